@@ -3,8 +3,8 @@ import shutil
 import argparse
 import logging
 
-from .globals import ANSI
-from .storage import LMDBStorageManager
+from .globals import ANSI, DEFAULT_TMP_MEMORY_BUDGET
+from .storage import LMDBStorageManager, MemoryStorageManager, COMPRESSIONS
 from .metadata import MetadataManager
 
 from .stats import StatsManager, TableStats, CollectionStats, NaiveStatsManager
@@ -18,13 +18,33 @@ class DatabaseManager:
     DEFAULT_TMP_DIR: Final[str] = 'alps-tmp.ddb'
     """Default directory for temporary files.
     """
+    TMP_STORAGES: Final = ('lmdb', 'memory')
+    """Supported kinds of storage for temporary files:
+    ``lmdb`` keeps them in a separate LMDB database under the tmp directory,
+    while ``memory`` keeps them in memory (see :class:`.MemoryStorageManager`),
+    spilling to scratch files under the tmp directory once they exceed the memory budget.
+    """
 
-    def __init__(self, db_dir: str, tmp_dir: str) -> None:
+    def __init__(self, db_dir: str, tmp_dir: str, tmp_compression: str | None = None,
+                 tmp_storage: str = 'lmdb', tmp_memory_budget: int = DEFAULT_TMP_MEMORY_BUDGET,
+                 durability: str = 'full', readahead: bool = True) -> None:
+        """Open the database in ``db_dir``, with temporary files stored as specified by ``tmp_storage``
+        (one of :attr:`.TMP_STORAGES`) under ``tmp_dir``.
+        ``tmp_compression`` applies only to ``lmdb``, and ``tmp_memory_budget`` (in bytes) only to ``memory``.
+        ``durability`` is the default durability mode for commits (which sessions can override with ``SET durability``);
+        it and ``readahead`` are explained in :class:`.LMDBStorageManager`.
+        """
+        if tmp_storage not in type(self).TMP_STORAGES:
+            raise ValueError(f'unknown tmp storage {tmp_storage}')
         self.db_dir: Final = db_dir
         self.tmp_dir: Final = tmp_dir
         shutil.rmtree(tmp_dir, ignore_errors=True)
-        self.sm: Final = LMDBStorageManager(db_dir, tmp_dir)
+        self.sm: Final = LMDBStorageManager(db_dir, tmp_dir, tmp_compression=tmp_compression,
+                                            tmp_storage=(MemoryStorageManager(tmp_dir, memory_budget=tmp_memory_budget)
+                                                         if tmp_storage == 'memory' else None),
+                                            durability=durability, readahead=readahead)
         self.mm: Final = MetadataManager(self.sm)
+        self.sm.transaction_listeners.append(self.mm) # for Bloom filters rebuilt by transactions
         self.zm: Final = cast(StatsManager[TableStats, CollectionStats], NaiveStatsManager(self.sm, self.mm))
         self.tm: Final = LMDBTransactionManager(self.sm)
         return
@@ -37,6 +57,17 @@ def main() -> None:
                            help='input file')
     argparser.add_argument('--echo', '-e', action='store_true',
                            help='echo input')
+    argparser.add_argument('--tmp-compression', type=str, choices=COMPRESSIONS,
+                           help='compress temporary files (e.g., for sorting and hashing) using the given method')
+    argparser.add_argument('--tmp-storage', type=str, choices=DatabaseManager.TMP_STORAGES, default='lmdb',
+                           help='where to keep temporary files (defaults to lmdb)')
+    argparser.add_argument('--tmp-memory-budget', type=int, default=DEFAULT_TMP_MEMORY_BUDGET // (1024 * 1024),
+                           help='megabytes of temporary files to keep in memory before spilling to disk, with --tmp-storage memory '
+                           f'(defaults to {DEFAULT_TMP_MEMORY_BUDGET // (1024 * 1024)})')
+    argparser.add_argument('--durability', type=str, choices=LMDBStorageManager.DURABILITIES, default='full',
+                           help='default durability of commits, which can be changed per session with SET durability (defaults to full)')
+    argparser.add_argument('--no-readahead', action='store_true',
+                           help='turn off readahead for the database (for databases much larger than memory)')
     argparser.add_argument('dbdir', type=str, nargs='?', default=DatabaseManager.DEFAULT_DB_DIR,
                            help=f'database directory (defaults to {DatabaseManager.DEFAULT_DB_DIR}/)')
     argparser.add_argument('tmpdir', type=str, nargs='?', default=DatabaseManager.DEFAULT_TMP_DIR,
@@ -63,7 +94,9 @@ def main() -> None:
     else:
         logging.getLogger().setLevel(logging.INFO)
 
-    dbm = DatabaseManager(args.dbdir, args.tmpdir)
+    dbm = DatabaseManager(args.dbdir, args.tmpdir, tmp_compression=args.tmp_compression,
+                          tmp_storage=args.tmp_storage, tmp_memory_budget=args.tmp_memory_budget * 1024 * 1024,
+                          durability=args.durability, readahead=not args.no_readahead)
     with Session(dbm) as s:
         if args.inputfile is None:
             s.repl()
@@ -20,10 +20,10 @@ if the right input happens to originate from a file scan,
 some operator in the right subtree would have buffered rows from the disk file a block at a time.
 """
 
-from .interface import ExecutorException, Pop, QPop, CPop, StatementContext
+from .interface import ExecutorException, Pop, QPop, CPop, StatementContext, TmpFilePool
 from .command import CreateTablePop, ShowTablesPop, AnalyzeStatsPop, CreateIndexPop, InsertPop, DeletePop
 from .literaltable import LiteralTablePop
-from .tablescan import TableScanPop
+from .tablescan import TableScanPop, ZoneMapScanPop, ParallelTableScanPop
 from .filter import FilterPop
 from .project import ProjectPop
 from .indexscan import IndexScanPop
@@ -34,3 +34,4 @@ from .join.mergeeqj import MergeEqJoinPop
 from .join.indexnlj import IndexNLJoinPop
 from .join.hasheqj import HashEqJoinPop
 from .aggr import AggrPop
+from .pipeline import PipelinePop
@@ -4,7 +4,9 @@ from functools import cached_property, partial
 import logging
 logging.basicConfig(level=logging.DEBUG)
 
-from ..profile import profile_generator
+from ..globals import DEFAULT_BATCH_SIZE
+from ..util import iter_batches
+from ..profile import profile_generator, BatchProfileStat
 from ..storage import HeapFile
 from ..validator import valexpr, ValExpr, OutputLineage
 from ..primitives import CompiledValExpr
@@ -29,6 +31,9 @@ class AggrPop(QPop['AggrPop.CompiledProps']):
         groupby_execs: list[CompiledValExpr]
         """Executable for each GROUP BY expression.
         """
+        groupby_row_exec: CompiledValExpr
+        """Executable for computing the tuple of all GROUP BY values at once.
+        """
         aggr_input_execs: list[CompiledValExpr]
         """Executable for computing an input for each aggregate expression from an input row.
         """
@@ -142,6 +147,7 @@ class AggrPop(QPop['AggrPop.CompiledProps']):
             ordered_asc = ordered_asc,
             unique_columns = unique_columns,
             groupby_execs = groupby_execs,
+            groupby_row_exec = CompiledValExpr.tuple(*groupby_execs),
             aggr_input_execs = aggr_input_execs,
             aggr_init_execs = aggr_init_execs,
             aggr_add_execs = aggr_add_execs,
@@ -162,13 +168,14 @@ class AggrPop(QPop['AggrPop.CompiledProps']):
                 self_writes = 0,
                 overall = self.input.estimated.blocks.overall))
     
-    def _tmp_file(self, name: str) -> HeapFile:
-        f = self.context.sm.heap_file(self.context.tmp_tx, f'.tmp-{name}', [], create_if_not_exists=True)
-        f.truncate()
-        return f
+    def _tmp_file(self) -> HeapFile:
+        return self.context.tmp_files.acquire([])
 
-    @profile_generator()
     def execute(self) -> Generator[tuple, None, None]:
+        return self.rows_from_batches()
+
+    @profile_generator(BatchProfileStat)
+    def execute_batches(self) -> Generator[list[tuple], None, None]:
         logging.debug("num_memory_blocks: %s, message: %s", self.num_memory_blocks, "zwh")
 
         needed = False
@@ -180,18 +187,17 @@ class AggrPop(QPop['AggrPop.CompiledProps']):
             grouped_files = []
             currWriter = None
             currgroup = None
-            inpreader = BufferedReader(self.memory_blocks_required() // 2) # half to read, half to write
-
-            for buffer in inpreader.iter_buffer(self.input.execute()):
-                for row in buffer:
-                    grp = tuple(group_exec.eval(row0=row) for group_exec in self.compiled.groupby_execs) # this can be a tuple, multiple groupby things, so ties can be handled
+            for batch in self.input.execute_batches():
+                # group values come as a tuple, multiple groupby things, so ties can be handled
+                for row, grp in zip(batch, self.compiled.groupby_row_exec.eval_batch('row0', batch)):
 
                     if currWriter is None or currgroup is None or currgroup != grp: # None is for first iteration, if we have a group transition also
                         if currWriter is not None: # group transition, close
                             currWriter.flush()
+                            self.context.tmp_files.num_bytes_spilled += currWriter.num_bytes_flushed
                             currWriter.file._close()
                         # either way, open file and buffer writer
-                        fle = self._tmp_file("-".join(map(str, grp)))
+                        fle = self._tmp_file()
                         grouped_files.append((grp, fle)) # store actual group to yield at end
                         currWriter = BufferedWriter(fle, self.memory_blocks_required() // 2)
                         currgroup = grp
@@ -199,47 +205,53 @@ class AggrPop(QPop['AggrPop.CompiledProps']):
                     currWriter.write(row)
             if currWriter is not None: # need to flush for the last group because no transition
                 currWriter.flush()
+                self.context.tmp_files.num_bytes_spilled += currWriter.num_bytes_flushed
                 currWriter.file._close()
 
         finalNeeded = {}
+        aggr_inputs_of = [ exec.function('row0') for exec in self.compiled.aggr_input_execs ]
+        aggr_adds = [ exec.function('state', 'new_val') for exec in self.compiled.aggr_add_execs ]
+        aggr_inits = [ exec.function() for exec in self.compiled.aggr_init_execs ]
+        aggr_finalizes = [ exec.function('state') for exec in self.compiled.aggr_finalize_execs ]
 
         if not needed:
             currgroup = None
             # now we process the rows on the outside            
-            for row in self.input.execute():
-                grp = tuple(group_exec.eval(row0=row) for group_exec in self.compiled.groupby_execs)
-                grp_key = "-".join(map(str, grp)) # creates a string key for the dictionary based on the group values
-                # ("Engineering", "New York") -> Engineering-New York
-                # this conversion could cause problems if the group values themselves contained hyphens,
-                # which is why we're now storing the original tuple alongside the states - 
-                # we use the string only as a lookup key, but preserve the original values for the final output.
-                # using it as a lookup is fine because it is injective
-                '''
-                The previous approach was problematic for the following reason.
-                grp_key = "-".join(map(str, grp))  # E.g., "42-Engineering-2023-01-15"
-                grp_tuple = tuple(grp_key.split("-"))  # Now becomes ("42", "Engineering", "2023-01-15")
+            for batch in self.input.execute_batches():
+                aggr_inputs = [exec.eval_batch('row0', batch) for exec in self.compiled.aggr_input_execs]
+                for j, (row, grp) in enumerate(zip(batch, self.compiled.groupby_row_exec.eval_batch('row0', batch))):
+                    grp_key = "-".join(map(str, grp)) # creates a string key for the dictionary based on the group values
+                    # ("Engineering", "New York") -> Engineering-New York
+                    # this conversion could cause problems if the group values themselves contained hyphens,
+                    # which is why we're now storing the original tuple alongside the states - 
+                    # we use the string only as a lookup key, but preserve the original values for the final output.
+                    # using it as a lookup is fine because it is injective
+                    '''
+                    The previous approach was problematic for the following reason.
+                    grp_key = "-".join(map(str, grp))  # E.g., "42-Engineering-2023-01-15"
+                    grp_tuple = tuple(grp_key.split("-"))  # Now becomes ("42", "Engineering", "2023-01-15")
                 
-                To use the strings as a lookup, we need the map to be injective, so no two tuples correspond to the same string.
-                Tuple (1, 2, 3) → "1-2-3"
-                Tuple ("1", "2-3") → "1-2-3"
-                This is not guaranteed, see above, so this is unsafe.
-                Tuples in Python are hashable and immutable, making them perfect as dictionary keys. Don't use strings.
-                But even if we fix this, our file name map is still not injective because it is the same map.
-                '''
+                    To use the strings as a lookup, we need the map to be injective, so no two tuples correspond to the same string.
+                    Tuple (1, 2, 3) → "1-2-3"
+                    Tuple ("1", "2-3") → "1-2-3"
+                    This is not guaranteed, see above, so this is unsafe.
+                    Tuples in Python are hashable and immutable, making them perfect as dictionary keys. Don't use strings.
+                    But even if we fix this, our file name map is still not injective because it is the same map.
+                    '''
                 
-                # new group we haven't seen before
-                if grp_key not in finalNeeded:
-                    # initialize state for all aggregates for this group
-                    #finalNeeded[grp_key] = [exec.eval() for exec in self.compiled.aggr_init_execs]
-                    finalNeeded[grp_key] = (grp, [exec.eval() for exec in self.compiled.aggr_init_execs])
+                    # new group we haven't seen before
+                    if grp_key not in finalNeeded:
+                        # initialize state for all aggregates for this group
+                        #finalNeeded[grp_key] = [exec.eval() for exec in self.compiled.aggr_init_execs]
+                        finalNeeded[grp_key] = (grp, [init() for init in aggr_inits])
                 
-                # process each aggregate for this row
-                for i in range(len(self.aggr_exprs)):
-                    curr = self.compiled.aggr_input_execs[i].eval(row0=row)
-                    finalNeeded[grp_key][1][i] = self.compiled.aggr_add_execs[i].eval(
-                        state=finalNeeded[grp_key][1][i], # finalNeeded[grp_key][i], # now we have this 2 piece of information store 
-                        new_val=curr
-                    )
+                    # process each aggregate for this row
+                    for i in range(len(self.aggr_exprs)):
+                        curr = aggr_inputs[i][j]
+                        finalNeeded[grp_key][1][i] = aggr_adds[i](
+                            finalNeeded[grp_key][1][i], # finalNeeded[grp_key][i], # now we have this 2 piece of information store 
+                            curr
+                        )
 
         else:  # if we had one or more non-incremental expressions, we have this loop to go over the files for all of them. some may be incremental, some not
             # first pass through the grouped files to initialize all group states
@@ -247,7 +259,7 @@ class AggrPop(QPop['AggrPop.CompiledProps']):
                 grp_key = "-".join(map(str, grp))
                 if grp_key not in finalNeeded:
                     #finalNeeded[grp_key] = [exec.eval() for exec in self.compiled.aggr_init_execs]
-                    finalNeeded[grp_key] = (grp, [exec.eval() for exec in self.compiled.aggr_init_execs])
+                    finalNeeded[grp_key] = (grp, [init() for init in aggr_inits])
             
             # now process each aggregate expression -> aggregation expressions -> rows in groups
             # we can't do row loop and then aggregation expression inside or not because the way we sort (if applicable) depends on aggregation expression and column details
@@ -261,18 +273,14 @@ class AggrPop(QPop['AggrPop.CompiledProps']):
                     tmp_file._open('r')
                     
                     if not self.aggr_exprs[i].is_incremental(): # only do the sorting if we need to (i.e. duplicates need to be removed and that is what we need to do to remove them)
-                        def compare_rows(row1, row2):
-                            val1 = self.compiled.aggr_input_execs[i].eval(row0=row1)
-                            val2 = self.compiled.aggr_input_execs[i].eval(row0=row2)
-                            return -1 if val1 < val2 else (1 if val1 > val2 else 0)
-                        
                         # some may be incremental and in this else loop of "needed" because we file-grouped every group in this case if 1 aggregate was non-incremental)
                         sort_buffer = ExtSortBuffer(
-                            compare=compare_rows,
-                            tmp_file_create=lambda level, run: self._tmp_file(f"sort-{i}-{level}-{run}"),
-                            tmp_file_delete=lambda f: f._close(),
+                            compare=None,
+                            tmp_file_create=lambda level, run: self._tmp_file(),
+                            tmp_file_delete=self.context.tmp_files.release,
                             num_memory_blocks=self.memory_blocks_required(),
-                            deduplicate=self.aggr_exprs[i].is_distinct
+                            deduplicate=self.aggr_exprs[i].is_distinct,
+                            key=aggr_inputs_of[i] # sort rows by the aggregate input value
                         )
                         
                         reader = BufferedReader(1)
@@ -282,31 +290,35 @@ class AggrPop(QPop['AggrPop.CompiledProps']):
                         
                         previous = None
                         for row in sort_buffer.iter_and_clear():
-                            curr = self.compiled.aggr_input_execs[i].eval(row0=row)
+                            curr = aggr_inputs_of[i](row)
                             if self.aggr_exprs[i].is_distinct: # remove duplicates
                                 if previous is not None and curr == previous: # if not first row and the same column value back to back
                                     continue # no need to add again
-                            finalNeeded[grp_key][1][i] = self.compiled.aggr_add_execs[i].eval( # merge old state and new finding 
-                                state=finalNeeded[grp_key][1][i], #finalNeeded[grp_key][i], 
-                                new_val=curr
+                            finalNeeded[grp_key][1][i] = aggr_adds[i]( # merge old state and new finding 
+                                finalNeeded[grp_key][1][i], #finalNeeded[grp_key][i], 
+                                curr
                             )
                             previous = curr
+                        self.context.tmp_files.num_bytes_spilled += sort_buffer.num_bytes_flushed
                         tmp_file._close()
 
                     else: # for incremental aggregates, process directly without sorting
                         reader = BufferedReader(1)
                         for buffer in reader.iter_buffer(tmp_file.iter_scan()):
                             for row in buffer:
-                                curr = self.compiled.aggr_input_execs[i].eval(row0=row)
-                                finalNeeded[grp_key][1][i] = self.compiled.aggr_add_execs[i].eval(
-                                    state=finalNeeded[grp_key][1][i], #finalNeeded[grp_key][i], 
-                                    new_val=curr
+                                curr = aggr_inputs_of[i](row)
+                                finalNeeded[grp_key][1][i] = aggr_adds[i](
+                                    finalNeeded[grp_key][1][i], #finalNeeded[grp_key][i], 
+                                    curr
                                 )
                         tmp_file._close()
+                self.context.tmp_files.release(tmp_file) # done with this group
            
+        outputs: list[tuple] = list()
         for grp_key, group_and_states in finalNeeded.items():
             original_group = group_and_states[0]  # first value element is the original group tuple, e.g. if we grouped by department, those names
             states = group_and_states[1] # second element is the list of aggregate states
             
-            finals = [finalizer.eval(state=states[i]) for i, finalizer in enumerate(self.compiled.aggr_finalize_execs)] # taking iterative states that are completed to their final form, often that is just returning themselves, othertimes a state encorporated a lot of information that must be synthesized
-            yield original_group + tuple(finals)
\ No newline at end of file
+            finals = [finalize(states[i]) for i, finalize in enumerate(aggr_finalizes)] # taking iterative states that are completed to their final form, often that is just returning themselves, othertimes a state encorporated a lot of information that must be synthesized
+            outputs.append(original_group + tuple(finals))
+        yield from iter_batches(outputs, DEFAULT_BATCH_SIZE)
\ No newline at end of file
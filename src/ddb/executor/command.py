@@ -4,8 +4,8 @@ import logging
 
 from ..globals import DEFAULT_SORT_BUFFER_SIZE
 from ..metadata import BaseTableMetadata, INTERNAL_ROW_ID_COLUMN_NAME, INTERNAL_ROW_ID_COLUMN_TYPE
-from ..validator import valexpr
-from ..storage import HeapFile
+from ..validator import ValExpr, valexpr
+from ..storage import HeapFile, DuplicateKeyException
 
 from .interface import ExecutorException, CPop, QPop, StatementContext
 from .tablescan import TableScanPop
@@ -20,6 +20,8 @@ class CreateTablePop(CPop):
 
     def execute(self) -> str:
         self.context.mm.table_storage(self.context.tx, self.metadata, create_if_not_exists=True)
+        for column_indices in self.metadata.composite_indices: # e.g., for enforcing a multi-column primary key
+            self.context.mm.composite_index_storage(self.context.tx, self.metadata, column_indices, create_if_not_exists=True)
         self.context.mm.upsert_base_table_metadata(self.context.tx, self.metadata)
         return 'CREATE TABLE'
 
@@ -50,14 +52,29 @@ class ShowTablesPop(CPop):
         return '\n'.join(lines)
 
 class CreateIndexPop(CPop):
-    def __init__(self, context: StatementContext, metadata: BaseTableMetadata, column_index: int) -> None:
+    def __init__(self, context: StatementContext, metadata: BaseTableMetadata, column_index: int | tuple[int, ...],
+                 included_column_indices: tuple[int, ...] = tuple(), use_hash: bool = False) -> None:
+        """``column_index`` is a tuple of column indices (in key order) for a composite index.
+        ``included_column_indices`` are the indices of columns whose values are to be stored in the index too.
+        ``use_hash`` asks for a hash index (for a single column only) instead of a B+tree.
+        """
         super().__init__(context)
         self.metadata = metadata
         self.column_index = column_index
+        self.included_column_indices = included_column_indices
+        self.use_hash = use_hash
         return
 
     def execute(self) -> str:
-        self.metadata.secondary_column_indices.append(self.column_index)
+        column_indices = self.column_index if isinstance(self.column_index, tuple) else (self.column_index, )
+        if isinstance(self.column_index, tuple):
+            self.metadata.composite_indices.append(self.column_index)
+        else:
+            self.metadata.secondary_column_indices.append(self.column_index)
+            if self.use_hash:
+                self.metadata.hash_column_indices.append(self.column_index)
+        if len(self.included_column_indices) > 0:
+            self.metadata.included_columns[self.column_index] = self.included_column_indices
         self.context.mm.upsert_base_table_metadata(self.context.tx, self.metadata)
         if self.metadata.primary_key_column_index is None:
             row_id_ref = valexpr.leaf.NamedColumnRef(
@@ -69,20 +86,29 @@ class CreateIndexPop(CPop):
                 self.metadata.name,
                 self.metadata.column_names[self.metadata.primary_key_column_index],
                 self.metadata.column_types[self.metadata.primary_key_column_index])
-        index_col_ref = valexpr.leaf.NamedColumnRef(
+        index_col_refs: list[ValExpr] = [valexpr.leaf.NamedColumnRef(
             self.metadata.name,
-            self.metadata.column_names[self.column_index],
-            self.metadata.column_types[self.column_index])
-        scan = MergeSortPop(ProjectPop(TableScanPop(self.context, self.metadata.name, self.metadata,
-                                                    return_row_id=(self.metadata.primary_key_column_index is None)),
-                                       [row_id_ref, index_col_ref], None),
-                            [index_col_ref, row_id_ref], [True, True],
-                            DEFAULT_SORT_BUFFER_SIZE, DEFAULT_SORT_BUFFER_SIZE)
-        count = 0
-        with self.context.mm.index_storage(self.context.tx, self.metadata, self.column_index, create_if_not_exists=True) as f:
-            for row_id, val in scan.execute():
-                f.put(val, (row_id, ))
-                count += 1
+            self.metadata.column_names[i],
+            self.metadata.column_types[i]) for i in column_indices]
+        included_col_refs: list[ValExpr] = [valexpr.leaf.NamedColumnRef(
+            self.metadata.name,
+            self.metadata.column_names[i],
+            self.metadata.column_types[i]) for i in self.included_column_indices]
+        num_keys = len(index_col_refs)
+        scan: QPop = ProjectPop(TableScanPop(self.context, self.metadata.name, self.metadata,
+                                             return_row_id=(self.metadata.primary_key_column_index is None)),
+                                [row_id_ref, *index_col_refs, *included_col_refs], None)
+        if not self.use_hash: # a hash index does not care about the order of entries
+            scan = MergeSortPop(scan, [*index_col_refs, row_id_ref], [True] * (len(index_col_refs) + 1),
+                                DEFAULT_SORT_BUFFER_SIZE, DEFAULT_SORT_BUFFER_SIZE)
+        # entries come out sorted (unless for a hash index), so they can be bulk-loaded
+        # (each entry's row holds the row id, followed by the included values, if any):
+        if isinstance(self.column_index, tuple):
+            with self.context.mm.composite_index_storage(self.context.tx, self.metadata, self.column_index, create_if_not_exists=True) as f:
+                count = f.bulk_load((tuple(row[1:1+num_keys]), (row[0], *row[1+num_keys:])) for row in scan.execute())
+        else:
+            with self.context.mm.index_storage(self.context.tx, self.metadata, self.column_index, create_if_not_exists=True) as f:
+                count = f.bulk_load((row[1], (row[0], *row[2:])) for row in scan.execute())
         return f'CREATE INDEX {count}'
 
 class InsertPop(CPop):
@@ -104,22 +130,37 @@ class InsertPop(CPop):
         with self.context.mm.table_storage(self.context.tx, self.metadata) as f, ExitStack() as stack:
             secondary_indices = [stack.enter_context(self.context.mm.index_storage(self.context.tx, self.metadata, i)) \
                                  for i in self.metadata.secondary_column_indices]
+            composite_indices = [stack.enter_context(self.context.mm.composite_index_storage(self.context.tx, self.metadata, ci)) \
+                                 for ci in self.metadata.composite_indices]
             if isinstance(f, HeapFile):
                 for row in self.contents_query.execute():
+                    for ci, cf in zip(self.metadata.composite_indices, composite_indices):
+                        if cf.unique and cf.get_one(tuple(row[i] for i in ci)) is not None:
+                            raise ExecutorException(f'primary key constraint violation in {self.metadata.name}: '
+                                                    f'key value {tuple(row[i] for i in ci)}')
                     row_id = f.put(row)
                     for i, si in zip(self.metadata.secondary_column_indices, secondary_indices):
-                        si.put(row[i], (row_id, ))
+                        si.put(row[i], (row_id, *(row[j] for j in self.metadata.included_column_indices(i))))
+                    for ci, cf in zip(self.metadata.composite_indices, composite_indices):
+                        cf.put(tuple(row[i] for i in ci), (row_id, *(row[j] for j in self.metadata.included_column_indices(ci))))
                     count += 1
             else:
-                for row in self.contents_query.execute():
-                    key = row[cast(int, self.metadata.primary_key_column_index)]
-                    if f.get_one(key) is not None:
-                        raise ExecutorException(f'primary key constraint violation in {self.metadata.name}: key value {key}')
-                    rest_of_row = tuple(v for i, v in enumerate(row) if i != self.metadata.primary_key_column_index)
-                    f.put(key, rest_of_row)
-                    for i, si in zip(self.metadata.secondary_column_indices, secondary_indices):
-                        si.put(row[i], (key, ))
-                    count += 1
+                def entries() -> Iterable[tuple]:
+                    for row in self.contents_query.execute():
+                        key = row[cast(int, self.metadata.primary_key_column_index)]
+                        rest_of_row = tuple(v for i, v in enumerate(row) if i != self.metadata.primary_key_column_index)
+                        for i, si in zip(self.metadata.secondary_column_indices, secondary_indices):
+                            si.put(row[i], (key, *(row[j] for j in self.metadata.included_column_indices(i))))
+                        for ci, cf in zip(self.metadata.composite_indices, composite_indices):
+                            cf.put(tuple(row[i] for i in ci), (key, *(row[j] for j in self.metadata.included_column_indices(ci))))
+                        yield key, rest_of_row
+                    return
+                # the primary key constraint is checked as part of the bulk load,
+                # which is especially efficient if the rows to insert happen to come in key order:
+                try:
+                    count = f.bulk_load(entries())
+                except DuplicateKeyException as e:
+                    raise ExecutorException(f'primary key constraint violation in {self.metadata.name}: key value {e.key}') from e
         return f'INSERT {count}'
 
 class DeletePop(CPop):
@@ -138,10 +179,20 @@ class DeletePop(CPop):
         with self.context.mm.table_storage(self.context.tx, self.metadata) as f, ExitStack() as stack:
             secondary_indices = [stack.enter_context(self.context.mm.index_storage(self.context.tx, self.metadata, i)) \
                                  for i in self.metadata.secondary_column_indices]
+            composite_indices = [stack.enter_context(self.context.mm.composite_index_storage(self.context.tx, self.metadata, ci)) \
+                                 for ci in self.metadata.composite_indices]
             for row in self.key_query.execute():
                 f.delete(row[0])
-                for i, si in enumerate(secondary_indices):
-                    key = row[i+1] # offset is 1 because row[0] is the id
-                    si.delete(key, (row[0],))
+                offset = 1 # because row[0] is the id
+                # each secondary key value is followed by the values of columns included in its index:
+                for i, si in zip(self.metadata.secondary_column_indices, secondary_indices):
+                    num_included = len(self.metadata.included_column_indices(i))
+                    si.delete(row[offset], (row[0], *row[offset+1:offset+1+num_included]))
+                    offset += 1 + num_included
+                # composite key values follow, again each followed by the included values:
+                for ci, cf in zip(self.metadata.composite_indices, composite_indices):
+                    num_included = len(self.metadata.included_column_indices(ci))
+                    cf.delete(row[offset:offset+len(ci)], (row[0], *row[offset+len(ci):offset+len(ci)+num_included]))
+                    offset += len(ci) + num_included
                 count += 1
         return f'DELETE {count}'
@@ -1,8 +1,10 @@
-from typing import Final, Iterable, Generator
+from typing import Final, Iterable, Iterator, Generator
 from dataclasses import dataclass
 from functools import cached_property
 
-from ..profile import profile_generator
+from ..globals import DEFAULT_BATCH_SIZE
+from ..util import coalesce_batches
+from ..profile import profile_generator, BatchProfileStat
 from ..validator import ValExpr, valexpr
 from ..primitives import CompiledValExpr
 
@@ -22,6 +24,8 @@ class FilterPop(QPop['FilterPop.CompiledProps']):
             yield from super().pstr()
             if self.cond_exec is not None:
                 yield f'filter condition code: {self.cond_exec}'
+                if (vector_code := self.cond_exec.vector_code()) is not None:
+                    yield f'vectorized filter condition code: {vector_code}'
             return
 
     def __init__(self, input: QPop[QPop.CompiledProps], cond: ValExpr) -> None:
@@ -45,7 +49,7 @@ class FilterPop(QPop['FilterPop.CompiledProps']):
     @cached_property
     def compiled(self) -> 'FilterPop.CompiledProps':
         input_props = self.input.compiled
-        exec = self.compile_valexpr(self.cond)
+        exec = self.compile_valexpr(self.cond, vectorize=True)
         return FilterPop.CompiledProps.from_input(input_props,
                                                   cond_exec = exec)
 
@@ -61,10 +65,16 @@ class FilterPop(QPop['FilterPop.CompiledProps']):
                 self_writes = 0,
                 overall = self.input.estimated.blocks.overall))
 
-    @profile_generator()
     def execute(self) -> Generator[tuple, None, None]:
+        return self.rows_from_batches()
+
+    @profile_generator(BatchProfileStat)
+    def execute_batches(self) -> Generator[list[tuple], None, None]:
         cond_exec = self.compiled.cond_exec
-        for row in self.input.execute():
-            if cond_exec.eval(row0 = row):
-                yield row
+        batches: Iterator[list[tuple]] = self.input.execute_batches()
+        if cond_exec.vector_code() is not None: # vectorized evaluation pays off only for big enough batches
+            batches = coalesce_batches(batches, DEFAULT_BATCH_SIZE)
+        for batch in batches:
+            if len(rows := cond_exec.filter_batch('row0', batch)) > 0:
+                yield rows
         return
@@ -4,8 +4,9 @@ from functools import cached_property
 from math import ceil
 
 from ..profile import profile_generator
-from ..metadata import TableMetadata, BaseTableMetadata, ValType, INTERNAL_ROW_ID_COLUMN_NAME, INTERNAL_ROW_ID_COLUMN_TYPE
-from ..storage import BplusTree, HeapFile
+from ..metadata import TableMetadata, BaseTableMetadata, ValType, INTERNAL_ROW_ID_COLUMN_NAME, INTERNAL_ROW_ID_COLUMN_TYPE, \
+    BloomFilteredBplusTree
+from ..storage import BplusTree, HeapFile, HashIndex
 from ..validator import OutputLineage, valexpr
 
 from .interface import QPop, StatementContext, ExecutorException
@@ -13,19 +14,26 @@ from .interface import QPop, StatementContext, ExecutorException
 class IndexScanPop(QPop[QPop.CompiledProps]):
     """Index scan physical operator.
     The underlying index is either a :class:`.BplusTree` (serving either as a primary index or a secondary index),
+    a :class:`.HashIndex` (serving as a secondary index, in which case search condition has to be a specific key),
     or a :class:`.HeapFile` (in which case search condition has to be a specific row id).
     In the case of a secondary index, the scan returns (key, row id) rows,
     with the second column named ``ddb.metadata.INTERNAL_ROW_ID_COLUMN_NAME``.
+    In the case of a composite (multi-column) index, the scan returns (key components..., row id) rows instead.
+    If the index has included columns (see :meth:`.BaseTableMetadata.included_column_indices`),
+    their values follow the row id in each row.
     The operator calls the storage manager to perform the scan,
     which essentially uses one memory block for buffering.
     Before calling this operator's ``execute()``, a scan range or key needs to be set.
+    Lookups by a single key consult the Bloom filter on the index keys (if any) first,
+    and the operator keeps count of how often the filter spares a lookup (see :class:`.BloomFilteredBplusTree`).
     """
     def __init__(self, context: StatementContext,
-                 alias: str, meta: BaseTableMetadata, key_name: str,
+                 alias: str, meta: BaseTableMetadata, key_name: str | tuple[str, ...],
                  is_range: bool) -> None:
         """Construct an index scan for the database table whose metadata is given by ``meta``,
         with table alias ``alias``, using the index on column named ``key_name``.
-        Note that ``key_name`` can be ``ddb.metadata.INTERNAL_ROW_ID_COLUMN_NAME`` for a table with no primary key.
+        Note that ``key_name`` can be ``ddb.metadata.INTERNAL_ROW_ID_COLUMN_NAME`` for a table with no primary key,
+        or a tuple of column names (in key order) for a composite index.
         ``is_range`` indicates whether this operator will be used for a key range scan,
         as opposed to looking up record(s) by a single key value.
         """
@@ -38,6 +46,9 @@ class IndexScanPop(QPop[QPop.CompiledProps]):
         self.key_upper: Any = None
         self.lower_exclusive: bool = False
         self.upper_exclusive: bool = False
+        self.num_bloom_probes: int = 0
+        self.num_bloom_negatives: int = 0
+        self.num_bloom_false_positives: int = 0
         return
 
     def memory_blocks_required(self) -> int:
@@ -48,6 +59,7 @@ class IndexScanPop(QPop[QPop.CompiledProps]):
 
     def set_key(self, key: Any) -> None:
         """Set the target search key for the subsequent :meth:`.execute()` call.
+        For a composite index, ``key`` is a tuple, which may provide just the leading key components.
         """
         self.key_lower = key
         self.key_upper = key
@@ -59,6 +71,8 @@ class IndexScanPop(QPop[QPop.CompiledProps]):
                   lower_exclusive: bool | None,
                   upper_exclusive: bool | None) -> None:
         """Set the scan range for the subsequent :meth:`.execute()` call.
+        For a composite index, each bound is a tuple, which may provide just the leading key components;
+        it is then compared with the same number of leading components of each key.
         """
         self.key_lower = key_lower
         self.key_upper = key_upper
@@ -67,10 +81,16 @@ class IndexScanPop(QPop[QPop.CompiledProps]):
         return
 
     def pstr_more(self) -> Iterable[str]:
-        yield f'AS {self.alias} using {self.meta.name}({self.key_name})'
+        key_name = ', '.join(self.key_name) if isinstance(self.key_name, tuple) else self.key_name
+        yield f'AS {self.alias} using {self.meta.name}({key_name})' + (' [hash]' if self.is_by_hash() else '')
         yield 'key range: {}{}, {}{}'.format('(' if self.lower_exclusive else '[',
                                              self.key_lower, self.key_upper,
                                              ')' if self.upper_exclusive else ']')
+        if self.num_bloom_probes > 0:
+            num_absent = self.num_bloom_negatives + self.num_bloom_false_positives
+            yield f'bloom filter: {self.num_bloom_probes} probes; ' +\
+                f'hit rate: {self.num_bloom_negatives / self.num_bloom_probes:.1%}; ' +\
+                'false positive rate: ' + (f'{self.num_bloom_false_positives / num_absent:.1%}' if num_absent > 0 else 'n/a')
         return
 
     def is_by_row_id(self) -> bool:
@@ -80,6 +100,19 @@ class IndexScanPop(QPop[QPop.CompiledProps]):
         return self.meta.primary_key_column_index is not None and \
             self.key_name == self.meta.column_names[self.meta.primary_key_column_index]
 
+    def is_by_hash(self) -> bool:
+        return isinstance(self.key_name, str) and self.key_name in self.meta.column_names and \
+            self.meta.column_names.index(self.key_name) in self.meta.hash_column_indices
+
+    def included_column_names(self) -> list[str]:
+        """Return the names of columns whose values are stored in the (secondary) index alongside the row id.
+        """
+        if self.is_by_row_id() or self.is_by_primary_key():
+            return list()
+        index = tuple(self.meta.column_names.index(n) for n in self.key_name) if isinstance(self.key_name, tuple) \
+            else self.meta.column_names.index(self.key_name)
+        return [ self.meta.column_names[i] for i in self.meta.included_column_indices(index) ]
+
     @cached_property
     def compiled(self) -> QPop.CompiledProps:
         output_column_names: list[str]
@@ -107,11 +140,24 @@ class IndexScanPop(QPop[QPop.CompiledProps]):
                 output_column_names.insert(insert_i, column_name)
                 output_column_types.insert(insert_i, column_type)
                 output_lineage.insert(insert_i, set(((self.alias, column_name), )))
+        elif isinstance(self.key_name, tuple): # composite index scan
+            output_column_names = [ *self.key_name, self.meta.id_name(), *self.included_column_names() ]
+            output_column_types = [ *(self.meta.column_types[self.meta.column_names.index(n)] for n in self.key_name),
+                                    self.meta.id_type(),
+                                    *(self.meta.column_types[self.meta.column_names.index(n)] for n in self.included_column_names()) ]
+            output_lineage = [ *(set(((self.alias, n), )) for n in self.key_name),
+                               set(((self.alias, self.meta.id_name()), )),
+                               *(set(((self.alias, n), )) for n in self.included_column_names()) ]
+            ordered_columns = list(range(len(self.key_name)))
+            ordered_asc = [True] * len(self.key_name)
+            unique_columns = {len(self.key_name)} # while key may not be unique, the internal row id is
         else: # secondary index scan
-            output_column_names = [ self.key_name, self.meta.id_name() ]
+            output_column_names = [ self.key_name, self.meta.id_name(), *self.included_column_names() ]
             output_column_types = [ self.meta.column_types[self.meta.column_names.index(self.key_name)],
-                                    self.meta.id_type() ]
-            output_lineage = [set(((self.alias, self.key_name), )), set(((self.alias, self.meta.id_name()), ))]
+                                    self.meta.id_type(),
+                                    *(self.meta.column_types[self.meta.column_names.index(n)] for n in self.included_column_names()) ]
+            output_lineage = [ set(((self.alias, self.key_name), )), set(((self.alias, self.meta.id_name()), )),
+                               *(set(((self.alias, n), )) for n in self.included_column_names()) ]
             ordered_columns = [0]
             ordered_asc = [True]
             unique_columns = {1} # while key may not be unique, the internal row id is
@@ -135,12 +181,17 @@ class IndexScanPop(QPop[QPop.CompiledProps]):
                 index_stats = self.context.zm.base_table_stats(self.context, self.meta)
             else:
                 index_stats = self.context.zm.secondary_index_stats(self.context, self.meta, self.key_name)
-            column_type = self.compiled.output_metadata.column_types[0]
-            column = valexpr.leaf.RelativeColumnRef(0, 0, column_type)
-            val = valexpr.leaf.Literal.from_any(column_type.dummy_value, column_type)
-            cond = valexpr.binary.GT(column, val) if self.is_range else valexpr.binary.EQ(column, val)
+            # for a composite index, a lookup is assumed to bind all key components, and a range scan just the first one:
+            num_bound_columns = len(self.key_name) if isinstance(self.key_name, tuple) and not self.is_range else 1
+            parts: list[valexpr.ValExpr] = list()
+            for i, column_type in enumerate(self.compiled.output_metadata.column_types[:num_bound_columns]):
+                column = valexpr.leaf.RelativeColumnRef(0, i, column_type)
+                val = valexpr.leaf.Literal.from_any(column_type.dummy_value, column_type)
+                parts.append(valexpr.binary.GT(column, val) if self.is_range else valexpr.binary.EQ(column, val))
+            cond = valexpr.make_conjunction(parts)
             new_stats = self.context.zm.selection_stats(index_stats, cond)
         self_reads = new_stats.block_count()
+        # a hash index reports a height of 1, as a lookup goes to the key's bucket directly:
         if index_stats.tree_height is not None and index_stats.tree_height > 1:
             self_reads += index_stats.tree_height - 1
         return QPop.EstimatedProps(
@@ -152,30 +203,77 @@ class IndexScanPop(QPop[QPop.CompiledProps]):
 
     @profile_generator()
     def execute(self) -> Generator[tuple, None, None]:
-        f: BplusTree|HeapFile
-        if self.key_name == INTERNAL_ROW_ID_COLUMN_NAME:
+        f: BplusTree|HashIndex|HeapFile
+        if isinstance(self.key_name, tuple):
+            column_indices = tuple(self.meta.column_names.index(n) for n in self.key_name)
+            f = self.context.mm.composite_index_storage(self.context.tx, self.meta, column_indices)
+            with f as file:
+                try:
+                    yield from self._execute_composite(file)
+                finally:
+                    self._count_bloom_probes(file)
+            return
+        elif self.key_name == INTERNAL_ROW_ID_COLUMN_NAME:
             f = self.context.mm.table_storage(self.context.tx, self.meta)
         else:
             column_index = self.meta.column_names.index(self.key_name)
             f = self.context.mm.index_storage(self.context.tx, self.meta, column_index)
         with f as file:
-            if isinstance(file, BplusTree):
-                if self.key_lower == self.key_upper and self.key_lower is not None:
-                    for key, row in file.iter_get(self.key_lower):
-                        yield (key, *row)
-                else:
-                    with closing(file.iter_scan(self.key_lower)) as iter:
-                        for key, row in iter:
-                            if self.key_lower is not None and self.lower_exclusive and key <= self.key_lower:
-                                continue
-                            elif self.key_upper is not None and (key > self.key_upper or (self.upper_exclusive and key >= self.key_upper)):
-                                break
+            try:
+                if isinstance(file, BplusTree):
+                    if self.key_lower == self.key_upper and self.key_lower is not None:
+                        for key, row in file.iter_get(self.key_lower):
                             yield (key, *row)
-            else:
-                if self.key_lower == self.key_upper and self.key_lower is not None:
-                    row = file.get(self.key_lower)
-                    if row is not None:
-                        yield row
+                    else:
+                        with closing(file.iter_scan_batches(self.key_lower, num_blocks=self.memory_blocks_required())) as iter:
+                            for batch in iter:
+                                for key, row in batch:
+                                    if self.key_lower is not None and self.lower_exclusive and key <= self.key_lower:
+                                        continue
+                                    elif self.key_upper is not None and (key > self.key_upper or (self.upper_exclusive and key >= self.key_upper)):
+                                        return
+                                    yield (key, *row)
+                elif isinstance(file, HashIndex):
+                    if self.key_lower == self.key_upper and self.key_lower is not None:
+                        for key, row in file.iter_get(self.key_lower):
+                            yield (key, *row)
+                    else:
+                        raise ExecutorException('hash index does not support range scans')
                 else:
-                    raise ExecutorException('unexpected error')
+                    if self.key_lower == self.key_upper and self.key_lower is not None:
+                        row = file.get(self.key_lower)
+                        if row is not None:
+                            yield row
+                    else:
+                        raise ExecutorException('unexpected error')
+            finally:
+                self._count_bloom_probes(file)
+        return
+
+    def _count_bloom_probes(self, file: BplusTree | HashIndex | HeapFile) -> None:
+        """Add up the Bloom filter counts kept by ``file`` (if it has a filter) after using it for :meth:`.execute`.
+        """
+        if isinstance(file, BloomFilteredBplusTree):
+            self.num_bloom_probes += file.num_probes
+            self.num_bloom_negatives += file.num_negatives
+            self.num_bloom_false_positives += file.num_false_positives
+        return
+
+    def _execute_composite(self, file: BplusTree) -> Generator[tuple, None, None]:
+        """Helper for :meth:`.execute` on a composite index, where bounds may cover only leading key components.
+        """
+        if self.key_lower == self.key_upper and self.key_lower is not None and len(self.key_lower) == len(self.key_name):
+            for key, row in file.iter_get(self.key_lower):
+                yield (*key, *row)
+            return
+        lower_n = 0 if self.key_lower is None else len(self.key_lower)
+        upper_n = 0 if self.key_upper is None else len(self.key_upper)
+        with closing(file.iter_scan_batches(self.key_lower, num_blocks=self.memory_blocks_required())) as iter:
+            for batch in iter:
+                for key, row in batch:
+                    if self.key_lower is not None and self.lower_exclusive and key[:lower_n] <= self.key_lower:
+                        continue
+                    elif self.key_upper is not None and (key[:upper_n] > self.key_upper or (self.upper_exclusive and key[:upper_n] >= self.key_upper)):
+                        return
+                    yield (*key, *row)
         return
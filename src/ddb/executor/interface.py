@@ -3,16 +3,16 @@ Other modules in the same subpackage define implementation classes.
 """
 from typing import cast, final, TypeVar, Generic, Self, Final, Iterable, Generator
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
 
-from ..globals import ANSI
-from ..util import CustomInitMeta
-from ..storage import StorageManager
+from ..globals import ANSI, DEFAULT_BATCH_SIZE
+from ..util import CustomInitMeta, iter_batches
+from ..storage import StorageManager, HeapFile
 from ..metadata import MetadataManager, TableMetadata
 from ..stats import StatsManager, TableStats, CollectionStats
-from ..validator import valexpr, ValExpr, OutputLineage
-from ..primitives import CompiledValExpr
+from ..validator import valexpr, ValExpr, OutputLineage, ValidatorException
+from ..primitives import CompiledValExpr, RowType
 from ..transaction import Transaction
 from ..profile import ProfileContext
 from ..util import MinMaxSum
@@ -22,6 +22,73 @@ class ExecutorException(Exception):
     """
     pass
 
+class TmpFilePool:
+    """A pool of temporary heap files in the tmp space, shared by all operators executing a statement.
+    Operators that spill rows to disk (e.g., for sorting, hashing, and materialization) acquire files from the pool
+    and release them when done, instead of creating and dropping a file each time.
+    A released file is emptied and handed out again by a later :meth:`.acquire` (possibly for a different row type),
+    so the number of files created is the most ever in use at once, not the number of runs or partitions produced.
+    At the end of the statement, :meth:`.recycle` deletes all files created by the pool.
+
+    Attributes:
+        num_files_created: number of files created by the pool.
+        num_files_reused: number of times a released file has been handed out again.
+        num_bytes_spilled: number of bytes of rows written to files from the pool, as reported by operators.
+    """
+    def __init__(self, sm: StorageManager, tmp_tx: Transaction) -> None:
+        self.sm: Final = sm
+        self.tmp_tx: Final = tmp_tx
+        self.free: Final[list[str]] = list()
+        """Names of (empty) files released to the pool.
+        """
+        self.in_use: Final[set[str]] = set()
+        """Names of files handed out and not yet released.
+        """
+        self.num_files_created: int = 0
+        self.num_files_reused: int = 0
+        self.num_bytes_spilled: int = 0
+        return
+
+    def _file_name(self, i: int) -> str:
+        return f'.tmp-{hex(id(self))}-{i}'
+
+    def acquire(self, row_type: RowType) -> HeapFile:
+        """Return an empty file, already opened, for storing rows of the given type.
+        """
+        if len(self.free) > 0:
+            name = self.free.pop()
+            self.num_files_reused += 1
+        else:
+            name = self._file_name(self.num_files_created)
+            self.num_files_created += 1
+        self.in_use.add(name)
+        return self.sm.heap_file(self.tmp_tx, name, row_type, create_if_not_exists=True)
+
+    def release(self, file: HeapFile) -> None:
+        """Give ``file`` (acquired from this pool) back to the pool, discarding its contents.
+        Releasing a file that is not in use (e.g., because the pool has been recycled) does nothing.
+        """
+        if file.name not in self.in_use:
+            return
+        self.in_use.remove(file.name)
+        with self.sm.heap_file(self.tmp_tx, file.name, file.row_type) as f:
+            f.truncate()
+        self.free.append(file.name)
+        return
+
+    def recycle(self) -> None:
+        """Delete all files created by this pool, whether released or not.
+        """
+        for i in range(self.num_files_created):
+            self.sm.delete_heap_file(self.tmp_tx, self._file_name(i))
+        self.free.clear()
+        self.in_use.clear()
+        return
+
+    def pstr(self) -> str:
+        return f'tmp files: {self.num_files_created} created, {self.num_files_reused} reused; ' +\
+            f'{self.num_bytes_spilled} bytes spilled'
+
 @dataclass(frozen=True)
 class StatementContext:
     """A context for each statement being processed,
@@ -32,7 +99,17 @@ class StatementContext:
     zm: StatsManager[TableStats, CollectionStats]
     tx: Transaction
     tmp_tx: Transaction
-    profile_context: ProfileContext
+    tmp_files: TmpFilePool
+    """Temporary files for operators to spill to, recycled at the end of the statement.
+    """
+    tx_sees_committed: bool
+    """Whether ``tx`` sees exactly the last committed state of the database
+    (i.e., no enclosing transaction has written anything yet),
+    so that other processes with read-only transactions of their own see the same data.
+    """
+    profile_context: ProfileContext | None
+    """``None`` if profiling is off, in which case measured properties are unavailable.
+    """
 
 class Pop(ABC, metaclass=CustomInitMeta):
     """An object representing a statement --- either a query (:class:`.QPop`) or
@@ -350,6 +427,8 @@ class QPop(Pop, Generic[P]):
     @cached_property
     @final
     def measured(self) -> MeasuredProps:
+        if self.context.profile_context is None:
+            raise ExecutorException('measured properties unavailable with profiling off')
         for c in self.children():
             c.measured
         num_execute_calls, next_calls, ns_elapsed, blocks_read, blocks_written, blocks_overall =\
@@ -398,6 +477,16 @@ class QPop(Pop, Generic[P]):
                 c.void_cached_props()
         return
 
+    @final
+    def replace_child(self, old: 'QPop[QPop.CompiledProps]', new: 'QPop[QPop.CompiledProps]') -> None:
+        """Replace the child operator ``old`` with ``new``, which must produce exactly the same output
+        (e.g., when a post-pass over a finished plan wraps a subplan to execute it differently).
+        No cached properties of this operator are affected.
+        """
+        for name in [ name for name, value in vars(self).items() if value is old ]:
+            setattr(self, name, new)
+        return
+
     def column_in_output(self, e: ValExpr) -> int | None:
         if isinstance(e, valexpr.leaf.RelativeColumnRef):
             return e.column_index
@@ -423,7 +512,7 @@ class QPop(Pop, Generic[P]):
                 return column_index
         return None
 
-    def compile_valexpr(self, e: ValExpr, row_vars: list[str] = ['row0', 'row1']) -> CompiledValExpr:
+    def compile_valexpr(self, e: ValExpr, row_vars: list[str] = ['row0', 'row1'], vectorize: bool = False) -> CompiledValExpr:
         """Compile the given expression ``e``.
         By default, we assume it will be evaluated in the context of executing this ``QPop``,
         and the input rows produced by the children, if any, represented as Python tuples,
@@ -431,10 +520,19 @@ class QPop(Pop, Generic[P]):
         Column references in ``e`` will be automatically converted to refer to the correct components of input tuples.
         Caller is free to use ``row_vars`` different from the default,
         but must be consistent when supplying their values as named parameters when calling :meth:`.CompiledValExpr.eval`.
+        If ``vectorize`` is set, also compile a vectorized version of ``e`` for evaluating batches of rows,
+        provided that ``e`` can be vectorized and does more than just returning a column or a literal
+        (see :meth:`.CompiledValExpr.eval_batch`).
         """
         output_lineages: list[OutputLineage] = [c.compiled.output_lineage for c in self.children()]
         code = valexpr.to_code_str(e, output_lineages, row_vars)
-        return CompiledValExpr(code)
+        vector_code: str | None = None
+        if vectorize and len(e.children()) > 0:
+            try:
+                vector_code = valexpr.to_code_str(e, output_lineages, row_vars, backend='numpy')
+            except ValidatorException: # fall back to evaluating row by row
+                pass
+        return CompiledValExpr(code, vector_code)
 
     @abstractmethod
     def execute(self) -> Generator[tuple, None, None]:
@@ -442,6 +540,31 @@ class QPop(Pop, Generic[P]):
         """
         pass
 
+    def execute_batches(self) -> Generator[list[tuple], None, None]:
+        """Return a Python generator that executes the operator and iterates over the result rows
+        a batch (list) at a time, in the same order as :meth:`.execute`.
+        Batches are never empty, and each is a new list that the caller is free to keep.
+
+        Passing batches between operators amortizes the interpretive overhead of each ``next()`` call,
+        and lets expressions be evaluated over a batch at a time (see :meth:`.CompiledValExpr.eval_batch`).
+        By default, this method is simply an adapter that collects rows from :meth:`.execute`
+        into batches of ``DEFAULT_BATCH_SIZE``.
+        An operator that natively executes in batches should override this method instead (profiled with
+        :class:`.BatchProfileStat`), and implement :meth:`.execute` as the reverse adapter (:meth:`.rows_from_batches`),
+        so that either way, only one of the two methods is profiled.
+        """
+        yield from iter_batches(self.execute(), DEFAULT_BATCH_SIZE)
+        return
+
+    @final
+    def rows_from_batches(self) -> Generator[tuple, None, None]:
+        """Iterate over the result rows of :meth:`.execute_batches` one at a time,
+        for implementing :meth:`.execute` for an operator that natively executes in batches.
+        """
+        for batch in self.execute_batches():
+            yield from batch
+        return
+
     @dataclass
     class Sarg:
         """A data structure representing arguments for a range search.
@@ -456,9 +579,16 @@ class QPop(Pop, Generic[P]):
         key_upper: ValExpr | None
         lower_exclusive: bool | None
         upper_exclusive: bool | None
+        key_prefix: list[ValExpr] = field(default_factory=list)
+        """For a composite index, values for the leading key components to search for (possibly none);
+        ``key_*`` attributes then bound the key component right after them.
+        Each bound for the index is thus a tuple consisting of the prefix followed by ``key_lower`` or ``key_upper``
+        (or just the prefix if that is ``None``).
+        """
 
         def to_str(self) -> str:
-            return '{}{}, {}{}'.format(
+            return ('prefix ({}) '.format(', '.join(e.to_str() for e in self.key_prefix)) if self.key_prefix else '') +\
+                '{}{}, {}{}'.format(
                 '(' if self.lower_exclusive is None or self.lower_exclusive else '[',
                 None if self.key_lower is None else self.key_lower.to_str(),
                 None if self.key_upper is None else self.key_upper.to_str(),
@@ -74,10 +74,10 @@ class BNLJoinPop(JoinPop['BNLJoinPop.CompiledProps']):
     @profile_generator()
     def execute(self) -> Generator[tuple, None, None]:
         outer = BufferedReader(self.num_memory_blocks)
-        cond_exec = self.compiled.cond_exec
+        cond = None if self.compiled.cond_exec is None else self.compiled.cond_exec.function('row0', 'row1')
         for outer_buffer in outer.iter_buffer(self.left.execute()):
             for inner_row in self.right.execute():
                 for outer_row in outer_buffer:
-                    if cond_exec is None or cond_exec.eval(row0 = outer_row, row1 = inner_row):
+                    if cond is None or cond(outer_row, inner_row):
                         yield (*outer_row, *inner_row)
         return
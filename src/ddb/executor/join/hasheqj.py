@@ -8,7 +8,7 @@ import hashlib
 from sys import getsizeof
 from math import log, floor
 
-from ...profile import profile_generator
+from ...profile import profile_generator, BatchProfileStat
 from ...validator import ValExpr, valexpr
 from ...primitives import CompiledValExpr
 from ...storage import HeapFile
@@ -134,11 +134,11 @@ class HashEqJoinPop(JoinPop['HashEqJoinPop.CompiledProps']):
                     reads + writes))
 
     def _tmp_partition_file(self, side: str, depth: int, partition_id: int) -> HeapFile:
-        """Create a temporary file for a partition in a given side (left/right), an ordinal depth, a partition id
+        """Get a temporary file for a partition in a given side (left/right), an ordinal depth, a partition id,
+        from the statement's :class:`.TmpFilePool`.
         """
-        f = self.context.sm.heap_file(self.context.tmp_tx, f'.tmp-{hex(id(self))}-{side}-{depth}-{partition_id}', [], create_if_not_exists=True)
-        f.truncate()
-        return f
+        input = self.left if side == 'this' else self.right
+        return self.context.tmp_files.acquire(input.compiled.output_metadata.column_types)
 
     @staticmethod
     def hash(v: Any) -> int:
@@ -151,8 +151,20 @@ class HashEqJoinPop(JoinPop['HashEqJoinPop.CompiledProps']):
         # a more heavy-weight alternative:
         # return int.from_bytes(hashlib.sha256(str(v).encode('utf-8')).digest(), 'big')
 
-    @profile_generator()
+    @staticmethod
+    def _iter_batches(input: HeapFile | QPop) -> Generator[list[tuple], None, None]:
+        """Iterate over the rows of ``input`` (an input operator or a partition file) a batch at a time.
+        """
+        if isinstance(input, QPop):
+            return input.execute_batches()
+        else:
+            return input.iter_scan_batches() # iter_scan_batches() needs 1 memory block
+
     def execute(self) -> Generator[tuple, None, None]:
+        return self.rows_from_batches()
+
+    @profile_generator(BatchProfileStat)
+    def execute_batches(self) -> Generator[list[tuple], None, None]:
         depth = 0
         num_partitions = 1
         sides = ['this', 'that']
@@ -184,17 +196,17 @@ class HashEqJoinPop(JoinPop['HashEqJoinPop.CompiledProps']):
                         partitions[ci].append(partition)
                         writers.append(BufferedWriter(partition, 1))
                         partition_sizes.append(0)
-                    for row in (old_partition.execute() if isinstance(old_partition, QPop) else
-                                old_partition.iter_scan()): # iter_scan() needs 1 memory block
-                        join_vals = join_vals_exec.eval(**{sides[ci]: row})
-                        h = HashEqJoinPop.hash(join_vals) // old_num_partitions # ignore previously used bits
-                        partition_sizes[h % fanout] += getsizeof(row)
-                        writers[h % fanout].write(row)
+                    for batch in HashEqJoinPop._iter_batches(old_partition):
+                        for row, join_vals in zip(batch, join_vals_exec.eval_batch(sides[ci], batch)):
+                            h = HashEqJoinPop.hash(join_vals) // old_num_partitions # ignore previously used bits
+                            partition_sizes[h % fanout] += getsizeof(row)
+                            writers[h % fanout].write(row)
                     for writer in writers:
                         writer.flush()
+                        self.context.tmp_files.num_bytes_spilled += writer.num_bytes_flushed
                     # remove old partition:
                     if isinstance(old_partition, HeapFile):
-                        self.context.sm.delete_heap_file(self.context.tmp_tx, old_partition.name)
+                        self.context.tmp_files.release(old_partition)
                     # update max size:
                     max_partition_sizes[ci] = max(max_partition_sizes[ci], max(partition_sizes))
             # check if max partition size is small enough for join/probe:
@@ -210,27 +222,29 @@ class HashEqJoinPop(JoinPop['HashEqJoinPop.CompiledProps']):
             # build:
             build_rows_by_join_vals: dict[Any, list[tuple]] = dict()
             join_vals_exec = join_vals_execs[build_side]
-            for row in (build.execute() if isinstance(build, QPop) else
-                        build.iter_scan()): # iter_scan() needs 1 memory block
-                join_vals = join_vals_exec.eval(**{sides[build_side]: row})
-                if join_vals not in build_rows_by_join_vals:
-                    build_rows_by_join_vals[join_vals] = list()
-                build_rows_by_join_vals[join_vals].append(row)
+            for batch in HashEqJoinPop._iter_batches(build):
+                for row, join_vals in zip(batch, join_vals_exec.eval_batch(sides[build_side], batch)):
+                    if join_vals not in build_rows_by_join_vals:
+                        build_rows_by_join_vals[join_vals] = list()
+                    build_rows_by_join_vals[join_vals].append(row)
             # remove build partition:
             if isinstance(build, HeapFile):
-                self.context.sm.delete_heap_file(self.context.tmp_tx, build.name)
+                self.context.tmp_files.release(build)
             if len(build_rows_by_join_vals) > 0:
                 # stream in probe:
                 join_vals_exec = join_vals_execs[1-build_side]
-                for row in (probe.execute() if isinstance(probe, QPop) else
-                            probe.iter_scan()): # iter_scan() needs 1 memory block
-                    join_vals = join_vals_exec.eval(**{sides[1-build_side]: row})
-                    if join_vals not in build_rows_by_join_vals:
-                        continue # nothing can be possibly joined
-                    for build_row in build_rows_by_join_vals[join_vals]:
-                        if self.compiled.eq_exec.eval(**{sides[build_side]: build_row, sides[1-build_side]: row}):
-                            yield (*build_row, *row) if build_side == 0 else (*row, *build_row)
+                eq = self.compiled.eq_exec.function(sides[build_side], sides[1-build_side])
+                for batch in HashEqJoinPop._iter_batches(probe):
+                    joined: list[tuple] = list()
+                    for row, join_vals in zip(batch, join_vals_exec.eval_batch(sides[1-build_side], batch)):
+                        if join_vals not in build_rows_by_join_vals:
+                            continue # nothing can be possibly joined
+                        for build_row in build_rows_by_join_vals[join_vals]:
+                            if eq(build_row, row):
+                                joined.append((*build_row, *row) if build_side == 0 else (*row, *build_row))
+                    if len(joined) > 0:
+                        yield joined
             # remove probe partition:
             if isinstance(probe, HeapFile):
-                self.context.sm.delete_heap_file(self.context.tmp_tx, probe.name)
+                self.context.tmp_files.release(probe)
         return
@@ -66,7 +66,8 @@ class IndexNLJoinPop(JoinPop['IndexNLJoinPop.CompiledProps']):
         unique_columns: set[int] = set()
         # see if we can infer more ordering/uniqueness; only chance is that we don't have a range scan on inner.
         # we look for the case where the lookup key is a column from outer:
-        if self.sarg.key_lower is not None and self.sarg.key_upper is not None and\
+        if len(self.sarg.key_prefix) == 0 and\
+            self.sarg.key_lower is not None and self.sarg.key_upper is not None and\
             (left_col_i := self.column_in_child(self.sarg.key_lower, 0)) is not None and\
             left_col_i == self.column_in_child(self.sarg.key_upper, 0):
             col_i_offset = len(left_props.output_metadata.column_names)
@@ -83,8 +84,8 @@ class IndexNLJoinPop(JoinPop['IndexNLJoinPop.CompiledProps']):
                     unique_columns = unique_columns | set(col_i_offset + right_col_i for right_col_i in right_props.unique_columns)
                 else: # right is a secondary (not necessarily unique) index scan
                     # one left row may join with multiple right rows, so left uniqueness is destroyed:
-                    right_row_id_index = 1
-                    unique_columns = { col_i_offset + right_row_id_index }
+                    # but the right row id (after the key, and before included columns, if any) stays unique:
+                    unique_columns = { col_i_offset + right_col_i for right_col_i in right_props.unique_columns }
         return ordered_columns, ordered_asc, unique_columns
 
     @cached_property
@@ -92,6 +93,13 @@ class IndexNLJoinPop(JoinPop['IndexNLJoinPop.CompiledProps']):
         ordered_columns, ordered_asc, unique_columns = self._infer_ordering_uniqueness_props()
         key_lower_exec = self.compile_valexpr(self.sarg.key_lower) if self.sarg.key_lower is not None else None
         key_upper_exec = self.compile_valexpr(self.sarg.key_upper) if self.sarg.key_upper is not None else None
+        if isinstance(cast(IndexScanPop, self.right).key_name, tuple):
+            # bounds for a composite index are tuples led by the prefix:
+            key_prefix_execs = [self.compile_valexpr(e) for e in self.sarg.key_prefix]
+            if key_lower_exec is not None or len(key_prefix_execs) > 0:
+                key_lower_exec = CompiledValExpr.tuple(*key_prefix_execs, *([key_lower_exec] if key_lower_exec is not None else []))
+            if key_upper_exec is not None or len(key_prefix_execs) > 0:
+                key_upper_exec = CompiledValExpr.tuple(*key_prefix_execs, *([key_upper_exec] if key_upper_exec is not None else []))
         cond_exec = self.compile_valexpr(self.cond) if self.cond is not None else None
         return IndexNLJoinPop.CompiledProps.from_inputs(self.left.compiled, self.right.compiled,
                                                         ordered_columns = ordered_columns,
@@ -121,16 +129,16 @@ class IndexNLJoinPop(JoinPop['IndexNLJoinPop.CompiledProps']):
 
     @profile_generator()
     def execute(self) -> Generator[tuple, None, None]:
-        key_lower_exec = self.compiled.key_lower_exec
-        key_upper_exec = self.compiled.key_upper_exec
-        cond_exec = self.compiled.cond_exec
+        key_lower_of = None if self.compiled.key_lower_exec is None else self.compiled.key_lower_exec.function('row0')
+        key_upper_of = None if self.compiled.key_upper_exec is None else self.compiled.key_upper_exec.function('row0')
+        cond = None if self.compiled.cond_exec is None else self.compiled.cond_exec.function('row0', 'row1')
         right = cast(IndexScanPop, self.right)
         for outer_row in self.left.execute():
-            key_lower = None if key_lower_exec is None else key_lower_exec.eval(row0 = outer_row)
-            key_upper = None if key_upper_exec is None else key_upper_exec.eval(row0 = outer_row)
+            key_lower = None if key_lower_of is None else key_lower_of(outer_row)
+            key_upper = None if key_upper_of is None else key_upper_of(outer_row)
             right.set_range(key_lower, key_upper,
                             self.sarg.lower_exclusive, self.sarg.upper_exclusive)
             for inner_row in right.execute():
-                if cond_exec is None or cond_exec.eval(row0 = outer_row, row1 = inner_row):
+                if cond is None or cond(outer_row, inner_row):
                     yield (*outer_row, *inner_row)
         return
@@ -1,4 +1,4 @@
-from typing import cast, Final, Iterable, Generator
+from typing import cast, Final, Iterable, Generator, Callable
 from contextlib import closing
 from dataclasses import dataclass
 from functools import cached_property
@@ -125,12 +125,13 @@ class MergeEqJoinPop(JoinPop['MergeEqJoinPop.CompiledProps']):
             unique_columns = left_props.unique_columns
         return ordered_columns, ordered_asc, unique_columns
 
-    def compare(self, this: tuple, that: tuple) -> int:
-        """Compare two rows ``this`` and ``that``,
-        and return ``-1``, ``0``, or ``1`` if ``this`` is less than (i.e., goes before in ascending order),
+    @cached_property
+    def compare(self) -> Callable[[tuple, tuple], int]:
+        """Function that compares two rows ``this`` and ``that``,
+        and returns ``-1``, ``0``, or ``1`` if ``this`` is less than (i.e., goes before in ascending order),
         equal to, or greater than ``that``, respectively.
         """
-        return self.compiled.cmp_exec.eval(this=this, that=that)
+        return self.compiled.cmp_exec.function('this', 'that')
 
     def _compile_comparators(self) -> tuple[CompiledValExpr, list[CompiledValExpr]]:
         # construct the comparator for merging:
@@ -226,16 +227,18 @@ class MergeEqJoinPop(JoinPop['MergeEqJoinPop.CompiledProps']):
         -> tuple[BufferedWriter, tuple | None, BufferedWriter, tuple | None]:
         def _helper(starting_row: tuple, iter: Generator[tuple, None, None], file: HeapFile, eq_exec: CompiledValExpr)\
             -> tuple[BufferedWriter, tuple | None]:
+            eq = eq_exec.function('this', 'that')
             file.truncate()
             writer = BufferedWriter(file, 1)
             writer.write(starting_row)
             while True:
                 row = next(iter, None)
-                if row is None or not eq_exec.eval(this=starting_row, that=row):
+                if row is None or not eq(starting_row, row):
                     if writer.num_blocks_flushed > 0:
                         # already spilled, so let's write buffered rows so join can proceed from the beginning;
                         # otherwise, no need to flush at all -- just use in-memory buffer:
                         writer.flush()
+                    self.context.tmp_files.num_bytes_spilled += writer.num_bytes_flushed
                     return writer, row
                 writer.write(row)
         writer0, row0_next = _helper(starting_row0, iter0, file0, self.compiled.side_eq_execs[0])
@@ -244,15 +247,14 @@ class MergeEqJoinPop(JoinPop['MergeEqJoinPop.CompiledProps']):
 
     @profile_generator()
     def execute(self) -> Generator[tuple, None, None]:
-        cmp_exec = self.compiled.cmp_exec
-        with self.context.sm.heap_file(self.context.tmp_tx, f'.tmp-{hex(id(self))}-left', [], create_if_not_exists=True) as file0, \
-            self.context.sm.heap_file(self.context.tmp_tx, f'.tmp-{hex(id(self))}-right', [], create_if_not_exists=True) as file1:
+        cmp = self.compare
+        with self.context.tmp_files.acquire([]) as file0, self.context.tmp_files.acquire([]) as file1:
             # because we want more explict control over input generators, use the with-closing pattern instead of for below:
             with closing(self.left.execute()) as iter0, closing(self.right.execute()) as iter1:
                 row0 = next(iter0, None)
                 row1 = next(iter1, None)
                 while row0 is not None and row1 is not None:
-                    cmp_result = cmp_exec.eval(this=row0, that=row1)
+                    cmp_result = cmp(row0, row1)
                     if cmp_result < 0:
                         row0 = next(iter0, None)
                     elif cmp_result > 0:
@@ -261,4 +263,6 @@ class MergeEqJoinPop(JoinPop['MergeEqJoinPop.CompiledProps']):
                         writer0, row0_next, writer1, row1_next = self.mini_bjlcj_prepare(row0, iter0, file0, row1, iter1, file1)
                         yield from self.mini_bnlcj_execute(writer0, writer1)
                         row0, row1 = row0_next, row1_next
+        self.context.tmp_files.release(file0)
+        self.context.tmp_files.release(file1)
         return
@@ -58,14 +58,9 @@ class MaterializePop(QPop[QPop.CompiledProps]):
                 overall = self.input.estimated.blocks.overall)) # note that subtree is paid as extra init cost
 
     def _tmp_file(self) -> HeapFile:
-        """Create a temporary file for caching input rows.
-        The file name is chosen in a way to help deduce which ``Pop`` produced it.
+        """Get a temporary file (from the statement's :class:`.TmpFilePool`) for caching input rows.
         """
-        f = self.context.sm.heap_file(self.context.tmp_tx,
-                                      f'.tmp-{hex(id(self))}-{hex(id(self.input))}',
-                                      [], create_if_not_exists=True)
-        f.truncate()
-        return f
+        return self.context.tmp_files.acquire(self.input.compiled.output_metadata.column_types)
 
     @profile_generator()
     def execute(self) -> Generator[tuple, None, None]:
@@ -80,6 +75,7 @@ class MaterializePop(QPop[QPop.CompiledProps]):
                 # already spilled, so let's write buffered rows so the file is complete;
                 # otherwise, no need to flush at all -- just use in-memory buffer:
                 self.writer.flush()
+                self.context.tmp_files.num_bytes_spilled += self.writer.num_bytes_flushed
             if not self.blocking: # already yielded results
                 return
         # leverage the materialized results:
@@ -92,5 +88,5 @@ class MaterializePop(QPop[QPop.CompiledProps]):
 
     def __exit__(self, exception_type, exception_value, exception_traceback):
         if self.writer is not None:
-            self.context.sm.delete_heap_file(self.context.tmp_tx, self.writer.file.name)
+            self.context.tmp_files.release(self.writer.file)
         return
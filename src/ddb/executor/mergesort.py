@@ -1,13 +1,15 @@
-from typing import Final, Iterable, Generator
+from typing import Final, Iterable, Generator, Callable
 from dataclasses import dataclass
 from functools import cached_property
 from math import ceil
 import logging
 
-from ..profile import profile_generator
+from ..globals import DEFAULT_BATCH_SIZE
+from ..util import iter_batches
+from ..profile import profile_generator, BatchProfileStat
 from ..storage import HeapFile
 from ..validator import ValExpr
-from ..primitives import CompiledValExpr
+from ..primitives import ValType, CompiledValExpr
 
 from .interface import QPop, ExecutorException
 from .util import ExtSortBuffer
@@ -24,19 +26,25 @@ class MergeSortPop(QPop['MergeSortPop.CompiledProps']):
         cmp_exec: CompiledValExpr
         """Executable for comparing rows.
         """
+        key_exec: CompiledValExpr
+        """Executable for computing the sort key of a row, which orders rows in the same way as ``cmp_exec``.
+        """
 
         def pstr(self) -> Iterable[str]:
             yield from super().pstr()
             if self.cmp_exec is not None:
                 yield f'row comparison code: {self.cmp_exec}'
+            yield f'sort key code: {self.key_exec}'
             return
 
     def __init__(self, input: QPop[QPop.CompiledProps],
                  exprs: list[ValExpr],
                  orders_asc: list[bool],
-                 num_memory_blocks: int, num_memory_blocks_final: int | None) -> None:
+                 num_memory_blocks: int, num_memory_blocks_final: int | None,
+                 loser_tree_fan_in: int | None = None) -> None:
         """Construct a sort on top of the given ``input``, using the specified expressions and orders.
         The number of memory blocks for the final pass does NOT include any block used for buffering output.
+        ``loser_tree_fan_in``, if given, is the number of runs from which merges use a tree of losers (see :class:`.ExtSortBuffer`).
         """
         super().__init__(input.context)
         self.input: Final = input
@@ -46,6 +54,7 @@ class MergeSortPop(QPop['MergeSortPop.CompiledProps']):
         if self.num_memory_blocks <= 2:
             raise ExecutorException('merge sort needs at least 3 memory blocks to perform a merge')
         self.num_memory_blocks_final: Final = num_memory_blocks_final or self.num_memory_blocks
+        self.loser_tree_fan_in: Final = loser_tree_fan_in
         return
 
     def memory_blocks_required(self) -> int:
@@ -58,6 +67,8 @@ class MergeSortPop(QPop['MergeSortPop.CompiledProps']):
         yield ', '.join(expr.to_str() + ' ' + ('ASC' if asc else 'DESC')
                         for expr, asc in zip(self.exprs, self.orders_asc))
         yield f'# memory blocks: {self.num_memory_blocks} ({self.num_memory_blocks_final} last pass)'
+        if self.loser_tree_fan_in is not None:
+            yield f'loser-tree merge: from {self.loser_tree_fan_in} runs'
         return
 
     def _infer_ordering_props(self) -> tuple[list[int], list[bool]]:
@@ -77,12 +88,13 @@ class MergeSortPop(QPop['MergeSortPop.CompiledProps']):
                     ordered_asc.append(asc)
         return ordered_columns, ordered_asc
 
-    def compare(self, this: tuple, that: tuple) -> int:
-        """Compare two rows ``this`` and ``that``,
-        and return ``-1``, ``0``, or ``1`` if ``this`` is less than (i.e., goes before in ascending order),
+    @cached_property
+    def compare(self) -> Callable[[tuple, tuple], int]:
+        """Function that compares two rows ``this`` and ``that``,
+        and returns ``-1``, ``0``, or ``1`` if ``this`` is less than (i.e., goes before in ascending order),
         equal to, or greater than ``that``, respectively.
         """
-        return self.compiled.cmp_exec.eval(this=this, that=that)
+        return self.compiled.cmp_exec.function('this', 'that')
 
     def _compile_comparators(self) -> CompiledValExpr:
         # construct the comparator for sorting:
@@ -105,6 +117,16 @@ class MergeSortPop(QPop['MergeSortPop.CompiledProps']):
             CompiledValExpr.conditional(eq_code, CompiledValExpr('0'), CompiledValExpr('1')))
         return cmp_exec
 
+    def _compile_sort_key(self) -> CompiledValExpr:
+        # construct the sort key, which is much cheaper for sorting than the comparator:
+        key_codes: list[CompiledValExpr] = list()
+        for expr, asc in zip(self.exprs, self.orders_asc):
+            code = self.compile_valexpr(expr, ['row0'])
+            if not asc:
+                code = CompiledValExpr.descending(code, expr.valtype() in (ValType.INTEGER, ValType.FLOAT, ValType.BOOLEAN))
+            key_codes.append(code)
+        return CompiledValExpr.tuple(*key_codes, avoid_singleton=True)
+
     @cached_property
     def compiled(self) -> 'MergeSortPop.CompiledProps':
         input_props = self.input.compiled
@@ -113,7 +135,8 @@ class MergeSortPop(QPop['MergeSortPop.CompiledProps']):
         return MergeSortPop.CompiledProps.from_input(input_props,
                                                      ordered_columns = ordered_columns,
                                                      ordered_asc = ordered_asc,
-                                                     cmp_exec = cmp_exec)
+                                                     cmp_exec = cmp_exec,
+                                                     key_exec = self._compile_sort_key())
 
     @cached_property
     def estimated(self) -> QPop.EstimatedProps:
@@ -133,28 +156,33 @@ class MergeSortPop(QPop['MergeSortPop.CompiledProps']):
                 overall = self.input.estimated.blocks.overall + block_self_reads + block_self_writes))
 
     def _tmp_file_create(self, level: int, run: int) -> HeapFile:
-        """Create a temporary file for a result run in a given level with an ordinal run number.
+        """Get a temporary file for a result run in a given level with an ordinal run number.
         Levels start at ``0`` (results of initial sorting pass) and go up by one with each additional merge pass.
         Each level may contain multiple result runs, numbered from ``0``.
-        The file name is chosen in a way to help deduce which ``Pop`` produced it and what level and run number it has.
+        The file comes from the statement's :class:`.TmpFilePool`, so its name does not reflect level or run.
         """
-        f = self.context.sm.heap_file(self.context.tmp_tx, f'.tmp-{hex(id(self))}-{level}-{run}', [], create_if_not_exists=True)
-        f.truncate()
-        return f
+        return self.context.tmp_files.acquire(self.input.compiled.output_metadata.column_types)
 
     def _tmp_file_delete(self, run: HeapFile) -> None:
-        """Delete a temporary file for a result run.
+        """Give a temporary file for a result run back to the pool.
         """
-        self.context.sm.delete_heap_file(self.context.tmp_tx, run.name)
+        self.context.tmp_files.release(run)
         return
 
-    @profile_generator()
     def execute(self) -> Generator[tuple, None, None]:
-        buffer = ExtSortBuffer(self.compare,
+        return self.rows_from_batches()
+
+    @profile_generator(BatchProfileStat)
+    def execute_batches(self) -> Generator[list[tuple], None, None]:
+        buffer = ExtSortBuffer(None,
                                self._tmp_file_create, self._tmp_file_delete,
-                               self.num_memory_blocks, self.num_memory_blocks_final)
+                               self.num_memory_blocks, self.num_memory_blocks_final,
+                               key=self.compiled.key_exec.function('row0'),
+                               loser_tree_fan_in=self.loser_tree_fan_in)
         logging.debug('***** pass 0: sort')
-        for row in self.input.execute():
-            buffer.add(row)
-        yield from buffer.iter_and_clear()
+        for batch in self.input.execute_batches():
+            for row in batch:
+                buffer.add(row)
+        yield from iter_batches(buffer.iter_and_clear(), DEFAULT_BATCH_SIZE)
+        self.context.tmp_files.num_bytes_spilled += buffer.num_bytes_flushed
         return
@@ -0,0 +1,176 @@
+from typing import cast, Final, Iterable, Generator, Callable, Any
+from dataclasses import dataclass
+from functools import cached_property
+from contextlib import closing
+
+from ..globals import DEFAULT_BATCH_SIZE
+from ..util import iter_batches
+from ..profile import profile_generator, get_profile_context, BatchProfileStat, PipelineProfileStat
+from ..primitives import compile_function
+
+from .interface import QPop, ExecutorException
+from .filter import FilterPop
+from .project import ProjectPop
+from .aggr import AggrPop
+
+class PipelinePop(QPop['PipelinePop.CompiledProps']):
+    """A physical operator that executes a pipeline of operators fused into one generated Python function,
+    such that each input row goes through all of them in a single loop,
+    instead of crossing a generator per operator.
+    The pipeline consumes batches from a source operator, which may be anything
+    (e.g., a table scan, or a blocking operator like :class:`.MergeSortPop`),
+    and fuses a chain of :class:`.FilterPop` and :class:`.ProjectPop` on top of it,
+    possibly ending with an :class:`.AggrPop` whose aggregates are all incrementally computable.
+    The generated code simply inlines the code of the operators' compiled expressions
+    (so it evaluates them one row at a time, without vectorization).
+
+    This operator is added by a post-pass over a finished plan (see ``planner.util.fuse_pipelines``),
+    on top of the fused operators, which remain in the plan as its child subtree only to be pretty-printed;
+    when profiling, statistics are still reported for each of them (see :class:`.PipelineProfileStat`).
+    """
+
+    @dataclass
+    class CompiledProps(QPop.CompiledProps):
+        code: str
+        """Generated Python source of the function executing the pipeline.
+        """
+        function: Callable[..., Any]
+        """The function executing the pipeline, compiled from ``code``.
+        """
+
+        def pstr(self) -> Iterable[str]:
+            yield from super().pstr()
+            yield 'pipeline code:'
+            for line in self.code.splitlines():
+                yield f'  {line}'
+            return
+
+    @classmethod
+    def chain(cls, top: QPop[QPop.CompiledProps]) -> tuple[list[QPop[QPop.CompiledProps]], QPop[QPop.CompiledProps]]:
+        """Find the maximal chain of operators, ending with ``top``, that can be fused into a pipeline.
+        Return the list of these operators (bottom up, possibly empty), along with the source operator underneath.
+        """
+        fused: list[QPop[QPop.CompiledProps]] = list()
+        pop = top
+        if isinstance(pop, AggrPop) and pop.num_non_incremental == 0:
+            fused.insert(0, pop)
+            pop = pop.input
+        while isinstance(pop, (FilterPop, ProjectPop)):
+            fused.insert(0, pop)
+            pop = pop.input
+        return fused, pop
+
+    def __init__(self, top: QPop[QPop.CompiledProps]) -> None:
+        """Construct a pipeline fusing the maximal chain of operators that ends with ``top`` (see :meth:`.chain`).
+        """
+        super().__init__(top.context)
+        self.top: Final = top
+        fused, source = PipelinePop.chain(top)
+        if len(fused) == 0:
+            raise ExecutorException(f'{type(top).__name__} cannot be fused into a pipeline')
+        self.fused: Final = fused
+        self.source: Final = source
+        return
+
+    def memory_blocks_required(self) -> int:
+        return 0
+
+    def children(self) -> tuple[QPop[QPop.CompiledProps], ...]:
+        return (self.top, )
+
+    def pstr_more(self) -> Iterable[str]:
+        yield 'fused: ' + ' -> '.join(f'{type(pop).__name__}[{hex(id(pop))}]' for pop in self.fused)
+        yield f'source: {type(self.source).__name__}[{hex(id(self.source))}]'
+        return
+
+    def is_aggregating(self) -> bool:
+        """Check if the pipeline ends with an :class:`.AggrPop`,
+        in which case the generated function only updates the aggregate states, and yields nothing.
+        """
+        return isinstance(self.fused[-1], AggrPop)
+
+    def _generate_code(self) -> str:
+        """Generate the Python source of the function executing the pipeline.
+        The function takes the batches from the source, the list of row counts for the fused operators to add to,
+        and (if aggregating) the dictionary of group states to update.
+        Each fused operator's code refers to its input row as ``row0``, so a projection simply rebinds it.
+        """
+        loop: list[str] = list()
+        counters: list[str] = list()
+        count_codes: list[str] = list()
+        count_code = 'len(_batch)' # number of rows coming out of the previous operator in the current batch
+        for i, pop in enumerate(self.fused):
+            if isinstance(pop, FilterPop):
+                loop.append(f'if not ({pop.compiled.cond_exec}):')
+                loop.append(f'    continue')
+                loop.append(f'_n{i} += 1')
+                counters.append(f'_n{i}')
+                count_code = f'_n{i}'
+            elif isinstance(pop, ProjectPop):
+                loop.append(f'row0 = {pop.compiled.output_row_exec}')
+            elif isinstance(pop, AggrPop): # like the incremental case of AggrPop.execute_batches, keyed by the group tuple:
+                aggr_props = cast(AggrPop, pop).compiled
+                loop.append(f'_grp = {aggr_props.groupby_row_exec}')
+                loop.append(f'if (_states := _groups.get(_grp)) is None:')
+                loop.append(f'    _states = _groups[_grp] = [' +
+                            ', '.join(f'({exec})' for exec in aggr_props.aggr_init_execs) + ']')
+                for j, (input_exec, add_exec) in enumerate(zip(aggr_props.aggr_input_execs, aggr_props.aggr_add_execs)):
+                    loop.append(f'state, new_val = _states[{j}], ({input_exec})')
+                    loop.append(f'_states[{j}] = {add_exec}')
+                continue # rows counted by the caller
+            else:
+                raise ExecutorException('unexpected error')
+            count_codes.append(count_code)
+        lines = [ 'def pipeline(_batches, _counts, _groups):',
+                  '    for _batch in _batches:' ]
+        if len(counters) > 0:
+            lines.append('        ' + ' = '.join(counters) + ' = 0')
+        if not self.is_aggregating():
+            lines.append('        _out = []')
+            loop.append('_out.append(row0)')
+        lines.append('        for row0 in _batch:')
+        lines.extend(f'            {line}' for line in loop)
+        lines.extend(f'        _counts[{i}] += {code}' for i, code in enumerate(count_codes))
+        if not self.is_aggregating():
+            lines.append('        if len(_out) > 0:')
+            lines.append('            yield _out')
+        return '\n'.join(lines) + '\n'
+
+    @cached_property
+    def compiled(self) -> 'PipelinePop.CompiledProps':
+        code = self._generate_code()
+        return PipelinePop.CompiledProps.from_input(self.top.compiled,
+                                                    code = code,
+                                                    function = compile_function(code, 'pipeline'))
+
+    @cached_property
+    def estimated(self) -> QPop.EstimatedProps:
+        return self.top.estimated
+
+    def execute(self) -> Generator[tuple, None, None]:
+        return self.rows_from_batches()
+
+    @profile_generator(PipelineProfileStat)
+    def execute_batches(self) -> Generator[list[tuple], None, None]:
+        profile_context = get_profile_context()
+        stats = None if profile_context is None else \
+            [ profile_context.fuse(BatchProfileStat, type(pop).execute_batches, pop) for pop in self.fused ]
+        counts = [0] * len(self.fused)
+        try:
+            with closing(self.source.execute_batches()) as batches:
+                if not self.is_aggregating():
+                    yield from self.compiled.function(batches, counts, None)
+                    return
+                groups: dict[tuple, list] = dict()
+                self.compiled.function(batches, counts, groups)
+            aggr_props = cast(AggrPop, self.fused[-1]).compiled
+            finalizes = [ exec.function('state') for exec in aggr_props.aggr_finalize_execs ]
+            outputs = [ grp + tuple(finalize(state) for finalize, state in zip(finalizes, states))
+                        for grp, states in groups.items() ]
+            counts[-1] = len(outputs)
+            yield from iter_batches(outputs, DEFAULT_BATCH_SIZE)
+        finally:
+            if stats is not None:
+                for stat, count in zip(stats, counts):
+                    stat.num_next_calls = count + 1 # as if the last next() call signifying the end had been made
+        return
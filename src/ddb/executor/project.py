@@ -2,7 +2,9 @@ from typing import cast, Final, Iterable, Sequence, Generator
 from dataclasses import dataclass
 from functools import cached_property
 
-from ..profile import profile_generator
+from ..globals import DEFAULT_BATCH_SIZE
+from ..util import coalesce_batches
+from ..profile import profile_generator, BatchProfileStat
 from ..validator import valexpr, ValExpr, OutputLineage
 from ..primitives import CompiledValExpr
 from ..metadata import TableMetadata, INTERNAL_ANON_COLUMN_NAME_FORMAT, INTERNAL_ANON_TABLE_NAME_FORMAT
@@ -19,11 +21,16 @@ class ProjectPop(QPop['ProjectPop.CompiledProps']):
         output_execs: list[CompiledValExpr]
         """Executable for computing each of the output columns.
         """
+        output_row_exec: CompiledValExpr
+        """Executable for computing an entire output row at once.
+        """
 
         def pstr(self) -> Iterable[str]:
             yield from super().pstr()
             for column_name, exec in zip(self.output_metadata.column_names, self.output_execs):
                 yield f'code for {column_name}: {exec}'
+                if (vector_code := exec.vector_code()) is not None:
+                    yield f'vectorized code for {column_name}: {vector_code}'
             return
 
     def __init__(self, input: QPop[QPop.CompiledProps], exprs: list[ValExpr], column_names: Sequence[str | None] | None) -> None:
@@ -81,13 +88,14 @@ class ProjectPop(QPop['ProjectPop.CompiledProps']):
         for input_column_index in input_props.unique_columns:
             if (i := preserved_input_columns.get(input_column_index)) is not None:
                 unique_columns = unique_columns | {i}
-        output_execs = [self.compile_valexpr(expr) for expr in self.output_exprs]
+        output_execs = [self.compile_valexpr(expr, vectorize=True) for expr in self.output_exprs]
         return ProjectPop.CompiledProps(output_metadata = TableMetadata(self.output_column_names, output_column_types),
                                         output_lineage = output_lineage,
                                         ordered_columns = ordered_columns,
                                         ordered_asc = ordered_asc,
                                         unique_columns = unique_columns,
-                                        output_execs = output_execs)
+                                        output_execs = output_execs,
+                                        output_row_exec = CompiledValExpr.tuple(*output_execs))
 
     @cached_property
     def estimated(self) -> QPop.EstimatedProps:
@@ -101,9 +109,17 @@ class ProjectPop(QPop['ProjectPop.CompiledProps']):
                 self_writes = 0,
                 overall = self.input.estimated.blocks.overall))
 
-    @profile_generator()
     def execute(self) -> Generator[tuple, None, None]:
+        return self.rows_from_batches()
+
+    @profile_generator(BatchProfileStat)
+    def execute_batches(self) -> Generator[list[tuple], None, None]:
         output_execs = self.compiled.output_execs
-        for row in self.input.execute():
-            yield tuple(exec.eval(row0 = row) for exec in output_execs)
+        output_row_exec = self.compiled.output_row_exec
+        if all(exec.vector_code() is None for exec in output_execs):
+            for batch in self.input.execute_batches():
+                yield output_row_exec.eval_batch('row0', batch)
+        else: # compute column by column, vectorized where possible (which pays off only for big enough batches):
+            for batch in coalesce_batches(self.input.execute_batches(), DEFAULT_BATCH_SIZE):
+                yield list(zip(*(exec.eval_batch('row0', batch) for exec in output_execs)))
         return
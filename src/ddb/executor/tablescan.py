@@ -1,13 +1,20 @@
-from typing import Final, Iterable, Generator
+from typing import cast, Final, ClassVar, Iterable, Generator, Callable, Any
+from dataclasses import dataclass
 from functools import cached_property
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future
+import multiprocessing
+import importlib
 
+from ..globals import DEFAULT_PARALLEL_SCAN_WORKERS
 from ..metadata import INTERNAL_ROW_ID_COLUMN_NAME, INTERNAL_ROW_ID_COLUMN_TYPE
-from ..profile import profile_generator
-from ..storage import HeapFile, BplusTree
-from ..validator import OutputLineage
+from ..profile import profile_generator, BatchProfileStat
+from ..storage import SnapshotChangedException, Zone, ScanPartition, HeapFile, BplusTree
+from ..validator import OutputLineage, valexpr, ValExpr
 from ..metadata import TableMetadata, BaseTableMetadata, ValType
+from ..primitives import CompiledValExpr
 
-from .interface import QPop, StatementContext
+from .interface import QPop, StatementContext, ExecutorException
 
 class TableScanPop(QPop[QPop.CompiledProps]):
     """Table scan physical operator.
@@ -16,16 +23,21 @@ class TableScanPop(QPop[QPop.CompiledProps]):
     if row id is requested, this scan will return the row id as the first column, followed by the normal columns.
     For a table with a primary key, the underlying storage is :class:`.BplusTree`;
     this scan will return the primary key as the first column, followed by the rest of the columns.
+    Optionally, the storage manager can be asked to prefetch a number of blocks ahead of the scan
+    on a background thread, so that reading overlaps with processing the rows already returned.
     """
-    def __init__(self, context: StatementContext, alias: str, meta: BaseTableMetadata, return_row_id: bool = False):
+    def __init__(self, context: StatementContext, alias: str, meta: BaseTableMetadata, return_row_id: bool = False,
+                 prefetch_blocks: int = 0):
         """Construct a table scan for the database table whose metadata is given by ``meta``,
         with table alias ``alias``.
         ``return_row_id`` option only matters for a table with no primary key.
+        ``prefetch_blocks`` is the number of blocks to read ahead (``0`` disables prefetching).
         """
         super().__init__(context)
         self.alias: Final = alias
         self.meta: Final = meta
         self.return_row_id: Final = return_row_id
+        self.prefetch_blocks: Final = prefetch_blocks
         return
 
     def memory_blocks_required(self) -> int:
@@ -36,6 +48,8 @@ class TableScanPop(QPop[QPop.CompiledProps]):
 
     def pstr_more(self) -> Iterable[str]:
         yield f'{self.meta.name} AS {self.alias}'
+        if self.prefetch_blocks > 0:
+            yield f'prefetch: {self.prefetch_blocks} blocks'
 
     @cached_property
     def compiled(self) -> QPop.CompiledProps:
@@ -87,13 +101,313 @@ class TableScanPop(QPop[QPop.CompiledProps]):
                 self_writes = block_self_writes,
                 overall = block_overall))
 
-    @profile_generator()
     def execute(self) -> Generator[tuple, None, None]:
+        return self.rows_from_batches()
+
+    @profile_generator(BatchProfileStat)
+    def execute_batches(self) -> Generator[list[tuple], None, None]:
         with self.context.mm.table_storage(self.context.tx, self.meta) as file:
             if isinstance(file, HeapFile):
-                for row in file.iter_scan(return_row_id=self.return_row_id):
-                    yield row
+                for batch in file.iter_scan_batches(return_row_id=self.return_row_id,
+                                                    num_blocks=self.memory_blocks_required(),
+                                                    prefetch_blocks=self.prefetch_blocks):
+                    if len(batch) > 0:
+                        yield batch
             elif isinstance(file, BplusTree):
-                for key, row in file.iter_scan():
-                    yield (key, *row) # key is the first column that gets read out
+                for batch in file.iter_scan_batches(num_blocks=self.memory_blocks_required(),
+                                                    prefetch_blocks=self.prefetch_blocks):
+                    if len(batch) > 0:
+                        yield [ (key, *row) for key, row in batch ] # key is the first column that gets read out
+        return
+
+_ZONE_TESTS: Final[dict[type[valexpr.binary.CompareOpValExpr], Callable[[Any, Any, Any], bool]]] = {
+    valexpr.binary.EQ: lambda lo, hi, v: lo <= v <= hi,
+    valexpr.binary.NE: lambda lo, hi, v: not (lo == hi == v),
+    valexpr.binary.LT: lambda lo, hi, v: lo < v,
+    valexpr.binary.LE: lambda lo, hi, v: lo <= v,
+    valexpr.binary.GT: lambda lo, hi, v: hi > v,
+    valexpr.binary.GE: lambda lo, hi, v: hi >= v,
+}
+"""For each comparison "column op value", a test on the min (``lo``) and max (``hi``) column values in a zone
+that fails only if no row in the zone can possibly satisfy the comparison.
+"""
+
+class ZoneMapScanPop(TableScanPop):
+    """Table scan physical operator that uses the zone map of a table stored in a :class:`.HeapFile`
+    to skip chunks of rows that cannot satisfy given conditions.
+    The conditions are conjuncts (see ``valexpr.conjunctive_parts``) that all rows of interest must satisfy;
+    those comparing a column of this table with a column-free expression are checked against the
+    :class:`.Zone` of each chunk, and the others are ignored.
+    Rows in chunks that are not skipped are returned without further checks,
+    so the conditions still need to be evaluated by some operator above (e.g., a :class:`.FilterPop`).
+    """
+    def __init__(self, context: StatementContext, alias: str, meta: BaseTableMetadata, conds: list[valexpr.ValExpr],
+                 return_row_id: bool = False):
+        """Construct a zone-map-based scan for the database table whose metadata is given by ``meta``,
+        with table alias ``alias``, using conjuncts ``conds``.
+        The table must be stored in a heap file with a zone map.
+        """
+        super().__init__(context, alias, meta, return_row_id)
+        self.conds: Final = conds
+        self.zone_tests: Final = type(self).make_zone_tests(alias, meta, conds)
+        return
+
+    @staticmethod
+    def make_zone_tests(alias: str, meta: BaseTableMetadata, conds: list[valexpr.ValExpr]) \
+            -> list[tuple[int, type[valexpr.binary.CompareOpValExpr], Any]]:
+        """Find among ``conds`` those that can be checked against zones of the table (with ``alias`` and ``meta``),
+        and return, for each of them, the triple of column index, comparison type, and value to compare with.
+        """
+        tests: list[tuple[int, type[valexpr.binary.CompareOpValExpr], Any]] = list()
+        for cond in conds:
+            if (found := valexpr.is_column_comparing_to_literal(cond)) is None:
+                continue
+            column, comp, expr = found
+            if not isinstance(column, valexpr.NamedColumnRef) or column.table_alias != alias\
+                or column.column_name not in meta.column_names:
+                continue
+            column_index = meta.column_names.index(column.column_name)
+            if column_index in meta.dictionary_column_indices: # zones summarize codes instead of strings
+                continue
+            if (value := valexpr.eval_literal(expr)) is None:
+                continue
+            tests.append((column_index, comp, value))
+        return tests
+
+    def pstr_more(self) -> Iterable[str]:
+        yield from super().pstr_more()
+        yield 'zone map checks: ' + ' AND '.join(cond.to_str() for cond in self.conds)
+        return
+
+    def may_match(self, zone: Zone) -> bool:
+        """Check if any row in the chunk summarized by ``zone`` can possibly satisfy all conditions.
+        """
+        for column_index, comp, value in self.zone_tests:
+            if zone.null_counts[column_index] >= zone.num_rows: # comparing with NULL never holds
+                return False
+            try:
+                if not _ZONE_TESTS[comp](zone.mins[column_index], zone.maxs[column_index], value):
+                    return False
+            except TypeError: # not comparable, so be conservative
+                continue
+        return True
+
+    @profile_generator(BatchProfileStat)
+    def execute_batches(self) -> Generator[list[tuple], None, None]:
+        with self.context.mm.table_storage(self.context.tx, self.meta) as file:
+            if not isinstance(file, HeapFile):
+                raise ExecutorException('unexpected error')
+            for batch in file.iter_scan_batches(return_row_id=self.return_row_id,
+                                                num_blocks=self.memory_blocks_required(),
+                                                zone_filter=self.may_match):
+                if len(batch) > 0:
+                    yield batch
+        return
+
+def _filter_and_project(batch: list[tuple], entries: bool,
+                        cond_exec: CompiledValExpr | None, column_indices: list[int] | None) -> list[tuple]:
+    """Return the rows in ``batch`` (with (key, row) ``entries`` flattened first) that satisfy ``cond_exec`` (if any),
+    keeping only the columns at ``column_indices`` (if given).
+    """
+    rows: list[tuple] = list()
+    cond = None if cond_exec is None else cond_exec.function('row0')
+    for row in batch:
+        if entries:
+            row = (row[0], *row[1])
+        if cond is not None and not cond(row):
+            continue
+        rows.append(row if column_indices is None else tuple(row[i] for i in column_indices))
+    return rows
+
+def _scan_partition(partition: ScanPartition, entries: bool,
+                    cond_exec: CompiledValExpr | None, column_indices: list[int] | None) -> tuple[int, list[list[tuple]]]:
+    """Scan ``partition`` in a worker process of :class:`.ParallelTableScanPop`,
+    and return the number of rows scanned, together with the nonempty batches of resulting rows
+    (see :func:`._filter_and_project`).
+    """
+    num_scanned = 0
+    batches: list[list[tuple]] = list()
+    for batch in partition.iter_scan_batches():
+        num_scanned += len(batch)
+        if len(rows := _filter_and_project(batch, entries, cond_exec, column_indices)) > 0:
+            batches.append(rows)
+    return num_scanned, batches
+
+class ParallelTableScanPop(QPop['ParallelTableScanPop.CompiledProps']):
+    """Table scan physical operator that farms the scan out to a pool of worker processes,
+    with a selection condition and a projection (onto a subset of columns) pushed down into it.
+    The storage manager divides the table into parts by row id or key (see :meth:`.HeapFile.scan_partitions`),
+    several per worker to even out the load;
+    each worker scans a part in its own read-only transaction, and sends back batches of the rows that survive.
+    Parts are handed out a few at a time, and their results are returned in order,
+    so the output is ordered just like that of a :class:`.TableScanPop`.
+    Since workers see only committed data, this operator should only be used
+    if the statement's transaction sees nothing else (see ``StatementContext.tx_sees_committed``).
+    If the storage manager cannot divide the table, the scan is carried out by this process instead;
+    the same happens to whatever remains of the scan if a commit makes the parts stale before workers get to them.
+    """
+
+    PARTS_PER_WORKER: Final[int] = 4
+    """Number of parts that the table is divided into for each worker.
+    """
+
+    pools: ClassVar[dict[int, ProcessPoolExecutor]] = dict()
+    """Pools of worker processes, by number of workers, created as needed and shared by all scans.
+    """
+
+    @dataclass
+    class CompiledProps(QPop.CompiledProps):
+        cond_exec: CompiledValExpr | None
+        """Executable for the selection condition (if any), over rows as scanned.
+        """
+        column_indices: list[int] | None
+        """Indices of the columns (in rows as scanned) to keep, or ``None`` to keep all.
+        """
+
+        def pstr(self) -> Iterable[str]:
+            yield from super().pstr()
+            if self.cond_exec is not None:
+                yield f'filter condition code: {self.cond_exec}'
+            return
+
+    def __init__(self, context: StatementContext, alias: str, meta: BaseTableMetadata,
+                 cond: ValExpr | None, column_names: set[str] | None,
+                 return_row_id: bool = False, num_workers: int = DEFAULT_PARALLEL_SCAN_WORKERS):
+        """Construct a parallel scan for the database table whose metadata is given by ``meta``,
+        with table alias ``alias``, returning rows that satisfy ``cond`` (if given),
+        with only the columns named in ``column_names`` (if given; the row id, if requested, is always kept).
+        """
+        super().__init__(context)
+        self.alias: Final = alias
+        self.meta: Final = meta
+        self.cond: Final = cond
+        self.column_names: Final = column_names
+        self.return_row_id: Final = return_row_id
+        self.num_workers: Final = num_workers
+        self.scan: Final = TableScanPop(context, alias, meta, return_row_id)
+        """A serial scan of the table (never executed), which tells what rows as scanned look like.
+        """
+        return
+
+    def memory_blocks_required(self) -> int:
+        return 1
+
+    def children(self) -> tuple[QPop[QPop.CompiledProps], ...]:
+        return tuple()
+
+    def pstr_more(self) -> Iterable[str]:
+        yield f'{self.meta.name} AS {self.alias}'
+        if self.cond is not None:
+            yield 'filter condition: ' + self.cond.to_str()
+        if self.column_names is not None:
+            yield 'columns: ' + ', '.join(self.compiled.output_metadata.column_names)
+        yield f'{self.num_workers} workers'
+        return
+
+    @cached_property
+    def compiled(self) -> 'ParallelTableScanPop.CompiledProps':
+        scanned = self.scan.compiled
+        cond_exec = None if self.cond is None \
+            else CompiledValExpr(valexpr.to_code_str(self.cond, [scanned.output_lineage], ['row0']))
+        if self.column_names is None:
+            return ParallelTableScanPop.CompiledProps.from_input(scanned, cond_exec = cond_exec, column_indices = None)
+        column_indices = [ i for i, column_name in enumerate(scanned.output_metadata.column_names)
+                           if column_name in self.column_names or column_name == INTERNAL_ROW_ID_COLUMN_NAME ]
+        output_indices = { column_index: i for i, column_index in enumerate(column_indices) }
+        ordered_columns: list[int] = list()
+        ordered_asc: list[bool] = list()
+        for column_index, asc in zip(scanned.ordered_columns, scanned.ordered_asc):
+            if (i := output_indices.get(column_index)) is None:
+                break
+            ordered_columns.append(i)
+            ordered_asc.append(asc)
+        return ParallelTableScanPop.CompiledProps(
+            output_metadata = TableMetadata([ scanned.output_metadata.column_names[i] for i in column_indices ],
+                                            [ scanned.output_metadata.column_types[i] for i in column_indices ]),
+            output_lineage = [ scanned.output_lineage[i] for i in column_indices ],
+            ordered_columns = ordered_columns,
+            ordered_asc = ordered_asc,
+            unique_columns = { output_indices[i] for i in scanned.unique_columns if i in output_indices },
+            cond_exec = cond_exec,
+            column_indices = column_indices)
+
+    @cached_property
+    def estimated(self) -> QPop.EstimatedProps:
+        scanned = self.scan.compiled
+        stats = self.scan.estimated.stats
+        if self.cond is not None:
+            stats = self.context.zm.selection_stats(stats, valexpr.relativize(self.cond, [scanned.output_lineage]))
+        if (column_indices := self.compiled.column_indices) is not None:
+            stats = self.context.zm.projection_stats(
+                stats,
+                [ valexpr.leaf.RelativeColumnRef(0, i, scanned.output_metadata.column_types[i]) for i in column_indices ])
+        return QPop.EstimatedProps(
+            stats = stats,
+            blocks = self.scan.estimated.blocks)
+
+    def pool(self) -> ProcessPoolExecutor:
+        """Return the pool of worker processes to use.
+        Workers are spawned instead of forked, so they do not inherit the LMDB environments opened by this process.
+        Each worker starts by importing :mod:`ddb.db`, just like this process did,
+        because this module cannot be imported first (:mod:`.stats` and :mod:`.executor` import each other).
+        """
+        if (pool := type(self).pools.get(self.num_workers)) is None:
+            pool = ProcessPoolExecutor(max_workers = self.num_workers, mp_context = multiprocessing.get_context('spawn'),
+                                       initializer = importlib.import_module, initargs = ('ddb.db', ))
+            type(self).pools[self.num_workers] = pool
+        return pool
+
+    def execute(self) -> Generator[tuple, None, None]:
+        return self.rows_from_batches()
+
+    @profile_generator(BatchProfileStat)
+    def execute_batches(self) -> Generator[list[tuple], None, None]:
+        cond_exec = self.compiled.cond_exec
+        column_indices = self.compiled.column_indices
+        partitions: list[ScanPartition] | None
+        with self.context.mm.table_storage(self.context.tx, self.meta) as file:
+            entries = isinstance(file, BplusTree)
+            num_partitions = self.num_workers * type(self).PARTS_PER_WORKER
+            if isinstance(file, HeapFile):
+                partitions = file.scan_partitions(num_partitions, return_row_id = self.return_row_id)
+            else:
+                partitions = cast(BplusTree, file).scan_partitions(num_partitions)
+            num_skipped = 0
+            if partitions is not None:
+                pool = self.pool()
+                remaining = iter(partitions)
+                futures: deque[Future[tuple[int, list[list[tuple]]]]] = deque()
+                try:
+                    for partition in remaining:
+                        futures.append(pool.submit(_scan_partition, partition, entries, cond_exec, column_indices))
+                        if len(futures) >= 2 * self.num_workers:
+                            break
+                    while len(futures) > 0:
+                        try:
+                            num_scanned, batches = futures.popleft().result()
+                        except SnapshotChangedException: # finish serially below
+                            break
+                        next_partition = next(remaining, None)
+                        if next_partition is not None:
+                            futures.append(pool.submit(_scan_partition, next_partition, entries, cond_exec, column_indices))
+                        num_skipped += num_scanned
+                        yield from batches
+                    else:
+                        return
+                finally:
+                    for future in futures:
+                        future.cancel()
+            # do it ourselves, skipping over the rows already scanned by workers
+            # (this transaction sees the same snapshot that the parts were made from, in the same order):
+            scanned = file.iter_scan_batches(return_row_id = self.return_row_id) if isinstance(file, HeapFile) \
+                else cast(BplusTree, file).iter_scan_batches()
+            for batch in scanned:
+                if num_skipped >= len(batch):
+                    num_skipped -= len(batch)
+                    continue
+                if num_skipped > 0:
+                    batch = batch[num_skipped:]
+                    num_skipped = 0
+                if len(rows := _filter_and_project(batch, entries, cond_exec, column_indices)) > 0:
+                    yield rows
         return
@@ -3,8 +3,9 @@
 from typing import cast, Final, Iterator, Generator, Callable, Any
 from sys import getsizeof
 from math import ceil
-from functools import cmp_to_key, total_ordering
-from queue import PriorityQueue
+from functools import cmp_to_key
+from itertools import chain
+from heapq import heapify, heappop, heapreplace
 from sortedcontainers import SortedSet # type: ignore
 import logging
 
@@ -65,6 +66,7 @@ class BufferedWriter:
         self.buffer: Final[list[tuple]] = list()
         self.num_bytes = 0
         self.num_blocks_flushed = 0
+        self.num_bytes_flushed = 0
         return
 
     def write(self, row: tuple) -> None:
@@ -82,43 +84,77 @@ class BufferedWriter:
         """
         self.file.batch_append(self.buffer)
         self.num_blocks_flushed += 1
+        self.num_bytes_flushed += self.num_bytes
         self.buffer.clear()
         self.num_bytes = 0
         return
 
-class PQueue(PriorityQueue):
-    """A priority queue with a custom comparator function.
+def heap_merge(sources: list[Iterator[tuple]], key: Callable[[tuple], Any]) -> Generator[tuple, None, None]:
+    """Merge rows from the given sources, each already sorted by ``key``, and return a stream of rows in sorted order.
+    Rows with equal keys come out in the order of their sources (so the merge is stable).
+    The merge maintains a binary heap (using :mod:`heapq`) of ``(sort_key, source_#, row)`` entries, one per source;
+    the source number breaks ties, so rows themselves are never compared.
     """
+    heap: list[tuple[Any, int, tuple]] = list()
+    for i, source in enumerate(sources):
+        row = next(source, None)
+        if row is not None:
+            heap.append((key(row), i, row))
+    heapify(heap)
+    while len(heap) > 0:
+        _, i, row = heap[0]
+        yield row
+        # replace the entry just returned with the next row from the same source (if any):
+        row = next(sources[i], None)
+        if row is None:
+            heappop(heap)
+        else:
+            heapreplace(heap, (key(row), i, row))
+    return
 
-    @total_ordering
-    class _WrappedItem:
-        """Internal helper class used to remember the custom comparator.
-        """
-        def __init__(self, item: Any, cmp: Callable[[Any, Any], int]) -> None:
-            self.item: Final = item
-            self.cmp: Final = cmp
-
-        def __eq__(self, other: object) -> bool:
-            return self.cmp(self.item, cast('PQueue._WrappedItem', other).item) == 0
-
-        def __lt__(self, other: object) -> bool:
-            return self.cmp(self.item, cast('PQueue._WrappedItem', other).item) < 0
-
-    def __init__(self, cmp: Callable[[Any, Any], int]) -> None:
-        self.cmp: Final = cmp
-        super().__init__()
+def loser_tree_merge(sources: list[Iterator[tuple]], key: Callable[[tuple], Any]) -> Generator[tuple, None, None]:
+    """Same as :func:`.heap_merge`, but use a tree of losers instead of a heap.
+    Each internal node of the tree remembers the source that lost the match played there,
+    so replacing the winner takes exactly one comparison per level on the path back up to the root,
+    whereas a heap needs up to two.
+    The comparisons are made in Python, however, while :mod:`heapq` makes them in C,
+    so this only pays off with very high fan-in and expensive keys.
+    """
+    k = len(sources)
+    if k == 0:
         return
-
-    def enqueue(self, item: Any) -> None:
-        """Add an item to the queue.
-        """
-        super().put(PQueue._WrappedItem(item, self.cmp))
+    # the ``(sort_key, source_#)`` of the current row from each source, or ``None`` if the source is exhausted:
+    heads: list[tuple|None] = [None] * k
+    keys: list[tuple|None] = [None] * k
+    def advance(i: int) -> None:
+        row = next(sources[i], None)
+        heads[i] = row
+        keys[i] = None if row is None else (key(row), i)
         return
-
-    def dequeue(self) -> Any:
-        """Remove the smallest item from the queue.
-        """
-        return super().get().item
+    def beats(i: int, j: int) -> bool:
+        ki, kj = keys[i], keys[j]
+        return ki is not None and (kj is None or ki < kj)
+    # lay the tree out like a heap: node n has children 2n and 2n+1; source i sits at leaf k+i;
+    # tree[n] is the loser at internal node n, and tree[0] is the overall winner:
+    for i in range(k):
+        advance(i)
+    winners = [0] * k + list(range(k))
+    tree = [0] * k
+    for n in range(k-1, 0, -1):
+        this, that = winners[2*n], winners[2*n+1]
+        winners[n], tree[n] = (this, that) if beats(this, that) else (that, this)
+    tree[0] = winners[1]
+    while keys[winner := tree[0]] is not None:
+        yield cast(tuple, heads[winner])
+        advance(winner)
+        # replay the matches on the path from the winner's leaf up to the root:
+        n = (k + winner) // 2
+        while n > 0:
+            if beats(tree[n], winner):
+                tree[n], winner = winner, tree[n]
+            n //= 2
+        tree[0] = winner
+    return
 
 class ExtSortBuffer:
     """Buffer rows, sort them (with optional deduplication), and allow them to be iterated over in order.
@@ -126,17 +162,22 @@ class ExtSortBuffer:
     Otherwise, an external-memory merge sort is performed.
     """
     def __init__(self,
-                 compare: Callable[[tuple, tuple], int],
+                 compare: Callable[[tuple, tuple], int] | None,
                  tmp_file_create: Callable[[int, int], HeapFile],
                  tmp_file_delete: Callable[[HeapFile], None],
                  num_memory_blocks: int, num_memory_blocks_final: int | None = None,
-                 deduplicate: bool = False) -> None:
+                 deduplicate: bool = False,
+                 key: Callable[[tuple], Any] | None = None,
+                 loser_tree_fan_in: int | None = None) -> None:
         """Construct a sorting buffer using the specified number of memory blocks.
         You can add rows to this buffer and then get them back in sorted order (optionally deduplicated).
         Beware, however, that you must finish adding all rows before retrieving any of them.
         ``compare(this, that)`` should allow this writer to compare two rows``this`` and ``that``,
         and return ``-1``, ``0``, or ``1`` if ``this`` is less than (i.e., goes before in ascending order),
         equal to, or greater than ``that``, respectively.
+        Alternatively (and preferably), ``compare`` can be ``None`` and ``key(row)`` should return the sort key of a row instead,
+        as in Python's ``list.sort()``: sorting with keys computed once per row is much cheaper than
+        calling a comparator for every comparison, which is what ``compare`` entails.
         This buffer will use temporary files as needed when it runs out of memory.
         ``tmp_file_make(level, run)`` should allow this writer to create temporary files within the appropriate transaction context:
         ``level`` starts at ``0`` (results of initial sorting pass) and go up by one with each additional merge pass;
@@ -144,9 +185,16 @@ class ExtSortBuffer:
         ``tmp_file_delete(heapfile)`` should allow this writer to delete a temporary file.
         If ``deduplicate`` is ``True``, duplicates will be removed;
         here, duplicates are defined as rows that satisfy ``==`` (a condition stronger than ``compare`` returning ``0``).
+        Runs are merged with a heap (see :func:`.heap_merge`), unless ``loser_tree_fan_in`` is given,
+        in which case merges of at least that many runs use a tree of losers instead (see :func:`.loser_tree_merge`).
         """
-        self.compare: Final = compare
-        self.sort_key: Final = cmp_to_key(self.compare)
+        if key is not None:
+            sort_key: Callable[[tuple], Any] = key
+        elif compare is not None:
+            sort_key = cmp_to_key(compare)
+        else:
+            raise ExecutorException('sorting needs either a comparator or a key')
+        self.sort_key: Final = sort_key
         self.tmp_file_create: Final = tmp_file_create
         self.tmp_file_delete: Final = tmp_file_delete
         self.num_memory_blocks: Final = num_memory_blocks
@@ -157,11 +205,15 @@ class ExtSortBuffer:
             raise ExecutorException('merge sort needs at least 2 memory blocks to perform the final merge')
         self.max_bytes: Final[int] = num_memory_blocks * BLOCK_SIZE
         self.deduplicate: Final = deduplicate
+        self.loser_tree_fan_in: Final = loser_tree_fan_in
         self.buffer: list|SortedSet =\
             SortedSet(key=self.sort_key) if self.deduplicate else\
             list()
         self.num_bytes: int = 0
         self.num_blocks_flushed: int = 0
+        self.num_bytes_flushed: int = 0
+        """Number of bytes written to temporary files, in all passes.
+        """
         self.runs: list[HeapFile] = list()
         return
 
@@ -177,6 +229,7 @@ class ExtSortBuffer:
             self.buffer.sort(key=self.sort_key)
             run.batch_append(self.buffer)
             self.buffer = list()
+        self.num_bytes_flushed += self.num_bytes
         self.num_bytes = 0
         self.num_blocks_flushed += self.num_memory_blocks
         return
@@ -199,39 +252,26 @@ class ExtSortBuffer:
 
     def _iter_merge(self, runs: list[HeapFile]) -> Generator[tuple, None, None]:
         """Merge the given sorted runs and return a stream of rows in the form of a generator.
-        By the nature of :meth:`.HeapFile.iter_scan`, we essentially need one memory block for each run.
+        Each run is read one block at a time (using :meth:`.HeapFile.iter_scan_batches`),
+        so we essentially need one memory block for each run.
         """
-        # construct a priority queue, where each entry is a triple (row, generator_where_it_came_from, run_#_where_it_came_from);
-        # run_#_where_it_came_from is useful for ensuring a stable sort order.
-        q_cmp = lambda this, that: (
-            t1 := cast(tuple, this),
-            t2 := cast(tuple, that),
-            cmp_result := self.compare(t1[0], t2[0]), # compare values
-            cmp_result if cmp_result != 0 \
-                else ((t1[-1] > t2[-1]) - (t2[-1] > t1[-1])) # comparing the run # ensures stable sort order
-        )[-1]
-        q: PQueue = PQueue(q_cmp)
-        # initialize the queue with one row from each run:
-        generators = [ run.iter_scan() for run in runs ]
-        for i, generator in enumerate(generators):
-            row = next(generator, None)
-            if row is not None:
-                q.enqueue((row, generator, i))
-        # repeatedly dequeue rows to return, and
-        # for each dequeued row, fetch the next from the same generator:
-        last_dequeued: tuple|None = None
-        while not q.empty():
-            # grab the smallest row and output it:
-            row, generator, i = cast(tuple[tuple, Generator[tuple, None, None], int], q.dequeue())
-            if not self.deduplicate or last_dequeued != row:
-                yield row
-            last_dequeued = row
-            # enter the next row from the same generator (if any):
-            row = next(generator, None)
-            if row is not None:
-                q.enqueue((row, generator, i))
-        for generator in generators:
-            generator.close()
+        scans = [ run.iter_scan_batches() for run in runs ]
+        try:
+            sources: list[Iterator[tuple]] = [ chain.from_iterable(scan) for scan in scans ]
+            merge = loser_tree_merge \
+                if self.loser_tree_fan_in is not None and len(runs) >= self.loser_tree_fan_in \
+                else heap_merge
+            if not self.deduplicate:
+                yield from merge(sources, self.sort_key)
+            else:
+                last: tuple|None = None
+                for row in merge(sources, self.sort_key):
+                    if last != row:
+                        yield row
+                    last = row
+        finally:
+            for scan in scans:
+                scan.close()
         return
 
     def iter_and_clear(self) -> Generator[tuple, None, None]:
@@ -266,6 +306,7 @@ class ExtSortBuffer:
                 for row in self._iter_merge(runs_subset):
                     writer.write(row)
                 writer.flush() # make sure all buffered rows are written
+                self.num_bytes_flushed += writer.num_bytes_flushed
                 # delete the old runs:
                 for run in runs_subset:
                     self.tmp_file_delete(run)
@@ -1,6 +1,7 @@
 """Constants globally visible to the entire system.
 """
 from typing import Final
+import os
 
 BLOCK_SIZE: Final[int] = 4028
 """Size of a memory/disk block (a unit of transfer), in bytes.
@@ -15,6 +16,43 @@ MAX_FILES: Final[int] = 10000
 For example, it may place a practical limit on how many runs an external merge sort may produce.
 """
 
+ZONE_MAP_CHUNK_SIZE: Final[int] = 256
+"""Number of consecutive row ids summarized by each zone in the zone map of a heap file.
+"""
+
+BLOOM_FILTER_BITS_PER_KEY: Final[int] = 10
+"""Number of bits per key in the Bloom filter for an index (which gives a false positive rate of about 1%).
+"""
+
+BLOOM_FILTER_MIN_CAPACITY: Final[int] = 1024
+"""Number of keys that the Bloom filter for a new (or small) index is sized for.
+"""
+
+DEFAULT_TMP_MEMORY_BUDGET: Final[int] = 256 * 1024 * 1024
+"""Default number of bytes of rows that an in-memory tmp space may hold before spilling files to disk.
+"""
+
+DEFAULT_PREFETCH_BLOCKS: Final[int] = 64
+"""Default number of blocks that a prefetching table scan reads ahead of the rows it has returned.
+"""
+
+DEFAULT_PARALLEL_SCAN_WORKERS: Final[int] = os.cpu_count() or 1
+"""Default number of worker processes used by a parallel table scan.
+"""
+
+PARALLEL_SCAN_MIN_BLOCKS: Final[int] = 64
+"""Number of blocks that a table must have for a parallel table scan to be worth the overhead of farming it out.
+"""
+
+DEFAULT_BATCH_SIZE: Final[int] = 1024
+"""Default number of rows in each batch passed between physical operators executing in batches
+(unless an operator's input naturally comes in batches of other sizes, e.g., a block of rows at a time from a table scan).
+"""
+
+HASH_INDEX_FILL_FACTOR: Final[float] = 0.75
+"""Average fill of the buckets of a hash index (as a fraction of ``BLOCK_SIZE``) beyond which it adds a bucket.
+"""
+
 DEFAULT_BNLJ_BUFFER_SIZE: Final[int] = 10
 """Default number of blocks used by block-based nested-loop join.
 """
@@ -27,6 +65,11 @@ DEFAULT_SORT_LAST_BUFFER_SIZE: Final = 5
 """Default number of blocks used by sorting, if the sort is supplying output to a sort-merge join.
 """
 
+LOSER_TREE_MERGE_MIN_RUNS: Final[int] = 4
+"""Number of sorted runs from which a sort merges them with a tree of losers instead of a heap,
+if loser-tree merging is enabled; with fewer runs, the tree is too shallow to save any comparisons.
+"""
+
 DEFAULT_HASH_BUFFER_SIZE: Final[int] = 10
 """Default number of blocks used by hashing.
 """
@@ -1,10 +1,14 @@
-from typing import Final, Iterable, Generator
+from typing import cast, Final, Iterable, Generator, Callable, Any
 from collections import OrderedDict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from math import log
 import pickle
+import struct
 
+from .globals import BLOCK_SIZE, BLOOM_FILTER_BITS_PER_KEY, BLOOM_FILTER_MIN_CAPACITY
 from .primitives import ValType, RowType
-from .storage import StorageManager, HeapFile, BplusTree
+from .storage import StorageMangerException, StorageManager, Zone, ScanPartition, HeapFile, BplusTree, HashIndex, KeyCodec
 from .transaction import Transaction
 
 INTERNAL_TABLES_FILE_NAME: Final[str] = '.ddb_tables'
@@ -13,6 +17,8 @@ INTERNAL_ROW_ID_COLUMN_TYPE: ValType = ValType.INTEGER
 INTERNAL_ANON_TABLE_NAME_FORMAT: Final[str] = '.table_{pop}_{hex}'
 INTERNAL_ANON_COLUMN_NAME_FORMAT: Final[str] = '.column_{index}'
 INTERNAL_SECONDARY_INDEX_FILE_NAME_FORMAT: Final[str] = '.{table_name}.{column_name}'
+INTERNAL_DICTIONARY_FILE_NAME_FORMAT: Final[str] = '.{table_name}.{column_name}.dict'
+INTERNAL_BLOOM_FILTER_FILE_NAME_FORMAT: Final[str] = '.{table_name}.{column_name}.bloom'
 
 @dataclass(frozen=True)
 class TableMetadata:
@@ -44,6 +50,62 @@ class BaseTableMetadata(TableMetadata):
     """Column Indices (into ``column_names`` and ``column_types``) for all (single-column) secondary indexes on this table,
     in no particular order.
     """
+    composite_indices: list[tuple[int, ...]] = field(default_factory=list)
+    """For each composite (multi-column) index on this table, the column indices (into ``column_names`` and ``column_types``)
+    of its key components, in key order; indexes are listed in no particular order.
+    """
+    composite_primary_key: tuple[int, ...] | None = None
+    """Column indices (into ``column_names`` and ``column_types``) for the multi-column primary key,
+    or ``None`` if this table has no such key.
+    Unlike a single-column primary key, it does not determine how the table is stored:
+    the table is still stored as a heap file (and ``primary_key_column_index`` is ``None``),
+    and the key is enforced by a composite index (also listed in ``composite_indices``) with unique keys.
+    """
+    compression: str | None = None
+    """Compression method (one of ``ddb.storage.COMPRESSIONS``) for the heap file storing this table,
+    or ``None`` if it is stored uncompressed.
+    """
+    dictionary_column_indices: list[int] = field(default_factory=list)
+    """Column indices (into ``column_names`` and ``column_types``) for all dictionary-encoded ``VARCHAR`` columns,
+    in no particular order.  See :class:`.StringDictionary`.
+    """
+    zone_map: bool = False
+    """Whether the heap file storing this table maintains a zone map (see ``ddb.storage.Zone``);
+    off unless the table is created ``WITH (zone_map=on)``.
+    """
+    bloom_filter: bool = False
+    """Whether each B+tree index on this table (including the one storing the table, if any)
+    is accompanied by a :class:`.BloomFilter` on its keys;
+    off unless the table is created ``WITH (bloom_filter=on)``.
+    """
+    included_columns: dict[int | tuple[int, ...], tuple[int, ...]] = field(default_factory=dict)
+    """For each secondary index (identified by its key column index, or tuple of indices for a composite index)
+    created with ``INCLUDE``, the column indices (into ``column_names`` and ``column_types``) of the included columns,
+    whose values are stored in each index entry after the primary key or row id,
+    so queries needing only these columns (besides the key) need not fetch the rows from the table.
+    """
+    hash_column_indices: list[int] = field(default_factory=list)
+    """Column indices (into ``column_names`` and ``column_types``) for the (single-column) secondary indexes
+    created with ``USING HASH``, which are stored as :class:`.HashIndex` instead of :class:`.BplusTree`
+    and thus support lookups by key but not range scans; each is also listed in ``secondary_column_indices``.
+    """
+
+    def __setstate__(self, state: dict) -> None:
+        # metadata pickled before composite indexes were supported lacks the field:
+        state.setdefault('composite_indices', list())
+        state.setdefault('compression', None)
+        state.setdefault('dictionary_column_indices', list())
+        state.setdefault('zone_map', False)
+        state.setdefault('bloom_filter', False)
+        state.setdefault('included_columns', dict())
+        state.setdefault('hash_column_indices', list())
+        self.__dict__.update(state)
+        return
+
+    def included_column_indices(self, index: int | tuple[int, ...]) -> tuple[int, ...]:
+        """Return the column indices of the columns included in the given secondary index (see ``included_columns``).
+        """
+        return self.included_columns.get(index, tuple())
 
     def id_name(self) -> str:
         if self.primary_key_column_index is None:
@@ -61,10 +123,445 @@ class BaseTableMetadata(TableMetadata):
         yield f'{self.name}(' +\
             ', '.join(n +\
                       ('[pk]' if i == self.primary_key_column_index else '') +\
-                      ('[sk]' if i in self.secondary_column_indices else '') +\
+                      ('[hash]' if i in self.hash_column_indices else '[sk]' if i in self.secondary_column_indices else '') +\
+                      ('[dict]' if i in self.dictionary_column_indices else '') +\
                       ' ' + t.name
                       for i, (n, t) in enumerate(zip(self.column_names, self.column_types))) +\
-            ')'
+            ')' +\
+            ''.join(('[pk]' if column_indices == self.composite_primary_key else '[sk]') +\
+                    '(' + ', '.join(self.column_names[i] for i in column_indices) + ')'
+                    for column_indices in self.composite_indices) +\
+            ''.join(f' [sk({self.column_names[index] if isinstance(index, int) else ", ".join(self.column_names[i] for i in index)}) ' +\
+                    'include (' + ', '.join(self.column_names[i] for i in column_indices) + ')]'
+                    for index, column_indices in self.included_columns.items()) +\
+            (f' [{self.compression}]' if self.compression is not None else '') +\
+            (' [zone map]' if self.zone_map else '') +\
+            (' [bloom filter]' if self.bloom_filter else '')
+        return
+
+class StringDictionary:
+    """In-memory copy of the dictionary for a dictionary-encoded ``VARCHAR`` column.
+
+    Such a column is stored in the table as integer codes, which are assigned consecutively (starting from 0)
+    to distinct strings in the order they are first stored, and are never reassigned.
+    The dictionary itself is persisted in a side :class:`.BplusTree` mapping codes to strings,
+    and :class:`.MetadataManager` keeps a copy in memory so that encoding and decoding need no I/O.
+    Decoding returns the very same ``str`` object for the same code,
+    so equality tests on decoded values (which check identity first) and hashing (which is cached per object)
+    are cheap for the operators above.
+    """
+    def __init__(self) -> None:
+        self.strings: Final[list[str]] = list()
+        """Strings, indexed by code.
+        """
+        self.codes: Final[dict[str, int]] = dict()
+        """Codes, by string.
+        """
+        return
+
+    def sync(self, f: BplusTree) -> None:
+        """Bring the in-memory copy up to date with the dictionary B+tree ``f`` as seen by its transaction.
+        Because codes are assigned consecutively, the number of entries in ``f`` tells whether
+        codes have been added by other transactions since (which are then loaded),
+        or codes added earlier to this copy have been rolled back (which are then forgotten).
+        """
+        num_codes = f.stat()['entries']
+        if num_codes < len(self.strings):
+            for s in self.strings[num_codes:]:
+                del self.codes[s]
+            del self.strings[num_codes:]
+        elif num_codes > len(self.strings):
+            for code, (s, ) in f.iter_scan(key_lower=len(self.strings)):
+                self.strings.append(s)
+                self.codes[s] = code
+        return
+
+    def add(self, f: BplusTree, s: str) -> int:
+        """Assign the next code to string ``s`` (which must not be in the dictionary yet),
+        record it in the dictionary B+tree ``f``, and return the code.
+        """
+        code = len(self.strings)
+        f.put(code, (s, ))
+        self.strings.append(s)
+        self.codes[s] = code
+        return code
+
+class DictionaryCodec:
+    """Encoder/decoder of rows with dictionary-encoded columns, used by :class:`.DictionaryEncodedHeapFile`
+    and :class:`.DictionaryEncodedBplusTree`.
+    Each encoded column is given by its index into the stored rows, its :class:`.StringDictionary`,
+    and the (open) dictionary B+tree for recording new codes.
+    """
+    def __init__(self, columns: list[tuple[int, StringDictionary, BplusTree]]) -> None:
+        self.columns: Final = columns
+        return
+
+    def encode(self, row: tuple, add: bool = True) -> tuple | None:
+        """Replace strings in encoded columns of ``row`` by their codes.
+        A string not yet in the dictionary is assigned a new code if ``add`` is ``True``;
+        otherwise, ``None`` is returned, because no such row can possibly have been stored.
+        """
+        values = list(row)
+        for i, dictionary, f in self.columns:
+            if (s := values[i]) is None:
+                continue
+            if (code := dictionary.codes.get(s)) is None:
+                if not add:
+                    return None
+                code = dictionary.add(f, s)
+            values[i] = code
+        return tuple(values)
+
+    def decode(self, row: tuple, offset: int = 0) -> tuple:
+        """Replace codes in encoded columns of ``row`` by their strings,
+        where the stored row starts at position ``offset`` of ``row`` (e.g., after a row id).
+        """
+        values = list(row)
+        for i, dictionary, _ in self.columns:
+            if (code := values[offset + i]) is not None:
+                values[offset + i] = dictionary.strings[code]
+        return tuple(values)
+
+class DictionaryEncodedHeapFile(HeapFile):
+    """A :class:`.HeapFile` with dictionary-encoded columns, which wraps the heap file actually storing the codes.
+    Rows going in and out have strings in these columns, so this is transparent to users.
+    """
+    def __init__(self, file: HeapFile, row_type: RowType, codec: DictionaryCodec) -> None:
+        super().__init__(file.tx, file.name, row_type)
+        self.file: Final = file
+        self.codec: Final = codec
+        return
+
+    def _open(self, create_if_not_exists: bool = False) -> None:
+        self.file._open(create_if_not_exists = create_if_not_exists)
+        for _, _, f in self.codec.columns:
+            f._open()
+        return
+
+    def get(self, row_id: int) -> tuple | None:
+        row = self.file.get(row_id)
+        return None if row is None else self.codec.decode(row)
+
+    def iter_scan(self, return_row_id: bool = False) -> Generator[tuple, None, None]:
+        offset = 1 if return_row_id else 0
+        for row in self.file.iter_scan(return_row_id = return_row_id):
+            yield self.codec.decode(row, offset)
+        return
+
+    def iter_scan_batches(self, return_row_id: bool = False, num_blocks: int = 1,
+                          zone_filter: Callable[[Zone], bool] | None = None,
+                          prefetch_blocks: int = 0) -> Generator[list[tuple], None, None]:
+        # NOTE: zones summarize codes, not strings, for dictionary-encoded columns
+        offset = 1 if return_row_id else 0
+        decode = self.codec.decode
+        for batch in self.file.iter_scan_batches(return_row_id = return_row_id, num_blocks = num_blocks,
+                                                 zone_filter = zone_filter, prefetch_blocks = prefetch_blocks):
+            yield [ decode(row, offset) for row in batch ]
+        return
+
+    def put(self, row: tuple, row_id: int | None = None) -> int:
+        return self.file.put(cast(tuple, self.codec.encode(row)), row_id = row_id)
+
+    def batch_append(self, rows: Iterable[tuple]) -> tuple[int, int]:
+        encode = self.codec.encode
+        return self.file.batch_append(cast(tuple, encode(row)) for row in rows)
+
+    def truncate(self) -> int:
+        return self.file.truncate()
+
+    def delete(self, row_id: int) -> int:
+        return self.file.delete(row_id)
+
+    def stat(self) -> dict:
+        return self.file.stat()
+
+    def _close(self):
+        self.file._close()
+        for _, _, f in self.codec.columns:
+            f._close()
+        return
+
+class DictionaryEncodedBplusTree(BplusTree):
+    """A :class:`.BplusTree` with dictionary-encoded (non-key) columns,
+    which wraps the B+tree actually storing the codes.
+    Rows going in and out have strings in these columns, so this is transparent to users.
+    """
+    def __init__(self, file: BplusTree, row_type: RowType, codec: DictionaryCodec) -> None:
+        super().__init__(file.tx, file.name, file.key_type, row_type, unique = file.unique)
+        self.file: Final = file
+        self.codec: Final = codec
+        return
+
+    def _open(self, create_if_not_exists: bool = False) -> None:
+        self.file._open(create_if_not_exists = create_if_not_exists)
+        for _, _, f in self.codec.columns:
+            f._open()
+        return
+
+    def get_one(self, key: Any) -> tuple | None:
+        row = self.file.get_one(key)
+        return None if row is None else self.codec.decode(row)
+
+    def iter_get(self, key: Any) -> Generator[tuple, None, None]:
+        for key, row in self.file.iter_get(key):
+            yield key, self.codec.decode(row)
+        return
+
+    def iter_scan(self, key_lower: Any = None) -> Generator[tuple, None, None]:
+        for key, row in self.file.iter_scan(key_lower = key_lower):
+            yield key, self.codec.decode(row)
+        return
+
+    def iter_scan_batches(self, key_lower: Any = None, num_blocks: int = 1,
+                          prefetch_blocks: int = 0) -> Generator[list[tuple], None, None]:
+        decode = self.codec.decode
+        for batch in self.file.iter_scan_batches(key_lower = key_lower, num_blocks = num_blocks,
+                                                 prefetch_blocks = prefetch_blocks):
+            yield [ (key, decode(row)) for key, row in batch ]
+        return
+
+    def put(self, key: Any, row: tuple) -> None:
+        self.file.put(key, cast(tuple, self.codec.encode(row)))
+        return
+
+    def bulk_load(self, entries: Iterable[tuple[Any, tuple]]) -> int:
+        encode = self.codec.encode
+        return self.file.bulk_load((key, cast(tuple, encode(row))) for key, row in entries)
+
+    def delete(self, key: Any, row: tuple | None = None) -> int:
+        if row is not None and (row := self.codec.encode(row, add = False)) is None:
+            return 0
+        return self.file.delete(key, row)
+
+    def stat(self) -> dict:
+        return self.file.stat()
+
+    def _close(self):
+        self.file._close()
+        for _, _, f in self.codec.columns:
+            f._close()
+        return
+
+class BloomFilter:
+    """In-memory copy of the Bloom filter on the keys of a B+tree index (primary or secondary),
+    which tells for sure that a key is absent from the index, so a lookup for such a key needs no I/O.
+
+    The filter sets ``num_hashes`` of its ``num_bits`` bits for each key added, at positions derived by double hashing
+    from a digest of the key's order-preserving encoding (see ``ddb.storage.KeyCodec``),
+    which, unlike Python's ``hash()``, is the same across runs.
+    The filter is persisted in a side :class:`.BplusTree` mapping page numbers to pages of ``ddb.globals.BLOCK_SIZE`` bytes,
+    with the geometry and ``num_keys`` (the number of keys added) stored under :attr:`.HEADER_KEY`.
+    Deleting keys from the index clears no bits, and bits set by rolled-back transactions are not cleared in memory,
+    so the filter may let through more keys than necessary but never fewer;
+    once more keys have been added than it was sized for, it is rebuilt with room to grow
+    (see :class:`.BloomFilteredBplusTree`).
+    A rebuilt filter reflects the keys as seen by the rebuilding transaction, so it stays private to that transaction
+    until it commits (see :meth:`.MetadataManager.bloom_filter`).
+    """
+    HEADER_KEY: Final[int] = -1
+    """Key of the entry holding ``(num_bits, num_hashes, num_keys)`` in the B+tree persisting the filter.
+    """
+
+    def __init__(self, num_bits: int, num_hashes: int, num_keys: int = 0) -> None:
+        self.num_bits: Final = num_bits
+        self.num_hashes: Final = num_hashes
+        self.num_keys = num_keys
+        self.bits: Final = bytearray((num_bits + 7) // 8)
+        return
+
+    @classmethod
+    def for_capacity(cls, capacity: int) -> 'BloomFilter':
+        """Return an empty filter sized for (at least) ``capacity`` keys.
+        """
+        num_bits = max(capacity, BLOOM_FILTER_MIN_CAPACITY) * BLOOM_FILTER_BITS_PER_KEY
+        # this number of hash functions minimizes the false positive rate:
+        return cls(num_bits, max(1, round(BLOOM_FILTER_BITS_PER_KEY * log(2))))
+
+    @classmethod
+    def load(cls, f: BplusTree) -> 'BloomFilter':
+        """Load the filter persisted in B+tree ``f``, or return an empty one if nothing has been persisted yet.
+        """
+        if (header := f.get_one(cls.HEADER_KEY)) is None:
+            return cls.for_capacity(0)
+        bloom_filter = cls(*header[0])
+        for page_number, (page, ) in f.iter_scan(key_lower = 0):
+            bloom_filter.merge_page(page_number, page)
+        return bloom_filter
+
+    def capacity(self) -> int:
+        return self.num_bits // BLOOM_FILTER_BITS_PER_KEY
+
+    def num_pages(self) -> int:
+        return (len(self.bits) + BLOCK_SIZE - 1) // BLOCK_SIZE
+
+    def _positions(self, key_bytes: bytes) -> list[int]:
+        digest = blake2b(key_bytes, digest_size = 16).digest()
+        h1 = int.from_bytes(digest[:8])
+        h2 = int.from_bytes(digest[8:]) | 1 # odd, so positions don't repeat too soon
+        return [ (h1 + i * h2) % self.num_bits for i in range(self.num_hashes) ]
+
+    def add(self, key_bytes: bytes) -> set[int]:
+        """Add the key encoded as ``key_bytes``, and return the numbers of the pages with bits set.
+        """
+        bits = self.bits
+        pages: set[int] = set()
+        for pos in self._positions(key_bytes):
+            bits[pos >> 3] |= 1 << (pos & 7)
+            pages.add((pos >> 3) // BLOCK_SIZE)
+        self.num_keys += 1
+        return pages
+
+    def may_contain(self, key_bytes: bytes) -> bool:
+        """Check if the key encoded as ``key_bytes`` may have been added (``False`` means it definitely has not).
+        """
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key_bytes))
+
+    def page(self, page_number: int) -> bytes:
+        return bytes(self.bits[page_number * BLOCK_SIZE:(page_number + 1) * BLOCK_SIZE])
+
+    def merge_page(self, page_number: int, page: bytes) -> None:
+        """Set the bits set in ``page`` (with the given number) of another filter with the same geometry.
+        """
+        start = page_number * BLOCK_SIZE
+        end = start + len(page)
+        self.bits[start:end] = (int.from_bytes(self.bits[start:end]) | int.from_bytes(page)).to_bytes(len(page))
+        return
+
+class BloomFilteredBplusTree(BplusTree):
+    """A :class:`.BplusTree` with a :class:`.BloomFilter` on its keys, which wraps the B+tree actually storing the entries.
+    A lookup by a full key consults the filter first, and skips the B+tree altogether if the key is definitely absent.
+    Keys put or bulk-loaded are added to the in-memory filter right away,
+    and the pages changed are written to the B+tree persisting the filter upon closing.
+    The object counts lookups that consult the filter (``num_probes``),
+    those answered by the filter alone (``num_negatives``),
+    and those let through by the filter that find nothing (``num_false_positives``).
+    """
+    def __init__(self, file: BplusTree, filter_file: BplusTree, mm: 'MetadataManager') -> None:
+        """Construct the wrapper for ``file``, whose filter is persisted in ``filter_file``
+        and kept in memory by ``mm`` (by the name of ``filter_file``).
+        """
+        super().__init__(file.tx, file.name, file.key_type, file.row_type, unique = file.unique)
+        self.file: Final = file
+        self.filter_file: Final = filter_file
+        self.mm: Final = mm
+        self.key_codec: Final = KeyCodec.for_key_type(file.key_type)
+        self.dirty_pages: Final[set[int]] = set()
+        self.num_probes = 0
+        self.num_negatives = 0
+        self.num_false_positives = 0
+        return
+
+    @property
+    def bloom_filter(self) -> BloomFilter:
+        return cast(BloomFilter, self.mm.bloom_filter(self.tx, self.filter_file.name))
+
+    def _open(self, create_if_not_exists: bool = False) -> None:
+        self.file._open(create_if_not_exists = create_if_not_exists)
+        self.filter_file._open()
+        return
+
+    def _probe(self, key: Any) -> bool | None:
+        """Consult the filter for ``key``, returning ``False`` if it is definitely absent, ``True`` if it may be present,
+        or ``None`` if the filter does not apply (e.g., ``key`` is just a prefix of a composite key).
+        """
+        if isinstance(self.key_type, tuple) and (not isinstance(key, tuple) or len(key) != len(self.key_type)):
+            return None
+        try:
+            key_bytes = self.key_codec.pack(key)
+        except (StorageMangerException, ValueError, TypeError, AttributeError, struct.error): # not a valid key, so leave it to the B+tree
+            return None
+        self.num_probes += 1
+        if self.bloom_filter.may_contain(key_bytes):
+            return True
+        self.num_negatives += 1
+        return False
+
+    def _add(self, key: Any) -> None:
+        self.dirty_pages.update(self.bloom_filter.add(self.key_codec.pack(key)))
+        return
+
+    def get_one(self, key: Any) -> tuple | None:
+        if (probed := self._probe(key)) is False:
+            return None
+        row = self.file.get_one(key)
+        if row is None and probed:
+            self.num_false_positives += 1
+        return row
+
+    def iter_get(self, key: Any) -> Generator[tuple, None, None]:
+        if (probed := self._probe(key)) is False:
+            return
+        found = False
+        for entry in self.file.iter_get(key):
+            found = True
+            yield entry
+        if not found and probed:
+            self.num_false_positives += 1
+        return
+
+    def iter_scan(self, key_lower: Any = None) -> Generator[tuple, None, None]:
+        return self.file.iter_scan(key_lower = key_lower)
+
+    def iter_scan_batches(self, key_lower: Any = None, num_blocks: int = 1,
+                          prefetch_blocks: int = 0) -> Generator[list[tuple], None, None]:
+        return self.file.iter_scan_batches(key_lower = key_lower, num_blocks = num_blocks,
+                                           prefetch_blocks = prefetch_blocks)
+
+    def scan_partitions(self, num_partitions: int) -> list[ScanPartition] | None:
+        return self.file.scan_partitions(num_partitions)
+
+    def put(self, key: Any, row: tuple) -> None:
+        self.file.put(key, row)
+        self._add(key)
+        return
+
+    def bulk_load(self, entries: Iterable[tuple[Any, tuple]]) -> int:
+        def added_entries() -> Iterable[tuple[Any, tuple]]:
+            for key, row in entries:
+                self._add(key)
+                yield key, row
+            return
+        return self.file.bulk_load(added_entries())
+
+    def delete(self, key: Any, row: tuple | None = None) -> int:
+        return self.file.delete(key, row)
+
+    def stat(self) -> dict:
+        return self.file.stat()
+
+    def _flush(self) -> None:
+        """Write the pages of the filter changed through this object to the B+tree persisting the filter,
+        first rebuilding the filter if it holds more keys than it was sized for
+        (which replaces the filter only for this transaction until it commits).
+        """
+        bloom_filter = self.bloom_filter
+        rebuilt = bloom_filter.num_keys > bloom_filter.capacity()
+        if rebuilt:
+            num_keys = self.file.stat()['entries']
+            bloom_filter = BloomFilter.for_capacity(2 * num_keys)
+            for key, _ in self.file.iter_scan():
+                bloom_filter.add(self.key_codec.pack(key))
+            bloom_filter.num_keys = num_keys
+            self.mm.bloom_filter_rebuilt(self.tx, self.filter_file.name, bloom_filter)
+        header = self.filter_file.get_one(BloomFilter.HEADER_KEY)
+        pages: Iterable[int] = sorted(self.dirty_pages)
+        if rebuilt or header is None or tuple(header[0][:2]) != (bloom_filter.num_bits, bloom_filter.num_hashes):
+            # the filter has been rebuilt (possibly by a transaction rolled back since), so write it all out:
+            pages = range(bloom_filter.num_pages())
+            for page_number in [ p for p, _ in self.filter_file.iter_scan(key_lower = bloom_filter.num_pages()) ]:
+                self.filter_file.delete(page_number)
+        for page_number in pages:
+            self.filter_file.put(page_number, (bloom_filter.page(page_number), ))
+        self.filter_file.put(BloomFilter.HEADER_KEY, ((bloom_filter.num_bits, bloom_filter.num_hashes, bloom_filter.num_keys), ))
+        self.dirty_pages.clear()
+        return
+
+    def _close(self):
+        if len(self.dirty_pages) > 0:
+            self._flush()
+        self.file._close()
+        self.filter_file._close()
         return
 
 class MetadataManager:
@@ -73,6 +570,37 @@ class MetadataManager:
     """
     def __init__(self, sm: StorageManager) -> None:
         self.sm: Final = sm
+        self.dictionaries: Final[dict[str, StringDictionary]] = dict()
+        """In-memory copies of dictionaries for dictionary-encoded columns, by dictionary B+tree name.
+        """
+        self.bloom_filters: Final[dict[str, BloomFilter]] = dict()
+        """In-memory copies of Bloom filters on index keys, by the name of the B+tree persisting the filter.
+        """
+        self.pending_bloom_filters: Final[dict[Transaction, dict[str, BloomFilter | None]]] = dict()
+        """Bloom filters rebuilt (or, if ``None``, removed) by each transaction (or passed on to it by its nested transactions),
+        by name as in ``bloom_filters``, which replace the ones there only upon the commit of the top-level transaction.
+        """
+        return
+
+    def transaction_committed(self, tx: Transaction) -> None:
+        """Must be called right after ``tx`` commits.
+        """
+        if (pending := self.pending_bloom_filters.pop(tx, None)) is None:
+            return
+        if (parent := tx.get_parent()) is not None:
+            self.pending_bloom_filters.setdefault(parent, dict()).update(pending)
+            return
+        for name, bloom_filter in pending.items():
+            if bloom_filter is None:
+                self.bloom_filters.pop(name, None)
+            else:
+                self.bloom_filters[name] = bloom_filter
+        return
+
+    def transaction_aborted(self, tx: Transaction) -> None:
+        """Must be called right after ``tx`` aborts.
+        """
+        self.pending_bloom_filters.pop(tx, None)
         return
 
     def tables_btree(self, tx: Transaction) -> BplusTree:
@@ -118,48 +646,186 @@ class MetadataManager:
         """Return the storage (heap file or B+tree) object for the table with given ``metadata``
         (creating it as needed if requested by ``create_if_not_exists``).
         An exception will be raised if it is not found.
+        If the table has dictionary-encoded columns, the object returned will encode and decode them transparently;
+        if it is stored in a B+tree with a Bloom filter, the object returned will consult and maintain the filter.
         """
+        stored_column_types = [ ValType.INTEGER if i in metadata.dictionary_column_indices else t
+                                for i, t in enumerate(metadata.column_types) ]
+        codec = self._dictionary_codec(tx, metadata, create_if_not_exists = create_if_not_exists)
         if metadata.primary_key_column_index is None:
-            return self.sm.heap_file(tx, metadata.name, metadata.column_types, create_if_not_exists = create_if_not_exists)
+            f = self.sm.heap_file(tx, metadata.name, stored_column_types, create_if_not_exists = create_if_not_exists,
+                                  compression = metadata.compression, zone_map = metadata.zone_map)
+            return f if codec is None else DictionaryEncodedHeapFile(f, metadata.column_types, codec)
         else:
-            row_type = metadata.column_types.copy()
+            row_type = stored_column_types
             key_type = row_type.pop(metadata.primary_key_column_index)
-            return self.sm.bplus_tree(tx, metadata.name, key_type, row_type, unique = True, create_if_not_exists = create_if_not_exists)
+            t = self.sm.bplus_tree(tx, metadata.name, key_type, row_type, unique = True, create_if_not_exists = create_if_not_exists)
+            if codec is not None:
+                row_type = metadata.column_types.copy()
+                row_type.pop(metadata.primary_key_column_index)
+                t = DictionaryEncodedBplusTree(t, row_type, codec)
+            return self._bloom_filtered(tx, metadata, t, (metadata.primary_key_column_index, ),
+                                        create_if_not_exists = create_if_not_exists)
 
     def remove_table_storage(self, tx: Transaction, metadata: BaseTableMetadata) -> None:
-        """Remove the heap file or B+tree storage for the table with given ``metadata``.
+        """Remove the heap file or B+tree storage for the table with given ``metadata``,
+        together with the dictionaries for its dictionary-encoded columns.
         """
         if metadata.primary_key_column_index is None:
             self.sm.delete_heap_file(tx, metadata.name)
         else:
             self.sm.delete_bplus_tree(tx, metadata.name)
+            self._remove_bloom_filter_storage(tx, metadata, (metadata.primary_key_column_index, ))
+        for column_index in metadata.dictionary_column_indices:
+            dictionary_storage_name = type(self)._dictionary_storage_name(metadata.name, metadata.column_names[column_index])
+            self.sm.delete_bplus_tree(tx, dictionary_storage_name)
+            self.dictionaries.pop(dictionary_storage_name, None)
+        return
+
+    @staticmethod
+    def _dictionary_storage_name(table_name: str, column_name: str) -> str:
+        return INTERNAL_DICTIONARY_FILE_NAME_FORMAT.format(table_name = table_name, column_name = column_name)
+
+    def _dictionary_codec(self, tx: Transaction, metadata: BaseTableMetadata, create_if_not_exists: bool = False) -> DictionaryCodec | None:
+        """Return the codec for the dictionary-encoded columns of the table with given ``metadata``,
+        with dictionaries brought up to date for ``tx``, or ``None`` if the table has no such columns.
+        """
+        if len(metadata.dictionary_column_indices) == 0:
+            return None
+        columns: list[tuple[int, StringDictionary, BplusTree]] = list()
+        for column_index in sorted(metadata.dictionary_column_indices):
+            name = type(self)._dictionary_storage_name(metadata.name, metadata.column_names[column_index])
+            f = self.sm.bplus_tree(tx, name, ValType.INTEGER, [ValType.VARCHAR],
+                                   unique = True, create_if_not_exists = create_if_not_exists)
+            dictionary = self.dictionaries.setdefault(name, StringDictionary())
+            dictionary.sync(f)
+            # the primary key (if any) is not part of the stored row:
+            stored_index = column_index
+            if metadata.primary_key_column_index is not None and column_index > metadata.primary_key_column_index:
+                stored_index -= 1
+            columns.append((stored_index, dictionary, f))
+        return DictionaryCodec(columns)
+
+    @staticmethod
+    def _bloom_filter_storage_name(metadata: BaseTableMetadata, column_indices: tuple[int, ...]) -> str:
+        return INTERNAL_BLOOM_FILTER_FILE_NAME_FORMAT.format(
+            table_name = metadata.name, column_name = ','.join(metadata.column_names[i] for i in column_indices))
+
+    def _bloom_filtered(self, tx: Transaction, metadata: BaseTableMetadata, t: BplusTree, column_indices: tuple[int, ...],
+                        create_if_not_exists: bool = False) -> BplusTree:
+        """Return ``t``, the B+tree for the index on the given columns of the table with given ``metadata``,
+        wrapped to use the Bloom filter on its keys if the table has Bloom filters.
+        """
+        if not metadata.bloom_filter:
+            return t
+        name = type(self)._bloom_filter_storage_name(metadata, column_indices)
+        f = self.sm.bplus_tree(tx, name, ValType.INTEGER, [ValType.ANY],
+                               unique = True, create_if_not_exists = create_if_not_exists)
+        if self.bloom_filter(tx, name) is None:
+            bloom_filter = BloomFilter.load(f)
+            if any(name in pending for pending in self._pending_bloom_filters(tx)):
+                # the filter was removed by tx (or an enclosing transaction), so this one is not committed yet:
+                self.pending_bloom_filters.setdefault(tx, dict())[name] = bloom_filter
+            else:
+                self.bloom_filters[name] = bloom_filter
+        return BloomFilteredBplusTree(t, f, self)
+
+    def _pending_bloom_filters(self, tx: Transaction) -> Generator[dict[str, BloomFilter | None], None, None]:
+        """Return a Python generator that yields the pending Bloom filters of ``tx`` and then its enclosing transactions.
+        """
+        t: Transaction | None = tx
+        while t is not None:
+            if (pending := self.pending_bloom_filters.get(t)) is not None:
+                yield pending
+            t = t.get_parent()
+        return
+
+    def bloom_filter(self, tx: Transaction, name: str) -> BloomFilter | None:
+        """Return the in-memory copy of the Bloom filter persisted in the named B+tree as seen by ``tx``,
+        or ``None`` if it has not been loaded (or has been removed by ``tx``).
+        """
+        if len(self.pending_bloom_filters) > 0:
+            for pending in self._pending_bloom_filters(tx):
+                if name in pending:
+                    return pending[name]
+        return self.bloom_filters.get(name)
+
+    def bloom_filter_rebuilt(self, tx: Transaction, name: str, bloom_filter: BloomFilter) -> None:
+        """Replace the in-memory copy of the Bloom filter persisted in the named B+tree by ``bloom_filter``,
+        rebuilt by ``tx`` from the keys it sees; other transactions keep seeing the old filter until ``tx`` commits.
+        """
+        self.pending_bloom_filters.setdefault(tx, dict())[name] = bloom_filter
+        return
+
+    def _remove_bloom_filter_storage(self, tx: Transaction, metadata: BaseTableMetadata, column_indices: tuple[int, ...]) -> None:
+        name = type(self)._bloom_filter_storage_name(metadata, column_indices)
+        self.sm.delete_bplus_tree(tx, name)
+        self.pending_bloom_filters.setdefault(tx, dict())[name] = None
         return
 
     @staticmethod
     def _secondary_index_storage_name(table_name: str, column_name: str) -> str:
         return INTERNAL_SECONDARY_INDEX_FILE_NAME_FORMAT.format(table_name = table_name, column_name = column_name)
 
-    def index_storage(self, tx: Transaction, metadata: BaseTableMetadata, column_index: int, create_if_not_exists: bool = False) -> BplusTree:
-        """Return the B+tree object for the index on the given column for the table with given ``metadata``
+    def index_storage(self, tx: Transaction, metadata: BaseTableMetadata, column_index: int,
+                      create_if_not_exists: bool = False) -> BplusTree | HashIndex:
+        """Return the B+tree object (or hash index object, for a secondary index created with ``USING HASH``)
+        for the index on the given column for the table with given ``metadata``
         (creating it as needed if requested by ``create_if_not_exists``).
         An exception will be raised if it is not found.
         Note that the index can be either primary or secondary.
+        For a secondary index, each entry's row holds the primary key or row id of the indexed row
+        (followed by the values of included columns, if any).
+        If the table has Bloom filters, the B+tree object returned will consult and maintain the one on the index keys
+        (a hash index needs no filter, as looking up a key reads just one bucket anyway).
         """
         if column_index == metadata.primary_key_column_index:
-            row_type = metadata.column_types.copy()
-            key_type = row_type.pop(metadata.primary_key_column_index)
-            return self.sm.bplus_tree(tx, metadata.name, key_type, row_type,
-                                      unique = True, create_if_not_exists = create_if_not_exists)
+            return cast(BplusTree, self.table_storage(tx, metadata, create_if_not_exists = create_if_not_exists))
         else:
-            row_type = [INTERNAL_ROW_ID_COLUMN_TYPE]
+            row_type = [INTERNAL_ROW_ID_COLUMN_TYPE] + \
+                [ metadata.column_types[i] for i in metadata.included_column_indices(column_index) ]
             key_type = metadata.column_types[column_index]
             index_storage_name = type(self)._secondary_index_storage_name(metadata.name, metadata.column_names[column_index])
-            return self.sm.bplus_tree(tx, index_storage_name, key_type, row_type,
-                                      unique = False, create_if_not_exists = create_if_not_exists)
+            if column_index in metadata.hash_column_indices:
+                return self.sm.hash_index(tx, index_storage_name, key_type, row_type, create_if_not_exists = create_if_not_exists)
+            t = self.sm.bplus_tree(tx, index_storage_name, key_type, row_type,
+                                   unique = False, create_if_not_exists = create_if_not_exists)
+            return self._bloom_filtered(tx, metadata, t, (column_index, ), create_if_not_exists = create_if_not_exists)
+
+    def composite_index_storage(self, tx: Transaction, metadata: BaseTableMetadata, column_indices: tuple[int, ...],
+                                create_if_not_exists: bool = False) -> BplusTree:
+        """Return the B+tree object for the composite index on the given columns (in key order)
+        for the table with given ``metadata`` (creating it as needed if requested by ``create_if_not_exists``).
+        Keys are tuples of column values, and each entry's row holds the primary key or row id of the indexed row
+        (followed by the values of included columns, if any).
+        The index enforces unique keys if it is the table's ``composite_primary_key``.
+        An exception will be raised if it is not found.
+        """
+        row_type = [metadata.id_type()] + [ metadata.column_types[i] for i in metadata.included_column_indices(column_indices) ]
+        key_type = tuple(metadata.column_types[i] for i in column_indices)
+        index_storage_name = type(self)._secondary_index_storage_name(
+            metadata.name, ','.join(metadata.column_names[i] for i in column_indices))
+        t = self.sm.bplus_tree(tx, index_storage_name, key_type, row_type,
+                               unique = (column_indices == metadata.composite_primary_key),
+                               create_if_not_exists = create_if_not_exists)
+        return self._bloom_filtered(tx, metadata, t, column_indices, create_if_not_exists = create_if_not_exists)
+
+    def remove_composite_index_storage(self, tx: Transaction, metadata: BaseTableMetadata, column_indices: tuple[int, ...]) -> None:
+        """Remove the B+tree object for the composite index on the given columns for the table with given ``metadata``.
+        """
+        index_storage_name = type(self)._secondary_index_storage_name(
+            metadata.name, ','.join(metadata.column_names[i] for i in column_indices))
+        self.sm.delete_bplus_tree(tx, index_storage_name)
+        self._remove_bloom_filter_storage(tx, metadata, column_indices)
+        return
 
     def remove_secondary_index_storage(self, tx: Transaction, metadata: BaseTableMetadata, column_index: int) -> None:
-        """Remove the B+tree object for the index on the given column for the table with given ``metadata``.
+        """Remove the B+tree object (or hash index object) for the index on the given column for the table with given ``metadata``.
         """
         index_storage_name = type(self)._secondary_index_storage_name(metadata.name, metadata.column_names[column_index])
+        if column_index in metadata.hash_column_indices:
+            self.sm.delete_hash_index(tx, index_storage_name)
+            return
         self.sm.delete_bplus_tree(tx, index_storage_name)
+        self._remove_bloom_filter_storage(tx, metadata, (column_index, ))
         return
@@ -1,8 +1,9 @@
 from typing import cast, Final
 
-from ..globals import DEFAULT_SORT_BUFFER_SIZE, DEFAULT_SORT_LAST_BUFFER_SIZE, DEFAULT_BNLJ_BUFFER_SIZE, DEFAULT_HASH_BUFFER_SIZE
+from ..globals import DEFAULT_SORT_BUFFER_SIZE, DEFAULT_SORT_LAST_BUFFER_SIZE, DEFAULT_BNLJ_BUFFER_SIZE, DEFAULT_HASH_BUFFER_SIZE, \
+    DEFAULT_PREFETCH_BLOCKS, PARALLEL_SCAN_MIN_BLOCKS, LOSER_TREE_MERGE_MIN_RUNS
 from ..validator import valexpr, ValExpr, SFWGHLop, BaseTableLop
-from ..executor import StatementContext, QPop, TableScanPop, BNLJoinPop, FilterPop, ProjectPop, IndexScanPop, IndexNLJoinPop, MergeEqJoinPop, MergeSortPop, HashEqJoinPop
+from ..executor import StatementContext, QPop, TableScanPop, ZoneMapScanPop, ParallelTableScanPop, BNLJoinPop, FilterPop, ProjectPop, IndexScanPop, IndexNLJoinPop, MergeEqJoinPop, MergeSortPop, HashEqJoinPop
 
 from .interface import Planner, PlannerException
 from .util import add_groupby_by_sorting, add_having_and_select
@@ -75,13 +76,36 @@ class BaselinePlanner(Planner):
             if not sort_needed:
                 return pop, orders_asc
         orders_asc = [ (asc if asc is not None else True) for asc in orders_asc_required ]
-        return MergeSortPop(pop, exprs, orders_asc, DEFAULT_SORT_BUFFER_SIZE, DEFAULT_SORT_LAST_BUFFER_SIZE), orders_asc
+        return MergeSortPop(pop, exprs, orders_asc, DEFAULT_SORT_BUFFER_SIZE, DEFAULT_SORT_LAST_BUFFER_SIZE,
+                            LOSER_TREE_MERGE_MIN_RUNS if Planner.options.loser_tree_merge else None), orders_asc
 
     @classmethod
-    def make_table_scan(cls, context: StatementContext, alias: str, table: BaseTableLop) -> QPop:
+    def make_table_scan(cls, context: StatementContext, alias: str, table: BaseTableLop, cond: ValExpr | None = None) -> QPop:
         """Make a table scan over ``table`` with ``alias``.
+        If ``cond`` is given, the caller guarantees that it will be applied to the rows scanned (possibly in a join),
+        so the scan can use it to skip rows by the table's zone map, if any.
         """
-        return TableScanPop(context, alias, table.base_metadata, table.return_row_id)
+        if cond is not None and Planner.options.zone_map_scan and table.base_metadata.zone_map:
+            conds = list(valexpr.conjunctive_parts(cond))
+            if len(ZoneMapScanPop.make_zone_tests(alias, table.base_metadata, conds)) > 0:
+                return ZoneMapScanPop(context, alias, table.base_metadata, conds, table.return_row_id)
+        return TableScanPop(context, alias, table.base_metadata, table.return_row_id,
+                            DEFAULT_PREFETCH_BLOCKS if Planner.options.prefetch_scan else 0)
+
+    @classmethod
+    def make_parallel_table_scan(cls, context: StatementContext, alias: str, table: BaseTableLop,
+                                 cond: ValExpr | None, column_names: set[str] | None) -> QPop | None:
+        """Make a parallel table scan over ``table`` with ``alias``, which evaluates ``cond`` (if given)
+        and keeps only the columns in ``column_names`` (if given),
+        or return ``None`` if it is not enabled or not worthwhile.
+        """
+        meta = table.base_metadata
+        if not Planner.options.parallel_scan or not context.tx_sees_committed \
+            or len(meta.dictionary_column_indices) > 0 or meta.compression is not None:
+            return None
+        if context.zm.base_table_stats(context, meta).block_count() < PARALLEL_SCAN_MIN_BLOCKS:
+            return None
+        return ParallelTableScanPop(context, alias, meta, cond, column_names, table.return_row_id)
 
     @classmethod
     def _find_pki_in_exprs(cls, plan: QPop, exprs: list[ValExpr]) -> int | None:
@@ -190,18 +214,51 @@ class BaselinePlanner(Planner):
                 covered_candidates.append(cond)
         return sarg, covered_candidates
 
+    @classmethod
+    def _gen_composite_sarg(cls, inner_table_alias: str, column_names: tuple[str, ...],
+                            candidates_map: dict[str, list[valexpr.binary.CompareOpValExpr]]) \
+            -> tuple[QPop.Sarg, list[valexpr.binary.CompareOpValExpr]] | None:
+        """A helper for :meth:`.sarg_cond`.
+        Given a composite B+tree index on ``inner_table_alias.column_names`` and ``candidates_map``,
+        which maps column names to lists of sargable conditions (all of which are supposed to hold),
+        generate the "best" sarg, which uses equality on the leading key components and possibly a range on the next one,
+        and return the subset of candidates covered by this sarg.
+        If the leading key component has no candidates, return ``None`` instead.
+        """
+        key_prefix: list[ValExpr] = list()
+        covered_candidates: list[valexpr.binary.CompareOpValExpr] = list()
+        for column_name in column_names:
+            if column_name not in candidates_map:
+                break
+            sarg, covered_parts = cls._gen_sarg(inner_table_alias, column_name, candidates_map[column_name])
+            covered_candidates.extend(covered_parts)
+            if sarg.is_range or len(key_prefix) == len(column_names) - 1:
+                # a range on this component, or equality on the last component; either way we are done:
+                sarg.key_prefix = key_prefix
+                return sarg, covered_candidates
+            key_prefix.append(cast(ValExpr, sarg.key_lower))
+        if len(key_prefix) == 0:
+            return None
+        # equality on some leading components only:
+        return QPop.Sarg(
+            is_range = True,
+            key_lower = None, key_upper = None,
+            lower_exclusive = False, upper_exclusive = False,
+            key_prefix = key_prefix), covered_candidates
+
     @classmethod
     def sarg_cond(cls, outer_table_aliases: list[str],
                   inner_table_alias: str, inner_table: BaseTableLop,
                   cond: ValExpr) \
-        -> tuple[int, QPop.Sarg, ValExpr | None] | None:
+        -> tuple[int | tuple[int, ...], QPop.Sarg, ValExpr | None] | None:
         """Consider a base ``inner_table`` with alias ``inner_table_alias``,
         which is joined with a collection of outer tables with ``outer_table_aliases``,
         or is by itself (if ``outer_table_aliases`` is empty).
         Given condition ``cond``, find a good :class:`.Sarg` that can be applied
         to some an index (either primary or secondary) of the base table.
         Return a triple consisting of
-        1) the chosen index (identified by the column index for the index key),
+        1) the chosen index (identified by the column index for the index key,
+        or a tuple of column indices for a composite index),
         2) the ``Sarg``, and
         3) a "remainder" condition (or ``None`` if not needed) such that
         ANDing it with the ``Sarg`` is equivalent to the given condition.
@@ -209,12 +266,15 @@ class BaselinePlanner(Planner):
 
         We assume that ``cond`` can be evaluated over ``outer_table_aliases`` plus ``inner_table_alias``.
         """
+        meta = inner_table.base_metadata
         # first, let's see what indexes we have on inner:
         indexed_column_names = list()
-        if inner_table.base_metadata.primary_key_column_index is not None:
-            indexed_column_names.append(inner_table.base_metadata.id_name())
-        for i in inner_table.base_metadata.secondary_column_indices:
-            indexed_column_names.append(inner_table.base_metadata.column_names[i])
+        if meta.primary_key_column_index is not None:
+            indexed_column_names.append(meta.id_name())
+        for i in meta.secondary_column_indices:
+            indexed_column_names.append(meta.column_names[i])
+        composite_indexed_column_names = [tuple(meta.column_names[i] for i in column_indices)
+                                          for column_indices in meta.composite_indices]
         # analyze each part and attach candidate parts to indexed columns:
         parts = list(valexpr.conjunctive_parts(cond))
         candidates_map: dict[str, list[valexpr.binary.CompareOpValExpr]] = dict()
@@ -230,35 +290,49 @@ class BaselinePlanner(Planner):
             for c in part.children():
                 if not isinstance(c, valexpr.leaf.NamedColumnRef):
                     continue
-                if c.table_alias != inner_table_alias or c.column_name not in indexed_column_names:
+                if c.table_alias != inner_table_alias or \
+                    (c.column_name not in indexed_column_names and \
+                     not any(c.column_name in column_names for column_names in composite_indexed_column_names)):
                     continue
                 # okay, we have a candidate associated with and indexed column:
                 if c.column_name not in candidates_map:
                     candidates_map[c.column_name] = list()
                 candidates_map[c.column_name].append(part)
-        # pick the best candidate: we prefer EQ and then primary key;
+        # pick the best candidate: we prefer more key components bound by EQ, then a range on one more,
+        # and then primary key, and then a hash index (which serves EQ only, but with one bucket access);
         # otherwise the choice is arbitrary.  this isn't necessarily the best strategy.
-        best_column_name = None
+        best_index: int | tuple[int, ...] | None = None
+        best_rank: tuple[int, int, int] = (0, 0, 0)
         best_sarg = None
         best_covered_parts = None
+        # each option is a triple of index, whether it is primary, and the output of _gen_sarg or _gen_composite_sarg:
+        options: list[tuple[int | tuple[int, ...], bool, tuple[QPop.Sarg, list[valexpr.binary.CompareOpValExpr]] | None]] = list()
         for column_name, candidates in candidates_map.items():
-            sarg, covered_parts = cls._gen_sarg(inner_table_alias, column_name, candidates)
-            replace = False
-            if best_sarg is None:
-                replace = True
-            elif best_sarg.is_range and not sarg.is_range:
-                replace = True
-            elif best_sarg.is_range == sarg.is_range and \
-                column_name == inner_table.base_metadata.id_name():
-                replace = True
-            if replace:
-                best_column_name, best_sarg, best_covered_parts = column_name, sarg, covered_parts
-        if best_column_name is None or best_sarg is None or best_covered_parts is None:
+            if column_name in indexed_column_names:
+                options.append((meta.column_names.index(column_name),
+                                column_name == meta.id_name(),
+                                cls._gen_sarg(inner_table_alias, column_name, candidates)))
+        for column_names, column_indices in zip(composite_indexed_column_names, meta.composite_indices):
+            options.append((column_indices,
+                            column_indices == meta.composite_primary_key,
+                            cls._gen_composite_sarg(inner_table_alias, column_names, candidates_map)))
+        for index, is_primary, sarg_out in options:
+            if sarg_out is None:
+                continue
+            sarg, covered_parts = sarg_out
+            is_hash = index in meta.hash_column_indices
+            if is_hash and sarg.is_range:
+                continue
+            num_eq = len(sarg.key_prefix) + (0 if sarg.is_range else 1)
+            has_range = sarg.is_range and (sarg.key_lower is not None or sarg.key_upper is not None)
+            rank = (num_eq, 1 if has_range else 0, 2 if is_primary else 1 if is_hash else 0)
+            if best_sarg is None or rank > best_rank:
+                best_index, best_rank, best_sarg, best_covered_parts = index, rank, sarg, covered_parts
+        if best_index is None or best_sarg is None or best_covered_parts is None:
             return None
         else:
-            best_column_index = inner_table.base_metadata.column_names.index(best_column_name)
             remaining_parts = [part for part in parts if part not in best_covered_parts]
-            return best_column_index, best_sarg, \
+            return best_index, best_sarg, \
                 (cond if len(best_covered_parts) == 0 else valexpr.make_conjunction(remaining_parts))
 
     @classmethod
@@ -276,21 +350,54 @@ class BaselinePlanner(Planner):
             QPop.Sarg(is_range = False, key_lower = key, key_upper = key, lower_exclusive = False, upper_exclusive = False),
             cond)
 
+    @classmethod
+    def _index_key_name(cls, table: BaseTableLop, column_index: int | tuple[int, ...]) -> str | tuple[str, ...]:
+        """Return the name of the key column for the index on ``table`` identified by ``column_index``,
+        or a tuple of names for a composite index.
+        """
+        if isinstance(column_index, tuple):
+            return tuple(table.base_metadata.column_names[i] for i in column_index)
+        else:
+            return table.base_metadata.column_names[column_index]
+
+    @classmethod
+    def index_covers(cls, table: BaseTableLop, column_index: int | tuple[int, ...], column_names: set[str] | None) -> bool:
+        """Check whether the index on ``table`` identified by ``column_index`` stores all columns in ``column_names``
+        (as key columns, the row id or primary key, or included columns),
+        in which case there is no need to retrieve the rest of the row from the base table.
+        """
+        if column_names is None:
+            return False
+        meta = table.base_metadata
+        key_name = cls._index_key_name(table, column_index)
+        covered_names = { *(key_name if isinstance(key_name, tuple) else (key_name, )), meta.id_name(),
+                          *(meta.column_names[i] for i in meta.included_column_indices(column_index)) }
+        return column_names <= covered_names
+
     @classmethod
     def make_independent_index_scan(cls, context: StatementContext,
                                     alias: str, table: BaseTableLop,
-                                    column_index: int, sarg: QPop.Sarg, cond_remainder: ValExpr | None) -> QPop:
+                                    column_index: int | tuple[int, ...], sarg: QPop.Sarg, cond_remainder: ValExpr | None,
+                                    column_names: set[str] | None = None) -> QPop:
         """Make a index scan over base ``table`` using its ``column_index`` and ``sarg``,
         and post-filter using ``cond_remainder`` if needed.
+        If known, ``column_names`` are the names of the table's columns needed by the rest of the plan;
+        if a secondary index covers them all, the rest of the row is not retrieved from the base table.
         """
         pop: QPop = IndexScanPop(
-            context, alias, table.base_metadata, table.base_metadata.column_names[column_index],
+            context, alias, table.base_metadata, cls._index_key_name(table, column_index),
             is_range = cast(bool, sarg.is_range))
         # table all by itself; the sarg should have no column references, so we can evaluate and set at compile-time:
         key_lower = valexpr.eval_literal(sarg.key_lower) if sarg.key_lower is not None else None
         key_upper = valexpr.eval_literal(sarg.key_upper) if sarg.key_upper is not None else None
+        if isinstance(column_index, tuple):
+            # bounds for a composite index are tuples led by the prefix:
+            key_prefix = tuple(valexpr.eval_literal(e) for e in sarg.key_prefix)
+            key_lower = (*key_prefix, key_lower) if key_lower is not None else (key_prefix if len(key_prefix) > 0 else None)
+            key_upper = (*key_prefix, key_upper) if key_upper is not None else (key_prefix if len(key_prefix) > 0 else None)
         cast(IndexScanPop, pop).set_range(key_lower, key_upper, sarg.lower_exclusive, sarg.upper_exclusive)
-        if column_index != table.base_metadata.primary_key_column_index:
+        if column_index != table.base_metadata.primary_key_column_index and \
+            not cls.index_covers(table, column_index, column_names):
             # secondary index only, need to get the rest of the row:
             pop = cls.retrieve_base_by_key(context, pop, alias, table, cond_remainder)
             cond_remainder = None
@@ -302,32 +409,38 @@ class BaselinePlanner(Planner):
     @classmethod
     def make_indexnljoin_with_table(cls, context: StatementContext, left: QPop,
                                     alias: str, table: BaseTableLop,
-                                    column_index: int, sarg: QPop.Sarg, cond_remainder: ValExpr | None) -> QPop:
+                                    column_index: int | tuple[int, ...], sarg: QPop.Sarg, cond_remainder: ValExpr | None,
+                                    column_names: set[str] | None = None) -> QPop:
         """Given the ``left`` subplan and a base ``table`` to joined
         using an index on its ``column_index`` and ``sarg``,
         along with a remainder condition to apply (``cond_remainder``),
         construct a plan based on index nested-loop join.
+        If known, ``column_names`` are the names of the table's columns needed by the rest of the plan
+        (see :meth:`.make_independent_index_scan`).
         """
         pop: QPop = IndexScanPop(
-            context, alias, table.base_metadata, table.base_metadata.column_names[column_index],
+            context, alias, table.base_metadata, cls._index_key_name(table, column_index),
             is_range = cast(bool, sarg.is_range))
-        if column_index != table.base_metadata.primary_key_column_index:
+        if column_index != table.base_metadata.primary_key_column_index and \
+            not cls.index_covers(table, column_index, column_names):
             # inner (right) is a secondary index only:
             pop = IndexNLJoinPop(left, cast(IndexScanPop, pop), sarg, None)
             # still need to join with the base table to get the full row:
             pop = cls.retrieve_base_by_key(context, pop, alias, table, cond_remainder)
-        else: # inner (right) is a primary index:
+        else: # inner (right) is a primary index, or a secondary index covering all columns needed:
             pop = IndexNLJoinPop(left, cast(IndexScanPop, pop), sarg, cond_remainder)
         return pop
 
     @classmethod
     def optimize_one_more_table(cls, context: StatementContext, left: QPop | None, left_aliases: list[str],
-                                alias: str, table: BaseTableLop, cond: ValExpr | None) \
+                                alias: str, table: BaseTableLop, cond: ValExpr | None,
+                                column_names: set[str] | None = None) \
     -> QPop:
         """Given an existing plan (``left``, containing table aliases ``left_aliases``),
         one more table (with ``alias``) to be joined,
         and a ``cond`` that can be evaluated over all of them,
         return a plan that further incorporates then given table and evaluates the given condition.
+        If known, ``column_names`` are the names of the table's columns needed by the rest of the plan.
         """
         # use an index scan if possible:
         sarg_cond_out = None if cond is None \
@@ -335,16 +448,16 @@ class BaselinePlanner(Planner):
         if sarg_cond_out is not None:
             column_index, sarg, cond_remainder = sarg_cond_out
             if left is None:
-                return cls.make_independent_index_scan(context, alias, table, column_index, sarg, cond_remainder)
+                return cls.make_independent_index_scan(context, alias, table, column_index, sarg, cond_remainder, column_names)
             elif Planner.options.index_join:
-                return cls.make_indexnljoin_with_table(context, left, alias, table, column_index, sarg, cond_remainder)
+                return cls.make_indexnljoin_with_table(context, left, alias, table, column_index, sarg, cond_remainder, column_names)
         # use sort merge join if possible:
         if Planner.options.sort_merge_join:
             eqj_cond_out = None if cond is None or left is None \
                 else cls.make_eqj_cond(left_aliases, [alias], cond)
             if eqj_cond_out is not None: # use a sort-merge join
                 left_exprs, right_exprs, cond_remainder = eqj_cond_out
-                pop = cls.make_table_scan(context, alias, table)
+                pop = cls.make_table_scan(context, alias, table, cond)
                 pop = cls.make_smjoin(cast(QPop, left), pop, left_exprs, right_exprs, cond_remainder)
                 return pop
         # use hash join if possible:
@@ -353,12 +466,15 @@ class BaselinePlanner(Planner):
                 else cls.make_eqj_cond(left_aliases, [alias], cond)
             if eqj_cond_out is not None: # use a hash join
                 left_exprs, right_exprs, cond_remainder = eqj_cond_out
-                pop = cls.make_table_scan(context, alias, table)
+                pop = cls.make_table_scan(context, alias, table, cond)
                 pop = cls.make_hashjoin(cast(QPop, left), pop, left_exprs, right_exprs, cond_remainder)
                 return pop
         # fall back: use a table scan
-        pop = cls.make_table_scan(context, alias, table)
+        pop = cls.make_table_scan(context, alias, table, cond)
         if left is None:
+            if type(pop) is TableScanPop and \
+                (parallel_pop := cls.make_parallel_table_scan(context, alias, table, cond, column_names)) is not None:
+                return parallel_pop
             if cond is not None:
                 pop = FilterPop(pop, cond)
         else:
@@ -370,19 +486,29 @@ class BaselinePlanner(Planner):
         plan: QPop | None = None
         cond: ValExpr | None = block.where_cond
         outer_table_aliases: list[str] = list()
+        # find the columns of each table needed anywhere in the block,
+        # in case a scan can drop the others or an index has them all:
+        exprs = block.select_valexprs + (block.groupby_valexprs or []) + \
+            [e for e in (block.where_cond, block.having_cond) if e is not None]
+        column_names: dict[str, set[str]] = { alias: set() for alias in block.from_aliases }
+        for e in exprs:
+            for ref in valexpr.find_column_refs(e):
+                if isinstance(ref, valexpr.leaf.NamedColumnRef) and ref.table_alias in column_names:
+                    column_names[ref.table_alias].add(ref.column_name)
         for input_table, input_alias in zip(block.from_tables, block.from_aliases):
             if not isinstance(input_table, BaseTableLop):
                 raise PlannerException('subqueries in FROM not supported')
             local_cond, cond = valexpr.push_down_conds(cond, outer_table_aliases + [input_alias]) if cond is not None else (None, None)
             plan = cls.optimize_one_more_table(context, plan, outer_table_aliases,
-                                               input_alias, input_table, local_cond)
+                                               input_alias, input_table, local_cond, column_names[input_alias])
             outer_table_aliases.append(input_alias)
         if plan is None:
             raise PlannerException('unexpected error')
         if cond is not None:
             plan = FilterPop(plan, cond)
         if block.groupby_valexprs is not None:
-            plan, groupby_indcies = add_groupby_by_sorting(plan, block.groupby_valexprs)
+            plan, groupby_indcies = add_groupby_by_sorting(
+                plan, block.groupby_valexprs, LOSER_TREE_MERGE_MIN_RUNS if Planner.options.loser_tree_merge else None)
             plan = add_having_and_select(
                 plan, block.groupby_valexprs, groupby_indcies,
                 block.having_cond, block.select_valexprs, block.select_aliases)
@@ -5,6 +5,8 @@ from ..util import OptionsBase
 from ..validator import valexpr, Lop, QLop, CreateTableLop, ShowTablesLop, AnalyzeStatsLop, CreateIndexLop, InsertLop, DeleteLop, LiteralTableLop, SFWGHLop
 from ..executor import Pop, QPop, StatementContext, CreateTablePop, ShowTablesPop, AnalyzeStatsPop, CreateIndexPop, InsertPop, DeletePop, LiteralTablePop, MaterializePop, ProjectPop
 
+from .util import fuse_pipelines
+
 class PlannerException(Exception):
     pass
 
@@ -27,6 +29,21 @@ class Planner(ABC):
         hash_join: bool = field(default=True, metadata={'on': True, 'off': False})
         """Whether to enable hash joins.
         """
+        zone_map_scan: bool = field(default=True, metadata={'on': True, 'off': False})
+        """Whether to enable table scans that skip data using zone maps.
+        """
+        prefetch_scan: bool = field(default=False, metadata={'on': True, 'off': False})
+        """Whether table scans read ahead on a background thread.
+        """
+        parallel_scan: bool = field(default=False, metadata={'on': True, 'off': False})
+        """Whether to enable table scans farmed out to worker processes.
+        """
+        fuse_pipelines: bool = field(default=False, metadata={'on': True, 'off': False})
+        """Whether to fuse chains of streaming operators in the final plan into generated code (see :class:`.PipelinePop`).
+        """
+        loser_tree_merge: bool = field(default=False, metadata={'on': True, 'off': False})
+        """Whether sorts merge many runs with a tree of losers instead of a heap (see :func:`.loser_tree_merge`).
+        """
 
     options = Options()
     """Options understood by the planner.
@@ -44,7 +61,7 @@ class Planner(ABC):
         elif isinstance(lop, AnalyzeStatsLop):
             return AnalyzeStatsPop(context, lop.base_metas)
         elif isinstance(lop, CreateIndexLop):
-            return CreateIndexPop(context, lop.base_metadata, lop.column_index)
+            return CreateIndexPop(context, lop.base_metadata, lop.column_index, lop.included_column_indices, lop.use_hash)
         elif isinstance(lop, InsertLop):
             if isinstance(lop.contents, LiteralTableLop):
                 return InsertPop(context, lop.base_metadata, LiteralTablePop(context, None, lop.contents.metadata(), lop.contents.rows))
@@ -53,7 +70,7 @@ class Planner(ABC):
                 return InsertPop(
                     context, lop.base_metadata,
                     # use blocking MaterializePop to decouple computation of what to insert and actual insert operations:
-                    MaterializePop(
+                    cls.finish_query(MaterializePop(
                         # use ProjectPop to ensure precise typing as needed:
                         ProjectPop(
                             contents_pop,
@@ -64,16 +81,25 @@ class Planner(ABC):
                                     lop.base_metadata.column_types))
                             ],
                             None),
-                        blocking=True))
+                        blocking=True)))
             else:
                 raise PlannerException('supported INSERT subquery')
         elif isinstance(lop, DeleteLop):
             # use blocking MaterializePop to decouple computation of what to delete and actual delete operations:
-            return DeletePop(context, lop.base_metadata, MaterializePop(cls.optimize_query(context, lop.key_query), blocking=True))
+            return DeletePop(context, lop.base_metadata,
+                             cls.finish_query(MaterializePop(cls.optimize_query(context, lop.key_query), blocking=True)))
         elif isinstance(lop, SFWGHLop):
-            return cls.optimize_block(context, lop)
+            return cls.finish_query(cls.optimize_block(context, lop))
         else:
             raise PlannerException(f'not yet supported: {type(lop).__name__}')
+
+    @classmethod
+    def finish_query(cls, plan: QPop) -> QPop:
+        """Apply post-passes (as enabled by options) to an optimized physical query ``plan``, and return the final plan.
+        """
+        if Planner.options.fuse_pipelines:
+            plan = fuse_pipelines(plan)
+        return plan
     
     @classmethod
     def optimize_query(cls, context: StatementContext, query: QLop) -> QPop:
@@ -2,14 +2,16 @@ from typing import cast, Sequence
 
 from ..globals import DEFAULT_SORT_BUFFER_SIZE
 from ..validator import ValExpr, valexpr, OutputLineage
-from ..executor import QPop, MergeSortPop, AggrPop, FilterPop, ProjectPop
+from ..executor import QPop, MergeSortPop, AggrPop, FilterPop, ProjectPop, PipelinePop
 
-def add_groupby_by_sorting(input: QPop[QPop.CompiledProps], groupby_exprs: list[ValExpr]) -> tuple[QPop[QPop.CompiledProps], list[int]]:
+def add_groupby_by_sorting(input: QPop[QPop.CompiledProps], groupby_exprs: list[ValExpr],
+                           loser_tree_fan_in: int | None = None) -> tuple[QPop[QPop.CompiledProps], list[int]]:
     """Add additional operators on top of ``input`` as needed so that
     its output will contain all GROUP BY expressions and
     its output rows sorted by them such that those in the same group will be consecutive.
     Return the new plan, together with the list of output column indices corresponding to the GROUP BY expressions.
     However, no particular column or sort ordering is guaranteed.
+    ``loser_tree_fan_in`` is passed on to the :class:`.MergeSortPop` added (if any).
     """
     # figure out what GROUP BY expressions (if any) are not merely column references,
     # and add them as extra columns using a projection as needed:
@@ -43,7 +45,7 @@ def add_groupby_by_sorting(input: QPop[QPop.CompiledProps], groupby_exprs: list[
         sort_exprs.append(valexpr.RelativeColumnRef(
             0, column_index, input.compiled.output_metadata.column_types[column_index]))
         orders_asc.append(True)
-    input = MergeSortPop(input, sort_exprs, orders_asc, DEFAULT_SORT_BUFFER_SIZE, DEFAULT_SORT_BUFFER_SIZE)
+    input = MergeSortPop(input, sort_exprs, orders_asc, DEFAULT_SORT_BUFFER_SIZE, DEFAULT_SORT_BUFFER_SIZE, loser_tree_fan_in)
     return input, groupby_column_indices
 
 def add_having_and_select(
@@ -75,3 +77,21 @@ def add_having_and_select(
         for e in select_exprs
     ]
     return ProjectPop(input, relativized_select_exprs, select_aliases)
+
+def fuse_pipelines(plan: QPop[QPop.CompiledProps]) -> QPop[QPop.CompiledProps]:
+    """A post-pass over a finished ``plan`` that fuses each maximal chain of (two or more) streaming operators,
+    i.e., one that stops at blocking operators such as sort and at joins, into a :class:`.PipelinePop`.
+    Return the new plan (whose root is different if the chain at the root is fused).
+    """
+    fused, source = PipelinePop.chain(plan)
+    if len(fused) == 0: # look for chains further down:
+        for child in plan.children():
+            if (new_child := fuse_pipelines(child)) is not child:
+                plan.replace_child(child, new_child)
+        return plan
+    # the source may itself end another chain (e.g., an AggrPop):
+    if (new_source := fuse_pipelines(source)) is not source:
+        fused[0].replace_child(source, new_source)
+    if len(fused) < 2: # nothing to be gained
+        return plan
+    return PipelinePop(plan)
@@ -1,13 +1,16 @@
-from typing import Final, Any, TypeAlias
+from typing import Final, Any, TypeAlias, Callable
 from enum import Enum, auto
 from functools import cached_property
+from operator import itemgetter
 from sys import getsizeof
 from datetime import datetime
+import builtins
 
 # the following imports are needed for providing Python functions used in compiled expressions:
 import re
 from math import sqrt
 from dateutil.parser import parse as str_to_datetime
+import numpy as np
 
 class ValType(Enum):
     """Types supported by our database system.
@@ -104,6 +107,11 @@ RowType: TypeAlias = list[ValType]
 """Type for a row, which is simply a list of ``ValType``s.
 """
 
+KeyType: TypeAlias = ValType | tuple[ValType, ...]
+"""Type for an index key, which is either a single ``ValType``,
+or a tuple of ``ValType``s for a composite (multi-column) key.
+"""
+
 def column_sizes(row_type: RowType) -> list[int]:
     """Return the sizes of columns according to their types (:meth:`.ValType.size`).
     """
@@ -118,26 +126,113 @@ def row_size(row_type: RowType) -> int:
 def regexp_match(s: str, pattern: str):
     return re.match(pattern, s) is not None
 
+# the following class provides a way for compiled sort keys to order values that cannot be negated in reverse:
+class DescKey:
+    """A wrapper of a value (e.g., a string) that orders in reverse of the value itself.
+    """
+    __slots__ = ('value', )
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+        return
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, DescKey) and self.value == other.value
+
+    def __lt__(self, other: 'DescKey') -> bool:
+        return other.value < self.value
+
+    def __gt__(self, other: 'DescKey') -> bool:
+        return other.value > self.value
+
+# the following function and class support compiled expressions that are vectorized using NumPy:
+def int_arith(ufunc: np.ufunc, *args: Any) -> Any:
+    """Apply ``ufunc`` (e.g., ``np.add``) to NumPy integer arrays (or scalars) ``args``.
+    Unlike Python integers, NumPy integers silently wrap around upon overflow,
+    so raise ``OverflowError`` instead if the result may come anywhere near that.
+    """
+    approx = ufunc(*(np.asarray(arg, dtype=np.float64) for arg in args))
+    if np.any(np.abs(approx) >= 2.0 ** 62):
+        raise OverflowError('integer result too large to vectorize')
+    return ufunc(*args)
+
+class ColumnarBatch:
+    """A batch of rows viewed by column: :meth:`.column` returns the values of a column as a NumPy array,
+    so that code referring to a component of a row (e.g., ``row0[2]``)
+    can instead refer to the entire column in a vectorized expression (e.g., ``row0.column(2, ValType.FLOAT)``).
+    Each column is converted on first use.
+    Only columns of booleans and numbers can be converted, and the NumPy type is taken from the declared ``ValType``
+    (not from the values, as a ``FLOAT`` column may well hold Python integers);
+    for other columns, or columns with ``None`` values, ``TypeError`` is raised.
+    """
+
+    _DTYPES: Final = { ValType.BOOLEAN: np.bool_, ValType.INTEGER: np.int64, ValType.FLOAT: np.float64 }
+
+    def __init__(self, rows: list[tuple]) -> None:
+        self.rows: Final = rows
+        self._columns: Final[dict[int, np.ndarray]] = dict()
+        return
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def column(self, column_index: int, valtype: ValType) -> np.ndarray:
+        if (column := self._columns.get(column_index)) is None:
+            if (dtype := self._DTYPES.get(valtype)) is None:
+                raise TypeError(f'column of {valtype.name} cannot be vectorized')
+            values = list(map(itemgetter(column_index), self.rows))
+            if None in values: # NumPy would silently turn these into NaN or False
+                raise TypeError('column with NULL cannot be vectorized')
+            # a typed ``fromiter`` is much faster than ``np.array``, which has to discover the type first:
+            column = np.fromiter(values, dtype=dtype, count=len(values))
+            self._columns[column_index] = column
+        return column
+
 class CompiledValExpr:
     """A compiled version of an expression tree that is more efficient for execution.
     During query execution, such expressions are often evaluated in the inner-most loops,
     so interpreted execution of parsed expressions is very expensive.
     Currently, this class is implemented as compiled Python expressions,
     which can additionally accept values for named parameters for each evaluation.
+    For use in inner loops, :meth:`.function` turns the expression into a Python function
+    taking these values as positional arguments, which avoids the cost of binding them by name for each call.
+    Optionally, it also carries a vectorized version of the expression that computes over NumPy arrays,
+    which :meth:`.eval_batch` and :meth:`.filter_batch` try first.
     """
 
-    def __init__(self, code: str) -> None:
+    def __init__(self, code: str, vector_code: str | None = None) -> None:
         """Construct a compiled expression from ``code``, which is a Python expression.
         ``code`` can refer to unbound variables, whose values must be set as named parameters when calling :meth:`.eval`.
         ``code`` can also make use of any functions imported or defined earlier in this module.
+        ``vector_code``, if given, is an equivalent Python expression that computes over a :class:`.ColumnarBatch`
+        instead of a row (see ``valexpr.to_code_str`` with backend ``numpy``).
         """
         self._code: Final[str] = code
         self._exec: Final[Any] = compile(self._code, '<string>', 'eval')
+        self._vector_code: Final = vector_code
+        self._vector_exec: Final[Any] = None if vector_code is None else compile(vector_code, '<string>', 'eval')
+        self._functions: Final[dict[tuple[str, ...], Callable[..., Any]]] = dict()
+        """Functions returned by :meth:`.function`, by parameter names.
+        """
+        self._batch_functions: Final[dict[tuple[bool, str, tuple[str, ...]], Callable[..., list]]] = dict()
+        """Functions evaluating list comprehensions for :meth:`.eval_batch` and :meth:`.filter_batch`,
+        by kind, row variable, and names of other variables.
+        """
         return
 
     def __str__(self) -> str:
         return self._code
 
+    def __reduce__(self) -> tuple:
+        """Support pickling (e.g., to ship the expression to another process) by recompiling from ``code``.
+        """
+        return (CompiledValExpr, (self._code, self._vector_code))
+
+    def vector_code(self) -> str | None:
+        """Return the vectorized version of the expression, or ``None`` if there is none.
+        """
+        return self._vector_code
+
     @classmethod
     def compare(cls, arg1: 'CompiledValExpr', op: str, arg2: 'CompiledValExpr') -> 'CompiledValExpr':
         """Construct a compiled expression comparing ``arg1`` and ``arg2`` using ``op``,
@@ -182,7 +277,91 @@ class CompiledValExpr:
         else:
             return CompiledValExpr('(' + ', '.join(f'({arg._code})' for arg in args) + ')')
 
+    @classmethod
+    def descending(cls, arg: 'CompiledValExpr', negatable: bool) -> 'CompiledValExpr':
+        """Construct a compiled expression whose values order in reverse of those of ``arg``, for use in sort keys:
+        if ``negatable`` (i.e., ``arg`` evaluates to numbers or booleans), values are simply negated;
+        otherwise, they are wrapped as :class:`.DescKey`.
+        """
+        if negatable:
+            return CompiledValExpr(f'-({arg._code})')
+        else:
+            return CompiledValExpr(f'DescKey({arg._code})')
+
     def eval(self, **kwarg) -> Any:
         """Evaluate this compiled expression, with variables therein bound to the named parameter values provided by ``kwarg``.
+        This builds a dictionary of variables for each call,
+        so it is meant for one-off evaluation and debugging; use :meth:`.function` in loops instead.
         """
         return eval(self._exec, None, kwarg)
+
+    def function(self, *params: str) -> Callable[..., Any]:
+        """Return a Python function that evaluates this compiled expression,
+        with variables therein bound to the positional arguments named by ``params``;
+        e.g., ``function('this', 'that')(row1, row2)`` is the same as ``eval(this=row1, that=row2)``, only faster.
+        The function is compiled on first request and cached.
+        """
+        if (f := self._functions.get(params)) is None:
+            f = eval(f'lambda {", ".join(params)}: ({self._code})', globals())
+            self._functions[params] = f
+        return f
+
+    def _eval_vectorized(self, row_var: str, rows: list[builtins.tuple], kwarg: dict[str, Any]) -> np.ndarray | None:
+        """Evaluate the vectorized version of this compiled expression over ``rows``
+        (as a :class:`.ColumnarBatch` bound to the variable ``row_var``), and return the array of results,
+        or ``None`` if there is no vectorized version, or if this batch cannot be handled by it:
+        e.g., some column cannot be converted, or some arithmetic error occurs
+        (in which case evaluating row by row will raise the proper exception, if any).
+        """
+        if self._vector_exec is None:
+            return None
+        kwarg = dict(kwarg)
+        kwarg[row_var] = ColumnarBatch(rows)
+        try:
+            with np.errstate(all='raise'):
+                result = eval(self._vector_exec, None, kwarg)
+        except (ArithmeticError, TypeError, ValueError):
+            return None
+        if not isinstance(result, np.ndarray) or result.shape != (len(rows), ) or result.dtype.kind not in 'biuf':
+            return None # e.g., the expression turns out to be constant
+        return result
+
+    def _eval_over(self, filtering: bool, row_var: str, rows: list[builtins.tuple], kwarg: dict[str, Any]) -> list:
+        """Evaluate this compiled expression over ``rows`` in one list comprehension,
+        binding each row in turn to the variable ``row_var``; see :meth:`.eval_batch` and :meth:`.filter_batch`.
+        """
+        if (result := self._eval_vectorized(row_var, rows, kwarg)) is not None:
+            if not filtering:
+                return result.tolist() # converts back to Python values
+            elif result.dtype.kind == 'b':
+                return [ rows[i] for i in np.flatnonzero(result).tolist() ]
+        params = tuple(kwarg.keys())
+        if (f := self._batch_functions.get((filtering, row_var, params))) is None:
+            code = f'[{row_var} for {row_var} in _rows if ({self._code})]' if filtering \
+                else f'[({self._code}) for {row_var} in _rows]'
+            f = eval(f'lambda _rows, {", ".join(params)}: {code}', globals())
+            self._batch_functions[(filtering, row_var, params)] = f
+        return f(rows, *kwarg.values())
+
+    def eval_batch(self, row_var: str, rows: list[builtins.tuple], **kwarg) -> list:
+        """Evaluate this compiled expression for each of the ``rows``, and return the list of results.
+        Each row in turn is bound to the variable ``row_var``;
+        other variables are bound to the named parameter values provided by ``kwarg`` as in :meth:`.eval`.
+        This saves the interpretive overhead of a separate :meth:`.eval` call per row;
+        if there is a vectorized version of this expression, it is tried first to save even more.
+        """
+        return self._eval_over(False, row_var, rows, kwarg)
+
+    def filter_batch(self, row_var: str, rows: list[builtins.tuple], **kwarg) -> list[builtins.tuple]:
+        """Same as :meth:`.eval_batch`, but return (in order) the ``rows`` for which this compiled expression is true.
+        """
+        return self._eval_over(True, row_var, rows, kwarg)
+
+def compile_function(code: str, name: str) -> Callable[..., Any]:
+    """Compile ``code``, which is the Python source of a function definition, and return the function named ``name``.
+    Like the code of a :class:`.CompiledValExpr`, ``code`` can make use of any functions imported or defined in this module,
+    so it can embed code of compiled expressions (e.g., to fuse their evaluation into one loop).
+    """
+    scope = dict(globals())
+    exec(compile(code, '<string>', 'exec'), scope)
+    return scope[name]
@@ -90,6 +90,53 @@ class ProfileStat:
         self.stop()
         return
 
+class BatchProfileStat(ProfileStat):
+    """A "collector" for a generator that yields lists (batches) of rows instead of individual rows,
+    such as :meth:`.QPop.execute_batches`.
+    To keep statistics comparable with a generator yielding individual rows,
+    ``num_next_calls`` counts as if each row had been obtained by a separate ``next()`` call
+    (again including the last one signifying the end).
+    """
+
+    def next_start(self) -> None:
+        self.start()
+        return
+
+    def next_stop(self, result: Any) -> None:
+        self.stop()
+        self.num_next_calls += 1 if result is None else len(result)
+        return
+
+class PipelineProfileStat(BatchProfileStat):
+    """A "collector" for a generator that executes a pipeline of operators fused together (see :class:`.PipelinePop`),
+    instead of calling their ``execute()`` methods.
+    So that statistics can still be reported for each fused operator as if it had executed separately,
+    the pipeline registers a "shadow" collector for each of them (see :meth:`.ProfileContext.fuse`).
+    Since the fused operators share one loop, each shadow is credited with all time spent in the pipeline
+    (much like a generator's time includes that of its inputs);
+    the pipeline itself is responsible for counting rows for the shadows.
+    """
+
+    def __init__(self, method: Callable, obj: Any, caller: 'ProfileStat | None',
+                 *call_args, **call_kw) -> None:
+        self.fused: Final[list[ProfileStat]] = list()
+        super().__init__(method, obj, caller, *call_args, **call_kw)
+        return
+
+    def stop(self) -> None:
+        ns_thread, ns_elapsed = self.ns_thread, self.ns_elapsed
+        super().stop()
+        for stat in self.fused:
+            stat.ns_thread += self.ns_thread - ns_thread
+            stat.ns_elapsed += self.ns_elapsed - ns_elapsed
+        return
+
+def is_execute(method_name: str) -> bool:
+    """Check if ``method_name`` (a qualified method name) is that of a method executing a ``Pop``,
+    i.e., ``execute()``, or ``execute_batches()`` for a ``QPop`` that executes natively in batches.
+    """
+    return method_name.endswith('.execute') or method_name.endswith('.execute_batches')
+
 class ProfileContext:
     """A context for hold profiling information during execution of a complex call graph.
     Currently we support only invocation of member methods.
@@ -171,6 +218,21 @@ class ProfileContext:
         self.call_end(stat, None)
         return
 
+    def fuse(self, stat_cls: type[ProfileStat], method: Callable, obj: Any) -> ProfileStat:
+        """Construct (and return) an object of the given ``stat_cls`` to track statistics on ``method`` of ``obj``,
+        which is not invoked but rather fused into the current invocation,
+        and register it in the member attribute ``stats`` as if it had been called by the current invocation.
+        The current invocation must be tracked by a :class:`.PipelineProfileStat`,
+        which credits its time to the new object; the caller should update other statistics as appropriate.
+        """
+        caller = None if len(self.call_stack) == 0 else self.call_stack[-1]
+        if not isinstance(caller, PipelineProfileStat):
+            raise ProfileException('fusing into a call not tracked by PipelineProfileStat')
+        stat = stat_cls(method, obj, caller)
+        caller.fused.append(stat)
+        self.stats.append(stat)
+        return stat
+
     def summarize_block_stats_for_execute(self, stat: ProfileStat) -> tuple[int, int, int]:
         """Given ``stat``, summarize stats about block I/Os incurred by this method and it call graph descendants.
         The components returned, in order, are:
@@ -185,7 +247,7 @@ class ProfileContext:
         for stat2 in self.stats:
             if stat2.caller is not None and stat2.caller == stat:
                 child_read, child_written, child_overall = self.summarize_block_stats_for_execute(stat2)
-                if stat2.method_name.endswith('.execute'):
+                if is_execute(stat2.method_name):
                     desc_blocks += child_overall
                 else: # count toward self:
                     num_blocks_read += child_read
@@ -213,7 +275,7 @@ class ProfileContext:
         blocks_overall = MinMaxSum[int]()
         for stat in self.stats:
             if (obj is None or stat.oid == id(obj))\
-            and stat.method_name.endswith('.execute'):
+            and is_execute(stat.method_name):
                 num_stats += 1
                 next_calls.add(stat.num_next_calls)
                 ns_elapsed.add(stat.ns_elapsed)
@@ -250,6 +312,14 @@ def new_profile_context() -> ProfileContext:
     profile_context = ProfileContext()
     return profile_context
 
+def no_profile_context() -> None:
+    """Unset the global profile context, so subsequent execution is not profiled at all
+    (decorated methods then construct no :class:`.ProfileStat` and incur no profiling overhead).
+    """
+    global profile_context
+    profile_context = None
+    return None
+
 def get_profile_context() -> ProfileContext | None:
     """Locate the appropriate profile context object for current execution.
     TODO: This method of getting the profile context through a global variable will NOT work when we have concurrent transactions.
@@ -10,8 +10,8 @@ from .util import OptionsBase
 from .parser import parse_all, ParserException
 from .validator import validate, ValidatorException, SetOptionLop, CommitLop, RollbackLop
 from .planner import Planner, NaivePlanner, BaselinePlanner, SmartPlanner
-from .executor import StatementContext, ExecutorException, CPop, QPop
-from .profile import new_profile_context
+from .executor import StatementContext, TmpFilePool, ExecutorException, CPop, QPop
+from .profile import ProfileContext, new_profile_context, no_profile_context
 if TYPE_CHECKING:
     # this hack and the use of quoted types for forward references below
     # are required to avoid Python circular import nightmare.
@@ -42,6 +42,8 @@ class Session:
         read_only: bool = field(default=False, metadata={'read only': True, 'read write': False})
         debug: bool = field(default=False, metadata={'on': True, 'off': False})
         planner: Type[Planner] = field(default=BaselinePlanner, metadata={'baseline': BaselinePlanner, 'naive': NaivePlanner, 'smart': SmartPlanner})
+        profile: bool = field(default=True, metadata={'on': True, 'off': False})
+        durability: str | None = field(default=None, metadata={'full': 'full', 'none': 'none', 'default': None})
 
     def __init__(self, dbm: 'DatabaseManager') -> None:
         self.dbm: Final = dbm
@@ -75,7 +77,8 @@ class Session:
         logging.debug(repr(parse_tree))
         # if needed, start parent transaction (recall we need one for database one for tmp space) spanning multiple requests:
         if not self.options.autocommit and self.parent_tx is None:
-            self.parent_tx = self.dbm.tm.begin_transaction(read_only=self.options.read_only)
+            self.parent_tx = self.dbm.tm.begin_transaction(read_only=self.options.read_only,
+                                                           durability=self.options.durability)
             self.parent_tmp_tx = self.dbm.tm.begin_transaction(read_only=False, tmp=True)
             self.parent_has_done_work = False
         # action to take on parent transaction upon completing request:
@@ -83,13 +86,20 @@ class Session:
         # start the (inner) transaction (again one for database and one for tmp space)
         # to handle the current request; error in this request won't abort the parent transaction (if any):
         r = Response()
-        with self.dbm.tm.begin_transaction(parent=self.parent_tx, read_only=self.options.read_only) as tx, \
+        with self.dbm.tm.begin_transaction(parent=self.parent_tx, read_only=self.options.read_only,
+                                           durability=self.options.durability) as tx, \
             self.dbm.tm.begin_transaction(parent=self.parent_tmp_tx, read_only=False, tmp=True) as tmp_tx:
             try:
+                if self.options.profile:
+                    profile_context: ProfileContext | None = new_profile_context()
+                else:
+                    no_profile_context()
+                    profile_context = None
                 context = StatementContext(
                     sm=self.dbm.sm, mm=self.dbm.mm, zm=self.dbm.zm,
-                    tx=tx, tmp_tx=tmp_tx,
-                    profile_context=new_profile_context())
+                    tx=tx, tmp_tx=tmp_tx, tmp_files=TmpFilePool(self.dbm.sm, tmp_tx),
+                    tx_sees_committed=(self.parent_tx is None or not self.parent_has_done_work),
+                    profile_context=profile_context)
                 # validate: parse tree -> logical plan
                 lop = validate(self.dbm.mm, context.tx, parse_tree)
                 logging.debug('-'*20 + ' LOGICAL PLAN ' + '-'*20)
@@ -134,6 +144,7 @@ class Session:
                     logging.debug('-'*20 + ' POST-MORTEM ANALYSIS ' + '-'*20)
                     if isinstance(pop, QPop):
                         r.r_pop = pop
+                    if isinstance(pop, QPop) and context.profile_context is not None:
                         logging.debug(f'total measured running time: {pop.measured.ns_elapsed.sum/1000000}ms')
                         logging.debug(f'total measured I/Os: {pop.measured.sum_blocks.overall}')
                         for s in pop.pstr():
@@ -141,6 +152,8 @@ class Session:
                         # logging.debug('-'*20 + ' DETAILED PROFILE ' + '-'*20)
                         # for s in context.profile_context.pstr_stats():
                         #     logging.debug(s)
+                    logging.debug(context.tmp_files.pstr())
+                context.tmp_files.recycle()
                 tmp_tx.commit()
                 tx.commit()
                 if self.parent_tx is not None:
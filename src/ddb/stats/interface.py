@@ -91,8 +91,9 @@ class StatsManager(ABC, Generic[TZ, CZ]):
         pass
 
     @abstractmethod
-    def secondary_index_stats(self, context: 'StatementContext', meta: 'BaseTableMetadata', column_name: str) -> TZ:
-        """Estimate stats for a secondary index for table with given metadata on column with the given name.
+    def secondary_index_stats(self, context: 'StatementContext', meta: 'BaseTableMetadata', column_name: str | tuple[str, ...]) -> TZ:
+        """Estimate stats for a secondary index for table with given metadata on column with the given name,
+        or, if ``column_name`` is a tuple, for a composite index on columns with the given names.
         """
         pass
 
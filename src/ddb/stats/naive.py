@@ -34,8 +34,9 @@ class NaiveCollectionStats(CollectionStats):
     table_stats: dict[str, NaiveTableStats]
     """A mapping from table names to their stats.
     """
-    index_stats: dict[str, dict[str, NaiveTableStats]]
-    """A mapping from (table name, column name) to the stats of the associated secondary index.
+    index_stats: dict[str, dict[str | tuple[str, ...], NaiveTableStats]]
+    """A mapping from (table name, column name) to the stats of the associated secondary index;
+    for a composite index, the column name is replaced by a tuple of column names.
     """
 
     def pstr(self) -> Iterable[str]:
@@ -44,6 +45,8 @@ class NaiveCollectionStats(CollectionStats):
             for s in stats.pstr():
                 yield '| ' + s
             for column_name, stats in self.index_stats[name].items():
+                if isinstance(column_name, tuple):
+                    column_name = ', '.join(column_name)
                 yield f'|- {name}({column_name}):'
                 for s in stats.pstr():
                     yield '|  | ' + s
@@ -123,22 +126,41 @@ class NaiveStatsManager(StatsManager[NaiveTableStats, NaiveCollectionStats]):
         self.stats.index_stats[meta.name] = dict()
         for si in meta.secondary_column_indices:
             column_name = meta.column_names[si]
-            index_row_type = [meta.column_types[si], ValType.INTEGER]
+            included = meta.included_column_indices(si)
+            index_row_type = [meta.column_types[si], ValType.INTEGER] + [meta.column_types[i] for i in included]
             index_stats = NaiveTableStats(
                 row_count = table_stats.row_count,
                 row_size = row_size(index_row_type),
                 column_sizes = column_sizes(index_row_type),
                 tree_height = 0,
                 fill_factor = 0.0,
-                distinct_counts = [table_stats.distinct_counts[si], table_stats.row_count])
+                distinct_counts = [table_stats.distinct_counts[si], table_stats.row_count] +\
+                    [table_stats.distinct_counts[i] for i in included])
             with self.mm.index_storage(context.tx, meta, si) as f:
                 storage_stats = f.stat()
                 type(self)._update_stats_from_lmdb(index_stats, storage_stats)
             self.stats.index_stats[meta.name][column_name] = index_stats
+        for column_indices in meta.composite_indices:
+            column_names = tuple(meta.column_names[i] for i in column_indices)
+            included = meta.included_column_indices(column_indices)
+            index_row_type = [meta.column_types[i] for i in column_indices] + [meta.id_type()] +\
+                [meta.column_types[i] for i in included]
+            index_stats = NaiveTableStats(
+                row_count = table_stats.row_count,
+                row_size = row_size(index_row_type),
+                column_sizes = column_sizes(index_row_type),
+                tree_height = 0,
+                fill_factor = 0.0,
+                distinct_counts = [table_stats.distinct_counts[i] for i in column_indices] + [table_stats.row_count] +\
+                    [table_stats.distinct_counts[i] for i in included])
+            with self.mm.composite_index_storage(context.tx, meta, column_indices) as f:
+                storage_stats = f.stat()
+                type(self)._update_stats_from_lmdb(index_stats, storage_stats)
+            self.stats.index_stats[meta.name][column_names] = index_stats
         # now that refreshing is done, run through this method again to handle return_row_id as needed:
         return self.base_table_stats(context, meta, return_row_id=return_row_id, refresh=False)
 
-    def secondary_index_stats(self, context: StatementContext, meta: BaseTableMetadata, column_name: str) -> NaiveTableStats:
+    def secondary_index_stats(self, context: StatementContext, meta: BaseTableMetadata, column_name: str | tuple[str, ...]) -> NaiveTableStats:
         if meta.name not in self.stats.index_stats or column_name not in self.stats.index_stats[meta.name]:
             self.base_table_stats(context, meta, refresh=True)
         return self.stats.index_stats[meta.name][column_name]
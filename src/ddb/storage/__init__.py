@@ -1,5 +1,7 @@
 """The storage manager and associated classes and functions let you
 store and manage records in heap files and indexes in a database.
 """
-from .interface import StorageMangerException, HeapFile, BplusTree, StorageManager
-from .lmdb import LMDBHeapFile, LMDBBplusTree, LMDBStorageManager, LMDBTransactionInterface
+from .interface import StorageMangerException, DuplicateKeyException, SnapshotChangedException, Zone, ScanPartition, HeapFile, Index, BplusTree, HashIndex, StorageManager
+from .lmdb import LMDBHeapFile, LMDBCompressedHeapFile, LMDBBplusTree, LMDBHashIndex, LMDBScanPartition, LMDBStorageManager, LMDBTransactionInterface
+from .memory import MemoryHeapFile, MemoryStorageManager
+from .serialize import COMPRESSIONS, KeyCodec
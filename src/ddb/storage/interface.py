@@ -1,10 +1,11 @@
 """This module mostly defines *abstract* classes and documents the storage API.
 See the :mod:`.lmdb` module for implementation classes.
 """
-from typing import final, Self, Final, Iterable, Generator, Any
+from typing import final, Self, Final, Iterable, Generator, Callable, Any
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 
-from ..primitives import ValType, RowType
+from ..primitives import ValType, RowType, KeyType
 from ..transaction import Transaction
 
 class StorageMangerException(Exception):
@@ -12,6 +13,58 @@ class StorageMangerException(Exception):
     """
     pass
 
+class DuplicateKeyException(StorageMangerException):
+    """Exception thrown when a key being added to a :class:`.BplusTree` with ``unique`` keys already exists.
+    """
+    def __init__(self, name: str, key: Any) -> None:
+        super().__init__(f'{name}: duplicate key value {key}')
+        self.key: Final = key
+        return
+
+class SnapshotChangedException(StorageMangerException):
+    """Exception thrown when a :class:`.ScanPartition` can no longer be scanned
+    because the database has changed since the partition was made.
+    """
+    pass
+
+@dataclass(frozen=True)
+class Zone:
+    """Summary of the rows in one chunk of consecutive row ids in a :class:`.HeapFile` with a zone map
+    (see :meth:`.HeapFile.iter_scan_batches`).
+    Values are summarized by column (in row order).
+    Minimums and maximums are conservative: deleting or overwriting rows does not tighten them.
+    """
+    num_rows: int
+    """Number of rows in the chunk.
+    """
+    mins: tuple
+    """For each column, the minimum of non-``NULL`` values, or ``None`` if there were none.
+    """
+    maxs: tuple
+    """For each column, the maximum of non-``NULL`` values, or ``None`` if there were none.
+    """
+    null_counts: tuple
+    """For each column, the number of ``NULL`` values.
+    """
+
+class ScanPartition(ABC):
+    """A part of a :class:`.HeapFile` or :class:`.BplusTree` (a range of row ids or keys)
+    that can be scanned in another process, in a read-only transaction of its own,
+    as obtained by ``scan_partitions`` of the file.
+    Objects of this class can be pickled and sent to that process;
+    they do not refer to the file object, transaction, or storage manager that created them.
+    """
+
+    @abstractmethod
+    def iter_scan_batches(self, num_blocks: int = 1) -> Generator[list[tuple], None, None]:
+        """Return a Python generator that iterates over lists of rows in this part,
+        as ``iter_scan_batches`` of the file that this part comes from would
+        (i.e., rows, (row id, row...) tuples, or (key, row) entries, as the case may be).
+        The implementation may refuse to be called in the process that created this object.
+        A :class:`.SnapshotChangedException` is raised if the part no longer looks as it did when made.
+        """
+        pass
+
 class HeapFile(ABC):
     """A ``HeapFile`` stores rows (tuples) that are uniquely identfied by row ids (integers).
 
@@ -77,6 +130,37 @@ class HeapFile(ABC):
         If ``return_row_id`` is ``True``, then return the (row id, row) pairs instead."""
         pass
 
+    @abstractmethod
+    def iter_scan_batches(self, return_row_id: bool = False, num_blocks: int = 1,
+                          zone_filter: Callable[[Zone], bool] | None = None,
+                          prefetch_blocks: int = 0) -> Generator[list[tuple], None, None]:
+        """Same as :meth:`.HeapFile.iter_scan`, but return a Python generator that iterates over
+        lists of rows instead of individual rows, in the same order.
+        Each list (except perhaps the last one) holds roughly ``num_blocks`` blocks' worth of rows,
+        so the per-iteration overhead is paid once per batch instead of once per row.
+        Each list is newly created, so the caller is free to hold on to or modify it.
+
+        If ``zone_filter`` is given and the file maintains a zone map (a :class:`.Zone` per chunk of row ids),
+        chunks whose zones fail ``zone_filter`` are skipped without being read.
+        Rows in the other chunks are all returned, so the caller still needs to check them;
+        without a zone map, ``zone_filter`` is simply ignored.
+
+        If ``prefetch_blocks`` is positive, the implementation may read up to that many blocks ahead
+        on a background thread, so that data not yet in memory is fetched while the caller works on rows returned.
+        This is only a hint, which implementations are free to ignore.
+        """
+        pass
+
+    def scan_partitions(self, num_partitions: int, return_row_id: bool = False) -> list[ScanPartition] | None:
+        """Divide the heap file into at most ``num_partitions`` parts by row id, to be scanned in parallel by other processes
+        (returning rows as :meth:`.HeapFile.iter_scan_batches` would with ``return_row_id``).
+        The parts are sized by guessing from the range of row ids, so they may be uneven.
+        Other processes see only committed data, so the caller must make sure that
+        neither this transaction nor its enclosing ones have changed the database.
+        Return ``None`` if the implementation does not support parallel scans.
+        """
+        return None
+
     @abstractmethod
     def put(self, row: tuple, row_id: int | None = None) -> int:
         """Store the given row in the heap file, and return the row id associated with it.
@@ -129,7 +213,68 @@ class HeapFile(ABC):
         self._close()
         return
 
-class BplusTree(ABC):
+class Index(ABC):
+    """What a :class:`.BplusTree` and a :class:`.HashIndex` have in common:
+    a collection of (key, row) entries that can be looked up and maintained by key,
+    so that code maintaining or probing an index need not care which of the two it is.
+    Like them, this class is implemented as a Python "context manager".
+    """
+
+    @abstractmethod
+    def _open(self, create_if_not_exists: bool = False) -> None:
+        """Called by the context manager method :meth:`.Index.__enter__` to ready this object
+        for managing the underlying file.
+        """
+        pass
+
+    @final
+    def __enter__(self) -> Self:
+        """Required for the context manager to ready this object."""
+        self._open()
+        return self
+
+    @abstractmethod
+    def iter_get(self, key: Any) -> Generator[tuple, None, None]:
+        """Return a Python generator that iterates over all (key, row) entries with given ``key``."""
+        pass
+
+    @abstractmethod
+    def put(self, key: Any, row: tuple) -> None:
+        """Store the given (key, row) entry in the index."""
+        pass
+
+    @abstractmethod
+    def bulk_load(self, entries: Iterable[tuple[Any, tuple]]) -> int:
+        """Add the given (key, row) entries to the index, and return the number of entries added."""
+        pass
+
+    @abstractmethod
+    def delete(self, key: Any, row: tuple | None = None) -> int:
+        """Delete the given (key, row) pair (if it exists), or,
+        if ``row`` is ``None``, all entries with the given key.
+        Return the number of entries deleted.
+        """
+        pass
+
+    @abstractmethod
+    def stat(self) -> dict:
+        """Return various statistics associated with this index."""
+        pass
+
+    @abstractmethod
+    def _close(self):
+        """Called by the context manager method :meth:`.Index.__exit__`
+        to release any resources used by this object to manage the underlying file.
+        """
+        pass
+
+    @final
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+        """Required for the context manager to release any resources used by this object."""
+        self._close()
+        return
+
+class BplusTree(Index):
     """A ``BplusTree`` stores a collection of (key, row) entries sorted by key,
     allowing fast retrieval and range scans of rows by key.
 
@@ -156,14 +301,17 @@ class BplusTree(ABC):
     Attributes:
         name: name of the B+tree file;
             caller is responsible for ensuring that the name is unique among all files managed by the storage manager.
-        key_type: type of the key; mutiple-component keys are currently not supported.
+        key_type: type of the key, or a tuple of types for a composite (multiple-component) key;
+            a composite key is a tuple of values, and wherever a key is used as a lower bound
+            (as in :meth:`.BplusTree.iter_scan`), a shorter tuple with values for only the leading components
+            can be given instead, which includes all keys starting with these values.
         row_type: TBD.
         unique: if `True`, the B+tree will enforce uniqueness of key values.
     """
 
     @abstractmethod
     def __init__(self, tx: Transaction, name: str,
-                 key_type: ValType, row_type: RowType,
+                 key_type: KeyType, row_type: RowType,
                  unique: bool = False):
         """Called by implementation class to help initalize an object of that class.
         (You shouldn't instantiate this abstract class directly.)
@@ -182,18 +330,12 @@ class BplusTree(ABC):
 
     @abstractmethod
     def _open(self, create_if_not_exists: bool = False) -> None:
-        """Called by the context manager method :meth:`.BplusTree.__enter__` to ready the resource.
+        """Called by the context manager method :meth:`.Index.__enter__` to ready the resource.
         to ready this object for managing the underlying file.
         The implementation class should implement this method.
         """
         pass
 
-    @final
-    def __enter__(self) -> Self:
-        """Required for the context manager to ready this object."""
-        self._open()
-        return self
-
     @abstractmethod
     def get_one(self, key: Any) -> tuple | None:
         """Return the first row with the given ``row_id``, or ``None`` if not found."""
@@ -240,6 +382,25 @@ class BplusTree(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_scan_batches(self, key_lower: Any = None, num_blocks: int = 1,
+                          prefetch_blocks: int = 0) -> Generator[list[tuple], None, None]:
+        """Same as :meth:`.BplusTree.iter_scan`, but return a Python generator that iterates over
+        lists of (key, row) entries instead of individual entries, in the same order.
+        Each list (except perhaps the last one) holds roughly ``num_blocks`` blocks' worth of entries,
+        so the per-iteration overhead is paid once per batch instead of once per entry.
+        Each list is newly created, so the caller is free to hold on to or modify it.
+        As with :meth:`.BplusTree.iter_scan`, consider closing the generator explicitly if you stop early.
+        ``prefetch_blocks`` is a hint to read ahead, as for :meth:`.HeapFile.iter_scan_batches`.
+        """
+        pass
+
+    def scan_partitions(self, num_partitions: int) -> list[ScanPartition] | None:
+        """Divide the B+tree into at most ``num_partitions`` parts by key, to be scanned in parallel by other processes;
+        see :meth:`.HeapFile.scan_partitions` for details.
+        """
+        return None
+
     @abstractmethod
     def put(self, key: Any, row: tuple) -> None:
         """Store the given (key, row) entry in the B+tree.
@@ -248,6 +409,19 @@ class BplusTree(ABC):
         """
         pass
 
+    @abstractmethod
+    def bulk_load(self, entries: Iterable[tuple[Any, tuple]]) -> int:
+        """Add the given (key, row) entries to the B+tree, and return the number of entries added.
+        Entries are best supplied in key order (and, for a non-``unique`` B+tree, in row order within each key),
+        in which case those going beyond the current largest key can be appended without searching the tree;
+        entries out of order are still handled correctly, just more slowly.
+        If ``unique`` is ``True``, a :class:`.DuplicateKeyException` will be raised upon
+        the first entry whose key already exists (either in the B+tree or earlier in ``entries``);
+        entries preceding it will have been added.
+        Otherwise, an entry identical to an existing one is ignored (and not counted).
+        """
+        pass
+
     @abstractmethod
     def delete(self, key: Any, row: tuple | None = None) -> int:
         """ Delete the given (key, row) pair (if it exists), or,
@@ -265,18 +439,100 @@ class BplusTree(ABC):
 
     @abstractmethod
     def _close(self):
-        """Called by the context manager method :meth:`.BplusTree.__exit__`
+        """Called by the context manager method :meth:`.Index.__exit__`
         to release any resources used by this object to manage the underlying file.
         The implementation class should implement this method.
         """
         pass
 
-    @final
-    def __exit__(self, exception_type, exception_value, exception_traceback):
-        """Required for the context manager to release any resources used by this object."""
-        self._close()
+class HashIndex(Index):
+    """A ``HashIndex`` stores a collection of (key, row) entries in buckets by a hash of the key,
+    allowing fast retrieval of rows by key, but not in key order (and hence not by key range).
+
+    Like a :class:`.BplusTree` with non-unique keys,
+    the data structure enforces that no entries sharing the same key have identical row values.
+    Compared with a :class:`.BplusTree`, looking up a key reads just the one bucket that the key hashes to,
+    instead of descending the tree from its root,
+    which makes a difference when there are many lookups (as in an index nested-loop join) or the keys are wide.
+
+    This class is implemented as a Python "context manager", like :class:`.BplusTree`.
+    Instead of constructing a ``HashIndex`` directly, consider doing so through :meth:`.StorageManager.hash_index`.
+
+    Attributes:
+        name: name of the hash index file;
+            caller is responsible for ensuring that the name is unique among all files managed by the storage manager.
+        key_type: type of the key, or a tuple of types for a composite (multiple-component) key.
+        row_type: TBD.
+    """
+
+    @abstractmethod
+    def __init__(self, tx: Transaction, name: str, key_type: KeyType, row_type: RowType):
+        """Called by implementation class to help initalize an object of that class.
+        (You shouldn't instantiate this abstract class directly.)
+        This method should not and will not open the hash index;
+        :meth:`.HashIndex._open` is used for that purpose instead.
+        """
+        self.tx: Final = tx
+        self.name: Final = name
+        self.key_type: Final = key_type
+        self.row_type: Final = row_type
         return
 
+    @abstractmethod
+    def _open(self, create_if_not_exists: bool = False) -> None:
+        """Called by the context manager method :meth:`.Index.__enter__` to ready this object
+        for managing the underlying file.
+        The implementation class should implement this method.
+        """
+        pass
+
+    @abstractmethod
+    def iter_get(self, key: Any) -> Generator[tuple, None, None]:
+        """Return a Python generator that iterates over all (key, row) entries with given ``key``."""
+        pass
+
+    @abstractmethod
+    def iter_scan(self) -> Generator[tuple, None, None]:
+        """Return a Python generator that iterates over all (key, row) entries, in no particular order."""
+        pass
+
+    @abstractmethod
+    def put(self, key: Any, row: tuple) -> None:
+        """Store the given (key, row) entry in the hash index, unless the exact same entry already exists.
+        """
+        pass
+
+    @abstractmethod
+    def bulk_load(self, entries: Iterable[tuple[Any, tuple]]) -> int:
+        """Add the given (key, row) entries to the hash index, and return the number of entries added
+        (an entry identical to an existing one is ignored and not counted).
+        Unlike :meth:`.BplusTree.bulk_load`, the order of entries does not matter.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: Any, row: tuple | None = None) -> int:
+        """ Delete the given (key, row) pair (if it exists), or,
+        if ``row`` is ``None``, all entries with the given key.
+        Return the number of entries deleted.
+        """
+        pass
+
+    @abstractmethod
+    def stat(self) -> dict:
+        """Return various statistics associated with this hash index,
+        in the same form as :meth:`.BplusTree.stat`, plus the number of buckets.
+        """
+        pass
+
+    @abstractmethod
+    def _close(self):
+        """Called by the context manager method :meth:`.Index.__exit__`
+        to release any resources used by this object to manage the underlying file.
+        The implementation class should implement this method.
+        """
+        pass
+
 class StorageManager(ABC):
     @abstractmethod
     def __init__(self):
@@ -287,9 +543,16 @@ class StorageManager(ABC):
                   tx: Transaction,
                   name: str,
                   row_type: RowType,
-                  create_if_not_exists: bool = False
+                  create_if_not_exists: bool = False,
+                  compression: str | None = None,
+                  zone_map: bool = False
     ) -> HeapFile:
         """Return a heap file, already opened for operations.
+        If ``compression`` is given, rows are stored compressed using that method,
+        which must be the same every time the file is opened;
+        an implementation may also compress all heap files in the tmp space by default.
+        If ``zone_map`` is ``True``, the file maintains a zone map for skipping chunks during scans;
+        this setting, too, must be the same every time the file is opened.
         """
         pass
 
@@ -301,7 +564,7 @@ class StorageManager(ABC):
     def bplus_tree(self,
                    tx: Transaction,
                    name: str,
-                   key_type: ValType,
+                   key_type: KeyType,
                    row_type: RowType,
                    unique: bool = False,
                    create_if_not_exists: bool = False
@@ -314,6 +577,22 @@ class StorageManager(ABC):
     def delete_bplus_tree(self, tx: Transaction, name: str) -> int:
         pass
 
+    @abstractmethod
+    def hash_index(self,
+                   tx: Transaction,
+                   name: str,
+                   key_type: KeyType,
+                   row_type: RowType,
+                   create_if_not_exists: bool = False
+    ) -> HashIndex:
+        """Return a hash index, already opened for operations.
+        """
+        pass
+
+    @abstractmethod
+    def delete_hash_index(self, tx: Transaction, name: str) -> int:
+        pass
+
     @abstractmethod
     def shutdown(self) -> None:
         pass
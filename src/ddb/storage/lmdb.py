@@ -1,151 +1,719 @@
 """This module contains the implementation of a storage manager
 based on `LMDB <https://lmdb.readthedocs.io/en/release/>`_.
 """
-from typing import Final, Generator, Iterable, Callable, Any
+from typing import cast, Final, ClassVar, Generator, Iterable, Callable, Any
 from abc import abstractmethod
+from dataclasses import dataclass
 from math import ceil
+from bisect import bisect_left
+from hashlib import blake2b
+import struct
+import threading
+import queue
 
 import lmdb # type: ignore
 
 from .. import globals
 from ..profile import profile, profile_generator, ProfileStat
-from ..primitives import ValType, RowType
+from ..primitives import ValType, RowType, KeyType
 from ..transaction import Transaction, TransactionManager
 
-from .interface import StorageMangerException, HeapFile, BplusTree, StorageManager
-from .serialize import pack_int, unpack_int, pack_str, unpack_str, pack_row, unpack_row
+from .interface import StorageMangerException, DuplicateKeyException, SnapshotChangedException, Zone, ScanPartition, HeapFile, BplusTree, HashIndex, StorageManager
+from .serialize import pack_int, unpack_int, pack_str, unpack_str, pack_row, unpack_row, RowCodec, KeyCodec, BlockCodec, HashEntryCodec, \
+    ROW_FORMATS, COMPRESSIONS
+from .memory import MemoryStorageManager
 
 class LMDBTransactionInterface(Transaction):
     """Defines the minimally required interface for a transaction object expected by :class:`LMDBStorageManager`.
     Specifically, it must have a LMDB transaction handle.
+
+    It also caches, for each heap file written by this transaction, the next row id to assign,
+    so :class:`LMDBHeapFile` does not have to seek to the end of the file for every new row.
+    The transaction manager is responsible for passing the cache on to the parent transaction upon commit,
+    and discarding it upon abort, such that cached row ids are always consistent with the file contents seen.
     """
     @abstractmethod
     def __init__(self, tm: TransactionManager, id: int, lmdb_tx: lmdb.Transaction, read_only: bool = False) -> None:
         super().__init__(tm, id, read_only = read_only)
         self.lmdb_tx: Final[lmdb.Transaction] = lmdb_tx
+        self.next_row_ids: Final[dict[str, int]] = dict()
+        """Next row id to assign in each heap file (by name) written by this transaction.
+        Row ids below it might have been assigned before, and row ids at or above it have definitely not.
+        """
+        return
+
+    def cached_next_row_id(self, name: str) -> int | None:
+        """Return the cached next row id to assign in the heap file with the given ``name``,
+        as known to this transaction or the closest enclosing transaction, or ``None`` if not cached.
+        """
+        tx: LMDBTransactionInterface | None = self
+        while tx is not None:
+            if (row_id := tx.next_row_ids.get(name)) is not None:
+                return row_id
+            tx = tx.get_parent()
+        return None
+
+class LMDBHandleRegistry:
+    """A registry of LMDB database handles opened in one LMDB environment, keyed by file key,
+    so that opening a file opened before is just a dictionary lookup instead of a call to ``open_db``.
+
+    LMDB ties a handle to the transaction that opened it until that transaction commits:
+    if it (or any enclosing transaction) aborts instead, the handle is closed automatically.
+    Hence, each handle is registered along with the transaction that opened it (its "owner"),
+    and it is only handed out to the owner and transactions nested therein.
+    Upon commit, ownership passes on to the enclosing transaction,
+    or, for a top-level transaction, the handle becomes shared by all transactions;
+    upon abort, handles owned by the transaction are dropped from the registry.
+    A handle is also dropped when its file is deleted, because LMDB closes it then.
+    The transaction manager is responsible for calling :meth:`.LMDBStorageManager.transaction_committed`
+    and :meth:`.LMDBStorageManager.transaction_aborted`, which in turn notify the registries.
+    """
+    def __init__(self, env: lmdb.Environment) -> None:
+        self.env: Final = env
+        self.handles: Final[dict[bytes, tuple[Any, LMDBTransactionInterface | None]]] = dict()
+        """Handle and owner (or ``None`` if shared by all) by file key.
+        """
+        self.owned: Final[dict[LMDBTransactionInterface, set[bytes]]] = dict()
+        """Keys of files whose handles are owned by each transaction.
+        """
+        return
+
+    def open(self, tx: LMDBTransactionInterface, file_key: bytes, dupsort: bool = False, create: bool = False) -> Any:
+        """Return a handle for the given file for use in ``tx``, opening (or creating) it as needed.
+        """
+        if (entry := self.handles.get(file_key)) is not None:
+            handle, owner = entry
+            if owner is None:
+                return handle
+            t: LMDBTransactionInterface | None = tx
+            while t is not None:
+                if t is owner:
+                    return handle
+                t = t.get_parent()
+            # owned by a transaction that tx cannot see into (unusual), so don't touch the registry:
+            return self.env.open_db(key=file_key, dupsort=dupsort, create=create, txn=tx.lmdb_tx)
+        handle = self.env.open_db(key=file_key, dupsort=dupsort, create=create, txn=tx.lmdb_tx)
+        self.handles[file_key] = (handle, tx)
+        self.owned.setdefault(tx, set()).add(file_key)
+        return handle
+
+    def evict(self, file_key: bytes) -> None:
+        """Drop the handle for the given file (if any), e.g., because the file has been deleted.
+        """
+        if (entry := self.handles.pop(file_key, None)) is not None and entry[1] is not None:
+            self.owned[entry[1]].discard(file_key)
+        return
+
+    def transaction_committed(self, tx: LMDBTransactionInterface) -> None:
+        """Pass ownership of handles opened by ``tx`` on to its enclosing transaction (if any).
+        """
+        if (file_keys := self.owned.pop(tx, None)) is None:
+            return
+        parent = tx.get_parent()
+        for file_key in file_keys:
+            self.handles[file_key] = (self.handles[file_key][0], parent)
+        if parent is not None:
+            self.owned.setdefault(parent, set()).update(file_keys)
+        return
+
+    def transaction_aborted(self, tx: LMDBTransactionInterface) -> None:
+        """Drop handles opened by ``tx``, which LMDB has closed.
+        """
+        for file_key in self.owned.pop(tx, set()):
+            del self.handles[file_key]
+        return
+
+    def is_shared(self, file_key: bytes) -> bool:
+        """Check if the handle for the given file is shared by all transactions,
+        i.e., it can be used in a transaction other than the ones that opened it.
+        """
+        return (entry := self.handles.get(file_key)) is not None and entry[1] is None
+
+class LMDBPrefetcher:
+    """Reads ahead of a sequential scan on a background thread,
+    so that pages of the LMDB memory map not yet in memory are fetched while the scan
+    (and the operators consuming its rows) work on rows already read.
+
+    LMDB does not allow a transaction to be used by two threads at the same time,
+    so the thread walks the database with its own cursor in a separate read-only transaction,
+    reading every entry (which pages it in) but decoding nothing.
+    The scan itself still reads all rows through its own transaction, so it returns exactly what that transaction sees;
+    the thread sees the last committed snapshot, whose pages are the same except for those modified since.
+    To bound the read-ahead, the thread puts a token into a bounded queue for each block's worth of entries it reads,
+    and the scan takes one out for each block's worth it consumes (see :meth:`.advance`),
+    so the thread waits once it is ``num_blocks`` blocks ahead.
+    Prefetching is best effort: the thread quietly stops upon any LMDB error.
+    """
+    def __init__(self, env: lmdb.Environment, handle: Any, key_lower: bytes | None, num_blocks: int) -> None:
+        """Start prefetching entries of the database with ``handle`` in ``env``,
+        starting from ``key_lower`` (or the first key if ``None``).
+        """
+        self.env: Final = env
+        self.handle: Final = handle
+        self.key_lower: Final = key_lower
+        self.tokens: Final[queue.Queue[None]] = queue.Queue(maxsize=num_blocks)
+        self.stopped: Final = threading.Event()
+        self.num_bytes_consumed = 0
+        self.thread: Final = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return
+
+    @classmethod
+    def start(cls, registry: LMDBHandleRegistry, file_key: bytes, handle: Any,
+              key_lower: bytes | None, num_blocks: int) -> 'LMDBPrefetcher | None':
+        """Start prefetching for a scan of the given file (whose handle is in ``registry``),
+        or return ``None`` if prefetching is not requested (``num_blocks`` is not positive)
+        or not possible (the file's handle is not yet usable by other transactions, e.g., if it was just created).
+        """
+        if num_blocks <= 0 or not registry.is_shared(file_key):
+            return None
+        return cls(registry.env, handle, key_lower, num_blocks)
+
+    def _run(self) -> None:
+        try:
+            with self.env.begin(write=False) as txn, txn.cursor(db=self.handle) as cursor:
+                if not (cursor.first() if self.key_lower is None else cursor.set_range(self.key_lower)):
+                    return
+                num_bytes = 0
+                for k, v in cursor:
+                    if self.stopped.is_set():
+                        return
+                    num_bytes += len(k) + len(v)
+                    if num_bytes >= globals.BLOCK_SIZE:
+                        self.tokens.put(None) # wait if too far ahead
+                        num_bytes = 0
+        except lmdb.Error:
+            pass
+        return
+
+    def advance(self, num_bytes: int) -> None:
+        """Let the thread know that the scan has consumed entries totaling ``num_bytes`` more bytes.
+        """
+        self.num_bytes_consumed += num_bytes
+        while self.num_bytes_consumed >= globals.BLOCK_SIZE:
+            self.num_bytes_consumed -= globals.BLOCK_SIZE
+            try:
+                self.tokens.get_nowait()
+            except queue.Empty: # the thread is not ahead (anymore)
+                break
+        return
+
+    def stop(self) -> None:
+        """Stop the thread and wait for it to finish.
+        """
+        self.stopped.set()
+        # the thread checks stopped before reading each entry, so it puts at most one more token;
+        # make room for that one in case the queue is full:
+        try:
+            self.tokens.get_nowait()
+        except queue.Empty:
+            pass
+        self.thread.join()
+        return
+
+@dataclass(frozen=True)
+class LMDBScanPartition(ScanPartition):
+    """A range of keys in an LMDB database (a heap file or a B+tree in the main environment),
+    to be scanned by another process in a read-only transaction of its own.
+    That transaction must see the same snapshot as the one that created this object,
+    which is checked by comparing LMDB transaction ids.
+
+    LMDB does not allow one process to open the same environment twice,
+    so :meth:`.iter_scan_batches` must be called in a process other than the one with the :class:`.LMDBStorageManager`,
+    where the environment is opened read-only (once per process).
+    """
+    location: str
+    """Location of the LMDB environment.
+    """
+    file_key: bytes
+    """Key of the LMDB database for the file.
+    """
+    snapshot_id: int
+    """Id of the last committed LMDB transaction, whose snapshot is to be scanned.
+    """
+    key_lower: bytes | None
+    """Packed key to start from (inclusive), or ``None`` to start from the first one.
+    """
+    key_upper: bytes | None
+    """Packed key to stop before (exclusive), or ``None`` to go until the last one.
+    """
+    row_type: tuple[ValType, ...]
+    row_format: str
+    key_type: KeyType | None
+    """Type of B+tree keys, or ``None`` for a heap file.
+    """
+    return_row_id: bool = False
+    """For a heap file, whether to return row ids along with rows.
+    """
+
+    envs: ClassVar[dict[str, lmdb.Environment]] = dict()
+    """Environments opened read-only in this process, by location.
+    """
+
+    @staticmethod
+    def split_key_range(first: bytes, last: bytes, num_parts: int) -> list[bytes]:
+        """Return up to ``num_parts - 1`` increasing keys that split the range between ``first`` and ``last`` into parts.
+        Without knowing how keys are distributed, we interpolate between the two,
+        treating the bytes following their common prefix as an unsigned integer.
+        """
+        prefix_len = 0
+        while prefix_len < min(len(first), len(last)) and first[prefix_len] == last[prefix_len]:
+            prefix_len += 1
+        prefix = first[:prefix_len]
+        lo = int.from_bytes(first[prefix_len:prefix_len+8].ljust(8, b'\0'), 'big')
+        hi = int.from_bytes(last[prefix_len:prefix_len+8].ljust(8, b'\0'), 'big')
+        bounds: list[bytes] = list()
+        for i in range(1, num_parts):
+            bound = prefix + (lo + (hi - lo) * i // num_parts).to_bytes(8, 'big')
+            if first < bound <= last and (len(bounds) == 0 or bounds[-1] < bound):
+                bounds.append(bound)
+        return bounds
+
+    @classmethod
+    def make_partitions(cls, storage_manager: 'LMDBStorageManager', tx: LMDBTransactionInterface,
+                        file_key: bytes, handle: Any, num_partitions: int, **kwargs) -> list[ScanPartition]:
+        """Divide the given database into at most ``num_partitions`` parts as seen by ``tx``,
+        with ``kwargs`` supplying the remaining fields of each part.
+        """
+        with tx.lmdb_tx.cursor(db=handle) as cursor:
+            if not cursor.first():
+                return list()
+            first = bytes(cursor.key())
+            cursor.last()
+            last = bytes(cursor.key())
+        # a write transaction gets the id following that of the last committed one:
+        snapshot_id = tx.lmdb_tx.id() - (0 if tx.read_only else 1)
+        bounds: list[bytes | None] = [None, *cls.split_key_range(first, last, num_partitions), None]
+        return [ cls(storage_manager.location, file_key, snapshot_id, key_lower, key_upper, **kwargs)
+                 for key_lower, key_upper in zip(bounds[:-1], bounds[1:]) ]
+
+    def iter_scan_batches(self, num_blocks: int = 1) -> Generator[list[tuple], None, None]:
+        if (env := type(self).envs.get(self.location)) is None:
+            env = lmdb.open(self.location, readonly=True, max_dbs=globals.MAX_FILES)
+            type(self).envs[self.location] = env
+        unpack_row = RowCodec.for_row_type(self.row_type, self.row_format).unpack
+        unpack_key = unpack_int if self.key_type is None else LMDBBplusTree.key_codec(self.key_type)[1]
+        max_bytes = num_blocks * globals.BLOCK_SIZE
+        batch: list[tuple] = list()
+        num_bytes = 0
+        with env.begin(write=False) as txn:
+            if txn.id() != self.snapshot_id:
+                raise SnapshotChangedException('database changed before it could be scanned in parallel')
+            handle = env.open_db(key=self.file_key, txn=txn, create=False)
+            with txn.cursor(db=handle) as cursor:
+                if not (cursor.first() if self.key_lower is None else cursor.set_range(self.key_lower)):
+                    return
+                for k, v in cursor:
+                    if self.key_upper is not None and k >= self.key_upper:
+                        break
+                    if self.key_type is not None:
+                        batch.append((unpack_key(k), unpack_row(v)))
+                    elif self.return_row_id:
+                        batch.append((unpack_key(k), *(unpack_row(v))))
+                    else:
+                        batch.append(unpack_row(v))
+                    num_bytes += len(k) + len(v)
+                    if num_bytes >= max_bytes:
+                        yield batch
+                        batch = list()
+                        num_bytes = 0
+        if len(batch) > 0:
+            yield batch
+        return
+
+class LMDBAccessCounts:
+    """Running counts of accesses made by an LMDB-based file object (including those to its zone map, if any),
+    from which :class:`LMDBPageProfileStat` derives the number of LMDB pages touched by each profiled call.
+    Sizes count keys and values only, not their overhead on a page.
+    """
+    def __init__(self) -> None:
+        self.num_seeks = 0
+        """Number of times a cursor is positioned by key (or at either end of the file), descending from the root.
+        """
+        self.num_entries_read = 0
+        self.num_bytes_read = 0
+        self.num_entries_written = 0
+        """Number of entries written or deleted.
+        """
+        self.num_bytes_written = 0
+        self.geometry: tuple[int, int] | None = None
+        """Page size and tree depth of the file, as last reported by ``stat()`` (``None`` if unknown or outdated).
+        """
+        return
+
+    def snapshot(self) -> tuple[int, int, int, int, int]:
+        return self.num_seeks, self.num_entries_read, self.num_bytes_read,\
+            self.num_entries_written, self.num_bytes_written
+
+class LMDBPageProfileStat(ProfileStat):
+    """Profile collector for methods of LMDB-based files, which counts the LMDB pages touched by each call.
+    See also :mod:`.profile`.
+
+    LMDB's Python binding does not expose the pages that a cursor visits,
+    so each file object keeps running :class:`LMDBAccessCounts`,
+    and the collector turns their increase over the call into pages:
+    every positioning of a cursor descends through ``depth - 1`` branch pages,
+    and the entries read (or written) are packed into leaf pages of the environment's page size,
+    each taking up its key, its value, and ``NODE_OVERHEAD`` bytes,
+    so that a scan counts each leaf page once instead of once per entry.
+    The page size and depth come from ``stat()``, which is called once per file object
+    (and again after each call that writes), instead of once per call.
+    With profiling off, no collector is constructed and ``stat()`` is never called.
+    Note that ``num_blocks_read`` and ``num_blocks_written`` are sensible only after :meth:`.finalize()`,
+    and not during the iteration.
+    """
+    METHOD_NAMES: tuple[str, ...] = ()
+    """Names of methods whose I/O stats are available.
+    """
+    PAGE_HEADER_SIZE: Final = 16
+    NODE_OVERHEAD: Final = 10 # node header and its offset in the page
+
+    def __init__(self, method: Callable, obj: 'LMDBHeapFile | LMDBBplusTree | LMDBHashIndex', caller: ProfileStat | None,
+                 *call_args, **call_kw):
+        super().__init__(method, obj, caller, *call_args, **call_kw)
+        if method.__name__ not in self.METHOD_NAMES:
+            raise NotImplementedError(f'I/O stats for {method.__qualname__} not available')
+        self.obj: Final = obj
+        self._counts: Final = obj.access_counts.snapshot()
+        if obj.access_counts.geometry is None:
+            stat = obj.stat()
+            obj.access_counts.geometry = (stat['psize'], stat['depth'])
+        return
+
+    def finalize(self, result: Any) -> None:
+        super().finalize(result)
+        counts = self.obj.access_counts
+        num_seeks, num_entries_read, num_bytes_read, num_entries_written, num_bytes_written =\
+            (after - before for after, before in zip(counts.snapshot(), self._counts))
+        psize, depth = cast(tuple[int, int], counts.geometry)
+        page_capacity = psize - self.PAGE_HEADER_SIZE
+        if num_seeks > 0 and depth > 0:
+            num_leaves = ceil((num_bytes_read + num_entries_read * self.NODE_OVERHEAD) / page_capacity)
+            self.num_blocks_read += num_seeks * (depth - 1) + max(num_seeks, num_leaves)
+        if num_entries_written > 0:
+            self.num_blocks_written += max(1, ceil(
+                (num_bytes_written + num_entries_written * self.NODE_OVERHEAD) / page_capacity))
+            counts.geometry = None # depth may have changed
         return
 
 class LMDBHeapFile(HeapFile):
     """LMDB-based heap file implementation.
+
+    If the storage manager is in ``zero_copy`` mode, keys and values read through the LMDB transaction
+    are buffers pointing directly into LMDB's memory map instead of ``bytes`` copies.
+    Such a buffer is valid only until the next cursor move or write in the transaction,
+    so every method here decodes it into Python objects (which do not reference the buffer) right away,
+    before yielding or returning anything to the caller.
+
+    If opened with ``zone_map``, the file keeps a :class:`.Zone` for each chunk of ``globals.ZONE_MAP_CHUNK_SIZE``
+    consecutive row ids in a separate LMDB database (keyed by chunk number),
+    and writes through this class keep it up to date.
     """
 
-    class MyProfileStat(ProfileStat):
+    class MyProfileStat(LMDBPageProfileStat):
         """Customized profile collector for some :class:`LMDBHeapFile` methods.
-        See also :mod:`.profile`.
-
-        Note: counting block I/O is tricky because LMDB does not expose that to us.
-        Instead, we make our best guestimate based on the number of rows accessed.
-        Hence, the values of ``num_blocks_read`` and ``num_blocks_written`` are sensible only after :meth:`.finalize()`,
-        and not during the iteration.
-        """
-        def __init__(self, method: Callable, obj: 'LMDBHeapFile', caller: ProfileStat | None,
-                     *call_args, **call_kw):
-            super().__init__(method, obj, caller, *call_args, **call_kw)
-            self.obj: Final = obj
-            self._method_name: Final = method.__name__
-            if self._method_name not in ('get', 'iter_scan', 'put', 'batch_append', 'delete'):
-                raise NotImplementedError(f'I/O stats for {method.__qualname__} not available')
-            self._stat = obj.stat()
-            # account for the initial lookup:
-            self.num_blocks_read += self._stat['depth']
-            return
-
-        def _estimate_blocks(self, num_entries: int) -> int:
-            if self._stat['leaf_pages'] == 0 or self._stat['entries'] == 0:
-                self._stat = self.obj.stat() # force refresh stats
-            stat = self._stat
-            # use total number of leaves and entries to come up with a guestimate:
-            # WARNING: we cannot set LMDB block size, but we can "pretend" leaves use our own block size:
-            leaves = ceil(stat['leaf_pages'] * stat['psize'] / globals.BLOCK_SIZE)
-            if leaves == 0:
-                return 0
-            entries_per_block = ceil(float(stat['entries']) / leaves)
-            if entries_per_block == 0: # no entries
-                return 0
-            return ceil(float(num_entries) / entries_per_block)
-
-        def finalize(self, result: Any) -> None:
-            super().finalize(result)
-            if self._method_name in ('iter_scan'):
-                self.num_blocks_read += self._estimate_blocks(self.num_next_calls)
-                if self.num_blocks_read > 1:
-                    self.num_blocks_read -= 1 # because we included the first leaf in the initial lookup cost
-            elif self._method_name == 'put':
-                self.num_blocks_written = 1
-            elif self._method_name == 'delete' and result > 0: # result is number of records deleted
-                self.num_blocks_written = 1
-            elif self._method_name == 'batch_append': # result[1] is number of records appended
-                self.num_blocks_written = self._estimate_blocks(result[1])
-            return
+        """
+        METHOD_NAMES = ('get', 'iter_scan', 'iter_scan_batches', 'put', 'batch_append', 'delete')
 
-    def __init__(self, storage_manager: 'LMDBStorageManager', tx: LMDBTransactionInterface, name: str, row_type: RowType) -> None:
+    def __init__(self, storage_manager: 'LMDBStorageManager', tx: LMDBTransactionInterface, name: str, row_type: RowType,
+                 zone_map: bool = False) -> None:
         super().__init__(tx, name, row_type)
         self.storage_manager: Final = storage_manager
+        self.tx_interface: Final = tx
+        """Same as ``tx``, but typed as what the storage manager requires of it.
+        """
         self.lmdb_tx: Final = tx.lmdb_tx
         self.lmdb_handle = None
+        self.row_codec: Final = RowCodec.for_row_type(tuple(row_type), storage_manager.row_format)
+        self.zone_map: Final = zone_map
+        self.zone_handle = None
+        self.access_counts: Final = LMDBAccessCounts()
         return
 
+    @staticmethod
+    def zone_map_file_key(name: str) -> bytes:
+        """Return the key of the LMDB database holding the zone map for the heap file with the given ``name``.
+        """
+        return pack_str(f'${Zone.__qualname__}.{name}')
+
+    def _file_key(self) -> bytes:
+        return pack_str(f'${self.__class__.__qualname__}.{self.name}')
+
     def _open(self, create_if_not_exists: bool = False) -> None:
         if self.lmdb_handle is None:
-            file_key = pack_str(f'${self.__class__.__qualname__}.{self.name}')
-            self.lmdb_handle = (self.storage_manager.tmp_env if self.tx.is_tmp() else self.storage_manager.env)\
-                .open_db(key=file_key, create=create_if_not_exists, txn=self.lmdb_tx)
+            self.lmdb_handle = self.storage_manager.handle_registry(self.tx)\
+                .open(self.tx_interface, self._file_key(), create=create_if_not_exists)
+        if self.zone_map and self.zone_handle is None:
+            self.zone_handle = self.storage_manager.handle_registry(self.tx)\
+                .open(self.tx_interface, type(self).zone_map_file_key(self.name), create=create_if_not_exists)
         return
 
+    def _update_zones(self, changes: Iterable[tuple[int, tuple | None, tuple | None]]) -> None:
+        """Bring the zone map up to date with the given changes to rows,
+        each specified by a triple of row id, old row (``None`` if new), and new row (``None`` if deleted).
+        """
+        chunk_size = globals.ZONE_MAP_CHUNK_SIZE
+        counts = self.access_counts
+        zones: dict[int, list] = dict() # chunk -> [num_rows, mins, maxs, null_counts], with lists for the latter three
+        for row_id, old_row, new_row in changes:
+            chunk = row_id // chunk_size
+            if (zone := zones.get(chunk)) is None:
+                counts.num_seeks += 1
+                if (v := self.lmdb_tx.get(pack_int(chunk), db=self.zone_handle)) is not None:
+                    counts.num_entries_read += 1
+                    counts.num_bytes_read += len(v)
+                    num_rows, mins, maxs, null_counts = unpack_row(v)
+                    zone = [num_rows, list(mins), list(maxs), list(null_counts)]
+                else:
+                    num_columns = len(old_row if new_row is None else new_row) # type: ignore
+                    zone = [0, [None] * num_columns, [None] * num_columns, [0] * num_columns]
+                zones[chunk] = zone
+            _, mins, maxs, null_counts = zone
+            if old_row is not None:
+                zone[0] -= 1
+                for i, val in enumerate(old_row):
+                    if val is None:
+                        null_counts[i] -= 1
+            if new_row is not None:
+                zone[0] += 1
+                for i, val in enumerate(new_row):
+                    if val is None:
+                        null_counts[i] += 1
+                    elif mins[i] is None:
+                        mins[i] = maxs[i] = val
+                    elif val < mins[i]:
+                        mins[i] = val
+                    elif val > maxs[i]:
+                        maxs[i] = val
+        for chunk, (num_rows, mins, maxs, null_counts) in zones.items():
+            counts.num_entries_written += 1
+            if num_rows > 0:
+                v = pack_row((num_rows, tuple(mins), tuple(maxs), tuple(null_counts)))
+                counts.num_bytes_written += len(v)
+                self.lmdb_tx.put(pack_int(chunk), v, db=self.zone_handle)
+            else:
+                self.lmdb_tx.delete(pack_int(chunk), db=self.zone_handle)
+        return
+
+    def _zone_ranges(self, zone_filter: Callable[[Zone], bool]) -> list[tuple[int, int]]:
+        """Return the ranges of row ids (each as an inclusive lower bound and exclusive upper bound, in order)
+        covering chunks whose zones pass ``zone_filter``, with adjacent chunks merged into one range.
+        """
+        chunk_size = globals.ZONE_MAP_CHUNK_SIZE
+        counts = self.access_counts
+        ranges: list[tuple[int, int]] = list()
+        counts.num_seeks += 1
+        with self.lmdb_tx.cursor(db=self.zone_handle) as cursor:
+            for k, v in cursor:
+                counts.num_entries_read += 1
+                counts.num_bytes_read += len(k) + len(v)
+                if not zone_filter(Zone(*unpack_row(v))):
+                    continue
+                lower = unpack_int(k) * chunk_size
+                if len(ranges) > 0 and ranges[-1][1] == lower:
+                    ranges[-1] = (ranges[-1][0], lower + chunk_size)
+                else:
+                    ranges.append((lower, lower + chunk_size))
+        return ranges
+
     def stat(self) -> dict:
         return self.lmdb_tx.stat(self.lmdb_handle)
 
+    def scan_partitions(self, num_partitions: int, return_row_id: bool = False) -> list[ScanPartition] | None:
+        if self.tx.is_tmp():
+            return None
+        return LMDBScanPartition.make_partitions(self.storage_manager, self.tx_interface, self._file_key(), self.lmdb_handle, num_partitions,
+                                                 row_type=tuple(self.row_type), row_format=self.storage_manager.row_format,
+                                                 key_type=None, return_row_id=return_row_id)
+
     @profile(MyProfileStat)
     def get(self, row_id: int) -> tuple | None:
+        self.access_counts.num_seeks += 1
         bytes = self.lmdb_tx.get(pack_int(row_id), db=self.lmdb_handle)
-        return unpack_row(bytes) if bytes is not None else None
+        if bytes is None:
+            return None
+        self.access_counts.num_entries_read += 1
+        self.access_counts.num_bytes_read += len(bytes)
+        return self.row_codec.unpack(bytes)
 
     @profile_generator(MyProfileStat)
     def iter_scan(self, return_row_id: bool = False) -> Generator[tuple, None, None]:
+        unpack_row = self.row_codec.unpack
+        counts = self.access_counts
+        counts.num_seeks += 1
         with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
             for k, v in cursor:
+                counts.num_entries_read += 1
+                counts.num_bytes_read += len(k) + len(v)
                 if return_row_id:
                     yield unpack_int(k), *(unpack_row(v))
                 else:
                     yield unpack_row(v)
         return
 
-    @profile(MyProfileStat)
-    def put(self, row: tuple, row_id: int | None = None) -> int:
+    @profile_generator(MyProfileStat)
+    def iter_scan_batches(self, return_row_id: bool = False, num_blocks: int = 1,
+                          zone_filter: Callable[[Zone], bool] | None = None,
+                          prefetch_blocks: int = 0) -> Generator[list[tuple], None, None]:
+        if zone_filter is not None and self.zone_map:
+            for row_id_lower, row_id_upper in self._zone_ranges(zone_filter):
+                yield from self._iter_scan_range_batches(row_id_lower, row_id_upper, return_row_id, num_blocks)
+            return
+        unpack_row = self.row_codec.unpack
+        counts = self.access_counts
+        max_bytes = num_blocks * globals.BLOCK_SIZE
+        batch: list[tuple] = list()
+        num_bytes = 0
+        counts.num_seeks += 1
+        prefetcher = LMDBPrefetcher.start(self.storage_manager.handle_registry(self.tx), self._file_key(),
+                                          self.lmdb_handle, None, prefetch_blocks)
+        try:
+            with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+                for k, v in cursor:
+                    if return_row_id:
+                        batch.append((unpack_int(k), *(unpack_row(v))))
+                    else:
+                        batch.append(unpack_row(v))
+                    num_bytes += len(k) + len(v)
+                    if num_bytes >= max_bytes:
+                        counts.num_entries_read += len(batch)
+                        counts.num_bytes_read += num_bytes
+                        if prefetcher is not None:
+                            prefetcher.advance(num_bytes)
+                        yield batch
+                        batch = list()
+                        num_bytes = 0
+        finally:
+            if prefetcher is not None:
+                prefetcher.stop()
+        if len(batch) > 0:
+            counts.num_entries_read += len(batch)
+            counts.num_bytes_read += num_bytes
+            yield batch
+        return
+
+    def _iter_scan_range_batches(self, row_id_lower: int, row_id_upper: int,
+                                 return_row_id: bool, num_blocks: int) -> Generator[list[tuple], None, None]:
+        """A helper for :meth:`.iter_scan_batches` that scans only rows whose ids are in the given range
+        (with an inclusive lower bound and exclusive upper bound).
+        """
+        unpack_row = self.row_codec.unpack
+        counts = self.access_counts
+        max_bytes = num_blocks * globals.BLOCK_SIZE
+        batch: list[tuple] = list()
+        num_bytes = 0
+        counts.num_seeks += 1
+        with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+            if cursor.set_range(pack_int(row_id_lower)):
+                for k, v in cursor:
+                    row_id = unpack_int(k)
+                    if row_id >= row_id_upper:
+                        break
+                    if return_row_id:
+                        batch.append((row_id, *(unpack_row(v))))
+                    else:
+                        batch.append(unpack_row(v))
+                    num_bytes += len(k) + len(v)
+                    if num_bytes >= max_bytes:
+                        counts.num_entries_read += len(batch)
+                        counts.num_bytes_read += num_bytes
+                        yield batch
+                        batch = list()
+                        num_bytes = 0
+        if len(batch) > 0:
+            counts.num_entries_read += len(batch)
+            counts.num_bytes_read += num_bytes
+            yield batch
+        return
+
+    def _next_row_id(self) -> int:
+        """Return the next row id to assign,
+        using the transaction's cache if possible or otherwise seeking to the end of the file.
+        """
+        row_id = self.tx_interface.cached_next_row_id(self.name)
         if row_id is None:
+            self.access_counts.num_seeks += 1
             with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
                 if cursor.last():
                     row_id = unpack_int(cursor.key()) + 1
                 else: # file is empty
                     row_id = 0
-        self.lmdb_tx.put(pack_int(row_id), pack_row(row), db=self.lmdb_handle)
+        return row_id
+
+    def _set_next_row_id(self, row_id: int) -> None:
+        """Remember in the transaction's cache the next row id to assign.
+        """
+        self.tx_interface.next_row_ids[self.name] = row_id
+        return
+
+    @profile(MyProfileStat)
+    def put(self, row: tuple, row_id: int | None = None) -> int:
+        if row_id is None:
+            row_id = self._next_row_id()
+            self._set_next_row_id(row_id + 1)
+        elif (next_row_id := self.tx_interface.cached_next_row_id(self.name)) is not None\
+            and row_id >= next_row_id:
+            self._set_next_row_id(row_id + 1)
+        counts = self.access_counts
+        counts.num_seeks += 1
+        k, v = pack_int(row_id), self.row_codec.pack(row)
+        counts.num_entries_written += 1
+        counts.num_bytes_written += len(k) + len(v)
+        if self.zone_map:
+            old_row = None if (v_old := self.lmdb_tx.get(k, db=self.lmdb_handle)) is None\
+                else self.row_codec.unpack(v_old)
+            self.lmdb_tx.put(k, v, db=self.lmdb_handle)
+            self._update_zones(((row_id, old_row, row), ))
+        else:
+            self.lmdb_tx.put(k, v, db=self.lmdb_handle)
         return row_id
 
     @profile(MyProfileStat)
     def batch_append(self, rows: Iterable[tuple]) -> tuple[int, int]:
+        pack_row = self.row_codec.pack
+        if self.zone_map:
+            rows = list(rows)
+        row_id_start = self._next_row_id()
+        row_id = row_id_start
+        num_bytes = 0
+        self.access_counts.num_seeks += 1
         with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
-            if cursor.last():
-                row_id_start = unpack_int(cursor.key()) + 1
-            else: # file is empty
-                row_id_start = 0
-            row_id = row_id_start
             for row in rows:
-                assert cursor.put(pack_int(row_id), pack_row(row), append=True)
+                k, v = pack_int(row_id), pack_row(row)
+                assert cursor.put(k, v, append=True)
+                num_bytes += len(k) + len(v)
                 row_id += 1
-            return row_id_start, row_id - row_id_start
+        self.access_counts.num_entries_written += row_id - row_id_start
+        self.access_counts.num_bytes_written += num_bytes
+        self._set_next_row_id(row_id)
+        if self.zone_map:
+            self._update_zones((row_id_start + i, None, row) for i, row in enumerate(rows))
+        return row_id_start, row_id - row_id_start
 
     def truncate(self) -> int:
         num_entries: int = self.stat()['entries']
         if num_entries > 0:
-            # quickest way to truncate is to drop and recreate:
-            self.lmdb_tx.drop(self.lmdb_handle, delete=True)
-            self._close()
-            self._open(create_if_not_exists=True)
+            # empty it but keep the database (and its handle), so a file reused over and over is not reopened each time:
+            self.lmdb_tx.drop(self.lmdb_handle, delete=False)
+            self.access_counts.geometry = None
+        if self.zone_map:
+            self.lmdb_tx.drop(self.zone_handle, delete=False) # just empty it
+        self._set_next_row_id(0)
         return num_entries
 
     @profile(MyProfileStat)
     def delete(self, row_id: int) -> int:
+        self.access_counts.num_seeks += 1
+        if self.zone_map:
+            if (v := self.lmdb_tx.get(pack_int(row_id), db=self.lmdb_handle)) is None:
+                return 0
+            old_row = self.row_codec.unpack(v)
+            self.lmdb_tx.delete(pack_int(row_id), db=self.lmdb_handle)
+            self.access_counts.num_entries_written += 1
+            self._update_zones(((row_id, old_row, None), ))
+            return 1
         if self.lmdb_tx.delete(pack_int(row_id), db=self.lmdb_handle) > 0:
+            self.access_counts.num_entries_written += 1
             return 1
         else:
             return 0
@@ -155,137 +723,447 @@ class LMDBHeapFile(HeapFile):
         to close lmdb file handles in API (underlying lmdb actually reuse handles
         across transactions, so there is a possibility of inadvertently
         closing handles while they are still used by others).
-        However, leaving all handles around is known to cause performance issues.
-        There isn't much we could do here for now, but we will keep an eye on it.
+        Instead, we leave the handle in the :class:`.LMDBHandleRegistry` for the next time this file is opened.
         """
         self.lmdb_handle = None
+        self.zone_handle = None
         return
 
-class LMDBBplusTree(BplusTree):
-    """LMDB-based B+tree implementation.
+class LMDBCompressedHeapFile(LMDBHeapFile):
+    """LMDB-based heap file implementation that stores rows in compressed blocks.
+
+    Consecutive rows (together with their row ids) are grouped into blocks of about ``globals.BLOCK_SIZE`` bytes
+    before compression, and each block is packed by a :class:`.serialize.BlockCodec` into a single LMDB value,
+    keyed by the highest row id that the block covers;
+    a block covers all row ids above the key of the preceding block, up to its own key.
+    A scan decompresses one block at a time;
+    getting, putting, or deleting a single row requires decompressing (and rewriting) the block covering it.
+    Hence, this implementation is best suited for rows written by :meth:`.batch_append` and read by scans,
+    such as runs of external sorting and partitions of hash joins.
+    A file must always be opened with the same compression method, as LMDB does not record it.
     """
 
-    class MyProfileStat(ProfileStat):
-        """Customized profile collector for some :class:`LMDBBplusTree` methods.
-        See also :mod:`.profile`.
-
-        Note: counting block I/O is tricky because LMDB does not expose that to us.
-        Instead, we make our best guestimate based on the number of rows accessed.
-        Hence, the values of ``num_blocks_read`` and ``num_blocks_written`` are sensible only after :meth:`.finalize()`,
-        and not during the iteration.
-        """
-        def __init__(self, method: Callable, obj: 'LMDBBplusTree', caller: ProfileStat | None,
-                     *call_args, **call_kw):
-            super().__init__(method, obj, caller, *call_args, **call_kw)
-            self.obj: Final = obj
-            self._method_name: Final = method.__name__
-            if self._method_name not in ('get_one', 'iter_get', 'iter_scan', 'put', 'delete'):
-                raise NotImplementedError(f'I/O stats for {method.__qualname__} not available')
-            self._stat = obj.stat()
-            # account for the initial lookup:
-            self.num_blocks_read += self._stat['depth']
+    def __init__(self, storage_manager: 'LMDBStorageManager', tx: LMDBTransactionInterface, name: str, row_type: RowType,
+                 compression: str, zone_map: bool = False) -> None:
+        super().__init__(storage_manager, tx, name, row_type, zone_map=zone_map)
+        self.block_codec: Final = BlockCodec.for_compression(compression)
+        return
+
+    def _read_block(self, value: bytes | memoryview) -> list[tuple[int, bytes]]:
+        """Decode a block read from LMDB into its (row id, packed row) entries.
+        """
+        self.access_counts.num_entries_read += 1
+        self.access_counts.num_bytes_read += len(value)
+        return self.block_codec.unpack(value)
+
+    def _write_block(self, cursor: lmdb.Cursor, entries: list[tuple[int, bytes]],
+                     key: bytes | None = None, append: bool = False) -> None:
+        """Encode the given (row id, packed row) entries as a block and write it through ``cursor``,
+        keyed by ``key`` if given or otherwise by the last row id among the entries.
+        """
+        if key is None:
+            key = pack_int(entries[-1][0])
+        value = self.block_codec.pack(entries)
+        self.access_counts.num_entries_written += 1
+        self.access_counts.num_bytes_written += len(key) + len(value)
+        cursor.put(key, value, append=append)
+        return
+
+    def scan_partitions(self, num_partitions: int, return_row_id: bool = False) -> list[ScanPartition] | None:
+        return None # parts would need to decode compressed blocks
+
+    @profile(LMDBHeapFile.MyProfileStat)
+    def get(self, row_id: int) -> tuple | None:
+        self.access_counts.num_seeks += 1
+        with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+            if not cursor.set_range(pack_int(row_id)):
+                return None
+            entries = self._read_block(cursor.value())
+        i = bisect_left(entries, row_id, key=lambda entry: entry[0])
+        if i < len(entries) and entries[i][0] == row_id:
+            return self.row_codec.unpack(entries[i][1])
+        return None
+
+    @profile_generator(LMDBHeapFile.MyProfileStat)
+    def iter_scan(self, return_row_id: bool = False) -> Generator[tuple, None, None]:
+        unpack_row = self.row_codec.unpack
+        self.access_counts.num_seeks += 1
+        with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+            for v in cursor.iternext(keys=False, values=True):
+                for row_id, row in self._read_block(v):
+                    if return_row_id:
+                        yield row_id, *(unpack_row(row))
+                    else:
+                        yield unpack_row(row)
+        return
+
+    @profile_generator(LMDBHeapFile.MyProfileStat)
+    def iter_scan_batches(self, return_row_id: bool = False, num_blocks: int = 1,
+                          zone_filter: Callable[[Zone], bool] | None = None,
+                          prefetch_blocks: int = 0) -> Generator[list[tuple], None, None]:
+        if zone_filter is not None and self.zone_map:
+            for row_id_lower, row_id_upper in self._zone_ranges(zone_filter):
+                yield from self._iter_scan_range_batches(row_id_lower, row_id_upper, return_row_id, num_blocks)
             return
+        unpack_row = self.row_codec.unpack
+        batch: list[tuple] = list()
+        num_blocks_buffered = 0
+        self.access_counts.num_seeks += 1
+        prefetcher = LMDBPrefetcher.start(self.storage_manager.handle_registry(self.tx), self._file_key(),
+                                          self.lmdb_handle, None, prefetch_blocks)
+        try:
+            with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+                for v in cursor.iternext(keys=False, values=True):
+                    entries = self._read_block(v)
+                    if return_row_id:
+                        batch.extend((row_id, *(unpack_row(row))) for row_id, row in entries)
+                    else:
+                        batch.extend(unpack_row(row) for _, row in entries)
+                    num_blocks_buffered += 1
+                    if num_blocks_buffered >= num_blocks:
+                        if prefetcher is not None:
+                            prefetcher.advance(num_blocks_buffered * globals.BLOCK_SIZE)
+                        yield batch
+                        batch = list()
+                        num_blocks_buffered = 0
+        finally:
+            if prefetcher is not None:
+                prefetcher.stop()
+        if len(batch) > 0:
+            yield batch
+        return
+
+    def _iter_scan_range_batches(self, row_id_lower: int, row_id_upper: int,
+                                 return_row_id: bool, num_blocks: int) -> Generator[list[tuple], None, None]:
+        unpack_row = self.row_codec.unpack
+        batch: list[tuple] = list()
+        num_blocks_buffered = 0
+        self.access_counts.num_seeks += 1
+        with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+            if cursor.set_range(pack_int(row_id_lower)): # first block that may cover the range
+                for k, v in cursor:
+                    entries = self._read_block(v)
+                    last_block = unpack_int(k) >= row_id_upper - 1
+                    entries = [ (row_id, row) for row_id, row in entries if row_id_lower <= row_id < row_id_upper ]
+                    if return_row_id:
+                        batch.extend((row_id, *(unpack_row(row))) for row_id, row in entries)
+                    else:
+                        batch.extend(unpack_row(row) for _, row in entries)
+                    num_blocks_buffered += 1
+                    if last_block:
+                        break
+                    if num_blocks_buffered >= num_blocks:
+                        yield batch
+                        batch = list()
+                        num_blocks_buffered = 0
+        if len(batch) > 0:
+            yield batch
+        return
+
+    @profile(LMDBHeapFile.MyProfileStat)
+    def put(self, row: tuple, row_id: int | None = None) -> int:
+        if row_id is None:
+            row_id = self._next_row_id()
+            self._set_next_row_id(row_id + 1)
+        elif (next_row_id := self.tx_interface.cached_next_row_id(self.name)) is not None\
+            and row_id >= next_row_id:
+            self._set_next_row_id(row_id + 1)
+        entry = (row_id, self.row_codec.pack(row))
+        old_row: tuple | None = None
+        self.access_counts.num_seeks += 1
+        with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+            if cursor.set_range(pack_int(row_id)): # an existing block covers this row id
+                key = bytes(cursor.key())
+                entries = self._read_block(cursor.value())
+                i = bisect_left(entries, row_id, key=lambda entry: entry[0])
+                if i < len(entries) and entries[i][0] == row_id:
+                    if self.zone_map:
+                        old_row = self.row_codec.unpack(entries[i][1])
+                    entries[i] = entry
+                else:
+                    entries.insert(i, entry)
+                self._write_block(cursor, entries, key=key)
+            else:
+                entries = self._read_block(cursor.value()) if cursor.last() else list()
+                if 0 < sum(len(row) for _, row in entries) < globals.BLOCK_SIZE:
+                    # extend the last block (which then covers a higher row id) since it still has room:
+                    cursor.delete()
+                    self.access_counts.num_entries_written += 1
+                    entries.append(entry)
+                else:
+                    entries = [entry]
+                self._write_block(cursor, entries, append=True)
+        if self.zone_map:
+            self._update_zones(((row_id, old_row, row), ))
+        return row_id
+
+    @profile(LMDBHeapFile.MyProfileStat)
+    def batch_append(self, rows: Iterable[tuple]) -> tuple[int, int]:
+        pack_row = self.row_codec.pack
+        if self.zone_map:
+            rows = list(rows)
+        row_id_start = self._next_row_id()
+        row_id = row_id_start
+        entries: list[tuple[int, bytes]] = list()
+        num_bytes = 0
+        self.access_counts.num_seeks += 1
+        with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+            for row in rows:
+                packed = pack_row(row)
+                entries.append((row_id, packed))
+                num_bytes += len(packed)
+                row_id += 1
+                if num_bytes >= globals.BLOCK_SIZE:
+                    self._write_block(cursor, entries, append=True)
+                    entries = list()
+                    num_bytes = 0
+            if len(entries) > 0:
+                self._write_block(cursor, entries, append=True)
+        self._set_next_row_id(row_id)
+        if self.zone_map:
+            self._update_zones((row_id_start + i, None, row) for i, row in enumerate(rows))
+        return row_id_start, row_id - row_id_start
 
-        def _estimate_blocks(self, num_entries: int) -> int:
-            if self._stat['leaf_pages'] == 0 or self._stat['entries'] == 0:
-                self._stat = self.obj.stat() # force refresh stats
-            stat = self._stat
-            # use total number of leaves and entries to come up with a guestimate:
-            # WARNING: we cannot set LMDB block size, but we can "pretend" leaves use our own block size:
-            leaves = ceil(stat['leaf_pages'] * stat['psize'] / globals.BLOCK_SIZE)
-            if leaves == 0:
+    def truncate(self) -> int:
+        with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+            num_rows = sum(BlockCodec.count(v) for v in cursor.iternext(keys=False, values=True))
+        super().truncate()
+        return num_rows
+
+    @profile(LMDBHeapFile.MyProfileStat)
+    def delete(self, row_id: int) -> int:
+        self.access_counts.num_seeks += 1
+        with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+            if not cursor.set_range(pack_int(row_id)):
                 return 0
-            entries_per_block = ceil(float(stat['entries']) / leaves)
-            if entries_per_block == 0: # no entries
+            key = bytes(cursor.key())
+            entries = self._read_block(cursor.value())
+            i = bisect_left(entries, row_id, key=lambda entry: entry[0])
+            if i == len(entries) or entries[i][0] != row_id:
                 return 0
-            return ceil(float(num_entries) / entries_per_block)
-
-        def finalize(self, result: Any) -> None:
-            super().finalize(result)
-            # get_one case doesn't need any additional adjustment
-            if self._method_name in ('iter_get', 'iter_scan'):
-                self.num_blocks_read += self._estimate_blocks(self.num_next_calls)
-                if self.num_blocks_read > 1:
-                    self.num_blocks_read -= 1 # because we included the first leaf in the initial lookup cost
-            elif self._method_name == 'put':
-                self.num_blocks_written = 1
-            elif self._method_name == 'delete' and result > 0: # result is number of records deleted
-                self.num_blocks_written = self._estimate_blocks(result)
-            return
+            old_row = self.row_codec.unpack(entries[i][1])
+            del entries[i]
+            if len(entries) > 0:
+                # keep the key, so the block still covers the same row ids:
+                self._write_block(cursor, entries, key=key)
+            else:
+                cursor.delete()
+                self.access_counts.num_entries_written += 1
+        if self.zone_map:
+            self._update_zones(((row_id, old_row, None), ))
+        return 1
+
+class LMDBBplusTree(BplusTree):
+    """LMDB-based B+tree implementation.
+    Like :class:`.LMDBHeapFile`, it decodes any buffer read through LMDB right away in ``zero_copy`` mode.
+    """
+
+    class MyProfileStat(LMDBPageProfileStat):
+        """Customized profile collector for some :class:`LMDBBplusTree` methods.
+        """
+        METHOD_NAMES = ('get_one', 'iter_get', 'iter_scan', 'iter_scan_batches', 'put', 'bulk_load', 'delete')
 
     def __init__(self, storage_manager: 'LMDBStorageManager',
                  tx: LMDBTransactionInterface, name: str,
-                 key_type: ValType, row_type: RowType,
+                 key_type: KeyType, row_type: RowType,
                  unique: bool = False) -> None:
         super().__init__(tx, name, key_type, row_type, unique)
         self.storage_manager = storage_manager
+        self.tx_interface: Final = tx
+        """Same as ``tx``, but typed as what the storage manager requires of it.
+        """
         self.lmdb_tx: Final = tx.lmdb_tx
         self.lmdb_handle = None
-        pack: Callable[[Any], bytes] | None = None
-        unpack: Callable[[bytes], Any] | None = None
-        if self.key_type == ValType.INTEGER:
-            pack, unpack = pack_int, unpack_int
-        elif self.key_type == ValType.VARCHAR:
-            pack, unpack = pack_str, unpack_str
-        else:
-            raise StorageMangerException(f'{self.name}: B+tree does not support {self.key_type.name} key')
+        self.row_codec: Final = RowCodec.for_row_type(tuple(row_type), storage_manager.row_format)
+        try:
+            pack, unpack = type(self).key_codec(self.key_type)
+        except StorageMangerException as e:
+            raise StorageMangerException(f'{self.name}: B+tree does not support key: {e}') from e
         self.pack_key: Final = pack
         self.unpack_key: Final = unpack
+        self.access_counts: Final = LMDBAccessCounts()
         return
 
+    @staticmethod
+    def key_codec(key_type: KeyType) -> tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+        """Return the functions for packing and unpacking keys of the given type,
+        whose packed forms must sort (as bytes) in key order.
+        """
+        if key_type == ValType.INTEGER:
+            return pack_int, unpack_int
+        elif key_type == ValType.VARCHAR:
+            return pack_str, unpack_str
+        else:
+            key_codec = KeyCodec.for_key_type(key_type)
+            return key_codec.pack, key_codec.unpack
+
+    def _file_key(self) -> bytes:
+        return pack_str(f'${self.__class__.__qualname__}.{self.name}')
+
     def _open(self, create_if_not_exists: bool = False) -> None:
         if self.lmdb_handle is None:
-            file_key = pack_str(f'${self.__class__.__qualname__}.{self.name}')
-            self.lmdb_handle = (self.storage_manager.tmp_env if self.tx.is_tmp() else self.storage_manager.env)\
-                .open_db(key=file_key, dupsort=(not self.unique),
-                         create=create_if_not_exists, txn=self.lmdb_tx)
+            file_key = self._file_key()
+            self.lmdb_handle = self.storage_manager.handle_registry(self.tx)\
+                .open(self.tx_interface, file_key, dupsort=(not self.unique), create=create_if_not_exists)
         return
 
     def stat(self) -> dict:
         stats = self.lmdb_tx.stat(db=self.lmdb_handle)
         return stats
 
+    def scan_partitions(self, num_partitions: int) -> list[ScanPartition] | None:
+        if self.tx.is_tmp():
+            return None
+        return LMDBScanPartition.make_partitions(self.storage_manager, self.tx_interface, self._file_key(), self.lmdb_handle, num_partitions,
+                                                 row_type=tuple(self.row_type), row_format=self.storage_manager.row_format,
+                                                 key_type=self.key_type)
+
     @profile(MyProfileStat)
     def get_one(self, key: Any) -> tuple | None:
-        bytes = self.lmdb_tx.get(self.pack_key(key), db=self.lmdb_handle)
-        return unpack_row(bytes) if bytes is not None else None
+        k = self.pack_key(key)
+        self.access_counts.num_seeks += 1
+        bytes = self.lmdb_tx.get(k, db=self.lmdb_handle)
+        if bytes is None:
+            return None
+        self.access_counts.num_entries_read += 1
+        self.access_counts.num_bytes_read += len(k) + len(bytes)
+        return self.row_codec.unpack(bytes)
 
     @profile_generator(MyProfileStat)
     def iter_get(self, key: Any) -> Generator[tuple, None, None]:
+        unpack_row = self.row_codec.unpack
+        counts = self.access_counts
+        counts.num_seeks += 1
         if self.unique:
-            v = self.lmdb_tx.get(self.pack_key(key), db=self.lmdb_handle)
+            k = self.pack_key(key)
+            v = self.lmdb_tx.get(k, db=self.lmdb_handle)
             if v is not None:
+                counts.num_entries_read += 1
+                counts.num_bytes_read += len(k) + len(v)
                 yield key, unpack_row(v)
         else:
             with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
                 cursor.set_key(self.pack_key(key))
                 for k, v in cursor.iternext_dup(keys=True, values=True):
+                    counts.num_entries_read += 1
+                    counts.num_bytes_read += len(k) + len(v)
                     yield self.unpack_key(k), unpack_row(v)
         return None
 
     @profile_generator(MyProfileStat)
     def iter_scan(self, key_lower: Any = None) -> Generator[tuple, None, None]:
+        unpack_row = self.row_codec.unpack
+        counts = self.access_counts
+        counts.num_seeks += 1
         with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
             if key_lower is not None:
                 if not cursor.set_range(self.pack_key(key_lower)):
                     # nothing in range; need to return explicitly or else lmdb will scan from beginning:
                     return
             for k, v in cursor:
+                counts.num_entries_read += 1
+                counts.num_bytes_read += len(k) + len(v)
                 yield self.unpack_key(k), unpack_row(v)
         return
 
+    @profile_generator(MyProfileStat)
+    def iter_scan_batches(self, key_lower: Any = None, num_blocks: int = 1,
+                          prefetch_blocks: int = 0) -> Generator[list[tuple], None, None]:
+        unpack_key = self.unpack_key
+        unpack_row = self.row_codec.unpack
+        max_bytes = num_blocks * globals.BLOCK_SIZE
+        counts = self.access_counts
+        batch: list[tuple] = list()
+        num_bytes = 0
+        counts.num_seeks += 1
+        k_lower = None if key_lower is None else self.pack_key(key_lower)
+        prefetcher = LMDBPrefetcher.start(self.storage_manager.handle_registry(self.tx), self._file_key(),
+                                          self.lmdb_handle, k_lower, prefetch_blocks)
+        try:
+            with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+                if k_lower is not None:
+                    if not cursor.set_range(k_lower):
+                        # nothing in range; need to return explicitly or else lmdb will scan from beginning:
+                        return
+                for k, v in cursor:
+                    batch.append((unpack_key(k), unpack_row(v)))
+                    num_bytes += len(k) + len(v)
+                    if num_bytes >= max_bytes:
+                        counts.num_entries_read += len(batch)
+                        counts.num_bytes_read += num_bytes
+                        if prefetcher is not None:
+                            prefetcher.advance(num_bytes)
+                        yield batch
+                        batch = list()
+                        num_bytes = 0
+        finally:
+            if prefetcher is not None:
+                prefetcher.stop()
+        if len(batch) > 0:
+            counts.num_entries_read += len(batch)
+            counts.num_bytes_read += num_bytes
+            yield batch
+        return
+
     @profile(MyProfileStat)
     def put(self, key: Any, row: tuple) -> None:
-        assert self.lmdb_tx.put(self.pack_key(key), pack_row(row), overwrite=True, db=self.lmdb_handle)
+        k, v = self.pack_key(key), self.row_codec.pack(row)
+        self.access_counts.num_seeks += 1
+        self.access_counts.num_entries_written += 1
+        self.access_counts.num_bytes_written += len(k) + len(v)
+        assert self.lmdb_tx.put(k, v, overwrite=True, db=self.lmdb_handle)
         return
 
+    @profile(MyProfileStat)
+    def bulk_load(self, entries: Iterable[tuple[Any, tuple]]) -> int:
+        """NOTE: LMDB's append mode requires the key to be strictly larger than all existing keys.
+        In principle, LMDB can also append duplicates of the largest key in a ``dupsort`` file,
+        but the Python binding only asks for that if the main (unnamed) database is ``dupsort``,
+        so entries repeating the last key appended are added with a regular put instead
+        (which is still cheap because the cursor is already at the end of the file).
+        """
+        pack_key = self.pack_key
+        pack_row = self.row_codec.pack
+        counts = self.access_counts
+        count = 0
+        num_bytes = 0
+        counts.num_seeks += 1
+        with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+            # copy the largest key, because a zero-copy buffer does not survive cursor moves:
+            k_last = bytes(cursor.key()) if cursor.last() else None
+            for key, row in entries:
+                k, v = pack_key(key), pack_row(row)
+                if k_last is None or k > k_last:
+                    # beyond all existing keys, so no need to check for duplicates:
+                    assert cursor.put(k, v, append=True)
+                    k_last = k
+                    count += 1
+                    num_bytes += len(k) + len(v)
+                    continue
+                counts.num_seeks += 1 # not appending, so the cursor descends from the root again
+                if self.unique:
+                    if cursor.set_key(k): # also catches duplicates within entries, which are in the tree by now
+                        raise DuplicateKeyException(self.name, key)
+                    assert cursor.put(k, v, overwrite=False)
+                    count += 1
+                    num_bytes += len(k) + len(v)
+                elif cursor.put(k, v, dupdata=False): # returns False if the same entry exists
+                    count += 1
+                    num_bytes += len(k) + len(v)
+        counts.num_entries_written += count
+        counts.num_bytes_written += num_bytes
+        return count
+
     @profile(MyProfileStat)
     def delete(self, key: Any, row: tuple | None = None) -> int:
+        counts = self.access_counts
+        counts.num_seeks += 1
         with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
             if self.unique:
                 if cursor.set_key(self.pack_key(key)):
-                    if row is None or row == unpack_row(cursor.value()):
+                    if row is None or row == self.row_codec.unpack(cursor.value()):
                         assert cursor.delete()
+                        counts.num_entries_written += 1
                         return 1
                 return 0
             elif row is None: # delete all with the same key
@@ -293,12 +1171,16 @@ class LMDBBplusTree(BplusTree):
                     count = cursor.count()
                     for i in range(count):
                         assert cursor.delete()
+                    counts.num_entries_written += count
                     return count
                 return 0
             else: # delete the entry matching both key and row, if any
-                if cursor.set_key_dup(self.pack_key(key), pack_row(row)):
-                    assert cursor.delete()
-                    return 1
+                # the row may have been stored in an older format, so try all possible encodings:
+                for v in self.row_codec.encodings(row):
+                    if cursor.set_key_dup(self.pack_key(key), v):
+                        assert cursor.delete()
+                        counts.num_entries_written += 1
+                        return 1
                 return 0
 
     def _close(self):
@@ -306,8 +1188,262 @@ class LMDBBplusTree(BplusTree):
         to close lmdb file handles in API (underlying lmdb actually reuse handles
         across transactions, so there is a possibility of inadvertently
         closing handles while they are still used by others).
-        However, leaving all handles around is known to cause performance issues.
-        There isn't much we could do here for now, but we will keep an eye on it.
+        Instead, we leave the handle in the :class:`.LMDBHandleRegistry` for the next time this file is opened.
+        """
+        self.lmdb_handle = None
+        return
+
+class LMDBHashIndex(HashIndex):
+    """LMDB-based hash index implementation, using linear hashing.
+
+    The file is an LMDB database with duplicate keys (``dupsort``), keyed by bucket number,
+    where each entry is a separate value under the number of its bucket, packed by a :class:`.serialize.HashEntryCodec`.
+    LMDB keeps the values under each bucket number sorted, and entries with the same key share a prefix,
+    so looking up, adding, or deleting an entry seeks directly to the entries with its key,
+    instead of reading and rewriting the whole bucket, no matter how many entries share a key.
+    (As with :class:`.LMDBBplusTree` with non-unique keys, LMDB limits the size of each entry to its maximum key size.)
+    Keys are packed as for :class:`.LMDBBplusTree`, and hashed by a digest of their packed form,
+    which, unlike Python's ``hash()``, is the same across runs.
+
+    The file starts out with a single bucket and grows one bucket at a time:
+    whenever entries average more than ``globals.HASH_INDEX_FILL_FACTOR`` of a block per bucket,
+    the bucket at the "split pointer" is split into itself and a new bucket at the end
+    (using the hash modulo twice the number of buckets at the start of the round),
+    and the pointer advances, returning to the first bucket once the number of buckets has doubled.
+    Splitting moves just the entries that hash to the new bucket.
+    Buckets are never merged, and a bucket may well grow beyond a block if many entries share the same key.
+    The number of doublings so far (the "level"), the split pointer, and the number and total size of entries
+    are kept in a header stored under :attr:`.HEADER_KEY`, which sorts before all buckets.
+    Like :class:`.LMDBHeapFile`, it decodes any buffer read through LMDB right away in ``zero_copy`` mode.
+    """
+
+    class MyProfileStat(LMDBPageProfileStat):
+        """Customized profile collector for some :class:`LMDBHashIndex` methods.
+        """
+        METHOD_NAMES = ('iter_get', 'iter_scan', 'put', 'bulk_load', 'delete')
+
+    HEADER_KEY: Final = pack_int(-1)
+    """Key of the header entry, which comes before bucket 0.
+    """
+    HEADER: Final = struct.Struct('>IIQQ')
+    """Layout of the header: level, split pointer, number of entries, and number of bytes of (packed) entries.
+    """
+
+    def __init__(self, storage_manager: 'LMDBStorageManager',
+                 tx: LMDBTransactionInterface, name: str,
+                 key_type: KeyType, row_type: RowType) -> None:
+        super().__init__(tx, name, key_type, row_type)
+        self.storage_manager: Final = storage_manager
+        self.tx_interface: Final = tx
+        """Same as ``tx``, but typed as what the storage manager requires of it.
+        """
+        self.lmdb_tx: Final = tx.lmdb_tx
+        self.lmdb_handle = None
+        self.row_codec: Final = RowCodec.for_row_type(tuple(row_type), storage_manager.row_format)
+        try:
+            pack, unpack = LMDBBplusTree.key_codec(self.key_type)
+        except StorageMangerException as e:
+            raise StorageMangerException(f'{self.name}: hash index does not support key: {e}') from e
+        self.pack_key: Final = pack
+        self.unpack_key: Final = unpack
+        self.level = 0
+        self.split = 0
+        self.num_entries = 0
+        self.num_bytes = 0
+        self.access_counts: Final = LMDBAccessCounts()
+        return
+
+    def _file_key(self) -> bytes:
+        return pack_str(f'${self.__class__.__qualname__}.{self.name}')
+
+    def _open(self, create_if_not_exists: bool = False) -> None:
+        if self.lmdb_handle is None:
+            self.lmdb_handle = self.storage_manager.handle_registry(self.tx)\
+                .open(self.tx_interface, self._file_key(), dupsort=True, create=create_if_not_exists)
+        return
+
+    def _read_header(self) -> None:
+        """(Re)read the header, which other objects for the same file may have changed since this one was opened.
+        The header sits on the same leaf page as the first buckets, so reading it does not count as a separate seek.
+        """
+        if (v := self.lmdb_tx.get(self.HEADER_KEY, db=self.lmdb_handle)) is not None:
+            self.access_counts.num_entries_read += 1
+            self.access_counts.num_bytes_read += len(self.HEADER_KEY) + len(v)
+            self.level, self.split, self.num_entries, self.num_bytes = self.HEADER.unpack(v)
+        return
+
+    def _write_header(self) -> None:
+        v = self.HEADER.pack(self.level, self.split, self.num_entries, self.num_bytes)
+        self.access_counts.num_entries_written += 1
+        self.access_counts.num_bytes_written += len(self.HEADER_KEY) + len(v)
+        # replace (rather than add to) the one value under the header key:
+        self.lmdb_tx.replace(self.HEADER_KEY, v, db=self.lmdb_handle)
+        return
+
+    def num_buckets(self) -> int:
+        return (1 << self.level) + self.split
+
+    @staticmethod
+    def _hash(k: bytes | memoryview) -> int:
+        return int.from_bytes(blake2b(k, digest_size=8).digest())
+
+    def _bucket_number(self, k: bytes) -> int:
+        """Return the number of the bucket for the packed key ``k``.
+        """
+        h = type(self)._hash(k)
+        n = 1 << self.level
+        if (b := h % n) < self.split: # already split in this round
+            b = h % (n << 1)
+        return b
+
+    def _add(self, key: Any, row: tuple) -> bool:
+        """Helper for :meth:`.put` and :meth:`.bulk_load`, which add an entry (unless it exists),
+        splitting buckets as needed, but leave writing the header to the caller.
+        Return whether the entry was added.
+        """
+        k = self.pack_key(key)
+        e = HashEntryCodec.pack(k, self.row_codec.pack(row))
+        self.access_counts.num_seeks += 1
+        if not self.lmdb_tx.put(pack_int(self._bucket_number(k)), e, dupdata=False, db=self.lmdb_handle):
+            return False # returns False if the same entry exists
+        self.access_counts.num_entries_written += 1
+        self.access_counts.num_bytes_written += 4 + len(e)
+        self.num_entries += 1
+        self.num_bytes += len(e)
+        while self.num_bytes > globals.HASH_INDEX_FILL_FACTOR * globals.BLOCK_SIZE * self.num_buckets():
+            self._split_bucket()
+        return True
+
+    def _split_bucket(self) -> None:
+        """Split the bucket at the split pointer, moving the entries that now hash to the new bucket,
+        and advance the pointer.
+        """
+        n = 1 << self.level
+        old, new = self.split, self.split + n
+        b_old, b_new = pack_int(old), pack_int(new)
+        hash_key = type(self)._hash
+        counts = self.access_counts
+        counts.num_seeks += 1
+        moved: list[bytes] = list()
+        with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+            if cursor.set_key(b_old):
+                for e in cursor.iternext_dup():
+                    counts.num_entries_read += 1
+                    counts.num_bytes_read += 4 + len(e)
+                    if hash_key(HashEntryCodec.unpack(e)[0]) % (n << 1) == new:
+                        moved.append(bytes(e)) # copy, because a zero-copy buffer does not survive cursor moves
+            for e in moved:
+                counts.num_seeks += 1
+                assert cursor.set_key_dup(b_old, e)
+                assert cursor.delete()
+                assert cursor.put(b_new, e, dupdata=False)
+        counts.num_entries_written += 2 * len(moved)
+        counts.num_bytes_written += 2 * sum(4 + len(e) for e in moved)
+        self.split += 1
+        if self.split == n: # all buckets of this round have been split
+            self.level += 1
+            self.split = 0
+        return
+
+    def stat(self) -> dict:
+        """NOTE: The ``entries`` reported do not include the header,
+        and ``buckets`` reports the number of buckets (including empty ones).
+        """
+        stats = dict(self.lmdb_tx.stat(db=self.lmdb_handle))
+        self._read_header()
+        stats['entries'] = self.num_entries
+        stats['buckets'] = self.num_buckets()
+        return stats
+
+    @profile_generator(MyProfileStat)
+    def iter_get(self, key: Any) -> Generator[tuple, None, None]:
+        unpack_row = self.row_codec.unpack
+        counts = self.access_counts
+        self._read_header()
+        k = self.pack_key(key)
+        prefix = HashEntryCodec.prefix(k)
+        counts.num_seeks += 1
+        with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+            if not cursor.set_range_dup(pack_int(self._bucket_number(k)), prefix):
+                return
+            for e in cursor.iternext_dup():
+                if e[:len(prefix)] != prefix: # past the entries with this key
+                    break
+                counts.num_entries_read += 1
+                counts.num_bytes_read += 4 + len(e)
+                yield key, unpack_row(e[len(prefix):])
+        return
+
+    @profile_generator(MyProfileStat)
+    def iter_scan(self) -> Generator[tuple, None, None]:
+        unpack_key = self.unpack_key
+        unpack_row = self.row_codec.unpack
+        counts = self.access_counts
+        counts.num_seeks += 1
+        with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+            if not cursor.set_range(pack_int(0)): # skip the header
+                return
+            for _, e in cursor:
+                counts.num_entries_read += 1
+                counts.num_bytes_read += 4 + len(e)
+                k, v = HashEntryCodec.unpack(e)
+                yield unpack_key(bytes(k)), unpack_row(v)
+        return
+
+    @profile(MyProfileStat)
+    def put(self, key: Any, row: tuple) -> None:
+        self._read_header()
+        if self._add(key, row):
+            self._write_header()
+        return
+
+    @profile(MyProfileStat)
+    def bulk_load(self, entries: Iterable[tuple[Any, tuple]]) -> int:
+        self._read_header()
+        count = 0
+        for key, row in entries:
+            if self._add(key, row):
+                count += 1
+        if count > 0:
+            self._write_header()
+        return count
+
+    @profile(MyProfileStat)
+    def delete(self, key: Any, row: tuple | None = None) -> int:
+        counts = self.access_counts
+        self._read_header()
+        k = self.pack_key(key)
+        b = pack_int(self._bucket_number(k))
+        count = 0
+        num_bytes = 0
+        counts.num_seeks += 1
+        with self.lmdb_tx.cursor(db=self.lmdb_handle) as cursor:
+            if row is None: # delete all with the same key
+                prefix = HashEntryCodec.prefix(k)
+                if cursor.set_range_dup(b, prefix):
+                    # deleting moves the cursor on to the next entry, which may be under the next bucket:
+                    while cursor.key() == b and (e := cursor.value())[:len(prefix)] == prefix:
+                        num_bytes += len(e)
+                        assert cursor.delete()
+                        count += 1
+            else: # delete the entry matching both key and row, if any
+                # the row may have been stored in an older format, so try all possible encodings:
+                for v in self.row_codec.encodings(row):
+                    e = HashEntryCodec.pack(k, v)
+                    if cursor.set_key_dup(b, e):
+                        assert cursor.delete()
+                        count, num_bytes = 1, len(e)
+                        break
+        if count == 0:
+            return 0
+        counts.num_entries_written += count
+        self.num_entries -= count
+        self.num_bytes -= num_bytes
+        self._write_header()
+        return count
+
+    def _close(self):
+        """NOTE: As with :class:`.LMDBBplusTree`, the handle stays in the :class:`.LMDBHandleRegistry`.
         """
         self.lmdb_handle = None
         return
@@ -315,45 +1451,158 @@ class LMDBBplusTree(BplusTree):
 class LMDBStorageManager(StorageManager):
     """LMDB-based storage manager.
     """
+    DURABILITIES: Final = ('full', 'none')
+    """Supported durability modes for committing a (top-level) transaction in the database:
+    ``full`` flushes the database to disk before the commit returns,
+    while ``none`` leaves the writing back to the operating system,
+    so a system crash may undo the most recent commits (but will not corrupt the database).
+    """
 
-    def __init__(self, location: str, tmp_location: str):
-        """
+    def __init__(self, location: str, tmp_location: str, row_format: str = 'binary', zero_copy: bool = True,
+                 tmp_compression: str | None = None, tmp_storage: MemoryStorageManager | None = None,
+                 durability: str = 'full', readahead: bool = True):
+        """Open (or create) the database at ``location`` and the temporary database at ``tmp_location``.
+        New rows will be written in ``row_format`` (one of :data:`.serialize.ROW_FORMATS`);
+        rows already written in other formats remain readable.
+        If ``zero_copy`` is ``True``, transactions will be started in LMDB's ``buffers`` mode,
+        so that rows are decoded straight from LMDB's memory map without first being copied into ``bytes``.
+        If ``tmp_compression`` (one of :data:`.serialize.COMPRESSIONS`) is given,
+        all heap files in the tmp space will be compressed with it (see :class:`.LMDBCompressedHeapFile`).
+        If ``tmp_storage`` is given, heap files in the tmp space will be managed by it instead
+        (while transactions and B+trees in the tmp space still go through the temporary database),
+        in which case ``tmp_compression`` does not apply.
+
+        ``durability`` (one of :attr:`.DURABILITIES`) is the default mode for committing transactions in the database;
+        it can be overridden for each commit (see :meth:`.flush`).
+        To make that possible, LMDB itself never syncs upon commit; instead, :meth:`.flush` syncs explicitly.
+        ``readahead`` is passed on to LMDB for the database;
+        it can be turned off for databases much larger than memory where random reads dominate.
+        (LMDB's ``writemap`` is not offered, as it does not support the nested transactions we rely on.)
+        The temporary database never needs durability, so it is never synced.
         """
         super().__init__()
+        if row_format not in ROW_FORMATS:
+            raise StorageMangerException(f'unknown row format {row_format}')
+        if durability not in type(self).DURABILITIES:
+            raise StorageMangerException(f'unknown durability {durability}')
+        if tmp_compression is not None and tmp_compression not in COMPRESSIONS:
+            raise StorageMangerException(f'unknown compression {tmp_compression}')
         self.location: Final = location
         self.tmp_location: Final = tmp_location
-        self.env: Final = lmdb.open(self.location, map_size=globals.MAX_DB_SIZE, max_dbs=globals.MAX_FILES)
-        self.tmp_env: Final = lmdb.open(self.tmp_location, map_size=globals.MAX_DB_SIZE, max_dbs=globals.MAX_FILES)
+        self.row_format: Final = row_format
+        self.zero_copy: Final = zero_copy
+        self.tmp_compression: Final = tmp_compression
+        self.tmp_storage: Final = tmp_storage
+        self.durability: Final = durability
+        self.env: Final = lmdb.open(self.location, map_size=globals.MAX_DB_SIZE, max_dbs=globals.MAX_FILES,
+                                    sync=False, metasync=False, readahead=readahead)
+        self.tmp_env: Final = lmdb.open(self.tmp_location, map_size=globals.MAX_DB_SIZE, max_dbs=globals.MAX_FILES,
+                                        sync=False, metasync=False)
+        self.handles: Final = LMDBHandleRegistry(self.env)
+        self.tmp_handles: Final = LMDBHandleRegistry(self.tmp_env)
+        self.transaction_listeners: Final[list[Any]] = list()
+        """Other components that keep state by transaction in the database (e.g., the metadata manager),
+        whose ``transaction_committed`` and ``transaction_aborted`` are called along with this object's.
+        """
+        return
+
+    def flush(self, tx: LMDBTransactionInterface, durability: str | None = None) -> None:
+        """Must be called by the transaction manager right after ``tx`` commits,
+        to make the commit durable according to ``durability`` (one of :attr:`.DURABILITIES`),
+        which defaults to that of the database.
+        Nothing needs to be done for nested transactions, read-only transactions, or transactions in the tmp space.
+        """
+        if durability is None:
+            durability = self.durability
+        elif durability not in type(self).DURABILITIES:
+            raise StorageMangerException(f'unknown durability {durability}')
+        if tx.get_parent() is not None or tx.read_only or tx.is_tmp():
+            return
+        if durability == 'full':
+            self.env.sync(True)
+        return
+
+    def handle_registry(self, tx: Transaction) -> LMDBHandleRegistry:
+        """Return the registry of handles for the environment (regular or tmp) that ``tx`` operates in.
+        """
+        return self.tmp_handles if tx.is_tmp() else self.handles
+
+    def transaction_committed(self, tx: LMDBTransactionInterface) -> None:
+        """Must be called by the transaction manager right after ``tx`` commits.
+        """
+        self.handle_registry(tx).transaction_committed(tx)
+        if self.tmp_storage is not None and tx.is_tmp():
+            self.tmp_storage.transaction_committed(tx)
+        if not tx.is_tmp():
+            for listener in self.transaction_listeners:
+                listener.transaction_committed(tx)
+        return
+
+    def transaction_aborted(self, tx: LMDBTransactionInterface) -> None:
+        """Must be called by the transaction manager right after ``tx`` aborts.
+        """
+        self.handle_registry(tx).transaction_aborted(tx)
+        if self.tmp_storage is not None and tx.is_tmp():
+            self.tmp_storage.transaction_aborted(tx)
+        if not tx.is_tmp():
+            for listener in self.transaction_listeners:
+                listener.transaction_aborted(tx)
         return
 
     def heap_file(self,
                   tx: Transaction,
                   name: str,
                   row_type: RowType,
-                  create_if_not_exists: bool = False
+                  create_if_not_exists: bool = False,
+                  compression: str | None = None,
+                  zone_map: bool = False
     ) -> HeapFile:
         if not isinstance(tx, LMDBTransactionInterface):
             raise StorageMangerException('unexpected error')
-        f = LMDBHeapFile(self, tx, name, row_type)
+        if self.tmp_storage is not None and tx.is_tmp():
+            return self.tmp_storage.heap_file(tx, name, row_type, create_if_not_exists=create_if_not_exists,
+                                              compression=compression, zone_map=zone_map)
+        if compression is None and tx.is_tmp():
+            compression = self.tmp_compression
+        f: LMDBHeapFile
+        if compression is None:
+            f = LMDBHeapFile(self, tx, name, row_type, zone_map=zone_map)
+        else:
+            f = LMDBCompressedHeapFile(self, tx, name, row_type, compression, zone_map=zone_map)
         f._open(create_if_not_exists=create_if_not_exists)
         return f
 
     def delete_heap_file(self, tx: Transaction, name: str) -> int:
         if not isinstance(tx, LMDBTransactionInterface):
             raise StorageMangerException('unexpected error')
-        try:
-            f = LMDBHeapFile(self, tx, name, []) # types don't matter here, just trying to drop it
-            f._open()
+        if self.tmp_storage is not None and tx.is_tmp():
+            return self.tmp_storage.delete_heap_file(tx, name)
+        # the file could have been stored either way; types and compression method don't matter here, just trying to drop it:
+        for f in (LMDBHeapFile(self, tx, name, []), LMDBCompressedHeapFile(self, tx, name, [], COMPRESSIONS[0])):
+            try:
+                f._open()
+            except lmdb.NotFoundError:
+                continue
             tx.lmdb_tx.drop(f.lmdb_handle, delete=True)
             f._close()
+            # lmdb has closed the handle:
+            self.handle_registry(tx).evict(pack_str(f'${f.__class__.__qualname__}.{name}'))
+            # shadow any row id cached by enclosing transactions, in case the file is recreated:
+            tx.next_row_ids[name] = 0
+            # drop the zone map too, if any:
+            try:
+                zone_map_file_key = LMDBHeapFile.zone_map_file_key(name)
+                tx.lmdb_tx.drop(self.handle_registry(tx).open(tx, zone_map_file_key), delete=True)
+                self.handle_registry(tx).evict(zone_map_file_key)
+            except lmdb.NotFoundError:
+                pass
             return 1
-        except lmdb.NotFoundError:
-            return 0
+        return 0
 
     def bplus_tree(self,
                    tx: Transaction,
                    name: str,
-                   key_type: ValType,
+                   key_type: KeyType,
                    row_type: RowType,
                    unique: bool = False,
                    create_if_not_exists: bool = False
@@ -372,9 +1621,40 @@ class LMDBStorageManager(StorageManager):
             f._open()
             tx.lmdb_tx.drop(f.lmdb_handle, delete=True)
             f._close()
+            # lmdb has closed the handle:
+            self.handle_registry(tx).evict(pack_str(f'${LMDBBplusTree.__qualname__}.{name}'))
+            return 1
+        except lmdb.NotFoundError:
+            return 0
+
+    def hash_index(self,
+                   tx: Transaction,
+                   name: str,
+                   key_type: KeyType,
+                   row_type: RowType,
+                   create_if_not_exists: bool = False
+    ) -> HashIndex:
+        if not isinstance(tx, LMDBTransactionInterface):
+            raise StorageMangerException('unexpected error')
+        f = LMDBHashIndex(self, tx, name, key_type, row_type)
+        f._open(create_if_not_exists=create_if_not_exists)
+        return f
+
+    def delete_hash_index(self, tx: Transaction, name: str) -> int:
+        if not isinstance(tx, LMDBTransactionInterface):
+            raise StorageMangerException('unexpected error')
+        try:
+            f = LMDBHashIndex(self, tx, name, ValType.VARCHAR, []) # types don't matter here, just trying to drop it
+            f._open()
+            tx.lmdb_tx.drop(f.lmdb_handle, delete=True)
+            f._close()
+            # lmdb has closed the handle:
+            self.handle_registry(tx).evict(pack_str(f'${LMDBHashIndex.__qualname__}.{name}'))
             return 1
         except lmdb.NotFoundError:
             return 0
 
     def shutdown(self) -> None:
+        if self.tmp_storage is not None:
+            self.tmp_storage.shutdown()
         return
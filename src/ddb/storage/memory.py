@@ -0,0 +1,437 @@
+"""This module contains the implementation of a storage manager for the tmp space that keeps heap files in memory.
+
+Files in the tmp space (such as runs of external sorting and partitions of hash joins) live only as long as
+the statement that uses them, so they need neither durability nor ordering by key:
+here, each file is simply a list of packed rows indexed by row id.
+To bound memory use, whole files are spilled to scratch files (which are memory-mapped for reading)
+once the packed rows held in memory exceed a budget.
+"""
+from typing import cast, Final, Generator, Iterable, Callable, Any, BinaryIO
+from math import ceil
+import mmap
+import os
+import tempfile
+
+from .. import globals
+from ..profile import profile, profile_generator, ProfileStat
+from ..primitives import RowType, KeyType
+from ..transaction import Transaction
+
+from .interface import StorageMangerException, Zone, HeapFile, BplusTree, HashIndex, StorageManager
+from .serialize import RowCodec, ROW_FORMATS
+
+class MemoryFileContents:
+    """Contents of a heap file managed by :class:`.MemoryStorageManager`.
+
+    Rows are packed by a :class:`.serialize.RowCodec` and kept in a list indexed by row id,
+    with ``None`` for row ids not in use, so appending and scanning are just list operations.
+    Once spilled (see :meth:`.spill`), the packed rows are moved to a scratch file instead,
+    and the list holds the (offset, length) of each row therein;
+    rows written afterwards are appended to the scratch file, which is memory-mapped for reading.
+    """
+    def __init__(self) -> None:
+        self.rows: list[Any] = list()
+        """Packed row (or, once spilled, its offset and length in the scratch file) by row id.
+        """
+        self.num_rows: int = 0
+        """Number of rows (excluding those deleted).
+        """
+        self.num_bytes: int = 0
+        """Number of bytes of packed rows (excluding those deleted).
+        """
+        self.scratch: BinaryIO | None = None
+        self.scratch_size: int = 0
+        self.scratch_map: mmap.mmap | None = None
+        return
+
+    def is_spilled(self) -> bool:
+        return self.scratch is not None
+
+    def num_bytes_in_memory(self) -> int:
+        return 0 if self.is_spilled() else self.num_bytes
+
+    def _write_scratch(self, packed: bytes) -> tuple[int, int]:
+        scratch = cast(BinaryIO, self.scratch)
+        scratch.seek(self.scratch_size)
+        scratch.write(packed)
+        offset = self.scratch_size
+        self.scratch_size += len(packed)
+        return offset, len(packed)
+
+    def _read_scratch(self, offset: int, length: int) -> bytes:
+        if self.scratch_map is None or len(self.scratch_map) < offset + length:
+            # (re)map to cover rows written since the last mapping:
+            if self.scratch_map is not None:
+                self.scratch_map.close()
+            scratch = cast(BinaryIO, self.scratch)
+            scratch.flush()
+            self.scratch_map = mmap.mmap(scratch.fileno(), self.scratch_size, access=mmap.ACCESS_READ)
+        return self.scratch_map[offset:offset+length]
+
+    def get(self, row_id: int) -> bytes | None:
+        if row_id < 0 or row_id >= len(self.rows) or (entry := self.rows[row_id]) is None:
+            return None
+        return self._read_scratch(*entry) if self.is_spilled() else entry
+
+    def iter_get(self, row_id_lower: int = 0) -> Generator[tuple[int, bytes], None, None]:
+        """Return a Python generator over (row id, packed row) pairs, starting from ``row_id_lower``.
+        Rows appended during the iteration are included.
+        """
+        rows = self.rows
+        row_id = row_id_lower
+        while row_id < len(rows):
+            if (entry := rows[row_id]) is not None:
+                yield row_id, (self._read_scratch(*entry) if self.is_spilled() else entry)
+            row_id += 1
+        return
+
+    def set(self, row_id: int, packed: bytes | None) -> int:
+        """Store ``packed`` as the row with ``row_id`` (or delete the row if ``packed`` is ``None``),
+        and return the number of rows replaced or deleted (either ``1`` or ``0``).
+        """
+        if row_id >= len(self.rows):
+            if packed is None:
+                return 0
+            self.rows.extend([None] * (row_id + 1 - len(self.rows)))
+        if (old := self.rows[row_id]) is not None:
+            self.num_rows -= 1
+            self.num_bytes -= old[1] if self.is_spilled() else len(old)
+        if packed is not None:
+            self.num_rows += 1
+            self.num_bytes += len(packed)
+            self.rows[row_id] = self._write_scratch(packed) if self.is_spilled() else packed
+        else:
+            self.rows[row_id] = None
+        return 0 if old is None else 1
+
+    def append(self, packed: bytes) -> int:
+        """Append ``packed`` as a new row, and return its row id.
+        """
+        self.rows.append(self._write_scratch(packed) if self.is_spilled() else packed)
+        self.num_rows += 1
+        self.num_bytes += len(packed)
+        return len(self.rows) - 1
+
+    def clear(self) -> int:
+        """Remove all rows (returning to memory if spilled), and return the number of rows removed.
+        """
+        num_rows = self.num_rows
+        self.discard()
+        self.rows.clear()
+        self.num_rows = 0
+        self.num_bytes = 0
+        return num_rows
+
+    def spill(self, location: str) -> int:
+        """Move all rows to a new scratch file under directory ``location``, and return the number of bytes written.
+        """
+        os.makedirs(location, exist_ok=True)
+        self.scratch = tempfile.TemporaryFile(dir=location)
+        self.scratch_size = 0
+        for row_id, entry in enumerate(self.rows):
+            if entry is not None:
+                self.rows[row_id] = self._write_scratch(entry)
+        return self.scratch_size
+
+    def discard(self) -> None:
+        """Release the scratch file, if any (and with it, all rows in it).
+        """
+        if self.scratch_map is not None:
+            self.scratch_map.close()
+            self.scratch_map = None
+        if self.scratch is not None:
+            self.scratch.close()
+            self.scratch = None
+            self.scratch_size = 0
+        return
+
+class MemoryHeapFile(HeapFile):
+    """In-memory heap file implementation, whose rows are stored in a :class:`.MemoryFileContents`.
+    Row ids are assigned consecutively (starting from 0) in the order rows are appended.
+
+    Rows are decoded into Python objects before being returned, like :class:`.LMDBHeapFile` does,
+    but reading or writing rows in memory incurs no I/O;
+    only rows read from or written to a scratch file (including those moved there by spilling) count as I/O.
+    Zone maps are not maintained, so the ``zone_filter`` of :meth:`.iter_scan_batches` is ignored,
+    and so is ``prefetch_blocks``, as there is nothing to read ahead.
+    """
+
+    class MyProfileStat(ProfileStat):
+        """Customized profile collector for some :class:`MemoryHeapFile` methods.
+        The number of blocks read or written is derived from the number of bytes of scratch files actually accessed.
+        """
+        def __init__(self, method: Callable, obj: 'MemoryHeapFile', caller: ProfileStat | None,
+                     *call_args, **call_kw):
+            super().__init__(method, obj, caller, *call_args, **call_kw)
+            self.obj: Final = obj
+            if method.__name__ not in ('get', 'iter_scan', 'iter_scan_batches', 'put', 'batch_append', 'delete'):
+                raise NotImplementedError(f'I/O stats for {method.__qualname__} not available')
+            self._num_bytes_read = obj.num_bytes_read
+            self._num_bytes_written = obj.num_bytes_written
+            return
+
+        def finalize(self, result: Any) -> None:
+            super().finalize(result)
+            self.num_blocks_read += ceil((self.obj.num_bytes_read - self._num_bytes_read) / globals.BLOCK_SIZE)
+            self.num_blocks_written += ceil((self.obj.num_bytes_written - self._num_bytes_written) / globals.BLOCK_SIZE)
+            return
+
+    def __init__(self, storage_manager: 'MemoryStorageManager', tx: Transaction, name: str, row_type: RowType) -> None:
+        super().__init__(tx, name, row_type)
+        self.storage_manager: Final = storage_manager
+        self.row_codec: Final = RowCodec.for_row_type(tuple(row_type), storage_manager.row_format)
+        self.contents: MemoryFileContents | None = None
+        self.num_bytes_read = 0
+        """Total number of bytes read from scratch files so far (for profiling).
+        """
+        self.num_bytes_written = 0
+        """Total number of bytes written to scratch files so far (for profiling).
+        """
+        return
+
+    def _open(self, create_if_not_exists: bool = False) -> None:
+        if self.contents is None:
+            self.contents = self.storage_manager.file_contents(self.tx, self.name, create_if_not_exists=create_if_not_exists)
+        return
+
+    def _written(self, num_bytes_in_memory: int, num_bytes: int) -> None:
+        """Account for a write that changed the number of bytes held in memory from ``num_bytes_in_memory``
+        and wrote ``num_bytes`` bytes of packed rows.
+        """
+        contents = cast(MemoryFileContents, self.contents)
+        if contents.is_spilled():
+            self.num_bytes_written += num_bytes
+        self.num_bytes_written += self.storage_manager.account(contents.num_bytes_in_memory() - num_bytes_in_memory)
+        return
+
+    def stat(self) -> dict:
+        contents = cast(MemoryFileContents, self.contents)
+        return { 'entries': contents.num_rows, 'bytes': contents.num_bytes, 'spilled': contents.is_spilled() }
+
+    @profile(MyProfileStat)
+    def get(self, row_id: int) -> tuple | None:
+        contents = cast(MemoryFileContents, self.contents)
+        if (packed := contents.get(row_id)) is None:
+            return None
+        if contents.is_spilled():
+            self.num_bytes_read += len(packed)
+        return self.row_codec.unpack(packed)
+
+    @profile_generator(MyProfileStat)
+    def iter_scan(self, return_row_id: bool = False) -> Generator[tuple, None, None]:
+        contents = cast(MemoryFileContents, self.contents)
+        unpack_row = self.row_codec.unpack
+        for row_id, packed in contents.iter_get():
+            if contents.is_spilled():
+                self.num_bytes_read += len(packed)
+            if return_row_id:
+                yield row_id, *(unpack_row(packed))
+            else:
+                yield unpack_row(packed)
+        return
+
+    @profile_generator(MyProfileStat)
+    def iter_scan_batches(self, return_row_id: bool = False, num_blocks: int = 1,
+                          zone_filter: Callable[[Zone], bool] | None = None,
+                          prefetch_blocks: int = 0) -> Generator[list[tuple], None, None]:
+        contents = cast(MemoryFileContents, self.contents)
+        unpack_row = self.row_codec.unpack
+        max_bytes = num_blocks * globals.BLOCK_SIZE
+        batch: list[tuple] = list()
+        num_bytes = 0
+        for row_id, packed in contents.iter_get():
+            if return_row_id:
+                batch.append((row_id, *(unpack_row(packed))))
+            else:
+                batch.append(unpack_row(packed))
+            num_bytes += len(packed)
+            if num_bytes >= max_bytes:
+                if contents.is_spilled():
+                    self.num_bytes_read += num_bytes
+                yield batch
+                batch = list()
+                num_bytes = 0
+        if len(batch) > 0:
+            if contents.is_spilled():
+                self.num_bytes_read += num_bytes
+            yield batch
+        return
+
+    @profile(MyProfileStat)
+    def put(self, row: tuple, row_id: int | None = None) -> int:
+        contents = cast(MemoryFileContents, self.contents)
+        num_bytes_in_memory = contents.num_bytes_in_memory()
+        packed = self.row_codec.pack(row)
+        if row_id is None:
+            row_id = contents.append(packed)
+        else:
+            contents.set(row_id, packed)
+        self._written(num_bytes_in_memory, len(packed))
+        return row_id
+
+    @profile(MyProfileStat)
+    def batch_append(self, rows: Iterable[tuple]) -> tuple[int, int]:
+        contents = cast(MemoryFileContents, self.contents)
+        num_bytes_in_memory = contents.num_bytes_in_memory()
+        num_bytes = contents.num_bytes
+        pack_row = self.row_codec.pack
+        row_id_start = len(contents.rows)
+        for row in rows:
+            contents.append(pack_row(row))
+        self._written(num_bytes_in_memory, contents.num_bytes - num_bytes)
+        return row_id_start, len(contents.rows) - row_id_start
+
+    def truncate(self) -> int:
+        contents = cast(MemoryFileContents, self.contents)
+        num_bytes_in_memory = contents.num_bytes_in_memory()
+        num_rows = contents.clear()
+        self.storage_manager.account(-num_bytes_in_memory)
+        return num_rows
+
+    @profile(MyProfileStat)
+    def delete(self, row_id: int) -> int:
+        contents = cast(MemoryFileContents, self.contents)
+        num_bytes_in_memory = contents.num_bytes_in_memory()
+        num_deleted = contents.set(row_id, None)
+        self.storage_manager.account(contents.num_bytes_in_memory() - num_bytes_in_memory)
+        return num_deleted
+
+    def _close(self):
+        self.contents = None
+        return
+
+class MemoryStorageManager(StorageManager):
+    """Storage manager for the tmp space that keeps heap files in memory (see :class:`.MemoryHeapFile`).
+    B+trees are not supported.
+
+    Transactions are only used to decide when files can be discarded:
+    a file belongs to the transaction that created it, and passes on to the enclosing transaction upon commit;
+    it is discarded when its transaction aborts, or when the top-level transaction it ends up with commits.
+    Writes to files are not undone by aborts, which is fine for the tmp space,
+    where each file is private to the statement using it.
+    The transaction manager (via :meth:`.LMDBStorageManager.transaction_committed`
+    and :meth:`.LMDBStorageManager.transaction_aborted`) is responsible for calling
+    :meth:`.transaction_committed` and :meth:`.transaction_aborted`.
+    """
+
+    def __init__(self, location: str, memory_budget: int = globals.DEFAULT_TMP_MEMORY_BUDGET,
+                 row_format: str = 'binary') -> None:
+        """Create a storage manager that keeps up to ``memory_budget`` bytes of packed rows in memory,
+        and spills files to scratch files under directory ``location`` beyond that.
+        Rows will be written in ``row_format`` (one of :data:`.serialize.ROW_FORMATS`).
+        """
+        super().__init__()
+        if row_format not in ROW_FORMATS:
+            raise StorageMangerException(f'unknown row format {row_format}')
+        self.location: Final = location
+        self.memory_budget: Final = memory_budget
+        self.row_format: Final = row_format
+        self.files: Final[dict[str, MemoryFileContents]] = dict()
+        self.owned: Final[dict[Transaction, set[str]]] = dict()
+        """Names of files created by each transaction (or passed on to it by its nested transactions).
+        """
+        self.memory_used: int = 0
+        """Total number of bytes of packed rows held in memory (i.e., in files not spilled).
+        """
+        return
+
+    def file_contents(self, tx: Transaction, name: str, create_if_not_exists: bool = False) -> MemoryFileContents:
+        """Return the contents of the file with the given ``name``, creating the file (owned by ``tx``) as needed
+        if requested by ``create_if_not_exists``.
+        """
+        if (contents := self.files.get(name)) is None:
+            if not create_if_not_exists:
+                raise StorageMangerException(f'file {name} not found')
+            contents = self.files[name] = MemoryFileContents()
+            self.owned.setdefault(tx, set()).add(name)
+        return contents
+
+    def account(self, delta: int) -> int:
+        """Account for a change of ``delta`` bytes in memory use,
+        spill files (largest first) until memory use is within budget, and return the number of bytes spilled.
+        """
+        self.memory_used += delta
+        num_bytes_spilled = 0
+        while self.memory_used > self.memory_budget:
+            contents = max(self.files.values(), key=lambda c: c.num_bytes_in_memory())
+            num_bytes_in_memory = contents.num_bytes_in_memory()
+            if num_bytes_in_memory == 0:
+                break
+            num_bytes_spilled += contents.spill(self.location)
+            self.memory_used -= num_bytes_in_memory
+        return num_bytes_spilled
+
+    def _discard(self, name: str) -> int:
+        if (contents := self.files.pop(name, None)) is None:
+            return 0
+        self.memory_used -= contents.num_bytes_in_memory()
+        contents.discard()
+        return 1
+
+    def transaction_committed(self, tx: Transaction) -> None:
+        """Must be called right after ``tx`` commits.
+        """
+        names = self.owned.pop(tx, set())
+        if (parent := tx.get_parent()) is not None:
+            self.owned.setdefault(parent, set()).update(names)
+        else:
+            for name in names:
+                self._discard(name)
+        return
+
+    def transaction_aborted(self, tx: Transaction) -> None:
+        """Must be called right after ``tx`` aborts.
+        """
+        for name in self.owned.pop(tx, set()):
+            self._discard(name)
+        return
+
+    def heap_file(self,
+                  tx: Transaction,
+                  name: str,
+                  row_type: RowType,
+                  create_if_not_exists: bool = False,
+                  compression: str | None = None,
+                  zone_map: bool = False
+    ) -> HeapFile:
+        """NOTE: ``compression`` and ``zone_map`` are ignored; rows are kept uncompressed without a zone map.
+        """
+        f = MemoryHeapFile(self, tx, name, row_type)
+        f._open(create_if_not_exists=create_if_not_exists)
+        return f
+
+    def delete_heap_file(self, tx: Transaction, name: str) -> int:
+        for names in self.owned.values():
+            names.discard(name)
+        return self._discard(name)
+
+    def bplus_tree(self,
+                   tx: Transaction,
+                   name: str,
+                   key_type: KeyType,
+                   row_type: RowType,
+                   unique: bool = False,
+                   create_if_not_exists: bool = False
+    ) -> BplusTree:
+        raise StorageMangerException(f'{name}: B+trees not supported by the in-memory storage manager')
+
+    def delete_bplus_tree(self, tx: Transaction, name: str) -> int:
+        return 0
+
+    def hash_index(self,
+                   tx: Transaction,
+                   name: str,
+                   key_type: KeyType,
+                   row_type: RowType,
+                   create_if_not_exists: bool = False
+    ) -> HashIndex:
+        raise StorageMangerException(f'{name}: hash indexes not supported by the in-memory storage manager')
+
+    def delete_hash_index(self, tx: Transaction, name: str) -> int:
+        return 0
+
+    def shutdown(self) -> None:
+        for name in list(self.files):
+            self._discard(name)
+        self.owned.clear()
+        return
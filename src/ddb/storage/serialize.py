@@ -1,16 +1,36 @@
 """Utility functions that serialize/deserialize Python objects for persistent storage.
 
-TODO: The implementation of row storage is based on ``pickle``.
-More efficient implementation may be possible.
+Rows can be stored in one of two formats.
+The generic format (:func:`.pack_row`/:func:`.unpack_row`) is based on ``pickle``.
+The binary format (:class:`.RowCodec`) is driven by the :data:`.RowType` of the file:
+it packs each value into a fixed-width slot (or a length-prefixed string for ``VARCHAR``),
+using a precompiled ``struct.Struct`` layout and a bitmap for ``NULL`` values.
+Encoded rows in either format can be told apart by their first byte,
+so :meth:`.RowCodec.unpack` can always read rows written in the generic format.
 
-NOTE: Currently, we pack/unpack integers using just 4 bytes, if they are stored as keys.
+Rows of a compressed heap file are grouped into blocks, each packed by :class:`.BlockCodec`
+(using one of the :data:`.COMPRESSIONS` from the standard library) into a single value.
+Each entry of a hash index is packed by :class:`.HashEntryCodec` into a single value.
+
+Keys are packed such that byte order reflects key order, which is what LMDB sorts by.
+Single-column ``INTEGER`` and ``VARCHAR`` keys (as well as row ids) use :func:`.pack_int`/:func:`.pack_str`;
+other keys, including composite (multi-column) ones, use :class:`.KeyCodec`.
+
+NOTE: :func:`.pack_int` packs integers using just 4 bytes.
 However, Python's ints are actually much, much wider.
 There will be a size difference when an int column is serialized (pickled) as part of a row,
 or when it's used in memory.
+:class:`.KeyCodec` uses 8 bytes instead.
 """
+from typing import Final, Callable, Iterable, Any, cast
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 import struct
 import pickle
+import zlib
+import lzma
 
+from ..primitives import ValType, RowType, KeyType
 from .interface import StorageMangerException
 
 def pack_int(i: int) -> bytes:
@@ -20,8 +40,8 @@ def pack_int(i: int) -> bytes:
     # add offset so min negative -> all 0's, and max positive -> all 1's
     return struct.pack('>I', i + 2147483648)
 
-def unpack_int(bytes: bytes) -> int:
-    """Deserialize 4 bytes into a signed integer in a way that is consistent with :meth:.pack_int; i.e.:
+def unpack_int(bytes: bytes | memoryview) -> int:
+    """Deserialize 4 bytes (or a buffer) into a signed integer in a way that is consistent with :meth:.pack_int; i.e.:
     ``unpack_int(pack_int(i)) == i``.
     """
     # subtract offset so min negative <- all 0's, and max positive <- all 1's
@@ -31,18 +51,18 @@ def pack_str(s: str) -> bytes:
     """Serialize a string into bytes, using the default encoding."""
     return s.encode()
 
-def unpack_str(bytes: bytes) -> str:
-    """Deserialize bytes into a string in a way that is consistent with :meth:.pack_str; i.e.:
+def unpack_str(bytes: bytes | memoryview) -> str:
+    """Deserialize bytes (or a buffer) into a string in a way that is consistent with :meth:.pack_str; i.e.:
     ``unpack_str(pack_str(s)) == s``.
     """
-    return bytes.decode()
+    return str(bytes, 'utf-8')
 
 def pack_row(row: tuple) -> bytes:
     """Serialize a tuple into bytes; there is no guarantee that the byte order reflects the natural row order."""
     return pickle.dumps(row)
 
-def unpack_row(bytes: bytes) -> tuple:
-    """Deserialize bytes into a tuple in a way that is consistent with :meth:.pack_row; i.e.:
+def unpack_row(bytes: bytes | memoryview) -> tuple:
+    """Deserialize bytes (or a buffer) into a tuple in a way that is consistent with :meth:.pack_row; i.e.:
     ``unpack_row(pack_row(t)) == t``.
     """
     obj = pickle.loads(bytes)
@@ -50,3 +70,422 @@ def unpack_row(bytes: bytes) -> tuple:
         raise StorageMangerException(f'unpacked object is not a row: {str(obj)}')
     else:
         return obj
+
+ROW_FORMATS: Final = ('binary', 'pickle')
+"""Supported storage formats for rows; see :meth:`.RowCodec.for_row_type`.
+"""
+
+_BINARY_ROW_TAG: Final = 1
+"""First byte of every row packed in the binary format.
+Pickled rows always start with the ``PROTO`` opcode (``0x80``) instead.
+"""
+
+_SLOT_FORMATS: Final = {
+    ValType.INTEGER: 'q',
+    ValType.FLOAT: 'd',
+    ValType.BOOLEAN: '?',
+    ValType.DATETIME: 'HBBBBBI',
+    ValType.VARCHAR: 'I', # length only; the encoded string itself follows the fixed-width part
+}
+"""``struct`` format for the fixed-width slot of each supported type.
+"""
+
+_BITMAP_FORMATS: Final = ((8, 'B'), (16, 'H'), (32, 'I'), (64, 'Q'))
+"""``struct`` format for the null bitmap, by max number of columns supported.
+"""
+
+class _FallBack(Exception):
+    """Raised by generated packing code when a value does not match its declared type.
+    """
+    pass
+
+def _raise_fall_back():
+    raise _FallBack
+
+class RowCodec:
+    """Serializer/deserializer of rows of a given :data:`.RowType`.
+
+    In the binary format, a row is laid out as a tag byte, a null bitmap,
+    one fixed-width slot per column (all packed by one precompiled ``struct.Struct``),
+    followed by the UTF-8 bytes of all non-null ``VARCHAR`` values, in column order.
+    ``INTEGER`` values take 8 bytes, so unlike :func:`.pack_int` they are not limited to 32 bits;
+    ``DATETIME`` values (without time zones) are broken into their fields.
+    Big-endian is used throughout, so a row consisting of a single non-negative ``INTEGER``
+    (e.g., a row id in a secondary index) sorts by its numeric value.
+
+    The generic ``pickle``-based format is used if the row type is empty or contains ``ANY``
+    (e.g., for temporary files and internal metadata), if it has more than 64 columns,
+    or for any row whose values do not exactly match the declared types
+    (e.g., an ``int`` in a ``FLOAT`` column, a ``datetime`` with time zone, or an integer wider than 64 bits).
+    Unpacking always accepts both formats.
+    """
+
+    def __init__(self, row_type: RowType, binary: bool = True) -> None:
+        self.row_type: Final = list(row_type)
+        self.binary: Final = binary and len(row_type) > 0 and len(row_type) <= 64 and\
+            all(t in _SLOT_FORMATS for t in row_type)
+        self.pack: Callable[[tuple], bytes]
+        """Serialize a row into bytes.
+        """
+        self.unpack: Callable[[bytes | memoryview], tuple]
+        """Deserialize bytes (or a buffer) into a row, in a way that is consistent with :attr:`.pack`.
+        """
+        if self.binary:
+            self.pack, self.unpack = type(self)._compile(self.row_type)
+        else:
+            self.pack, self.unpack = pack_row, unpack_row
+        return
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def for_row_type(cls, row_type: tuple[ValType, ...], row_format: str = 'binary') -> 'RowCodec':
+        """Return a (shared) codec for rows of the given type stored in the given format
+        (one of :data:`.ROW_FORMATS`).
+        """
+        if row_format not in ROW_FORMATS:
+            raise StorageMangerException(f'unknown row format {row_format}')
+        return cls(list(row_type), binary=(row_format == 'binary'))
+
+    def encodings(self, row: tuple) -> Iterable[bytes]:
+        """Return all encodings that may have been used to store the given row,
+        starting with the one that :attr:`.pack` would produce.
+        This is useful for finding an exact match among stored rows.
+        """
+        packed = self.pack(row)
+        yield packed
+        if packed[0] == _BINARY_ROW_TAG:
+            yield pack_row(row)
+        return
+
+    @staticmethod
+    def _compile(row_type: RowType) -> tuple[Callable[[tuple], bytes], Callable[[bytes | memoryview], tuple]]:
+        """Generate and compile Python code specialized for packing/unpacking rows of the given type.
+        """
+        n = len(row_type)
+        bitmap_format = next(f for m, f in _BITMAP_FORMATS if n <= m)
+        layout = struct.Struct('>B' + bitmap_format + ''.join(_SLOT_FORMATS[t] for t in row_type))
+        columns = [f'c{i}' for i in range(n)]
+        # packing code:
+        pack_lines = [f'def pack(row):',
+                      f'    {", ".join(columns)}, = row',
+                      f'    nulls = 0']
+        slots: list[str] = list()
+        strs: list[str] = list()
+        for i, (c, t) in enumerate(zip(columns, row_type)):
+            pack_lines.append(f'    if {c} is None:')
+            pack_lines.append(f'        nulls |= {1 << i}')
+            if t == ValType.VARCHAR:
+                pack_lines.append(f'        {c}_bytes = b""')
+                pack_lines.append(f'    else:')
+                pack_lines.append(f'        {c}_bytes = {c}.encode()')
+                slots.append(f'len({c}_bytes)')
+                strs.append(f'{c}_bytes')
+            elif t == ValType.DATETIME:
+                pack_lines.append(f'        {c} = _NULL_DATETIME')
+                pack_lines.append(f'    elif type({c}) is not _datetime or {c}.tzinfo is not None:')
+                pack_lines.append(f'        _fall_back()')
+                slots.extend(f'{c}.{a}' for a in ('year', 'month', 'day', 'hour', 'minute', 'second', 'microsecond'))
+            else:
+                pytype = { ValType.INTEGER: 'int', ValType.FLOAT: 'float', ValType.BOOLEAN: 'bool' }[t]
+                pack_lines.append(f'        {c} = {pytype}()')
+                pack_lines.append(f'    elif type({c}) is not {pytype}:')
+                pack_lines.append(f'        _fall_back()')
+                slots.append(c)
+        pack_lines.append(f'    return _layout.pack({_BINARY_ROW_TAG}, nulls, {", ".join(slots)})' +\
+                          ''.join(f' + {s}' for s in strs))
+        # unpacking code:
+        slot_vars: list[str] = list()
+        for c, t in zip(columns, row_type):
+            if t == ValType.DATETIME:
+                slot_vars.extend(f'{c}_{a}' for a in ('y', 'mo', 'd', 'h', 'mi', 's', 'us'))
+            elif t == ValType.VARCHAR:
+                slot_vars.append(f'{c}_len')
+            else:
+                slot_vars.append(c)
+        unpack_lines = [f'def unpack(b):',
+                        f'    if b[0] != {_BINARY_ROW_TAG}:',
+                        f'        return _unpack_row(b)',
+                        f'    _, nulls, {", ".join(slot_vars)}, = _layout.unpack_from(b)',
+                        f'    o = {layout.size}']
+        for i, (c, t) in enumerate(zip(columns, row_type)):
+            if t == ValType.VARCHAR:
+                unpack_lines.append(f'    {c} = str(b[o:o+{c}_len], "utf-8")')
+                unpack_lines.append(f'    o += {c}_len')
+            elif t == ValType.DATETIME:
+                unpack_lines.append(f'    {c} = None if nulls & {1 << i} else '
+                                    f'_datetime({c}_y, {c}_mo, {c}_d, {c}_h, {c}_mi, {c}_s, {c}_us)')
+        unpack_lines.append(f'    if nulls:')
+        unpack_lines.append(f'        return tuple(None if nulls & (1 << i) else v for i, v in enumerate(({", ".join(columns)},)))')
+        unpack_lines.append(f'    return ({", ".join(columns)},)')
+        namespace = {
+            '_layout': layout,
+            '_datetime': datetime,
+            '_NULL_DATETIME': datetime(1, 1, 1),
+            '_fall_back': _raise_fall_back,
+            '_unpack_row': unpack_row,
+        }
+        exec('\n'.join(pack_lines + unpack_lines), namespace)
+        pack_binary = cast(Callable[[tuple], bytes], namespace['pack'])
+        unpack = cast(Callable[[bytes | memoryview], tuple], namespace['unpack'])
+        def pack(row: tuple) -> bytes:
+            try:
+                return pack_binary(row)
+            except (_FallBack, ValueError, TypeError, AttributeError, struct.error):
+                return pack_row(row)
+        return pack, unpack
+
+
+_KEY_NULL: Final = b'\x00'
+"""Marker preceding a ``NULL`` key component; it sorts before :data:`._KEY_NOT_NULL`.
+"""
+
+_KEY_NOT_NULL: Final = b'\x01'
+"""Marker preceding a non-``NULL`` key component.
+"""
+
+_KEY_STR_END: Final = b'\x00\x01'
+"""Terminator of a ``VARCHAR`` key component; a zero byte within the string is escaped as ``00 FF``.
+"""
+
+_KEY_UINT64: Final = struct.Struct('>Q')
+_KEY_FLOAT64: Final = struct.Struct('>d')
+_KEY_SIGN_BIT: Final = 1 << 63
+_KEY_EPOCH: Final = datetime(1, 1, 1)
+_KEY_MICROSECOND: Final = timedelta(microseconds=1)
+
+def _pack_key_int(v: int) -> bytes:
+    # flip the sign bit so negative numbers come first:
+    return _KEY_UINT64.pack(v + _KEY_SIGN_BIT)
+
+def _unpack_key_int(b: bytes, o: int) -> tuple[int, int]:
+    return _KEY_UINT64.unpack_from(b, o)[0] - _KEY_SIGN_BIT, o + 8
+
+def _pack_key_float(v: float) -> bytes:
+    u = _KEY_UINT64.unpack(_KEY_FLOAT64.pack(float(v) + 0.0))[0] # adding 0.0 turns -0.0 into 0.0
+    # flip all bits of negative numbers (so larger magnitudes come first), and just the sign bit otherwise:
+    return _KEY_UINT64.pack(u ^ 0xFFFFFFFFFFFFFFFF if u & _KEY_SIGN_BIT else u | _KEY_SIGN_BIT)
+
+def _unpack_key_float(b: bytes, o: int) -> tuple[float, int]:
+    u = _KEY_UINT64.unpack_from(b, o)[0]
+    u = u ^ _KEY_SIGN_BIT if u & _KEY_SIGN_BIT else u ^ 0xFFFFFFFFFFFFFFFF
+    return _KEY_FLOAT64.unpack(_KEY_UINT64.pack(u))[0], o + 8
+
+def _pack_key_datetime(v: datetime) -> bytes:
+    if v.tzinfo is not None:
+        v = v.astimezone(timezone.utc).replace(tzinfo=None)
+    return _KEY_UINT64.pack((v - _KEY_EPOCH) // _KEY_MICROSECOND)
+
+def _unpack_key_datetime(b: bytes, o: int) -> tuple[datetime, int]:
+    return _KEY_EPOCH + _KEY_MICROSECOND * _KEY_UINT64.unpack_from(b, o)[0], o + 8
+
+def _pack_key_bool(v: bool) -> bytes:
+    return b'\x01' if v else b'\x00'
+
+def _unpack_key_bool(b: bytes, o: int) -> tuple[bool, int]:
+    return b[o] != 0, o + 1
+
+def _pack_key_str(v: str) -> bytes:
+    return v.encode().replace(b'\x00', b'\x00\xff') + _KEY_STR_END
+
+def _unpack_key_str(b: bytes, o: int) -> tuple[str, int]:
+    start = o
+    while True:
+        zero = b.find(b'\x00', o)
+        if b[zero + 1] != 0xff: # not an escaped zero byte, so it must be the terminator
+            break
+        o = zero + 2
+    return b[start:zero].replace(b'\x00\xff', b'\x00').decode(), zero + 2
+
+_KEY_COMPONENT_CODECS: Final[dict[ValType, tuple[Callable[[Any], bytes], Callable[[bytes, int], tuple[Any, int]]]]] = {
+    ValType.INTEGER: (_pack_key_int, _unpack_key_int),
+    ValType.FLOAT: (_pack_key_float, _unpack_key_float),
+    ValType.DATETIME: (_pack_key_datetime, _unpack_key_datetime),
+    ValType.BOOLEAN: (_pack_key_bool, _unpack_key_bool),
+    ValType.VARCHAR: (_pack_key_str, _unpack_key_str),
+}
+"""Packing/unpacking functions for each supported type of key component.
+Each unpacking function takes the bytes and the offset to start from,
+and returns the value together with the offset right after it.
+"""
+
+class KeyCodec:
+    """Order-preserving serializer/deserializer of keys of a given :data:`.KeyType`,
+    such that comparing packed keys byte by byte agrees with comparing the keys themselves.
+
+    A composite key (whose type is a tuple) is a tuple of values, packed by concatenating its components.
+    Each component consists of a marker byte (so ``NULL`` sorts before all other values), followed by:
+
+    * for ``INTEGER``, 8 bytes of two's complement with the sign bit flipped;
+    * for ``FLOAT``, the 8 bytes of the IEEE 754 double,
+      with the sign bit flipped for a non-negative number or all bits flipped for a negative one;
+    * for ``DATETIME``, 8 bytes counting microseconds since 0001-01-01
+      (a value with a time zone is converted to UTC first, and is unpacked without one);
+    * for ``BOOLEAN``, 1 byte;
+    * for ``VARCHAR``, the UTF-8 bytes with zero bytes escaped, followed by a 2-byte terminator.
+
+    Because every component is self-delimiting, a prefix of a composite key
+    (i.e., a shorter tuple with values for its leading columns) is packed into a prefix of the full key's bytes,
+    which sorts before all full keys starting with it;
+    hence a prefix can be used as the lower bound of a B+tree scan.
+    A scalar key (whose type is a single ``ValType``) is packed just like a composite key with one component.
+    """
+
+    def __init__(self, key_type: KeyType) -> None:
+        self.key_type: Final = key_type
+        self.composite: Final = isinstance(key_type, tuple)
+        component_types = key_type if isinstance(key_type, tuple) else (key_type, )
+        for t in component_types:
+            if t not in _KEY_COMPONENT_CODECS:
+                raise StorageMangerException(f'{t.name} key currently not supported')
+        self._packs: Final = tuple(_KEY_COMPONENT_CODECS[t][0] for t in component_types)
+        self._unpacks: Final = tuple(_KEY_COMPONENT_CODECS[t][1] for t in component_types)
+        self.pack: Callable[[Any], bytes]
+        """Serialize a key (or, for a composite key, a prefix thereof) into bytes.
+        """
+        self.unpack: Callable[[bytes | memoryview], Any]
+        """Deserialize bytes (or a buffer) into a key, in a way that is consistent with :attr:`.pack`.
+        """
+        if self.composite:
+            self.pack, self.unpack = self._pack_tuple, self._unpack_tuple
+        else:
+            self.pack, self.unpack = self._pack_scalar, self._unpack_scalar
+        return
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def for_key_type(cls, key_type: KeyType) -> 'KeyCodec':
+        """Return a (shared) codec for keys of the given type.
+        """
+        return cls(key_type)
+
+    def _pack_tuple(self, key: tuple) -> bytes:
+        if len(key) > len(self._packs):
+            raise StorageMangerException(f'key {key} has more components than {len(self._packs)}')
+        return b''.join(_KEY_NULL if v is None else _KEY_NOT_NULL + pack(v) for pack, v in zip(self._packs, key))
+
+    def _unpack_tuple(self, b: bytes | memoryview) -> tuple:
+        b = bytes(b)
+        values: list[Any] = list()
+        o = 0
+        for unpack in self._unpacks:
+            if o >= len(b):
+                break
+            if b[o] == _KEY_NULL[0]:
+                values.append(None)
+                o += 1
+            else:
+                v, o = unpack(b, o + 1)
+                values.append(v)
+        return tuple(values)
+
+    def _pack_scalar(self, key: Any) -> bytes:
+        return _KEY_NULL if key is None else _KEY_NOT_NULL + self._packs[0](key)
+
+    def _unpack_scalar(self, b: bytes | memoryview) -> Any:
+        b = bytes(b)
+        return None if b[0] == _KEY_NULL[0] else self._unpacks[0](b, 1)[0]
+
+
+_COMPRESSORS: Final[dict[str, tuple[Callable[[bytes], bytes], Callable[[bytes | memoryview], bytes]]]] = {
+    # compressed blocks are mostly spilled data that are written once and read once or twice,
+    # so favor speed over compression ratio:
+    'zlib': (lambda b: zlib.compress(b, 1), zlib.decompress),
+    'lzma': (lambda b: lzma.compress(b, preset=0), lzma.decompress),
+}
+
+COMPRESSIONS: Final = tuple(_COMPRESSORS.keys())
+"""Supported compression methods for heap files; see :class:`.BlockCodec`.
+"""
+
+_BLOCK_HEADER: Final = struct.Struct('>I')
+"""Uncompressed header of a block: the number of rows therein.
+"""
+
+_BLOCK_ENTRY_HEADER: Final = struct.Struct('>iI')
+"""Header of each row in a block (before compression): its row id and the length of the packed row that follows.
+"""
+
+class BlockCodec:
+    """Serializer/deserializer of blocks of rows, for heap files stored in compressed form.
+
+    A block is a sequence of (row id, packed row) entries, where each row has been packed by a :class:`.RowCodec`.
+    The entries are concatenated (each with a small header giving the row id and the length of the row)
+    and compressed as a whole, after an uncompressed header giving the number of entries,
+    so that rows can be counted without decompressing the block.
+    """
+
+    def __init__(self, compression: str) -> None:
+        if compression not in _COMPRESSORS:
+            raise StorageMangerException(f'unknown compression {compression}')
+        self.compression: Final = compression
+        self._compress, self._decompress = _COMPRESSORS[compression]
+        return
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def for_compression(cls, compression: str) -> 'BlockCodec':
+        """Return a (shared) codec for the given compression method (one of :data:`.COMPRESSIONS`).
+        """
+        return cls(compression)
+
+    def pack(self, entries: list[tuple[int, bytes]]) -> bytes:
+        """Serialize a block, given as a list of (row id, packed row) entries, into bytes.
+        """
+        pack_header = _BLOCK_ENTRY_HEADER.pack
+        payload = b''.join(pack_header(row_id, len(row)) + row for row_id, row in entries)
+        return _BLOCK_HEADER.pack(len(entries)) + self._compress(payload)
+
+    def unpack(self, b: bytes | memoryview) -> list[tuple[int, bytes]]:
+        """Deserialize bytes (or a buffer) into a list of (row id, packed row) entries,
+        in a way that is consistent with :meth:`.pack`.
+        """
+        payload = self._decompress(memoryview(b)[_BLOCK_HEADER.size:])
+        unpack_header = _BLOCK_ENTRY_HEADER.unpack_from
+        header_size = _BLOCK_ENTRY_HEADER.size
+        entries: list[tuple[int, bytes]] = list()
+        o = 0
+        while o < len(payload):
+            row_id, length = unpack_header(payload, o)
+            o += header_size
+            entries.append((row_id, payload[o:o+length]))
+            o += length
+        return entries
+
+    @staticmethod
+    def count(b: bytes | memoryview) -> int:
+        """Return the number of rows in the block serialized as bytes (or a buffer), without decompressing it.
+        """
+        return _BLOCK_HEADER.unpack_from(b)[0]
+
+_HASH_ENTRY_HEADER: Final = struct.Struct('>H')
+"""Header of an entry of a hash index: the length of the packed key that follows.
+"""
+
+class HashEntryCodec:
+    """Serializer/deserializer of entries of a hash index.
+
+    An entry combines a packed key (packed as for a B+tree) and a packed row (packed by a :class:`.RowCodec`)
+    into a single value, which starts with the length of the key followed by the key itself.
+    This prefix is the same for all entries with the same key and is not a prefix of that of any other key,
+    so entries stored in byte order keep those with the same key together.
+    """
+
+    @staticmethod
+    def prefix(k: bytes) -> bytes:
+        """Return the prefix shared by all entries with the packed key ``k``.
+        """
+        return _HASH_ENTRY_HEADER.pack(len(k)) + k
+
+    @staticmethod
+    def pack(k: bytes, v: bytes) -> bytes:
+        """Serialize the entry with packed key ``k`` and packed row ``v`` into bytes.
+        """
+        return _HASH_ENTRY_HEADER.pack(len(k)) + k + v
+
+    @staticmethod
+    def unpack(b: bytes | memoryview) -> tuple[bytes | memoryview, bytes | memoryview]:
+        """Deserialize bytes (or a buffer) into the packed key and packed row of an entry,
+        which are slices of (and hence only valid as long as) ``b``.
+        """
+        o = _HASH_ENTRY_HEADER.size + _HASH_ENTRY_HEADER.unpack_from(b)[0]
+        return b[_HASH_ENTRY_HEADER.size:o], b[o:]
@@ -8,9 +8,10 @@ from .interface import TransactionStatus, TransactionManager, TransactionExcepti
 
 class LMDBTransaction(LMDBTransactionInterface):
     def __init__(self, tm: 'LMDBTransactionManager', id: int, lmdb_tx: lmdb.Transaction,
-                 parent: 'LMDBTransaction | None' = None, read_only: bool = False) -> None:
+                 parent: 'LMDBTransaction | None' = None, read_only: bool = False, durability: str | None = None) -> None:
         super().__init__(tm, id, lmdb_tx, read_only=read_only)
         self.parent: Final['LMDBTransaction | None'] = parent
+        self.durability: Final = durability
         if self.parent is not None:
             self.parent.children.append(self)
         self.children: Final[list['LMDBTransaction']] = list()
@@ -25,7 +26,8 @@ class LMDBTransactionManager(TransactionManager[LMDBTransaction]):
         self.sm: Final = sm
         return
 
-    def begin_transaction(self, parent: LMDBTransaction | None = None, read_only: bool = False, tmp: bool = False) -> LMDBTransaction:
+    def begin_transaction(self, parent: LMDBTransaction | None = None, read_only: bool = False, tmp: bool = False,
+                          durability: str | None = None) -> LMDBTransaction:
         if parent is not None:
             if parent.read_only and not read_only:
                 raise TransactionException(f'cannot nest read/write transaction in ready-only transaction {parent.id}')
@@ -35,12 +37,13 @@ class LMDBTransactionManager(TransactionManager[LMDBTransaction]):
                 raise TransactionException(f'cannot nest an in-tmp transaction in regular transaction {parent.id}')
         if tmp:
             lmdb_tx = self.sm.tmp_env.begin(parent = parent.lmdb_tx if parent is not None else None,
-                                            write = not(read_only))
+                                            write = not(read_only), buffers = self.sm.zero_copy)
             return LMDBTransactionInTmp(self, time.monotonic_ns(), lmdb_tx, parent = parent, read_only = read_only)
         else:
             lmdb_tx = self.sm.env.begin(parent = parent.lmdb_tx if parent is not None else None,
-                                        write = not(read_only))
-            return LMDBTransaction(self, time.monotonic_ns(), lmdb_tx, parent = parent, read_only = read_only)
+                                        write = not(read_only), buffers = self.sm.zero_copy)
+            return LMDBTransaction(self, time.monotonic_ns(), lmdb_tx, parent = parent, read_only = read_only,
+                                   durability = durability)
 
     def is_tmp(self, tx: LMDBTransaction) -> bool:
         return isinstance(tx, LMDBTransactionInTmp)
@@ -62,6 +65,12 @@ class LMDBTransactionManager(TransactionManager[LMDBTransaction]):
                 raise TransactionException(f'cannot commit transaction {tx.id} with active nested transaction {child.id}')
         tx.lmdb_tx.commit()
         tx.status = TransactionStatus.COMMITTED
+        self.sm.transaction_committed(tx)
+        self.sm.flush(tx, durability=tx.durability)
+        # cached row ids are now valid for the parent too:
+        if tx.parent is not None:
+            tx.parent.next_row_ids.update(tx.next_row_ids)
+        tx.next_row_ids.clear()
         return
 
     def abort(self, tx: LMDBTransaction) -> None:
@@ -72,4 +81,7 @@ class LMDBTransactionManager(TransactionManager[LMDBTransaction]):
                 self.abort(child)
         tx.lmdb_tx.abort()
         tx.status = TransactionStatus.ABORTED
+        self.sm.transaction_aborted(tx)
+        # row ids cached by this transaction may no longer be consistent with the files:
+        tx.next_row_ids.clear()
         return
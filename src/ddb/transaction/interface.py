@@ -40,10 +40,13 @@ class TransactionManager(ABC, Generic[T]):
     """
 
     @abstractmethod
-    def begin_transaction(self, parent: T | None = None, read_only: bool = False, tmp: bool = False) -> T:
+    def begin_transaction(self, parent: T | None = None, read_only: bool = False, tmp: bool = False,
+                          durability: str | None = None) -> T:
         """Begin a new transaction.
         If ``parent`` is given, the new transaction will be nested therein.
         If ``tmp`` is set, the new transaction will be operating in the separate tmp space.
+        ``durability`` (as understood by the underlying storage manager) controls how the commit of
+        a top-level transaction is made durable; ``None`` means the default of the storage manager.
         """
         pass
 
@@ -1,6 +1,6 @@
 from abc import ABCMeta
 from dataclasses import dataclass, fields
-from typing import Iterable, TypeVar, Generic, cast
+from typing import Iterable, Iterator, TypeVar, Generic, cast
 
 
 T = TypeVar('T', int, float)
@@ -24,6 +24,42 @@ class MinMaxSum(Generic[T]):
         self.sum += other
         return
 
+E = TypeVar('E')
+"""Type variable for the generic function :func:`.iter_batches`.
+"""
+
+def iter_batches(items: Iterable[E], batch_size: int) -> Iterator[list[E]]:
+    """Return an iterator over lists of (up to) ``batch_size`` consecutive ``items``, in order.
+    Each list is new, so the caller is free to keep it; no list is empty.
+    """
+    batch: list[E] = list()
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = list()
+    if len(batch) > 0:
+        yield batch
+    return
+
+def coalesce_batches(batches: Iterable[list[E]], batch_size: int) -> Iterator[list[E]]:
+    """Return an iterator over lists of the items in ``batches``, in order,
+    where consecutive smaller batches are combined until they have at least ``batch_size`` items.
+    As with :func:`.iter_batches`, no list is empty, and the caller is free to keep each list.
+    """
+    combined: list[E] = list()
+    for batch in batches:
+        if len(combined) == 0 and len(batch) >= batch_size:
+            yield batch
+            continue
+        combined.extend(batch)
+        if len(combined) >= batch_size:
+            yield combined
+            combined = list()
+    if len(combined) > 0:
+        yield combined
+    return
+
 class CustomInitMeta(ABCMeta):
     """A helper metaclass intended for abstract base classes that will automatically
     call a method ``__post_init__()`` (if it exists) after ``__init__()``.
@@ -120,9 +120,16 @@ class AnalyzeStatsLop(Lop):
         return
 
 class CreateIndexLop(Lop):
-    def __init__(self, base_metadata: BaseTableMetadata, column_index: int) -> None:
+    def __init__(self, base_metadata: BaseTableMetadata, column_index: int | tuple[int, ...],
+                 included_column_indices: tuple[int, ...] = tuple(), use_hash: bool = False) -> None:
+        """``column_index`` is a tuple of column indices (in key order) for a composite index.
+        ``included_column_indices`` are the indices of columns whose values are to be stored in the index too.
+        ``use_hash`` asks for a hash index (for a single column only) instead of a B+tree.
+        """
         self.base_metadata: Final = base_metadata
         self.column_index: Final = column_index
+        self.included_column_indices: Final = included_column_indices
+        self.use_hash: Final = use_hash
         return
 
     def is_read_only(self) -> bool: return False
@@ -132,6 +139,10 @@ class CreateIndexLop(Lop):
     def pstr_more(self) -> Iterable[str]:
         yield from self.base_metadata.pstr()
         yield f'key column index: {self.column_index}'
+        if len(self.included_column_indices) > 0:
+            yield f'included column indices: {self.included_column_indices}'
+        if self.use_hash:
+            yield 'using hash'
         return
 
 class DeleteLop(Lop):
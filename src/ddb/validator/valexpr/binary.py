@@ -13,6 +13,10 @@ class BinaryOpValExpr(ValExpr):
     NOTE: This should be best enforced as an abstract class attribute, but Python doesn't quite support it.
     """
 
+    ufunc: str | None = None
+    """The NumPy function (as code) for generating vectorized code, or ``None`` if the op cannot be vectorized.
+    """
+
     def __init__(self, left: ValExpr, right: ValExpr) -> None:
         super().__init__((left, right))
         return
@@ -32,6 +36,15 @@ class BinaryOpValExpr(ValExpr):
         left_code, right_code = children_code_str
         return f'({left_code}) {type(self).op} ({right_code})'
 
+    def _vector_code_str(self, children_code_str: tuple[str, ...]) -> str | None:
+        if type(self).ufunc is None:
+            return None
+        left_code, right_code = children_code_str
+        if self.valtype() == ValType.INTEGER: # guard against overflow
+            return f'int_arith({type(self).ufunc}, ({left_code}), ({right_code}))'
+        else:
+            return f'{type(self).ufunc}(({left_code}), ({right_code}))'
+
     def to_str(self) -> str:
         return f'({self.children()[0].to_str()}) {type(self).op} ({self.children()[1].to_str()})'
 
@@ -43,15 +56,19 @@ class BinaryOpValExpr(ValExpr):
 
 class PLUS(ArithOpValExpr, BinaryOpValExpr):
     op = '+'
+    ufunc = 'np.add'
 
 class MINUS(ArithOpValExpr, BinaryOpValExpr):
     op = '-'
+    ufunc = 'np.subtract'
 
 class MULTIPLY(ArithOpValExpr, BinaryOpValExpr):
     op = '*'
+    ufunc = 'np.multiply'
 
 class DIVIDE(ArithOpValExpr, BinaryOpValExpr):
     op = '/'
+    ufunc = 'np.divide'
 
     def _code_str(self, children_code_str: tuple[str, ...]) -> str:
         left_code, right_code = children_code_str
@@ -62,9 +79,17 @@ class DIVIDE(ArithOpValExpr, BinaryOpValExpr):
         else:
             return super()._code_str(children_code_str)
 
+    def _vector_code_str(self, children_code_str: tuple[str, ...]) -> str | None:
+        left_code, right_code = children_code_str
+        if self.valtype() == ValType.INTEGER:
+            return f'int_arith(np.floor_divide, ({left_code}), ({right_code}))'
+        else:
+            return super()._vector_code_str(children_code_str)
+
 class MOD(UniTypeOpValExpr, BinaryOpValExpr):
     uni_type = ValType.INTEGER
     op = '%'
+    ufunc = 'np.remainder'
 
 class CONCAT(UniTypeOpValExpr, BinaryOpValExpr):
     uni_type = ValType.VARCHAR
@@ -85,9 +110,11 @@ class REGEXPLIKE(BinaryOpValExpr):
 
 class AND(BoolOpValExpr, BinaryOpValExpr):
     op = 'and'
+    ufunc = 'np.logical_and'
 
 class OR(BoolOpValExpr, BinaryOpValExpr):
     op = 'or'
+    ufunc = 'np.logical_or'
 
 class CompareOpValExpr(BinaryOpValExpr):
     def _validate_valtype(self) -> tuple[ValType, ...]:
@@ -102,6 +129,11 @@ class CompareOpValExpr(BinaryOpValExpr):
             raise ValidatorException(f'cannot directly compare {left.valtype().name} and {right.valtype().name}')
         return ValType.BOOLEAN, desired_child_type, desired_child_type
 
+    def _vector_code_str(self, children_code_str: tuple[str, ...]) -> str | None:
+        if self.children()[0].valtype() not in (ValType.INTEGER, ValType.FLOAT, ValType.BOOLEAN):
+            return None
+        return self._code_str(children_code_str) # NumPy overloads comparison operators elementwise
+
 class EQ(CompareOpValExpr):
     op = '=='
 
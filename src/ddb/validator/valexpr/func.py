@@ -148,3 +148,14 @@ class CAST(OFunCallValExpr):
             return f'int({children_code_str[0]})'
         else:
             raise ValidatorException('unexpected error')
+
+    def _vector_code_str(self, children_code_str: tuple[str, ...]) -> str | None:
+        arg = self.children()[0]
+        if arg.valtype() == self.options['AS']:
+            return children_code_str[0]
+        elif arg.valtype() == ValType.INTEGER and self.options['AS'] == ValType.FLOAT:
+            return f'np.asarray({children_code_str[0]}, dtype=np.float64)'
+        elif arg.valtype() == ValType.FLOAT and self.options['AS'] == ValType.INTEGER:
+            return f'np.asarray({children_code_str[0]}).astype(np.int64)' # truncates toward zero like int()
+        else: # conversions from/to strings may differ subtly from Python's
+            return None
@@ -85,6 +85,14 @@ class ValExpr(ABC, metaclass=CustomInitMeta):
         """
         pass
 
+    def _vector_code_str(self, children_code_str: tuple[str, ...]) -> str | None:
+        """Same as :meth:`._code_str`, but for the ``numpy`` backend of :func:`.to_code_str`:
+        the Python expression should compute over NumPy arrays (or scalars) holding values for an entire batch of rows.
+        Return ``None`` if this expression cannot be vectorized, which is the default;
+        subclasses should override this method as appropriate.
+        """
+        return None
+
 class ArithOpValExpr(ValExpr):
     """An arithmetic operator.
     """
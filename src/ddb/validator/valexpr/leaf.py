@@ -41,6 +41,9 @@ class Literal(LeafValExpr):
             case _:
                 raise NotImplementedError
 
+    def _vector_code_str(self, children_code_str: tuple[str, ...]) -> str | None:
+        return self._code_str(children_code_str) # a scalar is broadcast as needed
+
 class LiteralString(Literal):
     """A literal string value.
     """
@@ -132,6 +135,12 @@ class RelativeColumnRef(LeafValExpr):
             raise TypeError
         return f'{row_vars[self.input_index]}[{self.column_index}]'
 
+    def _vector_code_str(self, children_code_str: tuple[str, ...],
+                         output_lineages: list[OutputLineage] | None = None, row_vars: list[str] | None = None) -> str:
+        if row_vars is None:
+            raise TypeError
+        return f'{row_vars[self.input_index]}.column({self.column_index}, ValType.{self.column_type.name})'
+
     def to_str(self) -> str:
         return f'((input){self.input_index}.(column){self.column_index})'
 
@@ -163,5 +172,14 @@ class NamedColumnRef(LeafValExpr):
                 return f'{row_vars[input_index]}[{column_index}]'
         raise ValidatorException(f'invalid column reference {self.table_alias}.{self.column_name}')
 
+    def _vector_code_str(self, children_code_str: tuple[str, ...],
+                         output_lineages: list[OutputLineage] | None = None, row_vars: list[str] | None = None) -> str:
+        if output_lineages is None or row_vars is None:
+            raise TypeError
+        for input_index, output_lineage in enumerate(output_lineages):
+            if (column_index := find_column_in_lineage(self.table_alias, self.column_name, output_lineage)) is not None:
+                return f'{row_vars[input_index]}.column({column_index}, ValType.{self.column_type.name})'
+        raise ValidatorException(f'invalid column reference {self.table_alias}.{self.column_name}')
+
     def to_str(self) -> str:
         return f'{self.table_alias}.{self.column_name}'
@@ -1,3 +1,5 @@
+from ...primitives import ValType
+
 from ..interface import ValidatorException
 from .interface import ValExpr, ArithOpValExpr, BoolOpValExpr
 
@@ -35,5 +37,14 @@ class UnaryOpValExpr(ValExpr):
 class NEG(ArithOpValExpr, UnaryOpValExpr):
     op = '-'
 
+    def _vector_code_str(self, children_code_str: tuple[str, ...]) -> str | None:
+        if self.valtype() == ValType.INTEGER: # guard against overflow
+            return f'int_arith(np.negative, ({children_code_str[0]}))'
+        else:
+            return f'np.negative({children_code_str[0]})'
+
 class NOT(BoolOpValExpr, UnaryOpValExpr):
     op = 'not'
+
+    def _vector_code_str(self, children_code_str: tuple[str, ...]) -> str | None:
+        return f'np.logical_not({children_code_str[0]})'
@@ -260,20 +260,46 @@ def is_computable_from(e: ValExpr, exprs: list[ValExpr]) -> bool:
     """
     return relativize(e, [[set()]*len(exprs)], [exprs], None) is not None
 
-def to_code_str(expr: ValExpr, output_lineages: list[OutputLineage], row_vars: list[str]) -> str:
+VECTORIZABLE_VALTYPES: Final = (ValType.INTEGER, ValType.FLOAT, ValType.BOOLEAN)
+"""Types of columns whose values can be computed over as NumPy arrays by code from :func:`.to_code_str`.
+"""
+
+def to_code_str(expr: ValExpr, output_lineages: list[OutputLineage], row_vars: list[str], backend: str = 'python') -> str:
     """Convert ``expr`` to a Python expression for evaluation inside a :class:`.QPop`.
     The list of ``OutputLineage`` objects, one for each children,
     is useful in converting :class:`.NamedColumnRef` to an index into an input row.
     The ``row_vars`` list specifies how the code should refer to a row when converting a column reference
     (:class:`.NamedColumnRef` or :class:`.RelativeColumnRef`):
     a row from the ``QPop``'s input at index ``i`` will be referred to using variable named ``row_vars[i]``.
+
+    With the default ``python`` backend, the code evaluates ``expr`` for one row at a time.
+    With the ``numpy`` backend, the code instead evaluates ``expr`` for an entire batch of rows at once,
+    with each variable in ``row_vars`` referring to a :class:`.ColumnarBatch`,
+    so a column reference gives the NumPy array of all values in that column (typed by the column's ``ValType``)
+    and the code computes the NumPy array of all results.
+    Only columns of types in ``VECTORIZABLE_VALTYPES`` can be referenced:
+    converting strings to NumPy arrays costs more than vectorized string functions can save.
+    If some part of ``expr`` cannot be vectorized this way, ``ValidatorException`` is raised.
     """
+    if backend == 'numpy' and isinstance(expr, (leaf.NamedColumnRef, leaf.RelativeColumnRef)) and \
+            expr.valtype() not in VECTORIZABLE_VALTYPES:
+        raise ValidatorException(f'column of {expr.valtype().name} cannot be vectorized')
     if isinstance(expr, leaf.NamedColumnRef):
+        if backend == 'numpy':
+            return expr._vector_code_str((), output_lineages=output_lineages, row_vars=row_vars)
         return expr._code_str((), output_lineages=output_lineages, row_vars=row_vars)
     elif isinstance(expr, leaf.RelativeColumnRef):
+        if backend == 'numpy':
+            return expr._vector_code_str((), row_vars=row_vars)
         return expr._code_str((), row_vars=row_vars)
-    else:
-        return expr._code_str(tuple(to_code_str(c, output_lineages, row_vars) for c in expr.children()))
+    children_code_str = tuple(to_code_str(c, output_lineages, row_vars, backend) for c in expr.children())
+    if backend == 'python':
+        return expr._code_str(children_code_str)
+    elif backend != 'numpy':
+        raise ValidatorException(f'unknown backend {backend}')
+    elif (code := expr._vector_code_str(children_code_str)) is None:
+        raise ValidatorException(f'{type(expr).__name__} cannot be vectorized')
+    return code
 
 def eval_literal(expr: ValExpr) -> Any:
     """Assuming that the expression doesn't contain any column reference,
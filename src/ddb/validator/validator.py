@@ -8,6 +8,7 @@ from sqlglot.optimizer.qualify import qualify
 
 from ..primitives import ValType, RowType
 from ..metadata import MetadataManager, BaseTableMetadata
+from ..storage import COMPRESSIONS
 from ..transaction import Transaction
 from ..parser import parse
 
@@ -56,6 +57,12 @@ def validate_type(type: exp.DataType.Type) -> ValType:
     else:
         raise ValidatorException(f'type {type} currently not supported')
 
+def validate_switch(property: exp.Property) -> bool:
+    value = property.args['value'].name.lower()
+    if value not in ('on', 'off'):
+        raise ValidatorException(f'{property.name.lower()} must be either on or off')
+    return value == 'on'
+
 def validate_create_table(mm: MetadataManager, tx: Transaction, parse_tree: exp.Create) -> CreateTableLop:
     table_name = cast(exp.Table, parse_tree.find(exp.Table)).this.name
     if table_name.startswith('.'):
@@ -77,22 +84,65 @@ def validate_create_table(mm: MetadataManager, tx: Transaction, parse_tree: exp.
     if parse_tree.find(exp.ColumnConstraint) is not None:
         raise ValidatorException('column constraint in CREATE TABLE currently not supported')
     primary_key = parse_tree.find(exp.PrimaryKey)
+    primary_key_column_index: int | None = None
+    composite_primary_key: tuple[int, ...] | None = None
     if primary_key is not None:
-        if len(primary_key.expressions) > 1:
-            raise ValidatorException('multi-column primary key currently not supported')
-        primary_key_column = primary_key.expressions[0].name
-        if primary_key_column not in column_names:
-            raise ValidatorException(f'primary key column {primary_key_column} not declared in CREATE TABLE')
-        primary_key_column_index = column_names.index(primary_key_column)
-        if column_types[primary_key_column_index] not in (ValType.INTEGER, ValType.VARCHAR):
-            raise ValidatorException(f'index key type {column_types[primary_key_column_index].name} currently not supported')
-    else:
-        primary_key_column_index = None
+        primary_key_column_indices: list[int] = list()
+        for primary_key_column in (e.name for e in primary_key.expressions):
+            if primary_key_column not in column_names:
+                raise ValidatorException(f'primary key column {primary_key_column} not declared in CREATE TABLE')
+            primary_key_column_indices.append(column_names.index(primary_key_column))
+        if len(primary_key_column_indices) != len(set(primary_key_column_indices)):
+            raise ValidatorException('duplicate columns in primary key')
+        if len(primary_key_column_indices) == 1:
+            primary_key_column_index = primary_key_column_indices[0]
+        else:
+            composite_primary_key = tuple(primary_key_column_indices)
+    compression: str | None = None
+    dictionary_column_indices: list[int] = list()
+    zone_map = False
+    bloom_filter = False
+    if (properties := parse_tree.args.get('properties')) is not None:
+        for property in properties.expressions:
+            if not isinstance(property, exp.Property):
+                raise ValidatorException('table property in CREATE TABLE currently not supported')
+            elif property.name.lower() == 'compression':
+                compression = property.args['value'].name.lower()
+                if compression not in COMPRESSIONS:
+                    raise ValidatorException(f'compression {compression} not supported (use one of {", ".join(COMPRESSIONS)})')
+                if primary_key_column_index is not None:
+                    raise ValidatorException('compression currently not supported for a table with a single-column primary key')
+            elif property.name.lower() == 'dictionary':
+                for dictionary_column in property.args['value'].name.split(','):
+                    dictionary_column = dictionary_column.strip().lower()
+                    if dictionary_column not in column_names:
+                        raise ValidatorException(f'dictionary column {dictionary_column} not declared in CREATE TABLE')
+                    column_index = column_names.index(dictionary_column)
+                    if column_types[column_index] != ValType.VARCHAR:
+                        raise ValidatorException(f'dictionary column {dictionary_column} is not VARCHAR')
+                    if column_index == primary_key_column_index:
+                        raise ValidatorException(f'dictionary column {dictionary_column} cannot be the primary key')
+                    if column_index not in dictionary_column_indices:
+                        dictionary_column_indices.append(column_index)
+            elif property.name.lower() == 'zone_map':
+                zone_map = validate_switch(property)
+                if zone_map and primary_key_column_index is not None:
+                    raise ValidatorException('zone map currently not supported for a table with a single-column primary key')
+            elif property.name.lower() == 'bloom_filter':
+                bloom_filter = validate_switch(property)
+            else:
+                raise ValidatorException('table property in CREATE TABLE currently not supported')
     return CreateTableLop(BaseTableMetadata(column_names = column_names,
                                             column_types = column_types,
                                             name = table_name,
                                             primary_key_column_index = primary_key_column_index,
-                                            secondary_column_indices = list()))
+                                            secondary_column_indices = list(),
+                                            composite_indices = ([composite_primary_key] if composite_primary_key is not None else list()),
+                                            composite_primary_key = composite_primary_key,
+                                            compression = compression,
+                                            dictionary_column_indices = dictionary_column_indices,
+                                            zone_map = zone_map,
+                                            bloom_filter = bloom_filter))
 
 def validate_analyze(mm: MetadataManager, tx: Transaction, parse_tree: exp.Command) -> AnalyzeStatsLop:
     if (t := parse_tree.find(exp.Literal)) is not None:
@@ -111,20 +161,46 @@ def validate_create_index(mm: MetadataManager, tx: Transaction, parse_tree: exp.
     table_metadata = mm.get_base_table_metadata(tx, table_name)
     if table_metadata is None:
         raise ValidatorException(f'table {table_name} does not exist')
-    columns = list(parse_tree.find_all(exp.Column))
-    if len(columns) > 1:
-        raise ValidatorException('multi-column index currently not supported')
-    column_name = columns[0].this.name
-    if column_name not in table_metadata.column_names:
-        raise ValidatorException(f'column {column_name} not table {table_name}')
-    column_index = table_metadata.column_names.index(column_name)
+    column_indices: list[int] = list()
+    for column in parse_tree.find_all(exp.Column):
+        column_name = column.this.name
+        if column_name not in table_metadata.column_names:
+            raise ValidatorException(f'column {column_name} not table {table_name}')
+        column_indices.append(table_metadata.column_names.index(column_name))
+    if len(column_indices) != len(set(column_indices)):
+        raise ValidatorException('duplicate columns in index key')
+    included_column_indices: list[int] = list()
+    index = cast(exp.Index, parse_tree.this)
+    for identifier in index.args.get('include') or []:
+        column_name = identifier.name
+        if column_name not in table_metadata.column_names:
+            raise ValidatorException(f'column {column_name} not table {table_name}')
+        column_index = table_metadata.column_names.index(column_name)
+        if column_index in column_indices or column_index in included_column_indices:
+            raise ValidatorException(f'column {column_name} is already in the index')
+        if column_index == table_metadata.primary_key_column_index:
+            raise ValidatorException(f'column {column_name} is the primary key of {table_name}, which every index stores already')
+        included_column_indices.append(column_index)
+    using = index.args.get('using')
+    method = 'btree' if using is None else using.name.lower()
+    if method not in ('btree', 'hash'):
+        raise ValidatorException(f'index method {method} not supported')
+    if len(column_indices) > 1:
+        if method == 'hash':
+            raise ValidatorException('hash index on multiple columns currently not supported')
+        index_column_names = ', '.join(table_metadata.column_names[i] for i in column_indices)
+        if tuple(column_indices) == table_metadata.composite_primary_key:
+            raise ValidatorException(f'columns {index_column_names} are already the primary key of {table_name}')
+        if tuple(column_indices) in table_metadata.composite_indices:
+            raise ValidatorException(f'secondary index {table_name}({index_column_names}) already exists')
+        return CreateIndexLop(table_metadata, tuple(column_indices), tuple(included_column_indices))
+    column_index = column_indices[0]
+    column_name = table_metadata.column_names[column_index]
     if column_index == table_metadata.primary_key_column_index:
         raise ValidatorException(f'column {column_name} is already the primary key of {table_name}')
     if column_index in table_metadata.secondary_column_indices:
         raise ValidatorException(f'secondary index {table_name}({column_name}) already exists')
-    if table_metadata.column_types[column_index] not in (ValType.INTEGER, ValType.VARCHAR):
-        raise ValidatorException(f'index key type {table_metadata.column_types[column_index].name} currently not supported')
-    return CreateIndexLop(table_metadata, column_index)
+    return CreateIndexLop(table_metadata, column_index, tuple(included_column_indices), use_hash = (method == 'hash'))
 
 def gather_schema(mm: MetadataManager, tx: Transaction, parse_tree: exp.Expression) -> dict[str, BaseTableMetadata]:
     """Give a statement represented by ``parse_tree``,
@@ -411,7 +487,8 @@ def validate_delete(mm: MetadataManager, tx: Transaction, parse_tree: exp.Delete
     if base_meta.primary_key_column_index is None:
         key_query.from_tables.clear()
         key_query.from_tables.append(validate_base_table(mm, tx, table_name, return_row_id=True))
-    # second, ensure that we first get the id (primary key or internal row id), and then all secondary key values in order:
+    # second, ensure that we first get the id (primary key or internal row id), and then all secondary key values in order
+    # (each followed by the values of columns included in that index, if any):
     key_query.select_valexprs.clear()
     key_query.select_aliases.clear()
     key_query.select_valexprs.append(NamedColumnRef(base_meta.name, base_meta.id_name(), base_meta.id_type()))
@@ -420,6 +497,20 @@ def validate_delete(mm: MetadataManager, tx: Transaction, parse_tree: exp.Delete
         key_query.select_valexprs.append(
             NamedColumnRef(base_meta.name, base_meta.column_names[sk_column_index], base_meta.column_types[sk_column_index]))
         key_query.select_aliases.append(f'sk_{i}')
+        for j, included_column_index in enumerate(base_meta.included_column_indices(sk_column_index)):
+            key_query.select_valexprs.append(
+                NamedColumnRef(base_meta.name, base_meta.column_names[included_column_index], base_meta.column_types[included_column_index]))
+            key_query.select_aliases.append(f'sk_{i}_inc_{j}')
+    # third, all composite key values, one index after another (again with included values, if any):
+    for i, column_indices in enumerate(base_meta.composite_indices):
+        for j, ck_column_index in enumerate(column_indices):
+            key_query.select_valexprs.append(
+                NamedColumnRef(base_meta.name, base_meta.column_names[ck_column_index], base_meta.column_types[ck_column_index]))
+            key_query.select_aliases.append(f'ck_{i}_{j}')
+        for j, included_column_index in enumerate(base_meta.included_column_indices(column_indices)):
+            key_query.select_valexprs.append(
+                NamedColumnRef(base_meta.name, base_meta.column_names[included_column_index], base_meta.column_types[included_column_index]))
+            key_query.select_aliases.append(f'ck_{i}_inc_{j}')
     return DeleteLop(base_meta, key_query)
 
 def validate_set_option(mm: MetadataManager, tx: Transaction, parse_tree: exp.Command) -> SetOptionLop:
@@ -0,0 +1,21 @@
+CREATE TABLE R(A INT, B INT, C FLOAT, D VARCHAR);
+INSERT INTO R VALUES (0, 0, 0.0, 'g0'), (1, 31, 0.5, 'g1'), (2, 62, 1.0, 'g2'), (3, 93, 1.5, 'g3'), (4, 124, 2.0, 'g4'), (5, 155, 2.5, 'g5'), (6, 186, 3.0, 'g6'), (7, 6, 3.5, 'g7'), (8, 37, 4.0, 'g8'), (9, 68, 4.5, 'g9'), (10, 99, 5.0, 'g10'), (11, 130, 5.5, 'g11'), (12, 161, 6.0, 'g12'), (13, 192, 6.5, 'g13'), (14, 12, 7.0, 'g14'), (15, 43, 7.5, 'g15'), (16, 74, 8.0, 'g16'), (17, 105, 8.5, 'g17'), (18, 136, 9.0, 'g18'), (19, 167, 9.5, 'g0'), (20, 198, 10.0, 'g1'), (21, 18, 10.5, 'g2'), (22, 49, 11.0, 'g3'), (23, 80, 11.5, 'g4'), (24, 111, 12.0, 'g5'), (25, 142, 12.5, 'g6'), (26, 173, 13.0, 'g7'), (27, 204, 13.5, 'g8'), (28, 24, 14.0, 'g9'), (29, 55, 14.5, 'g10'), (30, 86, 15.0, 'g11'), (31, 117, 15.5, 'g12'), (32, 148, 16.0, 'g13'), (33, 179, 16.5, 'g14'), (34, 210, 17.0, 'g15'), (35, 30, 17.5, 'g16'), (36, 61, 18.0, 'g17'), (37, 92, 18.5, 'g18'), (38, 123, 19.0, 'g0'), (39, 154, 19.5, 'g1'), (40, 185, 20.0, 'g2'), (41, 5, 20.5, 'g3'), (42, 36, 21.0, 'g4'), (43, 67, 21.5, 'g5'), (44, 98, 22.0, 'g6'), (45, 129, 22.5, 'g7'), (46, 160, 23.0, 'g8'), (47, 191, 23.5, 'g9'), (48, 11, 24.0, 'g10'), (49, 42, 24.5, 'g11'), (50, 73, 25.0, 'g12'), (51, 104, 25.5, 'g13'), (52, 135, 26.0, 'g14'), (53, 166, 26.5, 'g15'), (54, 197, 27.0, 'g16'), (55, 17, 27.5, 'g17'), (56, 48, 28.0, 'g18'), (57, 79, 28.5, 'g0'), (58, 110, 29.0, 'g1'), (59, 141, 29.5, 'g2'), (60, 172, 30.0, 'g3'), (61, 203, 30.5, 'g4'), (62, 23, 31.0, 'g5'), (63, 54, 31.5, 'g6'), (64, 85, 32.0, 'g7'), (65, 116, 32.5, 'g8'), (66, 147, 33.0, 'g9'), (67, 178, 33.5, 'g10'), (68, 209, 34.0, 'g11'), (69, 29, 34.5, 'g12'), (70, 60, 35.0, 'g13'), (71, 91, 35.5, 'g14'), (72, 122, 36.0, 'g15'), (73, 153, 36.5, 'g16'), (74, 184, 37.0, 'g17'), (75, 4, 37.5, 'g18'), (76, 35, 38.0, 'g0'), (77, 66, 38.5, 'g1'), (78, 97, 39.0, 'g2'), (79, 128, 39.5, 'g3'), (80, 159, 40.0, 'g4'), (81, 190, 40.5, 'g5'), (82, 10, 41.0, 'g6'), (83, 41, 41.5, 'g7'), (84, 72, 42.0, 'g8'), (85, 103, 42.5, 'g9'), (86, 134, 43.0, 'g10'), (87, 165, 43.5, 'g11'), (88, 196, 44.0, 'g12'), (89, 16, 44.5, 'g13'), (90, 47, 45.0, 'g14'), (91, 78, 45.5, 'g15'), (92, 109, 46.0, 'g16'), (93, 140, 46.5, 'g17'), (94, 171, 47.0, 'g18'), (95, 202, 47.5, 'g0'), (96, 22, 48.0, 'g1'), (97, 53, 0.0, 'g2'), (98, 84, 0.5, 'g3'), (99, 115, 1.0, 'g4'), (100, 146, 1.5, 'g5'), (101, 177, 2.0, 'g6'), (102, 208, 2.5, 'g7'), (103, 28, 3.0, 'g8'), (104, 59, 3.5, 'g9'), (105, 90, 4.0, 'g10'), (106, 121, 4.5, 'g11'), (107, 152, 5.0, 'g12'), (108, 183, 5.5, 'g13'), (109, 3, 6.0, 'g14'), (110, 34, 6.5, 'g15'), (111, 65, 7.0, 'g16'), (112, 96, 7.5, 'g17'), (113, 127, 8.0, 'g18'), (114, 158, 8.5, 'g0'), (115, 189, 9.0, 'g1'), (116, 9, 9.5, 'g2'), (117, 40, 10.0, 'g3'), (118, 71, 10.5, 'g4'), (119, 102, 11.0, 'g5'), (120, 133, 11.5, 'g6'), (121, 164, 12.0, 'g7'), (122, 195, 12.5, 'g8'), (123, 15, 13.0, 'g9'), (124, 46, 13.5, 'g10'), (125, 77, 14.0, 'g11'), (126, 108, 14.5, 'g12'), (127, 139, 15.0, 'g13'), (128, 170, 15.5, 'g14'), (129, 201, 16.0, 'g15'), (130, 21, 16.5, 'g16'), (131, 52, 17.0, 'g17'), (132, 83, 17.5, 'g18'), (133, 114, 18.0, 'g0'), (134, 145, 18.5, 'g1'), (135, 176, 19.0, 'g2'), (136, 207, 19.5, 'g3'), (137, 27, 20.0, 'g4'), (138, 58, 20.5, 'g5'), (139, 89, 21.0, 'g6'), (140, 120, 21.5, 'g7'), (141, 151, 22.0, 'g8'), (142, 182, 22.5, 'g9'), (143, 2, 23.0, 'g10'), (144, 33, 23.5, 'g11'), (145, 64, 24.0, 'g12'), (146, 95, 24.5, 'g13'), (147, 126, 25.0, 'g14'), (148, 157, 25.5, 'g15'), (149, 188, 26.0, 'g16'), (150, 8, 26.5, 'g17'), (151, 39, 27.0, 'g18'), (152, 70, 27.5, 'g0'), (153, 101, 28.0, 'g1'), (154, 132, 28.5, 'g2'), (155, 163, 29.0, 'g3'), (156, 194, 29.5, 'g4'), (157, 14, 30.0, 'g5'), (158, 45, 30.5, 'g6'), (159, 76, 31.0, 'g7'), (160, 107, 31.5, 'g8'), (161, 138, 32.0, 'g9'), (162, 169, 32.5, 'g10'), (163, 200, 33.0, 'g11'), (164, 20, 33.5, 'g12'), (165, 51, 34.0, 'g13'), (166, 82, 34.5, 'g14'), (167, 113, 35.0, 'g15'), (168, 144, 35.5, 'g16'), (169, 175, 36.0, 'g17'), (170, 206, 36.5, 'g18'), (171, 26, 37.0, 'g0'), (172, 57, 37.5, 'g1'), (173, 88, 38.0, 'g2'), (174, 119, 38.5, 'g3'), (175, 150, 39.0, 'g4'), (176, 181, 39.5, 'g5'), (177, 1, 40.0, 'g6'), (178, 32, 40.5, 'g7'), (179, 63, 41.0, 'g8'), (180, 94, 41.5, 'g9'), (181, 125, 42.0, 'g10'), (182, 156, 42.5, 'g11'), (183, 187, 43.0, 'g12'), (184, 7, 43.5, 'g13'), (185, 38, 44.0, 'g14'), (186, 69, 44.5, 'g15'), (187, 100, 45.0, 'g16'), (188, 131, 45.5, 'g17'), (189, 162, 46.0, 'g18'), (190, 193, 46.5, 'g0'), (191, 13, 47.0, 'g1'), (192, 44, 47.5, 'g2'), (193, 75, 48.0, 'g3'), (194, 106, 0.0, 'g4'), (195, 137, 0.5, 'g5'), (196, 168, 1.0, 'g6'), (197, 199, 1.5, 'g7'), (198, 19, 2.0, 'g8'), (199, 50, 2.5, 'g9'), (200, 81, 3.0, 'g10'), (201, 112, 3.5, 'g11'), (202, 143, 4.0, 'g12'), (203, 174, 4.5, 'g13'), (204, 205, 5.0, 'g14'), (205, 25, 5.5, 'g15'), (206, 56, 6.0, 'g16'), (207, 87, 6.5, 'g17'), (208, 118, 7.0, 'g18'), (209, 149, 7.5, 'g0'), (210, 180, 8.0, 'g1'), (211, 0, 8.5, 'g2'), (212, 31, 9.0, 'g3'), (213, 62, 9.5, 'g4'), (214, 93, 10.0, 'g5'), (215, 124, 10.5, 'g6'), (216, 155, 11.0, 'g7'), (217, 186, 11.5, 'g8'), (218, 6, 12.0, 'g9'), (219, 37, 12.5, 'g10'), (220, 68, 13.0, 'g11'), (221, 99, 13.5, 'g12'), (222, 130, 14.0, 'g13'), (223, 161, 14.5, 'g14'), (224, 192, 15.0, 'g15'), (225, 12, 15.5, 'g16'), (226, 43, 16.0, 'g17'), (227, 74, 16.5, 'g18'), (228, 105, 17.0, 'g0'), (229, 136, 17.5, 'g1'), (230, 167, 18.0, 'g2'), (231, 198, 18.5, 'g3'), (232, 18, 19.0, 'g4'), (233, 49, 19.5, 'g5'), (234, 80, 20.0, 'g6'), (235, 111, 20.5, 'g7'), (236, 142, 21.0, 'g8'), (237, 173, 21.5, 'g9'), (238, 204, 22.0, 'g10'), (239, 24, 22.5, 'g11'), (240, 55, 23.0, 'g12'), (241, 86, 23.5, 'g13'), (242, 117, 24.0, 'g14'), (243, 148, 24.5, 'g15'), (244, 179, 25.0, 'g16'), (245, 210, 25.5, 'g17'), (246, 30, 26.0, 'g18'), (247, 61, 26.5, 'g0'), (248, 92, 27.0, 'g1'), (249, 123, 27.5, 'g2'), (250, 154, 28.0, 'g3'), (251, 185, 28.5, 'g4'), (252, 5, 29.0, 'g5'), (253, 36, 29.5, 'g6'), (254, 67, 30.0, 'g7'), (255, 98, 30.5, 'g8'), (256, 129, 31.0, 'g9'), (257, 160, 31.5, 'g10'), (258, 191, 32.0, 'g11'), (259, 11, 32.5, 'g12'), (260, 42, 33.0, 'g13'), (261, 73, 33.5, 'g14'), (262, 104, 34.0, 'g15'), (263, 135, 34.5, 'g16'), (264, 166, 35.0, 'g17'), (265, 197, 35.5, 'g18'), (266, 17, 36.0, 'g0'), (267, 48, 36.5, 'g1'), (268, 79, 37.0, 'g2'), (269, 110, 37.5, 'g3'), (270, 141, 38.0, 'g4'), (271, 172, 38.5, 'g5'), (272, 203, 39.0, 'g6'), (273, 23, 39.5, 'g7'), (274, 54, 40.0, 'g8'), (275, 85, 40.5, 'g9'), (276, 116, 41.0, 'g10'), (277, 147, 41.5, 'g11'), (278, 178, 42.0, 'g12'), (279, 209, 42.5, 'g13'), (280, 29, 43.0, 'g14'), (281, 60, 43.5, 'g15'), (282, 91, 44.0, 'g16'), (283, 122, 44.5, 'g17'), (284, 153, 45.0, 'g18'), (285, 184, 45.5, 'g0'), (286, 4, 46.0, 'g1'), (287, 35, 46.5, 'g2'), (288, 66, 47.0, 'g3'), (289, 97, 47.5, 'g4'), (290, 128, 48.0, 'g5'), (291, 159, 0.0, 'g6'), (292, 190, 0.5, 'g7'), (293, 10, 1.0, 'g8'), (294, 41, 1.5, 'g9'), (295, 72, 2.0, 'g10'), (296, 103, 2.5, 'g11'), (297, 134, 3.0, 'g12'), (298, 165, 3.5, 'g13'), (299, 196, 4.0, 'g14'), (300, 16, 4.5, 'g15'), (301, 47, 5.0, 'g16'), (302, 78, 5.5, 'g17'), (303, 109, 6.0, 'g18'), (304, 140, 6.5, 'g0'), (305, 171, 7.0, 'g1'), (306, 202, 7.5, 'g2'), (307, 22, 8.0, 'g3'), (308, 53, 8.5, 'g4'), (309, 84, 9.0, 'g5'), (310, 115, 9.5, 'g6'), (311, 146, 10.0, 'g7'), (312, 177, 10.5, 'g8'), (313, 208, 11.0, 'g9'), (314, 28, 11.5, 'g10'), (315, 59, 12.0, 'g11'), (316, 90, 12.5, 'g12'), (317, 121, 13.0, 'g13'), (318, 152, 13.5, 'g14'), (319, 183, 14.0, 'g15'), (320, 3, 14.5, 'g16'), (321, 34, 15.0, 'g17'), (322, 65, 15.5, 'g18'), (323, 96, 16.0, 'g0'), (324, 127, 16.5, 'g1'), (325, 158, 17.0, 'g2'), (326, 189, 17.5, 'g3'), (327, 9, 18.0, 'g4'), (328, 40, 18.5, 'g5'), (329, 71, 19.0, 'g6'), (330, 102, 19.5, 'g7'), (331, 133, 20.0, 'g8'), (332, 164, 20.5, 'g9'), (333, 195, 21.0, 'g10'), (334, 15, 21.5, 'g11'), (335, 46, 22.0, 'g12'), (336, 77, 22.5, 'g13'), (337, 108, 23.0, 'g14'), (338, 139, 23.5, 'g15'), (339, 170, 24.0, 'g16'), (340, 201, 24.5, 'g17'), (341, 21, 25.0, 'g18'), (342, 52, 25.5, 'g0'), (343, 83, 26.0, 'g1'), (344, 114, 26.5, 'g2'), (345, 145, 27.0, 'g3'), (346, 176, 27.5, 'g4'), (347, 207, 28.0, 'g5'), (348, 27, 28.5, 'g6'), (349, 58, 29.0, 'g7'), (350, 89, 29.5, 'g8'), (351, 120, 30.0, 'g9'), (352, 151, 30.5, 'g10'), (353, 182, 31.0, 'g11'), (354, 2, 31.5, 'g12'), (355, 33, 32.0, 'g13'), (356, 64, 32.5, 'g14'), (357, 95, 33.0, 'g15'), (358, 126, 33.5, 'g16'), (359, 157, 34.0, 'g17'), (360, 188, 34.5, 'g18'), (361, 8, 35.0, 'g0'), (362, 39, 35.5, 'g1'), (363, 70, 36.0, 'g2'), (364, 101, 36.5, 'g3'), (365, 132, 37.0, 'g4'), (366, 163, 37.5, 'g5'), (367, 194, 38.0, 'g6'), (368, 14, 38.5, 'g7'), (369, 45, 39.0, 'g8'), (370, 76, 39.5, 'g9'), (371, 107, 40.0, 'g10'), (372, 138, 40.5, 'g11'), (373, 169, 41.0, 'g12'), (374, 200, 41.5, 'g13'), (375, 20, 42.0, 'g14'), (376, 51, 42.5, 'g15'), (377, 82, 43.0, 'g16'), (378, 113, 43.5, 'g17'), (379, 144, 44.0, 'g18'), (380, 175, 44.5, 'g0'), (381, 206, 45.0, 'g1'), (382, 26, 45.5, 'g2'), (383, 57, 46.0, 'g3'), (384, 88, 46.5, 'g4'), (385, 119, 47.0, 'g5'), (386, 150, 47.5, 'g6'), (387, 181, 48.0, 'g7'), (388, 1, 0.0, 'g8'), (389, 32, 0.5, 'g9'), (390, 63, 1.0, 'g10'), (391, 94, 1.5, 'g11'), (392, 125, 2.0, 'g12'), (393, 156, 2.5, 'g13'), (394, 187, 3.0, 'g14'), (395, 7, 3.5, 'g15'), (396, 38, 4.0, 'g16'), (397, 69, 4.5, 'g17'), (398, 100, 5.0, 'g18'), (399, 131, 5.5, 'g0'), (400, 162, 6.0, 'g1'), (401, 193, 6.5, 'g2'), (402, 13, 7.0, 'g3'), (403, 44, 7.5, 'g4'), (404, 75, 8.0, 'g5'), (405, 106, 8.5, 'g6'), (406, 137, 9.0, 'g7'), (407, 168, 9.5, 'g8'), (408, 199, 10.0, 'g9'), (409, 19, 10.5, 'g10'), (410, 50, 11.0, 'g11'), (411, 81, 11.5, 'g12'), (412, 112, 12.0, 'g13'), (413, 143, 12.5, 'g14'), (414, 174, 13.0, 'g15'), (415, 205, 13.5, 'g16'), (416, 25, 14.0, 'g17'), (417, 56, 14.5, 'g18'), (418, 87, 15.0, 'g0'), (419, 118, 15.5, 'g1'), (420, 149, 16.0, 'g2'), (421, 180, 16.5, 'g3'), (422, 0, 17.0, 'g4'), (423, 31, 17.5, 'g5'), (424, 62, 18.0, 'g6'), (425, 93, 18.5, 'g7'), (426, 124, 19.0, 'g8'), (427, 155, 19.5, 'g9'), (428, 186, 20.0, 'g10'), (429, 6, 20.5, 'g11'), (430, 37, 21.0, 'g12'), (431, 68, 21.5, 'g13'), (432, 99, 22.0, 'g14'), (433, 130, 22.5, 'g15'), (434, 161, 23.0, 'g16'), (435, 192, 23.5, 'g17'), (436, 12, 24.0, 'g18'), (437, 43, 24.5, 'g0'), (438, 74, 25.0, 'g1'), (439, 105, 25.5, 'g2'), (440, 136, 26.0, 'g3'), (441, 167, 26.5, 'g4'), (442, 198, 27.0, 'g5'), (443, 18, 27.5, 'g6'), (444, 49, 28.0, 'g7'), (445, 80, 28.5, 'g8'), (446, 111, 29.0, 'g9'), (447, 142, 29.5, 'g10'), (448, 173, 30.0, 'g11'), (449, 204, 30.5, 'g12'), (450, 24, 31.0, 'g13'), (451, 55, 31.5, 'g14'), (452, 86, 32.0, 'g15'), (453, 117, 32.5, 'g16'), (454, 148, 33.0, 'g17'), (455, 179, 33.5, 'g18'), (456, 210, 34.0, 'g0'), (457, 30, 34.5, 'g1'), (458, 61, 35.0, 'g2'), (459, 92, 35.5, 'g3'), (460, 123, 36.0, 'g4'), (461, 154, 36.5, 'g5'), (462, 185, 37.0, 'g6'), (463, 5, 37.5, 'g7'), (464, 36, 38.0, 'g8'), (465, 67, 38.5, 'g9'), (466, 98, 39.0, 'g10'), (467, 129, 39.5, 'g11'), (468, 160, 40.0, 'g12'), (469, 191, 40.5, 'g13'), (470, 11, 41.0, 'g14'), (471, 42, 41.5, 'g15'), (472, 73, 42.0, 'g16'), (473, 104, 42.5, 'g17'), (474, 135, 43.0, 'g18'), (475, 166, 43.5, 'g0'), (476, 197, 44.0, 'g1'), (477, 17, 44.5, 'g2'), (478, 48, 45.0, 'g3'), (479, 79, 45.5, 'g4'), (480, 110, 46.0, 'g5'), (481, 141, 46.5, 'g6'), (482, 172, 47.0, 'g7'), (483, 203, 47.5, 'g8'), (484, 23, 48.0, 'g9'), (485, 54, 0.0, 'g10'), (486, 85, 0.5, 'g11'), (487, 116, 1.0, 'g12'), (488, 147, 1.5, 'g13'), (489, 178, 2.0, 'g14'), (490, 209, 2.5, 'g15'), (491, 29, 3.0, 'g16'), (492, 60, 3.5, 'g17'), (493, 91, 4.0, 'g18'), (494, 122, 4.5, 'g0'), (495, 153, 5.0, 'g1'), (496, 184, 5.5, 'g2'), (497, 4, 6.0, 'g3'), (498, 35, 6.5, 'g4'), (499, 66, 7.0, 'g5'), (500, 97, 7.5, 'g6'), (501, 128, 8.0, 'g7'), (502, 159, 8.5, 'g8'), (503, 190, 9.0, 'g9'), (504, 10, 9.5, 'g10'), (505, 41, 10.0, 'g11'), (506, 72, 10.5, 'g12'), (507, 103, 11.0, 'g13'), (508, 134, 11.5, 'g14'), (509, 165, 12.0, 'g15'), (510, 196, 12.5, 'g16'), (511, 16, 13.0, 'g17'), (512, 47, 13.5, 'g18'), (513, 78, 14.0, 'g0'), (514, 109, 14.5, 'g1'), (515, 140, 15.0, 'g2'), (516, 171, 15.5, 'g3'), (517, 202, 16.0, 'g4'), (518, 22, 16.5, 'g5'), (519, 53, 17.0, 'g6'), (520, 84, 17.5, 'g7'), (521, 115, 18.0, 'g8'), (522, 146, 18.5, 'g9'), (523, 177, 19.0, 'g10'), (524, 208, 19.5, 'g11'), (525, 28, 20.0, 'g12'), (526, 59, 20.5, 'g13'), (527, 90, 21.0, 'g14'), (528, 121, 21.5, 'g15'), (529, 152, 22.0, 'g16'), (530, 183, 22.5, 'g17'), (531, 3, 23.0, 'g18'), (532, 34, 23.5, 'g0'), (533, 65, 24.0, 'g1'), (534, 96, 24.5, 'g2'), (535, 127, 25.0, 'g3'), (536, 158, 25.5, 'g4'), (537, 189, 26.0, 'g5'), (538, 9, 26.5, 'g6'), (539, 40, 27.0, 'g7'), (540, 71, 27.5, 'g8'), (541, 102, 28.0, 'g9'), (542, 133, 28.5, 'g10'), (543, 164, 29.0, 'g11'), (544, 195, 29.5, 'g12'), (545, 15, 30.0, 'g13'), (546, 46, 30.5, 'g14'), (547, 77, 31.0, 'g15'), (548, 108, 31.5, 'g16'), (549, 139, 32.0, 'g17'), (550, 170, 32.5, 'g18'), (551, 201, 33.0, 'g0'), (552, 21, 33.5, 'g1'), (553, 52, 34.0, 'g2'), (554, 83, 34.5, 'g3'), (555, 114, 35.0, 'g4'), (556, 145, 35.5, 'g5'), (557, 176, 36.0, 'g6'), (558, 207, 36.5, 'g7'), (559, 27, 37.0, 'g8'), (560, 58, 37.5, 'g9'), (561, 89, 38.0, 'g10'), (562, 120, 38.5, 'g11'), (563, 151, 39.0, 'g12'), (564, 182, 39.5, 'g13'), (565, 2, 40.0, 'g14'), (566, 33, 40.5, 'g15'), (567, 64, 41.0, 'g16'), (568, 95, 41.5, 'g17'), (569, 126, 42.0, 'g18'), (570, 157, 42.5, 'g0'), (571, 188, 43.0, 'g1'), (572, 8, 43.5, 'g2'), (573, 39, 44.0, 'g3'), (574, 70, 44.5, 'g4'), (575, 101, 45.0, 'g5'), (576, 132, 45.5, 'g6'), (577, 163, 46.0, 'g7'), (578, 194, 46.5, 'g8'), (579, 14, 47.0, 'g9'), (580, 45, 47.5, 'g10'), (581, 76, 48.0, 'g11'), (582, 107, 0.0, 'g12'), (583, 138, 0.5, 'g13'), (584, 169, 1.0, 'g14'), (585, 200, 1.5, 'g15'), (586, 20, 2.0, 'g16'), (587, 51, 2.5, 'g17'), (588, 82, 3.0, 'g18'), (589, 113, 3.5, 'g0'), (590, 144, 4.0, 'g1'), (591, 175, 4.5, 'g2'), (592, 206, 5.0, 'g3'), (593, 26, 5.5, 'g4'), (594, 57, 6.0, 'g5'), (595, 88, 6.5, 'g6'), (596, 119, 7.0, 'g7'), (597, 150, 7.5, 'g8'), (598, 181, 8.0, 'g9'), (599, 1, 8.5, 'g10'), (600, 32, 9.0, 'g11'), (601, 63, 9.5, 'g12'), (602, 94, 10.0, 'g13'), (603, 125, 10.5, 'g14'), (604, 156, 11.0, 'g15'), (605, 187, 11.5, 'g16'), (606, 7, 12.0, 'g17'), (607, 38, 12.5, 'g18'), (608, 69, 13.0, 'g0'), (609, 100, 13.5, 'g1'), (610, 131, 14.0, 'g2'), (611, 162, 14.5, 'g3'), (612, 193, 15.0, 'g4'), (613, 13, 15.5, 'g5'), (614, 44, 16.0, 'g6'), (615, 75, 16.5, 'g7'), (616, 106, 17.0, 'g8'), (617, 137, 17.5, 'g9'), (618, 168, 18.0, 'g10'), (619, 199, 18.5, 'g11'), (620, 19, 19.0, 'g12'), (621, 50, 19.5, 'g13'), (622, 81, 20.0, 'g14'), (623, 112, 20.5, 'g15'), (624, 143, 21.0, 'g16'), (625, 174, 21.5, 'g17'), (626, 205, 22.0, 'g18'), (627, 25, 22.5, 'g0'), (628, 56, 23.0, 'g1'), (629, 87, 23.5, 'g2'), (630, 118, 24.0, 'g3'), (631, 149, 24.5, 'g4'), (632, 180, 25.0, 'g5'), (633, 0, 25.5, 'g6'), (634, 31, 26.0, 'g7'), (635, 62, 26.5, 'g8'), (636, 93, 27.0, 'g9'), (637, 124, 27.5, 'g10'), (638, 155, 28.0, 'g11'), (639, 186, 28.5, 'g12'), (640, 6, 29.0, 'g13'), (641, 37, 29.5, 'g14'), (642, 68, 30.0, 'g15'), (643, 99, 30.5, 'g16'), (644, 130, 31.0, 'g17'), (645, 161, 31.5, 'g18'), (646, 192, 32.0, 'g0'), (647, 12, 32.5, 'g1'), (648, 43, 33.0, 'g2'), (649, 74, 33.5, 'g3'), (650, 105, 34.0, 'g4'), (651, 136, 34.5, 'g5'), (652, 167, 35.0, 'g6'), (653, 198, 35.5, 'g7'), (654, 18, 36.0, 'g8'), (655, 49, 36.5, 'g9'), (656, 80, 37.0, 'g10'), (657, 111, 37.5, 'g11'), (658, 142, 38.0, 'g12'), (659, 173, 38.5, 'g13'), (660, 204, 39.0, 'g14'), (661, 24, 39.5, 'g15'), (662, 55, 40.0, 'g16'), (663, 86, 40.5, 'g17'), (664, 117, 41.0, 'g18'), (665, 148, 41.5, 'g0'), (666, 179, 42.0, 'g1'), (667, 210, 42.5, 'g2'), (668, 30, 43.0, 'g3'), (669, 61, 43.5, 'g4'), (670, 92, 44.0, 'g5'), (671, 123, 44.5, 'g6'), (672, 154, 45.0, 'g7'), (673, 185, 45.5, 'g8'), (674, 5, 46.0, 'g9'), (675, 36, 46.5, 'g10'), (676, 67, 47.0, 'g11'), (677, 98, 47.5, 'g12'), (678, 129, 48.0, 'g13'), (679, 160, 0.0, 'g14'), (680, 191, 0.5, 'g15'), (681, 11, 1.0, 'g16'), (682, 42, 1.5, 'g17'), (683, 73, 2.0, 'g18'), (684, 104, 2.5, 'g0'), (685, 135, 3.0, 'g1'), (686, 166, 3.5, 'g2'), (687, 197, 4.0, 'g3'), (688, 17, 4.5, 'g4'), (689, 48, 5.0, 'g5'), (690, 79, 5.5, 'g6'), (691, 110, 6.0, 'g7'), (692, 141, 6.5, 'g8'), (693, 172, 7.0, 'g9'), (694, 203, 7.5, 'g10'), (695, 23, 8.0, 'g11'), (696, 54, 8.5, 'g12'), (697, 85, 9.0, 'g13'), (698, 116, 9.5, 'g14'), (699, 147, 10.0, 'g15'), (700, 178, 10.5, 'g16'), (701, 209, 11.0, 'g17'), (702, 29, 11.5, 'g18'), (703, 60, 12.0, 'g0'), (704, 91, 12.5, 'g1'), (705, 122, 13.0, 'g2'), (706, 153, 13.5, 'g3'), (707, 184, 14.0, 'g4'), (708, 4, 14.5, 'g5'), (709, 35, 15.0, 'g6'), (710, 66, 15.5, 'g7'), (711, 97, 16.0, 'g8'), (712, 128, 16.5, 'g9'), (713, 159, 17.0, 'g10'), (714, 190, 17.5, 'g11'), (715, 10, 18.0, 'g12'), (716, 41, 18.5, 'g13'), (717, 72, 19.0, 'g14'), (718, 103, 19.5, 'g15'), (719, 134, 20.0, 'g16'), (720, 165, 20.5, 'g17'), (721, 196, 21.0, 'g18'), (722, 16, 21.5, 'g0'), (723, 47, 22.0, 'g1'), (724, 78, 22.5, 'g2'), (725, 109, 23.0, 'g3'), (726, 140, 23.5, 'g4'), (727, 171, 24.0, 'g5'), (728, 202, 24.5, 'g6'), (729, 22, 25.0, 'g7'), (730, 53, 25.5, 'g8'), (731, 84, 26.0, 'g9'), (732, 115, 26.5, 'g10'), (733, 146, 27.0, 'g11'), (734, 177, 27.5, 'g12'), (735, 208, 28.0, 'g13'), (736, 28, 28.5, 'g14'), (737, 59, 29.0, 'g15'), (738, 90, 29.5, 'g16'), (739, 121, 30.0, 'g17'), (740, 152, 30.5, 'g18'), (741, 183, 31.0, 'g0'), (742, 3, 31.5, 'g1'), (743, 34, 32.0, 'g2'), (744, 65, 32.5, 'g3'), (745, 96, 33.0, 'g4'), (746, 127, 33.5, 'g5'), (747, 158, 34.0, 'g6'), (748, 189, 34.5, 'g7'), (749, 9, 35.0, 'g8'), (750, 40, 35.5, 'g9'), (751, 71, 36.0, 'g10'), (752, 102, 36.5, 'g11'), (753, 133, 37.0, 'g12'), (754, 164, 37.5, 'g13'), (755, 195, 38.0, 'g14'), (756, 15, 38.5, 'g15'), (757, 46, 39.0, 'g16'), (758, 77, 39.5, 'g17'), (759, 108, 40.0, 'g18'), (760, 139, 40.5, 'g0'), (761, 170, 41.0, 'g1'), (762, 201, 41.5, 'g2'), (763, 21, 42.0, 'g3'), (764, 52, 42.5, 'g4'), (765, 83, 43.0, 'g5'), (766, 114, 43.5, 'g6'), (767, 145, 44.0, 'g7'), (768, 176, 44.5, 'g8'), (769, 207, 45.0, 'g9'), (770, 27, 45.5, 'g10'), (771, 58, 46.0, 'g11'), (772, 89, 46.5, 'g12'), (773, 120, 47.0, 'g13'), (774, 151, 47.5, 'g14'), (775, 182, 48.0, 'g15'), (776, 2, 0.0, 'g16'), (777, 33, 0.5, 'g17'), (778, 64, 1.0, 'g18'), (779, 95, 1.5, 'g0'), (780, 126, 2.0, 'g1'), (781, 157, 2.5, 'g2'), (782, 188, 3.0, 'g3'), (783, 8, 3.5, 'g4'), (784, 39, 4.0, 'g5'), (785, 70, 4.5, 'g6'), (786, 101, 5.0, 'g7'), (787, 132, 5.5, 'g8'), (788, 163, 6.0, 'g9'), (789, 194, 6.5, 'g10'), (790, 14, 7.0, 'g11'), (791, 45, 7.5, 'g12'), (792, 76, 8.0, 'g13'), (793, 107, 8.5, 'g14'), (794, 138, 9.0, 'g15'), (795, 169, 9.5, 'g16'), (796, 200, 10.0, 'g17'), (797, 20, 10.5, 'g18'), (798, 51, 11.0, 'g0'), (799, 82, 11.5, 'g1'), (800, 113, 12.0, 'g2'), (801, 144, 12.5, 'g3'), (802, 175, 13.0, 'g4'), (803, 206, 13.5, 'g5'), (804, 26, 14.0, 'g6'), (805, 57, 14.5, 'g7'), (806, 88, 15.0, 'g8'), (807, 119, 15.5, 'g9'), (808, 150, 16.0, 'g10'), (809, 181, 16.5, 'g11'), (810, 1, 17.0, 'g12'), (811, 32, 17.5, 'g13'), (812, 63, 18.0, 'g14'), (813, 94, 18.5, 'g15'), (814, 125, 19.0, 'g16'), (815, 156, 19.5, 'g17'), (816, 187, 20.0, 'g18'), (817, 7, 20.5, 'g0'), (818, 38, 21.0, 'g1'), (819, 69, 21.5, 'g2'), (820, 100, 22.0, 'g3'), (821, 131, 22.5, 'g4'), (822, 162, 23.0, 'g5'), (823, 193, 23.5, 'g6'), (824, 13, 24.0, 'g7'), (825, 44, 24.5, 'g8'), (826, 75, 25.0, 'g9'), (827, 106, 25.5, 'g10'), (828, 137, 26.0, 'g11'), (829, 168, 26.5, 'g12'), (830, 199, 27.0, 'g13'), (831, 19, 27.5, 'g14'), (832, 50, 28.0, 'g15'), (833, 81, 28.5, 'g16'), (834, 112, 29.0, 'g17'), (835, 143, 29.5, 'g18'), (836, 174, 30.0, 'g0'), (837, 205, 30.5, 'g1'), (838, 25, 31.0, 'g2'), (839, 56, 31.5, 'g3'), (840, 87, 32.0, 'g4'), (841, 118, 32.5, 'g5'), (842, 149, 33.0, 'g6'), (843, 180, 33.5, 'g7'), (844, 0, 34.0, 'g8'), (845, 31, 34.5, 'g9'), (846, 62, 35.0, 'g10'), (847, 93, 35.5, 'g11'), (848, 124, 36.0, 'g12'), (849, 155, 36.5, 'g13'), (850, 186, 37.0, 'g14'), (851, 6, 37.5, 'g15'), (852, 37, 38.0, 'g16'), (853, 68, 38.5, 'g17'), (854, 99, 39.0, 'g18'), (855, 130, 39.5, 'g0'), (856, 161, 40.0, 'g1'), (857, 192, 40.5, 'g2'), (858, 12, 41.0, 'g3'), (859, 43, 41.5, 'g4'), (860, 74, 42.0, 'g5'), (861, 105, 42.5, 'g6'), (862, 136, 43.0, 'g7'), (863, 167, 43.5, 'g8'), (864, 198, 44.0, 'g9'), (865, 18, 44.5, 'g10'), (866, 49, 45.0, 'g11'), (867, 80, 45.5, 'g12'), (868, 111, 46.0, 'g13'), (869, 142, 46.5, 'g14'), (870, 173, 47.0, 'g15'), (871, 204, 47.5, 'g16'), (872, 24, 48.0, 'g17'), (873, 55, 0.0, 'g18'), (874, 86, 0.5, 'g0'), (875, 117, 1.0, 'g1'), (876, 148, 1.5, 'g2'), (877, 179, 2.0, 'g3'), (878, 210, 2.5, 'g4'), (879, 30, 3.0, 'g5'), (880, 61, 3.5, 'g6'), (881, 92, 4.0, 'g7'), (882, 123, 4.5, 'g8'), (883, 154, 5.0, 'g9'), (884, 185, 5.5, 'g10'), (885, 5, 6.0, 'g11'), (886, 36, 6.5, 'g12'), (887, 67, 7.0, 'g13'), (888, 98, 7.5, 'g14'), (889, 129, 8.0, 'g15'), (890, 160, 8.5, 'g16'), (891, 191, 9.0, 'g17'), (892, 11, 9.5, 'g18'), (893, 42, 10.0, 'g0'), (894, 73, 10.5, 'g1'), (895, 104, 11.0, 'g2'), (896, 135, 11.5, 'g3'), (897, 166, 12.0, 'g4'), (898, 197, 12.5, 'g5'), (899, 17, 13.0, 'g6'), (900, 48, 13.5, 'g7'), (901, 79, 14.0, 'g8'), (902, 110, 14.5, 'g9'), (903, 141, 15.0, 'g10'), (904, 172, 15.5, 'g11'), (905, 203, 16.0, 'g12'), (906, 23, 16.5, 'g13'), (907, 54, 17.0, 'g14'), (908, 85, 17.5, 'g15'), (909, 116, 18.0, 'g16'), (910, 147, 18.5, 'g17'), (911, 178, 19.0, 'g18'), (912, 209, 19.5, 'g0'), (913, 29, 20.0, 'g1'), (914, 60, 20.5, 'g2'), (915, 91, 21.0, 'g3'), (916, 122, 21.5, 'g4'), (917, 153, 22.0, 'g5'), (918, 184, 22.5, 'g6'), (919, 4, 23.0, 'g7'), (920, 35, 23.5, 'g8'), (921, 66, 24.0, 'g9'), (922, 97, 24.5, 'g10'), (923, 128, 25.0, 'g11'), (924, 159, 25.5, 'g12'), (925, 190, 26.0, 'g13'), (926, 10, 26.5, 'g14'), (927, 41, 27.0, 'g15'), (928, 72, 27.5, 'g16'), (929, 103, 28.0, 'g17'), (930, 134, 28.5, 'g18'), (931, 165, 29.0, 'g0'), (932, 196, 29.5, 'g1'), (933, 16, 30.0, 'g2'), (934, 47, 30.5, 'g3'), (935, 78, 31.0, 'g4'), (936, 109, 31.5, 'g5'), (937, 140, 32.0, 'g6'), (938, 171, 32.5, 'g7'), (939, 202, 33.0, 'g8'), (940, 22, 33.5, 'g9'), (941, 53, 34.0, 'g10'), (942, 84, 34.5, 'g11'), (943, 115, 35.0, 'g12'), (944, 146, 35.5, 'g13'), (945, 177, 36.0, 'g14'), (946, 208, 36.5, 'g15'), (947, 28, 37.0, 'g16'), (948, 59, 37.5, 'g17'), (949, 90, 38.0, 'g18'), (950, 121, 38.5, 'g0'), (951, 152, 39.0, 'g1'), (952, 183, 39.5, 'g2'), (953, 3, 40.0, 'g3'), (954, 34, 40.5, 'g4'), (955, 65, 41.0, 'g5'), (956, 96, 41.5, 'g6'), (957, 127, 42.0, 'g7'), (958, 158, 42.5, 'g8'), (959, 189, 43.0, 'g9'), (960, 9, 43.5, 'g10'), (961, 40, 44.0, 'g11'), (962, 71, 44.5, 'g12'), (963, 102, 45.0, 'g13'), (964, 133, 45.5, 'g14'), (965, 164, 46.0, 'g15'), (966, 195, 46.5, 'g16'), (967, 15, 47.0, 'g17'), (968, 46, 47.5, 'g18'), (969, 77, 48.0, 'g0'), (970, 108, 0.0, 'g1'), (971, 139, 0.5, 'g2'), (972, 170, 1.0, 'g3'), (973, 201, 1.5, 'g4'), (974, 21, 2.0, 'g5'), (975, 52, 2.5, 'g6'), (976, 83, 3.0, 'g7'), (977, 114, 3.5, 'g8'), (978, 145, 4.0, 'g9'), (979, 176, 4.5, 'g10'), (980, 207, 5.0, 'g11'), (981, 27, 5.5, 'g12'), (982, 58, 6.0, 'g13'), (983, 89, 6.5, 'g14'), (984, 120, 7.0, 'g15'), (985, 151, 7.5, 'g16'), (986, 182, 8.0, 'g17'), (987, 2, 8.5, 'g18'), (988, 33, 9.0, 'g0'), (989, 64, 9.5, 'g1'), (990, 95, 10.0, 'g2'), (991, 126, 10.5, 'g3'), (992, 157, 11.0, 'g4'), (993, 188, 11.5, 'g5'), (994, 8, 12.0, 'g6'), (995, 39, 12.5, 'g7'), (996, 70, 13.0, 'g8'), (997, 101, 13.5, 'g9'), (998, 132, 14.0, 'g10'), (999, 163, 14.5, 'g11'), (1000, 194, 15.0, 'g12'), (1001, 14, 15.5, 'g13'), (1002, 45, 16.0, 'g14'), (1003, 76, 16.5, 'g15'), (1004, 107, 17.0, 'g16'), (1005, 138, 17.5, 'g17'), (1006, 169, 18.0, 'g18'), (1007, 200, 18.5, 'g0'), (1008, 20, 19.0, 'g1'), (1009, 51, 19.5, 'g2'), (1010, 82, 20.0, 'g3'), (1011, 113, 20.5, 'g4'), (1012, 144, 21.0, 'g5'), (1013, 175, 21.5, 'g6'), (1014, 206, 22.0, 'g7'), (1015, 26, 22.5, 'g8'), (1016, 57, 23.0, 'g9'), (1017, 88, 23.5, 'g10'), (1018, 119, 24.0, 'g11'), (1019, 150, 24.5, 'g12'), (1020, 181, 25.0, 'g13'), (1021, 1, 25.5, 'g14'), (1022, 32, 26.0, 'g15'), (1023, 63, 26.5, 'g16'), (1024, 94, 27.0, 'g17'), (1025, 125, 27.5, 'g18'), (1026, 156, 28.0, 'g0'), (1027, 187, 28.5, 'g1'), (1028, 7, 29.0, 'g2'), (1029, 38, 29.5, 'g3'), (1030, 69, 30.0, 'g4'), (1031, 100, 30.5, 'g5'), (1032, 131, 31.0, 'g6'), (1033, 162, 31.5, 'g7'), (1034, 193, 32.0, 'g8'), (1035, 13, 32.5, 'g9'), (1036, 44, 33.0, 'g10'), (1037, 75, 33.5, 'g11'), (1038, 106, 34.0, 'g12'), (1039, 137, 34.5, 'g13'), (1040, 168, 35.0, 'g14'), (1041, 199, 35.5, 'g15'), (1042, 19, 36.0, 'g16'), (1043, 50, 36.5, 'g17'), (1044, 81, 37.0, 'g18'), (1045, 112, 37.5, 'g0'), (1046, 143, 38.0, 'g1'), (1047, 174, 38.5, 'g2'), (1048, 205, 39.0, 'g3'), (1049, 25, 39.5, 'g4'), (1050, 56, 40.0, 'g5'), (1051, 87, 40.5, 'g6'), (1052, 118, 41.0, 'g7'), (1053, 149, 41.5, 'g8'), (1054, 180, 42.0, 'g9'), (1055, 0, 42.5, 'g10'), (1056, 31, 43.0, 'g11'), (1057, 62, 43.5, 'g12'), (1058, 93, 44.0, 'g13'), (1059, 124, 44.5, 'g14'), (1060, 155, 45.0, 'g15'), (1061, 186, 45.5, 'g16'), (1062, 6, 46.0, 'g17'), (1063, 37, 46.5, 'g18'), (1064, 68, 47.0, 'g0'), (1065, 99, 47.5, 'g1'), (1066, 130, 48.0, 'g2'), (1067, 161, 0.0, 'g3'), (1068, 192, 0.5, 'g4'), (1069, 12, 1.0, 'g5'), (1070, 43, 1.5, 'g6'), (1071, 74, 2.0, 'g7'), (1072, 105, 2.5, 'g8'), (1073, 136, 3.0, 'g9'), (1074, 167, 3.5, 'g10'), (1075, 198, 4.0, 'g11'), (1076, 18, 4.5, 'g12'), (1077, 49, 5.0, 'g13'), (1078, 80, 5.5, 'g14'), (1079, 111, 6.0, 'g15'), (1080, 142, 6.5, 'g16'), (1081, 173, 7.0, 'g17'), (1082, 204, 7.5, 'g18'), (1083, 24, 8.0, 'g0'), (1084, 55, 8.5, 'g1'), (1085, 86, 9.0, 'g2'), (1086, 117, 9.5, 'g3'), (1087, 148, 10.0, 'g4'), (1088, 179, 10.5, 'g5'), (1089, 210, 11.0, 'g6'), (1090, 30, 11.5, 'g7'), (1091, 61, 12.0, 'g8'), (1092, 92, 12.5, 'g9'), (1093, 123, 13.0, 'g10'), (1094, 154, 13.5, 'g11'), (1095, 185, 14.0, 'g12'), (1096, 5, 14.5, 'g13'), (1097, 36, 15.0, 'g14'), (1098, 67, 15.5, 'g15'), (1099, 98, 16.0, 'g16'), (1100, 129, 16.5, 'g17'), (1101, 160, 17.0, 'g18'), (1102, 191, 17.5, 'g0'), (1103, 11, 18.0, 'g1'), (1104, 42, 18.5, 'g2'), (1105, 73, 19.0, 'g3'), (1106, 104, 19.5, 'g4'), (1107, 135, 20.0, 'g5'), (1108, 166, 20.5, 'g6'), (1109, 197, 21.0, 'g7'), (1110, 17, 21.5, 'g8'), (1111, 48, 22.0, 'g9'), (1112, 79, 22.5, 'g10'), (1113, 110, 23.0, 'g11'), (1114, 141, 23.5, 'g12'), (1115, 172, 24.0, 'g13'), (1116, 203, 24.5, 'g14'), (1117, 23, 25.0, 'g15'), (1118, 54, 25.5, 'g16'), (1119, 85, 26.0, 'g17'), (1120, 116, 26.5, 'g18'), (1121, 147, 27.0, 'g0'), (1122, 178, 27.5, 'g1'), (1123, 209, 28.0, 'g2'), (1124, 29, 28.5, 'g3'), (1125, 60, 29.0, 'g4'), (1126, 91, 29.5, 'g5'), (1127, 122, 30.0, 'g6'), (1128, 153, 30.5, 'g7'), (1129, 184, 31.0, 'g8'), (1130, 4, 31.5, 'g9'), (1131, 35, 32.0, 'g10'), (1132, 66, 32.5, 'g11'), (1133, 97, 33.0, 'g12'), (1134, 128, 33.5, 'g13'), (1135, 159, 34.0, 'g14'), (1136, 190, 34.5, 'g15'), (1137, 10, 35.0, 'g16'), (1138, 41, 35.5, 'g17'), (1139, 72, 36.0, 'g18'), (1140, 103, 36.5, 'g0'), (1141, 134, 37.0, 'g1'), (1142, 165, 37.5, 'g2'), (1143, 196, 38.0, 'g3'), (1144, 16, 38.5, 'g4'), (1145, 47, 39.0, 'g5'), (1146, 78, 39.5, 'g6'), (1147, 109, 40.0, 'g7'), (1148, 140, 40.5, 'g8'), (1149, 171, 41.0, 'g9'), (1150, 202, 41.5, 'g10'), (1151, 22, 42.0, 'g11'), (1152, 53, 42.5, 'g12'), (1153, 84, 43.0, 'g13'), (1154, 115, 43.5, 'g14'), (1155, 146, 44.0, 'g15'), (1156, 177, 44.5, 'g16'), (1157, 208, 45.0, 'g17'), (1158, 28, 45.5, 'g18'), (1159, 59, 46.0, 'g0'), (1160, 90, 46.5, 'g1'), (1161, 121, 47.0, 'g2'), (1162, 152, 47.5, 'g3'), (1163, 183, 48.0, 'g4'), (1164, 3, 0.0, 'g5'), (1165, 34, 0.5, 'g6'), (1166, 65, 1.0, 'g7'), (1167, 96, 1.5, 'g8'), (1168, 127, 2.0, 'g9'), (1169, 158, 2.5, 'g10'), (1170, 189, 3.0, 'g11'), (1171, 9, 3.5, 'g12'), (1172, 40, 4.0, 'g13'), (1173, 71, 4.5, 'g14'), (1174, 102, 5.0, 'g15'), (1175, 133, 5.5, 'g16'), (1176, 164, 6.0, 'g17'), (1177, 195, 6.5, 'g18'), (1178, 15, 7.0, 'g0'), (1179, 46, 7.5, 'g1'), (1180, 77, 8.0, 'g2'), (1181, 108, 8.5, 'g3'), (1182, 139, 9.0, 'g4'), (1183, 170, 9.5, 'g5'), (1184, 201, 10.0, 'g6'), (1185, 21, 10.5, 'g7'), (1186, 52, 11.0, 'g8'), (1187, 83, 11.5, 'g9'), (1188, 114, 12.0, 'g10'), (1189, 145, 12.5, 'g11'), (1190, 176, 13.0, 'g12'), (1191, 207, 13.5, 'g13'), (1192, 27, 14.0, 'g14'), (1193, 58, 14.5, 'g15'), (1194, 89, 15.0, 'g16'), (1195, 120, 15.5, 'g17'), (1196, 151, 16.0, 'g18'), (1197, 182, 16.5, 'g0'), (1198, 2, 17.0, 'g1'), (1199, 33, 17.5, 'g2'), (1200, 64, 18.0, 'g3'), (1201, 95, 18.5, 'g4'), (1202, 126, 19.0, 'g5'), (1203, 157, 19.5, 'g6'), (1204, 188, 20.0, 'g7'), (1205, 8, 20.5, 'g8'), (1206, 39, 21.0, 'g9'), (1207, 70, 21.5, 'g10'), (1208, 101, 22.0, 'g11'), (1209, 132, 22.5, 'g12'), (1210, 163, 23.0, 'g13'), (1211, 194, 23.5, 'g14'), (1212, 14, 24.0, 'g15'), (1213, 45, 24.5, 'g16'), (1214, 76, 25.0, 'g17'), (1215, 107, 25.5, 'g18'), (1216, 138, 26.0, 'g0'), (1217, 169, 26.5, 'g1'), (1218, 200, 27.0, 'g2'), (1219, 20, 27.5, 'g3'), (1220, 51, 28.0, 'g4'), (1221, 82, 28.5, 'g5'), (1222, 113, 29.0, 'g6'), (1223, 144, 29.5, 'g7'), (1224, 175, 30.0, 'g8'), (1225, 206, 30.5, 'g9'), (1226, 26, 31.0, 'g10'), (1227, 57, 31.5, 'g11'), (1228, 88, 32.0, 'g12'), (1229, 119, 32.5, 'g13'), (1230, 150, 33.0, 'g14'), (1231, 181, 33.5, 'g15'), (1232, 1, 34.0, 'g16'), (1233, 32, 34.5, 'g17'), (1234, 63, 35.0, 'g18'), (1235, 94, 35.5, 'g0'), (1236, 125, 36.0, 'g1'), (1237, 156, 36.5, 'g2'), (1238, 187, 37.0, 'g3'), (1239, 7, 37.5, 'g4'), (1240, 38, 38.0, 'g5'), (1241, 69, 38.5, 'g6'), (1242, 100, 39.0, 'g7'), (1243, 131, 39.5, 'g8'), (1244, 162, 40.0, 'g9'), (1245, 193, 40.5, 'g10'), (1246, 13, 41.0, 'g11'), (1247, 44, 41.5, 'g12'), (1248, 75, 42.0, 'g13'), (1249, 106, 42.5, 'g14'), (1250, 137, 43.0, 'g15'), (1251, 168, 43.5, 'g16'), (1252, 199, 44.0, 'g17'), (1253, 19, 44.5, 'g18'), (1254, 50, 45.0, 'g0'), (1255, 81, 45.5, 'g1'), (1256, 112, 46.0, 'g2'), (1257, 143, 46.5, 'g3'), (1258, 174, 47.0, 'g4'), (1259, 205, 47.5, 'g5'), (1260, 25, 48.0, 'g6'), (1261, 56, 0.0, 'g7'), (1262, 87, 0.5, 'g8'), (1263, 118, 1.0, 'g9'), (1264, 149, 1.5, 'g10'), (1265, 180, 2.0, 'g11'), (1266, 0, 2.5, 'g12'), (1267, 31, 3.0, 'g13'), (1268, 62, 3.5, 'g14'), (1269, 93, 4.0, 'g15'), (1270, 124, 4.5, 'g16'), (1271, 155, 5.0, 'g17'), (1272, 186, 5.5, 'g18'), (1273, 6, 6.0, 'g0'), (1274, 37, 6.5, 'g1'), (1275, 68, 7.0, 'g2'), (1276, 99, 7.5, 'g3'), (1277, 130, 8.0, 'g4'), (1278, 161, 8.5, 'g5'), (1279, 192, 9.0, 'g6'), (1280, 12, 9.5, 'g7'), (1281, 43, 10.0, 'g8'), (1282, 74, 10.5, 'g9'), (1283, 105, 11.0, 'g10'), (1284, 136, 11.5, 'g11'), (1285, 167, 12.0, 'g12'), (1286, 198, 12.5, 'g13'), (1287, 18, 13.0, 'g14'), (1288, 49, 13.5, 'g15'), (1289, 80, 14.0, 'g16'), (1290, 111, 14.5, 'g17'), (1291, 142, 15.0, 'g18'), (1292, 173, 15.5, 'g0'), (1293, 204, 16.0, 'g1'), (1294, 24, 16.5, 'g2'), (1295, 55, 17.0, 'g3'), (1296, 86, 17.5, 'g4'), (1297, 117, 18.0, 'g5'), (1298, 148, 18.5, 'g6'), (1299, 179, 19.0, 'g7'), (1300, 210, 19.5, 'g8'), (1301, 30, 20.0, 'g9'), (1302, 61, 20.5, 'g10'), (1303, 92, 21.0, 'g11'), (1304, 123, 21.5, 'g12'), (1305, 154, 22.0, 'g13'), (1306, 185, 22.5, 'g14'), (1307, 5, 23.0, 'g15'), (1308, 36, 23.5, 'g16'), (1309, 67, 24.0, 'g17'), (1310, 98, 24.5, 'g18'), (1311, 129, 25.0, 'g0'), (1312, 160, 25.5, 'g1'), (1313, 191, 26.0, 'g2'), (1314, 11, 26.5, 'g3'), (1315, 42, 27.0, 'g4'), (1316, 73, 27.5, 'g5'), (1317, 104, 28.0, 'g6'), (1318, 135, 28.5, 'g7'), (1319, 166, 29.0, 'g8'), (1320, 197, 29.5, 'g9'), (1321, 17, 30.0, 'g10'), (1322, 48, 30.5, 'g11'), (1323, 79, 31.0, 'g12'), (1324, 110, 31.5, 'g13'), (1325, 141, 32.0, 'g14'), (1326, 172, 32.5, 'g15'), (1327, 203, 33.0, 'g16'), (1328, 23, 33.5, 'g17'), (1329, 54, 34.0, 'g18'), (1330, 85, 34.5, 'g0'), (1331, 116, 35.0, 'g1'), (1332, 147, 35.5, 'g2'), (1333, 178, 36.0, 'g3'), (1334, 209, 36.5, 'g4'), (1335, 29, 37.0, 'g5'), (1336, 60, 37.5, 'g6'), (1337, 91, 38.0, 'g7'), (1338, 122, 38.5, 'g8'), (1339, 153, 39.0, 'g9'), (1340, 184, 39.5, 'g10'), (1341, 4, 40.0, 'g11'), (1342, 35, 40.5, 'g12'), (1343, 66, 41.0, 'g13'), (1344, 97, 41.5, 'g14'), (1345, 128, 42.0, 'g15'), (1346, 159, 42.5, 'g16'), (1347, 190, 43.0, 'g17'), (1348, 10, 43.5, 'g18'), (1349, 41, 44.0, 'g0'), (1350, 72, 44.5, 'g1'), (1351, 103, 45.0, 'g2'), (1352, 134, 45.5, 'g3'), (1353, 165, 46.0, 'g4'), (1354, 196, 46.5, 'g5'), (1355, 16, 47.0, 'g6'), (1356, 47, 47.5, 'g7'), (1357, 78, 48.0, 'g8'), (1358, 109, 0.0, 'g9'), (1359, 140, 0.5, 'g10'), (1360, 171, 1.0, 'g11'), (1361, 202, 1.5, 'g12'), (1362, 22, 2.0, 'g13'), (1363, 53, 2.5, 'g14'), (1364, 84, 3.0, 'g15'), (1365, 115, 3.5, 'g16'), (1366, 146, 4.0, 'g17'), (1367, 177, 4.5, 'g18'), (1368, 208, 5.0, 'g0'), (1369, 28, 5.5, 'g1'), (1370, 59, 6.0, 'g2'), (1371, 90, 6.5, 'g3'), (1372, 121, 7.0, 'g4'), (1373, 152, 7.5, 'g5'), (1374, 183, 8.0, 'g6'), (1375, 3, 8.5, 'g7'), (1376, 34, 9.0, 'g8'), (1377, 65, 9.5, 'g9'), (1378, 96, 10.0, 'g10'), (1379, 127, 10.5, 'g11'), (1380, 158, 11.0, 'g12'), (1381, 189, 11.5, 'g13'), (1382, 9, 12.0, 'g14'), (1383, 40, 12.5, 'g15'), (1384, 71, 13.0, 'g16'), (1385, 102, 13.5, 'g17'), (1386, 133, 14.0, 'g18'), (1387, 164, 14.5, 'g0'), (1388, 195, 15.0, 'g1'), (1389, 15, 15.5, 'g2'), (1390, 46, 16.0, 'g3'), (1391, 77, 16.5, 'g4'), (1392, 108, 17.0, 'g5'), (1393, 139, 17.5, 'g6'), (1394, 170, 18.0, 'g7'), (1395, 201, 18.5, 'g8'), (1396, 21, 19.0, 'g9'), (1397, 52, 19.5, 'g10'), (1398, 83, 20.0, 'g11'), (1399, 114, 20.5, 'g12'), (1400, 145, 21.0, 'g13'), (1401, 176, 21.5, 'g14'), (1402, 207, 22.0, 'g15'), (1403, 27, 22.5, 'g16'), (1404, 58, 23.0, 'g17'), (1405, 89, 23.5, 'g18'), (1406, 120, 24.0, 'g0'), (1407, 151, 24.5, 'g1'), (1408, 182, 25.0, 'g2'), (1409, 2, 25.5, 'g3'), (1410, 33, 26.0, 'g4'), (1411, 64, 26.5, 'g5'), (1412, 95, 27.0, 'g6'), (1413, 126, 27.5, 'g7'), (1414, 157, 28.0, 'g8'), (1415, 188, 28.5, 'g9'), (1416, 8, 29.0, 'g10'), (1417, 39, 29.5, 'g11'), (1418, 70, 30.0, 'g12'), (1419, 101, 30.5, 'g13'), (1420, 132, 31.0, 'g14'), (1421, 163, 31.5, 'g15'), (1422, 194, 32.0, 'g16'), (1423, 14, 32.5, 'g17'), (1424, 45, 33.0, 'g18'), (1425, 76, 33.5, 'g0'), (1426, 107, 34.0, 'g1'), (1427, 138, 34.5, 'g2'), (1428, 169, 35.0, 'g3'), (1429, 200, 35.5, 'g4'), (1430, 20, 36.0, 'g5'), (1431, 51, 36.5, 'g6'), (1432, 82, 37.0, 'g7'), (1433, 113, 37.5, 'g8'), (1434, 144, 38.0, 'g9'), (1435, 175, 38.5, 'g10'), (1436, 206, 39.0, 'g11'), (1437, 26, 39.5, 'g12'), (1438, 57, 40.0, 'g13'), (1439, 88, 40.5, 'g14'), (1440, 119, 41.0, 'g15'), (1441, 150, 41.5, 'g16'), (1442, 181, 42.0, 'g17'), (1443, 1, 42.5, 'g18'), (1444, 32, 43.0, 'g0'), (1445, 63, 43.5, 'g1'), (1446, 94, 44.0, 'g2'), (1447, 125, 44.5, 'g3'), (1448, 156, 45.0, 'g4'), (1449, 187, 45.5, 'g5'), (1450, 7, 46.0, 'g6'), (1451, 38, 46.5, 'g7'), (1452, 69, 47.0, 'g8'), (1453, 100, 47.5, 'g9'), (1454, 131, 48.0, 'g10'), (1455, 162, 0.0, 'g11'), (1456, 193, 0.5, 'g12'), (1457, 13, 1.0, 'g13'), (1458, 44, 1.5, 'g14'), (1459, 75, 2.0, 'g15'), (1460, 106, 2.5, 'g16'), (1461, 137, 3.0, 'g17'), (1462, 168, 3.5, 'g18'), (1463, 199, 4.0, 'g0'), (1464, 19, 4.5, 'g1'), (1465, 50, 5.0, 'g2'), (1466, 81, 5.5, 'g3'), (1467, 112, 6.0, 'g4'), (1468, 143, 6.5, 'g5'), (1469, 174, 7.0, 'g6'), (1470, 205, 7.5, 'g7'), (1471, 25, 8.0, 'g8'), (1472, 56, 8.5, 'g9'), (1473, 87, 9.0, 'g10'), (1474, 118, 9.5, 'g11'), (1475, 149, 10.0, 'g12'), (1476, 180, 10.5, 'g13'), (1477, 0, 11.0, 'g14'), (1478, 31, 11.5, 'g15'), (1479, 62, 12.0, 'g16'), (1480, 93, 12.5, 'g17'), (1481, 124, 13.0, 'g18'), (1482, 155, 13.5, 'g0'), (1483, 186, 14.0, 'g1'), (1484, 6, 14.5, 'g2'), (1485, 37, 15.0, 'g3'), (1486, 68, 15.5, 'g4'), (1487, 99, 16.0, 'g5'), (1488, 130, 16.5, 'g6'), (1489, 161, 17.0, 'g7'), (1490, 192, 17.5, 'g8'), (1491, 12, 18.0, 'g9'), (1492, 43, 18.5, 'g10'), (1493, 74, 19.0, 'g11'), (1494, 105, 19.5, 'g12'), (1495, 136, 20.0, 'g13'), (1496, 167, 20.5, 'g14'), (1497, 198, 21.0, 'g15'), (1498, 18, 21.5, 'g16'), (1499, 49, 22.0, 'g17'), (1500, 80, 22.5, 'g18'), (1501, 111, 23.0, 'g0'), (1502, 142, 23.5, 'g1'), (1503, 173, 24.0, 'g2'), (1504, 204, 24.5, 'g3'), (1505, 24, 25.0, 'g4'), (1506, 55, 25.5, 'g5'), (1507, 86, 26.0, 'g6'), (1508, 117, 26.5, 'g7'), (1509, 148, 27.0, 'g8'), (1510, 179, 27.5, 'g9'), (1511, 210, 28.0, 'g10'), (1512, 30, 28.5, 'g11'), (1513, 61, 29.0, 'g12'), (1514, 92, 29.5, 'g13'), (1515, 123, 30.0, 'g14'), (1516, 154, 30.5, 'g15'), (1517, 185, 31.0, 'g16'), (1518, 5, 31.5, 'g17'), (1519, 36, 32.0, 'g18'), (1520, 67, 32.5, 'g0'), (1521, 98, 33.0, 'g1'), (1522, 129, 33.5, 'g2'), (1523, 160, 34.0, 'g3'), (1524, 191, 34.5, 'g4'), (1525, 11, 35.0, 'g5'), (1526, 42, 35.5, 'g6'), (1527, 73, 36.0, 'g7'), (1528, 104, 36.5, 'g8'), (1529, 135, 37.0, 'g9'), (1530, 166, 37.5, 'g10'), (1531, 197, 38.0, 'g11'), (1532, 17, 38.5, 'g12'), (1533, 48, 39.0, 'g13'), (1534, 79, 39.5, 'g14'), (1535, 110, 40.0, 'g15'), (1536, 141, 40.5, 'g16'), (1537, 172, 41.0, 'g17'), (1538, 203, 41.5, 'g18'), (1539, 23, 42.0, 'g0'), (1540, 54, 42.5, 'g1'), (1541, 85, 43.0, 'g2'), (1542, 116, 43.5, 'g3'), (1543, 147, 44.0, 'g4'), (1544, 178, 44.5, 'g5'), (1545, 209, 45.0, 'g6'), (1546, 29, 45.5, 'g7'), (1547, 60, 46.0, 'g8'), (1548, 91, 46.5, 'g9'), (1549, 122, 47.0, 'g10'), (1550, 153, 47.5, 'g11'), (1551, 184, 48.0, 'g12'), (1552, 4, 0.0, 'g13'), (1553, 35, 0.5, 'g14'), (1554, 66, 1.0, 'g15'), (1555, 97, 1.5, 'g16'), (1556, 128, 2.0, 'g17'), (1557, 159, 2.5, 'g18'), (1558, 190, 3.0, 'g0'), (1559, 10, 3.5, 'g1'), (1560, 41, 4.0, 'g2'), (1561, 72, 4.5, 'g3'), (1562, 103, 5.0, 'g4'), (1563, 134, 5.5, 'g5'), (1564, 165, 6.0, 'g6'), (1565, 196, 6.5, 'g7'), (1566, 16, 7.0, 'g8'), (1567, 47, 7.5, 'g9'), (1568, 78, 8.0, 'g10'), (1569, 109, 8.5, 'g11'), (1570, 140, 9.0, 'g12'), (1571, 171, 9.5, 'g13'), (1572, 202, 10.0, 'g14'), (1573, 22, 10.5, 'g15'), (1574, 53, 11.0, 'g16'), (1575, 84, 11.5, 'g17'), (1576, 115, 12.0, 'g18'), (1577, 146, 12.5, 'g0'), (1578, 177, 13.0, 'g1'), (1579, 208, 13.5, 'g2'), (1580, 28, 14.0, 'g3'), (1581, 59, 14.5, 'g4'), (1582, 90, 15.0, 'g5'), (1583, 121, 15.5, 'g6'), (1584, 152, 16.0, 'g7'), (1585, 183, 16.5, 'g8'), (1586, 3, 17.0, 'g9'), (1587, 34, 17.5, 'g10'), (1588, 65, 18.0, 'g11'), (1589, 96, 18.5, 'g12'), (1590, 127, 19.0, 'g13'), (1591, 158, 19.5, 'g14'), (1592, 189, 20.0, 'g15'), (1593, 9, 20.5, 'g16'), (1594, 40, 21.0, 'g17'), (1595, 71, 21.5, 'g18'), (1596, 102, 22.0, 'g0'), (1597, 133, 22.5, 'g1'), (1598, 164, 23.0, 'g2'), (1599, 195, 23.5, 'g3'), (1600, 15, 24.0, 'g4'), (1601, 46, 24.5, 'g5'), (1602, 77, 25.0, 'g6'), (1603, 108, 25.5, 'g7'), (1604, 139, 26.0, 'g8'), (1605, 170, 26.5, 'g9'), (1606, 201, 27.0, 'g10'), (1607, 21, 27.5, 'g11'), (1608, 52, 28.0, 'g12'), (1609, 83, 28.5, 'g13'), (1610, 114, 29.0, 'g14'), (1611, 145, 29.5, 'g15'), (1612, 176, 30.0, 'g16'), (1613, 207, 30.5, 'g17'), (1614, 27, 31.0, 'g18'), (1615, 58, 31.5, 'g0'), (1616, 89, 32.0, 'g1'), (1617, 120, 32.5, 'g2'), (1618, 151, 33.0, 'g3'), (1619, 182, 33.5, 'g4'), (1620, 2, 34.0, 'g5'), (1621, 33, 34.5, 'g6'), (1622, 64, 35.0, 'g7'), (1623, 95, 35.5, 'g8'), (1624, 126, 36.0, 'g9'), (1625, 157, 36.5, 'g10'), (1626, 188, 37.0, 'g11'), (1627, 8, 37.5, 'g12'), (1628, 39, 38.0, 'g13'), (1629, 70, 38.5, 'g14'), (1630, 101, 39.0, 'g15'), (1631, 132, 39.5, 'g16'), (1632, 163, 40.0, 'g17'), (1633, 194, 40.5, 'g18'), (1634, 14, 41.0, 'g0'), (1635, 45, 41.5, 'g1'), (1636, 76, 42.0, 'g2'), (1637, 107, 42.5, 'g3'), (1638, 138, 43.0, 'g4'), (1639, 169, 43.5, 'g5'), (1640, 200, 44.0, 'g6'), (1641, 20, 44.5, 'g7'), (1642, 51, 45.0, 'g8'), (1643, 82, 45.5, 'g9'), (1644, 113, 46.0, 'g10'), (1645, 144, 46.5, 'g11'), (1646, 175, 47.0, 'g12'), (1647, 206, 47.5, 'g13'), (1648, 26, 48.0, 'g14'), (1649, 57, 0.0, 'g15'), (1650, 88, 0.5, 'g16'), (1651, 119, 1.0, 'g17'), (1652, 150, 1.5, 'g18'), (1653, 181, 2.0, 'g0'), (1654, 1, 2.5, 'g1'), (1655, 32, 3.0, 'g2'), (1656, 63, 3.5, 'g3'), (1657, 94, 4.0, 'g4'), (1658, 125, 4.5, 'g5'), (1659, 156, 5.0, 'g6'), (1660, 187, 5.5, 'g7'), (1661, 7, 6.0, 'g8'), (1662, 38, 6.5, 'g9'), (1663, 69, 7.0, 'g10'), (1664, 100, 7.5, 'g11'), (1665, 131, 8.0, 'g12'), (1666, 162, 8.5, 'g13'), (1667, 193, 9.0, 'g14'), (1668, 13, 9.5, 'g15'), (1669, 44, 10.0, 'g16'), (1670, 75, 10.5, 'g17'), (1671, 106, 11.0, 'g18'), (1672, 137, 11.5, 'g0'), (1673, 168, 12.0, 'g1'), (1674, 199, 12.5, 'g2'), (1675, 19, 13.0, 'g3'), (1676, 50, 13.5, 'g4'), (1677, 81, 14.0, 'g5'), (1678, 112, 14.5, 'g6'), (1679, 143, 15.0, 'g7'), (1680, 174, 15.5, 'g8'), (1681, 205, 16.0, 'g9'), (1682, 25, 16.5, 'g10'), (1683, 56, 17.0, 'g11'), (1684, 87, 17.5, 'g12'), (1685, 118, 18.0, 'g13'), (1686, 149, 18.5, 'g14'), (1687, 180, 19.0, 'g15'), (1688, 0, 19.5, 'g16'), (1689, 31, 20.0, 'g17'), (1690, 62, 20.5, 'g18'), (1691, 93, 21.0, 'g0'), (1692, 124, 21.5, 'g1'), (1693, 155, 22.0, 'g2'), (1694, 186, 22.5, 'g3'), (1695, 6, 23.0, 'g4'), (1696, 37, 23.5, 'g5'), (1697, 68, 24.0, 'g6'), (1698, 99, 24.5, 'g7'), (1699, 130, 25.0, 'g8'), (1700, 161, 25.5, 'g9'), (1701, 192, 26.0, 'g10'), (1702, 12, 26.5, 'g11'), (1703, 43, 27.0, 'g12'), (1704, 74, 27.5, 'g13'), (1705, 105, 28.0, 'g14'), (1706, 136, 28.5, 'g15'), (1707, 167, 29.0, 'g16'), (1708, 198, 29.5, 'g17'), (1709, 18, 30.0, 'g18'), (1710, 49, 30.5, 'g0'), (1711, 80, 31.0, 'g1'), (1712, 111, 31.5, 'g2'), (1713, 142, 32.0, 'g3'), (1714, 173, 32.5, 'g4'), (1715, 204, 33.0, 'g5'), (1716, 24, 33.5, 'g6'), (1717, 55, 34.0, 'g7'), (1718, 86, 34.5, 'g8'), (1719, 117, 35.0, 'g9'), (1720, 148, 35.5, 'g10'), (1721, 179, 36.0, 'g11'), (1722, 210, 36.5, 'g12'), (1723, 30, 37.0, 'g13'), (1724, 61, 37.5, 'g14'), (1725, 92, 38.0, 'g15'), (1726, 123, 38.5, 'g16'), (1727, 154, 39.0, 'g17'), (1728, 185, 39.5, 'g18'), (1729, 5, 40.0, 'g0'), (1730, 36, 40.5, 'g1'), (1731, 67, 41.0, 'g2'), (1732, 98, 41.5, 'g3'), (1733, 129, 42.0, 'g4'), (1734, 160, 42.5, 'g5'), (1735, 191, 43.0, 'g6'), (1736, 11, 43.5, 'g7'), (1737, 42, 44.0, 'g8'), (1738, 73, 44.5, 'g9'), (1739, 104, 45.0, 'g10'), (1740, 135, 45.5, 'g11'), (1741, 166, 46.0, 'g12'), (1742, 197, 46.5, 'g13'), (1743, 17, 47.0, 'g14'), (1744, 48, 47.5, 'g15'), (1745, 79, 48.0, 'g16'), (1746, 110, 0.0, 'g17'), (1747, 141, 0.5, 'g18'), (1748, 172, 1.0, 'g0'), (1749, 203, 1.5, 'g1'), (1750, 23, 2.0, 'g2'), (1751, 54, 2.5, 'g3'), (1752, 85, 3.0, 'g4'), (1753, 116, 3.5, 'g5'), (1754, 147, 4.0, 'g6'), (1755, 178, 4.5, 'g7'), (1756, 209, 5.0, 'g8'), (1757, 29, 5.5, 'g9'), (1758, 60, 6.0, 'g10'), (1759, 91, 6.5, 'g11'), (1760, 122, 7.0, 'g12'), (1761, 153, 7.5, 'g13'), (1762, 184, 8.0, 'g14'), (1763, 4, 8.5, 'g15'), (1764, 35, 9.0, 'g16'), (1765, 66, 9.5, 'g17'), (1766, 97, 10.0, 'g18'), (1767, 128, 10.5, 'g0'), (1768, 159, 11.0, 'g1'), (1769, 190, 11.5, 'g2'), (1770, 10, 12.0, 'g3'), (1771, 41, 12.5, 'g4'), (1772, 72, 13.0, 'g5'), (1773, 103, 13.5, 'g6'), (1774, 134, 14.0, 'g7'), (1775, 165, 14.5, 'g8'), (1776, 196, 15.0, 'g9'), (1777, 16, 15.5, 'g10'), (1778, 47, 16.0, 'g11'), (1779, 78, 16.5, 'g12'), (1780, 109, 17.0, 'g13'), (1781, 140, 17.5, 'g14'), (1782, 171, 18.0, 'g15'), (1783, 202, 18.5, 'g16'), (1784, 22, 19.0, 'g17'), (1785, 53, 19.5, 'g18'), (1786, 84, 20.0, 'g0'), (1787, 115, 20.5, 'g1'), (1788, 146, 21.0, 'g2'), (1789, 177, 21.5, 'g3'), (1790, 208, 22.0, 'g4'), (1791, 28, 22.5, 'g5'), (1792, 59, 23.0, 'g6'), (1793, 90, 23.5, 'g7'), (1794, 121, 24.0, 'g8'), (1795, 152, 24.5, 'g9'), (1796, 183, 25.0, 'g10'), (1797, 3, 25.5, 'g11'), (1798, 34, 26.0, 'g12'), (1799, 65, 26.5, 'g13'), (1800, 96, 27.0, 'g14'), (1801, 127, 27.5, 'g15'), (1802, 158, 28.0, 'g16'), (1803, 189, 28.5, 'g17'), (1804, 9, 29.0, 'g18'), (1805, 40, 29.5, 'g0'), (1806, 71, 30.0, 'g1'), (1807, 102, 30.5, 'g2'), (1808, 133, 31.0, 'g3'), (1809, 164, 31.5, 'g4'), (1810, 195, 32.0, 'g5'), (1811, 15, 32.5, 'g6'), (1812, 46, 33.0, 'g7'), (1813, 77, 33.5, 'g8'), (1814, 108, 34.0, 'g9'), (1815, 139, 34.5, 'g10'), (1816, 170, 35.0, 'g11'), (1817, 201, 35.5, 'g12'), (1818, 21, 36.0, 'g13'), (1819, 52, 36.5, 'g14'), (1820, 83, 37.0, 'g15'), (1821, 114, 37.5, 'g16'), (1822, 145, 38.0, 'g17'), (1823, 176, 38.5, 'g18'), (1824, 207, 39.0, 'g0'), (1825, 27, 39.5, 'g1'), (1826, 58, 40.0, 'g2'), (1827, 89, 40.5, 'g3'), (1828, 120, 41.0, 'g4'), (1829, 151, 41.5, 'g5'), (1830, 182, 42.0, 'g6'), (1831, 2, 42.5, 'g7'), (1832, 33, 43.0, 'g8'), (1833, 64, 43.5, 'g9'), (1834, 95, 44.0, 'g10'), (1835, 126, 44.5, 'g11'), (1836, 157, 45.0, 'g12'), (1837, 188, 45.5, 'g13'), (1838, 8, 46.0, 'g14'), (1839, 39, 46.5, 'g15'), (1840, 70, 47.0, 'g16'), (1841, 101, 47.5, 'g17'), (1842, 132, 48.0, 'g18'), (1843, 163, 0.0, 'g0'), (1844, 194, 0.5, 'g1'), (1845, 14, 1.0, 'g2'), (1846, 45, 1.5, 'g3'), (1847, 76, 2.0, 'g4'), (1848, 107, 2.5, 'g5'), (1849, 138, 3.0, 'g6'), (1850, 169, 3.5, 'g7'), (1851, 200, 4.0, 'g8'), (1852, 20, 4.5, 'g9'), (1853, 51, 5.0, 'g10'), (1854, 82, 5.5, 'g11'), (1855, 113, 6.0, 'g12'), (1856, 144, 6.5, 'g13'), (1857, 175, 7.0, 'g14'), (1858, 206, 7.5, 'g15'), (1859, 26, 8.0, 'g16'), (1860, 57, 8.5, 'g17'), (1861, 88, 9.0, 'g18'), (1862, 119, 9.5, 'g0'), (1863, 150, 10.0, 'g1'), (1864, 181, 10.5, 'g2'), (1865, 1, 11.0, 'g3'), (1866, 32, 11.5, 'g4'), (1867, 63, 12.0, 'g5'), (1868, 94, 12.5, 'g6'), (1869, 125, 13.0, 'g7'), (1870, 156, 13.5, 'g8'), (1871, 187, 14.0, 'g9'), (1872, 7, 14.5, 'g10'), (1873, 38, 15.0, 'g11'), (1874, 69, 15.5, 'g12'), (1875, 100, 16.0, 'g13'), (1876, 131, 16.5, 'g14'), (1877, 162, 17.0, 'g15'), (1878, 193, 17.5, 'g16'), (1879, 13, 18.0, 'g17'), (1880, 44, 18.5, 'g18'), (1881, 75, 19.0, 'g0'), (1882, 106, 19.5, 'g1'), (1883, 137, 20.0, 'g2'), (1884, 168, 20.5, 'g3'), (1885, 199, 21.0, 'g4'), (1886, 19, 21.5, 'g5'), (1887, 50, 22.0, 'g6'), (1888, 81, 22.5, 'g7'), (1889, 112, 23.0, 'g8'), (1890, 143, 23.5, 'g9'), (1891, 174, 24.0, 'g10'), (1892, 205, 24.5, 'g11'), (1893, 25, 25.0, 'g12'), (1894, 56, 25.5, 'g13'), (1895, 87, 26.0, 'g14'), (1896, 118, 26.5, 'g15'), (1897, 149, 27.0, 'g16'), (1898, 180, 27.5, 'g17'), (1899, 0, 28.0, 'g18'), (1900, 31, 28.5, 'g0'), (1901, 62, 29.0, 'g1'), (1902, 93, 29.5, 'g2'), (1903, 124, 30.0, 'g3'), (1904, 155, 30.5, 'g4'), (1905, 186, 31.0, 'g5'), (1906, 6, 31.5, 'g6'), (1907, 37, 32.0, 'g7'), (1908, 68, 32.5, 'g8'), (1909, 99, 33.0, 'g9'), (1910, 130, 33.5, 'g10'), (1911, 161, 34.0, 'g11'), (1912, 192, 34.5, 'g12'), (1913, 12, 35.0, 'g13'), (1914, 43, 35.5, 'g14'), (1915, 74, 36.0, 'g15'), (1916, 105, 36.5, 'g16'), (1917, 136, 37.0, 'g17'), (1918, 167, 37.5, 'g18'), (1919, 198, 38.0, 'g0'), (1920, 18, 38.5, 'g1'), (1921, 49, 39.0, 'g2'), (1922, 80, 39.5, 'g3'), (1923, 111, 40.0, 'g4'), (1924, 142, 40.5, 'g5'), (1925, 173, 41.0, 'g6'), (1926, 204, 41.5, 'g7'), (1927, 24, 42.0, 'g8'), (1928, 55, 42.5, 'g9'), (1929, 86, 43.0, 'g10'), (1930, 117, 43.5, 'g11'), (1931, 148, 44.0, 'g12'), (1932, 179, 44.5, 'g13'), (1933, 210, 45.0, 'g14'), (1934, 30, 45.5, 'g15'), (1935, 61, 46.0, 'g16'), (1936, 92, 46.5, 'g17'), (1937, 123, 47.0, 'g18'), (1938, 154, 47.5, 'g0'), (1939, 185, 48.0, 'g1'), (1940, 5, 0.0, 'g2'), (1941, 36, 0.5, 'g3'), (1942, 67, 1.0, 'g4'), (1943, 98, 1.5, 'g5'), (1944, 129, 2.0, 'g6'), (1945, 160, 2.5, 'g7'), (1946, 191, 3.0, 'g8'), (1947, 11, 3.5, 'g9'), (1948, 42, 4.0, 'g10'), (1949, 73, 4.5, 'g11'), (1950, 104, 5.0, 'g12'), (1951, 135, 5.5, 'g13'), (1952, 166, 6.0, 'g14'), (1953, 197, 6.5, 'g15'), (1954, 17, 7.0, 'g16'), (1955, 48, 7.5, 'g17'), (1956, 79, 8.0, 'g18'), (1957, 110, 8.5, 'g0'), (1958, 141, 9.0, 'g1'), (1959, 172, 9.5, 'g2'), (1960, 203, 10.0, 'g3'), (1961, 23, 10.5, 'g4'), (1962, 54, 11.0, 'g5'), (1963, 85, 11.5, 'g6'), (1964, 116, 12.0, 'g7'), (1965, 147, 12.5, 'g8'), (1966, 178, 13.0, 'g9'), (1967, 209, 13.5, 'g10'), (1968, 29, 14.0, 'g11'), (1969, 60, 14.5, 'g12'), (1970, 91, 15.0, 'g13'), (1971, 122, 15.5, 'g14'), (1972, 153, 16.0, 'g15'), (1973, 184, 16.5, 'g16'), (1974, 4, 17.0, 'g17'), (1975, 35, 17.5, 'g18'), (1976, 66, 18.0, 'g0'), (1977, 97, 18.5, 'g1'), (1978, 128, 19.0, 'g2'), (1979, 159, 19.5, 'g3'), (1980, 190, 20.0, 'g4'), (1981, 10, 20.5, 'g5'), (1982, 41, 21.0, 'g6'), (1983, 72, 21.5, 'g7'), (1984, 103, 22.0, 'g8'), (1985, 134, 22.5, 'g9'), (1986, 165, 23.0, 'g10'), (1987, 196, 23.5, 'g11'), (1988, 16, 24.0, 'g12'), (1989, 47, 24.5, 'g13'), (1990, 78, 25.0, 'g14'), (1991, 109, 25.5, 'g15'), (1992, 140, 26.0, 'g16'), (1993, 171, 26.5, 'g17'), (1994, 202, 27.0, 'g18'), (1995, 22, 27.5, 'g0'), (1996, 53, 28.0, 'g1'), (1997, 84, 28.5, 'g2'), (1998, 115, 29.0, 'g3'), (1999, 146, 29.5, 'g4'), (2000, 177, 30.0, 'g5'), (2001, 208, 30.5, 'g6'), (2002, 28, 31.0, 'g7'), (2003, 59, 31.5, 'g8'), (2004, 90, 32.0, 'g9'), (2005, 121, 32.5, 'g10'), (2006, 152, 33.0, 'g11'), (2007, 183, 33.5, 'g12'), (2008, 3, 34.0, 'g13'), (2009, 34, 34.5, 'g14'), (2010, 65, 35.0, 'g15'), (2011, 96, 35.5, 'g16'), (2012, 127, 36.0, 'g17'), (2013, 158, 36.5, 'g18'), (2014, 189, 37.0, 'g0'), (2015, 9, 37.5, 'g1'), (2016, 40, 38.0, 'g2'), (2017, 71, 38.5, 'g3'), (2018, 102, 39.0, 'g4'), (2019, 133, 39.5, 'g5'), (2020, 164, 40.0, 'g6'), (2021, 195, 40.5, 'g7'), (2022, 15, 41.0, 'g8'), (2023, 46, 41.5, 'g9'), (2024, 77, 42.0, 'g10'), (2025, 108, 42.5, 'g11'), (2026, 139, 43.0, 'g12'), (2027, 170, 43.5, 'g13'), (2028, 201, 44.0, 'g14'), (2029, 21, 44.5, 'g15'), (2030, 52, 45.0, 'g16'), (2031, 83, 45.5, 'g17'), (2032, 114, 46.0, 'g18'), (2033, 145, 46.5, 'g0'), (2034, 176, 47.0, 'g1'), (2035, 207, 47.5, 'g2'), (2036, 27, 48.0, 'g3'), (2037, 58, 0.0, 'g4'), (2038, 89, 0.5, 'g5'), (2039, 120, 1.0, 'g6'), (2040, 151, 1.5, 'g7'), (2041, 182, 2.0, 'g8'), (2042, 2, 2.5, 'g9'), (2043, 33, 3.0, 'g10'), (2044, 64, 3.5, 'g11'), (2045, 95, 4.0, 'g12'), (2046, 126, 4.5, 'g13'), (2047, 157, 5.0, 'g14'), (2048, 188, 5.5, 'g15'), (2049, 8, 6.0, 'g16'), (2050, 39, 6.5, 'g17'), (2051, 70, 7.0, 'g18'), (2052, 101, 7.5, 'g0'), (2053, 132, 8.0, 'g1'), (2054, 163, 8.5, 'g2'), (2055, 194, 9.0, 'g3'), (2056, 14, 9.5, 'g4'), (2057, 45, 10.0, 'g5'), (2058, 76, 10.5, 'g6'), (2059, 107, 11.0, 'g7'), (2060, 138, 11.5, 'g8'), (2061, 169, 12.0, 'g9'), (2062, 200, 12.5, 'g10'), (2063, 20, 13.0, 'g11'), (2064, 51, 13.5, 'g12'), (2065, 82, 14.0, 'g13'), (2066, 113, 14.5, 'g14'), (2067, 144, 15.0, 'g15'), (2068, 175, 15.5, 'g16'), (2069, 206, 16.0, 'g17'), (2070, 26, 16.5, 'g18'), (2071, 57, 17.0, 'g0'), (2072, 88, 17.5, 'g1'), (2073, 119, 18.0, 'g2'), (2074, 150, 18.5, 'g3'), (2075, 181, 19.0, 'g4'), (2076, 1, 19.5, 'g5'), (2077, 32, 20.0, 'g6'), (2078, 63, 20.5, 'g7'), (2079, 94, 21.0, 'g8'), (2080, 125, 21.5, 'g9'), (2081, 156, 22.0, 'g10'), (2082, 187, 22.5, 'g11'), (2083, 7, 23.0, 'g12'), (2084, 38, 23.5, 'g13'), (2085, 69, 24.0, 'g14'), (2086, 100, 24.5, 'g15'), (2087, 131, 25.0, 'g16'), (2088, 162, 25.5, 'g17'), (2089, 193, 26.0, 'g18'), (2090, 13, 26.5, 'g0'), (2091, 44, 27.0, 'g1'), (2092, 75, 27.5, 'g2'), (2093, 106, 28.0, 'g3'), (2094, 137, 28.5, 'g4'), (2095, 168, 29.0, 'g5'), (2096, 199, 29.5, 'g6'), (2097, 19, 30.0, 'g7'), (2098, 50, 30.5, 'g8'), (2099, 81, 31.0, 'g9'), (2100, 112, 31.5, 'g10'), (2101, 143, 32.0, 'g11'), (2102, 174, 32.5, 'g12'), (2103, 205, 33.0, 'g13'), (2104, 25, 33.5, 'g14'), (2105, 56, 34.0, 'g15'), (2106, 87, 34.5, 'g16'), (2107, 118, 35.0, 'g17'), (2108, 149, 35.5, 'g18'), (2109, 180, 36.0, 'g0'), (2110, 0, 36.5, 'g1'), (2111, 31, 37.0, 'g2'), (2112, 62, 37.5, 'g3'), (2113, 93, 38.0, 'g4'), (2114, 124, 38.5, 'g5'), (2115, 155, 39.0, 'g6'), (2116, 186, 39.5, 'g7'), (2117, 6, 40.0, 'g8'), (2118, 37, 40.5, 'g9'), (2119, 68, 41.0, 'g10'), (2120, 99, 41.5, 'g11'), (2121, 130, 42.0, 'g12'), (2122, 161, 42.5, 'g13'), (2123, 192, 43.0, 'g14'), (2124, 12, 43.5, 'g15'), (2125, 43, 44.0, 'g16'), (2126, 74, 44.5, 'g17'), (2127, 105, 45.0, 'g18'), (2128, 136, 45.5, 'g0'), (2129, 167, 46.0, 'g1'), (2130, 198, 46.5, 'g2'), (2131, 18, 47.0, 'g3'), (2132, 49, 47.5, 'g4'), (2133, 80, 48.0, 'g5'), (2134, 111, 0.0, 'g6'), (2135, 142, 0.5, 'g7'), (2136, 173, 1.0, 'g8'), (2137, 204, 1.5, 'g9'), (2138, 24, 2.0, 'g10'), (2139, 55, 2.5, 'g11'), (2140, 86, 3.0, 'g12'), (2141, 117, 3.5, 'g13'), (2142, 148, 4.0, 'g14'), (2143, 179, 4.5, 'g15'), (2144, 210, 5.0, 'g16'), (2145, 30, 5.5, 'g17'), (2146, 61, 6.0, 'g18'), (2147, 92, 6.5, 'g0'), (2148, 123, 7.0, 'g1'), (2149, 154, 7.5, 'g2'), (2150, 185, 8.0, 'g3'), (2151, 5, 8.5, 'g4'), (2152, 36, 9.0, 'g5'), (2153, 67, 9.5, 'g6'), (2154, 98, 10.0, 'g7'), (2155, 129, 10.5, 'g8'), (2156, 160, 11.0, 'g9'), (2157, 191, 11.5, 'g10'), (2158, 11, 12.0, 'g11'), (2159, 42, 12.5, 'g12'), (2160, 73, 13.0, 'g13'), (2161, 104, 13.5, 'g14'), (2162, 135, 14.0, 'g15'), (2163, 166, 14.5, 'g16'), (2164, 197, 15.0, 'g17'), (2165, 17, 15.5, 'g18'), (2166, 48, 16.0, 'g0'), (2167, 79, 16.5, 'g1'), (2168, 110, 17.0, 'g2'), (2169, 141, 17.5, 'g3'), (2170, 172, 18.0, 'g4'), (2171, 203, 18.5, 'g5'), (2172, 23, 19.0, 'g6'), (2173, 54, 19.5, 'g7'), (2174, 85, 20.0, 'g8'), (2175, 116, 20.5, 'g9'), (2176, 147, 21.0, 'g10'), (2177, 178, 21.5, 'g11'), (2178, 209, 22.0, 'g12'), (2179, 29, 22.5, 'g13'), (2180, 60, 23.0, 'g14'), (2181, 91, 23.5, 'g15'), (2182, 122, 24.0, 'g16'), (2183, 153, 24.5, 'g17'), (2184, 184, 25.0, 'g18'), (2185, 4, 25.5, 'g0'), (2186, 35, 26.0, 'g1'), (2187, 66, 26.5, 'g2'), (2188, 97, 27.0, 'g3'), (2189, 128, 27.5, 'g4'), (2190, 159, 28.0, 'g5'), (2191, 190, 28.5, 'g6'), (2192, 10, 29.0, 'g7'), (2193, 41, 29.5, 'g8'), (2194, 72, 30.0, 'g9'), (2195, 103, 30.5, 'g10'), (2196, 134, 31.0, 'g11'), (2197, 165, 31.5, 'g12'), (2198, 196, 32.0, 'g13'), (2199, 16, 32.5, 'g14'), (2200, 47, 33.0, 'g15'), (2201, 78, 33.5, 'g16'), (2202, 109, 34.0, 'g17'), (2203, 140, 34.5, 'g18'), (2204, 171, 35.0, 'g0'), (2205, 202, 35.5, 'g1'), (2206, 22, 36.0, 'g2'), (2207, 53, 36.5, 'g3'), (2208, 84, 37.0, 'g4'), (2209, 115, 37.5, 'g5'), (2210, 146, 38.0, 'g6'), (2211, 177, 38.5, 'g7'), (2212, 208, 39.0, 'g8'), (2213, 28, 39.5, 'g9'), (2214, 59, 40.0, 'g10'), (2215, 90, 40.5, 'g11'), (2216, 121, 41.0, 'g12'), (2217, 152, 41.5, 'g13'), (2218, 183, 42.0, 'g14'), (2219, 3, 42.5, 'g15'), (2220, 34, 43.0, 'g16'), (2221, 65, 43.5, 'g17'), (2222, 96, 44.0, 'g18'), (2223, 127, 44.5, 'g0'), (2224, 158, 45.0, 'g1'), (2225, 189, 45.5, 'g2'), (2226, 9, 46.0, 'g3'), (2227, 40, 46.5, 'g4'), (2228, 71, 47.0, 'g5'), (2229, 102, 47.5, 'g6'), (2230, 133, 48.0, 'g7'), (2231, 164, 0.0, 'g8'), (2232, 195, 0.5, 'g9'), (2233, 15, 1.0, 'g10'), (2234, 46, 1.5, 'g11'), (2235, 77, 2.0, 'g12'), (2236, 108, 2.5, 'g13'), (2237, 139, 3.0, 'g14'), (2238, 170, 3.5, 'g15'), (2239, 201, 4.0, 'g16'), (2240, 21, 4.5, 'g17'), (2241, 52, 5.0, 'g18'), (2242, 83, 5.5, 'g0'), (2243, 114, 6.0, 'g1'), (2244, 145, 6.5, 'g2'), (2245, 176, 7.0, 'g3'), (2246, 207, 7.5, 'g4'), (2247, 27, 8.0, 'g5'), (2248, 58, 8.5, 'g6'), (2249, 89, 9.0, 'g7'), (2250, 120, 9.5, 'g8'), (2251, 151, 10.0, 'g9'), (2252, 182, 10.5, 'g10'), (2253, 2, 11.0, 'g11'), (2254, 33, 11.5, 'g12'), (2255, 64, 12.0, 'g13'), (2256, 95, 12.5, 'g14'), (2257, 126, 13.0, 'g15'), (2258, 157, 13.5, 'g16'), (2259, 188, 14.0, 'g17'), (2260, 8, 14.5, 'g18'), (2261, 39, 15.0, 'g0'), (2262, 70, 15.5, 'g1'), (2263, 101, 16.0, 'g2'), (2264, 132, 16.5, 'g3'), (2265, 163, 17.0, 'g4'), (2266, 194, 17.5, 'g5'), (2267, 14, 18.0, 'g6'), (2268, 45, 18.5, 'g7'), (2269, 76, 19.0, 'g8'), (2270, 107, 19.5, 'g9'), (2271, 138, 20.0, 'g10'), (2272, 169, 20.5, 'g11'), (2273, 200, 21.0, 'g12'), (2274, 20, 21.5, 'g13'), (2275, 51, 22.0, 'g14'), (2276, 82, 22.5, 'g15'), (2277, 113, 23.0, 'g16'), (2278, 144, 23.5, 'g17'), (2279, 175, 24.0, 'g18'), (2280, 206, 24.5, 'g0'), (2281, 26, 25.0, 'g1'), (2282, 57, 25.5, 'g2'), (2283, 88, 26.0, 'g3'), (2284, 119, 26.5, 'g4'), (2285, 150, 27.0, 'g5'), (2286, 181, 27.5, 'g6'), (2287, 1, 28.0, 'g7'), (2288, 32, 28.5, 'g8'), (2289, 63, 29.0, 'g9'), (2290, 94, 29.5, 'g10'), (2291, 125, 30.0, 'g11'), (2292, 156, 30.5, 'g12'), (2293, 187, 31.0, 'g13'), (2294, 7, 31.5, 'g14'), (2295, 38, 32.0, 'g15'), (2296, 69, 32.5, 'g16'), (2297, 100, 33.0, 'g17'), (2298, 131, 33.5, 'g18'), (2299, 162, 34.0, 'g0'), (2300, 193, 34.5, 'g1'), (2301, 13, 35.0, 'g2'), (2302, 44, 35.5, 'g3'), (2303, 75, 36.0, 'g4'), (2304, 106, 36.5, 'g5'), (2305, 137, 37.0, 'g6'), (2306, 168, 37.5, 'g7'), (2307, 199, 38.0, 'g8'), (2308, 19, 38.5, 'g9'), (2309, 50, 39.0, 'g10'), (2310, 81, 39.5, 'g11'), (2311, 112, 40.0, 'g12'), (2312, 143, 40.5, 'g13'), (2313, 174, 41.0, 'g14'), (2314, 205, 41.5, 'g15'), (2315, 25, 42.0, 'g16'), (2316, 56, 42.5, 'g17'), (2317, 87, 43.0, 'g18'), (2318, 118, 43.5, 'g0'), (2319, 149, 44.0, 'g1'), (2320, 180, 44.5, 'g2'), (2321, 0, 45.0, 'g3'), (2322, 31, 45.5, 'g4'), (2323, 62, 46.0, 'g5'), (2324, 93, 46.5, 'g6'), (2325, 124, 47.0, 'g7'), (2326, 155, 47.5, 'g8'), (2327, 186, 48.0, 'g9'), (2328, 6, 0.0, 'g10'), (2329, 37, 0.5, 'g11'), (2330, 68, 1.0, 'g12'), (2331, 99, 1.5, 'g13'), (2332, 130, 2.0, 'g14'), (2333, 161, 2.5, 'g15'), (2334, 192, 3.0, 'g16'), (2335, 12, 3.5, 'g17'), (2336, 43, 4.0, 'g18'), (2337, 74, 4.5, 'g0'), (2338, 105, 5.0, 'g1'), (2339, 136, 5.5, 'g2'), (2340, 167, 6.0, 'g3'), (2341, 198, 6.5, 'g4'), (2342, 18, 7.0, 'g5'), (2343, 49, 7.5, 'g6'), (2344, 80, 8.0, 'g7'), (2345, 111, 8.5, 'g8'), (2346, 142, 9.0, 'g9'), (2347, 173, 9.5, 'g10'), (2348, 204, 10.0, 'g11'), (2349, 24, 10.5, 'g12'), (2350, 55, 11.0, 'g13'), (2351, 86, 11.5, 'g14'), (2352, 117, 12.0, 'g15'), (2353, 148, 12.5, 'g16'), (2354, 179, 13.0, 'g17'), (2355, 210, 13.5, 'g18'), (2356, 30, 14.0, 'g0'), (2357, 61, 14.5, 'g1'), (2358, 92, 15.0, 'g2'), (2359, 123, 15.5, 'g3'), (2360, 154, 16.0, 'g4'), (2361, 185, 16.5, 'g5'), (2362, 5, 17.0, 'g6'), (2363, 36, 17.5, 'g7'), (2364, 67, 18.0, 'g8'), (2365, 98, 18.5, 'g9'), (2366, 129, 19.0, 'g10'), (2367, 160, 19.5, 'g11'), (2368, 191, 20.0, 'g12'), (2369, 11, 20.5, 'g13'), (2370, 42, 21.0, 'g14'), (2371, 73, 21.5, 'g15'), (2372, 104, 22.0, 'g16'), (2373, 135, 22.5, 'g17'), (2374, 166, 23.0, 'g18'), (2375, 197, 23.5, 'g0'), (2376, 17, 24.0, 'g1'), (2377, 48, 24.5, 'g2'), (2378, 79, 25.0, 'g3'), (2379, 110, 25.5, 'g4'), (2380, 141, 26.0, 'g5'), (2381, 172, 26.5, 'g6'), (2382, 203, 27.0, 'g7'), (2383, 23, 27.5, 'g8'), (2384, 54, 28.0, 'g9'), (2385, 85, 28.5, 'g10'), (2386, 116, 29.0, 'g11'), (2387, 147, 29.5, 'g12'), (2388, 178, 30.0, 'g13'), (2389, 209, 30.5, 'g14'), (2390, 29, 31.0, 'g15'), (2391, 60, 31.5, 'g16'), (2392, 91, 32.0, 'g17'), (2393, 122, 32.5, 'g18'), (2394, 153, 33.0, 'g0'), (2395, 184, 33.5, 'g1'), (2396, 4, 34.0, 'g2'), (2397, 35, 34.5, 'g3'), (2398, 66, 35.0, 'g4'), (2399, 97, 35.5, 'g5'), (2400, 128, 36.0, 'g6'), (2401, 159, 36.5, 'g7'), (2402, 190, 37.0, 'g8'), (2403, 10, 37.5, 'g9'), (2404, 41, 38.0, 'g10'), (2405, 72, 38.5, 'g11'), (2406, 103, 39.0, 'g12'), (2407, 134, 39.5, 'g13'), (2408, 165, 40.0, 'g14'), (2409, 196, 40.5, 'g15'), (2410, 16, 41.0, 'g16'), (2411, 47, 41.5, 'g17'), (2412, 78, 42.0, 'g18'), (2413, 109, 42.5, 'g0'), (2414, 140, 43.0, 'g1'), (2415, 171, 43.5, 'g2'), (2416, 202, 44.0, 'g3'), (2417, 22, 44.5, 'g4'), (2418, 53, 45.0, 'g5'), (2419, 84, 45.5, 'g6'), (2420, 115, 46.0, 'g7'), (2421, 146, 46.5, 'g8'), (2422, 177, 47.0, 'g9'), (2423, 208, 47.5, 'g10'), (2424, 28, 48.0, 'g11'), (2425, 59, 0.0, 'g12'), (2426, 90, 0.5, 'g13'), (2427, 121, 1.0, 'g14'), (2428, 152, 1.5, 'g15'), (2429, 183, 2.0, 'g16'), (2430, 3, 2.5, 'g17'), (2431, 34, 3.0, 'g18'), (2432, 65, 3.5, 'g0'), (2433, 96, 4.0, 'g1'), (2434, 127, 4.5, 'g2'), (2435, 158, 5.0, 'g3'), (2436, 189, 5.5, 'g4'), (2437, 9, 6.0, 'g5'), (2438, 40, 6.5, 'g6'), (2439, 71, 7.0, 'g7'), (2440, 102, 7.5, 'g8'), (2441, 133, 8.0, 'g9'), (2442, 164, 8.5, 'g10'), (2443, 195, 9.0, 'g11'), (2444, 15, 9.5, 'g12'), (2445, 46, 10.0, 'g13'), (2446, 77, 10.5, 'g14'), (2447, 108, 11.0, 'g15'), (2448, 139, 11.5, 'g16'), (2449, 170, 12.0, 'g17'), (2450, 201, 12.5, 'g18'), (2451, 21, 13.0, 'g0'), (2452, 52, 13.5, 'g1'), (2453, 83, 14.0, 'g2'), (2454, 114, 14.5, 'g3'), (2455, 145, 15.0, 'g4'), (2456, 176, 15.5, 'g5'), (2457, 207, 16.0, 'g6'), (2458, 27, 16.5, 'g7'), (2459, 58, 17.0, 'g8'), (2460, 89, 17.5, 'g9'), (2461, 120, 18.0, 'g10'), (2462, 151, 18.5, 'g11'), (2463, 182, 19.0, 'g12'), (2464, 2, 19.5, 'g13'), (2465, 33, 20.0, 'g14'), (2466, 64, 20.5, 'g15'), (2467, 95, 21.0, 'g16'), (2468, 126, 21.5, 'g17'), (2469, 157, 22.0, 'g18'), (2470, 188, 22.5, 'g0'), (2471, 8, 23.0, 'g1'), (2472, 39, 23.5, 'g2'), (2473, 70, 24.0, 'g3'), (2474, 101, 24.5, 'g4'), (2475, 132, 25.0, 'g5'), (2476, 163, 25.5, 'g6'), (2477, 194, 26.0, 'g7'), (2478, 14, 26.5, 'g8'), (2479, 45, 27.0, 'g9'), (2480, 76, 27.5, 'g10'), (2481, 107, 28.0, 'g11'), (2482, 138, 28.5, 'g12'), (2483, 169, 29.0, 'g13'), (2484, 200, 29.5, 'g14'), (2485, 20, 30.0, 'g15'), (2486, 51, 30.5, 'g16'), (2487, 82, 31.0, 'g17'), (2488, 113, 31.5, 'g18'), (2489, 144, 32.0, 'g0'), (2490, 175, 32.5, 'g1'), (2491, 206, 33.0, 'g2'), (2492, 26, 33.5, 'g3'), (2493, 57, 34.0, 'g4'), (2494, 88, 34.5, 'g5'), (2495, 119, 35.0, 'g6'), (2496, 150, 35.5, 'g7'), (2497, 181, 36.0, 'g8'), (2498, 1, 36.5, 'g9'), (2499, 32, 37.0, 'g10'), (2500, 63, 37.5, 'g11'), (2501, 94, 38.0, 'g12'), (2502, 125, 38.5, 'g13'), (2503, 156, 39.0, 'g14'), (2504, 187, 39.5, 'g15'), (2505, 7, 40.0, 'g16'), (2506, 38, 40.5, 'g17'), (2507, 69, 41.0, 'g18'), (2508, 100, 41.5, 'g0'), (2509, 131, 42.0, 'g1'), (2510, 162, 42.5, 'g2'), (2511, 193, 43.0, 'g3'), (2512, 13, 43.5, 'g4'), (2513, 44, 44.0, 'g5'), (2514, 75, 44.5, 'g6'), (2515, 106, 45.0, 'g7'), (2516, 137, 45.5, 'g8'), (2517, 168, 46.0, 'g9'), (2518, 199, 46.5, 'g10'), (2519, 19, 47.0, 'g11'), (2520, 50, 47.5, 'g12'), (2521, 81, 48.0, 'g13'), (2522, 112, 0.0, 'g14'), (2523, 143, 0.5, 'g15'), (2524, 174, 1.0, 'g16'), (2525, 205, 1.5, 'g17'), (2526, 25, 2.0, 'g18'), (2527, 56, 2.5, 'g0'), (2528, 87, 3.0, 'g1'), (2529, 118, 3.5, 'g2'), (2530, 149, 4.0, 'g3'), (2531, 180, 4.5, 'g4'), (2532, 0, 5.0, 'g5'), (2533, 31, 5.5, 'g6'), (2534, 62, 6.0, 'g7'), (2535, 93, 6.5, 'g8'), (2536, 124, 7.0, 'g9'), (2537, 155, 7.5, 'g10'), (2538, 186, 8.0, 'g11'), (2539, 6, 8.5, 'g12'), (2540, 37, 9.0, 'g13'), (2541, 68, 9.5, 'g14'), (2542, 99, 10.0, 'g15'), (2543, 130, 10.5, 'g16'), (2544, 161, 11.0, 'g17'), (2545, 192, 11.5, 'g18'), (2546, 12, 12.0, 'g0'), (2547, 43, 12.5, 'g1'), (2548, 74, 13.0, 'g2'), (2549, 105, 13.5, 'g3'), (2550, 136, 14.0, 'g4'), (2551, 167, 14.5, 'g5'), (2552, 198, 15.0, 'g6'), (2553, 18, 15.5, 'g7'), (2554, 49, 16.0, 'g8'), (2555, 80, 16.5, 'g9'), (2556, 111, 17.0, 'g10'), (2557, 142, 17.5, 'g11'), (2558, 173, 18.0, 'g12'), (2559, 204, 18.5, 'g13'), (2560, 24, 19.0, 'g14'), (2561, 55, 19.5, 'g15'), (2562, 86, 20.0, 'g16'), (2563, 117, 20.5, 'g17'), (2564, 148, 21.0, 'g18'), (2565, 179, 21.5, 'g0'), (2566, 210, 22.0, 'g1'), (2567, 30, 22.5, 'g2'), (2568, 61, 23.0, 'g3'), (2569, 92, 23.5, 'g4'), (2570, 123, 24.0, 'g5'), (2571, 154, 24.5, 'g6'), (2572, 185, 25.0, 'g7'), (2573, 5, 25.5, 'g8'), (2574, 36, 26.0, 'g9'), (2575, 67, 26.5, 'g10'), (2576, 98, 27.0, 'g11'), (2577, 129, 27.5, 'g12'), (2578, 160, 28.0, 'g13'), (2579, 191, 28.5, 'g14'), (2580, 11, 29.0, 'g15'), (2581, 42, 29.5, 'g16'), (2582, 73, 30.0, 'g17'), (2583, 104, 30.5, 'g18'), (2584, 135, 31.0, 'g0'), (2585, 166, 31.5, 'g1'), (2586, 197, 32.0, 'g2'), (2587, 17, 32.5, 'g3'), (2588, 48, 33.0, 'g4'), (2589, 79, 33.5, 'g5'), (2590, 110, 34.0, 'g6'), (2591, 141, 34.5, 'g7'), (2592, 172, 35.0, 'g8'), (2593, 203, 35.5, 'g9'), (2594, 23, 36.0, 'g10'), (2595, 54, 36.5, 'g11'), (2596, 85, 37.0, 'g12'), (2597, 116, 37.5, 'g13'), (2598, 147, 38.0, 'g14'), (2599, 178, 38.5, 'g15'), (2600, 209, 39.0, 'g16'), (2601, 29, 39.5, 'g17'), (2602, 60, 40.0, 'g18'), (2603, 91, 40.5, 'g0'), (2604, 122, 41.0, 'g1'), (2605, 153, 41.5, 'g2'), (2606, 184, 42.0, 'g3'), (2607, 4, 42.5, 'g4'), (2608, 35, 43.0, 'g5'), (2609, 66, 43.5, 'g6'), (2610, 97, 44.0, 'g7'), (2611, 128, 44.5, 'g8'), (2612, 159, 45.0, 'g9'), (2613, 190, 45.5, 'g10'), (2614, 10, 46.0, 'g11'), (2615, 41, 46.5, 'g12'), (2616, 72, 47.0, 'g13'), (2617, 103, 47.5, 'g14'), (2618, 134, 48.0, 'g15'), (2619, 165, 0.0, 'g16'), (2620, 196, 0.5, 'g17'), (2621, 16, 1.0, 'g18'), (2622, 47, 1.5, 'g0'), (2623, 78, 2.0, 'g1'), (2624, 109, 2.5, 'g2'), (2625, 140, 3.0, 'g3'), (2626, 171, 3.5, 'g4'), (2627, 202, 4.0, 'g5'), (2628, 22, 4.5, 'g6'), (2629, 53, 5.0, 'g7'), (2630, 84, 5.5, 'g8'), (2631, 115, 6.0, 'g9'), (2632, 146, 6.5, 'g10'), (2633, 177, 7.0, 'g11'), (2634, 208, 7.5, 'g12'), (2635, 28, 8.0, 'g13'), (2636, 59, 8.5, 'g14'), (2637, 90, 9.0, 'g15'), (2638, 121, 9.5, 'g16'), (2639, 152, 10.0, 'g17'), (2640, 183, 10.5, 'g18'), (2641, 3, 11.0, 'g0'), (2642, 34, 11.5, 'g1'), (2643, 65, 12.0, 'g2'), (2644, 96, 12.5, 'g3'), (2645, 127, 13.0, 'g4'), (2646, 158, 13.5, 'g5'), (2647, 189, 14.0, 'g6'), (2648, 9, 14.5, 'g7'), (2649, 40, 15.0, 'g8'), (2650, 71, 15.5, 'g9'), (2651, 102, 16.0, 'g10'), (2652, 133, 16.5, 'g11'), (2653, 164, 17.0, 'g12'), (2654, 195, 17.5, 'g13'), (2655, 15, 18.0, 'g14'), (2656, 46, 18.5, 'g15'), (2657, 77, 19.0, 'g16'), (2658, 108, 19.5, 'g17'), (2659, 139, 20.0, 'g18'), (2660, 170, 20.5, 'g0'), (2661, 201, 21.0, 'g1'), (2662, 21, 21.5, 'g2'), (2663, 52, 22.0, 'g3'), (2664, 83, 22.5, 'g4'), (2665, 114, 23.0, 'g5'), (2666, 145, 23.5, 'g6'), (2667, 176, 24.0, 'g7'), (2668, 207, 24.5, 'g8'), (2669, 27, 25.0, 'g9'), (2670, 58, 25.5, 'g10'), (2671, 89, 26.0, 'g11'), (2672, 120, 26.5, 'g12'), (2673, 151, 27.0, 'g13'), (2674, 182, 27.5, 'g14'), (2675, 2, 28.0, 'g15'), (2676, 33, 28.5, 'g16'), (2677, 64, 29.0, 'g17'), (2678, 95, 29.5, 'g18'), (2679, 126, 30.0, 'g0'), (2680, 157, 30.5, 'g1'), (2681, 188, 31.0, 'g2'), (2682, 8, 31.5, 'g3'), (2683, 39, 32.0, 'g4'), (2684, 70, 32.5, 'g5'), (2685, 101, 33.0, 'g6'), (2686, 132, 33.5, 'g7'), (2687, 163, 34.0, 'g8'), (2688, 194, 34.5, 'g9'), (2689, 14, 35.0, 'g10'), (2690, 45, 35.5, 'g11'), (2691, 76, 36.0, 'g12'), (2692, 107, 36.5, 'g13'), (2693, 138, 37.0, 'g14'), (2694, 169, 37.5, 'g15'), (2695, 200, 38.0, 'g16'), (2696, 20, 38.5, 'g17'), (2697, 51, 39.0, 'g18'), (2698, 82, 39.5, 'g0'), (2699, 113, 40.0, 'g1'), (2700, 144, 40.5, 'g2'), (2701, 175, 41.0, 'g3'), (2702, 206, 41.5, 'g4'), (2703, 26, 42.0, 'g5'), (2704, 57, 42.5, 'g6'), (2705, 88, 43.0, 'g7'), (2706, 119, 43.5, 'g8'), (2707, 150, 44.0, 'g9'), (2708, 181, 44.5, 'g10'), (2709, 1, 45.0, 'g11'), (2710, 32, 45.5, 'g12'), (2711, 63, 46.0, 'g13'), (2712, 94, 46.5, 'g14'), (2713, 125, 47.0, 'g15'), (2714, 156, 47.5, 'g16'), (2715, 187, 48.0, 'g17'), (2716, 7, 0.0, 'g18'), (2717, 38, 0.5, 'g0'), (2718, 69, 1.0, 'g1'), (2719, 100, 1.5, 'g2'), (2720, 131, 2.0, 'g3'), (2721, 162, 2.5, 'g4'), (2722, 193, 3.0, 'g5'), (2723, 13, 3.5, 'g6'), (2724, 44, 4.0, 'g7'), (2725, 75, 4.5, 'g8'), (2726, 106, 5.0, 'g9'), (2727, 137, 5.5, 'g10'), (2728, 168, 6.0, 'g11'), (2729, 199, 6.5, 'g12'), (2730, 19, 7.0, 'g13'), (2731, 50, 7.5, 'g14'), (2732, 81, 8.0, 'g15'), (2733, 112, 8.5, 'g16'), (2734, 143, 9.0, 'g17'), (2735, 174, 9.5, 'g18'), (2736, 205, 10.0, 'g0'), (2737, 25, 10.5, 'g1'), (2738, 56, 11.0, 'g2'), (2739, 87, 11.5, 'g3'), (2740, 118, 12.0, 'g4'), (2741, 149, 12.5, 'g5'), (2742, 180, 13.0, 'g6'), (2743, 0, 13.5, 'g7'), (2744, 31, 14.0, 'g8'), (2745, 62, 14.5, 'g9'), (2746, 93, 15.0, 'g10'), (2747, 124, 15.5, 'g11'), (2748, 155, 16.0, 'g12'), (2749, 186, 16.5, 'g13'), (2750, 6, 17.0, 'g14'), (2751, 37, 17.5, 'g15'), (2752, 68, 18.0, 'g16'), (2753, 99, 18.5, 'g17'), (2754, 130, 19.0, 'g18'), (2755, 161, 19.5, 'g0'), (2756, 192, 20.0, 'g1'), (2757, 12, 20.5, 'g2'), (2758, 43, 21.0, 'g3'), (2759, 74, 21.5, 'g4'), (2760, 105, 22.0, 'g5'), (2761, 136, 22.5, 'g6'), (2762, 167, 23.0, 'g7'), (2763, 198, 23.5, 'g8'), (2764, 18, 24.0, 'g9'), (2765, 49, 24.5, 'g10'), (2766, 80, 25.0, 'g11'), (2767, 111, 25.5, 'g12'), (2768, 142, 26.0, 'g13'), (2769, 173, 26.5, 'g14'), (2770, 204, 27.0, 'g15'), (2771, 24, 27.5, 'g16'), (2772, 55, 28.0, 'g17'), (2773, 86, 28.5, 'g18'), (2774, 117, 29.0, 'g0'), (2775, 148, 29.5, 'g1'), (2776, 179, 30.0, 'g2'), (2777, 210, 30.5, 'g3'), (2778, 30, 31.0, 'g4'), (2779, 61, 31.5, 'g5'), (2780, 92, 32.0, 'g6'), (2781, 123, 32.5, 'g7'), (2782, 154, 33.0, 'g8'), (2783, 185, 33.5, 'g9'), (2784, 5, 34.0, 'g10'), (2785, 36, 34.5, 'g11'), (2786, 67, 35.0, 'g12'), (2787, 98, 35.5, 'g13'), (2788, 129, 36.0, 'g14'), (2789, 160, 36.5, 'g15'), (2790, 191, 37.0, 'g16'), (2791, 11, 37.5, 'g17'), (2792, 42, 38.0, 'g18'), (2793, 73, 38.5, 'g0'), (2794, 104, 39.0, 'g1'), (2795, 135, 39.5, 'g2'), (2796, 166, 40.0, 'g3'), (2797, 197, 40.5, 'g4'), (2798, 17, 41.0, 'g5'), (2799, 48, 41.5, 'g6'), (2800, 79, 42.0, 'g7'), (2801, 110, 42.5, 'g8'), (2802, 141, 43.0, 'g9'), (2803, 172, 43.5, 'g10'), (2804, 203, 44.0, 'g11'), (2805, 23, 44.5, 'g12'), (2806, 54, 45.0, 'g13'), (2807, 85, 45.5, 'g14'), (2808, 116, 46.0, 'g15'), (2809, 147, 46.5, 'g16'), (2810, 178, 47.0, 'g17'), (2811, 209, 47.5, 'g18'), (2812, 29, 48.0, 'g0'), (2813, 60, 0.0, 'g1'), (2814, 91, 0.5, 'g2'), (2815, 122, 1.0, 'g3'), (2816, 153, 1.5, 'g4'), (2817, 184, 2.0, 'g5'), (2818, 4, 2.5, 'g6'), (2819, 35, 3.0, 'g7'), (2820, 66, 3.5, 'g8'), (2821, 97, 4.0, 'g9'), (2822, 128, 4.5, 'g10'), (2823, 159, 5.0, 'g11'), (2824, 190, 5.5, 'g12'), (2825, 10, 6.0, 'g13'), (2826, 41, 6.5, 'g14'), (2827, 72, 7.0, 'g15'), (2828, 103, 7.5, 'g16'), (2829, 134, 8.0, 'g17'), (2830, 165, 8.5, 'g18'), (2831, 196, 9.0, 'g0'), (2832, 16, 9.5, 'g1'), (2833, 47, 10.0, 'g2'), (2834, 78, 10.5, 'g3'), (2835, 109, 11.0, 'g4'), (2836, 140, 11.5, 'g5'), (2837, 171, 12.0, 'g6'), (2838, 202, 12.5, 'g7'), (2839, 22, 13.0, 'g8'), (2840, 53, 13.5, 'g9'), (2841, 84, 14.0, 'g10'), (2842, 115, 14.5, 'g11'), (2843, 146, 15.0, 'g12'), (2844, 177, 15.5, 'g13'), (2845, 208, 16.0, 'g14'), (2846, 28, 16.5, 'g15'), (2847, 59, 17.0, 'g16'), (2848, 90, 17.5, 'g17'), (2849, 121, 18.0, 'g18'), (2850, 152, 18.5, 'g0'), (2851, 183, 19.0, 'g1'), (2852, 3, 19.5, 'g2'), (2853, 34, 20.0, 'g3'), (2854, 65, 20.5, 'g4'), (2855, 96, 21.0, 'g5'), (2856, 127, 21.5, 'g6'), (2857, 158, 22.0, 'g7'), (2858, 189, 22.5, 'g8'), (2859, 9, 23.0, 'g9'), (2860, 40, 23.5, 'g10'), (2861, 71, 24.0, 'g11'), (2862, 102, 24.5, 'g12'), (2863, 133, 25.0, 'g13'), (2864, 164, 25.5, 'g14'), (2865, 195, 26.0, 'g15'), (2866, 15, 26.5, 'g16'), (2867, 46, 27.0, 'g17'), (2868, 77, 27.5, 'g18'), (2869, 108, 28.0, 'g0'), (2870, 139, 28.5, 'g1'), (2871, 170, 29.0, 'g2'), (2872, 201, 29.5, 'g3'), (2873, 21, 30.0, 'g4'), (2874, 52, 30.5, 'g5'), (2875, 83, 31.0, 'g6'), (2876, 114, 31.5, 'g7'), (2877, 145, 32.0, 'g8'), (2878, 176, 32.5, 'g9'), (2879, 207, 33.0, 'g10'), (2880, 27, 33.5, 'g11'), (2881, 58, 34.0, 'g12'), (2882, 89, 34.5, 'g13'), (2883, 120, 35.0, 'g14'), (2884, 151, 35.5, 'g15'), (2885, 182, 36.0, 'g16'), (2886, 2, 36.5, 'g17'), (2887, 33, 37.0, 'g18'), (2888, 64, 37.5, 'g0'), (2889, 95, 38.0, 'g1'), (2890, 126, 38.5, 'g2'), (2891, 157, 39.0, 'g3'), (2892, 188, 39.5, 'g4'), (2893, 8, 40.0, 'g5'), (2894, 39, 40.5, 'g6'), (2895, 70, 41.0, 'g7'), (2896, 101, 41.5, 'g8'), (2897, 132, 42.0, 'g9'), (2898, 163, 42.5, 'g10'), (2899, 194, 43.0, 'g11'), (2900, 14, 43.5, 'g12'), (2901, 45, 44.0, 'g13'), (2902, 76, 44.5, 'g14'), (2903, 107, 45.0, 'g15'), (2904, 138, 45.5, 'g16'), (2905, 169, 46.0, 'g17'), (2906, 200, 46.5, 'g18'), (2907, 20, 47.0, 'g0'), (2908, 51, 47.5, 'g1'), (2909, 82, 48.0, 'g2'), (2910, 113, 0.0, 'g3'), (2911, 144, 0.5, 'g4'), (2912, 175, 1.0, 'g5'), (2913, 206, 1.5, 'g6'), (2914, 26, 2.0, 'g7'), (2915, 57, 2.5, 'g8'), (2916, 88, 3.0, 'g9'), (2917, 119, 3.5, 'g10'), (2918, 150, 4.0, 'g11'), (2919, 181, 4.5, 'g12'), (2920, 1, 5.0, 'g13'), (2921, 32, 5.5, 'g14'), (2922, 63, 6.0, 'g15'), (2923, 94, 6.5, 'g16'), (2924, 125, 7.0, 'g17'), (2925, 156, 7.5, 'g18'), (2926, 187, 8.0, 'g0'), (2927, 7, 8.5, 'g1'), (2928, 38, 9.0, 'g2'), (2929, 69, 9.5, 'g3'), (2930, 100, 10.0, 'g4'), (2931, 131, 10.5, 'g5'), (2932, 162, 11.0, 'g6'), (2933, 193, 11.5, 'g7'), (2934, 13, 12.0, 'g8'), (2935, 44, 12.5, 'g9'), (2936, 75, 13.0, 'g10'), (2937, 106, 13.5, 'g11'), (2938, 137, 14.0, 'g12'), (2939, 168, 14.5, 'g13'), (2940, 199, 15.0, 'g14'), (2941, 19, 15.5, 'g15'), (2942, 50, 16.0, 'g16'), (2943, 81, 16.5, 'g17'), (2944, 112, 17.0, 'g18'), (2945, 143, 17.5, 'g0'), (2946, 174, 18.0, 'g1'), (2947, 205, 18.5, 'g2'), (2948, 25, 19.0, 'g3'), (2949, 56, 19.5, 'g4'), (2950, 87, 20.0, 'g5'), (2951, 118, 20.5, 'g6'), (2952, 149, 21.0, 'g7'), (2953, 180, 21.5, 'g8'), (2954, 0, 22.0, 'g9'), (2955, 31, 22.5, 'g10'), (2956, 62, 23.0, 'g11'), (2957, 93, 23.5, 'g12'), (2958, 124, 24.0, 'g13'), (2959, 155, 24.5, 'g14'), (2960, 186, 25.0, 'g15'), (2961, 6, 25.5, 'g16'), (2962, 37, 26.0, 'g17'), (2963, 68, 26.5, 'g18'), (2964, 99, 27.0, 'g0'), (2965, 130, 27.5, 'g1'), (2966, 161, 28.0, 'g2'), (2967, 192, 28.5, 'g3'), (2968, 12, 29.0, 'g4'), (2969, 43, 29.5, 'g5'), (2970, 74, 30.0, 'g6'), (2971, 105, 30.5, 'g7'), (2972, 136, 31.0, 'g8'), (2973, 167, 31.5, 'g9'), (2974, 198, 32.0, 'g10'), (2975, 18, 32.5, 'g11'), (2976, 49, 33.0, 'g12'), (2977, 80, 33.5, 'g13'), (2978, 111, 34.0, 'g14'), (2979, 142, 34.5, 'g15'), (2980, 173, 35.0, 'g16'), (2981, 204, 35.5, 'g17'), (2982, 24, 36.0, 'g18'), (2983, 55, 36.5, 'g0'), (2984, 86, 37.0, 'g1'), (2985, 117, 37.5, 'g2'), (2986, 148, 38.0, 'g3'), (2987, 179, 38.5, 'g4'), (2988, 210, 39.0, 'g5'), (2989, 30, 39.5, 'g6'), (2990, 61, 40.0, 'g7'), (2991, 92, 40.5, 'g8'), (2992, 123, 41.0, 'g9'), (2993, 154, 41.5, 'g10'), (2994, 185, 42.0, 'g11'), (2995, 5, 42.5, 'g12'), (2996, 36, 43.0, 'g13'), (2997, 67, 43.5, 'g14'), (2998, 98, 44.0, 'g15'), (2999, 129, 44.5, 'g16'), (3000, 160, 45.0, 'g17'), (3001, 191, 45.5, 'g18'), (3002, 11, 46.0, 'g0'), (3003, 42, 46.5, 'g1'), (3004, 73, 47.0, 'g2'), (3005, 104, 47.5, 'g3'), (3006, 135, 48.0, 'g4'), (3007, 166, 0.0, 'g5'), (3008, 197, 0.5, 'g6'), (3009, 17, 1.0, 'g7'), (3010, 48, 1.5, 'g8'), (3011, 79, 2.0, 'g9'), (3012, 110, 2.5, 'g10'), (3013, 141, 3.0, 'g11'), (3014, 172, 3.5, 'g12'), (3015, 203, 4.0, 'g13'), (3016, 23, 4.5, 'g14'), (3017, 54, 5.0, 'g15'), (3018, 85, 5.5, 'g16'), (3019, 116, 6.0, 'g17'), (3020, 147, 6.5, 'g18'), (3021, 178, 7.0, 'g0'), (3022, 209, 7.5, 'g1'), (3023, 29, 8.0, 'g2'), (3024, 60, 8.5, 'g3'), (3025, 91, 9.0, 'g4'), (3026, 122, 9.5, 'g5'), (3027, 153, 10.0, 'g6'), (3028, 184, 10.5, 'g7'), (3029, 4, 11.0, 'g8'), (3030, 35, 11.5, 'g9'), (3031, 66, 12.0, 'g10'), (3032, 97, 12.5, 'g11'), (3033, 128, 13.0, 'g12'), (3034, 159, 13.5, 'g13'), (3035, 190, 14.0, 'g14'), (3036, 10, 14.5, 'g15'), (3037, 41, 15.0, 'g16'), (3038, 72, 15.5, 'g17'), (3039, 103, 16.0, 'g18'), (3040, 134, 16.5, 'g0'), (3041, 165, 17.0, 'g1'), (3042, 196, 17.5, 'g2'), (3043, 16, 18.0, 'g3'), (3044, 47, 18.5, 'g4'), (3045, 78, 19.0, 'g5'), (3046, 109, 19.5, 'g6'), (3047, 140, 20.0, 'g7'), (3048, 171, 20.5, 'g8'), (3049, 202, 21.0, 'g9'), (3050, 22, 21.5, 'g10'), (3051, 53, 22.0, 'g11'), (3052, 84, 22.5, 'g12'), (3053, 115, 23.0, 'g13'), (3054, 146, 23.5, 'g14'), (3055, 177, 24.0, 'g15'), (3056, 208, 24.5, 'g16'), (3057, 28, 25.0, 'g17'), (3058, 59, 25.5, 'g18'), (3059, 90, 26.0, 'g0'), (3060, 121, 26.5, 'g1'), (3061, 152, 27.0, 'g2'), (3062, 183, 27.5, 'g3'), (3063, 3, 28.0, 'g4'), (3064, 34, 28.5, 'g5'), (3065, 65, 29.0, 'g6'), (3066, 96, 29.5, 'g7'), (3067, 127, 30.0, 'g8'), (3068, 158, 30.5, 'g9'), (3069, 189, 31.0, 'g10'), (3070, 9, 31.5, 'g11'), (3071, 40, 32.0, 'g12'), (3072, 71, 32.5, 'g13'), (3073, 102, 33.0, 'g14'), (3074, 133, 33.5, 'g15'), (3075, 164, 34.0, 'g16'), (3076, 195, 34.5, 'g17'), (3077, 15, 35.0, 'g18'), (3078, 46, 35.5, 'g0'), (3079, 77, 36.0, 'g1'), (3080, 108, 36.5, 'g2'), (3081, 139, 37.0, 'g3'), (3082, 170, 37.5, 'g4'), (3083, 201, 38.0, 'g5'), (3084, 21, 38.5, 'g6'), (3085, 52, 39.0, 'g7'), (3086, 83, 39.5, 'g8'), (3087, 114, 40.0, 'g9'), (3088, 145, 40.5, 'g10'), (3089, 176, 41.0, 'g11'), (3090, 207, 41.5, 'g12'), (3091, 27, 42.0, 'g13'), (3092, 58, 42.5, 'g14'), (3093, 89, 43.0, 'g15'), (3094, 120, 43.5, 'g16'), (3095, 151, 44.0, 'g17'), (3096, 182, 44.5, 'g18'), (3097, 2, 45.0, 'g0'), (3098, 33, 45.5, 'g1'), (3099, 64, 46.0, 'g2'), (3100, 95, 46.5, 'g3'), (3101, 126, 47.0, 'g4'), (3102, 157, 47.5, 'g5'), (3103, 188, 48.0, 'g6'), (3104, 8, 0.0, 'g7'), (3105, 39, 0.5, 'g8'), (3106, 70, 1.0, 'g9'), (3107, 101, 1.5, 'g10'), (3108, 132, 2.0, 'g11'), (3109, 163, 2.5, 'g12'), (3110, 194, 3.0, 'g13'), (3111, 14, 3.5, 'g14'), (3112, 45, 4.0, 'g15'), (3113, 76, 4.5, 'g16'), (3114, 107, 5.0, 'g17'), (3115, 138, 5.5, 'g18'), (3116, 169, 6.0, 'g0'), (3117, 200, 6.5, 'g1'), (3118, 20, 7.0, 'g2'), (3119, 51, 7.5, 'g3'), (3120, 82, 8.0, 'g4'), (3121, 113, 8.5, 'g5'), (3122, 144, 9.0, 'g6'), (3123, 175, 9.5, 'g7'), (3124, 206, 10.0, 'g8'), (3125, 26, 10.5, 'g9'), (3126, 57, 11.0, 'g10'), (3127, 88, 11.5, 'g11'), (3128, 119, 12.0, 'g12'), (3129, 150, 12.5, 'g13'), (3130, 181, 13.0, 'g14'), (3131, 1, 13.5, 'g15'), (3132, 32, 14.0, 'g16'), (3133, 63, 14.5, 'g17'), (3134, 94, 15.0, 'g18'), (3135, 125, 15.5, 'g0'), (3136, 156, 16.0, 'g1'), (3137, 187, 16.5, 'g2'), (3138, 7, 17.0, 'g3'), (3139, 38, 17.5, 'g4'), (3140, 69, 18.0, 'g5'), (3141, 100, 18.5, 'g6'), (3142, 131, 19.0, 'g7'), (3143, 162, 19.5, 'g8'), (3144, 193, 20.0, 'g9'), (3145, 13, 20.5, 'g10'), (3146, 44, 21.0, 'g11'), (3147, 75, 21.5, 'g12'), (3148, 106, 22.0, 'g13'), (3149, 137, 22.5, 'g14'), (3150, 168, 23.0, 'g15'), (3151, 199, 23.5, 'g16'), (3152, 19, 24.0, 'g17'), (3153, 50, 24.5, 'g18'), (3154, 81, 25.0, 'g0'), (3155, 112, 25.5, 'g1'), (3156, 143, 26.0, 'g2'), (3157, 174, 26.5, 'g3'), (3158, 205, 27.0, 'g4'), (3159, 25, 27.5, 'g5'), (3160, 56, 28.0, 'g6'), (3161, 87, 28.5, 'g7'), (3162, 118, 29.0, 'g8'), (3163, 149, 29.5, 'g9'), (3164, 180, 30.0, 'g10'), (3165, 0, 30.5, 'g11'), (3166, 31, 31.0, 'g12'), (3167, 62, 31.5, 'g13'), (3168, 93, 32.0, 'g14'), (3169, 124, 32.5, 'g15'), (3170, 155, 33.0, 'g16'), (3171, 186, 33.5, 'g17'), (3172, 6, 34.0, 'g18'), (3173, 37, 34.5, 'g0'), (3174, 68, 35.0, 'g1'), (3175, 99, 35.5, 'g2'), (3176, 130, 36.0, 'g3'), (3177, 161, 36.5, 'g4'), (3178, 192, 37.0, 'g5'), (3179, 12, 37.5, 'g6'), (3180, 43, 38.0, 'g7'), (3181, 74, 38.5, 'g8'), (3182, 105, 39.0, 'g9'), (3183, 136, 39.5, 'g10'), (3184, 167, 40.0, 'g11'), (3185, 198, 40.5, 'g12'), (3186, 18, 41.0, 'g13'), (3187, 49, 41.5, 'g14'), (3188, 80, 42.0, 'g15'), (3189, 111, 42.5, 'g16'), (3190, 142, 43.0, 'g17'), (3191, 173, 43.5, 'g18'), (3192, 204, 44.0, 'g0'), (3193, 24, 44.5, 'g1'), (3194, 55, 45.0, 'g2'), (3195, 86, 45.5, 'g3'), (3196, 117, 46.0, 'g4'), (3197, 148, 46.5, 'g5'), (3198, 179, 47.0, 'g6'), (3199, 210, 47.5, 'g7'), (3200, 30, 48.0, 'g8'), (3201, 61, 0.0, 'g9'), (3202, 92, 0.5, 'g10'), (3203, 123, 1.0, 'g11'), (3204, 154, 1.5, 'g12'), (3205, 185, 2.0, 'g13'), (3206, 5, 2.5, 'g14'), (3207, 36, 3.0, 'g15'), (3208, 67, 3.5, 'g16'), (3209, 98, 4.0, 'g17'), (3210, 129, 4.5, 'g18'), (3211, 160, 5.0, 'g0'), (3212, 191, 5.5, 'g1'), (3213, 11, 6.0, 'g2'), (3214, 42, 6.5, 'g3'), (3215, 73, 7.0, 'g4'), (3216, 104, 7.5, 'g5'), (3217, 135, 8.0, 'g6'), (3218, 166, 8.5, 'g7'), (3219, 197, 9.0, 'g8'), (3220, 17, 9.5, 'g9'), (3221, 48, 10.0, 'g10'), (3222, 79, 10.5, 'g11'), (3223, 110, 11.0, 'g12'), (3224, 141, 11.5, 'g13'), (3225, 172, 12.0, 'g14'), (3226, 203, 12.5, 'g15'), (3227, 23, 13.0, 'g16'), (3228, 54, 13.5, 'g17'), (3229, 85, 14.0, 'g18'), (3230, 116, 14.5, 'g0'), (3231, 147, 15.0, 'g1'), (3232, 178, 15.5, 'g2'), (3233, 209, 16.0, 'g3'), (3234, 29, 16.5, 'g4'), (3235, 60, 17.0, 'g5'), (3236, 91, 17.5, 'g6'), (3237, 122, 18.0, 'g7'), (3238, 153, 18.5, 'g8'), (3239, 184, 19.0, 'g9'), (3240, 4, 19.5, 'g10'), (3241, 35, 20.0, 'g11'), (3242, 66, 20.5, 'g12'), (3243, 97, 21.0, 'g13'), (3244, 128, 21.5, 'g14'), (3245, 159, 22.0, 'g15'), (3246, 190, 22.5, 'g16'), (3247, 10, 23.0, 'g17'), (3248, 41, 23.5, 'g18'), (3249, 72, 24.0, 'g0'), (3250, 103, 24.5, 'g1'), (3251, 134, 25.0, 'g2'), (3252, 165, 25.5, 'g3'), (3253, 196, 26.0, 'g4'), (3254, 16, 26.5, 'g5'), (3255, 47, 27.0, 'g6'), (3256, 78, 27.5, 'g7'), (3257, 109, 28.0, 'g8'), (3258, 140, 28.5, 'g9'), (3259, 171, 29.0, 'g10'), (3260, 202, 29.5, 'g11'), (3261, 22, 30.0, 'g12'), (3262, 53, 30.5, 'g13'), (3263, 84, 31.0, 'g14'), (3264, 115, 31.5, 'g15'), (3265, 146, 32.0, 'g16'), (3266, 177, 32.5, 'g17'), (3267, 208, 33.0, 'g18'), (3268, 28, 33.5, 'g0'), (3269, 59, 34.0, 'g1'), (3270, 90, 34.5, 'g2'), (3271, 121, 35.0, 'g3'), (3272, 152, 35.5, 'g4'), (3273, 183, 36.0, 'g5'), (3274, 3, 36.5, 'g6'), (3275, 34, 37.0, 'g7'), (3276, 65, 37.5, 'g8'), (3277, 96, 38.0, 'g9'), (3278, 127, 38.5, 'g10'), (3279, 158, 39.0, 'g11'), (3280, 189, 39.5, 'g12'), (3281, 9, 40.0, 'g13'), (3282, 40, 40.5, 'g14'), (3283, 71, 41.0, 'g15'), (3284, 102, 41.5, 'g16'), (3285, 133, 42.0, 'g17'), (3286, 164, 42.5, 'g18'), (3287, 195, 43.0, 'g0'), (3288, 15, 43.5, 'g1'), (3289, 46, 44.0, 'g2'), (3290, 77, 44.5, 'g3'), (3291, 108, 45.0, 'g4'), (3292, 139, 45.5, 'g5'), (3293, 170, 46.0, 'g6'), (3294, 201, 46.5, 'g7'), (3295, 21, 47.0, 'g8'), (3296, 52, 47.5, 'g9'), (3297, 83, 48.0, 'g10'), (3298, 114, 0.0, 'g11'), (3299, 145, 0.5, 'g12'), (3300, 176, 1.0, 'g13'), (3301, 207, 1.5, 'g14'), (3302, 27, 2.0, 'g15'), (3303, 58, 2.5, 'g16'), (3304, 89, 3.0, 'g17'), (3305, 120, 3.5, 'g18'), (3306, 151, 4.0, 'g0'), (3307, 182, 4.5, 'g1'), (3308, 2, 5.0, 'g2'), (3309, 33, 5.5, 'g3'), (3310, 64, 6.0, 'g4'), (3311, 95, 6.5, 'g5'), (3312, 126, 7.0, 'g6'), (3313, 157, 7.5, 'g7'), (3314, 188, 8.0, 'g8'), (3315, 8, 8.5, 'g9'), (3316, 39, 9.0, 'g10'), (3317, 70, 9.5, 'g11'), (3318, 101, 10.0, 'g12'), (3319, 132, 10.5, 'g13'), (3320, 163, 11.0, 'g14'), (3321, 194, 11.5, 'g15'), (3322, 14, 12.0, 'g16'), (3323, 45, 12.5, 'g17'), (3324, 76, 13.0, 'g18'), (3325, 107, 13.5, 'g0'), (3326, 138, 14.0, 'g1'), (3327, 169, 14.5, 'g2'), (3328, 200, 15.0, 'g3'), (3329, 20, 15.5, 'g4'), (3330, 51, 16.0, 'g5'), (3331, 82, 16.5, 'g6'), (3332, 113, 17.0, 'g7'), (3333, 144, 17.5, 'g8'), (3334, 175, 18.0, 'g9'), (3335, 206, 18.5, 'g10'), (3336, 26, 19.0, 'g11'), (3337, 57, 19.5, 'g12'), (3338, 88, 20.0, 'g13'), (3339, 119, 20.5, 'g14'), (3340, 150, 21.0, 'g15'), (3341, 181, 21.5, 'g16'), (3342, 1, 22.0, 'g17'), (3343, 32, 22.5, 'g18'), (3344, 63, 23.0, 'g0'), (3345, 94, 23.5, 'g1'), (3346, 125, 24.0, 'g2'), (3347, 156, 24.5, 'g3'), (3348, 187, 25.0, 'g4'), (3349, 7, 25.5, 'g5'), (3350, 38, 26.0, 'g6'), (3351, 69, 26.5, 'g7'), (3352, 100, 27.0, 'g8'), (3353, 131, 27.5, 'g9'), (3354, 162, 28.0, 'g10'), (3355, 193, 28.5, 'g11'), (3356, 13, 29.0, 'g12'), (3357, 44, 29.5, 'g13'), (3358, 75, 30.0, 'g14'), (3359, 106, 30.5, 'g15'), (3360, 137, 31.0, 'g16'), (3361, 168, 31.5, 'g17'), (3362, 199, 32.0, 'g18'), (3363, 19, 32.5, 'g0'), (3364, 50, 33.0, 'g1'), (3365, 81, 33.5, 'g2'), (3366, 112, 34.0, 'g3'), (3367, 143, 34.5, 'g4'), (3368, 174, 35.0, 'g5'), (3369, 205, 35.5, 'g6'), (3370, 25, 36.0, 'g7'), (3371, 56, 36.5, 'g8'), (3372, 87, 37.0, 'g9'), (3373, 118, 37.5, 'g10'), (3374, 149, 38.0, 'g11'), (3375, 180, 38.5, 'g12'), (3376, 0, 39.0, 'g13'), (3377, 31, 39.5, 'g14'), (3378, 62, 40.0, 'g15'), (3379, 93, 40.5, 'g16'), (3380, 124, 41.0, 'g17'), (3381, 155, 41.5, 'g18'), (3382, 186, 42.0, 'g0'), (3383, 6, 42.5, 'g1'), (3384, 37, 43.0, 'g2'), (3385, 68, 43.5, 'g3'), (3386, 99, 44.0, 'g4'), (3387, 130, 44.5, 'g5'), (3388, 161, 45.0, 'g6'), (3389, 192, 45.5, 'g7'), (3390, 12, 46.0, 'g8'), (3391, 43, 46.5, 'g9'), (3392, 74, 47.0, 'g10'), (3393, 105, 47.5, 'g11'), (3394, 136, 48.0, 'g12'), (3395, 167, 0.0, 'g13'), (3396, 198, 0.5, 'g14'), (3397, 18, 1.0, 'g15'), (3398, 49, 1.5, 'g16'), (3399, 80, 2.0, 'g17'), (3400, 111, 2.5, 'g18'), (3401, 142, 3.0, 'g0'), (3402, 173, 3.5, 'g1'), (3403, 204, 4.0, 'g2'), (3404, 24, 4.5, 'g3'), (3405, 55, 5.0, 'g4'), (3406, 86, 5.5, 'g5'), (3407, 117, 6.0, 'g6'), (3408, 148, 6.5, 'g7'), (3409, 179, 7.0, 'g8'), (3410, 210, 7.5, 'g9'), (3411, 30, 8.0, 'g10'), (3412, 61, 8.5, 'g11'), (3413, 92, 9.0, 'g12'), (3414, 123, 9.5, 'g13'), (3415, 154, 10.0, 'g14'), (3416, 185, 10.5, 'g15'), (3417, 5, 11.0, 'g16'), (3418, 36, 11.5, 'g17'), (3419, 67, 12.0, 'g18'), (3420, 98, 12.5, 'g0'), (3421, 129, 13.0, 'g1'), (3422, 160, 13.5, 'g2'), (3423, 191, 14.0, 'g3'), (3424, 11, 14.5, 'g4'), (3425, 42, 15.0, 'g5'), (3426, 73, 15.5, 'g6'), (3427, 104, 16.0, 'g7'), (3428, 135, 16.5, 'g8'), (3429, 166, 17.0, 'g9'), (3430, 197, 17.5, 'g10'), (3431, 17, 18.0, 'g11'), (3432, 48, 18.5, 'g12'), (3433, 79, 19.0, 'g13'), (3434, 110, 19.5, 'g14'), (3435, 141, 20.0, 'g15'), (3436, 172, 20.5, 'g16'), (3437, 203, 21.0, 'g17'), (3438, 23, 21.5, 'g18'), (3439, 54, 22.0, 'g0'), (3440, 85, 22.5, 'g1'), (3441, 116, 23.0, 'g2'), (3442, 147, 23.5, 'g3'), (3443, 178, 24.0, 'g4'), (3444, 209, 24.5, 'g5'), (3445, 29, 25.0, 'g6'), (3446, 60, 25.5, 'g7'), (3447, 91, 26.0, 'g8'), (3448, 122, 26.5, 'g9'), (3449, 153, 27.0, 'g10'), (3450, 184, 27.5, 'g11'), (3451, 4, 28.0, 'g12'), (3452, 35, 28.5, 'g13'), (3453, 66, 29.0, 'g14'), (3454, 97, 29.5, 'g15'), (3455, 128, 30.0, 'g16'), (3456, 159, 30.5, 'g17'), (3457, 190, 31.0, 'g18'), (3458, 10, 31.5, 'g0'), (3459, 41, 32.0, 'g1'), (3460, 72, 32.5, 'g2'), (3461, 103, 33.0, 'g3'), (3462, 134, 33.5, 'g4'), (3463, 165, 34.0, 'g5'), (3464, 196, 34.5, 'g6'), (3465, 16, 35.0, 'g7'), (3466, 47, 35.5, 'g8'), (3467, 78, 36.0, 'g9'), (3468, 109, 36.5, 'g10'), (3469, 140, 37.0, 'g11'), (3470, 171, 37.5, 'g12'), (3471, 202, 38.0, 'g13'), (3472, 22, 38.5, 'g14'), (3473, 53, 39.0, 'g15'), (3474, 84, 39.5, 'g16'), (3475, 115, 40.0, 'g17'), (3476, 146, 40.5, 'g18'), (3477, 177, 41.0, 'g0'), (3478, 208, 41.5, 'g1'), (3479, 28, 42.0, 'g2'), (3480, 59, 42.5, 'g3'), (3481, 90, 43.0, 'g4'), (3482, 121, 43.5, 'g5'), (3483, 152, 44.0, 'g6'), (3484, 183, 44.5, 'g7'), (3485, 3, 45.0, 'g8'), (3486, 34, 45.5, 'g9'), (3487, 65, 46.0, 'g10'), (3488, 96, 46.5, 'g11'), (3489, 127, 47.0, 'g12'), (3490, 158, 47.5, 'g13'), (3491, 189, 48.0, 'g14'), (3492, 9, 0.0, 'g15'), (3493, 40, 0.5, 'g16'), (3494, 71, 1.0, 'g17'), (3495, 102, 1.5, 'g18'), (3496, 133, 2.0, 'g0'), (3497, 164, 2.5, 'g1'), (3498, 195, 3.0, 'g2'), (3499, 15, 3.5, 'g3'), (3500, 46, 4.0, 'g4'), (3501, 77, 4.5, 'g5'), (3502, 108, 5.0, 'g6'), (3503, 139, 5.5, 'g7'), (3504, 170, 6.0, 'g8'), (3505, 201, 6.5, 'g9'), (3506, 21, 7.0, 'g10'), (3507, 52, 7.5, 'g11'), (3508, 83, 8.0, 'g12'), (3509, 114, 8.5, 'g13'), (3510, 145, 9.0, 'g14'), (3511, 176, 9.5, 'g15'), (3512, 207, 10.0, 'g16'), (3513, 27, 10.5, 'g17'), (3514, 58, 11.0, 'g18'), (3515, 89, 11.5, 'g0'), (3516, 120, 12.0, 'g1'), (3517, 151, 12.5, 'g2'), (3518, 182, 13.0, 'g3'), (3519, 2, 13.5, 'g4'), (3520, 33, 14.0, 'g5'), (3521, 64, 14.5, 'g6'), (3522, 95, 15.0, 'g7'), (3523, 126, 15.5, 'g8'), (3524, 157, 16.0, 'g9'), (3525, 188, 16.5, 'g10'), (3526, 8, 17.0, 'g11'), (3527, 39, 17.5, 'g12'), (3528, 70, 18.0, 'g13'), (3529, 101, 18.5, 'g14'), (3530, 132, 19.0, 'g15'), (3531, 163, 19.5, 'g16'), (3532, 194, 20.0, 'g17'), (3533, 14, 20.5, 'g18'), (3534, 45, 21.0, 'g0'), (3535, 76, 21.5, 'g1'), (3536, 107, 22.0, 'g2'), (3537, 138, 22.5, 'g3'), (3538, 169, 23.0, 'g4'), (3539, 200, 23.5, 'g5'), (3540, 20, 24.0, 'g6'), (3541, 51, 24.5, 'g7'), (3542, 82, 25.0, 'g8'), (3543, 113, 25.5, 'g9'), (3544, 144, 26.0, 'g10'), (3545, 175, 26.5, 'g11'), (3546, 206, 27.0, 'g12'), (3547, 26, 27.5, 'g13'), (3548, 57, 28.0, 'g14'), (3549, 88, 28.5, 'g15'), (3550, 119, 29.0, 'g16'), (3551, 150, 29.5, 'g17'), (3552, 181, 30.0, 'g18'), (3553, 1, 30.5, 'g0'), (3554, 32, 31.0, 'g1'), (3555, 63, 31.5, 'g2'), (3556, 94, 32.0, 'g3'), (3557, 125, 32.5, 'g4'), (3558, 156, 33.0, 'g5'), (3559, 187, 33.5, 'g6'), (3560, 7, 34.0, 'g7'), (3561, 38, 34.5, 'g8'), (3562, 69, 35.0, 'g9'), (3563, 100, 35.5, 'g10'), (3564, 131, 36.0, 'g11'), (3565, 162, 36.5, 'g12'), (3566, 193, 37.0, 'g13'), (3567, 13, 37.5, 'g14'), (3568, 44, 38.0, 'g15'), (3569, 75, 38.5, 'g16'), (3570, 106, 39.0, 'g17'), (3571, 137, 39.5, 'g18'), (3572, 168, 40.0, 'g0'), (3573, 199, 40.5, 'g1'), (3574, 19, 41.0, 'g2'), (3575, 50, 41.5, 'g3'), (3576, 81, 42.0, 'g4'), (3577, 112, 42.5, 'g5'), (3578, 143, 43.0, 'g6'), (3579, 174, 43.5, 'g7'), (3580, 205, 44.0, 'g8'), (3581, 25, 44.5, 'g9'), (3582, 56, 45.0, 'g10'), (3583, 87, 45.5, 'g11'), (3584, 118, 46.0, 'g12'), (3585, 149, 46.5, 'g13'), (3586, 180, 47.0, 'g14'), (3587, 0, 47.5, 'g15'), (3588, 31, 48.0, 'g16'), (3589, 62, 0.0, 'g17'), (3590, 93, 0.5, 'g18'), (3591, 124, 1.0, 'g0'), (3592, 155, 1.5, 'g1'), (3593, 186, 2.0, 'g2'), (3594, 6, 2.5, 'g3'), (3595, 37, 3.0, 'g4'), (3596, 68, 3.5, 'g5'), (3597, 99, 4.0, 'g6'), (3598, 130, 4.5, 'g7'), (3599, 161, 5.0, 'g8'), (3600, 192, 5.5, 'g9'), (3601, 12, 6.0, 'g10'), (3602, 43, 6.5, 'g11'), (3603, 74, 7.0, 'g12'), (3604, 105, 7.5, 'g13'), (3605, 136, 8.0, 'g14'), (3606, 167, 8.5, 'g15'), (3607, 198, 9.0, 'g16'), (3608, 18, 9.5, 'g17'), (3609, 49, 10.0, 'g18'), (3610, 80, 10.5, 'g0'), (3611, 111, 11.0, 'g1'), (3612, 142, 11.5, 'g2'), (3613, 173, 12.0, 'g3'), (3614, 204, 12.5, 'g4'), (3615, 24, 13.0, 'g5'), (3616, 55, 13.5, 'g6'), (3617, 86, 14.0, 'g7'), (3618, 117, 14.5, 'g8'), (3619, 148, 15.0, 'g9'), (3620, 179, 15.5, 'g10'), (3621, 210, 16.0, 'g11'), (3622, 30, 16.5, 'g12'), (3623, 61, 17.0, 'g13'), (3624, 92, 17.5, 'g14'), (3625, 123, 18.0, 'g15'), (3626, 154, 18.5, 'g16'), (3627, 185, 19.0, 'g17'), (3628, 5, 19.5, 'g18'), (3629, 36, 20.0, 'g0'), (3630, 67, 20.5, 'g1'), (3631, 98, 21.0, 'g2'), (3632, 129, 21.5, 'g3'), (3633, 160, 22.0, 'g4'), (3634, 191, 22.5, 'g5'), (3635, 11, 23.0, 'g6'), (3636, 42, 23.5, 'g7'), (3637, 73, 24.0, 'g8'), (3638, 104, 24.5, 'g9'), (3639, 135, 25.0, 'g10'), (3640, 166, 25.5, 'g11'), (3641, 197, 26.0, 'g12'), (3642, 17, 26.5, 'g13'), (3643, 48, 27.0, 'g14'), (3644, 79, 27.5, 'g15'), (3645, 110, 28.0, 'g16'), (3646, 141, 28.5, 'g17'), (3647, 172, 29.0, 'g18'), (3648, 203, 29.5, 'g0'), (3649, 23, 30.0, 'g1'), (3650, 54, 30.5, 'g2'), (3651, 85, 31.0, 'g3'), (3652, 116, 31.5, 'g4'), (3653, 147, 32.0, 'g5'), (3654, 178, 32.5, 'g6'), (3655, 209, 33.0, 'g7'), (3656, 29, 33.5, 'g8'), (3657, 60, 34.0, 'g9'), (3658, 91, 34.5, 'g10'), (3659, 122, 35.0, 'g11'), (3660, 153, 35.5, 'g12'), (3661, 184, 36.0, 'g13'), (3662, 4, 36.5, 'g14'), (3663, 35, 37.0, 'g15'), (3664, 66, 37.5, 'g16'), (3665, 97, 38.0, 'g17'), (3666, 128, 38.5, 'g18'), (3667, 159, 39.0, 'g0'), (3668, 190, 39.5, 'g1'), (3669, 10, 40.0, 'g2'), (3670, 41, 40.5, 'g3'), (3671, 72, 41.0, 'g4'), (3672, 103, 41.5, 'g5'), (3673, 134, 42.0, 'g6'), (3674, 165, 42.5, 'g7'), (3675, 196, 43.0, 'g8'), (3676, 16, 43.5, 'g9'), (3677, 47, 44.0, 'g10'), (3678, 78, 44.5, 'g11'), (3679, 109, 45.0, 'g12'), (3680, 140, 45.5, 'g13'), (3681, 171, 46.0, 'g14'), (3682, 202, 46.5, 'g15'), (3683, 22, 47.0, 'g16'), (3684, 53, 47.5, 'g17'), (3685, 84, 48.0, 'g18'), (3686, 115, 0.0, 'g0'), (3687, 146, 0.5, 'g1'), (3688, 177, 1.0, 'g2'), (3689, 208, 1.5, 'g3'), (3690, 28, 2.0, 'g4'), (3691, 59, 2.5, 'g5'), (3692, 90, 3.0, 'g6'), (3693, 121, 3.5, 'g7'), (3694, 152, 4.0, 'g8'), (3695, 183, 4.5, 'g9'), (3696, 3, 5.0, 'g10'), (3697, 34, 5.5, 'g11'), (3698, 65, 6.0, 'g12'), (3699, 96, 6.5, 'g13'), (3700, 127, 7.0, 'g14'), (3701, 158, 7.5, 'g15'), (3702, 189, 8.0, 'g16'), (3703, 9, 8.5, 'g17'), (3704, 40, 9.0, 'g18'), (3705, 71, 9.5, 'g0'), (3706, 102, 10.0, 'g1'), (3707, 133, 10.5, 'g2'), (3708, 164, 11.0, 'g3'), (3709, 195, 11.5, 'g4'), (3710, 15, 12.0, 'g5'), (3711, 46, 12.5, 'g6'), (3712, 77, 13.0, 'g7'), (3713, 108, 13.5, 'g8'), (3714, 139, 14.0, 'g9'), (3715, 170, 14.5, 'g10'), (3716, 201, 15.0, 'g11'), (3717, 21, 15.5, 'g12'), (3718, 52, 16.0, 'g13'), (3719, 83, 16.5, 'g14'), (3720, 114, 17.0, 'g15'), (3721, 145, 17.5, 'g16'), (3722, 176, 18.0, 'g17'), (3723, 207, 18.5, 'g18'), (3724, 27, 19.0, 'g0'), (3725, 58, 19.5, 'g1'), (3726, 89, 20.0, 'g2'), (3727, 120, 20.5, 'g3'), (3728, 151, 21.0, 'g4'), (3729, 182, 21.5, 'g5'), (3730, 2, 22.0, 'g6'), (3731, 33, 22.5, 'g7'), (3732, 64, 23.0, 'g8'), (3733, 95, 23.5, 'g9'), (3734, 126, 24.0, 'g10'), (3735, 157, 24.5, 'g11'), (3736, 188, 25.0, 'g12'), (3737, 8, 25.5, 'g13'), (3738, 39, 26.0, 'g14'), (3739, 70, 26.5, 'g15'), (3740, 101, 27.0, 'g16'), (3741, 132, 27.5, 'g17'), (3742, 163, 28.0, 'g18'), (3743, 194, 28.5, 'g0'), (3744, 14, 29.0, 'g1'), (3745, 45, 29.5, 'g2'), (3746, 76, 30.0, 'g3'), (3747, 107, 30.5, 'g4'), (3748, 138, 31.0, 'g5'), (3749, 169, 31.5, 'g6'), (3750, 200, 32.0, 'g7'), (3751, 20, 32.5, 'g8'), (3752, 51, 33.0, 'g9'), (3753, 82, 33.5, 'g10'), (3754, 113, 34.0, 'g11'), (3755, 144, 34.5, 'g12'), (3756, 175, 35.0, 'g13'), (3757, 206, 35.5, 'g14'), (3758, 26, 36.0, 'g15'), (3759, 57, 36.5, 'g16'), (3760, 88, 37.0, 'g17'), (3761, 119, 37.5, 'g18'), (3762, 150, 38.0, 'g0'), (3763, 181, 38.5, 'g1'), (3764, 1, 39.0, 'g2'), (3765, 32, 39.5, 'g3'), (3766, 63, 40.0, 'g4'), (3767, 94, 40.5, 'g5'), (3768, 125, 41.0, 'g6'), (3769, 156, 41.5, 'g7'), (3770, 187, 42.0, 'g8'), (3771, 7, 42.5, 'g9'), (3772, 38, 43.0, 'g10'), (3773, 69, 43.5, 'g11'), (3774, 100, 44.0, 'g12'), (3775, 131, 44.5, 'g13'), (3776, 162, 45.0, 'g14'), (3777, 193, 45.5, 'g15'), (3778, 13, 46.0, 'g16'), (3779, 44, 46.5, 'g17'), (3780, 75, 47.0, 'g18'), (3781, 106, 47.5, 'g0'), (3782, 137, 48.0, 'g1'), (3783, 168, 0.0, 'g2'), (3784, 199, 0.5, 'g3'), (3785, 19, 1.0, 'g4'), (3786, 50, 1.5, 'g5'), (3787, 81, 2.0, 'g6'), (3788, 112, 2.5, 'g7'), (3789, 143, 3.0, 'g8'), (3790, 174, 3.5, 'g9'), (3791, 205, 4.0, 'g10'), (3792, 25, 4.5, 'g11'), (3793, 56, 5.0, 'g12'), (3794, 87, 5.5, 'g13'), (3795, 118, 6.0, 'g14'), (3796, 149, 6.5, 'g15'), (3797, 180, 7.0, 'g16'), (3798, 0, 7.5, 'g17'), (3799, 31, 8.0, 'g18'), (3800, 62, 8.5, 'g0'), (3801, 93, 9.0, 'g1'), (3802, 124, 9.5, 'g2'), (3803, 155, 10.0, 'g3'), (3804, 186, 10.5, 'g4'), (3805, 6, 11.0, 'g5'), (3806, 37, 11.5, 'g6'), (3807, 68, 12.0, 'g7'), (3808, 99, 12.5, 'g8'), (3809, 130, 13.0, 'g9'), (3810, 161, 13.5, 'g10'), (3811, 192, 14.0, 'g11'), (3812, 12, 14.5, 'g12'), (3813, 43, 15.0, 'g13'), (3814, 74, 15.5, 'g14'), (3815, 105, 16.0, 'g15'), (3816, 136, 16.5, 'g16'), (3817, 167, 17.0, 'g17'), (3818, 198, 17.5, 'g18'), (3819, 18, 18.0, 'g0'), (3820, 49, 18.5, 'g1'), (3821, 80, 19.0, 'g2'), (3822, 111, 19.5, 'g3'), (3823, 142, 20.0, 'g4'), (3824, 173, 20.5, 'g5'), (3825, 204, 21.0, 'g6'), (3826, 24, 21.5, 'g7'), (3827, 55, 22.0, 'g8'), (3828, 86, 22.5, 'g9'), (3829, 117, 23.0, 'g10'), (3830, 148, 23.5, 'g11'), (3831, 179, 24.0, 'g12'), (3832, 210, 24.5, 'g13'), (3833, 30, 25.0, 'g14'), (3834, 61, 25.5, 'g15'), (3835, 92, 26.0, 'g16'), (3836, 123, 26.5, 'g17'), (3837, 154, 27.0, 'g18'), (3838, 185, 27.5, 'g0'), (3839, 5, 28.0, 'g1'), (3840, 36, 28.5, 'g2'), (3841, 67, 29.0, 'g3'), (3842, 98, 29.5, 'g4'), (3843, 129, 30.0, 'g5'), (3844, 160, 30.5, 'g6'), (3845, 191, 31.0, 'g7'), (3846, 11, 31.5, 'g8'), (3847, 42, 32.0, 'g9'), (3848, 73, 32.5, 'g10'), (3849, 104, 33.0, 'g11'), (3850, 135, 33.5, 'g12'), (3851, 166, 34.0, 'g13'), (3852, 197, 34.5, 'g14'), (3853, 17, 35.0, 'g15'), (3854, 48, 35.5, 'g16'), (3855, 79, 36.0, 'g17'), (3856, 110, 36.5, 'g18'), (3857, 141, 37.0, 'g0'), (3858, 172, 37.5, 'g1'), (3859, 203, 38.0, 'g2'), (3860, 23, 38.5, 'g3'), (3861, 54, 39.0, 'g4'), (3862, 85, 39.5, 'g5'), (3863, 116, 40.0, 'g6'), (3864, 147, 40.5, 'g7'), (3865, 178, 41.0, 'g8'), (3866, 209, 41.5, 'g9'), (3867, 29, 42.0, 'g10'), (3868, 60, 42.5, 'g11'), (3869, 91, 43.0, 'g12'), (3870, 122, 43.5, 'g13'), (3871, 153, 44.0, 'g14'), (3872, 184, 44.5, 'g15'), (3873, 4, 45.0, 'g16'), (3874, 35, 45.5, 'g17'), (3875, 66, 46.0, 'g18'), (3876, 97, 46.5, 'g0'), (3877, 128, 47.0, 'g1'), (3878, 159, 47.5, 'g2'), (3879, 190, 48.0, 'g3'), (3880, 10, 0.0, 'g4'), (3881, 41, 0.5, 'g5'), (3882, 72, 1.0, 'g6'), (3883, 103, 1.5, 'g7'), (3884, 134, 2.0, 'g8'), (3885, 165, 2.5, 'g9'), (3886, 196, 3.0, 'g10'), (3887, 16, 3.5, 'g11'), (3888, 47, 4.0, 'g12'), (3889, 78, 4.5, 'g13'), (3890, 109, 5.0, 'g14'), (3891, 140, 5.5, 'g15'), (3892, 171, 6.0, 'g16'), (3893, 202, 6.5, 'g17'), (3894, 22, 7.0, 'g18'), (3895, 53, 7.5, 'g0'), (3896, 84, 8.0, 'g1'), (3897, 115, 8.5, 'g2'), (3898, 146, 9.0, 'g3'), (3899, 177, 9.5, 'g4'), (3900, 208, 10.0, 'g5'), (3901, 28, 10.5, 'g6'), (3902, 59, 11.0, 'g7'), (3903, 90, 11.5, 'g8'), (3904, 121, 12.0, 'g9'), (3905, 152, 12.5, 'g10'), (3906, 183, 13.0, 'g11'), (3907, 3, 13.5, 'g12'), (3908, 34, 14.0, 'g13'), (3909, 65, 14.5, 'g14'), (3910, 96, 15.0, 'g15'), (3911, 127, 15.5, 'g16'), (3912, 158, 16.0, 'g17'), (3913, 189, 16.5, 'g18'), (3914, 9, 17.0, 'g0'), (3915, 40, 17.5, 'g1'), (3916, 71, 18.0, 'g2'), (3917, 102, 18.5, 'g3'), (3918, 133, 19.0, 'g4'), (3919, 164, 19.5, 'g5'), (3920, 195, 20.0, 'g6'), (3921, 15, 20.5, 'g7'), (3922, 46, 21.0, 'g8'), (3923, 77, 21.5, 'g9'), (3924, 108, 22.0, 'g10'), (3925, 139, 22.5, 'g11'), (3926, 170, 23.0, 'g12'), (3927, 201, 23.5, 'g13'), (3928, 21, 24.0, 'g14'), (3929, 52, 24.5, 'g15'), (3930, 83, 25.0, 'g16'), (3931, 114, 25.5, 'g17'), (3932, 145, 26.0, 'g18'), (3933, 176, 26.5, 'g0'), (3934, 207, 27.0, 'g1'), (3935, 27, 27.5, 'g2'), (3936, 58, 28.0, 'g3'), (3937, 89, 28.5, 'g4'), (3938, 120, 29.0, 'g5'), (3939, 151, 29.5, 'g6'), (3940, 182, 30.0, 'g7'), (3941, 2, 30.5, 'g8'), (3942, 33, 31.0, 'g9'), (3943, 64, 31.5, 'g10'), (3944, 95, 32.0, 'g11'), (3945, 126, 32.5, 'g12'), (3946, 157, 33.0, 'g13'), (3947, 188, 33.5, 'g14'), (3948, 8, 34.0, 'g15'), (3949, 39, 34.5, 'g16'), (3950, 70, 35.0, 'g17'), (3951, 101, 35.5, 'g18'), (3952, 132, 36.0, 'g0'), (3953, 163, 36.5, 'g1'), (3954, 194, 37.0, 'g2'), (3955, 14, 37.5, 'g3'), (3956, 45, 38.0, 'g4'), (3957, 76, 38.5, 'g5'), (3958, 107, 39.0, 'g6'), (3959, 138, 39.5, 'g7'), (3960, 169, 40.0, 'g8'), (3961, 200, 40.5, 'g9'), (3962, 20, 41.0, 'g10'), (3963, 51, 41.5, 'g11'), (3964, 82, 42.0, 'g12'), (3965, 113, 42.5, 'g13'), (3966, 144, 43.0, 'g14'), (3967, 175, 43.5, 'g15'), (3968, 206, 44.0, 'g16'), (3969, 26, 44.5, 'g17'), (3970, 57, 45.0, 'g18'), (3971, 88, 45.5, 'g0'), (3972, 119, 46.0, 'g1'), (3973, 150, 46.5, 'g2'), (3974, 181, 47.0, 'g3'), (3975, 1, 47.5, 'g4'), (3976, 32, 48.0, 'g5'), (3977, 63, 0.0, 'g6'), (3978, 94, 0.5, 'g7'), (3979, 125, 1.0, 'g8'), (3980, 156, 1.5, 'g9'), (3981, 187, 2.0, 'g10'), (3982, 7, 2.5, 'g11'), (3983, 38, 3.0, 'g12'), (3984, 69, 3.5, 'g13'), (3985, 100, 4.0, 'g14'), (3986, 131, 4.5, 'g15'), (3987, 162, 5.0, 'g16'), (3988, 193, 5.5, 'g17'), (3989, 13, 6.0, 'g18'), (3990, 44, 6.5, 'g0'), (3991, 75, 7.0, 'g1'), (3992, 106, 7.5, 'g2'), (3993, 137, 8.0, 'g3'), (3994, 168, 8.5, 'g4'), (3995, 199, 9.0, 'g5'), (3996, 19, 9.5, 'g6'), (3997, 50, 10.0, 'g7'), (3998, 81, 10.5, 'g8'), (3999, 112, 11.0, 'g9'), (4000, 143, 11.5, 'g10'), (4001, 174, 12.0, 'g11'), (4002, 205, 12.5, 'g12'), (4003, 25, 13.0, 'g13'), (4004, 56, 13.5, 'g14'), (4005, 87, 14.0, 'g15'), (4006, 118, 14.5, 'g16'), (4007, 149, 15.0, 'g17'), (4008, 180, 15.5, 'g18'), (4009, 0, 16.0, 'g0'), (4010, 31, 16.5, 'g1'), (4011, 62, 17.0, 'g2'), (4012, 93, 17.5, 'g3'), (4013, 124, 18.0, 'g4'), (4014, 155, 18.5, 'g5'), (4015, 186, 19.0, 'g6'), (4016, 6, 19.5, 'g7'), (4017, 37, 20.0, 'g8'), (4018, 68, 20.5, 'g9'), (4019, 99, 21.0, 'g10'), (4020, 130, 21.5, 'g11'), (4021, 161, 22.0, 'g12'), (4022, 192, 22.5, 'g13'), (4023, 12, 23.0, 'g14'), (4024, 43, 23.5, 'g15'), (4025, 74, 24.0, 'g16'), (4026, 105, 24.5, 'g17'), (4027, 136, 25.0, 'g18'), (4028, 167, 25.5, 'g0'), (4029, 198, 26.0, 'g1'), (4030, 18, 26.5, 'g2'), (4031, 49, 27.0, 'g3'), (4032, 80, 27.5, 'g4'), (4033, 111, 28.0, 'g5'), (4034, 142, 28.5, 'g6'), (4035, 173, 29.0, 'g7'), (4036, 204, 29.5, 'g8'), (4037, 24, 30.0, 'g9'), (4038, 55, 30.5, 'g10'), (4039, 86, 31.0, 'g11'), (4040, 117, 31.5, 'g12'), (4041, 148, 32.0, 'g13'), (4042, 179, 32.5, 'g14'), (4043, 210, 33.0, 'g15'), (4044, 30, 33.5, 'g16'), (4045, 61, 34.0, 'g17'), (4046, 92, 34.5, 'g18'), (4047, 123, 35.0, 'g0'), (4048, 154, 35.5, 'g1'), (4049, 185, 36.0, 'g2'), (4050, 5, 36.5, 'g3'), (4051, 36, 37.0, 'g4'), (4052, 67, 37.5, 'g5'), (4053, 98, 38.0, 'g6'), (4054, 129, 38.5, 'g7'), (4055, 160, 39.0, 'g8'), (4056, 191, 39.5, 'g9'), (4057, 11, 40.0, 'g10'), (4058, 42, 40.5, 'g11'), (4059, 73, 41.0, 'g12'), (4060, 104, 41.5, 'g13'), (4061, 135, 42.0, 'g14'), (4062, 166, 42.5, 'g15'), (4063, 197, 43.0, 'g16'), (4064, 17, 43.5, 'g17'), (4065, 48, 44.0, 'g18'), (4066, 79, 44.5, 'g0'), (4067, 110, 45.0, 'g1'), (4068, 141, 45.5, 'g2'), (4069, 172, 46.0, 'g3'), (4070, 203, 46.5, 'g4'), (4071, 23, 47.0, 'g5'), (4072, 54, 47.5, 'g6'), (4073, 85, 48.0, 'g7'), (4074, 116, 0.0, 'g8'), (4075, 147, 0.5, 'g9'), (4076, 178, 1.0, 'g10'), (4077, 209, 1.5, 'g11'), (4078, 29, 2.0, 'g12'), (4079, 60, 2.5, 'g13'), (4080, 91, 3.0, 'g14'), (4081, 122, 3.5, 'g15'), (4082, 153, 4.0, 'g16'), (4083, 184, 4.5, 'g17'), (4084, 4, 5.0, 'g18'), (4085, 35, 5.5, 'g0'), (4086, 66, 6.0, 'g1'), (4087, 97, 6.5, 'g2'), (4088, 128, 7.0, 'g3'), (4089, 159, 7.5, 'g4'), (4090, 190, 8.0, 'g5'), (4091, 10, 8.5, 'g6'), (4092, 41, 9.0, 'g7'), (4093, 72, 9.5, 'g8'), (4094, 103, 10.0, 'g9'), (4095, 134, 10.5, 'g10'), (4096, 165, 11.0, 'g11'), (4097, 196, 11.5, 'g12'), (4098, 16, 12.0, 'g13'), (4099, 47, 12.5, 'g14'), (4100, 78, 13.0, 'g15'), (4101, 109, 13.5, 'g16'), (4102, 140, 14.0, 'g17'), (4103, 171, 14.5, 'g18'), (4104, 202, 15.0, 'g0'), (4105, 22, 15.5, 'g1'), (4106, 53, 16.0, 'g2'), (4107, 84, 16.5, 'g3'), (4108, 115, 17.0, 'g4'), (4109, 146, 17.5, 'g5'), (4110, 177, 18.0, 'g6'), (4111, 208, 18.5, 'g7'), (4112, 28, 19.0, 'g8'), (4113, 59, 19.5, 'g9'), (4114, 90, 20.0, 'g10'), (4115, 121, 20.5, 'g11'), (4116, 152, 21.0, 'g12'), (4117, 183, 21.5, 'g13'), (4118, 3, 22.0, 'g14'), (4119, 34, 22.5, 'g15'), (4120, 65, 23.0, 'g16'), (4121, 96, 23.5, 'g17'), (4122, 127, 24.0, 'g18'), (4123, 158, 24.5, 'g0'), (4124, 189, 25.0, 'g1'), (4125, 9, 25.5, 'g2'), (4126, 40, 26.0, 'g3'), (4127, 71, 26.5, 'g4'), (4128, 102, 27.0, 'g5'), (4129, 133, 27.5, 'g6'), (4130, 164, 28.0, 'g7'), (4131, 195, 28.5, 'g8'), (4132, 15, 29.0, 'g9'), (4133, 46, 29.5, 'g10'), (4134, 77, 30.0, 'g11'), (4135, 108, 30.5, 'g12'), (4136, 139, 31.0, 'g13'), (4137, 170, 31.5, 'g14'), (4138, 201, 32.0, 'g15'), (4139, 21, 32.5, 'g16'), (4140, 52, 33.0, 'g17'), (4141, 83, 33.5, 'g18'), (4142, 114, 34.0, 'g0'), (4143, 145, 34.5, 'g1'), (4144, 176, 35.0, 'g2'), (4145, 207, 35.5, 'g3'), (4146, 27, 36.0, 'g4'), (4147, 58, 36.5, 'g5'), (4148, 89, 37.0, 'g6'), (4149, 120, 37.5, 'g7'), (4150, 151, 38.0, 'g8'), (4151, 182, 38.5, 'g9'), (4152, 2, 39.0, 'g10'), (4153, 33, 39.5, 'g11'), (4154, 64, 40.0, 'g12'), (4155, 95, 40.5, 'g13'), (4156, 126, 41.0, 'g14'), (4157, 157, 41.5, 'g15'), (4158, 188, 42.0, 'g16'), (4159, 8, 42.5, 'g17'), (4160, 39, 43.0, 'g18'), (4161, 70, 43.5, 'g0'), (4162, 101, 44.0, 'g1'), (4163, 132, 44.5, 'g2'), (4164, 163, 45.0, 'g3'), (4165, 194, 45.5, 'g4'), (4166, 14, 46.0, 'g5'), (4167, 45, 46.5, 'g6'), (4168, 76, 47.0, 'g7'), (4169, 107, 47.5, 'g8'), (4170, 138, 48.0, 'g9'), (4171, 169, 0.0, 'g10'), (4172, 200, 0.5, 'g11'), (4173, 20, 1.0, 'g12'), (4174, 51, 1.5, 'g13'), (4175, 82, 2.0, 'g14'), (4176, 113, 2.5, 'g15'), (4177, 144, 3.0, 'g16'), (4178, 175, 3.5, 'g17'), (4179, 206, 4.0, 'g18'), (4180, 26, 4.5, 'g0'), (4181, 57, 5.0, 'g1'), (4182, 88, 5.5, 'g2'), (4183, 119, 6.0, 'g3'), (4184, 150, 6.5, 'g4'), (4185, 181, 7.0, 'g5'), (4186, 1, 7.5, 'g6'), (4187, 32, 8.0, 'g7'), (4188, 63, 8.5, 'g8'), (4189, 94, 9.0, 'g9'), (4190, 125, 9.5, 'g10'), (4191, 156, 10.0, 'g11'), (4192, 187, 10.5, 'g12'), (4193, 7, 11.0, 'g13'), (4194, 38, 11.5, 'g14'), (4195, 69, 12.0, 'g15'), (4196, 100, 12.5, 'g16'), (4197, 131, 13.0, 'g17'), (4198, 162, 13.5, 'g18'), (4199, 193, 14.0, 'g0'), (4200, 13, 14.5, 'g1'), (4201, 44, 15.0, 'g2'), (4202, 75, 15.5, 'g3'), (4203, 106, 16.0, 'g4'), (4204, 137, 16.5, 'g5'), (4205, 168, 17.0, 'g6'), (4206, 199, 17.5, 'g7'), (4207, 19, 18.0, 'g8'), (4208, 50, 18.5, 'g9'), (4209, 81, 19.0, 'g10'), (4210, 112, 19.5, 'g11'), (4211, 143, 20.0, 'g12'), (4212, 174, 20.5, 'g13'), (4213, 205, 21.0, 'g14'), (4214, 25, 21.5, 'g15'), (4215, 56, 22.0, 'g16'), (4216, 87, 22.5, 'g17'), (4217, 118, 23.0, 'g18'), (4218, 149, 23.5, 'g0'), (4219, 180, 24.0, 'g1'), (4220, 0, 24.5, 'g2'), (4221, 31, 25.0, 'g3'), (4222, 62, 25.5, 'g4'), (4223, 93, 26.0, 'g5'), (4224, 124, 26.5, 'g6'), (4225, 155, 27.0, 'g7'), (4226, 186, 27.5, 'g8'), (4227, 6, 28.0, 'g9'), (4228, 37, 28.5, 'g10'), (4229, 68, 29.0, 'g11'), (4230, 99, 29.5, 'g12'), (4231, 130, 30.0, 'g13'), (4232, 161, 30.5, 'g14'), (4233, 192, 31.0, 'g15'), (4234, 12, 31.5, 'g16'), (4235, 43, 32.0, 'g17'), (4236, 74, 32.5, 'g18'), (4237, 105, 33.0, 'g0'), (4238, 136, 33.5, 'g1'), (4239, 167, 34.0, 'g2'), (4240, 198, 34.5, 'g3'), (4241, 18, 35.0, 'g4'), (4242, 49, 35.5, 'g5'), (4243, 80, 36.0, 'g6'), (4244, 111, 36.5, 'g7'), (4245, 142, 37.0, 'g8'), (4246, 173, 37.5, 'g9'), (4247, 204, 38.0, 'g10'), (4248, 24, 38.5, 'g11'), (4249, 55, 39.0, 'g12'), (4250, 86, 39.5, 'g13'), (4251, 117, 40.0, 'g14'), (4252, 148, 40.5, 'g15'), (4253, 179, 41.0, 'g16'), (4254, 210, 41.5, 'g17'), (4255, 30, 42.0, 'g18'), (4256, 61, 42.5, 'g0'), (4257, 92, 43.0, 'g1'), (4258, 123, 43.5, 'g2'), (4259, 154, 44.0, 'g3'), (4260, 185, 44.5, 'g4'), (4261, 5, 45.0, 'g5'), (4262, 36, 45.5, 'g6'), (4263, 67, 46.0, 'g7'), (4264, 98, 46.5, 'g8'), (4265, 129, 47.0, 'g9'), (4266, 160, 47.5, 'g10'), (4267, 191, 48.0, 'g11'), (4268, 11, 0.0, 'g12'), (4269, 42, 0.5, 'g13'), (4270, 73, 1.0, 'g14'), (4271, 104, 1.5, 'g15'), (4272, 135, 2.0, 'g16'), (4273, 166, 2.5, 'g17'), (4274, 197, 3.0, 'g18'), (4275, 17, 3.5, 'g0'), (4276, 48, 4.0, 'g1'), (4277, 79, 4.5, 'g2'), (4278, 110, 5.0, 'g3'), (4279, 141, 5.5, 'g4'), (4280, 172, 6.0, 'g5'), (4281, 203, 6.5, 'g6'), (4282, 23, 7.0, 'g7'), (4283, 54, 7.5, 'g8'), (4284, 85, 8.0, 'g9'), (4285, 116, 8.5, 'g10'), (4286, 147, 9.0, 'g11'), (4287, 178, 9.5, 'g12'), (4288, 209, 10.0, 'g13'), (4289, 29, 10.5, 'g14'), (4290, 60, 11.0, 'g15'), (4291, 91, 11.5, 'g16'), (4292, 122, 12.0, 'g17'), (4293, 153, 12.5, 'g18'), (4294, 184, 13.0, 'g0'), (4295, 4, 13.5, 'g1'), (4296, 35, 14.0, 'g2'), (4297, 66, 14.5, 'g3'), (4298, 97, 15.0, 'g4'), (4299, 128, 15.5, 'g5'), (4300, 159, 16.0, 'g6'), (4301, 190, 16.5, 'g7'), (4302, 10, 17.0, 'g8'), (4303, 41, 17.5, 'g9'), (4304, 72, 18.0, 'g10'), (4305, 103, 18.5, 'g11'), (4306, 134, 19.0, 'g12'), (4307, 165, 19.5, 'g13'), (4308, 196, 20.0, 'g14'), (4309, 16, 20.5, 'g15'), (4310, 47, 21.0, 'g16'), (4311, 78, 21.5, 'g17'), (4312, 109, 22.0, 'g18'), (4313, 140, 22.5, 'g0'), (4314, 171, 23.0, 'g1'), (4315, 202, 23.5, 'g2'), (4316, 22, 24.0, 'g3'), (4317, 53, 24.5, 'g4'), (4318, 84, 25.0, 'g5'), (4319, 115, 25.5, 'g6'), (4320, 146, 26.0, 'g7'), (4321, 177, 26.5, 'g8'), (4322, 208, 27.0, 'g9'), (4323, 28, 27.5, 'g10'), (4324, 59, 28.0, 'g11'), (4325, 90, 28.5, 'g12'), (4326, 121, 29.0, 'g13'), (4327, 152, 29.5, 'g14'), (4328, 183, 30.0, 'g15'), (4329, 3, 30.5, 'g16'), (4330, 34, 31.0, 'g17'), (4331, 65, 31.5, 'g18'), (4332, 96, 32.0, 'g0'), (4333, 127, 32.5, 'g1'), (4334, 158, 33.0, 'g2'), (4335, 189, 33.5, 'g3'), (4336, 9, 34.0, 'g4'), (4337, 40, 34.5, 'g5'), (4338, 71, 35.0, 'g6'), (4339, 102, 35.5, 'g7'), (4340, 133, 36.0, 'g8'), (4341, 164, 36.5, 'g9'), (4342, 195, 37.0, 'g10'), (4343, 15, 37.5, 'g11'), (4344, 46, 38.0, 'g12'), (4345, 77, 38.5, 'g13'), (4346, 108, 39.0, 'g14'), (4347, 139, 39.5, 'g15'), (4348, 170, 40.0, 'g16'), (4349, 201, 40.5, 'g17'), (4350, 21, 41.0, 'g18'), (4351, 52, 41.5, 'g0'), (4352, 83, 42.0, 'g1'), (4353, 114, 42.5, 'g2'), (4354, 145, 43.0, 'g3'), (4355, 176, 43.5, 'g4'), (4356, 207, 44.0, 'g5'), (4357, 27, 44.5, 'g6'), (4358, 58, 45.0, 'g7'), (4359, 89, 45.5, 'g8'), (4360, 120, 46.0, 'g9'), (4361, 151, 46.5, 'g10'), (4362, 182, 47.0, 'g11'), (4363, 2, 47.5, 'g12'), (4364, 33, 48.0, 'g13'), (4365, 64, 0.0, 'g14'), (4366, 95, 0.5, 'g15'), (4367, 126, 1.0, 'g16'), (4368, 157, 1.5, 'g17'), (4369, 188, 2.0, 'g18'), (4370, 8, 2.5, 'g0'), (4371, 39, 3.0, 'g1'), (4372, 70, 3.5, 'g2'), (4373, 101, 4.0, 'g3'), (4374, 132, 4.5, 'g4'), (4375, 163, 5.0, 'g5'), (4376, 194, 5.5, 'g6'), (4377, 14, 6.0, 'g7'), (4378, 45, 6.5, 'g8'), (4379, 76, 7.0, 'g9'), (4380, 107, 7.5, 'g10'), (4381, 138, 8.0, 'g11'), (4382, 169, 8.5, 'g12'), (4383, 200, 9.0, 'g13'), (4384, 20, 9.5, 'g14'), (4385, 51, 10.0, 'g15'), (4386, 82, 10.5, 'g16'), (4387, 113, 11.0, 'g17'), (4388, 144, 11.5, 'g18'), (4389, 175, 12.0, 'g0'), (4390, 206, 12.5, 'g1'), (4391, 26, 13.0, 'g2'), (4392, 57, 13.5, 'g3'), (4393, 88, 14.0, 'g4'), (4394, 119, 14.5, 'g5'), (4395, 150, 15.0, 'g6'), (4396, 181, 15.5, 'g7'), (4397, 1, 16.0, 'g8'), (4398, 32, 16.5, 'g9'), (4399, 63, 17.0, 'g10'), (4400, 94, 17.5, 'g11'), (4401, 125, 18.0, 'g12'), (4402, 156, 18.5, 'g13'), (4403, 187, 19.0, 'g14'), (4404, 7, 19.5, 'g15'), (4405, 38, 20.0, 'g16'), (4406, 69, 20.5, 'g17'), (4407, 100, 21.0, 'g18'), (4408, 131, 21.5, 'g0'), (4409, 162, 22.0, 'g1'), (4410, 193, 22.5, 'g2'), (4411, 13, 23.0, 'g3'), (4412, 44, 23.5, 'g4'), (4413, 75, 24.0, 'g5'), (4414, 106, 24.5, 'g6'), (4415, 137, 25.0, 'g7'), (4416, 168, 25.5, 'g8'), (4417, 199, 26.0, 'g9'), (4418, 19, 26.5, 'g10'), (4419, 50, 27.0, 'g11'), (4420, 81, 27.5, 'g12'), (4421, 112, 28.0, 'g13'), (4422, 143, 28.5, 'g14'), (4423, 174, 29.0, 'g15'), (4424, 205, 29.5, 'g16'), (4425, 25, 30.0, 'g17'), (4426, 56, 30.5, 'g18'), (4427, 87, 31.0, 'g0'), (4428, 118, 31.5, 'g1'), (4429, 149, 32.0, 'g2'), (4430, 180, 32.5, 'g3'), (4431, 0, 33.0, 'g4'), (4432, 31, 33.5, 'g5'), (4433, 62, 34.0, 'g6'), (4434, 93, 34.5, 'g7'), (4435, 124, 35.0, 'g8'), (4436, 155, 35.5, 'g9'), (4437, 186, 36.0, 'g10'), (4438, 6, 36.5, 'g11'), (4439, 37, 37.0, 'g12'), (4440, 68, 37.5, 'g13'), (4441, 99, 38.0, 'g14'), (4442, 130, 38.5, 'g15'), (4443, 161, 39.0, 'g16'), (4444, 192, 39.5, 'g17'), (4445, 12, 40.0, 'g18'), (4446, 43, 40.5, 'g0'), (4447, 74, 41.0, 'g1'), (4448, 105, 41.5, 'g2'), (4449, 136, 42.0, 'g3'), (4450, 167, 42.5, 'g4'), (4451, 198, 43.0, 'g5'), (4452, 18, 43.5, 'g6'), (4453, 49, 44.0, 'g7'), (4454, 80, 44.5, 'g8'), (4455, 111, 45.0, 'g9'), (4456, 142, 45.5, 'g10'), (4457, 173, 46.0, 'g11'), (4458, 204, 46.5, 'g12'), (4459, 24, 47.0, 'g13'), (4460, 55, 47.5, 'g14'), (4461, 86, 48.0, 'g15'), (4462, 117, 0.0, 'g16'), (4463, 148, 0.5, 'g17'), (4464, 179, 1.0, 'g18'), (4465, 210, 1.5, 'g0'), (4466, 30, 2.0, 'g1'), (4467, 61, 2.5, 'g2'), (4468, 92, 3.0, 'g3'), (4469, 123, 3.5, 'g4'), (4470, 154, 4.0, 'g5'), (4471, 185, 4.5, 'g6'), (4472, 5, 5.0, 'g7'), (4473, 36, 5.5, 'g8'), (4474, 67, 6.0, 'g9'), (4475, 98, 6.5, 'g10'), (4476, 129, 7.0, 'g11'), (4477, 160, 7.5, 'g12'), (4478, 191, 8.0, 'g13'), (4479, 11, 8.5, 'g14'), (4480, 42, 9.0, 'g15'), (4481, 73, 9.5, 'g16'), (4482, 104, 10.0, 'g17'), (4483, 135, 10.5, 'g18'), (4484, 166, 11.0, 'g0'), (4485, 197, 11.5, 'g1'), (4486, 17, 12.0, 'g2'), (4487, 48, 12.5, 'g3'), (4488, 79, 13.0, 'g4'), (4489, 110, 13.5, 'g5'), (4490, 141, 14.0, 'g6'), (4491, 172, 14.5, 'g7'), (4492, 203, 15.0, 'g8'), (4493, 23, 15.5, 'g9'), (4494, 54, 16.0, 'g10'), (4495, 85, 16.5, 'g11'), (4496, 116, 17.0, 'g12'), (4497, 147, 17.5, 'g13'), (4498, 178, 18.0, 'g14'), (4499, 209, 18.5, 'g15'), (4500, 29, 19.0, 'g16'), (4501, 60, 19.5, 'g17'), (4502, 91, 20.0, 'g18'), (4503, 122, 20.5, 'g0'), (4504, 153, 21.0, 'g1'), (4505, 184, 21.5, 'g2'), (4506, 4, 22.0, 'g3'), (4507, 35, 22.5, 'g4'), (4508, 66, 23.0, 'g5'), (4509, 97, 23.5, 'g6'), (4510, 128, 24.0, 'g7'), (4511, 159, 24.5, 'g8'), (4512, 190, 25.0, 'g9'), (4513, 10, 25.5, 'g10'), (4514, 41, 26.0, 'g11'), (4515, 72, 26.5, 'g12'), (4516, 103, 27.0, 'g13'), (4517, 134, 27.5, 'g14'), (4518, 165, 28.0, 'g15'), (4519, 196, 28.5, 'g16'), (4520, 16, 29.0, 'g17'), (4521, 47, 29.5, 'g18'), (4522, 78, 30.0, 'g0'), (4523, 109, 30.5, 'g1'), (4524, 140, 31.0, 'g2'), (4525, 171, 31.5, 'g3'), (4526, 202, 32.0, 'g4'), (4527, 22, 32.5, 'g5'), (4528, 53, 33.0, 'g6'), (4529, 84, 33.5, 'g7'), (4530, 115, 34.0, 'g8'), (4531, 146, 34.5, 'g9'), (4532, 177, 35.0, 'g10'), (4533, 208, 35.5, 'g11'), (4534, 28, 36.0, 'g12'), (4535, 59, 36.5, 'g13'), (4536, 90, 37.0, 'g14'), (4537, 121, 37.5, 'g15'), (4538, 152, 38.0, 'g16'), (4539, 183, 38.5, 'g17'), (4540, 3, 39.0, 'g18'), (4541, 34, 39.5, 'g0'), (4542, 65, 40.0, 'g1'), (4543, 96, 40.5, 'g2'), (4544, 127, 41.0, 'g3'), (4545, 158, 41.5, 'g4'), (4546, 189, 42.0, 'g5'), (4547, 9, 42.5, 'g6'), (4548, 40, 43.0, 'g7'), (4549, 71, 43.5, 'g8'), (4550, 102, 44.0, 'g9'), (4551, 133, 44.5, 'g10'), (4552, 164, 45.0, 'g11'), (4553, 195, 45.5, 'g12'), (4554, 15, 46.0, 'g13'), (4555, 46, 46.5, 'g14'), (4556, 77, 47.0, 'g15'), (4557, 108, 47.5, 'g16'), (4558, 139, 48.0, 'g17'), (4559, 170, 0.0, 'g18'), (4560, 201, 0.5, 'g0'), (4561, 21, 1.0, 'g1'), (4562, 52, 1.5, 'g2'), (4563, 83, 2.0, 'g3'), (4564, 114, 2.5, 'g4'), (4565, 145, 3.0, 'g5'), (4566, 176, 3.5, 'g6'), (4567, 207, 4.0, 'g7'), (4568, 27, 4.5, 'g8'), (4569, 58, 5.0, 'g9'), (4570, 89, 5.5, 'g10'), (4571, 120, 6.0, 'g11'), (4572, 151, 6.5, 'g12'), (4573, 182, 7.0, 'g13'), (4574, 2, 7.5, 'g14'), (4575, 33, 8.0, 'g15'), (4576, 64, 8.5, 'g16'), (4577, 95, 9.0, 'g17'), (4578, 126, 9.5, 'g18'), (4579, 157, 10.0, 'g0'), (4580, 188, 10.5, 'g1'), (4581, 8, 11.0, 'g2'), (4582, 39, 11.5, 'g3'), (4583, 70, 12.0, 'g4'), (4584, 101, 12.5, 'g5'), (4585, 132, 13.0, 'g6'), (4586, 163, 13.5, 'g7'), (4587, 194, 14.0, 'g8'), (4588, 14, 14.5, 'g9'), (4589, 45, 15.0, 'g10'), (4590, 76, 15.5, 'g11'), (4591, 107, 16.0, 'g12'), (4592, 138, 16.5, 'g13'), (4593, 169, 17.0, 'g14'), (4594, 200, 17.5, 'g15'), (4595, 20, 18.0, 'g16'), (4596, 51, 18.5, 'g17'), (4597, 82, 19.0, 'g18'), (4598, 113, 19.5, 'g0'), (4599, 144, 20.0, 'g1'), (4600, 175, 20.5, 'g2'), (4601, 206, 21.0, 'g3'), (4602, 26, 21.5, 'g4'), (4603, 57, 22.0, 'g5'), (4604, 88, 22.5, 'g6'), (4605, 119, 23.0, 'g7'), (4606, 150, 23.5, 'g8'), (4607, 181, 24.0, 'g9'), (4608, 1, 24.5, 'g10'), (4609, 32, 25.0, 'g11'), (4610, 63, 25.5, 'g12'), (4611, 94, 26.0, 'g13'), (4612, 125, 26.5, 'g14'), (4613, 156, 27.0, 'g15'), (4614, 187, 27.5, 'g16'), (4615, 7, 28.0, 'g17'), (4616, 38, 28.5, 'g18'), (4617, 69, 29.0, 'g0'), (4618, 100, 29.5, 'g1'), (4619, 131, 30.0, 'g2'), (4620, 162, 30.5, 'g3'), (4621, 193, 31.0, 'g4'), (4622, 13, 31.5, 'g5'), (4623, 44, 32.0, 'g6'), (4624, 75, 32.5, 'g7'), (4625, 106, 33.0, 'g8'), (4626, 137, 33.5, 'g9'), (4627, 168, 34.0, 'g10'), (4628, 199, 34.5, 'g11'), (4629, 19, 35.0, 'g12'), (4630, 50, 35.5, 'g13'), (4631, 81, 36.0, 'g14'), (4632, 112, 36.5, 'g15'), (4633, 143, 37.0, 'g16'), (4634, 174, 37.5, 'g17'), (4635, 205, 38.0, 'g18'), (4636, 25, 38.5, 'g0'), (4637, 56, 39.0, 'g1'), (4638, 87, 39.5, 'g2'), (4639, 118, 40.0, 'g3'), (4640, 149, 40.5, 'g4'), (4641, 180, 41.0, 'g5'), (4642, 0, 41.5, 'g6'), (4643, 31, 42.0, 'g7'), (4644, 62, 42.5, 'g8'), (4645, 93, 43.0, 'g9'), (4646, 124, 43.5, 'g10'), (4647, 155, 44.0, 'g11'), (4648, 186, 44.5, 'g12'), (4649, 6, 45.0, 'g13'), (4650, 37, 45.5, 'g14'), (4651, 68, 46.0, 'g15'), (4652, 99, 46.5, 'g16'), (4653, 130, 47.0, 'g17'), (4654, 161, 47.5, 'g18'), (4655, 192, 48.0, 'g0'), (4656, 12, 0.0, 'g1'), (4657, 43, 0.5, 'g2'), (4658, 74, 1.0, 'g3'), (4659, 105, 1.5, 'g4'), (4660, 136, 2.0, 'g5'), (4661, 167, 2.5, 'g6'), (4662, 198, 3.0, 'g7'), (4663, 18, 3.5, 'g8'), (4664, 49, 4.0, 'g9'), (4665, 80, 4.5, 'g10'), (4666, 111, 5.0, 'g11'), (4667, 142, 5.5, 'g12'), (4668, 173, 6.0, 'g13'), (4669, 204, 6.5, 'g14'), (4670, 24, 7.0, 'g15'), (4671, 55, 7.5, 'g16'), (4672, 86, 8.0, 'g17'), (4673, 117, 8.5, 'g18'), (4674, 148, 9.0, 'g0'), (4675, 179, 9.5, 'g1'), (4676, 210, 10.0, 'g2'), (4677, 30, 10.5, 'g3'), (4678, 61, 11.0, 'g4'), (4679, 92, 11.5, 'g5'), (4680, 123, 12.0, 'g6'), (4681, 154, 12.5, 'g7'), (4682, 185, 13.0, 'g8'), (4683, 5, 13.5, 'g9'), (4684, 36, 14.0, 'g10'), (4685, 67, 14.5, 'g11'), (4686, 98, 15.0, 'g12'), (4687, 129, 15.5, 'g13'), (4688, 160, 16.0, 'g14'), (4689, 191, 16.5, 'g15'), (4690, 11, 17.0, 'g16'), (4691, 42, 17.5, 'g17'), (4692, 73, 18.0, 'g18'), (4693, 104, 18.5, 'g0'), (4694, 135, 19.0, 'g1'), (4695, 166, 19.5, 'g2'), (4696, 197, 20.0, 'g3'), (4697, 17, 20.5, 'g4'), (4698, 48, 21.0, 'g5'), (4699, 79, 21.5, 'g6'), (4700, 110, 22.0, 'g7'), (4701, 141, 22.5, 'g8'), (4702, 172, 23.0, 'g9'), (4703, 203, 23.5, 'g10'), (4704, 23, 24.0, 'g11'), (4705, 54, 24.5, 'g12'), (4706, 85, 25.0, 'g13'), (4707, 116, 25.5, 'g14'), (4708, 147, 26.0, 'g15'), (4709, 178, 26.5, 'g16'), (4710, 209, 27.0, 'g17'), (4711, 29, 27.5, 'g18'), (4712, 60, 28.0, 'g0'), (4713, 91, 28.5, 'g1'), (4714, 122, 29.0, 'g2'), (4715, 153, 29.5, 'g3'), (4716, 184, 30.0, 'g4'), (4717, 4, 30.5, 'g5'), (4718, 35, 31.0, 'g6'), (4719, 66, 31.5, 'g7'), (4720, 97, 32.0, 'g8'), (4721, 128, 32.5, 'g9'), (4722, 159, 33.0, 'g10'), (4723, 190, 33.5, 'g11'), (4724, 10, 34.0, 'g12'), (4725, 41, 34.5, 'g13'), (4726, 72, 35.0, 'g14'), (4727, 103, 35.5, 'g15'), (4728, 134, 36.0, 'g16'), (4729, 165, 36.5, 'g17'), (4730, 196, 37.0, 'g18'), (4731, 16, 37.5, 'g0'), (4732, 47, 38.0, 'g1'), (4733, 78, 38.5, 'g2'), (4734, 109, 39.0, 'g3'), (4735, 140, 39.5, 'g4'), (4736, 171, 40.0, 'g5'), (4737, 202, 40.5, 'g6'), (4738, 22, 41.0, 'g7'), (4739, 53, 41.5, 'g8'), (4740, 84, 42.0, 'g9'), (4741, 115, 42.5, 'g10'), (4742, 146, 43.0, 'g11'), (4743, 177, 43.5, 'g12'), (4744, 208, 44.0, 'g13'), (4745, 28, 44.5, 'g14'), (4746, 59, 45.0, 'g15'), (4747, 90, 45.5, 'g16'), (4748, 121, 46.0, 'g17'), (4749, 152, 46.5, 'g18'), (4750, 183, 47.0, 'g0'), (4751, 3, 47.5, 'g1'), (4752, 34, 48.0, 'g2'), (4753, 65, 0.0, 'g3'), (4754, 96, 0.5, 'g4'), (4755, 127, 1.0, 'g5'), (4756, 158, 1.5, 'g6'), (4757, 189, 2.0, 'g7'), (4758, 9, 2.5, 'g8'), (4759, 40, 3.0, 'g9'), (4760, 71, 3.5, 'g10'), (4761, 102, 4.0, 'g11'), (4762, 133, 4.5, 'g12'), (4763, 164, 5.0, 'g13'), (4764, 195, 5.5, 'g14'), (4765, 15, 6.0, 'g15'), (4766, 46, 6.5, 'g16'), (4767, 77, 7.0, 'g17'), (4768, 108, 7.5, 'g18'), (4769, 139, 8.0, 'g0'), (4770, 170, 8.5, 'g1'), (4771, 201, 9.0, 'g2'), (4772, 21, 9.5, 'g3'), (4773, 52, 10.0, 'g4'), (4774, 83, 10.5, 'g5'), (4775, 114, 11.0, 'g6'), (4776, 145, 11.5, 'g7'), (4777, 176, 12.0, 'g8'), (4778, 207, 12.5, 'g9'), (4779, 27, 13.0, 'g10'), (4780, 58, 13.5, 'g11'), (4781, 89, 14.0, 'g12'), (4782, 120, 14.5, 'g13'), (4783, 151, 15.0, 'g14'), (4784, 182, 15.5, 'g15'), (4785, 2, 16.0, 'g16'), (4786, 33, 16.5, 'g17'), (4787, 64, 17.0, 'g18'), (4788, 95, 17.5, 'g0'), (4789, 126, 18.0, 'g1'), (4790, 157, 18.5, 'g2'), (4791, 188, 19.0, 'g3'), (4792, 8, 19.5, 'g4'), (4793, 39, 20.0, 'g5'), (4794, 70, 20.5, 'g6'), (4795, 101, 21.0, 'g7'), (4796, 132, 21.5, 'g8'), (4797, 163, 22.0, 'g9'), (4798, 194, 22.5, 'g10'), (4799, 14, 23.0, 'g11'), (4800, 45, 23.5, 'g12'), (4801, 76, 24.0, 'g13'), (4802, 107, 24.5, 'g14'), (4803, 138, 25.0, 'g15'), (4804, 169, 25.5, 'g16'), (4805, 200, 26.0, 'g17'), (4806, 20, 26.5, 'g18'), (4807, 51, 27.0, 'g0'), (4808, 82, 27.5, 'g1'), (4809, 113, 28.0, 'g2'), (4810, 144, 28.5, 'g3'), (4811, 175, 29.0, 'g4'), (4812, 206, 29.5, 'g5'), (4813, 26, 30.0, 'g6'), (4814, 57, 30.5, 'g7'), (4815, 88, 31.0, 'g8'), (4816, 119, 31.5, 'g9'), (4817, 150, 32.0, 'g10'), (4818, 181, 32.5, 'g11'), (4819, 1, 33.0, 'g12'), (4820, 32, 33.5, 'g13'), (4821, 63, 34.0, 'g14'), (4822, 94, 34.5, 'g15'), (4823, 125, 35.0, 'g16'), (4824, 156, 35.5, 'g17'), (4825, 187, 36.0, 'g18'), (4826, 7, 36.5, 'g0'), (4827, 38, 37.0, 'g1'), (4828, 69, 37.5, 'g2'), (4829, 100, 38.0, 'g3'), (4830, 131, 38.5, 'g4'), (4831, 162, 39.0, 'g5'), (4832, 193, 39.5, 'g6'), (4833, 13, 40.0, 'g7'), (4834, 44, 40.5, 'g8'), (4835, 75, 41.0, 'g9'), (4836, 106, 41.5, 'g10'), (4837, 137, 42.0, 'g11'), (4838, 168, 42.5, 'g12'), (4839, 199, 43.0, 'g13'), (4840, 19, 43.5, 'g14'), (4841, 50, 44.0, 'g15'), (4842, 81, 44.5, 'g16'), (4843, 112, 45.0, 'g17'), (4844, 143, 45.5, 'g18'), (4845, 174, 46.0, 'g0'), (4846, 205, 46.5, 'g1'), (4847, 25, 47.0, 'g2'), (4848, 56, 47.5, 'g3'), (4849, 87, 48.0, 'g4'), (4850, 118, 0.0, 'g5'), (4851, 149, 0.5, 'g6'), (4852, 180, 1.0, 'g7'), (4853, 0, 1.5, 'g8'), (4854, 31, 2.0, 'g9'), (4855, 62, 2.5, 'g10'), (4856, 93, 3.0, 'g11'), (4857, 124, 3.5, 'g12'), (4858, 155, 4.0, 'g13'), (4859, 186, 4.5, 'g14'), (4860, 6, 5.0, 'g15'), (4861, 37, 5.5, 'g16'), (4862, 68, 6.0, 'g17'), (4863, 99, 6.5, 'g18'), (4864, 130, 7.0, 'g0'), (4865, 161, 7.5, 'g1'), (4866, 192, 8.0, 'g2'), (4867, 12, 8.5, 'g3'), (4868, 43, 9.0, 'g4'), (4869, 74, 9.5, 'g5'), (4870, 105, 10.0, 'g6'), (4871, 136, 10.5, 'g7'), (4872, 167, 11.0, 'g8'), (4873, 198, 11.5, 'g9'), (4874, 18, 12.0, 'g10'), (4875, 49, 12.5, 'g11'), (4876, 80, 13.0, 'g12'), (4877, 111, 13.5, 'g13'), (4878, 142, 14.0, 'g14'), (4879, 173, 14.5, 'g15'), (4880, 204, 15.0, 'g16'), (4881, 24, 15.5, 'g17'), (4882, 55, 16.0, 'g18'), (4883, 86, 16.5, 'g0'), (4884, 117, 17.0, 'g1'), (4885, 148, 17.5, 'g2'), (4886, 179, 18.0, 'g3'), (4887, 210, 18.5, 'g4'), (4888, 30, 19.0, 'g5'), (4889, 61, 19.5, 'g6'), (4890, 92, 20.0, 'g7'), (4891, 123, 20.5, 'g8'), (4892, 154, 21.0, 'g9'), (4893, 185, 21.5, 'g10'), (4894, 5, 22.0, 'g11'), (4895, 36, 22.5, 'g12'), (4896, 67, 23.0, 'g13'), (4897, 98, 23.5, 'g14'), (4898, 129, 24.0, 'g15'), (4899, 160, 24.5, 'g16'), (4900, 191, 25.0, 'g17'), (4901, 11, 25.5, 'g18'), (4902, 42, 26.0, 'g0'), (4903, 73, 26.5, 'g1'), (4904, 104, 27.0, 'g2'), (4905, 135, 27.5, 'g3'), (4906, 166, 28.0, 'g4'), (4907, 197, 28.5, 'g5'), (4908, 17, 29.0, 'g6'), (4909, 48, 29.5, 'g7'), (4910, 79, 30.0, 'g8'), (4911, 110, 30.5, 'g9'), (4912, 141, 31.0, 'g10'), (4913, 172, 31.5, 'g11'), (4914, 203, 32.0, 'g12'), (4915, 23, 32.5, 'g13'), (4916, 54, 33.0, 'g14'), (4917, 85, 33.5, 'g15'), (4918, 116, 34.0, 'g16'), (4919, 147, 34.5, 'g17'), (4920, 178, 35.0, 'g18'), (4921, 209, 35.5, 'g0'), (4922, 29, 36.0, 'g1'), (4923, 60, 36.5, 'g2'), (4924, 91, 37.0, 'g3'), (4925, 122, 37.5, 'g4'), (4926, 153, 38.0, 'g5'), (4927, 184, 38.5, 'g6'), (4928, 4, 39.0, 'g7'), (4929, 35, 39.5, 'g8'), (4930, 66, 40.0, 'g9'), (4931, 97, 40.5, 'g10'), (4932, 128, 41.0, 'g11'), (4933, 159, 41.5, 'g12'), (4934, 190, 42.0, 'g13'), (4935, 10, 42.5, 'g14'), (4936, 41, 43.0, 'g15'), (4937, 72, 43.5, 'g16'), (4938, 103, 44.0, 'g17'), (4939, 134, 44.5, 'g18'), (4940, 165, 45.0, 'g0'), (4941, 196, 45.5, 'g1'), (4942, 16, 46.0, 'g2'), (4943, 47, 46.5, 'g3'), (4944, 78, 47.0, 'g4'), (4945, 109, 47.5, 'g5'), (4946, 140, 48.0, 'g6'), (4947, 171, 0.0, 'g7'), (4948, 202, 0.5, 'g8'), (4949, 22, 1.0, 'g9'), (4950, 53, 1.5, 'g10'), (4951, 84, 2.0, 'g11'), (4952, 115, 2.5, 'g12'), (4953, 146, 3.0, 'g13'), (4954, 177, 3.5, 'g14'), (4955, 208, 4.0, 'g15'), (4956, 28, 4.5, 'g16'), (4957, 59, 5.0, 'g17'), (4958, 90, 5.5, 'g18'), (4959, 121, 6.0, 'g0'), (4960, 152, 6.5, 'g1'), (4961, 183, 7.0, 'g2'), (4962, 3, 7.5, 'g3'), (4963, 34, 8.0, 'g4'), (4964, 65, 8.5, 'g5'), (4965, 96, 9.0, 'g6'), (4966, 127, 9.5, 'g7'), (4967, 158, 10.0, 'g8'), (4968, 189, 10.5, 'g9'), (4969, 9, 11.0, 'g10'), (4970, 40, 11.5, 'g11'), (4971, 71, 12.0, 'g12'), (4972, 102, 12.5, 'g13'), (4973, 133, 13.0, 'g14'), (4974, 164, 13.5, 'g15'), (4975, 195, 14.0, 'g16'), (4976, 15, 14.5, 'g17'), (4977, 46, 15.0, 'g18'), (4978, 77, 15.5, 'g0'), (4979, 108, 16.0, 'g1'), (4980, 139, 16.5, 'g2'), (4981, 170, 17.0, 'g3'), (4982, 201, 17.5, 'g4'), (4983, 21, 18.0, 'g5'), (4984, 52, 18.5, 'g6'), (4985, 83, 19.0, 'g7'), (4986, 114, 19.5, 'g8'), (4987, 145, 20.0, 'g9'), (4988, 176, 20.5, 'g10'), (4989, 207, 21.0, 'g11'), (4990, 27, 21.5, 'g12'), (4991, 58, 22.0, 'g13'), (4992, 89, 22.5, 'g14'), (4993, 120, 23.0, 'g15'), (4994, 151, 23.5, 'g16'), (4995, 182, 24.0, 'g17'), (4996, 2, 24.5, 'g18'), (4997, 33, 25.0, 'g0'), (4998, 64, 25.5, 'g1'), (4999, 95, 26.0, 'g2');
+CREATE TABLE S(K INT, G INT, N VARCHAR, PRIMARY KEY(K));
+INSERT INTO S VALUES (0, 0, 's0'), (1, 1, 's1'), (2, 2, 's2'), (3, 3, 's3'), (4, 4, 's4'), (5, 5, 's0'), (6, 6, 's1'), (7, 0, 's2'), (8, 1, 's3'), (9, 2, 's4'), (10, 3, 's0'), (11, 4, 's1'), (12, 5, 's2'), (13, 6, 's3'), (14, 0, 's4'), (15, 1, 's0'), (16, 2, 's1'), (17, 3, 's2'), (18, 4, 's3'), (19, 5, 's4'), (20, 6, 's0'), (21, 0, 's1'), (22, 1, 's2'), (23, 2, 's3'), (24, 3, 's4'), (25, 4, 's0'), (26, 5, 's1'), (27, 6, 's2'), (28, 0, 's3'), (29, 1, 's4'), (30, 2, 's0'), (31, 3, 's1'), (32, 4, 's2'), (33, 5, 's3'), (34, 6, 's4'), (35, 0, 's0'), (36, 1, 's1'), (37, 2, 's2'), (38, 3, 's3'), (39, 4, 's4'), (40, 5, 's0'), (41, 6, 's1'), (42, 0, 's2'), (43, 1, 's3'), (44, 2, 's4'), (45, 3, 's0'), (46, 4, 's1'), (47, 5, 's2'), (48, 6, 's3'), (49, 0, 's4'), (50, 1, 's0'), (51, 2, 's1'), (52, 3, 's2'), (53, 4, 's3'), (54, 5, 's4'), (55, 6, 's0'), (56, 0, 's1'), (57, 1, 's2'), (58, 2, 's3'), (59, 3, 's4'), (60, 4, 's0'), (61, 5, 's1'), (62, 6, 's2'), (63, 0, 's3'), (64, 1, 's4'), (65, 2, 's0'), (66, 3, 's1'), (67, 4, 's2'), (68, 5, 's3'), (69, 6, 's4'), (70, 0, 's0'), (71, 1, 's1'), (72, 2, 's2'), (73, 3, 's3'), (74, 4, 's4'), (75, 5, 's0'), (76, 6, 's1'), (77, 0, 's2'), (78, 1, 's3'), (79, 2, 's4'), (80, 3, 's0'), (81, 4, 's1'), (82, 5, 's2'), (83, 6, 's3'), (84, 0, 's4'), (85, 1, 's0'), (86, 2, 's1'), (87, 3, 's2'), (88, 4, 's3'), (89, 5, 's4'), (90, 6, 's0'), (91, 0, 's1'), (92, 1, 's2'), (93, 2, 's3'), (94, 3, 's4'), (95, 4, 's0'), (96, 5, 's1'), (97, 6, 's2'), (98, 0, 's3'), (99, 1, 's4'), (100, 2, 's0'), (101, 3, 's1'), (102, 4, 's2'), (103, 5, 's3'), (104, 6, 's4'), (105, 0, 's0'), (106, 1, 's1'), (107, 2, 's2'), (108, 3, 's3'), (109, 4, 's4'), (110, 5, 's0'), (111, 6, 's1'), (112, 0, 's2'), (113, 1, 's3'), (114, 2, 's4'), (115, 3, 's0'), (116, 4, 's1'), (117, 5, 's2'), (118, 6, 's3'), (119, 0, 's4'), (120, 1, 's0'), (121, 2, 's1'), (122, 3, 's2'), (123, 4, 's3'), (124, 5, 's4'), (125, 6, 's0'), (126, 0, 's1'), (127, 1, 's2'), (128, 2, 's3'), (129, 3, 's4'), (130, 4, 's0'), (131, 5, 's1'), (132, 6, 's2'), (133, 0, 's3'), (134, 1, 's4'), (135, 2, 's0'), (136, 3, 's1'), (137, 4, 's2'), (138, 5, 's3'), (139, 6, 's4'), (140, 0, 's0'), (141, 1, 's1'), (142, 2, 's2'), (143, 3, 's3'), (144, 4, 's4'), (145, 5, 's0'), (146, 6, 's1'), (147, 0, 's2'), (148, 1, 's3'), (149, 2, 's4'), (150, 3, 's0'), (151, 4, 's1'), (152, 5, 's2'), (153, 6, 's3'), (154, 0, 's4'), (155, 1, 's0'), (156, 2, 's1'), (157, 3, 's2'), (158, 4, 's3'), (159, 5, 's4'), (160, 6, 's0'), (161, 0, 's1'), (162, 1, 's2'), (163, 2, 's3'), (164, 3, 's4'), (165, 4, 's0'), (166, 5, 's1'), (167, 6, 's2'), (168, 0, 's3'), (169, 1, 's4'), (170, 2, 's0'), (171, 3, 's1'), (172, 4, 's2'), (173, 5, 's3'), (174, 6, 's4'), (175, 0, 's0'), (176, 1, 's1'), (177, 2, 's2'), (178, 3, 's3'), (179, 4, 's4'), (180, 5, 's0'), (181, 6, 's1'), (182, 0, 's2'), (183, 1, 's3'), (184, 2, 's4'), (185, 3, 's0'), (186, 4, 's1'), (187, 5, 's2'), (188, 6, 's3'), (189, 0, 's4'), (190, 1, 's0'), (191, 2, 's1'), (192, 3, 's2'), (193, 4, 's3'), (194, 5, 's4'), (195, 6, 's0'), (196, 0, 's1'), (197, 1, 's2'), (198, 2, 's3'), (199, 3, 's4'), (200, 4, 's0'), (201, 5, 's1'), (202, 6, 's2'), (203, 0, 's3'), (204, 1, 's4'), (205, 2, 's0'), (206, 3, 's1'), (207, 4, 's2'), (208, 5, 's3'), (209, 6, 's4'), (210, 0, 's0'), (211, 1, 's1'), (212, 2, 's2'), (213, 3, 's3'), (214, 4, 's4'), (215, 5, 's0'), (216, 6, 's1'), (217, 0, 's2'), (218, 1, 's3'), (219, 2, 's4'), (220, 3, 's0'), (221, 4, 's1'), (222, 5, 's2'), (223, 6, 's3'), (224, 0, 's4'), (225, 1, 's0'), (226, 2, 's1'), (227, 3, 's2'), (228, 4, 's3'), (229, 5, 's4'), (230, 6, 's0'), (231, 0, 's1'), (232, 1, 's2'), (233, 2, 's3'), (234, 3, 's4'), (235, 4, 's0'), (236, 5, 's1'), (237, 6, 's2'), (238, 0, 's3'), (239, 1, 's4'), (240, 2, 's0'), (241, 3, 's1'), (242, 4, 's2'), (243, 5, 's3'), (244, 6, 's4'), (245, 0, 's0'), (246, 1, 's1'), (247, 2, 's2'), (248, 3, 's3'), (249, 4, 's4'), (250, 5, 's0'), (251, 6, 's1'), (252, 0, 's2'), (253, 1, 's3'), (254, 2, 's4'), (255, 3, 's0'), (256, 4, 's1'), (257, 5, 's2'), (258, 6, 's3'), (259, 0, 's4'), (260, 1, 's0'), (261, 2, 's1'), (262, 3, 's2'), (263, 4, 's3'), (264, 5, 's4'), (265, 6, 's0'), (266, 0, 's1'), (267, 1, 's2'), (268, 2, 's3'), (269, 3, 's4'), (270, 4, 's0'), (271, 5, 's1'), (272, 6, 's2'), (273, 0, 's3'), (274, 1, 's4'), (275, 2, 's0'), (276, 3, 's1'), (277, 4, 's2'), (278, 5, 's3'), (279, 6, 's4'), (280, 0, 's0'), (281, 1, 's1'), (282, 2, 's2'), (283, 3, 's3'), (284, 4, 's4'), (285, 5, 's0'), (286, 6, 's1'), (287, 0, 's2'), (288, 1, 's3'), (289, 2, 's4'), (290, 3, 's0'), (291, 4, 's1'), (292, 5, 's2'), (293, 6, 's3'), (294, 0, 's4'), (295, 1, 's0'), (296, 2, 's1'), (297, 3, 's2'), (298, 4, 's3'), (299, 5, 's4'), (300, 6, 's0'), (301, 0, 's1'), (302, 1, 's2'), (303, 2, 's3'), (304, 3, 's4'), (305, 4, 's0'), (306, 5, 's1'), (307, 6, 's2'), (308, 0, 's3'), (309, 1, 's4'), (310, 2, 's0'), (311, 3, 's1'), (312, 4, 's2'), (313, 5, 's3'), (314, 6, 's4'), (315, 0, 's0'), (316, 1, 's1'), (317, 2, 's2'), (318, 3, 's3'), (319, 4, 's4'), (320, 5, 's0'), (321, 6, 's1'), (322, 0, 's2'), (323, 1, 's3'), (324, 2, 's4'), (325, 3, 's0'), (326, 4, 's1'), (327, 5, 's2'), (328, 6, 's3'), (329, 0, 's4'), (330, 1, 's0'), (331, 2, 's1'), (332, 3, 's2'), (333, 4, 's3'), (334, 5, 's4'), (335, 6, 's0'), (336, 0, 's1'), (337, 1, 's2'), (338, 2, 's3'), (339, 3, 's4'), (340, 4, 's0'), (341, 5, 's1'), (342, 6, 's2'), (343, 0, 's3'), (344, 1, 's4'), (345, 2, 's0'), (346, 3, 's1'), (347, 4, 's2'), (348, 5, 's3'), (349, 6, 's4'), (350, 0, 's0'), (351, 1, 's1'), (352, 2, 's2'), (353, 3, 's3'), (354, 4, 's4'), (355, 5, 's0'), (356, 6, 's1'), (357, 0, 's2'), (358, 1, 's3'), (359, 2, 's4'), (360, 3, 's0'), (361, 4, 's1'), (362, 5, 's2'), (363, 6, 's3'), (364, 0, 's4'), (365, 1, 's0'), (366, 2, 's1'), (367, 3, 's2'), (368, 4, 's3'), (369, 5, 's4'), (370, 6, 's0'), (371, 0, 's1'), (372, 1, 's2'), (373, 2, 's3'), (374, 3, 's4'), (375, 4, 's0'), (376, 5, 's1'), (377, 6, 's2'), (378, 0, 's3'), (379, 1, 's4'), (380, 2, 's0'), (381, 3, 's1'), (382, 4, 's2'), (383, 5, 's3'), (384, 6, 's4'), (385, 0, 's0'), (386, 1, 's1'), (387, 2, 's2'), (388, 3, 's3'), (389, 4, 's4'), (390, 5, 's0'), (391, 6, 's1'), (392, 0, 's2'), (393, 1, 's3'), (394, 2, 's4'), (395, 3, 's0'), (396, 4, 's1'), (397, 5, 's2'), (398, 6, 's3'), (399, 0, 's4'), (400, 1, 's0'), (401, 2, 's1'), (402, 3, 's2'), (403, 4, 's3'), (404, 5, 's4'), (405, 6, 's0'), (406, 0, 's1'), (407, 1, 's2'), (408, 2, 's3'), (409, 3, 's4'), (410, 4, 's0'), (411, 5, 's1'), (412, 6, 's2'), (413, 0, 's3'), (414, 1, 's4'), (415, 2, 's0'), (416, 3, 's1'), (417, 4, 's2'), (418, 5, 's3'), (419, 6, 's4'), (420, 0, 's0'), (421, 1, 's1'), (422, 2, 's2'), (423, 3, 's3'), (424, 4, 's4'), (425, 5, 's0'), (426, 6, 's1'), (427, 0, 's2'), (428, 1, 's3'), (429, 2, 's4'), (430, 3, 's0'), (431, 4, 's1'), (432, 5, 's2'), (433, 6, 's3'), (434, 0, 's4'), (435, 1, 's0'), (436, 2, 's1'), (437, 3, 's2'), (438, 4, 's3'), (439, 5, 's4'), (440, 6, 's0'), (441, 0, 's1'), (442, 1, 's2'), (443, 2, 's3'), (444, 3, 's4'), (445, 4, 's0'), (446, 5, 's1'), (447, 6, 's2'), (448, 0, 's3'), (449, 1, 's4'), (450, 2, 's0'), (451, 3, 's1'), (452, 4, 's2'), (453, 5, 's3'), (454, 6, 's4'), (455, 0, 's0'), (456, 1, 's1'), (457, 2, 's2'), (458, 3, 's3'), (459, 4, 's4'), (460, 5, 's0'), (461, 6, 's1'), (462, 0, 's2'), (463, 1, 's3'), (464, 2, 's4'), (465, 3, 's0'), (466, 4, 's1'), (467, 5, 's2'), (468, 6, 's3'), (469, 0, 's4'), (470, 1, 's0'), (471, 2, 's1'), (472, 3, 's2'), (473, 4, 's3'), (474, 5, 's4'), (475, 6, 's0'), (476, 0, 's1'), (477, 1, 's2'), (478, 2, 's3'), (479, 3, 's4'), (480, 4, 's0'), (481, 5, 's1'), (482, 6, 's2'), (483, 0, 's3'), (484, 1, 's4'), (485, 2, 's0'), (486, 3, 's1'), (487, 4, 's2'), (488, 5, 's3'), (489, 6, 's4'), (490, 0, 's0'), (491, 1, 's1'), (492, 2, 's2'), (493, 3, 's3'), (494, 4, 's4'), (495, 5, 's0'), (496, 6, 's1'), (497, 0, 's2'), (498, 1, 's3'), (499, 2, 's4'), (500, 3, 's0'), (501, 4, 's1'), (502, 5, 's2'), (503, 6, 's3'), (504, 0, 's4'), (505, 1, 's0'), (506, 2, 's1'), (507, 3, 's2'), (508, 4, 's3'), (509, 5, 's4'), (510, 6, 's0'), (511, 0, 's1'), (512, 1, 's2'), (513, 2, 's3'), (514, 3, 's4'), (515, 4, 's0'), (516, 5, 's1'), (517, 6, 's2'), (518, 0, 's3'), (519, 1, 's4'), (520, 2, 's0'), (521, 3, 's1'), (522, 4, 's2'), (523, 5, 's3'), (524, 6, 's4'), (525, 0, 's0'), (526, 1, 's1'), (527, 2, 's2'), (528, 3, 's3'), (529, 4, 's4'), (530, 5, 's0'), (531, 6, 's1'), (532, 0, 's2'), (533, 1, 's3'), (534, 2, 's4'), (535, 3, 's0'), (536, 4, 's1'), (537, 5, 's2'), (538, 6, 's3'), (539, 0, 's4'), (540, 1, 's0'), (541, 2, 's1'), (542, 3, 's2'), (543, 4, 's3'), (544, 5, 's4'), (545, 6, 's0'), (546, 0, 's1'), (547, 1, 's2'), (548, 2, 's3'), (549, 3, 's4'), (550, 4, 's0'), (551, 5, 's1'), (552, 6, 's2'), (553, 0, 's3'), (554, 1, 's4'), (555, 2, 's0'), (556, 3, 's1'), (557, 4, 's2'), (558, 5, 's3'), (559, 6, 's4'), (560, 0, 's0'), (561, 1, 's1'), (562, 2, 's2'), (563, 3, 's3'), (564, 4, 's4'), (565, 5, 's0'), (566, 6, 's1'), (567, 0, 's2'), (568, 1, 's3'), (569, 2, 's4'), (570, 3, 's0'), (571, 4, 's1'), (572, 5, 's2'), (573, 6, 's3'), (574, 0, 's4'), (575, 1, 's0'), (576, 2, 's1'), (577, 3, 's2'), (578, 4, 's3'), (579, 5, 's4'), (580, 6, 's0'), (581, 0, 's1'), (582, 1, 's2'), (583, 2, 's3'), (584, 3, 's4'), (585, 4, 's0'), (586, 5, 's1'), (587, 6, 's2'), (588, 0, 's3'), (589, 1, 's4'), (590, 2, 's0'), (591, 3, 's1'), (592, 4, 's2'), (593, 5, 's3'), (594, 6, 's4'), (595, 0, 's0'), (596, 1, 's1'), (597, 2, 's2'), (598, 3, 's3'), (599, 4, 's4');
+SELECT A, B * 2, C + 1.0 FROM R WHERE B > 200;
+SELECT A FROM R WHERE A % 1000 = 999;
+SELECT A, D FROM R WHERE B > 1000;
+SELECT D, COUNT(*), SUM(B), MIN(C), MAX(A) FROM R GROUP BY D;
+SELECT D, AVG(C) FROM R WHERE B < 50 GROUP BY D;
+SELECT COUNT(*), SUM(C) FROM R WHERE B < 100;
+SELECT D, COUNT(DISTINCT B), SUM(DISTINCT C) FROM R WHERE A < 3000 GROUP BY D;
+SELECT S.N, COUNT(*), SUM(R.C) FROM R, S WHERE R.B = S.K AND R.A < 1000 GROUP BY S.N;
+SET INDEX_JOIN OFF;
+SET SORT_MERGE_JOIN OFF;
+SELECT R.A, S.N FROM R, S WHERE R.B = S.K AND S.G = 3;
+SET HASH_JOIN OFF;
+SET SORT_MERGE_JOIN ON;
+SELECT R.A, S.N FROM R, S WHERE R.B = S.K AND S.G = 3;
+SET HASH_JOIN ON;
+SET INDEX_JOIN ON;
+SELECT R.A, S.G FROM R, S WHERE R.B = S.K AND R.A < 500;
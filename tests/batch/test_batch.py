@@ -0,0 +1,59 @@
+import pytest
+import subprocess
+
+from ddb.db import DatabaseManager
+from ddb.session import Session
+from ddb.globals import DEFAULT_BATCH_SIZE
+from ddb.planner import Planner
+from ddb import executor
+from ddb.executor import QPop, TableScanPop, FilterPop, ProjectPop, HashEqJoinPop, AggrPop, MergeSortPop
+
+testcase_dir = "tests/batch/"
+T = 1
+
+@pytest.fixture(params=[1, 7, DEFAULT_BATCH_SIZE])
+def session(request, monkeypatch):
+    # results do not depend on how rows are batched between operators:
+    for module in (executor.interface, executor.filter, executor.project, executor.aggr, executor.mergesort, executor.pipeline):
+        monkeypatch.setattr(module, 'DEFAULT_BATCH_SIZE', request.param)
+    dbm = DatabaseManager(
+        db_dir = DatabaseManager.DEFAULT_DB_DIR,
+        tmp_dir = DatabaseManager.DEFAULT_TMP_DIR
+    )
+    s = Session(dbm)
+    yield s
+    Planner.options = Planner.Options()
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_batch_{t_id}")
+
+def test_batches(run, monkeypatch, capsys):
+    # every operator hands out non-empty batches, each a new list, with rows in the order of execute():
+    subprocess.run(['make', 'clean'], check=True)
+    for r in run('CREATE TABLE R(A INT, B INT, C VARCHAR);' +
+                 'INSERT INTO R VALUES ' + ', '.join(f"({i}, {i*31%211}, 'g{i%19}')" for i in range(3000)) + ';' +
+                 'CREATE TABLE S(K INT, N VARCHAR, PRIMARY KEY(K));' +
+                 'INSERT INTO S VALUES ' + ', '.join(f"({i}, 's{i%5}')" for i in range(300)) + ';'):
+        assert r.error is None, r.error_details
+    batches: list[list[tuple]] = list()
+    for cls in (QPop, TableScanPop, FilterPop, ProjectPop, HashEqJoinPop, AggrPop, MergeSortPop):
+        def checking_execute_batches(self, execute_batches=cls.execute_batches):
+            for batch in execute_batches(self):
+                assert type(batch) is list and len(batch) > 0
+                assert all(batch is not other for other in batches)
+                batches.append(batch)
+                yield batch
+        monkeypatch.setattr(cls, 'execute_batches', checking_execute_batches)
+    capsys.readouterr()
+    for r in run('SELECT A, B * 2 FROM R WHERE B > 100 ORDER BY R.A;' +
+                 'SELECT C, COUNT(*), SUM(B) FROM R WHERE A % 3 = 0 GROUP BY C;' +
+                 'SET INDEX_JOIN OFF;' +
+                 'SET SORT_MERGE_JOIN OFF;' +
+                 'SELECT R.A, S.N FROM R, S WHERE R.B = S.K AND R.A < 1000;' +
+                 'SET SORT_MERGE_JOIN ON;' +
+                 'SET INDEX_JOIN ON;'):
+        assert r.error is None, r.error_details
+    assert len(batches) > 0
+    ordered = [ eval(line) for line in capsys.readouterr().out.split("\n")[1:1 + sum(1 for i in range(3000) if i*31%211 > 100)] ]
+    assert ordered == [ (i, i*31%211*2) for i in range(3000) if i*31%211 > 100 ]
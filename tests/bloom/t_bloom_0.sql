@@ -0,0 +1,17 @@
+CREATE TABLE R(A INT, B INT, C VARCHAR, PRIMARY KEY(A)) WITH (bloom_filter=on);
+INSERT INTO R VALUES (0, 0, 'b0'), (3, 1, 'b1'), (6, 2, 'b2'), (9, 3, 'b3'), (12, 4, 'b4'), (15, 5, 'b5'), (18, 6, 'b6'), (21, 7, 'b7'), (24, 8, 'b8'), (27, 9, 'b9'), (30, 10, 'b10'), (33, 11, 'b11'), (36, 12, 'b12'), (39, 13, 'b13'), (42, 14, 'b14'), (45, 15, 'b15'), (48, 16, 'b16'), (51, 0, 'b17'), (54, 1, 'b18'), (57, 2, 'b19'), (60, 3, 'b20'), (63, 4, 'b21'), (66, 5, 'b22'), (69, 6, 'b23'), (72, 7, 'b24'), (75, 8, 'b25'), (78, 9, 'b26'), (81, 10, 'b27'), (84, 11, 'b28'), (87, 12, 'b0'), (90, 13, 'b1'), (93, 14, 'b2'), (96, 15, 'b3'), (99, 16, 'b4'), (102, 0, 'b5'), (105, 1, 'b6'), (108, 2, 'b7'), (111, 3, 'b8'), (114, 4, 'b9'), (117, 5, 'b10'), (120, 6, 'b11'), (123, 7, 'b12'), (126, 8, 'b13'), (129, 9, 'b14'), (132, 10, 'b15'), (135, 11, 'b16'), (138, 12, 'b17'), (141, 13, 'b18'), (144, 14, 'b19'), (147, 15, 'b20'), (150, 16, 'b21'), (153, 0, 'b22'), (156, 1, 'b23'), (159, 2, 'b24'), (162, 3, 'b25'), (165, 4, 'b26'), (168, 5, 'b27'), (171, 6, 'b28'), (174, 7, 'b0'), (177, 8, 'b1'), (180, 9, 'b2'), (183, 10, 'b3'), (186, 11, 'b4'), (189, 12, 'b5'), (192, 13, 'b6'), (195, 14, 'b7'), (198, 15, 'b8'), (201, 16, 'b9'), (204, 0, 'b10'), (207, 1, 'b11'), (210, 2, 'b12'), (213, 3, 'b13'), (216, 4, 'b14'), (219, 5, 'b15'), (222, 6, 'b16'), (225, 7, 'b17'), (228, 8, 'b18'), (231, 9, 'b19'), (234, 10, 'b20'), (237, 11, 'b21'), (240, 12, 'b22'), (243, 13, 'b23'), (246, 14, 'b24'), (249, 15, 'b25'), (252, 16, 'b26'), (255, 0, 'b27'), (258, 1, 'b28'), (261, 2, 'b0'), (264, 3, 'b1'), (267, 4, 'b2'), (270, 5, 'b3'), (273, 6, 'b4'), (276, 7, 'b5'), (279, 8, 'b6'), (282, 9, 'b7'), (285, 10, 'b8'), (288, 11, 'b9'), (291, 12, 'b10'), (294, 13, 'b11'), (297, 14, 'b12'), (300, 15, 'b13'), (303, 16, 'b14'), (306, 0, 'b15'), (309, 1, 'b16'), (312, 2, 'b17'), (315, 3, 'b18'), (318, 4, 'b19'), (321, 5, 'b20'), (324, 6, 'b21'), (327, 7, 'b22'), (330, 8, 'b23'), (333, 9, 'b24'), (336, 10, 'b25'), (339, 11, 'b26'), (342, 12, 'b27'), (345, 13, 'b28'), (348, 14, 'b0'), (351, 15, 'b1'), (354, 16, 'b2'), (357, 0, 'b3'), (360, 1, 'b4'), (363, 2, 'b5'), (366, 3, 'b6'), (369, 4, 'b7'), (372, 5, 'b8'), (375, 6, 'b9'), (378, 7, 'b10'), (381, 8, 'b11'), (384, 9, 'b12'), (387, 10, 'b13'), (390, 11, 'b14'), (393, 12, 'b15'), (396, 13, 'b16'), (399, 14, 'b17'), (402, 15, 'b18'), (405, 16, 'b19'), (408, 0, 'b20'), (411, 1, 'b21'), (414, 2, 'b22'), (417, 3, 'b23'), (420, 4, 'b24'), (423, 5, 'b25'), (426, 6, 'b26'), (429, 7, 'b27'), (432, 8, 'b28'), (435, 9, 'b0'), (438, 10, 'b1'), (441, 11, 'b2'), (444, 12, 'b3'), (447, 13, 'b4'), (450, 14, 'b5'), (453, 15, 'b6'), (456, 16, 'b7'), (459, 0, 'b8'), (462, 1, 'b9'), (465, 2, 'b10'), (468, 3, 'b11'), (471, 4, 'b12'), (474, 5, 'b13'), (477, 6, 'b14'), (480, 7, 'b15'), (483, 8, 'b16'), (486, 9, 'b17'), (489, 10, 'b18'), (492, 11, 'b19'), (495, 12, 'b20'), (498, 13, 'b21'), (501, 14, 'b22'), (504, 15, 'b23'), (507, 16, 'b24'), (510, 0, 'b25'), (513, 1, 'b26'), (516, 2, 'b27'), (519, 3, 'b28'), (522, 4, 'b0'), (525, 5, 'b1'), (528, 6, 'b2'), (531, 7, 'b3'), (534, 8, 'b4'), (537, 9, 'b5'), (540, 10, 'b6'), (543, 11, 'b7'), (546, 12, 'b8'), (549, 13, 'b9'), (552, 14, 'b10'), (555, 15, 'b11'), (558, 16, 'b12'), (561, 0, 'b13'), (564, 1, 'b14'), (567, 2, 'b15'), (570, 3, 'b16'), (573, 4, 'b17'), (576, 5, 'b18'), (579, 6, 'b19'), (582, 7, 'b20'), (585, 8, 'b21'), (588, 9, 'b22'), (591, 10, 'b23'), (594, 11, 'b24'), (597, 12, 'b25'), (600, 13, 'b26'), (603, 14, 'b27'), (606, 15, 'b28'), (609, 16, 'b0'), (612, 0, 'b1'), (615, 1, 'b2'), (618, 2, 'b3'), (621, 3, 'b4'), (624, 4, 'b5'), (627, 5, 'b6'), (630, 6, 'b7'), (633, 7, 'b8'), (636, 8, 'b9'), (639, 9, 'b10'), (642, 10, 'b11'), (645, 11, 'b12'), (648, 12, 'b13'), (651, 13, 'b14'), (654, 14, 'b15'), (657, 15, 'b16'), (660, 16, 'b17'), (663, 0, 'b18'), (666, 1, 'b19'), (669, 2, 'b20'), (672, 3, 'b21'), (675, 4, 'b22'), (678, 5, 'b23'), (681, 6, 'b24'), (684, 7, 'b25'), (687, 8, 'b26'), (690, 9, 'b27'), (693, 10, 'b28'), (696, 11, 'b0'), (699, 12, 'b1'), (702, 13, 'b2'), (705, 14, 'b3'), (708, 15, 'b4'), (711, 16, 'b5'), (714, 0, 'b6'), (717, 1, 'b7'), (720, 2, 'b8'), (723, 3, 'b9'), (726, 4, 'b10'), (729, 5, 'b11'), (732, 6, 'b12'), (735, 7, 'b13'), (738, 8, 'b14'), (741, 9, 'b15'), (744, 10, 'b16'), (747, 11, 'b17'), (750, 12, 'b18'), (753, 13, 'b19'), (756, 14, 'b20'), (759, 15, 'b21'), (762, 16, 'b22'), (765, 0, 'b23'), (768, 1, 'b24'), (771, 2, 'b25'), (774, 3, 'b26'), (777, 4, 'b27'), (780, 5, 'b28'), (783, 6, 'b0'), (786, 7, 'b1'), (789, 8, 'b2'), (792, 9, 'b3'), (795, 10, 'b4'), (798, 11, 'b5'), (801, 12, 'b6'), (804, 13, 'b7'), (807, 14, 'b8'), (810, 15, 'b9'), (813, 16, 'b10'), (816, 0, 'b11'), (819, 1, 'b12'), (822, 2, 'b13'), (825, 3, 'b14'), (828, 4, 'b15'), (831, 5, 'b16'), (834, 6, 'b17'), (837, 7, 'b18'), (840, 8, 'b19'), (843, 9, 'b20'), (846, 10, 'b21'), (849, 11, 'b22'), (852, 12, 'b23'), (855, 13, 'b24'), (858, 14, 'b25'), (861, 15, 'b26'), (864, 16, 'b27'), (867, 0, 'b28'), (870, 1, 'b0'), (873, 2, 'b1'), (876, 3, 'b2'), (879, 4, 'b3'), (882, 5, 'b4'), (885, 6, 'b5'), (888, 7, 'b6'), (891, 8, 'b7'), (894, 9, 'b8'), (897, 10, 'b9'), (900, 11, 'b10'), (903, 12, 'b11'), (906, 13, 'b12'), (909, 14, 'b13'), (912, 15, 'b14'), (915, 16, 'b15'), (918, 0, 'b16'), (921, 1, 'b17'), (924, 2, 'b18'), (927, 3, 'b19'), (930, 4, 'b20'), (933, 5, 'b21'), (936, 6, 'b22'), (939, 7, 'b23'), (942, 8, 'b24'), (945, 9, 'b25'), (948, 10, 'b26'), (951, 11, 'b27'), (954, 12, 'b28'), (957, 13, 'b0'), (960, 14, 'b1'), (963, 15, 'b2'), (966, 16, 'b3'), (969, 0, 'b4'), (972, 1, 'b5'), (975, 2, 'b6'), (978, 3, 'b7'), (981, 4, 'b8'), (984, 5, 'b9'), (987, 6, 'b10'), (990, 7, 'b11'), (993, 8, 'b12'), (996, 9, 'b13'), (999, 10, 'b14'), (1002, 11, 'b15'), (1005, 12, 'b16'), (1008, 13, 'b17'), (1011, 14, 'b18'), (1014, 15, 'b19'), (1017, 16, 'b20'), (1020, 0, 'b21'), (1023, 1, 'b22'), (1026, 2, 'b23'), (1029, 3, 'b24'), (1032, 4, 'b25'), (1035, 5, 'b26'), (1038, 6, 'b27'), (1041, 7, 'b28'), (1044, 8, 'b0'), (1047, 9, 'b1'), (1050, 10, 'b2'), (1053, 11, 'b3'), (1056, 12, 'b4'), (1059, 13, 'b5'), (1062, 14, 'b6'), (1065, 15, 'b7'), (1068, 16, 'b8'), (1071, 0, 'b9'), (1074, 1, 'b10'), (1077, 2, 'b11'), (1080, 3, 'b12'), (1083, 4, 'b13'), (1086, 5, 'b14'), (1089, 6, 'b15'), (1092, 7, 'b16'), (1095, 8, 'b17'), (1098, 9, 'b18'), (1101, 10, 'b19'), (1104, 11, 'b20'), (1107, 12, 'b21'), (1110, 13, 'b22'), (1113, 14, 'b23'), (1116, 15, 'b24'), (1119, 16, 'b25'), (1122, 0, 'b26'), (1125, 1, 'b27'), (1128, 2, 'b28'), (1131, 3, 'b0'), (1134, 4, 'b1'), (1137, 5, 'b2'), (1140, 6, 'b3'), (1143, 7, 'b4'), (1146, 8, 'b5'), (1149, 9, 'b6'), (1152, 10, 'b7'), (1155, 11, 'b8'), (1158, 12, 'b9'), (1161, 13, 'b10'), (1164, 14, 'b11'), (1167, 15, 'b12'), (1170, 16, 'b13'), (1173, 0, 'b14'), (1176, 1, 'b15'), (1179, 2, 'b16'), (1182, 3, 'b17'), (1185, 4, 'b18'), (1188, 5, 'b19'), (1191, 6, 'b20'), (1194, 7, 'b21'), (1197, 8, 'b22'), (1200, 9, 'b23'), (1203, 10, 'b24'), (1206, 11, 'b25'), (1209, 12, 'b26'), (1212, 13, 'b27'), (1215, 14, 'b28'), (1218, 15, 'b0'), (1221, 16, 'b1'), (1224, 0, 'b2'), (1227, 1, 'b3'), (1230, 2, 'b4'), (1233, 3, 'b5'), (1236, 4, 'b6'), (1239, 5, 'b7'), (1242, 6, 'b8'), (1245, 7, 'b9'), (1248, 8, 'b10'), (1251, 9, 'b11'), (1254, 10, 'b12'), (1257, 11, 'b13'), (1260, 12, 'b14'), (1263, 13, 'b15'), (1266, 14, 'b16'), (1269, 15, 'b17'), (1272, 16, 'b18'), (1275, 0, 'b19'), (1278, 1, 'b20'), (1281, 2, 'b21'), (1284, 3, 'b22'), (1287, 4, 'b23'), (1290, 5, 'b24'), (1293, 6, 'b25'), (1296, 7, 'b26'), (1299, 8, 'b27'), (1302, 9, 'b28'), (1305, 10, 'b0'), (1308, 11, 'b1'), (1311, 12, 'b2'), (1314, 13, 'b3'), (1317, 14, 'b4'), (1320, 15, 'b5'), (1323, 16, 'b6'), (1326, 0, 'b7'), (1329, 1, 'b8'), (1332, 2, 'b9'), (1335, 3, 'b10'), (1338, 4, 'b11'), (1341, 5, 'b12'), (1344, 6, 'b13'), (1347, 7, 'b14'), (1350, 8, 'b15'), (1353, 9, 'b16'), (1356, 10, 'b17'), (1359, 11, 'b18'), (1362, 12, 'b19'), (1365, 13, 'b20'), (1368, 14, 'b21'), (1371, 15, 'b22'), (1374, 16, 'b23'), (1377, 0, 'b24'), (1380, 1, 'b25'), (1383, 2, 'b26'), (1386, 3, 'b27'), (1389, 4, 'b28'), (1392, 5, 'b0'), (1395, 6, 'b1'), (1398, 7, 'b2'), (1401, 8, 'b3'), (1404, 9, 'b4'), (1407, 10, 'b5'), (1410, 11, 'b6'), (1413, 12, 'b7'), (1416, 13, 'b8'), (1419, 14, 'b9'), (1422, 15, 'b10'), (1425, 16, 'b11'), (1428, 0, 'b12'), (1431, 1, 'b13'), (1434, 2, 'b14'), (1437, 3, 'b15'), (1440, 4, 'b16'), (1443, 5, 'b17'), (1446, 6, 'b18'), (1449, 7, 'b19'), (1452, 8, 'b20'), (1455, 9, 'b21'), (1458, 10, 'b22'), (1461, 11, 'b23'), (1464, 12, 'b24'), (1467, 13, 'b25'), (1470, 14, 'b26'), (1473, 15, 'b27'), (1476, 16, 'b28'), (1479, 0, 'b0'), (1482, 1, 'b1'), (1485, 2, 'b2'), (1488, 3, 'b3'), (1491, 4, 'b4'), (1494, 5, 'b5'), (1497, 6, 'b6'), (1500, 7, 'b7'), (1503, 8, 'b8'), (1506, 9, 'b9'), (1509, 10, 'b10'), (1512, 11, 'b11'), (1515, 12, 'b12'), (1518, 13, 'b13'), (1521, 14, 'b14'), (1524, 15, 'b15'), (1527, 16, 'b16'), (1530, 0, 'b17'), (1533, 1, 'b18'), (1536, 2, 'b19'), (1539, 3, 'b20'), (1542, 4, 'b21'), (1545, 5, 'b22'), (1548, 6, 'b23'), (1551, 7, 'b24'), (1554, 8, 'b25'), (1557, 9, 'b26'), (1560, 10, 'b27'), (1563, 11, 'b28'), (1566, 12, 'b0'), (1569, 13, 'b1'), (1572, 14, 'b2'), (1575, 15, 'b3'), (1578, 16, 'b4'), (1581, 0, 'b5'), (1584, 1, 'b6'), (1587, 2, 'b7'), (1590, 3, 'b8'), (1593, 4, 'b9'), (1596, 5, 'b10'), (1599, 6, 'b11'), (1602, 7, 'b12'), (1605, 8, 'b13'), (1608, 9, 'b14'), (1611, 10, 'b15'), (1614, 11, 'b16'), (1617, 12, 'b17'), (1620, 13, 'b18'), (1623, 14, 'b19'), (1626, 15, 'b20'), (1629, 16, 'b21'), (1632, 0, 'b22'), (1635, 1, 'b23'), (1638, 2, 'b24'), (1641, 3, 'b25'), (1644, 4, 'b26'), (1647, 5, 'b27'), (1650, 6, 'b28'), (1653, 7, 'b0'), (1656, 8, 'b1'), (1659, 9, 'b2'), (1662, 10, 'b3'), (1665, 11, 'b4'), (1668, 12, 'b5'), (1671, 13, 'b6'), (1674, 14, 'b7'), (1677, 15, 'b8'), (1680, 16, 'b9'), (1683, 0, 'b10'), (1686, 1, 'b11'), (1689, 2, 'b12'), (1692, 3, 'b13'), (1695, 4, 'b14'), (1698, 5, 'b15'), (1701, 6, 'b16'), (1704, 7, 'b17'), (1707, 8, 'b18'), (1710, 9, 'b19'), (1713, 10, 'b20'), (1716, 11, 'b21'), (1719, 12, 'b22'), (1722, 13, 'b23'), (1725, 14, 'b24'), (1728, 15, 'b25'), (1731, 16, 'b26'), (1734, 0, 'b27'), (1737, 1, 'b28'), (1740, 2, 'b0'), (1743, 3, 'b1'), (1746, 4, 'b2'), (1749, 5, 'b3'), (1752, 6, 'b4'), (1755, 7, 'b5'), (1758, 8, 'b6'), (1761, 9, 'b7'), (1764, 10, 'b8'), (1767, 11, 'b9'), (1770, 12, 'b10'), (1773, 13, 'b11'), (1776, 14, 'b12'), (1779, 15, 'b13'), (1782, 16, 'b14'), (1785, 0, 'b15'), (1788, 1, 'b16'), (1791, 2, 'b17'), (1794, 3, 'b18'), (1797, 4, 'b19'), (1800, 5, 'b20'), (1803, 6, 'b21'), (1806, 7, 'b22'), (1809, 8, 'b23'), (1812, 9, 'b24'), (1815, 10, 'b25'), (1818, 11, 'b26'), (1821, 12, 'b27'), (1824, 13, 'b28'), (1827, 14, 'b0'), (1830, 15, 'b1'), (1833, 16, 'b2'), (1836, 0, 'b3'), (1839, 1, 'b4'), (1842, 2, 'b5'), (1845, 3, 'b6'), (1848, 4, 'b7'), (1851, 5, 'b8'), (1854, 6, 'b9'), (1857, 7, 'b10'), (1860, 8, 'b11'), (1863, 9, 'b12'), (1866, 10, 'b13'), (1869, 11, 'b14'), (1872, 12, 'b15'), (1875, 13, 'b16'), (1878, 14, 'b17'), (1881, 15, 'b18'), (1884, 16, 'b19'), (1887, 0, 'b20'), (1890, 1, 'b21'), (1893, 2, 'b22'), (1896, 3, 'b23'), (1899, 4, 'b24'), (1902, 5, 'b25'), (1905, 6, 'b26'), (1908, 7, 'b27'), (1911, 8, 'b28'), (1914, 9, 'b0'), (1917, 10, 'b1'), (1920, 11, 'b2'), (1923, 12, 'b3'), (1926, 13, 'b4'), (1929, 14, 'b5'), (1932, 15, 'b6'), (1935, 16, 'b7'), (1938, 0, 'b8'), (1941, 1, 'b9'), (1944, 2, 'b10'), (1947, 3, 'b11'), (1950, 4, 'b12'), (1953, 5, 'b13'), (1956, 6, 'b14'), (1959, 7, 'b15'), (1962, 8, 'b16'), (1965, 9, 'b17'), (1968, 10, 'b18'), (1971, 11, 'b19'), (1974, 12, 'b20'), (1977, 13, 'b21'), (1980, 14, 'b22'), (1983, 15, 'b23'), (1986, 16, 'b24'), (1989, 0, 'b25'), (1992, 1, 'b26'), (1995, 2, 'b27'), (1998, 3, 'b28'), (2001, 4, 'b0'), (2004, 5, 'b1'), (2007, 6, 'b2'), (2010, 7, 'b3'), (2013, 8, 'b4'), (2016, 9, 'b5'), (2019, 10, 'b6'), (2022, 11, 'b7'), (2025, 12, 'b8'), (2028, 13, 'b9'), (2031, 14, 'b10'), (2034, 15, 'b11'), (2037, 16, 'b12'), (2040, 0, 'b13'), (2043, 1, 'b14'), (2046, 2, 'b15'), (2049, 3, 'b16'), (2052, 4, 'b17'), (2055, 5, 'b18'), (2058, 6, 'b19'), (2061, 7, 'b20'), (2064, 8, 'b21'), (2067, 9, 'b22'), (2070, 10, 'b23'), (2073, 11, 'b24'), (2076, 12, 'b25'), (2079, 13, 'b26'), (2082, 14, 'b27'), (2085, 15, 'b28'), (2088, 16, 'b0'), (2091, 0, 'b1'), (2094, 1, 'b2'), (2097, 2, 'b3'), (2100, 3, 'b4'), (2103, 4, 'b5'), (2106, 5, 'b6'), (2109, 6, 'b7'), (2112, 7, 'b8'), (2115, 8, 'b9'), (2118, 9, 'b10'), (2121, 10, 'b11'), (2124, 11, 'b12'), (2127, 12, 'b13'), (2130, 13, 'b14'), (2133, 14, 'b15'), (2136, 15, 'b16'), (2139, 16, 'b17'), (2142, 0, 'b18'), (2145, 1, 'b19'), (2148, 2, 'b20'), (2151, 3, 'b21'), (2154, 4, 'b22'), (2157, 5, 'b23'), (2160, 6, 'b24'), (2163, 7, 'b25'), (2166, 8, 'b26'), (2169, 9, 'b27'), (2172, 10, 'b28'), (2175, 11, 'b0'), (2178, 12, 'b1'), (2181, 13, 'b2'), (2184, 14, 'b3'), (2187, 15, 'b4'), (2190, 16, 'b5'), (2193, 0, 'b6'), (2196, 1, 'b7'), (2199, 2, 'b8'), (2202, 3, 'b9'), (2205, 4, 'b10'), (2208, 5, 'b11'), (2211, 6, 'b12'), (2214, 7, 'b13'), (2217, 8, 'b14'), (2220, 9, 'b15'), (2223, 10, 'b16'), (2226, 11, 'b17'), (2229, 12, 'b18'), (2232, 13, 'b19'), (2235, 14, 'b20'), (2238, 15, 'b21'), (2241, 16, 'b22'), (2244, 0, 'b23'), (2247, 1, 'b24'), (2250, 2, 'b25'), (2253, 3, 'b26'), (2256, 4, 'b27'), (2259, 5, 'b28'), (2262, 6, 'b0'), (2265, 7, 'b1'), (2268, 8, 'b2'), (2271, 9, 'b3'), (2274, 10, 'b4'), (2277, 11, 'b5'), (2280, 12, 'b6'), (2283, 13, 'b7'), (2286, 14, 'b8'), (2289, 15, 'b9'), (2292, 16, 'b10'), (2295, 0, 'b11'), (2298, 1, 'b12'), (2301, 2, 'b13'), (2304, 3, 'b14'), (2307, 4, 'b15'), (2310, 5, 'b16'), (2313, 6, 'b17'), (2316, 7, 'b18'), (2319, 8, 'b19'), (2322, 9, 'b20'), (2325, 10, 'b21'), (2328, 11, 'b22'), (2331, 12, 'b23'), (2334, 13, 'b24'), (2337, 14, 'b25'), (2340, 15, 'b26'), (2343, 16, 'b27'), (2346, 0, 'b28'), (2349, 1, 'b0'), (2352, 2, 'b1'), (2355, 3, 'b2'), (2358, 4, 'b3'), (2361, 5, 'b4'), (2364, 6, 'b5'), (2367, 7, 'b6'), (2370, 8, 'b7'), (2373, 9, 'b8'), (2376, 10, 'b9'), (2379, 11, 'b10'), (2382, 12, 'b11'), (2385, 13, 'b12'), (2388, 14, 'b13'), (2391, 15, 'b14'), (2394, 16, 'b15'), (2397, 0, 'b16'), (2400, 1, 'b17'), (2403, 2, 'b18'), (2406, 3, 'b19'), (2409, 4, 'b20'), (2412, 5, 'b21'), (2415, 6, 'b22'), (2418, 7, 'b23'), (2421, 8, 'b24'), (2424, 9, 'b25'), (2427, 10, 'b26'), (2430, 11, 'b27'), (2433, 12, 'b28'), (2436, 13, 'b0'), (2439, 14, 'b1'), (2442, 15, 'b2'), (2445, 16, 'b3'), (2448, 0, 'b4'), (2451, 1, 'b5'), (2454, 2, 'b6'), (2457, 3, 'b7'), (2460, 4, 'b8'), (2463, 5, 'b9'), (2466, 6, 'b10'), (2469, 7, 'b11'), (2472, 8, 'b12'), (2475, 9, 'b13'), (2478, 10, 'b14'), (2481, 11, 'b15'), (2484, 12, 'b16'), (2487, 13, 'b17'), (2490, 14, 'b18'), (2493, 15, 'b19'), (2496, 16, 'b20'), (2499, 0, 'b21'), (2502, 1, 'b22'), (2505, 2, 'b23'), (2508, 3, 'b24'), (2511, 4, 'b25'), (2514, 5, 'b26'), (2517, 6, 'b27'), (2520, 7, 'b28'), (2523, 8, 'b0'), (2526, 9, 'b1'), (2529, 10, 'b2'), (2532, 11, 'b3'), (2535, 12, 'b4'), (2538, 13, 'b5'), (2541, 14, 'b6'), (2544, 15, 'b7'), (2547, 16, 'b8'), (2550, 0, 'b9'), (2553, 1, 'b10'), (2556, 2, 'b11'), (2559, 3, 'b12'), (2562, 4, 'b13'), (2565, 5, 'b14'), (2568, 6, 'b15'), (2571, 7, 'b16'), (2574, 8, 'b17'), (2577, 9, 'b18'), (2580, 10, 'b19'), (2583, 11, 'b20'), (2586, 12, 'b21'), (2589, 13, 'b22'), (2592, 14, 'b23'), (2595, 15, 'b24'), (2598, 16, 'b25'), (2601, 0, 'b26'), (2604, 1, 'b27'), (2607, 2, 'b28'), (2610, 3, 'b0'), (2613, 4, 'b1'), (2616, 5, 'b2'), (2619, 6, 'b3'), (2622, 7, 'b4'), (2625, 8, 'b5'), (2628, 9, 'b6'), (2631, 10, 'b7'), (2634, 11, 'b8'), (2637, 12, 'b9'), (2640, 13, 'b10'), (2643, 14, 'b11'), (2646, 15, 'b12'), (2649, 16, 'b13'), (2652, 0, 'b14'), (2655, 1, 'b15'), (2658, 2, 'b16'), (2661, 3, 'b17'), (2664, 4, 'b18'), (2667, 5, 'b19'), (2670, 6, 'b20'), (2673, 7, 'b21'), (2676, 8, 'b22'), (2679, 9, 'b23'), (2682, 10, 'b24'), (2685, 11, 'b25'), (2688, 12, 'b26'), (2691, 13, 'b27'), (2694, 14, 'b28'), (2697, 15, 'b0'), (2700, 16, 'b1'), (2703, 0, 'b2'), (2706, 1, 'b3'), (2709, 2, 'b4'), (2712, 3, 'b5'), (2715, 4, 'b6'), (2718, 5, 'b7'), (2721, 6, 'b8'), (2724, 7, 'b9'), (2727, 8, 'b10'), (2730, 9, 'b11'), (2733, 10, 'b12'), (2736, 11, 'b13'), (2739, 12, 'b14'), (2742, 13, 'b15'), (2745, 14, 'b16'), (2748, 15, 'b17'), (2751, 16, 'b18'), (2754, 0, 'b19'), (2757, 1, 'b20'), (2760, 2, 'b21'), (2763, 3, 'b22'), (2766, 4, 'b23'), (2769, 5, 'b24'), (2772, 6, 'b25'), (2775, 7, 'b26'), (2778, 8, 'b27'), (2781, 9, 'b28'), (2784, 10, 'b0'), (2787, 11, 'b1'), (2790, 12, 'b2'), (2793, 13, 'b3'), (2796, 14, 'b4'), (2799, 15, 'b5'), (2802, 16, 'b6'), (2805, 0, 'b7'), (2808, 1, 'b8'), (2811, 2, 'b9'), (2814, 3, 'b10'), (2817, 4, 'b11'), (2820, 5, 'b12'), (2823, 6, 'b13'), (2826, 7, 'b14'), (2829, 8, 'b15'), (2832, 9, 'b16'), (2835, 10, 'b17'), (2838, 11, 'b18'), (2841, 12, 'b19'), (2844, 13, 'b20'), (2847, 14, 'b21'), (2850, 15, 'b22'), (2853, 16, 'b23'), (2856, 0, 'b24'), (2859, 1, 'b25'), (2862, 2, 'b26'), (2865, 3, 'b27'), (2868, 4, 'b28'), (2871, 5, 'b0'), (2874, 6, 'b1'), (2877, 7, 'b2'), (2880, 8, 'b3'), (2883, 9, 'b4'), (2886, 10, 'b5'), (2889, 11, 'b6'), (2892, 12, 'b7'), (2895, 13, 'b8'), (2898, 14, 'b9'), (2901, 15, 'b10'), (2904, 16, 'b11'), (2907, 0, 'b12'), (2910, 1, 'b13'), (2913, 2, 'b14'), (2916, 3, 'b15'), (2919, 4, 'b16'), (2922, 5, 'b17'), (2925, 6, 'b18'), (2928, 7, 'b19'), (2931, 8, 'b20'), (2934, 9, 'b21'), (2937, 10, 'b22'), (2940, 11, 'b23'), (2943, 12, 'b24'), (2946, 13, 'b25'), (2949, 14, 'b26'), (2952, 15, 'b27'), (2955, 16, 'b28'), (2958, 0, 'b0'), (2961, 1, 'b1'), (2964, 2, 'b2'), (2967, 3, 'b3'), (2970, 4, 'b4'), (2973, 5, 'b5'), (2976, 6, 'b6'), (2979, 7, 'b7'), (2982, 8, 'b8'), (2985, 9, 'b9'), (2988, 10, 'b10'), (2991, 11, 'b11'), (2994, 12, 'b12'), (2997, 13, 'b13'), (3000, 14, 'b14'), (3003, 15, 'b15'), (3006, 16, 'b16'), (3009, 0, 'b17'), (3012, 1, 'b18'), (3015, 2, 'b19'), (3018, 3, 'b20'), (3021, 4, 'b21'), (3024, 5, 'b22'), (3027, 6, 'b23'), (3030, 7, 'b24'), (3033, 8, 'b25'), (3036, 9, 'b26'), (3039, 10, 'b27'), (3042, 11, 'b28'), (3045, 12, 'b0'), (3048, 13, 'b1'), (3051, 14, 'b2'), (3054, 15, 'b3'), (3057, 16, 'b4'), (3060, 0, 'b5'), (3063, 1, 'b6'), (3066, 2, 'b7'), (3069, 3, 'b8'), (3072, 4, 'b9'), (3075, 5, 'b10'), (3078, 6, 'b11'), (3081, 7, 'b12'), (3084, 8, 'b13'), (3087, 9, 'b14'), (3090, 10, 'b15'), (3093, 11, 'b16'), (3096, 12, 'b17'), (3099, 13, 'b18'), (3102, 14, 'b19'), (3105, 15, 'b20'), (3108, 16, 'b21'), (3111, 0, 'b22'), (3114, 1, 'b23'), (3117, 2, 'b24'), (3120, 3, 'b25'), (3123, 4, 'b26'), (3126, 5, 'b27'), (3129, 6, 'b28'), (3132, 7, 'b0'), (3135, 8, 'b1'), (3138, 9, 'b2'), (3141, 10, 'b3'), (3144, 11, 'b4'), (3147, 12, 'b5'), (3150, 13, 'b6'), (3153, 14, 'b7'), (3156, 15, 'b8'), (3159, 16, 'b9'), (3162, 0, 'b10'), (3165, 1, 'b11'), (3168, 2, 'b12'), (3171, 3, 'b13'), (3174, 4, 'b14'), (3177, 5, 'b15'), (3180, 6, 'b16'), (3183, 7, 'b17'), (3186, 8, 'b18'), (3189, 9, 'b19'), (3192, 10, 'b20'), (3195, 11, 'b21'), (3198, 12, 'b22'), (3201, 13, 'b23'), (3204, 14, 'b24'), (3207, 15, 'b25'), (3210, 16, 'b26'), (3213, 0, 'b27'), (3216, 1, 'b28'), (3219, 2, 'b0'), (3222, 3, 'b1'), (3225, 4, 'b2'), (3228, 5, 'b3'), (3231, 6, 'b4'), (3234, 7, 'b5'), (3237, 8, 'b6'), (3240, 9, 'b7'), (3243, 10, 'b8'), (3246, 11, 'b9'), (3249, 12, 'b10'), (3252, 13, 'b11'), (3255, 14, 'b12'), (3258, 15, 'b13'), (3261, 16, 'b14'), (3264, 0, 'b15'), (3267, 1, 'b16'), (3270, 2, 'b17'), (3273, 3, 'b18'), (3276, 4, 'b19'), (3279, 5, 'b20'), (3282, 6, 'b21'), (3285, 7, 'b22'), (3288, 8, 'b23'), (3291, 9, 'b24'), (3294, 10, 'b25'), (3297, 11, 'b26'), (3300, 12, 'b27'), (3303, 13, 'b28'), (3306, 14, 'b0'), (3309, 15, 'b1'), (3312, 16, 'b2'), (3315, 0, 'b3'), (3318, 1, 'b4'), (3321, 2, 'b5'), (3324, 3, 'b6'), (3327, 4, 'b7'), (3330, 5, 'b8'), (3333, 6, 'b9'), (3336, 7, 'b10'), (3339, 8, 'b11'), (3342, 9, 'b12'), (3345, 10, 'b13'), (3348, 11, 'b14'), (3351, 12, 'b15'), (3354, 13, 'b16'), (3357, 14, 'b17'), (3360, 15, 'b18'), (3363, 16, 'b19'), (3366, 0, 'b20'), (3369, 1, 'b21'), (3372, 2, 'b22'), (3375, 3, 'b23'), (3378, 4, 'b24'), (3381, 5, 'b25'), (3384, 6, 'b26'), (3387, 7, 'b27'), (3390, 8, 'b28'), (3393, 9, 'b0'), (3396, 10, 'b1'), (3399, 11, 'b2'), (3402, 12, 'b3'), (3405, 13, 'b4'), (3408, 14, 'b5'), (3411, 15, 'b6'), (3414, 16, 'b7'), (3417, 0, 'b8'), (3420, 1, 'b9'), (3423, 2, 'b10'), (3426, 3, 'b11'), (3429, 4, 'b12'), (3432, 5, 'b13'), (3435, 6, 'b14'), (3438, 7, 'b15'), (3441, 8, 'b16'), (3444, 9, 'b17'), (3447, 10, 'b18'), (3450, 11, 'b19'), (3453, 12, 'b20'), (3456, 13, 'b21'), (3459, 14, 'b22'), (3462, 15, 'b23'), (3465, 16, 'b24'), (3468, 0, 'b25'), (3471, 1, 'b26'), (3474, 2, 'b27'), (3477, 3, 'b28'), (3480, 4, 'b0'), (3483, 5, 'b1'), (3486, 6, 'b2'), (3489, 7, 'b3'), (3492, 8, 'b4'), (3495, 9, 'b5'), (3498, 10, 'b6'), (3501, 11, 'b7'), (3504, 12, 'b8'), (3507, 13, 'b9'), (3510, 14, 'b10'), (3513, 15, 'b11'), (3516, 16, 'b12'), (3519, 0, 'b13'), (3522, 1, 'b14'), (3525, 2, 'b15'), (3528, 3, 'b16'), (3531, 4, 'b17'), (3534, 5, 'b18'), (3537, 6, 'b19'), (3540, 7, 'b20'), (3543, 8, 'b21'), (3546, 9, 'b22'), (3549, 10, 'b23'), (3552, 11, 'b24'), (3555, 12, 'b25'), (3558, 13, 'b26'), (3561, 14, 'b27'), (3564, 15, 'b28'), (3567, 16, 'b0'), (3570, 0, 'b1'), (3573, 1, 'b2'), (3576, 2, 'b3'), (3579, 3, 'b4'), (3582, 4, 'b5'), (3585, 5, 'b6'), (3588, 6, 'b7'), (3591, 7, 'b8'), (3594, 8, 'b9'), (3597, 9, 'b10'), (3600, 10, 'b11'), (3603, 11, 'b12'), (3606, 12, 'b13'), (3609, 13, 'b14'), (3612, 14, 'b15'), (3615, 15, 'b16'), (3618, 16, 'b17'), (3621, 0, 'b18'), (3624, 1, 'b19'), (3627, 2, 'b20'), (3630, 3, 'b21'), (3633, 4, 'b22'), (3636, 5, 'b23'), (3639, 6, 'b24'), (3642, 7, 'b25'), (3645, 8, 'b26'), (3648, 9, 'b27'), (3651, 10, 'b28'), (3654, 11, 'b0'), (3657, 12, 'b1'), (3660, 13, 'b2'), (3663, 14, 'b3'), (3666, 15, 'b4'), (3669, 16, 'b5'), (3672, 0, 'b6'), (3675, 1, 'b7'), (3678, 2, 'b8'), (3681, 3, 'b9'), (3684, 4, 'b10'), (3687, 5, 'b11'), (3690, 6, 'b12'), (3693, 7, 'b13'), (3696, 8, 'b14'), (3699, 9, 'b15'), (3702, 10, 'b16'), (3705, 11, 'b17'), (3708, 12, 'b18'), (3711, 13, 'b19'), (3714, 14, 'b20'), (3717, 15, 'b21'), (3720, 16, 'b22'), (3723, 0, 'b23'), (3726, 1, 'b24'), (3729, 2, 'b25'), (3732, 3, 'b26'), (3735, 4, 'b27'), (3738, 5, 'b28'), (3741, 6, 'b0'), (3744, 7, 'b1'), (3747, 8, 'b2'), (3750, 9, 'b3'), (3753, 10, 'b4'), (3756, 11, 'b5'), (3759, 12, 'b6'), (3762, 13, 'b7'), (3765, 14, 'b8'), (3768, 15, 'b9'), (3771, 16, 'b10'), (3774, 0, 'b11'), (3777, 1, 'b12'), (3780, 2, 'b13'), (3783, 3, 'b14'), (3786, 4, 'b15'), (3789, 5, 'b16'), (3792, 6, 'b17'), (3795, 7, 'b18'), (3798, 8, 'b19'), (3801, 9, 'b20'), (3804, 10, 'b21'), (3807, 11, 'b22'), (3810, 12, 'b23'), (3813, 13, 'b24'), (3816, 14, 'b25'), (3819, 15, 'b26'), (3822, 16, 'b27'), (3825, 0, 'b28'), (3828, 1, 'b0'), (3831, 2, 'b1'), (3834, 3, 'b2'), (3837, 4, 'b3'), (3840, 5, 'b4'), (3843, 6, 'b5'), (3846, 7, 'b6'), (3849, 8, 'b7'), (3852, 9, 'b8'), (3855, 10, 'b9'), (3858, 11, 'b10'), (3861, 12, 'b11'), (3864, 13, 'b12'), (3867, 14, 'b13'), (3870, 15, 'b14'), (3873, 16, 'b15'), (3876, 0, 'b16'), (3879, 1, 'b17'), (3882, 2, 'b18'), (3885, 3, 'b19'), (3888, 4, 'b20'), (3891, 5, 'b21'), (3894, 6, 'b22'), (3897, 7, 'b23'), (3900, 8, 'b24'), (3903, 9, 'b25'), (3906, 10, 'b26'), (3909, 11, 'b27'), (3912, 12, 'b28'), (3915, 13, 'b0'), (3918, 14, 'b1'), (3921, 15, 'b2'), (3924, 16, 'b3'), (3927, 0, 'b4'), (3930, 1, 'b5'), (3933, 2, 'b6'), (3936, 3, 'b7'), (3939, 4, 'b8'), (3942, 5, 'b9'), (3945, 6, 'b10'), (3948, 7, 'b11'), (3951, 8, 'b12'), (3954, 9, 'b13'), (3957, 10, 'b14'), (3960, 11, 'b15'), (3963, 12, 'b16'), (3966, 13, 'b17'), (3969, 14, 'b18'), (3972, 15, 'b19'), (3975, 16, 'b20'), (3978, 0, 'b21'), (3981, 1, 'b22'), (3984, 2, 'b23'), (3987, 3, 'b24'), (3990, 4, 'b25'), (3993, 5, 'b26'), (3996, 6, 'b27'), (3999, 7, 'b28'), (4002, 8, 'b0'), (4005, 9, 'b1'), (4008, 10, 'b2'), (4011, 11, 'b3'), (4014, 12, 'b4'), (4017, 13, 'b5'), (4020, 14, 'b6'), (4023, 15, 'b7'), (4026, 16, 'b8'), (4029, 0, 'b9'), (4032, 1, 'b10'), (4035, 2, 'b11'), (4038, 3, 'b12'), (4041, 4, 'b13'), (4044, 5, 'b14'), (4047, 6, 'b15'), (4050, 7, 'b16'), (4053, 8, 'b17'), (4056, 9, 'b18'), (4059, 10, 'b19'), (4062, 11, 'b20'), (4065, 12, 'b21'), (4068, 13, 'b22'), (4071, 14, 'b23'), (4074, 15, 'b24'), (4077, 16, 'b25'), (4080, 0, 'b26'), (4083, 1, 'b27'), (4086, 2, 'b28'), (4089, 3, 'b0'), (4092, 4, 'b1'), (4095, 5, 'b2'), (4098, 6, 'b3'), (4101, 7, 'b4'), (4104, 8, 'b5'), (4107, 9, 'b6'), (4110, 10, 'b7'), (4113, 11, 'b8'), (4116, 12, 'b9'), (4119, 13, 'b10'), (4122, 14, 'b11'), (4125, 15, 'b12'), (4128, 16, 'b13'), (4131, 0, 'b14'), (4134, 1, 'b15'), (4137, 2, 'b16'), (4140, 3, 'b17'), (4143, 4, 'b18'), (4146, 5, 'b19'), (4149, 6, 'b20'), (4152, 7, 'b21'), (4155, 8, 'b22'), (4158, 9, 'b23'), (4161, 10, 'b24'), (4164, 11, 'b25'), (4167, 12, 'b26'), (4170, 13, 'b27'), (4173, 14, 'b28'), (4176, 15, 'b0'), (4179, 16, 'b1'), (4182, 0, 'b2'), (4185, 1, 'b3'), (4188, 2, 'b4'), (4191, 3, 'b5'), (4194, 4, 'b6'), (4197, 5, 'b7'), (4200, 6, 'b8'), (4203, 7, 'b9'), (4206, 8, 'b10'), (4209, 9, 'b11'), (4212, 10, 'b12'), (4215, 11, 'b13'), (4218, 12, 'b14'), (4221, 13, 'b15'), (4224, 14, 'b16'), (4227, 15, 'b17'), (4230, 16, 'b18'), (4233, 0, 'b19'), (4236, 1, 'b20'), (4239, 2, 'b21'), (4242, 3, 'b22'), (4245, 4, 'b23'), (4248, 5, 'b24'), (4251, 6, 'b25'), (4254, 7, 'b26'), (4257, 8, 'b27'), (4260, 9, 'b28'), (4263, 10, 'b0'), (4266, 11, 'b1'), (4269, 12, 'b2'), (4272, 13, 'b3'), (4275, 14, 'b4'), (4278, 15, 'b5'), (4281, 16, 'b6'), (4284, 0, 'b7'), (4287, 1, 'b8'), (4290, 2, 'b9'), (4293, 3, 'b10'), (4296, 4, 'b11'), (4299, 5, 'b12'), (4302, 6, 'b13'), (4305, 7, 'b14'), (4308, 8, 'b15'), (4311, 9, 'b16'), (4314, 10, 'b17'), (4317, 11, 'b18'), (4320, 12, 'b19'), (4323, 13, 'b20'), (4326, 14, 'b21'), (4329, 15, 'b22'), (4332, 16, 'b23'), (4335, 0, 'b24'), (4338, 1, 'b25'), (4341, 2, 'b26'), (4344, 3, 'b27'), (4347, 4, 'b28'), (4350, 5, 'b0'), (4353, 6, 'b1'), (4356, 7, 'b2'), (4359, 8, 'b3'), (4362, 9, 'b4'), (4365, 10, 'b5'), (4368, 11, 'b6'), (4371, 12, 'b7'), (4374, 13, 'b8'), (4377, 14, 'b9'), (4380, 15, 'b10'), (4383, 16, 'b11'), (4386, 0, 'b12'), (4389, 1, 'b13'), (4392, 2, 'b14'), (4395, 3, 'b15'), (4398, 4, 'b16'), (4401, 5, 'b17'), (4404, 6, 'b18'), (4407, 7, 'b19'), (4410, 8, 'b20'), (4413, 9, 'b21'), (4416, 10, 'b22'), (4419, 11, 'b23'), (4422, 12, 'b24'), (4425, 13, 'b25'), (4428, 14, 'b26'), (4431, 15, 'b27'), (4434, 16, 'b28'), (4437, 0, 'b0'), (4440, 1, 'b1'), (4443, 2, 'b2'), (4446, 3, 'b3'), (4449, 4, 'b4'), (4452, 5, 'b5'), (4455, 6, 'b6'), (4458, 7, 'b7'), (4461, 8, 'b8'), (4464, 9, 'b9'), (4467, 10, 'b10'), (4470, 11, 'b11'), (4473, 12, 'b12'), (4476, 13, 'b13'), (4479, 14, 'b14'), (4482, 15, 'b15'), (4485, 16, 'b16'), (4488, 0, 'b17'), (4491, 1, 'b18'), (4494, 2, 'b19'), (4497, 3, 'b20');
+CREATE INDEX RB ON R(B);
+CREATE TABLE S(X INT, Y VARCHAR, Z INT, PRIMARY KEY(X, Y)) WITH (bloom_filter=on);
+INSERT INTO S VALUES (0, 'b0', 0), (1, 'b1', 1), (2, 'b2', 2), (3, 'b3', 3), (4, 'b4', 4), (5, 'b5', 5), (6, 'b6', 6), (7, 'b7', 7), (8, 'b8', 8), (9, 'b9', 9), (10, 'b10', 10), (11, 'b11', 11), (12, 'b12', 12), (13, 'b13', 13), (14, 'b14', 14), (15, 'b15', 15), (16, 'b16', 16), (17, 'b17', 17), (18, 'b18', 18), (19, 'b19', 19), (20, 'b20', 20), (21, 'b21', 21), (22, 'b22', 22), (23, 'b23', 23), (24, 'b24', 24), (25, 'b25', 25), (26, 'b26', 26), (27, 'b27', 27), (28, 'b28', 28), (29, 'b0', 29), (30, 'b1', 30), (31, 'b2', 31), (32, 'b3', 32), (33, 'b4', 33), (34, 'b5', 34), (35, 'b6', 35), (36, 'b7', 36), (37, 'b8', 37), (38, 'b9', 38), (39, 'b10', 39), (0, 'b11', 40), (1, 'b12', 41), (2, 'b13', 42), (3, 'b14', 43), (4, 'b15', 44), (5, 'b16', 45), (6, 'b17', 46), (7, 'b18', 47), (8, 'b19', 48), (9, 'b20', 49), (10, 'b21', 50), (11, 'b22', 51), (12, 'b23', 52), (13, 'b24', 53), (14, 'b25', 54), (15, 'b26', 55), (16, 'b27', 56), (17, 'b28', 57), (18, 'b0', 58), (19, 'b1', 59), (20, 'b2', 60), (21, 'b3', 61), (22, 'b4', 62), (23, 'b5', 63), (24, 'b6', 64), (25, 'b7', 65), (26, 'b8', 66), (27, 'b9', 67), (28, 'b10', 68), (29, 'b11', 69), (30, 'b12', 70), (31, 'b13', 71), (32, 'b14', 72), (33, 'b15', 73), (34, 'b16', 74), (35, 'b17', 75), (36, 'b18', 76), (37, 'b19', 77), (38, 'b20', 78), (39, 'b21', 79), (0, 'b22', 80), (1, 'b23', 81), (2, 'b24', 82), (3, 'b25', 83), (4, 'b26', 84), (5, 'b27', 85), (6, 'b28', 86), (7, 'b0', 87), (8, 'b1', 88), (9, 'b2', 89), (10, 'b3', 90), (11, 'b4', 91), (12, 'b5', 92), (13, 'b6', 93), (14, 'b7', 94), (15, 'b8', 95), (16, 'b9', 96), (17, 'b10', 97), (18, 'b11', 98), (19, 'b12', 99), (20, 'b13', 100), (21, 'b14', 101), (22, 'b15', 102), (23, 'b16', 103), (24, 'b17', 104), (25, 'b18', 105), (26, 'b19', 106), (27, 'b20', 107), (28, 'b21', 108), (29, 'b22', 109), (30, 'b23', 110), (31, 'b24', 111), (32, 'b25', 112), (33, 'b26', 113), (34, 'b27', 114), (35, 'b28', 115), (36, 'b0', 116), (37, 'b1', 117), (38, 'b2', 118), (39, 'b3', 119), (0, 'b4', 120), (1, 'b5', 121), (2, 'b6', 122), (3, 'b7', 123), (4, 'b8', 124), (5, 'b9', 125), (6, 'b10', 126), (7, 'b11', 127), (8, 'b12', 128), (9, 'b13', 129), (10, 'b14', 130), (11, 'b15', 131), (12, 'b16', 132), (13, 'b17', 133), (14, 'b18', 134), (15, 'b19', 135), (16, 'b20', 136), (17, 'b21', 137), (18, 'b22', 138), (19, 'b23', 139), (20, 'b24', 140), (21, 'b25', 141), (22, 'b26', 142), (23, 'b27', 143), (24, 'b28', 144), (25, 'b0', 145), (26, 'b1', 146), (27, 'b2', 147), (28, 'b3', 148), (29, 'b4', 149), (30, 'b5', 150), (31, 'b6', 151), (32, 'b7', 152), (33, 'b8', 153), (34, 'b9', 154), (35, 'b10', 155), (36, 'b11', 156), (37, 'b12', 157), (38, 'b13', 158), (39, 'b14', 159), (0, 'b15', 160), (1, 'b16', 161), (2, 'b17', 162), (3, 'b18', 163), (4, 'b19', 164), (5, 'b20', 165), (6, 'b21', 166), (7, 'b22', 167), (8, 'b23', 168), (9, 'b24', 169), (10, 'b25', 170), (11, 'b26', 171), (12, 'b27', 172), (13, 'b28', 173), (14, 'b0', 174), (15, 'b1', 175), (16, 'b2', 176), (17, 'b3', 177), (18, 'b4', 178), (19, 'b5', 179), (20, 'b6', 180), (21, 'b7', 181), (22, 'b8', 182), (23, 'b9', 183), (24, 'b10', 184), (25, 'b11', 185), (26, 'b12', 186), (27, 'b13', 187), (28, 'b14', 188), (29, 'b15', 189), (30, 'b16', 190), (31, 'b17', 191), (32, 'b18', 192), (33, 'b19', 193), (34, 'b20', 194), (35, 'b21', 195), (36, 'b22', 196), (37, 'b23', 197), (38, 'b24', 198), (39, 'b25', 199), (0, 'b26', 200), (1, 'b27', 201), (2, 'b28', 202), (3, 'b0', 203), (4, 'b1', 204), (5, 'b2', 205), (6, 'b3', 206), (7, 'b4', 207), (8, 'b5', 208), (9, 'b6', 209), (10, 'b7', 210), (11, 'b8', 211), (12, 'b9', 212), (13, 'b10', 213), (14, 'b11', 214), (15, 'b12', 215), (16, 'b13', 216), (17, 'b14', 217), (18, 'b15', 218), (19, 'b16', 219), (20, 'b17', 220), (21, 'b18', 221), (22, 'b19', 222), (23, 'b20', 223), (24, 'b21', 224), (25, 'b22', 225), (26, 'b23', 226), (27, 'b24', 227), (28, 'b25', 228), (29, 'b26', 229), (30, 'b27', 230), (31, 'b28', 231), (32, 'b0', 232), (33, 'b1', 233), (34, 'b2', 234), (35, 'b3', 235), (36, 'b4', 236), (37, 'b5', 237), (38, 'b6', 238), (39, 'b7', 239), (0, 'b8', 240), (1, 'b9', 241), (2, 'b10', 242), (3, 'b11', 243), (4, 'b12', 244), (5, 'b13', 245), (6, 'b14', 246), (7, 'b15', 247), (8, 'b16', 248), (9, 'b17', 249), (10, 'b18', 250), (11, 'b19', 251), (12, 'b20', 252), (13, 'b21', 253), (14, 'b22', 254), (15, 'b23', 255), (16, 'b24', 256), (17, 'b25', 257), (18, 'b26', 258), (19, 'b27', 259), (20, 'b28', 260), (21, 'b0', 261), (22, 'b1', 262), (23, 'b2', 263), (24, 'b3', 264), (25, 'b4', 265), (26, 'b5', 266), (27, 'b6', 267), (28, 'b7', 268), (29, 'b8', 269), (30, 'b9', 270), (31, 'b10', 271), (32, 'b11', 272), (33, 'b12', 273), (34, 'b13', 274), (35, 'b14', 275), (36, 'b15', 276), (37, 'b16', 277), (38, 'b17', 278), (39, 'b18', 279), (0, 'b19', 280), (1, 'b20', 281), (2, 'b21', 282), (3, 'b22', 283), (4, 'b23', 284), (5, 'b24', 285), (6, 'b25', 286), (7, 'b26', 287), (8, 'b27', 288), (9, 'b28', 289), (10, 'b0', 290), (11, 'b1', 291), (12, 'b2', 292), (13, 'b3', 293), (14, 'b4', 294), (15, 'b5', 295), (16, 'b6', 296), (17, 'b7', 297), (18, 'b8', 298), (19, 'b9', 299);
+SELECT * FROM R WHERE A = 300;
+SELECT * FROM R WHERE A = 301;
+SELECT A, C FROM R WHERE B = 5 AND A < 300;
+SELECT * FROM R WHERE B = 99;
+SELECT * FROM S WHERE X = 3 AND Y = 'b3';
+SELECT * FROM S WHERE X = 3 AND Y = 'b4';
+SELECT R.A, S.Z FROM R, S WHERE R.A = S.X AND R.C = S.Y;
+DELETE FROM R WHERE A < 600;
+SELECT * FROM R WHERE A = 300;
+INSERT INTO R VALUES (301, 100, 'new'), (300, 101, 'again');
+SELECT * FROM R WHERE A = 301 OR A = 300;
+SELECT * FROM R WHERE B = 100;
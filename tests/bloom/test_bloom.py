@@ -0,0 +1,73 @@
+import pytest
+import subprocess
+
+from ddb.db import DatabaseManager
+from ddb.session import Session
+from ddb.metadata import BloomFilter
+
+testcase_dir = "tests/bloom/"
+T = 1
+
+@pytest.fixture
+def session():
+    subprocess.run(['make', 'clean'], check=True)
+    dbm = DatabaseManager(
+        db_dir = DatabaseManager.DEFAULT_DB_DIR,
+        tmp_dir = DatabaseManager.DEFAULT_TMP_DIR
+    )
+    s = Session(dbm)
+    yield s
+    subprocess.run(['make', 'clean'], check=True) # these tests commit, so don't leave their tables behind
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_bloom_{t_id}")
+
+def test_rebuild_rolled_back(run):
+    # a transaction that deletes a key and then adds enough keys to rebuild the filter (from the keys it sees) rolls back;
+    # the deleted key is still in the index, so the filter must still let it through:
+    for r in run('SET AUTOCOMMIT OFF;' +
+                 'CREATE TABLE R(A INT, B INT, PRIMARY KEY(A)) WITH (bloom_filter=on);' +
+                 'INSERT INTO R VALUES ' + ', '.join(f'({i}, {i})' for i in range(10)) + ';' +
+                 'COMMIT;' +
+                 'DELETE FROM R WHERE A = 5;' +
+                 'INSERT INTO R VALUES ' + ', '.join(f'({i}, {i})' for i in range(100, 1200)) + ';' +
+                 'ROLLBACK;'):
+        assert r.error is None, r.error_details
+    r, = run('SELECT * FROM R WHERE A = 5;')
+    assert r.error is None and r.response.startswith('SELECT 1'), r.response
+    r, = run('INSERT INTO R VALUES (5, 0);')
+    assert r.error is not None, 'duplicate primary key accepted'
+
+def test_rebuild_committed(run):
+    # once the transaction that rebuilt the filter commits, the rebuilt filter is used (and maintained) by others:
+    for r in run('SET AUTOCOMMIT OFF;' +
+                 'CREATE TABLE R(A INT, B INT, PRIMARY KEY(A)) WITH (bloom_filter=on);' +
+                 'INSERT INTO R VALUES ' + ', '.join(f'({i}, {i})' for i in range(1100)) + ';' +
+                 'COMMIT;' +
+                 'INSERT INTO R VALUES (5000, 0);' +
+                 'COMMIT;'):
+        assert r.error is None, r.error_details
+    for key in (0, 1099, 5000):
+        r, = run(f'SELECT * FROM R WHERE A = {key};')
+        assert r.error is None and r.response.startswith('SELECT 1'), r.response
+    r, = run('SELECT * FROM R WHERE A = 1100;')
+    assert r.error is None and r.response.startswith('SELECT 0'), r.response
+
+@pytest.mark.parametrize("bloom_filter", ["on", "off"])
+def test_filter_consulted(run, monkeypatch, bloom_filter):
+    # only a table created with Bloom filters has lookups checked against them:
+    probes = list()
+    may_contain = BloomFilter.may_contain
+    def counting_may_contain(self, key_bytes):
+        probes.append(key_bytes)
+        return may_contain(self, key_bytes)
+    monkeypatch.setattr(BloomFilter, 'may_contain', counting_may_contain)
+    *_, show, r = run(f'CREATE TABLE R(A INT, B INT, PRIMARY KEY(A)) WITH (bloom_filter={bloom_filter});' +
+                      'INSERT INTO R VALUES ' + ', '.join(f'({i}, {i})' for i in range(10)) + ';' +
+                      'SHOW TABLES;' +
+                      'SELECT * FROM R WHERE A = 50;')
+    assert all(r.error is None for r in (show, r))
+    assert ('[bloom filter]' in show.response) == (bloom_filter == 'on')
+    assert r.response.startswith('SELECT 0')
+    assert (len(probes) > 0) == (bloom_filter == 'on')
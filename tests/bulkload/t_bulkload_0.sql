@@ -0,0 +1,17 @@
+CREATE TABLE R(K INT, A INT, B VARCHAR, PRIMARY KEY(K));
+INSERT INTO R VALUES (0, 0, 'b0'), (2, 1, 'b1'), (4, 2, 'b2'), (6, 3, 'b3'), (8, 4, 'b4'), (10, 5, 'b5'), (12, 6, 'b6'), (14, 7, 'b0'), (16, 8, 'b1'), (18, 9, 'b2'), (20, 10, 'b3'), (22, 11, 'b4'), (24, 12, 'b5'), (26, 0, 'b6'), (28, 1, 'b0'), (30, 2, 'b1'), (32, 3, 'b2'), (34, 4, 'b3'), (36, 5, 'b4'), (38, 6, 'b5'), (40, 7, 'b6'), (42, 8, 'b0'), (44, 9, 'b1'), (46, 10, 'b2'), (48, 11, 'b3'), (50, 12, 'b4'), (52, 0, 'b5'), (54, 1, 'b6'), (56, 2, 'b0'), (58, 3, 'b1'), (60, 4, 'b2'), (62, 5, 'b3'), (64, 6, 'b4'), (66, 7, 'b5'), (68, 8, 'b6'), (70, 9, 'b0'), (72, 10, 'b1'), (74, 11, 'b2'), (76, 12, 'b3'), (78, 0, 'b4'), (80, 1, 'b5'), (82, 2, 'b6'), (84, 3, 'b0'), (86, 4, 'b1'), (88, 5, 'b2'), (90, 6, 'b3'), (92, 7, 'b4'), (94, 8, 'b5'), (96, 9, 'b6'), (98, 10, 'b0'), (100, 11, 'b1'), (102, 12, 'b2'), (104, 0, 'b3'), (106, 1, 'b4'), (108, 2, 'b5'), (110, 3, 'b6'), (112, 4, 'b0'), (114, 5, 'b1'), (116, 6, 'b2'), (118, 7, 'b3'), (120, 8, 'b4'), (122, 9, 'b5'), (124, 10, 'b6'), (126, 11, 'b0'), (128, 12, 'b1'), (130, 0, 'b2'), (132, 1, 'b3'), (134, 2, 'b4'), (136, 3, 'b5'), (138, 4, 'b6'), (140, 5, 'b0'), (142, 6, 'b1'), (144, 7, 'b2'), (146, 8, 'b3'), (148, 9, 'b4'), (150, 10, 'b5'), (152, 11, 'b6'), (154, 12, 'b0'), (156, 0, 'b1'), (158, 1, 'b2'), (160, 2, 'b3'), (162, 3, 'b4'), (164, 4, 'b5'), (166, 5, 'b6'), (168, 6, 'b0'), (170, 7, 'b1'), (172, 8, 'b2'), (174, 9, 'b3'), (176, 10, 'b4'), (178, 11, 'b5'), (180, 12, 'b6'), (182, 0, 'b0'), (184, 1, 'b1'), (186, 2, 'b2'), (188, 3, 'b3'), (190, 4, 'b4'), (192, 5, 'b5'), (194, 6, 'b6'), (196, 7, 'b0'), (198, 8, 'b1'), (200, 9, 'b2'), (202, 10, 'b3'), (204, 11, 'b4'), (206, 12, 'b5'), (208, 0, 'b6'), (210, 1, 'b0'), (212, 2, 'b1'), (214, 3, 'b2'), (216, 4, 'b3'), (218, 5, 'b4'), (220, 6, 'b5'), (222, 7, 'b6'), (224, 8, 'b0'), (226, 9, 'b1'), (228, 10, 'b2'), (230, 11, 'b3'), (232, 12, 'b4'), (234, 0, 'b5'), (236, 1, 'b6'), (238, 2, 'b0'), (240, 3, 'b1'), (242, 4, 'b2'), (244, 5, 'b3'), (246, 6, 'b4'), (248, 7, 'b5'), (250, 8, 'b6'), (252, 9, 'b0'), (254, 10, 'b1'), (256, 11, 'b2'), (258, 12, 'b3'), (260, 0, 'b4'), (262, 1, 'b5'), (264, 2, 'b6'), (266, 3, 'b0'), (268, 4, 'b1'), (270, 5, 'b2'), (272, 6, 'b3'), (274, 7, 'b4'), (276, 8, 'b5'), (278, 9, 'b6'), (280, 10, 'b0'), (282, 11, 'b1'), (284, 12, 'b2'), (286, 0, 'b3'), (288, 1, 'b4'), (290, 2, 'b5'), (292, 3, 'b6'), (294, 4, 'b0'), (296, 5, 'b1'), (298, 6, 'b2'), (300, 7, 'b3'), (302, 8, 'b4'), (304, 9, 'b5'), (306, 10, 'b6'), (308, 11, 'b0'), (310, 12, 'b1'), (312, 0, 'b2'), (314, 1, 'b3'), (316, 2, 'b4'), (318, 3, 'b5'), (320, 4, 'b6'), (322, 5, 'b0'), (324, 6, 'b1'), (326, 7, 'b2'), (328, 8, 'b3'), (330, 9, 'b4'), (332, 10, 'b5'), (334, 11, 'b6'), (336, 12, 'b0'), (338, 0, 'b1'), (340, 1, 'b2'), (342, 2, 'b3'), (344, 3, 'b4'), (346, 4, 'b5'), (348, 5, 'b6'), (350, 6, 'b0'), (352, 7, 'b1'), (354, 8, 'b2'), (356, 9, 'b3'), (358, 10, 'b4'), (360, 11, 'b5'), (362, 12, 'b6'), (364, 0, 'b0'), (366, 1, 'b1'), (368, 2, 'b2'), (370, 3, 'b3'), (372, 4, 'b4'), (374, 5, 'b5'), (376, 6, 'b6'), (378, 7, 'b0'), (380, 8, 'b1'), (382, 9, 'b2'), (384, 10, 'b3'), (386, 11, 'b4'), (388, 12, 'b5'), (390, 0, 'b6'), (392, 1, 'b0'), (394, 2, 'b1'), (396, 3, 'b2'), (398, 4, 'b3'), (400, 5, 'b4'), (402, 6, 'b5'), (404, 7, 'b6'), (406, 8, 'b0'), (408, 9, 'b1'), (410, 10, 'b2'), (412, 11, 'b3'), (414, 12, 'b4'), (416, 0, 'b5'), (418, 1, 'b6'), (420, 2, 'b0'), (422, 3, 'b1'), (424, 4, 'b2'), (426, 5, 'b3'), (428, 6, 'b4'), (430, 7, 'b5'), (432, 8, 'b6'), (434, 9, 'b0'), (436, 10, 'b1'), (438, 11, 'b2'), (440, 12, 'b3'), (442, 0, 'b4'), (444, 1, 'b5'), (446, 2, 'b6'), (448, 3, 'b0'), (450, 4, 'b1'), (452, 5, 'b2'), (454, 6, 'b3'), (456, 7, 'b4'), (458, 8, 'b5'), (460, 9, 'b6'), (462, 10, 'b0'), (464, 11, 'b1'), (466, 12, 'b2'), (468, 0, 'b3'), (470, 1, 'b4'), (472, 2, 'b5'), (474, 3, 'b6'), (476, 4, 'b0'), (478, 5, 'b1'), (480, 6, 'b2'), (482, 7, 'b3'), (484, 8, 'b4'), (486, 9, 'b5'), (488, 10, 'b6'), (490, 11, 'b0'), (492, 12, 'b1'), (494, 0, 'b2'), (496, 1, 'b3'), (498, 2, 'b4'), (500, 3, 'b5'), (502, 4, 'b6'), (504, 5, 'b0'), (506, 6, 'b1'), (508, 7, 'b2'), (510, 8, 'b3'), (512, 9, 'b4'), (514, 10, 'b5'), (516, 11, 'b6'), (518, 12, 'b0'), (520, 0, 'b1'), (522, 1, 'b2'), (524, 2, 'b3'), (526, 3, 'b4'), (528, 4, 'b5'), (530, 5, 'b6'), (532, 6, 'b0'), (534, 7, 'b1'), (536, 8, 'b2'), (538, 9, 'b3'), (540, 10, 'b4'), (542, 11, 'b5'), (544, 12, 'b6'), (546, 0, 'b0'), (548, 1, 'b1'), (550, 2, 'b2'), (552, 3, 'b3'), (554, 4, 'b4'), (556, 5, 'b5'), (558, 6, 'b6'), (560, 7, 'b0'), (562, 8, 'b1'), (564, 9, 'b2'), (566, 10, 'b3'), (568, 11, 'b4'), (570, 12, 'b5'), (572, 0, 'b6'), (574, 1, 'b0'), (576, 2, 'b1'), (578, 3, 'b2'), (580, 4, 'b3'), (582, 5, 'b4'), (584, 6, 'b5'), (586, 7, 'b6'), (588, 8, 'b0'), (590, 9, 'b1'), (592, 10, 'b2'), (594, 11, 'b3'), (596, 12, 'b4'), (598, 0, 'b5'), (600, 1, 'b6'), (602, 2, 'b0'), (604, 3, 'b1'), (606, 4, 'b2'), (608, 5, 'b3'), (610, 6, 'b4'), (612, 7, 'b5'), (614, 8, 'b6'), (616, 9, 'b0'), (618, 10, 'b1'), (620, 11, 'b2'), (622, 12, 'b3'), (624, 0, 'b4'), (626, 1, 'b5'), (628, 2, 'b6'), (630, 3, 'b0'), (632, 4, 'b1'), (634, 5, 'b2'), (636, 6, 'b3'), (638, 7, 'b4'), (640, 8, 'b5'), (642, 9, 'b6'), (644, 10, 'b0'), (646, 11, 'b1'), (648, 12, 'b2'), (650, 0, 'b3'), (652, 1, 'b4'), (654, 2, 'b5'), (656, 3, 'b6'), (658, 4, 'b0'), (660, 5, 'b1'), (662, 6, 'b2'), (664, 7, 'b3'), (666, 8, 'b4'), (668, 9, 'b5'), (670, 10, 'b6'), (672, 11, 'b0'), (674, 12, 'b1'), (676, 0, 'b2'), (678, 1, 'b3'), (680, 2, 'b4'), (682, 3, 'b5'), (684, 4, 'b6'), (686, 5, 'b0'), (688, 6, 'b1'), (690, 7, 'b2'), (692, 8, 'b3'), (694, 9, 'b4'), (696, 10, 'b5'), (698, 11, 'b6'), (700, 12, 'b0'), (702, 0, 'b1'), (704, 1, 'b2'), (706, 2, 'b3'), (708, 3, 'b4'), (710, 4, 'b5'), (712, 5, 'b6'), (714, 6, 'b0'), (716, 7, 'b1'), (718, 8, 'b2'), (720, 9, 'b3'), (722, 10, 'b4'), (724, 11, 'b5'), (726, 12, 'b6'), (728, 0, 'b0'), (730, 1, 'b1'), (732, 2, 'b2'), (734, 3, 'b3'), (736, 4, 'b4'), (738, 5, 'b5'), (740, 6, 'b6'), (742, 7, 'b0'), (744, 8, 'b1'), (746, 9, 'b2'), (748, 10, 'b3'), (750, 11, 'b4'), (752, 12, 'b5'), (754, 0, 'b6'), (756, 1, 'b0'), (758, 2, 'b1'), (760, 3, 'b2'), (762, 4, 'b3'), (764, 5, 'b4'), (766, 6, 'b5'), (768, 7, 'b6'), (770, 8, 'b0'), (772, 9, 'b1'), (774, 10, 'b2'), (776, 11, 'b3'), (778, 12, 'b4'), (780, 0, 'b5'), (782, 1, 'b6'), (784, 2, 'b0'), (786, 3, 'b1'), (788, 4, 'b2'), (790, 5, 'b3'), (792, 6, 'b4'), (794, 7, 'b5'), (796, 8, 'b6'), (798, 9, 'b0'), (800, 10, 'b1'), (802, 11, 'b2'), (804, 12, 'b3'), (806, 0, 'b4'), (808, 1, 'b5'), (810, 2, 'b6'), (812, 3, 'b0'), (814, 4, 'b1'), (816, 5, 'b2'), (818, 6, 'b3'), (820, 7, 'b4'), (822, 8, 'b5'), (824, 9, 'b6'), (826, 10, 'b0'), (828, 11, 'b1'), (830, 12, 'b2'), (832, 0, 'b3'), (834, 1, 'b4'), (836, 2, 'b5'), (838, 3, 'b6'), (840, 4, 'b0'), (842, 5, 'b1'), (844, 6, 'b2'), (846, 7, 'b3'), (848, 8, 'b4'), (850, 9, 'b5'), (852, 10, 'b6'), (854, 11, 'b0'), (856, 12, 'b1'), (858, 0, 'b2'), (860, 1, 'b3'), (862, 2, 'b4'), (864, 3, 'b5'), (866, 4, 'b6'), (868, 5, 'b0'), (870, 6, 'b1'), (872, 7, 'b2'), (874, 8, 'b3'), (876, 9, 'b4'), (878, 10, 'b5'), (880, 11, 'b6'), (882, 12, 'b0'), (884, 0, 'b1'), (886, 1, 'b2'), (888, 2, 'b3'), (890, 3, 'b4'), (892, 4, 'b5'), (894, 5, 'b6'), (896, 6, 'b0'), (898, 7, 'b1'), (900, 8, 'b2'), (902, 9, 'b3'), (904, 10, 'b4'), (906, 11, 'b5'), (908, 12, 'b6'), (910, 0, 'b0'), (912, 1, 'b1'), (914, 2, 'b2'), (916, 3, 'b3'), (918, 4, 'b4'), (920, 5, 'b5'), (922, 6, 'b6'), (924, 7, 'b0'), (926, 8, 'b1'), (928, 9, 'b2'), (930, 10, 'b3'), (932, 11, 'b4'), (934, 12, 'b5'), (936, 0, 'b6'), (938, 1, 'b0'), (940, 2, 'b1'), (942, 3, 'b2'), (944, 4, 'b3'), (946, 5, 'b4'), (948, 6, 'b5'), (950, 7, 'b6'), (952, 8, 'b0'), (954, 9, 'b1'), (956, 10, 'b2'), (958, 11, 'b3'), (960, 12, 'b4'), (962, 0, 'b5'), (964, 1, 'b6'), (966, 2, 'b0'), (968, 3, 'b1'), (970, 4, 'b2'), (972, 5, 'b3'), (974, 6, 'b4'), (976, 7, 'b5'), (978, 8, 'b6'), (980, 9, 'b0'), (982, 10, 'b1'), (984, 11, 'b2'), (986, 12, 'b3'), (988, 0, 'b4'), (990, 1, 'b5'), (992, 2, 'b6'), (994, 3, 'b0'), (996, 4, 'b1'), (998, 5, 'b2'), (1000, 6, 'b3'), (1002, 7, 'b4'), (1004, 8, 'b5'), (1006, 9, 'b6'), (1008, 10, 'b0'), (1010, 11, 'b1'), (1012, 12, 'b2'), (1014, 0, 'b3'), (1016, 1, 'b4'), (1018, 2, 'b5'), (1020, 3, 'b6'), (1022, 4, 'b0'), (1024, 5, 'b1'), (1026, 6, 'b2'), (1028, 7, 'b3'), (1030, 8, 'b4'), (1032, 9, 'b5'), (1034, 10, 'b6'), (1036, 11, 'b0'), (1038, 12, 'b1'), (1040, 0, 'b2'), (1042, 1, 'b3'), (1044, 2, 'b4'), (1046, 3, 'b5'), (1048, 4, 'b6'), (1050, 5, 'b0'), (1052, 6, 'b1'), (1054, 7, 'b2'), (1056, 8, 'b3'), (1058, 9, 'b4'), (1060, 10, 'b5'), (1062, 11, 'b6'), (1064, 12, 'b0'), (1066, 0, 'b1'), (1068, 1, 'b2'), (1070, 2, 'b3'), (1072, 3, 'b4'), (1074, 4, 'b5'), (1076, 5, 'b6'), (1078, 6, 'b0'), (1080, 7, 'b1'), (1082, 8, 'b2'), (1084, 9, 'b3'), (1086, 10, 'b4'), (1088, 11, 'b5'), (1090, 12, 'b6'), (1092, 0, 'b0'), (1094, 1, 'b1'), (1096, 2, 'b2'), (1098, 3, 'b3'), (1100, 4, 'b4'), (1102, 5, 'b5'), (1104, 6, 'b6'), (1106, 7, 'b0'), (1108, 8, 'b1'), (1110, 9, 'b2'), (1112, 10, 'b3'), (1114, 11, 'b4'), (1116, 12, 'b5'), (1118, 0, 'b6'), (1120, 1, 'b0'), (1122, 2, 'b1'), (1124, 3, 'b2'), (1126, 4, 'b3'), (1128, 5, 'b4'), (1130, 6, 'b5'), (1132, 7, 'b6'), (1134, 8, 'b0'), (1136, 9, 'b1'), (1138, 10, 'b2'), (1140, 11, 'b3'), (1142, 12, 'b4'), (1144, 0, 'b5'), (1146, 1, 'b6'), (1148, 2, 'b0'), (1150, 3, 'b1'), (1152, 4, 'b2'), (1154, 5, 'b3'), (1156, 6, 'b4'), (1158, 7, 'b5'), (1160, 8, 'b6'), (1162, 9, 'b0'), (1164, 10, 'b1'), (1166, 11, 'b2'), (1168, 12, 'b3'), (1170, 0, 'b4'), (1172, 1, 'b5'), (1174, 2, 'b6'), (1176, 3, 'b0'), (1178, 4, 'b1'), (1180, 5, 'b2'), (1182, 6, 'b3'), (1184, 7, 'b4'), (1186, 8, 'b5'), (1188, 9, 'b6'), (1190, 10, 'b0'), (1192, 11, 'b1'), (1194, 12, 'b2'), (1196, 0, 'b3'), (1198, 1, 'b4'), (1200, 2, 'b5'), (1202, 3, 'b6'), (1204, 4, 'b0'), (1206, 5, 'b1'), (1208, 6, 'b2'), (1210, 7, 'b3'), (1212, 8, 'b4'), (1214, 9, 'b5'), (1216, 10, 'b6'), (1218, 11, 'b0'), (1220, 12, 'b1'), (1222, 0, 'b2'), (1224, 1, 'b3'), (1226, 2, 'b4'), (1228, 3, 'b5'), (1230, 4, 'b6'), (1232, 5, 'b0'), (1234, 6, 'b1'), (1236, 7, 'b2'), (1238, 8, 'b3'), (1240, 9, 'b4'), (1242, 10, 'b5'), (1244, 11, 'b6'), (1246, 12, 'b0'), (1248, 0, 'b1'), (1250, 1, 'b2'), (1252, 2, 'b3'), (1254, 3, 'b4'), (1256, 4, 'b5'), (1258, 5, 'b6'), (1260, 6, 'b0'), (1262, 7, 'b1'), (1264, 8, 'b2'), (1266, 9, 'b3'), (1268, 10, 'b4'), (1270, 11, 'b5'), (1272, 12, 'b6'), (1274, 0, 'b0'), (1276, 1, 'b1'), (1278, 2, 'b2'), (1280, 3, 'b3'), (1282, 4, 'b4'), (1284, 5, 'b5'), (1286, 6, 'b6'), (1288, 7, 'b0'), (1290, 8, 'b1'), (1292, 9, 'b2'), (1294, 10, 'b3'), (1296, 11, 'b4'), (1298, 12, 'b5'), (1300, 0, 'b6'), (1302, 1, 'b0'), (1304, 2, 'b1'), (1306, 3, 'b2'), (1308, 4, 'b3'), (1310, 5, 'b4'), (1312, 6, 'b5'), (1314, 7, 'b6'), (1316, 8, 'b0'), (1318, 9, 'b1'), (1320, 10, 'b2'), (1322, 11, 'b3'), (1324, 12, 'b4'), (1326, 0, 'b5'), (1328, 1, 'b6'), (1330, 2, 'b0'), (1332, 3, 'b1'), (1334, 4, 'b2'), (1336, 5, 'b3'), (1338, 6, 'b4'), (1340, 7, 'b5'), (1342, 8, 'b6'), (1344, 9, 'b0'), (1346, 10, 'b1'), (1348, 11, 'b2'), (1350, 12, 'b3'), (1352, 0, 'b4'), (1354, 1, 'b5'), (1356, 2, 'b6'), (1358, 3, 'b0'), (1360, 4, 'b1'), (1362, 5, 'b2'), (1364, 6, 'b3'), (1366, 7, 'b4'), (1368, 8, 'b5'), (1370, 9, 'b6'), (1372, 10, 'b0'), (1374, 11, 'b1'), (1376, 12, 'b2'), (1378, 0, 'b3'), (1380, 1, 'b4'), (1382, 2, 'b5'), (1384, 3, 'b6'), (1386, 4, 'b0'), (1388, 5, 'b1'), (1390, 6, 'b2'), (1392, 7, 'b3'), (1394, 8, 'b4'), (1396, 9, 'b5'), (1398, 10, 'b6'), (1400, 11, 'b0'), (1402, 12, 'b1'), (1404, 0, 'b2'), (1406, 1, 'b3'), (1408, 2, 'b4'), (1410, 3, 'b5'), (1412, 4, 'b6'), (1414, 5, 'b0'), (1416, 6, 'b1'), (1418, 7, 'b2'), (1420, 8, 'b3'), (1422, 9, 'b4'), (1424, 10, 'b5'), (1426, 11, 'b6'), (1428, 12, 'b0'), (1430, 0, 'b1'), (1432, 1, 'b2'), (1434, 2, 'b3'), (1436, 3, 'b4'), (1438, 4, 'b5'), (1440, 5, 'b6'), (1442, 6, 'b0'), (1444, 7, 'b1'), (1446, 8, 'b2'), (1448, 9, 'b3'), (1450, 10, 'b4'), (1452, 11, 'b5'), (1454, 12, 'b6'), (1456, 0, 'b0'), (1458, 1, 'b1'), (1460, 2, 'b2'), (1462, 3, 'b3'), (1464, 4, 'b4'), (1466, 5, 'b5'), (1468, 6, 'b6'), (1470, 7, 'b0'), (1472, 8, 'b1'), (1474, 9, 'b2'), (1476, 10, 'b3'), (1478, 11, 'b4'), (1480, 12, 'b5'), (1482, 0, 'b6'), (1484, 1, 'b0'), (1486, 2, 'b1'), (1488, 3, 'b2'), (1490, 4, 'b3'), (1492, 5, 'b4'), (1494, 6, 'b5'), (1496, 7, 'b6'), (1498, 8, 'b0'), (1500, 9, 'b1'), (1502, 10, 'b2'), (1504, 11, 'b3'), (1506, 12, 'b4'), (1508, 0, 'b5'), (1510, 1, 'b6'), (1512, 2, 'b0'), (1514, 3, 'b1'), (1516, 4, 'b2'), (1518, 5, 'b3'), (1520, 6, 'b4'), (1522, 7, 'b5'), (1524, 8, 'b6'), (1526, 9, 'b0'), (1528, 10, 'b1'), (1530, 11, 'b2'), (1532, 12, 'b3'), (1534, 0, 'b4'), (1536, 1, 'b5'), (1538, 2, 'b6'), (1540, 3, 'b0'), (1542, 4, 'b1'), (1544, 5, 'b2'), (1546, 6, 'b3'), (1548, 7, 'b4'), (1550, 8, 'b5'), (1552, 9, 'b6'), (1554, 10, 'b0'), (1556, 11, 'b1'), (1558, 12, 'b2'), (1560, 0, 'b3'), (1562, 1, 'b4'), (1564, 2, 'b5'), (1566, 3, 'b6'), (1568, 4, 'b0'), (1570, 5, 'b1'), (1572, 6, 'b2'), (1574, 7, 'b3'), (1576, 8, 'b4'), (1578, 9, 'b5'), (1580, 10, 'b6'), (1582, 11, 'b0'), (1584, 12, 'b1'), (1586, 0, 'b2'), (1588, 1, 'b3'), (1590, 2, 'b4'), (1592, 3, 'b5'), (1594, 4, 'b6'), (1596, 5, 'b0'), (1598, 6, 'b1'), (1600, 7, 'b2'), (1602, 8, 'b3'), (1604, 9, 'b4'), (1606, 10, 'b5'), (1608, 11, 'b6'), (1610, 12, 'b0'), (1612, 0, 'b1'), (1614, 1, 'b2'), (1616, 2, 'b3'), (1618, 3, 'b4'), (1620, 4, 'b5'), (1622, 5, 'b6'), (1624, 6, 'b0'), (1626, 7, 'b1'), (1628, 8, 'b2'), (1630, 9, 'b3'), (1632, 10, 'b4'), (1634, 11, 'b5'), (1636, 12, 'b6'), (1638, 0, 'b0'), (1640, 1, 'b1'), (1642, 2, 'b2'), (1644, 3, 'b3'), (1646, 4, 'b4'), (1648, 5, 'b5'), (1650, 6, 'b6'), (1652, 7, 'b0'), (1654, 8, 'b1'), (1656, 9, 'b2'), (1658, 10, 'b3'), (1660, 11, 'b4'), (1662, 12, 'b5'), (1664, 0, 'b6'), (1666, 1, 'b0'), (1668, 2, 'b1'), (1670, 3, 'b2'), (1672, 4, 'b3'), (1674, 5, 'b4'), (1676, 6, 'b5'), (1678, 7, 'b6'), (1680, 8, 'b0'), (1682, 9, 'b1'), (1684, 10, 'b2'), (1686, 11, 'b3'), (1688, 12, 'b4'), (1690, 0, 'b5'), (1692, 1, 'b6'), (1694, 2, 'b0'), (1696, 3, 'b1'), (1698, 4, 'b2'), (1700, 5, 'b3'), (1702, 6, 'b4'), (1704, 7, 'b5'), (1706, 8, 'b6'), (1708, 9, 'b0'), (1710, 10, 'b1'), (1712, 11, 'b2'), (1714, 12, 'b3'), (1716, 0, 'b4'), (1718, 1, 'b5'), (1720, 2, 'b6'), (1722, 3, 'b0'), (1724, 4, 'b1'), (1726, 5, 'b2'), (1728, 6, 'b3'), (1730, 7, 'b4'), (1732, 8, 'b5'), (1734, 9, 'b6'), (1736, 10, 'b0'), (1738, 11, 'b1'), (1740, 12, 'b2'), (1742, 0, 'b3'), (1744, 1, 'b4'), (1746, 2, 'b5'), (1748, 3, 'b6'), (1750, 4, 'b0'), (1752, 5, 'b1'), (1754, 6, 'b2'), (1756, 7, 'b3'), (1758, 8, 'b4'), (1760, 9, 'b5'), (1762, 10, 'b6'), (1764, 11, 'b0'), (1766, 12, 'b1'), (1768, 0, 'b2'), (1770, 1, 'b3'), (1772, 2, 'b4'), (1774, 3, 'b5'), (1776, 4, 'b6'), (1778, 5, 'b0'), (1780, 6, 'b1'), (1782, 7, 'b2'), (1784, 8, 'b3'), (1786, 9, 'b4'), (1788, 10, 'b5'), (1790, 11, 'b6'), (1792, 12, 'b0'), (1794, 0, 'b1'), (1796, 1, 'b2'), (1798, 2, 'b3'), (1800, 3, 'b4'), (1802, 4, 'b5'), (1804, 5, 'b6'), (1806, 6, 'b0'), (1808, 7, 'b1'), (1810, 8, 'b2'), (1812, 9, 'b3'), (1814, 10, 'b4'), (1816, 11, 'b5'), (1818, 12, 'b6'), (1820, 0, 'b0'), (1822, 1, 'b1'), (1824, 2, 'b2'), (1826, 3, 'b3'), (1828, 4, 'b4'), (1830, 5, 'b5'), (1832, 6, 'b6'), (1834, 7, 'b0'), (1836, 8, 'b1'), (1838, 9, 'b2'), (1840, 10, 'b3'), (1842, 11, 'b4'), (1844, 12, 'b5'), (1846, 0, 'b6'), (1848, 1, 'b0'), (1850, 2, 'b1'), (1852, 3, 'b2'), (1854, 4, 'b3'), (1856, 5, 'b4'), (1858, 6, 'b5'), (1860, 7, 'b6'), (1862, 8, 'b0'), (1864, 9, 'b1'), (1866, 10, 'b2'), (1868, 11, 'b3'), (1870, 12, 'b4'), (1872, 0, 'b5'), (1874, 1, 'b6'), (1876, 2, 'b0'), (1878, 3, 'b1'), (1880, 4, 'b2'), (1882, 5, 'b3'), (1884, 6, 'b4'), (1886, 7, 'b5'), (1888, 8, 'b6'), (1890, 9, 'b0'), (1892, 10, 'b1'), (1894, 11, 'b2'), (1896, 12, 'b3'), (1898, 0, 'b4'), (1900, 1, 'b5'), (1902, 2, 'b6'), (1904, 3, 'b0'), (1906, 4, 'b1'), (1908, 5, 'b2'), (1910, 6, 'b3'), (1912, 7, 'b4'), (1914, 8, 'b5'), (1916, 9, 'b6'), (1918, 10, 'b0'), (1920, 11, 'b1'), (1922, 12, 'b2'), (1924, 0, 'b3'), (1926, 1, 'b4'), (1928, 2, 'b5'), (1930, 3, 'b6'), (1932, 4, 'b0'), (1934, 5, 'b1'), (1936, 6, 'b2'), (1938, 7, 'b3'), (1940, 8, 'b4'), (1942, 9, 'b5'), (1944, 10, 'b6'), (1946, 11, 'b0'), (1948, 12, 'b1'), (1950, 0, 'b2'), (1952, 1, 'b3'), (1954, 2, 'b4'), (1956, 3, 'b5'), (1958, 4, 'b6'), (1960, 5, 'b0'), (1962, 6, 'b1'), (1964, 7, 'b2'), (1966, 8, 'b3'), (1968, 9, 'b4'), (1970, 10, 'b5'), (1972, 11, 'b6'), (1974, 12, 'b0'), (1976, 0, 'b1'), (1978, 1, 'b2'), (1980, 2, 'b3'), (1982, 3, 'b4'), (1984, 4, 'b5'), (1986, 5, 'b6'), (1988, 6, 'b0'), (1990, 7, 'b1'), (1992, 8, 'b2'), (1994, 9, 'b3'), (1996, 10, 'b4'), (1998, 11, 'b5'), (2000, 12, 'b6'), (2002, 0, 'b0'), (2004, 1, 'b1'), (2006, 2, 'b2'), (2008, 3, 'b3'), (2010, 4, 'b4'), (2012, 5, 'b5'), (2014, 6, 'b6'), (2016, 7, 'b0'), (2018, 8, 'b1'), (2020, 9, 'b2'), (2022, 10, 'b3'), (2024, 11, 'b4'), (2026, 12, 'b5'), (2028, 0, 'b6'), (2030, 1, 'b0'), (2032, 2, 'b1'), (2034, 3, 'b2'), (2036, 4, 'b3'), (2038, 5, 'b4'), (2040, 6, 'b5'), (2042, 7, 'b6'), (2044, 8, 'b0'), (2046, 9, 'b1'), (2048, 10, 'b2'), (2050, 11, 'b3'), (2052, 12, 'b4'), (2054, 0, 'b5'), (2056, 1, 'b6'), (2058, 2, 'b0'), (2060, 3, 'b1'), (2062, 4, 'b2'), (2064, 5, 'b3'), (2066, 6, 'b4'), (2068, 7, 'b5'), (2070, 8, 'b6'), (2072, 9, 'b0'), (2074, 10, 'b1'), (2076, 11, 'b2'), (2078, 12, 'b3'), (2080, 0, 'b4'), (2082, 1, 'b5'), (2084, 2, 'b6'), (2086, 3, 'b0'), (2088, 4, 'b1'), (2090, 5, 'b2'), (2092, 6, 'b3'), (2094, 7, 'b4'), (2096, 8, 'b5'), (2098, 9, 'b6'), (2100, 10, 'b0'), (2102, 11, 'b1'), (2104, 12, 'b2'), (2106, 0, 'b3'), (2108, 1, 'b4'), (2110, 2, 'b5'), (2112, 3, 'b6'), (2114, 4, 'b0'), (2116, 5, 'b1'), (2118, 6, 'b2'), (2120, 7, 'b3'), (2122, 8, 'b4'), (2124, 9, 'b5'), (2126, 10, 'b6'), (2128, 11, 'b0'), (2130, 12, 'b1'), (2132, 0, 'b2'), (2134, 1, 'b3'), (2136, 2, 'b4'), (2138, 3, 'b5'), (2140, 4, 'b6'), (2142, 5, 'b0'), (2144, 6, 'b1'), (2146, 7, 'b2'), (2148, 8, 'b3'), (2150, 9, 'b4'), (2152, 10, 'b5'), (2154, 11, 'b6'), (2156, 12, 'b0'), (2158, 0, 'b1'), (2160, 1, 'b2'), (2162, 2, 'b3'), (2164, 3, 'b4'), (2166, 4, 'b5'), (2168, 5, 'b6'), (2170, 6, 'b0'), (2172, 7, 'b1'), (2174, 8, 'b2'), (2176, 9, 'b3'), (2178, 10, 'b4'), (2180, 11, 'b5'), (2182, 12, 'b6'), (2184, 0, 'b0'), (2186, 1, 'b1'), (2188, 2, 'b2'), (2190, 3, 'b3'), (2192, 4, 'b4'), (2194, 5, 'b5'), (2196, 6, 'b6'), (2198, 7, 'b0'), (2200, 8, 'b1'), (2202, 9, 'b2'), (2204, 10, 'b3'), (2206, 11, 'b4'), (2208, 12, 'b5'), (2210, 0, 'b6'), (2212, 1, 'b0'), (2214, 2, 'b1'), (2216, 3, 'b2'), (2218, 4, 'b3'), (2220, 5, 'b4'), (2222, 6, 'b5'), (2224, 7, 'b6'), (2226, 8, 'b0'), (2228, 9, 'b1'), (2230, 10, 'b2'), (2232, 11, 'b3'), (2234, 12, 'b4'), (2236, 0, 'b5'), (2238, 1, 'b6'), (2240, 2, 'b0'), (2242, 3, 'b1'), (2244, 4, 'b2'), (2246, 5, 'b3'), (2248, 6, 'b4'), (2250, 7, 'b5'), (2252, 8, 'b6'), (2254, 9, 'b0'), (2256, 10, 'b1'), (2258, 11, 'b2'), (2260, 12, 'b3'), (2262, 0, 'b4'), (2264, 1, 'b5'), (2266, 2, 'b6'), (2268, 3, 'b0'), (2270, 4, 'b1'), (2272, 5, 'b2'), (2274, 6, 'b3'), (2276, 7, 'b4'), (2278, 8, 'b5'), (2280, 9, 'b6'), (2282, 10, 'b0'), (2284, 11, 'b1'), (2286, 12, 'b2'), (2288, 0, 'b3'), (2290, 1, 'b4'), (2292, 2, 'b5'), (2294, 3, 'b6'), (2296, 4, 'b0'), (2298, 5, 'b1'), (2300, 6, 'b2'), (2302, 7, 'b3'), (2304, 8, 'b4'), (2306, 9, 'b5'), (2308, 10, 'b6'), (2310, 11, 'b0'), (2312, 12, 'b1'), (2314, 0, 'b2'), (2316, 1, 'b3'), (2318, 2, 'b4'), (2320, 3, 'b5'), (2322, 4, 'b6'), (2324, 5, 'b0'), (2326, 6, 'b1'), (2328, 7, 'b2'), (2330, 8, 'b3'), (2332, 9, 'b4'), (2334, 10, 'b5'), (2336, 11, 'b6'), (2338, 12, 'b0'), (2340, 0, 'b1'), (2342, 1, 'b2'), (2344, 2, 'b3'), (2346, 3, 'b4'), (2348, 4, 'b5'), (2350, 5, 'b6'), (2352, 6, 'b0'), (2354, 7, 'b1'), (2356, 8, 'b2'), (2358, 9, 'b3'), (2360, 10, 'b4'), (2362, 11, 'b5'), (2364, 12, 'b6'), (2366, 0, 'b0'), (2368, 1, 'b1'), (2370, 2, 'b2'), (2372, 3, 'b3'), (2374, 4, 'b4'), (2376, 5, 'b5'), (2378, 6, 'b6'), (2380, 7, 'b0'), (2382, 8, 'b1'), (2384, 9, 'b2'), (2386, 10, 'b3'), (2388, 11, 'b4'), (2390, 12, 'b5'), (2392, 0, 'b6'), (2394, 1, 'b0'), (2396, 2, 'b1'), (2398, 3, 'b2'), (2400, 4, 'b3'), (2402, 5, 'b4'), (2404, 6, 'b5'), (2406, 7, 'b6'), (2408, 8, 'b0'), (2410, 9, 'b1'), (2412, 10, 'b2'), (2414, 11, 'b3'), (2416, 12, 'b4'), (2418, 0, 'b5'), (2420, 1, 'b6'), (2422, 2, 'b0'), (2424, 3, 'b1'), (2426, 4, 'b2'), (2428, 5, 'b3'), (2430, 6, 'b4'), (2432, 7, 'b5'), (2434, 8, 'b6'), (2436, 9, 'b0'), (2438, 10, 'b1'), (2440, 11, 'b2'), (2442, 12, 'b3'), (2444, 0, 'b4'), (2446, 1, 'b5'), (2448, 2, 'b6'), (2450, 3, 'b0'), (2452, 4, 'b1'), (2454, 5, 'b2'), (2456, 6, 'b3'), (2458, 7, 'b4'), (2460, 8, 'b5'), (2462, 9, 'b6'), (2464, 10, 'b0'), (2466, 11, 'b1'), (2468, 12, 'b2'), (2470, 0, 'b3'), (2472, 1, 'b4'), (2474, 2, 'b5'), (2476, 3, 'b6'), (2478, 4, 'b0'), (2480, 5, 'b1'), (2482, 6, 'b2'), (2484, 7, 'b3'), (2486, 8, 'b4'), (2488, 9, 'b5'), (2490, 10, 'b6'), (2492, 11, 'b0'), (2494, 12, 'b1'), (2496, 0, 'b2'), (2498, 1, 'b3'), (2500, 2, 'b4'), (2502, 3, 'b5'), (2504, 4, 'b6'), (2506, 5, 'b0'), (2508, 6, 'b1'), (2510, 7, 'b2'), (2512, 8, 'b3'), (2514, 9, 'b4'), (2516, 10, 'b5'), (2518, 11, 'b6'), (2520, 12, 'b0'), (2522, 0, 'b1'), (2524, 1, 'b2'), (2526, 2, 'b3'), (2528, 3, 'b4'), (2530, 4, 'b5'), (2532, 5, 'b6'), (2534, 6, 'b0'), (2536, 7, 'b1'), (2538, 8, 'b2'), (2540, 9, 'b3'), (2542, 10, 'b4'), (2544, 11, 'b5'), (2546, 12, 'b6'), (2548, 0, 'b0'), (2550, 1, 'b1'), (2552, 2, 'b2'), (2554, 3, 'b3'), (2556, 4, 'b4'), (2558, 5, 'b5'), (2560, 6, 'b6'), (2562, 7, 'b0'), (2564, 8, 'b1'), (2566, 9, 'b2'), (2568, 10, 'b3'), (2570, 11, 'b4'), (2572, 12, 'b5'), (2574, 0, 'b6'), (2576, 1, 'b0'), (2578, 2, 'b1'), (2580, 3, 'b2'), (2582, 4, 'b3'), (2584, 5, 'b4'), (2586, 6, 'b5'), (2588, 7, 'b6'), (2590, 8, 'b0'), (2592, 9, 'b1'), (2594, 10, 'b2'), (2596, 11, 'b3'), (2598, 12, 'b4'), (2600, 0, 'b5'), (2602, 1, 'b6'), (2604, 2, 'b0'), (2606, 3, 'b1'), (2608, 4, 'b2'), (2610, 5, 'b3'), (2612, 6, 'b4'), (2614, 7, 'b5'), (2616, 8, 'b6'), (2618, 9, 'b0'), (2620, 10, 'b1'), (2622, 11, 'b2'), (2624, 12, 'b3'), (2626, 0, 'b4'), (2628, 1, 'b5'), (2630, 2, 'b6'), (2632, 3, 'b0'), (2634, 4, 'b1'), (2636, 5, 'b2'), (2638, 6, 'b3'), (2640, 7, 'b4'), (2642, 8, 'b5'), (2644, 9, 'b6'), (2646, 10, 'b0'), (2648, 11, 'b1'), (2650, 12, 'b2'), (2652, 0, 'b3'), (2654, 1, 'b4'), (2656, 2, 'b5'), (2658, 3, 'b6'), (2660, 4, 'b0'), (2662, 5, 'b1'), (2664, 6, 'b2'), (2666, 7, 'b3'), (2668, 8, 'b4'), (2670, 9, 'b5'), (2672, 10, 'b6'), (2674, 11, 'b0'), (2676, 12, 'b1'), (2678, 0, 'b2'), (2680, 1, 'b3'), (2682, 2, 'b4'), (2684, 3, 'b5'), (2686, 4, 'b6'), (2688, 5, 'b0'), (2690, 6, 'b1'), (2692, 7, 'b2'), (2694, 8, 'b3'), (2696, 9, 'b4'), (2698, 10, 'b5'), (2700, 11, 'b6'), (2702, 12, 'b0'), (2704, 0, 'b1'), (2706, 1, 'b2'), (2708, 2, 'b3'), (2710, 3, 'b4'), (2712, 4, 'b5'), (2714, 5, 'b6'), (2716, 6, 'b0'), (2718, 7, 'b1'), (2720, 8, 'b2'), (2722, 9, 'b3'), (2724, 10, 'b4'), (2726, 11, 'b5'), (2728, 12, 'b6'), (2730, 0, 'b0'), (2732, 1, 'b1'), (2734, 2, 'b2'), (2736, 3, 'b3'), (2738, 4, 'b4'), (2740, 5, 'b5'), (2742, 6, 'b6'), (2744, 7, 'b0'), (2746, 8, 'b1'), (2748, 9, 'b2'), (2750, 10, 'b3'), (2752, 11, 'b4'), (2754, 12, 'b5'), (2756, 0, 'b6'), (2758, 1, 'b0'), (2760, 2, 'b1'), (2762, 3, 'b2'), (2764, 4, 'b3'), (2766, 5, 'b4'), (2768, 6, 'b5'), (2770, 7, 'b6'), (2772, 8, 'b0'), (2774, 9, 'b1'), (2776, 10, 'b2'), (2778, 11, 'b3'), (2780, 12, 'b4'), (2782, 0, 'b5'), (2784, 1, 'b6'), (2786, 2, 'b0'), (2788, 3, 'b1'), (2790, 4, 'b2'), (2792, 5, 'b3'), (2794, 6, 'b4'), (2796, 7, 'b5'), (2798, 8, 'b6'), (2800, 9, 'b0'), (2802, 10, 'b1'), (2804, 11, 'b2'), (2806, 12, 'b3'), (2808, 0, 'b4'), (2810, 1, 'b5'), (2812, 2, 'b6'), (2814, 3, 'b0'), (2816, 4, 'b1'), (2818, 5, 'b2'), (2820, 6, 'b3'), (2822, 7, 'b4'), (2824, 8, 'b5'), (2826, 9, 'b6'), (2828, 10, 'b0'), (2830, 11, 'b1'), (2832, 12, 'b2'), (2834, 0, 'b3'), (2836, 1, 'b4'), (2838, 2, 'b5'), (2840, 3, 'b6'), (2842, 4, 'b0'), (2844, 5, 'b1'), (2846, 6, 'b2'), (2848, 7, 'b3'), (2850, 8, 'b4'), (2852, 9, 'b5'), (2854, 10, 'b6'), (2856, 11, 'b0'), (2858, 12, 'b1'), (2860, 0, 'b2'), (2862, 1, 'b3'), (2864, 2, 'b4'), (2866, 3, 'b5'), (2868, 4, 'b6'), (2870, 5, 'b0'), (2872, 6, 'b1'), (2874, 7, 'b2'), (2876, 8, 'b3'), (2878, 9, 'b4'), (2880, 10, 'b5'), (2882, 11, 'b6'), (2884, 12, 'b0'), (2886, 0, 'b1'), (2888, 1, 'b2'), (2890, 2, 'b3'), (2892, 3, 'b4'), (2894, 4, 'b5'), (2896, 5, 'b6'), (2898, 6, 'b0'), (2900, 7, 'b1'), (2902, 8, 'b2'), (2904, 9, 'b3'), (2906, 10, 'b4'), (2908, 11, 'b5'), (2910, 12, 'b6'), (2912, 0, 'b0'), (2914, 1, 'b1'), (2916, 2, 'b2'), (2918, 3, 'b3'), (2920, 4, 'b4'), (2922, 5, 'b5'), (2924, 6, 'b6'), (2926, 7, 'b0'), (2928, 8, 'b1'), (2930, 9, 'b2'), (2932, 10, 'b3'), (2934, 11, 'b4'), (2936, 12, 'b5'), (2938, 0, 'b6'), (2940, 1, 'b0'), (2942, 2, 'b1'), (2944, 3, 'b2'), (2946, 4, 'b3'), (2948, 5, 'b4'), (2950, 6, 'b5'), (2952, 7, 'b6'), (2954, 8, 'b0'), (2956, 9, 'b1'), (2958, 10, 'b2'), (2960, 11, 'b3'), (2962, 12, 'b4'), (2964, 0, 'b5'), (2966, 1, 'b6'), (2968, 2, 'b0'), (2970, 3, 'b1'), (2972, 4, 'b2'), (2974, 5, 'b3'), (2976, 6, 'b4'), (2978, 7, 'b5'), (2980, 8, 'b6'), (2982, 9, 'b0'), (2984, 10, 'b1'), (2986, 11, 'b2'), (2988, 12, 'b3'), (2990, 0, 'b4'), (2992, 1, 'b5'), (2994, 2, 'b6'), (2996, 3, 'b0'), (2998, 4, 'b1');
+INSERT INTO R VALUES (3001, 4, 'c0'), (2995, 1, 'c2'), (2989, 9, 'c4'), (2983, 6, 'c1'), (2977, 3, 'c3'), (2971, 0, 'c0'), (2965, 8, 'c2'), (2959, 5, 'c4'), (2953, 2, 'c1'), (2947, 10, 'c3'), (2941, 7, 'c0'), (2935, 4, 'c2'), (2929, 1, 'c4'), (2923, 9, 'c1'), (2917, 6, 'c3'), (2911, 3, 'c0'), (2905, 0, 'c2'), (2899, 8, 'c4'), (2893, 5, 'c1'), (2887, 2, 'c3'), (2881, 10, 'c0'), (2875, 7, 'c2'), (2869, 4, 'c4'), (2863, 1, 'c1'), (2857, 9, 'c3'), (2851, 6, 'c0'), (2845, 3, 'c2'), (2839, 0, 'c4'), (2833, 8, 'c1'), (2827, 5, 'c3'), (2821, 2, 'c0'), (2815, 10, 'c2'), (2809, 7, 'c4'), (2803, 4, 'c1'), (2797, 1, 'c3'), (2791, 9, 'c0'), (2785, 6, 'c2'), (2779, 3, 'c4'), (2773, 0, 'c1'), (2767, 8, 'c3'), (2761, 5, 'c0'), (2755, 2, 'c2'), (2749, 10, 'c4'), (2743, 7, 'c1'), (2737, 4, 'c3'), (2731, 1, 'c0'), (2725, 9, 'c2'), (2719, 6, 'c4'), (2713, 3, 'c1'), (2707, 0, 'c3'), (2701, 8, 'c0'), (2695, 5, 'c2'), (2689, 2, 'c4'), (2683, 10, 'c1'), (2677, 7, 'c3'), (2671, 4, 'c0'), (2665, 1, 'c2'), (2659, 9, 'c4'), (2653, 6, 'c1'), (2647, 3, 'c3'), (2641, 0, 'c0'), (2635, 8, 'c2'), (2629, 5, 'c4'), (2623, 2, 'c1'), (2617, 10, 'c3'), (2611, 7, 'c0'), (2605, 4, 'c2'), (2599, 1, 'c4'), (2593, 9, 'c1'), (2587, 6, 'c3'), (2581, 3, 'c0'), (2575, 0, 'c2'), (2569, 8, 'c4'), (2563, 5, 'c1'), (2557, 2, 'c3'), (2551, 10, 'c0'), (2545, 7, 'c2'), (2539, 4, 'c4'), (2533, 1, 'c1'), (2527, 9, 'c3'), (2521, 6, 'c0'), (2515, 3, 'c2'), (2509, 0, 'c4'), (2503, 8, 'c1'), (2497, 5, 'c3'), (2491, 2, 'c0'), (2485, 10, 'c2'), (2479, 7, 'c4'), (2473, 4, 'c1'), (2467, 1, 'c3'), (2461, 9, 'c0'), (2455, 6, 'c2'), (2449, 3, 'c4'), (2443, 0, 'c1'), (2437, 8, 'c3'), (2431, 5, 'c0'), (2425, 2, 'c2'), (2419, 10, 'c4'), (2413, 7, 'c1'), (2407, 4, 'c3'), (2401, 1, 'c0'), (2395, 9, 'c2'), (2389, 6, 'c4'), (2383, 3, 'c1'), (2377, 0, 'c3'), (2371, 8, 'c0'), (2365, 5, 'c2'), (2359, 2, 'c4'), (2353, 10, 'c1'), (2347, 7, 'c3'), (2341, 4, 'c0'), (2335, 1, 'c2'), (2329, 9, 'c4'), (2323, 6, 'c1'), (2317, 3, 'c3'), (2311, 0, 'c0'), (2305, 8, 'c2'), (2299, 5, 'c4'), (2293, 2, 'c1'), (2287, 10, 'c3'), (2281, 7, 'c0'), (2275, 4, 'c2'), (2269, 1, 'c4'), (2263, 9, 'c1'), (2257, 6, 'c3'), (2251, 3, 'c0'), (2245, 0, 'c2'), (2239, 8, 'c4'), (2233, 5, 'c1'), (2227, 2, 'c3'), (2221, 10, 'c0'), (2215, 7, 'c2'), (2209, 4, 'c4'), (2203, 1, 'c1'), (2197, 9, 'c3'), (2191, 6, 'c0'), (2185, 3, 'c2'), (2179, 0, 'c4'), (2173, 8, 'c1'), (2167, 5, 'c3'), (2161, 2, 'c0'), (2155, 10, 'c2'), (2149, 7, 'c4'), (2143, 4, 'c1'), (2137, 1, 'c3'), (2131, 9, 'c0'), (2125, 6, 'c2'), (2119, 3, 'c4'), (2113, 0, 'c1'), (2107, 8, 'c3'), (2101, 5, 'c0'), (2095, 2, 'c2'), (2089, 10, 'c4'), (2083, 7, 'c1'), (2077, 4, 'c3'), (2071, 1, 'c0'), (2065, 9, 'c2'), (2059, 6, 'c4'), (2053, 3, 'c1'), (2047, 0, 'c3'), (2041, 8, 'c0'), (2035, 5, 'c2'), (2029, 2, 'c4'), (2023, 10, 'c1'), (2017, 7, 'c3'), (2011, 4, 'c0'), (2005, 1, 'c2'), (1999, 9, 'c4'), (1993, 6, 'c1'), (1987, 3, 'c3'), (1981, 0, 'c0'), (1975, 8, 'c2'), (1969, 5, 'c4'), (1963, 2, 'c1'), (1957, 10, 'c3'), (1951, 7, 'c0'), (1945, 4, 'c2'), (1939, 1, 'c4'), (1933, 9, 'c1'), (1927, 6, 'c3'), (1921, 3, 'c0'), (1915, 0, 'c2'), (1909, 8, 'c4'), (1903, 5, 'c1'), (1897, 2, 'c3'), (1891, 10, 'c0'), (1885, 7, 'c2'), (1879, 4, 'c4'), (1873, 1, 'c1'), (1867, 9, 'c3'), (1861, 6, 'c0'), (1855, 3, 'c2'), (1849, 0, 'c4'), (1843, 8, 'c1'), (1837, 5, 'c3'), (1831, 2, 'c0'), (1825, 10, 'c2'), (1819, 7, 'c4'), (1813, 4, 'c1'), (1807, 1, 'c3'), (1801, 9, 'c0'), (1795, 6, 'c2'), (1789, 3, 'c4'), (1783, 0, 'c1'), (1777, 8, 'c3'), (1771, 5, 'c0'), (1765, 2, 'c2'), (1759, 10, 'c4'), (1753, 7, 'c1'), (1747, 4, 'c3'), (1741, 1, 'c0'), (1735, 9, 'c2'), (1729, 6, 'c4'), (1723, 3, 'c1'), (1717, 0, 'c3'), (1711, 8, 'c0'), (1705, 5, 'c2'), (1699, 2, 'c4'), (1693, 10, 'c1'), (1687, 7, 'c3'), (1681, 4, 'c0'), (1675, 1, 'c2'), (1669, 9, 'c4'), (1663, 6, 'c1'), (1657, 3, 'c3'), (1651, 0, 'c0'), (1645, 8, 'c2'), (1639, 5, 'c4'), (1633, 2, 'c1'), (1627, 10, 'c3'), (1621, 7, 'c0'), (1615, 4, 'c2'), (1609, 1, 'c4'), (1603, 9, 'c1'), (1597, 6, 'c3'), (1591, 3, 'c0'), (1585, 0, 'c2'), (1579, 8, 'c4'), (1573, 5, 'c1'), (1567, 2, 'c3'), (1561, 10, 'c0'), (1555, 7, 'c2'), (1549, 4, 'c4'), (1543, 1, 'c1'), (1537, 9, 'c3'), (1531, 6, 'c0'), (1525, 3, 'c2'), (1519, 0, 'c4'), (1513, 8, 'c1'), (1507, 5, 'c3'), (1501, 2, 'c0'), (1495, 10, 'c2'), (1489, 7, 'c4'), (1483, 4, 'c1'), (1477, 1, 'c3'), (1471, 9, 'c0'), (1465, 6, 'c2'), (1459, 3, 'c4'), (1453, 0, 'c1'), (1447, 8, 'c3'), (1441, 5, 'c0'), (1435, 2, 'c2'), (1429, 10, 'c4'), (1423, 7, 'c1'), (1417, 4, 'c3'), (1411, 1, 'c0'), (1405, 9, 'c2'), (1399, 6, 'c4'), (1393, 3, 'c1'), (1387, 0, 'c3'), (1381, 8, 'c0'), (1375, 5, 'c2'), (1369, 2, 'c4'), (1363, 10, 'c1'), (1357, 7, 'c3'), (1351, 4, 'c0'), (1345, 1, 'c2'), (1339, 9, 'c4'), (1333, 6, 'c1'), (1327, 3, 'c3'), (1321, 0, 'c0'), (1315, 8, 'c2'), (1309, 5, 'c4'), (1303, 2, 'c1'), (1297, 10, 'c3'), (1291, 7, 'c0'), (1285, 4, 'c2'), (1279, 1, 'c4'), (1273, 9, 'c1'), (1267, 6, 'c3'), (1261, 3, 'c0'), (1255, 0, 'c2'), (1249, 8, 'c4'), (1243, 5, 'c1'), (1237, 2, 'c3'), (1231, 10, 'c0'), (1225, 7, 'c2'), (1219, 4, 'c4'), (1213, 1, 'c1'), (1207, 9, 'c3'), (1201, 6, 'c0'), (1195, 3, 'c2'), (1189, 0, 'c4'), (1183, 8, 'c1'), (1177, 5, 'c3'), (1171, 2, 'c0'), (1165, 10, 'c2'), (1159, 7, 'c4'), (1153, 4, 'c1'), (1147, 1, 'c3'), (1141, 9, 'c0'), (1135, 6, 'c2'), (1129, 3, 'c4'), (1123, 0, 'c1'), (1117, 8, 'c3'), (1111, 5, 'c0'), (1105, 2, 'c2'), (1099, 10, 'c4'), (1093, 7, 'c1'), (1087, 4, 'c3'), (1081, 1, 'c0'), (1075, 9, 'c2'), (1069, 6, 'c4'), (1063, 3, 'c1'), (1057, 0, 'c3'), (1051, 8, 'c0'), (1045, 5, 'c2'), (1039, 2, 'c4'), (1033, 10, 'c1'), (1027, 7, 'c3'), (1021, 4, 'c0'), (1015, 1, 'c2'), (1009, 9, 'c4'), (1003, 6, 'c1'), (997, 3, 'c3'), (991, 0, 'c0'), (985, 8, 'c2'), (979, 5, 'c4'), (973, 2, 'c1'), (967, 10, 'c3'), (961, 7, 'c0'), (955, 4, 'c2'), (949, 1, 'c4'), (943, 9, 'c1'), (937, 6, 'c3'), (931, 3, 'c0'), (925, 0, 'c2'), (919, 8, 'c4'), (913, 5, 'c1'), (907, 2, 'c3'), (901, 10, 'c0'), (895, 7, 'c2'), (889, 4, 'c4'), (883, 1, 'c1'), (877, 9, 'c3'), (871, 6, 'c0'), (865, 3, 'c2'), (859, 0, 'c4'), (853, 8, 'c1'), (847, 5, 'c3'), (841, 2, 'c0'), (835, 10, 'c2'), (829, 7, 'c4'), (823, 4, 'c1'), (817, 1, 'c3'), (811, 9, 'c0'), (805, 6, 'c2'), (799, 3, 'c4'), (793, 0, 'c1'), (787, 8, 'c3'), (781, 5, 'c0'), (775, 2, 'c2'), (769, 10, 'c4'), (763, 7, 'c1'), (757, 4, 'c3'), (751, 1, 'c0'), (745, 9, 'c2'), (739, 6, 'c4'), (733, 3, 'c1'), (727, 0, 'c3'), (721, 8, 'c0'), (715, 5, 'c2'), (709, 2, 'c4'), (703, 10, 'c1'), (697, 7, 'c3'), (691, 4, 'c0'), (685, 1, 'c2'), (679, 9, 'c4'), (673, 6, 'c1'), (667, 3, 'c3'), (661, 0, 'c0'), (655, 8, 'c2'), (649, 5, 'c4'), (643, 2, 'c1'), (637, 10, 'c3'), (631, 7, 'c0'), (625, 4, 'c2'), (619, 1, 'c4'), (613, 9, 'c1'), (607, 6, 'c3'), (601, 3, 'c0'), (595, 0, 'c2'), (589, 8, 'c4'), (583, 5, 'c1'), (577, 2, 'c3'), (571, 10, 'c0'), (565, 7, 'c2'), (559, 4, 'c4'), (553, 1, 'c1'), (547, 9, 'c3'), (541, 6, 'c0'), (535, 3, 'c2'), (529, 0, 'c4'), (523, 8, 'c1'), (517, 5, 'c3'), (511, 2, 'c0'), (505, 10, 'c2'), (499, 7, 'c4'), (493, 4, 'c1'), (487, 1, 'c3'), (481, 9, 'c0'), (475, 6, 'c2'), (469, 3, 'c4'), (463, 0, 'c1'), (457, 8, 'c3'), (451, 5, 'c0'), (445, 2, 'c2'), (439, 10, 'c4'), (433, 7, 'c1'), (427, 4, 'c3'), (421, 1, 'c0'), (415, 9, 'c2'), (409, 6, 'c4'), (403, 3, 'c1'), (397, 0, 'c3'), (391, 8, 'c0'), (385, 5, 'c2'), (379, 2, 'c4'), (373, 10, 'c1'), (367, 7, 'c3'), (361, 4, 'c0'), (355, 1, 'c2'), (349, 9, 'c4'), (343, 6, 'c1'), (337, 3, 'c3'), (331, 0, 'c0'), (325, 8, 'c2'), (319, 5, 'c4'), (313, 2, 'c1'), (307, 10, 'c3'), (301, 7, 'c0'), (295, 4, 'c2'), (289, 1, 'c4'), (283, 9, 'c1'), (277, 6, 'c3'), (271, 3, 'c0'), (265, 0, 'c2'), (259, 8, 'c4'), (253, 5, 'c1'), (247, 2, 'c3'), (241, 10, 'c0'), (235, 7, 'c2'), (229, 4, 'c4'), (223, 1, 'c1'), (217, 9, 'c3'), (211, 6, 'c0'), (205, 3, 'c2'), (199, 0, 'c4'), (193, 8, 'c1'), (187, 5, 'c3'), (181, 2, 'c0'), (175, 10, 'c2'), (169, 7, 'c4'), (163, 4, 'c1'), (157, 1, 'c3'), (151, 9, 'c0'), (145, 6, 'c2'), (139, 3, 'c4'), (133, 0, 'c1'), (127, 8, 'c3'), (121, 5, 'c0'), (115, 2, 'c2'), (109, 10, 'c4'), (103, 7, 'c1'), (97, 4, 'c3'), (91, 1, 'c0'), (85, 9, 'c2'), (79, 6, 'c4'), (73, 3, 'c1'), (67, 0, 'c3'), (61, 8, 'c0'), (55, 5, 'c2'), (49, 2, 'c4'), (43, 10, 'c1'), (37, 7, 'c3'), (31, 4, 'c0'), (25, 1, 'c2'), (19, 9, 'c4'), (13, 6, 'c1'), (7, 3, 'c3');
+INSERT INTO R VALUES (5000, 0, 'd'), (5001, 1, 'd'), (5002, 2, 'd'), (5003, 0, 'd'), (5004, 1, 'd'), (5005, 2, 'd'), (5006, 0, 'd'), (5007, 1, 'd'), (5008, 2, 'd'), (5009, 0, 'd'), (5010, 1, 'd'), (5011, 2, 'd'), (5012, 0, 'd'), (5013, 1, 'd'), (5014, 2, 'd'), (5015, 0, 'd'), (5016, 1, 'd'), (5017, 2, 'd'), (5018, 0, 'd'), (5019, 1, 'd'), (5020, 2, 'd'), (5021, 0, 'd'), (5022, 1, 'd'), (5023, 2, 'd'), (5024, 0, 'd'), (5025, 1, 'd'), (5026, 2, 'd'), (5027, 0, 'd'), (5028, 1, 'd'), (5029, 2, 'd'), (5030, 0, 'd'), (5031, 1, 'd'), (5032, 2, 'd'), (5033, 0, 'd'), (5034, 1, 'd'), (5035, 2, 'd'), (5036, 0, 'd'), (5037, 1, 'd'), (5038, 2, 'd'), (5039, 0, 'd'), (5040, 1, 'd'), (5041, 2, 'd'), (5042, 0, 'd'), (5043, 1, 'd'), (5044, 2, 'd'), (5045, 0, 'd'), (5046, 1, 'd'), (5047, 2, 'd'), (5048, 0, 'd'), (5049, 1, 'd'), (5050, 2, 'd'), (5051, 0, 'd'), (5052, 1, 'd'), (5053, 2, 'd'), (5054, 0, 'd'), (5055, 1, 'd'), (5056, 2, 'd'), (5057, 0, 'd'), (5058, 1, 'd'), (5059, 2, 'd'), (5060, 0, 'd'), (5061, 1, 'd'), (5062, 2, 'd'), (5063, 0, 'd'), (5064, 1, 'd'), (5065, 2, 'd'), (5066, 0, 'd'), (5067, 1, 'd'), (5068, 2, 'd'), (5069, 0, 'd'), (5070, 1, 'd'), (5071, 2, 'd'), (5072, 0, 'd'), (5073, 1, 'd'), (5074, 2, 'd'), (5075, 0, 'd'), (5076, 1, 'd'), (5077, 2, 'd'), (5078, 0, 'd'), (5079, 1, 'd'), (5080, 2, 'd'), (5081, 0, 'd'), (5082, 1, 'd'), (5083, 2, 'd'), (5084, 0, 'd'), (5085, 1, 'd'), (5086, 2, 'd'), (5087, 0, 'd'), (5088, 1, 'd'), (5089, 2, 'd'), (5090, 0, 'd'), (5091, 1, 'd'), (5092, 2, 'd'), (5093, 0, 'd'), (5094, 1, 'd'), (5095, 2, 'd'), (5096, 0, 'd'), (5097, 1, 'd'), (5098, 2, 'd'), (5099, 0, 'd'), (-1, 0, 'first');
+CREATE INDEX RA ON R(A);
+CREATE INDEX RAB ON R(A, B);
+CREATE TABLE S(A INT, B VARCHAR, C FLOAT);
+INSERT INTO S VALUES (0, 'b0', 0.5), (1, 'b1', 1.5), (2, 'b2', 2.5), (3, 'b3', 3.5), (4, 'b4', 4.5), (5, 'b5', 5.5), (6, 'b6', 6.5), (7, 'b0', 7.5), (8, 'b1', 8.5), (9, 'b2', 9.5), (10, 'b3', 10.5), (11, 'b4', 11.5), (12, 'b5', 12.5), (13, 'b6', 13.5), (14, 'b0', 14.5), (15, 'b1', 15.5), (16, 'b2', 16.5), (0, 'b3', 17.5), (1, 'b4', 18.5), (2, 'b5', 19.5), (3, 'b6', 20.5), (4, 'b0', 21.5), (5, 'b1', 22.5), (6, 'b2', 23.5), (7, 'b3', 24.5), (8, 'b4', 25.5), (9, 'b5', 26.5), (10, 'b6', 27.5), (11, 'b0', 28.5), (12, 'b1', 29.5), (13, 'b2', 30.5), (14, 'b3', 31.5), (15, 'b4', 32.5), (16, 'b5', 33.5), (0, 'b6', 34.5), (1, 'b0', 35.5), (2, 'b1', 36.5), (3, 'b2', 37.5), (4, 'b3', 38.5), (5, 'b4', 39.5), (6, 'b5', 40.5), (7, 'b6', 41.5), (8, 'b0', 42.5), (9, 'b1', 43.5), (10, 'b2', 44.5), (11, 'b3', 45.5), (12, 'b4', 46.5), (13, 'b5', 47.5), (14, 'b6', 48.5), (15, 'b0', 49.5), (16, 'b1', 50.5), (0, 'b2', 51.5), (1, 'b3', 52.5), (2, 'b4', 53.5), (3, 'b5', 54.5), (4, 'b6', 55.5), (5, 'b0', 56.5), (6, 'b1', 57.5), (7, 'b2', 58.5), (8, 'b3', 59.5), (9, 'b4', 60.5), (10, 'b5', 61.5), (11, 'b6', 62.5), (12, 'b0', 63.5), (13, 'b1', 64.5), (14, 'b2', 65.5), (15, 'b3', 66.5), (16, 'b4', 67.5), (0, 'b5', 68.5), (1, 'b6', 69.5), (2, 'b0', 70.5), (3, 'b1', 71.5), (4, 'b2', 72.5), (5, 'b3', 73.5), (6, 'b4', 74.5), (7, 'b5', 75.5), (8, 'b6', 76.5), (9, 'b0', 77.5), (10, 'b1', 78.5), (11, 'b2', 79.5), (12, 'b3', 80.5), (13, 'b4', 81.5), (14, 'b5', 82.5), (15, 'b6', 83.5), (16, 'b0', 84.5), (0, 'b1', 85.5), (1, 'b2', 86.5), (2, 'b3', 87.5), (3, 'b4', 88.5), (4, 'b5', 89.5), (5, 'b6', 90.5), (6, 'b0', 91.5), (7, 'b1', 92.5), (8, 'b2', 93.5), (9, 'b3', 94.5), (10, 'b4', 95.5), (11, 'b5', 96.5), (12, 'b6', 97.5), (13, 'b0', 98.5), (14, 'b1', 99.5), (15, 'b2', 100.5), (16, 'b3', 101.5), (0, 'b4', 102.5), (1, 'b5', 103.5), (2, 'b6', 104.5), (3, 'b0', 105.5), (4, 'b1', 106.5), (5, 'b2', 107.5), (6, 'b3', 108.5), (7, 'b4', 109.5), (8, 'b5', 110.5), (9, 'b6', 111.5), (10, 'b0', 112.5), (11, 'b1', 113.5), (12, 'b2', 114.5), (13, 'b3', 115.5), (14, 'b4', 116.5), (15, 'b5', 117.5), (16, 'b6', 118.5), (0, 'b0', 119.5), (1, 'b1', 120.5), (2, 'b2', 121.5), (3, 'b3', 122.5), (4, 'b4', 123.5), (5, 'b5', 124.5), (6, 'b6', 125.5), (7, 'b0', 126.5), (8, 'b1', 127.5), (9, 'b2', 128.5), (10, 'b3', 129.5), (11, 'b4', 130.5), (12, 'b5', 131.5), (13, 'b6', 132.5), (14, 'b0', 133.5), (15, 'b1', 134.5), (16, 'b2', 135.5), (0, 'b3', 136.5), (1, 'b4', 137.5), (2, 'b5', 138.5), (3, 'b6', 139.5), (4, 'b0', 140.5), (5, 'b1', 141.5), (6, 'b2', 142.5), (7, 'b3', 143.5), (8, 'b4', 144.5), (9, 'b5', 145.5), (10, 'b6', 146.5), (11, 'b0', 147.5), (12, 'b1', 148.5), (13, 'b2', 149.5), (14, 'b3', 150.5), (15, 'b4', 151.5), (16, 'b5', 152.5), (0, 'b6', 153.5), (1, 'b0', 154.5), (2, 'b1', 155.5), (3, 'b2', 156.5), (4, 'b3', 157.5), (5, 'b4', 158.5), (6, 'b5', 159.5), (7, 'b6', 160.5), (8, 'b0', 161.5), (9, 'b1', 162.5), (10, 'b2', 163.5), (11, 'b3', 164.5), (12, 'b4', 165.5), (13, 'b5', 166.5), (14, 'b6', 167.5), (15, 'b0', 168.5), (16, 'b1', 169.5), (0, 'b2', 170.5), (1, 'b3', 171.5), (2, 'b4', 172.5), (3, 'b5', 173.5), (4, 'b6', 174.5), (5, 'b0', 175.5), (6, 'b1', 176.5), (7, 'b2', 177.5), (8, 'b3', 178.5), (9, 'b4', 179.5), (10, 'b5', 180.5), (11, 'b6', 181.5), (12, 'b0', 182.5), (13, 'b1', 183.5), (14, 'b2', 184.5), (15, 'b3', 185.5), (16, 'b4', 186.5), (0, 'b5', 187.5), (1, 'b6', 188.5), (2, 'b0', 189.5), (3, 'b1', 190.5), (4, 'b2', 191.5), (5, 'b3', 192.5), (6, 'b4', 193.5), (7, 'b5', 194.5), (8, 'b6', 195.5), (9, 'b0', 196.5), (10, 'b1', 197.5), (11, 'b2', 198.5), (12, 'b3', 199.5), (13, 'b4', 200.5), (14, 'b5', 201.5), (15, 'b6', 202.5), (16, 'b0', 203.5), (0, 'b1', 204.5), (1, 'b2', 205.5), (2, 'b3', 206.5), (3, 'b4', 207.5), (4, 'b5', 208.5), (5, 'b6', 209.5), (6, 'b0', 210.5), (7, 'b1', 211.5), (8, 'b2', 212.5), (9, 'b3', 213.5), (10, 'b4', 214.5), (11, 'b5', 215.5), (12, 'b6', 216.5), (13, 'b0', 217.5), (14, 'b1', 218.5), (15, 'b2', 219.5), (16, 'b3', 220.5), (0, 'b4', 221.5), (1, 'b5', 222.5), (2, 'b6', 223.5), (3, 'b0', 224.5), (4, 'b1', 225.5), (5, 'b2', 226.5), (6, 'b3', 227.5), (7, 'b4', 228.5), (8, 'b5', 229.5), (9, 'b6', 230.5), (10, 'b0', 231.5), (11, 'b1', 232.5), (12, 'b2', 233.5), (13, 'b3', 234.5), (14, 'b4', 235.5), (15, 'b5', 236.5), (16, 'b6', 237.5), (0, 'b0', 238.5), (1, 'b1', 239.5), (2, 'b2', 240.5), (3, 'b3', 241.5), (4, 'b4', 242.5), (5, 'b5', 243.5), (6, 'b6', 244.5), (7, 'b0', 245.5), (8, 'b1', 246.5), (9, 'b2', 247.5), (10, 'b3', 248.5), (11, 'b4', 249.5), (12, 'b5', 250.5), (13, 'b6', 251.5), (14, 'b0', 252.5), (15, 'b1', 253.5), (16, 'b2', 254.5), (0, 'b3', 255.5), (1, 'b4', 256.5), (2, 'b5', 257.5), (3, 'b6', 258.5), (4, 'b0', 259.5), (5, 'b1', 260.5), (6, 'b2', 261.5), (7, 'b3', 262.5), (8, 'b4', 263.5), (9, 'b5', 264.5), (10, 'b6', 265.5), (11, 'b0', 266.5), (12, 'b1', 267.5), (13, 'b2', 268.5), (14, 'b3', 269.5), (15, 'b4', 270.5), (16, 'b5', 271.5), (0, 'b6', 272.5), (1, 'b0', 273.5), (2, 'b1', 274.5), (3, 'b2', 275.5), (4, 'b3', 276.5), (5, 'b4', 277.5), (6, 'b5', 278.5), (7, 'b6', 279.5), (8, 'b0', 280.5), (9, 'b1', 281.5), (10, 'b2', 282.5), (11, 'b3', 283.5), (12, 'b4', 284.5), (13, 'b5', 285.5), (14, 'b6', 286.5), (15, 'b0', 287.5), (16, 'b1', 288.5), (0, 'b2', 289.5), (1, 'b3', 290.5), (2, 'b4', 291.5), (3, 'b5', 292.5), (4, 'b6', 293.5), (5, 'b0', 294.5), (6, 'b1', 295.5), (7, 'b2', 296.5), (8, 'b3', 297.5), (9, 'b4', 298.5), (10, 'b5', 299.5), (11, 'b6', 300.5), (12, 'b0', 301.5), (13, 'b1', 302.5), (14, 'b2', 303.5), (15, 'b3', 304.5), (16, 'b4', 305.5), (0, 'b5', 306.5), (1, 'b6', 307.5), (2, 'b0', 308.5), (3, 'b1', 309.5), (4, 'b2', 310.5), (5, 'b3', 311.5), (6, 'b4', 312.5), (7, 'b5', 313.5), (8, 'b6', 314.5), (9, 'b0', 315.5), (10, 'b1', 316.5), (11, 'b2', 317.5), (12, 'b3', 318.5), (13, 'b4', 319.5), (14, 'b5', 320.5), (15, 'b6', 321.5), (16, 'b0', 322.5), (0, 'b1', 323.5), (1, 'b2', 324.5), (2, 'b3', 325.5), (3, 'b4', 326.5), (4, 'b5', 327.5), (5, 'b6', 328.5), (6, 'b0', 329.5), (7, 'b1', 330.5), (8, 'b2', 331.5), (9, 'b3', 332.5), (10, 'b4', 333.5), (11, 'b5', 334.5), (12, 'b6', 335.5), (13, 'b0', 336.5), (14, 'b1', 337.5), (15, 'b2', 338.5), (16, 'b3', 339.5), (0, 'b4', 340.5), (1, 'b5', 341.5), (2, 'b6', 342.5), (3, 'b0', 343.5), (4, 'b1', 344.5), (5, 'b2', 345.5), (6, 'b3', 346.5), (7, 'b4', 347.5), (8, 'b5', 348.5), (9, 'b6', 349.5), (10, 'b0', 350.5), (11, 'b1', 351.5), (12, 'b2', 352.5), (13, 'b3', 353.5), (14, 'b4', 354.5), (15, 'b5', 355.5), (16, 'b6', 356.5), (0, 'b0', 357.5), (1, 'b1', 358.5), (2, 'b2', 359.5), (3, 'b3', 360.5), (4, 'b4', 361.5), (5, 'b5', 362.5), (6, 'b6', 363.5), (7, 'b0', 364.5), (8, 'b1', 365.5), (9, 'b2', 366.5), (10, 'b3', 367.5), (11, 'b4', 368.5), (12, 'b5', 369.5), (13, 'b6', 370.5), (14, 'b0', 371.5), (15, 'b1', 372.5), (16, 'b2', 373.5), (0, 'b3', 374.5), (1, 'b4', 375.5), (2, 'b5', 376.5), (3, 'b6', 377.5), (4, 'b0', 378.5), (5, 'b1', 379.5), (6, 'b2', 380.5), (7, 'b3', 381.5), (8, 'b4', 382.5), (9, 'b5', 383.5), (10, 'b6', 384.5), (11, 'b0', 385.5), (12, 'b1', 386.5), (13, 'b2', 387.5), (14, 'b3', 388.5), (15, 'b4', 389.5), (16, 'b5', 390.5), (0, 'b6', 391.5), (1, 'b0', 392.5), (2, 'b1', 393.5), (3, 'b2', 394.5), (4, 'b3', 395.5), (5, 'b4', 396.5), (6, 'b5', 397.5), (7, 'b6', 398.5), (8, 'b0', 399.5), (9, 'b1', 400.5), (10, 'b2', 401.5), (11, 'b3', 402.5), (12, 'b4', 403.5), (13, 'b5', 404.5), (14, 'b6', 405.5), (15, 'b0', 406.5), (16, 'b1', 407.5), (0, 'b2', 408.5), (1, 'b3', 409.5), (2, 'b4', 410.5), (3, 'b5', 411.5), (4, 'b6', 412.5), (5, 'b0', 413.5), (6, 'b1', 414.5), (7, 'b2', 415.5), (8, 'b3', 416.5), (9, 'b4', 417.5), (10, 'b5', 418.5), (11, 'b6', 419.5), (12, 'b0', 420.5), (13, 'b1', 421.5), (14, 'b2', 422.5), (15, 'b3', 423.5), (16, 'b4', 424.5), (0, 'b5', 425.5), (1, 'b6', 426.5), (2, 'b0', 427.5), (3, 'b1', 428.5), (4, 'b2', 429.5), (5, 'b3', 430.5), (6, 'b4', 431.5), (7, 'b5', 432.5), (8, 'b6', 433.5), (9, 'b0', 434.5), (10, 'b1', 435.5), (11, 'b2', 436.5), (12, 'b3', 437.5), (13, 'b4', 438.5), (14, 'b5', 439.5), (15, 'b6', 440.5), (16, 'b0', 441.5), (0, 'b1', 442.5), (1, 'b2', 443.5), (2, 'b3', 444.5), (3, 'b4', 445.5), (4, 'b5', 446.5), (5, 'b6', 447.5), (6, 'b0', 448.5), (7, 'b1', 449.5), (8, 'b2', 450.5), (9, 'b3', 451.5), (10, 'b4', 452.5), (11, 'b5', 453.5), (12, 'b6', 454.5), (13, 'b0', 455.5), (14, 'b1', 456.5), (15, 'b2', 457.5), (16, 'b3', 458.5), (0, 'b4', 459.5), (1, 'b5', 460.5), (2, 'b6', 461.5), (3, 'b0', 462.5), (4, 'b1', 463.5), (5, 'b2', 464.5), (6, 'b3', 465.5), (7, 'b4', 466.5), (8, 'b5', 467.5), (9, 'b6', 468.5), (10, 'b0', 469.5), (11, 'b1', 470.5), (12, 'b2', 471.5), (13, 'b3', 472.5), (14, 'b4', 473.5), (15, 'b5', 474.5), (16, 'b6', 475.5), (0, 'b0', 476.5), (1, 'b1', 477.5), (2, 'b2', 478.5), (3, 'b3', 479.5), (4, 'b4', 480.5), (5, 'b5', 481.5), (6, 'b6', 482.5), (7, 'b0', 483.5), (8, 'b1', 484.5), (9, 'b2', 485.5), (10, 'b3', 486.5), (11, 'b4', 487.5), (12, 'b5', 488.5), (13, 'b6', 489.5), (14, 'b0', 490.5), (15, 'b1', 491.5), (16, 'b2', 492.5), (0, 'b3', 493.5), (1, 'b4', 494.5), (2, 'b5', 495.5), (3, 'b6', 496.5), (4, 'b0', 497.5), (5, 'b1', 498.5), (6, 'b2', 499.5), (7, 'b3', 500.5), (8, 'b4', 501.5), (9, 'b5', 502.5), (10, 'b6', 503.5), (11, 'b0', 504.5), (12, 'b1', 505.5), (13, 'b2', 506.5), (14, 'b3', 507.5), (15, 'b4', 508.5), (16, 'b5', 509.5), (0, 'b6', 510.5), (1, 'b0', 511.5), (2, 'b1', 512.5), (3, 'b2', 513.5), (4, 'b3', 514.5), (5, 'b4', 515.5), (6, 'b5', 516.5), (7, 'b6', 517.5), (8, 'b0', 518.5), (9, 'b1', 519.5), (10, 'b2', 520.5), (11, 'b3', 521.5), (12, 'b4', 522.5), (13, 'b5', 523.5), (14, 'b6', 524.5), (15, 'b0', 525.5), (16, 'b1', 526.5), (0, 'b2', 527.5), (1, 'b3', 528.5), (2, 'b4', 529.5), (3, 'b5', 530.5), (4, 'b6', 531.5), (5, 'b0', 532.5), (6, 'b1', 533.5), (7, 'b2', 534.5), (8, 'b3', 535.5), (9, 'b4', 536.5), (10, 'b5', 537.5), (11, 'b6', 538.5), (12, 'b0', 539.5), (13, 'b1', 540.5), (14, 'b2', 541.5), (15, 'b3', 542.5), (16, 'b4', 543.5), (0, 'b5', 544.5), (1, 'b6', 545.5), (2, 'b0', 546.5), (3, 'b1', 547.5), (4, 'b2', 548.5), (5, 'b3', 549.5), (6, 'b4', 550.5), (7, 'b5', 551.5), (8, 'b6', 552.5), (9, 'b0', 553.5), (10, 'b1', 554.5), (11, 'b2', 555.5), (12, 'b3', 556.5), (13, 'b4', 557.5), (14, 'b5', 558.5), (15, 'b6', 559.5), (16, 'b0', 560.5), (0, 'b1', 561.5), (1, 'b2', 562.5), (2, 'b3', 563.5), (3, 'b4', 564.5), (4, 'b5', 565.5), (5, 'b6', 566.5), (6, 'b0', 567.5), (7, 'b1', 568.5), (8, 'b2', 569.5), (9, 'b3', 570.5), (10, 'b4', 571.5), (11, 'b5', 572.5), (12, 'b6', 573.5), (13, 'b0', 574.5), (14, 'b1', 575.5), (15, 'b2', 576.5), (16, 'b3', 577.5), (0, 'b4', 578.5), (1, 'b5', 579.5), (2, 'b6', 580.5), (3, 'b0', 581.5), (4, 'b1', 582.5), (5, 'b2', 583.5), (6, 'b3', 584.5), (7, 'b4', 585.5), (8, 'b5', 586.5), (9, 'b6', 587.5), (10, 'b0', 588.5), (11, 'b1', 589.5), (12, 'b2', 590.5), (13, 'b3', 591.5), (14, 'b4', 592.5), (15, 'b5', 593.5), (16, 'b6', 594.5), (0, 'b0', 595.5), (1, 'b1', 596.5), (2, 'b2', 597.5), (3, 'b3', 598.5), (4, 'b4', 599.5), (5, 'b5', 600.5), (6, 'b6', 601.5), (7, 'b0', 602.5), (8, 'b1', 603.5), (9, 'b2', 604.5), (10, 'b3', 605.5), (11, 'b4', 606.5), (12, 'b5', 607.5), (13, 'b6', 608.5), (14, 'b0', 609.5), (15, 'b1', 610.5), (16, 'b2', 611.5), (0, 'b3', 612.5), (1, 'b4', 613.5), (2, 'b5', 614.5), (3, 'b6', 615.5), (4, 'b0', 616.5), (5, 'b1', 617.5), (6, 'b2', 618.5), (7, 'b3', 619.5), (8, 'b4', 620.5), (9, 'b5', 621.5), (10, 'b6', 622.5), (11, 'b0', 623.5), (12, 'b1', 624.5), (13, 'b2', 625.5), (14, 'b3', 626.5), (15, 'b4', 627.5), (16, 'b5', 628.5), (0, 'b6', 629.5), (1, 'b0', 630.5), (2, 'b1', 631.5), (3, 'b2', 632.5), (4, 'b3', 633.5), (5, 'b4', 634.5), (6, 'b5', 635.5), (7, 'b6', 636.5), (8, 'b0', 637.5), (9, 'b1', 638.5), (10, 'b2', 639.5), (11, 'b3', 640.5), (12, 'b4', 641.5), (13, 'b5', 642.5), (14, 'b6', 643.5), (15, 'b0', 644.5), (16, 'b1', 645.5), (0, 'b2', 646.5), (1, 'b3', 647.5), (2, 'b4', 648.5), (3, 'b5', 649.5), (4, 'b6', 650.5), (5, 'b0', 651.5), (6, 'b1', 652.5), (7, 'b2', 653.5), (8, 'b3', 654.5), (9, 'b4', 655.5), (10, 'b5', 656.5), (11, 'b6', 657.5), (12, 'b0', 658.5), (13, 'b1', 659.5), (14, 'b2', 660.5), (15, 'b3', 661.5), (16, 'b4', 662.5), (0, 'b5', 663.5), (1, 'b6', 664.5), (2, 'b0', 665.5), (3, 'b1', 666.5), (4, 'b2', 667.5), (5, 'b3', 668.5), (6, 'b4', 669.5), (7, 'b5', 670.5), (8, 'b6', 671.5), (9, 'b0', 672.5), (10, 'b1', 673.5), (11, 'b2', 674.5), (12, 'b3', 675.5), (13, 'b4', 676.5), (14, 'b5', 677.5), (15, 'b6', 678.5), (16, 'b0', 679.5), (0, 'b1', 680.5), (1, 'b2', 681.5), (2, 'b3', 682.5), (3, 'b4', 683.5), (4, 'b5', 684.5), (5, 'b6', 685.5), (6, 'b0', 686.5), (7, 'b1', 687.5), (8, 'b2', 688.5), (9, 'b3', 689.5), (10, 'b4', 690.5), (11, 'b5', 691.5), (12, 'b6', 692.5), (13, 'b0', 693.5), (14, 'b1', 694.5), (15, 'b2', 695.5), (16, 'b3', 696.5), (0, 'b4', 697.5), (1, 'b5', 698.5), (2, 'b6', 699.5), (3, 'b0', 700.5), (4, 'b1', 701.5), (5, 'b2', 702.5), (6, 'b3', 703.5), (7, 'b4', 704.5), (8, 'b5', 705.5), (9, 'b6', 706.5), (10, 'b0', 707.5), (11, 'b1', 708.5), (12, 'b2', 709.5), (13, 'b3', 710.5), (14, 'b4', 711.5), (15, 'b5', 712.5), (16, 'b6', 713.5), (0, 'b0', 714.5), (1, 'b1', 715.5), (2, 'b2', 716.5), (3, 'b3', 717.5), (4, 'b4', 718.5), (5, 'b5', 719.5), (6, 'b6', 720.5), (7, 'b0', 721.5), (8, 'b1', 722.5), (9, 'b2', 723.5), (10, 'b3', 724.5), (11, 'b4', 725.5), (12, 'b5', 726.5), (13, 'b6', 727.5), (14, 'b0', 728.5), (15, 'b1', 729.5), (16, 'b2', 730.5), (0, 'b3', 731.5), (1, 'b4', 732.5), (2, 'b5', 733.5), (3, 'b6', 734.5), (4, 'b0', 735.5), (5, 'b1', 736.5), (6, 'b2', 737.5), (7, 'b3', 738.5), (8, 'b4', 739.5), (9, 'b5', 740.5), (10, 'b6', 741.5), (11, 'b0', 742.5), (12, 'b1', 743.5), (13, 'b2', 744.5), (14, 'b3', 745.5), (15, 'b4', 746.5), (16, 'b5', 747.5), (0, 'b6', 748.5), (1, 'b0', 749.5), (2, 'b1', 750.5), (3, 'b2', 751.5), (4, 'b3', 752.5), (5, 'b4', 753.5), (6, 'b5', 754.5), (7, 'b6', 755.5), (8, 'b0', 756.5), (9, 'b1', 757.5), (10, 'b2', 758.5), (11, 'b3', 759.5), (12, 'b4', 760.5), (13, 'b5', 761.5), (14, 'b6', 762.5), (15, 'b0', 763.5), (16, 'b1', 764.5), (0, 'b2', 765.5), (1, 'b3', 766.5), (2, 'b4', 767.5), (3, 'b5', 768.5), (4, 'b6', 769.5), (5, 'b0', 770.5), (6, 'b1', 771.5), (7, 'b2', 772.5), (8, 'b3', 773.5), (9, 'b4', 774.5), (10, 'b5', 775.5), (11, 'b6', 776.5), (12, 'b0', 777.5), (13, 'b1', 778.5), (14, 'b2', 779.5), (15, 'b3', 780.5), (16, 'b4', 781.5), (0, 'b5', 782.5), (1, 'b6', 783.5), (2, 'b0', 784.5), (3, 'b1', 785.5), (4, 'b2', 786.5), (5, 'b3', 787.5), (6, 'b4', 788.5), (7, 'b5', 789.5), (8, 'b6', 790.5), (9, 'b0', 791.5), (10, 'b1', 792.5), (11, 'b2', 793.5), (12, 'b3', 794.5), (13, 'b4', 795.5), (14, 'b5', 796.5), (15, 'b6', 797.5), (16, 'b0', 798.5), (0, 'b1', 799.5), (1, 'b2', 800.5), (2, 'b3', 801.5), (3, 'b4', 802.5), (4, 'b5', 803.5), (5, 'b6', 804.5), (6, 'b0', 805.5), (7, 'b1', 806.5), (8, 'b2', 807.5), (9, 'b3', 808.5), (10, 'b4', 809.5), (11, 'b5', 810.5), (12, 'b6', 811.5), (13, 'b0', 812.5), (14, 'b1', 813.5), (15, 'b2', 814.5), (16, 'b3', 815.5), (0, 'b4', 816.5), (1, 'b5', 817.5), (2, 'b6', 818.5), (3, 'b0', 819.5), (4, 'b1', 820.5), (5, 'b2', 821.5), (6, 'b3', 822.5), (7, 'b4', 823.5), (8, 'b5', 824.5), (9, 'b6', 825.5), (10, 'b0', 826.5), (11, 'b1', 827.5), (12, 'b2', 828.5), (13, 'b3', 829.5), (14, 'b4', 830.5), (15, 'b5', 831.5), (16, 'b6', 832.5), (0, 'b0', 833.5), (1, 'b1', 834.5), (2, 'b2', 835.5), (3, 'b3', 836.5), (4, 'b4', 837.5), (5, 'b5', 838.5), (6, 'b6', 839.5), (7, 'b0', 840.5), (8, 'b1', 841.5), (9, 'b2', 842.5), (10, 'b3', 843.5), (11, 'b4', 844.5), (12, 'b5', 845.5), (13, 'b6', 846.5), (14, 'b0', 847.5), (15, 'b1', 848.5), (16, 'b2', 849.5), (0, 'b3', 850.5), (1, 'b4', 851.5), (2, 'b5', 852.5), (3, 'b6', 853.5), (4, 'b0', 854.5), (5, 'b1', 855.5), (6, 'b2', 856.5), (7, 'b3', 857.5), (8, 'b4', 858.5), (9, 'b5', 859.5), (10, 'b6', 860.5), (11, 'b0', 861.5), (12, 'b1', 862.5), (13, 'b2', 863.5), (14, 'b3', 864.5), (15, 'b4', 865.5), (16, 'b5', 866.5), (0, 'b6', 867.5), (1, 'b0', 868.5), (2, 'b1', 869.5), (3, 'b2', 870.5), (4, 'b3', 871.5), (5, 'b4', 872.5), (6, 'b5', 873.5), (7, 'b6', 874.5), (8, 'b0', 875.5), (9, 'b1', 876.5), (10, 'b2', 877.5), (11, 'b3', 878.5), (12, 'b4', 879.5), (13, 'b5', 880.5), (14, 'b6', 881.5), (15, 'b0', 882.5), (16, 'b1', 883.5), (0, 'b2', 884.5), (1, 'b3', 885.5), (2, 'b4', 886.5), (3, 'b5', 887.5), (4, 'b6', 888.5), (5, 'b0', 889.5), (6, 'b1', 890.5), (7, 'b2', 891.5), (8, 'b3', 892.5), (9, 'b4', 893.5), (10, 'b5', 894.5), (11, 'b6', 895.5), (12, 'b0', 896.5), (13, 'b1', 897.5), (14, 'b2', 898.5), (15, 'b3', 899.5), (16, 'b4', 900.5), (0, 'b5', 901.5), (1, 'b6', 902.5), (2, 'b0', 903.5), (3, 'b1', 904.5), (4, 'b2', 905.5), (5, 'b3', 906.5), (6, 'b4', 907.5), (7, 'b5', 908.5), (8, 'b6', 909.5), (9, 'b0', 910.5), (10, 'b1', 911.5), (11, 'b2', 912.5), (12, 'b3', 913.5), (13, 'b4', 914.5), (14, 'b5', 915.5), (15, 'b6', 916.5), (16, 'b0', 917.5), (0, 'b1', 918.5), (1, 'b2', 919.5), (2, 'b3', 920.5), (3, 'b4', 921.5), (4, 'b5', 922.5), (5, 'b6', 923.5), (6, 'b0', 924.5), (7, 'b1', 925.5), (8, 'b2', 926.5), (9, 'b3', 927.5), (10, 'b4', 928.5), (11, 'b5', 929.5), (12, 'b6', 930.5), (13, 'b0', 931.5), (14, 'b1', 932.5), (15, 'b2', 933.5), (16, 'b3', 934.5), (0, 'b4', 935.5), (1, 'b5', 936.5), (2, 'b6', 937.5), (3, 'b0', 938.5), (4, 'b1', 939.5), (5, 'b2', 940.5), (6, 'b3', 941.5), (7, 'b4', 942.5), (8, 'b5', 943.5), (9, 'b6', 944.5), (10, 'b0', 945.5), (11, 'b1', 946.5), (12, 'b2', 947.5), (13, 'b3', 948.5), (14, 'b4', 949.5), (15, 'b5', 950.5), (16, 'b6', 951.5), (0, 'b0', 952.5), (1, 'b1', 953.5), (2, 'b2', 954.5), (3, 'b3', 955.5), (4, 'b4', 956.5), (5, 'b5', 957.5), (6, 'b6', 958.5), (7, 'b0', 959.5), (8, 'b1', 960.5), (9, 'b2', 961.5), (10, 'b3', 962.5), (11, 'b4', 963.5), (12, 'b5', 964.5), (13, 'b6', 965.5), (14, 'b0', 966.5), (15, 'b1', 967.5), (16, 'b2', 968.5), (0, 'b3', 969.5), (1, 'b4', 970.5), (2, 'b5', 971.5), (3, 'b6', 972.5), (4, 'b0', 973.5), (5, 'b1', 974.5), (6, 'b2', 975.5), (7, 'b3', 976.5), (8, 'b4', 977.5), (9, 'b5', 978.5), (10, 'b6', 979.5), (11, 'b0', 980.5), (12, 'b1', 981.5), (13, 'b2', 982.5), (14, 'b3', 983.5), (15, 'b4', 984.5), (16, 'b5', 985.5), (0, 'b6', 986.5), (1, 'b0', 987.5), (2, 'b1', 988.5), (3, 'b2', 989.5), (4, 'b3', 990.5), (5, 'b4', 991.5), (6, 'b5', 992.5), (7, 'b6', 993.5), (8, 'b0', 994.5), (9, 'b1', 995.5), (10, 'b2', 996.5), (11, 'b3', 997.5), (12, 'b4', 998.5), (13, 'b5', 999.5), (14, 'b6', 1000.5), (15, 'b0', 1001.5), (16, 'b1', 1002.5), (0, 'b2', 1003.5), (1, 'b3', 1004.5), (2, 'b4', 1005.5), (3, 'b5', 1006.5), (4, 'b6', 1007.5), (5, 'b0', 1008.5), (6, 'b1', 1009.5), (7, 'b2', 1010.5), (8, 'b3', 1011.5), (9, 'b4', 1012.5), (10, 'b5', 1013.5), (11, 'b6', 1014.5), (12, 'b0', 1015.5), (13, 'b1', 1016.5), (14, 'b2', 1017.5), (15, 'b3', 1018.5), (16, 'b4', 1019.5), (0, 'b5', 1020.5), (1, 'b6', 1021.5), (2, 'b0', 1022.5), (3, 'b1', 1023.5), (4, 'b2', 1024.5), (5, 'b3', 1025.5), (6, 'b4', 1026.5), (7, 'b5', 1027.5), (8, 'b6', 1028.5), (9, 'b0', 1029.5), (10, 'b1', 1030.5), (11, 'b2', 1031.5), (12, 'b3', 1032.5), (13, 'b4', 1033.5), (14, 'b5', 1034.5), (15, 'b6', 1035.5), (16, 'b0', 1036.5), (0, 'b1', 1037.5), (1, 'b2', 1038.5), (2, 'b3', 1039.5), (3, 'b4', 1040.5), (4, 'b5', 1041.5), (5, 'b6', 1042.5), (6, 'b0', 1043.5), (7, 'b1', 1044.5), (8, 'b2', 1045.5), (9, 'b3', 1046.5), (10, 'b4', 1047.5), (11, 'b5', 1048.5), (12, 'b6', 1049.5), (13, 'b0', 1050.5), (14, 'b1', 1051.5), (15, 'b2', 1052.5), (16, 'b3', 1053.5), (0, 'b4', 1054.5), (1, 'b5', 1055.5), (2, 'b6', 1056.5), (3, 'b0', 1057.5), (4, 'b1', 1058.5), (5, 'b2', 1059.5), (6, 'b3', 1060.5), (7, 'b4', 1061.5), (8, 'b5', 1062.5), (9, 'b6', 1063.5), (10, 'b0', 1064.5), (11, 'b1', 1065.5), (12, 'b2', 1066.5), (13, 'b3', 1067.5), (14, 'b4', 1068.5), (15, 'b5', 1069.5), (16, 'b6', 1070.5), (0, 'b0', 1071.5), (1, 'b1', 1072.5), (2, 'b2', 1073.5), (3, 'b3', 1074.5), (4, 'b4', 1075.5), (5, 'b5', 1076.5), (6, 'b6', 1077.5), (7, 'b0', 1078.5), (8, 'b1', 1079.5), (9, 'b2', 1080.5), (10, 'b3', 1081.5), (11, 'b4', 1082.5), (12, 'b5', 1083.5), (13, 'b6', 1084.5), (14, 'b0', 1085.5), (15, 'b1', 1086.5), (16, 'b2', 1087.5), (0, 'b3', 1088.5), (1, 'b4', 1089.5), (2, 'b5', 1090.5), (3, 'b6', 1091.5), (4, 'b0', 1092.5), (5, 'b1', 1093.5), (6, 'b2', 1094.5), (7, 'b3', 1095.5), (8, 'b4', 1096.5), (9, 'b5', 1097.5), (10, 'b6', 1098.5), (11, 'b0', 1099.5), (12, 'b1', 1100.5), (13, 'b2', 1101.5), (14, 'b3', 1102.5), (15, 'b4', 1103.5), (16, 'b5', 1104.5), (0, 'b6', 1105.5), (1, 'b0', 1106.5), (2, 'b1', 1107.5), (3, 'b2', 1108.5), (4, 'b3', 1109.5), (5, 'b4', 1110.5), (6, 'b5', 1111.5), (7, 'b6', 1112.5), (8, 'b0', 1113.5), (9, 'b1', 1114.5), (10, 'b2', 1115.5), (11, 'b3', 1116.5), (12, 'b4', 1117.5), (13, 'b5', 1118.5), (14, 'b6', 1119.5), (15, 'b0', 1120.5), (16, 'b1', 1121.5), (0, 'b2', 1122.5), (1, 'b3', 1123.5), (2, 'b4', 1124.5), (3, 'b5', 1125.5), (4, 'b6', 1126.5), (5, 'b0', 1127.5), (6, 'b1', 1128.5), (7, 'b2', 1129.5), (8, 'b3', 1130.5), (9, 'b4', 1131.5), (10, 'b5', 1132.5), (11, 'b6', 1133.5), (12, 'b0', 1134.5), (13, 'b1', 1135.5), (14, 'b2', 1136.5), (15, 'b3', 1137.5), (16, 'b4', 1138.5), (0, 'b5', 1139.5), (1, 'b6', 1140.5), (2, 'b0', 1141.5), (3, 'b1', 1142.5), (4, 'b2', 1143.5), (5, 'b3', 1144.5), (6, 'b4', 1145.5), (7, 'b5', 1146.5), (8, 'b6', 1147.5), (9, 'b0', 1148.5), (10, 'b1', 1149.5), (11, 'b2', 1150.5), (12, 'b3', 1151.5), (13, 'b4', 1152.5), (14, 'b5', 1153.5), (15, 'b6', 1154.5), (16, 'b0', 1155.5), (0, 'b1', 1156.5), (1, 'b2', 1157.5), (2, 'b3', 1158.5), (3, 'b4', 1159.5), (4, 'b5', 1160.5), (5, 'b6', 1161.5), (6, 'b0', 1162.5), (7, 'b1', 1163.5), (8, 'b2', 1164.5), (9, 'b3', 1165.5), (10, 'b4', 1166.5), (11, 'b5', 1167.5), (12, 'b6', 1168.5), (13, 'b0', 1169.5), (14, 'b1', 1170.5), (15, 'b2', 1171.5), (16, 'b3', 1172.5), (0, 'b4', 1173.5), (1, 'b5', 1174.5), (2, 'b6', 1175.5), (3, 'b0', 1176.5), (4, 'b1', 1177.5), (5, 'b2', 1178.5), (6, 'b3', 1179.5), (7, 'b4', 1180.5), (8, 'b5', 1181.5), (9, 'b6', 1182.5), (10, 'b0', 1183.5), (11, 'b1', 1184.5), (12, 'b2', 1185.5), (13, 'b3', 1186.5), (14, 'b4', 1187.5), (15, 'b5', 1188.5), (16, 'b6', 1189.5), (0, 'b0', 1190.5), (1, 'b1', 1191.5), (2, 'b2', 1192.5), (3, 'b3', 1193.5), (4, 'b4', 1194.5), (5, 'b5', 1195.5), (6, 'b6', 1196.5), (7, 'b0', 1197.5), (8, 'b1', 1198.5), (9, 'b2', 1199.5);
+CREATE INDEX SA ON S(A);
+CREATE INDEX SBA ON S(B, A);
+SELECT COUNT(*), MIN(K), MAX(K) FROM R;
+SELECT K, B FROM R WHERE A = 12;
+SELECT K FROM R WHERE A = 4 AND B = 'b3';
+SELECT K, A FROM R WHERE K < 10 OR K > 5095;
+SELECT C FROM S WHERE A = 16;
+SELECT A, C FROM S WHERE B = 'b2' AND A = 9;
+SELECT R.K, S.C FROM R, S WHERE R.A = S.A AND R.B = S.B AND R.K < 40;
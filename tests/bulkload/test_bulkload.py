@@ -0,0 +1,30 @@
+import pytest
+import subprocess
+
+testcase_dir = "tests/bulkload/"
+T = 1
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_bulkload_{t_id}")
+
+@pytest.mark.parametrize("values", [
+    [(1, 1), (2, 2), (2, 3), (3, 3)], # duplicates next to each other, as when appending sorted input
+    [(9, 1), (3, 2), (7, 3), (3, 4)], # duplicates apart
+    [(8, 1), (10, 2), (4, 3)], # duplicating a key already in the table
+])
+def test_duplicate_keys(run, capsys, values):
+    # the whole statement fails, leaving the table as it was:
+    subprocess.run(['make', 'clean'], check=True)
+    for r in run('CREATE TABLE R(K INT, A INT, PRIMARY KEY(K));' +
+                 'CREATE INDEX RA ON R(A);' +
+                 'INSERT INTO R VALUES (4, 0), (5, 0);'):
+        assert r.error is None, r.error_details
+    r, = run('INSERT INTO R VALUES ' + ', '.join(map(str, values)) + ';')
+    assert r.error is not None and 'primary key constraint violation' in r.error
+    capsys.readouterr()
+    r, = run('SELECT * FROM R;')
+    assert r.error is None and r.response.startswith('SELECT 2')
+    assert capsys.readouterr().out.split("\n")[1:-1] == ['(4, 0)', '(5, 0)']
+    r, = run('SELECT K FROM R WHERE A = 1;')
+    assert r.error is None and r.response.startswith('SELECT 0')
@@ -0,0 +1,22 @@
+CREATE TABLE R(K INT, A INT, B FLOAT, C VARCHAR, D DATETIME, E BOOLEAN);
+INSERT INTO R VALUES (0, 1, 0.0, '東京', '2023-08-21', FALSE), (1, 2147483648, 1e10, '', '2019-07-20', TRUE), (2, 425, -32.5, 'abc', '2001-06-01', TRUE), (3, 0, -3.5, 'abc', '2022-12-01', TRUE), (4, 564, -123.125, 'abc', '2017-04-22', TRUE), (5, 558, 0.0, 'éclair', '2030-11-04', TRUE), (6, -2147483653, -70.5, 'Zebra', '2027-07-17', TRUE), (7, -2147483653, 1e10, 'x y', '2020-10-28', TRUE), (8, 2147483648, 1e10, 'éclair', '2006-06-18', FALSE), (9, -823, -123.125, 'a', '2005-09-27', FALSE), (10, -242, 0.0, '東京', '1997-05-23', FALSE), (11, -1, -123.125, 'abc', '1995-04-18', TRUE), (12, 4611686018427387904, 3.25, '東京', '2012-11-18', TRUE), (13, -1, -123.125, 'abc', '2022-01-16', FALSE), (14, 2147483648, 1e10, '東京', '2017-07-12', TRUE), (15, 4611686018427387904, -123.125, '', '2009-11-06', TRUE), (16, 1, 3.25, '', '1999-02-28', TRUE), (17, 0, 3.25, 'abc', '2012-02-26', TRUE), (18, -2147483653, -0.5, 'ab', '2011-09-06', FALSE), (19, -2147483653, 16.5, 'Zebra', '2026-08-04', TRUE), (20, -4611686018427387904, 1e10, 'abc', '2011-02-09', TRUE), (21, -4611686018427387904, -0.5, '', '2020-03-02', TRUE), (22, -4611686018427387904, -0.5, 'x y', '2023-04-17', TRUE), (23, 4611686018427387904, 68.5, 'éclair', '1998-12-10', TRUE), (24, 2147483648, 3.25, 'a', '1999-05-10', TRUE), (25, -2147483653, 0.0, 'x y', '1997-10-27', TRUE), (26, 970, -57.5, 'longer string value', '2027-01-13', TRUE), (27, 1, -123.125, 'éclair', '2007-08-04', FALSE), (28, -394, 3.25, 'longer string value', '2020-05-01', TRUE), (29, 4611686018427387904, -0.5, 'Zebra', '2022-04-09', TRUE), (30, -4611686018427387904, 3.25, 'x y', '2026-09-08', TRUE), (31, 0, -0.5, 'ab', '2005-09-07', FALSE), (32, 4611686018427387904, -123.125, 'b', '2018-06-11', TRUE), (33, 2147483648, 54.5, '東京', '2003-10-18', TRUE), (34, 0, 0.0, 'éclair', '2004-03-11', TRUE), (35, -4611686018427387904, -123.125, 'x y', '2009-10-03', FALSE), (36, -2147483653, -123.125, 'a', '2024-05-04', TRUE), (37, -2147483653, -123.125, '', '2000-07-04', TRUE), (38, 2147483648, 1e10, 'ab', '2002-08-06', TRUE), (39, 1, 1e10, 'x y', '2013-09-09', FALSE), (40, 1, -47.5, 'Zebra', '1997-01-01', FALSE), (41, 4611686018427387904, 1e10, 'Zebra', '2020-02-03', FALSE), (42, 986, 3.25, 'abc', '2029-12-16', FALSE), (43, -1, -0.5, 'b', '2007-04-12', TRUE), (44, -2147483653, 1e10, 'a', '2016-04-13', FALSE), (45, 4611686018427387904, 3.25, 'longer string value', '2014-04-11', TRUE), (46, 1, -0.5, '', '2010-07-03', FALSE), (47, 1, 0.0, '', '1995-05-25', FALSE), (48, 10, 0.0, 'x y', '2015-02-17', TRUE), (49, -1, 3.25, 'b', '2001-12-17', FALSE), (50, 2147483648, -123.125, '', '2015-10-26', TRUE), (51, -2147483653, -123.125, 'ab', '1998-12-28', TRUE), (52, 1, 1e10, 'éclair', '2030-05-18', FALSE), (53, 743, 1e10, 'Zebra', '2005-05-16', TRUE), (54, -4611686018427387904, 0.0, '', '2017-10-05', TRUE), (55, -2147483653, 1e10, 'longer string value', '2020-03-20', TRUE), (56, -522, -0.5, 'x y', '2015-09-21', FALSE), (57, 2147483648, 3.25, '東京', '2025-04-23', FALSE), (58, -2147483653, -0.5, '', '1999-09-21', FALSE), (59, 2147483648, 3.25, 'b', '2030-06-06', FALSE), (60, 1, -123.125, 'x y', '2019-03-05', FALSE), (61, 2147483648, 45.5, '', '2026-11-13', FALSE), (62, -1, 39.5, '', '2028-02-26', FALSE), (63, 1, -32.5, 'a', '2003-10-27', TRUE), (64, 2147483648, 1e10, 'éclair', '2005-06-15', TRUE), (65, 274, 0.0, 'éclair', '2029-07-04', FALSE), (66, 2147483648, -4.5, 'x y', '1995-04-17', FALSE), (67, 0, -93.5, 'longer string value', '2010-05-07', TRUE), (68, -1, -0.5, 'b', '2014-10-25', FALSE), (69, 704, -123.125, 'Zebra', '2026-07-28', TRUE), (70, 2147483648, 1e10, 'abc', '2013-02-26', TRUE), (71, 0, 3.25, 'ab', '1999-09-12', FALSE), (72, 4611686018427387904, -123.125, 'Zebra', '1995-02-15', FALSE), (73, -2147483653, 1e10, 'Zebra', '2026-02-21', FALSE), (74, 2147483648, 0.0, 'b', '2027-04-15', FALSE), (75, -2147483653, -0.5, '東京', '2028-04-12', TRUE), (76, -4611686018427387904, 1e10, 'éclair', '2016-10-19', TRUE), (77, 2147483648, 63.5, 'b', '1996-07-24', TRUE), (78, -4611686018427387904, 3.25, 'ab', '1999-10-01', FALSE), (79, -2147483653, 1e10, 'x y', '2014-03-15', FALSE), (80, -1, -123.125, '', '2012-09-04', FALSE), (81, 4611686018427387904, -83.5, '東京', '1996-03-17', TRUE), (82, 1, 2.5, 'b', '2014-04-17', TRUE), (83, 4611686018427387904, 0.0, 'a', '2028-11-12', FALSE), (84, 0, 3.25, 'x y', '2012-06-20', TRUE), (85, -4611686018427387904, 1e10, 'b', '2016-12-08', FALSE), (86, 2147483648, 0.0, 'longer string value', '2020-06-14', TRUE), (87, -2147483653, 0.0, 'ab', '2023-10-24', TRUE), (88, -2147483653, -123.125, 'ab', '2003-03-23', FALSE), (89, -2147483653, 1e10, 'abc', '2002-12-07', FALSE), (90, 1, 1e10, 'Zebra', '2026-02-06', TRUE), (91, 0, -0.5, '', '2026-12-17', FALSE), (92, -2147483653, -123.125, 'ab', '2001-04-13', TRUE), (93, 13, -0.5, 'abc', '2010-05-15', FALSE), (94, -567, 3.25, 'Zebra', '2026-10-04', TRUE), (95, 0, 0.0, '東京', '2015-07-28', FALSE), (96, 2147483648, -0.5, 'ab', '1996-01-13', TRUE), (97, 0, 1e10, 'b', '2003-02-15', FALSE), (98, 0, -123.125, '', '2028-03-02', FALSE), (99, 1, 0.0, 'abc', '1996-08-21', TRUE), (100, -2147483653, -0.5, '東京', '2019-06-21', FALSE), (101, -2147483653, 64.5, 'abc', '2010-01-19', TRUE), (102, -4611686018427387904, 54.5, 'x y', '2028-01-12', FALSE), (103, 2147483648, -123.125, 'éclair', '1999-12-09', TRUE), (104, -1, -0.5, '', '2008-07-28', TRUE), (105, 1, 1e10, 'x y', '2018-02-11', TRUE), (106, 0, 13.5, 'ab', '2020-12-15', TRUE), (107, -2147483653, 3.25, 'Zebra', '2000-05-02', FALSE), (108, -2147483653, -20.5, 'ab', '2011-07-26', TRUE), (109, -2147483653, 1e10, 'abc', '2027-09-07', FALSE), (110, 4611686018427387904, 1e10, 'longer string value', '2025-02-05', FALSE), (111, 0, -26.5, 'ab', '2007-06-13', FALSE), (112, -4611686018427387904, -0.5, 'longer string value', '1999-01-10', FALSE), (113, -2147483653, 3.25, 'b', '2015-12-24', TRUE), (114, 1, 3.25, 'Zebra', '2015-10-03', FALSE), (115, -428, 3.25, 'éclair', '2000-10-26', TRUE), (116, 0, 1e10, 'longer string value', '2011-04-23', FALSE), (117, 4611686018427387904, 3.25, '東京', '2016-09-17', TRUE), (118, -1, -36.5, 'abc', '2003-02-06', FALSE), (119, 0, -123.125, 'b', '2001-04-09', TRUE), (120, 1, -0.5, 'ab', '2027-07-01', FALSE), (121, 843, 3.25, 'abc', '2007-10-16', TRUE), (122, -129, 3.25, 'x y', '2007-08-24', TRUE), (123, -2147483653, -0.5, '', '2029-07-17', FALSE), (124, -4611686018427387904, -123.125, 'longer string value', '2022-01-12', FALSE), (125, 2147483648, -24.5, '', '2029-02-27', FALSE), (126, 4611686018427387904, -123.125, 'longer string value', '2030-05-17', FALSE), (127, -4611686018427387904, 54.5, 'longer string value', '2014-08-10', TRUE), (128, 36, -0.5, 'x y', '2005-05-21', TRUE), (129, 0, 1e10, 'éclair', '2013-11-25', TRUE), (130, 1, 0.0, 'éclair', '2012-08-09', FALSE), (131, 302, 3.25, 'éclair', '2024-02-16', FALSE), (132, -4611686018427387904, 0.0, 'ab', '2011-06-28', TRUE), (133, -2147483653, 3.25, 'x y', '2013-12-14', FALSE), (134, 4611686018427387904, 1e10, 'abc', '2026-07-23', FALSE), (135, 1, -0.5, 'ab', '2009-12-01', TRUE), (136, -1, 0.0, 'éclair', '2006-01-03', FALSE), (137, 0, -0.5, 'x y', '2022-06-02', TRUE), (138, -4611686018427387904, 71.5, 'a', '2011-11-09', TRUE), (139, 0, -46.5, 'a', '2019-02-22', FALSE), (140, -398, 0.0, 'longer string value', '2025-02-05', FALSE), (141, 2147483648, -123.125, 'b', '2021-12-18', FALSE), (142, 779, -123.125, 'abc', '2016-08-04', TRUE), (143, 4611686018427387904, 3.25, '', '2029-11-15', FALSE), (144, 1, -123.125, 'b', '2012-12-08', FALSE), (145, -1, -0.5, 'éclair', '2030-11-20', TRUE), (146, -1, 3.25, 'b', '2025-12-10', FALSE), (147, 2147483648, 3.25, 'longer string value', '2025-04-11', TRUE), (148, -1, -123.125, '東京', '2029-03-02', FALSE), (149, -1, -0.5, 'Zebra', '2026-08-11', TRUE), (150, -1, 3.25, 'abc', '2000-11-18', TRUE), (151, -1, 0.0, 'abc', '2007-09-19', FALSE), (152, 4611686018427387904, 0.0, 'b', '2009-02-24', TRUE), (153, 4611686018427387904, -123.125, 'x y', '2019-01-04', FALSE), (154, -1, 3.25, 'ab', '1997-06-03', TRUE), (155, 1, 3.25, 'abc', '2012-09-02', FALSE), (156, 1, 1e10, 'Zebra', '2010-02-22', FALSE), (157, 0, 3.25, 'a', '2017-11-24', TRUE), (158, -2147483653, 0.0, 'longer string value', '2028-08-19', FALSE), (159, -4611686018427387904, -0.5, 'b', '2030-03-02', TRUE), (160, 2147483648, 1e10, 'b', '2029-01-09', FALSE), (161, -2147483653, -0.5, 'éclair', '2001-12-12', TRUE), (162, 4611686018427387904, -123.125, 'x y', '1996-10-10', FALSE), (163, -1, 0.0, 'longer string value', '2004-11-27', TRUE), (164, 4611686018427387904, 3.25, 'ab', '2004-07-27', FALSE), (165, 1, -0.5, 'b', '2013-11-22', TRUE), (166, 0, -0.5, 'éclair', '2030-02-15', TRUE), (167, -4611686018427387904, 53.5, 'éclair', '2012-06-14', FALSE), (168, 240, 0.0, '東京', '1997-11-23', TRUE), (169, 0, -123.125, 'ab', '2028-09-25', FALSE), (170, -2147483653, -123.125, 'Zebra', '2025-12-08', TRUE), (171, 4611686018427387904, 0.0, '', '2015-07-24', FALSE), (172, 0, 1e10, 'éclair', '2019-06-10', FALSE), (173, 2147483648, -123.125, 'x y', '2004-01-11', TRUE), (174, -1, 39.5, '東京', '2016-12-04', TRUE), (175, 2147483648, -2.5, 'ab', '2020-12-08', TRUE), (176, 4611686018427387904, -16.5, 'abc', '2024-12-16', FALSE), (177, 2147483648, 1e10, 'éclair', '2029-02-19', FALSE), (178, -2147483653, -0.5, '', '2019-07-04', TRUE), (179, 1, 1e10, 'éclair', '2027-05-05', TRUE), (180, 1, 0.0, '東京', '2020-11-23', TRUE), (181, -4611686018427387904, -123.125, 'abc', '2022-03-22', TRUE), (182, 2147483648, -123.125, 'x y', '2005-03-13', TRUE), (183, 2147483648, -0.5, '', '2028-12-07', TRUE), (184, -4611686018427387904, 1e10, 'a', '1998-07-03', TRUE), (185, 313, -123.125, 'abc', '1995-01-28', FALSE), (186, -2147483653, 1e10, 'ab', '2003-09-23', FALSE), (187, 578, 1e10, 'x y', '2005-12-13', FALSE), (188, 2147483648, 3.25, 'Zebra', '2004-05-19', FALSE), (189, -1, 99.5, 'longer string value', '2000-12-12', FALSE), (190, -1, 3.25, 'b', '2017-07-09', FALSE), (191, -1, 3.25, 'abc', '2007-02-26', TRUE), (192, -4611686018427387904, -0.5, 'longer string value', '2003-09-15', FALSE), (193, 2147483648, -79.5, 'a', '2004-11-02', TRUE), (194, -4611686018427387904, 1e10, 'ab', '2003-11-18', TRUE), (195, 2147483648, -0.5, 'b', '2007-11-24', FALSE), (196, -1, 3.25, 'ab', '2017-08-18', FALSE), (197, -2147483653, -47.5, '東京', '1996-05-26', TRUE), (198, 4611686018427387904, 1e10, 'b', '1998-01-27', FALSE), (199, -1, 0.0, 'a', '2022-11-19', TRUE);
+CREATE TABLE SF(B FLOAT, K INT, PRIMARY KEY(B));
+INSERT INTO SF VALUES (-1e10, 0), (-2.5, 1), (-0.25, 2), (0.0, 3), (0.125, 4), (3.0, 5), (7.5, 6), (1e12, 7);
+CREATE TABLE SC(C VARCHAR, K INT, PRIMARY KEY(C));
+INSERT INTO SC VALUES ('a', 1), ('ab', 2), ('abc', 3), ('b', 4), ('Zebra', 5), ('éclair', 6), ('東京', 7), ('x y', 8), ('longer string value', 9);
+CREATE TABLE SD(D DATETIME, K INT, PRIMARY KEY(D));
+INSERT INTO SD VALUES ('1999-01-11', 19991), ('1999-05-15', 19995), ('1999-09-19', 19999), ('2000-01-11', 20001), ('2000-05-15', 20005), ('2000-09-19', 20009), ('2024-01-11', 20241), ('2024-05-15', 20245), ('2024-09-19', 20249);
+CREATE TABLE SI(A INT, K INT, PRIMARY KEY(A));
+INSERT INTO SI VALUES (-2147483648, 0), (-300, 1), (-1, 2), (0, 3), (1, 4), (255, 5), (256, 6), (65536, 7), (2147483647, 8);
+SELECT * FROM R;
+SELECT K, A FROM R WHERE A < 0;
+SELECT K, C FROM R WHERE C = '東京' OR C = '';
+SELECT K, D FROM R WHERE D >= '2020-01-01' AND E = TRUE;
+SELECT B, K FROM SF WHERE B > -1.0 AND B < 5.0;
+SELECT C, K FROM SC WHERE C >= 'ab' AND C < 'b';
+SELECT C, K FROM SC WHERE C > 'Zebra';
+SELECT D, K FROM SD;
+SELECT SD.K, R.K FROM SD, R WHERE SD.D <= R.D AND R.K < 5;
+SELECT A, K FROM SI WHERE A >= -1 AND A < 65536;
+SELECT A, K FROM SI WHERE A < -1000;
+SELECT SI.A, SF.B FROM SI, SF WHERE SI.K = SF.K;
@@ -0,0 +1,29 @@
+import pytest
+import datetime
+
+from ddb.primitives import ValType
+from ddb.storage.serialize import RowCodec
+
+testcase_dir = "tests/codec/"
+T = 1
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_codec_{t_id}")
+
+ROW_TYPE = (ValType.INTEGER, ValType.FLOAT, ValType.VARCHAR, ValType.DATETIME, ValType.BOOLEAN)
+
+@pytest.mark.parametrize("row", [
+    (1, 2.5, 'abc', datetime.datetime(2024, 2, 29, 12, 30, 1, 5), True),
+    (-2**63, -0.0, '', datetime.datetime(1, 1, 1), False),
+    (None, None, None, None, None),
+    (0, None, '東京\0x', None, True),
+    # not matching the declared types, so stored in the generic format:
+    (2**70, 1, 'a', datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc), 1),
+])
+def test_row_round_trip(row):
+    codec = RowCodec.for_row_type(ROW_TYPE)
+    packed = codec.pack(row)
+    for unpacked in (codec.unpack(packed), codec.unpack(memoryview(packed))):
+        assert unpacked == row and [type(v) for v in unpacked] == [type(v) for v in row]
+    assert packed in codec.encodings(row)
@@ -0,0 +1,91 @@
+import pytest
+
+from ddb.primitives import ValType, CompiledValExpr
+from ddb.validator import valexpr
+from ddb.validator.valexpr import RelativeColumnRef, LiteralNumber, LiteralString
+from ddb.validator.valexpr.binary import GT, PLUS, MULTIPLY
+from ddb.validator.valexpr.aggr import SUM, COUNT, AVG, STDDEV_POP, MIN, MAX
+
+# compiled functions must compute exactly what eval does with the same variables bound by name:
+
+ROWS = [ (i % 5, f's{i % 3}', i / 4) for i in range(30) ]
+
+def column(input_index, column_index):
+    return RelativeColumnRef(input_index, column_index, [ValType.INTEGER, ValType.VARCHAR, ValType.FLOAT][column_index])
+
+def compile_code(e, row_vars):
+    return CompiledValExpr(valexpr.to_code_str(e, [], row_vars))
+
+def comparator(ascs):
+    # the same shape as the merge-sort and merge-join comparators: -1, 0, or 1 comparing this to that
+    this_before_that = CompiledValExpr.logical('or', *(
+        CompiledValExpr.logical('and', *(
+            [ CompiledValExpr.compare(CompiledValExpr(f'this[{j}]'), '==', CompiledValExpr(f'that[{j}]')) for j in range(i) ] +
+            [ CompiledValExpr.compare(CompiledValExpr(f'this[{i}]'), '<' if asc else '>', CompiledValExpr(f'that[{i}]')) ]))
+        for i, asc in enumerate(ascs)))
+    eq = CompiledValExpr.logical('and', *(
+        CompiledValExpr.compare(CompiledValExpr(f'this[{i}]'), '==', CompiledValExpr(f'that[{i}]')) for i in range(len(ascs))))
+    return CompiledValExpr.conditional(
+        this_before_that, CompiledValExpr('-1'),
+        CompiledValExpr.conditional(eq, CompiledValExpr('0'), CompiledValExpr('1')))
+
+@pytest.mark.parametrize("ascs", [(True, ), (False, True), (True, False, True)])
+def test_comparator(ascs):
+    cmp_exec = comparator(ascs)
+    cmp = cmp_exec.function('this', 'that')
+    for this in ROWS[:10]:
+        for that in ROWS:
+            assert cmp(this, that) == cmp_exec.eval(this=this, that=that)
+
+def test_sort_key():
+    key_exec = CompiledValExpr.tuple(
+        CompiledValExpr.descending(compile_code(column(0, 0), ['row0']), True),
+        CompiledValExpr.descending(compile_code(column(0, 1), ['row0']), False),
+        compile_code(column(0, 2), ['row0']))
+    key = key_exec.function('row0')
+    assert [ key(row) for row in ROWS ] == [ key_exec.eval(row0=row) for row in ROWS ]
+    assert sorted(ROWS, key=key) == sorted(ROWS, key=lambda row: key_exec.eval(row0=row))
+
+def test_join_condition():
+    # a condition over two inputs, with the parameters named as the join operators name them:
+    cond_exec = compile_code(GT(PLUS(column(0, 0), column(1, 2)), MULTIPLY(column(1, 0), LiteralNumber(2))), ['row0', 'row1'])
+    cond = cond_exec.function('row0', 'row1')
+    swapped = cond_exec.function('row1', 'row0')
+    for row0 in ROWS[:10]:
+        for row1 in ROWS:
+            assert cond(row0, row1) == cond_exec.eval(row0=row0, row1=row1)
+            assert swapped(row1, row0) == cond(row0, row1)
+
+@pytest.mark.parametrize("aggr_class", [SUM, COUNT, AVG, STDDEV_POP, MIN, MAX])
+@pytest.mark.parametrize("column_index", [0, 2])
+def test_aggregate(aggr_class, column_index):
+    # the same init/add/finalize expressions that AggrPop compiles:
+    e = aggr_class((column(0, column_index), ))
+    input_exec = compile_code(column(0, column_index), ['row0'])
+    init_exec = CompiledValExpr(e.code_str_init())
+    add_exec = CompiledValExpr(e.code_str_add('state', 'new_val'))
+    finalize_exec = CompiledValExpr(e.code_str_finalize('state'))
+    input_of, init, add, finalize = \
+        input_exec.function('row0'), init_exec.function(), add_exec.function('state', 'new_val'), finalize_exec.function('state')
+    state, expected_state = init(), init_exec.eval()
+    assert state == expected_state
+    for row in ROWS:
+        state = add(state, input_of(row))
+        expected_state = add_exec.eval(state=expected_state, new_val=input_exec.eval(row0=row))
+        assert state == expected_state
+    assert finalize(state) == finalize_exec.eval(state=expected_state)
+    assert finalize(init()) == finalize_exec.eval(state=init_exec.eval())
+
+def test_function_cache():
+    # a function is compiled once per list of parameter names, and then reused:
+    e = compile_code(GT(column(0, 1), LiteralString('s0')), ['row0'])
+    f = e.function('row0')
+    assert e.function('row0') is f
+    g = e.function('row0', 'row1')
+    assert g is not f and e.function('row0', 'row1') is g and e.function('row0') is f
+    assert [ f(row) for row in ROWS ] == [ g(row, None) for row in ROWS ] == [ e.eval(row0=row) for row in ROWS ]
+    # the batch versions are cached the same way, and agree with the row-by-row ones:
+    assert e.eval_batch('row0', ROWS) == [ f(row) for row in ROWS ]
+    assert e.filter_batch('row0', ROWS) == [ row for row in ROWS if f(row) ]
+    assert e.filter_batch('row0', ROWS[:7]) == [ row for row in ROWS[:7] if f(row) ]
+    assert len(e._batch_functions) == 2
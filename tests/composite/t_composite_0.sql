@@ -0,0 +1,17 @@
+CREATE TABLE R(A INT, B VARCHAR, C FLOAT, D INT, PRIMARY KEY(A, B));
+INSERT INTO R VALUES (0, 'k0', 0.25, 0), (1, 'k0', 1.25, 1), (2, 'k0', 2.25, 2), (3, 'k0', 3.25, 3), (4, 'k0', 4.25, 4), (5, 'k0', 5.25, 5), (6, 'k0', 6.25, 6), (7, 'k0', 7.25, 7), (8, 'k0', 8.25, 8), (9, 'k0', 9.25, 0), (10, 'k0', 10.25, 1), (11, 'k0', 11.25, 2), (12, 'k0', 12.25, 3), (13, 'k0', 13.25, 4), (14, 'k0', 14.25, 5), (15, 'k0', 15.25, 6), (16, 'k0', 16.25, 7), (17, 'k0', 17.25, 8), (18, 'k0', 18.25, 0), (19, 'k0', 19.25, 1), (20, 'k0', 20.25, 2), (21, 'k0', 21.25, 3), (22, 'k0', 22.25, 4), (23, 'k0', 23.25, 5), (24, 'k0', 24.25, 6), (0, 'k1', 25.25, 7), (1, 'k1', 26.25, 8), (2, 'k1', 27.25, 0), (3, 'k1', 28.25, 1), (4, 'k1', 29.25, 2), (5, 'k1', 30.25, 3), (6, 'k1', 31.25, 4), (7, 'k1', 32.25, 5), (8, 'k1', 33.25, 6), (9, 'k1', 34.25, 7), (10, 'k1', 35.25, 8), (11, 'k1', 36.25, 0), (12, 'k1', 37.25, 1), (13, 'k1', 38.25, 2), (14, 'k1', 39.25, 3), (15, 'k1', 40.25, 4), (16, 'k1', 41.25, 5), (17, 'k1', 42.25, 6), (18, 'k1', 43.25, 7), (19, 'k1', 44.25, 8), (20, 'k1', 45.25, 0), (21, 'k1', 46.25, 1), (22, 'k1', 47.25, 2), (23, 'k1', 48.25, 3), (24, 'k1', 49.25, 4), (0, 'k2', 50.25, 5), (1, 'k2', 51.25, 6), (2, 'k2', 52.25, 7), (3, 'k2', 53.25, 8), (4, 'k2', 54.25, 0), (5, 'k2', 55.25, 1), (6, 'k2', 56.25, 2), (7, 'k2', 57.25, 3), (8, 'k2', 58.25, 4), (9, 'k2', 59.25, 5), (10, 'k2', 60.25, 6), (11, 'k2', 61.25, 7), (12, 'k2', 62.25, 8), (13, 'k2', 63.25, 0), (14, 'k2', 64.25, 1), (15, 'k2', 65.25, 2), (16, 'k2', 66.25, 3), (17, 'k2', 67.25, 4), (18, 'k2', 68.25, 5), (19, 'k2', 69.25, 6), (20, 'k2', 70.25, 7), (21, 'k2', 71.25, 8), (22, 'k2', 72.25, 0), (23, 'k2', 73.25, 1), (24, 'k2', 74.25, 2), (0, 'k3', 75.25, 3), (1, 'k3', 76.25, 4), (2, 'k3', 77.25, 5), (3, 'k3', 78.25, 6), (4, 'k3', 79.25, 7), (5, 'k3', 80.25, 8), (6, 'k3', 81.25, 0), (7, 'k3', 82.25, 1), (8, 'k3', 83.25, 2), (9, 'k3', 84.25, 3), (10, 'k3', 85.25, 4), (11, 'k3', 86.25, 5), (12, 'k3', 87.25, 6), (13, 'k3', 88.25, 7), (14, 'k3', 89.25, 8), (15, 'k3', 90.25, 0), (16, 'k3', 91.25, 1), (17, 'k3', 92.25, 2), (18, 'k3', 93.25, 3), (19, 'k3', 94.25, 4), (20, 'k3', 95.25, 5), (21, 'k3', 96.25, 6), (22, 'k3', 97.25, 7), (23, 'k3', 98.25, 8), (24, 'k3', 99.25, 0), (0, 'k4', 100.25, 1), (1, 'k4', 101.25, 2), (2, 'k4', 102.25, 3), (3, 'k4', 103.25, 4), (4, 'k4', 104.25, 5), (5, 'k4', 105.25, 6), (6, 'k4', 106.25, 7), (7, 'k4', 107.25, 8), (8, 'k4', 108.25, 0), (9, 'k4', 109.25, 1), (10, 'k4', 110.25, 2), (11, 'k4', 111.25, 3), (12, 'k4', 112.25, 4), (13, 'k4', 113.25, 5), (14, 'k4', 114.25, 6), (15, 'k4', 115.25, 7), (16, 'k4', 116.25, 8), (17, 'k4', 117.25, 0), (18, 'k4', 118.25, 1), (19, 'k4', 119.25, 2), (20, 'k4', 120.25, 3), (21, 'k4', 121.25, 4), (22, 'k4', 122.25, 5), (23, 'k4', 123.25, 6), (24, 'k4', 124.25, 7), (0, 'k5', 125.25, 8), (1, 'k5', 126.25, 0), (2, 'k5', 127.25, 1), (3, 'k5', 128.25, 2), (4, 'k5', 129.25, 3), (5, 'k5', 130.25, 4), (6, 'k5', 131.25, 5), (7, 'k5', 132.25, 6), (8, 'k5', 133.25, 7), (9, 'k5', 134.25, 8), (10, 'k5', 135.25, 0), (11, 'k5', 136.25, 1), (12, 'k5', 137.25, 2), (13, 'k5', 138.25, 3), (14, 'k5', 139.25, 4), (15, 'k5', 140.25, 5), (16, 'k5', 141.25, 6), (17, 'k5', 142.25, 7), (18, 'k5', 143.25, 8), (19, 'k5', 144.25, 0), (20, 'k5', 145.25, 1), (21, 'k5', 146.25, 2), (22, 'k5', 147.25, 3), (23, 'k5', 148.25, 4), (24, 'k5', 149.25, 5), (0, 'k6', 150.25, 6), (1, 'k6', 151.25, 7), (2, 'k6', 152.25, 8), (3, 'k6', 153.25, 0), (4, 'k6', 154.25, 1), (5, 'k6', 155.25, 2), (6, 'k6', 156.25, 3), (7, 'k6', 157.25, 4), (8, 'k6', 158.25, 5), (9, 'k6', 159.25, 6), (10, 'k6', 160.25, 7), (11, 'k6', 161.25, 8), (12, 'k6', 162.25, 0), (13, 'k6', 163.25, 1), (14, 'k6', 164.25, 2), (15, 'k6', 165.25, 3), (16, 'k6', 166.25, 4), (17, 'k6', 167.25, 5), (18, 'k6', 168.25, 6), (19, 'k6', 169.25, 7), (20, 'k6', 170.25, 8), (21, 'k6', 171.25, 0), (22, 'k6', 172.25, 1), (23, 'k6', 173.25, 2), (24, 'k6', 174.25, 3), (0, 'k7', 175.25, 4), (1, 'k7', 176.25, 5), (2, 'k7', 177.25, 6), (3, 'k7', 178.25, 7), (4, 'k7', 179.25, 8), (5, 'k7', 180.25, 0), (6, 'k7', 181.25, 1), (7, 'k7', 182.25, 2), (8, 'k7', 183.25, 3), (9, 'k7', 184.25, 4), (10, 'k7', 185.25, 5), (11, 'k7', 186.25, 6), (12, 'k7', 187.25, 7), (13, 'k7', 188.25, 8), (14, 'k7', 189.25, 0), (15, 'k7', 190.25, 1), (16, 'k7', 191.25, 2), (17, 'k7', 192.25, 3), (18, 'k7', 193.25, 4), (19, 'k7', 194.25, 5), (20, 'k7', 195.25, 6), (21, 'k7', 196.25, 7), (22, 'k7', 197.25, 8), (23, 'k7', 198.25, 0), (24, 'k7', 199.25, 1), (0, 'k8', 200.25, 2), (1, 'k8', 201.25, 3), (2, 'k8', 202.25, 4), (3, 'k8', 203.25, 5), (4, 'k8', 204.25, 6), (5, 'k8', 205.25, 7), (6, 'k8', 206.25, 8), (7, 'k8', 207.25, 0), (8, 'k8', 208.25, 1), (9, 'k8', 209.25, 2), (10, 'k8', 210.25, 3), (11, 'k8', 211.25, 4), (12, 'k8', 212.25, 5), (13, 'k8', 213.25, 6), (14, 'k8', 214.25, 7), (15, 'k8', 215.25, 8), (16, 'k8', 216.25, 0), (17, 'k8', 217.25, 1), (18, 'k8', 218.25, 2), (19, 'k8', 219.25, 3), (20, 'k8', 220.25, 4), (21, 'k8', 221.25, 5), (22, 'k8', 222.25, 6), (23, 'k8', 223.25, 7), (24, 'k8', 224.25, 8), (0, 'k9', 225.25, 0), (1, 'k9', 226.25, 1), (2, 'k9', 227.25, 2), (3, 'k9', 228.25, 3), (4, 'k9', 229.25, 4), (5, 'k9', 230.25, 5), (6, 'k9', 231.25, 6), (7, 'k9', 232.25, 7), (8, 'k9', 233.25, 8), (9, 'k9', 234.25, 0), (10, 'k9', 235.25, 1), (11, 'k9', 236.25, 2), (12, 'k9', 237.25, 3), (13, 'k9', 238.25, 4), (14, 'k9', 239.25, 5), (15, 'k9', 240.25, 6), (16, 'k9', 241.25, 7), (17, 'k9', 242.25, 8), (18, 'k9', 243.25, 0), (19, 'k9', 244.25, 1), (20, 'k9', 245.25, 2), (21, 'k9', 246.25, 3), (22, 'k9', 247.25, 4), (23, 'k9', 248.25, 5), (24, 'k9', 249.25, 6), (0, 'k10', 250.25, 7), (1, 'k10', 251.25, 8), (2, 'k10', 252.25, 0), (3, 'k10', 253.25, 1), (4, 'k10', 254.25, 2), (5, 'k10', 255.25, 3), (6, 'k10', 256.25, 4), (7, 'k10', 257.25, 5), (8, 'k10', 258.25, 6), (9, 'k10', 259.25, 7), (10, 'k10', 260.25, 8), (11, 'k10', 261.25, 0), (12, 'k10', 262.25, 1), (13, 'k10', 263.25, 2), (14, 'k10', 264.25, 3), (15, 'k10', 265.25, 4), (16, 'k10', 266.25, 5), (17, 'k10', 267.25, 6), (18, 'k10', 268.25, 7), (19, 'k10', 269.25, 8), (20, 'k10', 270.25, 0), (21, 'k10', 271.25, 1), (22, 'k10', 272.25, 2), (23, 'k10', 273.25, 3), (24, 'k10', 274.25, 4), (0, 'k11', 275.25, 5), (1, 'k11', 276.25, 6), (2, 'k11', 277.25, 7), (3, 'k11', 278.25, 8), (4, 'k11', 279.25, 0), (5, 'k11', 280.25, 1), (6, 'k11', 281.25, 2), (7, 'k11', 282.25, 3), (8, 'k11', 283.25, 4), (9, 'k11', 284.25, 5), (10, 'k11', 285.25, 6), (11, 'k11', 286.25, 7), (12, 'k11', 287.25, 8), (13, 'k11', 288.25, 0), (14, 'k11', 289.25, 1), (15, 'k11', 290.25, 2), (16, 'k11', 291.25, 3), (17, 'k11', 292.25, 4), (18, 'k11', 293.25, 5), (19, 'k11', 294.25, 6), (20, 'k11', 295.25, 7), (21, 'k11', 296.25, 8), (22, 'k11', 297.25, 0), (23, 'k11', 298.25, 1), (24, 'k11', 299.25, 2), (0, 'k12', 300.25, 3), (1, 'k12', 301.25, 4), (2, 'k12', 302.25, 5), (3, 'k12', 303.25, 6), (4, 'k12', 304.25, 7), (5, 'k12', 305.25, 8), (6, 'k12', 306.25, 0), (7, 'k12', 307.25, 1), (8, 'k12', 308.25, 2), (9, 'k12', 309.25, 3), (10, 'k12', 310.25, 4), (11, 'k12', 311.25, 5), (12, 'k12', 312.25, 6), (13, 'k12', 313.25, 7), (14, 'k12', 314.25, 8), (15, 'k12', 315.25, 0), (16, 'k12', 316.25, 1), (17, 'k12', 317.25, 2), (18, 'k12', 318.25, 3), (19, 'k12', 319.25, 4), (20, 'k12', 320.25, 5), (21, 'k12', 321.25, 6), (22, 'k12', 322.25, 7), (23, 'k12', 323.25, 8), (24, 'k12', 324.25, 0), (0, 'k13', 325.25, 1), (1, 'k13', 326.25, 2), (2, 'k13', 327.25, 3), (3, 'k13', 328.25, 4), (4, 'k13', 329.25, 5), (5, 'k13', 330.25, 6), (6, 'k13', 331.25, 7), (7, 'k13', 332.25, 8), (8, 'k13', 333.25, 0), (9, 'k13', 334.25, 1), (10, 'k13', 335.25, 2), (11, 'k13', 336.25, 3), (12, 'k13', 337.25, 4), (13, 'k13', 338.25, 5), (14, 'k13', 339.25, 6), (15, 'k13', 340.25, 7), (16, 'k13', 341.25, 8), (17, 'k13', 342.25, 0), (18, 'k13', 343.25, 1), (19, 'k13', 344.25, 2), (20, 'k13', 345.25, 3), (21, 'k13', 346.25, 4), (22, 'k13', 347.25, 5), (23, 'k13', 348.25, 6), (24, 'k13', 349.25, 7), (0, 'k14', 350.25, 8), (1, 'k14', 351.25, 0), (2, 'k14', 352.25, 1), (3, 'k14', 353.25, 2), (4, 'k14', 354.25, 3), (5, 'k14', 355.25, 4), (6, 'k14', 356.25, 5), (7, 'k14', 357.25, 6), (8, 'k14', 358.25, 7), (9, 'k14', 359.25, 8), (10, 'k14', 360.25, 0), (11, 'k14', 361.25, 1), (12, 'k14', 362.25, 2), (13, 'k14', 363.25, 3), (14, 'k14', 364.25, 4), (15, 'k14', 365.25, 5), (16, 'k14', 366.25, 6), (17, 'k14', 367.25, 7), (18, 'k14', 368.25, 8), (19, 'k14', 369.25, 0), (20, 'k14', 370.25, 1), (21, 'k14', 371.25, 2), (22, 'k14', 372.25, 3), (23, 'k14', 373.25, 4), (24, 'k14', 374.25, 5), (0, 'k15', 375.25, 6), (1, 'k15', 376.25, 7), (2, 'k15', 377.25, 8), (3, 'k15', 378.25, 0), (4, 'k15', 379.25, 1), (5, 'k15', 380.25, 2), (6, 'k15', 381.25, 3), (7, 'k15', 382.25, 4), (8, 'k15', 383.25, 5), (9, 'k15', 384.25, 6), (10, 'k15', 385.25, 7), (11, 'k15', 386.25, 8), (12, 'k15', 387.25, 0), (13, 'k15', 388.25, 1), (14, 'k15', 389.25, 2), (15, 'k15', 390.25, 3), (16, 'k15', 391.25, 4), (17, 'k15', 392.25, 5), (18, 'k15', 393.25, 6), (19, 'k15', 394.25, 7), (20, 'k15', 395.25, 8), (21, 'k15', 396.25, 0), (22, 'k15', 397.25, 1), (23, 'k15', 398.25, 2), (24, 'k15', 399.25, 3), (0, 'k16', 400.25, 4), (1, 'k16', 401.25, 5), (2, 'k16', 402.25, 6), (3, 'k16', 403.25, 7), (4, 'k16', 404.25, 8), (5, 'k16', 405.25, 0), (6, 'k16', 406.25, 1), (7, 'k16', 407.25, 2), (8, 'k16', 408.25, 3), (9, 'k16', 409.25, 4), (10, 'k16', 410.25, 5), (11, 'k16', 411.25, 6), (12, 'k16', 412.25, 7), (13, 'k16', 413.25, 8), (14, 'k16', 414.25, 0), (15, 'k16', 415.25, 1), (16, 'k16', 416.25, 2), (17, 'k16', 417.25, 3), (18, 'k16', 418.25, 4), (19, 'k16', 419.25, 5), (20, 'k16', 420.25, 6), (21, 'k16', 421.25, 7), (22, 'k16', 422.25, 8), (23, 'k16', 423.25, 0), (24, 'k16', 424.25, 1), (0, 'k17', 425.25, 2), (1, 'k17', 426.25, 3), (2, 'k17', 427.25, 4), (3, 'k17', 428.25, 5), (4, 'k17', 429.25, 6), (5, 'k17', 430.25, 7), (6, 'k17', 431.25, 8), (7, 'k17', 432.25, 0), (8, 'k17', 433.25, 1), (9, 'k17', 434.25, 2), (10, 'k17', 435.25, 3), (11, 'k17', 436.25, 4), (12, 'k17', 437.25, 5), (13, 'k17', 438.25, 6), (14, 'k17', 439.25, 7), (15, 'k17', 440.25, 8), (16, 'k17', 441.25, 0), (17, 'k17', 442.25, 1), (18, 'k17', 443.25, 2), (19, 'k17', 444.25, 3), (20, 'k17', 445.25, 4), (21, 'k17', 446.25, 5), (22, 'k17', 447.25, 6), (23, 'k17', 448.25, 7), (24, 'k17', 449.25, 8), (0, 'k18', 450.25, 0), (1, 'k18', 451.25, 1), (2, 'k18', 452.25, 2), (3, 'k18', 453.25, 3), (4, 'k18', 454.25, 4), (5, 'k18', 455.25, 5), (6, 'k18', 456.25, 6), (7, 'k18', 457.25, 7), (8, 'k18', 458.25, 8), (9, 'k18', 459.25, 0), (10, 'k18', 460.25, 1), (11, 'k18', 461.25, 2), (12, 'k18', 462.25, 3), (13, 'k18', 463.25, 4), (14, 'k18', 464.25, 5), (15, 'k18', 465.25, 6), (16, 'k18', 466.25, 7), (17, 'k18', 467.25, 8), (18, 'k18', 468.25, 0), (19, 'k18', 469.25, 1), (20, 'k18', 470.25, 2), (21, 'k18', 471.25, 3), (22, 'k18', 472.25, 4), (23, 'k18', 473.25, 5), (24, 'k18', 474.25, 6), (0, 'k19', 475.25, 7), (1, 'k19', 476.25, 8), (2, 'k19', 477.25, 0), (3, 'k19', 478.25, 1), (4, 'k19', 479.25, 2), (5, 'k19', 480.25, 3), (6, 'k19', 481.25, 4), (7, 'k19', 482.25, 5), (8, 'k19', 483.25, 6), (9, 'k19', 484.25, 7), (10, 'k19', 485.25, 8), (11, 'k19', 486.25, 0), (12, 'k19', 487.25, 1), (13, 'k19', 488.25, 2), (14, 'k19', 489.25, 3), (15, 'k19', 490.25, 4), (16, 'k19', 491.25, 5), (17, 'k19', 492.25, 6), (18, 'k19', 493.25, 7), (19, 'k19', 494.25, 8), (20, 'k19', 495.25, 0), (21, 'k19', 496.25, 1), (22, 'k19', 497.25, 2), (23, 'k19', 498.25, 3), (24, 'k19', 499.25, 4), (0, 'k20', 500.25, 5), (1, 'k20', 501.25, 6), (2, 'k20', 502.25, 7), (3, 'k20', 503.25, 8), (4, 'k20', 504.25, 0), (5, 'k20', 505.25, 1), (6, 'k20', 506.25, 2), (7, 'k20', 507.25, 3), (8, 'k20', 508.25, 4), (9, 'k20', 509.25, 5), (10, 'k20', 510.25, 6), (11, 'k20', 511.25, 7), (12, 'k20', 512.25, 8), (13, 'k20', 513.25, 0), (14, 'k20', 514.25, 1), (15, 'k20', 515.25, 2), (16, 'k20', 516.25, 3), (17, 'k20', 517.25, 4), (18, 'k20', 518.25, 5), (19, 'k20', 519.25, 6), (20, 'k20', 520.25, 7), (21, 'k20', 521.25, 8), (22, 'k20', 522.25, 0), (23, 'k20', 523.25, 1), (24, 'k20', 524.25, 2), (0, 'k21', 525.25, 3), (1, 'k21', 526.25, 4), (2, 'k21', 527.25, 5), (3, 'k21', 528.25, 6), (4, 'k21', 529.25, 7), (5, 'k21', 530.25, 8), (6, 'k21', 531.25, 0), (7, 'k21', 532.25, 1), (8, 'k21', 533.25, 2), (9, 'k21', 534.25, 3), (10, 'k21', 535.25, 4), (11, 'k21', 536.25, 5), (12, 'k21', 537.25, 6), (13, 'k21', 538.25, 7), (14, 'k21', 539.25, 8), (15, 'k21', 540.25, 0), (16, 'k21', 541.25, 1), (17, 'k21', 542.25, 2), (18, 'k21', 543.25, 3), (19, 'k21', 544.25, 4), (20, 'k21', 545.25, 5), (21, 'k21', 546.25, 6), (22, 'k21', 547.25, 7), (23, 'k21', 548.25, 8), (24, 'k21', 549.25, 0), (0, 'k22', 550.25, 1), (1, 'k22', 551.25, 2), (2, 'k22', 552.25, 3), (3, 'k22', 553.25, 4), (4, 'k22', 554.25, 5), (5, 'k22', 555.25, 6), (6, 'k22', 556.25, 7), (7, 'k22', 557.25, 8), (8, 'k22', 558.25, 0), (9, 'k22', 559.25, 1), (10, 'k22', 560.25, 2), (11, 'k22', 561.25, 3), (12, 'k22', 562.25, 4), (13, 'k22', 563.25, 5), (14, 'k22', 564.25, 6), (15, 'k22', 565.25, 7), (16, 'k22', 566.25, 8), (17, 'k22', 567.25, 0), (18, 'k22', 568.25, 1), (19, 'k22', 569.25, 2), (20, 'k22', 570.25, 3), (21, 'k22', 571.25, 4), (22, 'k22', 572.25, 5), (23, 'k22', 573.25, 6), (24, 'k22', 574.25, 7), (0, 'k23', 575.25, 8), (1, 'k23', 576.25, 0), (2, 'k23', 577.25, 1), (3, 'k23', 578.25, 2), (4, 'k23', 579.25, 3), (5, 'k23', 580.25, 4), (6, 'k23', 581.25, 5), (7, 'k23', 582.25, 6), (8, 'k23', 583.25, 7), (9, 'k23', 584.25, 8), (10, 'k23', 585.25, 0), (11, 'k23', 586.25, 1), (12, 'k23', 587.25, 2), (13, 'k23', 588.25, 3), (14, 'k23', 589.25, 4), (15, 'k23', 590.25, 5), (16, 'k23', 591.25, 6), (17, 'k23', 592.25, 7), (18, 'k23', 593.25, 8), (19, 'k23', 594.25, 0), (20, 'k23', 595.25, 1), (21, 'k23', 596.25, 2), (22, 'k23', 597.25, 3), (23, 'k23', 598.25, 4), (24, 'k23', 599.25, 5), (0, 'k24', 600.25, 6), (1, 'k24', 601.25, 7), (2, 'k24', 602.25, 8), (3, 'k24', 603.25, 0), (4, 'k24', 604.25, 1), (5, 'k24', 605.25, 2), (6, 'k24', 606.25, 3), (7, 'k24', 607.25, 4), (8, 'k24', 608.25, 5), (9, 'k24', 609.25, 6), (10, 'k24', 610.25, 7), (11, 'k24', 611.25, 8), (12, 'k24', 612.25, 0), (13, 'k24', 613.25, 1), (14, 'k24', 614.25, 2), (15, 'k24', 615.25, 3), (16, 'k24', 616.25, 4), (17, 'k24', 617.25, 5), (18, 'k24', 618.25, 6), (19, 'k24', 619.25, 7), (20, 'k24', 620.25, 8), (21, 'k24', 621.25, 0), (22, 'k24', 622.25, 1), (23, 'k24', 623.25, 2), (24, 'k24', 624.25, 3), (0, 'k25', 625.25, 4), (1, 'k25', 626.25, 5), (2, 'k25', 627.25, 6), (3, 'k25', 628.25, 7), (4, 'k25', 629.25, 8), (5, 'k25', 630.25, 0), (6, 'k25', 631.25, 1), (7, 'k25', 632.25, 2), (8, 'k25', 633.25, 3), (9, 'k25', 634.25, 4), (10, 'k25', 635.25, 5), (11, 'k25', 636.25, 6), (12, 'k25', 637.25, 7), (13, 'k25', 638.25, 8), (14, 'k25', 639.25, 0), (15, 'k25', 640.25, 1), (16, 'k25', 641.25, 2), (17, 'k25', 642.25, 3), (18, 'k25', 643.25, 4), (19, 'k25', 644.25, 5), (20, 'k25', 645.25, 6), (21, 'k25', 646.25, 7), (22, 'k25', 647.25, 8), (23, 'k25', 648.25, 0), (24, 'k25', 649.25, 1), (0, 'k26', 650.25, 2), (1, 'k26', 651.25, 3), (2, 'k26', 652.25, 4), (3, 'k26', 653.25, 5), (4, 'k26', 654.25, 6), (5, 'k26', 655.25, 7), (6, 'k26', 656.25, 8), (7, 'k26', 657.25, 0), (8, 'k26', 658.25, 1), (9, 'k26', 659.25, 2), (10, 'k26', 660.25, 3), (11, 'k26', 661.25, 4), (12, 'k26', 662.25, 5), (13, 'k26', 663.25, 6), (14, 'k26', 664.25, 7), (15, 'k26', 665.25, 8), (16, 'k26', 666.25, 0), (17, 'k26', 667.25, 1), (18, 'k26', 668.25, 2), (19, 'k26', 669.25, 3), (20, 'k26', 670.25, 4), (21, 'k26', 671.25, 5), (22, 'k26', 672.25, 6), (23, 'k26', 673.25, 7), (24, 'k26', 674.25, 8), (0, 'k27', 675.25, 0), (1, 'k27', 676.25, 1), (2, 'k27', 677.25, 2), (3, 'k27', 678.25, 3), (4, 'k27', 679.25, 4), (5, 'k27', 680.25, 5), (6, 'k27', 681.25, 6), (7, 'k27', 682.25, 7), (8, 'k27', 683.25, 8), (9, 'k27', 684.25, 0), (10, 'k27', 685.25, 1), (11, 'k27', 686.25, 2), (12, 'k27', 687.25, 3), (13, 'k27', 688.25, 4), (14, 'k27', 689.25, 5), (15, 'k27', 690.25, 6), (16, 'k27', 691.25, 7), (17, 'k27', 692.25, 8), (18, 'k27', 693.25, 0), (19, 'k27', 694.25, 1), (20, 'k27', 695.25, 2), (21, 'k27', 696.25, 3), (22, 'k27', 697.25, 4), (23, 'k27', 698.25, 5), (24, 'k27', 699.25, 6), (0, 'k28', 700.25, 7), (1, 'k28', 701.25, 8), (2, 'k28', 702.25, 0), (3, 'k28', 703.25, 1), (4, 'k28', 704.25, 2), (5, 'k28', 705.25, 3), (6, 'k28', 706.25, 4), (7, 'k28', 707.25, 5), (8, 'k28', 708.25, 6), (9, 'k28', 709.25, 7), (10, 'k28', 710.25, 8), (11, 'k28', 711.25, 0), (12, 'k28', 712.25, 1), (13, 'k28', 713.25, 2), (14, 'k28', 714.25, 3), (15, 'k28', 715.25, 4), (16, 'k28', 716.25, 5), (17, 'k28', 717.25, 6), (18, 'k28', 718.25, 7), (19, 'k28', 719.25, 8), (20, 'k28', 720.25, 0), (21, 'k28', 721.25, 1), (22, 'k28', 722.25, 2), (23, 'k28', 723.25, 3), (24, 'k28', 724.25, 4), (0, 'k29', 725.25, 5), (1, 'k29', 726.25, 6), (2, 'k29', 727.25, 7), (3, 'k29', 728.25, 8), (4, 'k29', 729.25, 0), (5, 'k29', 730.25, 1), (6, 'k29', 731.25, 2), (7, 'k29', 732.25, 3), (8, 'k29', 733.25, 4), (9, 'k29', 734.25, 5), (10, 'k29', 735.25, 6), (11, 'k29', 736.25, 7), (12, 'k29', 737.25, 8), (13, 'k29', 738.25, 0), (14, 'k29', 739.25, 1), (15, 'k29', 740.25, 2), (16, 'k29', 741.25, 3), (17, 'k29', 742.25, 4), (18, 'k29', 743.25, 5), (19, 'k29', 744.25, 6), (20, 'k29', 745.25, 7), (21, 'k29', 746.25, 8), (22, 'k29', 747.25, 0), (23, 'k29', 748.25, 1), (24, 'k29', 749.25, 2), (0, 'k30', 750.25, 3), (1, 'k30', 751.25, 4), (2, 'k30', 752.25, 5), (3, 'k30', 753.25, 6), (4, 'k30', 754.25, 7), (5, 'k30', 755.25, 8), (6, 'k30', 756.25, 0), (7, 'k30', 757.25, 1), (8, 'k30', 758.25, 2), (9, 'k30', 759.25, 3), (10, 'k30', 760.25, 4), (11, 'k30', 761.25, 5), (12, 'k30', 762.25, 6), (13, 'k30', 763.25, 7), (14, 'k30', 764.25, 8), (15, 'k30', 765.25, 0), (16, 'k30', 766.25, 1), (17, 'k30', 767.25, 2), (18, 'k30', 768.25, 3), (19, 'k30', 769.25, 4), (20, 'k30', 770.25, 5), (21, 'k30', 771.25, 6), (22, 'k30', 772.25, 7), (23, 'k30', 773.25, 8), (24, 'k30', 774.25, 0), (0, 'k31', 775.25, 1), (1, 'k31', 776.25, 2), (2, 'k31', 777.25, 3), (3, 'k31', 778.25, 4), (4, 'k31', 779.25, 5), (5, 'k31', 780.25, 6), (6, 'k31', 781.25, 7), (7, 'k31', 782.25, 8), (8, 'k31', 783.25, 0), (9, 'k31', 784.25, 1), (10, 'k31', 785.25, 2), (11, 'k31', 786.25, 3), (12, 'k31', 787.25, 4), (13, 'k31', 788.25, 5), (14, 'k31', 789.25, 6), (15, 'k31', 790.25, 7), (16, 'k31', 791.25, 8), (17, 'k31', 792.25, 0), (18, 'k31', 793.25, 1), (19, 'k31', 794.25, 2), (20, 'k31', 795.25, 3), (21, 'k31', 796.25, 4), (22, 'k31', 797.25, 5), (23, 'k31', 798.25, 6), (24, 'k31', 799.25, 7), (0, 'k32', 800.25, 8), (1, 'k32', 801.25, 0), (2, 'k32', 802.25, 1), (3, 'k32', 803.25, 2), (4, 'k32', 804.25, 3), (5, 'k32', 805.25, 4), (6, 'k32', 806.25, 5), (7, 'k32', 807.25, 6), (8, 'k32', 808.25, 7), (9, 'k32', 809.25, 8), (10, 'k32', 810.25, 0), (11, 'k32', 811.25, 1), (12, 'k32', 812.25, 2), (13, 'k32', 813.25, 3), (14, 'k32', 814.25, 4), (15, 'k32', 815.25, 5), (16, 'k32', 816.25, 6), (17, 'k32', 817.25, 7), (18, 'k32', 818.25, 8), (19, 'k32', 819.25, 0), (20, 'k32', 820.25, 1), (21, 'k32', 821.25, 2), (22, 'k32', 822.25, 3), (23, 'k32', 823.25, 4), (24, 'k32', 824.25, 5), (0, 'k33', 825.25, 6), (1, 'k33', 826.25, 7), (2, 'k33', 827.25, 8), (3, 'k33', 828.25, 0), (4, 'k33', 829.25, 1), (5, 'k33', 830.25, 2), (6, 'k33', 831.25, 3), (7, 'k33', 832.25, 4), (8, 'k33', 833.25, 5), (9, 'k33', 834.25, 6), (10, 'k33', 835.25, 7), (11, 'k33', 836.25, 8), (12, 'k33', 837.25, 0), (13, 'k33', 838.25, 1), (14, 'k33', 839.25, 2), (15, 'k33', 840.25, 3), (16, 'k33', 841.25, 4), (17, 'k33', 842.25, 5), (18, 'k33', 843.25, 6), (19, 'k33', 844.25, 7), (20, 'k33', 845.25, 8), (21, 'k33', 846.25, 0), (22, 'k33', 847.25, 1), (23, 'k33', 848.25, 2), (24, 'k33', 849.25, 3), (0, 'k34', 850.25, 4), (1, 'k34', 851.25, 5), (2, 'k34', 852.25, 6), (3, 'k34', 853.25, 7), (4, 'k34', 854.25, 8), (5, 'k34', 855.25, 0), (6, 'k34', 856.25, 1), (7, 'k34', 857.25, 2), (8, 'k34', 858.25, 3), (9, 'k34', 859.25, 4), (10, 'k34', 860.25, 5), (11, 'k34', 861.25, 6), (12, 'k34', 862.25, 7), (13, 'k34', 863.25, 8), (14, 'k34', 864.25, 0), (15, 'k34', 865.25, 1), (16, 'k34', 866.25, 2), (17, 'k34', 867.25, 3), (18, 'k34', 868.25, 4), (19, 'k34', 869.25, 5), (20, 'k34', 870.25, 6), (21, 'k34', 871.25, 7), (22, 'k34', 872.25, 8), (23, 'k34', 873.25, 0), (24, 'k34', 874.25, 1), (0, 'k35', 875.25, 2), (1, 'k35', 876.25, 3), (2, 'k35', 877.25, 4), (3, 'k35', 878.25, 5), (4, 'k35', 879.25, 6), (5, 'k35', 880.25, 7), (6, 'k35', 881.25, 8), (7, 'k35', 882.25, 0), (8, 'k35', 883.25, 1), (9, 'k35', 884.25, 2), (10, 'k35', 885.25, 3), (11, 'k35', 886.25, 4), (12, 'k35', 887.25, 5), (13, 'k35', 888.25, 6), (14, 'k35', 889.25, 7), (15, 'k35', 890.25, 8), (16, 'k35', 891.25, 0), (17, 'k35', 892.25, 1), (18, 'k35', 893.25, 2), (19, 'k35', 894.25, 3), (20, 'k35', 895.25, 4), (21, 'k35', 896.25, 5), (22, 'k35', 897.25, 6), (23, 'k35', 898.25, 7), (24, 'k35', 899.25, 8), (0, 'k36', 900.25, 0), (1, 'k36', 901.25, 1), (2, 'k36', 902.25, 2), (3, 'k36', 903.25, 3), (4, 'k36', 904.25, 4), (5, 'k36', 905.25, 5), (6, 'k36', 906.25, 6), (7, 'k36', 907.25, 7), (8, 'k36', 908.25, 8), (9, 'k36', 909.25, 0), (10, 'k36', 910.25, 1), (11, 'k36', 911.25, 2), (12, 'k36', 912.25, 3), (13, 'k36', 913.25, 4), (14, 'k36', 914.25, 5), (15, 'k36', 915.25, 6), (16, 'k36', 916.25, 7), (17, 'k36', 917.25, 8), (18, 'k36', 918.25, 0), (19, 'k36', 919.25, 1), (20, 'k36', 920.25, 2), (21, 'k36', 921.25, 3), (22, 'k36', 922.25, 4), (23, 'k36', 923.25, 5), (24, 'k36', 924.25, 6), (0, 'k37', 925.25, 7), (1, 'k37', 926.25, 8), (2, 'k37', 927.25, 0), (3, 'k37', 928.25, 1), (4, 'k37', 929.25, 2), (5, 'k37', 930.25, 3), (6, 'k37', 931.25, 4), (7, 'k37', 932.25, 5), (8, 'k37', 933.25, 6), (9, 'k37', 934.25, 7), (10, 'k37', 935.25, 8), (11, 'k37', 936.25, 0), (12, 'k37', 937.25, 1), (13, 'k37', 938.25, 2), (14, 'k37', 939.25, 3), (15, 'k37', 940.25, 4), (16, 'k37', 941.25, 5), (17, 'k37', 942.25, 6), (18, 'k37', 943.25, 7), (19, 'k37', 944.25, 8), (20, 'k37', 945.25, 0), (21, 'k37', 946.25, 1), (22, 'k37', 947.25, 2), (23, 'k37', 948.25, 3), (24, 'k37', 949.25, 4), (0, 'k38', 950.25, 5), (1, 'k38', 951.25, 6), (2, 'k38', 952.25, 7), (3, 'k38', 953.25, 8), (4, 'k38', 954.25, 0), (5, 'k38', 955.25, 1), (6, 'k38', 956.25, 2), (7, 'k38', 957.25, 3), (8, 'k38', 958.25, 4), (9, 'k38', 959.25, 5), (10, 'k38', 960.25, 6), (11, 'k38', 961.25, 7), (12, 'k38', 962.25, 8), (13, 'k38', 963.25, 0), (14, 'k38', 964.25, 1), (15, 'k38', 965.25, 2), (16, 'k38', 966.25, 3), (17, 'k38', 967.25, 4), (18, 'k38', 968.25, 5), (19, 'k38', 969.25, 6), (20, 'k38', 970.25, 7), (21, 'k38', 971.25, 8), (22, 'k38', 972.25, 0), (23, 'k38', 973.25, 1), (24, 'k38', 974.25, 2), (0, 'k39', 975.25, 3), (1, 'k39', 976.25, 4), (2, 'k39', 977.25, 5), (3, 'k39', 978.25, 6), (4, 'k39', 979.25, 7), (5, 'k39', 980.25, 8), (6, 'k39', 981.25, 0), (7, 'k39', 982.25, 1), (8, 'k39', 983.25, 2), (9, 'k39', 984.25, 3), (10, 'k39', 985.25, 4), (11, 'k39', 986.25, 5), (12, 'k39', 987.25, 6), (13, 'k39', 988.25, 7), (14, 'k39', 989.25, 8), (15, 'k39', 990.25, 0), (16, 'k39', 991.25, 1), (17, 'k39', 992.25, 2), (18, 'k39', 993.25, 3), (19, 'k39', 994.25, 4), (20, 'k39', 995.25, 5), (21, 'k39', 996.25, 6), (22, 'k39', 997.25, 7), (23, 'k39', 998.25, 8), (24, 'k39', 999.25, 0);
+CREATE INDEX RCD ON R(D, C);
+CREATE TABLE S(X INT, Y INT, Z VARCHAR);
+INSERT INTO S VALUES (0, 0, 'k0'), (1, 1, 'k1'), (2, 2, 'k2'), (3, 3, 'k3'), (4, 4, 'k4'), (5, 5, 'k5'), (6, 6, 'k6'), (7, 7, 'k7'), (8, 8, 'k8'), (9, 9, 'k9'), (0, 10, 'k10'), (1, 11, 'k11'), (2, 12, 'k12'), (3, 13, 'k13'), (4, 14, 'k14'), (5, 15, 'k15'), (6, 16, 'k16'), (7, 17, 'k17'), (8, 18, 'k18'), (9, 19, 'k19'), (0, 20, 'k20'), (1, 21, 'k21'), (2, 22, 'k22'), (3, 23, 'k23'), (4, 24, 'k24'), (5, 0, 'k25'), (6, 1, 'k26'), (7, 2, 'k27'), (8, 3, 'k28'), (9, 4, 'k29'), (0, 5, 'k30'), (1, 6, 'k31'), (2, 7, 'k32'), (3, 8, 'k33'), (4, 9, 'k34'), (5, 10, 'k35'), (6, 11, 'k36'), (7, 12, 'k37'), (8, 13, 'k38'), (9, 14, 'k39'), (0, 15, 'k0'), (1, 16, 'k1'), (2, 17, 'k2'), (3, 18, 'k3'), (4, 19, 'k4'), (5, 20, 'k5'), (6, 21, 'k6'), (7, 22, 'k7'), (8, 23, 'k8'), (9, 24, 'k9'), (0, 0, 'k10'), (1, 1, 'k11'), (2, 2, 'k12'), (3, 3, 'k13'), (4, 4, 'k14'), (5, 5, 'k15'), (6, 6, 'k16'), (7, 7, 'k17'), (8, 8, 'k18'), (9, 9, 'k19'), (0, 10, 'k20'), (1, 11, 'k21'), (2, 12, 'k22'), (3, 13, 'k23'), (4, 14, 'k24'), (5, 15, 'k25'), (6, 16, 'k26'), (7, 17, 'k27'), (8, 18, 'k28'), (9, 19, 'k29'), (0, 20, 'k30'), (1, 21, 'k31'), (2, 22, 'k32'), (3, 23, 'k33'), (4, 24, 'k34'), (5, 0, 'k35'), (6, 1, 'k36'), (7, 2, 'k37'), (8, 3, 'k38'), (9, 4, 'k39'), (0, 5, 'k0'), (1, 6, 'k1'), (2, 7, 'k2'), (3, 8, 'k3'), (4, 9, 'k4'), (5, 10, 'k5'), (6, 11, 'k6'), (7, 12, 'k7'), (8, 13, 'k8'), (9, 14, 'k9'), (0, 15, 'k10'), (1, 16, 'k11'), (2, 17, 'k12'), (3, 18, 'k13'), (4, 19, 'k14'), (5, 20, 'k15'), (6, 21, 'k16'), (7, 22, 'k17'), (8, 23, 'k18'), (9, 24, 'k19'), (0, 0, 'k20'), (1, 1, 'k21'), (2, 2, 'k22'), (3, 3, 'k23'), (4, 4, 'k24'), (5, 5, 'k25'), (6, 6, 'k26'), (7, 7, 'k27'), (8, 8, 'k28'), (9, 9, 'k29'), (0, 10, 'k30'), (1, 11, 'k31'), (2, 12, 'k32'), (3, 13, 'k33'), (4, 14, 'k34'), (5, 15, 'k35'), (6, 16, 'k36'), (7, 17, 'k37'), (8, 18, 'k38'), (9, 19, 'k39'), (0, 20, 'k0'), (1, 21, 'k1'), (2, 22, 'k2'), (3, 23, 'k3'), (4, 24, 'k4'), (5, 0, 'k5'), (6, 1, 'k6'), (7, 2, 'k7'), (8, 3, 'k8'), (9, 4, 'k9'), (0, 5, 'k10'), (1, 6, 'k11'), (2, 7, 'k12'), (3, 8, 'k13'), (4, 9, 'k14'), (5, 10, 'k15'), (6, 11, 'k16'), (7, 12, 'k17'), (8, 13, 'k18'), (9, 14, 'k19'), (0, 15, 'k20'), (1, 16, 'k21'), (2, 17, 'k22'), (3, 18, 'k23'), (4, 19, 'k24'), (5, 20, 'k25'), (6, 21, 'k26'), (7, 22, 'k27'), (8, 23, 'k28'), (9, 24, 'k29'), (0, 0, 'k30'), (1, 1, 'k31'), (2, 2, 'k32'), (3, 3, 'k33'), (4, 4, 'k34'), (5, 5, 'k35'), (6, 6, 'k36'), (7, 7, 'k37'), (8, 8, 'k38'), (9, 9, 'k39'), (0, 10, 'k0'), (1, 11, 'k1'), (2, 12, 'k2'), (3, 13, 'k3'), (4, 14, 'k4'), (5, 15, 'k5'), (6, 16, 'k6'), (7, 17, 'k7'), (8, 18, 'k8'), (9, 19, 'k9'), (0, 20, 'k10'), (1, 21, 'k11'), (2, 22, 'k12'), (3, 23, 'k13'), (4, 24, 'k14'), (5, 0, 'k15'), (6, 1, 'k16'), (7, 2, 'k17'), (8, 3, 'k18'), (9, 4, 'k19'), (0, 5, 'k20'), (1, 6, 'k21'), (2, 7, 'k22'), (3, 8, 'k23'), (4, 9, 'k24'), (5, 10, 'k25'), (6, 11, 'k26'), (7, 12, 'k27'), (8, 13, 'k28'), (9, 14, 'k29'), (0, 15, 'k30'), (1, 16, 'k31'), (2, 17, 'k32'), (3, 18, 'k33'), (4, 19, 'k34'), (5, 20, 'k35'), (6, 21, 'k36'), (7, 22, 'k37'), (8, 23, 'k38'), (9, 24, 'k39'), (0, 0, 'k0'), (1, 1, 'k1'), (2, 2, 'k2'), (3, 3, 'k3'), (4, 4, 'k4'), (5, 5, 'k5'), (6, 6, 'k6'), (7, 7, 'k7'), (8, 8, 'k8'), (9, 9, 'k9'), (0, 10, 'k10'), (1, 11, 'k11'), (2, 12, 'k12'), (3, 13, 'k13'), (4, 14, 'k14'), (5, 15, 'k15'), (6, 16, 'k16'), (7, 17, 'k17'), (8, 18, 'k18'), (9, 19, 'k19'), (0, 20, 'k20'), (1, 21, 'k21'), (2, 22, 'k22'), (3, 23, 'k23'), (4, 24, 'k24'), (5, 0, 'k25'), (6, 1, 'k26'), (7, 2, 'k27'), (8, 3, 'k28'), (9, 4, 'k29'), (0, 5, 'k30'), (1, 6, 'k31'), (2, 7, 'k32'), (3, 8, 'k33'), (4, 9, 'k34'), (5, 10, 'k35'), (6, 11, 'k36'), (7, 12, 'k37'), (8, 13, 'k38'), (9, 14, 'k39'), (0, 15, 'k0'), (1, 16, 'k1'), (2, 17, 'k2'), (3, 18, 'k3'), (4, 19, 'k4'), (5, 20, 'k5'), (6, 21, 'k6'), (7, 22, 'k7'), (8, 23, 'k8'), (9, 24, 'k9'), (0, 0, 'k10'), (1, 1, 'k11'), (2, 2, 'k12'), (3, 3, 'k13'), (4, 4, 'k14'), (5, 5, 'k15'), (6, 6, 'k16'), (7, 7, 'k17'), (8, 8, 'k18'), (9, 9, 'k19'), (0, 10, 'k20'), (1, 11, 'k21'), (2, 12, 'k22'), (3, 13, 'k23'), (4, 14, 'k24'), (5, 15, 'k25'), (6, 16, 'k26'), (7, 17, 'k27'), (8, 18, 'k28'), (9, 19, 'k29'), (0, 20, 'k30'), (1, 21, 'k31'), (2, 22, 'k32'), (3, 23, 'k33'), (4, 24, 'k34'), (5, 0, 'k35'), (6, 1, 'k36'), (7, 2, 'k37'), (8, 3, 'k38'), (9, 4, 'k39'), (0, 5, 'k0'), (1, 6, 'k1'), (2, 7, 'k2'), (3, 8, 'k3'), (4, 9, 'k4'), (5, 10, 'k5'), (6, 11, 'k6'), (7, 12, 'k7'), (8, 13, 'k8'), (9, 14, 'k9'), (0, 15, 'k10'), (1, 16, 'k11'), (2, 17, 'k12'), (3, 18, 'k13'), (4, 19, 'k14'), (5, 20, 'k15'), (6, 21, 'k16'), (7, 22, 'k17'), (8, 23, 'k18'), (9, 24, 'k19'), (0, 0, 'k20'), (1, 1, 'k21'), (2, 2, 'k22'), (3, 3, 'k23'), (4, 4, 'k24'), (5, 5, 'k25'), (6, 6, 'k26'), (7, 7, 'k27'), (8, 8, 'k28'), (9, 9, 'k29'), (0, 10, 'k30'), (1, 11, 'k31'), (2, 12, 'k32'), (3, 13, 'k33'), (4, 14, 'k34'), (5, 15, 'k35'), (6, 16, 'k36'), (7, 17, 'k37'), (8, 18, 'k38'), (9, 19, 'k39'), (0, 20, 'k0'), (1, 21, 'k1'), (2, 22, 'k2'), (3, 23, 'k3'), (4, 24, 'k4'), (5, 0, 'k5'), (6, 1, 'k6'), (7, 2, 'k7'), (8, 3, 'k8'), (9, 4, 'k9'), (0, 5, 'k10'), (1, 6, 'k11'), (2, 7, 'k12'), (3, 8, 'k13'), (4, 9, 'k14'), (5, 10, 'k15'), (6, 11, 'k16'), (7, 12, 'k17'), (8, 13, 'k18'), (9, 14, 'k19'), (0, 15, 'k20'), (1, 16, 'k21'), (2, 17, 'k22'), (3, 18, 'k23'), (4, 19, 'k24'), (5, 20, 'k25'), (6, 21, 'k26'), (7, 22, 'k27'), (8, 23, 'k28'), (9, 24, 'k29'), (0, 0, 'k30'), (1, 1, 'k31'), (2, 2, 'k32'), (3, 3, 'k33'), (4, 4, 'k34'), (5, 5, 'k35'), (6, 6, 'k36'), (7, 7, 'k37'), (8, 8, 'k38'), (9, 9, 'k39'), (0, 10, 'k0'), (1, 11, 'k1'), (2, 12, 'k2'), (3, 13, 'k3'), (4, 14, 'k4'), (5, 15, 'k5'), (6, 16, 'k6'), (7, 17, 'k7'), (8, 18, 'k8'), (9, 19, 'k9'), (0, 20, 'k10'), (1, 21, 'k11'), (2, 22, 'k12'), (3, 23, 'k13'), (4, 24, 'k14'), (5, 0, 'k15'), (6, 1, 'k16'), (7, 2, 'k17'), (8, 3, 'k18'), (9, 4, 'k19'), (0, 5, 'k20'), (1, 6, 'k21'), (2, 7, 'k22'), (3, 8, 'k23'), (4, 9, 'k24'), (5, 10, 'k25'), (6, 11, 'k26'), (7, 12, 'k27'), (8, 13, 'k28'), (9, 14, 'k29'), (0, 15, 'k30'), (1, 16, 'k31'), (2, 17, 'k32'), (3, 18, 'k33'), (4, 19, 'k34'), (5, 20, 'k35'), (6, 21, 'k36'), (7, 22, 'k37'), (8, 23, 'k38'), (9, 24, 'k39');
+CREATE INDEX SYZ ON S(Y, Z);
+SELECT * FROM R WHERE A = 3 AND B = 'k7';
+SELECT B, C FROM R WHERE A = 24;
+SELECT A, B FROM R WHERE A >= 5 AND A < 7 AND D = 0;
+SELECT A, C FROM R WHERE D = 4 AND C > 900.0;
+SELECT X, Y FROM S WHERE Y = 3 AND Z = 'k3';
+SELECT R.C, S.X FROM R, S WHERE R.A = S.Y AND R.B = S.Z AND S.X < 2;
+DELETE FROM R WHERE A = 3;
+SELECT * FROM R WHERE A = 3 AND B = 'k7';
+INSERT INTO R VALUES (3, 'k7', 0.5, 100);
+SELECT * FROM R WHERE A = 3;
+SELECT A, B FROM R WHERE D = 100;
@@ -0,0 +1,49 @@
+import pytest
+import datetime
+import subprocess
+
+from ddb.parser import parse_all
+from ddb.primitives import ValType
+from ddb.storage import KeyCodec
+
+testcase_dir = "tests/composite/"
+T = 1
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_composite_{t_id}")
+
+@pytest.mark.parametrize("key_type, keys", [
+    (ValType.INTEGER, [-2**63, -2**31 - 1, -300, -1, 0, 1, 255, 256, 2**40, 2**63 - 1]),
+    (ValType.FLOAT, [float('-inf'), -1e300, -2.5, -1e-300, 0.0, 1e-300, 0.125, 3.0, 1e300, float('inf')]),
+    (ValType.VARCHAR, ['', '\0', '\0\0', '\0a', 'a', 'a\0', 'a\0b', 'ab', 'b', 'é', '東京']),
+    (ValType.DATETIME, [datetime.datetime(1, 1, 1), datetime.datetime(1999, 12, 31, 23, 59, 59, 999999),
+                        datetime.datetime(2000, 1, 1), datetime.datetime(9999, 12, 31)]),
+    (ValType.BOOLEAN, [False, True]),
+    ((ValType.VARCHAR, ValType.INTEGER), [(None, None), (None, 5), ('', -1), ('', 0), ('a', -7), ('a', 3), ('a\0', -9), ('ab', 0)]),
+])
+def test_key_order(key_type, keys):
+    # packed keys must sort just like the keys themselves (with NULL first):
+    codec = KeyCodec.for_key_type(key_type)
+    packed = [ codec.pack(key) for key in keys ]
+    assert packed == sorted(packed) and len(set(packed)) == len(packed)
+    assert [ codec.unpack(p) for p in packed ] == keys
+
+def test_composite_key_prefix():
+    # a prefix of a composite key is a lower bound for all keys starting with it:
+    codec = KeyCodec.for_key_type((ValType.INTEGER, ValType.VARCHAR, ValType.FLOAT))
+    prefix = codec.pack((3, 'b'))
+    assert codec.pack((3, 'a', 9.0)) < prefix < codec.pack((3, 'b', -1e300)) < codec.pack((3, 'b\0', -1.0))
+    assert codec.unpack(prefix) == (3, 'b')
+
+def test_duplicate_composite_key(session):
+    subprocess.run(['make', 'clean'], check=True)
+    for parse_tree in parse_all("CREATE TABLE R(A INT, B VARCHAR, C INT, PRIMARY KEY(A, B));" +
+                                "INSERT INTO R VALUES (1, 'x', 0), (1, 'y', 0), (2, 'x', 0);"):
+        r = session.request(parse_tree)
+        assert r.error is None, r.error_details
+    for values in ["(3, 'x', 1), (3, 'x', 2)", "(1, 'y', 1)"]:
+        r, = [ session.request(parse_tree) for parse_tree in parse_all(f'INSERT INTO R VALUES {values};') ]
+        assert r.error is not None and 'primary key constraint violation' in r.error
+    r, = [ session.request(parse_tree) for parse_tree in parse_all('SELECT * FROM R;') ]
+    assert r.error is None and r.response.startswith('SELECT 3')
@@ -0,0 +1,19 @@
+CREATE TABLE R(A INT, B FLOAT, C VARCHAR, D DATETIME) WITH (compression='zlib');
+INSERT INTO R VALUES (0, 0.5, 'zz0', '2010-01-10'), (1, 1.5, 'zz1', '2011-02-11'), (2, 2.5, 'zz2', '2012-03-12'), (3, 3.5, 'zz3', '2013-04-13'), (4, 4.5, 'zz4', '2014-05-14'), (5, 5.5, 'zz5', '2015-06-15'), (6, 6.5, 'zz6', '2016-07-16'), (7, 7.5, 'zz7', '2017-08-17'), (8, 8.5, 'zz8', '2018-09-18'), (9, 9.5, 'zz9', '2019-01-19'), (10, 10.5, 'zz10', '2020-02-10'), (11, 11.5, 'zz11', '2021-03-11'), (12, 12.5, 'zz12', '2022-04-12'), (13, 13.5, 'zz0', '2023-05-13'), (14, 14.5, 'zz1', '2024-06-14'), (15, 15.5, 'zz2', '2010-07-15'), (16, 16.5, 'zz3', '2011-08-16'), (17, 17.5, 'zz4', '2012-09-17'), (18, 18.5, 'zz5', '2013-01-18'), (19, 19.5, 'zz6', '2014-02-19'), (20, 20.5, 'zz7', '2015-03-10'), (21, 21.5, 'zz8', '2016-04-11'), (22, 22.5, 'zz9', '2017-05-12'), (23, 23.5, 'zz10', '2018-06-13'), (24, 24.5, 'zz11', '2019-07-14'), (25, 25.5, 'zz12', '2020-08-15'), (26, 26.5, 'zz0', '2021-09-16'), (27, 27.5, 'zz1', '2022-01-17'), (28, 28.5, 'zz2', '2023-02-18'), (29, 29.5, 'zz3', '2024-03-19'), (30, 30.5, 'zz4', '2010-04-10'), (31, 31.5, 'zz5', '2011-05-11'), (32, 32.5, 'zz6', '2012-06-12'), (33, 33.5, 'zz7', '2013-07-13'), (34, 34.5, 'zz8', '2014-08-14'), (35, 35.5, 'zz9', '2015-09-15'), (36, 36.5, 'zz10', '2016-01-16'), (37, 37.5, 'zz11', '2017-02-17'), (38, 38.5, 'zz12', '2018-03-18'), (39, 39.5, 'zz0', '2019-04-19'), (40, 40.5, 'zz1', '2020-05-10'), (41, 41.5, 'zz2', '2021-06-11'), (42, 42.5, 'zz3', '2022-07-12'), (43, 43.5, 'zz4', '2023-08-13'), (44, 44.5, 'zz5', '2024-09-14'), (45, 45.5, 'zz6', '2010-01-15'), (46, 46.5, 'zz7', '2011-02-16'), (47, 47.5, 'zz8', '2012-03-17'), (48, 48.5, 'zz9', '2013-04-18'), (49, 49.5, 'zz10', '2014-05-19'), (50, 50.5, 'zz11', '2015-06-10'), (51, 51.5, 'zz12', '2016-07-11'), (52, 52.5, 'zz0', '2017-08-12'), (53, 53.5, 'zz1', '2018-09-13'), (54, 54.5, 'zz2', '2019-01-14'), (55, 55.5, 'zz3', '2020-02-15'), (56, 56.5, 'zz4', '2021-03-16'), (57, 57.5, 'zz5', '2022-04-17'), (58, 58.5, 'zz6', '2023-05-18'), (59, 59.5, 'zz7', '2024-06-19'), (60, 60.5, 'zz8', '2010-07-10'), (61, 61.5, 'zz9', '2011-08-11'), (62, 62.5, 'zz10', '2012-09-12'), (63, 63.5, 'zz11', '2013-01-13'), (64, 64.5, 'zz12', '2014-02-14'), (65, 65.5, 'zz0', '2015-03-15'), (66, 66.5, 'zz1', '2016-04-16'), (67, 67.5, 'zz2', '2017-05-17'), (68, 68.5, 'zz3', '2018-06-18'), (69, 69.5, 'zz4', '2019-07-19'), (70, 70.5, 'zz5', '2020-08-10'), (71, 71.5, 'zz6', '2021-09-11'), (72, 72.5, 'zz7', '2022-01-12'), (73, 73.5, 'zz8', '2023-02-13'), (74, 74.5, 'zz9', '2024-03-14'), (75, 75.5, 'zz10', '2010-04-15'), (76, 76.5, 'zz11', '2011-05-16'), (77, 77.5, 'zz12', '2012-06-17'), (78, 78.5, 'zz0', '2013-07-18'), (79, 79.5, 'zz1', '2014-08-19'), (80, 80.5, 'zz2', '2015-09-10'), (81, 81.5, 'zz3', '2016-01-11'), (82, 82.5, 'zz4', '2017-02-12'), (83, 83.5, 'zz5', '2018-03-13'), (84, 84.5, 'zz6', '2019-04-14'), (85, 85.5, 'zz7', '2020-05-15'), (86, 86.5, 'zz8', '2021-06-16'), (87, 87.5, 'zz9', '2022-07-17'), (88, 88.5, 'zz10', '2023-08-18'), (89, 89.5, 'zz11', '2024-09-19'), (90, 90.5, 'zz12', '2010-01-10'), (91, 91.5, 'zz0', '2011-02-11'), (92, 92.5, 'zz1', '2012-03-12'), (93, 93.5, 'zz2', '2013-04-13'), (94, 94.5, 'zz3', '2014-05-14'), (95, 95.5, 'zz4', '2015-06-15'), (96, 96.5, 'zz5', '2016-07-16'), (97, 97.5, 'zz6', '2017-08-17'), (98, 98.5, 'zz7', '2018-09-18'), (99, 99.5, 'zz8', '2019-01-19'), (100, 100.5, 'zz9', '2020-02-10'), (101, 0.5, 'zz10', '2021-03-11'), (102, 1.5, 'zz11', '2022-04-12'), (103, 2.5, 'zz12', '2023-05-13'), (104, 3.5, 'zz0', '2024-06-14'), (105, 4.5, 'zz1', '2010-07-15'), (106, 5.5, 'zz2', '2011-08-16'), (107, 6.5, 'zz3', '2012-09-17'), (108, 7.5, 'zz4', '2013-01-18'), (109, 8.5, 'zz5', '2014-02-19'), (110, 9.5, 'zz6', '2015-03-10'), (111, 10.5, 'zz7', '2016-04-11'), (112, 11.5, 'zz8', '2017-05-12'), (113, 12.5, 'zz9', '2018-06-13'), (114, 13.5, 'zz10', '2019-07-14'), (115, 14.5, 'zz11', '2020-08-15'), (116, 15.5, 'zz12', '2021-09-16'), (117, 16.5, 'zz0', '2022-01-17'), (118, 17.5, 'zz1', '2023-02-18'), (119, 18.5, 'zz2', '2024-03-19'), (120, 19.5, 'zz3', '2010-04-10'), (121, 20.5, 'zz4', '2011-05-11'), (122, 21.5, 'zz5', '2012-06-12'), (123, 22.5, 'zz6', '2013-07-13'), (124, 23.5, 'zz7', '2014-08-14'), (125, 24.5, 'zz8', '2015-09-15'), (126, 25.5, 'zz9', '2016-01-16'), (127, 26.5, 'zz10', '2017-02-17'), (128, 27.5, 'zz11', '2018-03-18'), (129, 28.5, 'zz12', '2019-04-19'), (130, 29.5, 'zz0', '2020-05-10'), (131, 30.5, 'zz1', '2021-06-11'), (132, 31.5, 'zz2', '2022-07-12'), (133, 32.5, 'zz3', '2023-08-13'), (134, 33.5, 'zz4', '2024-09-14'), (135, 34.5, 'zz5', '2010-01-15'), (136, 35.5, 'zz6', '2011-02-16'), (137, 36.5, 'zz7', '2012-03-17'), (138, 37.5, 'zz8', '2013-04-18'), (139, 38.5, 'zz9', '2014-05-19'), (140, 39.5, 'zz10', '2015-06-10'), (141, 40.5, 'zz11', '2016-07-11'), (142, 41.5, 'zz12', '2017-08-12'), (143, 42.5, 'zz0', '2018-09-13'), (144, 43.5, 'zz1', '2019-01-14'), (145, 44.5, 'zz2', '2020-02-15'), (146, 45.5, 'zz3', '2021-03-16'), (147, 46.5, 'zz4', '2022-04-17'), (148, 47.5, 'zz5', '2023-05-18'), (149, 48.5, 'zz6', '2024-06-19'), (150, 49.5, 'zz7', '2010-07-10'), (151, 50.5, 'zz8', '2011-08-11'), (152, 51.5, 'zz9', '2012-09-12'), (153, 52.5, 'zz10', '2013-01-13'), (154, 53.5, 'zz11', '2014-02-14'), (155, 54.5, 'zz12', '2015-03-15'), (156, 55.5, 'zz0', '2016-04-16'), (157, 56.5, 'zz1', '2017-05-17'), (158, 57.5, 'zz2', '2018-06-18'), (159, 58.5, 'zz3', '2019-07-19'), (160, 59.5, 'zz4', '2020-08-10'), (161, 60.5, 'zz5', '2021-09-11'), (162, 61.5, 'zz6', '2022-01-12'), (163, 62.5, 'zz7', '2023-02-13'), (164, 63.5, 'zz8', '2024-03-14'), (165, 64.5, 'zz9', '2010-04-15'), (166, 65.5, 'zz10', '2011-05-16'), (167, 66.5, 'zz11', '2012-06-17'), (168, 67.5, 'zz12', '2013-07-18'), (169, 68.5, 'zz0', '2014-08-19'), (170, 69.5, 'zz1', '2015-09-10'), (171, 70.5, 'zz2', '2016-01-11'), (172, 71.5, 'zz3', '2017-02-12'), (173, 72.5, 'zz4', '2018-03-13'), (174, 73.5, 'zz5', '2019-04-14'), (175, 74.5, 'zz6', '2020-05-15'), (176, 75.5, 'zz7', '2021-06-16'), (177, 76.5, 'zz8', '2022-07-17'), (178, 77.5, 'zz9', '2023-08-18'), (179, 78.5, 'zz10', '2024-09-19'), (180, 79.5, 'zz11', '2010-01-10'), (181, 80.5, 'zz12', '2011-02-11'), (182, 81.5, 'zz0', '2012-03-12'), (183, 82.5, 'zz1', '2013-04-13'), (184, 83.5, 'zz2', '2014-05-14'), (185, 84.5, 'zz3', '2015-06-15'), (186, 85.5, 'zz4', '2016-07-16'), (187, 86.5, 'zz5', '2017-08-17'), (188, 87.5, 'zz6', '2018-09-18'), (189, 88.5, 'zz7', '2019-01-19'), (190, 89.5, 'zz8', '2020-02-10'), (191, 90.5, 'zz9', '2021-03-11'), (192, 91.5, 'zz10', '2022-04-12'), (193, 92.5, 'zz11', '2023-05-13'), (194, 93.5, 'zz12', '2024-06-14'), (195, 94.5, 'zz0', '2010-07-15'), (196, 95.5, 'zz1', '2011-08-16'), (197, 96.5, 'zz2', '2012-09-17'), (198, 97.5, 'zz3', '2013-01-18'), (199, 98.5, 'zz4', '2014-02-19'), (200, 99.5, 'zz5', '2015-03-10'), (201, 100.5, 'zz6', '2016-04-11'), (202, 0.5, 'zz7', '2017-05-12'), (203, 1.5, 'zz8', '2018-06-13'), (204, 2.5, 'zz9', '2019-07-14'), (205, 3.5, 'zz10', '2020-08-15'), (206, 4.5, 'zz11', '2021-09-16'), (207, 5.5, 'zz12', '2022-01-17'), (208, 6.5, 'zz0', '2023-02-18'), (209, 7.5, 'zz1', '2024-03-19'), (210, 8.5, 'zz2', '2010-04-10'), (211, 9.5, 'zz3', '2011-05-11'), (212, 10.5, 'zz4', '2012-06-12'), (213, 11.5, 'zz5', '2013-07-13'), (214, 12.5, 'zz6', '2014-08-14'), (215, 13.5, 'zz7', '2015-09-15'), (216, 14.5, 'zz8', '2016-01-16'), (217, 15.5, 'zz9', '2017-02-17'), (218, 16.5, 'zz10', '2018-03-18'), (219, 17.5, 'zz11', '2019-04-19'), (220, 18.5, 'zz12', '2020-05-10'), (221, 19.5, 'zz0', '2021-06-11'), (222, 20.5, 'zz1', '2022-07-12'), (223, 21.5, 'zz2', '2023-08-13'), (224, 22.5, 'zz3', '2024-09-14'), (225, 23.5, 'zz4', '2010-01-15'), (226, 24.5, 'zz5', '2011-02-16'), (227, 25.5, 'zz6', '2012-03-17'), (228, 26.5, 'zz7', '2013-04-18'), (229, 27.5, 'zz8', '2014-05-19'), (230, 28.5, 'zz9', '2015-06-10'), (231, 29.5, 'zz10', '2016-07-11'), (232, 30.5, 'zz11', '2017-08-12'), (233, 31.5, 'zz12', '2018-09-13'), (234, 32.5, 'zz0', '2019-01-14'), (235, 33.5, 'zz1', '2020-02-15'), (236, 34.5, 'zz2', '2021-03-16'), (237, 35.5, 'zz3', '2022-04-17'), (238, 36.5, 'zz4', '2023-05-18'), (239, 37.5, 'zz5', '2024-06-19'), (240, 38.5, 'zz6', '2010-07-10'), (241, 39.5, 'zz7', '2011-08-11'), (242, 40.5, 'zz8', '2012-09-12'), (243, 41.5, 'zz9', '2013-01-13'), (244, 42.5, 'zz10', '2014-02-14'), (245, 43.5, 'zz11', '2015-03-15'), (246, 44.5, 'zz12', '2016-04-16'), (247, 45.5, 'zz0', '2017-05-17'), (248, 46.5, 'zz1', '2018-06-18'), (249, 47.5, 'zz2', '2019-07-19'), (250, 48.5, 'zz3', '2020-08-10'), (251, 49.5, 'zz4', '2021-09-11'), (252, 50.5, 'zz5', '2022-01-12'), (253, 51.5, 'zz6', '2023-02-13'), (254, 52.5, 'zz7', '2024-03-14'), (255, 53.5, 'zz8', '2010-04-15'), (256, 54.5, 'zz9', '2011-05-16'), (257, 55.5, 'zz10', '2012-06-17'), (258, 56.5, 'zz11', '2013-07-18'), (259, 57.5, 'zz12', '2014-08-19'), (260, 58.5, 'zz0', '2015-09-10'), (261, 59.5, 'zz1', '2016-01-11'), (262, 60.5, 'zz2', '2017-02-12'), (263, 61.5, 'zz3', '2018-03-13'), (264, 62.5, 'zz4', '2019-04-14'), (265, 63.5, 'zz5', '2020-05-15'), (266, 64.5, 'zz6', '2021-06-16'), (267, 65.5, 'zz7', '2022-07-17'), (268, 66.5, 'zz8', '2023-08-18'), (269, 67.5, 'zz9', '2024-09-19'), (270, 68.5, 'zz10', '2010-01-10'), (271, 69.5, 'zz11', '2011-02-11'), (272, 70.5, 'zz12', '2012-03-12'), (273, 71.5, 'zz0', '2013-04-13'), (274, 72.5, 'zz1', '2014-05-14'), (275, 73.5, 'zz2', '2015-06-15'), (276, 74.5, 'zz3', '2016-07-16'), (277, 75.5, 'zz4', '2017-08-17'), (278, 76.5, 'zz5', '2018-09-18'), (279, 77.5, 'zz6', '2019-01-19'), (280, 78.5, 'zz7', '2020-02-10'), (281, 79.5, 'zz8', '2021-03-11'), (282, 80.5, 'zz9', '2022-04-12'), (283, 81.5, 'zz10', '2023-05-13'), (284, 82.5, 'zz11', '2024-06-14'), (285, 83.5, 'zz12', '2010-07-15'), (286, 84.5, 'zz0', '2011-08-16'), (287, 85.5, 'zz1', '2012-09-17'), (288, 86.5, 'zz2', '2013-01-18'), (289, 87.5, 'zz3', '2014-02-19'), (290, 88.5, 'zz4', '2015-03-10'), (291, 89.5, 'zz5', '2016-04-11'), (292, 90.5, 'zz6', '2017-05-12'), (293, 91.5, 'zz7', '2018-06-13'), (294, 92.5, 'zz8', '2019-07-14'), (295, 93.5, 'zz9', '2020-08-15'), (296, 94.5, 'zz10', '2021-09-16'), (297, 95.5, 'zz11', '2022-01-17'), (298, 96.5, 'zz12', '2023-02-18'), (299, 97.5, 'zz0', '2024-03-19'), (300, 98.5, 'zz1', '2010-04-10'), (301, 99.5, 'zz2', '2011-05-11'), (302, 100.5, 'zz3', '2012-06-12'), (303, 0.5, 'zz4', '2013-07-13'), (304, 1.5, 'zz5', '2014-08-14'), (305, 2.5, 'zz6', '2015-09-15'), (306, 3.5, 'zz7', '2016-01-16'), (307, 4.5, 'zz8', '2017-02-17'), (308, 5.5, 'zz9', '2018-03-18'), (309, 6.5, 'zz10', '2019-04-19'), (310, 7.5, 'zz11', '2020-05-10'), (311, 8.5, 'zz12', '2021-06-11'), (312, 9.5, 'zz0', '2022-07-12'), (313, 10.5, 'zz1', '2023-08-13'), (314, 11.5, 'zz2', '2024-09-14'), (315, 12.5, 'zz3', '2010-01-15'), (316, 13.5, 'zz4', '2011-02-16'), (317, 14.5, 'zz5', '2012-03-17'), (318, 15.5, 'zz6', '2013-04-18'), (319, 16.5, 'zz7', '2014-05-19'), (320, 17.5, 'zz8', '2015-06-10'), (321, 18.5, 'zz9', '2016-07-11'), (322, 19.5, 'zz10', '2017-08-12'), (323, 20.5, 'zz11', '2018-09-13'), (324, 21.5, 'zz12', '2019-01-14'), (325, 22.5, 'zz0', '2020-02-15'), (326, 23.5, 'zz1', '2021-03-16'), (327, 24.5, 'zz2', '2022-04-17'), (328, 25.5, 'zz3', '2023-05-18'), (329, 26.5, 'zz4', '2024-06-19'), (330, 27.5, 'zz5', '2010-07-10'), (331, 28.5, 'zz6', '2011-08-11'), (332, 29.5, 'zz7', '2012-09-12'), (333, 30.5, 'zz8', '2013-01-13'), (334, 31.5, 'zz9', '2014-02-14'), (335, 32.5, 'zz10', '2015-03-15'), (336, 33.5, 'zz11', '2016-04-16'), (337, 34.5, 'zz12', '2017-05-17'), (338, 35.5, 'zz0', '2018-06-18'), (339, 36.5, 'zz1', '2019-07-19'), (340, 37.5, 'zz2', '2020-08-10'), (341, 38.5, 'zz3', '2021-09-11'), (342, 39.5, 'zz4', '2022-01-12'), (343, 40.5, 'zz5', '2023-02-13'), (344, 41.5, 'zz6', '2024-03-14'), (345, 42.5, 'zz7', '2010-04-15'), (346, 43.5, 'zz8', '2011-05-16'), (347, 44.5, 'zz9', '2012-06-17'), (348, 45.5, 'zz10', '2013-07-18'), (349, 46.5, 'zz11', '2014-08-19'), (350, 47.5, 'zz12', '2015-09-10'), (351, 48.5, 'zz0', '2016-01-11'), (352, 49.5, 'zz1', '2017-02-12'), (353, 50.5, 'zz2', '2018-03-13'), (354, 51.5, 'zz3', '2019-04-14'), (355, 52.5, 'zz4', '2020-05-15'), (356, 53.5, 'zz5', '2021-06-16'), (357, 54.5, 'zz6', '2022-07-17'), (358, 55.5, 'zz7', '2023-08-18'), (359, 56.5, 'zz8', '2024-09-19'), (360, 57.5, 'zz9', '2010-01-10'), (361, 58.5, 'zz10', '2011-02-11'), (362, 59.5, 'zz11', '2012-03-12'), (363, 60.5, 'zz12', '2013-04-13'), (364, 61.5, 'zz0', '2014-05-14'), (365, 62.5, 'zz1', '2015-06-15'), (366, 63.5, 'zz2', '2016-07-16'), (367, 64.5, 'zz3', '2017-08-17'), (368, 65.5, 'zz4', '2018-09-18'), (369, 66.5, 'zz5', '2019-01-19'), (370, 67.5, 'zz6', '2020-02-10'), (371, 68.5, 'zz7', '2021-03-11'), (372, 69.5, 'zz8', '2022-04-12'), (373, 70.5, 'zz9', '2023-05-13'), (374, 71.5, 'zz10', '2024-06-14'), (375, 72.5, 'zz11', '2010-07-15'), (376, 73.5, 'zz12', '2011-08-16'), (377, 74.5, 'zz0', '2012-09-17'), (378, 75.5, 'zz1', '2013-01-18'), (379, 76.5, 'zz2', '2014-02-19'), (380, 77.5, 'zz3', '2015-03-10'), (381, 78.5, 'zz4', '2016-04-11'), (382, 79.5, 'zz5', '2017-05-12'), (383, 80.5, 'zz6', '2018-06-13'), (384, 81.5, 'zz7', '2019-07-14'), (385, 82.5, 'zz8', '2020-08-15'), (386, 83.5, 'zz9', '2021-09-16'), (387, 84.5, 'zz10', '2022-01-17'), (388, 85.5, 'zz11', '2023-02-18'), (389, 86.5, 'zz12', '2024-03-19'), (390, 87.5, 'zz0', '2010-04-10'), (391, 88.5, 'zz1', '2011-05-11'), (392, 89.5, 'zz2', '2012-06-12'), (393, 90.5, 'zz3', '2013-07-13'), (394, 91.5, 'zz4', '2014-08-14'), (395, 92.5, 'zz5', '2015-09-15'), (396, 93.5, 'zz6', '2016-01-16'), (397, 94.5, 'zz7', '2017-02-17'), (398, 95.5, 'zz8', '2018-03-18'), (399, 96.5, 'zz9', '2019-04-19'), (400, 97.5, 'zz10', '2020-05-10'), (401, 98.5, 'zz11', '2021-06-11'), (402, 99.5, 'zz12', '2022-07-12'), (403, 100.5, 'zz0', '2023-08-13'), (404, 0.5, 'zz1', '2024-09-14'), (405, 1.5, 'zz2', '2010-01-15'), (406, 2.5, 'zz3', '2011-02-16'), (407, 3.5, 'zz4', '2012-03-17'), (408, 4.5, 'zz5', '2013-04-18'), (409, 5.5, 'zz6', '2014-05-19'), (410, 6.5, 'zz7', '2015-06-10'), (411, 7.5, 'zz8', '2016-07-11'), (412, 8.5, 'zz9', '2017-08-12'), (413, 9.5, 'zz10', '2018-09-13'), (414, 10.5, 'zz11', '2019-01-14'), (415, 11.5, 'zz12', '2020-02-15'), (416, 12.5, 'zz0', '2021-03-16'), (417, 13.5, 'zz1', '2022-04-17'), (418, 14.5, 'zz2', '2023-05-18'), (419, 15.5, 'zz3', '2024-06-19'), (420, 16.5, 'zz4', '2010-07-10'), (421, 17.5, 'zz5', '2011-08-11'), (422, 18.5, 'zz6', '2012-09-12'), (423, 19.5, 'zz7', '2013-01-13'), (424, 20.5, 'zz8', '2014-02-14'), (425, 21.5, 'zz9', '2015-03-15'), (426, 22.5, 'zz10', '2016-04-16'), (427, 23.5, 'zz11', '2017-05-17'), (428, 24.5, 'zz12', '2018-06-18'), (429, 25.5, 'zz0', '2019-07-19'), (430, 26.5, 'zz1', '2020-08-10'), (431, 27.5, 'zz2', '2021-09-11'), (432, 28.5, 'zz3', '2022-01-12'), (433, 29.5, 'zz4', '2023-02-13'), (434, 30.5, 'zz5', '2024-03-14'), (435, 31.5, 'zz6', '2010-04-15'), (436, 32.5, 'zz7', '2011-05-16'), (437, 33.5, 'zz8', '2012-06-17'), (438, 34.5, 'zz9', '2013-07-18'), (439, 35.5, 'zz10', '2014-08-19'), (440, 36.5, 'zz11', '2015-09-10'), (441, 37.5, 'zz12', '2016-01-11'), (442, 38.5, 'zz0', '2017-02-12'), (443, 39.5, 'zz1', '2018-03-13'), (444, 40.5, 'zz2', '2019-04-14'), (445, 41.5, 'zz3', '2020-05-15'), (446, 42.5, 'zz4', '2021-06-16'), (447, 43.5, 'zz5', '2022-07-17'), (448, 44.5, 'zz6', '2023-08-18'), (449, 45.5, 'zz7', '2024-09-19'), (450, 46.5, 'zz8', '2010-01-10'), (451, 47.5, 'zz9', '2011-02-11'), (452, 48.5, 'zz10', '2012-03-12'), (453, 49.5, 'zz11', '2013-04-13'), (454, 50.5, 'zz12', '2014-05-14'), (455, 51.5, 'zz0', '2015-06-15'), (456, 52.5, 'zz1', '2016-07-16'), (457, 53.5, 'zz2', '2017-08-17'), (458, 54.5, 'zz3', '2018-09-18'), (459, 55.5, 'zz4', '2019-01-19'), (460, 56.5, 'zz5', '2020-02-10'), (461, 57.5, 'zz6', '2021-03-11'), (462, 58.5, 'zz7', '2022-04-12'), (463, 59.5, 'zz8', '2023-05-13'), (464, 60.5, 'zz9', '2024-06-14'), (465, 61.5, 'zz10', '2010-07-15'), (466, 62.5, 'zz11', '2011-08-16'), (467, 63.5, 'zz12', '2012-09-17'), (468, 64.5, 'zz0', '2013-01-18'), (469, 65.5, 'zz1', '2014-02-19'), (470, 66.5, 'zz2', '2015-03-10'), (471, 67.5, 'zz3', '2016-04-11'), (472, 68.5, 'zz4', '2017-05-12'), (473, 69.5, 'zz5', '2018-06-13'), (474, 70.5, 'zz6', '2019-07-14'), (475, 71.5, 'zz7', '2020-08-15'), (476, 72.5, 'zz8', '2021-09-16'), (477, 73.5, 'zz9', '2022-01-17'), (478, 74.5, 'zz10', '2023-02-18'), (479, 75.5, 'zz11', '2024-03-19'), (480, 76.5, 'zz12', '2010-04-10'), (481, 77.5, 'zz0', '2011-05-11'), (482, 78.5, 'zz1', '2012-06-12'), (483, 79.5, 'zz2', '2013-07-13'), (484, 80.5, 'zz3', '2014-08-14'), (485, 81.5, 'zz4', '2015-09-15'), (486, 82.5, 'zz5', '2016-01-16'), (487, 83.5, 'zz6', '2017-02-17'), (488, 84.5, 'zz7', '2018-03-18'), (489, 85.5, 'zz8', '2019-04-19'), (490, 86.5, 'zz9', '2020-05-10'), (491, 87.5, 'zz10', '2021-06-11'), (492, 88.5, 'zz11', '2022-07-12'), (493, 89.5, 'zz12', '2023-08-13'), (494, 90.5, 'zz0', '2024-09-14'), (495, 91.5, 'zz1', '2010-01-15'), (496, 92.5, 'zz2', '2011-02-16'), (497, 93.5, 'zz3', '2012-03-17'), (498, 94.5, 'zz4', '2013-04-18'), (499, 95.5, 'zz5', '2014-05-19'), (500, 96.5, 'zz6', '2015-06-10'), (501, 97.5, 'zz7', '2016-07-11'), (502, 98.5, 'zz8', '2017-08-12'), (503, 99.5, 'zz9', '2018-09-13'), (504, 100.5, 'zz10', '2019-01-14'), (505, 0.5, 'zz11', '2020-02-15'), (506, 1.5, 'zz12', '2021-03-16'), (507, 2.5, 'zz0', '2022-04-17'), (508, 3.5, 'zz1', '2023-05-18'), (509, 4.5, 'zz2', '2024-06-19'), (510, 5.5, 'zz3', '2010-07-10'), (511, 6.5, 'zz4', '2011-08-11'), (512, 7.5, 'zz5', '2012-09-12'), (513, 8.5, 'zz6', '2013-01-13'), (514, 9.5, 'zz7', '2014-02-14'), (515, 10.5, 'zz8', '2015-03-15'), (516, 11.5, 'zz9', '2016-04-16'), (517, 12.5, 'zz10', '2017-05-17'), (518, 13.5, 'zz11', '2018-06-18'), (519, 14.5, 'zz12', '2019-07-19'), (520, 15.5, 'zz0', '2020-08-10'), (521, 16.5, 'zz1', '2021-09-11'), (522, 17.5, 'zz2', '2022-01-12'), (523, 18.5, 'zz3', '2023-02-13'), (524, 19.5, 'zz4', '2024-03-14'), (525, 20.5, 'zz5', '2010-04-15'), (526, 21.5, 'zz6', '2011-05-16'), (527, 22.5, 'zz7', '2012-06-17'), (528, 23.5, 'zz8', '2013-07-18'), (529, 24.5, 'zz9', '2014-08-19'), (530, 25.5, 'zz10', '2015-09-10'), (531, 26.5, 'zz11', '2016-01-11'), (532, 27.5, 'zz12', '2017-02-12'), (533, 28.5, 'zz0', '2018-03-13'), (534, 29.5, 'zz1', '2019-04-14'), (535, 30.5, 'zz2', '2020-05-15'), (536, 31.5, 'zz3', '2021-06-16'), (537, 32.5, 'zz4', '2022-07-17'), (538, 33.5, 'zz5', '2023-08-18'), (539, 34.5, 'zz6', '2024-09-19'), (540, 35.5, 'zz7', '2010-01-10'), (541, 36.5, 'zz8', '2011-02-11'), (542, 37.5, 'zz9', '2012-03-12'), (543, 38.5, 'zz10', '2013-04-13'), (544, 39.5, 'zz11', '2014-05-14'), (545, 40.5, 'zz12', '2015-06-15'), (546, 41.5, 'zz0', '2016-07-16'), (547, 42.5, 'zz1', '2017-08-17'), (548, 43.5, 'zz2', '2018-09-18'), (549, 44.5, 'zz3', '2019-01-19'), (550, 45.5, 'zz4', '2020-02-10'), (551, 46.5, 'zz5', '2021-03-11'), (552, 47.5, 'zz6', '2022-04-12'), (553, 48.5, 'zz7', '2023-05-13'), (554, 49.5, 'zz8', '2024-06-14'), (555, 50.5, 'zz9', '2010-07-15'), (556, 51.5, 'zz10', '2011-08-16'), (557, 52.5, 'zz11', '2012-09-17'), (558, 53.5, 'zz12', '2013-01-18'), (559, 54.5, 'zz0', '2014-02-19'), (560, 55.5, 'zz1', '2015-03-10'), (561, 56.5, 'zz2', '2016-04-11'), (562, 57.5, 'zz3', '2017-05-12'), (563, 58.5, 'zz4', '2018-06-13'), (564, 59.5, 'zz5', '2019-07-14'), (565, 60.5, 'zz6', '2020-08-15'), (566, 61.5, 'zz7', '2021-09-16'), (567, 62.5, 'zz8', '2022-01-17'), (568, 63.5, 'zz9', '2023-02-18'), (569, 64.5, 'zz10', '2024-03-19'), (570, 65.5, 'zz11', '2010-04-10'), (571, 66.5, 'zz12', '2011-05-11'), (572, 67.5, 'zz0', '2012-06-12'), (573, 68.5, 'zz1', '2013-07-13'), (574, 69.5, 'zz2', '2014-08-14'), (575, 70.5, 'zz3', '2015-09-15'), (576, 71.5, 'zz4', '2016-01-16'), (577, 72.5, 'zz5', '2017-02-17'), (578, 73.5, 'zz6', '2018-03-18'), (579, 74.5, 'zz7', '2019-04-19'), (580, 75.5, 'zz8', '2020-05-10'), (581, 76.5, 'zz9', '2021-06-11'), (582, 77.5, 'zz10', '2022-07-12'), (583, 78.5, 'zz11', '2023-08-13'), (584, 79.5, 'zz12', '2024-09-14'), (585, 80.5, 'zz0', '2010-01-15'), (586, 81.5, 'zz1', '2011-02-16'), (587, 82.5, 'zz2', '2012-03-17'), (588, 83.5, 'zz3', '2013-04-18'), (589, 84.5, 'zz4', '2014-05-19'), (590, 85.5, 'zz5', '2015-06-10'), (591, 86.5, 'zz6', '2016-07-11'), (592, 87.5, 'zz7', '2017-08-12'), (593, 88.5, 'zz8', '2018-09-13'), (594, 89.5, 'zz9', '2019-01-14'), (595, 90.5, 'zz10', '2020-02-15'), (596, 91.5, 'zz11', '2021-03-16'), (597, 92.5, 'zz12', '2022-04-17'), (598, 93.5, 'zz0', '2023-05-18'), (599, 94.5, 'zz1', '2024-06-19'), (600, 95.5, 'zz2', '2010-07-10'), (601, 96.5, 'zz3', '2011-08-11'), (602, 97.5, 'zz4', '2012-09-12'), (603, 98.5, 'zz5', '2013-01-13'), (604, 99.5, 'zz6', '2014-02-14'), (605, 100.5, 'zz7', '2015-03-15'), (606, 0.5, 'zz8', '2016-04-16'), (607, 1.5, 'zz9', '2017-05-17'), (608, 2.5, 'zz10', '2018-06-18'), (609, 3.5, 'zz11', '2019-07-19'), (610, 4.5, 'zz12', '2020-08-10'), (611, 5.5, 'zz0', '2021-09-11'), (612, 6.5, 'zz1', '2022-01-12'), (613, 7.5, 'zz2', '2023-02-13'), (614, 8.5, 'zz3', '2024-03-14'), (615, 9.5, 'zz4', '2010-04-15'), (616, 10.5, 'zz5', '2011-05-16'), (617, 11.5, 'zz6', '2012-06-17'), (618, 12.5, 'zz7', '2013-07-18'), (619, 13.5, 'zz8', '2014-08-19'), (620, 14.5, 'zz9', '2015-09-10'), (621, 15.5, 'zz10', '2016-01-11'), (622, 16.5, 'zz11', '2017-02-12'), (623, 17.5, 'zz12', '2018-03-13'), (624, 18.5, 'zz0', '2019-04-14'), (625, 19.5, 'zz1', '2020-05-15'), (626, 20.5, 'zz2', '2021-06-16'), (627, 21.5, 'zz3', '2022-07-17'), (628, 22.5, 'zz4', '2023-08-18'), (629, 23.5, 'zz5', '2024-09-19'), (630, 24.5, 'zz6', '2010-01-10'), (631, 25.5, 'zz7', '2011-02-11'), (632, 26.5, 'zz8', '2012-03-12'), (633, 27.5, 'zz9', '2013-04-13'), (634, 28.5, 'zz10', '2014-05-14'), (635, 29.5, 'zz11', '2015-06-15'), (636, 30.5, 'zz12', '2016-07-16'), (637, 31.5, 'zz0', '2017-08-17'), (638, 32.5, 'zz1', '2018-09-18'), (639, 33.5, 'zz2', '2019-01-19'), (640, 34.5, 'zz3', '2020-02-10'), (641, 35.5, 'zz4', '2021-03-11'), (642, 36.5, 'zz5', '2022-04-12'), (643, 37.5, 'zz6', '2023-05-13'), (644, 38.5, 'zz7', '2024-06-14'), (645, 39.5, 'zz8', '2010-07-15'), (646, 40.5, 'zz9', '2011-08-16'), (647, 41.5, 'zz10', '2012-09-17'), (648, 42.5, 'zz11', '2013-01-18'), (649, 43.5, 'zz12', '2014-02-19'), (650, 44.5, 'zz0', '2015-03-10'), (651, 45.5, 'zz1', '2016-04-11'), (652, 46.5, 'zz2', '2017-05-12'), (653, 47.5, 'zz3', '2018-06-13'), (654, 48.5, 'zz4', '2019-07-14'), (655, 49.5, 'zz5', '2020-08-15'), (656, 50.5, 'zz6', '2021-09-16'), (657, 51.5, 'zz7', '2022-01-17'), (658, 52.5, 'zz8', '2023-02-18'), (659, 53.5, 'zz9', '2024-03-19'), (660, 54.5, 'zz10', '2010-04-10'), (661, 55.5, 'zz11', '2011-05-11'), (662, 56.5, 'zz12', '2012-06-12'), (663, 57.5, 'zz0', '2013-07-13'), (664, 58.5, 'zz1', '2014-08-14'), (665, 59.5, 'zz2', '2015-09-15'), (666, 60.5, 'zz3', '2016-01-16'), (667, 61.5, 'zz4', '2017-02-17'), (668, 62.5, 'zz5', '2018-03-18'), (669, 63.5, 'zz6', '2019-04-19'), (670, 64.5, 'zz7', '2020-05-10'), (671, 65.5, 'zz8', '2021-06-11'), (672, 66.5, 'zz9', '2022-07-12'), (673, 67.5, 'zz10', '2023-08-13'), (674, 68.5, 'zz11', '2024-09-14'), (675, 69.5, 'zz12', '2010-01-15'), (676, 70.5, 'zz0', '2011-02-16'), (677, 71.5, 'zz1', '2012-03-17'), (678, 72.5, 'zz2', '2013-04-18'), (679, 73.5, 'zz3', '2014-05-19'), (680, 74.5, 'zz4', '2015-06-10'), (681, 75.5, 'zz5', '2016-07-11'), (682, 76.5, 'zz6', '2017-08-12'), (683, 77.5, 'zz7', '2018-09-13'), (684, 78.5, 'zz8', '2019-01-14'), (685, 79.5, 'zz9', '2020-02-15'), (686, 80.5, 'zz10', '2021-03-16'), (687, 81.5, 'zz11', '2022-04-17'), (688, 82.5, 'zz12', '2023-05-18'), (689, 83.5, 'zz0', '2024-06-19'), (690, 84.5, 'zz1', '2010-07-10'), (691, 85.5, 'zz2', '2011-08-11'), (692, 86.5, 'zz3', '2012-09-12'), (693, 87.5, 'zz4', '2013-01-13'), (694, 88.5, 'zz5', '2014-02-14'), (695, 89.5, 'zz6', '2015-03-15'), (696, 90.5, 'zz7', '2016-04-16'), (697, 91.5, 'zz8', '2017-05-17'), (698, 92.5, 'zz9', '2018-06-18'), (699, 93.5, 'zz10', '2019-07-19'), (700, 94.5, 'zz11', '2020-08-10'), (701, 95.5, 'zz12', '2021-09-11'), (702, 96.5, 'zz0', '2022-01-12'), (703, 97.5, 'zz1', '2023-02-13'), (704, 98.5, 'zz2', '2024-03-14'), (705, 99.5, 'zz3', '2010-04-15'), (706, 100.5, 'zz4', '2011-05-16'), (707, 0.5, 'zz5', '2012-06-17'), (708, 1.5, 'zz6', '2013-07-18'), (709, 2.5, 'zz7', '2014-08-19'), (710, 3.5, 'zz8', '2015-09-10'), (711, 4.5, 'zz9', '2016-01-11'), (712, 5.5, 'zz10', '2017-02-12'), (713, 6.5, 'zz11', '2018-03-13'), (714, 7.5, 'zz12', '2019-04-14'), (715, 8.5, 'zz0', '2020-05-15'), (716, 9.5, 'zz1', '2021-06-16'), (717, 10.5, 'zz2', '2022-07-17'), (718, 11.5, 'zz3', '2023-08-18'), (719, 12.5, 'zz4', '2024-09-19'), (720, 13.5, 'zz5', '2010-01-10'), (721, 14.5, 'zz6', '2011-02-11'), (722, 15.5, 'zz7', '2012-03-12'), (723, 16.5, 'zz8', '2013-04-13'), (724, 17.5, 'zz9', '2014-05-14'), (725, 18.5, 'zz10', '2015-06-15'), (726, 19.5, 'zz11', '2016-07-16'), (727, 20.5, 'zz12', '2017-08-17'), (728, 21.5, 'zz0', '2018-09-18'), (729, 22.5, 'zz1', '2019-01-19'), (730, 23.5, 'zz2', '2020-02-10'), (731, 24.5, 'zz3', '2021-03-11'), (732, 25.5, 'zz4', '2022-04-12'), (733, 26.5, 'zz5', '2023-05-13'), (734, 27.5, 'zz6', '2024-06-14'), (735, 28.5, 'zz7', '2010-07-15'), (736, 29.5, 'zz8', '2011-08-16'), (737, 30.5, 'zz9', '2012-09-17'), (738, 31.5, 'zz10', '2013-01-18'), (739, 32.5, 'zz11', '2014-02-19'), (740, 33.5, 'zz12', '2015-03-10'), (741, 34.5, 'zz0', '2016-04-11'), (742, 35.5, 'zz1', '2017-05-12'), (743, 36.5, 'zz2', '2018-06-13'), (744, 37.5, 'zz3', '2019-07-14'), (745, 38.5, 'zz4', '2020-08-15'), (746, 39.5, 'zz5', '2021-09-16'), (747, 40.5, 'zz6', '2022-01-17'), (748, 41.5, 'zz7', '2023-02-18'), (749, 42.5, 'zz8', '2024-03-19'), (750, 43.5, 'zz9', '2010-04-10'), (751, 44.5, 'zz10', '2011-05-11'), (752, 45.5, 'zz11', '2012-06-12'), (753, 46.5, 'zz12', '2013-07-13'), (754, 47.5, 'zz0', '2014-08-14'), (755, 48.5, 'zz1', '2015-09-15'), (756, 49.5, 'zz2', '2016-01-16'), (757, 50.5, 'zz3', '2017-02-17'), (758, 51.5, 'zz4', '2018-03-18'), (759, 52.5, 'zz5', '2019-04-19'), (760, 53.5, 'zz6', '2020-05-10'), (761, 54.5, 'zz7', '2021-06-11'), (762, 55.5, 'zz8', '2022-07-12'), (763, 56.5, 'zz9', '2023-08-13'), (764, 57.5, 'zz10', '2024-09-14'), (765, 58.5, 'zz11', '2010-01-15'), (766, 59.5, 'zz12', '2011-02-16'), (767, 60.5, 'zz0', '2012-03-17'), (768, 61.5, 'zz1', '2013-04-18'), (769, 62.5, 'zz2', '2014-05-19'), (770, 63.5, 'zz3', '2015-06-10'), (771, 64.5, 'zz4', '2016-07-11'), (772, 65.5, 'zz5', '2017-08-12'), (773, 66.5, 'zz6', '2018-09-13'), (774, 67.5, 'zz7', '2019-01-14'), (775, 68.5, 'zz8', '2020-02-15'), (776, 69.5, 'zz9', '2021-03-16'), (777, 70.5, 'zz10', '2022-04-17'), (778, 71.5, 'zz11', '2023-05-18'), (779, 72.5, 'zz12', '2024-06-19'), (780, 73.5, 'zz0', '2010-07-10'), (781, 74.5, 'zz1', '2011-08-11'), (782, 75.5, 'zz2', '2012-09-12'), (783, 76.5, 'zz3', '2013-01-13'), (784, 77.5, 'zz4', '2014-02-14'), (785, 78.5, 'zz5', '2015-03-15'), (786, 79.5, 'zz6', '2016-04-16'), (787, 80.5, 'zz7', '2017-05-17'), (788, 81.5, 'zz8', '2018-06-18'), (789, 82.5, 'zz9', '2019-07-19'), (790, 83.5, 'zz10', '2020-08-10'), (791, 84.5, 'zz11', '2021-09-11'), (792, 85.5, 'zz12', '2022-01-12'), (793, 86.5, 'zz0', '2023-02-13'), (794, 87.5, 'zz1', '2024-03-14'), (795, 88.5, 'zz2', '2010-04-15'), (796, 89.5, 'zz3', '2011-05-16'), (797, 90.5, 'zz4', '2012-06-17'), (798, 91.5, 'zz5', '2013-07-18'), (799, 92.5, 'zz6', '2014-08-19'), (800, 93.5, 'zz7', '2015-09-10'), (801, 94.5, 'zz8', '2016-01-11'), (802, 95.5, 'zz9', '2017-02-12'), (803, 96.5, 'zz10', '2018-03-13'), (804, 97.5, 'zz11', '2019-04-14'), (805, 98.5, 'zz12', '2020-05-15'), (806, 99.5, 'zz0', '2021-06-16'), (807, 100.5, 'zz1', '2022-07-17'), (808, 0.5, 'zz2', '2023-08-18'), (809, 1.5, 'zz3', '2024-09-19'), (810, 2.5, 'zz4', '2010-01-10'), (811, 3.5, 'zz5', '2011-02-11'), (812, 4.5, 'zz6', '2012-03-12'), (813, 5.5, 'zz7', '2013-04-13'), (814, 6.5, 'zz8', '2014-05-14'), (815, 7.5, 'zz9', '2015-06-15'), (816, 8.5, 'zz10', '2016-07-16'), (817, 9.5, 'zz11', '2017-08-17'), (818, 10.5, 'zz12', '2018-09-18'), (819, 11.5, 'zz0', '2019-01-19'), (820, 12.5, 'zz1', '2020-02-10'), (821, 13.5, 'zz2', '2021-03-11'), (822, 14.5, 'zz3', '2022-04-12'), (823, 15.5, 'zz4', '2023-05-13'), (824, 16.5, 'zz5', '2024-06-14'), (825, 17.5, 'zz6', '2010-07-15'), (826, 18.5, 'zz7', '2011-08-16'), (827, 19.5, 'zz8', '2012-09-17'), (828, 20.5, 'zz9', '2013-01-18'), (829, 21.5, 'zz10', '2014-02-19'), (830, 22.5, 'zz11', '2015-03-10'), (831, 23.5, 'zz12', '2016-04-11'), (832, 24.5, 'zz0', '2017-05-12'), (833, 25.5, 'zz1', '2018-06-13'), (834, 26.5, 'zz2', '2019-07-14'), (835, 27.5, 'zz3', '2020-08-15'), (836, 28.5, 'zz4', '2021-09-16'), (837, 29.5, 'zz5', '2022-01-17'), (838, 30.5, 'zz6', '2023-02-18'), (839, 31.5, 'zz7', '2024-03-19'), (840, 32.5, 'zz8', '2010-04-10'), (841, 33.5, 'zz9', '2011-05-11'), (842, 34.5, 'zz10', '2012-06-12'), (843, 35.5, 'zz11', '2013-07-13'), (844, 36.5, 'zz12', '2014-08-14'), (845, 37.5, 'zz0', '2015-09-15'), (846, 38.5, 'zz1', '2016-01-16'), (847, 39.5, 'zz2', '2017-02-17'), (848, 40.5, 'zz3', '2018-03-18'), (849, 41.5, 'zz4', '2019-04-19'), (850, 42.5, 'zz5', '2020-05-10'), (851, 43.5, 'zz6', '2021-06-11'), (852, 44.5, 'zz7', '2022-07-12'), (853, 45.5, 'zz8', '2023-08-13'), (854, 46.5, 'zz9', '2024-09-14'), (855, 47.5, 'zz10', '2010-01-15'), (856, 48.5, 'zz11', '2011-02-16'), (857, 49.5, 'zz12', '2012-03-17'), (858, 50.5, 'zz0', '2013-04-18'), (859, 51.5, 'zz1', '2014-05-19'), (860, 52.5, 'zz2', '2015-06-10'), (861, 53.5, 'zz3', '2016-07-11'), (862, 54.5, 'zz4', '2017-08-12'), (863, 55.5, 'zz5', '2018-09-13'), (864, 56.5, 'zz6', '2019-01-14'), (865, 57.5, 'zz7', '2020-02-15'), (866, 58.5, 'zz8', '2021-03-16'), (867, 59.5, 'zz9', '2022-04-17'), (868, 60.5, 'zz10', '2023-05-18'), (869, 61.5, 'zz11', '2024-06-19'), (870, 62.5, 'zz12', '2010-07-10'), (871, 63.5, 'zz0', '2011-08-11'), (872, 64.5, 'zz1', '2012-09-12'), (873, 65.5, 'zz2', '2013-01-13'), (874, 66.5, 'zz3', '2014-02-14'), (875, 67.5, 'zz4', '2015-03-15'), (876, 68.5, 'zz5', '2016-04-16'), (877, 69.5, 'zz6', '2017-05-17'), (878, 70.5, 'zz7', '2018-06-18'), (879, 71.5, 'zz8', '2019-07-19'), (880, 72.5, 'zz9', '2020-08-10'), (881, 73.5, 'zz10', '2021-09-11'), (882, 74.5, 'zz11', '2022-01-12'), (883, 75.5, 'zz12', '2023-02-13'), (884, 76.5, 'zz0', '2024-03-14'), (885, 77.5, 'zz1', '2010-04-15'), (886, 78.5, 'zz2', '2011-05-16'), (887, 79.5, 'zz3', '2012-06-17'), (888, 80.5, 'zz4', '2013-07-18'), (889, 81.5, 'zz5', '2014-08-19'), (890, 82.5, 'zz6', '2015-09-10'), (891, 83.5, 'zz7', '2016-01-11'), (892, 84.5, 'zz8', '2017-02-12'), (893, 85.5, 'zz9', '2018-03-13'), (894, 86.5, 'zz10', '2019-04-14'), (895, 87.5, 'zz11', '2020-05-15'), (896, 88.5, 'zz12', '2021-06-16'), (897, 89.5, 'zz0', '2022-07-17'), (898, 90.5, 'zz1', '2023-08-18'), (899, 91.5, 'zz2', '2024-09-19'), (900, 92.5, 'zz3', '2010-01-10'), (901, 93.5, 'zz4', '2011-02-11'), (902, 94.5, 'zz5', '2012-03-12'), (903, 95.5, 'zz6', '2013-04-13'), (904, 96.5, 'zz7', '2014-05-14'), (905, 97.5, 'zz8', '2015-06-15'), (906, 98.5, 'zz9', '2016-07-16'), (907, 99.5, 'zz10', '2017-08-17'), (908, 100.5, 'zz11', '2018-09-18'), (909, 0.5, 'zz12', '2019-01-19'), (910, 1.5, 'zz0', '2020-02-10'), (911, 2.5, 'zz1', '2021-03-11'), (912, 3.5, 'zz2', '2022-04-12'), (913, 4.5, 'zz3', '2023-05-13'), (914, 5.5, 'zz4', '2024-06-14'), (915, 6.5, 'zz5', '2010-07-15'), (916, 7.5, 'zz6', '2011-08-16'), (917, 8.5, 'zz7', '2012-09-17'), (918, 9.5, 'zz8', '2013-01-18'), (919, 10.5, 'zz9', '2014-02-19'), (920, 11.5, 'zz10', '2015-03-10'), (921, 12.5, 'zz11', '2016-04-11'), (922, 13.5, 'zz12', '2017-05-12'), (923, 14.5, 'zz0', '2018-06-13'), (924, 15.5, 'zz1', '2019-07-14'), (925, 16.5, 'zz2', '2020-08-15'), (926, 17.5, 'zz3', '2021-09-16'), (927, 18.5, 'zz4', '2022-01-17'), (928, 19.5, 'zz5', '2023-02-18'), (929, 20.5, 'zz6', '2024-03-19'), (930, 21.5, 'zz7', '2010-04-10'), (931, 22.5, 'zz8', '2011-05-11'), (932, 23.5, 'zz9', '2012-06-12'), (933, 24.5, 'zz10', '2013-07-13'), (934, 25.5, 'zz11', '2014-08-14'), (935, 26.5, 'zz12', '2015-09-15'), (936, 27.5, 'zz0', '2016-01-16'), (937, 28.5, 'zz1', '2017-02-17'), (938, 29.5, 'zz2', '2018-03-18'), (939, 30.5, 'zz3', '2019-04-19'), (940, 31.5, 'zz4', '2020-05-10'), (941, 32.5, 'zz5', '2021-06-11'), (942, 33.5, 'zz6', '2022-07-12'), (943, 34.5, 'zz7', '2023-08-13'), (944, 35.5, 'zz8', '2024-09-14'), (945, 36.5, 'zz9', '2010-01-15'), (946, 37.5, 'zz10', '2011-02-16'), (947, 38.5, 'zz11', '2012-03-17'), (948, 39.5, 'zz12', '2013-04-18'), (949, 40.5, 'zz0', '2014-05-19'), (950, 41.5, 'zz1', '2015-06-10'), (951, 42.5, 'zz2', '2016-07-11'), (952, 43.5, 'zz3', '2017-08-12'), (953, 44.5, 'zz4', '2018-09-13'), (954, 45.5, 'zz5', '2019-01-14'), (955, 46.5, 'zz6', '2020-02-15'), (956, 47.5, 'zz7', '2021-03-16'), (957, 48.5, 'zz8', '2022-04-17'), (958, 49.5, 'zz9', '2023-05-18'), (959, 50.5, 'zz10', '2024-06-19'), (960, 51.5, 'zz11', '2010-07-10'), (961, 52.5, 'zz12', '2011-08-11'), (962, 53.5, 'zz0', '2012-09-12'), (963, 54.5, 'zz1', '2013-01-13'), (964, 55.5, 'zz2', '2014-02-14'), (965, 56.5, 'zz3', '2015-03-15'), (966, 57.5, 'zz4', '2016-04-16'), (967, 58.5, 'zz5', '2017-05-17'), (968, 59.5, 'zz6', '2018-06-18'), (969, 60.5, 'zz7', '2019-07-19'), (970, 61.5, 'zz8', '2020-08-10'), (971, 62.5, 'zz9', '2021-09-11'), (972, 63.5, 'zz10', '2022-01-12'), (973, 64.5, 'zz11', '2023-02-13'), (974, 65.5, 'zz12', '2024-03-14'), (975, 66.5, 'zz0', '2010-04-15'), (976, 67.5, 'zz1', '2011-05-16'), (977, 68.5, 'zz2', '2012-06-17'), (978, 69.5, 'zz3', '2013-07-18'), (979, 70.5, 'zz4', '2014-08-19'), (980, 71.5, 'zz5', '2015-09-10'), (981, 72.5, 'zz6', '2016-01-11'), (982, 73.5, 'zz7', '2017-02-12'), (983, 74.5, 'zz8', '2018-03-13'), (984, 75.5, 'zz9', '2019-04-14'), (985, 76.5, 'zz10', '2020-05-15'), (986, 77.5, 'zz11', '2021-06-16'), (987, 78.5, 'zz12', '2022-07-17'), (988, 79.5, 'zz0', '2023-08-18'), (989, 80.5, 'zz1', '2024-09-19'), (990, 81.5, 'zz2', '2010-01-10'), (991, 82.5, 'zz3', '2011-02-11'), (992, 83.5, 'zz4', '2012-03-12'), (993, 84.5, 'zz5', '2013-04-13'), (994, 85.5, 'zz6', '2014-05-14'), (995, 86.5, 'zz7', '2015-06-15'), (996, 87.5, 'zz8', '2016-07-16'), (997, 88.5, 'zz9', '2017-08-17'), (998, 89.5, 'zz10', '2018-09-18'), (999, 90.5, 'zz11', '2019-01-19'), (1000, 91.5, 'zz12', '2020-02-10'), (1001, 92.5, 'zz0', '2021-03-11'), (1002, 93.5, 'zz1', '2022-04-12'), (1003, 94.5, 'zz2', '2023-05-13'), (1004, 95.5, 'zz3', '2024-06-14'), (1005, 96.5, 'zz4', '2010-07-15'), (1006, 97.5, 'zz5', '2011-08-16'), (1007, 98.5, 'zz6', '2012-09-17'), (1008, 99.5, 'zz7', '2013-01-18'), (1009, 100.5, 'zz8', '2014-02-19'), (1010, 0.5, 'zz9', '2015-03-10'), (1011, 1.5, 'zz10', '2016-04-11'), (1012, 2.5, 'zz11', '2017-05-12'), (1013, 3.5, 'zz12', '2018-06-13'), (1014, 4.5, 'zz0', '2019-07-14'), (1015, 5.5, 'zz1', '2020-08-15'), (1016, 6.5, 'zz2', '2021-09-16'), (1017, 7.5, 'zz3', '2022-01-17'), (1018, 8.5, 'zz4', '2023-02-18'), (1019, 9.5, 'zz5', '2024-03-19'), (1020, 10.5, 'zz6', '2010-04-10'), (1021, 11.5, 'zz7', '2011-05-11'), (1022, 12.5, 'zz8', '2012-06-12'), (1023, 13.5, 'zz9', '2013-07-13'), (1024, 14.5, 'zz10', '2014-08-14'), (1025, 15.5, 'zz11', '2015-09-15'), (1026, 16.5, 'zz12', '2016-01-16'), (1027, 17.5, 'zz0', '2017-02-17'), (1028, 18.5, 'zz1', '2018-03-18'), (1029, 19.5, 'zz2', '2019-04-19'), (1030, 20.5, 'zz3', '2020-05-10'), (1031, 21.5, 'zz4', '2021-06-11'), (1032, 22.5, 'zz5', '2022-07-12'), (1033, 23.5, 'zz6', '2023-08-13'), (1034, 24.5, 'zz7', '2024-09-14'), (1035, 25.5, 'zz8', '2010-01-15'), (1036, 26.5, 'zz9', '2011-02-16'), (1037, 27.5, 'zz10', '2012-03-17'), (1038, 28.5, 'zz11', '2013-04-18'), (1039, 29.5, 'zz12', '2014-05-19'), (1040, 30.5, 'zz0', '2015-06-10'), (1041, 31.5, 'zz1', '2016-07-11'), (1042, 32.5, 'zz2', '2017-08-12'), (1043, 33.5, 'zz3', '2018-09-13'), (1044, 34.5, 'zz4', '2019-01-14'), (1045, 35.5, 'zz5', '2020-02-15'), (1046, 36.5, 'zz6', '2021-03-16'), (1047, 37.5, 'zz7', '2022-04-17'), (1048, 38.5, 'zz8', '2023-05-18'), (1049, 39.5, 'zz9', '2024-06-19'), (1050, 40.5, 'zz10', '2010-07-10'), (1051, 41.5, 'zz11', '2011-08-11'), (1052, 42.5, 'zz12', '2012-09-12'), (1053, 43.5, 'zz0', '2013-01-13'), (1054, 44.5, 'zz1', '2014-02-14'), (1055, 45.5, 'zz2', '2015-03-15'), (1056, 46.5, 'zz3', '2016-04-16'), (1057, 47.5, 'zz4', '2017-05-17'), (1058, 48.5, 'zz5', '2018-06-18'), (1059, 49.5, 'zz6', '2019-07-19'), (1060, 50.5, 'zz7', '2020-08-10'), (1061, 51.5, 'zz8', '2021-09-11'), (1062, 52.5, 'zz9', '2022-01-12'), (1063, 53.5, 'zz10', '2023-02-13'), (1064, 54.5, 'zz11', '2024-03-14'), (1065, 55.5, 'zz12', '2010-04-15'), (1066, 56.5, 'zz0', '2011-05-16'), (1067, 57.5, 'zz1', '2012-06-17'), (1068, 58.5, 'zz2', '2013-07-18'), (1069, 59.5, 'zz3', '2014-08-19'), (1070, 60.5, 'zz4', '2015-09-10'), (1071, 61.5, 'zz5', '2016-01-11'), (1072, 62.5, 'zz6', '2017-02-12'), (1073, 63.5, 'zz7', '2018-03-13'), (1074, 64.5, 'zz8', '2019-04-14'), (1075, 65.5, 'zz9', '2020-05-15'), (1076, 66.5, 'zz10', '2021-06-16'), (1077, 67.5, 'zz11', '2022-07-17'), (1078, 68.5, 'zz12', '2023-08-18'), (1079, 69.5, 'zz0', '2024-09-19'), (1080, 70.5, 'zz1', '2010-01-10'), (1081, 71.5, 'zz2', '2011-02-11'), (1082, 72.5, 'zz3', '2012-03-12'), (1083, 73.5, 'zz4', '2013-04-13'), (1084, 74.5, 'zz5', '2014-05-14'), (1085, 75.5, 'zz6', '2015-06-15'), (1086, 76.5, 'zz7', '2016-07-16'), (1087, 77.5, 'zz8', '2017-08-17'), (1088, 78.5, 'zz9', '2018-09-18'), (1089, 79.5, 'zz10', '2019-01-19'), (1090, 80.5, 'zz11', '2020-02-10'), (1091, 81.5, 'zz12', '2021-03-11'), (1092, 82.5, 'zz0', '2022-04-12'), (1093, 83.5, 'zz1', '2023-05-13'), (1094, 84.5, 'zz2', '2024-06-14'), (1095, 85.5, 'zz3', '2010-07-15'), (1096, 86.5, 'zz4', '2011-08-16'), (1097, 87.5, 'zz5', '2012-09-17'), (1098, 88.5, 'zz6', '2013-01-18'), (1099, 89.5, 'zz7', '2014-02-19'), (1100, 90.5, 'zz8', '2015-03-10'), (1101, 91.5, 'zz9', '2016-04-11'), (1102, 92.5, 'zz10', '2017-05-12'), (1103, 93.5, 'zz11', '2018-06-13'), (1104, 94.5, 'zz12', '2019-07-14'), (1105, 95.5, 'zz0', '2020-08-15'), (1106, 96.5, 'zz1', '2021-09-16'), (1107, 97.5, 'zz2', '2022-01-17'), (1108, 98.5, 'zz3', '2023-02-18'), (1109, 99.5, 'zz4', '2024-03-19'), (1110, 100.5, 'zz5', '2010-04-10'), (1111, 0.5, 'zz6', '2011-05-11'), (1112, 1.5, 'zz7', '2012-06-12'), (1113, 2.5, 'zz8', '2013-07-13'), (1114, 3.5, 'zz9', '2014-08-14'), (1115, 4.5, 'zz10', '2015-09-15'), (1116, 5.5, 'zz11', '2016-01-16'), (1117, 6.5, 'zz12', '2017-02-17'), (1118, 7.5, 'zz0', '2018-03-18'), (1119, 8.5, 'zz1', '2019-04-19'), (1120, 9.5, 'zz2', '2020-05-10'), (1121, 10.5, 'zz3', '2021-06-11'), (1122, 11.5, 'zz4', '2022-07-12'), (1123, 12.5, 'zz5', '2023-08-13'), (1124, 13.5, 'zz6', '2024-09-14'), (1125, 14.5, 'zz7', '2010-01-15'), (1126, 15.5, 'zz8', '2011-02-16'), (1127, 16.5, 'zz9', '2012-03-17'), (1128, 17.5, 'zz10', '2013-04-18'), (1129, 18.5, 'zz11', '2014-05-19'), (1130, 19.5, 'zz12', '2015-06-10'), (1131, 20.5, 'zz0', '2016-07-11'), (1132, 21.5, 'zz1', '2017-08-12'), (1133, 22.5, 'zz2', '2018-09-13'), (1134, 23.5, 'zz3', '2019-01-14'), (1135, 24.5, 'zz4', '2020-02-15'), (1136, 25.5, 'zz5', '2021-03-16'), (1137, 26.5, 'zz6', '2022-04-17'), (1138, 27.5, 'zz7', '2023-05-18'), (1139, 28.5, 'zz8', '2024-06-19'), (1140, 29.5, 'zz9', '2010-07-10'), (1141, 30.5, 'zz10', '2011-08-11'), (1142, 31.5, 'zz11', '2012-09-12'), (1143, 32.5, 'zz12', '2013-01-13'), (1144, 33.5, 'zz0', '2014-02-14'), (1145, 34.5, 'zz1', '2015-03-15'), (1146, 35.5, 'zz2', '2016-04-16'), (1147, 36.5, 'zz3', '2017-05-17'), (1148, 37.5, 'zz4', '2018-06-18'), (1149, 38.5, 'zz5', '2019-07-19'), (1150, 39.5, 'zz6', '2020-08-10'), (1151, 40.5, 'zz7', '2021-09-11'), (1152, 41.5, 'zz8', '2022-01-12'), (1153, 42.5, 'zz9', '2023-02-13'), (1154, 43.5, 'zz10', '2024-03-14'), (1155, 44.5, 'zz11', '2010-04-15'), (1156, 45.5, 'zz12', '2011-05-16'), (1157, 46.5, 'zz0', '2012-06-17'), (1158, 47.5, 'zz1', '2013-07-18'), (1159, 48.5, 'zz2', '2014-08-19'), (1160, 49.5, 'zz3', '2015-09-10'), (1161, 50.5, 'zz4', '2016-01-11'), (1162, 51.5, 'zz5', '2017-02-12'), (1163, 52.5, 'zz6', '2018-03-13'), (1164, 53.5, 'zz7', '2019-04-14'), (1165, 54.5, 'zz8', '2020-05-15'), (1166, 55.5, 'zz9', '2021-06-16'), (1167, 56.5, 'zz10', '2022-07-17'), (1168, 57.5, 'zz11', '2023-08-18'), (1169, 58.5, 'zz12', '2024-09-19'), (1170, 59.5, 'zz0', '2010-01-10'), (1171, 60.5, 'zz1', '2011-02-11'), (1172, 61.5, 'zz2', '2012-03-12'), (1173, 62.5, 'zz3', '2013-04-13'), (1174, 63.5, 'zz4', '2014-05-14'), (1175, 64.5, 'zz5', '2015-06-15'), (1176, 65.5, 'zz6', '2016-07-16'), (1177, 66.5, 'zz7', '2017-08-17'), (1178, 67.5, 'zz8', '2018-09-18'), (1179, 68.5, 'zz9', '2019-01-19'), (1180, 69.5, 'zz10', '2020-02-10'), (1181, 70.5, 'zz11', '2021-03-11'), (1182, 71.5, 'zz12', '2022-04-12'), (1183, 72.5, 'zz0', '2023-05-13'), (1184, 73.5, 'zz1', '2024-06-14'), (1185, 74.5, 'zz2', '2010-07-15'), (1186, 75.5, 'zz3', '2011-08-16'), (1187, 76.5, 'zz4', '2012-09-17'), (1188, 77.5, 'zz5', '2013-01-18'), (1189, 78.5, 'zz6', '2014-02-19'), (1190, 79.5, 'zz7', '2015-03-10'), (1191, 80.5, 'zz8', '2016-04-11'), (1192, 81.5, 'zz9', '2017-05-12'), (1193, 82.5, 'zz10', '2018-06-13'), (1194, 83.5, 'zz11', '2019-07-14'), (1195, 84.5, 'zz12', '2020-08-15'), (1196, 85.5, 'zz0', '2021-09-16'), (1197, 86.5, 'zz1', '2022-01-17'), (1198, 87.5, 'zz2', '2023-02-18'), (1199, 88.5, 'zz3', '2024-03-19'), (1200, 89.5, 'zz4', '2010-04-10'), (1201, 90.5, 'zz5', '2011-05-11'), (1202, 91.5, 'zz6', '2012-06-12'), (1203, 92.5, 'zz7', '2013-07-13'), (1204, 93.5, 'zz8', '2014-08-14'), (1205, 94.5, 'zz9', '2015-09-15'), (1206, 95.5, 'zz10', '2016-01-16'), (1207, 96.5, 'zz11', '2017-02-17'), (1208, 97.5, 'zz12', '2018-03-18'), (1209, 98.5, 'zz0', '2019-04-19'), (1210, 99.5, 'zz1', '2020-05-10'), (1211, 100.5, 'zz2', '2021-06-11'), (1212, 0.5, 'zz3', '2022-07-12'), (1213, 1.5, 'zz4', '2023-08-13'), (1214, 2.5, 'zz5', '2024-09-14'), (1215, 3.5, 'zz6', '2010-01-15'), (1216, 4.5, 'zz7', '2011-02-16'), (1217, 5.5, 'zz8', '2012-03-17'), (1218, 6.5, 'zz9', '2013-04-18'), (1219, 7.5, 'zz10', '2014-05-19'), (1220, 8.5, 'zz11', '2015-06-10'), (1221, 9.5, 'zz12', '2016-07-11'), (1222, 10.5, 'zz0', '2017-08-12'), (1223, 11.5, 'zz1', '2018-09-13'), (1224, 12.5, 'zz2', '2019-01-14'), (1225, 13.5, 'zz3', '2020-02-15'), (1226, 14.5, 'zz4', '2021-03-16'), (1227, 15.5, 'zz5', '2022-04-17'), (1228, 16.5, 'zz6', '2023-05-18'), (1229, 17.5, 'zz7', '2024-06-19'), (1230, 18.5, 'zz8', '2010-07-10'), (1231, 19.5, 'zz9', '2011-08-11'), (1232, 20.5, 'zz10', '2012-09-12'), (1233, 21.5, 'zz11', '2013-01-13'), (1234, 22.5, 'zz12', '2014-02-14'), (1235, 23.5, 'zz0', '2015-03-15'), (1236, 24.5, 'zz1', '2016-04-16'), (1237, 25.5, 'zz2', '2017-05-17'), (1238, 26.5, 'zz3', '2018-06-18'), (1239, 27.5, 'zz4', '2019-07-19'), (1240, 28.5, 'zz5', '2020-08-10'), (1241, 29.5, 'zz6', '2021-09-11'), (1242, 30.5, 'zz7', '2022-01-12'), (1243, 31.5, 'zz8', '2023-02-13'), (1244, 32.5, 'zz9', '2024-03-14'), (1245, 33.5, 'zz10', '2010-04-15'), (1246, 34.5, 'zz11', '2011-05-16'), (1247, 35.5, 'zz12', '2012-06-17'), (1248, 36.5, 'zz0', '2013-07-18'), (1249, 37.5, 'zz1', '2014-08-19'), (1250, 38.5, 'zz2', '2015-09-10'), (1251, 39.5, 'zz3', '2016-01-11'), (1252, 40.5, 'zz4', '2017-02-12'), (1253, 41.5, 'zz5', '2018-03-13'), (1254, 42.5, 'zz6', '2019-04-14'), (1255, 43.5, 'zz7', '2020-05-15'), (1256, 44.5, 'zz8', '2021-06-16'), (1257, 45.5, 'zz9', '2022-07-17'), (1258, 46.5, 'zz10', '2023-08-18'), (1259, 47.5, 'zz11', '2024-09-19'), (1260, 48.5, 'zz12', '2010-01-10'), (1261, 49.5, 'zz0', '2011-02-11'), (1262, 50.5, 'zz1', '2012-03-12'), (1263, 51.5, 'zz2', '2013-04-13'), (1264, 52.5, 'zz3', '2014-05-14'), (1265, 53.5, 'zz4', '2015-06-15'), (1266, 54.5, 'zz5', '2016-07-16'), (1267, 55.5, 'zz6', '2017-08-17'), (1268, 56.5, 'zz7', '2018-09-18'), (1269, 57.5, 'zz8', '2019-01-19'), (1270, 58.5, 'zz9', '2020-02-10'), (1271, 59.5, 'zz10', '2021-03-11'), (1272, 60.5, 'zz11', '2022-04-12'), (1273, 61.5, 'zz12', '2023-05-13'), (1274, 62.5, 'zz0', '2024-06-14'), (1275, 63.5, 'zz1', '2010-07-15'), (1276, 64.5, 'zz2', '2011-08-16'), (1277, 65.5, 'zz3', '2012-09-17'), (1278, 66.5, 'zz4', '2013-01-18'), (1279, 67.5, 'zz5', '2014-02-19'), (1280, 68.5, 'zz6', '2015-03-10'), (1281, 69.5, 'zz7', '2016-04-11'), (1282, 70.5, 'zz8', '2017-05-12'), (1283, 71.5, 'zz9', '2018-06-13'), (1284, 72.5, 'zz10', '2019-07-14'), (1285, 73.5, 'zz11', '2020-08-15'), (1286, 74.5, 'zz12', '2021-09-16'), (1287, 75.5, 'zz0', '2022-01-17'), (1288, 76.5, 'zz1', '2023-02-18'), (1289, 77.5, 'zz2', '2024-03-19'), (1290, 78.5, 'zz3', '2010-04-10'), (1291, 79.5, 'zz4', '2011-05-11'), (1292, 80.5, 'zz5', '2012-06-12'), (1293, 81.5, 'zz6', '2013-07-13'), (1294, 82.5, 'zz7', '2014-08-14'), (1295, 83.5, 'zz8', '2015-09-15'), (1296, 84.5, 'zz9', '2016-01-16'), (1297, 85.5, 'zz10', '2017-02-17'), (1298, 86.5, 'zz11', '2018-03-18'), (1299, 87.5, 'zz12', '2019-04-19'), (1300, 88.5, 'zz0', '2020-05-10'), (1301, 89.5, 'zz1', '2021-06-11'), (1302, 90.5, 'zz2', '2022-07-12'), (1303, 91.5, 'zz3', '2023-08-13'), (1304, 92.5, 'zz4', '2024-09-14'), (1305, 93.5, 'zz5', '2010-01-15'), (1306, 94.5, 'zz6', '2011-02-16'), (1307, 95.5, 'zz7', '2012-03-17'), (1308, 96.5, 'zz8', '2013-04-18'), (1309, 97.5, 'zz9', '2014-05-19'), (1310, 98.5, 'zz10', '2015-06-10'), (1311, 99.5, 'zz11', '2016-07-11'), (1312, 100.5, 'zz12', '2017-08-12'), (1313, 0.5, 'zz0', '2018-09-13'), (1314, 1.5, 'zz1', '2019-01-14'), (1315, 2.5, 'zz2', '2020-02-15'), (1316, 3.5, 'zz3', '2021-03-16'), (1317, 4.5, 'zz4', '2022-04-17'), (1318, 5.5, 'zz5', '2023-05-18'), (1319, 6.5, 'zz6', '2024-06-19'), (1320, 7.5, 'zz7', '2010-07-10'), (1321, 8.5, 'zz8', '2011-08-11'), (1322, 9.5, 'zz9', '2012-09-12'), (1323, 10.5, 'zz10', '2013-01-13'), (1324, 11.5, 'zz11', '2014-02-14'), (1325, 12.5, 'zz12', '2015-03-15'), (1326, 13.5, 'zz0', '2016-04-16'), (1327, 14.5, 'zz1', '2017-05-17'), (1328, 15.5, 'zz2', '2018-06-18'), (1329, 16.5, 'zz3', '2019-07-19'), (1330, 17.5, 'zz4', '2020-08-10'), (1331, 18.5, 'zz5', '2021-09-11'), (1332, 19.5, 'zz6', '2022-01-12'), (1333, 20.5, 'zz7', '2023-02-13'), (1334, 21.5, 'zz8', '2024-03-14'), (1335, 22.5, 'zz9', '2010-04-15'), (1336, 23.5, 'zz10', '2011-05-16'), (1337, 24.5, 'zz11', '2012-06-17'), (1338, 25.5, 'zz12', '2013-07-18'), (1339, 26.5, 'zz0', '2014-08-19'), (1340, 27.5, 'zz1', '2015-09-10'), (1341, 28.5, 'zz2', '2016-01-11'), (1342, 29.5, 'zz3', '2017-02-12'), (1343, 30.5, 'zz4', '2018-03-13'), (1344, 31.5, 'zz5', '2019-04-14'), (1345, 32.5, 'zz6', '2020-05-15'), (1346, 33.5, 'zz7', '2021-06-16'), (1347, 34.5, 'zz8', '2022-07-17'), (1348, 35.5, 'zz9', '2023-08-18'), (1349, 36.5, 'zz10', '2024-09-19'), (1350, 37.5, 'zz11', '2010-01-10'), (1351, 38.5, 'zz12', '2011-02-11'), (1352, 39.5, 'zz0', '2012-03-12'), (1353, 40.5, 'zz1', '2013-04-13'), (1354, 41.5, 'zz2', '2014-05-14'), (1355, 42.5, 'zz3', '2015-06-15'), (1356, 43.5, 'zz4', '2016-07-16'), (1357, 44.5, 'zz5', '2017-08-17'), (1358, 45.5, 'zz6', '2018-09-18'), (1359, 46.5, 'zz7', '2019-01-19'), (1360, 47.5, 'zz8', '2020-02-10'), (1361, 48.5, 'zz9', '2021-03-11'), (1362, 49.5, 'zz10', '2022-04-12'), (1363, 50.5, 'zz11', '2023-05-13'), (1364, 51.5, 'zz12', '2024-06-14'), (1365, 52.5, 'zz0', '2010-07-15'), (1366, 53.5, 'zz1', '2011-08-16'), (1367, 54.5, 'zz2', '2012-09-17'), (1368, 55.5, 'zz3', '2013-01-18'), (1369, 56.5, 'zz4', '2014-02-19'), (1370, 57.5, 'zz5', '2015-03-10'), (1371, 58.5, 'zz6', '2016-04-11'), (1372, 59.5, 'zz7', '2017-05-12'), (1373, 60.5, 'zz8', '2018-06-13'), (1374, 61.5, 'zz9', '2019-07-14'), (1375, 62.5, 'zz10', '2020-08-15'), (1376, 63.5, 'zz11', '2021-09-16'), (1377, 64.5, 'zz12', '2022-01-17'), (1378, 65.5, 'zz0', '2023-02-18'), (1379, 66.5, 'zz1', '2024-03-19'), (1380, 67.5, 'zz2', '2010-04-10'), (1381, 68.5, 'zz3', '2011-05-11'), (1382, 69.5, 'zz4', '2012-06-12'), (1383, 70.5, 'zz5', '2013-07-13'), (1384, 71.5, 'zz6', '2014-08-14'), (1385, 72.5, 'zz7', '2015-09-15'), (1386, 73.5, 'zz8', '2016-01-16'), (1387, 74.5, 'zz9', '2017-02-17'), (1388, 75.5, 'zz10', '2018-03-18'), (1389, 76.5, 'zz11', '2019-04-19'), (1390, 77.5, 'zz12', '2020-05-10'), (1391, 78.5, 'zz0', '2021-06-11'), (1392, 79.5, 'zz1', '2022-07-12'), (1393, 80.5, 'zz2', '2023-08-13'), (1394, 81.5, 'zz3', '2024-09-14'), (1395, 82.5, 'zz4', '2010-01-15'), (1396, 83.5, 'zz5', '2011-02-16'), (1397, 84.5, 'zz6', '2012-03-17'), (1398, 85.5, 'zz7', '2013-04-18'), (1399, 86.5, 'zz8', '2014-05-19'), (1400, 87.5, 'zz9', '2015-06-10'), (1401, 88.5, 'zz10', '2016-07-11'), (1402, 89.5, 'zz11', '2017-08-12'), (1403, 90.5, 'zz12', '2018-09-13'), (1404, 91.5, 'zz0', '2019-01-14'), (1405, 92.5, 'zz1', '2020-02-15'), (1406, 93.5, 'zz2', '2021-03-16'), (1407, 94.5, 'zz3', '2022-04-17'), (1408, 95.5, 'zz4', '2023-05-18'), (1409, 96.5, 'zz5', '2024-06-19'), (1410, 97.5, 'zz6', '2010-07-10'), (1411, 98.5, 'zz7', '2011-08-11'), (1412, 99.5, 'zz8', '2012-09-12'), (1413, 100.5, 'zz9', '2013-01-13'), (1414, 0.5, 'zz10', '2014-02-14'), (1415, 1.5, 'zz11', '2015-03-15'), (1416, 2.5, 'zz12', '2016-04-16'), (1417, 3.5, 'zz0', '2017-05-17'), (1418, 4.5, 'zz1', '2018-06-18'), (1419, 5.5, 'zz2', '2019-07-19'), (1420, 6.5, 'zz3', '2020-08-10'), (1421, 7.5, 'zz4', '2021-09-11'), (1422, 8.5, 'zz5', '2022-01-12'), (1423, 9.5, 'zz6', '2023-02-13'), (1424, 10.5, 'zz7', '2024-03-14'), (1425, 11.5, 'zz8', '2010-04-15'), (1426, 12.5, 'zz9', '2011-05-16'), (1427, 13.5, 'zz10', '2012-06-17'), (1428, 14.5, 'zz11', '2013-07-18'), (1429, 15.5, 'zz12', '2014-08-19'), (1430, 16.5, 'zz0', '2015-09-10'), (1431, 17.5, 'zz1', '2016-01-11'), (1432, 18.5, 'zz2', '2017-02-12'), (1433, 19.5, 'zz3', '2018-03-13'), (1434, 20.5, 'zz4', '2019-04-14'), (1435, 21.5, 'zz5', '2020-05-15'), (1436, 22.5, 'zz6', '2021-06-16'), (1437, 23.5, 'zz7', '2022-07-17'), (1438, 24.5, 'zz8', '2023-08-18'), (1439, 25.5, 'zz9', '2024-09-19'), (1440, 26.5, 'zz10', '2010-01-10'), (1441, 27.5, 'zz11', '2011-02-11'), (1442, 28.5, 'zz12', '2012-03-12'), (1443, 29.5, 'zz0', '2013-04-13'), (1444, 30.5, 'zz1', '2014-05-14'), (1445, 31.5, 'zz2', '2015-06-15'), (1446, 32.5, 'zz3', '2016-07-16'), (1447, 33.5, 'zz4', '2017-08-17'), (1448, 34.5, 'zz5', '2018-09-18'), (1449, 35.5, 'zz6', '2019-01-19'), (1450, 36.5, 'zz7', '2020-02-10'), (1451, 37.5, 'zz8', '2021-03-11'), (1452, 38.5, 'zz9', '2022-04-12'), (1453, 39.5, 'zz10', '2023-05-13'), (1454, 40.5, 'zz11', '2024-06-14'), (1455, 41.5, 'zz12', '2010-07-15'), (1456, 42.5, 'zz0', '2011-08-16'), (1457, 43.5, 'zz1', '2012-09-17'), (1458, 44.5, 'zz2', '2013-01-18'), (1459, 45.5, 'zz3', '2014-02-19'), (1460, 46.5, 'zz4', '2015-03-10'), (1461, 47.5, 'zz5', '2016-04-11'), (1462, 48.5, 'zz6', '2017-05-12'), (1463, 49.5, 'zz7', '2018-06-13'), (1464, 50.5, 'zz8', '2019-07-14'), (1465, 51.5, 'zz9', '2020-08-15'), (1466, 52.5, 'zz10', '2021-09-16'), (1467, 53.5, 'zz11', '2022-01-17'), (1468, 54.5, 'zz12', '2023-02-18'), (1469, 55.5, 'zz0', '2024-03-19'), (1470, 56.5, 'zz1', '2010-04-10'), (1471, 57.5, 'zz2', '2011-05-11'), (1472, 58.5, 'zz3', '2012-06-12'), (1473, 59.5, 'zz4', '2013-07-13'), (1474, 60.5, 'zz5', '2014-08-14'), (1475, 61.5, 'zz6', '2015-09-15'), (1476, 62.5, 'zz7', '2016-01-16'), (1477, 63.5, 'zz8', '2017-02-17'), (1478, 64.5, 'zz9', '2018-03-18'), (1479, 65.5, 'zz10', '2019-04-19'), (1480, 66.5, 'zz11', '2020-05-10'), (1481, 67.5, 'zz12', '2021-06-11'), (1482, 68.5, 'zz0', '2022-07-12'), (1483, 69.5, 'zz1', '2023-08-13'), (1484, 70.5, 'zz2', '2024-09-14'), (1485, 71.5, 'zz3', '2010-01-15'), (1486, 72.5, 'zz4', '2011-02-16'), (1487, 73.5, 'zz5', '2012-03-17'), (1488, 74.5, 'zz6', '2013-04-18'), (1489, 75.5, 'zz7', '2014-05-19'), (1490, 76.5, 'zz8', '2015-06-10'), (1491, 77.5, 'zz9', '2016-07-11'), (1492, 78.5, 'zz10', '2017-08-12'), (1493, 79.5, 'zz11', '2018-09-13'), (1494, 80.5, 'zz12', '2019-01-14'), (1495, 81.5, 'zz0', '2020-02-15'), (1496, 82.5, 'zz1', '2021-03-16'), (1497, 83.5, 'zz2', '2022-04-17'), (1498, 84.5, 'zz3', '2023-05-18'), (1499, 85.5, 'zz4', '2024-06-19'), (1500, 86.5, 'zz5', '2010-07-10'), (1501, 87.5, 'zz6', '2011-08-11'), (1502, 88.5, 'zz7', '2012-09-12'), (1503, 89.5, 'zz8', '2013-01-13'), (1504, 90.5, 'zz9', '2014-02-14'), (1505, 91.5, 'zz10', '2015-03-15'), (1506, 92.5, 'zz11', '2016-04-16'), (1507, 93.5, 'zz12', '2017-05-17'), (1508, 94.5, 'zz0', '2018-06-18'), (1509, 95.5, 'zz1', '2019-07-19'), (1510, 96.5, 'zz2', '2020-08-10'), (1511, 97.5, 'zz3', '2021-09-11'), (1512, 98.5, 'zz4', '2022-01-12'), (1513, 99.5, 'zz5', '2023-02-13'), (1514, 100.5, 'zz6', '2024-03-14'), (1515, 0.5, 'zz7', '2010-04-15'), (1516, 1.5, 'zz8', '2011-05-16'), (1517, 2.5, 'zz9', '2012-06-17'), (1518, 3.5, 'zz10', '2013-07-18'), (1519, 4.5, 'zz11', '2014-08-19'), (1520, 5.5, 'zz12', '2015-09-10'), (1521, 6.5, 'zz0', '2016-01-11'), (1522, 7.5, 'zz1', '2017-02-12'), (1523, 8.5, 'zz2', '2018-03-13'), (1524, 9.5, 'zz3', '2019-04-14'), (1525, 10.5, 'zz4', '2020-05-15'), (1526, 11.5, 'zz5', '2021-06-16'), (1527, 12.5, 'zz6', '2022-07-17'), (1528, 13.5, 'zz7', '2023-08-18'), (1529, 14.5, 'zz8', '2024-09-19'), (1530, 15.5, 'zz9', '2010-01-10'), (1531, 16.5, 'zz10', '2011-02-11'), (1532, 17.5, 'zz11', '2012-03-12'), (1533, 18.5, 'zz12', '2013-04-13'), (1534, 19.5, 'zz0', '2014-05-14'), (1535, 20.5, 'zz1', '2015-06-15'), (1536, 21.5, 'zz2', '2016-07-16'), (1537, 22.5, 'zz3', '2017-08-17'), (1538, 23.5, 'zz4', '2018-09-18'), (1539, 24.5, 'zz5', '2019-01-19'), (1540, 25.5, 'zz6', '2020-02-10'), (1541, 26.5, 'zz7', '2021-03-11'), (1542, 27.5, 'zz8', '2022-04-12'), (1543, 28.5, 'zz9', '2023-05-13'), (1544, 29.5, 'zz10', '2024-06-14'), (1545, 30.5, 'zz11', '2010-07-15'), (1546, 31.5, 'zz12', '2011-08-16'), (1547, 32.5, 'zz0', '2012-09-17'), (1548, 33.5, 'zz1', '2013-01-18'), (1549, 34.5, 'zz2', '2014-02-19'), (1550, 35.5, 'zz3', '2015-03-10'), (1551, 36.5, 'zz4', '2016-04-11'), (1552, 37.5, 'zz5', '2017-05-12'), (1553, 38.5, 'zz6', '2018-06-13'), (1554, 39.5, 'zz7', '2019-07-14'), (1555, 40.5, 'zz8', '2020-08-15'), (1556, 41.5, 'zz9', '2021-09-16'), (1557, 42.5, 'zz10', '2022-01-17'), (1558, 43.5, 'zz11', '2023-02-18'), (1559, 44.5, 'zz12', '2024-03-19'), (1560, 45.5, 'zz0', '2010-04-10'), (1561, 46.5, 'zz1', '2011-05-11'), (1562, 47.5, 'zz2', '2012-06-12'), (1563, 48.5, 'zz3', '2013-07-13'), (1564, 49.5, 'zz4', '2014-08-14'), (1565, 50.5, 'zz5', '2015-09-15'), (1566, 51.5, 'zz6', '2016-01-16'), (1567, 52.5, 'zz7', '2017-02-17'), (1568, 53.5, 'zz8', '2018-03-18'), (1569, 54.5, 'zz9', '2019-04-19'), (1570, 55.5, 'zz10', '2020-05-10'), (1571, 56.5, 'zz11', '2021-06-11'), (1572, 57.5, 'zz12', '2022-07-12'), (1573, 58.5, 'zz0', '2023-08-13'), (1574, 59.5, 'zz1', '2024-09-14'), (1575, 60.5, 'zz2', '2010-01-15'), (1576, 61.5, 'zz3', '2011-02-16'), (1577, 62.5, 'zz4', '2012-03-17'), (1578, 63.5, 'zz5', '2013-04-18'), (1579, 64.5, 'zz6', '2014-05-19'), (1580, 65.5, 'zz7', '2015-06-10'), (1581, 66.5, 'zz8', '2016-07-11'), (1582, 67.5, 'zz9', '2017-08-12'), (1583, 68.5, 'zz10', '2018-09-13'), (1584, 69.5, 'zz11', '2019-01-14'), (1585, 70.5, 'zz12', '2020-02-15'), (1586, 71.5, 'zz0', '2021-03-16'), (1587, 72.5, 'zz1', '2022-04-17'), (1588, 73.5, 'zz2', '2023-05-18'), (1589, 74.5, 'zz3', '2024-06-19'), (1590, 75.5, 'zz4', '2010-07-10'), (1591, 76.5, 'zz5', '2011-08-11'), (1592, 77.5, 'zz6', '2012-09-12'), (1593, 78.5, 'zz7', '2013-01-13'), (1594, 79.5, 'zz8', '2014-02-14'), (1595, 80.5, 'zz9', '2015-03-15'), (1596, 81.5, 'zz10', '2016-04-16'), (1597, 82.5, 'zz11', '2017-05-17'), (1598, 83.5, 'zz12', '2018-06-18'), (1599, 84.5, 'zz0', '2019-07-19'), (1600, 85.5, 'zz1', '2020-08-10'), (1601, 86.5, 'zz2', '2021-09-11'), (1602, 87.5, 'zz3', '2022-01-12'), (1603, 88.5, 'zz4', '2023-02-13'), (1604, 89.5, 'zz5', '2024-03-14'), (1605, 90.5, 'zz6', '2010-04-15'), (1606, 91.5, 'zz7', '2011-05-16'), (1607, 92.5, 'zz8', '2012-06-17'), (1608, 93.5, 'zz9', '2013-07-18'), (1609, 94.5, 'zz10', '2014-08-19'), (1610, 95.5, 'zz11', '2015-09-10'), (1611, 96.5, 'zz12', '2016-01-11'), (1612, 97.5, 'zz0', '2017-02-12'), (1613, 98.5, 'zz1', '2018-03-13'), (1614, 99.5, 'zz2', '2019-04-14'), (1615, 100.5, 'zz3', '2020-05-15'), (1616, 0.5, 'zz4', '2021-06-16'), (1617, 1.5, 'zz5', '2022-07-17'), (1618, 2.5, 'zz6', '2023-08-18'), (1619, 3.5, 'zz7', '2024-09-19'), (1620, 4.5, 'zz8', '2010-01-10'), (1621, 5.5, 'zz9', '2011-02-11'), (1622, 6.5, 'zz10', '2012-03-12'), (1623, 7.5, 'zz11', '2013-04-13'), (1624, 8.5, 'zz12', '2014-05-14'), (1625, 9.5, 'zz0', '2015-06-15'), (1626, 10.5, 'zz1', '2016-07-16'), (1627, 11.5, 'zz2', '2017-08-17'), (1628, 12.5, 'zz3', '2018-09-18'), (1629, 13.5, 'zz4', '2019-01-19'), (1630, 14.5, 'zz5', '2020-02-10'), (1631, 15.5, 'zz6', '2021-03-11'), (1632, 16.5, 'zz7', '2022-04-12'), (1633, 17.5, 'zz8', '2023-05-13'), (1634, 18.5, 'zz9', '2024-06-14'), (1635, 19.5, 'zz10', '2010-07-15'), (1636, 20.5, 'zz11', '2011-08-16'), (1637, 21.5, 'zz12', '2012-09-17'), (1638, 22.5, 'zz0', '2013-01-18'), (1639, 23.5, 'zz1', '2014-02-19'), (1640, 24.5, 'zz2', '2015-03-10'), (1641, 25.5, 'zz3', '2016-04-11'), (1642, 26.5, 'zz4', '2017-05-12'), (1643, 27.5, 'zz5', '2018-06-13'), (1644, 28.5, 'zz6', '2019-07-14'), (1645, 29.5, 'zz7', '2020-08-15'), (1646, 30.5, 'zz8', '2021-09-16'), (1647, 31.5, 'zz9', '2022-01-17'), (1648, 32.5, 'zz10', '2023-02-18'), (1649, 33.5, 'zz11', '2024-03-19'), (1650, 34.5, 'zz12', '2010-04-10'), (1651, 35.5, 'zz0', '2011-05-11'), (1652, 36.5, 'zz1', '2012-06-12'), (1653, 37.5, 'zz2', '2013-07-13'), (1654, 38.5, 'zz3', '2014-08-14'), (1655, 39.5, 'zz4', '2015-09-15'), (1656, 40.5, 'zz5', '2016-01-16'), (1657, 41.5, 'zz6', '2017-02-17'), (1658, 42.5, 'zz7', '2018-03-18'), (1659, 43.5, 'zz8', '2019-04-19'), (1660, 44.5, 'zz9', '2020-05-10'), (1661, 45.5, 'zz10', '2021-06-11'), (1662, 46.5, 'zz11', '2022-07-12'), (1663, 47.5, 'zz12', '2023-08-13'), (1664, 48.5, 'zz0', '2024-09-14'), (1665, 49.5, 'zz1', '2010-01-15'), (1666, 50.5, 'zz2', '2011-02-16'), (1667, 51.5, 'zz3', '2012-03-17'), (1668, 52.5, 'zz4', '2013-04-18'), (1669, 53.5, 'zz5', '2014-05-19'), (1670, 54.5, 'zz6', '2015-06-10'), (1671, 55.5, 'zz7', '2016-07-11'), (1672, 56.5, 'zz8', '2017-08-12'), (1673, 57.5, 'zz9', '2018-09-13'), (1674, 58.5, 'zz10', '2019-01-14'), (1675, 59.5, 'zz11', '2020-02-15'), (1676, 60.5, 'zz12', '2021-03-16'), (1677, 61.5, 'zz0', '2022-04-17'), (1678, 62.5, 'zz1', '2023-05-18'), (1679, 63.5, 'zz2', '2024-06-19'), (1680, 64.5, 'zz3', '2010-07-10'), (1681, 65.5, 'zz4', '2011-08-11'), (1682, 66.5, 'zz5', '2012-09-12'), (1683, 67.5, 'zz6', '2013-01-13'), (1684, 68.5, 'zz7', '2014-02-14'), (1685, 69.5, 'zz8', '2015-03-15'), (1686, 70.5, 'zz9', '2016-04-16'), (1687, 71.5, 'zz10', '2017-05-17'), (1688, 72.5, 'zz11', '2018-06-18'), (1689, 73.5, 'zz12', '2019-07-19'), (1690, 74.5, 'zz0', '2020-08-10'), (1691, 75.5, 'zz1', '2021-09-11'), (1692, 76.5, 'zz2', '2022-01-12'), (1693, 77.5, 'zz3', '2023-02-13'), (1694, 78.5, 'zz4', '2024-03-14'), (1695, 79.5, 'zz5', '2010-04-15'), (1696, 80.5, 'zz6', '2011-05-16'), (1697, 81.5, 'zz7', '2012-06-17'), (1698, 82.5, 'zz8', '2013-07-18'), (1699, 83.5, 'zz9', '2014-08-19'), (1700, 84.5, 'zz10', '2015-09-10'), (1701, 85.5, 'zz11', '2016-01-11'), (1702, 86.5, 'zz12', '2017-02-12'), (1703, 87.5, 'zz0', '2018-03-13'), (1704, 88.5, 'zz1', '2019-04-14'), (1705, 89.5, 'zz2', '2020-05-15'), (1706, 90.5, 'zz3', '2021-06-16'), (1707, 91.5, 'zz4', '2022-07-17'), (1708, 92.5, 'zz5', '2023-08-18'), (1709, 93.5, 'zz6', '2024-09-19'), (1710, 94.5, 'zz7', '2010-01-10'), (1711, 95.5, 'zz8', '2011-02-11'), (1712, 96.5, 'zz9', '2012-03-12'), (1713, 97.5, 'zz10', '2013-04-13'), (1714, 98.5, 'zz11', '2014-05-14'), (1715, 99.5, 'zz12', '2015-06-15'), (1716, 100.5, 'zz0', '2016-07-16'), (1717, 0.5, 'zz1', '2017-08-17'), (1718, 1.5, 'zz2', '2018-09-18'), (1719, 2.5, 'zz3', '2019-01-19'), (1720, 3.5, 'zz4', '2020-02-10'), (1721, 4.5, 'zz5', '2021-03-11'), (1722, 5.5, 'zz6', '2022-04-12'), (1723, 6.5, 'zz7', '2023-05-13'), (1724, 7.5, 'zz8', '2024-06-14'), (1725, 8.5, 'zz9', '2010-07-15'), (1726, 9.5, 'zz10', '2011-08-16'), (1727, 10.5, 'zz11', '2012-09-17'), (1728, 11.5, 'zz12', '2013-01-18'), (1729, 12.5, 'zz0', '2014-02-19'), (1730, 13.5, 'zz1', '2015-03-10'), (1731, 14.5, 'zz2', '2016-04-11'), (1732, 15.5, 'zz3', '2017-05-12'), (1733, 16.5, 'zz4', '2018-06-13'), (1734, 17.5, 'zz5', '2019-07-14'), (1735, 18.5, 'zz6', '2020-08-15'), (1736, 19.5, 'zz7', '2021-09-16'), (1737, 20.5, 'zz8', '2022-01-17'), (1738, 21.5, 'zz9', '2023-02-18'), (1739, 22.5, 'zz10', '2024-03-19'), (1740, 23.5, 'zz11', '2010-04-10'), (1741, 24.5, 'zz12', '2011-05-11'), (1742, 25.5, 'zz0', '2012-06-12'), (1743, 26.5, 'zz1', '2013-07-13'), (1744, 27.5, 'zz2', '2014-08-14'), (1745, 28.5, 'zz3', '2015-09-15'), (1746, 29.5, 'zz4', '2016-01-16'), (1747, 30.5, 'zz5', '2017-02-17'), (1748, 31.5, 'zz6', '2018-03-18'), (1749, 32.5, 'zz7', '2019-04-19'), (1750, 33.5, 'zz8', '2020-05-10'), (1751, 34.5, 'zz9', '2021-06-11'), (1752, 35.5, 'zz10', '2022-07-12'), (1753, 36.5, 'zz11', '2023-08-13'), (1754, 37.5, 'zz12', '2024-09-14'), (1755, 38.5, 'zz0', '2010-01-15'), (1756, 39.5, 'zz1', '2011-02-16'), (1757, 40.5, 'zz2', '2012-03-17'), (1758, 41.5, 'zz3', '2013-04-18'), (1759, 42.5, 'zz4', '2014-05-19'), (1760, 43.5, 'zz5', '2015-06-10'), (1761, 44.5, 'zz6', '2016-07-11'), (1762, 45.5, 'zz7', '2017-08-12'), (1763, 46.5, 'zz8', '2018-09-13'), (1764, 47.5, 'zz9', '2019-01-14'), (1765, 48.5, 'zz10', '2020-02-15'), (1766, 49.5, 'zz11', '2021-03-16'), (1767, 50.5, 'zz12', '2022-04-17'), (1768, 51.5, 'zz0', '2023-05-18'), (1769, 52.5, 'zz1', '2024-06-19'), (1770, 53.5, 'zz2', '2010-07-10'), (1771, 54.5, 'zz3', '2011-08-11'), (1772, 55.5, 'zz4', '2012-09-12'), (1773, 56.5, 'zz5', '2013-01-13'), (1774, 57.5, 'zz6', '2014-02-14'), (1775, 58.5, 'zz7', '2015-03-15'), (1776, 59.5, 'zz8', '2016-04-16'), (1777, 60.5, 'zz9', '2017-05-17'), (1778, 61.5, 'zz10', '2018-06-18'), (1779, 62.5, 'zz11', '2019-07-19'), (1780, 63.5, 'zz12', '2020-08-10'), (1781, 64.5, 'zz0', '2021-09-11'), (1782, 65.5, 'zz1', '2022-01-12'), (1783, 66.5, 'zz2', '2023-02-13'), (1784, 67.5, 'zz3', '2024-03-14'), (1785, 68.5, 'zz4', '2010-04-15'), (1786, 69.5, 'zz5', '2011-05-16'), (1787, 70.5, 'zz6', '2012-06-17'), (1788, 71.5, 'zz7', '2013-07-18'), (1789, 72.5, 'zz8', '2014-08-19'), (1790, 73.5, 'zz9', '2015-09-10'), (1791, 74.5, 'zz10', '2016-01-11'), (1792, 75.5, 'zz11', '2017-02-12'), (1793, 76.5, 'zz12', '2018-03-13'), (1794, 77.5, 'zz0', '2019-04-14'), (1795, 78.5, 'zz1', '2020-05-15'), (1796, 79.5, 'zz2', '2021-06-16'), (1797, 80.5, 'zz3', '2022-07-17'), (1798, 81.5, 'zz4', '2023-08-18'), (1799, 82.5, 'zz5', '2024-09-19'), (1800, 83.5, 'zz6', '2010-01-10'), (1801, 84.5, 'zz7', '2011-02-11'), (1802, 85.5, 'zz8', '2012-03-12'), (1803, 86.5, 'zz9', '2013-04-13'), (1804, 87.5, 'zz10', '2014-05-14'), (1805, 88.5, 'zz11', '2015-06-15'), (1806, 89.5, 'zz12', '2016-07-16'), (1807, 90.5, 'zz0', '2017-08-17'), (1808, 91.5, 'zz1', '2018-09-18'), (1809, 92.5, 'zz2', '2019-01-19'), (1810, 93.5, 'zz3', '2020-02-10'), (1811, 94.5, 'zz4', '2021-03-11'), (1812, 95.5, 'zz5', '2022-04-12'), (1813, 96.5, 'zz6', '2023-05-13'), (1814, 97.5, 'zz7', '2024-06-14'), (1815, 98.5, 'zz8', '2010-07-15'), (1816, 99.5, 'zz9', '2011-08-16'), (1817, 100.5, 'zz10', '2012-09-17'), (1818, 0.5, 'zz11', '2013-01-18'), (1819, 1.5, 'zz12', '2014-02-19'), (1820, 2.5, 'zz0', '2015-03-10'), (1821, 3.5, 'zz1', '2016-04-11'), (1822, 4.5, 'zz2', '2017-05-12'), (1823, 5.5, 'zz3', '2018-06-13'), (1824, 6.5, 'zz4', '2019-07-14'), (1825, 7.5, 'zz5', '2020-08-15'), (1826, 8.5, 'zz6', '2021-09-16'), (1827, 9.5, 'zz7', '2022-01-17'), (1828, 10.5, 'zz8', '2023-02-18'), (1829, 11.5, 'zz9', '2024-03-19'), (1830, 12.5, 'zz10', '2010-04-10'), (1831, 13.5, 'zz11', '2011-05-11'), (1832, 14.5, 'zz12', '2012-06-12'), (1833, 15.5, 'zz0', '2013-07-13'), (1834, 16.5, 'zz1', '2014-08-14'), (1835, 17.5, 'zz2', '2015-09-15'), (1836, 18.5, 'zz3', '2016-01-16'), (1837, 19.5, 'zz4', '2017-02-17'), (1838, 20.5, 'zz5', '2018-03-18'), (1839, 21.5, 'zz6', '2019-04-19'), (1840, 22.5, 'zz7', '2020-05-10'), (1841, 23.5, 'zz8', '2021-06-11'), (1842, 24.5, 'zz9', '2022-07-12'), (1843, 25.5, 'zz10', '2023-08-13'), (1844, 26.5, 'zz11', '2024-09-14'), (1845, 27.5, 'zz12', '2010-01-15'), (1846, 28.5, 'zz0', '2011-02-16'), (1847, 29.5, 'zz1', '2012-03-17'), (1848, 30.5, 'zz2', '2013-04-18'), (1849, 31.5, 'zz3', '2014-05-19'), (1850, 32.5, 'zz4', '2015-06-10'), (1851, 33.5, 'zz5', '2016-07-11'), (1852, 34.5, 'zz6', '2017-08-12'), (1853, 35.5, 'zz7', '2018-09-13'), (1854, 36.5, 'zz8', '2019-01-14'), (1855, 37.5, 'zz9', '2020-02-15'), (1856, 38.5, 'zz10', '2021-03-16'), (1857, 39.5, 'zz11', '2022-04-17'), (1858, 40.5, 'zz12', '2023-05-18'), (1859, 41.5, 'zz0', '2024-06-19'), (1860, 42.5, 'zz1', '2010-07-10'), (1861, 43.5, 'zz2', '2011-08-11'), (1862, 44.5, 'zz3', '2012-09-12'), (1863, 45.5, 'zz4', '2013-01-13'), (1864, 46.5, 'zz5', '2014-02-14'), (1865, 47.5, 'zz6', '2015-03-15'), (1866, 48.5, 'zz7', '2016-04-16'), (1867, 49.5, 'zz8', '2017-05-17'), (1868, 50.5, 'zz9', '2018-06-18'), (1869, 51.5, 'zz10', '2019-07-19'), (1870, 52.5, 'zz11', '2020-08-10'), (1871, 53.5, 'zz12', '2021-09-11'), (1872, 54.5, 'zz0', '2022-01-12'), (1873, 55.5, 'zz1', '2023-02-13'), (1874, 56.5, 'zz2', '2024-03-14'), (1875, 57.5, 'zz3', '2010-04-15'), (1876, 58.5, 'zz4', '2011-05-16'), (1877, 59.5, 'zz5', '2012-06-17'), (1878, 60.5, 'zz6', '2013-07-18'), (1879, 61.5, 'zz7', '2014-08-19'), (1880, 62.5, 'zz8', '2015-09-10'), (1881, 63.5, 'zz9', '2016-01-11'), (1882, 64.5, 'zz10', '2017-02-12'), (1883, 65.5, 'zz11', '2018-03-13'), (1884, 66.5, 'zz12', '2019-04-14'), (1885, 67.5, 'zz0', '2020-05-15'), (1886, 68.5, 'zz1', '2021-06-16'), (1887, 69.5, 'zz2', '2022-07-17'), (1888, 70.5, 'zz3', '2023-08-18'), (1889, 71.5, 'zz4', '2024-09-19'), (1890, 72.5, 'zz5', '2010-01-10'), (1891, 73.5, 'zz6', '2011-02-11'), (1892, 74.5, 'zz7', '2012-03-12'), (1893, 75.5, 'zz8', '2013-04-13'), (1894, 76.5, 'zz9', '2014-05-14'), (1895, 77.5, 'zz10', '2015-06-15'), (1896, 78.5, 'zz11', '2016-07-16'), (1897, 79.5, 'zz12', '2017-08-17'), (1898, 80.5, 'zz0', '2018-09-18'), (1899, 81.5, 'zz1', '2019-01-19'), (1900, 82.5, 'zz2', '2020-02-10'), (1901, 83.5, 'zz3', '2021-03-11'), (1902, 84.5, 'zz4', '2022-04-12'), (1903, 85.5, 'zz5', '2023-05-13'), (1904, 86.5, 'zz6', '2024-06-14'), (1905, 87.5, 'zz7', '2010-07-15'), (1906, 88.5, 'zz8', '2011-08-16'), (1907, 89.5, 'zz9', '2012-09-17'), (1908, 90.5, 'zz10', '2013-01-18'), (1909, 91.5, 'zz11', '2014-02-19'), (1910, 92.5, 'zz12', '2015-03-10'), (1911, 93.5, 'zz0', '2016-04-11'), (1912, 94.5, 'zz1', '2017-05-12'), (1913, 95.5, 'zz2', '2018-06-13'), (1914, 96.5, 'zz3', '2019-07-14'), (1915, 97.5, 'zz4', '2020-08-15'), (1916, 98.5, 'zz5', '2021-09-16'), (1917, 99.5, 'zz6', '2022-01-17'), (1918, 100.5, 'zz7', '2023-02-18'), (1919, 0.5, 'zz8', '2024-03-19'), (1920, 1.5, 'zz9', '2010-04-10'), (1921, 2.5, 'zz10', '2011-05-11'), (1922, 3.5, 'zz11', '2012-06-12'), (1923, 4.5, 'zz12', '2013-07-13'), (1924, 5.5, 'zz0', '2014-08-14'), (1925, 6.5, 'zz1', '2015-09-15'), (1926, 7.5, 'zz2', '2016-01-16'), (1927, 8.5, 'zz3', '2017-02-17'), (1928, 9.5, 'zz4', '2018-03-18'), (1929, 10.5, 'zz5', '2019-04-19'), (1930, 11.5, 'zz6', '2020-05-10'), (1931, 12.5, 'zz7', '2021-06-11'), (1932, 13.5, 'zz8', '2022-07-12'), (1933, 14.5, 'zz9', '2023-08-13'), (1934, 15.5, 'zz10', '2024-09-14'), (1935, 16.5, 'zz11', '2010-01-15'), (1936, 17.5, 'zz12', '2011-02-16'), (1937, 18.5, 'zz0', '2012-03-17'), (1938, 19.5, 'zz1', '2013-04-18'), (1939, 20.5, 'zz2', '2014-05-19'), (1940, 21.5, 'zz3', '2015-06-10'), (1941, 22.5, 'zz4', '2016-07-11'), (1942, 23.5, 'zz5', '2017-08-12'), (1943, 24.5, 'zz6', '2018-09-13'), (1944, 25.5, 'zz7', '2019-01-14'), (1945, 26.5, 'zz8', '2020-02-15'), (1946, 27.5, 'zz9', '2021-03-16'), (1947, 28.5, 'zz10', '2022-04-17'), (1948, 29.5, 'zz11', '2023-05-18'), (1949, 30.5, 'zz12', '2024-06-19'), (1950, 31.5, 'zz0', '2010-07-10'), (1951, 32.5, 'zz1', '2011-08-11'), (1952, 33.5, 'zz2', '2012-09-12'), (1953, 34.5, 'zz3', '2013-01-13'), (1954, 35.5, 'zz4', '2014-02-14'), (1955, 36.5, 'zz5', '2015-03-15'), (1956, 37.5, 'zz6', '2016-04-16'), (1957, 38.5, 'zz7', '2017-05-17'), (1958, 39.5, 'zz8', '2018-06-18'), (1959, 40.5, 'zz9', '2019-07-19'), (1960, 41.5, 'zz10', '2020-08-10'), (1961, 42.5, 'zz11', '2021-09-11'), (1962, 43.5, 'zz12', '2022-01-12'), (1963, 44.5, 'zz0', '2023-02-13'), (1964, 45.5, 'zz1', '2024-03-14'), (1965, 46.5, 'zz2', '2010-04-15'), (1966, 47.5, 'zz3', '2011-05-16'), (1967, 48.5, 'zz4', '2012-06-17'), (1968, 49.5, 'zz5', '2013-07-18'), (1969, 50.5, 'zz6', '2014-08-19'), (1970, 51.5, 'zz7', '2015-09-10'), (1971, 52.5, 'zz8', '2016-01-11'), (1972, 53.5, 'zz9', '2017-02-12'), (1973, 54.5, 'zz10', '2018-03-13'), (1974, 55.5, 'zz11', '2019-04-14'), (1975, 56.5, 'zz12', '2020-05-15'), (1976, 57.5, 'zz0', '2021-06-16'), (1977, 58.5, 'zz1', '2022-07-17'), (1978, 59.5, 'zz2', '2023-08-18'), (1979, 60.5, 'zz3', '2024-09-19'), (1980, 61.5, 'zz4', '2010-01-10'), (1981, 62.5, 'zz5', '2011-02-11'), (1982, 63.5, 'zz6', '2012-03-12'), (1983, 64.5, 'zz7', '2013-04-13'), (1984, 65.5, 'zz8', '2014-05-14'), (1985, 66.5, 'zz9', '2015-06-15'), (1986, 67.5, 'zz10', '2016-07-16'), (1987, 68.5, 'zz11', '2017-08-17'), (1988, 69.5, 'zz12', '2018-09-18'), (1989, 70.5, 'zz0', '2019-01-19'), (1990, 71.5, 'zz1', '2020-02-10'), (1991, 72.5, 'zz2', '2021-03-11'), (1992, 73.5, 'zz3', '2022-04-12'), (1993, 74.5, 'zz4', '2023-05-13'), (1994, 75.5, 'zz5', '2024-06-14'), (1995, 76.5, 'zz6', '2010-07-15'), (1996, 77.5, 'zz7', '2011-08-16'), (1997, 78.5, 'zz8', '2012-09-17'), (1998, 79.5, 'zz9', '2013-01-18'), (1999, 80.5, 'zz10', '2014-02-19'), (2000, 81.5, 'zz11', '2015-03-10'), (2001, 82.5, 'zz12', '2016-04-11'), (2002, 83.5, 'zz0', '2017-05-12'), (2003, 84.5, 'zz1', '2018-06-13'), (2004, 85.5, 'zz2', '2019-07-14'), (2005, 86.5, 'zz3', '2020-08-15'), (2006, 87.5, 'zz4', '2021-09-16'), (2007, 88.5, 'zz5', '2022-01-17'), (2008, 89.5, 'zz6', '2023-02-18'), (2009, 90.5, 'zz7', '2024-03-19'), (2010, 91.5, 'zz8', '2010-04-10'), (2011, 92.5, 'zz9', '2011-05-11'), (2012, 93.5, 'zz10', '2012-06-12'), (2013, 94.5, 'zz11', '2013-07-13'), (2014, 95.5, 'zz12', '2014-08-14'), (2015, 96.5, 'zz0', '2015-09-15'), (2016, 97.5, 'zz1', '2016-01-16'), (2017, 98.5, 'zz2', '2017-02-17'), (2018, 99.5, 'zz3', '2018-03-18'), (2019, 100.5, 'zz4', '2019-04-19'), (2020, 0.5, 'zz5', '2020-05-10'), (2021, 1.5, 'zz6', '2021-06-11'), (2022, 2.5, 'zz7', '2022-07-12'), (2023, 3.5, 'zz8', '2023-08-13'), (2024, 4.5, 'zz9', '2024-09-14'), (2025, 5.5, 'zz10', '2010-01-15'), (2026, 6.5, 'zz11', '2011-02-16'), (2027, 7.5, 'zz12', '2012-03-17'), (2028, 8.5, 'zz0', '2013-04-18'), (2029, 9.5, 'zz1', '2014-05-19'), (2030, 10.5, 'zz2', '2015-06-10'), (2031, 11.5, 'zz3', '2016-07-11'), (2032, 12.5, 'zz4', '2017-08-12'), (2033, 13.5, 'zz5', '2018-09-13'), (2034, 14.5, 'zz6', '2019-01-14'), (2035, 15.5, 'zz7', '2020-02-15'), (2036, 16.5, 'zz8', '2021-03-16'), (2037, 17.5, 'zz9', '2022-04-17'), (2038, 18.5, 'zz10', '2023-05-18'), (2039, 19.5, 'zz11', '2024-06-19'), (2040, 20.5, 'zz12', '2010-07-10'), (2041, 21.5, 'zz0', '2011-08-11'), (2042, 22.5, 'zz1', '2012-09-12'), (2043, 23.5, 'zz2', '2013-01-13'), (2044, 24.5, 'zz3', '2014-02-14'), (2045, 25.5, 'zz4', '2015-03-15'), (2046, 26.5, 'zz5', '2016-04-16'), (2047, 27.5, 'zz6', '2017-05-17'), (2048, 28.5, 'zz7', '2018-06-18'), (2049, 29.5, 'zz8', '2019-07-19'), (2050, 30.5, 'zz9', '2020-08-10'), (2051, 31.5, 'zz10', '2021-09-11'), (2052, 32.5, 'zz11', '2022-01-12'), (2053, 33.5, 'zz12', '2023-02-13'), (2054, 34.5, 'zz0', '2024-03-14'), (2055, 35.5, 'zz1', '2010-04-15'), (2056, 36.5, 'zz2', '2011-05-16'), (2057, 37.5, 'zz3', '2012-06-17'), (2058, 38.5, 'zz4', '2013-07-18'), (2059, 39.5, 'zz5', '2014-08-19'), (2060, 40.5, 'zz6', '2015-09-10'), (2061, 41.5, 'zz7', '2016-01-11'), (2062, 42.5, 'zz8', '2017-02-12'), (2063, 43.5, 'zz9', '2018-03-13'), (2064, 44.5, 'zz10', '2019-04-14'), (2065, 45.5, 'zz11', '2020-05-15'), (2066, 46.5, 'zz12', '2021-06-16'), (2067, 47.5, 'zz0', '2022-07-17'), (2068, 48.5, 'zz1', '2023-08-18'), (2069, 49.5, 'zz2', '2024-09-19'), (2070, 50.5, 'zz3', '2010-01-10'), (2071, 51.5, 'zz4', '2011-02-11'), (2072, 52.5, 'zz5', '2012-03-12'), (2073, 53.5, 'zz6', '2013-04-13'), (2074, 54.5, 'zz7', '2014-05-14'), (2075, 55.5, 'zz8', '2015-06-15'), (2076, 56.5, 'zz9', '2016-07-16'), (2077, 57.5, 'zz10', '2017-08-17'), (2078, 58.5, 'zz11', '2018-09-18'), (2079, 59.5, 'zz12', '2019-01-19'), (2080, 60.5, 'zz0', '2020-02-10'), (2081, 61.5, 'zz1', '2021-03-11'), (2082, 62.5, 'zz2', '2022-04-12'), (2083, 63.5, 'zz3', '2023-05-13'), (2084, 64.5, 'zz4', '2024-06-14'), (2085, 65.5, 'zz5', '2010-07-15'), (2086, 66.5, 'zz6', '2011-08-16'), (2087, 67.5, 'zz7', '2012-09-17'), (2088, 68.5, 'zz8', '2013-01-18'), (2089, 69.5, 'zz9', '2014-02-19'), (2090, 70.5, 'zz10', '2015-03-10'), (2091, 71.5, 'zz11', '2016-04-11'), (2092, 72.5, 'zz12', '2017-05-12'), (2093, 73.5, 'zz0', '2018-06-13'), (2094, 74.5, 'zz1', '2019-07-14'), (2095, 75.5, 'zz2', '2020-08-15'), (2096, 76.5, 'zz3', '2021-09-16'), (2097, 77.5, 'zz4', '2022-01-17'), (2098, 78.5, 'zz5', '2023-02-18'), (2099, 79.5, 'zz6', '2024-03-19'), (2100, 80.5, 'zz7', '2010-04-10'), (2101, 81.5, 'zz8', '2011-05-11'), (2102, 82.5, 'zz9', '2012-06-12'), (2103, 83.5, 'zz10', '2013-07-13'), (2104, 84.5, 'zz11', '2014-08-14'), (2105, 85.5, 'zz12', '2015-09-15'), (2106, 86.5, 'zz0', '2016-01-16'), (2107, 87.5, 'zz1', '2017-02-17'), (2108, 88.5, 'zz2', '2018-03-18'), (2109, 89.5, 'zz3', '2019-04-19'), (2110, 90.5, 'zz4', '2020-05-10'), (2111, 91.5, 'zz5', '2021-06-11'), (2112, 92.5, 'zz6', '2022-07-12'), (2113, 93.5, 'zz7', '2023-08-13'), (2114, 94.5, 'zz8', '2024-09-14'), (2115, 95.5, 'zz9', '2010-01-15'), (2116, 96.5, 'zz10', '2011-02-16'), (2117, 97.5, 'zz11', '2012-03-17'), (2118, 98.5, 'zz12', '2013-04-18'), (2119, 99.5, 'zz0', '2014-05-19'), (2120, 100.5, 'zz1', '2015-06-10'), (2121, 0.5, 'zz2', '2016-07-11'), (2122, 1.5, 'zz3', '2017-08-12'), (2123, 2.5, 'zz4', '2018-09-13'), (2124, 3.5, 'zz5', '2019-01-14'), (2125, 4.5, 'zz6', '2020-02-15'), (2126, 5.5, 'zz7', '2021-03-16'), (2127, 6.5, 'zz8', '2022-04-17'), (2128, 7.5, 'zz9', '2023-05-18'), (2129, 8.5, 'zz10', '2024-06-19'), (2130, 9.5, 'zz11', '2010-07-10'), (2131, 10.5, 'zz12', '2011-08-11'), (2132, 11.5, 'zz0', '2012-09-12'), (2133, 12.5, 'zz1', '2013-01-13'), (2134, 13.5, 'zz2', '2014-02-14'), (2135, 14.5, 'zz3', '2015-03-15'), (2136, 15.5, 'zz4', '2016-04-16'), (2137, 16.5, 'zz5', '2017-05-17'), (2138, 17.5, 'zz6', '2018-06-18'), (2139, 18.5, 'zz7', '2019-07-19'), (2140, 19.5, 'zz8', '2020-08-10'), (2141, 20.5, 'zz9', '2021-09-11'), (2142, 21.5, 'zz10', '2022-01-12'), (2143, 22.5, 'zz11', '2023-02-13'), (2144, 23.5, 'zz12', '2024-03-14'), (2145, 24.5, 'zz0', '2010-04-15'), (2146, 25.5, 'zz1', '2011-05-16'), (2147, 26.5, 'zz2', '2012-06-17'), (2148, 27.5, 'zz3', '2013-07-18'), (2149, 28.5, 'zz4', '2014-08-19'), (2150, 29.5, 'zz5', '2015-09-10'), (2151, 30.5, 'zz6', '2016-01-11'), (2152, 31.5, 'zz7', '2017-02-12'), (2153, 32.5, 'zz8', '2018-03-13'), (2154, 33.5, 'zz9', '2019-04-14'), (2155, 34.5, 'zz10', '2020-05-15'), (2156, 35.5, 'zz11', '2021-06-16'), (2157, 36.5, 'zz12', '2022-07-17'), (2158, 37.5, 'zz0', '2023-08-18'), (2159, 38.5, 'zz1', '2024-09-19'), (2160, 39.5, 'zz2', '2010-01-10'), (2161, 40.5, 'zz3', '2011-02-11'), (2162, 41.5, 'zz4', '2012-03-12'), (2163, 42.5, 'zz5', '2013-04-13'), (2164, 43.5, 'zz6', '2014-05-14'), (2165, 44.5, 'zz7', '2015-06-15'), (2166, 45.5, 'zz8', '2016-07-16'), (2167, 46.5, 'zz9', '2017-08-17'), (2168, 47.5, 'zz10', '2018-09-18'), (2169, 48.5, 'zz11', '2019-01-19'), (2170, 49.5, 'zz12', '2020-02-10'), (2171, 50.5, 'zz0', '2021-03-11'), (2172, 51.5, 'zz1', '2022-04-12'), (2173, 52.5, 'zz2', '2023-05-13'), (2174, 53.5, 'zz3', '2024-06-14'), (2175, 54.5, 'zz4', '2010-07-15'), (2176, 55.5, 'zz5', '2011-08-16'), (2177, 56.5, 'zz6', '2012-09-17'), (2178, 57.5, 'zz7', '2013-01-18'), (2179, 58.5, 'zz8', '2014-02-19'), (2180, 59.5, 'zz9', '2015-03-10'), (2181, 60.5, 'zz10', '2016-04-11'), (2182, 61.5, 'zz11', '2017-05-12'), (2183, 62.5, 'zz12', '2018-06-13'), (2184, 63.5, 'zz0', '2019-07-14'), (2185, 64.5, 'zz1', '2020-08-15'), (2186, 65.5, 'zz2', '2021-09-16'), (2187, 66.5, 'zz3', '2022-01-17'), (2188, 67.5, 'zz4', '2023-02-18'), (2189, 68.5, 'zz5', '2024-03-19'), (2190, 69.5, 'zz6', '2010-04-10'), (2191, 70.5, 'zz7', '2011-05-11'), (2192, 71.5, 'zz8', '2012-06-12'), (2193, 72.5, 'zz9', '2013-07-13'), (2194, 73.5, 'zz10', '2014-08-14'), (2195, 74.5, 'zz11', '2015-09-15'), (2196, 75.5, 'zz12', '2016-01-16'), (2197, 76.5, 'zz0', '2017-02-17'), (2198, 77.5, 'zz1', '2018-03-18'), (2199, 78.5, 'zz2', '2019-04-19'), (2200, 79.5, 'zz3', '2020-05-10'), (2201, 80.5, 'zz4', '2021-06-11'), (2202, 81.5, 'zz5', '2022-07-12'), (2203, 82.5, 'zz6', '2023-08-13'), (2204, 83.5, 'zz7', '2024-09-14'), (2205, 84.5, 'zz8', '2010-01-15'), (2206, 85.5, 'zz9', '2011-02-16'), (2207, 86.5, 'zz10', '2012-03-17'), (2208, 87.5, 'zz11', '2013-04-18'), (2209, 88.5, 'zz12', '2014-05-19'), (2210, 89.5, 'zz0', '2015-06-10'), (2211, 90.5, 'zz1', '2016-07-11'), (2212, 91.5, 'zz2', '2017-08-12'), (2213, 92.5, 'zz3', '2018-09-13'), (2214, 93.5, 'zz4', '2019-01-14'), (2215, 94.5, 'zz5', '2020-02-15'), (2216, 95.5, 'zz6', '2021-03-16'), (2217, 96.5, 'zz7', '2022-04-17'), (2218, 97.5, 'zz8', '2023-05-18'), (2219, 98.5, 'zz9', '2024-06-19'), (2220, 99.5, 'zz10', '2010-07-10'), (2221, 100.5, 'zz11', '2011-08-11'), (2222, 0.5, 'zz12', '2012-09-12'), (2223, 1.5, 'zz0', '2013-01-13'), (2224, 2.5, 'zz1', '2014-02-14'), (2225, 3.5, 'zz2', '2015-03-15'), (2226, 4.5, 'zz3', '2016-04-16'), (2227, 5.5, 'zz4', '2017-05-17'), (2228, 6.5, 'zz5', '2018-06-18'), (2229, 7.5, 'zz6', '2019-07-19'), (2230, 8.5, 'zz7', '2020-08-10'), (2231, 9.5, 'zz8', '2021-09-11'), (2232, 10.5, 'zz9', '2022-01-12'), (2233, 11.5, 'zz10', '2023-02-13'), (2234, 12.5, 'zz11', '2024-03-14'), (2235, 13.5, 'zz12', '2010-04-15'), (2236, 14.5, 'zz0', '2011-05-16'), (2237, 15.5, 'zz1', '2012-06-17'), (2238, 16.5, 'zz2', '2013-07-18'), (2239, 17.5, 'zz3', '2014-08-19'), (2240, 18.5, 'zz4', '2015-09-10'), (2241, 19.5, 'zz5', '2016-01-11'), (2242, 20.5, 'zz6', '2017-02-12'), (2243, 21.5, 'zz7', '2018-03-13'), (2244, 22.5, 'zz8', '2019-04-14'), (2245, 23.5, 'zz9', '2020-05-15'), (2246, 24.5, 'zz10', '2021-06-16'), (2247, 25.5, 'zz11', '2022-07-17'), (2248, 26.5, 'zz12', '2023-08-18'), (2249, 27.5, 'zz0', '2024-09-19'), (2250, 28.5, 'zz1', '2010-01-10'), (2251, 29.5, 'zz2', '2011-02-11'), (2252, 30.5, 'zz3', '2012-03-12'), (2253, 31.5, 'zz4', '2013-04-13'), (2254, 32.5, 'zz5', '2014-05-14'), (2255, 33.5, 'zz6', '2015-06-15'), (2256, 34.5, 'zz7', '2016-07-16'), (2257, 35.5, 'zz8', '2017-08-17'), (2258, 36.5, 'zz9', '2018-09-18'), (2259, 37.5, 'zz10', '2019-01-19'), (2260, 38.5, 'zz11', '2020-02-10'), (2261, 39.5, 'zz12', '2021-03-11'), (2262, 40.5, 'zz0', '2022-04-12'), (2263, 41.5, 'zz1', '2023-05-13'), (2264, 42.5, 'zz2', '2024-06-14'), (2265, 43.5, 'zz3', '2010-07-15'), (2266, 44.5, 'zz4', '2011-08-16'), (2267, 45.5, 'zz5', '2012-09-17'), (2268, 46.5, 'zz6', '2013-01-18'), (2269, 47.5, 'zz7', '2014-02-19'), (2270, 48.5, 'zz8', '2015-03-10'), (2271, 49.5, 'zz9', '2016-04-11'), (2272, 50.5, 'zz10', '2017-05-12'), (2273, 51.5, 'zz11', '2018-06-13'), (2274, 52.5, 'zz12', '2019-07-14'), (2275, 53.5, 'zz0', '2020-08-15'), (2276, 54.5, 'zz1', '2021-09-16'), (2277, 55.5, 'zz2', '2022-01-17'), (2278, 56.5, 'zz3', '2023-02-18'), (2279, 57.5, 'zz4', '2024-03-19'), (2280, 58.5, 'zz5', '2010-04-10'), (2281, 59.5, 'zz6', '2011-05-11'), (2282, 60.5, 'zz7', '2012-06-12'), (2283, 61.5, 'zz8', '2013-07-13'), (2284, 62.5, 'zz9', '2014-08-14'), (2285, 63.5, 'zz10', '2015-09-15'), (2286, 64.5, 'zz11', '2016-01-16'), (2287, 65.5, 'zz12', '2017-02-17'), (2288, 66.5, 'zz0', '2018-03-18'), (2289, 67.5, 'zz1', '2019-04-19'), (2290, 68.5, 'zz2', '2020-05-10'), (2291, 69.5, 'zz3', '2021-06-11'), (2292, 70.5, 'zz4', '2022-07-12'), (2293, 71.5, 'zz5', '2023-08-13'), (2294, 72.5, 'zz6', '2024-09-14'), (2295, 73.5, 'zz7', '2010-01-15'), (2296, 74.5, 'zz8', '2011-02-16'), (2297, 75.5, 'zz9', '2012-03-17'), (2298, 76.5, 'zz10', '2013-04-18'), (2299, 77.5, 'zz11', '2014-05-19'), (2300, 78.5, 'zz12', '2015-06-10'), (2301, 79.5, 'zz0', '2016-07-11'), (2302, 80.5, 'zz1', '2017-08-12'), (2303, 81.5, 'zz2', '2018-09-13'), (2304, 82.5, 'zz3', '2019-01-14'), (2305, 83.5, 'zz4', '2020-02-15'), (2306, 84.5, 'zz5', '2021-03-16'), (2307, 85.5, 'zz6', '2022-04-17'), (2308, 86.5, 'zz7', '2023-05-18'), (2309, 87.5, 'zz8', '2024-06-19'), (2310, 88.5, 'zz9', '2010-07-10'), (2311, 89.5, 'zz10', '2011-08-11'), (2312, 90.5, 'zz11', '2012-09-12'), (2313, 91.5, 'zz12', '2013-01-13'), (2314, 92.5, 'zz0', '2014-02-14'), (2315, 93.5, 'zz1', '2015-03-15'), (2316, 94.5, 'zz2', '2016-04-16'), (2317, 95.5, 'zz3', '2017-05-17'), (2318, 96.5, 'zz4', '2018-06-18'), (2319, 97.5, 'zz5', '2019-07-19'), (2320, 98.5, 'zz6', '2020-08-10'), (2321, 99.5, 'zz7', '2021-09-11'), (2322, 100.5, 'zz8', '2022-01-12'), (2323, 0.5, 'zz9', '2023-02-13'), (2324, 1.5, 'zz10', '2024-03-14'), (2325, 2.5, 'zz11', '2010-04-15'), (2326, 3.5, 'zz12', '2011-05-16'), (2327, 4.5, 'zz0', '2012-06-17'), (2328, 5.5, 'zz1', '2013-07-18'), (2329, 6.5, 'zz2', '2014-08-19'), (2330, 7.5, 'zz3', '2015-09-10'), (2331, 8.5, 'zz4', '2016-01-11'), (2332, 9.5, 'zz5', '2017-02-12'), (2333, 10.5, 'zz6', '2018-03-13'), (2334, 11.5, 'zz7', '2019-04-14'), (2335, 12.5, 'zz8', '2020-05-15'), (2336, 13.5, 'zz9', '2021-06-16'), (2337, 14.5, 'zz10', '2022-07-17'), (2338, 15.5, 'zz11', '2023-08-18'), (2339, 16.5, 'zz12', '2024-09-19'), (2340, 17.5, 'zz0', '2010-01-10'), (2341, 18.5, 'zz1', '2011-02-11'), (2342, 19.5, 'zz2', '2012-03-12'), (2343, 20.5, 'zz3', '2013-04-13'), (2344, 21.5, 'zz4', '2014-05-14'), (2345, 22.5, 'zz5', '2015-06-15'), (2346, 23.5, 'zz6', '2016-07-16'), (2347, 24.5, 'zz7', '2017-08-17'), (2348, 25.5, 'zz8', '2018-09-18'), (2349, 26.5, 'zz9', '2019-01-19'), (2350, 27.5, 'zz10', '2020-02-10'), (2351, 28.5, 'zz11', '2021-03-11'), (2352, 29.5, 'zz12', '2022-04-12'), (2353, 30.5, 'zz0', '2023-05-13'), (2354, 31.5, 'zz1', '2024-06-14'), (2355, 32.5, 'zz2', '2010-07-15'), (2356, 33.5, 'zz3', '2011-08-16'), (2357, 34.5, 'zz4', '2012-09-17'), (2358, 35.5, 'zz5', '2013-01-18'), (2359, 36.5, 'zz6', '2014-02-19'), (2360, 37.5, 'zz7', '2015-03-10'), (2361, 38.5, 'zz8', '2016-04-11'), (2362, 39.5, 'zz9', '2017-05-12'), (2363, 40.5, 'zz10', '2018-06-13'), (2364, 41.5, 'zz11', '2019-07-14'), (2365, 42.5, 'zz12', '2020-08-15'), (2366, 43.5, 'zz0', '2021-09-16'), (2367, 44.5, 'zz1', '2022-01-17'), (2368, 45.5, 'zz2', '2023-02-18'), (2369, 46.5, 'zz3', '2024-03-19'), (2370, 47.5, 'zz4', '2010-04-10'), (2371, 48.5, 'zz5', '2011-05-11'), (2372, 49.5, 'zz6', '2012-06-12'), (2373, 50.5, 'zz7', '2013-07-13'), (2374, 51.5, 'zz8', '2014-08-14'), (2375, 52.5, 'zz9', '2015-09-15'), (2376, 53.5, 'zz10', '2016-01-16'), (2377, 54.5, 'zz11', '2017-02-17'), (2378, 55.5, 'zz12', '2018-03-18'), (2379, 56.5, 'zz0', '2019-04-19'), (2380, 57.5, 'zz1', '2020-05-10'), (2381, 58.5, 'zz2', '2021-06-11'), (2382, 59.5, 'zz3', '2022-07-12'), (2383, 60.5, 'zz4', '2023-08-13'), (2384, 61.5, 'zz5', '2024-09-14'), (2385, 62.5, 'zz6', '2010-01-15'), (2386, 63.5, 'zz7', '2011-02-16'), (2387, 64.5, 'zz8', '2012-03-17'), (2388, 65.5, 'zz9', '2013-04-18'), (2389, 66.5, 'zz10', '2014-05-19'), (2390, 67.5, 'zz11', '2015-06-10'), (2391, 68.5, 'zz12', '2016-07-11'), (2392, 69.5, 'zz0', '2017-08-12'), (2393, 70.5, 'zz1', '2018-09-13'), (2394, 71.5, 'zz2', '2019-01-14'), (2395, 72.5, 'zz3', '2020-02-15'), (2396, 73.5, 'zz4', '2021-03-16'), (2397, 74.5, 'zz5', '2022-04-17'), (2398, 75.5, 'zz6', '2023-05-18'), (2399, 76.5, 'zz7', '2024-06-19'), (2400, 77.5, 'zz8', '2010-07-10'), (2401, 78.5, 'zz9', '2011-08-11'), (2402, 79.5, 'zz10', '2012-09-12'), (2403, 80.5, 'zz11', '2013-01-13'), (2404, 81.5, 'zz12', '2014-02-14'), (2405, 82.5, 'zz0', '2015-03-15'), (2406, 83.5, 'zz1', '2016-04-16'), (2407, 84.5, 'zz2', '2017-05-17'), (2408, 85.5, 'zz3', '2018-06-18'), (2409, 86.5, 'zz4', '2019-07-19'), (2410, 87.5, 'zz5', '2020-08-10'), (2411, 88.5, 'zz6', '2021-09-11'), (2412, 89.5, 'zz7', '2022-01-12'), (2413, 90.5, 'zz8', '2023-02-13'), (2414, 91.5, 'zz9', '2024-03-14'), (2415, 92.5, 'zz10', '2010-04-15'), (2416, 93.5, 'zz11', '2011-05-16'), (2417, 94.5, 'zz12', '2012-06-17'), (2418, 95.5, 'zz0', '2013-07-18'), (2419, 96.5, 'zz1', '2014-08-19'), (2420, 97.5, 'zz2', '2015-09-10'), (2421, 98.5, 'zz3', '2016-01-11'), (2422, 99.5, 'zz4', '2017-02-12'), (2423, 100.5, 'zz5', '2018-03-13'), (2424, 0.5, 'zz6', '2019-04-14'), (2425, 1.5, 'zz7', '2020-05-15'), (2426, 2.5, 'zz8', '2021-06-16'), (2427, 3.5, 'zz9', '2022-07-17'), (2428, 4.5, 'zz10', '2023-08-18'), (2429, 5.5, 'zz11', '2024-09-19'), (2430, 6.5, 'zz12', '2010-01-10'), (2431, 7.5, 'zz0', '2011-02-11'), (2432, 8.5, 'zz1', '2012-03-12'), (2433, 9.5, 'zz2', '2013-04-13'), (2434, 10.5, 'zz3', '2014-05-14'), (2435, 11.5, 'zz4', '2015-06-15'), (2436, 12.5, 'zz5', '2016-07-16'), (2437, 13.5, 'zz6', '2017-08-17'), (2438, 14.5, 'zz7', '2018-09-18'), (2439, 15.5, 'zz8', '2019-01-19'), (2440, 16.5, 'zz9', '2020-02-10'), (2441, 17.5, 'zz10', '2021-03-11'), (2442, 18.5, 'zz11', '2022-04-12'), (2443, 19.5, 'zz12', '2023-05-13'), (2444, 20.5, 'zz0', '2024-06-14'), (2445, 21.5, 'zz1', '2010-07-15'), (2446, 22.5, 'zz2', '2011-08-16'), (2447, 23.5, 'zz3', '2012-09-17'), (2448, 24.5, 'zz4', '2013-01-18'), (2449, 25.5, 'zz5', '2014-02-19'), (2450, 26.5, 'zz6', '2015-03-10'), (2451, 27.5, 'zz7', '2016-04-11'), (2452, 28.5, 'zz8', '2017-05-12'), (2453, 29.5, 'zz9', '2018-06-13'), (2454, 30.5, 'zz10', '2019-07-14'), (2455, 31.5, 'zz11', '2020-08-15'), (2456, 32.5, 'zz12', '2021-09-16'), (2457, 33.5, 'zz0', '2022-01-17'), (2458, 34.5, 'zz1', '2023-02-18'), (2459, 35.5, 'zz2', '2024-03-19'), (2460, 36.5, 'zz3', '2010-04-10'), (2461, 37.5, 'zz4', '2011-05-11'), (2462, 38.5, 'zz5', '2012-06-12'), (2463, 39.5, 'zz6', '2013-07-13'), (2464, 40.5, 'zz7', '2014-08-14'), (2465, 41.5, 'zz8', '2015-09-15'), (2466, 42.5, 'zz9', '2016-01-16'), (2467, 43.5, 'zz10', '2017-02-17'), (2468, 44.5, 'zz11', '2018-03-18'), (2469, 45.5, 'zz12', '2019-04-19'), (2470, 46.5, 'zz0', '2020-05-10'), (2471, 47.5, 'zz1', '2021-06-11'), (2472, 48.5, 'zz2', '2022-07-12'), (2473, 49.5, 'zz3', '2023-08-13'), (2474, 50.5, 'zz4', '2024-09-14'), (2475, 51.5, 'zz5', '2010-01-15'), (2476, 52.5, 'zz6', '2011-02-16'), (2477, 53.5, 'zz7', '2012-03-17'), (2478, 54.5, 'zz8', '2013-04-18'), (2479, 55.5, 'zz9', '2014-05-19'), (2480, 56.5, 'zz10', '2015-06-10'), (2481, 57.5, 'zz11', '2016-07-11'), (2482, 58.5, 'zz12', '2017-08-12'), (2483, 59.5, 'zz0', '2018-09-13'), (2484, 60.5, 'zz1', '2019-01-14'), (2485, 61.5, 'zz2', '2020-02-15'), (2486, 62.5, 'zz3', '2021-03-16'), (2487, 63.5, 'zz4', '2022-04-17'), (2488, 64.5, 'zz5', '2023-05-18'), (2489, 65.5, 'zz6', '2024-06-19'), (2490, 66.5, 'zz7', '2010-07-10'), (2491, 67.5, 'zz8', '2011-08-11'), (2492, 68.5, 'zz9', '2012-09-12'), (2493, 69.5, 'zz10', '2013-01-13'), (2494, 70.5, 'zz11', '2014-02-14'), (2495, 71.5, 'zz12', '2015-03-15'), (2496, 72.5, 'zz0', '2016-04-16'), (2497, 73.5, 'zz1', '2017-05-17'), (2498, 74.5, 'zz2', '2018-06-18'), (2499, 75.5, 'zz3', '2019-07-19');
+CREATE TABLE S(A INT, E VARCHAR, F INT) WITH (compression='lzma');
+INSERT INTO S VALUES (0, 'ss0', 0), (3, 'ss1', 1), (6, 'ss2', 2), (9, 'ss3', 3), (12, 'ss4', 4), (15, 'ss5', 5), (18, 'ss6', 6), (21, 'ss7', 0), (24, 'ss8', 1), (27, 'ss9', 2), (30, 'ss10', 3), (33, 'ss11', 4), (36, 'ss12', 5), (39, 'ss13', 6), (42, 'ss14', 0), (45, 'ss15', 1), (48, 'ss16', 2), (51, 'ss17', 3), (54, 'ss18', 4), (57, 'ss19', 5), (60, 'ss20', 6), (63, 'ss21', 0), (66, 'ss22', 1), (69, 'ss23', 2), (72, 'ss24', 3), (75, 'ss25', 4), (78, 'ss26', 5), (81, 'ss27', 6), (84, 'ss28', 0), (87, 'ss0', 1), (90, 'ss1', 2), (93, 'ss2', 3), (96, 'ss3', 4), (99, 'ss4', 5), (102, 'ss5', 6), (105, 'ss6', 0), (108, 'ss7', 1), (111, 'ss8', 2), (114, 'ss9', 3), (117, 'ss10', 4), (120, 'ss11', 5), (123, 'ss12', 6), (126, 'ss13', 0), (129, 'ss14', 1), (132, 'ss15', 2), (135, 'ss16', 3), (138, 'ss17', 4), (141, 'ss18', 5), (144, 'ss19', 6), (147, 'ss20', 0), (150, 'ss21', 1), (153, 'ss22', 2), (156, 'ss23', 3), (159, 'ss24', 4), (162, 'ss25', 5), (165, 'ss26', 6), (168, 'ss27', 0), (171, 'ss28', 1), (174, 'ss0', 2), (177, 'ss1', 3), (180, 'ss2', 4), (183, 'ss3', 5), (186, 'ss4', 6), (189, 'ss5', 0), (192, 'ss6', 1), (195, 'ss7', 2), (198, 'ss8', 3), (201, 'ss9', 4), (204, 'ss10', 5), (207, 'ss11', 6), (210, 'ss12', 0), (213, 'ss13', 1), (216, 'ss14', 2), (219, 'ss15', 3), (222, 'ss16', 4), (225, 'ss17', 5), (228, 'ss18', 6), (231, 'ss19', 0), (234, 'ss20', 1), (237, 'ss21', 2), (240, 'ss22', 3), (243, 'ss23', 4), (246, 'ss24', 5), (249, 'ss25', 6), (252, 'ss26', 0), (255, 'ss27', 1), (258, 'ss28', 2), (261, 'ss0', 3), (264, 'ss1', 4), (267, 'ss2', 5), (270, 'ss3', 6), (273, 'ss4', 0), (276, 'ss5', 1), (279, 'ss6', 2), (282, 'ss7', 3), (285, 'ss8', 4), (288, 'ss9', 5), (291, 'ss10', 6), (294, 'ss11', 0), (297, 'ss12', 1), (300, 'ss13', 2), (303, 'ss14', 3), (306, 'ss15', 4), (309, 'ss16', 5), (312, 'ss17', 6), (315, 'ss18', 0), (318, 'ss19', 1), (321, 'ss20', 2), (324, 'ss21', 3), (327, 'ss22', 4), (330, 'ss23', 5), (333, 'ss24', 6), (336, 'ss25', 0), (339, 'ss26', 1), (342, 'ss27', 2), (345, 'ss28', 3), (348, 'ss0', 4), (351, 'ss1', 5), (354, 'ss2', 6), (357, 'ss3', 0), (360, 'ss4', 1), (363, 'ss5', 2), (366, 'ss6', 3), (369, 'ss7', 4), (372, 'ss8', 5), (375, 'ss9', 6), (378, 'ss10', 0), (381, 'ss11', 1), (384, 'ss12', 2), (387, 'ss13', 3), (390, 'ss14', 4), (393, 'ss15', 5), (396, 'ss16', 6), (399, 'ss17', 0), (402, 'ss18', 1), (405, 'ss19', 2), (408, 'ss20', 3), (411, 'ss21', 4), (414, 'ss22', 5), (417, 'ss23', 6), (420, 'ss24', 0), (423, 'ss25', 1), (426, 'ss26', 2), (429, 'ss27', 3), (432, 'ss28', 4), (435, 'ss0', 5), (438, 'ss1', 6), (441, 'ss2', 0), (444, 'ss3', 1), (447, 'ss4', 2), (450, 'ss5', 3), (453, 'ss6', 4), (456, 'ss7', 5), (459, 'ss8', 6), (462, 'ss9', 0), (465, 'ss10', 1), (468, 'ss11', 2), (471, 'ss12', 3), (474, 'ss13', 4), (477, 'ss14', 5), (480, 'ss15', 6), (483, 'ss16', 0), (486, 'ss17', 1), (489, 'ss18', 2), (492, 'ss19', 3), (495, 'ss20', 4), (498, 'ss21', 5), (501, 'ss22', 6), (504, 'ss23', 0), (507, 'ss24', 1), (510, 'ss25', 2), (513, 'ss26', 3), (516, 'ss27', 4), (519, 'ss28', 5), (522, 'ss0', 6), (525, 'ss1', 0), (528, 'ss2', 1), (531, 'ss3', 2), (534, 'ss4', 3), (537, 'ss5', 4), (540, 'ss6', 5), (543, 'ss7', 6), (546, 'ss8', 0), (549, 'ss9', 1), (552, 'ss10', 2), (555, 'ss11', 3), (558, 'ss12', 4), (561, 'ss13', 5), (564, 'ss14', 6), (567, 'ss15', 0), (570, 'ss16', 1), (573, 'ss17', 2), (576, 'ss18', 3), (579, 'ss19', 4), (582, 'ss20', 5), (585, 'ss21', 6), (588, 'ss22', 0), (591, 'ss23', 1), (594, 'ss24', 2), (597, 'ss25', 3), (600, 'ss26', 4), (603, 'ss27', 5), (606, 'ss28', 6), (609, 'ss0', 0), (612, 'ss1', 1), (615, 'ss2', 2), (618, 'ss3', 3), (621, 'ss4', 4), (624, 'ss5', 5), (627, 'ss6', 6), (630, 'ss7', 0), (633, 'ss8', 1), (636, 'ss9', 2), (639, 'ss10', 3), (642, 'ss11', 4), (645, 'ss12', 5), (648, 'ss13', 6), (651, 'ss14', 0), (654, 'ss15', 1), (657, 'ss16', 2), (660, 'ss17', 3), (663, 'ss18', 4), (666, 'ss19', 5), (669, 'ss20', 6), (672, 'ss21', 0), (675, 'ss22', 1), (678, 'ss23', 2), (681, 'ss24', 3), (684, 'ss25', 4), (687, 'ss26', 5), (690, 'ss27', 6), (693, 'ss28', 0), (696, 'ss0', 1), (699, 'ss1', 2), (702, 'ss2', 3), (705, 'ss3', 4), (708, 'ss4', 5), (711, 'ss5', 6), (714, 'ss6', 0), (717, 'ss7', 1), (720, 'ss8', 2), (723, 'ss9', 3), (726, 'ss10', 4), (729, 'ss11', 5), (732, 'ss12', 6), (735, 'ss13', 0), (738, 'ss14', 1), (741, 'ss15', 2), (744, 'ss16', 3), (747, 'ss17', 4), (750, 'ss18', 5), (753, 'ss19', 6), (756, 'ss20', 0), (759, 'ss21', 1), (762, 'ss22', 2), (765, 'ss23', 3), (768, 'ss24', 4), (771, 'ss25', 5), (774, 'ss26', 6), (777, 'ss27', 0), (780, 'ss28', 1), (783, 'ss0', 2), (786, 'ss1', 3), (789, 'ss2', 4), (792, 'ss3', 5), (795, 'ss4', 6), (798, 'ss5', 0), (801, 'ss6', 1), (804, 'ss7', 2), (807, 'ss8', 3), (810, 'ss9', 4), (813, 'ss10', 5), (816, 'ss11', 6), (819, 'ss12', 0), (822, 'ss13', 1), (825, 'ss14', 2), (828, 'ss15', 3), (831, 'ss16', 4), (834, 'ss17', 5), (837, 'ss18', 6), (840, 'ss19', 0), (843, 'ss20', 1), (846, 'ss21', 2), (849, 'ss22', 3), (852, 'ss23', 4), (855, 'ss24', 5), (858, 'ss25', 6), (861, 'ss26', 0), (864, 'ss27', 1), (867, 'ss28', 2), (870, 'ss0', 3), (873, 'ss1', 4), (876, 'ss2', 5), (879, 'ss3', 6), (882, 'ss4', 0), (885, 'ss5', 1), (888, 'ss6', 2), (891, 'ss7', 3), (894, 'ss8', 4), (897, 'ss9', 5), (900, 'ss10', 6), (903, 'ss11', 0), (906, 'ss12', 1), (909, 'ss13', 2), (912, 'ss14', 3), (915, 'ss15', 4), (918, 'ss16', 5), (921, 'ss17', 6), (924, 'ss18', 0), (927, 'ss19', 1), (930, 'ss20', 2), (933, 'ss21', 3), (936, 'ss22', 4), (939, 'ss23', 5), (942, 'ss24', 6), (945, 'ss25', 0), (948, 'ss26', 1), (951, 'ss27', 2), (954, 'ss28', 3), (957, 'ss0', 4), (960, 'ss1', 5), (963, 'ss2', 6), (966, 'ss3', 0), (969, 'ss4', 1), (972, 'ss5', 2), (975, 'ss6', 3), (978, 'ss7', 4), (981, 'ss8', 5), (984, 'ss9', 6), (987, 'ss10', 0), (990, 'ss11', 1), (993, 'ss12', 2), (996, 'ss13', 3), (999, 'ss14', 4), (1002, 'ss15', 5), (1005, 'ss16', 6), (1008, 'ss17', 0), (1011, 'ss18', 1), (1014, 'ss19', 2), (1017, 'ss20', 3), (1020, 'ss21', 4), (1023, 'ss22', 5), (1026, 'ss23', 6), (1029, 'ss24', 0), (1032, 'ss25', 1), (1035, 'ss26', 2), (1038, 'ss27', 3), (1041, 'ss28', 4), (1044, 'ss0', 5), (1047, 'ss1', 6), (1050, 'ss2', 0), (1053, 'ss3', 1), (1056, 'ss4', 2), (1059, 'ss5', 3), (1062, 'ss6', 4), (1065, 'ss7', 5), (1068, 'ss8', 6), (1071, 'ss9', 0), (1074, 'ss10', 1), (1077, 'ss11', 2), (1080, 'ss12', 3), (1083, 'ss13', 4), (1086, 'ss14', 5), (1089, 'ss15', 6), (1092, 'ss16', 0), (1095, 'ss17', 1), (1098, 'ss18', 2), (1101, 'ss19', 3), (1104, 'ss20', 4), (1107, 'ss21', 5), (1110, 'ss22', 6), (1113, 'ss23', 0), (1116, 'ss24', 1), (1119, 'ss25', 2), (1122, 'ss26', 3), (1125, 'ss27', 4), (1128, 'ss28', 5), (1131, 'ss0', 6), (1134, 'ss1', 0), (1137, 'ss2', 1), (1140, 'ss3', 2), (1143, 'ss4', 3), (1146, 'ss5', 4), (1149, 'ss6', 5), (1152, 'ss7', 6), (1155, 'ss8', 0), (1158, 'ss9', 1), (1161, 'ss10', 2), (1164, 'ss11', 3), (1167, 'ss12', 4), (1170, 'ss13', 5), (1173, 'ss14', 6), (1176, 'ss15', 0), (1179, 'ss16', 1), (1182, 'ss17', 2), (1185, 'ss18', 3), (1188, 'ss19', 4), (1191, 'ss20', 5), (1194, 'ss21', 6), (1197, 'ss22', 0), (1200, 'ss23', 1), (1203, 'ss24', 2), (1206, 'ss25', 3), (1209, 'ss26', 4), (1212, 'ss27', 5), (1215, 'ss28', 6), (1218, 'ss0', 0), (1221, 'ss1', 1), (1224, 'ss2', 2), (1227, 'ss3', 3), (1230, 'ss4', 4), (1233, 'ss5', 5), (1236, 'ss6', 6), (1239, 'ss7', 0), (1242, 'ss8', 1), (1245, 'ss9', 2), (1248, 'ss10', 3), (1251, 'ss11', 4), (1254, 'ss12', 5), (1257, 'ss13', 6), (1260, 'ss14', 0), (1263, 'ss15', 1), (1266, 'ss16', 2), (1269, 'ss17', 3), (1272, 'ss18', 4), (1275, 'ss19', 5), (1278, 'ss20', 6), (1281, 'ss21', 0), (1284, 'ss22', 1), (1287, 'ss23', 2), (1290, 'ss24', 3), (1293, 'ss25', 4), (1296, 'ss26', 5), (1299, 'ss27', 6), (1302, 'ss28', 0), (1305, 'ss0', 1), (1308, 'ss1', 2), (1311, 'ss2', 3), (1314, 'ss3', 4), (1317, 'ss4', 5), (1320, 'ss5', 6), (1323, 'ss6', 0), (1326, 'ss7', 1), (1329, 'ss8', 2), (1332, 'ss9', 3), (1335, 'ss10', 4), (1338, 'ss11', 5), (1341, 'ss12', 6), (1344, 'ss13', 0), (1347, 'ss14', 1), (1350, 'ss15', 2), (1353, 'ss16', 3), (1356, 'ss17', 4), (1359, 'ss18', 5), (1362, 'ss19', 6), (1365, 'ss20', 0), (1368, 'ss21', 1), (1371, 'ss22', 2), (1374, 'ss23', 3), (1377, 'ss24', 4), (1380, 'ss25', 5), (1383, 'ss26', 6), (1386, 'ss27', 0), (1389, 'ss28', 1), (1392, 'ss0', 2), (1395, 'ss1', 3), (1398, 'ss2', 4), (1401, 'ss3', 5), (1404, 'ss4', 6), (1407, 'ss5', 0), (1410, 'ss6', 1), (1413, 'ss7', 2), (1416, 'ss8', 3), (1419, 'ss9', 4), (1422, 'ss10', 5), (1425, 'ss11', 6), (1428, 'ss12', 0), (1431, 'ss13', 1), (1434, 'ss14', 2), (1437, 'ss15', 3), (1440, 'ss16', 4), (1443, 'ss17', 5), (1446, 'ss18', 6), (1449, 'ss19', 0), (1452, 'ss20', 1), (1455, 'ss21', 2), (1458, 'ss22', 3), (1461, 'ss23', 4), (1464, 'ss24', 5), (1467, 'ss25', 6), (1470, 'ss26', 0), (1473, 'ss27', 1), (1476, 'ss28', 2), (1479, 'ss0', 3), (1482, 'ss1', 4), (1485, 'ss2', 5), (1488, 'ss3', 6), (1491, 'ss4', 0), (1494, 'ss5', 1), (1497, 'ss6', 2), (1500, 'ss7', 3), (1503, 'ss8', 4), (1506, 'ss9', 5), (1509, 'ss10', 6), (1512, 'ss11', 0), (1515, 'ss12', 1), (1518, 'ss13', 2), (1521, 'ss14', 3), (1524, 'ss15', 4), (1527, 'ss16', 5), (1530, 'ss17', 6), (1533, 'ss18', 0), (1536, 'ss19', 1), (1539, 'ss20', 2), (1542, 'ss21', 3), (1545, 'ss22', 4), (1548, 'ss23', 5), (1551, 'ss24', 6), (1554, 'ss25', 0), (1557, 'ss26', 1), (1560, 'ss27', 2), (1563, 'ss28', 3), (1566, 'ss0', 4), (1569, 'ss1', 5), (1572, 'ss2', 6), (1575, 'ss3', 0), (1578, 'ss4', 1), (1581, 'ss5', 2), (1584, 'ss6', 3), (1587, 'ss7', 4), (1590, 'ss8', 5), (1593, 'ss9', 6), (1596, 'ss10', 0), (1599, 'ss11', 1), (1602, 'ss12', 2), (1605, 'ss13', 3), (1608, 'ss14', 4), (1611, 'ss15', 5), (1614, 'ss16', 6), (1617, 'ss17', 0), (1620, 'ss18', 1), (1623, 'ss19', 2), (1626, 'ss20', 3), (1629, 'ss21', 4), (1632, 'ss22', 5), (1635, 'ss23', 6), (1638, 'ss24', 0), (1641, 'ss25', 1), (1644, 'ss26', 2), (1647, 'ss27', 3), (1650, 'ss28', 4), (1653, 'ss0', 5), (1656, 'ss1', 6), (1659, 'ss2', 0), (1662, 'ss3', 1), (1665, 'ss4', 2), (1668, 'ss5', 3), (1671, 'ss6', 4), (1674, 'ss7', 5), (1677, 'ss8', 6), (1680, 'ss9', 0), (1683, 'ss10', 1), (1686, 'ss11', 2), (1689, 'ss12', 3), (1692, 'ss13', 4), (1695, 'ss14', 5), (1698, 'ss15', 6), (1701, 'ss16', 0), (1704, 'ss17', 1), (1707, 'ss18', 2), (1710, 'ss19', 3), (1713, 'ss20', 4), (1716, 'ss21', 5), (1719, 'ss22', 6), (1722, 'ss23', 0), (1725, 'ss24', 1), (1728, 'ss25', 2), (1731, 'ss26', 3), (1734, 'ss27', 4), (1737, 'ss28', 5), (1740, 'ss0', 6), (1743, 'ss1', 0), (1746, 'ss2', 1), (1749, 'ss3', 2), (1752, 'ss4', 3), (1755, 'ss5', 4), (1758, 'ss6', 5), (1761, 'ss7', 6), (1764, 'ss8', 0), (1767, 'ss9', 1), (1770, 'ss10', 2), (1773, 'ss11', 3), (1776, 'ss12', 4), (1779, 'ss13', 5), (1782, 'ss14', 6), (1785, 'ss15', 0), (1788, 'ss16', 1), (1791, 'ss17', 2), (1794, 'ss18', 3), (1797, 'ss19', 4), (1800, 'ss20', 5), (1803, 'ss21', 6), (1806, 'ss22', 0), (1809, 'ss23', 1), (1812, 'ss24', 2), (1815, 'ss25', 3), (1818, 'ss26', 4), (1821, 'ss27', 5), (1824, 'ss28', 6), (1827, 'ss0', 0), (1830, 'ss1', 1), (1833, 'ss2', 2), (1836, 'ss3', 3), (1839, 'ss4', 4), (1842, 'ss5', 5), (1845, 'ss6', 6), (1848, 'ss7', 0), (1851, 'ss8', 1), (1854, 'ss9', 2), (1857, 'ss10', 3), (1860, 'ss11', 4), (1863, 'ss12', 5), (1866, 'ss13', 6), (1869, 'ss14', 0), (1872, 'ss15', 1), (1875, 'ss16', 2), (1878, 'ss17', 3), (1881, 'ss18', 4), (1884, 'ss19', 5), (1887, 'ss20', 6), (1890, 'ss21', 0), (1893, 'ss22', 1), (1896, 'ss23', 2), (1899, 'ss24', 3), (1902, 'ss25', 4), (1905, 'ss26', 5), (1908, 'ss27', 6), (1911, 'ss28', 0), (1914, 'ss0', 1), (1917, 'ss1', 2), (1920, 'ss2', 3), (1923, 'ss3', 4), (1926, 'ss4', 5), (1929, 'ss5', 6), (1932, 'ss6', 0), (1935, 'ss7', 1), (1938, 'ss8', 2), (1941, 'ss9', 3), (1944, 'ss10', 4), (1947, 'ss11', 5), (1950, 'ss12', 6), (1953, 'ss13', 0), (1956, 'ss14', 1), (1959, 'ss15', 2), (1962, 'ss16', 3), (1965, 'ss17', 4), (1968, 'ss18', 5), (1971, 'ss19', 6), (1974, 'ss20', 0), (1977, 'ss21', 1), (1980, 'ss22', 2), (1983, 'ss23', 3), (1986, 'ss24', 4), (1989, 'ss25', 5), (1992, 'ss26', 6), (1995, 'ss27', 0), (1998, 'ss28', 1), (2001, 'ss0', 2), (2004, 'ss1', 3), (2007, 'ss2', 4), (2010, 'ss3', 5), (2013, 'ss4', 6), (2016, 'ss5', 0), (2019, 'ss6', 1), (2022, 'ss7', 2), (2025, 'ss8', 3), (2028, 'ss9', 4), (2031, 'ss10', 5), (2034, 'ss11', 6), (2037, 'ss12', 0), (2040, 'ss13', 1), (2043, 'ss14', 2), (2046, 'ss15', 3), (2049, 'ss16', 4), (2052, 'ss17', 5), (2055, 'ss18', 6), (2058, 'ss19', 0), (2061, 'ss20', 1), (2064, 'ss21', 2), (2067, 'ss22', 3), (2070, 'ss23', 4), (2073, 'ss24', 5), (2076, 'ss25', 6), (2079, 'ss26', 0), (2082, 'ss27', 1), (2085, 'ss28', 2), (2088, 'ss0', 3), (2091, 'ss1', 4), (2094, 'ss2', 5), (2097, 'ss3', 6), (2100, 'ss4', 0), (2103, 'ss5', 1), (2106, 'ss6', 2), (2109, 'ss7', 3), (2112, 'ss8', 4), (2115, 'ss9', 5), (2118, 'ss10', 6), (2121, 'ss11', 0), (2124, 'ss12', 1), (2127, 'ss13', 2), (2130, 'ss14', 3), (2133, 'ss15', 4), (2136, 'ss16', 5), (2139, 'ss17', 6), (2142, 'ss18', 0), (2145, 'ss19', 1), (2148, 'ss20', 2), (2151, 'ss21', 3), (2154, 'ss22', 4), (2157, 'ss23', 5), (2160, 'ss24', 6), (2163, 'ss25', 0), (2166, 'ss26', 1), (2169, 'ss27', 2), (2172, 'ss28', 3), (2175, 'ss0', 4), (2178, 'ss1', 5), (2181, 'ss2', 6), (2184, 'ss3', 0), (2187, 'ss4', 1), (2190, 'ss5', 2), (2193, 'ss6', 3), (2196, 'ss7', 4), (2199, 'ss8', 5), (2202, 'ss9', 6), (2205, 'ss10', 0), (2208, 'ss11', 1), (2211, 'ss12', 2), (2214, 'ss13', 3), (2217, 'ss14', 4), (2220, 'ss15', 5), (2223, 'ss16', 6), (2226, 'ss17', 0), (2229, 'ss18', 1), (2232, 'ss19', 2), (2235, 'ss20', 3), (2238, 'ss21', 4), (2241, 'ss22', 5), (2244, 'ss23', 6), (2247, 'ss24', 0), (2250, 'ss25', 1), (2253, 'ss26', 2), (2256, 'ss27', 3), (2259, 'ss28', 4), (2262, 'ss0', 5), (2265, 'ss1', 6), (2268, 'ss2', 0), (2271, 'ss3', 1), (2274, 'ss4', 2), (2277, 'ss5', 3), (2280, 'ss6', 4), (2283, 'ss7', 5), (2286, 'ss8', 6), (2289, 'ss9', 0), (2292, 'ss10', 1), (2295, 'ss11', 2), (2298, 'ss12', 3), (2301, 'ss13', 4), (2304, 'ss14', 5), (2307, 'ss15', 6), (2310, 'ss16', 0), (2313, 'ss17', 1), (2316, 'ss18', 2), (2319, 'ss19', 3), (2322, 'ss20', 4), (2325, 'ss21', 5), (2328, 'ss22', 6), (2331, 'ss23', 0), (2334, 'ss24', 1), (2337, 'ss25', 2), (2340, 'ss26', 3), (2343, 'ss27', 4), (2346, 'ss28', 5), (2349, 'ss0', 6), (2352, 'ss1', 0), (2355, 'ss2', 1), (2358, 'ss3', 2), (2361, 'ss4', 3), (2364, 'ss5', 4), (2367, 'ss6', 5), (2370, 'ss7', 6), (2373, 'ss8', 0), (2376, 'ss9', 1), (2379, 'ss10', 2), (2382, 'ss11', 3), (2385, 'ss12', 4), (2388, 'ss13', 5), (2391, 'ss14', 6), (2394, 'ss15', 0), (2397, 'ss16', 1), (2400, 'ss17', 2), (2403, 'ss18', 3), (2406, 'ss19', 4), (2409, 'ss20', 5), (2412, 'ss21', 6), (2415, 'ss22', 0), (2418, 'ss23', 1), (2421, 'ss24', 2), (2424, 'ss25', 3), (2427, 'ss26', 4), (2430, 'ss27', 5), (2433, 'ss28', 6), (2436, 'ss0', 0), (2439, 'ss1', 1), (2442, 'ss2', 2), (2445, 'ss3', 3), (2448, 'ss4', 4), (2451, 'ss5', 5), (2454, 'ss6', 6), (2457, 'ss7', 0), (2460, 'ss8', 1), (2463, 'ss9', 2), (2466, 'ss10', 3), (2469, 'ss11', 4), (2472, 'ss12', 5), (2475, 'ss13', 6), (2478, 'ss14', 0), (2481, 'ss15', 1), (2484, 'ss16', 2), (2487, 'ss17', 3), (2490, 'ss18', 4), (2493, 'ss19', 5), (2496, 'ss20', 6), (2499, 'ss21', 0), (2502, 'ss22', 1), (2505, 'ss23', 2), (2508, 'ss24', 3), (2511, 'ss25', 4), (2514, 'ss26', 5), (2517, 'ss27', 6), (2520, 'ss28', 0), (2523, 'ss0', 1), (2526, 'ss1', 2), (2529, 'ss2', 3), (2532, 'ss3', 4), (2535, 'ss4', 5), (2538, 'ss5', 6), (2541, 'ss6', 0), (2544, 'ss7', 1), (2547, 'ss8', 2), (2550, 'ss9', 3), (2553, 'ss10', 4), (2556, 'ss11', 5), (2559, 'ss12', 6), (2562, 'ss13', 0), (2565, 'ss14', 1), (2568, 'ss15', 2), (2571, 'ss16', 3), (2574, 'ss17', 4), (2577, 'ss18', 5), (2580, 'ss19', 6), (2583, 'ss20', 0), (2586, 'ss21', 1), (2589, 'ss22', 2), (2592, 'ss23', 3), (2595, 'ss24', 4), (2598, 'ss25', 5), (2601, 'ss26', 6), (2604, 'ss27', 0), (2607, 'ss28', 1), (2610, 'ss0', 2), (2613, 'ss1', 3), (2616, 'ss2', 4), (2619, 'ss3', 5), (2622, 'ss4', 6), (2625, 'ss5', 0), (2628, 'ss6', 1), (2631, 'ss7', 2), (2634, 'ss8', 3), (2637, 'ss9', 4), (2640, 'ss10', 5), (2643, 'ss11', 6), (2646, 'ss12', 0), (2649, 'ss13', 1), (2652, 'ss14', 2), (2655, 'ss15', 3), (2658, 'ss16', 4), (2661, 'ss17', 5), (2664, 'ss18', 6), (2667, 'ss19', 0), (2670, 'ss20', 1), (2673, 'ss21', 2), (2676, 'ss22', 3), (2679, 'ss23', 4), (2682, 'ss24', 5), (2685, 'ss25', 6), (2688, 'ss26', 0), (2691, 'ss27', 1), (2694, 'ss28', 2), (2697, 'ss0', 3), (2700, 'ss1', 4), (2703, 'ss2', 5), (2706, 'ss3', 6), (2709, 'ss4', 0), (2712, 'ss5', 1), (2715, 'ss6', 2), (2718, 'ss7', 3), (2721, 'ss8', 4), (2724, 'ss9', 5), (2727, 'ss10', 6), (2730, 'ss11', 0), (2733, 'ss12', 1), (2736, 'ss13', 2), (2739, 'ss14', 3), (2742, 'ss15', 4), (2745, 'ss16', 5), (2748, 'ss17', 6), (2751, 'ss18', 0), (2754, 'ss19', 1), (2757, 'ss20', 2), (2760, 'ss21', 3), (2763, 'ss22', 4), (2766, 'ss23', 5), (2769, 'ss24', 6), (2772, 'ss25', 0), (2775, 'ss26', 1), (2778, 'ss27', 2), (2781, 'ss28', 3), (2784, 'ss0', 4), (2787, 'ss1', 5), (2790, 'ss2', 6), (2793, 'ss3', 0), (2796, 'ss4', 1), (2799, 'ss5', 2), (2802, 'ss6', 3), (2805, 'ss7', 4), (2808, 'ss8', 5), (2811, 'ss9', 6), (2814, 'ss10', 0), (2817, 'ss11', 1), (2820, 'ss12', 2), (2823, 'ss13', 3), (2826, 'ss14', 4), (2829, 'ss15', 5), (2832, 'ss16', 6), (2835, 'ss17', 0), (2838, 'ss18', 1), (2841, 'ss19', 2), (2844, 'ss20', 3), (2847, 'ss21', 4), (2850, 'ss22', 5), (2853, 'ss23', 6), (2856, 'ss24', 0), (2859, 'ss25', 1), (2862, 'ss26', 2), (2865, 'ss27', 3), (2868, 'ss28', 4), (2871, 'ss0', 5), (2874, 'ss1', 6), (2877, 'ss2', 0), (2880, 'ss3', 1), (2883, 'ss4', 2), (2886, 'ss5', 3), (2889, 'ss6', 4), (2892, 'ss7', 5), (2895, 'ss8', 6), (2898, 'ss9', 0), (2901, 'ss10', 1), (2904, 'ss11', 2), (2907, 'ss12', 3), (2910, 'ss13', 4), (2913, 'ss14', 5), (2916, 'ss15', 6), (2919, 'ss16', 0), (2922, 'ss17', 1), (2925, 'ss18', 2), (2928, 'ss19', 3), (2931, 'ss20', 4), (2934, 'ss21', 5), (2937, 'ss22', 6), (2940, 'ss23', 0), (2943, 'ss24', 1), (2946, 'ss25', 2), (2949, 'ss26', 3), (2952, 'ss27', 4), (2955, 'ss28', 5), (2958, 'ss0', 6), (2961, 'ss1', 0), (2964, 'ss2', 1), (2967, 'ss3', 2), (2970, 'ss4', 3), (2973, 'ss5', 4), (2976, 'ss6', 5), (2979, 'ss7', 6), (2982, 'ss8', 0), (2985, 'ss9', 1), (2988, 'ss10', 2), (2991, 'ss11', 3), (2994, 'ss12', 4), (2997, 'ss13', 5), (3000, 'ss14', 6), (3003, 'ss15', 0), (3006, 'ss16', 1), (3009, 'ss17', 2), (3012, 'ss18', 3), (3015, 'ss19', 4), (3018, 'ss20', 5), (3021, 'ss21', 6), (3024, 'ss22', 0), (3027, 'ss23', 1), (3030, 'ss24', 2), (3033, 'ss25', 3), (3036, 'ss26', 4), (3039, 'ss27', 5), (3042, 'ss28', 6), (3045, 'ss0', 0), (3048, 'ss1', 1), (3051, 'ss2', 2), (3054, 'ss3', 3), (3057, 'ss4', 4), (3060, 'ss5', 5), (3063, 'ss6', 6), (3066, 'ss7', 0), (3069, 'ss8', 1), (3072, 'ss9', 2), (3075, 'ss10', 3), (3078, 'ss11', 4), (3081, 'ss12', 5), (3084, 'ss13', 6), (3087, 'ss14', 0), (3090, 'ss15', 1), (3093, 'ss16', 2), (3096, 'ss17', 3), (3099, 'ss18', 4), (3102, 'ss19', 5), (3105, 'ss20', 6), (3108, 'ss21', 0), (3111, 'ss22', 1), (3114, 'ss23', 2), (3117, 'ss24', 3), (3120, 'ss25', 4), (3123, 'ss26', 5), (3126, 'ss27', 6), (3129, 'ss28', 0), (3132, 'ss0', 1), (3135, 'ss1', 2), (3138, 'ss2', 3), (3141, 'ss3', 4), (3144, 'ss4', 5), (3147, 'ss5', 6), (3150, 'ss6', 0), (3153, 'ss7', 1), (3156, 'ss8', 2), (3159, 'ss9', 3), (3162, 'ss10', 4), (3165, 'ss11', 5), (3168, 'ss12', 6), (3171, 'ss13', 0), (3174, 'ss14', 1), (3177, 'ss15', 2), (3180, 'ss16', 3), (3183, 'ss17', 4), (3186, 'ss18', 5), (3189, 'ss19', 6), (3192, 'ss20', 0), (3195, 'ss21', 1), (3198, 'ss22', 2), (3201, 'ss23', 3), (3204, 'ss24', 4), (3207, 'ss25', 5), (3210, 'ss26', 6), (3213, 'ss27', 0), (3216, 'ss28', 1), (3219, 'ss0', 2), (3222, 'ss1', 3), (3225, 'ss2', 4), (3228, 'ss3', 5), (3231, 'ss4', 6), (3234, 'ss5', 0), (3237, 'ss6', 1), (3240, 'ss7', 2), (3243, 'ss8', 3), (3246, 'ss9', 4), (3249, 'ss10', 5), (3252, 'ss11', 6), (3255, 'ss12', 0), (3258, 'ss13', 1), (3261, 'ss14', 2), (3264, 'ss15', 3), (3267, 'ss16', 4), (3270, 'ss17', 5), (3273, 'ss18', 6), (3276, 'ss19', 0), (3279, 'ss20', 1), (3282, 'ss21', 2), (3285, 'ss22', 3), (3288, 'ss23', 4), (3291, 'ss24', 5), (3294, 'ss25', 6), (3297, 'ss26', 0), (3300, 'ss27', 1), (3303, 'ss28', 2), (3306, 'ss0', 3), (3309, 'ss1', 4), (3312, 'ss2', 5), (3315, 'ss3', 6), (3318, 'ss4', 0), (3321, 'ss5', 1), (3324, 'ss6', 2), (3327, 'ss7', 3), (3330, 'ss8', 4), (3333, 'ss9', 5), (3336, 'ss10', 6), (3339, 'ss11', 0), (3342, 'ss12', 1), (3345, 'ss13', 2), (3348, 'ss14', 3), (3351, 'ss15', 4), (3354, 'ss16', 5), (3357, 'ss17', 6), (3360, 'ss18', 0), (3363, 'ss19', 1), (3366, 'ss20', 2), (3369, 'ss21', 3), (3372, 'ss22', 4), (3375, 'ss23', 5), (3378, 'ss24', 6), (3381, 'ss25', 0), (3384, 'ss26', 1), (3387, 'ss27', 2), (3390, 'ss28', 3), (3393, 'ss0', 4), (3396, 'ss1', 5), (3399, 'ss2', 6), (3402, 'ss3', 0), (3405, 'ss4', 1), (3408, 'ss5', 2), (3411, 'ss6', 3), (3414, 'ss7', 4), (3417, 'ss8', 5), (3420, 'ss9', 6), (3423, 'ss10', 0), (3426, 'ss11', 1), (3429, 'ss12', 2), (3432, 'ss13', 3), (3435, 'ss14', 4), (3438, 'ss15', 5), (3441, 'ss16', 6), (3444, 'ss17', 0), (3447, 'ss18', 1), (3450, 'ss19', 2), (3453, 'ss20', 3), (3456, 'ss21', 4), (3459, 'ss22', 5), (3462, 'ss23', 6), (3465, 'ss24', 0), (3468, 'ss25', 1), (3471, 'ss26', 2), (3474, 'ss27', 3), (3477, 'ss28', 4), (3480, 'ss0', 5), (3483, 'ss1', 6), (3486, 'ss2', 0), (3489, 'ss3', 1), (3492, 'ss4', 2), (3495, 'ss5', 3), (3498, 'ss6', 4), (3501, 'ss7', 5), (3504, 'ss8', 6), (3507, 'ss9', 0), (3510, 'ss10', 1), (3513, 'ss11', 2), (3516, 'ss12', 3), (3519, 'ss13', 4), (3522, 'ss14', 5), (3525, 'ss15', 6), (3528, 'ss16', 0), (3531, 'ss17', 1), (3534, 'ss18', 2), (3537, 'ss19', 3), (3540, 'ss20', 4), (3543, 'ss21', 5), (3546, 'ss22', 6), (3549, 'ss23', 0), (3552, 'ss24', 1), (3555, 'ss25', 2), (3558, 'ss26', 3), (3561, 'ss27', 4), (3564, 'ss28', 5), (3567, 'ss0', 6), (3570, 'ss1', 0), (3573, 'ss2', 1), (3576, 'ss3', 2), (3579, 'ss4', 3), (3582, 'ss5', 4), (3585, 'ss6', 5), (3588, 'ss7', 6), (3591, 'ss8', 0), (3594, 'ss9', 1), (3597, 'ss10', 2);
+CREATE TABLE T(A INT, B VARCHAR, C INT, PRIMARY KEY(A, B)) WITH (compression='zlib');
+INSERT INTO T VALUES (0, 't0', 0), (1, 't0', 1), (2, 't0', 2), (3, 't0', 3), (4, 't0', 4), (5, 't0', 5), (6, 't0', 6), (7, 't0', 7), (8, 't0', 8), (9, 't0', 9), (10, 't0', 10), (11, 't0', 11), (12, 't0', 12), (13, 't0', 13), (14, 't0', 14), (15, 't0', 15), (16, 't0', 16), (17, 't0', 17), (18, 't0', 18), (19, 't0', 19), (20, 't0', 20), (21, 't0', 21), (22, 't0', 22), (23, 't0', 23), (24, 't0', 24), (25, 't0', 25), (26, 't0', 26), (27, 't0', 27), (28, 't0', 28), (29, 't0', 29), (30, 't0', 30), (31, 't0', 31), (32, 't0', 32), (33, 't0', 33), (34, 't0', 34), (35, 't0', 35), (36, 't0', 36), (37, 't0', 37), (38, 't0', 38), (39, 't0', 39), (40, 't0', 40), (41, 't0', 41), (42, 't0', 42), (43, 't0', 43), (44, 't0', 44), (45, 't0', 45), (46, 't0', 46), (47, 't0', 47), (48, 't0', 48), (49, 't0', 49), (0, 't1', 50), (1, 't1', 51), (2, 't1', 52), (3, 't1', 53), (4, 't1', 54), (5, 't1', 55), (6, 't1', 56), (7, 't1', 57), (8, 't1', 58), (9, 't1', 59), (10, 't1', 60), (11, 't1', 61), (12, 't1', 62), (13, 't1', 63), (14, 't1', 64), (15, 't1', 65), (16, 't1', 66), (17, 't1', 67), (18, 't1', 68), (19, 't1', 69), (20, 't1', 70), (21, 't1', 71), (22, 't1', 72), (23, 't1', 73), (24, 't1', 74), (25, 't1', 75), (26, 't1', 76), (27, 't1', 77), (28, 't1', 78), (29, 't1', 79), (30, 't1', 80), (31, 't1', 81), (32, 't1', 82), (33, 't1', 83), (34, 't1', 84), (35, 't1', 85), (36, 't1', 86), (37, 't1', 87), (38, 't1', 88), (39, 't1', 89), (40, 't1', 90), (41, 't1', 91), (42, 't1', 92), (43, 't1', 93), (44, 't1', 94), (45, 't1', 95), (46, 't1', 96), (47, 't1', 97), (48, 't1', 98), (49, 't1', 99), (0, 't2', 100), (1, 't2', 101), (2, 't2', 102), (3, 't2', 103), (4, 't2', 104), (5, 't2', 105), (6, 't2', 106), (7, 't2', 107), (8, 't2', 108), (9, 't2', 109), (10, 't2', 110), (11, 't2', 111), (12, 't2', 112), (13, 't2', 113), (14, 't2', 114), (15, 't2', 115), (16, 't2', 116), (17, 't2', 117), (18, 't2', 118), (19, 't2', 119), (20, 't2', 120), (21, 't2', 121), (22, 't2', 122), (23, 't2', 123), (24, 't2', 124), (25, 't2', 125), (26, 't2', 126), (27, 't2', 127), (28, 't2', 128), (29, 't2', 129), (30, 't2', 130), (31, 't2', 131), (32, 't2', 132), (33, 't2', 133), (34, 't2', 134), (35, 't2', 135), (36, 't2', 136), (37, 't2', 137), (38, 't2', 138), (39, 't2', 139), (40, 't2', 140), (41, 't2', 141), (42, 't2', 142), (43, 't2', 143), (44, 't2', 144), (45, 't2', 145), (46, 't2', 146), (47, 't2', 147), (48, 't2', 148), (49, 't2', 149), (0, 't3', 150), (1, 't3', 151), (2, 't3', 152), (3, 't3', 153), (4, 't3', 154), (5, 't3', 155), (6, 't3', 156), (7, 't3', 157), (8, 't3', 158), (9, 't3', 159), (10, 't3', 160), (11, 't3', 161), (12, 't3', 162), (13, 't3', 163), (14, 't3', 164), (15, 't3', 165), (16, 't3', 166), (17, 't3', 167), (18, 't3', 168), (19, 't3', 169), (20, 't3', 170), (21, 't3', 171), (22, 't3', 172), (23, 't3', 173), (24, 't3', 174), (25, 't3', 175), (26, 't3', 176), (27, 't3', 177), (28, 't3', 178), (29, 't3', 179), (30, 't3', 180), (31, 't3', 181), (32, 't3', 182), (33, 't3', 183), (34, 't3', 184), (35, 't3', 185), (36, 't3', 186), (37, 't3', 187), (38, 't3', 188), (39, 't3', 189), (40, 't3', 190), (41, 't3', 191), (42, 't3', 192), (43, 't3', 193), (44, 't3', 194), (45, 't3', 195), (46, 't3', 196), (47, 't3', 197), (48, 't3', 198), (49, 't3', 199), (0, 't4', 200), (1, 't4', 201), (2, 't4', 202), (3, 't4', 203), (4, 't4', 204), (5, 't4', 205), (6, 't4', 206), (7, 't4', 207), (8, 't4', 208), (9, 't4', 209), (10, 't4', 210), (11, 't4', 211), (12, 't4', 212), (13, 't4', 213), (14, 't4', 214), (15, 't4', 215), (16, 't4', 216), (17, 't4', 217), (18, 't4', 218), (19, 't4', 219), (20, 't4', 220), (21, 't4', 221), (22, 't4', 222), (23, 't4', 223), (24, 't4', 224), (25, 't4', 225), (26, 't4', 226), (27, 't4', 227), (28, 't4', 228), (29, 't4', 229), (30, 't4', 230), (31, 't4', 231), (32, 't4', 232), (33, 't4', 233), (34, 't4', 234), (35, 't4', 235), (36, 't4', 236), (37, 't4', 237), (38, 't4', 238), (39, 't4', 239), (40, 't4', 240), (41, 't4', 241), (42, 't4', 242), (43, 't4', 243), (44, 't4', 244), (45, 't4', 245), (46, 't4', 246), (47, 't4', 247), (48, 't4', 248), (49, 't4', 249), (0, 't5', 250), (1, 't5', 251), (2, 't5', 252), (3, 't5', 253), (4, 't5', 254), (5, 't5', 255), (6, 't5', 256), (7, 't5', 257), (8, 't5', 258), (9, 't5', 259), (10, 't5', 260), (11, 't5', 261), (12, 't5', 262), (13, 't5', 263), (14, 't5', 264), (15, 't5', 265), (16, 't5', 266), (17, 't5', 267), (18, 't5', 268), (19, 't5', 269), (20, 't5', 270), (21, 't5', 271), (22, 't5', 272), (23, 't5', 273), (24, 't5', 274), (25, 't5', 275), (26, 't5', 276), (27, 't5', 277), (28, 't5', 278), (29, 't5', 279), (30, 't5', 280), (31, 't5', 281), (32, 't5', 282), (33, 't5', 283), (34, 't5', 284), (35, 't5', 285), (36, 't5', 286), (37, 't5', 287), (38, 't5', 288), (39, 't5', 289), (40, 't5', 290), (41, 't5', 291), (42, 't5', 292), (43, 't5', 293), (44, 't5', 294), (45, 't5', 295), (46, 't5', 296), (47, 't5', 297), (48, 't5', 298), (49, 't5', 299), (0, 't6', 300), (1, 't6', 301), (2, 't6', 302), (3, 't6', 303), (4, 't6', 304), (5, 't6', 305), (6, 't6', 306), (7, 't6', 307), (8, 't6', 308), (9, 't6', 309), (10, 't6', 310), (11, 't6', 311), (12, 't6', 312), (13, 't6', 313), (14, 't6', 314), (15, 't6', 315), (16, 't6', 316), (17, 't6', 317), (18, 't6', 318), (19, 't6', 319), (20, 't6', 320), (21, 't6', 321), (22, 't6', 322), (23, 't6', 323), (24, 't6', 324), (25, 't6', 325), (26, 't6', 326), (27, 't6', 327), (28, 't6', 328), (29, 't6', 329), (30, 't6', 330), (31, 't6', 331), (32, 't6', 332), (33, 't6', 333), (34, 't6', 334), (35, 't6', 335), (36, 't6', 336), (37, 't6', 337), (38, 't6', 338), (39, 't6', 339), (40, 't6', 340), (41, 't6', 341), (42, 't6', 342), (43, 't6', 343), (44, 't6', 344), (45, 't6', 345), (46, 't6', 346), (47, 't6', 347), (48, 't6', 348), (49, 't6', 349), (0, 't7', 350), (1, 't7', 351), (2, 't7', 352), (3, 't7', 353), (4, 't7', 354), (5, 't7', 355), (6, 't7', 356), (7, 't7', 357), (8, 't7', 358), (9, 't7', 359), (10, 't7', 360), (11, 't7', 361), (12, 't7', 362), (13, 't7', 363), (14, 't7', 364), (15, 't7', 365), (16, 't7', 366), (17, 't7', 367), (18, 't7', 368), (19, 't7', 369), (20, 't7', 370), (21, 't7', 371), (22, 't7', 372), (23, 't7', 373), (24, 't7', 374), (25, 't7', 375), (26, 't7', 376), (27, 't7', 377), (28, 't7', 378), (29, 't7', 379), (30, 't7', 380), (31, 't7', 381), (32, 't7', 382), (33, 't7', 383), (34, 't7', 384), (35, 't7', 385), (36, 't7', 386), (37, 't7', 387), (38, 't7', 388), (39, 't7', 389), (40, 't7', 390), (41, 't7', 391), (42, 't7', 392), (43, 't7', 393), (44, 't7', 394), (45, 't7', 395), (46, 't7', 396), (47, 't7', 397), (48, 't7', 398), (49, 't7', 399), (0, 't8', 400), (1, 't8', 401), (2, 't8', 402), (3, 't8', 403), (4, 't8', 404), (5, 't8', 405), (6, 't8', 406), (7, 't8', 407), (8, 't8', 408), (9, 't8', 409), (10, 't8', 410), (11, 't8', 411), (12, 't8', 412), (13, 't8', 413), (14, 't8', 414), (15, 't8', 415), (16, 't8', 416), (17, 't8', 417), (18, 't8', 418), (19, 't8', 419), (20, 't8', 420), (21, 't8', 421), (22, 't8', 422), (23, 't8', 423), (24, 't8', 424), (25, 't8', 425), (26, 't8', 426), (27, 't8', 427), (28, 't8', 428), (29, 't8', 429), (30, 't8', 430), (31, 't8', 431), (32, 't8', 432), (33, 't8', 433), (34, 't8', 434), (35, 't8', 435), (36, 't8', 436), (37, 't8', 437), (38, 't8', 438), (39, 't8', 439), (40, 't8', 440), (41, 't8', 441), (42, 't8', 442), (43, 't8', 443), (44, 't8', 444), (45, 't8', 445), (46, 't8', 446), (47, 't8', 447), (48, 't8', 448), (49, 't8', 449), (0, 't9', 450), (1, 't9', 451), (2, 't9', 452), (3, 't9', 453), (4, 't9', 454), (5, 't9', 455), (6, 't9', 456), (7, 't9', 457), (8, 't9', 458), (9, 't9', 459), (10, 't9', 460), (11, 't9', 461), (12, 't9', 462), (13, 't9', 463), (14, 't9', 464), (15, 't9', 465), (16, 't9', 466), (17, 't9', 467), (18, 't9', 468), (19, 't9', 469), (20, 't9', 470), (21, 't9', 471), (22, 't9', 472), (23, 't9', 473), (24, 't9', 474), (25, 't9', 475), (26, 't9', 476), (27, 't9', 477), (28, 't9', 478), (29, 't9', 479), (30, 't9', 480), (31, 't9', 481), (32, 't9', 482), (33, 't9', 483), (34, 't9', 484), (35, 't9', 485), (36, 't9', 486), (37, 't9', 487), (38, 't9', 488), (39, 't9', 489), (40, 't9', 490), (41, 't9', 491), (42, 't9', 492), (43, 't9', 493), (44, 't9', 494), (45, 't9', 495), (46, 't9', 496), (47, 't9', 497), (48, 't9', 498), (49, 't9', 499), (0, 't10', 500), (1, 't10', 501), (2, 't10', 502), (3, 't10', 503), (4, 't10', 504), (5, 't10', 505), (6, 't10', 506), (7, 't10', 507), (8, 't10', 508), (9, 't10', 509), (10, 't10', 510), (11, 't10', 511), (12, 't10', 512), (13, 't10', 513), (14, 't10', 514), (15, 't10', 515), (16, 't10', 516), (17, 't10', 517), (18, 't10', 518), (19, 't10', 519), (20, 't10', 520), (21, 't10', 521), (22, 't10', 522), (23, 't10', 523), (24, 't10', 524), (25, 't10', 525), (26, 't10', 526), (27, 't10', 527), (28, 't10', 528), (29, 't10', 529), (30, 't10', 530), (31, 't10', 531), (32, 't10', 532), (33, 't10', 533), (34, 't10', 534), (35, 't10', 535), (36, 't10', 536), (37, 't10', 537), (38, 't10', 538), (39, 't10', 539), (40, 't10', 540), (41, 't10', 541), (42, 't10', 542), (43, 't10', 543), (44, 't10', 544), (45, 't10', 545), (46, 't10', 546), (47, 't10', 547), (48, 't10', 548), (49, 't10', 549), (0, 't11', 550), (1, 't11', 551), (2, 't11', 552), (3, 't11', 553), (4, 't11', 554), (5, 't11', 555), (6, 't11', 556), (7, 't11', 557), (8, 't11', 558), (9, 't11', 559), (10, 't11', 560), (11, 't11', 561), (12, 't11', 562), (13, 't11', 563), (14, 't11', 564), (15, 't11', 565), (16, 't11', 566), (17, 't11', 567), (18, 't11', 568), (19, 't11', 569), (20, 't11', 570), (21, 't11', 571), (22, 't11', 572), (23, 't11', 573), (24, 't11', 574), (25, 't11', 575), (26, 't11', 576), (27, 't11', 577), (28, 't11', 578), (29, 't11', 579), (30, 't11', 580), (31, 't11', 581), (32, 't11', 582), (33, 't11', 583), (34, 't11', 584), (35, 't11', 585), (36, 't11', 586), (37, 't11', 587), (38, 't11', 588), (39, 't11', 589), (40, 't11', 590), (41, 't11', 591), (42, 't11', 592), (43, 't11', 593), (44, 't11', 594), (45, 't11', 595), (46, 't11', 596), (47, 't11', 597), (48, 't11', 598), (49, 't11', 599);
+CREATE INDEX RC ON R(C);
+SELECT A, B FROM R WHERE A < 30;
+SELECT A, D FROM R WHERE C = 'zz5' AND B > 90.0;
+SELECT R.A, S.E FROM R, S WHERE R.A = S.A AND S.F = 3 AND R.A < 1000;
+SELECT C, COUNT(*), SUM(B) FROM R GROUP BY C;
+SELECT * FROM T WHERE A = 7 AND B = 't3';
+DELETE FROM R WHERE A >= 100 AND A < 2400;
+DELETE FROM S WHERE F = 0;
+INSERT INTO R VALUES (99999, 1.5, 'new', '2030-01-01');
+SELECT A, C FROM R WHERE A > 2450 OR A < 5;
+SELECT COUNT(*), MAX(A) FROM R;
+SELECT F, COUNT(*) FROM S GROUP BY F;
+SELECT A FROM R WHERE C = 'new';
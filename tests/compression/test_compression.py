@@ -0,0 +1,51 @@
+import pytest
+
+from ddb.db import DatabaseManager
+from ddb.session import Session
+from ddb.primitives import ValType
+from ddb.storage import COMPRESSIONS, LMDBCompressedHeapFile
+
+testcase_dir = "tests/compression/"
+T = 1
+
+@pytest.fixture(params=[None, 'zlib', 'lzma'])
+def session(request):
+    # tables choose their own compression; spilled rows use the tmp compression (if any):
+    dbm = DatabaseManager(
+        db_dir = DatabaseManager.DEFAULT_DB_DIR,
+        tmp_dir = DatabaseManager.DEFAULT_TMP_DIR,
+        tmp_compression = request.param
+    )
+    s = Session(dbm)
+    yield s
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_compression_{t_id}")
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_heap_file_operations(session, compression):
+    # a compressed heap file behaves just like an uncompressed one, whichever rows its blocks hold:
+    dbm = session.dbm
+    with dbm.tm.begin_transaction(read_only=False, tmp=True) as tx, \
+        dbm.sm.heap_file(tx, 'compressed', [ValType.INTEGER, ValType.VARCHAR],
+                         create_if_not_exists=True, compression=compression) as f:
+        assert isinstance(f, LMDBCompressedHeapFile)
+        rows: dict[int, tuple] = dict()
+        start, count = f.batch_append((i, 'x' * (i % 50)) for i in range(3000))
+        assert count == 3000
+        rows.update((start + i, (i, 'x' * (i % 50))) for i in range(3000))
+        for row_id in list(rows)[::7]:
+            assert f.delete(row_id) == 1 and f.delete(row_id) == 0
+            del rows[row_id]
+        for row_id in list(rows)[::11]:
+            rows[row_id] = (-row_id, 'overwritten')
+            assert f.put(rows[row_id], row_id) == row_id
+        for i in range(100):
+            row_id = f.put((i, 'new'))
+            assert row_id not in rows
+            rows[row_id] = (i, 'new')
+        assert all(f.get(row_id) == row for row_id, row in list(rows.items())[::13])
+        assert sorted(f.iter_scan(return_row_id=True)) == sorted((row_id, *row) for row_id, row in rows.items())
+        assert sorted(row for batch in f.iter_scan_batches() for row in batch) == sorted(rows.values())
+        assert f.truncate() == len(rows) and list(f.iter_scan()) == []
@@ -0,0 +1,87 @@
+"""Fixtures shared by the test suites in this directory.
+
+Most suites run SQL test cases: ``t_<name>_<id>.sql`` holds the commands,
+and ``t_<name>_<id>.ans`` holds the expected response of each command,
+followed by the (sorted) result rows if the command is a ``SELECT``.
+A suite may override the ``session`` fixture, e.g., to parametrize the database it runs against;
+:func:`check_sql_case` and :func:`run` then use the overriding one.
+"""
+import pytest
+import datetime
+import subprocess
+
+from ddb.db import DatabaseManager
+from ddb.session import Session
+from ddb.parser import parse_all
+
+@pytest.fixture
+def session():
+    dbm = DatabaseManager(
+        db_dir = DatabaseManager.DEFAULT_DB_DIR,
+        tmp_dir = DatabaseManager.DEFAULT_TMP_DIR
+    )
+    s = Session(dbm)
+    yield s
+
+@pytest.fixture
+def run(session):
+    """Return a function that runs all commands in the given SQL string, returning their results.
+    """
+    def run(sql):
+        return [ session.request(parse_tree) for parse_tree in parse_all(sql) ]
+    return run
+
+def load_answer(ans_filename):
+    answer, select_answer = None, None
+    with open(ans_filename, "r") as fans:
+        # load commands' responses and query results to answer and select_answer respectively
+        answer, select_answer = [], []
+        lines = list(fans.readlines())
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            line = line.lstrip('(').rstrip(')\n')
+            answer.append((str(line.split(", ")[0]), eval(line.split(", ")[1])))
+            if answer[-1][0] == "SELECT":
+                # load all the query results
+                select_answer.append([eval(l[:-1]) for l in lines[i + 1 : i + 1 + answer[-1][1]]])
+                i = i + answer[-1][1]
+            i += 1
+    return answer, select_answer
+
+@pytest.fixture
+def check_sql_case(session, capsys):
+    """Return a function that runs the test case at the given path (without the ``.sql``/``.ans`` suffix)
+    and checks its results against the answer file.
+    Unless ``clean`` is ``False``, the database is removed (``make clean``) first.
+    """
+    def check(case_path, clean=True):
+        if clean:
+            subprocess.run(['make', 'clean'], check=True)
+        with open(case_path + ".sql") as fsql:
+            answer, select_answer = load_answer(case_path + ".ans")
+            assert answer is not None and select_answer is not None, f"{case_path}: faild to load answer file"
+            # Check command one by one
+            command_id = 0
+            select_id = 0
+            for parse_tree in parse_all(fsql.read()):
+                capsys.readouterr()
+                r = session.request(parse_tree)
+                assert r.error is None, f"{case_path}, command{command_id}: got error: {r.error_details}"
+                assert r.response.startswith(answer[command_id][0]), f"{case_path}, command{command_id}: incorrect command."
+                if r.response.startswith("SELECT"):
+                    # check the result count
+                    assert int(r.response.split("\n")[0].split(" ")[1]) == answer[command_id][1], f"{case_path}, command{command_id}: incorrect result count."
+                    # check the result content
+                    result = capsys.readouterr().out.split("\n")[1:-1]
+                    result = [tuple(v.strftime("%Y-%m-%d") if isinstance(v, datetime.datetime) else v
+                                    for v in eval(item, {'datetime' : datetime})) for item in result]
+                    result.sort()
+                    assert len(result) == len(select_answer[select_id]) and \
+                        all(row == pytest.approx(ans_row) for row, ans_row in zip(result, select_answer[select_id])), \
+                        f"{case_path}, command{command_id}: incorrect result content"
+                    select_id += 1
+                command_id += 1
+            # check if all commands are fully executed
+            assert command_id == len(answer), f"{case_path}: executed {command_id} commands <> total {len(answer)} commands"
+    return check
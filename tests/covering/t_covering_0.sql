@@ -0,0 +1,23 @@
+CREATE TABLE R(A INT, B INT, C INT, D VARCHAR, E FLOAT);
+INSERT INTO R VALUES (0, 0, 0, 'c0', 0.0), (1, 7, 1, 'c1', 0.5), (2, 14, 2, 'c2', 1.0), (3, 21, 3, 'c3', 1.5), (4, 28, 4, 'c4', 2.0), (5, 35, 5, 'c5', 2.5), (6, 42, 6, 'c6', 3.0), (7, 49, 7, 'c7', 3.5), (8, 3, 8, 'c8', 4.0), (9, 10, 9, 'c9', 4.5), (10, 17, 10, 'c10', 5.0), (11, 24, 0, 'c11', 5.5), (12, 31, 1, 'c12', 6.0), (13, 38, 2, 'c0', 6.5), (14, 45, 3, 'c1', 7.0), (15, 52, 4, 'c2', 7.5), (16, 6, 5, 'c3', 8.0), (17, 13, 6, 'c4', 8.5), (18, 20, 7, 'c5', 9.0), (19, 27, 8, 'c6', 9.5), (20, 34, 9, 'c7', 10.0), (21, 41, 10, 'c8', 10.5), (22, 48, 0, 'c9', 11.0), (23, 2, 1, 'c10', 11.5), (24, 9, 2, 'c11', 12.0), (25, 16, 3, 'c12', 12.5), (26, 23, 4, 'c0', 13.0), (27, 30, 5, 'c1', 13.5), (28, 37, 6, 'c2', 14.0), (29, 44, 7, 'c3', 14.5), (30, 51, 8, 'c4', 15.0), (31, 5, 9, 'c5', 15.5), (32, 12, 10, 'c6', 16.0), (33, 19, 0, 'c7', 16.5), (34, 26, 1, 'c8', 17.0), (35, 33, 2, 'c9', 17.5), (36, 40, 3, 'c10', 18.0), (37, 47, 4, 'c11', 18.5), (38, 1, 5, 'c12', 19.0), (39, 8, 6, 'c0', 19.5), (40, 15, 7, 'c1', 20.0), (41, 22, 8, 'c2', 20.5), (42, 29, 9, 'c3', 21.0), (43, 36, 10, 'c4', 21.5), (44, 43, 0, 'c5', 22.0), (45, 50, 1, 'c6', 22.5), (46, 4, 2, 'c7', 23.0), (47, 11, 3, 'c8', 23.5), (48, 18, 4, 'c9', 24.0), (49, 25, 5, 'c10', 24.5), (50, 32, 6, 'c11', 25.0), (51, 39, 7, 'c12', 25.5), (52, 46, 8, 'c0', 26.0), (53, 0, 9, 'c1', 26.5), (54, 7, 10, 'c2', 27.0), (55, 14, 0, 'c3', 27.5), (56, 21, 1, 'c4', 28.0), (57, 28, 2, 'c5', 28.5), (58, 35, 3, 'c6', 29.0), (59, 42, 4, 'c7', 29.5), (60, 49, 5, 'c8', 30.0), (61, 3, 6, 'c9', 30.5), (62, 10, 7, 'c10', 31.0), (63, 17, 8, 'c11', 31.5), (64, 24, 9, 'c12', 32.0), (65, 31, 10, 'c0', 32.5), (66, 38, 0, 'c1', 33.0), (67, 45, 1, 'c2', 33.5), (68, 52, 2, 'c3', 34.0), (69, 6, 3, 'c4', 34.5), (70, 13, 4, 'c5', 35.0), (71, 20, 5, 'c6', 35.5), (72, 27, 6, 'c7', 36.0), (73, 34, 7, 'c8', 36.5), (74, 41, 8, 'c9', 37.0), (75, 48, 9, 'c10', 37.5), (76, 2, 10, 'c11', 38.0), (77, 9, 0, 'c12', 38.5), (78, 16, 1, 'c0', 39.0), (79, 23, 2, 'c1', 39.5), (80, 30, 3, 'c2', 40.0), (81, 37, 4, 'c3', 40.5), (82, 44, 5, 'c4', 41.0), (83, 51, 6, 'c5', 41.5), (84, 5, 7, 'c6', 42.0), (85, 12, 8, 'c7', 42.5), (86, 19, 9, 'c8', 43.0), (87, 26, 10, 'c9', 43.5), (88, 33, 0, 'c10', 44.0), (89, 40, 1, 'c11', 44.5), (90, 47, 2, 'c12', 45.0), (91, 1, 3, 'c0', 45.5), (92, 8, 4, 'c1', 46.0), (93, 15, 5, 'c2', 46.5), (94, 22, 6, 'c3', 47.0), (95, 29, 7, 'c4', 47.5), (96, 36, 8, 'c5', 48.0), (97, 43, 9, 'c6', 48.5), (98, 50, 10, 'c7', 49.0), (99, 4, 0, 'c8', 49.5), (100, 11, 1, 'c9', 50.0), (101, 18, 2, 'c10', 50.5), (102, 25, 3, 'c11', 51.0), (103, 32, 4, 'c12', 51.5), (104, 39, 5, 'c0', 52.0), (105, 46, 6, 'c1', 52.5), (106, 0, 7, 'c2', 53.0), (107, 7, 8, 'c3', 53.5), (108, 14, 9, 'c4', 54.0), (109, 21, 10, 'c5', 54.5), (110, 28, 0, 'c6', 55.0), (111, 35, 1, 'c7', 55.5), (112, 42, 2, 'c8', 56.0), (113, 49, 3, 'c9', 56.5), (114, 3, 4, 'c10', 57.0), (115, 10, 5, 'c11', 57.5), (116, 17, 6, 'c12', 58.0), (117, 24, 7, 'c0', 58.5), (118, 31, 8, 'c1', 59.0), (119, 38, 9, 'c2', 59.5), (120, 45, 10, 'c3', 60.0), (121, 52, 0, 'c4', 60.5), (122, 6, 1, 'c5', 61.0), (123, 13, 2, 'c6', 61.5), (124, 20, 3, 'c7', 62.0), (125, 27, 4, 'c8', 62.5), (126, 34, 5, 'c9', 63.0), (127, 41, 6, 'c10', 63.5), (128, 48, 7, 'c11', 64.0), (129, 2, 8, 'c12', 64.5), (130, 9, 9, 'c0', 65.0), (131, 16, 10, 'c1', 65.5), (132, 23, 0, 'c2', 66.0), (133, 30, 1, 'c3', 66.5), (134, 37, 2, 'c4', 67.0), (135, 44, 3, 'c5', 67.5), (136, 51, 4, 'c6', 68.0), (137, 5, 5, 'c7', 68.5), (138, 12, 6, 'c8', 69.0), (139, 19, 7, 'c9', 69.5), (140, 26, 8, 'c10', 70.0), (141, 33, 9, 'c11', 70.5), (142, 40, 10, 'c12', 71.0), (143, 47, 0, 'c0', 71.5), (144, 1, 1, 'c1', 72.0), (145, 8, 2, 'c2', 72.5), (146, 15, 3, 'c3', 73.0), (147, 22, 4, 'c4', 73.5), (148, 29, 5, 'c5', 74.0), (149, 36, 6, 'c6', 74.5), (150, 43, 7, 'c7', 75.0), (151, 50, 8, 'c8', 75.5), (152, 4, 9, 'c9', 76.0), (153, 11, 10, 'c10', 76.5), (154, 18, 0, 'c11', 77.0), (155, 25, 1, 'c12', 77.5), (156, 32, 2, 'c0', 78.0), (157, 39, 3, 'c1', 78.5), (158, 46, 4, 'c2', 79.0), (159, 0, 5, 'c3', 79.5), (160, 7, 6, 'c4', 80.0), (161, 14, 7, 'c5', 80.5), (162, 21, 8, 'c6', 81.0), (163, 28, 9, 'c7', 81.5), (164, 35, 10, 'c8', 82.0), (165, 42, 0, 'c9', 82.5), (166, 49, 1, 'c10', 83.0), (167, 3, 2, 'c11', 83.5), (168, 10, 3, 'c12', 84.0), (169, 17, 4, 'c0', 84.5), (170, 24, 5, 'c1', 85.0), (171, 31, 6, 'c2', 85.5), (172, 38, 7, 'c3', 86.0), (173, 45, 8, 'c4', 86.5), (174, 52, 9, 'c5', 87.0), (175, 6, 10, 'c6', 87.5), (176, 13, 0, 'c7', 88.0), (177, 20, 1, 'c8', 88.5), (178, 27, 2, 'c9', 89.0), (179, 34, 3, 'c10', 89.5), (180, 41, 4, 'c11', 90.0), (181, 48, 5, 'c12', 90.5), (182, 2, 6, 'c0', 91.0), (183, 9, 7, 'c1', 91.5), (184, 16, 8, 'c2', 92.0), (185, 23, 9, 'c3', 92.5), (186, 30, 10, 'c4', 93.0), (187, 37, 0, 'c5', 93.5), (188, 44, 1, 'c6', 94.0), (189, 51, 2, 'c7', 94.5), (190, 5, 3, 'c8', 95.0), (191, 12, 4, 'c9', 95.5), (192, 19, 5, 'c10', 96.0), (193, 26, 6, 'c11', 96.5), (194, 33, 7, 'c12', 97.0), (195, 40, 8, 'c0', 97.5), (196, 47, 9, 'c1', 98.0), (197, 1, 10, 'c2', 98.5), (198, 8, 0, 'c3', 99.0), (199, 15, 1, 'c4', 99.5), (200, 22, 2, 'c5', 100.0), (201, 29, 3, 'c6', 100.5), (202, 36, 4, 'c7', 101.0), (203, 43, 5, 'c8', 101.5), (204, 50, 6, 'c9', 102.0), (205, 4, 7, 'c10', 102.5), (206, 11, 8, 'c11', 103.0), (207, 18, 9, 'c12', 103.5), (208, 25, 10, 'c0', 104.0), (209, 32, 0, 'c1', 104.5), (210, 39, 1, 'c2', 105.0), (211, 46, 2, 'c3', 105.5), (212, 0, 3, 'c4', 106.0), (213, 7, 4, 'c5', 106.5), (214, 14, 5, 'c6', 107.0), (215, 21, 6, 'c7', 107.5), (216, 28, 7, 'c8', 108.0), (217, 35, 8, 'c9', 108.5), (218, 42, 9, 'c10', 109.0), (219, 49, 10, 'c11', 109.5), (220, 3, 0, 'c12', 110.0), (221, 10, 1, 'c0', 110.5), (222, 17, 2, 'c1', 111.0), (223, 24, 3, 'c2', 111.5), (224, 31, 4, 'c3', 112.0), (225, 38, 5, 'c4', 112.5), (226, 45, 6, 'c5', 113.0), (227, 52, 7, 'c6', 113.5), (228, 6, 8, 'c7', 114.0), (229, 13, 9, 'c8', 114.5), (230, 20, 10, 'c9', 115.0), (231, 27, 0, 'c10', 115.5), (232, 34, 1, 'c11', 116.0), (233, 41, 2, 'c12', 116.5), (234, 48, 3, 'c0', 117.0), (235, 2, 4, 'c1', 117.5), (236, 9, 5, 'c2', 118.0), (237, 16, 6, 'c3', 118.5), (238, 23, 7, 'c4', 119.0), (239, 30, 8, 'c5', 119.5), (240, 37, 9, 'c6', 120.0), (241, 44, 10, 'c7', 120.5), (242, 51, 0, 'c8', 121.0), (243, 5, 1, 'c9', 121.5), (244, 12, 2, 'c10', 122.0), (245, 19, 3, 'c11', 122.5), (246, 26, 4, 'c12', 123.0), (247, 33, 5, 'c0', 123.5), (248, 40, 6, 'c1', 124.0), (249, 47, 7, 'c2', 124.5), (250, 1, 8, 'c3', 125.0), (251, 8, 9, 'c4', 125.5), (252, 15, 10, 'c5', 126.0), (253, 22, 0, 'c6', 126.5), (254, 29, 1, 'c7', 127.0), (255, 36, 2, 'c8', 127.5), (256, 43, 3, 'c9', 128.0), (257, 50, 4, 'c10', 128.5), (258, 4, 5, 'c11', 129.0), (259, 11, 6, 'c12', 129.5), (260, 18, 7, 'c0', 130.0), (261, 25, 8, 'c1', 130.5), (262, 32, 9, 'c2', 131.0), (263, 39, 10, 'c3', 131.5), (264, 46, 0, 'c4', 132.0), (265, 0, 1, 'c5', 132.5), (266, 7, 2, 'c6', 133.0), (267, 14, 3, 'c7', 133.5), (268, 21, 4, 'c8', 134.0), (269, 28, 5, 'c9', 134.5), (270, 35, 6, 'c10', 135.0), (271, 42, 7, 'c11', 135.5), (272, 49, 8, 'c12', 136.0), (273, 3, 9, 'c0', 136.5), (274, 10, 10, 'c1', 137.0), (275, 17, 0, 'c2', 137.5), (276, 24, 1, 'c3', 138.0), (277, 31, 2, 'c4', 138.5), (278, 38, 3, 'c5', 139.0), (279, 45, 4, 'c6', 139.5), (280, 52, 5, 'c7', 140.0), (281, 6, 6, 'c8', 140.5), (282, 13, 7, 'c9', 141.0), (283, 20, 8, 'c10', 141.5), (284, 27, 9, 'c11', 142.0), (285, 34, 10, 'c12', 142.5), (286, 41, 0, 'c0', 143.0), (287, 48, 1, 'c1', 143.5), (288, 2, 2, 'c2', 144.0), (289, 9, 3, 'c3', 144.5), (290, 16, 4, 'c4', 145.0), (291, 23, 5, 'c5', 145.5), (292, 30, 6, 'c6', 146.0), (293, 37, 7, 'c7', 146.5), (294, 44, 8, 'c8', 147.0), (295, 51, 9, 'c9', 147.5), (296, 5, 10, 'c10', 148.0), (297, 12, 0, 'c11', 148.5), (298, 19, 1, 'c12', 149.0), (299, 26, 2, 'c0', 149.5), (300, 33, 3, 'c1', 150.0), (301, 40, 4, 'c2', 150.5), (302, 47, 5, 'c3', 151.0), (303, 1, 6, 'c4', 151.5), (304, 8, 7, 'c5', 152.0), (305, 15, 8, 'c6', 152.5), (306, 22, 9, 'c7', 153.0), (307, 29, 10, 'c8', 153.5), (308, 36, 0, 'c9', 154.0), (309, 43, 1, 'c10', 154.5), (310, 50, 2, 'c11', 155.0), (311, 4, 3, 'c12', 155.5), (312, 11, 4, 'c0', 156.0), (313, 18, 5, 'c1', 156.5), (314, 25, 6, 'c2', 157.0), (315, 32, 7, 'c3', 157.5), (316, 39, 8, 'c4', 158.0), (317, 46, 9, 'c5', 158.5), (318, 0, 10, 'c6', 159.0), (319, 7, 0, 'c7', 159.5), (320, 14, 1, 'c8', 160.0), (321, 21, 2, 'c9', 160.5), (322, 28, 3, 'c10', 161.0), (323, 35, 4, 'c11', 161.5), (324, 42, 5, 'c12', 162.0), (325, 49, 6, 'c0', 162.5), (326, 3, 7, 'c1', 163.0), (327, 10, 8, 'c2', 163.5), (328, 17, 9, 'c3', 164.0), (329, 24, 10, 'c4', 164.5), (330, 31, 0, 'c5', 165.0), (331, 38, 1, 'c6', 165.5), (332, 45, 2, 'c7', 166.0), (333, 52, 3, 'c8', 166.5), (334, 6, 4, 'c9', 167.0), (335, 13, 5, 'c10', 167.5), (336, 20, 6, 'c11', 168.0), (337, 27, 7, 'c12', 168.5), (338, 34, 8, 'c0', 169.0), (339, 41, 9, 'c1', 169.5), (340, 48, 10, 'c2', 170.0), (341, 2, 0, 'c3', 170.5), (342, 9, 1, 'c4', 171.0), (343, 16, 2, 'c5', 171.5), (344, 23, 3, 'c6', 172.0), (345, 30, 4, 'c7', 172.5), (346, 37, 5, 'c8', 173.0), (347, 44, 6, 'c9', 173.5), (348, 51, 7, 'c10', 174.0), (349, 5, 8, 'c11', 174.5), (350, 12, 9, 'c12', 175.0), (351, 19, 10, 'c0', 175.5), (352, 26, 0, 'c1', 176.0), (353, 33, 1, 'c2', 176.5), (354, 40, 2, 'c3', 177.0), (355, 47, 3, 'c4', 177.5), (356, 1, 4, 'c5', 178.0), (357, 8, 5, 'c6', 178.5), (358, 15, 6, 'c7', 179.0), (359, 22, 7, 'c8', 179.5), (360, 29, 8, 'c9', 180.0), (361, 36, 9, 'c10', 180.5), (362, 43, 10, 'c11', 181.0), (363, 50, 0, 'c12', 181.5), (364, 4, 1, 'c0', 182.0), (365, 11, 2, 'c1', 182.5), (366, 18, 3, 'c2', 183.0), (367, 25, 4, 'c3', 183.5), (368, 32, 5, 'c4', 184.0), (369, 39, 6, 'c5', 184.5), (370, 46, 7, 'c6', 185.0), (371, 0, 8, 'c7', 185.5), (372, 7, 9, 'c8', 186.0), (373, 14, 10, 'c9', 186.5), (374, 21, 0, 'c10', 187.0), (375, 28, 1, 'c11', 187.5), (376, 35, 2, 'c12', 188.0), (377, 42, 3, 'c0', 188.5), (378, 49, 4, 'c1', 189.0), (379, 3, 5, 'c2', 189.5), (380, 10, 6, 'c3', 190.0), (381, 17, 7, 'c4', 190.5), (382, 24, 8, 'c5', 191.0), (383, 31, 9, 'c6', 191.5), (384, 38, 10, 'c7', 192.0), (385, 45, 0, 'c8', 192.5), (386, 52, 1, 'c9', 193.0), (387, 6, 2, 'c10', 193.5), (388, 13, 3, 'c11', 194.0), (389, 20, 4, 'c12', 194.5), (390, 27, 5, 'c0', 195.0), (391, 34, 6, 'c1', 195.5), (392, 41, 7, 'c2', 196.0), (393, 48, 8, 'c3', 196.5), (394, 2, 9, 'c4', 197.0), (395, 9, 10, 'c5', 197.5), (396, 16, 0, 'c6', 198.0), (397, 23, 1, 'c7', 198.5), (398, 30, 2, 'c8', 199.0), (399, 37, 3, 'c9', 199.5);
+CREATE INDEX ON R(B) INCLUDE (D);
+CREATE INDEX ON R(C, B) INCLUDE (E);
+SELECT B, D FROM R WHERE B = 17;
+SELECT R.A, R.B, R.D FROM R WHERE B >= 10 AND B < 13;
+SELECT B, D, E FROM R WHERE B = 5;
+SELECT C, B, E FROM R WHERE C = 3 AND B > 40;
+SELECT R.A, R.C, R.E FROM R WHERE C = 7;
+SELECT B, D, COUNT(*) FROM R WHERE B < 5 GROUP BY B, D;
+CREATE TABLE S(K INT, X INT, Y VARCHAR, PRIMARY KEY(K));
+INSERT INTO S VALUES (0, 0, 's0'), (1, 1, 's1'), (2, 2, 's2'), (3, 3, 's3'), (4, 4, 's4'), (5, 5, 's5'), (6, 6, 's6'), (7, 7, 's0'), (8, 8, 's1'), (9, 9, 's2'), (10, 10, 's3'), (11, 11, 's4'), (12, 12, 's5'), (13, 13, 's6'), (14, 14, 's0'), (15, 15, 's1'), (16, 16, 's2'), (17, 17, 's3'), (18, 18, 's4'), (19, 19, 's5'), (20, 20, 's6'), (21, 21, 's0'), (22, 22, 's1'), (23, 23, 's2'), (24, 24, 's3'), (25, 25, 's4'), (26, 26, 's5'), (27, 27, 's6'), (28, 28, 's0'), (29, 0, 's1'), (30, 1, 's2'), (31, 2, 's3'), (32, 3, 's4'), (33, 4, 's5'), (34, 5, 's6'), (35, 6, 's0'), (36, 7, 's1'), (37, 8, 's2'), (38, 9, 's3'), (39, 10, 's4'), (40, 11, 's5'), (41, 12, 's6'), (42, 13, 's0'), (43, 14, 's1'), (44, 15, 's2'), (45, 16, 's3'), (46, 17, 's4'), (47, 18, 's5'), (48, 19, 's6'), (49, 20, 's0'), (50, 21, 's1'), (51, 22, 's2'), (52, 23, 's3'), (53, 24, 's4'), (54, 25, 's5'), (55, 26, 's6'), (56, 27, 's0'), (57, 28, 's1'), (58, 0, 's2'), (59, 1, 's3'), (60, 2, 's4'), (61, 3, 's5'), (62, 4, 's6'), (63, 5, 's0'), (64, 6, 's1'), (65, 7, 's2'), (66, 8, 's3'), (67, 9, 's4'), (68, 10, 's5'), (69, 11, 's6'), (70, 12, 's0'), (71, 13, 's1'), (72, 14, 's2'), (73, 15, 's3'), (74, 16, 's4'), (75, 17, 's5'), (76, 18, 's6'), (77, 19, 's0'), (78, 20, 's1'), (79, 21, 's2'), (80, 22, 's3'), (81, 23, 's4'), (82, 24, 's5'), (83, 25, 's6'), (84, 26, 's0'), (85, 27, 's1'), (86, 28, 's2'), (87, 0, 's3'), (88, 1, 's4'), (89, 2, 's5'), (90, 3, 's6'), (91, 4, 's0'), (92, 5, 's1'), (93, 6, 's2'), (94, 7, 's3'), (95, 8, 's4'), (96, 9, 's5'), (97, 10, 's6'), (98, 11, 's0'), (99, 12, 's1'), (100, 13, 's2'), (101, 14, 's3'), (102, 15, 's4'), (103, 16, 's5'), (104, 17, 's6'), (105, 18, 's0'), (106, 19, 's1'), (107, 20, 's2'), (108, 21, 's3'), (109, 22, 's4'), (110, 23, 's5'), (111, 24, 's6'), (112, 25, 's0'), (113, 26, 's1'), (114, 27, 's2'), (115, 28, 's3'), (116, 0, 's4'), (117, 1, 's5'), (118, 2, 's6'), (119, 3, 's0'), (120, 4, 's1'), (121, 5, 's2'), (122, 6, 's3'), (123, 7, 's4'), (124, 8, 's5'), (125, 9, 's6'), (126, 10, 's0'), (127, 11, 's1'), (128, 12, 's2'), (129, 13, 's3'), (130, 14, 's4'), (131, 15, 's5'), (132, 16, 's6'), (133, 17, 's0'), (134, 18, 's1'), (135, 19, 's2'), (136, 20, 's3'), (137, 21, 's4'), (138, 22, 's5'), (139, 23, 's6'), (140, 24, 's0'), (141, 25, 's1'), (142, 26, 's2'), (143, 27, 's3'), (144, 28, 's4'), (145, 0, 's5'), (146, 1, 's6'), (147, 2, 's0'), (148, 3, 's1'), (149, 4, 's2'), (150, 5, 's3'), (151, 6, 's4'), (152, 7, 's5'), (153, 8, 's6'), (154, 9, 's0'), (155, 10, 's1'), (156, 11, 's2'), (157, 12, 's3'), (158, 13, 's4'), (159, 14, 's5'), (160, 15, 's6'), (161, 16, 's0'), (162, 17, 's1'), (163, 18, 's2'), (164, 19, 's3'), (165, 20, 's4'), (166, 21, 's5'), (167, 22, 's6'), (168, 23, 's0'), (169, 24, 's1'), (170, 25, 's2'), (171, 26, 's3'), (172, 27, 's4'), (173, 28, 's5'), (174, 0, 's6'), (175, 1, 's0'), (176, 2, 's1'), (177, 3, 's2'), (178, 4, 's3'), (179, 5, 's4'), (180, 6, 's5'), (181, 7, 's6'), (182, 8, 's0'), (183, 9, 's1'), (184, 10, 's2'), (185, 11, 's3'), (186, 12, 's4'), (187, 13, 's5'), (188, 14, 's6'), (189, 15, 's0'), (190, 16, 's1'), (191, 17, 's2'), (192, 18, 's3'), (193, 19, 's4'), (194, 20, 's5'), (195, 21, 's6'), (196, 22, 's0'), (197, 23, 's1'), (198, 24, 's2'), (199, 25, 's3');
+CREATE INDEX ON S(X) INCLUDE (Y);
+SELECT S.X, S.Y FROM R, S WHERE R.B = S.X AND R.A < 30;
+SELECT S.K, S.X, S.Y FROM S WHERE X = 4;
+INSERT INTO R VALUES (1000, 17, 3, 'new', 99.5), (1001, 45, 3, 'newer', 0.25);
+DELETE FROM R WHERE D = 'c5';
+DELETE FROM R WHERE A < 50;
+DELETE FROM S WHERE K < 40;
+INSERT INTO S VALUES (500, 4, 'added'), (501, 17, 'added');
+SELECT B, D FROM R WHERE B = 17;
+SELECT C, B, E FROM R WHERE C = 3 AND B > 40;
+SELECT S.K, S.X, S.Y FROM S WHERE X = 4;
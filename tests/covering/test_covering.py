@@ -0,0 +1,36 @@
+import pytest
+import subprocess
+
+from ddb.planner.baseline import BaselinePlanner
+
+testcase_dir = "tests/covering/"
+T = 1
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_covering_{t_id}")
+
+@pytest.mark.parametrize("query,covered", [
+    ("SELECT B, D FROM R WHERE B = 17;", True),
+    ("SELECT R.A, R.B, R.D FROM R WHERE B = 17;", False),
+    ("SELECT C, B, E FROM R WHERE C = 3 AND B > 40;", True),
+    ("SELECT R.A, R.C FROM R WHERE C = 3 AND B > 40;", False),
+])
+def test_base_table_fetch(run, monkeypatch, query, covered):
+    # the rest of the row is retrieved from the base table only if the index does not store all columns needed:
+    subprocess.run(['make', 'clean'], check=True)
+    for r in run('CREATE TABLE R(A INT, B INT, C INT, D VARCHAR, E FLOAT);' +
+                 'INSERT INTO R VALUES ' + ', '.join(f"({i}, {i*7%53}, {i%11}, 'c{i%13}', {i*0.5})" for i in range(400)) + ';' +
+                 'CREATE INDEX ON R(B) INCLUDE (D);' +
+                 'CREATE INDEX ON R(C, B) INCLUDE (E);'):
+        assert r.error is None, r.error_details
+    fetches = list()
+    retrieve_base_by_key = BaselinePlanner.retrieve_base_by_key
+    def counting_retrieve_base_by_key(cls, *args):
+        fetches.append(args)
+        return retrieve_base_by_key(*args)
+    monkeypatch.setattr(BaselinePlanner, 'retrieve_base_by_key', classmethod(counting_retrieve_base_by_key))
+    r, = run(query)
+    assert r.error is None, r.error_details
+    assert r.response.startswith('SELECT 8')
+    assert (len(fetches) == 0) == covered
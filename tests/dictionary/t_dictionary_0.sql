@@ -0,0 +1,18 @@
+CREATE TABLE R(A INT, CITY VARCHAR, NOTE VARCHAR, TAG VARCHAR) WITH (dictionary='city, tag', zone_map=on);
+INSERT INTO R VALUES (0, 'Durham', 'n0', 'tag0'), (1, 'Raleigh', 'n1', 'tag1'), (2, 'Cary', 'n2', 'tag2'), (3, 'Apex', 'n3', 'tag0'), (4, 'Zebulon', 'n4', 'tag1'), (5, 'Chapel Hill', 'n5', 'tag2'), (6, 'Wake Forest', 'n6', 'tag0'), (7, 'Durham', 'n7', 'tag1'), (8, 'Raleigh', 'n8', 'tag2'), (9, 'Cary', 'n9', 'tag0'), (10, 'Apex', 'n10', 'tag1'), (11, 'Zebulon', 'n11', 'tag2'), (12, 'Chapel Hill', 'n12', 'tag0'), (13, 'Wake Forest', 'n13', 'tag1'), (14, 'Durham', 'n14', 'tag2'), (15, 'Raleigh', 'n15', 'tag0'), (16, 'Cary', 'n16', 'tag1'), (17, 'Apex', 'n17', 'tag2'), (18, 'Zebulon', 'n18', 'tag0'), (19, 'Chapel Hill', 'n19', 'tag1'), (20, 'Wake Forest', 'n20', 'tag2'), (21, 'Durham', 'n21', 'tag0'), (22, 'Raleigh', 'n22', 'tag1'), (23, 'Cary', 'n23', 'tag2'), (24, 'Apex', 'n24', 'tag0'), (25, 'Zebulon', 'n25', 'tag1'), (26, 'Chapel Hill', 'n26', 'tag2'), (27, 'Wake Forest', 'n27', 'tag0'), (28, 'Durham', 'n28', 'tag1'), (29, 'Raleigh', 'n29', 'tag2'), (30, 'Cary', 'n30', 'tag0'), (31, 'Apex', 'n31', 'tag1'), (32, 'Zebulon', 'n32', 'tag2'), (33, 'Chapel Hill', 'n33', 'tag0'), (34, 'Wake Forest', 'n34', 'tag1'), (35, 'Durham', 'n35', 'tag2'), (36, 'Raleigh', 'n36', 'tag0'), (37, 'Cary', 'n37', 'tag1'), (38, 'Apex', 'n38', 'tag2'), (39, 'Zebulon', 'n39', 'tag0'), (40, 'Chapel Hill', 'n40', 'tag1'), (41, 'Wake Forest', 'n41', 'tag2'), (42, 'Durham', 'n42', 'tag0'), (43, 'Raleigh', 'n43', 'tag1'), (44, 'Cary', 'n44', 'tag2'), (45, 'Apex', 'n45', 'tag0'), (46, 'Zebulon', 'n46', 'tag1'), (47, 'Chapel Hill', 'n47', 'tag2'), (48, 'Wake Forest', 'n48', 'tag0'), (49, 'Durham', 'n49', 'tag1'), (50, 'Raleigh', 'n50', 'tag2'), (51, 'Cary', 'n51', 'tag0'), (52, 'Apex', 'n52', 'tag1'), (53, 'Zebulon', 'n53', 'tag2'), (54, 'Chapel Hill', 'n54', 'tag0'), (55, 'Wake Forest', 'n55', 'tag1'), (56, 'Durham', 'n56', 'tag2'), (57, 'Raleigh', 'n57', 'tag0'), (58, 'Cary', 'n58', 'tag1'), (59, 'Apex', 'n59', 'tag2'), (60, 'Zebulon', 'n60', 'tag0'), (61, 'Chapel Hill', 'n61', 'tag1'), (62, 'Wake Forest', 'n62', 'tag2'), (63, 'Durham', 'n63', 'tag0'), (64, 'Raleigh', 'n64', 'tag1'), (65, 'Cary', 'n65', 'tag2'), (66, 'Apex', 'n66', 'tag0'), (67, 'Zebulon', 'n67', 'tag1'), (68, 'Chapel Hill', 'n68', 'tag2'), (69, 'Wake Forest', 'n69', 'tag0'), (70, 'Durham', 'n70', 'tag1'), (71, 'Raleigh', 'n71', 'tag2'), (72, 'Cary', 'n72', 'tag0'), (73, 'Apex', 'n73', 'tag1'), (74, 'Zebulon', 'n74', 'tag2'), (75, 'Chapel Hill', 'n75', 'tag0'), (76, 'Wake Forest', 'n76', 'tag1'), (77, 'Durham', 'n77', 'tag2'), (78, 'Raleigh', 'n78', 'tag0'), (79, 'Cary', 'n79', 'tag1'), (80, 'Apex', 'n80', 'tag2'), (81, 'Zebulon', 'n81', 'tag0'), (82, 'Chapel Hill', 'n82', 'tag1'), (83, 'Wake Forest', 'n83', 'tag2'), (84, 'Durham', 'n84', 'tag0'), (85, 'Raleigh', 'n85', 'tag1'), (86, 'Cary', 'n86', 'tag2'), (87, 'Apex', 'n87', 'tag0'), (88, 'Zebulon', 'n88', 'tag1'), (89, 'Chapel Hill', 'n89', 'tag2'), (90, 'Wake Forest', 'n90', 'tag0'), (91, 'Durham', 'n91', 'tag1'), (92, 'Raleigh', 'n92', 'tag2'), (93, 'Cary', 'n93', 'tag0'), (94, 'Apex', 'n94', 'tag1'), (95, 'Zebulon', 'n95', 'tag2'), (96, 'Chapel Hill', 'n96', 'tag0'), (97, 'Wake Forest', 'n97', 'tag1'), (98, 'Durham', 'n98', 'tag2'), (99, 'Raleigh', 'n99', 'tag0'), (100, 'Cary', 'n100', 'tag1'), (101, 'Apex', 'n101', 'tag2'), (102, 'Zebulon', 'n102', 'tag0'), (103, 'Chapel Hill', 'n103', 'tag1'), (104, 'Wake Forest', 'n104', 'tag2'), (105, 'Durham', 'n105', 'tag0'), (106, 'Raleigh', 'n106', 'tag1'), (107, 'Cary', 'n107', 'tag2'), (108, 'Apex', 'n108', 'tag0'), (109, 'Zebulon', 'n109', 'tag1'), (110, 'Chapel Hill', 'n110', 'tag2'), (111, 'Wake Forest', 'n111', 'tag0'), (112, 'Durham', 'n112', 'tag1'), (113, 'Raleigh', 'n113', 'tag2'), (114, 'Cary', 'n114', 'tag0'), (115, 'Apex', 'n115', 'tag1'), (116, 'Zebulon', 'n116', 'tag2'), (117, 'Chapel Hill', 'n117', 'tag0'), (118, 'Wake Forest', 'n118', 'tag1'), (119, 'Durham', 'n119', 'tag2'), (120, 'Raleigh', 'n120', 'tag0'), (121, 'Cary', 'n121', 'tag1'), (122, 'Apex', 'n122', 'tag2'), (123, 'Zebulon', 'n123', 'tag0'), (124, 'Chapel Hill', 'n124', 'tag1'), (125, 'Wake Forest', 'n125', 'tag2'), (126, 'Durham', 'n126', 'tag0'), (127, 'Raleigh', 'n127', 'tag1'), (128, 'Cary', 'n128', 'tag2'), (129, 'Apex', 'n129', 'tag0'), (130, 'Zebulon', 'n130', 'tag1'), (131, 'Chapel Hill', 'n131', 'tag2'), (132, 'Wake Forest', 'n132', 'tag0'), (133, 'Durham', 'n133', 'tag1'), (134, 'Raleigh', 'n134', 'tag2'), (135, 'Cary', 'n135', 'tag0'), (136, 'Apex', 'n136', 'tag1'), (137, 'Zebulon', 'n137', 'tag2'), (138, 'Chapel Hill', 'n138', 'tag0'), (139, 'Wake Forest', 'n139', 'tag1'), (140, 'Durham', 'n140', 'tag2'), (141, 'Raleigh', 'n141', 'tag0'), (142, 'Cary', 'n142', 'tag1'), (143, 'Apex', 'n143', 'tag2'), (144, 'Zebulon', 'n144', 'tag0'), (145, 'Chapel Hill', 'n145', 'tag1'), (146, 'Wake Forest', 'n146', 'tag2'), (147, 'Durham', 'n147', 'tag0'), (148, 'Raleigh', 'n148', 'tag1'), (149, 'Cary', 'n149', 'tag2'), (150, 'Apex', 'n150', 'tag0'), (151, 'Zebulon', 'n151', 'tag1'), (152, 'Chapel Hill', 'n152', 'tag2'), (153, 'Wake Forest', 'n153', 'tag0'), (154, 'Durham', 'n154', 'tag1'), (155, 'Raleigh', 'n155', 'tag2'), (156, 'Cary', 'n156', 'tag0'), (157, 'Apex', 'n157', 'tag1'), (158, 'Zebulon', 'n158', 'tag2'), (159, 'Chapel Hill', 'n159', 'tag0'), (160, 'Wake Forest', 'n160', 'tag1'), (161, 'Durham', 'n161', 'tag2'), (162, 'Raleigh', 'n162', 'tag0'), (163, 'Cary', 'n163', 'tag1'), (164, 'Apex', 'n164', 'tag2'), (165, 'Zebulon', 'n165', 'tag0'), (166, 'Chapel Hill', 'n166', 'tag1'), (167, 'Wake Forest', 'n167', 'tag2'), (168, 'Durham', 'n168', 'tag0'), (169, 'Raleigh', 'n169', 'tag1'), (170, 'Cary', 'n170', 'tag2'), (171, 'Apex', 'n171', 'tag0'), (172, 'Zebulon', 'n172', 'tag1'), (173, 'Chapel Hill', 'n173', 'tag2'), (174, 'Wake Forest', 'n174', 'tag0'), (175, 'Durham', 'n175', 'tag1'), (176, 'Raleigh', 'n176', 'tag2'), (177, 'Cary', 'n177', 'tag0'), (178, 'Apex', 'n178', 'tag1'), (179, 'Zebulon', 'n179', 'tag2'), (180, 'Chapel Hill', 'n180', 'tag0'), (181, 'Wake Forest', 'n181', 'tag1'), (182, 'Durham', 'n182', 'tag2'), (183, 'Raleigh', 'n183', 'tag0'), (184, 'Cary', 'n184', 'tag1'), (185, 'Apex', 'n185', 'tag2'), (186, 'Zebulon', 'n186', 'tag0'), (187, 'Chapel Hill', 'n187', 'tag1'), (188, 'Wake Forest', 'n188', 'tag2'), (189, 'Durham', 'n189', 'tag0'), (190, 'Raleigh', 'n190', 'tag1'), (191, 'Cary', 'n191', 'tag2'), (192, 'Apex', 'n192', 'tag0'), (193, 'Zebulon', 'n193', 'tag1'), (194, 'Chapel Hill', 'n194', 'tag2'), (195, 'Wake Forest', 'n195', 'tag0'), (196, 'Durham', 'n196', 'tag1'), (197, 'Raleigh', 'n197', 'tag2'), (198, 'Cary', 'n198', 'tag0'), (199, 'Apex', 'n199', 'tag1'), (200, 'Zebulon', 'n200', 'tag2'), (201, 'Chapel Hill', 'n201', 'tag0'), (202, 'Wake Forest', 'n202', 'tag1'), (203, 'Durham', 'n203', 'tag2'), (204, 'Raleigh', 'n204', 'tag0'), (205, 'Cary', 'n205', 'tag1'), (206, 'Apex', 'n206', 'tag2'), (207, 'Zebulon', 'n207', 'tag0'), (208, 'Chapel Hill', 'n208', 'tag1'), (209, 'Wake Forest', 'n209', 'tag2'), (210, 'Durham', 'n210', 'tag0'), (211, 'Raleigh', 'n211', 'tag1'), (212, 'Cary', 'n212', 'tag2'), (213, 'Apex', 'n213', 'tag0'), (214, 'Zebulon', 'n214', 'tag1'), (215, 'Chapel Hill', 'n215', 'tag2'), (216, 'Wake Forest', 'n216', 'tag0'), (217, 'Durham', 'n217', 'tag1'), (218, 'Raleigh', 'n218', 'tag2'), (219, 'Cary', 'n219', 'tag0'), (220, 'Apex', 'n220', 'tag1'), (221, 'Zebulon', 'n221', 'tag2'), (222, 'Chapel Hill', 'n222', 'tag0'), (223, 'Wake Forest', 'n223', 'tag1'), (224, 'Durham', 'n224', 'tag2'), (225, 'Raleigh', 'n225', 'tag0'), (226, 'Cary', 'n226', 'tag1'), (227, 'Apex', 'n227', 'tag2'), (228, 'Zebulon', 'n228', 'tag0'), (229, 'Chapel Hill', 'n229', 'tag1'), (230, 'Wake Forest', 'n230', 'tag2'), (231, 'Durham', 'n231', 'tag0'), (232, 'Raleigh', 'n232', 'tag1'), (233, 'Cary', 'n233', 'tag2'), (234, 'Apex', 'n234', 'tag0'), (235, 'Zebulon', 'n235', 'tag1'), (236, 'Chapel Hill', 'n236', 'tag2'), (237, 'Wake Forest', 'n237', 'tag0'), (238, 'Durham', 'n238', 'tag1'), (239, 'Raleigh', 'n239', 'tag2'), (240, 'Cary', 'n240', 'tag0'), (241, 'Apex', 'n241', 'tag1'), (242, 'Zebulon', 'n242', 'tag2'), (243, 'Chapel Hill', 'n243', 'tag0'), (244, 'Wake Forest', 'n244', 'tag1'), (245, 'Durham', 'n245', 'tag2'), (246, 'Raleigh', 'n246', 'tag0'), (247, 'Cary', 'n247', 'tag1'), (248, 'Apex', 'n248', 'tag2'), (249, 'Zebulon', 'n249', 'tag0'), (250, 'Chapel Hill', 'n250', 'tag1'), (251, 'Wake Forest', 'n251', 'tag2'), (252, 'Durham', 'n252', 'tag0'), (253, 'Raleigh', 'n253', 'tag1'), (254, 'Cary', 'n254', 'tag2'), (255, 'Apex', 'n255', 'tag0'), (256, 'Zebulon', 'n256', 'tag1'), (257, 'Chapel Hill', 'n257', 'tag2'), (258, 'Wake Forest', 'n258', 'tag0'), (259, 'Durham', 'n259', 'tag1'), (260, 'Raleigh', 'n260', 'tag2'), (261, 'Cary', 'n261', 'tag0'), (262, 'Apex', 'n262', 'tag1'), (263, 'Zebulon', 'n263', 'tag2'), (264, 'Chapel Hill', 'n264', 'tag0'), (265, 'Wake Forest', 'n265', 'tag1'), (266, 'Durham', 'n266', 'tag2'), (267, 'Raleigh', 'n267', 'tag0'), (268, 'Cary', 'n268', 'tag1'), (269, 'Apex', 'n269', 'tag2'), (270, 'Zebulon', 'n270', 'tag0'), (271, 'Chapel Hill', 'n271', 'tag1'), (272, 'Wake Forest', 'n272', 'tag2'), (273, 'Durham', 'n273', 'tag0'), (274, 'Raleigh', 'n274', 'tag1'), (275, 'Cary', 'n275', 'tag2'), (276, 'Apex', 'n276', 'tag0'), (277, 'Zebulon', 'n277', 'tag1'), (278, 'Chapel Hill', 'n278', 'tag2'), (279, 'Wake Forest', 'n279', 'tag0'), (280, 'Durham', 'n280', 'tag1'), (281, 'Raleigh', 'n281', 'tag2'), (282, 'Cary', 'n282', 'tag0'), (283, 'Apex', 'n283', 'tag1'), (284, 'Zebulon', 'n284', 'tag2'), (285, 'Chapel Hill', 'n285', 'tag0'), (286, 'Wake Forest', 'n286', 'tag1'), (287, 'Durham', 'n287', 'tag2'), (288, 'Raleigh', 'n288', 'tag0'), (289, 'Cary', 'n289', 'tag1'), (290, 'Apex', 'n290', 'tag2'), (291, 'Zebulon', 'n291', 'tag0'), (292, 'Chapel Hill', 'n292', 'tag1'), (293, 'Wake Forest', 'n293', 'tag2'), (294, 'Durham', 'n294', 'tag0'), (295, 'Raleigh', 'n295', 'tag1'), (296, 'Cary', 'n296', 'tag2'), (297, 'Apex', 'n297', 'tag0'), (298, 'Zebulon', 'n298', 'tag1'), (299, 'Chapel Hill', 'n299', 'tag2'), (300, 'Wake Forest', 'n300', 'tag0'), (301, 'Durham', 'n301', 'tag1'), (302, 'Raleigh', 'n302', 'tag2'), (303, 'Cary', 'n303', 'tag0'), (304, 'Apex', 'n304', 'tag1'), (305, 'Zebulon', 'n305', 'tag2'), (306, 'Chapel Hill', 'n306', 'tag0'), (307, 'Wake Forest', 'n307', 'tag1'), (308, 'Durham', 'n308', 'tag2'), (309, 'Raleigh', 'n309', 'tag0'), (310, 'Cary', 'n310', 'tag1'), (311, 'Apex', 'n311', 'tag2'), (312, 'Zebulon', 'n312', 'tag0'), (313, 'Chapel Hill', 'n313', 'tag1'), (314, 'Wake Forest', 'n314', 'tag2'), (315, 'Durham', 'n315', 'tag0'), (316, 'Raleigh', 'n316', 'tag1'), (317, 'Cary', 'n317', 'tag2'), (318, 'Apex', 'n318', 'tag0'), (319, 'Zebulon', 'n319', 'tag1'), (320, 'Chapel Hill', 'n320', 'tag2'), (321, 'Wake Forest', 'n321', 'tag0'), (322, 'Durham', 'n322', 'tag1'), (323, 'Raleigh', 'n323', 'tag2'), (324, 'Cary', 'n324', 'tag0'), (325, 'Apex', 'n325', 'tag1'), (326, 'Zebulon', 'n326', 'tag2'), (327, 'Chapel Hill', 'n327', 'tag0'), (328, 'Wake Forest', 'n328', 'tag1'), (329, 'Durham', 'n329', 'tag2'), (330, 'Raleigh', 'n330', 'tag0'), (331, 'Cary', 'n331', 'tag1'), (332, 'Apex', 'n332', 'tag2'), (333, 'Zebulon', 'n333', 'tag0'), (334, 'Chapel Hill', 'n334', 'tag1'), (335, 'Wake Forest', 'n335', 'tag2'), (336, 'Durham', 'n336', 'tag0'), (337, 'Raleigh', 'n337', 'tag1'), (338, 'Cary', 'n338', 'tag2'), (339, 'Apex', 'n339', 'tag0'), (340, 'Zebulon', 'n340', 'tag1'), (341, 'Chapel Hill', 'n341', 'tag2'), (342, 'Wake Forest', 'n342', 'tag0'), (343, 'Durham', 'n343', 'tag1'), (344, 'Raleigh', 'n344', 'tag2'), (345, 'Cary', 'n345', 'tag0'), (346, 'Apex', 'n346', 'tag1'), (347, 'Zebulon', 'n347', 'tag2'), (348, 'Chapel Hill', 'n348', 'tag0'), (349, 'Wake Forest', 'n349', 'tag1'), (350, 'Durham', 'n350', 'tag2'), (351, 'Raleigh', 'n351', 'tag0'), (352, 'Cary', 'n352', 'tag1'), (353, 'Apex', 'n353', 'tag2'), (354, 'Zebulon', 'n354', 'tag0'), (355, 'Chapel Hill', 'n355', 'tag1'), (356, 'Wake Forest', 'n356', 'tag2'), (357, 'Durham', 'n357', 'tag0'), (358, 'Raleigh', 'n358', 'tag1'), (359, 'Cary', 'n359', 'tag2'), (360, 'Apex', 'n360', 'tag0'), (361, 'Zebulon', 'n361', 'tag1'), (362, 'Chapel Hill', 'n362', 'tag2'), (363, 'Wake Forest', 'n363', 'tag0'), (364, 'Durham', 'n364', 'tag1'), (365, 'Raleigh', 'n365', 'tag2'), (366, 'Cary', 'n366', 'tag0'), (367, 'Apex', 'n367', 'tag1'), (368, 'Zebulon', 'n368', 'tag2'), (369, 'Chapel Hill', 'n369', 'tag0'), (370, 'Wake Forest', 'n370', 'tag1'), (371, 'Durham', 'n371', 'tag2'), (372, 'Raleigh', 'n372', 'tag0'), (373, 'Cary', 'n373', 'tag1'), (374, 'Apex', 'n374', 'tag2'), (375, 'Zebulon', 'n375', 'tag0'), (376, 'Chapel Hill', 'n376', 'tag1'), (377, 'Wake Forest', 'n377', 'tag2'), (378, 'Durham', 'n378', 'tag0'), (379, 'Raleigh', 'n379', 'tag1'), (380, 'Cary', 'n380', 'tag2'), (381, 'Apex', 'n381', 'tag0'), (382, 'Zebulon', 'n382', 'tag1'), (383, 'Chapel Hill', 'n383', 'tag2'), (384, 'Wake Forest', 'n384', 'tag0'), (385, 'Durham', 'n385', 'tag1'), (386, 'Raleigh', 'n386', 'tag2'), (387, 'Cary', 'n387', 'tag0'), (388, 'Apex', 'n388', 'tag1'), (389, 'Zebulon', 'n389', 'tag2'), (390, 'Chapel Hill', 'n390', 'tag0'), (391, 'Wake Forest', 'n391', 'tag1'), (392, 'Durham', 'n392', 'tag2'), (393, 'Raleigh', 'n393', 'tag0'), (394, 'Cary', 'n394', 'tag1'), (395, 'Apex', 'n395', 'tag2'), (396, 'Zebulon', 'n396', 'tag0'), (397, 'Chapel Hill', 'n397', 'tag1'), (398, 'Wake Forest', 'n398', 'tag2'), (399, 'Durham', 'n399', 'tag0'), (400, 'Raleigh', 'n400', 'tag1'), (401, 'Cary', 'n401', 'tag2'), (402, 'Apex', 'n402', 'tag0'), (403, 'Zebulon', 'n403', 'tag1'), (404, 'Chapel Hill', 'n404', 'tag2'), (405, 'Wake Forest', 'n405', 'tag0'), (406, 'Durham', 'n406', 'tag1'), (407, 'Raleigh', 'n407', 'tag2'), (408, 'Cary', 'n408', 'tag0'), (409, 'Apex', 'n409', 'tag1'), (410, 'Zebulon', 'n410', 'tag2'), (411, 'Chapel Hill', 'n411', 'tag0'), (412, 'Wake Forest', 'n412', 'tag1'), (413, 'Durham', 'n413', 'tag2'), (414, 'Raleigh', 'n414', 'tag0'), (415, 'Cary', 'n415', 'tag1'), (416, 'Apex', 'n416', 'tag2'), (417, 'Zebulon', 'n417', 'tag0'), (418, 'Chapel Hill', 'n418', 'tag1'), (419, 'Wake Forest', 'n419', 'tag2'), (420, 'Durham', 'n420', 'tag0'), (421, 'Raleigh', 'n421', 'tag1'), (422, 'Cary', 'n422', 'tag2'), (423, 'Apex', 'n423', 'tag0'), (424, 'Zebulon', 'n424', 'tag1'), (425, 'Chapel Hill', 'n425', 'tag2'), (426, 'Wake Forest', 'n426', 'tag0'), (427, 'Durham', 'n427', 'tag1'), (428, 'Raleigh', 'n428', 'tag2'), (429, 'Cary', 'n429', 'tag0'), (430, 'Apex', 'n430', 'tag1'), (431, 'Zebulon', 'n431', 'tag2'), (432, 'Chapel Hill', 'n432', 'tag0'), (433, 'Wake Forest', 'n433', 'tag1'), (434, 'Durham', 'n434', 'tag2'), (435, 'Raleigh', 'n435', 'tag0'), (436, 'Cary', 'n436', 'tag1'), (437, 'Apex', 'n437', 'tag2'), (438, 'Zebulon', 'n438', 'tag0'), (439, 'Chapel Hill', 'n439', 'tag1'), (440, 'Wake Forest', 'n440', 'tag2'), (441, 'Durham', 'n441', 'tag0'), (442, 'Raleigh', 'n442', 'tag1'), (443, 'Cary', 'n443', 'tag2'), (444, 'Apex', 'n444', 'tag0'), (445, 'Zebulon', 'n445', 'tag1'), (446, 'Chapel Hill', 'n446', 'tag2'), (447, 'Wake Forest', 'n447', 'tag0'), (448, 'Durham', 'n448', 'tag1'), (449, 'Raleigh', 'n449', 'tag2'), (450, 'Cary', 'n450', 'tag0'), (451, 'Apex', 'n451', 'tag1'), (452, 'Zebulon', 'n452', 'tag2'), (453, 'Chapel Hill', 'n453', 'tag0'), (454, 'Wake Forest', 'n454', 'tag1'), (455, 'Durham', 'n455', 'tag2'), (456, 'Raleigh', 'n456', 'tag0'), (457, 'Cary', 'n457', 'tag1'), (458, 'Apex', 'n458', 'tag2'), (459, 'Zebulon', 'n459', 'tag0'), (460, 'Chapel Hill', 'n460', 'tag1'), (461, 'Wake Forest', 'n461', 'tag2'), (462, 'Durham', 'n462', 'tag0'), (463, 'Raleigh', 'n463', 'tag1'), (464, 'Cary', 'n464', 'tag2'), (465, 'Apex', 'n465', 'tag0'), (466, 'Zebulon', 'n466', 'tag1'), (467, 'Chapel Hill', 'n467', 'tag2'), (468, 'Wake Forest', 'n468', 'tag0'), (469, 'Durham', 'n469', 'tag1'), (470, 'Raleigh', 'n470', 'tag2'), (471, 'Cary', 'n471', 'tag0'), (472, 'Apex', 'n472', 'tag1'), (473, 'Zebulon', 'n473', 'tag2'), (474, 'Chapel Hill', 'n474', 'tag0'), (475, 'Wake Forest', 'n475', 'tag1'), (476, 'Durham', 'n476', 'tag2'), (477, 'Raleigh', 'n477', 'tag0'), (478, 'Cary', 'n478', 'tag1'), (479, 'Apex', 'n479', 'tag2'), (480, 'Zebulon', 'n480', 'tag0'), (481, 'Chapel Hill', 'n481', 'tag1'), (482, 'Wake Forest', 'n482', 'tag2'), (483, 'Durham', 'n483', 'tag0'), (484, 'Raleigh', 'n484', 'tag1'), (485, 'Cary', 'n485', 'tag2'), (486, 'Apex', 'n486', 'tag0'), (487, 'Zebulon', 'n487', 'tag1'), (488, 'Chapel Hill', 'n488', 'tag2'), (489, 'Wake Forest', 'n489', 'tag0'), (490, 'Durham', 'n490', 'tag1'), (491, 'Raleigh', 'n491', 'tag2'), (492, 'Cary', 'n492', 'tag0'), (493, 'Apex', 'n493', 'tag1'), (494, 'Zebulon', 'n494', 'tag2'), (495, 'Chapel Hill', 'n495', 'tag0'), (496, 'Wake Forest', 'n496', 'tag1'), (497, 'Durham', 'n497', 'tag2'), (498, 'Raleigh', 'n498', 'tag0'), (499, 'Cary', 'n499', 'tag1'), (500, 'Apex', 'n500', 'tag2'), (501, 'Zebulon', 'n501', 'tag0'), (502, 'Chapel Hill', 'n502', 'tag1'), (503, 'Wake Forest', 'n503', 'tag2'), (504, 'Durham', 'n504', 'tag0'), (505, 'Raleigh', 'n505', 'tag1'), (506, 'Cary', 'n506', 'tag2'), (507, 'Apex', 'n507', 'tag0'), (508, 'Zebulon', 'n508', 'tag1'), (509, 'Chapel Hill', 'n509', 'tag2'), (510, 'Wake Forest', 'n510', 'tag0'), (511, 'Durham', 'n511', 'tag1'), (512, 'Raleigh', 'n512', 'tag2'), (513, 'Cary', 'n513', 'tag0'), (514, 'Apex', 'n514', 'tag1'), (515, 'Zebulon', 'n515', 'tag2'), (516, 'Chapel Hill', 'n516', 'tag0'), (517, 'Wake Forest', 'n517', 'tag1'), (518, 'Durham', 'n518', 'tag2'), (519, 'Raleigh', 'n519', 'tag0'), (520, 'Cary', 'n520', 'tag1'), (521, 'Apex', 'n521', 'tag2'), (522, 'Zebulon', 'n522', 'tag0'), (523, 'Chapel Hill', 'n523', 'tag1'), (524, 'Wake Forest', 'n524', 'tag2'), (525, 'Durham', 'n525', 'tag0'), (526, 'Raleigh', 'n526', 'tag1'), (527, 'Cary', 'n527', 'tag2'), (528, 'Apex', 'n528', 'tag0'), (529, 'Zebulon', 'n529', 'tag1'), (530, 'Chapel Hill', 'n530', 'tag2'), (531, 'Wake Forest', 'n531', 'tag0'), (532, 'Durham', 'n532', 'tag1'), (533, 'Raleigh', 'n533', 'tag2'), (534, 'Cary', 'n534', 'tag0'), (535, 'Apex', 'n535', 'tag1'), (536, 'Zebulon', 'n536', 'tag2'), (537, 'Chapel Hill', 'n537', 'tag0'), (538, 'Wake Forest', 'n538', 'tag1'), (539, 'Durham', 'n539', 'tag2'), (540, 'Raleigh', 'n540', 'tag0'), (541, 'Cary', 'n541', 'tag1'), (542, 'Apex', 'n542', 'tag2'), (543, 'Zebulon', 'n543', 'tag0'), (544, 'Chapel Hill', 'n544', 'tag1'), (545, 'Wake Forest', 'n545', 'tag2'), (546, 'Durham', 'n546', 'tag0'), (547, 'Raleigh', 'n547', 'tag1'), (548, 'Cary', 'n548', 'tag2'), (549, 'Apex', 'n549', 'tag0'), (550, 'Zebulon', 'n550', 'tag1'), (551, 'Chapel Hill', 'n551', 'tag2'), (552, 'Wake Forest', 'n552', 'tag0'), (553, 'Durham', 'n553', 'tag1'), (554, 'Raleigh', 'n554', 'tag2'), (555, 'Cary', 'n555', 'tag0'), (556, 'Apex', 'n556', 'tag1'), (557, 'Zebulon', 'n557', 'tag2'), (558, 'Chapel Hill', 'n558', 'tag0'), (559, 'Wake Forest', 'n559', 'tag1'), (560, 'Durham', 'n560', 'tag2'), (561, 'Raleigh', 'n561', 'tag0'), (562, 'Cary', 'n562', 'tag1'), (563, 'Apex', 'n563', 'tag2'), (564, 'Zebulon', 'n564', 'tag0'), (565, 'Chapel Hill', 'n565', 'tag1'), (566, 'Wake Forest', 'n566', 'tag2'), (567, 'Durham', 'n567', 'tag0'), (568, 'Raleigh', 'n568', 'tag1'), (569, 'Cary', 'n569', 'tag2'), (570, 'Apex', 'n570', 'tag0'), (571, 'Zebulon', 'n571', 'tag1'), (572, 'Chapel Hill', 'n572', 'tag2'), (573, 'Wake Forest', 'n573', 'tag0'), (574, 'Durham', 'n574', 'tag1'), (575, 'Raleigh', 'n575', 'tag2'), (576, 'Cary', 'n576', 'tag0'), (577, 'Apex', 'n577', 'tag1'), (578, 'Zebulon', 'n578', 'tag2'), (579, 'Chapel Hill', 'n579', 'tag0'), (580, 'Wake Forest', 'n580', 'tag1'), (581, 'Durham', 'n581', 'tag2'), (582, 'Raleigh', 'n582', 'tag0'), (583, 'Cary', 'n583', 'tag1'), (584, 'Apex', 'n584', 'tag2'), (585, 'Zebulon', 'n585', 'tag0'), (586, 'Chapel Hill', 'n586', 'tag1'), (587, 'Wake Forest', 'n587', 'tag2'), (588, 'Durham', 'n588', 'tag0'), (589, 'Raleigh', 'n589', 'tag1'), (590, 'Cary', 'n590', 'tag2'), (591, 'Apex', 'n591', 'tag0'), (592, 'Zebulon', 'n592', 'tag1'), (593, 'Chapel Hill', 'n593', 'tag2'), (594, 'Wake Forest', 'n594', 'tag0'), (595, 'Durham', 'n595', 'tag1'), (596, 'Raleigh', 'n596', 'tag2'), (597, 'Cary', 'n597', 'tag0'), (598, 'Apex', 'n598', 'tag1'), (599, 'Zebulon', 'n599', 'tag2'), (600, 'Chapel Hill', 'n600', 'tag0'), (601, 'Wake Forest', 'n601', 'tag1'), (602, 'Durham', 'n602', 'tag2'), (603, 'Raleigh', 'n603', 'tag0'), (604, 'Cary', 'n604', 'tag1'), (605, 'Apex', 'n605', 'tag2'), (606, 'Zebulon', 'n606', 'tag0'), (607, 'Chapel Hill', 'n607', 'tag1'), (608, 'Wake Forest', 'n608', 'tag2'), (609, 'Durham', 'n609', 'tag0'), (610, 'Raleigh', 'n610', 'tag1'), (611, 'Cary', 'n611', 'tag2'), (612, 'Apex', 'n612', 'tag0'), (613, 'Zebulon', 'n613', 'tag1'), (614, 'Chapel Hill', 'n614', 'tag2'), (615, 'Wake Forest', 'n615', 'tag0'), (616, 'Durham', 'n616', 'tag1'), (617, 'Raleigh', 'n617', 'tag2'), (618, 'Cary', 'n618', 'tag0'), (619, 'Apex', 'n619', 'tag1'), (620, 'Zebulon', 'n620', 'tag2'), (621, 'Chapel Hill', 'n621', 'tag0'), (622, 'Wake Forest', 'n622', 'tag1'), (623, 'Durham', 'n623', 'tag2'), (624, 'Raleigh', 'n624', 'tag0'), (625, 'Cary', 'n625', 'tag1'), (626, 'Apex', 'n626', 'tag2'), (627, 'Zebulon', 'n627', 'tag0'), (628, 'Chapel Hill', 'n628', 'tag1'), (629, 'Wake Forest', 'n629', 'tag2'), (630, 'Durham', 'n630', 'tag0'), (631, 'Raleigh', 'n631', 'tag1'), (632, 'Cary', 'n632', 'tag2'), (633, 'Apex', 'n633', 'tag0'), (634, 'Zebulon', 'n634', 'tag1'), (635, 'Chapel Hill', 'n635', 'tag2'), (636, 'Wake Forest', 'n636', 'tag0'), (637, 'Durham', 'n637', 'tag1'), (638, 'Raleigh', 'n638', 'tag2'), (639, 'Cary', 'n639', 'tag0'), (640, 'Apex', 'n640', 'tag1'), (641, 'Zebulon', 'n641', 'tag2'), (642, 'Chapel Hill', 'n642', 'tag0'), (643, 'Wake Forest', 'n643', 'tag1'), (644, 'Durham', 'n644', 'tag2'), (645, 'Raleigh', 'n645', 'tag0'), (646, 'Cary', 'n646', 'tag1'), (647, 'Apex', 'n647', 'tag2'), (648, 'Zebulon', 'n648', 'tag0'), (649, 'Chapel Hill', 'n649', 'tag1'), (650, 'Wake Forest', 'n650', 'tag2'), (651, 'Durham', 'n651', 'tag0'), (652, 'Raleigh', 'n652', 'tag1'), (653, 'Cary', 'n653', 'tag2'), (654, 'Apex', 'n654', 'tag0'), (655, 'Zebulon', 'n655', 'tag1'), (656, 'Chapel Hill', 'n656', 'tag2'), (657, 'Wake Forest', 'n657', 'tag0'), (658, 'Durham', 'n658', 'tag1'), (659, 'Raleigh', 'n659', 'tag2'), (660, 'Cary', 'n660', 'tag0'), (661, 'Apex', 'n661', 'tag1'), (662, 'Zebulon', 'n662', 'tag2'), (663, 'Chapel Hill', 'n663', 'tag0'), (664, 'Wake Forest', 'n664', 'tag1'), (665, 'Durham', 'n665', 'tag2'), (666, 'Raleigh', 'n666', 'tag0'), (667, 'Cary', 'n667', 'tag1'), (668, 'Apex', 'n668', 'tag2'), (669, 'Zebulon', 'n669', 'tag0'), (670, 'Chapel Hill', 'n670', 'tag1'), (671, 'Wake Forest', 'n671', 'tag2'), (672, 'Durham', 'n672', 'tag0'), (673, 'Raleigh', 'n673', 'tag1'), (674, 'Cary', 'n674', 'tag2'), (675, 'Apex', 'n675', 'tag0'), (676, 'Zebulon', 'n676', 'tag1'), (677, 'Chapel Hill', 'n677', 'tag2'), (678, 'Wake Forest', 'n678', 'tag0'), (679, 'Durham', 'n679', 'tag1'), (680, 'Raleigh', 'n680', 'tag2'), (681, 'Cary', 'n681', 'tag0'), (682, 'Apex', 'n682', 'tag1'), (683, 'Zebulon', 'n683', 'tag2'), (684, 'Chapel Hill', 'n684', 'tag0'), (685, 'Wake Forest', 'n685', 'tag1'), (686, 'Durham', 'n686', 'tag2'), (687, 'Raleigh', 'n687', 'tag0'), (688, 'Cary', 'n688', 'tag1'), (689, 'Apex', 'n689', 'tag2'), (690, 'Zebulon', 'n690', 'tag0'), (691, 'Chapel Hill', 'n691', 'tag1'), (692, 'Wake Forest', 'n692', 'tag2'), (693, 'Durham', 'n693', 'tag0'), (694, 'Raleigh', 'n694', 'tag1'), (695, 'Cary', 'n695', 'tag2'), (696, 'Apex', 'n696', 'tag0'), (697, 'Zebulon', 'n697', 'tag1'), (698, 'Chapel Hill', 'n698', 'tag2'), (699, 'Wake Forest', 'n699', 'tag0'), (700, 'Durham', 'n700', 'tag1'), (701, 'Raleigh', 'n701', 'tag2'), (702, 'Cary', 'n702', 'tag0'), (703, 'Apex', 'n703', 'tag1'), (704, 'Zebulon', 'n704', 'tag2'), (705, 'Chapel Hill', 'n705', 'tag0'), (706, 'Wake Forest', 'n706', 'tag1'), (707, 'Durham', 'n707', 'tag2'), (708, 'Raleigh', 'n708', 'tag0'), (709, 'Cary', 'n709', 'tag1'), (710, 'Apex', 'n710', 'tag2'), (711, 'Zebulon', 'n711', 'tag0'), (712, 'Chapel Hill', 'n712', 'tag1'), (713, 'Wake Forest', 'n713', 'tag2'), (714, 'Durham', 'n714', 'tag0'), (715, 'Raleigh', 'n715', 'tag1'), (716, 'Cary', 'n716', 'tag2'), (717, 'Apex', 'n717', 'tag0'), (718, 'Zebulon', 'n718', 'tag1'), (719, 'Chapel Hill', 'n719', 'tag2'), (720, 'Wake Forest', 'n720', 'tag0'), (721, 'Durham', 'n721', 'tag1'), (722, 'Raleigh', 'n722', 'tag2'), (723, 'Cary', 'n723', 'tag0'), (724, 'Apex', 'n724', 'tag1'), (725, 'Zebulon', 'n725', 'tag2'), (726, 'Chapel Hill', 'n726', 'tag0'), (727, 'Wake Forest', 'n727', 'tag1'), (728, 'Durham', 'n728', 'tag2'), (729, 'Raleigh', 'n729', 'tag0'), (730, 'Cary', 'n730', 'tag1'), (731, 'Apex', 'n731', 'tag2'), (732, 'Zebulon', 'n732', 'tag0'), (733, 'Chapel Hill', 'n733', 'tag1'), (734, 'Wake Forest', 'n734', 'tag2'), (735, 'Durham', 'n735', 'tag0'), (736, 'Raleigh', 'n736', 'tag1'), (737, 'Cary', 'n737', 'tag2'), (738, 'Apex', 'n738', 'tag0'), (739, 'Zebulon', 'n739', 'tag1'), (740, 'Chapel Hill', 'n740', 'tag2'), (741, 'Wake Forest', 'n741', 'tag0'), (742, 'Durham', 'n742', 'tag1'), (743, 'Raleigh', 'n743', 'tag2'), (744, 'Cary', 'n744', 'tag0'), (745, 'Apex', 'n745', 'tag1'), (746, 'Zebulon', 'n746', 'tag2'), (747, 'Chapel Hill', 'n747', 'tag0'), (748, 'Wake Forest', 'n748', 'tag1'), (749, 'Durham', 'n749', 'tag2'), (750, 'Raleigh', 'n750', 'tag0'), (751, 'Cary', 'n751', 'tag1'), (752, 'Apex', 'n752', 'tag2'), (753, 'Zebulon', 'n753', 'tag0'), (754, 'Chapel Hill', 'n754', 'tag1'), (755, 'Wake Forest', 'n755', 'tag2'), (756, 'Durham', 'n756', 'tag0'), (757, 'Raleigh', 'n757', 'tag1'), (758, 'Cary', 'n758', 'tag2'), (759, 'Apex', 'n759', 'tag0'), (760, 'Zebulon', 'n760', 'tag1'), (761, 'Chapel Hill', 'n761', 'tag2'), (762, 'Wake Forest', 'n762', 'tag0'), (763, 'Durham', 'n763', 'tag1'), (764, 'Raleigh', 'n764', 'tag2'), (765, 'Cary', 'n765', 'tag0'), (766, 'Apex', 'n766', 'tag1'), (767, 'Zebulon', 'n767', 'tag2'), (768, 'Chapel Hill', 'n768', 'tag0'), (769, 'Wake Forest', 'n769', 'tag1'), (770, 'Durham', 'n770', 'tag2'), (771, 'Raleigh', 'n771', 'tag0'), (772, 'Cary', 'n772', 'tag1'), (773, 'Apex', 'n773', 'tag2'), (774, 'Zebulon', 'n774', 'tag0'), (775, 'Chapel Hill', 'n775', 'tag1'), (776, 'Wake Forest', 'n776', 'tag2'), (777, 'Durham', 'n777', 'tag0'), (778, 'Raleigh', 'n778', 'tag1'), (779, 'Cary', 'n779', 'tag2'), (780, 'Apex', 'n780', 'tag0'), (781, 'Zebulon', 'n781', 'tag1'), (782, 'Chapel Hill', 'n782', 'tag2'), (783, 'Wake Forest', 'n783', 'tag0'), (784, 'Durham', 'n784', 'tag1'), (785, 'Raleigh', 'n785', 'tag2'), (786, 'Cary', 'n786', 'tag0'), (787, 'Apex', 'n787', 'tag1'), (788, 'Zebulon', 'n788', 'tag2'), (789, 'Chapel Hill', 'n789', 'tag0'), (790, 'Wake Forest', 'n790', 'tag1'), (791, 'Durham', 'n791', 'tag2'), (792, 'Raleigh', 'n792', 'tag0'), (793, 'Cary', 'n793', 'tag1'), (794, 'Apex', 'n794', 'tag2'), (795, 'Zebulon', 'n795', 'tag0'), (796, 'Chapel Hill', 'n796', 'tag1'), (797, 'Wake Forest', 'n797', 'tag2'), (798, 'Durham', 'n798', 'tag0'), (799, 'Raleigh', 'n799', 'tag1'), (800, 'Cary', 'n800', 'tag2'), (801, 'Apex', 'n801', 'tag0'), (802, 'Zebulon', 'n802', 'tag1'), (803, 'Chapel Hill', 'n803', 'tag2'), (804, 'Wake Forest', 'n804', 'tag0'), (805, 'Durham', 'n805', 'tag1'), (806, 'Raleigh', 'n806', 'tag2'), (807, 'Cary', 'n807', 'tag0'), (808, 'Apex', 'n808', 'tag1'), (809, 'Zebulon', 'n809', 'tag2'), (810, 'Chapel Hill', 'n810', 'tag0'), (811, 'Wake Forest', 'n811', 'tag1'), (812, 'Durham', 'n812', 'tag2'), (813, 'Raleigh', 'n813', 'tag0'), (814, 'Cary', 'n814', 'tag1'), (815, 'Apex', 'n815', 'tag2'), (816, 'Zebulon', 'n816', 'tag0'), (817, 'Chapel Hill', 'n817', 'tag1'), (818, 'Wake Forest', 'n818', 'tag2'), (819, 'Durham', 'n819', 'tag0'), (820, 'Raleigh', 'n820', 'tag1'), (821, 'Cary', 'n821', 'tag2'), (822, 'Apex', 'n822', 'tag0'), (823, 'Zebulon', 'n823', 'tag1'), (824, 'Chapel Hill', 'n824', 'tag2'), (825, 'Wake Forest', 'n825', 'tag0'), (826, 'Durham', 'n826', 'tag1'), (827, 'Raleigh', 'n827', 'tag2'), (828, 'Cary', 'n828', 'tag0'), (829, 'Apex', 'n829', 'tag1'), (830, 'Zebulon', 'n830', 'tag2'), (831, 'Chapel Hill', 'n831', 'tag0'), (832, 'Wake Forest', 'n832', 'tag1'), (833, 'Durham', 'n833', 'tag2'), (834, 'Raleigh', 'n834', 'tag0'), (835, 'Cary', 'n835', 'tag1'), (836, 'Apex', 'n836', 'tag2'), (837, 'Zebulon', 'n837', 'tag0'), (838, 'Chapel Hill', 'n838', 'tag1'), (839, 'Wake Forest', 'n839', 'tag2'), (840, 'Durham', 'n840', 'tag0'), (841, 'Raleigh', 'n841', 'tag1'), (842, 'Cary', 'n842', 'tag2'), (843, 'Apex', 'n843', 'tag0'), (844, 'Zebulon', 'n844', 'tag1'), (845, 'Chapel Hill', 'n845', 'tag2'), (846, 'Wake Forest', 'n846', 'tag0'), (847, 'Durham', 'n847', 'tag1'), (848, 'Raleigh', 'n848', 'tag2'), (849, 'Cary', 'n849', 'tag0'), (850, 'Apex', 'n850', 'tag1'), (851, 'Zebulon', 'n851', 'tag2'), (852, 'Chapel Hill', 'n852', 'tag0'), (853, 'Wake Forest', 'n853', 'tag1'), (854, 'Durham', 'n854', 'tag2'), (855, 'Raleigh', 'n855', 'tag0'), (856, 'Cary', 'n856', 'tag1'), (857, 'Apex', 'n857', 'tag2'), (858, 'Zebulon', 'n858', 'tag0'), (859, 'Chapel Hill', 'n859', 'tag1'), (860, 'Wake Forest', 'n860', 'tag2'), (861, 'Durham', 'n861', 'tag0'), (862, 'Raleigh', 'n862', 'tag1'), (863, 'Cary', 'n863', 'tag2'), (864, 'Apex', 'n864', 'tag0'), (865, 'Zebulon', 'n865', 'tag1'), (866, 'Chapel Hill', 'n866', 'tag2'), (867, 'Wake Forest', 'n867', 'tag0'), (868, 'Durham', 'n868', 'tag1'), (869, 'Raleigh', 'n869', 'tag2'), (870, 'Cary', 'n870', 'tag0'), (871, 'Apex', 'n871', 'tag1'), (872, 'Zebulon', 'n872', 'tag2'), (873, 'Chapel Hill', 'n873', 'tag0'), (874, 'Wake Forest', 'n874', 'tag1'), (875, 'Durham', 'n875', 'tag2'), (876, 'Raleigh', 'n876', 'tag0'), (877, 'Cary', 'n877', 'tag1'), (878, 'Apex', 'n878', 'tag2'), (879, 'Zebulon', 'n879', 'tag0'), (880, 'Chapel Hill', 'n880', 'tag1'), (881, 'Wake Forest', 'n881', 'tag2'), (882, 'Durham', 'n882', 'tag0'), (883, 'Raleigh', 'n883', 'tag1'), (884, 'Cary', 'n884', 'tag2'), (885, 'Apex', 'n885', 'tag0'), (886, 'Zebulon', 'n886', 'tag1'), (887, 'Chapel Hill', 'n887', 'tag2'), (888, 'Wake Forest', 'n888', 'tag0'), (889, 'Durham', 'n889', 'tag1'), (890, 'Raleigh', 'n890', 'tag2'), (891, 'Cary', 'n891', 'tag0'), (892, 'Apex', 'n892', 'tag1'), (893, 'Zebulon', 'n893', 'tag2'), (894, 'Chapel Hill', 'n894', 'tag0'), (895, 'Wake Forest', 'n895', 'tag1'), (896, 'Durham', 'n896', 'tag2'), (897, 'Raleigh', 'n897', 'tag0'), (898, 'Cary', 'n898', 'tag1'), (899, 'Apex', 'n899', 'tag2'), (900, 'Zebulon', 'n900', 'tag0'), (901, 'Chapel Hill', 'n901', 'tag1'), (902, 'Wake Forest', 'n902', 'tag2'), (903, 'Durham', 'n903', 'tag0'), (904, 'Raleigh', 'n904', 'tag1'), (905, 'Cary', 'n905', 'tag2'), (906, 'Apex', 'n906', 'tag0'), (907, 'Zebulon', 'n907', 'tag1'), (908, 'Chapel Hill', 'n908', 'tag2'), (909, 'Wake Forest', 'n909', 'tag0'), (910, 'Durham', 'n910', 'tag1'), (911, 'Raleigh', 'n911', 'tag2'), (912, 'Cary', 'n912', 'tag0'), (913, 'Apex', 'n913', 'tag1'), (914, 'Zebulon', 'n914', 'tag2'), (915, 'Chapel Hill', 'n915', 'tag0'), (916, 'Wake Forest', 'n916', 'tag1'), (917, 'Durham', 'n917', 'tag2'), (918, 'Raleigh', 'n918', 'tag0'), (919, 'Cary', 'n919', 'tag1'), (920, 'Apex', 'n920', 'tag2'), (921, 'Zebulon', 'n921', 'tag0'), (922, 'Chapel Hill', 'n922', 'tag1'), (923, 'Wake Forest', 'n923', 'tag2'), (924, 'Durham', 'n924', 'tag0'), (925, 'Raleigh', 'n925', 'tag1'), (926, 'Cary', 'n926', 'tag2'), (927, 'Apex', 'n927', 'tag0'), (928, 'Zebulon', 'n928', 'tag1'), (929, 'Chapel Hill', 'n929', 'tag2'), (930, 'Wake Forest', 'n930', 'tag0'), (931, 'Durham', 'n931', 'tag1'), (932, 'Raleigh', 'n932', 'tag2'), (933, 'Cary', 'n933', 'tag0'), (934, 'Apex', 'n934', 'tag1'), (935, 'Zebulon', 'n935', 'tag2'), (936, 'Chapel Hill', 'n936', 'tag0'), (937, 'Wake Forest', 'n937', 'tag1'), (938, 'Durham', 'n938', 'tag2'), (939, 'Raleigh', 'n939', 'tag0'), (940, 'Cary', 'n940', 'tag1'), (941, 'Apex', 'n941', 'tag2'), (942, 'Zebulon', 'n942', 'tag0'), (943, 'Chapel Hill', 'n943', 'tag1'), (944, 'Wake Forest', 'n944', 'tag2'), (945, 'Durham', 'n945', 'tag0'), (946, 'Raleigh', 'n946', 'tag1'), (947, 'Cary', 'n947', 'tag2'), (948, 'Apex', 'n948', 'tag0'), (949, 'Zebulon', 'n949', 'tag1'), (950, 'Chapel Hill', 'n950', 'tag2'), (951, 'Wake Forest', 'n951', 'tag0'), (952, 'Durham', 'n952', 'tag1'), (953, 'Raleigh', 'n953', 'tag2'), (954, 'Cary', 'n954', 'tag0'), (955, 'Apex', 'n955', 'tag1'), (956, 'Zebulon', 'n956', 'tag2'), (957, 'Chapel Hill', 'n957', 'tag0'), (958, 'Wake Forest', 'n958', 'tag1'), (959, 'Durham', 'n959', 'tag2'), (960, 'Raleigh', 'n960', 'tag0'), (961, 'Cary', 'n961', 'tag1'), (962, 'Apex', 'n962', 'tag2'), (963, 'Zebulon', 'n963', 'tag0'), (964, 'Chapel Hill', 'n964', 'tag1'), (965, 'Wake Forest', 'n965', 'tag2'), (966, 'Durham', 'n966', 'tag0'), (967, 'Raleigh', 'n967', 'tag1'), (968, 'Cary', 'n968', 'tag2'), (969, 'Apex', 'n969', 'tag0'), (970, 'Zebulon', 'n970', 'tag1'), (971, 'Chapel Hill', 'n971', 'tag2'), (972, 'Wake Forest', 'n972', 'tag0'), (973, 'Durham', 'n973', 'tag1'), (974, 'Raleigh', 'n974', 'tag2'), (975, 'Cary', 'n975', 'tag0'), (976, 'Apex', 'n976', 'tag1'), (977, 'Zebulon', 'n977', 'tag2'), (978, 'Chapel Hill', 'n978', 'tag0'), (979, 'Wake Forest', 'n979', 'tag1'), (980, 'Durham', 'n980', 'tag2'), (981, 'Raleigh', 'n981', 'tag0'), (982, 'Cary', 'n982', 'tag1'), (983, 'Apex', 'n983', 'tag2'), (984, 'Zebulon', 'n984', 'tag0'), (985, 'Chapel Hill', 'n985', 'tag1'), (986, 'Wake Forest', 'n986', 'tag2'), (987, 'Durham', 'n987', 'tag0'), (988, 'Raleigh', 'n988', 'tag1'), (989, 'Cary', 'n989', 'tag2'), (990, 'Apex', 'n990', 'tag0'), (991, 'Zebulon', 'n991', 'tag1'), (992, 'Chapel Hill', 'n992', 'tag2'), (993, 'Wake Forest', 'n993', 'tag0'), (994, 'Durham', 'n994', 'tag1'), (995, 'Raleigh', 'n995', 'tag2'), (996, 'Cary', 'n996', 'tag0'), (997, 'Apex', 'n997', 'tag1'), (998, 'Zebulon', 'n998', 'tag2'), (999, 'Chapel Hill', 'n999', 'tag0'), (1000, 'Wake Forest', 'n1000', 'tag1'), (1001, 'Durham', 'n1001', 'tag2'), (1002, 'Raleigh', 'n1002', 'tag0'), (1003, 'Cary', 'n1003', 'tag1'), (1004, 'Apex', 'n1004', 'tag2'), (1005, 'Zebulon', 'n1005', 'tag0'), (1006, 'Chapel Hill', 'n1006', 'tag1'), (1007, 'Wake Forest', 'n1007', 'tag2'), (1008, 'Durham', 'n1008', 'tag0'), (1009, 'Raleigh', 'n1009', 'tag1'), (1010, 'Cary', 'n1010', 'tag2'), (1011, 'Apex', 'n1011', 'tag0'), (1012, 'Zebulon', 'n1012', 'tag1'), (1013, 'Chapel Hill', 'n1013', 'tag2'), (1014, 'Wake Forest', 'n1014', 'tag0'), (1015, 'Durham', 'n1015', 'tag1'), (1016, 'Raleigh', 'n1016', 'tag2'), (1017, 'Cary', 'n1017', 'tag0'), (1018, 'Apex', 'n1018', 'tag1'), (1019, 'Zebulon', 'n1019', 'tag2'), (1020, 'Chapel Hill', 'n1020', 'tag0'), (1021, 'Wake Forest', 'n1021', 'tag1'), (1022, 'Durham', 'n1022', 'tag2'), (1023, 'Raleigh', 'n1023', 'tag0'), (1024, 'Cary', 'n1024', 'tag1'), (1025, 'Apex', 'n1025', 'tag2'), (1026, 'Zebulon', 'n1026', 'tag0'), (1027, 'Chapel Hill', 'n1027', 'tag1'), (1028, 'Wake Forest', 'n1028', 'tag2'), (1029, 'Durham', 'n1029', 'tag0'), (1030, 'Raleigh', 'n1030', 'tag1'), (1031, 'Cary', 'n1031', 'tag2'), (1032, 'Apex', 'n1032', 'tag0'), (1033, 'Zebulon', 'n1033', 'tag1'), (1034, 'Chapel Hill', 'n1034', 'tag2'), (1035, 'Wake Forest', 'n1035', 'tag0'), (1036, 'Durham', 'n1036', 'tag1'), (1037, 'Raleigh', 'n1037', 'tag2'), (1038, 'Cary', 'n1038', 'tag0'), (1039, 'Apex', 'n1039', 'tag1'), (1040, 'Zebulon', 'n1040', 'tag2'), (1041, 'Chapel Hill', 'n1041', 'tag0'), (1042, 'Wake Forest', 'n1042', 'tag1'), (1043, 'Durham', 'n1043', 'tag2'), (1044, 'Raleigh', 'n1044', 'tag0'), (1045, 'Cary', 'n1045', 'tag1'), (1046, 'Apex', 'n1046', 'tag2'), (1047, 'Zebulon', 'n1047', 'tag0'), (1048, 'Chapel Hill', 'n1048', 'tag1'), (1049, 'Wake Forest', 'n1049', 'tag2'), (1050, 'Durham', 'n1050', 'tag0'), (1051, 'Raleigh', 'n1051', 'tag1'), (1052, 'Cary', 'n1052', 'tag2'), (1053, 'Apex', 'n1053', 'tag0'), (1054, 'Zebulon', 'n1054', 'tag1'), (1055, 'Chapel Hill', 'n1055', 'tag2'), (1056, 'Wake Forest', 'n1056', 'tag0'), (1057, 'Durham', 'n1057', 'tag1'), (1058, 'Raleigh', 'n1058', 'tag2'), (1059, 'Cary', 'n1059', 'tag0'), (1060, 'Apex', 'n1060', 'tag1'), (1061, 'Zebulon', 'n1061', 'tag2'), (1062, 'Chapel Hill', 'n1062', 'tag0'), (1063, 'Wake Forest', 'n1063', 'tag1'), (1064, 'Durham', 'n1064', 'tag2'), (1065, 'Raleigh', 'n1065', 'tag0'), (1066, 'Cary', 'n1066', 'tag1'), (1067, 'Apex', 'n1067', 'tag2'), (1068, 'Zebulon', 'n1068', 'tag0'), (1069, 'Chapel Hill', 'n1069', 'tag1'), (1070, 'Wake Forest', 'n1070', 'tag2'), (1071, 'Durham', 'n1071', 'tag0'), (1072, 'Raleigh', 'n1072', 'tag1'), (1073, 'Cary', 'n1073', 'tag2'), (1074, 'Apex', 'n1074', 'tag0'), (1075, 'Zebulon', 'n1075', 'tag1'), (1076, 'Chapel Hill', 'n1076', 'tag2'), (1077, 'Wake Forest', 'n1077', 'tag0'), (1078, 'Durham', 'n1078', 'tag1'), (1079, 'Raleigh', 'n1079', 'tag2'), (1080, 'Cary', 'n1080', 'tag0'), (1081, 'Apex', 'n1081', 'tag1'), (1082, 'Zebulon', 'n1082', 'tag2'), (1083, 'Chapel Hill', 'n1083', 'tag0'), (1084, 'Wake Forest', 'n1084', 'tag1'), (1085, 'Durham', 'n1085', 'tag2'), (1086, 'Raleigh', 'n1086', 'tag0'), (1087, 'Cary', 'n1087', 'tag1'), (1088, 'Apex', 'n1088', 'tag2'), (1089, 'Zebulon', 'n1089', 'tag0'), (1090, 'Chapel Hill', 'n1090', 'tag1'), (1091, 'Wake Forest', 'n1091', 'tag2'), (1092, 'Durham', 'n1092', 'tag0'), (1093, 'Raleigh', 'n1093', 'tag1'), (1094, 'Cary', 'n1094', 'tag2'), (1095, 'Apex', 'n1095', 'tag0'), (1096, 'Zebulon', 'n1096', 'tag1'), (1097, 'Chapel Hill', 'n1097', 'tag2'), (1098, 'Wake Forest', 'n1098', 'tag0'), (1099, 'Durham', 'n1099', 'tag1'), (1100, 'Raleigh', 'n1100', 'tag2'), (1101, 'Cary', 'n1101', 'tag0'), (1102, 'Apex', 'n1102', 'tag1'), (1103, 'Zebulon', 'n1103', 'tag2'), (1104, 'Chapel Hill', 'n1104', 'tag0'), (1105, 'Wake Forest', 'n1105', 'tag1'), (1106, 'Durham', 'n1106', 'tag2'), (1107, 'Raleigh', 'n1107', 'tag0'), (1108, 'Cary', 'n1108', 'tag1'), (1109, 'Apex', 'n1109', 'tag2'), (1110, 'Zebulon', 'n1110', 'tag0'), (1111, 'Chapel Hill', 'n1111', 'tag1'), (1112, 'Wake Forest', 'n1112', 'tag2'), (1113, 'Durham', 'n1113', 'tag0'), (1114, 'Raleigh', 'n1114', 'tag1'), (1115, 'Cary', 'n1115', 'tag2'), (1116, 'Apex', 'n1116', 'tag0'), (1117, 'Zebulon', 'n1117', 'tag1'), (1118, 'Chapel Hill', 'n1118', 'tag2'), (1119, 'Wake Forest', 'n1119', 'tag0'), (1120, 'Durham', 'n1120', 'tag1'), (1121, 'Raleigh', 'n1121', 'tag2'), (1122, 'Cary', 'n1122', 'tag0'), (1123, 'Apex', 'n1123', 'tag1'), (1124, 'Zebulon', 'n1124', 'tag2'), (1125, 'Chapel Hill', 'n1125', 'tag0'), (1126, 'Wake Forest', 'n1126', 'tag1'), (1127, 'Durham', 'n1127', 'tag2'), (1128, 'Raleigh', 'n1128', 'tag0'), (1129, 'Cary', 'n1129', 'tag1'), (1130, 'Apex', 'n1130', 'tag2'), (1131, 'Zebulon', 'n1131', 'tag0'), (1132, 'Chapel Hill', 'n1132', 'tag1'), (1133, 'Wake Forest', 'n1133', 'tag2'), (1134, 'Durham', 'n1134', 'tag0'), (1135, 'Raleigh', 'n1135', 'tag1'), (1136, 'Cary', 'n1136', 'tag2'), (1137, 'Apex', 'n1137', 'tag0'), (1138, 'Zebulon', 'n1138', 'tag1'), (1139, 'Chapel Hill', 'n1139', 'tag2'), (1140, 'Wake Forest', 'n1140', 'tag0'), (1141, 'Durham', 'n1141', 'tag1'), (1142, 'Raleigh', 'n1142', 'tag2'), (1143, 'Cary', 'n1143', 'tag0'), (1144, 'Apex', 'n1144', 'tag1'), (1145, 'Zebulon', 'n1145', 'tag2'), (1146, 'Chapel Hill', 'n1146', 'tag0'), (1147, 'Wake Forest', 'n1147', 'tag1'), (1148, 'Durham', 'n1148', 'tag2'), (1149, 'Raleigh', 'n1149', 'tag0'), (1150, 'Cary', 'n1150', 'tag1'), (1151, 'Apex', 'n1151', 'tag2'), (1152, 'Zebulon', 'n1152', 'tag0'), (1153, 'Chapel Hill', 'n1153', 'tag1'), (1154, 'Wake Forest', 'n1154', 'tag2'), (1155, 'Durham', 'n1155', 'tag0'), (1156, 'Raleigh', 'n1156', 'tag1'), (1157, 'Cary', 'n1157', 'tag2'), (1158, 'Apex', 'n1158', 'tag0'), (1159, 'Zebulon', 'n1159', 'tag1'), (1160, 'Chapel Hill', 'n1160', 'tag2'), (1161, 'Wake Forest', 'n1161', 'tag0'), (1162, 'Durham', 'n1162', 'tag1'), (1163, 'Raleigh', 'n1163', 'tag2'), (1164, 'Cary', 'n1164', 'tag0'), (1165, 'Apex', 'n1165', 'tag1'), (1166, 'Zebulon', 'n1166', 'tag2'), (1167, 'Chapel Hill', 'n1167', 'tag0'), (1168, 'Wake Forest', 'n1168', 'tag1'), (1169, 'Durham', 'n1169', 'tag2'), (1170, 'Raleigh', 'n1170', 'tag0'), (1171, 'Cary', 'n1171', 'tag1'), (1172, 'Apex', 'n1172', 'tag2'), (1173, 'Zebulon', 'n1173', 'tag0'), (1174, 'Chapel Hill', 'n1174', 'tag1'), (1175, 'Wake Forest', 'n1175', 'tag2'), (1176, 'Durham', 'n1176', 'tag0'), (1177, 'Raleigh', 'n1177', 'tag1'), (1178, 'Cary', 'n1178', 'tag2'), (1179, 'Apex', 'n1179', 'tag0'), (1180, 'Zebulon', 'n1180', 'tag1'), (1181, 'Chapel Hill', 'n1181', 'tag2'), (1182, 'Wake Forest', 'n1182', 'tag0'), (1183, 'Durham', 'n1183', 'tag1'), (1184, 'Raleigh', 'n1184', 'tag2'), (1185, 'Cary', 'n1185', 'tag0'), (1186, 'Apex', 'n1186', 'tag1'), (1187, 'Zebulon', 'n1187', 'tag2'), (1188, 'Chapel Hill', 'n1188', 'tag0'), (1189, 'Wake Forest', 'n1189', 'tag1'), (1190, 'Durham', 'n1190', 'tag2'), (1191, 'Raleigh', 'n1191', 'tag0'), (1192, 'Cary', 'n1192', 'tag1'), (1193, 'Apex', 'n1193', 'tag2'), (1194, 'Zebulon', 'n1194', 'tag0'), (1195, 'Chapel Hill', 'n1195', 'tag1'), (1196, 'Wake Forest', 'n1196', 'tag2'), (1197, 'Durham', 'n1197', 'tag0'), (1198, 'Raleigh', 'n1198', 'tag1'), (1199, 'Cary', 'n1199', 'tag2'), (1200, 'Apex', 'n1200', 'tag0'), (1201, 'Zebulon', 'n1201', 'tag1'), (1202, 'Chapel Hill', 'n1202', 'tag2'), (1203, 'Wake Forest', 'n1203', 'tag0'), (1204, 'Durham', 'n1204', 'tag1'), (1205, 'Raleigh', 'n1205', 'tag2'), (1206, 'Cary', 'n1206', 'tag0'), (1207, 'Apex', 'n1207', 'tag1'), (1208, 'Zebulon', 'n1208', 'tag2'), (1209, 'Chapel Hill', 'n1209', 'tag0'), (1210, 'Wake Forest', 'n1210', 'tag1'), (1211, 'Durham', 'n1211', 'tag2'), (1212, 'Raleigh', 'n1212', 'tag0'), (1213, 'Cary', 'n1213', 'tag1'), (1214, 'Apex', 'n1214', 'tag2'), (1215, 'Zebulon', 'n1215', 'tag0'), (1216, 'Chapel Hill', 'n1216', 'tag1'), (1217, 'Wake Forest', 'n1217', 'tag2'), (1218, 'Durham', 'n1218', 'tag0'), (1219, 'Raleigh', 'n1219', 'tag1'), (1220, 'Cary', 'n1220', 'tag2'), (1221, 'Apex', 'n1221', 'tag0'), (1222, 'Zebulon', 'n1222', 'tag1'), (1223, 'Chapel Hill', 'n1223', 'tag2'), (1224, 'Wake Forest', 'n1224', 'tag0'), (1225, 'Durham', 'n1225', 'tag1'), (1226, 'Raleigh', 'n1226', 'tag2'), (1227, 'Cary', 'n1227', 'tag0'), (1228, 'Apex', 'n1228', 'tag1'), (1229, 'Zebulon', 'n1229', 'tag2'), (1230, 'Chapel Hill', 'n1230', 'tag0'), (1231, 'Wake Forest', 'n1231', 'tag1'), (1232, 'Durham', 'n1232', 'tag2'), (1233, 'Raleigh', 'n1233', 'tag0'), (1234, 'Cary', 'n1234', 'tag1'), (1235, 'Apex', 'n1235', 'tag2'), (1236, 'Zebulon', 'n1236', 'tag0'), (1237, 'Chapel Hill', 'n1237', 'tag1'), (1238, 'Wake Forest', 'n1238', 'tag2'), (1239, 'Durham', 'n1239', 'tag0'), (1240, 'Raleigh', 'n1240', 'tag1'), (1241, 'Cary', 'n1241', 'tag2'), (1242, 'Apex', 'n1242', 'tag0'), (1243, 'Zebulon', 'n1243', 'tag1'), (1244, 'Chapel Hill', 'n1244', 'tag2'), (1245, 'Wake Forest', 'n1245', 'tag0'), (1246, 'Durham', 'n1246', 'tag1'), (1247, 'Raleigh', 'n1247', 'tag2'), (1248, 'Cary', 'n1248', 'tag0'), (1249, 'Apex', 'n1249', 'tag1'), (1250, 'Zebulon', 'n1250', 'tag2'), (1251, 'Chapel Hill', 'n1251', 'tag0'), (1252, 'Wake Forest', 'n1252', 'tag1'), (1253, 'Durham', 'n1253', 'tag2'), (1254, 'Raleigh', 'n1254', 'tag0'), (1255, 'Cary', 'n1255', 'tag1'), (1256, 'Apex', 'n1256', 'tag2'), (1257, 'Zebulon', 'n1257', 'tag0'), (1258, 'Chapel Hill', 'n1258', 'tag1'), (1259, 'Wake Forest', 'n1259', 'tag2'), (1260, 'Durham', 'n1260', 'tag0'), (1261, 'Raleigh', 'n1261', 'tag1'), (1262, 'Cary', 'n1262', 'tag2'), (1263, 'Apex', 'n1263', 'tag0'), (1264, 'Zebulon', 'n1264', 'tag1'), (1265, 'Chapel Hill', 'n1265', 'tag2'), (1266, 'Wake Forest', 'n1266', 'tag0'), (1267, 'Durham', 'n1267', 'tag1'), (1268, 'Raleigh', 'n1268', 'tag2'), (1269, 'Cary', 'n1269', 'tag0'), (1270, 'Apex', 'n1270', 'tag1'), (1271, 'Zebulon', 'n1271', 'tag2'), (1272, 'Chapel Hill', 'n1272', 'tag0'), (1273, 'Wake Forest', 'n1273', 'tag1'), (1274, 'Durham', 'n1274', 'tag2'), (1275, 'Raleigh', 'n1275', 'tag0'), (1276, 'Cary', 'n1276', 'tag1'), (1277, 'Apex', 'n1277', 'tag2'), (1278, 'Zebulon', 'n1278', 'tag0'), (1279, 'Chapel Hill', 'n1279', 'tag1'), (1280, 'Wake Forest', 'n1280', 'tag2'), (1281, 'Durham', 'n1281', 'tag0'), (1282, 'Raleigh', 'n1282', 'tag1'), (1283, 'Cary', 'n1283', 'tag2'), (1284, 'Apex', 'n1284', 'tag0'), (1285, 'Zebulon', 'n1285', 'tag1'), (1286, 'Chapel Hill', 'n1286', 'tag2'), (1287, 'Wake Forest', 'n1287', 'tag0'), (1288, 'Durham', 'n1288', 'tag1'), (1289, 'Raleigh', 'n1289', 'tag2'), (1290, 'Cary', 'n1290', 'tag0'), (1291, 'Apex', 'n1291', 'tag1'), (1292, 'Zebulon', 'n1292', 'tag2'), (1293, 'Chapel Hill', 'n1293', 'tag0'), (1294, 'Wake Forest', 'n1294', 'tag1'), (1295, 'Durham', 'n1295', 'tag2'), (1296, 'Raleigh', 'n1296', 'tag0'), (1297, 'Cary', 'n1297', 'tag1'), (1298, 'Apex', 'n1298', 'tag2'), (1299, 'Zebulon', 'n1299', 'tag0'), (1300, 'Chapel Hill', 'n1300', 'tag1'), (1301, 'Wake Forest', 'n1301', 'tag2'), (1302, 'Durham', 'n1302', 'tag0'), (1303, 'Raleigh', 'n1303', 'tag1'), (1304, 'Cary', 'n1304', 'tag2'), (1305, 'Apex', 'n1305', 'tag0'), (1306, 'Zebulon', 'n1306', 'tag1'), (1307, 'Chapel Hill', 'n1307', 'tag2'), (1308, 'Wake Forest', 'n1308', 'tag0'), (1309, 'Durham', 'n1309', 'tag1'), (1310, 'Raleigh', 'n1310', 'tag2'), (1311, 'Cary', 'n1311', 'tag0'), (1312, 'Apex', 'n1312', 'tag1'), (1313, 'Zebulon', 'n1313', 'tag2'), (1314, 'Chapel Hill', 'n1314', 'tag0'), (1315, 'Wake Forest', 'n1315', 'tag1'), (1316, 'Durham', 'n1316', 'tag2'), (1317, 'Raleigh', 'n1317', 'tag0'), (1318, 'Cary', 'n1318', 'tag1'), (1319, 'Apex', 'n1319', 'tag2'), (1320, 'Zebulon', 'n1320', 'tag0'), (1321, 'Chapel Hill', 'n1321', 'tag1'), (1322, 'Wake Forest', 'n1322', 'tag2'), (1323, 'Durham', 'n1323', 'tag0'), (1324, 'Raleigh', 'n1324', 'tag1'), (1325, 'Cary', 'n1325', 'tag2'), (1326, 'Apex', 'n1326', 'tag0'), (1327, 'Zebulon', 'n1327', 'tag1'), (1328, 'Chapel Hill', 'n1328', 'tag2'), (1329, 'Wake Forest', 'n1329', 'tag0'), (1330, 'Durham', 'n1330', 'tag1'), (1331, 'Raleigh', 'n1331', 'tag2'), (1332, 'Cary', 'n1332', 'tag0'), (1333, 'Apex', 'n1333', 'tag1'), (1334, 'Zebulon', 'n1334', 'tag2'), (1335, 'Chapel Hill', 'n1335', 'tag0'), (1336, 'Wake Forest', 'n1336', 'tag1'), (1337, 'Durham', 'n1337', 'tag2'), (1338, 'Raleigh', 'n1338', 'tag0'), (1339, 'Cary', 'n1339', 'tag1'), (1340, 'Apex', 'n1340', 'tag2'), (1341, 'Zebulon', 'n1341', 'tag0'), (1342, 'Chapel Hill', 'n1342', 'tag1'), (1343, 'Wake Forest', 'n1343', 'tag2'), (1344, 'Durham', 'n1344', 'tag0'), (1345, 'Raleigh', 'n1345', 'tag1'), (1346, 'Cary', 'n1346', 'tag2'), (1347, 'Apex', 'n1347', 'tag0'), (1348, 'Zebulon', 'n1348', 'tag1'), (1349, 'Chapel Hill', 'n1349', 'tag2'), (1350, 'Wake Forest', 'n1350', 'tag0'), (1351, 'Durham', 'n1351', 'tag1'), (1352, 'Raleigh', 'n1352', 'tag2'), (1353, 'Cary', 'n1353', 'tag0'), (1354, 'Apex', 'n1354', 'tag1'), (1355, 'Zebulon', 'n1355', 'tag2'), (1356, 'Chapel Hill', 'n1356', 'tag0'), (1357, 'Wake Forest', 'n1357', 'tag1'), (1358, 'Durham', 'n1358', 'tag2'), (1359, 'Raleigh', 'n1359', 'tag0'), (1360, 'Cary', 'n1360', 'tag1'), (1361, 'Apex', 'n1361', 'tag2'), (1362, 'Zebulon', 'n1362', 'tag0'), (1363, 'Chapel Hill', 'n1363', 'tag1'), (1364, 'Wake Forest', 'n1364', 'tag2'), (1365, 'Durham', 'n1365', 'tag0'), (1366, 'Raleigh', 'n1366', 'tag1'), (1367, 'Cary', 'n1367', 'tag2'), (1368, 'Apex', 'n1368', 'tag0'), (1369, 'Zebulon', 'n1369', 'tag1'), (1370, 'Chapel Hill', 'n1370', 'tag2'), (1371, 'Wake Forest', 'n1371', 'tag0'), (1372, 'Durham', 'n1372', 'tag1'), (1373, 'Raleigh', 'n1373', 'tag2'), (1374, 'Cary', 'n1374', 'tag0'), (1375, 'Apex', 'n1375', 'tag1'), (1376, 'Zebulon', 'n1376', 'tag2'), (1377, 'Chapel Hill', 'n1377', 'tag0'), (1378, 'Wake Forest', 'n1378', 'tag1'), (1379, 'Durham', 'n1379', 'tag2'), (1380, 'Raleigh', 'n1380', 'tag0'), (1381, 'Cary', 'n1381', 'tag1'), (1382, 'Apex', 'n1382', 'tag2'), (1383, 'Zebulon', 'n1383', 'tag0'), (1384, 'Chapel Hill', 'n1384', 'tag1'), (1385, 'Wake Forest', 'n1385', 'tag2'), (1386, 'Durham', 'n1386', 'tag0'), (1387, 'Raleigh', 'n1387', 'tag1'), (1388, 'Cary', 'n1388', 'tag2'), (1389, 'Apex', 'n1389', 'tag0'), (1390, 'Zebulon', 'n1390', 'tag1'), (1391, 'Chapel Hill', 'n1391', 'tag2'), (1392, 'Wake Forest', 'n1392', 'tag0'), (1393, 'Durham', 'n1393', 'tag1'), (1394, 'Raleigh', 'n1394', 'tag2'), (1395, 'Cary', 'n1395', 'tag0'), (1396, 'Apex', 'n1396', 'tag1'), (1397, 'Zebulon', 'n1397', 'tag2'), (1398, 'Chapel Hill', 'n1398', 'tag0'), (1399, 'Wake Forest', 'n1399', 'tag1'), (1400, 'Durham', 'n1400', 'tag2'), (1401, 'Raleigh', 'n1401', 'tag0'), (1402, 'Cary', 'n1402', 'tag1'), (1403, 'Apex', 'n1403', 'tag2'), (1404, 'Zebulon', 'n1404', 'tag0'), (1405, 'Chapel Hill', 'n1405', 'tag1'), (1406, 'Wake Forest', 'n1406', 'tag2'), (1407, 'Durham', 'n1407', 'tag0'), (1408, 'Raleigh', 'n1408', 'tag1'), (1409, 'Cary', 'n1409', 'tag2'), (1410, 'Apex', 'n1410', 'tag0'), (1411, 'Zebulon', 'n1411', 'tag1'), (1412, 'Chapel Hill', 'n1412', 'tag2'), (1413, 'Wake Forest', 'n1413', 'tag0'), (1414, 'Durham', 'n1414', 'tag1'), (1415, 'Raleigh', 'n1415', 'tag2'), (1416, 'Cary', 'n1416', 'tag0'), (1417, 'Apex', 'n1417', 'tag1'), (1418, 'Zebulon', 'n1418', 'tag2'), (1419, 'Chapel Hill', 'n1419', 'tag0'), (1420, 'Wake Forest', 'n1420', 'tag1'), (1421, 'Durham', 'n1421', 'tag2'), (1422, 'Raleigh', 'n1422', 'tag0'), (1423, 'Cary', 'n1423', 'tag1'), (1424, 'Apex', 'n1424', 'tag2'), (1425, 'Zebulon', 'n1425', 'tag0'), (1426, 'Chapel Hill', 'n1426', 'tag1'), (1427, 'Wake Forest', 'n1427', 'tag2'), (1428, 'Durham', 'n1428', 'tag0'), (1429, 'Raleigh', 'n1429', 'tag1'), (1430, 'Cary', 'n1430', 'tag2'), (1431, 'Apex', 'n1431', 'tag0'), (1432, 'Zebulon', 'n1432', 'tag1'), (1433, 'Chapel Hill', 'n1433', 'tag2'), (1434, 'Wake Forest', 'n1434', 'tag0'), (1435, 'Durham', 'n1435', 'tag1'), (1436, 'Raleigh', 'n1436', 'tag2'), (1437, 'Cary', 'n1437', 'tag0'), (1438, 'Apex', 'n1438', 'tag1'), (1439, 'Zebulon', 'n1439', 'tag2'), (1440, 'Chapel Hill', 'n1440', 'tag0'), (1441, 'Wake Forest', 'n1441', 'tag1'), (1442, 'Durham', 'n1442', 'tag2'), (1443, 'Raleigh', 'n1443', 'tag0'), (1444, 'Cary', 'n1444', 'tag1'), (1445, 'Apex', 'n1445', 'tag2'), (1446, 'Zebulon', 'n1446', 'tag0'), (1447, 'Chapel Hill', 'n1447', 'tag1'), (1448, 'Wake Forest', 'n1448', 'tag2'), (1449, 'Durham', 'n1449', 'tag0'), (1450, 'Raleigh', 'n1450', 'tag1'), (1451, 'Cary', 'n1451', 'tag2'), (1452, 'Apex', 'n1452', 'tag0'), (1453, 'Zebulon', 'n1453', 'tag1'), (1454, 'Chapel Hill', 'n1454', 'tag2'), (1455, 'Wake Forest', 'n1455', 'tag0'), (1456, 'Durham', 'n1456', 'tag1'), (1457, 'Raleigh', 'n1457', 'tag2'), (1458, 'Cary', 'n1458', 'tag0'), (1459, 'Apex', 'n1459', 'tag1'), (1460, 'Zebulon', 'n1460', 'tag2'), (1461, 'Chapel Hill', 'n1461', 'tag0'), (1462, 'Wake Forest', 'n1462', 'tag1'), (1463, 'Durham', 'n1463', 'tag2'), (1464, 'Raleigh', 'n1464', 'tag0'), (1465, 'Cary', 'n1465', 'tag1'), (1466, 'Apex', 'n1466', 'tag2'), (1467, 'Zebulon', 'n1467', 'tag0'), (1468, 'Chapel Hill', 'n1468', 'tag1'), (1469, 'Wake Forest', 'n1469', 'tag2'), (1470, 'Durham', 'n1470', 'tag0'), (1471, 'Raleigh', 'n1471', 'tag1'), (1472, 'Cary', 'n1472', 'tag2'), (1473, 'Apex', 'n1473', 'tag0'), (1474, 'Zebulon', 'n1474', 'tag1'), (1475, 'Chapel Hill', 'n1475', 'tag2'), (1476, 'Wake Forest', 'n1476', 'tag0'), (1477, 'Durham', 'n1477', 'tag1'), (1478, 'Raleigh', 'n1478', 'tag2'), (1479, 'Cary', 'n1479', 'tag0'), (1480, 'Apex', 'n1480', 'tag1'), (1481, 'Zebulon', 'n1481', 'tag2'), (1482, 'Chapel Hill', 'n1482', 'tag0'), (1483, 'Wake Forest', 'n1483', 'tag1'), (1484, 'Durham', 'n1484', 'tag2'), (1485, 'Raleigh', 'n1485', 'tag0'), (1486, 'Cary', 'n1486', 'tag1'), (1487, 'Apex', 'n1487', 'tag2'), (1488, 'Zebulon', 'n1488', 'tag0'), (1489, 'Chapel Hill', 'n1489', 'tag1'), (1490, 'Wake Forest', 'n1490', 'tag2'), (1491, 'Durham', 'n1491', 'tag0'), (1492, 'Raleigh', 'n1492', 'tag1'), (1493, 'Cary', 'n1493', 'tag2'), (1494, 'Apex', 'n1494', 'tag0'), (1495, 'Zebulon', 'n1495', 'tag1'), (1496, 'Chapel Hill', 'n1496', 'tag2'), (1497, 'Wake Forest', 'n1497', 'tag0'), (1498, 'Durham', 'n1498', 'tag1'), (1499, 'Raleigh', 'n1499', 'tag2');
+CREATE TABLE S(K INT, CITY VARCHAR, PRIMARY KEY(K)) WITH (dictionary='city');
+INSERT INTO S VALUES (0, 'Durham'), (1, 'Apex'), (2, 'Wake Forest'), (3, 'Cary'), (4, 'Chapel Hill'), (5, 'Raleigh'), (6, 'Zebulon'), (7, 'Durham'), (8, 'Apex'), (9, 'Wake Forest'), (10, 'Cary'), (11, 'Chapel Hill'), (12, 'Raleigh'), (13, 'Zebulon'), (14, 'Durham'), (15, 'Apex'), (16, 'Wake Forest'), (17, 'Cary'), (18, 'Chapel Hill'), (19, 'Raleigh'), (20, 'Zebulon'), (21, 'Durham'), (22, 'Apex'), (23, 'Wake Forest'), (24, 'Cary'), (25, 'Chapel Hill'), (26, 'Raleigh'), (27, 'Zebulon'), (28, 'Durham'), (29, 'Apex'), (30, 'Wake Forest'), (31, 'Cary'), (32, 'Chapel Hill'), (33, 'Raleigh'), (34, 'Zebulon'), (35, 'Durham'), (36, 'Apex'), (37, 'Wake Forest'), (38, 'Cary'), (39, 'Chapel Hill');
+CREATE TABLE T(CITY VARCHAR, POP INT);
+INSERT INTO T VALUES ('Durham', 6000), ('Raleigh', 7000), ('Cary', 4000), ('Apex', 4000), ('Zebulon', 7000), ('Chapel Hill', 11000), ('Wake Forest', 0);
+CREATE INDEX RCITY ON R(CITY);
+SELECT A, NOTE FROM R WHERE CITY = 'Apex' AND A < 100;
+SELECT A, CITY FROM R WHERE CITY > 'Durham' AND A >= 1490;
+SELECT CITY, TAG, COUNT(*) FROM R GROUP BY CITY, TAG;
+SELECT S.K, T.POP FROM S, T WHERE S.CITY = T.CITY;
+SELECT R.A, S.K FROM R, S WHERE R.CITY = S.CITY AND R.A < 20 AND S.K < 5;
+SELECT A FROM R WHERE CITY = 'Nowhere';
+INSERT INTO R VALUES (2000, 'Nowhere', 'x', 'tag9'), (2001, 'Durham', 'y', 'tag9');
+SELECT A, CITY, TAG FROM R WHERE A >= 2000;
+SELECT A FROM R WHERE TAG = 'tag9';
+DELETE FROM R WHERE CITY = 'Cary';
+SELECT CITY, COUNT(*) FROM R GROUP BY CITY;
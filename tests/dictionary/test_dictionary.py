@@ -0,0 +1,36 @@
+import pytest
+import subprocess
+
+testcase_dir = "tests/dictionary/"
+T = 1
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_dictionary_{t_id}")
+
+def test_codes_rolled_back(run, capsys):
+    # codes assigned by a transaction that rolls back are forgotten, and assigned to other strings later:
+    subprocess.run(['make', 'clean'], check=True)
+    for r in run("CREATE TABLE R(A INT, B VARCHAR) WITH (dictionary='b');" +
+                 "INSERT INTO R VALUES (0, 'zero');" +
+                 "SET AUTOCOMMIT OFF;" +
+                 "INSERT INTO R VALUES (1, 'one'), (2, 'two');" +
+                 "ROLLBACK;" +
+                 "INSERT INTO R VALUES (3, 'three'), (4, 'zero');" +
+                 "COMMIT;" +
+                 "SET AUTOCOMMIT ON;"):
+        assert r.error is None, r.error_details
+    capsys.readouterr()
+    r, = run('SELECT * FROM R;')
+    assert r.error is None
+    assert sorted(capsys.readouterr().out.split("\n")[1:-1]) == ["(0, 'zero')", "(3, 'three')", "(4, 'zero')"]
+
+@pytest.mark.parametrize("sql", [
+    "CREATE TABLE R(A INT, B VARCHAR) WITH (dictionary='a');",
+    "CREATE TABLE R(A INT, B VARCHAR) WITH (dictionary='c');",
+    "CREATE TABLE R(A INT, B VARCHAR, PRIMARY KEY(B)) WITH (dictionary='b');",
+])
+def test_invalid_dictionary_column(run, sql):
+    subprocess.run(['make', 'clean'], check=True)
+    r, = run(sql)
+    assert r.error is not None
@@ -0,0 +1,21 @@
+CREATE TABLE R(A INT, B INT, C VARCHAR, PRIMARY KEY(A));
+INSERT INTO R VALUES (0, 0, 'v0'), (1, 1, 'v1'), (2, 2, 'v2'), (3, 3, 'v3'), (4, 4, 'v4'), (5, 5, 'v5'), (6, 6, 'v6'), (7, 7, 'v7'), (8, 8, 'v8'), (9, 9, 'v9'), (10, 10, 'v10'), (11, 11, 'v11'), (12, 12, 'v12'), (13, 13, 'v13'), (14, 14, 'v14'), (15, 15, 'v15'), (16, 16, 'v16'), (17, 0, 'v17'), (18, 1, 'v18'), (19, 2, 'v19'), (20, 3, 'v20'), (21, 4, 'v21'), (22, 5, 'v22'), (23, 6, 'v0'), (24, 7, 'v1'), (25, 8, 'v2'), (26, 9, 'v3'), (27, 10, 'v4'), (28, 11, 'v5'), (29, 12, 'v6'), (30, 13, 'v7'), (31, 14, 'v8'), (32, 15, 'v9'), (33, 16, 'v10'), (34, 0, 'v11'), (35, 1, 'v12'), (36, 2, 'v13'), (37, 3, 'v14'), (38, 4, 'v15'), (39, 5, 'v16'), (40, 6, 'v17'), (41, 7, 'v18'), (42, 8, 'v19'), (43, 9, 'v20'), (44, 10, 'v21'), (45, 11, 'v22'), (46, 12, 'v0'), (47, 13, 'v1'), (48, 14, 'v2'), (49, 15, 'v3'), (50, 16, 'v4'), (51, 0, 'v5'), (52, 1, 'v6'), (53, 2, 'v7'), (54, 3, 'v8'), (55, 4, 'v9'), (56, 5, 'v10'), (57, 6, 'v11'), (58, 7, 'v12'), (59, 8, 'v13'), (60, 9, 'v14'), (61, 10, 'v15'), (62, 11, 'v16'), (63, 12, 'v17'), (64, 13, 'v18'), (65, 14, 'v19'), (66, 15, 'v20'), (67, 16, 'v21'), (68, 0, 'v22'), (69, 1, 'v0'), (70, 2, 'v1'), (71, 3, 'v2'), (72, 4, 'v3'), (73, 5, 'v4'), (74, 6, 'v5'), (75, 7, 'v6'), (76, 8, 'v7'), (77, 9, 'v8'), (78, 10, 'v9'), (79, 11, 'v10'), (80, 12, 'v11'), (81, 13, 'v12'), (82, 14, 'v13'), (83, 15, 'v14'), (84, 16, 'v15'), (85, 0, 'v16'), (86, 1, 'v17'), (87, 2, 'v18'), (88, 3, 'v19'), (89, 4, 'v20'), (90, 5, 'v21'), (91, 6, 'v22'), (92, 7, 'v0'), (93, 8, 'v1'), (94, 9, 'v2'), (95, 10, 'v3'), (96, 11, 'v4'), (97, 12, 'v5'), (98, 13, 'v6'), (99, 14, 'v7'), (100, 15, 'v8'), (101, 16, 'v9'), (102, 0, 'v10'), (103, 1, 'v11'), (104, 2, 'v12'), (105, 3, 'v13'), (106, 4, 'v14'), (107, 5, 'v15'), (108, 6, 'v16'), (109, 7, 'v17'), (110, 8, 'v18'), (111, 9, 'v19'), (112, 10, 'v20'), (113, 11, 'v21'), (114, 12, 'v22'), (115, 13, 'v0'), (116, 14, 'v1'), (117, 15, 'v2'), (118, 16, 'v3'), (119, 0, 'v4'), (120, 1, 'v5'), (121, 2, 'v6'), (122, 3, 'v7'), (123, 4, 'v8'), (124, 5, 'v9'), (125, 6, 'v10'), (126, 7, 'v11'), (127, 8, 'v12'), (128, 9, 'v13'), (129, 10, 'v14'), (130, 11, 'v15'), (131, 12, 'v16'), (132, 13, 'v17'), (133, 14, 'v18'), (134, 15, 'v19'), (135, 16, 'v20'), (136, 0, 'v21'), (137, 1, 'v22'), (138, 2, 'v0'), (139, 3, 'v1'), (140, 4, 'v2'), (141, 5, 'v3'), (142, 6, 'v4'), (143, 7, 'v5'), (144, 8, 'v6'), (145, 9, 'v7'), (146, 10, 'v8'), (147, 11, 'v9'), (148, 12, 'v10'), (149, 13, 'v11'), (150, 14, 'v12'), (151, 15, 'v13'), (152, 16, 'v14'), (153, 0, 'v15'), (154, 1, 'v16'), (155, 2, 'v17'), (156, 3, 'v18'), (157, 4, 'v19'), (158, 5, 'v20'), (159, 6, 'v21'), (160, 7, 'v22'), (161, 8, 'v0'), (162, 9, 'v1'), (163, 10, 'v2'), (164, 11, 'v3'), (165, 12, 'v4'), (166, 13, 'v5'), (167, 14, 'v6'), (168, 15, 'v7'), (169, 16, 'v8'), (170, 0, 'v9'), (171, 1, 'v10'), (172, 2, 'v11'), (173, 3, 'v12'), (174, 4, 'v13'), (175, 5, 'v14'), (176, 6, 'v15'), (177, 7, 'v16'), (178, 8, 'v17'), (179, 9, 'v18'), (180, 10, 'v19'), (181, 11, 'v20'), (182, 12, 'v21'), (183, 13, 'v22'), (184, 14, 'v0'), (185, 15, 'v1'), (186, 16, 'v2'), (187, 0, 'v3'), (188, 1, 'v4'), (189, 2, 'v5'), (190, 3, 'v6'), (191, 4, 'v7'), (192, 5, 'v8'), (193, 6, 'v9'), (194, 7, 'v10'), (195, 8, 'v11'), (196, 9, 'v12'), (197, 10, 'v13'), (198, 11, 'v14'), (199, 12, 'v15'), (200, 13, 'v16'), (201, 14, 'v17'), (202, 15, 'v18'), (203, 16, 'v19'), (204, 0, 'v20'), (205, 1, 'v21'), (206, 2, 'v22'), (207, 3, 'v0'), (208, 4, 'v1'), (209, 5, 'v2'), (210, 6, 'v3'), (211, 7, 'v4'), (212, 8, 'v5'), (213, 9, 'v6'), (214, 10, 'v7'), (215, 11, 'v8'), (216, 12, 'v9'), (217, 13, 'v10'), (218, 14, 'v11'), (219, 15, 'v12'), (220, 16, 'v13'), (221, 0, 'v14'), (222, 1, 'v15'), (223, 2, 'v16'), (224, 3, 'v17'), (225, 4, 'v18'), (226, 5, 'v19'), (227, 6, 'v20'), (228, 7, 'v21'), (229, 8, 'v22'), (230, 9, 'v0'), (231, 10, 'v1'), (232, 11, 'v2'), (233, 12, 'v3'), (234, 13, 'v4'), (235, 14, 'v5'), (236, 15, 'v6'), (237, 16, 'v7'), (238, 0, 'v8'), (239, 1, 'v9'), (240, 2, 'v10'), (241, 3, 'v11'), (242, 4, 'v12'), (243, 5, 'v13'), (244, 6, 'v14'), (245, 7, 'v15'), (246, 8, 'v16'), (247, 9, 'v17'), (248, 10, 'v18'), (249, 11, 'v19'), (250, 12, 'v20'), (251, 13, 'v21'), (252, 14, 'v22'), (253, 15, 'v0'), (254, 16, 'v1'), (255, 0, 'v2'), (256, 1, 'v3'), (257, 2, 'v4'), (258, 3, 'v5'), (259, 4, 'v6'), (260, 5, 'v7'), (261, 6, 'v8'), (262, 7, 'v9'), (263, 8, 'v10'), (264, 9, 'v11'), (265, 10, 'v12'), (266, 11, 'v13'), (267, 12, 'v14'), (268, 13, 'v15'), (269, 14, 'v16'), (270, 15, 'v17'), (271, 16, 'v18'), (272, 0, 'v19'), (273, 1, 'v20'), (274, 2, 'v21'), (275, 3, 'v22'), (276, 4, 'v0'), (277, 5, 'v1'), (278, 6, 'v2'), (279, 7, 'v3'), (280, 8, 'v4'), (281, 9, 'v5'), (282, 10, 'v6'), (283, 11, 'v7'), (284, 12, 'v8'), (285, 13, 'v9'), (286, 14, 'v10'), (287, 15, 'v11'), (288, 16, 'v12'), (289, 0, 'v13'), (290, 1, 'v14'), (291, 2, 'v15'), (292, 3, 'v16'), (293, 4, 'v17'), (294, 5, 'v18'), (295, 6, 'v19'), (296, 7, 'v20'), (297, 8, 'v21'), (298, 9, 'v22'), (299, 10, 'v0'), (300, 11, 'v1'), (301, 12, 'v2'), (302, 13, 'v3'), (303, 14, 'v4'), (304, 15, 'v5'), (305, 16, 'v6'), (306, 0, 'v7'), (307, 1, 'v8'), (308, 2, 'v9'), (309, 3, 'v10'), (310, 4, 'v11'), (311, 5, 'v12'), (312, 6, 'v13'), (313, 7, 'v14'), (314, 8, 'v15'), (315, 9, 'v16'), (316, 10, 'v17'), (317, 11, 'v18'), (318, 12, 'v19'), (319, 13, 'v20'), (320, 14, 'v21'), (321, 15, 'v22'), (322, 16, 'v0'), (323, 0, 'v1'), (324, 1, 'v2'), (325, 2, 'v3'), (326, 3, 'v4'), (327, 4, 'v5'), (328, 5, 'v6'), (329, 6, 'v7'), (330, 7, 'v8'), (331, 8, 'v9'), (332, 9, 'v10'), (333, 10, 'v11'), (334, 11, 'v12'), (335, 12, 'v13'), (336, 13, 'v14'), (337, 14, 'v15'), (338, 15, 'v16'), (339, 16, 'v17'), (340, 0, 'v18'), (341, 1, 'v19'), (342, 2, 'v20'), (343, 3, 'v21'), (344, 4, 'v22'), (345, 5, 'v0'), (346, 6, 'v1'), (347, 7, 'v2'), (348, 8, 'v3'), (349, 9, 'v4'), (350, 10, 'v5'), (351, 11, 'v6'), (352, 12, 'v7'), (353, 13, 'v8'), (354, 14, 'v9'), (355, 15, 'v10'), (356, 16, 'v11'), (357, 0, 'v12'), (358, 1, 'v13'), (359, 2, 'v14'), (360, 3, 'v15'), (361, 4, 'v16'), (362, 5, 'v17'), (363, 6, 'v18'), (364, 7, 'v19'), (365, 8, 'v20'), (366, 9, 'v21'), (367, 10, 'v22'), (368, 11, 'v0'), (369, 12, 'v1'), (370, 13, 'v2'), (371, 14, 'v3'), (372, 15, 'v4'), (373, 16, 'v5'), (374, 0, 'v6'), (375, 1, 'v7'), (376, 2, 'v8'), (377, 3, 'v9'), (378, 4, 'v10'), (379, 5, 'v11'), (380, 6, 'v12'), (381, 7, 'v13'), (382, 8, 'v14'), (383, 9, 'v15'), (384, 10, 'v16'), (385, 11, 'v17'), (386, 12, 'v18'), (387, 13, 'v19'), (388, 14, 'v20'), (389, 15, 'v21'), (390, 16, 'v22'), (391, 0, 'v0'), (392, 1, 'v1'), (393, 2, 'v2'), (394, 3, 'v3'), (395, 4, 'v4'), (396, 5, 'v5'), (397, 6, 'v6'), (398, 7, 'v7'), (399, 8, 'v8'), (400, 9, 'v9'), (401, 10, 'v10'), (402, 11, 'v11'), (403, 12, 'v12'), (404, 13, 'v13'), (405, 14, 'v14'), (406, 15, 'v15'), (407, 16, 'v16'), (408, 0, 'v17'), (409, 1, 'v18'), (410, 2, 'v19'), (411, 3, 'v20'), (412, 4, 'v21'), (413, 5, 'v22'), (414, 6, 'v0'), (415, 7, 'v1'), (416, 8, 'v2'), (417, 9, 'v3'), (418, 10, 'v4'), (419, 11, 'v5'), (420, 12, 'v6'), (421, 13, 'v7'), (422, 14, 'v8'), (423, 15, 'v9'), (424, 16, 'v10'), (425, 0, 'v11'), (426, 1, 'v12'), (427, 2, 'v13'), (428, 3, 'v14'), (429, 4, 'v15'), (430, 5, 'v16'), (431, 6, 'v17'), (432, 7, 'v18'), (433, 8, 'v19'), (434, 9, 'v20'), (435, 10, 'v21'), (436, 11, 'v22'), (437, 12, 'v0'), (438, 13, 'v1'), (439, 14, 'v2'), (440, 15, 'v3'), (441, 16, 'v4'), (442, 0, 'v5'), (443, 1, 'v6'), (444, 2, 'v7'), (445, 3, 'v8'), (446, 4, 'v9'), (447, 5, 'v10'), (448, 6, 'v11'), (449, 7, 'v12'), (450, 8, 'v13'), (451, 9, 'v14'), (452, 10, 'v15'), (453, 11, 'v16'), (454, 12, 'v17'), (455, 13, 'v18'), (456, 14, 'v19'), (457, 15, 'v20'), (458, 16, 'v21'), (459, 0, 'v22'), (460, 1, 'v0'), (461, 2, 'v1'), (462, 3, 'v2'), (463, 4, 'v3'), (464, 5, 'v4'), (465, 6, 'v5'), (466, 7, 'v6'), (467, 8, 'v7'), (468, 9, 'v8'), (469, 10, 'v9'), (470, 11, 'v10'), (471, 12, 'v11'), (472, 13, 'v12'), (473, 14, 'v13'), (474, 15, 'v14'), (475, 16, 'v15'), (476, 0, 'v16'), (477, 1, 'v17'), (478, 2, 'v18'), (479, 3, 'v19'), (480, 4, 'v20'), (481, 5, 'v21'), (482, 6, 'v22'), (483, 7, 'v0'), (484, 8, 'v1'), (485, 9, 'v2'), (486, 10, 'v3'), (487, 11, 'v4'), (488, 12, 'v5'), (489, 13, 'v6'), (490, 14, 'v7'), (491, 15, 'v8'), (492, 16, 'v9'), (493, 0, 'v10'), (494, 1, 'v11'), (495, 2, 'v12'), (496, 3, 'v13'), (497, 4, 'v14'), (498, 5, 'v15'), (499, 6, 'v16'), (500, 7, 'v17'), (501, 8, 'v18'), (502, 9, 'v19'), (503, 10, 'v20'), (504, 11, 'v21'), (505, 12, 'v22'), (506, 13, 'v0'), (507, 14, 'v1'), (508, 15, 'v2'), (509, 16, 'v3'), (510, 0, 'v4'), (511, 1, 'v5'), (512, 2, 'v6'), (513, 3, 'v7'), (514, 4, 'v8'), (515, 5, 'v9'), (516, 6, 'v10'), (517, 7, 'v11'), (518, 8, 'v12'), (519, 9, 'v13'), (520, 10, 'v14'), (521, 11, 'v15'), (522, 12, 'v16'), (523, 13, 'v17'), (524, 14, 'v18'), (525, 15, 'v19'), (526, 16, 'v20'), (527, 0, 'v21'), (528, 1, 'v22'), (529, 2, 'v0'), (530, 3, 'v1'), (531, 4, 'v2'), (532, 5, 'v3'), (533, 6, 'v4'), (534, 7, 'v5'), (535, 8, 'v6'), (536, 9, 'v7'), (537, 10, 'v8'), (538, 11, 'v9'), (539, 12, 'v10'), (540, 13, 'v11'), (541, 14, 'v12'), (542, 15, 'v13'), (543, 16, 'v14'), (544, 0, 'v15'), (545, 1, 'v16'), (546, 2, 'v17'), (547, 3, 'v18'), (548, 4, 'v19'), (549, 5, 'v20'), (550, 6, 'v21'), (551, 7, 'v22'), (552, 8, 'v0'), (553, 9, 'v1'), (554, 10, 'v2'), (555, 11, 'v3'), (556, 12, 'v4'), (557, 13, 'v5'), (558, 14, 'v6'), (559, 15, 'v7'), (560, 16, 'v8'), (561, 0, 'v9'), (562, 1, 'v10'), (563, 2, 'v11'), (564, 3, 'v12'), (565, 4, 'v13'), (566, 5, 'v14'), (567, 6, 'v15'), (568, 7, 'v16'), (569, 8, 'v17'), (570, 9, 'v18'), (571, 10, 'v19'), (572, 11, 'v20'), (573, 12, 'v21'), (574, 13, 'v22'), (575, 14, 'v0'), (576, 15, 'v1'), (577, 16, 'v2'), (578, 0, 'v3'), (579, 1, 'v4'), (580, 2, 'v5'), (581, 3, 'v6'), (582, 4, 'v7'), (583, 5, 'v8'), (584, 6, 'v9'), (585, 7, 'v10'), (586, 8, 'v11'), (587, 9, 'v12'), (588, 10, 'v13'), (589, 11, 'v14'), (590, 12, 'v15'), (591, 13, 'v16'), (592, 14, 'v17'), (593, 15, 'v18'), (594, 16, 'v19'), (595, 0, 'v20'), (596, 1, 'v21'), (597, 2, 'v22'), (598, 3, 'v0'), (599, 4, 'v1'), (600, 5, 'v2'), (601, 6, 'v3'), (602, 7, 'v4'), (603, 8, 'v5'), (604, 9, 'v6'), (605, 10, 'v7'), (606, 11, 'v8'), (607, 12, 'v9'), (608, 13, 'v10'), (609, 14, 'v11'), (610, 15, 'v12'), (611, 16, 'v13'), (612, 0, 'v14'), (613, 1, 'v15'), (614, 2, 'v16'), (615, 3, 'v17'), (616, 4, 'v18'), (617, 5, 'v19'), (618, 6, 'v20'), (619, 7, 'v21'), (620, 8, 'v22'), (621, 9, 'v0'), (622, 10, 'v1'), (623, 11, 'v2'), (624, 12, 'v3'), (625, 13, 'v4'), (626, 14, 'v5'), (627, 15, 'v6'), (628, 16, 'v7'), (629, 0, 'v8'), (630, 1, 'v9'), (631, 2, 'v10'), (632, 3, 'v11'), (633, 4, 'v12'), (634, 5, 'v13'), (635, 6, 'v14'), (636, 7, 'v15'), (637, 8, 'v16'), (638, 9, 'v17'), (639, 10, 'v18'), (640, 11, 'v19'), (641, 12, 'v20'), (642, 13, 'v21'), (643, 14, 'v22'), (644, 15, 'v0'), (645, 16, 'v1'), (646, 0, 'v2'), (647, 1, 'v3'), (648, 2, 'v4'), (649, 3, 'v5'), (650, 4, 'v6'), (651, 5, 'v7'), (652, 6, 'v8'), (653, 7, 'v9'), (654, 8, 'v10'), (655, 9, 'v11'), (656, 10, 'v12'), (657, 11, 'v13'), (658, 12, 'v14'), (659, 13, 'v15'), (660, 14, 'v16'), (661, 15, 'v17'), (662, 16, 'v18'), (663, 0, 'v19'), (664, 1, 'v20'), (665, 2, 'v21'), (666, 3, 'v22'), (667, 4, 'v0'), (668, 5, 'v1'), (669, 6, 'v2'), (670, 7, 'v3'), (671, 8, 'v4'), (672, 9, 'v5'), (673, 10, 'v6'), (674, 11, 'v7'), (675, 12, 'v8'), (676, 13, 'v9'), (677, 14, 'v10'), (678, 15, 'v11'), (679, 16, 'v12'), (680, 0, 'v13'), (681, 1, 'v14'), (682, 2, 'v15'), (683, 3, 'v16'), (684, 4, 'v17'), (685, 5, 'v18'), (686, 6, 'v19'), (687, 7, 'v20'), (688, 8, 'v21'), (689, 9, 'v22'), (690, 10, 'v0'), (691, 11, 'v1'), (692, 12, 'v2'), (693, 13, 'v3'), (694, 14, 'v4'), (695, 15, 'v5'), (696, 16, 'v6'), (697, 0, 'v7'), (698, 1, 'v8'), (699, 2, 'v9'), (700, 3, 'v10'), (701, 4, 'v11'), (702, 5, 'v12'), (703, 6, 'v13'), (704, 7, 'v14'), (705, 8, 'v15'), (706, 9, 'v16'), (707, 10, 'v17'), (708, 11, 'v18'), (709, 12, 'v19'), (710, 13, 'v20'), (711, 14, 'v21'), (712, 15, 'v22'), (713, 16, 'v0'), (714, 0, 'v1'), (715, 1, 'v2'), (716, 2, 'v3'), (717, 3, 'v4'), (718, 4, 'v5'), (719, 5, 'v6'), (720, 6, 'v7'), (721, 7, 'v8'), (722, 8, 'v9'), (723, 9, 'v10'), (724, 10, 'v11'), (725, 11, 'v12'), (726, 12, 'v13'), (727, 13, 'v14'), (728, 14, 'v15'), (729, 15, 'v16'), (730, 16, 'v17'), (731, 0, 'v18'), (732, 1, 'v19'), (733, 2, 'v20'), (734, 3, 'v21'), (735, 4, 'v22'), (736, 5, 'v0'), (737, 6, 'v1'), (738, 7, 'v2'), (739, 8, 'v3'), (740, 9, 'v4'), (741, 10, 'v5'), (742, 11, 'v6'), (743, 12, 'v7'), (744, 13, 'v8'), (745, 14, 'v9'), (746, 15, 'v10'), (747, 16, 'v11'), (748, 0, 'v12'), (749, 1, 'v13'), (750, 2, 'v14'), (751, 3, 'v15'), (752, 4, 'v16'), (753, 5, 'v17'), (754, 6, 'v18'), (755, 7, 'v19'), (756, 8, 'v20'), (757, 9, 'v21'), (758, 10, 'v22'), (759, 11, 'v0'), (760, 12, 'v1'), (761, 13, 'v2'), (762, 14, 'v3'), (763, 15, 'v4'), (764, 16, 'v5'), (765, 0, 'v6'), (766, 1, 'v7'), (767, 2, 'v8'), (768, 3, 'v9'), (769, 4, 'v10'), (770, 5, 'v11'), (771, 6, 'v12'), (772, 7, 'v13'), (773, 8, 'v14'), (774, 9, 'v15'), (775, 10, 'v16'), (776, 11, 'v17'), (777, 12, 'v18'), (778, 13, 'v19'), (779, 14, 'v20'), (780, 15, 'v21'), (781, 16, 'v22'), (782, 0, 'v0'), (783, 1, 'v1'), (784, 2, 'v2'), (785, 3, 'v3'), (786, 4, 'v4'), (787, 5, 'v5'), (788, 6, 'v6'), (789, 7, 'v7'), (790, 8, 'v8'), (791, 9, 'v9'), (792, 10, 'v10'), (793, 11, 'v11'), (794, 12, 'v12'), (795, 13, 'v13'), (796, 14, 'v14'), (797, 15, 'v15'), (798, 16, 'v16'), (799, 0, 'v17');
+SET DURABILITY NONE;
+INSERT INTO R VALUES (1000, 1, 'none'), (1001, 2, 'none');
+DELETE FROM R WHERE B = 3;
+SELECT R.A, R.C FROM R WHERE B = 1;
+SET AUTOCOMMIT OFF;
+INSERT INTO R VALUES (2000, 1, 'txn');
+DELETE FROM R WHERE A < 100;
+COMMIT;
+SET DURABILITY FULL;
+INSERT INTO R VALUES (3000, 1, 'full');
+ROLLBACK;
+INSERT INTO R VALUES (3001, 1, 'full');
+COMMIT;
+SET AUTOCOMMIT ON;
+SET DURABILITY DEFAULT;
+CREATE INDEX ON R(C);
+SELECT R.A, R.B FROM R WHERE C = 'v5';
+SELECT R.A, R.C FROM R WHERE B = 1;
+SELECT B, COUNT(*) FROM R GROUP BY B;
@@ -0,0 +1,81 @@
+import pytest
+import subprocess
+
+from ddb.db import DatabaseManager
+from ddb.session import Session
+from ddb.storage import StorageMangerException
+
+testcase_dir = "tests/durability/"
+T = 1
+
+@pytest.fixture(params=[
+    dict(durability='full'),
+    dict(durability='none'),
+    dict(durability='full', readahead=False),
+    dict(durability='none', readahead=False),
+], ids=lambda params: ','.join(f'{k}={v}' for k, v in params.items()))
+def session(request):
+    # results do not depend on when (or how) commits reach the disk:
+    dbm = DatabaseManager(
+        db_dir = DatabaseManager.DEFAULT_DB_DIR,
+        tmp_dir = DatabaseManager.DEFAULT_TMP_DIR,
+        **request.param
+    )
+    s = Session(dbm)
+    yield s
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_durability_{t_id}")
+
+class CountingEnvironment:
+    """Stands in for an LMDB environment, counting calls to ``sync`` and passing everything through.
+    """
+    def __init__(self, env):
+        self.env = env
+        self.syncs = 0
+
+    def sync(self, force=False):
+        self.syncs += 1
+        return self.env.sync(force)
+
+    def __getattr__(self, name):
+        return getattr(self.env, name)
+
+@pytest.mark.parametrize("setting,synced", [
+    ("DEFAULT", None),
+    ("FULL", True),
+    ("NONE", False),
+])
+def test_commit_synced(session, run, monkeypatch, setting, synced):
+    # a top-level read/write commit is synced to disk only under full durability;
+    # nested commits within a transaction never are:
+    subprocess.run(['make', 'clean'], check=True)
+    if synced is None:
+        synced = session.dbm.sm.durability == 'full'
+    env = CountingEnvironment(session.dbm.sm.env)
+    monkeypatch.setattr(session.dbm.sm, 'env', env)
+    for r in run(f'SET DURABILITY {setting};' +
+                 'CREATE TABLE R(A INT, B INT);'):
+        assert r.error is None, r.error_details
+    env.syncs = 0
+    r, = run('INSERT INTO R VALUES (1, 1);')
+    assert r.error is None, r.error_details
+    assert env.syncs == (1 if synced else 0)
+    r, = run('SET AUTOCOMMIT OFF;')
+    assert r.error is None, r.error_details
+    env.syncs = 0
+    for r in run('INSERT INTO R VALUES (2, 2);' +
+                 'DELETE FROM R WHERE A = 1;'):
+        assert r.error is None, r.error_details
+    assert env.syncs == 0
+    r, = run('COMMIT;')
+    assert r.error is None, r.error_details
+    assert env.syncs == (1 if synced else 0)
+    r, = run('SET AUTOCOMMIT ON;')
+    assert r.error is None, r.error_details
+
+def test_invalid_durability():
+    with pytest.raises(StorageMangerException):
+        DatabaseManager(db_dir = DatabaseManager.DEFAULT_DB_DIR, tmp_dir = DatabaseManager.DEFAULT_TMP_DIR,
+                        durability = 'some')
@@ -0,0 +1,21 @@
+SET AUTOCOMMIT OFF;
+CREATE TABLE R(A INT, B INT, C VARCHAR);
+INSERT INTO R VALUES (1, 1, 'a'), (2, 2, 'b');
+CREATE INDEX ON R(B);
+SELECT R.A FROM R WHERE B = 2;
+ROLLBACK;
+CREATE TABLE R(A INT, B VARCHAR, PRIMARY KEY(A));
+INSERT INTO R VALUES (5, 'x'), (6, 'y');
+CREATE INDEX ON R(B);
+SELECT R.A FROM R WHERE B = 'y';
+COMMIT;
+CREATE TABLE S(K INT, V INT);
+INSERT INTO S VALUES (1, 5);
+ROLLBACK;
+SET AUTOCOMMIT ON;
+CREATE TABLE S(K INT, V INT);
+INSERT INTO S VALUES (2, 6), (3, 5);
+SELECT R.A, S.K FROM R, S WHERE R.A = S.V;
+CREATE INDEX ON S(K);
+SELECT S.K, S.V FROM S WHERE K = 3;
+SELECT R.A, R.B FROM R WHERE B = 'x';
@@ -0,0 +1,70 @@
+import pytest
+import subprocess
+
+from ddb.primitives import ValType
+
+testcase_dir = "tests/handles/"
+T = 1
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_handles_{t_id}")
+
+class CountingEnvironment:
+    """Stands in for an LMDB environment, counting calls to ``open_db`` and passing everything through.
+    """
+    def __init__(self, env):
+        self.env = env
+        self.opens = 0
+
+    def open_db(self, *args, **kwargs):
+        self.opens += 1
+        return self.env.open_db(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.env, name)
+
+def open_file(dbm, tx, name):
+    with dbm.sm.heap_file(tx, name, [ValType.INTEGER], create_if_not_exists=True) as f:
+        f.put((1, ))
+        return f._file_key()
+
+def test_handle_ownership(session, monkeypatch):
+    # a handle is reused by the transaction that opened it and those nested therein,
+    # shared by all once committed at the top level, and forgotten once aborted:
+    subprocess.run(['make', 'clean'], check=True)
+    dbm = session.dbm
+    registry = dbm.sm.handles
+    env = CountingEnvironment(registry.env)
+    monkeypatch.setattr(registry, 'env', env)
+    with dbm.tm.begin_transaction() as tx:
+        key = open_file(dbm, tx, 'committed')
+        assert env.opens == 1 and not registry.is_shared(key)
+        with dbm.tm.begin_transaction(parent=tx) as child:
+            open_file(dbm, child, 'committed')
+            child_key = open_file(dbm, child, 'child')
+            child.commit()
+        assert env.opens == 2 and registry.handles[child_key][1] is tx
+        with dbm.tm.begin_transaction(parent=tx) as child:
+            aborted_key = open_file(dbm, child, 'aborted')
+            child.abort()
+        assert aborted_key not in registry.handles
+        tx.commit()
+    assert registry.is_shared(key) and registry.is_shared(child_key)
+    with dbm.tm.begin_transaction() as tx:
+        open_file(dbm, tx, 'committed')
+        open_file(dbm, tx, 'child')
+        assert env.opens == 3
+        rolled_back_key = open_file(dbm, tx, 'rolled back')
+        tx.abort()
+    assert env.opens == 4 and rolled_back_key not in registry.handles
+    with dbm.tm.begin_transaction() as tx:
+        # the file was never created, so it has to be created (and its handle opened) again:
+        assert open_file(dbm, tx, 'rolled back') == rolled_back_key
+        with dbm.sm.heap_file(tx, 'rolled back', [ValType.INTEGER]) as f:
+            assert list(f.iter_scan()) == [(1, )]
+        assert env.opens == 5
+        # deleting a file closes its handle:
+        assert dbm.sm.delete_heap_file(tx, 'committed') == 1
+        assert key not in registry.handles
+        tx.commit()
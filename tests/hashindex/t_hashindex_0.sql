@@ -0,0 +1,21 @@
+CREATE TABLE R(A INT, B INT, C VARCHAR, D FLOAT);
+CREATE INDEX ON R USING HASH (B);
+INSERT INTO R VALUES (0, 0, 'n0', 0.0), (1, 13, 'n1', 0.25), (2, 26, 'n2', 0.5), (3, 39, 'n3', 0.75), (4, 52, 'n4', 1.0), (5, 65, 'n5', 1.25), (6, 78, 'n6', 1.5), (7, 91, 'n7', 1.75), (8, 7, 'n8', 2.0), (9, 20, 'n9', 2.25), (10, 33, 'n10', 2.5), (11, 46, 'n11', 2.75), (12, 59, 'n12', 3.0), (13, 72, 'n13', 3.25), (14, 85, 'n14', 3.5), (15, 1, 'n15', 3.75), (16, 14, 'n16', 4.0), (17, 27, 'n17', 4.25), (18, 40, 'n18', 4.5), (19, 53, 'n19', 4.75), (20, 66, 'n20', 5.0), (21, 79, 'n21', 5.25), (22, 92, 'n22', 5.5), (23, 8, 'n23', 5.75), (24, 21, 'n24', 6.0), (25, 34, 'n25', 6.25), (26, 47, 'n26', 6.5), (27, 60, 'n27', 6.75), (28, 73, 'n28', 7.0), (29, 86, 'n29', 7.25), (30, 2, 'n30', 7.5), (31, 15, 'n31', 7.75), (32, 28, 'n32', 8.0), (33, 41, 'n33', 8.25), (34, 54, 'n34', 8.5), (35, 67, 'n35', 8.75), (36, 80, 'n36', 9.0), (37, 93, 'n37', 9.25), (38, 9, 'n38', 9.5), (39, 22, 'n39', 9.75), (40, 35, 'n40', 10.0), (41, 48, 'n0', 10.25), (42, 61, 'n1', 10.5), (43, 74, 'n2', 10.75), (44, 87, 'n3', 11.0), (45, 3, 'n4', 11.25), (46, 16, 'n5', 11.5), (47, 29, 'n6', 11.75), (48, 42, 'n7', 12.0), (49, 55, 'n8', 12.25), (50, 68, 'n9', 12.5), (51, 81, 'n10', 12.75), (52, 94, 'n11', 13.0), (53, 10, 'n12', 13.25), (54, 23, 'n13', 13.5), (55, 36, 'n14', 13.75), (56, 49, 'n15', 14.0), (57, 62, 'n16', 14.25), (58, 75, 'n17', 14.5), (59, 88, 'n18', 14.75), (60, 4, 'n19', 15.0), (61, 17, 'n20', 15.25), (62, 30, 'n21', 15.5), (63, 43, 'n22', 15.75), (64, 56, 'n23', 16.0), (65, 69, 'n24', 16.25), (66, 82, 'n25', 16.5), (67, 95, 'n26', 16.75), (68, 11, 'n27', 17.0), (69, 24, 'n28', 17.25), (70, 37, 'n29', 17.5), (71, 50, 'n30', 17.75), (72, 63, 'n31', 18.0), (73, 76, 'n32', 18.25), (74, 89, 'n33', 18.5), (75, 5, 'n34', 18.75), (76, 18, 'n35', 19.0), (77, 31, 'n36', 19.25), (78, 44, 'n37', 19.5), (79, 57, 'n38', 19.75), (80, 70, 'n39', 20.0), (81, 83, 'n40', 20.25), (82, 96, 'n0', 20.5), (83, 12, 'n1', 20.75), (84, 25, 'n2', 21.0), (85, 38, 'n3', 21.25), (86, 51, 'n4', 21.5), (87, 64, 'n5', 21.75), (88, 77, 'n6', 22.0), (89, 90, 'n7', 22.25), (90, 6, 'n8', 22.5), (91, 19, 'n9', 22.75), (92, 32, 'n10', 23.0), (93, 45, 'n11', 23.25), (94, 58, 'n12', 23.5), (95, 71, 'n13', 23.75), (96, 84, 'n14', 24.0), (97, 0, 'n15', 24.25), (98, 13, 'n16', 24.5), (99, 26, 'n17', 24.75), (100, 39, 'n18', 25.0), (101, 52, 'n19', 25.25), (102, 65, 'n20', 25.5), (103, 78, 'n21', 25.75), (104, 91, 'n22', 26.0), (105, 7, 'n23', 26.25), (106, 20, 'n24', 26.5), (107, 33, 'n25', 26.75), (108, 46, 'n26', 27.0), (109, 59, 'n27', 27.25), (110, 72, 'n28', 27.5), (111, 85, 'n29', 27.75), (112, 1, 'n30', 28.0), (113, 14, 'n31', 28.25), (114, 27, 'n32', 28.5), (115, 40, 'n33', 28.75), (116, 53, 'n34', 29.0), (117, 66, 'n35', 29.25), (118, 79, 'n36', 29.5), (119, 92, 'n37', 29.75), (120, 8, 'n38', 30.0), (121, 21, 'n39', 30.25), (122, 34, 'n40', 30.5), (123, 47, 'n0', 30.75), (124, 60, 'n1', 31.0), (125, 73, 'n2', 31.25), (126, 86, 'n3', 31.5), (127, 2, 'n4', 31.75), (128, 15, 'n5', 32.0), (129, 28, 'n6', 32.25), (130, 41, 'n7', 32.5), (131, 54, 'n8', 32.75), (132, 67, 'n9', 33.0), (133, 80, 'n10', 33.25), (134, 93, 'n11', 33.5), (135, 9, 'n12', 33.75), (136, 22, 'n13', 34.0), (137, 35, 'n14', 34.25), (138, 48, 'n15', 34.5), (139, 61, 'n16', 34.75), (140, 74, 'n17', 35.0), (141, 87, 'n18', 35.25), (142, 3, 'n19', 35.5), (143, 16, 'n20', 35.75), (144, 29, 'n21', 36.0), (145, 42, 'n22', 36.25), (146, 55, 'n23', 36.5), (147, 68, 'n24', 36.75), (148, 81, 'n25', 37.0), (149, 94, 'n26', 37.25), (150, 10, 'n27', 37.5), (151, 23, 'n28', 37.75), (152, 36, 'n29', 38.0), (153, 49, 'n30', 38.25), (154, 62, 'n31', 38.5), (155, 75, 'n32', 38.75), (156, 88, 'n33', 39.0), (157, 4, 'n34', 39.25), (158, 17, 'n35', 39.5), (159, 30, 'n36', 39.75), (160, 43, 'n37', 40.0), (161, 56, 'n38', 40.25), (162, 69, 'n39', 40.5), (163, 82, 'n40', 40.75), (164, 95, 'n0', 41.0), (165, 11, 'n1', 41.25), (166, 24, 'n2', 41.5), (167, 37, 'n3', 41.75), (168, 50, 'n4', 42.0), (169, 63, 'n5', 42.25), (170, 76, 'n6', 42.5), (171, 89, 'n7', 42.75), (172, 5, 'n8', 43.0), (173, 18, 'n9', 43.25), (174, 31, 'n10', 43.5), (175, 44, 'n11', 43.75), (176, 57, 'n12', 44.0), (177, 70, 'n13', 44.25), (178, 83, 'n14', 44.5), (179, 96, 'n15', 44.75), (180, 12, 'n16', 45.0), (181, 25, 'n17', 45.25), (182, 38, 'n18', 45.5), (183, 51, 'n19', 45.75), (184, 64, 'n20', 46.0), (185, 77, 'n21', 46.25), (186, 90, 'n22', 46.5), (187, 6, 'n23', 46.75), (188, 19, 'n24', 47.0), (189, 32, 'n25', 47.25), (190, 45, 'n26', 47.5), (191, 58, 'n27', 47.75), (192, 71, 'n28', 48.0), (193, 84, 'n29', 48.25), (194, 0, 'n30', 48.5), (195, 13, 'n31', 48.75), (196, 26, 'n32', 49.0), (197, 39, 'n33', 49.25), (198, 52, 'n34', 49.5), (199, 65, 'n35', 49.75), (200, 78, 'n36', 50.0), (201, 91, 'n37', 50.25), (202, 7, 'n38', 50.5), (203, 20, 'n39', 50.75), (204, 33, 'n40', 51.0), (205, 46, 'n0', 51.25), (206, 59, 'n1', 51.5), (207, 72, 'n2', 51.75), (208, 85, 'n3', 52.0), (209, 1, 'n4', 52.25), (210, 14, 'n5', 52.5), (211, 27, 'n6', 52.75), (212, 40, 'n7', 53.0), (213, 53, 'n8', 53.25), (214, 66, 'n9', 53.5), (215, 79, 'n10', 53.75), (216, 92, 'n11', 54.0), (217, 8, 'n12', 54.25), (218, 21, 'n13', 54.5), (219, 34, 'n14', 54.75), (220, 47, 'n15', 55.0), (221, 60, 'n16', 55.25), (222, 73, 'n17', 55.5), (223, 86, 'n18', 55.75), (224, 2, 'n19', 56.0), (225, 15, 'n20', 56.25), (226, 28, 'n21', 56.5), (227, 41, 'n22', 56.75), (228, 54, 'n23', 57.0), (229, 67, 'n24', 57.25), (230, 80, 'n25', 57.5), (231, 93, 'n26', 57.75), (232, 9, 'n27', 58.0), (233, 22, 'n28', 58.25), (234, 35, 'n29', 58.5), (235, 48, 'n30', 58.75), (236, 61, 'n31', 59.0), (237, 74, 'n32', 59.25), (238, 87, 'n33', 59.5), (239, 3, 'n34', 59.75), (240, 16, 'n35', 60.0), (241, 29, 'n36', 60.25), (242, 42, 'n37', 60.5), (243, 55, 'n38', 60.75), (244, 68, 'n39', 61.0), (245, 81, 'n40', 61.25), (246, 94, 'n0', 61.5), (247, 10, 'n1', 61.75), (248, 23, 'n2', 62.0), (249, 36, 'n3', 62.25), (250, 49, 'n4', 62.5), (251, 62, 'n5', 62.75), (252, 75, 'n6', 63.0), (253, 88, 'n7', 63.25), (254, 4, 'n8', 63.5), (255, 17, 'n9', 63.75), (256, 30, 'n10', 64.0), (257, 43, 'n11', 64.25), (258, 56, 'n12', 64.5), (259, 69, 'n13', 64.75), (260, 82, 'n14', 65.0), (261, 95, 'n15', 65.25), (262, 11, 'n16', 65.5), (263, 24, 'n17', 65.75), (264, 37, 'n18', 66.0), (265, 50, 'n19', 66.25), (266, 63, 'n20', 66.5), (267, 76, 'n21', 66.75), (268, 89, 'n22', 67.0), (269, 5, 'n23', 67.25), (270, 18, 'n24', 67.5), (271, 31, 'n25', 67.75), (272, 44, 'n26', 68.0), (273, 57, 'n27', 68.25), (274, 70, 'n28', 68.5), (275, 83, 'n29', 68.75), (276, 96, 'n30', 69.0), (277, 12, 'n31', 69.25), (278, 25, 'n32', 69.5), (279, 38, 'n33', 69.75), (280, 51, 'n34', 70.0), (281, 64, 'n35', 70.25), (282, 77, 'n36', 70.5), (283, 90, 'n37', 70.75), (284, 6, 'n38', 71.0), (285, 19, 'n39', 71.25), (286, 32, 'n40', 71.5), (287, 45, 'n0', 71.75), (288, 58, 'n1', 72.0), (289, 71, 'n2', 72.25), (290, 84, 'n3', 72.5), (291, 0, 'n4', 72.75), (292, 13, 'n5', 73.0), (293, 26, 'n6', 73.25), (294, 39, 'n7', 73.5), (295, 52, 'n8', 73.75), (296, 65, 'n9', 74.0), (297, 78, 'n10', 74.25), (298, 91, 'n11', 74.5), (299, 7, 'n12', 74.75), (300, 20, 'n13', 75.0), (301, 33, 'n14', 75.25), (302, 46, 'n15', 75.5), (303, 59, 'n16', 75.75), (304, 72, 'n17', 76.0), (305, 85, 'n18', 76.25), (306, 1, 'n19', 76.5), (307, 14, 'n20', 76.75), (308, 27, 'n21', 77.0), (309, 40, 'n22', 77.25), (310, 53, 'n23', 77.5), (311, 66, 'n24', 77.75), (312, 79, 'n25', 78.0), (313, 92, 'n26', 78.25), (314, 8, 'n27', 78.5), (315, 21, 'n28', 78.75), (316, 34, 'n29', 79.0), (317, 47, 'n30', 79.25), (318, 60, 'n31', 79.5), (319, 73, 'n32', 79.75), (320, 86, 'n33', 80.0), (321, 2, 'n34', 80.25), (322, 15, 'n35', 80.5), (323, 28, 'n36', 80.75), (324, 41, 'n37', 81.0), (325, 54, 'n38', 81.25), (326, 67, 'n39', 81.5), (327, 80, 'n40', 81.75), (328, 93, 'n0', 82.0), (329, 9, 'n1', 82.25), (330, 22, 'n2', 82.5), (331, 35, 'n3', 82.75), (332, 48, 'n4', 83.0), (333, 61, 'n5', 83.25), (334, 74, 'n6', 83.5), (335, 87, 'n7', 83.75), (336, 3, 'n8', 84.0), (337, 16, 'n9', 84.25), (338, 29, 'n10', 84.5), (339, 42, 'n11', 84.75), (340, 55, 'n12', 85.0), (341, 68, 'n13', 85.25), (342, 81, 'n14', 85.5), (343, 94, 'n15', 85.75), (344, 10, 'n16', 86.0), (345, 23, 'n17', 86.25), (346, 36, 'n18', 86.5), (347, 49, 'n19', 86.75), (348, 62, 'n20', 87.0), (349, 75, 'n21', 87.25), (350, 88, 'n22', 87.5), (351, 4, 'n23', 87.75), (352, 17, 'n24', 88.0), (353, 30, 'n25', 88.25), (354, 43, 'n26', 88.5), (355, 56, 'n27', 88.75), (356, 69, 'n28', 89.0), (357, 82, 'n29', 89.25), (358, 95, 'n30', 89.5), (359, 11, 'n31', 89.75), (360, 24, 'n32', 90.0), (361, 37, 'n33', 90.25), (362, 50, 'n34', 90.5), (363, 63, 'n35', 90.75), (364, 76, 'n36', 91.0), (365, 89, 'n37', 91.25), (366, 5, 'n38', 91.5), (367, 18, 'n39', 91.75), (368, 31, 'n40', 92.0), (369, 44, 'n0', 92.25), (370, 57, 'n1', 92.5), (371, 70, 'n2', 92.75), (372, 83, 'n3', 93.0), (373, 96, 'n4', 93.25), (374, 12, 'n5', 93.5), (375, 25, 'n6', 93.75), (376, 38, 'n7', 94.0), (377, 51, 'n8', 94.25), (378, 64, 'n9', 94.5), (379, 77, 'n10', 94.75), (380, 90, 'n11', 95.0), (381, 6, 'n12', 95.25), (382, 19, 'n13', 95.5), (383, 32, 'n14', 95.75), (384, 45, 'n15', 96.0), (385, 58, 'n16', 96.25), (386, 71, 'n17', 96.5), (387, 84, 'n18', 96.75), (388, 0, 'n19', 97.0), (389, 13, 'n20', 97.25), (390, 26, 'n21', 97.5), (391, 39, 'n22', 97.75), (392, 52, 'n23', 98.0), (393, 65, 'n24', 98.25), (394, 78, 'n25', 98.5), (395, 91, 'n26', 98.75), (396, 7, 'n27', 99.0), (397, 20, 'n28', 99.25), (398, 33, 'n29', 99.5), (399, 46, 'n30', 99.75), (400, 59, 'n31', 100.0), (401, 72, 'n32', 100.25), (402, 85, 'n33', 100.5), (403, 1, 'n34', 100.75), (404, 14, 'n35', 101.0), (405, 27, 'n36', 101.25), (406, 40, 'n37', 101.5), (407, 53, 'n38', 101.75), (408, 66, 'n39', 102.0), (409, 79, 'n40', 102.25), (410, 92, 'n0', 102.5), (411, 8, 'n1', 102.75), (412, 21, 'n2', 103.0), (413, 34, 'n3', 103.25), (414, 47, 'n4', 103.5), (415, 60, 'n5', 103.75), (416, 73, 'n6', 104.0), (417, 86, 'n7', 104.25), (418, 2, 'n8', 104.5), (419, 15, 'n9', 104.75), (420, 28, 'n10', 105.0), (421, 41, 'n11', 105.25), (422, 54, 'n12', 105.5), (423, 67, 'n13', 105.75), (424, 80, 'n14', 106.0), (425, 93, 'n15', 106.25), (426, 9, 'n16', 106.5), (427, 22, 'n17', 106.75), (428, 35, 'n18', 107.0), (429, 48, 'n19', 107.25), (430, 61, 'n20', 107.5), (431, 74, 'n21', 107.75), (432, 87, 'n22', 108.0), (433, 3, 'n23', 108.25), (434, 16, 'n24', 108.5), (435, 29, 'n25', 108.75), (436, 42, 'n26', 109.0), (437, 55, 'n27', 109.25), (438, 68, 'n28', 109.5), (439, 81, 'n29', 109.75), (440, 94, 'n30', 110.0), (441, 10, 'n31', 110.25), (442, 23, 'n32', 110.5), (443, 36, 'n33', 110.75), (444, 49, 'n34', 111.0), (445, 62, 'n35', 111.25), (446, 75, 'n36', 111.5), (447, 88, 'n37', 111.75), (448, 4, 'n38', 112.0), (449, 17, 'n39', 112.25), (450, 30, 'n40', 112.5), (451, 43, 'n0', 112.75), (452, 56, 'n1', 113.0), (453, 69, 'n2', 113.25), (454, 82, 'n3', 113.5), (455, 95, 'n4', 113.75), (456, 11, 'n5', 114.0), (457, 24, 'n6', 114.25), (458, 37, 'n7', 114.5), (459, 50, 'n8', 114.75), (460, 63, 'n9', 115.0), (461, 76, 'n10', 115.25), (462, 89, 'n11', 115.5), (463, 5, 'n12', 115.75), (464, 18, 'n13', 116.0), (465, 31, 'n14', 116.25), (466, 44, 'n15', 116.5), (467, 57, 'n16', 116.75), (468, 70, 'n17', 117.0), (469, 83, 'n18', 117.25), (470, 96, 'n19', 117.5), (471, 12, 'n20', 117.75), (472, 25, 'n21', 118.0), (473, 38, 'n22', 118.25), (474, 51, 'n23', 118.5), (475, 64, 'n24', 118.75), (476, 77, 'n25', 119.0), (477, 90, 'n26', 119.25), (478, 6, 'n27', 119.5), (479, 19, 'n28', 119.75), (480, 32, 'n29', 120.0), (481, 45, 'n30', 120.25), (482, 58, 'n31', 120.5), (483, 71, 'n32', 120.75), (484, 84, 'n33', 121.0), (485, 0, 'n34', 121.25), (486, 13, 'n35', 121.5), (487, 26, 'n36', 121.75), (488, 39, 'n37', 122.0), (489, 52, 'n38', 122.25), (490, 65, 'n39', 122.5), (491, 78, 'n40', 122.75), (492, 91, 'n0', 123.0), (493, 7, 'n1', 123.25), (494, 20, 'n2', 123.5), (495, 33, 'n3', 123.75), (496, 46, 'n4', 124.0), (497, 59, 'n5', 124.25), (498, 72, 'n6', 124.5), (499, 85, 'n7', 124.75), (500, 1, 'n8', 125.0), (501, 14, 'n9', 125.25), (502, 27, 'n10', 125.5), (503, 40, 'n11', 125.75), (504, 53, 'n12', 126.0), (505, 66, 'n13', 126.25), (506, 79, 'n14', 126.5), (507, 92, 'n15', 126.75), (508, 8, 'n16', 127.0), (509, 21, 'n17', 127.25), (510, 34, 'n18', 127.5), (511, 47, 'n19', 127.75), (512, 60, 'n20', 128.0), (513, 73, 'n21', 128.25), (514, 86, 'n22', 128.5), (515, 2, 'n23', 128.75), (516, 15, 'n24', 129.0), (517, 28, 'n25', 129.25), (518, 41, 'n26', 129.5), (519, 54, 'n27', 129.75), (520, 67, 'n28', 130.0), (521, 80, 'n29', 130.25), (522, 93, 'n30', 130.5), (523, 9, 'n31', 130.75), (524, 22, 'n32', 131.0), (525, 35, 'n33', 131.25), (526, 48, 'n34', 131.5), (527, 61, 'n35', 131.75), (528, 74, 'n36', 132.0), (529, 87, 'n37', 132.25), (530, 3, 'n38', 132.5), (531, 16, 'n39', 132.75), (532, 29, 'n40', 133.0), (533, 42, 'n0', 133.25), (534, 55, 'n1', 133.5), (535, 68, 'n2', 133.75), (536, 81, 'n3', 134.0), (537, 94, 'n4', 134.25), (538, 10, 'n5', 134.5), (539, 23, 'n6', 134.75), (540, 36, 'n7', 135.0), (541, 49, 'n8', 135.25), (542, 62, 'n9', 135.5), (543, 75, 'n10', 135.75), (544, 88, 'n11', 136.0), (545, 4, 'n12', 136.25), (546, 17, 'n13', 136.5), (547, 30, 'n14', 136.75), (548, 43, 'n15', 137.0), (549, 56, 'n16', 137.25), (550, 69, 'n17', 137.5), (551, 82, 'n18', 137.75), (552, 95, 'n19', 138.0), (553, 11, 'n20', 138.25), (554, 24, 'n21', 138.5), (555, 37, 'n22', 138.75), (556, 50, 'n23', 139.0), (557, 63, 'n24', 139.25), (558, 76, 'n25', 139.5), (559, 89, 'n26', 139.75), (560, 5, 'n27', 140.0), (561, 18, 'n28', 140.25), (562, 31, 'n29', 140.5), (563, 44, 'n30', 140.75), (564, 57, 'n31', 141.0), (565, 70, 'n32', 141.25), (566, 83, 'n33', 141.5), (567, 96, 'n34', 141.75), (568, 12, 'n35', 142.0), (569, 25, 'n36', 142.25), (570, 38, 'n37', 142.5), (571, 51, 'n38', 142.75), (572, 64, 'n39', 143.0), (573, 77, 'n40', 143.25), (574, 90, 'n0', 143.5), (575, 6, 'n1', 143.75), (576, 19, 'n2', 144.0), (577, 32, 'n3', 144.25), (578, 45, 'n4', 144.5), (579, 58, 'n5', 144.75), (580, 71, 'n6', 145.0), (581, 84, 'n7', 145.25), (582, 0, 'n8', 145.5), (583, 13, 'n9', 145.75), (584, 26, 'n10', 146.0), (585, 39, 'n11', 146.25), (586, 52, 'n12', 146.5), (587, 65, 'n13', 146.75), (588, 78, 'n14', 147.0), (589, 91, 'n15', 147.25), (590, 7, 'n16', 147.5), (591, 20, 'n17', 147.75), (592, 33, 'n18', 148.0), (593, 46, 'n19', 148.25), (594, 59, 'n20', 148.5), (595, 72, 'n21', 148.75), (596, 85, 'n22', 149.0), (597, 1, 'n23', 149.25), (598, 14, 'n24', 149.5), (599, 27, 'n25', 149.75), (600, 40, 'n26', 150.0), (601, 53, 'n27', 150.25), (602, 66, 'n28', 150.5), (603, 79, 'n29', 150.75), (604, 92, 'n30', 151.0), (605, 8, 'n31', 151.25), (606, 21, 'n32', 151.5), (607, 34, 'n33', 151.75), (608, 47, 'n34', 152.0), (609, 60, 'n35', 152.25), (610, 73, 'n36', 152.5), (611, 86, 'n37', 152.75), (612, 2, 'n38', 153.0), (613, 15, 'n39', 153.25), (614, 28, 'n40', 153.5), (615, 41, 'n0', 153.75), (616, 54, 'n1', 154.0), (617, 67, 'n2', 154.25), (618, 80, 'n3', 154.5), (619, 93, 'n4', 154.75), (620, 9, 'n5', 155.0), (621, 22, 'n6', 155.25), (622, 35, 'n7', 155.5), (623, 48, 'n8', 155.75), (624, 61, 'n9', 156.0), (625, 74, 'n10', 156.25), (626, 87, 'n11', 156.5), (627, 3, 'n12', 156.75), (628, 16, 'n13', 157.0), (629, 29, 'n14', 157.25), (630, 42, 'n15', 157.5), (631, 55, 'n16', 157.75), (632, 68, 'n17', 158.0), (633, 81, 'n18', 158.25), (634, 94, 'n19', 158.5), (635, 10, 'n20', 158.75), (636, 23, 'n21', 159.0), (637, 36, 'n22', 159.25), (638, 49, 'n23', 159.5), (639, 62, 'n24', 159.75), (640, 75, 'n25', 160.0), (641, 88, 'n26', 160.25), (642, 4, 'n27', 160.5), (643, 17, 'n28', 160.75), (644, 30, 'n29', 161.0), (645, 43, 'n30', 161.25), (646, 56, 'n31', 161.5), (647, 69, 'n32', 161.75), (648, 82, 'n33', 162.0), (649, 95, 'n34', 162.25), (650, 11, 'n35', 162.5), (651, 24, 'n36', 162.75), (652, 37, 'n37', 163.0), (653, 50, 'n38', 163.25), (654, 63, 'n39', 163.5), (655, 76, 'n40', 163.75), (656, 89, 'n0', 164.0), (657, 5, 'n1', 164.25), (658, 18, 'n2', 164.5), (659, 31, 'n3', 164.75), (660, 44, 'n4', 165.0), (661, 57, 'n5', 165.25), (662, 70, 'n6', 165.5), (663, 83, 'n7', 165.75), (664, 96, 'n8', 166.0), (665, 12, 'n9', 166.25), (666, 25, 'n10', 166.5), (667, 38, 'n11', 166.75), (668, 51, 'n12', 167.0), (669, 64, 'n13', 167.25), (670, 77, 'n14', 167.5), (671, 90, 'n15', 167.75), (672, 6, 'n16', 168.0), (673, 19, 'n17', 168.25), (674, 32, 'n18', 168.5), (675, 45, 'n19', 168.75), (676, 58, 'n20', 169.0), (677, 71, 'n21', 169.25), (678, 84, 'n22', 169.5), (679, 0, 'n23', 169.75), (680, 13, 'n24', 170.0), (681, 26, 'n25', 170.25), (682, 39, 'n26', 170.5), (683, 52, 'n27', 170.75), (684, 65, 'n28', 171.0), (685, 78, 'n29', 171.25), (686, 91, 'n30', 171.5), (687, 7, 'n31', 171.75), (688, 20, 'n32', 172.0), (689, 33, 'n33', 172.25), (690, 46, 'n34', 172.5), (691, 59, 'n35', 172.75), (692, 72, 'n36', 173.0), (693, 85, 'n37', 173.25), (694, 1, 'n38', 173.5), (695, 14, 'n39', 173.75), (696, 27, 'n40', 174.0), (697, 40, 'n0', 174.25), (698, 53, 'n1', 174.5), (699, 66, 'n2', 174.75), (700, 79, 'n3', 175.0), (701, 92, 'n4', 175.25), (702, 8, 'n5', 175.5), (703, 21, 'n6', 175.75), (704, 34, 'n7', 176.0), (705, 47, 'n8', 176.25), (706, 60, 'n9', 176.5), (707, 73, 'n10', 176.75), (708, 86, 'n11', 177.0), (709, 2, 'n12', 177.25), (710, 15, 'n13', 177.5), (711, 28, 'n14', 177.75), (712, 41, 'n15', 178.0), (713, 54, 'n16', 178.25), (714, 67, 'n17', 178.5), (715, 80, 'n18', 178.75), (716, 93, 'n19', 179.0), (717, 9, 'n20', 179.25), (718, 22, 'n21', 179.5), (719, 35, 'n22', 179.75), (720, 48, 'n23', 180.0), (721, 61, 'n24', 180.25), (722, 74, 'n25', 180.5), (723, 87, 'n26', 180.75), (724, 3, 'n27', 181.0), (725, 16, 'n28', 181.25), (726, 29, 'n29', 181.5), (727, 42, 'n30', 181.75), (728, 55, 'n31', 182.0), (729, 68, 'n32', 182.25), (730, 81, 'n33', 182.5), (731, 94, 'n34', 182.75), (732, 10, 'n35', 183.0), (733, 23, 'n36', 183.25), (734, 36, 'n37', 183.5), (735, 49, 'n38', 183.75), (736, 62, 'n39', 184.0), (737, 75, 'n40', 184.25), (738, 88, 'n0', 184.5), (739, 4, 'n1', 184.75), (740, 17, 'n2', 185.0), (741, 30, 'n3', 185.25), (742, 43, 'n4', 185.5), (743, 56, 'n5', 185.75), (744, 69, 'n6', 186.0), (745, 82, 'n7', 186.25), (746, 95, 'n8', 186.5), (747, 11, 'n9', 186.75), (748, 24, 'n10', 187.0), (749, 37, 'n11', 187.25), (750, 50, 'n12', 187.5), (751, 63, 'n13', 187.75), (752, 76, 'n14', 188.0), (753, 89, 'n15', 188.25), (754, 5, 'n16', 188.5), (755, 18, 'n17', 188.75), (756, 31, 'n18', 189.0), (757, 44, 'n19', 189.25), (758, 57, 'n20', 189.5), (759, 70, 'n21', 189.75), (760, 83, 'n22', 190.0), (761, 96, 'n23', 190.25), (762, 12, 'n24', 190.5), (763, 25, 'n25', 190.75), (764, 38, 'n26', 191.0), (765, 51, 'n27', 191.25), (766, 64, 'n28', 191.5), (767, 77, 'n29', 191.75), (768, 90, 'n30', 192.0), (769, 6, 'n31', 192.25), (770, 19, 'n32', 192.5), (771, 32, 'n33', 192.75), (772, 45, 'n34', 193.0), (773, 58, 'n35', 193.25), (774, 71, 'n36', 193.5), (775, 84, 'n37', 193.75), (776, 0, 'n38', 194.0), (777, 13, 'n39', 194.25), (778, 26, 'n40', 194.5), (779, 39, 'n0', 194.75), (780, 52, 'n1', 195.0), (781, 65, 'n2', 195.25), (782, 78, 'n3', 195.5), (783, 91, 'n4', 195.75), (784, 7, 'n5', 196.0), (785, 20, 'n6', 196.25), (786, 33, 'n7', 196.5), (787, 46, 'n8', 196.75), (788, 59, 'n9', 197.0), (789, 72, 'n10', 197.25), (790, 85, 'n11', 197.5), (791, 1, 'n12', 197.75), (792, 14, 'n13', 198.0), (793, 27, 'n14', 198.25), (794, 40, 'n15', 198.5), (795, 53, 'n16', 198.75), (796, 66, 'n17', 199.0), (797, 79, 'n18', 199.25), (798, 92, 'n19', 199.5), (799, 8, 'n20', 199.75), (800, 21, 'n21', 200.0), (801, 34, 'n22', 200.25), (802, 47, 'n23', 200.5), (803, 60, 'n24', 200.75), (804, 73, 'n25', 201.0), (805, 86, 'n26', 201.25), (806, 2, 'n27', 201.5), (807, 15, 'n28', 201.75), (808, 28, 'n29', 202.0), (809, 41, 'n30', 202.25), (810, 54, 'n31', 202.5), (811, 67, 'n32', 202.75), (812, 80, 'n33', 203.0), (813, 93, 'n34', 203.25), (814, 9, 'n35', 203.5), (815, 22, 'n36', 203.75), (816, 35, 'n37', 204.0), (817, 48, 'n38', 204.25), (818, 61, 'n39', 204.5), (819, 74, 'n40', 204.75), (820, 87, 'n0', 205.0), (821, 3, 'n1', 205.25), (822, 16, 'n2', 205.5), (823, 29, 'n3', 205.75), (824, 42, 'n4', 206.0), (825, 55, 'n5', 206.25), (826, 68, 'n6', 206.5), (827, 81, 'n7', 206.75), (828, 94, 'n8', 207.0), (829, 10, 'n9', 207.25), (830, 23, 'n10', 207.5), (831, 36, 'n11', 207.75), (832, 49, 'n12', 208.0), (833, 62, 'n13', 208.25), (834, 75, 'n14', 208.5), (835, 88, 'n15', 208.75), (836, 4, 'n16', 209.0), (837, 17, 'n17', 209.25), (838, 30, 'n18', 209.5), (839, 43, 'n19', 209.75), (840, 56, 'n20', 210.0), (841, 69, 'n21', 210.25), (842, 82, 'n22', 210.5), (843, 95, 'n23', 210.75), (844, 11, 'n24', 211.0), (845, 24, 'n25', 211.25), (846, 37, 'n26', 211.5), (847, 50, 'n27', 211.75), (848, 63, 'n28', 212.0), (849, 76, 'n29', 212.25), (850, 89, 'n30', 212.5), (851, 5, 'n31', 212.75), (852, 18, 'n32', 213.0), (853, 31, 'n33', 213.25), (854, 44, 'n34', 213.5), (855, 57, 'n35', 213.75), (856, 70, 'n36', 214.0), (857, 83, 'n37', 214.25), (858, 96, 'n38', 214.5), (859, 12, 'n39', 214.75), (860, 25, 'n40', 215.0), (861, 38, 'n0', 215.25), (862, 51, 'n1', 215.5), (863, 64, 'n2', 215.75), (864, 77, 'n3', 216.0), (865, 90, 'n4', 216.25), (866, 6, 'n5', 216.5), (867, 19, 'n6', 216.75), (868, 32, 'n7', 217.0), (869, 45, 'n8', 217.25), (870, 58, 'n9', 217.5), (871, 71, 'n10', 217.75), (872, 84, 'n11', 218.0), (873, 0, 'n12', 218.25), (874, 13, 'n13', 218.5), (875, 26, 'n14', 218.75), (876, 39, 'n15', 219.0), (877, 52, 'n16', 219.25), (878, 65, 'n17', 219.5), (879, 78, 'n18', 219.75), (880, 91, 'n19', 220.0), (881, 7, 'n20', 220.25), (882, 20, 'n21', 220.5), (883, 33, 'n22', 220.75), (884, 46, 'n23', 221.0), (885, 59, 'n24', 221.25), (886, 72, 'n25', 221.5), (887, 85, 'n26', 221.75), (888, 1, 'n27', 222.0), (889, 14, 'n28', 222.25), (890, 27, 'n29', 222.5), (891, 40, 'n30', 222.75), (892, 53, 'n31', 223.0), (893, 66, 'n32', 223.25), (894, 79, 'n33', 223.5), (895, 92, 'n34', 223.75), (896, 8, 'n35', 224.0), (897, 21, 'n36', 224.25), (898, 34, 'n37', 224.5), (899, 47, 'n38', 224.75), (900, 60, 'n39', 225.0), (901, 73, 'n40', 225.25), (902, 86, 'n0', 225.5), (903, 2, 'n1', 225.75), (904, 15, 'n2', 226.0), (905, 28, 'n3', 226.25), (906, 41, 'n4', 226.5), (907, 54, 'n5', 226.75), (908, 67, 'n6', 227.0), (909, 80, 'n7', 227.25), (910, 93, 'n8', 227.5), (911, 9, 'n9', 227.75), (912, 22, 'n10', 228.0), (913, 35, 'n11', 228.25), (914, 48, 'n12', 228.5), (915, 61, 'n13', 228.75), (916, 74, 'n14', 229.0), (917, 87, 'n15', 229.25), (918, 3, 'n16', 229.5), (919, 16, 'n17', 229.75), (920, 29, 'n18', 230.0), (921, 42, 'n19', 230.25), (922, 55, 'n20', 230.5), (923, 68, 'n21', 230.75), (924, 81, 'n22', 231.0), (925, 94, 'n23', 231.25), (926, 10, 'n24', 231.5), (927, 23, 'n25', 231.75), (928, 36, 'n26', 232.0), (929, 49, 'n27', 232.25), (930, 62, 'n28', 232.5), (931, 75, 'n29', 232.75), (932, 88, 'n30', 233.0), (933, 4, 'n31', 233.25), (934, 17, 'n32', 233.5), (935, 30, 'n33', 233.75), (936, 43, 'n34', 234.0), (937, 56, 'n35', 234.25), (938, 69, 'n36', 234.5), (939, 82, 'n37', 234.75), (940, 95, 'n38', 235.0), (941, 11, 'n39', 235.25), (942, 24, 'n40', 235.5), (943, 37, 'n0', 235.75), (944, 50, 'n1', 236.0), (945, 63, 'n2', 236.25), (946, 76, 'n3', 236.5), (947, 89, 'n4', 236.75), (948, 5, 'n5', 237.0), (949, 18, 'n6', 237.25), (950, 31, 'n7', 237.5), (951, 44, 'n8', 237.75), (952, 57, 'n9', 238.0), (953, 70, 'n10', 238.25), (954, 83, 'n11', 238.5), (955, 96, 'n12', 238.75), (956, 12, 'n13', 239.0), (957, 25, 'n14', 239.25), (958, 38, 'n15', 239.5), (959, 51, 'n16', 239.75), (960, 64, 'n17', 240.0), (961, 77, 'n18', 240.25), (962, 90, 'n19', 240.5), (963, 6, 'n20', 240.75), (964, 19, 'n21', 241.0), (965, 32, 'n22', 241.25), (966, 45, 'n23', 241.5), (967, 58, 'n24', 241.75), (968, 71, 'n25', 242.0), (969, 84, 'n26', 242.25), (970, 0, 'n27', 242.5), (971, 13, 'n28', 242.75), (972, 26, 'n29', 243.0), (973, 39, 'n30', 243.25), (974, 52, 'n31', 243.5), (975, 65, 'n32', 243.75), (976, 78, 'n33', 244.0), (977, 91, 'n34', 244.25), (978, 7, 'n35', 244.5), (979, 20, 'n36', 244.75), (980, 33, 'n37', 245.0), (981, 46, 'n38', 245.25), (982, 59, 'n39', 245.5), (983, 72, 'n40', 245.75), (984, 85, 'n0', 246.0), (985, 1, 'n1', 246.25), (986, 14, 'n2', 246.5), (987, 27, 'n3', 246.75), (988, 40, 'n4', 247.0), (989, 53, 'n5', 247.25), (990, 66, 'n6', 247.5), (991, 79, 'n7', 247.75), (992, 92, 'n8', 248.0), (993, 8, 'n9', 248.25), (994, 21, 'n10', 248.5), (995, 34, 'n11', 248.75), (996, 47, 'n12', 249.0), (997, 60, 'n13', 249.25), (998, 73, 'n14', 249.5), (999, 86, 'n15', 249.75), (1000, 2, 'n16', 250.0), (1001, 15, 'n17', 250.25), (1002, 28, 'n18', 250.5), (1003, 41, 'n19', 250.75), (1004, 54, 'n20', 251.0), (1005, 67, 'n21', 251.25), (1006, 80, 'n22', 251.5), (1007, 93, 'n23', 251.75), (1008, 9, 'n24', 252.0), (1009, 22, 'n25', 252.25), (1010, 35, 'n26', 252.5), (1011, 48, 'n27', 252.75), (1012, 61, 'n28', 253.0), (1013, 74, 'n29', 253.25), (1014, 87, 'n30', 253.5), (1015, 3, 'n31', 253.75), (1016, 16, 'n32', 254.0), (1017, 29, 'n33', 254.25), (1018, 42, 'n34', 254.5), (1019, 55, 'n35', 254.75), (1020, 68, 'n36', 255.0), (1021, 81, 'n37', 255.25), (1022, 94, 'n38', 255.5), (1023, 10, 'n39', 255.75), (1024, 23, 'n40', 256.0), (1025, 36, 'n0', 256.25), (1026, 49, 'n1', 256.5), (1027, 62, 'n2', 256.75), (1028, 75, 'n3', 257.0), (1029, 88, 'n4', 257.25), (1030, 4, 'n5', 257.5), (1031, 17, 'n6', 257.75), (1032, 30, 'n7', 258.0), (1033, 43, 'n8', 258.25), (1034, 56, 'n9', 258.5), (1035, 69, 'n10', 258.75), (1036, 82, 'n11', 259.0), (1037, 95, 'n12', 259.25), (1038, 11, 'n13', 259.5), (1039, 24, 'n14', 259.75), (1040, 37, 'n15', 260.0), (1041, 50, 'n16', 260.25), (1042, 63, 'n17', 260.5), (1043, 76, 'n18', 260.75), (1044, 89, 'n19', 261.0), (1045, 5, 'n20', 261.25), (1046, 18, 'n21', 261.5), (1047, 31, 'n22', 261.75), (1048, 44, 'n23', 262.0), (1049, 57, 'n24', 262.25), (1050, 70, 'n25', 262.5), (1051, 83, 'n26', 262.75), (1052, 96, 'n27', 263.0), (1053, 12, 'n28', 263.25), (1054, 25, 'n29', 263.5), (1055, 38, 'n30', 263.75), (1056, 51, 'n31', 264.0), (1057, 64, 'n32', 264.25), (1058, 77, 'n33', 264.5), (1059, 90, 'n34', 264.75), (1060, 6, 'n35', 265.0), (1061, 19, 'n36', 265.25), (1062, 32, 'n37', 265.5), (1063, 45, 'n38', 265.75), (1064, 58, 'n39', 266.0), (1065, 71, 'n40', 266.25), (1066, 84, 'n0', 266.5), (1067, 0, 'n1', 266.75), (1068, 13, 'n2', 267.0), (1069, 26, 'n3', 267.25), (1070, 39, 'n4', 267.5), (1071, 52, 'n5', 267.75), (1072, 65, 'n6', 268.0), (1073, 78, 'n7', 268.25), (1074, 91, 'n8', 268.5), (1075, 7, 'n9', 268.75), (1076, 20, 'n10', 269.0), (1077, 33, 'n11', 269.25), (1078, 46, 'n12', 269.5), (1079, 59, 'n13', 269.75), (1080, 72, 'n14', 270.0), (1081, 85, 'n15', 270.25), (1082, 1, 'n16', 270.5), (1083, 14, 'n17', 270.75), (1084, 27, 'n18', 271.0), (1085, 40, 'n19', 271.25), (1086, 53, 'n20', 271.5), (1087, 66, 'n21', 271.75), (1088, 79, 'n22', 272.0), (1089, 92, 'n23', 272.25), (1090, 8, 'n24', 272.5), (1091, 21, 'n25', 272.75), (1092, 34, 'n26', 273.0), (1093, 47, 'n27', 273.25), (1094, 60, 'n28', 273.5), (1095, 73, 'n29', 273.75), (1096, 86, 'n30', 274.0), (1097, 2, 'n31', 274.25), (1098, 15, 'n32', 274.5), (1099, 28, 'n33', 274.75), (1100, 41, 'n34', 275.0), (1101, 54, 'n35', 275.25), (1102, 67, 'n36', 275.5), (1103, 80, 'n37', 275.75), (1104, 93, 'n38', 276.0), (1105, 9, 'n39', 276.25), (1106, 22, 'n40', 276.5), (1107, 35, 'n0', 276.75), (1108, 48, 'n1', 277.0), (1109, 61, 'n2', 277.25), (1110, 74, 'n3', 277.5), (1111, 87, 'n4', 277.75), (1112, 3, 'n5', 278.0), (1113, 16, 'n6', 278.25), (1114, 29, 'n7', 278.5), (1115, 42, 'n8', 278.75), (1116, 55, 'n9', 279.0), (1117, 68, 'n10', 279.25), (1118, 81, 'n11', 279.5), (1119, 94, 'n12', 279.75), (1120, 10, 'n13', 280.0), (1121, 23, 'n14', 280.25), (1122, 36, 'n15', 280.5), (1123, 49, 'n16', 280.75), (1124, 62, 'n17', 281.0), (1125, 75, 'n18', 281.25), (1126, 88, 'n19', 281.5), (1127, 4, 'n20', 281.75), (1128, 17, 'n21', 282.0), (1129, 30, 'n22', 282.25), (1130, 43, 'n23', 282.5), (1131, 56, 'n24', 282.75), (1132, 69, 'n25', 283.0), (1133, 82, 'n26', 283.25), (1134, 95, 'n27', 283.5), (1135, 11, 'n28', 283.75), (1136, 24, 'n29', 284.0), (1137, 37, 'n30', 284.25), (1138, 50, 'n31', 284.5), (1139, 63, 'n32', 284.75), (1140, 76, 'n33', 285.0), (1141, 89, 'n34', 285.25), (1142, 5, 'n35', 285.5), (1143, 18, 'n36', 285.75), (1144, 31, 'n37', 286.0), (1145, 44, 'n38', 286.25), (1146, 57, 'n39', 286.5), (1147, 70, 'n40', 286.75), (1148, 83, 'n0', 287.0), (1149, 96, 'n1', 287.25), (1150, 12, 'n2', 287.5), (1151, 25, 'n3', 287.75), (1152, 38, 'n4', 288.0), (1153, 51, 'n5', 288.25), (1154, 64, 'n6', 288.5), (1155, 77, 'n7', 288.75), (1156, 90, 'n8', 289.0), (1157, 6, 'n9', 289.25), (1158, 19, 'n10', 289.5), (1159, 32, 'n11', 289.75), (1160, 45, 'n12', 290.0), (1161, 58, 'n13', 290.25), (1162, 71, 'n14', 290.5), (1163, 84, 'n15', 290.75), (1164, 0, 'n16', 291.0), (1165, 13, 'n17', 291.25), (1166, 26, 'n18', 291.5), (1167, 39, 'n19', 291.75), (1168, 52, 'n20', 292.0), (1169, 65, 'n21', 292.25), (1170, 78, 'n22', 292.5), (1171, 91, 'n23', 292.75), (1172, 7, 'n24', 293.0), (1173, 20, 'n25', 293.25), (1174, 33, 'n26', 293.5), (1175, 46, 'n27', 293.75), (1176, 59, 'n28', 294.0), (1177, 72, 'n29', 294.25), (1178, 85, 'n30', 294.5), (1179, 1, 'n31', 294.75), (1180, 14, 'n32', 295.0), (1181, 27, 'n33', 295.25), (1182, 40, 'n34', 295.5), (1183, 53, 'n35', 295.75), (1184, 66, 'n36', 296.0), (1185, 79, 'n37', 296.25), (1186, 92, 'n38', 296.5), (1187, 8, 'n39', 296.75), (1188, 21, 'n40', 297.0), (1189, 34, 'n0', 297.25), (1190, 47, 'n1', 297.5), (1191, 60, 'n2', 297.75), (1192, 73, 'n3', 298.0), (1193, 86, 'n4', 298.25), (1194, 2, 'n5', 298.5), (1195, 15, 'n6', 298.75), (1196, 28, 'n7', 299.0), (1197, 41, 'n8', 299.25), (1198, 54, 'n9', 299.5), (1199, 67, 'n10', 299.75), (1200, 80, 'n11', 300.0), (1201, 93, 'n12', 300.25), (1202, 9, 'n13', 300.5), (1203, 22, 'n14', 300.75), (1204, 35, 'n15', 301.0), (1205, 48, 'n16', 301.25), (1206, 61, 'n17', 301.5), (1207, 74, 'n18', 301.75), (1208, 87, 'n19', 302.0), (1209, 3, 'n20', 302.25), (1210, 16, 'n21', 302.5), (1211, 29, 'n22', 302.75), (1212, 42, 'n23', 303.0), (1213, 55, 'n24', 303.25), (1214, 68, 'n25', 303.5), (1215, 81, 'n26', 303.75), (1216, 94, 'n27', 304.0), (1217, 10, 'n28', 304.25), (1218, 23, 'n29', 304.5), (1219, 36, 'n30', 304.75), (1220, 49, 'n31', 305.0), (1221, 62, 'n32', 305.25), (1222, 75, 'n33', 305.5), (1223, 88, 'n34', 305.75), (1224, 4, 'n35', 306.0), (1225, 17, 'n36', 306.25), (1226, 30, 'n37', 306.5), (1227, 43, 'n38', 306.75), (1228, 56, 'n39', 307.0), (1229, 69, 'n40', 307.25), (1230, 82, 'n0', 307.5), (1231, 95, 'n1', 307.75), (1232, 11, 'n2', 308.0), (1233, 24, 'n3', 308.25), (1234, 37, 'n4', 308.5), (1235, 50, 'n5', 308.75), (1236, 63, 'n6', 309.0), (1237, 76, 'n7', 309.25), (1238, 89, 'n8', 309.5), (1239, 5, 'n9', 309.75), (1240, 18, 'n10', 310.0), (1241, 31, 'n11', 310.25), (1242, 44, 'n12', 310.5), (1243, 57, 'n13', 310.75), (1244, 70, 'n14', 311.0), (1245, 83, 'n15', 311.25), (1246, 96, 'n16', 311.5), (1247, 12, 'n17', 311.75), (1248, 25, 'n18', 312.0), (1249, 38, 'n19', 312.25), (1250, 51, 'n20', 312.5), (1251, 64, 'n21', 312.75), (1252, 77, 'n22', 313.0), (1253, 90, 'n23', 313.25), (1254, 6, 'n24', 313.5), (1255, 19, 'n25', 313.75), (1256, 32, 'n26', 314.0), (1257, 45, 'n27', 314.25), (1258, 58, 'n28', 314.5), (1259, 71, 'n29', 314.75), (1260, 84, 'n30', 315.0), (1261, 0, 'n31', 315.25), (1262, 13, 'n32', 315.5), (1263, 26, 'n33', 315.75), (1264, 39, 'n34', 316.0), (1265, 52, 'n35', 316.25), (1266, 65, 'n36', 316.5), (1267, 78, 'n37', 316.75), (1268, 91, 'n38', 317.0), (1269, 7, 'n39', 317.25), (1270, 20, 'n40', 317.5), (1271, 33, 'n0', 317.75), (1272, 46, 'n1', 318.0), (1273, 59, 'n2', 318.25), (1274, 72, 'n3', 318.5), (1275, 85, 'n4', 318.75), (1276, 1, 'n5', 319.0), (1277, 14, 'n6', 319.25), (1278, 27, 'n7', 319.5), (1279, 40, 'n8', 319.75), (1280, 53, 'n9', 320.0), (1281, 66, 'n10', 320.25), (1282, 79, 'n11', 320.5), (1283, 92, 'n12', 320.75), (1284, 8, 'n13', 321.0), (1285, 21, 'n14', 321.25), (1286, 34, 'n15', 321.5), (1287, 47, 'n16', 321.75), (1288, 60, 'n17', 322.0), (1289, 73, 'n18', 322.25), (1290, 86, 'n19', 322.5), (1291, 2, 'n20', 322.75), (1292, 15, 'n21', 323.0), (1293, 28, 'n22', 323.25), (1294, 41, 'n23', 323.5), (1295, 54, 'n24', 323.75), (1296, 67, 'n25', 324.0), (1297, 80, 'n26', 324.25), (1298, 93, 'n27', 324.5), (1299, 9, 'n28', 324.75), (1300, 22, 'n29', 325.0), (1301, 35, 'n30', 325.25), (1302, 48, 'n31', 325.5), (1303, 61, 'n32', 325.75), (1304, 74, 'n33', 326.0), (1305, 87, 'n34', 326.25), (1306, 3, 'n35', 326.5), (1307, 16, 'n36', 326.75), (1308, 29, 'n37', 327.0), (1309, 42, 'n38', 327.25), (1310, 55, 'n39', 327.5), (1311, 68, 'n40', 327.75), (1312, 81, 'n0', 328.0), (1313, 94, 'n1', 328.25), (1314, 10, 'n2', 328.5), (1315, 23, 'n3', 328.75), (1316, 36, 'n4', 329.0), (1317, 49, 'n5', 329.25), (1318, 62, 'n6', 329.5), (1319, 75, 'n7', 329.75), (1320, 88, 'n8', 330.0), (1321, 4, 'n9', 330.25), (1322, 17, 'n10', 330.5), (1323, 30, 'n11', 330.75), (1324, 43, 'n12', 331.0), (1325, 56, 'n13', 331.25), (1326, 69, 'n14', 331.5), (1327, 82, 'n15', 331.75), (1328, 95, 'n16', 332.0), (1329, 11, 'n17', 332.25), (1330, 24, 'n18', 332.5), (1331, 37, 'n19', 332.75), (1332, 50, 'n20', 333.0), (1333, 63, 'n21', 333.25), (1334, 76, 'n22', 333.5), (1335, 89, 'n23', 333.75), (1336, 5, 'n24', 334.0), (1337, 18, 'n25', 334.25), (1338, 31, 'n26', 334.5), (1339, 44, 'n27', 334.75), (1340, 57, 'n28', 335.0), (1341, 70, 'n29', 335.25), (1342, 83, 'n30', 335.5), (1343, 96, 'n31', 335.75), (1344, 12, 'n32', 336.0), (1345, 25, 'n33', 336.25), (1346, 38, 'n34', 336.5), (1347, 51, 'n35', 336.75), (1348, 64, 'n36', 337.0), (1349, 77, 'n37', 337.25), (1350, 90, 'n38', 337.5), (1351, 6, 'n39', 337.75), (1352, 19, 'n40', 338.0), (1353, 32, 'n0', 338.25), (1354, 45, 'n1', 338.5), (1355, 58, 'n2', 338.75), (1356, 71, 'n3', 339.0), (1357, 84, 'n4', 339.25), (1358, 0, 'n5', 339.5), (1359, 13, 'n6', 339.75), (1360, 26, 'n7', 340.0), (1361, 39, 'n8', 340.25), (1362, 52, 'n9', 340.5), (1363, 65, 'n10', 340.75), (1364, 78, 'n11', 341.0), (1365, 91, 'n12', 341.25), (1366, 7, 'n13', 341.5), (1367, 20, 'n14', 341.75), (1368, 33, 'n15', 342.0), (1369, 46, 'n16', 342.25), (1370, 59, 'n17', 342.5), (1371, 72, 'n18', 342.75), (1372, 85, 'n19', 343.0), (1373, 1, 'n20', 343.25), (1374, 14, 'n21', 343.5), (1375, 27, 'n22', 343.75), (1376, 40, 'n23', 344.0), (1377, 53, 'n24', 344.25), (1378, 66, 'n25', 344.5), (1379, 79, 'n26', 344.75), (1380, 92, 'n27', 345.0), (1381, 8, 'n28', 345.25), (1382, 21, 'n29', 345.5), (1383, 34, 'n30', 345.75), (1384, 47, 'n31', 346.0), (1385, 60, 'n32', 346.25), (1386, 73, 'n33', 346.5), (1387, 86, 'n34', 346.75), (1388, 2, 'n35', 347.0), (1389, 15, 'n36', 347.25), (1390, 28, 'n37', 347.5), (1391, 41, 'n38', 347.75), (1392, 54, 'n39', 348.0), (1393, 67, 'n40', 348.25), (1394, 80, 'n0', 348.5), (1395, 93, 'n1', 348.75), (1396, 9, 'n2', 349.0), (1397, 22, 'n3', 349.25), (1398, 35, 'n4', 349.5), (1399, 48, 'n5', 349.75), (1400, 61, 'n6', 350.0), (1401, 74, 'n7', 350.25), (1402, 87, 'n8', 350.5), (1403, 3, 'n9', 350.75), (1404, 16, 'n10', 351.0), (1405, 29, 'n11', 351.25), (1406, 42, 'n12', 351.5), (1407, 55, 'n13', 351.75), (1408, 68, 'n14', 352.0), (1409, 81, 'n15', 352.25), (1410, 94, 'n16', 352.5), (1411, 10, 'n17', 352.75), (1412, 23, 'n18', 353.0), (1413, 36, 'n19', 353.25), (1414, 49, 'n20', 353.5), (1415, 62, 'n21', 353.75), (1416, 75, 'n22', 354.0), (1417, 88, 'n23', 354.25), (1418, 4, 'n24', 354.5), (1419, 17, 'n25', 354.75), (1420, 30, 'n26', 355.0), (1421, 43, 'n27', 355.25), (1422, 56, 'n28', 355.5), (1423, 69, 'n29', 355.75), (1424, 82, 'n30', 356.0), (1425, 95, 'n31', 356.25), (1426, 11, 'n32', 356.5), (1427, 24, 'n33', 356.75), (1428, 37, 'n34', 357.0), (1429, 50, 'n35', 357.25), (1430, 63, 'n36', 357.5), (1431, 76, 'n37', 357.75), (1432, 89, 'n38', 358.0), (1433, 5, 'n39', 358.25), (1434, 18, 'n40', 358.5), (1435, 31, 'n0', 358.75), (1436, 44, 'n1', 359.0), (1437, 57, 'n2', 359.25), (1438, 70, 'n3', 359.5), (1439, 83, 'n4', 359.75), (1440, 96, 'n5', 360.0), (1441, 12, 'n6', 360.25), (1442, 25, 'n7', 360.5), (1443, 38, 'n8', 360.75), (1444, 51, 'n9', 361.0), (1445, 64, 'n10', 361.25), (1446, 77, 'n11', 361.5), (1447, 90, 'n12', 361.75), (1448, 6, 'n13', 362.0), (1449, 19, 'n14', 362.25), (1450, 32, 'n15', 362.5), (1451, 45, 'n16', 362.75), (1452, 58, 'n17', 363.0), (1453, 71, 'n18', 363.25), (1454, 84, 'n19', 363.5), (1455, 0, 'n20', 363.75), (1456, 13, 'n21', 364.0), (1457, 26, 'n22', 364.25), (1458, 39, 'n23', 364.5), (1459, 52, 'n24', 364.75), (1460, 65, 'n25', 365.0), (1461, 78, 'n26', 365.25), (1462, 91, 'n27', 365.5), (1463, 7, 'n28', 365.75), (1464, 20, 'n29', 366.0), (1465, 33, 'n30', 366.25), (1466, 46, 'n31', 366.5), (1467, 59, 'n32', 366.75), (1468, 72, 'n33', 367.0), (1469, 85, 'n34', 367.25), (1470, 1, 'n35', 367.5), (1471, 14, 'n36', 367.75), (1472, 27, 'n37', 368.0), (1473, 40, 'n38', 368.25), (1474, 53, 'n39', 368.5), (1475, 66, 'n40', 368.75), (1476, 79, 'n0', 369.0), (1477, 92, 'n1', 369.25), (1478, 8, 'n2', 369.5), (1479, 21, 'n3', 369.75), (1480, 34, 'n4', 370.0), (1481, 47, 'n5', 370.25), (1482, 60, 'n6', 370.5), (1483, 73, 'n7', 370.75), (1484, 86, 'n8', 371.0), (1485, 2, 'n9', 371.25), (1486, 15, 'n10', 371.5), (1487, 28, 'n11', 371.75), (1488, 41, 'n12', 372.0), (1489, 54, 'n13', 372.25), (1490, 67, 'n14', 372.5), (1491, 80, 'n15', 372.75), (1492, 93, 'n16', 373.0), (1493, 9, 'n17', 373.25), (1494, 22, 'n18', 373.5), (1495, 35, 'n19', 373.75), (1496, 48, 'n20', 374.0), (1497, 61, 'n21', 374.25), (1498, 74, 'n22', 374.5), (1499, 87, 'n23', 374.75);
+CREATE INDEX ON R USING HASH (C) INCLUDE (D);
+SELECT R.A, R.B FROM R WHERE B = 42;
+SELECT C, D FROM R WHERE C = 'n7';
+SELECT R.A, R.C FROM R WHERE B = 42 AND C = 'n7';
+SELECT R.A, R.B FROM R WHERE B > 90 AND B <= 92;
+SELECT R.A FROM R WHERE B = 1000;
+CREATE TABLE S(K INT, NAME VARCHAR, G INT, PRIMARY KEY(K));
+INSERT INTO S VALUES (0, 'n0', 0), (1, 'n1', 1), (2, 'n2', 2), (3, 'n3', 3), (4, 'n4', 4), (5, 'n5', 0), (6, 'n6', 1), (7, 'n7', 2), (8, 'n8', 3), (9, 'n9', 4), (10, 'n10', 0), (11, 'n11', 1), (12, 'n12', 2), (13, 'n13', 3), (14, 'n14', 4), (15, 'n15', 0), (16, 'n16', 1), (17, 'n17', 2), (18, 'n18', 3), (19, 'n19', 4), (20, 'n20', 0), (21, 'n21', 1), (22, 'n22', 2), (23, 'n23', 3), (24, 'n24', 4), (25, 'n25', 0), (26, 'n26', 1), (27, 'n27', 2), (28, 'n28', 3), (29, 'n29', 4), (30, 'n30', 0), (31, 'n31', 1), (32, 'n32', 2), (33, 'n33', 3), (34, 'n34', 4), (35, 'n35', 0), (36, 'n36', 1), (37, 'n37', 2), (38, 'n38', 3), (39, 'n39', 4), (40, 'n40', 0), (41, 'n0', 1), (42, 'n1', 2), (43, 'n2', 3), (44, 'n3', 4), (45, 'n4', 0), (46, 'n5', 1), (47, 'n6', 2), (48, 'n7', 3), (49, 'n8', 4), (50, 'n9', 0), (51, 'n10', 1), (52, 'n11', 2), (53, 'n12', 3), (54, 'n13', 4), (55, 'n14', 0), (56, 'n15', 1), (57, 'n16', 2), (58, 'n17', 3), (59, 'n18', 4), (60, 'n19', 0), (61, 'n20', 1), (62, 'n21', 2), (63, 'n22', 3), (64, 'n23', 4), (65, 'n24', 0), (66, 'n25', 1), (67, 'n26', 2), (68, 'n27', 3), (69, 'n28', 4), (70, 'n29', 0), (71, 'n30', 1), (72, 'n31', 2), (73, 'n32', 3), (74, 'n33', 4), (75, 'n34', 0), (76, 'n35', 1), (77, 'n36', 2), (78, 'n37', 3), (79, 'n38', 4), (80, 'n39', 0), (81, 'n40', 1), (82, 'n0', 2), (83, 'n1', 3), (84, 'n2', 4), (85, 'n3', 0), (86, 'n4', 1), (87, 'n5', 2), (88, 'n6', 3), (89, 'n7', 4), (90, 'n8', 0), (91, 'n9', 1), (92, 'n10', 2), (93, 'n11', 3), (94, 'n12', 4), (95, 'n13', 0), (96, 'n14', 1), (97, 'n15', 2), (98, 'n16', 3), (99, 'n17', 4), (100, 'n18', 0), (101, 'n19', 1), (102, 'n20', 2), (103, 'n21', 3), (104, 'n22', 4), (105, 'n23', 0), (106, 'n24', 1), (107, 'n25', 2), (108, 'n26', 3), (109, 'n27', 4), (110, 'n28', 0), (111, 'n29', 1), (112, 'n30', 2), (113, 'n31', 3), (114, 'n32', 4), (115, 'n33', 0), (116, 'n34', 1), (117, 'n35', 2), (118, 'n36', 3), (119, 'n37', 4), (120, 'n38', 0), (121, 'n39', 1), (122, 'n40', 2), (123, 'n0', 3), (124, 'n1', 4), (125, 'n2', 0), (126, 'n3', 1), (127, 'n4', 2), (128, 'n5', 3), (129, 'n6', 4), (130, 'n7', 0), (131, 'n8', 1), (132, 'n9', 2), (133, 'n10', 3), (134, 'n11', 4), (135, 'n12', 0), (136, 'n13', 1), (137, 'n14', 2), (138, 'n15', 3), (139, 'n16', 4), (140, 'n17', 0), (141, 'n18', 1), (142, 'n19', 2), (143, 'n20', 3), (144, 'n21', 4), (145, 'n22', 0), (146, 'n23', 1), (147, 'n24', 2), (148, 'n25', 3), (149, 'n26', 4), (150, 'n27', 0), (151, 'n28', 1), (152, 'n29', 2), (153, 'n30', 3), (154, 'n31', 4), (155, 'n32', 0), (156, 'n33', 1), (157, 'n34', 2), (158, 'n35', 3), (159, 'n36', 4), (160, 'n37', 0), (161, 'n38', 1), (162, 'n39', 2), (163, 'n40', 3), (164, 'n0', 4), (165, 'n1', 0), (166, 'n2', 1), (167, 'n3', 2), (168, 'n4', 3), (169, 'n5', 4), (170, 'n6', 0), (171, 'n7', 1), (172, 'n8', 2), (173, 'n9', 3), (174, 'n10', 4), (175, 'n11', 0), (176, 'n12', 1), (177, 'n13', 2), (178, 'n14', 3), (179, 'n15', 4), (180, 'n16', 0), (181, 'n17', 1), (182, 'n18', 2), (183, 'n19', 3), (184, 'n20', 4), (185, 'n21', 0), (186, 'n22', 1), (187, 'n23', 2), (188, 'n24', 3), (189, 'n25', 4), (190, 'n26', 0), (191, 'n27', 1), (192, 'n28', 2), (193, 'n29', 3), (194, 'n30', 4), (195, 'n31', 0), (196, 'n32', 1), (197, 'n33', 2), (198, 'n34', 3), (199, 'n35', 4), (200, 'n36', 0), (201, 'n37', 1), (202, 'n38', 2), (203, 'n39', 3), (204, 'n40', 4), (205, 'n0', 0), (206, 'n1', 1), (207, 'n2', 2), (208, 'n3', 3), (209, 'n4', 4), (210, 'n5', 0), (211, 'n6', 1), (212, 'n7', 2), (213, 'n8', 3), (214, 'n9', 4), (215, 'n10', 0), (216, 'n11', 1), (217, 'n12', 2), (218, 'n13', 3), (219, 'n14', 4), (220, 'n15', 0), (221, 'n16', 1), (222, 'n17', 2), (223, 'n18', 3), (224, 'n19', 4), (225, 'n20', 0), (226, 'n21', 1), (227, 'n22', 2), (228, 'n23', 3), (229, 'n24', 4), (230, 'n25', 0), (231, 'n26', 1), (232, 'n27', 2), (233, 'n28', 3), (234, 'n29', 4), (235, 'n30', 0), (236, 'n31', 1), (237, 'n32', 2), (238, 'n33', 3), (239, 'n34', 4), (240, 'n35', 0), (241, 'n36', 1), (242, 'n37', 2), (243, 'n38', 3), (244, 'n39', 4), (245, 'n40', 0), (246, 'n0', 1), (247, 'n1', 2), (248, 'n2', 3), (249, 'n3', 4), (250, 'n4', 0), (251, 'n5', 1), (252, 'n6', 2), (253, 'n7', 3), (254, 'n8', 4), (255, 'n9', 0), (256, 'n10', 1), (257, 'n11', 2), (258, 'n12', 3), (259, 'n13', 4), (260, 'n14', 0), (261, 'n15', 1), (262, 'n16', 2), (263, 'n17', 3), (264, 'n18', 4), (265, 'n19', 0), (266, 'n20', 1), (267, 'n21', 2), (268, 'n22', 3), (269, 'n23', 4), (270, 'n24', 0), (271, 'n25', 1), (272, 'n26', 2), (273, 'n27', 3), (274, 'n28', 4), (275, 'n29', 0), (276, 'n30', 1), (277, 'n31', 2), (278, 'n32', 3), (279, 'n33', 4), (280, 'n34', 0), (281, 'n35', 1), (282, 'n36', 2), (283, 'n37', 3), (284, 'n38', 4), (285, 'n39', 0), (286, 'n40', 1), (287, 'n0', 2), (288, 'n1', 3), (289, 'n2', 4), (290, 'n3', 0), (291, 'n4', 1), (292, 'n5', 2), (293, 'n6', 3), (294, 'n7', 4), (295, 'n8', 0), (296, 'n9', 1), (297, 'n10', 2), (298, 'n11', 3), (299, 'n12', 4);
+CREATE INDEX ON S USING HASH (NAME);
+SELECT S.K, R.A FROM S, R WHERE S.NAME = R.C AND S.K < 10 AND R.B < 20;
+SELECT S.G, COUNT(*) FROM S, R WHERE R.B = S.K GROUP BY S.G;
+DELETE FROM R WHERE B = 42;
+DELETE FROM R WHERE A >= 1000;
+INSERT INTO R VALUES (5000, 42, 'n7', 1.5), (5001, 42, 'fresh', 2.5), (5002, 43, 'n7', 3.5);
+SELECT R.A, R.B FROM R WHERE B = 42;
+SELECT C, D FROM R WHERE C = 'n7';
+SELECT R.A, R.C FROM R WHERE C = 'fresh';
+SELECT COUNT(*) FROM R;
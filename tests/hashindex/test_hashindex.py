@@ -0,0 +1,77 @@
+import pytest
+import subprocess
+
+from ddb.primitives import ValType
+from ddb.storage import LMDBHashIndex
+from ddb.profile import no_profile_context
+
+testcase_dir = "tests/hashindex/"
+T = 1
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_hashindex_{t_id}")
+
+def test_hash_index_operations(session):
+    # a hash index keeps returning the same entries as its buckets split:
+    subprocess.run(['make', 'clean'], check=True)
+    dbm = session.dbm
+    with dbm.tm.begin_transaction(read_only=False, tmp=True) as tx, \
+        dbm.sm.hash_index(tx, 'hashed', ValType.VARCHAR, [ValType.INTEGER], create_if_not_exists=True) as index:
+        assert isinstance(index, LMDBHashIndex)
+        entries: set[tuple] = set()
+        assert index.bulk_load((f'k{i % 500}', (i, )) for i in range(2000)) == 2000
+        entries.update((f'k{i % 500}', (i, )) for i in range(2000))
+        assert index.bulk_load([('k0', (0, )), ('k0', (-1, ))]) == 1
+        entries.add(('k0', (-1, )))
+        num_buckets = index.stat()['buckets']
+        assert num_buckets > 1
+        for i in range(2000, 6000):
+            index.put(f'k{i % 700}', (i, ))
+            entries.add((f'k{i % 700}', (i, )))
+        index.put('k1', (1, ))
+        assert index.stat()['buckets'] > num_buckets
+        assert index.stat()['entries'] == len(entries)
+        assert index.delete('k3', (3, )) == 1 and index.delete('k3', (3, )) == 0
+        entries.discard(('k3', (3, )))
+        num_deleted = sum(1 for key, _ in entries if key == 'k4')
+        assert index.delete('k4') == num_deleted and num_deleted > 1
+        entries = { (key, row) for key, row in entries if key != 'k4' }
+        assert index.delete('missing') == 0
+        for key in ('k0', 'k3', 'k4', 'k650', 'missing'):
+            assert sorted(index.iter_get(key)) == sorted((k, row) for k, row in entries if k == key)
+        assert sorted(index.iter_scan()) == sorted(entries)
+        assert index.stat()['entries'] == len(entries)
+
+def test_hash_index_duplicate_keys(session):
+    # adding or deleting an entry under a key shared by many others does not read or rewrite them all:
+    subprocess.run(['make', 'clean'], check=True)
+    no_profile_context() # so that only the operations below access the file
+    dbm = session.dbm
+    with dbm.tm.begin_transaction(read_only=False, tmp=True) as tx, \
+        dbm.sm.hash_index(tx, 'hashed', ValType.INTEGER, [ValType.INTEGER], create_if_not_exists=True) as index:
+        assert index.bulk_load((i % 3, (i, )) for i in range(6000)) == 6000
+        counts = index.access_counts
+        for op in (lambda: index.put(1, (-1, )), lambda: index.put(1, (1, )), lambda: index.delete(2, (5, ))):
+            num_seeks, num_entries_read, _, num_entries_written, num_bytes_written = counts.snapshot()
+            op()
+            assert counts.num_seeks - num_seeks == 1
+            assert counts.num_entries_read - num_entries_read <= 1 # the header
+            assert counts.num_entries_written - num_entries_written <= 2 # the entry and the header
+            assert counts.num_bytes_written - num_bytes_written < 100
+        assert sorted(row for _, row in index.iter_get(1)) == [ (-1, ) ] + [ (i, ) for i in range(1, 6000, 3) ]
+        assert sorted(row for _, row in index.iter_get(2)) == [ (i, ) for i in range(2, 6000, 3) if i != 5 ]
+        assert index.delete(0) == 2000
+        assert list(index.iter_get(0)) == [] and index.stat()['entries'] == 4000
+
+@pytest.mark.parametrize("sql", [
+    "CREATE INDEX ON R USING HASH (A, B);",
+    "CREATE INDEX ON R USING GIST (B);",
+    "CREATE INDEX ON R USING HASH (A);",
+])
+def test_invalid_hash_index(run, sql):
+    subprocess.run(['make', 'clean'], check=True)
+    r, = run('CREATE TABLE R(A INT, B INT, PRIMARY KEY(A));')
+    assert r.error is None, r.error_details
+    r, = run(sql)
+    assert r.error is not None
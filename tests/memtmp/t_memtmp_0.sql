@@ -0,0 +1,11 @@
+CREATE TABLE R(A INT, B INT, C VARCHAR);
+INSERT INTO R VALUES (0, 0, 'r0'), (1, 37, 'r1'), (2, 74, 'r2'), (3, 111, 'r3'), (4, 148, 'r4'), (5, 185, 'r5'), (6, 222, 'r6'), (7, 259, 'r7'), (8, 296, 'r8'), (9, 333, 'r9'), (10, 370, 'r10'), (11, 407, 'r11'), (12, 444, 'r12'), (13, 481, 'r13'), (14, 18, 'r14'), (15, 55, 'r15'), (16, 92, 'r16'), (17, 129, 'r17'), (18, 166, 'r18'), (19, 203, 'r19'), (20, 240, 'r20'), (21, 277, 'r21'), (22, 314, 'r22'), (23, 351, 'r23'), (24, 388, 'r24'), (25, 425, 'r25'), (26, 462, 'r26'), (27, 499, 'r27'), (28, 36, 'r28'), (29, 73, 'r29'), (30, 110, 'r30'), (31, 147, 'r31'), (32, 184, 'r32'), (33, 221, 'r33'), (34, 258, 'r34'), (35, 295, 'r35'), (36, 332, 'r36'), (37, 369, 'r37'), (38, 406, 'r38'), (39, 443, 'r39'), (40, 480, 'r40'), (41, 17, 'r41'), (42, 54, 'r42'), (43, 91, 'r43'), (44, 128, 'r44'), (45, 165, 'r45'), (46, 202, 'r46'), (47, 239, 'r47'), (48, 276, 'r48'), (49, 313, 'r49'), (50, 350, 'r50'), (51, 387, 'r51'), (52, 424, 'r52'), (53, 461, 'r53'), (54, 498, 'r54'), (55, 35, 'r55'), (56, 72, 'r56'), (57, 109, 'r57'), (58, 146, 'r58'), (59, 183, 'r59'), (60, 220, 'r60'), (61, 257, 'r0'), (62, 294, 'r1'), (63, 331, 'r2'), (64, 368, 'r3'), (65, 405, 'r4'), (66, 442, 'r5'), (67, 479, 'r6'), (68, 16, 'r7'), (69, 53, 'r8'), (70, 90, 'r9'), (71, 127, 'r10'), (72, 164, 'r11'), (73, 201, 'r12'), (74, 238, 'r13'), (75, 275, 'r14'), (76, 312, 'r15'), (77, 349, 'r16'), (78, 386, 'r17'), (79, 423, 'r18'), (80, 460, 'r19'), (81, 497, 'r20'), (82, 34, 'r21'), (83, 71, 'r22'), (84, 108, 'r23'), (85, 145, 'r24'), (86, 182, 'r25'), (87, 219, 'r26'), (88, 256, 'r27'), (89, 293, 'r28'), (90, 330, 'r29'), (91, 367, 'r30'), (92, 404, 'r31'), (93, 441, 'r32'), (94, 478, 'r33'), (95, 15, 'r34'), (96, 52, 'r35'), (97, 89, 'r36'), (98, 126, 'r37'), (99, 163, 'r38'), (100, 200, 'r39'), (101, 237, 'r40'), (102, 274, 'r41'), (103, 311, 'r42'), (104, 348, 'r43'), (105, 385, 'r44'), (106, 422, 'r45'), (107, 459, 'r46'), (108, 496, 'r47'), (109, 33, 'r48'), (110, 70, 'r49'), (111, 107, 'r50'), (112, 144, 'r51'), (113, 181, 'r52'), (114, 218, 'r53'), (115, 255, 'r54'), (116, 292, 'r55'), (117, 329, 'r56'), (118, 366, 'r57'), (119, 403, 'r58'), (120, 440, 'r59'), (121, 477, 'r60'), (122, 14, 'r0'), (123, 51, 'r1'), (124, 88, 'r2'), (125, 125, 'r3'), (126, 162, 'r4'), (127, 199, 'r5'), (128, 236, 'r6'), (129, 273, 'r7'), (130, 310, 'r8'), (131, 347, 'r9'), (132, 384, 'r10'), (133, 421, 'r11'), (134, 458, 'r12'), (135, 495, 'r13'), (136, 32, 'r14'), (137, 69, 'r15'), (138, 106, 'r16'), (139, 143, 'r17'), (140, 180, 'r18'), (141, 217, 'r19'), (142, 254, 'r20'), (143, 291, 'r21'), (144, 328, 'r22'), (145, 365, 'r23'), (146, 402, 'r24'), (147, 439, 'r25'), (148, 476, 'r26'), (149, 13, 'r27'), (150, 50, 'r28'), (151, 87, 'r29'), (152, 124, 'r30'), (153, 161, 'r31'), (154, 198, 'r32'), (155, 235, 'r33'), (156, 272, 'r34'), (157, 309, 'r35'), (158, 346, 'r36'), (159, 383, 'r37'), (160, 420, 'r38'), (161, 457, 'r39'), (162, 494, 'r40'), (163, 31, 'r41'), (164, 68, 'r42'), (165, 105, 'r43'), (166, 142, 'r44'), (167, 179, 'r45'), (168, 216, 'r46'), (169, 253, 'r47'), (170, 290, 'r48'), (171, 327, 'r49'), (172, 364, 'r50'), (173, 401, 'r51'), (174, 438, 'r52'), (175, 475, 'r53'), (176, 12, 'r54'), (177, 49, 'r55'), (178, 86, 'r56'), (179, 123, 'r57'), (180, 160, 'r58'), (181, 197, 'r59'), (182, 234, 'r60'), (183, 271, 'r0'), (184, 308, 'r1'), (185, 345, 'r2'), (186, 382, 'r3'), (187, 419, 'r4'), (188, 456, 'r5'), (189, 493, 'r6'), (190, 30, 'r7'), (191, 67, 'r8'), (192, 104, 'r9'), (193, 141, 'r10'), (194, 178, 'r11'), (195, 215, 'r12'), (196, 252, 'r13'), (197, 289, 'r14'), (198, 326, 'r15'), (199, 363, 'r16'), (200, 400, 'r17'), (201, 437, 'r18'), (202, 474, 'r19'), (203, 11, 'r20'), (204, 48, 'r21'), (205, 85, 'r22'), (206, 122, 'r23'), (207, 159, 'r24'), (208, 196, 'r25'), (209, 233, 'r26'), (210, 270, 'r27'), (211, 307, 'r28'), (212, 344, 'r29'), (213, 381, 'r30'), (214, 418, 'r31'), (215, 455, 'r32'), (216, 492, 'r33'), (217, 29, 'r34'), (218, 66, 'r35'), (219, 103, 'r36'), (220, 140, 'r37'), (221, 177, 'r38'), (222, 214, 'r39'), (223, 251, 'r40'), (224, 288, 'r41'), (225, 325, 'r42'), (226, 362, 'r43'), (227, 399, 'r44'), (228, 436, 'r45'), (229, 473, 'r46'), (230, 10, 'r47'), (231, 47, 'r48'), (232, 84, 'r49'), (233, 121, 'r50'), (234, 158, 'r51'), (235, 195, 'r52'), (236, 232, 'r53'), (237, 269, 'r54'), (238, 306, 'r55'), (239, 343, 'r56'), (240, 380, 'r57'), (241, 417, 'r58'), (242, 454, 'r59'), (243, 491, 'r60'), (244, 28, 'r0'), (245, 65, 'r1'), (246, 102, 'r2'), (247, 139, 'r3'), (248, 176, 'r4'), (249, 213, 'r5'), (250, 250, 'r6'), (251, 287, 'r7'), (252, 324, 'r8'), (253, 361, 'r9'), (254, 398, 'r10'), (255, 435, 'r11'), (256, 472, 'r12'), (257, 9, 'r13'), (258, 46, 'r14'), (259, 83, 'r15'), (260, 120, 'r16'), (261, 157, 'r17'), (262, 194, 'r18'), (263, 231, 'r19'), (264, 268, 'r20'), (265, 305, 'r21'), (266, 342, 'r22'), (267, 379, 'r23'), (268, 416, 'r24'), (269, 453, 'r25'), (270, 490, 'r26'), (271, 27, 'r27'), (272, 64, 'r28'), (273, 101, 'r29'), (274, 138, 'r30'), (275, 175, 'r31'), (276, 212, 'r32'), (277, 249, 'r33'), (278, 286, 'r34'), (279, 323, 'r35'), (280, 360, 'r36'), (281, 397, 'r37'), (282, 434, 'r38'), (283, 471, 'r39'), (284, 8, 'r40'), (285, 45, 'r41'), (286, 82, 'r42'), (287, 119, 'r43'), (288, 156, 'r44'), (289, 193, 'r45'), (290, 230, 'r46'), (291, 267, 'r47'), (292, 304, 'r48'), (293, 341, 'r49'), (294, 378, 'r50'), (295, 415, 'r51'), (296, 452, 'r52'), (297, 489, 'r53'), (298, 26, 'r54'), (299, 63, 'r55'), (300, 100, 'r56'), (301, 137, 'r57'), (302, 174, 'r58'), (303, 211, 'r59'), (304, 248, 'r60'), (305, 285, 'r0'), (306, 322, 'r1'), (307, 359, 'r2'), (308, 396, 'r3'), (309, 433, 'r4'), (310, 470, 'r5'), (311, 7, 'r6'), (312, 44, 'r7'), (313, 81, 'r8'), (314, 118, 'r9'), (315, 155, 'r10'), (316, 192, 'r11'), (317, 229, 'r12'), (318, 266, 'r13'), (319, 303, 'r14'), (320, 340, 'r15'), (321, 377, 'r16'), (322, 414, 'r17'), (323, 451, 'r18'), (324, 488, 'r19'), (325, 25, 'r20'), (326, 62, 'r21'), (327, 99, 'r22'), (328, 136, 'r23'), (329, 173, 'r24'), (330, 210, 'r25'), (331, 247, 'r26'), (332, 284, 'r27'), (333, 321, 'r28'), (334, 358, 'r29'), (335, 395, 'r30'), (336, 432, 'r31'), (337, 469, 'r32'), (338, 6, 'r33'), (339, 43, 'r34'), (340, 80, 'r35'), (341, 117, 'r36'), (342, 154, 'r37'), (343, 191, 'r38'), (344, 228, 'r39'), (345, 265, 'r40'), (346, 302, 'r41'), (347, 339, 'r42'), (348, 376, 'r43'), (349, 413, 'r44'), (350, 450, 'r45'), (351, 487, 'r46'), (352, 24, 'r47'), (353, 61, 'r48'), (354, 98, 'r49'), (355, 135, 'r50'), (356, 172, 'r51'), (357, 209, 'r52'), (358, 246, 'r53'), (359, 283, 'r54'), (360, 320, 'r55'), (361, 357, 'r56'), (362, 394, 'r57'), (363, 431, 'r58'), (364, 468, 'r59'), (365, 5, 'r60'), (366, 42, 'r0'), (367, 79, 'r1'), (368, 116, 'r2'), (369, 153, 'r3'), (370, 190, 'r4'), (371, 227, 'r5'), (372, 264, 'r6'), (373, 301, 'r7'), (374, 338, 'r8'), (375, 375, 'r9'), (376, 412, 'r10'), (377, 449, 'r11'), (378, 486, 'r12'), (379, 23, 'r13'), (380, 60, 'r14'), (381, 97, 'r15'), (382, 134, 'r16'), (383, 171, 'r17'), (384, 208, 'r18'), (385, 245, 'r19'), (386, 282, 'r20'), (387, 319, 'r21'), (388, 356, 'r22'), (389, 393, 'r23'), (390, 430, 'r24'), (391, 467, 'r25'), (392, 4, 'r26'), (393, 41, 'r27'), (394, 78, 'r28'), (395, 115, 'r29'), (396, 152, 'r30'), (397, 189, 'r31'), (398, 226, 'r32'), (399, 263, 'r33'), (400, 300, 'r34'), (401, 337, 'r35'), (402, 374, 'r36'), (403, 411, 'r37'), (404, 448, 'r38'), (405, 485, 'r39'), (406, 22, 'r40'), (407, 59, 'r41'), (408, 96, 'r42'), (409, 133, 'r43'), (410, 170, 'r44'), (411, 207, 'r45'), (412, 244, 'r46'), (413, 281, 'r47'), (414, 318, 'r48'), (415, 355, 'r49'), (416, 392, 'r50'), (417, 429, 'r51'), (418, 466, 'r52'), (419, 3, 'r53'), (420, 40, 'r54'), (421, 77, 'r55'), (422, 114, 'r56'), (423, 151, 'r57'), (424, 188, 'r58'), (425, 225, 'r59'), (426, 262, 'r60'), (427, 299, 'r0'), (428, 336, 'r1'), (429, 373, 'r2'), (430, 410, 'r3'), (431, 447, 'r4'), (432, 484, 'r5'), (433, 21, 'r6'), (434, 58, 'r7'), (435, 95, 'r8'), (436, 132, 'r9'), (437, 169, 'r10'), (438, 206, 'r11'), (439, 243, 'r12'), (440, 280, 'r13'), (441, 317, 'r14'), (442, 354, 'r15'), (443, 391, 'r16'), (444, 428, 'r17'), (445, 465, 'r18'), (446, 2, 'r19'), (447, 39, 'r20'), (448, 76, 'r21'), (449, 113, 'r22'), (450, 150, 'r23'), (451, 187, 'r24'), (452, 224, 'r25'), (453, 261, 'r26'), (454, 298, 'r27'), (455, 335, 'r28'), (456, 372, 'r29'), (457, 409, 'r30'), (458, 446, 'r31'), (459, 483, 'r32'), (460, 20, 'r33'), (461, 57, 'r34'), (462, 94, 'r35'), (463, 131, 'r36'), (464, 168, 'r37'), (465, 205, 'r38'), (466, 242, 'r39'), (467, 279, 'r40'), (468, 316, 'r41'), (469, 353, 'r42'), (470, 390, 'r43'), (471, 427, 'r44'), (472, 464, 'r45'), (473, 1, 'r46'), (474, 38, 'r47'), (475, 75, 'r48'), (476, 112, 'r49'), (477, 149, 'r50'), (478, 186, 'r51'), (479, 223, 'r52'), (480, 260, 'r53'), (481, 297, 'r54'), (482, 334, 'r55'), (483, 371, 'r56'), (484, 408, 'r57'), (485, 445, 'r58'), (486, 482, 'r59'), (487, 19, 'r60'), (488, 56, 'r0'), (489, 93, 'r1'), (490, 130, 'r2'), (491, 167, 'r3'), (492, 204, 'r4'), (493, 241, 'r5'), (494, 278, 'r6'), (495, 315, 'r7'), (496, 352, 'r8'), (497, 389, 'r9'), (498, 426, 'r10'), (499, 463, 'r11'), (500, 0, 'r12'), (501, 37, 'r13'), (502, 74, 'r14'), (503, 111, 'r15'), (504, 148, 'r16'), (505, 185, 'r17'), (506, 222, 'r18'), (507, 259, 'r19'), (508, 296, 'r20'), (509, 333, 'r21'), (510, 370, 'r22'), (511, 407, 'r23'), (512, 444, 'r24'), (513, 481, 'r25'), (514, 18, 'r26'), (515, 55, 'r27'), (516, 92, 'r28'), (517, 129, 'r29'), (518, 166, 'r30'), (519, 203, 'r31'), (520, 240, 'r32'), (521, 277, 'r33'), (522, 314, 'r34'), (523, 351, 'r35'), (524, 388, 'r36'), (525, 425, 'r37'), (526, 462, 'r38'), (527, 499, 'r39'), (528, 36, 'r40'), (529, 73, 'r41'), (530, 110, 'r42'), (531, 147, 'r43'), (532, 184, 'r44'), (533, 221, 'r45'), (534, 258, 'r46'), (535, 295, 'r47'), (536, 332, 'r48'), (537, 369, 'r49'), (538, 406, 'r50'), (539, 443, 'r51'), (540, 480, 'r52'), (541, 17, 'r53'), (542, 54, 'r54'), (543, 91, 'r55'), (544, 128, 'r56'), (545, 165, 'r57'), (546, 202, 'r58'), (547, 239, 'r59'), (548, 276, 'r60'), (549, 313, 'r0'), (550, 350, 'r1'), (551, 387, 'r2'), (552, 424, 'r3'), (553, 461, 'r4'), (554, 498, 'r5'), (555, 35, 'r6'), (556, 72, 'r7'), (557, 109, 'r8'), (558, 146, 'r9'), (559, 183, 'r10'), (560, 220, 'r11'), (561, 257, 'r12'), (562, 294, 'r13'), (563, 331, 'r14'), (564, 368, 'r15'), (565, 405, 'r16'), (566, 442, 'r17'), (567, 479, 'r18'), (568, 16, 'r19'), (569, 53, 'r20'), (570, 90, 'r21'), (571, 127, 'r22'), (572, 164, 'r23'), (573, 201, 'r24'), (574, 238, 'r25'), (575, 275, 'r26'), (576, 312, 'r27'), (577, 349, 'r28'), (578, 386, 'r29'), (579, 423, 'r30'), (580, 460, 'r31'), (581, 497, 'r32'), (582, 34, 'r33'), (583, 71, 'r34'), (584, 108, 'r35'), (585, 145, 'r36'), (586, 182, 'r37'), (587, 219, 'r38'), (588, 256, 'r39'), (589, 293, 'r40'), (590, 330, 'r41'), (591, 367, 'r42'), (592, 404, 'r43'), (593, 441, 'r44'), (594, 478, 'r45'), (595, 15, 'r46'), (596, 52, 'r47'), (597, 89, 'r48'), (598, 126, 'r49'), (599, 163, 'r50'), (600, 200, 'r51'), (601, 237, 'r52'), (602, 274, 'r53'), (603, 311, 'r54'), (604, 348, 'r55'), (605, 385, 'r56'), (606, 422, 'r57'), (607, 459, 'r58'), (608, 496, 'r59'), (609, 33, 'r60'), (610, 70, 'r0'), (611, 107, 'r1'), (612, 144, 'r2'), (613, 181, 'r3'), (614, 218, 'r4'), (615, 255, 'r5'), (616, 292, 'r6'), (617, 329, 'r7'), (618, 366, 'r8'), (619, 403, 'r9'), (620, 440, 'r10'), (621, 477, 'r11'), (622, 14, 'r12'), (623, 51, 'r13'), (624, 88, 'r14'), (625, 125, 'r15'), (626, 162, 'r16'), (627, 199, 'r17'), (628, 236, 'r18'), (629, 273, 'r19'), (630, 310, 'r20'), (631, 347, 'r21'), (632, 384, 'r22'), (633, 421, 'r23'), (634, 458, 'r24'), (635, 495, 'r25'), (636, 32, 'r26'), (637, 69, 'r27'), (638, 106, 'r28'), (639, 143, 'r29'), (640, 180, 'r30'), (641, 217, 'r31'), (642, 254, 'r32'), (643, 291, 'r33'), (644, 328, 'r34'), (645, 365, 'r35'), (646, 402, 'r36'), (647, 439, 'r37'), (648, 476, 'r38'), (649, 13, 'r39'), (650, 50, 'r40'), (651, 87, 'r41'), (652, 124, 'r42'), (653, 161, 'r43'), (654, 198, 'r44'), (655, 235, 'r45'), (656, 272, 'r46'), (657, 309, 'r47'), (658, 346, 'r48'), (659, 383, 'r49'), (660, 420, 'r50'), (661, 457, 'r51'), (662, 494, 'r52'), (663, 31, 'r53'), (664, 68, 'r54'), (665, 105, 'r55'), (666, 142, 'r56'), (667, 179, 'r57'), (668, 216, 'r58'), (669, 253, 'r59'), (670, 290, 'r60'), (671, 327, 'r0'), (672, 364, 'r1'), (673, 401, 'r2'), (674, 438, 'r3'), (675, 475, 'r4'), (676, 12, 'r5'), (677, 49, 'r6'), (678, 86, 'r7'), (679, 123, 'r8'), (680, 160, 'r9'), (681, 197, 'r10'), (682, 234, 'r11'), (683, 271, 'r12'), (684, 308, 'r13'), (685, 345, 'r14'), (686, 382, 'r15'), (687, 419, 'r16'), (688, 456, 'r17'), (689, 493, 'r18'), (690, 30, 'r19'), (691, 67, 'r20'), (692, 104, 'r21'), (693, 141, 'r22'), (694, 178, 'r23'), (695, 215, 'r24'), (696, 252, 'r25'), (697, 289, 'r26'), (698, 326, 'r27'), (699, 363, 'r28'), (700, 400, 'r29'), (701, 437, 'r30'), (702, 474, 'r31'), (703, 11, 'r32'), (704, 48, 'r33'), (705, 85, 'r34'), (706, 122, 'r35'), (707, 159, 'r36'), (708, 196, 'r37'), (709, 233, 'r38'), (710, 270, 'r39'), (711, 307, 'r40'), (712, 344, 'r41'), (713, 381, 'r42'), (714, 418, 'r43'), (715, 455, 'r44'), (716, 492, 'r45'), (717, 29, 'r46'), (718, 66, 'r47'), (719, 103, 'r48'), (720, 140, 'r49'), (721, 177, 'r50'), (722, 214, 'r51'), (723, 251, 'r52'), (724, 288, 'r53'), (725, 325, 'r54'), (726, 362, 'r55'), (727, 399, 'r56'), (728, 436, 'r57'), (729, 473, 'r58'), (730, 10, 'r59'), (731, 47, 'r60'), (732, 84, 'r0'), (733, 121, 'r1'), (734, 158, 'r2'), (735, 195, 'r3'), (736, 232, 'r4'), (737, 269, 'r5'), (738, 306, 'r6'), (739, 343, 'r7'), (740, 380, 'r8'), (741, 417, 'r9'), (742, 454, 'r10'), (743, 491, 'r11'), (744, 28, 'r12'), (745, 65, 'r13'), (746, 102, 'r14'), (747, 139, 'r15'), (748, 176, 'r16'), (749, 213, 'r17'), (750, 250, 'r18'), (751, 287, 'r19'), (752, 324, 'r20'), (753, 361, 'r21'), (754, 398, 'r22'), (755, 435, 'r23'), (756, 472, 'r24'), (757, 9, 'r25'), (758, 46, 'r26'), (759, 83, 'r27'), (760, 120, 'r28'), (761, 157, 'r29'), (762, 194, 'r30'), (763, 231, 'r31'), (764, 268, 'r32'), (765, 305, 'r33'), (766, 342, 'r34'), (767, 379, 'r35'), (768, 416, 'r36'), (769, 453, 'r37'), (770, 490, 'r38'), (771, 27, 'r39'), (772, 64, 'r40'), (773, 101, 'r41'), (774, 138, 'r42'), (775, 175, 'r43'), (776, 212, 'r44'), (777, 249, 'r45'), (778, 286, 'r46'), (779, 323, 'r47'), (780, 360, 'r48'), (781, 397, 'r49'), (782, 434, 'r50'), (783, 471, 'r51'), (784, 8, 'r52'), (785, 45, 'r53'), (786, 82, 'r54'), (787, 119, 'r55'), (788, 156, 'r56'), (789, 193, 'r57'), (790, 230, 'r58'), (791, 267, 'r59'), (792, 304, 'r60'), (793, 341, 'r0'), (794, 378, 'r1'), (795, 415, 'r2'), (796, 452, 'r3'), (797, 489, 'r4'), (798, 26, 'r5'), (799, 63, 'r6'), (800, 100, 'r7'), (801, 137, 'r8'), (802, 174, 'r9'), (803, 211, 'r10'), (804, 248, 'r11'), (805, 285, 'r12'), (806, 322, 'r13'), (807, 359, 'r14'), (808, 396, 'r15'), (809, 433, 'r16'), (810, 470, 'r17'), (811, 7, 'r18'), (812, 44, 'r19'), (813, 81, 'r20'), (814, 118, 'r21'), (815, 155, 'r22'), (816, 192, 'r23'), (817, 229, 'r24'), (818, 266, 'r25'), (819, 303, 'r26'), (820, 340, 'r27'), (821, 377, 'r28'), (822, 414, 'r29'), (823, 451, 'r30'), (824, 488, 'r31'), (825, 25, 'r32'), (826, 62, 'r33'), (827, 99, 'r34'), (828, 136, 'r35'), (829, 173, 'r36'), (830, 210, 'r37'), (831, 247, 'r38'), (832, 284, 'r39'), (833, 321, 'r40'), (834, 358, 'r41'), (835, 395, 'r42'), (836, 432, 'r43'), (837, 469, 'r44'), (838, 6, 'r45'), (839, 43, 'r46'), (840, 80, 'r47'), (841, 117, 'r48'), (842, 154, 'r49'), (843, 191, 'r50'), (844, 228, 'r51'), (845, 265, 'r52'), (846, 302, 'r53'), (847, 339, 'r54'), (848, 376, 'r55'), (849, 413, 'r56'), (850, 450, 'r57'), (851, 487, 'r58'), (852, 24, 'r59'), (853, 61, 'r60'), (854, 98, 'r0'), (855, 135, 'r1'), (856, 172, 'r2'), (857, 209, 'r3'), (858, 246, 'r4'), (859, 283, 'r5'), (860, 320, 'r6'), (861, 357, 'r7'), (862, 394, 'r8'), (863, 431, 'r9'), (864, 468, 'r10'), (865, 5, 'r11'), (866, 42, 'r12'), (867, 79, 'r13'), (868, 116, 'r14'), (869, 153, 'r15'), (870, 190, 'r16'), (871, 227, 'r17'), (872, 264, 'r18'), (873, 301, 'r19'), (874, 338, 'r20'), (875, 375, 'r21'), (876, 412, 'r22'), (877, 449, 'r23'), (878, 486, 'r24'), (879, 23, 'r25'), (880, 60, 'r26'), (881, 97, 'r27'), (882, 134, 'r28'), (883, 171, 'r29'), (884, 208, 'r30'), (885, 245, 'r31'), (886, 282, 'r32'), (887, 319, 'r33'), (888, 356, 'r34'), (889, 393, 'r35'), (890, 430, 'r36'), (891, 467, 'r37'), (892, 4, 'r38'), (893, 41, 'r39'), (894, 78, 'r40'), (895, 115, 'r41'), (896, 152, 'r42'), (897, 189, 'r43'), (898, 226, 'r44'), (899, 263, 'r45'), (900, 300, 'r46'), (901, 337, 'r47'), (902, 374, 'r48'), (903, 411, 'r49'), (904, 448, 'r50'), (905, 485, 'r51'), (906, 22, 'r52'), (907, 59, 'r53'), (908, 96, 'r54'), (909, 133, 'r55'), (910, 170, 'r56'), (911, 207, 'r57'), (912, 244, 'r58'), (913, 281, 'r59'), (914, 318, 'r60'), (915, 355, 'r0'), (916, 392, 'r1'), (917, 429, 'r2'), (918, 466, 'r3'), (919, 3, 'r4'), (920, 40, 'r5'), (921, 77, 'r6'), (922, 114, 'r7'), (923, 151, 'r8'), (924, 188, 'r9'), (925, 225, 'r10'), (926, 262, 'r11'), (927, 299, 'r12'), (928, 336, 'r13'), (929, 373, 'r14'), (930, 410, 'r15'), (931, 447, 'r16'), (932, 484, 'r17'), (933, 21, 'r18'), (934, 58, 'r19'), (935, 95, 'r20'), (936, 132, 'r21'), (937, 169, 'r22'), (938, 206, 'r23'), (939, 243, 'r24'), (940, 280, 'r25'), (941, 317, 'r26'), (942, 354, 'r27'), (943, 391, 'r28'), (944, 428, 'r29'), (945, 465, 'r30'), (946, 2, 'r31'), (947, 39, 'r32'), (948, 76, 'r33'), (949, 113, 'r34'), (950, 150, 'r35'), (951, 187, 'r36'), (952, 224, 'r37'), (953, 261, 'r38'), (954, 298, 'r39'), (955, 335, 'r40'), (956, 372, 'r41'), (957, 409, 'r42'), (958, 446, 'r43'), (959, 483, 'r44'), (960, 20, 'r45'), (961, 57, 'r46'), (962, 94, 'r47'), (963, 131, 'r48'), (964, 168, 'r49'), (965, 205, 'r50'), (966, 242, 'r51'), (967, 279, 'r52'), (968, 316, 'r53'), (969, 353, 'r54'), (970, 390, 'r55'), (971, 427, 'r56'), (972, 464, 'r57'), (973, 1, 'r58'), (974, 38, 'r59'), (975, 75, 'r60'), (976, 112, 'r0'), (977, 149, 'r1'), (978, 186, 'r2'), (979, 223, 'r3'), (980, 260, 'r4'), (981, 297, 'r5'), (982, 334, 'r6'), (983, 371, 'r7'), (984, 408, 'r8'), (985, 445, 'r9'), (986, 482, 'r10'), (987, 19, 'r11'), (988, 56, 'r12'), (989, 93, 'r13'), (990, 130, 'r14'), (991, 167, 'r15'), (992, 204, 'r16'), (993, 241, 'r17'), (994, 278, 'r18'), (995, 315, 'r19'), (996, 352, 'r20'), (997, 389, 'r21'), (998, 426, 'r22'), (999, 463, 'r23'), (1000, 0, 'r24'), (1001, 37, 'r25'), (1002, 74, 'r26'), (1003, 111, 'r27'), (1004, 148, 'r28'), (1005, 185, 'r29'), (1006, 222, 'r30'), (1007, 259, 'r31'), (1008, 296, 'r32'), (1009, 333, 'r33'), (1010, 370, 'r34'), (1011, 407, 'r35'), (1012, 444, 'r36'), (1013, 481, 'r37'), (1014, 18, 'r38'), (1015, 55, 'r39'), (1016, 92, 'r40'), (1017, 129, 'r41'), (1018, 166, 'r42'), (1019, 203, 'r43'), (1020, 240, 'r44'), (1021, 277, 'r45'), (1022, 314, 'r46'), (1023, 351, 'r47'), (1024, 388, 'r48'), (1025, 425, 'r49'), (1026, 462, 'r50'), (1027, 499, 'r51'), (1028, 36, 'r52'), (1029, 73, 'r53'), (1030, 110, 'r54'), (1031, 147, 'r55'), (1032, 184, 'r56'), (1033, 221, 'r57'), (1034, 258, 'r58'), (1035, 295, 'r59'), (1036, 332, 'r60'), (1037, 369, 'r0'), (1038, 406, 'r1'), (1039, 443, 'r2'), (1040, 480, 'r3'), (1041, 17, 'r4'), (1042, 54, 'r5'), (1043, 91, 'r6'), (1044, 128, 'r7'), (1045, 165, 'r8'), (1046, 202, 'r9'), (1047, 239, 'r10'), (1048, 276, 'r11'), (1049, 313, 'r12'), (1050, 350, 'r13'), (1051, 387, 'r14'), (1052, 424, 'r15'), (1053, 461, 'r16'), (1054, 498, 'r17'), (1055, 35, 'r18'), (1056, 72, 'r19'), (1057, 109, 'r20'), (1058, 146, 'r21'), (1059, 183, 'r22'), (1060, 220, 'r23'), (1061, 257, 'r24'), (1062, 294, 'r25'), (1063, 331, 'r26'), (1064, 368, 'r27'), (1065, 405, 'r28'), (1066, 442, 'r29'), (1067, 479, 'r30'), (1068, 16, 'r31'), (1069, 53, 'r32'), (1070, 90, 'r33'), (1071, 127, 'r34'), (1072, 164, 'r35'), (1073, 201, 'r36'), (1074, 238, 'r37'), (1075, 275, 'r38'), (1076, 312, 'r39'), (1077, 349, 'r40'), (1078, 386, 'r41'), (1079, 423, 'r42'), (1080, 460, 'r43'), (1081, 497, 'r44'), (1082, 34, 'r45'), (1083, 71, 'r46'), (1084, 108, 'r47'), (1085, 145, 'r48'), (1086, 182, 'r49'), (1087, 219, 'r50'), (1088, 256, 'r51'), (1089, 293, 'r52'), (1090, 330, 'r53'), (1091, 367, 'r54'), (1092, 404, 'r55'), (1093, 441, 'r56'), (1094, 478, 'r57'), (1095, 15, 'r58'), (1096, 52, 'r59'), (1097, 89, 'r60'), (1098, 126, 'r0'), (1099, 163, 'r1'), (1100, 200, 'r2'), (1101, 237, 'r3'), (1102, 274, 'r4'), (1103, 311, 'r5'), (1104, 348, 'r6'), (1105, 385, 'r7'), (1106, 422, 'r8'), (1107, 459, 'r9'), (1108, 496, 'r10'), (1109, 33, 'r11'), (1110, 70, 'r12'), (1111, 107, 'r13'), (1112, 144, 'r14'), (1113, 181, 'r15'), (1114, 218, 'r16'), (1115, 255, 'r17'), (1116, 292, 'r18'), (1117, 329, 'r19'), (1118, 366, 'r20'), (1119, 403, 'r21'), (1120, 440, 'r22'), (1121, 477, 'r23'), (1122, 14, 'r24'), (1123, 51, 'r25'), (1124, 88, 'r26'), (1125, 125, 'r27'), (1126, 162, 'r28'), (1127, 199, 'r29'), (1128, 236, 'r30'), (1129, 273, 'r31'), (1130, 310, 'r32'), (1131, 347, 'r33'), (1132, 384, 'r34'), (1133, 421, 'r35'), (1134, 458, 'r36'), (1135, 495, 'r37'), (1136, 32, 'r38'), (1137, 69, 'r39'), (1138, 106, 'r40'), (1139, 143, 'r41'), (1140, 180, 'r42'), (1141, 217, 'r43'), (1142, 254, 'r44'), (1143, 291, 'r45'), (1144, 328, 'r46'), (1145, 365, 'r47'), (1146, 402, 'r48'), (1147, 439, 'r49'), (1148, 476, 'r50'), (1149, 13, 'r51'), (1150, 50, 'r52'), (1151, 87, 'r53'), (1152, 124, 'r54'), (1153, 161, 'r55'), (1154, 198, 'r56'), (1155, 235, 'r57'), (1156, 272, 'r58'), (1157, 309, 'r59'), (1158, 346, 'r60'), (1159, 383, 'r0'), (1160, 420, 'r1'), (1161, 457, 'r2'), (1162, 494, 'r3'), (1163, 31, 'r4'), (1164, 68, 'r5'), (1165, 105, 'r6'), (1166, 142, 'r7'), (1167, 179, 'r8'), (1168, 216, 'r9'), (1169, 253, 'r10'), (1170, 290, 'r11'), (1171, 327, 'r12'), (1172, 364, 'r13'), (1173, 401, 'r14'), (1174, 438, 'r15'), (1175, 475, 'r16'), (1176, 12, 'r17'), (1177, 49, 'r18'), (1178, 86, 'r19'), (1179, 123, 'r20'), (1180, 160, 'r21'), (1181, 197, 'r22'), (1182, 234, 'r23'), (1183, 271, 'r24'), (1184, 308, 'r25'), (1185, 345, 'r26'), (1186, 382, 'r27'), (1187, 419, 'r28'), (1188, 456, 'r29'), (1189, 493, 'r30'), (1190, 30, 'r31'), (1191, 67, 'r32'), (1192, 104, 'r33'), (1193, 141, 'r34'), (1194, 178, 'r35'), (1195, 215, 'r36'), (1196, 252, 'r37'), (1197, 289, 'r38'), (1198, 326, 'r39'), (1199, 363, 'r40'), (1200, 400, 'r41'), (1201, 437, 'r42'), (1202, 474, 'r43'), (1203, 11, 'r44'), (1204, 48, 'r45'), (1205, 85, 'r46'), (1206, 122, 'r47'), (1207, 159, 'r48'), (1208, 196, 'r49'), (1209, 233, 'r50'), (1210, 270, 'r51'), (1211, 307, 'r52'), (1212, 344, 'r53'), (1213, 381, 'r54'), (1214, 418, 'r55'), (1215, 455, 'r56'), (1216, 492, 'r57'), (1217, 29, 'r58'), (1218, 66, 'r59'), (1219, 103, 'r60'), (1220, 140, 'r0'), (1221, 177, 'r1'), (1222, 214, 'r2'), (1223, 251, 'r3'), (1224, 288, 'r4'), (1225, 325, 'r5'), (1226, 362, 'r6'), (1227, 399, 'r7'), (1228, 436, 'r8'), (1229, 473, 'r9'), (1230, 10, 'r10'), (1231, 47, 'r11'), (1232, 84, 'r12'), (1233, 121, 'r13'), (1234, 158, 'r14'), (1235, 195, 'r15'), (1236, 232, 'r16'), (1237, 269, 'r17'), (1238, 306, 'r18'), (1239, 343, 'r19'), (1240, 380, 'r20'), (1241, 417, 'r21'), (1242, 454, 'r22'), (1243, 491, 'r23'), (1244, 28, 'r24'), (1245, 65, 'r25'), (1246, 102, 'r26'), (1247, 139, 'r27'), (1248, 176, 'r28'), (1249, 213, 'r29'), (1250, 250, 'r30'), (1251, 287, 'r31'), (1252, 324, 'r32'), (1253, 361, 'r33'), (1254, 398, 'r34'), (1255, 435, 'r35'), (1256, 472, 'r36'), (1257, 9, 'r37'), (1258, 46, 'r38'), (1259, 83, 'r39'), (1260, 120, 'r40'), (1261, 157, 'r41'), (1262, 194, 'r42'), (1263, 231, 'r43'), (1264, 268, 'r44'), (1265, 305, 'r45'), (1266, 342, 'r46'), (1267, 379, 'r47'), (1268, 416, 'r48'), (1269, 453, 'r49'), (1270, 490, 'r50'), (1271, 27, 'r51'), (1272, 64, 'r52'), (1273, 101, 'r53'), (1274, 138, 'r54'), (1275, 175, 'r55'), (1276, 212, 'r56'), (1277, 249, 'r57'), (1278, 286, 'r58'), (1279, 323, 'r59'), (1280, 360, 'r60'), (1281, 397, 'r0'), (1282, 434, 'r1'), (1283, 471, 'r2'), (1284, 8, 'r3'), (1285, 45, 'r4'), (1286, 82, 'r5'), (1287, 119, 'r6'), (1288, 156, 'r7'), (1289, 193, 'r8'), (1290, 230, 'r9'), (1291, 267, 'r10'), (1292, 304, 'r11'), (1293, 341, 'r12'), (1294, 378, 'r13'), (1295, 415, 'r14'), (1296, 452, 'r15'), (1297, 489, 'r16'), (1298, 26, 'r17'), (1299, 63, 'r18'), (1300, 100, 'r19'), (1301, 137, 'r20'), (1302, 174, 'r21'), (1303, 211, 'r22'), (1304, 248, 'r23'), (1305, 285, 'r24'), (1306, 322, 'r25'), (1307, 359, 'r26'), (1308, 396, 'r27'), (1309, 433, 'r28'), (1310, 470, 'r29'), (1311, 7, 'r30'), (1312, 44, 'r31'), (1313, 81, 'r32'), (1314, 118, 'r33'), (1315, 155, 'r34'), (1316, 192, 'r35'), (1317, 229, 'r36'), (1318, 266, 'r37'), (1319, 303, 'r38'), (1320, 340, 'r39'), (1321, 377, 'r40'), (1322, 414, 'r41'), (1323, 451, 'r42'), (1324, 488, 'r43'), (1325, 25, 'r44'), (1326, 62, 'r45'), (1327, 99, 'r46'), (1328, 136, 'r47'), (1329, 173, 'r48'), (1330, 210, 'r49'), (1331, 247, 'r50'), (1332, 284, 'r51'), (1333, 321, 'r52'), (1334, 358, 'r53'), (1335, 395, 'r54'), (1336, 432, 'r55'), (1337, 469, 'r56'), (1338, 6, 'r57'), (1339, 43, 'r58'), (1340, 80, 'r59'), (1341, 117, 'r60'), (1342, 154, 'r0'), (1343, 191, 'r1'), (1344, 228, 'r2'), (1345, 265, 'r3'), (1346, 302, 'r4'), (1347, 339, 'r5'), (1348, 376, 'r6'), (1349, 413, 'r7'), (1350, 450, 'r8'), (1351, 487, 'r9'), (1352, 24, 'r10'), (1353, 61, 'r11'), (1354, 98, 'r12'), (1355, 135, 'r13'), (1356, 172, 'r14'), (1357, 209, 'r15'), (1358, 246, 'r16'), (1359, 283, 'r17'), (1360, 320, 'r18'), (1361, 357, 'r19'), (1362, 394, 'r20'), (1363, 431, 'r21'), (1364, 468, 'r22'), (1365, 5, 'r23'), (1366, 42, 'r24'), (1367, 79, 'r25'), (1368, 116, 'r26'), (1369, 153, 'r27'), (1370, 190, 'r28'), (1371, 227, 'r29'), (1372, 264, 'r30'), (1373, 301, 'r31'), (1374, 338, 'r32'), (1375, 375, 'r33'), (1376, 412, 'r34'), (1377, 449, 'r35'), (1378, 486, 'r36'), (1379, 23, 'r37'), (1380, 60, 'r38'), (1381, 97, 'r39'), (1382, 134, 'r40'), (1383, 171, 'r41'), (1384, 208, 'r42'), (1385, 245, 'r43'), (1386, 282, 'r44'), (1387, 319, 'r45'), (1388, 356, 'r46'), (1389, 393, 'r47'), (1390, 430, 'r48'), (1391, 467, 'r49'), (1392, 4, 'r50'), (1393, 41, 'r51'), (1394, 78, 'r52'), (1395, 115, 'r53'), (1396, 152, 'r54'), (1397, 189, 'r55'), (1398, 226, 'r56'), (1399, 263, 'r57'), (1400, 300, 'r58'), (1401, 337, 'r59'), (1402, 374, 'r60'), (1403, 411, 'r0'), (1404, 448, 'r1'), (1405, 485, 'r2'), (1406, 22, 'r3'), (1407, 59, 'r4'), (1408, 96, 'r5'), (1409, 133, 'r6'), (1410, 170, 'r7'), (1411, 207, 'r8'), (1412, 244, 'r9'), (1413, 281, 'r10'), (1414, 318, 'r11'), (1415, 355, 'r12'), (1416, 392, 'r13'), (1417, 429, 'r14'), (1418, 466, 'r15'), (1419, 3, 'r16'), (1420, 40, 'r17'), (1421, 77, 'r18'), (1422, 114, 'r19'), (1423, 151, 'r20'), (1424, 188, 'r21'), (1425, 225, 'r22'), (1426, 262, 'r23'), (1427, 299, 'r24'), (1428, 336, 'r25'), (1429, 373, 'r26'), (1430, 410, 'r27'), (1431, 447, 'r28'), (1432, 484, 'r29'), (1433, 21, 'r30'), (1434, 58, 'r31'), (1435, 95, 'r32'), (1436, 132, 'r33'), (1437, 169, 'r34'), (1438, 206, 'r35'), (1439, 243, 'r36'), (1440, 280, 'r37'), (1441, 317, 'r38'), (1442, 354, 'r39'), (1443, 391, 'r40'), (1444, 428, 'r41'), (1445, 465, 'r42'), (1446, 2, 'r43'), (1447, 39, 'r44'), (1448, 76, 'r45'), (1449, 113, 'r46'), (1450, 150, 'r47'), (1451, 187, 'r48'), (1452, 224, 'r49'), (1453, 261, 'r50'), (1454, 298, 'r51'), (1455, 335, 'r52'), (1456, 372, 'r53'), (1457, 409, 'r54'), (1458, 446, 'r55'), (1459, 483, 'r56'), (1460, 20, 'r57'), (1461, 57, 'r58'), (1462, 94, 'r59'), (1463, 131, 'r60'), (1464, 168, 'r0'), (1465, 205, 'r1'), (1466, 242, 'r2'), (1467, 279, 'r3'), (1468, 316, 'r4'), (1469, 353, 'r5'), (1470, 390, 'r6'), (1471, 427, 'r7'), (1472, 464, 'r8'), (1473, 1, 'r9'), (1474, 38, 'r10'), (1475, 75, 'r11'), (1476, 112, 'r12'), (1477, 149, 'r13'), (1478, 186, 'r14'), (1479, 223, 'r15'), (1480, 260, 'r16'), (1481, 297, 'r17'), (1482, 334, 'r18'), (1483, 371, 'r19'), (1484, 408, 'r20'), (1485, 445, 'r21'), (1486, 482, 'r22'), (1487, 19, 'r23'), (1488, 56, 'r24'), (1489, 93, 'r25'), (1490, 130, 'r26'), (1491, 167, 'r27'), (1492, 204, 'r28'), (1493, 241, 'r29'), (1494, 278, 'r30'), (1495, 315, 'r31'), (1496, 352, 'r32'), (1497, 389, 'r33'), (1498, 426, 'r34'), (1499, 463, 'r35'), (1500, 0, 'r36'), (1501, 37, 'r37'), (1502, 74, 'r38'), (1503, 111, 'r39'), (1504, 148, 'r40'), (1505, 185, 'r41'), (1506, 222, 'r42'), (1507, 259, 'r43'), (1508, 296, 'r44'), (1509, 333, 'r45'), (1510, 370, 'r46'), (1511, 407, 'r47'), (1512, 444, 'r48'), (1513, 481, 'r49'), (1514, 18, 'r50'), (1515, 55, 'r51'), (1516, 92, 'r52'), (1517, 129, 'r53'), (1518, 166, 'r54'), (1519, 203, 'r55'), (1520, 240, 'r56'), (1521, 277, 'r57'), (1522, 314, 'r58'), (1523, 351, 'r59'), (1524, 388, 'r60'), (1525, 425, 'r0'), (1526, 462, 'r1'), (1527, 499, 'r2'), (1528, 36, 'r3'), (1529, 73, 'r4'), (1530, 110, 'r5'), (1531, 147, 'r6'), (1532, 184, 'r7'), (1533, 221, 'r8'), (1534, 258, 'r9'), (1535, 295, 'r10'), (1536, 332, 'r11'), (1537, 369, 'r12'), (1538, 406, 'r13'), (1539, 443, 'r14'), (1540, 480, 'r15'), (1541, 17, 'r16'), (1542, 54, 'r17'), (1543, 91, 'r18'), (1544, 128, 'r19'), (1545, 165, 'r20'), (1546, 202, 'r21'), (1547, 239, 'r22'), (1548, 276, 'r23'), (1549, 313, 'r24'), (1550, 350, 'r25'), (1551, 387, 'r26'), (1552, 424, 'r27'), (1553, 461, 'r28'), (1554, 498, 'r29'), (1555, 35, 'r30'), (1556, 72, 'r31'), (1557, 109, 'r32'), (1558, 146, 'r33'), (1559, 183, 'r34'), (1560, 220, 'r35'), (1561, 257, 'r36'), (1562, 294, 'r37'), (1563, 331, 'r38'), (1564, 368, 'r39'), (1565, 405, 'r40'), (1566, 442, 'r41'), (1567, 479, 'r42'), (1568, 16, 'r43'), (1569, 53, 'r44'), (1570, 90, 'r45'), (1571, 127, 'r46'), (1572, 164, 'r47'), (1573, 201, 'r48'), (1574, 238, 'r49'), (1575, 275, 'r50'), (1576, 312, 'r51'), (1577, 349, 'r52'), (1578, 386, 'r53'), (1579, 423, 'r54'), (1580, 460, 'r55'), (1581, 497, 'r56'), (1582, 34, 'r57'), (1583, 71, 'r58'), (1584, 108, 'r59'), (1585, 145, 'r60'), (1586, 182, 'r0'), (1587, 219, 'r1'), (1588, 256, 'r2'), (1589, 293, 'r3'), (1590, 330, 'r4'), (1591, 367, 'r5'), (1592, 404, 'r6'), (1593, 441, 'r7'), (1594, 478, 'r8'), (1595, 15, 'r9'), (1596, 52, 'r10'), (1597, 89, 'r11'), (1598, 126, 'r12'), (1599, 163, 'r13'), (1600, 200, 'r14'), (1601, 237, 'r15'), (1602, 274, 'r16'), (1603, 311, 'r17'), (1604, 348, 'r18'), (1605, 385, 'r19'), (1606, 422, 'r20'), (1607, 459, 'r21'), (1608, 496, 'r22'), (1609, 33, 'r23'), (1610, 70, 'r24'), (1611, 107, 'r25'), (1612, 144, 'r26'), (1613, 181, 'r27'), (1614, 218, 'r28'), (1615, 255, 'r29'), (1616, 292, 'r30'), (1617, 329, 'r31'), (1618, 366, 'r32'), (1619, 403, 'r33'), (1620, 440, 'r34'), (1621, 477, 'r35'), (1622, 14, 'r36'), (1623, 51, 'r37'), (1624, 88, 'r38'), (1625, 125, 'r39'), (1626, 162, 'r40'), (1627, 199, 'r41'), (1628, 236, 'r42'), (1629, 273, 'r43'), (1630, 310, 'r44'), (1631, 347, 'r45'), (1632, 384, 'r46'), (1633, 421, 'r47'), (1634, 458, 'r48'), (1635, 495, 'r49'), (1636, 32, 'r50'), (1637, 69, 'r51'), (1638, 106, 'r52'), (1639, 143, 'r53'), (1640, 180, 'r54'), (1641, 217, 'r55'), (1642, 254, 'r56'), (1643, 291, 'r57'), (1644, 328, 'r58'), (1645, 365, 'r59'), (1646, 402, 'r60'), (1647, 439, 'r0'), (1648, 476, 'r1'), (1649, 13, 'r2'), (1650, 50, 'r3'), (1651, 87, 'r4'), (1652, 124, 'r5'), (1653, 161, 'r6'), (1654, 198, 'r7'), (1655, 235, 'r8'), (1656, 272, 'r9'), (1657, 309, 'r10'), (1658, 346, 'r11'), (1659, 383, 'r12'), (1660, 420, 'r13'), (1661, 457, 'r14'), (1662, 494, 'r15'), (1663, 31, 'r16'), (1664, 68, 'r17'), (1665, 105, 'r18'), (1666, 142, 'r19'), (1667, 179, 'r20'), (1668, 216, 'r21'), (1669, 253, 'r22'), (1670, 290, 'r23'), (1671, 327, 'r24'), (1672, 364, 'r25'), (1673, 401, 'r26'), (1674, 438, 'r27'), (1675, 475, 'r28'), (1676, 12, 'r29'), (1677, 49, 'r30'), (1678, 86, 'r31'), (1679, 123, 'r32'), (1680, 160, 'r33'), (1681, 197, 'r34'), (1682, 234, 'r35'), (1683, 271, 'r36'), (1684, 308, 'r37'), (1685, 345, 'r38'), (1686, 382, 'r39'), (1687, 419, 'r40'), (1688, 456, 'r41'), (1689, 493, 'r42'), (1690, 30, 'r43'), (1691, 67, 'r44'), (1692, 104, 'r45'), (1693, 141, 'r46'), (1694, 178, 'r47'), (1695, 215, 'r48'), (1696, 252, 'r49'), (1697, 289, 'r50'), (1698, 326, 'r51'), (1699, 363, 'r52'), (1700, 400, 'r53'), (1701, 437, 'r54'), (1702, 474, 'r55'), (1703, 11, 'r56'), (1704, 48, 'r57'), (1705, 85, 'r58'), (1706, 122, 'r59'), (1707, 159, 'r60'), (1708, 196, 'r0'), (1709, 233, 'r1'), (1710, 270, 'r2'), (1711, 307, 'r3'), (1712, 344, 'r4'), (1713, 381, 'r5'), (1714, 418, 'r6'), (1715, 455, 'r7'), (1716, 492, 'r8'), (1717, 29, 'r9'), (1718, 66, 'r10'), (1719, 103, 'r11'), (1720, 140, 'r12'), (1721, 177, 'r13'), (1722, 214, 'r14'), (1723, 251, 'r15'), (1724, 288, 'r16'), (1725, 325, 'r17'), (1726, 362, 'r18'), (1727, 399, 'r19'), (1728, 436, 'r20'), (1729, 473, 'r21'), (1730, 10, 'r22'), (1731, 47, 'r23'), (1732, 84, 'r24'), (1733, 121, 'r25'), (1734, 158, 'r26'), (1735, 195, 'r27'), (1736, 232, 'r28'), (1737, 269, 'r29'), (1738, 306, 'r30'), (1739, 343, 'r31'), (1740, 380, 'r32'), (1741, 417, 'r33'), (1742, 454, 'r34'), (1743, 491, 'r35'), (1744, 28, 'r36'), (1745, 65, 'r37'), (1746, 102, 'r38'), (1747, 139, 'r39'), (1748, 176, 'r40'), (1749, 213, 'r41'), (1750, 250, 'r42'), (1751, 287, 'r43'), (1752, 324, 'r44'), (1753, 361, 'r45'), (1754, 398, 'r46'), (1755, 435, 'r47'), (1756, 472, 'r48'), (1757, 9, 'r49'), (1758, 46, 'r50'), (1759, 83, 'r51'), (1760, 120, 'r52'), (1761, 157, 'r53'), (1762, 194, 'r54'), (1763, 231, 'r55'), (1764, 268, 'r56'), (1765, 305, 'r57'), (1766, 342, 'r58'), (1767, 379, 'r59'), (1768, 416, 'r60'), (1769, 453, 'r0'), (1770, 490, 'r1'), (1771, 27, 'r2'), (1772, 64, 'r3'), (1773, 101, 'r4'), (1774, 138, 'r5'), (1775, 175, 'r6'), (1776, 212, 'r7'), (1777, 249, 'r8'), (1778, 286, 'r9'), (1779, 323, 'r10'), (1780, 360, 'r11'), (1781, 397, 'r12'), (1782, 434, 'r13'), (1783, 471, 'r14'), (1784, 8, 'r15'), (1785, 45, 'r16'), (1786, 82, 'r17'), (1787, 119, 'r18'), (1788, 156, 'r19'), (1789, 193, 'r20'), (1790, 230, 'r21'), (1791, 267, 'r22'), (1792, 304, 'r23'), (1793, 341, 'r24'), (1794, 378, 'r25'), (1795, 415, 'r26'), (1796, 452, 'r27'), (1797, 489, 'r28'), (1798, 26, 'r29'), (1799, 63, 'r30'), (1800, 100, 'r31'), (1801, 137, 'r32'), (1802, 174, 'r33'), (1803, 211, 'r34'), (1804, 248, 'r35'), (1805, 285, 'r36'), (1806, 322, 'r37'), (1807, 359, 'r38'), (1808, 396, 'r39'), (1809, 433, 'r40'), (1810, 470, 'r41'), (1811, 7, 'r42'), (1812, 44, 'r43'), (1813, 81, 'r44'), (1814, 118, 'r45'), (1815, 155, 'r46'), (1816, 192, 'r47'), (1817, 229, 'r48'), (1818, 266, 'r49'), (1819, 303, 'r50'), (1820, 340, 'r51'), (1821, 377, 'r52'), (1822, 414, 'r53'), (1823, 451, 'r54'), (1824, 488, 'r55'), (1825, 25, 'r56'), (1826, 62, 'r57'), (1827, 99, 'r58'), (1828, 136, 'r59'), (1829, 173, 'r60'), (1830, 210, 'r0'), (1831, 247, 'r1'), (1832, 284, 'r2'), (1833, 321, 'r3'), (1834, 358, 'r4'), (1835, 395, 'r5'), (1836, 432, 'r6'), (1837, 469, 'r7'), (1838, 6, 'r8'), (1839, 43, 'r9'), (1840, 80, 'r10'), (1841, 117, 'r11'), (1842, 154, 'r12'), (1843, 191, 'r13'), (1844, 228, 'r14'), (1845, 265, 'r15'), (1846, 302, 'r16'), (1847, 339, 'r17'), (1848, 376, 'r18'), (1849, 413, 'r19'), (1850, 450, 'r20'), (1851, 487, 'r21'), (1852, 24, 'r22'), (1853, 61, 'r23'), (1854, 98, 'r24'), (1855, 135, 'r25'), (1856, 172, 'r26'), (1857, 209, 'r27'), (1858, 246, 'r28'), (1859, 283, 'r29'), (1860, 320, 'r30'), (1861, 357, 'r31'), (1862, 394, 'r32'), (1863, 431, 'r33'), (1864, 468, 'r34'), (1865, 5, 'r35'), (1866, 42, 'r36'), (1867, 79, 'r37'), (1868, 116, 'r38'), (1869, 153, 'r39'), (1870, 190, 'r40'), (1871, 227, 'r41'), (1872, 264, 'r42'), (1873, 301, 'r43'), (1874, 338, 'r44'), (1875, 375, 'r45'), (1876, 412, 'r46'), (1877, 449, 'r47'), (1878, 486, 'r48'), (1879, 23, 'r49'), (1880, 60, 'r50'), (1881, 97, 'r51'), (1882, 134, 'r52'), (1883, 171, 'r53'), (1884, 208, 'r54'), (1885, 245, 'r55'), (1886, 282, 'r56'), (1887, 319, 'r57'), (1888, 356, 'r58'), (1889, 393, 'r59'), (1890, 430, 'r60'), (1891, 467, 'r0'), (1892, 4, 'r1'), (1893, 41, 'r2'), (1894, 78, 'r3'), (1895, 115, 'r4'), (1896, 152, 'r5'), (1897, 189, 'r6'), (1898, 226, 'r7'), (1899, 263, 'r8'), (1900, 300, 'r9'), (1901, 337, 'r10'), (1902, 374, 'r11'), (1903, 411, 'r12'), (1904, 448, 'r13'), (1905, 485, 'r14'), (1906, 22, 'r15'), (1907, 59, 'r16'), (1908, 96, 'r17'), (1909, 133, 'r18'), (1910, 170, 'r19'), (1911, 207, 'r20'), (1912, 244, 'r21'), (1913, 281, 'r22'), (1914, 318, 'r23'), (1915, 355, 'r24'), (1916, 392, 'r25'), (1917, 429, 'r26'), (1918, 466, 'r27'), (1919, 3, 'r28'), (1920, 40, 'r29'), (1921, 77, 'r30'), (1922, 114, 'r31'), (1923, 151, 'r32'), (1924, 188, 'r33'), (1925, 225, 'r34'), (1926, 262, 'r35'), (1927, 299, 'r36'), (1928, 336, 'r37'), (1929, 373, 'r38'), (1930, 410, 'r39'), (1931, 447, 'r40'), (1932, 484, 'r41'), (1933, 21, 'r42'), (1934, 58, 'r43'), (1935, 95, 'r44'), (1936, 132, 'r45'), (1937, 169, 'r46'), (1938, 206, 'r47'), (1939, 243, 'r48'), (1940, 280, 'r49'), (1941, 317, 'r50'), (1942, 354, 'r51'), (1943, 391, 'r52'), (1944, 428, 'r53'), (1945, 465, 'r54'), (1946, 2, 'r55'), (1947, 39, 'r56'), (1948, 76, 'r57'), (1949, 113, 'r58'), (1950, 150, 'r59'), (1951, 187, 'r60'), (1952, 224, 'r0'), (1953, 261, 'r1'), (1954, 298, 'r2'), (1955, 335, 'r3'), (1956, 372, 'r4'), (1957, 409, 'r5'), (1958, 446, 'r6'), (1959, 483, 'r7'), (1960, 20, 'r8'), (1961, 57, 'r9'), (1962, 94, 'r10'), (1963, 131, 'r11'), (1964, 168, 'r12'), (1965, 205, 'r13'), (1966, 242, 'r14'), (1967, 279, 'r15'), (1968, 316, 'r16'), (1969, 353, 'r17'), (1970, 390, 'r18'), (1971, 427, 'r19'), (1972, 464, 'r20'), (1973, 1, 'r21'), (1974, 38, 'r22'), (1975, 75, 'r23'), (1976, 112, 'r24'), (1977, 149, 'r25'), (1978, 186, 'r26'), (1979, 223, 'r27'), (1980, 260, 'r28'), (1981, 297, 'r29'), (1982, 334, 'r30'), (1983, 371, 'r31'), (1984, 408, 'r32'), (1985, 445, 'r33'), (1986, 482, 'r34'), (1987, 19, 'r35'), (1988, 56, 'r36'), (1989, 93, 'r37'), (1990, 130, 'r38'), (1991, 167, 'r39'), (1992, 204, 'r40'), (1993, 241, 'r41'), (1994, 278, 'r42'), (1995, 315, 'r43'), (1996, 352, 'r44'), (1997, 389, 'r45'), (1998, 426, 'r46'), (1999, 463, 'r47'), (2000, 0, 'r48'), (2001, 37, 'r49'), (2002, 74, 'r50'), (2003, 111, 'r51'), (2004, 148, 'r52'), (2005, 185, 'r53'), (2006, 222, 'r54'), (2007, 259, 'r55'), (2008, 296, 'r56'), (2009, 333, 'r57'), (2010, 370, 'r58'), (2011, 407, 'r59'), (2012, 444, 'r60'), (2013, 481, 'r0'), (2014, 18, 'r1'), (2015, 55, 'r2'), (2016, 92, 'r3'), (2017, 129, 'r4'), (2018, 166, 'r5'), (2019, 203, 'r6'), (2020, 240, 'r7'), (2021, 277, 'r8'), (2022, 314, 'r9'), (2023, 351, 'r10'), (2024, 388, 'r11'), (2025, 425, 'r12'), (2026, 462, 'r13'), (2027, 499, 'r14'), (2028, 36, 'r15'), (2029, 73, 'r16'), (2030, 110, 'r17'), (2031, 147, 'r18'), (2032, 184, 'r19'), (2033, 221, 'r20'), (2034, 258, 'r21'), (2035, 295, 'r22'), (2036, 332, 'r23'), (2037, 369, 'r24'), (2038, 406, 'r25'), (2039, 443, 'r26'), (2040, 480, 'r27'), (2041, 17, 'r28'), (2042, 54, 'r29'), (2043, 91, 'r30'), (2044, 128, 'r31'), (2045, 165, 'r32'), (2046, 202, 'r33'), (2047, 239, 'r34'), (2048, 276, 'r35'), (2049, 313, 'r36'), (2050, 350, 'r37'), (2051, 387, 'r38'), (2052, 424, 'r39'), (2053, 461, 'r40'), (2054, 498, 'r41'), (2055, 35, 'r42'), (2056, 72, 'r43'), (2057, 109, 'r44'), (2058, 146, 'r45'), (2059, 183, 'r46'), (2060, 220, 'r47'), (2061, 257, 'r48'), (2062, 294, 'r49'), (2063, 331, 'r50'), (2064, 368, 'r51'), (2065, 405, 'r52'), (2066, 442, 'r53'), (2067, 479, 'r54'), (2068, 16, 'r55'), (2069, 53, 'r56'), (2070, 90, 'r57'), (2071, 127, 'r58'), (2072, 164, 'r59'), (2073, 201, 'r60'), (2074, 238, 'r0'), (2075, 275, 'r1'), (2076, 312, 'r2'), (2077, 349, 'r3'), (2078, 386, 'r4'), (2079, 423, 'r5'), (2080, 460, 'r6'), (2081, 497, 'r7'), (2082, 34, 'r8'), (2083, 71, 'r9'), (2084, 108, 'r10'), (2085, 145, 'r11'), (2086, 182, 'r12'), (2087, 219, 'r13'), (2088, 256, 'r14'), (2089, 293, 'r15'), (2090, 330, 'r16'), (2091, 367, 'r17'), (2092, 404, 'r18'), (2093, 441, 'r19'), (2094, 478, 'r20'), (2095, 15, 'r21'), (2096, 52, 'r22'), (2097, 89, 'r23'), (2098, 126, 'r24'), (2099, 163, 'r25'), (2100, 200, 'r26'), (2101, 237, 'r27'), (2102, 274, 'r28'), (2103, 311, 'r29'), (2104, 348, 'r30'), (2105, 385, 'r31'), (2106, 422, 'r32'), (2107, 459, 'r33'), (2108, 496, 'r34'), (2109, 33, 'r35'), (2110, 70, 'r36'), (2111, 107, 'r37'), (2112, 144, 'r38'), (2113, 181, 'r39'), (2114, 218, 'r40'), (2115, 255, 'r41'), (2116, 292, 'r42'), (2117, 329, 'r43'), (2118, 366, 'r44'), (2119, 403, 'r45'), (2120, 440, 'r46'), (2121, 477, 'r47'), (2122, 14, 'r48'), (2123, 51, 'r49'), (2124, 88, 'r50'), (2125, 125, 'r51'), (2126, 162, 'r52'), (2127, 199, 'r53'), (2128, 236, 'r54'), (2129, 273, 'r55'), (2130, 310, 'r56'), (2131, 347, 'r57'), (2132, 384, 'r58'), (2133, 421, 'r59'), (2134, 458, 'r60'), (2135, 495, 'r0'), (2136, 32, 'r1'), (2137, 69, 'r2'), (2138, 106, 'r3'), (2139, 143, 'r4'), (2140, 180, 'r5'), (2141, 217, 'r6'), (2142, 254, 'r7'), (2143, 291, 'r8'), (2144, 328, 'r9'), (2145, 365, 'r10'), (2146, 402, 'r11'), (2147, 439, 'r12'), (2148, 476, 'r13'), (2149, 13, 'r14'), (2150, 50, 'r15'), (2151, 87, 'r16'), (2152, 124, 'r17'), (2153, 161, 'r18'), (2154, 198, 'r19'), (2155, 235, 'r20'), (2156, 272, 'r21'), (2157, 309, 'r22'), (2158, 346, 'r23'), (2159, 383, 'r24'), (2160, 420, 'r25'), (2161, 457, 'r26'), (2162, 494, 'r27'), (2163, 31, 'r28'), (2164, 68, 'r29'), (2165, 105, 'r30'), (2166, 142, 'r31'), (2167, 179, 'r32'), (2168, 216, 'r33'), (2169, 253, 'r34'), (2170, 290, 'r35'), (2171, 327, 'r36'), (2172, 364, 'r37'), (2173, 401, 'r38'), (2174, 438, 'r39'), (2175, 475, 'r40'), (2176, 12, 'r41'), (2177, 49, 'r42'), (2178, 86, 'r43'), (2179, 123, 'r44'), (2180, 160, 'r45'), (2181, 197, 'r46'), (2182, 234, 'r47'), (2183, 271, 'r48'), (2184, 308, 'r49'), (2185, 345, 'r50'), (2186, 382, 'r51'), (2187, 419, 'r52'), (2188, 456, 'r53'), (2189, 493, 'r54'), (2190, 30, 'r55'), (2191, 67, 'r56'), (2192, 104, 'r57'), (2193, 141, 'r58'), (2194, 178, 'r59'), (2195, 215, 'r60'), (2196, 252, 'r0'), (2197, 289, 'r1'), (2198, 326, 'r2'), (2199, 363, 'r3'), (2200, 400, 'r4'), (2201, 437, 'r5'), (2202, 474, 'r6'), (2203, 11, 'r7'), (2204, 48, 'r8'), (2205, 85, 'r9'), (2206, 122, 'r10'), (2207, 159, 'r11'), (2208, 196, 'r12'), (2209, 233, 'r13'), (2210, 270, 'r14'), (2211, 307, 'r15'), (2212, 344, 'r16'), (2213, 381, 'r17'), (2214, 418, 'r18'), (2215, 455, 'r19'), (2216, 492, 'r20'), (2217, 29, 'r21'), (2218, 66, 'r22'), (2219, 103, 'r23'), (2220, 140, 'r24'), (2221, 177, 'r25'), (2222, 214, 'r26'), (2223, 251, 'r27'), (2224, 288, 'r28'), (2225, 325, 'r29'), (2226, 362, 'r30'), (2227, 399, 'r31'), (2228, 436, 'r32'), (2229, 473, 'r33'), (2230, 10, 'r34'), (2231, 47, 'r35'), (2232, 84, 'r36'), (2233, 121, 'r37'), (2234, 158, 'r38'), (2235, 195, 'r39'), (2236, 232, 'r40'), (2237, 269, 'r41'), (2238, 306, 'r42'), (2239, 343, 'r43'), (2240, 380, 'r44'), (2241, 417, 'r45'), (2242, 454, 'r46'), (2243, 491, 'r47'), (2244, 28, 'r48'), (2245, 65, 'r49'), (2246, 102, 'r50'), (2247, 139, 'r51'), (2248, 176, 'r52'), (2249, 213, 'r53'), (2250, 250, 'r54'), (2251, 287, 'r55'), (2252, 324, 'r56'), (2253, 361, 'r57'), (2254, 398, 'r58'), (2255, 435, 'r59'), (2256, 472, 'r60'), (2257, 9, 'r0'), (2258, 46, 'r1'), (2259, 83, 'r2'), (2260, 120, 'r3'), (2261, 157, 'r4'), (2262, 194, 'r5'), (2263, 231, 'r6'), (2264, 268, 'r7'), (2265, 305, 'r8'), (2266, 342, 'r9'), (2267, 379, 'r10'), (2268, 416, 'r11'), (2269, 453, 'r12'), (2270, 490, 'r13'), (2271, 27, 'r14'), (2272, 64, 'r15'), (2273, 101, 'r16'), (2274, 138, 'r17'), (2275, 175, 'r18'), (2276, 212, 'r19'), (2277, 249, 'r20'), (2278, 286, 'r21'), (2279, 323, 'r22'), (2280, 360, 'r23'), (2281, 397, 'r24'), (2282, 434, 'r25'), (2283, 471, 'r26'), (2284, 8, 'r27'), (2285, 45, 'r28'), (2286, 82, 'r29'), (2287, 119, 'r30'), (2288, 156, 'r31'), (2289, 193, 'r32'), (2290, 230, 'r33'), (2291, 267, 'r34'), (2292, 304, 'r35'), (2293, 341, 'r36'), (2294, 378, 'r37'), (2295, 415, 'r38'), (2296, 452, 'r39'), (2297, 489, 'r40'), (2298, 26, 'r41'), (2299, 63, 'r42'), (2300, 100, 'r43'), (2301, 137, 'r44'), (2302, 174, 'r45'), (2303, 211, 'r46'), (2304, 248, 'r47'), (2305, 285, 'r48'), (2306, 322, 'r49'), (2307, 359, 'r50'), (2308, 396, 'r51'), (2309, 433, 'r52'), (2310, 470, 'r53'), (2311, 7, 'r54'), (2312, 44, 'r55'), (2313, 81, 'r56'), (2314, 118, 'r57'), (2315, 155, 'r58'), (2316, 192, 'r59'), (2317, 229, 'r60'), (2318, 266, 'r0'), (2319, 303, 'r1'), (2320, 340, 'r2'), (2321, 377, 'r3'), (2322, 414, 'r4'), (2323, 451, 'r5'), (2324, 488, 'r6'), (2325, 25, 'r7'), (2326, 62, 'r8'), (2327, 99, 'r9'), (2328, 136, 'r10'), (2329, 173, 'r11'), (2330, 210, 'r12'), (2331, 247, 'r13'), (2332, 284, 'r14'), (2333, 321, 'r15'), (2334, 358, 'r16'), (2335, 395, 'r17'), (2336, 432, 'r18'), (2337, 469, 'r19'), (2338, 6, 'r20'), (2339, 43, 'r21'), (2340, 80, 'r22'), (2341, 117, 'r23'), (2342, 154, 'r24'), (2343, 191, 'r25'), (2344, 228, 'r26'), (2345, 265, 'r27'), (2346, 302, 'r28'), (2347, 339, 'r29'), (2348, 376, 'r30'), (2349, 413, 'r31'), (2350, 450, 'r32'), (2351, 487, 'r33'), (2352, 24, 'r34'), (2353, 61, 'r35'), (2354, 98, 'r36'), (2355, 135, 'r37'), (2356, 172, 'r38'), (2357, 209, 'r39'), (2358, 246, 'r40'), (2359, 283, 'r41'), (2360, 320, 'r42'), (2361, 357, 'r43'), (2362, 394, 'r44'), (2363, 431, 'r45'), (2364, 468, 'r46'), (2365, 5, 'r47'), (2366, 42, 'r48'), (2367, 79, 'r49'), (2368, 116, 'r50'), (2369, 153, 'r51'), (2370, 190, 'r52'), (2371, 227, 'r53'), (2372, 264, 'r54'), (2373, 301, 'r55'), (2374, 338, 'r56'), (2375, 375, 'r57'), (2376, 412, 'r58'), (2377, 449, 'r59'), (2378, 486, 'r60'), (2379, 23, 'r0'), (2380, 60, 'r1'), (2381, 97, 'r2'), (2382, 134, 'r3'), (2383, 171, 'r4'), (2384, 208, 'r5'), (2385, 245, 'r6'), (2386, 282, 'r7'), (2387, 319, 'r8'), (2388, 356, 'r9'), (2389, 393, 'r10'), (2390, 430, 'r11'), (2391, 467, 'r12'), (2392, 4, 'r13'), (2393, 41, 'r14'), (2394, 78, 'r15'), (2395, 115, 'r16'), (2396, 152, 'r17'), (2397, 189, 'r18'), (2398, 226, 'r19'), (2399, 263, 'r20'), (2400, 300, 'r21'), (2401, 337, 'r22'), (2402, 374, 'r23'), (2403, 411, 'r24'), (2404, 448, 'r25'), (2405, 485, 'r26'), (2406, 22, 'r27'), (2407, 59, 'r28'), (2408, 96, 'r29'), (2409, 133, 'r30'), (2410, 170, 'r31'), (2411, 207, 'r32'), (2412, 244, 'r33'), (2413, 281, 'r34'), (2414, 318, 'r35'), (2415, 355, 'r36'), (2416, 392, 'r37'), (2417, 429, 'r38'), (2418, 466, 'r39'), (2419, 3, 'r40'), (2420, 40, 'r41'), (2421, 77, 'r42'), (2422, 114, 'r43'), (2423, 151, 'r44'), (2424, 188, 'r45'), (2425, 225, 'r46'), (2426, 262, 'r47'), (2427, 299, 'r48'), (2428, 336, 'r49'), (2429, 373, 'r50'), (2430, 410, 'r51'), (2431, 447, 'r52'), (2432, 484, 'r53'), (2433, 21, 'r54'), (2434, 58, 'r55'), (2435, 95, 'r56'), (2436, 132, 'r57'), (2437, 169, 'r58'), (2438, 206, 'r59'), (2439, 243, 'r60'), (2440, 280, 'r0'), (2441, 317, 'r1'), (2442, 354, 'r2'), (2443, 391, 'r3'), (2444, 428, 'r4'), (2445, 465, 'r5'), (2446, 2, 'r6'), (2447, 39, 'r7'), (2448, 76, 'r8'), (2449, 113, 'r9'), (2450, 150, 'r10'), (2451, 187, 'r11'), (2452, 224, 'r12'), (2453, 261, 'r13'), (2454, 298, 'r14'), (2455, 335, 'r15'), (2456, 372, 'r16'), (2457, 409, 'r17'), (2458, 446, 'r18'), (2459, 483, 'r19'), (2460, 20, 'r20'), (2461, 57, 'r21'), (2462, 94, 'r22'), (2463, 131, 'r23'), (2464, 168, 'r24'), (2465, 205, 'r25'), (2466, 242, 'r26'), (2467, 279, 'r27'), (2468, 316, 'r28'), (2469, 353, 'r29'), (2470, 390, 'r30'), (2471, 427, 'r31'), (2472, 464, 'r32'), (2473, 1, 'r33'), (2474, 38, 'r34'), (2475, 75, 'r35'), (2476, 112, 'r36'), (2477, 149, 'r37'), (2478, 186, 'r38'), (2479, 223, 'r39'), (2480, 260, 'r40'), (2481, 297, 'r41'), (2482, 334, 'r42'), (2483, 371, 'r43'), (2484, 408, 'r44'), (2485, 445, 'r45'), (2486, 482, 'r46'), (2487, 19, 'r47'), (2488, 56, 'r48'), (2489, 93, 'r49'), (2490, 130, 'r50'), (2491, 167, 'r51'), (2492, 204, 'r52'), (2493, 241, 'r53'), (2494, 278, 'r54'), (2495, 315, 'r55'), (2496, 352, 'r56'), (2497, 389, 'r57'), (2498, 426, 'r58'), (2499, 463, 'r59'), (2500, 0, 'r60'), (2501, 37, 'r0'), (2502, 74, 'r1'), (2503, 111, 'r2'), (2504, 148, 'r3'), (2505, 185, 'r4'), (2506, 222, 'r5'), (2507, 259, 'r6'), (2508, 296, 'r7'), (2509, 333, 'r8'), (2510, 370, 'r9'), (2511, 407, 'r10'), (2512, 444, 'r11'), (2513, 481, 'r12'), (2514, 18, 'r13'), (2515, 55, 'r14'), (2516, 92, 'r15'), (2517, 129, 'r16'), (2518, 166, 'r17'), (2519, 203, 'r18'), (2520, 240, 'r19'), (2521, 277, 'r20'), (2522, 314, 'r21'), (2523, 351, 'r22'), (2524, 388, 'r23'), (2525, 425, 'r24'), (2526, 462, 'r25'), (2527, 499, 'r26'), (2528, 36, 'r27'), (2529, 73, 'r28'), (2530, 110, 'r29'), (2531, 147, 'r30'), (2532, 184, 'r31'), (2533, 221, 'r32'), (2534, 258, 'r33'), (2535, 295, 'r34'), (2536, 332, 'r35'), (2537, 369, 'r36'), (2538, 406, 'r37'), (2539, 443, 'r38'), (2540, 480, 'r39'), (2541, 17, 'r40'), (2542, 54, 'r41'), (2543, 91, 'r42'), (2544, 128, 'r43'), (2545, 165, 'r44'), (2546, 202, 'r45'), (2547, 239, 'r46'), (2548, 276, 'r47'), (2549, 313, 'r48'), (2550, 350, 'r49'), (2551, 387, 'r50'), (2552, 424, 'r51'), (2553, 461, 'r52'), (2554, 498, 'r53'), (2555, 35, 'r54'), (2556, 72, 'r55'), (2557, 109, 'r56'), (2558, 146, 'r57'), (2559, 183, 'r58'), (2560, 220, 'r59'), (2561, 257, 'r60'), (2562, 294, 'r0'), (2563, 331, 'r1'), (2564, 368, 'r2'), (2565, 405, 'r3'), (2566, 442, 'r4'), (2567, 479, 'r5'), (2568, 16, 'r6'), (2569, 53, 'r7'), (2570, 90, 'r8'), (2571, 127, 'r9'), (2572, 164, 'r10'), (2573, 201, 'r11'), (2574, 238, 'r12'), (2575, 275, 'r13'), (2576, 312, 'r14'), (2577, 349, 'r15'), (2578, 386, 'r16'), (2579, 423, 'r17'), (2580, 460, 'r18'), (2581, 497, 'r19'), (2582, 34, 'r20'), (2583, 71, 'r21'), (2584, 108, 'r22'), (2585, 145, 'r23'), (2586, 182, 'r24'), (2587, 219, 'r25'), (2588, 256, 'r26'), (2589, 293, 'r27'), (2590, 330, 'r28'), (2591, 367, 'r29'), (2592, 404, 'r30'), (2593, 441, 'r31'), (2594, 478, 'r32'), (2595, 15, 'r33'), (2596, 52, 'r34'), (2597, 89, 'r35'), (2598, 126, 'r36'), (2599, 163, 'r37'), (2600, 200, 'r38'), (2601, 237, 'r39'), (2602, 274, 'r40'), (2603, 311, 'r41'), (2604, 348, 'r42'), (2605, 385, 'r43'), (2606, 422, 'r44'), (2607, 459, 'r45'), (2608, 496, 'r46'), (2609, 33, 'r47'), (2610, 70, 'r48'), (2611, 107, 'r49'), (2612, 144, 'r50'), (2613, 181, 'r51'), (2614, 218, 'r52'), (2615, 255, 'r53'), (2616, 292, 'r54'), (2617, 329, 'r55'), (2618, 366, 'r56'), (2619, 403, 'r57'), (2620, 440, 'r58'), (2621, 477, 'r59'), (2622, 14, 'r60'), (2623, 51, 'r0'), (2624, 88, 'r1'), (2625, 125, 'r2'), (2626, 162, 'r3'), (2627, 199, 'r4'), (2628, 236, 'r5'), (2629, 273, 'r6'), (2630, 310, 'r7'), (2631, 347, 'r8'), (2632, 384, 'r9'), (2633, 421, 'r10'), (2634, 458, 'r11'), (2635, 495, 'r12'), (2636, 32, 'r13'), (2637, 69, 'r14'), (2638, 106, 'r15'), (2639, 143, 'r16'), (2640, 180, 'r17'), (2641, 217, 'r18'), (2642, 254, 'r19'), (2643, 291, 'r20'), (2644, 328, 'r21'), (2645, 365, 'r22'), (2646, 402, 'r23'), (2647, 439, 'r24'), (2648, 476, 'r25'), (2649, 13, 'r26'), (2650, 50, 'r27'), (2651, 87, 'r28'), (2652, 124, 'r29'), (2653, 161, 'r30'), (2654, 198, 'r31'), (2655, 235, 'r32'), (2656, 272, 'r33'), (2657, 309, 'r34'), (2658, 346, 'r35'), (2659, 383, 'r36'), (2660, 420, 'r37'), (2661, 457, 'r38'), (2662, 494, 'r39'), (2663, 31, 'r40'), (2664, 68, 'r41'), (2665, 105, 'r42'), (2666, 142, 'r43'), (2667, 179, 'r44'), (2668, 216, 'r45'), (2669, 253, 'r46'), (2670, 290, 'r47'), (2671, 327, 'r48'), (2672, 364, 'r49'), (2673, 401, 'r50'), (2674, 438, 'r51'), (2675, 475, 'r52'), (2676, 12, 'r53'), (2677, 49, 'r54'), (2678, 86, 'r55'), (2679, 123, 'r56'), (2680, 160, 'r57'), (2681, 197, 'r58'), (2682, 234, 'r59'), (2683, 271, 'r60'), (2684, 308, 'r0'), (2685, 345, 'r1'), (2686, 382, 'r2'), (2687, 419, 'r3'), (2688, 456, 'r4'), (2689, 493, 'r5'), (2690, 30, 'r6'), (2691, 67, 'r7'), (2692, 104, 'r8'), (2693, 141, 'r9'), (2694, 178, 'r10'), (2695, 215, 'r11'), (2696, 252, 'r12'), (2697, 289, 'r13'), (2698, 326, 'r14'), (2699, 363, 'r15'), (2700, 400, 'r16'), (2701, 437, 'r17'), (2702, 474, 'r18'), (2703, 11, 'r19'), (2704, 48, 'r20'), (2705, 85, 'r21'), (2706, 122, 'r22'), (2707, 159, 'r23'), (2708, 196, 'r24'), (2709, 233, 'r25'), (2710, 270, 'r26'), (2711, 307, 'r27'), (2712, 344, 'r28'), (2713, 381, 'r29'), (2714, 418, 'r30'), (2715, 455, 'r31'), (2716, 492, 'r32'), (2717, 29, 'r33'), (2718, 66, 'r34'), (2719, 103, 'r35'), (2720, 140, 'r36'), (2721, 177, 'r37'), (2722, 214, 'r38'), (2723, 251, 'r39'), (2724, 288, 'r40'), (2725, 325, 'r41'), (2726, 362, 'r42'), (2727, 399, 'r43'), (2728, 436, 'r44'), (2729, 473, 'r45'), (2730, 10, 'r46'), (2731, 47, 'r47'), (2732, 84, 'r48'), (2733, 121, 'r49'), (2734, 158, 'r50'), (2735, 195, 'r51'), (2736, 232, 'r52'), (2737, 269, 'r53'), (2738, 306, 'r54'), (2739, 343, 'r55'), (2740, 380, 'r56'), (2741, 417, 'r57'), (2742, 454, 'r58'), (2743, 491, 'r59'), (2744, 28, 'r60'), (2745, 65, 'r0'), (2746, 102, 'r1'), (2747, 139, 'r2'), (2748, 176, 'r3'), (2749, 213, 'r4'), (2750, 250, 'r5'), (2751, 287, 'r6'), (2752, 324, 'r7'), (2753, 361, 'r8'), (2754, 398, 'r9'), (2755, 435, 'r10'), (2756, 472, 'r11'), (2757, 9, 'r12'), (2758, 46, 'r13'), (2759, 83, 'r14'), (2760, 120, 'r15'), (2761, 157, 'r16'), (2762, 194, 'r17'), (2763, 231, 'r18'), (2764, 268, 'r19'), (2765, 305, 'r20'), (2766, 342, 'r21'), (2767, 379, 'r22'), (2768, 416, 'r23'), (2769, 453, 'r24'), (2770, 490, 'r25'), (2771, 27, 'r26'), (2772, 64, 'r27'), (2773, 101, 'r28'), (2774, 138, 'r29'), (2775, 175, 'r30'), (2776, 212, 'r31'), (2777, 249, 'r32'), (2778, 286, 'r33'), (2779, 323, 'r34'), (2780, 360, 'r35'), (2781, 397, 'r36'), (2782, 434, 'r37'), (2783, 471, 'r38'), (2784, 8, 'r39'), (2785, 45, 'r40'), (2786, 82, 'r41'), (2787, 119, 'r42'), (2788, 156, 'r43'), (2789, 193, 'r44'), (2790, 230, 'r45'), (2791, 267, 'r46'), (2792, 304, 'r47'), (2793, 341, 'r48'), (2794, 378, 'r49'), (2795, 415, 'r50'), (2796, 452, 'r51'), (2797, 489, 'r52'), (2798, 26, 'r53'), (2799, 63, 'r54'), (2800, 100, 'r55'), (2801, 137, 'r56'), (2802, 174, 'r57'), (2803, 211, 'r58'), (2804, 248, 'r59'), (2805, 285, 'r60'), (2806, 322, 'r0'), (2807, 359, 'r1'), (2808, 396, 'r2'), (2809, 433, 'r3'), (2810, 470, 'r4'), (2811, 7, 'r5'), (2812, 44, 'r6'), (2813, 81, 'r7'), (2814, 118, 'r8'), (2815, 155, 'r9'), (2816, 192, 'r10'), (2817, 229, 'r11'), (2818, 266, 'r12'), (2819, 303, 'r13'), (2820, 340, 'r14'), (2821, 377, 'r15'), (2822, 414, 'r16'), (2823, 451, 'r17'), (2824, 488, 'r18'), (2825, 25, 'r19'), (2826, 62, 'r20'), (2827, 99, 'r21'), (2828, 136, 'r22'), (2829, 173, 'r23'), (2830, 210, 'r24'), (2831, 247, 'r25'), (2832, 284, 'r26'), (2833, 321, 'r27'), (2834, 358, 'r28'), (2835, 395, 'r29'), (2836, 432, 'r30'), (2837, 469, 'r31'), (2838, 6, 'r32'), (2839, 43, 'r33'), (2840, 80, 'r34'), (2841, 117, 'r35'), (2842, 154, 'r36'), (2843, 191, 'r37'), (2844, 228, 'r38'), (2845, 265, 'r39'), (2846, 302, 'r40'), (2847, 339, 'r41'), (2848, 376, 'r42'), (2849, 413, 'r43'), (2850, 450, 'r44'), (2851, 487, 'r45'), (2852, 24, 'r46'), (2853, 61, 'r47'), (2854, 98, 'r48'), (2855, 135, 'r49'), (2856, 172, 'r50'), (2857, 209, 'r51'), (2858, 246, 'r52'), (2859, 283, 'r53'), (2860, 320, 'r54'), (2861, 357, 'r55'), (2862, 394, 'r56'), (2863, 431, 'r57'), (2864, 468, 'r58'), (2865, 5, 'r59'), (2866, 42, 'r60'), (2867, 79, 'r0'), (2868, 116, 'r1'), (2869, 153, 'r2'), (2870, 190, 'r3'), (2871, 227, 'r4'), (2872, 264, 'r5'), (2873, 301, 'r6'), (2874, 338, 'r7'), (2875, 375, 'r8'), (2876, 412, 'r9'), (2877, 449, 'r10'), (2878, 486, 'r11'), (2879, 23, 'r12'), (2880, 60, 'r13'), (2881, 97, 'r14'), (2882, 134, 'r15'), (2883, 171, 'r16'), (2884, 208, 'r17'), (2885, 245, 'r18'), (2886, 282, 'r19'), (2887, 319, 'r20'), (2888, 356, 'r21'), (2889, 393, 'r22'), (2890, 430, 'r23'), (2891, 467, 'r24'), (2892, 4, 'r25'), (2893, 41, 'r26'), (2894, 78, 'r27'), (2895, 115, 'r28'), (2896, 152, 'r29'), (2897, 189, 'r30'), (2898, 226, 'r31'), (2899, 263, 'r32'), (2900, 300, 'r33'), (2901, 337, 'r34'), (2902, 374, 'r35'), (2903, 411, 'r36'), (2904, 448, 'r37'), (2905, 485, 'r38'), (2906, 22, 'r39'), (2907, 59, 'r40'), (2908, 96, 'r41'), (2909, 133, 'r42'), (2910, 170, 'r43'), (2911, 207, 'r44'), (2912, 244, 'r45'), (2913, 281, 'r46'), (2914, 318, 'r47'), (2915, 355, 'r48'), (2916, 392, 'r49'), (2917, 429, 'r50'), (2918, 466, 'r51'), (2919, 3, 'r52'), (2920, 40, 'r53'), (2921, 77, 'r54'), (2922, 114, 'r55'), (2923, 151, 'r56'), (2924, 188, 'r57'), (2925, 225, 'r58'), (2926, 262, 'r59'), (2927, 299, 'r60'), (2928, 336, 'r0'), (2929, 373, 'r1'), (2930, 410, 'r2'), (2931, 447, 'r3'), (2932, 484, 'r4'), (2933, 21, 'r5'), (2934, 58, 'r6'), (2935, 95, 'r7'), (2936, 132, 'r8'), (2937, 169, 'r9'), (2938, 206, 'r10'), (2939, 243, 'r11'), (2940, 280, 'r12'), (2941, 317, 'r13'), (2942, 354, 'r14'), (2943, 391, 'r15'), (2944, 428, 'r16'), (2945, 465, 'r17'), (2946, 2, 'r18'), (2947, 39, 'r19'), (2948, 76, 'r20'), (2949, 113, 'r21'), (2950, 150, 'r22'), (2951, 187, 'r23'), (2952, 224, 'r24'), (2953, 261, 'r25'), (2954, 298, 'r26'), (2955, 335, 'r27'), (2956, 372, 'r28'), (2957, 409, 'r29'), (2958, 446, 'r30'), (2959, 483, 'r31'), (2960, 20, 'r32'), (2961, 57, 'r33'), (2962, 94, 'r34'), (2963, 131, 'r35'), (2964, 168, 'r36'), (2965, 205, 'r37'), (2966, 242, 'r38'), (2967, 279, 'r39'), (2968, 316, 'r40'), (2969, 353, 'r41'), (2970, 390, 'r42'), (2971, 427, 'r43'), (2972, 464, 'r44'), (2973, 1, 'r45'), (2974, 38, 'r46'), (2975, 75, 'r47'), (2976, 112, 'r48'), (2977, 149, 'r49'), (2978, 186, 'r50'), (2979, 223, 'r51'), (2980, 260, 'r52'), (2981, 297, 'r53'), (2982, 334, 'r54'), (2983, 371, 'r55'), (2984, 408, 'r56'), (2985, 445, 'r57'), (2986, 482, 'r58'), (2987, 19, 'r59'), (2988, 56, 'r60'), (2989, 93, 'r0'), (2990, 130, 'r1'), (2991, 167, 'r2'), (2992, 204, 'r3'), (2993, 241, 'r4'), (2994, 278, 'r5'), (2995, 315, 'r6'), (2996, 352, 'r7'), (2997, 389, 'r8'), (2998, 426, 'r9'), (2999, 463, 'r10'), (3000, 0, 'r11'), (3001, 37, 'r12'), (3002, 74, 'r13'), (3003, 111, 'r14'), (3004, 148, 'r15'), (3005, 185, 'r16'), (3006, 222, 'r17'), (3007, 259, 'r18'), (3008, 296, 'r19'), (3009, 333, 'r20'), (3010, 370, 'r21'), (3011, 407, 'r22'), (3012, 444, 'r23'), (3013, 481, 'r24'), (3014, 18, 'r25'), (3015, 55, 'r26'), (3016, 92, 'r27'), (3017, 129, 'r28'), (3018, 166, 'r29'), (3019, 203, 'r30'), (3020, 240, 'r31'), (3021, 277, 'r32'), (3022, 314, 'r33'), (3023, 351, 'r34'), (3024, 388, 'r35'), (3025, 425, 'r36'), (3026, 462, 'r37'), (3027, 499, 'r38'), (3028, 36, 'r39'), (3029, 73, 'r40'), (3030, 110, 'r41'), (3031, 147, 'r42'), (3032, 184, 'r43'), (3033, 221, 'r44'), (3034, 258, 'r45'), (3035, 295, 'r46'), (3036, 332, 'r47'), (3037, 369, 'r48'), (3038, 406, 'r49'), (3039, 443, 'r50'), (3040, 480, 'r51'), (3041, 17, 'r52'), (3042, 54, 'r53'), (3043, 91, 'r54'), (3044, 128, 'r55'), (3045, 165, 'r56'), (3046, 202, 'r57'), (3047, 239, 'r58'), (3048, 276, 'r59'), (3049, 313, 'r60'), (3050, 350, 'r0'), (3051, 387, 'r1'), (3052, 424, 'r2'), (3053, 461, 'r3'), (3054, 498, 'r4'), (3055, 35, 'r5'), (3056, 72, 'r6'), (3057, 109, 'r7'), (3058, 146, 'r8'), (3059, 183, 'r9'), (3060, 220, 'r10'), (3061, 257, 'r11'), (3062, 294, 'r12'), (3063, 331, 'r13'), (3064, 368, 'r14'), (3065, 405, 'r15'), (3066, 442, 'r16'), (3067, 479, 'r17'), (3068, 16, 'r18'), (3069, 53, 'r19'), (3070, 90, 'r20'), (3071, 127, 'r21'), (3072, 164, 'r22'), (3073, 201, 'r23'), (3074, 238, 'r24'), (3075, 275, 'r25'), (3076, 312, 'r26'), (3077, 349, 'r27'), (3078, 386, 'r28'), (3079, 423, 'r29'), (3080, 460, 'r30'), (3081, 497, 'r31'), (3082, 34, 'r32'), (3083, 71, 'r33'), (3084, 108, 'r34'), (3085, 145, 'r35'), (3086, 182, 'r36'), (3087, 219, 'r37'), (3088, 256, 'r38'), (3089, 293, 'r39'), (3090, 330, 'r40'), (3091, 367, 'r41'), (3092, 404, 'r42'), (3093, 441, 'r43'), (3094, 478, 'r44'), (3095, 15, 'r45'), (3096, 52, 'r46'), (3097, 89, 'r47'), (3098, 126, 'r48'), (3099, 163, 'r49'), (3100, 200, 'r50'), (3101, 237, 'r51'), (3102, 274, 'r52'), (3103, 311, 'r53'), (3104, 348, 'r54'), (3105, 385, 'r55'), (3106, 422, 'r56'), (3107, 459, 'r57'), (3108, 496, 'r58'), (3109, 33, 'r59'), (3110, 70, 'r60'), (3111, 107, 'r0'), (3112, 144, 'r1'), (3113, 181, 'r2'), (3114, 218, 'r3'), (3115, 255, 'r4'), (3116, 292, 'r5'), (3117, 329, 'r6'), (3118, 366, 'r7'), (3119, 403, 'r8'), (3120, 440, 'r9'), (3121, 477, 'r10'), (3122, 14, 'r11'), (3123, 51, 'r12'), (3124, 88, 'r13'), (3125, 125, 'r14'), (3126, 162, 'r15'), (3127, 199, 'r16'), (3128, 236, 'r17'), (3129, 273, 'r18'), (3130, 310, 'r19'), (3131, 347, 'r20'), (3132, 384, 'r21'), (3133, 421, 'r22'), (3134, 458, 'r23'), (3135, 495, 'r24'), (3136, 32, 'r25'), (3137, 69, 'r26'), (3138, 106, 'r27'), (3139, 143, 'r28'), (3140, 180, 'r29'), (3141, 217, 'r30'), (3142, 254, 'r31'), (3143, 291, 'r32'), (3144, 328, 'r33'), (3145, 365, 'r34'), (3146, 402, 'r35'), (3147, 439, 'r36'), (3148, 476, 'r37'), (3149, 13, 'r38'), (3150, 50, 'r39'), (3151, 87, 'r40'), (3152, 124, 'r41'), (3153, 161, 'r42'), (3154, 198, 'r43'), (3155, 235, 'r44'), (3156, 272, 'r45'), (3157, 309, 'r46'), (3158, 346, 'r47'), (3159, 383, 'r48'), (3160, 420, 'r49'), (3161, 457, 'r50'), (3162, 494, 'r51'), (3163, 31, 'r52'), (3164, 68, 'r53'), (3165, 105, 'r54'), (3166, 142, 'r55'), (3167, 179, 'r56'), (3168, 216, 'r57'), (3169, 253, 'r58'), (3170, 290, 'r59'), (3171, 327, 'r60'), (3172, 364, 'r0'), (3173, 401, 'r1'), (3174, 438, 'r2'), (3175, 475, 'r3'), (3176, 12, 'r4'), (3177, 49, 'r5'), (3178, 86, 'r6'), (3179, 123, 'r7'), (3180, 160, 'r8'), (3181, 197, 'r9'), (3182, 234, 'r10'), (3183, 271, 'r11'), (3184, 308, 'r12'), (3185, 345, 'r13'), (3186, 382, 'r14'), (3187, 419, 'r15'), (3188, 456, 'r16'), (3189, 493, 'r17'), (3190, 30, 'r18'), (3191, 67, 'r19'), (3192, 104, 'r20'), (3193, 141, 'r21'), (3194, 178, 'r22'), (3195, 215, 'r23'), (3196, 252, 'r24'), (3197, 289, 'r25'), (3198, 326, 'r26'), (3199, 363, 'r27'), (3200, 400, 'r28'), (3201, 437, 'r29'), (3202, 474, 'r30'), (3203, 11, 'r31'), (3204, 48, 'r32'), (3205, 85, 'r33'), (3206, 122, 'r34'), (3207, 159, 'r35'), (3208, 196, 'r36'), (3209, 233, 'r37'), (3210, 270, 'r38'), (3211, 307, 'r39'), (3212, 344, 'r40'), (3213, 381, 'r41'), (3214, 418, 'r42'), (3215, 455, 'r43'), (3216, 492, 'r44'), (3217, 29, 'r45'), (3218, 66, 'r46'), (3219, 103, 'r47'), (3220, 140, 'r48'), (3221, 177, 'r49'), (3222, 214, 'r50'), (3223, 251, 'r51'), (3224, 288, 'r52'), (3225, 325, 'r53'), (3226, 362, 'r54'), (3227, 399, 'r55'), (3228, 436, 'r56'), (3229, 473, 'r57'), (3230, 10, 'r58'), (3231, 47, 'r59'), (3232, 84, 'r60'), (3233, 121, 'r0'), (3234, 158, 'r1'), (3235, 195, 'r2'), (3236, 232, 'r3'), (3237, 269, 'r4'), (3238, 306, 'r5'), (3239, 343, 'r6'), (3240, 380, 'r7'), (3241, 417, 'r8'), (3242, 454, 'r9'), (3243, 491, 'r10'), (3244, 28, 'r11'), (3245, 65, 'r12'), (3246, 102, 'r13'), (3247, 139, 'r14'), (3248, 176, 'r15'), (3249, 213, 'r16'), (3250, 250, 'r17'), (3251, 287, 'r18'), (3252, 324, 'r19'), (3253, 361, 'r20'), (3254, 398, 'r21'), (3255, 435, 'r22'), (3256, 472, 'r23'), (3257, 9, 'r24'), (3258, 46, 'r25'), (3259, 83, 'r26'), (3260, 120, 'r27'), (3261, 157, 'r28'), (3262, 194, 'r29'), (3263, 231, 'r30'), (3264, 268, 'r31'), (3265, 305, 'r32'), (3266, 342, 'r33'), (3267, 379, 'r34'), (3268, 416, 'r35'), (3269, 453, 'r36'), (3270, 490, 'r37'), (3271, 27, 'r38'), (3272, 64, 'r39'), (3273, 101, 'r40'), (3274, 138, 'r41'), (3275, 175, 'r42'), (3276, 212, 'r43'), (3277, 249, 'r44'), (3278, 286, 'r45'), (3279, 323, 'r46'), (3280, 360, 'r47'), (3281, 397, 'r48'), (3282, 434, 'r49'), (3283, 471, 'r50'), (3284, 8, 'r51'), (3285, 45, 'r52'), (3286, 82, 'r53'), (3287, 119, 'r54'), (3288, 156, 'r55'), (3289, 193, 'r56'), (3290, 230, 'r57'), (3291, 267, 'r58'), (3292, 304, 'r59'), (3293, 341, 'r60'), (3294, 378, 'r0'), (3295, 415, 'r1'), (3296, 452, 'r2'), (3297, 489, 'r3'), (3298, 26, 'r4'), (3299, 63, 'r5'), (3300, 100, 'r6'), (3301, 137, 'r7'), (3302, 174, 'r8'), (3303, 211, 'r9'), (3304, 248, 'r10'), (3305, 285, 'r11'), (3306, 322, 'r12'), (3307, 359, 'r13'), (3308, 396, 'r14'), (3309, 433, 'r15'), (3310, 470, 'r16'), (3311, 7, 'r17'), (3312, 44, 'r18'), (3313, 81, 'r19'), (3314, 118, 'r20'), (3315, 155, 'r21'), (3316, 192, 'r22'), (3317, 229, 'r23'), (3318, 266, 'r24'), (3319, 303, 'r25'), (3320, 340, 'r26'), (3321, 377, 'r27'), (3322, 414, 'r28'), (3323, 451, 'r29'), (3324, 488, 'r30'), (3325, 25, 'r31'), (3326, 62, 'r32'), (3327, 99, 'r33'), (3328, 136, 'r34'), (3329, 173, 'r35'), (3330, 210, 'r36'), (3331, 247, 'r37'), (3332, 284, 'r38'), (3333, 321, 'r39'), (3334, 358, 'r40'), (3335, 395, 'r41'), (3336, 432, 'r42'), (3337, 469, 'r43'), (3338, 6, 'r44'), (3339, 43, 'r45'), (3340, 80, 'r46'), (3341, 117, 'r47'), (3342, 154, 'r48'), (3343, 191, 'r49'), (3344, 228, 'r50'), (3345, 265, 'r51'), (3346, 302, 'r52'), (3347, 339, 'r53'), (3348, 376, 'r54'), (3349, 413, 'r55'), (3350, 450, 'r56'), (3351, 487, 'r57'), (3352, 24, 'r58'), (3353, 61, 'r59'), (3354, 98, 'r60'), (3355, 135, 'r0'), (3356, 172, 'r1'), (3357, 209, 'r2'), (3358, 246, 'r3'), (3359, 283, 'r4'), (3360, 320, 'r5'), (3361, 357, 'r6'), (3362, 394, 'r7'), (3363, 431, 'r8'), (3364, 468, 'r9'), (3365, 5, 'r10'), (3366, 42, 'r11'), (3367, 79, 'r12'), (3368, 116, 'r13'), (3369, 153, 'r14'), (3370, 190, 'r15'), (3371, 227, 'r16'), (3372, 264, 'r17'), (3373, 301, 'r18'), (3374, 338, 'r19'), (3375, 375, 'r20'), (3376, 412, 'r21'), (3377, 449, 'r22'), (3378, 486, 'r23'), (3379, 23, 'r24'), (3380, 60, 'r25'), (3381, 97, 'r26'), (3382, 134, 'r27'), (3383, 171, 'r28'), (3384, 208, 'r29'), (3385, 245, 'r30'), (3386, 282, 'r31'), (3387, 319, 'r32'), (3388, 356, 'r33'), (3389, 393, 'r34'), (3390, 430, 'r35'), (3391, 467, 'r36'), (3392, 4, 'r37'), (3393, 41, 'r38'), (3394, 78, 'r39'), (3395, 115, 'r40'), (3396, 152, 'r41'), (3397, 189, 'r42'), (3398, 226, 'r43'), (3399, 263, 'r44'), (3400, 300, 'r45'), (3401, 337, 'r46'), (3402, 374, 'r47'), (3403, 411, 'r48'), (3404, 448, 'r49'), (3405, 485, 'r50'), (3406, 22, 'r51'), (3407, 59, 'r52'), (3408, 96, 'r53'), (3409, 133, 'r54'), (3410, 170, 'r55'), (3411, 207, 'r56'), (3412, 244, 'r57'), (3413, 281, 'r58'), (3414, 318, 'r59'), (3415, 355, 'r60'), (3416, 392, 'r0'), (3417, 429, 'r1'), (3418, 466, 'r2'), (3419, 3, 'r3'), (3420, 40, 'r4'), (3421, 77, 'r5'), (3422, 114, 'r6'), (3423, 151, 'r7'), (3424, 188, 'r8'), (3425, 225, 'r9'), (3426, 262, 'r10'), (3427, 299, 'r11'), (3428, 336, 'r12'), (3429, 373, 'r13'), (3430, 410, 'r14'), (3431, 447, 'r15'), (3432, 484, 'r16'), (3433, 21, 'r17'), (3434, 58, 'r18'), (3435, 95, 'r19'), (3436, 132, 'r20'), (3437, 169, 'r21'), (3438, 206, 'r22'), (3439, 243, 'r23'), (3440, 280, 'r24'), (3441, 317, 'r25'), (3442, 354, 'r26'), (3443, 391, 'r27'), (3444, 428, 'r28'), (3445, 465, 'r29'), (3446, 2, 'r30'), (3447, 39, 'r31'), (3448, 76, 'r32'), (3449, 113, 'r33'), (3450, 150, 'r34'), (3451, 187, 'r35'), (3452, 224, 'r36'), (3453, 261, 'r37'), (3454, 298, 'r38'), (3455, 335, 'r39'), (3456, 372, 'r40'), (3457, 409, 'r41'), (3458, 446, 'r42'), (3459, 483, 'r43'), (3460, 20, 'r44'), (3461, 57, 'r45'), (3462, 94, 'r46'), (3463, 131, 'r47'), (3464, 168, 'r48'), (3465, 205, 'r49'), (3466, 242, 'r50'), (3467, 279, 'r51'), (3468, 316, 'r52'), (3469, 353, 'r53'), (3470, 390, 'r54'), (3471, 427, 'r55'), (3472, 464, 'r56'), (3473, 1, 'r57'), (3474, 38, 'r58'), (3475, 75, 'r59'), (3476, 112, 'r60'), (3477, 149, 'r0'), (3478, 186, 'r1'), (3479, 223, 'r2'), (3480, 260, 'r3'), (3481, 297, 'r4'), (3482, 334, 'r5'), (3483, 371, 'r6'), (3484, 408, 'r7'), (3485, 445, 'r8'), (3486, 482, 'r9'), (3487, 19, 'r10'), (3488, 56, 'r11'), (3489, 93, 'r12'), (3490, 130, 'r13'), (3491, 167, 'r14'), (3492, 204, 'r15'), (3493, 241, 'r16'), (3494, 278, 'r17'), (3495, 315, 'r18'), (3496, 352, 'r19'), (3497, 389, 'r20'), (3498, 426, 'r21'), (3499, 463, 'r22'), (3500, 0, 'r23'), (3501, 37, 'r24'), (3502, 74, 'r25'), (3503, 111, 'r26'), (3504, 148, 'r27'), (3505, 185, 'r28'), (3506, 222, 'r29'), (3507, 259, 'r30'), (3508, 296, 'r31'), (3509, 333, 'r32'), (3510, 370, 'r33'), (3511, 407, 'r34'), (3512, 444, 'r35'), (3513, 481, 'r36'), (3514, 18, 'r37'), (3515, 55, 'r38'), (3516, 92, 'r39'), (3517, 129, 'r40'), (3518, 166, 'r41'), (3519, 203, 'r42'), (3520, 240, 'r43'), (3521, 277, 'r44'), (3522, 314, 'r45'), (3523, 351, 'r46'), (3524, 388, 'r47'), (3525, 425, 'r48'), (3526, 462, 'r49'), (3527, 499, 'r50'), (3528, 36, 'r51'), (3529, 73, 'r52'), (3530, 110, 'r53'), (3531, 147, 'r54'), (3532, 184, 'r55'), (3533, 221, 'r56'), (3534, 258, 'r57'), (3535, 295, 'r58'), (3536, 332, 'r59'), (3537, 369, 'r60'), (3538, 406, 'r0'), (3539, 443, 'r1'), (3540, 480, 'r2'), (3541, 17, 'r3'), (3542, 54, 'r4'), (3543, 91, 'r5'), (3544, 128, 'r6'), (3545, 165, 'r7'), (3546, 202, 'r8'), (3547, 239, 'r9'), (3548, 276, 'r10'), (3549, 313, 'r11'), (3550, 350, 'r12'), (3551, 387, 'r13'), (3552, 424, 'r14'), (3553, 461, 'r15'), (3554, 498, 'r16'), (3555, 35, 'r17'), (3556, 72, 'r18'), (3557, 109, 'r19'), (3558, 146, 'r20'), (3559, 183, 'r21'), (3560, 220, 'r22'), (3561, 257, 'r23'), (3562, 294, 'r24'), (3563, 331, 'r25'), (3564, 368, 'r26'), (3565, 405, 'r27'), (3566, 442, 'r28'), (3567, 479, 'r29'), (3568, 16, 'r30'), (3569, 53, 'r31'), (3570, 90, 'r32'), (3571, 127, 'r33'), (3572, 164, 'r34'), (3573, 201, 'r35'), (3574, 238, 'r36'), (3575, 275, 'r37'), (3576, 312, 'r38'), (3577, 349, 'r39'), (3578, 386, 'r40'), (3579, 423, 'r41'), (3580, 460, 'r42'), (3581, 497, 'r43'), (3582, 34, 'r44'), (3583, 71, 'r45'), (3584, 108, 'r46'), (3585, 145, 'r47'), (3586, 182, 'r48'), (3587, 219, 'r49'), (3588, 256, 'r50'), (3589, 293, 'r51'), (3590, 330, 'r52'), (3591, 367, 'r53'), (3592, 404, 'r54'), (3593, 441, 'r55'), (3594, 478, 'r56'), (3595, 15, 'r57'), (3596, 52, 'r58'), (3597, 89, 'r59'), (3598, 126, 'r60'), (3599, 163, 'r0'), (3600, 200, 'r1'), (3601, 237, 'r2'), (3602, 274, 'r3'), (3603, 311, 'r4'), (3604, 348, 'r5'), (3605, 385, 'r6'), (3606, 422, 'r7'), (3607, 459, 'r8'), (3608, 496, 'r9'), (3609, 33, 'r10'), (3610, 70, 'r11'), (3611, 107, 'r12'), (3612, 144, 'r13'), (3613, 181, 'r14'), (3614, 218, 'r15'), (3615, 255, 'r16'), (3616, 292, 'r17'), (3617, 329, 'r18'), (3618, 366, 'r19'), (3619, 403, 'r20'), (3620, 440, 'r21'), (3621, 477, 'r22'), (3622, 14, 'r23'), (3623, 51, 'r24'), (3624, 88, 'r25'), (3625, 125, 'r26'), (3626, 162, 'r27'), (3627, 199, 'r28'), (3628, 236, 'r29'), (3629, 273, 'r30'), (3630, 310, 'r31'), (3631, 347, 'r32'), (3632, 384, 'r33'), (3633, 421, 'r34'), (3634, 458, 'r35'), (3635, 495, 'r36'), (3636, 32, 'r37'), (3637, 69, 'r38'), (3638, 106, 'r39'), (3639, 143, 'r40'), (3640, 180, 'r41'), (3641, 217, 'r42'), (3642, 254, 'r43'), (3643, 291, 'r44'), (3644, 328, 'r45'), (3645, 365, 'r46'), (3646, 402, 'r47'), (3647, 439, 'r48'), (3648, 476, 'r49'), (3649, 13, 'r50'), (3650, 50, 'r51'), (3651, 87, 'r52'), (3652, 124, 'r53'), (3653, 161, 'r54'), (3654, 198, 'r55'), (3655, 235, 'r56'), (3656, 272, 'r57'), (3657, 309, 'r58'), (3658, 346, 'r59'), (3659, 383, 'r60'), (3660, 420, 'r0'), (3661, 457, 'r1'), (3662, 494, 'r2'), (3663, 31, 'r3'), (3664, 68, 'r4'), (3665, 105, 'r5'), (3666, 142, 'r6'), (3667, 179, 'r7'), (3668, 216, 'r8'), (3669, 253, 'r9'), (3670, 290, 'r10'), (3671, 327, 'r11'), (3672, 364, 'r12'), (3673, 401, 'r13'), (3674, 438, 'r14'), (3675, 475, 'r15'), (3676, 12, 'r16'), (3677, 49, 'r17'), (3678, 86, 'r18'), (3679, 123, 'r19'), (3680, 160, 'r20'), (3681, 197, 'r21'), (3682, 234, 'r22'), (3683, 271, 'r23'), (3684, 308, 'r24'), (3685, 345, 'r25'), (3686, 382, 'r26'), (3687, 419, 'r27'), (3688, 456, 'r28'), (3689, 493, 'r29'), (3690, 30, 'r30'), (3691, 67, 'r31'), (3692, 104, 'r32'), (3693, 141, 'r33'), (3694, 178, 'r34'), (3695, 215, 'r35'), (3696, 252, 'r36'), (3697, 289, 'r37'), (3698, 326, 'r38'), (3699, 363, 'r39'), (3700, 400, 'r40'), (3701, 437, 'r41'), (3702, 474, 'r42'), (3703, 11, 'r43'), (3704, 48, 'r44'), (3705, 85, 'r45'), (3706, 122, 'r46'), (3707, 159, 'r47'), (3708, 196, 'r48'), (3709, 233, 'r49'), (3710, 270, 'r50'), (3711, 307, 'r51'), (3712, 344, 'r52'), (3713, 381, 'r53'), (3714, 418, 'r54'), (3715, 455, 'r55'), (3716, 492, 'r56'), (3717, 29, 'r57'), (3718, 66, 'r58'), (3719, 103, 'r59'), (3720, 140, 'r60'), (3721, 177, 'r0'), (3722, 214, 'r1'), (3723, 251, 'r2'), (3724, 288, 'r3'), (3725, 325, 'r4'), (3726, 362, 'r5'), (3727, 399, 'r6'), (3728, 436, 'r7'), (3729, 473, 'r8'), (3730, 10, 'r9'), (3731, 47, 'r10'), (3732, 84, 'r11'), (3733, 121, 'r12'), (3734, 158, 'r13'), (3735, 195, 'r14'), (3736, 232, 'r15'), (3737, 269, 'r16'), (3738, 306, 'r17'), (3739, 343, 'r18'), (3740, 380, 'r19'), (3741, 417, 'r20'), (3742, 454, 'r21'), (3743, 491, 'r22'), (3744, 28, 'r23'), (3745, 65, 'r24'), (3746, 102, 'r25'), (3747, 139, 'r26'), (3748, 176, 'r27'), (3749, 213, 'r28'), (3750, 250, 'r29'), (3751, 287, 'r30'), (3752, 324, 'r31'), (3753, 361, 'r32'), (3754, 398, 'r33'), (3755, 435, 'r34'), (3756, 472, 'r35'), (3757, 9, 'r36'), (3758, 46, 'r37'), (3759, 83, 'r38'), (3760, 120, 'r39'), (3761, 157, 'r40'), (3762, 194, 'r41'), (3763, 231, 'r42'), (3764, 268, 'r43'), (3765, 305, 'r44'), (3766, 342, 'r45'), (3767, 379, 'r46'), (3768, 416, 'r47'), (3769, 453, 'r48'), (3770, 490, 'r49'), (3771, 27, 'r50'), (3772, 64, 'r51'), (3773, 101, 'r52'), (3774, 138, 'r53'), (3775, 175, 'r54'), (3776, 212, 'r55'), (3777, 249, 'r56'), (3778, 286, 'r57'), (3779, 323, 'r58'), (3780, 360, 'r59'), (3781, 397, 'r60'), (3782, 434, 'r0'), (3783, 471, 'r1'), (3784, 8, 'r2'), (3785, 45, 'r3'), (3786, 82, 'r4'), (3787, 119, 'r5'), (3788, 156, 'r6'), (3789, 193, 'r7'), (3790, 230, 'r8'), (3791, 267, 'r9'), (3792, 304, 'r10'), (3793, 341, 'r11'), (3794, 378, 'r12'), (3795, 415, 'r13'), (3796, 452, 'r14'), (3797, 489, 'r15'), (3798, 26, 'r16'), (3799, 63, 'r17'), (3800, 100, 'r18'), (3801, 137, 'r19'), (3802, 174, 'r20'), (3803, 211, 'r21'), (3804, 248, 'r22'), (3805, 285, 'r23'), (3806, 322, 'r24'), (3807, 359, 'r25'), (3808, 396, 'r26'), (3809, 433, 'r27'), (3810, 470, 'r28'), (3811, 7, 'r29'), (3812, 44, 'r30'), (3813, 81, 'r31'), (3814, 118, 'r32'), (3815, 155, 'r33'), (3816, 192, 'r34'), (3817, 229, 'r35'), (3818, 266, 'r36'), (3819, 303, 'r37'), (3820, 340, 'r38'), (3821, 377, 'r39'), (3822, 414, 'r40'), (3823, 451, 'r41'), (3824, 488, 'r42'), (3825, 25, 'r43'), (3826, 62, 'r44'), (3827, 99, 'r45'), (3828, 136, 'r46'), (3829, 173, 'r47'), (3830, 210, 'r48'), (3831, 247, 'r49'), (3832, 284, 'r50'), (3833, 321, 'r51'), (3834, 358, 'r52'), (3835, 395, 'r53'), (3836, 432, 'r54'), (3837, 469, 'r55'), (3838, 6, 'r56'), (3839, 43, 'r57'), (3840, 80, 'r58'), (3841, 117, 'r59'), (3842, 154, 'r60'), (3843, 191, 'r0'), (3844, 228, 'r1'), (3845, 265, 'r2'), (3846, 302, 'r3'), (3847, 339, 'r4'), (3848, 376, 'r5'), (3849, 413, 'r6'), (3850, 450, 'r7'), (3851, 487, 'r8'), (3852, 24, 'r9'), (3853, 61, 'r10'), (3854, 98, 'r11'), (3855, 135, 'r12'), (3856, 172, 'r13'), (3857, 209, 'r14'), (3858, 246, 'r15'), (3859, 283, 'r16'), (3860, 320, 'r17'), (3861, 357, 'r18'), (3862, 394, 'r19'), (3863, 431, 'r20'), (3864, 468, 'r21'), (3865, 5, 'r22'), (3866, 42, 'r23'), (3867, 79, 'r24'), (3868, 116, 'r25'), (3869, 153, 'r26'), (3870, 190, 'r27'), (3871, 227, 'r28'), (3872, 264, 'r29'), (3873, 301, 'r30'), (3874, 338, 'r31'), (3875, 375, 'r32'), (3876, 412, 'r33'), (3877, 449, 'r34'), (3878, 486, 'r35'), (3879, 23, 'r36'), (3880, 60, 'r37'), (3881, 97, 'r38'), (3882, 134, 'r39'), (3883, 171, 'r40'), (3884, 208, 'r41'), (3885, 245, 'r42'), (3886, 282, 'r43'), (3887, 319, 'r44'), (3888, 356, 'r45'), (3889, 393, 'r46'), (3890, 430, 'r47'), (3891, 467, 'r48'), (3892, 4, 'r49'), (3893, 41, 'r50'), (3894, 78, 'r51'), (3895, 115, 'r52'), (3896, 152, 'r53'), (3897, 189, 'r54'), (3898, 226, 'r55'), (3899, 263, 'r56'), (3900, 300, 'r57'), (3901, 337, 'r58'), (3902, 374, 'r59'), (3903, 411, 'r60'), (3904, 448, 'r0'), (3905, 485, 'r1'), (3906, 22, 'r2'), (3907, 59, 'r3'), (3908, 96, 'r4'), (3909, 133, 'r5'), (3910, 170, 'r6'), (3911, 207, 'r7'), (3912, 244, 'r8'), (3913, 281, 'r9'), (3914, 318, 'r10'), (3915, 355, 'r11'), (3916, 392, 'r12'), (3917, 429, 'r13'), (3918, 466, 'r14'), (3919, 3, 'r15'), (3920, 40, 'r16'), (3921, 77, 'r17'), (3922, 114, 'r18'), (3923, 151, 'r19'), (3924, 188, 'r20'), (3925, 225, 'r21'), (3926, 262, 'r22'), (3927, 299, 'r23'), (3928, 336, 'r24'), (3929, 373, 'r25'), (3930, 410, 'r26'), (3931, 447, 'r27'), (3932, 484, 'r28'), (3933, 21, 'r29'), (3934, 58, 'r30'), (3935, 95, 'r31'), (3936, 132, 'r32'), (3937, 169, 'r33'), (3938, 206, 'r34'), (3939, 243, 'r35'), (3940, 280, 'r36'), (3941, 317, 'r37'), (3942, 354, 'r38'), (3943, 391, 'r39'), (3944, 428, 'r40'), (3945, 465, 'r41'), (3946, 2, 'r42'), (3947, 39, 'r43'), (3948, 76, 'r44'), (3949, 113, 'r45'), (3950, 150, 'r46'), (3951, 187, 'r47'), (3952, 224, 'r48'), (3953, 261, 'r49'), (3954, 298, 'r50'), (3955, 335, 'r51'), (3956, 372, 'r52'), (3957, 409, 'r53'), (3958, 446, 'r54'), (3959, 483, 'r55'), (3960, 20, 'r56'), (3961, 57, 'r57'), (3962, 94, 'r58'), (3963, 131, 'r59'), (3964, 168, 'r60'), (3965, 205, 'r0'), (3966, 242, 'r1'), (3967, 279, 'r2'), (3968, 316, 'r3'), (3969, 353, 'r4'), (3970, 390, 'r5'), (3971, 427, 'r6'), (3972, 464, 'r7'), (3973, 1, 'r8'), (3974, 38, 'r9'), (3975, 75, 'r10'), (3976, 112, 'r11'), (3977, 149, 'r12'), (3978, 186, 'r13'), (3979, 223, 'r14'), (3980, 260, 'r15'), (3981, 297, 'r16'), (3982, 334, 'r17'), (3983, 371, 'r18'), (3984, 408, 'r19'), (3985, 445, 'r20'), (3986, 482, 'r21'), (3987, 19, 'r22'), (3988, 56, 'r23'), (3989, 93, 'r24'), (3990, 130, 'r25'), (3991, 167, 'r26'), (3992, 204, 'r27'), (3993, 241, 'r28'), (3994, 278, 'r29'), (3995, 315, 'r30'), (3996, 352, 'r31'), (3997, 389, 'r32'), (3998, 426, 'r33'), (3999, 463, 'r34');
+CREATE TABLE S(B INT, D FLOAT);
+INSERT INTO S VALUES (0, 0.5), (1, 1.5), (2, 2.5), (3, 3.5), (4, 4.5), (5, 5.5), (6, 6.5), (7, 7.5), (8, 8.5), (9, 9.5), (10, 10.5), (11, 11.5), (12, 12.5), (13, 13.5), (14, 14.5), (15, 15.5), (16, 16.5), (17, 17.5), (18, 18.5), (19, 19.5), (20, 20.5), (21, 21.5), (22, 22.5), (23, 23.5), (24, 24.5), (25, 25.5), (26, 26.5), (27, 27.5), (28, 28.5), (29, 29.5), (30, 30.5), (31, 31.5), (32, 32.5), (33, 33.5), (34, 34.5), (35, 35.5), (36, 36.5), (37, 37.5), (38, 38.5), (39, 39.5), (40, 40.5), (41, 41.5), (42, 42.5), (43, 43.5), (44, 44.5), (45, 45.5), (46, 46.5), (47, 47.5), (48, 48.5), (49, 49.5), (50, 50.5), (51, 51.5), (52, 52.5), (53, 53.5), (54, 54.5), (55, 55.5), (56, 56.5), (57, 57.5), (58, 58.5), (59, 59.5), (60, 60.5), (61, 61.5), (62, 62.5), (63, 63.5), (64, 64.5), (65, 65.5), (66, 66.5), (67, 67.5), (68, 68.5), (69, 69.5), (70, 70.5), (71, 71.5), (72, 72.5), (73, 73.5), (74, 74.5), (75, 75.5), (76, 76.5), (77, 77.5), (78, 78.5), (79, 79.5), (80, 80.5), (81, 81.5), (82, 82.5), (83, 83.5), (84, 84.5), (85, 85.5), (86, 86.5), (87, 87.5), (88, 88.5), (89, 89.5), (90, 90.5), (91, 91.5), (92, 92.5), (93, 93.5), (94, 94.5), (95, 95.5), (96, 96.5), (97, 97.5), (98, 98.5), (99, 99.5), (100, 100.5), (101, 101.5), (102, 102.5), (103, 103.5), (104, 104.5), (105, 105.5), (106, 106.5), (107, 107.5), (108, 108.5), (109, 109.5), (110, 110.5), (111, 111.5), (112, 112.5), (113, 113.5), (114, 114.5), (115, 115.5), (116, 116.5), (117, 117.5), (118, 118.5), (119, 119.5), (120, 120.5), (121, 121.5), (122, 122.5), (123, 123.5), (124, 124.5), (125, 125.5), (126, 126.5), (127, 127.5), (128, 128.5), (129, 129.5), (130, 130.5), (131, 131.5), (132, 132.5), (133, 133.5), (134, 134.5), (135, 135.5), (136, 136.5), (137, 137.5), (138, 138.5), (139, 139.5), (140, 140.5), (141, 141.5), (142, 142.5), (143, 143.5), (144, 144.5), (145, 145.5), (146, 146.5), (147, 147.5), (148, 148.5), (149, 149.5), (150, 150.5), (151, 151.5), (152, 152.5), (153, 153.5), (154, 154.5), (155, 155.5), (156, 156.5), (157, 157.5), (158, 158.5), (159, 159.5), (160, 160.5), (161, 161.5), (162, 162.5), (163, 163.5), (164, 164.5), (165, 165.5), (166, 166.5), (167, 167.5), (168, 168.5), (169, 169.5), (170, 170.5), (171, 171.5), (172, 172.5), (173, 173.5), (174, 174.5), (175, 175.5), (176, 176.5), (177, 177.5), (178, 178.5), (179, 179.5), (180, 180.5), (181, 181.5), (182, 182.5), (183, 183.5), (184, 184.5), (185, 185.5), (186, 186.5), (187, 187.5), (188, 188.5), (189, 189.5), (190, 190.5), (191, 191.5), (192, 192.5), (193, 193.5), (194, 194.5), (195, 195.5), (196, 196.5), (197, 197.5), (198, 198.5), (199, 199.5), (200, 200.5), (201, 201.5), (202, 202.5), (203, 203.5), (204, 204.5), (205, 205.5), (206, 206.5), (207, 207.5), (208, 208.5), (209, 209.5), (210, 210.5), (211, 211.5), (212, 212.5), (213, 213.5), (214, 214.5), (215, 215.5), (216, 216.5), (217, 217.5), (218, 218.5), (219, 219.5), (220, 220.5), (221, 221.5), (222, 222.5), (223, 223.5), (224, 224.5), (225, 225.5), (226, 226.5), (227, 227.5), (228, 228.5), (229, 229.5), (230, 230.5), (231, 231.5), (232, 232.5), (233, 233.5), (234, 234.5), (235, 235.5), (236, 236.5), (237, 237.5), (238, 238.5), (239, 239.5), (240, 240.5), (241, 241.5), (242, 242.5), (243, 243.5), (244, 244.5), (245, 245.5), (246, 246.5), (247, 247.5), (248, 248.5), (249, 249.5), (250, 250.5), (251, 251.5), (252, 252.5), (253, 253.5), (254, 254.5), (255, 255.5), (256, 256.5), (257, 257.5), (258, 258.5), (259, 259.5), (260, 260.5), (261, 261.5), (262, 262.5), (263, 263.5), (264, 264.5), (265, 265.5), (266, 266.5), (267, 267.5), (268, 268.5), (269, 269.5), (270, 270.5), (271, 271.5), (272, 272.5), (273, 273.5), (274, 274.5), (275, 275.5), (276, 276.5), (277, 277.5), (278, 278.5), (279, 279.5), (280, 280.5), (281, 281.5), (282, 282.5), (283, 283.5), (284, 284.5), (285, 285.5), (286, 286.5), (287, 287.5), (288, 288.5), (289, 289.5), (290, 290.5), (291, 291.5), (292, 292.5), (293, 293.5), (294, 294.5), (295, 295.5), (296, 296.5), (297, 297.5), (298, 298.5), (299, 299.5), (300, 300.5), (301, 301.5), (302, 302.5), (303, 303.5), (304, 304.5), (305, 305.5), (306, 306.5), (307, 307.5), (308, 308.5), (309, 309.5), (310, 310.5), (311, 311.5), (312, 312.5), (313, 313.5), (314, 314.5), (315, 315.5), (316, 316.5), (317, 317.5), (318, 318.5), (319, 319.5), (320, 320.5), (321, 321.5), (322, 322.5), (323, 323.5), (324, 324.5), (325, 325.5), (326, 326.5), (327, 327.5), (328, 328.5), (329, 329.5), (330, 330.5), (331, 331.5), (332, 332.5), (333, 333.5), (334, 334.5), (335, 335.5), (336, 336.5), (337, 337.5), (338, 338.5), (339, 339.5), (340, 340.5), (341, 341.5), (342, 342.5), (343, 343.5), (344, 344.5), (345, 345.5), (346, 346.5), (347, 347.5), (348, 348.5), (349, 349.5), (350, 350.5), (351, 351.5), (352, 352.5), (353, 353.5), (354, 354.5), (355, 355.5), (356, 356.5), (357, 357.5), (358, 358.5), (359, 359.5), (360, 360.5), (361, 361.5), (362, 362.5), (363, 363.5), (364, 364.5), (365, 365.5), (366, 366.5), (367, 367.5), (368, 368.5), (369, 369.5), (370, 370.5), (371, 371.5), (372, 372.5), (373, 373.5), (374, 374.5), (375, 375.5), (376, 376.5), (377, 377.5), (378, 378.5), (379, 379.5), (380, 380.5), (381, 381.5), (382, 382.5), (383, 383.5), (384, 384.5), (385, 385.5), (386, 386.5), (387, 387.5), (388, 388.5), (389, 389.5), (390, 390.5), (391, 391.5), (392, 392.5), (393, 393.5), (394, 394.5), (395, 395.5), (396, 396.5), (397, 397.5), (398, 398.5), (399, 399.5), (400, 400.5), (401, 401.5), (402, 402.5), (403, 403.5), (404, 404.5), (405, 405.5), (406, 406.5), (407, 407.5), (408, 408.5), (409, 409.5), (410, 410.5), (411, 411.5), (412, 412.5), (413, 413.5), (414, 414.5), (415, 415.5), (416, 416.5), (417, 417.5), (418, 418.5), (419, 419.5), (420, 420.5), (421, 421.5), (422, 422.5), (423, 423.5), (424, 424.5), (425, 425.5), (426, 426.5), (427, 427.5), (428, 428.5), (429, 429.5), (430, 430.5), (431, 431.5), (432, 432.5), (433, 433.5), (434, 434.5), (435, 435.5), (436, 436.5), (437, 437.5), (438, 438.5), (439, 439.5), (440, 440.5), (441, 441.5), (442, 442.5), (443, 443.5), (444, 444.5), (445, 445.5), (446, 446.5), (447, 447.5), (448, 448.5), (449, 449.5), (450, 450.5), (451, 451.5), (452, 452.5), (453, 453.5), (454, 454.5), (455, 455.5), (456, 456.5), (457, 457.5), (458, 458.5), (459, 459.5), (460, 460.5), (461, 461.5), (462, 462.5), (463, 463.5), (464, 464.5), (465, 465.5), (466, 466.5), (467, 467.5), (468, 468.5), (469, 469.5), (470, 470.5), (471, 471.5), (472, 472.5), (473, 473.5), (474, 474.5), (475, 475.5), (476, 476.5), (477, 477.5), (478, 478.5), (479, 479.5), (480, 480.5), (481, 481.5), (482, 482.5), (483, 483.5), (484, 484.5), (485, 485.5), (486, 486.5), (487, 487.5), (488, 488.5), (489, 489.5), (490, 490.5), (491, 491.5), (492, 492.5), (493, 493.5), (494, 494.5), (495, 495.5), (496, 496.5), (497, 497.5), (498, 498.5), (499, 499.5), (500, 500.5), (501, 501.5), (502, 502.5), (503, 503.5), (504, 504.5), (505, 505.5), (506, 506.5), (507, 507.5), (508, 508.5), (509, 509.5), (510, 510.5), (511, 511.5), (512, 512.5), (513, 513.5), (514, 514.5), (515, 515.5), (516, 516.5), (517, 517.5), (518, 518.5), (519, 519.5), (520, 520.5), (521, 521.5), (522, 522.5), (523, 523.5), (524, 524.5), (525, 525.5), (526, 526.5), (527, 527.5), (528, 528.5), (529, 529.5), (530, 530.5), (531, 531.5), (532, 532.5), (533, 533.5), (534, 534.5), (535, 535.5), (536, 536.5), (537, 537.5), (538, 538.5), (539, 539.5), (540, 540.5), (541, 541.5), (542, 542.5), (543, 543.5), (544, 544.5), (545, 545.5), (546, 546.5), (547, 547.5), (548, 548.5), (549, 549.5), (550, 550.5), (551, 551.5), (552, 552.5), (553, 553.5), (554, 554.5), (555, 555.5), (556, 556.5), (557, 557.5), (558, 558.5), (559, 559.5), (560, 560.5), (561, 561.5), (562, 562.5), (563, 563.5), (564, 564.5), (565, 565.5), (566, 566.5), (567, 567.5), (568, 568.5), (569, 569.5), (570, 570.5), (571, 571.5), (572, 572.5), (573, 573.5), (574, 574.5), (575, 575.5), (576, 576.5), (577, 577.5), (578, 578.5), (579, 579.5), (580, 580.5), (581, 581.5), (582, 582.5), (583, 583.5), (584, 584.5), (585, 585.5), (586, 586.5), (587, 587.5), (588, 588.5), (589, 589.5), (590, 590.5), (591, 591.5), (592, 592.5), (593, 593.5), (594, 594.5), (595, 595.5), (596, 596.5), (597, 597.5), (598, 598.5), (599, 599.5), (600, 600.5), (601, 601.5), (602, 602.5), (603, 603.5), (604, 604.5), (605, 605.5), (606, 606.5), (607, 607.5), (608, 608.5), (609, 609.5), (610, 610.5), (611, 611.5), (612, 612.5), (613, 613.5), (614, 614.5), (615, 615.5), (616, 616.5), (617, 617.5), (618, 618.5), (619, 619.5), (620, 620.5), (621, 621.5), (622, 622.5), (623, 623.5), (624, 624.5), (625, 625.5), (626, 626.5), (627, 627.5), (628, 628.5), (629, 629.5), (630, 630.5), (631, 631.5), (632, 632.5), (633, 633.5), (634, 634.5), (635, 635.5), (636, 636.5), (637, 637.5), (638, 638.5), (639, 639.5), (640, 640.5), (641, 641.5), (642, 642.5), (643, 643.5), (644, 644.5), (645, 645.5), (646, 646.5), (647, 647.5), (648, 648.5), (649, 649.5), (650, 650.5), (651, 651.5), (652, 652.5), (653, 653.5), (654, 654.5), (655, 655.5), (656, 656.5), (657, 657.5), (658, 658.5), (659, 659.5), (660, 660.5), (661, 661.5), (662, 662.5), (663, 663.5), (664, 664.5), (665, 665.5), (666, 666.5), (667, 667.5), (668, 668.5), (669, 669.5), (670, 670.5), (671, 671.5), (672, 672.5), (673, 673.5), (674, 674.5), (675, 675.5), (676, 676.5), (677, 677.5), (678, 678.5), (679, 679.5), (680, 680.5), (681, 681.5), (682, 682.5), (683, 683.5), (684, 684.5), (685, 685.5), (686, 686.5), (687, 687.5), (688, 688.5), (689, 689.5), (690, 690.5), (691, 691.5), (692, 692.5), (693, 693.5), (694, 694.5), (695, 695.5), (696, 696.5), (697, 697.5), (698, 698.5), (699, 699.5), (0, 700.5), (1, 701.5), (2, 702.5), (3, 703.5), (4, 704.5), (5, 705.5), (6, 706.5), (7, 707.5), (8, 708.5), (9, 709.5), (10, 710.5), (11, 711.5), (12, 712.5), (13, 713.5), (14, 714.5), (15, 715.5), (16, 716.5), (17, 717.5), (18, 718.5), (19, 719.5), (20, 720.5), (21, 721.5), (22, 722.5), (23, 723.5), (24, 724.5), (25, 725.5), (26, 726.5), (27, 727.5), (28, 728.5), (29, 729.5), (30, 730.5), (31, 731.5), (32, 732.5), (33, 733.5), (34, 734.5), (35, 735.5), (36, 736.5), (37, 737.5), (38, 738.5), (39, 739.5), (40, 740.5), (41, 741.5), (42, 742.5), (43, 743.5), (44, 744.5), (45, 745.5), (46, 746.5), (47, 747.5), (48, 748.5), (49, 749.5), (50, 750.5), (51, 751.5), (52, 752.5), (53, 753.5), (54, 754.5), (55, 755.5), (56, 756.5), (57, 757.5), (58, 758.5), (59, 759.5), (60, 760.5), (61, 761.5), (62, 762.5), (63, 763.5), (64, 764.5), (65, 765.5), (66, 766.5), (67, 767.5), (68, 768.5), (69, 769.5), (70, 770.5), (71, 771.5), (72, 772.5), (73, 773.5), (74, 774.5), (75, 775.5), (76, 776.5), (77, 777.5), (78, 778.5), (79, 779.5), (80, 780.5), (81, 781.5), (82, 782.5), (83, 783.5), (84, 784.5), (85, 785.5), (86, 786.5), (87, 787.5), (88, 788.5), (89, 789.5), (90, 790.5), (91, 791.5), (92, 792.5), (93, 793.5), (94, 794.5), (95, 795.5), (96, 796.5), (97, 797.5), (98, 798.5), (99, 799.5), (100, 800.5), (101, 801.5), (102, 802.5), (103, 803.5), (104, 804.5), (105, 805.5), (106, 806.5), (107, 807.5), (108, 808.5), (109, 809.5), (110, 810.5), (111, 811.5), (112, 812.5), (113, 813.5), (114, 814.5), (115, 815.5), (116, 816.5), (117, 817.5), (118, 818.5), (119, 819.5), (120, 820.5), (121, 821.5), (122, 822.5), (123, 823.5), (124, 824.5), (125, 825.5), (126, 826.5), (127, 827.5), (128, 828.5), (129, 829.5), (130, 830.5), (131, 831.5), (132, 832.5), (133, 833.5), (134, 834.5), (135, 835.5), (136, 836.5), (137, 837.5), (138, 838.5), (139, 839.5), (140, 840.5), (141, 841.5), (142, 842.5), (143, 843.5), (144, 844.5), (145, 845.5), (146, 846.5), (147, 847.5), (148, 848.5), (149, 849.5), (150, 850.5), (151, 851.5), (152, 852.5), (153, 853.5), (154, 854.5), (155, 855.5), (156, 856.5), (157, 857.5), (158, 858.5), (159, 859.5), (160, 860.5), (161, 861.5), (162, 862.5), (163, 863.5), (164, 864.5), (165, 865.5), (166, 866.5), (167, 867.5), (168, 868.5), (169, 869.5), (170, 870.5), (171, 871.5), (172, 872.5), (173, 873.5), (174, 874.5), (175, 875.5), (176, 876.5), (177, 877.5), (178, 878.5), (179, 879.5), (180, 880.5), (181, 881.5), (182, 882.5), (183, 883.5), (184, 884.5), (185, 885.5), (186, 886.5), (187, 887.5), (188, 888.5), (189, 889.5), (190, 890.5), (191, 891.5), (192, 892.5), (193, 893.5), (194, 894.5), (195, 895.5), (196, 896.5), (197, 897.5), (198, 898.5), (199, 899.5), (200, 900.5), (201, 901.5), (202, 902.5), (203, 903.5), (204, 904.5), (205, 905.5), (206, 906.5), (207, 907.5), (208, 908.5), (209, 909.5), (210, 910.5), (211, 911.5), (212, 912.5), (213, 913.5), (214, 914.5), (215, 915.5), (216, 916.5), (217, 917.5), (218, 918.5), (219, 919.5), (220, 920.5), (221, 921.5), (222, 922.5), (223, 923.5), (224, 924.5), (225, 925.5), (226, 926.5), (227, 927.5), (228, 928.5), (229, 929.5), (230, 930.5), (231, 931.5), (232, 932.5), (233, 933.5), (234, 934.5), (235, 935.5), (236, 936.5), (237, 937.5), (238, 938.5), (239, 939.5), (240, 940.5), (241, 941.5), (242, 942.5), (243, 943.5), (244, 944.5), (245, 945.5), (246, 946.5), (247, 947.5), (248, 948.5), (249, 949.5), (250, 950.5), (251, 951.5), (252, 952.5), (253, 953.5), (254, 954.5), (255, 955.5), (256, 956.5), (257, 957.5), (258, 958.5), (259, 959.5), (260, 960.5), (261, 961.5), (262, 962.5), (263, 963.5), (264, 964.5), (265, 965.5), (266, 966.5), (267, 967.5), (268, 968.5), (269, 969.5), (270, 970.5), (271, 971.5), (272, 972.5), (273, 973.5), (274, 974.5), (275, 975.5), (276, 976.5), (277, 977.5), (278, 978.5), (279, 979.5), (280, 980.5), (281, 981.5), (282, 982.5), (283, 983.5), (284, 984.5), (285, 985.5), (286, 986.5), (287, 987.5), (288, 988.5), (289, 989.5), (290, 990.5), (291, 991.5), (292, 992.5), (293, 993.5), (294, 994.5), (295, 995.5), (296, 996.5), (297, 997.5), (298, 998.5), (299, 999.5), (300, 1000.5), (301, 1001.5), (302, 1002.5), (303, 1003.5), (304, 1004.5), (305, 1005.5), (306, 1006.5), (307, 1007.5), (308, 1008.5), (309, 1009.5), (310, 1010.5), (311, 1011.5), (312, 1012.5), (313, 1013.5), (314, 1014.5), (315, 1015.5), (316, 1016.5), (317, 1017.5), (318, 1018.5), (319, 1019.5), (320, 1020.5), (321, 1021.5), (322, 1022.5), (323, 1023.5), (324, 1024.5), (325, 1025.5), (326, 1026.5), (327, 1027.5), (328, 1028.5), (329, 1029.5), (330, 1030.5), (331, 1031.5), (332, 1032.5), (333, 1033.5), (334, 1034.5), (335, 1035.5), (336, 1036.5), (337, 1037.5), (338, 1038.5), (339, 1039.5), (340, 1040.5), (341, 1041.5), (342, 1042.5), (343, 1043.5), (344, 1044.5), (345, 1045.5), (346, 1046.5), (347, 1047.5), (348, 1048.5), (349, 1049.5), (350, 1050.5), (351, 1051.5), (352, 1052.5), (353, 1053.5), (354, 1054.5), (355, 1055.5), (356, 1056.5), (357, 1057.5), (358, 1058.5), (359, 1059.5), (360, 1060.5), (361, 1061.5), (362, 1062.5), (363, 1063.5), (364, 1064.5), (365, 1065.5), (366, 1066.5), (367, 1067.5), (368, 1068.5), (369, 1069.5), (370, 1070.5), (371, 1071.5), (372, 1072.5), (373, 1073.5), (374, 1074.5), (375, 1075.5), (376, 1076.5), (377, 1077.5), (378, 1078.5), (379, 1079.5), (380, 1080.5), (381, 1081.5), (382, 1082.5), (383, 1083.5), (384, 1084.5), (385, 1085.5), (386, 1086.5), (387, 1087.5), (388, 1088.5), (389, 1089.5), (390, 1090.5), (391, 1091.5), (392, 1092.5), (393, 1093.5), (394, 1094.5), (395, 1095.5), (396, 1096.5), (397, 1097.5), (398, 1098.5), (399, 1099.5), (400, 1100.5), (401, 1101.5), (402, 1102.5), (403, 1103.5), (404, 1104.5), (405, 1105.5), (406, 1106.5), (407, 1107.5), (408, 1108.5), (409, 1109.5), (410, 1110.5), (411, 1111.5), (412, 1112.5), (413, 1113.5), (414, 1114.5), (415, 1115.5), (416, 1116.5), (417, 1117.5), (418, 1118.5), (419, 1119.5), (420, 1120.5), (421, 1121.5), (422, 1122.5), (423, 1123.5), (424, 1124.5), (425, 1125.5), (426, 1126.5), (427, 1127.5), (428, 1128.5), (429, 1129.5), (430, 1130.5), (431, 1131.5), (432, 1132.5), (433, 1133.5), (434, 1134.5), (435, 1135.5), (436, 1136.5), (437, 1137.5), (438, 1138.5), (439, 1139.5), (440, 1140.5), (441, 1141.5), (442, 1142.5), (443, 1143.5), (444, 1144.5), (445, 1145.5), (446, 1146.5), (447, 1147.5), (448, 1148.5), (449, 1149.5), (450, 1150.5), (451, 1151.5), (452, 1152.5), (453, 1153.5), (454, 1154.5), (455, 1155.5), (456, 1156.5), (457, 1157.5), (458, 1158.5), (459, 1159.5), (460, 1160.5), (461, 1161.5), (462, 1162.5), (463, 1163.5), (464, 1164.5), (465, 1165.5), (466, 1166.5), (467, 1167.5), (468, 1168.5), (469, 1169.5), (470, 1170.5), (471, 1171.5), (472, 1172.5), (473, 1173.5), (474, 1174.5), (475, 1175.5), (476, 1176.5), (477, 1177.5), (478, 1178.5), (479, 1179.5), (480, 1180.5), (481, 1181.5), (482, 1182.5), (483, 1183.5), (484, 1184.5), (485, 1185.5), (486, 1186.5), (487, 1187.5), (488, 1188.5), (489, 1189.5), (490, 1190.5), (491, 1191.5), (492, 1192.5), (493, 1193.5), (494, 1194.5), (495, 1195.5), (496, 1196.5), (497, 1197.5), (498, 1198.5), (499, 1199.5), (500, 1200.5), (501, 1201.5), (502, 1202.5), (503, 1203.5), (504, 1204.5), (505, 1205.5), (506, 1206.5), (507, 1207.5), (508, 1208.5), (509, 1209.5), (510, 1210.5), (511, 1211.5), (512, 1212.5), (513, 1213.5), (514, 1214.5), (515, 1215.5), (516, 1216.5), (517, 1217.5), (518, 1218.5), (519, 1219.5), (520, 1220.5), (521, 1221.5), (522, 1222.5), (523, 1223.5), (524, 1224.5), (525, 1225.5), (526, 1226.5), (527, 1227.5), (528, 1228.5), (529, 1229.5), (530, 1230.5), (531, 1231.5), (532, 1232.5), (533, 1233.5), (534, 1234.5), (535, 1235.5), (536, 1236.5), (537, 1237.5), (538, 1238.5), (539, 1239.5), (540, 1240.5), (541, 1241.5), (542, 1242.5), (543, 1243.5), (544, 1244.5), (545, 1245.5), (546, 1246.5), (547, 1247.5), (548, 1248.5), (549, 1249.5), (550, 1250.5), (551, 1251.5), (552, 1252.5), (553, 1253.5), (554, 1254.5), (555, 1255.5), (556, 1256.5), (557, 1257.5), (558, 1258.5), (559, 1259.5), (560, 1260.5), (561, 1261.5), (562, 1262.5), (563, 1263.5), (564, 1264.5), (565, 1265.5), (566, 1266.5), (567, 1267.5), (568, 1268.5), (569, 1269.5), (570, 1270.5), (571, 1271.5), (572, 1272.5), (573, 1273.5), (574, 1274.5), (575, 1275.5), (576, 1276.5), (577, 1277.5), (578, 1278.5), (579, 1279.5), (580, 1280.5), (581, 1281.5), (582, 1282.5), (583, 1283.5), (584, 1284.5), (585, 1285.5), (586, 1286.5), (587, 1287.5), (588, 1288.5), (589, 1289.5), (590, 1290.5), (591, 1291.5), (592, 1292.5), (593, 1293.5), (594, 1294.5), (595, 1295.5), (596, 1296.5), (597, 1297.5), (598, 1298.5), (599, 1299.5), (600, 1300.5), (601, 1301.5), (602, 1302.5), (603, 1303.5), (604, 1304.5), (605, 1305.5), (606, 1306.5), (607, 1307.5), (608, 1308.5), (609, 1309.5), (610, 1310.5), (611, 1311.5), (612, 1312.5), (613, 1313.5), (614, 1314.5), (615, 1315.5), (616, 1316.5), (617, 1317.5), (618, 1318.5), (619, 1319.5), (620, 1320.5), (621, 1321.5), (622, 1322.5), (623, 1323.5), (624, 1324.5), (625, 1325.5), (626, 1326.5), (627, 1327.5), (628, 1328.5), (629, 1329.5), (630, 1330.5), (631, 1331.5), (632, 1332.5), (633, 1333.5), (634, 1334.5), (635, 1335.5), (636, 1336.5), (637, 1337.5), (638, 1338.5), (639, 1339.5), (640, 1340.5), (641, 1341.5), (642, 1342.5), (643, 1343.5), (644, 1344.5), (645, 1345.5), (646, 1346.5), (647, 1347.5), (648, 1348.5), (649, 1349.5), (650, 1350.5), (651, 1351.5), (652, 1352.5), (653, 1353.5), (654, 1354.5), (655, 1355.5), (656, 1356.5), (657, 1357.5), (658, 1358.5), (659, 1359.5), (660, 1360.5), (661, 1361.5), (662, 1362.5), (663, 1363.5), (664, 1364.5), (665, 1365.5), (666, 1366.5), (667, 1367.5), (668, 1368.5), (669, 1369.5), (670, 1370.5), (671, 1371.5), (672, 1372.5), (673, 1373.5), (674, 1374.5), (675, 1375.5), (676, 1376.5), (677, 1377.5), (678, 1378.5), (679, 1379.5), (680, 1380.5), (681, 1381.5), (682, 1382.5), (683, 1383.5), (684, 1384.5), (685, 1385.5), (686, 1386.5), (687, 1387.5), (688, 1388.5), (689, 1389.5), (690, 1390.5), (691, 1391.5), (692, 1392.5), (693, 1393.5), (694, 1394.5), (695, 1395.5), (696, 1396.5), (697, 1397.5), (698, 1398.5), (699, 1399.5), (0, 1400.5), (1, 1401.5), (2, 1402.5), (3, 1403.5), (4, 1404.5), (5, 1405.5), (6, 1406.5), (7, 1407.5), (8, 1408.5), (9, 1409.5), (10, 1410.5), (11, 1411.5), (12, 1412.5), (13, 1413.5), (14, 1414.5), (15, 1415.5), (16, 1416.5), (17, 1417.5), (18, 1418.5), (19, 1419.5), (20, 1420.5), (21, 1421.5), (22, 1422.5), (23, 1423.5), (24, 1424.5), (25, 1425.5), (26, 1426.5), (27, 1427.5), (28, 1428.5), (29, 1429.5), (30, 1430.5), (31, 1431.5), (32, 1432.5), (33, 1433.5), (34, 1434.5), (35, 1435.5), (36, 1436.5), (37, 1437.5), (38, 1438.5), (39, 1439.5), (40, 1440.5), (41, 1441.5), (42, 1442.5), (43, 1443.5), (44, 1444.5), (45, 1445.5), (46, 1446.5), (47, 1447.5), (48, 1448.5), (49, 1449.5), (50, 1450.5), (51, 1451.5), (52, 1452.5), (53, 1453.5), (54, 1454.5), (55, 1455.5), (56, 1456.5), (57, 1457.5), (58, 1458.5), (59, 1459.5), (60, 1460.5), (61, 1461.5), (62, 1462.5), (63, 1463.5), (64, 1464.5), (65, 1465.5), (66, 1466.5), (67, 1467.5), (68, 1468.5), (69, 1469.5), (70, 1470.5), (71, 1471.5), (72, 1472.5), (73, 1473.5), (74, 1474.5), (75, 1475.5), (76, 1476.5), (77, 1477.5), (78, 1478.5), (79, 1479.5), (80, 1480.5), (81, 1481.5), (82, 1482.5), (83, 1483.5), (84, 1484.5), (85, 1485.5), (86, 1486.5), (87, 1487.5), (88, 1488.5), (89, 1489.5), (90, 1490.5), (91, 1491.5), (92, 1492.5), (93, 1493.5), (94, 1494.5), (95, 1495.5), (96, 1496.5), (97, 1497.5), (98, 1498.5), (99, 1499.5), (100, 1500.5), (101, 1501.5), (102, 1502.5), (103, 1503.5), (104, 1504.5), (105, 1505.5), (106, 1506.5), (107, 1507.5), (108, 1508.5), (109, 1509.5), (110, 1510.5), (111, 1511.5), (112, 1512.5), (113, 1513.5), (114, 1514.5), (115, 1515.5), (116, 1516.5), (117, 1517.5), (118, 1518.5), (119, 1519.5), (120, 1520.5), (121, 1521.5), (122, 1522.5), (123, 1523.5), (124, 1524.5), (125, 1525.5), (126, 1526.5), (127, 1527.5), (128, 1528.5), (129, 1529.5), (130, 1530.5), (131, 1531.5), (132, 1532.5), (133, 1533.5), (134, 1534.5), (135, 1535.5), (136, 1536.5), (137, 1537.5), (138, 1538.5), (139, 1539.5), (140, 1540.5), (141, 1541.5), (142, 1542.5), (143, 1543.5), (144, 1544.5), (145, 1545.5), (146, 1546.5), (147, 1547.5), (148, 1548.5), (149, 1549.5), (150, 1550.5), (151, 1551.5), (152, 1552.5), (153, 1553.5), (154, 1554.5), (155, 1555.5), (156, 1556.5), (157, 1557.5), (158, 1558.5), (159, 1559.5), (160, 1560.5), (161, 1561.5), (162, 1562.5), (163, 1563.5), (164, 1564.5), (165, 1565.5), (166, 1566.5), (167, 1567.5), (168, 1568.5), (169, 1569.5), (170, 1570.5), (171, 1571.5), (172, 1572.5), (173, 1573.5), (174, 1574.5), (175, 1575.5), (176, 1576.5), (177, 1577.5), (178, 1578.5), (179, 1579.5), (180, 1580.5), (181, 1581.5), (182, 1582.5), (183, 1583.5), (184, 1584.5), (185, 1585.5), (186, 1586.5), (187, 1587.5), (188, 1588.5), (189, 1589.5), (190, 1590.5), (191, 1591.5), (192, 1592.5), (193, 1593.5), (194, 1594.5), (195, 1595.5), (196, 1596.5), (197, 1597.5), (198, 1598.5), (199, 1599.5), (200, 1600.5), (201, 1601.5), (202, 1602.5), (203, 1603.5), (204, 1604.5), (205, 1605.5), (206, 1606.5), (207, 1607.5), (208, 1608.5), (209, 1609.5), (210, 1610.5), (211, 1611.5), (212, 1612.5), (213, 1613.5), (214, 1614.5), (215, 1615.5), (216, 1616.5), (217, 1617.5), (218, 1618.5), (219, 1619.5), (220, 1620.5), (221, 1621.5), (222, 1622.5), (223, 1623.5), (224, 1624.5), (225, 1625.5), (226, 1626.5), (227, 1627.5), (228, 1628.5), (229, 1629.5), (230, 1630.5), (231, 1631.5), (232, 1632.5), (233, 1633.5), (234, 1634.5), (235, 1635.5), (236, 1636.5), (237, 1637.5), (238, 1638.5), (239, 1639.5), (240, 1640.5), (241, 1641.5), (242, 1642.5), (243, 1643.5), (244, 1644.5), (245, 1645.5), (246, 1646.5), (247, 1647.5), (248, 1648.5), (249, 1649.5), (250, 1650.5), (251, 1651.5), (252, 1652.5), (253, 1653.5), (254, 1654.5), (255, 1655.5), (256, 1656.5), (257, 1657.5), (258, 1658.5), (259, 1659.5), (260, 1660.5), (261, 1661.5), (262, 1662.5), (263, 1663.5), (264, 1664.5), (265, 1665.5), (266, 1666.5), (267, 1667.5), (268, 1668.5), (269, 1669.5), (270, 1670.5), (271, 1671.5), (272, 1672.5), (273, 1673.5), (274, 1674.5), (275, 1675.5), (276, 1676.5), (277, 1677.5), (278, 1678.5), (279, 1679.5), (280, 1680.5), (281, 1681.5), (282, 1682.5), (283, 1683.5), (284, 1684.5), (285, 1685.5), (286, 1686.5), (287, 1687.5), (288, 1688.5), (289, 1689.5), (290, 1690.5), (291, 1691.5), (292, 1692.5), (293, 1693.5), (294, 1694.5), (295, 1695.5), (296, 1696.5), (297, 1697.5), (298, 1698.5), (299, 1699.5), (300, 1700.5), (301, 1701.5), (302, 1702.5), (303, 1703.5), (304, 1704.5), (305, 1705.5), (306, 1706.5), (307, 1707.5), (308, 1708.5), (309, 1709.5), (310, 1710.5), (311, 1711.5), (312, 1712.5), (313, 1713.5), (314, 1714.5), (315, 1715.5), (316, 1716.5), (317, 1717.5), (318, 1718.5), (319, 1719.5), (320, 1720.5), (321, 1721.5), (322, 1722.5), (323, 1723.5), (324, 1724.5), (325, 1725.5), (326, 1726.5), (327, 1727.5), (328, 1728.5), (329, 1729.5), (330, 1730.5), (331, 1731.5), (332, 1732.5), (333, 1733.5), (334, 1734.5), (335, 1735.5), (336, 1736.5), (337, 1737.5), (338, 1738.5), (339, 1739.5), (340, 1740.5), (341, 1741.5), (342, 1742.5), (343, 1743.5), (344, 1744.5), (345, 1745.5), (346, 1746.5), (347, 1747.5), (348, 1748.5), (349, 1749.5), (350, 1750.5), (351, 1751.5), (352, 1752.5), (353, 1753.5), (354, 1754.5), (355, 1755.5), (356, 1756.5), (357, 1757.5), (358, 1758.5), (359, 1759.5), (360, 1760.5), (361, 1761.5), (362, 1762.5), (363, 1763.5), (364, 1764.5), (365, 1765.5), (366, 1766.5), (367, 1767.5), (368, 1768.5), (369, 1769.5), (370, 1770.5), (371, 1771.5), (372, 1772.5), (373, 1773.5), (374, 1774.5), (375, 1775.5), (376, 1776.5), (377, 1777.5), (378, 1778.5), (379, 1779.5), (380, 1780.5), (381, 1781.5), (382, 1782.5), (383, 1783.5), (384, 1784.5), (385, 1785.5), (386, 1786.5), (387, 1787.5), (388, 1788.5), (389, 1789.5), (390, 1790.5), (391, 1791.5), (392, 1792.5), (393, 1793.5), (394, 1794.5), (395, 1795.5), (396, 1796.5), (397, 1797.5), (398, 1798.5), (399, 1799.5), (400, 1800.5), (401, 1801.5), (402, 1802.5), (403, 1803.5), (404, 1804.5), (405, 1805.5), (406, 1806.5), (407, 1807.5), (408, 1808.5), (409, 1809.5), (410, 1810.5), (411, 1811.5), (412, 1812.5), (413, 1813.5), (414, 1814.5), (415, 1815.5), (416, 1816.5), (417, 1817.5), (418, 1818.5), (419, 1819.5), (420, 1820.5), (421, 1821.5), (422, 1822.5), (423, 1823.5), (424, 1824.5), (425, 1825.5), (426, 1826.5), (427, 1827.5), (428, 1828.5), (429, 1829.5), (430, 1830.5), (431, 1831.5), (432, 1832.5), (433, 1833.5), (434, 1834.5), (435, 1835.5), (436, 1836.5), (437, 1837.5), (438, 1838.5), (439, 1839.5), (440, 1840.5), (441, 1841.5), (442, 1842.5), (443, 1843.5), (444, 1844.5), (445, 1845.5), (446, 1846.5), (447, 1847.5), (448, 1848.5), (449, 1849.5), (450, 1850.5), (451, 1851.5), (452, 1852.5), (453, 1853.5), (454, 1854.5), (455, 1855.5), (456, 1856.5), (457, 1857.5), (458, 1858.5), (459, 1859.5), (460, 1860.5), (461, 1861.5), (462, 1862.5), (463, 1863.5), (464, 1864.5), (465, 1865.5), (466, 1866.5), (467, 1867.5), (468, 1868.5), (469, 1869.5), (470, 1870.5), (471, 1871.5), (472, 1872.5), (473, 1873.5), (474, 1874.5), (475, 1875.5), (476, 1876.5), (477, 1877.5), (478, 1878.5), (479, 1879.5), (480, 1880.5), (481, 1881.5), (482, 1882.5), (483, 1883.5), (484, 1884.5), (485, 1885.5), (486, 1886.5), (487, 1887.5), (488, 1888.5), (489, 1889.5), (490, 1890.5), (491, 1891.5), (492, 1892.5), (493, 1893.5), (494, 1894.5), (495, 1895.5), (496, 1896.5), (497, 1897.5), (498, 1898.5), (499, 1899.5), (500, 1900.5), (501, 1901.5), (502, 1902.5), (503, 1903.5), (504, 1904.5), (505, 1905.5), (506, 1906.5), (507, 1907.5), (508, 1908.5), (509, 1909.5), (510, 1910.5), (511, 1911.5), (512, 1912.5), (513, 1913.5), (514, 1914.5), (515, 1915.5), (516, 1916.5), (517, 1917.5), (518, 1918.5), (519, 1919.5), (520, 1920.5), (521, 1921.5), (522, 1922.5), (523, 1923.5), (524, 1924.5), (525, 1925.5), (526, 1926.5), (527, 1927.5), (528, 1928.5), (529, 1929.5), (530, 1930.5), (531, 1931.5), (532, 1932.5), (533, 1933.5), (534, 1934.5), (535, 1935.5), (536, 1936.5), (537, 1937.5), (538, 1938.5), (539, 1939.5), (540, 1940.5), (541, 1941.5), (542, 1942.5), (543, 1943.5), (544, 1944.5), (545, 1945.5), (546, 1946.5), (547, 1947.5), (548, 1948.5), (549, 1949.5), (550, 1950.5), (551, 1951.5), (552, 1952.5), (553, 1953.5), (554, 1954.5), (555, 1955.5), (556, 1956.5), (557, 1957.5), (558, 1958.5), (559, 1959.5), (560, 1960.5), (561, 1961.5), (562, 1962.5), (563, 1963.5), (564, 1964.5), (565, 1965.5), (566, 1966.5), (567, 1967.5), (568, 1968.5), (569, 1969.5), (570, 1970.5), (571, 1971.5), (572, 1972.5), (573, 1973.5), (574, 1974.5), (575, 1975.5), (576, 1976.5), (577, 1977.5), (578, 1978.5), (579, 1979.5), (580, 1980.5), (581, 1981.5), (582, 1982.5), (583, 1983.5), (584, 1984.5), (585, 1985.5), (586, 1986.5), (587, 1987.5), (588, 1988.5), (589, 1989.5), (590, 1990.5), (591, 1991.5), (592, 1992.5), (593, 1993.5), (594, 1994.5), (595, 1995.5), (596, 1996.5), (597, 1997.5), (598, 1998.5), (599, 1999.5);
+SELECT C, COUNT(*), COUNT(DISTINCT B), SUM(A) FROM R GROUP BY C;
+SELECT R.A, S.D FROM R, S WHERE R.B = S.B AND R.A < 300;
+SET HASH_JOIN OFF;
+SELECT R.A, S.D FROM R, S WHERE R.B = S.B AND S.D < 300.0;
+SET HASH_JOIN ON;
+SELECT A, B FROM R WHERE A > 3950 ORDER BY R.B;
+SELECT B, COUNT(*) FROM S GROUP BY B;
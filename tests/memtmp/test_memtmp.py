@@ -0,0 +1,48 @@
+import pytest
+
+from ddb.db import DatabaseManager
+from ddb.session import Session
+from ddb.globals import DEFAULT_TMP_MEMORY_BUDGET
+from ddb.primitives import ValType
+from ddb.storage import MemoryHeapFile
+
+testcase_dir = "tests/memtmp/"
+T = 1
+
+@pytest.fixture(params=[DEFAULT_TMP_MEMORY_BUDGET, 4096])
+def session(request):
+    # with the small budget, files in the tmp space get spilled to scratch files:
+    dbm = DatabaseManager(
+        db_dir = DatabaseManager.DEFAULT_DB_DIR,
+        tmp_dir = DatabaseManager.DEFAULT_TMP_DIR,
+        tmp_storage = 'memory',
+        tmp_memory_budget = request.param
+    )
+    s = Session(dbm)
+    yield s
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_memtmp_{t_id}")
+
+@pytest.mark.parametrize("commit", [True, False])
+def test_file_lifetime(session, commit):
+    # a file is kept (spilled beyond the budget) until its transaction aborts or the top-level one commits:
+    dbm = session.dbm
+    tmp_storage = dbm.sm.tmp_storage
+    rows = [ (i, f'row {i}') for i in range(1000) ]
+    with dbm.tm.begin_transaction(read_only=False, tmp=True) as parent:
+        tx = dbm.tm.begin_transaction(parent=parent, read_only=False, tmp=True)
+        with dbm.sm.heap_file(tx, 'f', [ValType.INTEGER, ValType.VARCHAR], create_if_not_exists=True) as f:
+            assert isinstance(f, MemoryHeapFile)
+            f.batch_append(rows)
+            assert list(f.iter_scan()) == rows
+        assert tmp_storage.files['f'].is_spilled() == (tmp_storage.memory_budget < DEFAULT_TMP_MEMORY_BUDGET)
+        if commit:
+            tx.commit()
+            with dbm.sm.heap_file(parent, 'f', [ValType.INTEGER, ValType.VARCHAR]) as f:
+                assert [ row for batch in f.iter_scan_batches() for row in batch ] == rows
+        else:
+            tx.abort()
+            assert 'f' not in tmp_storage.files
+    assert 'f' not in tmp_storage.files and tmp_storage.memory_used == 0
@@ -0,0 +1,13 @@
+CREATE TABLE R(A INT, B INT, C VARCHAR, D FLOAT);
+INSERT INTO R VALUES (0, 0, 'k0', 0.0), (1, 1917, 'k13', 0.25), (2, 833, 'k26', 0.5), (3, 2750, 'k39', 0.75), (4, 1666, 'k52', 1.0), (5, 582, 'k65', 1.25), (6, 2499, 'k78', 1.5), (7, 1415, 'k91', 1.75), (8, 331, 'k104', 2.0), (9, 2248, 'k117', 2.25), (10, 1164, 'k130', 2.5), (11, 80, 'k143', 2.75), (12, 1997, 'k156', 3.0), (13, 913, 'k12', 3.25), (14, 2830, 'k25', 3.5), (15, 1746, 'k38', 3.75), (16, 662, 'k51', 4.0), (17, 2579, 'k64', 4.25), (18, 1495, 'k77', 4.5), (19, 411, 'k90', 4.75), (20, 2328, 'k103', 5.0), (21, 1244, 'k116', 5.25), (22, 160, 'k129', 5.5), (23, 2077, 'k142', 5.75), (24, 993, 'k155', 6.0), (25, 2910, 'k11', 6.25), (26, 1826, 'k24', 6.5), (27, 742, 'k37', 6.75), (28, 2659, 'k50', 7.0), (29, 1575, 'k63', 0.0), (30, 491, 'k76', 0.25), (31, 2408, 'k89', 0.5), (32, 1324, 'k102', 0.75), (33, 240, 'k115', 1.0), (34, 2157, 'k128', 1.25), (35, 1073, 'k141', 1.5), (36, 2990, 'k154', 1.75), (37, 1906, 'k10', 2.0), (38, 822, 'k23', 2.25), (39, 2739, 'k36', 2.5), (40, 1655, 'k49', 2.75), (41, 571, 'k62', 3.0), (42, 2488, 'k75', 3.25), (43, 1404, 'k88', 3.5), (44, 320, 'k101', 3.75), (45, 2237, 'k114', 4.0), (46, 1153, 'k127', 4.25), (47, 69, 'k140', 4.5), (48, 1986, 'k153', 4.75), (49, 902, 'k9', 5.0), (50, 2819, 'k22', 5.25), (51, 1735, 'k35', 5.5), (52, 651, 'k48', 5.75), (53, 2568, 'k61', 6.0), (54, 1484, 'k74', 6.25), (55, 400, 'k87', 6.5), (56, 2317, 'k100', 6.75), (57, 1233, 'k113', 7.0), (58, 149, 'k126', 0.0), (59, 2066, 'k139', 0.25), (60, 982, 'k152', 0.5), (61, 2899, 'k8', 0.75), (62, 1815, 'k21', 1.0), (63, 731, 'k34', 1.25), (64, 2648, 'k47', 1.5), (65, 1564, 'k60', 1.75), (66, 480, 'k73', 2.0), (67, 2397, 'k86', 2.25), (68, 1313, 'k99', 2.5), (69, 229, 'k112', 2.75), (70, 2146, 'k125', 3.0), (71, 1062, 'k138', 3.25), (72, 2979, 'k151', 3.5), (73, 1895, 'k7', 3.75), (74, 811, 'k20', 4.0), (75, 2728, 'k33', 4.25), (76, 1644, 'k46', 4.5), (77, 560, 'k59', 4.75), (78, 2477, 'k72', 5.0), (79, 1393, 'k85', 5.25), (80, 309, 'k98', 5.5), (81, 2226, 'k111', 5.75), (82, 1142, 'k124', 6.0), (83, 58, 'k137', 6.25), (84, 1975, 'k150', 6.5), (85, 891, 'k6', 6.75), (86, 2808, 'k19', 7.0), (87, 1724, 'k32', 0.0), (88, 640, 'k45', 0.25), (89, 2557, 'k58', 0.5), (90, 1473, 'k71', 0.75), (91, 389, 'k84', 1.0), (92, 2306, 'k97', 1.25), (93, 1222, 'k110', 1.5), (94, 138, 'k123', 1.75), (95, 2055, 'k136', 2.0), (96, 971, 'k149', 2.25), (97, 2888, 'k5', 2.5), (98, 1804, 'k18', 2.75), (99, 720, 'k31', 3.0), (100, 2637, 'k44', 3.25), (101, 1553, 'k57', 3.5), (102, 469, 'k70', 3.75), (103, 2386, 'k83', 4.0), (104, 1302, 'k96', 4.25), (105, 218, 'k109', 4.5), (106, 2135, 'k122', 4.75), (107, 1051, 'k135', 5.0), (108, 2968, 'k148', 5.25), (109, 1884, 'k4', 5.5), (110, 800, 'k17', 5.75), (111, 2717, 'k30', 6.0), (112, 1633, 'k43', 6.25), (113, 549, 'k56', 6.5), (114, 2466, 'k69', 6.75), (115, 1382, 'k82', 7.0), (116, 298, 'k95', 0.0), (117, 2215, 'k108', 0.25), (118, 1131, 'k121', 0.5), (119, 47, 'k134', 0.75), (120, 1964, 'k147', 1.0), (121, 880, 'k3', 1.25), (122, 2797, 'k16', 1.5), (123, 1713, 'k29', 1.75), (124, 629, 'k42', 2.0), (125, 2546, 'k55', 2.25), (126, 1462, 'k68', 2.5), (127, 378, 'k81', 2.75), (128, 2295, 'k94', 3.0), (129, 1211, 'k107', 3.25), (130, 127, 'k120', 3.5), (131, 2044, 'k133', 3.75), (132, 960, 'k146', 4.0), (133, 2877, 'k2', 4.25), (134, 1793, 'k15', 4.5), (135, 709, 'k28', 4.75), (136, 2626, 'k41', 5.0), (137, 1542, 'k54', 5.25), (138, 458, 'k67', 5.5), (139, 2375, 'k80', 5.75), (140, 1291, 'k93', 6.0), (141, 207, 'k106', 6.25), (142, 2124, 'k119', 6.5), (143, 1040, 'k132', 6.75), (144, 2957, 'k145', 7.0), (145, 1873, 'k1', 0.0), (146, 789, 'k14', 0.25), (147, 2706, 'k27', 0.5), (148, 1622, 'k40', 0.75), (149, 538, 'k53', 1.0), (150, 2455, 'k66', 1.25), (151, 1371, 'k79', 1.5), (152, 287, 'k92', 1.75), (153, 2204, 'k105', 2.0), (154, 1120, 'k118', 2.25), (155, 36, 'k131', 2.5), (156, 1953, 'k144', 2.75), (157, 869, 'k0', 3.0), (158, 2786, 'k13', 3.25), (159, 1702, 'k26', 3.5), (160, 618, 'k39', 3.75), (161, 2535, 'k52', 4.0), (162, 1451, 'k65', 4.25), (163, 367, 'k78', 4.5), (164, 2284, 'k91', 4.75), (165, 1200, 'k104', 5.0), (166, 116, 'k117', 5.25), (167, 2033, 'k130', 5.5), (168, 949, 'k143', 5.75), (169, 2866, 'k156', 6.0), (170, 1782, 'k12', 6.25), (171, 698, 'k25', 6.5), (172, 2615, 'k38', 6.75), (173, 1531, 'k51', 7.0), (174, 447, 'k64', 0.0), (175, 2364, 'k77', 0.25), (176, 1280, 'k90', 0.5), (177, 196, 'k103', 0.75), (178, 2113, 'k116', 1.0), (179, 1029, 'k129', 1.25), (180, 2946, 'k142', 1.5), (181, 1862, 'k155', 1.75), (182, 778, 'k11', 2.0), (183, 2695, 'k24', 2.25), (184, 1611, 'k37', 2.5), (185, 527, 'k50', 2.75), (186, 2444, 'k63', 3.0), (187, 1360, 'k76', 3.25), (188, 276, 'k89', 3.5), (189, 2193, 'k102', 3.75), (190, 1109, 'k115', 4.0), (191, 25, 'k128', 4.25), (192, 1942, 'k141', 4.5), (193, 858, 'k154', 4.75), (194, 2775, 'k10', 5.0), (195, 1691, 'k23', 5.25), (196, 607, 'k36', 5.5), (197, 2524, 'k49', 5.75), (198, 1440, 'k62', 6.0), (199, 356, 'k75', 6.25), (200, 2273, 'k88', 6.5), (201, 1189, 'k101', 6.75), (202, 105, 'k114', 7.0), (203, 2022, 'k127', 0.0), (204, 938, 'k140', 0.25), (205, 2855, 'k153', 0.5), (206, 1771, 'k9', 0.75), (207, 687, 'k22', 1.0), (208, 2604, 'k35', 1.25), (209, 1520, 'k48', 1.5), (210, 436, 'k61', 1.75), (211, 2353, 'k74', 2.0), (212, 1269, 'k87', 2.25), (213, 185, 'k100', 2.5), (214, 2102, 'k113', 2.75), (215, 1018, 'k126', 3.0), (216, 2935, 'k139', 3.25), (217, 1851, 'k152', 3.5), (218, 767, 'k8', 3.75), (219, 2684, 'k21', 4.0), (220, 1600, 'k34', 4.25), (221, 516, 'k47', 4.5), (222, 2433, 'k60', 4.75), (223, 1349, 'k73', 5.0), (224, 265, 'k86', 5.25), (225, 2182, 'k99', 5.5), (226, 1098, 'k112', 5.75), (227, 14, 'k125', 6.0), (228, 1931, 'k138', 6.25), (229, 847, 'k151', 6.5), (230, 2764, 'k7', 6.75), (231, 1680, 'k20', 7.0), (232, 596, 'k33', 0.0), (233, 2513, 'k46', 0.25), (234, 1429, 'k59', 0.5), (235, 345, 'k72', 0.75), (236, 2262, 'k85', 1.0), (237, 1178, 'k98', 1.25), (238, 94, 'k111', 1.5), (239, 2011, 'k124', 1.75), (240, 927, 'k137', 2.0), (241, 2844, 'k150', 2.25), (242, 1760, 'k6', 2.5), (243, 676, 'k19', 2.75), (244, 2593, 'k32', 3.0), (245, 1509, 'k45', 3.25), (246, 425, 'k58', 3.5), (247, 2342, 'k71', 3.75), (248, 1258, 'k84', 4.0), (249, 174, 'k97', 4.25), (250, 2091, 'k110', 4.5), (251, 1007, 'k123', 4.75), (252, 2924, 'k136', 5.0), (253, 1840, 'k149', 5.25), (254, 756, 'k5', 5.5), (255, 2673, 'k18', 5.75), (256, 1589, 'k31', 6.0), (257, 505, 'k44', 6.25), (258, 2422, 'k57', 6.5), (259, 1338, 'k70', 6.75), (260, 254, 'k83', 7.0), (261, 2171, 'k96', 0.0), (262, 1087, 'k109', 0.25), (263, 3, 'k122', 0.5), (264, 1920, 'k135', 0.75), (265, 836, 'k148', 1.0), (266, 2753, 'k4', 1.25), (267, 1669, 'k17', 1.5), (268, 585, 'k30', 1.75), (269, 2502, 'k43', 2.0), (270, 1418, 'k56', 2.25), (271, 334, 'k69', 2.5), (272, 2251, 'k82', 2.75), (273, 1167, 'k95', 3.0), (274, 83, 'k108', 3.25), (275, 2000, 'k121', 3.5), (276, 916, 'k134', 3.75), (277, 2833, 'k147', 4.0), (278, 1749, 'k3', 4.25), (279, 665, 'k16', 4.5), (280, 2582, 'k29', 4.75), (281, 1498, 'k42', 5.0), (282, 414, 'k55', 5.25), (283, 2331, 'k68', 5.5), (284, 1247, 'k81', 5.75), (285, 163, 'k94', 6.0), (286, 2080, 'k107', 6.25), (287, 996, 'k120', 6.5), (288, 2913, 'k133', 6.75), (289, 1829, 'k146', 7.0), (290, 745, 'k2', 0.0), (291, 2662, 'k15', 0.25), (292, 1578, 'k28', 0.5), (293, 494, 'k41', 0.75), (294, 2411, 'k54', 1.0), (295, 1327, 'k67', 1.25), (296, 243, 'k80', 1.5), (297, 2160, 'k93', 1.75), (298, 1076, 'k106', 2.0), (299, 2993, 'k119', 2.25), (300, 1909, 'k132', 2.5), (301, 825, 'k145', 2.75), (302, 2742, 'k1', 3.0), (303, 1658, 'k14', 3.25), (304, 574, 'k27', 3.5), (305, 2491, 'k40', 3.75), (306, 1407, 'k53', 4.0), (307, 323, 'k66', 4.25), (308, 2240, 'k79', 4.5), (309, 1156, 'k92', 4.75), (310, 72, 'k105', 5.0), (311, 1989, 'k118', 5.25), (312, 905, 'k131', 5.5), (313, 2822, 'k144', 5.75), (314, 1738, 'k0', 6.0), (315, 654, 'k13', 6.25), (316, 2571, 'k26', 6.5), (317, 1487, 'k39', 6.75), (318, 403, 'k52', 7.0), (319, 2320, 'k65', 0.0), (320, 1236, 'k78', 0.25), (321, 152, 'k91', 0.5), (322, 2069, 'k104', 0.75), (323, 985, 'k117', 1.0), (324, 2902, 'k130', 1.25), (325, 1818, 'k143', 1.5), (326, 734, 'k156', 1.75), (327, 2651, 'k12', 2.0), (328, 1567, 'k25', 2.25), (329, 483, 'k38', 2.5), (330, 2400, 'k51', 2.75), (331, 1316, 'k64', 3.0), (332, 232, 'k77', 3.25), (333, 2149, 'k90', 3.5), (334, 1065, 'k103', 3.75), (335, 2982, 'k116', 4.0), (336, 1898, 'k129', 4.25), (337, 814, 'k142', 4.5), (338, 2731, 'k155', 4.75), (339, 1647, 'k11', 5.0), (340, 563, 'k24', 5.25), (341, 2480, 'k37', 5.5), (342, 1396, 'k50', 5.75), (343, 312, 'k63', 6.0), (344, 2229, 'k76', 6.25), (345, 1145, 'k89', 6.5), (346, 61, 'k102', 6.75), (347, 1978, 'k115', 7.0), (348, 894, 'k128', 0.0), (349, 2811, 'k141', 0.25), (350, 1727, 'k154', 0.5), (351, 643, 'k10', 0.75), (352, 2560, 'k23', 1.0), (353, 1476, 'k36', 1.25), (354, 392, 'k49', 1.5), (355, 2309, 'k62', 1.75), (356, 1225, 'k75', 2.0), (357, 141, 'k88', 2.25), (358, 2058, 'k101', 2.5), (359, 974, 'k114', 2.75), (360, 2891, 'k127', 3.0), (361, 1807, 'k140', 3.25), (362, 723, 'k153', 3.5), (363, 2640, 'k9', 3.75), (364, 1556, 'k22', 4.0), (365, 472, 'k35', 4.25), (366, 2389, 'k48', 4.5), (367, 1305, 'k61', 4.75), (368, 221, 'k74', 5.0), (369, 2138, 'k87', 5.25), (370, 1054, 'k100', 5.5), (371, 2971, 'k113', 5.75), (372, 1887, 'k126', 6.0), (373, 803, 'k139', 6.25), (374, 2720, 'k152', 6.5), (375, 1636, 'k8', 6.75), (376, 552, 'k21', 7.0), (377, 2469, 'k34', 0.0), (378, 1385, 'k47', 0.25), (379, 301, 'k60', 0.5), (380, 2218, 'k73', 0.75), (381, 1134, 'k86', 1.0), (382, 50, 'k99', 1.25), (383, 1967, 'k112', 1.5), (384, 883, 'k125', 1.75), (385, 2800, 'k138', 2.0), (386, 1716, 'k151', 2.25), (387, 632, 'k7', 2.5), (388, 2549, 'k20', 2.75), (389, 1465, 'k33', 3.0), (390, 381, 'k46', 3.25), (391, 2298, 'k59', 3.5), (392, 1214, 'k72', 3.75), (393, 130, 'k85', 4.0), (394, 2047, 'k98', 4.25), (395, 963, 'k111', 4.5), (396, 2880, 'k124', 4.75), (397, 1796, 'k137', 5.0), (398, 712, 'k150', 5.25), (399, 2629, 'k6', 5.5), (400, 1545, 'k19', 5.75), (401, 461, 'k32', 6.0), (402, 2378, 'k45', 6.25), (403, 1294, 'k58', 6.5), (404, 210, 'k71', 6.75), (405, 2127, 'k84', 7.0), (406, 1043, 'k97', 0.0), (407, 2960, 'k110', 0.25), (408, 1876, 'k123', 0.5), (409, 792, 'k136', 0.75), (410, 2709, 'k149', 1.0), (411, 1625, 'k5', 1.25), (412, 541, 'k18', 1.5), (413, 2458, 'k31', 1.75), (414, 1374, 'k44', 2.0), (415, 290, 'k57', 2.25), (416, 2207, 'k70', 2.5), (417, 1123, 'k83', 2.75), (418, 39, 'k96', 3.0), (419, 1956, 'k109', 3.25), (420, 872, 'k122', 3.5), (421, 2789, 'k135', 3.75), (422, 1705, 'k148', 4.0), (423, 621, 'k4', 4.25), (424, 2538, 'k17', 4.5), (425, 1454, 'k30', 4.75), (426, 370, 'k43', 5.0), (427, 2287, 'k56', 5.25), (428, 1203, 'k69', 5.5), (429, 119, 'k82', 5.75), (430, 2036, 'k95', 6.0), (431, 952, 'k108', 6.25), (432, 2869, 'k121', 6.5), (433, 1785, 'k134', 6.75), (434, 701, 'k147', 7.0), (435, 2618, 'k3', 0.0), (436, 1534, 'k16', 0.25), (437, 450, 'k29', 0.5), (438, 2367, 'k42', 0.75), (439, 1283, 'k55', 1.0), (440, 199, 'k68', 1.25), (441, 2116, 'k81', 1.5), (442, 1032, 'k94', 1.75), (443, 2949, 'k107', 2.0), (444, 1865, 'k120', 2.25), (445, 781, 'k133', 2.5), (446, 2698, 'k146', 2.75), (447, 1614, 'k2', 3.0), (448, 530, 'k15', 3.25), (449, 2447, 'k28', 3.5), (450, 1363, 'k41', 3.75), (451, 279, 'k54', 4.0), (452, 2196, 'k67', 4.25), (453, 1112, 'k80', 4.5), (454, 28, 'k93', 4.75), (455, 1945, 'k106', 5.0), (456, 861, 'k119', 5.25), (457, 2778, 'k132', 5.5), (458, 1694, 'k145', 5.75), (459, 610, 'k1', 6.0), (460, 2527, 'k14', 6.25), (461, 1443, 'k27', 6.5), (462, 359, 'k40', 6.75), (463, 2276, 'k53', 7.0), (464, 1192, 'k66', 0.0), (465, 108, 'k79', 0.25), (466, 2025, 'k92', 0.5), (467, 941, 'k105', 0.75), (468, 2858, 'k118', 1.0), (469, 1774, 'k131', 1.25), (470, 690, 'k144', 1.5), (471, 2607, 'k0', 1.75), (472, 1523, 'k13', 2.0), (473, 439, 'k26', 2.25), (474, 2356, 'k39', 2.5), (475, 1272, 'k52', 2.75), (476, 188, 'k65', 3.0), (477, 2105, 'k78', 3.25), (478, 1021, 'k91', 3.5), (479, 2938, 'k104', 3.75), (480, 1854, 'k117', 4.0), (481, 770, 'k130', 4.25), (482, 2687, 'k143', 4.5), (483, 1603, 'k156', 4.75), (484, 519, 'k12', 5.0), (485, 2436, 'k25', 5.25), (486, 1352, 'k38', 5.5), (487, 268, 'k51', 5.75), (488, 2185, 'k64', 6.0), (489, 1101, 'k77', 6.25), (490, 17, 'k90', 6.5), (491, 1934, 'k103', 6.75), (492, 850, 'k116', 7.0), (493, 2767, 'k129', 0.0), (494, 1683, 'k142', 0.25), (495, 599, 'k155', 0.5), (496, 2516, 'k11', 0.75), (497, 1432, 'k24', 1.0), (498, 348, 'k37', 1.25), (499, 2265, 'k50', 1.5), (500, 1181, 'k63', 1.75), (501, 97, 'k76', 2.0), (502, 2014, 'k89', 2.25), (503, 930, 'k102', 2.5), (504, 2847, 'k115', 2.75), (505, 1763, 'k128', 3.0), (506, 679, 'k141', 3.25), (507, 2596, 'k154', 3.5), (508, 1512, 'k10', 3.75), (509, 428, 'k23', 4.0), (510, 2345, 'k36', 4.25), (511, 1261, 'k49', 4.5), (512, 177, 'k62', 4.75), (513, 2094, 'k75', 5.0), (514, 1010, 'k88', 5.25), (515, 2927, 'k101', 5.5), (516, 1843, 'k114', 5.75), (517, 759, 'k127', 6.0), (518, 2676, 'k140', 6.25), (519, 1592, 'k153', 6.5), (520, 508, 'k9', 6.75), (521, 2425, 'k22', 7.0), (522, 1341, 'k35', 0.0), (523, 257, 'k48', 0.25), (524, 2174, 'k61', 0.5), (525, 1090, 'k74', 0.75), (526, 6, 'k87', 1.0), (527, 1923, 'k100', 1.25), (528, 839, 'k113', 1.5), (529, 2756, 'k126', 1.75), (530, 1672, 'k139', 2.0), (531, 588, 'k152', 2.25), (532, 2505, 'k8', 2.5), (533, 1421, 'k21', 2.75), (534, 337, 'k34', 3.0), (535, 2254, 'k47', 3.25), (536, 1170, 'k60', 3.5), (537, 86, 'k73', 3.75), (538, 2003, 'k86', 4.0), (539, 919, 'k99', 4.25), (540, 2836, 'k112', 4.5), (541, 1752, 'k125', 4.75), (542, 668, 'k138', 5.0), (543, 2585, 'k151', 5.25), (544, 1501, 'k7', 5.5), (545, 417, 'k20', 5.75), (546, 2334, 'k33', 6.0), (547, 1250, 'k46', 6.25), (548, 166, 'k59', 6.5), (549, 2083, 'k72', 6.75), (550, 999, 'k85', 7.0), (551, 2916, 'k98', 0.0), (552, 1832, 'k111', 0.25), (553, 748, 'k124', 0.5), (554, 2665, 'k137', 0.75), (555, 1581, 'k150', 1.0), (556, 497, 'k6', 1.25), (557, 2414, 'k19', 1.5), (558, 1330, 'k32', 1.75), (559, 246, 'k45', 2.0), (560, 2163, 'k58', 2.25), (561, 1079, 'k71', 2.5), (562, 2996, 'k84', 2.75), (563, 1912, 'k97', 3.0), (564, 828, 'k110', 3.25), (565, 2745, 'k123', 3.5), (566, 1661, 'k136', 3.75), (567, 577, 'k149', 4.0), (568, 2494, 'k5', 4.25), (569, 1410, 'k18', 4.5), (570, 326, 'k31', 4.75), (571, 2243, 'k44', 5.0), (572, 1159, 'k57', 5.25), (573, 75, 'k70', 5.5), (574, 1992, 'k83', 5.75), (575, 908, 'k96', 6.0), (576, 2825, 'k109', 6.25), (577, 1741, 'k122', 6.5), (578, 657, 'k135', 6.75), (579, 2574, 'k148', 7.0), (580, 1490, 'k4', 0.0), (581, 406, 'k17', 0.25), (582, 2323, 'k30', 0.5), (583, 1239, 'k43', 0.75), (584, 155, 'k56', 1.0), (585, 2072, 'k69', 1.25), (586, 988, 'k82', 1.5), (587, 2905, 'k95', 1.75), (588, 1821, 'k108', 2.0), (589, 737, 'k121', 2.25), (590, 2654, 'k134', 2.5), (591, 1570, 'k147', 2.75), (592, 486, 'k3', 3.0), (593, 2403, 'k16', 3.25), (594, 1319, 'k29', 3.5), (595, 235, 'k42', 3.75), (596, 2152, 'k55', 4.0), (597, 1068, 'k68', 4.25), (598, 2985, 'k81', 4.5), (599, 1901, 'k94', 4.75), (600, 817, 'k107', 5.0), (601, 2734, 'k120', 5.25), (602, 1650, 'k133', 5.5), (603, 566, 'k146', 5.75), (604, 2483, 'k2', 6.0), (605, 1399, 'k15', 6.25), (606, 315, 'k28', 6.5), (607, 2232, 'k41', 6.75), (608, 1148, 'k54', 7.0), (609, 64, 'k67', 0.0), (610, 1981, 'k80', 0.25), (611, 897, 'k93', 0.5), (612, 2814, 'k106', 0.75), (613, 1730, 'k119', 1.0), (614, 646, 'k132', 1.25), (615, 2563, 'k145', 1.5), (616, 1479, 'k1', 1.75), (617, 395, 'k14', 2.0), (618, 2312, 'k27', 2.25), (619, 1228, 'k40', 2.5), (620, 144, 'k53', 2.75), (621, 2061, 'k66', 3.0), (622, 977, 'k79', 3.25), (623, 2894, 'k92', 3.5), (624, 1810, 'k105', 3.75), (625, 726, 'k118', 4.0), (626, 2643, 'k131', 4.25), (627, 1559, 'k144', 4.5), (628, 475, 'k0', 4.75), (629, 2392, 'k13', 5.0), (630, 1308, 'k26', 5.25), (631, 224, 'k39', 5.5), (632, 2141, 'k52', 5.75), (633, 1057, 'k65', 6.0), (634, 2974, 'k78', 6.25), (635, 1890, 'k91', 6.5), (636, 806, 'k104', 6.75), (637, 2723, 'k117', 7.0), (638, 1639, 'k130', 0.0), (639, 555, 'k143', 0.25), (640, 2472, 'k156', 0.5), (641, 1388, 'k12', 0.75), (642, 304, 'k25', 1.0), (643, 2221, 'k38', 1.25), (644, 1137, 'k51', 1.5), (645, 53, 'k64', 1.75), (646, 1970, 'k77', 2.0), (647, 886, 'k90', 2.25), (648, 2803, 'k103', 2.5), (649, 1719, 'k116', 2.75), (650, 635, 'k129', 3.0), (651, 2552, 'k142', 3.25), (652, 1468, 'k155', 3.5), (653, 384, 'k11', 3.75), (654, 2301, 'k24', 4.0), (655, 1217, 'k37', 4.25), (656, 133, 'k50', 4.5), (657, 2050, 'k63', 4.75), (658, 966, 'k76', 5.0), (659, 2883, 'k89', 5.25), (660, 1799, 'k102', 5.5), (661, 715, 'k115', 5.75), (662, 2632, 'k128', 6.0), (663, 1548, 'k141', 6.25), (664, 464, 'k154', 6.5), (665, 2381, 'k10', 6.75), (666, 1297, 'k23', 7.0), (667, 213, 'k36', 0.0), (668, 2130, 'k49', 0.25), (669, 1046, 'k62', 0.5), (670, 2963, 'k75', 0.75), (671, 1879, 'k88', 1.0), (672, 795, 'k101', 1.25), (673, 2712, 'k114', 1.5), (674, 1628, 'k127', 1.75), (675, 544, 'k140', 2.0), (676, 2461, 'k153', 2.25), (677, 1377, 'k9', 2.5), (678, 293, 'k22', 2.75), (679, 2210, 'k35', 3.0), (680, 1126, 'k48', 3.25), (681, 42, 'k61', 3.5), (682, 1959, 'k74', 3.75), (683, 875, 'k87', 4.0), (684, 2792, 'k100', 4.25), (685, 1708, 'k113', 4.5), (686, 624, 'k126', 4.75), (687, 2541, 'k139', 5.0), (688, 1457, 'k152', 5.25), (689, 373, 'k8', 5.5), (690, 2290, 'k21', 5.75), (691, 1206, 'k34', 6.0), (692, 122, 'k47', 6.25), (693, 2039, 'k60', 6.5), (694, 955, 'k73', 6.75), (695, 2872, 'k86', 7.0), (696, 1788, 'k99', 0.0), (697, 704, 'k112', 0.25), (698, 2621, 'k125', 0.5), (699, 1537, 'k138', 0.75), (700, 453, 'k151', 1.0), (701, 2370, 'k7', 1.25), (702, 1286, 'k20', 1.5), (703, 202, 'k33', 1.75), (704, 2119, 'k46', 2.0), (705, 1035, 'k59', 2.25), (706, 2952, 'k72', 2.5), (707, 1868, 'k85', 2.75), (708, 784, 'k98', 3.0), (709, 2701, 'k111', 3.25), (710, 1617, 'k124', 3.5), (711, 533, 'k137', 3.75), (712, 2450, 'k150', 4.0), (713, 1366, 'k6', 4.25), (714, 282, 'k19', 4.5), (715, 2199, 'k32', 4.75), (716, 1115, 'k45', 5.0), (717, 31, 'k58', 5.25), (718, 1948, 'k71', 5.5), (719, 864, 'k84', 5.75), (720, 2781, 'k97', 6.0), (721, 1697, 'k110', 6.25), (722, 613, 'k123', 6.5), (723, 2530, 'k136', 6.75), (724, 1446, 'k149', 7.0), (725, 362, 'k5', 0.0), (726, 2279, 'k18', 0.25), (727, 1195, 'k31', 0.5), (728, 111, 'k44', 0.75), (729, 2028, 'k57', 1.0), (730, 944, 'k70', 1.25), (731, 2861, 'k83', 1.5), (732, 1777, 'k96', 1.75), (733, 693, 'k109', 2.0), (734, 2610, 'k122', 2.25), (735, 1526, 'k135', 2.5), (736, 442, 'k148', 2.75), (737, 2359, 'k4', 3.0), (738, 1275, 'k17', 3.25), (739, 191, 'k30', 3.5), (740, 2108, 'k43', 3.75), (741, 1024, 'k56', 4.0), (742, 2941, 'k69', 4.25), (743, 1857, 'k82', 4.5), (744, 773, 'k95', 4.75), (745, 2690, 'k108', 5.0), (746, 1606, 'k121', 5.25), (747, 522, 'k134', 5.5), (748, 2439, 'k147', 5.75), (749, 1355, 'k3', 6.0), (750, 271, 'k16', 6.25), (751, 2188, 'k29', 6.5), (752, 1104, 'k42', 6.75), (753, 20, 'k55', 7.0), (754, 1937, 'k68', 0.0), (755, 853, 'k81', 0.25), (756, 2770, 'k94', 0.5), (757, 1686, 'k107', 0.75), (758, 602, 'k120', 1.0), (759, 2519, 'k133', 1.25), (760, 1435, 'k146', 1.5), (761, 351, 'k2', 1.75), (762, 2268, 'k15', 2.0), (763, 1184, 'k28', 2.25), (764, 100, 'k41', 2.5), (765, 2017, 'k54', 2.75), (766, 933, 'k67', 3.0), (767, 2850, 'k80', 3.25), (768, 1766, 'k93', 3.5), (769, 682, 'k106', 3.75), (770, 2599, 'k119', 4.0), (771, 1515, 'k132', 4.25), (772, 431, 'k145', 4.5), (773, 2348, 'k1', 4.75), (774, 1264, 'k14', 5.0), (775, 180, 'k27', 5.25), (776, 2097, 'k40', 5.5), (777, 1013, 'k53', 5.75), (778, 2930, 'k66', 6.0), (779, 1846, 'k79', 6.25), (780, 762, 'k92', 6.5), (781, 2679, 'k105', 6.75), (782, 1595, 'k118', 7.0), (783, 511, 'k131', 0.0), (784, 2428, 'k144', 0.25), (785, 1344, 'k0', 0.5), (786, 260, 'k13', 0.75), (787, 2177, 'k26', 1.0), (788, 1093, 'k39', 1.25), (789, 9, 'k52', 1.5), (790, 1926, 'k65', 1.75), (791, 842, 'k78', 2.0), (792, 2759, 'k91', 2.25), (793, 1675, 'k104', 2.5), (794, 591, 'k117', 2.75), (795, 2508, 'k130', 3.0), (796, 1424, 'k143', 3.25), (797, 340, 'k156', 3.5), (798, 2257, 'k12', 3.75), (799, 1173, 'k25', 4.0), (800, 89, 'k38', 4.25), (801, 2006, 'k51', 4.5), (802, 922, 'k64', 4.75), (803, 2839, 'k77', 5.0), (804, 1755, 'k90', 5.25), (805, 671, 'k103', 5.5), (806, 2588, 'k116', 5.75), (807, 1504, 'k129', 6.0), (808, 420, 'k142', 6.25), (809, 2337, 'k155', 6.5), (810, 1253, 'k11', 6.75), (811, 169, 'k24', 7.0), (812, 2086, 'k37', 0.0), (813, 1002, 'k50', 0.25), (814, 2919, 'k63', 0.5), (815, 1835, 'k76', 0.75), (816, 751, 'k89', 1.0), (817, 2668, 'k102', 1.25), (818, 1584, 'k115', 1.5), (819, 500, 'k128', 1.75), (820, 2417, 'k141', 2.0), (821, 1333, 'k154', 2.25), (822, 249, 'k10', 2.5), (823, 2166, 'k23', 2.75), (824, 1082, 'k36', 3.0), (825, 2999, 'k49', 3.25), (826, 1915, 'k62', 3.5), (827, 831, 'k75', 3.75), (828, 2748, 'k88', 4.0), (829, 1664, 'k101', 4.25), (830, 580, 'k114', 4.5), (831, 2497, 'k127', 4.75), (832, 1413, 'k140', 5.0), (833, 329, 'k153', 5.25), (834, 2246, 'k9', 5.5), (835, 1162, 'k22', 5.75), (836, 78, 'k35', 6.0), (837, 1995, 'k48', 6.25), (838, 911, 'k61', 6.5), (839, 2828, 'k74', 6.75), (840, 1744, 'k87', 7.0), (841, 660, 'k100', 0.0), (842, 2577, 'k113', 0.25), (843, 1493, 'k126', 0.5), (844, 409, 'k139', 0.75), (845, 2326, 'k152', 1.0), (846, 1242, 'k8', 1.25), (847, 158, 'k21', 1.5), (848, 2075, 'k34', 1.75), (849, 991, 'k47', 2.0), (850, 2908, 'k60', 2.25), (851, 1824, 'k73', 2.5), (852, 740, 'k86', 2.75), (853, 2657, 'k99', 3.0), (854, 1573, 'k112', 3.25), (855, 489, 'k125', 3.5), (856, 2406, 'k138', 3.75), (857, 1322, 'k151', 4.0), (858, 238, 'k7', 4.25), (859, 2155, 'k20', 4.5), (860, 1071, 'k33', 4.75), (861, 2988, 'k46', 5.0), (862, 1904, 'k59', 5.25), (863, 820, 'k72', 5.5), (864, 2737, 'k85', 5.75), (865, 1653, 'k98', 6.0), (866, 569, 'k111', 6.25), (867, 2486, 'k124', 6.5), (868, 1402, 'k137', 6.75), (869, 318, 'k150', 7.0), (870, 2235, 'k6', 0.0), (871, 1151, 'k19', 0.25), (872, 67, 'k32', 0.5), (873, 1984, 'k45', 0.75), (874, 900, 'k58', 1.0), (875, 2817, 'k71', 1.25), (876, 1733, 'k84', 1.5), (877, 649, 'k97', 1.75), (878, 2566, 'k110', 2.0), (879, 1482, 'k123', 2.25), (880, 398, 'k136', 2.5), (881, 2315, 'k149', 2.75), (882, 1231, 'k5', 3.0), (883, 147, 'k18', 3.25), (884, 2064, 'k31', 3.5), (885, 980, 'k44', 3.75), (886, 2897, 'k57', 4.0), (887, 1813, 'k70', 4.25), (888, 729, 'k83', 4.5), (889, 2646, 'k96', 4.75), (890, 1562, 'k109', 5.0), (891, 478, 'k122', 5.25), (892, 2395, 'k135', 5.5), (893, 1311, 'k148', 5.75), (894, 227, 'k4', 6.0), (895, 2144, 'k17', 6.25), (896, 1060, 'k30', 6.5), (897, 2977, 'k43', 6.75), (898, 1893, 'k56', 7.0), (899, 809, 'k69', 0.0), (900, 2726, 'k82', 0.25), (901, 1642, 'k95', 0.5), (902, 558, 'k108', 0.75), (903, 2475, 'k121', 1.0), (904, 1391, 'k134', 1.25), (905, 307, 'k147', 1.5), (906, 2224, 'k3', 1.75), (907, 1140, 'k16', 2.0), (908, 56, 'k29', 2.25), (909, 1973, 'k42', 2.5), (910, 889, 'k55', 2.75), (911, 2806, 'k68', 3.0), (912, 1722, 'k81', 3.25), (913, 638, 'k94', 3.5), (914, 2555, 'k107', 3.75), (915, 1471, 'k120', 4.0), (916, 387, 'k133', 4.25), (917, 2304, 'k146', 4.5), (918, 1220, 'k2', 4.75), (919, 136, 'k15', 5.0), (920, 2053, 'k28', 5.25), (921, 969, 'k41', 5.5), (922, 2886, 'k54', 5.75), (923, 1802, 'k67', 6.0), (924, 718, 'k80', 6.25), (925, 2635, 'k93', 6.5), (926, 1551, 'k106', 6.75), (927, 467, 'k119', 7.0), (928, 2384, 'k132', 0.0), (929, 1300, 'k145', 0.25), (930, 216, 'k1', 0.5), (931, 2133, 'k14', 0.75), (932, 1049, 'k27', 1.0), (933, 2966, 'k40', 1.25), (934, 1882, 'k53', 1.5), (935, 798, 'k66', 1.75), (936, 2715, 'k79', 2.0), (937, 1631, 'k92', 2.25), (938, 547, 'k105', 2.5), (939, 2464, 'k118', 2.75), (940, 1380, 'k131', 3.0), (941, 296, 'k144', 3.25), (942, 2213, 'k0', 3.5), (943, 1129, 'k13', 3.75), (944, 45, 'k26', 4.0), (945, 1962, 'k39', 4.25), (946, 878, 'k52', 4.5), (947, 2795, 'k65', 4.75), (948, 1711, 'k78', 5.0), (949, 627, 'k91', 5.25), (950, 2544, 'k104', 5.5), (951, 1460, 'k117', 5.75), (952, 376, 'k130', 6.0), (953, 2293, 'k143', 6.25), (954, 1209, 'k156', 6.5), (955, 125, 'k12', 6.75), (956, 2042, 'k25', 7.0), (957, 958, 'k38', 0.0), (958, 2875, 'k51', 0.25), (959, 1791, 'k64', 0.5), (960, 707, 'k77', 0.75), (961, 2624, 'k90', 1.0), (962, 1540, 'k103', 1.25), (963, 456, 'k116', 1.5), (964, 2373, 'k129', 1.75), (965, 1289, 'k142', 2.0), (966, 205, 'k155', 2.25), (967, 2122, 'k11', 2.5), (968, 1038, 'k24', 2.75), (969, 2955, 'k37', 3.0), (970, 1871, 'k50', 3.25), (971, 787, 'k63', 3.5), (972, 2704, 'k76', 3.75), (973, 1620, 'k89', 4.0), (974, 536, 'k102', 4.25), (975, 2453, 'k115', 4.5), (976, 1369, 'k128', 4.75), (977, 285, 'k141', 5.0), (978, 2202, 'k154', 5.25), (979, 1118, 'k10', 5.5), (980, 34, 'k23', 5.75), (981, 1951, 'k36', 6.0), (982, 867, 'k49', 6.25), (983, 2784, 'k62', 6.5), (984, 1700, 'k75', 6.75), (985, 616, 'k88', 7.0), (986, 2533, 'k101', 0.0), (987, 1449, 'k114', 0.25), (988, 365, 'k127', 0.5), (989, 2282, 'k140', 0.75), (990, 1198, 'k153', 1.0), (991, 114, 'k9', 1.25), (992, 2031, 'k22', 1.5), (993, 947, 'k35', 1.75), (994, 2864, 'k48', 2.0), (995, 1780, 'k61', 2.25), (996, 696, 'k74', 2.5), (997, 2613, 'k87', 2.75), (998, 1529, 'k100', 3.0), (999, 445, 'k113', 3.25), (1000, 2362, 'k126', 3.5), (1001, 1278, 'k139', 3.75), (1002, 194, 'k152', 4.0), (1003, 2111, 'k8', 4.25), (1004, 1027, 'k21', 4.5), (1005, 2944, 'k34', 4.75), (1006, 1860, 'k47', 5.0), (1007, 776, 'k60', 5.25), (1008, 2693, 'k73', 5.5), (1009, 1609, 'k86', 5.75), (1010, 525, 'k99', 6.0), (1011, 2442, 'k112', 6.25), (1012, 1358, 'k125', 6.5), (1013, 274, 'k138', 6.75), (1014, 2191, 'k151', 7.0), (1015, 1107, 'k7', 0.0), (1016, 23, 'k20', 0.25), (1017, 1940, 'k33', 0.5), (1018, 856, 'k46', 0.75), (1019, 2773, 'k59', 1.0), (1020, 1689, 'k72', 1.25), (1021, 605, 'k85', 1.5), (1022, 2522, 'k98', 1.75), (1023, 1438, 'k111', 2.0), (1024, 354, 'k124', 2.25), (1025, 2271, 'k137', 2.5), (1026, 1187, 'k150', 2.75), (1027, 103, 'k6', 3.0), (1028, 2020, 'k19', 3.25), (1029, 936, 'k32', 3.5), (1030, 2853, 'k45', 3.75), (1031, 1769, 'k58', 4.0), (1032, 685, 'k71', 4.25), (1033, 2602, 'k84', 4.5), (1034, 1518, 'k97', 4.75), (1035, 434, 'k110', 5.0), (1036, 2351, 'k123', 5.25), (1037, 1267, 'k136', 5.5), (1038, 183, 'k149', 5.75), (1039, 2100, 'k5', 6.0), (1040, 1016, 'k18', 6.25), (1041, 2933, 'k31', 6.5), (1042, 1849, 'k44', 6.75), (1043, 765, 'k57', 7.0), (1044, 2682, 'k70', 0.0), (1045, 1598, 'k83', 0.25), (1046, 514, 'k96', 0.5), (1047, 2431, 'k109', 0.75), (1048, 1347, 'k122', 1.0), (1049, 263, 'k135', 1.25), (1050, 2180, 'k148', 1.5), (1051, 1096, 'k4', 1.75), (1052, 12, 'k17', 2.0), (1053, 1929, 'k30', 2.25), (1054, 845, 'k43', 2.5), (1055, 2762, 'k56', 2.75), (1056, 1678, 'k69', 3.0), (1057, 594, 'k82', 3.25), (1058, 2511, 'k95', 3.5), (1059, 1427, 'k108', 3.75), (1060, 343, 'k121', 4.0), (1061, 2260, 'k134', 4.25), (1062, 1176, 'k147', 4.5), (1063, 92, 'k3', 4.75), (1064, 2009, 'k16', 5.0), (1065, 925, 'k29', 5.25), (1066, 2842, 'k42', 5.5), (1067, 1758, 'k55', 5.75), (1068, 674, 'k68', 6.0), (1069, 2591, 'k81', 6.25), (1070, 1507, 'k94', 6.5), (1071, 423, 'k107', 6.75), (1072, 2340, 'k120', 7.0), (1073, 1256, 'k133', 0.0), (1074, 172, 'k146', 0.25), (1075, 2089, 'k2', 0.5), (1076, 1005, 'k15', 0.75), (1077, 2922, 'k28', 1.0), (1078, 1838, 'k41', 1.25), (1079, 754, 'k54', 1.5), (1080, 2671, 'k67', 1.75), (1081, 1587, 'k80', 2.0), (1082, 503, 'k93', 2.25), (1083, 2420, 'k106', 2.5), (1084, 1336, 'k119', 2.75), (1085, 252, 'k132', 3.0), (1086, 2169, 'k145', 3.25), (1087, 1085, 'k1', 3.5), (1088, 1, 'k14', 3.75), (1089, 1918, 'k27', 4.0), (1090, 834, 'k40', 4.25), (1091, 2751, 'k53', 4.5), (1092, 1667, 'k66', 4.75), (1093, 583, 'k79', 5.0), (1094, 2500, 'k92', 5.25), (1095, 1416, 'k105', 5.5), (1096, 332, 'k118', 5.75), (1097, 2249, 'k131', 6.0), (1098, 1165, 'k144', 6.25), (1099, 81, 'k0', 6.5), (1100, 1998, 'k13', 6.75), (1101, 914, 'k26', 7.0), (1102, 2831, 'k39', 0.0), (1103, 1747, 'k52', 0.25), (1104, 663, 'k65', 0.5), (1105, 2580, 'k78', 0.75), (1106, 1496, 'k91', 1.0), (1107, 412, 'k104', 1.25), (1108, 2329, 'k117', 1.5), (1109, 1245, 'k130', 1.75), (1110, 161, 'k143', 2.0), (1111, 2078, 'k156', 2.25), (1112, 994, 'k12', 2.5), (1113, 2911, 'k25', 2.75), (1114, 1827, 'k38', 3.0), (1115, 743, 'k51', 3.25), (1116, 2660, 'k64', 3.5), (1117, 1576, 'k77', 3.75), (1118, 492, 'k90', 4.0), (1119, 2409, 'k103', 4.25), (1120, 1325, 'k116', 4.5), (1121, 241, 'k129', 4.75), (1122, 2158, 'k142', 5.0), (1123, 1074, 'k155', 5.25), (1124, 2991, 'k11', 5.5), (1125, 1907, 'k24', 5.75), (1126, 823, 'k37', 6.0), (1127, 2740, 'k50', 6.25), (1128, 1656, 'k63', 6.5), (1129, 572, 'k76', 6.75), (1130, 2489, 'k89', 7.0), (1131, 1405, 'k102', 0.0), (1132, 321, 'k115', 0.25), (1133, 2238, 'k128', 0.5), (1134, 1154, 'k141', 0.75), (1135, 70, 'k154', 1.0), (1136, 1987, 'k10', 1.25), (1137, 903, 'k23', 1.5), (1138, 2820, 'k36', 1.75), (1139, 1736, 'k49', 2.0), (1140, 652, 'k62', 2.25), (1141, 2569, 'k75', 2.5), (1142, 1485, 'k88', 2.75), (1143, 401, 'k101', 3.0), (1144, 2318, 'k114', 3.25), (1145, 1234, 'k127', 3.5), (1146, 150, 'k140', 3.75), (1147, 2067, 'k153', 4.0), (1148, 983, 'k9', 4.25), (1149, 2900, 'k22', 4.5), (1150, 1816, 'k35', 4.75), (1151, 732, 'k48', 5.0), (1152, 2649, 'k61', 5.25), (1153, 1565, 'k74', 5.5), (1154, 481, 'k87', 5.75), (1155, 2398, 'k100', 6.0), (1156, 1314, 'k113', 6.25), (1157, 230, 'k126', 6.5), (1158, 2147, 'k139', 6.75), (1159, 1063, 'k152', 7.0), (1160, 2980, 'k8', 0.0), (1161, 1896, 'k21', 0.25), (1162, 812, 'k34', 0.5), (1163, 2729, 'k47', 0.75), (1164, 1645, 'k60', 1.0), (1165, 561, 'k73', 1.25), (1166, 2478, 'k86', 1.5), (1167, 1394, 'k99', 1.75), (1168, 310, 'k112', 2.0), (1169, 2227, 'k125', 2.25), (1170, 1143, 'k138', 2.5), (1171, 59, 'k151', 2.75), (1172, 1976, 'k7', 3.0), (1173, 892, 'k20', 3.25), (1174, 2809, 'k33', 3.5), (1175, 1725, 'k46', 3.75), (1176, 641, 'k59', 4.0), (1177, 2558, 'k72', 4.25), (1178, 1474, 'k85', 4.5), (1179, 390, 'k98', 4.75), (1180, 2307, 'k111', 5.0), (1181, 1223, 'k124', 5.25), (1182, 139, 'k137', 5.5), (1183, 2056, 'k150', 5.75), (1184, 972, 'k6', 6.0), (1185, 2889, 'k19', 6.25), (1186, 1805, 'k32', 6.5), (1187, 721, 'k45', 6.75), (1188, 2638, 'k58', 7.0), (1189, 1554, 'k71', 0.0), (1190, 470, 'k84', 0.25), (1191, 2387, 'k97', 0.5), (1192, 1303, 'k110', 0.75), (1193, 219, 'k123', 1.0), (1194, 2136, 'k136', 1.25), (1195, 1052, 'k149', 1.5), (1196, 2969, 'k5', 1.75), (1197, 1885, 'k18', 2.0), (1198, 801, 'k31', 2.25), (1199, 2718, 'k44', 2.5), (1200, 1634, 'k57', 2.75), (1201, 550, 'k70', 3.0), (1202, 2467, 'k83', 3.25), (1203, 1383, 'k96', 3.5), (1204, 299, 'k109', 3.75), (1205, 2216, 'k122', 4.0), (1206, 1132, 'k135', 4.25), (1207, 48, 'k148', 4.5), (1208, 1965, 'k4', 4.75), (1209, 881, 'k17', 5.0), (1210, 2798, 'k30', 5.25), (1211, 1714, 'k43', 5.5), (1212, 630, 'k56', 5.75), (1213, 2547, 'k69', 6.0), (1214, 1463, 'k82', 6.25), (1215, 379, 'k95', 6.5), (1216, 2296, 'k108', 6.75), (1217, 1212, 'k121', 7.0), (1218, 128, 'k134', 0.0), (1219, 2045, 'k147', 0.25), (1220, 961, 'k3', 0.5), (1221, 2878, 'k16', 0.75), (1222, 1794, 'k29', 1.0), (1223, 710, 'k42', 1.25), (1224, 2627, 'k55', 1.5), (1225, 1543, 'k68', 1.75), (1226, 459, 'k81', 2.0), (1227, 2376, 'k94', 2.25), (1228, 1292, 'k107', 2.5), (1229, 208, 'k120', 2.75), (1230, 2125, 'k133', 3.0), (1231, 1041, 'k146', 3.25), (1232, 2958, 'k2', 3.5), (1233, 1874, 'k15', 3.75), (1234, 790, 'k28', 4.0), (1235, 2707, 'k41', 4.25), (1236, 1623, 'k54', 4.5), (1237, 539, 'k67', 4.75), (1238, 2456, 'k80', 5.0), (1239, 1372, 'k93', 5.25), (1240, 288, 'k106', 5.5), (1241, 2205, 'k119', 5.75), (1242, 1121, 'k132', 6.0), (1243, 37, 'k145', 6.25), (1244, 1954, 'k1', 6.5), (1245, 870, 'k14', 6.75), (1246, 2787, 'k27', 7.0), (1247, 1703, 'k40', 0.0), (1248, 619, 'k53', 0.25), (1249, 2536, 'k66', 0.5), (1250, 1452, 'k79', 0.75), (1251, 368, 'k92', 1.0), (1252, 2285, 'k105', 1.25), (1253, 1201, 'k118', 1.5), (1254, 117, 'k131', 1.75), (1255, 2034, 'k144', 2.0), (1256, 950, 'k0', 2.25), (1257, 2867, 'k13', 2.5), (1258, 1783, 'k26', 2.75), (1259, 699, 'k39', 3.0), (1260, 2616, 'k52', 3.25), (1261, 1532, 'k65', 3.5), (1262, 448, 'k78', 3.75), (1263, 2365, 'k91', 4.0), (1264, 1281, 'k104', 4.25), (1265, 197, 'k117', 4.5), (1266, 2114, 'k130', 4.75), (1267, 1030, 'k143', 5.0), (1268, 2947, 'k156', 5.25), (1269, 1863, 'k12', 5.5), (1270, 779, 'k25', 5.75), (1271, 2696, 'k38', 6.0), (1272, 1612, 'k51', 6.25), (1273, 528, 'k64', 6.5), (1274, 2445, 'k77', 6.75), (1275, 1361, 'k90', 7.0), (1276, 277, 'k103', 0.0), (1277, 2194, 'k116', 0.25), (1278, 1110, 'k129', 0.5), (1279, 26, 'k142', 0.75), (1280, 1943, 'k155', 1.0), (1281, 859, 'k11', 1.25), (1282, 2776, 'k24', 1.5), (1283, 1692, 'k37', 1.75), (1284, 608, 'k50', 2.0), (1285, 2525, 'k63', 2.25), (1286, 1441, 'k76', 2.5), (1287, 357, 'k89', 2.75), (1288, 2274, 'k102', 3.0), (1289, 1190, 'k115', 3.25), (1290, 106, 'k128', 3.5), (1291, 2023, 'k141', 3.75), (1292, 939, 'k154', 4.0), (1293, 2856, 'k10', 4.25), (1294, 1772, 'k23', 4.5), (1295, 688, 'k36', 4.75), (1296, 2605, 'k49', 5.0), (1297, 1521, 'k62', 5.25), (1298, 437, 'k75', 5.5), (1299, 2354, 'k88', 5.75), (1300, 1270, 'k101', 6.0), (1301, 186, 'k114', 6.25), (1302, 2103, 'k127', 6.5), (1303, 1019, 'k140', 6.75), (1304, 2936, 'k153', 7.0), (1305, 1852, 'k9', 0.0), (1306, 768, 'k22', 0.25), (1307, 2685, 'k35', 0.5), (1308, 1601, 'k48', 0.75), (1309, 517, 'k61', 1.0), (1310, 2434, 'k74', 1.25), (1311, 1350, 'k87', 1.5), (1312, 266, 'k100', 1.75), (1313, 2183, 'k113', 2.0), (1314, 1099, 'k126', 2.25), (1315, 15, 'k139', 2.5), (1316, 1932, 'k152', 2.75), (1317, 848, 'k8', 3.0), (1318, 2765, 'k21', 3.25), (1319, 1681, 'k34', 3.5), (1320, 597, 'k47', 3.75), (1321, 2514, 'k60', 4.0), (1322, 1430, 'k73', 4.25), (1323, 346, 'k86', 4.5), (1324, 2263, 'k99', 4.75), (1325, 1179, 'k112', 5.0), (1326, 95, 'k125', 5.25), (1327, 2012, 'k138', 5.5), (1328, 928, 'k151', 5.75), (1329, 2845, 'k7', 6.0), (1330, 1761, 'k20', 6.25), (1331, 677, 'k33', 6.5), (1332, 2594, 'k46', 6.75), (1333, 1510, 'k59', 7.0), (1334, 426, 'k72', 0.0), (1335, 2343, 'k85', 0.25), (1336, 1259, 'k98', 0.5), (1337, 175, 'k111', 0.75), (1338, 2092, 'k124', 1.0), (1339, 1008, 'k137', 1.25), (1340, 2925, 'k150', 1.5), (1341, 1841, 'k6', 1.75), (1342, 757, 'k19', 2.0), (1343, 2674, 'k32', 2.25), (1344, 1590, 'k45', 2.5), (1345, 506, 'k58', 2.75), (1346, 2423, 'k71', 3.0), (1347, 1339, 'k84', 3.25), (1348, 255, 'k97', 3.5), (1349, 2172, 'k110', 3.75), (1350, 1088, 'k123', 4.0), (1351, 4, 'k136', 4.25), (1352, 1921, 'k149', 4.5), (1353, 837, 'k5', 4.75), (1354, 2754, 'k18', 5.0), (1355, 1670, 'k31', 5.25), (1356, 586, 'k44', 5.5), (1357, 2503, 'k57', 5.75), (1358, 1419, 'k70', 6.0), (1359, 335, 'k83', 6.25), (1360, 2252, 'k96', 6.5), (1361, 1168, 'k109', 6.75), (1362, 84, 'k122', 7.0), (1363, 2001, 'k135', 0.0), (1364, 917, 'k148', 0.25), (1365, 2834, 'k4', 0.5), (1366, 1750, 'k17', 0.75), (1367, 666, 'k30', 1.0), (1368, 2583, 'k43', 1.25), (1369, 1499, 'k56', 1.5), (1370, 415, 'k69', 1.75), (1371, 2332, 'k82', 2.0), (1372, 1248, 'k95', 2.25), (1373, 164, 'k108', 2.5), (1374, 2081, 'k121', 2.75), (1375, 997, 'k134', 3.0), (1376, 2914, 'k147', 3.25), (1377, 1830, 'k3', 3.5), (1378, 746, 'k16', 3.75), (1379, 2663, 'k29', 4.0), (1380, 1579, 'k42', 4.25), (1381, 495, 'k55', 4.5), (1382, 2412, 'k68', 4.75), (1383, 1328, 'k81', 5.0), (1384, 244, 'k94', 5.25), (1385, 2161, 'k107', 5.5), (1386, 1077, 'k120', 5.75), (1387, 2994, 'k133', 6.0), (1388, 1910, 'k146', 6.25), (1389, 826, 'k2', 6.5), (1390, 2743, 'k15', 6.75), (1391, 1659, 'k28', 7.0), (1392, 575, 'k41', 0.0), (1393, 2492, 'k54', 0.25), (1394, 1408, 'k67', 0.5), (1395, 324, 'k80', 0.75), (1396, 2241, 'k93', 1.0), (1397, 1157, 'k106', 1.25), (1398, 73, 'k119', 1.5), (1399, 1990, 'k132', 1.75), (1400, 906, 'k145', 2.0), (1401, 2823, 'k1', 2.25), (1402, 1739, 'k14', 2.5), (1403, 655, 'k27', 2.75), (1404, 2572, 'k40', 3.0), (1405, 1488, 'k53', 3.25), (1406, 404, 'k66', 3.5), (1407, 2321, 'k79', 3.75), (1408, 1237, 'k92', 4.0), (1409, 153, 'k105', 4.25), (1410, 2070, 'k118', 4.5), (1411, 986, 'k131', 4.75), (1412, 2903, 'k144', 5.0), (1413, 1819, 'k0', 5.25), (1414, 735, 'k13', 5.5), (1415, 2652, 'k26', 5.75), (1416, 1568, 'k39', 6.0), (1417, 484, 'k52', 6.25), (1418, 2401, 'k65', 6.5), (1419, 1317, 'k78', 6.75), (1420, 233, 'k91', 7.0), (1421, 2150, 'k104', 0.0), (1422, 1066, 'k117', 0.25), (1423, 2983, 'k130', 0.5), (1424, 1899, 'k143', 0.75), (1425, 815, 'k156', 1.0), (1426, 2732, 'k12', 1.25), (1427, 1648, 'k25', 1.5), (1428, 564, 'k38', 1.75), (1429, 2481, 'k51', 2.0), (1430, 1397, 'k64', 2.25), (1431, 313, 'k77', 2.5), (1432, 2230, 'k90', 2.75), (1433, 1146, 'k103', 3.0), (1434, 62, 'k116', 3.25), (1435, 1979, 'k129', 3.5), (1436, 895, 'k142', 3.75), (1437, 2812, 'k155', 4.0), (1438, 1728, 'k11', 4.25), (1439, 644, 'k24', 4.5), (1440, 2561, 'k37', 4.75), (1441, 1477, 'k50', 5.0), (1442, 393, 'k63', 5.25), (1443, 2310, 'k76', 5.5), (1444, 1226, 'k89', 5.75), (1445, 142, 'k102', 6.0), (1446, 2059, 'k115', 6.25), (1447, 975, 'k128', 6.5), (1448, 2892, 'k141', 6.75), (1449, 1808, 'k154', 7.0), (1450, 724, 'k10', 0.0), (1451, 2641, 'k23', 0.25), (1452, 1557, 'k36', 0.5), (1453, 473, 'k49', 0.75), (1454, 2390, 'k62', 1.0), (1455, 1306, 'k75', 1.25), (1456, 222, 'k88', 1.5), (1457, 2139, 'k101', 1.75), (1458, 1055, 'k114', 2.0), (1459, 2972, 'k127', 2.25), (1460, 1888, 'k140', 2.5), (1461, 804, 'k153', 2.75), (1462, 2721, 'k9', 3.0), (1463, 1637, 'k22', 3.25), (1464, 553, 'k35', 3.5), (1465, 2470, 'k48', 3.75), (1466, 1386, 'k61', 4.0), (1467, 302, 'k74', 4.25), (1468, 2219, 'k87', 4.5), (1469, 1135, 'k100', 4.75), (1470, 51, 'k113', 5.0), (1471, 1968, 'k126', 5.25), (1472, 884, 'k139', 5.5), (1473, 2801, 'k152', 5.75), (1474, 1717, 'k8', 6.0), (1475, 633, 'k21', 6.25), (1476, 2550, 'k34', 6.5), (1477, 1466, 'k47', 6.75), (1478, 382, 'k60', 7.0), (1479, 2299, 'k73', 0.0), (1480, 1215, 'k86', 0.25), (1481, 131, 'k99', 0.5), (1482, 2048, 'k112', 0.75), (1483, 964, 'k125', 1.0), (1484, 2881, 'k138', 1.25), (1485, 1797, 'k151', 1.5), (1486, 713, 'k7', 1.75), (1487, 2630, 'k20', 2.0), (1488, 1546, 'k33', 2.25), (1489, 462, 'k46', 2.5), (1490, 2379, 'k59', 2.75), (1491, 1295, 'k72', 3.0), (1492, 211, 'k85', 3.25), (1493, 2128, 'k98', 3.5), (1494, 1044, 'k111', 3.75), (1495, 2961, 'k124', 4.0), (1496, 1877, 'k137', 4.25), (1497, 793, 'k150', 4.5), (1498, 2710, 'k6', 4.75), (1499, 1626, 'k19', 5.0), (1500, 542, 'k32', 5.25), (1501, 2459, 'k45', 5.5), (1502, 1375, 'k58', 5.75), (1503, 291, 'k71', 6.0), (1504, 2208, 'k84', 6.25), (1505, 1124, 'k97', 6.5), (1506, 40, 'k110', 6.75), (1507, 1957, 'k123', 7.0), (1508, 873, 'k136', 0.0), (1509, 2790, 'k149', 0.25), (1510, 1706, 'k5', 0.5), (1511, 622, 'k18', 0.75), (1512, 2539, 'k31', 1.0), (1513, 1455, 'k44', 1.25), (1514, 371, 'k57', 1.5), (1515, 2288, 'k70', 1.75), (1516, 1204, 'k83', 2.0), (1517, 120, 'k96', 2.25), (1518, 2037, 'k109', 2.5), (1519, 953, 'k122', 2.75), (1520, 2870, 'k135', 3.0), (1521, 1786, 'k148', 3.25), (1522, 702, 'k4', 3.5), (1523, 2619, 'k17', 3.75), (1524, 1535, 'k30', 4.0), (1525, 451, 'k43', 4.25), (1526, 2368, 'k56', 4.5), (1527, 1284, 'k69', 4.75), (1528, 200, 'k82', 5.0), (1529, 2117, 'k95', 5.25), (1530, 1033, 'k108', 5.5), (1531, 2950, 'k121', 5.75), (1532, 1866, 'k134', 6.0), (1533, 782, 'k147', 6.25), (1534, 2699, 'k3', 6.5), (1535, 1615, 'k16', 6.75), (1536, 531, 'k29', 7.0), (1537, 2448, 'k42', 0.0), (1538, 1364, 'k55', 0.25), (1539, 280, 'k68', 0.5), (1540, 2197, 'k81', 0.75), (1541, 1113, 'k94', 1.0), (1542, 29, 'k107', 1.25), (1543, 1946, 'k120', 1.5), (1544, 862, 'k133', 1.75), (1545, 2779, 'k146', 2.0), (1546, 1695, 'k2', 2.25), (1547, 611, 'k15', 2.5), (1548, 2528, 'k28', 2.75), (1549, 1444, 'k41', 3.0), (1550, 360, 'k54', 3.25), (1551, 2277, 'k67', 3.5), (1552, 1193, 'k80', 3.75), (1553, 109, 'k93', 4.0), (1554, 2026, 'k106', 4.25), (1555, 942, 'k119', 4.5), (1556, 2859, 'k132', 4.75), (1557, 1775, 'k145', 5.0), (1558, 691, 'k1', 5.25), (1559, 2608, 'k14', 5.5), (1560, 1524, 'k27', 5.75), (1561, 440, 'k40', 6.0), (1562, 2357, 'k53', 6.25), (1563, 1273, 'k66', 6.5), (1564, 189, 'k79', 6.75), (1565, 2106, 'k92', 7.0), (1566, 1022, 'k105', 0.0), (1567, 2939, 'k118', 0.25), (1568, 1855, 'k131', 0.5), (1569, 771, 'k144', 0.75), (1570, 2688, 'k0', 1.0), (1571, 1604, 'k13', 1.25), (1572, 520, 'k26', 1.5), (1573, 2437, 'k39', 1.75), (1574, 1353, 'k52', 2.0), (1575, 269, 'k65', 2.25), (1576, 2186, 'k78', 2.5), (1577, 1102, 'k91', 2.75), (1578, 18, 'k104', 3.0), (1579, 1935, 'k117', 3.25), (1580, 851, 'k130', 3.5), (1581, 2768, 'k143', 3.75), (1582, 1684, 'k156', 4.0), (1583, 600, 'k12', 4.25), (1584, 2517, 'k25', 4.5), (1585, 1433, 'k38', 4.75), (1586, 349, 'k51', 5.0), (1587, 2266, 'k64', 5.25), (1588, 1182, 'k77', 5.5), (1589, 98, 'k90', 5.75), (1590, 2015, 'k103', 6.0), (1591, 931, 'k116', 6.25), (1592, 2848, 'k129', 6.5), (1593, 1764, 'k142', 6.75), (1594, 680, 'k155', 7.0), (1595, 2597, 'k11', 0.0), (1596, 1513, 'k24', 0.25), (1597, 429, 'k37', 0.5), (1598, 2346, 'k50', 0.75), (1599, 1262, 'k63', 1.0), (1600, 178, 'k76', 1.25), (1601, 2095, 'k89', 1.5), (1602, 1011, 'k102', 1.75), (1603, 2928, 'k115', 2.0), (1604, 1844, 'k128', 2.25), (1605, 760, 'k141', 2.5), (1606, 2677, 'k154', 2.75), (1607, 1593, 'k10', 3.0), (1608, 509, 'k23', 3.25), (1609, 2426, 'k36', 3.5), (1610, 1342, 'k49', 3.75), (1611, 258, 'k62', 4.0), (1612, 2175, 'k75', 4.25), (1613, 1091, 'k88', 4.5), (1614, 7, 'k101', 4.75), (1615, 1924, 'k114', 5.0), (1616, 840, 'k127', 5.25), (1617, 2757, 'k140', 5.5), (1618, 1673, 'k153', 5.75), (1619, 589, 'k9', 6.0), (1620, 2506, 'k22', 6.25), (1621, 1422, 'k35', 6.5), (1622, 338, 'k48', 6.75), (1623, 2255, 'k61', 7.0), (1624, 1171, 'k74', 0.0), (1625, 87, 'k87', 0.25), (1626, 2004, 'k100', 0.5), (1627, 920, 'k113', 0.75), (1628, 2837, 'k126', 1.0), (1629, 1753, 'k139', 1.25), (1630, 669, 'k152', 1.5), (1631, 2586, 'k8', 1.75), (1632, 1502, 'k21', 2.0), (1633, 418, 'k34', 2.25), (1634, 2335, 'k47', 2.5), (1635, 1251, 'k60', 2.75), (1636, 167, 'k73', 3.0), (1637, 2084, 'k86', 3.25), (1638, 1000, 'k99', 3.5), (1639, 2917, 'k112', 3.75), (1640, 1833, 'k125', 4.0), (1641, 749, 'k138', 4.25), (1642, 2666, 'k151', 4.5), (1643, 1582, 'k7', 4.75), (1644, 498, 'k20', 5.0), (1645, 2415, 'k33', 5.25), (1646, 1331, 'k46', 5.5), (1647, 247, 'k59', 5.75), (1648, 2164, 'k72', 6.0), (1649, 1080, 'k85', 6.25), (1650, 2997, 'k98', 6.5), (1651, 1913, 'k111', 6.75), (1652, 829, 'k124', 7.0), (1653, 2746, 'k137', 0.0), (1654, 1662, 'k150', 0.25), (1655, 578, 'k6', 0.5), (1656, 2495, 'k19', 0.75), (1657, 1411, 'k32', 1.0), (1658, 327, 'k45', 1.25), (1659, 2244, 'k58', 1.5), (1660, 1160, 'k71', 1.75), (1661, 76, 'k84', 2.0), (1662, 1993, 'k97', 2.25), (1663, 909, 'k110', 2.5), (1664, 2826, 'k123', 2.75), (1665, 1742, 'k136', 3.0), (1666, 658, 'k149', 3.25), (1667, 2575, 'k5', 3.5), (1668, 1491, 'k18', 3.75), (1669, 407, 'k31', 4.0), (1670, 2324, 'k44', 4.25), (1671, 1240, 'k57', 4.5), (1672, 156, 'k70', 4.75), (1673, 2073, 'k83', 5.0), (1674, 989, 'k96', 5.25), (1675, 2906, 'k109', 5.5), (1676, 1822, 'k122', 5.75), (1677, 738, 'k135', 6.0), (1678, 2655, 'k148', 6.25), (1679, 1571, 'k4', 6.5), (1680, 487, 'k17', 6.75), (1681, 2404, 'k30', 7.0), (1682, 1320, 'k43', 0.0), (1683, 236, 'k56', 0.25), (1684, 2153, 'k69', 0.5), (1685, 1069, 'k82', 0.75), (1686, 2986, 'k95', 1.0), (1687, 1902, 'k108', 1.25), (1688, 818, 'k121', 1.5), (1689, 2735, 'k134', 1.75), (1690, 1651, 'k147', 2.0), (1691, 567, 'k3', 2.25), (1692, 2484, 'k16', 2.5), (1693, 1400, 'k29', 2.75), (1694, 316, 'k42', 3.0), (1695, 2233, 'k55', 3.25), (1696, 1149, 'k68', 3.5), (1697, 65, 'k81', 3.75), (1698, 1982, 'k94', 4.0), (1699, 898, 'k107', 4.25), (1700, 2815, 'k120', 4.5), (1701, 1731, 'k133', 4.75), (1702, 647, 'k146', 5.0), (1703, 2564, 'k2', 5.25), (1704, 1480, 'k15', 5.5), (1705, 396, 'k28', 5.75), (1706, 2313, 'k41', 6.0), (1707, 1229, 'k54', 6.25), (1708, 145, 'k67', 6.5), (1709, 2062, 'k80', 6.75), (1710, 978, 'k93', 7.0), (1711, 2895, 'k106', 0.0), (1712, 1811, 'k119', 0.25), (1713, 727, 'k132', 0.5), (1714, 2644, 'k145', 0.75), (1715, 1560, 'k1', 1.0), (1716, 476, 'k14', 1.25), (1717, 2393, 'k27', 1.5), (1718, 1309, 'k40', 1.75), (1719, 225, 'k53', 2.0), (1720, 2142, 'k66', 2.25), (1721, 1058, 'k79', 2.5), (1722, 2975, 'k92', 2.75), (1723, 1891, 'k105', 3.0), (1724, 807, 'k118', 3.25), (1725, 2724, 'k131', 3.5), (1726, 1640, 'k144', 3.75), (1727, 556, 'k0', 4.0), (1728, 2473, 'k13', 4.25), (1729, 1389, 'k26', 4.5), (1730, 305, 'k39', 4.75), (1731, 2222, 'k52', 5.0), (1732, 1138, 'k65', 5.25), (1733, 54, 'k78', 5.5), (1734, 1971, 'k91', 5.75), (1735, 887, 'k104', 6.0), (1736, 2804, 'k117', 6.25), (1737, 1720, 'k130', 6.5), (1738, 636, 'k143', 6.75), (1739, 2553, 'k156', 7.0), (1740, 1469, 'k12', 0.0), (1741, 385, 'k25', 0.25), (1742, 2302, 'k38', 0.5), (1743, 1218, 'k51', 0.75), (1744, 134, 'k64', 1.0), (1745, 2051, 'k77', 1.25), (1746, 967, 'k90', 1.5), (1747, 2884, 'k103', 1.75), (1748, 1800, 'k116', 2.0), (1749, 716, 'k129', 2.25), (1750, 2633, 'k142', 2.5), (1751, 1549, 'k155', 2.75), (1752, 465, 'k11', 3.0), (1753, 2382, 'k24', 3.25), (1754, 1298, 'k37', 3.5), (1755, 214, 'k50', 3.75), (1756, 2131, 'k63', 4.0), (1757, 1047, 'k76', 4.25), (1758, 2964, 'k89', 4.5), (1759, 1880, 'k102', 4.75), (1760, 796, 'k115', 5.0), (1761, 2713, 'k128', 5.25), (1762, 1629, 'k141', 5.5), (1763, 545, 'k154', 5.75), (1764, 2462, 'k10', 6.0), (1765, 1378, 'k23', 6.25), (1766, 294, 'k36', 6.5), (1767, 2211, 'k49', 6.75), (1768, 1127, 'k62', 7.0), (1769, 43, 'k75', 0.0), (1770, 1960, 'k88', 0.25), (1771, 876, 'k101', 0.5), (1772, 2793, 'k114', 0.75), (1773, 1709, 'k127', 1.0), (1774, 625, 'k140', 1.25), (1775, 2542, 'k153', 1.5), (1776, 1458, 'k9', 1.75), (1777, 374, 'k22', 2.0), (1778, 2291, 'k35', 2.25), (1779, 1207, 'k48', 2.5), (1780, 123, 'k61', 2.75), (1781, 2040, 'k74', 3.0), (1782, 956, 'k87', 3.25), (1783, 2873, 'k100', 3.5), (1784, 1789, 'k113', 3.75), (1785, 705, 'k126', 4.0), (1786, 2622, 'k139', 4.25), (1787, 1538, 'k152', 4.5), (1788, 454, 'k8', 4.75), (1789, 2371, 'k21', 5.0), (1790, 1287, 'k34', 5.25), (1791, 203, 'k47', 5.5), (1792, 2120, 'k60', 5.75), (1793, 1036, 'k73', 6.0), (1794, 2953, 'k86', 6.25), (1795, 1869, 'k99', 6.5), (1796, 785, 'k112', 6.75), (1797, 2702, 'k125', 7.0), (1798, 1618, 'k138', 0.0), (1799, 534, 'k151', 0.25), (1800, 2451, 'k7', 0.5), (1801, 1367, 'k20', 0.75), (1802, 283, 'k33', 1.0), (1803, 2200, 'k46', 1.25), (1804, 1116, 'k59', 1.5), (1805, 32, 'k72', 1.75), (1806, 1949, 'k85', 2.0), (1807, 865, 'k98', 2.25), (1808, 2782, 'k111', 2.5), (1809, 1698, 'k124', 2.75), (1810, 614, 'k137', 3.0), (1811, 2531, 'k150', 3.25), (1812, 1447, 'k6', 3.5), (1813, 363, 'k19', 3.75), (1814, 2280, 'k32', 4.0), (1815, 1196, 'k45', 4.25), (1816, 112, 'k58', 4.5), (1817, 2029, 'k71', 4.75), (1818, 945, 'k84', 5.0), (1819, 2862, 'k97', 5.25), (1820, 1778, 'k110', 5.5), (1821, 694, 'k123', 5.75), (1822, 2611, 'k136', 6.0), (1823, 1527, 'k149', 6.25), (1824, 443, 'k5', 6.5), (1825, 2360, 'k18', 6.75), (1826, 1276, 'k31', 7.0), (1827, 192, 'k44', 0.0), (1828, 2109, 'k57', 0.25), (1829, 1025, 'k70', 0.5), (1830, 2942, 'k83', 0.75), (1831, 1858, 'k96', 1.0), (1832, 774, 'k109', 1.25), (1833, 2691, 'k122', 1.5), (1834, 1607, 'k135', 1.75), (1835, 523, 'k148', 2.0), (1836, 2440, 'k4', 2.25), (1837, 1356, 'k17', 2.5), (1838, 272, 'k30', 2.75), (1839, 2189, 'k43', 3.0), (1840, 1105, 'k56', 3.25), (1841, 21, 'k69', 3.5), (1842, 1938, 'k82', 3.75), (1843, 854, 'k95', 4.0), (1844, 2771, 'k108', 4.25), (1845, 1687, 'k121', 4.5), (1846, 603, 'k134', 4.75), (1847, 2520, 'k147', 5.0), (1848, 1436, 'k3', 5.25), (1849, 352, 'k16', 5.5), (1850, 2269, 'k29', 5.75), (1851, 1185, 'k42', 6.0), (1852, 101, 'k55', 6.25), (1853, 2018, 'k68', 6.5), (1854, 934, 'k81', 6.75), (1855, 2851, 'k94', 7.0), (1856, 1767, 'k107', 0.0), (1857, 683, 'k120', 0.25), (1858, 2600, 'k133', 0.5), (1859, 1516, 'k146', 0.75), (1860, 432, 'k2', 1.0), (1861, 2349, 'k15', 1.25), (1862, 1265, 'k28', 1.5), (1863, 181, 'k41', 1.75), (1864, 2098, 'k54', 2.0), (1865, 1014, 'k67', 2.25), (1866, 2931, 'k80', 2.5), (1867, 1847, 'k93', 2.75), (1868, 763, 'k106', 3.0), (1869, 2680, 'k119', 3.25), (1870, 1596, 'k132', 3.5), (1871, 512, 'k145', 3.75), (1872, 2429, 'k1', 4.0), (1873, 1345, 'k14', 4.25), (1874, 261, 'k27', 4.5), (1875, 2178, 'k40', 4.75), (1876, 1094, 'k53', 5.0), (1877, 10, 'k66', 5.25), (1878, 1927, 'k79', 5.5), (1879, 843, 'k92', 5.75), (1880, 2760, 'k105', 6.0), (1881, 1676, 'k118', 6.25), (1882, 592, 'k131', 6.5), (1883, 2509, 'k144', 6.75), (1884, 1425, 'k0', 7.0), (1885, 341, 'k13', 0.0), (1886, 2258, 'k26', 0.25), (1887, 1174, 'k39', 0.5), (1888, 90, 'k52', 0.75), (1889, 2007, 'k65', 1.0), (1890, 923, 'k78', 1.25), (1891, 2840, 'k91', 1.5), (1892, 1756, 'k104', 1.75), (1893, 672, 'k117', 2.0), (1894, 2589, 'k130', 2.25), (1895, 1505, 'k143', 2.5), (1896, 421, 'k156', 2.75), (1897, 2338, 'k12', 3.0), (1898, 1254, 'k25', 3.25), (1899, 170, 'k38', 3.5), (1900, 2087, 'k51', 3.75), (1901, 1003, 'k64', 4.0), (1902, 2920, 'k77', 4.25), (1903, 1836, 'k90', 4.5), (1904, 752, 'k103', 4.75), (1905, 2669, 'k116', 5.0), (1906, 1585, 'k129', 5.25), (1907, 501, 'k142', 5.5), (1908, 2418, 'k155', 5.75), (1909, 1334, 'k11', 6.0), (1910, 250, 'k24', 6.25), (1911, 2167, 'k37', 6.5), (1912, 1083, 'k50', 6.75), (1913, 3000, 'k63', 7.0), (1914, 1916, 'k76', 0.0), (1915, 832, 'k89', 0.25), (1916, 2749, 'k102', 0.5), (1917, 1665, 'k115', 0.75), (1918, 581, 'k128', 1.0), (1919, 2498, 'k141', 1.25), (1920, 1414, 'k154', 1.5), (1921, 330, 'k10', 1.75), (1922, 2247, 'k23', 2.0), (1923, 1163, 'k36', 2.25), (1924, 79, 'k49', 2.5), (1925, 1996, 'k62', 2.75), (1926, 912, 'k75', 3.0), (1927, 2829, 'k88', 3.25), (1928, 1745, 'k101', 3.5), (1929, 661, 'k114', 3.75), (1930, 2578, 'k127', 4.0), (1931, 1494, 'k140', 4.25), (1932, 410, 'k153', 4.5), (1933, 2327, 'k9', 4.75), (1934, 1243, 'k22', 5.0), (1935, 159, 'k35', 5.25), (1936, 2076, 'k48', 5.5), (1937, 992, 'k61', 5.75), (1938, 2909, 'k74', 6.0), (1939, 1825, 'k87', 6.25), (1940, 741, 'k100', 6.5), (1941, 2658, 'k113', 6.75), (1942, 1574, 'k126', 7.0), (1943, 490, 'k139', 0.0), (1944, 2407, 'k152', 0.25), (1945, 1323, 'k8', 0.5), (1946, 239, 'k21', 0.75), (1947, 2156, 'k34', 1.0), (1948, 1072, 'k47', 1.25), (1949, 2989, 'k60', 1.5), (1950, 1905, 'k73', 1.75), (1951, 821, 'k86', 2.0), (1952, 2738, 'k99', 2.25), (1953, 1654, 'k112', 2.5), (1954, 570, 'k125', 2.75), (1955, 2487, 'k138', 3.0), (1956, 1403, 'k151', 3.25), (1957, 319, 'k7', 3.5), (1958, 2236, 'k20', 3.75), (1959, 1152, 'k33', 4.0), (1960, 68, 'k46', 4.25), (1961, 1985, 'k59', 4.5), (1962, 901, 'k72', 4.75), (1963, 2818, 'k85', 5.0), (1964, 1734, 'k98', 5.25), (1965, 650, 'k111', 5.5), (1966, 2567, 'k124', 5.75), (1967, 1483, 'k137', 6.0), (1968, 399, 'k150', 6.25), (1969, 2316, 'k6', 6.5), (1970, 1232, 'k19', 6.75), (1971, 148, 'k32', 7.0), (1972, 2065, 'k45', 0.0), (1973, 981, 'k58', 0.25), (1974, 2898, 'k71', 0.5), (1975, 1814, 'k84', 0.75), (1976, 730, 'k97', 1.0), (1977, 2647, 'k110', 1.25), (1978, 1563, 'k123', 1.5), (1979, 479, 'k136', 1.75), (1980, 2396, 'k149', 2.0), (1981, 1312, 'k5', 2.25), (1982, 228, 'k18', 2.5), (1983, 2145, 'k31', 2.75), (1984, 1061, 'k44', 3.0), (1985, 2978, 'k57', 3.25), (1986, 1894, 'k70', 3.5), (1987, 810, 'k83', 3.75), (1988, 2727, 'k96', 4.0), (1989, 1643, 'k109', 4.25), (1990, 559, 'k122', 4.5), (1991, 2476, 'k135', 4.75), (1992, 1392, 'k148', 5.0), (1993, 308, 'k4', 5.25), (1994, 2225, 'k17', 5.5), (1995, 1141, 'k30', 5.75), (1996, 57, 'k43', 6.0), (1997, 1974, 'k56', 6.25), (1998, 890, 'k69', 6.5), (1999, 2807, 'k82', 6.75), (2000, 1723, 'k95', 7.0), (2001, 639, 'k108', 0.0), (2002, 2556, 'k121', 0.25), (2003, 1472, 'k134', 0.5), (2004, 388, 'k147', 0.75), (2005, 2305, 'k3', 1.0), (2006, 1221, 'k16', 1.25), (2007, 137, 'k29', 1.5), (2008, 2054, 'k42', 1.75), (2009, 970, 'k55', 2.0), (2010, 2887, 'k68', 2.25), (2011, 1803, 'k81', 2.5), (2012, 719, 'k94', 2.75), (2013, 2636, 'k107', 3.0), (2014, 1552, 'k120', 3.25), (2015, 468, 'k133', 3.5), (2016, 2385, 'k146', 3.75), (2017, 1301, 'k2', 4.0), (2018, 217, 'k15', 4.25), (2019, 2134, 'k28', 4.5), (2020, 1050, 'k41', 4.75), (2021, 2967, 'k54', 5.0), (2022, 1883, 'k67', 5.25), (2023, 799, 'k80', 5.5), (2024, 2716, 'k93', 5.75), (2025, 1632, 'k106', 6.0), (2026, 548, 'k119', 6.25), (2027, 2465, 'k132', 6.5), (2028, 1381, 'k145', 6.75), (2029, 297, 'k1', 7.0), (2030, 2214, 'k14', 0.0), (2031, 1130, 'k27', 0.25), (2032, 46, 'k40', 0.5), (2033, 1963, 'k53', 0.75), (2034, 879, 'k66', 1.0), (2035, 2796, 'k79', 1.25), (2036, 1712, 'k92', 1.5), (2037, 628, 'k105', 1.75), (2038, 2545, 'k118', 2.0), (2039, 1461, 'k131', 2.25), (2040, 377, 'k144', 2.5), (2041, 2294, 'k0', 2.75), (2042, 1210, 'k13', 3.0), (2043, 126, 'k26', 3.25), (2044, 2043, 'k39', 3.5), (2045, 959, 'k52', 3.75), (2046, 2876, 'k65', 4.0), (2047, 1792, 'k78', 4.25), (2048, 708, 'k91', 4.5), (2049, 2625, 'k104', 4.75), (2050, 1541, 'k117', 5.0), (2051, 457, 'k130', 5.25), (2052, 2374, 'k143', 5.5), (2053, 1290, 'k156', 5.75), (2054, 206, 'k12', 6.0), (2055, 2123, 'k25', 6.25), (2056, 1039, 'k38', 6.5), (2057, 2956, 'k51', 6.75), (2058, 1872, 'k64', 7.0), (2059, 788, 'k77', 0.0), (2060, 2705, 'k90', 0.25), (2061, 1621, 'k103', 0.5), (2062, 537, 'k116', 0.75), (2063, 2454, 'k129', 1.0), (2064, 1370, 'k142', 1.25), (2065, 286, 'k155', 1.5), (2066, 2203, 'k11', 1.75), (2067, 1119, 'k24', 2.0), (2068, 35, 'k37', 2.25), (2069, 1952, 'k50', 2.5), (2070, 868, 'k63', 2.75), (2071, 2785, 'k76', 3.0), (2072, 1701, 'k89', 3.25), (2073, 617, 'k102', 3.5), (2074, 2534, 'k115', 3.75), (2075, 1450, 'k128', 4.0), (2076, 366, 'k141', 4.25), (2077, 2283, 'k154', 4.5), (2078, 1199, 'k10', 4.75), (2079, 115, 'k23', 5.0), (2080, 2032, 'k36', 5.25), (2081, 948, 'k49', 5.5), (2082, 2865, 'k62', 5.75), (2083, 1781, 'k75', 6.0), (2084, 697, 'k88', 6.25), (2085, 2614, 'k101', 6.5), (2086, 1530, 'k114', 6.75), (2087, 446, 'k127', 7.0), (2088, 2363, 'k140', 0.0), (2089, 1279, 'k153', 0.25), (2090, 195, 'k9', 0.5), (2091, 2112, 'k22', 0.75), (2092, 1028, 'k35', 1.0), (2093, 2945, 'k48', 1.25), (2094, 1861, 'k61', 1.5), (2095, 777, 'k74', 1.75), (2096, 2694, 'k87', 2.0), (2097, 1610, 'k100', 2.25), (2098, 526, 'k113', 2.5), (2099, 2443, 'k126', 2.75), (2100, 1359, 'k139', 3.0), (2101, 275, 'k152', 3.25), (2102, 2192, 'k8', 3.5), (2103, 1108, 'k21', 3.75), (2104, 24, 'k34', 4.0), (2105, 1941, 'k47', 4.25), (2106, 857, 'k60', 4.5), (2107, 2774, 'k73', 4.75), (2108, 1690, 'k86', 5.0), (2109, 606, 'k99', 5.25), (2110, 2523, 'k112', 5.5), (2111, 1439, 'k125', 5.75), (2112, 355, 'k138', 6.0), (2113, 2272, 'k151', 6.25), (2114, 1188, 'k7', 6.5), (2115, 104, 'k20', 6.75), (2116, 2021, 'k33', 7.0), (2117, 937, 'k46', 0.0), (2118, 2854, 'k59', 0.25), (2119, 1770, 'k72', 0.5), (2120, 686, 'k85', 0.75), (2121, 2603, 'k98', 1.0), (2122, 1519, 'k111', 1.25), (2123, 435, 'k124', 1.5), (2124, 2352, 'k137', 1.75), (2125, 1268, 'k150', 2.0), (2126, 184, 'k6', 2.25), (2127, 2101, 'k19', 2.5), (2128, 1017, 'k32', 2.75), (2129, 2934, 'k45', 3.0), (2130, 1850, 'k58', 3.25), (2131, 766, 'k71', 3.5), (2132, 2683, 'k84', 3.75), (2133, 1599, 'k97', 4.0), (2134, 515, 'k110', 4.25), (2135, 2432, 'k123', 4.5), (2136, 1348, 'k136', 4.75), (2137, 264, 'k149', 5.0), (2138, 2181, 'k5', 5.25), (2139, 1097, 'k18', 5.5), (2140, 13, 'k31', 5.75), (2141, 1930, 'k44', 6.0), (2142, 846, 'k57', 6.25), (2143, 2763, 'k70', 6.5), (2144, 1679, 'k83', 6.75), (2145, 595, 'k96', 7.0), (2146, 2512, 'k109', 0.0), (2147, 1428, 'k122', 0.25), (2148, 344, 'k135', 0.5), (2149, 2261, 'k148', 0.75), (2150, 1177, 'k4', 1.0), (2151, 93, 'k17', 1.25), (2152, 2010, 'k30', 1.5), (2153, 926, 'k43', 1.75), (2154, 2843, 'k56', 2.0), (2155, 1759, 'k69', 2.25), (2156, 675, 'k82', 2.5), (2157, 2592, 'k95', 2.75), (2158, 1508, 'k108', 3.0), (2159, 424, 'k121', 3.25), (2160, 2341, 'k134', 3.5), (2161, 1257, 'k147', 3.75), (2162, 173, 'k3', 4.0), (2163, 2090, 'k16', 4.25), (2164, 1006, 'k29', 4.5), (2165, 2923, 'k42', 4.75), (2166, 1839, 'k55', 5.0), (2167, 755, 'k68', 5.25), (2168, 2672, 'k81', 5.5), (2169, 1588, 'k94', 5.75), (2170, 504, 'k107', 6.0), (2171, 2421, 'k120', 6.25), (2172, 1337, 'k133', 6.5), (2173, 253, 'k146', 6.75), (2174, 2170, 'k2', 7.0), (2175, 1086, 'k15', 0.0), (2176, 2, 'k28', 0.25), (2177, 1919, 'k41', 0.5), (2178, 835, 'k54', 0.75), (2179, 2752, 'k67', 1.0), (2180, 1668, 'k80', 1.25), (2181, 584, 'k93', 1.5), (2182, 2501, 'k106', 1.75), (2183, 1417, 'k119', 2.0), (2184, 333, 'k132', 2.25), (2185, 2250, 'k145', 2.5), (2186, 1166, 'k1', 2.75), (2187, 82, 'k14', 3.0), (2188, 1999, 'k27', 3.25), (2189, 915, 'k40', 3.5), (2190, 2832, 'k53', 3.75), (2191, 1748, 'k66', 4.0), (2192, 664, 'k79', 4.25), (2193, 2581, 'k92', 4.5), (2194, 1497, 'k105', 4.75), (2195, 413, 'k118', 5.0), (2196, 2330, 'k131', 5.25), (2197, 1246, 'k144', 5.5), (2198, 162, 'k0', 5.75), (2199, 2079, 'k13', 6.0), (2200, 995, 'k26', 6.25), (2201, 2912, 'k39', 6.5), (2202, 1828, 'k52', 6.75), (2203, 744, 'k65', 7.0), (2204, 2661, 'k78', 0.0), (2205, 1577, 'k91', 0.25), (2206, 493, 'k104', 0.5), (2207, 2410, 'k117', 0.75), (2208, 1326, 'k130', 1.0), (2209, 242, 'k143', 1.25), (2210, 2159, 'k156', 1.5), (2211, 1075, 'k12', 1.75), (2212, 2992, 'k25', 2.0), (2213, 1908, 'k38', 2.25), (2214, 824, 'k51', 2.5), (2215, 2741, 'k64', 2.75), (2216, 1657, 'k77', 3.0), (2217, 573, 'k90', 3.25), (2218, 2490, 'k103', 3.5), (2219, 1406, 'k116', 3.75), (2220, 322, 'k129', 4.0), (2221, 2239, 'k142', 4.25), (2222, 1155, 'k155', 4.5), (2223, 71, 'k11', 4.75), (2224, 1988, 'k24', 5.0), (2225, 904, 'k37', 5.25), (2226, 2821, 'k50', 5.5), (2227, 1737, 'k63', 5.75), (2228, 653, 'k76', 6.0), (2229, 2570, 'k89', 6.25), (2230, 1486, 'k102', 6.5), (2231, 402, 'k115', 6.75), (2232, 2319, 'k128', 7.0), (2233, 1235, 'k141', 0.0), (2234, 151, 'k154', 0.25), (2235, 2068, 'k10', 0.5), (2236, 984, 'k23', 0.75), (2237, 2901, 'k36', 1.0), (2238, 1817, 'k49', 1.25), (2239, 733, 'k62', 1.5), (2240, 2650, 'k75', 1.75), (2241, 1566, 'k88', 2.0), (2242, 482, 'k101', 2.25), (2243, 2399, 'k114', 2.5), (2244, 1315, 'k127', 2.75), (2245, 231, 'k140', 3.0), (2246, 2148, 'k153', 3.25), (2247, 1064, 'k9', 3.5), (2248, 2981, 'k22', 3.75), (2249, 1897, 'k35', 4.0), (2250, 813, 'k48', 4.25), (2251, 2730, 'k61', 4.5), (2252, 1646, 'k74', 4.75), (2253, 562, 'k87', 5.0), (2254, 2479, 'k100', 5.25), (2255, 1395, 'k113', 5.5), (2256, 311, 'k126', 5.75), (2257, 2228, 'k139', 6.0), (2258, 1144, 'k152', 6.25), (2259, 60, 'k8', 6.5), (2260, 1977, 'k21', 6.75), (2261, 893, 'k34', 7.0), (2262, 2810, 'k47', 0.0), (2263, 1726, 'k60', 0.25), (2264, 642, 'k73', 0.5), (2265, 2559, 'k86', 0.75), (2266, 1475, 'k99', 1.0), (2267, 391, 'k112', 1.25), (2268, 2308, 'k125', 1.5), (2269, 1224, 'k138', 1.75), (2270, 140, 'k151', 2.0), (2271, 2057, 'k7', 2.25), (2272, 973, 'k20', 2.5), (2273, 2890, 'k33', 2.75), (2274, 1806, 'k46', 3.0), (2275, 722, 'k59', 3.25), (2276, 2639, 'k72', 3.5), (2277, 1555, 'k85', 3.75), (2278, 471, 'k98', 4.0), (2279, 2388, 'k111', 4.25), (2280, 1304, 'k124', 4.5), (2281, 220, 'k137', 4.75), (2282, 2137, 'k150', 5.0), (2283, 1053, 'k6', 5.25), (2284, 2970, 'k19', 5.5), (2285, 1886, 'k32', 5.75), (2286, 802, 'k45', 6.0), (2287, 2719, 'k58', 6.25), (2288, 1635, 'k71', 6.5), (2289, 551, 'k84', 6.75), (2290, 2468, 'k97', 7.0), (2291, 1384, 'k110', 0.0), (2292, 300, 'k123', 0.25), (2293, 2217, 'k136', 0.5), (2294, 1133, 'k149', 0.75), (2295, 49, 'k5', 1.0), (2296, 1966, 'k18', 1.25), (2297, 882, 'k31', 1.5), (2298, 2799, 'k44', 1.75), (2299, 1715, 'k57', 2.0), (2300, 631, 'k70', 2.25), (2301, 2548, 'k83', 2.5), (2302, 1464, 'k96', 2.75), (2303, 380, 'k109', 3.0), (2304, 2297, 'k122', 3.25), (2305, 1213, 'k135', 3.5), (2306, 129, 'k148', 3.75), (2307, 2046, 'k4', 4.0), (2308, 962, 'k17', 4.25), (2309, 2879, 'k30', 4.5), (2310, 1795, 'k43', 4.75), (2311, 711, 'k56', 5.0), (2312, 2628, 'k69', 5.25), (2313, 1544, 'k82', 5.5), (2314, 460, 'k95', 5.75), (2315, 2377, 'k108', 6.0), (2316, 1293, 'k121', 6.25), (2317, 209, 'k134', 6.5), (2318, 2126, 'k147', 6.75), (2319, 1042, 'k3', 7.0), (2320, 2959, 'k16', 0.0), (2321, 1875, 'k29', 0.25), (2322, 791, 'k42', 0.5), (2323, 2708, 'k55', 0.75), (2324, 1624, 'k68', 1.0), (2325, 540, 'k81', 1.25), (2326, 2457, 'k94', 1.5), (2327, 1373, 'k107', 1.75), (2328, 289, 'k120', 2.0), (2329, 2206, 'k133', 2.25), (2330, 1122, 'k146', 2.5), (2331, 38, 'k2', 2.75), (2332, 1955, 'k15', 3.0), (2333, 871, 'k28', 3.25), (2334, 2788, 'k41', 3.5), (2335, 1704, 'k54', 3.75), (2336, 620, 'k67', 4.0), (2337, 2537, 'k80', 4.25), (2338, 1453, 'k93', 4.5), (2339, 369, 'k106', 4.75), (2340, 2286, 'k119', 5.0), (2341, 1202, 'k132', 5.25), (2342, 118, 'k145', 5.5), (2343, 2035, 'k1', 5.75), (2344, 951, 'k14', 6.0), (2345, 2868, 'k27', 6.25), (2346, 1784, 'k40', 6.5), (2347, 700, 'k53', 6.75), (2348, 2617, 'k66', 7.0), (2349, 1533, 'k79', 0.0), (2350, 449, 'k92', 0.25), (2351, 2366, 'k105', 0.5), (2352, 1282, 'k118', 0.75), (2353, 198, 'k131', 1.0), (2354, 2115, 'k144', 1.25), (2355, 1031, 'k0', 1.5), (2356, 2948, 'k13', 1.75), (2357, 1864, 'k26', 2.0), (2358, 780, 'k39', 2.25), (2359, 2697, 'k52', 2.5), (2360, 1613, 'k65', 2.75), (2361, 529, 'k78', 3.0), (2362, 2446, 'k91', 3.25), (2363, 1362, 'k104', 3.5), (2364, 278, 'k117', 3.75), (2365, 2195, 'k130', 4.0), (2366, 1111, 'k143', 4.25), (2367, 27, 'k156', 4.5), (2368, 1944, 'k12', 4.75), (2369, 860, 'k25', 5.0), (2370, 2777, 'k38', 5.25), (2371, 1693, 'k51', 5.5), (2372, 609, 'k64', 5.75), (2373, 2526, 'k77', 6.0), (2374, 1442, 'k90', 6.25), (2375, 358, 'k103', 6.5), (2376, 2275, 'k116', 6.75), (2377, 1191, 'k129', 7.0), (2378, 107, 'k142', 0.0), (2379, 2024, 'k155', 0.25), (2380, 940, 'k11', 0.5), (2381, 2857, 'k24', 0.75), (2382, 1773, 'k37', 1.0), (2383, 689, 'k50', 1.25), (2384, 2606, 'k63', 1.5), (2385, 1522, 'k76', 1.75), (2386, 438, 'k89', 2.0), (2387, 2355, 'k102', 2.25), (2388, 1271, 'k115', 2.5), (2389, 187, 'k128', 2.75), (2390, 2104, 'k141', 3.0), (2391, 1020, 'k154', 3.25), (2392, 2937, 'k10', 3.5), (2393, 1853, 'k23', 3.75), (2394, 769, 'k36', 4.0), (2395, 2686, 'k49', 4.25), (2396, 1602, 'k62', 4.5), (2397, 518, 'k75', 4.75), (2398, 2435, 'k88', 5.0), (2399, 1351, 'k101', 5.25), (2400, 267, 'k114', 5.5), (2401, 2184, 'k127', 5.75), (2402, 1100, 'k140', 6.0), (2403, 16, 'k153', 6.25), (2404, 1933, 'k9', 6.5), (2405, 849, 'k22', 6.75), (2406, 2766, 'k35', 7.0), (2407, 1682, 'k48', 0.0), (2408, 598, 'k61', 0.25), (2409, 2515, 'k74', 0.5), (2410, 1431, 'k87', 0.75), (2411, 347, 'k100', 1.0), (2412, 2264, 'k113', 1.25), (2413, 1180, 'k126', 1.5), (2414, 96, 'k139', 1.75), (2415, 2013, 'k152', 2.0), (2416, 929, 'k8', 2.25), (2417, 2846, 'k21', 2.5), (2418, 1762, 'k34', 2.75), (2419, 678, 'k47', 3.0), (2420, 2595, 'k60', 3.25), (2421, 1511, 'k73', 3.5), (2422, 427, 'k86', 3.75), (2423, 2344, 'k99', 4.0), (2424, 1260, 'k112', 4.25), (2425, 176, 'k125', 4.5), (2426, 2093, 'k138', 4.75), (2427, 1009, 'k151', 5.0), (2428, 2926, 'k7', 5.25), (2429, 1842, 'k20', 5.5), (2430, 758, 'k33', 5.75), (2431, 2675, 'k46', 6.0), (2432, 1591, 'k59', 6.25), (2433, 507, 'k72', 6.5), (2434, 2424, 'k85', 6.75), (2435, 1340, 'k98', 7.0), (2436, 256, 'k111', 0.0), (2437, 2173, 'k124', 0.25), (2438, 1089, 'k137', 0.5), (2439, 5, 'k150', 0.75), (2440, 1922, 'k6', 1.0), (2441, 838, 'k19', 1.25), (2442, 2755, 'k32', 1.5), (2443, 1671, 'k45', 1.75), (2444, 587, 'k58', 2.0), (2445, 2504, 'k71', 2.25), (2446, 1420, 'k84', 2.5), (2447, 336, 'k97', 2.75), (2448, 2253, 'k110', 3.0), (2449, 1169, 'k123', 3.25), (2450, 85, 'k136', 3.5), (2451, 2002, 'k149', 3.75), (2452, 918, 'k5', 4.0), (2453, 2835, 'k18', 4.25), (2454, 1751, 'k31', 4.5), (2455, 667, 'k44', 4.75), (2456, 2584, 'k57', 5.0), (2457, 1500, 'k70', 5.25), (2458, 416, 'k83', 5.5), (2459, 2333, 'k96', 5.75), (2460, 1249, 'k109', 6.0), (2461, 165, 'k122', 6.25), (2462, 2082, 'k135', 6.5), (2463, 998, 'k148', 6.75), (2464, 2915, 'k4', 7.0), (2465, 1831, 'k17', 0.0), (2466, 747, 'k30', 0.25), (2467, 2664, 'k43', 0.5), (2468, 1580, 'k56', 0.75), (2469, 496, 'k69', 1.0), (2470, 2413, 'k82', 1.25), (2471, 1329, 'k95', 1.5), (2472, 245, 'k108', 1.75), (2473, 2162, 'k121', 2.0), (2474, 1078, 'k134', 2.25), (2475, 2995, 'k147', 2.5), (2476, 1911, 'k3', 2.75), (2477, 827, 'k16', 3.0), (2478, 2744, 'k29', 3.25), (2479, 1660, 'k42', 3.5), (2480, 576, 'k55', 3.75), (2481, 2493, 'k68', 4.0), (2482, 1409, 'k81', 4.25), (2483, 325, 'k94', 4.5), (2484, 2242, 'k107', 4.75), (2485, 1158, 'k120', 5.0), (2486, 74, 'k133', 5.25), (2487, 1991, 'k146', 5.5), (2488, 907, 'k2', 5.75), (2489, 2824, 'k15', 6.0), (2490, 1740, 'k28', 6.25), (2491, 656, 'k41', 6.5), (2492, 2573, 'k54', 6.75), (2493, 1489, 'k67', 7.0), (2494, 405, 'k80', 0.0), (2495, 2322, 'k93', 0.25), (2496, 1238, 'k106', 0.5), (2497, 154, 'k119', 0.75), (2498, 2071, 'k132', 1.0), (2499, 987, 'k145', 1.25), (2500, 2904, 'k1', 1.5), (2501, 1820, 'k14', 1.75), (2502, 736, 'k27', 2.0), (2503, 2653, 'k40', 2.25), (2504, 1569, 'k53', 2.5), (2505, 485, 'k66', 2.75), (2506, 2402, 'k79', 3.0), (2507, 1318, 'k92', 3.25), (2508, 234, 'k105', 3.5), (2509, 2151, 'k118', 3.75), (2510, 1067, 'k131', 4.0), (2511, 2984, 'k144', 4.25), (2512, 1900, 'k0', 4.5), (2513, 816, 'k13', 4.75), (2514, 2733, 'k26', 5.0), (2515, 1649, 'k39', 5.25), (2516, 565, 'k52', 5.5), (2517, 2482, 'k65', 5.75), (2518, 1398, 'k78', 6.0), (2519, 314, 'k91', 6.25), (2520, 2231, 'k104', 6.5), (2521, 1147, 'k117', 6.75), (2522, 63, 'k130', 7.0), (2523, 1980, 'k143', 0.0), (2524, 896, 'k156', 0.25), (2525, 2813, 'k12', 0.5), (2526, 1729, 'k25', 0.75), (2527, 645, 'k38', 1.0), (2528, 2562, 'k51', 1.25), (2529, 1478, 'k64', 1.5), (2530, 394, 'k77', 1.75), (2531, 2311, 'k90', 2.0), (2532, 1227, 'k103', 2.25), (2533, 143, 'k116', 2.5), (2534, 2060, 'k129', 2.75), (2535, 976, 'k142', 3.0), (2536, 2893, 'k155', 3.25), (2537, 1809, 'k11', 3.5), (2538, 725, 'k24', 3.75), (2539, 2642, 'k37', 4.0), (2540, 1558, 'k50', 4.25), (2541, 474, 'k63', 4.5), (2542, 2391, 'k76', 4.75), (2543, 1307, 'k89', 5.0), (2544, 223, 'k102', 5.25), (2545, 2140, 'k115', 5.5), (2546, 1056, 'k128', 5.75), (2547, 2973, 'k141', 6.0), (2548, 1889, 'k154', 6.25), (2549, 805, 'k10', 6.5), (2550, 2722, 'k23', 6.75), (2551, 1638, 'k36', 7.0), (2552, 554, 'k49', 0.0), (2553, 2471, 'k62', 0.25), (2554, 1387, 'k75', 0.5), (2555, 303, 'k88', 0.75), (2556, 2220, 'k101', 1.0), (2557, 1136, 'k114', 1.25), (2558, 52, 'k127', 1.5), (2559, 1969, 'k140', 1.75), (2560, 885, 'k153', 2.0), (2561, 2802, 'k9', 2.25), (2562, 1718, 'k22', 2.5), (2563, 634, 'k35', 2.75), (2564, 2551, 'k48', 3.0), (2565, 1467, 'k61', 3.25), (2566, 383, 'k74', 3.5), (2567, 2300, 'k87', 3.75), (2568, 1216, 'k100', 4.0), (2569, 132, 'k113', 4.25), (2570, 2049, 'k126', 4.5), (2571, 965, 'k139', 4.75), (2572, 2882, 'k152', 5.0), (2573, 1798, 'k8', 5.25), (2574, 714, 'k21', 5.5), (2575, 2631, 'k34', 5.75), (2576, 1547, 'k47', 6.0), (2577, 463, 'k60', 6.25), (2578, 2380, 'k73', 6.5), (2579, 1296, 'k86', 6.75), (2580, 212, 'k99', 7.0), (2581, 2129, 'k112', 0.0), (2582, 1045, 'k125', 0.25), (2583, 2962, 'k138', 0.5), (2584, 1878, 'k151', 0.75), (2585, 794, 'k7', 1.0), (2586, 2711, 'k20', 1.25), (2587, 1627, 'k33', 1.5), (2588, 543, 'k46', 1.75), (2589, 2460, 'k59', 2.0), (2590, 1376, 'k72', 2.25), (2591, 292, 'k85', 2.5), (2592, 2209, 'k98', 2.75), (2593, 1125, 'k111', 3.0), (2594, 41, 'k124', 3.25), (2595, 1958, 'k137', 3.5), (2596, 874, 'k150', 3.75), (2597, 2791, 'k6', 4.0), (2598, 1707, 'k19', 4.25), (2599, 623, 'k32', 4.5), (2600, 2540, 'k45', 4.75), (2601, 1456, 'k58', 5.0), (2602, 372, 'k71', 5.25), (2603, 2289, 'k84', 5.5), (2604, 1205, 'k97', 5.75), (2605, 121, 'k110', 6.0), (2606, 2038, 'k123', 6.25), (2607, 954, 'k136', 6.5), (2608, 2871, 'k149', 6.75), (2609, 1787, 'k5', 7.0), (2610, 703, 'k18', 0.0), (2611, 2620, 'k31', 0.25), (2612, 1536, 'k44', 0.5), (2613, 452, 'k57', 0.75), (2614, 2369, 'k70', 1.0), (2615, 1285, 'k83', 1.25), (2616, 201, 'k96', 1.5), (2617, 2118, 'k109', 1.75), (2618, 1034, 'k122', 2.0), (2619, 2951, 'k135', 2.25), (2620, 1867, 'k148', 2.5), (2621, 783, 'k4', 2.75), (2622, 2700, 'k17', 3.0), (2623, 1616, 'k30', 3.25), (2624, 532, 'k43', 3.5), (2625, 2449, 'k56', 3.75), (2626, 1365, 'k69', 4.0), (2627, 281, 'k82', 4.25), (2628, 2198, 'k95', 4.5), (2629, 1114, 'k108', 4.75), (2630, 30, 'k121', 5.0), (2631, 1947, 'k134', 5.25), (2632, 863, 'k147', 5.5), (2633, 2780, 'k3', 5.75), (2634, 1696, 'k16', 6.0), (2635, 612, 'k29', 6.25), (2636, 2529, 'k42', 6.5), (2637, 1445, 'k55', 6.75), (2638, 361, 'k68', 7.0), (2639, 2278, 'k81', 0.0), (2640, 1194, 'k94', 0.25), (2641, 110, 'k107', 0.5), (2642, 2027, 'k120', 0.75), (2643, 943, 'k133', 1.0), (2644, 2860, 'k146', 1.25), (2645, 1776, 'k2', 1.5), (2646, 692, 'k15', 1.75), (2647, 2609, 'k28', 2.0), (2648, 1525, 'k41', 2.25), (2649, 441, 'k54', 2.5), (2650, 2358, 'k67', 2.75), (2651, 1274, 'k80', 3.0), (2652, 190, 'k93', 3.25), (2653, 2107, 'k106', 3.5), (2654, 1023, 'k119', 3.75), (2655, 2940, 'k132', 4.0), (2656, 1856, 'k145', 4.25), (2657, 772, 'k1', 4.5), (2658, 2689, 'k14', 4.75), (2659, 1605, 'k27', 5.0), (2660, 521, 'k40', 5.25), (2661, 2438, 'k53', 5.5), (2662, 1354, 'k66', 5.75), (2663, 270, 'k79', 6.0), (2664, 2187, 'k92', 6.25), (2665, 1103, 'k105', 6.5), (2666, 19, 'k118', 6.75), (2667, 1936, 'k131', 7.0), (2668, 852, 'k144', 0.0), (2669, 2769, 'k0', 0.25), (2670, 1685, 'k13', 0.5), (2671, 601, 'k26', 0.75), (2672, 2518, 'k39', 1.0), (2673, 1434, 'k52', 1.25), (2674, 350, 'k65', 1.5), (2675, 2267, 'k78', 1.75), (2676, 1183, 'k91', 2.0), (2677, 99, 'k104', 2.25), (2678, 2016, 'k117', 2.5), (2679, 932, 'k130', 2.75), (2680, 2849, 'k143', 3.0), (2681, 1765, 'k156', 3.25), (2682, 681, 'k12', 3.5), (2683, 2598, 'k25', 3.75), (2684, 1514, 'k38', 4.0), (2685, 430, 'k51', 4.25), (2686, 2347, 'k64', 4.5), (2687, 1263, 'k77', 4.75), (2688, 179, 'k90', 5.0), (2689, 2096, 'k103', 5.25), (2690, 1012, 'k116', 5.5), (2691, 2929, 'k129', 5.75), (2692, 1845, 'k142', 6.0), (2693, 761, 'k155', 6.25), (2694, 2678, 'k11', 6.5), (2695, 1594, 'k24', 6.75), (2696, 510, 'k37', 7.0), (2697, 2427, 'k50', 0.0), (2698, 1343, 'k63', 0.25), (2699, 259, 'k76', 0.5), (2700, 2176, 'k89', 0.75), (2701, 1092, 'k102', 1.0), (2702, 8, 'k115', 1.25), (2703, 1925, 'k128', 1.5), (2704, 841, 'k141', 1.75), (2705, 2758, 'k154', 2.0), (2706, 1674, 'k10', 2.25), (2707, 590, 'k23', 2.5), (2708, 2507, 'k36', 2.75), (2709, 1423, 'k49', 3.0), (2710, 339, 'k62', 3.25), (2711, 2256, 'k75', 3.5), (2712, 1172, 'k88', 3.75), (2713, 88, 'k101', 4.0), (2714, 2005, 'k114', 4.25), (2715, 921, 'k127', 4.5), (2716, 2838, 'k140', 4.75), (2717, 1754, 'k153', 5.0), (2718, 670, 'k9', 5.25), (2719, 2587, 'k22', 5.5), (2720, 1503, 'k35', 5.75), (2721, 419, 'k48', 6.0), (2722, 2336, 'k61', 6.25), (2723, 1252, 'k74', 6.5), (2724, 168, 'k87', 6.75), (2725, 2085, 'k100', 7.0), (2726, 1001, 'k113', 0.0), (2727, 2918, 'k126', 0.25), (2728, 1834, 'k139', 0.5), (2729, 750, 'k152', 0.75), (2730, 2667, 'k8', 1.0), (2731, 1583, 'k21', 1.25), (2732, 499, 'k34', 1.5), (2733, 2416, 'k47', 1.75), (2734, 1332, 'k60', 2.0), (2735, 248, 'k73', 2.25), (2736, 2165, 'k86', 2.5), (2737, 1081, 'k99', 2.75), (2738, 2998, 'k112', 3.0), (2739, 1914, 'k125', 3.25), (2740, 830, 'k138', 3.5), (2741, 2747, 'k151', 3.75), (2742, 1663, 'k7', 4.0), (2743, 579, 'k20', 4.25), (2744, 2496, 'k33', 4.5), (2745, 1412, 'k46', 4.75), (2746, 328, 'k59', 5.0), (2747, 2245, 'k72', 5.25), (2748, 1161, 'k85', 5.5), (2749, 77, 'k98', 5.75), (2750, 1994, 'k111', 6.0), (2751, 910, 'k124', 6.25), (2752, 2827, 'k137', 6.5), (2753, 1743, 'k150', 6.75), (2754, 659, 'k6', 7.0), (2755, 2576, 'k19', 0.0), (2756, 1492, 'k32', 0.25), (2757, 408, 'k45', 0.5), (2758, 2325, 'k58', 0.75), (2759, 1241, 'k71', 1.0), (2760, 157, 'k84', 1.25), (2761, 2074, 'k97', 1.5), (2762, 990, 'k110', 1.75), (2763, 2907, 'k123', 2.0), (2764, 1823, 'k136', 2.25), (2765, 739, 'k149', 2.5), (2766, 2656, 'k5', 2.75), (2767, 1572, 'k18', 3.0), (2768, 488, 'k31', 3.25), (2769, 2405, 'k44', 3.5), (2770, 1321, 'k57', 3.75), (2771, 237, 'k70', 4.0), (2772, 2154, 'k83', 4.25), (2773, 1070, 'k96', 4.5), (2774, 2987, 'k109', 4.75), (2775, 1903, 'k122', 5.0), (2776, 819, 'k135', 5.25), (2777, 2736, 'k148', 5.5), (2778, 1652, 'k4', 5.75), (2779, 568, 'k17', 6.0), (2780, 2485, 'k30', 6.25), (2781, 1401, 'k43', 6.5), (2782, 317, 'k56', 6.75), (2783, 2234, 'k69', 7.0), (2784, 1150, 'k82', 0.0), (2785, 66, 'k95', 0.25), (2786, 1983, 'k108', 0.5), (2787, 899, 'k121', 0.75), (2788, 2816, 'k134', 1.0), (2789, 1732, 'k147', 1.25), (2790, 648, 'k3', 1.5), (2791, 2565, 'k16', 1.75), (2792, 1481, 'k29', 2.0), (2793, 397, 'k42', 2.25), (2794, 2314, 'k55', 2.5), (2795, 1230, 'k68', 2.75), (2796, 146, 'k81', 3.0), (2797, 2063, 'k94', 3.25), (2798, 979, 'k107', 3.5), (2799, 2896, 'k120', 3.75), (2800, 1812, 'k133', 4.0), (2801, 728, 'k146', 4.25), (2802, 2645, 'k2', 4.5), (2803, 1561, 'k15', 4.75), (2804, 477, 'k28', 5.0), (2805, 2394, 'k41', 5.25), (2806, 1310, 'k54', 5.5), (2807, 226, 'k67', 5.75), (2808, 2143, 'k80', 6.0), (2809, 1059, 'k93', 6.25), (2810, 2976, 'k106', 6.5), (2811, 1892, 'k119', 6.75), (2812, 808, 'k132', 7.0), (2813, 2725, 'k145', 0.0), (2814, 1641, 'k1', 0.25), (2815, 557, 'k14', 0.5), (2816, 2474, 'k27', 0.75), (2817, 1390, 'k40', 1.0), (2818, 306, 'k53', 1.25), (2819, 2223, 'k66', 1.5), (2820, 1139, 'k79', 1.75), (2821, 55, 'k92', 2.0), (2822, 1972, 'k105', 2.25), (2823, 888, 'k118', 2.5), (2824, 2805, 'k131', 2.75), (2825, 1721, 'k144', 3.0), (2826, 637, 'k0', 3.25), (2827, 2554, 'k13', 3.5), (2828, 1470, 'k26', 3.75), (2829, 386, 'k39', 4.0), (2830, 2303, 'k52', 4.25), (2831, 1219, 'k65', 4.5), (2832, 135, 'k78', 4.75), (2833, 2052, 'k91', 5.0), (2834, 968, 'k104', 5.25), (2835, 2885, 'k117', 5.5), (2836, 1801, 'k130', 5.75), (2837, 717, 'k143', 6.0), (2838, 2634, 'k156', 6.25), (2839, 1550, 'k12', 6.5), (2840, 466, 'k25', 6.75), (2841, 2383, 'k38', 7.0), (2842, 1299, 'k51', 0.0), (2843, 215, 'k64', 0.25), (2844, 2132, 'k77', 0.5), (2845, 1048, 'k90', 0.75), (2846, 2965, 'k103', 1.0), (2847, 1881, 'k116', 1.25), (2848, 797, 'k129', 1.5), (2849, 2714, 'k142', 1.75), (2850, 1630, 'k155', 2.0), (2851, 546, 'k11', 2.25), (2852, 2463, 'k24', 2.5), (2853, 1379, 'k37', 2.75), (2854, 295, 'k50', 3.0), (2855, 2212, 'k63', 3.25), (2856, 1128, 'k76', 3.5), (2857, 44, 'k89', 3.75), (2858, 1961, 'k102', 4.0), (2859, 877, 'k115', 4.25), (2860, 2794, 'k128', 4.5), (2861, 1710, 'k141', 4.75), (2862, 626, 'k154', 5.0), (2863, 2543, 'k10', 5.25), (2864, 1459, 'k23', 5.5), (2865, 375, 'k36', 5.75), (2866, 2292, 'k49', 6.0), (2867, 1208, 'k62', 6.25), (2868, 124, 'k75', 6.5), (2869, 2041, 'k88', 6.75), (2870, 957, 'k101', 7.0), (2871, 2874, 'k114', 0.0), (2872, 1790, 'k127', 0.25), (2873, 706, 'k140', 0.5), (2874, 2623, 'k153', 0.75), (2875, 1539, 'k9', 1.0), (2876, 455, 'k22', 1.25), (2877, 2372, 'k35', 1.5), (2878, 1288, 'k48', 1.75), (2879, 204, 'k61', 2.0), (2880, 2121, 'k74', 2.25), (2881, 1037, 'k87', 2.5), (2882, 2954, 'k100', 2.75), (2883, 1870, 'k113', 3.0), (2884, 786, 'k126', 3.25), (2885, 2703, 'k139', 3.5), (2886, 1619, 'k152', 3.75), (2887, 535, 'k8', 4.0), (2888, 2452, 'k21', 4.25), (2889, 1368, 'k34', 4.5), (2890, 284, 'k47', 4.75), (2891, 2201, 'k60', 5.0), (2892, 1117, 'k73', 5.25), (2893, 33, 'k86', 5.5), (2894, 1950, 'k99', 5.75), (2895, 866, 'k112', 6.0), (2896, 2783, 'k125', 6.25), (2897, 1699, 'k138', 6.5), (2898, 615, 'k151', 6.75), (2899, 2532, 'k7', 7.0), (2900, 1448, 'k20', 0.0), (2901, 364, 'k33', 0.25), (2902, 2281, 'k46', 0.5), (2903, 1197, 'k59', 0.75), (2904, 113, 'k72', 1.0), (2905, 2030, 'k85', 1.25), (2906, 946, 'k98', 1.5), (2907, 2863, 'k111', 1.75), (2908, 1779, 'k124', 2.0), (2909, 695, 'k137', 2.25), (2910, 2612, 'k150', 2.5), (2911, 1528, 'k6', 2.75), (2912, 444, 'k19', 3.0), (2913, 2361, 'k32', 3.25), (2914, 1277, 'k45', 3.5), (2915, 193, 'k58', 3.75), (2916, 2110, 'k71', 4.0), (2917, 1026, 'k84', 4.25), (2918, 2943, 'k97', 4.5), (2919, 1859, 'k110', 4.75), (2920, 775, 'k123', 5.0), (2921, 2692, 'k136', 5.25), (2922, 1608, 'k149', 5.5), (2923, 524, 'k5', 5.75), (2924, 2441, 'k18', 6.0), (2925, 1357, 'k31', 6.25), (2926, 273, 'k44', 6.5), (2927, 2190, 'k57', 6.75), (2928, 1106, 'k70', 7.0), (2929, 22, 'k83', 0.0), (2930, 1939, 'k96', 0.25), (2931, 855, 'k109', 0.5), (2932, 2772, 'k122', 0.75), (2933, 1688, 'k135', 1.0), (2934, 604, 'k148', 1.25), (2935, 2521, 'k4', 1.5), (2936, 1437, 'k17', 1.75), (2937, 353, 'k30', 2.0), (2938, 2270, 'k43', 2.25), (2939, 1186, 'k56', 2.5), (2940, 102, 'k69', 2.75), (2941, 2019, 'k82', 3.0), (2942, 935, 'k95', 3.25), (2943, 2852, 'k108', 3.5), (2944, 1768, 'k121', 3.75), (2945, 684, 'k134', 4.0), (2946, 2601, 'k147', 4.25), (2947, 1517, 'k3', 4.5), (2948, 433, 'k16', 4.75), (2949, 2350, 'k29', 5.0), (2950, 1266, 'k42', 5.25), (2951, 182, 'k55', 5.5), (2952, 2099, 'k68', 5.75), (2953, 1015, 'k81', 6.0), (2954, 2932, 'k94', 6.25), (2955, 1848, 'k107', 6.5), (2956, 764, 'k120', 6.75), (2957, 2681, 'k133', 7.0), (2958, 1597, 'k146', 0.0), (2959, 513, 'k2', 0.25), (2960, 2430, 'k15', 0.5), (2961, 1346, 'k28', 0.75), (2962, 262, 'k41', 1.0), (2963, 2179, 'k54', 1.25), (2964, 1095, 'k67', 1.5), (2965, 11, 'k80', 1.75), (2966, 1928, 'k93', 2.0), (2967, 844, 'k106', 2.25), (2968, 2761, 'k119', 2.5), (2969, 1677, 'k132', 2.75), (2970, 593, 'k145', 3.0), (2971, 2510, 'k1', 3.25), (2972, 1426, 'k14', 3.5), (2973, 342, 'k27', 3.75), (2974, 2259, 'k40', 4.0), (2975, 1175, 'k53', 4.25), (2976, 91, 'k66', 4.5), (2977, 2008, 'k79', 4.75), (2978, 924, 'k92', 5.0), (2979, 2841, 'k105', 5.25), (2980, 1757, 'k118', 5.5), (2981, 673, 'k131', 5.75), (2982, 2590, 'k144', 6.0), (2983, 1506, 'k0', 6.25), (2984, 422, 'k13', 6.5), (2985, 2339, 'k26', 6.75), (2986, 1255, 'k39', 7.0), (2987, 171, 'k52', 0.0), (2988, 2088, 'k65', 0.25), (2989, 1004, 'k78', 0.5), (2990, 2921, 'k91', 0.75), (2991, 1837, 'k104', 1.0), (2992, 753, 'k117', 1.25), (2993, 2670, 'k130', 1.5), (2994, 1586, 'k143', 1.75), (2995, 502, 'k156', 2.0), (2996, 2419, 'k12', 2.25), (2997, 1335, 'k25', 2.5), (2998, 251, 'k38', 2.75), (2999, 2168, 'k51', 3.0), (3000, 1084, 'k64', 3.25), (3001, 0, 'k77', 3.5), (3002, 1917, 'k90', 3.75), (3003, 833, 'k103', 4.0), (3004, 2750, 'k116', 4.25), (3005, 1666, 'k129', 4.5), (3006, 582, 'k142', 4.75), (3007, 2499, 'k155', 5.0), (3008, 1415, 'k11', 5.25), (3009, 331, 'k24', 5.5), (3010, 2248, 'k37', 5.75), (3011, 1164, 'k50', 6.0), (3012, 80, 'k63', 6.25), (3013, 1997, 'k76', 6.5), (3014, 913, 'k89', 6.75), (3015, 2830, 'k102', 7.0), (3016, 1746, 'k115', 0.0), (3017, 662, 'k128', 0.25), (3018, 2579, 'k141', 0.5), (3019, 1495, 'k154', 0.75), (3020, 411, 'k10', 1.0), (3021, 2328, 'k23', 1.25), (3022, 1244, 'k36', 1.5), (3023, 160, 'k49', 1.75), (3024, 2077, 'k62', 2.0), (3025, 993, 'k75', 2.25), (3026, 2910, 'k88', 2.5), (3027, 1826, 'k101', 2.75), (3028, 742, 'k114', 3.0), (3029, 2659, 'k127', 3.25), (3030, 1575, 'k140', 3.5), (3031, 491, 'k153', 3.75), (3032, 2408, 'k9', 4.0), (3033, 1324, 'k22', 4.25), (3034, 240, 'k35', 4.5), (3035, 2157, 'k48', 4.75), (3036, 1073, 'k61', 5.0), (3037, 2990, 'k74', 5.25), (3038, 1906, 'k87', 5.5), (3039, 822, 'k100', 5.75), (3040, 2739, 'k113', 6.0), (3041, 1655, 'k126', 6.25), (3042, 571, 'k139', 6.5), (3043, 2488, 'k152', 6.75), (3044, 1404, 'k8', 7.0), (3045, 320, 'k21', 0.0), (3046, 2237, 'k34', 0.25), (3047, 1153, 'k47', 0.5), (3048, 69, 'k60', 0.75), (3049, 1986, 'k73', 1.0), (3050, 902, 'k86', 1.25), (3051, 2819, 'k99', 1.5), (3052, 1735, 'k112', 1.75), (3053, 651, 'k125', 2.0), (3054, 2568, 'k138', 2.25), (3055, 1484, 'k151', 2.5), (3056, 400, 'k7', 2.75), (3057, 2317, 'k20', 3.0), (3058, 1233, 'k33', 3.25), (3059, 149, 'k46', 3.5), (3060, 2066, 'k59', 3.75), (3061, 982, 'k72', 4.0), (3062, 2899, 'k85', 4.25), (3063, 1815, 'k98', 4.5), (3064, 731, 'k111', 4.75), (3065, 2648, 'k124', 5.0), (3066, 1564, 'k137', 5.25), (3067, 480, 'k150', 5.5), (3068, 2397, 'k6', 5.75), (3069, 1313, 'k19', 6.0), (3070, 229, 'k32', 6.25), (3071, 2146, 'k45', 6.5), (3072, 1062, 'k58', 6.75), (3073, 2979, 'k71', 7.0), (3074, 1895, 'k84', 0.0), (3075, 811, 'k97', 0.25), (3076, 2728, 'k110', 0.5), (3077, 1644, 'k123', 0.75), (3078, 560, 'k136', 1.0), (3079, 2477, 'k149', 1.25), (3080, 1393, 'k5', 1.5), (3081, 309, 'k18', 1.75), (3082, 2226, 'k31', 2.0), (3083, 1142, 'k44', 2.25), (3084, 58, 'k57', 2.5), (3085, 1975, 'k70', 2.75), (3086, 891, 'k83', 3.0), (3087, 2808, 'k96', 3.25), (3088, 1724, 'k109', 3.5), (3089, 640, 'k122', 3.75), (3090, 2557, 'k135', 4.0), (3091, 1473, 'k148', 4.25), (3092, 389, 'k4', 4.5), (3093, 2306, 'k17', 4.75), (3094, 1222, 'k30', 5.0), (3095, 138, 'k43', 5.25), (3096, 2055, 'k56', 5.5), (3097, 971, 'k69', 5.75), (3098, 2888, 'k82', 6.0), (3099, 1804, 'k95', 6.25), (3100, 720, 'k108', 6.5), (3101, 2637, 'k121', 6.75), (3102, 1553, 'k134', 7.0), (3103, 469, 'k147', 0.0), (3104, 2386, 'k3', 0.25), (3105, 1302, 'k16', 0.5), (3106, 218, 'k29', 0.75), (3107, 2135, 'k42', 1.0), (3108, 1051, 'k55', 1.25), (3109, 2968, 'k68', 1.5), (3110, 1884, 'k81', 1.75), (3111, 800, 'k94', 2.0), (3112, 2717, 'k107', 2.25), (3113, 1633, 'k120', 2.5), (3114, 549, 'k133', 2.75), (3115, 2466, 'k146', 3.0), (3116, 1382, 'k2', 3.25), (3117, 298, 'k15', 3.5), (3118, 2215, 'k28', 3.75), (3119, 1131, 'k41', 4.0), (3120, 47, 'k54', 4.25), (3121, 1964, 'k67', 4.5), (3122, 880, 'k80', 4.75), (3123, 2797, 'k93', 5.0), (3124, 1713, 'k106', 5.25), (3125, 629, 'k119', 5.5), (3126, 2546, 'k132', 5.75), (3127, 1462, 'k145', 6.0), (3128, 378, 'k1', 6.25), (3129, 2295, 'k14', 6.5), (3130, 1211, 'k27', 6.75), (3131, 127, 'k40', 7.0), (3132, 2044, 'k53', 0.0), (3133, 960, 'k66', 0.25), (3134, 2877, 'k79', 0.5), (3135, 1793, 'k92', 0.75), (3136, 709, 'k105', 1.0), (3137, 2626, 'k118', 1.25), (3138, 1542, 'k131', 1.5), (3139, 458, 'k144', 1.75), (3140, 2375, 'k0', 2.0), (3141, 1291, 'k13', 2.25), (3142, 207, 'k26', 2.5), (3143, 2124, 'k39', 2.75), (3144, 1040, 'k52', 3.0), (3145, 2957, 'k65', 3.25), (3146, 1873, 'k78', 3.5), (3147, 789, 'k91', 3.75), (3148, 2706, 'k104', 4.0), (3149, 1622, 'k117', 4.25), (3150, 538, 'k130', 4.5), (3151, 2455, 'k143', 4.75), (3152, 1371, 'k156', 5.0), (3153, 287, 'k12', 5.25), (3154, 2204, 'k25', 5.5), (3155, 1120, 'k38', 5.75), (3156, 36, 'k51', 6.0), (3157, 1953, 'k64', 6.25), (3158, 869, 'k77', 6.5), (3159, 2786, 'k90', 6.75), (3160, 1702, 'k103', 7.0), (3161, 618, 'k116', 0.0), (3162, 2535, 'k129', 0.25), (3163, 1451, 'k142', 0.5), (3164, 367, 'k155', 0.75), (3165, 2284, 'k11', 1.0), (3166, 1200, 'k24', 1.25), (3167, 116, 'k37', 1.5), (3168, 2033, 'k50', 1.75), (3169, 949, 'k63', 2.0), (3170, 2866, 'k76', 2.25), (3171, 1782, 'k89', 2.5), (3172, 698, 'k102', 2.75), (3173, 2615, 'k115', 3.0), (3174, 1531, 'k128', 3.25), (3175, 447, 'k141', 3.5), (3176, 2364, 'k154', 3.75), (3177, 1280, 'k10', 4.0), (3178, 196, 'k23', 4.25), (3179, 2113, 'k36', 4.5), (3180, 1029, 'k49', 4.75), (3181, 2946, 'k62', 5.0), (3182, 1862, 'k75', 5.25), (3183, 778, 'k88', 5.5), (3184, 2695, 'k101', 5.75), (3185, 1611, 'k114', 6.0), (3186, 527, 'k127', 6.25), (3187, 2444, 'k140', 6.5), (3188, 1360, 'k153', 6.75), (3189, 276, 'k9', 7.0), (3190, 2193, 'k22', 0.0), (3191, 1109, 'k35', 0.25), (3192, 25, 'k48', 0.5), (3193, 1942, 'k61', 0.75), (3194, 858, 'k74', 1.0), (3195, 2775, 'k87', 1.25), (3196, 1691, 'k100', 1.5), (3197, 607, 'k113', 1.75), (3198, 2524, 'k126', 2.0), (3199, 1440, 'k139', 2.25), (3200, 356, 'k152', 2.5), (3201, 2273, 'k8', 2.75), (3202, 1189, 'k21', 3.0), (3203, 105, 'k34', 3.25), (3204, 2022, 'k47', 3.5), (3205, 938, 'k60', 3.75), (3206, 2855, 'k73', 4.0), (3207, 1771, 'k86', 4.25), (3208, 687, 'k99', 4.5), (3209, 2604, 'k112', 4.75), (3210, 1520, 'k125', 5.0), (3211, 436, 'k138', 5.25), (3212, 2353, 'k151', 5.5), (3213, 1269, 'k7', 5.75), (3214, 185, 'k20', 6.0), (3215, 2102, 'k33', 6.25), (3216, 1018, 'k46', 6.5), (3217, 2935, 'k59', 6.75), (3218, 1851, 'k72', 7.0), (3219, 767, 'k85', 0.0), (3220, 2684, 'k98', 0.25), (3221, 1600, 'k111', 0.5), (3222, 516, 'k124', 0.75), (3223, 2433, 'k137', 1.0), (3224, 1349, 'k150', 1.25), (3225, 265, 'k6', 1.5), (3226, 2182, 'k19', 1.75), (3227, 1098, 'k32', 2.0), (3228, 14, 'k45', 2.25), (3229, 1931, 'k58', 2.5), (3230, 847, 'k71', 2.75), (3231, 2764, 'k84', 3.0), (3232, 1680, 'k97', 3.25), (3233, 596, 'k110', 3.5), (3234, 2513, 'k123', 3.75), (3235, 1429, 'k136', 4.0), (3236, 345, 'k149', 4.25), (3237, 2262, 'k5', 4.5), (3238, 1178, 'k18', 4.75), (3239, 94, 'k31', 5.0), (3240, 2011, 'k44', 5.25), (3241, 927, 'k57', 5.5), (3242, 2844, 'k70', 5.75), (3243, 1760, 'k83', 6.0), (3244, 676, 'k96', 6.25), (3245, 2593, 'k109', 6.5), (3246, 1509, 'k122', 6.75), (3247, 425, 'k135', 7.0), (3248, 2342, 'k148', 0.0), (3249, 1258, 'k4', 0.25), (3250, 174, 'k17', 0.5), (3251, 2091, 'k30', 0.75), (3252, 1007, 'k43', 1.0), (3253, 2924, 'k56', 1.25), (3254, 1840, 'k69', 1.5), (3255, 756, 'k82', 1.75), (3256, 2673, 'k95', 2.0), (3257, 1589, 'k108', 2.25), (3258, 505, 'k121', 2.5), (3259, 2422, 'k134', 2.75), (3260, 1338, 'k147', 3.0), (3261, 254, 'k3', 3.25), (3262, 2171, 'k16', 3.5), (3263, 1087, 'k29', 3.75), (3264, 3, 'k42', 4.0), (3265, 1920, 'k55', 4.25), (3266, 836, 'k68', 4.5), (3267, 2753, 'k81', 4.75), (3268, 1669, 'k94', 5.0), (3269, 585, 'k107', 5.25), (3270, 2502, 'k120', 5.5), (3271, 1418, 'k133', 5.75), (3272, 334, 'k146', 6.0), (3273, 2251, 'k2', 6.25), (3274, 1167, 'k15', 6.5), (3275, 83, 'k28', 6.75), (3276, 2000, 'k41', 7.0), (3277, 916, 'k54', 0.0), (3278, 2833, 'k67', 0.25), (3279, 1749, 'k80', 0.5), (3280, 665, 'k93', 0.75), (3281, 2582, 'k106', 1.0), (3282, 1498, 'k119', 1.25), (3283, 414, 'k132', 1.5), (3284, 2331, 'k145', 1.75), (3285, 1247, 'k1', 2.0), (3286, 163, 'k14', 2.25), (3287, 2080, 'k27', 2.5), (3288, 996, 'k40', 2.75), (3289, 2913, 'k53', 3.0), (3290, 1829, 'k66', 3.25), (3291, 745, 'k79', 3.5), (3292, 2662, 'k92', 3.75), (3293, 1578, 'k105', 4.0), (3294, 494, 'k118', 4.25), (3295, 2411, 'k131', 4.5), (3296, 1327, 'k144', 4.75), (3297, 243, 'k0', 5.0), (3298, 2160, 'k13', 5.25), (3299, 1076, 'k26', 5.5), (3300, 2993, 'k39', 5.75), (3301, 1909, 'k52', 6.0), (3302, 825, 'k65', 6.25), (3303, 2742, 'k78', 6.5), (3304, 1658, 'k91', 6.75), (3305, 574, 'k104', 7.0), (3306, 2491, 'k117', 0.0), (3307, 1407, 'k130', 0.25), (3308, 323, 'k143', 0.5), (3309, 2240, 'k156', 0.75), (3310, 1156, 'k12', 1.0), (3311, 72, 'k25', 1.25), (3312, 1989, 'k38', 1.5), (3313, 905, 'k51', 1.75), (3314, 2822, 'k64', 2.0), (3315, 1738, 'k77', 2.25), (3316, 654, 'k90', 2.5), (3317, 2571, 'k103', 2.75), (3318, 1487, 'k116', 3.0), (3319, 403, 'k129', 3.25), (3320, 2320, 'k142', 3.5), (3321, 1236, 'k155', 3.75), (3322, 152, 'k11', 4.0), (3323, 2069, 'k24', 4.25), (3324, 985, 'k37', 4.5), (3325, 2902, 'k50', 4.75), (3326, 1818, 'k63', 5.0), (3327, 734, 'k76', 5.25), (3328, 2651, 'k89', 5.5), (3329, 1567, 'k102', 5.75), (3330, 483, 'k115', 6.0), (3331, 2400, 'k128', 6.25), (3332, 1316, 'k141', 6.5), (3333, 232, 'k154', 6.75), (3334, 2149, 'k10', 7.0), (3335, 1065, 'k23', 0.0), (3336, 2982, 'k36', 0.25), (3337, 1898, 'k49', 0.5), (3338, 814, 'k62', 0.75), (3339, 2731, 'k75', 1.0), (3340, 1647, 'k88', 1.25), (3341, 563, 'k101', 1.5), (3342, 2480, 'k114', 1.75), (3343, 1396, 'k127', 2.0), (3344, 312, 'k140', 2.25), (3345, 2229, 'k153', 2.5), (3346, 1145, 'k9', 2.75), (3347, 61, 'k22', 3.0), (3348, 1978, 'k35', 3.25), (3349, 894, 'k48', 3.5), (3350, 2811, 'k61', 3.75), (3351, 1727, 'k74', 4.0), (3352, 643, 'k87', 4.25), (3353, 2560, 'k100', 4.5), (3354, 1476, 'k113', 4.75), (3355, 392, 'k126', 5.0), (3356, 2309, 'k139', 5.25), (3357, 1225, 'k152', 5.5), (3358, 141, 'k8', 5.75), (3359, 2058, 'k21', 6.0), (3360, 974, 'k34', 6.25), (3361, 2891, 'k47', 6.5), (3362, 1807, 'k60', 6.75), (3363, 723, 'k73', 7.0), (3364, 2640, 'k86', 0.0), (3365, 1556, 'k99', 0.25), (3366, 472, 'k112', 0.5), (3367, 2389, 'k125', 0.75), (3368, 1305, 'k138', 1.0), (3369, 221, 'k151', 1.25), (3370, 2138, 'k7', 1.5), (3371, 1054, 'k20', 1.75), (3372, 2971, 'k33', 2.0), (3373, 1887, 'k46', 2.25), (3374, 803, 'k59', 2.5), (3375, 2720, 'k72', 2.75), (3376, 1636, 'k85', 3.0), (3377, 552, 'k98', 3.25), (3378, 2469, 'k111', 3.5), (3379, 1385, 'k124', 3.75), (3380, 301, 'k137', 4.0), (3381, 2218, 'k150', 4.25), (3382, 1134, 'k6', 4.5), (3383, 50, 'k19', 4.75), (3384, 1967, 'k32', 5.0), (3385, 883, 'k45', 5.25), (3386, 2800, 'k58', 5.5), (3387, 1716, 'k71', 5.75), (3388, 632, 'k84', 6.0), (3389, 2549, 'k97', 6.25), (3390, 1465, 'k110', 6.5), (3391, 381, 'k123', 6.75), (3392, 2298, 'k136', 7.0), (3393, 1214, 'k149', 0.0), (3394, 130, 'k5', 0.25), (3395, 2047, 'k18', 0.5), (3396, 963, 'k31', 0.75), (3397, 2880, 'k44', 1.0), (3398, 1796, 'k57', 1.25), (3399, 712, 'k70', 1.5), (3400, 2629, 'k83', 1.75), (3401, 1545, 'k96', 2.0), (3402, 461, 'k109', 2.25), (3403, 2378, 'k122', 2.5), (3404, 1294, 'k135', 2.75), (3405, 210, 'k148', 3.0), (3406, 2127, 'k4', 3.25), (3407, 1043, 'k17', 3.5), (3408, 2960, 'k30', 3.75), (3409, 1876, 'k43', 4.0), (3410, 792, 'k56', 4.25), (3411, 2709, 'k69', 4.5), (3412, 1625, 'k82', 4.75), (3413, 541, 'k95', 5.0), (3414, 2458, 'k108', 5.25), (3415, 1374, 'k121', 5.5), (3416, 290, 'k134', 5.75), (3417, 2207, 'k147', 6.0), (3418, 1123, 'k3', 6.25), (3419, 39, 'k16', 6.5), (3420, 1956, 'k29', 6.75), (3421, 872, 'k42', 7.0), (3422, 2789, 'k55', 0.0), (3423, 1705, 'k68', 0.25), (3424, 621, 'k81', 0.5), (3425, 2538, 'k94', 0.75), (3426, 1454, 'k107', 1.0), (3427, 370, 'k120', 1.25), (3428, 2287, 'k133', 1.5), (3429, 1203, 'k146', 1.75), (3430, 119, 'k2', 2.0), (3431, 2036, 'k15', 2.25), (3432, 952, 'k28', 2.5), (3433, 2869, 'k41', 2.75), (3434, 1785, 'k54', 3.0), (3435, 701, 'k67', 3.25), (3436, 2618, 'k80', 3.5), (3437, 1534, 'k93', 3.75), (3438, 450, 'k106', 4.0), (3439, 2367, 'k119', 4.25), (3440, 1283, 'k132', 4.5), (3441, 199, 'k145', 4.75), (3442, 2116, 'k1', 5.0), (3443, 1032, 'k14', 5.25), (3444, 2949, 'k27', 5.5), (3445, 1865, 'k40', 5.75), (3446, 781, 'k53', 6.0), (3447, 2698, 'k66', 6.25), (3448, 1614, 'k79', 6.5), (3449, 530, 'k92', 6.75), (3450, 2447, 'k105', 7.0), (3451, 1363, 'k118', 0.0), (3452, 279, 'k131', 0.25), (3453, 2196, 'k144', 0.5), (3454, 1112, 'k0', 0.75), (3455, 28, 'k13', 1.0), (3456, 1945, 'k26', 1.25), (3457, 861, 'k39', 1.5), (3458, 2778, 'k52', 1.75), (3459, 1694, 'k65', 2.0), (3460, 610, 'k78', 2.25), (3461, 2527, 'k91', 2.5), (3462, 1443, 'k104', 2.75), (3463, 359, 'k117', 3.0), (3464, 2276, 'k130', 3.25), (3465, 1192, 'k143', 3.5), (3466, 108, 'k156', 3.75), (3467, 2025, 'k12', 4.0), (3468, 941, 'k25', 4.25), (3469, 2858, 'k38', 4.5), (3470, 1774, 'k51', 4.75), (3471, 690, 'k64', 5.0), (3472, 2607, 'k77', 5.25), (3473, 1523, 'k90', 5.5), (3474, 439, 'k103', 5.75), (3475, 2356, 'k116', 6.0), (3476, 1272, 'k129', 6.25), (3477, 188, 'k142', 6.5), (3478, 2105, 'k155', 6.75), (3479, 1021, 'k11', 7.0), (3480, 2938, 'k24', 0.0), (3481, 1854, 'k37', 0.25), (3482, 770, 'k50', 0.5), (3483, 2687, 'k63', 0.75), (3484, 1603, 'k76', 1.0), (3485, 519, 'k89', 1.25), (3486, 2436, 'k102', 1.5), (3487, 1352, 'k115', 1.75), (3488, 268, 'k128', 2.0), (3489, 2185, 'k141', 2.25), (3490, 1101, 'k154', 2.5), (3491, 17, 'k10', 2.75), (3492, 1934, 'k23', 3.0), (3493, 850, 'k36', 3.25), (3494, 2767, 'k49', 3.5), (3495, 1683, 'k62', 3.75), (3496, 599, 'k75', 4.0), (3497, 2516, 'k88', 4.25), (3498, 1432, 'k101', 4.5), (3499, 348, 'k114', 4.75), (3500, 2265, 'k127', 5.0), (3501, 1181, 'k140', 5.25), (3502, 97, 'k153', 5.5), (3503, 2014, 'k9', 5.75), (3504, 930, 'k22', 6.0), (3505, 2847, 'k35', 6.25), (3506, 1763, 'k48', 6.5), (3507, 679, 'k61', 6.75), (3508, 2596, 'k74', 7.0), (3509, 1512, 'k87', 0.0), (3510, 428, 'k100', 0.25), (3511, 2345, 'k113', 0.5), (3512, 1261, 'k126', 0.75), (3513, 177, 'k139', 1.0), (3514, 2094, 'k152', 1.25), (3515, 1010, 'k8', 1.5), (3516, 2927, 'k21', 1.75), (3517, 1843, 'k34', 2.0), (3518, 759, 'k47', 2.25), (3519, 2676, 'k60', 2.5), (3520, 1592, 'k73', 2.75), (3521, 508, 'k86', 3.0), (3522, 2425, 'k99', 3.25), (3523, 1341, 'k112', 3.5), (3524, 257, 'k125', 3.75), (3525, 2174, 'k138', 4.0), (3526, 1090, 'k151', 4.25), (3527, 6, 'k7', 4.5), (3528, 1923, 'k20', 4.75), (3529, 839, 'k33', 5.0), (3530, 2756, 'k46', 5.25), (3531, 1672, 'k59', 5.5), (3532, 588, 'k72', 5.75), (3533, 2505, 'k85', 6.0), (3534, 1421, 'k98', 6.25), (3535, 337, 'k111', 6.5), (3536, 2254, 'k124', 6.75), (3537, 1170, 'k137', 7.0), (3538, 86, 'k150', 0.0), (3539, 2003, 'k6', 0.25), (3540, 919, 'k19', 0.5), (3541, 2836, 'k32', 0.75), (3542, 1752, 'k45', 1.0), (3543, 668, 'k58', 1.25), (3544, 2585, 'k71', 1.5), (3545, 1501, 'k84', 1.75), (3546, 417, 'k97', 2.0), (3547, 2334, 'k110', 2.25), (3548, 1250, 'k123', 2.5), (3549, 166, 'k136', 2.75), (3550, 2083, 'k149', 3.0), (3551, 999, 'k5', 3.25), (3552, 2916, 'k18', 3.5), (3553, 1832, 'k31', 3.75), (3554, 748, 'k44', 4.0), (3555, 2665, 'k57', 4.25), (3556, 1581, 'k70', 4.5), (3557, 497, 'k83', 4.75), (3558, 2414, 'k96', 5.0), (3559, 1330, 'k109', 5.25), (3560, 246, 'k122', 5.5), (3561, 2163, 'k135', 5.75), (3562, 1079, 'k148', 6.0), (3563, 2996, 'k4', 6.25), (3564, 1912, 'k17', 6.5), (3565, 828, 'k30', 6.75), (3566, 2745, 'k43', 7.0), (3567, 1661, 'k56', 0.0), (3568, 577, 'k69', 0.25), (3569, 2494, 'k82', 0.5), (3570, 1410, 'k95', 0.75), (3571, 326, 'k108', 1.0), (3572, 2243, 'k121', 1.25), (3573, 1159, 'k134', 1.5), (3574, 75, 'k147', 1.75), (3575, 1992, 'k3', 2.0), (3576, 908, 'k16', 2.25), (3577, 2825, 'k29', 2.5), (3578, 1741, 'k42', 2.75), (3579, 657, 'k55', 3.0), (3580, 2574, 'k68', 3.25), (3581, 1490, 'k81', 3.5), (3582, 406, 'k94', 3.75), (3583, 2323, 'k107', 4.0), (3584, 1239, 'k120', 4.25), (3585, 155, 'k133', 4.5), (3586, 2072, 'k146', 4.75), (3587, 988, 'k2', 5.0), (3588, 2905, 'k15', 5.25), (3589, 1821, 'k28', 5.5), (3590, 737, 'k41', 5.75), (3591, 2654, 'k54', 6.0), (3592, 1570, 'k67', 6.25), (3593, 486, 'k80', 6.5), (3594, 2403, 'k93', 6.75), (3595, 1319, 'k106', 7.0), (3596, 235, 'k119', 0.0), (3597, 2152, 'k132', 0.25), (3598, 1068, 'k145', 0.5), (3599, 2985, 'k1', 0.75), (3600, 1901, 'k14', 1.0), (3601, 817, 'k27', 1.25), (3602, 2734, 'k40', 1.5), (3603, 1650, 'k53', 1.75), (3604, 566, 'k66', 2.0), (3605, 2483, 'k79', 2.25), (3606, 1399, 'k92', 2.5), (3607, 315, 'k105', 2.75), (3608, 2232, 'k118', 3.0), (3609, 1148, 'k131', 3.25), (3610, 64, 'k144', 3.5), (3611, 1981, 'k0', 3.75), (3612, 897, 'k13', 4.0), (3613, 2814, 'k26', 4.25), (3614, 1730, 'k39', 4.5), (3615, 646, 'k52', 4.75), (3616, 2563, 'k65', 5.0), (3617, 1479, 'k78', 5.25), (3618, 395, 'k91', 5.5), (3619, 2312, 'k104', 5.75), (3620, 1228, 'k117', 6.0), (3621, 144, 'k130', 6.25), (3622, 2061, 'k143', 6.5), (3623, 977, 'k156', 6.75), (3624, 2894, 'k12', 7.0), (3625, 1810, 'k25', 0.0), (3626, 726, 'k38', 0.25), (3627, 2643, 'k51', 0.5), (3628, 1559, 'k64', 0.75), (3629, 475, 'k77', 1.0), (3630, 2392, 'k90', 1.25), (3631, 1308, 'k103', 1.5), (3632, 224, 'k116', 1.75), (3633, 2141, 'k129', 2.0), (3634, 1057, 'k142', 2.25), (3635, 2974, 'k155', 2.5), (3636, 1890, 'k11', 2.75), (3637, 806, 'k24', 3.0), (3638, 2723, 'k37', 3.25), (3639, 1639, 'k50', 3.5), (3640, 555, 'k63', 3.75), (3641, 2472, 'k76', 4.0), (3642, 1388, 'k89', 4.25), (3643, 304, 'k102', 4.5), (3644, 2221, 'k115', 4.75), (3645, 1137, 'k128', 5.0), (3646, 53, 'k141', 5.25), (3647, 1970, 'k154', 5.5), (3648, 886, 'k10', 5.75), (3649, 2803, 'k23', 6.0), (3650, 1719, 'k36', 6.25), (3651, 635, 'k49', 6.5), (3652, 2552, 'k62', 6.75), (3653, 1468, 'k75', 7.0), (3654, 384, 'k88', 0.0), (3655, 2301, 'k101', 0.25), (3656, 1217, 'k114', 0.5), (3657, 133, 'k127', 0.75), (3658, 2050, 'k140', 1.0), (3659, 966, 'k153', 1.25), (3660, 2883, 'k9', 1.5), (3661, 1799, 'k22', 1.75), (3662, 715, 'k35', 2.0), (3663, 2632, 'k48', 2.25), (3664, 1548, 'k61', 2.5), (3665, 464, 'k74', 2.75), (3666, 2381, 'k87', 3.0), (3667, 1297, 'k100', 3.25), (3668, 213, 'k113', 3.5), (3669, 2130, 'k126', 3.75), (3670, 1046, 'k139', 4.0), (3671, 2963, 'k152', 4.25), (3672, 1879, 'k8', 4.5), (3673, 795, 'k21', 4.75), (3674, 2712, 'k34', 5.0), (3675, 1628, 'k47', 5.25), (3676, 544, 'k60', 5.5), (3677, 2461, 'k73', 5.75), (3678, 1377, 'k86', 6.0), (3679, 293, 'k99', 6.25), (3680, 2210, 'k112', 6.5), (3681, 1126, 'k125', 6.75), (3682, 42, 'k138', 7.0), (3683, 1959, 'k151', 0.0), (3684, 875, 'k7', 0.25), (3685, 2792, 'k20', 0.5), (3686, 1708, 'k33', 0.75), (3687, 624, 'k46', 1.0), (3688, 2541, 'k59', 1.25), (3689, 1457, 'k72', 1.5), (3690, 373, 'k85', 1.75), (3691, 2290, 'k98', 2.0), (3692, 1206, 'k111', 2.25), (3693, 122, 'k124', 2.5), (3694, 2039, 'k137', 2.75), (3695, 955, 'k150', 3.0), (3696, 2872, 'k6', 3.25), (3697, 1788, 'k19', 3.5), (3698, 704, 'k32', 3.75), (3699, 2621, 'k45', 4.0), (3700, 1537, 'k58', 4.25), (3701, 453, 'k71', 4.5), (3702, 2370, 'k84', 4.75), (3703, 1286, 'k97', 5.0), (3704, 202, 'k110', 5.25), (3705, 2119, 'k123', 5.5), (3706, 1035, 'k136', 5.75), (3707, 2952, 'k149', 6.0), (3708, 1868, 'k5', 6.25), (3709, 784, 'k18', 6.5), (3710, 2701, 'k31', 6.75), (3711, 1617, 'k44', 7.0), (3712, 533, 'k57', 0.0), (3713, 2450, 'k70', 0.25), (3714, 1366, 'k83', 0.5), (3715, 282, 'k96', 0.75), (3716, 2199, 'k109', 1.0), (3717, 1115, 'k122', 1.25), (3718, 31, 'k135', 1.5), (3719, 1948, 'k148', 1.75), (3720, 864, 'k4', 2.0), (3721, 2781, 'k17', 2.25), (3722, 1697, 'k30', 2.5), (3723, 613, 'k43', 2.75), (3724, 2530, 'k56', 3.0), (3725, 1446, 'k69', 3.25), (3726, 362, 'k82', 3.5), (3727, 2279, 'k95', 3.75), (3728, 1195, 'k108', 4.0), (3729, 111, 'k121', 4.25), (3730, 2028, 'k134', 4.5), (3731, 944, 'k147', 4.75), (3732, 2861, 'k3', 5.0), (3733, 1777, 'k16', 5.25), (3734, 693, 'k29', 5.5), (3735, 2610, 'k42', 5.75), (3736, 1526, 'k55', 6.0), (3737, 442, 'k68', 6.25), (3738, 2359, 'k81', 6.5), (3739, 1275, 'k94', 6.75), (3740, 191, 'k107', 7.0), (3741, 2108, 'k120', 0.0), (3742, 1024, 'k133', 0.25), (3743, 2941, 'k146', 0.5), (3744, 1857, 'k2', 0.75), (3745, 773, 'k15', 1.0), (3746, 2690, 'k28', 1.25), (3747, 1606, 'k41', 1.5), (3748, 522, 'k54', 1.75), (3749, 2439, 'k67', 2.0), (3750, 1355, 'k80', 2.25), (3751, 271, 'k93', 2.5), (3752, 2188, 'k106', 2.75), (3753, 1104, 'k119', 3.0), (3754, 20, 'k132', 3.25), (3755, 1937, 'k145', 3.5), (3756, 853, 'k1', 3.75), (3757, 2770, 'k14', 4.0), (3758, 1686, 'k27', 4.25), (3759, 602, 'k40', 4.5), (3760, 2519, 'k53', 4.75), (3761, 1435, 'k66', 5.0), (3762, 351, 'k79', 5.25), (3763, 2268, 'k92', 5.5), (3764, 1184, 'k105', 5.75), (3765, 100, 'k118', 6.0), (3766, 2017, 'k131', 6.25), (3767, 933, 'k144', 6.5), (3768, 2850, 'k0', 6.75), (3769, 1766, 'k13', 7.0), (3770, 682, 'k26', 0.0), (3771, 2599, 'k39', 0.25), (3772, 1515, 'k52', 0.5), (3773, 431, 'k65', 0.75), (3774, 2348, 'k78', 1.0), (3775, 1264, 'k91', 1.25), (3776, 180, 'k104', 1.5), (3777, 2097, 'k117', 1.75), (3778, 1013, 'k130', 2.0), (3779, 2930, 'k143', 2.25), (3780, 1846, 'k156', 2.5), (3781, 762, 'k12', 2.75), (3782, 2679, 'k25', 3.0), (3783, 1595, 'k38', 3.25), (3784, 511, 'k51', 3.5), (3785, 2428, 'k64', 3.75), (3786, 1344, 'k77', 4.0), (3787, 260, 'k90', 4.25), (3788, 2177, 'k103', 4.5), (3789, 1093, 'k116', 4.75), (3790, 9, 'k129', 5.0), (3791, 1926, 'k142', 5.25), (3792, 842, 'k155', 5.5), (3793, 2759, 'k11', 5.75), (3794, 1675, 'k24', 6.0), (3795, 591, 'k37', 6.25), (3796, 2508, 'k50', 6.5), (3797, 1424, 'k63', 6.75), (3798, 340, 'k76', 7.0), (3799, 2257, 'k89', 0.0), (3800, 1173, 'k102', 0.25), (3801, 89, 'k115', 0.5), (3802, 2006, 'k128', 0.75), (3803, 922, 'k141', 1.0), (3804, 2839, 'k154', 1.25), (3805, 1755, 'k10', 1.5), (3806, 671, 'k23', 1.75), (3807, 2588, 'k36', 2.0), (3808, 1504, 'k49', 2.25), (3809, 420, 'k62', 2.5), (3810, 2337, 'k75', 2.75), (3811, 1253, 'k88', 3.0), (3812, 169, 'k101', 3.25), (3813, 2086, 'k114', 3.5), (3814, 1002, 'k127', 3.75), (3815, 2919, 'k140', 4.0), (3816, 1835, 'k153', 4.25), (3817, 751, 'k9', 4.5), (3818, 2668, 'k22', 4.75), (3819, 1584, 'k35', 5.0), (3820, 500, 'k48', 5.25), (3821, 2417, 'k61', 5.5), (3822, 1333, 'k74', 5.75), (3823, 249, 'k87', 6.0), (3824, 2166, 'k100', 6.25), (3825, 1082, 'k113', 6.5), (3826, 2999, 'k126', 6.75), (3827, 1915, 'k139', 7.0), (3828, 831, 'k152', 0.0), (3829, 2748, 'k8', 0.25), (3830, 1664, 'k21', 0.5), (3831, 580, 'k34', 0.75), (3832, 2497, 'k47', 1.0), (3833, 1413, 'k60', 1.25), (3834, 329, 'k73', 1.5), (3835, 2246, 'k86', 1.75), (3836, 1162, 'k99', 2.0), (3837, 78, 'k112', 2.25), (3838, 1995, 'k125', 2.5), (3839, 911, 'k138', 2.75), (3840, 2828, 'k151', 3.0), (3841, 1744, 'k7', 3.25), (3842, 660, 'k20', 3.5), (3843, 2577, 'k33', 3.75), (3844, 1493, 'k46', 4.0), (3845, 409, 'k59', 4.25), (3846, 2326, 'k72', 4.5), (3847, 1242, 'k85', 4.75), (3848, 158, 'k98', 5.0), (3849, 2075, 'k111', 5.25), (3850, 991, 'k124', 5.5), (3851, 2908, 'k137', 5.75), (3852, 1824, 'k150', 6.0), (3853, 740, 'k6', 6.25), (3854, 2657, 'k19', 6.5), (3855, 1573, 'k32', 6.75), (3856, 489, 'k45', 7.0), (3857, 2406, 'k58', 0.0), (3858, 1322, 'k71', 0.25), (3859, 238, 'k84', 0.5), (3860, 2155, 'k97', 0.75), (3861, 1071, 'k110', 1.0), (3862, 2988, 'k123', 1.25), (3863, 1904, 'k136', 1.5), (3864, 820, 'k149', 1.75), (3865, 2737, 'k5', 2.0), (3866, 1653, 'k18', 2.25), (3867, 569, 'k31', 2.5), (3868, 2486, 'k44', 2.75), (3869, 1402, 'k57', 3.0), (3870, 318, 'k70', 3.25), (3871, 2235, 'k83', 3.5), (3872, 1151, 'k96', 3.75), (3873, 67, 'k109', 4.0), (3874, 1984, 'k122', 4.25), (3875, 900, 'k135', 4.5), (3876, 2817, 'k148', 4.75), (3877, 1733, 'k4', 5.0), (3878, 649, 'k17', 5.25), (3879, 2566, 'k30', 5.5), (3880, 1482, 'k43', 5.75), (3881, 398, 'k56', 6.0), (3882, 2315, 'k69', 6.25), (3883, 1231, 'k82', 6.5), (3884, 147, 'k95', 6.75), (3885, 2064, 'k108', 7.0), (3886, 980, 'k121', 0.0), (3887, 2897, 'k134', 0.25), (3888, 1813, 'k147', 0.5), (3889, 729, 'k3', 0.75), (3890, 2646, 'k16', 1.0), (3891, 1562, 'k29', 1.25), (3892, 478, 'k42', 1.5), (3893, 2395, 'k55', 1.75), (3894, 1311, 'k68', 2.0), (3895, 227, 'k81', 2.25), (3896, 2144, 'k94', 2.5), (3897, 1060, 'k107', 2.75), (3898, 2977, 'k120', 3.0), (3899, 1893, 'k133', 3.25), (3900, 809, 'k146', 3.5), (3901, 2726, 'k2', 3.75), (3902, 1642, 'k15', 4.0), (3903, 558, 'k28', 4.25), (3904, 2475, 'k41', 4.5), (3905, 1391, 'k54', 4.75), (3906, 307, 'k67', 5.0), (3907, 2224, 'k80', 5.25), (3908, 1140, 'k93', 5.5), (3909, 56, 'k106', 5.75), (3910, 1973, 'k119', 6.0), (3911, 889, 'k132', 6.25), (3912, 2806, 'k145', 6.5), (3913, 1722, 'k1', 6.75), (3914, 638, 'k14', 7.0), (3915, 2555, 'k27', 0.0), (3916, 1471, 'k40', 0.25), (3917, 387, 'k53', 0.5), (3918, 2304, 'k66', 0.75), (3919, 1220, 'k79', 1.0), (3920, 136, 'k92', 1.25), (3921, 2053, 'k105', 1.5), (3922, 969, 'k118', 1.75), (3923, 2886, 'k131', 2.0), (3924, 1802, 'k144', 2.25), (3925, 718, 'k0', 2.5), (3926, 2635, 'k13', 2.75), (3927, 1551, 'k26', 3.0), (3928, 467, 'k39', 3.25), (3929, 2384, 'k52', 3.5), (3930, 1300, 'k65', 3.75), (3931, 216, 'k78', 4.0), (3932, 2133, 'k91', 4.25), (3933, 1049, 'k104', 4.5), (3934, 2966, 'k117', 4.75), (3935, 1882, 'k130', 5.0), (3936, 798, 'k143', 5.25), (3937, 2715, 'k156', 5.5), (3938, 1631, 'k12', 5.75), (3939, 547, 'k25', 6.0), (3940, 2464, 'k38', 6.25), (3941, 1380, 'k51', 6.5), (3942, 296, 'k64', 6.75), (3943, 2213, 'k77', 7.0), (3944, 1129, 'k90', 0.0), (3945, 45, 'k103', 0.25), (3946, 1962, 'k116', 0.5), (3947, 878, 'k129', 0.75), (3948, 2795, 'k142', 1.0), (3949, 1711, 'k155', 1.25), (3950, 627, 'k11', 1.5), (3951, 2544, 'k24', 1.75), (3952, 1460, 'k37', 2.0), (3953, 376, 'k50', 2.25), (3954, 2293, 'k63', 2.5), (3955, 1209, 'k76', 2.75), (3956, 125, 'k89', 3.0), (3957, 2042, 'k102', 3.25), (3958, 958, 'k115', 3.5), (3959, 2875, 'k128', 3.75), (3960, 1791, 'k141', 4.0), (3961, 707, 'k154', 4.25), (3962, 2624, 'k10', 4.5), (3963, 1540, 'k23', 4.75), (3964, 456, 'k36', 5.0), (3965, 2373, 'k49', 5.25), (3966, 1289, 'k62', 5.5), (3967, 205, 'k75', 5.75), (3968, 2122, 'k88', 6.0), (3969, 1038, 'k101', 6.25), (3970, 2955, 'k114', 6.5), (3971, 1871, 'k127', 6.75), (3972, 787, 'k140', 7.0), (3973, 2704, 'k153', 0.0), (3974, 1620, 'k9', 0.25), (3975, 536, 'k22', 0.5), (3976, 2453, 'k35', 0.75), (3977, 1369, 'k48', 1.0), (3978, 285, 'k61', 1.25), (3979, 2202, 'k74', 1.5), (3980, 1118, 'k87', 1.75), (3981, 34, 'k100', 2.0), (3982, 1951, 'k113', 2.25), (3983, 867, 'k126', 2.5), (3984, 2784, 'k139', 2.75), (3985, 1700, 'k152', 3.0), (3986, 616, 'k8', 3.25), (3987, 2533, 'k21', 3.5), (3988, 1449, 'k34', 3.75), (3989, 365, 'k47', 4.0), (3990, 2282, 'k60', 4.25), (3991, 1198, 'k73', 4.5), (3992, 114, 'k86', 4.75), (3993, 2031, 'k99', 5.0), (3994, 947, 'k112', 5.25), (3995, 2864, 'k125', 5.5), (3996, 1780, 'k138', 5.75), (3997, 696, 'k151', 6.0), (3998, 2613, 'k7', 6.25), (3999, 1529, 'k20', 6.5), (4000, 445, 'k33', 6.75), (4001, 2362, 'k46', 7.0), (4002, 1278, 'k59', 0.0), (4003, 194, 'k72', 0.25), (4004, 2111, 'k85', 0.5), (4005, 1027, 'k98', 0.75), (4006, 2944, 'k111', 1.0), (4007, 1860, 'k124', 1.25), (4008, 776, 'k137', 1.5), (4009, 2693, 'k150', 1.75), (4010, 1609, 'k6', 2.0), (4011, 525, 'k19', 2.25), (4012, 2442, 'k32', 2.5), (4013, 1358, 'k45', 2.75), (4014, 274, 'k58', 3.0), (4015, 2191, 'k71', 3.25), (4016, 1107, 'k84', 3.5), (4017, 23, 'k97', 3.75), (4018, 1940, 'k110', 4.0), (4019, 856, 'k123', 4.25), (4020, 2773, 'k136', 4.5), (4021, 1689, 'k149', 4.75), (4022, 605, 'k5', 5.0), (4023, 2522, 'k18', 5.25), (4024, 1438, 'k31', 5.5), (4025, 354, 'k44', 5.75), (4026, 2271, 'k57', 6.0), (4027, 1187, 'k70', 6.25), (4028, 103, 'k83', 6.5), (4029, 2020, 'k96', 6.75), (4030, 936, 'k109', 7.0), (4031, 2853, 'k122', 0.0), (4032, 1769, 'k135', 0.25), (4033, 685, 'k148', 0.5), (4034, 2602, 'k4', 0.75), (4035, 1518, 'k17', 1.0), (4036, 434, 'k30', 1.25), (4037, 2351, 'k43', 1.5), (4038, 1267, 'k56', 1.75), (4039, 183, 'k69', 2.0), (4040, 2100, 'k82', 2.25), (4041, 1016, 'k95', 2.5), (4042, 2933, 'k108', 2.75), (4043, 1849, 'k121', 3.0), (4044, 765, 'k134', 3.25), (4045, 2682, 'k147', 3.5), (4046, 1598, 'k3', 3.75), (4047, 514, 'k16', 4.0), (4048, 2431, 'k29', 4.25), (4049, 1347, 'k42', 4.5), (4050, 263, 'k55', 4.75), (4051, 2180, 'k68', 5.0), (4052, 1096, 'k81', 5.25), (4053, 12, 'k94', 5.5), (4054, 1929, 'k107', 5.75), (4055, 845, 'k120', 6.0), (4056, 2762, 'k133', 6.25), (4057, 1678, 'k146', 6.5), (4058, 594, 'k2', 6.75), (4059, 2511, 'k15', 7.0), (4060, 1427, 'k28', 0.0), (4061, 343, 'k41', 0.25), (4062, 2260, 'k54', 0.5), (4063, 1176, 'k67', 0.75), (4064, 92, 'k80', 1.0), (4065, 2009, 'k93', 1.25), (4066, 925, 'k106', 1.5), (4067, 2842, 'k119', 1.75), (4068, 1758, 'k132', 2.0), (4069, 674, 'k145', 2.25), (4070, 2591, 'k1', 2.5), (4071, 1507, 'k14', 2.75), (4072, 423, 'k27', 3.0), (4073, 2340, 'k40', 3.25), (4074, 1256, 'k53', 3.5), (4075, 172, 'k66', 3.75), (4076, 2089, 'k79', 4.0), (4077, 1005, 'k92', 4.25), (4078, 2922, 'k105', 4.5), (4079, 1838, 'k118', 4.75), (4080, 754, 'k131', 5.0), (4081, 2671, 'k144', 5.25), (4082, 1587, 'k0', 5.5), (4083, 503, 'k13', 5.75), (4084, 2420, 'k26', 6.0), (4085, 1336, 'k39', 6.25), (4086, 252, 'k52', 6.5), (4087, 2169, 'k65', 6.75), (4088, 1085, 'k78', 7.0), (4089, 1, 'k91', 0.0), (4090, 1918, 'k104', 0.25), (4091, 834, 'k117', 0.5), (4092, 2751, 'k130', 0.75), (4093, 1667, 'k143', 1.0), (4094, 583, 'k156', 1.25), (4095, 2500, 'k12', 1.5), (4096, 1416, 'k25', 1.75), (4097, 332, 'k38', 2.0), (4098, 2249, 'k51', 2.25), (4099, 1165, 'k64', 2.5), (4100, 81, 'k77', 2.75), (4101, 1998, 'k90', 3.0), (4102, 914, 'k103', 3.25), (4103, 2831, 'k116', 3.5), (4104, 1747, 'k129', 3.75), (4105, 663, 'k142', 4.0), (4106, 2580, 'k155', 4.25), (4107, 1496, 'k11', 4.5), (4108, 412, 'k24', 4.75), (4109, 2329, 'k37', 5.0), (4110, 1245, 'k50', 5.25), (4111, 161, 'k63', 5.5), (4112, 2078, 'k76', 5.75), (4113, 994, 'k89', 6.0), (4114, 2911, 'k102', 6.25), (4115, 1827, 'k115', 6.5), (4116, 743, 'k128', 6.75), (4117, 2660, 'k141', 7.0), (4118, 1576, 'k154', 0.0), (4119, 492, 'k10', 0.25), (4120, 2409, 'k23', 0.5), (4121, 1325, 'k36', 0.75), (4122, 241, 'k49', 1.0), (4123, 2158, 'k62', 1.25), (4124, 1074, 'k75', 1.5), (4125, 2991, 'k88', 1.75), (4126, 1907, 'k101', 2.0), (4127, 823, 'k114', 2.25), (4128, 2740, 'k127', 2.5), (4129, 1656, 'k140', 2.75), (4130, 572, 'k153', 3.0), (4131, 2489, 'k9', 3.25), (4132, 1405, 'k22', 3.5), (4133, 321, 'k35', 3.75), (4134, 2238, 'k48', 4.0), (4135, 1154, 'k61', 4.25), (4136, 70, 'k74', 4.5), (4137, 1987, 'k87', 4.75), (4138, 903, 'k100', 5.0), (4139, 2820, 'k113', 5.25), (4140, 1736, 'k126', 5.5), (4141, 652, 'k139', 5.75), (4142, 2569, 'k152', 6.0), (4143, 1485, 'k8', 6.25), (4144, 401, 'k21', 6.5), (4145, 2318, 'k34', 6.75), (4146, 1234, 'k47', 7.0), (4147, 150, 'k60', 0.0), (4148, 2067, 'k73', 0.25), (4149, 983, 'k86', 0.5), (4150, 2900, 'k99', 0.75), (4151, 1816, 'k112', 1.0), (4152, 732, 'k125', 1.25), (4153, 2649, 'k138', 1.5), (4154, 1565, 'k151', 1.75), (4155, 481, 'k7', 2.0), (4156, 2398, 'k20', 2.25), (4157, 1314, 'k33', 2.5), (4158, 230, 'k46', 2.75), (4159, 2147, 'k59', 3.0), (4160, 1063, 'k72', 3.25), (4161, 2980, 'k85', 3.5), (4162, 1896, 'k98', 3.75), (4163, 812, 'k111', 4.0), (4164, 2729, 'k124', 4.25), (4165, 1645, 'k137', 4.5), (4166, 561, 'k150', 4.75), (4167, 2478, 'k6', 5.0), (4168, 1394, 'k19', 5.25), (4169, 310, 'k32', 5.5), (4170, 2227, 'k45', 5.75), (4171, 1143, 'k58', 6.0), (4172, 59, 'k71', 6.25), (4173, 1976, 'k84', 6.5), (4174, 892, 'k97', 6.75), (4175, 2809, 'k110', 7.0), (4176, 1725, 'k123', 0.0), (4177, 641, 'k136', 0.25), (4178, 2558, 'k149', 0.5), (4179, 1474, 'k5', 0.75), (4180, 390, 'k18', 1.0), (4181, 2307, 'k31', 1.25), (4182, 1223, 'k44', 1.5), (4183, 139, 'k57', 1.75), (4184, 2056, 'k70', 2.0), (4185, 972, 'k83', 2.25), (4186, 2889, 'k96', 2.5), (4187, 1805, 'k109', 2.75), (4188, 721, 'k122', 3.0), (4189, 2638, 'k135', 3.25), (4190, 1554, 'k148', 3.5), (4191, 470, 'k4', 3.75), (4192, 2387, 'k17', 4.0), (4193, 1303, 'k30', 4.25), (4194, 219, 'k43', 4.5), (4195, 2136, 'k56', 4.75), (4196, 1052, 'k69', 5.0), (4197, 2969, 'k82', 5.25), (4198, 1885, 'k95', 5.5), (4199, 801, 'k108', 5.75), (4200, 2718, 'k121', 6.0), (4201, 1634, 'k134', 6.25), (4202, 550, 'k147', 6.5), (4203, 2467, 'k3', 6.75), (4204, 1383, 'k16', 7.0), (4205, 299, 'k29', 0.0), (4206, 2216, 'k42', 0.25), (4207, 1132, 'k55', 0.5), (4208, 48, 'k68', 0.75), (4209, 1965, 'k81', 1.0), (4210, 881, 'k94', 1.25), (4211, 2798, 'k107', 1.5), (4212, 1714, 'k120', 1.75), (4213, 630, 'k133', 2.0), (4214, 2547, 'k146', 2.25), (4215, 1463, 'k2', 2.5), (4216, 379, 'k15', 2.75), (4217, 2296, 'k28', 3.0), (4218, 1212, 'k41', 3.25), (4219, 128, 'k54', 3.5), (4220, 2045, 'k67', 3.75), (4221, 961, 'k80', 4.0), (4222, 2878, 'k93', 4.25), (4223, 1794, 'k106', 4.5), (4224, 710, 'k119', 4.75), (4225, 2627, 'k132', 5.0), (4226, 1543, 'k145', 5.25), (4227, 459, 'k1', 5.5), (4228, 2376, 'k14', 5.75), (4229, 1292, 'k27', 6.0), (4230, 208, 'k40', 6.25), (4231, 2125, 'k53', 6.5), (4232, 1041, 'k66', 6.75), (4233, 2958, 'k79', 7.0), (4234, 1874, 'k92', 0.0), (4235, 790, 'k105', 0.25), (4236, 2707, 'k118', 0.5), (4237, 1623, 'k131', 0.75), (4238, 539, 'k144', 1.0), (4239, 2456, 'k0', 1.25), (4240, 1372, 'k13', 1.5), (4241, 288, 'k26', 1.75), (4242, 2205, 'k39', 2.0), (4243, 1121, 'k52', 2.25), (4244, 37, 'k65', 2.5), (4245, 1954, 'k78', 2.75), (4246, 870, 'k91', 3.0), (4247, 2787, 'k104', 3.25), (4248, 1703, 'k117', 3.5), (4249, 619, 'k130', 3.75), (4250, 2536, 'k143', 4.0), (4251, 1452, 'k156', 4.25), (4252, 368, 'k12', 4.5), (4253, 2285, 'k25', 4.75), (4254, 1201, 'k38', 5.0), (4255, 117, 'k51', 5.25), (4256, 2034, 'k64', 5.5), (4257, 950, 'k77', 5.75), (4258, 2867, 'k90', 6.0), (4259, 1783, 'k103', 6.25), (4260, 699, 'k116', 6.5), (4261, 2616, 'k129', 6.75), (4262, 1532, 'k142', 7.0), (4263, 448, 'k155', 0.0), (4264, 2365, 'k11', 0.25), (4265, 1281, 'k24', 0.5), (4266, 197, 'k37', 0.75), (4267, 2114, 'k50', 1.0), (4268, 1030, 'k63', 1.25), (4269, 2947, 'k76', 1.5), (4270, 1863, 'k89', 1.75), (4271, 779, 'k102', 2.0), (4272, 2696, 'k115', 2.25), (4273, 1612, 'k128', 2.5), (4274, 528, 'k141', 2.75), (4275, 2445, 'k154', 3.0), (4276, 1361, 'k10', 3.25), (4277, 277, 'k23', 3.5), (4278, 2194, 'k36', 3.75), (4279, 1110, 'k49', 4.0), (4280, 26, 'k62', 4.25), (4281, 1943, 'k75', 4.5), (4282, 859, 'k88', 4.75), (4283, 2776, 'k101', 5.0), (4284, 1692, 'k114', 5.25), (4285, 608, 'k127', 5.5), (4286, 2525, 'k140', 5.75), (4287, 1441, 'k153', 6.0), (4288, 357, 'k9', 6.25), (4289, 2274, 'k22', 6.5), (4290, 1190, 'k35', 6.75), (4291, 106, 'k48', 7.0), (4292, 2023, 'k61', 0.0), (4293, 939, 'k74', 0.25), (4294, 2856, 'k87', 0.5), (4295, 1772, 'k100', 0.75), (4296, 688, 'k113', 1.0), (4297, 2605, 'k126', 1.25), (4298, 1521, 'k139', 1.5), (4299, 437, 'k152', 1.75), (4300, 2354, 'k8', 2.0), (4301, 1270, 'k21', 2.25), (4302, 186, 'k34', 2.5), (4303, 2103, 'k47', 2.75), (4304, 1019, 'k60', 3.0), (4305, 2936, 'k73', 3.25), (4306, 1852, 'k86', 3.5), (4307, 768, 'k99', 3.75), (4308, 2685, 'k112', 4.0), (4309, 1601, 'k125', 4.25), (4310, 517, 'k138', 4.5), (4311, 2434, 'k151', 4.75), (4312, 1350, 'k7', 5.0), (4313, 266, 'k20', 5.25), (4314, 2183, 'k33', 5.5), (4315, 1099, 'k46', 5.75), (4316, 15, 'k59', 6.0), (4317, 1932, 'k72', 6.25), (4318, 848, 'k85', 6.5), (4319, 2765, 'k98', 6.75), (4320, 1681, 'k111', 7.0), (4321, 597, 'k124', 0.0), (4322, 2514, 'k137', 0.25), (4323, 1430, 'k150', 0.5), (4324, 346, 'k6', 0.75), (4325, 2263, 'k19', 1.0), (4326, 1179, 'k32', 1.25), (4327, 95, 'k45', 1.5), (4328, 2012, 'k58', 1.75), (4329, 928, 'k71', 2.0), (4330, 2845, 'k84', 2.25), (4331, 1761, 'k97', 2.5), (4332, 677, 'k110', 2.75), (4333, 2594, 'k123', 3.0), (4334, 1510, 'k136', 3.25), (4335, 426, 'k149', 3.5), (4336, 2343, 'k5', 3.75), (4337, 1259, 'k18', 4.0), (4338, 175, 'k31', 4.25), (4339, 2092, 'k44', 4.5), (4340, 1008, 'k57', 4.75), (4341, 2925, 'k70', 5.0), (4342, 1841, 'k83', 5.25), (4343, 757, 'k96', 5.5), (4344, 2674, 'k109', 5.75), (4345, 1590, 'k122', 6.0), (4346, 506, 'k135', 6.25), (4347, 2423, 'k148', 6.5), (4348, 1339, 'k4', 6.75), (4349, 255, 'k17', 7.0), (4350, 2172, 'k30', 0.0), (4351, 1088, 'k43', 0.25), (4352, 4, 'k56', 0.5), (4353, 1921, 'k69', 0.75), (4354, 837, 'k82', 1.0), (4355, 2754, 'k95', 1.25), (4356, 1670, 'k108', 1.5), (4357, 586, 'k121', 1.75), (4358, 2503, 'k134', 2.0), (4359, 1419, 'k147', 2.25), (4360, 335, 'k3', 2.5), (4361, 2252, 'k16', 2.75), (4362, 1168, 'k29', 3.0), (4363, 84, 'k42', 3.25), (4364, 2001, 'k55', 3.5), (4365, 917, 'k68', 3.75), (4366, 2834, 'k81', 4.0), (4367, 1750, 'k94', 4.25), (4368, 666, 'k107', 4.5), (4369, 2583, 'k120', 4.75), (4370, 1499, 'k133', 5.0), (4371, 415, 'k146', 5.25), (4372, 2332, 'k2', 5.5), (4373, 1248, 'k15', 5.75), (4374, 164, 'k28', 6.0), (4375, 2081, 'k41', 6.25), (4376, 997, 'k54', 6.5), (4377, 2914, 'k67', 6.75), (4378, 1830, 'k80', 7.0), (4379, 746, 'k93', 0.0), (4380, 2663, 'k106', 0.25), (4381, 1579, 'k119', 0.5), (4382, 495, 'k132', 0.75), (4383, 2412, 'k145', 1.0), (4384, 1328, 'k1', 1.25), (4385, 244, 'k14', 1.5), (4386, 2161, 'k27', 1.75), (4387, 1077, 'k40', 2.0), (4388, 2994, 'k53', 2.25), (4389, 1910, 'k66', 2.5), (4390, 826, 'k79', 2.75), (4391, 2743, 'k92', 3.0), (4392, 1659, 'k105', 3.25), (4393, 575, 'k118', 3.5), (4394, 2492, 'k131', 3.75), (4395, 1408, 'k144', 4.0), (4396, 324, 'k0', 4.25), (4397, 2241, 'k13', 4.5), (4398, 1157, 'k26', 4.75), (4399, 73, 'k39', 5.0), (4400, 1990, 'k52', 5.25), (4401, 906, 'k65', 5.5), (4402, 2823, 'k78', 5.75), (4403, 1739, 'k91', 6.0), (4404, 655, 'k104', 6.25), (4405, 2572, 'k117', 6.5), (4406, 1488, 'k130', 6.75), (4407, 404, 'k143', 7.0), (4408, 2321, 'k156', 0.0), (4409, 1237, 'k12', 0.25), (4410, 153, 'k25', 0.5), (4411, 2070, 'k38', 0.75), (4412, 986, 'k51', 1.0), (4413, 2903, 'k64', 1.25), (4414, 1819, 'k77', 1.5), (4415, 735, 'k90', 1.75), (4416, 2652, 'k103', 2.0), (4417, 1568, 'k116', 2.25), (4418, 484, 'k129', 2.5), (4419, 2401, 'k142', 2.75), (4420, 1317, 'k155', 3.0), (4421, 233, 'k11', 3.25), (4422, 2150, 'k24', 3.5), (4423, 1066, 'k37', 3.75), (4424, 2983, 'k50', 4.0), (4425, 1899, 'k63', 4.25), (4426, 815, 'k76', 4.5), (4427, 2732, 'k89', 4.75), (4428, 1648, 'k102', 5.0), (4429, 564, 'k115', 5.25), (4430, 2481, 'k128', 5.5), (4431, 1397, 'k141', 5.75), (4432, 313, 'k154', 6.0), (4433, 2230, 'k10', 6.25), (4434, 1146, 'k23', 6.5), (4435, 62, 'k36', 6.75), (4436, 1979, 'k49', 7.0), (4437, 895, 'k62', 0.0), (4438, 2812, 'k75', 0.25), (4439, 1728, 'k88', 0.5), (4440, 644, 'k101', 0.75), (4441, 2561, 'k114', 1.0), (4442, 1477, 'k127', 1.25), (4443, 393, 'k140', 1.5), (4444, 2310, 'k153', 1.75), (4445, 1226, 'k9', 2.0), (4446, 142, 'k22', 2.25), (4447, 2059, 'k35', 2.5), (4448, 975, 'k48', 2.75), (4449, 2892, 'k61', 3.0), (4450, 1808, 'k74', 3.25), (4451, 724, 'k87', 3.5), (4452, 2641, 'k100', 3.75), (4453, 1557, 'k113', 4.0), (4454, 473, 'k126', 4.25), (4455, 2390, 'k139', 4.5), (4456, 1306, 'k152', 4.75), (4457, 222, 'k8', 5.0), (4458, 2139, 'k21', 5.25), (4459, 1055, 'k34', 5.5), (4460, 2972, 'k47', 5.75), (4461, 1888, 'k60', 6.0), (4462, 804, 'k73', 6.25), (4463, 2721, 'k86', 6.5), (4464, 1637, 'k99', 6.75), (4465, 553, 'k112', 7.0), (4466, 2470, 'k125', 0.0), (4467, 1386, 'k138', 0.25), (4468, 302, 'k151', 0.5), (4469, 2219, 'k7', 0.75), (4470, 1135, 'k20', 1.0), (4471, 51, 'k33', 1.25), (4472, 1968, 'k46', 1.5), (4473, 884, 'k59', 1.75), (4474, 2801, 'k72', 2.0), (4475, 1717, 'k85', 2.25), (4476, 633, 'k98', 2.5), (4477, 2550, 'k111', 2.75), (4478, 1466, 'k124', 3.0), (4479, 382, 'k137', 3.25), (4480, 2299, 'k150', 3.5), (4481, 1215, 'k6', 3.75), (4482, 131, 'k19', 4.0), (4483, 2048, 'k32', 4.25), (4484, 964, 'k45', 4.5), (4485, 2881, 'k58', 4.75), (4486, 1797, 'k71', 5.0), (4487, 713, 'k84', 5.25), (4488, 2630, 'k97', 5.5), (4489, 1546, 'k110', 5.75), (4490, 462, 'k123', 6.0), (4491, 2379, 'k136', 6.25), (4492, 1295, 'k149', 6.5), (4493, 211, 'k5', 6.75), (4494, 2128, 'k18', 7.0), (4495, 1044, 'k31', 0.0), (4496, 2961, 'k44', 0.25), (4497, 1877, 'k57', 0.5), (4498, 793, 'k70', 0.75), (4499, 2710, 'k83', 1.0), (4500, 1626, 'k96', 1.25), (4501, 542, 'k109', 1.5), (4502, 2459, 'k122', 1.75), (4503, 1375, 'k135', 2.0), (4504, 291, 'k148', 2.25), (4505, 2208, 'k4', 2.5), (4506, 1124, 'k17', 2.75), (4507, 40, 'k30', 3.0), (4508, 1957, 'k43', 3.25), (4509, 873, 'k56', 3.5), (4510, 2790, 'k69', 3.75), (4511, 1706, 'k82', 4.0), (4512, 622, 'k95', 4.25), (4513, 2539, 'k108', 4.5), (4514, 1455, 'k121', 4.75), (4515, 371, 'k134', 5.0), (4516, 2288, 'k147', 5.25), (4517, 1204, 'k3', 5.5), (4518, 120, 'k16', 5.75), (4519, 2037, 'k29', 6.0), (4520, 953, 'k42', 6.25), (4521, 2870, 'k55', 6.5), (4522, 1786, 'k68', 6.75), (4523, 702, 'k81', 7.0), (4524, 2619, 'k94', 0.0), (4525, 1535, 'k107', 0.25), (4526, 451, 'k120', 0.5), (4527, 2368, 'k133', 0.75), (4528, 1284, 'k146', 1.0), (4529, 200, 'k2', 1.25), (4530, 2117, 'k15', 1.5), (4531, 1033, 'k28', 1.75), (4532, 2950, 'k41', 2.0), (4533, 1866, 'k54', 2.25), (4534, 782, 'k67', 2.5), (4535, 2699, 'k80', 2.75), (4536, 1615, 'k93', 3.0), (4537, 531, 'k106', 3.25), (4538, 2448, 'k119', 3.5), (4539, 1364, 'k132', 3.75), (4540, 280, 'k145', 4.0), (4541, 2197, 'k1', 4.25), (4542, 1113, 'k14', 4.5), (4543, 29, 'k27', 4.75), (4544, 1946, 'k40', 5.0), (4545, 862, 'k53', 5.25), (4546, 2779, 'k66', 5.5), (4547, 1695, 'k79', 5.75), (4548, 611, 'k92', 6.0), (4549, 2528, 'k105', 6.25), (4550, 1444, 'k118', 6.5), (4551, 360, 'k131', 6.75), (4552, 2277, 'k144', 7.0), (4553, 1193, 'k0', 0.0), (4554, 109, 'k13', 0.25), (4555, 2026, 'k26', 0.5), (4556, 942, 'k39', 0.75), (4557, 2859, 'k52', 1.0), (4558, 1775, 'k65', 1.25), (4559, 691, 'k78', 1.5), (4560, 2608, 'k91', 1.75), (4561, 1524, 'k104', 2.0), (4562, 440, 'k117', 2.25), (4563, 2357, 'k130', 2.5), (4564, 1273, 'k143', 2.75), (4565, 189, 'k156', 3.0), (4566, 2106, 'k12', 3.25), (4567, 1022, 'k25', 3.5), (4568, 2939, 'k38', 3.75), (4569, 1855, 'k51', 4.0), (4570, 771, 'k64', 4.25), (4571, 2688, 'k77', 4.5), (4572, 1604, 'k90', 4.75), (4573, 520, 'k103', 5.0), (4574, 2437, 'k116', 5.25), (4575, 1353, 'k129', 5.5), (4576, 269, 'k142', 5.75), (4577, 2186, 'k155', 6.0), (4578, 1102, 'k11', 6.25), (4579, 18, 'k24', 6.5), (4580, 1935, 'k37', 6.75), (4581, 851, 'k50', 7.0), (4582, 2768, 'k63', 0.0), (4583, 1684, 'k76', 0.25), (4584, 600, 'k89', 0.5), (4585, 2517, 'k102', 0.75), (4586, 1433, 'k115', 1.0), (4587, 349, 'k128', 1.25), (4588, 2266, 'k141', 1.5), (4589, 1182, 'k154', 1.75), (4590, 98, 'k10', 2.0), (4591, 2015, 'k23', 2.25), (4592, 931, 'k36', 2.5), (4593, 2848, 'k49', 2.75), (4594, 1764, 'k62', 3.0), (4595, 680, 'k75', 3.25), (4596, 2597, 'k88', 3.5), (4597, 1513, 'k101', 3.75), (4598, 429, 'k114', 4.0), (4599, 2346, 'k127', 4.25), (4600, 1262, 'k140', 4.5), (4601, 178, 'k153', 4.75), (4602, 2095, 'k9', 5.0), (4603, 1011, 'k22', 5.25), (4604, 2928, 'k35', 5.5), (4605, 1844, 'k48', 5.75), (4606, 760, 'k61', 6.0), (4607, 2677, 'k74', 6.25), (4608, 1593, 'k87', 6.5), (4609, 509, 'k100', 6.75), (4610, 2426, 'k113', 7.0), (4611, 1342, 'k126', 0.0), (4612, 258, 'k139', 0.25), (4613, 2175, 'k152', 0.5), (4614, 1091, 'k8', 0.75), (4615, 7, 'k21', 1.0), (4616, 1924, 'k34', 1.25), (4617, 840, 'k47', 1.5), (4618, 2757, 'k60', 1.75), (4619, 1673, 'k73', 2.0), (4620, 589, 'k86', 2.25), (4621, 2506, 'k99', 2.5), (4622, 1422, 'k112', 2.75), (4623, 338, 'k125', 3.0), (4624, 2255, 'k138', 3.25), (4625, 1171, 'k151', 3.5), (4626, 87, 'k7', 3.75), (4627, 2004, 'k20', 4.0), (4628, 920, 'k33', 4.25), (4629, 2837, 'k46', 4.5), (4630, 1753, 'k59', 4.75), (4631, 669, 'k72', 5.0), (4632, 2586, 'k85', 5.25), (4633, 1502, 'k98', 5.5), (4634, 418, 'k111', 5.75), (4635, 2335, 'k124', 6.0), (4636, 1251, 'k137', 6.25), (4637, 167, 'k150', 6.5), (4638, 2084, 'k6', 6.75), (4639, 1000, 'k19', 7.0), (4640, 2917, 'k32', 0.0), (4641, 1833, 'k45', 0.25), (4642, 749, 'k58', 0.5), (4643, 2666, 'k71', 0.75), (4644, 1582, 'k84', 1.0), (4645, 498, 'k97', 1.25), (4646, 2415, 'k110', 1.5), (4647, 1331, 'k123', 1.75), (4648, 247, 'k136', 2.0), (4649, 2164, 'k149', 2.25), (4650, 1080, 'k5', 2.5), (4651, 2997, 'k18', 2.75), (4652, 1913, 'k31', 3.0), (4653, 829, 'k44', 3.25), (4654, 2746, 'k57', 3.5), (4655, 1662, 'k70', 3.75), (4656, 578, 'k83', 4.0), (4657, 2495, 'k96', 4.25), (4658, 1411, 'k109', 4.5), (4659, 327, 'k122', 4.75), (4660, 2244, 'k135', 5.0), (4661, 1160, 'k148', 5.25), (4662, 76, 'k4', 5.5), (4663, 1993, 'k17', 5.75), (4664, 909, 'k30', 6.0), (4665, 2826, 'k43', 6.25), (4666, 1742, 'k56', 6.5), (4667, 658, 'k69', 6.75), (4668, 2575, 'k82', 7.0), (4669, 1491, 'k95', 0.0), (4670, 407, 'k108', 0.25), (4671, 2324, 'k121', 0.5), (4672, 1240, 'k134', 0.75), (4673, 156, 'k147', 1.0), (4674, 2073, 'k3', 1.25), (4675, 989, 'k16', 1.5), (4676, 2906, 'k29', 1.75), (4677, 1822, 'k42', 2.0), (4678, 738, 'k55', 2.25), (4679, 2655, 'k68', 2.5), (4680, 1571, 'k81', 2.75), (4681, 487, 'k94', 3.0), (4682, 2404, 'k107', 3.25), (4683, 1320, 'k120', 3.5), (4684, 236, 'k133', 3.75), (4685, 2153, 'k146', 4.0), (4686, 1069, 'k2', 4.25), (4687, 2986, 'k15', 4.5), (4688, 1902, 'k28', 4.75), (4689, 818, 'k41', 5.0), (4690, 2735, 'k54', 5.25), (4691, 1651, 'k67', 5.5), (4692, 567, 'k80', 5.75), (4693, 2484, 'k93', 6.0), (4694, 1400, 'k106', 6.25), (4695, 316, 'k119', 6.5), (4696, 2233, 'k132', 6.75), (4697, 1149, 'k145', 7.0), (4698, 65, 'k1', 0.0), (4699, 1982, 'k14', 0.25), (4700, 898, 'k27', 0.5), (4701, 2815, 'k40', 0.75), (4702, 1731, 'k53', 1.0), (4703, 647, 'k66', 1.25), (4704, 2564, 'k79', 1.5), (4705, 1480, 'k92', 1.75), (4706, 396, 'k105', 2.0), (4707, 2313, 'k118', 2.25), (4708, 1229, 'k131', 2.5), (4709, 145, 'k144', 2.75), (4710, 2062, 'k0', 3.0), (4711, 978, 'k13', 3.25), (4712, 2895, 'k26', 3.5), (4713, 1811, 'k39', 3.75), (4714, 727, 'k52', 4.0), (4715, 2644, 'k65', 4.25), (4716, 1560, 'k78', 4.5), (4717, 476, 'k91', 4.75), (4718, 2393, 'k104', 5.0), (4719, 1309, 'k117', 5.25), (4720, 225, 'k130', 5.5), (4721, 2142, 'k143', 5.75), (4722, 1058, 'k156', 6.0), (4723, 2975, 'k12', 6.25), (4724, 1891, 'k25', 6.5), (4725, 807, 'k38', 6.75), (4726, 2724, 'k51', 7.0), (4727, 1640, 'k64', 0.0), (4728, 556, 'k77', 0.25), (4729, 2473, 'k90', 0.5), (4730, 1389, 'k103', 0.75), (4731, 305, 'k116', 1.0), (4732, 2222, 'k129', 1.25), (4733, 1138, 'k142', 1.5), (4734, 54, 'k155', 1.75), (4735, 1971, 'k11', 2.0), (4736, 887, 'k24', 2.25), (4737, 2804, 'k37', 2.5), (4738, 1720, 'k50', 2.75), (4739, 636, 'k63', 3.0), (4740, 2553, 'k76', 3.25), (4741, 1469, 'k89', 3.5), (4742, 385, 'k102', 3.75), (4743, 2302, 'k115', 4.0), (4744, 1218, 'k128', 4.25), (4745, 134, 'k141', 4.5), (4746, 2051, 'k154', 4.75), (4747, 967, 'k10', 5.0), (4748, 2884, 'k23', 5.25), (4749, 1800, 'k36', 5.5), (4750, 716, 'k49', 5.75), (4751, 2633, 'k62', 6.0), (4752, 1549, 'k75', 6.25), (4753, 465, 'k88', 6.5), (4754, 2382, 'k101', 6.75), (4755, 1298, 'k114', 7.0), (4756, 214, 'k127', 0.0), (4757, 2131, 'k140', 0.25), (4758, 1047, 'k153', 0.5), (4759, 2964, 'k9', 0.75), (4760, 1880, 'k22', 1.0), (4761, 796, 'k35', 1.25), (4762, 2713, 'k48', 1.5), (4763, 1629, 'k61', 1.75), (4764, 545, 'k74', 2.0), (4765, 2462, 'k87', 2.25), (4766, 1378, 'k100', 2.5), (4767, 294, 'k113', 2.75), (4768, 2211, 'k126', 3.0), (4769, 1127, 'k139', 3.25), (4770, 43, 'k152', 3.5), (4771, 1960, 'k8', 3.75), (4772, 876, 'k21', 4.0), (4773, 2793, 'k34', 4.25), (4774, 1709, 'k47', 4.5), (4775, 625, 'k60', 4.75), (4776, 2542, 'k73', 5.0), (4777, 1458, 'k86', 5.25), (4778, 374, 'k99', 5.5), (4779, 2291, 'k112', 5.75), (4780, 1207, 'k125', 6.0), (4781, 123, 'k138', 6.25), (4782, 2040, 'k151', 6.5), (4783, 956, 'k7', 6.75), (4784, 2873, 'k20', 7.0), (4785, 1789, 'k33', 0.0), (4786, 705, 'k46', 0.25), (4787, 2622, 'k59', 0.5), (4788, 1538, 'k72', 0.75), (4789, 454, 'k85', 1.0), (4790, 2371, 'k98', 1.25), (4791, 1287, 'k111', 1.5), (4792, 203, 'k124', 1.75), (4793, 2120, 'k137', 2.0), (4794, 1036, 'k150', 2.25), (4795, 2953, 'k6', 2.5), (4796, 1869, 'k19', 2.75), (4797, 785, 'k32', 3.0), (4798, 2702, 'k45', 3.25), (4799, 1618, 'k58', 3.5), (4800, 534, 'k71', 3.75), (4801, 2451, 'k84', 4.0), (4802, 1367, 'k97', 4.25), (4803, 283, 'k110', 4.5), (4804, 2200, 'k123', 4.75), (4805, 1116, 'k136', 5.0), (4806, 32, 'k149', 5.25), (4807, 1949, 'k5', 5.5), (4808, 865, 'k18', 5.75), (4809, 2782, 'k31', 6.0), (4810, 1698, 'k44', 6.25), (4811, 614, 'k57', 6.5), (4812, 2531, 'k70', 6.75), (4813, 1447, 'k83', 7.0), (4814, 363, 'k96', 0.0), (4815, 2280, 'k109', 0.25), (4816, 1196, 'k122', 0.5), (4817, 112, 'k135', 0.75), (4818, 2029, 'k148', 1.0), (4819, 945, 'k4', 1.25), (4820, 2862, 'k17', 1.5), (4821, 1778, 'k30', 1.75), (4822, 694, 'k43', 2.0), (4823, 2611, 'k56', 2.25), (4824, 1527, 'k69', 2.5), (4825, 443, 'k82', 2.75), (4826, 2360, 'k95', 3.0), (4827, 1276, 'k108', 3.25), (4828, 192, 'k121', 3.5), (4829, 2109, 'k134', 3.75), (4830, 1025, 'k147', 4.0), (4831, 2942, 'k3', 4.25), (4832, 1858, 'k16', 4.5), (4833, 774, 'k29', 4.75), (4834, 2691, 'k42', 5.0), (4835, 1607, 'k55', 5.25), (4836, 523, 'k68', 5.5), (4837, 2440, 'k81', 5.75), (4838, 1356, 'k94', 6.0), (4839, 272, 'k107', 6.25), (4840, 2189, 'k120', 6.5), (4841, 1105, 'k133', 6.75), (4842, 21, 'k146', 7.0), (4843, 1938, 'k2', 0.0), (4844, 854, 'k15', 0.25), (4845, 2771, 'k28', 0.5), (4846, 1687, 'k41', 0.75), (4847, 603, 'k54', 1.0), (4848, 2520, 'k67', 1.25), (4849, 1436, 'k80', 1.5), (4850, 352, 'k93', 1.75), (4851, 2269, 'k106', 2.0), (4852, 1185, 'k119', 2.25), (4853, 101, 'k132', 2.5), (4854, 2018, 'k145', 2.75), (4855, 934, 'k1', 3.0), (4856, 2851, 'k14', 3.25), (4857, 1767, 'k27', 3.5), (4858, 683, 'k40', 3.75), (4859, 2600, 'k53', 4.0), (4860, 1516, 'k66', 4.25), (4861, 432, 'k79', 4.5), (4862, 2349, 'k92', 4.75), (4863, 1265, 'k105', 5.0), (4864, 181, 'k118', 5.25), (4865, 2098, 'k131', 5.5), (4866, 1014, 'k144', 5.75), (4867, 2931, 'k0', 6.0), (4868, 1847, 'k13', 6.25), (4869, 763, 'k26', 6.5), (4870, 2680, 'k39', 6.75), (4871, 1596, 'k52', 7.0), (4872, 512, 'k65', 0.0), (4873, 2429, 'k78', 0.25), (4874, 1345, 'k91', 0.5), (4875, 261, 'k104', 0.75), (4876, 2178, 'k117', 1.0), (4877, 1094, 'k130', 1.25), (4878, 10, 'k143', 1.5), (4879, 1927, 'k156', 1.75), (4880, 843, 'k12', 2.0), (4881, 2760, 'k25', 2.25), (4882, 1676, 'k38', 2.5), (4883, 592, 'k51', 2.75), (4884, 2509, 'k64', 3.0), (4885, 1425, 'k77', 3.25), (4886, 341, 'k90', 3.5), (4887, 2258, 'k103', 3.75), (4888, 1174, 'k116', 4.0), (4889, 90, 'k129', 4.25), (4890, 2007, 'k142', 4.5), (4891, 923, 'k155', 4.75), (4892, 2840, 'k11', 5.0), (4893, 1756, 'k24', 5.25), (4894, 672, 'k37', 5.5), (4895, 2589, 'k50', 5.75), (4896, 1505, 'k63', 6.0), (4897, 421, 'k76', 6.25), (4898, 2338, 'k89', 6.5), (4899, 1254, 'k102', 6.75), (4900, 170, 'k115', 7.0), (4901, 2087, 'k128', 0.0), (4902, 1003, 'k141', 0.25), (4903, 2920, 'k154', 0.5), (4904, 1836, 'k10', 0.75), (4905, 752, 'k23', 1.0), (4906, 2669, 'k36', 1.25), (4907, 1585, 'k49', 1.5), (4908, 501, 'k62', 1.75), (4909, 2418, 'k75', 2.0), (4910, 1334, 'k88', 2.25), (4911, 250, 'k101', 2.5), (4912, 2167, 'k114', 2.75), (4913, 1083, 'k127', 3.0), (4914, 3000, 'k140', 3.25), (4915, 1916, 'k153', 3.5), (4916, 832, 'k9', 3.75), (4917, 2749, 'k22', 4.0), (4918, 1665, 'k35', 4.25), (4919, 581, 'k48', 4.5), (4920, 2498, 'k61', 4.75), (4921, 1414, 'k74', 5.0), (4922, 330, 'k87', 5.25), (4923, 2247, 'k100', 5.5), (4924, 1163, 'k113', 5.75), (4925, 79, 'k126', 6.0), (4926, 1996, 'k139', 6.25), (4927, 912, 'k152', 6.5), (4928, 2829, 'k8', 6.75), (4929, 1745, 'k21', 7.0), (4930, 661, 'k34', 0.0), (4931, 2578, 'k47', 0.25), (4932, 1494, 'k60', 0.5), (4933, 410, 'k73', 0.75), (4934, 2327, 'k86', 1.0), (4935, 1243, 'k99', 1.25), (4936, 159, 'k112', 1.5), (4937, 2076, 'k125', 1.75), (4938, 992, 'k138', 2.0), (4939, 2909, 'k151', 2.25), (4940, 1825, 'k7', 2.5), (4941, 741, 'k20', 2.75), (4942, 2658, 'k33', 3.0), (4943, 1574, 'k46', 3.25), (4944, 490, 'k59', 3.5), (4945, 2407, 'k72', 3.75), (4946, 1323, 'k85', 4.0), (4947, 239, 'k98', 4.25), (4948, 2156, 'k111', 4.5), (4949, 1072, 'k124', 4.75), (4950, 2989, 'k137', 5.0), (4951, 1905, 'k150', 5.25), (4952, 821, 'k6', 5.5), (4953, 2738, 'k19', 5.75), (4954, 1654, 'k32', 6.0), (4955, 570, 'k45', 6.25), (4956, 2487, 'k58', 6.5), (4957, 1403, 'k71', 6.75), (4958, 319, 'k84', 7.0), (4959, 2236, 'k97', 0.0), (4960, 1152, 'k110', 0.25), (4961, 68, 'k123', 0.5), (4962, 1985, 'k136', 0.75), (4963, 901, 'k149', 1.0), (4964, 2818, 'k5', 1.25), (4965, 1734, 'k18', 1.5), (4966, 650, 'k31', 1.75), (4967, 2567, 'k44', 2.0), (4968, 1483, 'k57', 2.25), (4969, 399, 'k70', 2.5), (4970, 2316, 'k83', 2.75), (4971, 1232, 'k96', 3.0), (4972, 148, 'k109', 3.25), (4973, 2065, 'k122', 3.5), (4974, 981, 'k135', 3.75), (4975, 2898, 'k148', 4.0), (4976, 1814, 'k4', 4.25), (4977, 730, 'k17', 4.5), (4978, 2647, 'k30', 4.75), (4979, 1563, 'k43', 5.0), (4980, 479, 'k56', 5.25), (4981, 2396, 'k69', 5.5), (4982, 1312, 'k82', 5.75), (4983, 228, 'k95', 6.0), (4984, 2145, 'k108', 6.25), (4985, 1061, 'k121', 6.5), (4986, 2978, 'k134', 6.75), (4987, 1894, 'k147', 7.0), (4988, 810, 'k3', 0.0), (4989, 2727, 'k16', 0.25), (4990, 1643, 'k29', 0.5), (4991, 559, 'k42', 0.75), (4992, 2476, 'k55', 1.0), (4993, 1392, 'k68', 1.25), (4994, 308, 'k81', 1.5), (4995, 2225, 'k94', 1.75), (4996, 1141, 'k107', 2.0), (4997, 57, 'k120', 2.25), (4998, 1974, 'k133', 2.5), (4999, 890, 'k146', 2.75), (5000, 2807, 'k2', 3.0), (5001, 1723, 'k15', 3.25), (5002, 639, 'k28', 3.5), (5003, 2556, 'k41', 3.75), (5004, 1472, 'k54', 4.0), (5005, 388, 'k67', 4.25), (5006, 2305, 'k80', 4.5), (5007, 1221, 'k93', 4.75), (5008, 137, 'k106', 5.0), (5009, 2054, 'k119', 5.25), (5010, 970, 'k132', 5.5), (5011, 2887, 'k145', 5.75), (5012, 1803, 'k1', 6.0), (5013, 719, 'k14', 6.25), (5014, 2636, 'k27', 6.5), (5015, 1552, 'k40', 6.75), (5016, 468, 'k53', 7.0), (5017, 2385, 'k66', 0.0), (5018, 1301, 'k79', 0.25), (5019, 217, 'k92', 0.5), (5020, 2134, 'k105', 0.75), (5021, 1050, 'k118', 1.0), (5022, 2967, 'k131', 1.25), (5023, 1883, 'k144', 1.5), (5024, 799, 'k0', 1.75), (5025, 2716, 'k13', 2.0), (5026, 1632, 'k26', 2.25), (5027, 548, 'k39', 2.5), (5028, 2465, 'k52', 2.75), (5029, 1381, 'k65', 3.0), (5030, 297, 'k78', 3.25), (5031, 2214, 'k91', 3.5), (5032, 1130, 'k104', 3.75), (5033, 46, 'k117', 4.0), (5034, 1963, 'k130', 4.25), (5035, 879, 'k143', 4.5), (5036, 2796, 'k156', 4.75), (5037, 1712, 'k12', 5.0), (5038, 628, 'k25', 5.25), (5039, 2545, 'k38', 5.5), (5040, 1461, 'k51', 5.75), (5041, 377, 'k64', 6.0), (5042, 2294, 'k77', 6.25), (5043, 1210, 'k90', 6.5), (5044, 126, 'k103', 6.75), (5045, 2043, 'k116', 7.0), (5046, 959, 'k129', 0.0), (5047, 2876, 'k142', 0.25), (5048, 1792, 'k155', 0.5), (5049, 708, 'k11', 0.75), (5050, 2625, 'k24', 1.0), (5051, 1541, 'k37', 1.25), (5052, 457, 'k50', 1.5), (5053, 2374, 'k63', 1.75), (5054, 1290, 'k76', 2.0), (5055, 206, 'k89', 2.25), (5056, 2123, 'k102', 2.5), (5057, 1039, 'k115', 2.75), (5058, 2956, 'k128', 3.0), (5059, 1872, 'k141', 3.25), (5060, 788, 'k154', 3.5), (5061, 2705, 'k10', 3.75), (5062, 1621, 'k23', 4.0), (5063, 537, 'k36', 4.25), (5064, 2454, 'k49', 4.5), (5065, 1370, 'k62', 4.75), (5066, 286, 'k75', 5.0), (5067, 2203, 'k88', 5.25), (5068, 1119, 'k101', 5.5), (5069, 35, 'k114', 5.75), (5070, 1952, 'k127', 6.0), (5071, 868, 'k140', 6.25), (5072, 2785, 'k153', 6.5), (5073, 1701, 'k9', 6.75), (5074, 617, 'k22', 7.0), (5075, 2534, 'k35', 0.0), (5076, 1450, 'k48', 0.25), (5077, 366, 'k61', 0.5), (5078, 2283, 'k74', 0.75), (5079, 1199, 'k87', 1.0), (5080, 115, 'k100', 1.25), (5081, 2032, 'k113', 1.5), (5082, 948, 'k126', 1.75), (5083, 2865, 'k139', 2.0), (5084, 1781, 'k152', 2.25), (5085, 697, 'k8', 2.5), (5086, 2614, 'k21', 2.75), (5087, 1530, 'k34', 3.0), (5088, 446, 'k47', 3.25), (5089, 2363, 'k60', 3.5), (5090, 1279, 'k73', 3.75), (5091, 195, 'k86', 4.0), (5092, 2112, 'k99', 4.25), (5093, 1028, 'k112', 4.5), (5094, 2945, 'k125', 4.75), (5095, 1861, 'k138', 5.0), (5096, 777, 'k151', 5.25), (5097, 2694, 'k7', 5.5), (5098, 1610, 'k20', 5.75), (5099, 526, 'k33', 6.0), (5100, 2443, 'k46', 6.25), (5101, 1359, 'k59', 6.5), (5102, 275, 'k72', 6.75), (5103, 2192, 'k85', 7.0), (5104, 1108, 'k98', 0.0), (5105, 24, 'k111', 0.25), (5106, 1941, 'k124', 0.5), (5107, 857, 'k137', 0.75), (5108, 2774, 'k150', 1.0), (5109, 1690, 'k6', 1.25), (5110, 606, 'k19', 1.5), (5111, 2523, 'k32', 1.75), (5112, 1439, 'k45', 2.0), (5113, 355, 'k58', 2.25), (5114, 2272, 'k71', 2.5), (5115, 1188, 'k84', 2.75), (5116, 104, 'k97', 3.0), (5117, 2021, 'k110', 3.25), (5118, 937, 'k123', 3.5), (5119, 2854, 'k136', 3.75), (5120, 1770, 'k149', 4.0), (5121, 686, 'k5', 4.25), (5122, 2603, 'k18', 4.5), (5123, 1519, 'k31', 4.75), (5124, 435, 'k44', 5.0), (5125, 2352, 'k57', 5.25), (5126, 1268, 'k70', 5.5), (5127, 184, 'k83', 5.75), (5128, 2101, 'k96', 6.0), (5129, 1017, 'k109', 6.25), (5130, 2934, 'k122', 6.5), (5131, 1850, 'k135', 6.75), (5132, 766, 'k148', 7.0), (5133, 2683, 'k4', 0.0), (5134, 1599, 'k17', 0.25), (5135, 515, 'k30', 0.5), (5136, 2432, 'k43', 0.75), (5137, 1348, 'k56', 1.0), (5138, 264, 'k69', 1.25), (5139, 2181, 'k82', 1.5), (5140, 1097, 'k95', 1.75), (5141, 13, 'k108', 2.0), (5142, 1930, 'k121', 2.25), (5143, 846, 'k134', 2.5), (5144, 2763, 'k147', 2.75), (5145, 1679, 'k3', 3.0), (5146, 595, 'k16', 3.25), (5147, 2512, 'k29', 3.5), (5148, 1428, 'k42', 3.75), (5149, 344, 'k55', 4.0), (5150, 2261, 'k68', 4.25), (5151, 1177, 'k81', 4.5), (5152, 93, 'k94', 4.75), (5153, 2010, 'k107', 5.0), (5154, 926, 'k120', 5.25), (5155, 2843, 'k133', 5.5), (5156, 1759, 'k146', 5.75), (5157, 675, 'k2', 6.0), (5158, 2592, 'k15', 6.25), (5159, 1508, 'k28', 6.5), (5160, 424, 'k41', 6.75), (5161, 2341, 'k54', 7.0), (5162, 1257, 'k67', 0.0), (5163, 173, 'k80', 0.25), (5164, 2090, 'k93', 0.5), (5165, 1006, 'k106', 0.75), (5166, 2923, 'k119', 1.0), (5167, 1839, 'k132', 1.25), (5168, 755, 'k145', 1.5), (5169, 2672, 'k1', 1.75), (5170, 1588, 'k14', 2.0), (5171, 504, 'k27', 2.25), (5172, 2421, 'k40', 2.5), (5173, 1337, 'k53', 2.75), (5174, 253, 'k66', 3.0), (5175, 2170, 'k79', 3.25), (5176, 1086, 'k92', 3.5), (5177, 2, 'k105', 3.75), (5178, 1919, 'k118', 4.0), (5179, 835, 'k131', 4.25), (5180, 2752, 'k144', 4.5), (5181, 1668, 'k0', 4.75), (5182, 584, 'k13', 5.0), (5183, 2501, 'k26', 5.25), (5184, 1417, 'k39', 5.5), (5185, 333, 'k52', 5.75), (5186, 2250, 'k65', 6.0), (5187, 1166, 'k78', 6.25), (5188, 82, 'k91', 6.5), (5189, 1999, 'k104', 6.75), (5190, 915, 'k117', 7.0), (5191, 2832, 'k130', 0.0), (5192, 1748, 'k143', 0.25), (5193, 664, 'k156', 0.5), (5194, 2581, 'k12', 0.75), (5195, 1497, 'k25', 1.0), (5196, 413, 'k38', 1.25), (5197, 2330, 'k51', 1.5), (5198, 1246, 'k64', 1.75), (5199, 162, 'k77', 2.0), (5200, 2079, 'k90', 2.25), (5201, 995, 'k103', 2.5), (5202, 2912, 'k116', 2.75), (5203, 1828, 'k129', 3.0), (5204, 744, 'k142', 3.25), (5205, 2661, 'k155', 3.5), (5206, 1577, 'k11', 3.75), (5207, 493, 'k24', 4.0), (5208, 2410, 'k37', 4.25), (5209, 1326, 'k50', 4.5), (5210, 242, 'k63', 4.75), (5211, 2159, 'k76', 5.0), (5212, 1075, 'k89', 5.25), (5213, 2992, 'k102', 5.5), (5214, 1908, 'k115', 5.75), (5215, 824, 'k128', 6.0), (5216, 2741, 'k141', 6.25), (5217, 1657, 'k154', 6.5), (5218, 573, 'k10', 6.75), (5219, 2490, 'k23', 7.0), (5220, 1406, 'k36', 0.0), (5221, 322, 'k49', 0.25), (5222, 2239, 'k62', 0.5), (5223, 1155, 'k75', 0.75), (5224, 71, 'k88', 1.0), (5225, 1988, 'k101', 1.25), (5226, 904, 'k114', 1.5), (5227, 2821, 'k127', 1.75), (5228, 1737, 'k140', 2.0), (5229, 653, 'k153', 2.25), (5230, 2570, 'k9', 2.5), (5231, 1486, 'k22', 2.75), (5232, 402, 'k35', 3.0), (5233, 2319, 'k48', 3.25), (5234, 1235, 'k61', 3.5), (5235, 151, 'k74', 3.75), (5236, 2068, 'k87', 4.0), (5237, 984, 'k100', 4.25), (5238, 2901, 'k113', 4.5), (5239, 1817, 'k126', 4.75), (5240, 733, 'k139', 5.0), (5241, 2650, 'k152', 5.25), (5242, 1566, 'k8', 5.5), (5243, 482, 'k21', 5.75), (5244, 2399, 'k34', 6.0), (5245, 1315, 'k47', 6.25), (5246, 231, 'k60', 6.5), (5247, 2148, 'k73', 6.75), (5248, 1064, 'k86', 7.0), (5249, 2981, 'k99', 0.0), (5250, 1897, 'k112', 0.25), (5251, 813, 'k125', 0.5), (5252, 2730, 'k138', 0.75), (5253, 1646, 'k151', 1.0), (5254, 562, 'k7', 1.25), (5255, 2479, 'k20', 1.5), (5256, 1395, 'k33', 1.75), (5257, 311, 'k46', 2.0), (5258, 2228, 'k59', 2.25), (5259, 1144, 'k72', 2.5), (5260, 60, 'k85', 2.75), (5261, 1977, 'k98', 3.0), (5262, 893, 'k111', 3.25), (5263, 2810, 'k124', 3.5), (5264, 1726, 'k137', 3.75), (5265, 642, 'k150', 4.0), (5266, 2559, 'k6', 4.25), (5267, 1475, 'k19', 4.5), (5268, 391, 'k32', 4.75), (5269, 2308, 'k45', 5.0), (5270, 1224, 'k58', 5.25), (5271, 140, 'k71', 5.5), (5272, 2057, 'k84', 5.75), (5273, 973, 'k97', 6.0), (5274, 2890, 'k110', 6.25), (5275, 1806, 'k123', 6.5), (5276, 722, 'k136', 6.75), (5277, 2639, 'k149', 7.0), (5278, 1555, 'k5', 0.0), (5279, 471, 'k18', 0.25), (5280, 2388, 'k31', 0.5), (5281, 1304, 'k44', 0.75), (5282, 220, 'k57', 1.0), (5283, 2137, 'k70', 1.25), (5284, 1053, 'k83', 1.5), (5285, 2970, 'k96', 1.75), (5286, 1886, 'k109', 2.0), (5287, 802, 'k122', 2.25), (5288, 2719, 'k135', 2.5), (5289, 1635, 'k148', 2.75), (5290, 551, 'k4', 3.0), (5291, 2468, 'k17', 3.25), (5292, 1384, 'k30', 3.5), (5293, 300, 'k43', 3.75), (5294, 2217, 'k56', 4.0), (5295, 1133, 'k69', 4.25), (5296, 49, 'k82', 4.5), (5297, 1966, 'k95', 4.75), (5298, 882, 'k108', 5.0), (5299, 2799, 'k121', 5.25), (5300, 1715, 'k134', 5.5), (5301, 631, 'k147', 5.75), (5302, 2548, 'k3', 6.0), (5303, 1464, 'k16', 6.25), (5304, 380, 'k29', 6.5), (5305, 2297, 'k42', 6.75), (5306, 1213, 'k55', 7.0), (5307, 129, 'k68', 0.0), (5308, 2046, 'k81', 0.25), (5309, 962, 'k94', 0.5), (5310, 2879, 'k107', 0.75), (5311, 1795, 'k120', 1.0), (5312, 711, 'k133', 1.25), (5313, 2628, 'k146', 1.5), (5314, 1544, 'k2', 1.75), (5315, 460, 'k15', 2.0), (5316, 2377, 'k28', 2.25), (5317, 1293, 'k41', 2.5), (5318, 209, 'k54', 2.75), (5319, 2126, 'k67', 3.0), (5320, 1042, 'k80', 3.25), (5321, 2959, 'k93', 3.5), (5322, 1875, 'k106', 3.75), (5323, 791, 'k119', 4.0), (5324, 2708, 'k132', 4.25), (5325, 1624, 'k145', 4.5), (5326, 540, 'k1', 4.75), (5327, 2457, 'k14', 5.0), (5328, 1373, 'k27', 5.25), (5329, 289, 'k40', 5.5), (5330, 2206, 'k53', 5.75), (5331, 1122, 'k66', 6.0), (5332, 38, 'k79', 6.25), (5333, 1955, 'k92', 6.5), (5334, 871, 'k105', 6.75), (5335, 2788, 'k118', 7.0), (5336, 1704, 'k131', 0.0), (5337, 620, 'k144', 0.25), (5338, 2537, 'k0', 0.5), (5339, 1453, 'k13', 0.75), (5340, 369, 'k26', 1.0), (5341, 2286, 'k39', 1.25), (5342, 1202, 'k52', 1.5), (5343, 118, 'k65', 1.75), (5344, 2035, 'k78', 2.0), (5345, 951, 'k91', 2.25), (5346, 2868, 'k104', 2.5), (5347, 1784, 'k117', 2.75), (5348, 700, 'k130', 3.0), (5349, 2617, 'k143', 3.25), (5350, 1533, 'k156', 3.5), (5351, 449, 'k12', 3.75), (5352, 2366, 'k25', 4.0), (5353, 1282, 'k38', 4.25), (5354, 198, 'k51', 4.5), (5355, 2115, 'k64', 4.75), (5356, 1031, 'k77', 5.0), (5357, 2948, 'k90', 5.25), (5358, 1864, 'k103', 5.5), (5359, 780, 'k116', 5.75), (5360, 2697, 'k129', 6.0), (5361, 1613, 'k142', 6.25), (5362, 529, 'k155', 6.5), (5363, 2446, 'k11', 6.75), (5364, 1362, 'k24', 7.0), (5365, 278, 'k37', 0.0), (5366, 2195, 'k50', 0.25), (5367, 1111, 'k63', 0.5), (5368, 27, 'k76', 0.75), (5369, 1944, 'k89', 1.0), (5370, 860, 'k102', 1.25), (5371, 2777, 'k115', 1.5), (5372, 1693, 'k128', 1.75), (5373, 609, 'k141', 2.0), (5374, 2526, 'k154', 2.25), (5375, 1442, 'k10', 2.5), (5376, 358, 'k23', 2.75), (5377, 2275, 'k36', 3.0), (5378, 1191, 'k49', 3.25), (5379, 107, 'k62', 3.5), (5380, 2024, 'k75', 3.75), (5381, 940, 'k88', 4.0), (5382, 2857, 'k101', 4.25), (5383, 1773, 'k114', 4.5), (5384, 689, 'k127', 4.75), (5385, 2606, 'k140', 5.0), (5386, 1522, 'k153', 5.25), (5387, 438, 'k9', 5.5), (5388, 2355, 'k22', 5.75), (5389, 1271, 'k35', 6.0), (5390, 187, 'k48', 6.25), (5391, 2104, 'k61', 6.5), (5392, 1020, 'k74', 6.75), (5393, 2937, 'k87', 7.0), (5394, 1853, 'k100', 0.0), (5395, 769, 'k113', 0.25), (5396, 2686, 'k126', 0.5), (5397, 1602, 'k139', 0.75), (5398, 518, 'k152', 1.0), (5399, 2435, 'k8', 1.25), (5400, 1351, 'k21', 1.5), (5401, 267, 'k34', 1.75), (5402, 2184, 'k47', 2.0), (5403, 1100, 'k60', 2.25), (5404, 16, 'k73', 2.5), (5405, 1933, 'k86', 2.75), (5406, 849, 'k99', 3.0), (5407, 2766, 'k112', 3.25), (5408, 1682, 'k125', 3.5), (5409, 598, 'k138', 3.75), (5410, 2515, 'k151', 4.0), (5411, 1431, 'k7', 4.25), (5412, 347, 'k20', 4.5), (5413, 2264, 'k33', 4.75), (5414, 1180, 'k46', 5.0), (5415, 96, 'k59', 5.25), (5416, 2013, 'k72', 5.5), (5417, 929, 'k85', 5.75), (5418, 2846, 'k98', 6.0), (5419, 1762, 'k111', 6.25), (5420, 678, 'k124', 6.5), (5421, 2595, 'k137', 6.75), (5422, 1511, 'k150', 7.0), (5423, 427, 'k6', 0.0), (5424, 2344, 'k19', 0.25), (5425, 1260, 'k32', 0.5), (5426, 176, 'k45', 0.75), (5427, 2093, 'k58', 1.0), (5428, 1009, 'k71', 1.25), (5429, 2926, 'k84', 1.5), (5430, 1842, 'k97', 1.75), (5431, 758, 'k110', 2.0), (5432, 2675, 'k123', 2.25), (5433, 1591, 'k136', 2.5), (5434, 507, 'k149', 2.75), (5435, 2424, 'k5', 3.0), (5436, 1340, 'k18', 3.25), (5437, 256, 'k31', 3.5), (5438, 2173, 'k44', 3.75), (5439, 1089, 'k57', 4.0), (5440, 5, 'k70', 4.25), (5441, 1922, 'k83', 4.5), (5442, 838, 'k96', 4.75), (5443, 2755, 'k109', 5.0), (5444, 1671, 'k122', 5.25), (5445, 587, 'k135', 5.5), (5446, 2504, 'k148', 5.75), (5447, 1420, 'k4', 6.0), (5448, 336, 'k17', 6.25), (5449, 2253, 'k30', 6.5), (5450, 1169, 'k43', 6.75), (5451, 85, 'k56', 7.0), (5452, 2002, 'k69', 0.0), (5453, 918, 'k82', 0.25), (5454, 2835, 'k95', 0.5), (5455, 1751, 'k108', 0.75), (5456, 667, 'k121', 1.0), (5457, 2584, 'k134', 1.25), (5458, 1500, 'k147', 1.5), (5459, 416, 'k3', 1.75), (5460, 2333, 'k16', 2.0), (5461, 1249, 'k29', 2.25), (5462, 165, 'k42', 2.5), (5463, 2082, 'k55', 2.75), (5464, 998, 'k68', 3.0), (5465, 2915, 'k81', 3.25), (5466, 1831, 'k94', 3.5), (5467, 747, 'k107', 3.75), (5468, 2664, 'k120', 4.0), (5469, 1580, 'k133', 4.25), (5470, 496, 'k146', 4.5), (5471, 2413, 'k2', 4.75), (5472, 1329, 'k15', 5.0), (5473, 245, 'k28', 5.25), (5474, 2162, 'k41', 5.5), (5475, 1078, 'k54', 5.75), (5476, 2995, 'k67', 6.0), (5477, 1911, 'k80', 6.25), (5478, 827, 'k93', 6.5), (5479, 2744, 'k106', 6.75), (5480, 1660, 'k119', 7.0), (5481, 576, 'k132', 0.0), (5482, 2493, 'k145', 0.25), (5483, 1409, 'k1', 0.5), (5484, 325, 'k14', 0.75), (5485, 2242, 'k27', 1.0), (5486, 1158, 'k40', 1.25), (5487, 74, 'k53', 1.5), (5488, 1991, 'k66', 1.75), (5489, 907, 'k79', 2.0), (5490, 2824, 'k92', 2.25), (5491, 1740, 'k105', 2.5), (5492, 656, 'k118', 2.75), (5493, 2573, 'k131', 3.0), (5494, 1489, 'k144', 3.25), (5495, 405, 'k0', 3.5), (5496, 2322, 'k13', 3.75), (5497, 1238, 'k26', 4.0), (5498, 154, 'k39', 4.25), (5499, 2071, 'k52', 4.5), (5500, 987, 'k65', 4.75), (5501, 2904, 'k78', 5.0), (5502, 1820, 'k91', 5.25), (5503, 736, 'k104', 5.5), (5504, 2653, 'k117', 5.75), (5505, 1569, 'k130', 6.0), (5506, 485, 'k143', 6.25), (5507, 2402, 'k156', 6.5), (5508, 1318, 'k12', 6.75), (5509, 234, 'k25', 7.0), (5510, 2151, 'k38', 0.0), (5511, 1067, 'k51', 0.25), (5512, 2984, 'k64', 0.5), (5513, 1900, 'k77', 0.75), (5514, 816, 'k90', 1.0), (5515, 2733, 'k103', 1.25), (5516, 1649, 'k116', 1.5), (5517, 565, 'k129', 1.75), (5518, 2482, 'k142', 2.0), (5519, 1398, 'k155', 2.25), (5520, 314, 'k11', 2.5), (5521, 2231, 'k24', 2.75), (5522, 1147, 'k37', 3.0), (5523, 63, 'k50', 3.25), (5524, 1980, 'k63', 3.5), (5525, 896, 'k76', 3.75), (5526, 2813, 'k89', 4.0), (5527, 1729, 'k102', 4.25), (5528, 645, 'k115', 4.5), (5529, 2562, 'k128', 4.75), (5530, 1478, 'k141', 5.0), (5531, 394, 'k154', 5.25), (5532, 2311, 'k10', 5.5), (5533, 1227, 'k23', 5.75), (5534, 143, 'k36', 6.0), (5535, 2060, 'k49', 6.25), (5536, 976, 'k62', 6.5), (5537, 2893, 'k75', 6.75), (5538, 1809, 'k88', 7.0), (5539, 725, 'k101', 0.0), (5540, 2642, 'k114', 0.25), (5541, 1558, 'k127', 0.5), (5542, 474, 'k140', 0.75), (5543, 2391, 'k153', 1.0), (5544, 1307, 'k9', 1.25), (5545, 223, 'k22', 1.5), (5546, 2140, 'k35', 1.75), (5547, 1056, 'k48', 2.0), (5548, 2973, 'k61', 2.25), (5549, 1889, 'k74', 2.5), (5550, 805, 'k87', 2.75), (5551, 2722, 'k100', 3.0), (5552, 1638, 'k113', 3.25), (5553, 554, 'k126', 3.5), (5554, 2471, 'k139', 3.75), (5555, 1387, 'k152', 4.0), (5556, 303, 'k8', 4.25), (5557, 2220, 'k21', 4.5), (5558, 1136, 'k34', 4.75), (5559, 52, 'k47', 5.0), (5560, 1969, 'k60', 5.25), (5561, 885, 'k73', 5.5), (5562, 2802, 'k86', 5.75), (5563, 1718, 'k99', 6.0), (5564, 634, 'k112', 6.25), (5565, 2551, 'k125', 6.5), (5566, 1467, 'k138', 6.75), (5567, 383, 'k151', 7.0), (5568, 2300, 'k7', 0.0), (5569, 1216, 'k20', 0.25), (5570, 132, 'k33', 0.5), (5571, 2049, 'k46', 0.75), (5572, 965, 'k59', 1.0), (5573, 2882, 'k72', 1.25), (5574, 1798, 'k85', 1.5), (5575, 714, 'k98', 1.75), (5576, 2631, 'k111', 2.0), (5577, 1547, 'k124', 2.25), (5578, 463, 'k137', 2.5), (5579, 2380, 'k150', 2.75), (5580, 1296, 'k6', 3.0), (5581, 212, 'k19', 3.25), (5582, 2129, 'k32', 3.5), (5583, 1045, 'k45', 3.75), (5584, 2962, 'k58', 4.0), (5585, 1878, 'k71', 4.25), (5586, 794, 'k84', 4.5), (5587, 2711, 'k97', 4.75), (5588, 1627, 'k110', 5.0), (5589, 543, 'k123', 5.25), (5590, 2460, 'k136', 5.5), (5591, 1376, 'k149', 5.75), (5592, 292, 'k5', 6.0), (5593, 2209, 'k18', 6.25), (5594, 1125, 'k31', 6.5), (5595, 41, 'k44', 6.75), (5596, 1958, 'k57', 7.0), (5597, 874, 'k70', 0.0), (5598, 2791, 'k83', 0.25), (5599, 1707, 'k96', 0.5), (5600, 623, 'k109', 0.75), (5601, 2540, 'k122', 1.0), (5602, 1456, 'k135', 1.25), (5603, 372, 'k148', 1.5), (5604, 2289, 'k4', 1.75), (5605, 1205, 'k17', 2.0), (5606, 121, 'k30', 2.25), (5607, 2038, 'k43', 2.5), (5608, 954, 'k56', 2.75), (5609, 2871, 'k69', 3.0), (5610, 1787, 'k82', 3.25), (5611, 703, 'k95', 3.5), (5612, 2620, 'k108', 3.75), (5613, 1536, 'k121', 4.0), (5614, 452, 'k134', 4.25), (5615, 2369, 'k147', 4.5), (5616, 1285, 'k3', 4.75), (5617, 201, 'k16', 5.0), (5618, 2118, 'k29', 5.25), (5619, 1034, 'k42', 5.5), (5620, 2951, 'k55', 5.75), (5621, 1867, 'k68', 6.0), (5622, 783, 'k81', 6.25), (5623, 2700, 'k94', 6.5), (5624, 1616, 'k107', 6.75), (5625, 532, 'k120', 7.0), (5626, 2449, 'k133', 0.0), (5627, 1365, 'k146', 0.25), (5628, 281, 'k2', 0.5), (5629, 2198, 'k15', 0.75), (5630, 1114, 'k28', 1.0), (5631, 30, 'k41', 1.25), (5632, 1947, 'k54', 1.5), (5633, 863, 'k67', 1.75), (5634, 2780, 'k80', 2.0), (5635, 1696, 'k93', 2.25), (5636, 612, 'k106', 2.5), (5637, 2529, 'k119', 2.75), (5638, 1445, 'k132', 3.0), (5639, 361, 'k145', 3.25), (5640, 2278, 'k1', 3.5), (5641, 1194, 'k14', 3.75), (5642, 110, 'k27', 4.0), (5643, 2027, 'k40', 4.25), (5644, 943, 'k53', 4.5), (5645, 2860, 'k66', 4.75), (5646, 1776, 'k79', 5.0), (5647, 692, 'k92', 5.25), (5648, 2609, 'k105', 5.5), (5649, 1525, 'k118', 5.75), (5650, 441, 'k131', 6.0), (5651, 2358, 'k144', 6.25), (5652, 1274, 'k0', 6.5), (5653, 190, 'k13', 6.75), (5654, 2107, 'k26', 7.0), (5655, 1023, 'k39', 0.0), (5656, 2940, 'k52', 0.25), (5657, 1856, 'k65', 0.5), (5658, 772, 'k78', 0.75), (5659, 2689, 'k91', 1.0), (5660, 1605, 'k104', 1.25), (5661, 521, 'k117', 1.5), (5662, 2438, 'k130', 1.75), (5663, 1354, 'k143', 2.0), (5664, 270, 'k156', 2.25), (5665, 2187, 'k12', 2.5), (5666, 1103, 'k25', 2.75), (5667, 19, 'k38', 3.0), (5668, 1936, 'k51', 3.25), (5669, 852, 'k64', 3.5), (5670, 2769, 'k77', 3.75), (5671, 1685, 'k90', 4.0), (5672, 601, 'k103', 4.25), (5673, 2518, 'k116', 4.5), (5674, 1434, 'k129', 4.75), (5675, 350, 'k142', 5.0), (5676, 2267, 'k155', 5.25), (5677, 1183, 'k11', 5.5), (5678, 99, 'k24', 5.75), (5679, 2016, 'k37', 6.0), (5680, 932, 'k50', 6.25), (5681, 2849, 'k63', 6.5), (5682, 1765, 'k76', 6.75), (5683, 681, 'k89', 7.0), (5684, 2598, 'k102', 0.0), (5685, 1514, 'k115', 0.25), (5686, 430, 'k128', 0.5), (5687, 2347, 'k141', 0.75), (5688, 1263, 'k154', 1.0), (5689, 179, 'k10', 1.25), (5690, 2096, 'k23', 1.5), (5691, 1012, 'k36', 1.75), (5692, 2929, 'k49', 2.0), (5693, 1845, 'k62', 2.25), (5694, 761, 'k75', 2.5), (5695, 2678, 'k88', 2.75), (5696, 1594, 'k101', 3.0), (5697, 510, 'k114', 3.25), (5698, 2427, 'k127', 3.5), (5699, 1343, 'k140', 3.75), (5700, 259, 'k153', 4.0), (5701, 2176, 'k9', 4.25), (5702, 1092, 'k22', 4.5), (5703, 8, 'k35', 4.75), (5704, 1925, 'k48', 5.0), (5705, 841, 'k61', 5.25), (5706, 2758, 'k74', 5.5), (5707, 1674, 'k87', 5.75), (5708, 590, 'k100', 6.0), (5709, 2507, 'k113', 6.25), (5710, 1423, 'k126', 6.5), (5711, 339, 'k139', 6.75), (5712, 2256, 'k152', 7.0), (5713, 1172, 'k8', 0.0), (5714, 88, 'k21', 0.25), (5715, 2005, 'k34', 0.5), (5716, 921, 'k47', 0.75), (5717, 2838, 'k60', 1.0), (5718, 1754, 'k73', 1.25), (5719, 670, 'k86', 1.5), (5720, 2587, 'k99', 1.75), (5721, 1503, 'k112', 2.0), (5722, 419, 'k125', 2.25), (5723, 2336, 'k138', 2.5), (5724, 1252, 'k151', 2.75), (5725, 168, 'k7', 3.0), (5726, 2085, 'k20', 3.25), (5727, 1001, 'k33', 3.5), (5728, 2918, 'k46', 3.75), (5729, 1834, 'k59', 4.0), (5730, 750, 'k72', 4.25), (5731, 2667, 'k85', 4.5), (5732, 1583, 'k98', 4.75), (5733, 499, 'k111', 5.0), (5734, 2416, 'k124', 5.25), (5735, 1332, 'k137', 5.5), (5736, 248, 'k150', 5.75), (5737, 2165, 'k6', 6.0), (5738, 1081, 'k19', 6.25), (5739, 2998, 'k32', 6.5), (5740, 1914, 'k45', 6.75), (5741, 830, 'k58', 7.0), (5742, 2747, 'k71', 0.0), (5743, 1663, 'k84', 0.25), (5744, 579, 'k97', 0.5), (5745, 2496, 'k110', 0.75), (5746, 1412, 'k123', 1.0), (5747, 328, 'k136', 1.25), (5748, 2245, 'k149', 1.5), (5749, 1161, 'k5', 1.75), (5750, 77, 'k18', 2.0), (5751, 1994, 'k31', 2.25), (5752, 910, 'k44', 2.5), (5753, 2827, 'k57', 2.75), (5754, 1743, 'k70', 3.0), (5755, 659, 'k83', 3.25), (5756, 2576, 'k96', 3.5), (5757, 1492, 'k109', 3.75), (5758, 408, 'k122', 4.0), (5759, 2325, 'k135', 4.25), (5760, 1241, 'k148', 4.5), (5761, 157, 'k4', 4.75), (5762, 2074, 'k17', 5.0), (5763, 990, 'k30', 5.25), (5764, 2907, 'k43', 5.5), (5765, 1823, 'k56', 5.75), (5766, 739, 'k69', 6.0), (5767, 2656, 'k82', 6.25), (5768, 1572, 'k95', 6.5), (5769, 488, 'k108', 6.75), (5770, 2405, 'k121', 7.0), (5771, 1321, 'k134', 0.0), (5772, 237, 'k147', 0.25), (5773, 2154, 'k3', 0.5), (5774, 1070, 'k16', 0.75), (5775, 2987, 'k29', 1.0), (5776, 1903, 'k42', 1.25), (5777, 819, 'k55', 1.5), (5778, 2736, 'k68', 1.75), (5779, 1652, 'k81', 2.0), (5780, 568, 'k94', 2.25), (5781, 2485, 'k107', 2.5), (5782, 1401, 'k120', 2.75), (5783, 317, 'k133', 3.0), (5784, 2234, 'k146', 3.25), (5785, 1150, 'k2', 3.5), (5786, 66, 'k15', 3.75), (5787, 1983, 'k28', 4.0), (5788, 899, 'k41', 4.25), (5789, 2816, 'k54', 4.5), (5790, 1732, 'k67', 4.75), (5791, 648, 'k80', 5.0), (5792, 2565, 'k93', 5.25), (5793, 1481, 'k106', 5.5), (5794, 397, 'k119', 5.75), (5795, 2314, 'k132', 6.0), (5796, 1230, 'k145', 6.25), (5797, 146, 'k1', 6.5), (5798, 2063, 'k14', 6.75), (5799, 979, 'k27', 7.0), (5800, 2896, 'k40', 0.0), (5801, 1812, 'k53', 0.25), (5802, 728, 'k66', 0.5), (5803, 2645, 'k79', 0.75), (5804, 1561, 'k92', 1.0), (5805, 477, 'k105', 1.25), (5806, 2394, 'k118', 1.5), (5807, 1310, 'k131', 1.75), (5808, 226, 'k144', 2.0), (5809, 2143, 'k0', 2.25), (5810, 1059, 'k13', 2.5), (5811, 2976, 'k26', 2.75), (5812, 1892, 'k39', 3.0), (5813, 808, 'k52', 3.25), (5814, 2725, 'k65', 3.5), (5815, 1641, 'k78', 3.75), (5816, 557, 'k91', 4.0), (5817, 2474, 'k104', 4.25), (5818, 1390, 'k117', 4.5), (5819, 306, 'k130', 4.75), (5820, 2223, 'k143', 5.0), (5821, 1139, 'k156', 5.25), (5822, 55, 'k12', 5.5), (5823, 1972, 'k25', 5.75), (5824, 888, 'k38', 6.0), (5825, 2805, 'k51', 6.25), (5826, 1721, 'k64', 6.5), (5827, 637, 'k77', 6.75), (5828, 2554, 'k90', 7.0), (5829, 1470, 'k103', 0.0), (5830, 386, 'k116', 0.25), (5831, 2303, 'k129', 0.5), (5832, 1219, 'k142', 0.75), (5833, 135, 'k155', 1.0), (5834, 2052, 'k11', 1.25), (5835, 968, 'k24', 1.5), (5836, 2885, 'k37', 1.75), (5837, 1801, 'k50', 2.0), (5838, 717, 'k63', 2.25), (5839, 2634, 'k76', 2.5), (5840, 1550, 'k89', 2.75), (5841, 466, 'k102', 3.0), (5842, 2383, 'k115', 3.25), (5843, 1299, 'k128', 3.5), (5844, 215, 'k141', 3.75), (5845, 2132, 'k154', 4.0), (5846, 1048, 'k10', 4.25), (5847, 2965, 'k23', 4.5), (5848, 1881, 'k36', 4.75), (5849, 797, 'k49', 5.0), (5850, 2714, 'k62', 5.25), (5851, 1630, 'k75', 5.5), (5852, 546, 'k88', 5.75), (5853, 2463, 'k101', 6.0), (5854, 1379, 'k114', 6.25), (5855, 295, 'k127', 6.5), (5856, 2212, 'k140', 6.75), (5857, 1128, 'k153', 7.0), (5858, 44, 'k9', 0.0), (5859, 1961, 'k22', 0.25), (5860, 877, 'k35', 0.5), (5861, 2794, 'k48', 0.75), (5862, 1710, 'k61', 1.0), (5863, 626, 'k74', 1.25), (5864, 2543, 'k87', 1.5), (5865, 1459, 'k100', 1.75), (5866, 375, 'k113', 2.0), (5867, 2292, 'k126', 2.25), (5868, 1208, 'k139', 2.5), (5869, 124, 'k152', 2.75), (5870, 2041, 'k8', 3.0), (5871, 957, 'k21', 3.25), (5872, 2874, 'k34', 3.5), (5873, 1790, 'k47', 3.75), (5874, 706, 'k60', 4.0), (5875, 2623, 'k73', 4.25), (5876, 1539, 'k86', 4.5), (5877, 455, 'k99', 4.75), (5878, 2372, 'k112', 5.0), (5879, 1288, 'k125', 5.25), (5880, 204, 'k138', 5.5), (5881, 2121, 'k151', 5.75), (5882, 1037, 'k7', 6.0), (5883, 2954, 'k20', 6.25), (5884, 1870, 'k33', 6.5), (5885, 786, 'k46', 6.75), (5886, 2703, 'k59', 7.0), (5887, 1619, 'k72', 0.0), (5888, 535, 'k85', 0.25), (5889, 2452, 'k98', 0.5), (5890, 1368, 'k111', 0.75), (5891, 284, 'k124', 1.0), (5892, 2201, 'k137', 1.25), (5893, 1117, 'k150', 1.5), (5894, 33, 'k6', 1.75), (5895, 1950, 'k19', 2.0), (5896, 866, 'k32', 2.25), (5897, 2783, 'k45', 2.5), (5898, 1699, 'k58', 2.75), (5899, 615, 'k71', 3.0), (5900, 2532, 'k84', 3.25), (5901, 1448, 'k97', 3.5), (5902, 364, 'k110', 3.75), (5903, 2281, 'k123', 4.0), (5904, 1197, 'k136', 4.25), (5905, 113, 'k149', 4.5), (5906, 2030, 'k5', 4.75), (5907, 946, 'k18', 5.0), (5908, 2863, 'k31', 5.25), (5909, 1779, 'k44', 5.5), (5910, 695, 'k57', 5.75), (5911, 2612, 'k70', 6.0), (5912, 1528, 'k83', 6.25), (5913, 444, 'k96', 6.5), (5914, 2361, 'k109', 6.75), (5915, 1277, 'k122', 7.0), (5916, 193, 'k135', 0.0), (5917, 2110, 'k148', 0.25), (5918, 1026, 'k4', 0.5), (5919, 2943, 'k17', 0.75), (5920, 1859, 'k30', 1.0), (5921, 775, 'k43', 1.25), (5922, 2692, 'k56', 1.5), (5923, 1608, 'k69', 1.75), (5924, 524, 'k82', 2.0), (5925, 2441, 'k95', 2.25), (5926, 1357, 'k108', 2.5), (5927, 273, 'k121', 2.75), (5928, 2190, 'k134', 3.0), (5929, 1106, 'k147', 3.25), (5930, 22, 'k3', 3.5), (5931, 1939, 'k16', 3.75), (5932, 855, 'k29', 4.0), (5933, 2772, 'k42', 4.25), (5934, 1688, 'k55', 4.5), (5935, 604, 'k68', 4.75), (5936, 2521, 'k81', 5.0), (5937, 1437, 'k94', 5.25), (5938, 353, 'k107', 5.5), (5939, 2270, 'k120', 5.75), (5940, 1186, 'k133', 6.0), (5941, 102, 'k146', 6.25), (5942, 2019, 'k2', 6.5), (5943, 935, 'k15', 6.75), (5944, 2852, 'k28', 7.0), (5945, 1768, 'k41', 0.0), (5946, 684, 'k54', 0.25), (5947, 2601, 'k67', 0.5), (5948, 1517, 'k80', 0.75), (5949, 433, 'k93', 1.0), (5950, 2350, 'k106', 1.25), (5951, 1266, 'k119', 1.5), (5952, 182, 'k132', 1.75), (5953, 2099, 'k145', 2.0), (5954, 1015, 'k1', 2.25), (5955, 2932, 'k14', 2.5), (5956, 1848, 'k27', 2.75), (5957, 764, 'k40', 3.0), (5958, 2681, 'k53', 3.25), (5959, 1597, 'k66', 3.5), (5960, 513, 'k79', 3.75), (5961, 2430, 'k92', 4.0), (5962, 1346, 'k105', 4.25), (5963, 262, 'k118', 4.5), (5964, 2179, 'k131', 4.75), (5965, 1095, 'k144', 5.0), (5966, 11, 'k0', 5.25), (5967, 1928, 'k13', 5.5), (5968, 844, 'k26', 5.75), (5969, 2761, 'k39', 6.0), (5970, 1677, 'k52', 6.25), (5971, 593, 'k65', 6.5), (5972, 2510, 'k78', 6.75), (5973, 1426, 'k91', 7.0), (5974, 342, 'k104', 0.0), (5975, 2259, 'k117', 0.25), (5976, 1175, 'k130', 0.5), (5977, 91, 'k143', 0.75), (5978, 2008, 'k156', 1.0), (5979, 924, 'k12', 1.25), (5980, 2841, 'k25', 1.5), (5981, 1757, 'k38', 1.75), (5982, 673, 'k51', 2.0), (5983, 2590, 'k64', 2.25), (5984, 1506, 'k77', 2.5), (5985, 422, 'k90', 2.75), (5986, 2339, 'k103', 3.0), (5987, 1255, 'k116', 3.25), (5988, 171, 'k129', 3.5), (5989, 2088, 'k142', 3.75), (5990, 1004, 'k155', 4.0), (5991, 2921, 'k11', 4.25), (5992, 1837, 'k24', 4.5), (5993, 753, 'k37', 4.75), (5994, 2670, 'k50', 5.0), (5995, 1586, 'k63', 5.25), (5996, 502, 'k76', 5.5), (5997, 2419, 'k89', 5.75), (5998, 1335, 'k102', 6.0), (5999, 251, 'k115', 6.25), (6000, 2168, 'k128', 6.5), (6001, 1084, 'k141', 6.75), (6002, 0, 'k154', 7.0), (6003, 1917, 'k10', 0.0), (6004, 833, 'k23', 0.25), (6005, 2750, 'k36', 0.5), (6006, 1666, 'k49', 0.75), (6007, 582, 'k62', 1.0), (6008, 2499, 'k75', 1.25), (6009, 1415, 'k88', 1.5), (6010, 331, 'k101', 1.75), (6011, 2248, 'k114', 2.0), (6012, 1164, 'k127', 2.25), (6013, 80, 'k140', 2.5), (6014, 1997, 'k153', 2.75), (6015, 913, 'k9', 3.0), (6016, 2830, 'k22', 3.25), (6017, 1746, 'k35', 3.5), (6018, 662, 'k48', 3.75), (6019, 2579, 'k61', 4.0), (6020, 1495, 'k74', 4.25), (6021, 411, 'k87', 4.5), (6022, 2328, 'k100', 4.75), (6023, 1244, 'k113', 5.0), (6024, 160, 'k126', 5.25), (6025, 2077, 'k139', 5.5), (6026, 993, 'k152', 5.75), (6027, 2910, 'k8', 6.0), (6028, 1826, 'k21', 6.25), (6029, 742, 'k34', 6.5), (6030, 2659, 'k47', 6.75), (6031, 1575, 'k60', 7.0), (6032, 491, 'k73', 0.0), (6033, 2408, 'k86', 0.25), (6034, 1324, 'k99', 0.5), (6035, 240, 'k112', 0.75), (6036, 2157, 'k125', 1.0), (6037, 1073, 'k138', 1.25), (6038, 2990, 'k151', 1.5), (6039, 1906, 'k7', 1.75), (6040, 822, 'k20', 2.0), (6041, 2739, 'k33', 2.25), (6042, 1655, 'k46', 2.5), (6043, 571, 'k59', 2.75), (6044, 2488, 'k72', 3.0), (6045, 1404, 'k85', 3.25), (6046, 320, 'k98', 3.5), (6047, 2237, 'k111', 3.75), (6048, 1153, 'k124', 4.0), (6049, 69, 'k137', 4.25), (6050, 1986, 'k150', 4.5), (6051, 902, 'k6', 4.75), (6052, 2819, 'k19', 5.0), (6053, 1735, 'k32', 5.25), (6054, 651, 'k45', 5.5), (6055, 2568, 'k58', 5.75), (6056, 1484, 'k71', 6.0), (6057, 400, 'k84', 6.25), (6058, 2317, 'k97', 6.5), (6059, 1233, 'k110', 6.75), (6060, 149, 'k123', 7.0), (6061, 2066, 'k136', 0.0), (6062, 982, 'k149', 0.25), (6063, 2899, 'k5', 0.5), (6064, 1815, 'k18', 0.75), (6065, 731, 'k31', 1.0), (6066, 2648, 'k44', 1.25), (6067, 1564, 'k57', 1.5), (6068, 480, 'k70', 1.75), (6069, 2397, 'k83', 2.0), (6070, 1313, 'k96', 2.25), (6071, 229, 'k109', 2.5), (6072, 2146, 'k122', 2.75), (6073, 1062, 'k135', 3.0), (6074, 2979, 'k148', 3.25), (6075, 1895, 'k4', 3.5), (6076, 811, 'k17', 3.75), (6077, 2728, 'k30', 4.0), (6078, 1644, 'k43', 4.25), (6079, 560, 'k56', 4.5), (6080, 2477, 'k69', 4.75), (6081, 1393, 'k82', 5.0), (6082, 309, 'k95', 5.25), (6083, 2226, 'k108', 5.5), (6084, 1142, 'k121', 5.75), (6085, 58, 'k134', 6.0), (6086, 1975, 'k147', 6.25), (6087, 891, 'k3', 6.5), (6088, 2808, 'k16', 6.75), (6089, 1724, 'k29', 7.0), (6090, 640, 'k42', 0.0), (6091, 2557, 'k55', 0.25), (6092, 1473, 'k68', 0.5), (6093, 389, 'k81', 0.75), (6094, 2306, 'k94', 1.0), (6095, 1222, 'k107', 1.25), (6096, 138, 'k120', 1.5), (6097, 2055, 'k133', 1.75), (6098, 971, 'k146', 2.0), (6099, 2888, 'k2', 2.25), (6100, 1804, 'k15', 2.5), (6101, 720, 'k28', 2.75), (6102, 2637, 'k41', 3.0), (6103, 1553, 'k54', 3.25), (6104, 469, 'k67', 3.5), (6105, 2386, 'k80', 3.75), (6106, 1302, 'k93', 4.0), (6107, 218, 'k106', 4.25), (6108, 2135, 'k119', 4.5), (6109, 1051, 'k132', 4.75), (6110, 2968, 'k145', 5.0), (6111, 1884, 'k1', 5.25), (6112, 800, 'k14', 5.5), (6113, 2717, 'k27', 5.75), (6114, 1633, 'k40', 6.0), (6115, 549, 'k53', 6.25), (6116, 2466, 'k66', 6.5), (6117, 1382, 'k79', 6.75), (6118, 298, 'k92', 7.0), (6119, 2215, 'k105', 0.0), (6120, 1131, 'k118', 0.25), (6121, 47, 'k131', 0.5), (6122, 1964, 'k144', 0.75), (6123, 880, 'k0', 1.0), (6124, 2797, 'k13', 1.25), (6125, 1713, 'k26', 1.5), (6126, 629, 'k39', 1.75), (6127, 2546, 'k52', 2.0), (6128, 1462, 'k65', 2.25), (6129, 378, 'k78', 2.5), (6130, 2295, 'k91', 2.75), (6131, 1211, 'k104', 3.0), (6132, 127, 'k117', 3.25), (6133, 2044, 'k130', 3.5), (6134, 960, 'k143', 3.75), (6135, 2877, 'k156', 4.0), (6136, 1793, 'k12', 4.25), (6137, 709, 'k25', 4.5), (6138, 2626, 'k38', 4.75), (6139, 1542, 'k51', 5.0), (6140, 458, 'k64', 5.25), (6141, 2375, 'k77', 5.5), (6142, 1291, 'k90', 5.75), (6143, 207, 'k103', 6.0), (6144, 2124, 'k116', 6.25), (6145, 1040, 'k129', 6.5), (6146, 2957, 'k142', 6.75), (6147, 1873, 'k155', 7.0), (6148, 789, 'k11', 0.0), (6149, 2706, 'k24', 0.25), (6150, 1622, 'k37', 0.5), (6151, 538, 'k50', 0.75), (6152, 2455, 'k63', 1.0), (6153, 1371, 'k76', 1.25), (6154, 287, 'k89', 1.5), (6155, 2204, 'k102', 1.75), (6156, 1120, 'k115', 2.0), (6157, 36, 'k128', 2.25), (6158, 1953, 'k141', 2.5), (6159, 869, 'k154', 2.75), (6160, 2786, 'k10', 3.0), (6161, 1702, 'k23', 3.25), (6162, 618, 'k36', 3.5), (6163, 2535, 'k49', 3.75), (6164, 1451, 'k62', 4.0), (6165, 367, 'k75', 4.25), (6166, 2284, 'k88', 4.5), (6167, 1200, 'k101', 4.75), (6168, 116, 'k114', 5.0), (6169, 2033, 'k127', 5.25), (6170, 949, 'k140', 5.5), (6171, 2866, 'k153', 5.75), (6172, 1782, 'k9', 6.0), (6173, 698, 'k22', 6.25), (6174, 2615, 'k35', 6.5), (6175, 1531, 'k48', 6.75), (6176, 447, 'k61', 7.0), (6177, 2364, 'k74', 0.0), (6178, 1280, 'k87', 0.25), (6179, 196, 'k100', 0.5), (6180, 2113, 'k113', 0.75), (6181, 1029, 'k126', 1.0), (6182, 2946, 'k139', 1.25), (6183, 1862, 'k152', 1.5), (6184, 778, 'k8', 1.75), (6185, 2695, 'k21', 2.0), (6186, 1611, 'k34', 2.25), (6187, 527, 'k47', 2.5), (6188, 2444, 'k60', 2.75), (6189, 1360, 'k73', 3.0), (6190, 276, 'k86', 3.25), (6191, 2193, 'k99', 3.5), (6192, 1109, 'k112', 3.75), (6193, 25, 'k125', 4.0), (6194, 1942, 'k138', 4.25), (6195, 858, 'k151', 4.5), (6196, 2775, 'k7', 4.75), (6197, 1691, 'k20', 5.0), (6198, 607, 'k33', 5.25), (6199, 2524, 'k46', 5.5), (6200, 1440, 'k59', 5.75), (6201, 356, 'k72', 6.0), (6202, 2273, 'k85', 6.25), (6203, 1189, 'k98', 6.5), (6204, 105, 'k111', 6.75), (6205, 2022, 'k124', 7.0), (6206, 938, 'k137', 0.0), (6207, 2855, 'k150', 0.25), (6208, 1771, 'k6', 0.5), (6209, 687, 'k19', 0.75), (6210, 2604, 'k32', 1.0), (6211, 1520, 'k45', 1.25), (6212, 436, 'k58', 1.5), (6213, 2353, 'k71', 1.75), (6214, 1269, 'k84', 2.0), (6215, 185, 'k97', 2.25), (6216, 2102, 'k110', 2.5), (6217, 1018, 'k123', 2.75), (6218, 2935, 'k136', 3.0), (6219, 1851, 'k149', 3.25), (6220, 767, 'k5', 3.5), (6221, 2684, 'k18', 3.75), (6222, 1600, 'k31', 4.0), (6223, 516, 'k44', 4.25), (6224, 2433, 'k57', 4.5), (6225, 1349, 'k70', 4.75), (6226, 265, 'k83', 5.0), (6227, 2182, 'k96', 5.25), (6228, 1098, 'k109', 5.5), (6229, 14, 'k122', 5.75), (6230, 1931, 'k135', 6.0), (6231, 847, 'k148', 6.25), (6232, 2764, 'k4', 6.5), (6233, 1680, 'k17', 6.75), (6234, 596, 'k30', 7.0), (6235, 2513, 'k43', 0.0), (6236, 1429, 'k56', 0.25), (6237, 345, 'k69', 0.5), (6238, 2262, 'k82', 0.75), (6239, 1178, 'k95', 1.0), (6240, 94, 'k108', 1.25), (6241, 2011, 'k121', 1.5), (6242, 927, 'k134', 1.75), (6243, 2844, 'k147', 2.0), (6244, 1760, 'k3', 2.25), (6245, 676, 'k16', 2.5), (6246, 2593, 'k29', 2.75), (6247, 1509, 'k42', 3.0), (6248, 425, 'k55', 3.25), (6249, 2342, 'k68', 3.5), (6250, 1258, 'k81', 3.75), (6251, 174, 'k94', 4.0), (6252, 2091, 'k107', 4.25), (6253, 1007, 'k120', 4.5), (6254, 2924, 'k133', 4.75), (6255, 1840, 'k146', 5.0), (6256, 756, 'k2', 5.25), (6257, 2673, 'k15', 5.5), (6258, 1589, 'k28', 5.75), (6259, 505, 'k41', 6.0), (6260, 2422, 'k54', 6.25), (6261, 1338, 'k67', 6.5), (6262, 254, 'k80', 6.75), (6263, 2171, 'k93', 7.0), (6264, 1087, 'k106', 0.0), (6265, 3, 'k119', 0.25), (6266, 1920, 'k132', 0.5), (6267, 836, 'k145', 0.75), (6268, 2753, 'k1', 1.0), (6269, 1669, 'k14', 1.25), (6270, 585, 'k27', 1.5), (6271, 2502, 'k40', 1.75), (6272, 1418, 'k53', 2.0), (6273, 334, 'k66', 2.25), (6274, 2251, 'k79', 2.5), (6275, 1167, 'k92', 2.75), (6276, 83, 'k105', 3.0), (6277, 2000, 'k118', 3.25), (6278, 916, 'k131', 3.5), (6279, 2833, 'k144', 3.75), (6280, 1749, 'k0', 4.0), (6281, 665, 'k13', 4.25), (6282, 2582, 'k26', 4.5), (6283, 1498, 'k39', 4.75), (6284, 414, 'k52', 5.0), (6285, 2331, 'k65', 5.25), (6286, 1247, 'k78', 5.5), (6287, 163, 'k91', 5.75), (6288, 2080, 'k104', 6.0), (6289, 996, 'k117', 6.25), (6290, 2913, 'k130', 6.5), (6291, 1829, 'k143', 6.75), (6292, 745, 'k156', 7.0), (6293, 2662, 'k12', 0.0), (6294, 1578, 'k25', 0.25), (6295, 494, 'k38', 0.5), (6296, 2411, 'k51', 0.75), (6297, 1327, 'k64', 1.0), (6298, 243, 'k77', 1.25), (6299, 2160, 'k90', 1.5), (6300, 1076, 'k103', 1.75), (6301, 2993, 'k116', 2.0), (6302, 1909, 'k129', 2.25), (6303, 825, 'k142', 2.5), (6304, 2742, 'k155', 2.75), (6305, 1658, 'k11', 3.0), (6306, 574, 'k24', 3.25), (6307, 2491, 'k37', 3.5), (6308, 1407, 'k50', 3.75), (6309, 323, 'k63', 4.0), (6310, 2240, 'k76', 4.25), (6311, 1156, 'k89', 4.5), (6312, 72, 'k102', 4.75), (6313, 1989, 'k115', 5.0), (6314, 905, 'k128', 5.25), (6315, 2822, 'k141', 5.5), (6316, 1738, 'k154', 5.75), (6317, 654, 'k10', 6.0), (6318, 2571, 'k23', 6.25), (6319, 1487, 'k36', 6.5), (6320, 403, 'k49', 6.75), (6321, 2320, 'k62', 7.0), (6322, 1236, 'k75', 0.0), (6323, 152, 'k88', 0.25), (6324, 2069, 'k101', 0.5), (6325, 985, 'k114', 0.75), (6326, 2902, 'k127', 1.0), (6327, 1818, 'k140', 1.25), (6328, 734, 'k153', 1.5), (6329, 2651, 'k9', 1.75), (6330, 1567, 'k22', 2.0), (6331, 483, 'k35', 2.25), (6332, 2400, 'k48', 2.5), (6333, 1316, 'k61', 2.75), (6334, 232, 'k74', 3.0), (6335, 2149, 'k87', 3.25), (6336, 1065, 'k100', 3.5), (6337, 2982, 'k113', 3.75), (6338, 1898, 'k126', 4.0), (6339, 814, 'k139', 4.25), (6340, 2731, 'k152', 4.5), (6341, 1647, 'k8', 4.75), (6342, 563, 'k21', 5.0), (6343, 2480, 'k34', 5.25), (6344, 1396, 'k47', 5.5), (6345, 312, 'k60', 5.75), (6346, 2229, 'k73', 6.0), (6347, 1145, 'k86', 6.25), (6348, 61, 'k99', 6.5), (6349, 1978, 'k112', 6.75), (6350, 894, 'k125', 7.0), (6351, 2811, 'k138', 0.0), (6352, 1727, 'k151', 0.25), (6353, 643, 'k7', 0.5), (6354, 2560, 'k20', 0.75), (6355, 1476, 'k33', 1.0), (6356, 392, 'k46', 1.25), (6357, 2309, 'k59', 1.5), (6358, 1225, 'k72', 1.75), (6359, 141, 'k85', 2.0), (6360, 2058, 'k98', 2.25), (6361, 974, 'k111', 2.5), (6362, 2891, 'k124', 2.75), (6363, 1807, 'k137', 3.0), (6364, 723, 'k150', 3.25), (6365, 2640, 'k6', 3.5), (6366, 1556, 'k19', 3.75), (6367, 472, 'k32', 4.0), (6368, 2389, 'k45', 4.25), (6369, 1305, 'k58', 4.5), (6370, 221, 'k71', 4.75), (6371, 2138, 'k84', 5.0), (6372, 1054, 'k97', 5.25), (6373, 2971, 'k110', 5.5), (6374, 1887, 'k123', 5.75), (6375, 803, 'k136', 6.0), (6376, 2720, 'k149', 6.25), (6377, 1636, 'k5', 6.5), (6378, 552, 'k18', 6.75), (6379, 2469, 'k31', 7.0), (6380, 1385, 'k44', 0.0), (6381, 301, 'k57', 0.25), (6382, 2218, 'k70', 0.5), (6383, 1134, 'k83', 0.75), (6384, 50, 'k96', 1.0), (6385, 1967, 'k109', 1.25), (6386, 883, 'k122', 1.5), (6387, 2800, 'k135', 1.75), (6388, 1716, 'k148', 2.0), (6389, 632, 'k4', 2.25), (6390, 2549, 'k17', 2.5), (6391, 1465, 'k30', 2.75), (6392, 381, 'k43', 3.0), (6393, 2298, 'k56', 3.25), (6394, 1214, 'k69', 3.5), (6395, 130, 'k82', 3.75), (6396, 2047, 'k95', 4.0), (6397, 963, 'k108', 4.25), (6398, 2880, 'k121', 4.5), (6399, 1796, 'k134', 4.75), (6400, 712, 'k147', 5.0), (6401, 2629, 'k3', 5.25), (6402, 1545, 'k16', 5.5), (6403, 461, 'k29', 5.75), (6404, 2378, 'k42', 6.0), (6405, 1294, 'k55', 6.25), (6406, 210, 'k68', 6.5), (6407, 2127, 'k81', 6.75), (6408, 1043, 'k94', 7.0), (6409, 2960, 'k107', 0.0), (6410, 1876, 'k120', 0.25), (6411, 792, 'k133', 0.5), (6412, 2709, 'k146', 0.75), (6413, 1625, 'k2', 1.0), (6414, 541, 'k15', 1.25), (6415, 2458, 'k28', 1.5), (6416, 1374, 'k41', 1.75), (6417, 290, 'k54', 2.0), (6418, 2207, 'k67', 2.25), (6419, 1123, 'k80', 2.5), (6420, 39, 'k93', 2.75), (6421, 1956, 'k106', 3.0), (6422, 872, 'k119', 3.25), (6423, 2789, 'k132', 3.5), (6424, 1705, 'k145', 3.75), (6425, 621, 'k1', 4.0), (6426, 2538, 'k14', 4.25), (6427, 1454, 'k27', 4.5), (6428, 370, 'k40', 4.75), (6429, 2287, 'k53', 5.0), (6430, 1203, 'k66', 5.25), (6431, 119, 'k79', 5.5), (6432, 2036, 'k92', 5.75), (6433, 952, 'k105', 6.0), (6434, 2869, 'k118', 6.25), (6435, 1785, 'k131', 6.5), (6436, 701, 'k144', 6.75), (6437, 2618, 'k0', 7.0), (6438, 1534, 'k13', 0.0), (6439, 450, 'k26', 0.25), (6440, 2367, 'k39', 0.5), (6441, 1283, 'k52', 0.75), (6442, 199, 'k65', 1.0), (6443, 2116, 'k78', 1.25), (6444, 1032, 'k91', 1.5), (6445, 2949, 'k104', 1.75), (6446, 1865, 'k117', 2.0), (6447, 781, 'k130', 2.25), (6448, 2698, 'k143', 2.5), (6449, 1614, 'k156', 2.75), (6450, 530, 'k12', 3.0), (6451, 2447, 'k25', 3.25), (6452, 1363, 'k38', 3.5), (6453, 279, 'k51', 3.75), (6454, 2196, 'k64', 4.0), (6455, 1112, 'k77', 4.25), (6456, 28, 'k90', 4.5), (6457, 1945, 'k103', 4.75), (6458, 861, 'k116', 5.0), (6459, 2778, 'k129', 5.25), (6460, 1694, 'k142', 5.5), (6461, 610, 'k155', 5.75), (6462, 2527, 'k11', 6.0), (6463, 1443, 'k24', 6.25), (6464, 359, 'k37', 6.5), (6465, 2276, 'k50', 6.75), (6466, 1192, 'k63', 7.0), (6467, 108, 'k76', 0.0), (6468, 2025, 'k89', 0.25), (6469, 941, 'k102', 0.5), (6470, 2858, 'k115', 0.75), (6471, 1774, 'k128', 1.0), (6472, 690, 'k141', 1.25), (6473, 2607, 'k154', 1.5), (6474, 1523, 'k10', 1.75), (6475, 439, 'k23', 2.0), (6476, 2356, 'k36', 2.25), (6477, 1272, 'k49', 2.5), (6478, 188, 'k62', 2.75), (6479, 2105, 'k75', 3.0), (6480, 1021, 'k88', 3.25), (6481, 2938, 'k101', 3.5), (6482, 1854, 'k114', 3.75), (6483, 770, 'k127', 4.0), (6484, 2687, 'k140', 4.25), (6485, 1603, 'k153', 4.5), (6486, 519, 'k9', 4.75), (6487, 2436, 'k22', 5.0), (6488, 1352, 'k35', 5.25), (6489, 268, 'k48', 5.5), (6490, 2185, 'k61', 5.75), (6491, 1101, 'k74', 6.0), (6492, 17, 'k87', 6.25), (6493, 1934, 'k100', 6.5), (6494, 850, 'k113', 6.75), (6495, 2767, 'k126', 7.0), (6496, 1683, 'k139', 0.0), (6497, 599, 'k152', 0.25), (6498, 2516, 'k8', 0.5), (6499, 1432, 'k21', 0.75), (6500, 348, 'k34', 1.0), (6501, 2265, 'k47', 1.25), (6502, 1181, 'k60', 1.5), (6503, 97, 'k73', 1.75), (6504, 2014, 'k86', 2.0), (6505, 930, 'k99', 2.25), (6506, 2847, 'k112', 2.5), (6507, 1763, 'k125', 2.75), (6508, 679, 'k138', 3.0), (6509, 2596, 'k151', 3.25), (6510, 1512, 'k7', 3.5), (6511, 428, 'k20', 3.75), (6512, 2345, 'k33', 4.0), (6513, 1261, 'k46', 4.25), (6514, 177, 'k59', 4.5), (6515, 2094, 'k72', 4.75), (6516, 1010, 'k85', 5.0), (6517, 2927, 'k98', 5.25), (6518, 1843, 'k111', 5.5), (6519, 759, 'k124', 5.75), (6520, 2676, 'k137', 6.0), (6521, 1592, 'k150', 6.25), (6522, 508, 'k6', 6.5), (6523, 2425, 'k19', 6.75), (6524, 1341, 'k32', 7.0), (6525, 257, 'k45', 0.0), (6526, 2174, 'k58', 0.25), (6527, 1090, 'k71', 0.5), (6528, 6, 'k84', 0.75), (6529, 1923, 'k97', 1.0), (6530, 839, 'k110', 1.25), (6531, 2756, 'k123', 1.5), (6532, 1672, 'k136', 1.75), (6533, 588, 'k149', 2.0), (6534, 2505, 'k5', 2.25), (6535, 1421, 'k18', 2.5), (6536, 337, 'k31', 2.75), (6537, 2254, 'k44', 3.0), (6538, 1170, 'k57', 3.25), (6539, 86, 'k70', 3.5), (6540, 2003, 'k83', 3.75), (6541, 919, 'k96', 4.0), (6542, 2836, 'k109', 4.25), (6543, 1752, 'k122', 4.5), (6544, 668, 'k135', 4.75), (6545, 2585, 'k148', 5.0), (6546, 1501, 'k4', 5.25), (6547, 417, 'k17', 5.5), (6548, 2334, 'k30', 5.75), (6549, 1250, 'k43', 6.0), (6550, 166, 'k56', 6.25), (6551, 2083, 'k69', 6.5), (6552, 999, 'k82', 6.75), (6553, 2916, 'k95', 7.0), (6554, 1832, 'k108', 0.0), (6555, 748, 'k121', 0.25), (6556, 2665, 'k134', 0.5), (6557, 1581, 'k147', 0.75), (6558, 497, 'k3', 1.0), (6559, 2414, 'k16', 1.25), (6560, 1330, 'k29', 1.5), (6561, 246, 'k42', 1.75), (6562, 2163, 'k55', 2.0), (6563, 1079, 'k68', 2.25), (6564, 2996, 'k81', 2.5), (6565, 1912, 'k94', 2.75), (6566, 828, 'k107', 3.0), (6567, 2745, 'k120', 3.25), (6568, 1661, 'k133', 3.5), (6569, 577, 'k146', 3.75), (6570, 2494, 'k2', 4.0), (6571, 1410, 'k15', 4.25), (6572, 326, 'k28', 4.5), (6573, 2243, 'k41', 4.75), (6574, 1159, 'k54', 5.0), (6575, 75, 'k67', 5.25), (6576, 1992, 'k80', 5.5), (6577, 908, 'k93', 5.75), (6578, 2825, 'k106', 6.0), (6579, 1741, 'k119', 6.25), (6580, 657, 'k132', 6.5), (6581, 2574, 'k145', 6.75), (6582, 1490, 'k1', 7.0), (6583, 406, 'k14', 0.0), (6584, 2323, 'k27', 0.25), (6585, 1239, 'k40', 0.5), (6586, 155, 'k53', 0.75), (6587, 2072, 'k66', 1.0), (6588, 988, 'k79', 1.25), (6589, 2905, 'k92', 1.5), (6590, 1821, 'k105', 1.75), (6591, 737, 'k118', 2.0), (6592, 2654, 'k131', 2.25), (6593, 1570, 'k144', 2.5), (6594, 486, 'k0', 2.75), (6595, 2403, 'k13', 3.0), (6596, 1319, 'k26', 3.25), (6597, 235, 'k39', 3.5), (6598, 2152, 'k52', 3.75), (6599, 1068, 'k65', 4.0), (6600, 2985, 'k78', 4.25), (6601, 1901, 'k91', 4.5), (6602, 817, 'k104', 4.75), (6603, 2734, 'k117', 5.0), (6604, 1650, 'k130', 5.25), (6605, 566, 'k143', 5.5), (6606, 2483, 'k156', 5.75), (6607, 1399, 'k12', 6.0), (6608, 315, 'k25', 6.25), (6609, 2232, 'k38', 6.5), (6610, 1148, 'k51', 6.75), (6611, 64, 'k64', 7.0), (6612, 1981, 'k77', 0.0), (6613, 897, 'k90', 0.25), (6614, 2814, 'k103', 0.5), (6615, 1730, 'k116', 0.75), (6616, 646, 'k129', 1.0), (6617, 2563, 'k142', 1.25), (6618, 1479, 'k155', 1.5), (6619, 395, 'k11', 1.75), (6620, 2312, 'k24', 2.0), (6621, 1228, 'k37', 2.25), (6622, 144, 'k50', 2.5), (6623, 2061, 'k63', 2.75), (6624, 977, 'k76', 3.0), (6625, 2894, 'k89', 3.25), (6626, 1810, 'k102', 3.5), (6627, 726, 'k115', 3.75), (6628, 2643, 'k128', 4.0), (6629, 1559, 'k141', 4.25), (6630, 475, 'k154', 4.5), (6631, 2392, 'k10', 4.75), (6632, 1308, 'k23', 5.0), (6633, 224, 'k36', 5.25), (6634, 2141, 'k49', 5.5), (6635, 1057, 'k62', 5.75), (6636, 2974, 'k75', 6.0), (6637, 1890, 'k88', 6.25), (6638, 806, 'k101', 6.5), (6639, 2723, 'k114', 6.75), (6640, 1639, 'k127', 7.0), (6641, 555, 'k140', 0.0), (6642, 2472, 'k153', 0.25), (6643, 1388, 'k9', 0.5), (6644, 304, 'k22', 0.75), (6645, 2221, 'k35', 1.0), (6646, 1137, 'k48', 1.25), (6647, 53, 'k61', 1.5), (6648, 1970, 'k74', 1.75), (6649, 886, 'k87', 2.0), (6650, 2803, 'k100', 2.25), (6651, 1719, 'k113', 2.5), (6652, 635, 'k126', 2.75), (6653, 2552, 'k139', 3.0), (6654, 1468, 'k152', 3.25), (6655, 384, 'k8', 3.5), (6656, 2301, 'k21', 3.75), (6657, 1217, 'k34', 4.0), (6658, 133, 'k47', 4.25), (6659, 2050, 'k60', 4.5), (6660, 966, 'k73', 4.75), (6661, 2883, 'k86', 5.0), (6662, 1799, 'k99', 5.25), (6663, 715, 'k112', 5.5), (6664, 2632, 'k125', 5.75), (6665, 1548, 'k138', 6.0), (6666, 464, 'k151', 6.25), (6667, 2381, 'k7', 6.5), (6668, 1297, 'k20', 6.75), (6669, 213, 'k33', 7.0), (6670, 2130, 'k46', 0.0), (6671, 1046, 'k59', 0.25), (6672, 2963, 'k72', 0.5), (6673, 1879, 'k85', 0.75), (6674, 795, 'k98', 1.0), (6675, 2712, 'k111', 1.25), (6676, 1628, 'k124', 1.5), (6677, 544, 'k137', 1.75), (6678, 2461, 'k150', 2.0), (6679, 1377, 'k6', 2.25), (6680, 293, 'k19', 2.5), (6681, 2210, 'k32', 2.75), (6682, 1126, 'k45', 3.0), (6683, 42, 'k58', 3.25), (6684, 1959, 'k71', 3.5), (6685, 875, 'k84', 3.75), (6686, 2792, 'k97', 4.0), (6687, 1708, 'k110', 4.25), (6688, 624, 'k123', 4.5), (6689, 2541, 'k136', 4.75), (6690, 1457, 'k149', 5.0), (6691, 373, 'k5', 5.25), (6692, 2290, 'k18', 5.5), (6693, 1206, 'k31', 5.75), (6694, 122, 'k44', 6.0), (6695, 2039, 'k57', 6.25), (6696, 955, 'k70', 6.5), (6697, 2872, 'k83', 6.75), (6698, 1788, 'k96', 7.0), (6699, 704, 'k109', 0.0), (6700, 2621, 'k122', 0.25), (6701, 1537, 'k135', 0.5), (6702, 453, 'k148', 0.75), (6703, 2370, 'k4', 1.0), (6704, 1286, 'k17', 1.25), (6705, 202, 'k30', 1.5), (6706, 2119, 'k43', 1.75), (6707, 1035, 'k56', 2.0), (6708, 2952, 'k69', 2.25), (6709, 1868, 'k82', 2.5), (6710, 784, 'k95', 2.75), (6711, 2701, 'k108', 3.0), (6712, 1617, 'k121', 3.25), (6713, 533, 'k134', 3.5), (6714, 2450, 'k147', 3.75), (6715, 1366, 'k3', 4.0), (6716, 282, 'k16', 4.25), (6717, 2199, 'k29', 4.5), (6718, 1115, 'k42', 4.75), (6719, 31, 'k55', 5.0), (6720, 1948, 'k68', 5.25), (6721, 864, 'k81', 5.5), (6722, 2781, 'k94', 5.75), (6723, 1697, 'k107', 6.0), (6724, 613, 'k120', 6.25), (6725, 2530, 'k133', 6.5), (6726, 1446, 'k146', 6.75), (6727, 362, 'k2', 7.0), (6728, 2279, 'k15', 0.0), (6729, 1195, 'k28', 0.25), (6730, 111, 'k41', 0.5), (6731, 2028, 'k54', 0.75), (6732, 944, 'k67', 1.0), (6733, 2861, 'k80', 1.25), (6734, 1777, 'k93', 1.5), (6735, 693, 'k106', 1.75), (6736, 2610, 'k119', 2.0), (6737, 1526, 'k132', 2.25), (6738, 442, 'k145', 2.5), (6739, 2359, 'k1', 2.75), (6740, 1275, 'k14', 3.0), (6741, 191, 'k27', 3.25), (6742, 2108, 'k40', 3.5), (6743, 1024, 'k53', 3.75), (6744, 2941, 'k66', 4.0), (6745, 1857, 'k79', 4.25), (6746, 773, 'k92', 4.5), (6747, 2690, 'k105', 4.75), (6748, 1606, 'k118', 5.0), (6749, 522, 'k131', 5.25), (6750, 2439, 'k144', 5.5), (6751, 1355, 'k0', 5.75), (6752, 271, 'k13', 6.0), (6753, 2188, 'k26', 6.25), (6754, 1104, 'k39', 6.5), (6755, 20, 'k52', 6.75), (6756, 1937, 'k65', 7.0), (6757, 853, 'k78', 0.0), (6758, 2770, 'k91', 0.25), (6759, 1686, 'k104', 0.5), (6760, 602, 'k117', 0.75), (6761, 2519, 'k130', 1.0), (6762, 1435, 'k143', 1.25), (6763, 351, 'k156', 1.5), (6764, 2268, 'k12', 1.75), (6765, 1184, 'k25', 2.0), (6766, 100, 'k38', 2.25), (6767, 2017, 'k51', 2.5), (6768, 933, 'k64', 2.75), (6769, 2850, 'k77', 3.0), (6770, 1766, 'k90', 3.25), (6771, 682, 'k103', 3.5), (6772, 2599, 'k116', 3.75), (6773, 1515, 'k129', 4.0), (6774, 431, 'k142', 4.25), (6775, 2348, 'k155', 4.5), (6776, 1264, 'k11', 4.75), (6777, 180, 'k24', 5.0), (6778, 2097, 'k37', 5.25), (6779, 1013, 'k50', 5.5), (6780, 2930, 'k63', 5.75), (6781, 1846, 'k76', 6.0), (6782, 762, 'k89', 6.25), (6783, 2679, 'k102', 6.5), (6784, 1595, 'k115', 6.75), (6785, 511, 'k128', 7.0), (6786, 2428, 'k141', 0.0), (6787, 1344, 'k154', 0.25), (6788, 260, 'k10', 0.5), (6789, 2177, 'k23', 0.75), (6790, 1093, 'k36', 1.0), (6791, 9, 'k49', 1.25), (6792, 1926, 'k62', 1.5), (6793, 842, 'k75', 1.75), (6794, 2759, 'k88', 2.0), (6795, 1675, 'k101', 2.25), (6796, 591, 'k114', 2.5), (6797, 2508, 'k127', 2.75), (6798, 1424, 'k140', 3.0), (6799, 340, 'k153', 3.25), (6800, 2257, 'k9', 3.5), (6801, 1173, 'k22', 3.75), (6802, 89, 'k35', 4.0), (6803, 2006, 'k48', 4.25), (6804, 922, 'k61', 4.5), (6805, 2839, 'k74', 4.75), (6806, 1755, 'k87', 5.0), (6807, 671, 'k100', 5.25), (6808, 2588, 'k113', 5.5), (6809, 1504, 'k126', 5.75), (6810, 420, 'k139', 6.0), (6811, 2337, 'k152', 6.25), (6812, 1253, 'k8', 6.5), (6813, 169, 'k21', 6.75), (6814, 2086, 'k34', 7.0), (6815, 1002, 'k47', 0.0), (6816, 2919, 'k60', 0.25), (6817, 1835, 'k73', 0.5), (6818, 751, 'k86', 0.75), (6819, 2668, 'k99', 1.0), (6820, 1584, 'k112', 1.25), (6821, 500, 'k125', 1.5), (6822, 2417, 'k138', 1.75), (6823, 1333, 'k151', 2.0), (6824, 249, 'k7', 2.25), (6825, 2166, 'k20', 2.5), (6826, 1082, 'k33', 2.75), (6827, 2999, 'k46', 3.0), (6828, 1915, 'k59', 3.25), (6829, 831, 'k72', 3.5), (6830, 2748, 'k85', 3.75), (6831, 1664, 'k98', 4.0), (6832, 580, 'k111', 4.25), (6833, 2497, 'k124', 4.5), (6834, 1413, 'k137', 4.75), (6835, 329, 'k150', 5.0), (6836, 2246, 'k6', 5.25), (6837, 1162, 'k19', 5.5), (6838, 78, 'k32', 5.75), (6839, 1995, 'k45', 6.0), (6840, 911, 'k58', 6.25), (6841, 2828, 'k71', 6.5), (6842, 1744, 'k84', 6.75), (6843, 660, 'k97', 7.0), (6844, 2577, 'k110', 0.0), (6845, 1493, 'k123', 0.25), (6846, 409, 'k136', 0.5), (6847, 2326, 'k149', 0.75), (6848, 1242, 'k5', 1.0), (6849, 158, 'k18', 1.25), (6850, 2075, 'k31', 1.5), (6851, 991, 'k44', 1.75), (6852, 2908, 'k57', 2.0), (6853, 1824, 'k70', 2.25), (6854, 740, 'k83', 2.5), (6855, 2657, 'k96', 2.75), (6856, 1573, 'k109', 3.0), (6857, 489, 'k122', 3.25), (6858, 2406, 'k135', 3.5), (6859, 1322, 'k148', 3.75), (6860, 238, 'k4', 4.0), (6861, 2155, 'k17', 4.25), (6862, 1071, 'k30', 4.5), (6863, 2988, 'k43', 4.75), (6864, 1904, 'k56', 5.0), (6865, 820, 'k69', 5.25), (6866, 2737, 'k82', 5.5), (6867, 1653, 'k95', 5.75), (6868, 569, 'k108', 6.0), (6869, 2486, 'k121', 6.25), (6870, 1402, 'k134', 6.5), (6871, 318, 'k147', 6.75), (6872, 2235, 'k3', 7.0), (6873, 1151, 'k16', 0.0), (6874, 67, 'k29', 0.25), (6875, 1984, 'k42', 0.5), (6876, 900, 'k55', 0.75), (6877, 2817, 'k68', 1.0), (6878, 1733, 'k81', 1.25), (6879, 649, 'k94', 1.5), (6880, 2566, 'k107', 1.75), (6881, 1482, 'k120', 2.0), (6882, 398, 'k133', 2.25), (6883, 2315, 'k146', 2.5), (6884, 1231, 'k2', 2.75), (6885, 147, 'k15', 3.0), (6886, 2064, 'k28', 3.25), (6887, 980, 'k41', 3.5), (6888, 2897, 'k54', 3.75), (6889, 1813, 'k67', 4.0), (6890, 729, 'k80', 4.25), (6891, 2646, 'k93', 4.5), (6892, 1562, 'k106', 4.75), (6893, 478, 'k119', 5.0), (6894, 2395, 'k132', 5.25), (6895, 1311, 'k145', 5.5), (6896, 227, 'k1', 5.75), (6897, 2144, 'k14', 6.0), (6898, 1060, 'k27', 6.25), (6899, 2977, 'k40', 6.5), (6900, 1893, 'k53', 6.75), (6901, 809, 'k66', 7.0), (6902, 2726, 'k79', 0.0), (6903, 1642, 'k92', 0.25), (6904, 558, 'k105', 0.5), (6905, 2475, 'k118', 0.75), (6906, 1391, 'k131', 1.0), (6907, 307, 'k144', 1.25), (6908, 2224, 'k0', 1.5), (6909, 1140, 'k13', 1.75), (6910, 56, 'k26', 2.0), (6911, 1973, 'k39', 2.25), (6912, 889, 'k52', 2.5), (6913, 2806, 'k65', 2.75), (6914, 1722, 'k78', 3.0), (6915, 638, 'k91', 3.25), (6916, 2555, 'k104', 3.5), (6917, 1471, 'k117', 3.75), (6918, 387, 'k130', 4.0), (6919, 2304, 'k143', 4.25), (6920, 1220, 'k156', 4.5), (6921, 136, 'k12', 4.75), (6922, 2053, 'k25', 5.0), (6923, 969, 'k38', 5.25), (6924, 2886, 'k51', 5.5), (6925, 1802, 'k64', 5.75), (6926, 718, 'k77', 6.0), (6927, 2635, 'k90', 6.25), (6928, 1551, 'k103', 6.5), (6929, 467, 'k116', 6.75), (6930, 2384, 'k129', 7.0), (6931, 1300, 'k142', 0.0), (6932, 216, 'k155', 0.25), (6933, 2133, 'k11', 0.5), (6934, 1049, 'k24', 0.75), (6935, 2966, 'k37', 1.0), (6936, 1882, 'k50', 1.25), (6937, 798, 'k63', 1.5), (6938, 2715, 'k76', 1.75), (6939, 1631, 'k89', 2.0), (6940, 547, 'k102', 2.25), (6941, 2464, 'k115', 2.5), (6942, 1380, 'k128', 2.75), (6943, 296, 'k141', 3.0), (6944, 2213, 'k154', 3.25), (6945, 1129, 'k10', 3.5), (6946, 45, 'k23', 3.75), (6947, 1962, 'k36', 4.0), (6948, 878, 'k49', 4.25), (6949, 2795, 'k62', 4.5), (6950, 1711, 'k75', 4.75), (6951, 627, 'k88', 5.0), (6952, 2544, 'k101', 5.25), (6953, 1460, 'k114', 5.5), (6954, 376, 'k127', 5.75), (6955, 2293, 'k140', 6.0), (6956, 1209, 'k153', 6.25), (6957, 125, 'k9', 6.5), (6958, 2042, 'k22', 6.75), (6959, 958, 'k35', 7.0), (6960, 2875, 'k48', 0.0), (6961, 1791, 'k61', 0.25), (6962, 707, 'k74', 0.5), (6963, 2624, 'k87', 0.75), (6964, 1540, 'k100', 1.0), (6965, 456, 'k113', 1.25), (6966, 2373, 'k126', 1.5), (6967, 1289, 'k139', 1.75), (6968, 205, 'k152', 2.0), (6969, 2122, 'k8', 2.25), (6970, 1038, 'k21', 2.5), (6971, 2955, 'k34', 2.75), (6972, 1871, 'k47', 3.0), (6973, 787, 'k60', 3.25), (6974, 2704, 'k73', 3.5), (6975, 1620, 'k86', 3.75), (6976, 536, 'k99', 4.0), (6977, 2453, 'k112', 4.25), (6978, 1369, 'k125', 4.5), (6979, 285, 'k138', 4.75), (6980, 2202, 'k151', 5.0), (6981, 1118, 'k7', 5.25), (6982, 34, 'k20', 5.5), (6983, 1951, 'k33', 5.75), (6984, 867, 'k46', 6.0), (6985, 2784, 'k59', 6.25), (6986, 1700, 'k72', 6.5), (6987, 616, 'k85', 6.75), (6988, 2533, 'k98', 7.0), (6989, 1449, 'k111', 0.0), (6990, 365, 'k124', 0.25), (6991, 2282, 'k137', 0.5), (6992, 1198, 'k150', 0.75), (6993, 114, 'k6', 1.0), (6994, 2031, 'k19', 1.25), (6995, 947, 'k32', 1.5), (6996, 2864, 'k45', 1.75), (6997, 1780, 'k58', 2.0), (6998, 696, 'k71', 2.25), (6999, 2613, 'k84', 2.5), (7000, 1529, 'k97', 2.75), (7001, 445, 'k110', 3.0), (7002, 2362, 'k123', 3.25), (7003, 1278, 'k136', 3.5), (7004, 194, 'k149', 3.75), (7005, 2111, 'k5', 4.0), (7006, 1027, 'k18', 4.25), (7007, 2944, 'k31', 4.5), (7008, 1860, 'k44', 4.75), (7009, 776, 'k57', 5.0), (7010, 2693, 'k70', 5.25), (7011, 1609, 'k83', 5.5), (7012, 525, 'k96', 5.75), (7013, 2442, 'k109', 6.0), (7014, 1358, 'k122', 6.25), (7015, 274, 'k135', 6.5), (7016, 2191, 'k148', 6.75), (7017, 1107, 'k4', 7.0), (7018, 23, 'k17', 0.0), (7019, 1940, 'k30', 0.25), (7020, 856, 'k43', 0.5), (7021, 2773, 'k56', 0.75), (7022, 1689, 'k69', 1.0), (7023, 605, 'k82', 1.25), (7024, 2522, 'k95', 1.5), (7025, 1438, 'k108', 1.75), (7026, 354, 'k121', 2.0), (7027, 2271, 'k134', 2.25), (7028, 1187, 'k147', 2.5), (7029, 103, 'k3', 2.75), (7030, 2020, 'k16', 3.0), (7031, 936, 'k29', 3.25), (7032, 2853, 'k42', 3.5), (7033, 1769, 'k55', 3.75), (7034, 685, 'k68', 4.0), (7035, 2602, 'k81', 4.25), (7036, 1518, 'k94', 4.5), (7037, 434, 'k107', 4.75), (7038, 2351, 'k120', 5.0), (7039, 1267, 'k133', 5.25), (7040, 183, 'k146', 5.5), (7041, 2100, 'k2', 5.75), (7042, 1016, 'k15', 6.0), (7043, 2933, 'k28', 6.25), (7044, 1849, 'k41', 6.5), (7045, 765, 'k54', 6.75), (7046, 2682, 'k67', 7.0), (7047, 1598, 'k80', 0.0), (7048, 514, 'k93', 0.25), (7049, 2431, 'k106', 0.5), (7050, 1347, 'k119', 0.75), (7051, 263, 'k132', 1.0), (7052, 2180, 'k145', 1.25), (7053, 1096, 'k1', 1.5), (7054, 12, 'k14', 1.75), (7055, 1929, 'k27', 2.0), (7056, 845, 'k40', 2.25), (7057, 2762, 'k53', 2.5), (7058, 1678, 'k66', 2.75), (7059, 594, 'k79', 3.0), (7060, 2511, 'k92', 3.25), (7061, 1427, 'k105', 3.5), (7062, 343, 'k118', 3.75), (7063, 2260, 'k131', 4.0), (7064, 1176, 'k144', 4.25), (7065, 92, 'k0', 4.5), (7066, 2009, 'k13', 4.75), (7067, 925, 'k26', 5.0), (7068, 2842, 'k39', 5.25), (7069, 1758, 'k52', 5.5), (7070, 674, 'k65', 5.75), (7071, 2591, 'k78', 6.0), (7072, 1507, 'k91', 6.25), (7073, 423, 'k104', 6.5), (7074, 2340, 'k117', 6.75), (7075, 1256, 'k130', 7.0), (7076, 172, 'k143', 0.0), (7077, 2089, 'k156', 0.25), (7078, 1005, 'k12', 0.5), (7079, 2922, 'k25', 0.75), (7080, 1838, 'k38', 1.0), (7081, 754, 'k51', 1.25), (7082, 2671, 'k64', 1.5), (7083, 1587, 'k77', 1.75), (7084, 503, 'k90', 2.0), (7085, 2420, 'k103', 2.25), (7086, 1336, 'k116', 2.5), (7087, 252, 'k129', 2.75), (7088, 2169, 'k142', 3.0), (7089, 1085, 'k155', 3.25), (7090, 1, 'k11', 3.5), (7091, 1918, 'k24', 3.75), (7092, 834, 'k37', 4.0), (7093, 2751, 'k50', 4.25), (7094, 1667, 'k63', 4.5), (7095, 583, 'k76', 4.75), (7096, 2500, 'k89', 5.0), (7097, 1416, 'k102', 5.25), (7098, 332, 'k115', 5.5), (7099, 2249, 'k128', 5.75), (7100, 1165, 'k141', 6.0), (7101, 81, 'k154', 6.25), (7102, 1998, 'k10', 6.5), (7103, 914, 'k23', 6.75), (7104, 2831, 'k36', 7.0), (7105, 1747, 'k49', 0.0), (7106, 663, 'k62', 0.25), (7107, 2580, 'k75', 0.5), (7108, 1496, 'k88', 0.75), (7109, 412, 'k101', 1.0), (7110, 2329, 'k114', 1.25), (7111, 1245, 'k127', 1.5), (7112, 161, 'k140', 1.75), (7113, 2078, 'k153', 2.0), (7114, 994, 'k9', 2.25), (7115, 2911, 'k22', 2.5), (7116, 1827, 'k35', 2.75), (7117, 743, 'k48', 3.0), (7118, 2660, 'k61', 3.25), (7119, 1576, 'k74', 3.5), (7120, 492, 'k87', 3.75), (7121, 2409, 'k100', 4.0), (7122, 1325, 'k113', 4.25), (7123, 241, 'k126', 4.5), (7124, 2158, 'k139', 4.75), (7125, 1074, 'k152', 5.0), (7126, 2991, 'k8', 5.25), (7127, 1907, 'k21', 5.5), (7128, 823, 'k34', 5.75), (7129, 2740, 'k47', 6.0), (7130, 1656, 'k60', 6.25), (7131, 572, 'k73', 6.5), (7132, 2489, 'k86', 6.75), (7133, 1405, 'k99', 7.0), (7134, 321, 'k112', 0.0), (7135, 2238, 'k125', 0.25), (7136, 1154, 'k138', 0.5), (7137, 70, 'k151', 0.75), (7138, 1987, 'k7', 1.0), (7139, 903, 'k20', 1.25), (7140, 2820, 'k33', 1.5), (7141, 1736, 'k46', 1.75), (7142, 652, 'k59', 2.0), (7143, 2569, 'k72', 2.25), (7144, 1485, 'k85', 2.5), (7145, 401, 'k98', 2.75), (7146, 2318, 'k111', 3.0), (7147, 1234, 'k124', 3.25), (7148, 150, 'k137', 3.5), (7149, 2067, 'k150', 3.75), (7150, 983, 'k6', 4.0), (7151, 2900, 'k19', 4.25), (7152, 1816, 'k32', 4.5), (7153, 732, 'k45', 4.75), (7154, 2649, 'k58', 5.0), (7155, 1565, 'k71', 5.25), (7156, 481, 'k84', 5.5), (7157, 2398, 'k97', 5.75), (7158, 1314, 'k110', 6.0), (7159, 230, 'k123', 6.25), (7160, 2147, 'k136', 6.5), (7161, 1063, 'k149', 6.75), (7162, 2980, 'k5', 7.0), (7163, 1896, 'k18', 0.0), (7164, 812, 'k31', 0.25), (7165, 2729, 'k44', 0.5), (7166, 1645, 'k57', 0.75), (7167, 561, 'k70', 1.0), (7168, 2478, 'k83', 1.25), (7169, 1394, 'k96', 1.5), (7170, 310, 'k109', 1.75), (7171, 2227, 'k122', 2.0), (7172, 1143, 'k135', 2.25), (7173, 59, 'k148', 2.5), (7174, 1976, 'k4', 2.75), (7175, 892, 'k17', 3.0), (7176, 2809, 'k30', 3.25), (7177, 1725, 'k43', 3.5), (7178, 641, 'k56', 3.75), (7179, 2558, 'k69', 4.0), (7180, 1474, 'k82', 4.25), (7181, 390, 'k95', 4.5), (7182, 2307, 'k108', 4.75), (7183, 1223, 'k121', 5.0), (7184, 139, 'k134', 5.25), (7185, 2056, 'k147', 5.5), (7186, 972, 'k3', 5.75), (7187, 2889, 'k16', 6.0), (7188, 1805, 'k29', 6.25), (7189, 721, 'k42', 6.5), (7190, 2638, 'k55', 6.75), (7191, 1554, 'k68', 7.0), (7192, 470, 'k81', 0.0), (7193, 2387, 'k94', 0.25), (7194, 1303, 'k107', 0.5), (7195, 219, 'k120', 0.75), (7196, 2136, 'k133', 1.0), (7197, 1052, 'k146', 1.25), (7198, 2969, 'k2', 1.5), (7199, 1885, 'k15', 1.75), (7200, 801, 'k28', 2.0), (7201, 2718, 'k41', 2.25), (7202, 1634, 'k54', 2.5), (7203, 550, 'k67', 2.75), (7204, 2467, 'k80', 3.0), (7205, 1383, 'k93', 3.25), (7206, 299, 'k106', 3.5), (7207, 2216, 'k119', 3.75), (7208, 1132, 'k132', 4.0), (7209, 48, 'k145', 4.25), (7210, 1965, 'k1', 4.5), (7211, 881, 'k14', 4.75), (7212, 2798, 'k27', 5.0), (7213, 1714, 'k40', 5.25), (7214, 630, 'k53', 5.5), (7215, 2547, 'k66', 5.75), (7216, 1463, 'k79', 6.0), (7217, 379, 'k92', 6.25), (7218, 2296, 'k105', 6.5), (7219, 1212, 'k118', 6.75), (7220, 128, 'k131', 7.0), (7221, 2045, 'k144', 0.0), (7222, 961, 'k0', 0.25), (7223, 2878, 'k13', 0.5), (7224, 1794, 'k26', 0.75), (7225, 710, 'k39', 1.0), (7226, 2627, 'k52', 1.25), (7227, 1543, 'k65', 1.5), (7228, 459, 'k78', 1.75), (7229, 2376, 'k91', 2.0), (7230, 1292, 'k104', 2.25), (7231, 208, 'k117', 2.5), (7232, 2125, 'k130', 2.75), (7233, 1041, 'k143', 3.0), (7234, 2958, 'k156', 3.25), (7235, 1874, 'k12', 3.5), (7236, 790, 'k25', 3.75), (7237, 2707, 'k38', 4.0), (7238, 1623, 'k51', 4.25), (7239, 539, 'k64', 4.5), (7240, 2456, 'k77', 4.75), (7241, 1372, 'k90', 5.0), (7242, 288, 'k103', 5.25), (7243, 2205, 'k116', 5.5), (7244, 1121, 'k129', 5.75), (7245, 37, 'k142', 6.0), (7246, 1954, 'k155', 6.25), (7247, 870, 'k11', 6.5), (7248, 2787, 'k24', 6.75), (7249, 1703, 'k37', 7.0), (7250, 619, 'k50', 0.0), (7251, 2536, 'k63', 0.25), (7252, 1452, 'k76', 0.5), (7253, 368, 'k89', 0.75), (7254, 2285, 'k102', 1.0), (7255, 1201, 'k115', 1.25), (7256, 117, 'k128', 1.5), (7257, 2034, 'k141', 1.75), (7258, 950, 'k154', 2.0), (7259, 2867, 'k10', 2.25), (7260, 1783, 'k23', 2.5), (7261, 699, 'k36', 2.75), (7262, 2616, 'k49', 3.0), (7263, 1532, 'k62', 3.25), (7264, 448, 'k75', 3.5), (7265, 2365, 'k88', 3.75), (7266, 1281, 'k101', 4.0), (7267, 197, 'k114', 4.25), (7268, 2114, 'k127', 4.5), (7269, 1030, 'k140', 4.75), (7270, 2947, 'k153', 5.0), (7271, 1863, 'k9', 5.25), (7272, 779, 'k22', 5.5), (7273, 2696, 'k35', 5.75), (7274, 1612, 'k48', 6.0), (7275, 528, 'k61', 6.25), (7276, 2445, 'k74', 6.5), (7277, 1361, 'k87', 6.75), (7278, 277, 'k100', 7.0), (7279, 2194, 'k113', 0.0), (7280, 1110, 'k126', 0.25), (7281, 26, 'k139', 0.5), (7282, 1943, 'k152', 0.75), (7283, 859, 'k8', 1.0), (7284, 2776, 'k21', 1.25), (7285, 1692, 'k34', 1.5), (7286, 608, 'k47', 1.75), (7287, 2525, 'k60', 2.0), (7288, 1441, 'k73', 2.25), (7289, 357, 'k86', 2.5), (7290, 2274, 'k99', 2.75), (7291, 1190, 'k112', 3.0), (7292, 106, 'k125', 3.25), (7293, 2023, 'k138', 3.5), (7294, 939, 'k151', 3.75), (7295, 2856, 'k7', 4.0), (7296, 1772, 'k20', 4.25), (7297, 688, 'k33', 4.5), (7298, 2605, 'k46', 4.75), (7299, 1521, 'k59', 5.0), (7300, 437, 'k72', 5.25), (7301, 2354, 'k85', 5.5), (7302, 1270, 'k98', 5.75), (7303, 186, 'k111', 6.0), (7304, 2103, 'k124', 6.25), (7305, 1019, 'k137', 6.5), (7306, 2936, 'k150', 6.75), (7307, 1852, 'k6', 7.0), (7308, 768, 'k19', 0.0), (7309, 2685, 'k32', 0.25), (7310, 1601, 'k45', 0.5), (7311, 517, 'k58', 0.75), (7312, 2434, 'k71', 1.0), (7313, 1350, 'k84', 1.25), (7314, 266, 'k97', 1.5), (7315, 2183, 'k110', 1.75), (7316, 1099, 'k123', 2.0), (7317, 15, 'k136', 2.25), (7318, 1932, 'k149', 2.5), (7319, 848, 'k5', 2.75), (7320, 2765, 'k18', 3.0), (7321, 1681, 'k31', 3.25), (7322, 597, 'k44', 3.5), (7323, 2514, 'k57', 3.75), (7324, 1430, 'k70', 4.0), (7325, 346, 'k83', 4.25), (7326, 2263, 'k96', 4.5), (7327, 1179, 'k109', 4.75), (7328, 95, 'k122', 5.0), (7329, 2012, 'k135', 5.25), (7330, 928, 'k148', 5.5), (7331, 2845, 'k4', 5.75), (7332, 1761, 'k17', 6.0), (7333, 677, 'k30', 6.25), (7334, 2594, 'k43', 6.5), (7335, 1510, 'k56', 6.75), (7336, 426, 'k69', 7.0), (7337, 2343, 'k82', 0.0), (7338, 1259, 'k95', 0.25), (7339, 175, 'k108', 0.5), (7340, 2092, 'k121', 0.75), (7341, 1008, 'k134', 1.0), (7342, 2925, 'k147', 1.25), (7343, 1841, 'k3', 1.5), (7344, 757, 'k16', 1.75), (7345, 2674, 'k29', 2.0), (7346, 1590, 'k42', 2.25), (7347, 506, 'k55', 2.5), (7348, 2423, 'k68', 2.75), (7349, 1339, 'k81', 3.0), (7350, 255, 'k94', 3.25), (7351, 2172, 'k107', 3.5), (7352, 1088, 'k120', 3.75), (7353, 4, 'k133', 4.0), (7354, 1921, 'k146', 4.25), (7355, 837, 'k2', 4.5), (7356, 2754, 'k15', 4.75), (7357, 1670, 'k28', 5.0), (7358, 586, 'k41', 5.25), (7359, 2503, 'k54', 5.5), (7360, 1419, 'k67', 5.75), (7361, 335, 'k80', 6.0), (7362, 2252, 'k93', 6.25), (7363, 1168, 'k106', 6.5), (7364, 84, 'k119', 6.75), (7365, 2001, 'k132', 7.0), (7366, 917, 'k145', 0.0), (7367, 2834, 'k1', 0.25), (7368, 1750, 'k14', 0.5), (7369, 666, 'k27', 0.75), (7370, 2583, 'k40', 1.0), (7371, 1499, 'k53', 1.25), (7372, 415, 'k66', 1.5), (7373, 2332, 'k79', 1.75), (7374, 1248, 'k92', 2.0), (7375, 164, 'k105', 2.25), (7376, 2081, 'k118', 2.5), (7377, 997, 'k131', 2.75), (7378, 2914, 'k144', 3.0), (7379, 1830, 'k0', 3.25), (7380, 746, 'k13', 3.5), (7381, 2663, 'k26', 3.75), (7382, 1579, 'k39', 4.0), (7383, 495, 'k52', 4.25), (7384, 2412, 'k65', 4.5), (7385, 1328, 'k78', 4.75), (7386, 244, 'k91', 5.0), (7387, 2161, 'k104', 5.25), (7388, 1077, 'k117', 5.5), (7389, 2994, 'k130', 5.75), (7390, 1910, 'k143', 6.0), (7391, 826, 'k156', 6.25), (7392, 2743, 'k12', 6.5), (7393, 1659, 'k25', 6.75), (7394, 575, 'k38', 7.0), (7395, 2492, 'k51', 0.0), (7396, 1408, 'k64', 0.25), (7397, 324, 'k77', 0.5), (7398, 2241, 'k90', 0.75), (7399, 1157, 'k103', 1.0), (7400, 73, 'k116', 1.25), (7401, 1990, 'k129', 1.5), (7402, 906, 'k142', 1.75), (7403, 2823, 'k155', 2.0), (7404, 1739, 'k11', 2.25), (7405, 655, 'k24', 2.5), (7406, 2572, 'k37', 2.75), (7407, 1488, 'k50', 3.0), (7408, 404, 'k63', 3.25), (7409, 2321, 'k76', 3.5), (7410, 1237, 'k89', 3.75), (7411, 153, 'k102', 4.0), (7412, 2070, 'k115', 4.25), (7413, 986, 'k128', 4.5), (7414, 2903, 'k141', 4.75), (7415, 1819, 'k154', 5.0), (7416, 735, 'k10', 5.25), (7417, 2652, 'k23', 5.5), (7418, 1568, 'k36', 5.75), (7419, 484, 'k49', 6.0), (7420, 2401, 'k62', 6.25), (7421, 1317, 'k75', 6.5), (7422, 233, 'k88', 6.75), (7423, 2150, 'k101', 7.0), (7424, 1066, 'k114', 0.0), (7425, 2983, 'k127', 0.25), (7426, 1899, 'k140', 0.5), (7427, 815, 'k153', 0.75), (7428, 2732, 'k9', 1.0), (7429, 1648, 'k22', 1.25), (7430, 564, 'k35', 1.5), (7431, 2481, 'k48', 1.75), (7432, 1397, 'k61', 2.0), (7433, 313, 'k74', 2.25), (7434, 2230, 'k87', 2.5), (7435, 1146, 'k100', 2.75), (7436, 62, 'k113', 3.0), (7437, 1979, 'k126', 3.25), (7438, 895, 'k139', 3.5), (7439, 2812, 'k152', 3.75), (7440, 1728, 'k8', 4.0), (7441, 644, 'k21', 4.25), (7442, 2561, 'k34', 4.5), (7443, 1477, 'k47', 4.75), (7444, 393, 'k60', 5.0), (7445, 2310, 'k73', 5.25), (7446, 1226, 'k86', 5.5), (7447, 142, 'k99', 5.75), (7448, 2059, 'k112', 6.0), (7449, 975, 'k125', 6.25), (7450, 2892, 'k138', 6.5), (7451, 1808, 'k151', 6.75), (7452, 724, 'k7', 7.0), (7453, 2641, 'k20', 0.0), (7454, 1557, 'k33', 0.25), (7455, 473, 'k46', 0.5), (7456, 2390, 'k59', 0.75), (7457, 1306, 'k72', 1.0), (7458, 222, 'k85', 1.25), (7459, 2139, 'k98', 1.5), (7460, 1055, 'k111', 1.75), (7461, 2972, 'k124', 2.0), (7462, 1888, 'k137', 2.25), (7463, 804, 'k150', 2.5), (7464, 2721, 'k6', 2.75), (7465, 1637, 'k19', 3.0), (7466, 553, 'k32', 3.25), (7467, 2470, 'k45', 3.5), (7468, 1386, 'k58', 3.75), (7469, 302, 'k71', 4.0), (7470, 2219, 'k84', 4.25), (7471, 1135, 'k97', 4.5), (7472, 51, 'k110', 4.75), (7473, 1968, 'k123', 5.0), (7474, 884, 'k136', 5.25), (7475, 2801, 'k149', 5.5), (7476, 1717, 'k5', 5.75), (7477, 633, 'k18', 6.0), (7478, 2550, 'k31', 6.25), (7479, 1466, 'k44', 6.5), (7480, 382, 'k57', 6.75), (7481, 2299, 'k70', 7.0), (7482, 1215, 'k83', 0.0), (7483, 131, 'k96', 0.25), (7484, 2048, 'k109', 0.5), (7485, 964, 'k122', 0.75), (7486, 2881, 'k135', 1.0), (7487, 1797, 'k148', 1.25), (7488, 713, 'k4', 1.5), (7489, 2630, 'k17', 1.75), (7490, 1546, 'k30', 2.0), (7491, 462, 'k43', 2.25), (7492, 2379, 'k56', 2.5), (7493, 1295, 'k69', 2.75), (7494, 211, 'k82', 3.0), (7495, 2128, 'k95', 3.25), (7496, 1044, 'k108', 3.5), (7497, 2961, 'k121', 3.75), (7498, 1877, 'k134', 4.0), (7499, 793, 'k147', 4.25), (7500, 2710, 'k3', 4.5), (7501, 1626, 'k16', 4.75), (7502, 542, 'k29', 5.0), (7503, 2459, 'k42', 5.25), (7504, 1375, 'k55', 5.5), (7505, 291, 'k68', 5.75), (7506, 2208, 'k81', 6.0), (7507, 1124, 'k94', 6.25), (7508, 40, 'k107', 6.5), (7509, 1957, 'k120', 6.75), (7510, 873, 'k133', 7.0), (7511, 2790, 'k146', 0.0), (7512, 1706, 'k2', 0.25), (7513, 622, 'k15', 0.5), (7514, 2539, 'k28', 0.75), (7515, 1455, 'k41', 1.0), (7516, 371, 'k54', 1.25), (7517, 2288, 'k67', 1.5), (7518, 1204, 'k80', 1.75), (7519, 120, 'k93', 2.0), (7520, 2037, 'k106', 2.25), (7521, 953, 'k119', 2.5), (7522, 2870, 'k132', 2.75), (7523, 1786, 'k145', 3.0), (7524, 702, 'k1', 3.25), (7525, 2619, 'k14', 3.5), (7526, 1535, 'k27', 3.75), (7527, 451, 'k40', 4.0), (7528, 2368, 'k53', 4.25), (7529, 1284, 'k66', 4.5), (7530, 200, 'k79', 4.75), (7531, 2117, 'k92', 5.0), (7532, 1033, 'k105', 5.25), (7533, 2950, 'k118', 5.5), (7534, 1866, 'k131', 5.75), (7535, 782, 'k144', 6.0), (7536, 2699, 'k0', 6.25), (7537, 1615, 'k13', 6.5), (7538, 531, 'k26', 6.75), (7539, 2448, 'k39', 7.0), (7540, 1364, 'k52', 0.0), (7541, 280, 'k65', 0.25), (7542, 2197, 'k78', 0.5), (7543, 1113, 'k91', 0.75), (7544, 29, 'k104', 1.0), (7545, 1946, 'k117', 1.25), (7546, 862, 'k130', 1.5), (7547, 2779, 'k143', 1.75), (7548, 1695, 'k156', 2.0), (7549, 611, 'k12', 2.25), (7550, 2528, 'k25', 2.5), (7551, 1444, 'k38', 2.75), (7552, 360, 'k51', 3.0), (7553, 2277, 'k64', 3.25), (7554, 1193, 'k77', 3.5), (7555, 109, 'k90', 3.75), (7556, 2026, 'k103', 4.0), (7557, 942, 'k116', 4.25), (7558, 2859, 'k129', 4.5), (7559, 1775, 'k142', 4.75), (7560, 691, 'k155', 5.0), (7561, 2608, 'k11', 5.25), (7562, 1524, 'k24', 5.5), (7563, 440, 'k37', 5.75), (7564, 2357, 'k50', 6.0), (7565, 1273, 'k63', 6.25), (7566, 189, 'k76', 6.5), (7567, 2106, 'k89', 6.75), (7568, 1022, 'k102', 7.0), (7569, 2939, 'k115', 0.0), (7570, 1855, 'k128', 0.25), (7571, 771, 'k141', 0.5), (7572, 2688, 'k154', 0.75), (7573, 1604, 'k10', 1.0), (7574, 520, 'k23', 1.25), (7575, 2437, 'k36', 1.5), (7576, 1353, 'k49', 1.75), (7577, 269, 'k62', 2.0), (7578, 2186, 'k75', 2.25), (7579, 1102, 'k88', 2.5), (7580, 18, 'k101', 2.75), (7581, 1935, 'k114', 3.0), (7582, 851, 'k127', 3.25), (7583, 2768, 'k140', 3.5), (7584, 1684, 'k153', 3.75), (7585, 600, 'k9', 4.0), (7586, 2517, 'k22', 4.25), (7587, 1433, 'k35', 4.5), (7588, 349, 'k48', 4.75), (7589, 2266, 'k61', 5.0), (7590, 1182, 'k74', 5.25), (7591, 98, 'k87', 5.5), (7592, 2015, 'k100', 5.75), (7593, 931, 'k113', 6.0), (7594, 2848, 'k126', 6.25), (7595, 1764, 'k139', 6.5), (7596, 680, 'k152', 6.75), (7597, 2597, 'k8', 7.0), (7598, 1513, 'k21', 0.0), (7599, 429, 'k34', 0.25), (7600, 2346, 'k47', 0.5), (7601, 1262, 'k60', 0.75), (7602, 178, 'k73', 1.0), (7603, 2095, 'k86', 1.25), (7604, 1011, 'k99', 1.5), (7605, 2928, 'k112', 1.75), (7606, 1844, 'k125', 2.0), (7607, 760, 'k138', 2.25), (7608, 2677, 'k151', 2.5), (7609, 1593, 'k7', 2.75), (7610, 509, 'k20', 3.0), (7611, 2426, 'k33', 3.25), (7612, 1342, 'k46', 3.5), (7613, 258, 'k59', 3.75), (7614, 2175, 'k72', 4.0), (7615, 1091, 'k85', 4.25), (7616, 7, 'k98', 4.5), (7617, 1924, 'k111', 4.75), (7618, 840, 'k124', 5.0), (7619, 2757, 'k137', 5.25), (7620, 1673, 'k150', 5.5), (7621, 589, 'k6', 5.75), (7622, 2506, 'k19', 6.0), (7623, 1422, 'k32', 6.25), (7624, 338, 'k45', 6.5), (7625, 2255, 'k58', 6.75), (7626, 1171, 'k71', 7.0), (7627, 87, 'k84', 0.0), (7628, 2004, 'k97', 0.25), (7629, 920, 'k110', 0.5), (7630, 2837, 'k123', 0.75), (7631, 1753, 'k136', 1.0), (7632, 669, 'k149', 1.25), (7633, 2586, 'k5', 1.5), (7634, 1502, 'k18', 1.75), (7635, 418, 'k31', 2.0), (7636, 2335, 'k44', 2.25), (7637, 1251, 'k57', 2.5), (7638, 167, 'k70', 2.75), (7639, 2084, 'k83', 3.0), (7640, 1000, 'k96', 3.25), (7641, 2917, 'k109', 3.5), (7642, 1833, 'k122', 3.75), (7643, 749, 'k135', 4.0), (7644, 2666, 'k148', 4.25), (7645, 1582, 'k4', 4.5), (7646, 498, 'k17', 4.75), (7647, 2415, 'k30', 5.0), (7648, 1331, 'k43', 5.25), (7649, 247, 'k56', 5.5), (7650, 2164, 'k69', 5.75), (7651, 1080, 'k82', 6.0), (7652, 2997, 'k95', 6.25), (7653, 1913, 'k108', 6.5), (7654, 829, 'k121', 6.75), (7655, 2746, 'k134', 7.0), (7656, 1662, 'k147', 0.0), (7657, 578, 'k3', 0.25), (7658, 2495, 'k16', 0.5), (7659, 1411, 'k29', 0.75), (7660, 327, 'k42', 1.0), (7661, 2244, 'k55', 1.25), (7662, 1160, 'k68', 1.5), (7663, 76, 'k81', 1.75), (7664, 1993, 'k94', 2.0), (7665, 909, 'k107', 2.25), (7666, 2826, 'k120', 2.5), (7667, 1742, 'k133', 2.75), (7668, 658, 'k146', 3.0), (7669, 2575, 'k2', 3.25), (7670, 1491, 'k15', 3.5), (7671, 407, 'k28', 3.75), (7672, 2324, 'k41', 4.0), (7673, 1240, 'k54', 4.25), (7674, 156, 'k67', 4.5), (7675, 2073, 'k80', 4.75), (7676, 989, 'k93', 5.0), (7677, 2906, 'k106', 5.25), (7678, 1822, 'k119', 5.5), (7679, 738, 'k132', 5.75), (7680, 2655, 'k145', 6.0), (7681, 1571, 'k1', 6.25), (7682, 487, 'k14', 6.5), (7683, 2404, 'k27', 6.75), (7684, 1320, 'k40', 7.0), (7685, 236, 'k53', 0.0), (7686, 2153, 'k66', 0.25), (7687, 1069, 'k79', 0.5), (7688, 2986, 'k92', 0.75), (7689, 1902, 'k105', 1.0), (7690, 818, 'k118', 1.25), (7691, 2735, 'k131', 1.5), (7692, 1651, 'k144', 1.75), (7693, 567, 'k0', 2.0), (7694, 2484, 'k13', 2.25), (7695, 1400, 'k26', 2.5), (7696, 316, 'k39', 2.75), (7697, 2233, 'k52', 3.0), (7698, 1149, 'k65', 3.25), (7699, 65, 'k78', 3.5), (7700, 1982, 'k91', 3.75), (7701, 898, 'k104', 4.0), (7702, 2815, 'k117', 4.25), (7703, 1731, 'k130', 4.5), (7704, 647, 'k143', 4.75), (7705, 2564, 'k156', 5.0), (7706, 1480, 'k12', 5.25), (7707, 396, 'k25', 5.5), (7708, 2313, 'k38', 5.75), (7709, 1229, 'k51', 6.0), (7710, 145, 'k64', 6.25), (7711, 2062, 'k77', 6.5), (7712, 978, 'k90', 6.75), (7713, 2895, 'k103', 7.0), (7714, 1811, 'k116', 0.0), (7715, 727, 'k129', 0.25), (7716, 2644, 'k142', 0.5), (7717, 1560, 'k155', 0.75), (7718, 476, 'k11', 1.0), (7719, 2393, 'k24', 1.25), (7720, 1309, 'k37', 1.5), (7721, 225, 'k50', 1.75), (7722, 2142, 'k63', 2.0), (7723, 1058, 'k76', 2.25), (7724, 2975, 'k89', 2.5), (7725, 1891, 'k102', 2.75), (7726, 807, 'k115', 3.0), (7727, 2724, 'k128', 3.25), (7728, 1640, 'k141', 3.5), (7729, 556, 'k154', 3.75), (7730, 2473, 'k10', 4.0), (7731, 1389, 'k23', 4.25), (7732, 305, 'k36', 4.5), (7733, 2222, 'k49', 4.75), (7734, 1138, 'k62', 5.0), (7735, 54, 'k75', 5.25), (7736, 1971, 'k88', 5.5), (7737, 887, 'k101', 5.75), (7738, 2804, 'k114', 6.0), (7739, 1720, 'k127', 6.25), (7740, 636, 'k140', 6.5), (7741, 2553, 'k153', 6.75), (7742, 1469, 'k9', 7.0), (7743, 385, 'k22', 0.0), (7744, 2302, 'k35', 0.25), (7745, 1218, 'k48', 0.5), (7746, 134, 'k61', 0.75), (7747, 2051, 'k74', 1.0), (7748, 967, 'k87', 1.25), (7749, 2884, 'k100', 1.5), (7750, 1800, 'k113', 1.75), (7751, 716, 'k126', 2.0), (7752, 2633, 'k139', 2.25), (7753, 1549, 'k152', 2.5), (7754, 465, 'k8', 2.75), (7755, 2382, 'k21', 3.0), (7756, 1298, 'k34', 3.25), (7757, 214, 'k47', 3.5), (7758, 2131, 'k60', 3.75), (7759, 1047, 'k73', 4.0), (7760, 2964, 'k86', 4.25), (7761, 1880, 'k99', 4.5), (7762, 796, 'k112', 4.75), (7763, 2713, 'k125', 5.0), (7764, 1629, 'k138', 5.25), (7765, 545, 'k151', 5.5), (7766, 2462, 'k7', 5.75), (7767, 1378, 'k20', 6.0), (7768, 294, 'k33', 6.25), (7769, 2211, 'k46', 6.5), (7770, 1127, 'k59', 6.75), (7771, 43, 'k72', 7.0), (7772, 1960, 'k85', 0.0), (7773, 876, 'k98', 0.25), (7774, 2793, 'k111', 0.5), (7775, 1709, 'k124', 0.75), (7776, 625, 'k137', 1.0), (7777, 2542, 'k150', 1.25), (7778, 1458, 'k6', 1.5), (7779, 374, 'k19', 1.75), (7780, 2291, 'k32', 2.0), (7781, 1207, 'k45', 2.25), (7782, 123, 'k58', 2.5), (7783, 2040, 'k71', 2.75), (7784, 956, 'k84', 3.0), (7785, 2873, 'k97', 3.25), (7786, 1789, 'k110', 3.5), (7787, 705, 'k123', 3.75), (7788, 2622, 'k136', 4.0), (7789, 1538, 'k149', 4.25), (7790, 454, 'k5', 4.5), (7791, 2371, 'k18', 4.75), (7792, 1287, 'k31', 5.0), (7793, 203, 'k44', 5.25), (7794, 2120, 'k57', 5.5), (7795, 1036, 'k70', 5.75), (7796, 2953, 'k83', 6.0), (7797, 1869, 'k96', 6.25), (7798, 785, 'k109', 6.5), (7799, 2702, 'k122', 6.75), (7800, 1618, 'k135', 7.0), (7801, 534, 'k148', 0.0), (7802, 2451, 'k4', 0.25), (7803, 1367, 'k17', 0.5), (7804, 283, 'k30', 0.75), (7805, 2200, 'k43', 1.0), (7806, 1116, 'k56', 1.25), (7807, 32, 'k69', 1.5), (7808, 1949, 'k82', 1.75), (7809, 865, 'k95', 2.0), (7810, 2782, 'k108', 2.25), (7811, 1698, 'k121', 2.5), (7812, 614, 'k134', 2.75), (7813, 2531, 'k147', 3.0), (7814, 1447, 'k3', 3.25), (7815, 363, 'k16', 3.5), (7816, 2280, 'k29', 3.75), (7817, 1196, 'k42', 4.0), (7818, 112, 'k55', 4.25), (7819, 2029, 'k68', 4.5), (7820, 945, 'k81', 4.75), (7821, 2862, 'k94', 5.0), (7822, 1778, 'k107', 5.25), (7823, 694, 'k120', 5.5), (7824, 2611, 'k133', 5.75), (7825, 1527, 'k146', 6.0), (7826, 443, 'k2', 6.25), (7827, 2360, 'k15', 6.5), (7828, 1276, 'k28', 6.75), (7829, 192, 'k41', 7.0), (7830, 2109, 'k54', 0.0), (7831, 1025, 'k67', 0.25), (7832, 2942, 'k80', 0.5), (7833, 1858, 'k93', 0.75), (7834, 774, 'k106', 1.0), (7835, 2691, 'k119', 1.25), (7836, 1607, 'k132', 1.5), (7837, 523, 'k145', 1.75), (7838, 2440, 'k1', 2.0), (7839, 1356, 'k14', 2.25), (7840, 272, 'k27', 2.5), (7841, 2189, 'k40', 2.75), (7842, 1105, 'k53', 3.0), (7843, 21, 'k66', 3.25), (7844, 1938, 'k79', 3.5), (7845, 854, 'k92', 3.75), (7846, 2771, 'k105', 4.0), (7847, 1687, 'k118', 4.25), (7848, 603, 'k131', 4.5), (7849, 2520, 'k144', 4.75), (7850, 1436, 'k0', 5.0), (7851, 352, 'k13', 5.25), (7852, 2269, 'k26', 5.5), (7853, 1185, 'k39', 5.75), (7854, 101, 'k52', 6.0), (7855, 2018, 'k65', 6.25), (7856, 934, 'k78', 6.5), (7857, 2851, 'k91', 6.75), (7858, 1767, 'k104', 7.0), (7859, 683, 'k117', 0.0), (7860, 2600, 'k130', 0.25), (7861, 1516, 'k143', 0.5), (7862, 432, 'k156', 0.75), (7863, 2349, 'k12', 1.0), (7864, 1265, 'k25', 1.25), (7865, 181, 'k38', 1.5), (7866, 2098, 'k51', 1.75), (7867, 1014, 'k64', 2.0), (7868, 2931, 'k77', 2.25), (7869, 1847, 'k90', 2.5), (7870, 763, 'k103', 2.75), (7871, 2680, 'k116', 3.0), (7872, 1596, 'k129', 3.25), (7873, 512, 'k142', 3.5), (7874, 2429, 'k155', 3.75), (7875, 1345, 'k11', 4.0), (7876, 261, 'k24', 4.25), (7877, 2178, 'k37', 4.5), (7878, 1094, 'k50', 4.75), (7879, 10, 'k63', 5.0), (7880, 1927, 'k76', 5.25), (7881, 843, 'k89', 5.5), (7882, 2760, 'k102', 5.75), (7883, 1676, 'k115', 6.0), (7884, 592, 'k128', 6.25), (7885, 2509, 'k141', 6.5), (7886, 1425, 'k154', 6.75), (7887, 341, 'k10', 7.0), (7888, 2258, 'k23', 0.0), (7889, 1174, 'k36', 0.25), (7890, 90, 'k49', 0.5), (7891, 2007, 'k62', 0.75), (7892, 923, 'k75', 1.0), (7893, 2840, 'k88', 1.25), (7894, 1756, 'k101', 1.5), (7895, 672, 'k114', 1.75), (7896, 2589, 'k127', 2.0), (7897, 1505, 'k140', 2.25), (7898, 421, 'k153', 2.5), (7899, 2338, 'k9', 2.75), (7900, 1254, 'k22', 3.0), (7901, 170, 'k35', 3.25), (7902, 2087, 'k48', 3.5), (7903, 1003, 'k61', 3.75), (7904, 2920, 'k74', 4.0), (7905, 1836, 'k87', 4.25), (7906, 752, 'k100', 4.5), (7907, 2669, 'k113', 4.75), (7908, 1585, 'k126', 5.0), (7909, 501, 'k139', 5.25), (7910, 2418, 'k152', 5.5), (7911, 1334, 'k8', 5.75), (7912, 250, 'k21', 6.0), (7913, 2167, 'k34', 6.25), (7914, 1083, 'k47', 6.5), (7915, 3000, 'k60', 6.75), (7916, 1916, 'k73', 7.0), (7917, 832, 'k86', 0.0), (7918, 2749, 'k99', 0.25), (7919, 1665, 'k112', 0.5), (7920, 581, 'k125', 0.75), (7921, 2498, 'k138', 1.0), (7922, 1414, 'k151', 1.25), (7923, 330, 'k7', 1.5), (7924, 2247, 'k20', 1.75), (7925, 1163, 'k33', 2.0), (7926, 79, 'k46', 2.25), (7927, 1996, 'k59', 2.5), (7928, 912, 'k72', 2.75), (7929, 2829, 'k85', 3.0), (7930, 1745, 'k98', 3.25), (7931, 661, 'k111', 3.5), (7932, 2578, 'k124', 3.75), (7933, 1494, 'k137', 4.0), (7934, 410, 'k150', 4.25), (7935, 2327, 'k6', 4.5), (7936, 1243, 'k19', 4.75), (7937, 159, 'k32', 5.0), (7938, 2076, 'k45', 5.25), (7939, 992, 'k58', 5.5), (7940, 2909, 'k71', 5.75), (7941, 1825, 'k84', 6.0), (7942, 741, 'k97', 6.25), (7943, 2658, 'k110', 6.5), (7944, 1574, 'k123', 6.75), (7945, 490, 'k136', 7.0), (7946, 2407, 'k149', 0.0), (7947, 1323, 'k5', 0.25), (7948, 239, 'k18', 0.5), (7949, 2156, 'k31', 0.75), (7950, 1072, 'k44', 1.0), (7951, 2989, 'k57', 1.25), (7952, 1905, 'k70', 1.5), (7953, 821, 'k83', 1.75), (7954, 2738, 'k96', 2.0), (7955, 1654, 'k109', 2.25), (7956, 570, 'k122', 2.5), (7957, 2487, 'k135', 2.75), (7958, 1403, 'k148', 3.0), (7959, 319, 'k4', 3.25), (7960, 2236, 'k17', 3.5), (7961, 1152, 'k30', 3.75), (7962, 68, 'k43', 4.0), (7963, 1985, 'k56', 4.25), (7964, 901, 'k69', 4.5), (7965, 2818, 'k82', 4.75), (7966, 1734, 'k95', 5.0), (7967, 650, 'k108', 5.25), (7968, 2567, 'k121', 5.5), (7969, 1483, 'k134', 5.75), (7970, 399, 'k147', 6.0), (7971, 2316, 'k3', 6.25), (7972, 1232, 'k16', 6.5), (7973, 148, 'k29', 6.75), (7974, 2065, 'k42', 7.0), (7975, 981, 'k55', 0.0), (7976, 2898, 'k68', 0.25), (7977, 1814, 'k81', 0.5), (7978, 730, 'k94', 0.75), (7979, 2647, 'k107', 1.0), (7980, 1563, 'k120', 1.25), (7981, 479, 'k133', 1.5), (7982, 2396, 'k146', 1.75), (7983, 1312, 'k2', 2.0), (7984, 228, 'k15', 2.25), (7985, 2145, 'k28', 2.5), (7986, 1061, 'k41', 2.75), (7987, 2978, 'k54', 3.0), (7988, 1894, 'k67', 3.25), (7989, 810, 'k80', 3.5), (7990, 2727, 'k93', 3.75), (7991, 1643, 'k106', 4.0), (7992, 559, 'k119', 4.25), (7993, 2476, 'k132', 4.5), (7994, 1392, 'k145', 4.75), (7995, 308, 'k1', 5.0), (7996, 2225, 'k14', 5.25), (7997, 1141, 'k27', 5.5), (7998, 57, 'k40', 5.75), (7999, 1974, 'k53', 6.0), (8000, 890, 'k66', 6.25), (8001, 2807, 'k79', 6.5), (8002, 1723, 'k92', 6.75), (8003, 639, 'k105', 7.0), (8004, 2556, 'k118', 0.0), (8005, 1472, 'k131', 0.25), (8006, 388, 'k144', 0.5), (8007, 2305, 'k0', 0.75), (8008, 1221, 'k13', 1.0), (8009, 137, 'k26', 1.25), (8010, 2054, 'k39', 1.5), (8011, 970, 'k52', 1.75), (8012, 2887, 'k65', 2.0), (8013, 1803, 'k78', 2.25), (8014, 719, 'k91', 2.5), (8015, 2636, 'k104', 2.75), (8016, 1552, 'k117', 3.0), (8017, 468, 'k130', 3.25), (8018, 2385, 'k143', 3.5), (8019, 1301, 'k156', 3.75), (8020, 217, 'k12', 4.0), (8021, 2134, 'k25', 4.25), (8022, 1050, 'k38', 4.5), (8023, 2967, 'k51', 4.75), (8024, 1883, 'k64', 5.0), (8025, 799, 'k77', 5.25), (8026, 2716, 'k90', 5.5), (8027, 1632, 'k103', 5.75), (8028, 548, 'k116', 6.0), (8029, 2465, 'k129', 6.25), (8030, 1381, 'k142', 6.5), (8031, 297, 'k155', 6.75), (8032, 2214, 'k11', 7.0), (8033, 1130, 'k24', 0.0), (8034, 46, 'k37', 0.25), (8035, 1963, 'k50', 0.5), (8036, 879, 'k63', 0.75), (8037, 2796, 'k76', 1.0), (8038, 1712, 'k89', 1.25), (8039, 628, 'k102', 1.5), (8040, 2545, 'k115', 1.75), (8041, 1461, 'k128', 2.0), (8042, 377, 'k141', 2.25), (8043, 2294, 'k154', 2.5), (8044, 1210, 'k10', 2.75), (8045, 126, 'k23', 3.0), (8046, 2043, 'k36', 3.25), (8047, 959, 'k49', 3.5), (8048, 2876, 'k62', 3.75), (8049, 1792, 'k75', 4.0), (8050, 708, 'k88', 4.25), (8051, 2625, 'k101', 4.5), (8052, 1541, 'k114', 4.75), (8053, 457, 'k127', 5.0), (8054, 2374, 'k140', 5.25), (8055, 1290, 'k153', 5.5), (8056, 206, 'k9', 5.75), (8057, 2123, 'k22', 6.0), (8058, 1039, 'k35', 6.25), (8059, 2956, 'k48', 6.5), (8060, 1872, 'k61', 6.75), (8061, 788, 'k74', 7.0), (8062, 2705, 'k87', 0.0), (8063, 1621, 'k100', 0.25), (8064, 537, 'k113', 0.5), (8065, 2454, 'k126', 0.75), (8066, 1370, 'k139', 1.0), (8067, 286, 'k152', 1.25), (8068, 2203, 'k8', 1.5), (8069, 1119, 'k21', 1.75), (8070, 35, 'k34', 2.0), (8071, 1952, 'k47', 2.25), (8072, 868, 'k60', 2.5), (8073, 2785, 'k73', 2.75), (8074, 1701, 'k86', 3.0), (8075, 617, 'k99', 3.25), (8076, 2534, 'k112', 3.5), (8077, 1450, 'k125', 3.75), (8078, 366, 'k138', 4.0), (8079, 2283, 'k151', 4.25), (8080, 1199, 'k7', 4.5), (8081, 115, 'k20', 4.75), (8082, 2032, 'k33', 5.0), (8083, 948, 'k46', 5.25), (8084, 2865, 'k59', 5.5), (8085, 1781, 'k72', 5.75), (8086, 697, 'k85', 6.0), (8087, 2614, 'k98', 6.25), (8088, 1530, 'k111', 6.5), (8089, 446, 'k124', 6.75), (8090, 2363, 'k137', 7.0), (8091, 1279, 'k150', 0.0), (8092, 195, 'k6', 0.25), (8093, 2112, 'k19', 0.5), (8094, 1028, 'k32', 0.75), (8095, 2945, 'k45', 1.0), (8096, 1861, 'k58', 1.25), (8097, 777, 'k71', 1.5), (8098, 2694, 'k84', 1.75), (8099, 1610, 'k97', 2.0), (8100, 526, 'k110', 2.25), (8101, 2443, 'k123', 2.5), (8102, 1359, 'k136', 2.75), (8103, 275, 'k149', 3.0), (8104, 2192, 'k5', 3.25), (8105, 1108, 'k18', 3.5), (8106, 24, 'k31', 3.75), (8107, 1941, 'k44', 4.0), (8108, 857, 'k57', 4.25), (8109, 2774, 'k70', 4.5), (8110, 1690, 'k83', 4.75), (8111, 606, 'k96', 5.0), (8112, 2523, 'k109', 5.25), (8113, 1439, 'k122', 5.5), (8114, 355, 'k135', 5.75), (8115, 2272, 'k148', 6.0), (8116, 1188, 'k4', 6.25), (8117, 104, 'k17', 6.5), (8118, 2021, 'k30', 6.75), (8119, 937, 'k43', 7.0), (8120, 2854, 'k56', 0.0), (8121, 1770, 'k69', 0.25), (8122, 686, 'k82', 0.5), (8123, 2603, 'k95', 0.75), (8124, 1519, 'k108', 1.0), (8125, 435, 'k121', 1.25), (8126, 2352, 'k134', 1.5), (8127, 1268, 'k147', 1.75), (8128, 184, 'k3', 2.0), (8129, 2101, 'k16', 2.25), (8130, 1017, 'k29', 2.5), (8131, 2934, 'k42', 2.75), (8132, 1850, 'k55', 3.0), (8133, 766, 'k68', 3.25), (8134, 2683, 'k81', 3.5), (8135, 1599, 'k94', 3.75), (8136, 515, 'k107', 4.0), (8137, 2432, 'k120', 4.25), (8138, 1348, 'k133', 4.5), (8139, 264, 'k146', 4.75), (8140, 2181, 'k2', 5.0), (8141, 1097, 'k15', 5.25), (8142, 13, 'k28', 5.5), (8143, 1930, 'k41', 5.75), (8144, 846, 'k54', 6.0), (8145, 2763, 'k67', 6.25), (8146, 1679, 'k80', 6.5), (8147, 595, 'k93', 6.75), (8148, 2512, 'k106', 7.0), (8149, 1428, 'k119', 0.0), (8150, 344, 'k132', 0.25), (8151, 2261, 'k145', 0.5), (8152, 1177, 'k1', 0.75), (8153, 93, 'k14', 1.0), (8154, 2010, 'k27', 1.25), (8155, 926, 'k40', 1.5), (8156, 2843, 'k53', 1.75), (8157, 1759, 'k66', 2.0), (8158, 675, 'k79', 2.25), (8159, 2592, 'k92', 2.5), (8160, 1508, 'k105', 2.75), (8161, 424, 'k118', 3.0), (8162, 2341, 'k131', 3.25), (8163, 1257, 'k144', 3.5), (8164, 173, 'k0', 3.75), (8165, 2090, 'k13', 4.0), (8166, 1006, 'k26', 4.25), (8167, 2923, 'k39', 4.5), (8168, 1839, 'k52', 4.75), (8169, 755, 'k65', 5.0), (8170, 2672, 'k78', 5.25), (8171, 1588, 'k91', 5.5), (8172, 504, 'k104', 5.75), (8173, 2421, 'k117', 6.0), (8174, 1337, 'k130', 6.25), (8175, 253, 'k143', 6.5), (8176, 2170, 'k156', 6.75), (8177, 1086, 'k12', 7.0), (8178, 2, 'k25', 0.0), (8179, 1919, 'k38', 0.25), (8180, 835, 'k51', 0.5), (8181, 2752, 'k64', 0.75), (8182, 1668, 'k77', 1.0), (8183, 584, 'k90', 1.25), (8184, 2501, 'k103', 1.5), (8185, 1417, 'k116', 1.75), (8186, 333, 'k129', 2.0), (8187, 2250, 'k142', 2.25), (8188, 1166, 'k155', 2.5), (8189, 82, 'k11', 2.75), (8190, 1999, 'k24', 3.0), (8191, 915, 'k37', 3.25), (8192, 2832, 'k50', 3.5), (8193, 1748, 'k63', 3.75), (8194, 664, 'k76', 4.0), (8195, 2581, 'k89', 4.25), (8196, 1497, 'k102', 4.5), (8197, 413, 'k115', 4.75), (8198, 2330, 'k128', 5.0), (8199, 1246, 'k141', 5.25), (8200, 162, 'k154', 5.5), (8201, 2079, 'k10', 5.75), (8202, 995, 'k23', 6.0), (8203, 2912, 'k36', 6.25), (8204, 1828, 'k49', 6.5), (8205, 744, 'k62', 6.75), (8206, 2661, 'k75', 7.0), (8207, 1577, 'k88', 0.0), (8208, 493, 'k101', 0.25), (8209, 2410, 'k114', 0.5), (8210, 1326, 'k127', 0.75), (8211, 242, 'k140', 1.0), (8212, 2159, 'k153', 1.25), (8213, 1075, 'k9', 1.5), (8214, 2992, 'k22', 1.75), (8215, 1908, 'k35', 2.0), (8216, 824, 'k48', 2.25), (8217, 2741, 'k61', 2.5), (8218, 1657, 'k74', 2.75), (8219, 573, 'k87', 3.0), (8220, 2490, 'k100', 3.25), (8221, 1406, 'k113', 3.5), (8222, 322, 'k126', 3.75), (8223, 2239, 'k139', 4.0), (8224, 1155, 'k152', 4.25), (8225, 71, 'k8', 4.5), (8226, 1988, 'k21', 4.75), (8227, 904, 'k34', 5.0), (8228, 2821, 'k47', 5.25), (8229, 1737, 'k60', 5.5), (8230, 653, 'k73', 5.75), (8231, 2570, 'k86', 6.0), (8232, 1486, 'k99', 6.25), (8233, 402, 'k112', 6.5), (8234, 2319, 'k125', 6.75), (8235, 1235, 'k138', 7.0), (8236, 151, 'k151', 0.0), (8237, 2068, 'k7', 0.25), (8238, 984, 'k20', 0.5), (8239, 2901, 'k33', 0.75), (8240, 1817, 'k46', 1.0), (8241, 733, 'k59', 1.25), (8242, 2650, 'k72', 1.5), (8243, 1566, 'k85', 1.75), (8244, 482, 'k98', 2.0), (8245, 2399, 'k111', 2.25), (8246, 1315, 'k124', 2.5), (8247, 231, 'k137', 2.75), (8248, 2148, 'k150', 3.0), (8249, 1064, 'k6', 3.25), (8250, 2981, 'k19', 3.5), (8251, 1897, 'k32', 3.75), (8252, 813, 'k45', 4.0), (8253, 2730, 'k58', 4.25), (8254, 1646, 'k71', 4.5), (8255, 562, 'k84', 4.75), (8256, 2479, 'k97', 5.0), (8257, 1395, 'k110', 5.25), (8258, 311, 'k123', 5.5), (8259, 2228, 'k136', 5.75), (8260, 1144, 'k149', 6.0), (8261, 60, 'k5', 6.25), (8262, 1977, 'k18', 6.5), (8263, 893, 'k31', 6.75), (8264, 2810, 'k44', 7.0), (8265, 1726, 'k57', 0.0), (8266, 642, 'k70', 0.25), (8267, 2559, 'k83', 0.5), (8268, 1475, 'k96', 0.75), (8269, 391, 'k109', 1.0), (8270, 2308, 'k122', 1.25), (8271, 1224, 'k135', 1.5), (8272, 140, 'k148', 1.75), (8273, 2057, 'k4', 2.0), (8274, 973, 'k17', 2.25), (8275, 2890, 'k30', 2.5), (8276, 1806, 'k43', 2.75), (8277, 722, 'k56', 3.0), (8278, 2639, 'k69', 3.25), (8279, 1555, 'k82', 3.5), (8280, 471, 'k95', 3.75), (8281, 2388, 'k108', 4.0), (8282, 1304, 'k121', 4.25), (8283, 220, 'k134', 4.5), (8284, 2137, 'k147', 4.75), (8285, 1053, 'k3', 5.0), (8286, 2970, 'k16', 5.25), (8287, 1886, 'k29', 5.5), (8288, 802, 'k42', 5.75), (8289, 2719, 'k55', 6.0), (8290, 1635, 'k68', 6.25), (8291, 551, 'k81', 6.5), (8292, 2468, 'k94', 6.75), (8293, 1384, 'k107', 7.0), (8294, 300, 'k120', 0.0), (8295, 2217, 'k133', 0.25), (8296, 1133, 'k146', 0.5), (8297, 49, 'k2', 0.75), (8298, 1966, 'k15', 1.0), (8299, 882, 'k28', 1.25), (8300, 2799, 'k41', 1.5), (8301, 1715, 'k54', 1.75), (8302, 631, 'k67', 2.0), (8303, 2548, 'k80', 2.25), (8304, 1464, 'k93', 2.5), (8305, 380, 'k106', 2.75), (8306, 2297, 'k119', 3.0), (8307, 1213, 'k132', 3.25), (8308, 129, 'k145', 3.5), (8309, 2046, 'k1', 3.75), (8310, 962, 'k14', 4.0), (8311, 2879, 'k27', 4.25), (8312, 1795, 'k40', 4.5), (8313, 711, 'k53', 4.75), (8314, 2628, 'k66', 5.0), (8315, 1544, 'k79', 5.25), (8316, 460, 'k92', 5.5), (8317, 2377, 'k105', 5.75), (8318, 1293, 'k118', 6.0), (8319, 209, 'k131', 6.25), (8320, 2126, 'k144', 6.5), (8321, 1042, 'k0', 6.75), (8322, 2959, 'k13', 7.0), (8323, 1875, 'k26', 0.0), (8324, 791, 'k39', 0.25), (8325, 2708, 'k52', 0.5), (8326, 1624, 'k65', 0.75), (8327, 540, 'k78', 1.0), (8328, 2457, 'k91', 1.25), (8329, 1373, 'k104', 1.5), (8330, 289, 'k117', 1.75), (8331, 2206, 'k130', 2.0), (8332, 1122, 'k143', 2.25), (8333, 38, 'k156', 2.5), (8334, 1955, 'k12', 2.75), (8335, 871, 'k25', 3.0), (8336, 2788, 'k38', 3.25), (8337, 1704, 'k51', 3.5), (8338, 620, 'k64', 3.75), (8339, 2537, 'k77', 4.0), (8340, 1453, 'k90', 4.25), (8341, 369, 'k103', 4.5), (8342, 2286, 'k116', 4.75), (8343, 1202, 'k129', 5.0), (8344, 118, 'k142', 5.25), (8345, 2035, 'k155', 5.5), (8346, 951, 'k11', 5.75), (8347, 2868, 'k24', 6.0), (8348, 1784, 'k37', 6.25), (8349, 700, 'k50', 6.5), (8350, 2617, 'k63', 6.75), (8351, 1533, 'k76', 7.0), (8352, 449, 'k89', 0.0), (8353, 2366, 'k102', 0.25), (8354, 1282, 'k115', 0.5), (8355, 198, 'k128', 0.75), (8356, 2115, 'k141', 1.0), (8357, 1031, 'k154', 1.25), (8358, 2948, 'k10', 1.5), (8359, 1864, 'k23', 1.75), (8360, 780, 'k36', 2.0), (8361, 2697, 'k49', 2.25), (8362, 1613, 'k62', 2.5), (8363, 529, 'k75', 2.75), (8364, 2446, 'k88', 3.0), (8365, 1362, 'k101', 3.25), (8366, 278, 'k114', 3.5), (8367, 2195, 'k127', 3.75), (8368, 1111, 'k140', 4.0), (8369, 27, 'k153', 4.25), (8370, 1944, 'k9', 4.5), (8371, 860, 'k22', 4.75), (8372, 2777, 'k35', 5.0), (8373, 1693, 'k48', 5.25), (8374, 609, 'k61', 5.5), (8375, 2526, 'k74', 5.75), (8376, 1442, 'k87', 6.0), (8377, 358, 'k100', 6.25), (8378, 2275, 'k113', 6.5), (8379, 1191, 'k126', 6.75), (8380, 107, 'k139', 7.0), (8381, 2024, 'k152', 0.0), (8382, 940, 'k8', 0.25), (8383, 2857, 'k21', 0.5), (8384, 1773, 'k34', 0.75), (8385, 689, 'k47', 1.0), (8386, 2606, 'k60', 1.25), (8387, 1522, 'k73', 1.5), (8388, 438, 'k86', 1.75), (8389, 2355, 'k99', 2.0), (8390, 1271, 'k112', 2.25), (8391, 187, 'k125', 2.5), (8392, 2104, 'k138', 2.75), (8393, 1020, 'k151', 3.0), (8394, 2937, 'k7', 3.25), (8395, 1853, 'k20', 3.5), (8396, 769, 'k33', 3.75), (8397, 2686, 'k46', 4.0), (8398, 1602, 'k59', 4.25), (8399, 518, 'k72', 4.5), (8400, 2435, 'k85', 4.75), (8401, 1351, 'k98', 5.0), (8402, 267, 'k111', 5.25), (8403, 2184, 'k124', 5.5), (8404, 1100, 'k137', 5.75), (8405, 16, 'k150', 6.0), (8406, 1933, 'k6', 6.25), (8407, 849, 'k19', 6.5), (8408, 2766, 'k32', 6.75), (8409, 1682, 'k45', 7.0), (8410, 598, 'k58', 0.0), (8411, 2515, 'k71', 0.25), (8412, 1431, 'k84', 0.5), (8413, 347, 'k97', 0.75), (8414, 2264, 'k110', 1.0), (8415, 1180, 'k123', 1.25), (8416, 96, 'k136', 1.5), (8417, 2013, 'k149', 1.75), (8418, 929, 'k5', 2.0), (8419, 2846, 'k18', 2.25), (8420, 1762, 'k31', 2.5), (8421, 678, 'k44', 2.75), (8422, 2595, 'k57', 3.0), (8423, 1511, 'k70', 3.25), (8424, 427, 'k83', 3.5), (8425, 2344, 'k96', 3.75), (8426, 1260, 'k109', 4.0), (8427, 176, 'k122', 4.25), (8428, 2093, 'k135', 4.5), (8429, 1009, 'k148', 4.75), (8430, 2926, 'k4', 5.0), (8431, 1842, 'k17', 5.25), (8432, 758, 'k30', 5.5), (8433, 2675, 'k43', 5.75), (8434, 1591, 'k56', 6.0), (8435, 507, 'k69', 6.25), (8436, 2424, 'k82', 6.5), (8437, 1340, 'k95', 6.75), (8438, 256, 'k108', 7.0), (8439, 2173, 'k121', 0.0), (8440, 1089, 'k134', 0.25), (8441, 5, 'k147', 0.5), (8442, 1922, 'k3', 0.75), (8443, 838, 'k16', 1.0), (8444, 2755, 'k29', 1.25), (8445, 1671, 'k42', 1.5), (8446, 587, 'k55', 1.75), (8447, 2504, 'k68', 2.0), (8448, 1420, 'k81', 2.25), (8449, 336, 'k94', 2.5), (8450, 2253, 'k107', 2.75), (8451, 1169, 'k120', 3.0), (8452, 85, 'k133', 3.25), (8453, 2002, 'k146', 3.5), (8454, 918, 'k2', 3.75), (8455, 2835, 'k15', 4.0), (8456, 1751, 'k28', 4.25), (8457, 667, 'k41', 4.5), (8458, 2584, 'k54', 4.75), (8459, 1500, 'k67', 5.0), (8460, 416, 'k80', 5.25), (8461, 2333, 'k93', 5.5), (8462, 1249, 'k106', 5.75), (8463, 165, 'k119', 6.0), (8464, 2082, 'k132', 6.25), (8465, 998, 'k145', 6.5), (8466, 2915, 'k1', 6.75), (8467, 1831, 'k14', 7.0), (8468, 747, 'k27', 0.0), (8469, 2664, 'k40', 0.25), (8470, 1580, 'k53', 0.5), (8471, 496, 'k66', 0.75), (8472, 2413, 'k79', 1.0), (8473, 1329, 'k92', 1.25), (8474, 245, 'k105', 1.5), (8475, 2162, 'k118', 1.75), (8476, 1078, 'k131', 2.0), (8477, 2995, 'k144', 2.25), (8478, 1911, 'k0', 2.5), (8479, 827, 'k13', 2.75), (8480, 2744, 'k26', 3.0), (8481, 1660, 'k39', 3.25), (8482, 576, 'k52', 3.5), (8483, 2493, 'k65', 3.75), (8484, 1409, 'k78', 4.0), (8485, 325, 'k91', 4.25), (8486, 2242, 'k104', 4.5), (8487, 1158, 'k117', 4.75), (8488, 74, 'k130', 5.0), (8489, 1991, 'k143', 5.25), (8490, 907, 'k156', 5.5), (8491, 2824, 'k12', 5.75), (8492, 1740, 'k25', 6.0), (8493, 656, 'k38', 6.25), (8494, 2573, 'k51', 6.5), (8495, 1489, 'k64', 6.75), (8496, 405, 'k77', 7.0), (8497, 2322, 'k90', 0.0), (8498, 1238, 'k103', 0.25), (8499, 154, 'k116', 0.5), (8500, 2071, 'k129', 0.75), (8501, 987, 'k142', 1.0), (8502, 2904, 'k155', 1.25), (8503, 1820, 'k11', 1.5), (8504, 736, 'k24', 1.75), (8505, 2653, 'k37', 2.0), (8506, 1569, 'k50', 2.25), (8507, 485, 'k63', 2.5), (8508, 2402, 'k76', 2.75), (8509, 1318, 'k89', 3.0), (8510, 234, 'k102', 3.25), (8511, 2151, 'k115', 3.5), (8512, 1067, 'k128', 3.75), (8513, 2984, 'k141', 4.0), (8514, 1900, 'k154', 4.25), (8515, 816, 'k10', 4.5), (8516, 2733, 'k23', 4.75), (8517, 1649, 'k36', 5.0), (8518, 565, 'k49', 5.25), (8519, 2482, 'k62', 5.5), (8520, 1398, 'k75', 5.75), (8521, 314, 'k88', 6.0), (8522, 2231, 'k101', 6.25), (8523, 1147, 'k114', 6.5), (8524, 63, 'k127', 6.75), (8525, 1980, 'k140', 7.0), (8526, 896, 'k153', 0.0), (8527, 2813, 'k9', 0.25), (8528, 1729, 'k22', 0.5), (8529, 645, 'k35', 0.75), (8530, 2562, 'k48', 1.0), (8531, 1478, 'k61', 1.25), (8532, 394, 'k74', 1.5), (8533, 2311, 'k87', 1.75), (8534, 1227, 'k100', 2.0), (8535, 143, 'k113', 2.25), (8536, 2060, 'k126', 2.5), (8537, 976, 'k139', 2.75), (8538, 2893, 'k152', 3.0), (8539, 1809, 'k8', 3.25), (8540, 725, 'k21', 3.5), (8541, 2642, 'k34', 3.75), (8542, 1558, 'k47', 4.0), (8543, 474, 'k60', 4.25), (8544, 2391, 'k73', 4.5), (8545, 1307, 'k86', 4.75), (8546, 223, 'k99', 5.0), (8547, 2140, 'k112', 5.25), (8548, 1056, 'k125', 5.5), (8549, 2973, 'k138', 5.75), (8550, 1889, 'k151', 6.0), (8551, 805, 'k7', 6.25), (8552, 2722, 'k20', 6.5), (8553, 1638, 'k33', 6.75), (8554, 554, 'k46', 7.0), (8555, 2471, 'k59', 0.0), (8556, 1387, 'k72', 0.25), (8557, 303, 'k85', 0.5), (8558, 2220, 'k98', 0.75), (8559, 1136, 'k111', 1.0), (8560, 52, 'k124', 1.25), (8561, 1969, 'k137', 1.5), (8562, 885, 'k150', 1.75), (8563, 2802, 'k6', 2.0), (8564, 1718, 'k19', 2.25), (8565, 634, 'k32', 2.5), (8566, 2551, 'k45', 2.75), (8567, 1467, 'k58', 3.0), (8568, 383, 'k71', 3.25), (8569, 2300, 'k84', 3.5), (8570, 1216, 'k97', 3.75), (8571, 132, 'k110', 4.0), (8572, 2049, 'k123', 4.25), (8573, 965, 'k136', 4.5), (8574, 2882, 'k149', 4.75), (8575, 1798, 'k5', 5.0), (8576, 714, 'k18', 5.25), (8577, 2631, 'k31', 5.5), (8578, 1547, 'k44', 5.75), (8579, 463, 'k57', 6.0), (8580, 2380, 'k70', 6.25), (8581, 1296, 'k83', 6.5), (8582, 212, 'k96', 6.75), (8583, 2129, 'k109', 7.0), (8584, 1045, 'k122', 0.0), (8585, 2962, 'k135', 0.25), (8586, 1878, 'k148', 0.5), (8587, 794, 'k4', 0.75), (8588, 2711, 'k17', 1.0), (8589, 1627, 'k30', 1.25), (8590, 543, 'k43', 1.5), (8591, 2460, 'k56', 1.75), (8592, 1376, 'k69', 2.0), (8593, 292, 'k82', 2.25), (8594, 2209, 'k95', 2.5), (8595, 1125, 'k108', 2.75), (8596, 41, 'k121', 3.0), (8597, 1958, 'k134', 3.25), (8598, 874, 'k147', 3.5), (8599, 2791, 'k3', 3.75), (8600, 1707, 'k16', 4.0), (8601, 623, 'k29', 4.25), (8602, 2540, 'k42', 4.5), (8603, 1456, 'k55', 4.75), (8604, 372, 'k68', 5.0), (8605, 2289, 'k81', 5.25), (8606, 1205, 'k94', 5.5), (8607, 121, 'k107', 5.75), (8608, 2038, 'k120', 6.0), (8609, 954, 'k133', 6.25), (8610, 2871, 'k146', 6.5), (8611, 1787, 'k2', 6.75), (8612, 703, 'k15', 7.0), (8613, 2620, 'k28', 0.0), (8614, 1536, 'k41', 0.25), (8615, 452, 'k54', 0.5), (8616, 2369, 'k67', 0.75), (8617, 1285, 'k80', 1.0), (8618, 201, 'k93', 1.25), (8619, 2118, 'k106', 1.5), (8620, 1034, 'k119', 1.75), (8621, 2951, 'k132', 2.0), (8622, 1867, 'k145', 2.25), (8623, 783, 'k1', 2.5), (8624, 2700, 'k14', 2.75), (8625, 1616, 'k27', 3.0), (8626, 532, 'k40', 3.25), (8627, 2449, 'k53', 3.5), (8628, 1365, 'k66', 3.75), (8629, 281, 'k79', 4.0), (8630, 2198, 'k92', 4.25), (8631, 1114, 'k105', 4.5), (8632, 30, 'k118', 4.75), (8633, 1947, 'k131', 5.0), (8634, 863, 'k144', 5.25), (8635, 2780, 'k0', 5.5), (8636, 1696, 'k13', 5.75), (8637, 612, 'k26', 6.0), (8638, 2529, 'k39', 6.25), (8639, 1445, 'k52', 6.5), (8640, 361, 'k65', 6.75), (8641, 2278, 'k78', 7.0), (8642, 1194, 'k91', 0.0), (8643, 110, 'k104', 0.25), (8644, 2027, 'k117', 0.5), (8645, 943, 'k130', 0.75), (8646, 2860, 'k143', 1.0), (8647, 1776, 'k156', 1.25), (8648, 692, 'k12', 1.5), (8649, 2609, 'k25', 1.75), (8650, 1525, 'k38', 2.0), (8651, 441, 'k51', 2.25), (8652, 2358, 'k64', 2.5), (8653, 1274, 'k77', 2.75), (8654, 190, 'k90', 3.0), (8655, 2107, 'k103', 3.25), (8656, 1023, 'k116', 3.5), (8657, 2940, 'k129', 3.75), (8658, 1856, 'k142', 4.0), (8659, 772, 'k155', 4.25), (8660, 2689, 'k11', 4.5), (8661, 1605, 'k24', 4.75), (8662, 521, 'k37', 5.0), (8663, 2438, 'k50', 5.25), (8664, 1354, 'k63', 5.5), (8665, 270, 'k76', 5.75), (8666, 2187, 'k89', 6.0), (8667, 1103, 'k102', 6.25), (8668, 19, 'k115', 6.5), (8669, 1936, 'k128', 6.75), (8670, 852, 'k141', 7.0), (8671, 2769, 'k154', 0.0), (8672, 1685, 'k10', 0.25), (8673, 601, 'k23', 0.5), (8674, 2518, 'k36', 0.75), (8675, 1434, 'k49', 1.0), (8676, 350, 'k62', 1.25), (8677, 2267, 'k75', 1.5), (8678, 1183, 'k88', 1.75), (8679, 99, 'k101', 2.0), (8680, 2016, 'k114', 2.25), (8681, 932, 'k127', 2.5), (8682, 2849, 'k140', 2.75), (8683, 1765, 'k153', 3.0), (8684, 681, 'k9', 3.25), (8685, 2598, 'k22', 3.5), (8686, 1514, 'k35', 3.75), (8687, 430, 'k48', 4.0), (8688, 2347, 'k61', 4.25), (8689, 1263, 'k74', 4.5), (8690, 179, 'k87', 4.75), (8691, 2096, 'k100', 5.0), (8692, 1012, 'k113', 5.25), (8693, 2929, 'k126', 5.5), (8694, 1845, 'k139', 5.75), (8695, 761, 'k152', 6.0), (8696, 2678, 'k8', 6.25), (8697, 1594, 'k21', 6.5), (8698, 510, 'k34', 6.75), (8699, 2427, 'k47', 7.0), (8700, 1343, 'k60', 0.0), (8701, 259, 'k73', 0.25), (8702, 2176, 'k86', 0.5), (8703, 1092, 'k99', 0.75), (8704, 8, 'k112', 1.0), (8705, 1925, 'k125', 1.25), (8706, 841, 'k138', 1.5), (8707, 2758, 'k151', 1.75), (8708, 1674, 'k7', 2.0), (8709, 590, 'k20', 2.25), (8710, 2507, 'k33', 2.5), (8711, 1423, 'k46', 2.75), (8712, 339, 'k59', 3.0), (8713, 2256, 'k72', 3.25), (8714, 1172, 'k85', 3.5), (8715, 88, 'k98', 3.75), (8716, 2005, 'k111', 4.0), (8717, 921, 'k124', 4.25), (8718, 2838, 'k137', 4.5), (8719, 1754, 'k150', 4.75), (8720, 670, 'k6', 5.0), (8721, 2587, 'k19', 5.25), (8722, 1503, 'k32', 5.5), (8723, 419, 'k45', 5.75), (8724, 2336, 'k58', 6.0), (8725, 1252, 'k71', 6.25), (8726, 168, 'k84', 6.5), (8727, 2085, 'k97', 6.75), (8728, 1001, 'k110', 7.0), (8729, 2918, 'k123', 0.0), (8730, 1834, 'k136', 0.25), (8731, 750, 'k149', 0.5), (8732, 2667, 'k5', 0.75), (8733, 1583, 'k18', 1.0), (8734, 499, 'k31', 1.25), (8735, 2416, 'k44', 1.5), (8736, 1332, 'k57', 1.75), (8737, 248, 'k70', 2.0), (8738, 2165, 'k83', 2.25), (8739, 1081, 'k96', 2.5), (8740, 2998, 'k109', 2.75), (8741, 1914, 'k122', 3.0), (8742, 830, 'k135', 3.25), (8743, 2747, 'k148', 3.5), (8744, 1663, 'k4', 3.75), (8745, 579, 'k17', 4.0), (8746, 2496, 'k30', 4.25), (8747, 1412, 'k43', 4.5), (8748, 328, 'k56', 4.75), (8749, 2245, 'k69', 5.0), (8750, 1161, 'k82', 5.25), (8751, 77, 'k95', 5.5), (8752, 1994, 'k108', 5.75), (8753, 910, 'k121', 6.0), (8754, 2827, 'k134', 6.25), (8755, 1743, 'k147', 6.5), (8756, 659, 'k3', 6.75), (8757, 2576, 'k16', 7.0), (8758, 1492, 'k29', 0.0), (8759, 408, 'k42', 0.25), (8760, 2325, 'k55', 0.5), (8761, 1241, 'k68', 0.75), (8762, 157, 'k81', 1.0), (8763, 2074, 'k94', 1.25), (8764, 990, 'k107', 1.5), (8765, 2907, 'k120', 1.75), (8766, 1823, 'k133', 2.0), (8767, 739, 'k146', 2.25), (8768, 2656, 'k2', 2.5), (8769, 1572, 'k15', 2.75), (8770, 488, 'k28', 3.0), (8771, 2405, 'k41', 3.25), (8772, 1321, 'k54', 3.5), (8773, 237, 'k67', 3.75), (8774, 2154, 'k80', 4.0), (8775, 1070, 'k93', 4.25), (8776, 2987, 'k106', 4.5), (8777, 1903, 'k119', 4.75), (8778, 819, 'k132', 5.0), (8779, 2736, 'k145', 5.25), (8780, 1652, 'k1', 5.5), (8781, 568, 'k14', 5.75), (8782, 2485, 'k27', 6.0), (8783, 1401, 'k40', 6.25), (8784, 317, 'k53', 6.5), (8785, 2234, 'k66', 6.75), (8786, 1150, 'k79', 7.0), (8787, 66, 'k92', 0.0), (8788, 1983, 'k105', 0.25), (8789, 899, 'k118', 0.5), (8790, 2816, 'k131', 0.75), (8791, 1732, 'k144', 1.0), (8792, 648, 'k0', 1.25), (8793, 2565, 'k13', 1.5), (8794, 1481, 'k26', 1.75), (8795, 397, 'k39', 2.0), (8796, 2314, 'k52', 2.25), (8797, 1230, 'k65', 2.5), (8798, 146, 'k78', 2.75), (8799, 2063, 'k91', 3.0), (8800, 979, 'k104', 3.25), (8801, 2896, 'k117', 3.5), (8802, 1812, 'k130', 3.75), (8803, 728, 'k143', 4.0), (8804, 2645, 'k156', 4.25), (8805, 1561, 'k12', 4.5), (8806, 477, 'k25', 4.75), (8807, 2394, 'k38', 5.0), (8808, 1310, 'k51', 5.25), (8809, 226, 'k64', 5.5), (8810, 2143, 'k77', 5.75), (8811, 1059, 'k90', 6.0), (8812, 2976, 'k103', 6.25), (8813, 1892, 'k116', 6.5), (8814, 808, 'k129', 6.75), (8815, 2725, 'k142', 7.0), (8816, 1641, 'k155', 0.0), (8817, 557, 'k11', 0.25), (8818, 2474, 'k24', 0.5), (8819, 1390, 'k37', 0.75), (8820, 306, 'k50', 1.0), (8821, 2223, 'k63', 1.25), (8822, 1139, 'k76', 1.5), (8823, 55, 'k89', 1.75), (8824, 1972, 'k102', 2.0), (8825, 888, 'k115', 2.25), (8826, 2805, 'k128', 2.5), (8827, 1721, 'k141', 2.75), (8828, 637, 'k154', 3.0), (8829, 2554, 'k10', 3.25), (8830, 1470, 'k23', 3.5), (8831, 386, 'k36', 3.75), (8832, 2303, 'k49', 4.0), (8833, 1219, 'k62', 4.25), (8834, 135, 'k75', 4.5), (8835, 2052, 'k88', 4.75), (8836, 968, 'k101', 5.0), (8837, 2885, 'k114', 5.25), (8838, 1801, 'k127', 5.5), (8839, 717, 'k140', 5.75), (8840, 2634, 'k153', 6.0), (8841, 1550, 'k9', 6.25), (8842, 466, 'k22', 6.5), (8843, 2383, 'k35', 6.75), (8844, 1299, 'k48', 7.0), (8845, 215, 'k61', 0.0), (8846, 2132, 'k74', 0.25), (8847, 1048, 'k87', 0.5), (8848, 2965, 'k100', 0.75), (8849, 1881, 'k113', 1.0), (8850, 797, 'k126', 1.25), (8851, 2714, 'k139', 1.5), (8852, 1630, 'k152', 1.75), (8853, 546, 'k8', 2.0), (8854, 2463, 'k21', 2.25), (8855, 1379, 'k34', 2.5), (8856, 295, 'k47', 2.75), (8857, 2212, 'k60', 3.0), (8858, 1128, 'k73', 3.25), (8859, 44, 'k86', 3.5), (8860, 1961, 'k99', 3.75), (8861, 877, 'k112', 4.0), (8862, 2794, 'k125', 4.25), (8863, 1710, 'k138', 4.5), (8864, 626, 'k151', 4.75), (8865, 2543, 'k7', 5.0), (8866, 1459, 'k20', 5.25), (8867, 375, 'k33', 5.5), (8868, 2292, 'k46', 5.75), (8869, 1208, 'k59', 6.0), (8870, 124, 'k72', 6.25), (8871, 2041, 'k85', 6.5), (8872, 957, 'k98', 6.75), (8873, 2874, 'k111', 7.0), (8874, 1790, 'k124', 0.0), (8875, 706, 'k137', 0.25), (8876, 2623, 'k150', 0.5), (8877, 1539, 'k6', 0.75), (8878, 455, 'k19', 1.0), (8879, 2372, 'k32', 1.25), (8880, 1288, 'k45', 1.5), (8881, 204, 'k58', 1.75), (8882, 2121, 'k71', 2.0), (8883, 1037, 'k84', 2.25), (8884, 2954, 'k97', 2.5), (8885, 1870, 'k110', 2.75), (8886, 786, 'k123', 3.0), (8887, 2703, 'k136', 3.25), (8888, 1619, 'k149', 3.5), (8889, 535, 'k5', 3.75), (8890, 2452, 'k18', 4.0), (8891, 1368, 'k31', 4.25), (8892, 284, 'k44', 4.5), (8893, 2201, 'k57', 4.75), (8894, 1117, 'k70', 5.0), (8895, 33, 'k83', 5.25), (8896, 1950, 'k96', 5.5), (8897, 866, 'k109', 5.75), (8898, 2783, 'k122', 6.0), (8899, 1699, 'k135', 6.25), (8900, 615, 'k148', 6.5), (8901, 2532, 'k4', 6.75), (8902, 1448, 'k17', 7.0), (8903, 364, 'k30', 0.0), (8904, 2281, 'k43', 0.25), (8905, 1197, 'k56', 0.5), (8906, 113, 'k69', 0.75), (8907, 2030, 'k82', 1.0), (8908, 946, 'k95', 1.25), (8909, 2863, 'k108', 1.5), (8910, 1779, 'k121', 1.75), (8911, 695, 'k134', 2.0), (8912, 2612, 'k147', 2.25), (8913, 1528, 'k3', 2.5), (8914, 444, 'k16', 2.75), (8915, 2361, 'k29', 3.0), (8916, 1277, 'k42', 3.25), (8917, 193, 'k55', 3.5), (8918, 2110, 'k68', 3.75), (8919, 1026, 'k81', 4.0), (8920, 2943, 'k94', 4.25), (8921, 1859, 'k107', 4.5), (8922, 775, 'k120', 4.75), (8923, 2692, 'k133', 5.0), (8924, 1608, 'k146', 5.25), (8925, 524, 'k2', 5.5), (8926, 2441, 'k15', 5.75), (8927, 1357, 'k28', 6.0), (8928, 273, 'k41', 6.25), (8929, 2190, 'k54', 6.5), (8930, 1106, 'k67', 6.75), (8931, 22, 'k80', 7.0), (8932, 1939, 'k93', 0.0), (8933, 855, 'k106', 0.25), (8934, 2772, 'k119', 0.5), (8935, 1688, 'k132', 0.75), (8936, 604, 'k145', 1.0), (8937, 2521, 'k1', 1.25), (8938, 1437, 'k14', 1.5), (8939, 353, 'k27', 1.75), (8940, 2270, 'k40', 2.0), (8941, 1186, 'k53', 2.25), (8942, 102, 'k66', 2.5), (8943, 2019, 'k79', 2.75), (8944, 935, 'k92', 3.0), (8945, 2852, 'k105', 3.25), (8946, 1768, 'k118', 3.5), (8947, 684, 'k131', 3.75), (8948, 2601, 'k144', 4.0), (8949, 1517, 'k0', 4.25), (8950, 433, 'k13', 4.5), (8951, 2350, 'k26', 4.75), (8952, 1266, 'k39', 5.0), (8953, 182, 'k52', 5.25), (8954, 2099, 'k65', 5.5), (8955, 1015, 'k78', 5.75), (8956, 2932, 'k91', 6.0), (8957, 1848, 'k104', 6.25), (8958, 764, 'k117', 6.5), (8959, 2681, 'k130', 6.75), (8960, 1597, 'k143', 7.0), (8961, 513, 'k156', 0.0), (8962, 2430, 'k12', 0.25), (8963, 1346, 'k25', 0.5), (8964, 262, 'k38', 0.75), (8965, 2179, 'k51', 1.0), (8966, 1095, 'k64', 1.25), (8967, 11, 'k77', 1.5), (8968, 1928, 'k90', 1.75), (8969, 844, 'k103', 2.0), (8970, 2761, 'k116', 2.25), (8971, 1677, 'k129', 2.5), (8972, 593, 'k142', 2.75), (8973, 2510, 'k155', 3.0), (8974, 1426, 'k11', 3.25), (8975, 342, 'k24', 3.5), (8976, 2259, 'k37', 3.75), (8977, 1175, 'k50', 4.0), (8978, 91, 'k63', 4.25), (8979, 2008, 'k76', 4.5), (8980, 924, 'k89', 4.75), (8981, 2841, 'k102', 5.0), (8982, 1757, 'k115', 5.25), (8983, 673, 'k128', 5.5), (8984, 2590, 'k141', 5.75), (8985, 1506, 'k154', 6.0), (8986, 422, 'k10', 6.25), (8987, 2339, 'k23', 6.5), (8988, 1255, 'k36', 6.75), (8989, 171, 'k49', 7.0), (8990, 2088, 'k62', 0.0), (8991, 1004, 'k75', 0.25), (8992, 2921, 'k88', 0.5), (8993, 1837, 'k101', 0.75), (8994, 753, 'k114', 1.0), (8995, 2670, 'k127', 1.25), (8996, 1586, 'k140', 1.5), (8997, 502, 'k153', 1.75), (8998, 2419, 'k9', 2.0), (8999, 1335, 'k22', 2.25), (9000, 251, 'k35', 2.5), (9001, 2168, 'k48', 2.75), (9002, 1084, 'k61', 3.0), (9003, 0, 'k74', 3.25), (9004, 1917, 'k87', 3.5), (9005, 833, 'k100', 3.75), (9006, 2750, 'k113', 4.0), (9007, 1666, 'k126', 4.25), (9008, 582, 'k139', 4.5), (9009, 2499, 'k152', 4.75), (9010, 1415, 'k8', 5.0), (9011, 331, 'k21', 5.25), (9012, 2248, 'k34', 5.5), (9013, 1164, 'k47', 5.75), (9014, 80, 'k60', 6.0), (9015, 1997, 'k73', 6.25), (9016, 913, 'k86', 6.5), (9017, 2830, 'k99', 6.75), (9018, 1746, 'k112', 7.0), (9019, 662, 'k125', 0.0), (9020, 2579, 'k138', 0.25), (9021, 1495, 'k151', 0.5), (9022, 411, 'k7', 0.75), (9023, 2328, 'k20', 1.0), (9024, 1244, 'k33', 1.25), (9025, 160, 'k46', 1.5), (9026, 2077, 'k59', 1.75), (9027, 993, 'k72', 2.0), (9028, 2910, 'k85', 2.25), (9029, 1826, 'k98', 2.5), (9030, 742, 'k111', 2.75), (9031, 2659, 'k124', 3.0), (9032, 1575, 'k137', 3.25), (9033, 491, 'k150', 3.5), (9034, 2408, 'k6', 3.75), (9035, 1324, 'k19', 4.0), (9036, 240, 'k32', 4.25), (9037, 2157, 'k45', 4.5), (9038, 1073, 'k58', 4.75), (9039, 2990, 'k71', 5.0), (9040, 1906, 'k84', 5.25), (9041, 822, 'k97', 5.5), (9042, 2739, 'k110', 5.75), (9043, 1655, 'k123', 6.0), (9044, 571, 'k136', 6.25), (9045, 2488, 'k149', 6.5), (9046, 1404, 'k5', 6.75), (9047, 320, 'k18', 7.0), (9048, 2237, 'k31', 0.0), (9049, 1153, 'k44', 0.25), (9050, 69, 'k57', 0.5), (9051, 1986, 'k70', 0.75), (9052, 902, 'k83', 1.0), (9053, 2819, 'k96', 1.25), (9054, 1735, 'k109', 1.5), (9055, 651, 'k122', 1.75), (9056, 2568, 'k135', 2.0), (9057, 1484, 'k148', 2.25), (9058, 400, 'k4', 2.5), (9059, 2317, 'k17', 2.75), (9060, 1233, 'k30', 3.0), (9061, 149, 'k43', 3.25), (9062, 2066, 'k56', 3.5), (9063, 982, 'k69', 3.75), (9064, 2899, 'k82', 4.0), (9065, 1815, 'k95', 4.25), (9066, 731, 'k108', 4.5), (9067, 2648, 'k121', 4.75), (9068, 1564, 'k134', 5.0), (9069, 480, 'k147', 5.25), (9070, 2397, 'k3', 5.5), (9071, 1313, 'k16', 5.75), (9072, 229, 'k29', 6.0), (9073, 2146, 'k42', 6.25), (9074, 1062, 'k55', 6.5), (9075, 2979, 'k68', 6.75), (9076, 1895, 'k81', 7.0), (9077, 811, 'k94', 0.0), (9078, 2728, 'k107', 0.25), (9079, 1644, 'k120', 0.5), (9080, 560, 'k133', 0.75), (9081, 2477, 'k146', 1.0), (9082, 1393, 'k2', 1.25), (9083, 309, 'k15', 1.5), (9084, 2226, 'k28', 1.75), (9085, 1142, 'k41', 2.0), (9086, 58, 'k54', 2.25), (9087, 1975, 'k67', 2.5), (9088, 891, 'k80', 2.75), (9089, 2808, 'k93', 3.0), (9090, 1724, 'k106', 3.25), (9091, 640, 'k119', 3.5), (9092, 2557, 'k132', 3.75), (9093, 1473, 'k145', 4.0), (9094, 389, 'k1', 4.25), (9095, 2306, 'k14', 4.5), (9096, 1222, 'k27', 4.75), (9097, 138, 'k40', 5.0), (9098, 2055, 'k53', 5.25), (9099, 971, 'k66', 5.5), (9100, 2888, 'k79', 5.75), (9101, 1804, 'k92', 6.0), (9102, 720, 'k105', 6.25), (9103, 2637, 'k118', 6.5), (9104, 1553, 'k131', 6.75), (9105, 469, 'k144', 7.0), (9106, 2386, 'k0', 0.0), (9107, 1302, 'k13', 0.25), (9108, 218, 'k26', 0.5), (9109, 2135, 'k39', 0.75), (9110, 1051, 'k52', 1.0), (9111, 2968, 'k65', 1.25), (9112, 1884, 'k78', 1.5), (9113, 800, 'k91', 1.75), (9114, 2717, 'k104', 2.0), (9115, 1633, 'k117', 2.25), (9116, 549, 'k130', 2.5), (9117, 2466, 'k143', 2.75), (9118, 1382, 'k156', 3.0), (9119, 298, 'k12', 3.25), (9120, 2215, 'k25', 3.5), (9121, 1131, 'k38', 3.75), (9122, 47, 'k51', 4.0), (9123, 1964, 'k64', 4.25), (9124, 880, 'k77', 4.5), (9125, 2797, 'k90', 4.75), (9126, 1713, 'k103', 5.0), (9127, 629, 'k116', 5.25), (9128, 2546, 'k129', 5.5), (9129, 1462, 'k142', 5.75), (9130, 378, 'k155', 6.0), (9131, 2295, 'k11', 6.25), (9132, 1211, 'k24', 6.5), (9133, 127, 'k37', 6.75), (9134, 2044, 'k50', 7.0), (9135, 960, 'k63', 0.0), (9136, 2877, 'k76', 0.25), (9137, 1793, 'k89', 0.5), (9138, 709, 'k102', 0.75), (9139, 2626, 'k115', 1.0), (9140, 1542, 'k128', 1.25), (9141, 458, 'k141', 1.5), (9142, 2375, 'k154', 1.75), (9143, 1291, 'k10', 2.0), (9144, 207, 'k23', 2.25), (9145, 2124, 'k36', 2.5), (9146, 1040, 'k49', 2.75), (9147, 2957, 'k62', 3.0), (9148, 1873, 'k75', 3.25), (9149, 789, 'k88', 3.5), (9150, 2706, 'k101', 3.75), (9151, 1622, 'k114', 4.0), (9152, 538, 'k127', 4.25), (9153, 2455, 'k140', 4.5), (9154, 1371, 'k153', 4.75), (9155, 287, 'k9', 5.0), (9156, 2204, 'k22', 5.25), (9157, 1120, 'k35', 5.5), (9158, 36, 'k48', 5.75), (9159, 1953, 'k61', 6.0), (9160, 869, 'k74', 6.25), (9161, 2786, 'k87', 6.5), (9162, 1702, 'k100', 6.75), (9163, 618, 'k113', 7.0), (9164, 2535, 'k126', 0.0), (9165, 1451, 'k139', 0.25), (9166, 367, 'k152', 0.5), (9167, 2284, 'k8', 0.75), (9168, 1200, 'k21', 1.0), (9169, 116, 'k34', 1.25), (9170, 2033, 'k47', 1.5), (9171, 949, 'k60', 1.75), (9172, 2866, 'k73', 2.0), (9173, 1782, 'k86', 2.25), (9174, 698, 'k99', 2.5), (9175, 2615, 'k112', 2.75), (9176, 1531, 'k125', 3.0), (9177, 447, 'k138', 3.25), (9178, 2364, 'k151', 3.5), (9179, 1280, 'k7', 3.75), (9180, 196, 'k20', 4.0), (9181, 2113, 'k33', 4.25), (9182, 1029, 'k46', 4.5), (9183, 2946, 'k59', 4.75), (9184, 1862, 'k72', 5.0), (9185, 778, 'k85', 5.25), (9186, 2695, 'k98', 5.5), (9187, 1611, 'k111', 5.75), (9188, 527, 'k124', 6.0), (9189, 2444, 'k137', 6.25), (9190, 1360, 'k150', 6.5), (9191, 276, 'k6', 6.75), (9192, 2193, 'k19', 7.0), (9193, 1109, 'k32', 0.0), (9194, 25, 'k45', 0.25), (9195, 1942, 'k58', 0.5), (9196, 858, 'k71', 0.75), (9197, 2775, 'k84', 1.0), (9198, 1691, 'k97', 1.25), (9199, 607, 'k110', 1.5), (9200, 2524, 'k123', 1.75), (9201, 1440, 'k136', 2.0), (9202, 356, 'k149', 2.25), (9203, 2273, 'k5', 2.5), (9204, 1189, 'k18', 2.75), (9205, 105, 'k31', 3.0), (9206, 2022, 'k44', 3.25), (9207, 938, 'k57', 3.5), (9208, 2855, 'k70', 3.75), (9209, 1771, 'k83', 4.0), (9210, 687, 'k96', 4.25), (9211, 2604, 'k109', 4.5), (9212, 1520, 'k122', 4.75), (9213, 436, 'k135', 5.0), (9214, 2353, 'k148', 5.25), (9215, 1269, 'k4', 5.5), (9216, 185, 'k17', 5.75), (9217, 2102, 'k30', 6.0), (9218, 1018, 'k43', 6.25), (9219, 2935, 'k56', 6.5), (9220, 1851, 'k69', 6.75), (9221, 767, 'k82', 7.0), (9222, 2684, 'k95', 0.0), (9223, 1600, 'k108', 0.25), (9224, 516, 'k121', 0.5), (9225, 2433, 'k134', 0.75), (9226, 1349, 'k147', 1.0), (9227, 265, 'k3', 1.25), (9228, 2182, 'k16', 1.5), (9229, 1098, 'k29', 1.75), (9230, 14, 'k42', 2.0), (9231, 1931, 'k55', 2.25), (9232, 847, 'k68', 2.5), (9233, 2764, 'k81', 2.75), (9234, 1680, 'k94', 3.0), (9235, 596, 'k107', 3.25), (9236, 2513, 'k120', 3.5), (9237, 1429, 'k133', 3.75), (9238, 345, 'k146', 4.0), (9239, 2262, 'k2', 4.25), (9240, 1178, 'k15', 4.5), (9241, 94, 'k28', 4.75), (9242, 2011, 'k41', 5.0), (9243, 927, 'k54', 5.25), (9244, 2844, 'k67', 5.5), (9245, 1760, 'k80', 5.75), (9246, 676, 'k93', 6.0), (9247, 2593, 'k106', 6.25), (9248, 1509, 'k119', 6.5), (9249, 425, 'k132', 6.75), (9250, 2342, 'k145', 7.0), (9251, 1258, 'k1', 0.0), (9252, 174, 'k14', 0.25), (9253, 2091, 'k27', 0.5), (9254, 1007, 'k40', 0.75), (9255, 2924, 'k53', 1.0), (9256, 1840, 'k66', 1.25), (9257, 756, 'k79', 1.5), (9258, 2673, 'k92', 1.75), (9259, 1589, 'k105', 2.0), (9260, 505, 'k118', 2.25), (9261, 2422, 'k131', 2.5), (9262, 1338, 'k144', 2.75), (9263, 254, 'k0', 3.0), (9264, 2171, 'k13', 3.25), (9265, 1087, 'k26', 3.5), (9266, 3, 'k39', 3.75), (9267, 1920, 'k52', 4.0), (9268, 836, 'k65', 4.25), (9269, 2753, 'k78', 4.5), (9270, 1669, 'k91', 4.75), (9271, 585, 'k104', 5.0), (9272, 2502, 'k117', 5.25), (9273, 1418, 'k130', 5.5), (9274, 334, 'k143', 5.75), (9275, 2251, 'k156', 6.0), (9276, 1167, 'k12', 6.25), (9277, 83, 'k25', 6.5), (9278, 2000, 'k38', 6.75), (9279, 916, 'k51', 7.0), (9280, 2833, 'k64', 0.0), (9281, 1749, 'k77', 0.25), (9282, 665, 'k90', 0.5), (9283, 2582, 'k103', 0.75), (9284, 1498, 'k116', 1.0), (9285, 414, 'k129', 1.25), (9286, 2331, 'k142', 1.5), (9287, 1247, 'k155', 1.75), (9288, 163, 'k11', 2.0), (9289, 2080, 'k24', 2.25), (9290, 996, 'k37', 2.5), (9291, 2913, 'k50', 2.75), (9292, 1829, 'k63', 3.0), (9293, 745, 'k76', 3.25), (9294, 2662, 'k89', 3.5), (9295, 1578, 'k102', 3.75), (9296, 494, 'k115', 4.0), (9297, 2411, 'k128', 4.25), (9298, 1327, 'k141', 4.5), (9299, 243, 'k154', 4.75), (9300, 2160, 'k10', 5.0), (9301, 1076, 'k23', 5.25), (9302, 2993, 'k36', 5.5), (9303, 1909, 'k49', 5.75), (9304, 825, 'k62', 6.0), (9305, 2742, 'k75', 6.25), (9306, 1658, 'k88', 6.5), (9307, 574, 'k101', 6.75), (9308, 2491, 'k114', 7.0), (9309, 1407, 'k127', 0.0), (9310, 323, 'k140', 0.25), (9311, 2240, 'k153', 0.5), (9312, 1156, 'k9', 0.75), (9313, 72, 'k22', 1.0), (9314, 1989, 'k35', 1.25), (9315, 905, 'k48', 1.5), (9316, 2822, 'k61', 1.75), (9317, 1738, 'k74', 2.0), (9318, 654, 'k87', 2.25), (9319, 2571, 'k100', 2.5), (9320, 1487, 'k113', 2.75), (9321, 403, 'k126', 3.0), (9322, 2320, 'k139', 3.25), (9323, 1236, 'k152', 3.5), (9324, 152, 'k8', 3.75), (9325, 2069, 'k21', 4.0), (9326, 985, 'k34', 4.25), (9327, 2902, 'k47', 4.5), (9328, 1818, 'k60', 4.75), (9329, 734, 'k73', 5.0), (9330, 2651, 'k86', 5.25), (9331, 1567, 'k99', 5.5), (9332, 483, 'k112', 5.75), (9333, 2400, 'k125', 6.0), (9334, 1316, 'k138', 6.25), (9335, 232, 'k151', 6.5), (9336, 2149, 'k7', 6.75), (9337, 1065, 'k20', 7.0), (9338, 2982, 'k33', 0.0), (9339, 1898, 'k46', 0.25), (9340, 814, 'k59', 0.5), (9341, 2731, 'k72', 0.75), (9342, 1647, 'k85', 1.0), (9343, 563, 'k98', 1.25), (9344, 2480, 'k111', 1.5), (9345, 1396, 'k124', 1.75), (9346, 312, 'k137', 2.0), (9347, 2229, 'k150', 2.25), (9348, 1145, 'k6', 2.5), (9349, 61, 'k19', 2.75), (9350, 1978, 'k32', 3.0), (9351, 894, 'k45', 3.25), (9352, 2811, 'k58', 3.5), (9353, 1727, 'k71', 3.75), (9354, 643, 'k84', 4.0), (9355, 2560, 'k97', 4.25), (9356, 1476, 'k110', 4.5), (9357, 392, 'k123', 4.75), (9358, 2309, 'k136', 5.0), (9359, 1225, 'k149', 5.25), (9360, 141, 'k5', 5.5), (9361, 2058, 'k18', 5.75), (9362, 974, 'k31', 6.0), (9363, 2891, 'k44', 6.25), (9364, 1807, 'k57', 6.5), (9365, 723, 'k70', 6.75), (9366, 2640, 'k83', 7.0), (9367, 1556, 'k96', 0.0), (9368, 472, 'k109', 0.25), (9369, 2389, 'k122', 0.5), (9370, 1305, 'k135', 0.75), (9371, 221, 'k148', 1.0), (9372, 2138, 'k4', 1.25), (9373, 1054, 'k17', 1.5), (9374, 2971, 'k30', 1.75), (9375, 1887, 'k43', 2.0), (9376, 803, 'k56', 2.25), (9377, 2720, 'k69', 2.5), (9378, 1636, 'k82', 2.75), (9379, 552, 'k95', 3.0), (9380, 2469, 'k108', 3.25), (9381, 1385, 'k121', 3.5), (9382, 301, 'k134', 3.75), (9383, 2218, 'k147', 4.0), (9384, 1134, 'k3', 4.25), (9385, 50, 'k16', 4.5), (9386, 1967, 'k29', 4.75), (9387, 883, 'k42', 5.0), (9388, 2800, 'k55', 5.25), (9389, 1716, 'k68', 5.5), (9390, 632, 'k81', 5.75), (9391, 2549, 'k94', 6.0), (9392, 1465, 'k107', 6.25), (9393, 381, 'k120', 6.5), (9394, 2298, 'k133', 6.75), (9395, 1214, 'k146', 7.0), (9396, 130, 'k2', 0.0), (9397, 2047, 'k15', 0.25), (9398, 963, 'k28', 0.5), (9399, 2880, 'k41', 0.75), (9400, 1796, 'k54', 1.0), (9401, 712, 'k67', 1.25), (9402, 2629, 'k80', 1.5), (9403, 1545, 'k93', 1.75), (9404, 461, 'k106', 2.0), (9405, 2378, 'k119', 2.25), (9406, 1294, 'k132', 2.5), (9407, 210, 'k145', 2.75), (9408, 2127, 'k1', 3.0), (9409, 1043, 'k14', 3.25), (9410, 2960, 'k27', 3.5), (9411, 1876, 'k40', 3.75), (9412, 792, 'k53', 4.0), (9413, 2709, 'k66', 4.25), (9414, 1625, 'k79', 4.5), (9415, 541, 'k92', 4.75), (9416, 2458, 'k105', 5.0), (9417, 1374, 'k118', 5.25), (9418, 290, 'k131', 5.5), (9419, 2207, 'k144', 5.75), (9420, 1123, 'k0', 6.0), (9421, 39, 'k13', 6.25), (9422, 1956, 'k26', 6.5), (9423, 872, 'k39', 6.75), (9424, 2789, 'k52', 7.0), (9425, 1705, 'k65', 0.0), (9426, 621, 'k78', 0.25), (9427, 2538, 'k91', 0.5), (9428, 1454, 'k104', 0.75), (9429, 370, 'k117', 1.0), (9430, 2287, 'k130', 1.25), (9431, 1203, 'k143', 1.5), (9432, 119, 'k156', 1.75), (9433, 2036, 'k12', 2.0), (9434, 952, 'k25', 2.25), (9435, 2869, 'k38', 2.5), (9436, 1785, 'k51', 2.75), (9437, 701, 'k64', 3.0), (9438, 2618, 'k77', 3.25), (9439, 1534, 'k90', 3.5), (9440, 450, 'k103', 3.75), (9441, 2367, 'k116', 4.0), (9442, 1283, 'k129', 4.25), (9443, 199, 'k142', 4.5), (9444, 2116, 'k155', 4.75), (9445, 1032, 'k11', 5.0), (9446, 2949, 'k24', 5.25), (9447, 1865, 'k37', 5.5), (9448, 781, 'k50', 5.75), (9449, 2698, 'k63', 6.0), (9450, 1614, 'k76', 6.25), (9451, 530, 'k89', 6.5), (9452, 2447, 'k102', 6.75), (9453, 1363, 'k115', 7.0), (9454, 279, 'k128', 0.0), (9455, 2196, 'k141', 0.25), (9456, 1112, 'k154', 0.5), (9457, 28, 'k10', 0.75), (9458, 1945, 'k23', 1.0), (9459, 861, 'k36', 1.25), (9460, 2778, 'k49', 1.5), (9461, 1694, 'k62', 1.75), (9462, 610, 'k75', 2.0), (9463, 2527, 'k88', 2.25), (9464, 1443, 'k101', 2.5), (9465, 359, 'k114', 2.75), (9466, 2276, 'k127', 3.0), (9467, 1192, 'k140', 3.25), (9468, 108, 'k153', 3.5), (9469, 2025, 'k9', 3.75), (9470, 941, 'k22', 4.0), (9471, 2858, 'k35', 4.25), (9472, 1774, 'k48', 4.5), (9473, 690, 'k61', 4.75), (9474, 2607, 'k74', 5.0), (9475, 1523, 'k87', 5.25), (9476, 439, 'k100', 5.5), (9477, 2356, 'k113', 5.75), (9478, 1272, 'k126', 6.0), (9479, 188, 'k139', 6.25), (9480, 2105, 'k152', 6.5), (9481, 1021, 'k8', 6.75), (9482, 2938, 'k21', 7.0), (9483, 1854, 'k34', 0.0), (9484, 770, 'k47', 0.25), (9485, 2687, 'k60', 0.5), (9486, 1603, 'k73', 0.75), (9487, 519, 'k86', 1.0), (9488, 2436, 'k99', 1.25), (9489, 1352, 'k112', 1.5), (9490, 268, 'k125', 1.75), (9491, 2185, 'k138', 2.0), (9492, 1101, 'k151', 2.25), (9493, 17, 'k7', 2.5), (9494, 1934, 'k20', 2.75), (9495, 850, 'k33', 3.0), (9496, 2767, 'k46', 3.25), (9497, 1683, 'k59', 3.5), (9498, 599, 'k72', 3.75), (9499, 2516, 'k85', 4.0), (9500, 1432, 'k98', 4.25), (9501, 348, 'k111', 4.5), (9502, 2265, 'k124', 4.75), (9503, 1181, 'k137', 5.0), (9504, 97, 'k150', 5.25), (9505, 2014, 'k6', 5.5), (9506, 930, 'k19', 5.75), (9507, 2847, 'k32', 6.0), (9508, 1763, 'k45', 6.25), (9509, 679, 'k58', 6.5), (9510, 2596, 'k71', 6.75), (9511, 1512, 'k84', 7.0), (9512, 428, 'k97', 0.0), (9513, 2345, 'k110', 0.25), (9514, 1261, 'k123', 0.5), (9515, 177, 'k136', 0.75), (9516, 2094, 'k149', 1.0), (9517, 1010, 'k5', 1.25), (9518, 2927, 'k18', 1.5), (9519, 1843, 'k31', 1.75), (9520, 759, 'k44', 2.0), (9521, 2676, 'k57', 2.25), (9522, 1592, 'k70', 2.5), (9523, 508, 'k83', 2.75), (9524, 2425, 'k96', 3.0), (9525, 1341, 'k109', 3.25), (9526, 257, 'k122', 3.5), (9527, 2174, 'k135', 3.75), (9528, 1090, 'k148', 4.0), (9529, 6, 'k4', 4.25), (9530, 1923, 'k17', 4.5), (9531, 839, 'k30', 4.75), (9532, 2756, 'k43', 5.0), (9533, 1672, 'k56', 5.25), (9534, 588, 'k69', 5.5), (9535, 2505, 'k82', 5.75), (9536, 1421, 'k95', 6.0), (9537, 337, 'k108', 6.25), (9538, 2254, 'k121', 6.5), (9539, 1170, 'k134', 6.75), (9540, 86, 'k147', 7.0), (9541, 2003, 'k3', 0.0), (9542, 919, 'k16', 0.25), (9543, 2836, 'k29', 0.5), (9544, 1752, 'k42', 0.75), (9545, 668, 'k55', 1.0), (9546, 2585, 'k68', 1.25), (9547, 1501, 'k81', 1.5), (9548, 417, 'k94', 1.75), (9549, 2334, 'k107', 2.0), (9550, 1250, 'k120', 2.25), (9551, 166, 'k133', 2.5), (9552, 2083, 'k146', 2.75), (9553, 999, 'k2', 3.0), (9554, 2916, 'k15', 3.25), (9555, 1832, 'k28', 3.5), (9556, 748, 'k41', 3.75), (9557, 2665, 'k54', 4.0), (9558, 1581, 'k67', 4.25), (9559, 497, 'k80', 4.5), (9560, 2414, 'k93', 4.75), (9561, 1330, 'k106', 5.0), (9562, 246, 'k119', 5.25), (9563, 2163, 'k132', 5.5), (9564, 1079, 'k145', 5.75), (9565, 2996, 'k1', 6.0), (9566, 1912, 'k14', 6.25), (9567, 828, 'k27', 6.5), (9568, 2745, 'k40', 6.75), (9569, 1661, 'k53', 7.0), (9570, 577, 'k66', 0.0), (9571, 2494, 'k79', 0.25), (9572, 1410, 'k92', 0.5), (9573, 326, 'k105', 0.75), (9574, 2243, 'k118', 1.0), (9575, 1159, 'k131', 1.25), (9576, 75, 'k144', 1.5), (9577, 1992, 'k0', 1.75), (9578, 908, 'k13', 2.0), (9579, 2825, 'k26', 2.25), (9580, 1741, 'k39', 2.5), (9581, 657, 'k52', 2.75), (9582, 2574, 'k65', 3.0), (9583, 1490, 'k78', 3.25), (9584, 406, 'k91', 3.5), (9585, 2323, 'k104', 3.75), (9586, 1239, 'k117', 4.0), (9587, 155, 'k130', 4.25), (9588, 2072, 'k143', 4.5), (9589, 988, 'k156', 4.75), (9590, 2905, 'k12', 5.0), (9591, 1821, 'k25', 5.25), (9592, 737, 'k38', 5.5), (9593, 2654, 'k51', 5.75), (9594, 1570, 'k64', 6.0), (9595, 486, 'k77', 6.25), (9596, 2403, 'k90', 6.5), (9597, 1319, 'k103', 6.75), (9598, 235, 'k116', 7.0), (9599, 2152, 'k129', 0.0), (9600, 1068, 'k142', 0.25), (9601, 2985, 'k155', 0.5), (9602, 1901, 'k11', 0.75), (9603, 817, 'k24', 1.0), (9604, 2734, 'k37', 1.25), (9605, 1650, 'k50', 1.5), (9606, 566, 'k63', 1.75), (9607, 2483, 'k76', 2.0), (9608, 1399, 'k89', 2.25), (9609, 315, 'k102', 2.5), (9610, 2232, 'k115', 2.75), (9611, 1148, 'k128', 3.0), (9612, 64, 'k141', 3.25), (9613, 1981, 'k154', 3.5), (9614, 897, 'k10', 3.75), (9615, 2814, 'k23', 4.0), (9616, 1730, 'k36', 4.25), (9617, 646, 'k49', 4.5), (9618, 2563, 'k62', 4.75), (9619, 1479, 'k75', 5.0), (9620, 395, 'k88', 5.25), (9621, 2312, 'k101', 5.5), (9622, 1228, 'k114', 5.75), (9623, 144, 'k127', 6.0), (9624, 2061, 'k140', 6.25), (9625, 977, 'k153', 6.5), (9626, 2894, 'k9', 6.75), (9627, 1810, 'k22', 7.0), (9628, 726, 'k35', 0.0), (9629, 2643, 'k48', 0.25), (9630, 1559, 'k61', 0.5), (9631, 475, 'k74', 0.75), (9632, 2392, 'k87', 1.0), (9633, 1308, 'k100', 1.25), (9634, 224, 'k113', 1.5), (9635, 2141, 'k126', 1.75), (9636, 1057, 'k139', 2.0), (9637, 2974, 'k152', 2.25), (9638, 1890, 'k8', 2.5), (9639, 806, 'k21', 2.75), (9640, 2723, 'k34', 3.0), (9641, 1639, 'k47', 3.25), (9642, 555, 'k60', 3.5), (9643, 2472, 'k73', 3.75), (9644, 1388, 'k86', 4.0), (9645, 304, 'k99', 4.25), (9646, 2221, 'k112', 4.5), (9647, 1137, 'k125', 4.75), (9648, 53, 'k138', 5.0), (9649, 1970, 'k151', 5.25), (9650, 886, 'k7', 5.5), (9651, 2803, 'k20', 5.75), (9652, 1719, 'k33', 6.0), (9653, 635, 'k46', 6.25), (9654, 2552, 'k59', 6.5), (9655, 1468, 'k72', 6.75), (9656, 384, 'k85', 7.0), (9657, 2301, 'k98', 0.0), (9658, 1217, 'k111', 0.25), (9659, 133, 'k124', 0.5), (9660, 2050, 'k137', 0.75), (9661, 966, 'k150', 1.0), (9662, 2883, 'k6', 1.25), (9663, 1799, 'k19', 1.5), (9664, 715, 'k32', 1.75), (9665, 2632, 'k45', 2.0), (9666, 1548, 'k58', 2.25), (9667, 464, 'k71', 2.5), (9668, 2381, 'k84', 2.75), (9669, 1297, 'k97', 3.0), (9670, 213, 'k110', 3.25), (9671, 2130, 'k123', 3.5), (9672, 1046, 'k136', 3.75), (9673, 2963, 'k149', 4.0), (9674, 1879, 'k5', 4.25), (9675, 795, 'k18', 4.5), (9676, 2712, 'k31', 4.75), (9677, 1628, 'k44', 5.0), (9678, 544, 'k57', 5.25), (9679, 2461, 'k70', 5.5), (9680, 1377, 'k83', 5.75), (9681, 293, 'k96', 6.0), (9682, 2210, 'k109', 6.25), (9683, 1126, 'k122', 6.5), (9684, 42, 'k135', 6.75), (9685, 1959, 'k148', 7.0), (9686, 875, 'k4', 0.0), (9687, 2792, 'k17', 0.25), (9688, 1708, 'k30', 0.5), (9689, 624, 'k43', 0.75), (9690, 2541, 'k56', 1.0), (9691, 1457, 'k69', 1.25), (9692, 373, 'k82', 1.5), (9693, 2290, 'k95', 1.75), (9694, 1206, 'k108', 2.0), (9695, 122, 'k121', 2.25), (9696, 2039, 'k134', 2.5), (9697, 955, 'k147', 2.75), (9698, 2872, 'k3', 3.0), (9699, 1788, 'k16', 3.25), (9700, 704, 'k29', 3.5), (9701, 2621, 'k42', 3.75), (9702, 1537, 'k55', 4.0), (9703, 453, 'k68', 4.25), (9704, 2370, 'k81', 4.5), (9705, 1286, 'k94', 4.75), (9706, 202, 'k107', 5.0), (9707, 2119, 'k120', 5.25), (9708, 1035, 'k133', 5.5), (9709, 2952, 'k146', 5.75), (9710, 1868, 'k2', 6.0), (9711, 784, 'k15', 6.25), (9712, 2701, 'k28', 6.5), (9713, 1617, 'k41', 6.75), (9714, 533, 'k54', 7.0), (9715, 2450, 'k67', 0.0), (9716, 1366, 'k80', 0.25), (9717, 282, 'k93', 0.5), (9718, 2199, 'k106', 0.75), (9719, 1115, 'k119', 1.0), (9720, 31, 'k132', 1.25), (9721, 1948, 'k145', 1.5), (9722, 864, 'k1', 1.75), (9723, 2781, 'k14', 2.0), (9724, 1697, 'k27', 2.25), (9725, 613, 'k40', 2.5), (9726, 2530, 'k53', 2.75), (9727, 1446, 'k66', 3.0), (9728, 362, 'k79', 3.25), (9729, 2279, 'k92', 3.5), (9730, 1195, 'k105', 3.75), (9731, 111, 'k118', 4.0), (9732, 2028, 'k131', 4.25), (9733, 944, 'k144', 4.5), (9734, 2861, 'k0', 4.75), (9735, 1777, 'k13', 5.0), (9736, 693, 'k26', 5.25), (9737, 2610, 'k39', 5.5), (9738, 1526, 'k52', 5.75), (9739, 442, 'k65', 6.0), (9740, 2359, 'k78', 6.25), (9741, 1275, 'k91', 6.5), (9742, 191, 'k104', 6.75), (9743, 2108, 'k117', 7.0), (9744, 1024, 'k130', 0.0), (9745, 2941, 'k143', 0.25), (9746, 1857, 'k156', 0.5), (9747, 773, 'k12', 0.75), (9748, 2690, 'k25', 1.0), (9749, 1606, 'k38', 1.25), (9750, 522, 'k51', 1.5), (9751, 2439, 'k64', 1.75), (9752, 1355, 'k77', 2.0), (9753, 271, 'k90', 2.25), (9754, 2188, 'k103', 2.5), (9755, 1104, 'k116', 2.75), (9756, 20, 'k129', 3.0), (9757, 1937, 'k142', 3.25), (9758, 853, 'k155', 3.5), (9759, 2770, 'k11', 3.75), (9760, 1686, 'k24', 4.0), (9761, 602, 'k37', 4.25), (9762, 2519, 'k50', 4.5), (9763, 1435, 'k63', 4.75), (9764, 351, 'k76', 5.0), (9765, 2268, 'k89', 5.25), (9766, 1184, 'k102', 5.5), (9767, 100, 'k115', 5.75), (9768, 2017, 'k128', 6.0), (9769, 933, 'k141', 6.25), (9770, 2850, 'k154', 6.5), (9771, 1766, 'k10', 6.75), (9772, 682, 'k23', 7.0), (9773, 2599, 'k36', 0.0), (9774, 1515, 'k49', 0.25), (9775, 431, 'k62', 0.5), (9776, 2348, 'k75', 0.75), (9777, 1264, 'k88', 1.0), (9778, 180, 'k101', 1.25), (9779, 2097, 'k114', 1.5), (9780, 1013, 'k127', 1.75), (9781, 2930, 'k140', 2.0), (9782, 1846, 'k153', 2.25), (9783, 762, 'k9', 2.5), (9784, 2679, 'k22', 2.75), (9785, 1595, 'k35', 3.0), (9786, 511, 'k48', 3.25), (9787, 2428, 'k61', 3.5), (9788, 1344, 'k74', 3.75), (9789, 260, 'k87', 4.0), (9790, 2177, 'k100', 4.25), (9791, 1093, 'k113', 4.5), (9792, 9, 'k126', 4.75), (9793, 1926, 'k139', 5.0), (9794, 842, 'k152', 5.25), (9795, 2759, 'k8', 5.5), (9796, 1675, 'k21', 5.75), (9797, 591, 'k34', 6.0), (9798, 2508, 'k47', 6.25), (9799, 1424, 'k60', 6.5), (9800, 340, 'k73', 6.75), (9801, 2257, 'k86', 7.0), (9802, 1173, 'k99', 0.0), (9803, 89, 'k112', 0.25), (9804, 2006, 'k125', 0.5), (9805, 922, 'k138', 0.75), (9806, 2839, 'k151', 1.0), (9807, 1755, 'k7', 1.25), (9808, 671, 'k20', 1.5), (9809, 2588, 'k33', 1.75), (9810, 1504, 'k46', 2.0), (9811, 420, 'k59', 2.25), (9812, 2337, 'k72', 2.5), (9813, 1253, 'k85', 2.75), (9814, 169, 'k98', 3.0), (9815, 2086, 'k111', 3.25), (9816, 1002, 'k124', 3.5), (9817, 2919, 'k137', 3.75), (9818, 1835, 'k150', 4.0), (9819, 751, 'k6', 4.25), (9820, 2668, 'k19', 4.5), (9821, 1584, 'k32', 4.75), (9822, 500, 'k45', 5.0), (9823, 2417, 'k58', 5.25), (9824, 1333, 'k71', 5.5), (9825, 249, 'k84', 5.75), (9826, 2166, 'k97', 6.0), (9827, 1082, 'k110', 6.25), (9828, 2999, 'k123', 6.5), (9829, 1915, 'k136', 6.75), (9830, 831, 'k149', 7.0), (9831, 2748, 'k5', 0.0), (9832, 1664, 'k18', 0.25), (9833, 580, 'k31', 0.5), (9834, 2497, 'k44', 0.75), (9835, 1413, 'k57', 1.0), (9836, 329, 'k70', 1.25), (9837, 2246, 'k83', 1.5), (9838, 1162, 'k96', 1.75), (9839, 78, 'k109', 2.0), (9840, 1995, 'k122', 2.25), (9841, 911, 'k135', 2.5), (9842, 2828, 'k148', 2.75), (9843, 1744, 'k4', 3.0), (9844, 660, 'k17', 3.25), (9845, 2577, 'k30', 3.5), (9846, 1493, 'k43', 3.75), (9847, 409, 'k56', 4.0), (9848, 2326, 'k69', 4.25), (9849, 1242, 'k82', 4.5), (9850, 158, 'k95', 4.75), (9851, 2075, 'k108', 5.0), (9852, 991, 'k121', 5.25), (9853, 2908, 'k134', 5.5), (9854, 1824, 'k147', 5.75), (9855, 740, 'k3', 6.0), (9856, 2657, 'k16', 6.25), (9857, 1573, 'k29', 6.5), (9858, 489, 'k42', 6.75), (9859, 2406, 'k55', 7.0), (9860, 1322, 'k68', 0.0), (9861, 238, 'k81', 0.25), (9862, 2155, 'k94', 0.5), (9863, 1071, 'k107', 0.75), (9864, 2988, 'k120', 1.0), (9865, 1904, 'k133', 1.25), (9866, 820, 'k146', 1.5), (9867, 2737, 'k2', 1.75), (9868, 1653, 'k15', 2.0), (9869, 569, 'k28', 2.25), (9870, 2486, 'k41', 2.5), (9871, 1402, 'k54', 2.75), (9872, 318, 'k67', 3.0), (9873, 2235, 'k80', 3.25), (9874, 1151, 'k93', 3.5), (9875, 67, 'k106', 3.75), (9876, 1984, 'k119', 4.0), (9877, 900, 'k132', 4.25), (9878, 2817, 'k145', 4.5), (9879, 1733, 'k1', 4.75), (9880, 649, 'k14', 5.0), (9881, 2566, 'k27', 5.25), (9882, 1482, 'k40', 5.5), (9883, 398, 'k53', 5.75), (9884, 2315, 'k66', 6.0), (9885, 1231, 'k79', 6.25), (9886, 147, 'k92', 6.5), (9887, 2064, 'k105', 6.75), (9888, 980, 'k118', 7.0), (9889, 2897, 'k131', 0.0), (9890, 1813, 'k144', 0.25), (9891, 729, 'k0', 0.5), (9892, 2646, 'k13', 0.75), (9893, 1562, 'k26', 1.0), (9894, 478, 'k39', 1.25), (9895, 2395, 'k52', 1.5), (9896, 1311, 'k65', 1.75), (9897, 227, 'k78', 2.0), (9898, 2144, 'k91', 2.25), (9899, 1060, 'k104', 2.5), (9900, 2977, 'k117', 2.75), (9901, 1893, 'k130', 3.0), (9902, 809, 'k143', 3.25), (9903, 2726, 'k156', 3.5), (9904, 1642, 'k12', 3.75), (9905, 558, 'k25', 4.0), (9906, 2475, 'k38', 4.25), (9907, 1391, 'k51', 4.5), (9908, 307, 'k64', 4.75), (9909, 2224, 'k77', 5.0), (9910, 1140, 'k90', 5.25), (9911, 56, 'k103', 5.5), (9912, 1973, 'k116', 5.75), (9913, 889, 'k129', 6.0), (9914, 2806, 'k142', 6.25), (9915, 1722, 'k155', 6.5), (9916, 638, 'k11', 6.75), (9917, 2555, 'k24', 7.0), (9918, 1471, 'k37', 0.0), (9919, 387, 'k50', 0.25), (9920, 2304, 'k63', 0.5), (9921, 1220, 'k76', 0.75), (9922, 136, 'k89', 1.0), (9923, 2053, 'k102', 1.25), (9924, 969, 'k115', 1.5), (9925, 2886, 'k128', 1.75), (9926, 1802, 'k141', 2.0), (9927, 718, 'k154', 2.25), (9928, 2635, 'k10', 2.5), (9929, 1551, 'k23', 2.75), (9930, 467, 'k36', 3.0), (9931, 2384, 'k49', 3.25), (9932, 1300, 'k62', 3.5), (9933, 216, 'k75', 3.75), (9934, 2133, 'k88', 4.0), (9935, 1049, 'k101', 4.25), (9936, 2966, 'k114', 4.5), (9937, 1882, 'k127', 4.75), (9938, 798, 'k140', 5.0), (9939, 2715, 'k153', 5.25), (9940, 1631, 'k9', 5.5), (9941, 547, 'k22', 5.75), (9942, 2464, 'k35', 6.0), (9943, 1380, 'k48', 6.25), (9944, 296, 'k61', 6.5), (9945, 2213, 'k74', 6.75), (9946, 1129, 'k87', 7.0), (9947, 45, 'k100', 0.0), (9948, 1962, 'k113', 0.25), (9949, 878, 'k126', 0.5), (9950, 2795, 'k139', 0.75), (9951, 1711, 'k152', 1.0), (9952, 627, 'k8', 1.25), (9953, 2544, 'k21', 1.5), (9954, 1460, 'k34', 1.75), (9955, 376, 'k47', 2.0), (9956, 2293, 'k60', 2.25), (9957, 1209, 'k73', 2.5), (9958, 125, 'k86', 2.75), (9959, 2042, 'k99', 3.0), (9960, 958, 'k112', 3.25), (9961, 2875, 'k125', 3.5), (9962, 1791, 'k138', 3.75), (9963, 707, 'k151', 4.0), (9964, 2624, 'k7', 4.25), (9965, 1540, 'k20', 4.5), (9966, 456, 'k33', 4.75), (9967, 2373, 'k46', 5.0), (9968, 1289, 'k59', 5.25), (9969, 205, 'k72', 5.5), (9970, 2122, 'k85', 5.75), (9971, 1038, 'k98', 6.0), (9972, 2955, 'k111', 6.25), (9973, 1871, 'k124', 6.5), (9974, 787, 'k137', 6.75), (9975, 2704, 'k150', 7.0), (9976, 1620, 'k6', 0.0), (9977, 536, 'k19', 0.25), (9978, 2453, 'k32', 0.5), (9979, 1369, 'k45', 0.75), (9980, 285, 'k58', 1.0), (9981, 2202, 'k71', 1.25), (9982, 1118, 'k84', 1.5), (9983, 34, 'k97', 1.75), (9984, 1951, 'k110', 2.0), (9985, 867, 'k123', 2.25), (9986, 2784, 'k136', 2.5), (9987, 1700, 'k149', 2.75), (9988, 616, 'k5', 3.0), (9989, 2533, 'k18', 3.25), (9990, 1449, 'k31', 3.5), (9991, 365, 'k44', 3.75), (9992, 2282, 'k57', 4.0), (9993, 1198, 'k70', 4.25), (9994, 114, 'k83', 4.5), (9995, 2031, 'k96', 4.75), (9996, 947, 'k109', 5.0), (9997, 2864, 'k122', 5.25), (9998, 1780, 'k135', 5.5), (9999, 696, 'k148', 5.75), (10000, 2613, 'k4', 6.0), (10001, 1529, 'k17', 6.25), (10002, 445, 'k30', 6.5), (10003, 2362, 'k43', 6.75), (10004, 1278, 'k56', 7.0), (10005, 194, 'k69', 0.0), (10006, 2111, 'k82', 0.25), (10007, 1027, 'k95', 0.5), (10008, 2944, 'k108', 0.75), (10009, 1860, 'k121', 1.0), (10010, 776, 'k134', 1.25), (10011, 2693, 'k147', 1.5), (10012, 1609, 'k3', 1.75), (10013, 525, 'k16', 2.0), (10014, 2442, 'k29', 2.25), (10015, 1358, 'k42', 2.5), (10016, 274, 'k55', 2.75), (10017, 2191, 'k68', 3.0), (10018, 1107, 'k81', 3.25), (10019, 23, 'k94', 3.5), (10020, 1940, 'k107', 3.75), (10021, 856, 'k120', 4.0), (10022, 2773, 'k133', 4.25), (10023, 1689, 'k146', 4.5), (10024, 605, 'k2', 4.75), (10025, 2522, 'k15', 5.0), (10026, 1438, 'k28', 5.25), (10027, 354, 'k41', 5.5), (10028, 2271, 'k54', 5.75), (10029, 1187, 'k67', 6.0), (10030, 103, 'k80', 6.25), (10031, 2020, 'k93', 6.5), (10032, 936, 'k106', 6.75), (10033, 2853, 'k119', 7.0), (10034, 1769, 'k132', 0.0), (10035, 685, 'k145', 0.25), (10036, 2602, 'k1', 0.5), (10037, 1518, 'k14', 0.75), (10038, 434, 'k27', 1.0), (10039, 2351, 'k40', 1.25), (10040, 1267, 'k53', 1.5), (10041, 183, 'k66', 1.75), (10042, 2100, 'k79', 2.0), (10043, 1016, 'k92', 2.25), (10044, 2933, 'k105', 2.5), (10045, 1849, 'k118', 2.75), (10046, 765, 'k131', 3.0), (10047, 2682, 'k144', 3.25), (10048, 1598, 'k0', 3.5), (10049, 514, 'k13', 3.75), (10050, 2431, 'k26', 4.0), (10051, 1347, 'k39', 4.25), (10052, 263, 'k52', 4.5), (10053, 2180, 'k65', 4.75), (10054, 1096, 'k78', 5.0), (10055, 12, 'k91', 5.25), (10056, 1929, 'k104', 5.5), (10057, 845, 'k117', 5.75), (10058, 2762, 'k130', 6.0), (10059, 1678, 'k143', 6.25), (10060, 594, 'k156', 6.5), (10061, 2511, 'k12', 6.75), (10062, 1427, 'k25', 7.0), (10063, 343, 'k38', 0.0), (10064, 2260, 'k51', 0.25), (10065, 1176, 'k64', 0.5), (10066, 92, 'k77', 0.75), (10067, 2009, 'k90', 1.0), (10068, 925, 'k103', 1.25), (10069, 2842, 'k116', 1.5), (10070, 1758, 'k129', 1.75), (10071, 674, 'k142', 2.0), (10072, 2591, 'k155', 2.25), (10073, 1507, 'k11', 2.5), (10074, 423, 'k24', 2.75), (10075, 2340, 'k37', 3.0), (10076, 1256, 'k50', 3.25), (10077, 172, 'k63', 3.5), (10078, 2089, 'k76', 3.75), (10079, 1005, 'k89', 4.0), (10080, 2922, 'k102', 4.25), (10081, 1838, 'k115', 4.5), (10082, 754, 'k128', 4.75), (10083, 2671, 'k141', 5.0), (10084, 1587, 'k154', 5.25), (10085, 503, 'k10', 5.5), (10086, 2420, 'k23', 5.75), (10087, 1336, 'k36', 6.0), (10088, 252, 'k49', 6.25), (10089, 2169, 'k62', 6.5), (10090, 1085, 'k75', 6.75), (10091, 1, 'k88', 7.0), (10092, 1918, 'k101', 0.0), (10093, 834, 'k114', 0.25), (10094, 2751, 'k127', 0.5), (10095, 1667, 'k140', 0.75), (10096, 583, 'k153', 1.0), (10097, 2500, 'k9', 1.25), (10098, 1416, 'k22', 1.5), (10099, 332, 'k35', 1.75), (10100, 2249, 'k48', 2.0), (10101, 1165, 'k61', 2.25), (10102, 81, 'k74', 2.5), (10103, 1998, 'k87', 2.75), (10104, 914, 'k100', 3.0), (10105, 2831, 'k113', 3.25), (10106, 1747, 'k126', 3.5), (10107, 663, 'k139', 3.75), (10108, 2580, 'k152', 4.0), (10109, 1496, 'k8', 4.25), (10110, 412, 'k21', 4.5), (10111, 2329, 'k34', 4.75), (10112, 1245, 'k47', 5.0), (10113, 161, 'k60', 5.25), (10114, 2078, 'k73', 5.5), (10115, 994, 'k86', 5.75), (10116, 2911, 'k99', 6.0), (10117, 1827, 'k112', 6.25), (10118, 743, 'k125', 6.5), (10119, 2660, 'k138', 6.75), (10120, 1576, 'k151', 7.0), (10121, 492, 'k7', 0.0), (10122, 2409, 'k20', 0.25), (10123, 1325, 'k33', 0.5), (10124, 241, 'k46', 0.75), (10125, 2158, 'k59', 1.0), (10126, 1074, 'k72', 1.25), (10127, 2991, 'k85', 1.5), (10128, 1907, 'k98', 1.75), (10129, 823, 'k111', 2.0), (10130, 2740, 'k124', 2.25), (10131, 1656, 'k137', 2.5), (10132, 572, 'k150', 2.75), (10133, 2489, 'k6', 3.0), (10134, 1405, 'k19', 3.25), (10135, 321, 'k32', 3.5), (10136, 2238, 'k45', 3.75), (10137, 1154, 'k58', 4.0), (10138, 70, 'k71', 4.25), (10139, 1987, 'k84', 4.5), (10140, 903, 'k97', 4.75), (10141, 2820, 'k110', 5.0), (10142, 1736, 'k123', 5.25), (10143, 652, 'k136', 5.5), (10144, 2569, 'k149', 5.75), (10145, 1485, 'k5', 6.0), (10146, 401, 'k18', 6.25), (10147, 2318, 'k31', 6.5), (10148, 1234, 'k44', 6.75), (10149, 150, 'k57', 7.0), (10150, 2067, 'k70', 0.0), (10151, 983, 'k83', 0.25), (10152, 2900, 'k96', 0.5), (10153, 1816, 'k109', 0.75), (10154, 732, 'k122', 1.0), (10155, 2649, 'k135', 1.25), (10156, 1565, 'k148', 1.5), (10157, 481, 'k4', 1.75), (10158, 2398, 'k17', 2.0), (10159, 1314, 'k30', 2.25), (10160, 230, 'k43', 2.5), (10161, 2147, 'k56', 2.75), (10162, 1063, 'k69', 3.0), (10163, 2980, 'k82', 3.25), (10164, 1896, 'k95', 3.5), (10165, 812, 'k108', 3.75), (10166, 2729, 'k121', 4.0), (10167, 1645, 'k134', 4.25), (10168, 561, 'k147', 4.5), (10169, 2478, 'k3', 4.75), (10170, 1394, 'k16', 5.0), (10171, 310, 'k29', 5.25), (10172, 2227, 'k42', 5.5), (10173, 1143, 'k55', 5.75), (10174, 59, 'k68', 6.0), (10175, 1976, 'k81', 6.25), (10176, 892, 'k94', 6.5), (10177, 2809, 'k107', 6.75), (10178, 1725, 'k120', 7.0), (10179, 641, 'k133', 0.0), (10180, 2558, 'k146', 0.25), (10181, 1474, 'k2', 0.5), (10182, 390, 'k15', 0.75), (10183, 2307, 'k28', 1.0), (10184, 1223, 'k41', 1.25), (10185, 139, 'k54', 1.5), (10186, 2056, 'k67', 1.75), (10187, 972, 'k80', 2.0), (10188, 2889, 'k93', 2.25), (10189, 1805, 'k106', 2.5), (10190, 721, 'k119', 2.75), (10191, 2638, 'k132', 3.0), (10192, 1554, 'k145', 3.25), (10193, 470, 'k1', 3.5), (10194, 2387, 'k14', 3.75), (10195, 1303, 'k27', 4.0), (10196, 219, 'k40', 4.25), (10197, 2136, 'k53', 4.5), (10198, 1052, 'k66', 4.75), (10199, 2969, 'k79', 5.0), (10200, 1885, 'k92', 5.25), (10201, 801, 'k105', 5.5), (10202, 2718, 'k118', 5.75), (10203, 1634, 'k131', 6.0), (10204, 550, 'k144', 6.25), (10205, 2467, 'k0', 6.5), (10206, 1383, 'k13', 6.75), (10207, 299, 'k26', 7.0), (10208, 2216, 'k39', 0.0), (10209, 1132, 'k52', 0.25), (10210, 48, 'k65', 0.5), (10211, 1965, 'k78', 0.75), (10212, 881, 'k91', 1.0), (10213, 2798, 'k104', 1.25), (10214, 1714, 'k117', 1.5), (10215, 630, 'k130', 1.75), (10216, 2547, 'k143', 2.0), (10217, 1463, 'k156', 2.25), (10218, 379, 'k12', 2.5), (10219, 2296, 'k25', 2.75), (10220, 1212, 'k38', 3.0), (10221, 128, 'k51', 3.25), (10222, 2045, 'k64', 3.5), (10223, 961, 'k77', 3.75), (10224, 2878, 'k90', 4.0), (10225, 1794, 'k103', 4.25), (10226, 710, 'k116', 4.5), (10227, 2627, 'k129', 4.75), (10228, 1543, 'k142', 5.0), (10229, 459, 'k155', 5.25), (10230, 2376, 'k11', 5.5), (10231, 1292, 'k24', 5.75), (10232, 208, 'k37', 6.0), (10233, 2125, 'k50', 6.25), (10234, 1041, 'k63', 6.5), (10235, 2958, 'k76', 6.75), (10236, 1874, 'k89', 7.0), (10237, 790, 'k102', 0.0), (10238, 2707, 'k115', 0.25), (10239, 1623, 'k128', 0.5), (10240, 539, 'k141', 0.75), (10241, 2456, 'k154', 1.0), (10242, 1372, 'k10', 1.25), (10243, 288, 'k23', 1.5), (10244, 2205, 'k36', 1.75), (10245, 1121, 'k49', 2.0), (10246, 37, 'k62', 2.25), (10247, 1954, 'k75', 2.5), (10248, 870, 'k88', 2.75), (10249, 2787, 'k101', 3.0), (10250, 1703, 'k114', 3.25), (10251, 619, 'k127', 3.5), (10252, 2536, 'k140', 3.75), (10253, 1452, 'k153', 4.0), (10254, 368, 'k9', 4.25), (10255, 2285, 'k22', 4.5), (10256, 1201, 'k35', 4.75), (10257, 117, 'k48', 5.0), (10258, 2034, 'k61', 5.25), (10259, 950, 'k74', 5.5), (10260, 2867, 'k87', 5.75), (10261, 1783, 'k100', 6.0), (10262, 699, 'k113', 6.25), (10263, 2616, 'k126', 6.5), (10264, 1532, 'k139', 6.75), (10265, 448, 'k152', 7.0), (10266, 2365, 'k8', 0.0), (10267, 1281, 'k21', 0.25), (10268, 197, 'k34', 0.5), (10269, 2114, 'k47', 0.75), (10270, 1030, 'k60', 1.0), (10271, 2947, 'k73', 1.25), (10272, 1863, 'k86', 1.5), (10273, 779, 'k99', 1.75), (10274, 2696, 'k112', 2.0), (10275, 1612, 'k125', 2.25), (10276, 528, 'k138', 2.5), (10277, 2445, 'k151', 2.75), (10278, 1361, 'k7', 3.0), (10279, 277, 'k20', 3.25), (10280, 2194, 'k33', 3.5), (10281, 1110, 'k46', 3.75), (10282, 26, 'k59', 4.0), (10283, 1943, 'k72', 4.25), (10284, 859, 'k85', 4.5), (10285, 2776, 'k98', 4.75), (10286, 1692, 'k111', 5.0), (10287, 608, 'k124', 5.25), (10288, 2525, 'k137', 5.5), (10289, 1441, 'k150', 5.75), (10290, 357, 'k6', 6.0), (10291, 2274, 'k19', 6.25), (10292, 1190, 'k32', 6.5), (10293, 106, 'k45', 6.75), (10294, 2023, 'k58', 7.0), (10295, 939, 'k71', 0.0), (10296, 2856, 'k84', 0.25), (10297, 1772, 'k97', 0.5), (10298, 688, 'k110', 0.75), (10299, 2605, 'k123', 1.0), (10300, 1521, 'k136', 1.25), (10301, 437, 'k149', 1.5), (10302, 2354, 'k5', 1.75), (10303, 1270, 'k18', 2.0), (10304, 186, 'k31', 2.25), (10305, 2103, 'k44', 2.5), (10306, 1019, 'k57', 2.75), (10307, 2936, 'k70', 3.0), (10308, 1852, 'k83', 3.25), (10309, 768, 'k96', 3.5), (10310, 2685, 'k109', 3.75), (10311, 1601, 'k122', 4.0), (10312, 517, 'k135', 4.25), (10313, 2434, 'k148', 4.5), (10314, 1350, 'k4', 4.75), (10315, 266, 'k17', 5.0), (10316, 2183, 'k30', 5.25), (10317, 1099, 'k43', 5.5), (10318, 15, 'k56', 5.75), (10319, 1932, 'k69', 6.0), (10320, 848, 'k82', 6.25), (10321, 2765, 'k95', 6.5), (10322, 1681, 'k108', 6.75), (10323, 597, 'k121', 7.0), (10324, 2514, 'k134', 0.0), (10325, 1430, 'k147', 0.25), (10326, 346, 'k3', 0.5), (10327, 2263, 'k16', 0.75), (10328, 1179, 'k29', 1.0), (10329, 95, 'k42', 1.25), (10330, 2012, 'k55', 1.5), (10331, 928, 'k68', 1.75), (10332, 2845, 'k81', 2.0), (10333, 1761, 'k94', 2.25), (10334, 677, 'k107', 2.5), (10335, 2594, 'k120', 2.75), (10336, 1510, 'k133', 3.0), (10337, 426, 'k146', 3.25), (10338, 2343, 'k2', 3.5), (10339, 1259, 'k15', 3.75), (10340, 175, 'k28', 4.0), (10341, 2092, 'k41', 4.25), (10342, 1008, 'k54', 4.5), (10343, 2925, 'k67', 4.75), (10344, 1841, 'k80', 5.0), (10345, 757, 'k93', 5.25), (10346, 2674, 'k106', 5.5), (10347, 1590, 'k119', 5.75), (10348, 506, 'k132', 6.0), (10349, 2423, 'k145', 6.25), (10350, 1339, 'k1', 6.5), (10351, 255, 'k14', 6.75), (10352, 2172, 'k27', 7.0), (10353, 1088, 'k40', 0.0), (10354, 4, 'k53', 0.25), (10355, 1921, 'k66', 0.5), (10356, 837, 'k79', 0.75), (10357, 2754, 'k92', 1.0), (10358, 1670, 'k105', 1.25), (10359, 586, 'k118', 1.5), (10360, 2503, 'k131', 1.75), (10361, 1419, 'k144', 2.0), (10362, 335, 'k0', 2.25), (10363, 2252, 'k13', 2.5), (10364, 1168, 'k26', 2.75), (10365, 84, 'k39', 3.0), (10366, 2001, 'k52', 3.25), (10367, 917, 'k65', 3.5), (10368, 2834, 'k78', 3.75), (10369, 1750, 'k91', 4.0), (10370, 666, 'k104', 4.25), (10371, 2583, 'k117', 4.5), (10372, 1499, 'k130', 4.75), (10373, 415, 'k143', 5.0), (10374, 2332, 'k156', 5.25), (10375, 1248, 'k12', 5.5), (10376, 164, 'k25', 5.75), (10377, 2081, 'k38', 6.0), (10378, 997, 'k51', 6.25), (10379, 2914, 'k64', 6.5), (10380, 1830, 'k77', 6.75), (10381, 746, 'k90', 7.0), (10382, 2663, 'k103', 0.0), (10383, 1579, 'k116', 0.25), (10384, 495, 'k129', 0.5), (10385, 2412, 'k142', 0.75), (10386, 1328, 'k155', 1.0), (10387, 244, 'k11', 1.25), (10388, 2161, 'k24', 1.5), (10389, 1077, 'k37', 1.75), (10390, 2994, 'k50', 2.0), (10391, 1910, 'k63', 2.25), (10392, 826, 'k76', 2.5), (10393, 2743, 'k89', 2.75), (10394, 1659, 'k102', 3.0), (10395, 575, 'k115', 3.25), (10396, 2492, 'k128', 3.5), (10397, 1408, 'k141', 3.75), (10398, 324, 'k154', 4.0), (10399, 2241, 'k10', 4.25), (10400, 1157, 'k23', 4.5), (10401, 73, 'k36', 4.75), (10402, 1990, 'k49', 5.0), (10403, 906, 'k62', 5.25), (10404, 2823, 'k75', 5.5), (10405, 1739, 'k88', 5.75), (10406, 655, 'k101', 6.0), (10407, 2572, 'k114', 6.25), (10408, 1488, 'k127', 6.5), (10409, 404, 'k140', 6.75), (10410, 2321, 'k153', 7.0), (10411, 1237, 'k9', 0.0), (10412, 153, 'k22', 0.25), (10413, 2070, 'k35', 0.5), (10414, 986, 'k48', 0.75), (10415, 2903, 'k61', 1.0), (10416, 1819, 'k74', 1.25), (10417, 735, 'k87', 1.5), (10418, 2652, 'k100', 1.75), (10419, 1568, 'k113', 2.0), (10420, 484, 'k126', 2.25), (10421, 2401, 'k139', 2.5), (10422, 1317, 'k152', 2.75), (10423, 233, 'k8', 3.0), (10424, 2150, 'k21', 3.25), (10425, 1066, 'k34', 3.5), (10426, 2983, 'k47', 3.75), (10427, 1899, 'k60', 4.0), (10428, 815, 'k73', 4.25), (10429, 2732, 'k86', 4.5), (10430, 1648, 'k99', 4.75), (10431, 564, 'k112', 5.0), (10432, 2481, 'k125', 5.25), (10433, 1397, 'k138', 5.5), (10434, 313, 'k151', 5.75), (10435, 2230, 'k7', 6.0), (10436, 1146, 'k20', 6.25), (10437, 62, 'k33', 6.5), (10438, 1979, 'k46', 6.75), (10439, 895, 'k59', 7.0), (10440, 2812, 'k72', 0.0), (10441, 1728, 'k85', 0.25), (10442, 644, 'k98', 0.5), (10443, 2561, 'k111', 0.75), (10444, 1477, 'k124', 1.0), (10445, 393, 'k137', 1.25), (10446, 2310, 'k150', 1.5), (10447, 1226, 'k6', 1.75), (10448, 142, 'k19', 2.0), (10449, 2059, 'k32', 2.25), (10450, 975, 'k45', 2.5), (10451, 2892, 'k58', 2.75), (10452, 1808, 'k71', 3.0), (10453, 724, 'k84', 3.25), (10454, 2641, 'k97', 3.5), (10455, 1557, 'k110', 3.75), (10456, 473, 'k123', 4.0), (10457, 2390, 'k136', 4.25), (10458, 1306, 'k149', 4.5), (10459, 222, 'k5', 4.75), (10460, 2139, 'k18', 5.0), (10461, 1055, 'k31', 5.25), (10462, 2972, 'k44', 5.5), (10463, 1888, 'k57', 5.75), (10464, 804, 'k70', 6.0), (10465, 2721, 'k83', 6.25), (10466, 1637, 'k96', 6.5), (10467, 553, 'k109', 6.75), (10468, 2470, 'k122', 7.0), (10469, 1386, 'k135', 0.0), (10470, 302, 'k148', 0.25), (10471, 2219, 'k4', 0.5), (10472, 1135, 'k17', 0.75), (10473, 51, 'k30', 1.0), (10474, 1968, 'k43', 1.25), (10475, 884, 'k56', 1.5), (10476, 2801, 'k69', 1.75), (10477, 1717, 'k82', 2.0), (10478, 633, 'k95', 2.25), (10479, 2550, 'k108', 2.5), (10480, 1466, 'k121', 2.75), (10481, 382, 'k134', 3.0), (10482, 2299, 'k147', 3.25), (10483, 1215, 'k3', 3.5), (10484, 131, 'k16', 3.75), (10485, 2048, 'k29', 4.0), (10486, 964, 'k42', 4.25), (10487, 2881, 'k55', 4.5), (10488, 1797, 'k68', 4.75), (10489, 713, 'k81', 5.0), (10490, 2630, 'k94', 5.25), (10491, 1546, 'k107', 5.5), (10492, 462, 'k120', 5.75), (10493, 2379, 'k133', 6.0), (10494, 1295, 'k146', 6.25), (10495, 211, 'k2', 6.5), (10496, 2128, 'k15', 6.75), (10497, 1044, 'k28', 7.0), (10498, 2961, 'k41', 0.0), (10499, 1877, 'k54', 0.25), (10500, 793, 'k67', 0.5), (10501, 2710, 'k80', 0.75), (10502, 1626, 'k93', 1.0), (10503, 542, 'k106', 1.25), (10504, 2459, 'k119', 1.5), (10505, 1375, 'k132', 1.75), (10506, 291, 'k145', 2.0), (10507, 2208, 'k1', 2.25), (10508, 1124, 'k14', 2.5), (10509, 40, 'k27', 2.75), (10510, 1957, 'k40', 3.0), (10511, 873, 'k53', 3.25), (10512, 2790, 'k66', 3.5), (10513, 1706, 'k79', 3.75), (10514, 622, 'k92', 4.0), (10515, 2539, 'k105', 4.25), (10516, 1455, 'k118', 4.5), (10517, 371, 'k131', 4.75), (10518, 2288, 'k144', 5.0), (10519, 1204, 'k0', 5.25), (10520, 120, 'k13', 5.5), (10521, 2037, 'k26', 5.75), (10522, 953, 'k39', 6.0), (10523, 2870, 'k52', 6.25), (10524, 1786, 'k65', 6.5), (10525, 702, 'k78', 6.75), (10526, 2619, 'k91', 7.0), (10527, 1535, 'k104', 0.0), (10528, 451, 'k117', 0.25), (10529, 2368, 'k130', 0.5), (10530, 1284, 'k143', 0.75), (10531, 200, 'k156', 1.0), (10532, 2117, 'k12', 1.25), (10533, 1033, 'k25', 1.5), (10534, 2950, 'k38', 1.75), (10535, 1866, 'k51', 2.0), (10536, 782, 'k64', 2.25), (10537, 2699, 'k77', 2.5), (10538, 1615, 'k90', 2.75), (10539, 531, 'k103', 3.0), (10540, 2448, 'k116', 3.25), (10541, 1364, 'k129', 3.5), (10542, 280, 'k142', 3.75), (10543, 2197, 'k155', 4.0), (10544, 1113, 'k11', 4.25), (10545, 29, 'k24', 4.5), (10546, 1946, 'k37', 4.75), (10547, 862, 'k50', 5.0), (10548, 2779, 'k63', 5.25), (10549, 1695, 'k76', 5.5), (10550, 611, 'k89', 5.75), (10551, 2528, 'k102', 6.0), (10552, 1444, 'k115', 6.25), (10553, 360, 'k128', 6.5), (10554, 2277, 'k141', 6.75), (10555, 1193, 'k154', 7.0), (10556, 109, 'k10', 0.0), (10557, 2026, 'k23', 0.25), (10558, 942, 'k36', 0.5), (10559, 2859, 'k49', 0.75), (10560, 1775, 'k62', 1.0), (10561, 691, 'k75', 1.25), (10562, 2608, 'k88', 1.5), (10563, 1524, 'k101', 1.75), (10564, 440, 'k114', 2.0), (10565, 2357, 'k127', 2.25), (10566, 1273, 'k140', 2.5), (10567, 189, 'k153', 2.75), (10568, 2106, 'k9', 3.0), (10569, 1022, 'k22', 3.25), (10570, 2939, 'k35', 3.5), (10571, 1855, 'k48', 3.75), (10572, 771, 'k61', 4.0), (10573, 2688, 'k74', 4.25), (10574, 1604, 'k87', 4.5), (10575, 520, 'k100', 4.75), (10576, 2437, 'k113', 5.0), (10577, 1353, 'k126', 5.25), (10578, 269, 'k139', 5.5), (10579, 2186, 'k152', 5.75), (10580, 1102, 'k8', 6.0), (10581, 18, 'k21', 6.25), (10582, 1935, 'k34', 6.5), (10583, 851, 'k47', 6.75), (10584, 2768, 'k60', 7.0), (10585, 1684, 'k73', 0.0), (10586, 600, 'k86', 0.25), (10587, 2517, 'k99', 0.5), (10588, 1433, 'k112', 0.75), (10589, 349, 'k125', 1.0), (10590, 2266, 'k138', 1.25), (10591, 1182, 'k151', 1.5), (10592, 98, 'k7', 1.75), (10593, 2015, 'k20', 2.0), (10594, 931, 'k33', 2.25), (10595, 2848, 'k46', 2.5), (10596, 1764, 'k59', 2.75), (10597, 680, 'k72', 3.0), (10598, 2597, 'k85', 3.25), (10599, 1513, 'k98', 3.5), (10600, 429, 'k111', 3.75), (10601, 2346, 'k124', 4.0), (10602, 1262, 'k137', 4.25), (10603, 178, 'k150', 4.5), (10604, 2095, 'k6', 4.75), (10605, 1011, 'k19', 5.0), (10606, 2928, 'k32', 5.25), (10607, 1844, 'k45', 5.5), (10608, 760, 'k58', 5.75), (10609, 2677, 'k71', 6.0), (10610, 1593, 'k84', 6.25), (10611, 509, 'k97', 6.5), (10612, 2426, 'k110', 6.75), (10613, 1342, 'k123', 7.0), (10614, 258, 'k136', 0.0), (10615, 2175, 'k149', 0.25), (10616, 1091, 'k5', 0.5), (10617, 7, 'k18', 0.75), (10618, 1924, 'k31', 1.0), (10619, 840, 'k44', 1.25), (10620, 2757, 'k57', 1.5), (10621, 1673, 'k70', 1.75), (10622, 589, 'k83', 2.0), (10623, 2506, 'k96', 2.25), (10624, 1422, 'k109', 2.5), (10625, 338, 'k122', 2.75), (10626, 2255, 'k135', 3.0), (10627, 1171, 'k148', 3.25), (10628, 87, 'k4', 3.5), (10629, 2004, 'k17', 3.75), (10630, 920, 'k30', 4.0), (10631, 2837, 'k43', 4.25), (10632, 1753, 'k56', 4.5), (10633, 669, 'k69', 4.75), (10634, 2586, 'k82', 5.0), (10635, 1502, 'k95', 5.25), (10636, 418, 'k108', 5.5), (10637, 2335, 'k121', 5.75), (10638, 1251, 'k134', 6.0), (10639, 167, 'k147', 6.25), (10640, 2084, 'k3', 6.5), (10641, 1000, 'k16', 6.75), (10642, 2917, 'k29', 7.0), (10643, 1833, 'k42', 0.0), (10644, 749, 'k55', 0.25), (10645, 2666, 'k68', 0.5), (10646, 1582, 'k81', 0.75), (10647, 498, 'k94', 1.0), (10648, 2415, 'k107', 1.25), (10649, 1331, 'k120', 1.5), (10650, 247, 'k133', 1.75), (10651, 2164, 'k146', 2.0), (10652, 1080, 'k2', 2.25), (10653, 2997, 'k15', 2.5), (10654, 1913, 'k28', 2.75), (10655, 829, 'k41', 3.0), (10656, 2746, 'k54', 3.25), (10657, 1662, 'k67', 3.5), (10658, 578, 'k80', 3.75), (10659, 2495, 'k93', 4.0), (10660, 1411, 'k106', 4.25), (10661, 327, 'k119', 4.5), (10662, 2244, 'k132', 4.75), (10663, 1160, 'k145', 5.0), (10664, 76, 'k1', 5.25), (10665, 1993, 'k14', 5.5), (10666, 909, 'k27', 5.75), (10667, 2826, 'k40', 6.0), (10668, 1742, 'k53', 6.25), (10669, 658, 'k66', 6.5), (10670, 2575, 'k79', 6.75), (10671, 1491, 'k92', 7.0), (10672, 407, 'k105', 0.0), (10673, 2324, 'k118', 0.25), (10674, 1240, 'k131', 0.5), (10675, 156, 'k144', 0.75), (10676, 2073, 'k0', 1.0), (10677, 989, 'k13', 1.25), (10678, 2906, 'k26', 1.5), (10679, 1822, 'k39', 1.75), (10680, 738, 'k52', 2.0), (10681, 2655, 'k65', 2.25), (10682, 1571, 'k78', 2.5), (10683, 487, 'k91', 2.75), (10684, 2404, 'k104', 3.0), (10685, 1320, 'k117', 3.25), (10686, 236, 'k130', 3.5), (10687, 2153, 'k143', 3.75), (10688, 1069, 'k156', 4.0), (10689, 2986, 'k12', 4.25), (10690, 1902, 'k25', 4.5), (10691, 818, 'k38', 4.75), (10692, 2735, 'k51', 5.0), (10693, 1651, 'k64', 5.25), (10694, 567, 'k77', 5.5), (10695, 2484, 'k90', 5.75), (10696, 1400, 'k103', 6.0), (10697, 316, 'k116', 6.25), (10698, 2233, 'k129', 6.5), (10699, 1149, 'k142', 6.75), (10700, 65, 'k155', 7.0), (10701, 1982, 'k11', 0.0), (10702, 898, 'k24', 0.25), (10703, 2815, 'k37', 0.5), (10704, 1731, 'k50', 0.75), (10705, 647, 'k63', 1.0), (10706, 2564, 'k76', 1.25), (10707, 1480, 'k89', 1.5), (10708, 396, 'k102', 1.75), (10709, 2313, 'k115', 2.0), (10710, 1229, 'k128', 2.25), (10711, 145, 'k141', 2.5), (10712, 2062, 'k154', 2.75), (10713, 978, 'k10', 3.0), (10714, 2895, 'k23', 3.25), (10715, 1811, 'k36', 3.5), (10716, 727, 'k49', 3.75), (10717, 2644, 'k62', 4.0), (10718, 1560, 'k75', 4.25), (10719, 476, 'k88', 4.5), (10720, 2393, 'k101', 4.75), (10721, 1309, 'k114', 5.0), (10722, 225, 'k127', 5.25), (10723, 2142, 'k140', 5.5), (10724, 1058, 'k153', 5.75), (10725, 2975, 'k9', 6.0), (10726, 1891, 'k22', 6.25), (10727, 807, 'k35', 6.5), (10728, 2724, 'k48', 6.75), (10729, 1640, 'k61', 7.0), (10730, 556, 'k74', 0.0), (10731, 2473, 'k87', 0.25), (10732, 1389, 'k100', 0.5), (10733, 305, 'k113', 0.75), (10734, 2222, 'k126', 1.0), (10735, 1138, 'k139', 1.25), (10736, 54, 'k152', 1.5), (10737, 1971, 'k8', 1.75), (10738, 887, 'k21', 2.0), (10739, 2804, 'k34', 2.25), (10740, 1720, 'k47', 2.5), (10741, 636, 'k60', 2.75), (10742, 2553, 'k73', 3.0), (10743, 1469, 'k86', 3.25), (10744, 385, 'k99', 3.5), (10745, 2302, 'k112', 3.75), (10746, 1218, 'k125', 4.0), (10747, 134, 'k138', 4.25), (10748, 2051, 'k151', 4.5), (10749, 967, 'k7', 4.75), (10750, 2884, 'k20', 5.0), (10751, 1800, 'k33', 5.25), (10752, 716, 'k46', 5.5), (10753, 2633, 'k59', 5.75), (10754, 1549, 'k72', 6.0), (10755, 465, 'k85', 6.25), (10756, 2382, 'k98', 6.5), (10757, 1298, 'k111', 6.75), (10758, 214, 'k124', 7.0), (10759, 2131, 'k137', 0.0), (10760, 1047, 'k150', 0.25), (10761, 2964, 'k6', 0.5), (10762, 1880, 'k19', 0.75), (10763, 796, 'k32', 1.0), (10764, 2713, 'k45', 1.25), (10765, 1629, 'k58', 1.5), (10766, 545, 'k71', 1.75), (10767, 2462, 'k84', 2.0), (10768, 1378, 'k97', 2.25), (10769, 294, 'k110', 2.5), (10770, 2211, 'k123', 2.75), (10771, 1127, 'k136', 3.0), (10772, 43, 'k149', 3.25), (10773, 1960, 'k5', 3.5), (10774, 876, 'k18', 3.75), (10775, 2793, 'k31', 4.0), (10776, 1709, 'k44', 4.25), (10777, 625, 'k57', 4.5), (10778, 2542, 'k70', 4.75), (10779, 1458, 'k83', 5.0), (10780, 374, 'k96', 5.25), (10781, 2291, 'k109', 5.5), (10782, 1207, 'k122', 5.75), (10783, 123, 'k135', 6.0), (10784, 2040, 'k148', 6.25), (10785, 956, 'k4', 6.5), (10786, 2873, 'k17', 6.75), (10787, 1789, 'k30', 7.0), (10788, 705, 'k43', 0.0), (10789, 2622, 'k56', 0.25), (10790, 1538, 'k69', 0.5), (10791, 454, 'k82', 0.75), (10792, 2371, 'k95', 1.0), (10793, 1287, 'k108', 1.25), (10794, 203, 'k121', 1.5), (10795, 2120, 'k134', 1.75), (10796, 1036, 'k147', 2.0), (10797, 2953, 'k3', 2.25), (10798, 1869, 'k16', 2.5), (10799, 785, 'k29', 2.75), (10800, 2702, 'k42', 3.0), (10801, 1618, 'k55', 3.25), (10802, 534, 'k68', 3.5), (10803, 2451, 'k81', 3.75), (10804, 1367, 'k94', 4.0), (10805, 283, 'k107', 4.25), (10806, 2200, 'k120', 4.5), (10807, 1116, 'k133', 4.75), (10808, 32, 'k146', 5.0), (10809, 1949, 'k2', 5.25), (10810, 865, 'k15', 5.5), (10811, 2782, 'k28', 5.75), (10812, 1698, 'k41', 6.0), (10813, 614, 'k54', 6.25), (10814, 2531, 'k67', 6.5), (10815, 1447, 'k80', 6.75), (10816, 363, 'k93', 7.0), (10817, 2280, 'k106', 0.0), (10818, 1196, 'k119', 0.25), (10819, 112, 'k132', 0.5), (10820, 2029, 'k145', 0.75), (10821, 945, 'k1', 1.0), (10822, 2862, 'k14', 1.25), (10823, 1778, 'k27', 1.5), (10824, 694, 'k40', 1.75), (10825, 2611, 'k53', 2.0), (10826, 1527, 'k66', 2.25), (10827, 443, 'k79', 2.5), (10828, 2360, 'k92', 2.75), (10829, 1276, 'k105', 3.0), (10830, 192, 'k118', 3.25), (10831, 2109, 'k131', 3.5), (10832, 1025, 'k144', 3.75), (10833, 2942, 'k0', 4.0), (10834, 1858, 'k13', 4.25), (10835, 774, 'k26', 4.5), (10836, 2691, 'k39', 4.75), (10837, 1607, 'k52', 5.0), (10838, 523, 'k65', 5.25), (10839, 2440, 'k78', 5.5), (10840, 1356, 'k91', 5.75), (10841, 272, 'k104', 6.0), (10842, 2189, 'k117', 6.25), (10843, 1105, 'k130', 6.5), (10844, 21, 'k143', 6.75), (10845, 1938, 'k156', 7.0), (10846, 854, 'k12', 0.0), (10847, 2771, 'k25', 0.25), (10848, 1687, 'k38', 0.5), (10849, 603, 'k51', 0.75), (10850, 2520, 'k64', 1.0), (10851, 1436, 'k77', 1.25), (10852, 352, 'k90', 1.5), (10853, 2269, 'k103', 1.75), (10854, 1185, 'k116', 2.0), (10855, 101, 'k129', 2.25), (10856, 2018, 'k142', 2.5), (10857, 934, 'k155', 2.75), (10858, 2851, 'k11', 3.0), (10859, 1767, 'k24', 3.25), (10860, 683, 'k37', 3.5), (10861, 2600, 'k50', 3.75), (10862, 1516, 'k63', 4.0), (10863, 432, 'k76', 4.25), (10864, 2349, 'k89', 4.5), (10865, 1265, 'k102', 4.75), (10866, 181, 'k115', 5.0), (10867, 2098, 'k128', 5.25), (10868, 1014, 'k141', 5.5), (10869, 2931, 'k154', 5.75), (10870, 1847, 'k10', 6.0), (10871, 763, 'k23', 6.25), (10872, 2680, 'k36', 6.5), (10873, 1596, 'k49', 6.75), (10874, 512, 'k62', 7.0), (10875, 2429, 'k75', 0.0), (10876, 1345, 'k88', 0.25), (10877, 261, 'k101', 0.5), (10878, 2178, 'k114', 0.75), (10879, 1094, 'k127', 1.0), (10880, 10, 'k140', 1.25), (10881, 1927, 'k153', 1.5), (10882, 843, 'k9', 1.75), (10883, 2760, 'k22', 2.0), (10884, 1676, 'k35', 2.25), (10885, 592, 'k48', 2.5), (10886, 2509, 'k61', 2.75), (10887, 1425, 'k74', 3.0), (10888, 341, 'k87', 3.25), (10889, 2258, 'k100', 3.5), (10890, 1174, 'k113', 3.75), (10891, 90, 'k126', 4.0), (10892, 2007, 'k139', 4.25), (10893, 923, 'k152', 4.5), (10894, 2840, 'k8', 4.75), (10895, 1756, 'k21', 5.0), (10896, 672, 'k34', 5.25), (10897, 2589, 'k47', 5.5), (10898, 1505, 'k60', 5.75), (10899, 421, 'k73', 6.0), (10900, 2338, 'k86', 6.25), (10901, 1254, 'k99', 6.5), (10902, 170, 'k112', 6.75), (10903, 2087, 'k125', 7.0), (10904, 1003, 'k138', 0.0), (10905, 2920, 'k151', 0.25), (10906, 1836, 'k7', 0.5), (10907, 752, 'k20', 0.75), (10908, 2669, 'k33', 1.0), (10909, 1585, 'k46', 1.25), (10910, 501, 'k59', 1.5), (10911, 2418, 'k72', 1.75), (10912, 1334, 'k85', 2.0), (10913, 250, 'k98', 2.25), (10914, 2167, 'k111', 2.5), (10915, 1083, 'k124', 2.75), (10916, 3000, 'k137', 3.0), (10917, 1916, 'k150', 3.25), (10918, 832, 'k6', 3.5), (10919, 2749, 'k19', 3.75), (10920, 1665, 'k32', 4.0), (10921, 581, 'k45', 4.25), (10922, 2498, 'k58', 4.5), (10923, 1414, 'k71', 4.75), (10924, 330, 'k84', 5.0), (10925, 2247, 'k97', 5.25), (10926, 1163, 'k110', 5.5), (10927, 79, 'k123', 5.75), (10928, 1996, 'k136', 6.0), (10929, 912, 'k149', 6.25), (10930, 2829, 'k5', 6.5), (10931, 1745, 'k18', 6.75), (10932, 661, 'k31', 7.0), (10933, 2578, 'k44', 0.0), (10934, 1494, 'k57', 0.25), (10935, 410, 'k70', 0.5), (10936, 2327, 'k83', 0.75), (10937, 1243, 'k96', 1.0), (10938, 159, 'k109', 1.25), (10939, 2076, 'k122', 1.5), (10940, 992, 'k135', 1.75), (10941, 2909, 'k148', 2.0), (10942, 1825, 'k4', 2.25), (10943, 741, 'k17', 2.5), (10944, 2658, 'k30', 2.75), (10945, 1574, 'k43', 3.0), (10946, 490, 'k56', 3.25), (10947, 2407, 'k69', 3.5), (10948, 1323, 'k82', 3.75), (10949, 239, 'k95', 4.0), (10950, 2156, 'k108', 4.25), (10951, 1072, 'k121', 4.5), (10952, 2989, 'k134', 4.75), (10953, 1905, 'k147', 5.0), (10954, 821, 'k3', 5.25), (10955, 2738, 'k16', 5.5), (10956, 1654, 'k29', 5.75), (10957, 570, 'k42', 6.0), (10958, 2487, 'k55', 6.25), (10959, 1403, 'k68', 6.5), (10960, 319, 'k81', 6.75), (10961, 2236, 'k94', 7.0), (10962, 1152, 'k107', 0.0), (10963, 68, 'k120', 0.25), (10964, 1985, 'k133', 0.5), (10965, 901, 'k146', 0.75), (10966, 2818, 'k2', 1.0), (10967, 1734, 'k15', 1.25), (10968, 650, 'k28', 1.5), (10969, 2567, 'k41', 1.75), (10970, 1483, 'k54', 2.0), (10971, 399, 'k67', 2.25), (10972, 2316, 'k80', 2.5), (10973, 1232, 'k93', 2.75), (10974, 148, 'k106', 3.0), (10975, 2065, 'k119', 3.25), (10976, 981, 'k132', 3.5), (10977, 2898, 'k145', 3.75), (10978, 1814, 'k1', 4.0), (10979, 730, 'k14', 4.25), (10980, 2647, 'k27', 4.5), (10981, 1563, 'k40', 4.75), (10982, 479, 'k53', 5.0), (10983, 2396, 'k66', 5.25), (10984, 1312, 'k79', 5.5), (10985, 228, 'k92', 5.75), (10986, 2145, 'k105', 6.0), (10987, 1061, 'k118', 6.25), (10988, 2978, 'k131', 6.5), (10989, 1894, 'k144', 6.75), (10990, 810, 'k0', 7.0), (10991, 2727, 'k13', 0.0), (10992, 1643, 'k26', 0.25), (10993, 559, 'k39', 0.5), (10994, 2476, 'k52', 0.75), (10995, 1392, 'k65', 1.0), (10996, 308, 'k78', 1.25), (10997, 2225, 'k91', 1.5), (10998, 1141, 'k104', 1.75), (10999, 57, 'k117', 2.0), (11000, 1974, 'k130', 2.25), (11001, 890, 'k143', 2.5), (11002, 2807, 'k156', 2.75), (11003, 1723, 'k12', 3.0), (11004, 639, 'k25', 3.25), (11005, 2556, 'k38', 3.5), (11006, 1472, 'k51', 3.75), (11007, 388, 'k64', 4.0), (11008, 2305, 'k77', 4.25), (11009, 1221, 'k90', 4.5), (11010, 137, 'k103', 4.75), (11011, 2054, 'k116', 5.0), (11012, 970, 'k129', 5.25), (11013, 2887, 'k142', 5.5), (11014, 1803, 'k155', 5.75), (11015, 719, 'k11', 6.0), (11016, 2636, 'k24', 6.25), (11017, 1552, 'k37', 6.5), (11018, 468, 'k50', 6.75), (11019, 2385, 'k63', 7.0), (11020, 1301, 'k76', 0.0), (11021, 217, 'k89', 0.25), (11022, 2134, 'k102', 0.5), (11023, 1050, 'k115', 0.75), (11024, 2967, 'k128', 1.0), (11025, 1883, 'k141', 1.25), (11026, 799, 'k154', 1.5), (11027, 2716, 'k10', 1.75), (11028, 1632, 'k23', 2.0), (11029, 548, 'k36', 2.25), (11030, 2465, 'k49', 2.5), (11031, 1381, 'k62', 2.75), (11032, 297, 'k75', 3.0), (11033, 2214, 'k88', 3.25), (11034, 1130, 'k101', 3.5), (11035, 46, 'k114', 3.75), (11036, 1963, 'k127', 4.0), (11037, 879, 'k140', 4.25), (11038, 2796, 'k153', 4.5), (11039, 1712, 'k9', 4.75), (11040, 628, 'k22', 5.0), (11041, 2545, 'k35', 5.25), (11042, 1461, 'k48', 5.5), (11043, 377, 'k61', 5.75), (11044, 2294, 'k74', 6.0), (11045, 1210, 'k87', 6.25), (11046, 126, 'k100', 6.5), (11047, 2043, 'k113', 6.75), (11048, 959, 'k126', 7.0), (11049, 2876, 'k139', 0.0), (11050, 1792, 'k152', 0.25), (11051, 708, 'k8', 0.5), (11052, 2625, 'k21', 0.75), (11053, 1541, 'k34', 1.0), (11054, 457, 'k47', 1.25), (11055, 2374, 'k60', 1.5), (11056, 1290, 'k73', 1.75), (11057, 206, 'k86', 2.0), (11058, 2123, 'k99', 2.25), (11059, 1039, 'k112', 2.5), (11060, 2956, 'k125', 2.75), (11061, 1872, 'k138', 3.0), (11062, 788, 'k151', 3.25), (11063, 2705, 'k7', 3.5), (11064, 1621, 'k20', 3.75), (11065, 537, 'k33', 4.0), (11066, 2454, 'k46', 4.25), (11067, 1370, 'k59', 4.5), (11068, 286, 'k72', 4.75), (11069, 2203, 'k85', 5.0), (11070, 1119, 'k98', 5.25), (11071, 35, 'k111', 5.5), (11072, 1952, 'k124', 5.75), (11073, 868, 'k137', 6.0), (11074, 2785, 'k150', 6.25), (11075, 1701, 'k6', 6.5), (11076, 617, 'k19', 6.75), (11077, 2534, 'k32', 7.0), (11078, 1450, 'k45', 0.0), (11079, 366, 'k58', 0.25), (11080, 2283, 'k71', 0.5), (11081, 1199, 'k84', 0.75), (11082, 115, 'k97', 1.0), (11083, 2032, 'k110', 1.25), (11084, 948, 'k123', 1.5), (11085, 2865, 'k136', 1.75), (11086, 1781, 'k149', 2.0), (11087, 697, 'k5', 2.25), (11088, 2614, 'k18', 2.5), (11089, 1530, 'k31', 2.75), (11090, 446, 'k44', 3.0), (11091, 2363, 'k57', 3.25), (11092, 1279, 'k70', 3.5), (11093, 195, 'k83', 3.75), (11094, 2112, 'k96', 4.0), (11095, 1028, 'k109', 4.25), (11096, 2945, 'k122', 4.5), (11097, 1861, 'k135', 4.75), (11098, 777, 'k148', 5.0), (11099, 2694, 'k4', 5.25), (11100, 1610, 'k17', 5.5), (11101, 526, 'k30', 5.75), (11102, 2443, 'k43', 6.0), (11103, 1359, 'k56', 6.25), (11104, 275, 'k69', 6.5), (11105, 2192, 'k82', 6.75), (11106, 1108, 'k95', 7.0), (11107, 24, 'k108', 0.0), (11108, 1941, 'k121', 0.25), (11109, 857, 'k134', 0.5), (11110, 2774, 'k147', 0.75), (11111, 1690, 'k3', 1.0), (11112, 606, 'k16', 1.25), (11113, 2523, 'k29', 1.5), (11114, 1439, 'k42', 1.75), (11115, 355, 'k55', 2.0), (11116, 2272, 'k68', 2.25), (11117, 1188, 'k81', 2.5), (11118, 104, 'k94', 2.75), (11119, 2021, 'k107', 3.0), (11120, 937, 'k120', 3.25), (11121, 2854, 'k133', 3.5), (11122, 1770, 'k146', 3.75), (11123, 686, 'k2', 4.0), (11124, 2603, 'k15', 4.25), (11125, 1519, 'k28', 4.5), (11126, 435, 'k41', 4.75), (11127, 2352, 'k54', 5.0), (11128, 1268, 'k67', 5.25), (11129, 184, 'k80', 5.5), (11130, 2101, 'k93', 5.75), (11131, 1017, 'k106', 6.0), (11132, 2934, 'k119', 6.25), (11133, 1850, 'k132', 6.5), (11134, 766, 'k145', 6.75), (11135, 2683, 'k1', 7.0), (11136, 1599, 'k14', 0.0), (11137, 515, 'k27', 0.25), (11138, 2432, 'k40', 0.5), (11139, 1348, 'k53', 0.75), (11140, 264, 'k66', 1.0), (11141, 2181, 'k79', 1.25), (11142, 1097, 'k92', 1.5), (11143, 13, 'k105', 1.75), (11144, 1930, 'k118', 2.0), (11145, 846, 'k131', 2.25), (11146, 2763, 'k144', 2.5), (11147, 1679, 'k0', 2.75), (11148, 595, 'k13', 3.0), (11149, 2512, 'k26', 3.25), (11150, 1428, 'k39', 3.5), (11151, 344, 'k52', 3.75), (11152, 2261, 'k65', 4.0), (11153, 1177, 'k78', 4.25), (11154, 93, 'k91', 4.5), (11155, 2010, 'k104', 4.75), (11156, 926, 'k117', 5.0), (11157, 2843, 'k130', 5.25), (11158, 1759, 'k143', 5.5), (11159, 675, 'k156', 5.75), (11160, 2592, 'k12', 6.0), (11161, 1508, 'k25', 6.25), (11162, 424, 'k38', 6.5), (11163, 2341, 'k51', 6.75), (11164, 1257, 'k64', 7.0), (11165, 173, 'k77', 0.0), (11166, 2090, 'k90', 0.25), (11167, 1006, 'k103', 0.5), (11168, 2923, 'k116', 0.75), (11169, 1839, 'k129', 1.0), (11170, 755, 'k142', 1.25), (11171, 2672, 'k155', 1.5), (11172, 1588, 'k11', 1.75), (11173, 504, 'k24', 2.0), (11174, 2421, 'k37', 2.25), (11175, 1337, 'k50', 2.5), (11176, 253, 'k63', 2.75), (11177, 2170, 'k76', 3.0), (11178, 1086, 'k89', 3.25), (11179, 2, 'k102', 3.5), (11180, 1919, 'k115', 3.75), (11181, 835, 'k128', 4.0), (11182, 2752, 'k141', 4.25), (11183, 1668, 'k154', 4.5), (11184, 584, 'k10', 4.75), (11185, 2501, 'k23', 5.0), (11186, 1417, 'k36', 5.25), (11187, 333, 'k49', 5.5), (11188, 2250, 'k62', 5.75), (11189, 1166, 'k75', 6.0), (11190, 82, 'k88', 6.25), (11191, 1999, 'k101', 6.5), (11192, 915, 'k114', 6.75), (11193, 2832, 'k127', 7.0), (11194, 1748, 'k140', 0.0), (11195, 664, 'k153', 0.25), (11196, 2581, 'k9', 0.5), (11197, 1497, 'k22', 0.75), (11198, 413, 'k35', 1.0), (11199, 2330, 'k48', 1.25), (11200, 1246, 'k61', 1.5), (11201, 162, 'k74', 1.75), (11202, 2079, 'k87', 2.0), (11203, 995, 'k100', 2.25), (11204, 2912, 'k113', 2.5), (11205, 1828, 'k126', 2.75), (11206, 744, 'k139', 3.0), (11207, 2661, 'k152', 3.25), (11208, 1577, 'k8', 3.5), (11209, 493, 'k21', 3.75), (11210, 2410, 'k34', 4.0), (11211, 1326, 'k47', 4.25), (11212, 242, 'k60', 4.5), (11213, 2159, 'k73', 4.75), (11214, 1075, 'k86', 5.0), (11215, 2992, 'k99', 5.25), (11216, 1908, 'k112', 5.5), (11217, 824, 'k125', 5.75), (11218, 2741, 'k138', 6.0), (11219, 1657, 'k151', 6.25), (11220, 573, 'k7', 6.5), (11221, 2490, 'k20', 6.75), (11222, 1406, 'k33', 7.0), (11223, 322, 'k46', 0.0), (11224, 2239, 'k59', 0.25), (11225, 1155, 'k72', 0.5), (11226, 71, 'k85', 0.75), (11227, 1988, 'k98', 1.0), (11228, 904, 'k111', 1.25), (11229, 2821, 'k124', 1.5), (11230, 1737, 'k137', 1.75), (11231, 653, 'k150', 2.0), (11232, 2570, 'k6', 2.25), (11233, 1486, 'k19', 2.5), (11234, 402, 'k32', 2.75), (11235, 2319, 'k45', 3.0), (11236, 1235, 'k58', 3.25), (11237, 151, 'k71', 3.5), (11238, 2068, 'k84', 3.75), (11239, 984, 'k97', 4.0), (11240, 2901, 'k110', 4.25), (11241, 1817, 'k123', 4.5), (11242, 733, 'k136', 4.75), (11243, 2650, 'k149', 5.0), (11244, 1566, 'k5', 5.25), (11245, 482, 'k18', 5.5), (11246, 2399, 'k31', 5.75), (11247, 1315, 'k44', 6.0), (11248, 231, 'k57', 6.25), (11249, 2148, 'k70', 6.5), (11250, 1064, 'k83', 6.75), (11251, 2981, 'k96', 7.0), (11252, 1897, 'k109', 0.0), (11253, 813, 'k122', 0.25), (11254, 2730, 'k135', 0.5), (11255, 1646, 'k148', 0.75), (11256, 562, 'k4', 1.0), (11257, 2479, 'k17', 1.25), (11258, 1395, 'k30', 1.5), (11259, 311, 'k43', 1.75), (11260, 2228, 'k56', 2.0), (11261, 1144, 'k69', 2.25), (11262, 60, 'k82', 2.5), (11263, 1977, 'k95', 2.75), (11264, 893, 'k108', 3.0), (11265, 2810, 'k121', 3.25), (11266, 1726, 'k134', 3.5), (11267, 642, 'k147', 3.75), (11268, 2559, 'k3', 4.0), (11269, 1475, 'k16', 4.25), (11270, 391, 'k29', 4.5), (11271, 2308, 'k42', 4.75), (11272, 1224, 'k55', 5.0), (11273, 140, 'k68', 5.25), (11274, 2057, 'k81', 5.5), (11275, 973, 'k94', 5.75), (11276, 2890, 'k107', 6.0), (11277, 1806, 'k120', 6.25), (11278, 722, 'k133', 6.5), (11279, 2639, 'k146', 6.75), (11280, 1555, 'k2', 7.0), (11281, 471, 'k15', 0.0), (11282, 2388, 'k28', 0.25), (11283, 1304, 'k41', 0.5), (11284, 220, 'k54', 0.75), (11285, 2137, 'k67', 1.0), (11286, 1053, 'k80', 1.25), (11287, 2970, 'k93', 1.5), (11288, 1886, 'k106', 1.75), (11289, 802, 'k119', 2.0), (11290, 2719, 'k132', 2.25), (11291, 1635, 'k145', 2.5), (11292, 551, 'k1', 2.75), (11293, 2468, 'k14', 3.0), (11294, 1384, 'k27', 3.25), (11295, 300, 'k40', 3.5), (11296, 2217, 'k53', 3.75), (11297, 1133, 'k66', 4.0), (11298, 49, 'k79', 4.25), (11299, 1966, 'k92', 4.5), (11300, 882, 'k105', 4.75), (11301, 2799, 'k118', 5.0), (11302, 1715, 'k131', 5.25), (11303, 631, 'k144', 5.5), (11304, 2548, 'k0', 5.75), (11305, 1464, 'k13', 6.0), (11306, 380, 'k26', 6.25), (11307, 2297, 'k39', 6.5), (11308, 1213, 'k52', 6.75), (11309, 129, 'k65', 7.0), (11310, 2046, 'k78', 0.0), (11311, 962, 'k91', 0.25), (11312, 2879, 'k104', 0.5), (11313, 1795, 'k117', 0.75), (11314, 711, 'k130', 1.0), (11315, 2628, 'k143', 1.25), (11316, 1544, 'k156', 1.5), (11317, 460, 'k12', 1.75), (11318, 2377, 'k25', 2.0), (11319, 1293, 'k38', 2.25), (11320, 209, 'k51', 2.5), (11321, 2126, 'k64', 2.75), (11322, 1042, 'k77', 3.0), (11323, 2959, 'k90', 3.25), (11324, 1875, 'k103', 3.5), (11325, 791, 'k116', 3.75), (11326, 2708, 'k129', 4.0), (11327, 1624, 'k142', 4.25), (11328, 540, 'k155', 4.5), (11329, 2457, 'k11', 4.75), (11330, 1373, 'k24', 5.0), (11331, 289, 'k37', 5.25), (11332, 2206, 'k50', 5.5), (11333, 1122, 'k63', 5.75), (11334, 38, 'k76', 6.0), (11335, 1955, 'k89', 6.25), (11336, 871, 'k102', 6.5), (11337, 2788, 'k115', 6.75), (11338, 1704, 'k128', 7.0), (11339, 620, 'k141', 0.0), (11340, 2537, 'k154', 0.25), (11341, 1453, 'k10', 0.5), (11342, 369, 'k23', 0.75), (11343, 2286, 'k36', 1.0), (11344, 1202, 'k49', 1.25), (11345, 118, 'k62', 1.5), (11346, 2035, 'k75', 1.75), (11347, 951, 'k88', 2.0), (11348, 2868, 'k101', 2.25), (11349, 1784, 'k114', 2.5), (11350, 700, 'k127', 2.75), (11351, 2617, 'k140', 3.0), (11352, 1533, 'k153', 3.25), (11353, 449, 'k9', 3.5), (11354, 2366, 'k22', 3.75), (11355, 1282, 'k35', 4.0), (11356, 198, 'k48', 4.25), (11357, 2115, 'k61', 4.5), (11358, 1031, 'k74', 4.75), (11359, 2948, 'k87', 5.0), (11360, 1864, 'k100', 5.25), (11361, 780, 'k113', 5.5), (11362, 2697, 'k126', 5.75), (11363, 1613, 'k139', 6.0), (11364, 529, 'k152', 6.25), (11365, 2446, 'k8', 6.5), (11366, 1362, 'k21', 6.75), (11367, 278, 'k34', 7.0), (11368, 2195, 'k47', 0.0), (11369, 1111, 'k60', 0.25), (11370, 27, 'k73', 0.5), (11371, 1944, 'k86', 0.75), (11372, 860, 'k99', 1.0), (11373, 2777, 'k112', 1.25), (11374, 1693, 'k125', 1.5), (11375, 609, 'k138', 1.75), (11376, 2526, 'k151', 2.0), (11377, 1442, 'k7', 2.25), (11378, 358, 'k20', 2.5), (11379, 2275, 'k33', 2.75), (11380, 1191, 'k46', 3.0), (11381, 107, 'k59', 3.25), (11382, 2024, 'k72', 3.5), (11383, 940, 'k85', 3.75), (11384, 2857, 'k98', 4.0), (11385, 1773, 'k111', 4.25), (11386, 689, 'k124', 4.5), (11387, 2606, 'k137', 4.75), (11388, 1522, 'k150', 5.0), (11389, 438, 'k6', 5.25), (11390, 2355, 'k19', 5.5), (11391, 1271, 'k32', 5.75), (11392, 187, 'k45', 6.0), (11393, 2104, 'k58', 6.25), (11394, 1020, 'k71', 6.5), (11395, 2937, 'k84', 6.75), (11396, 1853, 'k97', 7.0), (11397, 769, 'k110', 0.0), (11398, 2686, 'k123', 0.25), (11399, 1602, 'k136', 0.5), (11400, 518, 'k149', 0.75), (11401, 2435, 'k5', 1.0), (11402, 1351, 'k18', 1.25), (11403, 267, 'k31', 1.5), (11404, 2184, 'k44', 1.75), (11405, 1100, 'k57', 2.0), (11406, 16, 'k70', 2.25), (11407, 1933, 'k83', 2.5), (11408, 849, 'k96', 2.75), (11409, 2766, 'k109', 3.0), (11410, 1682, 'k122', 3.25), (11411, 598, 'k135', 3.5), (11412, 2515, 'k148', 3.75), (11413, 1431, 'k4', 4.0), (11414, 347, 'k17', 4.25), (11415, 2264, 'k30', 4.5), (11416, 1180, 'k43', 4.75), (11417, 96, 'k56', 5.0), (11418, 2013, 'k69', 5.25), (11419, 929, 'k82', 5.5), (11420, 2846, 'k95', 5.75), (11421, 1762, 'k108', 6.0), (11422, 678, 'k121', 6.25), (11423, 2595, 'k134', 6.5), (11424, 1511, 'k147', 6.75), (11425, 427, 'k3', 7.0), (11426, 2344, 'k16', 0.0), (11427, 1260, 'k29', 0.25), (11428, 176, 'k42', 0.5), (11429, 2093, 'k55', 0.75), (11430, 1009, 'k68', 1.0), (11431, 2926, 'k81', 1.25), (11432, 1842, 'k94', 1.5), (11433, 758, 'k107', 1.75), (11434, 2675, 'k120', 2.0), (11435, 1591, 'k133', 2.25), (11436, 507, 'k146', 2.5), (11437, 2424, 'k2', 2.75), (11438, 1340, 'k15', 3.0), (11439, 256, 'k28', 3.25), (11440, 2173, 'k41', 3.5), (11441, 1089, 'k54', 3.75), (11442, 5, 'k67', 4.0), (11443, 1922, 'k80', 4.25), (11444, 838, 'k93', 4.5), (11445, 2755, 'k106', 4.75), (11446, 1671, 'k119', 5.0), (11447, 587, 'k132', 5.25), (11448, 2504, 'k145', 5.5), (11449, 1420, 'k1', 5.75), (11450, 336, 'k14', 6.0), (11451, 2253, 'k27', 6.25), (11452, 1169, 'k40', 6.5), (11453, 85, 'k53', 6.75), (11454, 2002, 'k66', 7.0), (11455, 918, 'k79', 0.0), (11456, 2835, 'k92', 0.25), (11457, 1751, 'k105', 0.5), (11458, 667, 'k118', 0.75), (11459, 2584, 'k131', 1.0), (11460, 1500, 'k144', 1.25), (11461, 416, 'k0', 1.5), (11462, 2333, 'k13', 1.75), (11463, 1249, 'k26', 2.0), (11464, 165, 'k39', 2.25), (11465, 2082, 'k52', 2.5), (11466, 998, 'k65', 2.75), (11467, 2915, 'k78', 3.0), (11468, 1831, 'k91', 3.25), (11469, 747, 'k104', 3.5), (11470, 2664, 'k117', 3.75), (11471, 1580, 'k130', 4.0), (11472, 496, 'k143', 4.25), (11473, 2413, 'k156', 4.5), (11474, 1329, 'k12', 4.75), (11475, 245, 'k25', 5.0), (11476, 2162, 'k38', 5.25), (11477, 1078, 'k51', 5.5), (11478, 2995, 'k64', 5.75), (11479, 1911, 'k77', 6.0), (11480, 827, 'k90', 6.25), (11481, 2744, 'k103', 6.5), (11482, 1660, 'k116', 6.75), (11483, 576, 'k129', 7.0), (11484, 2493, 'k142', 0.0), (11485, 1409, 'k155', 0.25), (11486, 325, 'k11', 0.5), (11487, 2242, 'k24', 0.75), (11488, 1158, 'k37', 1.0), (11489, 74, 'k50', 1.25), (11490, 1991, 'k63', 1.5), (11491, 907, 'k76', 1.75), (11492, 2824, 'k89', 2.0), (11493, 1740, 'k102', 2.25), (11494, 656, 'k115', 2.5), (11495, 2573, 'k128', 2.75), (11496, 1489, 'k141', 3.0), (11497, 405, 'k154', 3.25), (11498, 2322, 'k10', 3.5), (11499, 1238, 'k23', 3.75), (11500, 154, 'k36', 4.0), (11501, 2071, 'k49', 4.25), (11502, 987, 'k62', 4.5), (11503, 2904, 'k75', 4.75), (11504, 1820, 'k88', 5.0), (11505, 736, 'k101', 5.25), (11506, 2653, 'k114', 5.5), (11507, 1569, 'k127', 5.75), (11508, 485, 'k140', 6.0), (11509, 2402, 'k153', 6.25), (11510, 1318, 'k9', 6.5), (11511, 234, 'k22', 6.75), (11512, 2151, 'k35', 7.0), (11513, 1067, 'k48', 0.0), (11514, 2984, 'k61', 0.25), (11515, 1900, 'k74', 0.5), (11516, 816, 'k87', 0.75), (11517, 2733, 'k100', 1.0), (11518, 1649, 'k113', 1.25), (11519, 565, 'k126', 1.5), (11520, 2482, 'k139', 1.75), (11521, 1398, 'k152', 2.0), (11522, 314, 'k8', 2.25), (11523, 2231, 'k21', 2.5), (11524, 1147, 'k34', 2.75), (11525, 63, 'k47', 3.0), (11526, 1980, 'k60', 3.25), (11527, 896, 'k73', 3.5), (11528, 2813, 'k86', 3.75), (11529, 1729, 'k99', 4.0), (11530, 645, 'k112', 4.25), (11531, 2562, 'k125', 4.5), (11532, 1478, 'k138', 4.75), (11533, 394, 'k151', 5.0), (11534, 2311, 'k7', 5.25), (11535, 1227, 'k20', 5.5), (11536, 143, 'k33', 5.75), (11537, 2060, 'k46', 6.0), (11538, 976, 'k59', 6.25), (11539, 2893, 'k72', 6.5), (11540, 1809, 'k85', 6.75), (11541, 725, 'k98', 7.0), (11542, 2642, 'k111', 0.0), (11543, 1558, 'k124', 0.25), (11544, 474, 'k137', 0.5), (11545, 2391, 'k150', 0.75), (11546, 1307, 'k6', 1.0), (11547, 223, 'k19', 1.25), (11548, 2140, 'k32', 1.5), (11549, 1056, 'k45', 1.75), (11550, 2973, 'k58', 2.0), (11551, 1889, 'k71', 2.25), (11552, 805, 'k84', 2.5), (11553, 2722, 'k97', 2.75), (11554, 1638, 'k110', 3.0), (11555, 554, 'k123', 3.25), (11556, 2471, 'k136', 3.5), (11557, 1387, 'k149', 3.75), (11558, 303, 'k5', 4.0), (11559, 2220, 'k18', 4.25), (11560, 1136, 'k31', 4.5), (11561, 52, 'k44', 4.75), (11562, 1969, 'k57', 5.0), (11563, 885, 'k70', 5.25), (11564, 2802, 'k83', 5.5), (11565, 1718, 'k96', 5.75), (11566, 634, 'k109', 6.0), (11567, 2551, 'k122', 6.25), (11568, 1467, 'k135', 6.5), (11569, 383, 'k148', 6.75), (11570, 2300, 'k4', 7.0), (11571, 1216, 'k17', 0.0), (11572, 132, 'k30', 0.25), (11573, 2049, 'k43', 0.5), (11574, 965, 'k56', 0.75), (11575, 2882, 'k69', 1.0), (11576, 1798, 'k82', 1.25), (11577, 714, 'k95', 1.5), (11578, 2631, 'k108', 1.75), (11579, 1547, 'k121', 2.0), (11580, 463, 'k134', 2.25), (11581, 2380, 'k147', 2.5), (11582, 1296, 'k3', 2.75), (11583, 212, 'k16', 3.0), (11584, 2129, 'k29', 3.25), (11585, 1045, 'k42', 3.5), (11586, 2962, 'k55', 3.75), (11587, 1878, 'k68', 4.0), (11588, 794, 'k81', 4.25), (11589, 2711, 'k94', 4.5), (11590, 1627, 'k107', 4.75), (11591, 543, 'k120', 5.0), (11592, 2460, 'k133', 5.25), (11593, 1376, 'k146', 5.5), (11594, 292, 'k2', 5.75), (11595, 2209, 'k15', 6.0), (11596, 1125, 'k28', 6.25), (11597, 41, 'k41', 6.5), (11598, 1958, 'k54', 6.75), (11599, 874, 'k67', 7.0), (11600, 2791, 'k80', 0.0), (11601, 1707, 'k93', 0.25), (11602, 623, 'k106', 0.5), (11603, 2540, 'k119', 0.75), (11604, 1456, 'k132', 1.0), (11605, 372, 'k145', 1.25), (11606, 2289, 'k1', 1.5), (11607, 1205, 'k14', 1.75), (11608, 121, 'k27', 2.0), (11609, 2038, 'k40', 2.25), (11610, 954, 'k53', 2.5), (11611, 2871, 'k66', 2.75), (11612, 1787, 'k79', 3.0), (11613, 703, 'k92', 3.25), (11614, 2620, 'k105', 3.5), (11615, 1536, 'k118', 3.75), (11616, 452, 'k131', 4.0), (11617, 2369, 'k144', 4.25), (11618, 1285, 'k0', 4.5), (11619, 201, 'k13', 4.75), (11620, 2118, 'k26', 5.0), (11621, 1034, 'k39', 5.25), (11622, 2951, 'k52', 5.5), (11623, 1867, 'k65', 5.75), (11624, 783, 'k78', 6.0), (11625, 2700, 'k91', 6.25), (11626, 1616, 'k104', 6.5), (11627, 532, 'k117', 6.75), (11628, 2449, 'k130', 7.0), (11629, 1365, 'k143', 0.0), (11630, 281, 'k156', 0.25), (11631, 2198, 'k12', 0.5), (11632, 1114, 'k25', 0.75), (11633, 30, 'k38', 1.0), (11634, 1947, 'k51', 1.25), (11635, 863, 'k64', 1.5), (11636, 2780, 'k77', 1.75), (11637, 1696, 'k90', 2.0), (11638, 612, 'k103', 2.25), (11639, 2529, 'k116', 2.5), (11640, 1445, 'k129', 2.75), (11641, 361, 'k142', 3.0), (11642, 2278, 'k155', 3.25), (11643, 1194, 'k11', 3.5), (11644, 110, 'k24', 3.75), (11645, 2027, 'k37', 4.0), (11646, 943, 'k50', 4.25), (11647, 2860, 'k63', 4.5), (11648, 1776, 'k76', 4.75), (11649, 692, 'k89', 5.0), (11650, 2609, 'k102', 5.25), (11651, 1525, 'k115', 5.5), (11652, 441, 'k128', 5.75), (11653, 2358, 'k141', 6.0), (11654, 1274, 'k154', 6.25), (11655, 190, 'k10', 6.5), (11656, 2107, 'k23', 6.75), (11657, 1023, 'k36', 7.0), (11658, 2940, 'k49', 0.0), (11659, 1856, 'k62', 0.25), (11660, 772, 'k75', 0.5), (11661, 2689, 'k88', 0.75), (11662, 1605, 'k101', 1.0), (11663, 521, 'k114', 1.25), (11664, 2438, 'k127', 1.5), (11665, 1354, 'k140', 1.75), (11666, 270, 'k153', 2.0), (11667, 2187, 'k9', 2.25), (11668, 1103, 'k22', 2.5), (11669, 19, 'k35', 2.75), (11670, 1936, 'k48', 3.0), (11671, 852, 'k61', 3.25), (11672, 2769, 'k74', 3.5), (11673, 1685, 'k87', 3.75), (11674, 601, 'k100', 4.0), (11675, 2518, 'k113', 4.25), (11676, 1434, 'k126', 4.5), (11677, 350, 'k139', 4.75), (11678, 2267, 'k152', 5.0), (11679, 1183, 'k8', 5.25), (11680, 99, 'k21', 5.5), (11681, 2016, 'k34', 5.75), (11682, 932, 'k47', 6.0), (11683, 2849, 'k60', 6.25), (11684, 1765, 'k73', 6.5), (11685, 681, 'k86', 6.75), (11686, 2598, 'k99', 7.0), (11687, 1514, 'k112', 0.0), (11688, 430, 'k125', 0.25), (11689, 2347, 'k138', 0.5), (11690, 1263, 'k151', 0.75), (11691, 179, 'k7', 1.0), (11692, 2096, 'k20', 1.25), (11693, 1012, 'k33', 1.5), (11694, 2929, 'k46', 1.75), (11695, 1845, 'k59', 2.0), (11696, 761, 'k72', 2.25), (11697, 2678, 'k85', 2.5), (11698, 1594, 'k98', 2.75), (11699, 510, 'k111', 3.0), (11700, 2427, 'k124', 3.25), (11701, 1343, 'k137', 3.5), (11702, 259, 'k150', 3.75), (11703, 2176, 'k6', 4.0), (11704, 1092, 'k19', 4.25), (11705, 8, 'k32', 4.5), (11706, 1925, 'k45', 4.75), (11707, 841, 'k58', 5.0), (11708, 2758, 'k71', 5.25), (11709, 1674, 'k84', 5.5), (11710, 590, 'k97', 5.75), (11711, 2507, 'k110', 6.0), (11712, 1423, 'k123', 6.25), (11713, 339, 'k136', 6.5), (11714, 2256, 'k149', 6.75), (11715, 1172, 'k5', 7.0), (11716, 88, 'k18', 0.0), (11717, 2005, 'k31', 0.25), (11718, 921, 'k44', 0.5), (11719, 2838, 'k57', 0.75), (11720, 1754, 'k70', 1.0), (11721, 670, 'k83', 1.25), (11722, 2587, 'k96', 1.5), (11723, 1503, 'k109', 1.75), (11724, 419, 'k122', 2.0), (11725, 2336, 'k135', 2.25), (11726, 1252, 'k148', 2.5), (11727, 168, 'k4', 2.75), (11728, 2085, 'k17', 3.0), (11729, 1001, 'k30', 3.25), (11730, 2918, 'k43', 3.5), (11731, 1834, 'k56', 3.75), (11732, 750, 'k69', 4.0), (11733, 2667, 'k82', 4.25), (11734, 1583, 'k95', 4.5), (11735, 499, 'k108', 4.75), (11736, 2416, 'k121', 5.0), (11737, 1332, 'k134', 5.25), (11738, 248, 'k147', 5.5), (11739, 2165, 'k3', 5.75), (11740, 1081, 'k16', 6.0), (11741, 2998, 'k29', 6.25), (11742, 1914, 'k42', 6.5), (11743, 830, 'k55', 6.75), (11744, 2747, 'k68', 7.0), (11745, 1663, 'k81', 0.0), (11746, 579, 'k94', 0.25), (11747, 2496, 'k107', 0.5), (11748, 1412, 'k120', 0.75), (11749, 328, 'k133', 1.0), (11750, 2245, 'k146', 1.25), (11751, 1161, 'k2', 1.5), (11752, 77, 'k15', 1.75), (11753, 1994, 'k28', 2.0), (11754, 910, 'k41', 2.25), (11755, 2827, 'k54', 2.5), (11756, 1743, 'k67', 2.75), (11757, 659, 'k80', 3.0), (11758, 2576, 'k93', 3.25), (11759, 1492, 'k106', 3.5), (11760, 408, 'k119', 3.75), (11761, 2325, 'k132', 4.0), (11762, 1241, 'k145', 4.25), (11763, 157, 'k1', 4.5), (11764, 2074, 'k14', 4.75), (11765, 990, 'k27', 5.0), (11766, 2907, 'k40', 5.25), (11767, 1823, 'k53', 5.5), (11768, 739, 'k66', 5.75), (11769, 2656, 'k79', 6.0), (11770, 1572, 'k92', 6.25), (11771, 488, 'k105', 6.5), (11772, 2405, 'k118', 6.75), (11773, 1321, 'k131', 7.0), (11774, 237, 'k144', 0.0), (11775, 2154, 'k0', 0.25), (11776, 1070, 'k13', 0.5), (11777, 2987, 'k26', 0.75), (11778, 1903, 'k39', 1.0), (11779, 819, 'k52', 1.25), (11780, 2736, 'k65', 1.5), (11781, 1652, 'k78', 1.75), (11782, 568, 'k91', 2.0), (11783, 2485, 'k104', 2.25), (11784, 1401, 'k117', 2.5), (11785, 317, 'k130', 2.75), (11786, 2234, 'k143', 3.0), (11787, 1150, 'k156', 3.25), (11788, 66, 'k12', 3.5), (11789, 1983, 'k25', 3.75), (11790, 899, 'k38', 4.0), (11791, 2816, 'k51', 4.25), (11792, 1732, 'k64', 4.5), (11793, 648, 'k77', 4.75), (11794, 2565, 'k90', 5.0), (11795, 1481, 'k103', 5.25), (11796, 397, 'k116', 5.5), (11797, 2314, 'k129', 5.75), (11798, 1230, 'k142', 6.0), (11799, 146, 'k155', 6.25), (11800, 2063, 'k11', 6.5), (11801, 979, 'k24', 6.75), (11802, 2896, 'k37', 7.0), (11803, 1812, 'k50', 0.0), (11804, 728, 'k63', 0.25), (11805, 2645, 'k76', 0.5), (11806, 1561, 'k89', 0.75), (11807, 477, 'k102', 1.0), (11808, 2394, 'k115', 1.25), (11809, 1310, 'k128', 1.5), (11810, 226, 'k141', 1.75), (11811, 2143, 'k154', 2.0), (11812, 1059, 'k10', 2.25), (11813, 2976, 'k23', 2.5), (11814, 1892, 'k36', 2.75), (11815, 808, 'k49', 3.0), (11816, 2725, 'k62', 3.25), (11817, 1641, 'k75', 3.5), (11818, 557, 'k88', 3.75), (11819, 2474, 'k101', 4.0), (11820, 1390, 'k114', 4.25), (11821, 306, 'k127', 4.5), (11822, 2223, 'k140', 4.75), (11823, 1139, 'k153', 5.0), (11824, 55, 'k9', 5.25), (11825, 1972, 'k22', 5.5), (11826, 888, 'k35', 5.75), (11827, 2805, 'k48', 6.0), (11828, 1721, 'k61', 6.25), (11829, 637, 'k74', 6.5), (11830, 2554, 'k87', 6.75), (11831, 1470, 'k100', 7.0), (11832, 386, 'k113', 0.0), (11833, 2303, 'k126', 0.25), (11834, 1219, 'k139', 0.5), (11835, 135, 'k152', 0.75), (11836, 2052, 'k8', 1.0), (11837, 968, 'k21', 1.25), (11838, 2885, 'k34', 1.5), (11839, 1801, 'k47', 1.75), (11840, 717, 'k60', 2.0), (11841, 2634, 'k73', 2.25), (11842, 1550, 'k86', 2.5), (11843, 466, 'k99', 2.75), (11844, 2383, 'k112', 3.0), (11845, 1299, 'k125', 3.25), (11846, 215, 'k138', 3.5), (11847, 2132, 'k151', 3.75), (11848, 1048, 'k7', 4.0), (11849, 2965, 'k20', 4.25), (11850, 1881, 'k33', 4.5), (11851, 797, 'k46', 4.75), (11852, 2714, 'k59', 5.0), (11853, 1630, 'k72', 5.25), (11854, 546, 'k85', 5.5), (11855, 2463, 'k98', 5.75), (11856, 1379, 'k111', 6.0), (11857, 295, 'k124', 6.25), (11858, 2212, 'k137', 6.5), (11859, 1128, 'k150', 6.75), (11860, 44, 'k6', 7.0), (11861, 1961, 'k19', 0.0), (11862, 877, 'k32', 0.25), (11863, 2794, 'k45', 0.5), (11864, 1710, 'k58', 0.75), (11865, 626, 'k71', 1.0), (11866, 2543, 'k84', 1.25), (11867, 1459, 'k97', 1.5), (11868, 375, 'k110', 1.75), (11869, 2292, 'k123', 2.0), (11870, 1208, 'k136', 2.25), (11871, 124, 'k149', 2.5), (11872, 2041, 'k5', 2.75), (11873, 957, 'k18', 3.0), (11874, 2874, 'k31', 3.25), (11875, 1790, 'k44', 3.5), (11876, 706, 'k57', 3.75), (11877, 2623, 'k70', 4.0), (11878, 1539, 'k83', 4.25), (11879, 455, 'k96', 4.5), (11880, 2372, 'k109', 4.75), (11881, 1288, 'k122', 5.0), (11882, 204, 'k135', 5.25), (11883, 2121, 'k148', 5.5), (11884, 1037, 'k4', 5.75), (11885, 2954, 'k17', 6.0), (11886, 1870, 'k30', 6.25), (11887, 786, 'k43', 6.5), (11888, 2703, 'k56', 6.75), (11889, 1619, 'k69', 7.0), (11890, 535, 'k82', 0.0), (11891, 2452, 'k95', 0.25), (11892, 1368, 'k108', 0.5), (11893, 284, 'k121', 0.75), (11894, 2201, 'k134', 1.0), (11895, 1117, 'k147', 1.25), (11896, 33, 'k3', 1.5), (11897, 1950, 'k16', 1.75), (11898, 866, 'k29', 2.0), (11899, 2783, 'k42', 2.25), (11900, 1699, 'k55', 2.5), (11901, 615, 'k68', 2.75), (11902, 2532, 'k81', 3.0), (11903, 1448, 'k94', 3.25), (11904, 364, 'k107', 3.5), (11905, 2281, 'k120', 3.75), (11906, 1197, 'k133', 4.0), (11907, 113, 'k146', 4.25), (11908, 2030, 'k2', 4.5), (11909, 946, 'k15', 4.75), (11910, 2863, 'k28', 5.0), (11911, 1779, 'k41', 5.25), (11912, 695, 'k54', 5.5), (11913, 2612, 'k67', 5.75), (11914, 1528, 'k80', 6.0), (11915, 444, 'k93', 6.25), (11916, 2361, 'k106', 6.5), (11917, 1277, 'k119', 6.75), (11918, 193, 'k132', 7.0), (11919, 2110, 'k145', 0.0), (11920, 1026, 'k1', 0.25), (11921, 2943, 'k14', 0.5), (11922, 1859, 'k27', 0.75), (11923, 775, 'k40', 1.0), (11924, 2692, 'k53', 1.25), (11925, 1608, 'k66', 1.5), (11926, 524, 'k79', 1.75), (11927, 2441, 'k92', 2.0), (11928, 1357, 'k105', 2.25), (11929, 273, 'k118', 2.5), (11930, 2190, 'k131', 2.75), (11931, 1106, 'k144', 3.0), (11932, 22, 'k0', 3.25), (11933, 1939, 'k13', 3.5), (11934, 855, 'k26', 3.75), (11935, 2772, 'k39', 4.0), (11936, 1688, 'k52', 4.25), (11937, 604, 'k65', 4.5), (11938, 2521, 'k78', 4.75), (11939, 1437, 'k91', 5.0), (11940, 353, 'k104', 5.25), (11941, 2270, 'k117', 5.5), (11942, 1186, 'k130', 5.75), (11943, 102, 'k143', 6.0), (11944, 2019, 'k156', 6.25), (11945, 935, 'k12', 6.5), (11946, 2852, 'k25', 6.75), (11947, 1768, 'k38', 7.0), (11948, 684, 'k51', 0.0), (11949, 2601, 'k64', 0.25), (11950, 1517, 'k77', 0.5), (11951, 433, 'k90', 0.75), (11952, 2350, 'k103', 1.0), (11953, 1266, 'k116', 1.25), (11954, 182, 'k129', 1.5), (11955, 2099, 'k142', 1.75), (11956, 1015, 'k155', 2.0), (11957, 2932, 'k11', 2.25), (11958, 1848, 'k24', 2.5), (11959, 764, 'k37', 2.75), (11960, 2681, 'k50', 3.0), (11961, 1597, 'k63', 3.25), (11962, 513, 'k76', 3.5), (11963, 2430, 'k89', 3.75), (11964, 1346, 'k102', 4.0), (11965, 262, 'k115', 4.25), (11966, 2179, 'k128', 4.5), (11967, 1095, 'k141', 4.75), (11968, 11, 'k154', 5.0), (11969, 1928, 'k10', 5.25), (11970, 844, 'k23', 5.5), (11971, 2761, 'k36', 5.75), (11972, 1677, 'k49', 6.0), (11973, 593, 'k62', 6.25), (11974, 2510, 'k75', 6.5), (11975, 1426, 'k88', 6.75), (11976, 342, 'k101', 7.0), (11977, 2259, 'k114', 0.0), (11978, 1175, 'k127', 0.25), (11979, 91, 'k140', 0.5), (11980, 2008, 'k153', 0.75), (11981, 924, 'k9', 1.0), (11982, 2841, 'k22', 1.25), (11983, 1757, 'k35', 1.5), (11984, 673, 'k48', 1.75), (11985, 2590, 'k61', 2.0), (11986, 1506, 'k74', 2.25), (11987, 422, 'k87', 2.5), (11988, 2339, 'k100', 2.75), (11989, 1255, 'k113', 3.0), (11990, 171, 'k126', 3.25), (11991, 2088, 'k139', 3.5), (11992, 1004, 'k152', 3.75), (11993, 2921, 'k8', 4.0), (11994, 1837, 'k21', 4.25), (11995, 753, 'k34', 4.5), (11996, 2670, 'k47', 4.75), (11997, 1586, 'k60', 5.0), (11998, 502, 'k73', 5.25), (11999, 2419, 'k86', 5.5);
+CREATE TABLE S(K INT, C VARCHAR, G INT);
+INSERT INTO S VALUES (0, 'k0', 0), (3, 'k3', 3), (6, 'k6', 0), (9, 'k9', 3), (12, 'k12', 0), (15, 'k15', 3), (18, 'k18', 0), (21, 'k21', 3), (24, 'k24', 0), (27, 'k27', 3), (30, 'k30', 0), (33, 'k33', 3), (36, 'k36', 0), (39, 'k39', 3), (42, 'k42', 0), (45, 'k45', 3), (48, 'k48', 0), (51, 'k51', 3), (54, 'k54', 0), (57, 'k57', 3), (60, 'k60', 0), (63, 'k63', 3), (66, 'k66', 0), (69, 'k69', 3), (72, 'k72', 0), (75, 'k75', 3), (78, 'k78', 0), (81, 'k81', 3), (84, 'k84', 0), (87, 'k87', 3), (90, 'k90', 0), (93, 'k93', 3), (96, 'k96', 0), (99, 'k99', 3), (102, 'k102', 0), (105, 'k105', 3), (108, 'k108', 0), (111, 'k111', 3), (114, 'k114', 0), (117, 'k117', 3), (120, 'k120', 0), (123, 'k123', 3), (126, 'k126', 0), (129, 'k129', 3), (132, 'k132', 0), (135, 'k135', 3), (138, 'k138', 0), (141, 'k141', 3), (144, 'k144', 0), (147, 'k147', 3), (150, 'k150', 0), (153, 'k153', 3), (156, 'k156', 0), (159, 'k2', 3), (162, 'k5', 0), (165, 'k8', 3), (168, 'k11', 0), (171, 'k14', 3), (174, 'k17', 0), (177, 'k20', 3), (180, 'k23', 0), (183, 'k26', 3), (186, 'k29', 0), (189, 'k32', 3), (192, 'k35', 0), (195, 'k38', 3), (198, 'k41', 0), (201, 'k44', 3), (204, 'k47', 0), (207, 'k50', 3), (210, 'k53', 0), (213, 'k56', 3), (216, 'k59', 0), (219, 'k62', 3), (222, 'k65', 0), (225, 'k68', 3), (228, 'k71', 0), (231, 'k74', 3), (234, 'k77', 0), (237, 'k80', 3), (240, 'k83', 0), (243, 'k86', 3), (246, 'k89', 0), (249, 'k92', 3), (252, 'k95', 0), (255, 'k98', 3), (258, 'k101', 0), (261, 'k104', 3), (264, 'k107', 0), (267, 'k110', 3), (270, 'k113', 0), (273, 'k116', 3), (276, 'k119', 0), (279, 'k122', 3), (282, 'k125', 0), (285, 'k128', 3), (288, 'k131', 0), (291, 'k134', 3), (294, 'k137', 0), (297, 'k140', 3), (300, 'k143', 0), (303, 'k146', 3), (306, 'k149', 0), (309, 'k152', 3), (312, 'k155', 0), (315, 'k1', 3), (318, 'k4', 0), (321, 'k7', 3), (324, 'k10', 0), (327, 'k13', 3), (330, 'k16', 0), (333, 'k19', 3), (336, 'k22', 0), (339, 'k25', 3), (342, 'k28', 0), (345, 'k31', 3), (348, 'k34', 0), (351, 'k37', 3), (354, 'k40', 0), (357, 'k43', 3), (360, 'k46', 0), (363, 'k49', 3), (366, 'k52', 0), (369, 'k55', 3), (372, 'k58', 0), (375, 'k61', 3), (378, 'k64', 0), (381, 'k67', 3), (384, 'k70', 0), (387, 'k73', 3), (390, 'k76', 0), (393, 'k79', 3), (396, 'k82', 0), (399, 'k85', 3), (402, 'k88', 0), (405, 'k91', 3), (408, 'k94', 0), (411, 'k97', 3), (414, 'k100', 0), (417, 'k103', 3), (420, 'k106', 0), (423, 'k109', 3), (426, 'k112', 0), (429, 'k115', 3), (432, 'k118', 0), (435, 'k121', 3), (438, 'k124', 0), (441, 'k127', 3), (444, 'k130', 0), (447, 'k133', 3), (450, 'k136', 0), (453, 'k139', 3), (456, 'k142', 0), (459, 'k145', 3), (462, 'k148', 0), (465, 'k151', 3), (468, 'k154', 0), (471, 'k0', 3), (474, 'k3', 0), (477, 'k6', 3), (480, 'k9', 0), (483, 'k12', 3), (486, 'k15', 0), (489, 'k18', 3), (492, 'k21', 0), (495, 'k24', 3), (498, 'k27', 0), (501, 'k30', 3), (504, 'k33', 0), (507, 'k36', 3), (510, 'k39', 0), (513, 'k42', 3), (516, 'k45', 0), (519, 'k48', 3), (522, 'k51', 0), (525, 'k54', 3), (528, 'k57', 0), (531, 'k60', 3), (534, 'k63', 0), (537, 'k66', 3), (540, 'k69', 0), (543, 'k72', 3), (546, 'k75', 0), (549, 'k78', 3), (552, 'k81', 0), (555, 'k84', 3), (558, 'k87', 0), (561, 'k90', 3), (564, 'k93', 0), (567, 'k96', 3), (570, 'k99', 0), (573, 'k102', 3), (576, 'k105', 0), (579, 'k108', 3), (582, 'k111', 0), (585, 'k114', 3), (588, 'k117', 0), (591, 'k120', 3), (594, 'k123', 0), (597, 'k126', 3), (600, 'k129', 0), (603, 'k132', 3), (606, 'k135', 0), (609, 'k138', 3), (612, 'k141', 0), (615, 'k144', 3), (618, 'k147', 0), (621, 'k150', 3), (624, 'k153', 0), (627, 'k156', 3), (630, 'k2', 0), (633, 'k5', 3), (636, 'k8', 0), (639, 'k11', 3), (642, 'k14', 0), (645, 'k17', 3), (648, 'k20', 0), (651, 'k23', 3), (654, 'k26', 0), (657, 'k29', 3), (660, 'k32', 0), (663, 'k35', 3), (666, 'k38', 0), (669, 'k41', 3), (672, 'k44', 0), (675, 'k47', 3), (678, 'k50', 0), (681, 'k53', 3), (684, 'k56', 0), (687, 'k59', 3), (690, 'k62', 0), (693, 'k65', 3), (696, 'k68', 0), (699, 'k71', 3), (702, 'k74', 0), (705, 'k77', 3), (708, 'k80', 0), (711, 'k83', 3), (714, 'k86', 0), (717, 'k89', 3), (720, 'k92', 0), (723, 'k95', 3), (726, 'k98', 0), (729, 'k101', 3), (732, 'k104', 0), (735, 'k107', 3), (738, 'k110', 0), (741, 'k113', 3), (744, 'k116', 0), (747, 'k119', 3), (750, 'k122', 0), (753, 'k125', 3), (756, 'k128', 0), (759, 'k131', 3), (762, 'k134', 0), (765, 'k137', 3), (768, 'k140', 0), (771, 'k143', 3), (774, 'k146', 0), (777, 'k149', 3), (780, 'k152', 0), (783, 'k155', 3), (786, 'k1', 0), (789, 'k4', 3), (792, 'k7', 0), (795, 'k10', 3), (798, 'k13', 0), (801, 'k16', 3), (804, 'k19', 0), (807, 'k22', 3), (810, 'k25', 0), (813, 'k28', 3), (816, 'k31', 0), (819, 'k34', 3), (822, 'k37', 0), (825, 'k40', 3), (828, 'k43', 0), (831, 'k46', 3), (834, 'k49', 0), (837, 'k52', 3), (840, 'k55', 0), (843, 'k58', 3), (846, 'k61', 0), (849, 'k64', 3), (852, 'k67', 0), (855, 'k70', 3), (858, 'k73', 0), (861, 'k76', 3), (864, 'k79', 0), (867, 'k82', 3), (870, 'k85', 0), (873, 'k88', 3), (876, 'k91', 0), (879, 'k94', 3), (882, 'k97', 0), (885, 'k100', 3), (888, 'k103', 0), (891, 'k106', 3), (894, 'k109', 0), (897, 'k112', 3), (900, 'k115', 0), (903, 'k118', 3), (906, 'k121', 0), (909, 'k124', 3), (912, 'k127', 0), (915, 'k130', 3), (918, 'k133', 0), (921, 'k136', 3), (924, 'k139', 0), (927, 'k142', 3), (930, 'k145', 0), (933, 'k148', 3), (936, 'k151', 0), (939, 'k154', 3), (942, 'k0', 0), (945, 'k3', 3), (948, 'k6', 0), (951, 'k9', 3), (954, 'k12', 0), (957, 'k15', 3), (960, 'k18', 0), (963, 'k21', 3), (966, 'k24', 0), (969, 'k27', 3), (972, 'k30', 0), (975, 'k33', 3), (978, 'k36', 0), (981, 'k39', 3), (984, 'k42', 0), (987, 'k45', 3), (990, 'k48', 0), (993, 'k51', 3), (996, 'k54', 0), (999, 'k57', 3), (1002, 'k60', 0), (1005, 'k63', 3), (1008, 'k66', 0), (1011, 'k69', 3), (1014, 'k72', 0), (1017, 'k75', 3), (1020, 'k78', 0), (1023, 'k81', 3), (1026, 'k84', 0), (1029, 'k87', 3), (1032, 'k90', 0), (1035, 'k93', 3), (1038, 'k96', 0), (1041, 'k99', 3), (1044, 'k102', 0), (1047, 'k105', 3), (1050, 'k108', 0), (1053, 'k111', 3), (1056, 'k114', 0), (1059, 'k117', 3), (1062, 'k120', 0), (1065, 'k123', 3), (1068, 'k126', 0), (1071, 'k129', 3), (1074, 'k132', 0), (1077, 'k135', 3), (1080, 'k138', 0), (1083, 'k141', 3), (1086, 'k144', 0), (1089, 'k147', 3), (1092, 'k150', 0), (1095, 'k153', 3), (1098, 'k156', 0), (1101, 'k2', 3), (1104, 'k5', 0), (1107, 'k8', 3), (1110, 'k11', 0), (1113, 'k14', 3), (1116, 'k17', 0), (1119, 'k20', 3), (1122, 'k23', 0), (1125, 'k26', 3), (1128, 'k29', 0), (1131, 'k32', 3), (1134, 'k35', 0), (1137, 'k38', 3), (1140, 'k41', 0), (1143, 'k44', 3), (1146, 'k47', 0), (1149, 'k50', 3), (1152, 'k53', 0), (1155, 'k56', 3), (1158, 'k59', 0), (1161, 'k62', 3), (1164, 'k65', 0), (1167, 'k68', 3), (1170, 'k71', 0), (1173, 'k74', 3), (1176, 'k77', 0), (1179, 'k80', 3), (1182, 'k83', 0), (1185, 'k86', 3), (1188, 'k89', 0), (1191, 'k92', 3), (1194, 'k95', 0), (1197, 'k98', 3), (1200, 'k101', 0), (1203, 'k104', 3), (1206, 'k107', 0), (1209, 'k110', 3), (1212, 'k113', 0), (1215, 'k116', 3), (1218, 'k119', 0), (1221, 'k122', 3), (1224, 'k125', 0), (1227, 'k128', 3), (1230, 'k131', 0), (1233, 'k134', 3), (1236, 'k137', 0), (1239, 'k140', 3), (1242, 'k143', 0), (1245, 'k146', 3), (1248, 'k149', 0), (1251, 'k152', 3), (1254, 'k155', 0), (1257, 'k1', 3), (1260, 'k4', 0), (1263, 'k7', 3), (1266, 'k10', 0), (1269, 'k13', 3), (1272, 'k16', 0), (1275, 'k19', 3), (1278, 'k22', 0), (1281, 'k25', 3), (1284, 'k28', 0), (1287, 'k31', 3), (1290, 'k34', 0), (1293, 'k37', 3), (1296, 'k40', 0), (1299, 'k43', 3), (1302, 'k46', 0), (1305, 'k49', 3), (1308, 'k52', 0), (1311, 'k55', 3), (1314, 'k58', 0), (1317, 'k61', 3), (1320, 'k64', 0), (1323, 'k67', 3), (1326, 'k70', 0), (1329, 'k73', 3), (1332, 'k76', 0), (1335, 'k79', 3), (1338, 'k82', 0), (1341, 'k85', 3), (1344, 'k88', 0), (1347, 'k91', 3), (1350, 'k94', 0), (1353, 'k97', 3), (1356, 'k100', 0), (1359, 'k103', 3), (1362, 'k106', 0), (1365, 'k109', 3), (1368, 'k112', 0), (1371, 'k115', 3), (1374, 'k118', 0), (1377, 'k121', 3), (1380, 'k124', 0), (1383, 'k127', 3), (1386, 'k130', 0), (1389, 'k133', 3), (1392, 'k136', 0), (1395, 'k139', 3), (1398, 'k142', 0), (1401, 'k145', 3), (1404, 'k148', 0), (1407, 'k151', 3), (1410, 'k154', 0), (1413, 'k0', 3), (1416, 'k3', 0), (1419, 'k6', 3), (1422, 'k9', 0), (1425, 'k12', 3), (1428, 'k15', 0), (1431, 'k18', 3), (1434, 'k21', 0), (1437, 'k24', 3), (1440, 'k27', 0), (1443, 'k30', 3), (1446, 'k33', 0), (1449, 'k36', 3), (1452, 'k39', 0), (1455, 'k42', 3), (1458, 'k45', 0), (1461, 'k48', 3), (1464, 'k51', 0), (1467, 'k54', 3), (1470, 'k57', 0), (1473, 'k60', 3), (1476, 'k63', 0), (1479, 'k66', 3), (1482, 'k69', 0), (1485, 'k72', 3), (1488, 'k75', 0), (1491, 'k78', 3), (1494, 'k81', 0), (1497, 'k84', 3), (1500, 'k87', 0), (1503, 'k90', 3), (1506, 'k93', 0), (1509, 'k96', 3), (1512, 'k99', 0), (1515, 'k102', 3), (1518, 'k105', 0), (1521, 'k108', 3), (1524, 'k111', 0), (1527, 'k114', 3), (1530, 'k117', 0), (1533, 'k120', 3), (1536, 'k123', 0), (1539, 'k126', 3), (1542, 'k129', 0), (1545, 'k132', 3), (1548, 'k135', 0), (1551, 'k138', 3), (1554, 'k141', 0), (1557, 'k144', 3), (1560, 'k147', 0), (1563, 'k150', 3), (1566, 'k153', 0), (1569, 'k156', 3), (1572, 'k2', 0), (1575, 'k5', 3), (1578, 'k8', 0), (1581, 'k11', 3), (1584, 'k14', 0), (1587, 'k17', 3), (1590, 'k20', 0), (1593, 'k23', 3), (1596, 'k26', 0), (1599, 'k29', 3), (1602, 'k32', 0), (1605, 'k35', 3), (1608, 'k38', 0), (1611, 'k41', 3), (1614, 'k44', 0), (1617, 'k47', 3), (1620, 'k50', 0), (1623, 'k53', 3), (1626, 'k56', 0), (1629, 'k59', 3), (1632, 'k62', 0), (1635, 'k65', 3), (1638, 'k68', 0), (1641, 'k71', 3), (1644, 'k74', 0), (1647, 'k77', 3), (1650, 'k80', 0), (1653, 'k83', 3), (1656, 'k86', 0), (1659, 'k89', 3), (1662, 'k92', 0), (1665, 'k95', 3), (1668, 'k98', 0), (1671, 'k101', 3), (1674, 'k104', 0), (1677, 'k107', 3), (1680, 'k110', 0), (1683, 'k113', 3), (1686, 'k116', 0), (1689, 'k119', 3), (1692, 'k122', 0), (1695, 'k125', 3), (1698, 'k128', 0), (1701, 'k131', 3), (1704, 'k134', 0), (1707, 'k137', 3), (1710, 'k140', 0), (1713, 'k143', 3), (1716, 'k146', 0), (1719, 'k149', 3), (1722, 'k152', 0), (1725, 'k155', 3), (1728, 'k1', 0), (1731, 'k4', 3), (1734, 'k7', 0), (1737, 'k10', 3), (1740, 'k13', 0), (1743, 'k16', 3), (1746, 'k19', 0), (1749, 'k22', 3), (1752, 'k25', 0), (1755, 'k28', 3), (1758, 'k31', 0), (1761, 'k34', 3), (1764, 'k37', 0), (1767, 'k40', 3), (1770, 'k43', 0), (1773, 'k46', 3), (1776, 'k49', 0), (1779, 'k52', 3), (1782, 'k55', 0), (1785, 'k58', 3), (1788, 'k61', 0), (1791, 'k64', 3), (1794, 'k67', 0), (1797, 'k70', 3), (1800, 'k73', 0), (1803, 'k76', 3), (1806, 'k79', 0), (1809, 'k82', 3), (1812, 'k85', 0), (1815, 'k88', 3), (1818, 'k91', 0), (1821, 'k94', 3), (1824, 'k97', 0), (1827, 'k100', 3), (1830, 'k103', 0), (1833, 'k106', 3), (1836, 'k109', 0), (1839, 'k112', 3), (1842, 'k115', 0), (1845, 'k118', 3), (1848, 'k121', 0), (1851, 'k124', 3), (1854, 'k127', 0), (1857, 'k130', 3), (1860, 'k133', 0), (1863, 'k136', 3), (1866, 'k139', 0), (1869, 'k142', 3), (1872, 'k145', 0), (1875, 'k148', 3), (1878, 'k151', 0), (1881, 'k154', 3), (1884, 'k0', 0), (1887, 'k3', 3), (1890, 'k6', 0), (1893, 'k9', 3), (1896, 'k12', 0), (1899, 'k15', 3), (1902, 'k18', 0), (1905, 'k21', 3), (1908, 'k24', 0), (1911, 'k27', 3), (1914, 'k30', 0), (1917, 'k33', 3), (1920, 'k36', 0), (1923, 'k39', 3), (1926, 'k42', 0), (1929, 'k45', 3), (1932, 'k48', 0), (1935, 'k51', 3), (1938, 'k54', 0), (1941, 'k57', 3), (1944, 'k60', 0), (1947, 'k63', 3), (1950, 'k66', 0), (1953, 'k69', 3), (1956, 'k72', 0), (1959, 'k75', 3), (1962, 'k78', 0), (1965, 'k81', 3), (1968, 'k84', 0), (1971, 'k87', 3), (1974, 'k90', 0), (1977, 'k93', 3), (1980, 'k96', 0), (1983, 'k99', 3), (1986, 'k102', 0), (1989, 'k105', 3), (1992, 'k108', 0), (1995, 'k111', 3), (1998, 'k114', 0), (2001, 'k117', 3), (2004, 'k120', 0), (2007, 'k123', 3), (2010, 'k126', 0), (2013, 'k129', 3), (2016, 'k132', 0), (2019, 'k135', 3), (2022, 'k138', 0), (2025, 'k141', 3), (2028, 'k144', 0), (2031, 'k147', 3), (2034, 'k150', 0), (2037, 'k153', 3), (2040, 'k156', 0), (2043, 'k2', 3), (2046, 'k5', 0), (2049, 'k8', 3), (2052, 'k11', 0), (2055, 'k14', 3), (2058, 'k17', 0), (2061, 'k20', 3), (2064, 'k23', 0), (2067, 'k26', 3), (2070, 'k29', 0), (2073, 'k32', 3), (2076, 'k35', 0), (2079, 'k38', 3), (2082, 'k41', 0), (2085, 'k44', 3), (2088, 'k47', 0), (2091, 'k50', 3), (2094, 'k53', 0), (2097, 'k56', 3), (2100, 'k59', 0), (2103, 'k62', 3), (2106, 'k65', 0), (2109, 'k68', 3), (2112, 'k71', 0), (2115, 'k74', 3), (2118, 'k77', 0), (2121, 'k80', 3), (2124, 'k83', 0), (2127, 'k86', 3), (2130, 'k89', 0), (2133, 'k92', 3), (2136, 'k95', 0), (2139, 'k98', 3), (2142, 'k101', 0), (2145, 'k104', 3), (2148, 'k107', 0), (2151, 'k110', 3), (2154, 'k113', 0), (2157, 'k116', 3), (2160, 'k119', 0), (2163, 'k122', 3), (2166, 'k125', 0), (2169, 'k128', 3), (2172, 'k131', 0), (2175, 'k134', 3), (2178, 'k137', 0), (2181, 'k140', 3), (2184, 'k143', 0), (2187, 'k146', 3), (2190, 'k149', 0), (2193, 'k152', 3), (2196, 'k155', 0), (2199, 'k1', 3), (2202, 'k4', 0), (2205, 'k7', 3), (2208, 'k10', 0), (2211, 'k13', 3), (2214, 'k16', 0), (2217, 'k19', 3), (2220, 'k22', 0), (2223, 'k25', 3), (2226, 'k28', 0), (2229, 'k31', 3), (2232, 'k34', 0), (2235, 'k37', 3), (2238, 'k40', 0), (2241, 'k43', 3), (2244, 'k46', 0), (2247, 'k49', 3), (2250, 'k52', 0), (2253, 'k55', 3), (2256, 'k58', 0), (2259, 'k61', 3), (2262, 'k64', 0), (2265, 'k67', 3), (2268, 'k70', 0), (2271, 'k73', 3), (2274, 'k76', 0), (2277, 'k79', 3), (2280, 'k82', 0), (2283, 'k85', 3), (2286, 'k88', 0), (2289, 'k91', 3), (2292, 'k94', 0), (2295, 'k97', 3), (2298, 'k100', 0), (2301, 'k103', 3), (2304, 'k106', 0), (2307, 'k109', 3), (2310, 'k112', 0), (2313, 'k115', 3), (2316, 'k118', 0), (2319, 'k121', 3), (2322, 'k124', 0), (2325, 'k127', 3), (2328, 'k130', 0), (2331, 'k133', 3), (2334, 'k136', 0), (2337, 'k139', 3), (2340, 'k142', 0), (2343, 'k145', 3), (2346, 'k148', 0), (2349, 'k151', 3), (2352, 'k154', 0), (2355, 'k0', 3), (2358, 'k3', 0), (2361, 'k6', 3), (2364, 'k9', 0), (2367, 'k12', 3), (2370, 'k15', 0), (2373, 'k18', 3), (2376, 'k21', 0), (2379, 'k24', 3), (2382, 'k27', 0), (2385, 'k30', 3), (2388, 'k33', 0), (2391, 'k36', 3), (2394, 'k39', 0), (2397, 'k42', 3), (2400, 'k45', 0), (2403, 'k48', 3), (2406, 'k51', 0), (2409, 'k54', 3), (2412, 'k57', 0), (2415, 'k60', 3), (2418, 'k63', 0), (2421, 'k66', 3), (2424, 'k69', 0), (2427, 'k72', 3), (2430, 'k75', 0), (2433, 'k78', 3), (2436, 'k81', 0), (2439, 'k84', 3), (2442, 'k87', 0), (2445, 'k90', 3), (2448, 'k93', 0), (2451, 'k96', 3), (2454, 'k99', 0), (2457, 'k102', 3), (2460, 'k105', 0), (2463, 'k108', 3), (2466, 'k111', 0), (2469, 'k114', 3), (2472, 'k117', 0), (2475, 'k120', 3), (2478, 'k123', 0), (2481, 'k126', 3), (2484, 'k129', 0), (2487, 'k132', 3), (2490, 'k135', 0), (2493, 'k138', 3), (2496, 'k141', 0), (2499, 'k144', 3), (2502, 'k147', 0), (2505, 'k150', 3), (2508, 'k153', 0), (2511, 'k156', 3), (2514, 'k2', 0), (2517, 'k5', 3), (2520, 'k8', 0), (2523, 'k11', 3), (2526, 'k14', 0), (2529, 'k17', 3), (2532, 'k20', 0), (2535, 'k23', 3), (2538, 'k26', 0), (2541, 'k29', 3), (2544, 'k32', 0), (2547, 'k35', 3), (2550, 'k38', 0), (2553, 'k41', 3), (2556, 'k44', 0), (2559, 'k47', 3), (2562, 'k50', 0), (2565, 'k53', 3), (2568, 'k56', 0), (2571, 'k59', 3), (2574, 'k62', 0), (2577, 'k65', 3), (2580, 'k68', 0), (2583, 'k71', 3), (2586, 'k74', 0), (2589, 'k77', 3), (2592, 'k80', 0), (2595, 'k83', 3), (2598, 'k86', 0), (2601, 'k89', 3), (2604, 'k92', 0), (2607, 'k95', 3), (2610, 'k98', 0), (2613, 'k101', 3), (2616, 'k104', 0), (2619, 'k107', 3), (2622, 'k110', 0), (2625, 'k113', 3), (2628, 'k116', 0), (2631, 'k119', 3), (2634, 'k122', 0), (2637, 'k125', 3), (2640, 'k128', 0), (2643, 'k131', 3), (2646, 'k134', 0), (2649, 'k137', 3), (2652, 'k140', 0), (2655, 'k143', 3), (2658, 'k146', 0), (2661, 'k149', 3), (2664, 'k152', 0), (2667, 'k155', 3), (2670, 'k1', 0), (2673, 'k4', 3), (2676, 'k7', 0), (2679, 'k10', 3), (2682, 'k13', 0), (2685, 'k16', 3), (2688, 'k19', 0), (2691, 'k22', 3), (2694, 'k25', 0), (2697, 'k28', 3), (2700, 'k31', 0), (2703, 'k34', 3), (2706, 'k37', 0), (2709, 'k40', 3), (2712, 'k43', 0), (2715, 'k46', 3), (2718, 'k49', 0), (2721, 'k52', 3), (2724, 'k55', 0), (2727, 'k58', 3), (2730, 'k61', 0), (2733, 'k64', 3), (2736, 'k67', 0), (2739, 'k70', 3), (2742, 'k73', 0), (2745, 'k76', 3), (2748, 'k79', 0), (2751, 'k82', 3), (2754, 'k85', 0), (2757, 'k88', 3), (2760, 'k91', 0), (2763, 'k94', 3), (2766, 'k97', 0), (2769, 'k100', 3), (2772, 'k103', 0), (2775, 'k106', 3), (2778, 'k109', 0), (2781, 'k112', 3), (2784, 'k115', 0), (2787, 'k118', 3), (2790, 'k121', 0), (2793, 'k124', 3), (2796, 'k127', 0), (2799, 'k130', 3), (2802, 'k133', 0), (2805, 'k136', 3), (2808, 'k139', 0), (2811, 'k142', 3), (2814, 'k145', 0), (2817, 'k148', 3), (2820, 'k151', 0), (2823, 'k154', 3), (2826, 'k0', 0), (2829, 'k3', 3), (2832, 'k6', 0), (2835, 'k9', 3), (2838, 'k12', 0), (2841, 'k15', 3), (2844, 'k18', 0), (2847, 'k21', 3), (2850, 'k24', 0), (2853, 'k27', 3), (2856, 'k30', 0), (2859, 'k33', 3), (2862, 'k36', 0), (2865, 'k39', 3), (2868, 'k42', 0), (2871, 'k45', 3), (2874, 'k48', 0), (2877, 'k51', 3), (2880, 'k54', 0), (2883, 'k57', 3), (2886, 'k60', 0), (2889, 'k63', 3), (2892, 'k66', 0), (2895, 'k69', 3), (2898, 'k72', 0), (2901, 'k75', 3), (2904, 'k78', 0), (2907, 'k81', 3), (2910, 'k84', 0), (2913, 'k87', 3), (2916, 'k90', 0), (2919, 'k93', 3), (2922, 'k96', 0), (2925, 'k99', 3), (2928, 'k102', 0), (2931, 'k105', 3), (2934, 'k108', 0), (2937, 'k111', 3), (2940, 'k114', 0), (2943, 'k117', 3), (2946, 'k120', 0), (2949, 'k123', 3), (2952, 'k126', 0), (2955, 'k129', 3), (2958, 'k132', 0), (2961, 'k135', 3), (2964, 'k138', 0), (2967, 'k141', 3), (2970, 'k144', 0), (2973, 'k147', 3), (2976, 'k150', 0), (2979, 'k153', 3), (2982, 'k156', 0), (2985, 'k2', 3), (2988, 'k5', 0), (2991, 'k8', 3), (2994, 'k11', 0), (2997, 'k14', 3), (3000, 'k17', 0);
+SELECT B, COUNT(*), SUM(D) FROM R GROUP BY B;
+SELECT C, COUNT(DISTINCT B), MIN(A), MAX(D) FROM R GROUP BY C;
+SELECT COUNT(DISTINCT B), SUM(DISTINCT D) FROM R;
+SET HASH_JOIN OFF;
+SET INDEX_JOIN OFF;
+SELECT S.G, COUNT(*), SUM(R.D) FROM R, S WHERE R.B = S.K GROUP BY S.G;
+SELECT R.A, S.K, S.G FROM R, S WHERE R.C = S.C AND R.B = S.K;
+SET INDEX_JOIN ON;
+SET HASH_JOIN ON;
@@ -0,0 +1,94 @@
+import pytest
+import subprocess
+
+from ddb.db import DatabaseManager
+from ddb.session import Session
+from ddb.primitives import ValType
+from ddb.planner import Planner
+from ddb.executor import TmpFilePool, util
+from ddb.executor.util import ExtSortBuffer, heap_merge, loser_tree_merge
+
+testcase_dir = "tests/merge/"
+T = 1
+
+@pytest.fixture(params=[False, True])
+def session(request):
+    # spilled sorts merge their runs the same way with either merge:
+    Planner.options.loser_tree_merge = request.param
+    dbm = DatabaseManager(
+        db_dir = DatabaseManager.DEFAULT_DB_DIR,
+        tmp_dir = DatabaseManager.DEFAULT_TMP_DIR
+    )
+    s = Session(dbm)
+    yield s
+    Planner.options = Planner.Options()
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_merge_{t_id}")
+
+@pytest.mark.parametrize("merge", [heap_merge, loser_tree_merge])
+@pytest.mark.parametrize("lengths", [
+    [],
+    [0],
+    [7],
+    [0, 0, 0],
+    [5, 0, 3],
+    [1, 2, 3, 4, 5],
+    [40, 1, 0, 17, 33, 2, 9],
+    [20] * 16,
+])
+def test_merge(merge, lengths):
+    # rows come out in key order; rows with equal keys come out in source order, and in order within a source:
+    sources = [ sorted(((i*31%11, f's{s}r{i}') for i in range(length)), key=lambda row: row[0])
+                for s, length in enumerate(lengths) ]
+    merged = list(merge([ iter(source) for source in sources ], lambda row: row[0]))
+    assert merged == sorted((row for source in sources for row in source), key=lambda row: row[0])
+
+@pytest.mark.parametrize("merge", [heap_merge, loser_tree_merge])
+def test_merge_reads_lazily(merge):
+    # a merge only reads ahead one row per source, so a consumer stopping early leaves the rest unread:
+    reads = [0, 0, 0]
+    def source(s):
+        for i in range(1000):
+            reads[s] += 1
+            yield (i*3 + s, )
+    merged = merge([ source(s) for s in range(3) ], lambda row: row[0])
+    assert [ next(merged) for _ in range(10) ] == [ (i, ) for i in range(10) ]
+    assert sum(reads) <= 10 + 3
+
+@pytest.mark.parametrize("loser_tree_fan_in", [None, 2, 1000])
+def test_sort_buffer_merge(session, loser_tree_fan_in):
+    # whichever merge a sort uses (also in intermediate passes), the result is the same:
+    subprocess.run(['make', 'clean'], check=True)
+    rows = [ (i*7919%1000, f'v{i}') for i in range(8000) ]
+    with session.dbm.tm.begin_transaction(read_only=False, tmp=True) as tmp_tx:
+        tmp_files = TmpFilePool(session.dbm.sm, tmp_tx)
+        buffer = ExtSortBuffer(None, lambda level, run: tmp_files.acquire([ValType.INTEGER, ValType.VARCHAR]), tmp_files.release,
+                               num_memory_blocks=4, key=lambda row: row[0], loser_tree_fan_in=loser_tree_fan_in)
+        for row in rows:
+            buffer.add(row)
+        assert list(buffer.iter_and_clear()) == sorted(rows, key=lambda row: row[0])
+
+@pytest.mark.parametrize("loser_tree_merge", ["on", "off"])
+def test_loser_tree_merge_option(run, capsys, monkeypatch, loser_tree_merge):
+    # the option decides which merge a spilled GROUP BY sort uses:
+    subprocess.run(['make', 'clean'], check=True)
+    merges = { 'heap_merge': 0, 'loser_tree_merge': 0 }
+    for name in merges:
+        def counting_merge(sources, key, name=name, merge=getattr(util, name)):
+            merges[name] += 1
+            return merge(sources, key)
+        monkeypatch.setattr(util, name, counting_merge)
+    for r in run(f'SET LOSER_TREE_MERGE {loser_tree_merge};' +
+                 'CREATE TABLE R(A INT, B INT);' +
+                 'INSERT INTO R VALUES ' + ', '.join(f'({i}, {i*7919%3001})' for i in range(8000)) + ';'):
+        assert r.error is None, r.error_details
+    capsys.readouterr()
+    r, = run('SELECT B, COUNT(*) FROM R GROUP BY B;')
+    assert r.error is None, r.error_details
+    assert len(capsys.readouterr().out.split("\n")[1:-1]) == 3001
+    if loser_tree_merge == 'on':
+        assert merges['loser_tree_merge'] > 0
+    else:
+        assert merges['loser_tree_merge'] == 0 and merges['heap_merge'] > 0
@@ -0,0 +1,10 @@
+CREATE TABLE R(A INT, B INT, C VARCHAR);
+INSERT INTO R VALUES (0, 0, 'r0'), (1, 7, 'r1'), (2, 14, 'r2'), (3, 21, 'r3'), (4, 28, 'r4'), (5, 35, 'r5'), (6, 42, 'r6'), (7, 49, 'r7'), (8, 56, 'r8'), (9, 63, 'r9'), (10, 70, 'r10'), (11, 77, 'r11'), (12, 84, 'r12'), (13, 91, 'r13'), (14, 98, 'r14'), (15, 4, 'r15'), (16, 11, 'r16'), (17, 18, 'r17'), (18, 25, 'r18'), (19, 32, 'r19'), (20, 39, 'r20'), (21, 46, 'r21'), (22, 53, 'r22'), (23, 60, 'r23'), (24, 67, 'r24'), (25, 74, 'r25'), (26, 81, 'r26'), (27, 88, 'r27'), (28, 95, 'r28'), (29, 1, 'r29'), (30, 8, 'r30'), (31, 15, 'r31'), (32, 22, 'r32'), (33, 29, 'r33'), (34, 36, 'r34'), (35, 43, 'r35'), (36, 50, 'r36'), (37, 57, 'r0'), (38, 64, 'r1'), (39, 71, 'r2'), (40, 78, 'r3'), (41, 85, 'r4'), (42, 92, 'r5'), (43, 99, 'r6'), (44, 5, 'r7'), (45, 12, 'r8'), (46, 19, 'r9'), (47, 26, 'r10'), (48, 33, 'r11'), (49, 40, 'r12'), (50, 47, 'r13'), (51, 54, 'r14'), (52, 61, 'r15'), (53, 68, 'r16'), (54, 75, 'r17'), (55, 82, 'r18'), (56, 89, 'r19'), (57, 96, 'r20'), (58, 2, 'r21'), (59, 9, 'r22'), (60, 16, 'r23'), (61, 23, 'r24'), (62, 30, 'r25'), (63, 37, 'r26'), (64, 44, 'r27'), (65, 51, 'r28'), (66, 58, 'r29'), (67, 65, 'r30'), (68, 72, 'r31'), (69, 79, 'r32'), (70, 86, 'r33'), (71, 93, 'r34'), (72, 100, 'r35'), (73, 6, 'r36'), (74, 13, 'r0'), (75, 20, 'r1'), (76, 27, 'r2'), (77, 34, 'r3'), (78, 41, 'r4'), (79, 48, 'r5'), (80, 55, 'r6'), (81, 62, 'r7'), (82, 69, 'r8'), (83, 76, 'r9'), (84, 83, 'r10'), (85, 90, 'r11'), (86, 97, 'r12'), (87, 3, 'r13'), (88, 10, 'r14'), (89, 17, 'r15'), (90, 24, 'r16'), (91, 31, 'r17'), (92, 38, 'r18'), (93, 45, 'r19'), (94, 52, 'r20'), (95, 59, 'r21'), (96, 66, 'r22'), (97, 73, 'r23'), (98, 80, 'r24'), (99, 87, 'r25'), (100, 94, 'r26'), (101, 0, 'r27'), (102, 7, 'r28'), (103, 14, 'r29'), (104, 21, 'r30'), (105, 28, 'r31'), (106, 35, 'r32'), (107, 42, 'r33'), (108, 49, 'r34'), (109, 56, 'r35'), (110, 63, 'r36'), (111, 70, 'r0'), (112, 77, 'r1'), (113, 84, 'r2'), (114, 91, 'r3'), (115, 98, 'r4'), (116, 4, 'r5'), (117, 11, 'r6'), (118, 18, 'r7'), (119, 25, 'r8'), (120, 32, 'r9'), (121, 39, 'r10'), (122, 46, 'r11'), (123, 53, 'r12'), (124, 60, 'r13'), (125, 67, 'r14'), (126, 74, 'r15'), (127, 81, 'r16'), (128, 88, 'r17'), (129, 95, 'r18'), (130, 1, 'r19'), (131, 8, 'r20'), (132, 15, 'r21'), (133, 22, 'r22'), (134, 29, 'r23'), (135, 36, 'r24'), (136, 43, 'r25'), (137, 50, 'r26'), (138, 57, 'r27'), (139, 64, 'r28'), (140, 71, 'r29'), (141, 78, 'r30'), (142, 85, 'r31'), (143, 92, 'r32'), (144, 99, 'r33'), (145, 5, 'r34'), (146, 12, 'r35'), (147, 19, 'r36'), (148, 26, 'r0'), (149, 33, 'r1'), (150, 40, 'r2'), (151, 47, 'r3'), (152, 54, 'r4'), (153, 61, 'r5'), (154, 68, 'r6'), (155, 75, 'r7'), (156, 82, 'r8'), (157, 89, 'r9'), (158, 96, 'r10'), (159, 2, 'r11'), (160, 9, 'r12'), (161, 16, 'r13'), (162, 23, 'r14'), (163, 30, 'r15'), (164, 37, 'r16'), (165, 44, 'r17'), (166, 51, 'r18'), (167, 58, 'r19'), (168, 65, 'r20'), (169, 72, 'r21'), (170, 79, 'r22'), (171, 86, 'r23'), (172, 93, 'r24'), (173, 100, 'r25'), (174, 6, 'r26'), (175, 13, 'r27'), (176, 20, 'r28'), (177, 27, 'r29'), (178, 34, 'r30'), (179, 41, 'r31'), (180, 48, 'r32'), (181, 55, 'r33'), (182, 62, 'r34'), (183, 69, 'r35'), (184, 76, 'r36'), (185, 83, 'r0'), (186, 90, 'r1'), (187, 97, 'r2'), (188, 3, 'r3'), (189, 10, 'r4'), (190, 17, 'r5'), (191, 24, 'r6'), (192, 31, 'r7'), (193, 38, 'r8'), (194, 45, 'r9'), (195, 52, 'r10'), (196, 59, 'r11'), (197, 66, 'r12'), (198, 73, 'r13'), (199, 80, 'r14'), (200, 87, 'r15'), (201, 94, 'r16'), (202, 0, 'r17'), (203, 7, 'r18'), (204, 14, 'r19'), (205, 21, 'r20'), (206, 28, 'r21'), (207, 35, 'r22'), (208, 42, 'r23'), (209, 49, 'r24'), (210, 56, 'r25'), (211, 63, 'r26'), (212, 70, 'r27'), (213, 77, 'r28'), (214, 84, 'r29'), (215, 91, 'r30'), (216, 98, 'r31'), (217, 4, 'r32'), (218, 11, 'r33'), (219, 18, 'r34'), (220, 25, 'r35'), (221, 32, 'r36'), (222, 39, 'r0'), (223, 46, 'r1'), (224, 53, 'r2'), (225, 60, 'r3'), (226, 67, 'r4'), (227, 74, 'r5'), (228, 81, 'r6'), (229, 88, 'r7'), (230, 95, 'r8'), (231, 1, 'r9'), (232, 8, 'r10'), (233, 15, 'r11'), (234, 22, 'r12'), (235, 29, 'r13'), (236, 36, 'r14'), (237, 43, 'r15'), (238, 50, 'r16'), (239, 57, 'r17'), (240, 64, 'r18'), (241, 71, 'r19'), (242, 78, 'r20'), (243, 85, 'r21'), (244, 92, 'r22'), (245, 99, 'r23'), (246, 5, 'r24'), (247, 12, 'r25'), (248, 19, 'r26'), (249, 26, 'r27'), (250, 33, 'r28'), (251, 40, 'r29'), (252, 47, 'r30'), (253, 54, 'r31'), (254, 61, 'r32'), (255, 68, 'r33'), (256, 75, 'r34'), (257, 82, 'r35'), (258, 89, 'r36'), (259, 96, 'r0'), (260, 2, 'r1'), (261, 9, 'r2'), (262, 16, 'r3'), (263, 23, 'r4'), (264, 30, 'r5'), (265, 37, 'r6'), (266, 44, 'r7'), (267, 51, 'r8'), (268, 58, 'r9'), (269, 65, 'r10'), (270, 72, 'r11'), (271, 79, 'r12'), (272, 86, 'r13'), (273, 93, 'r14'), (274, 100, 'r15'), (275, 6, 'r16'), (276, 13, 'r17'), (277, 20, 'r18'), (278, 27, 'r19'), (279, 34, 'r20'), (280, 41, 'r21'), (281, 48, 'r22'), (282, 55, 'r23'), (283, 62, 'r24'), (284, 69, 'r25'), (285, 76, 'r26'), (286, 83, 'r27'), (287, 90, 'r28'), (288, 97, 'r29'), (289, 3, 'r30'), (290, 10, 'r31'), (291, 17, 'r32'), (292, 24, 'r33'), (293, 31, 'r34'), (294, 38, 'r35'), (295, 45, 'r36'), (296, 52, 'r0'), (297, 59, 'r1'), (298, 66, 'r2'), (299, 73, 'r3'), (300, 80, 'r4'), (301, 87, 'r5'), (302, 94, 'r6'), (303, 0, 'r7'), (304, 7, 'r8'), (305, 14, 'r9'), (306, 21, 'r10'), (307, 28, 'r11'), (308, 35, 'r12'), (309, 42, 'r13'), (310, 49, 'r14'), (311, 56, 'r15'), (312, 63, 'r16'), (313, 70, 'r17'), (314, 77, 'r18'), (315, 84, 'r19'), (316, 91, 'r20'), (317, 98, 'r21'), (318, 4, 'r22'), (319, 11, 'r23'), (320, 18, 'r24'), (321, 25, 'r25'), (322, 32, 'r26'), (323, 39, 'r27'), (324, 46, 'r28'), (325, 53, 'r29'), (326, 60, 'r30'), (327, 67, 'r31'), (328, 74, 'r32'), (329, 81, 'r33'), (330, 88, 'r34'), (331, 95, 'r35'), (332, 1, 'r36'), (333, 8, 'r0'), (334, 15, 'r1'), (335, 22, 'r2'), (336, 29, 'r3'), (337, 36, 'r4'), (338, 43, 'r5'), (339, 50, 'r6'), (340, 57, 'r7'), (341, 64, 'r8'), (342, 71, 'r9'), (343, 78, 'r10'), (344, 85, 'r11'), (345, 92, 'r12'), (346, 99, 'r13'), (347, 5, 'r14'), (348, 12, 'r15'), (349, 19, 'r16'), (350, 26, 'r17'), (351, 33, 'r18'), (352, 40, 'r19'), (353, 47, 'r20'), (354, 54, 'r21'), (355, 61, 'r22'), (356, 68, 'r23'), (357, 75, 'r24'), (358, 82, 'r25'), (359, 89, 'r26'), (360, 96, 'r27'), (361, 2, 'r28'), (362, 9, 'r29'), (363, 16, 'r30'), (364, 23, 'r31'), (365, 30, 'r32'), (366, 37, 'r33'), (367, 44, 'r34'), (368, 51, 'r35'), (369, 58, 'r36'), (370, 65, 'r0'), (371, 72, 'r1'), (372, 79, 'r2'), (373, 86, 'r3'), (374, 93, 'r4'), (375, 100, 'r5'), (376, 6, 'r6'), (377, 13, 'r7'), (378, 20, 'r8'), (379, 27, 'r9'), (380, 34, 'r10'), (381, 41, 'r11'), (382, 48, 'r12'), (383, 55, 'r13'), (384, 62, 'r14'), (385, 69, 'r15'), (386, 76, 'r16'), (387, 83, 'r17'), (388, 90, 'r18'), (389, 97, 'r19'), (390, 3, 'r20'), (391, 10, 'r21'), (392, 17, 'r22'), (393, 24, 'r23'), (394, 31, 'r24'), (395, 38, 'r25'), (396, 45, 'r26'), (397, 52, 'r27'), (398, 59, 'r28'), (399, 66, 'r29'), (400, 73, 'r30'), (401, 80, 'r31'), (402, 87, 'r32'), (403, 94, 'r33'), (404, 0, 'r34'), (405, 7, 'r35'), (406, 14, 'r36'), (407, 21, 'r0'), (408, 28, 'r1'), (409, 35, 'r2'), (410, 42, 'r3'), (411, 49, 'r4'), (412, 56, 'r5'), (413, 63, 'r6'), (414, 70, 'r7'), (415, 77, 'r8'), (416, 84, 'r9'), (417, 91, 'r10'), (418, 98, 'r11'), (419, 4, 'r12'), (420, 11, 'r13'), (421, 18, 'r14'), (422, 25, 'r15'), (423, 32, 'r16'), (424, 39, 'r17'), (425, 46, 'r18'), (426, 53, 'r19'), (427, 60, 'r20'), (428, 67, 'r21'), (429, 74, 'r22'), (430, 81, 'r23'), (431, 88, 'r24'), (432, 95, 'r25'), (433, 1, 'r26'), (434, 8, 'r27'), (435, 15, 'r28'), (436, 22, 'r29'), (437, 29, 'r30'), (438, 36, 'r31'), (439, 43, 'r32'), (440, 50, 'r33'), (441, 57, 'r34'), (442, 64, 'r35'), (443, 71, 'r36'), (444, 78, 'r0'), (445, 85, 'r1'), (446, 92, 'r2'), (447, 99, 'r3'), (448, 5, 'r4'), (449, 12, 'r5'), (450, 19, 'r6'), (451, 26, 'r7'), (452, 33, 'r8'), (453, 40, 'r9'), (454, 47, 'r10'), (455, 54, 'r11'), (456, 61, 'r12'), (457, 68, 'r13'), (458, 75, 'r14'), (459, 82, 'r15'), (460, 89, 'r16'), (461, 96, 'r17'), (462, 2, 'r18'), (463, 9, 'r19'), (464, 16, 'r20'), (465, 23, 'r21'), (466, 30, 'r22'), (467, 37, 'r23'), (468, 44, 'r24'), (469, 51, 'r25'), (470, 58, 'r26'), (471, 65, 'r27'), (472, 72, 'r28'), (473, 79, 'r29'), (474, 86, 'r30'), (475, 93, 'r31'), (476, 100, 'r32'), (477, 6, 'r33'), (478, 13, 'r34'), (479, 20, 'r35'), (480, 27, 'r36'), (481, 34, 'r0'), (482, 41, 'r1'), (483, 48, 'r2'), (484, 55, 'r3'), (485, 62, 'r4'), (486, 69, 'r5'), (487, 76, 'r6'), (488, 83, 'r7'), (489, 90, 'r8'), (490, 97, 'r9'), (491, 3, 'r10'), (492, 10, 'r11'), (493, 17, 'r12'), (494, 24, 'r13'), (495, 31, 'r14'), (496, 38, 'r15'), (497, 45, 'r16'), (498, 52, 'r17'), (499, 59, 'r18'), (500, 66, 'r19'), (501, 73, 'r20'), (502, 80, 'r21'), (503, 87, 'r22'), (504, 94, 'r23'), (505, 0, 'r24'), (506, 7, 'r25'), (507, 14, 'r26'), (508, 21, 'r27'), (509, 28, 'r28'), (510, 35, 'r29'), (511, 42, 'r30'), (512, 49, 'r31'), (513, 56, 'r32'), (514, 63, 'r33'), (515, 70, 'r34'), (516, 77, 'r35'), (517, 84, 'r36'), (518, 91, 'r0'), (519, 98, 'r1'), (520, 4, 'r2'), (521, 11, 'r3'), (522, 18, 'r4'), (523, 25, 'r5'), (524, 32, 'r6'), (525, 39, 'r7'), (526, 46, 'r8'), (527, 53, 'r9'), (528, 60, 'r10'), (529, 67, 'r11'), (530, 74, 'r12'), (531, 81, 'r13'), (532, 88, 'r14'), (533, 95, 'r15'), (534, 1, 'r16'), (535, 8, 'r17'), (536, 15, 'r18'), (537, 22, 'r19'), (538, 29, 'r20'), (539, 36, 'r21'), (540, 43, 'r22'), (541, 50, 'r23'), (542, 57, 'r24'), (543, 64, 'r25'), (544, 71, 'r26'), (545, 78, 'r27'), (546, 85, 'r28'), (547, 92, 'r29'), (548, 99, 'r30'), (549, 5, 'r31'), (550, 12, 'r32'), (551, 19, 'r33'), (552, 26, 'r34'), (553, 33, 'r35'), (554, 40, 'r36'), (555, 47, 'r0'), (556, 54, 'r1'), (557, 61, 'r2'), (558, 68, 'r3'), (559, 75, 'r4'), (560, 82, 'r5'), (561, 89, 'r6'), (562, 96, 'r7'), (563, 2, 'r8'), (564, 9, 'r9'), (565, 16, 'r10'), (566, 23, 'r11'), (567, 30, 'r12'), (568, 37, 'r13'), (569, 44, 'r14'), (570, 51, 'r15'), (571, 58, 'r16'), (572, 65, 'r17'), (573, 72, 'r18'), (574, 79, 'r19'), (575, 86, 'r20'), (576, 93, 'r21'), (577, 100, 'r22'), (578, 6, 'r23'), (579, 13, 'r24'), (580, 20, 'r25'), (581, 27, 'r26'), (582, 34, 'r27'), (583, 41, 'r28'), (584, 48, 'r29'), (585, 55, 'r30'), (586, 62, 'r31'), (587, 69, 'r32'), (588, 76, 'r33'), (589, 83, 'r34'), (590, 90, 'r35'), (591, 97, 'r36'), (592, 3, 'r0'), (593, 10, 'r1'), (594, 17, 'r2'), (595, 24, 'r3'), (596, 31, 'r4'), (597, 38, 'r5'), (598, 45, 'r6'), (599, 52, 'r7'), (600, 59, 'r8'), (601, 66, 'r9'), (602, 73, 'r10'), (603, 80, 'r11'), (604, 87, 'r12'), (605, 94, 'r13'), (606, 0, 'r14'), (607, 7, 'r15'), (608, 14, 'r16'), (609, 21, 'r17'), (610, 28, 'r18'), (611, 35, 'r19'), (612, 42, 'r20'), (613, 49, 'r21'), (614, 56, 'r22'), (615, 63, 'r23'), (616, 70, 'r24'), (617, 77, 'r25'), (618, 84, 'r26'), (619, 91, 'r27'), (620, 98, 'r28'), (621, 4, 'r29'), (622, 11, 'r30'), (623, 18, 'r31'), (624, 25, 'r32'), (625, 32, 'r33'), (626, 39, 'r34'), (627, 46, 'r35'), (628, 53, 'r36'), (629, 60, 'r0'), (630, 67, 'r1'), (631, 74, 'r2'), (632, 81, 'r3'), (633, 88, 'r4'), (634, 95, 'r5'), (635, 1, 'r6'), (636, 8, 'r7'), (637, 15, 'r8'), (638, 22, 'r9'), (639, 29, 'r10'), (640, 36, 'r11'), (641, 43, 'r12'), (642, 50, 'r13'), (643, 57, 'r14'), (644, 64, 'r15'), (645, 71, 'r16'), (646, 78, 'r17'), (647, 85, 'r18'), (648, 92, 'r19'), (649, 99, 'r20'), (650, 5, 'r21'), (651, 12, 'r22'), (652, 19, 'r23'), (653, 26, 'r24'), (654, 33, 'r25'), (655, 40, 'r26'), (656, 47, 'r27'), (657, 54, 'r28'), (658, 61, 'r29'), (659, 68, 'r30'), (660, 75, 'r31'), (661, 82, 'r32'), (662, 89, 'r33'), (663, 96, 'r34'), (664, 2, 'r35'), (665, 9, 'r36'), (666, 16, 'r0'), (667, 23, 'r1'), (668, 30, 'r2'), (669, 37, 'r3'), (670, 44, 'r4'), (671, 51, 'r5'), (672, 58, 'r6'), (673, 65, 'r7'), (674, 72, 'r8'), (675, 79, 'r9'), (676, 86, 'r10'), (677, 93, 'r11'), (678, 100, 'r12'), (679, 6, 'r13'), (680, 13, 'r14'), (681, 20, 'r15'), (682, 27, 'r16'), (683, 34, 'r17'), (684, 41, 'r18'), (685, 48, 'r19'), (686, 55, 'r20'), (687, 62, 'r21'), (688, 69, 'r22'), (689, 76, 'r23'), (690, 83, 'r24'), (691, 90, 'r25'), (692, 97, 'r26'), (693, 3, 'r27'), (694, 10, 'r28'), (695, 17, 'r29'), (696, 24, 'r30'), (697, 31, 'r31'), (698, 38, 'r32'), (699, 45, 'r33'), (700, 52, 'r34'), (701, 59, 'r35'), (702, 66, 'r36'), (703, 73, 'r0'), (704, 80, 'r1'), (705, 87, 'r2'), (706, 94, 'r3'), (707, 0, 'r4'), (708, 7, 'r5'), (709, 14, 'r6'), (710, 21, 'r7'), (711, 28, 'r8'), (712, 35, 'r9'), (713, 42, 'r10'), (714, 49, 'r11'), (715, 56, 'r12'), (716, 63, 'r13'), (717, 70, 'r14'), (718, 77, 'r15'), (719, 84, 'r16'), (720, 91, 'r17'), (721, 98, 'r18'), (722, 4, 'r19'), (723, 11, 'r20'), (724, 18, 'r21'), (725, 25, 'r22'), (726, 32, 'r23'), (727, 39, 'r24'), (728, 46, 'r25'), (729, 53, 'r26'), (730, 60, 'r27'), (731, 67, 'r28'), (732, 74, 'r29'), (733, 81, 'r30'), (734, 88, 'r31'), (735, 95, 'r32'), (736, 1, 'r33'), (737, 8, 'r34'), (738, 15, 'r35'), (739, 22, 'r36'), (740, 29, 'r0'), (741, 36, 'r1'), (742, 43, 'r2'), (743, 50, 'r3'), (744, 57, 'r4'), (745, 64, 'r5'), (746, 71, 'r6'), (747, 78, 'r7'), (748, 85, 'r8'), (749, 92, 'r9'), (750, 99, 'r10'), (751, 5, 'r11'), (752, 12, 'r12'), (753, 19, 'r13'), (754, 26, 'r14'), (755, 33, 'r15'), (756, 40, 'r16'), (757, 47, 'r17'), (758, 54, 'r18'), (759, 61, 'r19'), (760, 68, 'r20'), (761, 75, 'r21'), (762, 82, 'r22'), (763, 89, 'r23'), (764, 96, 'r24'), (765, 2, 'r25'), (766, 9, 'r26'), (767, 16, 'r27'), (768, 23, 'r28'), (769, 30, 'r29'), (770, 37, 'r30'), (771, 44, 'r31'), (772, 51, 'r32'), (773, 58, 'r33'), (774, 65, 'r34'), (775, 72, 'r35'), (776, 79, 'r36'), (777, 86, 'r0'), (778, 93, 'r1'), (779, 100, 'r2'), (780, 6, 'r3'), (781, 13, 'r4'), (782, 20, 'r5'), (783, 27, 'r6'), (784, 34, 'r7'), (785, 41, 'r8'), (786, 48, 'r9'), (787, 55, 'r10'), (788, 62, 'r11'), (789, 69, 'r12'), (790, 76, 'r13'), (791, 83, 'r14'), (792, 90, 'r15'), (793, 97, 'r16'), (794, 3, 'r17'), (795, 10, 'r18'), (796, 17, 'r19'), (797, 24, 'r20'), (798, 31, 'r21'), (799, 38, 'r22'), (800, 45, 'r23'), (801, 52, 'r24'), (802, 59, 'r25'), (803, 66, 'r26'), (804, 73, 'r27'), (805, 80, 'r28'), (806, 87, 'r29'), (807, 94, 'r30'), (808, 0, 'r31'), (809, 7, 'r32'), (810, 14, 'r33'), (811, 21, 'r34'), (812, 28, 'r35'), (813, 35, 'r36'), (814, 42, 'r0'), (815, 49, 'r1'), (816, 56, 'r2'), (817, 63, 'r3'), (818, 70, 'r4'), (819, 77, 'r5'), (820, 84, 'r6'), (821, 91, 'r7'), (822, 98, 'r8'), (823, 4, 'r9'), (824, 11, 'r10'), (825, 18, 'r11'), (826, 25, 'r12'), (827, 32, 'r13'), (828, 39, 'r14'), (829, 46, 'r15'), (830, 53, 'r16'), (831, 60, 'r17'), (832, 67, 'r18'), (833, 74, 'r19'), (834, 81, 'r20'), (835, 88, 'r21'), (836, 95, 'r22'), (837, 1, 'r23'), (838, 8, 'r24'), (839, 15, 'r25'), (840, 22, 'r26'), (841, 29, 'r27'), (842, 36, 'r28'), (843, 43, 'r29'), (844, 50, 'r30'), (845, 57, 'r31'), (846, 64, 'r32'), (847, 71, 'r33'), (848, 78, 'r34'), (849, 85, 'r35'), (850, 92, 'r36'), (851, 99, 'r0'), (852, 5, 'r1'), (853, 12, 'r2'), (854, 19, 'r3'), (855, 26, 'r4'), (856, 33, 'r5'), (857, 40, 'r6'), (858, 47, 'r7'), (859, 54, 'r8'), (860, 61, 'r9'), (861, 68, 'r10'), (862, 75, 'r11'), (863, 82, 'r12'), (864, 89, 'r13'), (865, 96, 'r14'), (866, 2, 'r15'), (867, 9, 'r16'), (868, 16, 'r17'), (869, 23, 'r18'), (870, 30, 'r19'), (871, 37, 'r20'), (872, 44, 'r21'), (873, 51, 'r22'), (874, 58, 'r23'), (875, 65, 'r24'), (876, 72, 'r25'), (877, 79, 'r26'), (878, 86, 'r27'), (879, 93, 'r28'), (880, 100, 'r29'), (881, 6, 'r30'), (882, 13, 'r31'), (883, 20, 'r32'), (884, 27, 'r33'), (885, 34, 'r34'), (886, 41, 'r35'), (887, 48, 'r36'), (888, 55, 'r0'), (889, 62, 'r1'), (890, 69, 'r2'), (891, 76, 'r3'), (892, 83, 'r4'), (893, 90, 'r5'), (894, 97, 'r6'), (895, 3, 'r7'), (896, 10, 'r8'), (897, 17, 'r9'), (898, 24, 'r10'), (899, 31, 'r11'), (900, 38, 'r12'), (901, 45, 'r13'), (902, 52, 'r14'), (903, 59, 'r15'), (904, 66, 'r16'), (905, 73, 'r17'), (906, 80, 'r18'), (907, 87, 'r19'), (908, 94, 'r20'), (909, 0, 'r21'), (910, 7, 'r22'), (911, 14, 'r23'), (912, 21, 'r24'), (913, 28, 'r25'), (914, 35, 'r26'), (915, 42, 'r27'), (916, 49, 'r28'), (917, 56, 'r29'), (918, 63, 'r30'), (919, 70, 'r31'), (920, 77, 'r32'), (921, 84, 'r33'), (922, 91, 'r34'), (923, 98, 'r35'), (924, 4, 'r36'), (925, 11, 'r0'), (926, 18, 'r1'), (927, 25, 'r2'), (928, 32, 'r3'), (929, 39, 'r4'), (930, 46, 'r5'), (931, 53, 'r6'), (932, 60, 'r7'), (933, 67, 'r8'), (934, 74, 'r9'), (935, 81, 'r10'), (936, 88, 'r11'), (937, 95, 'r12'), (938, 1, 'r13'), (939, 8, 'r14'), (940, 15, 'r15'), (941, 22, 'r16'), (942, 29, 'r17'), (943, 36, 'r18'), (944, 43, 'r19'), (945, 50, 'r20'), (946, 57, 'r21'), (947, 64, 'r22'), (948, 71, 'r23'), (949, 78, 'r24'), (950, 85, 'r25'), (951, 92, 'r26'), (952, 99, 'r27'), (953, 5, 'r28'), (954, 12, 'r29'), (955, 19, 'r30'), (956, 26, 'r31'), (957, 33, 'r32'), (958, 40, 'r33'), (959, 47, 'r34'), (960, 54, 'r35'), (961, 61, 'r36'), (962, 68, 'r0'), (963, 75, 'r1'), (964, 82, 'r2'), (965, 89, 'r3'), (966, 96, 'r4'), (967, 2, 'r5'), (968, 9, 'r6'), (969, 16, 'r7'), (970, 23, 'r8'), (971, 30, 'r9'), (972, 37, 'r10'), (973, 44, 'r11'), (974, 51, 'r12'), (975, 58, 'r13'), (976, 65, 'r14'), (977, 72, 'r15'), (978, 79, 'r16'), (979, 86, 'r17'), (980, 93, 'r18'), (981, 100, 'r19'), (982, 6, 'r20'), (983, 13, 'r21'), (984, 20, 'r22'), (985, 27, 'r23'), (986, 34, 'r24'), (987, 41, 'r25'), (988, 48, 'r26'), (989, 55, 'r27'), (990, 62, 'r28'), (991, 69, 'r29'), (992, 76, 'r30'), (993, 83, 'r31'), (994, 90, 'r32'), (995, 97, 'r33'), (996, 3, 'r34'), (997, 10, 'r35'), (998, 17, 'r36'), (999, 24, 'r0'), (1000, 31, 'r1'), (1001, 38, 'r2'), (1002, 45, 'r3'), (1003, 52, 'r4'), (1004, 59, 'r5'), (1005, 66, 'r6'), (1006, 73, 'r7'), (1007, 80, 'r8'), (1008, 87, 'r9'), (1009, 94, 'r10'), (1010, 0, 'r11'), (1011, 7, 'r12'), (1012, 14, 'r13'), (1013, 21, 'r14'), (1014, 28, 'r15'), (1015, 35, 'r16'), (1016, 42, 'r17'), (1017, 49, 'r18'), (1018, 56, 'r19'), (1019, 63, 'r20'), (1020, 70, 'r21'), (1021, 77, 'r22'), (1022, 84, 'r23'), (1023, 91, 'r24'), (1024, 98, 'r25'), (1025, 4, 'r26'), (1026, 11, 'r27'), (1027, 18, 'r28'), (1028, 25, 'r29'), (1029, 32, 'r30'), (1030, 39, 'r31'), (1031, 46, 'r32'), (1032, 53, 'r33'), (1033, 60, 'r34'), (1034, 67, 'r35'), (1035, 74, 'r36'), (1036, 81, 'r0'), (1037, 88, 'r1'), (1038, 95, 'r2'), (1039, 1, 'r3'), (1040, 8, 'r4'), (1041, 15, 'r5'), (1042, 22, 'r6'), (1043, 29, 'r7'), (1044, 36, 'r8'), (1045, 43, 'r9'), (1046, 50, 'r10'), (1047, 57, 'r11'), (1048, 64, 'r12'), (1049, 71, 'r13'), (1050, 78, 'r14'), (1051, 85, 'r15'), (1052, 92, 'r16'), (1053, 99, 'r17'), (1054, 5, 'r18'), (1055, 12, 'r19'), (1056, 19, 'r20'), (1057, 26, 'r21'), (1058, 33, 'r22'), (1059, 40, 'r23'), (1060, 47, 'r24'), (1061, 54, 'r25'), (1062, 61, 'r26'), (1063, 68, 'r27'), (1064, 75, 'r28'), (1065, 82, 'r29'), (1066, 89, 'r30'), (1067, 96, 'r31'), (1068, 2, 'r32'), (1069, 9, 'r33'), (1070, 16, 'r34'), (1071, 23, 'r35'), (1072, 30, 'r36'), (1073, 37, 'r0'), (1074, 44, 'r1'), (1075, 51, 'r2'), (1076, 58, 'r3'), (1077, 65, 'r4'), (1078, 72, 'r5'), (1079, 79, 'r6'), (1080, 86, 'r7'), (1081, 93, 'r8'), (1082, 100, 'r9'), (1083, 6, 'r10'), (1084, 13, 'r11'), (1085, 20, 'r12'), (1086, 27, 'r13'), (1087, 34, 'r14'), (1088, 41, 'r15'), (1089, 48, 'r16'), (1090, 55, 'r17'), (1091, 62, 'r18'), (1092, 69, 'r19'), (1093, 76, 'r20'), (1094, 83, 'r21'), (1095, 90, 'r22'), (1096, 97, 'r23'), (1097, 3, 'r24'), (1098, 10, 'r25'), (1099, 17, 'r26'), (1100, 24, 'r27'), (1101, 31, 'r28'), (1102, 38, 'r29'), (1103, 45, 'r30'), (1104, 52, 'r31'), (1105, 59, 'r32'), (1106, 66, 'r33'), (1107, 73, 'r34'), (1108, 80, 'r35'), (1109, 87, 'r36'), (1110, 94, 'r0'), (1111, 0, 'r1'), (1112, 7, 'r2'), (1113, 14, 'r3'), (1114, 21, 'r4'), (1115, 28, 'r5'), (1116, 35, 'r6'), (1117, 42, 'r7'), (1118, 49, 'r8'), (1119, 56, 'r9'), (1120, 63, 'r10'), (1121, 70, 'r11'), (1122, 77, 'r12'), (1123, 84, 'r13'), (1124, 91, 'r14'), (1125, 98, 'r15'), (1126, 4, 'r16'), (1127, 11, 'r17'), (1128, 18, 'r18'), (1129, 25, 'r19'), (1130, 32, 'r20'), (1131, 39, 'r21'), (1132, 46, 'r22'), (1133, 53, 'r23'), (1134, 60, 'r24'), (1135, 67, 'r25'), (1136, 74, 'r26'), (1137, 81, 'r27'), (1138, 88, 'r28'), (1139, 95, 'r29'), (1140, 1, 'r30'), (1141, 8, 'r31'), (1142, 15, 'r32'), (1143, 22, 'r33'), (1144, 29, 'r34'), (1145, 36, 'r35'), (1146, 43, 'r36'), (1147, 50, 'r0'), (1148, 57, 'r1'), (1149, 64, 'r2'), (1150, 71, 'r3'), (1151, 78, 'r4'), (1152, 85, 'r5'), (1153, 92, 'r6'), (1154, 99, 'r7'), (1155, 5, 'r8'), (1156, 12, 'r9'), (1157, 19, 'r10'), (1158, 26, 'r11'), (1159, 33, 'r12'), (1160, 40, 'r13'), (1161, 47, 'r14'), (1162, 54, 'r15'), (1163, 61, 'r16'), (1164, 68, 'r17'), (1165, 75, 'r18'), (1166, 82, 'r19'), (1167, 89, 'r20'), (1168, 96, 'r21'), (1169, 2, 'r22'), (1170, 9, 'r23'), (1171, 16, 'r24'), (1172, 23, 'r25'), (1173, 30, 'r26'), (1174, 37, 'r27'), (1175, 44, 'r28'), (1176, 51, 'r29'), (1177, 58, 'r30'), (1178, 65, 'r31'), (1179, 72, 'r32'), (1180, 79, 'r33'), (1181, 86, 'r34'), (1182, 93, 'r35'), (1183, 100, 'r36'), (1184, 6, 'r0'), (1185, 13, 'r1'), (1186, 20, 'r2'), (1187, 27, 'r3'), (1188, 34, 'r4'), (1189, 41, 'r5'), (1190, 48, 'r6'), (1191, 55, 'r7'), (1192, 62, 'r8'), (1193, 69, 'r9'), (1194, 76, 'r10'), (1195, 83, 'r11'), (1196, 90, 'r12'), (1197, 97, 'r13'), (1198, 3, 'r14'), (1199, 10, 'r15'), (1200, 17, 'r16'), (1201, 24, 'r17'), (1202, 31, 'r18'), (1203, 38, 'r19'), (1204, 45, 'r20'), (1205, 52, 'r21'), (1206, 59, 'r22'), (1207, 66, 'r23'), (1208, 73, 'r24'), (1209, 80, 'r25'), (1210, 87, 'r26'), (1211, 94, 'r27'), (1212, 0, 'r28'), (1213, 7, 'r29'), (1214, 14, 'r30'), (1215, 21, 'r31'), (1216, 28, 'r32'), (1217, 35, 'r33'), (1218, 42, 'r34'), (1219, 49, 'r35'), (1220, 56, 'r36'), (1221, 63, 'r0'), (1222, 70, 'r1'), (1223, 77, 'r2'), (1224, 84, 'r3'), (1225, 91, 'r4'), (1226, 98, 'r5'), (1227, 4, 'r6'), (1228, 11, 'r7'), (1229, 18, 'r8'), (1230, 25, 'r9'), (1231, 32, 'r10'), (1232, 39, 'r11'), (1233, 46, 'r12'), (1234, 53, 'r13'), (1235, 60, 'r14'), (1236, 67, 'r15'), (1237, 74, 'r16'), (1238, 81, 'r17'), (1239, 88, 'r18'), (1240, 95, 'r19'), (1241, 1, 'r20'), (1242, 8, 'r21'), (1243, 15, 'r22'), (1244, 22, 'r23'), (1245, 29, 'r24'), (1246, 36, 'r25'), (1247, 43, 'r26'), (1248, 50, 'r27'), (1249, 57, 'r28'), (1250, 64, 'r29'), (1251, 71, 'r30'), (1252, 78, 'r31'), (1253, 85, 'r32'), (1254, 92, 'r33'), (1255, 99, 'r34'), (1256, 5, 'r35'), (1257, 12, 'r36'), (1258, 19, 'r0'), (1259, 26, 'r1'), (1260, 33, 'r2'), (1261, 40, 'r3'), (1262, 47, 'r4'), (1263, 54, 'r5'), (1264, 61, 'r6'), (1265, 68, 'r7'), (1266, 75, 'r8'), (1267, 82, 'r9'), (1268, 89, 'r10'), (1269, 96, 'r11'), (1270, 2, 'r12'), (1271, 9, 'r13'), (1272, 16, 'r14'), (1273, 23, 'r15'), (1274, 30, 'r16'), (1275, 37, 'r17'), (1276, 44, 'r18'), (1277, 51, 'r19'), (1278, 58, 'r20'), (1279, 65, 'r21'), (1280, 72, 'r22'), (1281, 79, 'r23'), (1282, 86, 'r24'), (1283, 93, 'r25'), (1284, 100, 'r26'), (1285, 6, 'r27'), (1286, 13, 'r28'), (1287, 20, 'r29'), (1288, 27, 'r30'), (1289, 34, 'r31'), (1290, 41, 'r32'), (1291, 48, 'r33'), (1292, 55, 'r34'), (1293, 62, 'r35'), (1294, 69, 'r36'), (1295, 76, 'r0'), (1296, 83, 'r1'), (1297, 90, 'r2'), (1298, 97, 'r3'), (1299, 3, 'r4'), (1300, 10, 'r5'), (1301, 17, 'r6'), (1302, 24, 'r7'), (1303, 31, 'r8'), (1304, 38, 'r9'), (1305, 45, 'r10'), (1306, 52, 'r11'), (1307, 59, 'r12'), (1308, 66, 'r13'), (1309, 73, 'r14'), (1310, 80, 'r15'), (1311, 87, 'r16'), (1312, 94, 'r17'), (1313, 0, 'r18'), (1314, 7, 'r19'), (1315, 14, 'r20'), (1316, 21, 'r21'), (1317, 28, 'r22'), (1318, 35, 'r23'), (1319, 42, 'r24'), (1320, 49, 'r25'), (1321, 56, 'r26'), (1322, 63, 'r27'), (1323, 70, 'r28'), (1324, 77, 'r29'), (1325, 84, 'r30'), (1326, 91, 'r31'), (1327, 98, 'r32'), (1328, 4, 'r33'), (1329, 11, 'r34'), (1330, 18, 'r35'), (1331, 25, 'r36'), (1332, 32, 'r0'), (1333, 39, 'r1'), (1334, 46, 'r2'), (1335, 53, 'r3'), (1336, 60, 'r4'), (1337, 67, 'r5'), (1338, 74, 'r6'), (1339, 81, 'r7'), (1340, 88, 'r8'), (1341, 95, 'r9'), (1342, 1, 'r10'), (1343, 8, 'r11'), (1344, 15, 'r12'), (1345, 22, 'r13'), (1346, 29, 'r14'), (1347, 36, 'r15'), (1348, 43, 'r16'), (1349, 50, 'r17'), (1350, 57, 'r18'), (1351, 64, 'r19'), (1352, 71, 'r20'), (1353, 78, 'r21'), (1354, 85, 'r22'), (1355, 92, 'r23'), (1356, 99, 'r24'), (1357, 5, 'r25'), (1358, 12, 'r26'), (1359, 19, 'r27'), (1360, 26, 'r28'), (1361, 33, 'r29'), (1362, 40, 'r30'), (1363, 47, 'r31'), (1364, 54, 'r32'), (1365, 61, 'r33'), (1366, 68, 'r34'), (1367, 75, 'r35'), (1368, 82, 'r36'), (1369, 89, 'r0'), (1370, 96, 'r1'), (1371, 2, 'r2'), (1372, 9, 'r3'), (1373, 16, 'r4'), (1374, 23, 'r5'), (1375, 30, 'r6'), (1376, 37, 'r7'), (1377, 44, 'r8'), (1378, 51, 'r9'), (1379, 58, 'r10'), (1380, 65, 'r11'), (1381, 72, 'r12'), (1382, 79, 'r13'), (1383, 86, 'r14'), (1384, 93, 'r15'), (1385, 100, 'r16'), (1386, 6, 'r17'), (1387, 13, 'r18'), (1388, 20, 'r19'), (1389, 27, 'r20'), (1390, 34, 'r21'), (1391, 41, 'r22'), (1392, 48, 'r23'), (1393, 55, 'r24'), (1394, 62, 'r25'), (1395, 69, 'r26'), (1396, 76, 'r27'), (1397, 83, 'r28'), (1398, 90, 'r29'), (1399, 97, 'r30'), (1400, 3, 'r31'), (1401, 10, 'r32'), (1402, 17, 'r33'), (1403, 24, 'r34'), (1404, 31, 'r35'), (1405, 38, 'r36'), (1406, 45, 'r0'), (1407, 52, 'r1'), (1408, 59, 'r2'), (1409, 66, 'r3'), (1410, 73, 'r4'), (1411, 80, 'r5'), (1412, 87, 'r6'), (1413, 94, 'r7'), (1414, 0, 'r8'), (1415, 7, 'r9'), (1416, 14, 'r10'), (1417, 21, 'r11'), (1418, 28, 'r12'), (1419, 35, 'r13'), (1420, 42, 'r14'), (1421, 49, 'r15'), (1422, 56, 'r16'), (1423, 63, 'r17'), (1424, 70, 'r18'), (1425, 77, 'r19'), (1426, 84, 'r20'), (1427, 91, 'r21'), (1428, 98, 'r22'), (1429, 4, 'r23'), (1430, 11, 'r24'), (1431, 18, 'r25'), (1432, 25, 'r26'), (1433, 32, 'r27'), (1434, 39, 'r28'), (1435, 46, 'r29'), (1436, 53, 'r30'), (1437, 60, 'r31'), (1438, 67, 'r32'), (1439, 74, 'r33'), (1440, 81, 'r34'), (1441, 88, 'r35'), (1442, 95, 'r36'), (1443, 1, 'r0'), (1444, 8, 'r1'), (1445, 15, 'r2'), (1446, 22, 'r3'), (1447, 29, 'r4'), (1448, 36, 'r5'), (1449, 43, 'r6'), (1450, 50, 'r7'), (1451, 57, 'r8'), (1452, 64, 'r9'), (1453, 71, 'r10'), (1454, 78, 'r11'), (1455, 85, 'r12'), (1456, 92, 'r13'), (1457, 99, 'r14'), (1458, 5, 'r15'), (1459, 12, 'r16'), (1460, 19, 'r17'), (1461, 26, 'r18'), (1462, 33, 'r19'), (1463, 40, 'r20'), (1464, 47, 'r21'), (1465, 54, 'r22'), (1466, 61, 'r23'), (1467, 68, 'r24'), (1468, 75, 'r25'), (1469, 82, 'r26'), (1470, 89, 'r27'), (1471, 96, 'r28'), (1472, 2, 'r29'), (1473, 9, 'r30'), (1474, 16, 'r31'), (1475, 23, 'r32'), (1476, 30, 'r33'), (1477, 37, 'r34'), (1478, 44, 'r35'), (1479, 51, 'r36'), (1480, 58, 'r0'), (1481, 65, 'r1'), (1482, 72, 'r2'), (1483, 79, 'r3'), (1484, 86, 'r4'), (1485, 93, 'r5'), (1486, 100, 'r6'), (1487, 6, 'r7'), (1488, 13, 'r8'), (1489, 20, 'r9'), (1490, 27, 'r10'), (1491, 34, 'r11'), (1492, 41, 'r12'), (1493, 48, 'r13'), (1494, 55, 'r14'), (1495, 62, 'r15'), (1496, 69, 'r16'), (1497, 76, 'r17'), (1498, 83, 'r18'), (1499, 90, 'r19'), (1500, 97, 'r20'), (1501, 3, 'r21'), (1502, 10, 'r22'), (1503, 17, 'r23'), (1504, 24, 'r24'), (1505, 31, 'r25'), (1506, 38, 'r26'), (1507, 45, 'r27'), (1508, 52, 'r28'), (1509, 59, 'r29'), (1510, 66, 'r30'), (1511, 73, 'r31'), (1512, 80, 'r32'), (1513, 87, 'r33'), (1514, 94, 'r34'), (1515, 0, 'r35'), (1516, 7, 'r36'), (1517, 14, 'r0'), (1518, 21, 'r1'), (1519, 28, 'r2'), (1520, 35, 'r3'), (1521, 42, 'r4'), (1522, 49, 'r5'), (1523, 56, 'r6'), (1524, 63, 'r7'), (1525, 70, 'r8'), (1526, 77, 'r9'), (1527, 84, 'r10'), (1528, 91, 'r11'), (1529, 98, 'r12'), (1530, 4, 'r13'), (1531, 11, 'r14'), (1532, 18, 'r15'), (1533, 25, 'r16'), (1534, 32, 'r17'), (1535, 39, 'r18'), (1536, 46, 'r19'), (1537, 53, 'r20'), (1538, 60, 'r21'), (1539, 67, 'r22'), (1540, 74, 'r23'), (1541, 81, 'r24'), (1542, 88, 'r25'), (1543, 95, 'r26'), (1544, 1, 'r27'), (1545, 8, 'r28'), (1546, 15, 'r29'), (1547, 22, 'r30'), (1548, 29, 'r31'), (1549, 36, 'r32'), (1550, 43, 'r33'), (1551, 50, 'r34'), (1552, 57, 'r35'), (1553, 64, 'r36'), (1554, 71, 'r0'), (1555, 78, 'r1'), (1556, 85, 'r2'), (1557, 92, 'r3'), (1558, 99, 'r4'), (1559, 5, 'r5'), (1560, 12, 'r6'), (1561, 19, 'r7'), (1562, 26, 'r8'), (1563, 33, 'r9'), (1564, 40, 'r10'), (1565, 47, 'r11'), (1566, 54, 'r12'), (1567, 61, 'r13'), (1568, 68, 'r14'), (1569, 75, 'r15'), (1570, 82, 'r16'), (1571, 89, 'r17'), (1572, 96, 'r18'), (1573, 2, 'r19'), (1574, 9, 'r20'), (1575, 16, 'r21'), (1576, 23, 'r22'), (1577, 30, 'r23'), (1578, 37, 'r24'), (1579, 44, 'r25'), (1580, 51, 'r26'), (1581, 58, 'r27'), (1582, 65, 'r28'), (1583, 72, 'r29'), (1584, 79, 'r30'), (1585, 86, 'r31'), (1586, 93, 'r32'), (1587, 100, 'r33'), (1588, 6, 'r34'), (1589, 13, 'r35'), (1590, 20, 'r36'), (1591, 27, 'r0'), (1592, 34, 'r1'), (1593, 41, 'r2'), (1594, 48, 'r3'), (1595, 55, 'r4'), (1596, 62, 'r5'), (1597, 69, 'r6'), (1598, 76, 'r7'), (1599, 83, 'r8'), (1600, 90, 'r9'), (1601, 97, 'r10'), (1602, 3, 'r11'), (1603, 10, 'r12'), (1604, 17, 'r13'), (1605, 24, 'r14'), (1606, 31, 'r15'), (1607, 38, 'r16'), (1608, 45, 'r17'), (1609, 52, 'r18'), (1610, 59, 'r19'), (1611, 66, 'r20'), (1612, 73, 'r21'), (1613, 80, 'r22'), (1614, 87, 'r23'), (1615, 94, 'r24'), (1616, 0, 'r25'), (1617, 7, 'r26'), (1618, 14, 'r27'), (1619, 21, 'r28'), (1620, 28, 'r29'), (1621, 35, 'r30'), (1622, 42, 'r31'), (1623, 49, 'r32'), (1624, 56, 'r33'), (1625, 63, 'r34'), (1626, 70, 'r35'), (1627, 77, 'r36'), (1628, 84, 'r0'), (1629, 91, 'r1'), (1630, 98, 'r2'), (1631, 4, 'r3'), (1632, 11, 'r4'), (1633, 18, 'r5'), (1634, 25, 'r6'), (1635, 32, 'r7'), (1636, 39, 'r8'), (1637, 46, 'r9'), (1638, 53, 'r10'), (1639, 60, 'r11'), (1640, 67, 'r12'), (1641, 74, 'r13'), (1642, 81, 'r14'), (1643, 88, 'r15'), (1644, 95, 'r16'), (1645, 1, 'r17'), (1646, 8, 'r18'), (1647, 15, 'r19'), (1648, 22, 'r20'), (1649, 29, 'r21'), (1650, 36, 'r22'), (1651, 43, 'r23'), (1652, 50, 'r24'), (1653, 57, 'r25'), (1654, 64, 'r26'), (1655, 71, 'r27'), (1656, 78, 'r28'), (1657, 85, 'r29'), (1658, 92, 'r30'), (1659, 99, 'r31'), (1660, 5, 'r32'), (1661, 12, 'r33'), (1662, 19, 'r34'), (1663, 26, 'r35'), (1664, 33, 'r36'), (1665, 40, 'r0'), (1666, 47, 'r1'), (1667, 54, 'r2'), (1668, 61, 'r3'), (1669, 68, 'r4'), (1670, 75, 'r5'), (1671, 82, 'r6'), (1672, 89, 'r7'), (1673, 96, 'r8'), (1674, 2, 'r9'), (1675, 9, 'r10'), (1676, 16, 'r11'), (1677, 23, 'r12'), (1678, 30, 'r13'), (1679, 37, 'r14'), (1680, 44, 'r15'), (1681, 51, 'r16'), (1682, 58, 'r17'), (1683, 65, 'r18'), (1684, 72, 'r19'), (1685, 79, 'r20'), (1686, 86, 'r21'), (1687, 93, 'r22'), (1688, 100, 'r23'), (1689, 6, 'r24'), (1690, 13, 'r25'), (1691, 20, 'r26'), (1692, 27, 'r27'), (1693, 34, 'r28'), (1694, 41, 'r29'), (1695, 48, 'r30'), (1696, 55, 'r31'), (1697, 62, 'r32'), (1698, 69, 'r33'), (1699, 76, 'r34'), (1700, 83, 'r35'), (1701, 90, 'r36'), (1702, 97, 'r0'), (1703, 3, 'r1'), (1704, 10, 'r2'), (1705, 17, 'r3'), (1706, 24, 'r4'), (1707, 31, 'r5'), (1708, 38, 'r6'), (1709, 45, 'r7'), (1710, 52, 'r8'), (1711, 59, 'r9'), (1712, 66, 'r10'), (1713, 73, 'r11'), (1714, 80, 'r12'), (1715, 87, 'r13'), (1716, 94, 'r14'), (1717, 0, 'r15'), (1718, 7, 'r16'), (1719, 14, 'r17'), (1720, 21, 'r18'), (1721, 28, 'r19'), (1722, 35, 'r20'), (1723, 42, 'r21'), (1724, 49, 'r22'), (1725, 56, 'r23'), (1726, 63, 'r24'), (1727, 70, 'r25'), (1728, 77, 'r26'), (1729, 84, 'r27'), (1730, 91, 'r28'), (1731, 98, 'r29'), (1732, 4, 'r30'), (1733, 11, 'r31'), (1734, 18, 'r32'), (1735, 25, 'r33'), (1736, 32, 'r34'), (1737, 39, 'r35'), (1738, 46, 'r36'), (1739, 53, 'r0'), (1740, 60, 'r1'), (1741, 67, 'r2'), (1742, 74, 'r3'), (1743, 81, 'r4'), (1744, 88, 'r5'), (1745, 95, 'r6'), (1746, 1, 'r7'), (1747, 8, 'r8'), (1748, 15, 'r9'), (1749, 22, 'r10'), (1750, 29, 'r11'), (1751, 36, 'r12'), (1752, 43, 'r13'), (1753, 50, 'r14'), (1754, 57, 'r15'), (1755, 64, 'r16'), (1756, 71, 'r17'), (1757, 78, 'r18'), (1758, 85, 'r19'), (1759, 92, 'r20'), (1760, 99, 'r21'), (1761, 5, 'r22'), (1762, 12, 'r23'), (1763, 19, 'r24'), (1764, 26, 'r25'), (1765, 33, 'r26'), (1766, 40, 'r27'), (1767, 47, 'r28'), (1768, 54, 'r29'), (1769, 61, 'r30'), (1770, 68, 'r31'), (1771, 75, 'r32'), (1772, 82, 'r33'), (1773, 89, 'r34'), (1774, 96, 'r35'), (1775, 2, 'r36'), (1776, 9, 'r0'), (1777, 16, 'r1'), (1778, 23, 'r2'), (1779, 30, 'r3'), (1780, 37, 'r4'), (1781, 44, 'r5'), (1782, 51, 'r6'), (1783, 58, 'r7'), (1784, 65, 'r8'), (1785, 72, 'r9'), (1786, 79, 'r10'), (1787, 86, 'r11'), (1788, 93, 'r12'), (1789, 100, 'r13'), (1790, 6, 'r14'), (1791, 13, 'r15'), (1792, 20, 'r16'), (1793, 27, 'r17'), (1794, 34, 'r18'), (1795, 41, 'r19'), (1796, 48, 'r20'), (1797, 55, 'r21'), (1798, 62, 'r22'), (1799, 69, 'r23'), (1800, 76, 'r24'), (1801, 83, 'r25'), (1802, 90, 'r26'), (1803, 97, 'r27'), (1804, 3, 'r28'), (1805, 10, 'r29'), (1806, 17, 'r30'), (1807, 24, 'r31'), (1808, 31, 'r32'), (1809, 38, 'r33'), (1810, 45, 'r34'), (1811, 52, 'r35'), (1812, 59, 'r36'), (1813, 66, 'r0'), (1814, 73, 'r1'), (1815, 80, 'r2'), (1816, 87, 'r3'), (1817, 94, 'r4'), (1818, 0, 'r5'), (1819, 7, 'r6'), (1820, 14, 'r7'), (1821, 21, 'r8'), (1822, 28, 'r9'), (1823, 35, 'r10'), (1824, 42, 'r11'), (1825, 49, 'r12'), (1826, 56, 'r13'), (1827, 63, 'r14'), (1828, 70, 'r15'), (1829, 77, 'r16'), (1830, 84, 'r17'), (1831, 91, 'r18'), (1832, 98, 'r19'), (1833, 4, 'r20'), (1834, 11, 'r21'), (1835, 18, 'r22'), (1836, 25, 'r23'), (1837, 32, 'r24'), (1838, 39, 'r25'), (1839, 46, 'r26'), (1840, 53, 'r27'), (1841, 60, 'r28'), (1842, 67, 'r29'), (1843, 74, 'r30'), (1844, 81, 'r31'), (1845, 88, 'r32'), (1846, 95, 'r33'), (1847, 1, 'r34'), (1848, 8, 'r35'), (1849, 15, 'r36'), (1850, 22, 'r0'), (1851, 29, 'r1'), (1852, 36, 'r2'), (1853, 43, 'r3'), (1854, 50, 'r4'), (1855, 57, 'r5'), (1856, 64, 'r6'), (1857, 71, 'r7'), (1858, 78, 'r8'), (1859, 85, 'r9'), (1860, 92, 'r10'), (1861, 99, 'r11'), (1862, 5, 'r12'), (1863, 12, 'r13'), (1864, 19, 'r14'), (1865, 26, 'r15'), (1866, 33, 'r16'), (1867, 40, 'r17'), (1868, 47, 'r18'), (1869, 54, 'r19'), (1870, 61, 'r20'), (1871, 68, 'r21'), (1872, 75, 'r22'), (1873, 82, 'r23'), (1874, 89, 'r24'), (1875, 96, 'r25'), (1876, 2, 'r26'), (1877, 9, 'r27'), (1878, 16, 'r28'), (1879, 23, 'r29'), (1880, 30, 'r30'), (1881, 37, 'r31'), (1882, 44, 'r32'), (1883, 51, 'r33'), (1884, 58, 'r34'), (1885, 65, 'r35'), (1886, 72, 'r36'), (1887, 79, 'r0'), (1888, 86, 'r1'), (1889, 93, 'r2'), (1890, 100, 'r3'), (1891, 6, 'r4'), (1892, 13, 'r5'), (1893, 20, 'r6'), (1894, 27, 'r7'), (1895, 34, 'r8'), (1896, 41, 'r9'), (1897, 48, 'r10'), (1898, 55, 'r11'), (1899, 62, 'r12'), (1900, 69, 'r13'), (1901, 76, 'r14'), (1902, 83, 'r15'), (1903, 90, 'r16'), (1904, 97, 'r17'), (1905, 3, 'r18'), (1906, 10, 'r19'), (1907, 17, 'r20'), (1908, 24, 'r21'), (1909, 31, 'r22'), (1910, 38, 'r23'), (1911, 45, 'r24'), (1912, 52, 'r25'), (1913, 59, 'r26'), (1914, 66, 'r27'), (1915, 73, 'r28'), (1916, 80, 'r29'), (1917, 87, 'r30'), (1918, 94, 'r31'), (1919, 0, 'r32'), (1920, 7, 'r33'), (1921, 14, 'r34'), (1922, 21, 'r35'), (1923, 28, 'r36'), (1924, 35, 'r0'), (1925, 42, 'r1'), (1926, 49, 'r2'), (1927, 56, 'r3'), (1928, 63, 'r4'), (1929, 70, 'r5'), (1930, 77, 'r6'), (1931, 84, 'r7'), (1932, 91, 'r8'), (1933, 98, 'r9'), (1934, 4, 'r10'), (1935, 11, 'r11'), (1936, 18, 'r12'), (1937, 25, 'r13'), (1938, 32, 'r14'), (1939, 39, 'r15'), (1940, 46, 'r16'), (1941, 53, 'r17'), (1942, 60, 'r18'), (1943, 67, 'r19'), (1944, 74, 'r20'), (1945, 81, 'r21'), (1946, 88, 'r22'), (1947, 95, 'r23'), (1948, 1, 'r24'), (1949, 8, 'r25'), (1950, 15, 'r26'), (1951, 22, 'r27'), (1952, 29, 'r28'), (1953, 36, 'r29'), (1954, 43, 'r30'), (1955, 50, 'r31'), (1956, 57, 'r32'), (1957, 64, 'r33'), (1958, 71, 'r34'), (1959, 78, 'r35'), (1960, 85, 'r36'), (1961, 92, 'r0'), (1962, 99, 'r1'), (1963, 5, 'r2'), (1964, 12, 'r3'), (1965, 19, 'r4'), (1966, 26, 'r5'), (1967, 33, 'r6'), (1968, 40, 'r7'), (1969, 47, 'r8'), (1970, 54, 'r9'), (1971, 61, 'r10'), (1972, 68, 'r11'), (1973, 75, 'r12'), (1974, 82, 'r13'), (1975, 89, 'r14'), (1976, 96, 'r15'), (1977, 2, 'r16'), (1978, 9, 'r17'), (1979, 16, 'r18'), (1980, 23, 'r19'), (1981, 30, 'r20'), (1982, 37, 'r21'), (1983, 44, 'r22'), (1984, 51, 'r23'), (1985, 58, 'r24'), (1986, 65, 'r25'), (1987, 72, 'r26'), (1988, 79, 'r27'), (1989, 86, 'r28'), (1990, 93, 'r29'), (1991, 100, 'r30'), (1992, 6, 'r31'), (1993, 13, 'r32'), (1994, 20, 'r33'), (1995, 27, 'r34'), (1996, 34, 'r35'), (1997, 41, 'r36'), (1998, 48, 'r0'), (1999, 55, 'r1'), (2000, 62, 'r2'), (2001, 69, 'r3'), (2002, 76, 'r4'), (2003, 83, 'r5'), (2004, 90, 'r6'), (2005, 97, 'r7'), (2006, 3, 'r8'), (2007, 10, 'r9'), (2008, 17, 'r10'), (2009, 24, 'r11'), (2010, 31, 'r12'), (2011, 38, 'r13'), (2012, 45, 'r14'), (2013, 52, 'r15'), (2014, 59, 'r16'), (2015, 66, 'r17'), (2016, 73, 'r18'), (2017, 80, 'r19'), (2018, 87, 'r20'), (2019, 94, 'r21'), (2020, 0, 'r22'), (2021, 7, 'r23'), (2022, 14, 'r24'), (2023, 21, 'r25'), (2024, 28, 'r26'), (2025, 35, 'r27'), (2026, 42, 'r28'), (2027, 49, 'r29'), (2028, 56, 'r30'), (2029, 63, 'r31'), (2030, 70, 'r32'), (2031, 77, 'r33'), (2032, 84, 'r34'), (2033, 91, 'r35'), (2034, 98, 'r36'), (2035, 4, 'r0'), (2036, 11, 'r1'), (2037, 18, 'r2'), (2038, 25, 'r3'), (2039, 32, 'r4'), (2040, 39, 'r5'), (2041, 46, 'r6'), (2042, 53, 'r7'), (2043, 60, 'r8'), (2044, 67, 'r9'), (2045, 74, 'r10'), (2046, 81, 'r11'), (2047, 88, 'r12'), (2048, 95, 'r13'), (2049, 1, 'r14'), (2050, 8, 'r15'), (2051, 15, 'r16'), (2052, 22, 'r17'), (2053, 29, 'r18'), (2054, 36, 'r19'), (2055, 43, 'r20'), (2056, 50, 'r21'), (2057, 57, 'r22'), (2058, 64, 'r23'), (2059, 71, 'r24'), (2060, 78, 'r25'), (2061, 85, 'r26'), (2062, 92, 'r27'), (2063, 99, 'r28'), (2064, 5, 'r29'), (2065, 12, 'r30'), (2066, 19, 'r31'), (2067, 26, 'r32'), (2068, 33, 'r33'), (2069, 40, 'r34'), (2070, 47, 'r35'), (2071, 54, 'r36'), (2072, 61, 'r0'), (2073, 68, 'r1'), (2074, 75, 'r2'), (2075, 82, 'r3'), (2076, 89, 'r4'), (2077, 96, 'r5'), (2078, 2, 'r6'), (2079, 9, 'r7'), (2080, 16, 'r8'), (2081, 23, 'r9'), (2082, 30, 'r10'), (2083, 37, 'r11'), (2084, 44, 'r12'), (2085, 51, 'r13'), (2086, 58, 'r14'), (2087, 65, 'r15'), (2088, 72, 'r16'), (2089, 79, 'r17'), (2090, 86, 'r18'), (2091, 93, 'r19'), (2092, 100, 'r20'), (2093, 6, 'r21'), (2094, 13, 'r22'), (2095, 20, 'r23'), (2096, 27, 'r24'), (2097, 34, 'r25'), (2098, 41, 'r26'), (2099, 48, 'r27'), (2100, 55, 'r28'), (2101, 62, 'r29'), (2102, 69, 'r30'), (2103, 76, 'r31'), (2104, 83, 'r32'), (2105, 90, 'r33'), (2106, 97, 'r34'), (2107, 3, 'r35'), (2108, 10, 'r36'), (2109, 17, 'r0'), (2110, 24, 'r1'), (2111, 31, 'r2'), (2112, 38, 'r3'), (2113, 45, 'r4'), (2114, 52, 'r5'), (2115, 59, 'r6'), (2116, 66, 'r7'), (2117, 73, 'r8'), (2118, 80, 'r9'), (2119, 87, 'r10'), (2120, 94, 'r11'), (2121, 0, 'r12'), (2122, 7, 'r13'), (2123, 14, 'r14'), (2124, 21, 'r15'), (2125, 28, 'r16'), (2126, 35, 'r17'), (2127, 42, 'r18'), (2128, 49, 'r19'), (2129, 56, 'r20'), (2130, 63, 'r21'), (2131, 70, 'r22'), (2132, 77, 'r23'), (2133, 84, 'r24'), (2134, 91, 'r25'), (2135, 98, 'r26'), (2136, 4, 'r27'), (2137, 11, 'r28'), (2138, 18, 'r29'), (2139, 25, 'r30'), (2140, 32, 'r31'), (2141, 39, 'r32'), (2142, 46, 'r33'), (2143, 53, 'r34'), (2144, 60, 'r35'), (2145, 67, 'r36'), (2146, 74, 'r0'), (2147, 81, 'r1'), (2148, 88, 'r2'), (2149, 95, 'r3'), (2150, 1, 'r4'), (2151, 8, 'r5'), (2152, 15, 'r6'), (2153, 22, 'r7'), (2154, 29, 'r8'), (2155, 36, 'r9'), (2156, 43, 'r10'), (2157, 50, 'r11'), (2158, 57, 'r12'), (2159, 64, 'r13'), (2160, 71, 'r14'), (2161, 78, 'r15'), (2162, 85, 'r16'), (2163, 92, 'r17'), (2164, 99, 'r18'), (2165, 5, 'r19'), (2166, 12, 'r20'), (2167, 19, 'r21'), (2168, 26, 'r22'), (2169, 33, 'r23'), (2170, 40, 'r24'), (2171, 47, 'r25'), (2172, 54, 'r26'), (2173, 61, 'r27'), (2174, 68, 'r28'), (2175, 75, 'r29'), (2176, 82, 'r30'), (2177, 89, 'r31'), (2178, 96, 'r32'), (2179, 2, 'r33'), (2180, 9, 'r34'), (2181, 16, 'r35'), (2182, 23, 'r36'), (2183, 30, 'r0'), (2184, 37, 'r1'), (2185, 44, 'r2'), (2186, 51, 'r3'), (2187, 58, 'r4'), (2188, 65, 'r5'), (2189, 72, 'r6'), (2190, 79, 'r7'), (2191, 86, 'r8'), (2192, 93, 'r9'), (2193, 100, 'r10'), (2194, 6, 'r11'), (2195, 13, 'r12'), (2196, 20, 'r13'), (2197, 27, 'r14'), (2198, 34, 'r15'), (2199, 41, 'r16'), (2200, 48, 'r17'), (2201, 55, 'r18'), (2202, 62, 'r19'), (2203, 69, 'r20'), (2204, 76, 'r21'), (2205, 83, 'r22'), (2206, 90, 'r23'), (2207, 97, 'r24'), (2208, 3, 'r25'), (2209, 10, 'r26'), (2210, 17, 'r27'), (2211, 24, 'r28'), (2212, 31, 'r29'), (2213, 38, 'r30'), (2214, 45, 'r31'), (2215, 52, 'r32'), (2216, 59, 'r33'), (2217, 66, 'r34'), (2218, 73, 'r35'), (2219, 80, 'r36'), (2220, 87, 'r0'), (2221, 94, 'r1'), (2222, 0, 'r2'), (2223, 7, 'r3'), (2224, 14, 'r4'), (2225, 21, 'r5'), (2226, 28, 'r6'), (2227, 35, 'r7'), (2228, 42, 'r8'), (2229, 49, 'r9'), (2230, 56, 'r10'), (2231, 63, 'r11'), (2232, 70, 'r12'), (2233, 77, 'r13'), (2234, 84, 'r14'), (2235, 91, 'r15'), (2236, 98, 'r16'), (2237, 4, 'r17'), (2238, 11, 'r18'), (2239, 18, 'r19'), (2240, 25, 'r20'), (2241, 32, 'r21'), (2242, 39, 'r22'), (2243, 46, 'r23'), (2244, 53, 'r24'), (2245, 60, 'r25'), (2246, 67, 'r26'), (2247, 74, 'r27'), (2248, 81, 'r28'), (2249, 88, 'r29'), (2250, 95, 'r30'), (2251, 1, 'r31'), (2252, 8, 'r32'), (2253, 15, 'r33'), (2254, 22, 'r34'), (2255, 29, 'r35'), (2256, 36, 'r36'), (2257, 43, 'r0'), (2258, 50, 'r1'), (2259, 57, 'r2'), (2260, 64, 'r3'), (2261, 71, 'r4'), (2262, 78, 'r5'), (2263, 85, 'r6'), (2264, 92, 'r7'), (2265, 99, 'r8'), (2266, 5, 'r9'), (2267, 12, 'r10'), (2268, 19, 'r11'), (2269, 26, 'r12'), (2270, 33, 'r13'), (2271, 40, 'r14'), (2272, 47, 'r15'), (2273, 54, 'r16'), (2274, 61, 'r17'), (2275, 68, 'r18'), (2276, 75, 'r19'), (2277, 82, 'r20'), (2278, 89, 'r21'), (2279, 96, 'r22'), (2280, 2, 'r23'), (2281, 9, 'r24'), (2282, 16, 'r25'), (2283, 23, 'r26'), (2284, 30, 'r27'), (2285, 37, 'r28'), (2286, 44, 'r29'), (2287, 51, 'r30'), (2288, 58, 'r31'), (2289, 65, 'r32'), (2290, 72, 'r33'), (2291, 79, 'r34'), (2292, 86, 'r35'), (2293, 93, 'r36'), (2294, 100, 'r0'), (2295, 6, 'r1'), (2296, 13, 'r2'), (2297, 20, 'r3'), (2298, 27, 'r4'), (2299, 34, 'r5'), (2300, 41, 'r6'), (2301, 48, 'r7'), (2302, 55, 'r8'), (2303, 62, 'r9'), (2304, 69, 'r10'), (2305, 76, 'r11'), (2306, 83, 'r12'), (2307, 90, 'r13'), (2308, 97, 'r14'), (2309, 3, 'r15'), (2310, 10, 'r16'), (2311, 17, 'r17'), (2312, 24, 'r18'), (2313, 31, 'r19'), (2314, 38, 'r20'), (2315, 45, 'r21'), (2316, 52, 'r22'), (2317, 59, 'r23'), (2318, 66, 'r24'), (2319, 73, 'r25'), (2320, 80, 'r26'), (2321, 87, 'r27'), (2322, 94, 'r28'), (2323, 0, 'r29'), (2324, 7, 'r30'), (2325, 14, 'r31'), (2326, 21, 'r32'), (2327, 28, 'r33'), (2328, 35, 'r34'), (2329, 42, 'r35'), (2330, 49, 'r36'), (2331, 56, 'r0'), (2332, 63, 'r1'), (2333, 70, 'r2'), (2334, 77, 'r3'), (2335, 84, 'r4'), (2336, 91, 'r5'), (2337, 98, 'r6'), (2338, 4, 'r7'), (2339, 11, 'r8'), (2340, 18, 'r9'), (2341, 25, 'r10'), (2342, 32, 'r11'), (2343, 39, 'r12'), (2344, 46, 'r13'), (2345, 53, 'r14'), (2346, 60, 'r15'), (2347, 67, 'r16'), (2348, 74, 'r17'), (2349, 81, 'r18'), (2350, 88, 'r19'), (2351, 95, 'r20'), (2352, 1, 'r21'), (2353, 8, 'r22'), (2354, 15, 'r23'), (2355, 22, 'r24'), (2356, 29, 'r25'), (2357, 36, 'r26'), (2358, 43, 'r27'), (2359, 50, 'r28'), (2360, 57, 'r29'), (2361, 64, 'r30'), (2362, 71, 'r31'), (2363, 78, 'r32'), (2364, 85, 'r33'), (2365, 92, 'r34'), (2366, 99, 'r35'), (2367, 5, 'r36'), (2368, 12, 'r0'), (2369, 19, 'r1'), (2370, 26, 'r2'), (2371, 33, 'r3'), (2372, 40, 'r4'), (2373, 47, 'r5'), (2374, 54, 'r6'), (2375, 61, 'r7'), (2376, 68, 'r8'), (2377, 75, 'r9'), (2378, 82, 'r10'), (2379, 89, 'r11'), (2380, 96, 'r12'), (2381, 2, 'r13'), (2382, 9, 'r14'), (2383, 16, 'r15'), (2384, 23, 'r16'), (2385, 30, 'r17'), (2386, 37, 'r18'), (2387, 44, 'r19'), (2388, 51, 'r20'), (2389, 58, 'r21'), (2390, 65, 'r22'), (2391, 72, 'r23'), (2392, 79, 'r24'), (2393, 86, 'r25'), (2394, 93, 'r26'), (2395, 100, 'r27'), (2396, 6, 'r28'), (2397, 13, 'r29'), (2398, 20, 'r30'), (2399, 27, 'r31'), (2400, 34, 'r32'), (2401, 41, 'r33'), (2402, 48, 'r34'), (2403, 55, 'r35'), (2404, 62, 'r36'), (2405, 69, 'r0'), (2406, 76, 'r1'), (2407, 83, 'r2'), (2408, 90, 'r3'), (2409, 97, 'r4'), (2410, 3, 'r5'), (2411, 10, 'r6'), (2412, 17, 'r7'), (2413, 24, 'r8'), (2414, 31, 'r9'), (2415, 38, 'r10'), (2416, 45, 'r11'), (2417, 52, 'r12'), (2418, 59, 'r13'), (2419, 66, 'r14'), (2420, 73, 'r15'), (2421, 80, 'r16'), (2422, 87, 'r17'), (2423, 94, 'r18'), (2424, 0, 'r19'), (2425, 7, 'r20'), (2426, 14, 'r21'), (2427, 21, 'r22'), (2428, 28, 'r23'), (2429, 35, 'r24'), (2430, 42, 'r25'), (2431, 49, 'r26'), (2432, 56, 'r27'), (2433, 63, 'r28'), (2434, 70, 'r29'), (2435, 77, 'r30'), (2436, 84, 'r31'), (2437, 91, 'r32'), (2438, 98, 'r33'), (2439, 4, 'r34'), (2440, 11, 'r35'), (2441, 18, 'r36'), (2442, 25, 'r0'), (2443, 32, 'r1'), (2444, 39, 'r2'), (2445, 46, 'r3'), (2446, 53, 'r4'), (2447, 60, 'r5'), (2448, 67, 'r6'), (2449, 74, 'r7'), (2450, 81, 'r8'), (2451, 88, 'r9'), (2452, 95, 'r10'), (2453, 1, 'r11'), (2454, 8, 'r12'), (2455, 15, 'r13'), (2456, 22, 'r14'), (2457, 29, 'r15'), (2458, 36, 'r16'), (2459, 43, 'r17'), (2460, 50, 'r18'), (2461, 57, 'r19'), (2462, 64, 'r20'), (2463, 71, 'r21'), (2464, 78, 'r22'), (2465, 85, 'r23'), (2466, 92, 'r24'), (2467, 99, 'r25'), (2468, 5, 'r26'), (2469, 12, 'r27'), (2470, 19, 'r28'), (2471, 26, 'r29'), (2472, 33, 'r30'), (2473, 40, 'r31'), (2474, 47, 'r32'), (2475, 54, 'r33'), (2476, 61, 'r34'), (2477, 68, 'r35'), (2478, 75, 'r36'), (2479, 82, 'r0'), (2480, 89, 'r1'), (2481, 96, 'r2'), (2482, 2, 'r3'), (2483, 9, 'r4'), (2484, 16, 'r5'), (2485, 23, 'r6'), (2486, 30, 'r7'), (2487, 37, 'r8'), (2488, 44, 'r9'), (2489, 51, 'r10'), (2490, 58, 'r11'), (2491, 65, 'r12'), (2492, 72, 'r13'), (2493, 79, 'r14'), (2494, 86, 'r15'), (2495, 93, 'r16'), (2496, 100, 'r17'), (2497, 6, 'r18'), (2498, 13, 'r19'), (2499, 20, 'r20'), (2500, 27, 'r21'), (2501, 34, 'r22'), (2502, 41, 'r23'), (2503, 48, 'r24'), (2504, 55, 'r25'), (2505, 62, 'r26'), (2506, 69, 'r27'), (2507, 76, 'r28'), (2508, 83, 'r29'), (2509, 90, 'r30'), (2510, 97, 'r31'), (2511, 3, 'r32'), (2512, 10, 'r33'), (2513, 17, 'r34'), (2514, 24, 'r35'), (2515, 31, 'r36'), (2516, 38, 'r0'), (2517, 45, 'r1'), (2518, 52, 'r2'), (2519, 59, 'r3'), (2520, 66, 'r4'), (2521, 73, 'r5'), (2522, 80, 'r6'), (2523, 87, 'r7'), (2524, 94, 'r8'), (2525, 0, 'r9'), (2526, 7, 'r10'), (2527, 14, 'r11'), (2528, 21, 'r12'), (2529, 28, 'r13'), (2530, 35, 'r14'), (2531, 42, 'r15'), (2532, 49, 'r16'), (2533, 56, 'r17'), (2534, 63, 'r18'), (2535, 70, 'r19'), (2536, 77, 'r20'), (2537, 84, 'r21'), (2538, 91, 'r22'), (2539, 98, 'r23'), (2540, 4, 'r24'), (2541, 11, 'r25'), (2542, 18, 'r26'), (2543, 25, 'r27'), (2544, 32, 'r28'), (2545, 39, 'r29'), (2546, 46, 'r30'), (2547, 53, 'r31'), (2548, 60, 'r32'), (2549, 67, 'r33'), (2550, 74, 'r34'), (2551, 81, 'r35'), (2552, 88, 'r36'), (2553, 95, 'r0'), (2554, 1, 'r1'), (2555, 8, 'r2'), (2556, 15, 'r3'), (2557, 22, 'r4'), (2558, 29, 'r5'), (2559, 36, 'r6'), (2560, 43, 'r7'), (2561, 50, 'r8'), (2562, 57, 'r9'), (2563, 64, 'r10'), (2564, 71, 'r11'), (2565, 78, 'r12'), (2566, 85, 'r13'), (2567, 92, 'r14'), (2568, 99, 'r15'), (2569, 5, 'r16'), (2570, 12, 'r17'), (2571, 19, 'r18'), (2572, 26, 'r19'), (2573, 33, 'r20'), (2574, 40, 'r21'), (2575, 47, 'r22'), (2576, 54, 'r23'), (2577, 61, 'r24'), (2578, 68, 'r25'), (2579, 75, 'r26'), (2580, 82, 'r27'), (2581, 89, 'r28'), (2582, 96, 'r29'), (2583, 2, 'r30'), (2584, 9, 'r31'), (2585, 16, 'r32'), (2586, 23, 'r33'), (2587, 30, 'r34'), (2588, 37, 'r35'), (2589, 44, 'r36'), (2590, 51, 'r0'), (2591, 58, 'r1'), (2592, 65, 'r2'), (2593, 72, 'r3'), (2594, 79, 'r4'), (2595, 86, 'r5'), (2596, 93, 'r6'), (2597, 100, 'r7'), (2598, 6, 'r8'), (2599, 13, 'r9'), (2600, 20, 'r10'), (2601, 27, 'r11'), (2602, 34, 'r12'), (2603, 41, 'r13'), (2604, 48, 'r14'), (2605, 55, 'r15'), (2606, 62, 'r16'), (2607, 69, 'r17'), (2608, 76, 'r18'), (2609, 83, 'r19'), (2610, 90, 'r20'), (2611, 97, 'r21'), (2612, 3, 'r22'), (2613, 10, 'r23'), (2614, 17, 'r24'), (2615, 24, 'r25'), (2616, 31, 'r26'), (2617, 38, 'r27'), (2618, 45, 'r28'), (2619, 52, 'r29'), (2620, 59, 'r30'), (2621, 66, 'r31'), (2622, 73, 'r32'), (2623, 80, 'r33'), (2624, 87, 'r34'), (2625, 94, 'r35'), (2626, 0, 'r36'), (2627, 7, 'r0'), (2628, 14, 'r1'), (2629, 21, 'r2'), (2630, 28, 'r3'), (2631, 35, 'r4'), (2632, 42, 'r5'), (2633, 49, 'r6'), (2634, 56, 'r7'), (2635, 63, 'r8'), (2636, 70, 'r9'), (2637, 77, 'r10'), (2638, 84, 'r11'), (2639, 91, 'r12'), (2640, 98, 'r13'), (2641, 4, 'r14'), (2642, 11, 'r15'), (2643, 18, 'r16'), (2644, 25, 'r17'), (2645, 32, 'r18'), (2646, 39, 'r19'), (2647, 46, 'r20'), (2648, 53, 'r21'), (2649, 60, 'r22'), (2650, 67, 'r23'), (2651, 74, 'r24'), (2652, 81, 'r25'), (2653, 88, 'r26'), (2654, 95, 'r27'), (2655, 1, 'r28'), (2656, 8, 'r29'), (2657, 15, 'r30'), (2658, 22, 'r31'), (2659, 29, 'r32'), (2660, 36, 'r33'), (2661, 43, 'r34'), (2662, 50, 'r35'), (2663, 57, 'r36'), (2664, 64, 'r0'), (2665, 71, 'r1'), (2666, 78, 'r2'), (2667, 85, 'r3'), (2668, 92, 'r4'), (2669, 99, 'r5'), (2670, 5, 'r6'), (2671, 12, 'r7'), (2672, 19, 'r8'), (2673, 26, 'r9'), (2674, 33, 'r10'), (2675, 40, 'r11'), (2676, 47, 'r12'), (2677, 54, 'r13'), (2678, 61, 'r14'), (2679, 68, 'r15'), (2680, 75, 'r16'), (2681, 82, 'r17'), (2682, 89, 'r18'), (2683, 96, 'r19'), (2684, 2, 'r20'), (2685, 9, 'r21'), (2686, 16, 'r22'), (2687, 23, 'r23'), (2688, 30, 'r24'), (2689, 37, 'r25'), (2690, 44, 'r26'), (2691, 51, 'r27'), (2692, 58, 'r28'), (2693, 65, 'r29'), (2694, 72, 'r30'), (2695, 79, 'r31'), (2696, 86, 'r32'), (2697, 93, 'r33'), (2698, 100, 'r34'), (2699, 6, 'r35'), (2700, 13, 'r36'), (2701, 20, 'r0'), (2702, 27, 'r1'), (2703, 34, 'r2'), (2704, 41, 'r3'), (2705, 48, 'r4'), (2706, 55, 'r5'), (2707, 62, 'r6'), (2708, 69, 'r7'), (2709, 76, 'r8'), (2710, 83, 'r9'), (2711, 90, 'r10'), (2712, 97, 'r11'), (2713, 3, 'r12'), (2714, 10, 'r13'), (2715, 17, 'r14'), (2716, 24, 'r15'), (2717, 31, 'r16'), (2718, 38, 'r17'), (2719, 45, 'r18'), (2720, 52, 'r19'), (2721, 59, 'r20'), (2722, 66, 'r21'), (2723, 73, 'r22'), (2724, 80, 'r23'), (2725, 87, 'r24'), (2726, 94, 'r25'), (2727, 0, 'r26'), (2728, 7, 'r27'), (2729, 14, 'r28'), (2730, 21, 'r29'), (2731, 28, 'r30'), (2732, 35, 'r31'), (2733, 42, 'r32'), (2734, 49, 'r33'), (2735, 56, 'r34'), (2736, 63, 'r35'), (2737, 70, 'r36'), (2738, 77, 'r0'), (2739, 84, 'r1'), (2740, 91, 'r2'), (2741, 98, 'r3'), (2742, 4, 'r4'), (2743, 11, 'r5'), (2744, 18, 'r6'), (2745, 25, 'r7'), (2746, 32, 'r8'), (2747, 39, 'r9'), (2748, 46, 'r10'), (2749, 53, 'r11'), (2750, 60, 'r12'), (2751, 67, 'r13'), (2752, 74, 'r14'), (2753, 81, 'r15'), (2754, 88, 'r16'), (2755, 95, 'r17'), (2756, 1, 'r18'), (2757, 8, 'r19'), (2758, 15, 'r20'), (2759, 22, 'r21'), (2760, 29, 'r22'), (2761, 36, 'r23'), (2762, 43, 'r24'), (2763, 50, 'r25'), (2764, 57, 'r26'), (2765, 64, 'r27'), (2766, 71, 'r28'), (2767, 78, 'r29'), (2768, 85, 'r30'), (2769, 92, 'r31'), (2770, 99, 'r32'), (2771, 5, 'r33'), (2772, 12, 'r34'), (2773, 19, 'r35'), (2774, 26, 'r36'), (2775, 33, 'r0'), (2776, 40, 'r1'), (2777, 47, 'r2'), (2778, 54, 'r3'), (2779, 61, 'r4'), (2780, 68, 'r5'), (2781, 75, 'r6'), (2782, 82, 'r7'), (2783, 89, 'r8'), (2784, 96, 'r9'), (2785, 2, 'r10'), (2786, 9, 'r11'), (2787, 16, 'r12'), (2788, 23, 'r13'), (2789, 30, 'r14'), (2790, 37, 'r15'), (2791, 44, 'r16'), (2792, 51, 'r17'), (2793, 58, 'r18'), (2794, 65, 'r19'), (2795, 72, 'r20'), (2796, 79, 'r21'), (2797, 86, 'r22'), (2798, 93, 'r23'), (2799, 100, 'r24'), (2800, 6, 'r25'), (2801, 13, 'r26'), (2802, 20, 'r27'), (2803, 27, 'r28'), (2804, 34, 'r29'), (2805, 41, 'r30'), (2806, 48, 'r31'), (2807, 55, 'r32'), (2808, 62, 'r33'), (2809, 69, 'r34'), (2810, 76, 'r35'), (2811, 83, 'r36'), (2812, 90, 'r0'), (2813, 97, 'r1'), (2814, 3, 'r2'), (2815, 10, 'r3'), (2816, 17, 'r4'), (2817, 24, 'r5'), (2818, 31, 'r6'), (2819, 38, 'r7'), (2820, 45, 'r8'), (2821, 52, 'r9'), (2822, 59, 'r10'), (2823, 66, 'r11'), (2824, 73, 'r12'), (2825, 80, 'r13'), (2826, 87, 'r14'), (2827, 94, 'r15'), (2828, 0, 'r16'), (2829, 7, 'r17'), (2830, 14, 'r18'), (2831, 21, 'r19'), (2832, 28, 'r20'), (2833, 35, 'r21'), (2834, 42, 'r22'), (2835, 49, 'r23'), (2836, 56, 'r24'), (2837, 63, 'r25'), (2838, 70, 'r26'), (2839, 77, 'r27'), (2840, 84, 'r28'), (2841, 91, 'r29'), (2842, 98, 'r30'), (2843, 4, 'r31'), (2844, 11, 'r32'), (2845, 18, 'r33'), (2846, 25, 'r34'), (2847, 32, 'r35'), (2848, 39, 'r36'), (2849, 46, 'r0'), (2850, 53, 'r1'), (2851, 60, 'r2'), (2852, 67, 'r3'), (2853, 74, 'r4'), (2854, 81, 'r5'), (2855, 88, 'r6'), (2856, 95, 'r7'), (2857, 1, 'r8'), (2858, 8, 'r9'), (2859, 15, 'r10'), (2860, 22, 'r11'), (2861, 29, 'r12'), (2862, 36, 'r13'), (2863, 43, 'r14'), (2864, 50, 'r15'), (2865, 57, 'r16'), (2866, 64, 'r17'), (2867, 71, 'r18'), (2868, 78, 'r19'), (2869, 85, 'r20'), (2870, 92, 'r21'), (2871, 99, 'r22'), (2872, 5, 'r23'), (2873, 12, 'r24'), (2874, 19, 'r25'), (2875, 26, 'r26'), (2876, 33, 'r27'), (2877, 40, 'r28'), (2878, 47, 'r29'), (2879, 54, 'r30'), (2880, 61, 'r31'), (2881, 68, 'r32'), (2882, 75, 'r33'), (2883, 82, 'r34'), (2884, 89, 'r35'), (2885, 96, 'r36'), (2886, 2, 'r0'), (2887, 9, 'r1'), (2888, 16, 'r2'), (2889, 23, 'r3'), (2890, 30, 'r4'), (2891, 37, 'r5'), (2892, 44, 'r6'), (2893, 51, 'r7'), (2894, 58, 'r8'), (2895, 65, 'r9'), (2896, 72, 'r10'), (2897, 79, 'r11'), (2898, 86, 'r12'), (2899, 93, 'r13'), (2900, 100, 'r14'), (2901, 6, 'r15'), (2902, 13, 'r16'), (2903, 20, 'r17'), (2904, 27, 'r18'), (2905, 34, 'r19'), (2906, 41, 'r20'), (2907, 48, 'r21'), (2908, 55, 'r22'), (2909, 62, 'r23'), (2910, 69, 'r24'), (2911, 76, 'r25'), (2912, 83, 'r26'), (2913, 90, 'r27'), (2914, 97, 'r28'), (2915, 3, 'r29'), (2916, 10, 'r30'), (2917, 17, 'r31'), (2918, 24, 'r32'), (2919, 31, 'r33'), (2920, 38, 'r34'), (2921, 45, 'r35'), (2922, 52, 'r36'), (2923, 59, 'r0'), (2924, 66, 'r1'), (2925, 73, 'r2'), (2926, 80, 'r3'), (2927, 87, 'r4'), (2928, 94, 'r5'), (2929, 0, 'r6'), (2930, 7, 'r7'), (2931, 14, 'r8'), (2932, 21, 'r9'), (2933, 28, 'r10'), (2934, 35, 'r11'), (2935, 42, 'r12'), (2936, 49, 'r13'), (2937, 56, 'r14'), (2938, 63, 'r15'), (2939, 70, 'r16'), (2940, 77, 'r17'), (2941, 84, 'r18'), (2942, 91, 'r19'), (2943, 98, 'r20'), (2944, 4, 'r21'), (2945, 11, 'r22'), (2946, 18, 'r23'), (2947, 25, 'r24'), (2948, 32, 'r25'), (2949, 39, 'r26'), (2950, 46, 'r27'), (2951, 53, 'r28'), (2952, 60, 'r29'), (2953, 67, 'r30'), (2954, 74, 'r31'), (2955, 81, 'r32'), (2956, 88, 'r33'), (2957, 95, 'r34'), (2958, 1, 'r35'), (2959, 8, 'r36'), (2960, 15, 'r0'), (2961, 22, 'r1'), (2962, 29, 'r2'), (2963, 36, 'r3'), (2964, 43, 'r4'), (2965, 50, 'r5'), (2966, 57, 'r6'), (2967, 64, 'r7'), (2968, 71, 'r8'), (2969, 78, 'r9'), (2970, 85, 'r10'), (2971, 92, 'r11'), (2972, 99, 'r12'), (2973, 5, 'r13'), (2974, 12, 'r14'), (2975, 19, 'r15'), (2976, 26, 'r16'), (2977, 33, 'r17'), (2978, 40, 'r18'), (2979, 47, 'r19'), (2980, 54, 'r20'), (2981, 61, 'r21'), (2982, 68, 'r22'), (2983, 75, 'r23'), (2984, 82, 'r24'), (2985, 89, 'r25'), (2986, 96, 'r26'), (2987, 2, 'r27'), (2988, 9, 'r28'), (2989, 16, 'r29'), (2990, 23, 'r30'), (2991, 30, 'r31'), (2992, 37, 'r32'), (2993, 44, 'r33'), (2994, 51, 'r34'), (2995, 58, 'r35'), (2996, 65, 'r36'), (2997, 72, 'r0'), (2998, 79, 'r1'), (2999, 86, 'r2'), (3000, 93, 'r3'), (3001, 100, 'r4'), (3002, 6, 'r5'), (3003, 13, 'r6'), (3004, 20, 'r7'), (3005, 27, 'r8'), (3006, 34, 'r9'), (3007, 41, 'r10'), (3008, 48, 'r11'), (3009, 55, 'r12'), (3010, 62, 'r13'), (3011, 69, 'r14'), (3012, 76, 'r15'), (3013, 83, 'r16'), (3014, 90, 'r17'), (3015, 97, 'r18'), (3016, 3, 'r19'), (3017, 10, 'r20'), (3018, 17, 'r21'), (3019, 24, 'r22'), (3020, 31, 'r23'), (3021, 38, 'r24'), (3022, 45, 'r25'), (3023, 52, 'r26'), (3024, 59, 'r27'), (3025, 66, 'r28'), (3026, 73, 'r29'), (3027, 80, 'r30'), (3028, 87, 'r31'), (3029, 94, 'r32'), (3030, 0, 'r33'), (3031, 7, 'r34'), (3032, 14, 'r35'), (3033, 21, 'r36'), (3034, 28, 'r0'), (3035, 35, 'r1'), (3036, 42, 'r2'), (3037, 49, 'r3'), (3038, 56, 'r4'), (3039, 63, 'r5'), (3040, 70, 'r6'), (3041, 77, 'r7'), (3042, 84, 'r8'), (3043, 91, 'r9'), (3044, 98, 'r10'), (3045, 4, 'r11'), (3046, 11, 'r12'), (3047, 18, 'r13'), (3048, 25, 'r14'), (3049, 32, 'r15'), (3050, 39, 'r16'), (3051, 46, 'r17'), (3052, 53, 'r18'), (3053, 60, 'r19'), (3054, 67, 'r20'), (3055, 74, 'r21'), (3056, 81, 'r22'), (3057, 88, 'r23'), (3058, 95, 'r24'), (3059, 1, 'r25'), (3060, 8, 'r26'), (3061, 15, 'r27'), (3062, 22, 'r28'), (3063, 29, 'r29'), (3064, 36, 'r30'), (3065, 43, 'r31'), (3066, 50, 'r32'), (3067, 57, 'r33'), (3068, 64, 'r34'), (3069, 71, 'r35'), (3070, 78, 'r36'), (3071, 85, 'r0'), (3072, 92, 'r1'), (3073, 99, 'r2'), (3074, 5, 'r3'), (3075, 12, 'r4'), (3076, 19, 'r5'), (3077, 26, 'r6'), (3078, 33, 'r7'), (3079, 40, 'r8'), (3080, 47, 'r9'), (3081, 54, 'r10'), (3082, 61, 'r11'), (3083, 68, 'r12'), (3084, 75, 'r13'), (3085, 82, 'r14'), (3086, 89, 'r15'), (3087, 96, 'r16'), (3088, 2, 'r17'), (3089, 9, 'r18'), (3090, 16, 'r19'), (3091, 23, 'r20'), (3092, 30, 'r21'), (3093, 37, 'r22'), (3094, 44, 'r23'), (3095, 51, 'r24'), (3096, 58, 'r25'), (3097, 65, 'r26'), (3098, 72, 'r27'), (3099, 79, 'r28'), (3100, 86, 'r29'), (3101, 93, 'r30'), (3102, 100, 'r31'), (3103, 6, 'r32'), (3104, 13, 'r33'), (3105, 20, 'r34'), (3106, 27, 'r35'), (3107, 34, 'r36'), (3108, 41, 'r0'), (3109, 48, 'r1'), (3110, 55, 'r2'), (3111, 62, 'r3'), (3112, 69, 'r4'), (3113, 76, 'r5'), (3114, 83, 'r6'), (3115, 90, 'r7'), (3116, 97, 'r8'), (3117, 3, 'r9'), (3118, 10, 'r10'), (3119, 17, 'r11'), (3120, 24, 'r12'), (3121, 31, 'r13'), (3122, 38, 'r14'), (3123, 45, 'r15'), (3124, 52, 'r16'), (3125, 59, 'r17'), (3126, 66, 'r18'), (3127, 73, 'r19'), (3128, 80, 'r20'), (3129, 87, 'r21'), (3130, 94, 'r22'), (3131, 0, 'r23'), (3132, 7, 'r24'), (3133, 14, 'r25'), (3134, 21, 'r26'), (3135, 28, 'r27'), (3136, 35, 'r28'), (3137, 42, 'r29'), (3138, 49, 'r30'), (3139, 56, 'r31'), (3140, 63, 'r32'), (3141, 70, 'r33'), (3142, 77, 'r34'), (3143, 84, 'r35'), (3144, 91, 'r36'), (3145, 98, 'r0'), (3146, 4, 'r1'), (3147, 11, 'r2'), (3148, 18, 'r3'), (3149, 25, 'r4'), (3150, 32, 'r5'), (3151, 39, 'r6'), (3152, 46, 'r7'), (3153, 53, 'r8'), (3154, 60, 'r9'), (3155, 67, 'r10'), (3156, 74, 'r11'), (3157, 81, 'r12'), (3158, 88, 'r13'), (3159, 95, 'r14'), (3160, 1, 'r15'), (3161, 8, 'r16'), (3162, 15, 'r17'), (3163, 22, 'r18'), (3164, 29, 'r19'), (3165, 36, 'r20'), (3166, 43, 'r21'), (3167, 50, 'r22'), (3168, 57, 'r23'), (3169, 64, 'r24'), (3170, 71, 'r25'), (3171, 78, 'r26'), (3172, 85, 'r27'), (3173, 92, 'r28'), (3174, 99, 'r29'), (3175, 5, 'r30'), (3176, 12, 'r31'), (3177, 19, 'r32'), (3178, 26, 'r33'), (3179, 33, 'r34'), (3180, 40, 'r35'), (3181, 47, 'r36'), (3182, 54, 'r0'), (3183, 61, 'r1'), (3184, 68, 'r2'), (3185, 75, 'r3'), (3186, 82, 'r4'), (3187, 89, 'r5'), (3188, 96, 'r6'), (3189, 2, 'r7'), (3190, 9, 'r8'), (3191, 16, 'r9'), (3192, 23, 'r10'), (3193, 30, 'r11'), (3194, 37, 'r12'), (3195, 44, 'r13'), (3196, 51, 'r14'), (3197, 58, 'r15'), (3198, 65, 'r16'), (3199, 72, 'r17'), (3200, 79, 'r18'), (3201, 86, 'r19'), (3202, 93, 'r20'), (3203, 100, 'r21'), (3204, 6, 'r22'), (3205, 13, 'r23'), (3206, 20, 'r24'), (3207, 27, 'r25'), (3208, 34, 'r26'), (3209, 41, 'r27'), (3210, 48, 'r28'), (3211, 55, 'r29'), (3212, 62, 'r30'), (3213, 69, 'r31'), (3214, 76, 'r32'), (3215, 83, 'r33'), (3216, 90, 'r34'), (3217, 97, 'r35'), (3218, 3, 'r36'), (3219, 10, 'r0'), (3220, 17, 'r1'), (3221, 24, 'r2'), (3222, 31, 'r3'), (3223, 38, 'r4'), (3224, 45, 'r5'), (3225, 52, 'r6'), (3226, 59, 'r7'), (3227, 66, 'r8'), (3228, 73, 'r9'), (3229, 80, 'r10'), (3230, 87, 'r11'), (3231, 94, 'r12'), (3232, 0, 'r13'), (3233, 7, 'r14'), (3234, 14, 'r15'), (3235, 21, 'r16'), (3236, 28, 'r17'), (3237, 35, 'r18'), (3238, 42, 'r19'), (3239, 49, 'r20'), (3240, 56, 'r21'), (3241, 63, 'r22'), (3242, 70, 'r23'), (3243, 77, 'r24'), (3244, 84, 'r25'), (3245, 91, 'r26'), (3246, 98, 'r27'), (3247, 4, 'r28'), (3248, 11, 'r29'), (3249, 18, 'r30'), (3250, 25, 'r31'), (3251, 32, 'r32'), (3252, 39, 'r33'), (3253, 46, 'r34'), (3254, 53, 'r35'), (3255, 60, 'r36'), (3256, 67, 'r0'), (3257, 74, 'r1'), (3258, 81, 'r2'), (3259, 88, 'r3'), (3260, 95, 'r4'), (3261, 1, 'r5'), (3262, 8, 'r6'), (3263, 15, 'r7'), (3264, 22, 'r8'), (3265, 29, 'r9'), (3266, 36, 'r10'), (3267, 43, 'r11'), (3268, 50, 'r12'), (3269, 57, 'r13'), (3270, 64, 'r14'), (3271, 71, 'r15'), (3272, 78, 'r16'), (3273, 85, 'r17'), (3274, 92, 'r18'), (3275, 99, 'r19'), (3276, 5, 'r20'), (3277, 12, 'r21'), (3278, 19, 'r22'), (3279, 26, 'r23'), (3280, 33, 'r24'), (3281, 40, 'r25'), (3282, 47, 'r26'), (3283, 54, 'r27'), (3284, 61, 'r28'), (3285, 68, 'r29'), (3286, 75, 'r30'), (3287, 82, 'r31'), (3288, 89, 'r32'), (3289, 96, 'r33'), (3290, 2, 'r34'), (3291, 9, 'r35'), (3292, 16, 'r36'), (3293, 23, 'r0'), (3294, 30, 'r1'), (3295, 37, 'r2'), (3296, 44, 'r3'), (3297, 51, 'r4'), (3298, 58, 'r5'), (3299, 65, 'r6'), (3300, 72, 'r7'), (3301, 79, 'r8'), (3302, 86, 'r9'), (3303, 93, 'r10'), (3304, 100, 'r11'), (3305, 6, 'r12'), (3306, 13, 'r13'), (3307, 20, 'r14'), (3308, 27, 'r15'), (3309, 34, 'r16'), (3310, 41, 'r17'), (3311, 48, 'r18'), (3312, 55, 'r19'), (3313, 62, 'r20'), (3314, 69, 'r21'), (3315, 76, 'r22'), (3316, 83, 'r23'), (3317, 90, 'r24'), (3318, 97, 'r25'), (3319, 3, 'r26'), (3320, 10, 'r27'), (3321, 17, 'r28'), (3322, 24, 'r29'), (3323, 31, 'r30'), (3324, 38, 'r31'), (3325, 45, 'r32'), (3326, 52, 'r33'), (3327, 59, 'r34'), (3328, 66, 'r35'), (3329, 73, 'r36'), (3330, 80, 'r0'), (3331, 87, 'r1'), (3332, 94, 'r2'), (3333, 0, 'r3'), (3334, 7, 'r4'), (3335, 14, 'r5'), (3336, 21, 'r6'), (3337, 28, 'r7'), (3338, 35, 'r8'), (3339, 42, 'r9'), (3340, 49, 'r10'), (3341, 56, 'r11'), (3342, 63, 'r12'), (3343, 70, 'r13'), (3344, 77, 'r14'), (3345, 84, 'r15'), (3346, 91, 'r16'), (3347, 98, 'r17'), (3348, 4, 'r18'), (3349, 11, 'r19'), (3350, 18, 'r20'), (3351, 25, 'r21'), (3352, 32, 'r22'), (3353, 39, 'r23'), (3354, 46, 'r24'), (3355, 53, 'r25'), (3356, 60, 'r26'), (3357, 67, 'r27'), (3358, 74, 'r28'), (3359, 81, 'r29'), (3360, 88, 'r30'), (3361, 95, 'r31'), (3362, 1, 'r32'), (3363, 8, 'r33'), (3364, 15, 'r34'), (3365, 22, 'r35'), (3366, 29, 'r36'), (3367, 36, 'r0'), (3368, 43, 'r1'), (3369, 50, 'r2'), (3370, 57, 'r3'), (3371, 64, 'r4'), (3372, 71, 'r5'), (3373, 78, 'r6'), (3374, 85, 'r7'), (3375, 92, 'r8'), (3376, 99, 'r9'), (3377, 5, 'r10'), (3378, 12, 'r11'), (3379, 19, 'r12'), (3380, 26, 'r13'), (3381, 33, 'r14'), (3382, 40, 'r15'), (3383, 47, 'r16'), (3384, 54, 'r17'), (3385, 61, 'r18'), (3386, 68, 'r19'), (3387, 75, 'r20'), (3388, 82, 'r21'), (3389, 89, 'r22'), (3390, 96, 'r23'), (3391, 2, 'r24'), (3392, 9, 'r25'), (3393, 16, 'r26'), (3394, 23, 'r27'), (3395, 30, 'r28'), (3396, 37, 'r29'), (3397, 44, 'r30'), (3398, 51, 'r31'), (3399, 58, 'r32'), (3400, 65, 'r33'), (3401, 72, 'r34'), (3402, 79, 'r35'), (3403, 86, 'r36'), (3404, 93, 'r0'), (3405, 100, 'r1'), (3406, 6, 'r2'), (3407, 13, 'r3'), (3408, 20, 'r4'), (3409, 27, 'r5'), (3410, 34, 'r6'), (3411, 41, 'r7'), (3412, 48, 'r8'), (3413, 55, 'r9'), (3414, 62, 'r10'), (3415, 69, 'r11'), (3416, 76, 'r12'), (3417, 83, 'r13'), (3418, 90, 'r14'), (3419, 97, 'r15'), (3420, 3, 'r16'), (3421, 10, 'r17'), (3422, 17, 'r18'), (3423, 24, 'r19'), (3424, 31, 'r20'), (3425, 38, 'r21'), (3426, 45, 'r22'), (3427, 52, 'r23'), (3428, 59, 'r24'), (3429, 66, 'r25'), (3430, 73, 'r26'), (3431, 80, 'r27'), (3432, 87, 'r28'), (3433, 94, 'r29'), (3434, 0, 'r30'), (3435, 7, 'r31'), (3436, 14, 'r32'), (3437, 21, 'r33'), (3438, 28, 'r34'), (3439, 35, 'r35'), (3440, 42, 'r36'), (3441, 49, 'r0'), (3442, 56, 'r1'), (3443, 63, 'r2'), (3444, 70, 'r3'), (3445, 77, 'r4'), (3446, 84, 'r5'), (3447, 91, 'r6'), (3448, 98, 'r7'), (3449, 4, 'r8'), (3450, 11, 'r9'), (3451, 18, 'r10'), (3452, 25, 'r11'), (3453, 32, 'r12'), (3454, 39, 'r13'), (3455, 46, 'r14'), (3456, 53, 'r15'), (3457, 60, 'r16'), (3458, 67, 'r17'), (3459, 74, 'r18'), (3460, 81, 'r19'), (3461, 88, 'r20'), (3462, 95, 'r21'), (3463, 1, 'r22'), (3464, 8, 'r23'), (3465, 15, 'r24'), (3466, 22, 'r25'), (3467, 29, 'r26'), (3468, 36, 'r27'), (3469, 43, 'r28'), (3470, 50, 'r29'), (3471, 57, 'r30'), (3472, 64, 'r31'), (3473, 71, 'r32'), (3474, 78, 'r33'), (3475, 85, 'r34'), (3476, 92, 'r35'), (3477, 99, 'r36'), (3478, 5, 'r0'), (3479, 12, 'r1'), (3480, 19, 'r2'), (3481, 26, 'r3'), (3482, 33, 'r4'), (3483, 40, 'r5'), (3484, 47, 'r6'), (3485, 54, 'r7'), (3486, 61, 'r8'), (3487, 68, 'r9'), (3488, 75, 'r10'), (3489, 82, 'r11'), (3490, 89, 'r12'), (3491, 96, 'r13'), (3492, 2, 'r14'), (3493, 9, 'r15'), (3494, 16, 'r16'), (3495, 23, 'r17'), (3496, 30, 'r18'), (3497, 37, 'r19'), (3498, 44, 'r20'), (3499, 51, 'r21'), (3500, 58, 'r22'), (3501, 65, 'r23'), (3502, 72, 'r24'), (3503, 79, 'r25'), (3504, 86, 'r26'), (3505, 93, 'r27'), (3506, 100, 'r28'), (3507, 6, 'r29'), (3508, 13, 'r30'), (3509, 20, 'r31'), (3510, 27, 'r32'), (3511, 34, 'r33'), (3512, 41, 'r34'), (3513, 48, 'r35'), (3514, 55, 'r36'), (3515, 62, 'r0'), (3516, 69, 'r1'), (3517, 76, 'r2'), (3518, 83, 'r3'), (3519, 90, 'r4'), (3520, 97, 'r5'), (3521, 3, 'r6'), (3522, 10, 'r7'), (3523, 17, 'r8'), (3524, 24, 'r9'), (3525, 31, 'r10'), (3526, 38, 'r11'), (3527, 45, 'r12'), (3528, 52, 'r13'), (3529, 59, 'r14'), (3530, 66, 'r15'), (3531, 73, 'r16'), (3532, 80, 'r17'), (3533, 87, 'r18'), (3534, 94, 'r19'), (3535, 0, 'r20'), (3536, 7, 'r21'), (3537, 14, 'r22'), (3538, 21, 'r23'), (3539, 28, 'r24'), (3540, 35, 'r25'), (3541, 42, 'r26'), (3542, 49, 'r27'), (3543, 56, 'r28'), (3544, 63, 'r29'), (3545, 70, 'r30'), (3546, 77, 'r31'), (3547, 84, 'r32'), (3548, 91, 'r33'), (3549, 98, 'r34'), (3550, 4, 'r35'), (3551, 11, 'r36'), (3552, 18, 'r0'), (3553, 25, 'r1'), (3554, 32, 'r2'), (3555, 39, 'r3'), (3556, 46, 'r4'), (3557, 53, 'r5'), (3558, 60, 'r6'), (3559, 67, 'r7'), (3560, 74, 'r8'), (3561, 81, 'r9'), (3562, 88, 'r10'), (3563, 95, 'r11'), (3564, 1, 'r12'), (3565, 8, 'r13'), (3566, 15, 'r14'), (3567, 22, 'r15'), (3568, 29, 'r16'), (3569, 36, 'r17'), (3570, 43, 'r18'), (3571, 50, 'r19'), (3572, 57, 'r20'), (3573, 64, 'r21'), (3574, 71, 'r22'), (3575, 78, 'r23'), (3576, 85, 'r24'), (3577, 92, 'r25'), (3578, 99, 'r26'), (3579, 5, 'r27'), (3580, 12, 'r28'), (3581, 19, 'r29'), (3582, 26, 'r30'), (3583, 33, 'r31'), (3584, 40, 'r32'), (3585, 47, 'r33'), (3586, 54, 'r34'), (3587, 61, 'r35'), (3588, 68, 'r36'), (3589, 75, 'r0'), (3590, 82, 'r1'), (3591, 89, 'r2'), (3592, 96, 'r3'), (3593, 2, 'r4'), (3594, 9, 'r5'), (3595, 16, 'r6'), (3596, 23, 'r7'), (3597, 30, 'r8'), (3598, 37, 'r9'), (3599, 44, 'r10'), (3600, 51, 'r11'), (3601, 58, 'r12'), (3602, 65, 'r13'), (3603, 72, 'r14'), (3604, 79, 'r15'), (3605, 86, 'r16'), (3606, 93, 'r17'), (3607, 100, 'r18'), (3608, 6, 'r19'), (3609, 13, 'r20'), (3610, 20, 'r21'), (3611, 27, 'r22'), (3612, 34, 'r23'), (3613, 41, 'r24'), (3614, 48, 'r25'), (3615, 55, 'r26'), (3616, 62, 'r27'), (3617, 69, 'r28'), (3618, 76, 'r29'), (3619, 83, 'r30'), (3620, 90, 'r31'), (3621, 97, 'r32'), (3622, 3, 'r33'), (3623, 10, 'r34'), (3624, 17, 'r35'), (3625, 24, 'r36'), (3626, 31, 'r0'), (3627, 38, 'r1'), (3628, 45, 'r2'), (3629, 52, 'r3'), (3630, 59, 'r4'), (3631, 66, 'r5'), (3632, 73, 'r6'), (3633, 80, 'r7'), (3634, 87, 'r8'), (3635, 94, 'r9'), (3636, 0, 'r10'), (3637, 7, 'r11'), (3638, 14, 'r12'), (3639, 21, 'r13'), (3640, 28, 'r14'), (3641, 35, 'r15'), (3642, 42, 'r16'), (3643, 49, 'r17'), (3644, 56, 'r18'), (3645, 63, 'r19'), (3646, 70, 'r20'), (3647, 77, 'r21'), (3648, 84, 'r22'), (3649, 91, 'r23'), (3650, 98, 'r24'), (3651, 4, 'r25'), (3652, 11, 'r26'), (3653, 18, 'r27'), (3654, 25, 'r28'), (3655, 32, 'r29'), (3656, 39, 'r30'), (3657, 46, 'r31'), (3658, 53, 'r32'), (3659, 60, 'r33'), (3660, 67, 'r34'), (3661, 74, 'r35'), (3662, 81, 'r36'), (3663, 88, 'r0'), (3664, 95, 'r1'), (3665, 1, 'r2'), (3666, 8, 'r3'), (3667, 15, 'r4'), (3668, 22, 'r5'), (3669, 29, 'r6'), (3670, 36, 'r7'), (3671, 43, 'r8'), (3672, 50, 'r9'), (3673, 57, 'r10'), (3674, 64, 'r11'), (3675, 71, 'r12'), (3676, 78, 'r13'), (3677, 85, 'r14'), (3678, 92, 'r15'), (3679, 99, 'r16'), (3680, 5, 'r17'), (3681, 12, 'r18'), (3682, 19, 'r19'), (3683, 26, 'r20'), (3684, 33, 'r21'), (3685, 40, 'r22'), (3686, 47, 'r23'), (3687, 54, 'r24'), (3688, 61, 'r25'), (3689, 68, 'r26'), (3690, 75, 'r27'), (3691, 82, 'r28'), (3692, 89, 'r29'), (3693, 96, 'r30'), (3694, 2, 'r31'), (3695, 9, 'r32'), (3696, 16, 'r33'), (3697, 23, 'r34'), (3698, 30, 'r35'), (3699, 37, 'r36'), (3700, 44, 'r0'), (3701, 51, 'r1'), (3702, 58, 'r2'), (3703, 65, 'r3'), (3704, 72, 'r4'), (3705, 79, 'r5'), (3706, 86, 'r6'), (3707, 93, 'r7'), (3708, 100, 'r8'), (3709, 6, 'r9'), (3710, 13, 'r10'), (3711, 20, 'r11'), (3712, 27, 'r12'), (3713, 34, 'r13'), (3714, 41, 'r14'), (3715, 48, 'r15'), (3716, 55, 'r16'), (3717, 62, 'r17'), (3718, 69, 'r18'), (3719, 76, 'r19'), (3720, 83, 'r20'), (3721, 90, 'r21'), (3722, 97, 'r22'), (3723, 3, 'r23'), (3724, 10, 'r24'), (3725, 17, 'r25'), (3726, 24, 'r26'), (3727, 31, 'r27'), (3728, 38, 'r28'), (3729, 45, 'r29'), (3730, 52, 'r30'), (3731, 59, 'r31'), (3732, 66, 'r32'), (3733, 73, 'r33'), (3734, 80, 'r34'), (3735, 87, 'r35'), (3736, 94, 'r36'), (3737, 0, 'r0'), (3738, 7, 'r1'), (3739, 14, 'r2'), (3740, 21, 'r3'), (3741, 28, 'r4'), (3742, 35, 'r5'), (3743, 42, 'r6'), (3744, 49, 'r7'), (3745, 56, 'r8'), (3746, 63, 'r9'), (3747, 70, 'r10'), (3748, 77, 'r11'), (3749, 84, 'r12'), (3750, 91, 'r13'), (3751, 98, 'r14'), (3752, 4, 'r15'), (3753, 11, 'r16'), (3754, 18, 'r17'), (3755, 25, 'r18'), (3756, 32, 'r19'), (3757, 39, 'r20'), (3758, 46, 'r21'), (3759, 53, 'r22'), (3760, 60, 'r23'), (3761, 67, 'r24'), (3762, 74, 'r25'), (3763, 81, 'r26'), (3764, 88, 'r27'), (3765, 95, 'r28'), (3766, 1, 'r29'), (3767, 8, 'r30'), (3768, 15, 'r31'), (3769, 22, 'r32'), (3770, 29, 'r33'), (3771, 36, 'r34'), (3772, 43, 'r35'), (3773, 50, 'r36'), (3774, 57, 'r0'), (3775, 64, 'r1'), (3776, 71, 'r2'), (3777, 78, 'r3'), (3778, 85, 'r4'), (3779, 92, 'r5'), (3780, 99, 'r6'), (3781, 5, 'r7'), (3782, 12, 'r8'), (3783, 19, 'r9'), (3784, 26, 'r10'), (3785, 33, 'r11'), (3786, 40, 'r12'), (3787, 47, 'r13'), (3788, 54, 'r14'), (3789, 61, 'r15'), (3790, 68, 'r16'), (3791, 75, 'r17'), (3792, 82, 'r18'), (3793, 89, 'r19'), (3794, 96, 'r20'), (3795, 2, 'r21'), (3796, 9, 'r22'), (3797, 16, 'r23'), (3798, 23, 'r24'), (3799, 30, 'r25'), (3800, 37, 'r26'), (3801, 44, 'r27'), (3802, 51, 'r28'), (3803, 58, 'r29'), (3804, 65, 'r30'), (3805, 72, 'r31'), (3806, 79, 'r32'), (3807, 86, 'r33'), (3808, 93, 'r34'), (3809, 100, 'r35'), (3810, 6, 'r36'), (3811, 13, 'r0'), (3812, 20, 'r1'), (3813, 27, 'r2'), (3814, 34, 'r3'), (3815, 41, 'r4'), (3816, 48, 'r5'), (3817, 55, 'r6'), (3818, 62, 'r7'), (3819, 69, 'r8'), (3820, 76, 'r9'), (3821, 83, 'r10'), (3822, 90, 'r11'), (3823, 97, 'r12'), (3824, 3, 'r13'), (3825, 10, 'r14'), (3826, 17, 'r15'), (3827, 24, 'r16'), (3828, 31, 'r17'), (3829, 38, 'r18'), (3830, 45, 'r19'), (3831, 52, 'r20'), (3832, 59, 'r21'), (3833, 66, 'r22'), (3834, 73, 'r23'), (3835, 80, 'r24'), (3836, 87, 'r25'), (3837, 94, 'r26'), (3838, 0, 'r27'), (3839, 7, 'r28'), (3840, 14, 'r29'), (3841, 21, 'r30'), (3842, 28, 'r31'), (3843, 35, 'r32'), (3844, 42, 'r33'), (3845, 49, 'r34'), (3846, 56, 'r35'), (3847, 63, 'r36'), (3848, 70, 'r0'), (3849, 77, 'r1'), (3850, 84, 'r2'), (3851, 91, 'r3'), (3852, 98, 'r4'), (3853, 4, 'r5'), (3854, 11, 'r6'), (3855, 18, 'r7'), (3856, 25, 'r8'), (3857, 32, 'r9'), (3858, 39, 'r10'), (3859, 46, 'r11'), (3860, 53, 'r12'), (3861, 60, 'r13'), (3862, 67, 'r14'), (3863, 74, 'r15'), (3864, 81, 'r16'), (3865, 88, 'r17'), (3866, 95, 'r18'), (3867, 1, 'r19'), (3868, 8, 'r20'), (3869, 15, 'r21'), (3870, 22, 'r22'), (3871, 29, 'r23'), (3872, 36, 'r24'), (3873, 43, 'r25'), (3874, 50, 'r26'), (3875, 57, 'r27'), (3876, 64, 'r28'), (3877, 71, 'r29'), (3878, 78, 'r30'), (3879, 85, 'r31'), (3880, 92, 'r32'), (3881, 99, 'r33'), (3882, 5, 'r34'), (3883, 12, 'r35'), (3884, 19, 'r36'), (3885, 26, 'r0'), (3886, 33, 'r1'), (3887, 40, 'r2'), (3888, 47, 'r3'), (3889, 54, 'r4'), (3890, 61, 'r5'), (3891, 68, 'r6'), (3892, 75, 'r7'), (3893, 82, 'r8'), (3894, 89, 'r9'), (3895, 96, 'r10'), (3896, 2, 'r11'), (3897, 9, 'r12'), (3898, 16, 'r13'), (3899, 23, 'r14'), (3900, 30, 'r15'), (3901, 37, 'r16'), (3902, 44, 'r17'), (3903, 51, 'r18'), (3904, 58, 'r19'), (3905, 65, 'r20'), (3906, 72, 'r21'), (3907, 79, 'r22'), (3908, 86, 'r23'), (3909, 93, 'r24'), (3910, 100, 'r25'), (3911, 6, 'r26'), (3912, 13, 'r27'), (3913, 20, 'r28'), (3914, 27, 'r29'), (3915, 34, 'r30'), (3916, 41, 'r31'), (3917, 48, 'r32'), (3918, 55, 'r33'), (3919, 62, 'r34'), (3920, 69, 'r35'), (3921, 76, 'r36'), (3922, 83, 'r0'), (3923, 90, 'r1'), (3924, 97, 'r2'), (3925, 3, 'r3'), (3926, 10, 'r4'), (3927, 17, 'r5'), (3928, 24, 'r6'), (3929, 31, 'r7'), (3930, 38, 'r8'), (3931, 45, 'r9'), (3932, 52, 'r10'), (3933, 59, 'r11'), (3934, 66, 'r12'), (3935, 73, 'r13'), (3936, 80, 'r14'), (3937, 87, 'r15'), (3938, 94, 'r16'), (3939, 0, 'r17'), (3940, 7, 'r18'), (3941, 14, 'r19'), (3942, 21, 'r20'), (3943, 28, 'r21'), (3944, 35, 'r22'), (3945, 42, 'r23'), (3946, 49, 'r24'), (3947, 56, 'r25'), (3948, 63, 'r26'), (3949, 70, 'r27'), (3950, 77, 'r28'), (3951, 84, 'r29'), (3952, 91, 'r30'), (3953, 98, 'r31'), (3954, 4, 'r32'), (3955, 11, 'r33'), (3956, 18, 'r34'), (3957, 25, 'r35'), (3958, 32, 'r36'), (3959, 39, 'r0'), (3960, 46, 'r1'), (3961, 53, 'r2'), (3962, 60, 'r3'), (3963, 67, 'r4'), (3964, 74, 'r5'), (3965, 81, 'r6'), (3966, 88, 'r7'), (3967, 95, 'r8'), (3968, 1, 'r9'), (3969, 8, 'r10'), (3970, 15, 'r11'), (3971, 22, 'r12'), (3972, 29, 'r13'), (3973, 36, 'r14'), (3974, 43, 'r15'), (3975, 50, 'r16'), (3976, 57, 'r17'), (3977, 64, 'r18'), (3978, 71, 'r19'), (3979, 78, 'r20'), (3980, 85, 'r21'), (3981, 92, 'r22'), (3982, 99, 'r23'), (3983, 5, 'r24'), (3984, 12, 'r25'), (3985, 19, 'r26'), (3986, 26, 'r27'), (3987, 33, 'r28'), (3988, 40, 'r29'), (3989, 47, 'r30'), (3990, 54, 'r31'), (3991, 61, 'r32'), (3992, 68, 'r33'), (3993, 75, 'r34'), (3994, 82, 'r35'), (3995, 89, 'r36'), (3996, 96, 'r0'), (3997, 2, 'r1'), (3998, 9, 'r2'), (3999, 16, 'r3'), (4000, 23, 'r4'), (4001, 30, 'r5'), (4002, 37, 'r6'), (4003, 44, 'r7'), (4004, 51, 'r8'), (4005, 58, 'r9'), (4006, 65, 'r10'), (4007, 72, 'r11'), (4008, 79, 'r12'), (4009, 86, 'r13'), (4010, 93, 'r14'), (4011, 100, 'r15'), (4012, 6, 'r16'), (4013, 13, 'r17'), (4014, 20, 'r18'), (4015, 27, 'r19'), (4016, 34, 'r20'), (4017, 41, 'r21'), (4018, 48, 'r22'), (4019, 55, 'r23'), (4020, 62, 'r24'), (4021, 69, 'r25'), (4022, 76, 'r26'), (4023, 83, 'r27'), (4024, 90, 'r28'), (4025, 97, 'r29'), (4026, 3, 'r30'), (4027, 10, 'r31'), (4028, 17, 'r32'), (4029, 24, 'r33'), (4030, 31, 'r34'), (4031, 38, 'r35'), (4032, 45, 'r36'), (4033, 52, 'r0'), (4034, 59, 'r1'), (4035, 66, 'r2'), (4036, 73, 'r3'), (4037, 80, 'r4'), (4038, 87, 'r5'), (4039, 94, 'r6'), (4040, 0, 'r7'), (4041, 7, 'r8'), (4042, 14, 'r9'), (4043, 21, 'r10'), (4044, 28, 'r11'), (4045, 35, 'r12'), (4046, 42, 'r13'), (4047, 49, 'r14'), (4048, 56, 'r15'), (4049, 63, 'r16'), (4050, 70, 'r17'), (4051, 77, 'r18'), (4052, 84, 'r19'), (4053, 91, 'r20'), (4054, 98, 'r21'), (4055, 4, 'r22'), (4056, 11, 'r23'), (4057, 18, 'r24'), (4058, 25, 'r25'), (4059, 32, 'r26'), (4060, 39, 'r27'), (4061, 46, 'r28'), (4062, 53, 'r29'), (4063, 60, 'r30'), (4064, 67, 'r31'), (4065, 74, 'r32'), (4066, 81, 'r33'), (4067, 88, 'r34'), (4068, 95, 'r35'), (4069, 1, 'r36'), (4070, 8, 'r0'), (4071, 15, 'r1'), (4072, 22, 'r2'), (4073, 29, 'r3'), (4074, 36, 'r4'), (4075, 43, 'r5'), (4076, 50, 'r6'), (4077, 57, 'r7'), (4078, 64, 'r8'), (4079, 71, 'r9'), (4080, 78, 'r10'), (4081, 85, 'r11'), (4082, 92, 'r12'), (4083, 99, 'r13'), (4084, 5, 'r14'), (4085, 12, 'r15'), (4086, 19, 'r16'), (4087, 26, 'r17'), (4088, 33, 'r18'), (4089, 40, 'r19'), (4090, 47, 'r20'), (4091, 54, 'r21'), (4092, 61, 'r22'), (4093, 68, 'r23'), (4094, 75, 'r24'), (4095, 82, 'r25'), (4096, 89, 'r26'), (4097, 96, 'r27'), (4098, 2, 'r28'), (4099, 9, 'r29'), (4100, 16, 'r30'), (4101, 23, 'r31'), (4102, 30, 'r32'), (4103, 37, 'r33'), (4104, 44, 'r34'), (4105, 51, 'r35'), (4106, 58, 'r36'), (4107, 65, 'r0'), (4108, 72, 'r1'), (4109, 79, 'r2'), (4110, 86, 'r3'), (4111, 93, 'r4'), (4112, 100, 'r5'), (4113, 6, 'r6'), (4114, 13, 'r7'), (4115, 20, 'r8'), (4116, 27, 'r9'), (4117, 34, 'r10'), (4118, 41, 'r11'), (4119, 48, 'r12'), (4120, 55, 'r13'), (4121, 62, 'r14'), (4122, 69, 'r15'), (4123, 76, 'r16'), (4124, 83, 'r17'), (4125, 90, 'r18'), (4126, 97, 'r19'), (4127, 3, 'r20'), (4128, 10, 'r21'), (4129, 17, 'r22'), (4130, 24, 'r23'), (4131, 31, 'r24'), (4132, 38, 'r25'), (4133, 45, 'r26'), (4134, 52, 'r27'), (4135, 59, 'r28'), (4136, 66, 'r29'), (4137, 73, 'r30'), (4138, 80, 'r31'), (4139, 87, 'r32'), (4140, 94, 'r33'), (4141, 0, 'r34'), (4142, 7, 'r35'), (4143, 14, 'r36'), (4144, 21, 'r0'), (4145, 28, 'r1'), (4146, 35, 'r2'), (4147, 42, 'r3'), (4148, 49, 'r4'), (4149, 56, 'r5'), (4150, 63, 'r6'), (4151, 70, 'r7'), (4152, 77, 'r8'), (4153, 84, 'r9'), (4154, 91, 'r10'), (4155, 98, 'r11'), (4156, 4, 'r12'), (4157, 11, 'r13'), (4158, 18, 'r14'), (4159, 25, 'r15'), (4160, 32, 'r16'), (4161, 39, 'r17'), (4162, 46, 'r18'), (4163, 53, 'r19'), (4164, 60, 'r20'), (4165, 67, 'r21'), (4166, 74, 'r22'), (4167, 81, 'r23'), (4168, 88, 'r24'), (4169, 95, 'r25'), (4170, 1, 'r26'), (4171, 8, 'r27'), (4172, 15, 'r28'), (4173, 22, 'r29'), (4174, 29, 'r30'), (4175, 36, 'r31'), (4176, 43, 'r32'), (4177, 50, 'r33'), (4178, 57, 'r34'), (4179, 64, 'r35'), (4180, 71, 'r36'), (4181, 78, 'r0'), (4182, 85, 'r1'), (4183, 92, 'r2'), (4184, 99, 'r3'), (4185, 5, 'r4'), (4186, 12, 'r5'), (4187, 19, 'r6'), (4188, 26, 'r7'), (4189, 33, 'r8'), (4190, 40, 'r9'), (4191, 47, 'r10'), (4192, 54, 'r11'), (4193, 61, 'r12'), (4194, 68, 'r13'), (4195, 75, 'r14'), (4196, 82, 'r15'), (4197, 89, 'r16'), (4198, 96, 'r17'), (4199, 2, 'r18'), (4200, 9, 'r19'), (4201, 16, 'r20'), (4202, 23, 'r21'), (4203, 30, 'r22'), (4204, 37, 'r23'), (4205, 44, 'r24'), (4206, 51, 'r25'), (4207, 58, 'r26'), (4208, 65, 'r27'), (4209, 72, 'r28'), (4210, 79, 'r29'), (4211, 86, 'r30'), (4212, 93, 'r31'), (4213, 100, 'r32'), (4214, 6, 'r33'), (4215, 13, 'r34'), (4216, 20, 'r35'), (4217, 27, 'r36'), (4218, 34, 'r0'), (4219, 41, 'r1'), (4220, 48, 'r2'), (4221, 55, 'r3'), (4222, 62, 'r4'), (4223, 69, 'r5'), (4224, 76, 'r6'), (4225, 83, 'r7'), (4226, 90, 'r8'), (4227, 97, 'r9'), (4228, 3, 'r10'), (4229, 10, 'r11'), (4230, 17, 'r12'), (4231, 24, 'r13'), (4232, 31, 'r14'), (4233, 38, 'r15'), (4234, 45, 'r16'), (4235, 52, 'r17'), (4236, 59, 'r18'), (4237, 66, 'r19'), (4238, 73, 'r20'), (4239, 80, 'r21'), (4240, 87, 'r22'), (4241, 94, 'r23'), (4242, 0, 'r24'), (4243, 7, 'r25'), (4244, 14, 'r26'), (4245, 21, 'r27'), (4246, 28, 'r28'), (4247, 35, 'r29'), (4248, 42, 'r30'), (4249, 49, 'r31'), (4250, 56, 'r32'), (4251, 63, 'r33'), (4252, 70, 'r34'), (4253, 77, 'r35'), (4254, 84, 'r36'), (4255, 91, 'r0'), (4256, 98, 'r1'), (4257, 4, 'r2'), (4258, 11, 'r3'), (4259, 18, 'r4'), (4260, 25, 'r5'), (4261, 32, 'r6'), (4262, 39, 'r7'), (4263, 46, 'r8'), (4264, 53, 'r9'), (4265, 60, 'r10'), (4266, 67, 'r11'), (4267, 74, 'r12'), (4268, 81, 'r13'), (4269, 88, 'r14'), (4270, 95, 'r15'), (4271, 1, 'r16'), (4272, 8, 'r17'), (4273, 15, 'r18'), (4274, 22, 'r19'), (4275, 29, 'r20'), (4276, 36, 'r21'), (4277, 43, 'r22'), (4278, 50, 'r23'), (4279, 57, 'r24'), (4280, 64, 'r25'), (4281, 71, 'r26'), (4282, 78, 'r27'), (4283, 85, 'r28'), (4284, 92, 'r29'), (4285, 99, 'r30'), (4286, 5, 'r31'), (4287, 12, 'r32'), (4288, 19, 'r33'), (4289, 26, 'r34'), (4290, 33, 'r35'), (4291, 40, 'r36'), (4292, 47, 'r0'), (4293, 54, 'r1'), (4294, 61, 'r2'), (4295, 68, 'r3'), (4296, 75, 'r4'), (4297, 82, 'r5'), (4298, 89, 'r6'), (4299, 96, 'r7'), (4300, 2, 'r8'), (4301, 9, 'r9'), (4302, 16, 'r10'), (4303, 23, 'r11'), (4304, 30, 'r12'), (4305, 37, 'r13'), (4306, 44, 'r14'), (4307, 51, 'r15'), (4308, 58, 'r16'), (4309, 65, 'r17'), (4310, 72, 'r18'), (4311, 79, 'r19'), (4312, 86, 'r20'), (4313, 93, 'r21'), (4314, 100, 'r22'), (4315, 6, 'r23'), (4316, 13, 'r24'), (4317, 20, 'r25'), (4318, 27, 'r26'), (4319, 34, 'r27'), (4320, 41, 'r28'), (4321, 48, 'r29'), (4322, 55, 'r30'), (4323, 62, 'r31'), (4324, 69, 'r32'), (4325, 76, 'r33'), (4326, 83, 'r34'), (4327, 90, 'r35'), (4328, 97, 'r36'), (4329, 3, 'r0'), (4330, 10, 'r1'), (4331, 17, 'r2'), (4332, 24, 'r3'), (4333, 31, 'r4'), (4334, 38, 'r5'), (4335, 45, 'r6'), (4336, 52, 'r7'), (4337, 59, 'r8'), (4338, 66, 'r9'), (4339, 73, 'r10'), (4340, 80, 'r11'), (4341, 87, 'r12'), (4342, 94, 'r13'), (4343, 0, 'r14'), (4344, 7, 'r15'), (4345, 14, 'r16'), (4346, 21, 'r17'), (4347, 28, 'r18'), (4348, 35, 'r19'), (4349, 42, 'r20'), (4350, 49, 'r21'), (4351, 56, 'r22'), (4352, 63, 'r23'), (4353, 70, 'r24'), (4354, 77, 'r25'), (4355, 84, 'r26'), (4356, 91, 'r27'), (4357, 98, 'r28'), (4358, 4, 'r29'), (4359, 11, 'r30'), (4360, 18, 'r31'), (4361, 25, 'r32'), (4362, 32, 'r33'), (4363, 39, 'r34'), (4364, 46, 'r35'), (4365, 53, 'r36'), (4366, 60, 'r0'), (4367, 67, 'r1'), (4368, 74, 'r2'), (4369, 81, 'r3'), (4370, 88, 'r4'), (4371, 95, 'r5'), (4372, 1, 'r6'), (4373, 8, 'r7'), (4374, 15, 'r8'), (4375, 22, 'r9'), (4376, 29, 'r10'), (4377, 36, 'r11'), (4378, 43, 'r12'), (4379, 50, 'r13'), (4380, 57, 'r14'), (4381, 64, 'r15'), (4382, 71, 'r16'), (4383, 78, 'r17'), (4384, 85, 'r18'), (4385, 92, 'r19'), (4386, 99, 'r20'), (4387, 5, 'r21'), (4388, 12, 'r22'), (4389, 19, 'r23'), (4390, 26, 'r24'), (4391, 33, 'r25'), (4392, 40, 'r26'), (4393, 47, 'r27'), (4394, 54, 'r28'), (4395, 61, 'r29'), (4396, 68, 'r30'), (4397, 75, 'r31'), (4398, 82, 'r32'), (4399, 89, 'r33'), (4400, 96, 'r34'), (4401, 2, 'r35'), (4402, 9, 'r36'), (4403, 16, 'r0'), (4404, 23, 'r1'), (4405, 30, 'r2'), (4406, 37, 'r3'), (4407, 44, 'r4'), (4408, 51, 'r5'), (4409, 58, 'r6'), (4410, 65, 'r7'), (4411, 72, 'r8'), (4412, 79, 'r9'), (4413, 86, 'r10'), (4414, 93, 'r11'), (4415, 100, 'r12'), (4416, 6, 'r13'), (4417, 13, 'r14'), (4418, 20, 'r15'), (4419, 27, 'r16'), (4420, 34, 'r17'), (4421, 41, 'r18'), (4422, 48, 'r19'), (4423, 55, 'r20'), (4424, 62, 'r21'), (4425, 69, 'r22'), (4426, 76, 'r23'), (4427, 83, 'r24'), (4428, 90, 'r25'), (4429, 97, 'r26'), (4430, 3, 'r27'), (4431, 10, 'r28'), (4432, 17, 'r29'), (4433, 24, 'r30'), (4434, 31, 'r31'), (4435, 38, 'r32'), (4436, 45, 'r33'), (4437, 52, 'r34'), (4438, 59, 'r35'), (4439, 66, 'r36'), (4440, 73, 'r0'), (4441, 80, 'r1'), (4442, 87, 'r2'), (4443, 94, 'r3'), (4444, 0, 'r4'), (4445, 7, 'r5'), (4446, 14, 'r6'), (4447, 21, 'r7'), (4448, 28, 'r8'), (4449, 35, 'r9'), (4450, 42, 'r10'), (4451, 49, 'r11'), (4452, 56, 'r12'), (4453, 63, 'r13'), (4454, 70, 'r14'), (4455, 77, 'r15'), (4456, 84, 'r16'), (4457, 91, 'r17'), (4458, 98, 'r18'), (4459, 4, 'r19'), (4460, 11, 'r20'), (4461, 18, 'r21'), (4462, 25, 'r22'), (4463, 32, 'r23'), (4464, 39, 'r24'), (4465, 46, 'r25'), (4466, 53, 'r26'), (4467, 60, 'r27'), (4468, 67, 'r28'), (4469, 74, 'r29'), (4470, 81, 'r30'), (4471, 88, 'r31'), (4472, 95, 'r32'), (4473, 1, 'r33'), (4474, 8, 'r34'), (4475, 15, 'r35'), (4476, 22, 'r36'), (4477, 29, 'r0'), (4478, 36, 'r1'), (4479, 43, 'r2'), (4480, 50, 'r3'), (4481, 57, 'r4'), (4482, 64, 'r5'), (4483, 71, 'r6'), (4484, 78, 'r7'), (4485, 85, 'r8'), (4486, 92, 'r9'), (4487, 99, 'r10'), (4488, 5, 'r11'), (4489, 12, 'r12'), (4490, 19, 'r13'), (4491, 26, 'r14'), (4492, 33, 'r15'), (4493, 40, 'r16'), (4494, 47, 'r17'), (4495, 54, 'r18'), (4496, 61, 'r19'), (4497, 68, 'r20'), (4498, 75, 'r21'), (4499, 82, 'r22'), (4500, 89, 'r23'), (4501, 96, 'r24'), (4502, 2, 'r25'), (4503, 9, 'r26'), (4504, 16, 'r27'), (4505, 23, 'r28'), (4506, 30, 'r29'), (4507, 37, 'r30'), (4508, 44, 'r31'), (4509, 51, 'r32'), (4510, 58, 'r33'), (4511, 65, 'r34'), (4512, 72, 'r35'), (4513, 79, 'r36'), (4514, 86, 'r0'), (4515, 93, 'r1'), (4516, 100, 'r2'), (4517, 6, 'r3'), (4518, 13, 'r4'), (4519, 20, 'r5'), (4520, 27, 'r6'), (4521, 34, 'r7'), (4522, 41, 'r8'), (4523, 48, 'r9'), (4524, 55, 'r10'), (4525, 62, 'r11'), (4526, 69, 'r12'), (4527, 76, 'r13'), (4528, 83, 'r14'), (4529, 90, 'r15'), (4530, 97, 'r16'), (4531, 3, 'r17'), (4532, 10, 'r18'), (4533, 17, 'r19'), (4534, 24, 'r20'), (4535, 31, 'r21'), (4536, 38, 'r22'), (4537, 45, 'r23'), (4538, 52, 'r24'), (4539, 59, 'r25'), (4540, 66, 'r26'), (4541, 73, 'r27'), (4542, 80, 'r28'), (4543, 87, 'r29'), (4544, 94, 'r30'), (4545, 0, 'r31'), (4546, 7, 'r32'), (4547, 14, 'r33'), (4548, 21, 'r34'), (4549, 28, 'r35'), (4550, 35, 'r36'), (4551, 42, 'r0'), (4552, 49, 'r1'), (4553, 56, 'r2'), (4554, 63, 'r3'), (4555, 70, 'r4'), (4556, 77, 'r5'), (4557, 84, 'r6'), (4558, 91, 'r7'), (4559, 98, 'r8'), (4560, 4, 'r9'), (4561, 11, 'r10'), (4562, 18, 'r11'), (4563, 25, 'r12'), (4564, 32, 'r13'), (4565, 39, 'r14'), (4566, 46, 'r15'), (4567, 53, 'r16'), (4568, 60, 'r17'), (4569, 67, 'r18'), (4570, 74, 'r19'), (4571, 81, 'r20'), (4572, 88, 'r21'), (4573, 95, 'r22'), (4574, 1, 'r23'), (4575, 8, 'r24'), (4576, 15, 'r25'), (4577, 22, 'r26'), (4578, 29, 'r27'), (4579, 36, 'r28'), (4580, 43, 'r29'), (4581, 50, 'r30'), (4582, 57, 'r31'), (4583, 64, 'r32'), (4584, 71, 'r33'), (4585, 78, 'r34'), (4586, 85, 'r35'), (4587, 92, 'r36'), (4588, 99, 'r0'), (4589, 5, 'r1'), (4590, 12, 'r2'), (4591, 19, 'r3'), (4592, 26, 'r4'), (4593, 33, 'r5'), (4594, 40, 'r6'), (4595, 47, 'r7'), (4596, 54, 'r8'), (4597, 61, 'r9'), (4598, 68, 'r10'), (4599, 75, 'r11'), (4600, 82, 'r12'), (4601, 89, 'r13'), (4602, 96, 'r14'), (4603, 2, 'r15'), (4604, 9, 'r16'), (4605, 16, 'r17'), (4606, 23, 'r18'), (4607, 30, 'r19'), (4608, 37, 'r20'), (4609, 44, 'r21'), (4610, 51, 'r22'), (4611, 58, 'r23'), (4612, 65, 'r24'), (4613, 72, 'r25'), (4614, 79, 'r26'), (4615, 86, 'r27'), (4616, 93, 'r28'), (4617, 100, 'r29'), (4618, 6, 'r30'), (4619, 13, 'r31'), (4620, 20, 'r32'), (4621, 27, 'r33'), (4622, 34, 'r34'), (4623, 41, 'r35'), (4624, 48, 'r36'), (4625, 55, 'r0'), (4626, 62, 'r1'), (4627, 69, 'r2'), (4628, 76, 'r3'), (4629, 83, 'r4'), (4630, 90, 'r5'), (4631, 97, 'r6'), (4632, 3, 'r7'), (4633, 10, 'r8'), (4634, 17, 'r9'), (4635, 24, 'r10'), (4636, 31, 'r11'), (4637, 38, 'r12'), (4638, 45, 'r13'), (4639, 52, 'r14'), (4640, 59, 'r15'), (4641, 66, 'r16'), (4642, 73, 'r17'), (4643, 80, 'r18'), (4644, 87, 'r19'), (4645, 94, 'r20'), (4646, 0, 'r21'), (4647, 7, 'r22'), (4648, 14, 'r23'), (4649, 21, 'r24'), (4650, 28, 'r25'), (4651, 35, 'r26'), (4652, 42, 'r27'), (4653, 49, 'r28'), (4654, 56, 'r29'), (4655, 63, 'r30'), (4656, 70, 'r31'), (4657, 77, 'r32'), (4658, 84, 'r33'), (4659, 91, 'r34'), (4660, 98, 'r35'), (4661, 4, 'r36'), (4662, 11, 'r0'), (4663, 18, 'r1'), (4664, 25, 'r2'), (4665, 32, 'r3'), (4666, 39, 'r4'), (4667, 46, 'r5'), (4668, 53, 'r6'), (4669, 60, 'r7'), (4670, 67, 'r8'), (4671, 74, 'r9'), (4672, 81, 'r10'), (4673, 88, 'r11'), (4674, 95, 'r12'), (4675, 1, 'r13'), (4676, 8, 'r14'), (4677, 15, 'r15'), (4678, 22, 'r16'), (4679, 29, 'r17'), (4680, 36, 'r18'), (4681, 43, 'r19'), (4682, 50, 'r20'), (4683, 57, 'r21'), (4684, 64, 'r22'), (4685, 71, 'r23'), (4686, 78, 'r24'), (4687, 85, 'r25'), (4688, 92, 'r26'), (4689, 99, 'r27'), (4690, 5, 'r28'), (4691, 12, 'r29'), (4692, 19, 'r30'), (4693, 26, 'r31'), (4694, 33, 'r32'), (4695, 40, 'r33'), (4696, 47, 'r34'), (4697, 54, 'r35'), (4698, 61, 'r36'), (4699, 68, 'r0'), (4700, 75, 'r1'), (4701, 82, 'r2'), (4702, 89, 'r3'), (4703, 96, 'r4'), (4704, 2, 'r5'), (4705, 9, 'r6'), (4706, 16, 'r7'), (4707, 23, 'r8'), (4708, 30, 'r9'), (4709, 37, 'r10'), (4710, 44, 'r11'), (4711, 51, 'r12'), (4712, 58, 'r13'), (4713, 65, 'r14'), (4714, 72, 'r15'), (4715, 79, 'r16'), (4716, 86, 'r17'), (4717, 93, 'r18'), (4718, 100, 'r19'), (4719, 6, 'r20'), (4720, 13, 'r21'), (4721, 20, 'r22'), (4722, 27, 'r23'), (4723, 34, 'r24'), (4724, 41, 'r25'), (4725, 48, 'r26'), (4726, 55, 'r27'), (4727, 62, 'r28'), (4728, 69, 'r29'), (4729, 76, 'r30'), (4730, 83, 'r31'), (4731, 90, 'r32'), (4732, 97, 'r33'), (4733, 3, 'r34'), (4734, 10, 'r35'), (4735, 17, 'r36'), (4736, 24, 'r0'), (4737, 31, 'r1'), (4738, 38, 'r2'), (4739, 45, 'r3'), (4740, 52, 'r4'), (4741, 59, 'r5'), (4742, 66, 'r6'), (4743, 73, 'r7'), (4744, 80, 'r8'), (4745, 87, 'r9'), (4746, 94, 'r10'), (4747, 0, 'r11'), (4748, 7, 'r12'), (4749, 14, 'r13'), (4750, 21, 'r14'), (4751, 28, 'r15'), (4752, 35, 'r16'), (4753, 42, 'r17'), (4754, 49, 'r18'), (4755, 56, 'r19'), (4756, 63, 'r20'), (4757, 70, 'r21'), (4758, 77, 'r22'), (4759, 84, 'r23'), (4760, 91, 'r24'), (4761, 98, 'r25'), (4762, 4, 'r26'), (4763, 11, 'r27'), (4764, 18, 'r28'), (4765, 25, 'r29'), (4766, 32, 'r30'), (4767, 39, 'r31'), (4768, 46, 'r32'), (4769, 53, 'r33'), (4770, 60, 'r34'), (4771, 67, 'r35'), (4772, 74, 'r36'), (4773, 81, 'r0'), (4774, 88, 'r1'), (4775, 95, 'r2'), (4776, 1, 'r3'), (4777, 8, 'r4'), (4778, 15, 'r5'), (4779, 22, 'r6'), (4780, 29, 'r7'), (4781, 36, 'r8'), (4782, 43, 'r9'), (4783, 50, 'r10'), (4784, 57, 'r11'), (4785, 64, 'r12'), (4786, 71, 'r13'), (4787, 78, 'r14'), (4788, 85, 'r15'), (4789, 92, 'r16'), (4790, 99, 'r17'), (4791, 5, 'r18'), (4792, 12, 'r19'), (4793, 19, 'r20'), (4794, 26, 'r21'), (4795, 33, 'r22'), (4796, 40, 'r23'), (4797, 47, 'r24'), (4798, 54, 'r25'), (4799, 61, 'r26'), (4800, 68, 'r27'), (4801, 75, 'r28'), (4802, 82, 'r29'), (4803, 89, 'r30'), (4804, 96, 'r31'), (4805, 2, 'r32'), (4806, 9, 'r33'), (4807, 16, 'r34'), (4808, 23, 'r35'), (4809, 30, 'r36'), (4810, 37, 'r0'), (4811, 44, 'r1'), (4812, 51, 'r2'), (4813, 58, 'r3'), (4814, 65, 'r4'), (4815, 72, 'r5'), (4816, 79, 'r6'), (4817, 86, 'r7'), (4818, 93, 'r8'), (4819, 100, 'r9'), (4820, 6, 'r10'), (4821, 13, 'r11'), (4822, 20, 'r12'), (4823, 27, 'r13'), (4824, 34, 'r14'), (4825, 41, 'r15'), (4826, 48, 'r16'), (4827, 55, 'r17'), (4828, 62, 'r18'), (4829, 69, 'r19'), (4830, 76, 'r20'), (4831, 83, 'r21'), (4832, 90, 'r22'), (4833, 97, 'r23'), (4834, 3, 'r24'), (4835, 10, 'r25'), (4836, 17, 'r26'), (4837, 24, 'r27'), (4838, 31, 'r28'), (4839, 38, 'r29'), (4840, 45, 'r30'), (4841, 52, 'r31'), (4842, 59, 'r32'), (4843, 66, 'r33'), (4844, 73, 'r34'), (4845, 80, 'r35'), (4846, 87, 'r36'), (4847, 94, 'r0'), (4848, 0, 'r1'), (4849, 7, 'r2'), (4850, 14, 'r3'), (4851, 21, 'r4'), (4852, 28, 'r5'), (4853, 35, 'r6'), (4854, 42, 'r7'), (4855, 49, 'r8'), (4856, 56, 'r9'), (4857, 63, 'r10'), (4858, 70, 'r11'), (4859, 77, 'r12'), (4860, 84, 'r13'), (4861, 91, 'r14'), (4862, 98, 'r15'), (4863, 4, 'r16'), (4864, 11, 'r17'), (4865, 18, 'r18'), (4866, 25, 'r19'), (4867, 32, 'r20'), (4868, 39, 'r21'), (4869, 46, 'r22'), (4870, 53, 'r23'), (4871, 60, 'r24'), (4872, 67, 'r25'), (4873, 74, 'r26'), (4874, 81, 'r27'), (4875, 88, 'r28'), (4876, 95, 'r29'), (4877, 1, 'r30'), (4878, 8, 'r31'), (4879, 15, 'r32'), (4880, 22, 'r33'), (4881, 29, 'r34'), (4882, 36, 'r35'), (4883, 43, 'r36'), (4884, 50, 'r0'), (4885, 57, 'r1'), (4886, 64, 'r2'), (4887, 71, 'r3'), (4888, 78, 'r4'), (4889, 85, 'r5'), (4890, 92, 'r6'), (4891, 99, 'r7'), (4892, 5, 'r8'), (4893, 12, 'r9'), (4894, 19, 'r10'), (4895, 26, 'r11'), (4896, 33, 'r12'), (4897, 40, 'r13'), (4898, 47, 'r14'), (4899, 54, 'r15'), (4900, 61, 'r16'), (4901, 68, 'r17'), (4902, 75, 'r18'), (4903, 82, 'r19'), (4904, 89, 'r20'), (4905, 96, 'r21'), (4906, 2, 'r22'), (4907, 9, 'r23'), (4908, 16, 'r24'), (4909, 23, 'r25'), (4910, 30, 'r26'), (4911, 37, 'r27'), (4912, 44, 'r28'), (4913, 51, 'r29'), (4914, 58, 'r30'), (4915, 65, 'r31'), (4916, 72, 'r32'), (4917, 79, 'r33'), (4918, 86, 'r34'), (4919, 93, 'r35'), (4920, 100, 'r36'), (4921, 6, 'r0'), (4922, 13, 'r1'), (4923, 20, 'r2'), (4924, 27, 'r3'), (4925, 34, 'r4'), (4926, 41, 'r5'), (4927, 48, 'r6'), (4928, 55, 'r7'), (4929, 62, 'r8'), (4930, 69, 'r9'), (4931, 76, 'r10'), (4932, 83, 'r11'), (4933, 90, 'r12'), (4934, 97, 'r13'), (4935, 3, 'r14'), (4936, 10, 'r15'), (4937, 17, 'r16'), (4938, 24, 'r17'), (4939, 31, 'r18'), (4940, 38, 'r19'), (4941, 45, 'r20'), (4942, 52, 'r21'), (4943, 59, 'r22'), (4944, 66, 'r23'), (4945, 73, 'r24'), (4946, 80, 'r25'), (4947, 87, 'r26'), (4948, 94, 'r27'), (4949, 0, 'r28'), (4950, 7, 'r29'), (4951, 14, 'r30'), (4952, 21, 'r31'), (4953, 28, 'r32'), (4954, 35, 'r33'), (4955, 42, 'r34'), (4956, 49, 'r35'), (4957, 56, 'r36'), (4958, 63, 'r0'), (4959, 70, 'r1'), (4960, 77, 'r2'), (4961, 84, 'r3'), (4962, 91, 'r4'), (4963, 98, 'r5'), (4964, 4, 'r6'), (4965, 11, 'r7'), (4966, 18, 'r8'), (4967, 25, 'r9'), (4968, 32, 'r10'), (4969, 39, 'r11'), (4970, 46, 'r12'), (4971, 53, 'r13'), (4972, 60, 'r14'), (4973, 67, 'r15'), (4974, 74, 'r16'), (4975, 81, 'r17'), (4976, 88, 'r18'), (4977, 95, 'r19'), (4978, 1, 'r20'), (4979, 8, 'r21'), (4980, 15, 'r22'), (4981, 22, 'r23'), (4982, 29, 'r24'), (4983, 36, 'r25'), (4984, 43, 'r26'), (4985, 50, 'r27'), (4986, 57, 'r28'), (4987, 64, 'r29'), (4988, 71, 'r30'), (4989, 78, 'r31'), (4990, 85, 'r32'), (4991, 92, 'r33'), (4992, 99, 'r34'), (4993, 5, 'r35'), (4994, 12, 'r36'), (4995, 19, 'r0'), (4996, 26, 'r1'), (4997, 33, 'r2'), (4998, 40, 'r3'), (4999, 47, 'r4'), (5000, 54, 'r5'), (5001, 61, 'r6'), (5002, 68, 'r7'), (5003, 75, 'r8'), (5004, 82, 'r9'), (5005, 89, 'r10'), (5006, 96, 'r11'), (5007, 2, 'r12'), (5008, 9, 'r13'), (5009, 16, 'r14'), (5010, 23, 'r15'), (5011, 30, 'r16'), (5012, 37, 'r17'), (5013, 44, 'r18'), (5014, 51, 'r19'), (5015, 58, 'r20'), (5016, 65, 'r21'), (5017, 72, 'r22'), (5018, 79, 'r23'), (5019, 86, 'r24'), (5020, 93, 'r25'), (5021, 100, 'r26'), (5022, 6, 'r27'), (5023, 13, 'r28'), (5024, 20, 'r29'), (5025, 27, 'r30'), (5026, 34, 'r31'), (5027, 41, 'r32'), (5028, 48, 'r33'), (5029, 55, 'r34'), (5030, 62, 'r35'), (5031, 69, 'r36'), (5032, 76, 'r0'), (5033, 83, 'r1'), (5034, 90, 'r2'), (5035, 97, 'r3'), (5036, 3, 'r4'), (5037, 10, 'r5'), (5038, 17, 'r6'), (5039, 24, 'r7'), (5040, 31, 'r8'), (5041, 38, 'r9'), (5042, 45, 'r10'), (5043, 52, 'r11'), (5044, 59, 'r12'), (5045, 66, 'r13'), (5046, 73, 'r14'), (5047, 80, 'r15'), (5048, 87, 'r16'), (5049, 94, 'r17'), (5050, 0, 'r18'), (5051, 7, 'r19'), (5052, 14, 'r20'), (5053, 21, 'r21'), (5054, 28, 'r22'), (5055, 35, 'r23'), (5056, 42, 'r24'), (5057, 49, 'r25'), (5058, 56, 'r26'), (5059, 63, 'r27'), (5060, 70, 'r28'), (5061, 77, 'r29'), (5062, 84, 'r30'), (5063, 91, 'r31'), (5064, 98, 'r32'), (5065, 4, 'r33'), (5066, 11, 'r34'), (5067, 18, 'r35'), (5068, 25, 'r36'), (5069, 32, 'r0'), (5070, 39, 'r1'), (5071, 46, 'r2'), (5072, 53, 'r3'), (5073, 60, 'r4'), (5074, 67, 'r5'), (5075, 74, 'r6'), (5076, 81, 'r7'), (5077, 88, 'r8'), (5078, 95, 'r9'), (5079, 1, 'r10'), (5080, 8, 'r11'), (5081, 15, 'r12'), (5082, 22, 'r13'), (5083, 29, 'r14'), (5084, 36, 'r15'), (5085, 43, 'r16'), (5086, 50, 'r17'), (5087, 57, 'r18'), (5088, 64, 'r19'), (5089, 71, 'r20'), (5090, 78, 'r21'), (5091, 85, 'r22'), (5092, 92, 'r23'), (5093, 99, 'r24'), (5094, 5, 'r25'), (5095, 12, 'r26'), (5096, 19, 'r27'), (5097, 26, 'r28'), (5098, 33, 'r29'), (5099, 40, 'r30'), (5100, 47, 'r31'), (5101, 54, 'r32'), (5102, 61, 'r33'), (5103, 68, 'r34'), (5104, 75, 'r35'), (5105, 82, 'r36'), (5106, 89, 'r0'), (5107, 96, 'r1'), (5108, 2, 'r2'), (5109, 9, 'r3'), (5110, 16, 'r4'), (5111, 23, 'r5'), (5112, 30, 'r6'), (5113, 37, 'r7'), (5114, 44, 'r8'), (5115, 51, 'r9'), (5116, 58, 'r10'), (5117, 65, 'r11'), (5118, 72, 'r12'), (5119, 79, 'r13'), (5120, 86, 'r14'), (5121, 93, 'r15'), (5122, 100, 'r16'), (5123, 6, 'r17'), (5124, 13, 'r18'), (5125, 20, 'r19'), (5126, 27, 'r20'), (5127, 34, 'r21'), (5128, 41, 'r22'), (5129, 48, 'r23'), (5130, 55, 'r24'), (5131, 62, 'r25'), (5132, 69, 'r26'), (5133, 76, 'r27'), (5134, 83, 'r28'), (5135, 90, 'r29'), (5136, 97, 'r30'), (5137, 3, 'r31'), (5138, 10, 'r32'), (5139, 17, 'r33'), (5140, 24, 'r34'), (5141, 31, 'r35'), (5142, 38, 'r36'), (5143, 45, 'r0'), (5144, 52, 'r1'), (5145, 59, 'r2'), (5146, 66, 'r3'), (5147, 73, 'r4'), (5148, 80, 'r5'), (5149, 87, 'r6'), (5150, 94, 'r7'), (5151, 0, 'r8'), (5152, 7, 'r9'), (5153, 14, 'r10'), (5154, 21, 'r11'), (5155, 28, 'r12'), (5156, 35, 'r13'), (5157, 42, 'r14'), (5158, 49, 'r15'), (5159, 56, 'r16'), (5160, 63, 'r17'), (5161, 70, 'r18'), (5162, 77, 'r19'), (5163, 84, 'r20'), (5164, 91, 'r21'), (5165, 98, 'r22'), (5166, 4, 'r23'), (5167, 11, 'r24'), (5168, 18, 'r25'), (5169, 25, 'r26'), (5170, 32, 'r27'), (5171, 39, 'r28'), (5172, 46, 'r29'), (5173, 53, 'r30'), (5174, 60, 'r31'), (5175, 67, 'r32'), (5176, 74, 'r33'), (5177, 81, 'r34'), (5178, 88, 'r35'), (5179, 95, 'r36'), (5180, 1, 'r0'), (5181, 8, 'r1'), (5182, 15, 'r2'), (5183, 22, 'r3'), (5184, 29, 'r4'), (5185, 36, 'r5'), (5186, 43, 'r6'), (5187, 50, 'r7'), (5188, 57, 'r8'), (5189, 64, 'r9'), (5190, 71, 'r10'), (5191, 78, 'r11'), (5192, 85, 'r12'), (5193, 92, 'r13'), (5194, 99, 'r14'), (5195, 5, 'r15'), (5196, 12, 'r16'), (5197, 19, 'r17'), (5198, 26, 'r18'), (5199, 33, 'r19'), (5200, 40, 'r20'), (5201, 47, 'r21'), (5202, 54, 'r22'), (5203, 61, 'r23'), (5204, 68, 'r24'), (5205, 75, 'r25'), (5206, 82, 'r26'), (5207, 89, 'r27'), (5208, 96, 'r28'), (5209, 2, 'r29'), (5210, 9, 'r30'), (5211, 16, 'r31'), (5212, 23, 'r32'), (5213, 30, 'r33'), (5214, 37, 'r34'), (5215, 44, 'r35'), (5216, 51, 'r36'), (5217, 58, 'r0'), (5218, 65, 'r1'), (5219, 72, 'r2'), (5220, 79, 'r3'), (5221, 86, 'r4'), (5222, 93, 'r5'), (5223, 100, 'r6'), (5224, 6, 'r7'), (5225, 13, 'r8'), (5226, 20, 'r9'), (5227, 27, 'r10'), (5228, 34, 'r11'), (5229, 41, 'r12'), (5230, 48, 'r13'), (5231, 55, 'r14'), (5232, 62, 'r15'), (5233, 69, 'r16'), (5234, 76, 'r17'), (5235, 83, 'r18'), (5236, 90, 'r19'), (5237, 97, 'r20'), (5238, 3, 'r21'), (5239, 10, 'r22'), (5240, 17, 'r23'), (5241, 24, 'r24'), (5242, 31, 'r25'), (5243, 38, 'r26'), (5244, 45, 'r27'), (5245, 52, 'r28'), (5246, 59, 'r29'), (5247, 66, 'r30'), (5248, 73, 'r31'), (5249, 80, 'r32'), (5250, 87, 'r33'), (5251, 94, 'r34'), (5252, 0, 'r35'), (5253, 7, 'r36'), (5254, 14, 'r0'), (5255, 21, 'r1'), (5256, 28, 'r2'), (5257, 35, 'r3'), (5258, 42, 'r4'), (5259, 49, 'r5'), (5260, 56, 'r6'), (5261, 63, 'r7'), (5262, 70, 'r8'), (5263, 77, 'r9'), (5264, 84, 'r10'), (5265, 91, 'r11'), (5266, 98, 'r12'), (5267, 4, 'r13'), (5268, 11, 'r14'), (5269, 18, 'r15'), (5270, 25, 'r16'), (5271, 32, 'r17'), (5272, 39, 'r18'), (5273, 46, 'r19'), (5274, 53, 'r20'), (5275, 60, 'r21'), (5276, 67, 'r22'), (5277, 74, 'r23'), (5278, 81, 'r24'), (5279, 88, 'r25'), (5280, 95, 'r26'), (5281, 1, 'r27'), (5282, 8, 'r28'), (5283, 15, 'r29'), (5284, 22, 'r30'), (5285, 29, 'r31'), (5286, 36, 'r32'), (5287, 43, 'r33'), (5288, 50, 'r34'), (5289, 57, 'r35'), (5290, 64, 'r36'), (5291, 71, 'r0'), (5292, 78, 'r1'), (5293, 85, 'r2'), (5294, 92, 'r3'), (5295, 99, 'r4'), (5296, 5, 'r5'), (5297, 12, 'r6'), (5298, 19, 'r7'), (5299, 26, 'r8'), (5300, 33, 'r9'), (5301, 40, 'r10'), (5302, 47, 'r11'), (5303, 54, 'r12'), (5304, 61, 'r13'), (5305, 68, 'r14'), (5306, 75, 'r15'), (5307, 82, 'r16'), (5308, 89, 'r17'), (5309, 96, 'r18'), (5310, 2, 'r19'), (5311, 9, 'r20'), (5312, 16, 'r21'), (5313, 23, 'r22'), (5314, 30, 'r23'), (5315, 37, 'r24'), (5316, 44, 'r25'), (5317, 51, 'r26'), (5318, 58, 'r27'), (5319, 65, 'r28'), (5320, 72, 'r29'), (5321, 79, 'r30'), (5322, 86, 'r31'), (5323, 93, 'r32'), (5324, 100, 'r33'), (5325, 6, 'r34'), (5326, 13, 'r35'), (5327, 20, 'r36'), (5328, 27, 'r0'), (5329, 34, 'r1'), (5330, 41, 'r2'), (5331, 48, 'r3'), (5332, 55, 'r4'), (5333, 62, 'r5'), (5334, 69, 'r6'), (5335, 76, 'r7'), (5336, 83, 'r8'), (5337, 90, 'r9'), (5338, 97, 'r10'), (5339, 3, 'r11'), (5340, 10, 'r12'), (5341, 17, 'r13'), (5342, 24, 'r14'), (5343, 31, 'r15'), (5344, 38, 'r16'), (5345, 45, 'r17'), (5346, 52, 'r18'), (5347, 59, 'r19'), (5348, 66, 'r20'), (5349, 73, 'r21'), (5350, 80, 'r22'), (5351, 87, 'r23'), (5352, 94, 'r24'), (5353, 0, 'r25'), (5354, 7, 'r26'), (5355, 14, 'r27'), (5356, 21, 'r28'), (5357, 28, 'r29'), (5358, 35, 'r30'), (5359, 42, 'r31'), (5360, 49, 'r32'), (5361, 56, 'r33'), (5362, 63, 'r34'), (5363, 70, 'r35'), (5364, 77, 'r36'), (5365, 84, 'r0'), (5366, 91, 'r1'), (5367, 98, 'r2'), (5368, 4, 'r3'), (5369, 11, 'r4'), (5370, 18, 'r5'), (5371, 25, 'r6'), (5372, 32, 'r7'), (5373, 39, 'r8'), (5374, 46, 'r9'), (5375, 53, 'r10'), (5376, 60, 'r11'), (5377, 67, 'r12'), (5378, 74, 'r13'), (5379, 81, 'r14'), (5380, 88, 'r15'), (5381, 95, 'r16'), (5382, 1, 'r17'), (5383, 8, 'r18'), (5384, 15, 'r19'), (5385, 22, 'r20'), (5386, 29, 'r21'), (5387, 36, 'r22'), (5388, 43, 'r23'), (5389, 50, 'r24'), (5390, 57, 'r25'), (5391, 64, 'r26'), (5392, 71, 'r27'), (5393, 78, 'r28'), (5394, 85, 'r29'), (5395, 92, 'r30'), (5396, 99, 'r31'), (5397, 5, 'r32'), (5398, 12, 'r33'), (5399, 19, 'r34'), (5400, 26, 'r35'), (5401, 33, 'r36'), (5402, 40, 'r0'), (5403, 47, 'r1'), (5404, 54, 'r2'), (5405, 61, 'r3'), (5406, 68, 'r4'), (5407, 75, 'r5'), (5408, 82, 'r6'), (5409, 89, 'r7'), (5410, 96, 'r8'), (5411, 2, 'r9'), (5412, 9, 'r10'), (5413, 16, 'r11'), (5414, 23, 'r12'), (5415, 30, 'r13'), (5416, 37, 'r14'), (5417, 44, 'r15'), (5418, 51, 'r16'), (5419, 58, 'r17'), (5420, 65, 'r18'), (5421, 72, 'r19'), (5422, 79, 'r20'), (5423, 86, 'r21'), (5424, 93, 'r22'), (5425, 100, 'r23'), (5426, 6, 'r24'), (5427, 13, 'r25'), (5428, 20, 'r26'), (5429, 27, 'r27'), (5430, 34, 'r28'), (5431, 41, 'r29'), (5432, 48, 'r30'), (5433, 55, 'r31'), (5434, 62, 'r32'), (5435, 69, 'r33'), (5436, 76, 'r34'), (5437, 83, 'r35'), (5438, 90, 'r36'), (5439, 97, 'r0'), (5440, 3, 'r1'), (5441, 10, 'r2'), (5442, 17, 'r3'), (5443, 24, 'r4'), (5444, 31, 'r5'), (5445, 38, 'r6'), (5446, 45, 'r7'), (5447, 52, 'r8'), (5448, 59, 'r9'), (5449, 66, 'r10'), (5450, 73, 'r11'), (5451, 80, 'r12'), (5452, 87, 'r13'), (5453, 94, 'r14'), (5454, 0, 'r15'), (5455, 7, 'r16'), (5456, 14, 'r17'), (5457, 21, 'r18'), (5458, 28, 'r19'), (5459, 35, 'r20'), (5460, 42, 'r21'), (5461, 49, 'r22'), (5462, 56, 'r23'), (5463, 63, 'r24'), (5464, 70, 'r25'), (5465, 77, 'r26'), (5466, 84, 'r27'), (5467, 91, 'r28'), (5468, 98, 'r29'), (5469, 4, 'r30'), (5470, 11, 'r31'), (5471, 18, 'r32'), (5472, 25, 'r33'), (5473, 32, 'r34'), (5474, 39, 'r35'), (5475, 46, 'r36'), (5476, 53, 'r0'), (5477, 60, 'r1'), (5478, 67, 'r2'), (5479, 74, 'r3'), (5480, 81, 'r4'), (5481, 88, 'r5'), (5482, 95, 'r6'), (5483, 1, 'r7'), (5484, 8, 'r8'), (5485, 15, 'r9'), (5486, 22, 'r10'), (5487, 29, 'r11'), (5488, 36, 'r12'), (5489, 43, 'r13'), (5490, 50, 'r14'), (5491, 57, 'r15'), (5492, 64, 'r16'), (5493, 71, 'r17'), (5494, 78, 'r18'), (5495, 85, 'r19'), (5496, 92, 'r20'), (5497, 99, 'r21'), (5498, 5, 'r22'), (5499, 12, 'r23'), (5500, 19, 'r24'), (5501, 26, 'r25'), (5502, 33, 'r26'), (5503, 40, 'r27'), (5504, 47, 'r28'), (5505, 54, 'r29'), (5506, 61, 'r30'), (5507, 68, 'r31'), (5508, 75, 'r32'), (5509, 82, 'r33'), (5510, 89, 'r34'), (5511, 96, 'r35'), (5512, 2, 'r36'), (5513, 9, 'r0'), (5514, 16, 'r1'), (5515, 23, 'r2'), (5516, 30, 'r3'), (5517, 37, 'r4'), (5518, 44, 'r5'), (5519, 51, 'r6'), (5520, 58, 'r7'), (5521, 65, 'r8'), (5522, 72, 'r9'), (5523, 79, 'r10'), (5524, 86, 'r11'), (5525, 93, 'r12'), (5526, 100, 'r13'), (5527, 6, 'r14'), (5528, 13, 'r15'), (5529, 20, 'r16'), (5530, 27, 'r17'), (5531, 34, 'r18'), (5532, 41, 'r19'), (5533, 48, 'r20'), (5534, 55, 'r21'), (5535, 62, 'r22'), (5536, 69, 'r23'), (5537, 76, 'r24'), (5538, 83, 'r25'), (5539, 90, 'r26'), (5540, 97, 'r27'), (5541, 3, 'r28'), (5542, 10, 'r29'), (5543, 17, 'r30'), (5544, 24, 'r31'), (5545, 31, 'r32'), (5546, 38, 'r33'), (5547, 45, 'r34'), (5548, 52, 'r35'), (5549, 59, 'r36'), (5550, 66, 'r0'), (5551, 73, 'r1'), (5552, 80, 'r2'), (5553, 87, 'r3'), (5554, 94, 'r4'), (5555, 0, 'r5'), (5556, 7, 'r6'), (5557, 14, 'r7'), (5558, 21, 'r8'), (5559, 28, 'r9'), (5560, 35, 'r10'), (5561, 42, 'r11'), (5562, 49, 'r12'), (5563, 56, 'r13'), (5564, 63, 'r14'), (5565, 70, 'r15'), (5566, 77, 'r16'), (5567, 84, 'r17'), (5568, 91, 'r18'), (5569, 98, 'r19'), (5570, 4, 'r20'), (5571, 11, 'r21'), (5572, 18, 'r22'), (5573, 25, 'r23'), (5574, 32, 'r24'), (5575, 39, 'r25'), (5576, 46, 'r26'), (5577, 53, 'r27'), (5578, 60, 'r28'), (5579, 67, 'r29'), (5580, 74, 'r30'), (5581, 81, 'r31'), (5582, 88, 'r32'), (5583, 95, 'r33'), (5584, 1, 'r34'), (5585, 8, 'r35'), (5586, 15, 'r36'), (5587, 22, 'r0'), (5588, 29, 'r1'), (5589, 36, 'r2'), (5590, 43, 'r3'), (5591, 50, 'r4'), (5592, 57, 'r5'), (5593, 64, 'r6'), (5594, 71, 'r7'), (5595, 78, 'r8'), (5596, 85, 'r9'), (5597, 92, 'r10'), (5598, 99, 'r11'), (5599, 5, 'r12'), (5600, 12, 'r13'), (5601, 19, 'r14'), (5602, 26, 'r15'), (5603, 33, 'r16'), (5604, 40, 'r17'), (5605, 47, 'r18'), (5606, 54, 'r19'), (5607, 61, 'r20'), (5608, 68, 'r21'), (5609, 75, 'r22'), (5610, 82, 'r23'), (5611, 89, 'r24'), (5612, 96, 'r25'), (5613, 2, 'r26'), (5614, 9, 'r27'), (5615, 16, 'r28'), (5616, 23, 'r29'), (5617, 30, 'r30'), (5618, 37, 'r31'), (5619, 44, 'r32'), (5620, 51, 'r33'), (5621, 58, 'r34'), (5622, 65, 'r35'), (5623, 72, 'r36'), (5624, 79, 'r0'), (5625, 86, 'r1'), (5626, 93, 'r2'), (5627, 100, 'r3'), (5628, 6, 'r4'), (5629, 13, 'r5'), (5630, 20, 'r6'), (5631, 27, 'r7'), (5632, 34, 'r8'), (5633, 41, 'r9'), (5634, 48, 'r10'), (5635, 55, 'r11'), (5636, 62, 'r12'), (5637, 69, 'r13'), (5638, 76, 'r14'), (5639, 83, 'r15'), (5640, 90, 'r16'), (5641, 97, 'r17'), (5642, 3, 'r18'), (5643, 10, 'r19'), (5644, 17, 'r20'), (5645, 24, 'r21'), (5646, 31, 'r22'), (5647, 38, 'r23'), (5648, 45, 'r24'), (5649, 52, 'r25'), (5650, 59, 'r26'), (5651, 66, 'r27'), (5652, 73, 'r28'), (5653, 80, 'r29'), (5654, 87, 'r30'), (5655, 94, 'r31'), (5656, 0, 'r32'), (5657, 7, 'r33'), (5658, 14, 'r34'), (5659, 21, 'r35'), (5660, 28, 'r36'), (5661, 35, 'r0'), (5662, 42, 'r1'), (5663, 49, 'r2'), (5664, 56, 'r3'), (5665, 63, 'r4'), (5666, 70, 'r5'), (5667, 77, 'r6'), (5668, 84, 'r7'), (5669, 91, 'r8'), (5670, 98, 'r9'), (5671, 4, 'r10'), (5672, 11, 'r11'), (5673, 18, 'r12'), (5674, 25, 'r13'), (5675, 32, 'r14'), (5676, 39, 'r15'), (5677, 46, 'r16'), (5678, 53, 'r17'), (5679, 60, 'r18'), (5680, 67, 'r19'), (5681, 74, 'r20'), (5682, 81, 'r21'), (5683, 88, 'r22'), (5684, 95, 'r23'), (5685, 1, 'r24'), (5686, 8, 'r25'), (5687, 15, 'r26'), (5688, 22, 'r27'), (5689, 29, 'r28'), (5690, 36, 'r29'), (5691, 43, 'r30'), (5692, 50, 'r31'), (5693, 57, 'r32'), (5694, 64, 'r33'), (5695, 71, 'r34'), (5696, 78, 'r35'), (5697, 85, 'r36'), (5698, 92, 'r0'), (5699, 99, 'r1'), (5700, 5, 'r2'), (5701, 12, 'r3'), (5702, 19, 'r4'), (5703, 26, 'r5'), (5704, 33, 'r6'), (5705, 40, 'r7'), (5706, 47, 'r8'), (5707, 54, 'r9'), (5708, 61, 'r10'), (5709, 68, 'r11'), (5710, 75, 'r12'), (5711, 82, 'r13'), (5712, 89, 'r14'), (5713, 96, 'r15'), (5714, 2, 'r16'), (5715, 9, 'r17'), (5716, 16, 'r18'), (5717, 23, 'r19'), (5718, 30, 'r20'), (5719, 37, 'r21'), (5720, 44, 'r22'), (5721, 51, 'r23'), (5722, 58, 'r24'), (5723, 65, 'r25'), (5724, 72, 'r26'), (5725, 79, 'r27'), (5726, 86, 'r28'), (5727, 93, 'r29'), (5728, 100, 'r30'), (5729, 6, 'r31'), (5730, 13, 'r32'), (5731, 20, 'r33'), (5732, 27, 'r34'), (5733, 34, 'r35'), (5734, 41, 'r36'), (5735, 48, 'r0'), (5736, 55, 'r1'), (5737, 62, 'r2'), (5738, 69, 'r3'), (5739, 76, 'r4'), (5740, 83, 'r5'), (5741, 90, 'r6'), (5742, 97, 'r7'), (5743, 3, 'r8'), (5744, 10, 'r9'), (5745, 17, 'r10'), (5746, 24, 'r11'), (5747, 31, 'r12'), (5748, 38, 'r13'), (5749, 45, 'r14'), (5750, 52, 'r15'), (5751, 59, 'r16'), (5752, 66, 'r17'), (5753, 73, 'r18'), (5754, 80, 'r19'), (5755, 87, 'r20'), (5756, 94, 'r21'), (5757, 0, 'r22'), (5758, 7, 'r23'), (5759, 14, 'r24'), (5760, 21, 'r25'), (5761, 28, 'r26'), (5762, 35, 'r27'), (5763, 42, 'r28'), (5764, 49, 'r29'), (5765, 56, 'r30'), (5766, 63, 'r31'), (5767, 70, 'r32'), (5768, 77, 'r33'), (5769, 84, 'r34'), (5770, 91, 'r35'), (5771, 98, 'r36'), (5772, 4, 'r0'), (5773, 11, 'r1'), (5774, 18, 'r2'), (5775, 25, 'r3'), (5776, 32, 'r4'), (5777, 39, 'r5'), (5778, 46, 'r6'), (5779, 53, 'r7'), (5780, 60, 'r8'), (5781, 67, 'r9'), (5782, 74, 'r10'), (5783, 81, 'r11'), (5784, 88, 'r12'), (5785, 95, 'r13'), (5786, 1, 'r14'), (5787, 8, 'r15'), (5788, 15, 'r16'), (5789, 22, 'r17'), (5790, 29, 'r18'), (5791, 36, 'r19'), (5792, 43, 'r20'), (5793, 50, 'r21'), (5794, 57, 'r22'), (5795, 64, 'r23'), (5796, 71, 'r24'), (5797, 78, 'r25'), (5798, 85, 'r26'), (5799, 92, 'r27'), (5800, 99, 'r28'), (5801, 5, 'r29'), (5802, 12, 'r30'), (5803, 19, 'r31'), (5804, 26, 'r32'), (5805, 33, 'r33'), (5806, 40, 'r34'), (5807, 47, 'r35'), (5808, 54, 'r36'), (5809, 61, 'r0'), (5810, 68, 'r1'), (5811, 75, 'r2'), (5812, 82, 'r3'), (5813, 89, 'r4'), (5814, 96, 'r5'), (5815, 2, 'r6'), (5816, 9, 'r7'), (5817, 16, 'r8'), (5818, 23, 'r9'), (5819, 30, 'r10'), (5820, 37, 'r11'), (5821, 44, 'r12'), (5822, 51, 'r13'), (5823, 58, 'r14'), (5824, 65, 'r15'), (5825, 72, 'r16'), (5826, 79, 'r17'), (5827, 86, 'r18'), (5828, 93, 'r19'), (5829, 100, 'r20'), (5830, 6, 'r21'), (5831, 13, 'r22'), (5832, 20, 'r23'), (5833, 27, 'r24'), (5834, 34, 'r25'), (5835, 41, 'r26'), (5836, 48, 'r27'), (5837, 55, 'r28'), (5838, 62, 'r29'), (5839, 69, 'r30'), (5840, 76, 'r31'), (5841, 83, 'r32'), (5842, 90, 'r33'), (5843, 97, 'r34'), (5844, 3, 'r35'), (5845, 10, 'r36'), (5846, 17, 'r0'), (5847, 24, 'r1'), (5848, 31, 'r2'), (5849, 38, 'r3'), (5850, 45, 'r4'), (5851, 52, 'r5'), (5852, 59, 'r6'), (5853, 66, 'r7'), (5854, 73, 'r8'), (5855, 80, 'r9'), (5856, 87, 'r10'), (5857, 94, 'r11'), (5858, 0, 'r12'), (5859, 7, 'r13'), (5860, 14, 'r14'), (5861, 21, 'r15'), (5862, 28, 'r16'), (5863, 35, 'r17'), (5864, 42, 'r18'), (5865, 49, 'r19'), (5866, 56, 'r20'), (5867, 63, 'r21'), (5868, 70, 'r22'), (5869, 77, 'r23'), (5870, 84, 'r24'), (5871, 91, 'r25'), (5872, 98, 'r26'), (5873, 4, 'r27'), (5874, 11, 'r28'), (5875, 18, 'r29'), (5876, 25, 'r30'), (5877, 32, 'r31'), (5878, 39, 'r32'), (5879, 46, 'r33'), (5880, 53, 'r34'), (5881, 60, 'r35'), (5882, 67, 'r36'), (5883, 74, 'r0'), (5884, 81, 'r1'), (5885, 88, 'r2'), (5886, 95, 'r3'), (5887, 1, 'r4'), (5888, 8, 'r5'), (5889, 15, 'r6'), (5890, 22, 'r7'), (5891, 29, 'r8'), (5892, 36, 'r9'), (5893, 43, 'r10'), (5894, 50, 'r11'), (5895, 57, 'r12'), (5896, 64, 'r13'), (5897, 71, 'r14'), (5898, 78, 'r15'), (5899, 85, 'r16'), (5900, 92, 'r17'), (5901, 99, 'r18'), (5902, 5, 'r19'), (5903, 12, 'r20'), (5904, 19, 'r21'), (5905, 26, 'r22'), (5906, 33, 'r23'), (5907, 40, 'r24'), (5908, 47, 'r25'), (5909, 54, 'r26'), (5910, 61, 'r27'), (5911, 68, 'r28'), (5912, 75, 'r29'), (5913, 82, 'r30'), (5914, 89, 'r31'), (5915, 96, 'r32'), (5916, 2, 'r33'), (5917, 9, 'r34'), (5918, 16, 'r35'), (5919, 23, 'r36'), (5920, 30, 'r0'), (5921, 37, 'r1'), (5922, 44, 'r2'), (5923, 51, 'r3'), (5924, 58, 'r4'), (5925, 65, 'r5'), (5926, 72, 'r6'), (5927, 79, 'r7'), (5928, 86, 'r8'), (5929, 93, 'r9'), (5930, 100, 'r10'), (5931, 6, 'r11'), (5932, 13, 'r12'), (5933, 20, 'r13'), (5934, 27, 'r14'), (5935, 34, 'r15'), (5936, 41, 'r16'), (5937, 48, 'r17'), (5938, 55, 'r18'), (5939, 62, 'r19'), (5940, 69, 'r20'), (5941, 76, 'r21'), (5942, 83, 'r22'), (5943, 90, 'r23'), (5944, 97, 'r24'), (5945, 3, 'r25'), (5946, 10, 'r26'), (5947, 17, 'r27'), (5948, 24, 'r28'), (5949, 31, 'r29'), (5950, 38, 'r30'), (5951, 45, 'r31'), (5952, 52, 'r32'), (5953, 59, 'r33'), (5954, 66, 'r34'), (5955, 73, 'r35'), (5956, 80, 'r36'), (5957, 87, 'r0'), (5958, 94, 'r1'), (5959, 0, 'r2'), (5960, 7, 'r3'), (5961, 14, 'r4'), (5962, 21, 'r5'), (5963, 28, 'r6'), (5964, 35, 'r7'), (5965, 42, 'r8'), (5966, 49, 'r9'), (5967, 56, 'r10'), (5968, 63, 'r11'), (5969, 70, 'r12'), (5970, 77, 'r13'), (5971, 84, 'r14'), (5972, 91, 'r15'), (5973, 98, 'r16'), (5974, 4, 'r17'), (5975, 11, 'r18'), (5976, 18, 'r19'), (5977, 25, 'r20'), (5978, 32, 'r21'), (5979, 39, 'r22'), (5980, 46, 'r23'), (5981, 53, 'r24'), (5982, 60, 'r25'), (5983, 67, 'r26'), (5984, 74, 'r27'), (5985, 81, 'r28'), (5986, 88, 'r29'), (5987, 95, 'r30'), (5988, 1, 'r31'), (5989, 8, 'r32'), (5990, 15, 'r33'), (5991, 22, 'r34'), (5992, 29, 'r35'), (5993, 36, 'r36'), (5994, 43, 'r0'), (5995, 50, 'r1'), (5996, 57, 'r2'), (5997, 64, 'r3'), (5998, 71, 'r4'), (5999, 78, 'r5');
+CREATE TABLE S(K INT, B INT, C VARCHAR, PRIMARY KEY(K));
+INSERT INTO S VALUES (0, 0, 'r0'), (13, 1, 'r1'), (26, 2, 'r2'), (39, 3, 'r3'), (52, 4, 'r4'), (65, 5, 'r5'), (78, 6, 'r6'), (91, 7, 'r7'), (104, 8, 'r8'), (117, 9, 'r9'), (130, 10, 'r10'), (143, 11, 'r11'), (156, 12, 'r12'), (169, 13, 'r13'), (182, 14, 'r14'), (195, 15, 'r15'), (208, 16, 'r16'), (221, 17, 'r17'), (234, 18, 'r18'), (247, 19, 'r19'), (260, 20, 'r20'), (273, 21, 'r21'), (286, 22, 'r22'), (299, 23, 'r23'), (312, 24, 'r24'), (325, 25, 'r25'), (338, 26, 'r26'), (351, 27, 'r27'), (364, 28, 'r28'), (377, 29, 'r29'), (390, 30, 'r30'), (403, 31, 'r31'), (416, 32, 'r32'), (429, 33, 'r33'), (442, 34, 'r34'), (455, 35, 'r35'), (468, 36, 'r36'), (481, 37, 'r37'), (494, 38, 'r38'), (507, 39, 'r39'), (520, 40, 'r40'), (533, 41, 'r0'), (546, 42, 'r1'), (559, 43, 'r2'), (572, 44, 'r3'), (585, 45, 'r4'), (598, 46, 'r5'), (611, 47, 'r6'), (624, 48, 'r7'), (637, 49, 'r8'), (650, 50, 'r9'), (663, 51, 'r10'), (676, 52, 'r11'), (689, 0, 'r12'), (702, 1, 'r13'), (715, 2, 'r14'), (728, 3, 'r15'), (741, 4, 'r16'), (754, 5, 'r17'), (767, 6, 'r18'), (780, 7, 'r19'), (793, 8, 'r20'), (806, 9, 'r21'), (819, 10, 'r22'), (832, 11, 'r23'), (845, 12, 'r24'), (858, 13, 'r25'), (871, 14, 'r26'), (884, 15, 'r27'), (897, 16, 'r28'), (910, 17, 'r29'), (923, 18, 'r30'), (936, 19, 'r31'), (949, 20, 'r32'), (962, 21, 'r33'), (975, 22, 'r34'), (988, 23, 'r35'), (1001, 24, 'r36'), (1014, 25, 'r37'), (1027, 26, 'r38'), (1040, 27, 'r39'), (1053, 28, 'r40'), (1066, 29, 'r0'), (1079, 30, 'r1'), (1092, 31, 'r2'), (1105, 32, 'r3'), (1118, 33, 'r4'), (1131, 34, 'r5'), (1144, 35, 'r6'), (1157, 36, 'r7'), (1170, 37, 'r8'), (1183, 38, 'r9'), (1196, 39, 'r10'), (1209, 40, 'r11'), (1222, 41, 'r12'), (1235, 42, 'r13'), (1248, 43, 'r14'), (1261, 44, 'r15'), (1274, 45, 'r16'), (1287, 46, 'r17'), (1300, 47, 'r18'), (1313, 48, 'r19'), (1326, 49, 'r20'), (1339, 50, 'r21'), (1352, 51, 'r22'), (1365, 52, 'r23'), (1378, 0, 'r24'), (1391, 1, 'r25'), (1404, 2, 'r26'), (1417, 3, 'r27'), (1430, 4, 'r28'), (1443, 5, 'r29'), (1456, 6, 'r30'), (1469, 7, 'r31'), (1482, 8, 'r32'), (1495, 9, 'r33'), (1508, 10, 'r34'), (1521, 11, 'r35'), (1534, 12, 'r36'), (1547, 13, 'r37'), (1560, 14, 'r38'), (1573, 15, 'r39'), (1586, 16, 'r40'), (1599, 17, 'r0'), (1612, 18, 'r1'), (1625, 19, 'r2'), (1638, 20, 'r3'), (1651, 21, 'r4'), (1664, 22, 'r5'), (1677, 23, 'r6'), (1690, 24, 'r7'), (1703, 25, 'r8'), (1716, 26, 'r9'), (1729, 27, 'r10'), (1742, 28, 'r11'), (1755, 29, 'r12'), (1768, 30, 'r13'), (1781, 31, 'r14'), (1794, 32, 'r15'), (1807, 33, 'r16'), (1820, 34, 'r17'), (1833, 35, 'r18'), (1846, 36, 'r19'), (1859, 37, 'r20'), (1872, 38, 'r21'), (1885, 39, 'r22'), (1898, 40, 'r23'), (1911, 41, 'r24'), (1924, 42, 'r25'), (1937, 43, 'r26'), (1950, 44, 'r27'), (1963, 45, 'r28'), (1976, 46, 'r29'), (1989, 47, 'r30'), (2002, 48, 'r31'), (2015, 49, 'r32'), (2028, 50, 'r33'), (2041, 51, 'r34'), (2054, 52, 'r35'), (2067, 0, 'r36'), (2080, 1, 'r37'), (2093, 2, 'r38'), (2106, 3, 'r39'), (2119, 4, 'r40'), (2132, 5, 'r0'), (2145, 6, 'r1'), (2158, 7, 'r2'), (2171, 8, 'r3'), (2184, 9, 'r4'), (2197, 10, 'r5'), (2210, 11, 'r6'), (2223, 12, 'r7'), (2236, 13, 'r8'), (2249, 14, 'r9'), (2262, 15, 'r10'), (2275, 16, 'r11'), (2288, 17, 'r12'), (2301, 18, 'r13'), (2314, 19, 'r14'), (2327, 20, 'r15'), (2340, 21, 'r16'), (2353, 22, 'r17'), (2366, 23, 'r18'), (2379, 24, 'r19'), (2392, 25, 'r20'), (2405, 26, 'r21'), (2418, 27, 'r22'), (2431, 28, 'r23'), (2444, 29, 'r24'), (2457, 30, 'r25'), (2470, 31, 'r26'), (2483, 32, 'r27'), (2496, 33, 'r28'), (2509, 34, 'r29'), (2522, 35, 'r30'), (2535, 36, 'r31'), (2548, 37, 'r32'), (2561, 38, 'r33'), (2574, 39, 'r34'), (2587, 40, 'r35'), (2600, 41, 'r36'), (2613, 42, 'r37'), (2626, 43, 'r38'), (2639, 44, 'r39'), (2652, 45, 'r40'), (2665, 46, 'r0'), (2678, 47, 'r1'), (2691, 48, 'r2'), (2704, 49, 'r3'), (2717, 50, 'r4'), (2730, 51, 'r5'), (2743, 52, 'r6'), (2756, 0, 'r7'), (2769, 1, 'r8'), (2782, 2, 'r9'), (2795, 3, 'r10'), (2808, 4, 'r11'), (2821, 5, 'r12'), (2834, 6, 'r13'), (2847, 7, 'r14'), (2860, 8, 'r15'), (2873, 9, 'r16'), (2886, 10, 'r17'), (2899, 11, 'r18'), (2912, 12, 'r19'), (2925, 13, 'r20'), (2938, 14, 'r21'), (2951, 15, 'r22'), (2964, 16, 'r23'), (2977, 17, 'r24'), (2990, 18, 'r25'), (3003, 19, 'r26'), (3016, 20, 'r27'), (3029, 21, 'r28'), (3042, 22, 'r29'), (3055, 23, 'r30'), (3068, 24, 'r31'), (3081, 25, 'r32'), (3094, 26, 'r33'), (3107, 27, 'r34'), (3120, 28, 'r35'), (3133, 29, 'r36'), (3146, 30, 'r37'), (3159, 31, 'r38'), (3172, 32, 'r39'), (3185, 33, 'r40'), (3198, 34, 'r0'), (3211, 35, 'r1'), (3224, 36, 'r2'), (3237, 37, 'r3'), (3250, 38, 'r4'), (3263, 39, 'r5'), (3276, 40, 'r6'), (3289, 41, 'r7'), (3302, 42, 'r8'), (3315, 43, 'r9'), (3328, 44, 'r10'), (3341, 45, 'r11'), (3354, 46, 'r12'), (3367, 47, 'r13'), (3380, 48, 'r14'), (3393, 49, 'r15'), (3406, 50, 'r16'), (3419, 51, 'r17'), (3432, 52, 'r18'), (3445, 0, 'r19'), (3458, 1, 'r20'), (3471, 2, 'r21'), (3484, 3, 'r22'), (3497, 4, 'r23'), (3510, 5, 'r24'), (3523, 6, 'r25'), (3536, 7, 'r26'), (3549, 8, 'r27'), (3562, 9, 'r28'), (3575, 10, 'r29'), (3588, 11, 'r30'), (3601, 12, 'r31'), (3614, 13, 'r32'), (3627, 14, 'r33'), (3640, 15, 'r34'), (3653, 16, 'r35'), (3666, 17, 'r36'), (3679, 18, 'r37'), (3692, 19, 'r38'), (3705, 20, 'r39'), (3718, 21, 'r40'), (3731, 22, 'r0'), (3744, 23, 'r1'), (3757, 24, 'r2'), (3770, 25, 'r3'), (3783, 26, 'r4'), (3796, 27, 'r5'), (3809, 28, 'r6'), (3822, 29, 'r7'), (3835, 30, 'r8'), (3848, 31, 'r9'), (3861, 32, 'r10'), (3874, 33, 'r11'), (3887, 34, 'r12'), (3900, 35, 'r13'), (3913, 36, 'r14'), (3926, 37, 'r15'), (3939, 38, 'r16'), (3952, 39, 'r17'), (3965, 40, 'r18'), (3978, 41, 'r19'), (3991, 42, 'r20'), (4004, 43, 'r21'), (4017, 44, 'r22'), (4030, 45, 'r23'), (4043, 46, 'r24'), (4056, 47, 'r25'), (4069, 48, 'r26'), (4082, 49, 'r27'), (4095, 50, 'r28'), (4108, 51, 'r29'), (4121, 52, 'r30'), (4134, 0, 'r31'), (4147, 1, 'r32'), (4160, 2, 'r33'), (4173, 3, 'r34'), (4186, 4, 'r35'), (4199, 5, 'r36'), (4212, 6, 'r37'), (4225, 7, 'r38'), (4238, 8, 'r39'), (4251, 9, 'r40'), (4264, 10, 'r0'), (4277, 11, 'r1'), (4290, 12, 'r2'), (4303, 13, 'r3'), (4316, 14, 'r4'), (4329, 15, 'r5'), (4342, 16, 'r6'), (4355, 17, 'r7'), (4368, 18, 'r8'), (4381, 19, 'r9'), (4394, 20, 'r10'), (4407, 21, 'r11'), (4420, 22, 'r12'), (4433, 23, 'r13'), (4446, 24, 'r14'), (4459, 25, 'r15'), (4472, 26, 'r16'), (4485, 27, 'r17'), (4498, 28, 'r18'), (4511, 29, 'r19'), (4524, 30, 'r20'), (4537, 31, 'r21'), (4550, 32, 'r22'), (4563, 33, 'r23'), (4576, 34, 'r24'), (4589, 35, 'r25'), (4602, 36, 'r26'), (4615, 37, 'r27'), (4628, 38, 'r28'), (4641, 39, 'r29'), (4654, 40, 'r30'), (4667, 41, 'r31'), (4680, 42, 'r32'), (4693, 43, 'r33'), (4706, 44, 'r34'), (4719, 45, 'r35'), (4732, 46, 'r36'), (4745, 47, 'r37'), (4758, 48, 'r38'), (4771, 49, 'r39'), (4784, 50, 'r40'), (4797, 51, 'r0'), (4810, 52, 'r1'), (4823, 0, 'r2'), (4836, 1, 'r3'), (4849, 2, 'r4'), (4862, 3, 'r5'), (4875, 4, 'r6'), (4888, 5, 'r7'), (4901, 6, 'r8'), (4914, 7, 'r9'), (4927, 8, 'r10'), (4940, 9, 'r11'), (4953, 10, 'r12'), (4966, 11, 'r13'), (4979, 12, 'r14'), (4992, 13, 'r15'), (5005, 14, 'r16'), (5018, 15, 'r17'), (5031, 16, 'r18'), (5044, 17, 'r19'), (5057, 18, 'r20'), (5070, 19, 'r21'), (5083, 20, 'r22'), (5096, 21, 'r23'), (5109, 22, 'r24'), (5122, 23, 'r25'), (5135, 24, 'r26'), (5148, 25, 'r27'), (5161, 26, 'r28'), (5174, 27, 'r29'), (5187, 28, 'r30'), (5200, 29, 'r31'), (5213, 30, 'r32'), (5226, 31, 'r33'), (5239, 32, 'r34'), (5252, 33, 'r35'), (5265, 34, 'r36'), (5278, 35, 'r37'), (5291, 36, 'r38'), (5304, 37, 'r39'), (5317, 38, 'r40'), (5330, 39, 'r0'), (5343, 40, 'r1'), (5356, 41, 'r2'), (5369, 42, 'r3'), (5382, 43, 'r4'), (5395, 44, 'r5'), (5408, 45, 'r6'), (5421, 46, 'r7'), (5434, 47, 'r8'), (5447, 48, 'r9'), (5460, 49, 'r10'), (5473, 50, 'r11'), (5486, 51, 'r12'), (5499, 52, 'r13'), (5512, 0, 'r14'), (5525, 1, 'r15'), (5538, 2, 'r16'), (5551, 3, 'r17'), (5564, 4, 'r18'), (5577, 5, 'r19'), (5590, 6, 'r20'), (5603, 7, 'r21'), (5616, 8, 'r22'), (5629, 9, 'r23'), (5642, 10, 'r24'), (5655, 11, 'r25'), (5668, 12, 'r26'), (5681, 13, 'r27'), (5694, 14, 'r28'), (5707, 15, 'r29'), (5720, 16, 'r30'), (5733, 17, 'r31'), (5746, 18, 'r32'), (5759, 19, 'r33'), (5772, 20, 'r34'), (5785, 21, 'r35'), (5798, 22, 'r36'), (5811, 23, 'r37'), (5824, 24, 'r38'), (5837, 25, 'r39'), (5850, 26, 'r40'), (5863, 27, 'r0'), (5876, 28, 'r1'), (5889, 29, 'r2'), (5902, 30, 'r3'), (5915, 31, 'r4'), (5928, 32, 'r5'), (5941, 33, 'r6'), (5954, 34, 'r7'), (5967, 35, 'r8'), (5980, 36, 'r9'), (5993, 37, 'r10'), (6006, 38, 'r11'), (12, 39, 'r12'), (25, 40, 'r13'), (38, 41, 'r14'), (51, 42, 'r15'), (64, 43, 'r16'), (77, 44, 'r17'), (90, 45, 'r18'), (103, 46, 'r19'), (116, 47, 'r20'), (129, 48, 'r21'), (142, 49, 'r22'), (155, 50, 'r23'), (168, 51, 'r24'), (181, 52, 'r25'), (194, 0, 'r26'), (207, 1, 'r27'), (220, 2, 'r28'), (233, 3, 'r29'), (246, 4, 'r30'), (259, 5, 'r31'), (272, 6, 'r32'), (285, 7, 'r33'), (298, 8, 'r34'), (311, 9, 'r35'), (324, 10, 'r36'), (337, 11, 'r37'), (350, 12, 'r38'), (363, 13, 'r39'), (376, 14, 'r40'), (389, 15, 'r0'), (402, 16, 'r1'), (415, 17, 'r2'), (428, 18, 'r3'), (441, 19, 'r4'), (454, 20, 'r5'), (467, 21, 'r6'), (480, 22, 'r7'), (493, 23, 'r8'), (506, 24, 'r9'), (519, 25, 'r10'), (532, 26, 'r11'), (545, 27, 'r12'), (558, 28, 'r13'), (571, 29, 'r14'), (584, 30, 'r15'), (597, 31, 'r16'), (610, 32, 'r17'), (623, 33, 'r18'), (636, 34, 'r19'), (649, 35, 'r20'), (662, 36, 'r21'), (675, 37, 'r22'), (688, 38, 'r23'), (701, 39, 'r24'), (714, 40, 'r25'), (727, 41, 'r26'), (740, 42, 'r27'), (753, 43, 'r28'), (766, 44, 'r29'), (779, 45, 'r30'), (792, 46, 'r31'), (805, 47, 'r32'), (818, 48, 'r33'), (831, 49, 'r34'), (844, 50, 'r35'), (857, 51, 'r36'), (870, 52, 'r37'), (883, 0, 'r38'), (896, 1, 'r39'), (909, 2, 'r40'), (922, 3, 'r0'), (935, 4, 'r1'), (948, 5, 'r2'), (961, 6, 'r3'), (974, 7, 'r4'), (987, 8, 'r5'), (1000, 9, 'r6'), (1013, 10, 'r7'), (1026, 11, 'r8'), (1039, 12, 'r9'), (1052, 13, 'r10'), (1065, 14, 'r11'), (1078, 15, 'r12'), (1091, 16, 'r13'), (1104, 17, 'r14'), (1117, 18, 'r15'), (1130, 19, 'r16'), (1143, 20, 'r17'), (1156, 21, 'r18'), (1169, 22, 'r19'), (1182, 23, 'r20'), (1195, 24, 'r21'), (1208, 25, 'r22'), (1221, 26, 'r23'), (1234, 27, 'r24'), (1247, 28, 'r25'), (1260, 29, 'r26'), (1273, 30, 'r27'), (1286, 31, 'r28'), (1299, 32, 'r29'), (1312, 33, 'r30'), (1325, 34, 'r31'), (1338, 35, 'r32'), (1351, 36, 'r33'), (1364, 37, 'r34'), (1377, 38, 'r35'), (1390, 39, 'r36'), (1403, 40, 'r37'), (1416, 41, 'r38'), (1429, 42, 'r39'), (1442, 43, 'r40'), (1455, 44, 'r0'), (1468, 45, 'r1'), (1481, 46, 'r2'), (1494, 47, 'r3'), (1507, 48, 'r4'), (1520, 49, 'r5'), (1533, 50, 'r6'), (1546, 51, 'r7'), (1559, 52, 'r8'), (1572, 0, 'r9'), (1585, 1, 'r10'), (1598, 2, 'r11'), (1611, 3, 'r12'), (1624, 4, 'r13'), (1637, 5, 'r14'), (1650, 6, 'r15'), (1663, 7, 'r16'), (1676, 8, 'r17'), (1689, 9, 'r18'), (1702, 10, 'r19'), (1715, 11, 'r20'), (1728, 12, 'r21'), (1741, 13, 'r22'), (1754, 14, 'r23'), (1767, 15, 'r24'), (1780, 16, 'r25'), (1793, 17, 'r26'), (1806, 18, 'r27'), (1819, 19, 'r28'), (1832, 20, 'r29'), (1845, 21, 'r30'), (1858, 22, 'r31'), (1871, 23, 'r32'), (1884, 24, 'r33'), (1897, 25, 'r34'), (1910, 26, 'r35'), (1923, 27, 'r36'), (1936, 28, 'r37'), (1949, 29, 'r38'), (1962, 30, 'r39'), (1975, 31, 'r40'), (1988, 32, 'r0'), (2001, 33, 'r1'), (2014, 34, 'r2'), (2027, 35, 'r3'), (2040, 36, 'r4'), (2053, 37, 'r5'), (2066, 38, 'r6'), (2079, 39, 'r7'), (2092, 40, 'r8'), (2105, 41, 'r9'), (2118, 42, 'r10'), (2131, 43, 'r11'), (2144, 44, 'r12'), (2157, 45, 'r13'), (2170, 46, 'r14'), (2183, 47, 'r15'), (2196, 48, 'r16'), (2209, 49, 'r17'), (2222, 50, 'r18'), (2235, 51, 'r19'), (2248, 52, 'r20'), (2261, 0, 'r21'), (2274, 1, 'r22'), (2287, 2, 'r23'), (2300, 3, 'r24'), (2313, 4, 'r25'), (2326, 5, 'r26'), (2339, 6, 'r27'), (2352, 7, 'r28'), (2365, 8, 'r29'), (2378, 9, 'r30'), (2391, 10, 'r31'), (2404, 11, 'r32'), (2417, 12, 'r33'), (2430, 13, 'r34'), (2443, 14, 'r35'), (2456, 15, 'r36'), (2469, 16, 'r37'), (2482, 17, 'r38'), (2495, 18, 'r39'), (2508, 19, 'r40'), (2521, 20, 'r0'), (2534, 21, 'r1'), (2547, 22, 'r2'), (2560, 23, 'r3'), (2573, 24, 'r4'), (2586, 25, 'r5'), (2599, 26, 'r6'), (2612, 27, 'r7'), (2625, 28, 'r8'), (2638, 29, 'r9'), (2651, 30, 'r10'), (2664, 31, 'r11'), (2677, 32, 'r12'), (2690, 33, 'r13'), (2703, 34, 'r14'), (2716, 35, 'r15'), (2729, 36, 'r16'), (2742, 37, 'r17'), (2755, 38, 'r18'), (2768, 39, 'r19'), (2781, 40, 'r20'), (2794, 41, 'r21'), (2807, 42, 'r22'), (2820, 43, 'r23'), (2833, 44, 'r24'), (2846, 45, 'r25'), (2859, 46, 'r26'), (2872, 47, 'r27'), (2885, 48, 'r28'), (2898, 49, 'r29'), (2911, 50, 'r30'), (2924, 51, 'r31'), (2937, 52, 'r32'), (2950, 0, 'r33'), (2963, 1, 'r34'), (2976, 2, 'r35'), (2989, 3, 'r36'), (3002, 4, 'r37'), (3015, 5, 'r38'), (3028, 6, 'r39'), (3041, 7, 'r40'), (3054, 8, 'r0'), (3067, 9, 'r1'), (3080, 10, 'r2'), (3093, 11, 'r3'), (3106, 12, 'r4'), (3119, 13, 'r5'), (3132, 14, 'r6'), (3145, 15, 'r7'), (3158, 16, 'r8'), (3171, 17, 'r9'), (3184, 18, 'r10'), (3197, 19, 'r11'), (3210, 20, 'r12'), (3223, 21, 'r13'), (3236, 22, 'r14'), (3249, 23, 'r15'), (3262, 24, 'r16'), (3275, 25, 'r17'), (3288, 26, 'r18'), (3301, 27, 'r19'), (3314, 28, 'r20'), (3327, 29, 'r21'), (3340, 30, 'r22'), (3353, 31, 'r23'), (3366, 32, 'r24'), (3379, 33, 'r25'), (3392, 34, 'r26'), (3405, 35, 'r27'), (3418, 36, 'r28'), (3431, 37, 'r29'), (3444, 38, 'r30'), (3457, 39, 'r31'), (3470, 40, 'r32'), (3483, 41, 'r33'), (3496, 42, 'r34'), (3509, 43, 'r35'), (3522, 44, 'r36'), (3535, 45, 'r37'), (3548, 46, 'r38'), (3561, 47, 'r39'), (3574, 48, 'r40'), (3587, 49, 'r0'), (3600, 50, 'r1'), (3613, 51, 'r2'), (3626, 52, 'r3'), (3639, 0, 'r4'), (3652, 1, 'r5'), (3665, 2, 'r6'), (3678, 3, 'r7'), (3691, 4, 'r8'), (3704, 5, 'r9'), (3717, 6, 'r10'), (3730, 7, 'r11'), (3743, 8, 'r12'), (3756, 9, 'r13'), (3769, 10, 'r14'), (3782, 11, 'r15'), (3795, 12, 'r16'), (3808, 13, 'r17'), (3821, 14, 'r18'), (3834, 15, 'r19'), (3847, 16, 'r20'), (3860, 17, 'r21'), (3873, 18, 'r22'), (3886, 19, 'r23'), (3899, 20, 'r24'), (3912, 21, 'r25'), (3925, 22, 'r26'), (3938, 23, 'r27'), (3951, 24, 'r28'), (3964, 25, 'r29'), (3977, 26, 'r30'), (3990, 27, 'r31'), (4003, 28, 'r32'), (4016, 29, 'r33'), (4029, 30, 'r34'), (4042, 31, 'r35'), (4055, 32, 'r36'), (4068, 33, 'r37'), (4081, 34, 'r38'), (4094, 35, 'r39'), (4107, 36, 'r40'), (4120, 37, 'r0'), (4133, 38, 'r1'), (4146, 39, 'r2'), (4159, 40, 'r3'), (4172, 41, 'r4'), (4185, 42, 'r5'), (4198, 43, 'r6'), (4211, 44, 'r7'), (4224, 45, 'r8'), (4237, 46, 'r9'), (4250, 47, 'r10'), (4263, 48, 'r11'), (4276, 49, 'r12'), (4289, 50, 'r13'), (4302, 51, 'r14'), (4315, 52, 'r15'), (4328, 0, 'r16'), (4341, 1, 'r17'), (4354, 2, 'r18'), (4367, 3, 'r19'), (4380, 4, 'r20'), (4393, 5, 'r21'), (4406, 6, 'r22'), (4419, 7, 'r23'), (4432, 8, 'r24'), (4445, 9, 'r25'), (4458, 10, 'r26'), (4471, 11, 'r27'), (4484, 12, 'r28'), (4497, 13, 'r29'), (4510, 14, 'r30'), (4523, 15, 'r31'), (4536, 16, 'r32'), (4549, 17, 'r33'), (4562, 18, 'r34'), (4575, 19, 'r35'), (4588, 20, 'r36'), (4601, 21, 'r37'), (4614, 22, 'r38'), (4627, 23, 'r39'), (4640, 24, 'r40'), (4653, 25, 'r0'), (4666, 26, 'r1'), (4679, 27, 'r2'), (4692, 28, 'r3'), (4705, 29, 'r4'), (4718, 30, 'r5'), (4731, 31, 'r6'), (4744, 32, 'r7'), (4757, 33, 'r8'), (4770, 34, 'r9'), (4783, 35, 'r10'), (4796, 36, 'r11'), (4809, 37, 'r12'), (4822, 38, 'r13'), (4835, 39, 'r14'), (4848, 40, 'r15'), (4861, 41, 'r16'), (4874, 42, 'r17'), (4887, 43, 'r18'), (4900, 44, 'r19'), (4913, 45, 'r20'), (4926, 46, 'r21'), (4939, 47, 'r22'), (4952, 48, 'r23'), (4965, 49, 'r24'), (4978, 50, 'r25'), (4991, 51, 'r26'), (5004, 52, 'r27'), (5017, 0, 'r28'), (5030, 1, 'r29'), (5043, 2, 'r30'), (5056, 3, 'r31'), (5069, 4, 'r32'), (5082, 5, 'r33'), (5095, 6, 'r34'), (5108, 7, 'r35'), (5121, 8, 'r36'), (5134, 9, 'r37'), (5147, 10, 'r38'), (5160, 11, 'r39'), (5173, 12, 'r40'), (5186, 13, 'r0'), (5199, 14, 'r1'), (5212, 15, 'r2'), (5225, 16, 'r3'), (5238, 17, 'r4'), (5251, 18, 'r5'), (5264, 19, 'r6'), (5277, 20, 'r7'), (5290, 21, 'r8'), (5303, 22, 'r9'), (5316, 23, 'r10'), (5329, 24, 'r11'), (5342, 25, 'r12'), (5355, 26, 'r13'), (5368, 27, 'r14'), (5381, 28, 'r15'), (5394, 29, 'r16'), (5407, 30, 'r17'), (5420, 31, 'r18'), (5433, 32, 'r19'), (5446, 33, 'r20'), (5459, 34, 'r21'), (5472, 35, 'r22'), (5485, 36, 'r23'), (5498, 37, 'r24'), (5511, 38, 'r25'), (5524, 39, 'r26'), (5537, 40, 'r27'), (5550, 41, 'r28'), (5563, 42, 'r29'), (5576, 43, 'r30'), (5589, 44, 'r31'), (5602, 45, 'r32'), (5615, 46, 'r33'), (5628, 47, 'r34'), (5641, 48, 'r35'), (5654, 49, 'r36'), (5667, 50, 'r37'), (5680, 51, 'r38'), (5693, 52, 'r39'), (5706, 0, 'r40'), (5719, 1, 'r0'), (5732, 2, 'r1'), (5745, 3, 'r2'), (5758, 4, 'r3'), (5771, 5, 'r4'), (5784, 6, 'r5'), (5797, 7, 'r6'), (5810, 8, 'r7'), (5823, 9, 'r8'), (5836, 10, 'r9'), (5849, 11, 'r10'), (5862, 12, 'r11'), (5875, 13, 'r12'), (5888, 14, 'r13'), (5901, 15, 'r14'), (5914, 16, 'r15'), (5927, 17, 'r16'), (5940, 18, 'r17'), (5953, 19, 'r18'), (5966, 20, 'r19'), (5979, 21, 'r20'), (5992, 22, 'r21'), (6005, 23, 'r22'), (11, 24, 'r23'), (24, 25, 'r24'), (37, 26, 'r25'), (50, 27, 'r26'), (63, 28, 'r27'), (76, 29, 'r28'), (89, 30, 'r29'), (102, 31, 'r30'), (115, 32, 'r31'), (128, 33, 'r32'), (141, 34, 'r33'), (154, 35, 'r34'), (167, 36, 'r35'), (180, 37, 'r36'), (193, 38, 'r37'), (206, 39, 'r38'), (219, 40, 'r39'), (232, 41, 'r40'), (245, 42, 'r0'), (258, 43, 'r1'), (271, 44, 'r2'), (284, 45, 'r3'), (297, 46, 'r4'), (310, 47, 'r5'), (323, 48, 'r6'), (336, 49, 'r7'), (349, 50, 'r8'), (362, 51, 'r9'), (375, 52, 'r10'), (388, 0, 'r11'), (401, 1, 'r12'), (414, 2, 'r13'), (427, 3, 'r14'), (440, 4, 'r15'), (453, 5, 'r16'), (466, 6, 'r17'), (479, 7, 'r18'), (492, 8, 'r19'), (505, 9, 'r20'), (518, 10, 'r21'), (531, 11, 'r22'), (544, 12, 'r23'), (557, 13, 'r24'), (570, 14, 'r25'), (583, 15, 'r26'), (596, 16, 'r27'), (609, 17, 'r28'), (622, 18, 'r29'), (635, 19, 'r30'), (648, 20, 'r31'), (661, 21, 'r32'), (674, 22, 'r33'), (687, 23, 'r34'), (700, 24, 'r35'), (713, 25, 'r36'), (726, 26, 'r37'), (739, 27, 'r38'), (752, 28, 'r39'), (765, 29, 'r40'), (778, 30, 'r0'), (791, 31, 'r1'), (804, 32, 'r2'), (817, 33, 'r3'), (830, 34, 'r4'), (843, 35, 'r5'), (856, 36, 'r6'), (869, 37, 'r7'), (882, 38, 'r8'), (895, 39, 'r9'), (908, 40, 'r10'), (921, 41, 'r11'), (934, 42, 'r12'), (947, 43, 'r13'), (960, 44, 'r14'), (973, 45, 'r15'), (986, 46, 'r16'), (999, 47, 'r17'), (1012, 48, 'r18'), (1025, 49, 'r19'), (1038, 50, 'r20'), (1051, 51, 'r21'), (1064, 52, 'r22'), (1077, 0, 'r23'), (1090, 1, 'r24'), (1103, 2, 'r25'), (1116, 3, 'r26'), (1129, 4, 'r27'), (1142, 5, 'r28'), (1155, 6, 'r29'), (1168, 7, 'r30'), (1181, 8, 'r31'), (1194, 9, 'r32'), (1207, 10, 'r33'), (1220, 11, 'r34'), (1233, 12, 'r35'), (1246, 13, 'r36'), (1259, 14, 'r37'), (1272, 15, 'r38'), (1285, 16, 'r39'), (1298, 17, 'r40'), (1311, 18, 'r0'), (1324, 19, 'r1'), (1337, 20, 'r2'), (1350, 21, 'r3'), (1363, 22, 'r4'), (1376, 23, 'r5'), (1389, 24, 'r6'), (1402, 25, 'r7'), (1415, 26, 'r8'), (1428, 27, 'r9'), (1441, 28, 'r10'), (1454, 29, 'r11'), (1467, 30, 'r12'), (1480, 31, 'r13'), (1493, 32, 'r14'), (1506, 33, 'r15'), (1519, 34, 'r16'), (1532, 35, 'r17'), (1545, 36, 'r18'), (1558, 37, 'r19'), (1571, 38, 'r20'), (1584, 39, 'r21'), (1597, 40, 'r22'), (1610, 41, 'r23'), (1623, 42, 'r24'), (1636, 43, 'r25'), (1649, 44, 'r26'), (1662, 45, 'r27'), (1675, 46, 'r28'), (1688, 47, 'r29'), (1701, 48, 'r30'), (1714, 49, 'r31'), (1727, 50, 'r32'), (1740, 51, 'r33'), (1753, 52, 'r34'), (1766, 0, 'r35'), (1779, 1, 'r36'), (1792, 2, 'r37'), (1805, 3, 'r38'), (1818, 4, 'r39'), (1831, 5, 'r40'), (1844, 6, 'r0'), (1857, 7, 'r1'), (1870, 8, 'r2'), (1883, 9, 'r3'), (1896, 10, 'r4'), (1909, 11, 'r5'), (1922, 12, 'r6'), (1935, 13, 'r7'), (1948, 14, 'r8'), (1961, 15, 'r9'), (1974, 16, 'r10'), (1987, 17, 'r11'), (2000, 18, 'r12'), (2013, 19, 'r13'), (2026, 20, 'r14'), (2039, 21, 'r15'), (2052, 22, 'r16'), (2065, 23, 'r17'), (2078, 24, 'r18'), (2091, 25, 'r19'), (2104, 26, 'r20'), (2117, 27, 'r21'), (2130, 28, 'r22'), (2143, 29, 'r23'), (2156, 30, 'r24'), (2169, 31, 'r25'), (2182, 32, 'r26'), (2195, 33, 'r27'), (2208, 34, 'r28'), (2221, 35, 'r29'), (2234, 36, 'r30'), (2247, 37, 'r31'), (2260, 38, 'r32'), (2273, 39, 'r33'), (2286, 40, 'r34'), (2299, 41, 'r35'), (2312, 42, 'r36'), (2325, 43, 'r37'), (2338, 44, 'r38'), (2351, 45, 'r39'), (2364, 46, 'r40'), (2377, 47, 'r0'), (2390, 48, 'r1'), (2403, 49, 'r2'), (2416, 50, 'r3'), (2429, 51, 'r4'), (2442, 52, 'r5'), (2455, 0, 'r6'), (2468, 1, 'r7'), (2481, 2, 'r8'), (2494, 3, 'r9'), (2507, 4, 'r10'), (2520, 5, 'r11'), (2533, 6, 'r12'), (2546, 7, 'r13'), (2559, 8, 'r14'), (2572, 9, 'r15'), (2585, 10, 'r16'), (2598, 11, 'r17'), (2611, 12, 'r18'), (2624, 13, 'r19'), (2637, 14, 'r20'), (2650, 15, 'r21'), (2663, 16, 'r22'), (2676, 17, 'r23'), (2689, 18, 'r24'), (2702, 19, 'r25'), (2715, 20, 'r26'), (2728, 21, 'r27'), (2741, 22, 'r28'), (2754, 23, 'r29'), (2767, 24, 'r30'), (2780, 25, 'r31'), (2793, 26, 'r32'), (2806, 27, 'r33'), (2819, 28, 'r34'), (2832, 29, 'r35'), (2845, 30, 'r36'), (2858, 31, 'r37'), (2871, 32, 'r38'), (2884, 33, 'r39'), (2897, 34, 'r40'), (2910, 35, 'r0'), (2923, 36, 'r1'), (2936, 37, 'r2'), (2949, 38, 'r3'), (2962, 39, 'r4'), (2975, 40, 'r5'), (2988, 41, 'r6'), (3001, 42, 'r7'), (3014, 43, 'r8'), (3027, 44, 'r9'), (3040, 45, 'r10'), (3053, 46, 'r11'), (3066, 47, 'r12'), (3079, 48, 'r13'), (3092, 49, 'r14'), (3105, 50, 'r15'), (3118, 51, 'r16'), (3131, 52, 'r17'), (3144, 0, 'r18'), (3157, 1, 'r19'), (3170, 2, 'r20'), (3183, 3, 'r21'), (3196, 4, 'r22'), (3209, 5, 'r23'), (3222, 6, 'r24'), (3235, 7, 'r25'), (3248, 8, 'r26'), (3261, 9, 'r27'), (3274, 10, 'r28'), (3287, 11, 'r29'), (3300, 12, 'r30'), (3313, 13, 'r31'), (3326, 14, 'r32'), (3339, 15, 'r33'), (3352, 16, 'r34'), (3365, 17, 'r35'), (3378, 18, 'r36'), (3391, 19, 'r37'), (3404, 20, 'r38'), (3417, 21, 'r39'), (3430, 22, 'r40'), (3443, 23, 'r0'), (3456, 24, 'r1'), (3469, 25, 'r2'), (3482, 26, 'r3'), (3495, 27, 'r4'), (3508, 28, 'r5'), (3521, 29, 'r6'), (3534, 30, 'r7'), (3547, 31, 'r8'), (3560, 32, 'r9'), (3573, 33, 'r10'), (3586, 34, 'r11'), (3599, 35, 'r12'), (3612, 36, 'r13'), (3625, 37, 'r14'), (3638, 38, 'r15'), (3651, 39, 'r16'), (3664, 40, 'r17'), (3677, 41, 'r18'), (3690, 42, 'r19'), (3703, 43, 'r20'), (3716, 44, 'r21'), (3729, 45, 'r22'), (3742, 46, 'r23'), (3755, 47, 'r24'), (3768, 48, 'r25'), (3781, 49, 'r26'), (3794, 50, 'r27'), (3807, 51, 'r28'), (3820, 52, 'r29'), (3833, 0, 'r30'), (3846, 1, 'r31'), (3859, 2, 'r32'), (3872, 3, 'r33'), (3885, 4, 'r34'), (3898, 5, 'r35'), (3911, 6, 'r36'), (3924, 7, 'r37'), (3937, 8, 'r38'), (3950, 9, 'r39'), (3963, 10, 'r40'), (3976, 11, 'r0'), (3989, 12, 'r1'), (4002, 13, 'r2'), (4015, 14, 'r3'), (4028, 15, 'r4'), (4041, 16, 'r5'), (4054, 17, 'r6'), (4067, 18, 'r7'), (4080, 19, 'r8'), (4093, 20, 'r9'), (4106, 21, 'r10'), (4119, 22, 'r11'), (4132, 23, 'r12'), (4145, 24, 'r13'), (4158, 25, 'r14'), (4171, 26, 'r15'), (4184, 27, 'r16'), (4197, 28, 'r17'), (4210, 29, 'r18'), (4223, 30, 'r19'), (4236, 31, 'r20'), (4249, 32, 'r21'), (4262, 33, 'r22'), (4275, 34, 'r23'), (4288, 35, 'r24'), (4301, 36, 'r25'), (4314, 37, 'r26'), (4327, 38, 'r27'), (4340, 39, 'r28'), (4353, 40, 'r29'), (4366, 41, 'r30'), (4379, 42, 'r31'), (4392, 43, 'r32'), (4405, 44, 'r33'), (4418, 45, 'r34'), (4431, 46, 'r35'), (4444, 47, 'r36'), (4457, 48, 'r37'), (4470, 49, 'r38'), (4483, 50, 'r39'), (4496, 51, 'r40'), (4509, 52, 'r0'), (4522, 0, 'r1'), (4535, 1, 'r2'), (4548, 2, 'r3'), (4561, 3, 'r4'), (4574, 4, 'r5'), (4587, 5, 'r6'), (4600, 6, 'r7'), (4613, 7, 'r8'), (4626, 8, 'r9'), (4639, 9, 'r10'), (4652, 10, 'r11'), (4665, 11, 'r12'), (4678, 12, 'r13'), (4691, 13, 'r14'), (4704, 14, 'r15'), (4717, 15, 'r16'), (4730, 16, 'r17'), (4743, 17, 'r18'), (4756, 18, 'r19'), (4769, 19, 'r20'), (4782, 20, 'r21'), (4795, 21, 'r22'), (4808, 22, 'r23'), (4821, 23, 'r24'), (4834, 24, 'r25'), (4847, 25, 'r26'), (4860, 26, 'r27'), (4873, 27, 'r28'), (4886, 28, 'r29'), (4899, 29, 'r30'), (4912, 30, 'r31'), (4925, 31, 'r32'), (4938, 32, 'r33'), (4951, 33, 'r34'), (4964, 34, 'r35'), (4977, 35, 'r36'), (4990, 36, 'r37'), (5003, 37, 'r38'), (5016, 38, 'r39'), (5029, 39, 'r40'), (5042, 40, 'r0'), (5055, 41, 'r1'), (5068, 42, 'r2'), (5081, 43, 'r3'), (5094, 44, 'r4'), (5107, 45, 'r5'), (5120, 46, 'r6'), (5133, 47, 'r7'), (5146, 48, 'r8'), (5159, 49, 'r9'), (5172, 50, 'r10'), (5185, 51, 'r11'), (5198, 52, 'r12'), (5211, 0, 'r13'), (5224, 1, 'r14'), (5237, 2, 'r15'), (5250, 3, 'r16'), (5263, 4, 'r17'), (5276, 5, 'r18'), (5289, 6, 'r19'), (5302, 7, 'r20'), (5315, 8, 'r21'), (5328, 9, 'r22'), (5341, 10, 'r23'), (5354, 11, 'r24'), (5367, 12, 'r25'), (5380, 13, 'r26'), (5393, 14, 'r27'), (5406, 15, 'r28'), (5419, 16, 'r29'), (5432, 17, 'r30'), (5445, 18, 'r31'), (5458, 19, 'r32'), (5471, 20, 'r33'), (5484, 21, 'r34'), (5497, 22, 'r35'), (5510, 23, 'r36'), (5523, 24, 'r37'), (5536, 25, 'r38'), (5549, 26, 'r39'), (5562, 27, 'r40'), (5575, 28, 'r0'), (5588, 29, 'r1'), (5601, 30, 'r2'), (5614, 31, 'r3'), (5627, 32, 'r4'), (5640, 33, 'r5'), (5653, 34, 'r6'), (5666, 35, 'r7'), (5679, 36, 'r8'), (5692, 37, 'r9'), (5705, 38, 'r10'), (5718, 39, 'r11'), (5731, 40, 'r12'), (5744, 41, 'r13'), (5757, 42, 'r14'), (5770, 43, 'r15'), (5783, 44, 'r16'), (5796, 45, 'r17'), (5809, 46, 'r18'), (5822, 47, 'r19'), (5835, 48, 'r20'), (5848, 49, 'r21'), (5861, 50, 'r22'), (5874, 51, 'r23'), (5887, 52, 'r24'), (5900, 0, 'r25'), (5913, 1, 'r26'), (5926, 2, 'r27'), (5939, 3, 'r28'), (5952, 4, 'r29'), (5965, 5, 'r30'), (5978, 6, 'r31'), (5991, 7, 'r32'), (6004, 8, 'r33'), (10, 9, 'r34'), (23, 10, 'r35'), (36, 11, 'r36'), (49, 12, 'r37'), (62, 13, 'r38'), (75, 14, 'r39'), (88, 15, 'r40'), (101, 16, 'r0'), (114, 17, 'r1'), (127, 18, 'r2'), (140, 19, 'r3'), (153, 20, 'r4'), (166, 21, 'r5'), (179, 22, 'r6'), (192, 23, 'r7'), (205, 24, 'r8'), (218, 25, 'r9'), (231, 26, 'r10'), (244, 27, 'r11'), (257, 28, 'r12'), (270, 29, 'r13'), (283, 30, 'r14'), (296, 31, 'r15'), (309, 32, 'r16'), (322, 33, 'r17'), (335, 34, 'r18'), (348, 35, 'r19'), (361, 36, 'r20'), (374, 37, 'r21'), (387, 38, 'r22'), (400, 39, 'r23'), (413, 40, 'r24'), (426, 41, 'r25'), (439, 42, 'r26'), (452, 43, 'r27'), (465, 44, 'r28'), (478, 45, 'r29'), (491, 46, 'r30'), (504, 47, 'r31'), (517, 48, 'r32'), (530, 49, 'r33'), (543, 50, 'r34'), (556, 51, 'r35'), (569, 52, 'r36'), (582, 0, 'r37'), (595, 1, 'r38'), (608, 2, 'r39'), (621, 3, 'r40'), (634, 4, 'r0'), (647, 5, 'r1'), (660, 6, 'r2'), (673, 7, 'r3'), (686, 8, 'r4'), (699, 9, 'r5'), (712, 10, 'r6'), (725, 11, 'r7'), (738, 12, 'r8'), (751, 13, 'r9'), (764, 14, 'r10'), (777, 15, 'r11'), (790, 16, 'r12'), (803, 17, 'r13'), (816, 18, 'r14'), (829, 19, 'r15'), (842, 20, 'r16'), (855, 21, 'r17'), (868, 22, 'r18'), (881, 23, 'r19'), (894, 24, 'r20'), (907, 25, 'r21'), (920, 26, 'r22'), (933, 27, 'r23'), (946, 28, 'r24'), (959, 29, 'r25'), (972, 30, 'r26'), (985, 31, 'r27'), (998, 32, 'r28'), (1011, 33, 'r29'), (1024, 34, 'r30'), (1037, 35, 'r31'), (1050, 36, 'r32'), (1063, 37, 'r33'), (1076, 38, 'r34'), (1089, 39, 'r35'), (1102, 40, 'r36'), (1115, 41, 'r37'), (1128, 42, 'r38'), (1141, 43, 'r39'), (1154, 44, 'r40'), (1167, 45, 'r0'), (1180, 46, 'r1'), (1193, 47, 'r2'), (1206, 48, 'r3'), (1219, 49, 'r4'), (1232, 50, 'r5'), (1245, 51, 'r6'), (1258, 52, 'r7'), (1271, 0, 'r8'), (1284, 1, 'r9'), (1297, 2, 'r10'), (1310, 3, 'r11'), (1323, 4, 'r12'), (1336, 5, 'r13'), (1349, 6, 'r14'), (1362, 7, 'r15'), (1375, 8, 'r16'), (1388, 9, 'r17'), (1401, 10, 'r18'), (1414, 11, 'r19'), (1427, 12, 'r20'), (1440, 13, 'r21'), (1453, 14, 'r22'), (1466, 15, 'r23'), (1479, 16, 'r24'), (1492, 17, 'r25'), (1505, 18, 'r26'), (1518, 19, 'r27'), (1531, 20, 'r28'), (1544, 21, 'r29'), (1557, 22, 'r30'), (1570, 23, 'r31'), (1583, 24, 'r32'), (1596, 25, 'r33'), (1609, 26, 'r34'), (1622, 27, 'r35'), (1635, 28, 'r36'), (1648, 29, 'r37'), (1661, 30, 'r38'), (1674, 31, 'r39'), (1687, 32, 'r40'), (1700, 33, 'r0'), (1713, 34, 'r1'), (1726, 35, 'r2'), (1739, 36, 'r3'), (1752, 37, 'r4'), (1765, 38, 'r5'), (1778, 39, 'r6'), (1791, 40, 'r7'), (1804, 41, 'r8'), (1817, 42, 'r9'), (1830, 43, 'r10'), (1843, 44, 'r11'), (1856, 45, 'r12'), (1869, 46, 'r13'), (1882, 47, 'r14'), (1895, 48, 'r15'), (1908, 49, 'r16'), (1921, 50, 'r17'), (1934, 51, 'r18'), (1947, 52, 'r19'), (1960, 0, 'r20'), (1973, 1, 'r21'), (1986, 2, 'r22'), (1999, 3, 'r23'), (2012, 4, 'r24'), (2025, 5, 'r25'), (2038, 6, 'r26'), (2051, 7, 'r27'), (2064, 8, 'r28'), (2077, 9, 'r29'), (2090, 10, 'r30'), (2103, 11, 'r31'), (2116, 12, 'r32'), (2129, 13, 'r33'), (2142, 14, 'r34'), (2155, 15, 'r35'), (2168, 16, 'r36'), (2181, 17, 'r37'), (2194, 18, 'r38'), (2207, 19, 'r39'), (2220, 20, 'r40'), (2233, 21, 'r0'), (2246, 22, 'r1'), (2259, 23, 'r2'), (2272, 24, 'r3'), (2285, 25, 'r4'), (2298, 26, 'r5'), (2311, 27, 'r6'), (2324, 28, 'r7'), (2337, 29, 'r8'), (2350, 30, 'r9'), (2363, 31, 'r10'), (2376, 32, 'r11'), (2389, 33, 'r12'), (2402, 34, 'r13'), (2415, 35, 'r14'), (2428, 36, 'r15'), (2441, 37, 'r16'), (2454, 38, 'r17'), (2467, 39, 'r18'), (2480, 40, 'r19'), (2493, 41, 'r20'), (2506, 42, 'r21'), (2519, 43, 'r22'), (2532, 44, 'r23'), (2545, 45, 'r24'), (2558, 46, 'r25'), (2571, 47, 'r26'), (2584, 48, 'r27'), (2597, 49, 'r28'), (2610, 50, 'r29'), (2623, 51, 'r30'), (2636, 52, 'r31'), (2649, 0, 'r32'), (2662, 1, 'r33'), (2675, 2, 'r34'), (2688, 3, 'r35'), (2701, 4, 'r36'), (2714, 5, 'r37'), (2727, 6, 'r38'), (2740, 7, 'r39'), (2753, 8, 'r40'), (2766, 9, 'r0'), (2779, 10, 'r1'), (2792, 11, 'r2'), (2805, 12, 'r3'), (2818, 13, 'r4'), (2831, 14, 'r5'), (2844, 15, 'r6'), (2857, 16, 'r7'), (2870, 17, 'r8'), (2883, 18, 'r9'), (2896, 19, 'r10'), (2909, 20, 'r11'), (2922, 21, 'r12'), (2935, 22, 'r13'), (2948, 23, 'r14'), (2961, 24, 'r15'), (2974, 25, 'r16'), (2987, 26, 'r17'), (3000, 27, 'r18'), (3013, 28, 'r19'), (3026, 29, 'r20'), (3039, 30, 'r21'), (3052, 31, 'r22'), (3065, 32, 'r23'), (3078, 33, 'r24'), (3091, 34, 'r25'), (3104, 35, 'r26'), (3117, 36, 'r27'), (3130, 37, 'r28'), (3143, 38, 'r29'), (3156, 39, 'r30'), (3169, 40, 'r31'), (3182, 41, 'r32'), (3195, 42, 'r33'), (3208, 43, 'r34'), (3221, 44, 'r35'), (3234, 45, 'r36'), (3247, 46, 'r37'), (3260, 47, 'r38'), (3273, 48, 'r39'), (3286, 49, 'r40'), (3299, 50, 'r0'), (3312, 51, 'r1'), (3325, 52, 'r2'), (3338, 0, 'r3'), (3351, 1, 'r4'), (3364, 2, 'r5'), (3377, 3, 'r6'), (3390, 4, 'r7'), (3403, 5, 'r8'), (3416, 6, 'r9'), (3429, 7, 'r10'), (3442, 8, 'r11'), (3455, 9, 'r12'), (3468, 10, 'r13'), (3481, 11, 'r14'), (3494, 12, 'r15'), (3507, 13, 'r16'), (3520, 14, 'r17'), (3533, 15, 'r18'), (3546, 16, 'r19'), (3559, 17, 'r20'), (3572, 18, 'r21'), (3585, 19, 'r22'), (3598, 20, 'r23'), (3611, 21, 'r24'), (3624, 22, 'r25'), (3637, 23, 'r26'), (3650, 24, 'r27'), (3663, 25, 'r28'), (3676, 26, 'r29'), (3689, 27, 'r30'), (3702, 28, 'r31'), (3715, 29, 'r32'), (3728, 30, 'r33'), (3741, 31, 'r34'), (3754, 32, 'r35'), (3767, 33, 'r36'), (3780, 34, 'r37'), (3793, 35, 'r38'), (3806, 36, 'r39'), (3819, 37, 'r40'), (3832, 38, 'r0'), (3845, 39, 'r1'), (3858, 40, 'r2'), (3871, 41, 'r3'), (3884, 42, 'r4'), (3897, 43, 'r5'), (3910, 44, 'r6'), (3923, 45, 'r7'), (3936, 46, 'r8'), (3949, 47, 'r9'), (3962, 48, 'r10'), (3975, 49, 'r11'), (3988, 50, 'r12'), (4001, 51, 'r13'), (4014, 52, 'r14'), (4027, 0, 'r15'), (4040, 1, 'r16'), (4053, 2, 'r17'), (4066, 3, 'r18'), (4079, 4, 'r19'), (4092, 5, 'r20'), (4105, 6, 'r21'), (4118, 7, 'r22'), (4131, 8, 'r23'), (4144, 9, 'r24'), (4157, 10, 'r25'), (4170, 11, 'r26'), (4183, 12, 'r27'), (4196, 13, 'r28'), (4209, 14, 'r29'), (4222, 15, 'r30'), (4235, 16, 'r31'), (4248, 17, 'r32'), (4261, 18, 'r33'), (4274, 19, 'r34'), (4287, 20, 'r35'), (4300, 21, 'r36'), (4313, 22, 'r37'), (4326, 23, 'r38'), (4339, 24, 'r39'), (4352, 25, 'r40'), (4365, 26, 'r0'), (4378, 27, 'r1'), (4391, 28, 'r2'), (4404, 29, 'r3'), (4417, 30, 'r4'), (4430, 31, 'r5'), (4443, 32, 'r6'), (4456, 33, 'r7'), (4469, 34, 'r8'), (4482, 35, 'r9'), (4495, 36, 'r10'), (4508, 37, 'r11'), (4521, 38, 'r12'), (4534, 39, 'r13'), (4547, 40, 'r14'), (4560, 41, 'r15'), (4573, 42, 'r16'), (4586, 43, 'r17'), (4599, 44, 'r18'), (4612, 45, 'r19'), (4625, 46, 'r20'), (4638, 47, 'r21'), (4651, 48, 'r22'), (4664, 49, 'r23'), (4677, 50, 'r24'), (4690, 51, 'r25'), (4703, 52, 'r26'), (4716, 0, 'r27'), (4729, 1, 'r28'), (4742, 2, 'r29'), (4755, 3, 'r30'), (4768, 4, 'r31'), (4781, 5, 'r32'), (4794, 6, 'r33'), (4807, 7, 'r34'), (4820, 8, 'r35'), (4833, 9, 'r36'), (4846, 10, 'r37'), (4859, 11, 'r38'), (4872, 12, 'r39'), (4885, 13, 'r40'), (4898, 14, 'r0'), (4911, 15, 'r1'), (4924, 16, 'r2'), (4937, 17, 'r3'), (4950, 18, 'r4'), (4963, 19, 'r5'), (4976, 20, 'r6'), (4989, 21, 'r7'), (5002, 22, 'r8'), (5015, 23, 'r9'), (5028, 24, 'r10'), (5041, 25, 'r11'), (5054, 26, 'r12'), (5067, 27, 'r13'), (5080, 28, 'r14'), (5093, 29, 'r15'), (5106, 30, 'r16'), (5119, 31, 'r17'), (5132, 32, 'r18'), (5145, 33, 'r19'), (5158, 34, 'r20'), (5171, 35, 'r21'), (5184, 36, 'r22'), (5197, 37, 'r23'), (5210, 38, 'r24'), (5223, 39, 'r25'), (5236, 40, 'r26'), (5249, 41, 'r27'), (5262, 42, 'r28'), (5275, 43, 'r29'), (5288, 44, 'r30'), (5301, 45, 'r31'), (5314, 46, 'r32'), (5327, 47, 'r33'), (5340, 48, 'r34'), (5353, 49, 'r35'), (5366, 50, 'r36'), (5379, 51, 'r37'), (5392, 52, 'r38'), (5405, 0, 'r39'), (5418, 1, 'r40'), (5431, 2, 'r0'), (5444, 3, 'r1'), (5457, 4, 'r2'), (5470, 5, 'r3'), (5483, 6, 'r4'), (5496, 7, 'r5'), (5509, 8, 'r6'), (5522, 9, 'r7'), (5535, 10, 'r8'), (5548, 11, 'r9'), (5561, 12, 'r10'), (5574, 13, 'r11'), (5587, 14, 'r12'), (5600, 15, 'r13'), (5613, 16, 'r14'), (5626, 17, 'r15'), (5639, 18, 'r16'), (5652, 19, 'r17'), (5665, 20, 'r18'), (5678, 21, 'r19'), (5691, 22, 'r20'), (5704, 23, 'r21'), (5717, 24, 'r22'), (5730, 25, 'r23'), (5743, 26, 'r24'), (5756, 27, 'r25'), (5769, 28, 'r26'), (5782, 29, 'r27'), (5795, 30, 'r28'), (5808, 31, 'r29'), (5821, 32, 'r30'), (5834, 33, 'r31'), (5847, 34, 'r32'), (5860, 35, 'r33'), (5873, 36, 'r34'), (5886, 37, 'r35'), (5899, 38, 'r36'), (5912, 39, 'r37'), (5925, 40, 'r38'), (5938, 41, 'r39'), (5951, 42, 'r40'), (5964, 43, 'r0'), (5977, 44, 'r1'), (5990, 45, 'r2'), (6003, 46, 'r3'), (9, 47, 'r4'), (22, 48, 'r5'), (35, 49, 'r6'), (48, 50, 'r7'), (61, 51, 'r8'), (74, 52, 'r9'), (87, 0, 'r10'), (100, 1, 'r11'), (113, 2, 'r12'), (126, 3, 'r13'), (139, 4, 'r14'), (152, 5, 'r15'), (165, 6, 'r16'), (178, 7, 'r17'), (191, 8, 'r18'), (204, 9, 'r19'), (217, 10, 'r20'), (230, 11, 'r21'), (243, 12, 'r22'), (256, 13, 'r23'), (269, 14, 'r24'), (282, 15, 'r25'), (295, 16, 'r26'), (308, 17, 'r27'), (321, 18, 'r28'), (334, 19, 'r29'), (347, 20, 'r30'), (360, 21, 'r31'), (373, 22, 'r32'), (386, 23, 'r33'), (399, 24, 'r34'), (412, 25, 'r35'), (425, 26, 'r36'), (438, 27, 'r37'), (451, 28, 'r38'), (464, 29, 'r39'), (477, 30, 'r40'), (490, 31, 'r0'), (503, 32, 'r1'), (516, 33, 'r2'), (529, 34, 'r3'), (542, 35, 'r4'), (555, 36, 'r5'), (568, 37, 'r6'), (581, 38, 'r7'), (594, 39, 'r8'), (607, 40, 'r9'), (620, 41, 'r10'), (633, 42, 'r11'), (646, 43, 'r12'), (659, 44, 'r13'), (672, 45, 'r14'), (685, 46, 'r15'), (698, 47, 'r16'), (711, 48, 'r17'), (724, 49, 'r18'), (737, 50, 'r19'), (750, 51, 'r20'), (763, 52, 'r21'), (776, 0, 'r22'), (789, 1, 'r23'), (802, 2, 'r24'), (815, 3, 'r25'), (828, 4, 'r26'), (841, 5, 'r27'), (854, 6, 'r28'), (867, 7, 'r29'), (880, 8, 'r30'), (893, 9, 'r31'), (906, 10, 'r32'), (919, 11, 'r33'), (932, 12, 'r34'), (945, 13, 'r35'), (958, 14, 'r36'), (971, 15, 'r37'), (984, 16, 'r38'), (997, 17, 'r39'), (1010, 18, 'r40'), (1023, 19, 'r0'), (1036, 20, 'r1'), (1049, 21, 'r2'), (1062, 22, 'r3'), (1075, 23, 'r4'), (1088, 24, 'r5'), (1101, 25, 'r6'), (1114, 26, 'r7'), (1127, 27, 'r8'), (1140, 28, 'r9'), (1153, 29, 'r10'), (1166, 30, 'r11'), (1179, 31, 'r12'), (1192, 32, 'r13'), (1205, 33, 'r14'), (1218, 34, 'r15'), (1231, 35, 'r16'), (1244, 36, 'r17'), (1257, 37, 'r18'), (1270, 38, 'r19'), (1283, 39, 'r20'), (1296, 40, 'r21'), (1309, 41, 'r22'), (1322, 42, 'r23'), (1335, 43, 'r24'), (1348, 44, 'r25'), (1361, 45, 'r26'), (1374, 46, 'r27'), (1387, 47, 'r28'), (1400, 48, 'r29'), (1413, 49, 'r30'), (1426, 50, 'r31'), (1439, 51, 'r32'), (1452, 52, 'r33'), (1465, 0, 'r34'), (1478, 1, 'r35'), (1491, 2, 'r36'), (1504, 3, 'r37'), (1517, 4, 'r38'), (1530, 5, 'r39'), (1543, 6, 'r40'), (1556, 7, 'r0'), (1569, 8, 'r1'), (1582, 9, 'r2'), (1595, 10, 'r3'), (1608, 11, 'r4'), (1621, 12, 'r5'), (1634, 13, 'r6'), (1647, 14, 'r7'), (1660, 15, 'r8'), (1673, 16, 'r9'), (1686, 17, 'r10'), (1699, 18, 'r11'), (1712, 19, 'r12'), (1725, 20, 'r13'), (1738, 21, 'r14'), (1751, 22, 'r15'), (1764, 23, 'r16'), (1777, 24, 'r17'), (1790, 25, 'r18'), (1803, 26, 'r19'), (1816, 27, 'r20'), (1829, 28, 'r21'), (1842, 29, 'r22'), (1855, 30, 'r23'), (1868, 31, 'r24'), (1881, 32, 'r25'), (1894, 33, 'r26'), (1907, 34, 'r27'), (1920, 35, 'r28'), (1933, 36, 'r29'), (1946, 37, 'r30'), (1959, 38, 'r31'), (1972, 39, 'r32'), (1985, 40, 'r33'), (1998, 41, 'r34'), (2011, 42, 'r35'), (2024, 43, 'r36'), (2037, 44, 'r37'), (2050, 45, 'r38'), (2063, 46, 'r39'), (2076, 47, 'r40'), (2089, 48, 'r0'), (2102, 49, 'r1'), (2115, 50, 'r2'), (2128, 51, 'r3'), (2141, 52, 'r4'), (2154, 0, 'r5'), (2167, 1, 'r6'), (2180, 2, 'r7'), (2193, 3, 'r8'), (2206, 4, 'r9'), (2219, 5, 'r10'), (2232, 6, 'r11'), (2245, 7, 'r12'), (2258, 8, 'r13'), (2271, 9, 'r14'), (2284, 10, 'r15'), (2297, 11, 'r16'), (2310, 12, 'r17'), (2323, 13, 'r18'), (2336, 14, 'r19'), (2349, 15, 'r20'), (2362, 16, 'r21'), (2375, 17, 'r22'), (2388, 18, 'r23'), (2401, 19, 'r24'), (2414, 20, 'r25'), (2427, 21, 'r26'), (2440, 22, 'r27'), (2453, 23, 'r28'), (2466, 24, 'r29'), (2479, 25, 'r30'), (2492, 26, 'r31'), (2505, 27, 'r32'), (2518, 28, 'r33'), (2531, 29, 'r34'), (2544, 30, 'r35'), (2557, 31, 'r36'), (2570, 32, 'r37'), (2583, 33, 'r38'), (2596, 34, 'r39'), (2609, 35, 'r40'), (2622, 36, 'r0'), (2635, 37, 'r1'), (2648, 38, 'r2'), (2661, 39, 'r3'), (2674, 40, 'r4'), (2687, 41, 'r5'), (2700, 42, 'r6'), (2713, 43, 'r7'), (2726, 44, 'r8'), (2739, 45, 'r9'), (2752, 46, 'r10'), (2765, 47, 'r11'), (2778, 48, 'r12'), (2791, 49, 'r13'), (2804, 50, 'r14'), (2817, 51, 'r15'), (2830, 52, 'r16'), (2843, 0, 'r17'), (2856, 1, 'r18'), (2869, 2, 'r19'), (2882, 3, 'r20'), (2895, 4, 'r21'), (2908, 5, 'r22'), (2921, 6, 'r23'), (2934, 7, 'r24'), (2947, 8, 'r25'), (2960, 9, 'r26'), (2973, 10, 'r27'), (2986, 11, 'r28'), (2999, 12, 'r29'), (3012, 13, 'r30'), (3025, 14, 'r31'), (3038, 15, 'r32'), (3051, 16, 'r33'), (3064, 17, 'r34'), (3077, 18, 'r35'), (3090, 19, 'r36'), (3103, 20, 'r37'), (3116, 21, 'r38'), (3129, 22, 'r39'), (3142, 23, 'r40'), (3155, 24, 'r0'), (3168, 25, 'r1'), (3181, 26, 'r2'), (3194, 27, 'r3'), (3207, 28, 'r4'), (3220, 29, 'r5'), (3233, 30, 'r6'), (3246, 31, 'r7'), (3259, 32, 'r8'), (3272, 33, 'r9'), (3285, 34, 'r10'), (3298, 35, 'r11'), (3311, 36, 'r12'), (3324, 37, 'r13'), (3337, 38, 'r14'), (3350, 39, 'r15'), (3363, 40, 'r16'), (3376, 41, 'r17'), (3389, 42, 'r18'), (3402, 43, 'r19'), (3415, 44, 'r20'), (3428, 45, 'r21'), (3441, 46, 'r22'), (3454, 47, 'r23'), (3467, 48, 'r24'), (3480, 49, 'r25'), (3493, 50, 'r26'), (3506, 51, 'r27'), (3519, 52, 'r28'), (3532, 0, 'r29'), (3545, 1, 'r30'), (3558, 2, 'r31'), (3571, 3, 'r32'), (3584, 4, 'r33'), (3597, 5, 'r34'), (3610, 6, 'r35'), (3623, 7, 'r36'), (3636, 8, 'r37'), (3649, 9, 'r38'), (3662, 10, 'r39'), (3675, 11, 'r40'), (3688, 12, 'r0'), (3701, 13, 'r1'), (3714, 14, 'r2'), (3727, 15, 'r3'), (3740, 16, 'r4'), (3753, 17, 'r5'), (3766, 18, 'r6'), (3779, 19, 'r7'), (3792, 20, 'r8'), (3805, 21, 'r9'), (3818, 22, 'r10'), (3831, 23, 'r11'), (3844, 24, 'r12'), (3857, 25, 'r13'), (3870, 26, 'r14'), (3883, 27, 'r15'), (3896, 28, 'r16'), (3909, 29, 'r17'), (3922, 30, 'r18'), (3935, 31, 'r19'), (3948, 32, 'r20'), (3961, 33, 'r21'), (3974, 34, 'r22'), (3987, 35, 'r23'), (4000, 36, 'r24'), (4013, 37, 'r25'), (4026, 38, 'r26'), (4039, 39, 'r27'), (4052, 40, 'r28'), (4065, 41, 'r29'), (4078, 42, 'r30'), (4091, 43, 'r31'), (4104, 44, 'r32'), (4117, 45, 'r33'), (4130, 46, 'r34'), (4143, 47, 'r35'), (4156, 48, 'r36'), (4169, 49, 'r37'), (4182, 50, 'r38'), (4195, 51, 'r39'), (4208, 52, 'r40'), (4221, 0, 'r0'), (4234, 1, 'r1'), (4247, 2, 'r2'), (4260, 3, 'r3'), (4273, 4, 'r4'), (4286, 5, 'r5'), (4299, 6, 'r6'), (4312, 7, 'r7'), (4325, 8, 'r8'), (4338, 9, 'r9'), (4351, 10, 'r10'), (4364, 11, 'r11'), (4377, 12, 'r12'), (4390, 13, 'r13'), (4403, 14, 'r14'), (4416, 15, 'r15'), (4429, 16, 'r16'), (4442, 17, 'r17'), (4455, 18, 'r18'), (4468, 19, 'r19'), (4481, 20, 'r20'), (4494, 21, 'r21'), (4507, 22, 'r22'), (4520, 23, 'r23'), (4533, 24, 'r24'), (4546, 25, 'r25'), (4559, 26, 'r26'), (4572, 27, 'r27'), (4585, 28, 'r28'), (4598, 29, 'r29'), (4611, 30, 'r30'), (4624, 31, 'r31'), (4637, 32, 'r32'), (4650, 33, 'r33'), (4663, 34, 'r34'), (4676, 35, 'r35'), (4689, 36, 'r36'), (4702, 37, 'r37'), (4715, 38, 'r38'), (4728, 39, 'r39'), (4741, 40, 'r40'), (4754, 41, 'r0'), (4767, 42, 'r1'), (4780, 43, 'r2'), (4793, 44, 'r3'), (4806, 45, 'r4'), (4819, 46, 'r5'), (4832, 47, 'r6'), (4845, 48, 'r7'), (4858, 49, 'r8'), (4871, 50, 'r9'), (4884, 51, 'r10'), (4897, 52, 'r11'), (4910, 0, 'r12'), (4923, 1, 'r13'), (4936, 2, 'r14'), (4949, 3, 'r15'), (4962, 4, 'r16'), (4975, 5, 'r17'), (4988, 6, 'r18'), (5001, 7, 'r19'), (5014, 8, 'r20'), (5027, 9, 'r21'), (5040, 10, 'r22'), (5053, 11, 'r23'), (5066, 12, 'r24'), (5079, 13, 'r25'), (5092, 14, 'r26'), (5105, 15, 'r27'), (5118, 16, 'r28'), (5131, 17, 'r29'), (5144, 18, 'r30'), (5157, 19, 'r31'), (5170, 20, 'r32'), (5183, 21, 'r33'), (5196, 22, 'r34'), (5209, 23, 'r35'), (5222, 24, 'r36'), (5235, 25, 'r37'), (5248, 26, 'r38'), (5261, 27, 'r39'), (5274, 28, 'r40'), (5287, 29, 'r0'), (5300, 30, 'r1'), (5313, 31, 'r2'), (5326, 32, 'r3'), (5339, 33, 'r4'), (5352, 34, 'r5'), (5365, 35, 'r6'), (5378, 36, 'r7'), (5391, 37, 'r8'), (5404, 38, 'r9'), (5417, 39, 'r10'), (5430, 40, 'r11'), (5443, 41, 'r12'), (5456, 42, 'r13'), (5469, 43, 'r14'), (5482, 44, 'r15'), (5495, 45, 'r16'), (5508, 46, 'r17'), (5521, 47, 'r18'), (5534, 48, 'r19'), (5547, 49, 'r20'), (5560, 50, 'r21'), (5573, 51, 'r22'), (5586, 52, 'r23'), (5599, 0, 'r24'), (5612, 1, 'r25'), (5625, 2, 'r26'), (5638, 3, 'r27'), (5651, 4, 'r28'), (5664, 5, 'r29'), (5677, 6, 'r30'), (5690, 7, 'r31'), (5703, 8, 'r32'), (5716, 9, 'r33'), (5729, 10, 'r34'), (5742, 11, 'r35'), (5755, 12, 'r36'), (5768, 13, 'r37'), (5781, 14, 'r38'), (5794, 15, 'r39'), (5807, 16, 'r40'), (5820, 17, 'r0'), (5833, 18, 'r1'), (5846, 19, 'r2'), (5859, 20, 'r3'), (5872, 21, 'r4'), (5885, 22, 'r5'), (5898, 23, 'r6'), (5911, 24, 'r7'), (5924, 25, 'r8'), (5937, 26, 'r9'), (5950, 27, 'r10'), (5963, 28, 'r11'), (5976, 29, 'r12'), (5989, 30, 'r13'), (6002, 31, 'r14'), (8, 32, 'r15'), (21, 33, 'r16'), (34, 34, 'r17'), (47, 35, 'r18'), (60, 36, 'r19'), (73, 37, 'r20'), (86, 38, 'r21'), (99, 39, 'r22'), (112, 40, 'r23'), (125, 41, 'r24'), (138, 42, 'r25'), (151, 43, 'r26'), (164, 44, 'r27'), (177, 45, 'r28'), (190, 46, 'r29'), (203, 47, 'r30'), (216, 48, 'r31'), (229, 49, 'r32'), (242, 50, 'r33'), (255, 51, 'r34'), (268, 52, 'r35'), (281, 0, 'r36'), (294, 1, 'r37'), (307, 2, 'r38'), (320, 3, 'r39'), (333, 4, 'r40'), (346, 5, 'r0'), (359, 6, 'r1'), (372, 7, 'r2'), (385, 8, 'r3'), (398, 9, 'r4'), (411, 10, 'r5'), (424, 11, 'r6'), (437, 12, 'r7'), (450, 13, 'r8'), (463, 14, 'r9'), (476, 15, 'r10'), (489, 16, 'r11'), (502, 17, 'r12'), (515, 18, 'r13'), (528, 19, 'r14'), (541, 20, 'r15'), (554, 21, 'r16'), (567, 22, 'r17'), (580, 23, 'r18'), (593, 24, 'r19'), (606, 25, 'r20'), (619, 26, 'r21'), (632, 27, 'r22'), (645, 28, 'r23'), (658, 29, 'r24'), (671, 30, 'r25'), (684, 31, 'r26'), (697, 32, 'r27'), (710, 33, 'r28'), (723, 34, 'r29'), (736, 35, 'r30'), (749, 36, 'r31'), (762, 37, 'r32'), (775, 38, 'r33'), (788, 39, 'r34'), (801, 40, 'r35'), (814, 41, 'r36'), (827, 42, 'r37'), (840, 43, 'r38'), (853, 44, 'r39'), (866, 45, 'r40'), (879, 46, 'r0'), (892, 47, 'r1'), (905, 48, 'r2'), (918, 49, 'r3'), (931, 50, 'r4'), (944, 51, 'r5'), (957, 52, 'r6'), (970, 0, 'r7'), (983, 1, 'r8'), (996, 2, 'r9'), (1009, 3, 'r10'), (1022, 4, 'r11'), (1035, 5, 'r12'), (1048, 6, 'r13'), (1061, 7, 'r14'), (1074, 8, 'r15'), (1087, 9, 'r16'), (1100, 10, 'r17'), (1113, 11, 'r18'), (1126, 12, 'r19'), (1139, 13, 'r20'), (1152, 14, 'r21'), (1165, 15, 'r22'), (1178, 16, 'r23'), (1191, 17, 'r24'), (1204, 18, 'r25'), (1217, 19, 'r26'), (1230, 20, 'r27'), (1243, 21, 'r28'), (1256, 22, 'r29'), (1269, 23, 'r30'), (1282, 24, 'r31'), (1295, 25, 'r32'), (1308, 26, 'r33'), (1321, 27, 'r34'), (1334, 28, 'r35'), (1347, 29, 'r36'), (1360, 30, 'r37'), (1373, 31, 'r38'), (1386, 32, 'r39'), (1399, 33, 'r40'), (1412, 34, 'r0'), (1425, 35, 'r1'), (1438, 36, 'r2'), (1451, 37, 'r3'), (1464, 38, 'r4'), (1477, 39, 'r5'), (1490, 40, 'r6'), (1503, 41, 'r7'), (1516, 42, 'r8'), (1529, 43, 'r9'), (1542, 44, 'r10'), (1555, 45, 'r11'), (1568, 46, 'r12'), (1581, 47, 'r13'), (1594, 48, 'r14'), (1607, 49, 'r15'), (1620, 50, 'r16'), (1633, 51, 'r17'), (1646, 52, 'r18'), (1659, 0, 'r19'), (1672, 1, 'r20'), (1685, 2, 'r21'), (1698, 3, 'r22'), (1711, 4, 'r23'), (1724, 5, 'r24'), (1737, 6, 'r25'), (1750, 7, 'r26'), (1763, 8, 'r27'), (1776, 9, 'r28'), (1789, 10, 'r29'), (1802, 11, 'r30'), (1815, 12, 'r31'), (1828, 13, 'r32'), (1841, 14, 'r33'), (1854, 15, 'r34'), (1867, 16, 'r35'), (1880, 17, 'r36'), (1893, 18, 'r37'), (1906, 19, 'r38'), (1919, 20, 'r39'), (1932, 21, 'r40'), (1945, 22, 'r0'), (1958, 23, 'r1'), (1971, 24, 'r2'), (1984, 25, 'r3'), (1997, 26, 'r4'), (2010, 27, 'r5'), (2023, 28, 'r6'), (2036, 29, 'r7'), (2049, 30, 'r8'), (2062, 31, 'r9'), (2075, 32, 'r10'), (2088, 33, 'r11'), (2101, 34, 'r12'), (2114, 35, 'r13'), (2127, 36, 'r14'), (2140, 37, 'r15'), (2153, 38, 'r16'), (2166, 39, 'r17'), (2179, 40, 'r18'), (2192, 41, 'r19'), (2205, 42, 'r20'), (2218, 43, 'r21'), (2231, 44, 'r22'), (2244, 45, 'r23'), (2257, 46, 'r24'), (2270, 47, 'r25'), (2283, 48, 'r26'), (2296, 49, 'r27'), (2309, 50, 'r28'), (2322, 51, 'r29'), (2335, 52, 'r30'), (2348, 0, 'r31'), (2361, 1, 'r32'), (2374, 2, 'r33'), (2387, 3, 'r34'), (2400, 4, 'r35'), (2413, 5, 'r36'), (2426, 6, 'r37'), (2439, 7, 'r38'), (2452, 8, 'r39'), (2465, 9, 'r40'), (2478, 10, 'r0'), (2491, 11, 'r1'), (2504, 12, 'r2'), (2517, 13, 'r3'), (2530, 14, 'r4'), (2543, 15, 'r5'), (2556, 16, 'r6'), (2569, 17, 'r7'), (2582, 18, 'r8'), (2595, 19, 'r9'), (2608, 20, 'r10'), (2621, 21, 'r11'), (2634, 22, 'r12'), (2647, 23, 'r13'), (2660, 24, 'r14'), (2673, 25, 'r15'), (2686, 26, 'r16'), (2699, 27, 'r17'), (2712, 28, 'r18'), (2725, 29, 'r19'), (2738, 30, 'r20'), (2751, 31, 'r21'), (2764, 32, 'r22'), (2777, 33, 'r23'), (2790, 34, 'r24'), (2803, 35, 'r25'), (2816, 36, 'r26'), (2829, 37, 'r27'), (2842, 38, 'r28'), (2855, 39, 'r29'), (2868, 40, 'r30'), (2881, 41, 'r31'), (2894, 42, 'r32'), (2907, 43, 'r33'), (2920, 44, 'r34'), (2933, 45, 'r35'), (2946, 46, 'r36'), (2959, 47, 'r37'), (2972, 48, 'r38'), (2985, 49, 'r39'), (2998, 50, 'r40'), (3011, 51, 'r0'), (3024, 52, 'r1'), (3037, 0, 'r2'), (3050, 1, 'r3'), (3063, 2, 'r4'), (3076, 3, 'r5'), (3089, 4, 'r6'), (3102, 5, 'r7'), (3115, 6, 'r8'), (3128, 7, 'r9'), (3141, 8, 'r10'), (3154, 9, 'r11'), (3167, 10, 'r12'), (3180, 11, 'r13'), (3193, 12, 'r14'), (3206, 13, 'r15'), (3219, 14, 'r16'), (3232, 15, 'r17'), (3245, 16, 'r18'), (3258, 17, 'r19'), (3271, 18, 'r20'), (3284, 19, 'r21'), (3297, 20, 'r22'), (3310, 21, 'r23'), (3323, 22, 'r24'), (3336, 23, 'r25'), (3349, 24, 'r26'), (3362, 25, 'r27'), (3375, 26, 'r28'), (3388, 27, 'r29'), (3401, 28, 'r30'), (3414, 29, 'r31'), (3427, 30, 'r32'), (3440, 31, 'r33'), (3453, 32, 'r34'), (3466, 33, 'r35'), (3479, 34, 'r36'), (3492, 35, 'r37'), (3505, 36, 'r38'), (3518, 37, 'r39'), (3531, 38, 'r40'), (3544, 39, 'r0'), (3557, 40, 'r1'), (3570, 41, 'r2'), (3583, 42, 'r3'), (3596, 43, 'r4'), (3609, 44, 'r5'), (3622, 45, 'r6'), (3635, 46, 'r7'), (3648, 47, 'r8'), (3661, 48, 'r9'), (3674, 49, 'r10'), (3687, 50, 'r11'), (3700, 51, 'r12'), (3713, 52, 'r13'), (3726, 0, 'r14'), (3739, 1, 'r15'), (3752, 2, 'r16'), (3765, 3, 'r17'), (3778, 4, 'r18'), (3791, 5, 'r19'), (3804, 6, 'r20'), (3817, 7, 'r21'), (3830, 8, 'r22'), (3843, 9, 'r23'), (3856, 10, 'r24'), (3869, 11, 'r25'), (3882, 12, 'r26'), (3895, 13, 'r27'), (3908, 14, 'r28'), (3921, 15, 'r29'), (3934, 16, 'r30'), (3947, 17, 'r31'), (3960, 18, 'r32'), (3973, 19, 'r33'), (3986, 20, 'r34'), (3999, 21, 'r35'), (4012, 22, 'r36'), (4025, 23, 'r37'), (4038, 24, 'r38'), (4051, 25, 'r39'), (4064, 26, 'r40'), (4077, 27, 'r0'), (4090, 28, 'r1'), (4103, 29, 'r2'), (4116, 30, 'r3'), (4129, 31, 'r4'), (4142, 32, 'r5'), (4155, 33, 'r6'), (4168, 34, 'r7'), (4181, 35, 'r8'), (4194, 36, 'r9'), (4207, 37, 'r10'), (4220, 38, 'r11'), (4233, 39, 'r12'), (4246, 40, 'r13'), (4259, 41, 'r14'), (4272, 42, 'r15'), (4285, 43, 'r16'), (4298, 44, 'r17'), (4311, 45, 'r18'), (4324, 46, 'r19'), (4337, 47, 'r20'), (4350, 48, 'r21'), (4363, 49, 'r22'), (4376, 50, 'r23'), (4389, 51, 'r24'), (4402, 52, 'r25'), (4415, 0, 'r26'), (4428, 1, 'r27'), (4441, 2, 'r28'), (4454, 3, 'r29'), (4467, 4, 'r30'), (4480, 5, 'r31'), (4493, 6, 'r32'), (4506, 7, 'r33'), (4519, 8, 'r34'), (4532, 9, 'r35'), (4545, 10, 'r36'), (4558, 11, 'r37'), (4571, 12, 'r38'), (4584, 13, 'r39'), (4597, 14, 'r40'), (4610, 15, 'r0'), (4623, 16, 'r1'), (4636, 17, 'r2'), (4649, 18, 'r3'), (4662, 19, 'r4'), (4675, 20, 'r5'), (4688, 21, 'r6'), (4701, 22, 'r7'), (4714, 23, 'r8'), (4727, 24, 'r9'), (4740, 25, 'r10'), (4753, 26, 'r11'), (4766, 27, 'r12'), (4779, 28, 'r13'), (4792, 29, 'r14'), (4805, 30, 'r15'), (4818, 31, 'r16'), (4831, 32, 'r17'), (4844, 33, 'r18'), (4857, 34, 'r19'), (4870, 35, 'r20'), (4883, 36, 'r21'), (4896, 37, 'r22'), (4909, 38, 'r23'), (4922, 39, 'r24'), (4935, 40, 'r25'), (4948, 41, 'r26'), (4961, 42, 'r27'), (4974, 43, 'r28'), (4987, 44, 'r29'), (5000, 45, 'r30'), (5013, 46, 'r31'), (5026, 47, 'r32'), (5039, 48, 'r33'), (5052, 49, 'r34'), (5065, 50, 'r35'), (5078, 51, 'r36'), (5091, 52, 'r37'), (5104, 0, 'r38'), (5117, 1, 'r39'), (5130, 2, 'r40'), (5143, 3, 'r0'), (5156, 4, 'r1'), (5169, 5, 'r2'), (5182, 6, 'r3'), (5195, 7, 'r4'), (5208, 8, 'r5'), (5221, 9, 'r6'), (5234, 10, 'r7'), (5247, 11, 'r8'), (5260, 12, 'r9'), (5273, 13, 'r10'), (5286, 14, 'r11'), (5299, 15, 'r12'), (5312, 16, 'r13'), (5325, 17, 'r14'), (5338, 18, 'r15'), (5351, 19, 'r16'), (5364, 20, 'r17'), (5377, 21, 'r18'), (5390, 22, 'r19'), (5403, 23, 'r20'), (5416, 24, 'r21'), (5429, 25, 'r22'), (5442, 26, 'r23'), (5455, 27, 'r24'), (5468, 28, 'r25'), (5481, 29, 'r26'), (5494, 30, 'r27'), (5507, 31, 'r28'), (5520, 32, 'r29'), (5533, 33, 'r30'), (5546, 34, 'r31'), (5559, 35, 'r32'), (5572, 36, 'r33'), (5585, 37, 'r34'), (5598, 38, 'r35'), (5611, 39, 'r36'), (5624, 40, 'r37'), (5637, 41, 'r38'), (5650, 42, 'r39'), (5663, 43, 'r40'), (5676, 44, 'r0'), (5689, 45, 'r1'), (5702, 46, 'r2'), (5715, 47, 'r3'), (5728, 48, 'r4'), (5741, 49, 'r5'), (5754, 50, 'r6'), (5767, 51, 'r7'), (5780, 52, 'r8'), (5793, 0, 'r9'), (5806, 1, 'r10'), (5819, 2, 'r11'), (5832, 3, 'r12'), (5845, 4, 'r13'), (5858, 5, 'r14'), (5871, 6, 'r15'), (5884, 7, 'r16'), (5897, 8, 'r17'), (5910, 9, 'r18'), (5923, 10, 'r19'), (5936, 11, 'r20'), (5949, 12, 'r21'), (5962, 13, 'r22'), (5975, 14, 'r23'), (5988, 15, 'r24'), (6001, 16, 'r25'), (7, 17, 'r26'), (20, 18, 'r27'), (33, 19, 'r28'), (46, 20, 'r29'), (59, 21, 'r30'), (72, 22, 'r31'), (85, 23, 'r32'), (98, 24, 'r33'), (111, 25, 'r34'), (124, 26, 'r35'), (137, 27, 'r36'), (150, 28, 'r37'), (163, 29, 'r38'), (176, 30, 'r39'), (189, 31, 'r40'), (202, 32, 'r0'), (215, 33, 'r1'), (228, 34, 'r2'), (241, 35, 'r3'), (254, 36, 'r4'), (267, 37, 'r5'), (280, 38, 'r6'), (293, 39, 'r7'), (306, 40, 'r8'), (319, 41, 'r9'), (332, 42, 'r10'), (345, 43, 'r11'), (358, 44, 'r12'), (371, 45, 'r13'), (384, 46, 'r14'), (397, 47, 'r15'), (410, 48, 'r16'), (423, 49, 'r17'), (436, 50, 'r18'), (449, 51, 'r19'), (462, 52, 'r20'), (475, 0, 'r21'), (488, 1, 'r22'), (501, 2, 'r23'), (514, 3, 'r24'), (527, 4, 'r25'), (540, 5, 'r26'), (553, 6, 'r27'), (566, 7, 'r28'), (579, 8, 'r29'), (592, 9, 'r30'), (605, 10, 'r31'), (618, 11, 'r32'), (631, 12, 'r33'), (644, 13, 'r34'), (657, 14, 'r35'), (670, 15, 'r36'), (683, 16, 'r37'), (696, 17, 'r38'), (709, 18, 'r39'), (722, 19, 'r40'), (735, 20, 'r0'), (748, 21, 'r1'), (761, 22, 'r2'), (774, 23, 'r3'), (787, 24, 'r4'), (800, 25, 'r5'), (813, 26, 'r6'), (826, 27, 'r7'), (839, 28, 'r8'), (852, 29, 'r9'), (865, 30, 'r10'), (878, 31, 'r11'), (891, 32, 'r12'), (904, 33, 'r13'), (917, 34, 'r14'), (930, 35, 'r15'), (943, 36, 'r16'), (956, 37, 'r17'), (969, 38, 'r18'), (982, 39, 'r19'), (995, 40, 'r20'), (1008, 41, 'r21'), (1021, 42, 'r22'), (1034, 43, 'r23'), (1047, 44, 'r24'), (1060, 45, 'r25'), (1073, 46, 'r26'), (1086, 47, 'r27'), (1099, 48, 'r28'), (1112, 49, 'r29'), (1125, 50, 'r30'), (1138, 51, 'r31'), (1151, 52, 'r32'), (1164, 0, 'r33'), (1177, 1, 'r34'), (1190, 2, 'r35'), (1203, 3, 'r36'), (1216, 4, 'r37'), (1229, 5, 'r38'), (1242, 6, 'r39'), (1255, 7, 'r40'), (1268, 8, 'r0'), (1281, 9, 'r1'), (1294, 10, 'r2'), (1307, 11, 'r3'), (1320, 12, 'r4'), (1333, 13, 'r5'), (1346, 14, 'r6'), (1359, 15, 'r7'), (1372, 16, 'r8'), (1385, 17, 'r9'), (1398, 18, 'r10'), (1411, 19, 'r11'), (1424, 20, 'r12'), (1437, 21, 'r13'), (1450, 22, 'r14'), (1463, 23, 'r15'), (1476, 24, 'r16'), (1489, 25, 'r17'), (1502, 26, 'r18'), (1515, 27, 'r19'), (1528, 28, 'r20'), (1541, 29, 'r21'), (1554, 30, 'r22'), (1567, 31, 'r23'), (1580, 32, 'r24'), (1593, 33, 'r25'), (1606, 34, 'r26'), (1619, 35, 'r27'), (1632, 36, 'r28'), (1645, 37, 'r29'), (1658, 38, 'r30'), (1671, 39, 'r31'), (1684, 40, 'r32'), (1697, 41, 'r33'), (1710, 42, 'r34'), (1723, 43, 'r35'), (1736, 44, 'r36'), (1749, 45, 'r37'), (1762, 46, 'r38'), (1775, 47, 'r39'), (1788, 48, 'r40'), (1801, 49, 'r0'), (1814, 50, 'r1'), (1827, 51, 'r2'), (1840, 52, 'r3'), (1853, 0, 'r4'), (1866, 1, 'r5'), (1879, 2, 'r6'), (1892, 3, 'r7'), (1905, 4, 'r8'), (1918, 5, 'r9'), (1931, 6, 'r10'), (1944, 7, 'r11'), (1957, 8, 'r12'), (1970, 9, 'r13'), (1983, 10, 'r14'), (1996, 11, 'r15'), (2009, 12, 'r16'), (2022, 13, 'r17'), (2035, 14, 'r18'), (2048, 15, 'r19'), (2061, 16, 'r20'), (2074, 17, 'r21'), (2087, 18, 'r22'), (2100, 19, 'r23'), (2113, 20, 'r24'), (2126, 21, 'r25'), (2139, 22, 'r26'), (2152, 23, 'r27'), (2165, 24, 'r28'), (2178, 25, 'r29'), (2191, 26, 'r30'), (2204, 27, 'r31'), (2217, 28, 'r32'), (2230, 29, 'r33'), (2243, 30, 'r34'), (2256, 31, 'r35'), (2269, 32, 'r36'), (2282, 33, 'r37'), (2295, 34, 'r38'), (2308, 35, 'r39'), (2321, 36, 'r40'), (2334, 37, 'r0'), (2347, 38, 'r1'), (2360, 39, 'r2'), (2373, 40, 'r3'), (2386, 41, 'r4'), (2399, 42, 'r5'), (2412, 43, 'r6'), (2425, 44, 'r7'), (2438, 45, 'r8'), (2451, 46, 'r9'), (2464, 47, 'r10'), (2477, 48, 'r11'), (2490, 49, 'r12'), (2503, 50, 'r13'), (2516, 51, 'r14'), (2529, 52, 'r15'), (2542, 0, 'r16'), (2555, 1, 'r17'), (2568, 2, 'r18'), (2581, 3, 'r19'), (2594, 4, 'r20'), (2607, 5, 'r21'), (2620, 6, 'r22'), (2633, 7, 'r23'), (2646, 8, 'r24'), (2659, 9, 'r25'), (2672, 10, 'r26'), (2685, 11, 'r27'), (2698, 12, 'r28'), (2711, 13, 'r29'), (2724, 14, 'r30'), (2737, 15, 'r31'), (2750, 16, 'r32'), (2763, 17, 'r33'), (2776, 18, 'r34'), (2789, 19, 'r35'), (2802, 20, 'r36'), (2815, 21, 'r37'), (2828, 22, 'r38'), (2841, 23, 'r39'), (2854, 24, 'r40'), (2867, 25, 'r0'), (2880, 26, 'r1'), (2893, 27, 'r2'), (2906, 28, 'r3'), (2919, 29, 'r4'), (2932, 30, 'r5'), (2945, 31, 'r6'), (2958, 32, 'r7'), (2971, 33, 'r8'), (2984, 34, 'r9'), (2997, 35, 'r10'), (3010, 36, 'r11'), (3023, 37, 'r12'), (3036, 38, 'r13'), (3049, 39, 'r14'), (3062, 40, 'r15'), (3075, 41, 'r16'), (3088, 42, 'r17'), (3101, 43, 'r18'), (3114, 44, 'r19'), (3127, 45, 'r20'), (3140, 46, 'r21'), (3153, 47, 'r22'), (3166, 48, 'r23'), (3179, 49, 'r24'), (3192, 50, 'r25'), (3205, 51, 'r26'), (3218, 52, 'r27'), (3231, 0, 'r28'), (3244, 1, 'r29'), (3257, 2, 'r30'), (3270, 3, 'r31'), (3283, 4, 'r32'), (3296, 5, 'r33'), (3309, 6, 'r34'), (3322, 7, 'r35'), (3335, 8, 'r36'), (3348, 9, 'r37'), (3361, 10, 'r38'), (3374, 11, 'r39'), (3387, 12, 'r40'), (3400, 13, 'r0'), (3413, 14, 'r1'), (3426, 15, 'r2'), (3439, 16, 'r3'), (3452, 17, 'r4'), (3465, 18, 'r5'), (3478, 19, 'r6'), (3491, 20, 'r7'), (3504, 21, 'r8'), (3517, 22, 'r9'), (3530, 23, 'r10'), (3543, 24, 'r11'), (3556, 25, 'r12'), (3569, 26, 'r13'), (3582, 27, 'r14'), (3595, 28, 'r15'), (3608, 29, 'r16'), (3621, 30, 'r17'), (3634, 31, 'r18'), (3647, 32, 'r19'), (3660, 33, 'r20'), (3673, 34, 'r21'), (3686, 35, 'r22'), (3699, 36, 'r23'), (3712, 37, 'r24'), (3725, 38, 'r25'), (3738, 39, 'r26'), (3751, 40, 'r27'), (3764, 41, 'r28'), (3777, 42, 'r29'), (3790, 43, 'r30'), (3803, 44, 'r31'), (3816, 45, 'r32'), (3829, 46, 'r33'), (3842, 47, 'r34'), (3855, 48, 'r35'), (3868, 49, 'r36'), (3881, 50, 'r37'), (3894, 51, 'r38'), (3907, 52, 'r39'), (3920, 0, 'r40'), (3933, 1, 'r0'), (3946, 2, 'r1'), (3959, 3, 'r2'), (3972, 4, 'r3'), (3985, 5, 'r4'), (3998, 6, 'r5'), (4011, 7, 'r6'), (4024, 8, 'r7'), (4037, 9, 'r8'), (4050, 10, 'r9'), (4063, 11, 'r10'), (4076, 12, 'r11'), (4089, 13, 'r12'), (4102, 14, 'r13'), (4115, 15, 'r14'), (4128, 16, 'r15'), (4141, 17, 'r16'), (4154, 18, 'r17'), (4167, 19, 'r18'), (4180, 20, 'r19'), (4193, 21, 'r20'), (4206, 22, 'r21'), (4219, 23, 'r22'), (4232, 24, 'r23'), (4245, 25, 'r24'), (4258, 26, 'r25'), (4271, 27, 'r26'), (4284, 28, 'r27'), (4297, 29, 'r28'), (4310, 30, 'r29'), (4323, 31, 'r30'), (4336, 32, 'r31'), (4349, 33, 'r32'), (4362, 34, 'r33'), (4375, 35, 'r34'), (4388, 36, 'r35'), (4401, 37, 'r36'), (4414, 38, 'r37'), (4427, 39, 'r38'), (4440, 40, 'r39'), (4453, 41, 'r40'), (4466, 42, 'r0'), (4479, 43, 'r1'), (4492, 44, 'r2'), (4505, 45, 'r3'), (4518, 46, 'r4'), (4531, 47, 'r5'), (4544, 48, 'r6'), (4557, 49, 'r7'), (4570, 50, 'r8'), (4583, 51, 'r9'), (4596, 52, 'r10'), (4609, 0, 'r11'), (4622, 1, 'r12'), (4635, 2, 'r13'), (4648, 3, 'r14'), (4661, 4, 'r15'), (4674, 5, 'r16'), (4687, 6, 'r17'), (4700, 7, 'r18'), (4713, 8, 'r19'), (4726, 9, 'r20'), (4739, 10, 'r21'), (4752, 11, 'r22'), (4765, 12, 'r23'), (4778, 13, 'r24'), (4791, 14, 'r25'), (4804, 15, 'r26'), (4817, 16, 'r27'), (4830, 17, 'r28'), (4843, 18, 'r29'), (4856, 19, 'r30'), (4869, 20, 'r31'), (4882, 21, 'r32'), (4895, 22, 'r33'), (4908, 23, 'r34'), (4921, 24, 'r35'), (4934, 25, 'r36'), (4947, 26, 'r37'), (4960, 27, 'r38'), (4973, 28, 'r39'), (4986, 29, 'r40'), (4999, 30, 'r0'), (5012, 31, 'r1'), (5025, 32, 'r2'), (5038, 33, 'r3'), (5051, 34, 'r4'), (5064, 35, 'r5'), (5077, 36, 'r6'), (5090, 37, 'r7'), (5103, 38, 'r8'), (5116, 39, 'r9'), (5129, 40, 'r10'), (5142, 41, 'r11'), (5155, 42, 'r12'), (5168, 43, 'r13'), (5181, 44, 'r14'), (5194, 45, 'r15'), (5207, 46, 'r16'), (5220, 47, 'r17'), (5233, 48, 'r18'), (5246, 49, 'r19'), (5259, 50, 'r20'), (5272, 51, 'r21'), (5285, 52, 'r22'), (5298, 0, 'r23'), (5311, 1, 'r24'), (5324, 2, 'r25'), (5337, 3, 'r26'), (5350, 4, 'r27'), (5363, 5, 'r28'), (5376, 6, 'r29'), (5389, 7, 'r30'), (5402, 8, 'r31'), (5415, 9, 'r32'), (5428, 10, 'r33'), (5441, 11, 'r34'), (5454, 12, 'r35'), (5467, 13, 'r36'), (5480, 14, 'r37'), (5493, 15, 'r38'), (5506, 16, 'r39'), (5519, 17, 'r40'), (5532, 18, 'r0'), (5545, 19, 'r1'), (5558, 20, 'r2'), (5571, 21, 'r3'), (5584, 22, 'r4'), (5597, 23, 'r5'), (5610, 24, 'r6'), (5623, 25, 'r7'), (5636, 26, 'r8'), (5649, 27, 'r9'), (5662, 28, 'r10'), (5675, 29, 'r11'), (5688, 30, 'r12'), (5701, 31, 'r13'), (5714, 32, 'r14'), (5727, 33, 'r15'), (5740, 34, 'r16'), (5753, 35, 'r17'), (5766, 36, 'r18'), (5779, 37, 'r19'), (5792, 38, 'r20'), (5805, 39, 'r21'), (5818, 40, 'r22'), (5831, 41, 'r23'), (5844, 42, 'r24'), (5857, 43, 'r25'), (5870, 44, 'r26'), (5883, 45, 'r27'), (5896, 46, 'r28'), (5909, 47, 'r29'), (5922, 48, 'r30'), (5935, 49, 'r31'), (5948, 50, 'r32'), (5961, 51, 'r33'), (5974, 52, 'r34'), (5987, 0, 'r35'), (6000, 1, 'r36'), (6, 2, 'r37'), (19, 3, 'r38'), (32, 4, 'r39'), (45, 5, 'r40'), (58, 6, 'r0'), (71, 7, 'r1'), (84, 8, 'r2'), (97, 9, 'r3'), (110, 10, 'r4'), (123, 11, 'r5'), (136, 12, 'r6'), (149, 13, 'r7'), (162, 14, 'r8'), (175, 15, 'r9'), (188, 16, 'r10'), (201, 17, 'r11'), (214, 18, 'r12'), (227, 19, 'r13'), (240, 20, 'r14'), (253, 21, 'r15'), (266, 22, 'r16'), (279, 23, 'r17'), (292, 24, 'r18'), (305, 25, 'r19'), (318, 26, 'r20'), (331, 27, 'r21'), (344, 28, 'r22'), (357, 29, 'r23'), (370, 30, 'r24'), (383, 31, 'r25'), (396, 32, 'r26'), (409, 33, 'r27'), (422, 34, 'r28'), (435, 35, 'r29'), (448, 36, 'r30'), (461, 37, 'r31'), (474, 38, 'r32'), (487, 39, 'r33'), (500, 40, 'r34'), (513, 41, 'r35'), (526, 42, 'r36'), (539, 43, 'r37'), (552, 44, 'r38'), (565, 45, 'r39'), (578, 46, 'r40'), (591, 47, 'r0'), (604, 48, 'r1'), (617, 49, 'r2'), (630, 50, 'r3'), (643, 51, 'r4'), (656, 52, 'r5'), (669, 0, 'r6'), (682, 1, 'r7'), (695, 2, 'r8'), (708, 3, 'r9'), (721, 4, 'r10'), (734, 5, 'r11'), (747, 6, 'r12'), (760, 7, 'r13'), (773, 8, 'r14'), (786, 9, 'r15'), (799, 10, 'r16'), (812, 11, 'r17'), (825, 12, 'r18'), (838, 13, 'r19'), (851, 14, 'r20'), (864, 15, 'r21'), (877, 16, 'r22'), (890, 17, 'r23'), (903, 18, 'r24'), (916, 19, 'r25'), (929, 20, 'r26'), (942, 21, 'r27'), (955, 22, 'r28'), (968, 23, 'r29'), (981, 24, 'r30'), (994, 25, 'r31'), (1007, 26, 'r32'), (1020, 27, 'r33'), (1033, 28, 'r34'), (1046, 29, 'r35'), (1059, 30, 'r36'), (1072, 31, 'r37'), (1085, 32, 'r38'), (1098, 33, 'r39'), (1111, 34, 'r40'), (1124, 35, 'r0'), (1137, 36, 'r1'), (1150, 37, 'r2'), (1163, 38, 'r3'), (1176, 39, 'r4'), (1189, 40, 'r5'), (1202, 41, 'r6'), (1215, 42, 'r7'), (1228, 43, 'r8'), (1241, 44, 'r9'), (1254, 45, 'r10'), (1267, 46, 'r11'), (1280, 47, 'r12'), (1293, 48, 'r13'), (1306, 49, 'r14'), (1319, 50, 'r15'), (1332, 51, 'r16'), (1345, 52, 'r17'), (1358, 0, 'r18'), (1371, 1, 'r19'), (1384, 2, 'r20'), (1397, 3, 'r21'), (1410, 4, 'r22'), (1423, 5, 'r23'), (1436, 6, 'r24'), (1449, 7, 'r25'), (1462, 8, 'r26'), (1475, 9, 'r27'), (1488, 10, 'r28'), (1501, 11, 'r29'), (1514, 12, 'r30'), (1527, 13, 'r31'), (1540, 14, 'r32'), (1553, 15, 'r33'), (1566, 16, 'r34'), (1579, 17, 'r35'), (1592, 18, 'r36'), (1605, 19, 'r37'), (1618, 20, 'r38'), (1631, 21, 'r39'), (1644, 22, 'r40'), (1657, 23, 'r0'), (1670, 24, 'r1'), (1683, 25, 'r2'), (1696, 26, 'r3'), (1709, 27, 'r4'), (1722, 28, 'r5'), (1735, 29, 'r6'), (1748, 30, 'r7'), (1761, 31, 'r8'), (1774, 32, 'r9'), (1787, 33, 'r10'), (1800, 34, 'r11'), (1813, 35, 'r12'), (1826, 36, 'r13'), (1839, 37, 'r14'), (1852, 38, 'r15'), (1865, 39, 'r16'), (1878, 40, 'r17'), (1891, 41, 'r18'), (1904, 42, 'r19'), (1917, 43, 'r20'), (1930, 44, 'r21'), (1943, 45, 'r22'), (1956, 46, 'r23'), (1969, 47, 'r24'), (1982, 48, 'r25'), (1995, 49, 'r26'), (2008, 50, 'r27'), (2021, 51, 'r28'), (2034, 52, 'r29'), (2047, 0, 'r30'), (2060, 1, 'r31'), (2073, 2, 'r32'), (2086, 3, 'r33'), (2099, 4, 'r34'), (2112, 5, 'r35'), (2125, 6, 'r36'), (2138, 7, 'r37'), (2151, 8, 'r38'), (2164, 9, 'r39'), (2177, 10, 'r40'), (2190, 11, 'r0'), (2203, 12, 'r1'), (2216, 13, 'r2'), (2229, 14, 'r3'), (2242, 15, 'r4'), (2255, 16, 'r5'), (2268, 17, 'r6'), (2281, 18, 'r7'), (2294, 19, 'r8'), (2307, 20, 'r9'), (2320, 21, 'r10'), (2333, 22, 'r11'), (2346, 23, 'r12'), (2359, 24, 'r13'), (2372, 25, 'r14'), (2385, 26, 'r15'), (2398, 27, 'r16'), (2411, 28, 'r17'), (2424, 29, 'r18'), (2437, 30, 'r19'), (2450, 31, 'r20'), (2463, 32, 'r21'), (2476, 33, 'r22'), (2489, 34, 'r23'), (2502, 35, 'r24'), (2515, 36, 'r25'), (2528, 37, 'r26'), (2541, 38, 'r27'), (2554, 39, 'r28'), (2567, 40, 'r29'), (2580, 41, 'r30'), (2593, 42, 'r31'), (2606, 43, 'r32'), (2619, 44, 'r33'), (2632, 45, 'r34'), (2645, 46, 'r35'), (2658, 47, 'r36'), (2671, 48, 'r37'), (2684, 49, 'r38'), (2697, 50, 'r39'), (2710, 51, 'r40'), (2723, 52, 'r0'), (2736, 0, 'r1'), (2749, 1, 'r2'), (2762, 2, 'r3'), (2775, 3, 'r4'), (2788, 4, 'r5'), (2801, 5, 'r6'), (2814, 6, 'r7'), (2827, 7, 'r8'), (2840, 8, 'r9'), (2853, 9, 'r10'), (2866, 10, 'r11'), (2879, 11, 'r12'), (2892, 12, 'r13'), (2905, 13, 'r14'), (2918, 14, 'r15'), (2931, 15, 'r16'), (2944, 16, 'r17'), (2957, 17, 'r18'), (2970, 18, 'r19'), (2983, 19, 'r20'), (2996, 20, 'r21'), (3009, 21, 'r22'), (3022, 22, 'r23'), (3035, 23, 'r24'), (3048, 24, 'r25'), (3061, 25, 'r26'), (3074, 26, 'r27'), (3087, 27, 'r28'), (3100, 28, 'r29'), (3113, 29, 'r30'), (3126, 30, 'r31'), (3139, 31, 'r32'), (3152, 32, 'r33'), (3165, 33, 'r34'), (3178, 34, 'r35'), (3191, 35, 'r36'), (3204, 36, 'r37'), (3217, 37, 'r38'), (3230, 38, 'r39'), (3243, 39, 'r40'), (3256, 40, 'r0'), (3269, 41, 'r1'), (3282, 42, 'r2'), (3295, 43, 'r3'), (3308, 44, 'r4'), (3321, 45, 'r5'), (3334, 46, 'r6'), (3347, 47, 'r7'), (3360, 48, 'r8'), (3373, 49, 'r9'), (3386, 50, 'r10'), (3399, 51, 'r11'), (3412, 52, 'r12'), (3425, 0, 'r13'), (3438, 1, 'r14'), (3451, 2, 'r15'), (3464, 3, 'r16'), (3477, 4, 'r17'), (3490, 5, 'r18'), (3503, 6, 'r19'), (3516, 7, 'r20'), (3529, 8, 'r21'), (3542, 9, 'r22'), (3555, 10, 'r23'), (3568, 11, 'r24'), (3581, 12, 'r25'), (3594, 13, 'r26'), (3607, 14, 'r27'), (3620, 15, 'r28'), (3633, 16, 'r29'), (3646, 17, 'r30'), (3659, 18, 'r31'), (3672, 19, 'r32'), (3685, 20, 'r33'), (3698, 21, 'r34'), (3711, 22, 'r35'), (3724, 23, 'r36'), (3737, 24, 'r37'), (3750, 25, 'r38'), (3763, 26, 'r39'), (3776, 27, 'r40'), (3789, 28, 'r0'), (3802, 29, 'r1'), (3815, 30, 'r2'), (3828, 31, 'r3'), (3841, 32, 'r4'), (3854, 33, 'r5'), (3867, 34, 'r6'), (3880, 35, 'r7'), (3893, 36, 'r8'), (3906, 37, 'r9'), (3919, 38, 'r10'), (3932, 39, 'r11'), (3945, 40, 'r12'), (3958, 41, 'r13'), (3971, 42, 'r14'), (3984, 43, 'r15'), (3997, 44, 'r16'), (4010, 45, 'r17'), (4023, 46, 'r18'), (4036, 47, 'r19'), (4049, 48, 'r20'), (4062, 49, 'r21'), (4075, 50, 'r22'), (4088, 51, 'r23'), (4101, 52, 'r24'), (4114, 0, 'r25'), (4127, 1, 'r26'), (4140, 2, 'r27'), (4153, 3, 'r28'), (4166, 4, 'r29'), (4179, 5, 'r30'), (4192, 6, 'r31'), (4205, 7, 'r32'), (4218, 8, 'r33'), (4231, 9, 'r34'), (4244, 10, 'r35'), (4257, 11, 'r36'), (4270, 12, 'r37'), (4283, 13, 'r38'), (4296, 14, 'r39'), (4309, 15, 'r40'), (4322, 16, 'r0'), (4335, 17, 'r1'), (4348, 18, 'r2'), (4361, 19, 'r3'), (4374, 20, 'r4'), (4387, 21, 'r5'), (4400, 22, 'r6'), (4413, 23, 'r7'), (4426, 24, 'r8'), (4439, 25, 'r9'), (4452, 26, 'r10'), (4465, 27, 'r11'), (4478, 28, 'r12'), (4491, 29, 'r13'), (4504, 30, 'r14'), (4517, 31, 'r15'), (4530, 32, 'r16'), (4543, 33, 'r17'), (4556, 34, 'r18'), (4569, 35, 'r19'), (4582, 36, 'r20'), (4595, 37, 'r21'), (4608, 38, 'r22'), (4621, 39, 'r23'), (4634, 40, 'r24'), (4647, 41, 'r25'), (4660, 42, 'r26'), (4673, 43, 'r27'), (4686, 44, 'r28'), (4699, 45, 'r29'), (4712, 46, 'r30'), (4725, 47, 'r31'), (4738, 48, 'r32'), (4751, 49, 'r33'), (4764, 50, 'r34'), (4777, 51, 'r35'), (4790, 52, 'r36'), (4803, 0, 'r37'), (4816, 1, 'r38'), (4829, 2, 'r39'), (4842, 3, 'r40'), (4855, 4, 'r0'), (4868, 5, 'r1'), (4881, 6, 'r2'), (4894, 7, 'r3'), (4907, 8, 'r4'), (4920, 9, 'r5'), (4933, 10, 'r6'), (4946, 11, 'r7'), (4959, 12, 'r8'), (4972, 13, 'r9'), (4985, 14, 'r10'), (4998, 15, 'r11'), (5011, 16, 'r12'), (5024, 17, 'r13'), (5037, 18, 'r14'), (5050, 19, 'r15'), (5063, 20, 'r16'), (5076, 21, 'r17'), (5089, 22, 'r18'), (5102, 23, 'r19'), (5115, 24, 'r20'), (5128, 25, 'r21'), (5141, 26, 'r22'), (5154, 27, 'r23'), (5167, 28, 'r24'), (5180, 29, 'r25'), (5193, 30, 'r26'), (5206, 31, 'r27'), (5219, 32, 'r28'), (5232, 33, 'r29'), (5245, 34, 'r30'), (5258, 35, 'r31'), (5271, 36, 'r32'), (5284, 37, 'r33'), (5297, 38, 'r34'), (5310, 39, 'r35'), (5323, 40, 'r36'), (5336, 41, 'r37'), (5349, 42, 'r38'), (5362, 43, 'r39'), (5375, 44, 'r40'), (5388, 45, 'r0'), (5401, 46, 'r1'), (5414, 47, 'r2'), (5427, 48, 'r3'), (5440, 49, 'r4'), (5453, 50, 'r5'), (5466, 51, 'r6'), (5479, 52, 'r7'), (5492, 0, 'r8'), (5505, 1, 'r9'), (5518, 2, 'r10'), (5531, 3, 'r11'), (5544, 4, 'r12'), (5557, 5, 'r13'), (5570, 6, 'r14'), (5583, 7, 'r15'), (5596, 8, 'r16'), (5609, 9, 'r17'), (5622, 10, 'r18'), (5635, 11, 'r19'), (5648, 12, 'r20'), (5661, 13, 'r21'), (5674, 14, 'r22'), (5687, 15, 'r23'), (5700, 16, 'r24'), (5713, 17, 'r25'), (5726, 18, 'r26'), (5739, 19, 'r27'), (5752, 20, 'r28'), (5765, 21, 'r29'), (5778, 22, 'r30'), (5791, 23, 'r31'), (5804, 24, 'r32'), (5817, 25, 'r33'), (5830, 26, 'r34'), (5843, 27, 'r35'), (5856, 28, 'r36'), (5869, 29, 'r37'), (5882, 30, 'r38'), (5895, 31, 'r39'), (5908, 32, 'r40'), (5921, 33, 'r0'), (5934, 34, 'r1'), (5947, 35, 'r2'), (5960, 36, 'r3'), (5973, 37, 'r4'), (5986, 38, 'r5'), (5999, 39, 'r6'), (5, 40, 'r7'), (18, 41, 'r8'), (31, 42, 'r9'), (44, 43, 'r10'), (57, 44, 'r11'), (70, 45, 'r12'), (83, 46, 'r13'), (96, 47, 'r14'), (109, 48, 'r15'), (122, 49, 'r16'), (135, 50, 'r17'), (148, 51, 'r18'), (161, 52, 'r19'), (174, 0, 'r20'), (187, 1, 'r21'), (200, 2, 'r22'), (213, 3, 'r23'), (226, 4, 'r24'), (239, 5, 'r25'), (252, 6, 'r26'), (265, 7, 'r27'), (278, 8, 'r28'), (291, 9, 'r29'), (304, 10, 'r30'), (317, 11, 'r31'), (330, 12, 'r32'), (343, 13, 'r33'), (356, 14, 'r34'), (369, 15, 'r35'), (382, 16, 'r36'), (395, 17, 'r37'), (408, 18, 'r38'), (421, 19, 'r39'), (434, 20, 'r40'), (447, 21, 'r0'), (460, 22, 'r1'), (473, 23, 'r2'), (486, 24, 'r3'), (499, 25, 'r4'), (512, 26, 'r5'), (525, 27, 'r6'), (538, 28, 'r7'), (551, 29, 'r8'), (564, 30, 'r9'), (577, 31, 'r10'), (590, 32, 'r11'), (603, 33, 'r12'), (616, 34, 'r13'), (629, 35, 'r14'), (642, 36, 'r15'), (655, 37, 'r16'), (668, 38, 'r17'), (681, 39, 'r18'), (694, 40, 'r19'), (707, 41, 'r20'), (720, 42, 'r21'), (733, 43, 'r22'), (746, 44, 'r23'), (759, 45, 'r24'), (772, 46, 'r25'), (785, 47, 'r26'), (798, 48, 'r27'), (811, 49, 'r28'), (824, 50, 'r29'), (837, 51, 'r30'), (850, 52, 'r31'), (863, 0, 'r32'), (876, 1, 'r33'), (889, 2, 'r34'), (902, 3, 'r35'), (915, 4, 'r36'), (928, 5, 'r37'), (941, 6, 'r38'), (954, 7, 'r39'), (967, 8, 'r40'), (980, 9, 'r0'), (993, 10, 'r1'), (1006, 11, 'r2'), (1019, 12, 'r3'), (1032, 13, 'r4'), (1045, 14, 'r5'), (1058, 15, 'r6'), (1071, 16, 'r7'), (1084, 17, 'r8'), (1097, 18, 'r9'), (1110, 19, 'r10'), (1123, 20, 'r11'), (1136, 21, 'r12'), (1149, 22, 'r13'), (1162, 23, 'r14'), (1175, 24, 'r15'), (1188, 25, 'r16'), (1201, 26, 'r17'), (1214, 27, 'r18'), (1227, 28, 'r19'), (1240, 29, 'r20'), (1253, 30, 'r21'), (1266, 31, 'r22'), (1279, 32, 'r23'), (1292, 33, 'r24'), (1305, 34, 'r25'), (1318, 35, 'r26'), (1331, 36, 'r27'), (1344, 37, 'r28'), (1357, 38, 'r29'), (1370, 39, 'r30'), (1383, 40, 'r31'), (1396, 41, 'r32'), (1409, 42, 'r33'), (1422, 43, 'r34'), (1435, 44, 'r35'), (1448, 45, 'r36'), (1461, 46, 'r37'), (1474, 47, 'r38'), (1487, 48, 'r39'), (1500, 49, 'r40'), (1513, 50, 'r0'), (1526, 51, 'r1'), (1539, 52, 'r2'), (1552, 0, 'r3'), (1565, 1, 'r4'), (1578, 2, 'r5'), (1591, 3, 'r6'), (1604, 4, 'r7'), (1617, 5, 'r8'), (1630, 6, 'r9'), (1643, 7, 'r10'), (1656, 8, 'r11'), (1669, 9, 'r12'), (1682, 10, 'r13'), (1695, 11, 'r14'), (1708, 12, 'r15'), (1721, 13, 'r16'), (1734, 14, 'r17'), (1747, 15, 'r18'), (1760, 16, 'r19'), (1773, 17, 'r20'), (1786, 18, 'r21'), (1799, 19, 'r22'), (1812, 20, 'r23'), (1825, 21, 'r24'), (1838, 22, 'r25'), (1851, 23, 'r26'), (1864, 24, 'r27'), (1877, 25, 'r28'), (1890, 26, 'r29'), (1903, 27, 'r30'), (1916, 28, 'r31'), (1929, 29, 'r32'), (1942, 30, 'r33'), (1955, 31, 'r34'), (1968, 32, 'r35'), (1981, 33, 'r36'), (1994, 34, 'r37'), (2007, 35, 'r38'), (2020, 36, 'r39'), (2033, 37, 'r40'), (2046, 38, 'r0'), (2059, 39, 'r1'), (2072, 40, 'r2'), (2085, 41, 'r3'), (2098, 42, 'r4'), (2111, 43, 'r5'), (2124, 44, 'r6'), (2137, 45, 'r7'), (2150, 46, 'r8'), (2163, 47, 'r9'), (2176, 48, 'r10'), (2189, 49, 'r11'), (2202, 50, 'r12'), (2215, 51, 'r13'), (2228, 52, 'r14'), (2241, 0, 'r15'), (2254, 1, 'r16'), (2267, 2, 'r17'), (2280, 3, 'r18'), (2293, 4, 'r19'), (2306, 5, 'r20'), (2319, 6, 'r21'), (2332, 7, 'r22'), (2345, 8, 'r23'), (2358, 9, 'r24'), (2371, 10, 'r25'), (2384, 11, 'r26'), (2397, 12, 'r27'), (2410, 13, 'r28'), (2423, 14, 'r29'), (2436, 15, 'r30'), (2449, 16, 'r31'), (2462, 17, 'r32'), (2475, 18, 'r33'), (2488, 19, 'r34'), (2501, 20, 'r35'), (2514, 21, 'r36'), (2527, 22, 'r37'), (2540, 23, 'r38'), (2553, 24, 'r39'), (2566, 25, 'r40'), (2579, 26, 'r0'), (2592, 27, 'r1'), (2605, 28, 'r2'), (2618, 29, 'r3'), (2631, 30, 'r4'), (2644, 31, 'r5'), (2657, 32, 'r6'), (2670, 33, 'r7'), (2683, 34, 'r8'), (2696, 35, 'r9'), (2709, 36, 'r10'), (2722, 37, 'r11'), (2735, 38, 'r12'), (2748, 39, 'r13'), (2761, 40, 'r14'), (2774, 41, 'r15'), (2787, 42, 'r16'), (2800, 43, 'r17'), (2813, 44, 'r18'), (2826, 45, 'r19'), (2839, 46, 'r20'), (2852, 47, 'r21'), (2865, 48, 'r22'), (2878, 49, 'r23'), (2891, 50, 'r24'), (2904, 51, 'r25'), (2917, 52, 'r26'), (2930, 0, 'r27'), (2943, 1, 'r28'), (2956, 2, 'r29'), (2969, 3, 'r30'), (2982, 4, 'r31'), (2995, 5, 'r32'), (3008, 6, 'r33'), (3021, 7, 'r34'), (3034, 8, 'r35'), (3047, 9, 'r36'), (3060, 10, 'r37'), (3073, 11, 'r38'), (3086, 12, 'r39'), (3099, 13, 'r40'), (3112, 14, 'r0'), (3125, 15, 'r1'), (3138, 16, 'r2'), (3151, 17, 'r3'), (3164, 18, 'r4'), (3177, 19, 'r5'), (3190, 20, 'r6'), (3203, 21, 'r7'), (3216, 22, 'r8'), (3229, 23, 'r9'), (3242, 24, 'r10'), (3255, 25, 'r11'), (3268, 26, 'r12'), (3281, 27, 'r13'), (3294, 28, 'r14'), (3307, 29, 'r15'), (3320, 30, 'r16'), (3333, 31, 'r17'), (3346, 32, 'r18'), (3359, 33, 'r19'), (3372, 34, 'r20'), (3385, 35, 'r21'), (3398, 36, 'r22'), (3411, 37, 'r23'), (3424, 38, 'r24'), (3437, 39, 'r25'), (3450, 40, 'r26'), (3463, 41, 'r27'), (3476, 42, 'r28'), (3489, 43, 'r29'), (3502, 44, 'r30'), (3515, 45, 'r31'), (3528, 46, 'r32'), (3541, 47, 'r33'), (3554, 48, 'r34'), (3567, 49, 'r35'), (3580, 50, 'r36'), (3593, 51, 'r37'), (3606, 52, 'r38'), (3619, 0, 'r39'), (3632, 1, 'r40'), (3645, 2, 'r0'), (3658, 3, 'r1'), (3671, 4, 'r2'), (3684, 5, 'r3'), (3697, 6, 'r4'), (3710, 7, 'r5'), (3723, 8, 'r6'), (3736, 9, 'r7'), (3749, 10, 'r8'), (3762, 11, 'r9'), (3775, 12, 'r10'), (3788, 13, 'r11'), (3801, 14, 'r12'), (3814, 15, 'r13'), (3827, 16, 'r14'), (3840, 17, 'r15'), (3853, 18, 'r16'), (3866, 19, 'r17'), (3879, 20, 'r18'), (3892, 21, 'r19'), (3905, 22, 'r20'), (3918, 23, 'r21'), (3931, 24, 'r22'), (3944, 25, 'r23'), (3957, 26, 'r24'), (3970, 27, 'r25'), (3983, 28, 'r26'), (3996, 29, 'r27'), (4009, 30, 'r28'), (4022, 31, 'r29'), (4035, 32, 'r30'), (4048, 33, 'r31'), (4061, 34, 'r32'), (4074, 35, 'r33'), (4087, 36, 'r34'), (4100, 37, 'r35'), (4113, 38, 'r36'), (4126, 39, 'r37'), (4139, 40, 'r38'), (4152, 41, 'r39'), (4165, 42, 'r40'), (4178, 43, 'r0'), (4191, 44, 'r1'), (4204, 45, 'r2'), (4217, 46, 'r3'), (4230, 47, 'r4'), (4243, 48, 'r5'), (4256, 49, 'r6'), (4269, 50, 'r7'), (4282, 51, 'r8'), (4295, 52, 'r9'), (4308, 0, 'r10'), (4321, 1, 'r11'), (4334, 2, 'r12'), (4347, 3, 'r13'), (4360, 4, 'r14'), (4373, 5, 'r15'), (4386, 6, 'r16'), (4399, 7, 'r17'), (4412, 8, 'r18'), (4425, 9, 'r19'), (4438, 10, 'r20'), (4451, 11, 'r21'), (4464, 12, 'r22'), (4477, 13, 'r23'), (4490, 14, 'r24'), (4503, 15, 'r25'), (4516, 16, 'r26'), (4529, 17, 'r27'), (4542, 18, 'r28'), (4555, 19, 'r29'), (4568, 20, 'r30'), (4581, 21, 'r31'), (4594, 22, 'r32'), (4607, 23, 'r33'), (4620, 24, 'r34'), (4633, 25, 'r35'), (4646, 26, 'r36'), (4659, 27, 'r37'), (4672, 28, 'r38'), (4685, 29, 'r39'), (4698, 30, 'r40'), (4711, 31, 'r0'), (4724, 32, 'r1'), (4737, 33, 'r2'), (4750, 34, 'r3'), (4763, 35, 'r4'), (4776, 36, 'r5'), (4789, 37, 'r6'), (4802, 38, 'r7'), (4815, 39, 'r8'), (4828, 40, 'r9'), (4841, 41, 'r10'), (4854, 42, 'r11'), (4867, 43, 'r12'), (4880, 44, 'r13'), (4893, 45, 'r14'), (4906, 46, 'r15'), (4919, 47, 'r16'), (4932, 48, 'r17'), (4945, 49, 'r18'), (4958, 50, 'r19'), (4971, 51, 'r20'), (4984, 52, 'r21'), (4997, 0, 'r22'), (5010, 1, 'r23'), (5023, 2, 'r24'), (5036, 3, 'r25'), (5049, 4, 'r26'), (5062, 5, 'r27'), (5075, 6, 'r28'), (5088, 7, 'r29'), (5101, 8, 'r30'), (5114, 9, 'r31'), (5127, 10, 'r32'), (5140, 11, 'r33'), (5153, 12, 'r34'), (5166, 13, 'r35'), (5179, 14, 'r36'), (5192, 15, 'r37'), (5205, 16, 'r38'), (5218, 17, 'r39'), (5231, 18, 'r40'), (5244, 19, 'r0'), (5257, 20, 'r1'), (5270, 21, 'r2'), (5283, 22, 'r3'), (5296, 23, 'r4'), (5309, 24, 'r5'), (5322, 25, 'r6'), (5335, 26, 'r7'), (5348, 27, 'r8'), (5361, 28, 'r9'), (5374, 29, 'r10'), (5387, 30, 'r11'), (5400, 31, 'r12'), (5413, 32, 'r13'), (5426, 33, 'r14'), (5439, 34, 'r15'), (5452, 35, 'r16'), (5465, 36, 'r17'), (5478, 37, 'r18'), (5491, 38, 'r19'), (5504, 39, 'r20'), (5517, 40, 'r21'), (5530, 41, 'r22'), (5543, 42, 'r23'), (5556, 43, 'r24'), (5569, 44, 'r25'), (5582, 45, 'r26'), (5595, 46, 'r27'), (5608, 47, 'r28'), (5621, 48, 'r29'), (5634, 49, 'r30'), (5647, 50, 'r31'), (5660, 51, 'r32'), (5673, 52, 'r33'), (5686, 0, 'r34'), (5699, 1, 'r35'), (5712, 2, 'r36'), (5725, 3, 'r37'), (5738, 4, 'r38'), (5751, 5, 'r39'), (5764, 6, 'r40'), (5777, 7, 'r0'), (5790, 8, 'r1'), (5803, 9, 'r2'), (5816, 10, 'r3'), (5829, 11, 'r4'), (5842, 12, 'r5'), (5855, 13, 'r6'), (5868, 14, 'r7'), (5881, 15, 'r8'), (5894, 16, 'r9'), (5907, 17, 'r10'), (5920, 18, 'r11'), (5933, 19, 'r12'), (5946, 20, 'r13'), (5959, 21, 'r14'), (5972, 22, 'r15'), (5985, 23, 'r16'), (5998, 24, 'r17'), (4, 25, 'r18'), (17, 26, 'r19'), (30, 27, 'r20'), (43, 28, 'r21'), (56, 29, 'r22'), (69, 30, 'r23'), (82, 31, 'r24'), (95, 32, 'r25'), (108, 33, 'r26'), (121, 34, 'r27'), (134, 35, 'r28'), (147, 36, 'r29'), (160, 37, 'r30'), (173, 38, 'r31'), (186, 39, 'r32'), (199, 40, 'r33'), (212, 41, 'r34'), (225, 42, 'r35'), (238, 43, 'r36'), (251, 44, 'r37'), (264, 45, 'r38'), (277, 46, 'r39'), (290, 47, 'r40'), (303, 48, 'r0'), (316, 49, 'r1'), (329, 50, 'r2'), (342, 51, 'r3'), (355, 52, 'r4'), (368, 0, 'r5'), (381, 1, 'r6'), (394, 2, 'r7'), (407, 3, 'r8'), (420, 4, 'r9'), (433, 5, 'r10'), (446, 6, 'r11'), (459, 7, 'r12'), (472, 8, 'r13'), (485, 9, 'r14'), (498, 10, 'r15'), (511, 11, 'r16'), (524, 12, 'r17'), (537, 13, 'r18'), (550, 14, 'r19'), (563, 15, 'r20'), (576, 16, 'r21'), (589, 17, 'r22'), (602, 18, 'r23'), (615, 19, 'r24'), (628, 20, 'r25'), (641, 21, 'r26'), (654, 22, 'r27'), (667, 23, 'r28'), (680, 24, 'r29'), (693, 25, 'r30'), (706, 26, 'r31'), (719, 27, 'r32'), (732, 28, 'r33'), (745, 29, 'r34'), (758, 30, 'r35'), (771, 31, 'r36'), (784, 32, 'r37'), (797, 33, 'r38'), (810, 34, 'r39'), (823, 35, 'r40'), (836, 36, 'r0'), (849, 37, 'r1'), (862, 38, 'r2'), (875, 39, 'r3'), (888, 40, 'r4'), (901, 41, 'r5'), (914, 42, 'r6'), (927, 43, 'r7'), (940, 44, 'r8'), (953, 45, 'r9'), (966, 46, 'r10'), (979, 47, 'r11'), (992, 48, 'r12'), (1005, 49, 'r13'), (1018, 50, 'r14'), (1031, 51, 'r15'), (1044, 52, 'r16'), (1057, 0, 'r17'), (1070, 1, 'r18'), (1083, 2, 'r19'), (1096, 3, 'r20'), (1109, 4, 'r21'), (1122, 5, 'r22'), (1135, 6, 'r23'), (1148, 7, 'r24'), (1161, 8, 'r25'), (1174, 9, 'r26'), (1187, 10, 'r27'), (1200, 11, 'r28'), (1213, 12, 'r29'), (1226, 13, 'r30'), (1239, 14, 'r31'), (1252, 15, 'r32'), (1265, 16, 'r33'), (1278, 17, 'r34'), (1291, 18, 'r35'), (1304, 19, 'r36'), (1317, 20, 'r37'), (1330, 21, 'r38'), (1343, 22, 'r39'), (1356, 23, 'r40'), (1369, 24, 'r0'), (1382, 25, 'r1'), (1395, 26, 'r2'), (1408, 27, 'r3'), (1421, 28, 'r4'), (1434, 29, 'r5'), (1447, 30, 'r6'), (1460, 31, 'r7'), (1473, 32, 'r8'), (1486, 33, 'r9'), (1499, 34, 'r10'), (1512, 35, 'r11'), (1525, 36, 'r12'), (1538, 37, 'r13'), (1551, 38, 'r14'), (1564, 39, 'r15'), (1577, 40, 'r16'), (1590, 41, 'r17'), (1603, 42, 'r18'), (1616, 43, 'r19'), (1629, 44, 'r20'), (1642, 45, 'r21'), (1655, 46, 'r22'), (1668, 47, 'r23'), (1681, 48, 'r24'), (1694, 49, 'r25'), (1707, 50, 'r26'), (1720, 51, 'r27'), (1733, 52, 'r28'), (1746, 0, 'r29'), (1759, 1, 'r30'), (1772, 2, 'r31'), (1785, 3, 'r32'), (1798, 4, 'r33'), (1811, 5, 'r34'), (1824, 6, 'r35'), (1837, 7, 'r36'), (1850, 8, 'r37'), (1863, 9, 'r38'), (1876, 10, 'r39'), (1889, 11, 'r40'), (1902, 12, 'r0'), (1915, 13, 'r1'), (1928, 14, 'r2'), (1941, 15, 'r3'), (1954, 16, 'r4'), (1967, 17, 'r5'), (1980, 18, 'r6'), (1993, 19, 'r7'), (2006, 20, 'r8'), (2019, 21, 'r9'), (2032, 22, 'r10'), (2045, 23, 'r11'), (2058, 24, 'r12'), (2071, 25, 'r13'), (2084, 26, 'r14'), (2097, 27, 'r15'), (2110, 28, 'r16'), (2123, 29, 'r17'), (2136, 30, 'r18'), (2149, 31, 'r19'), (2162, 32, 'r20'), (2175, 33, 'r21'), (2188, 34, 'r22'), (2201, 35, 'r23'), (2214, 36, 'r24'), (2227, 37, 'r25'), (2240, 38, 'r26'), (2253, 39, 'r27'), (2266, 40, 'r28'), (2279, 41, 'r29'), (2292, 42, 'r30'), (2305, 43, 'r31'), (2318, 44, 'r32'), (2331, 45, 'r33'), (2344, 46, 'r34'), (2357, 47, 'r35'), (2370, 48, 'r36'), (2383, 49, 'r37'), (2396, 50, 'r38'), (2409, 51, 'r39'), (2422, 52, 'r40'), (2435, 0, 'r0'), (2448, 1, 'r1'), (2461, 2, 'r2'), (2474, 3, 'r3'), (2487, 4, 'r4'), (2500, 5, 'r5'), (2513, 6, 'r6'), (2526, 7, 'r7'), (2539, 8, 'r8'), (2552, 9, 'r9'), (2565, 10, 'r10'), (2578, 11, 'r11'), (2591, 12, 'r12'), (2604, 13, 'r13'), (2617, 14, 'r14'), (2630, 15, 'r15'), (2643, 16, 'r16'), (2656, 17, 'r17'), (2669, 18, 'r18'), (2682, 19, 'r19'), (2695, 20, 'r20'), (2708, 21, 'r21'), (2721, 22, 'r22'), (2734, 23, 'r23'), (2747, 24, 'r24'), (2760, 25, 'r25'), (2773, 26, 'r26'), (2786, 27, 'r27'), (2799, 28, 'r28'), (2812, 29, 'r29'), (2825, 30, 'r30'), (2838, 31, 'r31'), (2851, 32, 'r32'), (2864, 33, 'r33'), (2877, 34, 'r34'), (2890, 35, 'r35'), (2903, 36, 'r36'), (2916, 37, 'r37'), (2929, 38, 'r38'), (2942, 39, 'r39'), (2955, 40, 'r40'), (2968, 41, 'r0'), (2981, 42, 'r1'), (2994, 43, 'r2'), (3007, 44, 'r3'), (3020, 45, 'r4'), (3033, 46, 'r5'), (3046, 47, 'r6'), (3059, 48, 'r7'), (3072, 49, 'r8'), (3085, 50, 'r9'), (3098, 51, 'r10'), (3111, 52, 'r11'), (3124, 0, 'r12'), (3137, 1, 'r13'), (3150, 2, 'r14'), (3163, 3, 'r15'), (3176, 4, 'r16'), (3189, 5, 'r17'), (3202, 6, 'r18'), (3215, 7, 'r19'), (3228, 8, 'r20'), (3241, 9, 'r21'), (3254, 10, 'r22'), (3267, 11, 'r23'), (3280, 12, 'r24'), (3293, 13, 'r25'), (3306, 14, 'r26'), (3319, 15, 'r27'), (3332, 16, 'r28'), (3345, 17, 'r29'), (3358, 18, 'r30'), (3371, 19, 'r31'), (3384, 20, 'r32'), (3397, 21, 'r33'), (3410, 22, 'r34'), (3423, 23, 'r35'), (3436, 24, 'r36'), (3449, 25, 'r37'), (3462, 26, 'r38'), (3475, 27, 'r39'), (3488, 28, 'r40'), (3501, 29, 'r0'), (3514, 30, 'r1'), (3527, 31, 'r2'), (3540, 32, 'r3'), (3553, 33, 'r4'), (3566, 34, 'r5'), (3579, 35, 'r6'), (3592, 36, 'r7'), (3605, 37, 'r8'), (3618, 38, 'r9'), (3631, 39, 'r10'), (3644, 40, 'r11'), (3657, 41, 'r12'), (3670, 42, 'r13'), (3683, 43, 'r14'), (3696, 44, 'r15'), (3709, 45, 'r16'), (3722, 46, 'r17'), (3735, 47, 'r18'), (3748, 48, 'r19'), (3761, 49, 'r20'), (3774, 50, 'r21'), (3787, 51, 'r22'), (3800, 52, 'r23'), (3813, 0, 'r24'), (3826, 1, 'r25'), (3839, 2, 'r26'), (3852, 3, 'r27'), (3865, 4, 'r28'), (3878, 5, 'r29'), (3891, 6, 'r30'), (3904, 7, 'r31'), (3917, 8, 'r32'), (3930, 9, 'r33'), (3943, 10, 'r34'), (3956, 11, 'r35'), (3969, 12, 'r36'), (3982, 13, 'r37'), (3995, 14, 'r38'), (4008, 15, 'r39'), (4021, 16, 'r40'), (4034, 17, 'r0'), (4047, 18, 'r1'), (4060, 19, 'r2'), (4073, 20, 'r3'), (4086, 21, 'r4'), (4099, 22, 'r5'), (4112, 23, 'r6'), (4125, 24, 'r7'), (4138, 25, 'r8'), (4151, 26, 'r9'), (4164, 27, 'r10'), (4177, 28, 'r11'), (4190, 29, 'r12'), (4203, 30, 'r13'), (4216, 31, 'r14'), (4229, 32, 'r15'), (4242, 33, 'r16'), (4255, 34, 'r17'), (4268, 35, 'r18'), (4281, 36, 'r19'), (4294, 37, 'r20'), (4307, 38, 'r21'), (4320, 39, 'r22'), (4333, 40, 'r23'), (4346, 41, 'r24'), (4359, 42, 'r25'), (4372, 43, 'r26'), (4385, 44, 'r27'), (4398, 45, 'r28'), (4411, 46, 'r29'), (4424, 47, 'r30'), (4437, 48, 'r31'), (4450, 49, 'r32'), (4463, 50, 'r33'), (4476, 51, 'r34'), (4489, 52, 'r35'), (4502, 0, 'r36'), (4515, 1, 'r37'), (4528, 2, 'r38'), (4541, 3, 'r39'), (4554, 4, 'r40'), (4567, 5, 'r0'), (4580, 6, 'r1'), (4593, 7, 'r2'), (4606, 8, 'r3'), (4619, 9, 'r4'), (4632, 10, 'r5'), (4645, 11, 'r6'), (4658, 12, 'r7'), (4671, 13, 'r8'), (4684, 14, 'r9'), (4697, 15, 'r10'), (4710, 16, 'r11'), (4723, 17, 'r12'), (4736, 18, 'r13'), (4749, 19, 'r14'), (4762, 20, 'r15'), (4775, 21, 'r16'), (4788, 22, 'r17'), (4801, 23, 'r18'), (4814, 24, 'r19'), (4827, 25, 'r20'), (4840, 26, 'r21'), (4853, 27, 'r22'), (4866, 28, 'r23'), (4879, 29, 'r24'), (4892, 30, 'r25'), (4905, 31, 'r26'), (4918, 32, 'r27'), (4931, 33, 'r28'), (4944, 34, 'r29'), (4957, 35, 'r30'), (4970, 36, 'r31'), (4983, 37, 'r32'), (4996, 38, 'r33'), (5009, 39, 'r34'), (5022, 40, 'r35'), (5035, 41, 'r36'), (5048, 42, 'r37'), (5061, 43, 'r38'), (5074, 44, 'r39'), (5087, 45, 'r40'), (5100, 46, 'r0'), (5113, 47, 'r1'), (5126, 48, 'r2'), (5139, 49, 'r3'), (5152, 50, 'r4'), (5165, 51, 'r5'), (5178, 52, 'r6'), (5191, 0, 'r7'), (5204, 1, 'r8'), (5217, 2, 'r9'), (5230, 3, 'r10'), (5243, 4, 'r11'), (5256, 5, 'r12'), (5269, 6, 'r13'), (5282, 7, 'r14'), (5295, 8, 'r15'), (5308, 9, 'r16'), (5321, 10, 'r17'), (5334, 11, 'r18'), (5347, 12, 'r19'), (5360, 13, 'r20'), (5373, 14, 'r21'), (5386, 15, 'r22'), (5399, 16, 'r23'), (5412, 17, 'r24'), (5425, 18, 'r25'), (5438, 19, 'r26'), (5451, 20, 'r27'), (5464, 21, 'r28'), (5477, 22, 'r29'), (5490, 23, 'r30'), (5503, 24, 'r31'), (5516, 25, 'r32'), (5529, 26, 'r33'), (5542, 27, 'r34'), (5555, 28, 'r35'), (5568, 29, 'r36'), (5581, 30, 'r37'), (5594, 31, 'r38'), (5607, 32, 'r39'), (5620, 33, 'r40'), (5633, 34, 'r0'), (5646, 35, 'r1'), (5659, 36, 'r2'), (5672, 37, 'r3'), (5685, 38, 'r4'), (5698, 39, 'r5'), (5711, 40, 'r6'), (5724, 41, 'r7'), (5737, 42, 'r8'), (5750, 43, 'r9'), (5763, 44, 'r10'), (5776, 45, 'r11'), (5789, 46, 'r12'), (5802, 47, 'r13'), (5815, 48, 'r14'), (5828, 49, 'r15'), (5841, 50, 'r16'), (5854, 51, 'r17'), (5867, 52, 'r18'), (5880, 0, 'r19'), (5893, 1, 'r20'), (5906, 2, 'r21'), (5919, 3, 'r22'), (5932, 4, 'r23'), (5945, 5, 'r24'), (5958, 6, 'r25'), (5971, 7, 'r26'), (5984, 8, 'r27'), (5997, 9, 'r28'), (3, 10, 'r29'), (16, 11, 'r30'), (29, 12, 'r31'), (42, 13, 'r32'), (55, 14, 'r33'), (68, 15, 'r34'), (81, 16, 'r35'), (94, 17, 'r36'), (107, 18, 'r37'), (120, 19, 'r38'), (133, 20, 'r39'), (146, 21, 'r40'), (159, 22, 'r0'), (172, 23, 'r1'), (185, 24, 'r2'), (198, 25, 'r3'), (211, 26, 'r4'), (224, 27, 'r5'), (237, 28, 'r6'), (250, 29, 'r7'), (263, 30, 'r8'), (276, 31, 'r9'), (289, 32, 'r10'), (302, 33, 'r11'), (315, 34, 'r12'), (328, 35, 'r13'), (341, 36, 'r14'), (354, 37, 'r15'), (367, 38, 'r16'), (380, 39, 'r17'), (393, 40, 'r18'), (406, 41, 'r19'), (419, 42, 'r20'), (432, 43, 'r21'), (445, 44, 'r22'), (458, 45, 'r23'), (471, 46, 'r24'), (484, 47, 'r25'), (497, 48, 'r26'), (510, 49, 'r27'), (523, 50, 'r28'), (536, 51, 'r29'), (549, 52, 'r30'), (562, 0, 'r31'), (575, 1, 'r32'), (588, 2, 'r33'), (601, 3, 'r34'), (614, 4, 'r35'), (627, 5, 'r36'), (640, 6, 'r37'), (653, 7, 'r38'), (666, 8, 'r39'), (679, 9, 'r40'), (692, 10, 'r0'), (705, 11, 'r1'), (718, 12, 'r2'), (731, 13, 'r3'), (744, 14, 'r4'), (757, 15, 'r5'), (770, 16, 'r6'), (783, 17, 'r7'), (796, 18, 'r8'), (809, 19, 'r9'), (822, 20, 'r10'), (835, 21, 'r11'), (848, 22, 'r12'), (861, 23, 'r13'), (874, 24, 'r14'), (887, 25, 'r15'), (900, 26, 'r16'), (913, 27, 'r17'), (926, 28, 'r18'), (939, 29, 'r19'), (952, 30, 'r20'), (965, 31, 'r21'), (978, 32, 'r22'), (991, 33, 'r23'), (1004, 34, 'r24'), (1017, 35, 'r25'), (1030, 36, 'r26'), (1043, 37, 'r27'), (1056, 38, 'r28'), (1069, 39, 'r29'), (1082, 40, 'r30'), (1095, 41, 'r31'), (1108, 42, 'r32'), (1121, 43, 'r33'), (1134, 44, 'r34'), (1147, 45, 'r35'), (1160, 46, 'r36'), (1173, 47, 'r37'), (1186, 48, 'r38'), (1199, 49, 'r39'), (1212, 50, 'r40'), (1225, 51, 'r0'), (1238, 52, 'r1'), (1251, 0, 'r2'), (1264, 1, 'r3'), (1277, 2, 'r4'), (1290, 3, 'r5'), (1303, 4, 'r6'), (1316, 5, 'r7'), (1329, 6, 'r8'), (1342, 7, 'r9'), (1355, 8, 'r10'), (1368, 9, 'r11'), (1381, 10, 'r12'), (1394, 11, 'r13'), (1407, 12, 'r14'), (1420, 13, 'r15'), (1433, 14, 'r16'), (1446, 15, 'r17'), (1459, 16, 'r18'), (1472, 17, 'r19'), (1485, 18, 'r20'), (1498, 19, 'r21'), (1511, 20, 'r22'), (1524, 21, 'r23'), (1537, 22, 'r24'), (1550, 23, 'r25'), (1563, 24, 'r26'), (1576, 25, 'r27'), (1589, 26, 'r28'), (1602, 27, 'r29'), (1615, 28, 'r30'), (1628, 29, 'r31'), (1641, 30, 'r32'), (1654, 31, 'r33'), (1667, 32, 'r34'), (1680, 33, 'r35'), (1693, 34, 'r36'), (1706, 35, 'r37'), (1719, 36, 'r38'), (1732, 37, 'r39'), (1745, 38, 'r40'), (1758, 39, 'r0'), (1771, 40, 'r1'), (1784, 41, 'r2'), (1797, 42, 'r3'), (1810, 43, 'r4'), (1823, 44, 'r5'), (1836, 45, 'r6'), (1849, 46, 'r7'), (1862, 47, 'r8'), (1875, 48, 'r9'), (1888, 49, 'r10'), (1901, 50, 'r11'), (1914, 51, 'r12'), (1927, 52, 'r13'), (1940, 0, 'r14'), (1953, 1, 'r15'), (1966, 2, 'r16'), (1979, 3, 'r17'), (1992, 4, 'r18'), (2005, 5, 'r19'), (2018, 6, 'r20'), (2031, 7, 'r21'), (2044, 8, 'r22'), (2057, 9, 'r23'), (2070, 10, 'r24'), (2083, 11, 'r25'), (2096, 12, 'r26'), (2109, 13, 'r27'), (2122, 14, 'r28'), (2135, 15, 'r29'), (2148, 16, 'r30'), (2161, 17, 'r31'), (2174, 18, 'r32'), (2187, 19, 'r33'), (2200, 20, 'r34'), (2213, 21, 'r35'), (2226, 22, 'r36'), (2239, 23, 'r37'), (2252, 24, 'r38'), (2265, 25, 'r39'), (2278, 26, 'r40'), (2291, 27, 'r0'), (2304, 28, 'r1'), (2317, 29, 'r2'), (2330, 30, 'r3'), (2343, 31, 'r4'), (2356, 32, 'r5'), (2369, 33, 'r6'), (2382, 34, 'r7'), (2395, 35, 'r8'), (2408, 36, 'r9'), (2421, 37, 'r10'), (2434, 38, 'r11'), (2447, 39, 'r12'), (2460, 40, 'r13'), (2473, 41, 'r14'), (2486, 42, 'r15'), (2499, 43, 'r16'), (2512, 44, 'r17'), (2525, 45, 'r18'), (2538, 46, 'r19'), (2551, 47, 'r20'), (2564, 48, 'r21'), (2577, 49, 'r22'), (2590, 50, 'r23'), (2603, 51, 'r24'), (2616, 52, 'r25'), (2629, 0, 'r26'), (2642, 1, 'r27'), (2655, 2, 'r28'), (2668, 3, 'r29'), (2681, 4, 'r30'), (2694, 5, 'r31'), (2707, 6, 'r32'), (2720, 7, 'r33'), (2733, 8, 'r34'), (2746, 9, 'r35'), (2759, 10, 'r36'), (2772, 11, 'r37'), (2785, 12, 'r38'), (2798, 13, 'r39'), (2811, 14, 'r40'), (2824, 15, 'r0'), (2837, 16, 'r1'), (2850, 17, 'r2'), (2863, 18, 'r3'), (2876, 19, 'r4'), (2889, 20, 'r5'), (2902, 21, 'r6'), (2915, 22, 'r7'), (2928, 23, 'r8'), (2941, 24, 'r9'), (2954, 25, 'r10'), (2967, 26, 'r11'), (2980, 27, 'r12'), (2993, 28, 'r13'), (3006, 29, 'r14'), (3019, 30, 'r15'), (3032, 31, 'r16'), (3045, 32, 'r17'), (3058, 33, 'r18'), (3071, 34, 'r19'), (3084, 35, 'r20'), (3097, 36, 'r21'), (3110, 37, 'r22'), (3123, 38, 'r23'), (3136, 39, 'r24'), (3149, 40, 'r25'), (3162, 41, 'r26'), (3175, 42, 'r27'), (3188, 43, 'r28'), (3201, 44, 'r29'), (3214, 45, 'r30'), (3227, 46, 'r31'), (3240, 47, 'r32'), (3253, 48, 'r33'), (3266, 49, 'r34'), (3279, 50, 'r35'), (3292, 51, 'r36'), (3305, 52, 'r37'), (3318, 0, 'r38'), (3331, 1, 'r39'), (3344, 2, 'r40'), (3357, 3, 'r0'), (3370, 4, 'r1'), (3383, 5, 'r2'), (3396, 6, 'r3'), (3409, 7, 'r4'), (3422, 8, 'r5'), (3435, 9, 'r6'), (3448, 10, 'r7'), (3461, 11, 'r8'), (3474, 12, 'r9'), (3487, 13, 'r10'), (3500, 14, 'r11'), (3513, 15, 'r12'), (3526, 16, 'r13'), (3539, 17, 'r14'), (3552, 18, 'r15'), (3565, 19, 'r16'), (3578, 20, 'r17'), (3591, 21, 'r18'), (3604, 22, 'r19'), (3617, 23, 'r20'), (3630, 24, 'r21'), (3643, 25, 'r22'), (3656, 26, 'r23'), (3669, 27, 'r24'), (3682, 28, 'r25'), (3695, 29, 'r26'), (3708, 30, 'r27'), (3721, 31, 'r28'), (3734, 32, 'r29'), (3747, 33, 'r30'), (3760, 34, 'r31'), (3773, 35, 'r32'), (3786, 36, 'r33'), (3799, 37, 'r34'), (3812, 38, 'r35'), (3825, 39, 'r36'), (3838, 40, 'r37'), (3851, 41, 'r38'), (3864, 42, 'r39'), (3877, 43, 'r40'), (3890, 44, 'r0'), (3903, 45, 'r1'), (3916, 46, 'r2'), (3929, 47, 'r3'), (3942, 48, 'r4'), (3955, 49, 'r5'), (3968, 50, 'r6'), (3981, 51, 'r7'), (3994, 52, 'r8'), (4007, 0, 'r9'), (4020, 1, 'r10'), (4033, 2, 'r11'), (4046, 3, 'r12'), (4059, 4, 'r13'), (4072, 5, 'r14'), (4085, 6, 'r15'), (4098, 7, 'r16'), (4111, 8, 'r17'), (4124, 9, 'r18'), (4137, 10, 'r19'), (4150, 11, 'r20'), (4163, 12, 'r21'), (4176, 13, 'r22'), (4189, 14, 'r23'), (4202, 15, 'r24'), (4215, 16, 'r25'), (4228, 17, 'r26'), (4241, 18, 'r27'), (4254, 19, 'r28'), (4267, 20, 'r29'), (4280, 21, 'r30'), (4293, 22, 'r31'), (4306, 23, 'r32'), (4319, 24, 'r33'), (4332, 25, 'r34'), (4345, 26, 'r35'), (4358, 27, 'r36'), (4371, 28, 'r37'), (4384, 29, 'r38'), (4397, 30, 'r39'), (4410, 31, 'r40'), (4423, 32, 'r0'), (4436, 33, 'r1'), (4449, 34, 'r2'), (4462, 35, 'r3'), (4475, 36, 'r4'), (4488, 37, 'r5'), (4501, 38, 'r6'), (4514, 39, 'r7'), (4527, 40, 'r8'), (4540, 41, 'r9'), (4553, 42, 'r10'), (4566, 43, 'r11'), (4579, 44, 'r12'), (4592, 45, 'r13'), (4605, 46, 'r14'), (4618, 47, 'r15'), (4631, 48, 'r16'), (4644, 49, 'r17'), (4657, 50, 'r18'), (4670, 51, 'r19'), (4683, 52, 'r20'), (4696, 0, 'r21'), (4709, 1, 'r22'), (4722, 2, 'r23'), (4735, 3, 'r24'), (4748, 4, 'r25'), (4761, 5, 'r26'), (4774, 6, 'r27'), (4787, 7, 'r28'), (4800, 8, 'r29'), (4813, 9, 'r30'), (4826, 10, 'r31'), (4839, 11, 'r32'), (4852, 12, 'r33'), (4865, 13, 'r34'), (4878, 14, 'r35'), (4891, 15, 'r36'), (4904, 16, 'r37'), (4917, 17, 'r38'), (4930, 18, 'r39'), (4943, 19, 'r40'), (4956, 20, 'r0'), (4969, 21, 'r1'), (4982, 22, 'r2'), (4995, 23, 'r3'), (5008, 24, 'r4'), (5021, 25, 'r5'), (5034, 26, 'r6'), (5047, 27, 'r7'), (5060, 28, 'r8'), (5073, 29, 'r9'), (5086, 30, 'r10'), (5099, 31, 'r11'), (5112, 32, 'r12'), (5125, 33, 'r13'), (5138, 34, 'r14'), (5151, 35, 'r15'), (5164, 36, 'r16'), (5177, 37, 'r17'), (5190, 38, 'r18'), (5203, 39, 'r19'), (5216, 40, 'r20'), (5229, 41, 'r21'), (5242, 42, 'r22'), (5255, 43, 'r23'), (5268, 44, 'r24'), (5281, 45, 'r25'), (5294, 46, 'r26'), (5307, 47, 'r27'), (5320, 48, 'r28'), (5333, 49, 'r29'), (5346, 50, 'r30'), (5359, 51, 'r31'), (5372, 52, 'r32'), (5385, 0, 'r33'), (5398, 1, 'r34'), (5411, 2, 'r35'), (5424, 3, 'r36'), (5437, 4, 'r37'), (5450, 5, 'r38'), (5463, 6, 'r39'), (5476, 7, 'r40'), (5489, 8, 'r0'), (5502, 9, 'r1'), (5515, 10, 'r2'), (5528, 11, 'r3'), (5541, 12, 'r4'), (5554, 13, 'r5'), (5567, 14, 'r6'), (5580, 15, 'r7'), (5593, 16, 'r8'), (5606, 17, 'r9'), (5619, 18, 'r10'), (5632, 19, 'r11'), (5645, 20, 'r12'), (5658, 21, 'r13'), (5671, 22, 'r14'), (5684, 23, 'r15'), (5697, 24, 'r16'), (5710, 25, 'r17'), (5723, 26, 'r18'), (5736, 27, 'r19'), (5749, 28, 'r20'), (5762, 29, 'r21'), (5775, 30, 'r22'), (5788, 31, 'r23'), (5801, 32, 'r24'), (5814, 33, 'r25'), (5827, 34, 'r26'), (5840, 35, 'r27'), (5853, 36, 'r28'), (5866, 37, 'r29'), (5879, 38, 'r30'), (5892, 39, 'r31'), (5905, 40, 'r32'), (5918, 41, 'r33'), (5931, 42, 'r34'), (5944, 43, 'r35'), (5957, 44, 'r36'), (5970, 45, 'r37'), (5983, 46, 'r38'), (5996, 47, 'r39'), (2, 48, 'r40'), (15, 49, 'r0'), (28, 50, 'r1'), (41, 51, 'r2'), (54, 52, 'r3'), (67, 0, 'r4'), (80, 1, 'r5'), (93, 2, 'r6'), (106, 3, 'r7'), (119, 4, 'r8'), (132, 5, 'r9'), (145, 6, 'r10'), (158, 7, 'r11'), (171, 8, 'r12'), (184, 9, 'r13'), (197, 10, 'r14'), (210, 11, 'r15'), (223, 12, 'r16'), (236, 13, 'r17'), (249, 14, 'r18'), (262, 15, 'r19'), (275, 16, 'r20'), (288, 17, 'r21'), (301, 18, 'r22'), (314, 19, 'r23'), (327, 20, 'r24'), (340, 21, 'r25'), (353, 22, 'r26'), (366, 23, 'r27'), (379, 24, 'r28'), (392, 25, 'r29'), (405, 26, 'r30'), (418, 27, 'r31'), (431, 28, 'r32'), (444, 29, 'r33'), (457, 30, 'r34'), (470, 31, 'r35'), (483, 32, 'r36'), (496, 33, 'r37'), (509, 34, 'r38'), (522, 35, 'r39'), (535, 36, 'r40'), (548, 37, 'r0'), (561, 38, 'r1'), (574, 39, 'r2'), (587, 40, 'r3'), (600, 41, 'r4'), (613, 42, 'r5'), (626, 43, 'r6'), (639, 44, 'r7'), (652, 45, 'r8'), (665, 46, 'r9'), (678, 47, 'r10'), (691, 48, 'r11'), (704, 49, 'r12'), (717, 50, 'r13'), (730, 51, 'r14'), (743, 52, 'r15'), (756, 0, 'r16'), (769, 1, 'r17'), (782, 2, 'r18'), (795, 3, 'r19'), (808, 4, 'r20'), (821, 5, 'r21'), (834, 6, 'r22'), (847, 7, 'r23'), (860, 8, 'r24'), (873, 9, 'r25'), (886, 10, 'r26'), (899, 11, 'r27'), (912, 12, 'r28'), (925, 13, 'r29'), (938, 14, 'r30'), (951, 15, 'r31'), (964, 16, 'r32'), (977, 17, 'r33'), (990, 18, 'r34'), (1003, 19, 'r35'), (1016, 20, 'r36'), (1029, 21, 'r37'), (1042, 22, 'r38'), (1055, 23, 'r39'), (1068, 24, 'r40'), (1081, 25, 'r0'), (1094, 26, 'r1'), (1107, 27, 'r2'), (1120, 28, 'r3'), (1133, 29, 'r4'), (1146, 30, 'r5'), (1159, 31, 'r6'), (1172, 32, 'r7'), (1185, 33, 'r8'), (1198, 34, 'r9'), (1211, 35, 'r10'), (1224, 36, 'r11'), (1237, 37, 'r12'), (1250, 38, 'r13'), (1263, 39, 'r14'), (1276, 40, 'r15'), (1289, 41, 'r16'), (1302, 42, 'r17'), (1315, 43, 'r18'), (1328, 44, 'r19'), (1341, 45, 'r20'), (1354, 46, 'r21'), (1367, 47, 'r22'), (1380, 48, 'r23'), (1393, 49, 'r24'), (1406, 50, 'r25'), (1419, 51, 'r26'), (1432, 52, 'r27'), (1445, 0, 'r28'), (1458, 1, 'r29'), (1471, 2, 'r30'), (1484, 3, 'r31'), (1497, 4, 'r32'), (1510, 5, 'r33'), (1523, 6, 'r34'), (1536, 7, 'r35'), (1549, 8, 'r36'), (1562, 9, 'r37'), (1575, 10, 'r38'), (1588, 11, 'r39'), (1601, 12, 'r40'), (1614, 13, 'r0'), (1627, 14, 'r1'), (1640, 15, 'r2'), (1653, 16, 'r3'), (1666, 17, 'r4'), (1679, 18, 'r5'), (1692, 19, 'r6'), (1705, 20, 'r7'), (1718, 21, 'r8'), (1731, 22, 'r9'), (1744, 23, 'r10'), (1757, 24, 'r11'), (1770, 25, 'r12'), (1783, 26, 'r13'), (1796, 27, 'r14'), (1809, 28, 'r15'), (1822, 29, 'r16'), (1835, 30, 'r17'), (1848, 31, 'r18'), (1861, 32, 'r19'), (1874, 33, 'r20'), (1887, 34, 'r21'), (1900, 35, 'r22'), (1913, 36, 'r23'), (1926, 37, 'r24'), (1939, 38, 'r25'), (1952, 39, 'r26'), (1965, 40, 'r27'), (1978, 41, 'r28'), (1991, 42, 'r29'), (2004, 43, 'r30'), (2017, 44, 'r31'), (2030, 45, 'r32'), (2043, 46, 'r33'), (2056, 47, 'r34'), (2069, 48, 'r35'), (2082, 49, 'r36'), (2095, 50, 'r37'), (2108, 51, 'r38'), (2121, 52, 'r39'), (2134, 0, 'r40'), (2147, 1, 'r0'), (2160, 2, 'r1'), (2173, 3, 'r2'), (2186, 4, 'r3'), (2199, 5, 'r4'), (2212, 6, 'r5'), (2225, 7, 'r6'), (2238, 8, 'r7'), (2251, 9, 'r8'), (2264, 10, 'r9'), (2277, 11, 'r10'), (2290, 12, 'r11'), (2303, 13, 'r12'), (2316, 14, 'r13'), (2329, 15, 'r14'), (2342, 16, 'r15'), (2355, 17, 'r16'), (2368, 18, 'r17'), (2381, 19, 'r18'), (2394, 20, 'r19'), (2407, 21, 'r20'), (2420, 22, 'r21'), (2433, 23, 'r22'), (2446, 24, 'r23'), (2459, 25, 'r24'), (2472, 26, 'r25'), (2485, 27, 'r26'), (2498, 28, 'r27'), (2511, 29, 'r28'), (2524, 30, 'r29'), (2537, 31, 'r30'), (2550, 32, 'r31'), (2563, 33, 'r32'), (2576, 34, 'r33'), (2589, 35, 'r34'), (2602, 36, 'r35'), (2615, 37, 'r36'), (2628, 38, 'r37'), (2641, 39, 'r38'), (2654, 40, 'r39'), (2667, 41, 'r40'), (2680, 42, 'r0'), (2693, 43, 'r1'), (2706, 44, 'r2'), (2719, 45, 'r3'), (2732, 46, 'r4'), (2745, 47, 'r5'), (2758, 48, 'r6'), (2771, 49, 'r7'), (2784, 50, 'r8'), (2797, 51, 'r9'), (2810, 52, 'r10'), (2823, 0, 'r11'), (2836, 1, 'r12'), (2849, 2, 'r13'), (2862, 3, 'r14'), (2875, 4, 'r15'), (2888, 5, 'r16'), (2901, 6, 'r17'), (2914, 7, 'r18'), (2927, 8, 'r19'), (2940, 9, 'r20'), (2953, 10, 'r21'), (2966, 11, 'r22'), (2979, 12, 'r23'), (2992, 13, 'r24'), (3005, 14, 'r25'), (3018, 15, 'r26'), (3031, 16, 'r27'), (3044, 17, 'r28'), (3057, 18, 'r29'), (3070, 19, 'r30'), (3083, 20, 'r31'), (3096, 21, 'r32'), (3109, 22, 'r33'), (3122, 23, 'r34'), (3135, 24, 'r35'), (3148, 25, 'r36'), (3161, 26, 'r37'), (3174, 27, 'r38'), (3187, 28, 'r39'), (3200, 29, 'r40'), (3213, 30, 'r0'), (3226, 31, 'r1'), (3239, 32, 'r2'), (3252, 33, 'r3'), (3265, 34, 'r4'), (3278, 35, 'r5'), (3291, 36, 'r6'), (3304, 37, 'r7'), (3317, 38, 'r8'), (3330, 39, 'r9'), (3343, 40, 'r10'), (3356, 41, 'r11'), (3369, 42, 'r12'), (3382, 43, 'r13'), (3395, 44, 'r14'), (3408, 45, 'r15'), (3421, 46, 'r16'), (3434, 47, 'r17'), (3447, 48, 'r18'), (3460, 49, 'r19'), (3473, 50, 'r20'), (3486, 51, 'r21'), (3499, 52, 'r22'), (3512, 0, 'r23'), (3525, 1, 'r24'), (3538, 2, 'r25'), (3551, 3, 'r26'), (3564, 4, 'r27'), (3577, 5, 'r28'), (3590, 6, 'r29'), (3603, 7, 'r30'), (3616, 8, 'r31'), (3629, 9, 'r32'), (3642, 10, 'r33'), (3655, 11, 'r34'), (3668, 12, 'r35'), (3681, 13, 'r36'), (3694, 14, 'r37'), (3707, 15, 'r38'), (3720, 16, 'r39'), (3733, 17, 'r40'), (3746, 18, 'r0'), (3759, 19, 'r1'), (3772, 20, 'r2'), (3785, 21, 'r3'), (3798, 22, 'r4'), (3811, 23, 'r5'), (3824, 24, 'r6'), (3837, 25, 'r7'), (3850, 26, 'r8'), (3863, 27, 'r9'), (3876, 28, 'r10'), (3889, 29, 'r11'), (3902, 30, 'r12'), (3915, 31, 'r13'), (3928, 32, 'r14'), (3941, 33, 'r15'), (3954, 34, 'r16'), (3967, 35, 'r17'), (3980, 36, 'r18'), (3993, 37, 'r19'), (4006, 38, 'r20'), (4019, 39, 'r21'), (4032, 40, 'r22'), (4045, 41, 'r23'), (4058, 42, 'r24'), (4071, 43, 'r25'), (4084, 44, 'r26'), (4097, 45, 'r27'), (4110, 46, 'r28'), (4123, 47, 'r29'), (4136, 48, 'r30'), (4149, 49, 'r31'), (4162, 50, 'r32'), (4175, 51, 'r33'), (4188, 52, 'r34'), (4201, 0, 'r35'), (4214, 1, 'r36'), (4227, 2, 'r37'), (4240, 3, 'r38'), (4253, 4, 'r39'), (4266, 5, 'r40'), (4279, 6, 'r0'), (4292, 7, 'r1'), (4305, 8, 'r2'), (4318, 9, 'r3'), (4331, 10, 'r4'), (4344, 11, 'r5'), (4357, 12, 'r6'), (4370, 13, 'r7'), (4383, 14, 'r8'), (4396, 15, 'r9'), (4409, 16, 'r10'), (4422, 17, 'r11'), (4435, 18, 'r12'), (4448, 19, 'r13'), (4461, 20, 'r14'), (4474, 21, 'r15'), (4487, 22, 'r16'), (4500, 23, 'r17'), (4513, 24, 'r18'), (4526, 25, 'r19'), (4539, 26, 'r20'), (4552, 27, 'r21'), (4565, 28, 'r22'), (4578, 29, 'r23'), (4591, 30, 'r24'), (4604, 31, 'r25'), (4617, 32, 'r26'), (4630, 33, 'r27'), (4643, 34, 'r28'), (4656, 35, 'r29'), (4669, 36, 'r30'), (4682, 37, 'r31'), (4695, 38, 'r32'), (4708, 39, 'r33'), (4721, 40, 'r34'), (4734, 41, 'r35'), (4747, 42, 'r36'), (4760, 43, 'r37'), (4773, 44, 'r38'), (4786, 45, 'r39'), (4799, 46, 'r40'), (4812, 47, 'r0'), (4825, 48, 'r1'), (4838, 49, 'r2'), (4851, 50, 'r3'), (4864, 51, 'r4'), (4877, 52, 'r5'), (4890, 0, 'r6'), (4903, 1, 'r7'), (4916, 2, 'r8'), (4929, 3, 'r9'), (4942, 4, 'r10'), (4955, 5, 'r11'), (4968, 6, 'r12'), (4981, 7, 'r13'), (4994, 8, 'r14'), (5007, 9, 'r15'), (5020, 10, 'r16'), (5033, 11, 'r17'), (5046, 12, 'r18'), (5059, 13, 'r19'), (5072, 14, 'r20'), (5085, 15, 'r21'), (5098, 16, 'r22'), (5111, 17, 'r23'), (5124, 18, 'r24'), (5137, 19, 'r25'), (5150, 20, 'r26'), (5163, 21, 'r27'), (5176, 22, 'r28'), (5189, 23, 'r29'), (5202, 24, 'r30'), (5215, 25, 'r31'), (5228, 26, 'r32'), (5241, 27, 'r33'), (5254, 28, 'r34'), (5267, 29, 'r35'), (5280, 30, 'r36'), (5293, 31, 'r37'), (5306, 32, 'r38'), (5319, 33, 'r39'), (5332, 34, 'r40'), (5345, 35, 'r0'), (5358, 36, 'r1'), (5371, 37, 'r2'), (5384, 38, 'r3'), (5397, 39, 'r4'), (5410, 40, 'r5'), (5423, 41, 'r6'), (5436, 42, 'r7'), (5449, 43, 'r8'), (5462, 44, 'r9'), (5475, 45, 'r10'), (5488, 46, 'r11'), (5501, 47, 'r12'), (5514, 48, 'r13'), (5527, 49, 'r14'), (5540, 50, 'r15'), (5553, 51, 'r16'), (5566, 52, 'r17'), (5579, 0, 'r18'), (5592, 1, 'r19'), (5605, 2, 'r20'), (5618, 3, 'r21'), (5631, 4, 'r22'), (5644, 5, 'r23'), (5657, 6, 'r24'), (5670, 7, 'r25'), (5683, 8, 'r26'), (5696, 9, 'r27'), (5709, 10, 'r28'), (5722, 11, 'r29'), (5735, 12, 'r30'), (5748, 13, 'r31'), (5761, 14, 'r32'), (5774, 15, 'r33'), (5787, 16, 'r34'), (5800, 17, 'r35'), (5813, 18, 'r36'), (5826, 19, 'r37'), (5839, 20, 'r38'), (5852, 21, 'r39'), (5865, 22, 'r40'), (5878, 23, 'r0'), (5891, 24, 'r1'), (5904, 25, 'r2'), (5917, 26, 'r3'), (5930, 27, 'r4'), (5943, 28, 'r5'), (5956, 29, 'r6'), (5969, 30, 'r7'), (5982, 31, 'r8'), (5995, 32, 'r9'), (1, 33, 'r10'), (14, 34, 'r11'), (27, 35, 'r12'), (40, 36, 'r13'), (53, 37, 'r14'), (66, 38, 'r15'), (79, 39, 'r16'), (92, 40, 'r17'), (105, 41, 'r18'), (118, 42, 'r19'), (131, 43, 'r20'), (144, 44, 'r21'), (157, 45, 'r22'), (170, 46, 'r23'), (183, 47, 'r24'), (196, 48, 'r25'), (209, 49, 'r26'), (222, 50, 'r27'), (235, 51, 'r28'), (248, 52, 'r29'), (261, 0, 'r30'), (274, 1, 'r31'), (287, 2, 'r32'), (300, 3, 'r33'), (313, 4, 'r34'), (326, 5, 'r35'), (339, 6, 'r36'), (352, 7, 'r37'), (365, 8, 'r38'), (378, 9, 'r39'), (391, 10, 'r40'), (404, 11, 'r0'), (417, 12, 'r1'), (430, 13, 'r2'), (443, 14, 'r3'), (456, 15, 'r4'), (469, 16, 'r5'), (482, 17, 'r6'), (495, 18, 'r7'), (508, 19, 'r8'), (521, 20, 'r9'), (534, 21, 'r10'), (547, 22, 'r11'), (560, 23, 'r12'), (573, 24, 'r13'), (586, 25, 'r14'), (599, 26, 'r15'), (612, 27, 'r16'), (625, 28, 'r17'), (638, 29, 'r18'), (651, 30, 'r19'), (664, 31, 'r20'), (677, 32, 'r21'), (690, 33, 'r22'), (703, 34, 'r23'), (716, 35, 'r24'), (729, 36, 'r25'), (742, 37, 'r26'), (755, 38, 'r27'), (768, 39, 'r28'), (781, 40, 'r29'), (794, 41, 'r30'), (807, 42, 'r31'), (820, 43, 'r32'), (833, 44, 'r33'), (846, 45, 'r34'), (859, 46, 'r35'), (872, 47, 'r36'), (885, 48, 'r37'), (898, 49, 'r38'), (911, 50, 'r39'), (924, 51, 'r40'), (937, 52, 'r0'), (950, 0, 'r1'), (963, 1, 'r2'), (976, 2, 'r3'), (989, 3, 'r4'), (1002, 4, 'r5'), (1015, 5, 'r6'), (1028, 6, 'r7'), (1041, 7, 'r8'), (1054, 8, 'r9'), (1067, 9, 'r10'), (1080, 10, 'r11'), (1093, 11, 'r12'), (1106, 12, 'r13'), (1119, 13, 'r14'), (1132, 14, 'r15'), (1145, 15, 'r16'), (1158, 16, 'r17'), (1171, 17, 'r18'), (1184, 18, 'r19'), (1197, 19, 'r20'), (1210, 20, 'r21'), (1223, 21, 'r22'), (1236, 22, 'r23'), (1249, 23, 'r24'), (1262, 24, 'r25'), (1275, 25, 'r26'), (1288, 26, 'r27'), (1301, 27, 'r28'), (1314, 28, 'r29'), (1327, 29, 'r30'), (1340, 30, 'r31'), (1353, 31, 'r32'), (1366, 32, 'r33'), (1379, 33, 'r34'), (1392, 34, 'r35'), (1405, 35, 'r36'), (1418, 36, 'r37'), (1431, 37, 'r38'), (1444, 38, 'r39'), (1457, 39, 'r40'), (1470, 40, 'r0'), (1483, 41, 'r1'), (1496, 42, 'r2'), (1509, 43, 'r3'), (1522, 44, 'r4'), (1535, 45, 'r5'), (1548, 46, 'r6'), (1561, 47, 'r7'), (1574, 48, 'r8'), (1587, 49, 'r9'), (1600, 50, 'r10'), (1613, 51, 'r11'), (1626, 52, 'r12'), (1639, 0, 'r13'), (1652, 1, 'r14'), (1665, 2, 'r15'), (1678, 3, 'r16'), (1691, 4, 'r17'), (1704, 5, 'r18'), (1717, 6, 'r19'), (1730, 7, 'r20'), (1743, 8, 'r21'), (1756, 9, 'r22'), (1769, 10, 'r23'), (1782, 11, 'r24'), (1795, 12, 'r25'), (1808, 13, 'r26'), (1821, 14, 'r27'), (1834, 15, 'r28'), (1847, 16, 'r29'), (1860, 17, 'r30'), (1873, 18, 'r31'), (1886, 19, 'r32'), (1899, 20, 'r33'), (1912, 21, 'r34'), (1925, 22, 'r35'), (1938, 23, 'r36'), (1951, 24, 'r37'), (1964, 25, 'r38'), (1977, 26, 'r39'), (1990, 27, 'r40'), (2003, 28, 'r0'), (2016, 29, 'r1'), (2029, 30, 'r2'), (2042, 31, 'r3'), (2055, 32, 'r4'), (2068, 33, 'r5'), (2081, 34, 'r6'), (2094, 35, 'r7'), (2107, 36, 'r8'), (2120, 37, 'r9'), (2133, 38, 'r10'), (2146, 39, 'r11'), (2159, 40, 'r12'), (2172, 41, 'r13'), (2185, 42, 'r14'), (2198, 43, 'r15'), (2211, 44, 'r16'), (2224, 45, 'r17'), (2237, 46, 'r18'), (2250, 47, 'r19'), (2263, 48, 'r20'), (2276, 49, 'r21'), (2289, 50, 'r22'), (2302, 51, 'r23'), (2315, 52, 'r24'), (2328, 0, 'r25'), (2341, 1, 'r26'), (2354, 2, 'r27'), (2367, 3, 'r28'), (2380, 4, 'r29'), (2393, 5, 'r30'), (2406, 6, 'r31'), (2419, 7, 'r32'), (2432, 8, 'r33'), (2445, 9, 'r34'), (2458, 10, 'r35'), (2471, 11, 'r36'), (2484, 12, 'r37'), (2497, 13, 'r38'), (2510, 14, 'r39'), (2523, 15, 'r40'), (2536, 16, 'r0'), (2549, 17, 'r1'), (2562, 18, 'r2'), (2575, 19, 'r3'), (2588, 20, 'r4'), (2601, 21, 'r5'), (2614, 22, 'r6'), (2627, 23, 'r7'), (2640, 24, 'r8'), (2653, 25, 'r9'), (2666, 26, 'r10'), (2679, 27, 'r11'), (2692, 28, 'r12'), (2705, 29, 'r13'), (2718, 30, 'r14'), (2731, 31, 'r15'), (2744, 32, 'r16'), (2757, 33, 'r17'), (2770, 34, 'r18'), (2783, 35, 'r19'), (2796, 36, 'r20'), (2809, 37, 'r21'), (2822, 38, 'r22'), (2835, 39, 'r23'), (2848, 40, 'r24'), (2861, 41, 'r25'), (2874, 42, 'r26'), (2887, 43, 'r27'), (2900, 44, 'r28'), (2913, 45, 'r29'), (2926, 46, 'r30'), (2939, 47, 'r31'), (2952, 48, 'r32'), (2965, 49, 'r33'), (2978, 50, 'r34'), (2991, 51, 'r35'), (3004, 52, 'r36'), (3017, 0, 'r37'), (3030, 1, 'r38'), (3043, 2, 'r39'), (3056, 3, 'r40'), (3069, 4, 'r0'), (3082, 5, 'r1'), (3095, 6, 'r2'), (3108, 7, 'r3'), (3121, 8, 'r4'), (3134, 9, 'r5'), (3147, 10, 'r6'), (3160, 11, 'r7'), (3173, 12, 'r8'), (3186, 13, 'r9'), (3199, 14, 'r10'), (3212, 15, 'r11'), (3225, 16, 'r12'), (3238, 17, 'r13'), (3251, 18, 'r14'), (3264, 19, 'r15'), (3277, 20, 'r16'), (3290, 21, 'r17'), (3303, 22, 'r18'), (3316, 23, 'r19'), (3329, 24, 'r20'), (3342, 25, 'r21'), (3355, 26, 'r22'), (3368, 27, 'r23'), (3381, 28, 'r24'), (3394, 29, 'r25'), (3407, 30, 'r26'), (3420, 31, 'r27'), (3433, 32, 'r28'), (3446, 33, 'r29'), (3459, 34, 'r30'), (3472, 35, 'r31'), (3485, 36, 'r32'), (3498, 37, 'r33'), (3511, 38, 'r34'), (3524, 39, 'r35'), (3537, 40, 'r36'), (3550, 41, 'r37'), (3563, 42, 'r38'), (3576, 43, 'r39'), (3589, 44, 'r40'), (3602, 45, 'r0'), (3615, 46, 'r1'), (3628, 47, 'r2'), (3641, 48, 'r3'), (3654, 49, 'r4'), (3667, 50, 'r5'), (3680, 51, 'r6'), (3693, 52, 'r7'), (3706, 0, 'r8'), (3719, 1, 'r9'), (3732, 2, 'r10'), (3745, 3, 'r11'), (3758, 4, 'r12'), (3771, 5, 'r13'), (3784, 6, 'r14'), (3797, 7, 'r15'), (3810, 8, 'r16'), (3823, 9, 'r17'), (3836, 10, 'r18'), (3849, 11, 'r19'), (3862, 12, 'r20'), (3875, 13, 'r21'), (3888, 14, 'r22'), (3901, 15, 'r23'), (3914, 16, 'r24'), (3927, 17, 'r25'), (3940, 18, 'r26'), (3953, 19, 'r27'), (3966, 20, 'r28'), (3979, 21, 'r29'), (3992, 22, 'r30'), (4005, 23, 'r31'), (4018, 24, 'r32'), (4031, 25, 'r33'), (4044, 26, 'r34'), (4057, 27, 'r35'), (4070, 28, 'r36'), (4083, 29, 'r37'), (4096, 30, 'r38'), (4109, 31, 'r39'), (4122, 32, 'r40'), (4135, 33, 'r0'), (4148, 34, 'r1'), (4161, 35, 'r2'), (4174, 36, 'r3'), (4187, 37, 'r4'), (4200, 38, 'r5'), (4213, 39, 'r6'), (4226, 40, 'r7'), (4239, 41, 'r8'), (4252, 42, 'r9'), (4265, 43, 'r10'), (4278, 44, 'r11'), (4291, 45, 'r12'), (4304, 46, 'r13'), (4317, 47, 'r14'), (4330, 48, 'r15'), (4343, 49, 'r16'), (4356, 50, 'r17'), (4369, 51, 'r18'), (4382, 52, 'r19'), (4395, 0, 'r20'), (4408, 1, 'r21'), (4421, 2, 'r22'), (4434, 3, 'r23'), (4447, 4, 'r24'), (4460, 5, 'r25'), (4473, 6, 'r26'), (4486, 7, 'r27'), (4499, 8, 'r28'), (4512, 9, 'r29'), (4525, 10, 'r30'), (4538, 11, 'r31'), (4551, 12, 'r32'), (4564, 13, 'r33'), (4577, 14, 'r34'), (4590, 15, 'r35'), (4603, 16, 'r36'), (4616, 17, 'r37'), (4629, 18, 'r38'), (4642, 19, 'r39'), (4655, 20, 'r40'), (4668, 21, 'r0'), (4681, 22, 'r1'), (4694, 23, 'r2'), (4707, 24, 'r3'), (4720, 25, 'r4'), (4733, 26, 'r5'), (4746, 27, 'r6'), (4759, 28, 'r7'), (4772, 29, 'r8'), (4785, 30, 'r9'), (4798, 31, 'r10'), (4811, 32, 'r11'), (4824, 33, 'r12'), (4837, 34, 'r13'), (4850, 35, 'r14'), (4863, 36, 'r15'), (4876, 37, 'r16'), (4889, 38, 'r17'), (4902, 39, 'r18'), (4915, 40, 'r19'), (4928, 41, 'r20'), (4941, 42, 'r21'), (4954, 43, 'r22'), (4967, 44, 'r23'), (4980, 45, 'r24'), (4993, 46, 'r25'), (5006, 47, 'r26'), (5019, 48, 'r27'), (5032, 49, 'r28'), (5045, 50, 'r29'), (5058, 51, 'r30'), (5071, 52, 'r31'), (5084, 0, 'r32'), (5097, 1, 'r33'), (5110, 2, 'r34'), (5123, 3, 'r35'), (5136, 4, 'r36'), (5149, 5, 'r37'), (5162, 6, 'r38'), (5175, 7, 'r39'), (5188, 8, 'r40'), (5201, 9, 'r0'), (5214, 10, 'r1'), (5227, 11, 'r2'), (5240, 12, 'r3'), (5253, 13, 'r4'), (5266, 14, 'r5'), (5279, 15, 'r6'), (5292, 16, 'r7'), (5305, 17, 'r8'), (5318, 18, 'r9'), (5331, 19, 'r10'), (5344, 20, 'r11'), (5357, 21, 'r12'), (5370, 22, 'r13'), (5383, 23, 'r14'), (5396, 24, 'r15'), (5409, 25, 'r16'), (5422, 26, 'r17'), (5435, 27, 'r18'), (5448, 28, 'r19'), (5461, 29, 'r20'), (5474, 30, 'r21'), (5487, 31, 'r22'), (5500, 32, 'r23'), (5513, 33, 'r24'), (5526, 34, 'r25'), (5539, 35, 'r26'), (5552, 36, 'r27'), (5565, 37, 'r28'), (5578, 38, 'r29'), (5591, 39, 'r30'), (5604, 40, 'r31'), (5617, 41, 'r32'), (5630, 42, 'r33'), (5643, 43, 'r34'), (5656, 44, 'r35'), (5669, 45, 'r36'), (5682, 46, 'r37'), (5695, 47, 'r38'), (5708, 48, 'r39'), (5721, 49, 'r40'), (5734, 50, 'r0'), (5747, 51, 'r1'), (5760, 52, 'r2'), (5773, 0, 'r3'), (5786, 1, 'r4'), (5799, 2, 'r5'), (5812, 3, 'r6'), (5825, 4, 'r7'), (5838, 5, 'r8'), (5851, 6, 'r9'), (5864, 7, 'r10'), (5877, 8, 'r11'), (5890, 9, 'r12'), (5903, 10, 'r13');
+SET PARALLEL_SCAN ON;
+SELECT A, C FROM R WHERE B * 2 = 6;
+SELECT K, B FROM S WHERE C = 'r5' AND B > 40;
+SELECT R.A, S.K FROM R, S WHERE R.A = S.K AND S.B = 7 AND R.B < 10;
+SELECT C, COUNT(*), SUM(B) FROM R WHERE A >= 1000 GROUP BY C;
+SET PARALLEL_SCAN OFF;
@@ -0,0 +1,60 @@
+import pytest
+import subprocess
+import dataclasses
+
+from ddb.db import DatabaseManager
+from ddb.session import Session
+from ddb.parser import parse_all
+from ddb.storage import LMDBScanPartition
+from ddb.executor import ParallelTableScanPop
+
+testcase_dir = "tests/parallel/"
+T = 1
+
+@pytest.fixture
+def session():
+    # workers open the database by its location, so it must not be removed once created:
+    subprocess.run(['make', 'clean'], check=True)
+    dbm = DatabaseManager(
+        db_dir = DatabaseManager.DEFAULT_DB_DIR,
+        tmp_dir = DatabaseManager.DEFAULT_TMP_DIR
+    )
+    s = Session(dbm)
+    yield s
+    for pool in ParallelTableScanPop.pools.values(): # workers keep the database open
+        pool.shutdown()
+    ParallelTableScanPop.pools.clear()
+    subprocess.run(['make', 'clean'], check=True)
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_parallel_{t_id}", clean=False)
+
+def select(session, capsys, sql):
+    result = list()
+    for parse_tree in parse_all(sql):
+        capsys.readouterr()
+        r = session.request(parse_tree)
+        assert r.error is None, r.error_details
+        if r.response.startswith("SELECT"):
+            result.append(capsys.readouterr().out.split("\n")[1:-1])
+    return result
+
+@pytest.mark.parametrize("num_fresh", [0, 2])
+def test_snapshot_changed(session, capsys, monkeypatch, num_fresh):
+    # parts made stale by a commit after planning are scanned by the operator itself, picking up where workers left off:
+    select(session, capsys, 'CREATE TABLE R(A INT, B INT, C VARCHAR);' +
+           'INSERT INTO R VALUES ' + ', '.join(f"({i}, {i*7%101}, 'r{i%37}')" for i in range(6000)) + ';')
+    query = 'SELECT A, C FROM R WHERE B * 2 < 100;'
+    expected, = select(session, capsys, query)
+    make_partitions = LMDBScanPartition.make_partitions
+    made = list()
+    def make_stale_partitions(cls, *args, **kwargs):
+        partitions = make_partitions(*args, **kwargs)
+        made.extend(partitions)
+        return partitions[:num_fresh] + [ dataclasses.replace(partition, snapshot_id=partition.snapshot_id+1)
+                                          for partition in partitions[num_fresh:] ]
+    monkeypatch.setattr(LMDBScanPartition, 'make_partitions', classmethod(make_stale_partitions))
+    result, = select(session, capsys, 'SET PARALLEL_SCAN ON;' + query + 'SET PARALLEL_SCAN OFF;')
+    assert len(made) > num_fresh, 'scan was not parallelized'
+    assert result == expected
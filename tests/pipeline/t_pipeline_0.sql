@@ -0,0 +1,21 @@
+SET AUTOCOMMIT OFF;
+SET FUSE_PIPELINES ON;
+CREATE TABLE R(X VARCHAR, Y VARCHAR, A INT, B FLOAT);
+INSERT INTO R VALUES
+	('p', 'q', 1, 0.5),
+	('p', 'r', 2, 1.5),
+	('s', 'q', 3, 2.5),
+	('p', 'q', 4, 3.5),
+	('t', 'u', 5, 4.5),
+	('s', 'q', 6, 5.5),
+	('a', 'b', 7, 6.5),
+	('a', 'b', 8, 7.5),
+	('t', 'u', 9, 8.5),
+	('p', 'r', 10, 9.5);
+SELECT X, Y, COUNT(*), SUM(A), SUM(B) FROM R GROUP BY X, Y;
+SELECT X, SUM(A), MAX(B) FROM R WHERE A > 2 GROUP BY X;
+SELECT COUNT(*), SUM(B), MIN(A) FROM R WHERE A > 1;
+SELECT X, A * 2, B + 1.0 FROM R WHERE A > 3 AND B < 9.0;
+SELECT X, Y FROM R WHERE A % 2 = 0 AND B > 1.0;
+SET FUSE_PIPELINES OFF;
+ROLLBACK;
@@ -0,0 +1,26 @@
+import pytest
+
+from ddb.primitives import ValType
+from ddb.metadata import TableMetadata
+from ddb.executor import StatementContext, LiteralTablePop, FilterPop, PipelinePop
+from ddb.executor.aggr import AggrPop
+from ddb.validator.valexpr import RelativeColumnRef, LiteralNumber
+from ddb.validator.valexpr.binary import GT
+from ddb.validator.valexpr.aggr import COUNT, SUM
+
+testcase_dir = "tests/pipeline/"
+T = 1
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_pipeline_{t_id}")
+
+def test_group_keys_with_hyphens():
+    # group values joined by hyphens would be the same for both groups below, so they must be kept apart by value:
+    context = StatementContext(sm=None, mm=None, zm=None, tx=None, tmp_tx=None, tmp_files=None,
+                               tx_sees_committed=True, profile_context=None)
+    rows = [('1', '2-3', 1), ('1-2', '3', 2), ('1', '2-3', 3), ('1-2-3', '', 4), ('1-2', '3', 0)]
+    x, y, a = (RelativeColumnRef(0, i, t) for i, t in enumerate((ValType.VARCHAR, ValType.VARCHAR, ValType.INTEGER)))
+    input = LiteralTablePop(context, 'r', TableMetadata(['x', 'y', 'a'], [ValType.VARCHAR, ValType.VARCHAR, ValType.INTEGER]), rows)
+    aggr = AggrPop(FilterPop(input, GT(a, LiteralNumber(0))), [x, y], [COUNT((LiteralNumber(1), )), SUM((a, ))], None, 0)
+    assert sorted(PipelinePop(aggr).execute()) == [('1', '2-3', 2, 4), ('1-2', '3', 1, 2), ('1-2-3', '', 1, 4)]
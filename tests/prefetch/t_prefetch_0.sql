@@ -0,0 +1,13 @@
+CREATE TABLE R(A INT, B FLOAT, C VARCHAR);
+INSERT INTO R VALUES (0, 0.5, 'p0'), (1, 1.5, 'p1'), (2, 2.5, 'p2'), (3, 3.5, 'p3'), (4, 4.5, 'p4'), (5, 5.5, 'p5'), (6, 6.5, 'p6'), (7, 7.5, 'p7'), (8, 8.5, 'p8'), (9, 9.5, 'p9'), (10, 10.5, 'p10'), (11, 11.5, 'p11'), (12, 12.5, 'p12'), (13, 13.5, 'p13'), (14, 14.5, 'p14'), (15, 15.5, 'p15'), (16, 16.5, 'p16'), (17, 17.5, 'p17'), (18, 18.5, 'p18'), (19, 19.5, 'p19'), (20, 20.5, 'p20'), (21, 21.5, 'p21'), (22, 22.5, 'p22'), (23, 23.5, 'p23'), (24, 24.5, 'p24'), (25, 25.5, 'p25'), (26, 26.5, 'p26'), (27, 27.5, 'p27'), (28, 28.5, 'p28'), (29, 29.5, 'p29'), (30, 30.5, 'p30'), (31, 31.5, 'p0'), (32, 32.5, 'p1'), (33, 33.5, 'p2'), (34, 34.5, 'p3'), (35, 35.5, 'p4'), (36, 36.5, 'p5'), (37, 37.5, 'p6'), (38, 38.5, 'p7'), (39, 39.5, 'p8'), (40, 40.5, 'p9'), (41, 41.5, 'p10'), (42, 42.5, 'p11'), (43, 43.5, 'p12'), (44, 44.5, 'p13'), (45, 45.5, 'p14'), (46, 46.5, 'p15'), (47, 47.5, 'p16'), (48, 48.5, 'p17'), (49, 49.5, 'p18'), (50, 50.5, 'p19'), (51, 51.5, 'p20'), (52, 52.5, 'p21'), (53, 53.5, 'p22'), (54, 54.5, 'p23'), (55, 55.5, 'p24'), (56, 56.5, 'p25'), (57, 57.5, 'p26'), (58, 58.5, 'p27'), (59, 59.5, 'p28'), (60, 60.5, 'p29'), (61, 61.5, 'p30'), (62, 62.5, 'p0'), (63, 63.5, 'p1'), (64, 64.5, 'p2'), (65, 65.5, 'p3'), (66, 66.5, 'p4'), (67, 67.5, 'p5'), (68, 68.5, 'p6'), (69, 69.5, 'p7'), (70, 70.5, 'p8'), (71, 71.5, 'p9'), (72, 72.5, 'p10'), (73, 73.5, 'p11'), (74, 74.5, 'p12'), (75, 75.5, 'p13'), (76, 76.5, 'p14'), (77, 77.5, 'p15'), (78, 78.5, 'p16'), (79, 79.5, 'p17'), (80, 80.5, 'p18'), (81, 81.5, 'p19'), (82, 82.5, 'p20'), (83, 83.5, 'p21'), (84, 84.5, 'p22'), (85, 85.5, 'p23'), (86, 86.5, 'p24'), (87, 87.5, 'p25'), (88, 88.5, 'p26'), (89, 89.5, 'p27'), (90, 90.5, 'p28'), (91, 91.5, 'p29'), (92, 92.5, 'p30'), (93, 93.5, 'p0'), (94, 94.5, 'p1'), (95, 95.5, 'p2'), (96, 96.5, 'p3'), (97, 0.5, 'p4'), (98, 1.5, 'p5'), (99, 2.5, 'p6'), (100, 3.5, 'p7'), (101, 4.5, 'p8'), (102, 5.5, 'p9'), (103, 6.5, 'p10'), (104, 7.5, 'p11'), (105, 8.5, 'p12'), (106, 9.5, 'p13'), (107, 10.5, 'p14'), (108, 11.5, 'p15'), (109, 12.5, 'p16'), (110, 13.5, 'p17'), (111, 14.5, 'p18'), (112, 15.5, 'p19'), (113, 16.5, 'p20'), (114, 17.5, 'p21'), (115, 18.5, 'p22'), (116, 19.5, 'p23'), (117, 20.5, 'p24'), (118, 21.5, 'p25'), (119, 22.5, 'p26'), (120, 23.5, 'p27'), (121, 24.5, 'p28'), (122, 25.5, 'p29'), (123, 26.5, 'p30'), (124, 27.5, 'p0'), (125, 28.5, 'p1'), (126, 29.5, 'p2'), (127, 30.5, 'p3'), (128, 31.5, 'p4'), (129, 32.5, 'p5'), (130, 33.5, 'p6'), (131, 34.5, 'p7'), (132, 35.5, 'p8'), (133, 36.5, 'p9'), (134, 37.5, 'p10'), (135, 38.5, 'p11'), (136, 39.5, 'p12'), (137, 40.5, 'p13'), (138, 41.5, 'p14'), (139, 42.5, 'p15'), (140, 43.5, 'p16'), (141, 44.5, 'p17'), (142, 45.5, 'p18'), (143, 46.5, 'p19'), (144, 47.5, 'p20'), (145, 48.5, 'p21'), (146, 49.5, 'p22'), (147, 50.5, 'p23'), (148, 51.5, 'p24'), (149, 52.5, 'p25'), (150, 53.5, 'p26'), (151, 54.5, 'p27'), (152, 55.5, 'p28'), (153, 56.5, 'p29'), (154, 57.5, 'p30'), (155, 58.5, 'p0'), (156, 59.5, 'p1'), (157, 60.5, 'p2'), (158, 61.5, 'p3'), (159, 62.5, 'p4'), (160, 63.5, 'p5'), (161, 64.5, 'p6'), (162, 65.5, 'p7'), (163, 66.5, 'p8'), (164, 67.5, 'p9'), (165, 68.5, 'p10'), (166, 69.5, 'p11'), (167, 70.5, 'p12'), (168, 71.5, 'p13'), (169, 72.5, 'p14'), (170, 73.5, 'p15'), (171, 74.5, 'p16'), (172, 75.5, 'p17'), (173, 76.5, 'p18'), (174, 77.5, 'p19'), (175, 78.5, 'p20'), (176, 79.5, 'p21'), (177, 80.5, 'p22'), (178, 81.5, 'p23'), (179, 82.5, 'p24'), (180, 83.5, 'p25'), (181, 84.5, 'p26'), (182, 85.5, 'p27'), (183, 86.5, 'p28'), (184, 87.5, 'p29'), (185, 88.5, 'p30'), (186, 89.5, 'p0'), (187, 90.5, 'p1'), (188, 91.5, 'p2'), (189, 92.5, 'p3'), (190, 93.5, 'p4'), (191, 94.5, 'p5'), (192, 95.5, 'p6'), (193, 96.5, 'p7'), (194, 0.5, 'p8'), (195, 1.5, 'p9'), (196, 2.5, 'p10'), (197, 3.5, 'p11'), (198, 4.5, 'p12'), (199, 5.5, 'p13'), (200, 6.5, 'p14'), (201, 7.5, 'p15'), (202, 8.5, 'p16'), (203, 9.5, 'p17'), (204, 10.5, 'p18'), (205, 11.5, 'p19'), (206, 12.5, 'p20'), (207, 13.5, 'p21'), (208, 14.5, 'p22'), (209, 15.5, 'p23'), (210, 16.5, 'p24'), (211, 17.5, 'p25'), (212, 18.5, 'p26'), (213, 19.5, 'p27'), (214, 20.5, 'p28'), (215, 21.5, 'p29'), (216, 22.5, 'p30'), (217, 23.5, 'p0'), (218, 24.5, 'p1'), (219, 25.5, 'p2'), (220, 26.5, 'p3'), (221, 27.5, 'p4'), (222, 28.5, 'p5'), (223, 29.5, 'p6'), (224, 30.5, 'p7'), (225, 31.5, 'p8'), (226, 32.5, 'p9'), (227, 33.5, 'p10'), (228, 34.5, 'p11'), (229, 35.5, 'p12'), (230, 36.5, 'p13'), (231, 37.5, 'p14'), (232, 38.5, 'p15'), (233, 39.5, 'p16'), (234, 40.5, 'p17'), (235, 41.5, 'p18'), (236, 42.5, 'p19'), (237, 43.5, 'p20'), (238, 44.5, 'p21'), (239, 45.5, 'p22'), (240, 46.5, 'p23'), (241, 47.5, 'p24'), (242, 48.5, 'p25'), (243, 49.5, 'p26'), (244, 50.5, 'p27'), (245, 51.5, 'p28'), (246, 52.5, 'p29'), (247, 53.5, 'p30'), (248, 54.5, 'p0'), (249, 55.5, 'p1'), (250, 56.5, 'p2'), (251, 57.5, 'p3'), (252, 58.5, 'p4'), (253, 59.5, 'p5'), (254, 60.5, 'p6'), (255, 61.5, 'p7'), (256, 62.5, 'p8'), (257, 63.5, 'p9'), (258, 64.5, 'p10'), (259, 65.5, 'p11'), (260, 66.5, 'p12'), (261, 67.5, 'p13'), (262, 68.5, 'p14'), (263, 69.5, 'p15'), (264, 70.5, 'p16'), (265, 71.5, 'p17'), (266, 72.5, 'p18'), (267, 73.5, 'p19'), (268, 74.5, 'p20'), (269, 75.5, 'p21'), (270, 76.5, 'p22'), (271, 77.5, 'p23'), (272, 78.5, 'p24'), (273, 79.5, 'p25'), (274, 80.5, 'p26'), (275, 81.5, 'p27'), (276, 82.5, 'p28'), (277, 83.5, 'p29'), (278, 84.5, 'p30'), (279, 85.5, 'p0'), (280, 86.5, 'p1'), (281, 87.5, 'p2'), (282, 88.5, 'p3'), (283, 89.5, 'p4'), (284, 90.5, 'p5'), (285, 91.5, 'p6'), (286, 92.5, 'p7'), (287, 93.5, 'p8'), (288, 94.5, 'p9'), (289, 95.5, 'p10'), (290, 96.5, 'p11'), (291, 0.5, 'p12'), (292, 1.5, 'p13'), (293, 2.5, 'p14'), (294, 3.5, 'p15'), (295, 4.5, 'p16'), (296, 5.5, 'p17'), (297, 6.5, 'p18'), (298, 7.5, 'p19'), (299, 8.5, 'p20'), (300, 9.5, 'p21'), (301, 10.5, 'p22'), (302, 11.5, 'p23'), (303, 12.5, 'p24'), (304, 13.5, 'p25'), (305, 14.5, 'p26'), (306, 15.5, 'p27'), (307, 16.5, 'p28'), (308, 17.5, 'p29'), (309, 18.5, 'p30'), (310, 19.5, 'p0'), (311, 20.5, 'p1'), (312, 21.5, 'p2'), (313, 22.5, 'p3'), (314, 23.5, 'p4'), (315, 24.5, 'p5'), (316, 25.5, 'p6'), (317, 26.5, 'p7'), (318, 27.5, 'p8'), (319, 28.5, 'p9'), (320, 29.5, 'p10'), (321, 30.5, 'p11'), (322, 31.5, 'p12'), (323, 32.5, 'p13'), (324, 33.5, 'p14'), (325, 34.5, 'p15'), (326, 35.5, 'p16'), (327, 36.5, 'p17'), (328, 37.5, 'p18'), (329, 38.5, 'p19'), (330, 39.5, 'p20'), (331, 40.5, 'p21'), (332, 41.5, 'p22'), (333, 42.5, 'p23'), (334, 43.5, 'p24'), (335, 44.5, 'p25'), (336, 45.5, 'p26'), (337, 46.5, 'p27'), (338, 47.5, 'p28'), (339, 48.5, 'p29'), (340, 49.5, 'p30'), (341, 50.5, 'p0'), (342, 51.5, 'p1'), (343, 52.5, 'p2'), (344, 53.5, 'p3'), (345, 54.5, 'p4'), (346, 55.5, 'p5'), (347, 56.5, 'p6'), (348, 57.5, 'p7'), (349, 58.5, 'p8'), (350, 59.5, 'p9'), (351, 60.5, 'p10'), (352, 61.5, 'p11'), (353, 62.5, 'p12'), (354, 63.5, 'p13'), (355, 64.5, 'p14'), (356, 65.5, 'p15'), (357, 66.5, 'p16'), (358, 67.5, 'p17'), (359, 68.5, 'p18'), (360, 69.5, 'p19'), (361, 70.5, 'p20'), (362, 71.5, 'p21'), (363, 72.5, 'p22'), (364, 73.5, 'p23'), (365, 74.5, 'p24'), (366, 75.5, 'p25'), (367, 76.5, 'p26'), (368, 77.5, 'p27'), (369, 78.5, 'p28'), (370, 79.5, 'p29'), (371, 80.5, 'p30'), (372, 81.5, 'p0'), (373, 82.5, 'p1'), (374, 83.5, 'p2'), (375, 84.5, 'p3'), (376, 85.5, 'p4'), (377, 86.5, 'p5'), (378, 87.5, 'p6'), (379, 88.5, 'p7'), (380, 89.5, 'p8'), (381, 90.5, 'p9'), (382, 91.5, 'p10'), (383, 92.5, 'p11'), (384, 93.5, 'p12'), (385, 94.5, 'p13'), (386, 95.5, 'p14'), (387, 96.5, 'p15'), (388, 0.5, 'p16'), (389, 1.5, 'p17'), (390, 2.5, 'p18'), (391, 3.5, 'p19'), (392, 4.5, 'p20'), (393, 5.5, 'p21'), (394, 6.5, 'p22'), (395, 7.5, 'p23'), (396, 8.5, 'p24'), (397, 9.5, 'p25'), (398, 10.5, 'p26'), (399, 11.5, 'p27'), (400, 12.5, 'p28'), (401, 13.5, 'p29'), (402, 14.5, 'p30'), (403, 15.5, 'p0'), (404, 16.5, 'p1'), (405, 17.5, 'p2'), (406, 18.5, 'p3'), (407, 19.5, 'p4'), (408, 20.5, 'p5'), (409, 21.5, 'p6'), (410, 22.5, 'p7'), (411, 23.5, 'p8'), (412, 24.5, 'p9'), (413, 25.5, 'p10'), (414, 26.5, 'p11'), (415, 27.5, 'p12'), (416, 28.5, 'p13'), (417, 29.5, 'p14'), (418, 30.5, 'p15'), (419, 31.5, 'p16'), (420, 32.5, 'p17'), (421, 33.5, 'p18'), (422, 34.5, 'p19'), (423, 35.5, 'p20'), (424, 36.5, 'p21'), (425, 37.5, 'p22'), (426, 38.5, 'p23'), (427, 39.5, 'p24'), (428, 40.5, 'p25'), (429, 41.5, 'p26'), (430, 42.5, 'p27'), (431, 43.5, 'p28'), (432, 44.5, 'p29'), (433, 45.5, 'p30'), (434, 46.5, 'p0'), (435, 47.5, 'p1'), (436, 48.5, 'p2'), (437, 49.5, 'p3'), (438, 50.5, 'p4'), (439, 51.5, 'p5'), (440, 52.5, 'p6'), (441, 53.5, 'p7'), (442, 54.5, 'p8'), (443, 55.5, 'p9'), (444, 56.5, 'p10'), (445, 57.5, 'p11'), (446, 58.5, 'p12'), (447, 59.5, 'p13'), (448, 60.5, 'p14'), (449, 61.5, 'p15'), (450, 62.5, 'p16'), (451, 63.5, 'p17'), (452, 64.5, 'p18'), (453, 65.5, 'p19'), (454, 66.5, 'p20'), (455, 67.5, 'p21'), (456, 68.5, 'p22'), (457, 69.5, 'p23'), (458, 70.5, 'p24'), (459, 71.5, 'p25'), (460, 72.5, 'p26'), (461, 73.5, 'p27'), (462, 74.5, 'p28'), (463, 75.5, 'p29'), (464, 76.5, 'p30'), (465, 77.5, 'p0'), (466, 78.5, 'p1'), (467, 79.5, 'p2'), (468, 80.5, 'p3'), (469, 81.5, 'p4'), (470, 82.5, 'p5'), (471, 83.5, 'p6'), (472, 84.5, 'p7'), (473, 85.5, 'p8'), (474, 86.5, 'p9'), (475, 87.5, 'p10'), (476, 88.5, 'p11'), (477, 89.5, 'p12'), (478, 90.5, 'p13'), (479, 91.5, 'p14'), (480, 92.5, 'p15'), (481, 93.5, 'p16'), (482, 94.5, 'p17'), (483, 95.5, 'p18'), (484, 96.5, 'p19'), (485, 0.5, 'p20'), (486, 1.5, 'p21'), (487, 2.5, 'p22'), (488, 3.5, 'p23'), (489, 4.5, 'p24'), (490, 5.5, 'p25'), (491, 6.5, 'p26'), (492, 7.5, 'p27'), (493, 8.5, 'p28'), (494, 9.5, 'p29'), (495, 10.5, 'p30'), (496, 11.5, 'p0'), (497, 12.5, 'p1'), (498, 13.5, 'p2'), (499, 14.5, 'p3'), (500, 15.5, 'p4'), (501, 16.5, 'p5'), (502, 17.5, 'p6'), (503, 18.5, 'p7'), (504, 19.5, 'p8'), (505, 20.5, 'p9'), (506, 21.5, 'p10'), (507, 22.5, 'p11'), (508, 23.5, 'p12'), (509, 24.5, 'p13'), (510, 25.5, 'p14'), (511, 26.5, 'p15'), (512, 27.5, 'p16'), (513, 28.5, 'p17'), (514, 29.5, 'p18'), (515, 30.5, 'p19'), (516, 31.5, 'p20'), (517, 32.5, 'p21'), (518, 33.5, 'p22'), (519, 34.5, 'p23'), (520, 35.5, 'p24'), (521, 36.5, 'p25'), (522, 37.5, 'p26'), (523, 38.5, 'p27'), (524, 39.5, 'p28'), (525, 40.5, 'p29'), (526, 41.5, 'p30'), (527, 42.5, 'p0'), (528, 43.5, 'p1'), (529, 44.5, 'p2'), (530, 45.5, 'p3'), (531, 46.5, 'p4'), (532, 47.5, 'p5'), (533, 48.5, 'p6'), (534, 49.5, 'p7'), (535, 50.5, 'p8'), (536, 51.5, 'p9'), (537, 52.5, 'p10'), (538, 53.5, 'p11'), (539, 54.5, 'p12'), (540, 55.5, 'p13'), (541, 56.5, 'p14'), (542, 57.5, 'p15'), (543, 58.5, 'p16'), (544, 59.5, 'p17'), (545, 60.5, 'p18'), (546, 61.5, 'p19'), (547, 62.5, 'p20'), (548, 63.5, 'p21'), (549, 64.5, 'p22'), (550, 65.5, 'p23'), (551, 66.5, 'p24'), (552, 67.5, 'p25'), (553, 68.5, 'p26'), (554, 69.5, 'p27'), (555, 70.5, 'p28'), (556, 71.5, 'p29'), (557, 72.5, 'p30'), (558, 73.5, 'p0'), (559, 74.5, 'p1'), (560, 75.5, 'p2'), (561, 76.5, 'p3'), (562, 77.5, 'p4'), (563, 78.5, 'p5'), (564, 79.5, 'p6'), (565, 80.5, 'p7'), (566, 81.5, 'p8'), (567, 82.5, 'p9'), (568, 83.5, 'p10'), (569, 84.5, 'p11'), (570, 85.5, 'p12'), (571, 86.5, 'p13'), (572, 87.5, 'p14'), (573, 88.5, 'p15'), (574, 89.5, 'p16'), (575, 90.5, 'p17'), (576, 91.5, 'p18'), (577, 92.5, 'p19'), (578, 93.5, 'p20'), (579, 94.5, 'p21'), (580, 95.5, 'p22'), (581, 96.5, 'p23'), (582, 0.5, 'p24'), (583, 1.5, 'p25'), (584, 2.5, 'p26'), (585, 3.5, 'p27'), (586, 4.5, 'p28'), (587, 5.5, 'p29'), (588, 6.5, 'p30'), (589, 7.5, 'p0'), (590, 8.5, 'p1'), (591, 9.5, 'p2'), (592, 10.5, 'p3'), (593, 11.5, 'p4'), (594, 12.5, 'p5'), (595, 13.5, 'p6'), (596, 14.5, 'p7'), (597, 15.5, 'p8'), (598, 16.5, 'p9'), (599, 17.5, 'p10'), (600, 18.5, 'p11'), (601, 19.5, 'p12'), (602, 20.5, 'p13'), (603, 21.5, 'p14'), (604, 22.5, 'p15'), (605, 23.5, 'p16'), (606, 24.5, 'p17'), (607, 25.5, 'p18'), (608, 26.5, 'p19'), (609, 27.5, 'p20'), (610, 28.5, 'p21'), (611, 29.5, 'p22'), (612, 30.5, 'p23'), (613, 31.5, 'p24'), (614, 32.5, 'p25'), (615, 33.5, 'p26'), (616, 34.5, 'p27'), (617, 35.5, 'p28'), (618, 36.5, 'p29'), (619, 37.5, 'p30'), (620, 38.5, 'p0'), (621, 39.5, 'p1'), (622, 40.5, 'p2'), (623, 41.5, 'p3'), (624, 42.5, 'p4'), (625, 43.5, 'p5'), (626, 44.5, 'p6'), (627, 45.5, 'p7'), (628, 46.5, 'p8'), (629, 47.5, 'p9'), (630, 48.5, 'p10'), (631, 49.5, 'p11'), (632, 50.5, 'p12'), (633, 51.5, 'p13'), (634, 52.5, 'p14'), (635, 53.5, 'p15'), (636, 54.5, 'p16'), (637, 55.5, 'p17'), (638, 56.5, 'p18'), (639, 57.5, 'p19'), (640, 58.5, 'p20'), (641, 59.5, 'p21'), (642, 60.5, 'p22'), (643, 61.5, 'p23'), (644, 62.5, 'p24'), (645, 63.5, 'p25'), (646, 64.5, 'p26'), (647, 65.5, 'p27'), (648, 66.5, 'p28'), (649, 67.5, 'p29'), (650, 68.5, 'p30'), (651, 69.5, 'p0'), (652, 70.5, 'p1'), (653, 71.5, 'p2'), (654, 72.5, 'p3'), (655, 73.5, 'p4'), (656, 74.5, 'p5'), (657, 75.5, 'p6'), (658, 76.5, 'p7'), (659, 77.5, 'p8'), (660, 78.5, 'p9'), (661, 79.5, 'p10'), (662, 80.5, 'p11'), (663, 81.5, 'p12'), (664, 82.5, 'p13'), (665, 83.5, 'p14'), (666, 84.5, 'p15'), (667, 85.5, 'p16'), (668, 86.5, 'p17'), (669, 87.5, 'p18'), (670, 88.5, 'p19'), (671, 89.5, 'p20'), (672, 90.5, 'p21'), (673, 91.5, 'p22'), (674, 92.5, 'p23'), (675, 93.5, 'p24'), (676, 94.5, 'p25'), (677, 95.5, 'p26'), (678, 96.5, 'p27'), (679, 0.5, 'p28'), (680, 1.5, 'p29'), (681, 2.5, 'p30'), (682, 3.5, 'p0'), (683, 4.5, 'p1'), (684, 5.5, 'p2'), (685, 6.5, 'p3'), (686, 7.5, 'p4'), (687, 8.5, 'p5'), (688, 9.5, 'p6'), (689, 10.5, 'p7'), (690, 11.5, 'p8'), (691, 12.5, 'p9'), (692, 13.5, 'p10'), (693, 14.5, 'p11'), (694, 15.5, 'p12'), (695, 16.5, 'p13'), (696, 17.5, 'p14'), (697, 18.5, 'p15'), (698, 19.5, 'p16'), (699, 20.5, 'p17'), (700, 21.5, 'p18'), (701, 22.5, 'p19'), (702, 23.5, 'p20'), (703, 24.5, 'p21'), (704, 25.5, 'p22'), (705, 26.5, 'p23'), (706, 27.5, 'p24'), (707, 28.5, 'p25'), (708, 29.5, 'p26'), (709, 30.5, 'p27'), (710, 31.5, 'p28'), (711, 32.5, 'p29'), (712, 33.5, 'p30'), (713, 34.5, 'p0'), (714, 35.5, 'p1'), (715, 36.5, 'p2'), (716, 37.5, 'p3'), (717, 38.5, 'p4'), (718, 39.5, 'p5'), (719, 40.5, 'p6'), (720, 41.5, 'p7'), (721, 42.5, 'p8'), (722, 43.5, 'p9'), (723, 44.5, 'p10'), (724, 45.5, 'p11'), (725, 46.5, 'p12'), (726, 47.5, 'p13'), (727, 48.5, 'p14'), (728, 49.5, 'p15'), (729, 50.5, 'p16'), (730, 51.5, 'p17'), (731, 52.5, 'p18'), (732, 53.5, 'p19'), (733, 54.5, 'p20'), (734, 55.5, 'p21'), (735, 56.5, 'p22'), (736, 57.5, 'p23'), (737, 58.5, 'p24'), (738, 59.5, 'p25'), (739, 60.5, 'p26'), (740, 61.5, 'p27'), (741, 62.5, 'p28'), (742, 63.5, 'p29'), (743, 64.5, 'p30'), (744, 65.5, 'p0'), (745, 66.5, 'p1'), (746, 67.5, 'p2'), (747, 68.5, 'p3'), (748, 69.5, 'p4'), (749, 70.5, 'p5'), (750, 71.5, 'p6'), (751, 72.5, 'p7'), (752, 73.5, 'p8'), (753, 74.5, 'p9'), (754, 75.5, 'p10'), (755, 76.5, 'p11'), (756, 77.5, 'p12'), (757, 78.5, 'p13'), (758, 79.5, 'p14'), (759, 80.5, 'p15'), (760, 81.5, 'p16'), (761, 82.5, 'p17'), (762, 83.5, 'p18'), (763, 84.5, 'p19'), (764, 85.5, 'p20'), (765, 86.5, 'p21'), (766, 87.5, 'p22'), (767, 88.5, 'p23'), (768, 89.5, 'p24'), (769, 90.5, 'p25'), (770, 91.5, 'p26'), (771, 92.5, 'p27'), (772, 93.5, 'p28'), (773, 94.5, 'p29'), (774, 95.5, 'p30'), (775, 96.5, 'p0'), (776, 0.5, 'p1'), (777, 1.5, 'p2'), (778, 2.5, 'p3'), (779, 3.5, 'p4'), (780, 4.5, 'p5'), (781, 5.5, 'p6'), (782, 6.5, 'p7'), (783, 7.5, 'p8'), (784, 8.5, 'p9'), (785, 9.5, 'p10'), (786, 10.5, 'p11'), (787, 11.5, 'p12'), (788, 12.5, 'p13'), (789, 13.5, 'p14'), (790, 14.5, 'p15'), (791, 15.5, 'p16'), (792, 16.5, 'p17'), (793, 17.5, 'p18'), (794, 18.5, 'p19'), (795, 19.5, 'p20'), (796, 20.5, 'p21'), (797, 21.5, 'p22'), (798, 22.5, 'p23'), (799, 23.5, 'p24'), (800, 24.5, 'p25'), (801, 25.5, 'p26'), (802, 26.5, 'p27'), (803, 27.5, 'p28'), (804, 28.5, 'p29'), (805, 29.5, 'p30'), (806, 30.5, 'p0'), (807, 31.5, 'p1'), (808, 32.5, 'p2'), (809, 33.5, 'p3'), (810, 34.5, 'p4'), (811, 35.5, 'p5'), (812, 36.5, 'p6'), (813, 37.5, 'p7'), (814, 38.5, 'p8'), (815, 39.5, 'p9'), (816, 40.5, 'p10'), (817, 41.5, 'p11'), (818, 42.5, 'p12'), (819, 43.5, 'p13'), (820, 44.5, 'p14'), (821, 45.5, 'p15'), (822, 46.5, 'p16'), (823, 47.5, 'p17'), (824, 48.5, 'p18'), (825, 49.5, 'p19'), (826, 50.5, 'p20'), (827, 51.5, 'p21'), (828, 52.5, 'p22'), (829, 53.5, 'p23'), (830, 54.5, 'p24'), (831, 55.5, 'p25'), (832, 56.5, 'p26'), (833, 57.5, 'p27'), (834, 58.5, 'p28'), (835, 59.5, 'p29'), (836, 60.5, 'p30'), (837, 61.5, 'p0'), (838, 62.5, 'p1'), (839, 63.5, 'p2'), (840, 64.5, 'p3'), (841, 65.5, 'p4'), (842, 66.5, 'p5'), (843, 67.5, 'p6'), (844, 68.5, 'p7'), (845, 69.5, 'p8'), (846, 70.5, 'p9'), (847, 71.5, 'p10'), (848, 72.5, 'p11'), (849, 73.5, 'p12'), (850, 74.5, 'p13'), (851, 75.5, 'p14'), (852, 76.5, 'p15'), (853, 77.5, 'p16'), (854, 78.5, 'p17'), (855, 79.5, 'p18'), (856, 80.5, 'p19'), (857, 81.5, 'p20'), (858, 82.5, 'p21'), (859, 83.5, 'p22'), (860, 84.5, 'p23'), (861, 85.5, 'p24'), (862, 86.5, 'p25'), (863, 87.5, 'p26'), (864, 88.5, 'p27'), (865, 89.5, 'p28'), (866, 90.5, 'p29'), (867, 91.5, 'p30'), (868, 92.5, 'p0'), (869, 93.5, 'p1'), (870, 94.5, 'p2'), (871, 95.5, 'p3'), (872, 96.5, 'p4'), (873, 0.5, 'p5'), (874, 1.5, 'p6'), (875, 2.5, 'p7'), (876, 3.5, 'p8'), (877, 4.5, 'p9'), (878, 5.5, 'p10'), (879, 6.5, 'p11'), (880, 7.5, 'p12'), (881, 8.5, 'p13'), (882, 9.5, 'p14'), (883, 10.5, 'p15'), (884, 11.5, 'p16'), (885, 12.5, 'p17'), (886, 13.5, 'p18'), (887, 14.5, 'p19'), (888, 15.5, 'p20'), (889, 16.5, 'p21'), (890, 17.5, 'p22'), (891, 18.5, 'p23'), (892, 19.5, 'p24'), (893, 20.5, 'p25'), (894, 21.5, 'p26'), (895, 22.5, 'p27'), (896, 23.5, 'p28'), (897, 24.5, 'p29'), (898, 25.5, 'p30'), (899, 26.5, 'p0'), (900, 27.5, 'p1'), (901, 28.5, 'p2'), (902, 29.5, 'p3'), (903, 30.5, 'p4'), (904, 31.5, 'p5'), (905, 32.5, 'p6'), (906, 33.5, 'p7'), (907, 34.5, 'p8'), (908, 35.5, 'p9'), (909, 36.5, 'p10'), (910, 37.5, 'p11'), (911, 38.5, 'p12'), (912, 39.5, 'p13'), (913, 40.5, 'p14'), (914, 41.5, 'p15'), (915, 42.5, 'p16'), (916, 43.5, 'p17'), (917, 44.5, 'p18'), (918, 45.5, 'p19'), (919, 46.5, 'p20'), (920, 47.5, 'p21'), (921, 48.5, 'p22'), (922, 49.5, 'p23'), (923, 50.5, 'p24'), (924, 51.5, 'p25'), (925, 52.5, 'p26'), (926, 53.5, 'p27'), (927, 54.5, 'p28'), (928, 55.5, 'p29'), (929, 56.5, 'p30'), (930, 57.5, 'p0'), (931, 58.5, 'p1'), (932, 59.5, 'p2'), (933, 60.5, 'p3'), (934, 61.5, 'p4'), (935, 62.5, 'p5'), (936, 63.5, 'p6'), (937, 64.5, 'p7'), (938, 65.5, 'p8'), (939, 66.5, 'p9'), (940, 67.5, 'p10'), (941, 68.5, 'p11'), (942, 69.5, 'p12'), (943, 70.5, 'p13'), (944, 71.5, 'p14'), (945, 72.5, 'p15'), (946, 73.5, 'p16'), (947, 74.5, 'p17'), (948, 75.5, 'p18'), (949, 76.5, 'p19'), (950, 77.5, 'p20'), (951, 78.5, 'p21'), (952, 79.5, 'p22'), (953, 80.5, 'p23'), (954, 81.5, 'p24'), (955, 82.5, 'p25'), (956, 83.5, 'p26'), (957, 84.5, 'p27'), (958, 85.5, 'p28'), (959, 86.5, 'p29'), (960, 87.5, 'p30'), (961, 88.5, 'p0'), (962, 89.5, 'p1'), (963, 90.5, 'p2'), (964, 91.5, 'p3'), (965, 92.5, 'p4'), (966, 93.5, 'p5'), (967, 94.5, 'p6'), (968, 95.5, 'p7'), (969, 96.5, 'p8'), (970, 0.5, 'p9'), (971, 1.5, 'p10'), (972, 2.5, 'p11'), (973, 3.5, 'p12'), (974, 4.5, 'p13'), (975, 5.5, 'p14'), (976, 6.5, 'p15'), (977, 7.5, 'p16'), (978, 8.5, 'p17'), (979, 9.5, 'p18'), (980, 10.5, 'p19'), (981, 11.5, 'p20'), (982, 12.5, 'p21'), (983, 13.5, 'p22'), (984, 14.5, 'p23'), (985, 15.5, 'p24'), (986, 16.5, 'p25'), (987, 17.5, 'p26'), (988, 18.5, 'p27'), (989, 19.5, 'p28'), (990, 20.5, 'p29'), (991, 21.5, 'p30'), (992, 22.5, 'p0'), (993, 23.5, 'p1'), (994, 24.5, 'p2'), (995, 25.5, 'p3'), (996, 26.5, 'p4'), (997, 27.5, 'p5'), (998, 28.5, 'p6'), (999, 29.5, 'p7'), (1000, 30.5, 'p8'), (1001, 31.5, 'p9'), (1002, 32.5, 'p10'), (1003, 33.5, 'p11'), (1004, 34.5, 'p12'), (1005, 35.5, 'p13'), (1006, 36.5, 'p14'), (1007, 37.5, 'p15'), (1008, 38.5, 'p16'), (1009, 39.5, 'p17'), (1010, 40.5, 'p18'), (1011, 41.5, 'p19'), (1012, 42.5, 'p20'), (1013, 43.5, 'p21'), (1014, 44.5, 'p22'), (1015, 45.5, 'p23'), (1016, 46.5, 'p24'), (1017, 47.5, 'p25'), (1018, 48.5, 'p26'), (1019, 49.5, 'p27'), (1020, 50.5, 'p28'), (1021, 51.5, 'p29'), (1022, 52.5, 'p30'), (1023, 53.5, 'p0'), (1024, 54.5, 'p1'), (1025, 55.5, 'p2'), (1026, 56.5, 'p3'), (1027, 57.5, 'p4'), (1028, 58.5, 'p5'), (1029, 59.5, 'p6'), (1030, 60.5, 'p7'), (1031, 61.5, 'p8'), (1032, 62.5, 'p9'), (1033, 63.5, 'p10'), (1034, 64.5, 'p11'), (1035, 65.5, 'p12'), (1036, 66.5, 'p13'), (1037, 67.5, 'p14'), (1038, 68.5, 'p15'), (1039, 69.5, 'p16'), (1040, 70.5, 'p17'), (1041, 71.5, 'p18'), (1042, 72.5, 'p19'), (1043, 73.5, 'p20'), (1044, 74.5, 'p21'), (1045, 75.5, 'p22'), (1046, 76.5, 'p23'), (1047, 77.5, 'p24'), (1048, 78.5, 'p25'), (1049, 79.5, 'p26'), (1050, 80.5, 'p27'), (1051, 81.5, 'p28'), (1052, 82.5, 'p29'), (1053, 83.5, 'p30'), (1054, 84.5, 'p0'), (1055, 85.5, 'p1'), (1056, 86.5, 'p2'), (1057, 87.5, 'p3'), (1058, 88.5, 'p4'), (1059, 89.5, 'p5'), (1060, 90.5, 'p6'), (1061, 91.5, 'p7'), (1062, 92.5, 'p8'), (1063, 93.5, 'p9'), (1064, 94.5, 'p10'), (1065, 95.5, 'p11'), (1066, 96.5, 'p12'), (1067, 0.5, 'p13'), (1068, 1.5, 'p14'), (1069, 2.5, 'p15'), (1070, 3.5, 'p16'), (1071, 4.5, 'p17'), (1072, 5.5, 'p18'), (1073, 6.5, 'p19'), (1074, 7.5, 'p20'), (1075, 8.5, 'p21'), (1076, 9.5, 'p22'), (1077, 10.5, 'p23'), (1078, 11.5, 'p24'), (1079, 12.5, 'p25'), (1080, 13.5, 'p26'), (1081, 14.5, 'p27'), (1082, 15.5, 'p28'), (1083, 16.5, 'p29'), (1084, 17.5, 'p30'), (1085, 18.5, 'p0'), (1086, 19.5, 'p1'), (1087, 20.5, 'p2'), (1088, 21.5, 'p3'), (1089, 22.5, 'p4'), (1090, 23.5, 'p5'), (1091, 24.5, 'p6'), (1092, 25.5, 'p7'), (1093, 26.5, 'p8'), (1094, 27.5, 'p9'), (1095, 28.5, 'p10'), (1096, 29.5, 'p11'), (1097, 30.5, 'p12'), (1098, 31.5, 'p13'), (1099, 32.5, 'p14'), (1100, 33.5, 'p15'), (1101, 34.5, 'p16'), (1102, 35.5, 'p17'), (1103, 36.5, 'p18'), (1104, 37.5, 'p19'), (1105, 38.5, 'p20'), (1106, 39.5, 'p21'), (1107, 40.5, 'p22'), (1108, 41.5, 'p23'), (1109, 42.5, 'p24'), (1110, 43.5, 'p25'), (1111, 44.5, 'p26'), (1112, 45.5, 'p27'), (1113, 46.5, 'p28'), (1114, 47.5, 'p29'), (1115, 48.5, 'p30'), (1116, 49.5, 'p0'), (1117, 50.5, 'p1'), (1118, 51.5, 'p2'), (1119, 52.5, 'p3'), (1120, 53.5, 'p4'), (1121, 54.5, 'p5'), (1122, 55.5, 'p6'), (1123, 56.5, 'p7'), (1124, 57.5, 'p8'), (1125, 58.5, 'p9'), (1126, 59.5, 'p10'), (1127, 60.5, 'p11'), (1128, 61.5, 'p12'), (1129, 62.5, 'p13'), (1130, 63.5, 'p14'), (1131, 64.5, 'p15'), (1132, 65.5, 'p16'), (1133, 66.5, 'p17'), (1134, 67.5, 'p18'), (1135, 68.5, 'p19'), (1136, 69.5, 'p20'), (1137, 70.5, 'p21'), (1138, 71.5, 'p22'), (1139, 72.5, 'p23'), (1140, 73.5, 'p24'), (1141, 74.5, 'p25'), (1142, 75.5, 'p26'), (1143, 76.5, 'p27'), (1144, 77.5, 'p28'), (1145, 78.5, 'p29'), (1146, 79.5, 'p30'), (1147, 80.5, 'p0'), (1148, 81.5, 'p1'), (1149, 82.5, 'p2'), (1150, 83.5, 'p3'), (1151, 84.5, 'p4'), (1152, 85.5, 'p5'), (1153, 86.5, 'p6'), (1154, 87.5, 'p7'), (1155, 88.5, 'p8'), (1156, 89.5, 'p9'), (1157, 90.5, 'p10'), (1158, 91.5, 'p11'), (1159, 92.5, 'p12'), (1160, 93.5, 'p13'), (1161, 94.5, 'p14'), (1162, 95.5, 'p15'), (1163, 96.5, 'p16'), (1164, 0.5, 'p17'), (1165, 1.5, 'p18'), (1166, 2.5, 'p19'), (1167, 3.5, 'p20'), (1168, 4.5, 'p21'), (1169, 5.5, 'p22'), (1170, 6.5, 'p23'), (1171, 7.5, 'p24'), (1172, 8.5, 'p25'), (1173, 9.5, 'p26'), (1174, 10.5, 'p27'), (1175, 11.5, 'p28'), (1176, 12.5, 'p29'), (1177, 13.5, 'p30'), (1178, 14.5, 'p0'), (1179, 15.5, 'p1'), (1180, 16.5, 'p2'), (1181, 17.5, 'p3'), (1182, 18.5, 'p4'), (1183, 19.5, 'p5'), (1184, 20.5, 'p6'), (1185, 21.5, 'p7'), (1186, 22.5, 'p8'), (1187, 23.5, 'p9'), (1188, 24.5, 'p10'), (1189, 25.5, 'p11'), (1190, 26.5, 'p12'), (1191, 27.5, 'p13'), (1192, 28.5, 'p14'), (1193, 29.5, 'p15'), (1194, 30.5, 'p16'), (1195, 31.5, 'p17'), (1196, 32.5, 'p18'), (1197, 33.5, 'p19'), (1198, 34.5, 'p20'), (1199, 35.5, 'p21'), (1200, 36.5, 'p22'), (1201, 37.5, 'p23'), (1202, 38.5, 'p24'), (1203, 39.5, 'p25'), (1204, 40.5, 'p26'), (1205, 41.5, 'p27'), (1206, 42.5, 'p28'), (1207, 43.5, 'p29'), (1208, 44.5, 'p30'), (1209, 45.5, 'p0'), (1210, 46.5, 'p1'), (1211, 47.5, 'p2'), (1212, 48.5, 'p3'), (1213, 49.5, 'p4'), (1214, 50.5, 'p5'), (1215, 51.5, 'p6'), (1216, 52.5, 'p7'), (1217, 53.5, 'p8'), (1218, 54.5, 'p9'), (1219, 55.5, 'p10'), (1220, 56.5, 'p11'), (1221, 57.5, 'p12'), (1222, 58.5, 'p13'), (1223, 59.5, 'p14'), (1224, 60.5, 'p15'), (1225, 61.5, 'p16'), (1226, 62.5, 'p17'), (1227, 63.5, 'p18'), (1228, 64.5, 'p19'), (1229, 65.5, 'p20'), (1230, 66.5, 'p21'), (1231, 67.5, 'p22'), (1232, 68.5, 'p23'), (1233, 69.5, 'p24'), (1234, 70.5, 'p25'), (1235, 71.5, 'p26'), (1236, 72.5, 'p27'), (1237, 73.5, 'p28'), (1238, 74.5, 'p29'), (1239, 75.5, 'p30'), (1240, 76.5, 'p0'), (1241, 77.5, 'p1'), (1242, 78.5, 'p2'), (1243, 79.5, 'p3'), (1244, 80.5, 'p4'), (1245, 81.5, 'p5'), (1246, 82.5, 'p6'), (1247, 83.5, 'p7'), (1248, 84.5, 'p8'), (1249, 85.5, 'p9'), (1250, 86.5, 'p10'), (1251, 87.5, 'p11'), (1252, 88.5, 'p12'), (1253, 89.5, 'p13'), (1254, 90.5, 'p14'), (1255, 91.5, 'p15'), (1256, 92.5, 'p16'), (1257, 93.5, 'p17'), (1258, 94.5, 'p18'), (1259, 95.5, 'p19'), (1260, 96.5, 'p20'), (1261, 0.5, 'p21'), (1262, 1.5, 'p22'), (1263, 2.5, 'p23'), (1264, 3.5, 'p24'), (1265, 4.5, 'p25'), (1266, 5.5, 'p26'), (1267, 6.5, 'p27'), (1268, 7.5, 'p28'), (1269, 8.5, 'p29'), (1270, 9.5, 'p30'), (1271, 10.5, 'p0'), (1272, 11.5, 'p1'), (1273, 12.5, 'p2'), (1274, 13.5, 'p3'), (1275, 14.5, 'p4'), (1276, 15.5, 'p5'), (1277, 16.5, 'p6'), (1278, 17.5, 'p7'), (1279, 18.5, 'p8'), (1280, 19.5, 'p9'), (1281, 20.5, 'p10'), (1282, 21.5, 'p11'), (1283, 22.5, 'p12'), (1284, 23.5, 'p13'), (1285, 24.5, 'p14'), (1286, 25.5, 'p15'), (1287, 26.5, 'p16'), (1288, 27.5, 'p17'), (1289, 28.5, 'p18'), (1290, 29.5, 'p19'), (1291, 30.5, 'p20'), (1292, 31.5, 'p21'), (1293, 32.5, 'p22'), (1294, 33.5, 'p23'), (1295, 34.5, 'p24'), (1296, 35.5, 'p25'), (1297, 36.5, 'p26'), (1298, 37.5, 'p27'), (1299, 38.5, 'p28'), (1300, 39.5, 'p29'), (1301, 40.5, 'p30'), (1302, 41.5, 'p0'), (1303, 42.5, 'p1'), (1304, 43.5, 'p2'), (1305, 44.5, 'p3'), (1306, 45.5, 'p4'), (1307, 46.5, 'p5'), (1308, 47.5, 'p6'), (1309, 48.5, 'p7'), (1310, 49.5, 'p8'), (1311, 50.5, 'p9'), (1312, 51.5, 'p10'), (1313, 52.5, 'p11'), (1314, 53.5, 'p12'), (1315, 54.5, 'p13'), (1316, 55.5, 'p14'), (1317, 56.5, 'p15'), (1318, 57.5, 'p16'), (1319, 58.5, 'p17'), (1320, 59.5, 'p18'), (1321, 60.5, 'p19'), (1322, 61.5, 'p20'), (1323, 62.5, 'p21'), (1324, 63.5, 'p22'), (1325, 64.5, 'p23'), (1326, 65.5, 'p24'), (1327, 66.5, 'p25'), (1328, 67.5, 'p26'), (1329, 68.5, 'p27'), (1330, 69.5, 'p28'), (1331, 70.5, 'p29'), (1332, 71.5, 'p30'), (1333, 72.5, 'p0'), (1334, 73.5, 'p1'), (1335, 74.5, 'p2'), (1336, 75.5, 'p3'), (1337, 76.5, 'p4'), (1338, 77.5, 'p5'), (1339, 78.5, 'p6'), (1340, 79.5, 'p7'), (1341, 80.5, 'p8'), (1342, 81.5, 'p9'), (1343, 82.5, 'p10'), (1344, 83.5, 'p11'), (1345, 84.5, 'p12'), (1346, 85.5, 'p13'), (1347, 86.5, 'p14'), (1348, 87.5, 'p15'), (1349, 88.5, 'p16'), (1350, 89.5, 'p17'), (1351, 90.5, 'p18'), (1352, 91.5, 'p19'), (1353, 92.5, 'p20'), (1354, 93.5, 'p21'), (1355, 94.5, 'p22'), (1356, 95.5, 'p23'), (1357, 96.5, 'p24'), (1358, 0.5, 'p25'), (1359, 1.5, 'p26'), (1360, 2.5, 'p27'), (1361, 3.5, 'p28'), (1362, 4.5, 'p29'), (1363, 5.5, 'p30'), (1364, 6.5, 'p0'), (1365, 7.5, 'p1'), (1366, 8.5, 'p2'), (1367, 9.5, 'p3'), (1368, 10.5, 'p4'), (1369, 11.5, 'p5'), (1370, 12.5, 'p6'), (1371, 13.5, 'p7'), (1372, 14.5, 'p8'), (1373, 15.5, 'p9'), (1374, 16.5, 'p10'), (1375, 17.5, 'p11'), (1376, 18.5, 'p12'), (1377, 19.5, 'p13'), (1378, 20.5, 'p14'), (1379, 21.5, 'p15'), (1380, 22.5, 'p16'), (1381, 23.5, 'p17'), (1382, 24.5, 'p18'), (1383, 25.5, 'p19'), (1384, 26.5, 'p20'), (1385, 27.5, 'p21'), (1386, 28.5, 'p22'), (1387, 29.5, 'p23'), (1388, 30.5, 'p24'), (1389, 31.5, 'p25'), (1390, 32.5, 'p26'), (1391, 33.5, 'p27'), (1392, 34.5, 'p28'), (1393, 35.5, 'p29'), (1394, 36.5, 'p30'), (1395, 37.5, 'p0'), (1396, 38.5, 'p1'), (1397, 39.5, 'p2'), (1398, 40.5, 'p3'), (1399, 41.5, 'p4'), (1400, 42.5, 'p5'), (1401, 43.5, 'p6'), (1402, 44.5, 'p7'), (1403, 45.5, 'p8'), (1404, 46.5, 'p9'), (1405, 47.5, 'p10'), (1406, 48.5, 'p11'), (1407, 49.5, 'p12'), (1408, 50.5, 'p13'), (1409, 51.5, 'p14'), (1410, 52.5, 'p15'), (1411, 53.5, 'p16'), (1412, 54.5, 'p17'), (1413, 55.5, 'p18'), (1414, 56.5, 'p19'), (1415, 57.5, 'p20'), (1416, 58.5, 'p21'), (1417, 59.5, 'p22'), (1418, 60.5, 'p23'), (1419, 61.5, 'p24'), (1420, 62.5, 'p25'), (1421, 63.5, 'p26'), (1422, 64.5, 'p27'), (1423, 65.5, 'p28'), (1424, 66.5, 'p29'), (1425, 67.5, 'p30'), (1426, 68.5, 'p0'), (1427, 69.5, 'p1'), (1428, 70.5, 'p2'), (1429, 71.5, 'p3'), (1430, 72.5, 'p4'), (1431, 73.5, 'p5'), (1432, 74.5, 'p6'), (1433, 75.5, 'p7'), (1434, 76.5, 'p8'), (1435, 77.5, 'p9'), (1436, 78.5, 'p10'), (1437, 79.5, 'p11'), (1438, 80.5, 'p12'), (1439, 81.5, 'p13'), (1440, 82.5, 'p14'), (1441, 83.5, 'p15'), (1442, 84.5, 'p16'), (1443, 85.5, 'p17'), (1444, 86.5, 'p18'), (1445, 87.5, 'p19'), (1446, 88.5, 'p20'), (1447, 89.5, 'p21'), (1448, 90.5, 'p22'), (1449, 91.5, 'p23'), (1450, 92.5, 'p24'), (1451, 93.5, 'p25'), (1452, 94.5, 'p26'), (1453, 95.5, 'p27'), (1454, 96.5, 'p28'), (1455, 0.5, 'p29'), (1456, 1.5, 'p30'), (1457, 2.5, 'p0'), (1458, 3.5, 'p1'), (1459, 4.5, 'p2'), (1460, 5.5, 'p3'), (1461, 6.5, 'p4'), (1462, 7.5, 'p5'), (1463, 8.5, 'p6'), (1464, 9.5, 'p7'), (1465, 10.5, 'p8'), (1466, 11.5, 'p9'), (1467, 12.5, 'p10'), (1468, 13.5, 'p11'), (1469, 14.5, 'p12'), (1470, 15.5, 'p13'), (1471, 16.5, 'p14'), (1472, 17.5, 'p15'), (1473, 18.5, 'p16'), (1474, 19.5, 'p17'), (1475, 20.5, 'p18'), (1476, 21.5, 'p19'), (1477, 22.5, 'p20'), (1478, 23.5, 'p21'), (1479, 24.5, 'p22'), (1480, 25.5, 'p23'), (1481, 26.5, 'p24'), (1482, 27.5, 'p25'), (1483, 28.5, 'p26'), (1484, 29.5, 'p27'), (1485, 30.5, 'p28'), (1486, 31.5, 'p29'), (1487, 32.5, 'p30'), (1488, 33.5, 'p0'), (1489, 34.5, 'p1'), (1490, 35.5, 'p2'), (1491, 36.5, 'p3'), (1492, 37.5, 'p4'), (1493, 38.5, 'p5'), (1494, 39.5, 'p6'), (1495, 40.5, 'p7'), (1496, 41.5, 'p8'), (1497, 42.5, 'p9'), (1498, 43.5, 'p10'), (1499, 44.5, 'p11'), (1500, 45.5, 'p12'), (1501, 46.5, 'p13'), (1502, 47.5, 'p14'), (1503, 48.5, 'p15'), (1504, 49.5, 'p16'), (1505, 50.5, 'p17'), (1506, 51.5, 'p18'), (1507, 52.5, 'p19'), (1508, 53.5, 'p20'), (1509, 54.5, 'p21'), (1510, 55.5, 'p22'), (1511, 56.5, 'p23'), (1512, 57.5, 'p24'), (1513, 58.5, 'p25'), (1514, 59.5, 'p26'), (1515, 60.5, 'p27'), (1516, 61.5, 'p28'), (1517, 62.5, 'p29'), (1518, 63.5, 'p30'), (1519, 64.5, 'p0'), (1520, 65.5, 'p1'), (1521, 66.5, 'p2'), (1522, 67.5, 'p3'), (1523, 68.5, 'p4'), (1524, 69.5, 'p5'), (1525, 70.5, 'p6'), (1526, 71.5, 'p7'), (1527, 72.5, 'p8'), (1528, 73.5, 'p9'), (1529, 74.5, 'p10'), (1530, 75.5, 'p11'), (1531, 76.5, 'p12'), (1532, 77.5, 'p13'), (1533, 78.5, 'p14'), (1534, 79.5, 'p15'), (1535, 80.5, 'p16'), (1536, 81.5, 'p17'), (1537, 82.5, 'p18'), (1538, 83.5, 'p19'), (1539, 84.5, 'p20'), (1540, 85.5, 'p21'), (1541, 86.5, 'p22'), (1542, 87.5, 'p23'), (1543, 88.5, 'p24'), (1544, 89.5, 'p25'), (1545, 90.5, 'p26'), (1546, 91.5, 'p27'), (1547, 92.5, 'p28'), (1548, 93.5, 'p29'), (1549, 94.5, 'p30'), (1550, 95.5, 'p0'), (1551, 96.5, 'p1'), (1552, 0.5, 'p2'), (1553, 1.5, 'p3'), (1554, 2.5, 'p4'), (1555, 3.5, 'p5'), (1556, 4.5, 'p6'), (1557, 5.5, 'p7'), (1558, 6.5, 'p8'), (1559, 7.5, 'p9'), (1560, 8.5, 'p10'), (1561, 9.5, 'p11'), (1562, 10.5, 'p12'), (1563, 11.5, 'p13'), (1564, 12.5, 'p14'), (1565, 13.5, 'p15'), (1566, 14.5, 'p16'), (1567, 15.5, 'p17'), (1568, 16.5, 'p18'), (1569, 17.5, 'p19'), (1570, 18.5, 'p20'), (1571, 19.5, 'p21'), (1572, 20.5, 'p22'), (1573, 21.5, 'p23'), (1574, 22.5, 'p24'), (1575, 23.5, 'p25'), (1576, 24.5, 'p26'), (1577, 25.5, 'p27'), (1578, 26.5, 'p28'), (1579, 27.5, 'p29'), (1580, 28.5, 'p30'), (1581, 29.5, 'p0'), (1582, 30.5, 'p1'), (1583, 31.5, 'p2'), (1584, 32.5, 'p3'), (1585, 33.5, 'p4'), (1586, 34.5, 'p5'), (1587, 35.5, 'p6'), (1588, 36.5, 'p7'), (1589, 37.5, 'p8'), (1590, 38.5, 'p9'), (1591, 39.5, 'p10'), (1592, 40.5, 'p11'), (1593, 41.5, 'p12'), (1594, 42.5, 'p13'), (1595, 43.5, 'p14'), (1596, 44.5, 'p15'), (1597, 45.5, 'p16'), (1598, 46.5, 'p17'), (1599, 47.5, 'p18'), (1600, 48.5, 'p19'), (1601, 49.5, 'p20'), (1602, 50.5, 'p21'), (1603, 51.5, 'p22'), (1604, 52.5, 'p23'), (1605, 53.5, 'p24'), (1606, 54.5, 'p25'), (1607, 55.5, 'p26'), (1608, 56.5, 'p27'), (1609, 57.5, 'p28'), (1610, 58.5, 'p29'), (1611, 59.5, 'p30'), (1612, 60.5, 'p0'), (1613, 61.5, 'p1'), (1614, 62.5, 'p2'), (1615, 63.5, 'p3'), (1616, 64.5, 'p4'), (1617, 65.5, 'p5'), (1618, 66.5, 'p6'), (1619, 67.5, 'p7'), (1620, 68.5, 'p8'), (1621, 69.5, 'p9'), (1622, 70.5, 'p10'), (1623, 71.5, 'p11'), (1624, 72.5, 'p12'), (1625, 73.5, 'p13'), (1626, 74.5, 'p14'), (1627, 75.5, 'p15'), (1628, 76.5, 'p16'), (1629, 77.5, 'p17'), (1630, 78.5, 'p18'), (1631, 79.5, 'p19'), (1632, 80.5, 'p20'), (1633, 81.5, 'p21'), (1634, 82.5, 'p22'), (1635, 83.5, 'p23'), (1636, 84.5, 'p24'), (1637, 85.5, 'p25'), (1638, 86.5, 'p26'), (1639, 87.5, 'p27'), (1640, 88.5, 'p28'), (1641, 89.5, 'p29'), (1642, 90.5, 'p30'), (1643, 91.5, 'p0'), (1644, 92.5, 'p1'), (1645, 93.5, 'p2'), (1646, 94.5, 'p3'), (1647, 95.5, 'p4'), (1648, 96.5, 'p5'), (1649, 0.5, 'p6'), (1650, 1.5, 'p7'), (1651, 2.5, 'p8'), (1652, 3.5, 'p9'), (1653, 4.5, 'p10'), (1654, 5.5, 'p11'), (1655, 6.5, 'p12'), (1656, 7.5, 'p13'), (1657, 8.5, 'p14'), (1658, 9.5, 'p15'), (1659, 10.5, 'p16'), (1660, 11.5, 'p17'), (1661, 12.5, 'p18'), (1662, 13.5, 'p19'), (1663, 14.5, 'p20'), (1664, 15.5, 'p21'), (1665, 16.5, 'p22'), (1666, 17.5, 'p23'), (1667, 18.5, 'p24'), (1668, 19.5, 'p25'), (1669, 20.5, 'p26'), (1670, 21.5, 'p27'), (1671, 22.5, 'p28'), (1672, 23.5, 'p29'), (1673, 24.5, 'p30'), (1674, 25.5, 'p0'), (1675, 26.5, 'p1'), (1676, 27.5, 'p2'), (1677, 28.5, 'p3'), (1678, 29.5, 'p4'), (1679, 30.5, 'p5'), (1680, 31.5, 'p6'), (1681, 32.5, 'p7'), (1682, 33.5, 'p8'), (1683, 34.5, 'p9'), (1684, 35.5, 'p10'), (1685, 36.5, 'p11'), (1686, 37.5, 'p12'), (1687, 38.5, 'p13'), (1688, 39.5, 'p14'), (1689, 40.5, 'p15'), (1690, 41.5, 'p16'), (1691, 42.5, 'p17'), (1692, 43.5, 'p18'), (1693, 44.5, 'p19'), (1694, 45.5, 'p20'), (1695, 46.5, 'p21'), (1696, 47.5, 'p22'), (1697, 48.5, 'p23'), (1698, 49.5, 'p24'), (1699, 50.5, 'p25'), (1700, 51.5, 'p26'), (1701, 52.5, 'p27'), (1702, 53.5, 'p28'), (1703, 54.5, 'p29'), (1704, 55.5, 'p30'), (1705, 56.5, 'p0'), (1706, 57.5, 'p1'), (1707, 58.5, 'p2'), (1708, 59.5, 'p3'), (1709, 60.5, 'p4'), (1710, 61.5, 'p5'), (1711, 62.5, 'p6'), (1712, 63.5, 'p7'), (1713, 64.5, 'p8'), (1714, 65.5, 'p9'), (1715, 66.5, 'p10'), (1716, 67.5, 'p11'), (1717, 68.5, 'p12'), (1718, 69.5, 'p13'), (1719, 70.5, 'p14'), (1720, 71.5, 'p15'), (1721, 72.5, 'p16'), (1722, 73.5, 'p17'), (1723, 74.5, 'p18'), (1724, 75.5, 'p19'), (1725, 76.5, 'p20'), (1726, 77.5, 'p21'), (1727, 78.5, 'p22'), (1728, 79.5, 'p23'), (1729, 80.5, 'p24'), (1730, 81.5, 'p25'), (1731, 82.5, 'p26'), (1732, 83.5, 'p27'), (1733, 84.5, 'p28'), (1734, 85.5, 'p29'), (1735, 86.5, 'p30'), (1736, 87.5, 'p0'), (1737, 88.5, 'p1'), (1738, 89.5, 'p2'), (1739, 90.5, 'p3'), (1740, 91.5, 'p4'), (1741, 92.5, 'p5'), (1742, 93.5, 'p6'), (1743, 94.5, 'p7'), (1744, 95.5, 'p8'), (1745, 96.5, 'p9'), (1746, 0.5, 'p10'), (1747, 1.5, 'p11'), (1748, 2.5, 'p12'), (1749, 3.5, 'p13'), (1750, 4.5, 'p14'), (1751, 5.5, 'p15'), (1752, 6.5, 'p16'), (1753, 7.5, 'p17'), (1754, 8.5, 'p18'), (1755, 9.5, 'p19'), (1756, 10.5, 'p20'), (1757, 11.5, 'p21'), (1758, 12.5, 'p22'), (1759, 13.5, 'p23'), (1760, 14.5, 'p24'), (1761, 15.5, 'p25'), (1762, 16.5, 'p26'), (1763, 17.5, 'p27'), (1764, 18.5, 'p28'), (1765, 19.5, 'p29'), (1766, 20.5, 'p30'), (1767, 21.5, 'p0'), (1768, 22.5, 'p1'), (1769, 23.5, 'p2'), (1770, 24.5, 'p3'), (1771, 25.5, 'p4'), (1772, 26.5, 'p5'), (1773, 27.5, 'p6'), (1774, 28.5, 'p7'), (1775, 29.5, 'p8'), (1776, 30.5, 'p9'), (1777, 31.5, 'p10'), (1778, 32.5, 'p11'), (1779, 33.5, 'p12'), (1780, 34.5, 'p13'), (1781, 35.5, 'p14'), (1782, 36.5, 'p15'), (1783, 37.5, 'p16'), (1784, 38.5, 'p17'), (1785, 39.5, 'p18'), (1786, 40.5, 'p19'), (1787, 41.5, 'p20'), (1788, 42.5, 'p21'), (1789, 43.5, 'p22'), (1790, 44.5, 'p23'), (1791, 45.5, 'p24'), (1792, 46.5, 'p25'), (1793, 47.5, 'p26'), (1794, 48.5, 'p27'), (1795, 49.5, 'p28'), (1796, 50.5, 'p29'), (1797, 51.5, 'p30'), (1798, 52.5, 'p0'), (1799, 53.5, 'p1'), (1800, 54.5, 'p2'), (1801, 55.5, 'p3'), (1802, 56.5, 'p4'), (1803, 57.5, 'p5'), (1804, 58.5, 'p6'), (1805, 59.5, 'p7'), (1806, 60.5, 'p8'), (1807, 61.5, 'p9'), (1808, 62.5, 'p10'), (1809, 63.5, 'p11'), (1810, 64.5, 'p12'), (1811, 65.5, 'p13'), (1812, 66.5, 'p14'), (1813, 67.5, 'p15'), (1814, 68.5, 'p16'), (1815, 69.5, 'p17'), (1816, 70.5, 'p18'), (1817, 71.5, 'p19'), (1818, 72.5, 'p20'), (1819, 73.5, 'p21'), (1820, 74.5, 'p22'), (1821, 75.5, 'p23'), (1822, 76.5, 'p24'), (1823, 77.5, 'p25'), (1824, 78.5, 'p26'), (1825, 79.5, 'p27'), (1826, 80.5, 'p28'), (1827, 81.5, 'p29'), (1828, 82.5, 'p30'), (1829, 83.5, 'p0'), (1830, 84.5, 'p1'), (1831, 85.5, 'p2'), (1832, 86.5, 'p3'), (1833, 87.5, 'p4'), (1834, 88.5, 'p5'), (1835, 89.5, 'p6'), (1836, 90.5, 'p7'), (1837, 91.5, 'p8'), (1838, 92.5, 'p9'), (1839, 93.5, 'p10'), (1840, 94.5, 'p11'), (1841, 95.5, 'p12'), (1842, 96.5, 'p13'), (1843, 0.5, 'p14'), (1844, 1.5, 'p15'), (1845, 2.5, 'p16'), (1846, 3.5, 'p17'), (1847, 4.5, 'p18'), (1848, 5.5, 'p19'), (1849, 6.5, 'p20'), (1850, 7.5, 'p21'), (1851, 8.5, 'p22'), (1852, 9.5, 'p23'), (1853, 10.5, 'p24'), (1854, 11.5, 'p25'), (1855, 12.5, 'p26'), (1856, 13.5, 'p27'), (1857, 14.5, 'p28'), (1858, 15.5, 'p29'), (1859, 16.5, 'p30'), (1860, 17.5, 'p0'), (1861, 18.5, 'p1'), (1862, 19.5, 'p2'), (1863, 20.5, 'p3'), (1864, 21.5, 'p4'), (1865, 22.5, 'p5'), (1866, 23.5, 'p6'), (1867, 24.5, 'p7'), (1868, 25.5, 'p8'), (1869, 26.5, 'p9'), (1870, 27.5, 'p10'), (1871, 28.5, 'p11'), (1872, 29.5, 'p12'), (1873, 30.5, 'p13'), (1874, 31.5, 'p14'), (1875, 32.5, 'p15'), (1876, 33.5, 'p16'), (1877, 34.5, 'p17'), (1878, 35.5, 'p18'), (1879, 36.5, 'p19'), (1880, 37.5, 'p20'), (1881, 38.5, 'p21'), (1882, 39.5, 'p22'), (1883, 40.5, 'p23'), (1884, 41.5, 'p24'), (1885, 42.5, 'p25'), (1886, 43.5, 'p26'), (1887, 44.5, 'p27'), (1888, 45.5, 'p28'), (1889, 46.5, 'p29'), (1890, 47.5, 'p30'), (1891, 48.5, 'p0'), (1892, 49.5, 'p1'), (1893, 50.5, 'p2'), (1894, 51.5, 'p3'), (1895, 52.5, 'p4'), (1896, 53.5, 'p5'), (1897, 54.5, 'p6'), (1898, 55.5, 'p7'), (1899, 56.5, 'p8'), (1900, 57.5, 'p9'), (1901, 58.5, 'p10'), (1902, 59.5, 'p11'), (1903, 60.5, 'p12'), (1904, 61.5, 'p13'), (1905, 62.5, 'p14'), (1906, 63.5, 'p15'), (1907, 64.5, 'p16'), (1908, 65.5, 'p17'), (1909, 66.5, 'p18'), (1910, 67.5, 'p19'), (1911, 68.5, 'p20'), (1912, 69.5, 'p21'), (1913, 70.5, 'p22'), (1914, 71.5, 'p23'), (1915, 72.5, 'p24'), (1916, 73.5, 'p25'), (1917, 74.5, 'p26'), (1918, 75.5, 'p27'), (1919, 76.5, 'p28'), (1920, 77.5, 'p29'), (1921, 78.5, 'p30'), (1922, 79.5, 'p0'), (1923, 80.5, 'p1'), (1924, 81.5, 'p2'), (1925, 82.5, 'p3'), (1926, 83.5, 'p4'), (1927, 84.5, 'p5'), (1928, 85.5, 'p6'), (1929, 86.5, 'p7'), (1930, 87.5, 'p8'), (1931, 88.5, 'p9'), (1932, 89.5, 'p10'), (1933, 90.5, 'p11'), (1934, 91.5, 'p12'), (1935, 92.5, 'p13'), (1936, 93.5, 'p14'), (1937, 94.5, 'p15'), (1938, 95.5, 'p16'), (1939, 96.5, 'p17'), (1940, 0.5, 'p18'), (1941, 1.5, 'p19'), (1942, 2.5, 'p20'), (1943, 3.5, 'p21'), (1944, 4.5, 'p22'), (1945, 5.5, 'p23'), (1946, 6.5, 'p24'), (1947, 7.5, 'p25'), (1948, 8.5, 'p26'), (1949, 9.5, 'p27'), (1950, 10.5, 'p28'), (1951, 11.5, 'p29'), (1952, 12.5, 'p30'), (1953, 13.5, 'p0'), (1954, 14.5, 'p1'), (1955, 15.5, 'p2'), (1956, 16.5, 'p3'), (1957, 17.5, 'p4'), (1958, 18.5, 'p5'), (1959, 19.5, 'p6'), (1960, 20.5, 'p7'), (1961, 21.5, 'p8'), (1962, 22.5, 'p9'), (1963, 23.5, 'p10'), (1964, 24.5, 'p11'), (1965, 25.5, 'p12'), (1966, 26.5, 'p13'), (1967, 27.5, 'p14'), (1968, 28.5, 'p15'), (1969, 29.5, 'p16'), (1970, 30.5, 'p17'), (1971, 31.5, 'p18'), (1972, 32.5, 'p19'), (1973, 33.5, 'p20'), (1974, 34.5, 'p21'), (1975, 35.5, 'p22'), (1976, 36.5, 'p23'), (1977, 37.5, 'p24'), (1978, 38.5, 'p25'), (1979, 39.5, 'p26'), (1980, 40.5, 'p27'), (1981, 41.5, 'p28'), (1982, 42.5, 'p29'), (1983, 43.5, 'p30'), (1984, 44.5, 'p0'), (1985, 45.5, 'p1'), (1986, 46.5, 'p2'), (1987, 47.5, 'p3'), (1988, 48.5, 'p4'), (1989, 49.5, 'p5'), (1990, 50.5, 'p6'), (1991, 51.5, 'p7'), (1992, 52.5, 'p8'), (1993, 53.5, 'p9'), (1994, 54.5, 'p10'), (1995, 55.5, 'p11'), (1996, 56.5, 'p12'), (1997, 57.5, 'p13'), (1998, 58.5, 'p14'), (1999, 59.5, 'p15'), (2000, 60.5, 'p16'), (2001, 61.5, 'p17'), (2002, 62.5, 'p18'), (2003, 63.5, 'p19'), (2004, 64.5, 'p20'), (2005, 65.5, 'p21'), (2006, 66.5, 'p22'), (2007, 67.5, 'p23'), (2008, 68.5, 'p24'), (2009, 69.5, 'p25'), (2010, 70.5, 'p26'), (2011, 71.5, 'p27'), (2012, 72.5, 'p28'), (2013, 73.5, 'p29'), (2014, 74.5, 'p30'), (2015, 75.5, 'p0'), (2016, 76.5, 'p1'), (2017, 77.5, 'p2'), (2018, 78.5, 'p3'), (2019, 79.5, 'p4'), (2020, 80.5, 'p5'), (2021, 81.5, 'p6'), (2022, 82.5, 'p7'), (2023, 83.5, 'p8'), (2024, 84.5, 'p9'), (2025, 85.5, 'p10'), (2026, 86.5, 'p11'), (2027, 87.5, 'p12'), (2028, 88.5, 'p13'), (2029, 89.5, 'p14'), (2030, 90.5, 'p15'), (2031, 91.5, 'p16'), (2032, 92.5, 'p17'), (2033, 93.5, 'p18'), (2034, 94.5, 'p19'), (2035, 95.5, 'p20'), (2036, 96.5, 'p21'), (2037, 0.5, 'p22'), (2038, 1.5, 'p23'), (2039, 2.5, 'p24'), (2040, 3.5, 'p25'), (2041, 4.5, 'p26'), (2042, 5.5, 'p27'), (2043, 6.5, 'p28'), (2044, 7.5, 'p29'), (2045, 8.5, 'p30'), (2046, 9.5, 'p0'), (2047, 10.5, 'p1'), (2048, 11.5, 'p2'), (2049, 12.5, 'p3'), (2050, 13.5, 'p4'), (2051, 14.5, 'p5'), (2052, 15.5, 'p6'), (2053, 16.5, 'p7'), (2054, 17.5, 'p8'), (2055, 18.5, 'p9'), (2056, 19.5, 'p10'), (2057, 20.5, 'p11'), (2058, 21.5, 'p12'), (2059, 22.5, 'p13'), (2060, 23.5, 'p14'), (2061, 24.5, 'p15'), (2062, 25.5, 'p16'), (2063, 26.5, 'p17'), (2064, 27.5, 'p18'), (2065, 28.5, 'p19'), (2066, 29.5, 'p20'), (2067, 30.5, 'p21'), (2068, 31.5, 'p22'), (2069, 32.5, 'p23'), (2070, 33.5, 'p24'), (2071, 34.5, 'p25'), (2072, 35.5, 'p26'), (2073, 36.5, 'p27'), (2074, 37.5, 'p28'), (2075, 38.5, 'p29'), (2076, 39.5, 'p30'), (2077, 40.5, 'p0'), (2078, 41.5, 'p1'), (2079, 42.5, 'p2'), (2080, 43.5, 'p3'), (2081, 44.5, 'p4'), (2082, 45.5, 'p5'), (2083, 46.5, 'p6'), (2084, 47.5, 'p7'), (2085, 48.5, 'p8'), (2086, 49.5, 'p9'), (2087, 50.5, 'p10'), (2088, 51.5, 'p11'), (2089, 52.5, 'p12'), (2090, 53.5, 'p13'), (2091, 54.5, 'p14'), (2092, 55.5, 'p15'), (2093, 56.5, 'p16'), (2094, 57.5, 'p17'), (2095, 58.5, 'p18'), (2096, 59.5, 'p19'), (2097, 60.5, 'p20'), (2098, 61.5, 'p21'), (2099, 62.5, 'p22'), (2100, 63.5, 'p23'), (2101, 64.5, 'p24'), (2102, 65.5, 'p25'), (2103, 66.5, 'p26'), (2104, 67.5, 'p27'), (2105, 68.5, 'p28'), (2106, 69.5, 'p29'), (2107, 70.5, 'p30'), (2108, 71.5, 'p0'), (2109, 72.5, 'p1'), (2110, 73.5, 'p2'), (2111, 74.5, 'p3'), (2112, 75.5, 'p4'), (2113, 76.5, 'p5'), (2114, 77.5, 'p6'), (2115, 78.5, 'p7'), (2116, 79.5, 'p8'), (2117, 80.5, 'p9'), (2118, 81.5, 'p10'), (2119, 82.5, 'p11'), (2120, 83.5, 'p12'), (2121, 84.5, 'p13'), (2122, 85.5, 'p14'), (2123, 86.5, 'p15'), (2124, 87.5, 'p16'), (2125, 88.5, 'p17'), (2126, 89.5, 'p18'), (2127, 90.5, 'p19'), (2128, 91.5, 'p20'), (2129, 92.5, 'p21'), (2130, 93.5, 'p22'), (2131, 94.5, 'p23'), (2132, 95.5, 'p24'), (2133, 96.5, 'p25'), (2134, 0.5, 'p26'), (2135, 1.5, 'p27'), (2136, 2.5, 'p28'), (2137, 3.5, 'p29'), (2138, 4.5, 'p30'), (2139, 5.5, 'p0'), (2140, 6.5, 'p1'), (2141, 7.5, 'p2'), (2142, 8.5, 'p3'), (2143, 9.5, 'p4'), (2144, 10.5, 'p5'), (2145, 11.5, 'p6'), (2146, 12.5, 'p7'), (2147, 13.5, 'p8'), (2148, 14.5, 'p9'), (2149, 15.5, 'p10'), (2150, 16.5, 'p11'), (2151, 17.5, 'p12'), (2152, 18.5, 'p13'), (2153, 19.5, 'p14'), (2154, 20.5, 'p15'), (2155, 21.5, 'p16'), (2156, 22.5, 'p17'), (2157, 23.5, 'p18'), (2158, 24.5, 'p19'), (2159, 25.5, 'p20'), (2160, 26.5, 'p21'), (2161, 27.5, 'p22'), (2162, 28.5, 'p23'), (2163, 29.5, 'p24'), (2164, 30.5, 'p25'), (2165, 31.5, 'p26'), (2166, 32.5, 'p27'), (2167, 33.5, 'p28'), (2168, 34.5, 'p29'), (2169, 35.5, 'p30'), (2170, 36.5, 'p0'), (2171, 37.5, 'p1'), (2172, 38.5, 'p2'), (2173, 39.5, 'p3'), (2174, 40.5, 'p4'), (2175, 41.5, 'p5'), (2176, 42.5, 'p6'), (2177, 43.5, 'p7'), (2178, 44.5, 'p8'), (2179, 45.5, 'p9'), (2180, 46.5, 'p10'), (2181, 47.5, 'p11'), (2182, 48.5, 'p12'), (2183, 49.5, 'p13'), (2184, 50.5, 'p14'), (2185, 51.5, 'p15'), (2186, 52.5, 'p16'), (2187, 53.5, 'p17'), (2188, 54.5, 'p18'), (2189, 55.5, 'p19'), (2190, 56.5, 'p20'), (2191, 57.5, 'p21'), (2192, 58.5, 'p22'), (2193, 59.5, 'p23'), (2194, 60.5, 'p24'), (2195, 61.5, 'p25'), (2196, 62.5, 'p26'), (2197, 63.5, 'p27'), (2198, 64.5, 'p28'), (2199, 65.5, 'p29'), (2200, 66.5, 'p30'), (2201, 67.5, 'p0'), (2202, 68.5, 'p1'), (2203, 69.5, 'p2'), (2204, 70.5, 'p3'), (2205, 71.5, 'p4'), (2206, 72.5, 'p5'), (2207, 73.5, 'p6'), (2208, 74.5, 'p7'), (2209, 75.5, 'p8'), (2210, 76.5, 'p9'), (2211, 77.5, 'p10'), (2212, 78.5, 'p11'), (2213, 79.5, 'p12'), (2214, 80.5, 'p13'), (2215, 81.5, 'p14'), (2216, 82.5, 'p15'), (2217, 83.5, 'p16'), (2218, 84.5, 'p17'), (2219, 85.5, 'p18'), (2220, 86.5, 'p19'), (2221, 87.5, 'p20'), (2222, 88.5, 'p21'), (2223, 89.5, 'p22'), (2224, 90.5, 'p23'), (2225, 91.5, 'p24'), (2226, 92.5, 'p25'), (2227, 93.5, 'p26'), (2228, 94.5, 'p27'), (2229, 95.5, 'p28'), (2230, 96.5, 'p29'), (2231, 0.5, 'p30'), (2232, 1.5, 'p0'), (2233, 2.5, 'p1'), (2234, 3.5, 'p2'), (2235, 4.5, 'p3'), (2236, 5.5, 'p4'), (2237, 6.5, 'p5'), (2238, 7.5, 'p6'), (2239, 8.5, 'p7'), (2240, 9.5, 'p8'), (2241, 10.5, 'p9'), (2242, 11.5, 'p10'), (2243, 12.5, 'p11'), (2244, 13.5, 'p12'), (2245, 14.5, 'p13'), (2246, 15.5, 'p14'), (2247, 16.5, 'p15'), (2248, 17.5, 'p16'), (2249, 18.5, 'p17'), (2250, 19.5, 'p18'), (2251, 20.5, 'p19'), (2252, 21.5, 'p20'), (2253, 22.5, 'p21'), (2254, 23.5, 'p22'), (2255, 24.5, 'p23'), (2256, 25.5, 'p24'), (2257, 26.5, 'p25'), (2258, 27.5, 'p26'), (2259, 28.5, 'p27'), (2260, 29.5, 'p28'), (2261, 30.5, 'p29'), (2262, 31.5, 'p30'), (2263, 32.5, 'p0'), (2264, 33.5, 'p1'), (2265, 34.5, 'p2'), (2266, 35.5, 'p3'), (2267, 36.5, 'p4'), (2268, 37.5, 'p5'), (2269, 38.5, 'p6'), (2270, 39.5, 'p7'), (2271, 40.5, 'p8'), (2272, 41.5, 'p9'), (2273, 42.5, 'p10'), (2274, 43.5, 'p11'), (2275, 44.5, 'p12'), (2276, 45.5, 'p13'), (2277, 46.5, 'p14'), (2278, 47.5, 'p15'), (2279, 48.5, 'p16'), (2280, 49.5, 'p17'), (2281, 50.5, 'p18'), (2282, 51.5, 'p19'), (2283, 52.5, 'p20'), (2284, 53.5, 'p21'), (2285, 54.5, 'p22'), (2286, 55.5, 'p23'), (2287, 56.5, 'p24'), (2288, 57.5, 'p25'), (2289, 58.5, 'p26'), (2290, 59.5, 'p27'), (2291, 60.5, 'p28'), (2292, 61.5, 'p29'), (2293, 62.5, 'p30'), (2294, 63.5, 'p0'), (2295, 64.5, 'p1'), (2296, 65.5, 'p2'), (2297, 66.5, 'p3'), (2298, 67.5, 'p4'), (2299, 68.5, 'p5'), (2300, 69.5, 'p6'), (2301, 70.5, 'p7'), (2302, 71.5, 'p8'), (2303, 72.5, 'p9'), (2304, 73.5, 'p10'), (2305, 74.5, 'p11'), (2306, 75.5, 'p12'), (2307, 76.5, 'p13'), (2308, 77.5, 'p14'), (2309, 78.5, 'p15'), (2310, 79.5, 'p16'), (2311, 80.5, 'p17'), (2312, 81.5, 'p18'), (2313, 82.5, 'p19'), (2314, 83.5, 'p20'), (2315, 84.5, 'p21'), (2316, 85.5, 'p22'), (2317, 86.5, 'p23'), (2318, 87.5, 'p24'), (2319, 88.5, 'p25'), (2320, 89.5, 'p26'), (2321, 90.5, 'p27'), (2322, 91.5, 'p28'), (2323, 92.5, 'p29'), (2324, 93.5, 'p30'), (2325, 94.5, 'p0'), (2326, 95.5, 'p1'), (2327, 96.5, 'p2'), (2328, 0.5, 'p3'), (2329, 1.5, 'p4'), (2330, 2.5, 'p5'), (2331, 3.5, 'p6'), (2332, 4.5, 'p7'), (2333, 5.5, 'p8'), (2334, 6.5, 'p9'), (2335, 7.5, 'p10'), (2336, 8.5, 'p11'), (2337, 9.5, 'p12'), (2338, 10.5, 'p13'), (2339, 11.5, 'p14'), (2340, 12.5, 'p15'), (2341, 13.5, 'p16'), (2342, 14.5, 'p17'), (2343, 15.5, 'p18'), (2344, 16.5, 'p19'), (2345, 17.5, 'p20'), (2346, 18.5, 'p21'), (2347, 19.5, 'p22'), (2348, 20.5, 'p23'), (2349, 21.5, 'p24'), (2350, 22.5, 'p25'), (2351, 23.5, 'p26'), (2352, 24.5, 'p27'), (2353, 25.5, 'p28'), (2354, 26.5, 'p29'), (2355, 27.5, 'p30'), (2356, 28.5, 'p0'), (2357, 29.5, 'p1'), (2358, 30.5, 'p2'), (2359, 31.5, 'p3'), (2360, 32.5, 'p4'), (2361, 33.5, 'p5'), (2362, 34.5, 'p6'), (2363, 35.5, 'p7'), (2364, 36.5, 'p8'), (2365, 37.5, 'p9'), (2366, 38.5, 'p10'), (2367, 39.5, 'p11'), (2368, 40.5, 'p12'), (2369, 41.5, 'p13'), (2370, 42.5, 'p14'), (2371, 43.5, 'p15'), (2372, 44.5, 'p16'), (2373, 45.5, 'p17'), (2374, 46.5, 'p18'), (2375, 47.5, 'p19'), (2376, 48.5, 'p20'), (2377, 49.5, 'p21'), (2378, 50.5, 'p22'), (2379, 51.5, 'p23'), (2380, 52.5, 'p24'), (2381, 53.5, 'p25'), (2382, 54.5, 'p26'), (2383, 55.5, 'p27'), (2384, 56.5, 'p28'), (2385, 57.5, 'p29'), (2386, 58.5, 'p30'), (2387, 59.5, 'p0'), (2388, 60.5, 'p1'), (2389, 61.5, 'p2'), (2390, 62.5, 'p3'), (2391, 63.5, 'p4'), (2392, 64.5, 'p5'), (2393, 65.5, 'p6'), (2394, 66.5, 'p7'), (2395, 67.5, 'p8'), (2396, 68.5, 'p9'), (2397, 69.5, 'p10'), (2398, 70.5, 'p11'), (2399, 71.5, 'p12'), (2400, 72.5, 'p13'), (2401, 73.5, 'p14'), (2402, 74.5, 'p15'), (2403, 75.5, 'p16'), (2404, 76.5, 'p17'), (2405, 77.5, 'p18'), (2406, 78.5, 'p19'), (2407, 79.5, 'p20'), (2408, 80.5, 'p21'), (2409, 81.5, 'p22'), (2410, 82.5, 'p23'), (2411, 83.5, 'p24'), (2412, 84.5, 'p25'), (2413, 85.5, 'p26'), (2414, 86.5, 'p27'), (2415, 87.5, 'p28'), (2416, 88.5, 'p29'), (2417, 89.5, 'p30'), (2418, 90.5, 'p0'), (2419, 91.5, 'p1'), (2420, 92.5, 'p2'), (2421, 93.5, 'p3'), (2422, 94.5, 'p4'), (2423, 95.5, 'p5'), (2424, 96.5, 'p6'), (2425, 0.5, 'p7'), (2426, 1.5, 'p8'), (2427, 2.5, 'p9'), (2428, 3.5, 'p10'), (2429, 4.5, 'p11'), (2430, 5.5, 'p12'), (2431, 6.5, 'p13'), (2432, 7.5, 'p14'), (2433, 8.5, 'p15'), (2434, 9.5, 'p16'), (2435, 10.5, 'p17'), (2436, 11.5, 'p18'), (2437, 12.5, 'p19'), (2438, 13.5, 'p20'), (2439, 14.5, 'p21'), (2440, 15.5, 'p22'), (2441, 16.5, 'p23'), (2442, 17.5, 'p24'), (2443, 18.5, 'p25'), (2444, 19.5, 'p26'), (2445, 20.5, 'p27'), (2446, 21.5, 'p28'), (2447, 22.5, 'p29'), (2448, 23.5, 'p30'), (2449, 24.5, 'p0'), (2450, 25.5, 'p1'), (2451, 26.5, 'p2'), (2452, 27.5, 'p3'), (2453, 28.5, 'p4'), (2454, 29.5, 'p5'), (2455, 30.5, 'p6'), (2456, 31.5, 'p7'), (2457, 32.5, 'p8'), (2458, 33.5, 'p9'), (2459, 34.5, 'p10'), (2460, 35.5, 'p11'), (2461, 36.5, 'p12'), (2462, 37.5, 'p13'), (2463, 38.5, 'p14'), (2464, 39.5, 'p15'), (2465, 40.5, 'p16'), (2466, 41.5, 'p17'), (2467, 42.5, 'p18'), (2468, 43.5, 'p19'), (2469, 44.5, 'p20'), (2470, 45.5, 'p21'), (2471, 46.5, 'p22'), (2472, 47.5, 'p23'), (2473, 48.5, 'p24'), (2474, 49.5, 'p25'), (2475, 50.5, 'p26'), (2476, 51.5, 'p27'), (2477, 52.5, 'p28'), (2478, 53.5, 'p29'), (2479, 54.5, 'p30'), (2480, 55.5, 'p0'), (2481, 56.5, 'p1'), (2482, 57.5, 'p2'), (2483, 58.5, 'p3'), (2484, 59.5, 'p4'), (2485, 60.5, 'p5'), (2486, 61.5, 'p6'), (2487, 62.5, 'p7'), (2488, 63.5, 'p8'), (2489, 64.5, 'p9'), (2490, 65.5, 'p10'), (2491, 66.5, 'p11'), (2492, 67.5, 'p12'), (2493, 68.5, 'p13'), (2494, 69.5, 'p14'), (2495, 70.5, 'p15'), (2496, 71.5, 'p16'), (2497, 72.5, 'p17'), (2498, 73.5, 'p18'), (2499, 74.5, 'p19'), (2500, 75.5, 'p20'), (2501, 76.5, 'p21'), (2502, 77.5, 'p22'), (2503, 78.5, 'p23'), (2504, 79.5, 'p24'), (2505, 80.5, 'p25'), (2506, 81.5, 'p26'), (2507, 82.5, 'p27'), (2508, 83.5, 'p28'), (2509, 84.5, 'p29'), (2510, 85.5, 'p30'), (2511, 86.5, 'p0'), (2512, 87.5, 'p1'), (2513, 88.5, 'p2'), (2514, 89.5, 'p3'), (2515, 90.5, 'p4'), (2516, 91.5, 'p5'), (2517, 92.5, 'p6'), (2518, 93.5, 'p7'), (2519, 94.5, 'p8'), (2520, 95.5, 'p9'), (2521, 96.5, 'p10'), (2522, 0.5, 'p11'), (2523, 1.5, 'p12'), (2524, 2.5, 'p13'), (2525, 3.5, 'p14'), (2526, 4.5, 'p15'), (2527, 5.5, 'p16'), (2528, 6.5, 'p17'), (2529, 7.5, 'p18'), (2530, 8.5, 'p19'), (2531, 9.5, 'p20'), (2532, 10.5, 'p21'), (2533, 11.5, 'p22'), (2534, 12.5, 'p23'), (2535, 13.5, 'p24'), (2536, 14.5, 'p25'), (2537, 15.5, 'p26'), (2538, 16.5, 'p27'), (2539, 17.5, 'p28'), (2540, 18.5, 'p29'), (2541, 19.5, 'p30'), (2542, 20.5, 'p0'), (2543, 21.5, 'p1'), (2544, 22.5, 'p2'), (2545, 23.5, 'p3'), (2546, 24.5, 'p4'), (2547, 25.5, 'p5'), (2548, 26.5, 'p6'), (2549, 27.5, 'p7'), (2550, 28.5, 'p8'), (2551, 29.5, 'p9'), (2552, 30.5, 'p10'), (2553, 31.5, 'p11'), (2554, 32.5, 'p12'), (2555, 33.5, 'p13'), (2556, 34.5, 'p14'), (2557, 35.5, 'p15'), (2558, 36.5, 'p16'), (2559, 37.5, 'p17'), (2560, 38.5, 'p18'), (2561, 39.5, 'p19'), (2562, 40.5, 'p20'), (2563, 41.5, 'p21'), (2564, 42.5, 'p22'), (2565, 43.5, 'p23'), (2566, 44.5, 'p24'), (2567, 45.5, 'p25'), (2568, 46.5, 'p26'), (2569, 47.5, 'p27'), (2570, 48.5, 'p28'), (2571, 49.5, 'p29'), (2572, 50.5, 'p30'), (2573, 51.5, 'p0'), (2574, 52.5, 'p1'), (2575, 53.5, 'p2'), (2576, 54.5, 'p3'), (2577, 55.5, 'p4'), (2578, 56.5, 'p5'), (2579, 57.5, 'p6'), (2580, 58.5, 'p7'), (2581, 59.5, 'p8'), (2582, 60.5, 'p9'), (2583, 61.5, 'p10'), (2584, 62.5, 'p11'), (2585, 63.5, 'p12'), (2586, 64.5, 'p13'), (2587, 65.5, 'p14'), (2588, 66.5, 'p15'), (2589, 67.5, 'p16'), (2590, 68.5, 'p17'), (2591, 69.5, 'p18'), (2592, 70.5, 'p19'), (2593, 71.5, 'p20'), (2594, 72.5, 'p21'), (2595, 73.5, 'p22'), (2596, 74.5, 'p23'), (2597, 75.5, 'p24'), (2598, 76.5, 'p25'), (2599, 77.5, 'p26'), (2600, 78.5, 'p27'), (2601, 79.5, 'p28'), (2602, 80.5, 'p29'), (2603, 81.5, 'p30'), (2604, 82.5, 'p0'), (2605, 83.5, 'p1'), (2606, 84.5, 'p2'), (2607, 85.5, 'p3'), (2608, 86.5, 'p4'), (2609, 87.5, 'p5'), (2610, 88.5, 'p6'), (2611, 89.5, 'p7'), (2612, 90.5, 'p8'), (2613, 91.5, 'p9'), (2614, 92.5, 'p10'), (2615, 93.5, 'p11'), (2616, 94.5, 'p12'), (2617, 95.5, 'p13'), (2618, 96.5, 'p14'), (2619, 0.5, 'p15'), (2620, 1.5, 'p16'), (2621, 2.5, 'p17'), (2622, 3.5, 'p18'), (2623, 4.5, 'p19'), (2624, 5.5, 'p20'), (2625, 6.5, 'p21'), (2626, 7.5, 'p22'), (2627, 8.5, 'p23'), (2628, 9.5, 'p24'), (2629, 10.5, 'p25'), (2630, 11.5, 'p26'), (2631, 12.5, 'p27'), (2632, 13.5, 'p28'), (2633, 14.5, 'p29'), (2634, 15.5, 'p30'), (2635, 16.5, 'p0'), (2636, 17.5, 'p1'), (2637, 18.5, 'p2'), (2638, 19.5, 'p3'), (2639, 20.5, 'p4'), (2640, 21.5, 'p5'), (2641, 22.5, 'p6'), (2642, 23.5, 'p7'), (2643, 24.5, 'p8'), (2644, 25.5, 'p9'), (2645, 26.5, 'p10'), (2646, 27.5, 'p11'), (2647, 28.5, 'p12'), (2648, 29.5, 'p13'), (2649, 30.5, 'p14'), (2650, 31.5, 'p15'), (2651, 32.5, 'p16'), (2652, 33.5, 'p17'), (2653, 34.5, 'p18'), (2654, 35.5, 'p19'), (2655, 36.5, 'p20'), (2656, 37.5, 'p21'), (2657, 38.5, 'p22'), (2658, 39.5, 'p23'), (2659, 40.5, 'p24'), (2660, 41.5, 'p25'), (2661, 42.5, 'p26'), (2662, 43.5, 'p27'), (2663, 44.5, 'p28'), (2664, 45.5, 'p29'), (2665, 46.5, 'p30'), (2666, 47.5, 'p0'), (2667, 48.5, 'p1'), (2668, 49.5, 'p2'), (2669, 50.5, 'p3'), (2670, 51.5, 'p4'), (2671, 52.5, 'p5'), (2672, 53.5, 'p6'), (2673, 54.5, 'p7'), (2674, 55.5, 'p8'), (2675, 56.5, 'p9'), (2676, 57.5, 'p10'), (2677, 58.5, 'p11'), (2678, 59.5, 'p12'), (2679, 60.5, 'p13'), (2680, 61.5, 'p14'), (2681, 62.5, 'p15'), (2682, 63.5, 'p16'), (2683, 64.5, 'p17'), (2684, 65.5, 'p18'), (2685, 66.5, 'p19'), (2686, 67.5, 'p20'), (2687, 68.5, 'p21'), (2688, 69.5, 'p22'), (2689, 70.5, 'p23'), (2690, 71.5, 'p24'), (2691, 72.5, 'p25'), (2692, 73.5, 'p26'), (2693, 74.5, 'p27'), (2694, 75.5, 'p28'), (2695, 76.5, 'p29'), (2696, 77.5, 'p30'), (2697, 78.5, 'p0'), (2698, 79.5, 'p1'), (2699, 80.5, 'p2'), (2700, 81.5, 'p3'), (2701, 82.5, 'p4'), (2702, 83.5, 'p5'), (2703, 84.5, 'p6'), (2704, 85.5, 'p7'), (2705, 86.5, 'p8'), (2706, 87.5, 'p9'), (2707, 88.5, 'p10'), (2708, 89.5, 'p11'), (2709, 90.5, 'p12'), (2710, 91.5, 'p13'), (2711, 92.5, 'p14'), (2712, 93.5, 'p15'), (2713, 94.5, 'p16'), (2714, 95.5, 'p17'), (2715, 96.5, 'p18'), (2716, 0.5, 'p19'), (2717, 1.5, 'p20'), (2718, 2.5, 'p21'), (2719, 3.5, 'p22'), (2720, 4.5, 'p23'), (2721, 5.5, 'p24'), (2722, 6.5, 'p25'), (2723, 7.5, 'p26'), (2724, 8.5, 'p27'), (2725, 9.5, 'p28'), (2726, 10.5, 'p29'), (2727, 11.5, 'p30'), (2728, 12.5, 'p0'), (2729, 13.5, 'p1'), (2730, 14.5, 'p2'), (2731, 15.5, 'p3'), (2732, 16.5, 'p4'), (2733, 17.5, 'p5'), (2734, 18.5, 'p6'), (2735, 19.5, 'p7'), (2736, 20.5, 'p8'), (2737, 21.5, 'p9'), (2738, 22.5, 'p10'), (2739, 23.5, 'p11'), (2740, 24.5, 'p12'), (2741, 25.5, 'p13'), (2742, 26.5, 'p14'), (2743, 27.5, 'p15'), (2744, 28.5, 'p16'), (2745, 29.5, 'p17'), (2746, 30.5, 'p18'), (2747, 31.5, 'p19'), (2748, 32.5, 'p20'), (2749, 33.5, 'p21'), (2750, 34.5, 'p22'), (2751, 35.5, 'p23'), (2752, 36.5, 'p24'), (2753, 37.5, 'p25'), (2754, 38.5, 'p26'), (2755, 39.5, 'p27'), (2756, 40.5, 'p28'), (2757, 41.5, 'p29'), (2758, 42.5, 'p30'), (2759, 43.5, 'p0'), (2760, 44.5, 'p1'), (2761, 45.5, 'p2'), (2762, 46.5, 'p3'), (2763, 47.5, 'p4'), (2764, 48.5, 'p5'), (2765, 49.5, 'p6'), (2766, 50.5, 'p7'), (2767, 51.5, 'p8'), (2768, 52.5, 'p9'), (2769, 53.5, 'p10'), (2770, 54.5, 'p11'), (2771, 55.5, 'p12'), (2772, 56.5, 'p13'), (2773, 57.5, 'p14'), (2774, 58.5, 'p15'), (2775, 59.5, 'p16'), (2776, 60.5, 'p17'), (2777, 61.5, 'p18'), (2778, 62.5, 'p19'), (2779, 63.5, 'p20'), (2780, 64.5, 'p21'), (2781, 65.5, 'p22'), (2782, 66.5, 'p23'), (2783, 67.5, 'p24'), (2784, 68.5, 'p25'), (2785, 69.5, 'p26'), (2786, 70.5, 'p27'), (2787, 71.5, 'p28'), (2788, 72.5, 'p29'), (2789, 73.5, 'p30'), (2790, 74.5, 'p0'), (2791, 75.5, 'p1'), (2792, 76.5, 'p2'), (2793, 77.5, 'p3'), (2794, 78.5, 'p4'), (2795, 79.5, 'p5'), (2796, 80.5, 'p6'), (2797, 81.5, 'p7'), (2798, 82.5, 'p8'), (2799, 83.5, 'p9'), (2800, 84.5, 'p10'), (2801, 85.5, 'p11'), (2802, 86.5, 'p12'), (2803, 87.5, 'p13'), (2804, 88.5, 'p14'), (2805, 89.5, 'p15'), (2806, 90.5, 'p16'), (2807, 91.5, 'p17'), (2808, 92.5, 'p18'), (2809, 93.5, 'p19'), (2810, 94.5, 'p20'), (2811, 95.5, 'p21'), (2812, 96.5, 'p22'), (2813, 0.5, 'p23'), (2814, 1.5, 'p24'), (2815, 2.5, 'p25'), (2816, 3.5, 'p26'), (2817, 4.5, 'p27'), (2818, 5.5, 'p28'), (2819, 6.5, 'p29'), (2820, 7.5, 'p30'), (2821, 8.5, 'p0'), (2822, 9.5, 'p1'), (2823, 10.5, 'p2'), (2824, 11.5, 'p3'), (2825, 12.5, 'p4'), (2826, 13.5, 'p5'), (2827, 14.5, 'p6'), (2828, 15.5, 'p7'), (2829, 16.5, 'p8'), (2830, 17.5, 'p9'), (2831, 18.5, 'p10'), (2832, 19.5, 'p11'), (2833, 20.5, 'p12'), (2834, 21.5, 'p13'), (2835, 22.5, 'p14'), (2836, 23.5, 'p15'), (2837, 24.5, 'p16'), (2838, 25.5, 'p17'), (2839, 26.5, 'p18'), (2840, 27.5, 'p19'), (2841, 28.5, 'p20'), (2842, 29.5, 'p21'), (2843, 30.5, 'p22'), (2844, 31.5, 'p23'), (2845, 32.5, 'p24'), (2846, 33.5, 'p25'), (2847, 34.5, 'p26'), (2848, 35.5, 'p27'), (2849, 36.5, 'p28'), (2850, 37.5, 'p29'), (2851, 38.5, 'p30'), (2852, 39.5, 'p0'), (2853, 40.5, 'p1'), (2854, 41.5, 'p2'), (2855, 42.5, 'p3'), (2856, 43.5, 'p4'), (2857, 44.5, 'p5'), (2858, 45.5, 'p6'), (2859, 46.5, 'p7'), (2860, 47.5, 'p8'), (2861, 48.5, 'p9'), (2862, 49.5, 'p10'), (2863, 50.5, 'p11'), (2864, 51.5, 'p12'), (2865, 52.5, 'p13'), (2866, 53.5, 'p14'), (2867, 54.5, 'p15'), (2868, 55.5, 'p16'), (2869, 56.5, 'p17'), (2870, 57.5, 'p18'), (2871, 58.5, 'p19'), (2872, 59.5, 'p20'), (2873, 60.5, 'p21'), (2874, 61.5, 'p22'), (2875, 62.5, 'p23'), (2876, 63.5, 'p24'), (2877, 64.5, 'p25'), (2878, 65.5, 'p26'), (2879, 66.5, 'p27'), (2880, 67.5, 'p28'), (2881, 68.5, 'p29'), (2882, 69.5, 'p30'), (2883, 70.5, 'p0'), (2884, 71.5, 'p1'), (2885, 72.5, 'p2'), (2886, 73.5, 'p3'), (2887, 74.5, 'p4'), (2888, 75.5, 'p5'), (2889, 76.5, 'p6'), (2890, 77.5, 'p7'), (2891, 78.5, 'p8'), (2892, 79.5, 'p9'), (2893, 80.5, 'p10'), (2894, 81.5, 'p11'), (2895, 82.5, 'p12'), (2896, 83.5, 'p13'), (2897, 84.5, 'p14'), (2898, 85.5, 'p15'), (2899, 86.5, 'p16'), (2900, 87.5, 'p17'), (2901, 88.5, 'p18'), (2902, 89.5, 'p19'), (2903, 90.5, 'p20'), (2904, 91.5, 'p21'), (2905, 92.5, 'p22'), (2906, 93.5, 'p23'), (2907, 94.5, 'p24'), (2908, 95.5, 'p25'), (2909, 96.5, 'p26'), (2910, 0.5, 'p27'), (2911, 1.5, 'p28'), (2912, 2.5, 'p29'), (2913, 3.5, 'p30'), (2914, 4.5, 'p0'), (2915, 5.5, 'p1'), (2916, 6.5, 'p2'), (2917, 7.5, 'p3'), (2918, 8.5, 'p4'), (2919, 9.5, 'p5'), (2920, 10.5, 'p6'), (2921, 11.5, 'p7'), (2922, 12.5, 'p8'), (2923, 13.5, 'p9'), (2924, 14.5, 'p10'), (2925, 15.5, 'p11'), (2926, 16.5, 'p12'), (2927, 17.5, 'p13'), (2928, 18.5, 'p14'), (2929, 19.5, 'p15'), (2930, 20.5, 'p16'), (2931, 21.5, 'p17'), (2932, 22.5, 'p18'), (2933, 23.5, 'p19'), (2934, 24.5, 'p20'), (2935, 25.5, 'p21'), (2936, 26.5, 'p22'), (2937, 27.5, 'p23'), (2938, 28.5, 'p24'), (2939, 29.5, 'p25'), (2940, 30.5, 'p26'), (2941, 31.5, 'p27'), (2942, 32.5, 'p28'), (2943, 33.5, 'p29'), (2944, 34.5, 'p30'), (2945, 35.5, 'p0'), (2946, 36.5, 'p1'), (2947, 37.5, 'p2'), (2948, 38.5, 'p3'), (2949, 39.5, 'p4'), (2950, 40.5, 'p5'), (2951, 41.5, 'p6'), (2952, 42.5, 'p7'), (2953, 43.5, 'p8'), (2954, 44.5, 'p9'), (2955, 45.5, 'p10'), (2956, 46.5, 'p11'), (2957, 47.5, 'p12'), (2958, 48.5, 'p13'), (2959, 49.5, 'p14'), (2960, 50.5, 'p15'), (2961, 51.5, 'p16'), (2962, 52.5, 'p17'), (2963, 53.5, 'p18'), (2964, 54.5, 'p19'), (2965, 55.5, 'p20'), (2966, 56.5, 'p21'), (2967, 57.5, 'p22'), (2968, 58.5, 'p23'), (2969, 59.5, 'p24'), (2970, 60.5, 'p25'), (2971, 61.5, 'p26'), (2972, 62.5, 'p27'), (2973, 63.5, 'p28'), (2974, 64.5, 'p29'), (2975, 65.5, 'p30'), (2976, 66.5, 'p0'), (2977, 67.5, 'p1'), (2978, 68.5, 'p2'), (2979, 69.5, 'p3'), (2980, 70.5, 'p4'), (2981, 71.5, 'p5'), (2982, 72.5, 'p6'), (2983, 73.5, 'p7'), (2984, 74.5, 'p8'), (2985, 75.5, 'p9'), (2986, 76.5, 'p10'), (2987, 77.5, 'p11'), (2988, 78.5, 'p12'), (2989, 79.5, 'p13'), (2990, 80.5, 'p14'), (2991, 81.5, 'p15'), (2992, 82.5, 'p16'), (2993, 83.5, 'p17'), (2994, 84.5, 'p18'), (2995, 85.5, 'p19'), (2996, 86.5, 'p20'), (2997, 87.5, 'p21'), (2998, 88.5, 'p22'), (2999, 89.5, 'p23');
+CREATE TABLE RC(A INT, B FLOAT, C VARCHAR) WITH (compression='zlib');
+INSERT INTO RC VALUES (0, 0.25, 'q0'), (2, 1.25, 'q1'), (4, 2.25, 'q2'), (6, 3.25, 'q3'), (8, 4.25, 'q4'), (10, 5.25, 'q5'), (12, 6.25, 'q6'), (14, 7.25, 'q7'), (16, 8.25, 'q8'), (18, 9.25, 'q9'), (20, 10.25, 'q10'), (22, 11.25, 'q11'), (24, 12.25, 'q12'), (26, 13.25, 'q13'), (28, 14.25, 'q14'), (30, 15.25, 'q15'), (32, 16.25, 'q16'), (34, 17.25, 'q17'), (36, 18.25, 'q18'), (38, 19.25, 'q19'), (40, 20.25, 'q20'), (42, 21.25, 'q21'), (44, 22.25, 'q22'), (46, 23.25, 'q0'), (48, 24.25, 'q1'), (50, 25.25, 'q2'), (52, 26.25, 'q3'), (54, 27.25, 'q4'), (56, 28.25, 'q5'), (58, 29.25, 'q6'), (60, 30.25, 'q7'), (62, 31.25, 'q8'), (64, 32.25, 'q9'), (66, 33.25, 'q10'), (68, 34.25, 'q11'), (70, 35.25, 'q12'), (72, 36.25, 'q13'), (74, 37.25, 'q14'), (76, 38.25, 'q15'), (78, 39.25, 'q16'), (80, 40.25, 'q17'), (82, 41.25, 'q18'), (84, 42.25, 'q19'), (86, 43.25, 'q20'), (88, 44.25, 'q21'), (90, 45.25, 'q22'), (92, 46.25, 'q0'), (94, 47.25, 'q1'), (96, 48.25, 'q2'), (98, 49.25, 'q3'), (100, 50.25, 'q4'), (102, 51.25, 'q5'), (104, 52.25, 'q6'), (106, 53.25, 'q7'), (108, 54.25, 'q8'), (110, 55.25, 'q9'), (112, 56.25, 'q10'), (114, 57.25, 'q11'), (116, 58.25, 'q12'), (118, 59.25, 'q13'), (120, 60.25, 'q14'), (122, 61.25, 'q15'), (124, 62.25, 'q16'), (126, 63.25, 'q17'), (128, 64.25, 'q18'), (130, 65.25, 'q19'), (132, 66.25, 'q20'), (134, 67.25, 'q21'), (136, 68.25, 'q22'), (138, 69.25, 'q0'), (140, 70.25, 'q1'), (142, 71.25, 'q2'), (144, 72.25, 'q3'), (146, 73.25, 'q4'), (148, 74.25, 'q5'), (150, 75.25, 'q6'), (152, 76.25, 'q7'), (154, 77.25, 'q8'), (156, 78.25, 'q9'), (158, 79.25, 'q10'), (160, 80.25, 'q11'), (162, 81.25, 'q12'), (164, 82.25, 'q13'), (166, 83.25, 'q14'), (168, 84.25, 'q15'), (170, 85.25, 'q16'), (172, 86.25, 'q17'), (174, 87.25, 'q18'), (176, 88.25, 'q19'), (178, 0.25, 'q20'), (180, 1.25, 'q21'), (182, 2.25, 'q22'), (184, 3.25, 'q0'), (186, 4.25, 'q1'), (188, 5.25, 'q2'), (190, 6.25, 'q3'), (192, 7.25, 'q4'), (194, 8.25, 'q5'), (196, 9.25, 'q6'), (198, 10.25, 'q7'), (200, 11.25, 'q8'), (202, 12.25, 'q9'), (204, 13.25, 'q10'), (206, 14.25, 'q11'), (208, 15.25, 'q12'), (210, 16.25, 'q13'), (212, 17.25, 'q14'), (214, 18.25, 'q15'), (216, 19.25, 'q16'), (218, 20.25, 'q17'), (220, 21.25, 'q18'), (222, 22.25, 'q19'), (224, 23.25, 'q20'), (226, 24.25, 'q21'), (228, 25.25, 'q22'), (230, 26.25, 'q0'), (232, 27.25, 'q1'), (234, 28.25, 'q2'), (236, 29.25, 'q3'), (238, 30.25, 'q4'), (240, 31.25, 'q5'), (242, 32.25, 'q6'), (244, 33.25, 'q7'), (246, 34.25, 'q8'), (248, 35.25, 'q9'), (250, 36.25, 'q10'), (252, 37.25, 'q11'), (254, 38.25, 'q12'), (256, 39.25, 'q13'), (258, 40.25, 'q14'), (260, 41.25, 'q15'), (262, 42.25, 'q16'), (264, 43.25, 'q17'), (266, 44.25, 'q18'), (268, 45.25, 'q19'), (270, 46.25, 'q20'), (272, 47.25, 'q21'), (274, 48.25, 'q22'), (276, 49.25, 'q0'), (278, 50.25, 'q1'), (280, 51.25, 'q2'), (282, 52.25, 'q3'), (284, 53.25, 'q4'), (286, 54.25, 'q5'), (288, 55.25, 'q6'), (290, 56.25, 'q7'), (292, 57.25, 'q8'), (294, 58.25, 'q9'), (296, 59.25, 'q10'), (298, 60.25, 'q11'), (300, 61.25, 'q12'), (302, 62.25, 'q13'), (304, 63.25, 'q14'), (306, 64.25, 'q15'), (308, 65.25, 'q16'), (310, 66.25, 'q17'), (312, 67.25, 'q18'), (314, 68.25, 'q19'), (316, 69.25, 'q20'), (318, 70.25, 'q21'), (320, 71.25, 'q22'), (322, 72.25, 'q0'), (324, 73.25, 'q1'), (326, 74.25, 'q2'), (328, 75.25, 'q3'), (330, 76.25, 'q4'), (332, 77.25, 'q5'), (334, 78.25, 'q6'), (336, 79.25, 'q7'), (338, 80.25, 'q8'), (340, 81.25, 'q9'), (342, 82.25, 'q10'), (344, 83.25, 'q11'), (346, 84.25, 'q12'), (348, 85.25, 'q13'), (350, 86.25, 'q14'), (352, 87.25, 'q15'), (354, 88.25, 'q16'), (356, 0.25, 'q17'), (358, 1.25, 'q18'), (360, 2.25, 'q19'), (362, 3.25, 'q20'), (364, 4.25, 'q21'), (366, 5.25, 'q22'), (368, 6.25, 'q0'), (370, 7.25, 'q1'), (372, 8.25, 'q2'), (374, 9.25, 'q3'), (376, 10.25, 'q4'), (378, 11.25, 'q5'), (380, 12.25, 'q6'), (382, 13.25, 'q7'), (384, 14.25, 'q8'), (386, 15.25, 'q9'), (388, 16.25, 'q10'), (390, 17.25, 'q11'), (392, 18.25, 'q12'), (394, 19.25, 'q13'), (396, 20.25, 'q14'), (398, 21.25, 'q15'), (400, 22.25, 'q16'), (402, 23.25, 'q17'), (404, 24.25, 'q18'), (406, 25.25, 'q19'), (408, 26.25, 'q20'), (410, 27.25, 'q21'), (412, 28.25, 'q22'), (414, 29.25, 'q0'), (416, 30.25, 'q1'), (418, 31.25, 'q2'), (420, 32.25, 'q3'), (422, 33.25, 'q4'), (424, 34.25, 'q5'), (426, 35.25, 'q6'), (428, 36.25, 'q7'), (430, 37.25, 'q8'), (432, 38.25, 'q9'), (434, 39.25, 'q10'), (436, 40.25, 'q11'), (438, 41.25, 'q12'), (440, 42.25, 'q13'), (442, 43.25, 'q14'), (444, 44.25, 'q15'), (446, 45.25, 'q16'), (448, 46.25, 'q17'), (450, 47.25, 'q18'), (452, 48.25, 'q19'), (454, 49.25, 'q20'), (456, 50.25, 'q21'), (458, 51.25, 'q22'), (460, 52.25, 'q0'), (462, 53.25, 'q1'), (464, 54.25, 'q2'), (466, 55.25, 'q3'), (468, 56.25, 'q4'), (470, 57.25, 'q5'), (472, 58.25, 'q6'), (474, 59.25, 'q7'), (476, 60.25, 'q8'), (478, 61.25, 'q9'), (480, 62.25, 'q10'), (482, 63.25, 'q11'), (484, 64.25, 'q12'), (486, 65.25, 'q13'), (488, 66.25, 'q14'), (490, 67.25, 'q15'), (492, 68.25, 'q16'), (494, 69.25, 'q17'), (496, 70.25, 'q18'), (498, 71.25, 'q19'), (500, 72.25, 'q20'), (502, 73.25, 'q21'), (504, 74.25, 'q22'), (506, 75.25, 'q0'), (508, 76.25, 'q1'), (510, 77.25, 'q2'), (512, 78.25, 'q3'), (514, 79.25, 'q4'), (516, 80.25, 'q5'), (518, 81.25, 'q6'), (520, 82.25, 'q7'), (522, 83.25, 'q8'), (524, 84.25, 'q9'), (526, 85.25, 'q10'), (528, 86.25, 'q11'), (530, 87.25, 'q12'), (532, 88.25, 'q13'), (534, 0.25, 'q14'), (536, 1.25, 'q15'), (538, 2.25, 'q16'), (540, 3.25, 'q17'), (542, 4.25, 'q18'), (544, 5.25, 'q19'), (546, 6.25, 'q20'), (548, 7.25, 'q21'), (550, 8.25, 'q22'), (552, 9.25, 'q0'), (554, 10.25, 'q1'), (556, 11.25, 'q2'), (558, 12.25, 'q3'), (560, 13.25, 'q4'), (562, 14.25, 'q5'), (564, 15.25, 'q6'), (566, 16.25, 'q7'), (568, 17.25, 'q8'), (570, 18.25, 'q9'), (572, 19.25, 'q10'), (574, 20.25, 'q11'), (576, 21.25, 'q12'), (578, 22.25, 'q13'), (580, 23.25, 'q14'), (582, 24.25, 'q15'), (584, 25.25, 'q16'), (586, 26.25, 'q17'), (588, 27.25, 'q18'), (590, 28.25, 'q19'), (592, 29.25, 'q20'), (594, 30.25, 'q21'), (596, 31.25, 'q22'), (598, 32.25, 'q0'), (600, 33.25, 'q1'), (602, 34.25, 'q2'), (604, 35.25, 'q3'), (606, 36.25, 'q4'), (608, 37.25, 'q5'), (610, 38.25, 'q6'), (612, 39.25, 'q7'), (614, 40.25, 'q8'), (616, 41.25, 'q9'), (618, 42.25, 'q10'), (620, 43.25, 'q11'), (622, 44.25, 'q12'), (624, 45.25, 'q13'), (626, 46.25, 'q14'), (628, 47.25, 'q15'), (630, 48.25, 'q16'), (632, 49.25, 'q17'), (634, 50.25, 'q18'), (636, 51.25, 'q19'), (638, 52.25, 'q20'), (640, 53.25, 'q21'), (642, 54.25, 'q22'), (644, 55.25, 'q0'), (646, 56.25, 'q1'), (648, 57.25, 'q2'), (650, 58.25, 'q3'), (652, 59.25, 'q4'), (654, 60.25, 'q5'), (656, 61.25, 'q6'), (658, 62.25, 'q7'), (660, 63.25, 'q8'), (662, 64.25, 'q9'), (664, 65.25, 'q10'), (666, 66.25, 'q11'), (668, 67.25, 'q12'), (670, 68.25, 'q13'), (672, 69.25, 'q14'), (674, 70.25, 'q15'), (676, 71.25, 'q16'), (678, 72.25, 'q17'), (680, 73.25, 'q18'), (682, 74.25, 'q19'), (684, 75.25, 'q20'), (686, 76.25, 'q21'), (688, 77.25, 'q22'), (690, 78.25, 'q0'), (692, 79.25, 'q1'), (694, 80.25, 'q2'), (696, 81.25, 'q3'), (698, 82.25, 'q4'), (700, 83.25, 'q5'), (702, 84.25, 'q6'), (704, 85.25, 'q7'), (706, 86.25, 'q8'), (708, 87.25, 'q9'), (710, 88.25, 'q10'), (712, 0.25, 'q11'), (714, 1.25, 'q12'), (716, 2.25, 'q13'), (718, 3.25, 'q14'), (720, 4.25, 'q15'), (722, 5.25, 'q16'), (724, 6.25, 'q17'), (726, 7.25, 'q18'), (728, 8.25, 'q19'), (730, 9.25, 'q20'), (732, 10.25, 'q21'), (734, 11.25, 'q22'), (736, 12.25, 'q0'), (738, 13.25, 'q1'), (740, 14.25, 'q2'), (742, 15.25, 'q3'), (744, 16.25, 'q4'), (746, 17.25, 'q5'), (748, 18.25, 'q6'), (750, 19.25, 'q7'), (752, 20.25, 'q8'), (754, 21.25, 'q9'), (756, 22.25, 'q10'), (758, 23.25, 'q11'), (760, 24.25, 'q12'), (762, 25.25, 'q13'), (764, 26.25, 'q14'), (766, 27.25, 'q15'), (768, 28.25, 'q16'), (770, 29.25, 'q17'), (772, 30.25, 'q18'), (774, 31.25, 'q19'), (776, 32.25, 'q20'), (778, 33.25, 'q21'), (780, 34.25, 'q22'), (782, 35.25, 'q0'), (784, 36.25, 'q1'), (786, 37.25, 'q2'), (788, 38.25, 'q3'), (790, 39.25, 'q4'), (792, 40.25, 'q5'), (794, 41.25, 'q6'), (796, 42.25, 'q7'), (798, 43.25, 'q8'), (800, 44.25, 'q9'), (802, 45.25, 'q10'), (804, 46.25, 'q11'), (806, 47.25, 'q12'), (808, 48.25, 'q13'), (810, 49.25, 'q14'), (812, 50.25, 'q15'), (814, 51.25, 'q16'), (816, 52.25, 'q17'), (818, 53.25, 'q18'), (820, 54.25, 'q19'), (822, 55.25, 'q20'), (824, 56.25, 'q21'), (826, 57.25, 'q22'), (828, 58.25, 'q0'), (830, 59.25, 'q1'), (832, 60.25, 'q2'), (834, 61.25, 'q3'), (836, 62.25, 'q4'), (838, 63.25, 'q5'), (840, 64.25, 'q6'), (842, 65.25, 'q7'), (844, 66.25, 'q8'), (846, 67.25, 'q9'), (848, 68.25, 'q10'), (850, 69.25, 'q11'), (852, 70.25, 'q12'), (854, 71.25, 'q13'), (856, 72.25, 'q14'), (858, 73.25, 'q15'), (860, 74.25, 'q16'), (862, 75.25, 'q17'), (864, 76.25, 'q18'), (866, 77.25, 'q19'), (868, 78.25, 'q20'), (870, 79.25, 'q21'), (872, 80.25, 'q22'), (874, 81.25, 'q0'), (876, 82.25, 'q1'), (878, 83.25, 'q2'), (880, 84.25, 'q3'), (882, 85.25, 'q4'), (884, 86.25, 'q5'), (886, 87.25, 'q6'), (888, 88.25, 'q7'), (890, 0.25, 'q8'), (892, 1.25, 'q9'), (894, 2.25, 'q10'), (896, 3.25, 'q11'), (898, 4.25, 'q12'), (900, 5.25, 'q13'), (902, 6.25, 'q14'), (904, 7.25, 'q15'), (906, 8.25, 'q16'), (908, 9.25, 'q17'), (910, 10.25, 'q18'), (912, 11.25, 'q19'), (914, 12.25, 'q20'), (916, 13.25, 'q21'), (918, 14.25, 'q22'), (920, 15.25, 'q0'), (922, 16.25, 'q1'), (924, 17.25, 'q2'), (926, 18.25, 'q3'), (928, 19.25, 'q4'), (930, 20.25, 'q5'), (932, 21.25, 'q6'), (934, 22.25, 'q7'), (936, 23.25, 'q8'), (938, 24.25, 'q9'), (940, 25.25, 'q10'), (942, 26.25, 'q11'), (944, 27.25, 'q12'), (946, 28.25, 'q13'), (948, 29.25, 'q14'), (950, 30.25, 'q15'), (952, 31.25, 'q16'), (954, 32.25, 'q17'), (956, 33.25, 'q18'), (958, 34.25, 'q19'), (960, 35.25, 'q20'), (962, 36.25, 'q21'), (964, 37.25, 'q22'), (966, 38.25, 'q0'), (968, 39.25, 'q1'), (970, 40.25, 'q2'), (972, 41.25, 'q3'), (974, 42.25, 'q4'), (976, 43.25, 'q5'), (978, 44.25, 'q6'), (980, 45.25, 'q7'), (982, 46.25, 'q8'), (984, 47.25, 'q9'), (986, 48.25, 'q10'), (988, 49.25, 'q11'), (990, 50.25, 'q12'), (992, 51.25, 'q13'), (994, 52.25, 'q14'), (996, 53.25, 'q15'), (998, 54.25, 'q16'), (1000, 55.25, 'q17'), (1002, 56.25, 'q18'), (1004, 57.25, 'q19'), (1006, 58.25, 'q20'), (1008, 59.25, 'q21'), (1010, 60.25, 'q22'), (1012, 61.25, 'q0'), (1014, 62.25, 'q1'), (1016, 63.25, 'q2'), (1018, 64.25, 'q3'), (1020, 65.25, 'q4'), (1022, 66.25, 'q5'), (1024, 67.25, 'q6'), (1026, 68.25, 'q7'), (1028, 69.25, 'q8'), (1030, 70.25, 'q9'), (1032, 71.25, 'q10'), (1034, 72.25, 'q11'), (1036, 73.25, 'q12'), (1038, 74.25, 'q13'), (1040, 75.25, 'q14'), (1042, 76.25, 'q15'), (1044, 77.25, 'q16'), (1046, 78.25, 'q17'), (1048, 79.25, 'q18'), (1050, 80.25, 'q19'), (1052, 81.25, 'q20'), (1054, 82.25, 'q21'), (1056, 83.25, 'q22'), (1058, 84.25, 'q0'), (1060, 85.25, 'q1'), (1062, 86.25, 'q2'), (1064, 87.25, 'q3'), (1066, 88.25, 'q4'), (1068, 0.25, 'q5'), (1070, 1.25, 'q6'), (1072, 2.25, 'q7'), (1074, 3.25, 'q8'), (1076, 4.25, 'q9'), (1078, 5.25, 'q10'), (1080, 6.25, 'q11'), (1082, 7.25, 'q12'), (1084, 8.25, 'q13'), (1086, 9.25, 'q14'), (1088, 10.25, 'q15'), (1090, 11.25, 'q16'), (1092, 12.25, 'q17'), (1094, 13.25, 'q18'), (1096, 14.25, 'q19'), (1098, 15.25, 'q20'), (1100, 16.25, 'q21'), (1102, 17.25, 'q22'), (1104, 18.25, 'q0'), (1106, 19.25, 'q1'), (1108, 20.25, 'q2'), (1110, 21.25, 'q3'), (1112, 22.25, 'q4'), (1114, 23.25, 'q5'), (1116, 24.25, 'q6'), (1118, 25.25, 'q7'), (1120, 26.25, 'q8'), (1122, 27.25, 'q9'), (1124, 28.25, 'q10'), (1126, 29.25, 'q11'), (1128, 30.25, 'q12'), (1130, 31.25, 'q13'), (1132, 32.25, 'q14'), (1134, 33.25, 'q15'), (1136, 34.25, 'q16'), (1138, 35.25, 'q17'), (1140, 36.25, 'q18'), (1142, 37.25, 'q19'), (1144, 38.25, 'q20'), (1146, 39.25, 'q21'), (1148, 40.25, 'q22'), (1150, 41.25, 'q0'), (1152, 42.25, 'q1'), (1154, 43.25, 'q2'), (1156, 44.25, 'q3'), (1158, 45.25, 'q4'), (1160, 46.25, 'q5'), (1162, 47.25, 'q6'), (1164, 48.25, 'q7'), (1166, 49.25, 'q8'), (1168, 50.25, 'q9'), (1170, 51.25, 'q10'), (1172, 52.25, 'q11'), (1174, 53.25, 'q12'), (1176, 54.25, 'q13'), (1178, 55.25, 'q14'), (1180, 56.25, 'q15'), (1182, 57.25, 'q16'), (1184, 58.25, 'q17'), (1186, 59.25, 'q18'), (1188, 60.25, 'q19'), (1190, 61.25, 'q20'), (1192, 62.25, 'q21'), (1194, 63.25, 'q22'), (1196, 64.25, 'q0'), (1198, 65.25, 'q1'), (1200, 66.25, 'q2'), (1202, 67.25, 'q3'), (1204, 68.25, 'q4'), (1206, 69.25, 'q5'), (1208, 70.25, 'q6'), (1210, 71.25, 'q7'), (1212, 72.25, 'q8'), (1214, 73.25, 'q9'), (1216, 74.25, 'q10'), (1218, 75.25, 'q11'), (1220, 76.25, 'q12'), (1222, 77.25, 'q13'), (1224, 78.25, 'q14'), (1226, 79.25, 'q15'), (1228, 80.25, 'q16'), (1230, 81.25, 'q17'), (1232, 82.25, 'q18'), (1234, 83.25, 'q19'), (1236, 84.25, 'q20'), (1238, 85.25, 'q21'), (1240, 86.25, 'q22'), (1242, 87.25, 'q0'), (1244, 88.25, 'q1'), (1246, 0.25, 'q2'), (1248, 1.25, 'q3'), (1250, 2.25, 'q4'), (1252, 3.25, 'q5'), (1254, 4.25, 'q6'), (1256, 5.25, 'q7'), (1258, 6.25, 'q8'), (1260, 7.25, 'q9'), (1262, 8.25, 'q10'), (1264, 9.25, 'q11'), (1266, 10.25, 'q12'), (1268, 11.25, 'q13'), (1270, 12.25, 'q14'), (1272, 13.25, 'q15'), (1274, 14.25, 'q16'), (1276, 15.25, 'q17'), (1278, 16.25, 'q18'), (1280, 17.25, 'q19'), (1282, 18.25, 'q20'), (1284, 19.25, 'q21'), (1286, 20.25, 'q22'), (1288, 21.25, 'q0'), (1290, 22.25, 'q1'), (1292, 23.25, 'q2'), (1294, 24.25, 'q3'), (1296, 25.25, 'q4'), (1298, 26.25, 'q5'), (1300, 27.25, 'q6'), (1302, 28.25, 'q7'), (1304, 29.25, 'q8'), (1306, 30.25, 'q9'), (1308, 31.25, 'q10'), (1310, 32.25, 'q11'), (1312, 33.25, 'q12'), (1314, 34.25, 'q13'), (1316, 35.25, 'q14'), (1318, 36.25, 'q15'), (1320, 37.25, 'q16'), (1322, 38.25, 'q17'), (1324, 39.25, 'q18'), (1326, 40.25, 'q19'), (1328, 41.25, 'q20'), (1330, 42.25, 'q21'), (1332, 43.25, 'q22'), (1334, 44.25, 'q0'), (1336, 45.25, 'q1'), (1338, 46.25, 'q2'), (1340, 47.25, 'q3'), (1342, 48.25, 'q4'), (1344, 49.25, 'q5'), (1346, 50.25, 'q6'), (1348, 51.25, 'q7'), (1350, 52.25, 'q8'), (1352, 53.25, 'q9'), (1354, 54.25, 'q10'), (1356, 55.25, 'q11'), (1358, 56.25, 'q12'), (1360, 57.25, 'q13'), (1362, 58.25, 'q14'), (1364, 59.25, 'q15'), (1366, 60.25, 'q16'), (1368, 61.25, 'q17'), (1370, 62.25, 'q18'), (1372, 63.25, 'q19'), (1374, 64.25, 'q20'), (1376, 65.25, 'q21'), (1378, 66.25, 'q22'), (1380, 67.25, 'q0'), (1382, 68.25, 'q1'), (1384, 69.25, 'q2'), (1386, 70.25, 'q3'), (1388, 71.25, 'q4'), (1390, 72.25, 'q5'), (1392, 73.25, 'q6'), (1394, 74.25, 'q7'), (1396, 75.25, 'q8'), (1398, 76.25, 'q9'), (1400, 77.25, 'q10'), (1402, 78.25, 'q11'), (1404, 79.25, 'q12'), (1406, 80.25, 'q13'), (1408, 81.25, 'q14'), (1410, 82.25, 'q15'), (1412, 83.25, 'q16'), (1414, 84.25, 'q17'), (1416, 85.25, 'q18'), (1418, 86.25, 'q19'), (1420, 87.25, 'q20'), (1422, 88.25, 'q21'), (1424, 0.25, 'q22'), (1426, 1.25, 'q0'), (1428, 2.25, 'q1'), (1430, 3.25, 'q2'), (1432, 4.25, 'q3'), (1434, 5.25, 'q4'), (1436, 6.25, 'q5'), (1438, 7.25, 'q6'), (1440, 8.25, 'q7'), (1442, 9.25, 'q8'), (1444, 10.25, 'q9'), (1446, 11.25, 'q10'), (1448, 12.25, 'q11'), (1450, 13.25, 'q12'), (1452, 14.25, 'q13'), (1454, 15.25, 'q14'), (1456, 16.25, 'q15'), (1458, 17.25, 'q16'), (1460, 18.25, 'q17'), (1462, 19.25, 'q18'), (1464, 20.25, 'q19'), (1466, 21.25, 'q20'), (1468, 22.25, 'q21'), (1470, 23.25, 'q22'), (1472, 24.25, 'q0'), (1474, 25.25, 'q1'), (1476, 26.25, 'q2'), (1478, 27.25, 'q3'), (1480, 28.25, 'q4'), (1482, 29.25, 'q5'), (1484, 30.25, 'q6'), (1486, 31.25, 'q7'), (1488, 32.25, 'q8'), (1490, 33.25, 'q9'), (1492, 34.25, 'q10'), (1494, 35.25, 'q11'), (1496, 36.25, 'q12'), (1498, 37.25, 'q13'), (1500, 38.25, 'q14'), (1502, 39.25, 'q15'), (1504, 40.25, 'q16'), (1506, 41.25, 'q17'), (1508, 42.25, 'q18'), (1510, 43.25, 'q19'), (1512, 44.25, 'q20'), (1514, 45.25, 'q21'), (1516, 46.25, 'q22'), (1518, 47.25, 'q0'), (1520, 48.25, 'q1'), (1522, 49.25, 'q2'), (1524, 50.25, 'q3'), (1526, 51.25, 'q4'), (1528, 52.25, 'q5'), (1530, 53.25, 'q6'), (1532, 54.25, 'q7'), (1534, 55.25, 'q8'), (1536, 56.25, 'q9'), (1538, 57.25, 'q10'), (1540, 58.25, 'q11'), (1542, 59.25, 'q12'), (1544, 60.25, 'q13'), (1546, 61.25, 'q14'), (1548, 62.25, 'q15'), (1550, 63.25, 'q16'), (1552, 64.25, 'q17'), (1554, 65.25, 'q18'), (1556, 66.25, 'q19'), (1558, 67.25, 'q20'), (1560, 68.25, 'q21'), (1562, 69.25, 'q22'), (1564, 70.25, 'q0'), (1566, 71.25, 'q1'), (1568, 72.25, 'q2'), (1570, 73.25, 'q3'), (1572, 74.25, 'q4'), (1574, 75.25, 'q5'), (1576, 76.25, 'q6'), (1578, 77.25, 'q7'), (1580, 78.25, 'q8'), (1582, 79.25, 'q9'), (1584, 80.25, 'q10'), (1586, 81.25, 'q11'), (1588, 82.25, 'q12'), (1590, 83.25, 'q13'), (1592, 84.25, 'q14'), (1594, 85.25, 'q15'), (1596, 86.25, 'q16'), (1598, 87.25, 'q17'), (1600, 88.25, 'q18'), (1602, 0.25, 'q19'), (1604, 1.25, 'q20'), (1606, 2.25, 'q21'), (1608, 3.25, 'q22'), (1610, 4.25, 'q0'), (1612, 5.25, 'q1'), (1614, 6.25, 'q2'), (1616, 7.25, 'q3'), (1618, 8.25, 'q4'), (1620, 9.25, 'q5'), (1622, 10.25, 'q6'), (1624, 11.25, 'q7'), (1626, 12.25, 'q8'), (1628, 13.25, 'q9'), (1630, 14.25, 'q10'), (1632, 15.25, 'q11'), (1634, 16.25, 'q12'), (1636, 17.25, 'q13'), (1638, 18.25, 'q14'), (1640, 19.25, 'q15'), (1642, 20.25, 'q16'), (1644, 21.25, 'q17'), (1646, 22.25, 'q18'), (1648, 23.25, 'q19'), (1650, 24.25, 'q20'), (1652, 25.25, 'q21'), (1654, 26.25, 'q22'), (1656, 27.25, 'q0'), (1658, 28.25, 'q1'), (1660, 29.25, 'q2'), (1662, 30.25, 'q3'), (1664, 31.25, 'q4'), (1666, 32.25, 'q5'), (1668, 33.25, 'q6'), (1670, 34.25, 'q7'), (1672, 35.25, 'q8'), (1674, 36.25, 'q9'), (1676, 37.25, 'q10'), (1678, 38.25, 'q11'), (1680, 39.25, 'q12'), (1682, 40.25, 'q13'), (1684, 41.25, 'q14'), (1686, 42.25, 'q15'), (1688, 43.25, 'q16'), (1690, 44.25, 'q17'), (1692, 45.25, 'q18'), (1694, 46.25, 'q19'), (1696, 47.25, 'q20'), (1698, 48.25, 'q21'), (1700, 49.25, 'q22'), (1702, 50.25, 'q0'), (1704, 51.25, 'q1'), (1706, 52.25, 'q2'), (1708, 53.25, 'q3'), (1710, 54.25, 'q4'), (1712, 55.25, 'q5'), (1714, 56.25, 'q6'), (1716, 57.25, 'q7'), (1718, 58.25, 'q8'), (1720, 59.25, 'q9'), (1722, 60.25, 'q10'), (1724, 61.25, 'q11'), (1726, 62.25, 'q12'), (1728, 63.25, 'q13'), (1730, 64.25, 'q14'), (1732, 65.25, 'q15'), (1734, 66.25, 'q16'), (1736, 67.25, 'q17'), (1738, 68.25, 'q18'), (1740, 69.25, 'q19'), (1742, 70.25, 'q20'), (1744, 71.25, 'q21'), (1746, 72.25, 'q22'), (1748, 73.25, 'q0'), (1750, 74.25, 'q1'), (1752, 75.25, 'q2'), (1754, 76.25, 'q3'), (1756, 77.25, 'q4'), (1758, 78.25, 'q5'), (1760, 79.25, 'q6'), (1762, 80.25, 'q7'), (1764, 81.25, 'q8'), (1766, 82.25, 'q9'), (1768, 83.25, 'q10'), (1770, 84.25, 'q11'), (1772, 85.25, 'q12'), (1774, 86.25, 'q13'), (1776, 87.25, 'q14'), (1778, 88.25, 'q15'), (1780, 0.25, 'q16'), (1782, 1.25, 'q17'), (1784, 2.25, 'q18'), (1786, 3.25, 'q19'), (1788, 4.25, 'q20'), (1790, 5.25, 'q21'), (1792, 6.25, 'q22'), (1794, 7.25, 'q0'), (1796, 8.25, 'q1'), (1798, 9.25, 'q2'), (1800, 10.25, 'q3'), (1802, 11.25, 'q4'), (1804, 12.25, 'q5'), (1806, 13.25, 'q6'), (1808, 14.25, 'q7'), (1810, 15.25, 'q8'), (1812, 16.25, 'q9'), (1814, 17.25, 'q10'), (1816, 18.25, 'q11'), (1818, 19.25, 'q12'), (1820, 20.25, 'q13'), (1822, 21.25, 'q14'), (1824, 22.25, 'q15'), (1826, 23.25, 'q16'), (1828, 24.25, 'q17'), (1830, 25.25, 'q18'), (1832, 26.25, 'q19'), (1834, 27.25, 'q20'), (1836, 28.25, 'q21'), (1838, 29.25, 'q22'), (1840, 30.25, 'q0'), (1842, 31.25, 'q1'), (1844, 32.25, 'q2'), (1846, 33.25, 'q3'), (1848, 34.25, 'q4'), (1850, 35.25, 'q5'), (1852, 36.25, 'q6'), (1854, 37.25, 'q7'), (1856, 38.25, 'q8'), (1858, 39.25, 'q9'), (1860, 40.25, 'q10'), (1862, 41.25, 'q11'), (1864, 42.25, 'q12'), (1866, 43.25, 'q13'), (1868, 44.25, 'q14'), (1870, 45.25, 'q15'), (1872, 46.25, 'q16'), (1874, 47.25, 'q17'), (1876, 48.25, 'q18'), (1878, 49.25, 'q19'), (1880, 50.25, 'q20'), (1882, 51.25, 'q21'), (1884, 52.25, 'q22'), (1886, 53.25, 'q0'), (1888, 54.25, 'q1'), (1890, 55.25, 'q2'), (1892, 56.25, 'q3'), (1894, 57.25, 'q4'), (1896, 58.25, 'q5'), (1898, 59.25, 'q6'), (1900, 60.25, 'q7'), (1902, 61.25, 'q8'), (1904, 62.25, 'q9'), (1906, 63.25, 'q10'), (1908, 64.25, 'q11'), (1910, 65.25, 'q12'), (1912, 66.25, 'q13'), (1914, 67.25, 'q14'), (1916, 68.25, 'q15'), (1918, 69.25, 'q16'), (1920, 70.25, 'q17'), (1922, 71.25, 'q18'), (1924, 72.25, 'q19'), (1926, 73.25, 'q20'), (1928, 74.25, 'q21'), (1930, 75.25, 'q22'), (1932, 76.25, 'q0'), (1934, 77.25, 'q1'), (1936, 78.25, 'q2'), (1938, 79.25, 'q3'), (1940, 80.25, 'q4'), (1942, 81.25, 'q5'), (1944, 82.25, 'q6'), (1946, 83.25, 'q7'), (1948, 84.25, 'q8'), (1950, 85.25, 'q9'), (1952, 86.25, 'q10'), (1954, 87.25, 'q11'), (1956, 88.25, 'q12'), (1958, 0.25, 'q13'), (1960, 1.25, 'q14'), (1962, 2.25, 'q15'), (1964, 3.25, 'q16'), (1966, 4.25, 'q17'), (1968, 5.25, 'q18'), (1970, 6.25, 'q19'), (1972, 7.25, 'q20'), (1974, 8.25, 'q21'), (1976, 9.25, 'q22'), (1978, 10.25, 'q0'), (1980, 11.25, 'q1'), (1982, 12.25, 'q2'), (1984, 13.25, 'q3'), (1986, 14.25, 'q4'), (1988, 15.25, 'q5'), (1990, 16.25, 'q6'), (1992, 17.25, 'q7'), (1994, 18.25, 'q8'), (1996, 19.25, 'q9'), (1998, 20.25, 'q10'), (2000, 21.25, 'q11'), (2002, 22.25, 'q12'), (2004, 23.25, 'q13'), (2006, 24.25, 'q14'), (2008, 25.25, 'q15'), (2010, 26.25, 'q16'), (2012, 27.25, 'q17'), (2014, 28.25, 'q18'), (2016, 29.25, 'q19'), (2018, 30.25, 'q20'), (2020, 31.25, 'q21'), (2022, 32.25, 'q22'), (2024, 33.25, 'q0'), (2026, 34.25, 'q1'), (2028, 35.25, 'q2'), (2030, 36.25, 'q3'), (2032, 37.25, 'q4'), (2034, 38.25, 'q5'), (2036, 39.25, 'q6'), (2038, 40.25, 'q7'), (2040, 41.25, 'q8'), (2042, 42.25, 'q9'), (2044, 43.25, 'q10'), (2046, 44.25, 'q11'), (2048, 45.25, 'q12'), (2050, 46.25, 'q13'), (2052, 47.25, 'q14'), (2054, 48.25, 'q15'), (2056, 49.25, 'q16'), (2058, 50.25, 'q17'), (2060, 51.25, 'q18'), (2062, 52.25, 'q19'), (2064, 53.25, 'q20'), (2066, 54.25, 'q21'), (2068, 55.25, 'q22'), (2070, 56.25, 'q0'), (2072, 57.25, 'q1'), (2074, 58.25, 'q2'), (2076, 59.25, 'q3'), (2078, 60.25, 'q4'), (2080, 61.25, 'q5'), (2082, 62.25, 'q6'), (2084, 63.25, 'q7'), (2086, 64.25, 'q8'), (2088, 65.25, 'q9'), (2090, 66.25, 'q10'), (2092, 67.25, 'q11'), (2094, 68.25, 'q12'), (2096, 69.25, 'q13'), (2098, 70.25, 'q14'), (2100, 71.25, 'q15'), (2102, 72.25, 'q16'), (2104, 73.25, 'q17'), (2106, 74.25, 'q18'), (2108, 75.25, 'q19'), (2110, 76.25, 'q20'), (2112, 77.25, 'q21'), (2114, 78.25, 'q22'), (2116, 79.25, 'q0'), (2118, 80.25, 'q1'), (2120, 81.25, 'q2'), (2122, 82.25, 'q3'), (2124, 83.25, 'q4'), (2126, 84.25, 'q5'), (2128, 85.25, 'q6'), (2130, 86.25, 'q7'), (2132, 87.25, 'q8'), (2134, 88.25, 'q9'), (2136, 0.25, 'q10'), (2138, 1.25, 'q11'), (2140, 2.25, 'q12'), (2142, 3.25, 'q13'), (2144, 4.25, 'q14'), (2146, 5.25, 'q15'), (2148, 6.25, 'q16'), (2150, 7.25, 'q17'), (2152, 8.25, 'q18'), (2154, 9.25, 'q19'), (2156, 10.25, 'q20'), (2158, 11.25, 'q21'), (2160, 12.25, 'q22'), (2162, 13.25, 'q0'), (2164, 14.25, 'q1'), (2166, 15.25, 'q2'), (2168, 16.25, 'q3'), (2170, 17.25, 'q4'), (2172, 18.25, 'q5'), (2174, 19.25, 'q6'), (2176, 20.25, 'q7'), (2178, 21.25, 'q8'), (2180, 22.25, 'q9'), (2182, 23.25, 'q10'), (2184, 24.25, 'q11'), (2186, 25.25, 'q12'), (2188, 26.25, 'q13'), (2190, 27.25, 'q14'), (2192, 28.25, 'q15'), (2194, 29.25, 'q16'), (2196, 30.25, 'q17'), (2198, 31.25, 'q18'), (2200, 32.25, 'q19'), (2202, 33.25, 'q20'), (2204, 34.25, 'q21'), (2206, 35.25, 'q22'), (2208, 36.25, 'q0'), (2210, 37.25, 'q1'), (2212, 38.25, 'q2'), (2214, 39.25, 'q3'), (2216, 40.25, 'q4'), (2218, 41.25, 'q5'), (2220, 42.25, 'q6'), (2222, 43.25, 'q7'), (2224, 44.25, 'q8'), (2226, 45.25, 'q9'), (2228, 46.25, 'q10'), (2230, 47.25, 'q11'), (2232, 48.25, 'q12'), (2234, 49.25, 'q13'), (2236, 50.25, 'q14'), (2238, 51.25, 'q15'), (2240, 52.25, 'q16'), (2242, 53.25, 'q17'), (2244, 54.25, 'q18'), (2246, 55.25, 'q19'), (2248, 56.25, 'q20'), (2250, 57.25, 'q21'), (2252, 58.25, 'q22'), (2254, 59.25, 'q0'), (2256, 60.25, 'q1'), (2258, 61.25, 'q2'), (2260, 62.25, 'q3'), (2262, 63.25, 'q4'), (2264, 64.25, 'q5'), (2266, 65.25, 'q6'), (2268, 66.25, 'q7'), (2270, 67.25, 'q8'), (2272, 68.25, 'q9'), (2274, 69.25, 'q10'), (2276, 70.25, 'q11'), (2278, 71.25, 'q12'), (2280, 72.25, 'q13'), (2282, 73.25, 'q14'), (2284, 74.25, 'q15'), (2286, 75.25, 'q16'), (2288, 76.25, 'q17'), (2290, 77.25, 'q18'), (2292, 78.25, 'q19'), (2294, 79.25, 'q20'), (2296, 80.25, 'q21'), (2298, 81.25, 'q22'), (2300, 82.25, 'q0'), (2302, 83.25, 'q1'), (2304, 84.25, 'q2'), (2306, 85.25, 'q3'), (2308, 86.25, 'q4'), (2310, 87.25, 'q5'), (2312, 88.25, 'q6'), (2314, 0.25, 'q7'), (2316, 1.25, 'q8'), (2318, 2.25, 'q9'), (2320, 3.25, 'q10'), (2322, 4.25, 'q11'), (2324, 5.25, 'q12'), (2326, 6.25, 'q13'), (2328, 7.25, 'q14'), (2330, 8.25, 'q15'), (2332, 9.25, 'q16'), (2334, 10.25, 'q17'), (2336, 11.25, 'q18'), (2338, 12.25, 'q19'), (2340, 13.25, 'q20'), (2342, 14.25, 'q21'), (2344, 15.25, 'q22'), (2346, 16.25, 'q0'), (2348, 17.25, 'q1'), (2350, 18.25, 'q2'), (2352, 19.25, 'q3'), (2354, 20.25, 'q4'), (2356, 21.25, 'q5'), (2358, 22.25, 'q6'), (2360, 23.25, 'q7'), (2362, 24.25, 'q8'), (2364, 25.25, 'q9'), (2366, 26.25, 'q10'), (2368, 27.25, 'q11'), (2370, 28.25, 'q12'), (2372, 29.25, 'q13'), (2374, 30.25, 'q14'), (2376, 31.25, 'q15'), (2378, 32.25, 'q16'), (2380, 33.25, 'q17'), (2382, 34.25, 'q18'), (2384, 35.25, 'q19'), (2386, 36.25, 'q20'), (2388, 37.25, 'q21'), (2390, 38.25, 'q22'), (2392, 39.25, 'q0'), (2394, 40.25, 'q1'), (2396, 41.25, 'q2'), (2398, 42.25, 'q3'), (2400, 43.25, 'q4'), (2402, 44.25, 'q5'), (2404, 45.25, 'q6'), (2406, 46.25, 'q7'), (2408, 47.25, 'q8'), (2410, 48.25, 'q9'), (2412, 49.25, 'q10'), (2414, 50.25, 'q11'), (2416, 51.25, 'q12'), (2418, 52.25, 'q13'), (2420, 53.25, 'q14'), (2422, 54.25, 'q15'), (2424, 55.25, 'q16'), (2426, 56.25, 'q17'), (2428, 57.25, 'q18'), (2430, 58.25, 'q19'), (2432, 59.25, 'q20'), (2434, 60.25, 'q21'), (2436, 61.25, 'q22'), (2438, 62.25, 'q0'), (2440, 63.25, 'q1'), (2442, 64.25, 'q2'), (2444, 65.25, 'q3'), (2446, 66.25, 'q4'), (2448, 67.25, 'q5'), (2450, 68.25, 'q6'), (2452, 69.25, 'q7'), (2454, 70.25, 'q8'), (2456, 71.25, 'q9'), (2458, 72.25, 'q10'), (2460, 73.25, 'q11'), (2462, 74.25, 'q12'), (2464, 75.25, 'q13'), (2466, 76.25, 'q14'), (2468, 77.25, 'q15'), (2470, 78.25, 'q16'), (2472, 79.25, 'q17'), (2474, 80.25, 'q18'), (2476, 81.25, 'q19'), (2478, 82.25, 'q20'), (2480, 83.25, 'q21'), (2482, 84.25, 'q22'), (2484, 85.25, 'q0'), (2486, 86.25, 'q1'), (2488, 87.25, 'q2'), (2490, 88.25, 'q3'), (2492, 0.25, 'q4'), (2494, 1.25, 'q5'), (2496, 2.25, 'q6'), (2498, 3.25, 'q7'), (2500, 4.25, 'q8'), (2502, 5.25, 'q9'), (2504, 6.25, 'q10'), (2506, 7.25, 'q11'), (2508, 8.25, 'q12'), (2510, 9.25, 'q13'), (2512, 10.25, 'q14'), (2514, 11.25, 'q15'), (2516, 12.25, 'q16'), (2518, 13.25, 'q17'), (2520, 14.25, 'q18'), (2522, 15.25, 'q19'), (2524, 16.25, 'q20'), (2526, 17.25, 'q21'), (2528, 18.25, 'q22'), (2530, 19.25, 'q0'), (2532, 20.25, 'q1'), (2534, 21.25, 'q2'), (2536, 22.25, 'q3'), (2538, 23.25, 'q4'), (2540, 24.25, 'q5'), (2542, 25.25, 'q6'), (2544, 26.25, 'q7'), (2546, 27.25, 'q8'), (2548, 28.25, 'q9'), (2550, 29.25, 'q10'), (2552, 30.25, 'q11'), (2554, 31.25, 'q12'), (2556, 32.25, 'q13'), (2558, 33.25, 'q14'), (2560, 34.25, 'q15'), (2562, 35.25, 'q16'), (2564, 36.25, 'q17'), (2566, 37.25, 'q18'), (2568, 38.25, 'q19'), (2570, 39.25, 'q20'), (2572, 40.25, 'q21'), (2574, 41.25, 'q22'), (2576, 42.25, 'q0'), (2578, 43.25, 'q1'), (2580, 44.25, 'q2'), (2582, 45.25, 'q3'), (2584, 46.25, 'q4'), (2586, 47.25, 'q5'), (2588, 48.25, 'q6'), (2590, 49.25, 'q7'), (2592, 50.25, 'q8'), (2594, 51.25, 'q9'), (2596, 52.25, 'q10'), (2598, 53.25, 'q11'), (2600, 54.25, 'q12'), (2602, 55.25, 'q13'), (2604, 56.25, 'q14'), (2606, 57.25, 'q15'), (2608, 58.25, 'q16'), (2610, 59.25, 'q17'), (2612, 60.25, 'q18'), (2614, 61.25, 'q19'), (2616, 62.25, 'q20'), (2618, 63.25, 'q21'), (2620, 64.25, 'q22'), (2622, 65.25, 'q0'), (2624, 66.25, 'q1'), (2626, 67.25, 'q2'), (2628, 68.25, 'q3'), (2630, 69.25, 'q4'), (2632, 70.25, 'q5'), (2634, 71.25, 'q6'), (2636, 72.25, 'q7'), (2638, 73.25, 'q8'), (2640, 74.25, 'q9'), (2642, 75.25, 'q10'), (2644, 76.25, 'q11'), (2646, 77.25, 'q12'), (2648, 78.25, 'q13'), (2650, 79.25, 'q14'), (2652, 80.25, 'q15'), (2654, 81.25, 'q16'), (2656, 82.25, 'q17'), (2658, 83.25, 'q18'), (2660, 84.25, 'q19'), (2662, 85.25, 'q20'), (2664, 86.25, 'q21'), (2666, 87.25, 'q22'), (2668, 88.25, 'q0'), (2670, 0.25, 'q1'), (2672, 1.25, 'q2'), (2674, 2.25, 'q3'), (2676, 3.25, 'q4'), (2678, 4.25, 'q5'), (2680, 5.25, 'q6'), (2682, 6.25, 'q7'), (2684, 7.25, 'q8'), (2686, 8.25, 'q9'), (2688, 9.25, 'q10'), (2690, 10.25, 'q11'), (2692, 11.25, 'q12'), (2694, 12.25, 'q13'), (2696, 13.25, 'q14'), (2698, 14.25, 'q15'), (2700, 15.25, 'q16'), (2702, 16.25, 'q17'), (2704, 17.25, 'q18'), (2706, 18.25, 'q19'), (2708, 19.25, 'q20'), (2710, 20.25, 'q21'), (2712, 21.25, 'q22'), (2714, 22.25, 'q0'), (2716, 23.25, 'q1'), (2718, 24.25, 'q2'), (2720, 25.25, 'q3'), (2722, 26.25, 'q4'), (2724, 27.25, 'q5'), (2726, 28.25, 'q6'), (2728, 29.25, 'q7'), (2730, 30.25, 'q8'), (2732, 31.25, 'q9'), (2734, 32.25, 'q10'), (2736, 33.25, 'q11'), (2738, 34.25, 'q12'), (2740, 35.25, 'q13'), (2742, 36.25, 'q14'), (2744, 37.25, 'q15'), (2746, 38.25, 'q16'), (2748, 39.25, 'q17'), (2750, 40.25, 'q18'), (2752, 41.25, 'q19'), (2754, 42.25, 'q20'), (2756, 43.25, 'q21'), (2758, 44.25, 'q22'), (2760, 45.25, 'q0'), (2762, 46.25, 'q1'), (2764, 47.25, 'q2'), (2766, 48.25, 'q3'), (2768, 49.25, 'q4'), (2770, 50.25, 'q5'), (2772, 51.25, 'q6'), (2774, 52.25, 'q7'), (2776, 53.25, 'q8'), (2778, 54.25, 'q9'), (2780, 55.25, 'q10'), (2782, 56.25, 'q11'), (2784, 57.25, 'q12'), (2786, 58.25, 'q13'), (2788, 59.25, 'q14'), (2790, 60.25, 'q15'), (2792, 61.25, 'q16'), (2794, 62.25, 'q17'), (2796, 63.25, 'q18'), (2798, 64.25, 'q19'), (2800, 65.25, 'q20'), (2802, 66.25, 'q21'), (2804, 67.25, 'q22'), (2806, 68.25, 'q0'), (2808, 69.25, 'q1'), (2810, 70.25, 'q2'), (2812, 71.25, 'q3'), (2814, 72.25, 'q4'), (2816, 73.25, 'q5'), (2818, 74.25, 'q6'), (2820, 75.25, 'q7'), (2822, 76.25, 'q8'), (2824, 77.25, 'q9'), (2826, 78.25, 'q10'), (2828, 79.25, 'q11'), (2830, 80.25, 'q12'), (2832, 81.25, 'q13'), (2834, 82.25, 'q14'), (2836, 83.25, 'q15'), (2838, 84.25, 'q16'), (2840, 85.25, 'q17'), (2842, 86.25, 'q18'), (2844, 87.25, 'q19'), (2846, 88.25, 'q20'), (2848, 0.25, 'q21'), (2850, 1.25, 'q22'), (2852, 2.25, 'q0'), (2854, 3.25, 'q1'), (2856, 4.25, 'q2'), (2858, 5.25, 'q3'), (2860, 6.25, 'q4'), (2862, 7.25, 'q5'), (2864, 8.25, 'q6'), (2866, 9.25, 'q7'), (2868, 10.25, 'q8'), (2870, 11.25, 'q9'), (2872, 12.25, 'q10'), (2874, 13.25, 'q11'), (2876, 14.25, 'q12'), (2878, 15.25, 'q13'), (2880, 16.25, 'q14'), (2882, 17.25, 'q15'), (2884, 18.25, 'q16'), (2886, 19.25, 'q17'), (2888, 20.25, 'q18'), (2890, 21.25, 'q19'), (2892, 22.25, 'q20'), (2894, 23.25, 'q21'), (2896, 24.25, 'q22'), (2898, 25.25, 'q0'), (2900, 26.25, 'q1'), (2902, 27.25, 'q2'), (2904, 28.25, 'q3'), (2906, 29.25, 'q4'), (2908, 30.25, 'q5'), (2910, 31.25, 'q6'), (2912, 32.25, 'q7'), (2914, 33.25, 'q8'), (2916, 34.25, 'q9'), (2918, 35.25, 'q10'), (2920, 36.25, 'q11'), (2922, 37.25, 'q12'), (2924, 38.25, 'q13'), (2926, 39.25, 'q14'), (2928, 40.25, 'q15'), (2930, 41.25, 'q16'), (2932, 42.25, 'q17'), (2934, 43.25, 'q18'), (2936, 44.25, 'q19'), (2938, 45.25, 'q20'), (2940, 46.25, 'q21'), (2942, 47.25, 'q22'), (2944, 48.25, 'q0'), (2946, 49.25, 'q1'), (2948, 50.25, 'q2'), (2950, 51.25, 'q3'), (2952, 52.25, 'q4'), (2954, 53.25, 'q5'), (2956, 54.25, 'q6'), (2958, 55.25, 'q7'), (2960, 56.25, 'q8'), (2962, 57.25, 'q9'), (2964, 58.25, 'q10'), (2966, 59.25, 'q11'), (2968, 60.25, 'q12'), (2970, 61.25, 'q13'), (2972, 62.25, 'q14'), (2974, 63.25, 'q15'), (2976, 64.25, 'q16'), (2978, 65.25, 'q17'), (2980, 66.25, 'q18'), (2982, 67.25, 'q19'), (2984, 68.25, 'q20'), (2986, 69.25, 'q21'), (2988, 70.25, 'q22'), (2990, 71.25, 'q0'), (2992, 72.25, 'q1'), (2994, 73.25, 'q2'), (2996, 74.25, 'q3'), (2998, 75.25, 'q4'), (3000, 76.25, 'q5'), (3002, 77.25, 'q6'), (3004, 78.25, 'q7'), (3006, 79.25, 'q8'), (3008, 80.25, 'q9'), (3010, 81.25, 'q10'), (3012, 82.25, 'q11'), (3014, 83.25, 'q12'), (3016, 84.25, 'q13'), (3018, 85.25, 'q14'), (3020, 86.25, 'q15'), (3022, 87.25, 'q16'), (3024, 88.25, 'q17'), (3026, 0.25, 'q18'), (3028, 1.25, 'q19'), (3030, 2.25, 'q20'), (3032, 3.25, 'q21'), (3034, 4.25, 'q22'), (3036, 5.25, 'q0'), (3038, 6.25, 'q1'), (3040, 7.25, 'q2'), (3042, 8.25, 'q3'), (3044, 9.25, 'q4'), (3046, 10.25, 'q5'), (3048, 11.25, 'q6'), (3050, 12.25, 'q7'), (3052, 13.25, 'q8'), (3054, 14.25, 'q9'), (3056, 15.25, 'q10'), (3058, 16.25, 'q11'), (3060, 17.25, 'q12'), (3062, 18.25, 'q13'), (3064, 19.25, 'q14'), (3066, 20.25, 'q15'), (3068, 21.25, 'q16'), (3070, 22.25, 'q17'), (3072, 23.25, 'q18'), (3074, 24.25, 'q19'), (3076, 25.25, 'q20'), (3078, 26.25, 'q21'), (3080, 27.25, 'q22'), (3082, 28.25, 'q0'), (3084, 29.25, 'q1'), (3086, 30.25, 'q2'), (3088, 31.25, 'q3'), (3090, 32.25, 'q4'), (3092, 33.25, 'q5'), (3094, 34.25, 'q6'), (3096, 35.25, 'q7'), (3098, 36.25, 'q8'), (3100, 37.25, 'q9'), (3102, 38.25, 'q10'), (3104, 39.25, 'q11'), (3106, 40.25, 'q12'), (3108, 41.25, 'q13'), (3110, 42.25, 'q14'), (3112, 43.25, 'q15'), (3114, 44.25, 'q16'), (3116, 45.25, 'q17'), (3118, 46.25, 'q18'), (3120, 47.25, 'q19'), (3122, 48.25, 'q20'), (3124, 49.25, 'q21'), (3126, 50.25, 'q22'), (3128, 51.25, 'q0'), (3130, 52.25, 'q1'), (3132, 53.25, 'q2'), (3134, 54.25, 'q3'), (3136, 55.25, 'q4'), (3138, 56.25, 'q5'), (3140, 57.25, 'q6'), (3142, 58.25, 'q7'), (3144, 59.25, 'q8'), (3146, 60.25, 'q9'), (3148, 61.25, 'q10'), (3150, 62.25, 'q11'), (3152, 63.25, 'q12'), (3154, 64.25, 'q13'), (3156, 65.25, 'q14'), (3158, 66.25, 'q15'), (3160, 67.25, 'q16'), (3162, 68.25, 'q17'), (3164, 69.25, 'q18'), (3166, 70.25, 'q19'), (3168, 71.25, 'q20'), (3170, 72.25, 'q21'), (3172, 73.25, 'q22'), (3174, 74.25, 'q0'), (3176, 75.25, 'q1'), (3178, 76.25, 'q2'), (3180, 77.25, 'q3'), (3182, 78.25, 'q4'), (3184, 79.25, 'q5'), (3186, 80.25, 'q6'), (3188, 81.25, 'q7'), (3190, 82.25, 'q8'), (3192, 83.25, 'q9'), (3194, 84.25, 'q10'), (3196, 85.25, 'q11'), (3198, 86.25, 'q12'), (3200, 87.25, 'q13'), (3202, 88.25, 'q14'), (3204, 0.25, 'q15'), (3206, 1.25, 'q16'), (3208, 2.25, 'q17'), (3210, 3.25, 'q18'), (3212, 4.25, 'q19'), (3214, 5.25, 'q20'), (3216, 6.25, 'q21'), (3218, 7.25, 'q22'), (3220, 8.25, 'q0'), (3222, 9.25, 'q1'), (3224, 10.25, 'q2'), (3226, 11.25, 'q3'), (3228, 12.25, 'q4'), (3230, 13.25, 'q5'), (3232, 14.25, 'q6'), (3234, 15.25, 'q7'), (3236, 16.25, 'q8'), (3238, 17.25, 'q9'), (3240, 18.25, 'q10'), (3242, 19.25, 'q11'), (3244, 20.25, 'q12'), (3246, 21.25, 'q13'), (3248, 22.25, 'q14'), (3250, 23.25, 'q15'), (3252, 24.25, 'q16'), (3254, 25.25, 'q17'), (3256, 26.25, 'q18'), (3258, 27.25, 'q19'), (3260, 28.25, 'q20'), (3262, 29.25, 'q21'), (3264, 30.25, 'q22'), (3266, 31.25, 'q0'), (3268, 32.25, 'q1'), (3270, 33.25, 'q2'), (3272, 34.25, 'q3'), (3274, 35.25, 'q4'), (3276, 36.25, 'q5'), (3278, 37.25, 'q6'), (3280, 38.25, 'q7'), (3282, 39.25, 'q8'), (3284, 40.25, 'q9'), (3286, 41.25, 'q10'), (3288, 42.25, 'q11'), (3290, 43.25, 'q12'), (3292, 44.25, 'q13'), (3294, 45.25, 'q14'), (3296, 46.25, 'q15'), (3298, 47.25, 'q16'), (3300, 48.25, 'q17'), (3302, 49.25, 'q18'), (3304, 50.25, 'q19'), (3306, 51.25, 'q20'), (3308, 52.25, 'q21'), (3310, 53.25, 'q22'), (3312, 54.25, 'q0'), (3314, 55.25, 'q1'), (3316, 56.25, 'q2'), (3318, 57.25, 'q3'), (3320, 58.25, 'q4'), (3322, 59.25, 'q5'), (3324, 60.25, 'q6'), (3326, 61.25, 'q7'), (3328, 62.25, 'q8'), (3330, 63.25, 'q9'), (3332, 64.25, 'q10'), (3334, 65.25, 'q11'), (3336, 66.25, 'q12'), (3338, 67.25, 'q13'), (3340, 68.25, 'q14'), (3342, 69.25, 'q15'), (3344, 70.25, 'q16'), (3346, 71.25, 'q17'), (3348, 72.25, 'q18'), (3350, 73.25, 'q19'), (3352, 74.25, 'q20'), (3354, 75.25, 'q21'), (3356, 76.25, 'q22'), (3358, 77.25, 'q0'), (3360, 78.25, 'q1'), (3362, 79.25, 'q2'), (3364, 80.25, 'q3'), (3366, 81.25, 'q4'), (3368, 82.25, 'q5'), (3370, 83.25, 'q6'), (3372, 84.25, 'q7'), (3374, 85.25, 'q8'), (3376, 86.25, 'q9'), (3378, 87.25, 'q10'), (3380, 88.25, 'q11'), (3382, 0.25, 'q12'), (3384, 1.25, 'q13'), (3386, 2.25, 'q14'), (3388, 3.25, 'q15'), (3390, 4.25, 'q16'), (3392, 5.25, 'q17'), (3394, 6.25, 'q18'), (3396, 7.25, 'q19'), (3398, 8.25, 'q20'), (3400, 9.25, 'q21'), (3402, 10.25, 'q22'), (3404, 11.25, 'q0'), (3406, 12.25, 'q1'), (3408, 13.25, 'q2'), (3410, 14.25, 'q3'), (3412, 15.25, 'q4'), (3414, 16.25, 'q5'), (3416, 17.25, 'q6'), (3418, 18.25, 'q7'), (3420, 19.25, 'q8'), (3422, 20.25, 'q9'), (3424, 21.25, 'q10'), (3426, 22.25, 'q11'), (3428, 23.25, 'q12'), (3430, 24.25, 'q13'), (3432, 25.25, 'q14'), (3434, 26.25, 'q15'), (3436, 27.25, 'q16'), (3438, 28.25, 'q17'), (3440, 29.25, 'q18'), (3442, 30.25, 'q19'), (3444, 31.25, 'q20'), (3446, 32.25, 'q21'), (3448, 33.25, 'q22'), (3450, 34.25, 'q0'), (3452, 35.25, 'q1'), (3454, 36.25, 'q2'), (3456, 37.25, 'q3'), (3458, 38.25, 'q4'), (3460, 39.25, 'q5'), (3462, 40.25, 'q6'), (3464, 41.25, 'q7'), (3466, 42.25, 'q8'), (3468, 43.25, 'q9'), (3470, 44.25, 'q10'), (3472, 45.25, 'q11'), (3474, 46.25, 'q12'), (3476, 47.25, 'q13'), (3478, 48.25, 'q14'), (3480, 49.25, 'q15'), (3482, 50.25, 'q16'), (3484, 51.25, 'q17'), (3486, 52.25, 'q18'), (3488, 53.25, 'q19'), (3490, 54.25, 'q20'), (3492, 55.25, 'q21'), (3494, 56.25, 'q22'), (3496, 57.25, 'q0'), (3498, 58.25, 'q1'), (3500, 59.25, 'q2'), (3502, 60.25, 'q3'), (3504, 61.25, 'q4'), (3506, 62.25, 'q5'), (3508, 63.25, 'q6'), (3510, 64.25, 'q7'), (3512, 65.25, 'q8'), (3514, 66.25, 'q9'), (3516, 67.25, 'q10'), (3518, 68.25, 'q11'), (3520, 69.25, 'q12'), (3522, 70.25, 'q13'), (3524, 71.25, 'q14'), (3526, 72.25, 'q15'), (3528, 73.25, 'q16'), (3530, 74.25, 'q17'), (3532, 75.25, 'q18'), (3534, 76.25, 'q19'), (3536, 77.25, 'q20'), (3538, 78.25, 'q21'), (3540, 79.25, 'q22'), (3542, 80.25, 'q0'), (3544, 81.25, 'q1'), (3546, 82.25, 'q2'), (3548, 83.25, 'q3'), (3550, 84.25, 'q4'), (3552, 85.25, 'q5'), (3554, 86.25, 'q6'), (3556, 87.25, 'q7'), (3558, 88.25, 'q8'), (3560, 0.25, 'q9'), (3562, 1.25, 'q10'), (3564, 2.25, 'q11'), (3566, 3.25, 'q12'), (3568, 4.25, 'q13'), (3570, 5.25, 'q14'), (3572, 6.25, 'q15'), (3574, 7.25, 'q16'), (3576, 8.25, 'q17'), (3578, 9.25, 'q18'), (3580, 10.25, 'q19'), (3582, 11.25, 'q20'), (3584, 12.25, 'q21'), (3586, 13.25, 'q22'), (3588, 14.25, 'q0'), (3590, 15.25, 'q1'), (3592, 16.25, 'q2'), (3594, 17.25, 'q3'), (3596, 18.25, 'q4'), (3598, 19.25, 'q5'), (3600, 20.25, 'q6'), (3602, 21.25, 'q7'), (3604, 22.25, 'q8'), (3606, 23.25, 'q9'), (3608, 24.25, 'q10'), (3610, 25.25, 'q11'), (3612, 26.25, 'q12'), (3614, 27.25, 'q13'), (3616, 28.25, 'q14'), (3618, 29.25, 'q15'), (3620, 30.25, 'q16'), (3622, 31.25, 'q17'), (3624, 32.25, 'q18'), (3626, 33.25, 'q19'), (3628, 34.25, 'q20'), (3630, 35.25, 'q21'), (3632, 36.25, 'q22'), (3634, 37.25, 'q0'), (3636, 38.25, 'q1'), (3638, 39.25, 'q2'), (3640, 40.25, 'q3'), (3642, 41.25, 'q4'), (3644, 42.25, 'q5'), (3646, 43.25, 'q6'), (3648, 44.25, 'q7'), (3650, 45.25, 'q8'), (3652, 46.25, 'q9'), (3654, 47.25, 'q10'), (3656, 48.25, 'q11'), (3658, 49.25, 'q12'), (3660, 50.25, 'q13'), (3662, 51.25, 'q14'), (3664, 52.25, 'q15'), (3666, 53.25, 'q16'), (3668, 54.25, 'q17'), (3670, 55.25, 'q18'), (3672, 56.25, 'q19'), (3674, 57.25, 'q20'), (3676, 58.25, 'q21'), (3678, 59.25, 'q22'), (3680, 60.25, 'q0'), (3682, 61.25, 'q1'), (3684, 62.25, 'q2'), (3686, 63.25, 'q3'), (3688, 64.25, 'q4'), (3690, 65.25, 'q5'), (3692, 66.25, 'q6'), (3694, 67.25, 'q7'), (3696, 68.25, 'q8'), (3698, 69.25, 'q9'), (3700, 70.25, 'q10'), (3702, 71.25, 'q11'), (3704, 72.25, 'q12'), (3706, 73.25, 'q13'), (3708, 74.25, 'q14'), (3710, 75.25, 'q15'), (3712, 76.25, 'q16'), (3714, 77.25, 'q17'), (3716, 78.25, 'q18'), (3718, 79.25, 'q19'), (3720, 80.25, 'q20'), (3722, 81.25, 'q21'), (3724, 82.25, 'q22'), (3726, 83.25, 'q0'), (3728, 84.25, 'q1'), (3730, 85.25, 'q2'), (3732, 86.25, 'q3'), (3734, 87.25, 'q4'), (3736, 88.25, 'q5'), (3738, 0.25, 'q6'), (3740, 1.25, 'q7'), (3742, 2.25, 'q8'), (3744, 3.25, 'q9'), (3746, 4.25, 'q10'), (3748, 5.25, 'q11'), (3750, 6.25, 'q12'), (3752, 7.25, 'q13'), (3754, 8.25, 'q14'), (3756, 9.25, 'q15'), (3758, 10.25, 'q16'), (3760, 11.25, 'q17'), (3762, 12.25, 'q18'), (3764, 13.25, 'q19'), (3766, 14.25, 'q20'), (3768, 15.25, 'q21'), (3770, 16.25, 'q22'), (3772, 17.25, 'q0'), (3774, 18.25, 'q1'), (3776, 19.25, 'q2'), (3778, 20.25, 'q3'), (3780, 21.25, 'q4'), (3782, 22.25, 'q5'), (3784, 23.25, 'q6'), (3786, 24.25, 'q7'), (3788, 25.25, 'q8'), (3790, 26.25, 'q9'), (3792, 27.25, 'q10'), (3794, 28.25, 'q11'), (3796, 29.25, 'q12'), (3798, 30.25, 'q13'), (3800, 31.25, 'q14'), (3802, 32.25, 'q15'), (3804, 33.25, 'q16'), (3806, 34.25, 'q17'), (3808, 35.25, 'q18'), (3810, 36.25, 'q19'), (3812, 37.25, 'q20'), (3814, 38.25, 'q21'), (3816, 39.25, 'q22'), (3818, 40.25, 'q0'), (3820, 41.25, 'q1'), (3822, 42.25, 'q2'), (3824, 43.25, 'q3'), (3826, 44.25, 'q4'), (3828, 45.25, 'q5'), (3830, 46.25, 'q6'), (3832, 47.25, 'q7'), (3834, 48.25, 'q8'), (3836, 49.25, 'q9'), (3838, 50.25, 'q10'), (3840, 51.25, 'q11'), (3842, 52.25, 'q12'), (3844, 53.25, 'q13'), (3846, 54.25, 'q14'), (3848, 55.25, 'q15'), (3850, 56.25, 'q16'), (3852, 57.25, 'q17'), (3854, 58.25, 'q18'), (3856, 59.25, 'q19'), (3858, 60.25, 'q20'), (3860, 61.25, 'q21'), (3862, 62.25, 'q22'), (3864, 63.25, 'q0'), (3866, 64.25, 'q1'), (3868, 65.25, 'q2'), (3870, 66.25, 'q3'), (3872, 67.25, 'q4'), (3874, 68.25, 'q5'), (3876, 69.25, 'q6'), (3878, 70.25, 'q7'), (3880, 71.25, 'q8'), (3882, 72.25, 'q9'), (3884, 73.25, 'q10'), (3886, 74.25, 'q11'), (3888, 75.25, 'q12'), (3890, 76.25, 'q13'), (3892, 77.25, 'q14'), (3894, 78.25, 'q15'), (3896, 79.25, 'q16'), (3898, 80.25, 'q17'), (3900, 81.25, 'q18'), (3902, 82.25, 'q19'), (3904, 83.25, 'q20'), (3906, 84.25, 'q21'), (3908, 85.25, 'q22'), (3910, 86.25, 'q0'), (3912, 87.25, 'q1'), (3914, 88.25, 'q2'), (3916, 0.25, 'q3'), (3918, 1.25, 'q4'), (3920, 2.25, 'q5'), (3922, 3.25, 'q6'), (3924, 4.25, 'q7'), (3926, 5.25, 'q8'), (3928, 6.25, 'q9'), (3930, 7.25, 'q10'), (3932, 8.25, 'q11'), (3934, 9.25, 'q12'), (3936, 10.25, 'q13'), (3938, 11.25, 'q14'), (3940, 12.25, 'q15'), (3942, 13.25, 'q16'), (3944, 14.25, 'q17'), (3946, 15.25, 'q18'), (3948, 16.25, 'q19'), (3950, 17.25, 'q20'), (3952, 18.25, 'q21'), (3954, 19.25, 'q22'), (3956, 20.25, 'q0'), (3958, 21.25, 'q1'), (3960, 22.25, 'q2'), (3962, 23.25, 'q3'), (3964, 24.25, 'q4'), (3966, 25.25, 'q5'), (3968, 26.25, 'q6'), (3970, 27.25, 'q7'), (3972, 28.25, 'q8'), (3974, 29.25, 'q9'), (3976, 30.25, 'q10'), (3978, 31.25, 'q11'), (3980, 32.25, 'q12'), (3982, 33.25, 'q13'), (3984, 34.25, 'q14'), (3986, 35.25, 'q15'), (3988, 36.25, 'q16'), (3990, 37.25, 'q17'), (3992, 38.25, 'q18'), (3994, 39.25, 'q19'), (3996, 40.25, 'q20'), (3998, 41.25, 'q21'), (4000, 42.25, 'q22'), (4002, 43.25, 'q0'), (4004, 44.25, 'q1'), (4006, 45.25, 'q2'), (4008, 46.25, 'q3'), (4010, 47.25, 'q4'), (4012, 48.25, 'q5'), (4014, 49.25, 'q6'), (4016, 50.25, 'q7'), (4018, 51.25, 'q8'), (4020, 52.25, 'q9'), (4022, 53.25, 'q10'), (4024, 54.25, 'q11'), (4026, 55.25, 'q12'), (4028, 56.25, 'q13'), (4030, 57.25, 'q14'), (4032, 58.25, 'q15'), (4034, 59.25, 'q16'), (4036, 60.25, 'q17'), (4038, 61.25, 'q18'), (4040, 62.25, 'q19'), (4042, 63.25, 'q20'), (4044, 64.25, 'q21'), (4046, 65.25, 'q22'), (4048, 66.25, 'q0'), (4050, 67.25, 'q1'), (4052, 68.25, 'q2'), (4054, 69.25, 'q3'), (4056, 70.25, 'q4'), (4058, 71.25, 'q5'), (4060, 72.25, 'q6'), (4062, 73.25, 'q7'), (4064, 74.25, 'q8'), (4066, 75.25, 'q9'), (4068, 76.25, 'q10'), (4070, 77.25, 'q11'), (4072, 78.25, 'q12'), (4074, 79.25, 'q13'), (4076, 80.25, 'q14'), (4078, 81.25, 'q15'), (4080, 82.25, 'q16'), (4082, 83.25, 'q17'), (4084, 84.25, 'q18'), (4086, 85.25, 'q19'), (4088, 86.25, 'q20'), (4090, 87.25, 'q21'), (4092, 88.25, 'q22'), (4094, 0.25, 'q0'), (4096, 1.25, 'q1'), (4098, 2.25, 'q2'), (4100, 3.25, 'q3'), (4102, 4.25, 'q4'), (4104, 5.25, 'q5'), (4106, 6.25, 'q6'), (4108, 7.25, 'q7'), (4110, 8.25, 'q8'), (4112, 9.25, 'q9'), (4114, 10.25, 'q10'), (4116, 11.25, 'q11'), (4118, 12.25, 'q12'), (4120, 13.25, 'q13'), (4122, 14.25, 'q14'), (4124, 15.25, 'q15'), (4126, 16.25, 'q16'), (4128, 17.25, 'q17'), (4130, 18.25, 'q18'), (4132, 19.25, 'q19'), (4134, 20.25, 'q20'), (4136, 21.25, 'q21'), (4138, 22.25, 'q22'), (4140, 23.25, 'q0'), (4142, 24.25, 'q1'), (4144, 25.25, 'q2'), (4146, 26.25, 'q3'), (4148, 27.25, 'q4'), (4150, 28.25, 'q5'), (4152, 29.25, 'q6'), (4154, 30.25, 'q7'), (4156, 31.25, 'q8'), (4158, 32.25, 'q9'), (4160, 33.25, 'q10'), (4162, 34.25, 'q11'), (4164, 35.25, 'q12'), (4166, 36.25, 'q13'), (4168, 37.25, 'q14'), (4170, 38.25, 'q15'), (4172, 39.25, 'q16'), (4174, 40.25, 'q17'), (4176, 41.25, 'q18'), (4178, 42.25, 'q19'), (4180, 43.25, 'q20'), (4182, 44.25, 'q21'), (4184, 45.25, 'q22'), (4186, 46.25, 'q0'), (4188, 47.25, 'q1'), (4190, 48.25, 'q2'), (4192, 49.25, 'q3'), (4194, 50.25, 'q4'), (4196, 51.25, 'q5'), (4198, 52.25, 'q6'), (4200, 53.25, 'q7'), (4202, 54.25, 'q8'), (4204, 55.25, 'q9'), (4206, 56.25, 'q10'), (4208, 57.25, 'q11'), (4210, 58.25, 'q12'), (4212, 59.25, 'q13'), (4214, 60.25, 'q14'), (4216, 61.25, 'q15'), (4218, 62.25, 'q16'), (4220, 63.25, 'q17'), (4222, 64.25, 'q18'), (4224, 65.25, 'q19'), (4226, 66.25, 'q20'), (4228, 67.25, 'q21'), (4230, 68.25, 'q22'), (4232, 69.25, 'q0'), (4234, 70.25, 'q1'), (4236, 71.25, 'q2'), (4238, 72.25, 'q3'), (4240, 73.25, 'q4'), (4242, 74.25, 'q5'), (4244, 75.25, 'q6'), (4246, 76.25, 'q7'), (4248, 77.25, 'q8'), (4250, 78.25, 'q9'), (4252, 79.25, 'q10'), (4254, 80.25, 'q11'), (4256, 81.25, 'q12'), (4258, 82.25, 'q13'), (4260, 83.25, 'q14'), (4262, 84.25, 'q15'), (4264, 85.25, 'q16'), (4266, 86.25, 'q17'), (4268, 87.25, 'q18'), (4270, 88.25, 'q19'), (4272, 0.25, 'q20'), (4274, 1.25, 'q21'), (4276, 2.25, 'q22'), (4278, 3.25, 'q0'), (4280, 4.25, 'q1'), (4282, 5.25, 'q2'), (4284, 6.25, 'q3'), (4286, 7.25, 'q4'), (4288, 8.25, 'q5'), (4290, 9.25, 'q6'), (4292, 10.25, 'q7'), (4294, 11.25, 'q8'), (4296, 12.25, 'q9'), (4298, 13.25, 'q10'), (4300, 14.25, 'q11'), (4302, 15.25, 'q12'), (4304, 16.25, 'q13'), (4306, 17.25, 'q14'), (4308, 18.25, 'q15'), (4310, 19.25, 'q16'), (4312, 20.25, 'q17'), (4314, 21.25, 'q18'), (4316, 22.25, 'q19'), (4318, 23.25, 'q20'), (4320, 24.25, 'q21'), (4322, 25.25, 'q22'), (4324, 26.25, 'q0'), (4326, 27.25, 'q1'), (4328, 28.25, 'q2'), (4330, 29.25, 'q3'), (4332, 30.25, 'q4'), (4334, 31.25, 'q5'), (4336, 32.25, 'q6'), (4338, 33.25, 'q7'), (4340, 34.25, 'q8'), (4342, 35.25, 'q9'), (4344, 36.25, 'q10'), (4346, 37.25, 'q11'), (4348, 38.25, 'q12'), (4350, 39.25, 'q13'), (4352, 40.25, 'q14'), (4354, 41.25, 'q15'), (4356, 42.25, 'q16'), (4358, 43.25, 'q17'), (4360, 44.25, 'q18'), (4362, 45.25, 'q19'), (4364, 46.25, 'q20'), (4366, 47.25, 'q21'), (4368, 48.25, 'q22'), (4370, 49.25, 'q0'), (4372, 50.25, 'q1'), (4374, 51.25, 'q2'), (4376, 52.25, 'q3'), (4378, 53.25, 'q4'), (4380, 54.25, 'q5'), (4382, 55.25, 'q6'), (4384, 56.25, 'q7'), (4386, 57.25, 'q8'), (4388, 58.25, 'q9'), (4390, 59.25, 'q10'), (4392, 60.25, 'q11'), (4394, 61.25, 'q12'), (4396, 62.25, 'q13'), (4398, 63.25, 'q14'), (4400, 64.25, 'q15'), (4402, 65.25, 'q16'), (4404, 66.25, 'q17'), (4406, 67.25, 'q18'), (4408, 68.25, 'q19'), (4410, 69.25, 'q20'), (4412, 70.25, 'q21'), (4414, 71.25, 'q22'), (4416, 72.25, 'q0'), (4418, 73.25, 'q1'), (4420, 74.25, 'q2'), (4422, 75.25, 'q3'), (4424, 76.25, 'q4'), (4426, 77.25, 'q5'), (4428, 78.25, 'q6'), (4430, 79.25, 'q7'), (4432, 80.25, 'q8'), (4434, 81.25, 'q9'), (4436, 82.25, 'q10'), (4438, 83.25, 'q11'), (4440, 84.25, 'q12'), (4442, 85.25, 'q13'), (4444, 86.25, 'q14'), (4446, 87.25, 'q15'), (4448, 88.25, 'q16'), (4450, 0.25, 'q17'), (4452, 1.25, 'q18'), (4454, 2.25, 'q19'), (4456, 3.25, 'q20'), (4458, 4.25, 'q21'), (4460, 5.25, 'q22'), (4462, 6.25, 'q0'), (4464, 7.25, 'q1'), (4466, 8.25, 'q2'), (4468, 9.25, 'q3'), (4470, 10.25, 'q4'), (4472, 11.25, 'q5'), (4474, 12.25, 'q6'), (4476, 13.25, 'q7'), (4478, 14.25, 'q8'), (4480, 15.25, 'q9'), (4482, 16.25, 'q10'), (4484, 17.25, 'q11'), (4486, 18.25, 'q12'), (4488, 19.25, 'q13'), (4490, 20.25, 'q14'), (4492, 21.25, 'q15'), (4494, 22.25, 'q16'), (4496, 23.25, 'q17'), (4498, 24.25, 'q18'), (4500, 25.25, 'q19'), (4502, 26.25, 'q20'), (4504, 27.25, 'q21'), (4506, 28.25, 'q22'), (4508, 29.25, 'q0'), (4510, 30.25, 'q1'), (4512, 31.25, 'q2'), (4514, 32.25, 'q3'), (4516, 33.25, 'q4'), (4518, 34.25, 'q5'), (4520, 35.25, 'q6'), (4522, 36.25, 'q7'), (4524, 37.25, 'q8'), (4526, 38.25, 'q9'), (4528, 39.25, 'q10'), (4530, 40.25, 'q11'), (4532, 41.25, 'q12'), (4534, 42.25, 'q13'), (4536, 43.25, 'q14'), (4538, 44.25, 'q15'), (4540, 45.25, 'q16'), (4542, 46.25, 'q17'), (4544, 47.25, 'q18'), (4546, 48.25, 'q19'), (4548, 49.25, 'q20'), (4550, 50.25, 'q21'), (4552, 51.25, 'q22'), (4554, 52.25, 'q0'), (4556, 53.25, 'q1'), (4558, 54.25, 'q2'), (4560, 55.25, 'q3'), (4562, 56.25, 'q4'), (4564, 57.25, 'q5'), (4566, 58.25, 'q6'), (4568, 59.25, 'q7'), (4570, 60.25, 'q8'), (4572, 61.25, 'q9'), (4574, 62.25, 'q10'), (4576, 63.25, 'q11'), (4578, 64.25, 'q12'), (4580, 65.25, 'q13'), (4582, 66.25, 'q14'), (4584, 67.25, 'q15'), (4586, 68.25, 'q16'), (4588, 69.25, 'q17'), (4590, 70.25, 'q18'), (4592, 71.25, 'q19'), (4594, 72.25, 'q20'), (4596, 73.25, 'q21'), (4598, 74.25, 'q22'), (4600, 75.25, 'q0'), (4602, 76.25, 'q1'), (4604, 77.25, 'q2'), (4606, 78.25, 'q3'), (4608, 79.25, 'q4'), (4610, 80.25, 'q5'), (4612, 81.25, 'q6'), (4614, 82.25, 'q7'), (4616, 83.25, 'q8'), (4618, 84.25, 'q9'), (4620, 85.25, 'q10'), (4622, 86.25, 'q11'), (4624, 87.25, 'q12'), (4626, 88.25, 'q13'), (4628, 0.25, 'q14'), (4630, 1.25, 'q15'), (4632, 2.25, 'q16'), (4634, 3.25, 'q17'), (4636, 4.25, 'q18'), (4638, 5.25, 'q19'), (4640, 6.25, 'q20'), (4642, 7.25, 'q21'), (4644, 8.25, 'q22'), (4646, 9.25, 'q0'), (4648, 10.25, 'q1'), (4650, 11.25, 'q2'), (4652, 12.25, 'q3'), (4654, 13.25, 'q4'), (4656, 14.25, 'q5'), (4658, 15.25, 'q6'), (4660, 16.25, 'q7'), (4662, 17.25, 'q8'), (4664, 18.25, 'q9'), (4666, 19.25, 'q10'), (4668, 20.25, 'q11'), (4670, 21.25, 'q12'), (4672, 22.25, 'q13'), (4674, 23.25, 'q14'), (4676, 24.25, 'q15'), (4678, 25.25, 'q16'), (4680, 26.25, 'q17'), (4682, 27.25, 'q18'), (4684, 28.25, 'q19'), (4686, 29.25, 'q20'), (4688, 30.25, 'q21'), (4690, 31.25, 'q22'), (4692, 32.25, 'q0'), (4694, 33.25, 'q1'), (4696, 34.25, 'q2'), (4698, 35.25, 'q3'), (4700, 36.25, 'q4'), (4702, 37.25, 'q5'), (4704, 38.25, 'q6'), (4706, 39.25, 'q7'), (4708, 40.25, 'q8'), (4710, 41.25, 'q9'), (4712, 42.25, 'q10'), (4714, 43.25, 'q11'), (4716, 44.25, 'q12'), (4718, 45.25, 'q13'), (4720, 46.25, 'q14'), (4722, 47.25, 'q15'), (4724, 48.25, 'q16'), (4726, 49.25, 'q17'), (4728, 50.25, 'q18'), (4730, 51.25, 'q19'), (4732, 52.25, 'q20'), (4734, 53.25, 'q21'), (4736, 54.25, 'q22'), (4738, 55.25, 'q0'), (4740, 56.25, 'q1'), (4742, 57.25, 'q2'), (4744, 58.25, 'q3'), (4746, 59.25, 'q4'), (4748, 60.25, 'q5'), (4750, 61.25, 'q6'), (4752, 62.25, 'q7'), (4754, 63.25, 'q8'), (4756, 64.25, 'q9'), (4758, 65.25, 'q10'), (4760, 66.25, 'q11'), (4762, 67.25, 'q12'), (4764, 68.25, 'q13'), (4766, 69.25, 'q14'), (4768, 70.25, 'q15'), (4770, 71.25, 'q16'), (4772, 72.25, 'q17'), (4774, 73.25, 'q18'), (4776, 74.25, 'q19'), (4778, 75.25, 'q20'), (4780, 76.25, 'q21'), (4782, 77.25, 'q22'), (4784, 78.25, 'q0'), (4786, 79.25, 'q1'), (4788, 80.25, 'q2'), (4790, 81.25, 'q3'), (4792, 82.25, 'q4'), (4794, 83.25, 'q5'), (4796, 84.25, 'q6'), (4798, 85.25, 'q7'), (4800, 86.25, 'q8'), (4802, 87.25, 'q9'), (4804, 88.25, 'q10'), (4806, 0.25, 'q11'), (4808, 1.25, 'q12'), (4810, 2.25, 'q13'), (4812, 3.25, 'q14'), (4814, 4.25, 'q15'), (4816, 5.25, 'q16'), (4818, 6.25, 'q17'), (4820, 7.25, 'q18'), (4822, 8.25, 'q19'), (4824, 9.25, 'q20'), (4826, 10.25, 'q21'), (4828, 11.25, 'q22'), (4830, 12.25, 'q0'), (4832, 13.25, 'q1'), (4834, 14.25, 'q2'), (4836, 15.25, 'q3'), (4838, 16.25, 'q4'), (4840, 17.25, 'q5'), (4842, 18.25, 'q6'), (4844, 19.25, 'q7'), (4846, 20.25, 'q8'), (4848, 21.25, 'q9'), (4850, 22.25, 'q10'), (4852, 23.25, 'q11'), (4854, 24.25, 'q12'), (4856, 25.25, 'q13'), (4858, 26.25, 'q14'), (4860, 27.25, 'q15'), (4862, 28.25, 'q16'), (4864, 29.25, 'q17'), (4866, 30.25, 'q18'), (4868, 31.25, 'q19'), (4870, 32.25, 'q20'), (4872, 33.25, 'q21'), (4874, 34.25, 'q22'), (4876, 35.25, 'q0'), (4878, 36.25, 'q1'), (4880, 37.25, 'q2'), (4882, 38.25, 'q3'), (4884, 39.25, 'q4'), (4886, 40.25, 'q5'), (4888, 41.25, 'q6'), (4890, 42.25, 'q7'), (4892, 43.25, 'q8'), (4894, 44.25, 'q9'), (4896, 45.25, 'q10'), (4898, 46.25, 'q11'), (4900, 47.25, 'q12'), (4902, 48.25, 'q13'), (4904, 49.25, 'q14'), (4906, 50.25, 'q15'), (4908, 51.25, 'q16'), (4910, 52.25, 'q17'), (4912, 53.25, 'q18'), (4914, 54.25, 'q19'), (4916, 55.25, 'q20'), (4918, 56.25, 'q21'), (4920, 57.25, 'q22'), (4922, 58.25, 'q0'), (4924, 59.25, 'q1'), (4926, 60.25, 'q2'), (4928, 61.25, 'q3'), (4930, 62.25, 'q4'), (4932, 63.25, 'q5'), (4934, 64.25, 'q6'), (4936, 65.25, 'q7'), (4938, 66.25, 'q8'), (4940, 67.25, 'q9'), (4942, 68.25, 'q10'), (4944, 69.25, 'q11'), (4946, 70.25, 'q12'), (4948, 71.25, 'q13'), (4950, 72.25, 'q14'), (4952, 73.25, 'q15'), (4954, 74.25, 'q16'), (4956, 75.25, 'q17'), (4958, 76.25, 'q18'), (4960, 77.25, 'q19'), (4962, 78.25, 'q20'), (4964, 79.25, 'q21'), (4966, 80.25, 'q22'), (4968, 81.25, 'q0'), (4970, 82.25, 'q1'), (4972, 83.25, 'q2'), (4974, 84.25, 'q3'), (4976, 85.25, 'q4'), (4978, 86.25, 'q5'), (4980, 87.25, 'q6'), (4982, 88.25, 'q7'), (4984, 0.25, 'q8'), (4986, 1.25, 'q9'), (4988, 2.25, 'q10'), (4990, 3.25, 'q11'), (4992, 4.25, 'q12'), (4994, 5.25, 'q13'), (4996, 6.25, 'q14'), (4998, 7.25, 'q15'), (5000, 8.25, 'q16'), (5002, 9.25, 'q17'), (5004, 10.25, 'q18'), (5006, 11.25, 'q19'), (5008, 12.25, 'q20'), (5010, 13.25, 'q21'), (5012, 14.25, 'q22'), (5014, 15.25, 'q0'), (5016, 16.25, 'q1'), (5018, 17.25, 'q2'), (5020, 18.25, 'q3'), (5022, 19.25, 'q4'), (5024, 20.25, 'q5'), (5026, 21.25, 'q6'), (5028, 22.25, 'q7'), (5030, 23.25, 'q8'), (5032, 24.25, 'q9'), (5034, 25.25, 'q10'), (5036, 26.25, 'q11'), (5038, 27.25, 'q12'), (5040, 28.25, 'q13'), (5042, 29.25, 'q14'), (5044, 30.25, 'q15'), (5046, 31.25, 'q16'), (5048, 32.25, 'q17'), (5050, 33.25, 'q18'), (5052, 34.25, 'q19'), (5054, 35.25, 'q20'), (5056, 36.25, 'q21'), (5058, 37.25, 'q22'), (5060, 38.25, 'q0'), (5062, 39.25, 'q1'), (5064, 40.25, 'q2'), (5066, 41.25, 'q3'), (5068, 42.25, 'q4'), (5070, 43.25, 'q5'), (5072, 44.25, 'q6'), (5074, 45.25, 'q7'), (5076, 46.25, 'q8'), (5078, 47.25, 'q9'), (5080, 48.25, 'q10'), (5082, 49.25, 'q11'), (5084, 50.25, 'q12'), (5086, 51.25, 'q13'), (5088, 52.25, 'q14'), (5090, 53.25, 'q15'), (5092, 54.25, 'q16'), (5094, 55.25, 'q17'), (5096, 56.25, 'q18'), (5098, 57.25, 'q19'), (5100, 58.25, 'q20'), (5102, 59.25, 'q21'), (5104, 60.25, 'q22'), (5106, 61.25, 'q0'), (5108, 62.25, 'q1'), (5110, 63.25, 'q2'), (5112, 64.25, 'q3'), (5114, 65.25, 'q4'), (5116, 66.25, 'q5'), (5118, 67.25, 'q6'), (5120, 68.25, 'q7'), (5122, 69.25, 'q8'), (5124, 70.25, 'q9'), (5126, 71.25, 'q10'), (5128, 72.25, 'q11'), (5130, 73.25, 'q12'), (5132, 74.25, 'q13'), (5134, 75.25, 'q14'), (5136, 76.25, 'q15'), (5138, 77.25, 'q16'), (5140, 78.25, 'q17'), (5142, 79.25, 'q18'), (5144, 80.25, 'q19'), (5146, 81.25, 'q20'), (5148, 82.25, 'q21'), (5150, 83.25, 'q22'), (5152, 84.25, 'q0'), (5154, 85.25, 'q1'), (5156, 86.25, 'q2'), (5158, 87.25, 'q3'), (5160, 88.25, 'q4'), (5162, 0.25, 'q5'), (5164, 1.25, 'q6'), (5166, 2.25, 'q7'), (5168, 3.25, 'q8'), (5170, 4.25, 'q9'), (5172, 5.25, 'q10'), (5174, 6.25, 'q11'), (5176, 7.25, 'q12'), (5178, 8.25, 'q13'), (5180, 9.25, 'q14'), (5182, 10.25, 'q15'), (5184, 11.25, 'q16'), (5186, 12.25, 'q17'), (5188, 13.25, 'q18'), (5190, 14.25, 'q19'), (5192, 15.25, 'q20'), (5194, 16.25, 'q21'), (5196, 17.25, 'q22'), (5198, 18.25, 'q0'), (5200, 19.25, 'q1'), (5202, 20.25, 'q2'), (5204, 21.25, 'q3'), (5206, 22.25, 'q4'), (5208, 23.25, 'q5'), (5210, 24.25, 'q6'), (5212, 25.25, 'q7'), (5214, 26.25, 'q8'), (5216, 27.25, 'q9'), (5218, 28.25, 'q10'), (5220, 29.25, 'q11'), (5222, 30.25, 'q12'), (5224, 31.25, 'q13'), (5226, 32.25, 'q14'), (5228, 33.25, 'q15'), (5230, 34.25, 'q16'), (5232, 35.25, 'q17'), (5234, 36.25, 'q18'), (5236, 37.25, 'q19'), (5238, 38.25, 'q20'), (5240, 39.25, 'q21'), (5242, 40.25, 'q22'), (5244, 41.25, 'q0'), (5246, 42.25, 'q1'), (5248, 43.25, 'q2'), (5250, 44.25, 'q3'), (5252, 45.25, 'q4'), (5254, 46.25, 'q5'), (5256, 47.25, 'q6'), (5258, 48.25, 'q7'), (5260, 49.25, 'q8'), (5262, 50.25, 'q9'), (5264, 51.25, 'q10'), (5266, 52.25, 'q11'), (5268, 53.25, 'q12'), (5270, 54.25, 'q13'), (5272, 55.25, 'q14'), (5274, 56.25, 'q15'), (5276, 57.25, 'q16'), (5278, 58.25, 'q17'), (5280, 59.25, 'q18'), (5282, 60.25, 'q19'), (5284, 61.25, 'q20'), (5286, 62.25, 'q21'), (5288, 63.25, 'q22'), (5290, 64.25, 'q0'), (5292, 65.25, 'q1'), (5294, 66.25, 'q2'), (5296, 67.25, 'q3'), (5298, 68.25, 'q4'), (5300, 69.25, 'q5'), (5302, 70.25, 'q6'), (5304, 71.25, 'q7'), (5306, 72.25, 'q8'), (5308, 73.25, 'q9'), (5310, 74.25, 'q10'), (5312, 75.25, 'q11'), (5314, 76.25, 'q12'), (5316, 77.25, 'q13'), (5318, 78.25, 'q14'), (5320, 79.25, 'q15'), (5322, 80.25, 'q16'), (5324, 81.25, 'q17'), (5326, 82.25, 'q18'), (5328, 83.25, 'q19'), (5330, 84.25, 'q20'), (5332, 85.25, 'q21'), (5334, 86.25, 'q22'), (5336, 87.25, 'q0'), (5338, 88.25, 'q1'), (5340, 0.25, 'q2'), (5342, 1.25, 'q3'), (5344, 2.25, 'q4'), (5346, 3.25, 'q5'), (5348, 4.25, 'q6'), (5350, 5.25, 'q7'), (5352, 6.25, 'q8'), (5354, 7.25, 'q9'), (5356, 8.25, 'q10'), (5358, 9.25, 'q11'), (5360, 10.25, 'q12'), (5362, 11.25, 'q13'), (5364, 12.25, 'q14'), (5366, 13.25, 'q15'), (5368, 14.25, 'q16'), (5370, 15.25, 'q17'), (5372, 16.25, 'q18'), (5374, 17.25, 'q19'), (5376, 18.25, 'q20'), (5378, 19.25, 'q21'), (5380, 20.25, 'q22'), (5382, 21.25, 'q0'), (5384, 22.25, 'q1'), (5386, 23.25, 'q2'), (5388, 24.25, 'q3'), (5390, 25.25, 'q4'), (5392, 26.25, 'q5'), (5394, 27.25, 'q6'), (5396, 28.25, 'q7'), (5398, 29.25, 'q8'), (5400, 30.25, 'q9'), (5402, 31.25, 'q10'), (5404, 32.25, 'q11'), (5406, 33.25, 'q12'), (5408, 34.25, 'q13'), (5410, 35.25, 'q14'), (5412, 36.25, 'q15'), (5414, 37.25, 'q16'), (5416, 38.25, 'q17'), (5418, 39.25, 'q18'), (5420, 40.25, 'q19'), (5422, 41.25, 'q20'), (5424, 42.25, 'q21'), (5426, 43.25, 'q22'), (5428, 44.25, 'q0'), (5430, 45.25, 'q1'), (5432, 46.25, 'q2'), (5434, 47.25, 'q3'), (5436, 48.25, 'q4'), (5438, 49.25, 'q5'), (5440, 50.25, 'q6'), (5442, 51.25, 'q7'), (5444, 52.25, 'q8'), (5446, 53.25, 'q9'), (5448, 54.25, 'q10'), (5450, 55.25, 'q11'), (5452, 56.25, 'q12'), (5454, 57.25, 'q13'), (5456, 58.25, 'q14'), (5458, 59.25, 'q15'), (5460, 60.25, 'q16'), (5462, 61.25, 'q17'), (5464, 62.25, 'q18'), (5466, 63.25, 'q19'), (5468, 64.25, 'q20'), (5470, 65.25, 'q21'), (5472, 66.25, 'q22'), (5474, 67.25, 'q0'), (5476, 68.25, 'q1'), (5478, 69.25, 'q2'), (5480, 70.25, 'q3'), (5482, 71.25, 'q4'), (5484, 72.25, 'q5'), (5486, 73.25, 'q6'), (5488, 74.25, 'q7'), (5490, 75.25, 'q8'), (5492, 76.25, 'q9'), (5494, 77.25, 'q10'), (5496, 78.25, 'q11'), (5498, 79.25, 'q12'), (5500, 80.25, 'q13'), (5502, 81.25, 'q14'), (5504, 82.25, 'q15'), (5506, 83.25, 'q16'), (5508, 84.25, 'q17'), (5510, 85.25, 'q18'), (5512, 86.25, 'q19'), (5514, 87.25, 'q20'), (5516, 88.25, 'q21'), (5518, 0.25, 'q22'), (5520, 1.25, 'q0'), (5522, 2.25, 'q1'), (5524, 3.25, 'q2'), (5526, 4.25, 'q3'), (5528, 5.25, 'q4'), (5530, 6.25, 'q5'), (5532, 7.25, 'q6'), (5534, 8.25, 'q7'), (5536, 9.25, 'q8'), (5538, 10.25, 'q9'), (5540, 11.25, 'q10'), (5542, 12.25, 'q11'), (5544, 13.25, 'q12'), (5546, 14.25, 'q13'), (5548, 15.25, 'q14'), (5550, 16.25, 'q15'), (5552, 17.25, 'q16'), (5554, 18.25, 'q17'), (5556, 19.25, 'q18'), (5558, 20.25, 'q19'), (5560, 21.25, 'q20'), (5562, 22.25, 'q21'), (5564, 23.25, 'q22'), (5566, 24.25, 'q0'), (5568, 25.25, 'q1'), (5570, 26.25, 'q2'), (5572, 27.25, 'q3'), (5574, 28.25, 'q4'), (5576, 29.25, 'q5'), (5578, 30.25, 'q6'), (5580, 31.25, 'q7'), (5582, 32.25, 'q8'), (5584, 33.25, 'q9'), (5586, 34.25, 'q10'), (5588, 35.25, 'q11'), (5590, 36.25, 'q12'), (5592, 37.25, 'q13'), (5594, 38.25, 'q14'), (5596, 39.25, 'q15'), (5598, 40.25, 'q16'), (5600, 41.25, 'q17'), (5602, 42.25, 'q18'), (5604, 43.25, 'q19'), (5606, 44.25, 'q20'), (5608, 45.25, 'q21'), (5610, 46.25, 'q22'), (5612, 47.25, 'q0'), (5614, 48.25, 'q1'), (5616, 49.25, 'q2'), (5618, 50.25, 'q3'), (5620, 51.25, 'q4'), (5622, 52.25, 'q5'), (5624, 53.25, 'q6'), (5626, 54.25, 'q7'), (5628, 55.25, 'q8'), (5630, 56.25, 'q9'), (5632, 57.25, 'q10'), (5634, 58.25, 'q11'), (5636, 59.25, 'q12'), (5638, 60.25, 'q13'), (5640, 61.25, 'q14'), (5642, 62.25, 'q15'), (5644, 63.25, 'q16'), (5646, 64.25, 'q17'), (5648, 65.25, 'q18'), (5650, 66.25, 'q19'), (5652, 67.25, 'q20'), (5654, 68.25, 'q21'), (5656, 69.25, 'q22'), (5658, 70.25, 'q0'), (5660, 71.25, 'q1'), (5662, 72.25, 'q2'), (5664, 73.25, 'q3'), (5666, 74.25, 'q4'), (5668, 75.25, 'q5'), (5670, 76.25, 'q6'), (5672, 77.25, 'q7'), (5674, 78.25, 'q8'), (5676, 79.25, 'q9'), (5678, 80.25, 'q10'), (5680, 81.25, 'q11'), (5682, 82.25, 'q12'), (5684, 83.25, 'q13'), (5686, 84.25, 'q14'), (5688, 85.25, 'q15'), (5690, 86.25, 'q16'), (5692, 87.25, 'q17'), (5694, 88.25, 'q18'), (5696, 0.25, 'q19'), (5698, 1.25, 'q20'), (5700, 2.25, 'q21'), (5702, 3.25, 'q22'), (5704, 4.25, 'q0'), (5706, 5.25, 'q1'), (5708, 6.25, 'q2'), (5710, 7.25, 'q3'), (5712, 8.25, 'q4'), (5714, 9.25, 'q5'), (5716, 10.25, 'q6'), (5718, 11.25, 'q7'), (5720, 12.25, 'q8'), (5722, 13.25, 'q9'), (5724, 14.25, 'q10'), (5726, 15.25, 'q11'), (5728, 16.25, 'q12'), (5730, 17.25, 'q13'), (5732, 18.25, 'q14'), (5734, 19.25, 'q15'), (5736, 20.25, 'q16'), (5738, 21.25, 'q17'), (5740, 22.25, 'q18'), (5742, 23.25, 'q19'), (5744, 24.25, 'q20'), (5746, 25.25, 'q21'), (5748, 26.25, 'q22'), (5750, 27.25, 'q0'), (5752, 28.25, 'q1'), (5754, 29.25, 'q2'), (5756, 30.25, 'q3'), (5758, 31.25, 'q4'), (5760, 32.25, 'q5'), (5762, 33.25, 'q6'), (5764, 34.25, 'q7'), (5766, 35.25, 'q8'), (5768, 36.25, 'q9'), (5770, 37.25, 'q10'), (5772, 38.25, 'q11'), (5774, 39.25, 'q12'), (5776, 40.25, 'q13'), (5778, 41.25, 'q14'), (5780, 42.25, 'q15'), (5782, 43.25, 'q16'), (5784, 44.25, 'q17'), (5786, 45.25, 'q18'), (5788, 46.25, 'q19'), (5790, 47.25, 'q20'), (5792, 48.25, 'q21'), (5794, 49.25, 'q22'), (5796, 50.25, 'q0'), (5798, 51.25, 'q1'), (5800, 52.25, 'q2'), (5802, 53.25, 'q3'), (5804, 54.25, 'q4'), (5806, 55.25, 'q5'), (5808, 56.25, 'q6'), (5810, 57.25, 'q7'), (5812, 58.25, 'q8'), (5814, 59.25, 'q9'), (5816, 60.25, 'q10'), (5818, 61.25, 'q11'), (5820, 62.25, 'q12'), (5822, 63.25, 'q13'), (5824, 64.25, 'q14'), (5826, 65.25, 'q15'), (5828, 66.25, 'q16'), (5830, 67.25, 'q17'), (5832, 68.25, 'q18'), (5834, 69.25, 'q19'), (5836, 70.25, 'q20'), (5838, 71.25, 'q21'), (5840, 72.25, 'q22'), (5842, 73.25, 'q0'), (5844, 74.25, 'q1'), (5846, 75.25, 'q2'), (5848, 76.25, 'q3'), (5850, 77.25, 'q4'), (5852, 78.25, 'q5'), (5854, 79.25, 'q6'), (5856, 80.25, 'q7'), (5858, 81.25, 'q8'), (5860, 82.25, 'q9'), (5862, 83.25, 'q10'), (5864, 84.25, 'q11'), (5866, 85.25, 'q12'), (5868, 86.25, 'q13'), (5870, 87.25, 'q14'), (5872, 88.25, 'q15'), (5874, 0.25, 'q16'), (5876, 1.25, 'q17'), (5878, 2.25, 'q18'), (5880, 3.25, 'q19'), (5882, 4.25, 'q20'), (5884, 5.25, 'q21'), (5886, 6.25, 'q22'), (5888, 7.25, 'q0'), (5890, 8.25, 'q1'), (5892, 9.25, 'q2'), (5894, 10.25, 'q3'), (5896, 11.25, 'q4'), (5898, 12.25, 'q5'), (5900, 13.25, 'q6'), (5902, 14.25, 'q7'), (5904, 15.25, 'q8'), (5906, 16.25, 'q9'), (5908, 17.25, 'q10'), (5910, 18.25, 'q11'), (5912, 19.25, 'q12'), (5914, 20.25, 'q13'), (5916, 21.25, 'q14'), (5918, 22.25, 'q15'), (5920, 23.25, 'q16'), (5922, 24.25, 'q17'), (5924, 25.25, 'q18'), (5926, 26.25, 'q19'), (5928, 27.25, 'q20'), (5930, 28.25, 'q21'), (5932, 29.25, 'q22'), (5934, 30.25, 'q0'), (5936, 31.25, 'q1'), (5938, 32.25, 'q2'), (5940, 33.25, 'q3'), (5942, 34.25, 'q4'), (5944, 35.25, 'q5'), (5946, 36.25, 'q6'), (5948, 37.25, 'q7'), (5950, 38.25, 'q8'), (5952, 39.25, 'q9'), (5954, 40.25, 'q10'), (5956, 41.25, 'q11'), (5958, 42.25, 'q12'), (5960, 43.25, 'q13'), (5962, 44.25, 'q14'), (5964, 45.25, 'q15'), (5966, 46.25, 'q16'), (5968, 47.25, 'q17'), (5970, 48.25, 'q18'), (5972, 49.25, 'q19'), (5974, 50.25, 'q20'), (5976, 51.25, 'q21'), (5978, 52.25, 'q22'), (5980, 53.25, 'q0'), (5982, 54.25, 'q1'), (5984, 55.25, 'q2'), (5986, 56.25, 'q3'), (5988, 57.25, 'q4'), (5990, 58.25, 'q5'), (5992, 59.25, 'q6'), (5994, 60.25, 'q7'), (5996, 61.25, 'q8'), (5998, 62.25, 'q9');
+CREATE TABLE RK(K INT, C VARCHAR, PRIMARY KEY(K));
+INSERT INTO RK VALUES (0, 'k0'), (7, 'k1'), (14, 'k2'), (21, 'k3'), (28, 'k4'), (35, 'k5'), (42, 'k6'), (49, 'k7'), (56, 'k8'), (63, 'k9'), (70, 'k10'), (77, 'k11'), (84, 'k12'), (91, 'k13'), (98, 'k14'), (105, 'k15'), (112, 'k16'), (119, 'k17'), (126, 'k18'), (133, 'k0'), (140, 'k1'), (147, 'k2'), (154, 'k3'), (161, 'k4'), (168, 'k5'), (175, 'k6'), (182, 'k7'), (189, 'k8'), (196, 'k9'), (203, 'k10'), (210, 'k11'), (217, 'k12'), (224, 'k13'), (231, 'k14'), (238, 'k15'), (245, 'k16'), (252, 'k17'), (259, 'k18'), (266, 'k0'), (273, 'k1'), (280, 'k2'), (287, 'k3'), (294, 'k4'), (301, 'k5'), (308, 'k6'), (315, 'k7'), (322, 'k8'), (329, 'k9'), (336, 'k10'), (343, 'k11'), (350, 'k12'), (357, 'k13'), (364, 'k14'), (371, 'k15'), (378, 'k16'), (385, 'k17'), (392, 'k18'), (399, 'k0'), (406, 'k1'), (413, 'k2'), (420, 'k3'), (427, 'k4'), (434, 'k5'), (441, 'k6'), (448, 'k7'), (455, 'k8'), (462, 'k9'), (469, 'k10'), (476, 'k11'), (483, 'k12'), (490, 'k13'), (497, 'k14'), (504, 'k15'), (511, 'k16'), (518, 'k17'), (525, 'k18'), (532, 'k0'), (539, 'k1'), (546, 'k2'), (553, 'k3'), (560, 'k4'), (567, 'k5'), (574, 'k6'), (581, 'k7'), (588, 'k8'), (595, 'k9'), (602, 'k10'), (609, 'k11'), (616, 'k12'), (623, 'k13'), (630, 'k14'), (637, 'k15'), (644, 'k16'), (651, 'k17'), (658, 'k18'), (665, 'k0'), (672, 'k1'), (679, 'k2'), (686, 'k3'), (693, 'k4'), (700, 'k5'), (707, 'k6'), (714, 'k7'), (721, 'k8'), (728, 'k9'), (735, 'k10'), (742, 'k11'), (749, 'k12'), (756, 'k13'), (763, 'k14'), (770, 'k15'), (777, 'k16'), (784, 'k17'), (791, 'k18'), (798, 'k0'), (805, 'k1'), (812, 'k2'), (819, 'k3'), (826, 'k4'), (833, 'k5'), (840, 'k6'), (847, 'k7'), (854, 'k8'), (861, 'k9'), (868, 'k10'), (875, 'k11'), (882, 'k12'), (889, 'k13'), (896, 'k14'), (903, 'k15'), (910, 'k16'), (917, 'k17'), (924, 'k18'), (931, 'k0'), (938, 'k1'), (945, 'k2'), (952, 'k3'), (959, 'k4'), (966, 'k5'), (973, 'k6'), (980, 'k7'), (987, 'k8'), (994, 'k9'), (1001, 'k10'), (1008, 'k11'), (1015, 'k12'), (1022, 'k13'), (1029, 'k14'), (1036, 'k15'), (1043, 'k16'), (1050, 'k17'), (1057, 'k18'), (1064, 'k0'), (1071, 'k1'), (1078, 'k2'), (1085, 'k3'), (1092, 'k4'), (1099, 'k5'), (1106, 'k6'), (1113, 'k7'), (1120, 'k8'), (1127, 'k9'), (1134, 'k10'), (1141, 'k11'), (1148, 'k12'), (1155, 'k13'), (1162, 'k14'), (1169, 'k15'), (1176, 'k16'), (1183, 'k17'), (1190, 'k18'), (1197, 'k0'), (1204, 'k1'), (1211, 'k2'), (1218, 'k3'), (1225, 'k4'), (1232, 'k5'), (1239, 'k6'), (1246, 'k7'), (1253, 'k8'), (1260, 'k9'), (1267, 'k10'), (1274, 'k11'), (1281, 'k12'), (1288, 'k13'), (1295, 'k14'), (1302, 'k15'), (1309, 'k16'), (1316, 'k17'), (1323, 'k18'), (1330, 'k0'), (1337, 'k1'), (1344, 'k2'), (1351, 'k3'), (1358, 'k4'), (1365, 'k5'), (1372, 'k6'), (1379, 'k7'), (1386, 'k8'), (1393, 'k9'), (1400, 'k10'), (1407, 'k11'), (1414, 'k12'), (1421, 'k13'), (1428, 'k14'), (1435, 'k15'), (1442, 'k16'), (1449, 'k17'), (1456, 'k18'), (1463, 'k0'), (1470, 'k1'), (1477, 'k2'), (1484, 'k3'), (1491, 'k4'), (1498, 'k5'), (1505, 'k6'), (1512, 'k7'), (1519, 'k8'), (1526, 'k9'), (1533, 'k10'), (1540, 'k11'), (1547, 'k12'), (1554, 'k13'), (1561, 'k14'), (1568, 'k15'), (1575, 'k16'), (1582, 'k17'), (1589, 'k18'), (1596, 'k0'), (1603, 'k1'), (1610, 'k2'), (1617, 'k3'), (1624, 'k4'), (1631, 'k5'), (1638, 'k6'), (1645, 'k7'), (1652, 'k8'), (1659, 'k9'), (1666, 'k10'), (1673, 'k11'), (1680, 'k12'), (1687, 'k13'), (1694, 'k14'), (1701, 'k15'), (1708, 'k16'), (1715, 'k17'), (1722, 'k18'), (1729, 'k0'), (1736, 'k1'), (1743, 'k2'), (1750, 'k3'), (1757, 'k4'), (1764, 'k5'), (1771, 'k6'), (1778, 'k7'), (1785, 'k8'), (1792, 'k9'), (1799, 'k10'), (1806, 'k11'), (1813, 'k12'), (1820, 'k13'), (1827, 'k14'), (1834, 'k15'), (1841, 'k16'), (1848, 'k17'), (1855, 'k18'), (1862, 'k0'), (1869, 'k1'), (1876, 'k2'), (1883, 'k3'), (1890, 'k4'), (1897, 'k5'), (1904, 'k6'), (1911, 'k7'), (1918, 'k8'), (1925, 'k9'), (1932, 'k10'), (1939, 'k11'), (1946, 'k12'), (1953, 'k13'), (1960, 'k14'), (1967, 'k15'), (1974, 'k16'), (1981, 'k17'), (1988, 'k18'), (1995, 'k0'), (2002, 'k1'), (2009, 'k2'), (2016, 'k3'), (2023, 'k4'), (2030, 'k5'), (2037, 'k6'), (2044, 'k7'), (2051, 'k8'), (2058, 'k9'), (2065, 'k10'), (2072, 'k11'), (2079, 'k12'), (2086, 'k13'), (2093, 'k14'), (2100, 'k15'), (2107, 'k16'), (2114, 'k17'), (2121, 'k18'), (2128, 'k0'), (2135, 'k1'), (2142, 'k2'), (2149, 'k3'), (2156, 'k4'), (2163, 'k5'), (2170, 'k6'), (2177, 'k7'), (2184, 'k8'), (2191, 'k9'), (2198, 'k10'), (2205, 'k11'), (2212, 'k12'), (2219, 'k13'), (2226, 'k14'), (2233, 'k15'), (2240, 'k16'), (2247, 'k17'), (2254, 'k18'), (2261, 'k0'), (2268, 'k1'), (2275, 'k2'), (2282, 'k3'), (2289, 'k4'), (2296, 'k5'), (2303, 'k6'), (2310, 'k7'), (2317, 'k8'), (2324, 'k9'), (2331, 'k10'), (2338, 'k11'), (2345, 'k12'), (2352, 'k13'), (2359, 'k14'), (2366, 'k15'), (2373, 'k16'), (2380, 'k17'), (2387, 'k18'), (2394, 'k0'), (2401, 'k1'), (2408, 'k2'), (2415, 'k3'), (2422, 'k4'), (2429, 'k5'), (2436, 'k6'), (2443, 'k7'), (2450, 'k8'), (2457, 'k9'), (2464, 'k10'), (2471, 'k11'), (2478, 'k12'), (2485, 'k13'), (2492, 'k14'), (2499, 'k15'), (2506, 'k16'), (2513, 'k17'), (2520, 'k18'), (2527, 'k0'), (2534, 'k1'), (2541, 'k2'), (2548, 'k3'), (2555, 'k4'), (2562, 'k5'), (2569, 'k6'), (2576, 'k7'), (2583, 'k8'), (2590, 'k9'), (2597, 'k10'), (2604, 'k11'), (2611, 'k12'), (2618, 'k13'), (2625, 'k14'), (2632, 'k15'), (2639, 'k16'), (2646, 'k17'), (2653, 'k18'), (2660, 'k0'), (2667, 'k1'), (2674, 'k2'), (2681, 'k3'), (2688, 'k4'), (2695, 'k5'), (2702, 'k6'), (2709, 'k7'), (2716, 'k8'), (2723, 'k9'), (2730, 'k10'), (2737, 'k11'), (2744, 'k12'), (2751, 'k13'), (2758, 'k14'), (2765, 'k15'), (2772, 'k16'), (2779, 'k17'), (2786, 'k18'), (2793, 'k0'), (2800, 'k1'), (2807, 'k2'), (2814, 'k3'), (2821, 'k4'), (2828, 'k5'), (2835, 'k6'), (2842, 'k7'), (2849, 'k8'), (2856, 'k9'), (2863, 'k10'), (2870, 'k11'), (2877, 'k12'), (2884, 'k13'), (2891, 'k14'), (2898, 'k15'), (2905, 'k16'), (2912, 'k17'), (2919, 'k18'), (2926, 'k0'), (2933, 'k1'), (2940, 'k2'), (2947, 'k3'), (2954, 'k4'), (2961, 'k5'), (2968, 'k6'), (2975, 'k7'), (2982, 'k8'), (2989, 'k9'), (2996, 'k10'), (2, 'k11'), (9, 'k12'), (16, 'k13'), (23, 'k14'), (30, 'k15'), (37, 'k16'), (44, 'k17'), (51, 'k18'), (58, 'k0'), (65, 'k1'), (72, 'k2'), (79, 'k3'), (86, 'k4'), (93, 'k5'), (100, 'k6'), (107, 'k7'), (114, 'k8'), (121, 'k9'), (128, 'k10'), (135, 'k11'), (142, 'k12'), (149, 'k13'), (156, 'k14'), (163, 'k15'), (170, 'k16'), (177, 'k17'), (184, 'k18'), (191, 'k0'), (198, 'k1'), (205, 'k2'), (212, 'k3'), (219, 'k4'), (226, 'k5'), (233, 'k6'), (240, 'k7'), (247, 'k8'), (254, 'k9'), (261, 'k10'), (268, 'k11'), (275, 'k12'), (282, 'k13'), (289, 'k14'), (296, 'k15'), (303, 'k16'), (310, 'k17'), (317, 'k18'), (324, 'k0'), (331, 'k1'), (338, 'k2'), (345, 'k3'), (352, 'k4'), (359, 'k5'), (366, 'k6'), (373, 'k7'), (380, 'k8'), (387, 'k9'), (394, 'k10'), (401, 'k11'), (408, 'k12'), (415, 'k13'), (422, 'k14'), (429, 'k15'), (436, 'k16'), (443, 'k17'), (450, 'k18'), (457, 'k0'), (464, 'k1'), (471, 'k2'), (478, 'k3'), (485, 'k4'), (492, 'k5'), (499, 'k6'), (506, 'k7'), (513, 'k8'), (520, 'k9'), (527, 'k10'), (534, 'k11'), (541, 'k12'), (548, 'k13'), (555, 'k14'), (562, 'k15'), (569, 'k16'), (576, 'k17'), (583, 'k18'), (590, 'k0'), (597, 'k1'), (604, 'k2'), (611, 'k3'), (618, 'k4'), (625, 'k5'), (632, 'k6'), (639, 'k7'), (646, 'k8'), (653, 'k9'), (660, 'k10'), (667, 'k11'), (674, 'k12'), (681, 'k13'), (688, 'k14'), (695, 'k15'), (702, 'k16'), (709, 'k17'), (716, 'k18'), (723, 'k0'), (730, 'k1'), (737, 'k2'), (744, 'k3'), (751, 'k4'), (758, 'k5'), (765, 'k6'), (772, 'k7'), (779, 'k8'), (786, 'k9'), (793, 'k10'), (800, 'k11'), (807, 'k12'), (814, 'k13'), (821, 'k14'), (828, 'k15'), (835, 'k16'), (842, 'k17'), (849, 'k18'), (856, 'k0'), (863, 'k1'), (870, 'k2'), (877, 'k3'), (884, 'k4'), (891, 'k5'), (898, 'k6'), (905, 'k7'), (912, 'k8'), (919, 'k9'), (926, 'k10'), (933, 'k11'), (940, 'k12'), (947, 'k13'), (954, 'k14'), (961, 'k15'), (968, 'k16'), (975, 'k17'), (982, 'k18'), (989, 'k0'), (996, 'k1'), (1003, 'k2'), (1010, 'k3'), (1017, 'k4'), (1024, 'k5'), (1031, 'k6'), (1038, 'k7'), (1045, 'k8'), (1052, 'k9'), (1059, 'k10'), (1066, 'k11'), (1073, 'k12'), (1080, 'k13'), (1087, 'k14'), (1094, 'k15'), (1101, 'k16'), (1108, 'k17'), (1115, 'k18'), (1122, 'k0'), (1129, 'k1'), (1136, 'k2'), (1143, 'k3'), (1150, 'k4'), (1157, 'k5'), (1164, 'k6'), (1171, 'k7'), (1178, 'k8'), (1185, 'k9'), (1192, 'k10'), (1199, 'k11'), (1206, 'k12'), (1213, 'k13'), (1220, 'k14'), (1227, 'k15'), (1234, 'k16'), (1241, 'k17'), (1248, 'k18'), (1255, 'k0'), (1262, 'k1'), (1269, 'k2'), (1276, 'k3'), (1283, 'k4'), (1290, 'k5'), (1297, 'k6'), (1304, 'k7'), (1311, 'k8'), (1318, 'k9'), (1325, 'k10'), (1332, 'k11'), (1339, 'k12'), (1346, 'k13'), (1353, 'k14'), (1360, 'k15'), (1367, 'k16'), (1374, 'k17'), (1381, 'k18'), (1388, 'k0'), (1395, 'k1'), (1402, 'k2'), (1409, 'k3'), (1416, 'k4'), (1423, 'k5'), (1430, 'k6'), (1437, 'k7'), (1444, 'k8'), (1451, 'k9'), (1458, 'k10'), (1465, 'k11'), (1472, 'k12'), (1479, 'k13'), (1486, 'k14'), (1493, 'k15'), (1500, 'k16'), (1507, 'k17'), (1514, 'k18'), (1521, 'k0'), (1528, 'k1'), (1535, 'k2'), (1542, 'k3'), (1549, 'k4'), (1556, 'k5'), (1563, 'k6'), (1570, 'k7'), (1577, 'k8'), (1584, 'k9'), (1591, 'k10'), (1598, 'k11'), (1605, 'k12'), (1612, 'k13'), (1619, 'k14'), (1626, 'k15'), (1633, 'k16'), (1640, 'k17'), (1647, 'k18'), (1654, 'k0'), (1661, 'k1'), (1668, 'k2'), (1675, 'k3'), (1682, 'k4'), (1689, 'k5'), (1696, 'k6'), (1703, 'k7'), (1710, 'k8'), (1717, 'k9'), (1724, 'k10'), (1731, 'k11'), (1738, 'k12'), (1745, 'k13'), (1752, 'k14'), (1759, 'k15'), (1766, 'k16'), (1773, 'k17'), (1780, 'k18'), (1787, 'k0'), (1794, 'k1'), (1801, 'k2'), (1808, 'k3'), (1815, 'k4'), (1822, 'k5'), (1829, 'k6'), (1836, 'k7'), (1843, 'k8'), (1850, 'k9'), (1857, 'k10'), (1864, 'k11'), (1871, 'k12'), (1878, 'k13'), (1885, 'k14'), (1892, 'k15'), (1899, 'k16'), (1906, 'k17'), (1913, 'k18'), (1920, 'k0'), (1927, 'k1'), (1934, 'k2'), (1941, 'k3'), (1948, 'k4'), (1955, 'k5'), (1962, 'k6'), (1969, 'k7'), (1976, 'k8'), (1983, 'k9'), (1990, 'k10'), (1997, 'k11'), (2004, 'k12'), (2011, 'k13'), (2018, 'k14'), (2025, 'k15'), (2032, 'k16'), (2039, 'k17'), (2046, 'k18'), (2053, 'k0'), (2060, 'k1'), (2067, 'k2'), (2074, 'k3'), (2081, 'k4'), (2088, 'k5'), (2095, 'k6'), (2102, 'k7'), (2109, 'k8'), (2116, 'k9'), (2123, 'k10'), (2130, 'k11'), (2137, 'k12'), (2144, 'k13'), (2151, 'k14'), (2158, 'k15'), (2165, 'k16'), (2172, 'k17'), (2179, 'k18'), (2186, 'k0'), (2193, 'k1'), (2200, 'k2'), (2207, 'k3'), (2214, 'k4'), (2221, 'k5'), (2228, 'k6'), (2235, 'k7'), (2242, 'k8'), (2249, 'k9'), (2256, 'k10'), (2263, 'k11'), (2270, 'k12'), (2277, 'k13'), (2284, 'k14'), (2291, 'k15'), (2298, 'k16'), (2305, 'k17'), (2312, 'k18'), (2319, 'k0'), (2326, 'k1'), (2333, 'k2'), (2340, 'k3'), (2347, 'k4'), (2354, 'k5'), (2361, 'k6'), (2368, 'k7'), (2375, 'k8'), (2382, 'k9'), (2389, 'k10'), (2396, 'k11'), (2403, 'k12'), (2410, 'k13'), (2417, 'k14'), (2424, 'k15'), (2431, 'k16'), (2438, 'k17'), (2445, 'k18'), (2452, 'k0'), (2459, 'k1'), (2466, 'k2'), (2473, 'k3'), (2480, 'k4'), (2487, 'k5'), (2494, 'k6'), (2501, 'k7'), (2508, 'k8'), (2515, 'k9'), (2522, 'k10'), (2529, 'k11'), (2536, 'k12'), (2543, 'k13'), (2550, 'k14'), (2557, 'k15'), (2564, 'k16'), (2571, 'k17'), (2578, 'k18'), (2585, 'k0'), (2592, 'k1'), (2599, 'k2'), (2606, 'k3'), (2613, 'k4'), (2620, 'k5'), (2627, 'k6'), (2634, 'k7'), (2641, 'k8'), (2648, 'k9'), (2655, 'k10'), (2662, 'k11'), (2669, 'k12'), (2676, 'k13'), (2683, 'k14'), (2690, 'k15'), (2697, 'k16'), (2704, 'k17'), (2711, 'k18'), (2718, 'k0'), (2725, 'k1'), (2732, 'k2'), (2739, 'k3'), (2746, 'k4'), (2753, 'k5'), (2760, 'k6'), (2767, 'k7'), (2774, 'k8'), (2781, 'k9'), (2788, 'k10'), (2795, 'k11'), (2802, 'k12'), (2809, 'k13'), (2816, 'k14'), (2823, 'k15'), (2830, 'k16'), (2837, 'k17'), (2844, 'k18'), (2851, 'k0'), (2858, 'k1'), (2865, 'k2'), (2872, 'k3'), (2879, 'k4'), (2886, 'k5'), (2893, 'k6'), (2900, 'k7'), (2907, 'k8'), (2914, 'k9'), (2921, 'k10'), (2928, 'k11'), (2935, 'k12'), (2942, 'k13'), (2949, 'k14'), (2956, 'k15'), (2963, 'k16'), (2970, 'k17'), (2977, 'k18'), (2984, 'k0'), (2991, 'k1'), (2998, 'k2'), (4, 'k3'), (11, 'k4'), (18, 'k5'), (25, 'k6'), (32, 'k7'), (39, 'k8'), (46, 'k9'), (53, 'k10'), (60, 'k11'), (67, 'k12'), (74, 'k13'), (81, 'k14'), (88, 'k15'), (95, 'k16'), (102, 'k17'), (109, 'k18'), (116, 'k0'), (123, 'k1'), (130, 'k2'), (137, 'k3'), (144, 'k4'), (151, 'k5'), (158, 'k6'), (165, 'k7'), (172, 'k8'), (179, 'k9'), (186, 'k10'), (193, 'k11'), (200, 'k12'), (207, 'k13'), (214, 'k14'), (221, 'k15'), (228, 'k16'), (235, 'k17'), (242, 'k18'), (249, 'k0'), (256, 'k1'), (263, 'k2'), (270, 'k3'), (277, 'k4'), (284, 'k5'), (291, 'k6'), (298, 'k7'), (305, 'k8'), (312, 'k9'), (319, 'k10'), (326, 'k11'), (333, 'k12'), (340, 'k13'), (347, 'k14'), (354, 'k15'), (361, 'k16'), (368, 'k17'), (375, 'k18'), (382, 'k0'), (389, 'k1'), (396, 'k2'), (403, 'k3'), (410, 'k4'), (417, 'k5'), (424, 'k6'), (431, 'k7'), (438, 'k8'), (445, 'k9'), (452, 'k10'), (459, 'k11'), (466, 'k12'), (473, 'k13'), (480, 'k14'), (487, 'k15'), (494, 'k16'), (501, 'k17'), (508, 'k18'), (515, 'k0'), (522, 'k1'), (529, 'k2'), (536, 'k3'), (543, 'k4'), (550, 'k5'), (557, 'k6'), (564, 'k7'), (571, 'k8'), (578, 'k9'), (585, 'k10'), (592, 'k11'), (599, 'k12'), (606, 'k13'), (613, 'k14'), (620, 'k15'), (627, 'k16'), (634, 'k17'), (641, 'k18'), (648, 'k0'), (655, 'k1'), (662, 'k2'), (669, 'k3'), (676, 'k4'), (683, 'k5'), (690, 'k6'), (697, 'k7'), (704, 'k8'), (711, 'k9'), (718, 'k10'), (725, 'k11'), (732, 'k12'), (739, 'k13'), (746, 'k14'), (753, 'k15'), (760, 'k16'), (767, 'k17'), (774, 'k18'), (781, 'k0'), (788, 'k1'), (795, 'k2'), (802, 'k3'), (809, 'k4'), (816, 'k5'), (823, 'k6'), (830, 'k7'), (837, 'k8'), (844, 'k9'), (851, 'k10'), (858, 'k11'), (865, 'k12'), (872, 'k13'), (879, 'k14'), (886, 'k15'), (893, 'k16'), (900, 'k17'), (907, 'k18'), (914, 'k0'), (921, 'k1'), (928, 'k2'), (935, 'k3'), (942, 'k4'), (949, 'k5'), (956, 'k6'), (963, 'k7'), (970, 'k8'), (977, 'k9'), (984, 'k10'), (991, 'k11'), (998, 'k12'), (1005, 'k13'), (1012, 'k14'), (1019, 'k15'), (1026, 'k16'), (1033, 'k17'), (1040, 'k18'), (1047, 'k0'), (1054, 'k1'), (1061, 'k2'), (1068, 'k3'), (1075, 'k4'), (1082, 'k5'), (1089, 'k6'), (1096, 'k7'), (1103, 'k8'), (1110, 'k9'), (1117, 'k10'), (1124, 'k11'), (1131, 'k12'), (1138, 'k13'), (1145, 'k14'), (1152, 'k15'), (1159, 'k16'), (1166, 'k17'), (1173, 'k18'), (1180, 'k0'), (1187, 'k1'), (1194, 'k2'), (1201, 'k3'), (1208, 'k4'), (1215, 'k5'), (1222, 'k6'), (1229, 'k7'), (1236, 'k8'), (1243, 'k9'), (1250, 'k10'), (1257, 'k11'), (1264, 'k12'), (1271, 'k13'), (1278, 'k14'), (1285, 'k15'), (1292, 'k16'), (1299, 'k17'), (1306, 'k18'), (1313, 'k0'), (1320, 'k1'), (1327, 'k2'), (1334, 'k3'), (1341, 'k4'), (1348, 'k5'), (1355, 'k6'), (1362, 'k7'), (1369, 'k8'), (1376, 'k9'), (1383, 'k10'), (1390, 'k11'), (1397, 'k12'), (1404, 'k13'), (1411, 'k14'), (1418, 'k15'), (1425, 'k16'), (1432, 'k17'), (1439, 'k18'), (1446, 'k0'), (1453, 'k1'), (1460, 'k2'), (1467, 'k3'), (1474, 'k4'), (1481, 'k5'), (1488, 'k6'), (1495, 'k7'), (1502, 'k8'), (1509, 'k9'), (1516, 'k10'), (1523, 'k11'), (1530, 'k12'), (1537, 'k13'), (1544, 'k14'), (1551, 'k15'), (1558, 'k16'), (1565, 'k17'), (1572, 'k18'), (1579, 'k0'), (1586, 'k1'), (1593, 'k2'), (1600, 'k3'), (1607, 'k4'), (1614, 'k5'), (1621, 'k6'), (1628, 'k7'), (1635, 'k8'), (1642, 'k9'), (1649, 'k10'), (1656, 'k11'), (1663, 'k12'), (1670, 'k13'), (1677, 'k14'), (1684, 'k15'), (1691, 'k16'), (1698, 'k17'), (1705, 'k18'), (1712, 'k0'), (1719, 'k1'), (1726, 'k2'), (1733, 'k3'), (1740, 'k4'), (1747, 'k5'), (1754, 'k6'), (1761, 'k7'), (1768, 'k8'), (1775, 'k9'), (1782, 'k10'), (1789, 'k11'), (1796, 'k12'), (1803, 'k13'), (1810, 'k14'), (1817, 'k15'), (1824, 'k16'), (1831, 'k17'), (1838, 'k18'), (1845, 'k0'), (1852, 'k1'), (1859, 'k2'), (1866, 'k3'), (1873, 'k4'), (1880, 'k5'), (1887, 'k6'), (1894, 'k7'), (1901, 'k8'), (1908, 'k9'), (1915, 'k10'), (1922, 'k11'), (1929, 'k12'), (1936, 'k13'), (1943, 'k14'), (1950, 'k15'), (1957, 'k16'), (1964, 'k17'), (1971, 'k18'), (1978, 'k0'), (1985, 'k1'), (1992, 'k2'), (1999, 'k3'), (2006, 'k4'), (2013, 'k5'), (2020, 'k6'), (2027, 'k7'), (2034, 'k8'), (2041, 'k9'), (2048, 'k10'), (2055, 'k11'), (2062, 'k12'), (2069, 'k13'), (2076, 'k14'), (2083, 'k15'), (2090, 'k16'), (2097, 'k17'), (2104, 'k18'), (2111, 'k0'), (2118, 'k1'), (2125, 'k2'), (2132, 'k3'), (2139, 'k4'), (2146, 'k5'), (2153, 'k6'), (2160, 'k7'), (2167, 'k8'), (2174, 'k9'), (2181, 'k10'), (2188, 'k11'), (2195, 'k12'), (2202, 'k13'), (2209, 'k14'), (2216, 'k15'), (2223, 'k16'), (2230, 'k17'), (2237, 'k18'), (2244, 'k0'), (2251, 'k1'), (2258, 'k2'), (2265, 'k3'), (2272, 'k4'), (2279, 'k5'), (2286, 'k6'), (2293, 'k7'), (2300, 'k8'), (2307, 'k9'), (2314, 'k10'), (2321, 'k11'), (2328, 'k12'), (2335, 'k13'), (2342, 'k14'), (2349, 'k15'), (2356, 'k16'), (2363, 'k17'), (2370, 'k18'), (2377, 'k0'), (2384, 'k1'), (2391, 'k2'), (2398, 'k3'), (2405, 'k4'), (2412, 'k5'), (2419, 'k6'), (2426, 'k7'), (2433, 'k8'), (2440, 'k9'), (2447, 'k10'), (2454, 'k11'), (2461, 'k12'), (2468, 'k13'), (2475, 'k14'), (2482, 'k15'), (2489, 'k16'), (2496, 'k17'), (2503, 'k18'), (2510, 'k0'), (2517, 'k1'), (2524, 'k2'), (2531, 'k3'), (2538, 'k4'), (2545, 'k5'), (2552, 'k6'), (2559, 'k7'), (2566, 'k8'), (2573, 'k9'), (2580, 'k10'), (2587, 'k11'), (2594, 'k12'), (2601, 'k13'), (2608, 'k14'), (2615, 'k15'), (2622, 'k16'), (2629, 'k17'), (2636, 'k18'), (2643, 'k0'), (2650, 'k1'), (2657, 'k2'), (2664, 'k3'), (2671, 'k4'), (2678, 'k5'), (2685, 'k6'), (2692, 'k7'), (2699, 'k8'), (2706, 'k9'), (2713, 'k10'), (2720, 'k11'), (2727, 'k12'), (2734, 'k13'), (2741, 'k14'), (2748, 'k15'), (2755, 'k16'), (2762, 'k17'), (2769, 'k18'), (2776, 'k0'), (2783, 'k1'), (2790, 'k2'), (2797, 'k3'), (2804, 'k4'), (2811, 'k5'), (2818, 'k6'), (2825, 'k7'), (2832, 'k8'), (2839, 'k9'), (2846, 'k10'), (2853, 'k11'), (2860, 'k12'), (2867, 'k13'), (2874, 'k14'), (2881, 'k15'), (2888, 'k16'), (2895, 'k17'), (2902, 'k18'), (2909, 'k0'), (2916, 'k1'), (2923, 'k2'), (2930, 'k3'), (2937, 'k4'), (2944, 'k5'), (2951, 'k6'), (2958, 'k7'), (2965, 'k8'), (2972, 'k9'), (2979, 'k10'), (2986, 'k11'), (2993, 'k12'), (3000, 'k13'), (6, 'k14'), (13, 'k15'), (20, 'k16'), (27, 'k17'), (34, 'k18'), (41, 'k0'), (48, 'k1'), (55, 'k2'), (62, 'k3'), (69, 'k4'), (76, 'k5'), (83, 'k6'), (90, 'k7'), (97, 'k8'), (104, 'k9'), (111, 'k10'), (118, 'k11'), (125, 'k12'), (132, 'k13'), (139, 'k14'), (146, 'k15'), (153, 'k16'), (160, 'k17'), (167, 'k18'), (174, 'k0'), (181, 'k1'), (188, 'k2'), (195, 'k3'), (202, 'k4'), (209, 'k5'), (216, 'k6'), (223, 'k7'), (230, 'k8'), (237, 'k9'), (244, 'k10'), (251, 'k11'), (258, 'k12'), (265, 'k13'), (272, 'k14'), (279, 'k15'), (286, 'k16'), (293, 'k17'), (300, 'k18'), (307, 'k0'), (314, 'k1'), (321, 'k2'), (328, 'k3'), (335, 'k4'), (342, 'k5'), (349, 'k6'), (356, 'k7'), (363, 'k8'), (370, 'k9'), (377, 'k10'), (384, 'k11'), (391, 'k12'), (398, 'k13'), (405, 'k14'), (412, 'k15'), (419, 'k16'), (426, 'k17'), (433, 'k18'), (440, 'k0'), (447, 'k1'), (454, 'k2'), (461, 'k3'), (468, 'k4'), (475, 'k5'), (482, 'k6'), (489, 'k7'), (496, 'k8'), (503, 'k9'), (510, 'k10'), (517, 'k11'), (524, 'k12'), (531, 'k13'), (538, 'k14'), (545, 'k15'), (552, 'k16'), (559, 'k17'), (566, 'k18'), (573, 'k0'), (580, 'k1'), (587, 'k2'), (594, 'k3'), (601, 'k4'), (608, 'k5'), (615, 'k6'), (622, 'k7'), (629, 'k8'), (636, 'k9'), (643, 'k10'), (650, 'k11'), (657, 'k12'), (664, 'k13'), (671, 'k14'), (678, 'k15'), (685, 'k16'), (692, 'k17'), (699, 'k18'), (706, 'k0'), (713, 'k1'), (720, 'k2'), (727, 'k3'), (734, 'k4'), (741, 'k5'), (748, 'k6'), (755, 'k7'), (762, 'k8'), (769, 'k9'), (776, 'k10'), (783, 'k11'), (790, 'k12'), (797, 'k13'), (804, 'k14'), (811, 'k15'), (818, 'k16'), (825, 'k17'), (832, 'k18'), (839, 'k0'), (846, 'k1'), (853, 'k2'), (860, 'k3'), (867, 'k4'), (874, 'k5'), (881, 'k6'), (888, 'k7'), (895, 'k8'), (902, 'k9'), (909, 'k10'), (916, 'k11'), (923, 'k12'), (930, 'k13'), (937, 'k14'), (944, 'k15'), (951, 'k16'), (958, 'k17'), (965, 'k18'), (972, 'k0'), (979, 'k1'), (986, 'k2'), (993, 'k3'), (1000, 'k4'), (1007, 'k5'), (1014, 'k6'), (1021, 'k7'), (1028, 'k8'), (1035, 'k9'), (1042, 'k10'), (1049, 'k11'), (1056, 'k12'), (1063, 'k13'), (1070, 'k14'), (1077, 'k15'), (1084, 'k16'), (1091, 'k17'), (1098, 'k18'), (1105, 'k0'), (1112, 'k1'), (1119, 'k2'), (1126, 'k3'), (1133, 'k4'), (1140, 'k5'), (1147, 'k6'), (1154, 'k7'), (1161, 'k8'), (1168, 'k9'), (1175, 'k10'), (1182, 'k11'), (1189, 'k12'), (1196, 'k13'), (1203, 'k14'), (1210, 'k15'), (1217, 'k16'), (1224, 'k17'), (1231, 'k18'), (1238, 'k0'), (1245, 'k1'), (1252, 'k2'), (1259, 'k3'), (1266, 'k4'), (1273, 'k5'), (1280, 'k6'), (1287, 'k7'), (1294, 'k8'), (1301, 'k9'), (1308, 'k10'), (1315, 'k11'), (1322, 'k12'), (1329, 'k13'), (1336, 'k14'), (1343, 'k15'), (1350, 'k16'), (1357, 'k17'), (1364, 'k18'), (1371, 'k0'), (1378, 'k1'), (1385, 'k2'), (1392, 'k3'), (1399, 'k4'), (1406, 'k5'), (1413, 'k6'), (1420, 'k7'), (1427, 'k8'), (1434, 'k9'), (1441, 'k10'), (1448, 'k11'), (1455, 'k12'), (1462, 'k13'), (1469, 'k14'), (1476, 'k15'), (1483, 'k16'), (1490, 'k17'), (1497, 'k18'), (1504, 'k0'), (1511, 'k1'), (1518, 'k2'), (1525, 'k3'), (1532, 'k4'), (1539, 'k5'), (1546, 'k6'), (1553, 'k7'), (1560, 'k8'), (1567, 'k9'), (1574, 'k10'), (1581, 'k11'), (1588, 'k12'), (1595, 'k13'), (1602, 'k14'), (1609, 'k15'), (1616, 'k16'), (1623, 'k17'), (1630, 'k18'), (1637, 'k0'), (1644, 'k1'), (1651, 'k2'), (1658, 'k3'), (1665, 'k4'), (1672, 'k5'), (1679, 'k6'), (1686, 'k7'), (1693, 'k8'), (1700, 'k9'), (1707, 'k10'), (1714, 'k11'), (1721, 'k12'), (1728, 'k13'), (1735, 'k14'), (1742, 'k15'), (1749, 'k16'), (1756, 'k17'), (1763, 'k18'), (1770, 'k0'), (1777, 'k1'), (1784, 'k2'), (1791, 'k3'), (1798, 'k4'), (1805, 'k5'), (1812, 'k6'), (1819, 'k7'), (1826, 'k8'), (1833, 'k9'), (1840, 'k10'), (1847, 'k11'), (1854, 'k12'), (1861, 'k13'), (1868, 'k14'), (1875, 'k15'), (1882, 'k16'), (1889, 'k17'), (1896, 'k18'), (1903, 'k0'), (1910, 'k1'), (1917, 'k2'), (1924, 'k3'), (1931, 'k4'), (1938, 'k5'), (1945, 'k6'), (1952, 'k7'), (1959, 'k8'), (1966, 'k9'), (1973, 'k10'), (1980, 'k11'), (1987, 'k12'), (1994, 'k13'), (2001, 'k14'), (2008, 'k15'), (2015, 'k16'), (2022, 'k17'), (2029, 'k18'), (2036, 'k0'), (2043, 'k1'), (2050, 'k2'), (2057, 'k3'), (2064, 'k4'), (2071, 'k5'), (2078, 'k6'), (2085, 'k7'), (2092, 'k8'), (2099, 'k9'), (2106, 'k10'), (2113, 'k11'), (2120, 'k12'), (2127, 'k13'), (2134, 'k14'), (2141, 'k15'), (2148, 'k16'), (2155, 'k17'), (2162, 'k18'), (2169, 'k0'), (2176, 'k1'), (2183, 'k2'), (2190, 'k3'), (2197, 'k4'), (2204, 'k5'), (2211, 'k6'), (2218, 'k7'), (2225, 'k8'), (2232, 'k9'), (2239, 'k10'), (2246, 'k11'), (2253, 'k12'), (2260, 'k13'), (2267, 'k14'), (2274, 'k15'), (2281, 'k16'), (2288, 'k17'), (2295, 'k18'), (2302, 'k0'), (2309, 'k1'), (2316, 'k2'), (2323, 'k3'), (2330, 'k4'), (2337, 'k5'), (2344, 'k6'), (2351, 'k7'), (2358, 'k8'), (2365, 'k9'), (2372, 'k10'), (2379, 'k11'), (2386, 'k12'), (2393, 'k13'), (2400, 'k14'), (2407, 'k15'), (2414, 'k16'), (2421, 'k17'), (2428, 'k18'), (2435, 'k0'), (2442, 'k1'), (2449, 'k2'), (2456, 'k3'), (2463, 'k4'), (2470, 'k5'), (2477, 'k6'), (2484, 'k7'), (2491, 'k8'), (2498, 'k9'), (2505, 'k10'), (2512, 'k11'), (2519, 'k12'), (2526, 'k13'), (2533, 'k14'), (2540, 'k15'), (2547, 'k16'), (2554, 'k17'), (2561, 'k18'), (2568, 'k0'), (2575, 'k1'), (2582, 'k2'), (2589, 'k3'), (2596, 'k4'), (2603, 'k5'), (2610, 'k6'), (2617, 'k7'), (2624, 'k8'), (2631, 'k9'), (2638, 'k10'), (2645, 'k11'), (2652, 'k12'), (2659, 'k13'), (2666, 'k14'), (2673, 'k15'), (2680, 'k16'), (2687, 'k17'), (2694, 'k18'), (2701, 'k0'), (2708, 'k1'), (2715, 'k2'), (2722, 'k3'), (2729, 'k4'), (2736, 'k5'), (2743, 'k6'), (2750, 'k7'), (2757, 'k8'), (2764, 'k9'), (2771, 'k10'), (2778, 'k11'), (2785, 'k12'), (2792, 'k13'), (2799, 'k14'), (2806, 'k15'), (2813, 'k16'), (2820, 'k17'), (2827, 'k18'), (2834, 'k0'), (2841, 'k1'), (2848, 'k2'), (2855, 'k3'), (2862, 'k4'), (2869, 'k5'), (2876, 'k6'), (2883, 'k7'), (2890, 'k8'), (2897, 'k9'), (2904, 'k10'), (2911, 'k11'), (2918, 'k12'), (2925, 'k13'), (2932, 'k14'), (2939, 'k15'), (2946, 'k16'), (2953, 'k17'), (2960, 'k18'), (2967, 'k0'), (2974, 'k1'), (2981, 'k2'), (2988, 'k3'), (2995, 'k4'), (1, 'k5'), (8, 'k6'), (15, 'k7'), (22, 'k8'), (29, 'k9'), (36, 'k10'), (43, 'k11'), (50, 'k12'), (57, 'k13'), (64, 'k14'), (71, 'k15'), (78, 'k16'), (85, 'k17'), (92, 'k18'), (99, 'k0'), (106, 'k1'), (113, 'k2'), (120, 'k3'), (127, 'k4'), (134, 'k5'), (141, 'k6'), (148, 'k7'), (155, 'k8'), (162, 'k9'), (169, 'k10'), (176, 'k11'), (183, 'k12'), (190, 'k13'), (197, 'k14'), (204, 'k15'), (211, 'k16'), (218, 'k17'), (225, 'k18'), (232, 'k0'), (239, 'k1'), (246, 'k2'), (253, 'k3'), (260, 'k4'), (267, 'k5'), (274, 'k6'), (281, 'k7'), (288, 'k8'), (295, 'k9'), (302, 'k10'), (309, 'k11'), (316, 'k12'), (323, 'k13'), (330, 'k14'), (337, 'k15'), (344, 'k16'), (351, 'k17'), (358, 'k18'), (365, 'k0'), (372, 'k1'), (379, 'k2'), (386, 'k3'), (393, 'k4'), (400, 'k5'), (407, 'k6'), (414, 'k7'), (421, 'k8'), (428, 'k9'), (435, 'k10'), (442, 'k11'), (449, 'k12'), (456, 'k13'), (463, 'k14'), (470, 'k15'), (477, 'k16'), (484, 'k17'), (491, 'k18'), (498, 'k0'), (505, 'k1'), (512, 'k2'), (519, 'k3'), (526, 'k4'), (533, 'k5'), (540, 'k6'), (547, 'k7'), (554, 'k8'), (561, 'k9'), (568, 'k10'), (575, 'k11'), (582, 'k12'), (589, 'k13'), (596, 'k14'), (603, 'k15'), (610, 'k16'), (617, 'k17'), (624, 'k18'), (631, 'k0'), (638, 'k1'), (645, 'k2'), (652, 'k3'), (659, 'k4'), (666, 'k5'), (673, 'k6'), (680, 'k7'), (687, 'k8'), (694, 'k9'), (701, 'k10'), (708, 'k11'), (715, 'k12'), (722, 'k13'), (729, 'k14'), (736, 'k15'), (743, 'k16'), (750, 'k17'), (757, 'k18'), (764, 'k0'), (771, 'k1'), (778, 'k2'), (785, 'k3'), (792, 'k4'), (799, 'k5'), (806, 'k6'), (813, 'k7'), (820, 'k8'), (827, 'k9'), (834, 'k10'), (841, 'k11'), (848, 'k12'), (855, 'k13'), (862, 'k14'), (869, 'k15'), (876, 'k16'), (883, 'k17'), (890, 'k18'), (897, 'k0'), (904, 'k1'), (911, 'k2'), (918, 'k3'), (925, 'k4'), (932, 'k5'), (939, 'k6'), (946, 'k7'), (953, 'k8'), (960, 'k9'), (967, 'k10'), (974, 'k11'), (981, 'k12'), (988, 'k13'), (995, 'k14'), (1002, 'k15'), (1009, 'k16'), (1016, 'k17'), (1023, 'k18'), (1030, 'k0'), (1037, 'k1'), (1044, 'k2'), (1051, 'k3'), (1058, 'k4'), (1065, 'k5'), (1072, 'k6'), (1079, 'k7'), (1086, 'k8'), (1093, 'k9'), (1100, 'k10'), (1107, 'k11'), (1114, 'k12'), (1121, 'k13'), (1128, 'k14'), (1135, 'k15'), (1142, 'k16'), (1149, 'k17'), (1156, 'k18'), (1163, 'k0'), (1170, 'k1'), (1177, 'k2'), (1184, 'k3'), (1191, 'k4'), (1198, 'k5'), (1205, 'k6'), (1212, 'k7'), (1219, 'k8'), (1226, 'k9'), (1233, 'k10'), (1240, 'k11'), (1247, 'k12'), (1254, 'k13'), (1261, 'k14'), (1268, 'k15'), (1275, 'k16'), (1282, 'k17'), (1289, 'k18'), (1296, 'k0'), (1303, 'k1'), (1310, 'k2'), (1317, 'k3'), (1324, 'k4'), (1331, 'k5'), (1338, 'k6'), (1345, 'k7'), (1352, 'k8'), (1359, 'k9'), (1366, 'k10'), (1373, 'k11'), (1380, 'k12'), (1387, 'k13'), (1394, 'k14'), (1401, 'k15'), (1408, 'k16'), (1415, 'k17'), (1422, 'k18'), (1429, 'k0'), (1436, 'k1'), (1443, 'k2'), (1450, 'k3'), (1457, 'k4'), (1464, 'k5'), (1471, 'k6'), (1478, 'k7'), (1485, 'k8'), (1492, 'k9'), (1499, 'k10'), (1506, 'k11'), (1513, 'k12'), (1520, 'k13'), (1527, 'k14'), (1534, 'k15'), (1541, 'k16'), (1548, 'k17'), (1555, 'k18'), (1562, 'k0'), (1569, 'k1'), (1576, 'k2'), (1583, 'k3'), (1590, 'k4'), (1597, 'k5'), (1604, 'k6'), (1611, 'k7'), (1618, 'k8'), (1625, 'k9'), (1632, 'k10'), (1639, 'k11'), (1646, 'k12'), (1653, 'k13'), (1660, 'k14'), (1667, 'k15'), (1674, 'k16'), (1681, 'k17'), (1688, 'k18'), (1695, 'k0'), (1702, 'k1'), (1709, 'k2'), (1716, 'k3'), (1723, 'k4'), (1730, 'k5'), (1737, 'k6'), (1744, 'k7'), (1751, 'k8'), (1758, 'k9'), (1765, 'k10'), (1772, 'k11'), (1779, 'k12'), (1786, 'k13'), (1793, 'k14'), (1800, 'k15'), (1807, 'k16'), (1814, 'k17'), (1821, 'k18'), (1828, 'k0'), (1835, 'k1'), (1842, 'k2'), (1849, 'k3'), (1856, 'k4'), (1863, 'k5'), (1870, 'k6'), (1877, 'k7'), (1884, 'k8'), (1891, 'k9'), (1898, 'k10'), (1905, 'k11'), (1912, 'k12'), (1919, 'k13'), (1926, 'k14'), (1933, 'k15'), (1940, 'k16'), (1947, 'k17'), (1954, 'k18'), (1961, 'k0'), (1968, 'k1'), (1975, 'k2'), (1982, 'k3'), (1989, 'k4'), (1996, 'k5'), (2003, 'k6'), (2010, 'k7'), (2017, 'k8'), (2024, 'k9'), (2031, 'k10'), (2038, 'k11'), (2045, 'k12'), (2052, 'k13'), (2059, 'k14'), (2066, 'k15'), (2073, 'k16'), (2080, 'k17'), (2087, 'k18'), (2094, 'k0'), (2101, 'k1'), (2108, 'k2'), (2115, 'k3'), (2122, 'k4'), (2129, 'k5'), (2136, 'k6'), (2143, 'k7'), (2150, 'k8'), (2157, 'k9'), (2164, 'k10'), (2171, 'k11'), (2178, 'k12'), (2185, 'k13'), (2192, 'k14'), (2199, 'k15'), (2206, 'k16'), (2213, 'k17'), (2220, 'k18'), (2227, 'k0'), (2234, 'k1'), (2241, 'k2'), (2248, 'k3'), (2255, 'k4'), (2262, 'k5'), (2269, 'k6'), (2276, 'k7'), (2283, 'k8'), (2290, 'k9'), (2297, 'k10'), (2304, 'k11'), (2311, 'k12'), (2318, 'k13'), (2325, 'k14'), (2332, 'k15'), (2339, 'k16'), (2346, 'k17'), (2353, 'k18'), (2360, 'k0'), (2367, 'k1'), (2374, 'k2'), (2381, 'k3'), (2388, 'k4'), (2395, 'k5'), (2402, 'k6'), (2409, 'k7'), (2416, 'k8'), (2423, 'k9'), (2430, 'k10'), (2437, 'k11'), (2444, 'k12'), (2451, 'k13'), (2458, 'k14'), (2465, 'k15'), (2472, 'k16'), (2479, 'k17'), (2486, 'k18'), (2493, 'k0'), (2500, 'k1'), (2507, 'k2'), (2514, 'k3'), (2521, 'k4'), (2528, 'k5'), (2535, 'k6'), (2542, 'k7'), (2549, 'k8'), (2556, 'k9'), (2563, 'k10'), (2570, 'k11'), (2577, 'k12'), (2584, 'k13'), (2591, 'k14'), (2598, 'k15'), (2605, 'k16'), (2612, 'k17'), (2619, 'k18'), (2626, 'k0'), (2633, 'k1'), (2640, 'k2'), (2647, 'k3'), (2654, 'k4'), (2661, 'k5'), (2668, 'k6'), (2675, 'k7'), (2682, 'k8'), (2689, 'k9'), (2696, 'k10'), (2703, 'k11'), (2710, 'k12'), (2717, 'k13'), (2724, 'k14'), (2731, 'k15'), (2738, 'k16'), (2745, 'k17'), (2752, 'k18'), (2759, 'k0'), (2766, 'k1'), (2773, 'k2'), (2780, 'k3'), (2787, 'k4'), (2794, 'k5'), (2801, 'k6'), (2808, 'k7'), (2815, 'k8'), (2822, 'k9'), (2829, 'k10'), (2836, 'k11'), (2843, 'k12'), (2850, 'k13'), (2857, 'k14'), (2864, 'k15'), (2871, 'k16'), (2878, 'k17'), (2885, 'k18'), (2892, 'k0'), (2899, 'k1'), (2906, 'k2'), (2913, 'k3'), (2920, 'k4'), (2927, 'k5'), (2934, 'k6'), (2941, 'k7'), (2948, 'k8'), (2955, 'k9'), (2962, 'k10'), (2969, 'k11'), (2976, 'k12'), (2983, 'k13'), (2990, 'k14'), (2997, 'k15'), (3, 'k16'), (10, 'k17'), (17, 'k18'), (24, 'k0'), (31, 'k1'), (38, 'k2'), (45, 'k3'), (52, 'k4'), (59, 'k5'), (66, 'k6'), (73, 'k7'), (80, 'k8'), (87, 'k9'), (94, 'k10'), (101, 'k11'), (108, 'k12'), (115, 'k13'), (122, 'k14'), (129, 'k15'), (136, 'k16'), (143, 'k17'), (150, 'k18'), (157, 'k0'), (164, 'k1'), (171, 'k2'), (178, 'k3'), (185, 'k4'), (192, 'k5'), (199, 'k6'), (206, 'k7'), (213, 'k8'), (220, 'k9'), (227, 'k10'), (234, 'k11'), (241, 'k12'), (248, 'k13'), (255, 'k14'), (262, 'k15'), (269, 'k16'), (276, 'k17'), (283, 'k18'), (290, 'k0'), (297, 'k1'), (304, 'k2'), (311, 'k3'), (318, 'k4'), (325, 'k5'), (332, 'k6'), (339, 'k7'), (346, 'k8'), (353, 'k9'), (360, 'k10'), (367, 'k11'), (374, 'k12'), (381, 'k13'), (388, 'k14'), (395, 'k15'), (402, 'k16'), (409, 'k17'), (416, 'k18'), (423, 'k0'), (430, 'k1'), (437, 'k2'), (444, 'k3'), (451, 'k4'), (458, 'k5'), (465, 'k6'), (472, 'k7'), (479, 'k8'), (486, 'k9'), (493, 'k10'), (500, 'k11'), (507, 'k12'), (514, 'k13'), (521, 'k14'), (528, 'k15'), (535, 'k16'), (542, 'k17'), (549, 'k18'), (556, 'k0'), (563, 'k1'), (570, 'k2'), (577, 'k3'), (584, 'k4'), (591, 'k5'), (598, 'k6'), (605, 'k7'), (612, 'k8'), (619, 'k9'), (626, 'k10'), (633, 'k11'), (640, 'k12'), (647, 'k13'), (654, 'k14'), (661, 'k15'), (668, 'k16'), (675, 'k17'), (682, 'k18'), (689, 'k0'), (696, 'k1'), (703, 'k2'), (710, 'k3'), (717, 'k4'), (724, 'k5'), (731, 'k6'), (738, 'k7'), (745, 'k8'), (752, 'k9'), (759, 'k10'), (766, 'k11'), (773, 'k12'), (780, 'k13'), (787, 'k14'), (794, 'k15'), (801, 'k16'), (808, 'k17'), (815, 'k18'), (822, 'k0'), (829, 'k1'), (836, 'k2'), (843, 'k3'), (850, 'k4'), (857, 'k5'), (864, 'k6'), (871, 'k7'), (878, 'k8'), (885, 'k9'), (892, 'k10'), (899, 'k11'), (906, 'k12'), (913, 'k13'), (920, 'k14'), (927, 'k15'), (934, 'k16'), (941, 'k17'), (948, 'k18'), (955, 'k0'), (962, 'k1'), (969, 'k2'), (976, 'k3'), (983, 'k4'), (990, 'k5'), (997, 'k6'), (1004, 'k7'), (1011, 'k8'), (1018, 'k9'), (1025, 'k10'), (1032, 'k11'), (1039, 'k12'), (1046, 'k13'), (1053, 'k14'), (1060, 'k15'), (1067, 'k16'), (1074, 'k17'), (1081, 'k18'), (1088, 'k0'), (1095, 'k1'), (1102, 'k2'), (1109, 'k3'), (1116, 'k4'), (1123, 'k5'), (1130, 'k6'), (1137, 'k7'), (1144, 'k8'), (1151, 'k9'), (1158, 'k10'), (1165, 'k11'), (1172, 'k12'), (1179, 'k13'), (1186, 'k14'), (1193, 'k15'), (1200, 'k16'), (1207, 'k17'), (1214, 'k18'), (1221, 'k0'), (1228, 'k1'), (1235, 'k2'), (1242, 'k3'), (1249, 'k4'), (1256, 'k5'), (1263, 'k6'), (1270, 'k7'), (1277, 'k8'), (1284, 'k9'), (1291, 'k10'), (1298, 'k11'), (1305, 'k12'), (1312, 'k13'), (1319, 'k14'), (1326, 'k15'), (1333, 'k16'), (1340, 'k17'), (1347, 'k18'), (1354, 'k0'), (1361, 'k1'), (1368, 'k2'), (1375, 'k3'), (1382, 'k4'), (1389, 'k5'), (1396, 'k6'), (1403, 'k7'), (1410, 'k8'), (1417, 'k9'), (1424, 'k10'), (1431, 'k11'), (1438, 'k12'), (1445, 'k13'), (1452, 'k14'), (1459, 'k15'), (1466, 'k16'), (1473, 'k17'), (1480, 'k18'), (1487, 'k0'), (1494, 'k1'), (1501, 'k2'), (1508, 'k3'), (1515, 'k4'), (1522, 'k5'), (1529, 'k6'), (1536, 'k7'), (1543, 'k8'), (1550, 'k9'), (1557, 'k10'), (1564, 'k11'), (1571, 'k12'), (1578, 'k13'), (1585, 'k14'), (1592, 'k15'), (1599, 'k16'), (1606, 'k17'), (1613, 'k18'), (1620, 'k0'), (1627, 'k1'), (1634, 'k2'), (1641, 'k3'), (1648, 'k4'), (1655, 'k5'), (1662, 'k6'), (1669, 'k7'), (1676, 'k8'), (1683, 'k9'), (1690, 'k10'), (1697, 'k11'), (1704, 'k12'), (1711, 'k13'), (1718, 'k14'), (1725, 'k15'), (1732, 'k16'), (1739, 'k17'), (1746, 'k18'), (1753, 'k0'), (1760, 'k1'), (1767, 'k2'), (1774, 'k3'), (1781, 'k4'), (1788, 'k5'), (1795, 'k6'), (1802, 'k7'), (1809, 'k8'), (1816, 'k9'), (1823, 'k10'), (1830, 'k11'), (1837, 'k12'), (1844, 'k13'), (1851, 'k14'), (1858, 'k15'), (1865, 'k16'), (1872, 'k17'), (1879, 'k18'), (1886, 'k0'), (1893, 'k1'), (1900, 'k2'), (1907, 'k3'), (1914, 'k4'), (1921, 'k5'), (1928, 'k6'), (1935, 'k7'), (1942, 'k8'), (1949, 'k9'), (1956, 'k10'), (1963, 'k11'), (1970, 'k12'), (1977, 'k13'), (1984, 'k14'), (1991, 'k15'), (1998, 'k16'), (2005, 'k17'), (2012, 'k18'), (2019, 'k0'), (2026, 'k1'), (2033, 'k2'), (2040, 'k3'), (2047, 'k4'), (2054, 'k5'), (2061, 'k6'), (2068, 'k7'), (2075, 'k8'), (2082, 'k9'), (2089, 'k10'), (2096, 'k11'), (2103, 'k12'), (2110, 'k13'), (2117, 'k14'), (2124, 'k15'), (2131, 'k16'), (2138, 'k17'), (2145, 'k18'), (2152, 'k0'), (2159, 'k1'), (2166, 'k2'), (2173, 'k3'), (2180, 'k4'), (2187, 'k5'), (2194, 'k6'), (2201, 'k7'), (2208, 'k8'), (2215, 'k9'), (2222, 'k10'), (2229, 'k11'), (2236, 'k12'), (2243, 'k13'), (2250, 'k14'), (2257, 'k15'), (2264, 'k16'), (2271, 'k17'), (2278, 'k18'), (2285, 'k0'), (2292, 'k1'), (2299, 'k2'), (2306, 'k3'), (2313, 'k4'), (2320, 'k5'), (2327, 'k6'), (2334, 'k7'), (2341, 'k8'), (2348, 'k9'), (2355, 'k10'), (2362, 'k11'), (2369, 'k12'), (2376, 'k13'), (2383, 'k14'), (2390, 'k15'), (2397, 'k16'), (2404, 'k17'), (2411, 'k18'), (2418, 'k0'), (2425, 'k1'), (2432, 'k2'), (2439, 'k3'), (2446, 'k4'), (2453, 'k5'), (2460, 'k6'), (2467, 'k7'), (2474, 'k8'), (2481, 'k9'), (2488, 'k10'), (2495, 'k11'), (2502, 'k12'), (2509, 'k13'), (2516, 'k14'), (2523, 'k15'), (2530, 'k16'), (2537, 'k17'), (2544, 'k18'), (2551, 'k0'), (2558, 'k1'), (2565, 'k2'), (2572, 'k3'), (2579, 'k4'), (2586, 'k5'), (2593, 'k6'), (2600, 'k7'), (2607, 'k8'), (2614, 'k9'), (2621, 'k10'), (2628, 'k11'), (2635, 'k12'), (2642, 'k13'), (2649, 'k14'), (2656, 'k15'), (2663, 'k16'), (2670, 'k17'), (2677, 'k18'), (2684, 'k0'), (2691, 'k1'), (2698, 'k2'), (2705, 'k3'), (2712, 'k4'), (2719, 'k5'), (2726, 'k6'), (2733, 'k7'), (2740, 'k8'), (2747, 'k9'), (2754, 'k10'), (2761, 'k11'), (2768, 'k12'), (2775, 'k13'), (2782, 'k14'), (2789, 'k15'), (2796, 'k16'), (2803, 'k17'), (2810, 'k18'), (2817, 'k0'), (2824, 'k1'), (2831, 'k2'), (2838, 'k3'), (2845, 'k4'), (2852, 'k5'), (2859, 'k6'), (2866, 'k7'), (2873, 'k8'), (2880, 'k9'), (2887, 'k10'), (2894, 'k11'), (2901, 'k12'), (2908, 'k13'), (2915, 'k14'), (2922, 'k15'), (2929, 'k16'), (2936, 'k17'), (2943, 'k18'), (2950, 'k0'), (2957, 'k1'), (2964, 'k2'), (2971, 'k3'), (2978, 'k4'), (2985, 'k5'), (2992, 'k6'), (2999, 'k7'), (5, 'k8'), (12, 'k9'), (19, 'k10'), (26, 'k11'), (33, 'k12'), (40, 'k13'), (47, 'k14'), (54, 'k15'), (61, 'k16'), (68, 'k17'), (75, 'k18'), (82, 'k0'), (89, 'k1'), (96, 'k2'), (103, 'k3'), (110, 'k4'), (117, 'k5'), (124, 'k6'), (131, 'k7'), (138, 'k8'), (145, 'k9'), (152, 'k10'), (159, 'k11'), (166, 'k12'), (173, 'k13'), (180, 'k14'), (187, 'k15'), (194, 'k16'), (201, 'k17'), (208, 'k18'), (215, 'k0'), (222, 'k1'), (229, 'k2'), (236, 'k3'), (243, 'k4'), (250, 'k5'), (257, 'k6'), (264, 'k7'), (271, 'k8'), (278, 'k9'), (285, 'k10'), (292, 'k11'), (299, 'k12'), (306, 'k13'), (313, 'k14'), (320, 'k15'), (327, 'k16'), (334, 'k17'), (341, 'k18'), (348, 'k0'), (355, 'k1'), (362, 'k2'), (369, 'k3'), (376, 'k4'), (383, 'k5'), (390, 'k6'), (397, 'k7'), (404, 'k8'), (411, 'k9'), (418, 'k10'), (425, 'k11'), (432, 'k12'), (439, 'k13'), (446, 'k14'), (453, 'k15'), (460, 'k16'), (467, 'k17'), (474, 'k18'), (481, 'k0'), (488, 'k1'), (495, 'k2'), (502, 'k3'), (509, 'k4'), (516, 'k5'), (523, 'k6'), (530, 'k7'), (537, 'k8'), (544, 'k9'), (551, 'k10'), (558, 'k11'), (565, 'k12'), (572, 'k13'), (579, 'k14'), (586, 'k15'), (593, 'k16'), (600, 'k17'), (607, 'k18'), (614, 'k0'), (621, 'k1'), (628, 'k2'), (635, 'k3'), (642, 'k4'), (649, 'k5'), (656, 'k6'), (663, 'k7'), (670, 'k8'), (677, 'k9'), (684, 'k10'), (691, 'k11'), (698, 'k12'), (705, 'k13'), (712, 'k14'), (719, 'k15'), (726, 'k16'), (733, 'k17'), (740, 'k18'), (747, 'k0'), (754, 'k1'), (761, 'k2'), (768, 'k3'), (775, 'k4'), (782, 'k5'), (789, 'k6'), (796, 'k7'), (803, 'k8'), (810, 'k9'), (817, 'k10'), (824, 'k11'), (831, 'k12'), (838, 'k13'), (845, 'k14'), (852, 'k15'), (859, 'k16'), (866, 'k17'), (873, 'k18'), (880, 'k0'), (887, 'k1'), (894, 'k2'), (901, 'k3'), (908, 'k4'), (915, 'k5'), (922, 'k6'), (929, 'k7'), (936, 'k8'), (943, 'k9'), (950, 'k10'), (957, 'k11'), (964, 'k12'), (971, 'k13'), (978, 'k14'), (985, 'k15'), (992, 'k16'), (999, 'k17'), (1006, 'k18'), (1013, 'k0'), (1020, 'k1'), (1027, 'k2'), (1034, 'k3'), (1041, 'k4'), (1048, 'k5'), (1055, 'k6'), (1062, 'k7'), (1069, 'k8'), (1076, 'k9'), (1083, 'k10'), (1090, 'k11'), (1097, 'k12'), (1104, 'k13'), (1111, 'k14'), (1118, 'k15'), (1125, 'k16'), (1132, 'k17'), (1139, 'k18'), (1146, 'k0'), (1153, 'k1'), (1160, 'k2'), (1167, 'k3'), (1174, 'k4'), (1181, 'k5'), (1188, 'k6'), (1195, 'k7'), (1202, 'k8'), (1209, 'k9'), (1216, 'k10'), (1223, 'k11'), (1230, 'k12'), (1237, 'k13'), (1244, 'k14'), (1251, 'k15'), (1258, 'k16'), (1265, 'k17'), (1272, 'k18'), (1279, 'k0'), (1286, 'k1'), (1293, 'k2'), (1300, 'k3'), (1307, 'k4'), (1314, 'k5'), (1321, 'k6'), (1328, 'k7'), (1335, 'k8'), (1342, 'k9'), (1349, 'k10'), (1356, 'k11'), (1363, 'k12'), (1370, 'k13'), (1377, 'k14'), (1384, 'k15'), (1391, 'k16'), (1398, 'k17'), (1405, 'k18'), (1412, 'k0'), (1419, 'k1'), (1426, 'k2'), (1433, 'k3'), (1440, 'k4'), (1447, 'k5'), (1454, 'k6'), (1461, 'k7'), (1468, 'k8'), (1475, 'k9'), (1482, 'k10'), (1489, 'k11'), (1496, 'k12'), (1503, 'k13'), (1510, 'k14'), (1517, 'k15'), (1524, 'k16'), (1531, 'k17'), (1538, 'k18'), (1545, 'k0'), (1552, 'k1'), (1559, 'k2'), (1566, 'k3'), (1573, 'k4'), (1580, 'k5'), (1587, 'k6'), (1594, 'k7'), (1601, 'k8'), (1608, 'k9'), (1615, 'k10'), (1622, 'k11'), (1629, 'k12'), (1636, 'k13'), (1643, 'k14'), (1650, 'k15'), (1657, 'k16'), (1664, 'k17'), (1671, 'k18'), (1678, 'k0'), (1685, 'k1'), (1692, 'k2'), (1699, 'k3'), (1706, 'k4'), (1713, 'k5'), (1720, 'k6'), (1727, 'k7'), (1734, 'k8'), (1741, 'k9'), (1748, 'k10'), (1755, 'k11'), (1762, 'k12'), (1769, 'k13'), (1776, 'k14'), (1783, 'k15'), (1790, 'k16'), (1797, 'k17'), (1804, 'k18'), (1811, 'k0'), (1818, 'k1'), (1825, 'k2'), (1832, 'k3'), (1839, 'k4'), (1846, 'k5'), (1853, 'k6'), (1860, 'k7'), (1867, 'k8'), (1874, 'k9'), (1881, 'k10'), (1888, 'k11'), (1895, 'k12'), (1902, 'k13'), (1909, 'k14'), (1916, 'k15'), (1923, 'k16'), (1930, 'k17'), (1937, 'k18'), (1944, 'k0'), (1951, 'k1'), (1958, 'k2'), (1965, 'k3'), (1972, 'k4'), (1979, 'k5'), (1986, 'k6'), (1993, 'k7'), (2000, 'k8'), (2007, 'k9'), (2014, 'k10'), (2021, 'k11'), (2028, 'k12'), (2035, 'k13'), (2042, 'k14'), (2049, 'k15'), (2056, 'k16'), (2063, 'k17'), (2070, 'k18'), (2077, 'k0'), (2084, 'k1'), (2091, 'k2'), (2098, 'k3'), (2105, 'k4'), (2112, 'k5'), (2119, 'k6'), (2126, 'k7'), (2133, 'k8'), (2140, 'k9'), (2147, 'k10'), (2154, 'k11'), (2161, 'k12'), (2168, 'k13'), (2175, 'k14'), (2182, 'k15'), (2189, 'k16'), (2196, 'k17'), (2203, 'k18'), (2210, 'k0'), (2217, 'k1'), (2224, 'k2'), (2231, 'k3'), (2238, 'k4'), (2245, 'k5'), (2252, 'k6'), (2259, 'k7'), (2266, 'k8'), (2273, 'k9'), (2280, 'k10'), (2287, 'k11'), (2294, 'k12'), (2301, 'k13'), (2308, 'k14'), (2315, 'k15'), (2322, 'k16'), (2329, 'k17'), (2336, 'k18'), (2343, 'k0'), (2350, 'k1'), (2357, 'k2'), (2364, 'k3'), (2371, 'k4'), (2378, 'k5'), (2385, 'k6'), (2392, 'k7'), (2399, 'k8'), (2406, 'k9'), (2413, 'k10'), (2420, 'k11'), (2427, 'k12'), (2434, 'k13'), (2441, 'k14'), (2448, 'k15'), (2455, 'k16'), (2462, 'k17'), (2469, 'k18'), (2476, 'k0'), (2483, 'k1'), (2490, 'k2'), (2497, 'k3'), (2504, 'k4'), (2511, 'k5'), (2518, 'k6'), (2525, 'k7'), (2532, 'k8'), (2539, 'k9'), (2546, 'k10'), (2553, 'k11'), (2560, 'k12'), (2567, 'k13'), (2574, 'k14'), (2581, 'k15'), (2588, 'k16'), (2595, 'k17'), (2602, 'k18'), (2609, 'k0'), (2616, 'k1'), (2623, 'k2'), (2630, 'k3'), (2637, 'k4'), (2644, 'k5'), (2651, 'k6'), (2658, 'k7'), (2665, 'k8'), (2672, 'k9'), (2679, 'k10'), (2686, 'k11'), (2693, 'k12'), (2700, 'k13'), (2707, 'k14'), (2714, 'k15'), (2721, 'k16'), (2728, 'k17'), (2735, 'k18'), (2742, 'k0'), (2749, 'k1'), (2756, 'k2'), (2763, 'k3'), (2770, 'k4'), (2777, 'k5'), (2784, 'k6'), (2791, 'k7'), (2798, 'k8'), (2805, 'k9'), (2812, 'k10'), (2819, 'k11'), (2826, 'k12'), (2833, 'k13'), (2840, 'k14'), (2847, 'k15'), (2854, 'k16'), (2861, 'k17'), (2868, 'k18'), (2875, 'k0'), (2882, 'k1'), (2889, 'k2'), (2896, 'k3'), (2903, 'k4'), (2910, 'k5'), (2917, 'k6'), (2924, 'k7'), (2931, 'k8'), (2938, 'k9'), (2945, 'k10'), (2952, 'k11'), (2959, 'k12'), (2966, 'k13'), (2973, 'k14'), (2980, 'k15'), (2987, 'k16');
+SET PREFETCH_SCAN ON;
+SELECT A, C FROM R WHERE B < 3.0;
+SELECT A, B FROM RC WHERE C = 'q7' AND A < 1000;
+SELECT K FROM RK WHERE C = 'k4' AND K > 2500;
+SELECT R.A, RC.B, RK.C FROM R, RC, RK WHERE R.A = RC.A AND RC.A = RK.K AND R.B > 90.0;
+SELECT C, COUNT(*), MAX(B) FROM R GROUP BY C;
+SET PREFETCH_SCAN OFF;
@@ -0,0 +1,40 @@
+import pytest
+import subprocess
+import time
+
+from ddb.parser import parse_all
+from ddb.storage.lmdb import LMDBPrefetcher
+
+testcase_dir = "tests/prefetch/"
+T = 1
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_prefetch_{t_id}")
+
+def test_stop_waiting_thread(session, monkeypatch):
+    # a thread that has read as far ahead as allowed (and is waiting) must still stop promptly:
+    subprocess.run(['make', 'clean'], check=True)
+    prefetchers = list()
+    start = LMDBPrefetcher.start
+    def recording_start(cls, *args):
+        prefetcher = start(*args)
+        if prefetcher is not None:
+            prefetchers.append(prefetcher)
+        return prefetcher
+    monkeypatch.setattr(LMDBPrefetcher, 'start', classmethod(recording_start))
+    for parse_tree in parse_all('CREATE TABLE R(A INT, B VARCHAR);' +
+                                'INSERT INTO R VALUES ' + ', '.join(f"({i}, 'x{i}')" for i in range(3000)) + ';' +
+                                'SET PREFETCH_SCAN ON;' +
+                                'SELECT * FROM R;' +
+                                'SET PREFETCH_SCAN OFF;'):
+        r = session.request(parse_tree)
+        assert r.error is None, r.error_details
+    assert len(prefetchers) > 0 and not any(prefetcher.thread.is_alive() for prefetcher in prefetchers)
+    prefetcher = LMDBPrefetcher(prefetchers[0].env, prefetchers[0].handle, None, 1)
+    for _ in range(1000):
+        if prefetcher.tokens.full():
+            break
+        time.sleep(0.001)
+    prefetcher.stop()
+    assert not prefetcher.thread.is_alive()
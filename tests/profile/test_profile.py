@@ -0,0 +1,82 @@
+import pytest
+import subprocess
+
+from ddb.primitives import ValType
+from ddb.profile import new_profile_context, no_profile_context, get_profile_context
+from ddb.storage.lmdb import LMDBPageProfileStat
+
+@pytest.fixture
+def profile_context():
+    yield new_profile_context()
+    no_profile_context()
+
+def stats_by_method(profile_context):
+    return { stat.method_name.split('.')[-1]: stat for stat in profile_context.stats }
+
+def test_heap_file_pages(session, profile_context):
+    # a scan touches each leaf page once (and the branch pages above the first one),
+    # a lookup touches one page per level, and appending rows dirties the leaf pages they fill:
+    subprocess.run(['make', 'clean'], check=True)
+    with session.dbm.tm.begin_transaction(read_only=False, tmp=True) as tx, \
+        session.dbm.sm.heap_file(tx, 'rows', [ValType.INTEGER, ValType.VARCHAR], create_if_not_exists=True) as h:
+        h.batch_append((i, 'x' * 20) for i in range(5000))
+        assert sum(1 for _ in h.iter_scan()) == 5000
+        assert h.get(17) == (17, 'x' * 20)
+        stats = stats_by_method(profile_context)
+        stat = h.stat()
+        assert stat['depth'] > 1 and stat['leaf_pages'] > 10
+        assert stats['batch_append'].num_blocks_read == 0
+        assert stats['batch_append'].num_blocks_written == pytest.approx(stat['leaf_pages'], abs=1)
+        assert stats['iter_scan'].num_blocks_read == pytest.approx(stat['depth'] - 1 + stat['leaf_pages'], abs=1)
+        assert stats['iter_scan'].num_blocks_written == 0
+        assert stats['get'].num_blocks_read == stat['depth']
+        counts = h.access_counts
+        assert (counts.num_entries_written, counts.num_entries_read) == (5000, 5001)
+        assert counts.num_bytes_read > counts.num_bytes_written > 5000 * 20
+
+def test_bplus_tree_pages(session, profile_context):
+    subprocess.run(['make', 'clean'], check=True)
+    with session.dbm.tm.begin_transaction(read_only=False, tmp=True) as tx, \
+        session.dbm.sm.bplus_tree(tx, 'index', ValType.INTEGER, [ValType.VARCHAR], unique=True, create_if_not_exists=True) as index:
+        index.bulk_load((i, ('y' * 30, )) for i in range(3000))
+        assert sum(1 for _ in index.iter_scan(key_lower=1500)) == 1500
+        assert list(index.iter_get(42)) == [ (42, ('y' * 30, )) ]
+        stats = stats_by_method(profile_context)
+        stat = index.stat()
+        assert stats['bulk_load'].num_blocks_written == pytest.approx(stat['leaf_pages'], abs=1)
+        # half of the leaf pages, after descending to the first one:
+        assert stats['iter_scan'].num_blocks_read == pytest.approx(stat['depth'] - 1 + stat['leaf_pages'] / 2, abs=2)
+        assert stats['iter_get'].num_blocks_read == stat['depth']
+
+@pytest.mark.parametrize("profile", ["on", "off"])
+def test_profile_option(run, capsys, monkeypatch, profile):
+    # without profiling, queries return the same results, but no page counts are collected:
+    subprocess.run(['make', 'clean'], check=True)
+    num_collectors = 0
+    init = LMDBPageProfileStat.__init__
+    def counting_init(self, *args, **kw):
+        nonlocal num_collectors
+        num_collectors += 1
+        init(self, *args, **kw)
+    monkeypatch.setattr(LMDBPageProfileStat, '__init__', counting_init)
+    for r in run(f'SET PROFILE {profile};' +
+                 'CREATE TABLE R(A INT, B INT, PRIMARY KEY(A));' +
+                 'CREATE TABLE S(C INT, D INT);' +
+                 'INSERT INTO R VALUES ' + ', '.join(f'({i}, {i % 7})' for i in range(300)) + ';' +
+                 'INSERT INTO S VALUES ' + ', '.join(f'({i}, {i * 2})' for i in range(0, 300, 3)) + ';'):
+        assert r.error is None, r.error_details
+    capsys.readouterr()
+    r, = run('SELECT B, COUNT(*) FROM R, S WHERE A = C AND D > 100 GROUP BY B;')
+    assert r.error is None, r.error_details
+    assert sorted(capsys.readouterr().out.split("\n")[1:-1]) == \
+        [ f'({b}, {sum(1 for i in range(0, 300, 3) if i * 2 > 100 and i % 7 == b)})' for b in range(7) ]
+    if profile == 'on':
+        assert get_profile_context() is not None and r.r_pop.measured.sum_blocks.overall > 0
+        assert num_collectors > 0
+    else:
+        assert get_profile_context() is None
+        assert num_collectors == 0
+    r, = run('SET PROFILE on;')
+    assert r.error is None
+    r, = run('SELECT * FROM S;')
+    assert r.error is None and get_profile_context() is not None
@@ -0,0 +1,20 @@
+CREATE TABLE R(A INT, B INT, C VARCHAR);
+CREATE INDEX ON R(B);
+INSERT INTO R VALUES (0, 0, 'r0'), (1, 1, 'r1'), (2, 2, 'r2'), (3, 3, 'r3'), (4, 4, 'r4'), (5, 5, 'r5'), (6, 6, 'r6'), (7, 7, 'r7'), (8, 8, 'r8'), (9, 9, 'r9'), (10, 10, 'r10'), (11, 11, 'r0'), (12, 12, 'r1'), (13, 13, 'r2'), (14, 14, 'r3'), (15, 15, 'r4'), (16, 16, 'r5'), (17, 17, 'r6'), (18, 18, 'r7'), (19, 19, 'r8'), (20, 20, 'r9'), (21, 21, 'r10'), (22, 22, 'r0'), (23, 23, 'r1'), (24, 24, 'r2'), (25, 25, 'r3'), (26, 26, 'r4'), (27, 27, 'r5'), (28, 28, 'r6'), (29, 29, 'r7'), (30, 30, 'r8'), (31, 31, 'r9'), (32, 32, 'r10'), (33, 33, 'r0'), (34, 34, 'r1'), (35, 35, 'r2'), (36, 36, 'r3'), (37, 0, 'r4'), (38, 1, 'r5'), (39, 2, 'r6'), (40, 3, 'r7'), (41, 4, 'r8'), (42, 5, 'r9'), (43, 6, 'r10'), (44, 7, 'r0'), (45, 8, 'r1'), (46, 9, 'r2'), (47, 10, 'r3'), (48, 11, 'r4'), (49, 12, 'r5'), (50, 13, 'r6'), (51, 14, 'r7'), (52, 15, 'r8'), (53, 16, 'r9'), (54, 17, 'r10'), (55, 18, 'r0'), (56, 19, 'r1'), (57, 20, 'r2'), (58, 21, 'r3'), (59, 22, 'r4'), (60, 23, 'r5'), (61, 24, 'r6'), (62, 25, 'r7'), (63, 26, 'r8'), (64, 27, 'r9'), (65, 28, 'r10'), (66, 29, 'r0'), (67, 30, 'r1'), (68, 31, 'r2'), (69, 32, 'r3'), (70, 33, 'r4'), (71, 34, 'r5'), (72, 35, 'r6'), (73, 36, 'r7'), (74, 0, 'r8'), (75, 1, 'r9'), (76, 2, 'r10'), (77, 3, 'r0'), (78, 4, 'r1'), (79, 5, 'r2'), (80, 6, 'r3'), (81, 7, 'r4'), (82, 8, 'r5'), (83, 9, 'r6'), (84, 10, 'r7'), (85, 11, 'r8'), (86, 12, 'r9'), (87, 13, 'r10'), (88, 14, 'r0'), (89, 15, 'r1'), (90, 16, 'r2'), (91, 17, 'r3'), (92, 18, 'r4'), (93, 19, 'r5'), (94, 20, 'r6'), (95, 21, 'r7'), (96, 22, 'r8'), (97, 23, 'r9'), (98, 24, 'r10'), (99, 25, 'r0'), (100, 26, 'r1'), (101, 27, 'r2'), (102, 28, 'r3'), (103, 29, 'r4'), (104, 30, 'r5'), (105, 31, 'r6'), (106, 32, 'r7'), (107, 33, 'r8'), (108, 34, 'r9'), (109, 35, 'r10'), (110, 36, 'r0'), (111, 0, 'r1'), (112, 1, 'r2'), (113, 2, 'r3'), (114, 3, 'r4'), (115, 4, 'r5'), (116, 5, 'r6'), (117, 6, 'r7'), (118, 7, 'r8'), (119, 8, 'r9'), (120, 9, 'r10'), (121, 10, 'r0'), (122, 11, 'r1'), (123, 12, 'r2'), (124, 13, 'r3'), (125, 14, 'r4'), (126, 15, 'r5'), (127, 16, 'r6'), (128, 17, 'r7'), (129, 18, 'r8'), (130, 19, 'r9'), (131, 20, 'r10'), (132, 21, 'r0'), (133, 22, 'r1'), (134, 23, 'r2'), (135, 24, 'r3'), (136, 25, 'r4'), (137, 26, 'r5'), (138, 27, 'r6'), (139, 28, 'r7'), (140, 29, 'r8'), (141, 30, 'r9'), (142, 31, 'r10'), (143, 32, 'r0'), (144, 33, 'r1'), (145, 34, 'r2'), (146, 35, 'r3'), (147, 36, 'r4'), (148, 0, 'r5'), (149, 1, 'r6'), (150, 2, 'r7'), (151, 3, 'r8'), (152, 4, 'r9'), (153, 5, 'r10'), (154, 6, 'r0'), (155, 7, 'r1'), (156, 8, 'r2'), (157, 9, 'r3'), (158, 10, 'r4'), (159, 11, 'r5'), (160, 12, 'r6'), (161, 13, 'r7'), (162, 14, 'r8'), (163, 15, 'r9'), (164, 16, 'r10'), (165, 17, 'r0'), (166, 18, 'r1'), (167, 19, 'r2'), (168, 20, 'r3'), (169, 21, 'r4'), (170, 22, 'r5'), (171, 23, 'r6'), (172, 24, 'r7'), (173, 25, 'r8'), (174, 26, 'r9'), (175, 27, 'r10'), (176, 28, 'r0'), (177, 29, 'r1'), (178, 30, 'r2'), (179, 31, 'r3'), (180, 32, 'r4'), (181, 33, 'r5'), (182, 34, 'r6'), (183, 35, 'r7'), (184, 36, 'r8'), (185, 0, 'r9'), (186, 1, 'r10'), (187, 2, 'r0'), (188, 3, 'r1'), (189, 4, 'r2'), (190, 5, 'r3'), (191, 6, 'r4'), (192, 7, 'r5'), (193, 8, 'r6'), (194, 9, 'r7'), (195, 10, 'r8'), (196, 11, 'r9'), (197, 12, 'r10'), (198, 13, 'r0'), (199, 14, 'r1'), (200, 15, 'r2'), (201, 16, 'r3'), (202, 17, 'r4'), (203, 18, 'r5'), (204, 19, 'r6'), (205, 20, 'r7'), (206, 21, 'r8'), (207, 22, 'r9'), (208, 23, 'r10'), (209, 24, 'r0'), (210, 25, 'r1'), (211, 26, 'r2'), (212, 27, 'r3'), (213, 28, 'r4'), (214, 29, 'r5'), (215, 30, 'r6'), (216, 31, 'r7'), (217, 32, 'r8'), (218, 33, 'r9'), (219, 34, 'r10'), (220, 35, 'r0'), (221, 36, 'r1'), (222, 0, 'r2'), (223, 1, 'r3'), (224, 2, 'r4'), (225, 3, 'r5'), (226, 4, 'r6'), (227, 5, 'r7'), (228, 6, 'r8'), (229, 7, 'r9'), (230, 8, 'r10'), (231, 9, 'r0'), (232, 10, 'r1'), (233, 11, 'r2'), (234, 12, 'r3'), (235, 13, 'r4'), (236, 14, 'r5'), (237, 15, 'r6'), (238, 16, 'r7'), (239, 17, 'r8'), (240, 18, 'r9'), (241, 19, 'r10'), (242, 20, 'r0'), (243, 21, 'r1'), (244, 22, 'r2'), (245, 23, 'r3'), (246, 24, 'r4'), (247, 25, 'r5'), (248, 26, 'r6'), (249, 27, 'r7'), (250, 28, 'r8'), (251, 29, 'r9'), (252, 30, 'r10'), (253, 31, 'r0'), (254, 32, 'r1'), (255, 33, 'r2'), (256, 34, 'r3'), (257, 35, 'r4'), (258, 36, 'r5'), (259, 0, 'r6'), (260, 1, 'r7'), (261, 2, 'r8'), (262, 3, 'r9'), (263, 4, 'r10'), (264, 5, 'r0'), (265, 6, 'r1'), (266, 7, 'r2'), (267, 8, 'r3'), (268, 9, 'r4'), (269, 10, 'r5'), (270, 11, 'r6'), (271, 12, 'r7'), (272, 13, 'r8'), (273, 14, 'r9'), (274, 15, 'r10'), (275, 16, 'r0'), (276, 17, 'r1'), (277, 18, 'r2'), (278, 19, 'r3'), (279, 20, 'r4'), (280, 21, 'r5'), (281, 22, 'r6'), (282, 23, 'r7'), (283, 24, 'r8'), (284, 25, 'r9'), (285, 26, 'r10'), (286, 27, 'r0'), (287, 28, 'r1'), (288, 29, 'r2'), (289, 30, 'r3'), (290, 31, 'r4'), (291, 32, 'r5'), (292, 33, 'r6'), (293, 34, 'r7'), (294, 35, 'r8'), (295, 36, 'r9'), (296, 0, 'r10'), (297, 1, 'r0'), (298, 2, 'r1'), (299, 3, 'r2'), (300, 4, 'r3'), (301, 5, 'r4'), (302, 6, 'r5'), (303, 7, 'r6'), (304, 8, 'r7'), (305, 9, 'r8'), (306, 10, 'r9'), (307, 11, 'r10'), (308, 12, 'r0'), (309, 13, 'r1'), (310, 14, 'r2'), (311, 15, 'r3'), (312, 16, 'r4'), (313, 17, 'r5'), (314, 18, 'r6'), (315, 19, 'r7'), (316, 20, 'r8'), (317, 21, 'r9'), (318, 22, 'r10'), (319, 23, 'r0'), (320, 24, 'r1'), (321, 25, 'r2'), (322, 26, 'r3'), (323, 27, 'r4'), (324, 28, 'r5'), (325, 29, 'r6'), (326, 30, 'r7'), (327, 31, 'r8'), (328, 32, 'r9'), (329, 33, 'r10'), (330, 34, 'r0'), (331, 35, 'r1'), (332, 36, 'r2'), (333, 0, 'r3'), (334, 1, 'r4'), (335, 2, 'r5'), (336, 3, 'r6'), (337, 4, 'r7'), (338, 5, 'r8'), (339, 6, 'r9'), (340, 7, 'r10'), (341, 8, 'r0'), (342, 9, 'r1'), (343, 10, 'r2'), (344, 11, 'r3'), (345, 12, 'r4'), (346, 13, 'r5'), (347, 14, 'r6'), (348, 15, 'r7'), (349, 16, 'r8'), (350, 17, 'r9'), (351, 18, 'r10'), (352, 19, 'r0'), (353, 20, 'r1'), (354, 21, 'r2'), (355, 22, 'r3'), (356, 23, 'r4'), (357, 24, 'r5'), (358, 25, 'r6'), (359, 26, 'r7'), (360, 27, 'r8'), (361, 28, 'r9'), (362, 29, 'r10'), (363, 30, 'r0'), (364, 31, 'r1'), (365, 32, 'r2'), (366, 33, 'r3'), (367, 34, 'r4'), (368, 35, 'r5'), (369, 36, 'r6'), (370, 0, 'r7'), (371, 1, 'r8'), (372, 2, 'r9'), (373, 3, 'r10'), (374, 4, 'r0'), (375, 5, 'r1'), (376, 6, 'r2'), (377, 7, 'r3'), (378, 8, 'r4'), (379, 9, 'r5'), (380, 10, 'r6'), (381, 11, 'r7'), (382, 12, 'r8'), (383, 13, 'r9'), (384, 14, 'r10'), (385, 15, 'r0'), (386, 16, 'r1'), (387, 17, 'r2'), (388, 18, 'r3'), (389, 19, 'r4'), (390, 20, 'r5'), (391, 21, 'r6'), (392, 22, 'r7'), (393, 23, 'r8'), (394, 24, 'r9'), (395, 25, 'r10'), (396, 26, 'r0'), (397, 27, 'r1'), (398, 28, 'r2'), (399, 29, 'r3'), (400, 30, 'r4'), (401, 31, 'r5'), (402, 32, 'r6'), (403, 33, 'r7'), (404, 34, 'r8'), (405, 35, 'r9'), (406, 36, 'r10'), (407, 0, 'r0'), (408, 1, 'r1'), (409, 2, 'r2'), (410, 3, 'r3'), (411, 4, 'r4'), (412, 5, 'r5'), (413, 6, 'r6'), (414, 7, 'r7'), (415, 8, 'r8'), (416, 9, 'r9'), (417, 10, 'r10'), (418, 11, 'r0'), (419, 12, 'r1'), (420, 13, 'r2'), (421, 14, 'r3'), (422, 15, 'r4'), (423, 16, 'r5'), (424, 17, 'r6'), (425, 18, 'r7'), (426, 19, 'r8'), (427, 20, 'r9'), (428, 21, 'r10'), (429, 22, 'r0'), (430, 23, 'r1'), (431, 24, 'r2'), (432, 25, 'r3'), (433, 26, 'r4'), (434, 27, 'r5'), (435, 28, 'r6'), (436, 29, 'r7'), (437, 30, 'r8'), (438, 31, 'r9'), (439, 32, 'r10'), (440, 33, 'r0'), (441, 34, 'r1'), (442, 35, 'r2'), (443, 36, 'r3'), (444, 0, 'r4'), (445, 1, 'r5'), (446, 2, 'r6'), (447, 3, 'r7'), (448, 4, 'r8'), (449, 5, 'r9'), (450, 6, 'r10'), (451, 7, 'r0'), (452, 8, 'r1'), (453, 9, 'r2'), (454, 10, 'r3'), (455, 11, 'r4'), (456, 12, 'r5'), (457, 13, 'r6'), (458, 14, 'r7'), (459, 15, 'r8'), (460, 16, 'r9'), (461, 17, 'r10'), (462, 18, 'r0'), (463, 19, 'r1'), (464, 20, 'r2'), (465, 21, 'r3'), (466, 22, 'r4'), (467, 23, 'r5'), (468, 24, 'r6'), (469, 25, 'r7'), (470, 26, 'r8'), (471, 27, 'r9'), (472, 28, 'r10'), (473, 29, 'r0'), (474, 30, 'r1'), (475, 31, 'r2'), (476, 32, 'r3'), (477, 33, 'r4'), (478, 34, 'r5'), (479, 35, 'r6'), (480, 36, 'r7'), (481, 0, 'r8'), (482, 1, 'r9'), (483, 2, 'r10'), (484, 3, 'r0'), (485, 4, 'r1'), (486, 5, 'r2'), (487, 6, 'r3'), (488, 7, 'r4'), (489, 8, 'r5'), (490, 9, 'r6'), (491, 10, 'r7'), (492, 11, 'r8'), (493, 12, 'r9'), (494, 13, 'r10'), (495, 14, 'r0'), (496, 15, 'r1'), (497, 16, 'r2'), (498, 17, 'r3'), (499, 18, 'r4'), (500, 19, 'r5'), (501, 20, 'r6'), (502, 21, 'r7'), (503, 22, 'r8'), (504, 23, 'r9'), (505, 24, 'r10'), (506, 25, 'r0'), (507, 26, 'r1'), (508, 27, 'r2'), (509, 28, 'r3'), (510, 29, 'r4'), (511, 30, 'r5'), (512, 31, 'r6'), (513, 32, 'r7'), (514, 33, 'r8'), (515, 34, 'r9'), (516, 35, 'r10'), (517, 36, 'r0'), (518, 0, 'r1'), (519, 1, 'r2'), (520, 2, 'r3'), (521, 3, 'r4'), (522, 4, 'r5'), (523, 5, 'r6'), (524, 6, 'r7'), (525, 7, 'r8'), (526, 8, 'r9'), (527, 9, 'r10'), (528, 10, 'r0'), (529, 11, 'r1'), (530, 12, 'r2'), (531, 13, 'r3'), (532, 14, 'r4'), (533, 15, 'r5'), (534, 16, 'r6'), (535, 17, 'r7'), (536, 18, 'r8'), (537, 19, 'r9'), (538, 20, 'r10'), (539, 21, 'r0'), (540, 22, 'r1'), (541, 23, 'r2'), (542, 24, 'r3'), (543, 25, 'r4'), (544, 26, 'r5'), (545, 27, 'r6'), (546, 28, 'r7'), (547, 29, 'r8'), (548, 30, 'r9'), (549, 31, 'r10'), (550, 32, 'r0'), (551, 33, 'r1'), (552, 34, 'r2'), (553, 35, 'r3'), (554, 36, 'r4'), (555, 0, 'r5'), (556, 1, 'r6'), (557, 2, 'r7'), (558, 3, 'r8'), (559, 4, 'r9'), (560, 5, 'r10'), (561, 6, 'r0'), (562, 7, 'r1'), (563, 8, 'r2'), (564, 9, 'r3'), (565, 10, 'r4'), (566, 11, 'r5'), (567, 12, 'r6'), (568, 13, 'r7'), (569, 14, 'r8'), (570, 15, 'r9'), (571, 16, 'r10'), (572, 17, 'r0'), (573, 18, 'r1'), (574, 19, 'r2'), (575, 20, 'r3'), (576, 21, 'r4'), (577, 22, 'r5'), (578, 23, 'r6'), (579, 24, 'r7'), (580, 25, 'r8'), (581, 26, 'r9'), (582, 27, 'r10'), (583, 28, 'r0'), (584, 29, 'r1'), (585, 30, 'r2'), (586, 31, 'r3'), (587, 32, 'r4'), (588, 33, 'r5'), (589, 34, 'r6'), (590, 35, 'r7'), (591, 36, 'r8'), (592, 0, 'r9'), (593, 1, 'r10'), (594, 2, 'r0'), (595, 3, 'r1'), (596, 4, 'r2'), (597, 5, 'r3'), (598, 6, 'r4'), (599, 7, 'r5'), (600, 8, 'r6'), (601, 9, 'r7'), (602, 10, 'r8'), (603, 11, 'r9'), (604, 12, 'r10'), (605, 13, 'r0'), (606, 14, 'r1'), (607, 15, 'r2'), (608, 16, 'r3'), (609, 17, 'r4'), (610, 18, 'r5'), (611, 19, 'r6'), (612, 20, 'r7'), (613, 21, 'r8'), (614, 22, 'r9'), (615, 23, 'r10'), (616, 24, 'r0'), (617, 25, 'r1'), (618, 26, 'r2'), (619, 27, 'r3'), (620, 28, 'r4'), (621, 29, 'r5'), (622, 30, 'r6'), (623, 31, 'r7'), (624, 32, 'r8'), (625, 33, 'r9'), (626, 34, 'r10'), (627, 35, 'r0'), (628, 36, 'r1'), (629, 0, 'r2'), (630, 1, 'r3'), (631, 2, 'r4'), (632, 3, 'r5'), (633, 4, 'r6'), (634, 5, 'r7'), (635, 6, 'r8'), (636, 7, 'r9'), (637, 8, 'r10'), (638, 9, 'r0'), (639, 10, 'r1'), (640, 11, 'r2'), (641, 12, 'r3'), (642, 13, 'r4'), (643, 14, 'r5'), (644, 15, 'r6'), (645, 16, 'r7'), (646, 17, 'r8'), (647, 18, 'r9'), (648, 19, 'r10'), (649, 20, 'r0'), (650, 21, 'r1'), (651, 22, 'r2'), (652, 23, 'r3'), (653, 24, 'r4'), (654, 25, 'r5'), (655, 26, 'r6'), (656, 27, 'r7'), (657, 28, 'r8'), (658, 29, 'r9'), (659, 30, 'r10'), (660, 31, 'r0'), (661, 32, 'r1'), (662, 33, 'r2'), (663, 34, 'r3'), (664, 35, 'r4'), (665, 36, 'r5'), (666, 0, 'r6'), (667, 1, 'r7'), (668, 2, 'r8'), (669, 3, 'r9'), (670, 4, 'r10'), (671, 5, 'r0'), (672, 6, 'r1'), (673, 7, 'r2'), (674, 8, 'r3'), (675, 9, 'r4'), (676, 10, 'r5'), (677, 11, 'r6'), (678, 12, 'r7'), (679, 13, 'r8'), (680, 14, 'r9'), (681, 15, 'r10'), (682, 16, 'r0'), (683, 17, 'r1'), (684, 18, 'r2'), (685, 19, 'r3'), (686, 20, 'r4'), (687, 21, 'r5'), (688, 22, 'r6'), (689, 23, 'r7'), (690, 24, 'r8'), (691, 25, 'r9'), (692, 26, 'r10'), (693, 27, 'r0'), (694, 28, 'r1'), (695, 29, 'r2'), (696, 30, 'r3'), (697, 31, 'r4'), (698, 32, 'r5'), (699, 33, 'r6'), (700, 34, 'r7'), (701, 35, 'r8'), (702, 36, 'r9'), (703, 0, 'r10'), (704, 1, 'r0'), (705, 2, 'r1'), (706, 3, 'r2'), (707, 4, 'r3'), (708, 5, 'r4'), (709, 6, 'r5'), (710, 7, 'r6'), (711, 8, 'r7'), (712, 9, 'r8'), (713, 10, 'r9'), (714, 11, 'r10'), (715, 12, 'r0'), (716, 13, 'r1'), (717, 14, 'r2'), (718, 15, 'r3'), (719, 16, 'r4'), (720, 17, 'r5'), (721, 18, 'r6'), (722, 19, 'r7'), (723, 20, 'r8'), (724, 21, 'r9'), (725, 22, 'r10'), (726, 23, 'r0'), (727, 24, 'r1'), (728, 25, 'r2'), (729, 26, 'r3'), (730, 27, 'r4'), (731, 28, 'r5'), (732, 29, 'r6'), (733, 30, 'r7'), (734, 31, 'r8'), (735, 32, 'r9'), (736, 33, 'r10'), (737, 34, 'r0'), (738, 35, 'r1'), (739, 36, 'r2'), (740, 0, 'r3'), (741, 1, 'r4'), (742, 2, 'r5'), (743, 3, 'r6'), (744, 4, 'r7'), (745, 5, 'r8'), (746, 6, 'r9'), (747, 7, 'r10'), (748, 8, 'r0'), (749, 9, 'r1'), (750, 10, 'r2'), (751, 11, 'r3'), (752, 12, 'r4'), (753, 13, 'r5'), (754, 14, 'r6'), (755, 15, 'r7'), (756, 16, 'r8'), (757, 17, 'r9'), (758, 18, 'r10'), (759, 19, 'r0'), (760, 20, 'r1'), (761, 21, 'r2'), (762, 22, 'r3'), (763, 23, 'r4'), (764, 24, 'r5'), (765, 25, 'r6'), (766, 26, 'r7'), (767, 27, 'r8'), (768, 28, 'r9'), (769, 29, 'r10'), (770, 30, 'r0'), (771, 31, 'r1'), (772, 32, 'r2'), (773, 33, 'r3'), (774, 34, 'r4'), (775, 35, 'r5'), (776, 36, 'r6'), (777, 0, 'r7'), (778, 1, 'r8'), (779, 2, 'r9'), (780, 3, 'r10'), (781, 4, 'r0'), (782, 5, 'r1'), (783, 6, 'r2'), (784, 7, 'r3'), (785, 8, 'r4'), (786, 9, 'r5'), (787, 10, 'r6'), (788, 11, 'r7'), (789, 12, 'r8'), (790, 13, 'r9'), (791, 14, 'r10'), (792, 15, 'r0'), (793, 16, 'r1'), (794, 17, 'r2'), (795, 18, 'r3'), (796, 19, 'r4'), (797, 20, 'r5'), (798, 21, 'r6'), (799, 22, 'r7'), (800, 23, 'r8'), (801, 24, 'r9'), (802, 25, 'r10'), (803, 26, 'r0'), (804, 27, 'r1'), (805, 28, 'r2'), (806, 29, 'r3'), (807, 30, 'r4'), (808, 31, 'r5'), (809, 32, 'r6'), (810, 33, 'r7'), (811, 34, 'r8'), (812, 35, 'r9'), (813, 36, 'r10'), (814, 0, 'r0'), (815, 1, 'r1'), (816, 2, 'r2'), (817, 3, 'r3'), (818, 4, 'r4'), (819, 5, 'r5'), (820, 6, 'r6'), (821, 7, 'r7'), (822, 8, 'r8'), (823, 9, 'r9'), (824, 10, 'r10'), (825, 11, 'r0'), (826, 12, 'r1'), (827, 13, 'r2'), (828, 14, 'r3'), (829, 15, 'r4'), (830, 16, 'r5'), (831, 17, 'r6'), (832, 18, 'r7'), (833, 19, 'r8'), (834, 20, 'r9'), (835, 21, 'r10'), (836, 22, 'r0'), (837, 23, 'r1'), (838, 24, 'r2'), (839, 25, 'r3'), (840, 26, 'r4'), (841, 27, 'r5'), (842, 28, 'r6'), (843, 29, 'r7'), (844, 30, 'r8'), (845, 31, 'r9'), (846, 32, 'r10'), (847, 33, 'r0'), (848, 34, 'r1'), (849, 35, 'r2'), (850, 36, 'r3'), (851, 0, 'r4'), (852, 1, 'r5'), (853, 2, 'r6'), (854, 3, 'r7'), (855, 4, 'r8'), (856, 5, 'r9'), (857, 6, 'r10'), (858, 7, 'r0'), (859, 8, 'r1'), (860, 9, 'r2'), (861, 10, 'r3'), (862, 11, 'r4'), (863, 12, 'r5'), (864, 13, 'r6'), (865, 14, 'r7'), (866, 15, 'r8'), (867, 16, 'r9'), (868, 17, 'r10'), (869, 18, 'r0'), (870, 19, 'r1'), (871, 20, 'r2'), (872, 21, 'r3'), (873, 22, 'r4'), (874, 23, 'r5'), (875, 24, 'r6'), (876, 25, 'r7'), (877, 26, 'r8'), (878, 27, 'r9'), (879, 28, 'r10'), (880, 29, 'r0'), (881, 30, 'r1'), (882, 31, 'r2'), (883, 32, 'r3'), (884, 33, 'r4'), (885, 34, 'r5'), (886, 35, 'r6'), (887, 36, 'r7'), (888, 0, 'r8'), (889, 1, 'r9'), (890, 2, 'r10'), (891, 3, 'r0'), (892, 4, 'r1'), (893, 5, 'r2'), (894, 6, 'r3'), (895, 7, 'r4'), (896, 8, 'r5'), (897, 9, 'r6'), (898, 10, 'r7'), (899, 11, 'r8'), (900, 12, 'r9'), (901, 13, 'r10'), (902, 14, 'r0'), (903, 15, 'r1'), (904, 16, 'r2'), (905, 17, 'r3'), (906, 18, 'r4'), (907, 19, 'r5'), (908, 20, 'r6'), (909, 21, 'r7'), (910, 22, 'r8'), (911, 23, 'r9'), (912, 24, 'r10'), (913, 25, 'r0'), (914, 26, 'r1'), (915, 27, 'r2'), (916, 28, 'r3'), (917, 29, 'r4'), (918, 30, 'r5'), (919, 31, 'r6'), (920, 32, 'r7'), (921, 33, 'r8'), (922, 34, 'r9'), (923, 35, 'r10'), (924, 36, 'r0'), (925, 0, 'r1'), (926, 1, 'r2'), (927, 2, 'r3'), (928, 3, 'r4'), (929, 4, 'r5'), (930, 5, 'r6'), (931, 6, 'r7'), (932, 7, 'r8'), (933, 8, 'r9'), (934, 9, 'r10'), (935, 10, 'r0'), (936, 11, 'r1'), (937, 12, 'r2'), (938, 13, 'r3'), (939, 14, 'r4'), (940, 15, 'r5'), (941, 16, 'r6'), (942, 17, 'r7'), (943, 18, 'r8'), (944, 19, 'r9'), (945, 20, 'r10'), (946, 21, 'r0'), (947, 22, 'r1'), (948, 23, 'r2'), (949, 24, 'r3'), (950, 25, 'r4'), (951, 26, 'r5'), (952, 27, 'r6'), (953, 28, 'r7'), (954, 29, 'r8'), (955, 30, 'r9'), (956, 31, 'r10'), (957, 32, 'r0'), (958, 33, 'r1'), (959, 34, 'r2'), (960, 35, 'r3'), (961, 36, 'r4'), (962, 0, 'r5'), (963, 1, 'r6'), (964, 2, 'r7'), (965, 3, 'r8'), (966, 4, 'r9'), (967, 5, 'r10'), (968, 6, 'r0'), (969, 7, 'r1'), (970, 8, 'r2'), (971, 9, 'r3'), (972, 10, 'r4'), (973, 11, 'r5'), (974, 12, 'r6'), (975, 13, 'r7'), (976, 14, 'r8'), (977, 15, 'r9'), (978, 16, 'r10'), (979, 17, 'r0'), (980, 18, 'r1'), (981, 19, 'r2'), (982, 20, 'r3'), (983, 21, 'r4'), (984, 22, 'r5'), (985, 23, 'r6'), (986, 24, 'r7'), (987, 25, 'r8'), (988, 26, 'r9'), (989, 27, 'r10'), (990, 28, 'r0'), (991, 29, 'r1'), (992, 30, 'r2'), (993, 31, 'r3'), (994, 32, 'r4'), (995, 33, 'r5'), (996, 34, 'r6'), (997, 35, 'r7'), (998, 36, 'r8'), (999, 0, 'r9'), (1000, 1, 'r10'), (1001, 2, 'r0'), (1002, 3, 'r1'), (1003, 4, 'r2'), (1004, 5, 'r3'), (1005, 6, 'r4'), (1006, 7, 'r5'), (1007, 8, 'r6'), (1008, 9, 'r7'), (1009, 10, 'r8'), (1010, 11, 'r9'), (1011, 12, 'r10'), (1012, 13, 'r0'), (1013, 14, 'r1'), (1014, 15, 'r2'), (1015, 16, 'r3'), (1016, 17, 'r4'), (1017, 18, 'r5'), (1018, 19, 'r6'), (1019, 20, 'r7'), (1020, 21, 'r8'), (1021, 22, 'r9'), (1022, 23, 'r10'), (1023, 24, 'r0'), (1024, 25, 'r1'), (1025, 26, 'r2'), (1026, 27, 'r3'), (1027, 28, 'r4'), (1028, 29, 'r5'), (1029, 30, 'r6'), (1030, 31, 'r7'), (1031, 32, 'r8'), (1032, 33, 'r9'), (1033, 34, 'r10'), (1034, 35, 'r0'), (1035, 36, 'r1'), (1036, 0, 'r2'), (1037, 1, 'r3'), (1038, 2, 'r4'), (1039, 3, 'r5'), (1040, 4, 'r6'), (1041, 5, 'r7'), (1042, 6, 'r8'), (1043, 7, 'r9'), (1044, 8, 'r10'), (1045, 9, 'r0'), (1046, 10, 'r1'), (1047, 11, 'r2'), (1048, 12, 'r3'), (1049, 13, 'r4'), (1050, 14, 'r5'), (1051, 15, 'r6'), (1052, 16, 'r7'), (1053, 17, 'r8'), (1054, 18, 'r9'), (1055, 19, 'r10'), (1056, 20, 'r0'), (1057, 21, 'r1'), (1058, 22, 'r2'), (1059, 23, 'r3'), (1060, 24, 'r4'), (1061, 25, 'r5'), (1062, 26, 'r6'), (1063, 27, 'r7'), (1064, 28, 'r8'), (1065, 29, 'r9'), (1066, 30, 'r10'), (1067, 31, 'r0'), (1068, 32, 'r1'), (1069, 33, 'r2'), (1070, 34, 'r3'), (1071, 35, 'r4'), (1072, 36, 'r5'), (1073, 0, 'r6'), (1074, 1, 'r7'), (1075, 2, 'r8'), (1076, 3, 'r9'), (1077, 4, 'r10'), (1078, 5, 'r0'), (1079, 6, 'r1'), (1080, 7, 'r2'), (1081, 8, 'r3'), (1082, 9, 'r4'), (1083, 10, 'r5'), (1084, 11, 'r6'), (1085, 12, 'r7'), (1086, 13, 'r8'), (1087, 14, 'r9'), (1088, 15, 'r10'), (1089, 16, 'r0'), (1090, 17, 'r1'), (1091, 18, 'r2'), (1092, 19, 'r3'), (1093, 20, 'r4'), (1094, 21, 'r5'), (1095, 22, 'r6'), (1096, 23, 'r7'), (1097, 24, 'r8'), (1098, 25, 'r9'), (1099, 26, 'r10'), (1100, 27, 'r0'), (1101, 28, 'r1'), (1102, 29, 'r2'), (1103, 30, 'r3'), (1104, 31, 'r4'), (1105, 32, 'r5'), (1106, 33, 'r6'), (1107, 34, 'r7'), (1108, 35, 'r8'), (1109, 36, 'r9'), (1110, 0, 'r10'), (1111, 1, 'r0'), (1112, 2, 'r1'), (1113, 3, 'r2'), (1114, 4, 'r3'), (1115, 5, 'r4'), (1116, 6, 'r5'), (1117, 7, 'r6'), (1118, 8, 'r7'), (1119, 9, 'r8'), (1120, 10, 'r9'), (1121, 11, 'r10'), (1122, 12, 'r0'), (1123, 13, 'r1'), (1124, 14, 'r2'), (1125, 15, 'r3'), (1126, 16, 'r4'), (1127, 17, 'r5'), (1128, 18, 'r6'), (1129, 19, 'r7'), (1130, 20, 'r8'), (1131, 21, 'r9'), (1132, 22, 'r10'), (1133, 23, 'r0'), (1134, 24, 'r1'), (1135, 25, 'r2'), (1136, 26, 'r3'), (1137, 27, 'r4'), (1138, 28, 'r5'), (1139, 29, 'r6'), (1140, 30, 'r7'), (1141, 31, 'r8'), (1142, 32, 'r9'), (1143, 33, 'r10'), (1144, 34, 'r0'), (1145, 35, 'r1'), (1146, 36, 'r2'), (1147, 0, 'r3'), (1148, 1, 'r4'), (1149, 2, 'r5'), (1150, 3, 'r6'), (1151, 4, 'r7'), (1152, 5, 'r8'), (1153, 6, 'r9'), (1154, 7, 'r10'), (1155, 8, 'r0'), (1156, 9, 'r1'), (1157, 10, 'r2'), (1158, 11, 'r3'), (1159, 12, 'r4'), (1160, 13, 'r5'), (1161, 14, 'r6'), (1162, 15, 'r7'), (1163, 16, 'r8'), (1164, 17, 'r9'), (1165, 18, 'r10'), (1166, 19, 'r0'), (1167, 20, 'r1'), (1168, 21, 'r2'), (1169, 22, 'r3'), (1170, 23, 'r4'), (1171, 24, 'r5'), (1172, 25, 'r6'), (1173, 26, 'r7'), (1174, 27, 'r8'), (1175, 28, 'r9'), (1176, 29, 'r10'), (1177, 30, 'r0'), (1178, 31, 'r1'), (1179, 32, 'r2'), (1180, 33, 'r3'), (1181, 34, 'r4'), (1182, 35, 'r5'), (1183, 36, 'r6'), (1184, 0, 'r7'), (1185, 1, 'r8'), (1186, 2, 'r9'), (1187, 3, 'r10'), (1188, 4, 'r0'), (1189, 5, 'r1'), (1190, 6, 'r2'), (1191, 7, 'r3'), (1192, 8, 'r4'), (1193, 9, 'r5'), (1194, 10, 'r6'), (1195, 11, 'r7'), (1196, 12, 'r8'), (1197, 13, 'r9'), (1198, 14, 'r10'), (1199, 15, 'r0'), (1200, 16, 'r1'), (1201, 17, 'r2'), (1202, 18, 'r3'), (1203, 19, 'r4'), (1204, 20, 'r5'), (1205, 21, 'r6'), (1206, 22, 'r7'), (1207, 23, 'r8'), (1208, 24, 'r9'), (1209, 25, 'r10'), (1210, 26, 'r0'), (1211, 27, 'r1'), (1212, 28, 'r2'), (1213, 29, 'r3'), (1214, 30, 'r4'), (1215, 31, 'r5'), (1216, 32, 'r6'), (1217, 33, 'r7'), (1218, 34, 'r8'), (1219, 35, 'r9'), (1220, 36, 'r10'), (1221, 0, 'r0'), (1222, 1, 'r1'), (1223, 2, 'r2'), (1224, 3, 'r3'), (1225, 4, 'r4'), (1226, 5, 'r5'), (1227, 6, 'r6'), (1228, 7, 'r7'), (1229, 8, 'r8'), (1230, 9, 'r9'), (1231, 10, 'r10'), (1232, 11, 'r0'), (1233, 12, 'r1'), (1234, 13, 'r2'), (1235, 14, 'r3'), (1236, 15, 'r4'), (1237, 16, 'r5'), (1238, 17, 'r6'), (1239, 18, 'r7'), (1240, 19, 'r8'), (1241, 20, 'r9'), (1242, 21, 'r10'), (1243, 22, 'r0'), (1244, 23, 'r1'), (1245, 24, 'r2'), (1246, 25, 'r3'), (1247, 26, 'r4'), (1248, 27, 'r5'), (1249, 28, 'r6'), (1250, 29, 'r7'), (1251, 30, 'r8'), (1252, 31, 'r9'), (1253, 32, 'r10'), (1254, 33, 'r0'), (1255, 34, 'r1'), (1256, 35, 'r2'), (1257, 36, 'r3'), (1258, 0, 'r4'), (1259, 1, 'r5'), (1260, 2, 'r6'), (1261, 3, 'r7'), (1262, 4, 'r8'), (1263, 5, 'r9'), (1264, 6, 'r10'), (1265, 7, 'r0'), (1266, 8, 'r1'), (1267, 9, 'r2'), (1268, 10, 'r3'), (1269, 11, 'r4'), (1270, 12, 'r5'), (1271, 13, 'r6'), (1272, 14, 'r7'), (1273, 15, 'r8'), (1274, 16, 'r9'), (1275, 17, 'r10'), (1276, 18, 'r0'), (1277, 19, 'r1'), (1278, 20, 'r2'), (1279, 21, 'r3'), (1280, 22, 'r4'), (1281, 23, 'r5'), (1282, 24, 'r6'), (1283, 25, 'r7'), (1284, 26, 'r8'), (1285, 27, 'r9'), (1286, 28, 'r10'), (1287, 29, 'r0'), (1288, 30, 'r1'), (1289, 31, 'r2'), (1290, 32, 'r3'), (1291, 33, 'r4'), (1292, 34, 'r5'), (1293, 35, 'r6'), (1294, 36, 'r7'), (1295, 0, 'r8'), (1296, 1, 'r9'), (1297, 2, 'r10'), (1298, 3, 'r0'), (1299, 4, 'r1'), (1300, 5, 'r2'), (1301, 6, 'r3'), (1302, 7, 'r4'), (1303, 8, 'r5'), (1304, 9, 'r6'), (1305, 10, 'r7'), (1306, 11, 'r8'), (1307, 12, 'r9'), (1308, 13, 'r10'), (1309, 14, 'r0'), (1310, 15, 'r1'), (1311, 16, 'r2'), (1312, 17, 'r3'), (1313, 18, 'r4'), (1314, 19, 'r5'), (1315, 20, 'r6'), (1316, 21, 'r7'), (1317, 22, 'r8'), (1318, 23, 'r9'), (1319, 24, 'r10'), (1320, 25, 'r0'), (1321, 26, 'r1'), (1322, 27, 'r2'), (1323, 28, 'r3'), (1324, 29, 'r4'), (1325, 30, 'r5'), (1326, 31, 'r6'), (1327, 32, 'r7'), (1328, 33, 'r8'), (1329, 34, 'r9'), (1330, 35, 'r10'), (1331, 36, 'r0'), (1332, 0, 'r1'), (1333, 1, 'r2'), (1334, 2, 'r3'), (1335, 3, 'r4'), (1336, 4, 'r5'), (1337, 5, 'r6'), (1338, 6, 'r7'), (1339, 7, 'r8'), (1340, 8, 'r9'), (1341, 9, 'r10'), (1342, 10, 'r0'), (1343, 11, 'r1'), (1344, 12, 'r2'), (1345, 13, 'r3'), (1346, 14, 'r4'), (1347, 15, 'r5'), (1348, 16, 'r6'), (1349, 17, 'r7'), (1350, 18, 'r8'), (1351, 19, 'r9'), (1352, 20, 'r10'), (1353, 21, 'r0'), (1354, 22, 'r1'), (1355, 23, 'r2'), (1356, 24, 'r3'), (1357, 25, 'r4'), (1358, 26, 'r5'), (1359, 27, 'r6'), (1360, 28, 'r7'), (1361, 29, 'r8'), (1362, 30, 'r9'), (1363, 31, 'r10'), (1364, 32, 'r0'), (1365, 33, 'r1'), (1366, 34, 'r2'), (1367, 35, 'r3'), (1368, 36, 'r4'), (1369, 0, 'r5'), (1370, 1, 'r6'), (1371, 2, 'r7'), (1372, 3, 'r8'), (1373, 4, 'r9'), (1374, 5, 'r10'), (1375, 6, 'r0'), (1376, 7, 'r1'), (1377, 8, 'r2'), (1378, 9, 'r3'), (1379, 10, 'r4'), (1380, 11, 'r5'), (1381, 12, 'r6'), (1382, 13, 'r7'), (1383, 14, 'r8'), (1384, 15, 'r9'), (1385, 16, 'r10'), (1386, 17, 'r0'), (1387, 18, 'r1'), (1388, 19, 'r2'), (1389, 20, 'r3'), (1390, 21, 'r4'), (1391, 22, 'r5'), (1392, 23, 'r6'), (1393, 24, 'r7'), (1394, 25, 'r8'), (1395, 26, 'r9'), (1396, 27, 'r10'), (1397, 28, 'r0'), (1398, 29, 'r1'), (1399, 30, 'r2'), (1400, 31, 'r3'), (1401, 32, 'r4'), (1402, 33, 'r5'), (1403, 34, 'r6'), (1404, 35, 'r7'), (1405, 36, 'r8'), (1406, 0, 'r9'), (1407, 1, 'r10'), (1408, 2, 'r0'), (1409, 3, 'r1'), (1410, 4, 'r2'), (1411, 5, 'r3'), (1412, 6, 'r4'), (1413, 7, 'r5'), (1414, 8, 'r6'), (1415, 9, 'r7'), (1416, 10, 'r8'), (1417, 11, 'r9'), (1418, 12, 'r10'), (1419, 13, 'r0'), (1420, 14, 'r1'), (1421, 15, 'r2'), (1422, 16, 'r3'), (1423, 17, 'r4'), (1424, 18, 'r5'), (1425, 19, 'r6'), (1426, 20, 'r7'), (1427, 21, 'r8'), (1428, 22, 'r9'), (1429, 23, 'r10'), (1430, 24, 'r0'), (1431, 25, 'r1'), (1432, 26, 'r2'), (1433, 27, 'r3'), (1434, 28, 'r4'), (1435, 29, 'r5'), (1436, 30, 'r6'), (1437, 31, 'r7'), (1438, 32, 'r8'), (1439, 33, 'r9'), (1440, 34, 'r10'), (1441, 35, 'r0'), (1442, 36, 'r1'), (1443, 0, 'r2'), (1444, 1, 'r3'), (1445, 2, 'r4'), (1446, 3, 'r5'), (1447, 4, 'r6'), (1448, 5, 'r7'), (1449, 6, 'r8'), (1450, 7, 'r9'), (1451, 8, 'r10'), (1452, 9, 'r0'), (1453, 10, 'r1'), (1454, 11, 'r2'), (1455, 12, 'r3'), (1456, 13, 'r4'), (1457, 14, 'r5'), (1458, 15, 'r6'), (1459, 16, 'r7'), (1460, 17, 'r8'), (1461, 18, 'r9'), (1462, 19, 'r10'), (1463, 20, 'r0'), (1464, 21, 'r1'), (1465, 22, 'r2'), (1466, 23, 'r3'), (1467, 24, 'r4'), (1468, 25, 'r5'), (1469, 26, 'r6'), (1470, 27, 'r7'), (1471, 28, 'r8'), (1472, 29, 'r9'), (1473, 30, 'r10'), (1474, 31, 'r0'), (1475, 32, 'r1'), (1476, 33, 'r2'), (1477, 34, 'r3'), (1478, 35, 'r4'), (1479, 36, 'r5'), (1480, 0, 'r6'), (1481, 1, 'r7'), (1482, 2, 'r8'), (1483, 3, 'r9'), (1484, 4, 'r10'), (1485, 5, 'r0'), (1486, 6, 'r1'), (1487, 7, 'r2'), (1488, 8, 'r3'), (1489, 9, 'r4'), (1490, 10, 'r5'), (1491, 11, 'r6'), (1492, 12, 'r7'), (1493, 13, 'r8'), (1494, 14, 'r9'), (1495, 15, 'r10'), (1496, 16, 'r0'), (1497, 17, 'r1'), (1498, 18, 'r2'), (1499, 19, 'r3');
+SET AUTOCOMMIT OFF;
+INSERT INTO R VALUES (1500, 20, 'r4'), (1501, 21, 'r5'), (1502, 22, 'r6'), (1503, 23, 'r7'), (1504, 24, 'r8'), (1505, 25, 'r9'), (1506, 26, 'r10'), (1507, 27, 'r0'), (1508, 28, 'r1'), (1509, 29, 'r2'), (1510, 30, 'r3'), (1511, 31, 'r4'), (1512, 32, 'r5'), (1513, 33, 'r6'), (1514, 34, 'r7'), (1515, 35, 'r8'), (1516, 36, 'r9'), (1517, 0, 'r10'), (1518, 1, 'r0'), (1519, 2, 'r1'), (1520, 3, 'r2'), (1521, 4, 'r3'), (1522, 5, 'r4'), (1523, 6, 'r5'), (1524, 7, 'r6'), (1525, 8, 'r7'), (1526, 9, 'r8'), (1527, 10, 'r9'), (1528, 11, 'r10'), (1529, 12, 'r0'), (1530, 13, 'r1'), (1531, 14, 'r2'), (1532, 15, 'r3'), (1533, 16, 'r4'), (1534, 17, 'r5'), (1535, 18, 'r6'), (1536, 19, 'r7'), (1537, 20, 'r8'), (1538, 21, 'r9'), (1539, 22, 'r10'), (1540, 23, 'r0'), (1541, 24, 'r1'), (1542, 25, 'r2'), (1543, 26, 'r3'), (1544, 27, 'r4'), (1545, 28, 'r5'), (1546, 29, 'r6'), (1547, 30, 'r7'), (1548, 31, 'r8'), (1549, 32, 'r9'), (1550, 33, 'r10'), (1551, 34, 'r0'), (1552, 35, 'r1'), (1553, 36, 'r2'), (1554, 0, 'r3'), (1555, 1, 'r4'), (1556, 2, 'r5'), (1557, 3, 'r6'), (1558, 4, 'r7'), (1559, 5, 'r8'), (1560, 6, 'r9'), (1561, 7, 'r10'), (1562, 8, 'r0'), (1563, 9, 'r1'), (1564, 10, 'r2'), (1565, 11, 'r3'), (1566, 12, 'r4'), (1567, 13, 'r5'), (1568, 14, 'r6'), (1569, 15, 'r7'), (1570, 16, 'r8'), (1571, 17, 'r9'), (1572, 18, 'r10'), (1573, 19, 'r0'), (1574, 20, 'r1'), (1575, 21, 'r2'), (1576, 22, 'r3'), (1577, 23, 'r4'), (1578, 24, 'r5'), (1579, 25, 'r6'), (1580, 26, 'r7'), (1581, 27, 'r8'), (1582, 28, 'r9'), (1583, 29, 'r10'), (1584, 30, 'r0'), (1585, 31, 'r1'), (1586, 32, 'r2'), (1587, 33, 'r3'), (1588, 34, 'r4'), (1589, 35, 'r5'), (1590, 36, 'r6'), (1591, 0, 'r7'), (1592, 1, 'r8'), (1593, 2, 'r9'), (1594, 3, 'r10'), (1595, 4, 'r0'), (1596, 5, 'r1'), (1597, 6, 'r2'), (1598, 7, 'r3'), (1599, 8, 'r4'), (1600, 9, 'r5'), (1601, 10, 'r6'), (1602, 11, 'r7'), (1603, 12, 'r8'), (1604, 13, 'r9'), (1605, 14, 'r10'), (1606, 15, 'r0'), (1607, 16, 'r1'), (1608, 17, 'r2'), (1609, 18, 'r3'), (1610, 19, 'r4'), (1611, 20, 'r5'), (1612, 21, 'r6'), (1613, 22, 'r7'), (1614, 23, 'r8'), (1615, 24, 'r9'), (1616, 25, 'r10'), (1617, 26, 'r0'), (1618, 27, 'r1'), (1619, 28, 'r2'), (1620, 29, 'r3'), (1621, 30, 'r4'), (1622, 31, 'r5'), (1623, 32, 'r6'), (1624, 33, 'r7'), (1625, 34, 'r8'), (1626, 35, 'r9'), (1627, 36, 'r10'), (1628, 0, 'r0'), (1629, 1, 'r1'), (1630, 2, 'r2'), (1631, 3, 'r3'), (1632, 4, 'r4'), (1633, 5, 'r5'), (1634, 6, 'r6'), (1635, 7, 'r7'), (1636, 8, 'r8'), (1637, 9, 'r9'), (1638, 10, 'r10'), (1639, 11, 'r0'), (1640, 12, 'r1'), (1641, 13, 'r2'), (1642, 14, 'r3'), (1643, 15, 'r4'), (1644, 16, 'r5'), (1645, 17, 'r6'), (1646, 18, 'r7'), (1647, 19, 'r8'), (1648, 20, 'r9'), (1649, 21, 'r10'), (1650, 22, 'r0'), (1651, 23, 'r1'), (1652, 24, 'r2'), (1653, 25, 'r3'), (1654, 26, 'r4'), (1655, 27, 'r5'), (1656, 28, 'r6'), (1657, 29, 'r7'), (1658, 30, 'r8'), (1659, 31, 'r9'), (1660, 32, 'r10'), (1661, 33, 'r0'), (1662, 34, 'r1'), (1663, 35, 'r2'), (1664, 36, 'r3'), (1665, 0, 'r4'), (1666, 1, 'r5'), (1667, 2, 'r6'), (1668, 3, 'r7'), (1669, 4, 'r8'), (1670, 5, 'r9'), (1671, 6, 'r10'), (1672, 7, 'r0'), (1673, 8, 'r1'), (1674, 9, 'r2'), (1675, 10, 'r3'), (1676, 11, 'r4'), (1677, 12, 'r5'), (1678, 13, 'r6'), (1679, 14, 'r7'), (1680, 15, 'r8'), (1681, 16, 'r9'), (1682, 17, 'r10'), (1683, 18, 'r0'), (1684, 19, 'r1'), (1685, 20, 'r2'), (1686, 21, 'r3'), (1687, 22, 'r4'), (1688, 23, 'r5'), (1689, 24, 'r6'), (1690, 25, 'r7'), (1691, 26, 'r8'), (1692, 27, 'r9'), (1693, 28, 'r10'), (1694, 29, 'r0'), (1695, 30, 'r1'), (1696, 31, 'r2'), (1697, 32, 'r3'), (1698, 33, 'r4'), (1699, 34, 'r5'), (1700, 35, 'r6'), (1701, 36, 'r7'), (1702, 0, 'r8'), (1703, 1, 'r9'), (1704, 2, 'r10'), (1705, 3, 'r0'), (1706, 4, 'r1'), (1707, 5, 'r2'), (1708, 6, 'r3'), (1709, 7, 'r4'), (1710, 8, 'r5'), (1711, 9, 'r6'), (1712, 10, 'r7'), (1713, 11, 'r8'), (1714, 12, 'r9'), (1715, 13, 'r10'), (1716, 14, 'r0'), (1717, 15, 'r1'), (1718, 16, 'r2'), (1719, 17, 'r3'), (1720, 18, 'r4'), (1721, 19, 'r5'), (1722, 20, 'r6'), (1723, 21, 'r7'), (1724, 22, 'r8'), (1725, 23, 'r9'), (1726, 24, 'r10'), (1727, 25, 'r0'), (1728, 26, 'r1'), (1729, 27, 'r2'), (1730, 28, 'r3'), (1731, 29, 'r4'), (1732, 30, 'r5'), (1733, 31, 'r6'), (1734, 32, 'r7'), (1735, 33, 'r8'), (1736, 34, 'r9'), (1737, 35, 'r10'), (1738, 36, 'r0'), (1739, 0, 'r1'), (1740, 1, 'r2'), (1741, 2, 'r3'), (1742, 3, 'r4'), (1743, 4, 'r5'), (1744, 5, 'r6'), (1745, 6, 'r7'), (1746, 7, 'r8'), (1747, 8, 'r9'), (1748, 9, 'r10'), (1749, 10, 'r0'), (1750, 11, 'r1'), (1751, 12, 'r2'), (1752, 13, 'r3'), (1753, 14, 'r4'), (1754, 15, 'r5'), (1755, 16, 'r6'), (1756, 17, 'r7'), (1757, 18, 'r8'), (1758, 19, 'r9'), (1759, 20, 'r10'), (1760, 21, 'r0'), (1761, 22, 'r1'), (1762, 23, 'r2'), (1763, 24, 'r3'), (1764, 25, 'r4'), (1765, 26, 'r5'), (1766, 27, 'r6'), (1767, 28, 'r7'), (1768, 29, 'r8'), (1769, 30, 'r9'), (1770, 31, 'r10'), (1771, 32, 'r0'), (1772, 33, 'r1'), (1773, 34, 'r2'), (1774, 35, 'r3'), (1775, 36, 'r4'), (1776, 0, 'r5'), (1777, 1, 'r6'), (1778, 2, 'r7'), (1779, 3, 'r8'), (1780, 4, 'r9'), (1781, 5, 'r10'), (1782, 6, 'r0'), (1783, 7, 'r1'), (1784, 8, 'r2'), (1785, 9, 'r3'), (1786, 10, 'r4'), (1787, 11, 'r5'), (1788, 12, 'r6'), (1789, 13, 'r7'), (1790, 14, 'r8'), (1791, 15, 'r9'), (1792, 16, 'r10'), (1793, 17, 'r0'), (1794, 18, 'r1'), (1795, 19, 'r2'), (1796, 20, 'r3'), (1797, 21, 'r4'), (1798, 22, 'r5'), (1799, 23, 'r6'), (1800, 24, 'r7'), (1801, 25, 'r8'), (1802, 26, 'r9'), (1803, 27, 'r10'), (1804, 28, 'r0'), (1805, 29, 'r1'), (1806, 30, 'r2'), (1807, 31, 'r3'), (1808, 32, 'r4'), (1809, 33, 'r5'), (1810, 34, 'r6'), (1811, 35, 'r7'), (1812, 36, 'r8'), (1813, 0, 'r9'), (1814, 1, 'r10'), (1815, 2, 'r0'), (1816, 3, 'r1'), (1817, 4, 'r2'), (1818, 5, 'r3'), (1819, 6, 'r4'), (1820, 7, 'r5'), (1821, 8, 'r6'), (1822, 9, 'r7'), (1823, 10, 'r8'), (1824, 11, 'r9'), (1825, 12, 'r10'), (1826, 13, 'r0'), (1827, 14, 'r1'), (1828, 15, 'r2'), (1829, 16, 'r3'), (1830, 17, 'r4'), (1831, 18, 'r5'), (1832, 19, 'r6'), (1833, 20, 'r7'), (1834, 21, 'r8'), (1835, 22, 'r9'), (1836, 23, 'r10'), (1837, 24, 'r0'), (1838, 25, 'r1'), (1839, 26, 'r2'), (1840, 27, 'r3'), (1841, 28, 'r4'), (1842, 29, 'r5'), (1843, 30, 'r6'), (1844, 31, 'r7'), (1845, 32, 'r8'), (1846, 33, 'r9'), (1847, 34, 'r10'), (1848, 35, 'r0'), (1849, 36, 'r1'), (1850, 0, 'r2'), (1851, 1, 'r3'), (1852, 2, 'r4'), (1853, 3, 'r5'), (1854, 4, 'r6'), (1855, 5, 'r7'), (1856, 6, 'r8'), (1857, 7, 'r9'), (1858, 8, 'r10'), (1859, 9, 'r0'), (1860, 10, 'r1'), (1861, 11, 'r2'), (1862, 12, 'r3'), (1863, 13, 'r4'), (1864, 14, 'r5'), (1865, 15, 'r6'), (1866, 16, 'r7'), (1867, 17, 'r8'), (1868, 18, 'r9'), (1869, 19, 'r10'), (1870, 20, 'r0'), (1871, 21, 'r1'), (1872, 22, 'r2'), (1873, 23, 'r3'), (1874, 24, 'r4'), (1875, 25, 'r5'), (1876, 26, 'r6'), (1877, 27, 'r7'), (1878, 28, 'r8'), (1879, 29, 'r9'), (1880, 30, 'r10'), (1881, 31, 'r0'), (1882, 32, 'r1'), (1883, 33, 'r2'), (1884, 34, 'r3'), (1885, 35, 'r4'), (1886, 36, 'r5'), (1887, 0, 'r6'), (1888, 1, 'r7'), (1889, 2, 'r8'), (1890, 3, 'r9'), (1891, 4, 'r10'), (1892, 5, 'r0'), (1893, 6, 'r1'), (1894, 7, 'r2'), (1895, 8, 'r3'), (1896, 9, 'r4'), (1897, 10, 'r5'), (1898, 11, 'r6'), (1899, 12, 'r7'), (1900, 13, 'r8'), (1901, 14, 'r9'), (1902, 15, 'r10'), (1903, 16, 'r0'), (1904, 17, 'r1'), (1905, 18, 'r2'), (1906, 19, 'r3'), (1907, 20, 'r4'), (1908, 21, 'r5'), (1909, 22, 'r6'), (1910, 23, 'r7'), (1911, 24, 'r8'), (1912, 25, 'r9'), (1913, 26, 'r10'), (1914, 27, 'r0'), (1915, 28, 'r1'), (1916, 29, 'r2'), (1917, 30, 'r3'), (1918, 31, 'r4'), (1919, 32, 'r5'), (1920, 33, 'r6'), (1921, 34, 'r7'), (1922, 35, 'r8'), (1923, 36, 'r9'), (1924, 0, 'r10'), (1925, 1, 'r0'), (1926, 2, 'r1'), (1927, 3, 'r2'), (1928, 4, 'r3'), (1929, 5, 'r4'), (1930, 6, 'r5'), (1931, 7, 'r6'), (1932, 8, 'r7'), (1933, 9, 'r8'), (1934, 10, 'r9'), (1935, 11, 'r10'), (1936, 12, 'r0'), (1937, 13, 'r1'), (1938, 14, 'r2'), (1939, 15, 'r3'), (1940, 16, 'r4'), (1941, 17, 'r5'), (1942, 18, 'r6'), (1943, 19, 'r7'), (1944, 20, 'r8'), (1945, 21, 'r9'), (1946, 22, 'r10'), (1947, 23, 'r0'), (1948, 24, 'r1'), (1949, 25, 'r2'), (1950, 26, 'r3'), (1951, 27, 'r4'), (1952, 28, 'r5'), (1953, 29, 'r6'), (1954, 30, 'r7'), (1955, 31, 'r8'), (1956, 32, 'r9'), (1957, 33, 'r10'), (1958, 34, 'r0'), (1959, 35, 'r1'), (1960, 36, 'r2'), (1961, 0, 'r3'), (1962, 1, 'r4'), (1963, 2, 'r5'), (1964, 3, 'r6'), (1965, 4, 'r7'), (1966, 5, 'r8'), (1967, 6, 'r9'), (1968, 7, 'r10'), (1969, 8, 'r0'), (1970, 9, 'r1'), (1971, 10, 'r2'), (1972, 11, 'r3'), (1973, 12, 'r4'), (1974, 13, 'r5'), (1975, 14, 'r6'), (1976, 15, 'r7'), (1977, 16, 'r8'), (1978, 17, 'r9'), (1979, 18, 'r10'), (1980, 19, 'r0'), (1981, 20, 'r1'), (1982, 21, 'r2'), (1983, 22, 'r3'), (1984, 23, 'r4'), (1985, 24, 'r5'), (1986, 25, 'r6'), (1987, 26, 'r7'), (1988, 27, 'r8'), (1989, 28, 'r9'), (1990, 29, 'r10'), (1991, 30, 'r0'), (1992, 31, 'r1'), (1993, 32, 'r2'), (1994, 33, 'r3'), (1995, 34, 'r4'), (1996, 35, 'r5'), (1997, 36, 'r6'), (1998, 0, 'r7'), (1999, 1, 'r8');
+DELETE FROM R WHERE B = 3;
+ROLLBACK;
+INSERT INTO R VALUES (2000, 2, 'r9'), (2001, 3, 'r10'), (2002, 4, 'r0'), (2003, 5, 'r1'), (2004, 6, 'r2'), (2005, 7, 'r3'), (2006, 8, 'r4'), (2007, 9, 'r5'), (2008, 10, 'r6'), (2009, 11, 'r7'), (2010, 12, 'r8'), (2011, 13, 'r9'), (2012, 14, 'r10'), (2013, 15, 'r0'), (2014, 16, 'r1'), (2015, 17, 'r2'), (2016, 18, 'r3'), (2017, 19, 'r4'), (2018, 20, 'r5'), (2019, 21, 'r6'), (2020, 22, 'r7'), (2021, 23, 'r8'), (2022, 24, 'r9'), (2023, 25, 'r10'), (2024, 26, 'r0'), (2025, 27, 'r1'), (2026, 28, 'r2'), (2027, 29, 'r3'), (2028, 30, 'r4'), (2029, 31, 'r5'), (2030, 32, 'r6'), (2031, 33, 'r7'), (2032, 34, 'r8'), (2033, 35, 'r9'), (2034, 36, 'r10'), (2035, 0, 'r0'), (2036, 1, 'r1'), (2037, 2, 'r2'), (2038, 3, 'r3'), (2039, 4, 'r4'), (2040, 5, 'r5'), (2041, 6, 'r6'), (2042, 7, 'r7'), (2043, 8, 'r8'), (2044, 9, 'r9'), (2045, 10, 'r10'), (2046, 11, 'r0'), (2047, 12, 'r1'), (2048, 13, 'r2'), (2049, 14, 'r3'), (2050, 15, 'r4'), (2051, 16, 'r5'), (2052, 17, 'r6'), (2053, 18, 'r7'), (2054, 19, 'r8'), (2055, 20, 'r9'), (2056, 21, 'r10'), (2057, 22, 'r0'), (2058, 23, 'r1'), (2059, 24, 'r2'), (2060, 25, 'r3'), (2061, 26, 'r4'), (2062, 27, 'r5'), (2063, 28, 'r6'), (2064, 29, 'r7'), (2065, 30, 'r8'), (2066, 31, 'r9'), (2067, 32, 'r10'), (2068, 33, 'r0'), (2069, 34, 'r1'), (2070, 35, 'r2'), (2071, 36, 'r3'), (2072, 0, 'r4'), (2073, 1, 'r5'), (2074, 2, 'r6'), (2075, 3, 'r7'), (2076, 4, 'r8'), (2077, 5, 'r9'), (2078, 6, 'r10'), (2079, 7, 'r0'), (2080, 8, 'r1'), (2081, 9, 'r2'), (2082, 10, 'r3'), (2083, 11, 'r4'), (2084, 12, 'r5'), (2085, 13, 'r6'), (2086, 14, 'r7'), (2087, 15, 'r8'), (2088, 16, 'r9'), (2089, 17, 'r10'), (2090, 18, 'r0'), (2091, 19, 'r1'), (2092, 20, 'r2'), (2093, 21, 'r3'), (2094, 22, 'r4'), (2095, 23, 'r5'), (2096, 24, 'r6'), (2097, 25, 'r7'), (2098, 26, 'r8'), (2099, 27, 'r9'), (2100, 28, 'r10'), (2101, 29, 'r0'), (2102, 30, 'r1'), (2103, 31, 'r2'), (2104, 32, 'r3'), (2105, 33, 'r4'), (2106, 34, 'r5'), (2107, 35, 'r6'), (2108, 36, 'r7'), (2109, 0, 'r8'), (2110, 1, 'r9'), (2111, 2, 'r10'), (2112, 3, 'r0'), (2113, 4, 'r1'), (2114, 5, 'r2'), (2115, 6, 'r3'), (2116, 7, 'r4'), (2117, 8, 'r5'), (2118, 9, 'r6'), (2119, 10, 'r7'), (2120, 11, 'r8'), (2121, 12, 'r9'), (2122, 13, 'r10'), (2123, 14, 'r0'), (2124, 15, 'r1'), (2125, 16, 'r2'), (2126, 17, 'r3'), (2127, 18, 'r4'), (2128, 19, 'r5'), (2129, 20, 'r6'), (2130, 21, 'r7'), (2131, 22, 'r8'), (2132, 23, 'r9'), (2133, 24, 'r10'), (2134, 25, 'r0'), (2135, 26, 'r1'), (2136, 27, 'r2'), (2137, 28, 'r3'), (2138, 29, 'r4'), (2139, 30, 'r5'), (2140, 31, 'r6'), (2141, 32, 'r7'), (2142, 33, 'r8'), (2143, 34, 'r9'), (2144, 35, 'r10'), (2145, 36, 'r0'), (2146, 0, 'r1'), (2147, 1, 'r2'), (2148, 2, 'r3'), (2149, 3, 'r4'), (2150, 4, 'r5'), (2151, 5, 'r6'), (2152, 6, 'r7'), (2153, 7, 'r8'), (2154, 8, 'r9'), (2155, 9, 'r10'), (2156, 10, 'r0'), (2157, 11, 'r1'), (2158, 12, 'r2'), (2159, 13, 'r3'), (2160, 14, 'r4'), (2161, 15, 'r5'), (2162, 16, 'r6'), (2163, 17, 'r7'), (2164, 18, 'r8'), (2165, 19, 'r9'), (2166, 20, 'r10'), (2167, 21, 'r0'), (2168, 22, 'r1'), (2169, 23, 'r2'), (2170, 24, 'r3'), (2171, 25, 'r4'), (2172, 26, 'r5'), (2173, 27, 'r6'), (2174, 28, 'r7'), (2175, 29, 'r8'), (2176, 30, 'r9'), (2177, 31, 'r10'), (2178, 32, 'r0'), (2179, 33, 'r1'), (2180, 34, 'r2'), (2181, 35, 'r3'), (2182, 36, 'r4'), (2183, 0, 'r5'), (2184, 1, 'r6'), (2185, 2, 'r7'), (2186, 3, 'r8'), (2187, 4, 'r9'), (2188, 5, 'r10'), (2189, 6, 'r0'), (2190, 7, 'r1'), (2191, 8, 'r2'), (2192, 9, 'r3'), (2193, 10, 'r4'), (2194, 11, 'r5'), (2195, 12, 'r6'), (2196, 13, 'r7'), (2197, 14, 'r8'), (2198, 15, 'r9'), (2199, 16, 'r10'), (2200, 17, 'r0'), (2201, 18, 'r1'), (2202, 19, 'r2'), (2203, 20, 'r3'), (2204, 21, 'r4'), (2205, 22, 'r5'), (2206, 23, 'r6'), (2207, 24, 'r7'), (2208, 25, 'r8'), (2209, 26, 'r9'), (2210, 27, 'r10'), (2211, 28, 'r0'), (2212, 29, 'r1'), (2213, 30, 'r2'), (2214, 31, 'r3'), (2215, 32, 'r4'), (2216, 33, 'r5'), (2217, 34, 'r6'), (2218, 35, 'r7'), (2219, 36, 'r8'), (2220, 0, 'r9'), (2221, 1, 'r10'), (2222, 2, 'r0'), (2223, 3, 'r1'), (2224, 4, 'r2'), (2225, 5, 'r3'), (2226, 6, 'r4'), (2227, 7, 'r5'), (2228, 8, 'r6'), (2229, 9, 'r7'), (2230, 10, 'r8'), (2231, 11, 'r9'), (2232, 12, 'r10'), (2233, 13, 'r0'), (2234, 14, 'r1'), (2235, 15, 'r2'), (2236, 16, 'r3'), (2237, 17, 'r4'), (2238, 18, 'r5'), (2239, 19, 'r6'), (2240, 20, 'r7'), (2241, 21, 'r8'), (2242, 22, 'r9'), (2243, 23, 'r10'), (2244, 24, 'r0'), (2245, 25, 'r1'), (2246, 26, 'r2'), (2247, 27, 'r3'), (2248, 28, 'r4'), (2249, 29, 'r5'), (2250, 30, 'r6'), (2251, 31, 'r7'), (2252, 32, 'r8'), (2253, 33, 'r9'), (2254, 34, 'r10'), (2255, 35, 'r0'), (2256, 36, 'r1'), (2257, 0, 'r2'), (2258, 1, 'r3'), (2259, 2, 'r4'), (2260, 3, 'r5'), (2261, 4, 'r6'), (2262, 5, 'r7'), (2263, 6, 'r8'), (2264, 7, 'r9'), (2265, 8, 'r10'), (2266, 9, 'r0'), (2267, 10, 'r1'), (2268, 11, 'r2'), (2269, 12, 'r3'), (2270, 13, 'r4'), (2271, 14, 'r5'), (2272, 15, 'r6'), (2273, 16, 'r7'), (2274, 17, 'r8'), (2275, 18, 'r9'), (2276, 19, 'r10'), (2277, 20, 'r0'), (2278, 21, 'r1'), (2279, 22, 'r2'), (2280, 23, 'r3'), (2281, 24, 'r4'), (2282, 25, 'r5'), (2283, 26, 'r6'), (2284, 27, 'r7'), (2285, 28, 'r8'), (2286, 29, 'r9'), (2287, 30, 'r10'), (2288, 31, 'r0'), (2289, 32, 'r1'), (2290, 33, 'r2'), (2291, 34, 'r3'), (2292, 35, 'r4'), (2293, 36, 'r5'), (2294, 0, 'r6'), (2295, 1, 'r7'), (2296, 2, 'r8'), (2297, 3, 'r9'), (2298, 4, 'r10'), (2299, 5, 'r0');
+INSERT INTO R VALUES (5000, 3, 'single');
+COMMIT;
+DELETE FROM R WHERE A >= 2200;
+INSERT INTO R VALUES (3000, 3, 'r8'), (3001, 4, 'r9'), (3002, 5, 'r10'), (3003, 6, 'r0'), (3004, 7, 'r1'), (3005, 8, 'r2'), (3006, 9, 'r3'), (3007, 10, 'r4'), (3008, 11, 'r5'), (3009, 12, 'r6'), (3010, 13, 'r7'), (3011, 14, 'r8'), (3012, 15, 'r9'), (3013, 16, 'r10'), (3014, 17, 'r0'), (3015, 18, 'r1'), (3016, 19, 'r2'), (3017, 20, 'r3'), (3018, 21, 'r4'), (3019, 22, 'r5'), (3020, 23, 'r6'), (3021, 24, 'r7'), (3022, 25, 'r8'), (3023, 26, 'r9'), (3024, 27, 'r10'), (3025, 28, 'r0'), (3026, 29, 'r1'), (3027, 30, 'r2'), (3028, 31, 'r3'), (3029, 32, 'r4'), (3030, 33, 'r5'), (3031, 34, 'r6'), (3032, 35, 'r7'), (3033, 36, 'r8'), (3034, 0, 'r9'), (3035, 1, 'r10'), (3036, 2, 'r0'), (3037, 3, 'r1'), (3038, 4, 'r2'), (3039, 5, 'r3'), (3040, 6, 'r4'), (3041, 7, 'r5'), (3042, 8, 'r6'), (3043, 9, 'r7'), (3044, 10, 'r8'), (3045, 11, 'r9'), (3046, 12, 'r10'), (3047, 13, 'r0'), (3048, 14, 'r1'), (3049, 15, 'r2'), (3050, 16, 'r3'), (3051, 17, 'r4'), (3052, 18, 'r5'), (3053, 19, 'r6'), (3054, 20, 'r7'), (3055, 21, 'r8'), (3056, 22, 'r9'), (3057, 23, 'r10'), (3058, 24, 'r0'), (3059, 25, 'r1'), (3060, 26, 'r2'), (3061, 27, 'r3'), (3062, 28, 'r4'), (3063, 29, 'r5'), (3064, 30, 'r6'), (3065, 31, 'r7'), (3066, 32, 'r8'), (3067, 33, 'r9'), (3068, 34, 'r10'), (3069, 35, 'r0'), (3070, 36, 'r1'), (3071, 0, 'r2'), (3072, 1, 'r3'), (3073, 2, 'r4'), (3074, 3, 'r5'), (3075, 4, 'r6'), (3076, 5, 'r7'), (3077, 6, 'r8'), (3078, 7, 'r9'), (3079, 8, 'r10'), (3080, 9, 'r0'), (3081, 10, 'r1'), (3082, 11, 'r2'), (3083, 12, 'r3'), (3084, 13, 'r4'), (3085, 14, 'r5'), (3086, 15, 'r6'), (3087, 16, 'r7'), (3088, 17, 'r8'), (3089, 18, 'r9'), (3090, 19, 'r10'), (3091, 20, 'r0'), (3092, 21, 'r1'), (3093, 22, 'r2'), (3094, 23, 'r3'), (3095, 24, 'r4'), (3096, 25, 'r5'), (3097, 26, 'r6'), (3098, 27, 'r7'), (3099, 28, 'r8'), (3100, 29, 'r9'), (3101, 30, 'r10'), (3102, 31, 'r0'), (3103, 32, 'r1'), (3104, 33, 'r2'), (3105, 34, 'r3'), (3106, 35, 'r4'), (3107, 36, 'r5'), (3108, 0, 'r6'), (3109, 1, 'r7'), (3110, 2, 'r8'), (3111, 3, 'r9'), (3112, 4, 'r10'), (3113, 5, 'r0'), (3114, 6, 'r1'), (3115, 7, 'r2'), (3116, 8, 'r3'), (3117, 9, 'r4'), (3118, 10, 'r5'), (3119, 11, 'r6'), (3120, 12, 'r7'), (3121, 13, 'r8'), (3122, 14, 'r9'), (3123, 15, 'r10'), (3124, 16, 'r0'), (3125, 17, 'r1'), (3126, 18, 'r2'), (3127, 19, 'r3'), (3128, 20, 'r4'), (3129, 21, 'r5'), (3130, 22, 'r6'), (3131, 23, 'r7'), (3132, 24, 'r8'), (3133, 25, 'r9'), (3134, 26, 'r10'), (3135, 27, 'r0'), (3136, 28, 'r1'), (3137, 29, 'r2'), (3138, 30, 'r3'), (3139, 31, 'r4'), (3140, 32, 'r5'), (3141, 33, 'r6'), (3142, 34, 'r7'), (3143, 35, 'r8'), (3144, 36, 'r9'), (3145, 0, 'r10'), (3146, 1, 'r0'), (3147, 2, 'r1'), (3148, 3, 'r2'), (3149, 4, 'r3'), (3150, 5, 'r4'), (3151, 6, 'r5'), (3152, 7, 'r6'), (3153, 8, 'r7'), (3154, 9, 'r8'), (3155, 10, 'r9'), (3156, 11, 'r10'), (3157, 12, 'r0'), (3158, 13, 'r1'), (3159, 14, 'r2'), (3160, 15, 'r3'), (3161, 16, 'r4'), (3162, 17, 'r5'), (3163, 18, 'r6'), (3164, 19, 'r7'), (3165, 20, 'r8'), (3166, 21, 'r9'), (3167, 22, 'r10'), (3168, 23, 'r0'), (3169, 24, 'r1'), (3170, 25, 'r2'), (3171, 26, 'r3'), (3172, 27, 'r4'), (3173, 28, 'r5'), (3174, 29, 'r6'), (3175, 30, 'r7'), (3176, 31, 'r8'), (3177, 32, 'r9'), (3178, 33, 'r10'), (3179, 34, 'r0'), (3180, 35, 'r1'), (3181, 36, 'r2'), (3182, 0, 'r3'), (3183, 1, 'r4'), (3184, 2, 'r5'), (3185, 3, 'r6'), (3186, 4, 'r7'), (3187, 5, 'r8'), (3188, 6, 'r9'), (3189, 7, 'r10'), (3190, 8, 'r0'), (3191, 9, 'r1'), (3192, 10, 'r2'), (3193, 11, 'r3'), (3194, 12, 'r4'), (3195, 13, 'r5'), (3196, 14, 'r6'), (3197, 15, 'r7'), (3198, 16, 'r8'), (3199, 17, 'r9');
+ROLLBACK;
+INSERT INTO R VALUES (6000, 3, 'after'), (6001, 4, 'after');
+COMMIT;
+SET AUTOCOMMIT ON;
+INSERT INTO R VALUES (4000, 4, 'r7'), (4001, 5, 'r8'), (4002, 6, 'r9'), (4003, 7, 'r10'), (4004, 8, 'r0'), (4005, 9, 'r1'), (4006, 10, 'r2'), (4007, 11, 'r3'), (4008, 12, 'r4'), (4009, 13, 'r5'), (4010, 14, 'r6'), (4011, 15, 'r7'), (4012, 16, 'r8'), (4013, 17, 'r9'), (4014, 18, 'r10'), (4015, 19, 'r0'), (4016, 20, 'r1'), (4017, 21, 'r2'), (4018, 22, 'r3'), (4019, 23, 'r4'), (4020, 24, 'r5'), (4021, 25, 'r6'), (4022, 26, 'r7'), (4023, 27, 'r8'), (4024, 28, 'r9'), (4025, 29, 'r10'), (4026, 30, 'r0'), (4027, 31, 'r1'), (4028, 32, 'r2'), (4029, 33, 'r3'), (4030, 34, 'r4'), (4031, 35, 'r5'), (4032, 36, 'r6'), (4033, 0, 'r7'), (4034, 1, 'r8'), (4035, 2, 'r9'), (4036, 3, 'r10'), (4037, 4, 'r0'), (4038, 5, 'r1'), (4039, 6, 'r2'), (4040, 7, 'r3'), (4041, 8, 'r4'), (4042, 9, 'r5'), (4043, 10, 'r6'), (4044, 11, 'r7'), (4045, 12, 'r8'), (4046, 13, 'r9'), (4047, 14, 'r10'), (4048, 15, 'r0'), (4049, 16, 'r1'), (4050, 17, 'r2'), (4051, 18, 'r3'), (4052, 19, 'r4'), (4053, 20, 'r5'), (4054, 21, 'r6'), (4055, 22, 'r7'), (4056, 23, 'r8'), (4057, 24, 'r9'), (4058, 25, 'r10'), (4059, 26, 'r0'), (4060, 27, 'r1'), (4061, 28, 'r2'), (4062, 29, 'r3'), (4063, 30, 'r4'), (4064, 31, 'r5'), (4065, 32, 'r6'), (4066, 33, 'r7'), (4067, 34, 'r8'), (4068, 35, 'r9'), (4069, 36, 'r10'), (4070, 0, 'r0'), (4071, 1, 'r1'), (4072, 2, 'r2'), (4073, 3, 'r3'), (4074, 4, 'r4'), (4075, 5, 'r5'), (4076, 6, 'r6'), (4077, 7, 'r7'), (4078, 8, 'r8'), (4079, 9, 'r9'), (4080, 10, 'r10'), (4081, 11, 'r0'), (4082, 12, 'r1'), (4083, 13, 'r2'), (4084, 14, 'r3'), (4085, 15, 'r4'), (4086, 16, 'r5'), (4087, 17, 'r6'), (4088, 18, 'r7'), (4089, 19, 'r8'), (4090, 20, 'r9'), (4091, 21, 'r10'), (4092, 22, 'r0'), (4093, 23, 'r1'), (4094, 24, 'r2'), (4095, 25, 'r3'), (4096, 26, 'r4'), (4097, 27, 'r5'), (4098, 28, 'r6'), (4099, 29, 'r7');
+SELECT R.A, R.C FROM R WHERE B = 3;
+SELECT COUNT(*), SUM(A), MAX(A) FROM R;
+SELECT C, COUNT(*) FROM R WHERE A > 1000 GROUP BY C;
@@ -0,0 +1,65 @@
+import pytest
+import subprocess
+
+from ddb.primitives import ValType
+
+testcase_dir = "tests/rowid/"
+T = 1
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_rowid_{t_id}")
+
+@pytest.mark.parametrize("commit_child", [True, False])
+def test_nested_row_ids(session, commit_child):
+    # row ids handed out in a nested transaction carry over to its parent only if it commits;
+    # either way, the parent never hands out an id already in use:
+    subprocess.run(['make', 'clean'], check=True)
+    dbm = session.dbm
+    with dbm.tm.begin_transaction() as tx:
+        with dbm.sm.heap_file(tx, 'R', [ValType.INTEGER], create_if_not_exists=True) as f:
+            start, count = f.batch_append((i, ) for i in range(100))
+        rows = { start + i: (i, ) for i in range(count) }
+        with dbm.tm.begin_transaction(parent=tx) as child:
+            with dbm.sm.heap_file(child, 'R', [ValType.INTEGER]) as f:
+                child_rows = { f.put((-i, )): (-i, ) for i in range(50) }
+                child_start, child_count = f.batch_append((1000 + i, ) for i in range(50))
+                child_rows.update((child_start + i, (1000 + i, )) for i in range(child_count))
+            if commit_child:
+                child.commit()
+                rows.update(child_rows)
+            else:
+                child.abort()
+        with dbm.sm.heap_file(tx, 'R', [ValType.INTEGER]) as f:
+            for i in range(20):
+                row_id = f.put((2000 + i, ))
+                assert row_id not in rows
+                rows[row_id] = (2000 + i, )
+            assert sorted(f.iter_scan(return_row_id=True)) == sorted((row_id, *row) for row_id, row in rows.items())
+            # truncating starts afresh:
+            assert f.truncate() == len(rows)
+            row_id = f.put((0, ))
+            assert list(f.iter_scan(return_row_id=True)) == [(row_id, 0)]
+        tx.commit()
+
+def test_failed_statement(capsys, run):
+    # a statement that fails midway (here, after appending a row but before indexing a key too wide for it)
+    # leaves no trace, and later rows do not overwrite earlier ones:
+    subprocess.run(['make', 'clean'], check=True)
+    for r in run('CREATE TABLE R(A INT, B INT);' +
+                 'CREATE INDEX ON R(B);' +
+                 'SET AUTOCOMMIT OFF;' +
+                 'INSERT INTO R VALUES (10, 10);'):
+        assert r.error is None, r.error_details
+    r, = run('INSERT INTO R VALUES (12, 12), (13, 99999999999);')
+    assert r.error is not None
+    for r in run('INSERT INTO R VALUES (11, 11), (14, 14);' +
+                 'COMMIT;' +
+                 'SET AUTOCOMMIT ON;'):
+        assert r.error is None, r.error_details
+    capsys.readouterr()
+    r, = run('SELECT * FROM R;')
+    assert r.error is None
+    assert sorted(capsys.readouterr().out.split("\n")[1:-1]) == ['(10, 10)', '(11, 11)', '(14, 14)']
+    r, = run('SELECT * FROM R WHERE B = 12;')
+    assert r.error is None and r.response.startswith('SELECT 0')
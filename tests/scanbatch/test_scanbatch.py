@@ -0,0 +1,68 @@
+import pytest
+import subprocess
+
+from ddb import globals
+from ddb.primitives import ValType
+from ddb.storage.serialize import pack_int
+
+def expected_batches(entries, sizes, max_bytes):
+    # the batches that a scan should return: entries in order, cut once they add up to max_bytes
+    batches, batch, num_bytes = [], [], 0
+    for entry, size in zip(entries, sizes):
+        batch.append(entry)
+        num_bytes += size
+        if num_bytes >= max_bytes:
+            batches.append(batch)
+            batch, num_bytes = [], 0
+    if len(batch) > 0:
+        batches.append(batch)
+    return batches
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    monkeypatch.setattr(globals, 'BLOCK_SIZE', 200)
+
+@pytest.mark.parametrize("num_rows", [0, 1, 97])
+@pytest.mark.parametrize("num_blocks", [1, 3])
+def test_heap_file_batches(session, small_blocks, num_rows, num_blocks):
+    subprocess.run(['make', 'clean'], check=True)
+    with session.dbm.tm.begin_transaction(read_only=False, tmp=True) as tx, \
+        session.dbm.sm.heap_file(tx, 'rows', [ValType.INTEGER, ValType.VARCHAR], create_if_not_exists=True) as h:
+        h.batch_append((i, 'x' * (i % 5 * 8)) for i in range(num_rows))
+        scanned = list(h.iter_scan(return_row_id=True))
+        assert len(scanned) == num_rows
+        sizes = [ len(pack_int(row_id)) + len(h.row_codec.pack(row)) for row_id, *row in scanned ]
+        expected = expected_batches(scanned, sizes, num_blocks * globals.BLOCK_SIZE)
+        assert list(h.iter_scan_batches(return_row_id=True, num_blocks=num_blocks)) == expected
+        assert list(h.iter_scan_batches(num_blocks=num_blocks)) == \
+            [ [ tuple(row) for _, *row in batch ] for batch in expected ]
+        assert [ row for batch in h.iter_scan_batches(num_blocks=num_blocks) for row in batch ] == list(h.iter_scan())
+        assert len(expected) == min(num_rows, 1) or len(expected) > 3 # several batches, the last perhaps partial
+
+@pytest.mark.parametrize("num_rows", [0, 1, 97])
+@pytest.mark.parametrize("unique", [True, False])
+def test_bplus_tree_batches(session, small_blocks, num_rows, unique):
+    subprocess.run(['make', 'clean'], check=True)
+    with session.dbm.tm.begin_transaction(read_only=False, tmp=True) as tx, \
+        session.dbm.sm.bplus_tree(tx, 'index', ValType.VARCHAR, [ValType.INTEGER, ValType.VARCHAR],
+                                  unique=unique, create_if_not_exists=True) as index:
+        for i in range(num_rows):
+            index.put(f'k{i if unique else i // 3:03}', (i, 'y' * (i % 7 * 5)))
+        for key_lower in (None, 'k010', 'z'):
+            scanned = list(index.iter_scan(key_lower=key_lower))
+            sizes = [ len(index.pack_key(key)) + len(index.row_codec.pack(row)) for key, row in scanned ]
+            for num_blocks in (1, 2):
+                batches = list(index.iter_scan_batches(key_lower=key_lower, num_blocks=num_blocks))
+                assert batches == expected_batches(scanned, sizes, num_blocks * globals.BLOCK_SIZE)
+                assert [ entry for batch in batches for entry in batch ] == scanned
+        assert len(list(index.iter_scan())) == num_rows
+
+def test_batches_are_new_lists(session, small_blocks):
+    subprocess.run(['make', 'clean'], check=True)
+    with session.dbm.tm.begin_transaction(read_only=False, tmp=True) as tx, \
+        session.dbm.sm.heap_file(tx, 'rows', [ValType.INTEGER], create_if_not_exists=True) as h:
+        h.batch_append((i, ) for i in range(100))
+        batches = list(h.iter_scan_batches())
+        assert len(batches) > 1 and len({ id(batch) for batch in batches }) == len(batches)
+        batches[0].clear() # the caller may modify what it gets
+        assert sum(len(batch) for batch in h.iter_scan_batches()) == 100
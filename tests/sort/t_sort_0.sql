@@ -0,0 +1,14 @@
+CREATE TABLE R(A INT, B INT, C FLOAT, D VARCHAR, E BOOLEAN, F DATETIME);
+INSERT INTO R VALUES (0, 0, 0.0, 'w0', FALSE, '2000-01-01'), (1, 37, 0.5, 'w7', TRUE, '2000-01-12'), (2, 74, 1.0, 'w14', TRUE, '2000-01-23'), (3, 10, 1.5, 'w21', FALSE, '2000-02-03'), (4, 47, 2.0, 'w28', TRUE, '2000-02-14'), (5, 84, 2.5, 'w6', TRUE, '2000-02-25'), (6, 20, 3.0, 'w13', FALSE, '2000-03-07'), (7, 57, 3.5, 'w20', TRUE, '2000-03-18'), (8, 94, 4.0, 'w27', TRUE, '2000-03-29'), (9, 30, 4.5, 'w5', FALSE, '2000-04-09'), (10, 67, 5.0, 'w12', TRUE, '2000-04-20'), (11, 3, 5.5, 'w19', TRUE, '2000-05-01'), (12, 40, 6.0, 'w26', FALSE, '2000-05-12'), (13, 77, 0.0, 'w4', TRUE, '2000-05-23'), (14, 13, 0.5, 'w11', TRUE, '2000-06-03'), (15, 50, 1.0, 'w18', FALSE, '2000-06-14'), (16, 87, 1.5, 'w25', TRUE, '2000-06-25'), (17, 23, 2.0, 'w3', TRUE, '2000-07-06'), (18, 60, 2.5, 'w10', FALSE, '2000-07-17'), (19, 97, 3.0, 'w17', TRUE, '2000-07-28'), (20, 33, 3.5, 'w24', TRUE, '2000-08-08'), (21, 70, 4.0, 'w2', FALSE, '2000-08-19'), (22, 6, 4.5, 'w9', TRUE, '2000-08-30'), (23, 43, 5.0, 'w16', TRUE, '2000-09-10'), (24, 80, 5.5, 'w23', FALSE, '2000-09-21'), (25, 16, 6.0, 'w1', TRUE, '2000-10-02'), (26, 53, 0.0, 'w8', TRUE, '2000-10-13'), (27, 90, 0.5, 'w15', FALSE, '2000-10-24'), (28, 26, 1.0, 'w22', TRUE, '2000-11-04'), (29, 63, 1.5, 'w0', TRUE, '2000-11-15'), (30, 100, 2.0, 'w7', FALSE, '2000-11-26'), (31, 36, 2.5, 'w14', TRUE, '2000-12-07'), (32, 73, 3.0, 'w21', TRUE, '2000-12-18'), (33, 9, 3.5, 'w28', FALSE, '2000-12-29'), (34, 46, 4.0, 'w6', TRUE, '2001-01-09'), (35, 83, 4.5, 'w13', TRUE, '2001-01-20'), (36, 19, 5.0, 'w20', FALSE, '2001-01-31'), (37, 56, 5.5, 'w27', TRUE, '2000-01-08'), (38, 93, 6.0, 'w5', TRUE, '2000-01-19'), (39, 29, 0.0, 'w12', FALSE, '2000-01-30'), (40, 66, 0.5, 'w19', TRUE, '2000-02-10'), (41, 2, 1.0, 'w26', TRUE, '2000-02-21'), (42, 39, 1.5, 'w4', FALSE, '2000-03-03'), (43, 76, 2.0, 'w11', TRUE, '2000-03-14'), (44, 12, 2.5, 'w18', TRUE, '2000-03-25'), (45, 49, 3.0, 'w25', FALSE, '2000-04-05'), (46, 86, 3.5, 'w3', TRUE, '2000-04-16'), (47, 22, 4.0, 'w10', TRUE, '2000-04-27'), (48, 59, 4.5, 'w17', FALSE, '2000-05-08'), (49, 96, 5.0, 'w24', TRUE, '2000-05-19'), (50, 32, 5.5, 'w2', TRUE, '2000-05-30'), (51, 69, 6.0, 'w9', FALSE, '2000-06-10'), (52, 5, 0.0, 'w16', TRUE, '2000-06-21'), (53, 42, 0.5, 'w23', TRUE, '2000-07-02'), (54, 79, 1.0, 'w1', FALSE, '2000-07-13'), (55, 15, 1.5, 'w8', TRUE, '2000-07-24'), (56, 52, 2.0, 'w15', TRUE, '2000-08-04'), (57, 89, 2.5, 'w22', FALSE, '2000-08-15'), (58, 25, 3.0, 'w0', TRUE, '2000-08-26'), (59, 62, 3.5, 'w7', TRUE, '2000-09-06'), (60, 99, 4.0, 'w14', FALSE, '2000-09-17'), (61, 35, 4.5, 'w21', TRUE, '2000-09-28'), (62, 72, 5.0, 'w28', TRUE, '2000-10-09'), (63, 8, 5.5, 'w6', FALSE, '2000-10-20'), (64, 45, 6.0, 'w13', TRUE, '2000-10-31'), (65, 82, 0.0, 'w20', TRUE, '2000-11-11'), (66, 18, 0.5, 'w27', FALSE, '2000-11-22'), (67, 55, 1.0, 'w5', TRUE, '2000-12-03'), (68, 92, 1.5, 'w12', TRUE, '2000-12-14'), (69, 28, 2.0, 'w19', FALSE, '2000-12-25'), (70, 65, 2.5, 'w26', TRUE, '2001-01-05'), (71, 1, 3.0, 'w4', TRUE, '2001-01-16'), (72, 38, 3.5, 'w11', FALSE, '2001-01-27'), (73, 75, 4.0, 'w18', TRUE, '2000-01-04'), (74, 11, 4.5, 'w25', TRUE, '2000-01-15'), (75, 48, 5.0, 'w3', FALSE, '2000-01-26'), (76, 85, 5.5, 'w10', TRUE, '2000-02-06'), (77, 21, 6.0, 'w17', TRUE, '2000-02-17'), (78, 58, 0.0, 'w24', FALSE, '2000-02-28'), (79, 95, 0.5, 'w2', TRUE, '2000-03-10'), (80, 31, 1.0, 'w9', TRUE, '2000-03-21'), (81, 68, 1.5, 'w16', FALSE, '2000-04-01'), (82, 4, 2.0, 'w23', TRUE, '2000-04-12'), (83, 41, 2.5, 'w1', TRUE, '2000-04-23'), (84, 78, 3.0, 'w8', FALSE, '2000-05-04'), (85, 14, 3.5, 'w15', TRUE, '2000-05-15'), (86, 51, 4.0, 'w22', TRUE, '2000-05-26'), (87, 88, 4.5, 'w0', FALSE, '2000-06-06'), (88, 24, 5.0, 'w7', TRUE, '2000-06-17'), (89, 61, 5.5, 'w14', TRUE, '2000-06-28'), (90, 98, 6.0, 'w21', FALSE, '2000-07-09'), (91, 34, 0.0, 'w28', TRUE, '2000-07-20'), (92, 71, 0.5, 'w6', TRUE, '2000-07-31'), (93, 7, 1.0, 'w13', FALSE, '2000-08-11'), (94, 44, 1.5, 'w20', TRUE, '2000-08-22'), (95, 81, 2.0, 'w27', TRUE, '2000-09-02'), (96, 17, 2.5, 'w5', FALSE, '2000-09-13'), (97, 54, 3.0, 'w12', TRUE, '2000-09-24'), (98, 91, 3.5, 'w19', TRUE, '2000-10-05'), (99, 27, 4.0, 'w26', FALSE, '2000-10-16'), (100, 64, 4.5, 'w4', TRUE, '2000-10-27'), (101, 0, 5.0, 'w11', TRUE, '2000-11-07'), (102, 37, 5.5, 'w18', FALSE, '2000-11-18'), (103, 74, 6.0, 'w25', TRUE, '2000-11-29'), (104, 10, 0.0, 'w3', TRUE, '2000-12-10'), (105, 47, 0.5, 'w10', FALSE, '2000-12-21'), (106, 84, 1.0, 'w17', TRUE, '2001-01-01'), (107, 20, 1.5, 'w24', TRUE, '2001-01-12'), (108, 57, 2.0, 'w2', FALSE, '2001-01-23'), (109, 94, 2.5, 'w9', TRUE, '2001-02-03'), (110, 30, 3.0, 'w16', TRUE, '2000-01-11'), (111, 67, 3.5, 'w23', FALSE, '2000-01-22'), (112, 3, 4.0, 'w1', TRUE, '2000-02-02'), (113, 40, 4.5, 'w8', TRUE, '2000-02-13'), (114, 77, 5.0, 'w15', FALSE, '2000-02-24'), (115, 13, 5.5, 'w22', TRUE, '2000-03-06'), (116, 50, 6.0, 'w0', TRUE, '2000-03-17'), (117, 87, 0.0, 'w7', FALSE, '2000-03-28'), (118, 23, 0.5, 'w14', TRUE, '2000-04-08'), (119, 60, 1.0, 'w21', TRUE, '2000-04-19'), (120, 97, 1.5, 'w28', FALSE, '2000-04-30'), (121, 33, 2.0, 'w6', TRUE, '2000-05-11'), (122, 70, 2.5, 'w13', TRUE, '2000-05-22'), (123, 6, 3.0, 'w20', FALSE, '2000-06-02'), (124, 43, 3.5, 'w27', TRUE, '2000-06-13'), (125, 80, 4.0, 'w5', TRUE, '2000-06-24'), (126, 16, 4.5, 'w12', FALSE, '2000-07-05'), (127, 53, 5.0, 'w19', TRUE, '2000-07-16'), (128, 90, 5.5, 'w26', TRUE, '2000-07-27'), (129, 26, 6.0, 'w4', FALSE, '2000-08-07'), (130, 63, 0.0, 'w11', TRUE, '2000-08-18'), (131, 100, 0.5, 'w18', TRUE, '2000-08-29'), (132, 36, 1.0, 'w25', FALSE, '2000-09-09'), (133, 73, 1.5, 'w3', TRUE, '2000-09-20'), (134, 9, 2.0, 'w10', TRUE, '2000-10-01'), (135, 46, 2.5, 'w17', FALSE, '2000-10-12'), (136, 83, 3.0, 'w24', TRUE, '2000-10-23'), (137, 19, 3.5, 'w2', TRUE, '2000-11-03'), (138, 56, 4.0, 'w9', FALSE, '2000-11-14'), (139, 93, 4.5, 'w16', TRUE, '2000-11-25'), (140, 29, 5.0, 'w23', TRUE, '2000-12-06'), (141, 66, 5.5, 'w1', FALSE, '2000-12-17'), (142, 2, 6.0, 'w8', TRUE, '2000-12-28'), (143, 39, 0.0, 'w15', TRUE, '2001-01-08'), (144, 76, 0.5, 'w22', FALSE, '2001-01-19'), (145, 12, 1.0, 'w0', TRUE, '2001-01-30'), (146, 49, 1.5, 'w7', TRUE, '2000-01-07'), (147, 86, 2.0, 'w14', FALSE, '2000-01-18'), (148, 22, 2.5, 'w21', TRUE, '2000-01-29'), (149, 59, 3.0, 'w28', TRUE, '2000-02-09'), (150, 96, 3.5, 'w6', FALSE, '2000-02-20'), (151, 32, 4.0, 'w13', TRUE, '2000-03-02'), (152, 69, 4.5, 'w20', TRUE, '2000-03-13'), (153, 5, 5.0, 'w27', FALSE, '2000-03-24'), (154, 42, 5.5, 'w5', TRUE, '2000-04-04'), (155, 79, 6.0, 'w12', TRUE, '2000-04-15'), (156, 15, 0.0, 'w19', FALSE, '2000-04-26'), (157, 52, 0.5, 'w26', TRUE, '2000-05-07'), (158, 89, 1.0, 'w4', TRUE, '2000-05-18'), (159, 25, 1.5, 'w11', FALSE, '2000-05-29'), (160, 62, 2.0, 'w18', TRUE, '2000-06-09'), (161, 99, 2.5, 'w25', TRUE, '2000-06-20'), (162, 35, 3.0, 'w3', FALSE, '2000-07-01'), (163, 72, 3.5, 'w10', TRUE, '2000-07-12'), (164, 8, 4.0, 'w17', TRUE, '2000-07-23'), (165, 45, 4.5, 'w24', FALSE, '2000-08-03'), (166, 82, 5.0, 'w2', TRUE, '2000-08-14'), (167, 18, 5.5, 'w9', TRUE, '2000-08-25'), (168, 55, 6.0, 'w16', FALSE, '2000-09-05'), (169, 92, 0.0, 'w23', TRUE, '2000-09-16'), (170, 28, 0.5, 'w1', TRUE, '2000-09-27'), (171, 65, 1.0, 'w8', FALSE, '2000-10-08'), (172, 1, 1.5, 'w15', TRUE, '2000-10-19'), (173, 38, 2.0, 'w22', TRUE, '2000-10-30'), (174, 75, 2.5, 'w0', FALSE, '2000-11-10'), (175, 11, 3.0, 'w7', TRUE, '2000-11-21'), (176, 48, 3.5, 'w14', TRUE, '2000-12-02'), (177, 85, 4.0, 'w21', FALSE, '2000-12-13'), (178, 21, 4.5, 'w28', TRUE, '2000-12-24'), (179, 58, 5.0, 'w6', TRUE, '2001-01-04'), (180, 95, 5.5, 'w13', FALSE, '2001-01-15'), (181, 31, 6.0, 'w20', TRUE, '2001-01-26'), (182, 68, 0.0, 'w27', TRUE, '2000-01-03'), (183, 4, 0.5, 'w5', FALSE, '2000-01-14'), (184, 41, 1.0, 'w12', TRUE, '2000-01-25'), (185, 78, 1.5, 'w19', TRUE, '2000-02-05'), (186, 14, 2.0, 'w26', FALSE, '2000-02-16'), (187, 51, 2.5, 'w4', TRUE, '2000-02-27'), (188, 88, 3.0, 'w11', TRUE, '2000-03-09'), (189, 24, 3.5, 'w18', FALSE, '2000-03-20'), (190, 61, 4.0, 'w25', TRUE, '2000-03-31'), (191, 98, 4.5, 'w3', TRUE, '2000-04-11'), (192, 34, 5.0, 'w10', FALSE, '2000-04-22'), (193, 71, 5.5, 'w17', TRUE, '2000-05-03'), (194, 7, 6.0, 'w24', TRUE, '2000-05-14'), (195, 44, 0.0, 'w2', FALSE, '2000-05-25'), (196, 81, 0.5, 'w9', TRUE, '2000-06-05'), (197, 17, 1.0, 'w16', TRUE, '2000-06-16'), (198, 54, 1.5, 'w23', FALSE, '2000-06-27'), (199, 91, 2.0, 'w1', TRUE, '2000-07-08'), (200, 27, 2.5, 'w8', TRUE, '2000-07-19'), (201, 64, 3.0, 'w15', FALSE, '2000-07-30'), (202, 0, 3.5, 'w22', TRUE, '2000-08-10'), (203, 37, 4.0, 'w0', TRUE, '2000-08-21'), (204, 74, 4.5, 'w7', FALSE, '2000-09-01'), (205, 10, 5.0, 'w14', TRUE, '2000-09-12'), (206, 47, 5.5, 'w21', TRUE, '2000-09-23'), (207, 84, 6.0, 'w28', FALSE, '2000-10-04'), (208, 20, 0.0, 'w6', TRUE, '2000-10-15'), (209, 57, 0.5, 'w13', TRUE, '2000-10-26'), (210, 94, 1.0, 'w20', FALSE, '2000-11-06'), (211, 30, 1.5, 'w27', TRUE, '2000-11-17'), (212, 67, 2.0, 'w5', TRUE, '2000-11-28'), (213, 3, 2.5, 'w12', FALSE, '2000-12-09'), (214, 40, 3.0, 'w19', TRUE, '2000-12-20'), (215, 77, 3.5, 'w26', TRUE, '2000-12-31'), (216, 13, 4.0, 'w4', FALSE, '2001-01-11'), (217, 50, 4.5, 'w11', TRUE, '2001-01-22'), (218, 87, 5.0, 'w18', TRUE, '2001-02-02'), (219, 23, 5.5, 'w25', FALSE, '2000-01-10'), (220, 60, 6.0, 'w3', TRUE, '2000-01-21'), (221, 97, 0.0, 'w10', TRUE, '2000-02-01'), (222, 33, 0.5, 'w17', FALSE, '2000-02-12'), (223, 70, 1.0, 'w24', TRUE, '2000-02-23'), (224, 6, 1.5, 'w2', TRUE, '2000-03-05'), (225, 43, 2.0, 'w9', FALSE, '2000-03-16'), (226, 80, 2.5, 'w16', TRUE, '2000-03-27'), (227, 16, 3.0, 'w23', TRUE, '2000-04-07'), (228, 53, 3.5, 'w1', FALSE, '2000-04-18'), (229, 90, 4.0, 'w8', TRUE, '2000-04-29'), (230, 26, 4.5, 'w15', TRUE, '2000-05-10'), (231, 63, 5.0, 'w22', FALSE, '2000-05-21'), (232, 100, 5.5, 'w0', TRUE, '2000-06-01'), (233, 36, 6.0, 'w7', TRUE, '2000-06-12'), (234, 73, 0.0, 'w14', FALSE, '2000-06-23'), (235, 9, 0.5, 'w21', TRUE, '2000-07-04'), (236, 46, 1.0, 'w28', TRUE, '2000-07-15'), (237, 83, 1.5, 'w6', FALSE, '2000-07-26'), (238, 19, 2.0, 'w13', TRUE, '2000-08-06'), (239, 56, 2.5, 'w20', TRUE, '2000-08-17'), (240, 93, 3.0, 'w27', FALSE, '2000-08-28'), (241, 29, 3.5, 'w5', TRUE, '2000-09-08'), (242, 66, 4.0, 'w12', TRUE, '2000-09-19'), (243, 2, 4.5, 'w19', FALSE, '2000-09-30'), (244, 39, 5.0, 'w26', TRUE, '2000-10-11'), (245, 76, 5.5, 'w4', TRUE, '2000-10-22'), (246, 12, 6.0, 'w11', FALSE, '2000-11-02'), (247, 49, 0.0, 'w18', TRUE, '2000-11-13'), (248, 86, 0.5, 'w25', TRUE, '2000-11-24'), (249, 22, 1.0, 'w3', FALSE, '2000-12-05'), (250, 59, 1.5, 'w10', TRUE, '2000-12-16'), (251, 96, 2.0, 'w17', TRUE, '2000-12-27'), (252, 32, 2.5, 'w24', FALSE, '2001-01-07'), (253, 69, 3.0, 'w2', TRUE, '2001-01-18'), (254, 5, 3.5, 'w9', TRUE, '2001-01-29'), (255, 42, 4.0, 'w16', FALSE, '2000-01-06'), (256, 79, 4.5, 'w23', TRUE, '2000-01-17'), (257, 15, 5.0, 'w1', TRUE, '2000-01-28'), (258, 52, 5.5, 'w8', FALSE, '2000-02-08'), (259, 89, 6.0, 'w15', TRUE, '2000-02-19'), (260, 25, 0.0, 'w22', TRUE, '2000-03-01'), (261, 62, 0.5, 'w0', FALSE, '2000-03-12'), (262, 99, 1.0, 'w7', TRUE, '2000-03-23'), (263, 35, 1.5, 'w14', TRUE, '2000-04-03'), (264, 72, 2.0, 'w21', FALSE, '2000-04-14'), (265, 8, 2.5, 'w28', TRUE, '2000-04-25'), (266, 45, 3.0, 'w6', TRUE, '2000-05-06'), (267, 82, 3.5, 'w13', FALSE, '2000-05-17'), (268, 18, 4.0, 'w20', TRUE, '2000-05-28'), (269, 55, 4.5, 'w27', TRUE, '2000-06-08'), (270, 92, 5.0, 'w5', FALSE, '2000-06-19'), (271, 28, 5.5, 'w12', TRUE, '2000-06-30'), (272, 65, 6.0, 'w19', TRUE, '2000-07-11'), (273, 1, 0.0, 'w26', FALSE, '2000-07-22'), (274, 38, 0.5, 'w4', TRUE, '2000-08-02'), (275, 75, 1.0, 'w11', TRUE, '2000-08-13'), (276, 11, 1.5, 'w18', FALSE, '2000-08-24'), (277, 48, 2.0, 'w25', TRUE, '2000-09-04'), (278, 85, 2.5, 'w3', TRUE, '2000-09-15'), (279, 21, 3.0, 'w10', FALSE, '2000-09-26'), (280, 58, 3.5, 'w17', TRUE, '2000-10-07'), (281, 95, 4.0, 'w24', TRUE, '2000-10-18'), (282, 31, 4.5, 'w2', FALSE, '2000-10-29'), (283, 68, 5.0, 'w9', TRUE, '2000-11-09'), (284, 4, 5.5, 'w16', TRUE, '2000-11-20'), (285, 41, 6.0, 'w23', FALSE, '2000-12-01'), (286, 78, 0.0, 'w1', TRUE, '2000-12-12'), (287, 14, 0.5, 'w8', TRUE, '2000-12-23'), (288, 51, 1.0, 'w15', FALSE, '2001-01-03'), (289, 88, 1.5, 'w22', TRUE, '2001-01-14'), (290, 24, 2.0, 'w0', TRUE, '2001-01-25'), (291, 61, 2.5, 'w7', FALSE, '2000-01-02'), (292, 98, 3.0, 'w14', TRUE, '2000-01-13'), (293, 34, 3.5, 'w21', TRUE, '2000-01-24'), (294, 71, 4.0, 'w28', FALSE, '2000-02-04'), (295, 7, 4.5, 'w6', TRUE, '2000-02-15'), (296, 44, 5.0, 'w13', TRUE, '2000-02-26'), (297, 81, 5.5, 'w20', FALSE, '2000-03-08'), (298, 17, 6.0, 'w27', TRUE, '2000-03-19'), (299, 54, 0.0, 'w5', TRUE, '2000-03-30'), (300, 91, 0.5, 'w12', FALSE, '2000-04-10'), (301, 27, 1.0, 'w19', TRUE, '2000-04-21'), (302, 64, 1.5, 'w26', TRUE, '2000-05-02'), (303, 0, 2.0, 'w4', FALSE, '2000-05-13'), (304, 37, 2.5, 'w11', TRUE, '2000-05-24'), (305, 74, 3.0, 'w18', TRUE, '2000-06-04'), (306, 10, 3.5, 'w25', FALSE, '2000-06-15'), (307, 47, 4.0, 'w3', TRUE, '2000-06-26'), (308, 84, 4.5, 'w10', TRUE, '2000-07-07'), (309, 20, 5.0, 'w17', FALSE, '2000-07-18'), (310, 57, 5.5, 'w24', TRUE, '2000-07-29'), (311, 94, 6.0, 'w2', TRUE, '2000-08-09'), (312, 30, 0.0, 'w9', FALSE, '2000-08-20'), (313, 67, 0.5, 'w16', TRUE, '2000-08-31'), (314, 3, 1.0, 'w23', TRUE, '2000-09-11'), (315, 40, 1.5, 'w1', FALSE, '2000-09-22'), (316, 77, 2.0, 'w8', TRUE, '2000-10-03'), (317, 13, 2.5, 'w15', TRUE, '2000-10-14'), (318, 50, 3.0, 'w22', FALSE, '2000-10-25'), (319, 87, 3.5, 'w0', TRUE, '2000-11-05'), (320, 23, 4.0, 'w7', TRUE, '2000-11-16'), (321, 60, 4.5, 'w14', FALSE, '2000-11-27'), (322, 97, 5.0, 'w21', TRUE, '2000-12-08'), (323, 33, 5.5, 'w28', TRUE, '2000-12-19'), (324, 70, 6.0, 'w6', FALSE, '2000-12-30'), (325, 6, 0.0, 'w13', TRUE, '2001-01-10'), (326, 43, 0.5, 'w20', TRUE, '2001-01-21'), (327, 80, 1.0, 'w27', FALSE, '2001-02-01'), (328, 16, 1.5, 'w5', TRUE, '2000-01-09'), (329, 53, 2.0, 'w12', TRUE, '2000-01-20'), (330, 90, 2.5, 'w19', FALSE, '2000-01-31'), (331, 26, 3.0, 'w26', TRUE, '2000-02-11'), (332, 63, 3.5, 'w4', TRUE, '2000-02-22'), (333, 100, 4.0, 'w11', FALSE, '2000-03-04'), (334, 36, 4.5, 'w18', TRUE, '2000-03-15'), (335, 73, 5.0, 'w25', TRUE, '2000-03-26'), (336, 9, 5.5, 'w3', FALSE, '2000-04-06'), (337, 46, 6.0, 'w10', TRUE, '2000-04-17'), (338, 83, 0.0, 'w17', TRUE, '2000-04-28'), (339, 19, 0.5, 'w24', FALSE, '2000-05-09'), (340, 56, 1.0, 'w2', TRUE, '2000-05-20'), (341, 93, 1.5, 'w9', TRUE, '2000-05-31'), (342, 29, 2.0, 'w16', FALSE, '2000-06-11'), (343, 66, 2.5, 'w23', TRUE, '2000-06-22'), (344, 2, 3.0, 'w1', TRUE, '2000-07-03'), (345, 39, 3.5, 'w8', FALSE, '2000-07-14'), (346, 76, 4.0, 'w15', TRUE, '2000-07-25'), (347, 12, 4.5, 'w22', TRUE, '2000-08-05'), (348, 49, 5.0, 'w0', FALSE, '2000-08-16'), (349, 86, 5.5, 'w7', TRUE, '2000-08-27'), (350, 22, 6.0, 'w14', TRUE, '2000-09-07'), (351, 59, 0.0, 'w21', FALSE, '2000-09-18'), (352, 96, 0.5, 'w28', TRUE, '2000-09-29'), (353, 32, 1.0, 'w6', TRUE, '2000-10-10'), (354, 69, 1.5, 'w13', FALSE, '2000-10-21'), (355, 5, 2.0, 'w20', TRUE, '2000-11-01'), (356, 42, 2.5, 'w27', TRUE, '2000-11-12'), (357, 79, 3.0, 'w5', FALSE, '2000-11-23'), (358, 15, 3.5, 'w12', TRUE, '2000-12-04'), (359, 52, 4.0, 'w19', TRUE, '2000-12-15'), (360, 89, 4.5, 'w26', FALSE, '2000-12-26'), (361, 25, 5.0, 'w4', TRUE, '2001-01-06'), (362, 62, 5.5, 'w11', TRUE, '2001-01-17'), (363, 99, 6.0, 'w18', FALSE, '2001-01-28'), (364, 35, 0.0, 'w25', TRUE, '2000-01-05'), (365, 72, 0.5, 'w3', TRUE, '2000-01-16'), (366, 8, 1.0, 'w10', FALSE, '2000-01-27'), (367, 45, 1.5, 'w17', TRUE, '2000-02-07'), (368, 82, 2.0, 'w24', TRUE, '2000-02-18'), (369, 18, 2.5, 'w2', FALSE, '2000-02-29'), (370, 55, 3.0, 'w9', TRUE, '2000-03-11'), (371, 92, 3.5, 'w16', TRUE, '2000-03-22'), (372, 28, 4.0, 'w23', FALSE, '2000-04-02'), (373, 65, 4.5, 'w1', TRUE, '2000-04-13'), (374, 1, 5.0, 'w8', TRUE, '2000-04-24'), (375, 38, 5.5, 'w15', FALSE, '2000-05-05'), (376, 75, 6.0, 'w22', TRUE, '2000-05-16'), (377, 11, 0.0, 'w0', TRUE, '2000-05-27'), (378, 48, 0.5, 'w7', FALSE, '2000-06-07'), (379, 85, 1.0, 'w14', TRUE, '2000-06-18'), (380, 21, 1.5, 'w21', TRUE, '2000-06-29'), (381, 58, 2.0, 'w28', FALSE, '2000-07-10'), (382, 95, 2.5, 'w6', TRUE, '2000-07-21'), (383, 31, 3.0, 'w13', TRUE, '2000-08-01'), (384, 68, 3.5, 'w20', FALSE, '2000-08-12'), (385, 4, 4.0, 'w27', TRUE, '2000-08-23'), (386, 41, 4.5, 'w5', TRUE, '2000-09-03'), (387, 78, 5.0, 'w12', FALSE, '2000-09-14'), (388, 14, 5.5, 'w19', TRUE, '2000-09-25'), (389, 51, 6.0, 'w26', TRUE, '2000-10-06'), (390, 88, 0.0, 'w4', FALSE, '2000-10-17'), (391, 24, 0.5, 'w11', TRUE, '2000-10-28'), (392, 61, 1.0, 'w18', TRUE, '2000-11-08'), (393, 98, 1.5, 'w25', FALSE, '2000-11-19'), (394, 34, 2.0, 'w3', TRUE, '2000-11-30'), (395, 71, 2.5, 'w10', TRUE, '2000-12-11'), (396, 7, 3.0, 'w17', FALSE, '2000-12-22'), (397, 44, 3.5, 'w24', TRUE, '2001-01-02'), (398, 81, 4.0, 'w2', TRUE, '2001-01-13'), (399, 17, 4.5, 'w9', FALSE, '2001-01-24'), (400, 54, 5.0, 'w16', TRUE, '2000-01-01'), (401, 91, 5.5, 'w23', TRUE, '2000-01-12'), (402, 27, 6.0, 'w1', FALSE, '2000-01-23'), (403, 64, 0.0, 'w8', TRUE, '2000-02-03'), (404, 0, 0.5, 'w15', TRUE, '2000-02-14'), (405, 37, 1.0, 'w22', FALSE, '2000-02-25'), (406, 74, 1.5, 'w0', TRUE, '2000-03-07'), (407, 10, 2.0, 'w7', TRUE, '2000-03-18'), (408, 47, 2.5, 'w14', FALSE, '2000-03-29'), (409, 84, 3.0, 'w21', TRUE, '2000-04-09'), (410, 20, 3.5, 'w28', TRUE, '2000-04-20'), (411, 57, 4.0, 'w6', FALSE, '2000-05-01'), (412, 94, 4.5, 'w13', TRUE, '2000-05-12'), (413, 30, 5.0, 'w20', TRUE, '2000-05-23'), (414, 67, 5.5, 'w27', FALSE, '2000-06-03'), (415, 3, 6.0, 'w5', TRUE, '2000-06-14'), (416, 40, 0.0, 'w12', TRUE, '2000-06-25'), (417, 77, 0.5, 'w19', FALSE, '2000-07-06'), (418, 13, 1.0, 'w26', TRUE, '2000-07-17'), (419, 50, 1.5, 'w4', TRUE, '2000-07-28'), (420, 87, 2.0, 'w11', FALSE, '2000-08-08'), (421, 23, 2.5, 'w18', TRUE, '2000-08-19'), (422, 60, 3.0, 'w25', TRUE, '2000-08-30'), (423, 97, 3.5, 'w3', FALSE, '2000-09-10'), (424, 33, 4.0, 'w10', TRUE, '2000-09-21'), (425, 70, 4.5, 'w17', TRUE, '2000-10-02'), (426, 6, 5.0, 'w24', FALSE, '2000-10-13'), (427, 43, 5.5, 'w2', TRUE, '2000-10-24'), (428, 80, 6.0, 'w9', TRUE, '2000-11-04'), (429, 16, 0.0, 'w16', FALSE, '2000-11-15'), (430, 53, 0.5, 'w23', TRUE, '2000-11-26'), (431, 90, 1.0, 'w1', TRUE, '2000-12-07'), (432, 26, 1.5, 'w8', FALSE, '2000-12-18'), (433, 63, 2.0, 'w15', TRUE, '2000-12-29'), (434, 100, 2.5, 'w22', TRUE, '2001-01-09'), (435, 36, 3.0, 'w0', FALSE, '2001-01-20'), (436, 73, 3.5, 'w7', TRUE, '2001-01-31'), (437, 9, 4.0, 'w14', TRUE, '2000-01-08'), (438, 46, 4.5, 'w21', FALSE, '2000-01-19'), (439, 83, 5.0, 'w28', TRUE, '2000-01-30'), (440, 19, 5.5, 'w6', TRUE, '2000-02-10'), (441, 56, 6.0, 'w13', FALSE, '2000-02-21'), (442, 93, 0.0, 'w20', TRUE, '2000-03-03'), (443, 29, 0.5, 'w27', TRUE, '2000-03-14'), (444, 66, 1.0, 'w5', FALSE, '2000-03-25'), (445, 2, 1.5, 'w12', TRUE, '2000-04-05'), (446, 39, 2.0, 'w19', TRUE, '2000-04-16'), (447, 76, 2.5, 'w26', FALSE, '2000-04-27'), (448, 12, 3.0, 'w4', TRUE, '2000-05-08'), (449, 49, 3.5, 'w11', TRUE, '2000-05-19'), (450, 86, 4.0, 'w18', FALSE, '2000-05-30'), (451, 22, 4.5, 'w25', TRUE, '2000-06-10'), (452, 59, 5.0, 'w3', TRUE, '2000-06-21'), (453, 96, 5.5, 'w10', FALSE, '2000-07-02'), (454, 32, 6.0, 'w17', TRUE, '2000-07-13'), (455, 69, 0.0, 'w24', TRUE, '2000-07-24'), (456, 5, 0.5, 'w2', FALSE, '2000-08-04'), (457, 42, 1.0, 'w9', TRUE, '2000-08-15'), (458, 79, 1.5, 'w16', TRUE, '2000-08-26'), (459, 15, 2.0, 'w23', FALSE, '2000-09-06'), (460, 52, 2.5, 'w1', TRUE, '2000-09-17'), (461, 89, 3.0, 'w8', TRUE, '2000-09-28'), (462, 25, 3.5, 'w15', FALSE, '2000-10-09'), (463, 62, 4.0, 'w22', TRUE, '2000-10-20'), (464, 99, 4.5, 'w0', TRUE, '2000-10-31'), (465, 35, 5.0, 'w7', FALSE, '2000-11-11'), (466, 72, 5.5, 'w14', TRUE, '2000-11-22'), (467, 8, 6.0, 'w21', TRUE, '2000-12-03'), (468, 45, 0.0, 'w28', FALSE, '2000-12-14'), (469, 82, 0.5, 'w6', TRUE, '2000-12-25'), (470, 18, 1.0, 'w13', TRUE, '2001-01-05'), (471, 55, 1.5, 'w20', FALSE, '2001-01-16'), (472, 92, 2.0, 'w27', TRUE, '2001-01-27'), (473, 28, 2.5, 'w5', TRUE, '2000-01-04'), (474, 65, 3.0, 'w12', FALSE, '2000-01-15'), (475, 1, 3.5, 'w19', TRUE, '2000-01-26'), (476, 38, 4.0, 'w26', TRUE, '2000-02-06'), (477, 75, 4.5, 'w4', FALSE, '2000-02-17'), (478, 11, 5.0, 'w11', TRUE, '2000-02-28'), (479, 48, 5.5, 'w18', TRUE, '2000-03-10'), (480, 85, 6.0, 'w25', FALSE, '2000-03-21'), (481, 21, 0.0, 'w3', TRUE, '2000-04-01'), (482, 58, 0.5, 'w10', TRUE, '2000-04-12'), (483, 95, 1.0, 'w17', FALSE, '2000-04-23'), (484, 31, 1.5, 'w24', TRUE, '2000-05-04'), (485, 68, 2.0, 'w2', TRUE, '2000-05-15'), (486, 4, 2.5, 'w9', FALSE, '2000-05-26'), (487, 41, 3.0, 'w16', TRUE, '2000-06-06'), (488, 78, 3.5, 'w23', TRUE, '2000-06-17'), (489, 14, 4.0, 'w1', FALSE, '2000-06-28'), (490, 51, 4.5, 'w8', TRUE, '2000-07-09'), (491, 88, 5.0, 'w15', TRUE, '2000-07-20'), (492, 24, 5.5, 'w22', FALSE, '2000-07-31'), (493, 61, 6.0, 'w0', TRUE, '2000-08-11'), (494, 98, 0.0, 'w7', TRUE, '2000-08-22'), (495, 34, 0.5, 'w14', FALSE, '2000-09-02'), (496, 71, 1.0, 'w21', TRUE, '2000-09-13'), (497, 7, 1.5, 'w28', TRUE, '2000-09-24'), (498, 44, 2.0, 'w6', FALSE, '2000-10-05'), (499, 81, 2.5, 'w13', TRUE, '2000-10-16'), (500, 17, 3.0, 'w20', TRUE, '2000-10-27'), (501, 54, 3.5, 'w27', FALSE, '2000-11-07'), (502, 91, 4.0, 'w5', TRUE, '2000-11-18'), (503, 27, 4.5, 'w12', TRUE, '2000-11-29'), (504, 64, 5.0, 'w19', FALSE, '2000-12-10'), (505, 0, 5.5, 'w26', TRUE, '2000-12-21'), (506, 37, 6.0, 'w4', TRUE, '2001-01-01'), (507, 74, 0.0, 'w11', FALSE, '2001-01-12'), (508, 10, 0.5, 'w18', TRUE, '2001-01-23'), (509, 47, 1.0, 'w25', TRUE, '2001-02-03'), (510, 84, 1.5, 'w3', FALSE, '2000-01-11'), (511, 20, 2.0, 'w10', TRUE, '2000-01-22'), (512, 57, 2.5, 'w17', TRUE, '2000-02-02'), (513, 94, 3.0, 'w24', FALSE, '2000-02-13'), (514, 30, 3.5, 'w2', TRUE, '2000-02-24'), (515, 67, 4.0, 'w9', TRUE, '2000-03-06'), (516, 3, 4.5, 'w16', FALSE, '2000-03-17'), (517, 40, 5.0, 'w23', TRUE, '2000-03-28'), (518, 77, 5.5, 'w1', TRUE, '2000-04-08'), (519, 13, 6.0, 'w8', FALSE, '2000-04-19'), (520, 50, 0.0, 'w15', TRUE, '2000-04-30'), (521, 87, 0.5, 'w22', TRUE, '2000-05-11'), (522, 23, 1.0, 'w0', FALSE, '2000-05-22'), (523, 60, 1.5, 'w7', TRUE, '2000-06-02'), (524, 97, 2.0, 'w14', TRUE, '2000-06-13'), (525, 33, 2.5, 'w21', FALSE, '2000-06-24'), (526, 70, 3.0, 'w28', TRUE, '2000-07-05'), (527, 6, 3.5, 'w6', TRUE, '2000-07-16'), (528, 43, 4.0, 'w13', FALSE, '2000-07-27'), (529, 80, 4.5, 'w20', TRUE, '2000-08-07'), (530, 16, 5.0, 'w27', TRUE, '2000-08-18'), (531, 53, 5.5, 'w5', FALSE, '2000-08-29'), (532, 90, 6.0, 'w12', TRUE, '2000-09-09'), (533, 26, 0.0, 'w19', TRUE, '2000-09-20'), (534, 63, 0.5, 'w26', FALSE, '2000-10-01'), (535, 100, 1.0, 'w4', TRUE, '2000-10-12'), (536, 36, 1.5, 'w11', TRUE, '2000-10-23'), (537, 73, 2.0, 'w18', FALSE, '2000-11-03'), (538, 9, 2.5, 'w25', TRUE, '2000-11-14'), (539, 46, 3.0, 'w3', TRUE, '2000-11-25'), (540, 83, 3.5, 'w10', FALSE, '2000-12-06'), (541, 19, 4.0, 'w17', TRUE, '2000-12-17'), (542, 56, 4.5, 'w24', TRUE, '2000-12-28'), (543, 93, 5.0, 'w2', FALSE, '2001-01-08'), (544, 29, 5.5, 'w9', TRUE, '2001-01-19'), (545, 66, 6.0, 'w16', TRUE, '2001-01-30'), (546, 2, 0.0, 'w23', FALSE, '2000-01-07'), (547, 39, 0.5, 'w1', TRUE, '2000-01-18'), (548, 76, 1.0, 'w8', TRUE, '2000-01-29'), (549, 12, 1.5, 'w15', FALSE, '2000-02-09'), (550, 49, 2.0, 'w22', TRUE, '2000-02-20'), (551, 86, 2.5, 'w0', TRUE, '2000-03-02'), (552, 22, 3.0, 'w7', FALSE, '2000-03-13'), (553, 59, 3.5, 'w14', TRUE, '2000-03-24'), (554, 96, 4.0, 'w21', TRUE, '2000-04-04'), (555, 32, 4.5, 'w28', FALSE, '2000-04-15'), (556, 69, 5.0, 'w6', TRUE, '2000-04-26'), (557, 5, 5.5, 'w13', TRUE, '2000-05-07'), (558, 42, 6.0, 'w20', FALSE, '2000-05-18'), (559, 79, 0.0, 'w27', TRUE, '2000-05-29'), (560, 15, 0.5, 'w5', TRUE, '2000-06-09'), (561, 52, 1.0, 'w12', FALSE, '2000-06-20'), (562, 89, 1.5, 'w19', TRUE, '2000-07-01'), (563, 25, 2.0, 'w26', TRUE, '2000-07-12'), (564, 62, 2.5, 'w4', FALSE, '2000-07-23'), (565, 99, 3.0, 'w11', TRUE, '2000-08-03'), (566, 35, 3.5, 'w18', TRUE, '2000-08-14'), (567, 72, 4.0, 'w25', FALSE, '2000-08-25'), (568, 8, 4.5, 'w3', TRUE, '2000-09-05'), (569, 45, 5.0, 'w10', TRUE, '2000-09-16'), (570, 82, 5.5, 'w17', FALSE, '2000-09-27'), (571, 18, 6.0, 'w24', TRUE, '2000-10-08'), (572, 55, 0.0, 'w2', TRUE, '2000-10-19'), (573, 92, 0.5, 'w9', FALSE, '2000-10-30'), (574, 28, 1.0, 'w16', TRUE, '2000-11-10'), (575, 65, 1.5, 'w23', TRUE, '2000-11-21'), (576, 1, 2.0, 'w1', FALSE, '2000-12-02'), (577, 38, 2.5, 'w8', TRUE, '2000-12-13'), (578, 75, 3.0, 'w15', TRUE, '2000-12-24'), (579, 11, 3.5, 'w22', FALSE, '2001-01-04'), (580, 48, 4.0, 'w0', TRUE, '2001-01-15'), (581, 85, 4.5, 'w7', TRUE, '2001-01-26'), (582, 21, 5.0, 'w14', FALSE, '2000-01-03'), (583, 58, 5.5, 'w21', TRUE, '2000-01-14'), (584, 95, 6.0, 'w28', TRUE, '2000-01-25'), (585, 31, 0.0, 'w6', FALSE, '2000-02-05'), (586, 68, 0.5, 'w13', TRUE, '2000-02-16'), (587, 4, 1.0, 'w20', TRUE, '2000-02-27'), (588, 41, 1.5, 'w27', FALSE, '2000-03-09'), (589, 78, 2.0, 'w5', TRUE, '2000-03-20'), (590, 14, 2.5, 'w12', TRUE, '2000-03-31'), (591, 51, 3.0, 'w19', FALSE, '2000-04-11'), (592, 88, 3.5, 'w26', TRUE, '2000-04-22'), (593, 24, 4.0, 'w4', TRUE, '2000-05-03'), (594, 61, 4.5, 'w11', FALSE, '2000-05-14'), (595, 98, 5.0, 'w18', TRUE, '2000-05-25'), (596, 34, 5.5, 'w25', TRUE, '2000-06-05'), (597, 71, 6.0, 'w3', FALSE, '2000-06-16'), (598, 7, 0.0, 'w10', TRUE, '2000-06-27'), (599, 44, 0.5, 'w17', TRUE, '2000-07-08'), (600, 81, 1.0, 'w24', FALSE, '2000-07-19'), (601, 17, 1.5, 'w2', TRUE, '2000-07-30'), (602, 54, 2.0, 'w9', TRUE, '2000-08-10'), (603, 91, 2.5, 'w16', FALSE, '2000-08-21'), (604, 27, 3.0, 'w23', TRUE, '2000-09-01'), (605, 64, 3.5, 'w1', TRUE, '2000-09-12'), (606, 0, 4.0, 'w8', FALSE, '2000-09-23'), (607, 37, 4.5, 'w15', TRUE, '2000-10-04'), (608, 74, 5.0, 'w22', TRUE, '2000-10-15'), (609, 10, 5.5, 'w0', FALSE, '2000-10-26'), (610, 47, 6.0, 'w7', TRUE, '2000-11-06'), (611, 84, 0.0, 'w14', TRUE, '2000-11-17'), (612, 20, 0.5, 'w21', FALSE, '2000-11-28'), (613, 57, 1.0, 'w28', TRUE, '2000-12-09'), (614, 94, 1.5, 'w6', TRUE, '2000-12-20'), (615, 30, 2.0, 'w13', FALSE, '2000-12-31'), (616, 67, 2.5, 'w20', TRUE, '2001-01-11'), (617, 3, 3.0, 'w27', TRUE, '2001-01-22'), (618, 40, 3.5, 'w5', FALSE, '2001-02-02'), (619, 77, 4.0, 'w12', TRUE, '2000-01-10'), (620, 13, 4.5, 'w19', TRUE, '2000-01-21'), (621, 50, 5.0, 'w26', FALSE, '2000-02-01'), (622, 87, 5.5, 'w4', TRUE, '2000-02-12'), (623, 23, 6.0, 'w11', TRUE, '2000-02-23'), (624, 60, 0.0, 'w18', FALSE, '2000-03-05'), (625, 97, 0.5, 'w25', TRUE, '2000-03-16'), (626, 33, 1.0, 'w3', TRUE, '2000-03-27'), (627, 70, 1.5, 'w10', FALSE, '2000-04-07'), (628, 6, 2.0, 'w17', TRUE, '2000-04-18'), (629, 43, 2.5, 'w24', TRUE, '2000-04-29'), (630, 80, 3.0, 'w2', FALSE, '2000-05-10'), (631, 16, 3.5, 'w9', TRUE, '2000-05-21'), (632, 53, 4.0, 'w16', TRUE, '2000-06-01'), (633, 90, 4.5, 'w23', FALSE, '2000-06-12'), (634, 26, 5.0, 'w1', TRUE, '2000-06-23'), (635, 63, 5.5, 'w8', TRUE, '2000-07-04'), (636, 100, 6.0, 'w15', FALSE, '2000-07-15'), (637, 36, 0.0, 'w22', TRUE, '2000-07-26'), (638, 73, 0.5, 'w0', TRUE, '2000-08-06'), (639, 9, 1.0, 'w7', FALSE, '2000-08-17'), (640, 46, 1.5, 'w14', TRUE, '2000-08-28'), (641, 83, 2.0, 'w21', TRUE, '2000-09-08'), (642, 19, 2.5, 'w28', FALSE, '2000-09-19'), (643, 56, 3.0, 'w6', TRUE, '2000-09-30'), (644, 93, 3.5, 'w13', TRUE, '2000-10-11'), (645, 29, 4.0, 'w20', FALSE, '2000-10-22'), (646, 66, 4.5, 'w27', TRUE, '2000-11-02'), (647, 2, 5.0, 'w5', TRUE, '2000-11-13'), (648, 39, 5.5, 'w12', FALSE, '2000-11-24'), (649, 76, 6.0, 'w19', TRUE, '2000-12-05'), (650, 12, 0.0, 'w26', TRUE, '2000-12-16'), (651, 49, 0.5, 'w4', FALSE, '2000-12-27'), (652, 86, 1.0, 'w11', TRUE, '2001-01-07'), (653, 22, 1.5, 'w18', TRUE, '2001-01-18'), (654, 59, 2.0, 'w25', FALSE, '2001-01-29'), (655, 96, 2.5, 'w3', TRUE, '2000-01-06'), (656, 32, 3.0, 'w10', TRUE, '2000-01-17'), (657, 69, 3.5, 'w17', FALSE, '2000-01-28'), (658, 5, 4.0, 'w24', TRUE, '2000-02-08'), (659, 42, 4.5, 'w2', TRUE, '2000-02-19'), (660, 79, 5.0, 'w9', FALSE, '2000-03-01'), (661, 15, 5.5, 'w16', TRUE, '2000-03-12'), (662, 52, 6.0, 'w23', TRUE, '2000-03-23'), (663, 89, 0.0, 'w1', FALSE, '2000-04-03'), (664, 25, 0.5, 'w8', TRUE, '2000-04-14'), (665, 62, 1.0, 'w15', TRUE, '2000-04-25'), (666, 99, 1.5, 'w22', FALSE, '2000-05-06'), (667, 35, 2.0, 'w0', TRUE, '2000-05-17'), (668, 72, 2.5, 'w7', TRUE, '2000-05-28'), (669, 8, 3.0, 'w14', FALSE, '2000-06-08'), (670, 45, 3.5, 'w21', TRUE, '2000-06-19'), (671, 82, 4.0, 'w28', TRUE, '2000-06-30'), (672, 18, 4.5, 'w6', FALSE, '2000-07-11'), (673, 55, 5.0, 'w13', TRUE, '2000-07-22'), (674, 92, 5.5, 'w20', TRUE, '2000-08-02'), (675, 28, 6.0, 'w27', FALSE, '2000-08-13'), (676, 65, 0.0, 'w5', TRUE, '2000-08-24'), (677, 1, 0.5, 'w12', TRUE, '2000-09-04'), (678, 38, 1.0, 'w19', FALSE, '2000-09-15'), (679, 75, 1.5, 'w26', TRUE, '2000-09-26'), (680, 11, 2.0, 'w4', TRUE, '2000-10-07'), (681, 48, 2.5, 'w11', FALSE, '2000-10-18'), (682, 85, 3.0, 'w18', TRUE, '2000-10-29'), (683, 21, 3.5, 'w25', TRUE, '2000-11-09'), (684, 58, 4.0, 'w3', FALSE, '2000-11-20'), (685, 95, 4.5, 'w10', TRUE, '2000-12-01'), (686, 31, 5.0, 'w17', TRUE, '2000-12-12'), (687, 68, 5.5, 'w24', FALSE, '2000-12-23'), (688, 4, 6.0, 'w2', TRUE, '2001-01-03'), (689, 41, 0.0, 'w9', TRUE, '2001-01-14'), (690, 78, 0.5, 'w16', FALSE, '2001-01-25'), (691, 14, 1.0, 'w23', TRUE, '2000-01-02'), (692, 51, 1.5, 'w1', TRUE, '2000-01-13'), (693, 88, 2.0, 'w8', FALSE, '2000-01-24'), (694, 24, 2.5, 'w15', TRUE, '2000-02-04'), (695, 61, 3.0, 'w22', TRUE, '2000-02-15'), (696, 98, 3.5, 'w0', FALSE, '2000-02-26'), (697, 34, 4.0, 'w7', TRUE, '2000-03-08'), (698, 71, 4.5, 'w14', TRUE, '2000-03-19'), (699, 7, 5.0, 'w21', FALSE, '2000-03-30'), (700, 44, 5.5, 'w28', TRUE, '2000-04-10'), (701, 81, 6.0, 'w6', TRUE, '2000-04-21'), (702, 17, 0.0, 'w13', FALSE, '2000-05-02'), (703, 54, 0.5, 'w20', TRUE, '2000-05-13'), (704, 91, 1.0, 'w27', TRUE, '2000-05-24'), (705, 27, 1.5, 'w5', FALSE, '2000-06-04'), (706, 64, 2.0, 'w12', TRUE, '2000-06-15'), (707, 0, 2.5, 'w19', TRUE, '2000-06-26'), (708, 37, 3.0, 'w26', FALSE, '2000-07-07'), (709, 74, 3.5, 'w4', TRUE, '2000-07-18'), (710, 10, 4.0, 'w11', TRUE, '2000-07-29'), (711, 47, 4.5, 'w18', FALSE, '2000-08-09'), (712, 84, 5.0, 'w25', TRUE, '2000-08-20'), (713, 20, 5.5, 'w3', TRUE, '2000-08-31'), (714, 57, 6.0, 'w10', FALSE, '2000-09-11'), (715, 94, 0.0, 'w17', TRUE, '2000-09-22'), (716, 30, 0.5, 'w24', TRUE, '2000-10-03'), (717, 67, 1.0, 'w2', FALSE, '2000-10-14'), (718, 3, 1.5, 'w9', TRUE, '2000-10-25'), (719, 40, 2.0, 'w16', TRUE, '2000-11-05'), (720, 77, 2.5, 'w23', FALSE, '2000-11-16'), (721, 13, 3.0, 'w1', TRUE, '2000-11-27'), (722, 50, 3.5, 'w8', TRUE, '2000-12-08'), (723, 87, 4.0, 'w15', FALSE, '2000-12-19'), (724, 23, 4.5, 'w22', TRUE, '2000-12-30'), (725, 60, 5.0, 'w0', TRUE, '2001-01-10'), (726, 97, 5.5, 'w7', FALSE, '2001-01-21'), (727, 33, 6.0, 'w14', TRUE, '2001-02-01'), (728, 70, 0.0, 'w21', TRUE, '2000-01-09'), (729, 6, 0.5, 'w28', FALSE, '2000-01-20'), (730, 43, 1.0, 'w6', TRUE, '2000-01-31'), (731, 80, 1.5, 'w13', TRUE, '2000-02-11'), (732, 16, 2.0, 'w20', FALSE, '2000-02-22'), (733, 53, 2.5, 'w27', TRUE, '2000-03-04'), (734, 90, 3.0, 'w5', TRUE, '2000-03-15'), (735, 26, 3.5, 'w12', FALSE, '2000-03-26'), (736, 63, 4.0, 'w19', TRUE, '2000-04-06'), (737, 100, 4.5, 'w26', TRUE, '2000-04-17'), (738, 36, 5.0, 'w4', FALSE, '2000-04-28'), (739, 73, 5.5, 'w11', TRUE, '2000-05-09'), (740, 9, 6.0, 'w18', TRUE, '2000-05-20'), (741, 46, 0.0, 'w25', FALSE, '2000-05-31'), (742, 83, 0.5, 'w3', TRUE, '2000-06-11'), (743, 19, 1.0, 'w10', TRUE, '2000-06-22'), (744, 56, 1.5, 'w17', FALSE, '2000-07-03'), (745, 93, 2.0, 'w24', TRUE, '2000-07-14'), (746, 29, 2.5, 'w2', TRUE, '2000-07-25'), (747, 66, 3.0, 'w9', FALSE, '2000-08-05'), (748, 2, 3.5, 'w16', TRUE, '2000-08-16'), (749, 39, 4.0, 'w23', TRUE, '2000-08-27'), (750, 76, 4.5, 'w1', FALSE, '2000-09-07'), (751, 12, 5.0, 'w8', TRUE, '2000-09-18'), (752, 49, 5.5, 'w15', TRUE, '2000-09-29'), (753, 86, 6.0, 'w22', FALSE, '2000-10-10'), (754, 22, 0.0, 'w0', TRUE, '2000-10-21'), (755, 59, 0.5, 'w7', TRUE, '2000-11-01'), (756, 96, 1.0, 'w14', FALSE, '2000-11-12'), (757, 32, 1.5, 'w21', TRUE, '2000-11-23'), (758, 69, 2.0, 'w28', TRUE, '2000-12-04'), (759, 5, 2.5, 'w6', FALSE, '2000-12-15'), (760, 42, 3.0, 'w13', TRUE, '2000-12-26'), (761, 79, 3.5, 'w20', TRUE, '2001-01-06'), (762, 15, 4.0, 'w27', FALSE, '2001-01-17'), (763, 52, 4.5, 'w5', TRUE, '2001-01-28'), (764, 89, 5.0, 'w12', TRUE, '2000-01-05'), (765, 25, 5.5, 'w19', FALSE, '2000-01-16'), (766, 62, 6.0, 'w26', TRUE, '2000-01-27'), (767, 99, 0.0, 'w4', TRUE, '2000-02-07'), (768, 35, 0.5, 'w11', FALSE, '2000-02-18'), (769, 72, 1.0, 'w18', TRUE, '2000-02-29'), (770, 8, 1.5, 'w25', TRUE, '2000-03-11'), (771, 45, 2.0, 'w3', FALSE, '2000-03-22'), (772, 82, 2.5, 'w10', TRUE, '2000-04-02'), (773, 18, 3.0, 'w17', TRUE, '2000-04-13'), (774, 55, 3.5, 'w24', FALSE, '2000-04-24'), (775, 92, 4.0, 'w2', TRUE, '2000-05-05'), (776, 28, 4.5, 'w9', TRUE, '2000-05-16'), (777, 65, 5.0, 'w16', FALSE, '2000-05-27'), (778, 1, 5.5, 'w23', TRUE, '2000-06-07'), (779, 38, 6.0, 'w1', TRUE, '2000-06-18'), (780, 75, 0.0, 'w8', FALSE, '2000-06-29'), (781, 11, 0.5, 'w15', TRUE, '2000-07-10'), (782, 48, 1.0, 'w22', TRUE, '2000-07-21'), (783, 85, 1.5, 'w0', FALSE, '2000-08-01'), (784, 21, 2.0, 'w7', TRUE, '2000-08-12'), (785, 58, 2.5, 'w14', TRUE, '2000-08-23'), (786, 95, 3.0, 'w21', FALSE, '2000-09-03'), (787, 31, 3.5, 'w28', TRUE, '2000-09-14'), (788, 68, 4.0, 'w6', TRUE, '2000-09-25'), (789, 4, 4.5, 'w13', FALSE, '2000-10-06'), (790, 41, 5.0, 'w20', TRUE, '2000-10-17'), (791, 78, 5.5, 'w27', TRUE, '2000-10-28'), (792, 14, 6.0, 'w5', FALSE, '2000-11-08'), (793, 51, 0.0, 'w12', TRUE, '2000-11-19'), (794, 88, 0.5, 'w19', TRUE, '2000-11-30'), (795, 24, 1.0, 'w26', FALSE, '2000-12-11'), (796, 61, 1.5, 'w4', TRUE, '2000-12-22'), (797, 98, 2.0, 'w11', TRUE, '2001-01-02'), (798, 34, 2.5, 'w18', FALSE, '2001-01-13'), (799, 71, 3.0, 'w25', TRUE, '2001-01-24'), (800, 7, 3.5, 'w3', TRUE, '2000-01-01'), (801, 44, 4.0, 'w10', FALSE, '2000-01-12'), (802, 81, 4.5, 'w17', TRUE, '2000-01-23'), (803, 17, 5.0, 'w24', TRUE, '2000-02-03'), (804, 54, 5.5, 'w2', FALSE, '2000-02-14'), (805, 91, 6.0, 'w9', TRUE, '2000-02-25'), (806, 27, 0.0, 'w16', TRUE, '2000-03-07'), (807, 64, 0.5, 'w23', FALSE, '2000-03-18'), (808, 0, 1.0, 'w1', TRUE, '2000-03-29'), (809, 37, 1.5, 'w8', TRUE, '2000-04-09'), (810, 74, 2.0, 'w15', FALSE, '2000-04-20'), (811, 10, 2.5, 'w22', TRUE, '2000-05-01'), (812, 47, 3.0, 'w0', TRUE, '2000-05-12'), (813, 84, 3.5, 'w7', FALSE, '2000-05-23'), (814, 20, 4.0, 'w14', TRUE, '2000-06-03'), (815, 57, 4.5, 'w21', TRUE, '2000-06-14'), (816, 94, 5.0, 'w28', FALSE, '2000-06-25'), (817, 30, 5.5, 'w6', TRUE, '2000-07-06'), (818, 67, 6.0, 'w13', TRUE, '2000-07-17'), (819, 3, 0.0, 'w20', FALSE, '2000-07-28'), (820, 40, 0.5, 'w27', TRUE, '2000-08-08'), (821, 77, 1.0, 'w5', TRUE, '2000-08-19'), (822, 13, 1.5, 'w12', FALSE, '2000-08-30'), (823, 50, 2.0, 'w19', TRUE, '2000-09-10'), (824, 87, 2.5, 'w26', TRUE, '2000-09-21'), (825, 23, 3.0, 'w4', FALSE, '2000-10-02'), (826, 60, 3.5, 'w11', TRUE, '2000-10-13'), (827, 97, 4.0, 'w18', TRUE, '2000-10-24'), (828, 33, 4.5, 'w25', FALSE, '2000-11-04'), (829, 70, 5.0, 'w3', TRUE, '2000-11-15'), (830, 6, 5.5, 'w10', TRUE, '2000-11-26'), (831, 43, 6.0, 'w17', FALSE, '2000-12-07'), (832, 80, 0.0, 'w24', TRUE, '2000-12-18'), (833, 16, 0.5, 'w2', TRUE, '2000-12-29'), (834, 53, 1.0, 'w9', FALSE, '2001-01-09'), (835, 90, 1.5, 'w16', TRUE, '2001-01-20'), (836, 26, 2.0, 'w23', TRUE, '2001-01-31'), (837, 63, 2.5, 'w1', FALSE, '2000-01-08'), (838, 100, 3.0, 'w8', TRUE, '2000-01-19'), (839, 36, 3.5, 'w15', TRUE, '2000-01-30'), (840, 73, 4.0, 'w22', FALSE, '2000-02-10'), (841, 9, 4.5, 'w0', TRUE, '2000-02-21'), (842, 46, 5.0, 'w7', TRUE, '2000-03-03'), (843, 83, 5.5, 'w14', FALSE, '2000-03-14'), (844, 19, 6.0, 'w21', TRUE, '2000-03-25'), (845, 56, 0.0, 'w28', TRUE, '2000-04-05'), (846, 93, 0.5, 'w6', FALSE, '2000-04-16'), (847, 29, 1.0, 'w13', TRUE, '2000-04-27'), (848, 66, 1.5, 'w20', TRUE, '2000-05-08'), (849, 2, 2.0, 'w27', FALSE, '2000-05-19'), (850, 39, 2.5, 'w5', TRUE, '2000-05-30'), (851, 76, 3.0, 'w12', TRUE, '2000-06-10'), (852, 12, 3.5, 'w19', FALSE, '2000-06-21'), (853, 49, 4.0, 'w26', TRUE, '2000-07-02'), (854, 86, 4.5, 'w4', TRUE, '2000-07-13'), (855, 22, 5.0, 'w11', FALSE, '2000-07-24'), (856, 59, 5.5, 'w18', TRUE, '2000-08-04'), (857, 96, 6.0, 'w25', TRUE, '2000-08-15'), (858, 32, 0.0, 'w3', FALSE, '2000-08-26'), (859, 69, 0.5, 'w10', TRUE, '2000-09-06'), (860, 5, 1.0, 'w17', TRUE, '2000-09-17'), (861, 42, 1.5, 'w24', FALSE, '2000-09-28'), (862, 79, 2.0, 'w2', TRUE, '2000-10-09'), (863, 15, 2.5, 'w9', TRUE, '2000-10-20'), (864, 52, 3.0, 'w16', FALSE, '2000-10-31'), (865, 89, 3.5, 'w23', TRUE, '2000-11-11'), (866, 25, 4.0, 'w1', TRUE, '2000-11-22'), (867, 62, 4.5, 'w8', FALSE, '2000-12-03'), (868, 99, 5.0, 'w15', TRUE, '2000-12-14'), (869, 35, 5.5, 'w22', TRUE, '2000-12-25'), (870, 72, 6.0, 'w0', FALSE, '2001-01-05'), (871, 8, 0.0, 'w7', TRUE, '2001-01-16'), (872, 45, 0.5, 'w14', TRUE, '2001-01-27'), (873, 82, 1.0, 'w21', FALSE, '2000-01-04'), (874, 18, 1.5, 'w28', TRUE, '2000-01-15'), (875, 55, 2.0, 'w6', TRUE, '2000-01-26'), (876, 92, 2.5, 'w13', FALSE, '2000-02-06'), (877, 28, 3.0, 'w20', TRUE, '2000-02-17'), (878, 65, 3.5, 'w27', TRUE, '2000-02-28'), (879, 1, 4.0, 'w5', FALSE, '2000-03-10'), (880, 38, 4.5, 'w12', TRUE, '2000-03-21'), (881, 75, 5.0, 'w19', TRUE, '2000-04-01'), (882, 11, 5.5, 'w26', FALSE, '2000-04-12'), (883, 48, 6.0, 'w4', TRUE, '2000-04-23'), (884, 85, 0.0, 'w11', TRUE, '2000-05-04'), (885, 21, 0.5, 'w18', FALSE, '2000-05-15'), (886, 58, 1.0, 'w25', TRUE, '2000-05-26'), (887, 95, 1.5, 'w3', TRUE, '2000-06-06'), (888, 31, 2.0, 'w10', FALSE, '2000-06-17'), (889, 68, 2.5, 'w17', TRUE, '2000-06-28'), (890, 4, 3.0, 'w24', TRUE, '2000-07-09'), (891, 41, 3.5, 'w2', FALSE, '2000-07-20'), (892, 78, 4.0, 'w9', TRUE, '2000-07-31'), (893, 14, 4.5, 'w16', TRUE, '2000-08-11'), (894, 51, 5.0, 'w23', FALSE, '2000-08-22'), (895, 88, 5.5, 'w1', TRUE, '2000-09-02'), (896, 24, 6.0, 'w8', TRUE, '2000-09-13'), (897, 61, 0.0, 'w15', FALSE, '2000-09-24'), (898, 98, 0.5, 'w22', TRUE, '2000-10-05'), (899, 34, 1.0, 'w0', TRUE, '2000-10-16'), (900, 71, 1.5, 'w7', FALSE, '2000-10-27'), (901, 7, 2.0, 'w14', TRUE, '2000-11-07'), (902, 44, 2.5, 'w21', TRUE, '2000-11-18'), (903, 81, 3.0, 'w28', FALSE, '2000-11-29'), (904, 17, 3.5, 'w6', TRUE, '2000-12-10'), (905, 54, 4.0, 'w13', TRUE, '2000-12-21'), (906, 91, 4.5, 'w20', FALSE, '2001-01-01'), (907, 27, 5.0, 'w27', TRUE, '2001-01-12'), (908, 64, 5.5, 'w5', TRUE, '2001-01-23'), (909, 0, 6.0, 'w12', FALSE, '2001-02-03'), (910, 37, 0.0, 'w19', TRUE, '2000-01-11'), (911, 74, 0.5, 'w26', TRUE, '2000-01-22'), (912, 10, 1.0, 'w4', FALSE, '2000-02-02'), (913, 47, 1.5, 'w11', TRUE, '2000-02-13'), (914, 84, 2.0, 'w18', TRUE, '2000-02-24'), (915, 20, 2.5, 'w25', FALSE, '2000-03-06'), (916, 57, 3.0, 'w3', TRUE, '2000-03-17'), (917, 94, 3.5, 'w10', TRUE, '2000-03-28'), (918, 30, 4.0, 'w17', FALSE, '2000-04-08'), (919, 67, 4.5, 'w24', TRUE, '2000-04-19'), (920, 3, 5.0, 'w2', TRUE, '2000-04-30'), (921, 40, 5.5, 'w9', FALSE, '2000-05-11'), (922, 77, 6.0, 'w16', TRUE, '2000-05-22'), (923, 13, 0.0, 'w23', TRUE, '2000-06-02'), (924, 50, 0.5, 'w1', FALSE, '2000-06-13'), (925, 87, 1.0, 'w8', TRUE, '2000-06-24'), (926, 23, 1.5, 'w15', TRUE, '2000-07-05'), (927, 60, 2.0, 'w22', FALSE, '2000-07-16'), (928, 97, 2.5, 'w0', TRUE, '2000-07-27'), (929, 33, 3.0, 'w7', TRUE, '2000-08-07'), (930, 70, 3.5, 'w14', FALSE, '2000-08-18'), (931, 6, 4.0, 'w21', TRUE, '2000-08-29'), (932, 43, 4.5, 'w28', TRUE, '2000-09-09'), (933, 80, 5.0, 'w6', FALSE, '2000-09-20'), (934, 16, 5.5, 'w13', TRUE, '2000-10-01'), (935, 53, 6.0, 'w20', TRUE, '2000-10-12'), (936, 90, 0.0, 'w27', FALSE, '2000-10-23'), (937, 26, 0.5, 'w5', TRUE, '2000-11-03'), (938, 63, 1.0, 'w12', TRUE, '2000-11-14'), (939, 100, 1.5, 'w19', FALSE, '2000-11-25'), (940, 36, 2.0, 'w26', TRUE, '2000-12-06'), (941, 73, 2.5, 'w4', TRUE, '2000-12-17'), (942, 9, 3.0, 'w11', FALSE, '2000-12-28'), (943, 46, 3.5, 'w18', TRUE, '2001-01-08'), (944, 83, 4.0, 'w25', TRUE, '2001-01-19'), (945, 19, 4.5, 'w3', FALSE, '2001-01-30'), (946, 56, 5.0, 'w10', TRUE, '2000-01-07'), (947, 93, 5.5, 'w17', TRUE, '2000-01-18'), (948, 29, 6.0, 'w24', FALSE, '2000-01-29'), (949, 66, 0.0, 'w2', TRUE, '2000-02-09'), (950, 2, 0.5, 'w9', TRUE, '2000-02-20'), (951, 39, 1.0, 'w16', FALSE, '2000-03-02'), (952, 76, 1.5, 'w23', TRUE, '2000-03-13'), (953, 12, 2.0, 'w1', TRUE, '2000-03-24'), (954, 49, 2.5, 'w8', FALSE, '2000-04-04'), (955, 86, 3.0, 'w15', TRUE, '2000-04-15'), (956, 22, 3.5, 'w22', TRUE, '2000-04-26'), (957, 59, 4.0, 'w0', FALSE, '2000-05-07'), (958, 96, 4.5, 'w7', TRUE, '2000-05-18'), (959, 32, 5.0, 'w14', TRUE, '2000-05-29'), (960, 69, 5.5, 'w21', FALSE, '2000-06-09'), (961, 5, 6.0, 'w28', TRUE, '2000-06-20'), (962, 42, 0.0, 'w6', TRUE, '2000-07-01'), (963, 79, 0.5, 'w13', FALSE, '2000-07-12'), (964, 15, 1.0, 'w20', TRUE, '2000-07-23'), (965, 52, 1.5, 'w27', TRUE, '2000-08-03'), (966, 89, 2.0, 'w5', FALSE, '2000-08-14'), (967, 25, 2.5, 'w12', TRUE, '2000-08-25'), (968, 62, 3.0, 'w19', TRUE, '2000-09-05'), (969, 99, 3.5, 'w26', FALSE, '2000-09-16'), (970, 35, 4.0, 'w4', TRUE, '2000-09-27'), (971, 72, 4.5, 'w11', TRUE, '2000-10-08'), (972, 8, 5.0, 'w18', FALSE, '2000-10-19'), (973, 45, 5.5, 'w25', TRUE, '2000-10-30'), (974, 82, 6.0, 'w3', TRUE, '2000-11-10'), (975, 18, 0.0, 'w10', FALSE, '2000-11-21'), (976, 55, 0.5, 'w17', TRUE, '2000-12-02'), (977, 92, 1.0, 'w24', TRUE, '2000-12-13'), (978, 28, 1.5, 'w2', FALSE, '2000-12-24'), (979, 65, 2.0, 'w9', TRUE, '2001-01-04'), (980, 1, 2.5, 'w16', TRUE, '2001-01-15'), (981, 38, 3.0, 'w23', FALSE, '2001-01-26'), (982, 75, 3.5, 'w1', TRUE, '2000-01-03'), (983, 11, 4.0, 'w8', TRUE, '2000-01-14'), (984, 48, 4.5, 'w15', FALSE, '2000-01-25'), (985, 85, 5.0, 'w22', TRUE, '2000-02-05'), (986, 21, 5.5, 'w0', TRUE, '2000-02-16'), (987, 58, 6.0, 'w7', FALSE, '2000-02-27'), (988, 95, 0.0, 'w14', TRUE, '2000-03-09'), (989, 31, 0.5, 'w21', TRUE, '2000-03-20'), (990, 68, 1.0, 'w28', FALSE, '2000-03-31'), (991, 4, 1.5, 'w6', TRUE, '2000-04-11'), (992, 41, 2.0, 'w13', TRUE, '2000-04-22'), (993, 78, 2.5, 'w20', FALSE, '2000-05-03'), (994, 14, 3.0, 'w27', TRUE, '2000-05-14'), (995, 51, 3.5, 'w5', TRUE, '2000-05-25'), (996, 88, 4.0, 'w12', FALSE, '2000-06-05'), (997, 24, 4.5, 'w19', TRUE, '2000-06-16'), (998, 61, 5.0, 'w26', TRUE, '2000-06-27'), (999, 98, 5.5, 'w4', FALSE, '2000-07-08'), (1000, 34, 6.0, 'w11', TRUE, '2000-07-19'), (1001, 71, 0.0, 'w18', TRUE, '2000-07-30'), (1002, 7, 0.5, 'w25', FALSE, '2000-08-10'), (1003, 44, 1.0, 'w3', TRUE, '2000-08-21'), (1004, 81, 1.5, 'w10', TRUE, '2000-09-01'), (1005, 17, 2.0, 'w17', FALSE, '2000-09-12'), (1006, 54, 2.5, 'w24', TRUE, '2000-09-23'), (1007, 91, 3.0, 'w2', TRUE, '2000-10-04'), (1008, 27, 3.5, 'w9', FALSE, '2000-10-15'), (1009, 64, 4.0, 'w16', TRUE, '2000-10-26'), (1010, 0, 4.5, 'w23', TRUE, '2000-11-06'), (1011, 37, 5.0, 'w1', FALSE, '2000-11-17'), (1012, 74, 5.5, 'w8', TRUE, '2000-11-28'), (1013, 10, 6.0, 'w15', TRUE, '2000-12-09'), (1014, 47, 0.0, 'w22', FALSE, '2000-12-20'), (1015, 84, 0.5, 'w0', TRUE, '2000-12-31'), (1016, 20, 1.0, 'w7', TRUE, '2001-01-11'), (1017, 57, 1.5, 'w14', FALSE, '2001-01-22'), (1018, 94, 2.0, 'w21', TRUE, '2001-02-02'), (1019, 30, 2.5, 'w28', TRUE, '2000-01-10'), (1020, 67, 3.0, 'w6', FALSE, '2000-01-21'), (1021, 3, 3.5, 'w13', TRUE, '2000-02-01'), (1022, 40, 4.0, 'w20', TRUE, '2000-02-12'), (1023, 77, 4.5, 'w27', FALSE, '2000-02-23'), (1024, 13, 5.0, 'w5', TRUE, '2000-03-05'), (1025, 50, 5.5, 'w12', TRUE, '2000-03-16'), (1026, 87, 6.0, 'w19', FALSE, '2000-03-27'), (1027, 23, 0.0, 'w26', TRUE, '2000-04-07'), (1028, 60, 0.5, 'w4', TRUE, '2000-04-18'), (1029, 97, 1.0, 'w11', FALSE, '2000-04-29'), (1030, 33, 1.5, 'w18', TRUE, '2000-05-10'), (1031, 70, 2.0, 'w25', TRUE, '2000-05-21'), (1032, 6, 2.5, 'w3', FALSE, '2000-06-01'), (1033, 43, 3.0, 'w10', TRUE, '2000-06-12'), (1034, 80, 3.5, 'w17', TRUE, '2000-06-23'), (1035, 16, 4.0, 'w24', FALSE, '2000-07-04'), (1036, 53, 4.5, 'w2', TRUE, '2000-07-15'), (1037, 90, 5.0, 'w9', TRUE, '2000-07-26'), (1038, 26, 5.5, 'w16', FALSE, '2000-08-06'), (1039, 63, 6.0, 'w23', TRUE, '2000-08-17'), (1040, 100, 0.0, 'w1', TRUE, '2000-08-28'), (1041, 36, 0.5, 'w8', FALSE, '2000-09-08'), (1042, 73, 1.0, 'w15', TRUE, '2000-09-19'), (1043, 9, 1.5, 'w22', TRUE, '2000-09-30'), (1044, 46, 2.0, 'w0', FALSE, '2000-10-11'), (1045, 83, 2.5, 'w7', TRUE, '2000-10-22'), (1046, 19, 3.0, 'w14', TRUE, '2000-11-02'), (1047, 56, 3.5, 'w21', FALSE, '2000-11-13'), (1048, 93, 4.0, 'w28', TRUE, '2000-11-24'), (1049, 29, 4.5, 'w6', TRUE, '2000-12-05'), (1050, 66, 5.0, 'w13', FALSE, '2000-12-16'), (1051, 2, 5.5, 'w20', TRUE, '2000-12-27'), (1052, 39, 6.0, 'w27', TRUE, '2001-01-07'), (1053, 76, 0.0, 'w5', FALSE, '2001-01-18'), (1054, 12, 0.5, 'w12', TRUE, '2001-01-29'), (1055, 49, 1.0, 'w19', TRUE, '2000-01-06'), (1056, 86, 1.5, 'w26', FALSE, '2000-01-17'), (1057, 22, 2.0, 'w4', TRUE, '2000-01-28'), (1058, 59, 2.5, 'w11', TRUE, '2000-02-08'), (1059, 96, 3.0, 'w18', FALSE, '2000-02-19'), (1060, 32, 3.5, 'w25', TRUE, '2000-03-01'), (1061, 69, 4.0, 'w3', TRUE, '2000-03-12'), (1062, 5, 4.5, 'w10', FALSE, '2000-03-23'), (1063, 42, 5.0, 'w17', TRUE, '2000-04-03'), (1064, 79, 5.5, 'w24', TRUE, '2000-04-14'), (1065, 15, 6.0, 'w2', FALSE, '2000-04-25'), (1066, 52, 0.0, 'w9', TRUE, '2000-05-06'), (1067, 89, 0.5, 'w16', TRUE, '2000-05-17'), (1068, 25, 1.0, 'w23', FALSE, '2000-05-28'), (1069, 62, 1.5, 'w1', TRUE, '2000-06-08'), (1070, 99, 2.0, 'w8', TRUE, '2000-06-19'), (1071, 35, 2.5, 'w15', FALSE, '2000-06-30'), (1072, 72, 3.0, 'w22', TRUE, '2000-07-11'), (1073, 8, 3.5, 'w0', TRUE, '2000-07-22'), (1074, 45, 4.0, 'w7', FALSE, '2000-08-02'), (1075, 82, 4.5, 'w14', TRUE, '2000-08-13'), (1076, 18, 5.0, 'w21', TRUE, '2000-08-24'), (1077, 55, 5.5, 'w28', FALSE, '2000-09-04'), (1078, 92, 6.0, 'w6', TRUE, '2000-09-15'), (1079, 28, 0.0, 'w13', TRUE, '2000-09-26'), (1080, 65, 0.5, 'w20', FALSE, '2000-10-07'), (1081, 1, 1.0, 'w27', TRUE, '2000-10-18'), (1082, 38, 1.5, 'w5', TRUE, '2000-10-29'), (1083, 75, 2.0, 'w12', FALSE, '2000-11-09'), (1084, 11, 2.5, 'w19', TRUE, '2000-11-20'), (1085, 48, 3.0, 'w26', TRUE, '2000-12-01'), (1086, 85, 3.5, 'w4', FALSE, '2000-12-12'), (1087, 21, 4.0, 'w11', TRUE, '2000-12-23'), (1088, 58, 4.5, 'w18', TRUE, '2001-01-03'), (1089, 95, 5.0, 'w25', FALSE, '2001-01-14'), (1090, 31, 5.5, 'w3', TRUE, '2001-01-25'), (1091, 68, 6.0, 'w10', TRUE, '2000-01-02'), (1092, 4, 0.0, 'w17', FALSE, '2000-01-13'), (1093, 41, 0.5, 'w24', TRUE, '2000-01-24'), (1094, 78, 1.0, 'w2', TRUE, '2000-02-04'), (1095, 14, 1.5, 'w9', FALSE, '2000-02-15'), (1096, 51, 2.0, 'w16', TRUE, '2000-02-26'), (1097, 88, 2.5, 'w23', TRUE, '2000-03-08'), (1098, 24, 3.0, 'w1', FALSE, '2000-03-19'), (1099, 61, 3.5, 'w8', TRUE, '2000-03-30'), (1100, 98, 4.0, 'w15', TRUE, '2000-04-10'), (1101, 34, 4.5, 'w22', FALSE, '2000-04-21'), (1102, 71, 5.0, 'w0', TRUE, '2000-05-02'), (1103, 7, 5.5, 'w7', TRUE, '2000-05-13'), (1104, 44, 6.0, 'w14', FALSE, '2000-05-24'), (1105, 81, 0.0, 'w21', TRUE, '2000-06-04'), (1106, 17, 0.5, 'w28', TRUE, '2000-06-15'), (1107, 54, 1.0, 'w6', FALSE, '2000-06-26'), (1108, 91, 1.5, 'w13', TRUE, '2000-07-07'), (1109, 27, 2.0, 'w20', TRUE, '2000-07-18'), (1110, 64, 2.5, 'w27', FALSE, '2000-07-29'), (1111, 0, 3.0, 'w5', TRUE, '2000-08-09'), (1112, 37, 3.5, 'w12', TRUE, '2000-08-20'), (1113, 74, 4.0, 'w19', FALSE, '2000-08-31'), (1114, 10, 4.5, 'w26', TRUE, '2000-09-11'), (1115, 47, 5.0, 'w4', TRUE, '2000-09-22'), (1116, 84, 5.5, 'w11', FALSE, '2000-10-03'), (1117, 20, 6.0, 'w18', TRUE, '2000-10-14'), (1118, 57, 0.0, 'w25', TRUE, '2000-10-25'), (1119, 94, 0.5, 'w3', FALSE, '2000-11-05'), (1120, 30, 1.0, 'w10', TRUE, '2000-11-16'), (1121, 67, 1.5, 'w17', TRUE, '2000-11-27'), (1122, 3, 2.0, 'w24', FALSE, '2000-12-08'), (1123, 40, 2.5, 'w2', TRUE, '2000-12-19'), (1124, 77, 3.0, 'w9', TRUE, '2000-12-30'), (1125, 13, 3.5, 'w16', FALSE, '2001-01-10'), (1126, 50, 4.0, 'w23', TRUE, '2001-01-21'), (1127, 87, 4.5, 'w1', TRUE, '2001-02-01'), (1128, 23, 5.0, 'w8', FALSE, '2000-01-09'), (1129, 60, 5.5, 'w15', TRUE, '2000-01-20'), (1130, 97, 6.0, 'w22', TRUE, '2000-01-31'), (1131, 33, 0.0, 'w0', FALSE, '2000-02-11'), (1132, 70, 0.5, 'w7', TRUE, '2000-02-22'), (1133, 6, 1.0, 'w14', TRUE, '2000-03-04'), (1134, 43, 1.5, 'w21', FALSE, '2000-03-15'), (1135, 80, 2.0, 'w28', TRUE, '2000-03-26'), (1136, 16, 2.5, 'w6', TRUE, '2000-04-06'), (1137, 53, 3.0, 'w13', FALSE, '2000-04-17'), (1138, 90, 3.5, 'w20', TRUE, '2000-04-28'), (1139, 26, 4.0, 'w27', TRUE, '2000-05-09'), (1140, 63, 4.5, 'w5', FALSE, '2000-05-20'), (1141, 100, 5.0, 'w12', TRUE, '2000-05-31'), (1142, 36, 5.5, 'w19', TRUE, '2000-06-11'), (1143, 73, 6.0, 'w26', FALSE, '2000-06-22'), (1144, 9, 0.0, 'w4', TRUE, '2000-07-03'), (1145, 46, 0.5, 'w11', TRUE, '2000-07-14'), (1146, 83, 1.0, 'w18', FALSE, '2000-07-25'), (1147, 19, 1.5, 'w25', TRUE, '2000-08-05'), (1148, 56, 2.0, 'w3', TRUE, '2000-08-16'), (1149, 93, 2.5, 'w10', FALSE, '2000-08-27'), (1150, 29, 3.0, 'w17', TRUE, '2000-09-07'), (1151, 66, 3.5, 'w24', TRUE, '2000-09-18'), (1152, 2, 4.0, 'w2', FALSE, '2000-09-29'), (1153, 39, 4.5, 'w9', TRUE, '2000-10-10'), (1154, 76, 5.0, 'w16', TRUE, '2000-10-21'), (1155, 12, 5.5, 'w23', FALSE, '2000-11-01'), (1156, 49, 6.0, 'w1', TRUE, '2000-11-12'), (1157, 86, 0.0, 'w8', TRUE, '2000-11-23'), (1158, 22, 0.5, 'w15', FALSE, '2000-12-04'), (1159, 59, 1.0, 'w22', TRUE, '2000-12-15'), (1160, 96, 1.5, 'w0', TRUE, '2000-12-26'), (1161, 32, 2.0, 'w7', FALSE, '2001-01-06'), (1162, 69, 2.5, 'w14', TRUE, '2001-01-17'), (1163, 5, 3.0, 'w21', TRUE, '2001-01-28'), (1164, 42, 3.5, 'w28', FALSE, '2000-01-05'), (1165, 79, 4.0, 'w6', TRUE, '2000-01-16'), (1166, 15, 4.5, 'w13', TRUE, '2000-01-27'), (1167, 52, 5.0, 'w20', FALSE, '2000-02-07'), (1168, 89, 5.5, 'w27', TRUE, '2000-02-18'), (1169, 25, 6.0, 'w5', TRUE, '2000-02-29'), (1170, 62, 0.0, 'w12', FALSE, '2000-03-11'), (1171, 99, 0.5, 'w19', TRUE, '2000-03-22'), (1172, 35, 1.0, 'w26', TRUE, '2000-04-02'), (1173, 72, 1.5, 'w4', FALSE, '2000-04-13'), (1174, 8, 2.0, 'w11', TRUE, '2000-04-24'), (1175, 45, 2.5, 'w18', TRUE, '2000-05-05'), (1176, 82, 3.0, 'w25', FALSE, '2000-05-16'), (1177, 18, 3.5, 'w3', TRUE, '2000-05-27'), (1178, 55, 4.0, 'w10', TRUE, '2000-06-07'), (1179, 92, 4.5, 'w17', FALSE, '2000-06-18'), (1180, 28, 5.0, 'w24', TRUE, '2000-06-29'), (1181, 65, 5.5, 'w2', TRUE, '2000-07-10'), (1182, 1, 6.0, 'w9', FALSE, '2000-07-21'), (1183, 38, 0.0, 'w16', TRUE, '2000-08-01'), (1184, 75, 0.5, 'w23', TRUE, '2000-08-12'), (1185, 11, 1.0, 'w1', FALSE, '2000-08-23'), (1186, 48, 1.5, 'w8', TRUE, '2000-09-03'), (1187, 85, 2.0, 'w15', TRUE, '2000-09-14'), (1188, 21, 2.5, 'w22', FALSE, '2000-09-25'), (1189, 58, 3.0, 'w0', TRUE, '2000-10-06'), (1190, 95, 3.5, 'w7', TRUE, '2000-10-17'), (1191, 31, 4.0, 'w14', FALSE, '2000-10-28'), (1192, 68, 4.5, 'w21', TRUE, '2000-11-08'), (1193, 4, 5.0, 'w28', TRUE, '2000-11-19'), (1194, 41, 5.5, 'w6', FALSE, '2000-11-30'), (1195, 78, 6.0, 'w13', TRUE, '2000-12-11'), (1196, 14, 0.0, 'w20', TRUE, '2000-12-22'), (1197, 51, 0.5, 'w27', FALSE, '2001-01-02'), (1198, 88, 1.0, 'w5', TRUE, '2001-01-13'), (1199, 24, 1.5, 'w12', TRUE, '2001-01-24'), (1200, 61, 2.0, 'w19', FALSE, '2000-01-01'), (1201, 98, 2.5, 'w26', TRUE, '2000-01-12'), (1202, 34, 3.0, 'w4', TRUE, '2000-01-23'), (1203, 71, 3.5, 'w11', FALSE, '2000-02-03'), (1204, 7, 4.0, 'w18', TRUE, '2000-02-14'), (1205, 44, 4.5, 'w25', TRUE, '2000-02-25'), (1206, 81, 5.0, 'w3', FALSE, '2000-03-07'), (1207, 17, 5.5, 'w10', TRUE, '2000-03-18'), (1208, 54, 6.0, 'w17', TRUE, '2000-03-29'), (1209, 91, 0.0, 'w24', FALSE, '2000-04-09'), (1210, 27, 0.5, 'w2', TRUE, '2000-04-20'), (1211, 64, 1.0, 'w9', TRUE, '2000-05-01'), (1212, 0, 1.5, 'w16', FALSE, '2000-05-12'), (1213, 37, 2.0, 'w23', TRUE, '2000-05-23'), (1214, 74, 2.5, 'w1', TRUE, '2000-06-03'), (1215, 10, 3.0, 'w8', FALSE, '2000-06-14'), (1216, 47, 3.5, 'w15', TRUE, '2000-06-25'), (1217, 84, 4.0, 'w22', TRUE, '2000-07-06'), (1218, 20, 4.5, 'w0', FALSE, '2000-07-17'), (1219, 57, 5.0, 'w7', TRUE, '2000-07-28'), (1220, 94, 5.5, 'w14', TRUE, '2000-08-08'), (1221, 30, 6.0, 'w21', FALSE, '2000-08-19'), (1222, 67, 0.0, 'w28', TRUE, '2000-08-30'), (1223, 3, 0.5, 'w6', TRUE, '2000-09-10'), (1224, 40, 1.0, 'w13', FALSE, '2000-09-21'), (1225, 77, 1.5, 'w20', TRUE, '2000-10-02'), (1226, 13, 2.0, 'w27', TRUE, '2000-10-13'), (1227, 50, 2.5, 'w5', FALSE, '2000-10-24'), (1228, 87, 3.0, 'w12', TRUE, '2000-11-04'), (1229, 23, 3.5, 'w19', TRUE, '2000-11-15'), (1230, 60, 4.0, 'w26', FALSE, '2000-11-26'), (1231, 97, 4.5, 'w4', TRUE, '2000-12-07'), (1232, 33, 5.0, 'w11', TRUE, '2000-12-18'), (1233, 70, 5.5, 'w18', FALSE, '2000-12-29'), (1234, 6, 6.0, 'w25', TRUE, '2001-01-09'), (1235, 43, 0.0, 'w3', TRUE, '2001-01-20'), (1236, 80, 0.5, 'w10', FALSE, '2001-01-31'), (1237, 16, 1.0, 'w17', TRUE, '2000-01-08'), (1238, 53, 1.5, 'w24', TRUE, '2000-01-19'), (1239, 90, 2.0, 'w2', FALSE, '2000-01-30'), (1240, 26, 2.5, 'w9', TRUE, '2000-02-10'), (1241, 63, 3.0, 'w16', TRUE, '2000-02-21'), (1242, 100, 3.5, 'w23', FALSE, '2000-03-03'), (1243, 36, 4.0, 'w1', TRUE, '2000-03-14'), (1244, 73, 4.5, 'w8', TRUE, '2000-03-25'), (1245, 9, 5.0, 'w15', FALSE, '2000-04-05'), (1246, 46, 5.5, 'w22', TRUE, '2000-04-16'), (1247, 83, 6.0, 'w0', TRUE, '2000-04-27'), (1248, 19, 0.0, 'w7', FALSE, '2000-05-08'), (1249, 56, 0.5, 'w14', TRUE, '2000-05-19'), (1250, 93, 1.0, 'w21', TRUE, '2000-05-30'), (1251, 29, 1.5, 'w28', FALSE, '2000-06-10'), (1252, 66, 2.0, 'w6', TRUE, '2000-06-21'), (1253, 2, 2.5, 'w13', TRUE, '2000-07-02'), (1254, 39, 3.0, 'w20', FALSE, '2000-07-13'), (1255, 76, 3.5, 'w27', TRUE, '2000-07-24'), (1256, 12, 4.0, 'w5', TRUE, '2000-08-04'), (1257, 49, 4.5, 'w12', FALSE, '2000-08-15'), (1258, 86, 5.0, 'w19', TRUE, '2000-08-26'), (1259, 22, 5.5, 'w26', TRUE, '2000-09-06'), (1260, 59, 6.0, 'w4', FALSE, '2000-09-17'), (1261, 96, 0.0, 'w11', TRUE, '2000-09-28'), (1262, 32, 0.5, 'w18', TRUE, '2000-10-09'), (1263, 69, 1.0, 'w25', FALSE, '2000-10-20'), (1264, 5, 1.5, 'w3', TRUE, '2000-10-31'), (1265, 42, 2.0, 'w10', TRUE, '2000-11-11'), (1266, 79, 2.5, 'w17', FALSE, '2000-11-22'), (1267, 15, 3.0, 'w24', TRUE, '2000-12-03'), (1268, 52, 3.5, 'w2', TRUE, '2000-12-14'), (1269, 89, 4.0, 'w9', FALSE, '2000-12-25'), (1270, 25, 4.5, 'w16', TRUE, '2001-01-05'), (1271, 62, 5.0, 'w23', TRUE, '2001-01-16'), (1272, 99, 5.5, 'w1', FALSE, '2001-01-27'), (1273, 35, 6.0, 'w8', TRUE, '2000-01-04'), (1274, 72, 0.0, 'w15', TRUE, '2000-01-15'), (1275, 8, 0.5, 'w22', FALSE, '2000-01-26'), (1276, 45, 1.0, 'w0', TRUE, '2000-02-06'), (1277, 82, 1.5, 'w7', TRUE, '2000-02-17'), (1278, 18, 2.0, 'w14', FALSE, '2000-02-28'), (1279, 55, 2.5, 'w21', TRUE, '2000-03-10'), (1280, 92, 3.0, 'w28', TRUE, '2000-03-21'), (1281, 28, 3.5, 'w6', FALSE, '2000-04-01'), (1282, 65, 4.0, 'w13', TRUE, '2000-04-12'), (1283, 1, 4.5, 'w20', TRUE, '2000-04-23'), (1284, 38, 5.0, 'w27', FALSE, '2000-05-04'), (1285, 75, 5.5, 'w5', TRUE, '2000-05-15'), (1286, 11, 6.0, 'w12', TRUE, '2000-05-26'), (1287, 48, 0.0, 'w19', FALSE, '2000-06-06'), (1288, 85, 0.5, 'w26', TRUE, '2000-06-17'), (1289, 21, 1.0, 'w4', TRUE, '2000-06-28'), (1290, 58, 1.5, 'w11', FALSE, '2000-07-09'), (1291, 95, 2.0, 'w18', TRUE, '2000-07-20'), (1292, 31, 2.5, 'w25', TRUE, '2000-07-31'), (1293, 68, 3.0, 'w3', FALSE, '2000-08-11'), (1294, 4, 3.5, 'w10', TRUE, '2000-08-22'), (1295, 41, 4.0, 'w17', TRUE, '2000-09-02'), (1296, 78, 4.5, 'w24', FALSE, '2000-09-13'), (1297, 14, 5.0, 'w2', TRUE, '2000-09-24'), (1298, 51, 5.5, 'w9', TRUE, '2000-10-05'), (1299, 88, 6.0, 'w16', FALSE, '2000-10-16'), (1300, 24, 0.0, 'w23', TRUE, '2000-10-27'), (1301, 61, 0.5, 'w1', TRUE, '2000-11-07'), (1302, 98, 1.0, 'w8', FALSE, '2000-11-18'), (1303, 34, 1.5, 'w15', TRUE, '2000-11-29'), (1304, 71, 2.0, 'w22', TRUE, '2000-12-10'), (1305, 7, 2.5, 'w0', FALSE, '2000-12-21'), (1306, 44, 3.0, 'w7', TRUE, '2001-01-01'), (1307, 81, 3.5, 'w14', TRUE, '2001-01-12'), (1308, 17, 4.0, 'w21', FALSE, '2001-01-23'), (1309, 54, 4.5, 'w28', TRUE, '2001-02-03'), (1310, 91, 5.0, 'w6', TRUE, '2000-01-11'), (1311, 27, 5.5, 'w13', FALSE, '2000-01-22'), (1312, 64, 6.0, 'w20', TRUE, '2000-02-02'), (1313, 0, 0.0, 'w27', TRUE, '2000-02-13'), (1314, 37, 0.5, 'w5', FALSE, '2000-02-24'), (1315, 74, 1.0, 'w12', TRUE, '2000-03-06'), (1316, 10, 1.5, 'w19', TRUE, '2000-03-17'), (1317, 47, 2.0, 'w26', FALSE, '2000-03-28'), (1318, 84, 2.5, 'w4', TRUE, '2000-04-08'), (1319, 20, 3.0, 'w11', TRUE, '2000-04-19'), (1320, 57, 3.5, 'w18', FALSE, '2000-04-30'), (1321, 94, 4.0, 'w25', TRUE, '2000-05-11'), (1322, 30, 4.5, 'w3', TRUE, '2000-05-22'), (1323, 67, 5.0, 'w10', FALSE, '2000-06-02'), (1324, 3, 5.5, 'w17', TRUE, '2000-06-13'), (1325, 40, 6.0, 'w24', TRUE, '2000-06-24'), (1326, 77, 0.0, 'w2', FALSE, '2000-07-05'), (1327, 13, 0.5, 'w9', TRUE, '2000-07-16'), (1328, 50, 1.0, 'w16', TRUE, '2000-07-27'), (1329, 87, 1.5, 'w23', FALSE, '2000-08-07'), (1330, 23, 2.0, 'w1', TRUE, '2000-08-18'), (1331, 60, 2.5, 'w8', TRUE, '2000-08-29'), (1332, 97, 3.0, 'w15', FALSE, '2000-09-09'), (1333, 33, 3.5, 'w22', TRUE, '2000-09-20'), (1334, 70, 4.0, 'w0', TRUE, '2000-10-01'), (1335, 6, 4.5, 'w7', FALSE, '2000-10-12'), (1336, 43, 5.0, 'w14', TRUE, '2000-10-23'), (1337, 80, 5.5, 'w21', TRUE, '2000-11-03'), (1338, 16, 6.0, 'w28', FALSE, '2000-11-14'), (1339, 53, 0.0, 'w6', TRUE, '2000-11-25'), (1340, 90, 0.5, 'w13', TRUE, '2000-12-06'), (1341, 26, 1.0, 'w20', FALSE, '2000-12-17'), (1342, 63, 1.5, 'w27', TRUE, '2000-12-28'), (1343, 100, 2.0, 'w5', TRUE, '2001-01-08'), (1344, 36, 2.5, 'w12', FALSE, '2001-01-19'), (1345, 73, 3.0, 'w19', TRUE, '2001-01-30'), (1346, 9, 3.5, 'w26', TRUE, '2000-01-07'), (1347, 46, 4.0, 'w4', FALSE, '2000-01-18'), (1348, 83, 4.5, 'w11', TRUE, '2000-01-29'), (1349, 19, 5.0, 'w18', TRUE, '2000-02-09'), (1350, 56, 5.5, 'w25', FALSE, '2000-02-20'), (1351, 93, 6.0, 'w3', TRUE, '2000-03-02'), (1352, 29, 0.0, 'w10', TRUE, '2000-03-13'), (1353, 66, 0.5, 'w17', FALSE, '2000-03-24'), (1354, 2, 1.0, 'w24', TRUE, '2000-04-04'), (1355, 39, 1.5, 'w2', TRUE, '2000-04-15'), (1356, 76, 2.0, 'w9', FALSE, '2000-04-26'), (1357, 12, 2.5, 'w16', TRUE, '2000-05-07'), (1358, 49, 3.0, 'w23', TRUE, '2000-05-18'), (1359, 86, 3.5, 'w1', FALSE, '2000-05-29'), (1360, 22, 4.0, 'w8', TRUE, '2000-06-09'), (1361, 59, 4.5, 'w15', TRUE, '2000-06-20'), (1362, 96, 5.0, 'w22', FALSE, '2000-07-01'), (1363, 32, 5.5, 'w0', TRUE, '2000-07-12'), (1364, 69, 6.0, 'w7', TRUE, '2000-07-23'), (1365, 5, 0.0, 'w14', FALSE, '2000-08-03'), (1366, 42, 0.5, 'w21', TRUE, '2000-08-14'), (1367, 79, 1.0, 'w28', TRUE, '2000-08-25'), (1368, 15, 1.5, 'w6', FALSE, '2000-09-05'), (1369, 52, 2.0, 'w13', TRUE, '2000-09-16'), (1370, 89, 2.5, 'w20', TRUE, '2000-09-27'), (1371, 25, 3.0, 'w27', FALSE, '2000-10-08'), (1372, 62, 3.5, 'w5', TRUE, '2000-10-19'), (1373, 99, 4.0, 'w12', TRUE, '2000-10-30'), (1374, 35, 4.5, 'w19', FALSE, '2000-11-10'), (1375, 72, 5.0, 'w26', TRUE, '2000-11-21'), (1376, 8, 5.5, 'w4', TRUE, '2000-12-02'), (1377, 45, 6.0, 'w11', FALSE, '2000-12-13'), (1378, 82, 0.0, 'w18', TRUE, '2000-12-24'), (1379, 18, 0.5, 'w25', TRUE, '2001-01-04'), (1380, 55, 1.0, 'w3', FALSE, '2001-01-15'), (1381, 92, 1.5, 'w10', TRUE, '2001-01-26'), (1382, 28, 2.0, 'w17', TRUE, '2000-01-03'), (1383, 65, 2.5, 'w24', FALSE, '2000-01-14'), (1384, 1, 3.0, 'w2', TRUE, '2000-01-25'), (1385, 38, 3.5, 'w9', TRUE, '2000-02-05'), (1386, 75, 4.0, 'w16', FALSE, '2000-02-16'), (1387, 11, 4.5, 'w23', TRUE, '2000-02-27'), (1388, 48, 5.0, 'w1', TRUE, '2000-03-09'), (1389, 85, 5.5, 'w8', FALSE, '2000-03-20'), (1390, 21, 6.0, 'w15', TRUE, '2000-03-31'), (1391, 58, 0.0, 'w22', TRUE, '2000-04-11'), (1392, 95, 0.5, 'w0', FALSE, '2000-04-22'), (1393, 31, 1.0, 'w7', TRUE, '2000-05-03'), (1394, 68, 1.5, 'w14', TRUE, '2000-05-14'), (1395, 4, 2.0, 'w21', FALSE, '2000-05-25'), (1396, 41, 2.5, 'w28', TRUE, '2000-06-05'), (1397, 78, 3.0, 'w6', TRUE, '2000-06-16'), (1398, 14, 3.5, 'w13', FALSE, '2000-06-27'), (1399, 51, 4.0, 'w20', TRUE, '2000-07-08'), (1400, 88, 4.5, 'w27', TRUE, '2000-07-19'), (1401, 24, 5.0, 'w5', FALSE, '2000-07-30'), (1402, 61, 5.5, 'w12', TRUE, '2000-08-10'), (1403, 98, 6.0, 'w19', TRUE, '2000-08-21'), (1404, 34, 0.0, 'w26', FALSE, '2000-09-01'), (1405, 71, 0.5, 'w4', TRUE, '2000-09-12'), (1406, 7, 1.0, 'w11', TRUE, '2000-09-23'), (1407, 44, 1.5, 'w18', FALSE, '2000-10-04'), (1408, 81, 2.0, 'w25', TRUE, '2000-10-15'), (1409, 17, 2.5, 'w3', TRUE, '2000-10-26'), (1410, 54, 3.0, 'w10', FALSE, '2000-11-06'), (1411, 91, 3.5, 'w17', TRUE, '2000-11-17'), (1412, 27, 4.0, 'w24', TRUE, '2000-11-28'), (1413, 64, 4.5, 'w2', FALSE, '2000-12-09'), (1414, 0, 5.0, 'w9', TRUE, '2000-12-20'), (1415, 37, 5.5, 'w16', TRUE, '2000-12-31'), (1416, 74, 6.0, 'w23', FALSE, '2001-01-11'), (1417, 10, 0.0, 'w1', TRUE, '2001-01-22'), (1418, 47, 0.5, 'w8', TRUE, '2001-02-02'), (1419, 84, 1.0, 'w15', FALSE, '2000-01-10'), (1420, 20, 1.5, 'w22', TRUE, '2000-01-21'), (1421, 57, 2.0, 'w0', TRUE, '2000-02-01'), (1422, 94, 2.5, 'w7', FALSE, '2000-02-12'), (1423, 30, 3.0, 'w14', TRUE, '2000-02-23'), (1424, 67, 3.5, 'w21', TRUE, '2000-03-05'), (1425, 3, 4.0, 'w28', FALSE, '2000-03-16'), (1426, 40, 4.5, 'w6', TRUE, '2000-03-27'), (1427, 77, 5.0, 'w13', TRUE, '2000-04-07'), (1428, 13, 5.5, 'w20', FALSE, '2000-04-18'), (1429, 50, 6.0, 'w27', TRUE, '2000-04-29'), (1430, 87, 0.0, 'w5', TRUE, '2000-05-10'), (1431, 23, 0.5, 'w12', FALSE, '2000-05-21'), (1432, 60, 1.0, 'w19', TRUE, '2000-06-01'), (1433, 97, 1.5, 'w26', TRUE, '2000-06-12'), (1434, 33, 2.0, 'w4', FALSE, '2000-06-23'), (1435, 70, 2.5, 'w11', TRUE, '2000-07-04'), (1436, 6, 3.0, 'w18', TRUE, '2000-07-15'), (1437, 43, 3.5, 'w25', FALSE, '2000-07-26'), (1438, 80, 4.0, 'w3', TRUE, '2000-08-06'), (1439, 16, 4.5, 'w10', TRUE, '2000-08-17'), (1440, 53, 5.0, 'w17', FALSE, '2000-08-28'), (1441, 90, 5.5, 'w24', TRUE, '2000-09-08'), (1442, 26, 6.0, 'w2', TRUE, '2000-09-19'), (1443, 63, 0.0, 'w9', FALSE, '2000-09-30'), (1444, 100, 0.5, 'w16', TRUE, '2000-10-11'), (1445, 36, 1.0, 'w23', TRUE, '2000-10-22'), (1446, 73, 1.5, 'w1', FALSE, '2000-11-02'), (1447, 9, 2.0, 'w8', TRUE, '2000-11-13'), (1448, 46, 2.5, 'w15', TRUE, '2000-11-24'), (1449, 83, 3.0, 'w22', FALSE, '2000-12-05'), (1450, 19, 3.5, 'w0', TRUE, '2000-12-16'), (1451, 56, 4.0, 'w7', TRUE, '2000-12-27'), (1452, 93, 4.5, 'w14', FALSE, '2001-01-07'), (1453, 29, 5.0, 'w21', TRUE, '2001-01-18'), (1454, 66, 5.5, 'w28', TRUE, '2001-01-29'), (1455, 2, 6.0, 'w6', FALSE, '2000-01-06'), (1456, 39, 0.0, 'w13', TRUE, '2000-01-17'), (1457, 76, 0.5, 'w20', TRUE, '2000-01-28'), (1458, 12, 1.0, 'w27', FALSE, '2000-02-08'), (1459, 49, 1.5, 'w5', TRUE, '2000-02-19'), (1460, 86, 2.0, 'w12', TRUE, '2000-03-01'), (1461, 22, 2.5, 'w19', FALSE, '2000-03-12'), (1462, 59, 3.0, 'w26', TRUE, '2000-03-23'), (1463, 96, 3.5, 'w4', TRUE, '2000-04-03'), (1464, 32, 4.0, 'w11', FALSE, '2000-04-14'), (1465, 69, 4.5, 'w18', TRUE, '2000-04-25'), (1466, 5, 5.0, 'w25', TRUE, '2000-05-06'), (1467, 42, 5.5, 'w3', FALSE, '2000-05-17'), (1468, 79, 6.0, 'w10', TRUE, '2000-05-28'), (1469, 15, 0.0, 'w17', TRUE, '2000-06-08'), (1470, 52, 0.5, 'w24', FALSE, '2000-06-19'), (1471, 89, 1.0, 'w2', TRUE, '2000-06-30'), (1472, 25, 1.5, 'w9', TRUE, '2000-07-11'), (1473, 62, 2.0, 'w16', FALSE, '2000-07-22'), (1474, 99, 2.5, 'w23', TRUE, '2000-08-02'), (1475, 35, 3.0, 'w1', TRUE, '2000-08-13'), (1476, 72, 3.5, 'w8', FALSE, '2000-08-24'), (1477, 8, 4.0, 'w15', TRUE, '2000-09-04'), (1478, 45, 4.5, 'w22', TRUE, '2000-09-15'), (1479, 82, 5.0, 'w0', FALSE, '2000-09-26'), (1480, 18, 5.5, 'w7', TRUE, '2000-10-07'), (1481, 55, 6.0, 'w14', TRUE, '2000-10-18'), (1482, 92, 0.0, 'w21', FALSE, '2000-10-29'), (1483, 28, 0.5, 'w28', TRUE, '2000-11-09'), (1484, 65, 1.0, 'w6', TRUE, '2000-11-20'), (1485, 1, 1.5, 'w13', FALSE, '2000-12-01'), (1486, 38, 2.0, 'w20', TRUE, '2000-12-12'), (1487, 75, 2.5, 'w27', TRUE, '2000-12-23'), (1488, 11, 3.0, 'w5', FALSE, '2001-01-03'), (1489, 48, 3.5, 'w12', TRUE, '2001-01-14'), (1490, 85, 4.0, 'w19', TRUE, '2001-01-25'), (1491, 21, 4.5, 'w26', FALSE, '2000-01-02'), (1492, 58, 5.0, 'w4', TRUE, '2000-01-13'), (1493, 95, 5.5, 'w11', TRUE, '2000-01-24'), (1494, 31, 6.0, 'w18', FALSE, '2000-02-04'), (1495, 68, 0.0, 'w25', TRUE, '2000-02-15'), (1496, 4, 0.5, 'w3', TRUE, '2000-02-26'), (1497, 41, 1.0, 'w10', FALSE, '2000-03-08'), (1498, 78, 1.5, 'w17', TRUE, '2000-03-19'), (1499, 14, 2.0, 'w24', TRUE, '2000-03-30'), (1500, 51, 2.5, 'w2', FALSE, '2000-04-10'), (1501, 88, 3.0, 'w9', TRUE, '2000-04-21'), (1502, 24, 3.5, 'w16', TRUE, '2000-05-02'), (1503, 61, 4.0, 'w23', FALSE, '2000-05-13'), (1504, 98, 4.5, 'w1', TRUE, '2000-05-24'), (1505, 34, 5.0, 'w8', TRUE, '2000-06-04'), (1506, 71, 5.5, 'w15', FALSE, '2000-06-15'), (1507, 7, 6.0, 'w22', TRUE, '2000-06-26'), (1508, 44, 0.0, 'w0', TRUE, '2000-07-07'), (1509, 81, 0.5, 'w7', FALSE, '2000-07-18'), (1510, 17, 1.0, 'w14', TRUE, '2000-07-29'), (1511, 54, 1.5, 'w21', TRUE, '2000-08-09'), (1512, 91, 2.0, 'w28', FALSE, '2000-08-20'), (1513, 27, 2.5, 'w6', TRUE, '2000-08-31'), (1514, 64, 3.0, 'w13', TRUE, '2000-09-11'), (1515, 0, 3.5, 'w20', FALSE, '2000-09-22'), (1516, 37, 4.0, 'w27', TRUE, '2000-10-03'), (1517, 74, 4.5, 'w5', TRUE, '2000-10-14'), (1518, 10, 5.0, 'w12', FALSE, '2000-10-25'), (1519, 47, 5.5, 'w19', TRUE, '2000-11-05'), (1520, 84, 6.0, 'w26', TRUE, '2000-11-16'), (1521, 20, 0.0, 'w4', FALSE, '2000-11-27'), (1522, 57, 0.5, 'w11', TRUE, '2000-12-08'), (1523, 94, 1.0, 'w18', TRUE, '2000-12-19'), (1524, 30, 1.5, 'w25', FALSE, '2000-12-30'), (1525, 67, 2.0, 'w3', TRUE, '2001-01-10'), (1526, 3, 2.5, 'w10', TRUE, '2001-01-21'), (1527, 40, 3.0, 'w17', FALSE, '2001-02-01'), (1528, 77, 3.5, 'w24', TRUE, '2000-01-09'), (1529, 13, 4.0, 'w2', TRUE, '2000-01-20'), (1530, 50, 4.5, 'w9', FALSE, '2000-01-31'), (1531, 87, 5.0, 'w16', TRUE, '2000-02-11'), (1532, 23, 5.5, 'w23', TRUE, '2000-02-22'), (1533, 60, 6.0, 'w1', FALSE, '2000-03-04'), (1534, 97, 0.0, 'w8', TRUE, '2000-03-15'), (1535, 33, 0.5, 'w15', TRUE, '2000-03-26'), (1536, 70, 1.0, 'w22', FALSE, '2000-04-06'), (1537, 6, 1.5, 'w0', TRUE, '2000-04-17'), (1538, 43, 2.0, 'w7', TRUE, '2000-04-28'), (1539, 80, 2.5, 'w14', FALSE, '2000-05-09'), (1540, 16, 3.0, 'w21', TRUE, '2000-05-20'), (1541, 53, 3.5, 'w28', TRUE, '2000-05-31'), (1542, 90, 4.0, 'w6', FALSE, '2000-06-11'), (1543, 26, 4.5, 'w13', TRUE, '2000-06-22'), (1544, 63, 5.0, 'w20', TRUE, '2000-07-03'), (1545, 100, 5.5, 'w27', FALSE, '2000-07-14'), (1546, 36, 6.0, 'w5', TRUE, '2000-07-25'), (1547, 73, 0.0, 'w12', TRUE, '2000-08-05'), (1548, 9, 0.5, 'w19', FALSE, '2000-08-16'), (1549, 46, 1.0, 'w26', TRUE, '2000-08-27'), (1550, 83, 1.5, 'w4', TRUE, '2000-09-07'), (1551, 19, 2.0, 'w11', FALSE, '2000-09-18'), (1552, 56, 2.5, 'w18', TRUE, '2000-09-29'), (1553, 93, 3.0, 'w25', TRUE, '2000-10-10'), (1554, 29, 3.5, 'w3', FALSE, '2000-10-21'), (1555, 66, 4.0, 'w10', TRUE, '2000-11-01'), (1556, 2, 4.5, 'w17', TRUE, '2000-11-12'), (1557, 39, 5.0, 'w24', FALSE, '2000-11-23'), (1558, 76, 5.5, 'w2', TRUE, '2000-12-04'), (1559, 12, 6.0, 'w9', TRUE, '2000-12-15'), (1560, 49, 0.0, 'w16', FALSE, '2000-12-26'), (1561, 86, 0.5, 'w23', TRUE, '2001-01-06'), (1562, 22, 1.0, 'w1', TRUE, '2001-01-17'), (1563, 59, 1.5, 'w8', FALSE, '2001-01-28'), (1564, 96, 2.0, 'w15', TRUE, '2000-01-05'), (1565, 32, 2.5, 'w22', TRUE, '2000-01-16'), (1566, 69, 3.0, 'w0', FALSE, '2000-01-27'), (1567, 5, 3.5, 'w7', TRUE, '2000-02-07'), (1568, 42, 4.0, 'w14', TRUE, '2000-02-18'), (1569, 79, 4.5, 'w21', FALSE, '2000-02-29'), (1570, 15, 5.0, 'w28', TRUE, '2000-03-11'), (1571, 52, 5.5, 'w6', TRUE, '2000-03-22'), (1572, 89, 6.0, 'w13', FALSE, '2000-04-02'), (1573, 25, 0.0, 'w20', TRUE, '2000-04-13'), (1574, 62, 0.5, 'w27', TRUE, '2000-04-24'), (1575, 99, 1.0, 'w5', FALSE, '2000-05-05'), (1576, 35, 1.5, 'w12', TRUE, '2000-05-16'), (1577, 72, 2.0, 'w19', TRUE, '2000-05-27'), (1578, 8, 2.5, 'w26', FALSE, '2000-06-07'), (1579, 45, 3.0, 'w4', TRUE, '2000-06-18'), (1580, 82, 3.5, 'w11', TRUE, '2000-06-29'), (1581, 18, 4.0, 'w18', FALSE, '2000-07-10'), (1582, 55, 4.5, 'w25', TRUE, '2000-07-21'), (1583, 92, 5.0, 'w3', TRUE, '2000-08-01'), (1584, 28, 5.5, 'w10', FALSE, '2000-08-12'), (1585, 65, 6.0, 'w17', TRUE, '2000-08-23'), (1586, 1, 0.0, 'w24', TRUE, '2000-09-03'), (1587, 38, 0.5, 'w2', FALSE, '2000-09-14'), (1588, 75, 1.0, 'w9', TRUE, '2000-09-25'), (1589, 11, 1.5, 'w16', TRUE, '2000-10-06'), (1590, 48, 2.0, 'w23', FALSE, '2000-10-17'), (1591, 85, 2.5, 'w1', TRUE, '2000-10-28'), (1592, 21, 3.0, 'w8', TRUE, '2000-11-08'), (1593, 58, 3.5, 'w15', FALSE, '2000-11-19'), (1594, 95, 4.0, 'w22', TRUE, '2000-11-30'), (1595, 31, 4.5, 'w0', TRUE, '2000-12-11'), (1596, 68, 5.0, 'w7', FALSE, '2000-12-22'), (1597, 4, 5.5, 'w14', TRUE, '2001-01-02'), (1598, 41, 6.0, 'w21', TRUE, '2001-01-13'), (1599, 78, 0.0, 'w28', FALSE, '2001-01-24'), (1600, 14, 0.5, 'w6', TRUE, '2000-01-01'), (1601, 51, 1.0, 'w13', TRUE, '2000-01-12'), (1602, 88, 1.5, 'w20', FALSE, '2000-01-23'), (1603, 24, 2.0, 'w27', TRUE, '2000-02-03'), (1604, 61, 2.5, 'w5', TRUE, '2000-02-14'), (1605, 98, 3.0, 'w12', FALSE, '2000-02-25'), (1606, 34, 3.5, 'w19', TRUE, '2000-03-07'), (1607, 71, 4.0, 'w26', TRUE, '2000-03-18'), (1608, 7, 4.5, 'w4', FALSE, '2000-03-29'), (1609, 44, 5.0, 'w11', TRUE, '2000-04-09'), (1610, 81, 5.5, 'w18', TRUE, '2000-04-20'), (1611, 17, 6.0, 'w25', FALSE, '2000-05-01'), (1612, 54, 0.0, 'w3', TRUE, '2000-05-12'), (1613, 91, 0.5, 'w10', TRUE, '2000-05-23'), (1614, 27, 1.0, 'w17', FALSE, '2000-06-03'), (1615, 64, 1.5, 'w24', TRUE, '2000-06-14'), (1616, 0, 2.0, 'w2', TRUE, '2000-06-25'), (1617, 37, 2.5, 'w9', FALSE, '2000-07-06'), (1618, 74, 3.0, 'w16', TRUE, '2000-07-17'), (1619, 10, 3.5, 'w23', TRUE, '2000-07-28'), (1620, 47, 4.0, 'w1', FALSE, '2000-08-08'), (1621, 84, 4.5, 'w8', TRUE, '2000-08-19'), (1622, 20, 5.0, 'w15', TRUE, '2000-08-30'), (1623, 57, 5.5, 'w22', FALSE, '2000-09-10'), (1624, 94, 6.0, 'w0', TRUE, '2000-09-21'), (1625, 30, 0.0, 'w7', TRUE, '2000-10-02'), (1626, 67, 0.5, 'w14', FALSE, '2000-10-13'), (1627, 3, 1.0, 'w21', TRUE, '2000-10-24'), (1628, 40, 1.5, 'w28', TRUE, '2000-11-04'), (1629, 77, 2.0, 'w6', FALSE, '2000-11-15'), (1630, 13, 2.5, 'w13', TRUE, '2000-11-26'), (1631, 50, 3.0, 'w20', TRUE, '2000-12-07'), (1632, 87, 3.5, 'w27', FALSE, '2000-12-18'), (1633, 23, 4.0, 'w5', TRUE, '2000-12-29'), (1634, 60, 4.5, 'w12', TRUE, '2001-01-09'), (1635, 97, 5.0, 'w19', FALSE, '2001-01-20'), (1636, 33, 5.5, 'w26', TRUE, '2001-01-31'), (1637, 70, 6.0, 'w4', TRUE, '2000-01-08'), (1638, 6, 0.0, 'w11', FALSE, '2000-01-19'), (1639, 43, 0.5, 'w18', TRUE, '2000-01-30'), (1640, 80, 1.0, 'w25', TRUE, '2000-02-10'), (1641, 16, 1.5, 'w3', FALSE, '2000-02-21'), (1642, 53, 2.0, 'w10', TRUE, '2000-03-03'), (1643, 90, 2.5, 'w17', TRUE, '2000-03-14'), (1644, 26, 3.0, 'w24', FALSE, '2000-03-25'), (1645, 63, 3.5, 'w2', TRUE, '2000-04-05'), (1646, 100, 4.0, 'w9', TRUE, '2000-04-16'), (1647, 36, 4.5, 'w16', FALSE, '2000-04-27'), (1648, 73, 5.0, 'w23', TRUE, '2000-05-08'), (1649, 9, 5.5, 'w1', TRUE, '2000-05-19'), (1650, 46, 6.0, 'w8', FALSE, '2000-05-30'), (1651, 83, 0.0, 'w15', TRUE, '2000-06-10'), (1652, 19, 0.5, 'w22', TRUE, '2000-06-21'), (1653, 56, 1.0, 'w0', FALSE, '2000-07-02'), (1654, 93, 1.5, 'w7', TRUE, '2000-07-13'), (1655, 29, 2.0, 'w14', TRUE, '2000-07-24'), (1656, 66, 2.5, 'w21', FALSE, '2000-08-04'), (1657, 2, 3.0, 'w28', TRUE, '2000-08-15'), (1658, 39, 3.5, 'w6', TRUE, '2000-08-26'), (1659, 76, 4.0, 'w13', FALSE, '2000-09-06'), (1660, 12, 4.5, 'w20', TRUE, '2000-09-17'), (1661, 49, 5.0, 'w27', TRUE, '2000-09-28'), (1662, 86, 5.5, 'w5', FALSE, '2000-10-09'), (1663, 22, 6.0, 'w12', TRUE, '2000-10-20'), (1664, 59, 0.0, 'w19', TRUE, '2000-10-31'), (1665, 96, 0.5, 'w26', FALSE, '2000-11-11'), (1666, 32, 1.0, 'w4', TRUE, '2000-11-22'), (1667, 69, 1.5, 'w11', TRUE, '2000-12-03'), (1668, 5, 2.0, 'w18', FALSE, '2000-12-14'), (1669, 42, 2.5, 'w25', TRUE, '2000-12-25'), (1670, 79, 3.0, 'w3', TRUE, '2001-01-05'), (1671, 15, 3.5, 'w10', FALSE, '2001-01-16'), (1672, 52, 4.0, 'w17', TRUE, '2001-01-27'), (1673, 89, 4.5, 'w24', TRUE, '2000-01-04'), (1674, 25, 5.0, 'w2', FALSE, '2000-01-15'), (1675, 62, 5.5, 'w9', TRUE, '2000-01-26'), (1676, 99, 6.0, 'w16', TRUE, '2000-02-06'), (1677, 35, 0.0, 'w23', FALSE, '2000-02-17'), (1678, 72, 0.5, 'w1', TRUE, '2000-02-28'), (1679, 8, 1.0, 'w8', TRUE, '2000-03-10'), (1680, 45, 1.5, 'w15', FALSE, '2000-03-21'), (1681, 82, 2.0, 'w22', TRUE, '2000-04-01'), (1682, 18, 2.5, 'w0', TRUE, '2000-04-12'), (1683, 55, 3.0, 'w7', FALSE, '2000-04-23'), (1684, 92, 3.5, 'w14', TRUE, '2000-05-04'), (1685, 28, 4.0, 'w21', TRUE, '2000-05-15'), (1686, 65, 4.5, 'w28', FALSE, '2000-05-26'), (1687, 1, 5.0, 'w6', TRUE, '2000-06-06'), (1688, 38, 5.5, 'w13', TRUE, '2000-06-17'), (1689, 75, 6.0, 'w20', FALSE, '2000-06-28'), (1690, 11, 0.0, 'w27', TRUE, '2000-07-09'), (1691, 48, 0.5, 'w5', TRUE, '2000-07-20'), (1692, 85, 1.0, 'w12', FALSE, '2000-07-31'), (1693, 21, 1.5, 'w19', TRUE, '2000-08-11'), (1694, 58, 2.0, 'w26', TRUE, '2000-08-22'), (1695, 95, 2.5, 'w4', FALSE, '2000-09-02'), (1696, 31, 3.0, 'w11', TRUE, '2000-09-13'), (1697, 68, 3.5, 'w18', TRUE, '2000-09-24'), (1698, 4, 4.0, 'w25', FALSE, '2000-10-05'), (1699, 41, 4.5, 'w3', TRUE, '2000-10-16'), (1700, 78, 5.0, 'w10', TRUE, '2000-10-27'), (1701, 14, 5.5, 'w17', FALSE, '2000-11-07'), (1702, 51, 6.0, 'w24', TRUE, '2000-11-18'), (1703, 88, 0.0, 'w2', TRUE, '2000-11-29'), (1704, 24, 0.5, 'w9', FALSE, '2000-12-10'), (1705, 61, 1.0, 'w16', TRUE, '2000-12-21'), (1706, 98, 1.5, 'w23', TRUE, '2001-01-01'), (1707, 34, 2.0, 'w1', FALSE, '2001-01-12'), (1708, 71, 2.5, 'w8', TRUE, '2001-01-23'), (1709, 7, 3.0, 'w15', TRUE, '2001-02-03'), (1710, 44, 3.5, 'w22', FALSE, '2000-01-11'), (1711, 81, 4.0, 'w0', TRUE, '2000-01-22'), (1712, 17, 4.5, 'w7', TRUE, '2000-02-02'), (1713, 54, 5.0, 'w14', FALSE, '2000-02-13'), (1714, 91, 5.5, 'w21', TRUE, '2000-02-24'), (1715, 27, 6.0, 'w28', TRUE, '2000-03-06'), (1716, 64, 0.0, 'w6', FALSE, '2000-03-17'), (1717, 0, 0.5, 'w13', TRUE, '2000-03-28'), (1718, 37, 1.0, 'w20', TRUE, '2000-04-08'), (1719, 74, 1.5, 'w27', FALSE, '2000-04-19'), (1720, 10, 2.0, 'w5', TRUE, '2000-04-30'), (1721, 47, 2.5, 'w12', TRUE, '2000-05-11'), (1722, 84, 3.0, 'w19', FALSE, '2000-05-22'), (1723, 20, 3.5, 'w26', TRUE, '2000-06-02'), (1724, 57, 4.0, 'w4', TRUE, '2000-06-13'), (1725, 94, 4.5, 'w11', FALSE, '2000-06-24'), (1726, 30, 5.0, 'w18', TRUE, '2000-07-05'), (1727, 67, 5.5, 'w25', TRUE, '2000-07-16'), (1728, 3, 6.0, 'w3', FALSE, '2000-07-27'), (1729, 40, 0.0, 'w10', TRUE, '2000-08-07'), (1730, 77, 0.5, 'w17', TRUE, '2000-08-18'), (1731, 13, 1.0, 'w24', FALSE, '2000-08-29'), (1732, 50, 1.5, 'w2', TRUE, '2000-09-09'), (1733, 87, 2.0, 'w9', TRUE, '2000-09-20'), (1734, 23, 2.5, 'w16', FALSE, '2000-10-01'), (1735, 60, 3.0, 'w23', TRUE, '2000-10-12'), (1736, 97, 3.5, 'w1', TRUE, '2000-10-23'), (1737, 33, 4.0, 'w8', FALSE, '2000-11-03'), (1738, 70, 4.5, 'w15', TRUE, '2000-11-14'), (1739, 6, 5.0, 'w22', TRUE, '2000-11-25'), (1740, 43, 5.5, 'w0', FALSE, '2000-12-06'), (1741, 80, 6.0, 'w7', TRUE, '2000-12-17'), (1742, 16, 0.0, 'w14', TRUE, '2000-12-28'), (1743, 53, 0.5, 'w21', FALSE, '2001-01-08'), (1744, 90, 1.0, 'w28', TRUE, '2001-01-19'), (1745, 26, 1.5, 'w6', TRUE, '2001-01-30'), (1746, 63, 2.0, 'w13', FALSE, '2000-01-07'), (1747, 100, 2.5, 'w20', TRUE, '2000-01-18'), (1748, 36, 3.0, 'w27', TRUE, '2000-01-29'), (1749, 73, 3.5, 'w5', FALSE, '2000-02-09'), (1750, 9, 4.0, 'w12', TRUE, '2000-02-20'), (1751, 46, 4.5, 'w19', TRUE, '2000-03-02'), (1752, 83, 5.0, 'w26', FALSE, '2000-03-13'), (1753, 19, 5.5, 'w4', TRUE, '2000-03-24'), (1754, 56, 6.0, 'w11', TRUE, '2000-04-04'), (1755, 93, 0.0, 'w18', FALSE, '2000-04-15'), (1756, 29, 0.5, 'w25', TRUE, '2000-04-26'), (1757, 66, 1.0, 'w3', TRUE, '2000-05-07'), (1758, 2, 1.5, 'w10', FALSE, '2000-05-18'), (1759, 39, 2.0, 'w17', TRUE, '2000-05-29'), (1760, 76, 2.5, 'w24', TRUE, '2000-06-09'), (1761, 12, 3.0, 'w2', FALSE, '2000-06-20'), (1762, 49, 3.5, 'w9', TRUE, '2000-07-01'), (1763, 86, 4.0, 'w16', TRUE, '2000-07-12'), (1764, 22, 4.5, 'w23', FALSE, '2000-07-23'), (1765, 59, 5.0, 'w1', TRUE, '2000-08-03'), (1766, 96, 5.5, 'w8', TRUE, '2000-08-14'), (1767, 32, 6.0, 'w15', FALSE, '2000-08-25'), (1768, 69, 0.0, 'w22', TRUE, '2000-09-05'), (1769, 5, 0.5, 'w0', TRUE, '2000-09-16'), (1770, 42, 1.0, 'w7', FALSE, '2000-09-27'), (1771, 79, 1.5, 'w14', TRUE, '2000-10-08'), (1772, 15, 2.0, 'w21', TRUE, '2000-10-19'), (1773, 52, 2.5, 'w28', FALSE, '2000-10-30'), (1774, 89, 3.0, 'w6', TRUE, '2000-11-10'), (1775, 25, 3.5, 'w13', TRUE, '2000-11-21'), (1776, 62, 4.0, 'w20', FALSE, '2000-12-02'), (1777, 99, 4.5, 'w27', TRUE, '2000-12-13'), (1778, 35, 5.0, 'w5', TRUE, '2000-12-24'), (1779, 72, 5.5, 'w12', FALSE, '2001-01-04'), (1780, 8, 6.0, 'w19', TRUE, '2001-01-15'), (1781, 45, 0.0, 'w26', TRUE, '2001-01-26'), (1782, 82, 0.5, 'w4', FALSE, '2000-01-03'), (1783, 18, 1.0, 'w11', TRUE, '2000-01-14'), (1784, 55, 1.5, 'w18', TRUE, '2000-01-25'), (1785, 92, 2.0, 'w25', FALSE, '2000-02-05'), (1786, 28, 2.5, 'w3', TRUE, '2000-02-16'), (1787, 65, 3.0, 'w10', TRUE, '2000-02-27'), (1788, 1, 3.5, 'w17', FALSE, '2000-03-09'), (1789, 38, 4.0, 'w24', TRUE, '2000-03-20'), (1790, 75, 4.5, 'w2', TRUE, '2000-03-31'), (1791, 11, 5.0, 'w9', FALSE, '2000-04-11'), (1792, 48, 5.5, 'w16', TRUE, '2000-04-22'), (1793, 85, 6.0, 'w23', TRUE, '2000-05-03'), (1794, 21, 0.0, 'w1', FALSE, '2000-05-14'), (1795, 58, 0.5, 'w8', TRUE, '2000-05-25'), (1796, 95, 1.0, 'w15', TRUE, '2000-06-05'), (1797, 31, 1.5, 'w22', FALSE, '2000-06-16'), (1798, 68, 2.0, 'w0', TRUE, '2000-06-27'), (1799, 4, 2.5, 'w7', TRUE, '2000-07-08'), (1800, 41, 3.0, 'w14', FALSE, '2000-07-19'), (1801, 78, 3.5, 'w21', TRUE, '2000-07-30'), (1802, 14, 4.0, 'w28', TRUE, '2000-08-10'), (1803, 51, 4.5, 'w6', FALSE, '2000-08-21'), (1804, 88, 5.0, 'w13', TRUE, '2000-09-01'), (1805, 24, 5.5, 'w20', TRUE, '2000-09-12'), (1806, 61, 6.0, 'w27', FALSE, '2000-09-23'), (1807, 98, 0.0, 'w5', TRUE, '2000-10-04'), (1808, 34, 0.5, 'w12', TRUE, '2000-10-15'), (1809, 71, 1.0, 'w19', FALSE, '2000-10-26'), (1810, 7, 1.5, 'w26', TRUE, '2000-11-06'), (1811, 44, 2.0, 'w4', TRUE, '2000-11-17'), (1812, 81, 2.5, 'w11', FALSE, '2000-11-28'), (1813, 17, 3.0, 'w18', TRUE, '2000-12-09'), (1814, 54, 3.5, 'w25', TRUE, '2000-12-20'), (1815, 91, 4.0, 'w3', FALSE, '2000-12-31'), (1816, 27, 4.5, 'w10', TRUE, '2001-01-11'), (1817, 64, 5.0, 'w17', TRUE, '2001-01-22'), (1818, 0, 5.5, 'w24', FALSE, '2001-02-02'), (1819, 37, 6.0, 'w2', TRUE, '2000-01-10'), (1820, 74, 0.0, 'w9', TRUE, '2000-01-21'), (1821, 10, 0.5, 'w16', FALSE, '2000-02-01'), (1822, 47, 1.0, 'w23', TRUE, '2000-02-12'), (1823, 84, 1.5, 'w1', TRUE, '2000-02-23'), (1824, 20, 2.0, 'w8', FALSE, '2000-03-05'), (1825, 57, 2.5, 'w15', TRUE, '2000-03-16'), (1826, 94, 3.0, 'w22', TRUE, '2000-03-27'), (1827, 30, 3.5, 'w0', FALSE, '2000-04-07'), (1828, 67, 4.0, 'w7', TRUE, '2000-04-18'), (1829, 3, 4.5, 'w14', TRUE, '2000-04-29'), (1830, 40, 5.0, 'w21', FALSE, '2000-05-10'), (1831, 77, 5.5, 'w28', TRUE, '2000-05-21'), (1832, 13, 6.0, 'w6', TRUE, '2000-06-01'), (1833, 50, 0.0, 'w13', FALSE, '2000-06-12'), (1834, 87, 0.5, 'w20', TRUE, '2000-06-23'), (1835, 23, 1.0, 'w27', TRUE, '2000-07-04'), (1836, 60, 1.5, 'w5', FALSE, '2000-07-15'), (1837, 97, 2.0, 'w12', TRUE, '2000-07-26'), (1838, 33, 2.5, 'w19', TRUE, '2000-08-06'), (1839, 70, 3.0, 'w26', FALSE, '2000-08-17'), (1840, 6, 3.5, 'w4', TRUE, '2000-08-28'), (1841, 43, 4.0, 'w11', TRUE, '2000-09-08'), (1842, 80, 4.5, 'w18', FALSE, '2000-09-19'), (1843, 16, 5.0, 'w25', TRUE, '2000-09-30'), (1844, 53, 5.5, 'w3', TRUE, '2000-10-11'), (1845, 90, 6.0, 'w10', FALSE, '2000-10-22'), (1846, 26, 0.0, 'w17', TRUE, '2000-11-02'), (1847, 63, 0.5, 'w24', TRUE, '2000-11-13'), (1848, 100, 1.0, 'w2', FALSE, '2000-11-24'), (1849, 36, 1.5, 'w9', TRUE, '2000-12-05'), (1850, 73, 2.0, 'w16', TRUE, '2000-12-16'), (1851, 9, 2.5, 'w23', FALSE, '2000-12-27'), (1852, 46, 3.0, 'w1', TRUE, '2001-01-07'), (1853, 83, 3.5, 'w8', TRUE, '2001-01-18'), (1854, 19, 4.0, 'w15', FALSE, '2001-01-29'), (1855, 56, 4.5, 'w22', TRUE, '2000-01-06'), (1856, 93, 5.0, 'w0', TRUE, '2000-01-17'), (1857, 29, 5.5, 'w7', FALSE, '2000-01-28'), (1858, 66, 6.0, 'w14', TRUE, '2000-02-08'), (1859, 2, 0.0, 'w21', TRUE, '2000-02-19'), (1860, 39, 0.5, 'w28', FALSE, '2000-03-01'), (1861, 76, 1.0, 'w6', TRUE, '2000-03-12'), (1862, 12, 1.5, 'w13', TRUE, '2000-03-23'), (1863, 49, 2.0, 'w20', FALSE, '2000-04-03'), (1864, 86, 2.5, 'w27', TRUE, '2000-04-14'), (1865, 22, 3.0, 'w5', TRUE, '2000-04-25'), (1866, 59, 3.5, 'w12', FALSE, '2000-05-06'), (1867, 96, 4.0, 'w19', TRUE, '2000-05-17'), (1868, 32, 4.5, 'w26', TRUE, '2000-05-28'), (1869, 69, 5.0, 'w4', FALSE, '2000-06-08'), (1870, 5, 5.5, 'w11', TRUE, '2000-06-19'), (1871, 42, 6.0, 'w18', TRUE, '2000-06-30'), (1872, 79, 0.0, 'w25', FALSE, '2000-07-11'), (1873, 15, 0.5, 'w3', TRUE, '2000-07-22'), (1874, 52, 1.0, 'w10', TRUE, '2000-08-02'), (1875, 89, 1.5, 'w17', FALSE, '2000-08-13'), (1876, 25, 2.0, 'w24', TRUE, '2000-08-24'), (1877, 62, 2.5, 'w2', TRUE, '2000-09-04'), (1878, 99, 3.0, 'w9', FALSE, '2000-09-15'), (1879, 35, 3.5, 'w16', TRUE, '2000-09-26'), (1880, 72, 4.0, 'w23', TRUE, '2000-10-07'), (1881, 8, 4.5, 'w1', FALSE, '2000-10-18'), (1882, 45, 5.0, 'w8', TRUE, '2000-10-29'), (1883, 82, 5.5, 'w15', TRUE, '2000-11-09'), (1884, 18, 6.0, 'w22', FALSE, '2000-11-20'), (1885, 55, 0.0, 'w0', TRUE, '2000-12-01'), (1886, 92, 0.5, 'w7', TRUE, '2000-12-12'), (1887, 28, 1.0, 'w14', FALSE, '2000-12-23'), (1888, 65, 1.5, 'w21', TRUE, '2001-01-03'), (1889, 1, 2.0, 'w28', TRUE, '2001-01-14'), (1890, 38, 2.5, 'w6', FALSE, '2001-01-25'), (1891, 75, 3.0, 'w13', TRUE, '2000-01-02'), (1892, 11, 3.5, 'w20', TRUE, '2000-01-13'), (1893, 48, 4.0, 'w27', FALSE, '2000-01-24'), (1894, 85, 4.5, 'w5', TRUE, '2000-02-04'), (1895, 21, 5.0, 'w12', TRUE, '2000-02-15'), (1896, 58, 5.5, 'w19', FALSE, '2000-02-26'), (1897, 95, 6.0, 'w26', TRUE, '2000-03-08'), (1898, 31, 0.0, 'w4', TRUE, '2000-03-19'), (1899, 68, 0.5, 'w11', FALSE, '2000-03-30'), (1900, 4, 1.0, 'w18', TRUE, '2000-04-10'), (1901, 41, 1.5, 'w25', TRUE, '2000-04-21'), (1902, 78, 2.0, 'w3', FALSE, '2000-05-02'), (1903, 14, 2.5, 'w10', TRUE, '2000-05-13'), (1904, 51, 3.0, 'w17', TRUE, '2000-05-24'), (1905, 88, 3.5, 'w24', FALSE, '2000-06-04'), (1906, 24, 4.0, 'w2', TRUE, '2000-06-15'), (1907, 61, 4.5, 'w9', TRUE, '2000-06-26'), (1908, 98, 5.0, 'w16', FALSE, '2000-07-07'), (1909, 34, 5.5, 'w23', TRUE, '2000-07-18'), (1910, 71, 6.0, 'w1', TRUE, '2000-07-29'), (1911, 7, 0.0, 'w8', FALSE, '2000-08-09'), (1912, 44, 0.5, 'w15', TRUE, '2000-08-20'), (1913, 81, 1.0, 'w22', TRUE, '2000-08-31'), (1914, 17, 1.5, 'w0', FALSE, '2000-09-11'), (1915, 54, 2.0, 'w7', TRUE, '2000-09-22'), (1916, 91, 2.5, 'w14', TRUE, '2000-10-03'), (1917, 27, 3.0, 'w21', FALSE, '2000-10-14'), (1918, 64, 3.5, 'w28', TRUE, '2000-10-25'), (1919, 0, 4.0, 'w6', TRUE, '2000-11-05'), (1920, 37, 4.5, 'w13', FALSE, '2000-11-16'), (1921, 74, 5.0, 'w20', TRUE, '2000-11-27'), (1922, 10, 5.5, 'w27', TRUE, '2000-12-08'), (1923, 47, 6.0, 'w5', FALSE, '2000-12-19'), (1924, 84, 0.0, 'w12', TRUE, '2000-12-30'), (1925, 20, 0.5, 'w19', TRUE, '2001-01-10'), (1926, 57, 1.0, 'w26', FALSE, '2001-01-21'), (1927, 94, 1.5, 'w4', TRUE, '2001-02-01'), (1928, 30, 2.0, 'w11', TRUE, '2000-01-09'), (1929, 67, 2.5, 'w18', FALSE, '2000-01-20'), (1930, 3, 3.0, 'w25', TRUE, '2000-01-31'), (1931, 40, 3.5, 'w3', TRUE, '2000-02-11'), (1932, 77, 4.0, 'w10', FALSE, '2000-02-22'), (1933, 13, 4.5, 'w17', TRUE, '2000-03-04'), (1934, 50, 5.0, 'w24', TRUE, '2000-03-15'), (1935, 87, 5.5, 'w2', FALSE, '2000-03-26'), (1936, 23, 6.0, 'w9', TRUE, '2000-04-06'), (1937, 60, 0.0, 'w16', TRUE, '2000-04-17'), (1938, 97, 0.5, 'w23', FALSE, '2000-04-28'), (1939, 33, 1.0, 'w1', TRUE, '2000-05-09'), (1940, 70, 1.5, 'w8', TRUE, '2000-05-20'), (1941, 6, 2.0, 'w15', FALSE, '2000-05-31'), (1942, 43, 2.5, 'w22', TRUE, '2000-06-11'), (1943, 80, 3.0, 'w0', TRUE, '2000-06-22'), (1944, 16, 3.5, 'w7', FALSE, '2000-07-03'), (1945, 53, 4.0, 'w14', TRUE, '2000-07-14'), (1946, 90, 4.5, 'w21', TRUE, '2000-07-25'), (1947, 26, 5.0, 'w28', FALSE, '2000-08-05'), (1948, 63, 5.5, 'w6', TRUE, '2000-08-16'), (1949, 100, 6.0, 'w13', TRUE, '2000-08-27'), (1950, 36, 0.0, 'w20', FALSE, '2000-09-07'), (1951, 73, 0.5, 'w27', TRUE, '2000-09-18'), (1952, 9, 1.0, 'w5', TRUE, '2000-09-29'), (1953, 46, 1.5, 'w12', FALSE, '2000-10-10'), (1954, 83, 2.0, 'w19', TRUE, '2000-10-21'), (1955, 19, 2.5, 'w26', TRUE, '2000-11-01'), (1956, 56, 3.0, 'w4', FALSE, '2000-11-12'), (1957, 93, 3.5, 'w11', TRUE, '2000-11-23'), (1958, 29, 4.0, 'w18', TRUE, '2000-12-04'), (1959, 66, 4.5, 'w25', FALSE, '2000-12-15'), (1960, 2, 5.0, 'w3', TRUE, '2000-12-26'), (1961, 39, 5.5, 'w10', TRUE, '2001-01-06'), (1962, 76, 6.0, 'w17', FALSE, '2001-01-17'), (1963, 12, 0.0, 'w24', TRUE, '2001-01-28'), (1964, 49, 0.5, 'w2', TRUE, '2000-01-05'), (1965, 86, 1.0, 'w9', FALSE, '2000-01-16'), (1966, 22, 1.5, 'w16', TRUE, '2000-01-27'), (1967, 59, 2.0, 'w23', TRUE, '2000-02-07'), (1968, 96, 2.5, 'w1', FALSE, '2000-02-18'), (1969, 32, 3.0, 'w8', TRUE, '2000-02-29'), (1970, 69, 3.5, 'w15', TRUE, '2000-03-11'), (1971, 5, 4.0, 'w22', FALSE, '2000-03-22'), (1972, 42, 4.5, 'w0', TRUE, '2000-04-02'), (1973, 79, 5.0, 'w7', TRUE, '2000-04-13'), (1974, 15, 5.5, 'w14', FALSE, '2000-04-24'), (1975, 52, 6.0, 'w21', TRUE, '2000-05-05'), (1976, 89, 0.0, 'w28', TRUE, '2000-05-16'), (1977, 25, 0.5, 'w6', FALSE, '2000-05-27'), (1978, 62, 1.0, 'w13', TRUE, '2000-06-07'), (1979, 99, 1.5, 'w20', TRUE, '2000-06-18'), (1980, 35, 2.0, 'w27', FALSE, '2000-06-29'), (1981, 72, 2.5, 'w5', TRUE, '2000-07-10'), (1982, 8, 3.0, 'w12', TRUE, '2000-07-21'), (1983, 45, 3.5, 'w19', FALSE, '2000-08-01'), (1984, 82, 4.0, 'w26', TRUE, '2000-08-12'), (1985, 18, 4.5, 'w4', TRUE, '2000-08-23'), (1986, 55, 5.0, 'w11', FALSE, '2000-09-03'), (1987, 92, 5.5, 'w18', TRUE, '2000-09-14'), (1988, 28, 6.0, 'w25', TRUE, '2000-09-25'), (1989, 65, 0.0, 'w3', FALSE, '2000-10-06'), (1990, 1, 0.5, 'w10', TRUE, '2000-10-17'), (1991, 38, 1.0, 'w17', TRUE, '2000-10-28'), (1992, 75, 1.5, 'w24', FALSE, '2000-11-08'), (1993, 11, 2.0, 'w2', TRUE, '2000-11-19'), (1994, 48, 2.5, 'w9', TRUE, '2000-11-30'), (1995, 85, 3.0, 'w16', FALSE, '2000-12-11'), (1996, 21, 3.5, 'w23', TRUE, '2000-12-22'), (1997, 58, 4.0, 'w1', TRUE, '2001-01-02'), (1998, 95, 4.5, 'w8', FALSE, '2001-01-13'), (1999, 31, 5.0, 'w15', TRUE, '2001-01-24'), (2000, 68, 5.5, 'w22', TRUE, '2000-01-01'), (2001, 4, 6.0, 'w0', FALSE, '2000-01-12'), (2002, 41, 0.0, 'w7', TRUE, '2000-01-23'), (2003, 78, 0.5, 'w14', TRUE, '2000-02-03'), (2004, 14, 1.0, 'w21', FALSE, '2000-02-14'), (2005, 51, 1.5, 'w28', TRUE, '2000-02-25'), (2006, 88, 2.0, 'w6', TRUE, '2000-03-07'), (2007, 24, 2.5, 'w13', FALSE, '2000-03-18'), (2008, 61, 3.0, 'w20', TRUE, '2000-03-29'), (2009, 98, 3.5, 'w27', TRUE, '2000-04-09'), (2010, 34, 4.0, 'w5', FALSE, '2000-04-20'), (2011, 71, 4.5, 'w12', TRUE, '2000-05-01'), (2012, 7, 5.0, 'w19', TRUE, '2000-05-12'), (2013, 44, 5.5, 'w26', FALSE, '2000-05-23'), (2014, 81, 6.0, 'w4', TRUE, '2000-06-03'), (2015, 17, 0.0, 'w11', TRUE, '2000-06-14'), (2016, 54, 0.5, 'w18', FALSE, '2000-06-25'), (2017, 91, 1.0, 'w25', TRUE, '2000-07-06'), (2018, 27, 1.5, 'w3', TRUE, '2000-07-17'), (2019, 64, 2.0, 'w10', FALSE, '2000-07-28'), (2020, 0, 2.5, 'w17', TRUE, '2000-08-08'), (2021, 37, 3.0, 'w24', TRUE, '2000-08-19'), (2022, 74, 3.5, 'w2', FALSE, '2000-08-30'), (2023, 10, 4.0, 'w9', TRUE, '2000-09-10'), (2024, 47, 4.5, 'w16', TRUE, '2000-09-21'), (2025, 84, 5.0, 'w23', FALSE, '2000-10-02'), (2026, 20, 5.5, 'w1', TRUE, '2000-10-13'), (2027, 57, 6.0, 'w8', TRUE, '2000-10-24'), (2028, 94, 0.0, 'w15', FALSE, '2000-11-04'), (2029, 30, 0.5, 'w22', TRUE, '2000-11-15'), (2030, 67, 1.0, 'w0', TRUE, '2000-11-26'), (2031, 3, 1.5, 'w7', FALSE, '2000-12-07'), (2032, 40, 2.0, 'w14', TRUE, '2000-12-18'), (2033, 77, 2.5, 'w21', TRUE, '2000-12-29'), (2034, 13, 3.0, 'w28', FALSE, '2001-01-09'), (2035, 50, 3.5, 'w6', TRUE, '2001-01-20'), (2036, 87, 4.0, 'w13', TRUE, '2001-01-31'), (2037, 23, 4.5, 'w20', FALSE, '2000-01-08'), (2038, 60, 5.0, 'w27', TRUE, '2000-01-19'), (2039, 97, 5.5, 'w5', TRUE, '2000-01-30'), (2040, 33, 6.0, 'w12', FALSE, '2000-02-10'), (2041, 70, 0.0, 'w19', TRUE, '2000-02-21'), (2042, 6, 0.5, 'w26', TRUE, '2000-03-03'), (2043, 43, 1.0, 'w4', FALSE, '2000-03-14'), (2044, 80, 1.5, 'w11', TRUE, '2000-03-25'), (2045, 16, 2.0, 'w18', TRUE, '2000-04-05'), (2046, 53, 2.5, 'w25', FALSE, '2000-04-16'), (2047, 90, 3.0, 'w3', TRUE, '2000-04-27'), (2048, 26, 3.5, 'w10', TRUE, '2000-05-08'), (2049, 63, 4.0, 'w17', FALSE, '2000-05-19'), (2050, 100, 4.5, 'w24', TRUE, '2000-05-30'), (2051, 36, 5.0, 'w2', TRUE, '2000-06-10'), (2052, 73, 5.5, 'w9', FALSE, '2000-06-21'), (2053, 9, 6.0, 'w16', TRUE, '2000-07-02'), (2054, 46, 0.0, 'w23', TRUE, '2000-07-13'), (2055, 83, 0.5, 'w1', FALSE, '2000-07-24'), (2056, 19, 1.0, 'w8', TRUE, '2000-08-04'), (2057, 56, 1.5, 'w15', TRUE, '2000-08-15'), (2058, 93, 2.0, 'w22', FALSE, '2000-08-26'), (2059, 29, 2.5, 'w0', TRUE, '2000-09-06'), (2060, 66, 3.0, 'w7', TRUE, '2000-09-17'), (2061, 2, 3.5, 'w14', FALSE, '2000-09-28'), (2062, 39, 4.0, 'w21', TRUE, '2000-10-09'), (2063, 76, 4.5, 'w28', TRUE, '2000-10-20'), (2064, 12, 5.0, 'w6', FALSE, '2000-10-31'), (2065, 49, 5.5, 'w13', TRUE, '2000-11-11'), (2066, 86, 6.0, 'w20', TRUE, '2000-11-22'), (2067, 22, 0.0, 'w27', FALSE, '2000-12-03'), (2068, 59, 0.5, 'w5', TRUE, '2000-12-14'), (2069, 96, 1.0, 'w12', TRUE, '2000-12-25'), (2070, 32, 1.5, 'w19', FALSE, '2001-01-05'), (2071, 69, 2.0, 'w26', TRUE, '2001-01-16'), (2072, 5, 2.5, 'w4', TRUE, '2001-01-27'), (2073, 42, 3.0, 'w11', FALSE, '2000-01-04'), (2074, 79, 3.5, 'w18', TRUE, '2000-01-15'), (2075, 15, 4.0, 'w25', TRUE, '2000-01-26'), (2076, 52, 4.5, 'w3', FALSE, '2000-02-06'), (2077, 89, 5.0, 'w10', TRUE, '2000-02-17'), (2078, 25, 5.5, 'w17', TRUE, '2000-02-28'), (2079, 62, 6.0, 'w24', FALSE, '2000-03-10'), (2080, 99, 0.0, 'w2', TRUE, '2000-03-21'), (2081, 35, 0.5, 'w9', TRUE, '2000-04-01'), (2082, 72, 1.0, 'w16', FALSE, '2000-04-12'), (2083, 8, 1.5, 'w23', TRUE, '2000-04-23'), (2084, 45, 2.0, 'w1', TRUE, '2000-05-04'), (2085, 82, 2.5, 'w8', FALSE, '2000-05-15'), (2086, 18, 3.0, 'w15', TRUE, '2000-05-26'), (2087, 55, 3.5, 'w22', TRUE, '2000-06-06'), (2088, 92, 4.0, 'w0', FALSE, '2000-06-17'), (2089, 28, 4.5, 'w7', TRUE, '2000-06-28'), (2090, 65, 5.0, 'w14', TRUE, '2000-07-09'), (2091, 1, 5.5, 'w21', FALSE, '2000-07-20'), (2092, 38, 6.0, 'w28', TRUE, '2000-07-31'), (2093, 75, 0.0, 'w6', TRUE, '2000-08-11'), (2094, 11, 0.5, 'w13', FALSE, '2000-08-22'), (2095, 48, 1.0, 'w20', TRUE, '2000-09-02'), (2096, 85, 1.5, 'w27', TRUE, '2000-09-13'), (2097, 21, 2.0, 'w5', FALSE, '2000-09-24'), (2098, 58, 2.5, 'w12', TRUE, '2000-10-05'), (2099, 95, 3.0, 'w19', TRUE, '2000-10-16'), (2100, 31, 3.5, 'w26', FALSE, '2000-10-27'), (2101, 68, 4.0, 'w4', TRUE, '2000-11-07'), (2102, 4, 4.5, 'w11', TRUE, '2000-11-18'), (2103, 41, 5.0, 'w18', FALSE, '2000-11-29'), (2104, 78, 5.5, 'w25', TRUE, '2000-12-10'), (2105, 14, 6.0, 'w3', TRUE, '2000-12-21'), (2106, 51, 0.0, 'w10', FALSE, '2001-01-01'), (2107, 88, 0.5, 'w17', TRUE, '2001-01-12'), (2108, 24, 1.0, 'w24', TRUE, '2001-01-23'), (2109, 61, 1.5, 'w2', FALSE, '2001-02-03'), (2110, 98, 2.0, 'w9', TRUE, '2000-01-11'), (2111, 34, 2.5, 'w16', TRUE, '2000-01-22'), (2112, 71, 3.0, 'w23', FALSE, '2000-02-02'), (2113, 7, 3.5, 'w1', TRUE, '2000-02-13'), (2114, 44, 4.0, 'w8', TRUE, '2000-02-24'), (2115, 81, 4.5, 'w15', FALSE, '2000-03-06'), (2116, 17, 5.0, 'w22', TRUE, '2000-03-17'), (2117, 54, 5.5, 'w0', TRUE, '2000-03-28'), (2118, 91, 6.0, 'w7', FALSE, '2000-04-08'), (2119, 27, 0.0, 'w14', TRUE, '2000-04-19'), (2120, 64, 0.5, 'w21', TRUE, '2000-04-30'), (2121, 0, 1.0, 'w28', FALSE, '2000-05-11'), (2122, 37, 1.5, 'w6', TRUE, '2000-05-22'), (2123, 74, 2.0, 'w13', TRUE, '2000-06-02'), (2124, 10, 2.5, 'w20', FALSE, '2000-06-13'), (2125, 47, 3.0, 'w27', TRUE, '2000-06-24'), (2126, 84, 3.5, 'w5', TRUE, '2000-07-05'), (2127, 20, 4.0, 'w12', FALSE, '2000-07-16'), (2128, 57, 4.5, 'w19', TRUE, '2000-07-27'), (2129, 94, 5.0, 'w26', TRUE, '2000-08-07'), (2130, 30, 5.5, 'w4', FALSE, '2000-08-18'), (2131, 67, 6.0, 'w11', TRUE, '2000-08-29'), (2132, 3, 0.0, 'w18', TRUE, '2000-09-09'), (2133, 40, 0.5, 'w25', FALSE, '2000-09-20'), (2134, 77, 1.0, 'w3', TRUE, '2000-10-01'), (2135, 13, 1.5, 'w10', TRUE, '2000-10-12'), (2136, 50, 2.0, 'w17', FALSE, '2000-10-23'), (2137, 87, 2.5, 'w24', TRUE, '2000-11-03'), (2138, 23, 3.0, 'w2', TRUE, '2000-11-14'), (2139, 60, 3.5, 'w9', FALSE, '2000-11-25'), (2140, 97, 4.0, 'w16', TRUE, '2000-12-06'), (2141, 33, 4.5, 'w23', TRUE, '2000-12-17'), (2142, 70, 5.0, 'w1', FALSE, '2000-12-28'), (2143, 6, 5.5, 'w8', TRUE, '2001-01-08'), (2144, 43, 6.0, 'w15', TRUE, '2001-01-19'), (2145, 80, 0.0, 'w22', FALSE, '2001-01-30'), (2146, 16, 0.5, 'w0', TRUE, '2000-01-07'), (2147, 53, 1.0, 'w7', TRUE, '2000-01-18'), (2148, 90, 1.5, 'w14', FALSE, '2000-01-29'), (2149, 26, 2.0, 'w21', TRUE, '2000-02-09'), (2150, 63, 2.5, 'w28', TRUE, '2000-02-20'), (2151, 100, 3.0, 'w6', FALSE, '2000-03-02'), (2152, 36, 3.5, 'w13', TRUE, '2000-03-13'), (2153, 73, 4.0, 'w20', TRUE, '2000-03-24'), (2154, 9, 4.5, 'w27', FALSE, '2000-04-04'), (2155, 46, 5.0, 'w5', TRUE, '2000-04-15'), (2156, 83, 5.5, 'w12', TRUE, '2000-04-26'), (2157, 19, 6.0, 'w19', FALSE, '2000-05-07'), (2158, 56, 0.0, 'w26', TRUE, '2000-05-18'), (2159, 93, 0.5, 'w4', TRUE, '2000-05-29'), (2160, 29, 1.0, 'w11', FALSE, '2000-06-09'), (2161, 66, 1.5, 'w18', TRUE, '2000-06-20'), (2162, 2, 2.0, 'w25', TRUE, '2000-07-01'), (2163, 39, 2.5, 'w3', FALSE, '2000-07-12'), (2164, 76, 3.0, 'w10', TRUE, '2000-07-23'), (2165, 12, 3.5, 'w17', TRUE, '2000-08-03'), (2166, 49, 4.0, 'w24', FALSE, '2000-08-14'), (2167, 86, 4.5, 'w2', TRUE, '2000-08-25'), (2168, 22, 5.0, 'w9', TRUE, '2000-09-05'), (2169, 59, 5.5, 'w16', FALSE, '2000-09-16'), (2170, 96, 6.0, 'w23', TRUE, '2000-09-27'), (2171, 32, 0.0, 'w1', TRUE, '2000-10-08'), (2172, 69, 0.5, 'w8', FALSE, '2000-10-19'), (2173, 5, 1.0, 'w15', TRUE, '2000-10-30'), (2174, 42, 1.5, 'w22', TRUE, '2000-11-10'), (2175, 79, 2.0, 'w0', FALSE, '2000-11-21'), (2176, 15, 2.5, 'w7', TRUE, '2000-12-02'), (2177, 52, 3.0, 'w14', TRUE, '2000-12-13'), (2178, 89, 3.5, 'w21', FALSE, '2000-12-24'), (2179, 25, 4.0, 'w28', TRUE, '2001-01-04'), (2180, 62, 4.5, 'w6', TRUE, '2001-01-15'), (2181, 99, 5.0, 'w13', FALSE, '2001-01-26'), (2182, 35, 5.5, 'w20', TRUE, '2000-01-03'), (2183, 72, 6.0, 'w27', TRUE, '2000-01-14'), (2184, 8, 0.0, 'w5', FALSE, '2000-01-25'), (2185, 45, 0.5, 'w12', TRUE, '2000-02-05'), (2186, 82, 1.0, 'w19', TRUE, '2000-02-16'), (2187, 18, 1.5, 'w26', FALSE, '2000-02-27'), (2188, 55, 2.0, 'w4', TRUE, '2000-03-09'), (2189, 92, 2.5, 'w11', TRUE, '2000-03-20'), (2190, 28, 3.0, 'w18', FALSE, '2000-03-31'), (2191, 65, 3.5, 'w25', TRUE, '2000-04-11'), (2192, 1, 4.0, 'w3', TRUE, '2000-04-22'), (2193, 38, 4.5, 'w10', FALSE, '2000-05-03'), (2194, 75, 5.0, 'w17', TRUE, '2000-05-14'), (2195, 11, 5.5, 'w24', TRUE, '2000-05-25'), (2196, 48, 6.0, 'w2', FALSE, '2000-06-05'), (2197, 85, 0.0, 'w9', TRUE, '2000-06-16'), (2198, 21, 0.5, 'w16', TRUE, '2000-06-27'), (2199, 58, 1.0, 'w23', FALSE, '2000-07-08'), (2200, 95, 1.5, 'w1', TRUE, '2000-07-19'), (2201, 31, 2.0, 'w8', TRUE, '2000-07-30'), (2202, 68, 2.5, 'w15', FALSE, '2000-08-10'), (2203, 4, 3.0, 'w22', TRUE, '2000-08-21'), (2204, 41, 3.5, 'w0', TRUE, '2000-09-01'), (2205, 78, 4.0, 'w7', FALSE, '2000-09-12'), (2206, 14, 4.5, 'w14', TRUE, '2000-09-23'), (2207, 51, 5.0, 'w21', TRUE, '2000-10-04'), (2208, 88, 5.5, 'w28', FALSE, '2000-10-15'), (2209, 24, 6.0, 'w6', TRUE, '2000-10-26'), (2210, 61, 0.0, 'w13', TRUE, '2000-11-06'), (2211, 98, 0.5, 'w20', FALSE, '2000-11-17'), (2212, 34, 1.0, 'w27', TRUE, '2000-11-28'), (2213, 71, 1.5, 'w5', TRUE, '2000-12-09'), (2214, 7, 2.0, 'w12', FALSE, '2000-12-20'), (2215, 44, 2.5, 'w19', TRUE, '2000-12-31'), (2216, 81, 3.0, 'w26', TRUE, '2001-01-11'), (2217, 17, 3.5, 'w4', FALSE, '2001-01-22'), (2218, 54, 4.0, 'w11', TRUE, '2001-02-02'), (2219, 91, 4.5, 'w18', TRUE, '2000-01-10'), (2220, 27, 5.0, 'w25', FALSE, '2000-01-21'), (2221, 64, 5.5, 'w3', TRUE, '2000-02-01'), (2222, 0, 6.0, 'w10', TRUE, '2000-02-12'), (2223, 37, 0.0, 'w17', FALSE, '2000-02-23'), (2224, 74, 0.5, 'w24', TRUE, '2000-03-05'), (2225, 10, 1.0, 'w2', TRUE, '2000-03-16'), (2226, 47, 1.5, 'w9', FALSE, '2000-03-27'), (2227, 84, 2.0, 'w16', TRUE, '2000-04-07'), (2228, 20, 2.5, 'w23', TRUE, '2000-04-18'), (2229, 57, 3.0, 'w1', FALSE, '2000-04-29'), (2230, 94, 3.5, 'w8', TRUE, '2000-05-10'), (2231, 30, 4.0, 'w15', TRUE, '2000-05-21'), (2232, 67, 4.5, 'w22', FALSE, '2000-06-01'), (2233, 3, 5.0, 'w0', TRUE, '2000-06-12'), (2234, 40, 5.5, 'w7', TRUE, '2000-06-23'), (2235, 77, 6.0, 'w14', FALSE, '2000-07-04'), (2236, 13, 0.0, 'w21', TRUE, '2000-07-15'), (2237, 50, 0.5, 'w28', TRUE, '2000-07-26'), (2238, 87, 1.0, 'w6', FALSE, '2000-08-06'), (2239, 23, 1.5, 'w13', TRUE, '2000-08-17'), (2240, 60, 2.0, 'w20', TRUE, '2000-08-28'), (2241, 97, 2.5, 'w27', FALSE, '2000-09-08'), (2242, 33, 3.0, 'w5', TRUE, '2000-09-19'), (2243, 70, 3.5, 'w12', TRUE, '2000-09-30'), (2244, 6, 4.0, 'w19', FALSE, '2000-10-11'), (2245, 43, 4.5, 'w26', TRUE, '2000-10-22'), (2246, 80, 5.0, 'w4', TRUE, '2000-11-02'), (2247, 16, 5.5, 'w11', FALSE, '2000-11-13'), (2248, 53, 6.0, 'w18', TRUE, '2000-11-24'), (2249, 90, 0.0, 'w25', TRUE, '2000-12-05'), (2250, 26, 0.5, 'w3', FALSE, '2000-12-16'), (2251, 63, 1.0, 'w10', TRUE, '2000-12-27'), (2252, 100, 1.5, 'w17', TRUE, '2001-01-07'), (2253, 36, 2.0, 'w24', FALSE, '2001-01-18'), (2254, 73, 2.5, 'w2', TRUE, '2001-01-29'), (2255, 9, 3.0, 'w9', TRUE, '2000-01-06'), (2256, 46, 3.5, 'w16', FALSE, '2000-01-17'), (2257, 83, 4.0, 'w23', TRUE, '2000-01-28'), (2258, 19, 4.5, 'w1', TRUE, '2000-02-08'), (2259, 56, 5.0, 'w8', FALSE, '2000-02-19'), (2260, 93, 5.5, 'w15', TRUE, '2000-03-01'), (2261, 29, 6.0, 'w22', TRUE, '2000-03-12'), (2262, 66, 0.0, 'w0', FALSE, '2000-03-23'), (2263, 2, 0.5, 'w7', TRUE, '2000-04-03'), (2264, 39, 1.0, 'w14', TRUE, '2000-04-14'), (2265, 76, 1.5, 'w21', FALSE, '2000-04-25'), (2266, 12, 2.0, 'w28', TRUE, '2000-05-06'), (2267, 49, 2.5, 'w6', TRUE, '2000-05-17'), (2268, 86, 3.0, 'w13', FALSE, '2000-05-28'), (2269, 22, 3.5, 'w20', TRUE, '2000-06-08'), (2270, 59, 4.0, 'w27', TRUE, '2000-06-19'), (2271, 96, 4.5, 'w5', FALSE, '2000-06-30'), (2272, 32, 5.0, 'w12', TRUE, '2000-07-11'), (2273, 69, 5.5, 'w19', TRUE, '2000-07-22'), (2274, 5, 6.0, 'w26', FALSE, '2000-08-02'), (2275, 42, 0.0, 'w4', TRUE, '2000-08-13'), (2276, 79, 0.5, 'w11', TRUE, '2000-08-24'), (2277, 15, 1.0, 'w18', FALSE, '2000-09-04'), (2278, 52, 1.5, 'w25', TRUE, '2000-09-15'), (2279, 89, 2.0, 'w3', TRUE, '2000-09-26'), (2280, 25, 2.5, 'w10', FALSE, '2000-10-07'), (2281, 62, 3.0, 'w17', TRUE, '2000-10-18'), (2282, 99, 3.5, 'w24', TRUE, '2000-10-29'), (2283, 35, 4.0, 'w2', FALSE, '2000-11-09'), (2284, 72, 4.5, 'w9', TRUE, '2000-11-20'), (2285, 8, 5.0, 'w16', TRUE, '2000-12-01'), (2286, 45, 5.5, 'w23', FALSE, '2000-12-12'), (2287, 82, 6.0, 'w1', TRUE, '2000-12-23'), (2288, 18, 0.0, 'w8', TRUE, '2001-01-03'), (2289, 55, 0.5, 'w15', FALSE, '2001-01-14'), (2290, 92, 1.0, 'w22', TRUE, '2001-01-25'), (2291, 28, 1.5, 'w0', TRUE, '2000-01-02'), (2292, 65, 2.0, 'w7', FALSE, '2000-01-13'), (2293, 1, 2.5, 'w14', TRUE, '2000-01-24'), (2294, 38, 3.0, 'w21', TRUE, '2000-02-04'), (2295, 75, 3.5, 'w28', FALSE, '2000-02-15'), (2296, 11, 4.0, 'w6', TRUE, '2000-02-26'), (2297, 48, 4.5, 'w13', TRUE, '2000-03-08'), (2298, 85, 5.0, 'w20', FALSE, '2000-03-19'), (2299, 21, 5.5, 'w27', TRUE, '2000-03-30'), (2300, 58, 6.0, 'w5', TRUE, '2000-04-10'), (2301, 95, 0.0, 'w12', FALSE, '2000-04-21'), (2302, 31, 0.5, 'w19', TRUE, '2000-05-02'), (2303, 68, 1.0, 'w26', TRUE, '2000-05-13'), (2304, 4, 1.5, 'w4', FALSE, '2000-05-24'), (2305, 41, 2.0, 'w11', TRUE, '2000-06-04'), (2306, 78, 2.5, 'w18', TRUE, '2000-06-15'), (2307, 14, 3.0, 'w25', FALSE, '2000-06-26'), (2308, 51, 3.5, 'w3', TRUE, '2000-07-07'), (2309, 88, 4.0, 'w10', TRUE, '2000-07-18'), (2310, 24, 4.5, 'w17', FALSE, '2000-07-29'), (2311, 61, 5.0, 'w24', TRUE, '2000-08-09'), (2312, 98, 5.5, 'w2', TRUE, '2000-08-20'), (2313, 34, 6.0, 'w9', FALSE, '2000-08-31'), (2314, 71, 0.0, 'w16', TRUE, '2000-09-11'), (2315, 7, 0.5, 'w23', TRUE, '2000-09-22'), (2316, 44, 1.0, 'w1', FALSE, '2000-10-03'), (2317, 81, 1.5, 'w8', TRUE, '2000-10-14'), (2318, 17, 2.0, 'w15', TRUE, '2000-10-25'), (2319, 54, 2.5, 'w22', FALSE, '2000-11-05'), (2320, 91, 3.0, 'w0', TRUE, '2000-11-16'), (2321, 27, 3.5, 'w7', TRUE, '2000-11-27'), (2322, 64, 4.0, 'w14', FALSE, '2000-12-08'), (2323, 0, 4.5, 'w21', TRUE, '2000-12-19'), (2324, 37, 5.0, 'w28', TRUE, '2000-12-30'), (2325, 74, 5.5, 'w6', FALSE, '2001-01-10'), (2326, 10, 6.0, 'w13', TRUE, '2001-01-21'), (2327, 47, 0.0, 'w20', TRUE, '2001-02-01'), (2328, 84, 0.5, 'w27', FALSE, '2000-01-09'), (2329, 20, 1.0, 'w5', TRUE, '2000-01-20'), (2330, 57, 1.5, 'w12', TRUE, '2000-01-31'), (2331, 94, 2.0, 'w19', FALSE, '2000-02-11'), (2332, 30, 2.5, 'w26', TRUE, '2000-02-22'), (2333, 67, 3.0, 'w4', TRUE, '2000-03-04'), (2334, 3, 3.5, 'w11', FALSE, '2000-03-15'), (2335, 40, 4.0, 'w18', TRUE, '2000-03-26'), (2336, 77, 4.5, 'w25', TRUE, '2000-04-06'), (2337, 13, 5.0, 'w3', FALSE, '2000-04-17'), (2338, 50, 5.5, 'w10', TRUE, '2000-04-28'), (2339, 87, 6.0, 'w17', TRUE, '2000-05-09'), (2340, 23, 0.0, 'w24', FALSE, '2000-05-20'), (2341, 60, 0.5, 'w2', TRUE, '2000-05-31'), (2342, 97, 1.0, 'w9', TRUE, '2000-06-11'), (2343, 33, 1.5, 'w16', FALSE, '2000-06-22'), (2344, 70, 2.0, 'w23', TRUE, '2000-07-03'), (2345, 6, 2.5, 'w1', TRUE, '2000-07-14'), (2346, 43, 3.0, 'w8', FALSE, '2000-07-25'), (2347, 80, 3.5, 'w15', TRUE, '2000-08-05'), (2348, 16, 4.0, 'w22', TRUE, '2000-08-16'), (2349, 53, 4.5, 'w0', FALSE, '2000-08-27'), (2350, 90, 5.0, 'w7', TRUE, '2000-09-07'), (2351, 26, 5.5, 'w14', TRUE, '2000-09-18'), (2352, 63, 6.0, 'w21', FALSE, '2000-09-29'), (2353, 100, 0.0, 'w28', TRUE, '2000-10-10'), (2354, 36, 0.5, 'w6', TRUE, '2000-10-21'), (2355, 73, 1.0, 'w13', FALSE, '2000-11-01'), (2356, 9, 1.5, 'w20', TRUE, '2000-11-12'), (2357, 46, 2.0, 'w27', TRUE, '2000-11-23'), (2358, 83, 2.5, 'w5', FALSE, '2000-12-04'), (2359, 19, 3.0, 'w12', TRUE, '2000-12-15'), (2360, 56, 3.5, 'w19', TRUE, '2000-12-26'), (2361, 93, 4.0, 'w26', FALSE, '2001-01-06'), (2362, 29, 4.5, 'w4', TRUE, '2001-01-17'), (2363, 66, 5.0, 'w11', TRUE, '2001-01-28'), (2364, 2, 5.5, 'w18', FALSE, '2000-01-05'), (2365, 39, 6.0, 'w25', TRUE, '2000-01-16'), (2366, 76, 0.0, 'w3', TRUE, '2000-01-27'), (2367, 12, 0.5, 'w10', FALSE, '2000-02-07'), (2368, 49, 1.0, 'w17', TRUE, '2000-02-18'), (2369, 86, 1.5, 'w24', TRUE, '2000-02-29'), (2370, 22, 2.0, 'w2', FALSE, '2000-03-11'), (2371, 59, 2.5, 'w9', TRUE, '2000-03-22'), (2372, 96, 3.0, 'w16', TRUE, '2000-04-02'), (2373, 32, 3.5, 'w23', FALSE, '2000-04-13'), (2374, 69, 4.0, 'w1', TRUE, '2000-04-24'), (2375, 5, 4.5, 'w8', TRUE, '2000-05-05'), (2376, 42, 5.0, 'w15', FALSE, '2000-05-16'), (2377, 79, 5.5, 'w22', TRUE, '2000-05-27'), (2378, 15, 6.0, 'w0', TRUE, '2000-06-07'), (2379, 52, 0.0, 'w7', FALSE, '2000-06-18'), (2380, 89, 0.5, 'w14', TRUE, '2000-06-29'), (2381, 25, 1.0, 'w21', TRUE, '2000-07-10'), (2382, 62, 1.5, 'w28', FALSE, '2000-07-21'), (2383, 99, 2.0, 'w6', TRUE, '2000-08-01'), (2384, 35, 2.5, 'w13', TRUE, '2000-08-12'), (2385, 72, 3.0, 'w20', FALSE, '2000-08-23'), (2386, 8, 3.5, 'w27', TRUE, '2000-09-03'), (2387, 45, 4.0, 'w5', TRUE, '2000-09-14'), (2388, 82, 4.5, 'w12', FALSE, '2000-09-25'), (2389, 18, 5.0, 'w19', TRUE, '2000-10-06'), (2390, 55, 5.5, 'w26', TRUE, '2000-10-17'), (2391, 92, 6.0, 'w4', FALSE, '2000-10-28'), (2392, 28, 0.0, 'w11', TRUE, '2000-11-08'), (2393, 65, 0.5, 'w18', TRUE, '2000-11-19'), (2394, 1, 1.0, 'w25', FALSE, '2000-11-30'), (2395, 38, 1.5, 'w3', TRUE, '2000-12-11'), (2396, 75, 2.0, 'w10', TRUE, '2000-12-22'), (2397, 11, 2.5, 'w17', FALSE, '2001-01-02'), (2398, 48, 3.0, 'w24', TRUE, '2001-01-13'), (2399, 85, 3.5, 'w2', TRUE, '2001-01-24'), (2400, 21, 4.0, 'w9', FALSE, '2000-01-01'), (2401, 58, 4.5, 'w16', TRUE, '2000-01-12'), (2402, 95, 5.0, 'w23', TRUE, '2000-01-23'), (2403, 31, 5.5, 'w1', FALSE, '2000-02-03'), (2404, 68, 6.0, 'w8', TRUE, '2000-02-14'), (2405, 4, 0.0, 'w15', TRUE, '2000-02-25'), (2406, 41, 0.5, 'w22', FALSE, '2000-03-07'), (2407, 78, 1.0, 'w0', TRUE, '2000-03-18'), (2408, 14, 1.5, 'w7', TRUE, '2000-03-29'), (2409, 51, 2.0, 'w14', FALSE, '2000-04-09'), (2410, 88, 2.5, 'w21', TRUE, '2000-04-20'), (2411, 24, 3.0, 'w28', TRUE, '2000-05-01'), (2412, 61, 3.5, 'w6', FALSE, '2000-05-12'), (2413, 98, 4.0, 'w13', TRUE, '2000-05-23'), (2414, 34, 4.5, 'w20', TRUE, '2000-06-03'), (2415, 71, 5.0, 'w27', FALSE, '2000-06-14'), (2416, 7, 5.5, 'w5', TRUE, '2000-06-25'), (2417, 44, 6.0, 'w12', TRUE, '2000-07-06'), (2418, 81, 0.0, 'w19', FALSE, '2000-07-17'), (2419, 17, 0.5, 'w26', TRUE, '2000-07-28'), (2420, 54, 1.0, 'w4', TRUE, '2000-08-08'), (2421, 91, 1.5, 'w11', FALSE, '2000-08-19'), (2422, 27, 2.0, 'w18', TRUE, '2000-08-30'), (2423, 64, 2.5, 'w25', TRUE, '2000-09-10'), (2424, 0, 3.0, 'w3', FALSE, '2000-09-21'), (2425, 37, 3.5, 'w10', TRUE, '2000-10-02'), (2426, 74, 4.0, 'w17', TRUE, '2000-10-13'), (2427, 10, 4.5, 'w24', FALSE, '2000-10-24'), (2428, 47, 5.0, 'w2', TRUE, '2000-11-04'), (2429, 84, 5.5, 'w9', TRUE, '2000-11-15'), (2430, 20, 6.0, 'w16', FALSE, '2000-11-26'), (2431, 57, 0.0, 'w23', TRUE, '2000-12-07'), (2432, 94, 0.5, 'w1', TRUE, '2000-12-18'), (2433, 30, 1.0, 'w8', FALSE, '2000-12-29'), (2434, 67, 1.5, 'w15', TRUE, '2001-01-09'), (2435, 3, 2.0, 'w22', TRUE, '2001-01-20'), (2436, 40, 2.5, 'w0', FALSE, '2001-01-31'), (2437, 77, 3.0, 'w7', TRUE, '2000-01-08'), (2438, 13, 3.5, 'w14', TRUE, '2000-01-19'), (2439, 50, 4.0, 'w21', FALSE, '2000-01-30'), (2440, 87, 4.5, 'w28', TRUE, '2000-02-10'), (2441, 23, 5.0, 'w6', TRUE, '2000-02-21'), (2442, 60, 5.5, 'w13', FALSE, '2000-03-03'), (2443, 97, 6.0, 'w20', TRUE, '2000-03-14'), (2444, 33, 0.0, 'w27', TRUE, '2000-03-25'), (2445, 70, 0.5, 'w5', FALSE, '2000-04-05'), (2446, 6, 1.0, 'w12', TRUE, '2000-04-16'), (2447, 43, 1.5, 'w19', TRUE, '2000-04-27'), (2448, 80, 2.0, 'w26', FALSE, '2000-05-08'), (2449, 16, 2.5, 'w4', TRUE, '2000-05-19'), (2450, 53, 3.0, 'w11', TRUE, '2000-05-30'), (2451, 90, 3.5, 'w18', FALSE, '2000-06-10'), (2452, 26, 4.0, 'w25', TRUE, '2000-06-21'), (2453, 63, 4.5, 'w3', TRUE, '2000-07-02'), (2454, 100, 5.0, 'w10', FALSE, '2000-07-13'), (2455, 36, 5.5, 'w17', TRUE, '2000-07-24'), (2456, 73, 6.0, 'w24', TRUE, '2000-08-04'), (2457, 9, 0.0, 'w2', FALSE, '2000-08-15'), (2458, 46, 0.5, 'w9', TRUE, '2000-08-26'), (2459, 83, 1.0, 'w16', TRUE, '2000-09-06'), (2460, 19, 1.5, 'w23', FALSE, '2000-09-17'), (2461, 56, 2.0, 'w1', TRUE, '2000-09-28'), (2462, 93, 2.5, 'w8', TRUE, '2000-10-09'), (2463, 29, 3.0, 'w15', FALSE, '2000-10-20'), (2464, 66, 3.5, 'w22', TRUE, '2000-10-31'), (2465, 2, 4.0, 'w0', TRUE, '2000-11-11'), (2466, 39, 4.5, 'w7', FALSE, '2000-11-22'), (2467, 76, 5.0, 'w14', TRUE, '2000-12-03'), (2468, 12, 5.5, 'w21', TRUE, '2000-12-14'), (2469, 49, 6.0, 'w28', FALSE, '2000-12-25'), (2470, 86, 0.0, 'w6', TRUE, '2001-01-05'), (2471, 22, 0.5, 'w13', TRUE, '2001-01-16'), (2472, 59, 1.0, 'w20', FALSE, '2001-01-27'), (2473, 96, 1.5, 'w27', TRUE, '2000-01-04'), (2474, 32, 2.0, 'w5', TRUE, '2000-01-15'), (2475, 69, 2.5, 'w12', FALSE, '2000-01-26'), (2476, 5, 3.0, 'w19', TRUE, '2000-02-06'), (2477, 42, 3.5, 'w26', TRUE, '2000-02-17'), (2478, 79, 4.0, 'w4', FALSE, '2000-02-28'), (2479, 15, 4.5, 'w11', TRUE, '2000-03-10'), (2480, 52, 5.0, 'w18', TRUE, '2000-03-21'), (2481, 89, 5.5, 'w25', FALSE, '2000-04-01'), (2482, 25, 6.0, 'w3', TRUE, '2000-04-12'), (2483, 62, 0.0, 'w10', TRUE, '2000-04-23'), (2484, 99, 0.5, 'w17', FALSE, '2000-05-04'), (2485, 35, 1.0, 'w24', TRUE, '2000-05-15'), (2486, 72, 1.5, 'w2', TRUE, '2000-05-26'), (2487, 8, 2.0, 'w9', FALSE, '2000-06-06'), (2488, 45, 2.5, 'w16', TRUE, '2000-06-17'), (2489, 82, 3.0, 'w23', TRUE, '2000-06-28'), (2490, 18, 3.5, 'w1', FALSE, '2000-07-09'), (2491, 55, 4.0, 'w8', TRUE, '2000-07-20'), (2492, 92, 4.5, 'w15', TRUE, '2000-07-31'), (2493, 28, 5.0, 'w22', FALSE, '2000-08-11'), (2494, 65, 5.5, 'w0', TRUE, '2000-08-22'), (2495, 1, 6.0, 'w7', TRUE, '2000-09-02'), (2496, 38, 0.0, 'w14', FALSE, '2000-09-13'), (2497, 75, 0.5, 'w21', TRUE, '2000-09-24'), (2498, 11, 1.0, 'w28', TRUE, '2000-10-05'), (2499, 48, 1.5, 'w6', FALSE, '2000-10-16'), (2500, 85, 2.0, 'w13', TRUE, '2000-10-27'), (2501, 21, 2.5, 'w20', TRUE, '2000-11-07'), (2502, 58, 3.0, 'w27', FALSE, '2000-11-18'), (2503, 95, 3.5, 'w5', TRUE, '2000-11-29'), (2504, 31, 4.0, 'w12', TRUE, '2000-12-10'), (2505, 68, 4.5, 'w19', FALSE, '2000-12-21'), (2506, 4, 5.0, 'w26', TRUE, '2001-01-01'), (2507, 41, 5.5, 'w4', TRUE, '2001-01-12'), (2508, 78, 6.0, 'w11', FALSE, '2001-01-23'), (2509, 14, 0.0, 'w18', TRUE, '2001-02-03'), (2510, 51, 0.5, 'w25', TRUE, '2000-01-11'), (2511, 88, 1.0, 'w3', FALSE, '2000-01-22'), (2512, 24, 1.5, 'w10', TRUE, '2000-02-02'), (2513, 61, 2.0, 'w17', TRUE, '2000-02-13'), (2514, 98, 2.5, 'w24', FALSE, '2000-02-24'), (2515, 34, 3.0, 'w2', TRUE, '2000-03-06'), (2516, 71, 3.5, 'w9', TRUE, '2000-03-17'), (2517, 7, 4.0, 'w16', FALSE, '2000-03-28'), (2518, 44, 4.5, 'w23', TRUE, '2000-04-08'), (2519, 81, 5.0, 'w1', TRUE, '2000-04-19'), (2520, 17, 5.5, 'w8', FALSE, '2000-04-30'), (2521, 54, 6.0, 'w15', TRUE, '2000-05-11'), (2522, 91, 0.0, 'w22', TRUE, '2000-05-22'), (2523, 27, 0.5, 'w0', FALSE, '2000-06-02'), (2524, 64, 1.0, 'w7', TRUE, '2000-06-13'), (2525, 0, 1.5, 'w14', TRUE, '2000-06-24'), (2526, 37, 2.0, 'w21', FALSE, '2000-07-05'), (2527, 74, 2.5, 'w28', TRUE, '2000-07-16'), (2528, 10, 3.0, 'w6', TRUE, '2000-07-27'), (2529, 47, 3.5, 'w13', FALSE, '2000-08-07'), (2530, 84, 4.0, 'w20', TRUE, '2000-08-18'), (2531, 20, 4.5, 'w27', TRUE, '2000-08-29'), (2532, 57, 5.0, 'w5', FALSE, '2000-09-09'), (2533, 94, 5.5, 'w12', TRUE, '2000-09-20'), (2534, 30, 6.0, 'w19', TRUE, '2000-10-01'), (2535, 67, 0.0, 'w26', FALSE, '2000-10-12'), (2536, 3, 0.5, 'w4', TRUE, '2000-10-23'), (2537, 40, 1.0, 'w11', TRUE, '2000-11-03'), (2538, 77, 1.5, 'w18', FALSE, '2000-11-14'), (2539, 13, 2.0, 'w25', TRUE, '2000-11-25'), (2540, 50, 2.5, 'w3', TRUE, '2000-12-06'), (2541, 87, 3.0, 'w10', FALSE, '2000-12-17'), (2542, 23, 3.5, 'w17', TRUE, '2000-12-28'), (2543, 60, 4.0, 'w24', TRUE, '2001-01-08'), (2544, 97, 4.5, 'w2', FALSE, '2001-01-19'), (2545, 33, 5.0, 'w9', TRUE, '2001-01-30'), (2546, 70, 5.5, 'w16', TRUE, '2000-01-07'), (2547, 6, 6.0, 'w23', FALSE, '2000-01-18'), (2548, 43, 0.0, 'w1', TRUE, '2000-01-29'), (2549, 80, 0.5, 'w8', TRUE, '2000-02-09'), (2550, 16, 1.0, 'w15', FALSE, '2000-02-20'), (2551, 53, 1.5, 'w22', TRUE, '2000-03-02'), (2552, 90, 2.0, 'w0', TRUE, '2000-03-13'), (2553, 26, 2.5, 'w7', FALSE, '2000-03-24'), (2554, 63, 3.0, 'w14', TRUE, '2000-04-04'), (2555, 100, 3.5, 'w21', TRUE, '2000-04-15'), (2556, 36, 4.0, 'w28', FALSE, '2000-04-26'), (2557, 73, 4.5, 'w6', TRUE, '2000-05-07'), (2558, 9, 5.0, 'w13', TRUE, '2000-05-18'), (2559, 46, 5.5, 'w20', FALSE, '2000-05-29'), (2560, 83, 6.0, 'w27', TRUE, '2000-06-09'), (2561, 19, 0.0, 'w5', TRUE, '2000-06-20'), (2562, 56, 0.5, 'w12', FALSE, '2000-07-01'), (2563, 93, 1.0, 'w19', TRUE, '2000-07-12'), (2564, 29, 1.5, 'w26', TRUE, '2000-07-23'), (2565, 66, 2.0, 'w4', FALSE, '2000-08-03'), (2566, 2, 2.5, 'w11', TRUE, '2000-08-14'), (2567, 39, 3.0, 'w18', TRUE, '2000-08-25'), (2568, 76, 3.5, 'w25', FALSE, '2000-09-05'), (2569, 12, 4.0, 'w3', TRUE, '2000-09-16'), (2570, 49, 4.5, 'w10', TRUE, '2000-09-27'), (2571, 86, 5.0, 'w17', FALSE, '2000-10-08'), (2572, 22, 5.5, 'w24', TRUE, '2000-10-19'), (2573, 59, 6.0, 'w2', TRUE, '2000-10-30'), (2574, 96, 0.0, 'w9', FALSE, '2000-11-10'), (2575, 32, 0.5, 'w16', TRUE, '2000-11-21'), (2576, 69, 1.0, 'w23', TRUE, '2000-12-02'), (2577, 5, 1.5, 'w1', FALSE, '2000-12-13'), (2578, 42, 2.0, 'w8', TRUE, '2000-12-24'), (2579, 79, 2.5, 'w15', TRUE, '2001-01-04'), (2580, 15, 3.0, 'w22', FALSE, '2001-01-15'), (2581, 52, 3.5, 'w0', TRUE, '2001-01-26'), (2582, 89, 4.0, 'w7', TRUE, '2000-01-03'), (2583, 25, 4.5, 'w14', FALSE, '2000-01-14'), (2584, 62, 5.0, 'w21', TRUE, '2000-01-25'), (2585, 99, 5.5, 'w28', TRUE, '2000-02-05'), (2586, 35, 6.0, 'w6', FALSE, '2000-02-16'), (2587, 72, 0.0, 'w13', TRUE, '2000-02-27'), (2588, 8, 0.5, 'w20', TRUE, '2000-03-09'), (2589, 45, 1.0, 'w27', FALSE, '2000-03-20'), (2590, 82, 1.5, 'w5', TRUE, '2000-03-31'), (2591, 18, 2.0, 'w12', TRUE, '2000-04-11'), (2592, 55, 2.5, 'w19', FALSE, '2000-04-22'), (2593, 92, 3.0, 'w26', TRUE, '2000-05-03'), (2594, 28, 3.5, 'w4', TRUE, '2000-05-14'), (2595, 65, 4.0, 'w11', FALSE, '2000-05-25'), (2596, 1, 4.5, 'w18', TRUE, '2000-06-05'), (2597, 38, 5.0, 'w25', TRUE, '2000-06-16'), (2598, 75, 5.5, 'w3', FALSE, '2000-06-27'), (2599, 11, 6.0, 'w10', TRUE, '2000-07-08'), (2600, 48, 0.0, 'w17', TRUE, '2000-07-19'), (2601, 85, 0.5, 'w24', FALSE, '2000-07-30'), (2602, 21, 1.0, 'w2', TRUE, '2000-08-10'), (2603, 58, 1.5, 'w9', TRUE, '2000-08-21'), (2604, 95, 2.0, 'w16', FALSE, '2000-09-01'), (2605, 31, 2.5, 'w23', TRUE, '2000-09-12'), (2606, 68, 3.0, 'w1', TRUE, '2000-09-23'), (2607, 4, 3.5, 'w8', FALSE, '2000-10-04'), (2608, 41, 4.0, 'w15', TRUE, '2000-10-15'), (2609, 78, 4.5, 'w22', TRUE, '2000-10-26'), (2610, 14, 5.0, 'w0', FALSE, '2000-11-06'), (2611, 51, 5.5, 'w7', TRUE, '2000-11-17'), (2612, 88, 6.0, 'w14', TRUE, '2000-11-28'), (2613, 24, 0.0, 'w21', FALSE, '2000-12-09'), (2614, 61, 0.5, 'w28', TRUE, '2000-12-20'), (2615, 98, 1.0, 'w6', TRUE, '2000-12-31'), (2616, 34, 1.5, 'w13', FALSE, '2001-01-11'), (2617, 71, 2.0, 'w20', TRUE, '2001-01-22'), (2618, 7, 2.5, 'w27', TRUE, '2001-02-02'), (2619, 44, 3.0, 'w5', FALSE, '2000-01-10'), (2620, 81, 3.5, 'w12', TRUE, '2000-01-21'), (2621, 17, 4.0, 'w19', TRUE, '2000-02-01'), (2622, 54, 4.5, 'w26', FALSE, '2000-02-12'), (2623, 91, 5.0, 'w4', TRUE, '2000-02-23'), (2624, 27, 5.5, 'w11', TRUE, '2000-03-05'), (2625, 64, 6.0, 'w18', FALSE, '2000-03-16'), (2626, 0, 0.0, 'w25', TRUE, '2000-03-27'), (2627, 37, 0.5, 'w3', TRUE, '2000-04-07'), (2628, 74, 1.0, 'w10', FALSE, '2000-04-18'), (2629, 10, 1.5, 'w17', TRUE, '2000-04-29'), (2630, 47, 2.0, 'w24', TRUE, '2000-05-10'), (2631, 84, 2.5, 'w2', FALSE, '2000-05-21'), (2632, 20, 3.0, 'w9', TRUE, '2000-06-01'), (2633, 57, 3.5, 'w16', TRUE, '2000-06-12'), (2634, 94, 4.0, 'w23', FALSE, '2000-06-23'), (2635, 30, 4.5, 'w1', TRUE, '2000-07-04'), (2636, 67, 5.0, 'w8', TRUE, '2000-07-15'), (2637, 3, 5.5, 'w15', FALSE, '2000-07-26'), (2638, 40, 6.0, 'w22', TRUE, '2000-08-06'), (2639, 77, 0.0, 'w0', TRUE, '2000-08-17'), (2640, 13, 0.5, 'w7', FALSE, '2000-08-28'), (2641, 50, 1.0, 'w14', TRUE, '2000-09-08'), (2642, 87, 1.5, 'w21', TRUE, '2000-09-19'), (2643, 23, 2.0, 'w28', FALSE, '2000-09-30'), (2644, 60, 2.5, 'w6', TRUE, '2000-10-11'), (2645, 97, 3.0, 'w13', TRUE, '2000-10-22'), (2646, 33, 3.5, 'w20', FALSE, '2000-11-02'), (2647, 70, 4.0, 'w27', TRUE, '2000-11-13'), (2648, 6, 4.5, 'w5', TRUE, '2000-11-24'), (2649, 43, 5.0, 'w12', FALSE, '2000-12-05'), (2650, 80, 5.5, 'w19', TRUE, '2000-12-16'), (2651, 16, 6.0, 'w26', TRUE, '2000-12-27'), (2652, 53, 0.0, 'w4', FALSE, '2001-01-07'), (2653, 90, 0.5, 'w11', TRUE, '2001-01-18'), (2654, 26, 1.0, 'w18', TRUE, '2001-01-29'), (2655, 63, 1.5, 'w25', FALSE, '2000-01-06'), (2656, 100, 2.0, 'w3', TRUE, '2000-01-17'), (2657, 36, 2.5, 'w10', TRUE, '2000-01-28'), (2658, 73, 3.0, 'w17', FALSE, '2000-02-08'), (2659, 9, 3.5, 'w24', TRUE, '2000-02-19'), (2660, 46, 4.0, 'w2', TRUE, '2000-03-01'), (2661, 83, 4.5, 'w9', FALSE, '2000-03-12'), (2662, 19, 5.0, 'w16', TRUE, '2000-03-23'), (2663, 56, 5.5, 'w23', TRUE, '2000-04-03'), (2664, 93, 6.0, 'w1', FALSE, '2000-04-14'), (2665, 29, 0.0, 'w8', TRUE, '2000-04-25'), (2666, 66, 0.5, 'w15', TRUE, '2000-05-06'), (2667, 2, 1.0, 'w22', FALSE, '2000-05-17'), (2668, 39, 1.5, 'w0', TRUE, '2000-05-28'), (2669, 76, 2.0, 'w7', TRUE, '2000-06-08'), (2670, 12, 2.5, 'w14', FALSE, '2000-06-19'), (2671, 49, 3.0, 'w21', TRUE, '2000-06-30'), (2672, 86, 3.5, 'w28', TRUE, '2000-07-11'), (2673, 22, 4.0, 'w6', FALSE, '2000-07-22'), (2674, 59, 4.5, 'w13', TRUE, '2000-08-02'), (2675, 96, 5.0, 'w20', TRUE, '2000-08-13'), (2676, 32, 5.5, 'w27', FALSE, '2000-08-24'), (2677, 69, 6.0, 'w5', TRUE, '2000-09-04'), (2678, 5, 0.0, 'w12', TRUE, '2000-09-15'), (2679, 42, 0.5, 'w19', FALSE, '2000-09-26'), (2680, 79, 1.0, 'w26', TRUE, '2000-10-07'), (2681, 15, 1.5, 'w4', TRUE, '2000-10-18'), (2682, 52, 2.0, 'w11', FALSE, '2000-10-29'), (2683, 89, 2.5, 'w18', TRUE, '2000-11-09'), (2684, 25, 3.0, 'w25', TRUE, '2000-11-20'), (2685, 62, 3.5, 'w3', FALSE, '2000-12-01'), (2686, 99, 4.0, 'w10', TRUE, '2000-12-12'), (2687, 35, 4.5, 'w17', TRUE, '2000-12-23'), (2688, 72, 5.0, 'w24', FALSE, '2001-01-03'), (2689, 8, 5.5, 'w2', TRUE, '2001-01-14'), (2690, 45, 6.0, 'w9', TRUE, '2001-01-25'), (2691, 82, 0.0, 'w16', FALSE, '2000-01-02'), (2692, 18, 0.5, 'w23', TRUE, '2000-01-13'), (2693, 55, 1.0, 'w1', TRUE, '2000-01-24'), (2694, 92, 1.5, 'w8', FALSE, '2000-02-04'), (2695, 28, 2.0, 'w15', TRUE, '2000-02-15'), (2696, 65, 2.5, 'w22', TRUE, '2000-02-26'), (2697, 1, 3.0, 'w0', FALSE, '2000-03-08'), (2698, 38, 3.5, 'w7', TRUE, '2000-03-19'), (2699, 75, 4.0, 'w14', TRUE, '2000-03-30'), (2700, 11, 4.5, 'w21', FALSE, '2000-04-10'), (2701, 48, 5.0, 'w28', TRUE, '2000-04-21'), (2702, 85, 5.5, 'w6', TRUE, '2000-05-02'), (2703, 21, 6.0, 'w13', FALSE, '2000-05-13'), (2704, 58, 0.0, 'w20', TRUE, '2000-05-24'), (2705, 95, 0.5, 'w27', TRUE, '2000-06-04'), (2706, 31, 1.0, 'w5', FALSE, '2000-06-15'), (2707, 68, 1.5, 'w12', TRUE, '2000-06-26'), (2708, 4, 2.0, 'w19', TRUE, '2000-07-07'), (2709, 41, 2.5, 'w26', FALSE, '2000-07-18'), (2710, 78, 3.0, 'w4', TRUE, '2000-07-29'), (2711, 14, 3.5, 'w11', TRUE, '2000-08-09'), (2712, 51, 4.0, 'w18', FALSE, '2000-08-20'), (2713, 88, 4.5, 'w25', TRUE, '2000-08-31'), (2714, 24, 5.0, 'w3', TRUE, '2000-09-11'), (2715, 61, 5.5, 'w10', FALSE, '2000-09-22'), (2716, 98, 6.0, 'w17', TRUE, '2000-10-03'), (2717, 34, 0.0, 'w24', TRUE, '2000-10-14'), (2718, 71, 0.5, 'w2', FALSE, '2000-10-25'), (2719, 7, 1.0, 'w9', TRUE, '2000-11-05'), (2720, 44, 1.5, 'w16', TRUE, '2000-11-16'), (2721, 81, 2.0, 'w23', FALSE, '2000-11-27'), (2722, 17, 2.5, 'w1', TRUE, '2000-12-08'), (2723, 54, 3.0, 'w8', TRUE, '2000-12-19'), (2724, 91, 3.5, 'w15', FALSE, '2000-12-30'), (2725, 27, 4.0, 'w22', TRUE, '2001-01-10'), (2726, 64, 4.5, 'w0', TRUE, '2001-01-21'), (2727, 0, 5.0, 'w7', FALSE, '2001-02-01'), (2728, 37, 5.5, 'w14', TRUE, '2000-01-09'), (2729, 74, 6.0, 'w21', TRUE, '2000-01-20'), (2730, 10, 0.0, 'w28', FALSE, '2000-01-31'), (2731, 47, 0.5, 'w6', TRUE, '2000-02-11'), (2732, 84, 1.0, 'w13', TRUE, '2000-02-22'), (2733, 20, 1.5, 'w20', FALSE, '2000-03-04'), (2734, 57, 2.0, 'w27', TRUE, '2000-03-15'), (2735, 94, 2.5, 'w5', TRUE, '2000-03-26'), (2736, 30, 3.0, 'w12', FALSE, '2000-04-06'), (2737, 67, 3.5, 'w19', TRUE, '2000-04-17'), (2738, 3, 4.0, 'w26', TRUE, '2000-04-28'), (2739, 40, 4.5, 'w4', FALSE, '2000-05-09'), (2740, 77, 5.0, 'w11', TRUE, '2000-05-20'), (2741, 13, 5.5, 'w18', TRUE, '2000-05-31'), (2742, 50, 6.0, 'w25', FALSE, '2000-06-11'), (2743, 87, 0.0, 'w3', TRUE, '2000-06-22'), (2744, 23, 0.5, 'w10', TRUE, '2000-07-03'), (2745, 60, 1.0, 'w17', FALSE, '2000-07-14'), (2746, 97, 1.5, 'w24', TRUE, '2000-07-25'), (2747, 33, 2.0, 'w2', TRUE, '2000-08-05'), (2748, 70, 2.5, 'w9', FALSE, '2000-08-16'), (2749, 6, 3.0, 'w16', TRUE, '2000-08-27'), (2750, 43, 3.5, 'w23', TRUE, '2000-09-07'), (2751, 80, 4.0, 'w1', FALSE, '2000-09-18'), (2752, 16, 4.5, 'w8', TRUE, '2000-09-29'), (2753, 53, 5.0, 'w15', TRUE, '2000-10-10'), (2754, 90, 5.5, 'w22', FALSE, '2000-10-21'), (2755, 26, 6.0, 'w0', TRUE, '2000-11-01'), (2756, 63, 0.0, 'w7', TRUE, '2000-11-12'), (2757, 100, 0.5, 'w14', FALSE, '2000-11-23'), (2758, 36, 1.0, 'w21', TRUE, '2000-12-04'), (2759, 73, 1.5, 'w28', TRUE, '2000-12-15'), (2760, 9, 2.0, 'w6', FALSE, '2000-12-26'), (2761, 46, 2.5, 'w13', TRUE, '2001-01-06'), (2762, 83, 3.0, 'w20', TRUE, '2001-01-17'), (2763, 19, 3.5, 'w27', FALSE, '2001-01-28'), (2764, 56, 4.0, 'w5', TRUE, '2000-01-05'), (2765, 93, 4.5, 'w12', TRUE, '2000-01-16'), (2766, 29, 5.0, 'w19', FALSE, '2000-01-27'), (2767, 66, 5.5, 'w26', TRUE, '2000-02-07'), (2768, 2, 6.0, 'w4', TRUE, '2000-02-18'), (2769, 39, 0.0, 'w11', FALSE, '2000-02-29'), (2770, 76, 0.5, 'w18', TRUE, '2000-03-11'), (2771, 12, 1.0, 'w25', TRUE, '2000-03-22'), (2772, 49, 1.5, 'w3', FALSE, '2000-04-02'), (2773, 86, 2.0, 'w10', TRUE, '2000-04-13'), (2774, 22, 2.5, 'w17', TRUE, '2000-04-24'), (2775, 59, 3.0, 'w24', FALSE, '2000-05-05'), (2776, 96, 3.5, 'w2', TRUE, '2000-05-16'), (2777, 32, 4.0, 'w9', TRUE, '2000-05-27'), (2778, 69, 4.5, 'w16', FALSE, '2000-06-07'), (2779, 5, 5.0, 'w23', TRUE, '2000-06-18'), (2780, 42, 5.5, 'w1', TRUE, '2000-06-29'), (2781, 79, 6.0, 'w8', FALSE, '2000-07-10'), (2782, 15, 0.0, 'w15', TRUE, '2000-07-21'), (2783, 52, 0.5, 'w22', TRUE, '2000-08-01'), (2784, 89, 1.0, 'w0', FALSE, '2000-08-12'), (2785, 25, 1.5, 'w7', TRUE, '2000-08-23'), (2786, 62, 2.0, 'w14', TRUE, '2000-09-03'), (2787, 99, 2.5, 'w21', FALSE, '2000-09-14'), (2788, 35, 3.0, 'w28', TRUE, '2000-09-25'), (2789, 72, 3.5, 'w6', TRUE, '2000-10-06'), (2790, 8, 4.0, 'w13', FALSE, '2000-10-17'), (2791, 45, 4.5, 'w20', TRUE, '2000-10-28'), (2792, 82, 5.0, 'w27', TRUE, '2000-11-08'), (2793, 18, 5.5, 'w5', FALSE, '2000-11-19'), (2794, 55, 6.0, 'w12', TRUE, '2000-11-30'), (2795, 92, 0.0, 'w19', TRUE, '2000-12-11'), (2796, 28, 0.5, 'w26', FALSE, '2000-12-22'), (2797, 65, 1.0, 'w4', TRUE, '2001-01-02'), (2798, 1, 1.5, 'w11', TRUE, '2001-01-13'), (2799, 38, 2.0, 'w18', FALSE, '2001-01-24'), (2800, 75, 2.5, 'w25', TRUE, '2000-01-01'), (2801, 11, 3.0, 'w3', TRUE, '2000-01-12'), (2802, 48, 3.5, 'w10', FALSE, '2000-01-23'), (2803, 85, 4.0, 'w17', TRUE, '2000-02-03'), (2804, 21, 4.5, 'w24', TRUE, '2000-02-14'), (2805, 58, 5.0, 'w2', FALSE, '2000-02-25'), (2806, 95, 5.5, 'w9', TRUE, '2000-03-07'), (2807, 31, 6.0, 'w16', TRUE, '2000-03-18'), (2808, 68, 0.0, 'w23', FALSE, '2000-03-29'), (2809, 4, 0.5, 'w1', TRUE, '2000-04-09'), (2810, 41, 1.0, 'w8', TRUE, '2000-04-20'), (2811, 78, 1.5, 'w15', FALSE, '2000-05-01'), (2812, 14, 2.0, 'w22', TRUE, '2000-05-12'), (2813, 51, 2.5, 'w0', TRUE, '2000-05-23'), (2814, 88, 3.0, 'w7', FALSE, '2000-06-03'), (2815, 24, 3.5, 'w14', TRUE, '2000-06-14'), (2816, 61, 4.0, 'w21', TRUE, '2000-06-25'), (2817, 98, 4.5, 'w28', FALSE, '2000-07-06'), (2818, 34, 5.0, 'w6', TRUE, '2000-07-17'), (2819, 71, 5.5, 'w13', TRUE, '2000-07-28'), (2820, 7, 6.0, 'w20', FALSE, '2000-08-08'), (2821, 44, 0.0, 'w27', TRUE, '2000-08-19'), (2822, 81, 0.5, 'w5', TRUE, '2000-08-30'), (2823, 17, 1.0, 'w12', FALSE, '2000-09-10'), (2824, 54, 1.5, 'w19', TRUE, '2000-09-21'), (2825, 91, 2.0, 'w26', TRUE, '2000-10-02'), (2826, 27, 2.5, 'w4', FALSE, '2000-10-13'), (2827, 64, 3.0, 'w11', TRUE, '2000-10-24'), (2828, 0, 3.5, 'w18', TRUE, '2000-11-04'), (2829, 37, 4.0, 'w25', FALSE, '2000-11-15'), (2830, 74, 4.5, 'w3', TRUE, '2000-11-26'), (2831, 10, 5.0, 'w10', TRUE, '2000-12-07'), (2832, 47, 5.5, 'w17', FALSE, '2000-12-18'), (2833, 84, 6.0, 'w24', TRUE, '2000-12-29'), (2834, 20, 0.0, 'w2', TRUE, '2001-01-09'), (2835, 57, 0.5, 'w9', FALSE, '2001-01-20'), (2836, 94, 1.0, 'w16', TRUE, '2001-01-31'), (2837, 30, 1.5, 'w23', TRUE, '2000-01-08'), (2838, 67, 2.0, 'w1', FALSE, '2000-01-19'), (2839, 3, 2.5, 'w8', TRUE, '2000-01-30'), (2840, 40, 3.0, 'w15', TRUE, '2000-02-10'), (2841, 77, 3.5, 'w22', FALSE, '2000-02-21'), (2842, 13, 4.0, 'w0', TRUE, '2000-03-03'), (2843, 50, 4.5, 'w7', TRUE, '2000-03-14'), (2844, 87, 5.0, 'w14', FALSE, '2000-03-25'), (2845, 23, 5.5, 'w21', TRUE, '2000-04-05'), (2846, 60, 6.0, 'w28', TRUE, '2000-04-16'), (2847, 97, 0.0, 'w6', FALSE, '2000-04-27'), (2848, 33, 0.5, 'w13', TRUE, '2000-05-08'), (2849, 70, 1.0, 'w20', TRUE, '2000-05-19'), (2850, 6, 1.5, 'w27', FALSE, '2000-05-30'), (2851, 43, 2.0, 'w5', TRUE, '2000-06-10'), (2852, 80, 2.5, 'w12', TRUE, '2000-06-21'), (2853, 16, 3.0, 'w19', FALSE, '2000-07-02'), (2854, 53, 3.5, 'w26', TRUE, '2000-07-13'), (2855, 90, 4.0, 'w4', TRUE, '2000-07-24'), (2856, 26, 4.5, 'w11', FALSE, '2000-08-04'), (2857, 63, 5.0, 'w18', TRUE, '2000-08-15'), (2858, 100, 5.5, 'w25', TRUE, '2000-08-26'), (2859, 36, 6.0, 'w3', FALSE, '2000-09-06'), (2860, 73, 0.0, 'w10', TRUE, '2000-09-17'), (2861, 9, 0.5, 'w17', TRUE, '2000-09-28'), (2862, 46, 1.0, 'w24', FALSE, '2000-10-09'), (2863, 83, 1.5, 'w2', TRUE, '2000-10-20'), (2864, 19, 2.0, 'w9', TRUE, '2000-10-31'), (2865, 56, 2.5, 'w16', FALSE, '2000-11-11'), (2866, 93, 3.0, 'w23', TRUE, '2000-11-22'), (2867, 29, 3.5, 'w1', TRUE, '2000-12-03'), (2868, 66, 4.0, 'w8', FALSE, '2000-12-14'), (2869, 2, 4.5, 'w15', TRUE, '2000-12-25'), (2870, 39, 5.0, 'w22', TRUE, '2001-01-05'), (2871, 76, 5.5, 'w0', FALSE, '2001-01-16'), (2872, 12, 6.0, 'w7', TRUE, '2001-01-27'), (2873, 49, 0.0, 'w14', TRUE, '2000-01-04'), (2874, 86, 0.5, 'w21', FALSE, '2000-01-15'), (2875, 22, 1.0, 'w28', TRUE, '2000-01-26'), (2876, 59, 1.5, 'w6', TRUE, '2000-02-06'), (2877, 96, 2.0, 'w13', FALSE, '2000-02-17'), (2878, 32, 2.5, 'w20', TRUE, '2000-02-28'), (2879, 69, 3.0, 'w27', TRUE, '2000-03-10'), (2880, 5, 3.5, 'w5', FALSE, '2000-03-21'), (2881, 42, 4.0, 'w12', TRUE, '2000-04-01'), (2882, 79, 4.5, 'w19', TRUE, '2000-04-12'), (2883, 15, 5.0, 'w26', FALSE, '2000-04-23'), (2884, 52, 5.5, 'w4', TRUE, '2000-05-04'), (2885, 89, 6.0, 'w11', TRUE, '2000-05-15'), (2886, 25, 0.0, 'w18', FALSE, '2000-05-26'), (2887, 62, 0.5, 'w25', TRUE, '2000-06-06'), (2888, 99, 1.0, 'w3', TRUE, '2000-06-17'), (2889, 35, 1.5, 'w10', FALSE, '2000-06-28'), (2890, 72, 2.0, 'w17', TRUE, '2000-07-09'), (2891, 8, 2.5, 'w24', TRUE, '2000-07-20'), (2892, 45, 3.0, 'w2', FALSE, '2000-07-31'), (2893, 82, 3.5, 'w9', TRUE, '2000-08-11'), (2894, 18, 4.0, 'w16', TRUE, '2000-08-22'), (2895, 55, 4.5, 'w23', FALSE, '2000-09-02'), (2896, 92, 5.0, 'w1', TRUE, '2000-09-13'), (2897, 28, 5.5, 'w8', TRUE, '2000-09-24'), (2898, 65, 6.0, 'w15', FALSE, '2000-10-05'), (2899, 1, 0.0, 'w22', TRUE, '2000-10-16'), (2900, 38, 0.5, 'w0', TRUE, '2000-10-27'), (2901, 75, 1.0, 'w7', FALSE, '2000-11-07'), (2902, 11, 1.5, 'w14', TRUE, '2000-11-18'), (2903, 48, 2.0, 'w21', TRUE, '2000-11-29'), (2904, 85, 2.5, 'w28', FALSE, '2000-12-10'), (2905, 21, 3.0, 'w6', TRUE, '2000-12-21'), (2906, 58, 3.5, 'w13', TRUE, '2001-01-01'), (2907, 95, 4.0, 'w20', FALSE, '2001-01-12'), (2908, 31, 4.5, 'w27', TRUE, '2001-01-23'), (2909, 68, 5.0, 'w5', TRUE, '2001-02-03'), (2910, 4, 5.5, 'w12', FALSE, '2000-01-11'), (2911, 41, 6.0, 'w19', TRUE, '2000-01-22'), (2912, 78, 0.0, 'w26', TRUE, '2000-02-02'), (2913, 14, 0.5, 'w4', FALSE, '2000-02-13'), (2914, 51, 1.0, 'w11', TRUE, '2000-02-24'), (2915, 88, 1.5, 'w18', TRUE, '2000-03-06'), (2916, 24, 2.0, 'w25', FALSE, '2000-03-17'), (2917, 61, 2.5, 'w3', TRUE, '2000-03-28'), (2918, 98, 3.0, 'w10', TRUE, '2000-04-08'), (2919, 34, 3.5, 'w17', FALSE, '2000-04-19'), (2920, 71, 4.0, 'w24', TRUE, '2000-04-30'), (2921, 7, 4.5, 'w2', TRUE, '2000-05-11'), (2922, 44, 5.0, 'w9', FALSE, '2000-05-22'), (2923, 81, 5.5, 'w16', TRUE, '2000-06-02'), (2924, 17, 6.0, 'w23', TRUE, '2000-06-13'), (2925, 54, 0.0, 'w1', FALSE, '2000-06-24'), (2926, 91, 0.5, 'w8', TRUE, '2000-07-05'), (2927, 27, 1.0, 'w15', TRUE, '2000-07-16'), (2928, 64, 1.5, 'w22', FALSE, '2000-07-27'), (2929, 0, 2.0, 'w0', TRUE, '2000-08-07'), (2930, 37, 2.5, 'w7', TRUE, '2000-08-18'), (2931, 74, 3.0, 'w14', FALSE, '2000-08-29'), (2932, 10, 3.5, 'w21', TRUE, '2000-09-09'), (2933, 47, 4.0, 'w28', TRUE, '2000-09-20'), (2934, 84, 4.5, 'w6', FALSE, '2000-10-01'), (2935, 20, 5.0, 'w13', TRUE, '2000-10-12'), (2936, 57, 5.5, 'w20', TRUE, '2000-10-23'), (2937, 94, 6.0, 'w27', FALSE, '2000-11-03'), (2938, 30, 0.0, 'w5', TRUE, '2000-11-14'), (2939, 67, 0.5, 'w12', TRUE, '2000-11-25'), (2940, 3, 1.0, 'w19', FALSE, '2000-12-06'), (2941, 40, 1.5, 'w26', TRUE, '2000-12-17'), (2942, 77, 2.0, 'w4', TRUE, '2000-12-28'), (2943, 13, 2.5, 'w11', FALSE, '2001-01-08'), (2944, 50, 3.0, 'w18', TRUE, '2001-01-19'), (2945, 87, 3.5, 'w25', TRUE, '2001-01-30'), (2946, 23, 4.0, 'w3', FALSE, '2000-01-07'), (2947, 60, 4.5, 'w10', TRUE, '2000-01-18'), (2948, 97, 5.0, 'w17', TRUE, '2000-01-29'), (2949, 33, 5.5, 'w24', FALSE, '2000-02-09'), (2950, 70, 6.0, 'w2', TRUE, '2000-02-20'), (2951, 6, 0.0, 'w9', TRUE, '2000-03-02'), (2952, 43, 0.5, 'w16', FALSE, '2000-03-13'), (2953, 80, 1.0, 'w23', TRUE, '2000-03-24'), (2954, 16, 1.5, 'w1', TRUE, '2000-04-04'), (2955, 53, 2.0, 'w8', FALSE, '2000-04-15'), (2956, 90, 2.5, 'w15', TRUE, '2000-04-26'), (2957, 26, 3.0, 'w22', TRUE, '2000-05-07'), (2958, 63, 3.5, 'w0', FALSE, '2000-05-18'), (2959, 100, 4.0, 'w7', TRUE, '2000-05-29'), (2960, 36, 4.5, 'w14', TRUE, '2000-06-09'), (2961, 73, 5.0, 'w21', FALSE, '2000-06-20'), (2962, 9, 5.5, 'w28', TRUE, '2000-07-01'), (2963, 46, 6.0, 'w6', TRUE, '2000-07-12'), (2964, 83, 0.0, 'w13', FALSE, '2000-07-23'), (2965, 19, 0.5, 'w20', TRUE, '2000-08-03'), (2966, 56, 1.0, 'w27', TRUE, '2000-08-14'), (2967, 93, 1.5, 'w5', FALSE, '2000-08-25'), (2968, 29, 2.0, 'w12', TRUE, '2000-09-05'), (2969, 66, 2.5, 'w19', TRUE, '2000-09-16'), (2970, 2, 3.0, 'w26', FALSE, '2000-09-27'), (2971, 39, 3.5, 'w4', TRUE, '2000-10-08'), (2972, 76, 4.0, 'w11', TRUE, '2000-10-19'), (2973, 12, 4.5, 'w18', FALSE, '2000-10-30'), (2974, 49, 5.0, 'w25', TRUE, '2000-11-10'), (2975, 86, 5.5, 'w3', TRUE, '2000-11-21'), (2976, 22, 6.0, 'w10', FALSE, '2000-12-02'), (2977, 59, 0.0, 'w17', TRUE, '2000-12-13'), (2978, 96, 0.5, 'w24', TRUE, '2000-12-24'), (2979, 32, 1.0, 'w2', FALSE, '2001-01-04'), (2980, 69, 1.5, 'w9', TRUE, '2001-01-15'), (2981, 5, 2.0, 'w16', TRUE, '2001-01-26'), (2982, 42, 2.5, 'w23', FALSE, '2000-01-03'), (2983, 79, 3.0, 'w1', TRUE, '2000-01-14'), (2984, 15, 3.5, 'w8', TRUE, '2000-01-25'), (2985, 52, 4.0, 'w15', FALSE, '2000-02-05'), (2986, 89, 4.5, 'w22', TRUE, '2000-02-16'), (2987, 25, 5.0, 'w0', TRUE, '2000-02-27'), (2988, 62, 5.5, 'w7', FALSE, '2000-03-09'), (2989, 99, 6.0, 'w14', TRUE, '2000-03-20'), (2990, 35, 0.0, 'w21', TRUE, '2000-03-31'), (2991, 72, 0.5, 'w28', FALSE, '2000-04-11'), (2992, 8, 1.0, 'w6', TRUE, '2000-04-22'), (2993, 45, 1.5, 'w13', TRUE, '2000-05-03'), (2994, 82, 2.0, 'w20', FALSE, '2000-05-14'), (2995, 18, 2.5, 'w27', TRUE, '2000-05-25'), (2996, 55, 3.0, 'w5', TRUE, '2000-06-05'), (2997, 92, 3.5, 'w12', FALSE, '2000-06-16'), (2998, 28, 4.0, 'w19', TRUE, '2000-06-27'), (2999, 65, 4.5, 'w26', TRUE, '2000-07-08'), (3000, 1, 5.0, 'w4', FALSE, '2000-07-19'), (3001, 38, 5.5, 'w11', TRUE, '2000-07-30'), (3002, 75, 6.0, 'w18', TRUE, '2000-08-10'), (3003, 11, 0.0, 'w25', FALSE, '2000-08-21'), (3004, 48, 0.5, 'w3', TRUE, '2000-09-01'), (3005, 85, 1.0, 'w10', TRUE, '2000-09-12'), (3006, 21, 1.5, 'w17', FALSE, '2000-09-23'), (3007, 58, 2.0, 'w24', TRUE, '2000-10-04'), (3008, 95, 2.5, 'w2', TRUE, '2000-10-15'), (3009, 31, 3.0, 'w9', FALSE, '2000-10-26'), (3010, 68, 3.5, 'w16', TRUE, '2000-11-06'), (3011, 4, 4.0, 'w23', TRUE, '2000-11-17'), (3012, 41, 4.5, 'w1', FALSE, '2000-11-28'), (3013, 78, 5.0, 'w8', TRUE, '2000-12-09'), (3014, 14, 5.5, 'w15', TRUE, '2000-12-20'), (3015, 51, 6.0, 'w22', FALSE, '2000-12-31'), (3016, 88, 0.0, 'w0', TRUE, '2001-01-11'), (3017, 24, 0.5, 'w7', TRUE, '2001-01-22'), (3018, 61, 1.0, 'w14', FALSE, '2001-02-02'), (3019, 98, 1.5, 'w21', TRUE, '2000-01-10'), (3020, 34, 2.0, 'w28', TRUE, '2000-01-21'), (3021, 71, 2.5, 'w6', FALSE, '2000-02-01'), (3022, 7, 3.0, 'w13', TRUE, '2000-02-12'), (3023, 44, 3.5, 'w20', TRUE, '2000-02-23'), (3024, 81, 4.0, 'w27', FALSE, '2000-03-05'), (3025, 17, 4.5, 'w5', TRUE, '2000-03-16'), (3026, 54, 5.0, 'w12', TRUE, '2000-03-27'), (3027, 91, 5.5, 'w19', FALSE, '2000-04-07'), (3028, 27, 6.0, 'w26', TRUE, '2000-04-18'), (3029, 64, 0.0, 'w4', TRUE, '2000-04-29'), (3030, 0, 0.5, 'w11', FALSE, '2000-05-10'), (3031, 37, 1.0, 'w18', TRUE, '2000-05-21'), (3032, 74, 1.5, 'w25', TRUE, '2000-06-01'), (3033, 10, 2.0, 'w3', FALSE, '2000-06-12'), (3034, 47, 2.5, 'w10', TRUE, '2000-06-23'), (3035, 84, 3.0, 'w17', TRUE, '2000-07-04'), (3036, 20, 3.5, 'w24', FALSE, '2000-07-15'), (3037, 57, 4.0, 'w2', TRUE, '2000-07-26'), (3038, 94, 4.5, 'w9', TRUE, '2000-08-06'), (3039, 30, 5.0, 'w16', FALSE, '2000-08-17'), (3040, 67, 5.5, 'w23', TRUE, '2000-08-28'), (3041, 3, 6.0, 'w1', TRUE, '2000-09-08'), (3042, 40, 0.0, 'w8', FALSE, '2000-09-19'), (3043, 77, 0.5, 'w15', TRUE, '2000-09-30'), (3044, 13, 1.0, 'w22', TRUE, '2000-10-11'), (3045, 50, 1.5, 'w0', FALSE, '2000-10-22'), (3046, 87, 2.0, 'w7', TRUE, '2000-11-02'), (3047, 23, 2.5, 'w14', TRUE, '2000-11-13'), (3048, 60, 3.0, 'w21', FALSE, '2000-11-24'), (3049, 97, 3.5, 'w28', TRUE, '2000-12-05'), (3050, 33, 4.0, 'w6', TRUE, '2000-12-16'), (3051, 70, 4.5, 'w13', FALSE, '2000-12-27'), (3052, 6, 5.0, 'w20', TRUE, '2001-01-07'), (3053, 43, 5.5, 'w27', TRUE, '2001-01-18'), (3054, 80, 6.0, 'w5', FALSE, '2001-01-29'), (3055, 16, 0.0, 'w12', TRUE, '2000-01-06'), (3056, 53, 0.5, 'w19', TRUE, '2000-01-17'), (3057, 90, 1.0, 'w26', FALSE, '2000-01-28'), (3058, 26, 1.5, 'w4', TRUE, '2000-02-08'), (3059, 63, 2.0, 'w11', TRUE, '2000-02-19'), (3060, 100, 2.5, 'w18', FALSE, '2000-03-01'), (3061, 36, 3.0, 'w25', TRUE, '2000-03-12'), (3062, 73, 3.5, 'w3', TRUE, '2000-03-23'), (3063, 9, 4.0, 'w10', FALSE, '2000-04-03'), (3064, 46, 4.5, 'w17', TRUE, '2000-04-14'), (3065, 83, 5.0, 'w24', TRUE, '2000-04-25'), (3066, 19, 5.5, 'w2', FALSE, '2000-05-06'), (3067, 56, 6.0, 'w9', TRUE, '2000-05-17'), (3068, 93, 0.0, 'w16', TRUE, '2000-05-28'), (3069, 29, 0.5, 'w23', FALSE, '2000-06-08'), (3070, 66, 1.0, 'w1', TRUE, '2000-06-19'), (3071, 2, 1.5, 'w8', TRUE, '2000-06-30'), (3072, 39, 2.0, 'w15', FALSE, '2000-07-11'), (3073, 76, 2.5, 'w22', TRUE, '2000-07-22'), (3074, 12, 3.0, 'w0', TRUE, '2000-08-02'), (3075, 49, 3.5, 'w7', FALSE, '2000-08-13'), (3076, 86, 4.0, 'w14', TRUE, '2000-08-24'), (3077, 22, 4.5, 'w21', TRUE, '2000-09-04'), (3078, 59, 5.0, 'w28', FALSE, '2000-09-15'), (3079, 96, 5.5, 'w6', TRUE, '2000-09-26'), (3080, 32, 6.0, 'w13', TRUE, '2000-10-07'), (3081, 69, 0.0, 'w20', FALSE, '2000-10-18'), (3082, 5, 0.5, 'w27', TRUE, '2000-10-29'), (3083, 42, 1.0, 'w5', TRUE, '2000-11-09'), (3084, 79, 1.5, 'w12', FALSE, '2000-11-20'), (3085, 15, 2.0, 'w19', TRUE, '2000-12-01'), (3086, 52, 2.5, 'w26', TRUE, '2000-12-12'), (3087, 89, 3.0, 'w4', FALSE, '2000-12-23'), (3088, 25, 3.5, 'w11', TRUE, '2001-01-03'), (3089, 62, 4.0, 'w18', TRUE, '2001-01-14'), (3090, 99, 4.5, 'w25', FALSE, '2001-01-25'), (3091, 35, 5.0, 'w3', TRUE, '2000-01-02'), (3092, 72, 5.5, 'w10', TRUE, '2000-01-13'), (3093, 8, 6.0, 'w17', FALSE, '2000-01-24'), (3094, 45, 0.0, 'w24', TRUE, '2000-02-04'), (3095, 82, 0.5, 'w2', TRUE, '2000-02-15'), (3096, 18, 1.0, 'w9', FALSE, '2000-02-26'), (3097, 55, 1.5, 'w16', TRUE, '2000-03-08'), (3098, 92, 2.0, 'w23', TRUE, '2000-03-19'), (3099, 28, 2.5, 'w1', FALSE, '2000-03-30'), (3100, 65, 3.0, 'w8', TRUE, '2000-04-10'), (3101, 1, 3.5, 'w15', TRUE, '2000-04-21'), (3102, 38, 4.0, 'w22', FALSE, '2000-05-02'), (3103, 75, 4.5, 'w0', TRUE, '2000-05-13'), (3104, 11, 5.0, 'w7', TRUE, '2000-05-24'), (3105, 48, 5.5, 'w14', FALSE, '2000-06-04'), (3106, 85, 6.0, 'w21', TRUE, '2000-06-15'), (3107, 21, 0.0, 'w28', TRUE, '2000-06-26'), (3108, 58, 0.5, 'w6', FALSE, '2000-07-07'), (3109, 95, 1.0, 'w13', TRUE, '2000-07-18'), (3110, 31, 1.5, 'w20', TRUE, '2000-07-29'), (3111, 68, 2.0, 'w27', FALSE, '2000-08-09'), (3112, 4, 2.5, 'w5', TRUE, '2000-08-20'), (3113, 41, 3.0, 'w12', TRUE, '2000-08-31'), (3114, 78, 3.5, 'w19', FALSE, '2000-09-11'), (3115, 14, 4.0, 'w26', TRUE, '2000-09-22'), (3116, 51, 4.5, 'w4', TRUE, '2000-10-03'), (3117, 88, 5.0, 'w11', FALSE, '2000-10-14'), (3118, 24, 5.5, 'w18', TRUE, '2000-10-25'), (3119, 61, 6.0, 'w25', TRUE, '2000-11-05'), (3120, 98, 0.0, 'w3', FALSE, '2000-11-16'), (3121, 34, 0.5, 'w10', TRUE, '2000-11-27'), (3122, 71, 1.0, 'w17', TRUE, '2000-12-08'), (3123, 7, 1.5, 'w24', FALSE, '2000-12-19'), (3124, 44, 2.0, 'w2', TRUE, '2000-12-30'), (3125, 81, 2.5, 'w9', TRUE, '2001-01-10'), (3126, 17, 3.0, 'w16', FALSE, '2001-01-21'), (3127, 54, 3.5, 'w23', TRUE, '2001-02-01'), (3128, 91, 4.0, 'w1', TRUE, '2000-01-09'), (3129, 27, 4.5, 'w8', FALSE, '2000-01-20'), (3130, 64, 5.0, 'w15', TRUE, '2000-01-31'), (3131, 0, 5.5, 'w22', TRUE, '2000-02-11'), (3132, 37, 6.0, 'w0', FALSE, '2000-02-22'), (3133, 74, 0.0, 'w7', TRUE, '2000-03-04'), (3134, 10, 0.5, 'w14', TRUE, '2000-03-15'), (3135, 47, 1.0, 'w21', FALSE, '2000-03-26'), (3136, 84, 1.5, 'w28', TRUE, '2000-04-06'), (3137, 20, 2.0, 'w6', TRUE, '2000-04-17'), (3138, 57, 2.5, 'w13', FALSE, '2000-04-28'), (3139, 94, 3.0, 'w20', TRUE, '2000-05-09'), (3140, 30, 3.5, 'w27', TRUE, '2000-05-20'), (3141, 67, 4.0, 'w5', FALSE, '2000-05-31'), (3142, 3, 4.5, 'w12', TRUE, '2000-06-11'), (3143, 40, 5.0, 'w19', TRUE, '2000-06-22'), (3144, 77, 5.5, 'w26', FALSE, '2000-07-03'), (3145, 13, 6.0, 'w4', TRUE, '2000-07-14'), (3146, 50, 0.0, 'w11', TRUE, '2000-07-25'), (3147, 87, 0.5, 'w18', FALSE, '2000-08-05'), (3148, 23, 1.0, 'w25', TRUE, '2000-08-16'), (3149, 60, 1.5, 'w3', TRUE, '2000-08-27'), (3150, 97, 2.0, 'w10', FALSE, '2000-09-07'), (3151, 33, 2.5, 'w17', TRUE, '2000-09-18'), (3152, 70, 3.0, 'w24', TRUE, '2000-09-29'), (3153, 6, 3.5, 'w2', FALSE, '2000-10-10'), (3154, 43, 4.0, 'w9', TRUE, '2000-10-21'), (3155, 80, 4.5, 'w16', TRUE, '2000-11-01'), (3156, 16, 5.0, 'w23', FALSE, '2000-11-12'), (3157, 53, 5.5, 'w1', TRUE, '2000-11-23'), (3158, 90, 6.0, 'w8', TRUE, '2000-12-04'), (3159, 26, 0.0, 'w15', FALSE, '2000-12-15'), (3160, 63, 0.5, 'w22', TRUE, '2000-12-26'), (3161, 100, 1.0, 'w0', TRUE, '2001-01-06'), (3162, 36, 1.5, 'w7', FALSE, '2001-01-17'), (3163, 73, 2.0, 'w14', TRUE, '2001-01-28'), (3164, 9, 2.5, 'w21', TRUE, '2000-01-05'), (3165, 46, 3.0, 'w28', FALSE, '2000-01-16'), (3166, 83, 3.5, 'w6', TRUE, '2000-01-27'), (3167, 19, 4.0, 'w13', TRUE, '2000-02-07'), (3168, 56, 4.5, 'w20', FALSE, '2000-02-18'), (3169, 93, 5.0, 'w27', TRUE, '2000-02-29'), (3170, 29, 5.5, 'w5', TRUE, '2000-03-11'), (3171, 66, 6.0, 'w12', FALSE, '2000-03-22'), (3172, 2, 0.0, 'w19', TRUE, '2000-04-02'), (3173, 39, 0.5, 'w26', TRUE, '2000-04-13'), (3174, 76, 1.0, 'w4', FALSE, '2000-04-24'), (3175, 12, 1.5, 'w11', TRUE, '2000-05-05'), (3176, 49, 2.0, 'w18', TRUE, '2000-05-16'), (3177, 86, 2.5, 'w25', FALSE, '2000-05-27'), (3178, 22, 3.0, 'w3', TRUE, '2000-06-07'), (3179, 59, 3.5, 'w10', TRUE, '2000-06-18'), (3180, 96, 4.0, 'w17', FALSE, '2000-06-29'), (3181, 32, 4.5, 'w24', TRUE, '2000-07-10'), (3182, 69, 5.0, 'w2', TRUE, '2000-07-21'), (3183, 5, 5.5, 'w9', FALSE, '2000-08-01'), (3184, 42, 6.0, 'w16', TRUE, '2000-08-12'), (3185, 79, 0.0, 'w23', TRUE, '2000-08-23'), (3186, 15, 0.5, 'w1', FALSE, '2000-09-03'), (3187, 52, 1.0, 'w8', TRUE, '2000-09-14'), (3188, 89, 1.5, 'w15', TRUE, '2000-09-25'), (3189, 25, 2.0, 'w22', FALSE, '2000-10-06'), (3190, 62, 2.5, 'w0', TRUE, '2000-10-17'), (3191, 99, 3.0, 'w7', TRUE, '2000-10-28'), (3192, 35, 3.5, 'w14', FALSE, '2000-11-08'), (3193, 72, 4.0, 'w21', TRUE, '2000-11-19'), (3194, 8, 4.5, 'w28', TRUE, '2000-11-30'), (3195, 45, 5.0, 'w6', FALSE, '2000-12-11'), (3196, 82, 5.5, 'w13', TRUE, '2000-12-22'), (3197, 18, 6.0, 'w20', TRUE, '2001-01-02'), (3198, 55, 0.0, 'w27', FALSE, '2001-01-13'), (3199, 92, 0.5, 'w5', TRUE, '2001-01-24'), (3200, 28, 1.0, 'w12', TRUE, '2000-01-01'), (3201, 65, 1.5, 'w19', FALSE, '2000-01-12'), (3202, 1, 2.0, 'w26', TRUE, '2000-01-23'), (3203, 38, 2.5, 'w4', TRUE, '2000-02-03'), (3204, 75, 3.0, 'w11', FALSE, '2000-02-14'), (3205, 11, 3.5, 'w18', TRUE, '2000-02-25'), (3206, 48, 4.0, 'w25', TRUE, '2000-03-07'), (3207, 85, 4.5, 'w3', FALSE, '2000-03-18'), (3208, 21, 5.0, 'w10', TRUE, '2000-03-29'), (3209, 58, 5.5, 'w17', TRUE, '2000-04-09'), (3210, 95, 6.0, 'w24', FALSE, '2000-04-20'), (3211, 31, 0.0, 'w2', TRUE, '2000-05-01'), (3212, 68, 0.5, 'w9', TRUE, '2000-05-12'), (3213, 4, 1.0, 'w16', FALSE, '2000-05-23'), (3214, 41, 1.5, 'w23', TRUE, '2000-06-03'), (3215, 78, 2.0, 'w1', TRUE, '2000-06-14'), (3216, 14, 2.5, 'w8', FALSE, '2000-06-25'), (3217, 51, 3.0, 'w15', TRUE, '2000-07-06'), (3218, 88, 3.5, 'w22', TRUE, '2000-07-17'), (3219, 24, 4.0, 'w0', FALSE, '2000-07-28'), (3220, 61, 4.5, 'w7', TRUE, '2000-08-08'), (3221, 98, 5.0, 'w14', TRUE, '2000-08-19'), (3222, 34, 5.5, 'w21', FALSE, '2000-08-30'), (3223, 71, 6.0, 'w28', TRUE, '2000-09-10'), (3224, 7, 0.0, 'w6', TRUE, '2000-09-21'), (3225, 44, 0.5, 'w13', FALSE, '2000-10-02'), (3226, 81, 1.0, 'w20', TRUE, '2000-10-13'), (3227, 17, 1.5, 'w27', TRUE, '2000-10-24'), (3228, 54, 2.0, 'w5', FALSE, '2000-11-04'), (3229, 91, 2.5, 'w12', TRUE, '2000-11-15'), (3230, 27, 3.0, 'w19', TRUE, '2000-11-26'), (3231, 64, 3.5, 'w26', FALSE, '2000-12-07'), (3232, 0, 4.0, 'w4', TRUE, '2000-12-18'), (3233, 37, 4.5, 'w11', TRUE, '2000-12-29'), (3234, 74, 5.0, 'w18', FALSE, '2001-01-09'), (3235, 10, 5.5, 'w25', TRUE, '2001-01-20'), (3236, 47, 6.0, 'w3', TRUE, '2001-01-31'), (3237, 84, 0.0, 'w10', FALSE, '2000-01-08'), (3238, 20, 0.5, 'w17', TRUE, '2000-01-19'), (3239, 57, 1.0, 'w24', TRUE, '2000-01-30'), (3240, 94, 1.5, 'w2', FALSE, '2000-02-10'), (3241, 30, 2.0, 'w9', TRUE, '2000-02-21'), (3242, 67, 2.5, 'w16', TRUE, '2000-03-03'), (3243, 3, 3.0, 'w23', FALSE, '2000-03-14'), (3244, 40, 3.5, 'w1', TRUE, '2000-03-25'), (3245, 77, 4.0, 'w8', TRUE, '2000-04-05'), (3246, 13, 4.5, 'w15', FALSE, '2000-04-16'), (3247, 50, 5.0, 'w22', TRUE, '2000-04-27'), (3248, 87, 5.5, 'w0', TRUE, '2000-05-08'), (3249, 23, 6.0, 'w7', FALSE, '2000-05-19'), (3250, 60, 0.0, 'w14', TRUE, '2000-05-30'), (3251, 97, 0.5, 'w21', TRUE, '2000-06-10'), (3252, 33, 1.0, 'w28', FALSE, '2000-06-21'), (3253, 70, 1.5, 'w6', TRUE, '2000-07-02'), (3254, 6, 2.0, 'w13', TRUE, '2000-07-13'), (3255, 43, 2.5, 'w20', FALSE, '2000-07-24'), (3256, 80, 3.0, 'w27', TRUE, '2000-08-04'), (3257, 16, 3.5, 'w5', TRUE, '2000-08-15'), (3258, 53, 4.0, 'w12', FALSE, '2000-08-26'), (3259, 90, 4.5, 'w19', TRUE, '2000-09-06'), (3260, 26, 5.0, 'w26', TRUE, '2000-09-17'), (3261, 63, 5.5, 'w4', FALSE, '2000-09-28'), (3262, 100, 6.0, 'w11', TRUE, '2000-10-09'), (3263, 36, 0.0, 'w18', TRUE, '2000-10-20'), (3264, 73, 0.5, 'w25', FALSE, '2000-10-31'), (3265, 9, 1.0, 'w3', TRUE, '2000-11-11'), (3266, 46, 1.5, 'w10', TRUE, '2000-11-22'), (3267, 83, 2.0, 'w17', FALSE, '2000-12-03'), (3268, 19, 2.5, 'w24', TRUE, '2000-12-14'), (3269, 56, 3.0, 'w2', TRUE, '2000-12-25'), (3270, 93, 3.5, 'w9', FALSE, '2001-01-05'), (3271, 29, 4.0, 'w16', TRUE, '2001-01-16'), (3272, 66, 4.5, 'w23', TRUE, '2001-01-27'), (3273, 2, 5.0, 'w1', FALSE, '2000-01-04'), (3274, 39, 5.5, 'w8', TRUE, '2000-01-15'), (3275, 76, 6.0, 'w15', TRUE, '2000-01-26'), (3276, 12, 0.0, 'w22', FALSE, '2000-02-06'), (3277, 49, 0.5, 'w0', TRUE, '2000-02-17'), (3278, 86, 1.0, 'w7', TRUE, '2000-02-28'), (3279, 22, 1.5, 'w14', FALSE, '2000-03-10'), (3280, 59, 2.0, 'w21', TRUE, '2000-03-21'), (3281, 96, 2.5, 'w28', TRUE, '2000-04-01'), (3282, 32, 3.0, 'w6', FALSE, '2000-04-12'), (3283, 69, 3.5, 'w13', TRUE, '2000-04-23'), (3284, 5, 4.0, 'w20', TRUE, '2000-05-04'), (3285, 42, 4.5, 'w27', FALSE, '2000-05-15'), (3286, 79, 5.0, 'w5', TRUE, '2000-05-26'), (3287, 15, 5.5, 'w12', TRUE, '2000-06-06'), (3288, 52, 6.0, 'w19', FALSE, '2000-06-17'), (3289, 89, 0.0, 'w26', TRUE, '2000-06-28'), (3290, 25, 0.5, 'w4', TRUE, '2000-07-09'), (3291, 62, 1.0, 'w11', FALSE, '2000-07-20'), (3292, 99, 1.5, 'w18', TRUE, '2000-07-31'), (3293, 35, 2.0, 'w25', TRUE, '2000-08-11'), (3294, 72, 2.5, 'w3', FALSE, '2000-08-22'), (3295, 8, 3.0, 'w10', TRUE, '2000-09-02'), (3296, 45, 3.5, 'w17', TRUE, '2000-09-13'), (3297, 82, 4.0, 'w24', FALSE, '2000-09-24'), (3298, 18, 4.5, 'w2', TRUE, '2000-10-05'), (3299, 55, 5.0, 'w9', TRUE, '2000-10-16'), (3300, 92, 5.5, 'w16', FALSE, '2000-10-27'), (3301, 28, 6.0, 'w23', TRUE, '2000-11-07'), (3302, 65, 0.0, 'w1', TRUE, '2000-11-18'), (3303, 1, 0.5, 'w8', FALSE, '2000-11-29'), (3304, 38, 1.0, 'w15', TRUE, '2000-12-10'), (3305, 75, 1.5, 'w22', TRUE, '2000-12-21'), (3306, 11, 2.0, 'w0', FALSE, '2001-01-01'), (3307, 48, 2.5, 'w7', TRUE, '2001-01-12'), (3308, 85, 3.0, 'w14', TRUE, '2001-01-23'), (3309, 21, 3.5, 'w21', FALSE, '2001-02-03'), (3310, 58, 4.0, 'w28', TRUE, '2000-01-11'), (3311, 95, 4.5, 'w6', TRUE, '2000-01-22'), (3312, 31, 5.0, 'w13', FALSE, '2000-02-02'), (3313, 68, 5.5, 'w20', TRUE, '2000-02-13'), (3314, 4, 6.0, 'w27', TRUE, '2000-02-24'), (3315, 41, 0.0, 'w5', FALSE, '2000-03-06'), (3316, 78, 0.5, 'w12', TRUE, '2000-03-17'), (3317, 14, 1.0, 'w19', TRUE, '2000-03-28'), (3318, 51, 1.5, 'w26', FALSE, '2000-04-08'), (3319, 88, 2.0, 'w4', TRUE, '2000-04-19'), (3320, 24, 2.5, 'w11', TRUE, '2000-04-30'), (3321, 61, 3.0, 'w18', FALSE, '2000-05-11'), (3322, 98, 3.5, 'w25', TRUE, '2000-05-22'), (3323, 34, 4.0, 'w3', TRUE, '2000-06-02'), (3324, 71, 4.5, 'w10', FALSE, '2000-06-13'), (3325, 7, 5.0, 'w17', TRUE, '2000-06-24'), (3326, 44, 5.5, 'w24', TRUE, '2000-07-05'), (3327, 81, 6.0, 'w2', FALSE, '2000-07-16'), (3328, 17, 0.0, 'w9', TRUE, '2000-07-27'), (3329, 54, 0.5, 'w16', TRUE, '2000-08-07'), (3330, 91, 1.0, 'w23', FALSE, '2000-08-18'), (3331, 27, 1.5, 'w1', TRUE, '2000-08-29'), (3332, 64, 2.0, 'w8', TRUE, '2000-09-09'), (3333, 0, 2.5, 'w15', FALSE, '2000-09-20'), (3334, 37, 3.0, 'w22', TRUE, '2000-10-01'), (3335, 74, 3.5, 'w0', TRUE, '2000-10-12'), (3336, 10, 4.0, 'w7', FALSE, '2000-10-23'), (3337, 47, 4.5, 'w14', TRUE, '2000-11-03'), (3338, 84, 5.0, 'w21', TRUE, '2000-11-14'), (3339, 20, 5.5, 'w28', FALSE, '2000-11-25'), (3340, 57, 6.0, 'w6', TRUE, '2000-12-06'), (3341, 94, 0.0, 'w13', TRUE, '2000-12-17'), (3342, 30, 0.5, 'w20', FALSE, '2000-12-28'), (3343, 67, 1.0, 'w27', TRUE, '2001-01-08'), (3344, 3, 1.5, 'w5', TRUE, '2001-01-19'), (3345, 40, 2.0, 'w12', FALSE, '2001-01-30'), (3346, 77, 2.5, 'w19', TRUE, '2000-01-07'), (3347, 13, 3.0, 'w26', TRUE, '2000-01-18'), (3348, 50, 3.5, 'w4', FALSE, '2000-01-29'), (3349, 87, 4.0, 'w11', TRUE, '2000-02-09'), (3350, 23, 4.5, 'w18', TRUE, '2000-02-20'), (3351, 60, 5.0, 'w25', FALSE, '2000-03-02'), (3352, 97, 5.5, 'w3', TRUE, '2000-03-13'), (3353, 33, 6.0, 'w10', TRUE, '2000-03-24'), (3354, 70, 0.0, 'w17', FALSE, '2000-04-04'), (3355, 6, 0.5, 'w24', TRUE, '2000-04-15'), (3356, 43, 1.0, 'w2', TRUE, '2000-04-26'), (3357, 80, 1.5, 'w9', FALSE, '2000-05-07'), (3358, 16, 2.0, 'w16', TRUE, '2000-05-18'), (3359, 53, 2.5, 'w23', TRUE, '2000-05-29'), (3360, 90, 3.0, 'w1', FALSE, '2000-06-09'), (3361, 26, 3.5, 'w8', TRUE, '2000-06-20'), (3362, 63, 4.0, 'w15', TRUE, '2000-07-01'), (3363, 100, 4.5, 'w22', FALSE, '2000-07-12'), (3364, 36, 5.0, 'w0', TRUE, '2000-07-23'), (3365, 73, 5.5, 'w7', TRUE, '2000-08-03'), (3366, 9, 6.0, 'w14', FALSE, '2000-08-14'), (3367, 46, 0.0, 'w21', TRUE, '2000-08-25'), (3368, 83, 0.5, 'w28', TRUE, '2000-09-05'), (3369, 19, 1.0, 'w6', FALSE, '2000-09-16'), (3370, 56, 1.5, 'w13', TRUE, '2000-09-27'), (3371, 93, 2.0, 'w20', TRUE, '2000-10-08'), (3372, 29, 2.5, 'w27', FALSE, '2000-10-19'), (3373, 66, 3.0, 'w5', TRUE, '2000-10-30'), (3374, 2, 3.5, 'w12', TRUE, '2000-11-10'), (3375, 39, 4.0, 'w19', FALSE, '2000-11-21'), (3376, 76, 4.5, 'w26', TRUE, '2000-12-02'), (3377, 12, 5.0, 'w4', TRUE, '2000-12-13'), (3378, 49, 5.5, 'w11', FALSE, '2000-12-24'), (3379, 86, 6.0, 'w18', TRUE, '2001-01-04'), (3380, 22, 0.0, 'w25', TRUE, '2001-01-15'), (3381, 59, 0.5, 'w3', FALSE, '2001-01-26'), (3382, 96, 1.0, 'w10', TRUE, '2000-01-03'), (3383, 32, 1.5, 'w17', TRUE, '2000-01-14'), (3384, 69, 2.0, 'w24', FALSE, '2000-01-25'), (3385, 5, 2.5, 'w2', TRUE, '2000-02-05'), (3386, 42, 3.0, 'w9', TRUE, '2000-02-16'), (3387, 79, 3.5, 'w16', FALSE, '2000-02-27'), (3388, 15, 4.0, 'w23', TRUE, '2000-03-09'), (3389, 52, 4.5, 'w1', TRUE, '2000-03-20'), (3390, 89, 5.0, 'w8', FALSE, '2000-03-31'), (3391, 25, 5.5, 'w15', TRUE, '2000-04-11'), (3392, 62, 6.0, 'w22', TRUE, '2000-04-22'), (3393, 99, 0.0, 'w0', FALSE, '2000-05-03'), (3394, 35, 0.5, 'w7', TRUE, '2000-05-14'), (3395, 72, 1.0, 'w14', TRUE, '2000-05-25'), (3396, 8, 1.5, 'w21', FALSE, '2000-06-05'), (3397, 45, 2.0, 'w28', TRUE, '2000-06-16'), (3398, 82, 2.5, 'w6', TRUE, '2000-06-27'), (3399, 18, 3.0, 'w13', FALSE, '2000-07-08'), (3400, 55, 3.5, 'w20', TRUE, '2000-07-19'), (3401, 92, 4.0, 'w27', TRUE, '2000-07-30'), (3402, 28, 4.5, 'w5', FALSE, '2000-08-10'), (3403, 65, 5.0, 'w12', TRUE, '2000-08-21'), (3404, 1, 5.5, 'w19', TRUE, '2000-09-01'), (3405, 38, 6.0, 'w26', FALSE, '2000-09-12'), (3406, 75, 0.0, 'w4', TRUE, '2000-09-23'), (3407, 11, 0.5, 'w11', TRUE, '2000-10-04'), (3408, 48, 1.0, 'w18', FALSE, '2000-10-15'), (3409, 85, 1.5, 'w25', TRUE, '2000-10-26'), (3410, 21, 2.0, 'w3', TRUE, '2000-11-06'), (3411, 58, 2.5, 'w10', FALSE, '2000-11-17'), (3412, 95, 3.0, 'w17', TRUE, '2000-11-28'), (3413, 31, 3.5, 'w24', TRUE, '2000-12-09'), (3414, 68, 4.0, 'w2', FALSE, '2000-12-20'), (3415, 4, 4.5, 'w9', TRUE, '2000-12-31'), (3416, 41, 5.0, 'w16', TRUE, '2001-01-11'), (3417, 78, 5.5, 'w23', FALSE, '2001-01-22'), (3418, 14, 6.0, 'w1', TRUE, '2001-02-02'), (3419, 51, 0.0, 'w8', TRUE, '2000-01-10'), (3420, 88, 0.5, 'w15', FALSE, '2000-01-21'), (3421, 24, 1.0, 'w22', TRUE, '2000-02-01'), (3422, 61, 1.5, 'w0', TRUE, '2000-02-12'), (3423, 98, 2.0, 'w7', FALSE, '2000-02-23'), (3424, 34, 2.5, 'w14', TRUE, '2000-03-05'), (3425, 71, 3.0, 'w21', TRUE, '2000-03-16'), (3426, 7, 3.5, 'w28', FALSE, '2000-03-27'), (3427, 44, 4.0, 'w6', TRUE, '2000-04-07'), (3428, 81, 4.5, 'w13', TRUE, '2000-04-18'), (3429, 17, 5.0, 'w20', FALSE, '2000-04-29'), (3430, 54, 5.5, 'w27', TRUE, '2000-05-10'), (3431, 91, 6.0, 'w5', TRUE, '2000-05-21'), (3432, 27, 0.0, 'w12', FALSE, '2000-06-01'), (3433, 64, 0.5, 'w19', TRUE, '2000-06-12'), (3434, 0, 1.0, 'w26', TRUE, '2000-06-23'), (3435, 37, 1.5, 'w4', FALSE, '2000-07-04'), (3436, 74, 2.0, 'w11', TRUE, '2000-07-15'), (3437, 10, 2.5, 'w18', TRUE, '2000-07-26'), (3438, 47, 3.0, 'w25', FALSE, '2000-08-06'), (3439, 84, 3.5, 'w3', TRUE, '2000-08-17'), (3440, 20, 4.0, 'w10', TRUE, '2000-08-28'), (3441, 57, 4.5, 'w17', FALSE, '2000-09-08'), (3442, 94, 5.0, 'w24', TRUE, '2000-09-19'), (3443, 30, 5.5, 'w2', TRUE, '2000-09-30'), (3444, 67, 6.0, 'w9', FALSE, '2000-10-11'), (3445, 3, 0.0, 'w16', TRUE, '2000-10-22'), (3446, 40, 0.5, 'w23', TRUE, '2000-11-02'), (3447, 77, 1.0, 'w1', FALSE, '2000-11-13'), (3448, 13, 1.5, 'w8', TRUE, '2000-11-24'), (3449, 50, 2.0, 'w15', TRUE, '2000-12-05'), (3450, 87, 2.5, 'w22', FALSE, '2000-12-16'), (3451, 23, 3.0, 'w0', TRUE, '2000-12-27'), (3452, 60, 3.5, 'w7', TRUE, '2001-01-07'), (3453, 97, 4.0, 'w14', FALSE, '2001-01-18'), (3454, 33, 4.5, 'w21', TRUE, '2001-01-29'), (3455, 70, 5.0, 'w28', TRUE, '2000-01-06'), (3456, 6, 5.5, 'w6', FALSE, '2000-01-17'), (3457, 43, 6.0, 'w13', TRUE, '2000-01-28'), (3458, 80, 0.0, 'w20', TRUE, '2000-02-08'), (3459, 16, 0.5, 'w27', FALSE, '2000-02-19'), (3460, 53, 1.0, 'w5', TRUE, '2000-03-01'), (3461, 90, 1.5, 'w12', TRUE, '2000-03-12'), (3462, 26, 2.0, 'w19', FALSE, '2000-03-23'), (3463, 63, 2.5, 'w26', TRUE, '2000-04-03'), (3464, 100, 3.0, 'w4', TRUE, '2000-04-14'), (3465, 36, 3.5, 'w11', FALSE, '2000-04-25'), (3466, 73, 4.0, 'w18', TRUE, '2000-05-06'), (3467, 9, 4.5, 'w25', TRUE, '2000-05-17'), (3468, 46, 5.0, 'w3', FALSE, '2000-05-28'), (3469, 83, 5.5, 'w10', TRUE, '2000-06-08'), (3470, 19, 6.0, 'w17', TRUE, '2000-06-19'), (3471, 56, 0.0, 'w24', FALSE, '2000-06-30'), (3472, 93, 0.5, 'w2', TRUE, '2000-07-11'), (3473, 29, 1.0, 'w9', TRUE, '2000-07-22'), (3474, 66, 1.5, 'w16', FALSE, '2000-08-02'), (3475, 2, 2.0, 'w23', TRUE, '2000-08-13'), (3476, 39, 2.5, 'w1', TRUE, '2000-08-24'), (3477, 76, 3.0, 'w8', FALSE, '2000-09-04'), (3478, 12, 3.5, 'w15', TRUE, '2000-09-15'), (3479, 49, 4.0, 'w22', TRUE, '2000-09-26'), (3480, 86, 4.5, 'w0', FALSE, '2000-10-07'), (3481, 22, 5.0, 'w7', TRUE, '2000-10-18'), (3482, 59, 5.5, 'w14', TRUE, '2000-10-29'), (3483, 96, 6.0, 'w21', FALSE, '2000-11-09'), (3484, 32, 0.0, 'w28', TRUE, '2000-11-20'), (3485, 69, 0.5, 'w6', TRUE, '2000-12-01'), (3486, 5, 1.0, 'w13', FALSE, '2000-12-12'), (3487, 42, 1.5, 'w20', TRUE, '2000-12-23'), (3488, 79, 2.0, 'w27', TRUE, '2001-01-03'), (3489, 15, 2.5, 'w5', FALSE, '2001-01-14'), (3490, 52, 3.0, 'w12', TRUE, '2001-01-25'), (3491, 89, 3.5, 'w19', TRUE, '2000-01-02'), (3492, 25, 4.0, 'w26', FALSE, '2000-01-13'), (3493, 62, 4.5, 'w4', TRUE, '2000-01-24'), (3494, 99, 5.0, 'w11', TRUE, '2000-02-04'), (3495, 35, 5.5, 'w18', FALSE, '2000-02-15'), (3496, 72, 6.0, 'w25', TRUE, '2000-02-26'), (3497, 8, 0.0, 'w3', TRUE, '2000-03-08'), (3498, 45, 0.5, 'w10', FALSE, '2000-03-19'), (3499, 82, 1.0, 'w17', TRUE, '2000-03-30'), (3500, 18, 1.5, 'w24', TRUE, '2000-04-10'), (3501, 55, 2.0, 'w2', FALSE, '2000-04-21'), (3502, 92, 2.5, 'w9', TRUE, '2000-05-02'), (3503, 28, 3.0, 'w16', TRUE, '2000-05-13'), (3504, 65, 3.5, 'w23', FALSE, '2000-05-24'), (3505, 1, 4.0, 'w1', TRUE, '2000-06-04'), (3506, 38, 4.5, 'w8', TRUE, '2000-06-15'), (3507, 75, 5.0, 'w15', FALSE, '2000-06-26'), (3508, 11, 5.5, 'w22', TRUE, '2000-07-07'), (3509, 48, 6.0, 'w0', TRUE, '2000-07-18'), (3510, 85, 0.0, 'w7', FALSE, '2000-07-29'), (3511, 21, 0.5, 'w14', TRUE, '2000-08-09'), (3512, 58, 1.0, 'w21', TRUE, '2000-08-20'), (3513, 95, 1.5, 'w28', FALSE, '2000-08-31'), (3514, 31, 2.0, 'w6', TRUE, '2000-09-11'), (3515, 68, 2.5, 'w13', TRUE, '2000-09-22'), (3516, 4, 3.0, 'w20', FALSE, '2000-10-03'), (3517, 41, 3.5, 'w27', TRUE, '2000-10-14'), (3518, 78, 4.0, 'w5', TRUE, '2000-10-25'), (3519, 14, 4.5, 'w12', FALSE, '2000-11-05'), (3520, 51, 5.0, 'w19', TRUE, '2000-11-16'), (3521, 88, 5.5, 'w26', TRUE, '2000-11-27'), (3522, 24, 6.0, 'w4', FALSE, '2000-12-08'), (3523, 61, 0.0, 'w11', TRUE, '2000-12-19'), (3524, 98, 0.5, 'w18', TRUE, '2000-12-30'), (3525, 34, 1.0, 'w25', FALSE, '2001-01-10'), (3526, 71, 1.5, 'w3', TRUE, '2001-01-21'), (3527, 7, 2.0, 'w10', TRUE, '2001-02-01'), (3528, 44, 2.5, 'w17', FALSE, '2000-01-09'), (3529, 81, 3.0, 'w24', TRUE, '2000-01-20'), (3530, 17, 3.5, 'w2', TRUE, '2000-01-31'), (3531, 54, 4.0, 'w9', FALSE, '2000-02-11'), (3532, 91, 4.5, 'w16', TRUE, '2000-02-22'), (3533, 27, 5.0, 'w23', TRUE, '2000-03-04'), (3534, 64, 5.5, 'w1', FALSE, '2000-03-15'), (3535, 0, 6.0, 'w8', TRUE, '2000-03-26'), (3536, 37, 0.0, 'w15', TRUE, '2000-04-06'), (3537, 74, 0.5, 'w22', FALSE, '2000-04-17'), (3538, 10, 1.0, 'w0', TRUE, '2000-04-28'), (3539, 47, 1.5, 'w7', TRUE, '2000-05-09'), (3540, 84, 2.0, 'w14', FALSE, '2000-05-20'), (3541, 20, 2.5, 'w21', TRUE, '2000-05-31'), (3542, 57, 3.0, 'w28', TRUE, '2000-06-11'), (3543, 94, 3.5, 'w6', FALSE, '2000-06-22'), (3544, 30, 4.0, 'w13', TRUE, '2000-07-03'), (3545, 67, 4.5, 'w20', TRUE, '2000-07-14'), (3546, 3, 5.0, 'w27', FALSE, '2000-07-25'), (3547, 40, 5.5, 'w5', TRUE, '2000-08-05'), (3548, 77, 6.0, 'w12', TRUE, '2000-08-16'), (3549, 13, 0.0, 'w19', FALSE, '2000-08-27'), (3550, 50, 0.5, 'w26', TRUE, '2000-09-07'), (3551, 87, 1.0, 'w4', TRUE, '2000-09-18'), (3552, 23, 1.5, 'w11', FALSE, '2000-09-29'), (3553, 60, 2.0, 'w18', TRUE, '2000-10-10'), (3554, 97, 2.5, 'w25', TRUE, '2000-10-21'), (3555, 33, 3.0, 'w3', FALSE, '2000-11-01'), (3556, 70, 3.5, 'w10', TRUE, '2000-11-12'), (3557, 6, 4.0, 'w17', TRUE, '2000-11-23'), (3558, 43, 4.5, 'w24', FALSE, '2000-12-04'), (3559, 80, 5.0, 'w2', TRUE, '2000-12-15'), (3560, 16, 5.5, 'w9', TRUE, '2000-12-26'), (3561, 53, 6.0, 'w16', FALSE, '2001-01-06'), (3562, 90, 0.0, 'w23', TRUE, '2001-01-17'), (3563, 26, 0.5, 'w1', TRUE, '2001-01-28'), (3564, 63, 1.0, 'w8', FALSE, '2000-01-05'), (3565, 100, 1.5, 'w15', TRUE, '2000-01-16'), (3566, 36, 2.0, 'w22', TRUE, '2000-01-27'), (3567, 73, 2.5, 'w0', FALSE, '2000-02-07'), (3568, 9, 3.0, 'w7', TRUE, '2000-02-18'), (3569, 46, 3.5, 'w14', TRUE, '2000-02-29'), (3570, 83, 4.0, 'w21', FALSE, '2000-03-11'), (3571, 19, 4.5, 'w28', TRUE, '2000-03-22'), (3572, 56, 5.0, 'w6', TRUE, '2000-04-02'), (3573, 93, 5.5, 'w13', FALSE, '2000-04-13'), (3574, 29, 6.0, 'w20', TRUE, '2000-04-24'), (3575, 66, 0.0, 'w27', TRUE, '2000-05-05'), (3576, 2, 0.5, 'w5', FALSE, '2000-05-16'), (3577, 39, 1.0, 'w12', TRUE, '2000-05-27'), (3578, 76, 1.5, 'w19', TRUE, '2000-06-07'), (3579, 12, 2.0, 'w26', FALSE, '2000-06-18'), (3580, 49, 2.5, 'w4', TRUE, '2000-06-29'), (3581, 86, 3.0, 'w11', TRUE, '2000-07-10'), (3582, 22, 3.5, 'w18', FALSE, '2000-07-21'), (3583, 59, 4.0, 'w25', TRUE, '2000-08-01'), (3584, 96, 4.5, 'w3', TRUE, '2000-08-12'), (3585, 32, 5.0, 'w10', FALSE, '2000-08-23'), (3586, 69, 5.5, 'w17', TRUE, '2000-09-03'), (3587, 5, 6.0, 'w24', TRUE, '2000-09-14'), (3588, 42, 0.0, 'w2', FALSE, '2000-09-25'), (3589, 79, 0.5, 'w9', TRUE, '2000-10-06'), (3590, 15, 1.0, 'w16', TRUE, '2000-10-17'), (3591, 52, 1.5, 'w23', FALSE, '2000-10-28'), (3592, 89, 2.0, 'w1', TRUE, '2000-11-08'), (3593, 25, 2.5, 'w8', TRUE, '2000-11-19'), (3594, 62, 3.0, 'w15', FALSE, '2000-11-30'), (3595, 99, 3.5, 'w22', TRUE, '2000-12-11'), (3596, 35, 4.0, 'w0', TRUE, '2000-12-22'), (3597, 72, 4.5, 'w7', FALSE, '2001-01-02'), (3598, 8, 5.0, 'w14', TRUE, '2001-01-13'), (3599, 45, 5.5, 'w21', TRUE, '2001-01-24'), (3600, 82, 6.0, 'w28', FALSE, '2000-01-01'), (3601, 18, 0.0, 'w6', TRUE, '2000-01-12'), (3602, 55, 0.5, 'w13', TRUE, '2000-01-23'), (3603, 92, 1.0, 'w20', FALSE, '2000-02-03'), (3604, 28, 1.5, 'w27', TRUE, '2000-02-14'), (3605, 65, 2.0, 'w5', TRUE, '2000-02-25'), (3606, 1, 2.5, 'w12', FALSE, '2000-03-07'), (3607, 38, 3.0, 'w19', TRUE, '2000-03-18'), (3608, 75, 3.5, 'w26', TRUE, '2000-03-29'), (3609, 11, 4.0, 'w4', FALSE, '2000-04-09'), (3610, 48, 4.5, 'w11', TRUE, '2000-04-20'), (3611, 85, 5.0, 'w18', TRUE, '2000-05-01'), (3612, 21, 5.5, 'w25', FALSE, '2000-05-12'), (3613, 58, 6.0, 'w3', TRUE, '2000-05-23'), (3614, 95, 0.0, 'w10', TRUE, '2000-06-03'), (3615, 31, 0.5, 'w17', FALSE, '2000-06-14'), (3616, 68, 1.0, 'w24', TRUE, '2000-06-25'), (3617, 4, 1.5, 'w2', TRUE, '2000-07-06'), (3618, 41, 2.0, 'w9', FALSE, '2000-07-17'), (3619, 78, 2.5, 'w16', TRUE, '2000-07-28'), (3620, 14, 3.0, 'w23', TRUE, '2000-08-08'), (3621, 51, 3.5, 'w1', FALSE, '2000-08-19'), (3622, 88, 4.0, 'w8', TRUE, '2000-08-30'), (3623, 24, 4.5, 'w15', TRUE, '2000-09-10'), (3624, 61, 5.0, 'w22', FALSE, '2000-09-21'), (3625, 98, 5.5, 'w0', TRUE, '2000-10-02'), (3626, 34, 6.0, 'w7', TRUE, '2000-10-13'), (3627, 71, 0.0, 'w14', FALSE, '2000-10-24'), (3628, 7, 0.5, 'w21', TRUE, '2000-11-04'), (3629, 44, 1.0, 'w28', TRUE, '2000-11-15'), (3630, 81, 1.5, 'w6', FALSE, '2000-11-26'), (3631, 17, 2.0, 'w13', TRUE, '2000-12-07'), (3632, 54, 2.5, 'w20', TRUE, '2000-12-18'), (3633, 91, 3.0, 'w27', FALSE, '2000-12-29'), (3634, 27, 3.5, 'w5', TRUE, '2001-01-09'), (3635, 64, 4.0, 'w12', TRUE, '2001-01-20'), (3636, 0, 4.5, 'w19', FALSE, '2001-01-31'), (3637, 37, 5.0, 'w26', TRUE, '2000-01-08'), (3638, 74, 5.5, 'w4', TRUE, '2000-01-19'), (3639, 10, 6.0, 'w11', FALSE, '2000-01-30'), (3640, 47, 0.0, 'w18', TRUE, '2000-02-10'), (3641, 84, 0.5, 'w25', TRUE, '2000-02-21'), (3642, 20, 1.0, 'w3', FALSE, '2000-03-03'), (3643, 57, 1.5, 'w10', TRUE, '2000-03-14'), (3644, 94, 2.0, 'w17', TRUE, '2000-03-25'), (3645, 30, 2.5, 'w24', FALSE, '2000-04-05'), (3646, 67, 3.0, 'w2', TRUE, '2000-04-16'), (3647, 3, 3.5, 'w9', TRUE, '2000-04-27'), (3648, 40, 4.0, 'w16', FALSE, '2000-05-08'), (3649, 77, 4.5, 'w23', TRUE, '2000-05-19'), (3650, 13, 5.0, 'w1', TRUE, '2000-05-30'), (3651, 50, 5.5, 'w8', FALSE, '2000-06-10'), (3652, 87, 6.0, 'w15', TRUE, '2000-06-21'), (3653, 23, 0.0, 'w22', TRUE, '2000-07-02'), (3654, 60, 0.5, 'w0', FALSE, '2000-07-13'), (3655, 97, 1.0, 'w7', TRUE, '2000-07-24'), (3656, 33, 1.5, 'w14', TRUE, '2000-08-04'), (3657, 70, 2.0, 'w21', FALSE, '2000-08-15'), (3658, 6, 2.5, 'w28', TRUE, '2000-08-26'), (3659, 43, 3.0, 'w6', TRUE, '2000-09-06'), (3660, 80, 3.5, 'w13', FALSE, '2000-09-17'), (3661, 16, 4.0, 'w20', TRUE, '2000-09-28'), (3662, 53, 4.5, 'w27', TRUE, '2000-10-09'), (3663, 90, 5.0, 'w5', FALSE, '2000-10-20'), (3664, 26, 5.5, 'w12', TRUE, '2000-10-31'), (3665, 63, 6.0, 'w19', TRUE, '2000-11-11'), (3666, 100, 0.0, 'w26', FALSE, '2000-11-22'), (3667, 36, 0.5, 'w4', TRUE, '2000-12-03'), (3668, 73, 1.0, 'w11', TRUE, '2000-12-14'), (3669, 9, 1.5, 'w18', FALSE, '2000-12-25'), (3670, 46, 2.0, 'w25', TRUE, '2001-01-05'), (3671, 83, 2.5, 'w3', TRUE, '2001-01-16'), (3672, 19, 3.0, 'w10', FALSE, '2001-01-27'), (3673, 56, 3.5, 'w17', TRUE, '2000-01-04'), (3674, 93, 4.0, 'w24', TRUE, '2000-01-15'), (3675, 29, 4.5, 'w2', FALSE, '2000-01-26'), (3676, 66, 5.0, 'w9', TRUE, '2000-02-06'), (3677, 2, 5.5, 'w16', TRUE, '2000-02-17'), (3678, 39, 6.0, 'w23', FALSE, '2000-02-28'), (3679, 76, 0.0, 'w1', TRUE, '2000-03-10'), (3680, 12, 0.5, 'w8', TRUE, '2000-03-21'), (3681, 49, 1.0, 'w15', FALSE, '2000-04-01'), (3682, 86, 1.5, 'w22', TRUE, '2000-04-12'), (3683, 22, 2.0, 'w0', TRUE, '2000-04-23'), (3684, 59, 2.5, 'w7', FALSE, '2000-05-04'), (3685, 96, 3.0, 'w14', TRUE, '2000-05-15'), (3686, 32, 3.5, 'w21', TRUE, '2000-05-26'), (3687, 69, 4.0, 'w28', FALSE, '2000-06-06'), (3688, 5, 4.5, 'w6', TRUE, '2000-06-17'), (3689, 42, 5.0, 'w13', TRUE, '2000-06-28'), (3690, 79, 5.5, 'w20', FALSE, '2000-07-09'), (3691, 15, 6.0, 'w27', TRUE, '2000-07-20'), (3692, 52, 0.0, 'w5', TRUE, '2000-07-31'), (3693, 89, 0.5, 'w12', FALSE, '2000-08-11'), (3694, 25, 1.0, 'w19', TRUE, '2000-08-22'), (3695, 62, 1.5, 'w26', TRUE, '2000-09-02'), (3696, 99, 2.0, 'w4', FALSE, '2000-09-13'), (3697, 35, 2.5, 'w11', TRUE, '2000-09-24'), (3698, 72, 3.0, 'w18', TRUE, '2000-10-05'), (3699, 8, 3.5, 'w25', FALSE, '2000-10-16'), (3700, 45, 4.0, 'w3', TRUE, '2000-10-27'), (3701, 82, 4.5, 'w10', TRUE, '2000-11-07'), (3702, 18, 5.0, 'w17', FALSE, '2000-11-18'), (3703, 55, 5.5, 'w24', TRUE, '2000-11-29'), (3704, 92, 6.0, 'w2', TRUE, '2000-12-10'), (3705, 28, 0.0, 'w9', FALSE, '2000-12-21'), (3706, 65, 0.5, 'w16', TRUE, '2001-01-01'), (3707, 1, 1.0, 'w23', TRUE, '2001-01-12'), (3708, 38, 1.5, 'w1', FALSE, '2001-01-23'), (3709, 75, 2.0, 'w8', TRUE, '2001-02-03'), (3710, 11, 2.5, 'w15', TRUE, '2000-01-11'), (3711, 48, 3.0, 'w22', FALSE, '2000-01-22'), (3712, 85, 3.5, 'w0', TRUE, '2000-02-02'), (3713, 21, 4.0, 'w7', TRUE, '2000-02-13'), (3714, 58, 4.5, 'w14', FALSE, '2000-02-24'), (3715, 95, 5.0, 'w21', TRUE, '2000-03-06'), (3716, 31, 5.5, 'w28', TRUE, '2000-03-17'), (3717, 68, 6.0, 'w6', FALSE, '2000-03-28'), (3718, 4, 0.0, 'w13', TRUE, '2000-04-08'), (3719, 41, 0.5, 'w20', TRUE, '2000-04-19'), (3720, 78, 1.0, 'w27', FALSE, '2000-04-30'), (3721, 14, 1.5, 'w5', TRUE, '2000-05-11'), (3722, 51, 2.0, 'w12', TRUE, '2000-05-22'), (3723, 88, 2.5, 'w19', FALSE, '2000-06-02'), (3724, 24, 3.0, 'w26', TRUE, '2000-06-13'), (3725, 61, 3.5, 'w4', TRUE, '2000-06-24'), (3726, 98, 4.0, 'w11', FALSE, '2000-07-05'), (3727, 34, 4.5, 'w18', TRUE, '2000-07-16'), (3728, 71, 5.0, 'w25', TRUE, '2000-07-27'), (3729, 7, 5.5, 'w3', FALSE, '2000-08-07'), (3730, 44, 6.0, 'w10', TRUE, '2000-08-18'), (3731, 81, 0.0, 'w17', TRUE, '2000-08-29'), (3732, 17, 0.5, 'w24', FALSE, '2000-09-09'), (3733, 54, 1.0, 'w2', TRUE, '2000-09-20'), (3734, 91, 1.5, 'w9', TRUE, '2000-10-01'), (3735, 27, 2.0, 'w16', FALSE, '2000-10-12'), (3736, 64, 2.5, 'w23', TRUE, '2000-10-23'), (3737, 0, 3.0, 'w1', TRUE, '2000-11-03'), (3738, 37, 3.5, 'w8', FALSE, '2000-11-14'), (3739, 74, 4.0, 'w15', TRUE, '2000-11-25'), (3740, 10, 4.5, 'w22', TRUE, '2000-12-06'), (3741, 47, 5.0, 'w0', FALSE, '2000-12-17'), (3742, 84, 5.5, 'w7', TRUE, '2000-12-28'), (3743, 20, 6.0, 'w14', TRUE, '2001-01-08'), (3744, 57, 0.0, 'w21', FALSE, '2001-01-19'), (3745, 94, 0.5, 'w28', TRUE, '2001-01-30'), (3746, 30, 1.0, 'w6', TRUE, '2000-01-07'), (3747, 67, 1.5, 'w13', FALSE, '2000-01-18'), (3748, 3, 2.0, 'w20', TRUE, '2000-01-29'), (3749, 40, 2.5, 'w27', TRUE, '2000-02-09'), (3750, 77, 3.0, 'w5', FALSE, '2000-02-20'), (3751, 13, 3.5, 'w12', TRUE, '2000-03-02'), (3752, 50, 4.0, 'w19', TRUE, '2000-03-13'), (3753, 87, 4.5, 'w26', FALSE, '2000-03-24'), (3754, 23, 5.0, 'w4', TRUE, '2000-04-04'), (3755, 60, 5.5, 'w11', TRUE, '2000-04-15'), (3756, 97, 6.0, 'w18', FALSE, '2000-04-26'), (3757, 33, 0.0, 'w25', TRUE, '2000-05-07'), (3758, 70, 0.5, 'w3', TRUE, '2000-05-18'), (3759, 6, 1.0, 'w10', FALSE, '2000-05-29'), (3760, 43, 1.5, 'w17', TRUE, '2000-06-09'), (3761, 80, 2.0, 'w24', TRUE, '2000-06-20'), (3762, 16, 2.5, 'w2', FALSE, '2000-07-01'), (3763, 53, 3.0, 'w9', TRUE, '2000-07-12'), (3764, 90, 3.5, 'w16', TRUE, '2000-07-23'), (3765, 26, 4.0, 'w23', FALSE, '2000-08-03'), (3766, 63, 4.5, 'w1', TRUE, '2000-08-14'), (3767, 100, 5.0, 'w8', TRUE, '2000-08-25'), (3768, 36, 5.5, 'w15', FALSE, '2000-09-05'), (3769, 73, 6.0, 'w22', TRUE, '2000-09-16'), (3770, 9, 0.0, 'w0', TRUE, '2000-09-27'), (3771, 46, 0.5, 'w7', FALSE, '2000-10-08'), (3772, 83, 1.0, 'w14', TRUE, '2000-10-19'), (3773, 19, 1.5, 'w21', TRUE, '2000-10-30'), (3774, 56, 2.0, 'w28', FALSE, '2000-11-10'), (3775, 93, 2.5, 'w6', TRUE, '2000-11-21'), (3776, 29, 3.0, 'w13', TRUE, '2000-12-02'), (3777, 66, 3.5, 'w20', FALSE, '2000-12-13'), (3778, 2, 4.0, 'w27', TRUE, '2000-12-24'), (3779, 39, 4.5, 'w5', TRUE, '2001-01-04'), (3780, 76, 5.0, 'w12', FALSE, '2001-01-15'), (3781, 12, 5.5, 'w19', TRUE, '2001-01-26'), (3782, 49, 6.0, 'w26', TRUE, '2000-01-03'), (3783, 86, 0.0, 'w4', FALSE, '2000-01-14'), (3784, 22, 0.5, 'w11', TRUE, '2000-01-25'), (3785, 59, 1.0, 'w18', TRUE, '2000-02-05'), (3786, 96, 1.5, 'w25', FALSE, '2000-02-16'), (3787, 32, 2.0, 'w3', TRUE, '2000-02-27'), (3788, 69, 2.5, 'w10', TRUE, '2000-03-09'), (3789, 5, 3.0, 'w17', FALSE, '2000-03-20'), (3790, 42, 3.5, 'w24', TRUE, '2000-03-31'), (3791, 79, 4.0, 'w2', TRUE, '2000-04-11'), (3792, 15, 4.5, 'w9', FALSE, '2000-04-22'), (3793, 52, 5.0, 'w16', TRUE, '2000-05-03'), (3794, 89, 5.5, 'w23', TRUE, '2000-05-14'), (3795, 25, 6.0, 'w1', FALSE, '2000-05-25'), (3796, 62, 0.0, 'w8', TRUE, '2000-06-05'), (3797, 99, 0.5, 'w15', TRUE, '2000-06-16'), (3798, 35, 1.0, 'w22', FALSE, '2000-06-27'), (3799, 72, 1.5, 'w0', TRUE, '2000-07-08'), (3800, 8, 2.0, 'w7', TRUE, '2000-07-19'), (3801, 45, 2.5, 'w14', FALSE, '2000-07-30'), (3802, 82, 3.0, 'w21', TRUE, '2000-08-10'), (3803, 18, 3.5, 'w28', TRUE, '2000-08-21'), (3804, 55, 4.0, 'w6', FALSE, '2000-09-01'), (3805, 92, 4.5, 'w13', TRUE, '2000-09-12'), (3806, 28, 5.0, 'w20', TRUE, '2000-09-23'), (3807, 65, 5.5, 'w27', FALSE, '2000-10-04'), (3808, 1, 6.0, 'w5', TRUE, '2000-10-15'), (3809, 38, 0.0, 'w12', TRUE, '2000-10-26'), (3810, 75, 0.5, 'w19', FALSE, '2000-11-06'), (3811, 11, 1.0, 'w26', TRUE, '2000-11-17'), (3812, 48, 1.5, 'w4', TRUE, '2000-11-28'), (3813, 85, 2.0, 'w11', FALSE, '2000-12-09'), (3814, 21, 2.5, 'w18', TRUE, '2000-12-20'), (3815, 58, 3.0, 'w25', TRUE, '2000-12-31'), (3816, 95, 3.5, 'w3', FALSE, '2001-01-11'), (3817, 31, 4.0, 'w10', TRUE, '2001-01-22'), (3818, 68, 4.5, 'w17', TRUE, '2001-02-02'), (3819, 4, 5.0, 'w24', FALSE, '2000-01-10'), (3820, 41, 5.5, 'w2', TRUE, '2000-01-21'), (3821, 78, 6.0, 'w9', TRUE, '2000-02-01'), (3822, 14, 0.0, 'w16', FALSE, '2000-02-12'), (3823, 51, 0.5, 'w23', TRUE, '2000-02-23'), (3824, 88, 1.0, 'w1', TRUE, '2000-03-05'), (3825, 24, 1.5, 'w8', FALSE, '2000-03-16'), (3826, 61, 2.0, 'w15', TRUE, '2000-03-27'), (3827, 98, 2.5, 'w22', TRUE, '2000-04-07'), (3828, 34, 3.0, 'w0', FALSE, '2000-04-18'), (3829, 71, 3.5, 'w7', TRUE, '2000-04-29'), (3830, 7, 4.0, 'w14', TRUE, '2000-05-10'), (3831, 44, 4.5, 'w21', FALSE, '2000-05-21'), (3832, 81, 5.0, 'w28', TRUE, '2000-06-01'), (3833, 17, 5.5, 'w6', TRUE, '2000-06-12'), (3834, 54, 6.0, 'w13', FALSE, '2000-06-23'), (3835, 91, 0.0, 'w20', TRUE, '2000-07-04'), (3836, 27, 0.5, 'w27', TRUE, '2000-07-15'), (3837, 64, 1.0, 'w5', FALSE, '2000-07-26'), (3838, 0, 1.5, 'w12', TRUE, '2000-08-06'), (3839, 37, 2.0, 'w19', TRUE, '2000-08-17'), (3840, 74, 2.5, 'w26', FALSE, '2000-08-28'), (3841, 10, 3.0, 'w4', TRUE, '2000-09-08'), (3842, 47, 3.5, 'w11', TRUE, '2000-09-19'), (3843, 84, 4.0, 'w18', FALSE, '2000-09-30'), (3844, 20, 4.5, 'w25', TRUE, '2000-10-11'), (3845, 57, 5.0, 'w3', TRUE, '2000-10-22'), (3846, 94, 5.5, 'w10', FALSE, '2000-11-02'), (3847, 30, 6.0, 'w17', TRUE, '2000-11-13'), (3848, 67, 0.0, 'w24', TRUE, '2000-11-24'), (3849, 3, 0.5, 'w2', FALSE, '2000-12-05'), (3850, 40, 1.0, 'w9', TRUE, '2000-12-16'), (3851, 77, 1.5, 'w16', TRUE, '2000-12-27'), (3852, 13, 2.0, 'w23', FALSE, '2001-01-07'), (3853, 50, 2.5, 'w1', TRUE, '2001-01-18'), (3854, 87, 3.0, 'w8', TRUE, '2001-01-29'), (3855, 23, 3.5, 'w15', FALSE, '2000-01-06'), (3856, 60, 4.0, 'w22', TRUE, '2000-01-17'), (3857, 97, 4.5, 'w0', TRUE, '2000-01-28'), (3858, 33, 5.0, 'w7', FALSE, '2000-02-08'), (3859, 70, 5.5, 'w14', TRUE, '2000-02-19'), (3860, 6, 6.0, 'w21', TRUE, '2000-03-01'), (3861, 43, 0.0, 'w28', FALSE, '2000-03-12'), (3862, 80, 0.5, 'w6', TRUE, '2000-03-23'), (3863, 16, 1.0, 'w13', TRUE, '2000-04-03'), (3864, 53, 1.5, 'w20', FALSE, '2000-04-14'), (3865, 90, 2.0, 'w27', TRUE, '2000-04-25'), (3866, 26, 2.5, 'w5', TRUE, '2000-05-06'), (3867, 63, 3.0, 'w12', FALSE, '2000-05-17'), (3868, 100, 3.5, 'w19', TRUE, '2000-05-28'), (3869, 36, 4.0, 'w26', TRUE, '2000-06-08'), (3870, 73, 4.5, 'w4', FALSE, '2000-06-19'), (3871, 9, 5.0, 'w11', TRUE, '2000-06-30'), (3872, 46, 5.5, 'w18', TRUE, '2000-07-11'), (3873, 83, 6.0, 'w25', FALSE, '2000-07-22'), (3874, 19, 0.0, 'w3', TRUE, '2000-08-02'), (3875, 56, 0.5, 'w10', TRUE, '2000-08-13'), (3876, 93, 1.0, 'w17', FALSE, '2000-08-24'), (3877, 29, 1.5, 'w24', TRUE, '2000-09-04'), (3878, 66, 2.0, 'w2', TRUE, '2000-09-15'), (3879, 2, 2.5, 'w9', FALSE, '2000-09-26'), (3880, 39, 3.0, 'w16', TRUE, '2000-10-07'), (3881, 76, 3.5, 'w23', TRUE, '2000-10-18'), (3882, 12, 4.0, 'w1', FALSE, '2000-10-29'), (3883, 49, 4.5, 'w8', TRUE, '2000-11-09'), (3884, 86, 5.0, 'w15', TRUE, '2000-11-20'), (3885, 22, 5.5, 'w22', FALSE, '2000-12-01'), (3886, 59, 6.0, 'w0', TRUE, '2000-12-12'), (3887, 96, 0.0, 'w7', TRUE, '2000-12-23'), (3888, 32, 0.5, 'w14', FALSE, '2001-01-03'), (3889, 69, 1.0, 'w21', TRUE, '2001-01-14'), (3890, 5, 1.5, 'w28', TRUE, '2001-01-25'), (3891, 42, 2.0, 'w6', FALSE, '2000-01-02'), (3892, 79, 2.5, 'w13', TRUE, '2000-01-13'), (3893, 15, 3.0, 'w20', TRUE, '2000-01-24'), (3894, 52, 3.5, 'w27', FALSE, '2000-02-04'), (3895, 89, 4.0, 'w5', TRUE, '2000-02-15'), (3896, 25, 4.5, 'w12', TRUE, '2000-02-26'), (3897, 62, 5.0, 'w19', FALSE, '2000-03-08'), (3898, 99, 5.5, 'w26', TRUE, '2000-03-19'), (3899, 35, 6.0, 'w4', TRUE, '2000-03-30'), (3900, 72, 0.0, 'w11', FALSE, '2000-04-10'), (3901, 8, 0.5, 'w18', TRUE, '2000-04-21'), (3902, 45, 1.0, 'w25', TRUE, '2000-05-02'), (3903, 82, 1.5, 'w3', FALSE, '2000-05-13'), (3904, 18, 2.0, 'w10', TRUE, '2000-05-24'), (3905, 55, 2.5, 'w17', TRUE, '2000-06-04'), (3906, 92, 3.0, 'w24', FALSE, '2000-06-15'), (3907, 28, 3.5, 'w2', TRUE, '2000-06-26'), (3908, 65, 4.0, 'w9', TRUE, '2000-07-07'), (3909, 1, 4.5, 'w16', FALSE, '2000-07-18'), (3910, 38, 5.0, 'w23', TRUE, '2000-07-29'), (3911, 75, 5.5, 'w1', TRUE, '2000-08-09'), (3912, 11, 6.0, 'w8', FALSE, '2000-08-20'), (3913, 48, 0.0, 'w15', TRUE, '2000-08-31'), (3914, 85, 0.5, 'w22', TRUE, '2000-09-11'), (3915, 21, 1.0, 'w0', FALSE, '2000-09-22'), (3916, 58, 1.5, 'w7', TRUE, '2000-10-03'), (3917, 95, 2.0, 'w14', TRUE, '2000-10-14'), (3918, 31, 2.5, 'w21', FALSE, '2000-10-25'), (3919, 68, 3.0, 'w28', TRUE, '2000-11-05'), (3920, 4, 3.5, 'w6', TRUE, '2000-11-16'), (3921, 41, 4.0, 'w13', FALSE, '2000-11-27'), (3922, 78, 4.5, 'w20', TRUE, '2000-12-08'), (3923, 14, 5.0, 'w27', TRUE, '2000-12-19'), (3924, 51, 5.5, 'w5', FALSE, '2000-12-30'), (3925, 88, 6.0, 'w12', TRUE, '2001-01-10'), (3926, 24, 0.0, 'w19', TRUE, '2001-01-21'), (3927, 61, 0.5, 'w26', FALSE, '2001-02-01'), (3928, 98, 1.0, 'w4', TRUE, '2000-01-09'), (3929, 34, 1.5, 'w11', TRUE, '2000-01-20'), (3930, 71, 2.0, 'w18', FALSE, '2000-01-31'), (3931, 7, 2.5, 'w25', TRUE, '2000-02-11'), (3932, 44, 3.0, 'w3', TRUE, '2000-02-22'), (3933, 81, 3.5, 'w10', FALSE, '2000-03-04'), (3934, 17, 4.0, 'w17', TRUE, '2000-03-15'), (3935, 54, 4.5, 'w24', TRUE, '2000-03-26'), (3936, 91, 5.0, 'w2', FALSE, '2000-04-06'), (3937, 27, 5.5, 'w9', TRUE, '2000-04-17'), (3938, 64, 6.0, 'w16', TRUE, '2000-04-28'), (3939, 0, 0.0, 'w23', FALSE, '2000-05-09'), (3940, 37, 0.5, 'w1', TRUE, '2000-05-20'), (3941, 74, 1.0, 'w8', TRUE, '2000-05-31'), (3942, 10, 1.5, 'w15', FALSE, '2000-06-11'), (3943, 47, 2.0, 'w22', TRUE, '2000-06-22'), (3944, 84, 2.5, 'w0', TRUE, '2000-07-03'), (3945, 20, 3.0, 'w7', FALSE, '2000-07-14'), (3946, 57, 3.5, 'w14', TRUE, '2000-07-25'), (3947, 94, 4.0, 'w21', TRUE, '2000-08-05'), (3948, 30, 4.5, 'w28', FALSE, '2000-08-16'), (3949, 67, 5.0, 'w6', TRUE, '2000-08-27'), (3950, 3, 5.5, 'w13', TRUE, '2000-09-07'), (3951, 40, 6.0, 'w20', FALSE, '2000-09-18'), (3952, 77, 0.0, 'w27', TRUE, '2000-09-29'), (3953, 13, 0.5, 'w5', TRUE, '2000-10-10'), (3954, 50, 1.0, 'w12', FALSE, '2000-10-21'), (3955, 87, 1.5, 'w19', TRUE, '2000-11-01'), (3956, 23, 2.0, 'w26', TRUE, '2000-11-12'), (3957, 60, 2.5, 'w4', FALSE, '2000-11-23'), (3958, 97, 3.0, 'w11', TRUE, '2000-12-04'), (3959, 33, 3.5, 'w18', TRUE, '2000-12-15'), (3960, 70, 4.0, 'w25', FALSE, '2000-12-26'), (3961, 6, 4.5, 'w3', TRUE, '2001-01-06'), (3962, 43, 5.0, 'w10', TRUE, '2001-01-17'), (3963, 80, 5.5, 'w17', FALSE, '2001-01-28'), (3964, 16, 6.0, 'w24', TRUE, '2000-01-05'), (3965, 53, 0.0, 'w2', TRUE, '2000-01-16'), (3966, 90, 0.5, 'w9', FALSE, '2000-01-27'), (3967, 26, 1.0, 'w16', TRUE, '2000-02-07'), (3968, 63, 1.5, 'w23', TRUE, '2000-02-18'), (3969, 100, 2.0, 'w1', FALSE, '2000-02-29'), (3970, 36, 2.5, 'w8', TRUE, '2000-03-11'), (3971, 73, 3.0, 'w15', TRUE, '2000-03-22'), (3972, 9, 3.5, 'w22', FALSE, '2000-04-02'), (3973, 46, 4.0, 'w0', TRUE, '2000-04-13'), (3974, 83, 4.5, 'w7', TRUE, '2000-04-24'), (3975, 19, 5.0, 'w14', FALSE, '2000-05-05'), (3976, 56, 5.5, 'w21', TRUE, '2000-05-16'), (3977, 93, 6.0, 'w28', TRUE, '2000-05-27'), (3978, 29, 0.0, 'w6', FALSE, '2000-06-07'), (3979, 66, 0.5, 'w13', TRUE, '2000-06-18'), (3980, 2, 1.0, 'w20', TRUE, '2000-06-29'), (3981, 39, 1.5, 'w27', FALSE, '2000-07-10'), (3982, 76, 2.0, 'w5', TRUE, '2000-07-21'), (3983, 12, 2.5, 'w12', TRUE, '2000-08-01'), (3984, 49, 3.0, 'w19', FALSE, '2000-08-12'), (3985, 86, 3.5, 'w26', TRUE, '2000-08-23'), (3986, 22, 4.0, 'w4', TRUE, '2000-09-03'), (3987, 59, 4.5, 'w11', FALSE, '2000-09-14'), (3988, 96, 5.0, 'w18', TRUE, '2000-09-25'), (3989, 32, 5.5, 'w25', TRUE, '2000-10-06'), (3990, 69, 6.0, 'w3', FALSE, '2000-10-17'), (3991, 5, 0.0, 'w10', TRUE, '2000-10-28'), (3992, 42, 0.5, 'w17', TRUE, '2000-11-08'), (3993, 79, 1.0, 'w24', FALSE, '2000-11-19'), (3994, 15, 1.5, 'w2', TRUE, '2000-11-30'), (3995, 52, 2.0, 'w9', TRUE, '2000-12-11'), (3996, 89, 2.5, 'w16', FALSE, '2000-12-22'), (3997, 25, 3.0, 'w23', TRUE, '2001-01-02'), (3998, 62, 3.5, 'w1', TRUE, '2001-01-13'), (3999, 99, 4.0, 'w8', FALSE, '2001-01-24');
+CREATE TABLE S(K INT, D VARCHAR, G INT);
+INSERT INTO S VALUES (0, 'w0', 0), (2, 'w2', 2), (4, 'w4', 0), (6, 'w6', 2), (8, 'w8', 0), (10, 'w10', 2), (12, 'w12', 0), (14, 'w14', 2), (16, 'w16', 0), (18, 'w18', 2), (20, 'w20', 0), (22, 'w22', 2), (24, 'w24', 0), (26, 'w26', 2), (28, 'w28', 0), (30, 'w1', 2), (32, 'w3', 0), (34, 'w5', 2), (36, 'w7', 0), (38, 'w9', 2), (40, 'w11', 0), (42, 'w13', 2), (44, 'w15', 0), (46, 'w17', 2), (48, 'w19', 0), (50, 'w21', 2), (52, 'w23', 0), (54, 'w25', 2), (56, 'w27', 0), (58, 'w0', 2), (60, 'w2', 0), (62, 'w4', 2), (64, 'w6', 0), (66, 'w8', 2), (68, 'w10', 0), (70, 'w12', 2), (72, 'w14', 0), (74, 'w16', 2), (76, 'w18', 0), (78, 'w20', 2), (80, 'w22', 0), (82, 'w24', 2), (84, 'w26', 0), (86, 'w28', 2), (88, 'w1', 0), (90, 'w3', 2), (92, 'w5', 0), (94, 'w7', 2), (96, 'w9', 0), (98, 'w11', 2), (100, 'w13', 0), (102, 'w15', 2), (104, 'w17', 0), (106, 'w19', 2), (108, 'w21', 0), (110, 'w23', 2), (112, 'w25', 0), (114, 'w27', 2), (116, 'w0', 0), (118, 'w2', 2), (120, 'w4', 0), (122, 'w6', 2), (124, 'w8', 0), (126, 'w10', 2), (128, 'w12', 0), (130, 'w14', 2), (132, 'w16', 0), (134, 'w18', 2), (136, 'w20', 0), (138, 'w22', 2), (140, 'w24', 0), (142, 'w26', 2), (144, 'w28', 0), (146, 'w1', 2), (148, 'w3', 0), (150, 'w5', 2), (152, 'w7', 0), (154, 'w9', 2), (156, 'w11', 0), (158, 'w13', 2), (160, 'w15', 0), (162, 'w17', 2), (164, 'w19', 0), (166, 'w21', 2), (168, 'w23', 0), (170, 'w25', 2), (172, 'w27', 0), (174, 'w0', 2), (176, 'w2', 0), (178, 'w4', 2), (180, 'w6', 0), (182, 'w8', 2), (184, 'w10', 0), (186, 'w12', 2), (188, 'w14', 0), (190, 'w16', 2), (192, 'w18', 0), (194, 'w20', 2), (196, 'w22', 0), (198, 'w24', 2), (200, 'w26', 0);
+SELECT D, COUNT(*), SUM(C), MIN(F) FROM R GROUP BY D;
+SELECT D, E, COUNT(DISTINCT B), MAX(DISTINCT D) FROM R WHERE A < 2000 GROUP BY D, E;
+SELECT E, F, COUNT(*) FROM R WHERE B < 20 GROUP BY E, F;
+SELECT C, SUM(DISTINCT A) FROM R GROUP BY C;
+SET HASH_JOIN OFF;
+SET INDEX_JOIN OFF;
+SELECT R.A, S.G FROM R, S WHERE R.B = S.K AND R.A < 1500;
+SELECT R.A, S.K FROM R, S WHERE R.D = S.D AND R.B = S.K;
+SET INDEX_JOIN ON;
+SET HASH_JOIN ON;
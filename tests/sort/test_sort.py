@@ -0,0 +1,118 @@
+import pytest
+import datetime
+import subprocess
+from functools import cmp_to_key
+
+from ddb.db import DatabaseManager
+from ddb.session import Session
+from ddb.primitives import ValType, DescKey
+from ddb.executor import ExecutorException, StatementContext, TmpFilePool, LiteralTablePop, MergeSortPop
+from ddb.executor.util import ExtSortBuffer
+from ddb.metadata import TableMetadata
+from ddb.planner import Planner
+from ddb.profile import no_profile_context
+from ddb.validator.valexpr import RelativeColumnRef
+
+testcase_dir = "tests/sort/"
+T = 1
+
+@pytest.fixture
+def session():
+    dbm = DatabaseManager(
+        db_dir = DatabaseManager.DEFAULT_DB_DIR,
+        tmp_dir = DatabaseManager.DEFAULT_TMP_DIR
+    )
+    s = Session(dbm)
+    yield s
+    Planner.options = Planner.Options()
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_sort_{t_id}")
+
+def sort_buffer(session, tmp_tx, key_or_compare, **kwargs):
+    tmp_files = TmpFilePool(session.dbm.sm, tmp_tx)
+    levels: list[int] = list()
+    def tmp_file_create(level, run):
+        levels.append(level)
+        return tmp_files.acquire([ValType.INTEGER, ValType.VARCHAR])
+    if key_or_compare == 'key':
+        buffer = ExtSortBuffer(None, tmp_file_create, tmp_files.release, key=lambda row: (row[0], DescKey(row[1])), **kwargs)
+    else:
+        def compare(this, that):
+            if this[0] != that[0]:
+                return -1 if this[0] < that[0] else 1
+            return 0 if this[1] == that[1] else -1 if this[1] > that[1] else 1
+        buffer = ExtSortBuffer(compare, tmp_file_create, tmp_files.release, **kwargs)
+    return buffer, levels
+
+@pytest.mark.parametrize("key_or_compare", ['key', 'compare'])
+@pytest.mark.parametrize("deduplicate", [False, True])
+@pytest.mark.parametrize("num_rows,num_passes", [(50, 0), (500, 1), (10000, 5)])
+def test_sort_buffer(session, key_or_compare, deduplicate, num_rows, num_passes):
+    # a sort in memory, with one run per memory load merged at the end, or with intermediate merge passes,
+    # returns the same rows (sorted by the first column and then the second descending):
+    subprocess.run(['make', 'clean'], check=True)
+    rows = [ (i*7919%(num_rows//4), f'v{i%9}') for i in range(num_rows) ]
+    expected = sorted(set(rows) if deduplicate else rows, key=lambda row: (row[0], [-ord(c) for c in row[1]]))
+    with session.dbm.tm.begin_transaction(read_only=False, tmp=True) as tmp_tx:
+        buffer, levels = sort_buffer(session, tmp_tx, key_or_compare, num_memory_blocks=3, deduplicate=deduplicate)
+        for row in rows:
+            buffer.add(row)
+        assert list(buffer.iter_and_clear()) == expected
+        assert (0 if len(levels) == 0 else max(levels) + 1) == num_passes
+        # the buffer can be used again once cleared:
+        for row in rows[:10]:
+            buffer.add(row)
+        assert list(buffer.iter_and_clear()) == sorted(set(rows[:10]) if deduplicate else rows[:10],
+                                                       key=lambda row: (row[0], [-ord(c) for c in row[1]]))
+
+def test_sort_buffer_stable(session):
+    # rows with equal keys keep the order they were added in, even across runs:
+    subprocess.run(['make', 'clean'], check=True)
+    rows = [ (i%5, f'v{i}') for i in range(2000) ]
+    with session.dbm.tm.begin_transaction(read_only=False, tmp=True) as tmp_tx:
+        tmp_files = TmpFilePool(session.dbm.sm, tmp_tx)
+        buffer = ExtSortBuffer(None, lambda level, run: tmp_files.acquire([ValType.INTEGER, ValType.VARCHAR]), tmp_files.release,
+                               num_memory_blocks=3, key=lambda row: row[0])
+        for row in rows:
+            buffer.add(row)
+        assert list(buffer.iter_and_clear()) == sorted(rows, key=lambda row: row[0])
+
+def test_desc_key():
+    values = ['b', 'a', 'ab', '', 'b']
+    assert sorted(values, key=DescKey) == sorted(values, reverse=True)
+    assert DescKey('a') == DescKey('a') and not DescKey('a') < DescKey('a')
+    assert sorted([(1, 'x'), (0, 'y'), (1, 'z')], key=lambda row: (row[0], DescKey(row[1]))) == [(0, 'y'), (1, 'z'), (1, 'x')]
+
+def test_sort_needs_key_or_compare():
+    with pytest.raises(ExecutorException):
+        ExtSortBuffer(None, None, None, num_memory_blocks=3)
+
+TYPES = [ValType.INTEGER, ValType.FLOAT, ValType.VARCHAR, ValType.BOOLEAN, ValType.DATETIME]
+
+@pytest.mark.parametrize("columns,orders_asc", [
+    ([0], [False]),
+    ([2, 0], [False, True]),
+    ([3, 1, 0], [False, False, True]),
+    ([4, 2, 0], [False, True, False]),
+    ([1, 2, 3, 4, 0], [True, False, True, False, True]),
+])
+@pytest.mark.parametrize("num_rows", [100, 5000])
+def test_merge_sort_pop(session, columns, orders_asc, num_rows):
+    # sorting by the compiled key (in memory or spilled) agrees with the compiled comparator, in either direction:
+    subprocess.run(['make', 'clean'], check=True)
+    dbm = session.dbm
+    rows = [ (i, (i*37%101)*0.5, f'w{i*7%29}', i%3 == 0, datetime.datetime(2000, 1, 1) + datetime.timedelta(days=i*11%400))
+             for i in range(num_rows) ]
+    no_profile_context()
+    with dbm.tm.begin_transaction(read_only=True) as tx, \
+        dbm.tm.begin_transaction(read_only=False, tmp=True) as tmp_tx:
+        context = StatementContext(
+            sm=dbm.sm, mm=dbm.mm, zm=dbm.zm, tx=tx, tmp_tx=tmp_tx, tmp_files=TmpFilePool(dbm.sm, tmp_tx),
+            tx_sees_committed=True, profile_context=None)
+        input = LiteralTablePop(context, None, TableMetadata(['a', 'b', 'c', 'd', 'e'], TYPES), rows)
+        pop = MergeSortPop(input, [ RelativeColumnRef(0, i, TYPES[i]) for i in columns ], orders_asc, 3, 3)
+        expected = sorted(rows, key=cmp_to_key(pop.compiled.cmp_exec.function('this', 'that')))
+        assert list(pop.execute()) == expected
+        context.tmp_files.recycle()
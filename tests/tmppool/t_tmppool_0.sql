@@ -0,0 +1,20 @@
+CREATE TABLE R(A INT, B INT, C VARCHAR);
+INSERT INTO R VALUES (0, 0, 'k0'), (1, 1910, 'k13'), (2, 1817, 'k26'), (3, 1724, 'k39'), (4, 1631, 'k52'), (5, 1538, 'k65'), (6, 1445, 'k78'), (7, 1352, 'k91'), (8, 1259, 'k7'), (9, 1166, 'k20'), (10, 1073, 'k33'), (11, 980, 'k46'), (12, 887, 'k59'), (13, 794, 'k72'), (14, 701, 'k85'), (15, 608, 'k1'), (16, 515, 'k14'), (17, 422, 'k27'), (18, 329, 'k40'), (19, 236, 'k53'), (20, 143, 'k66'), (21, 50, 'k79'), (22, 1960, 'k92'), (23, 1867, 'k8'), (24, 1774, 'k21'), (25, 1681, 'k34'), (26, 1588, 'k47'), (27, 1495, 'k60'), (28, 1402, 'k73'), (29, 1309, 'k86'), (30, 1216, 'k2'), (31, 1123, 'k15'), (32, 1030, 'k28'), (33, 937, 'k41'), (34, 844, 'k54'), (35, 751, 'k67'), (36, 658, 'k80'), (37, 565, 'k93'), (38, 472, 'k9'), (39, 379, 'k22'), (40, 286, 'k35'), (41, 193, 'k48'), (42, 100, 'k61'), (43, 7, 'k74'), (44, 1917, 'k87'), (45, 1824, 'k3'), (46, 1731, 'k16'), (47, 1638, 'k29'), (48, 1545, 'k42'), (49, 1452, 'k55'), (50, 1359, 'k68'), (51, 1266, 'k81'), (52, 1173, 'k94'), (53, 1080, 'k10'), (54, 987, 'k23'), (55, 894, 'k36'), (56, 801, 'k49'), (57, 708, 'k62'), (58, 615, 'k75'), (59, 522, 'k88'), (60, 429, 'k4'), (61, 336, 'k17'), (62, 243, 'k30'), (63, 150, 'k43'), (64, 57, 'k56'), (65, 1967, 'k69'), (66, 1874, 'k82'), (67, 1781, 'k95'), (68, 1688, 'k11'), (69, 1595, 'k24'), (70, 1502, 'k37'), (71, 1409, 'k50'), (72, 1316, 'k63'), (73, 1223, 'k76'), (74, 1130, 'k89'), (75, 1037, 'k5'), (76, 944, 'k18'), (77, 851, 'k31'), (78, 758, 'k44'), (79, 665, 'k57'), (80, 572, 'k70'), (81, 479, 'k83'), (82, 386, 'k96'), (83, 293, 'k12'), (84, 200, 'k25'), (85, 107, 'k38'), (86, 14, 'k51'), (87, 1924, 'k64'), (88, 1831, 'k77'), (89, 1738, 'k90'), (90, 1645, 'k6'), (91, 1552, 'k19'), (92, 1459, 'k32'), (93, 1366, 'k45'), (94, 1273, 'k58'), (95, 1180, 'k71'), (96, 1087, 'k84'), (97, 994, 'k0'), (98, 901, 'k13'), (99, 808, 'k26'), (100, 715, 'k39'), (101, 622, 'k52'), (102, 529, 'k65'), (103, 436, 'k78'), (104, 343, 'k91'), (105, 250, 'k7'), (106, 157, 'k20'), (107, 64, 'k33'), (108, 1974, 'k46'), (109, 1881, 'k59'), (110, 1788, 'k72'), (111, 1695, 'k85'), (112, 1602, 'k1'), (113, 1509, 'k14'), (114, 1416, 'k27'), (115, 1323, 'k40'), (116, 1230, 'k53'), (117, 1137, 'k66'), (118, 1044, 'k79'), (119, 951, 'k92'), (120, 858, 'k8'), (121, 765, 'k21'), (122, 672, 'k34'), (123, 579, 'k47'), (124, 486, 'k60'), (125, 393, 'k73'), (126, 300, 'k86'), (127, 207, 'k2'), (128, 114, 'k15'), (129, 21, 'k28'), (130, 1931, 'k41'), (131, 1838, 'k54'), (132, 1745, 'k67'), (133, 1652, 'k80'), (134, 1559, 'k93'), (135, 1466, 'k9'), (136, 1373, 'k22'), (137, 1280, 'k35'), (138, 1187, 'k48'), (139, 1094, 'k61'), (140, 1001, 'k74'), (141, 908, 'k87'), (142, 815, 'k3'), (143, 722, 'k16'), (144, 629, 'k29'), (145, 536, 'k42'), (146, 443, 'k55'), (147, 350, 'k68'), (148, 257, 'k81'), (149, 164, 'k94'), (150, 71, 'k10'), (151, 1981, 'k23'), (152, 1888, 'k36'), (153, 1795, 'k49'), (154, 1702, 'k62'), (155, 1609, 'k75'), (156, 1516, 'k88'), (157, 1423, 'k4'), (158, 1330, 'k17'), (159, 1237, 'k30'), (160, 1144, 'k43'), (161, 1051, 'k56'), (162, 958, 'k69'), (163, 865, 'k82'), (164, 772, 'k95'), (165, 679, 'k11'), (166, 586, 'k24'), (167, 493, 'k37'), (168, 400, 'k50'), (169, 307, 'k63'), (170, 214, 'k76'), (171, 121, 'k89'), (172, 28, 'k5'), (173, 1938, 'k18'), (174, 1845, 'k31'), (175, 1752, 'k44'), (176, 1659, 'k57'), (177, 1566, 'k70'), (178, 1473, 'k83'), (179, 1380, 'k96'), (180, 1287, 'k12'), (181, 1194, 'k25'), (182, 1101, 'k38'), (183, 1008, 'k51'), (184, 915, 'k64'), (185, 822, 'k77'), (186, 729, 'k90'), (187, 636, 'k6'), (188, 543, 'k19'), (189, 450, 'k32'), (190, 357, 'k45'), (191, 264, 'k58'), (192, 171, 'k71'), (193, 78, 'k84'), (194, 1988, 'k0'), (195, 1895, 'k13'), (196, 1802, 'k26'), (197, 1709, 'k39'), (198, 1616, 'k52'), (199, 1523, 'k65'), (200, 1430, 'k78'), (201, 1337, 'k91'), (202, 1244, 'k7'), (203, 1151, 'k20'), (204, 1058, 'k33'), (205, 965, 'k46'), (206, 872, 'k59'), (207, 779, 'k72'), (208, 686, 'k85'), (209, 593, 'k1'), (210, 500, 'k14'), (211, 407, 'k27'), (212, 314, 'k40'), (213, 221, 'k53'), (214, 128, 'k66'), (215, 35, 'k79'), (216, 1945, 'k92'), (217, 1852, 'k8'), (218, 1759, 'k21'), (219, 1666, 'k34'), (220, 1573, 'k47'), (221, 1480, 'k60'), (222, 1387, 'k73'), (223, 1294, 'k86'), (224, 1201, 'k2'), (225, 1108, 'k15'), (226, 1015, 'k28'), (227, 922, 'k41'), (228, 829, 'k54'), (229, 736, 'k67'), (230, 643, 'k80'), (231, 550, 'k93'), (232, 457, 'k9'), (233, 364, 'k22'), (234, 271, 'k35'), (235, 178, 'k48'), (236, 85, 'k61'), (237, 1995, 'k74'), (238, 1902, 'k87'), (239, 1809, 'k3'), (240, 1716, 'k16'), (241, 1623, 'k29'), (242, 1530, 'k42'), (243, 1437, 'k55'), (244, 1344, 'k68'), (245, 1251, 'k81'), (246, 1158, 'k94'), (247, 1065, 'k10'), (248, 972, 'k23'), (249, 879, 'k36'), (250, 786, 'k49'), (251, 693, 'k62'), (252, 600, 'k75'), (253, 507, 'k88'), (254, 414, 'k4'), (255, 321, 'k17'), (256, 228, 'k30'), (257, 135, 'k43'), (258, 42, 'k56'), (259, 1952, 'k69'), (260, 1859, 'k82'), (261, 1766, 'k95'), (262, 1673, 'k11'), (263, 1580, 'k24'), (264, 1487, 'k37'), (265, 1394, 'k50'), (266, 1301, 'k63'), (267, 1208, 'k76'), (268, 1115, 'k89'), (269, 1022, 'k5'), (270, 929, 'k18'), (271, 836, 'k31'), (272, 743, 'k44'), (273, 650, 'k57'), (274, 557, 'k70'), (275, 464, 'k83'), (276, 371, 'k96'), (277, 278, 'k12'), (278, 185, 'k25'), (279, 92, 'k38'), (280, 2002, 'k51'), (281, 1909, 'k64'), (282, 1816, 'k77'), (283, 1723, 'k90'), (284, 1630, 'k6'), (285, 1537, 'k19'), (286, 1444, 'k32'), (287, 1351, 'k45'), (288, 1258, 'k58'), (289, 1165, 'k71'), (290, 1072, 'k84'), (291, 979, 'k0'), (292, 886, 'k13'), (293, 793, 'k26'), (294, 700, 'k39'), (295, 607, 'k52'), (296, 514, 'k65'), (297, 421, 'k78'), (298, 328, 'k91'), (299, 235, 'k7'), (300, 142, 'k20'), (301, 49, 'k33'), (302, 1959, 'k46'), (303, 1866, 'k59'), (304, 1773, 'k72'), (305, 1680, 'k85'), (306, 1587, 'k1'), (307, 1494, 'k14'), (308, 1401, 'k27'), (309, 1308, 'k40'), (310, 1215, 'k53'), (311, 1122, 'k66'), (312, 1029, 'k79'), (313, 936, 'k92'), (314, 843, 'k8'), (315, 750, 'k21'), (316, 657, 'k34'), (317, 564, 'k47'), (318, 471, 'k60'), (319, 378, 'k73'), (320, 285, 'k86'), (321, 192, 'k2'), (322, 99, 'k15'), (323, 6, 'k28'), (324, 1916, 'k41'), (325, 1823, 'k54'), (326, 1730, 'k67'), (327, 1637, 'k80'), (328, 1544, 'k93'), (329, 1451, 'k9'), (330, 1358, 'k22'), (331, 1265, 'k35'), (332, 1172, 'k48'), (333, 1079, 'k61'), (334, 986, 'k74'), (335, 893, 'k87'), (336, 800, 'k3'), (337, 707, 'k16'), (338, 614, 'k29'), (339, 521, 'k42'), (340, 428, 'k55'), (341, 335, 'k68'), (342, 242, 'k81'), (343, 149, 'k94'), (344, 56, 'k10'), (345, 1966, 'k23'), (346, 1873, 'k36'), (347, 1780, 'k49'), (348, 1687, 'k62'), (349, 1594, 'k75'), (350, 1501, 'k88'), (351, 1408, 'k4'), (352, 1315, 'k17'), (353, 1222, 'k30'), (354, 1129, 'k43'), (355, 1036, 'k56'), (356, 943, 'k69'), (357, 850, 'k82'), (358, 757, 'k95'), (359, 664, 'k11'), (360, 571, 'k24'), (361, 478, 'k37'), (362, 385, 'k50'), (363, 292, 'k63'), (364, 199, 'k76'), (365, 106, 'k89'), (366, 13, 'k5'), (367, 1923, 'k18'), (368, 1830, 'k31'), (369, 1737, 'k44'), (370, 1644, 'k57'), (371, 1551, 'k70'), (372, 1458, 'k83'), (373, 1365, 'k96'), (374, 1272, 'k12'), (375, 1179, 'k25'), (376, 1086, 'k38'), (377, 993, 'k51'), (378, 900, 'k64'), (379, 807, 'k77'), (380, 714, 'k90'), (381, 621, 'k6'), (382, 528, 'k19'), (383, 435, 'k32'), (384, 342, 'k45'), (385, 249, 'k58'), (386, 156, 'k71'), (387, 63, 'k84'), (388, 1973, 'k0'), (389, 1880, 'k13'), (390, 1787, 'k26'), (391, 1694, 'k39'), (392, 1601, 'k52'), (393, 1508, 'k65'), (394, 1415, 'k78'), (395, 1322, 'k91'), (396, 1229, 'k7'), (397, 1136, 'k20'), (398, 1043, 'k33'), (399, 950, 'k46'), (400, 857, 'k59'), (401, 764, 'k72'), (402, 671, 'k85'), (403, 578, 'k1'), (404, 485, 'k14'), (405, 392, 'k27'), (406, 299, 'k40'), (407, 206, 'k53'), (408, 113, 'k66'), (409, 20, 'k79'), (410, 1930, 'k92'), (411, 1837, 'k8'), (412, 1744, 'k21'), (413, 1651, 'k34'), (414, 1558, 'k47'), (415, 1465, 'k60'), (416, 1372, 'k73'), (417, 1279, 'k86'), (418, 1186, 'k2'), (419, 1093, 'k15'), (420, 1000, 'k28'), (421, 907, 'k41'), (422, 814, 'k54'), (423, 721, 'k67'), (424, 628, 'k80'), (425, 535, 'k93'), (426, 442, 'k9'), (427, 349, 'k22'), (428, 256, 'k35'), (429, 163, 'k48'), (430, 70, 'k61'), (431, 1980, 'k74'), (432, 1887, 'k87'), (433, 1794, 'k3'), (434, 1701, 'k16'), (435, 1608, 'k29'), (436, 1515, 'k42'), (437, 1422, 'k55'), (438, 1329, 'k68'), (439, 1236, 'k81'), (440, 1143, 'k94'), (441, 1050, 'k10'), (442, 957, 'k23'), (443, 864, 'k36'), (444, 771, 'k49'), (445, 678, 'k62'), (446, 585, 'k75'), (447, 492, 'k88'), (448, 399, 'k4'), (449, 306, 'k17'), (450, 213, 'k30'), (451, 120, 'k43'), (452, 27, 'k56'), (453, 1937, 'k69'), (454, 1844, 'k82'), (455, 1751, 'k95'), (456, 1658, 'k11'), (457, 1565, 'k24'), (458, 1472, 'k37'), (459, 1379, 'k50'), (460, 1286, 'k63'), (461, 1193, 'k76'), (462, 1100, 'k89'), (463, 1007, 'k5'), (464, 914, 'k18'), (465, 821, 'k31'), (466, 728, 'k44'), (467, 635, 'k57'), (468, 542, 'k70'), (469, 449, 'k83'), (470, 356, 'k96'), (471, 263, 'k12'), (472, 170, 'k25'), (473, 77, 'k38'), (474, 1987, 'k51'), (475, 1894, 'k64'), (476, 1801, 'k77'), (477, 1708, 'k90'), (478, 1615, 'k6'), (479, 1522, 'k19'), (480, 1429, 'k32'), (481, 1336, 'k45'), (482, 1243, 'k58'), (483, 1150, 'k71'), (484, 1057, 'k84'), (485, 964, 'k0'), (486, 871, 'k13'), (487, 778, 'k26'), (488, 685, 'k39'), (489, 592, 'k52'), (490, 499, 'k65'), (491, 406, 'k78'), (492, 313, 'k91'), (493, 220, 'k7'), (494, 127, 'k20'), (495, 34, 'k33'), (496, 1944, 'k46'), (497, 1851, 'k59'), (498, 1758, 'k72'), (499, 1665, 'k85'), (500, 1572, 'k1'), (501, 1479, 'k14'), (502, 1386, 'k27'), (503, 1293, 'k40'), (504, 1200, 'k53'), (505, 1107, 'k66'), (506, 1014, 'k79'), (507, 921, 'k92'), (508, 828, 'k8'), (509, 735, 'k21'), (510, 642, 'k34'), (511, 549, 'k47'), (512, 456, 'k60'), (513, 363, 'k73'), (514, 270, 'k86'), (515, 177, 'k2'), (516, 84, 'k15'), (517, 1994, 'k28'), (518, 1901, 'k41'), (519, 1808, 'k54'), (520, 1715, 'k67'), (521, 1622, 'k80'), (522, 1529, 'k93'), (523, 1436, 'k9'), (524, 1343, 'k22'), (525, 1250, 'k35'), (526, 1157, 'k48'), (527, 1064, 'k61'), (528, 971, 'k74'), (529, 878, 'k87'), (530, 785, 'k3'), (531, 692, 'k16'), (532, 599, 'k29'), (533, 506, 'k42'), (534, 413, 'k55'), (535, 320, 'k68'), (536, 227, 'k81'), (537, 134, 'k94'), (538, 41, 'k10'), (539, 1951, 'k23'), (540, 1858, 'k36'), (541, 1765, 'k49'), (542, 1672, 'k62'), (543, 1579, 'k75'), (544, 1486, 'k88'), (545, 1393, 'k4'), (546, 1300, 'k17'), (547, 1207, 'k30'), (548, 1114, 'k43'), (549, 1021, 'k56'), (550, 928, 'k69'), (551, 835, 'k82'), (552, 742, 'k95'), (553, 649, 'k11'), (554, 556, 'k24'), (555, 463, 'k37'), (556, 370, 'k50'), (557, 277, 'k63'), (558, 184, 'k76'), (559, 91, 'k89'), (560, 2001, 'k5'), (561, 1908, 'k18'), (562, 1815, 'k31'), (563, 1722, 'k44'), (564, 1629, 'k57'), (565, 1536, 'k70'), (566, 1443, 'k83'), (567, 1350, 'k96'), (568, 1257, 'k12'), (569, 1164, 'k25'), (570, 1071, 'k38'), (571, 978, 'k51'), (572, 885, 'k64'), (573, 792, 'k77'), (574, 699, 'k90'), (575, 606, 'k6'), (576, 513, 'k19'), (577, 420, 'k32'), (578, 327, 'k45'), (579, 234, 'k58'), (580, 141, 'k71'), (581, 48, 'k84'), (582, 1958, 'k0'), (583, 1865, 'k13'), (584, 1772, 'k26'), (585, 1679, 'k39'), (586, 1586, 'k52'), (587, 1493, 'k65'), (588, 1400, 'k78'), (589, 1307, 'k91'), (590, 1214, 'k7'), (591, 1121, 'k20'), (592, 1028, 'k33'), (593, 935, 'k46'), (594, 842, 'k59'), (595, 749, 'k72'), (596, 656, 'k85'), (597, 563, 'k1'), (598, 470, 'k14'), (599, 377, 'k27'), (600, 284, 'k40'), (601, 191, 'k53'), (602, 98, 'k66'), (603, 5, 'k79'), (604, 1915, 'k92'), (605, 1822, 'k8'), (606, 1729, 'k21'), (607, 1636, 'k34'), (608, 1543, 'k47'), (609, 1450, 'k60'), (610, 1357, 'k73'), (611, 1264, 'k86'), (612, 1171, 'k2'), (613, 1078, 'k15'), (614, 985, 'k28'), (615, 892, 'k41'), (616, 799, 'k54'), (617, 706, 'k67'), (618, 613, 'k80'), (619, 520, 'k93'), (620, 427, 'k9'), (621, 334, 'k22'), (622, 241, 'k35'), (623, 148, 'k48'), (624, 55, 'k61'), (625, 1965, 'k74'), (626, 1872, 'k87'), (627, 1779, 'k3'), (628, 1686, 'k16'), (629, 1593, 'k29'), (630, 1500, 'k42'), (631, 1407, 'k55'), (632, 1314, 'k68'), (633, 1221, 'k81'), (634, 1128, 'k94'), (635, 1035, 'k10'), (636, 942, 'k23'), (637, 849, 'k36'), (638, 756, 'k49'), (639, 663, 'k62'), (640, 570, 'k75'), (641, 477, 'k88'), (642, 384, 'k4'), (643, 291, 'k17'), (644, 198, 'k30'), (645, 105, 'k43'), (646, 12, 'k56'), (647, 1922, 'k69'), (648, 1829, 'k82'), (649, 1736, 'k95'), (650, 1643, 'k11'), (651, 1550, 'k24'), (652, 1457, 'k37'), (653, 1364, 'k50'), (654, 1271, 'k63'), (655, 1178, 'k76'), (656, 1085, 'k89'), (657, 992, 'k5'), (658, 899, 'k18'), (659, 806, 'k31'), (660, 713, 'k44'), (661, 620, 'k57'), (662, 527, 'k70'), (663, 434, 'k83'), (664, 341, 'k96'), (665, 248, 'k12'), (666, 155, 'k25'), (667, 62, 'k38'), (668, 1972, 'k51'), (669, 1879, 'k64'), (670, 1786, 'k77'), (671, 1693, 'k90'), (672, 1600, 'k6'), (673, 1507, 'k19'), (674, 1414, 'k32'), (675, 1321, 'k45'), (676, 1228, 'k58'), (677, 1135, 'k71'), (678, 1042, 'k84'), (679, 949, 'k0'), (680, 856, 'k13'), (681, 763, 'k26'), (682, 670, 'k39'), (683, 577, 'k52'), (684, 484, 'k65'), (685, 391, 'k78'), (686, 298, 'k91'), (687, 205, 'k7'), (688, 112, 'k20'), (689, 19, 'k33'), (690, 1929, 'k46'), (691, 1836, 'k59'), (692, 1743, 'k72'), (693, 1650, 'k85'), (694, 1557, 'k1'), (695, 1464, 'k14'), (696, 1371, 'k27'), (697, 1278, 'k40'), (698, 1185, 'k53'), (699, 1092, 'k66'), (700, 999, 'k79'), (701, 906, 'k92'), (702, 813, 'k8'), (703, 720, 'k21'), (704, 627, 'k34'), (705, 534, 'k47'), (706, 441, 'k60'), (707, 348, 'k73'), (708, 255, 'k86'), (709, 162, 'k2'), (710, 69, 'k15'), (711, 1979, 'k28'), (712, 1886, 'k41'), (713, 1793, 'k54'), (714, 1700, 'k67'), (715, 1607, 'k80'), (716, 1514, 'k93'), (717, 1421, 'k9'), (718, 1328, 'k22'), (719, 1235, 'k35'), (720, 1142, 'k48'), (721, 1049, 'k61'), (722, 956, 'k74'), (723, 863, 'k87'), (724, 770, 'k3'), (725, 677, 'k16'), (726, 584, 'k29'), (727, 491, 'k42'), (728, 398, 'k55'), (729, 305, 'k68'), (730, 212, 'k81'), (731, 119, 'k94'), (732, 26, 'k10'), (733, 1936, 'k23'), (734, 1843, 'k36'), (735, 1750, 'k49'), (736, 1657, 'k62'), (737, 1564, 'k75'), (738, 1471, 'k88'), (739, 1378, 'k4'), (740, 1285, 'k17'), (741, 1192, 'k30'), (742, 1099, 'k43'), (743, 1006, 'k56'), (744, 913, 'k69'), (745, 820, 'k82'), (746, 727, 'k95'), (747, 634, 'k11'), (748, 541, 'k24'), (749, 448, 'k37'), (750, 355, 'k50'), (751, 262, 'k63'), (752, 169, 'k76'), (753, 76, 'k89'), (754, 1986, 'k5'), (755, 1893, 'k18'), (756, 1800, 'k31'), (757, 1707, 'k44'), (758, 1614, 'k57'), (759, 1521, 'k70'), (760, 1428, 'k83'), (761, 1335, 'k96'), (762, 1242, 'k12'), (763, 1149, 'k25'), (764, 1056, 'k38'), (765, 963, 'k51'), (766, 870, 'k64'), (767, 777, 'k77'), (768, 684, 'k90'), (769, 591, 'k6'), (770, 498, 'k19'), (771, 405, 'k32'), (772, 312, 'k45'), (773, 219, 'k58'), (774, 126, 'k71'), (775, 33, 'k84'), (776, 1943, 'k0'), (777, 1850, 'k13'), (778, 1757, 'k26'), (779, 1664, 'k39'), (780, 1571, 'k52'), (781, 1478, 'k65'), (782, 1385, 'k78'), (783, 1292, 'k91'), (784, 1199, 'k7'), (785, 1106, 'k20'), (786, 1013, 'k33'), (787, 920, 'k46'), (788, 827, 'k59'), (789, 734, 'k72'), (790, 641, 'k85'), (791, 548, 'k1'), (792, 455, 'k14'), (793, 362, 'k27'), (794, 269, 'k40'), (795, 176, 'k53'), (796, 83, 'k66'), (797, 1993, 'k79'), (798, 1900, 'k92'), (799, 1807, 'k8'), (800, 1714, 'k21'), (801, 1621, 'k34'), (802, 1528, 'k47'), (803, 1435, 'k60'), (804, 1342, 'k73'), (805, 1249, 'k86'), (806, 1156, 'k2'), (807, 1063, 'k15'), (808, 970, 'k28'), (809, 877, 'k41'), (810, 784, 'k54'), (811, 691, 'k67'), (812, 598, 'k80'), (813, 505, 'k93'), (814, 412, 'k9'), (815, 319, 'k22'), (816, 226, 'k35'), (817, 133, 'k48'), (818, 40, 'k61'), (819, 1950, 'k74'), (820, 1857, 'k87'), (821, 1764, 'k3'), (822, 1671, 'k16'), (823, 1578, 'k29'), (824, 1485, 'k42'), (825, 1392, 'k55'), (826, 1299, 'k68'), (827, 1206, 'k81'), (828, 1113, 'k94'), (829, 1020, 'k10'), (830, 927, 'k23'), (831, 834, 'k36'), (832, 741, 'k49'), (833, 648, 'k62'), (834, 555, 'k75'), (835, 462, 'k88'), (836, 369, 'k4'), (837, 276, 'k17'), (838, 183, 'k30'), (839, 90, 'k43'), (840, 2000, 'k56'), (841, 1907, 'k69'), (842, 1814, 'k82'), (843, 1721, 'k95'), (844, 1628, 'k11'), (845, 1535, 'k24'), (846, 1442, 'k37'), (847, 1349, 'k50'), (848, 1256, 'k63'), (849, 1163, 'k76'), (850, 1070, 'k89'), (851, 977, 'k5'), (852, 884, 'k18'), (853, 791, 'k31'), (854, 698, 'k44'), (855, 605, 'k57'), (856, 512, 'k70'), (857, 419, 'k83'), (858, 326, 'k96'), (859, 233, 'k12'), (860, 140, 'k25'), (861, 47, 'k38'), (862, 1957, 'k51'), (863, 1864, 'k64'), (864, 1771, 'k77'), (865, 1678, 'k90'), (866, 1585, 'k6'), (867, 1492, 'k19'), (868, 1399, 'k32'), (869, 1306, 'k45'), (870, 1213, 'k58'), (871, 1120, 'k71'), (872, 1027, 'k84'), (873, 934, 'k0'), (874, 841, 'k13'), (875, 748, 'k26'), (876, 655, 'k39'), (877, 562, 'k52'), (878, 469, 'k65'), (879, 376, 'k78'), (880, 283, 'k91'), (881, 190, 'k7'), (882, 97, 'k20'), (883, 4, 'k33'), (884, 1914, 'k46'), (885, 1821, 'k59'), (886, 1728, 'k72'), (887, 1635, 'k85'), (888, 1542, 'k1'), (889, 1449, 'k14'), (890, 1356, 'k27'), (891, 1263, 'k40'), (892, 1170, 'k53'), (893, 1077, 'k66'), (894, 984, 'k79'), (895, 891, 'k92'), (896, 798, 'k8'), (897, 705, 'k21'), (898, 612, 'k34'), (899, 519, 'k47'), (900, 426, 'k60'), (901, 333, 'k73'), (902, 240, 'k86'), (903, 147, 'k2'), (904, 54, 'k15'), (905, 1964, 'k28'), (906, 1871, 'k41'), (907, 1778, 'k54'), (908, 1685, 'k67'), (909, 1592, 'k80'), (910, 1499, 'k93'), (911, 1406, 'k9'), (912, 1313, 'k22'), (913, 1220, 'k35'), (914, 1127, 'k48'), (915, 1034, 'k61'), (916, 941, 'k74'), (917, 848, 'k87'), (918, 755, 'k3'), (919, 662, 'k16'), (920, 569, 'k29'), (921, 476, 'k42'), (922, 383, 'k55'), (923, 290, 'k68'), (924, 197, 'k81'), (925, 104, 'k94'), (926, 11, 'k10'), (927, 1921, 'k23'), (928, 1828, 'k36'), (929, 1735, 'k49'), (930, 1642, 'k62'), (931, 1549, 'k75'), (932, 1456, 'k88'), (933, 1363, 'k4'), (934, 1270, 'k17'), (935, 1177, 'k30'), (936, 1084, 'k43'), (937, 991, 'k56'), (938, 898, 'k69'), (939, 805, 'k82'), (940, 712, 'k95'), (941, 619, 'k11'), (942, 526, 'k24'), (943, 433, 'k37'), (944, 340, 'k50'), (945, 247, 'k63'), (946, 154, 'k76'), (947, 61, 'k89'), (948, 1971, 'k5'), (949, 1878, 'k18'), (950, 1785, 'k31'), (951, 1692, 'k44'), (952, 1599, 'k57'), (953, 1506, 'k70'), (954, 1413, 'k83'), (955, 1320, 'k96'), (956, 1227, 'k12'), (957, 1134, 'k25'), (958, 1041, 'k38'), (959, 948, 'k51'), (960, 855, 'k64'), (961, 762, 'k77'), (962, 669, 'k90'), (963, 576, 'k6'), (964, 483, 'k19'), (965, 390, 'k32'), (966, 297, 'k45'), (967, 204, 'k58'), (968, 111, 'k71'), (969, 18, 'k84'), (970, 1928, 'k0'), (971, 1835, 'k13'), (972, 1742, 'k26'), (973, 1649, 'k39'), (974, 1556, 'k52'), (975, 1463, 'k65'), (976, 1370, 'k78'), (977, 1277, 'k91'), (978, 1184, 'k7'), (979, 1091, 'k20'), (980, 998, 'k33'), (981, 905, 'k46'), (982, 812, 'k59'), (983, 719, 'k72'), (984, 626, 'k85'), (985, 533, 'k1'), (986, 440, 'k14'), (987, 347, 'k27'), (988, 254, 'k40'), (989, 161, 'k53'), (990, 68, 'k66'), (991, 1978, 'k79'), (992, 1885, 'k92'), (993, 1792, 'k8'), (994, 1699, 'k21'), (995, 1606, 'k34'), (996, 1513, 'k47'), (997, 1420, 'k60'), (998, 1327, 'k73'), (999, 1234, 'k86'), (1000, 1141, 'k2'), (1001, 1048, 'k15'), (1002, 955, 'k28'), (1003, 862, 'k41'), (1004, 769, 'k54'), (1005, 676, 'k67'), (1006, 583, 'k80'), (1007, 490, 'k93'), (1008, 397, 'k9'), (1009, 304, 'k22'), (1010, 211, 'k35'), (1011, 118, 'k48'), (1012, 25, 'k61'), (1013, 1935, 'k74'), (1014, 1842, 'k87'), (1015, 1749, 'k3'), (1016, 1656, 'k16'), (1017, 1563, 'k29'), (1018, 1470, 'k42'), (1019, 1377, 'k55'), (1020, 1284, 'k68'), (1021, 1191, 'k81'), (1022, 1098, 'k94'), (1023, 1005, 'k10'), (1024, 912, 'k23'), (1025, 819, 'k36'), (1026, 726, 'k49'), (1027, 633, 'k62'), (1028, 540, 'k75'), (1029, 447, 'k88'), (1030, 354, 'k4'), (1031, 261, 'k17'), (1032, 168, 'k30'), (1033, 75, 'k43'), (1034, 1985, 'k56'), (1035, 1892, 'k69'), (1036, 1799, 'k82'), (1037, 1706, 'k95'), (1038, 1613, 'k11'), (1039, 1520, 'k24'), (1040, 1427, 'k37'), (1041, 1334, 'k50'), (1042, 1241, 'k63'), (1043, 1148, 'k76'), (1044, 1055, 'k89'), (1045, 962, 'k5'), (1046, 869, 'k18'), (1047, 776, 'k31'), (1048, 683, 'k44'), (1049, 590, 'k57'), (1050, 497, 'k70'), (1051, 404, 'k83'), (1052, 311, 'k96'), (1053, 218, 'k12'), (1054, 125, 'k25'), (1055, 32, 'k38'), (1056, 1942, 'k51'), (1057, 1849, 'k64'), (1058, 1756, 'k77'), (1059, 1663, 'k90'), (1060, 1570, 'k6'), (1061, 1477, 'k19'), (1062, 1384, 'k32'), (1063, 1291, 'k45'), (1064, 1198, 'k58'), (1065, 1105, 'k71'), (1066, 1012, 'k84'), (1067, 919, 'k0'), (1068, 826, 'k13'), (1069, 733, 'k26'), (1070, 640, 'k39'), (1071, 547, 'k52'), (1072, 454, 'k65'), (1073, 361, 'k78'), (1074, 268, 'k91'), (1075, 175, 'k7'), (1076, 82, 'k20'), (1077, 1992, 'k33'), (1078, 1899, 'k46'), (1079, 1806, 'k59'), (1080, 1713, 'k72'), (1081, 1620, 'k85'), (1082, 1527, 'k1'), (1083, 1434, 'k14'), (1084, 1341, 'k27'), (1085, 1248, 'k40'), (1086, 1155, 'k53'), (1087, 1062, 'k66'), (1088, 969, 'k79'), (1089, 876, 'k92'), (1090, 783, 'k8'), (1091, 690, 'k21'), (1092, 597, 'k34'), (1093, 504, 'k47'), (1094, 411, 'k60'), (1095, 318, 'k73'), (1096, 225, 'k86'), (1097, 132, 'k2'), (1098, 39, 'k15'), (1099, 1949, 'k28'), (1100, 1856, 'k41'), (1101, 1763, 'k54'), (1102, 1670, 'k67'), (1103, 1577, 'k80'), (1104, 1484, 'k93'), (1105, 1391, 'k9'), (1106, 1298, 'k22'), (1107, 1205, 'k35'), (1108, 1112, 'k48'), (1109, 1019, 'k61'), (1110, 926, 'k74'), (1111, 833, 'k87'), (1112, 740, 'k3'), (1113, 647, 'k16'), (1114, 554, 'k29'), (1115, 461, 'k42'), (1116, 368, 'k55'), (1117, 275, 'k68'), (1118, 182, 'k81'), (1119, 89, 'k94'), (1120, 1999, 'k10'), (1121, 1906, 'k23'), (1122, 1813, 'k36'), (1123, 1720, 'k49'), (1124, 1627, 'k62'), (1125, 1534, 'k75'), (1126, 1441, 'k88'), (1127, 1348, 'k4'), (1128, 1255, 'k17'), (1129, 1162, 'k30'), (1130, 1069, 'k43'), (1131, 976, 'k56'), (1132, 883, 'k69'), (1133, 790, 'k82'), (1134, 697, 'k95'), (1135, 604, 'k11'), (1136, 511, 'k24'), (1137, 418, 'k37'), (1138, 325, 'k50'), (1139, 232, 'k63'), (1140, 139, 'k76'), (1141, 46, 'k89'), (1142, 1956, 'k5'), (1143, 1863, 'k18'), (1144, 1770, 'k31'), (1145, 1677, 'k44'), (1146, 1584, 'k57'), (1147, 1491, 'k70'), (1148, 1398, 'k83'), (1149, 1305, 'k96'), (1150, 1212, 'k12'), (1151, 1119, 'k25'), (1152, 1026, 'k38'), (1153, 933, 'k51'), (1154, 840, 'k64'), (1155, 747, 'k77'), (1156, 654, 'k90'), (1157, 561, 'k6'), (1158, 468, 'k19'), (1159, 375, 'k32'), (1160, 282, 'k45'), (1161, 189, 'k58'), (1162, 96, 'k71'), (1163, 3, 'k84'), (1164, 1913, 'k0'), (1165, 1820, 'k13'), (1166, 1727, 'k26'), (1167, 1634, 'k39'), (1168, 1541, 'k52'), (1169, 1448, 'k65'), (1170, 1355, 'k78'), (1171, 1262, 'k91'), (1172, 1169, 'k7'), (1173, 1076, 'k20'), (1174, 983, 'k33'), (1175, 890, 'k46'), (1176, 797, 'k59'), (1177, 704, 'k72'), (1178, 611, 'k85'), (1179, 518, 'k1'), (1180, 425, 'k14'), (1181, 332, 'k27'), (1182, 239, 'k40'), (1183, 146, 'k53'), (1184, 53, 'k66'), (1185, 1963, 'k79'), (1186, 1870, 'k92'), (1187, 1777, 'k8'), (1188, 1684, 'k21'), (1189, 1591, 'k34'), (1190, 1498, 'k47'), (1191, 1405, 'k60'), (1192, 1312, 'k73'), (1193, 1219, 'k86'), (1194, 1126, 'k2'), (1195, 1033, 'k15'), (1196, 940, 'k28'), (1197, 847, 'k41'), (1198, 754, 'k54'), (1199, 661, 'k67'), (1200, 568, 'k80'), (1201, 475, 'k93'), (1202, 382, 'k9'), (1203, 289, 'k22'), (1204, 196, 'k35'), (1205, 103, 'k48'), (1206, 10, 'k61'), (1207, 1920, 'k74'), (1208, 1827, 'k87'), (1209, 1734, 'k3'), (1210, 1641, 'k16'), (1211, 1548, 'k29'), (1212, 1455, 'k42'), (1213, 1362, 'k55'), (1214, 1269, 'k68'), (1215, 1176, 'k81'), (1216, 1083, 'k94'), (1217, 990, 'k10'), (1218, 897, 'k23'), (1219, 804, 'k36'), (1220, 711, 'k49'), (1221, 618, 'k62'), (1222, 525, 'k75'), (1223, 432, 'k88'), (1224, 339, 'k4'), (1225, 246, 'k17'), (1226, 153, 'k30'), (1227, 60, 'k43'), (1228, 1970, 'k56'), (1229, 1877, 'k69'), (1230, 1784, 'k82'), (1231, 1691, 'k95'), (1232, 1598, 'k11'), (1233, 1505, 'k24'), (1234, 1412, 'k37'), (1235, 1319, 'k50'), (1236, 1226, 'k63'), (1237, 1133, 'k76'), (1238, 1040, 'k89'), (1239, 947, 'k5'), (1240, 854, 'k18'), (1241, 761, 'k31'), (1242, 668, 'k44'), (1243, 575, 'k57'), (1244, 482, 'k70'), (1245, 389, 'k83'), (1246, 296, 'k96'), (1247, 203, 'k12'), (1248, 110, 'k25'), (1249, 17, 'k38'), (1250, 1927, 'k51'), (1251, 1834, 'k64'), (1252, 1741, 'k77'), (1253, 1648, 'k90'), (1254, 1555, 'k6'), (1255, 1462, 'k19'), (1256, 1369, 'k32'), (1257, 1276, 'k45'), (1258, 1183, 'k58'), (1259, 1090, 'k71'), (1260, 997, 'k84'), (1261, 904, 'k0'), (1262, 811, 'k13'), (1263, 718, 'k26'), (1264, 625, 'k39'), (1265, 532, 'k52'), (1266, 439, 'k65'), (1267, 346, 'k78'), (1268, 253, 'k91'), (1269, 160, 'k7'), (1270, 67, 'k20'), (1271, 1977, 'k33'), (1272, 1884, 'k46'), (1273, 1791, 'k59'), (1274, 1698, 'k72'), (1275, 1605, 'k85'), (1276, 1512, 'k1'), (1277, 1419, 'k14'), (1278, 1326, 'k27'), (1279, 1233, 'k40'), (1280, 1140, 'k53'), (1281, 1047, 'k66'), (1282, 954, 'k79'), (1283, 861, 'k92'), (1284, 768, 'k8'), (1285, 675, 'k21'), (1286, 582, 'k34'), (1287, 489, 'k47'), (1288, 396, 'k60'), (1289, 303, 'k73'), (1290, 210, 'k86'), (1291, 117, 'k2'), (1292, 24, 'k15'), (1293, 1934, 'k28'), (1294, 1841, 'k41'), (1295, 1748, 'k54'), (1296, 1655, 'k67'), (1297, 1562, 'k80'), (1298, 1469, 'k93'), (1299, 1376, 'k9'), (1300, 1283, 'k22'), (1301, 1190, 'k35'), (1302, 1097, 'k48'), (1303, 1004, 'k61'), (1304, 911, 'k74'), (1305, 818, 'k87'), (1306, 725, 'k3'), (1307, 632, 'k16'), (1308, 539, 'k29'), (1309, 446, 'k42'), (1310, 353, 'k55'), (1311, 260, 'k68'), (1312, 167, 'k81'), (1313, 74, 'k94'), (1314, 1984, 'k10'), (1315, 1891, 'k23'), (1316, 1798, 'k36'), (1317, 1705, 'k49'), (1318, 1612, 'k62'), (1319, 1519, 'k75'), (1320, 1426, 'k88'), (1321, 1333, 'k4'), (1322, 1240, 'k17'), (1323, 1147, 'k30'), (1324, 1054, 'k43'), (1325, 961, 'k56'), (1326, 868, 'k69'), (1327, 775, 'k82'), (1328, 682, 'k95'), (1329, 589, 'k11'), (1330, 496, 'k24'), (1331, 403, 'k37'), (1332, 310, 'k50'), (1333, 217, 'k63'), (1334, 124, 'k76'), (1335, 31, 'k89'), (1336, 1941, 'k5'), (1337, 1848, 'k18'), (1338, 1755, 'k31'), (1339, 1662, 'k44'), (1340, 1569, 'k57'), (1341, 1476, 'k70'), (1342, 1383, 'k83'), (1343, 1290, 'k96'), (1344, 1197, 'k12'), (1345, 1104, 'k25'), (1346, 1011, 'k38'), (1347, 918, 'k51'), (1348, 825, 'k64'), (1349, 732, 'k77'), (1350, 639, 'k90'), (1351, 546, 'k6'), (1352, 453, 'k19'), (1353, 360, 'k32'), (1354, 267, 'k45'), (1355, 174, 'k58'), (1356, 81, 'k71'), (1357, 1991, 'k84'), (1358, 1898, 'k0'), (1359, 1805, 'k13'), (1360, 1712, 'k26'), (1361, 1619, 'k39'), (1362, 1526, 'k52'), (1363, 1433, 'k65'), (1364, 1340, 'k78'), (1365, 1247, 'k91'), (1366, 1154, 'k7'), (1367, 1061, 'k20'), (1368, 968, 'k33'), (1369, 875, 'k46'), (1370, 782, 'k59'), (1371, 689, 'k72'), (1372, 596, 'k85'), (1373, 503, 'k1'), (1374, 410, 'k14'), (1375, 317, 'k27'), (1376, 224, 'k40'), (1377, 131, 'k53'), (1378, 38, 'k66'), (1379, 1948, 'k79'), (1380, 1855, 'k92'), (1381, 1762, 'k8'), (1382, 1669, 'k21'), (1383, 1576, 'k34'), (1384, 1483, 'k47'), (1385, 1390, 'k60'), (1386, 1297, 'k73'), (1387, 1204, 'k86'), (1388, 1111, 'k2'), (1389, 1018, 'k15'), (1390, 925, 'k28'), (1391, 832, 'k41'), (1392, 739, 'k54'), (1393, 646, 'k67'), (1394, 553, 'k80'), (1395, 460, 'k93'), (1396, 367, 'k9'), (1397, 274, 'k22'), (1398, 181, 'k35'), (1399, 88, 'k48'), (1400, 1998, 'k61'), (1401, 1905, 'k74'), (1402, 1812, 'k87'), (1403, 1719, 'k3'), (1404, 1626, 'k16'), (1405, 1533, 'k29'), (1406, 1440, 'k42'), (1407, 1347, 'k55'), (1408, 1254, 'k68'), (1409, 1161, 'k81'), (1410, 1068, 'k94'), (1411, 975, 'k10'), (1412, 882, 'k23'), (1413, 789, 'k36'), (1414, 696, 'k49'), (1415, 603, 'k62'), (1416, 510, 'k75'), (1417, 417, 'k88'), (1418, 324, 'k4'), (1419, 231, 'k17'), (1420, 138, 'k30'), (1421, 45, 'k43'), (1422, 1955, 'k56'), (1423, 1862, 'k69'), (1424, 1769, 'k82'), (1425, 1676, 'k95'), (1426, 1583, 'k11'), (1427, 1490, 'k24'), (1428, 1397, 'k37'), (1429, 1304, 'k50'), (1430, 1211, 'k63'), (1431, 1118, 'k76'), (1432, 1025, 'k89'), (1433, 932, 'k5'), (1434, 839, 'k18'), (1435, 746, 'k31'), (1436, 653, 'k44'), (1437, 560, 'k57'), (1438, 467, 'k70'), (1439, 374, 'k83'), (1440, 281, 'k96'), (1441, 188, 'k12'), (1442, 95, 'k25'), (1443, 2, 'k38'), (1444, 1912, 'k51'), (1445, 1819, 'k64'), (1446, 1726, 'k77'), (1447, 1633, 'k90'), (1448, 1540, 'k6'), (1449, 1447, 'k19'), (1450, 1354, 'k32'), (1451, 1261, 'k45'), (1452, 1168, 'k58'), (1453, 1075, 'k71'), (1454, 982, 'k84'), (1455, 889, 'k0'), (1456, 796, 'k13'), (1457, 703, 'k26'), (1458, 610, 'k39'), (1459, 517, 'k52'), (1460, 424, 'k65'), (1461, 331, 'k78'), (1462, 238, 'k91'), (1463, 145, 'k7'), (1464, 52, 'k20'), (1465, 1962, 'k33'), (1466, 1869, 'k46'), (1467, 1776, 'k59'), (1468, 1683, 'k72'), (1469, 1590, 'k85'), (1470, 1497, 'k1'), (1471, 1404, 'k14'), (1472, 1311, 'k27'), (1473, 1218, 'k40'), (1474, 1125, 'k53'), (1475, 1032, 'k66'), (1476, 939, 'k79'), (1477, 846, 'k92'), (1478, 753, 'k8'), (1479, 660, 'k21'), (1480, 567, 'k34'), (1481, 474, 'k47'), (1482, 381, 'k60'), (1483, 288, 'k73'), (1484, 195, 'k86'), (1485, 102, 'k2'), (1486, 9, 'k15'), (1487, 1919, 'k28'), (1488, 1826, 'k41'), (1489, 1733, 'k54'), (1490, 1640, 'k67'), (1491, 1547, 'k80'), (1492, 1454, 'k93'), (1493, 1361, 'k9'), (1494, 1268, 'k22'), (1495, 1175, 'k35'), (1496, 1082, 'k48'), (1497, 989, 'k61'), (1498, 896, 'k74'), (1499, 803, 'k87'), (1500, 710, 'k3'), (1501, 617, 'k16'), (1502, 524, 'k29'), (1503, 431, 'k42'), (1504, 338, 'k55'), (1505, 245, 'k68'), (1506, 152, 'k81'), (1507, 59, 'k94'), (1508, 1969, 'k10'), (1509, 1876, 'k23'), (1510, 1783, 'k36'), (1511, 1690, 'k49'), (1512, 1597, 'k62'), (1513, 1504, 'k75'), (1514, 1411, 'k88'), (1515, 1318, 'k4'), (1516, 1225, 'k17'), (1517, 1132, 'k30'), (1518, 1039, 'k43'), (1519, 946, 'k56'), (1520, 853, 'k69'), (1521, 760, 'k82'), (1522, 667, 'k95'), (1523, 574, 'k11'), (1524, 481, 'k24'), (1525, 388, 'k37'), (1526, 295, 'k50'), (1527, 202, 'k63'), (1528, 109, 'k76'), (1529, 16, 'k89'), (1530, 1926, 'k5'), (1531, 1833, 'k18'), (1532, 1740, 'k31'), (1533, 1647, 'k44'), (1534, 1554, 'k57'), (1535, 1461, 'k70'), (1536, 1368, 'k83'), (1537, 1275, 'k96'), (1538, 1182, 'k12'), (1539, 1089, 'k25'), (1540, 996, 'k38'), (1541, 903, 'k51'), (1542, 810, 'k64'), (1543, 717, 'k77'), (1544, 624, 'k90'), (1545, 531, 'k6'), (1546, 438, 'k19'), (1547, 345, 'k32'), (1548, 252, 'k45'), (1549, 159, 'k58'), (1550, 66, 'k71'), (1551, 1976, 'k84'), (1552, 1883, 'k0'), (1553, 1790, 'k13'), (1554, 1697, 'k26'), (1555, 1604, 'k39'), (1556, 1511, 'k52'), (1557, 1418, 'k65'), (1558, 1325, 'k78'), (1559, 1232, 'k91'), (1560, 1139, 'k7'), (1561, 1046, 'k20'), (1562, 953, 'k33'), (1563, 860, 'k46'), (1564, 767, 'k59'), (1565, 674, 'k72'), (1566, 581, 'k85'), (1567, 488, 'k1'), (1568, 395, 'k14'), (1569, 302, 'k27'), (1570, 209, 'k40'), (1571, 116, 'k53'), (1572, 23, 'k66'), (1573, 1933, 'k79'), (1574, 1840, 'k92'), (1575, 1747, 'k8'), (1576, 1654, 'k21'), (1577, 1561, 'k34'), (1578, 1468, 'k47'), (1579, 1375, 'k60'), (1580, 1282, 'k73'), (1581, 1189, 'k86'), (1582, 1096, 'k2'), (1583, 1003, 'k15'), (1584, 910, 'k28'), (1585, 817, 'k41'), (1586, 724, 'k54'), (1587, 631, 'k67'), (1588, 538, 'k80'), (1589, 445, 'k93'), (1590, 352, 'k9'), (1591, 259, 'k22'), (1592, 166, 'k35'), (1593, 73, 'k48'), (1594, 1983, 'k61'), (1595, 1890, 'k74'), (1596, 1797, 'k87'), (1597, 1704, 'k3'), (1598, 1611, 'k16'), (1599, 1518, 'k29'), (1600, 1425, 'k42'), (1601, 1332, 'k55'), (1602, 1239, 'k68'), (1603, 1146, 'k81'), (1604, 1053, 'k94'), (1605, 960, 'k10'), (1606, 867, 'k23'), (1607, 774, 'k36'), (1608, 681, 'k49'), (1609, 588, 'k62'), (1610, 495, 'k75'), (1611, 402, 'k88'), (1612, 309, 'k4'), (1613, 216, 'k17'), (1614, 123, 'k30'), (1615, 30, 'k43'), (1616, 1940, 'k56'), (1617, 1847, 'k69'), (1618, 1754, 'k82'), (1619, 1661, 'k95'), (1620, 1568, 'k11'), (1621, 1475, 'k24'), (1622, 1382, 'k37'), (1623, 1289, 'k50'), (1624, 1196, 'k63'), (1625, 1103, 'k76'), (1626, 1010, 'k89'), (1627, 917, 'k5'), (1628, 824, 'k18'), (1629, 731, 'k31'), (1630, 638, 'k44'), (1631, 545, 'k57'), (1632, 452, 'k70'), (1633, 359, 'k83'), (1634, 266, 'k96'), (1635, 173, 'k12'), (1636, 80, 'k25'), (1637, 1990, 'k38'), (1638, 1897, 'k51'), (1639, 1804, 'k64'), (1640, 1711, 'k77'), (1641, 1618, 'k90'), (1642, 1525, 'k6'), (1643, 1432, 'k19'), (1644, 1339, 'k32'), (1645, 1246, 'k45'), (1646, 1153, 'k58'), (1647, 1060, 'k71'), (1648, 967, 'k84'), (1649, 874, 'k0'), (1650, 781, 'k13'), (1651, 688, 'k26'), (1652, 595, 'k39'), (1653, 502, 'k52'), (1654, 409, 'k65'), (1655, 316, 'k78'), (1656, 223, 'k91'), (1657, 130, 'k7'), (1658, 37, 'k20'), (1659, 1947, 'k33'), (1660, 1854, 'k46'), (1661, 1761, 'k59'), (1662, 1668, 'k72'), (1663, 1575, 'k85'), (1664, 1482, 'k1'), (1665, 1389, 'k14'), (1666, 1296, 'k27'), (1667, 1203, 'k40'), (1668, 1110, 'k53'), (1669, 1017, 'k66'), (1670, 924, 'k79'), (1671, 831, 'k92'), (1672, 738, 'k8'), (1673, 645, 'k21'), (1674, 552, 'k34'), (1675, 459, 'k47'), (1676, 366, 'k60'), (1677, 273, 'k73'), (1678, 180, 'k86'), (1679, 87, 'k2'), (1680, 1997, 'k15'), (1681, 1904, 'k28'), (1682, 1811, 'k41'), (1683, 1718, 'k54'), (1684, 1625, 'k67'), (1685, 1532, 'k80'), (1686, 1439, 'k93'), (1687, 1346, 'k9'), (1688, 1253, 'k22'), (1689, 1160, 'k35'), (1690, 1067, 'k48'), (1691, 974, 'k61'), (1692, 881, 'k74'), (1693, 788, 'k87'), (1694, 695, 'k3'), (1695, 602, 'k16'), (1696, 509, 'k29'), (1697, 416, 'k42'), (1698, 323, 'k55'), (1699, 230, 'k68'), (1700, 137, 'k81'), (1701, 44, 'k94'), (1702, 1954, 'k10'), (1703, 1861, 'k23'), (1704, 1768, 'k36'), (1705, 1675, 'k49'), (1706, 1582, 'k62'), (1707, 1489, 'k75'), (1708, 1396, 'k88'), (1709, 1303, 'k4'), (1710, 1210, 'k17'), (1711, 1117, 'k30'), (1712, 1024, 'k43'), (1713, 931, 'k56'), (1714, 838, 'k69'), (1715, 745, 'k82'), (1716, 652, 'k95'), (1717, 559, 'k11'), (1718, 466, 'k24'), (1719, 373, 'k37'), (1720, 280, 'k50'), (1721, 187, 'k63'), (1722, 94, 'k76'), (1723, 1, 'k89'), (1724, 1911, 'k5'), (1725, 1818, 'k18'), (1726, 1725, 'k31'), (1727, 1632, 'k44'), (1728, 1539, 'k57'), (1729, 1446, 'k70'), (1730, 1353, 'k83'), (1731, 1260, 'k96'), (1732, 1167, 'k12'), (1733, 1074, 'k25'), (1734, 981, 'k38'), (1735, 888, 'k51'), (1736, 795, 'k64'), (1737, 702, 'k77'), (1738, 609, 'k90'), (1739, 516, 'k6'), (1740, 423, 'k19'), (1741, 330, 'k32'), (1742, 237, 'k45'), (1743, 144, 'k58'), (1744, 51, 'k71'), (1745, 1961, 'k84'), (1746, 1868, 'k0'), (1747, 1775, 'k13'), (1748, 1682, 'k26'), (1749, 1589, 'k39'), (1750, 1496, 'k52'), (1751, 1403, 'k65'), (1752, 1310, 'k78'), (1753, 1217, 'k91'), (1754, 1124, 'k7'), (1755, 1031, 'k20'), (1756, 938, 'k33'), (1757, 845, 'k46'), (1758, 752, 'k59'), (1759, 659, 'k72'), (1760, 566, 'k85'), (1761, 473, 'k1'), (1762, 380, 'k14'), (1763, 287, 'k27'), (1764, 194, 'k40'), (1765, 101, 'k53'), (1766, 8, 'k66'), (1767, 1918, 'k79'), (1768, 1825, 'k92'), (1769, 1732, 'k8'), (1770, 1639, 'k21'), (1771, 1546, 'k34'), (1772, 1453, 'k47'), (1773, 1360, 'k60'), (1774, 1267, 'k73'), (1775, 1174, 'k86'), (1776, 1081, 'k2'), (1777, 988, 'k15'), (1778, 895, 'k28'), (1779, 802, 'k41'), (1780, 709, 'k54'), (1781, 616, 'k67'), (1782, 523, 'k80'), (1783, 430, 'k93'), (1784, 337, 'k9'), (1785, 244, 'k22'), (1786, 151, 'k35'), (1787, 58, 'k48'), (1788, 1968, 'k61'), (1789, 1875, 'k74'), (1790, 1782, 'k87'), (1791, 1689, 'k3'), (1792, 1596, 'k16'), (1793, 1503, 'k29'), (1794, 1410, 'k42'), (1795, 1317, 'k55'), (1796, 1224, 'k68'), (1797, 1131, 'k81'), (1798, 1038, 'k94'), (1799, 945, 'k10'), (1800, 852, 'k23'), (1801, 759, 'k36'), (1802, 666, 'k49'), (1803, 573, 'k62'), (1804, 480, 'k75'), (1805, 387, 'k88'), (1806, 294, 'k4'), (1807, 201, 'k17'), (1808, 108, 'k30'), (1809, 15, 'k43'), (1810, 1925, 'k56'), (1811, 1832, 'k69'), (1812, 1739, 'k82'), (1813, 1646, 'k95'), (1814, 1553, 'k11'), (1815, 1460, 'k24'), (1816, 1367, 'k37'), (1817, 1274, 'k50'), (1818, 1181, 'k63'), (1819, 1088, 'k76'), (1820, 995, 'k89'), (1821, 902, 'k5'), (1822, 809, 'k18'), (1823, 716, 'k31'), (1824, 623, 'k44'), (1825, 530, 'k57'), (1826, 437, 'k70'), (1827, 344, 'k83'), (1828, 251, 'k96'), (1829, 158, 'k12'), (1830, 65, 'k25'), (1831, 1975, 'k38'), (1832, 1882, 'k51'), (1833, 1789, 'k64'), (1834, 1696, 'k77'), (1835, 1603, 'k90'), (1836, 1510, 'k6'), (1837, 1417, 'k19'), (1838, 1324, 'k32'), (1839, 1231, 'k45'), (1840, 1138, 'k58'), (1841, 1045, 'k71'), (1842, 952, 'k84'), (1843, 859, 'k0'), (1844, 766, 'k13'), (1845, 673, 'k26'), (1846, 580, 'k39'), (1847, 487, 'k52'), (1848, 394, 'k65'), (1849, 301, 'k78'), (1850, 208, 'k91'), (1851, 115, 'k7'), (1852, 22, 'k20'), (1853, 1932, 'k33'), (1854, 1839, 'k46'), (1855, 1746, 'k59'), (1856, 1653, 'k72'), (1857, 1560, 'k85'), (1858, 1467, 'k1'), (1859, 1374, 'k14'), (1860, 1281, 'k27'), (1861, 1188, 'k40'), (1862, 1095, 'k53'), (1863, 1002, 'k66'), (1864, 909, 'k79'), (1865, 816, 'k92'), (1866, 723, 'k8'), (1867, 630, 'k21'), (1868, 537, 'k34'), (1869, 444, 'k47'), (1870, 351, 'k60'), (1871, 258, 'k73'), (1872, 165, 'k86'), (1873, 72, 'k2'), (1874, 1982, 'k15'), (1875, 1889, 'k28'), (1876, 1796, 'k41'), (1877, 1703, 'k54'), (1878, 1610, 'k67'), (1879, 1517, 'k80'), (1880, 1424, 'k93'), (1881, 1331, 'k9'), (1882, 1238, 'k22'), (1883, 1145, 'k35'), (1884, 1052, 'k48'), (1885, 959, 'k61'), (1886, 866, 'k74'), (1887, 773, 'k87'), (1888, 680, 'k3'), (1889, 587, 'k16'), (1890, 494, 'k29'), (1891, 401, 'k42'), (1892, 308, 'k55'), (1893, 215, 'k68'), (1894, 122, 'k81'), (1895, 29, 'k94'), (1896, 1939, 'k10'), (1897, 1846, 'k23'), (1898, 1753, 'k36'), (1899, 1660, 'k49'), (1900, 1567, 'k62'), (1901, 1474, 'k75'), (1902, 1381, 'k88'), (1903, 1288, 'k4'), (1904, 1195, 'k17'), (1905, 1102, 'k30'), (1906, 1009, 'k43'), (1907, 916, 'k56'), (1908, 823, 'k69'), (1909, 730, 'k82'), (1910, 637, 'k95'), (1911, 544, 'k11'), (1912, 451, 'k24'), (1913, 358, 'k37'), (1914, 265, 'k50'), (1915, 172, 'k63'), (1916, 79, 'k76'), (1917, 1989, 'k89'), (1918, 1896, 'k5'), (1919, 1803, 'k18'), (1920, 1710, 'k31'), (1921, 1617, 'k44'), (1922, 1524, 'k57'), (1923, 1431, 'k70'), (1924, 1338, 'k83'), (1925, 1245, 'k96'), (1926, 1152, 'k12'), (1927, 1059, 'k25'), (1928, 966, 'k38'), (1929, 873, 'k51'), (1930, 780, 'k64'), (1931, 687, 'k77'), (1932, 594, 'k90'), (1933, 501, 'k6'), (1934, 408, 'k19'), (1935, 315, 'k32'), (1936, 222, 'k45'), (1937, 129, 'k58'), (1938, 36, 'k71'), (1939, 1946, 'k84'), (1940, 1853, 'k0'), (1941, 1760, 'k13'), (1942, 1667, 'k26'), (1943, 1574, 'k39'), (1944, 1481, 'k52'), (1945, 1388, 'k65'), (1946, 1295, 'k78'), (1947, 1202, 'k91'), (1948, 1109, 'k7'), (1949, 1016, 'k20'), (1950, 923, 'k33'), (1951, 830, 'k46'), (1952, 737, 'k59'), (1953, 644, 'k72'), (1954, 551, 'k85'), (1955, 458, 'k1'), (1956, 365, 'k14'), (1957, 272, 'k27'), (1958, 179, 'k40'), (1959, 86, 'k53'), (1960, 1996, 'k66'), (1961, 1903, 'k79'), (1962, 1810, 'k92'), (1963, 1717, 'k8'), (1964, 1624, 'k21'), (1965, 1531, 'k34'), (1966, 1438, 'k47'), (1967, 1345, 'k60'), (1968, 1252, 'k73'), (1969, 1159, 'k86'), (1970, 1066, 'k2'), (1971, 973, 'k15'), (1972, 880, 'k28'), (1973, 787, 'k41'), (1974, 694, 'k54'), (1975, 601, 'k67'), (1976, 508, 'k80'), (1977, 415, 'k93'), (1978, 322, 'k9'), (1979, 229, 'k22'), (1980, 136, 'k35'), (1981, 43, 'k48'), (1982, 1953, 'k61'), (1983, 1860, 'k74'), (1984, 1767, 'k87'), (1985, 1674, 'k3'), (1986, 1581, 'k16'), (1987, 1488, 'k29'), (1988, 1395, 'k42'), (1989, 1302, 'k55'), (1990, 1209, 'k68'), (1991, 1116, 'k81'), (1992, 1023, 'k94'), (1993, 930, 'k10'), (1994, 837, 'k23'), (1995, 744, 'k36'), (1996, 651, 'k49'), (1997, 558, 'k62'), (1998, 465, 'k75'), (1999, 372, 'k88'), (2000, 279, 'k4'), (2001, 186, 'k17'), (2002, 93, 'k30'), (2003, 0, 'k43'), (2004, 1910, 'k56'), (2005, 1817, 'k69'), (2006, 1724, 'k82'), (2007, 1631, 'k95'), (2008, 1538, 'k11'), (2009, 1445, 'k24'), (2010, 1352, 'k37'), (2011, 1259, 'k50'), (2012, 1166, 'k63'), (2013, 1073, 'k76'), (2014, 980, 'k89'), (2015, 887, 'k5'), (2016, 794, 'k18'), (2017, 701, 'k31'), (2018, 608, 'k44'), (2019, 515, 'k57'), (2020, 422, 'k70'), (2021, 329, 'k83'), (2022, 236, 'k96'), (2023, 143, 'k12'), (2024, 50, 'k25'), (2025, 1960, 'k38'), (2026, 1867, 'k51'), (2027, 1774, 'k64'), (2028, 1681, 'k77'), (2029, 1588, 'k90'), (2030, 1495, 'k6'), (2031, 1402, 'k19'), (2032, 1309, 'k32'), (2033, 1216, 'k45'), (2034, 1123, 'k58'), (2035, 1030, 'k71'), (2036, 937, 'k84'), (2037, 844, 'k0'), (2038, 751, 'k13'), (2039, 658, 'k26'), (2040, 565, 'k39'), (2041, 472, 'k52'), (2042, 379, 'k65'), (2043, 286, 'k78'), (2044, 193, 'k91'), (2045, 100, 'k7'), (2046, 7, 'k20'), (2047, 1917, 'k33'), (2048, 1824, 'k46'), (2049, 1731, 'k59'), (2050, 1638, 'k72'), (2051, 1545, 'k85'), (2052, 1452, 'k1'), (2053, 1359, 'k14'), (2054, 1266, 'k27'), (2055, 1173, 'k40'), (2056, 1080, 'k53'), (2057, 987, 'k66'), (2058, 894, 'k79'), (2059, 801, 'k92'), (2060, 708, 'k8'), (2061, 615, 'k21'), (2062, 522, 'k34'), (2063, 429, 'k47'), (2064, 336, 'k60'), (2065, 243, 'k73'), (2066, 150, 'k86'), (2067, 57, 'k2'), (2068, 1967, 'k15'), (2069, 1874, 'k28'), (2070, 1781, 'k41'), (2071, 1688, 'k54'), (2072, 1595, 'k67'), (2073, 1502, 'k80'), (2074, 1409, 'k93'), (2075, 1316, 'k9'), (2076, 1223, 'k22'), (2077, 1130, 'k35'), (2078, 1037, 'k48'), (2079, 944, 'k61'), (2080, 851, 'k74'), (2081, 758, 'k87'), (2082, 665, 'k3'), (2083, 572, 'k16'), (2084, 479, 'k29'), (2085, 386, 'k42'), (2086, 293, 'k55'), (2087, 200, 'k68'), (2088, 107, 'k81'), (2089, 14, 'k94'), (2090, 1924, 'k10'), (2091, 1831, 'k23'), (2092, 1738, 'k36'), (2093, 1645, 'k49'), (2094, 1552, 'k62'), (2095, 1459, 'k75'), (2096, 1366, 'k88'), (2097, 1273, 'k4'), (2098, 1180, 'k17'), (2099, 1087, 'k30'), (2100, 994, 'k43'), (2101, 901, 'k56'), (2102, 808, 'k69'), (2103, 715, 'k82'), (2104, 622, 'k95'), (2105, 529, 'k11'), (2106, 436, 'k24'), (2107, 343, 'k37'), (2108, 250, 'k50'), (2109, 157, 'k63'), (2110, 64, 'k76'), (2111, 1974, 'k89'), (2112, 1881, 'k5'), (2113, 1788, 'k18'), (2114, 1695, 'k31'), (2115, 1602, 'k44'), (2116, 1509, 'k57'), (2117, 1416, 'k70'), (2118, 1323, 'k83'), (2119, 1230, 'k96'), (2120, 1137, 'k12'), (2121, 1044, 'k25'), (2122, 951, 'k38'), (2123, 858, 'k51'), (2124, 765, 'k64'), (2125, 672, 'k77'), (2126, 579, 'k90'), (2127, 486, 'k6'), (2128, 393, 'k19'), (2129, 300, 'k32'), (2130, 207, 'k45'), (2131, 114, 'k58'), (2132, 21, 'k71'), (2133, 1931, 'k84'), (2134, 1838, 'k0'), (2135, 1745, 'k13'), (2136, 1652, 'k26'), (2137, 1559, 'k39'), (2138, 1466, 'k52'), (2139, 1373, 'k65'), (2140, 1280, 'k78'), (2141, 1187, 'k91'), (2142, 1094, 'k7'), (2143, 1001, 'k20'), (2144, 908, 'k33'), (2145, 815, 'k46'), (2146, 722, 'k59'), (2147, 629, 'k72'), (2148, 536, 'k85'), (2149, 443, 'k1'), (2150, 350, 'k14'), (2151, 257, 'k27'), (2152, 164, 'k40'), (2153, 71, 'k53'), (2154, 1981, 'k66'), (2155, 1888, 'k79'), (2156, 1795, 'k92'), (2157, 1702, 'k8'), (2158, 1609, 'k21'), (2159, 1516, 'k34'), (2160, 1423, 'k47'), (2161, 1330, 'k60'), (2162, 1237, 'k73'), (2163, 1144, 'k86'), (2164, 1051, 'k2'), (2165, 958, 'k15'), (2166, 865, 'k28'), (2167, 772, 'k41'), (2168, 679, 'k54'), (2169, 586, 'k67'), (2170, 493, 'k80'), (2171, 400, 'k93'), (2172, 307, 'k9'), (2173, 214, 'k22'), (2174, 121, 'k35'), (2175, 28, 'k48'), (2176, 1938, 'k61'), (2177, 1845, 'k74'), (2178, 1752, 'k87'), (2179, 1659, 'k3'), (2180, 1566, 'k16'), (2181, 1473, 'k29'), (2182, 1380, 'k42'), (2183, 1287, 'k55'), (2184, 1194, 'k68'), (2185, 1101, 'k81'), (2186, 1008, 'k94'), (2187, 915, 'k10'), (2188, 822, 'k23'), (2189, 729, 'k36'), (2190, 636, 'k49'), (2191, 543, 'k62'), (2192, 450, 'k75'), (2193, 357, 'k88'), (2194, 264, 'k4'), (2195, 171, 'k17'), (2196, 78, 'k30'), (2197, 1988, 'k43'), (2198, 1895, 'k56'), (2199, 1802, 'k69'), (2200, 1709, 'k82'), (2201, 1616, 'k95'), (2202, 1523, 'k11'), (2203, 1430, 'k24'), (2204, 1337, 'k37'), (2205, 1244, 'k50'), (2206, 1151, 'k63'), (2207, 1058, 'k76'), (2208, 965, 'k89'), (2209, 872, 'k5'), (2210, 779, 'k18'), (2211, 686, 'k31'), (2212, 593, 'k44'), (2213, 500, 'k57'), (2214, 407, 'k70'), (2215, 314, 'k83'), (2216, 221, 'k96'), (2217, 128, 'k12'), (2218, 35, 'k25'), (2219, 1945, 'k38'), (2220, 1852, 'k51'), (2221, 1759, 'k64'), (2222, 1666, 'k77'), (2223, 1573, 'k90'), (2224, 1480, 'k6'), (2225, 1387, 'k19'), (2226, 1294, 'k32'), (2227, 1201, 'k45'), (2228, 1108, 'k58'), (2229, 1015, 'k71'), (2230, 922, 'k84'), (2231, 829, 'k0'), (2232, 736, 'k13'), (2233, 643, 'k26'), (2234, 550, 'k39'), (2235, 457, 'k52'), (2236, 364, 'k65'), (2237, 271, 'k78'), (2238, 178, 'k91'), (2239, 85, 'k7'), (2240, 1995, 'k20'), (2241, 1902, 'k33'), (2242, 1809, 'k46'), (2243, 1716, 'k59'), (2244, 1623, 'k72'), (2245, 1530, 'k85'), (2246, 1437, 'k1'), (2247, 1344, 'k14'), (2248, 1251, 'k27'), (2249, 1158, 'k40'), (2250, 1065, 'k53'), (2251, 972, 'k66'), (2252, 879, 'k79'), (2253, 786, 'k92'), (2254, 693, 'k8'), (2255, 600, 'k21'), (2256, 507, 'k34'), (2257, 414, 'k47'), (2258, 321, 'k60'), (2259, 228, 'k73'), (2260, 135, 'k86'), (2261, 42, 'k2'), (2262, 1952, 'k15'), (2263, 1859, 'k28'), (2264, 1766, 'k41'), (2265, 1673, 'k54'), (2266, 1580, 'k67'), (2267, 1487, 'k80'), (2268, 1394, 'k93'), (2269, 1301, 'k9'), (2270, 1208, 'k22'), (2271, 1115, 'k35'), (2272, 1022, 'k48'), (2273, 929, 'k61'), (2274, 836, 'k74'), (2275, 743, 'k87'), (2276, 650, 'k3'), (2277, 557, 'k16'), (2278, 464, 'k29'), (2279, 371, 'k42'), (2280, 278, 'k55'), (2281, 185, 'k68'), (2282, 92, 'k81'), (2283, 2002, 'k94'), (2284, 1909, 'k10'), (2285, 1816, 'k23'), (2286, 1723, 'k36'), (2287, 1630, 'k49'), (2288, 1537, 'k62'), (2289, 1444, 'k75'), (2290, 1351, 'k88'), (2291, 1258, 'k4'), (2292, 1165, 'k17'), (2293, 1072, 'k30'), (2294, 979, 'k43'), (2295, 886, 'k56'), (2296, 793, 'k69'), (2297, 700, 'k82'), (2298, 607, 'k95'), (2299, 514, 'k11'), (2300, 421, 'k24'), (2301, 328, 'k37'), (2302, 235, 'k50'), (2303, 142, 'k63'), (2304, 49, 'k76'), (2305, 1959, 'k89'), (2306, 1866, 'k5'), (2307, 1773, 'k18'), (2308, 1680, 'k31'), (2309, 1587, 'k44'), (2310, 1494, 'k57'), (2311, 1401, 'k70'), (2312, 1308, 'k83'), (2313, 1215, 'k96'), (2314, 1122, 'k12'), (2315, 1029, 'k25'), (2316, 936, 'k38'), (2317, 843, 'k51'), (2318, 750, 'k64'), (2319, 657, 'k77'), (2320, 564, 'k90'), (2321, 471, 'k6'), (2322, 378, 'k19'), (2323, 285, 'k32'), (2324, 192, 'k45'), (2325, 99, 'k58'), (2326, 6, 'k71'), (2327, 1916, 'k84'), (2328, 1823, 'k0'), (2329, 1730, 'k13'), (2330, 1637, 'k26'), (2331, 1544, 'k39'), (2332, 1451, 'k52'), (2333, 1358, 'k65'), (2334, 1265, 'k78'), (2335, 1172, 'k91'), (2336, 1079, 'k7'), (2337, 986, 'k20'), (2338, 893, 'k33'), (2339, 800, 'k46'), (2340, 707, 'k59'), (2341, 614, 'k72'), (2342, 521, 'k85'), (2343, 428, 'k1'), (2344, 335, 'k14'), (2345, 242, 'k27'), (2346, 149, 'k40'), (2347, 56, 'k53'), (2348, 1966, 'k66'), (2349, 1873, 'k79'), (2350, 1780, 'k92'), (2351, 1687, 'k8'), (2352, 1594, 'k21'), (2353, 1501, 'k34'), (2354, 1408, 'k47'), (2355, 1315, 'k60'), (2356, 1222, 'k73'), (2357, 1129, 'k86'), (2358, 1036, 'k2'), (2359, 943, 'k15'), (2360, 850, 'k28'), (2361, 757, 'k41'), (2362, 664, 'k54'), (2363, 571, 'k67'), (2364, 478, 'k80'), (2365, 385, 'k93'), (2366, 292, 'k9'), (2367, 199, 'k22'), (2368, 106, 'k35'), (2369, 13, 'k48'), (2370, 1923, 'k61'), (2371, 1830, 'k74'), (2372, 1737, 'k87'), (2373, 1644, 'k3'), (2374, 1551, 'k16'), (2375, 1458, 'k29'), (2376, 1365, 'k42'), (2377, 1272, 'k55'), (2378, 1179, 'k68'), (2379, 1086, 'k81'), (2380, 993, 'k94'), (2381, 900, 'k10'), (2382, 807, 'k23'), (2383, 714, 'k36'), (2384, 621, 'k49'), (2385, 528, 'k62'), (2386, 435, 'k75'), (2387, 342, 'k88'), (2388, 249, 'k4'), (2389, 156, 'k17'), (2390, 63, 'k30'), (2391, 1973, 'k43'), (2392, 1880, 'k56'), (2393, 1787, 'k69'), (2394, 1694, 'k82'), (2395, 1601, 'k95'), (2396, 1508, 'k11'), (2397, 1415, 'k24'), (2398, 1322, 'k37'), (2399, 1229, 'k50'), (2400, 1136, 'k63'), (2401, 1043, 'k76'), (2402, 950, 'k89'), (2403, 857, 'k5'), (2404, 764, 'k18'), (2405, 671, 'k31'), (2406, 578, 'k44'), (2407, 485, 'k57'), (2408, 392, 'k70'), (2409, 299, 'k83'), (2410, 206, 'k96'), (2411, 113, 'k12'), (2412, 20, 'k25'), (2413, 1930, 'k38'), (2414, 1837, 'k51'), (2415, 1744, 'k64'), (2416, 1651, 'k77'), (2417, 1558, 'k90'), (2418, 1465, 'k6'), (2419, 1372, 'k19'), (2420, 1279, 'k32'), (2421, 1186, 'k45'), (2422, 1093, 'k58'), (2423, 1000, 'k71'), (2424, 907, 'k84'), (2425, 814, 'k0'), (2426, 721, 'k13'), (2427, 628, 'k26'), (2428, 535, 'k39'), (2429, 442, 'k52'), (2430, 349, 'k65'), (2431, 256, 'k78'), (2432, 163, 'k91'), (2433, 70, 'k7'), (2434, 1980, 'k20'), (2435, 1887, 'k33'), (2436, 1794, 'k46'), (2437, 1701, 'k59'), (2438, 1608, 'k72'), (2439, 1515, 'k85'), (2440, 1422, 'k1'), (2441, 1329, 'k14'), (2442, 1236, 'k27'), (2443, 1143, 'k40'), (2444, 1050, 'k53'), (2445, 957, 'k66'), (2446, 864, 'k79'), (2447, 771, 'k92'), (2448, 678, 'k8'), (2449, 585, 'k21'), (2450, 492, 'k34'), (2451, 399, 'k47'), (2452, 306, 'k60'), (2453, 213, 'k73'), (2454, 120, 'k86'), (2455, 27, 'k2'), (2456, 1937, 'k15'), (2457, 1844, 'k28'), (2458, 1751, 'k41'), (2459, 1658, 'k54'), (2460, 1565, 'k67'), (2461, 1472, 'k80'), (2462, 1379, 'k93'), (2463, 1286, 'k9'), (2464, 1193, 'k22'), (2465, 1100, 'k35'), (2466, 1007, 'k48'), (2467, 914, 'k61'), (2468, 821, 'k74'), (2469, 728, 'k87'), (2470, 635, 'k3'), (2471, 542, 'k16'), (2472, 449, 'k29'), (2473, 356, 'k42'), (2474, 263, 'k55'), (2475, 170, 'k68'), (2476, 77, 'k81'), (2477, 1987, 'k94'), (2478, 1894, 'k10'), (2479, 1801, 'k23'), (2480, 1708, 'k36'), (2481, 1615, 'k49'), (2482, 1522, 'k62'), (2483, 1429, 'k75'), (2484, 1336, 'k88'), (2485, 1243, 'k4'), (2486, 1150, 'k17'), (2487, 1057, 'k30'), (2488, 964, 'k43'), (2489, 871, 'k56'), (2490, 778, 'k69'), (2491, 685, 'k82'), (2492, 592, 'k95'), (2493, 499, 'k11'), (2494, 406, 'k24'), (2495, 313, 'k37'), (2496, 220, 'k50'), (2497, 127, 'k63'), (2498, 34, 'k76'), (2499, 1944, 'k89'), (2500, 1851, 'k5'), (2501, 1758, 'k18'), (2502, 1665, 'k31'), (2503, 1572, 'k44'), (2504, 1479, 'k57'), (2505, 1386, 'k70'), (2506, 1293, 'k83'), (2507, 1200, 'k96'), (2508, 1107, 'k12'), (2509, 1014, 'k25'), (2510, 921, 'k38'), (2511, 828, 'k51'), (2512, 735, 'k64'), (2513, 642, 'k77'), (2514, 549, 'k90'), (2515, 456, 'k6'), (2516, 363, 'k19'), (2517, 270, 'k32'), (2518, 177, 'k45'), (2519, 84, 'k58'), (2520, 1994, 'k71'), (2521, 1901, 'k84'), (2522, 1808, 'k0'), (2523, 1715, 'k13'), (2524, 1622, 'k26'), (2525, 1529, 'k39'), (2526, 1436, 'k52'), (2527, 1343, 'k65'), (2528, 1250, 'k78'), (2529, 1157, 'k91'), (2530, 1064, 'k7'), (2531, 971, 'k20'), (2532, 878, 'k33'), (2533, 785, 'k46'), (2534, 692, 'k59'), (2535, 599, 'k72'), (2536, 506, 'k85'), (2537, 413, 'k1'), (2538, 320, 'k14'), (2539, 227, 'k27'), (2540, 134, 'k40'), (2541, 41, 'k53'), (2542, 1951, 'k66'), (2543, 1858, 'k79'), (2544, 1765, 'k92'), (2545, 1672, 'k8'), (2546, 1579, 'k21'), (2547, 1486, 'k34'), (2548, 1393, 'k47'), (2549, 1300, 'k60'), (2550, 1207, 'k73'), (2551, 1114, 'k86'), (2552, 1021, 'k2'), (2553, 928, 'k15'), (2554, 835, 'k28'), (2555, 742, 'k41'), (2556, 649, 'k54'), (2557, 556, 'k67'), (2558, 463, 'k80'), (2559, 370, 'k93'), (2560, 277, 'k9'), (2561, 184, 'k22'), (2562, 91, 'k35'), (2563, 2001, 'k48'), (2564, 1908, 'k61'), (2565, 1815, 'k74'), (2566, 1722, 'k87'), (2567, 1629, 'k3'), (2568, 1536, 'k16'), (2569, 1443, 'k29'), (2570, 1350, 'k42'), (2571, 1257, 'k55'), (2572, 1164, 'k68'), (2573, 1071, 'k81'), (2574, 978, 'k94'), (2575, 885, 'k10'), (2576, 792, 'k23'), (2577, 699, 'k36'), (2578, 606, 'k49'), (2579, 513, 'k62'), (2580, 420, 'k75'), (2581, 327, 'k88'), (2582, 234, 'k4'), (2583, 141, 'k17'), (2584, 48, 'k30'), (2585, 1958, 'k43'), (2586, 1865, 'k56'), (2587, 1772, 'k69'), (2588, 1679, 'k82'), (2589, 1586, 'k95'), (2590, 1493, 'k11'), (2591, 1400, 'k24'), (2592, 1307, 'k37'), (2593, 1214, 'k50'), (2594, 1121, 'k63'), (2595, 1028, 'k76'), (2596, 935, 'k89'), (2597, 842, 'k5'), (2598, 749, 'k18'), (2599, 656, 'k31'), (2600, 563, 'k44'), (2601, 470, 'k57'), (2602, 377, 'k70'), (2603, 284, 'k83'), (2604, 191, 'k96'), (2605, 98, 'k12'), (2606, 5, 'k25'), (2607, 1915, 'k38'), (2608, 1822, 'k51'), (2609, 1729, 'k64'), (2610, 1636, 'k77'), (2611, 1543, 'k90'), (2612, 1450, 'k6'), (2613, 1357, 'k19'), (2614, 1264, 'k32'), (2615, 1171, 'k45'), (2616, 1078, 'k58'), (2617, 985, 'k71'), (2618, 892, 'k84'), (2619, 799, 'k0'), (2620, 706, 'k13'), (2621, 613, 'k26'), (2622, 520, 'k39'), (2623, 427, 'k52'), (2624, 334, 'k65'), (2625, 241, 'k78'), (2626, 148, 'k91'), (2627, 55, 'k7'), (2628, 1965, 'k20'), (2629, 1872, 'k33'), (2630, 1779, 'k46'), (2631, 1686, 'k59'), (2632, 1593, 'k72'), (2633, 1500, 'k85'), (2634, 1407, 'k1'), (2635, 1314, 'k14'), (2636, 1221, 'k27'), (2637, 1128, 'k40'), (2638, 1035, 'k53'), (2639, 942, 'k66'), (2640, 849, 'k79'), (2641, 756, 'k92'), (2642, 663, 'k8'), (2643, 570, 'k21'), (2644, 477, 'k34'), (2645, 384, 'k47'), (2646, 291, 'k60'), (2647, 198, 'k73'), (2648, 105, 'k86'), (2649, 12, 'k2'), (2650, 1922, 'k15'), (2651, 1829, 'k28'), (2652, 1736, 'k41'), (2653, 1643, 'k54'), (2654, 1550, 'k67'), (2655, 1457, 'k80'), (2656, 1364, 'k93'), (2657, 1271, 'k9'), (2658, 1178, 'k22'), (2659, 1085, 'k35'), (2660, 992, 'k48'), (2661, 899, 'k61'), (2662, 806, 'k74'), (2663, 713, 'k87'), (2664, 620, 'k3'), (2665, 527, 'k16'), (2666, 434, 'k29'), (2667, 341, 'k42'), (2668, 248, 'k55'), (2669, 155, 'k68'), (2670, 62, 'k81'), (2671, 1972, 'k94'), (2672, 1879, 'k10'), (2673, 1786, 'k23'), (2674, 1693, 'k36'), (2675, 1600, 'k49'), (2676, 1507, 'k62'), (2677, 1414, 'k75'), (2678, 1321, 'k88'), (2679, 1228, 'k4'), (2680, 1135, 'k17'), (2681, 1042, 'k30'), (2682, 949, 'k43'), (2683, 856, 'k56'), (2684, 763, 'k69'), (2685, 670, 'k82'), (2686, 577, 'k95'), (2687, 484, 'k11'), (2688, 391, 'k24'), (2689, 298, 'k37'), (2690, 205, 'k50'), (2691, 112, 'k63'), (2692, 19, 'k76'), (2693, 1929, 'k89'), (2694, 1836, 'k5'), (2695, 1743, 'k18'), (2696, 1650, 'k31'), (2697, 1557, 'k44'), (2698, 1464, 'k57'), (2699, 1371, 'k70'), (2700, 1278, 'k83'), (2701, 1185, 'k96'), (2702, 1092, 'k12'), (2703, 999, 'k25'), (2704, 906, 'k38'), (2705, 813, 'k51'), (2706, 720, 'k64'), (2707, 627, 'k77'), (2708, 534, 'k90'), (2709, 441, 'k6'), (2710, 348, 'k19'), (2711, 255, 'k32'), (2712, 162, 'k45'), (2713, 69, 'k58'), (2714, 1979, 'k71'), (2715, 1886, 'k84'), (2716, 1793, 'k0'), (2717, 1700, 'k13'), (2718, 1607, 'k26'), (2719, 1514, 'k39'), (2720, 1421, 'k52'), (2721, 1328, 'k65'), (2722, 1235, 'k78'), (2723, 1142, 'k91'), (2724, 1049, 'k7'), (2725, 956, 'k20'), (2726, 863, 'k33'), (2727, 770, 'k46'), (2728, 677, 'k59'), (2729, 584, 'k72'), (2730, 491, 'k85'), (2731, 398, 'k1'), (2732, 305, 'k14'), (2733, 212, 'k27'), (2734, 119, 'k40'), (2735, 26, 'k53'), (2736, 1936, 'k66'), (2737, 1843, 'k79'), (2738, 1750, 'k92'), (2739, 1657, 'k8'), (2740, 1564, 'k21'), (2741, 1471, 'k34'), (2742, 1378, 'k47'), (2743, 1285, 'k60'), (2744, 1192, 'k73'), (2745, 1099, 'k86'), (2746, 1006, 'k2'), (2747, 913, 'k15'), (2748, 820, 'k28'), (2749, 727, 'k41'), (2750, 634, 'k54'), (2751, 541, 'k67'), (2752, 448, 'k80'), (2753, 355, 'k93'), (2754, 262, 'k9'), (2755, 169, 'k22'), (2756, 76, 'k35'), (2757, 1986, 'k48'), (2758, 1893, 'k61'), (2759, 1800, 'k74'), (2760, 1707, 'k87'), (2761, 1614, 'k3'), (2762, 1521, 'k16'), (2763, 1428, 'k29'), (2764, 1335, 'k42'), (2765, 1242, 'k55'), (2766, 1149, 'k68'), (2767, 1056, 'k81'), (2768, 963, 'k94'), (2769, 870, 'k10'), (2770, 777, 'k23'), (2771, 684, 'k36'), (2772, 591, 'k49'), (2773, 498, 'k62'), (2774, 405, 'k75'), (2775, 312, 'k88'), (2776, 219, 'k4'), (2777, 126, 'k17'), (2778, 33, 'k30'), (2779, 1943, 'k43'), (2780, 1850, 'k56'), (2781, 1757, 'k69'), (2782, 1664, 'k82'), (2783, 1571, 'k95'), (2784, 1478, 'k11'), (2785, 1385, 'k24'), (2786, 1292, 'k37'), (2787, 1199, 'k50'), (2788, 1106, 'k63'), (2789, 1013, 'k76'), (2790, 920, 'k89'), (2791, 827, 'k5'), (2792, 734, 'k18'), (2793, 641, 'k31'), (2794, 548, 'k44'), (2795, 455, 'k57'), (2796, 362, 'k70'), (2797, 269, 'k83'), (2798, 176, 'k96'), (2799, 83, 'k12'), (2800, 1993, 'k25'), (2801, 1900, 'k38'), (2802, 1807, 'k51'), (2803, 1714, 'k64'), (2804, 1621, 'k77'), (2805, 1528, 'k90'), (2806, 1435, 'k6'), (2807, 1342, 'k19'), (2808, 1249, 'k32'), (2809, 1156, 'k45'), (2810, 1063, 'k58'), (2811, 970, 'k71'), (2812, 877, 'k84'), (2813, 784, 'k0'), (2814, 691, 'k13'), (2815, 598, 'k26'), (2816, 505, 'k39'), (2817, 412, 'k52'), (2818, 319, 'k65'), (2819, 226, 'k78'), (2820, 133, 'k91'), (2821, 40, 'k7'), (2822, 1950, 'k20'), (2823, 1857, 'k33'), (2824, 1764, 'k46'), (2825, 1671, 'k59'), (2826, 1578, 'k72'), (2827, 1485, 'k85'), (2828, 1392, 'k1'), (2829, 1299, 'k14'), (2830, 1206, 'k27'), (2831, 1113, 'k40'), (2832, 1020, 'k53'), (2833, 927, 'k66'), (2834, 834, 'k79'), (2835, 741, 'k92'), (2836, 648, 'k8'), (2837, 555, 'k21'), (2838, 462, 'k34'), (2839, 369, 'k47'), (2840, 276, 'k60'), (2841, 183, 'k73'), (2842, 90, 'k86'), (2843, 2000, 'k2'), (2844, 1907, 'k15'), (2845, 1814, 'k28'), (2846, 1721, 'k41'), (2847, 1628, 'k54'), (2848, 1535, 'k67'), (2849, 1442, 'k80'), (2850, 1349, 'k93'), (2851, 1256, 'k9'), (2852, 1163, 'k22'), (2853, 1070, 'k35'), (2854, 977, 'k48'), (2855, 884, 'k61'), (2856, 791, 'k74'), (2857, 698, 'k87'), (2858, 605, 'k3'), (2859, 512, 'k16'), (2860, 419, 'k29'), (2861, 326, 'k42'), (2862, 233, 'k55'), (2863, 140, 'k68'), (2864, 47, 'k81'), (2865, 1957, 'k94'), (2866, 1864, 'k10'), (2867, 1771, 'k23'), (2868, 1678, 'k36'), (2869, 1585, 'k49'), (2870, 1492, 'k62'), (2871, 1399, 'k75'), (2872, 1306, 'k88'), (2873, 1213, 'k4'), (2874, 1120, 'k17'), (2875, 1027, 'k30'), (2876, 934, 'k43'), (2877, 841, 'k56'), (2878, 748, 'k69'), (2879, 655, 'k82'), (2880, 562, 'k95'), (2881, 469, 'k11'), (2882, 376, 'k24'), (2883, 283, 'k37'), (2884, 190, 'k50'), (2885, 97, 'k63'), (2886, 4, 'k76'), (2887, 1914, 'k89'), (2888, 1821, 'k5'), (2889, 1728, 'k18'), (2890, 1635, 'k31'), (2891, 1542, 'k44'), (2892, 1449, 'k57'), (2893, 1356, 'k70'), (2894, 1263, 'k83'), (2895, 1170, 'k96'), (2896, 1077, 'k12'), (2897, 984, 'k25'), (2898, 891, 'k38'), (2899, 798, 'k51'), (2900, 705, 'k64'), (2901, 612, 'k77'), (2902, 519, 'k90'), (2903, 426, 'k6'), (2904, 333, 'k19'), (2905, 240, 'k32'), (2906, 147, 'k45'), (2907, 54, 'k58'), (2908, 1964, 'k71'), (2909, 1871, 'k84'), (2910, 1778, 'k0'), (2911, 1685, 'k13'), (2912, 1592, 'k26'), (2913, 1499, 'k39'), (2914, 1406, 'k52'), (2915, 1313, 'k65'), (2916, 1220, 'k78'), (2917, 1127, 'k91'), (2918, 1034, 'k7'), (2919, 941, 'k20'), (2920, 848, 'k33'), (2921, 755, 'k46'), (2922, 662, 'k59'), (2923, 569, 'k72'), (2924, 476, 'k85'), (2925, 383, 'k1'), (2926, 290, 'k14'), (2927, 197, 'k27'), (2928, 104, 'k40'), (2929, 11, 'k53'), (2930, 1921, 'k66'), (2931, 1828, 'k79'), (2932, 1735, 'k92'), (2933, 1642, 'k8'), (2934, 1549, 'k21'), (2935, 1456, 'k34'), (2936, 1363, 'k47'), (2937, 1270, 'k60'), (2938, 1177, 'k73'), (2939, 1084, 'k86'), (2940, 991, 'k2'), (2941, 898, 'k15'), (2942, 805, 'k28'), (2943, 712, 'k41'), (2944, 619, 'k54'), (2945, 526, 'k67'), (2946, 433, 'k80'), (2947, 340, 'k93'), (2948, 247, 'k9'), (2949, 154, 'k22'), (2950, 61, 'k35'), (2951, 1971, 'k48'), (2952, 1878, 'k61'), (2953, 1785, 'k74'), (2954, 1692, 'k87'), (2955, 1599, 'k3'), (2956, 1506, 'k16'), (2957, 1413, 'k29'), (2958, 1320, 'k42'), (2959, 1227, 'k55'), (2960, 1134, 'k68'), (2961, 1041, 'k81'), (2962, 948, 'k94'), (2963, 855, 'k10'), (2964, 762, 'k23'), (2965, 669, 'k36'), (2966, 576, 'k49'), (2967, 483, 'k62'), (2968, 390, 'k75'), (2969, 297, 'k88'), (2970, 204, 'k4'), (2971, 111, 'k17'), (2972, 18, 'k30'), (2973, 1928, 'k43'), (2974, 1835, 'k56'), (2975, 1742, 'k69'), (2976, 1649, 'k82'), (2977, 1556, 'k95'), (2978, 1463, 'k11'), (2979, 1370, 'k24'), (2980, 1277, 'k37'), (2981, 1184, 'k50'), (2982, 1091, 'k63'), (2983, 998, 'k76'), (2984, 905, 'k89'), (2985, 812, 'k5'), (2986, 719, 'k18'), (2987, 626, 'k31'), (2988, 533, 'k44'), (2989, 440, 'k57'), (2990, 347, 'k70'), (2991, 254, 'k83'), (2992, 161, 'k96'), (2993, 68, 'k12'), (2994, 1978, 'k25'), (2995, 1885, 'k38'), (2996, 1792, 'k51'), (2997, 1699, 'k64'), (2998, 1606, 'k77'), (2999, 1513, 'k90'), (3000, 1420, 'k6'), (3001, 1327, 'k19'), (3002, 1234, 'k32'), (3003, 1141, 'k45'), (3004, 1048, 'k58'), (3005, 955, 'k71'), (3006, 862, 'k84'), (3007, 769, 'k0'), (3008, 676, 'k13'), (3009, 583, 'k26'), (3010, 490, 'k39'), (3011, 397, 'k52'), (3012, 304, 'k65'), (3013, 211, 'k78'), (3014, 118, 'k91'), (3015, 25, 'k7'), (3016, 1935, 'k20'), (3017, 1842, 'k33'), (3018, 1749, 'k46'), (3019, 1656, 'k59'), (3020, 1563, 'k72'), (3021, 1470, 'k85'), (3022, 1377, 'k1'), (3023, 1284, 'k14'), (3024, 1191, 'k27'), (3025, 1098, 'k40'), (3026, 1005, 'k53'), (3027, 912, 'k66'), (3028, 819, 'k79'), (3029, 726, 'k92'), (3030, 633, 'k8'), (3031, 540, 'k21'), (3032, 447, 'k34'), (3033, 354, 'k47'), (3034, 261, 'k60'), (3035, 168, 'k73'), (3036, 75, 'k86'), (3037, 1985, 'k2'), (3038, 1892, 'k15'), (3039, 1799, 'k28'), (3040, 1706, 'k41'), (3041, 1613, 'k54'), (3042, 1520, 'k67'), (3043, 1427, 'k80'), (3044, 1334, 'k93'), (3045, 1241, 'k9'), (3046, 1148, 'k22'), (3047, 1055, 'k35'), (3048, 962, 'k48'), (3049, 869, 'k61'), (3050, 776, 'k74'), (3051, 683, 'k87'), (3052, 590, 'k3'), (3053, 497, 'k16'), (3054, 404, 'k29'), (3055, 311, 'k42'), (3056, 218, 'k55'), (3057, 125, 'k68'), (3058, 32, 'k81'), (3059, 1942, 'k94'), (3060, 1849, 'k10'), (3061, 1756, 'k23'), (3062, 1663, 'k36'), (3063, 1570, 'k49'), (3064, 1477, 'k62'), (3065, 1384, 'k75'), (3066, 1291, 'k88'), (3067, 1198, 'k4'), (3068, 1105, 'k17'), (3069, 1012, 'k30'), (3070, 919, 'k43'), (3071, 826, 'k56'), (3072, 733, 'k69'), (3073, 640, 'k82'), (3074, 547, 'k95'), (3075, 454, 'k11'), (3076, 361, 'k24'), (3077, 268, 'k37'), (3078, 175, 'k50'), (3079, 82, 'k63'), (3080, 1992, 'k76'), (3081, 1899, 'k89'), (3082, 1806, 'k5'), (3083, 1713, 'k18'), (3084, 1620, 'k31'), (3085, 1527, 'k44'), (3086, 1434, 'k57'), (3087, 1341, 'k70'), (3088, 1248, 'k83'), (3089, 1155, 'k96'), (3090, 1062, 'k12'), (3091, 969, 'k25'), (3092, 876, 'k38'), (3093, 783, 'k51'), (3094, 690, 'k64'), (3095, 597, 'k77'), (3096, 504, 'k90'), (3097, 411, 'k6'), (3098, 318, 'k19'), (3099, 225, 'k32'), (3100, 132, 'k45'), (3101, 39, 'k58'), (3102, 1949, 'k71'), (3103, 1856, 'k84'), (3104, 1763, 'k0'), (3105, 1670, 'k13'), (3106, 1577, 'k26'), (3107, 1484, 'k39'), (3108, 1391, 'k52'), (3109, 1298, 'k65'), (3110, 1205, 'k78'), (3111, 1112, 'k91'), (3112, 1019, 'k7'), (3113, 926, 'k20'), (3114, 833, 'k33'), (3115, 740, 'k46'), (3116, 647, 'k59'), (3117, 554, 'k72'), (3118, 461, 'k85'), (3119, 368, 'k1'), (3120, 275, 'k14'), (3121, 182, 'k27'), (3122, 89, 'k40'), (3123, 1999, 'k53'), (3124, 1906, 'k66'), (3125, 1813, 'k79'), (3126, 1720, 'k92'), (3127, 1627, 'k8'), (3128, 1534, 'k21'), (3129, 1441, 'k34'), (3130, 1348, 'k47'), (3131, 1255, 'k60'), (3132, 1162, 'k73'), (3133, 1069, 'k86'), (3134, 976, 'k2'), (3135, 883, 'k15'), (3136, 790, 'k28'), (3137, 697, 'k41'), (3138, 604, 'k54'), (3139, 511, 'k67'), (3140, 418, 'k80'), (3141, 325, 'k93'), (3142, 232, 'k9'), (3143, 139, 'k22'), (3144, 46, 'k35'), (3145, 1956, 'k48'), (3146, 1863, 'k61'), (3147, 1770, 'k74'), (3148, 1677, 'k87'), (3149, 1584, 'k3'), (3150, 1491, 'k16'), (3151, 1398, 'k29'), (3152, 1305, 'k42'), (3153, 1212, 'k55'), (3154, 1119, 'k68'), (3155, 1026, 'k81'), (3156, 933, 'k94'), (3157, 840, 'k10'), (3158, 747, 'k23'), (3159, 654, 'k36'), (3160, 561, 'k49'), (3161, 468, 'k62'), (3162, 375, 'k75'), (3163, 282, 'k88'), (3164, 189, 'k4'), (3165, 96, 'k17'), (3166, 3, 'k30'), (3167, 1913, 'k43'), (3168, 1820, 'k56'), (3169, 1727, 'k69'), (3170, 1634, 'k82'), (3171, 1541, 'k95'), (3172, 1448, 'k11'), (3173, 1355, 'k24'), (3174, 1262, 'k37'), (3175, 1169, 'k50'), (3176, 1076, 'k63'), (3177, 983, 'k76'), (3178, 890, 'k89'), (3179, 797, 'k5'), (3180, 704, 'k18'), (3181, 611, 'k31'), (3182, 518, 'k44'), (3183, 425, 'k57'), (3184, 332, 'k70'), (3185, 239, 'k83'), (3186, 146, 'k96'), (3187, 53, 'k12'), (3188, 1963, 'k25'), (3189, 1870, 'k38'), (3190, 1777, 'k51'), (3191, 1684, 'k64'), (3192, 1591, 'k77'), (3193, 1498, 'k90'), (3194, 1405, 'k6'), (3195, 1312, 'k19'), (3196, 1219, 'k32'), (3197, 1126, 'k45'), (3198, 1033, 'k58'), (3199, 940, 'k71'), (3200, 847, 'k84'), (3201, 754, 'k0'), (3202, 661, 'k13'), (3203, 568, 'k26'), (3204, 475, 'k39'), (3205, 382, 'k52'), (3206, 289, 'k65'), (3207, 196, 'k78'), (3208, 103, 'k91'), (3209, 10, 'k7'), (3210, 1920, 'k20'), (3211, 1827, 'k33'), (3212, 1734, 'k46'), (3213, 1641, 'k59'), (3214, 1548, 'k72'), (3215, 1455, 'k85'), (3216, 1362, 'k1'), (3217, 1269, 'k14'), (3218, 1176, 'k27'), (3219, 1083, 'k40'), (3220, 990, 'k53'), (3221, 897, 'k66'), (3222, 804, 'k79'), (3223, 711, 'k92'), (3224, 618, 'k8'), (3225, 525, 'k21'), (3226, 432, 'k34'), (3227, 339, 'k47'), (3228, 246, 'k60'), (3229, 153, 'k73'), (3230, 60, 'k86'), (3231, 1970, 'k2'), (3232, 1877, 'k15'), (3233, 1784, 'k28'), (3234, 1691, 'k41'), (3235, 1598, 'k54'), (3236, 1505, 'k67'), (3237, 1412, 'k80'), (3238, 1319, 'k93'), (3239, 1226, 'k9'), (3240, 1133, 'k22'), (3241, 1040, 'k35'), (3242, 947, 'k48'), (3243, 854, 'k61'), (3244, 761, 'k74'), (3245, 668, 'k87'), (3246, 575, 'k3'), (3247, 482, 'k16'), (3248, 389, 'k29'), (3249, 296, 'k42'), (3250, 203, 'k55'), (3251, 110, 'k68'), (3252, 17, 'k81'), (3253, 1927, 'k94'), (3254, 1834, 'k10'), (3255, 1741, 'k23'), (3256, 1648, 'k36'), (3257, 1555, 'k49'), (3258, 1462, 'k62'), (3259, 1369, 'k75'), (3260, 1276, 'k88'), (3261, 1183, 'k4'), (3262, 1090, 'k17'), (3263, 997, 'k30'), (3264, 904, 'k43'), (3265, 811, 'k56'), (3266, 718, 'k69'), (3267, 625, 'k82'), (3268, 532, 'k95'), (3269, 439, 'k11'), (3270, 346, 'k24'), (3271, 253, 'k37'), (3272, 160, 'k50'), (3273, 67, 'k63'), (3274, 1977, 'k76'), (3275, 1884, 'k89'), (3276, 1791, 'k5'), (3277, 1698, 'k18'), (3278, 1605, 'k31'), (3279, 1512, 'k44'), (3280, 1419, 'k57'), (3281, 1326, 'k70'), (3282, 1233, 'k83'), (3283, 1140, 'k96'), (3284, 1047, 'k12'), (3285, 954, 'k25'), (3286, 861, 'k38'), (3287, 768, 'k51'), (3288, 675, 'k64'), (3289, 582, 'k77'), (3290, 489, 'k90'), (3291, 396, 'k6'), (3292, 303, 'k19'), (3293, 210, 'k32'), (3294, 117, 'k45'), (3295, 24, 'k58'), (3296, 1934, 'k71'), (3297, 1841, 'k84'), (3298, 1748, 'k0'), (3299, 1655, 'k13'), (3300, 1562, 'k26'), (3301, 1469, 'k39'), (3302, 1376, 'k52'), (3303, 1283, 'k65'), (3304, 1190, 'k78'), (3305, 1097, 'k91'), (3306, 1004, 'k7'), (3307, 911, 'k20'), (3308, 818, 'k33'), (3309, 725, 'k46'), (3310, 632, 'k59'), (3311, 539, 'k72'), (3312, 446, 'k85'), (3313, 353, 'k1'), (3314, 260, 'k14'), (3315, 167, 'k27'), (3316, 74, 'k40'), (3317, 1984, 'k53'), (3318, 1891, 'k66'), (3319, 1798, 'k79'), (3320, 1705, 'k92'), (3321, 1612, 'k8'), (3322, 1519, 'k21'), (3323, 1426, 'k34'), (3324, 1333, 'k47'), (3325, 1240, 'k60'), (3326, 1147, 'k73'), (3327, 1054, 'k86'), (3328, 961, 'k2'), (3329, 868, 'k15'), (3330, 775, 'k28'), (3331, 682, 'k41'), (3332, 589, 'k54'), (3333, 496, 'k67'), (3334, 403, 'k80'), (3335, 310, 'k93'), (3336, 217, 'k9'), (3337, 124, 'k22'), (3338, 31, 'k35'), (3339, 1941, 'k48'), (3340, 1848, 'k61'), (3341, 1755, 'k74'), (3342, 1662, 'k87'), (3343, 1569, 'k3'), (3344, 1476, 'k16'), (3345, 1383, 'k29'), (3346, 1290, 'k42'), (3347, 1197, 'k55'), (3348, 1104, 'k68'), (3349, 1011, 'k81'), (3350, 918, 'k94'), (3351, 825, 'k10'), (3352, 732, 'k23'), (3353, 639, 'k36'), (3354, 546, 'k49'), (3355, 453, 'k62'), (3356, 360, 'k75'), (3357, 267, 'k88'), (3358, 174, 'k4'), (3359, 81, 'k17'), (3360, 1991, 'k30'), (3361, 1898, 'k43'), (3362, 1805, 'k56'), (3363, 1712, 'k69'), (3364, 1619, 'k82'), (3365, 1526, 'k95'), (3366, 1433, 'k11'), (3367, 1340, 'k24'), (3368, 1247, 'k37'), (3369, 1154, 'k50'), (3370, 1061, 'k63'), (3371, 968, 'k76'), (3372, 875, 'k89'), (3373, 782, 'k5'), (3374, 689, 'k18'), (3375, 596, 'k31'), (3376, 503, 'k44'), (3377, 410, 'k57'), (3378, 317, 'k70'), (3379, 224, 'k83'), (3380, 131, 'k96'), (3381, 38, 'k12'), (3382, 1948, 'k25'), (3383, 1855, 'k38'), (3384, 1762, 'k51'), (3385, 1669, 'k64'), (3386, 1576, 'k77'), (3387, 1483, 'k90'), (3388, 1390, 'k6'), (3389, 1297, 'k19'), (3390, 1204, 'k32'), (3391, 1111, 'k45'), (3392, 1018, 'k58'), (3393, 925, 'k71'), (3394, 832, 'k84'), (3395, 739, 'k0'), (3396, 646, 'k13'), (3397, 553, 'k26'), (3398, 460, 'k39'), (3399, 367, 'k52'), (3400, 274, 'k65'), (3401, 181, 'k78'), (3402, 88, 'k91'), (3403, 1998, 'k7'), (3404, 1905, 'k20'), (3405, 1812, 'k33'), (3406, 1719, 'k46'), (3407, 1626, 'k59'), (3408, 1533, 'k72'), (3409, 1440, 'k85'), (3410, 1347, 'k1'), (3411, 1254, 'k14'), (3412, 1161, 'k27'), (3413, 1068, 'k40'), (3414, 975, 'k53'), (3415, 882, 'k66'), (3416, 789, 'k79'), (3417, 696, 'k92'), (3418, 603, 'k8'), (3419, 510, 'k21'), (3420, 417, 'k34'), (3421, 324, 'k47'), (3422, 231, 'k60'), (3423, 138, 'k73'), (3424, 45, 'k86'), (3425, 1955, 'k2'), (3426, 1862, 'k15'), (3427, 1769, 'k28'), (3428, 1676, 'k41'), (3429, 1583, 'k54'), (3430, 1490, 'k67'), (3431, 1397, 'k80'), (3432, 1304, 'k93'), (3433, 1211, 'k9'), (3434, 1118, 'k22'), (3435, 1025, 'k35'), (3436, 932, 'k48'), (3437, 839, 'k61'), (3438, 746, 'k74'), (3439, 653, 'k87'), (3440, 560, 'k3'), (3441, 467, 'k16'), (3442, 374, 'k29'), (3443, 281, 'k42'), (3444, 188, 'k55'), (3445, 95, 'k68'), (3446, 2, 'k81'), (3447, 1912, 'k94'), (3448, 1819, 'k10'), (3449, 1726, 'k23'), (3450, 1633, 'k36'), (3451, 1540, 'k49'), (3452, 1447, 'k62'), (3453, 1354, 'k75'), (3454, 1261, 'k88'), (3455, 1168, 'k4'), (3456, 1075, 'k17'), (3457, 982, 'k30'), (3458, 889, 'k43'), (3459, 796, 'k56'), (3460, 703, 'k69'), (3461, 610, 'k82'), (3462, 517, 'k95'), (3463, 424, 'k11'), (3464, 331, 'k24'), (3465, 238, 'k37'), (3466, 145, 'k50'), (3467, 52, 'k63'), (3468, 1962, 'k76'), (3469, 1869, 'k89'), (3470, 1776, 'k5'), (3471, 1683, 'k18'), (3472, 1590, 'k31'), (3473, 1497, 'k44'), (3474, 1404, 'k57'), (3475, 1311, 'k70'), (3476, 1218, 'k83'), (3477, 1125, 'k96'), (3478, 1032, 'k12'), (3479, 939, 'k25'), (3480, 846, 'k38'), (3481, 753, 'k51'), (3482, 660, 'k64'), (3483, 567, 'k77'), (3484, 474, 'k90'), (3485, 381, 'k6'), (3486, 288, 'k19'), (3487, 195, 'k32'), (3488, 102, 'k45'), (3489, 9, 'k58'), (3490, 1919, 'k71'), (3491, 1826, 'k84'), (3492, 1733, 'k0'), (3493, 1640, 'k13'), (3494, 1547, 'k26'), (3495, 1454, 'k39'), (3496, 1361, 'k52'), (3497, 1268, 'k65'), (3498, 1175, 'k78'), (3499, 1082, 'k91'), (3500, 989, 'k7'), (3501, 896, 'k20'), (3502, 803, 'k33'), (3503, 710, 'k46'), (3504, 617, 'k59'), (3505, 524, 'k72'), (3506, 431, 'k85'), (3507, 338, 'k1'), (3508, 245, 'k14'), (3509, 152, 'k27'), (3510, 59, 'k40'), (3511, 1969, 'k53'), (3512, 1876, 'k66'), (3513, 1783, 'k79'), (3514, 1690, 'k92'), (3515, 1597, 'k8'), (3516, 1504, 'k21'), (3517, 1411, 'k34'), (3518, 1318, 'k47'), (3519, 1225, 'k60'), (3520, 1132, 'k73'), (3521, 1039, 'k86'), (3522, 946, 'k2'), (3523, 853, 'k15'), (3524, 760, 'k28'), (3525, 667, 'k41'), (3526, 574, 'k54'), (3527, 481, 'k67'), (3528, 388, 'k80'), (3529, 295, 'k93'), (3530, 202, 'k9'), (3531, 109, 'k22'), (3532, 16, 'k35'), (3533, 1926, 'k48'), (3534, 1833, 'k61'), (3535, 1740, 'k74'), (3536, 1647, 'k87'), (3537, 1554, 'k3'), (3538, 1461, 'k16'), (3539, 1368, 'k29'), (3540, 1275, 'k42'), (3541, 1182, 'k55'), (3542, 1089, 'k68'), (3543, 996, 'k81'), (3544, 903, 'k94'), (3545, 810, 'k10'), (3546, 717, 'k23'), (3547, 624, 'k36'), (3548, 531, 'k49'), (3549, 438, 'k62'), (3550, 345, 'k75'), (3551, 252, 'k88'), (3552, 159, 'k4'), (3553, 66, 'k17'), (3554, 1976, 'k30'), (3555, 1883, 'k43'), (3556, 1790, 'k56'), (3557, 1697, 'k69'), (3558, 1604, 'k82'), (3559, 1511, 'k95'), (3560, 1418, 'k11'), (3561, 1325, 'k24'), (3562, 1232, 'k37'), (3563, 1139, 'k50'), (3564, 1046, 'k63'), (3565, 953, 'k76'), (3566, 860, 'k89'), (3567, 767, 'k5'), (3568, 674, 'k18'), (3569, 581, 'k31'), (3570, 488, 'k44'), (3571, 395, 'k57'), (3572, 302, 'k70'), (3573, 209, 'k83'), (3574, 116, 'k96'), (3575, 23, 'k12'), (3576, 1933, 'k25'), (3577, 1840, 'k38'), (3578, 1747, 'k51'), (3579, 1654, 'k64'), (3580, 1561, 'k77'), (3581, 1468, 'k90'), (3582, 1375, 'k6'), (3583, 1282, 'k19'), (3584, 1189, 'k32'), (3585, 1096, 'k45'), (3586, 1003, 'k58'), (3587, 910, 'k71'), (3588, 817, 'k84'), (3589, 724, 'k0'), (3590, 631, 'k13'), (3591, 538, 'k26'), (3592, 445, 'k39'), (3593, 352, 'k52'), (3594, 259, 'k65'), (3595, 166, 'k78'), (3596, 73, 'k91'), (3597, 1983, 'k7'), (3598, 1890, 'k20'), (3599, 1797, 'k33'), (3600, 1704, 'k46'), (3601, 1611, 'k59'), (3602, 1518, 'k72'), (3603, 1425, 'k85'), (3604, 1332, 'k1'), (3605, 1239, 'k14'), (3606, 1146, 'k27'), (3607, 1053, 'k40'), (3608, 960, 'k53'), (3609, 867, 'k66'), (3610, 774, 'k79'), (3611, 681, 'k92'), (3612, 588, 'k8'), (3613, 495, 'k21'), (3614, 402, 'k34'), (3615, 309, 'k47'), (3616, 216, 'k60'), (3617, 123, 'k73'), (3618, 30, 'k86'), (3619, 1940, 'k2'), (3620, 1847, 'k15'), (3621, 1754, 'k28'), (3622, 1661, 'k41'), (3623, 1568, 'k54'), (3624, 1475, 'k67'), (3625, 1382, 'k80'), (3626, 1289, 'k93'), (3627, 1196, 'k9'), (3628, 1103, 'k22'), (3629, 1010, 'k35'), (3630, 917, 'k48'), (3631, 824, 'k61'), (3632, 731, 'k74'), (3633, 638, 'k87'), (3634, 545, 'k3'), (3635, 452, 'k16'), (3636, 359, 'k29'), (3637, 266, 'k42'), (3638, 173, 'k55'), (3639, 80, 'k68'), (3640, 1990, 'k81'), (3641, 1897, 'k94'), (3642, 1804, 'k10'), (3643, 1711, 'k23'), (3644, 1618, 'k36'), (3645, 1525, 'k49'), (3646, 1432, 'k62'), (3647, 1339, 'k75'), (3648, 1246, 'k88'), (3649, 1153, 'k4'), (3650, 1060, 'k17'), (3651, 967, 'k30'), (3652, 874, 'k43'), (3653, 781, 'k56'), (3654, 688, 'k69'), (3655, 595, 'k82'), (3656, 502, 'k95'), (3657, 409, 'k11'), (3658, 316, 'k24'), (3659, 223, 'k37'), (3660, 130, 'k50'), (3661, 37, 'k63'), (3662, 1947, 'k76'), (3663, 1854, 'k89'), (3664, 1761, 'k5'), (3665, 1668, 'k18'), (3666, 1575, 'k31'), (3667, 1482, 'k44'), (3668, 1389, 'k57'), (3669, 1296, 'k70'), (3670, 1203, 'k83'), (3671, 1110, 'k96'), (3672, 1017, 'k12'), (3673, 924, 'k25'), (3674, 831, 'k38'), (3675, 738, 'k51'), (3676, 645, 'k64'), (3677, 552, 'k77'), (3678, 459, 'k90'), (3679, 366, 'k6'), (3680, 273, 'k19'), (3681, 180, 'k32'), (3682, 87, 'k45'), (3683, 1997, 'k58'), (3684, 1904, 'k71'), (3685, 1811, 'k84'), (3686, 1718, 'k0'), (3687, 1625, 'k13'), (3688, 1532, 'k26'), (3689, 1439, 'k39'), (3690, 1346, 'k52'), (3691, 1253, 'k65'), (3692, 1160, 'k78'), (3693, 1067, 'k91'), (3694, 974, 'k7'), (3695, 881, 'k20'), (3696, 788, 'k33'), (3697, 695, 'k46'), (3698, 602, 'k59'), (3699, 509, 'k72'), (3700, 416, 'k85'), (3701, 323, 'k1'), (3702, 230, 'k14'), (3703, 137, 'k27'), (3704, 44, 'k40'), (3705, 1954, 'k53'), (3706, 1861, 'k66'), (3707, 1768, 'k79'), (3708, 1675, 'k92'), (3709, 1582, 'k8'), (3710, 1489, 'k21'), (3711, 1396, 'k34'), (3712, 1303, 'k47'), (3713, 1210, 'k60'), (3714, 1117, 'k73'), (3715, 1024, 'k86'), (3716, 931, 'k2'), (3717, 838, 'k15'), (3718, 745, 'k28'), (3719, 652, 'k41'), (3720, 559, 'k54'), (3721, 466, 'k67'), (3722, 373, 'k80'), (3723, 280, 'k93'), (3724, 187, 'k9'), (3725, 94, 'k22'), (3726, 1, 'k35'), (3727, 1911, 'k48'), (3728, 1818, 'k61'), (3729, 1725, 'k74'), (3730, 1632, 'k87'), (3731, 1539, 'k3'), (3732, 1446, 'k16'), (3733, 1353, 'k29'), (3734, 1260, 'k42'), (3735, 1167, 'k55'), (3736, 1074, 'k68'), (3737, 981, 'k81'), (3738, 888, 'k94'), (3739, 795, 'k10'), (3740, 702, 'k23'), (3741, 609, 'k36'), (3742, 516, 'k49'), (3743, 423, 'k62'), (3744, 330, 'k75'), (3745, 237, 'k88'), (3746, 144, 'k4'), (3747, 51, 'k17'), (3748, 1961, 'k30'), (3749, 1868, 'k43'), (3750, 1775, 'k56'), (3751, 1682, 'k69'), (3752, 1589, 'k82'), (3753, 1496, 'k95'), (3754, 1403, 'k11'), (3755, 1310, 'k24'), (3756, 1217, 'k37'), (3757, 1124, 'k50'), (3758, 1031, 'k63'), (3759, 938, 'k76'), (3760, 845, 'k89'), (3761, 752, 'k5'), (3762, 659, 'k18'), (3763, 566, 'k31'), (3764, 473, 'k44'), (3765, 380, 'k57'), (3766, 287, 'k70'), (3767, 194, 'k83'), (3768, 101, 'k96'), (3769, 8, 'k12'), (3770, 1918, 'k25'), (3771, 1825, 'k38'), (3772, 1732, 'k51'), (3773, 1639, 'k64'), (3774, 1546, 'k77'), (3775, 1453, 'k90'), (3776, 1360, 'k6'), (3777, 1267, 'k19'), (3778, 1174, 'k32'), (3779, 1081, 'k45'), (3780, 988, 'k58'), (3781, 895, 'k71'), (3782, 802, 'k84'), (3783, 709, 'k0'), (3784, 616, 'k13'), (3785, 523, 'k26'), (3786, 430, 'k39'), (3787, 337, 'k52'), (3788, 244, 'k65'), (3789, 151, 'k78'), (3790, 58, 'k91'), (3791, 1968, 'k7'), (3792, 1875, 'k20'), (3793, 1782, 'k33'), (3794, 1689, 'k46'), (3795, 1596, 'k59'), (3796, 1503, 'k72'), (3797, 1410, 'k85'), (3798, 1317, 'k1'), (3799, 1224, 'k14'), (3800, 1131, 'k27'), (3801, 1038, 'k40'), (3802, 945, 'k53'), (3803, 852, 'k66'), (3804, 759, 'k79'), (3805, 666, 'k92'), (3806, 573, 'k8'), (3807, 480, 'k21'), (3808, 387, 'k34'), (3809, 294, 'k47'), (3810, 201, 'k60'), (3811, 108, 'k73'), (3812, 15, 'k86'), (3813, 1925, 'k2'), (3814, 1832, 'k15'), (3815, 1739, 'k28'), (3816, 1646, 'k41'), (3817, 1553, 'k54'), (3818, 1460, 'k67'), (3819, 1367, 'k80'), (3820, 1274, 'k93'), (3821, 1181, 'k9'), (3822, 1088, 'k22'), (3823, 995, 'k35'), (3824, 902, 'k48'), (3825, 809, 'k61'), (3826, 716, 'k74'), (3827, 623, 'k87'), (3828, 530, 'k3'), (3829, 437, 'k16'), (3830, 344, 'k29'), (3831, 251, 'k42'), (3832, 158, 'k55'), (3833, 65, 'k68'), (3834, 1975, 'k81'), (3835, 1882, 'k94'), (3836, 1789, 'k10'), (3837, 1696, 'k23'), (3838, 1603, 'k36'), (3839, 1510, 'k49'), (3840, 1417, 'k62'), (3841, 1324, 'k75'), (3842, 1231, 'k88'), (3843, 1138, 'k4'), (3844, 1045, 'k17'), (3845, 952, 'k30'), (3846, 859, 'k43'), (3847, 766, 'k56'), (3848, 673, 'k69'), (3849, 580, 'k82'), (3850, 487, 'k95'), (3851, 394, 'k11'), (3852, 301, 'k24'), (3853, 208, 'k37'), (3854, 115, 'k50'), (3855, 22, 'k63'), (3856, 1932, 'k76'), (3857, 1839, 'k89'), (3858, 1746, 'k5'), (3859, 1653, 'k18'), (3860, 1560, 'k31'), (3861, 1467, 'k44'), (3862, 1374, 'k57'), (3863, 1281, 'k70'), (3864, 1188, 'k83'), (3865, 1095, 'k96'), (3866, 1002, 'k12'), (3867, 909, 'k25'), (3868, 816, 'k38'), (3869, 723, 'k51'), (3870, 630, 'k64'), (3871, 537, 'k77'), (3872, 444, 'k90'), (3873, 351, 'k6'), (3874, 258, 'k19'), (3875, 165, 'k32'), (3876, 72, 'k45'), (3877, 1982, 'k58'), (3878, 1889, 'k71'), (3879, 1796, 'k84'), (3880, 1703, 'k0'), (3881, 1610, 'k13'), (3882, 1517, 'k26'), (3883, 1424, 'k39'), (3884, 1331, 'k52'), (3885, 1238, 'k65'), (3886, 1145, 'k78'), (3887, 1052, 'k91'), (3888, 959, 'k7'), (3889, 866, 'k20'), (3890, 773, 'k33'), (3891, 680, 'k46'), (3892, 587, 'k59'), (3893, 494, 'k72'), (3894, 401, 'k85'), (3895, 308, 'k1'), (3896, 215, 'k14'), (3897, 122, 'k27'), (3898, 29, 'k40'), (3899, 1939, 'k53'), (3900, 1846, 'k66'), (3901, 1753, 'k79'), (3902, 1660, 'k92'), (3903, 1567, 'k8'), (3904, 1474, 'k21'), (3905, 1381, 'k34'), (3906, 1288, 'k47'), (3907, 1195, 'k60'), (3908, 1102, 'k73'), (3909, 1009, 'k86'), (3910, 916, 'k2'), (3911, 823, 'k15'), (3912, 730, 'k28'), (3913, 637, 'k41'), (3914, 544, 'k54'), (3915, 451, 'k67'), (3916, 358, 'k80'), (3917, 265, 'k93'), (3918, 172, 'k9'), (3919, 79, 'k22'), (3920, 1989, 'k35'), (3921, 1896, 'k48'), (3922, 1803, 'k61'), (3923, 1710, 'k74'), (3924, 1617, 'k87'), (3925, 1524, 'k3'), (3926, 1431, 'k16'), (3927, 1338, 'k29'), (3928, 1245, 'k42'), (3929, 1152, 'k55'), (3930, 1059, 'k68'), (3931, 966, 'k81'), (3932, 873, 'k94'), (3933, 780, 'k10'), (3934, 687, 'k23'), (3935, 594, 'k36'), (3936, 501, 'k49'), (3937, 408, 'k62'), (3938, 315, 'k75'), (3939, 222, 'k88'), (3940, 129, 'k4'), (3941, 36, 'k17'), (3942, 1946, 'k30'), (3943, 1853, 'k43'), (3944, 1760, 'k56'), (3945, 1667, 'k69'), (3946, 1574, 'k82'), (3947, 1481, 'k95'), (3948, 1388, 'k11'), (3949, 1295, 'k24'), (3950, 1202, 'k37'), (3951, 1109, 'k50'), (3952, 1016, 'k63'), (3953, 923, 'k76'), (3954, 830, 'k89'), (3955, 737, 'k5'), (3956, 644, 'k18'), (3957, 551, 'k31'), (3958, 458, 'k44'), (3959, 365, 'k57'), (3960, 272, 'k70'), (3961, 179, 'k83'), (3962, 86, 'k96'), (3963, 1996, 'k12'), (3964, 1903, 'k25'), (3965, 1810, 'k38'), (3966, 1717, 'k51'), (3967, 1624, 'k64'), (3968, 1531, 'k77'), (3969, 1438, 'k90'), (3970, 1345, 'k6'), (3971, 1252, 'k19'), (3972, 1159, 'k32'), (3973, 1066, 'k45'), (3974, 973, 'k58'), (3975, 880, 'k71'), (3976, 787, 'k84'), (3977, 694, 'k0'), (3978, 601, 'k13'), (3979, 508, 'k26'), (3980, 415, 'k39'), (3981, 322, 'k52'), (3982, 229, 'k65'), (3983, 136, 'k78'), (3984, 43, 'k91'), (3985, 1953, 'k7'), (3986, 1860, 'k20'), (3987, 1767, 'k33'), (3988, 1674, 'k46'), (3989, 1581, 'k59'), (3990, 1488, 'k72'), (3991, 1395, 'k85'), (3992, 1302, 'k1'), (3993, 1209, 'k14'), (3994, 1116, 'k27'), (3995, 1023, 'k40'), (3996, 930, 'k53'), (3997, 837, 'k66'), (3998, 744, 'k79'), (3999, 651, 'k92'), (4000, 558, 'k8'), (4001, 465, 'k21'), (4002, 372, 'k34'), (4003, 279, 'k47'), (4004, 186, 'k60'), (4005, 93, 'k73'), (4006, 0, 'k86'), (4007, 1910, 'k2'), (4008, 1817, 'k15'), (4009, 1724, 'k28'), (4010, 1631, 'k41'), (4011, 1538, 'k54'), (4012, 1445, 'k67'), (4013, 1352, 'k80'), (4014, 1259, 'k93'), (4015, 1166, 'k9'), (4016, 1073, 'k22'), (4017, 980, 'k35'), (4018, 887, 'k48'), (4019, 794, 'k61'), (4020, 701, 'k74'), (4021, 608, 'k87'), (4022, 515, 'k3'), (4023, 422, 'k16'), (4024, 329, 'k29'), (4025, 236, 'k42'), (4026, 143, 'k55'), (4027, 50, 'k68'), (4028, 1960, 'k81'), (4029, 1867, 'k94'), (4030, 1774, 'k10'), (4031, 1681, 'k23'), (4032, 1588, 'k36'), (4033, 1495, 'k49'), (4034, 1402, 'k62'), (4035, 1309, 'k75'), (4036, 1216, 'k88'), (4037, 1123, 'k4'), (4038, 1030, 'k17'), (4039, 937, 'k30'), (4040, 844, 'k43'), (4041, 751, 'k56'), (4042, 658, 'k69'), (4043, 565, 'k82'), (4044, 472, 'k95'), (4045, 379, 'k11'), (4046, 286, 'k24'), (4047, 193, 'k37'), (4048, 100, 'k50'), (4049, 7, 'k63'), (4050, 1917, 'k76'), (4051, 1824, 'k89'), (4052, 1731, 'k5'), (4053, 1638, 'k18'), (4054, 1545, 'k31'), (4055, 1452, 'k44'), (4056, 1359, 'k57'), (4057, 1266, 'k70'), (4058, 1173, 'k83'), (4059, 1080, 'k96'), (4060, 987, 'k12'), (4061, 894, 'k25'), (4062, 801, 'k38'), (4063, 708, 'k51'), (4064, 615, 'k64'), (4065, 522, 'k77'), (4066, 429, 'k90'), (4067, 336, 'k6'), (4068, 243, 'k19'), (4069, 150, 'k32'), (4070, 57, 'k45'), (4071, 1967, 'k58'), (4072, 1874, 'k71'), (4073, 1781, 'k84'), (4074, 1688, 'k0'), (4075, 1595, 'k13'), (4076, 1502, 'k26'), (4077, 1409, 'k39'), (4078, 1316, 'k52'), (4079, 1223, 'k65'), (4080, 1130, 'k78'), (4081, 1037, 'k91'), (4082, 944, 'k7'), (4083, 851, 'k20'), (4084, 758, 'k33'), (4085, 665, 'k46'), (4086, 572, 'k59'), (4087, 479, 'k72'), (4088, 386, 'k85'), (4089, 293, 'k1'), (4090, 200, 'k14'), (4091, 107, 'k27'), (4092, 14, 'k40'), (4093, 1924, 'k53'), (4094, 1831, 'k66'), (4095, 1738, 'k79'), (4096, 1645, 'k92'), (4097, 1552, 'k8'), (4098, 1459, 'k21'), (4099, 1366, 'k34'), (4100, 1273, 'k47'), (4101, 1180, 'k60'), (4102, 1087, 'k73'), (4103, 994, 'k86'), (4104, 901, 'k2'), (4105, 808, 'k15'), (4106, 715, 'k28'), (4107, 622, 'k41'), (4108, 529, 'k54'), (4109, 436, 'k67'), (4110, 343, 'k80'), (4111, 250, 'k93'), (4112, 157, 'k9'), (4113, 64, 'k22'), (4114, 1974, 'k35'), (4115, 1881, 'k48'), (4116, 1788, 'k61'), (4117, 1695, 'k74'), (4118, 1602, 'k87'), (4119, 1509, 'k3'), (4120, 1416, 'k16'), (4121, 1323, 'k29'), (4122, 1230, 'k42'), (4123, 1137, 'k55'), (4124, 1044, 'k68'), (4125, 951, 'k81'), (4126, 858, 'k94'), (4127, 765, 'k10'), (4128, 672, 'k23'), (4129, 579, 'k36'), (4130, 486, 'k49'), (4131, 393, 'k62'), (4132, 300, 'k75'), (4133, 207, 'k88'), (4134, 114, 'k4'), (4135, 21, 'k17'), (4136, 1931, 'k30'), (4137, 1838, 'k43'), (4138, 1745, 'k56'), (4139, 1652, 'k69'), (4140, 1559, 'k82'), (4141, 1466, 'k95'), (4142, 1373, 'k11'), (4143, 1280, 'k24'), (4144, 1187, 'k37'), (4145, 1094, 'k50'), (4146, 1001, 'k63'), (4147, 908, 'k76'), (4148, 815, 'k89'), (4149, 722, 'k5'), (4150, 629, 'k18'), (4151, 536, 'k31'), (4152, 443, 'k44'), (4153, 350, 'k57'), (4154, 257, 'k70'), (4155, 164, 'k83'), (4156, 71, 'k96'), (4157, 1981, 'k12'), (4158, 1888, 'k25'), (4159, 1795, 'k38'), (4160, 1702, 'k51'), (4161, 1609, 'k64'), (4162, 1516, 'k77'), (4163, 1423, 'k90'), (4164, 1330, 'k6'), (4165, 1237, 'k19'), (4166, 1144, 'k32'), (4167, 1051, 'k45'), (4168, 958, 'k58'), (4169, 865, 'k71'), (4170, 772, 'k84'), (4171, 679, 'k0'), (4172, 586, 'k13'), (4173, 493, 'k26'), (4174, 400, 'k39'), (4175, 307, 'k52'), (4176, 214, 'k65'), (4177, 121, 'k78'), (4178, 28, 'k91'), (4179, 1938, 'k7'), (4180, 1845, 'k20'), (4181, 1752, 'k33'), (4182, 1659, 'k46'), (4183, 1566, 'k59'), (4184, 1473, 'k72'), (4185, 1380, 'k85'), (4186, 1287, 'k1'), (4187, 1194, 'k14'), (4188, 1101, 'k27'), (4189, 1008, 'k40'), (4190, 915, 'k53'), (4191, 822, 'k66'), (4192, 729, 'k79'), (4193, 636, 'k92'), (4194, 543, 'k8'), (4195, 450, 'k21'), (4196, 357, 'k34'), (4197, 264, 'k47'), (4198, 171, 'k60'), (4199, 78, 'k73'), (4200, 1988, 'k86'), (4201, 1895, 'k2'), (4202, 1802, 'k15'), (4203, 1709, 'k28'), (4204, 1616, 'k41'), (4205, 1523, 'k54'), (4206, 1430, 'k67'), (4207, 1337, 'k80'), (4208, 1244, 'k93'), (4209, 1151, 'k9'), (4210, 1058, 'k22'), (4211, 965, 'k35'), (4212, 872, 'k48'), (4213, 779, 'k61'), (4214, 686, 'k74'), (4215, 593, 'k87'), (4216, 500, 'k3'), (4217, 407, 'k16'), (4218, 314, 'k29'), (4219, 221, 'k42'), (4220, 128, 'k55'), (4221, 35, 'k68'), (4222, 1945, 'k81'), (4223, 1852, 'k94'), (4224, 1759, 'k10'), (4225, 1666, 'k23'), (4226, 1573, 'k36'), (4227, 1480, 'k49'), (4228, 1387, 'k62'), (4229, 1294, 'k75'), (4230, 1201, 'k88'), (4231, 1108, 'k4'), (4232, 1015, 'k17'), (4233, 922, 'k30'), (4234, 829, 'k43'), (4235, 736, 'k56'), (4236, 643, 'k69'), (4237, 550, 'k82'), (4238, 457, 'k95'), (4239, 364, 'k11'), (4240, 271, 'k24'), (4241, 178, 'k37'), (4242, 85, 'k50'), (4243, 1995, 'k63'), (4244, 1902, 'k76'), (4245, 1809, 'k89'), (4246, 1716, 'k5'), (4247, 1623, 'k18'), (4248, 1530, 'k31'), (4249, 1437, 'k44'), (4250, 1344, 'k57'), (4251, 1251, 'k70'), (4252, 1158, 'k83'), (4253, 1065, 'k96'), (4254, 972, 'k12'), (4255, 879, 'k25'), (4256, 786, 'k38'), (4257, 693, 'k51'), (4258, 600, 'k64'), (4259, 507, 'k77'), (4260, 414, 'k90'), (4261, 321, 'k6'), (4262, 228, 'k19'), (4263, 135, 'k32'), (4264, 42, 'k45'), (4265, 1952, 'k58'), (4266, 1859, 'k71'), (4267, 1766, 'k84'), (4268, 1673, 'k0'), (4269, 1580, 'k13'), (4270, 1487, 'k26'), (4271, 1394, 'k39'), (4272, 1301, 'k52'), (4273, 1208, 'k65'), (4274, 1115, 'k78'), (4275, 1022, 'k91'), (4276, 929, 'k7'), (4277, 836, 'k20'), (4278, 743, 'k33'), (4279, 650, 'k46'), (4280, 557, 'k59'), (4281, 464, 'k72'), (4282, 371, 'k85'), (4283, 278, 'k1'), (4284, 185, 'k14'), (4285, 92, 'k27'), (4286, 2002, 'k40'), (4287, 1909, 'k53'), (4288, 1816, 'k66'), (4289, 1723, 'k79'), (4290, 1630, 'k92'), (4291, 1537, 'k8'), (4292, 1444, 'k21'), (4293, 1351, 'k34'), (4294, 1258, 'k47'), (4295, 1165, 'k60'), (4296, 1072, 'k73'), (4297, 979, 'k86'), (4298, 886, 'k2'), (4299, 793, 'k15'), (4300, 700, 'k28'), (4301, 607, 'k41'), (4302, 514, 'k54'), (4303, 421, 'k67'), (4304, 328, 'k80'), (4305, 235, 'k93'), (4306, 142, 'k9'), (4307, 49, 'k22'), (4308, 1959, 'k35'), (4309, 1866, 'k48'), (4310, 1773, 'k61'), (4311, 1680, 'k74'), (4312, 1587, 'k87'), (4313, 1494, 'k3'), (4314, 1401, 'k16'), (4315, 1308, 'k29'), (4316, 1215, 'k42'), (4317, 1122, 'k55'), (4318, 1029, 'k68'), (4319, 936, 'k81'), (4320, 843, 'k94'), (4321, 750, 'k10'), (4322, 657, 'k23'), (4323, 564, 'k36'), (4324, 471, 'k49'), (4325, 378, 'k62'), (4326, 285, 'k75'), (4327, 192, 'k88'), (4328, 99, 'k4'), (4329, 6, 'k17'), (4330, 1916, 'k30'), (4331, 1823, 'k43'), (4332, 1730, 'k56'), (4333, 1637, 'k69'), (4334, 1544, 'k82'), (4335, 1451, 'k95'), (4336, 1358, 'k11'), (4337, 1265, 'k24'), (4338, 1172, 'k37'), (4339, 1079, 'k50'), (4340, 986, 'k63'), (4341, 893, 'k76'), (4342, 800, 'k89'), (4343, 707, 'k5'), (4344, 614, 'k18'), (4345, 521, 'k31'), (4346, 428, 'k44'), (4347, 335, 'k57'), (4348, 242, 'k70'), (4349, 149, 'k83'), (4350, 56, 'k96'), (4351, 1966, 'k12'), (4352, 1873, 'k25'), (4353, 1780, 'k38'), (4354, 1687, 'k51'), (4355, 1594, 'k64'), (4356, 1501, 'k77'), (4357, 1408, 'k90'), (4358, 1315, 'k6'), (4359, 1222, 'k19'), (4360, 1129, 'k32'), (4361, 1036, 'k45'), (4362, 943, 'k58'), (4363, 850, 'k71'), (4364, 757, 'k84'), (4365, 664, 'k0'), (4366, 571, 'k13'), (4367, 478, 'k26'), (4368, 385, 'k39'), (4369, 292, 'k52'), (4370, 199, 'k65'), (4371, 106, 'k78'), (4372, 13, 'k91'), (4373, 1923, 'k7'), (4374, 1830, 'k20'), (4375, 1737, 'k33'), (4376, 1644, 'k46'), (4377, 1551, 'k59'), (4378, 1458, 'k72'), (4379, 1365, 'k85'), (4380, 1272, 'k1'), (4381, 1179, 'k14'), (4382, 1086, 'k27'), (4383, 993, 'k40'), (4384, 900, 'k53'), (4385, 807, 'k66'), (4386, 714, 'k79'), (4387, 621, 'k92'), (4388, 528, 'k8'), (4389, 435, 'k21'), (4390, 342, 'k34'), (4391, 249, 'k47'), (4392, 156, 'k60'), (4393, 63, 'k73'), (4394, 1973, 'k86'), (4395, 1880, 'k2'), (4396, 1787, 'k15'), (4397, 1694, 'k28'), (4398, 1601, 'k41'), (4399, 1508, 'k54'), (4400, 1415, 'k67'), (4401, 1322, 'k80'), (4402, 1229, 'k93'), (4403, 1136, 'k9'), (4404, 1043, 'k22'), (4405, 950, 'k35'), (4406, 857, 'k48'), (4407, 764, 'k61'), (4408, 671, 'k74'), (4409, 578, 'k87'), (4410, 485, 'k3'), (4411, 392, 'k16'), (4412, 299, 'k29'), (4413, 206, 'k42'), (4414, 113, 'k55'), (4415, 20, 'k68'), (4416, 1930, 'k81'), (4417, 1837, 'k94'), (4418, 1744, 'k10'), (4419, 1651, 'k23'), (4420, 1558, 'k36'), (4421, 1465, 'k49'), (4422, 1372, 'k62'), (4423, 1279, 'k75'), (4424, 1186, 'k88'), (4425, 1093, 'k4'), (4426, 1000, 'k17'), (4427, 907, 'k30'), (4428, 814, 'k43'), (4429, 721, 'k56'), (4430, 628, 'k69'), (4431, 535, 'k82'), (4432, 442, 'k95'), (4433, 349, 'k11'), (4434, 256, 'k24'), (4435, 163, 'k37'), (4436, 70, 'k50'), (4437, 1980, 'k63'), (4438, 1887, 'k76'), (4439, 1794, 'k89'), (4440, 1701, 'k5'), (4441, 1608, 'k18'), (4442, 1515, 'k31'), (4443, 1422, 'k44'), (4444, 1329, 'k57'), (4445, 1236, 'k70'), (4446, 1143, 'k83'), (4447, 1050, 'k96'), (4448, 957, 'k12'), (4449, 864, 'k25'), (4450, 771, 'k38'), (4451, 678, 'k51'), (4452, 585, 'k64'), (4453, 492, 'k77'), (4454, 399, 'k90'), (4455, 306, 'k6'), (4456, 213, 'k19'), (4457, 120, 'k32'), (4458, 27, 'k45'), (4459, 1937, 'k58'), (4460, 1844, 'k71'), (4461, 1751, 'k84'), (4462, 1658, 'k0'), (4463, 1565, 'k13'), (4464, 1472, 'k26'), (4465, 1379, 'k39'), (4466, 1286, 'k52'), (4467, 1193, 'k65'), (4468, 1100, 'k78'), (4469, 1007, 'k91'), (4470, 914, 'k7'), (4471, 821, 'k20'), (4472, 728, 'k33'), (4473, 635, 'k46'), (4474, 542, 'k59'), (4475, 449, 'k72'), (4476, 356, 'k85'), (4477, 263, 'k1'), (4478, 170, 'k14'), (4479, 77, 'k27'), (4480, 1987, 'k40'), (4481, 1894, 'k53'), (4482, 1801, 'k66'), (4483, 1708, 'k79'), (4484, 1615, 'k92'), (4485, 1522, 'k8'), (4486, 1429, 'k21'), (4487, 1336, 'k34'), (4488, 1243, 'k47'), (4489, 1150, 'k60'), (4490, 1057, 'k73'), (4491, 964, 'k86'), (4492, 871, 'k2'), (4493, 778, 'k15'), (4494, 685, 'k28'), (4495, 592, 'k41'), (4496, 499, 'k54'), (4497, 406, 'k67'), (4498, 313, 'k80'), (4499, 220, 'k93'), (4500, 127, 'k9'), (4501, 34, 'k22'), (4502, 1944, 'k35'), (4503, 1851, 'k48'), (4504, 1758, 'k61'), (4505, 1665, 'k74'), (4506, 1572, 'k87'), (4507, 1479, 'k3'), (4508, 1386, 'k16'), (4509, 1293, 'k29'), (4510, 1200, 'k42'), (4511, 1107, 'k55'), (4512, 1014, 'k68'), (4513, 921, 'k81'), (4514, 828, 'k94'), (4515, 735, 'k10'), (4516, 642, 'k23'), (4517, 549, 'k36'), (4518, 456, 'k49'), (4519, 363, 'k62'), (4520, 270, 'k75'), (4521, 177, 'k88'), (4522, 84, 'k4'), (4523, 1994, 'k17'), (4524, 1901, 'k30'), (4525, 1808, 'k43'), (4526, 1715, 'k56'), (4527, 1622, 'k69'), (4528, 1529, 'k82'), (4529, 1436, 'k95'), (4530, 1343, 'k11'), (4531, 1250, 'k24'), (4532, 1157, 'k37'), (4533, 1064, 'k50'), (4534, 971, 'k63'), (4535, 878, 'k76'), (4536, 785, 'k89'), (4537, 692, 'k5'), (4538, 599, 'k18'), (4539, 506, 'k31'), (4540, 413, 'k44'), (4541, 320, 'k57'), (4542, 227, 'k70'), (4543, 134, 'k83'), (4544, 41, 'k96'), (4545, 1951, 'k12'), (4546, 1858, 'k25'), (4547, 1765, 'k38'), (4548, 1672, 'k51'), (4549, 1579, 'k64'), (4550, 1486, 'k77'), (4551, 1393, 'k90'), (4552, 1300, 'k6'), (4553, 1207, 'k19'), (4554, 1114, 'k32'), (4555, 1021, 'k45'), (4556, 928, 'k58'), (4557, 835, 'k71'), (4558, 742, 'k84'), (4559, 649, 'k0'), (4560, 556, 'k13'), (4561, 463, 'k26'), (4562, 370, 'k39'), (4563, 277, 'k52'), (4564, 184, 'k65'), (4565, 91, 'k78'), (4566, 2001, 'k91'), (4567, 1908, 'k7'), (4568, 1815, 'k20'), (4569, 1722, 'k33'), (4570, 1629, 'k46'), (4571, 1536, 'k59'), (4572, 1443, 'k72'), (4573, 1350, 'k85'), (4574, 1257, 'k1'), (4575, 1164, 'k14'), (4576, 1071, 'k27'), (4577, 978, 'k40'), (4578, 885, 'k53'), (4579, 792, 'k66'), (4580, 699, 'k79'), (4581, 606, 'k92'), (4582, 513, 'k8'), (4583, 420, 'k21'), (4584, 327, 'k34'), (4585, 234, 'k47'), (4586, 141, 'k60'), (4587, 48, 'k73'), (4588, 1958, 'k86'), (4589, 1865, 'k2'), (4590, 1772, 'k15'), (4591, 1679, 'k28'), (4592, 1586, 'k41'), (4593, 1493, 'k54'), (4594, 1400, 'k67'), (4595, 1307, 'k80'), (4596, 1214, 'k93'), (4597, 1121, 'k9'), (4598, 1028, 'k22'), (4599, 935, 'k35'), (4600, 842, 'k48'), (4601, 749, 'k61'), (4602, 656, 'k74'), (4603, 563, 'k87'), (4604, 470, 'k3'), (4605, 377, 'k16'), (4606, 284, 'k29'), (4607, 191, 'k42'), (4608, 98, 'k55'), (4609, 5, 'k68'), (4610, 1915, 'k81'), (4611, 1822, 'k94'), (4612, 1729, 'k10'), (4613, 1636, 'k23'), (4614, 1543, 'k36'), (4615, 1450, 'k49'), (4616, 1357, 'k62'), (4617, 1264, 'k75'), (4618, 1171, 'k88'), (4619, 1078, 'k4'), (4620, 985, 'k17'), (4621, 892, 'k30'), (4622, 799, 'k43'), (4623, 706, 'k56'), (4624, 613, 'k69'), (4625, 520, 'k82'), (4626, 427, 'k95'), (4627, 334, 'k11'), (4628, 241, 'k24'), (4629, 148, 'k37'), (4630, 55, 'k50'), (4631, 1965, 'k63'), (4632, 1872, 'k76'), (4633, 1779, 'k89'), (4634, 1686, 'k5'), (4635, 1593, 'k18'), (4636, 1500, 'k31'), (4637, 1407, 'k44'), (4638, 1314, 'k57'), (4639, 1221, 'k70'), (4640, 1128, 'k83'), (4641, 1035, 'k96'), (4642, 942, 'k12'), (4643, 849, 'k25'), (4644, 756, 'k38'), (4645, 663, 'k51'), (4646, 570, 'k64'), (4647, 477, 'k77'), (4648, 384, 'k90'), (4649, 291, 'k6'), (4650, 198, 'k19'), (4651, 105, 'k32'), (4652, 12, 'k45'), (4653, 1922, 'k58'), (4654, 1829, 'k71'), (4655, 1736, 'k84'), (4656, 1643, 'k0'), (4657, 1550, 'k13'), (4658, 1457, 'k26'), (4659, 1364, 'k39'), (4660, 1271, 'k52'), (4661, 1178, 'k65'), (4662, 1085, 'k78'), (4663, 992, 'k91'), (4664, 899, 'k7'), (4665, 806, 'k20'), (4666, 713, 'k33'), (4667, 620, 'k46'), (4668, 527, 'k59'), (4669, 434, 'k72'), (4670, 341, 'k85'), (4671, 248, 'k1'), (4672, 155, 'k14'), (4673, 62, 'k27'), (4674, 1972, 'k40'), (4675, 1879, 'k53'), (4676, 1786, 'k66'), (4677, 1693, 'k79'), (4678, 1600, 'k92'), (4679, 1507, 'k8'), (4680, 1414, 'k21'), (4681, 1321, 'k34'), (4682, 1228, 'k47'), (4683, 1135, 'k60'), (4684, 1042, 'k73'), (4685, 949, 'k86'), (4686, 856, 'k2'), (4687, 763, 'k15'), (4688, 670, 'k28'), (4689, 577, 'k41'), (4690, 484, 'k54'), (4691, 391, 'k67'), (4692, 298, 'k80'), (4693, 205, 'k93'), (4694, 112, 'k9'), (4695, 19, 'k22'), (4696, 1929, 'k35'), (4697, 1836, 'k48'), (4698, 1743, 'k61'), (4699, 1650, 'k74'), (4700, 1557, 'k87'), (4701, 1464, 'k3'), (4702, 1371, 'k16'), (4703, 1278, 'k29'), (4704, 1185, 'k42'), (4705, 1092, 'k55'), (4706, 999, 'k68'), (4707, 906, 'k81'), (4708, 813, 'k94'), (4709, 720, 'k10'), (4710, 627, 'k23'), (4711, 534, 'k36'), (4712, 441, 'k49'), (4713, 348, 'k62'), (4714, 255, 'k75'), (4715, 162, 'k88'), (4716, 69, 'k4'), (4717, 1979, 'k17'), (4718, 1886, 'k30'), (4719, 1793, 'k43'), (4720, 1700, 'k56'), (4721, 1607, 'k69'), (4722, 1514, 'k82'), (4723, 1421, 'k95'), (4724, 1328, 'k11'), (4725, 1235, 'k24'), (4726, 1142, 'k37'), (4727, 1049, 'k50'), (4728, 956, 'k63'), (4729, 863, 'k76'), (4730, 770, 'k89'), (4731, 677, 'k5'), (4732, 584, 'k18'), (4733, 491, 'k31'), (4734, 398, 'k44'), (4735, 305, 'k57'), (4736, 212, 'k70'), (4737, 119, 'k83'), (4738, 26, 'k96'), (4739, 1936, 'k12'), (4740, 1843, 'k25'), (4741, 1750, 'k38'), (4742, 1657, 'k51'), (4743, 1564, 'k64'), (4744, 1471, 'k77'), (4745, 1378, 'k90'), (4746, 1285, 'k6'), (4747, 1192, 'k19'), (4748, 1099, 'k32'), (4749, 1006, 'k45'), (4750, 913, 'k58'), (4751, 820, 'k71'), (4752, 727, 'k84'), (4753, 634, 'k0'), (4754, 541, 'k13'), (4755, 448, 'k26'), (4756, 355, 'k39'), (4757, 262, 'k52'), (4758, 169, 'k65'), (4759, 76, 'k78'), (4760, 1986, 'k91'), (4761, 1893, 'k7'), (4762, 1800, 'k20'), (4763, 1707, 'k33'), (4764, 1614, 'k46'), (4765, 1521, 'k59'), (4766, 1428, 'k72'), (4767, 1335, 'k85'), (4768, 1242, 'k1'), (4769, 1149, 'k14'), (4770, 1056, 'k27'), (4771, 963, 'k40'), (4772, 870, 'k53'), (4773, 777, 'k66'), (4774, 684, 'k79'), (4775, 591, 'k92'), (4776, 498, 'k8'), (4777, 405, 'k21'), (4778, 312, 'k34'), (4779, 219, 'k47'), (4780, 126, 'k60'), (4781, 33, 'k73'), (4782, 1943, 'k86'), (4783, 1850, 'k2'), (4784, 1757, 'k15'), (4785, 1664, 'k28'), (4786, 1571, 'k41'), (4787, 1478, 'k54'), (4788, 1385, 'k67'), (4789, 1292, 'k80'), (4790, 1199, 'k93'), (4791, 1106, 'k9'), (4792, 1013, 'k22'), (4793, 920, 'k35'), (4794, 827, 'k48'), (4795, 734, 'k61'), (4796, 641, 'k74'), (4797, 548, 'k87'), (4798, 455, 'k3'), (4799, 362, 'k16'), (4800, 269, 'k29'), (4801, 176, 'k42'), (4802, 83, 'k55'), (4803, 1993, 'k68'), (4804, 1900, 'k81'), (4805, 1807, 'k94'), (4806, 1714, 'k10'), (4807, 1621, 'k23'), (4808, 1528, 'k36'), (4809, 1435, 'k49'), (4810, 1342, 'k62'), (4811, 1249, 'k75'), (4812, 1156, 'k88'), (4813, 1063, 'k4'), (4814, 970, 'k17'), (4815, 877, 'k30'), (4816, 784, 'k43'), (4817, 691, 'k56'), (4818, 598, 'k69'), (4819, 505, 'k82'), (4820, 412, 'k95'), (4821, 319, 'k11'), (4822, 226, 'k24'), (4823, 133, 'k37'), (4824, 40, 'k50'), (4825, 1950, 'k63'), (4826, 1857, 'k76'), (4827, 1764, 'k89'), (4828, 1671, 'k5'), (4829, 1578, 'k18'), (4830, 1485, 'k31'), (4831, 1392, 'k44'), (4832, 1299, 'k57'), (4833, 1206, 'k70'), (4834, 1113, 'k83'), (4835, 1020, 'k96'), (4836, 927, 'k12'), (4837, 834, 'k25'), (4838, 741, 'k38'), (4839, 648, 'k51'), (4840, 555, 'k64'), (4841, 462, 'k77'), (4842, 369, 'k90'), (4843, 276, 'k6'), (4844, 183, 'k19'), (4845, 90, 'k32'), (4846, 2000, 'k45'), (4847, 1907, 'k58'), (4848, 1814, 'k71'), (4849, 1721, 'k84'), (4850, 1628, 'k0'), (4851, 1535, 'k13'), (4852, 1442, 'k26'), (4853, 1349, 'k39'), (4854, 1256, 'k52'), (4855, 1163, 'k65'), (4856, 1070, 'k78'), (4857, 977, 'k91'), (4858, 884, 'k7'), (4859, 791, 'k20'), (4860, 698, 'k33'), (4861, 605, 'k46'), (4862, 512, 'k59'), (4863, 419, 'k72'), (4864, 326, 'k85'), (4865, 233, 'k1'), (4866, 140, 'k14'), (4867, 47, 'k27'), (4868, 1957, 'k40'), (4869, 1864, 'k53'), (4870, 1771, 'k66'), (4871, 1678, 'k79'), (4872, 1585, 'k92'), (4873, 1492, 'k8'), (4874, 1399, 'k21'), (4875, 1306, 'k34'), (4876, 1213, 'k47'), (4877, 1120, 'k60'), (4878, 1027, 'k73'), (4879, 934, 'k86'), (4880, 841, 'k2'), (4881, 748, 'k15'), (4882, 655, 'k28'), (4883, 562, 'k41'), (4884, 469, 'k54'), (4885, 376, 'k67'), (4886, 283, 'k80'), (4887, 190, 'k93'), (4888, 97, 'k9'), (4889, 4, 'k22'), (4890, 1914, 'k35'), (4891, 1821, 'k48'), (4892, 1728, 'k61'), (4893, 1635, 'k74'), (4894, 1542, 'k87'), (4895, 1449, 'k3'), (4896, 1356, 'k16'), (4897, 1263, 'k29'), (4898, 1170, 'k42'), (4899, 1077, 'k55'), (4900, 984, 'k68'), (4901, 891, 'k81'), (4902, 798, 'k94'), (4903, 705, 'k10'), (4904, 612, 'k23'), (4905, 519, 'k36'), (4906, 426, 'k49'), (4907, 333, 'k62'), (4908, 240, 'k75'), (4909, 147, 'k88'), (4910, 54, 'k4'), (4911, 1964, 'k17'), (4912, 1871, 'k30'), (4913, 1778, 'k43'), (4914, 1685, 'k56'), (4915, 1592, 'k69'), (4916, 1499, 'k82'), (4917, 1406, 'k95'), (4918, 1313, 'k11'), (4919, 1220, 'k24'), (4920, 1127, 'k37'), (4921, 1034, 'k50'), (4922, 941, 'k63'), (4923, 848, 'k76'), (4924, 755, 'k89'), (4925, 662, 'k5'), (4926, 569, 'k18'), (4927, 476, 'k31'), (4928, 383, 'k44'), (4929, 290, 'k57'), (4930, 197, 'k70'), (4931, 104, 'k83'), (4932, 11, 'k96'), (4933, 1921, 'k12'), (4934, 1828, 'k25'), (4935, 1735, 'k38'), (4936, 1642, 'k51'), (4937, 1549, 'k64'), (4938, 1456, 'k77'), (4939, 1363, 'k90'), (4940, 1270, 'k6'), (4941, 1177, 'k19'), (4942, 1084, 'k32'), (4943, 991, 'k45'), (4944, 898, 'k58'), (4945, 805, 'k71'), (4946, 712, 'k84'), (4947, 619, 'k0'), (4948, 526, 'k13'), (4949, 433, 'k26'), (4950, 340, 'k39'), (4951, 247, 'k52'), (4952, 154, 'k65'), (4953, 61, 'k78'), (4954, 1971, 'k91'), (4955, 1878, 'k7'), (4956, 1785, 'k20'), (4957, 1692, 'k33'), (4958, 1599, 'k46'), (4959, 1506, 'k59'), (4960, 1413, 'k72'), (4961, 1320, 'k85'), (4962, 1227, 'k1'), (4963, 1134, 'k14'), (4964, 1041, 'k27'), (4965, 948, 'k40'), (4966, 855, 'k53'), (4967, 762, 'k66'), (4968, 669, 'k79'), (4969, 576, 'k92'), (4970, 483, 'k8'), (4971, 390, 'k21'), (4972, 297, 'k34'), (4973, 204, 'k47'), (4974, 111, 'k60'), (4975, 18, 'k73'), (4976, 1928, 'k86'), (4977, 1835, 'k2'), (4978, 1742, 'k15'), (4979, 1649, 'k28'), (4980, 1556, 'k41'), (4981, 1463, 'k54'), (4982, 1370, 'k67'), (4983, 1277, 'k80'), (4984, 1184, 'k93'), (4985, 1091, 'k9'), (4986, 998, 'k22'), (4987, 905, 'k35'), (4988, 812, 'k48'), (4989, 719, 'k61'), (4990, 626, 'k74'), (4991, 533, 'k87'), (4992, 440, 'k3'), (4993, 347, 'k16'), (4994, 254, 'k29'), (4995, 161, 'k42'), (4996, 68, 'k55'), (4997, 1978, 'k68'), (4998, 1885, 'k81'), (4999, 1792, 'k94'), (5000, 1699, 'k10'), (5001, 1606, 'k23'), (5002, 1513, 'k36'), (5003, 1420, 'k49'), (5004, 1327, 'k62'), (5005, 1234, 'k75'), (5006, 1141, 'k88'), (5007, 1048, 'k4'), (5008, 955, 'k17'), (5009, 862, 'k30'), (5010, 769, 'k43'), (5011, 676, 'k56'), (5012, 583, 'k69'), (5013, 490, 'k82'), (5014, 397, 'k95'), (5015, 304, 'k11'), (5016, 211, 'k24'), (5017, 118, 'k37'), (5018, 25, 'k50'), (5019, 1935, 'k63'), (5020, 1842, 'k76'), (5021, 1749, 'k89'), (5022, 1656, 'k5'), (5023, 1563, 'k18'), (5024, 1470, 'k31'), (5025, 1377, 'k44'), (5026, 1284, 'k57'), (5027, 1191, 'k70'), (5028, 1098, 'k83'), (5029, 1005, 'k96'), (5030, 912, 'k12'), (5031, 819, 'k25'), (5032, 726, 'k38'), (5033, 633, 'k51'), (5034, 540, 'k64'), (5035, 447, 'k77'), (5036, 354, 'k90'), (5037, 261, 'k6'), (5038, 168, 'k19'), (5039, 75, 'k32'), (5040, 1985, 'k45'), (5041, 1892, 'k58'), (5042, 1799, 'k71'), (5043, 1706, 'k84'), (5044, 1613, 'k0'), (5045, 1520, 'k13'), (5046, 1427, 'k26'), (5047, 1334, 'k39'), (5048, 1241, 'k52'), (5049, 1148, 'k65'), (5050, 1055, 'k78'), (5051, 962, 'k91'), (5052, 869, 'k7'), (5053, 776, 'k20'), (5054, 683, 'k33'), (5055, 590, 'k46'), (5056, 497, 'k59'), (5057, 404, 'k72'), (5058, 311, 'k85'), (5059, 218, 'k1'), (5060, 125, 'k14'), (5061, 32, 'k27'), (5062, 1942, 'k40'), (5063, 1849, 'k53'), (5064, 1756, 'k66'), (5065, 1663, 'k79'), (5066, 1570, 'k92'), (5067, 1477, 'k8'), (5068, 1384, 'k21'), (5069, 1291, 'k34'), (5070, 1198, 'k47'), (5071, 1105, 'k60'), (5072, 1012, 'k73'), (5073, 919, 'k86'), (5074, 826, 'k2'), (5075, 733, 'k15'), (5076, 640, 'k28'), (5077, 547, 'k41'), (5078, 454, 'k54'), (5079, 361, 'k67'), (5080, 268, 'k80'), (5081, 175, 'k93'), (5082, 82, 'k9'), (5083, 1992, 'k22'), (5084, 1899, 'k35'), (5085, 1806, 'k48'), (5086, 1713, 'k61'), (5087, 1620, 'k74'), (5088, 1527, 'k87'), (5089, 1434, 'k3'), (5090, 1341, 'k16'), (5091, 1248, 'k29'), (5092, 1155, 'k42'), (5093, 1062, 'k55'), (5094, 969, 'k68'), (5095, 876, 'k81'), (5096, 783, 'k94'), (5097, 690, 'k10'), (5098, 597, 'k23'), (5099, 504, 'k36'), (5100, 411, 'k49'), (5101, 318, 'k62'), (5102, 225, 'k75'), (5103, 132, 'k88'), (5104, 39, 'k4'), (5105, 1949, 'k17'), (5106, 1856, 'k30'), (5107, 1763, 'k43'), (5108, 1670, 'k56'), (5109, 1577, 'k69'), (5110, 1484, 'k82'), (5111, 1391, 'k95'), (5112, 1298, 'k11'), (5113, 1205, 'k24'), (5114, 1112, 'k37'), (5115, 1019, 'k50'), (5116, 926, 'k63'), (5117, 833, 'k76'), (5118, 740, 'k89'), (5119, 647, 'k5'), (5120, 554, 'k18'), (5121, 461, 'k31'), (5122, 368, 'k44'), (5123, 275, 'k57'), (5124, 182, 'k70'), (5125, 89, 'k83'), (5126, 1999, 'k96'), (5127, 1906, 'k12'), (5128, 1813, 'k25'), (5129, 1720, 'k38'), (5130, 1627, 'k51'), (5131, 1534, 'k64'), (5132, 1441, 'k77'), (5133, 1348, 'k90'), (5134, 1255, 'k6'), (5135, 1162, 'k19'), (5136, 1069, 'k32'), (5137, 976, 'k45'), (5138, 883, 'k58'), (5139, 790, 'k71'), (5140, 697, 'k84'), (5141, 604, 'k0'), (5142, 511, 'k13'), (5143, 418, 'k26'), (5144, 325, 'k39'), (5145, 232, 'k52'), (5146, 139, 'k65'), (5147, 46, 'k78'), (5148, 1956, 'k91'), (5149, 1863, 'k7'), (5150, 1770, 'k20'), (5151, 1677, 'k33'), (5152, 1584, 'k46'), (5153, 1491, 'k59'), (5154, 1398, 'k72'), (5155, 1305, 'k85'), (5156, 1212, 'k1'), (5157, 1119, 'k14'), (5158, 1026, 'k27'), (5159, 933, 'k40'), (5160, 840, 'k53'), (5161, 747, 'k66'), (5162, 654, 'k79'), (5163, 561, 'k92'), (5164, 468, 'k8'), (5165, 375, 'k21'), (5166, 282, 'k34'), (5167, 189, 'k47'), (5168, 96, 'k60'), (5169, 3, 'k73'), (5170, 1913, 'k86'), (5171, 1820, 'k2'), (5172, 1727, 'k15'), (5173, 1634, 'k28'), (5174, 1541, 'k41'), (5175, 1448, 'k54'), (5176, 1355, 'k67'), (5177, 1262, 'k80'), (5178, 1169, 'k93'), (5179, 1076, 'k9'), (5180, 983, 'k22'), (5181, 890, 'k35'), (5182, 797, 'k48'), (5183, 704, 'k61'), (5184, 611, 'k74'), (5185, 518, 'k87'), (5186, 425, 'k3'), (5187, 332, 'k16'), (5188, 239, 'k29'), (5189, 146, 'k42'), (5190, 53, 'k55'), (5191, 1963, 'k68'), (5192, 1870, 'k81'), (5193, 1777, 'k94'), (5194, 1684, 'k10'), (5195, 1591, 'k23'), (5196, 1498, 'k36'), (5197, 1405, 'k49'), (5198, 1312, 'k62'), (5199, 1219, 'k75'), (5200, 1126, 'k88'), (5201, 1033, 'k4'), (5202, 940, 'k17'), (5203, 847, 'k30'), (5204, 754, 'k43'), (5205, 661, 'k56'), (5206, 568, 'k69'), (5207, 475, 'k82'), (5208, 382, 'k95'), (5209, 289, 'k11'), (5210, 196, 'k24'), (5211, 103, 'k37'), (5212, 10, 'k50'), (5213, 1920, 'k63'), (5214, 1827, 'k76'), (5215, 1734, 'k89'), (5216, 1641, 'k5'), (5217, 1548, 'k18'), (5218, 1455, 'k31'), (5219, 1362, 'k44'), (5220, 1269, 'k57'), (5221, 1176, 'k70'), (5222, 1083, 'k83'), (5223, 990, 'k96'), (5224, 897, 'k12'), (5225, 804, 'k25'), (5226, 711, 'k38'), (5227, 618, 'k51'), (5228, 525, 'k64'), (5229, 432, 'k77'), (5230, 339, 'k90'), (5231, 246, 'k6'), (5232, 153, 'k19'), (5233, 60, 'k32'), (5234, 1970, 'k45'), (5235, 1877, 'k58'), (5236, 1784, 'k71'), (5237, 1691, 'k84'), (5238, 1598, 'k0'), (5239, 1505, 'k13'), (5240, 1412, 'k26'), (5241, 1319, 'k39'), (5242, 1226, 'k52'), (5243, 1133, 'k65'), (5244, 1040, 'k78'), (5245, 947, 'k91'), (5246, 854, 'k7'), (5247, 761, 'k20'), (5248, 668, 'k33'), (5249, 575, 'k46'), (5250, 482, 'k59'), (5251, 389, 'k72'), (5252, 296, 'k85'), (5253, 203, 'k1'), (5254, 110, 'k14'), (5255, 17, 'k27'), (5256, 1927, 'k40'), (5257, 1834, 'k53'), (5258, 1741, 'k66'), (5259, 1648, 'k79'), (5260, 1555, 'k92'), (5261, 1462, 'k8'), (5262, 1369, 'k21'), (5263, 1276, 'k34'), (5264, 1183, 'k47'), (5265, 1090, 'k60'), (5266, 997, 'k73'), (5267, 904, 'k86'), (5268, 811, 'k2'), (5269, 718, 'k15'), (5270, 625, 'k28'), (5271, 532, 'k41'), (5272, 439, 'k54'), (5273, 346, 'k67'), (5274, 253, 'k80'), (5275, 160, 'k93'), (5276, 67, 'k9'), (5277, 1977, 'k22'), (5278, 1884, 'k35'), (5279, 1791, 'k48'), (5280, 1698, 'k61'), (5281, 1605, 'k74'), (5282, 1512, 'k87'), (5283, 1419, 'k3'), (5284, 1326, 'k16'), (5285, 1233, 'k29'), (5286, 1140, 'k42'), (5287, 1047, 'k55'), (5288, 954, 'k68'), (5289, 861, 'k81'), (5290, 768, 'k94'), (5291, 675, 'k10'), (5292, 582, 'k23'), (5293, 489, 'k36'), (5294, 396, 'k49'), (5295, 303, 'k62'), (5296, 210, 'k75'), (5297, 117, 'k88'), (5298, 24, 'k4'), (5299, 1934, 'k17'), (5300, 1841, 'k30'), (5301, 1748, 'k43'), (5302, 1655, 'k56'), (5303, 1562, 'k69'), (5304, 1469, 'k82'), (5305, 1376, 'k95'), (5306, 1283, 'k11'), (5307, 1190, 'k24'), (5308, 1097, 'k37'), (5309, 1004, 'k50'), (5310, 911, 'k63'), (5311, 818, 'k76'), (5312, 725, 'k89'), (5313, 632, 'k5'), (5314, 539, 'k18'), (5315, 446, 'k31'), (5316, 353, 'k44'), (5317, 260, 'k57'), (5318, 167, 'k70'), (5319, 74, 'k83'), (5320, 1984, 'k96'), (5321, 1891, 'k12'), (5322, 1798, 'k25'), (5323, 1705, 'k38'), (5324, 1612, 'k51'), (5325, 1519, 'k64'), (5326, 1426, 'k77'), (5327, 1333, 'k90'), (5328, 1240, 'k6'), (5329, 1147, 'k19'), (5330, 1054, 'k32'), (5331, 961, 'k45'), (5332, 868, 'k58'), (5333, 775, 'k71'), (5334, 682, 'k84'), (5335, 589, 'k0'), (5336, 496, 'k13'), (5337, 403, 'k26'), (5338, 310, 'k39'), (5339, 217, 'k52'), (5340, 124, 'k65'), (5341, 31, 'k78'), (5342, 1941, 'k91'), (5343, 1848, 'k7'), (5344, 1755, 'k20'), (5345, 1662, 'k33'), (5346, 1569, 'k46'), (5347, 1476, 'k59'), (5348, 1383, 'k72'), (5349, 1290, 'k85'), (5350, 1197, 'k1'), (5351, 1104, 'k14'), (5352, 1011, 'k27'), (5353, 918, 'k40'), (5354, 825, 'k53'), (5355, 732, 'k66'), (5356, 639, 'k79'), (5357, 546, 'k92'), (5358, 453, 'k8'), (5359, 360, 'k21'), (5360, 267, 'k34'), (5361, 174, 'k47'), (5362, 81, 'k60'), (5363, 1991, 'k73'), (5364, 1898, 'k86'), (5365, 1805, 'k2'), (5366, 1712, 'k15'), (5367, 1619, 'k28'), (5368, 1526, 'k41'), (5369, 1433, 'k54'), (5370, 1340, 'k67'), (5371, 1247, 'k80'), (5372, 1154, 'k93'), (5373, 1061, 'k9'), (5374, 968, 'k22'), (5375, 875, 'k35'), (5376, 782, 'k48'), (5377, 689, 'k61'), (5378, 596, 'k74'), (5379, 503, 'k87'), (5380, 410, 'k3'), (5381, 317, 'k16'), (5382, 224, 'k29'), (5383, 131, 'k42'), (5384, 38, 'k55'), (5385, 1948, 'k68'), (5386, 1855, 'k81'), (5387, 1762, 'k94'), (5388, 1669, 'k10'), (5389, 1576, 'k23'), (5390, 1483, 'k36'), (5391, 1390, 'k49'), (5392, 1297, 'k62'), (5393, 1204, 'k75'), (5394, 1111, 'k88'), (5395, 1018, 'k4'), (5396, 925, 'k17'), (5397, 832, 'k30'), (5398, 739, 'k43'), (5399, 646, 'k56'), (5400, 553, 'k69'), (5401, 460, 'k82'), (5402, 367, 'k95'), (5403, 274, 'k11'), (5404, 181, 'k24'), (5405, 88, 'k37'), (5406, 1998, 'k50'), (5407, 1905, 'k63'), (5408, 1812, 'k76'), (5409, 1719, 'k89'), (5410, 1626, 'k5'), (5411, 1533, 'k18'), (5412, 1440, 'k31'), (5413, 1347, 'k44'), (5414, 1254, 'k57'), (5415, 1161, 'k70'), (5416, 1068, 'k83'), (5417, 975, 'k96'), (5418, 882, 'k12'), (5419, 789, 'k25'), (5420, 696, 'k38'), (5421, 603, 'k51'), (5422, 510, 'k64'), (5423, 417, 'k77'), (5424, 324, 'k90'), (5425, 231, 'k6'), (5426, 138, 'k19'), (5427, 45, 'k32'), (5428, 1955, 'k45'), (5429, 1862, 'k58'), (5430, 1769, 'k71'), (5431, 1676, 'k84'), (5432, 1583, 'k0'), (5433, 1490, 'k13'), (5434, 1397, 'k26'), (5435, 1304, 'k39'), (5436, 1211, 'k52'), (5437, 1118, 'k65'), (5438, 1025, 'k78'), (5439, 932, 'k91'), (5440, 839, 'k7'), (5441, 746, 'k20'), (5442, 653, 'k33'), (5443, 560, 'k46'), (5444, 467, 'k59'), (5445, 374, 'k72'), (5446, 281, 'k85'), (5447, 188, 'k1'), (5448, 95, 'k14'), (5449, 2, 'k27'), (5450, 1912, 'k40'), (5451, 1819, 'k53'), (5452, 1726, 'k66'), (5453, 1633, 'k79'), (5454, 1540, 'k92'), (5455, 1447, 'k8'), (5456, 1354, 'k21'), (5457, 1261, 'k34'), (5458, 1168, 'k47'), (5459, 1075, 'k60'), (5460, 982, 'k73'), (5461, 889, 'k86'), (5462, 796, 'k2'), (5463, 703, 'k15'), (5464, 610, 'k28'), (5465, 517, 'k41'), (5466, 424, 'k54'), (5467, 331, 'k67'), (5468, 238, 'k80'), (5469, 145, 'k93'), (5470, 52, 'k9'), (5471, 1962, 'k22'), (5472, 1869, 'k35'), (5473, 1776, 'k48'), (5474, 1683, 'k61'), (5475, 1590, 'k74'), (5476, 1497, 'k87'), (5477, 1404, 'k3'), (5478, 1311, 'k16'), (5479, 1218, 'k29'), (5480, 1125, 'k42'), (5481, 1032, 'k55'), (5482, 939, 'k68'), (5483, 846, 'k81'), (5484, 753, 'k94'), (5485, 660, 'k10'), (5486, 567, 'k23'), (5487, 474, 'k36'), (5488, 381, 'k49'), (5489, 288, 'k62'), (5490, 195, 'k75'), (5491, 102, 'k88'), (5492, 9, 'k4'), (5493, 1919, 'k17'), (5494, 1826, 'k30'), (5495, 1733, 'k43'), (5496, 1640, 'k56'), (5497, 1547, 'k69'), (5498, 1454, 'k82'), (5499, 1361, 'k95'), (5500, 1268, 'k11'), (5501, 1175, 'k24'), (5502, 1082, 'k37'), (5503, 989, 'k50'), (5504, 896, 'k63'), (5505, 803, 'k76'), (5506, 710, 'k89'), (5507, 617, 'k5'), (5508, 524, 'k18'), (5509, 431, 'k31'), (5510, 338, 'k44'), (5511, 245, 'k57'), (5512, 152, 'k70'), (5513, 59, 'k83'), (5514, 1969, 'k96'), (5515, 1876, 'k12'), (5516, 1783, 'k25'), (5517, 1690, 'k38'), (5518, 1597, 'k51'), (5519, 1504, 'k64'), (5520, 1411, 'k77'), (5521, 1318, 'k90'), (5522, 1225, 'k6'), (5523, 1132, 'k19'), (5524, 1039, 'k32'), (5525, 946, 'k45'), (5526, 853, 'k58'), (5527, 760, 'k71'), (5528, 667, 'k84'), (5529, 574, 'k0'), (5530, 481, 'k13'), (5531, 388, 'k26'), (5532, 295, 'k39'), (5533, 202, 'k52'), (5534, 109, 'k65'), (5535, 16, 'k78'), (5536, 1926, 'k91'), (5537, 1833, 'k7'), (5538, 1740, 'k20'), (5539, 1647, 'k33'), (5540, 1554, 'k46'), (5541, 1461, 'k59'), (5542, 1368, 'k72'), (5543, 1275, 'k85'), (5544, 1182, 'k1'), (5545, 1089, 'k14'), (5546, 996, 'k27'), (5547, 903, 'k40'), (5548, 810, 'k53'), (5549, 717, 'k66'), (5550, 624, 'k79'), (5551, 531, 'k92'), (5552, 438, 'k8'), (5553, 345, 'k21'), (5554, 252, 'k34'), (5555, 159, 'k47'), (5556, 66, 'k60'), (5557, 1976, 'k73'), (5558, 1883, 'k86'), (5559, 1790, 'k2'), (5560, 1697, 'k15'), (5561, 1604, 'k28'), (5562, 1511, 'k41'), (5563, 1418, 'k54'), (5564, 1325, 'k67'), (5565, 1232, 'k80'), (5566, 1139, 'k93'), (5567, 1046, 'k9'), (5568, 953, 'k22'), (5569, 860, 'k35'), (5570, 767, 'k48'), (5571, 674, 'k61'), (5572, 581, 'k74'), (5573, 488, 'k87'), (5574, 395, 'k3'), (5575, 302, 'k16'), (5576, 209, 'k29'), (5577, 116, 'k42'), (5578, 23, 'k55'), (5579, 1933, 'k68'), (5580, 1840, 'k81'), (5581, 1747, 'k94'), (5582, 1654, 'k10'), (5583, 1561, 'k23'), (5584, 1468, 'k36'), (5585, 1375, 'k49'), (5586, 1282, 'k62'), (5587, 1189, 'k75'), (5588, 1096, 'k88'), (5589, 1003, 'k4'), (5590, 910, 'k17'), (5591, 817, 'k30'), (5592, 724, 'k43'), (5593, 631, 'k56'), (5594, 538, 'k69'), (5595, 445, 'k82'), (5596, 352, 'k95'), (5597, 259, 'k11'), (5598, 166, 'k24'), (5599, 73, 'k37'), (5600, 1983, 'k50'), (5601, 1890, 'k63'), (5602, 1797, 'k76'), (5603, 1704, 'k89'), (5604, 1611, 'k5'), (5605, 1518, 'k18'), (5606, 1425, 'k31'), (5607, 1332, 'k44'), (5608, 1239, 'k57'), (5609, 1146, 'k70'), (5610, 1053, 'k83'), (5611, 960, 'k96'), (5612, 867, 'k12'), (5613, 774, 'k25'), (5614, 681, 'k38'), (5615, 588, 'k51'), (5616, 495, 'k64'), (5617, 402, 'k77'), (5618, 309, 'k90'), (5619, 216, 'k6'), (5620, 123, 'k19'), (5621, 30, 'k32'), (5622, 1940, 'k45'), (5623, 1847, 'k58'), (5624, 1754, 'k71'), (5625, 1661, 'k84'), (5626, 1568, 'k0'), (5627, 1475, 'k13'), (5628, 1382, 'k26'), (5629, 1289, 'k39'), (5630, 1196, 'k52'), (5631, 1103, 'k65'), (5632, 1010, 'k78'), (5633, 917, 'k91'), (5634, 824, 'k7'), (5635, 731, 'k20'), (5636, 638, 'k33'), (5637, 545, 'k46'), (5638, 452, 'k59'), (5639, 359, 'k72'), (5640, 266, 'k85'), (5641, 173, 'k1'), (5642, 80, 'k14'), (5643, 1990, 'k27'), (5644, 1897, 'k40'), (5645, 1804, 'k53'), (5646, 1711, 'k66'), (5647, 1618, 'k79'), (5648, 1525, 'k92'), (5649, 1432, 'k8'), (5650, 1339, 'k21'), (5651, 1246, 'k34'), (5652, 1153, 'k47'), (5653, 1060, 'k60'), (5654, 967, 'k73'), (5655, 874, 'k86'), (5656, 781, 'k2'), (5657, 688, 'k15'), (5658, 595, 'k28'), (5659, 502, 'k41'), (5660, 409, 'k54'), (5661, 316, 'k67'), (5662, 223, 'k80'), (5663, 130, 'k93'), (5664, 37, 'k9'), (5665, 1947, 'k22'), (5666, 1854, 'k35'), (5667, 1761, 'k48'), (5668, 1668, 'k61'), (5669, 1575, 'k74'), (5670, 1482, 'k87'), (5671, 1389, 'k3'), (5672, 1296, 'k16'), (5673, 1203, 'k29'), (5674, 1110, 'k42'), (5675, 1017, 'k55'), (5676, 924, 'k68'), (5677, 831, 'k81'), (5678, 738, 'k94'), (5679, 645, 'k10'), (5680, 552, 'k23'), (5681, 459, 'k36'), (5682, 366, 'k49'), (5683, 273, 'k62'), (5684, 180, 'k75'), (5685, 87, 'k88'), (5686, 1997, 'k4'), (5687, 1904, 'k17'), (5688, 1811, 'k30'), (5689, 1718, 'k43'), (5690, 1625, 'k56'), (5691, 1532, 'k69'), (5692, 1439, 'k82'), (5693, 1346, 'k95'), (5694, 1253, 'k11'), (5695, 1160, 'k24'), (5696, 1067, 'k37'), (5697, 974, 'k50'), (5698, 881, 'k63'), (5699, 788, 'k76'), (5700, 695, 'k89'), (5701, 602, 'k5'), (5702, 509, 'k18'), (5703, 416, 'k31'), (5704, 323, 'k44'), (5705, 230, 'k57'), (5706, 137, 'k70'), (5707, 44, 'k83'), (5708, 1954, 'k96'), (5709, 1861, 'k12'), (5710, 1768, 'k25'), (5711, 1675, 'k38'), (5712, 1582, 'k51'), (5713, 1489, 'k64'), (5714, 1396, 'k77'), (5715, 1303, 'k90'), (5716, 1210, 'k6'), (5717, 1117, 'k19'), (5718, 1024, 'k32'), (5719, 931, 'k45'), (5720, 838, 'k58'), (5721, 745, 'k71'), (5722, 652, 'k84'), (5723, 559, 'k0'), (5724, 466, 'k13'), (5725, 373, 'k26'), (5726, 280, 'k39'), (5727, 187, 'k52'), (5728, 94, 'k65'), (5729, 1, 'k78'), (5730, 1911, 'k91'), (5731, 1818, 'k7'), (5732, 1725, 'k20'), (5733, 1632, 'k33'), (5734, 1539, 'k46'), (5735, 1446, 'k59'), (5736, 1353, 'k72'), (5737, 1260, 'k85'), (5738, 1167, 'k1'), (5739, 1074, 'k14'), (5740, 981, 'k27'), (5741, 888, 'k40'), (5742, 795, 'k53'), (5743, 702, 'k66'), (5744, 609, 'k79'), (5745, 516, 'k92'), (5746, 423, 'k8'), (5747, 330, 'k21'), (5748, 237, 'k34'), (5749, 144, 'k47'), (5750, 51, 'k60'), (5751, 1961, 'k73'), (5752, 1868, 'k86'), (5753, 1775, 'k2'), (5754, 1682, 'k15'), (5755, 1589, 'k28'), (5756, 1496, 'k41'), (5757, 1403, 'k54'), (5758, 1310, 'k67'), (5759, 1217, 'k80'), (5760, 1124, 'k93'), (5761, 1031, 'k9'), (5762, 938, 'k22'), (5763, 845, 'k35'), (5764, 752, 'k48'), (5765, 659, 'k61'), (5766, 566, 'k74'), (5767, 473, 'k87'), (5768, 380, 'k3'), (5769, 287, 'k16'), (5770, 194, 'k29'), (5771, 101, 'k42'), (5772, 8, 'k55'), (5773, 1918, 'k68'), (5774, 1825, 'k81'), (5775, 1732, 'k94'), (5776, 1639, 'k10'), (5777, 1546, 'k23'), (5778, 1453, 'k36'), (5779, 1360, 'k49'), (5780, 1267, 'k62'), (5781, 1174, 'k75'), (5782, 1081, 'k88'), (5783, 988, 'k4'), (5784, 895, 'k17'), (5785, 802, 'k30'), (5786, 709, 'k43'), (5787, 616, 'k56'), (5788, 523, 'k69'), (5789, 430, 'k82'), (5790, 337, 'k95'), (5791, 244, 'k11'), (5792, 151, 'k24'), (5793, 58, 'k37'), (5794, 1968, 'k50'), (5795, 1875, 'k63'), (5796, 1782, 'k76'), (5797, 1689, 'k89'), (5798, 1596, 'k5'), (5799, 1503, 'k18'), (5800, 1410, 'k31'), (5801, 1317, 'k44'), (5802, 1224, 'k57'), (5803, 1131, 'k70'), (5804, 1038, 'k83'), (5805, 945, 'k96'), (5806, 852, 'k12'), (5807, 759, 'k25'), (5808, 666, 'k38'), (5809, 573, 'k51'), (5810, 480, 'k64'), (5811, 387, 'k77'), (5812, 294, 'k90'), (5813, 201, 'k6'), (5814, 108, 'k19'), (5815, 15, 'k32'), (5816, 1925, 'k45'), (5817, 1832, 'k58'), (5818, 1739, 'k71'), (5819, 1646, 'k84'), (5820, 1553, 'k0'), (5821, 1460, 'k13'), (5822, 1367, 'k26'), (5823, 1274, 'k39'), (5824, 1181, 'k52'), (5825, 1088, 'k65'), (5826, 995, 'k78'), (5827, 902, 'k91'), (5828, 809, 'k7'), (5829, 716, 'k20'), (5830, 623, 'k33'), (5831, 530, 'k46'), (5832, 437, 'k59'), (5833, 344, 'k72'), (5834, 251, 'k85'), (5835, 158, 'k1'), (5836, 65, 'k14'), (5837, 1975, 'k27'), (5838, 1882, 'k40'), (5839, 1789, 'k53'), (5840, 1696, 'k66'), (5841, 1603, 'k79'), (5842, 1510, 'k92'), (5843, 1417, 'k8'), (5844, 1324, 'k21'), (5845, 1231, 'k34'), (5846, 1138, 'k47'), (5847, 1045, 'k60'), (5848, 952, 'k73'), (5849, 859, 'k86'), (5850, 766, 'k2'), (5851, 673, 'k15'), (5852, 580, 'k28'), (5853, 487, 'k41'), (5854, 394, 'k54'), (5855, 301, 'k67'), (5856, 208, 'k80'), (5857, 115, 'k93'), (5858, 22, 'k9'), (5859, 1932, 'k22'), (5860, 1839, 'k35'), (5861, 1746, 'k48'), (5862, 1653, 'k61'), (5863, 1560, 'k74'), (5864, 1467, 'k87'), (5865, 1374, 'k3'), (5866, 1281, 'k16'), (5867, 1188, 'k29'), (5868, 1095, 'k42'), (5869, 1002, 'k55'), (5870, 909, 'k68'), (5871, 816, 'k81'), (5872, 723, 'k94'), (5873, 630, 'k10'), (5874, 537, 'k23'), (5875, 444, 'k36'), (5876, 351, 'k49'), (5877, 258, 'k62'), (5878, 165, 'k75'), (5879, 72, 'k88'), (5880, 1982, 'k4'), (5881, 1889, 'k17'), (5882, 1796, 'k30'), (5883, 1703, 'k43'), (5884, 1610, 'k56'), (5885, 1517, 'k69'), (5886, 1424, 'k82'), (5887, 1331, 'k95'), (5888, 1238, 'k11'), (5889, 1145, 'k24'), (5890, 1052, 'k37'), (5891, 959, 'k50'), (5892, 866, 'k63'), (5893, 773, 'k76'), (5894, 680, 'k89'), (5895, 587, 'k5'), (5896, 494, 'k18'), (5897, 401, 'k31'), (5898, 308, 'k44'), (5899, 215, 'k57'), (5900, 122, 'k70'), (5901, 29, 'k83'), (5902, 1939, 'k96'), (5903, 1846, 'k12'), (5904, 1753, 'k25'), (5905, 1660, 'k38'), (5906, 1567, 'k51'), (5907, 1474, 'k64'), (5908, 1381, 'k77'), (5909, 1288, 'k90'), (5910, 1195, 'k6'), (5911, 1102, 'k19'), (5912, 1009, 'k32'), (5913, 916, 'k45'), (5914, 823, 'k58'), (5915, 730, 'k71'), (5916, 637, 'k84'), (5917, 544, 'k0'), (5918, 451, 'k13'), (5919, 358, 'k26'), (5920, 265, 'k39'), (5921, 172, 'k52'), (5922, 79, 'k65'), (5923, 1989, 'k78'), (5924, 1896, 'k91'), (5925, 1803, 'k7'), (5926, 1710, 'k20'), (5927, 1617, 'k33'), (5928, 1524, 'k46'), (5929, 1431, 'k59'), (5930, 1338, 'k72'), (5931, 1245, 'k85'), (5932, 1152, 'k1'), (5933, 1059, 'k14'), (5934, 966, 'k27'), (5935, 873, 'k40'), (5936, 780, 'k53'), (5937, 687, 'k66'), (5938, 594, 'k79'), (5939, 501, 'k92'), (5940, 408, 'k8'), (5941, 315, 'k21'), (5942, 222, 'k34'), (5943, 129, 'k47'), (5944, 36, 'k60'), (5945, 1946, 'k73'), (5946, 1853, 'k86'), (5947, 1760, 'k2'), (5948, 1667, 'k15'), (5949, 1574, 'k28'), (5950, 1481, 'k41'), (5951, 1388, 'k54'), (5952, 1295, 'k67'), (5953, 1202, 'k80'), (5954, 1109, 'k93'), (5955, 1016, 'k9'), (5956, 923, 'k22'), (5957, 830, 'k35'), (5958, 737, 'k48'), (5959, 644, 'k61'), (5960, 551, 'k74'), (5961, 458, 'k87'), (5962, 365, 'k3'), (5963, 272, 'k16'), (5964, 179, 'k29'), (5965, 86, 'k42'), (5966, 1996, 'k55'), (5967, 1903, 'k68'), (5968, 1810, 'k81'), (5969, 1717, 'k94'), (5970, 1624, 'k10'), (5971, 1531, 'k23'), (5972, 1438, 'k36'), (5973, 1345, 'k49'), (5974, 1252, 'k62'), (5975, 1159, 'k75'), (5976, 1066, 'k88'), (5977, 973, 'k4'), (5978, 880, 'k17'), (5979, 787, 'k30'), (5980, 694, 'k43'), (5981, 601, 'k56'), (5982, 508, 'k69'), (5983, 415, 'k82'), (5984, 322, 'k95'), (5985, 229, 'k11'), (5986, 136, 'k24'), (5987, 43, 'k37'), (5988, 1953, 'k50'), (5989, 1860, 'k63'), (5990, 1767, 'k76'), (5991, 1674, 'k89'), (5992, 1581, 'k5'), (5993, 1488, 'k18'), (5994, 1395, 'k31'), (5995, 1302, 'k44'), (5996, 1209, 'k57'), (5997, 1116, 'k70'), (5998, 1023, 'k83'), (5999, 930, 'k96'), (6000, 837, 'k12'), (6001, 744, 'k25'), (6002, 651, 'k38'), (6003, 558, 'k51'), (6004, 465, 'k64'), (6005, 372, 'k77'), (6006, 279, 'k90'), (6007, 186, 'k6'), (6008, 93, 'k19'), (6009, 0, 'k32'), (6010, 1910, 'k45'), (6011, 1817, 'k58'), (6012, 1724, 'k71'), (6013, 1631, 'k84'), (6014, 1538, 'k0'), (6015, 1445, 'k13'), (6016, 1352, 'k26'), (6017, 1259, 'k39'), (6018, 1166, 'k52'), (6019, 1073, 'k65'), (6020, 980, 'k78'), (6021, 887, 'k91'), (6022, 794, 'k7'), (6023, 701, 'k20'), (6024, 608, 'k33'), (6025, 515, 'k46'), (6026, 422, 'k59'), (6027, 329, 'k72'), (6028, 236, 'k85'), (6029, 143, 'k1'), (6030, 50, 'k14'), (6031, 1960, 'k27'), (6032, 1867, 'k40'), (6033, 1774, 'k53'), (6034, 1681, 'k66'), (6035, 1588, 'k79'), (6036, 1495, 'k92'), (6037, 1402, 'k8'), (6038, 1309, 'k21'), (6039, 1216, 'k34'), (6040, 1123, 'k47'), (6041, 1030, 'k60'), (6042, 937, 'k73'), (6043, 844, 'k86'), (6044, 751, 'k2'), (6045, 658, 'k15'), (6046, 565, 'k28'), (6047, 472, 'k41'), (6048, 379, 'k54'), (6049, 286, 'k67'), (6050, 193, 'k80'), (6051, 100, 'k93'), (6052, 7, 'k9'), (6053, 1917, 'k22'), (6054, 1824, 'k35'), (6055, 1731, 'k48'), (6056, 1638, 'k61'), (6057, 1545, 'k74'), (6058, 1452, 'k87'), (6059, 1359, 'k3'), (6060, 1266, 'k16'), (6061, 1173, 'k29'), (6062, 1080, 'k42'), (6063, 987, 'k55'), (6064, 894, 'k68'), (6065, 801, 'k81'), (6066, 708, 'k94'), (6067, 615, 'k10'), (6068, 522, 'k23'), (6069, 429, 'k36'), (6070, 336, 'k49'), (6071, 243, 'k62'), (6072, 150, 'k75'), (6073, 57, 'k88'), (6074, 1967, 'k4'), (6075, 1874, 'k17'), (6076, 1781, 'k30'), (6077, 1688, 'k43'), (6078, 1595, 'k56'), (6079, 1502, 'k69'), (6080, 1409, 'k82'), (6081, 1316, 'k95'), (6082, 1223, 'k11'), (6083, 1130, 'k24'), (6084, 1037, 'k37'), (6085, 944, 'k50'), (6086, 851, 'k63'), (6087, 758, 'k76'), (6088, 665, 'k89'), (6089, 572, 'k5'), (6090, 479, 'k18'), (6091, 386, 'k31'), (6092, 293, 'k44'), (6093, 200, 'k57'), (6094, 107, 'k70'), (6095, 14, 'k83'), (6096, 1924, 'k96'), (6097, 1831, 'k12'), (6098, 1738, 'k25'), (6099, 1645, 'k38'), (6100, 1552, 'k51'), (6101, 1459, 'k64'), (6102, 1366, 'k77'), (6103, 1273, 'k90'), (6104, 1180, 'k6'), (6105, 1087, 'k19'), (6106, 994, 'k32'), (6107, 901, 'k45'), (6108, 808, 'k58'), (6109, 715, 'k71'), (6110, 622, 'k84'), (6111, 529, 'k0'), (6112, 436, 'k13'), (6113, 343, 'k26'), (6114, 250, 'k39'), (6115, 157, 'k52'), (6116, 64, 'k65'), (6117, 1974, 'k78'), (6118, 1881, 'k91'), (6119, 1788, 'k7'), (6120, 1695, 'k20'), (6121, 1602, 'k33'), (6122, 1509, 'k46'), (6123, 1416, 'k59'), (6124, 1323, 'k72'), (6125, 1230, 'k85'), (6126, 1137, 'k1'), (6127, 1044, 'k14'), (6128, 951, 'k27'), (6129, 858, 'k40'), (6130, 765, 'k53'), (6131, 672, 'k66'), (6132, 579, 'k79'), (6133, 486, 'k92'), (6134, 393, 'k8'), (6135, 300, 'k21'), (6136, 207, 'k34'), (6137, 114, 'k47'), (6138, 21, 'k60'), (6139, 1931, 'k73'), (6140, 1838, 'k86'), (6141, 1745, 'k2'), (6142, 1652, 'k15'), (6143, 1559, 'k28'), (6144, 1466, 'k41'), (6145, 1373, 'k54'), (6146, 1280, 'k67'), (6147, 1187, 'k80'), (6148, 1094, 'k93'), (6149, 1001, 'k9'), (6150, 908, 'k22'), (6151, 815, 'k35'), (6152, 722, 'k48'), (6153, 629, 'k61'), (6154, 536, 'k74'), (6155, 443, 'k87'), (6156, 350, 'k3'), (6157, 257, 'k16'), (6158, 164, 'k29'), (6159, 71, 'k42'), (6160, 1981, 'k55'), (6161, 1888, 'k68'), (6162, 1795, 'k81'), (6163, 1702, 'k94'), (6164, 1609, 'k10'), (6165, 1516, 'k23'), (6166, 1423, 'k36'), (6167, 1330, 'k49'), (6168, 1237, 'k62'), (6169, 1144, 'k75'), (6170, 1051, 'k88'), (6171, 958, 'k4'), (6172, 865, 'k17'), (6173, 772, 'k30'), (6174, 679, 'k43'), (6175, 586, 'k56'), (6176, 493, 'k69'), (6177, 400, 'k82'), (6178, 307, 'k95'), (6179, 214, 'k11'), (6180, 121, 'k24'), (6181, 28, 'k37'), (6182, 1938, 'k50'), (6183, 1845, 'k63'), (6184, 1752, 'k76'), (6185, 1659, 'k89'), (6186, 1566, 'k5'), (6187, 1473, 'k18'), (6188, 1380, 'k31'), (6189, 1287, 'k44'), (6190, 1194, 'k57'), (6191, 1101, 'k70'), (6192, 1008, 'k83'), (6193, 915, 'k96'), (6194, 822, 'k12'), (6195, 729, 'k25'), (6196, 636, 'k38'), (6197, 543, 'k51'), (6198, 450, 'k64'), (6199, 357, 'k77'), (6200, 264, 'k90'), (6201, 171, 'k6'), (6202, 78, 'k19'), (6203, 1988, 'k32'), (6204, 1895, 'k45'), (6205, 1802, 'k58'), (6206, 1709, 'k71'), (6207, 1616, 'k84'), (6208, 1523, 'k0'), (6209, 1430, 'k13'), (6210, 1337, 'k26'), (6211, 1244, 'k39'), (6212, 1151, 'k52'), (6213, 1058, 'k65'), (6214, 965, 'k78'), (6215, 872, 'k91'), (6216, 779, 'k7'), (6217, 686, 'k20'), (6218, 593, 'k33'), (6219, 500, 'k46'), (6220, 407, 'k59'), (6221, 314, 'k72'), (6222, 221, 'k85'), (6223, 128, 'k1'), (6224, 35, 'k14'), (6225, 1945, 'k27'), (6226, 1852, 'k40'), (6227, 1759, 'k53'), (6228, 1666, 'k66'), (6229, 1573, 'k79'), (6230, 1480, 'k92'), (6231, 1387, 'k8'), (6232, 1294, 'k21'), (6233, 1201, 'k34'), (6234, 1108, 'k47'), (6235, 1015, 'k60'), (6236, 922, 'k73'), (6237, 829, 'k86'), (6238, 736, 'k2'), (6239, 643, 'k15'), (6240, 550, 'k28'), (6241, 457, 'k41'), (6242, 364, 'k54'), (6243, 271, 'k67'), (6244, 178, 'k80'), (6245, 85, 'k93'), (6246, 1995, 'k9'), (6247, 1902, 'k22'), (6248, 1809, 'k35'), (6249, 1716, 'k48'), (6250, 1623, 'k61'), (6251, 1530, 'k74'), (6252, 1437, 'k87'), (6253, 1344, 'k3'), (6254, 1251, 'k16'), (6255, 1158, 'k29'), (6256, 1065, 'k42'), (6257, 972, 'k55'), (6258, 879, 'k68'), (6259, 786, 'k81'), (6260, 693, 'k94'), (6261, 600, 'k10'), (6262, 507, 'k23'), (6263, 414, 'k36'), (6264, 321, 'k49'), (6265, 228, 'k62'), (6266, 135, 'k75'), (6267, 42, 'k88'), (6268, 1952, 'k4'), (6269, 1859, 'k17'), (6270, 1766, 'k30'), (6271, 1673, 'k43'), (6272, 1580, 'k56'), (6273, 1487, 'k69'), (6274, 1394, 'k82'), (6275, 1301, 'k95'), (6276, 1208, 'k11'), (6277, 1115, 'k24'), (6278, 1022, 'k37'), (6279, 929, 'k50'), (6280, 836, 'k63'), (6281, 743, 'k76'), (6282, 650, 'k89'), (6283, 557, 'k5'), (6284, 464, 'k18'), (6285, 371, 'k31'), (6286, 278, 'k44'), (6287, 185, 'k57'), (6288, 92, 'k70'), (6289, 2002, 'k83'), (6290, 1909, 'k96'), (6291, 1816, 'k12'), (6292, 1723, 'k25'), (6293, 1630, 'k38'), (6294, 1537, 'k51'), (6295, 1444, 'k64'), (6296, 1351, 'k77'), (6297, 1258, 'k90'), (6298, 1165, 'k6'), (6299, 1072, 'k19'), (6300, 979, 'k32'), (6301, 886, 'k45'), (6302, 793, 'k58'), (6303, 700, 'k71'), (6304, 607, 'k84'), (6305, 514, 'k0'), (6306, 421, 'k13'), (6307, 328, 'k26'), (6308, 235, 'k39'), (6309, 142, 'k52'), (6310, 49, 'k65'), (6311, 1959, 'k78'), (6312, 1866, 'k91'), (6313, 1773, 'k7'), (6314, 1680, 'k20'), (6315, 1587, 'k33'), (6316, 1494, 'k46'), (6317, 1401, 'k59'), (6318, 1308, 'k72'), (6319, 1215, 'k85'), (6320, 1122, 'k1'), (6321, 1029, 'k14'), (6322, 936, 'k27'), (6323, 843, 'k40'), (6324, 750, 'k53'), (6325, 657, 'k66'), (6326, 564, 'k79'), (6327, 471, 'k92'), (6328, 378, 'k8'), (6329, 285, 'k21'), (6330, 192, 'k34'), (6331, 99, 'k47'), (6332, 6, 'k60'), (6333, 1916, 'k73'), (6334, 1823, 'k86'), (6335, 1730, 'k2'), (6336, 1637, 'k15'), (6337, 1544, 'k28'), (6338, 1451, 'k41'), (6339, 1358, 'k54'), (6340, 1265, 'k67'), (6341, 1172, 'k80'), (6342, 1079, 'k93'), (6343, 986, 'k9'), (6344, 893, 'k22'), (6345, 800, 'k35'), (6346, 707, 'k48'), (6347, 614, 'k61'), (6348, 521, 'k74'), (6349, 428, 'k87'), (6350, 335, 'k3'), (6351, 242, 'k16'), (6352, 149, 'k29'), (6353, 56, 'k42'), (6354, 1966, 'k55'), (6355, 1873, 'k68'), (6356, 1780, 'k81'), (6357, 1687, 'k94'), (6358, 1594, 'k10'), (6359, 1501, 'k23'), (6360, 1408, 'k36'), (6361, 1315, 'k49'), (6362, 1222, 'k62'), (6363, 1129, 'k75'), (6364, 1036, 'k88'), (6365, 943, 'k4'), (6366, 850, 'k17'), (6367, 757, 'k30'), (6368, 664, 'k43'), (6369, 571, 'k56'), (6370, 478, 'k69'), (6371, 385, 'k82'), (6372, 292, 'k95'), (6373, 199, 'k11'), (6374, 106, 'k24'), (6375, 13, 'k37'), (6376, 1923, 'k50'), (6377, 1830, 'k63'), (6378, 1737, 'k76'), (6379, 1644, 'k89'), (6380, 1551, 'k5'), (6381, 1458, 'k18'), (6382, 1365, 'k31'), (6383, 1272, 'k44'), (6384, 1179, 'k57'), (6385, 1086, 'k70'), (6386, 993, 'k83'), (6387, 900, 'k96'), (6388, 807, 'k12'), (6389, 714, 'k25'), (6390, 621, 'k38'), (6391, 528, 'k51'), (6392, 435, 'k64'), (6393, 342, 'k77'), (6394, 249, 'k90'), (6395, 156, 'k6'), (6396, 63, 'k19'), (6397, 1973, 'k32'), (6398, 1880, 'k45'), (6399, 1787, 'k58'), (6400, 1694, 'k71'), (6401, 1601, 'k84'), (6402, 1508, 'k0'), (6403, 1415, 'k13'), (6404, 1322, 'k26'), (6405, 1229, 'k39'), (6406, 1136, 'k52'), (6407, 1043, 'k65'), (6408, 950, 'k78'), (6409, 857, 'k91'), (6410, 764, 'k7'), (6411, 671, 'k20'), (6412, 578, 'k33'), (6413, 485, 'k46'), (6414, 392, 'k59'), (6415, 299, 'k72'), (6416, 206, 'k85'), (6417, 113, 'k1'), (6418, 20, 'k14'), (6419, 1930, 'k27'), (6420, 1837, 'k40'), (6421, 1744, 'k53'), (6422, 1651, 'k66'), (6423, 1558, 'k79'), (6424, 1465, 'k92'), (6425, 1372, 'k8'), (6426, 1279, 'k21'), (6427, 1186, 'k34'), (6428, 1093, 'k47'), (6429, 1000, 'k60'), (6430, 907, 'k73'), (6431, 814, 'k86'), (6432, 721, 'k2'), (6433, 628, 'k15'), (6434, 535, 'k28'), (6435, 442, 'k41'), (6436, 349, 'k54'), (6437, 256, 'k67'), (6438, 163, 'k80'), (6439, 70, 'k93'), (6440, 1980, 'k9'), (6441, 1887, 'k22'), (6442, 1794, 'k35'), (6443, 1701, 'k48'), (6444, 1608, 'k61'), (6445, 1515, 'k74'), (6446, 1422, 'k87'), (6447, 1329, 'k3'), (6448, 1236, 'k16'), (6449, 1143, 'k29'), (6450, 1050, 'k42'), (6451, 957, 'k55'), (6452, 864, 'k68'), (6453, 771, 'k81'), (6454, 678, 'k94'), (6455, 585, 'k10'), (6456, 492, 'k23'), (6457, 399, 'k36'), (6458, 306, 'k49'), (6459, 213, 'k62'), (6460, 120, 'k75'), (6461, 27, 'k88'), (6462, 1937, 'k4'), (6463, 1844, 'k17'), (6464, 1751, 'k30'), (6465, 1658, 'k43'), (6466, 1565, 'k56'), (6467, 1472, 'k69'), (6468, 1379, 'k82'), (6469, 1286, 'k95'), (6470, 1193, 'k11'), (6471, 1100, 'k24'), (6472, 1007, 'k37'), (6473, 914, 'k50'), (6474, 821, 'k63'), (6475, 728, 'k76'), (6476, 635, 'k89'), (6477, 542, 'k5'), (6478, 449, 'k18'), (6479, 356, 'k31'), (6480, 263, 'k44'), (6481, 170, 'k57'), (6482, 77, 'k70'), (6483, 1987, 'k83'), (6484, 1894, 'k96'), (6485, 1801, 'k12'), (6486, 1708, 'k25'), (6487, 1615, 'k38'), (6488, 1522, 'k51'), (6489, 1429, 'k64'), (6490, 1336, 'k77'), (6491, 1243, 'k90'), (6492, 1150, 'k6'), (6493, 1057, 'k19'), (6494, 964, 'k32'), (6495, 871, 'k45'), (6496, 778, 'k58'), (6497, 685, 'k71'), (6498, 592, 'k84'), (6499, 499, 'k0'), (6500, 406, 'k13'), (6501, 313, 'k26'), (6502, 220, 'k39'), (6503, 127, 'k52'), (6504, 34, 'k65'), (6505, 1944, 'k78'), (6506, 1851, 'k91'), (6507, 1758, 'k7'), (6508, 1665, 'k20'), (6509, 1572, 'k33'), (6510, 1479, 'k46'), (6511, 1386, 'k59'), (6512, 1293, 'k72'), (6513, 1200, 'k85'), (6514, 1107, 'k1'), (6515, 1014, 'k14'), (6516, 921, 'k27'), (6517, 828, 'k40'), (6518, 735, 'k53'), (6519, 642, 'k66'), (6520, 549, 'k79'), (6521, 456, 'k92'), (6522, 363, 'k8'), (6523, 270, 'k21'), (6524, 177, 'k34'), (6525, 84, 'k47'), (6526, 1994, 'k60'), (6527, 1901, 'k73'), (6528, 1808, 'k86'), (6529, 1715, 'k2'), (6530, 1622, 'k15'), (6531, 1529, 'k28'), (6532, 1436, 'k41'), (6533, 1343, 'k54'), (6534, 1250, 'k67'), (6535, 1157, 'k80'), (6536, 1064, 'k93'), (6537, 971, 'k9'), (6538, 878, 'k22'), (6539, 785, 'k35'), (6540, 692, 'k48'), (6541, 599, 'k61'), (6542, 506, 'k74'), (6543, 413, 'k87'), (6544, 320, 'k3'), (6545, 227, 'k16'), (6546, 134, 'k29'), (6547, 41, 'k42'), (6548, 1951, 'k55'), (6549, 1858, 'k68'), (6550, 1765, 'k81'), (6551, 1672, 'k94'), (6552, 1579, 'k10'), (6553, 1486, 'k23'), (6554, 1393, 'k36'), (6555, 1300, 'k49'), (6556, 1207, 'k62'), (6557, 1114, 'k75'), (6558, 1021, 'k88'), (6559, 928, 'k4'), (6560, 835, 'k17'), (6561, 742, 'k30'), (6562, 649, 'k43'), (6563, 556, 'k56'), (6564, 463, 'k69'), (6565, 370, 'k82'), (6566, 277, 'k95'), (6567, 184, 'k11'), (6568, 91, 'k24'), (6569, 2001, 'k37'), (6570, 1908, 'k50'), (6571, 1815, 'k63'), (6572, 1722, 'k76'), (6573, 1629, 'k89'), (6574, 1536, 'k5'), (6575, 1443, 'k18'), (6576, 1350, 'k31'), (6577, 1257, 'k44'), (6578, 1164, 'k57'), (6579, 1071, 'k70'), (6580, 978, 'k83'), (6581, 885, 'k96'), (6582, 792, 'k12'), (6583, 699, 'k25'), (6584, 606, 'k38'), (6585, 513, 'k51'), (6586, 420, 'k64'), (6587, 327, 'k77'), (6588, 234, 'k90'), (6589, 141, 'k6'), (6590, 48, 'k19'), (6591, 1958, 'k32'), (6592, 1865, 'k45'), (6593, 1772, 'k58'), (6594, 1679, 'k71'), (6595, 1586, 'k84'), (6596, 1493, 'k0'), (6597, 1400, 'k13'), (6598, 1307, 'k26'), (6599, 1214, 'k39'), (6600, 1121, 'k52'), (6601, 1028, 'k65'), (6602, 935, 'k78'), (6603, 842, 'k91'), (6604, 749, 'k7'), (6605, 656, 'k20'), (6606, 563, 'k33'), (6607, 470, 'k46'), (6608, 377, 'k59'), (6609, 284, 'k72'), (6610, 191, 'k85'), (6611, 98, 'k1'), (6612, 5, 'k14'), (6613, 1915, 'k27'), (6614, 1822, 'k40'), (6615, 1729, 'k53'), (6616, 1636, 'k66'), (6617, 1543, 'k79'), (6618, 1450, 'k92'), (6619, 1357, 'k8'), (6620, 1264, 'k21'), (6621, 1171, 'k34'), (6622, 1078, 'k47'), (6623, 985, 'k60'), (6624, 892, 'k73'), (6625, 799, 'k86'), (6626, 706, 'k2'), (6627, 613, 'k15'), (6628, 520, 'k28'), (6629, 427, 'k41'), (6630, 334, 'k54'), (6631, 241, 'k67'), (6632, 148, 'k80'), (6633, 55, 'k93'), (6634, 1965, 'k9'), (6635, 1872, 'k22'), (6636, 1779, 'k35'), (6637, 1686, 'k48'), (6638, 1593, 'k61'), (6639, 1500, 'k74'), (6640, 1407, 'k87'), (6641, 1314, 'k3'), (6642, 1221, 'k16'), (6643, 1128, 'k29'), (6644, 1035, 'k42'), (6645, 942, 'k55'), (6646, 849, 'k68'), (6647, 756, 'k81'), (6648, 663, 'k94'), (6649, 570, 'k10'), (6650, 477, 'k23'), (6651, 384, 'k36'), (6652, 291, 'k49'), (6653, 198, 'k62'), (6654, 105, 'k75'), (6655, 12, 'k88'), (6656, 1922, 'k4'), (6657, 1829, 'k17'), (6658, 1736, 'k30'), (6659, 1643, 'k43'), (6660, 1550, 'k56'), (6661, 1457, 'k69'), (6662, 1364, 'k82'), (6663, 1271, 'k95'), (6664, 1178, 'k11'), (6665, 1085, 'k24'), (6666, 992, 'k37'), (6667, 899, 'k50'), (6668, 806, 'k63'), (6669, 713, 'k76'), (6670, 620, 'k89'), (6671, 527, 'k5'), (6672, 434, 'k18'), (6673, 341, 'k31'), (6674, 248, 'k44'), (6675, 155, 'k57'), (6676, 62, 'k70'), (6677, 1972, 'k83'), (6678, 1879, 'k96'), (6679, 1786, 'k12'), (6680, 1693, 'k25'), (6681, 1600, 'k38'), (6682, 1507, 'k51'), (6683, 1414, 'k64'), (6684, 1321, 'k77'), (6685, 1228, 'k90'), (6686, 1135, 'k6'), (6687, 1042, 'k19'), (6688, 949, 'k32'), (6689, 856, 'k45'), (6690, 763, 'k58'), (6691, 670, 'k71'), (6692, 577, 'k84'), (6693, 484, 'k0'), (6694, 391, 'k13'), (6695, 298, 'k26'), (6696, 205, 'k39'), (6697, 112, 'k52'), (6698, 19, 'k65'), (6699, 1929, 'k78'), (6700, 1836, 'k91'), (6701, 1743, 'k7'), (6702, 1650, 'k20'), (6703, 1557, 'k33'), (6704, 1464, 'k46'), (6705, 1371, 'k59'), (6706, 1278, 'k72'), (6707, 1185, 'k85'), (6708, 1092, 'k1'), (6709, 999, 'k14'), (6710, 906, 'k27'), (6711, 813, 'k40'), (6712, 720, 'k53'), (6713, 627, 'k66'), (6714, 534, 'k79'), (6715, 441, 'k92'), (6716, 348, 'k8'), (6717, 255, 'k21'), (6718, 162, 'k34'), (6719, 69, 'k47'), (6720, 1979, 'k60'), (6721, 1886, 'k73'), (6722, 1793, 'k86'), (6723, 1700, 'k2'), (6724, 1607, 'k15'), (6725, 1514, 'k28'), (6726, 1421, 'k41'), (6727, 1328, 'k54'), (6728, 1235, 'k67'), (6729, 1142, 'k80'), (6730, 1049, 'k93'), (6731, 956, 'k9'), (6732, 863, 'k22'), (6733, 770, 'k35'), (6734, 677, 'k48'), (6735, 584, 'k61'), (6736, 491, 'k74'), (6737, 398, 'k87'), (6738, 305, 'k3'), (6739, 212, 'k16'), (6740, 119, 'k29'), (6741, 26, 'k42'), (6742, 1936, 'k55'), (6743, 1843, 'k68'), (6744, 1750, 'k81'), (6745, 1657, 'k94'), (6746, 1564, 'k10'), (6747, 1471, 'k23'), (6748, 1378, 'k36'), (6749, 1285, 'k49'), (6750, 1192, 'k62'), (6751, 1099, 'k75'), (6752, 1006, 'k88'), (6753, 913, 'k4'), (6754, 820, 'k17'), (6755, 727, 'k30'), (6756, 634, 'k43'), (6757, 541, 'k56'), (6758, 448, 'k69'), (6759, 355, 'k82'), (6760, 262, 'k95'), (6761, 169, 'k11'), (6762, 76, 'k24'), (6763, 1986, 'k37'), (6764, 1893, 'k50'), (6765, 1800, 'k63'), (6766, 1707, 'k76'), (6767, 1614, 'k89'), (6768, 1521, 'k5'), (6769, 1428, 'k18'), (6770, 1335, 'k31'), (6771, 1242, 'k44'), (6772, 1149, 'k57'), (6773, 1056, 'k70'), (6774, 963, 'k83'), (6775, 870, 'k96'), (6776, 777, 'k12'), (6777, 684, 'k25'), (6778, 591, 'k38'), (6779, 498, 'k51'), (6780, 405, 'k64'), (6781, 312, 'k77'), (6782, 219, 'k90'), (6783, 126, 'k6'), (6784, 33, 'k19'), (6785, 1943, 'k32'), (6786, 1850, 'k45'), (6787, 1757, 'k58'), (6788, 1664, 'k71'), (6789, 1571, 'k84'), (6790, 1478, 'k0'), (6791, 1385, 'k13'), (6792, 1292, 'k26'), (6793, 1199, 'k39'), (6794, 1106, 'k52'), (6795, 1013, 'k65'), (6796, 920, 'k78'), (6797, 827, 'k91'), (6798, 734, 'k7'), (6799, 641, 'k20'), (6800, 548, 'k33'), (6801, 455, 'k46'), (6802, 362, 'k59'), (6803, 269, 'k72'), (6804, 176, 'k85'), (6805, 83, 'k1'), (6806, 1993, 'k14'), (6807, 1900, 'k27'), (6808, 1807, 'k40'), (6809, 1714, 'k53'), (6810, 1621, 'k66'), (6811, 1528, 'k79'), (6812, 1435, 'k92'), (6813, 1342, 'k8'), (6814, 1249, 'k21'), (6815, 1156, 'k34'), (6816, 1063, 'k47'), (6817, 970, 'k60'), (6818, 877, 'k73'), (6819, 784, 'k86'), (6820, 691, 'k2'), (6821, 598, 'k15'), (6822, 505, 'k28'), (6823, 412, 'k41'), (6824, 319, 'k54'), (6825, 226, 'k67'), (6826, 133, 'k80'), (6827, 40, 'k93'), (6828, 1950, 'k9'), (6829, 1857, 'k22'), (6830, 1764, 'k35'), (6831, 1671, 'k48'), (6832, 1578, 'k61'), (6833, 1485, 'k74'), (6834, 1392, 'k87'), (6835, 1299, 'k3'), (6836, 1206, 'k16'), (6837, 1113, 'k29'), (6838, 1020, 'k42'), (6839, 927, 'k55'), (6840, 834, 'k68'), (6841, 741, 'k81'), (6842, 648, 'k94'), (6843, 555, 'k10'), (6844, 462, 'k23'), (6845, 369, 'k36'), (6846, 276, 'k49'), (6847, 183, 'k62'), (6848, 90, 'k75'), (6849, 2000, 'k88'), (6850, 1907, 'k4'), (6851, 1814, 'k17'), (6852, 1721, 'k30'), (6853, 1628, 'k43'), (6854, 1535, 'k56'), (6855, 1442, 'k69'), (6856, 1349, 'k82'), (6857, 1256, 'k95'), (6858, 1163, 'k11'), (6859, 1070, 'k24'), (6860, 977, 'k37'), (6861, 884, 'k50'), (6862, 791, 'k63'), (6863, 698, 'k76'), (6864, 605, 'k89'), (6865, 512, 'k5'), (6866, 419, 'k18'), (6867, 326, 'k31'), (6868, 233, 'k44'), (6869, 140, 'k57'), (6870, 47, 'k70'), (6871, 1957, 'k83'), (6872, 1864, 'k96'), (6873, 1771, 'k12'), (6874, 1678, 'k25'), (6875, 1585, 'k38'), (6876, 1492, 'k51'), (6877, 1399, 'k64'), (6878, 1306, 'k77'), (6879, 1213, 'k90'), (6880, 1120, 'k6'), (6881, 1027, 'k19'), (6882, 934, 'k32'), (6883, 841, 'k45'), (6884, 748, 'k58'), (6885, 655, 'k71'), (6886, 562, 'k84'), (6887, 469, 'k0'), (6888, 376, 'k13'), (6889, 283, 'k26'), (6890, 190, 'k39'), (6891, 97, 'k52'), (6892, 4, 'k65'), (6893, 1914, 'k78'), (6894, 1821, 'k91'), (6895, 1728, 'k7'), (6896, 1635, 'k20'), (6897, 1542, 'k33'), (6898, 1449, 'k46'), (6899, 1356, 'k59'), (6900, 1263, 'k72'), (6901, 1170, 'k85'), (6902, 1077, 'k1'), (6903, 984, 'k14'), (6904, 891, 'k27'), (6905, 798, 'k40'), (6906, 705, 'k53'), (6907, 612, 'k66'), (6908, 519, 'k79'), (6909, 426, 'k92'), (6910, 333, 'k8'), (6911, 240, 'k21'), (6912, 147, 'k34'), (6913, 54, 'k47'), (6914, 1964, 'k60'), (6915, 1871, 'k73'), (6916, 1778, 'k86'), (6917, 1685, 'k2'), (6918, 1592, 'k15'), (6919, 1499, 'k28'), (6920, 1406, 'k41'), (6921, 1313, 'k54'), (6922, 1220, 'k67'), (6923, 1127, 'k80'), (6924, 1034, 'k93'), (6925, 941, 'k9'), (6926, 848, 'k22'), (6927, 755, 'k35'), (6928, 662, 'k48'), (6929, 569, 'k61'), (6930, 476, 'k74'), (6931, 383, 'k87'), (6932, 290, 'k3'), (6933, 197, 'k16'), (6934, 104, 'k29'), (6935, 11, 'k42'), (6936, 1921, 'k55'), (6937, 1828, 'k68'), (6938, 1735, 'k81'), (6939, 1642, 'k94'), (6940, 1549, 'k10'), (6941, 1456, 'k23'), (6942, 1363, 'k36'), (6943, 1270, 'k49'), (6944, 1177, 'k62'), (6945, 1084, 'k75'), (6946, 991, 'k88'), (6947, 898, 'k4'), (6948, 805, 'k17'), (6949, 712, 'k30'), (6950, 619, 'k43'), (6951, 526, 'k56'), (6952, 433, 'k69'), (6953, 340, 'k82'), (6954, 247, 'k95'), (6955, 154, 'k11'), (6956, 61, 'k24'), (6957, 1971, 'k37'), (6958, 1878, 'k50'), (6959, 1785, 'k63'), (6960, 1692, 'k76'), (6961, 1599, 'k89'), (6962, 1506, 'k5'), (6963, 1413, 'k18'), (6964, 1320, 'k31'), (6965, 1227, 'k44'), (6966, 1134, 'k57'), (6967, 1041, 'k70'), (6968, 948, 'k83'), (6969, 855, 'k96'), (6970, 762, 'k12'), (6971, 669, 'k25'), (6972, 576, 'k38'), (6973, 483, 'k51'), (6974, 390, 'k64'), (6975, 297, 'k77'), (6976, 204, 'k90'), (6977, 111, 'k6'), (6978, 18, 'k19'), (6979, 1928, 'k32'), (6980, 1835, 'k45'), (6981, 1742, 'k58'), (6982, 1649, 'k71'), (6983, 1556, 'k84'), (6984, 1463, 'k0'), (6985, 1370, 'k13'), (6986, 1277, 'k26'), (6987, 1184, 'k39'), (6988, 1091, 'k52'), (6989, 998, 'k65'), (6990, 905, 'k78'), (6991, 812, 'k91'), (6992, 719, 'k7'), (6993, 626, 'k20'), (6994, 533, 'k33'), (6995, 440, 'k46'), (6996, 347, 'k59'), (6997, 254, 'k72'), (6998, 161, 'k85'), (6999, 68, 'k1'), (7000, 1978, 'k14'), (7001, 1885, 'k27'), (7002, 1792, 'k40'), (7003, 1699, 'k53'), (7004, 1606, 'k66'), (7005, 1513, 'k79'), (7006, 1420, 'k92'), (7007, 1327, 'k8'), (7008, 1234, 'k21'), (7009, 1141, 'k34'), (7010, 1048, 'k47'), (7011, 955, 'k60'), (7012, 862, 'k73'), (7013, 769, 'k86'), (7014, 676, 'k2'), (7015, 583, 'k15'), (7016, 490, 'k28'), (7017, 397, 'k41'), (7018, 304, 'k54'), (7019, 211, 'k67'), (7020, 118, 'k80'), (7021, 25, 'k93'), (7022, 1935, 'k9'), (7023, 1842, 'k22'), (7024, 1749, 'k35'), (7025, 1656, 'k48'), (7026, 1563, 'k61'), (7027, 1470, 'k74'), (7028, 1377, 'k87'), (7029, 1284, 'k3'), (7030, 1191, 'k16'), (7031, 1098, 'k29'), (7032, 1005, 'k42'), (7033, 912, 'k55'), (7034, 819, 'k68'), (7035, 726, 'k81'), (7036, 633, 'k94'), (7037, 540, 'k10'), (7038, 447, 'k23'), (7039, 354, 'k36'), (7040, 261, 'k49'), (7041, 168, 'k62'), (7042, 75, 'k75'), (7043, 1985, 'k88'), (7044, 1892, 'k4'), (7045, 1799, 'k17'), (7046, 1706, 'k30'), (7047, 1613, 'k43'), (7048, 1520, 'k56'), (7049, 1427, 'k69'), (7050, 1334, 'k82'), (7051, 1241, 'k95'), (7052, 1148, 'k11'), (7053, 1055, 'k24'), (7054, 962, 'k37'), (7055, 869, 'k50'), (7056, 776, 'k63'), (7057, 683, 'k76'), (7058, 590, 'k89'), (7059, 497, 'k5'), (7060, 404, 'k18'), (7061, 311, 'k31'), (7062, 218, 'k44'), (7063, 125, 'k57'), (7064, 32, 'k70'), (7065, 1942, 'k83'), (7066, 1849, 'k96'), (7067, 1756, 'k12'), (7068, 1663, 'k25'), (7069, 1570, 'k38'), (7070, 1477, 'k51'), (7071, 1384, 'k64'), (7072, 1291, 'k77'), (7073, 1198, 'k90'), (7074, 1105, 'k6'), (7075, 1012, 'k19'), (7076, 919, 'k32'), (7077, 826, 'k45'), (7078, 733, 'k58'), (7079, 640, 'k71'), (7080, 547, 'k84'), (7081, 454, 'k0'), (7082, 361, 'k13'), (7083, 268, 'k26'), (7084, 175, 'k39'), (7085, 82, 'k52'), (7086, 1992, 'k65'), (7087, 1899, 'k78'), (7088, 1806, 'k91'), (7089, 1713, 'k7'), (7090, 1620, 'k20'), (7091, 1527, 'k33'), (7092, 1434, 'k46'), (7093, 1341, 'k59'), (7094, 1248, 'k72'), (7095, 1155, 'k85'), (7096, 1062, 'k1'), (7097, 969, 'k14'), (7098, 876, 'k27'), (7099, 783, 'k40'), (7100, 690, 'k53'), (7101, 597, 'k66'), (7102, 504, 'k79'), (7103, 411, 'k92'), (7104, 318, 'k8'), (7105, 225, 'k21'), (7106, 132, 'k34'), (7107, 39, 'k47'), (7108, 1949, 'k60'), (7109, 1856, 'k73'), (7110, 1763, 'k86'), (7111, 1670, 'k2'), (7112, 1577, 'k15'), (7113, 1484, 'k28'), (7114, 1391, 'k41'), (7115, 1298, 'k54'), (7116, 1205, 'k67'), (7117, 1112, 'k80'), (7118, 1019, 'k93'), (7119, 926, 'k9'), (7120, 833, 'k22'), (7121, 740, 'k35'), (7122, 647, 'k48'), (7123, 554, 'k61'), (7124, 461, 'k74'), (7125, 368, 'k87'), (7126, 275, 'k3'), (7127, 182, 'k16'), (7128, 89, 'k29'), (7129, 1999, 'k42'), (7130, 1906, 'k55'), (7131, 1813, 'k68'), (7132, 1720, 'k81'), (7133, 1627, 'k94'), (7134, 1534, 'k10'), (7135, 1441, 'k23'), (7136, 1348, 'k36'), (7137, 1255, 'k49'), (7138, 1162, 'k62'), (7139, 1069, 'k75'), (7140, 976, 'k88'), (7141, 883, 'k4'), (7142, 790, 'k17'), (7143, 697, 'k30'), (7144, 604, 'k43'), (7145, 511, 'k56'), (7146, 418, 'k69'), (7147, 325, 'k82'), (7148, 232, 'k95'), (7149, 139, 'k11'), (7150, 46, 'k24'), (7151, 1956, 'k37'), (7152, 1863, 'k50'), (7153, 1770, 'k63'), (7154, 1677, 'k76'), (7155, 1584, 'k89'), (7156, 1491, 'k5'), (7157, 1398, 'k18'), (7158, 1305, 'k31'), (7159, 1212, 'k44'), (7160, 1119, 'k57'), (7161, 1026, 'k70'), (7162, 933, 'k83'), (7163, 840, 'k96'), (7164, 747, 'k12'), (7165, 654, 'k25'), (7166, 561, 'k38'), (7167, 468, 'k51'), (7168, 375, 'k64'), (7169, 282, 'k77'), (7170, 189, 'k90'), (7171, 96, 'k6'), (7172, 3, 'k19'), (7173, 1913, 'k32'), (7174, 1820, 'k45'), (7175, 1727, 'k58'), (7176, 1634, 'k71'), (7177, 1541, 'k84'), (7178, 1448, 'k0'), (7179, 1355, 'k13'), (7180, 1262, 'k26'), (7181, 1169, 'k39'), (7182, 1076, 'k52'), (7183, 983, 'k65'), (7184, 890, 'k78'), (7185, 797, 'k91'), (7186, 704, 'k7'), (7187, 611, 'k20'), (7188, 518, 'k33'), (7189, 425, 'k46'), (7190, 332, 'k59'), (7191, 239, 'k72'), (7192, 146, 'k85'), (7193, 53, 'k1'), (7194, 1963, 'k14'), (7195, 1870, 'k27'), (7196, 1777, 'k40'), (7197, 1684, 'k53'), (7198, 1591, 'k66'), (7199, 1498, 'k79'), (7200, 1405, 'k92'), (7201, 1312, 'k8'), (7202, 1219, 'k21'), (7203, 1126, 'k34'), (7204, 1033, 'k47'), (7205, 940, 'k60'), (7206, 847, 'k73'), (7207, 754, 'k86'), (7208, 661, 'k2'), (7209, 568, 'k15'), (7210, 475, 'k28'), (7211, 382, 'k41'), (7212, 289, 'k54'), (7213, 196, 'k67'), (7214, 103, 'k80'), (7215, 10, 'k93'), (7216, 1920, 'k9'), (7217, 1827, 'k22'), (7218, 1734, 'k35'), (7219, 1641, 'k48'), (7220, 1548, 'k61'), (7221, 1455, 'k74'), (7222, 1362, 'k87'), (7223, 1269, 'k3'), (7224, 1176, 'k16'), (7225, 1083, 'k29'), (7226, 990, 'k42'), (7227, 897, 'k55'), (7228, 804, 'k68'), (7229, 711, 'k81'), (7230, 618, 'k94'), (7231, 525, 'k10'), (7232, 432, 'k23'), (7233, 339, 'k36'), (7234, 246, 'k49'), (7235, 153, 'k62'), (7236, 60, 'k75'), (7237, 1970, 'k88'), (7238, 1877, 'k4'), (7239, 1784, 'k17'), (7240, 1691, 'k30'), (7241, 1598, 'k43'), (7242, 1505, 'k56'), (7243, 1412, 'k69'), (7244, 1319, 'k82'), (7245, 1226, 'k95'), (7246, 1133, 'k11'), (7247, 1040, 'k24'), (7248, 947, 'k37'), (7249, 854, 'k50'), (7250, 761, 'k63'), (7251, 668, 'k76'), (7252, 575, 'k89'), (7253, 482, 'k5'), (7254, 389, 'k18'), (7255, 296, 'k31'), (7256, 203, 'k44'), (7257, 110, 'k57'), (7258, 17, 'k70'), (7259, 1927, 'k83'), (7260, 1834, 'k96'), (7261, 1741, 'k12'), (7262, 1648, 'k25'), (7263, 1555, 'k38'), (7264, 1462, 'k51'), (7265, 1369, 'k64'), (7266, 1276, 'k77'), (7267, 1183, 'k90'), (7268, 1090, 'k6'), (7269, 997, 'k19'), (7270, 904, 'k32'), (7271, 811, 'k45'), (7272, 718, 'k58'), (7273, 625, 'k71'), (7274, 532, 'k84'), (7275, 439, 'k0'), (7276, 346, 'k13'), (7277, 253, 'k26'), (7278, 160, 'k39'), (7279, 67, 'k52'), (7280, 1977, 'k65'), (7281, 1884, 'k78'), (7282, 1791, 'k91'), (7283, 1698, 'k7'), (7284, 1605, 'k20'), (7285, 1512, 'k33'), (7286, 1419, 'k46'), (7287, 1326, 'k59'), (7288, 1233, 'k72'), (7289, 1140, 'k85'), (7290, 1047, 'k1'), (7291, 954, 'k14'), (7292, 861, 'k27'), (7293, 768, 'k40'), (7294, 675, 'k53'), (7295, 582, 'k66'), (7296, 489, 'k79'), (7297, 396, 'k92'), (7298, 303, 'k8'), (7299, 210, 'k21'), (7300, 117, 'k34'), (7301, 24, 'k47'), (7302, 1934, 'k60'), (7303, 1841, 'k73'), (7304, 1748, 'k86'), (7305, 1655, 'k2'), (7306, 1562, 'k15'), (7307, 1469, 'k28'), (7308, 1376, 'k41'), (7309, 1283, 'k54'), (7310, 1190, 'k67'), (7311, 1097, 'k80'), (7312, 1004, 'k93'), (7313, 911, 'k9'), (7314, 818, 'k22'), (7315, 725, 'k35'), (7316, 632, 'k48'), (7317, 539, 'k61'), (7318, 446, 'k74'), (7319, 353, 'k87'), (7320, 260, 'k3'), (7321, 167, 'k16'), (7322, 74, 'k29'), (7323, 1984, 'k42'), (7324, 1891, 'k55'), (7325, 1798, 'k68'), (7326, 1705, 'k81'), (7327, 1612, 'k94'), (7328, 1519, 'k10'), (7329, 1426, 'k23'), (7330, 1333, 'k36'), (7331, 1240, 'k49'), (7332, 1147, 'k62'), (7333, 1054, 'k75'), (7334, 961, 'k88'), (7335, 868, 'k4'), (7336, 775, 'k17'), (7337, 682, 'k30'), (7338, 589, 'k43'), (7339, 496, 'k56'), (7340, 403, 'k69'), (7341, 310, 'k82'), (7342, 217, 'k95'), (7343, 124, 'k11'), (7344, 31, 'k24'), (7345, 1941, 'k37'), (7346, 1848, 'k50'), (7347, 1755, 'k63'), (7348, 1662, 'k76'), (7349, 1569, 'k89'), (7350, 1476, 'k5'), (7351, 1383, 'k18'), (7352, 1290, 'k31'), (7353, 1197, 'k44'), (7354, 1104, 'k57'), (7355, 1011, 'k70'), (7356, 918, 'k83'), (7357, 825, 'k96'), (7358, 732, 'k12'), (7359, 639, 'k25'), (7360, 546, 'k38'), (7361, 453, 'k51'), (7362, 360, 'k64'), (7363, 267, 'k77'), (7364, 174, 'k90'), (7365, 81, 'k6'), (7366, 1991, 'k19'), (7367, 1898, 'k32'), (7368, 1805, 'k45'), (7369, 1712, 'k58'), (7370, 1619, 'k71'), (7371, 1526, 'k84'), (7372, 1433, 'k0'), (7373, 1340, 'k13'), (7374, 1247, 'k26'), (7375, 1154, 'k39'), (7376, 1061, 'k52'), (7377, 968, 'k65'), (7378, 875, 'k78'), (7379, 782, 'k91'), (7380, 689, 'k7'), (7381, 596, 'k20'), (7382, 503, 'k33'), (7383, 410, 'k46'), (7384, 317, 'k59'), (7385, 224, 'k72'), (7386, 131, 'k85'), (7387, 38, 'k1'), (7388, 1948, 'k14'), (7389, 1855, 'k27'), (7390, 1762, 'k40'), (7391, 1669, 'k53'), (7392, 1576, 'k66'), (7393, 1483, 'k79'), (7394, 1390, 'k92'), (7395, 1297, 'k8'), (7396, 1204, 'k21'), (7397, 1111, 'k34'), (7398, 1018, 'k47'), (7399, 925, 'k60'), (7400, 832, 'k73'), (7401, 739, 'k86'), (7402, 646, 'k2'), (7403, 553, 'k15'), (7404, 460, 'k28'), (7405, 367, 'k41'), (7406, 274, 'k54'), (7407, 181, 'k67'), (7408, 88, 'k80'), (7409, 1998, 'k93'), (7410, 1905, 'k9'), (7411, 1812, 'k22'), (7412, 1719, 'k35'), (7413, 1626, 'k48'), (7414, 1533, 'k61'), (7415, 1440, 'k74'), (7416, 1347, 'k87'), (7417, 1254, 'k3'), (7418, 1161, 'k16'), (7419, 1068, 'k29'), (7420, 975, 'k42'), (7421, 882, 'k55'), (7422, 789, 'k68'), (7423, 696, 'k81'), (7424, 603, 'k94'), (7425, 510, 'k10'), (7426, 417, 'k23'), (7427, 324, 'k36'), (7428, 231, 'k49'), (7429, 138, 'k62'), (7430, 45, 'k75'), (7431, 1955, 'k88'), (7432, 1862, 'k4'), (7433, 1769, 'k17'), (7434, 1676, 'k30'), (7435, 1583, 'k43'), (7436, 1490, 'k56'), (7437, 1397, 'k69'), (7438, 1304, 'k82'), (7439, 1211, 'k95'), (7440, 1118, 'k11'), (7441, 1025, 'k24'), (7442, 932, 'k37'), (7443, 839, 'k50'), (7444, 746, 'k63'), (7445, 653, 'k76'), (7446, 560, 'k89'), (7447, 467, 'k5'), (7448, 374, 'k18'), (7449, 281, 'k31'), (7450, 188, 'k44'), (7451, 95, 'k57'), (7452, 2, 'k70'), (7453, 1912, 'k83'), (7454, 1819, 'k96'), (7455, 1726, 'k12'), (7456, 1633, 'k25'), (7457, 1540, 'k38'), (7458, 1447, 'k51'), (7459, 1354, 'k64'), (7460, 1261, 'k77'), (7461, 1168, 'k90'), (7462, 1075, 'k6'), (7463, 982, 'k19'), (7464, 889, 'k32'), (7465, 796, 'k45'), (7466, 703, 'k58'), (7467, 610, 'k71'), (7468, 517, 'k84'), (7469, 424, 'k0'), (7470, 331, 'k13'), (7471, 238, 'k26'), (7472, 145, 'k39'), (7473, 52, 'k52'), (7474, 1962, 'k65'), (7475, 1869, 'k78'), (7476, 1776, 'k91'), (7477, 1683, 'k7'), (7478, 1590, 'k20'), (7479, 1497, 'k33'), (7480, 1404, 'k46'), (7481, 1311, 'k59'), (7482, 1218, 'k72'), (7483, 1125, 'k85'), (7484, 1032, 'k1'), (7485, 939, 'k14'), (7486, 846, 'k27'), (7487, 753, 'k40'), (7488, 660, 'k53'), (7489, 567, 'k66'), (7490, 474, 'k79'), (7491, 381, 'k92'), (7492, 288, 'k8'), (7493, 195, 'k21'), (7494, 102, 'k34'), (7495, 9, 'k47'), (7496, 1919, 'k60'), (7497, 1826, 'k73'), (7498, 1733, 'k86'), (7499, 1640, 'k2'), (7500, 1547, 'k15'), (7501, 1454, 'k28'), (7502, 1361, 'k41'), (7503, 1268, 'k54'), (7504, 1175, 'k67'), (7505, 1082, 'k80'), (7506, 989, 'k93'), (7507, 896, 'k9'), (7508, 803, 'k22'), (7509, 710, 'k35'), (7510, 617, 'k48'), (7511, 524, 'k61'), (7512, 431, 'k74'), (7513, 338, 'k87'), (7514, 245, 'k3'), (7515, 152, 'k16'), (7516, 59, 'k29'), (7517, 1969, 'k42'), (7518, 1876, 'k55'), (7519, 1783, 'k68'), (7520, 1690, 'k81'), (7521, 1597, 'k94'), (7522, 1504, 'k10'), (7523, 1411, 'k23'), (7524, 1318, 'k36'), (7525, 1225, 'k49'), (7526, 1132, 'k62'), (7527, 1039, 'k75'), (7528, 946, 'k88'), (7529, 853, 'k4'), (7530, 760, 'k17'), (7531, 667, 'k30'), (7532, 574, 'k43'), (7533, 481, 'k56'), (7534, 388, 'k69'), (7535, 295, 'k82'), (7536, 202, 'k95'), (7537, 109, 'k11'), (7538, 16, 'k24'), (7539, 1926, 'k37'), (7540, 1833, 'k50'), (7541, 1740, 'k63'), (7542, 1647, 'k76'), (7543, 1554, 'k89'), (7544, 1461, 'k5'), (7545, 1368, 'k18'), (7546, 1275, 'k31'), (7547, 1182, 'k44'), (7548, 1089, 'k57'), (7549, 996, 'k70'), (7550, 903, 'k83'), (7551, 810, 'k96'), (7552, 717, 'k12'), (7553, 624, 'k25'), (7554, 531, 'k38'), (7555, 438, 'k51'), (7556, 345, 'k64'), (7557, 252, 'k77'), (7558, 159, 'k90'), (7559, 66, 'k6'), (7560, 1976, 'k19'), (7561, 1883, 'k32'), (7562, 1790, 'k45'), (7563, 1697, 'k58'), (7564, 1604, 'k71'), (7565, 1511, 'k84'), (7566, 1418, 'k0'), (7567, 1325, 'k13'), (7568, 1232, 'k26'), (7569, 1139, 'k39'), (7570, 1046, 'k52'), (7571, 953, 'k65'), (7572, 860, 'k78'), (7573, 767, 'k91'), (7574, 674, 'k7'), (7575, 581, 'k20'), (7576, 488, 'k33'), (7577, 395, 'k46'), (7578, 302, 'k59'), (7579, 209, 'k72'), (7580, 116, 'k85'), (7581, 23, 'k1'), (7582, 1933, 'k14'), (7583, 1840, 'k27'), (7584, 1747, 'k40'), (7585, 1654, 'k53'), (7586, 1561, 'k66'), (7587, 1468, 'k79'), (7588, 1375, 'k92'), (7589, 1282, 'k8'), (7590, 1189, 'k21'), (7591, 1096, 'k34'), (7592, 1003, 'k47'), (7593, 910, 'k60'), (7594, 817, 'k73'), (7595, 724, 'k86'), (7596, 631, 'k2'), (7597, 538, 'k15'), (7598, 445, 'k28'), (7599, 352, 'k41'), (7600, 259, 'k54'), (7601, 166, 'k67'), (7602, 73, 'k80'), (7603, 1983, 'k93'), (7604, 1890, 'k9'), (7605, 1797, 'k22'), (7606, 1704, 'k35'), (7607, 1611, 'k48'), (7608, 1518, 'k61'), (7609, 1425, 'k74'), (7610, 1332, 'k87'), (7611, 1239, 'k3'), (7612, 1146, 'k16'), (7613, 1053, 'k29'), (7614, 960, 'k42'), (7615, 867, 'k55'), (7616, 774, 'k68'), (7617, 681, 'k81'), (7618, 588, 'k94'), (7619, 495, 'k10'), (7620, 402, 'k23'), (7621, 309, 'k36'), (7622, 216, 'k49'), (7623, 123, 'k62'), (7624, 30, 'k75'), (7625, 1940, 'k88'), (7626, 1847, 'k4'), (7627, 1754, 'k17'), (7628, 1661, 'k30'), (7629, 1568, 'k43'), (7630, 1475, 'k56'), (7631, 1382, 'k69'), (7632, 1289, 'k82'), (7633, 1196, 'k95'), (7634, 1103, 'k11'), (7635, 1010, 'k24'), (7636, 917, 'k37'), (7637, 824, 'k50'), (7638, 731, 'k63'), (7639, 638, 'k76'), (7640, 545, 'k89'), (7641, 452, 'k5'), (7642, 359, 'k18'), (7643, 266, 'k31'), (7644, 173, 'k44'), (7645, 80, 'k57'), (7646, 1990, 'k70'), (7647, 1897, 'k83'), (7648, 1804, 'k96'), (7649, 1711, 'k12'), (7650, 1618, 'k25'), (7651, 1525, 'k38'), (7652, 1432, 'k51'), (7653, 1339, 'k64'), (7654, 1246, 'k77'), (7655, 1153, 'k90'), (7656, 1060, 'k6'), (7657, 967, 'k19'), (7658, 874, 'k32'), (7659, 781, 'k45'), (7660, 688, 'k58'), (7661, 595, 'k71'), (7662, 502, 'k84'), (7663, 409, 'k0'), (7664, 316, 'k13'), (7665, 223, 'k26'), (7666, 130, 'k39'), (7667, 37, 'k52'), (7668, 1947, 'k65'), (7669, 1854, 'k78'), (7670, 1761, 'k91'), (7671, 1668, 'k7'), (7672, 1575, 'k20'), (7673, 1482, 'k33'), (7674, 1389, 'k46'), (7675, 1296, 'k59'), (7676, 1203, 'k72'), (7677, 1110, 'k85'), (7678, 1017, 'k1'), (7679, 924, 'k14'), (7680, 831, 'k27'), (7681, 738, 'k40'), (7682, 645, 'k53'), (7683, 552, 'k66'), (7684, 459, 'k79'), (7685, 366, 'k92'), (7686, 273, 'k8'), (7687, 180, 'k21'), (7688, 87, 'k34'), (7689, 1997, 'k47'), (7690, 1904, 'k60'), (7691, 1811, 'k73'), (7692, 1718, 'k86'), (7693, 1625, 'k2'), (7694, 1532, 'k15'), (7695, 1439, 'k28'), (7696, 1346, 'k41'), (7697, 1253, 'k54'), (7698, 1160, 'k67'), (7699, 1067, 'k80'), (7700, 974, 'k93'), (7701, 881, 'k9'), (7702, 788, 'k22'), (7703, 695, 'k35'), (7704, 602, 'k48'), (7705, 509, 'k61'), (7706, 416, 'k74'), (7707, 323, 'k87'), (7708, 230, 'k3'), (7709, 137, 'k16'), (7710, 44, 'k29'), (7711, 1954, 'k42'), (7712, 1861, 'k55'), (7713, 1768, 'k68'), (7714, 1675, 'k81'), (7715, 1582, 'k94'), (7716, 1489, 'k10'), (7717, 1396, 'k23'), (7718, 1303, 'k36'), (7719, 1210, 'k49'), (7720, 1117, 'k62'), (7721, 1024, 'k75'), (7722, 931, 'k88'), (7723, 838, 'k4'), (7724, 745, 'k17'), (7725, 652, 'k30'), (7726, 559, 'k43'), (7727, 466, 'k56'), (7728, 373, 'k69'), (7729, 280, 'k82'), (7730, 187, 'k95'), (7731, 94, 'k11'), (7732, 1, 'k24'), (7733, 1911, 'k37'), (7734, 1818, 'k50'), (7735, 1725, 'k63'), (7736, 1632, 'k76'), (7737, 1539, 'k89'), (7738, 1446, 'k5'), (7739, 1353, 'k18'), (7740, 1260, 'k31'), (7741, 1167, 'k44'), (7742, 1074, 'k57'), (7743, 981, 'k70'), (7744, 888, 'k83'), (7745, 795, 'k96'), (7746, 702, 'k12'), (7747, 609, 'k25'), (7748, 516, 'k38'), (7749, 423, 'k51'), (7750, 330, 'k64'), (7751, 237, 'k77'), (7752, 144, 'k90'), (7753, 51, 'k6'), (7754, 1961, 'k19'), (7755, 1868, 'k32'), (7756, 1775, 'k45'), (7757, 1682, 'k58'), (7758, 1589, 'k71'), (7759, 1496, 'k84'), (7760, 1403, 'k0'), (7761, 1310, 'k13'), (7762, 1217, 'k26'), (7763, 1124, 'k39'), (7764, 1031, 'k52'), (7765, 938, 'k65'), (7766, 845, 'k78'), (7767, 752, 'k91'), (7768, 659, 'k7'), (7769, 566, 'k20'), (7770, 473, 'k33'), (7771, 380, 'k46'), (7772, 287, 'k59'), (7773, 194, 'k72'), (7774, 101, 'k85'), (7775, 8, 'k1'), (7776, 1918, 'k14'), (7777, 1825, 'k27'), (7778, 1732, 'k40'), (7779, 1639, 'k53'), (7780, 1546, 'k66'), (7781, 1453, 'k79'), (7782, 1360, 'k92'), (7783, 1267, 'k8'), (7784, 1174, 'k21'), (7785, 1081, 'k34'), (7786, 988, 'k47'), (7787, 895, 'k60'), (7788, 802, 'k73'), (7789, 709, 'k86'), (7790, 616, 'k2'), (7791, 523, 'k15'), (7792, 430, 'k28'), (7793, 337, 'k41'), (7794, 244, 'k54'), (7795, 151, 'k67'), (7796, 58, 'k80'), (7797, 1968, 'k93'), (7798, 1875, 'k9'), (7799, 1782, 'k22'), (7800, 1689, 'k35'), (7801, 1596, 'k48'), (7802, 1503, 'k61'), (7803, 1410, 'k74'), (7804, 1317, 'k87'), (7805, 1224, 'k3'), (7806, 1131, 'k16'), (7807, 1038, 'k29'), (7808, 945, 'k42'), (7809, 852, 'k55'), (7810, 759, 'k68'), (7811, 666, 'k81'), (7812, 573, 'k94'), (7813, 480, 'k10'), (7814, 387, 'k23'), (7815, 294, 'k36'), (7816, 201, 'k49'), (7817, 108, 'k62'), (7818, 15, 'k75'), (7819, 1925, 'k88'), (7820, 1832, 'k4'), (7821, 1739, 'k17'), (7822, 1646, 'k30'), (7823, 1553, 'k43'), (7824, 1460, 'k56'), (7825, 1367, 'k69'), (7826, 1274, 'k82'), (7827, 1181, 'k95'), (7828, 1088, 'k11'), (7829, 995, 'k24'), (7830, 902, 'k37'), (7831, 809, 'k50'), (7832, 716, 'k63'), (7833, 623, 'k76'), (7834, 530, 'k89'), (7835, 437, 'k5'), (7836, 344, 'k18'), (7837, 251, 'k31'), (7838, 158, 'k44'), (7839, 65, 'k57'), (7840, 1975, 'k70'), (7841, 1882, 'k83'), (7842, 1789, 'k96'), (7843, 1696, 'k12'), (7844, 1603, 'k25'), (7845, 1510, 'k38'), (7846, 1417, 'k51'), (7847, 1324, 'k64'), (7848, 1231, 'k77'), (7849, 1138, 'k90'), (7850, 1045, 'k6'), (7851, 952, 'k19'), (7852, 859, 'k32'), (7853, 766, 'k45'), (7854, 673, 'k58'), (7855, 580, 'k71'), (7856, 487, 'k84'), (7857, 394, 'k0'), (7858, 301, 'k13'), (7859, 208, 'k26'), (7860, 115, 'k39'), (7861, 22, 'k52'), (7862, 1932, 'k65'), (7863, 1839, 'k78'), (7864, 1746, 'k91'), (7865, 1653, 'k7'), (7866, 1560, 'k20'), (7867, 1467, 'k33'), (7868, 1374, 'k46'), (7869, 1281, 'k59'), (7870, 1188, 'k72'), (7871, 1095, 'k85'), (7872, 1002, 'k1'), (7873, 909, 'k14'), (7874, 816, 'k27'), (7875, 723, 'k40'), (7876, 630, 'k53'), (7877, 537, 'k66'), (7878, 444, 'k79'), (7879, 351, 'k92'), (7880, 258, 'k8'), (7881, 165, 'k21'), (7882, 72, 'k34'), (7883, 1982, 'k47'), (7884, 1889, 'k60'), (7885, 1796, 'k73'), (7886, 1703, 'k86'), (7887, 1610, 'k2'), (7888, 1517, 'k15'), (7889, 1424, 'k28'), (7890, 1331, 'k41'), (7891, 1238, 'k54'), (7892, 1145, 'k67'), (7893, 1052, 'k80'), (7894, 959, 'k93'), (7895, 866, 'k9'), (7896, 773, 'k22'), (7897, 680, 'k35'), (7898, 587, 'k48'), (7899, 494, 'k61'), (7900, 401, 'k74'), (7901, 308, 'k87'), (7902, 215, 'k3'), (7903, 122, 'k16'), (7904, 29, 'k29'), (7905, 1939, 'k42'), (7906, 1846, 'k55'), (7907, 1753, 'k68'), (7908, 1660, 'k81'), (7909, 1567, 'k94'), (7910, 1474, 'k10'), (7911, 1381, 'k23'), (7912, 1288, 'k36'), (7913, 1195, 'k49'), (7914, 1102, 'k62'), (7915, 1009, 'k75'), (7916, 916, 'k88'), (7917, 823, 'k4'), (7918, 730, 'k17'), (7919, 637, 'k30'), (7920, 544, 'k43'), (7921, 451, 'k56'), (7922, 358, 'k69'), (7923, 265, 'k82'), (7924, 172, 'k95'), (7925, 79, 'k11'), (7926, 1989, 'k24'), (7927, 1896, 'k37'), (7928, 1803, 'k50'), (7929, 1710, 'k63'), (7930, 1617, 'k76'), (7931, 1524, 'k89'), (7932, 1431, 'k5'), (7933, 1338, 'k18'), (7934, 1245, 'k31'), (7935, 1152, 'k44'), (7936, 1059, 'k57'), (7937, 966, 'k70'), (7938, 873, 'k83'), (7939, 780, 'k96'), (7940, 687, 'k12'), (7941, 594, 'k25'), (7942, 501, 'k38'), (7943, 408, 'k51'), (7944, 315, 'k64'), (7945, 222, 'k77'), (7946, 129, 'k90'), (7947, 36, 'k6'), (7948, 1946, 'k19'), (7949, 1853, 'k32'), (7950, 1760, 'k45'), (7951, 1667, 'k58'), (7952, 1574, 'k71'), (7953, 1481, 'k84'), (7954, 1388, 'k0'), (7955, 1295, 'k13'), (7956, 1202, 'k26'), (7957, 1109, 'k39'), (7958, 1016, 'k52'), (7959, 923, 'k65'), (7960, 830, 'k78'), (7961, 737, 'k91'), (7962, 644, 'k7'), (7963, 551, 'k20'), (7964, 458, 'k33'), (7965, 365, 'k46'), (7966, 272, 'k59'), (7967, 179, 'k72'), (7968, 86, 'k85'), (7969, 1996, 'k1'), (7970, 1903, 'k14'), (7971, 1810, 'k27'), (7972, 1717, 'k40'), (7973, 1624, 'k53'), (7974, 1531, 'k66'), (7975, 1438, 'k79'), (7976, 1345, 'k92'), (7977, 1252, 'k8'), (7978, 1159, 'k21'), (7979, 1066, 'k34'), (7980, 973, 'k47'), (7981, 880, 'k60'), (7982, 787, 'k73'), (7983, 694, 'k86'), (7984, 601, 'k2'), (7985, 508, 'k15'), (7986, 415, 'k28'), (7987, 322, 'k41'), (7988, 229, 'k54'), (7989, 136, 'k67'), (7990, 43, 'k80'), (7991, 1953, 'k93'), (7992, 1860, 'k9'), (7993, 1767, 'k22'), (7994, 1674, 'k35'), (7995, 1581, 'k48'), (7996, 1488, 'k61'), (7997, 1395, 'k74'), (7998, 1302, 'k87'), (7999, 1209, 'k3');
+CREATE TABLE S(K INT, G INT);
+INSERT INTO S VALUES (0, 0), (2, 2), (4, 4), (6, 1), (8, 3), (10, 0), (12, 2), (14, 4), (16, 1), (18, 3), (20, 0), (22, 2), (24, 4), (26, 1), (28, 3), (30, 0), (32, 2), (34, 4), (36, 1), (38, 3), (40, 0), (42, 2), (44, 4), (46, 1), (48, 3), (50, 0), (52, 2), (54, 4), (56, 1), (58, 3), (60, 0), (62, 2), (64, 4), (66, 1), (68, 3), (70, 0), (72, 2), (74, 4), (76, 1), (78, 3), (80, 0), (82, 2), (84, 4), (86, 1), (88, 3), (90, 0), (92, 2), (94, 4), (96, 1), (98, 3), (100, 0), (102, 2), (104, 4), (106, 1), (108, 3), (110, 0), (112, 2), (114, 4), (116, 1), (118, 3), (120, 0), (122, 2), (124, 4), (126, 1), (128, 3), (130, 0), (132, 2), (134, 4), (136, 1), (138, 3), (140, 0), (142, 2), (144, 4), (146, 1), (148, 3), (150, 0), (152, 2), (154, 4), (156, 1), (158, 3), (160, 0), (162, 2), (164, 4), (166, 1), (168, 3), (170, 0), (172, 2), (174, 4), (176, 1), (178, 3), (180, 0), (182, 2), (184, 4), (186, 1), (188, 3), (190, 0), (192, 2), (194, 4), (196, 1), (198, 3), (200, 0), (202, 2), (204, 4), (206, 1), (208, 3), (210, 0), (212, 2), (214, 4), (216, 1), (218, 3), (220, 0), (222, 2), (224, 4), (226, 1), (228, 3), (230, 0), (232, 2), (234, 4), (236, 1), (238, 3), (240, 0), (242, 2), (244, 4), (246, 1), (248, 3), (250, 0), (252, 2), (254, 4), (256, 1), (258, 3), (260, 0), (262, 2), (264, 4), (266, 1), (268, 3), (270, 0), (272, 2), (274, 4), (276, 1), (278, 3), (280, 0), (282, 2), (284, 4), (286, 1), (288, 3), (290, 0), (292, 2), (294, 4), (296, 1), (298, 3), (300, 0), (302, 2), (304, 4), (306, 1), (308, 3), (310, 0), (312, 2), (314, 4), (316, 1), (318, 3), (320, 0), (322, 2), (324, 4), (326, 1), (328, 3), (330, 0), (332, 2), (334, 4), (336, 1), (338, 3), (340, 0), (342, 2), (344, 4), (346, 1), (348, 3), (350, 0), (352, 2), (354, 4), (356, 1), (358, 3), (360, 0), (362, 2), (364, 4), (366, 1), (368, 3), (370, 0), (372, 2), (374, 4), (376, 1), (378, 3), (380, 0), (382, 2), (384, 4), (386, 1), (388, 3), (390, 0), (392, 2), (394, 4), (396, 1), (398, 3), (400, 0), (402, 2), (404, 4), (406, 1), (408, 3), (410, 0), (412, 2), (414, 4), (416, 1), (418, 3), (420, 0), (422, 2), (424, 4), (426, 1), (428, 3), (430, 0), (432, 2), (434, 4), (436, 1), (438, 3), (440, 0), (442, 2), (444, 4), (446, 1), (448, 3), (450, 0), (452, 2), (454, 4), (456, 1), (458, 3), (460, 0), (462, 2), (464, 4), (466, 1), (468, 3), (470, 0), (472, 2), (474, 4), (476, 1), (478, 3), (480, 0), (482, 2), (484, 4), (486, 1), (488, 3), (490, 0), (492, 2), (494, 4), (496, 1), (498, 3), (500, 0), (502, 2), (504, 4), (506, 1), (508, 3), (510, 0), (512, 2), (514, 4), (516, 1), (518, 3), (520, 0), (522, 2), (524, 4), (526, 1), (528, 3), (530, 0), (532, 2), (534, 4), (536, 1), (538, 3), (540, 0), (542, 2), (544, 4), (546, 1), (548, 3), (550, 0), (552, 2), (554, 4), (556, 1), (558, 3), (560, 0), (562, 2), (564, 4), (566, 1), (568, 3), (570, 0), (572, 2), (574, 4), (576, 1), (578, 3), (580, 0), (582, 2), (584, 4), (586, 1), (588, 3), (590, 0), (592, 2), (594, 4), (596, 1), (598, 3), (600, 0), (602, 2), (604, 4), (606, 1), (608, 3), (610, 0), (612, 2), (614, 4), (616, 1), (618, 3), (620, 0), (622, 2), (624, 4), (626, 1), (628, 3), (630, 0), (632, 2), (634, 4), (636, 1), (638, 3), (640, 0), (642, 2), (644, 4), (646, 1), (648, 3), (650, 0), (652, 2), (654, 4), (656, 1), (658, 3), (660, 0), (662, 2), (664, 4), (666, 1), (668, 3), (670, 0), (672, 2), (674, 4), (676, 1), (678, 3), (680, 0), (682, 2), (684, 4), (686, 1), (688, 3), (690, 0), (692, 2), (694, 4), (696, 1), (698, 3), (700, 0), (702, 2), (704, 4), (706, 1), (708, 3), (710, 0), (712, 2), (714, 4), (716, 1), (718, 3), (720, 0), (722, 2), (724, 4), (726, 1), (728, 3), (730, 0), (732, 2), (734, 4), (736, 1), (738, 3), (740, 0), (742, 2), (744, 4), (746, 1), (748, 3), (750, 0), (752, 2), (754, 4), (756, 1), (758, 3), (760, 0), (762, 2), (764, 4), (766, 1), (768, 3), (770, 0), (772, 2), (774, 4), (776, 1), (778, 3), (780, 0), (782, 2), (784, 4), (786, 1), (788, 3), (790, 0), (792, 2), (794, 4), (796, 1), (798, 3), (800, 0), (802, 2), (804, 4), (806, 1), (808, 3), (810, 0), (812, 2), (814, 4), (816, 1), (818, 3), (820, 0), (822, 2), (824, 4), (826, 1), (828, 3), (830, 0), (832, 2), (834, 4), (836, 1), (838, 3), (840, 0), (842, 2), (844, 4), (846, 1), (848, 3), (850, 0), (852, 2), (854, 4), (856, 1), (858, 3), (860, 0), (862, 2), (864, 4), (866, 1), (868, 3), (870, 0), (872, 2), (874, 4), (876, 1), (878, 3), (880, 0), (882, 2), (884, 4), (886, 1), (888, 3), (890, 0), (892, 2), (894, 4), (896, 1), (898, 3), (900, 0), (902, 2), (904, 4), (906, 1), (908, 3), (910, 0), (912, 2), (914, 4), (916, 1), (918, 3), (920, 0), (922, 2), (924, 4), (926, 1), (928, 3), (930, 0), (932, 2), (934, 4), (936, 1), (938, 3), (940, 0), (942, 2), (944, 4), (946, 1), (948, 3), (950, 0), (952, 2), (954, 4), (956, 1), (958, 3), (960, 0), (962, 2), (964, 4), (966, 1), (968, 3), (970, 0), (972, 2), (974, 4), (976, 1), (978, 3), (980, 0), (982, 2), (984, 4), (986, 1), (988, 3), (990, 0), (992, 2), (994, 4), (996, 1), (998, 3), (1000, 0), (1002, 2), (1004, 4), (1006, 1), (1008, 3), (1010, 0), (1012, 2), (1014, 4), (1016, 1), (1018, 3), (1020, 0), (1022, 2), (1024, 4), (1026, 1), (1028, 3), (1030, 0), (1032, 2), (1034, 4), (1036, 1), (1038, 3), (1040, 0), (1042, 2), (1044, 4), (1046, 1), (1048, 3), (1050, 0), (1052, 2), (1054, 4), (1056, 1), (1058, 3), (1060, 0), (1062, 2), (1064, 4), (1066, 1), (1068, 3), (1070, 0), (1072, 2), (1074, 4), (1076, 1), (1078, 3), (1080, 0), (1082, 2), (1084, 4), (1086, 1), (1088, 3), (1090, 0), (1092, 2), (1094, 4), (1096, 1), (1098, 3), (1100, 0), (1102, 2), (1104, 4), (1106, 1), (1108, 3), (1110, 0), (1112, 2), (1114, 4), (1116, 1), (1118, 3), (1120, 0), (1122, 2), (1124, 4), (1126, 1), (1128, 3), (1130, 0), (1132, 2), (1134, 4), (1136, 1), (1138, 3), (1140, 0), (1142, 2), (1144, 4), (1146, 1), (1148, 3), (1150, 0), (1152, 2), (1154, 4), (1156, 1), (1158, 3), (1160, 0), (1162, 2), (1164, 4), (1166, 1), (1168, 3), (1170, 0), (1172, 2), (1174, 4), (1176, 1), (1178, 3), (1180, 0), (1182, 2), (1184, 4), (1186, 1), (1188, 3), (1190, 0), (1192, 2), (1194, 4), (1196, 1), (1198, 3), (1200, 0), (1202, 2), (1204, 4), (1206, 1), (1208, 3), (1210, 0), (1212, 2), (1214, 4), (1216, 1), (1218, 3), (1220, 0), (1222, 2), (1224, 4), (1226, 1), (1228, 3), (1230, 0), (1232, 2), (1234, 4), (1236, 1), (1238, 3), (1240, 0), (1242, 2), (1244, 4), (1246, 1), (1248, 3), (1250, 0), (1252, 2), (1254, 4), (1256, 1), (1258, 3), (1260, 0), (1262, 2), (1264, 4), (1266, 1), (1268, 3), (1270, 0), (1272, 2), (1274, 4), (1276, 1), (1278, 3), (1280, 0), (1282, 2), (1284, 4), (1286, 1), (1288, 3), (1290, 0), (1292, 2), (1294, 4), (1296, 1), (1298, 3), (1300, 0), (1302, 2), (1304, 4), (1306, 1), (1308, 3), (1310, 0), (1312, 2), (1314, 4), (1316, 1), (1318, 3), (1320, 0), (1322, 2), (1324, 4), (1326, 1), (1328, 3), (1330, 0), (1332, 2), (1334, 4), (1336, 1), (1338, 3), (1340, 0), (1342, 2), (1344, 4), (1346, 1), (1348, 3), (1350, 0), (1352, 2), (1354, 4), (1356, 1), (1358, 3), (1360, 0), (1362, 2), (1364, 4), (1366, 1), (1368, 3), (1370, 0), (1372, 2), (1374, 4), (1376, 1), (1378, 3), (1380, 0), (1382, 2), (1384, 4), (1386, 1), (1388, 3), (1390, 0), (1392, 2), (1394, 4), (1396, 1), (1398, 3), (1400, 0), (1402, 2), (1404, 4), (1406, 1), (1408, 3), (1410, 0), (1412, 2), (1414, 4), (1416, 1), (1418, 3), (1420, 0), (1422, 2), (1424, 4), (1426, 1), (1428, 3), (1430, 0), (1432, 2), (1434, 4), (1436, 1), (1438, 3), (1440, 0), (1442, 2), (1444, 4), (1446, 1), (1448, 3), (1450, 0), (1452, 2), (1454, 4), (1456, 1), (1458, 3), (1460, 0), (1462, 2), (1464, 4), (1466, 1), (1468, 3), (1470, 0), (1472, 2), (1474, 4), (1476, 1), (1478, 3), (1480, 0), (1482, 2), (1484, 4), (1486, 1), (1488, 3), (1490, 0), (1492, 2), (1494, 4), (1496, 1), (1498, 3), (1500, 0), (1502, 2), (1504, 4), (1506, 1), (1508, 3), (1510, 0), (1512, 2), (1514, 4), (1516, 1), (1518, 3), (1520, 0), (1522, 2), (1524, 4), (1526, 1), (1528, 3), (1530, 0), (1532, 2), (1534, 4), (1536, 1), (1538, 3), (1540, 0), (1542, 2), (1544, 4), (1546, 1), (1548, 3), (1550, 0), (1552, 2), (1554, 4), (1556, 1), (1558, 3), (1560, 0), (1562, 2), (1564, 4), (1566, 1), (1568, 3), (1570, 0), (1572, 2), (1574, 4), (1576, 1), (1578, 3), (1580, 0), (1582, 2), (1584, 4), (1586, 1), (1588, 3), (1590, 0), (1592, 2), (1594, 4), (1596, 1), (1598, 3), (1600, 0), (1602, 2), (1604, 4), (1606, 1), (1608, 3), (1610, 0), (1612, 2), (1614, 4), (1616, 1), (1618, 3), (1620, 0), (1622, 2), (1624, 4), (1626, 1), (1628, 3), (1630, 0), (1632, 2), (1634, 4), (1636, 1), (1638, 3), (1640, 0), (1642, 2), (1644, 4), (1646, 1), (1648, 3), (1650, 0), (1652, 2), (1654, 4), (1656, 1), (1658, 3), (1660, 0), (1662, 2), (1664, 4), (1666, 1), (1668, 3), (1670, 0), (1672, 2), (1674, 4), (1676, 1), (1678, 3), (1680, 0), (1682, 2), (1684, 4), (1686, 1), (1688, 3), (1690, 0), (1692, 2), (1694, 4), (1696, 1), (1698, 3), (1700, 0), (1702, 2), (1704, 4), (1706, 1), (1708, 3), (1710, 0), (1712, 2), (1714, 4), (1716, 1), (1718, 3), (1720, 0), (1722, 2), (1724, 4), (1726, 1), (1728, 3), (1730, 0), (1732, 2), (1734, 4), (1736, 1), (1738, 3), (1740, 0), (1742, 2), (1744, 4), (1746, 1), (1748, 3), (1750, 0), (1752, 2), (1754, 4), (1756, 1), (1758, 3), (1760, 0), (1762, 2), (1764, 4), (1766, 1), (1768, 3), (1770, 0), (1772, 2), (1774, 4), (1776, 1), (1778, 3), (1780, 0), (1782, 2), (1784, 4), (1786, 1), (1788, 3), (1790, 0), (1792, 2), (1794, 4), (1796, 1), (1798, 3), (1800, 0), (1802, 2), (1804, 4), (1806, 1), (1808, 3), (1810, 0), (1812, 2), (1814, 4), (1816, 1), (1818, 3), (1820, 0), (1822, 2), (1824, 4), (1826, 1), (1828, 3), (1830, 0), (1832, 2), (1834, 4), (1836, 1), (1838, 3), (1840, 0), (1842, 2), (1844, 4), (1846, 1), (1848, 3), (1850, 0), (1852, 2), (1854, 4), (1856, 1), (1858, 3), (1860, 0), (1862, 2), (1864, 4), (1866, 1), (1868, 3), (1870, 0), (1872, 2), (1874, 4), (1876, 1), (1878, 3), (1880, 0), (1882, 2), (1884, 4), (1886, 1), (1888, 3), (1890, 0), (1892, 2), (1894, 4), (1896, 1), (1898, 3), (1900, 0), (1902, 2), (1904, 4), (1906, 1), (1908, 3), (1910, 0), (1912, 2), (1914, 4), (1916, 1), (1918, 3), (1920, 0), (1922, 2), (1924, 4), (1926, 1), (1928, 3), (1930, 0), (1932, 2), (1934, 4), (1936, 1), (1938, 3), (1940, 0), (1942, 2), (1944, 4), (1946, 1), (1948, 3), (1950, 0), (1952, 2), (1954, 4), (1956, 1), (1958, 3), (1960, 0), (1962, 2), (1964, 4), (1966, 1), (1968, 3), (1970, 0), (1972, 2), (1974, 4), (1976, 1), (1978, 3), (1980, 0), (1982, 2), (1984, 4), (1986, 1), (1988, 3), (1990, 0), (1992, 2), (1994, 4), (1996, 1), (1998, 3), (2000, 0), (2002, 2);
+SET AUTOCOMMIT OFF;
+SELECT B, COUNT(*), MIN(C) FROM R GROUP BY B;
+SELECT C, COUNT(DISTINCT B) FROM R GROUP BY C;
+SET INDEX_JOIN OFF;
+SET SORT_MERGE_JOIN OFF;
+SELECT S.G, COUNT(*), SUM(R.A) FROM R, S WHERE R.B = S.K GROUP BY S.G;
+SET HASH_JOIN OFF;
+SET SORT_MERGE_JOIN ON;
+SELECT S.G, COUNT(*), SUM(R.A) FROM R, S WHERE R.B = S.K GROUP BY S.G;
+SET HASH_JOIN ON;
+SET INDEX_JOIN ON;
+DELETE FROM R WHERE B < 1000;
+SELECT C, COUNT(DISTINCT B) FROM R GROUP BY C;
+ROLLBACK;
+SET AUTOCOMMIT ON;
+SELECT COUNT(*), COUNT(DISTINCT B) FROM R;
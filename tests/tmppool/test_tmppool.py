@@ -0,0 +1,75 @@
+import pytest
+import subprocess
+import lmdb
+
+from ddb.db import DatabaseManager
+from ddb.session import Session
+from ddb.primitives import ValType
+from ddb.planner import Planner
+from ddb.executor import TmpFilePool
+
+testcase_dir = "tests/tmppool/"
+T = 1
+
+@pytest.fixture
+def session():
+    dbm = DatabaseManager(
+        db_dir = DatabaseManager.DEFAULT_DB_DIR,
+        tmp_dir = DatabaseManager.DEFAULT_TMP_DIR
+    )
+    s = Session(dbm)
+    yield s
+    Planner.options = Planner.Options()
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_tmppool_{t_id}")
+
+def test_pool(session):
+    # released files are emptied and handed out again (for any row type); recycling deletes every file created:
+    subprocess.run(['make', 'clean'], check=True)
+    dbm = session.dbm
+    with dbm.tm.begin_transaction(read_only=False, tmp=True) as tmp_tx:
+        pool = TmpFilePool(dbm.sm, tmp_tx)
+        files = [ pool.acquire([ValType.INTEGER]) for _ in range(3) ]
+        assert len(set(f.name for f in files)) == 3
+        for i, f in enumerate(files):
+            f.batch_append((j, ) for j in range(100 * i))
+        pool.release(files[0])
+        pool.release(files[2])
+        pool.release(files[2]) # releasing again does nothing
+        reused = [ pool.acquire([ValType.VARCHAR, ValType.FLOAT]) for _ in range(2) ]
+        assert set(f.name for f in reused) == { files[0].name, files[2].name }
+        assert all(list(f.iter_scan()) == [] for f in reused)
+        reused[0].put(('x', 1.5))
+        assert list(reused[0].iter_scan()) == [('x', 1.5)]
+        assert pool.num_files_created == 3 and pool.num_files_reused == 2
+        assert pool.acquire([ValType.INTEGER]).name not in set(f.name for f in files)
+        assert pool.num_files_created == 4
+        pool.recycle()
+        for i in range(4):
+            with pytest.raises(lmdb.NotFoundError):
+                dbm.sm.heap_file(tmp_tx, pool._file_name(i), [ValType.INTEGER])
+        pool.release(reused[0]) # releasing after recycling does nothing
+        assert pool.acquire([ValType.INTEGER]).name == pool._file_name(4)
+
+def test_statement_recycles(run, monkeypatch):
+    # a statement that spills reuses files from its pool and leaves none behind:
+    subprocess.run(['make', 'clean'], check=True)
+    for r in run('CREATE TABLE R(A INT, B INT, C VARCHAR);' +
+                 'INSERT INTO R VALUES ' + ', '.join(f"({i}, {i*7919%2003}, 'k{i*13%97}')" for i in range(8000)) + ';'):
+        assert r.error is None, r.error_details
+    pools = list()
+    recycle = TmpFilePool.recycle
+    def checking_recycle(self):
+        recycle(self)
+        pools.append(self)
+        for i in range(self.num_files_created):
+            with pytest.raises(lmdb.NotFoundError):
+                self.sm.heap_file(self.tmp_tx, self._file_name(i), [ValType.INTEGER])
+    monkeypatch.setattr(TmpFilePool, 'recycle', checking_recycle)
+    r, = run('SELECT C, COUNT(DISTINCT B), MIN(A) FROM R GROUP BY C;')
+    assert r.error is None, r.error_details
+    pool, = pools
+    assert pool.num_bytes_spilled > 0
+    assert 0 < pool.num_files_created < pool.num_files_created + pool.num_files_reused
@@ -0,0 +1,80 @@
+SET AUTOCOMMIT OFF;
+CREATE TABLE R(A INT, B FLOAT, C BOOLEAN);
+INSERT INTO R VALUES
+	(10, 0.53, FALSE),
+	(40, 0.36, FALSE),
+	(13, 0.6, TRUE),
+	(32, 0.67, TRUE),
+	(50, 0.0, TRUE),
+	(23, 0.74, FALSE),
+	(4, 0.18, TRUE),
+	(14, 0.88, TRUE),
+	(27, 0.94, FALSE),
+	(39, 0.56, TRUE),
+	(21, 0.69, FALSE),
+	(44, 0.14, FALSE),
+	(1, 0.19, TRUE),
+	(7, 0.02, FALSE),
+	(10, 0.7, FALSE),
+	(25, 0.62, TRUE),
+	(11, 0.85, TRUE),
+	(30, 0.3, TRUE),
+	(49, 0.25, TRUE),
+	(43, 0.84, TRUE),
+	(7, 0.71, FALSE),
+	(35, 0.49, TRUE),
+	(21, 0.18, FALSE),
+	(18, 0.46, FALSE),
+	(32, 0.49, FALSE),
+	(31, 0.49, FALSE),
+	(1, 0.11, TRUE),
+	(45, 0.91, FALSE),
+	(0, 0.62, TRUE),
+	(35, 0.76, TRUE),
+	(36, 0.77, FALSE),
+	(35, 0.79, TRUE),
+	(11, 0.85, TRUE),
+	(40, 0.44, FALSE),
+	(22, 0.97, FALSE),
+	(15, 0.13, TRUE),
+	(4, 0.22, FALSE),
+	(23, 0.2, TRUE),
+	(43, 0.66, TRUE),
+	(26, 0.2, TRUE);
+CREATE TABLE S(D INT);
+INSERT INTO S VALUES
+	(1),
+	(2),
+	(3),
+	(4),
+	(5),
+	(6),
+	(7),
+	(8),
+	(9),
+	(10),
+	(11),
+	(12),
+	(13),
+	(14),
+	(15),
+	(16),
+	(17),
+	(18),
+	(19),
+	(20),
+	(21),
+	(22),
+	(23),
+	(24),
+	(25),
+	(26),
+	(27),
+	(28),
+	(29),
+	(30);
+SELECT A, D, A * D + 1, B * 2.0 FROM R, S WHERE D = 7 AND A % 3 = 1;
+SELECT COUNT(*), SUM(A * D) FROM R, S WHERE B >= 0.25 AND C;
+SELECT A + D, B / 2.0, C FROM R, S WHERE D > 28 AND NOT C AND A / 10 = 3;
+SELECT A, D FROM R, S WHERE A * A - D * D = 0;
+ROLLBACK;
@@ -0,0 +1,38 @@
+SET AUTOCOMMIT OFF;
+CREATE TABLE R(A INT, B INT);
+INSERT INTO R VALUES
+	(381750306833, 29516),
+	(414490689004, 398666),
+	(270050984780, -659648),
+	(75427428586, -78861),
+	(450135257686, 623020),
+	(531465321692, -879559),
+	(317127495131, -890584),
+	(287132767987, 380819),
+	(35604740551, -120138),
+	(185751299117, -172621),
+	(953781030623, -290990),
+	(990614602320, -693576),
+	(167432630235, 564156),
+	(527114771115, -896397),
+	(151407109687, 363673),
+	(527115359797, -940652),
+	(236020603938, 886260),
+	(403032274138, 667693),
+	(967028386236, -226658),
+	(848691360731, -106441),
+	(637735893323, 892865),
+	(527633906448, -354125),
+	(584711672649, 233990),
+	(151509188201, 611149),
+	(11685607481, -198121),
+	(140382289138, 500905),
+	(287863743408, 245050),
+	(705775524571, -476204),
+	(462071222675, -460620),
+	(445315720895, 576296),
+	(9223372036854775807, 2);
+SELECT A * A, B * 3 FROM R WHERE B > 0;
+SELECT A, B FROM R WHERE A * B > 9223372036854775807;
+SELECT A + 1, B FROM R WHERE A > 9000000000000000000;
+ROLLBACK;
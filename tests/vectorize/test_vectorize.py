@@ -0,0 +1,30 @@
+import pytest
+
+from ddb.primitives import ValType, CompiledValExpr
+from ddb.validator import valexpr
+from ddb.validator.valexpr import RelativeColumnRef, LiteralNumber, LiteralBoolean
+from ddb.validator.valexpr.binary import EQ, GT, MULTIPLY
+
+testcase_dir = "tests/vectorize/"
+T = 2
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_vectorize_{t_id}")
+
+def compile_vectorized(e):
+    return CompiledValExpr(valexpr.to_code_str(e, [], ['row0']), valexpr.to_code_str(e, [], ['row0'], backend='numpy'))
+
+def test_float_column_holding_ints():
+    # a FLOAT column may hold Python ints; the first one must not make the whole column integer:
+    rows = [(1, ), (2.5, ), (3, ), (0.5, )]
+    x = RelativeColumnRef(0, 0, ValType.FLOAT)
+    assert compile_vectorized(GT(x, LiteralNumber(2))).filter_batch('row0', rows) == [(2.5, ), (3, )]
+    assert compile_vectorized(MULTIPLY(x, LiteralNumber(2))).eval_batch('row0', rows) == [2, 5.0, 6, 1.0]
+
+def test_column_with_null():
+    # NumPy would turn None into False (or NaN), so such a column must be evaluated row by row:
+    rows = [(True, ), (None, ), (False, )]
+    assert compile_vectorized(EQ(RelativeColumnRef(0, 0, ValType.BOOLEAN), LiteralBoolean(False))).filter_batch('row0', rows) == [(False, )]
+    rows = [(1.5, ), (None, ), (2.0, )]
+    assert compile_vectorized(EQ(RelativeColumnRef(0, 0, ValType.FLOAT), LiteralNumber(2.0))).filter_batch('row0', rows) == [(2.0, )]
@@ -0,0 +1,76 @@
+import pytest
+import datetime
+import subprocess
+
+from ddb.primitives import ValType
+
+# rows read in zero-copy mode are decoded from buffers into LMDB's memory map,
+# which LMDB reuses once the cursor moves on or the transaction ends;
+# the rows must be unaffected when that happens:
+
+ROW_TYPE = [ValType.INTEGER, ValType.VARCHAR, ValType.FLOAT, ValType.DATETIME]
+
+def make_row(i, version=0):
+    return (i, f'v{version}:' + 'x' * (i % 13), i / 4 + version, datetime.datetime(2000 + version, 1, 1 + i % 28))
+
+NUM_ROWS = 300
+
+@pytest.mark.parametrize("compression", [None, 'zlib'])
+def test_heap_file_rows(session, compression):
+    subprocess.run(['make', 'clean'], check=True)
+    assert session.dbm.sm.zero_copy
+    with session.dbm.tm.begin_transaction(read_only=False, tmp=True) as tx:
+        with session.dbm.sm.heap_file(tx, 'rows', ROW_TYPE, create_if_not_exists=True, compression=compression) as h:
+            h.batch_append(make_row(i) for i in range(NUM_ROWS))
+            scan = h.iter_scan(return_row_id=True)
+            first = next(scan)
+            rest = list(scan) # moves the cursor past the first row
+            assert first[1:] == make_row(0)
+            row_ids = [ first[0] ] + [ row_id for row_id, *_ in rest ]
+            rows = [ h.get(row_id) for row_id in row_ids ]
+            batches = list(h.iter_scan_batches())
+            for i, row_id in enumerate(row_ids): # overwrites the pages read
+                h.put(make_row(i, 1), row_id)
+            for row_id in row_ids[::2]:
+                h.delete(row_id)
+            assert first[1:] == make_row(0)
+            assert [ tuple(row) for _, *row in rest ] == [ make_row(i) for i in range(1, NUM_ROWS) ]
+            assert rows == [ make_row(i) for i in range(NUM_ROWS) ]
+            assert [ row for batch in batches for row in batch ] == rows
+    # the transaction is gone, along with its buffers:
+    assert first[1:] == make_row(0)
+    assert rows == [ make_row(i) for i in range(NUM_ROWS) ]
+    assert [ row for batch in batches for row in batch ] == rows
+
+def test_bplus_tree_entries(session):
+    subprocess.run(['make', 'clean'], check=True)
+    with session.dbm.tm.begin_transaction(read_only=False, tmp=True) as tx:
+        with session.dbm.sm.bplus_tree(tx, 'index', ValType.VARCHAR, ROW_TYPE, unique=True, create_if_not_exists=True) as index:
+            index.bulk_load((f'k{i:04}', make_row(i)) for i in range(NUM_ROWS))
+            entries = list(index.iter_scan())
+            batches = list(index.iter_scan_batches(key_lower='k0100'))
+            found = [ index.get_one(f'k{i:04}') for i in range(NUM_ROWS) ]
+            matches = [ list(index.iter_get(f'k{i:04}')) for i in range(0, NUM_ROWS, 7) ]
+            for i in range(NUM_ROWS):
+                index.put(f'k{i:04}', make_row(i, 1))
+            index.delete('k0000')
+            index.delete('k0150')
+    expected = [ (f'k{i:04}', make_row(i)) for i in range(NUM_ROWS) ]
+    assert entries == expected
+    assert [ entry for batch in batches for entry in batch ] == expected[100:]
+    assert found == [ row for _, row in expected ]
+    assert matches == [ [ entry ] for entry in expected[::7] ]
+
+def test_hash_index_entries(session):
+    subprocess.run(['make', 'clean'], check=True)
+    with session.dbm.tm.begin_transaction(read_only=False, tmp=True) as tx:
+        with session.dbm.sm.hash_index(tx, 'hashed', ValType.INTEGER, ROW_TYPE, create_if_not_exists=True) as index:
+            index.bulk_load((i % 50, make_row(i)) for i in range(NUM_ROWS))
+            entries = sorted(index.iter_scan())
+            matches = [ sorted(index.iter_get(key)) for key in range(50) ]
+            for i in range(NUM_ROWS):
+                index.delete(i % 50, make_row(i))
+                index.put(i % 50, make_row(i, 1))
+    expected = sorted((i % 50, make_row(i)) for i in range(NUM_ROWS))
+    assert entries == expected
+    assert matches == [ [ entry for entry in expected if entry[0] == key ] for key in range(50) ]
@@ -0,0 +1,15 @@
+CREATE TABLE R(A INT, B FLOAT, C VARCHAR) WITH (zone_map=on);
+INSERT INTO R VALUES (0, 0.0, 'z00'), (1, 3.7, 'z00'), (2, 7.4, 'z00'), (3, 11.1, 'z00'), (4, 14.8, 'z00'), (5, 18.5, 'z00'), (6, 22.2, 'z00'), (7, 25.9, 'z00'), (8, 29.6, 'z00'), (9, 33.3, 'z00'), (10, 37.0, 'z00'), (11, 40.7, 'z00'), (12, 44.4, 'z00'), (13, 48.1, 'z00'), (14, 51.8, 'z00'), (15, 55.5, 'z00'), (16, 59.2, 'z00'), (17, 62.9, 'z00'), (18, 66.6, 'z00'), (19, 70.3, 'z00'), (20, 74.0, 'z00'), (21, 77.7, 'z00'), (22, 81.4, 'z00'), (23, 85.1, 'z00'), (24, 88.8, 'z00'), (25, 92.5, 'z00'), (26, 96.2, 'z00'), (27, 99.9, 'z00'), (28, 3.6, 'z00'), (29, 7.3, 'z00'), (30, 11.0, 'z00'), (31, 14.7, 'z00'), (32, 18.4, 'z00'), (33, 22.1, 'z00'), (34, 25.8, 'z00'), (35, 29.5, 'z00'), (36, 33.2, 'z00'), (37, 36.9, 'z00'), (38, 40.6, 'z00'), (39, 44.3, 'z00'), (40, 48.0, 'z00'), (41, 51.7, 'z00'), (42, 55.4, 'z00'), (43, 59.1, 'z00'), (44, 62.8, 'z00'), (45, 66.5, 'z00'), (46, 70.2, 'z00'), (47, 73.9, 'z00'), (48, 77.6, 'z00'), (49, 81.3, 'z00'), (50, 85.0, 'z00'), (51, 88.7, 'z00'), (52, 92.4, 'z00'), (53, 96.1, 'z00'), (54, 99.8, 'z00'), (55, 3.5, 'z00'), (56, 7.2, 'z00'), (57, 10.9, 'z00'), (58, 14.6, 'z00'), (59, 18.3, 'z00'), (60, 22.0, 'z00'), (61, 25.7, 'z00'), (62, 29.4, 'z00'), (63, 33.1, 'z00'), (64, 36.8, 'z00'), (65, 40.5, 'z00'), (66, 44.2, 'z00'), (67, 47.9, 'z00'), (68, 51.6, 'z00'), (69, 55.3, 'z00'), (70, 59.0, 'z00'), (71, 62.7, 'z00'), (72, 66.4, 'z00'), (73, 70.1, 'z00'), (74, 73.8, 'z00'), (75, 77.5, 'z00'), (76, 81.2, 'z00'), (77, 84.9, 'z00'), (78, 88.6, 'z00'), (79, 92.3, 'z00'), (80, 96.0, 'z00'), (81, 99.7, 'z00'), (82, 3.4, 'z00'), (83, 7.1, 'z00'), (84, 10.8, 'z00'), (85, 14.5, 'z00'), (86, 18.2, 'z00'), (87, 21.9, 'z00'), (88, 25.6, 'z00'), (89, 29.3, 'z00'), (90, 33.0, 'z00'), (91, 36.7, 'z00'), (92, 40.4, 'z00'), (93, 44.1, 'z00'), (94, 47.8, 'z00'), (95, 51.5, 'z00'), (96, 55.2, 'z00'), (97, 58.9, 'z00'), (98, 62.6, 'z00'), (99, 66.3, 'z00'), (100, 70.0, 'z01'), (101, 73.7, 'z01'), (102, 77.4, 'z01'), (103, 81.1, 'z01'), (104, 84.8, 'z01'), (105, 88.5, 'z01'), (106, 92.2, 'z01'), (107, 95.9, 'z01'), (108, 99.6, 'z01'), (109, 3.3, 'z01'), (110, 7.0, 'z01'), (111, 10.7, 'z01'), (112, 14.4, 'z01'), (113, 18.1, 'z01'), (114, 21.8, 'z01'), (115, 25.5, 'z01'), (116, 29.2, 'z01'), (117, 32.9, 'z01'), (118, 36.6, 'z01'), (119, 40.3, 'z01'), (120, 44.0, 'z01'), (121, 47.7, 'z01'), (122, 51.4, 'z01'), (123, 55.1, 'z01'), (124, 58.8, 'z01'), (125, 62.5, 'z01'), (126, 66.2, 'z01'), (127, 69.9, 'z01'), (128, 73.6, 'z01'), (129, 77.3, 'z01'), (130, 81.0, 'z01'), (131, 84.7, 'z01'), (132, 88.4, 'z01'), (133, 92.1, 'z01'), (134, 95.8, 'z01'), (135, 99.5, 'z01'), (136, 3.2, 'z01'), (137, 6.9, 'z01'), (138, 10.6, 'z01'), (139, 14.3, 'z01'), (140, 18.0, 'z01'), (141, 21.7, 'z01'), (142, 25.4, 'z01'), (143, 29.1, 'z01'), (144, 32.8, 'z01'), (145, 36.5, 'z01'), (146, 40.2, 'z01'), (147, 43.9, 'z01'), (148, 47.6, 'z01'), (149, 51.3, 'z01'), (150, 55.0, 'z01'), (151, 58.7, 'z01'), (152, 62.4, 'z01'), (153, 66.1, 'z01'), (154, 69.8, 'z01'), (155, 73.5, 'z01'), (156, 77.2, 'z01'), (157, 80.9, 'z01'), (158, 84.6, 'z01'), (159, 88.3, 'z01'), (160, 92.0, 'z01'), (161, 95.7, 'z01'), (162, 99.4, 'z01'), (163, 3.1, 'z01'), (164, 6.8, 'z01'), (165, 10.5, 'z01'), (166, 14.2, 'z01'), (167, 17.9, 'z01'), (168, 21.6, 'z01'), (169, 25.3, 'z01'), (170, 29.0, 'z01'), (171, 32.7, 'z01'), (172, 36.4, 'z01'), (173, 40.1, 'z01'), (174, 43.8, 'z01'), (175, 47.5, 'z01'), (176, 51.2, 'z01'), (177, 54.9, 'z01'), (178, 58.6, 'z01'), (179, 62.3, 'z01'), (180, 66.0, 'z01'), (181, 69.7, 'z01'), (182, 73.4, 'z01'), (183, 77.1, 'z01'), (184, 80.8, 'z01'), (185, 84.5, 'z01'), (186, 88.2, 'z01'), (187, 91.9, 'z01'), (188, 95.6, 'z01'), (189, 99.3, 'z01'), (190, 3.0, 'z01'), (191, 6.7, 'z01'), (192, 10.4, 'z01'), (193, 14.1, 'z01'), (194, 17.8, 'z01'), (195, 21.5, 'z01'), (196, 25.2, 'z01'), (197, 28.9, 'z01'), (198, 32.6, 'z01'), (199, 36.3, 'z01'), (200, 40.0, 'z02'), (201, 43.7, 'z02'), (202, 47.4, 'z02'), (203, 51.1, 'z02'), (204, 54.8, 'z02'), (205, 58.5, 'z02'), (206, 62.2, 'z02'), (207, 65.9, 'z02'), (208, 69.6, 'z02'), (209, 73.3, 'z02'), (210, 77.0, 'z02'), (211, 80.7, 'z02'), (212, 84.4, 'z02'), (213, 88.1, 'z02'), (214, 91.8, 'z02'), (215, 95.5, 'z02'), (216, 99.2, 'z02'), (217, 2.9, 'z02'), (218, 6.6, 'z02'), (219, 10.3, 'z02'), (220, 14.0, 'z02'), (221, 17.7, 'z02'), (222, 21.4, 'z02'), (223, 25.1, 'z02'), (224, 28.8, 'z02'), (225, 32.5, 'z02'), (226, 36.2, 'z02'), (227, 39.9, 'z02'), (228, 43.6, 'z02'), (229, 47.3, 'z02'), (230, 51.0, 'z02'), (231, 54.7, 'z02'), (232, 58.4, 'z02'), (233, 62.1, 'z02'), (234, 65.8, 'z02'), (235, 69.5, 'z02'), (236, 73.2, 'z02'), (237, 76.9, 'z02'), (238, 80.6, 'z02'), (239, 84.3, 'z02'), (240, 88.0, 'z02'), (241, 91.7, 'z02'), (242, 95.4, 'z02'), (243, 99.1, 'z02'), (244, 2.8, 'z02'), (245, 6.5, 'z02'), (246, 10.2, 'z02'), (247, 13.9, 'z02'), (248, 17.6, 'z02'), (249, 21.3, 'z02'), (250, 25.0, 'z02'), (251, 28.7, 'z02'), (252, 32.4, 'z02'), (253, 36.1, 'z02'), (254, 39.8, 'z02'), (255, 43.5, 'z02'), (256, 47.2, 'z02'), (257, 50.9, 'z02'), (258, 54.6, 'z02'), (259, 58.3, 'z02'), (260, 62.0, 'z02'), (261, 65.7, 'z02'), (262, 69.4, 'z02'), (263, 73.1, 'z02'), (264, 76.8, 'z02'), (265, 80.5, 'z02'), (266, 84.2, 'z02'), (267, 87.9, 'z02'), (268, 91.6, 'z02'), (269, 95.3, 'z02'), (270, 99.0, 'z02'), (271, 2.7, 'z02'), (272, 6.4, 'z02'), (273, 10.1, 'z02'), (274, 13.8, 'z02'), (275, 17.5, 'z02'), (276, 21.2, 'z02'), (277, 24.9, 'z02'), (278, 28.6, 'z02'), (279, 32.3, 'z02'), (280, 36.0, 'z02'), (281, 39.7, 'z02'), (282, 43.4, 'z02'), (283, 47.1, 'z02'), (284, 50.8, 'z02'), (285, 54.5, 'z02'), (286, 58.2, 'z02'), (287, 61.9, 'z02'), (288, 65.6, 'z02'), (289, 69.3, 'z02'), (290, 73.0, 'z02'), (291, 76.7, 'z02'), (292, 80.4, 'z02'), (293, 84.1, 'z02'), (294, 87.8, 'z02'), (295, 91.5, 'z02'), (296, 95.2, 'z02'), (297, 98.9, 'z02'), (298, 2.6, 'z02'), (299, 6.3, 'z02'), (300, 10.0, 'z03'), (301, 13.7, 'z03'), (302, 17.4, 'z03'), (303, 21.1, 'z03'), (304, 24.8, 'z03'), (305, 28.5, 'z03'), (306, 32.2, 'z03'), (307, 35.9, 'z03'), (308, 39.6, 'z03'), (309, 43.3, 'z03'), (310, 47.0, 'z03'), (311, 50.7, 'z03'), (312, 54.4, 'z03'), (313, 58.1, 'z03'), (314, 61.8, 'z03'), (315, 65.5, 'z03'), (316, 69.2, 'z03'), (317, 72.9, 'z03'), (318, 76.6, 'z03'), (319, 80.3, 'z03'), (320, 84.0, 'z03'), (321, 87.7, 'z03'), (322, 91.4, 'z03'), (323, 95.1, 'z03'), (324, 98.8, 'z03'), (325, 2.5, 'z03'), (326, 6.2, 'z03'), (327, 9.9, 'z03'), (328, 13.6, 'z03'), (329, 17.3, 'z03'), (330, 21.0, 'z03'), (331, 24.7, 'z03'), (332, 28.4, 'z03'), (333, 32.1, 'z03'), (334, 35.8, 'z03'), (335, 39.5, 'z03'), (336, 43.2, 'z03'), (337, 46.9, 'z03'), (338, 50.6, 'z03'), (339, 54.3, 'z03'), (340, 58.0, 'z03'), (341, 61.7, 'z03'), (342, 65.4, 'z03'), (343, 69.1, 'z03'), (344, 72.8, 'z03'), (345, 76.5, 'z03'), (346, 80.2, 'z03'), (347, 83.9, 'z03'), (348, 87.6, 'z03'), (349, 91.3, 'z03'), (350, 95.0, 'z03'), (351, 98.7, 'z03'), (352, 2.4, 'z03'), (353, 6.1, 'z03'), (354, 9.8, 'z03'), (355, 13.5, 'z03'), (356, 17.2, 'z03'), (357, 20.9, 'z03'), (358, 24.6, 'z03'), (359, 28.3, 'z03'), (360, 32.0, 'z03'), (361, 35.7, 'z03'), (362, 39.4, 'z03'), (363, 43.1, 'z03'), (364, 46.8, 'z03'), (365, 50.5, 'z03'), (366, 54.2, 'z03'), (367, 57.9, 'z03'), (368, 61.6, 'z03'), (369, 65.3, 'z03'), (370, 69.0, 'z03'), (371, 72.7, 'z03'), (372, 76.4, 'z03'), (373, 80.1, 'z03'), (374, 83.8, 'z03'), (375, 87.5, 'z03'), (376, 91.2, 'z03'), (377, 94.9, 'z03'), (378, 98.6, 'z03'), (379, 2.3, 'z03'), (380, 6.0, 'z03'), (381, 9.7, 'z03'), (382, 13.4, 'z03'), (383, 17.1, 'z03'), (384, 20.8, 'z03'), (385, 24.5, 'z03'), (386, 28.2, 'z03'), (387, 31.9, 'z03'), (388, 35.6, 'z03'), (389, 39.3, 'z03'), (390, 43.0, 'z03'), (391, 46.7, 'z03'), (392, 50.4, 'z03'), (393, 54.1, 'z03'), (394, 57.8, 'z03'), (395, 61.5, 'z03'), (396, 65.2, 'z03'), (397, 68.9, 'z03'), (398, 72.6, 'z03'), (399, 76.3, 'z03'), (400, 80.0, 'z04'), (401, 83.7, 'z04'), (402, 87.4, 'z04'), (403, 91.1, 'z04'), (404, 94.8, 'z04'), (405, 98.5, 'z04'), (406, 2.2, 'z04'), (407, 5.9, 'z04'), (408, 9.6, 'z04'), (409, 13.3, 'z04'), (410, 17.0, 'z04'), (411, 20.7, 'z04'), (412, 24.4, 'z04'), (413, 28.1, 'z04'), (414, 31.8, 'z04'), (415, 35.5, 'z04'), (416, 39.2, 'z04'), (417, 42.9, 'z04'), (418, 46.6, 'z04'), (419, 50.3, 'z04'), (420, 54.0, 'z04'), (421, 57.7, 'z04'), (422, 61.4, 'z04'), (423, 65.1, 'z04'), (424, 68.8, 'z04'), (425, 72.5, 'z04'), (426, 76.2, 'z04'), (427, 79.9, 'z04'), (428, 83.6, 'z04'), (429, 87.3, 'z04'), (430, 91.0, 'z04'), (431, 94.7, 'z04'), (432, 98.4, 'z04'), (433, 2.1, 'z04'), (434, 5.8, 'z04'), (435, 9.5, 'z04'), (436, 13.2, 'z04'), (437, 16.9, 'z04'), (438, 20.6, 'z04'), (439, 24.3, 'z04'), (440, 28.0, 'z04'), (441, 31.7, 'z04'), (442, 35.4, 'z04'), (443, 39.1, 'z04'), (444, 42.8, 'z04'), (445, 46.5, 'z04'), (446, 50.2, 'z04'), (447, 53.9, 'z04'), (448, 57.6, 'z04'), (449, 61.3, 'z04'), (450, 65.0, 'z04'), (451, 68.7, 'z04'), (452, 72.4, 'z04'), (453, 76.1, 'z04'), (454, 79.8, 'z04'), (455, 83.5, 'z04'), (456, 87.2, 'z04'), (457, 90.9, 'z04'), (458, 94.6, 'z04'), (459, 98.3, 'z04'), (460, 2.0, 'z04'), (461, 5.7, 'z04'), (462, 9.4, 'z04'), (463, 13.1, 'z04'), (464, 16.8, 'z04'), (465, 20.5, 'z04'), (466, 24.2, 'z04'), (467, 27.9, 'z04'), (468, 31.6, 'z04'), (469, 35.3, 'z04'), (470, 39.0, 'z04'), (471, 42.7, 'z04'), (472, 46.4, 'z04'), (473, 50.1, 'z04'), (474, 53.8, 'z04'), (475, 57.5, 'z04'), (476, 61.2, 'z04'), (477, 64.9, 'z04'), (478, 68.6, 'z04'), (479, 72.3, 'z04'), (480, 76.0, 'z04'), (481, 79.7, 'z04'), (482, 83.4, 'z04'), (483, 87.1, 'z04'), (484, 90.8, 'z04'), (485, 94.5, 'z04'), (486, 98.2, 'z04'), (487, 1.9, 'z04'), (488, 5.6, 'z04'), (489, 9.3, 'z04'), (490, 13.0, 'z04'), (491, 16.7, 'z04'), (492, 20.4, 'z04'), (493, 24.1, 'z04'), (494, 27.8, 'z04'), (495, 31.5, 'z04'), (496, 35.2, 'z04'), (497, 38.9, 'z04'), (498, 42.6, 'z04'), (499, 46.3, 'z04'), (500, 50.0, 'z05'), (501, 53.7, 'z05'), (502, 57.4, 'z05'), (503, 61.1, 'z05'), (504, 64.8, 'z05'), (505, 68.5, 'z05'), (506, 72.2, 'z05'), (507, 75.9, 'z05'), (508, 79.6, 'z05'), (509, 83.3, 'z05'), (510, 87.0, 'z05'), (511, 90.7, 'z05'), (512, 94.4, 'z05'), (513, 98.1, 'z05'), (514, 1.8, 'z05'), (515, 5.5, 'z05'), (516, 9.2, 'z05'), (517, 12.9, 'z05'), (518, 16.6, 'z05'), (519, 20.3, 'z05'), (520, 24.0, 'z05'), (521, 27.7, 'z05'), (522, 31.4, 'z05'), (523, 35.1, 'z05'), (524, 38.8, 'z05'), (525, 42.5, 'z05'), (526, 46.2, 'z05'), (527, 49.9, 'z05'), (528, 53.6, 'z05'), (529, 57.3, 'z05'), (530, 61.0, 'z05'), (531, 64.7, 'z05'), (532, 68.4, 'z05'), (533, 72.1, 'z05'), (534, 75.8, 'z05'), (535, 79.5, 'z05'), (536, 83.2, 'z05'), (537, 86.9, 'z05'), (538, 90.6, 'z05'), (539, 94.3, 'z05'), (540, 98.0, 'z05'), (541, 1.7, 'z05'), (542, 5.4, 'z05'), (543, 9.1, 'z05'), (544, 12.8, 'z05'), (545, 16.5, 'z05'), (546, 20.2, 'z05'), (547, 23.9, 'z05'), (548, 27.6, 'z05'), (549, 31.3, 'z05'), (550, 35.0, 'z05'), (551, 38.7, 'z05'), (552, 42.4, 'z05'), (553, 46.1, 'z05'), (554, 49.8, 'z05'), (555, 53.5, 'z05'), (556, 57.2, 'z05'), (557, 60.9, 'z05'), (558, 64.6, 'z05'), (559, 68.3, 'z05'), (560, 72.0, 'z05'), (561, 75.7, 'z05'), (562, 79.4, 'z05'), (563, 83.1, 'z05'), (564, 86.8, 'z05'), (565, 90.5, 'z05'), (566, 94.2, 'z05'), (567, 97.9, 'z05'), (568, 1.6, 'z05'), (569, 5.3, 'z05'), (570, 9.0, 'z05'), (571, 12.7, 'z05'), (572, 16.4, 'z05'), (573, 20.1, 'z05'), (574, 23.8, 'z05'), (575, 27.5, 'z05'), (576, 31.2, 'z05'), (577, 34.9, 'z05'), (578, 38.6, 'z05'), (579, 42.3, 'z05'), (580, 46.0, 'z05'), (581, 49.7, 'z05'), (582, 53.4, 'z05'), (583, 57.1, 'z05'), (584, 60.8, 'z05'), (585, 64.5, 'z05'), (586, 68.2, 'z05'), (587, 71.9, 'z05'), (588, 75.6, 'z05'), (589, 79.3, 'z05'), (590, 83.0, 'z05'), (591, 86.7, 'z05'), (592, 90.4, 'z05'), (593, 94.1, 'z05'), (594, 97.8, 'z05'), (595, 1.5, 'z05'), (596, 5.2, 'z05'), (597, 8.9, 'z05'), (598, 12.6, 'z05'), (599, 16.3, 'z05'), (600, 20.0, 'z06'), (601, 23.7, 'z06'), (602, 27.4, 'z06'), (603, 31.1, 'z06'), (604, 34.8, 'z06'), (605, 38.5, 'z06'), (606, 42.2, 'z06'), (607, 45.9, 'z06'), (608, 49.6, 'z06'), (609, 53.3, 'z06'), (610, 57.0, 'z06'), (611, 60.7, 'z06'), (612, 64.4, 'z06'), (613, 68.1, 'z06'), (614, 71.8, 'z06'), (615, 75.5, 'z06'), (616, 79.2, 'z06'), (617, 82.9, 'z06'), (618, 86.6, 'z06'), (619, 90.3, 'z06'), (620, 94.0, 'z06'), (621, 97.7, 'z06'), (622, 1.4, 'z06'), (623, 5.1, 'z06'), (624, 8.8, 'z06'), (625, 12.5, 'z06'), (626, 16.2, 'z06'), (627, 19.9, 'z06'), (628, 23.6, 'z06'), (629, 27.3, 'z06'), (630, 31.0, 'z06'), (631, 34.7, 'z06'), (632, 38.4, 'z06'), (633, 42.1, 'z06'), (634, 45.8, 'z06'), (635, 49.5, 'z06'), (636, 53.2, 'z06'), (637, 56.9, 'z06'), (638, 60.6, 'z06'), (639, 64.3, 'z06'), (640, 68.0, 'z06'), (641, 71.7, 'z06'), (642, 75.4, 'z06'), (643, 79.1, 'z06'), (644, 82.8, 'z06'), (645, 86.5, 'z06'), (646, 90.2, 'z06'), (647, 93.9, 'z06'), (648, 97.6, 'z06'), (649, 1.3, 'z06'), (650, 5.0, 'z06'), (651, 8.7, 'z06'), (652, 12.4, 'z06'), (653, 16.1, 'z06'), (654, 19.8, 'z06'), (655, 23.5, 'z06'), (656, 27.2, 'z06'), (657, 30.9, 'z06'), (658, 34.6, 'z06'), (659, 38.3, 'z06'), (660, 42.0, 'z06'), (661, 45.7, 'z06'), (662, 49.4, 'z06'), (663, 53.1, 'z06'), (664, 56.8, 'z06'), (665, 60.5, 'z06'), (666, 64.2, 'z06'), (667, 67.9, 'z06'), (668, 71.6, 'z06'), (669, 75.3, 'z06'), (670, 79.0, 'z06'), (671, 82.7, 'z06'), (672, 86.4, 'z06'), (673, 90.1, 'z06'), (674, 93.8, 'z06'), (675, 97.5, 'z06'), (676, 1.2, 'z06'), (677, 4.9, 'z06'), (678, 8.6, 'z06'), (679, 12.3, 'z06'), (680, 16.0, 'z06'), (681, 19.7, 'z06'), (682, 23.4, 'z06'), (683, 27.1, 'z06'), (684, 30.8, 'z06'), (685, 34.5, 'z06'), (686, 38.2, 'z06'), (687, 41.9, 'z06'), (688, 45.6, 'z06'), (689, 49.3, 'z06'), (690, 53.0, 'z06'), (691, 56.7, 'z06'), (692, 60.4, 'z06'), (693, 64.1, 'z06'), (694, 67.8, 'z06'), (695, 71.5, 'z06'), (696, 75.2, 'z06'), (697, 78.9, 'z06'), (698, 82.6, 'z06'), (699, 86.3, 'z06'), (700, 90.0, 'z07'), (701, 93.7, 'z07'), (702, 97.4, 'z07'), (703, 1.1, 'z07'), (704, 4.8, 'z07'), (705, 8.5, 'z07'), (706, 12.2, 'z07'), (707, 15.9, 'z07'), (708, 19.6, 'z07'), (709, 23.3, 'z07'), (710, 27.0, 'z07'), (711, 30.7, 'z07'), (712, 34.4, 'z07'), (713, 38.1, 'z07'), (714, 41.8, 'z07'), (715, 45.5, 'z07'), (716, 49.2, 'z07'), (717, 52.9, 'z07'), (718, 56.6, 'z07'), (719, 60.3, 'z07'), (720, 64.0, 'z07'), (721, 67.7, 'z07'), (722, 71.4, 'z07'), (723, 75.1, 'z07'), (724, 78.8, 'z07'), (725, 82.5, 'z07'), (726, 86.2, 'z07'), (727, 89.9, 'z07'), (728, 93.6, 'z07'), (729, 97.3, 'z07'), (730, 1.0, 'z07'), (731, 4.7, 'z07'), (732, 8.4, 'z07'), (733, 12.1, 'z07'), (734, 15.8, 'z07'), (735, 19.5, 'z07'), (736, 23.2, 'z07'), (737, 26.9, 'z07'), (738, 30.6, 'z07'), (739, 34.3, 'z07'), (740, 38.0, 'z07'), (741, 41.7, 'z07'), (742, 45.4, 'z07'), (743, 49.1, 'z07'), (744, 52.8, 'z07'), (745, 56.5, 'z07'), (746, 60.2, 'z07'), (747, 63.9, 'z07'), (748, 67.6, 'z07'), (749, 71.3, 'z07'), (750, 75.0, 'z07'), (751, 78.7, 'z07'), (752, 82.4, 'z07'), (753, 86.1, 'z07'), (754, 89.8, 'z07'), (755, 93.5, 'z07'), (756, 97.2, 'z07'), (757, 0.9, 'z07'), (758, 4.6, 'z07'), (759, 8.3, 'z07'), (760, 12.0, 'z07'), (761, 15.7, 'z07'), (762, 19.4, 'z07'), (763, 23.1, 'z07'), (764, 26.8, 'z07'), (765, 30.5, 'z07'), (766, 34.2, 'z07'), (767, 37.9, 'z07'), (768, 41.6, 'z07'), (769, 45.3, 'z07'), (770, 49.0, 'z07'), (771, 52.7, 'z07'), (772, 56.4, 'z07'), (773, 60.1, 'z07'), (774, 63.8, 'z07'), (775, 67.5, 'z07'), (776, 71.2, 'z07'), (777, 74.9, 'z07'), (778, 78.6, 'z07'), (779, 82.3, 'z07'), (780, 86.0, 'z07'), (781, 89.7, 'z07'), (782, 93.4, 'z07'), (783, 97.1, 'z07'), (784, 0.8, 'z07'), (785, 4.5, 'z07'), (786, 8.2, 'z07'), (787, 11.9, 'z07'), (788, 15.6, 'z07'), (789, 19.3, 'z07'), (790, 23.0, 'z07'), (791, 26.7, 'z07'), (792, 30.4, 'z07'), (793, 34.1, 'z07'), (794, 37.8, 'z07'), (795, 41.5, 'z07'), (796, 45.2, 'z07'), (797, 48.9, 'z07'), (798, 52.6, 'z07'), (799, 56.3, 'z07'), (800, 60.0, 'z08'), (801, 63.7, 'z08'), (802, 67.4, 'z08'), (803, 71.1, 'z08'), (804, 74.8, 'z08'), (805, 78.5, 'z08'), (806, 82.2, 'z08'), (807, 85.9, 'z08'), (808, 89.6, 'z08'), (809, 93.3, 'z08'), (810, 97.0, 'z08'), (811, 0.7, 'z08'), (812, 4.4, 'z08'), (813, 8.1, 'z08'), (814, 11.8, 'z08'), (815, 15.5, 'z08'), (816, 19.2, 'z08'), (817, 22.9, 'z08'), (818, 26.6, 'z08'), (819, 30.3, 'z08'), (820, 34.0, 'z08'), (821, 37.7, 'z08'), (822, 41.4, 'z08'), (823, 45.1, 'z08'), (824, 48.8, 'z08'), (825, 52.5, 'z08'), (826, 56.2, 'z08'), (827, 59.9, 'z08'), (828, 63.6, 'z08'), (829, 67.3, 'z08'), (830, 71.0, 'z08'), (831, 74.7, 'z08'), (832, 78.4, 'z08'), (833, 82.1, 'z08'), (834, 85.8, 'z08'), (835, 89.5, 'z08'), (836, 93.2, 'z08'), (837, 96.9, 'z08'), (838, 0.6, 'z08'), (839, 4.3, 'z08'), (840, 8.0, 'z08'), (841, 11.7, 'z08'), (842, 15.4, 'z08'), (843, 19.1, 'z08'), (844, 22.8, 'z08'), (845, 26.5, 'z08'), (846, 30.2, 'z08'), (847, 33.9, 'z08'), (848, 37.6, 'z08'), (849, 41.3, 'z08'), (850, 45.0, 'z08'), (851, 48.7, 'z08'), (852, 52.4, 'z08'), (853, 56.1, 'z08'), (854, 59.8, 'z08'), (855, 63.5, 'z08'), (856, 67.2, 'z08'), (857, 70.9, 'z08'), (858, 74.6, 'z08'), (859, 78.3, 'z08'), (860, 82.0, 'z08'), (861, 85.7, 'z08'), (862, 89.4, 'z08'), (863, 93.1, 'z08'), (864, 96.8, 'z08'), (865, 0.5, 'z08'), (866, 4.2, 'z08'), (867, 7.9, 'z08'), (868, 11.6, 'z08'), (869, 15.3, 'z08'), (870, 19.0, 'z08'), (871, 22.7, 'z08'), (872, 26.4, 'z08'), (873, 30.1, 'z08'), (874, 33.8, 'z08'), (875, 37.5, 'z08'), (876, 41.2, 'z08'), (877, 44.9, 'z08'), (878, 48.6, 'z08'), (879, 52.3, 'z08'), (880, 56.0, 'z08'), (881, 59.7, 'z08'), (882, 63.4, 'z08'), (883, 67.1, 'z08'), (884, 70.8, 'z08'), (885, 74.5, 'z08'), (886, 78.2, 'z08'), (887, 81.9, 'z08'), (888, 85.6, 'z08'), (889, 89.3, 'z08'), (890, 93.0, 'z08'), (891, 96.7, 'z08'), (892, 0.4, 'z08'), (893, 4.1, 'z08'), (894, 7.8, 'z08'), (895, 11.5, 'z08'), (896, 15.2, 'z08'), (897, 18.9, 'z08'), (898, 22.6, 'z08'), (899, 26.3, 'z08'), (900, 30.0, 'z09'), (901, 33.7, 'z09'), (902, 37.4, 'z09'), (903, 41.1, 'z09'), (904, 44.8, 'z09'), (905, 48.5, 'z09'), (906, 52.2, 'z09'), (907, 55.9, 'z09'), (908, 59.6, 'z09'), (909, 63.3, 'z09'), (910, 67.0, 'z09'), (911, 70.7, 'z09'), (912, 74.4, 'z09'), (913, 78.1, 'z09'), (914, 81.8, 'z09'), (915, 85.5, 'z09'), (916, 89.2, 'z09'), (917, 92.9, 'z09'), (918, 96.6, 'z09'), (919, 0.3, 'z09'), (920, 4.0, 'z09'), (921, 7.7, 'z09'), (922, 11.4, 'z09'), (923, 15.1, 'z09'), (924, 18.8, 'z09'), (925, 22.5, 'z09'), (926, 26.2, 'z09'), (927, 29.9, 'z09'), (928, 33.6, 'z09'), (929, 37.3, 'z09'), (930, 41.0, 'z09'), (931, 44.7, 'z09'), (932, 48.4, 'z09'), (933, 52.1, 'z09'), (934, 55.8, 'z09'), (935, 59.5, 'z09'), (936, 63.2, 'z09'), (937, 66.9, 'z09'), (938, 70.6, 'z09'), (939, 74.3, 'z09'), (940, 78.0, 'z09'), (941, 81.7, 'z09'), (942, 85.4, 'z09'), (943, 89.1, 'z09'), (944, 92.8, 'z09'), (945, 96.5, 'z09'), (946, 0.2, 'z09'), (947, 3.9, 'z09'), (948, 7.6, 'z09'), (949, 11.3, 'z09'), (950, 15.0, 'z09'), (951, 18.7, 'z09'), (952, 22.4, 'z09'), (953, 26.1, 'z09'), (954, 29.8, 'z09'), (955, 33.5, 'z09'), (956, 37.2, 'z09'), (957, 40.9, 'z09'), (958, 44.6, 'z09'), (959, 48.3, 'z09'), (960, 52.0, 'z09'), (961, 55.7, 'z09'), (962, 59.4, 'z09'), (963, 63.1, 'z09'), (964, 66.8, 'z09'), (965, 70.5, 'z09'), (966, 74.2, 'z09'), (967, 77.9, 'z09'), (968, 81.6, 'z09'), (969, 85.3, 'z09'), (970, 89.0, 'z09'), (971, 92.7, 'z09'), (972, 96.4, 'z09'), (973, 0.1, 'z09'), (974, 3.8, 'z09'), (975, 7.5, 'z09'), (976, 11.2, 'z09'), (977, 14.9, 'z09'), (978, 18.6, 'z09'), (979, 22.3, 'z09'), (980, 26.0, 'z09'), (981, 29.7, 'z09'), (982, 33.4, 'z09'), (983, 37.1, 'z09'), (984, 40.8, 'z09'), (985, 44.5, 'z09'), (986, 48.2, 'z09'), (987, 51.9, 'z09'), (988, 55.6, 'z09'), (989, 59.3, 'z09'), (990, 63.0, 'z09'), (991, 66.7, 'z09'), (992, 70.4, 'z09'), (993, 74.1, 'z09'), (994, 77.8, 'z09'), (995, 81.5, 'z09'), (996, 85.2, 'z09'), (997, 88.9, 'z09'), (998, 92.6, 'z09'), (999, 96.3, 'z09'), (1000, 0.0, 'z10'), (1001, 3.7, 'z10'), (1002, 7.4, 'z10'), (1003, 11.1, 'z10'), (1004, 14.8, 'z10'), (1005, 18.5, 'z10'), (1006, 22.2, 'z10'), (1007, 25.9, 'z10'), (1008, 29.6, 'z10'), (1009, 33.3, 'z10'), (1010, 37.0, 'z10'), (1011, 40.7, 'z10'), (1012, 44.4, 'z10'), (1013, 48.1, 'z10'), (1014, 51.8, 'z10'), (1015, 55.5, 'z10'), (1016, 59.2, 'z10'), (1017, 62.9, 'z10'), (1018, 66.6, 'z10'), (1019, 70.3, 'z10'), (1020, 74.0, 'z10'), (1021, 77.7, 'z10'), (1022, 81.4, 'z10'), (1023, 85.1, 'z10'), (1024, 88.8, 'z10'), (1025, 92.5, 'z10'), (1026, 96.2, 'z10'), (1027, 99.9, 'z10'), (1028, 3.6, 'z10'), (1029, 7.3, 'z10'), (1030, 11.0, 'z10'), (1031, 14.7, 'z10'), (1032, 18.4, 'z10'), (1033, 22.1, 'z10'), (1034, 25.8, 'z10'), (1035, 29.5, 'z10'), (1036, 33.2, 'z10'), (1037, 36.9, 'z10'), (1038, 40.6, 'z10'), (1039, 44.3, 'z10'), (1040, 48.0, 'z10'), (1041, 51.7, 'z10'), (1042, 55.4, 'z10'), (1043, 59.1, 'z10'), (1044, 62.8, 'z10'), (1045, 66.5, 'z10'), (1046, 70.2, 'z10'), (1047, 73.9, 'z10'), (1048, 77.6, 'z10'), (1049, 81.3, 'z10'), (1050, 85.0, 'z10'), (1051, 88.7, 'z10'), (1052, 92.4, 'z10'), (1053, 96.1, 'z10'), (1054, 99.8, 'z10'), (1055, 3.5, 'z10'), (1056, 7.2, 'z10'), (1057, 10.9, 'z10'), (1058, 14.6, 'z10'), (1059, 18.3, 'z10'), (1060, 22.0, 'z10'), (1061, 25.7, 'z10'), (1062, 29.4, 'z10'), (1063, 33.1, 'z10'), (1064, 36.8, 'z10'), (1065, 40.5, 'z10'), (1066, 44.2, 'z10'), (1067, 47.9, 'z10'), (1068, 51.6, 'z10'), (1069, 55.3, 'z10'), (1070, 59.0, 'z10'), (1071, 62.7, 'z10'), (1072, 66.4, 'z10'), (1073, 70.1, 'z10'), (1074, 73.8, 'z10'), (1075, 77.5, 'z10'), (1076, 81.2, 'z10'), (1077, 84.9, 'z10'), (1078, 88.6, 'z10'), (1079, 92.3, 'z10'), (1080, 96.0, 'z10'), (1081, 99.7, 'z10'), (1082, 3.4, 'z10'), (1083, 7.1, 'z10'), (1084, 10.8, 'z10'), (1085, 14.5, 'z10'), (1086, 18.2, 'z10'), (1087, 21.9, 'z10'), (1088, 25.6, 'z10'), (1089, 29.3, 'z10'), (1090, 33.0, 'z10'), (1091, 36.7, 'z10'), (1092, 40.4, 'z10'), (1093, 44.1, 'z10'), (1094, 47.8, 'z10'), (1095, 51.5, 'z10'), (1096, 55.2, 'z10'), (1097, 58.9, 'z10'), (1098, 62.6, 'z10'), (1099, 66.3, 'z10'), (1100, 70.0, 'z11'), (1101, 73.7, 'z11'), (1102, 77.4, 'z11'), (1103, 81.1, 'z11'), (1104, 84.8, 'z11'), (1105, 88.5, 'z11'), (1106, 92.2, 'z11'), (1107, 95.9, 'z11'), (1108, 99.6, 'z11'), (1109, 3.3, 'z11'), (1110, 7.0, 'z11'), (1111, 10.7, 'z11'), (1112, 14.4, 'z11'), (1113, 18.1, 'z11'), (1114, 21.8, 'z11'), (1115, 25.5, 'z11'), (1116, 29.2, 'z11'), (1117, 32.9, 'z11'), (1118, 36.6, 'z11'), (1119, 40.3, 'z11'), (1120, 44.0, 'z11'), (1121, 47.7, 'z11'), (1122, 51.4, 'z11'), (1123, 55.1, 'z11'), (1124, 58.8, 'z11'), (1125, 62.5, 'z11'), (1126, 66.2, 'z11'), (1127, 69.9, 'z11'), (1128, 73.6, 'z11'), (1129, 77.3, 'z11'), (1130, 81.0, 'z11'), (1131, 84.7, 'z11'), (1132, 88.4, 'z11'), (1133, 92.1, 'z11'), (1134, 95.8, 'z11'), (1135, 99.5, 'z11'), (1136, 3.2, 'z11'), (1137, 6.9, 'z11'), (1138, 10.6, 'z11'), (1139, 14.3, 'z11'), (1140, 18.0, 'z11'), (1141, 21.7, 'z11'), (1142, 25.4, 'z11'), (1143, 29.1, 'z11'), (1144, 32.8, 'z11'), (1145, 36.5, 'z11'), (1146, 40.2, 'z11'), (1147, 43.9, 'z11'), (1148, 47.6, 'z11'), (1149, 51.3, 'z11'), (1150, 55.0, 'z11'), (1151, 58.7, 'z11'), (1152, 62.4, 'z11'), (1153, 66.1, 'z11'), (1154, 69.8, 'z11'), (1155, 73.5, 'z11'), (1156, 77.2, 'z11'), (1157, 80.9, 'z11'), (1158, 84.6, 'z11'), (1159, 88.3, 'z11'), (1160, 92.0, 'z11'), (1161, 95.7, 'z11'), (1162, 99.4, 'z11'), (1163, 3.1, 'z11'), (1164, 6.8, 'z11'), (1165, 10.5, 'z11'), (1166, 14.2, 'z11'), (1167, 17.9, 'z11'), (1168, 21.6, 'z11'), (1169, 25.3, 'z11'), (1170, 29.0, 'z11'), (1171, 32.7, 'z11'), (1172, 36.4, 'z11'), (1173, 40.1, 'z11'), (1174, 43.8, 'z11'), (1175, 47.5, 'z11'), (1176, 51.2, 'z11'), (1177, 54.9, 'z11'), (1178, 58.6, 'z11'), (1179, 62.3, 'z11'), (1180, 66.0, 'z11'), (1181, 69.7, 'z11'), (1182, 73.4, 'z11'), (1183, 77.1, 'z11'), (1184, 80.8, 'z11'), (1185, 84.5, 'z11'), (1186, 88.2, 'z11'), (1187, 91.9, 'z11'), (1188, 95.6, 'z11'), (1189, 99.3, 'z11'), (1190, 3.0, 'z11'), (1191, 6.7, 'z11'), (1192, 10.4, 'z11'), (1193, 14.1, 'z11'), (1194, 17.8, 'z11'), (1195, 21.5, 'z11'), (1196, 25.2, 'z11'), (1197, 28.9, 'z11'), (1198, 32.6, 'z11'), (1199, 36.3, 'z11'), (1200, 40.0, 'z12'), (1201, 43.7, 'z12'), (1202, 47.4, 'z12'), (1203, 51.1, 'z12'), (1204, 54.8, 'z12'), (1205, 58.5, 'z12'), (1206, 62.2, 'z12'), (1207, 65.9, 'z12'), (1208, 69.6, 'z12'), (1209, 73.3, 'z12'), (1210, 77.0, 'z12'), (1211, 80.7, 'z12'), (1212, 84.4, 'z12'), (1213, 88.1, 'z12'), (1214, 91.8, 'z12'), (1215, 95.5, 'z12'), (1216, 99.2, 'z12'), (1217, 2.9, 'z12'), (1218, 6.6, 'z12'), (1219, 10.3, 'z12'), (1220, 14.0, 'z12'), (1221, 17.7, 'z12'), (1222, 21.4, 'z12'), (1223, 25.1, 'z12'), (1224, 28.8, 'z12'), (1225, 32.5, 'z12'), (1226, 36.2, 'z12'), (1227, 39.9, 'z12'), (1228, 43.6, 'z12'), (1229, 47.3, 'z12'), (1230, 51.0, 'z12'), (1231, 54.7, 'z12'), (1232, 58.4, 'z12'), (1233, 62.1, 'z12'), (1234, 65.8, 'z12'), (1235, 69.5, 'z12'), (1236, 73.2, 'z12'), (1237, 76.9, 'z12'), (1238, 80.6, 'z12'), (1239, 84.3, 'z12'), (1240, 88.0, 'z12'), (1241, 91.7, 'z12'), (1242, 95.4, 'z12'), (1243, 99.1, 'z12'), (1244, 2.8, 'z12'), (1245, 6.5, 'z12'), (1246, 10.2, 'z12'), (1247, 13.9, 'z12'), (1248, 17.6, 'z12'), (1249, 21.3, 'z12'), (1250, 25.0, 'z12'), (1251, 28.7, 'z12'), (1252, 32.4, 'z12'), (1253, 36.1, 'z12'), (1254, 39.8, 'z12'), (1255, 43.5, 'z12'), (1256, 47.2, 'z12'), (1257, 50.9, 'z12'), (1258, 54.6, 'z12'), (1259, 58.3, 'z12'), (1260, 62.0, 'z12'), (1261, 65.7, 'z12'), (1262, 69.4, 'z12'), (1263, 73.1, 'z12'), (1264, 76.8, 'z12'), (1265, 80.5, 'z12'), (1266, 84.2, 'z12'), (1267, 87.9, 'z12'), (1268, 91.6, 'z12'), (1269, 95.3, 'z12'), (1270, 99.0, 'z12'), (1271, 2.7, 'z12'), (1272, 6.4, 'z12'), (1273, 10.1, 'z12'), (1274, 13.8, 'z12'), (1275, 17.5, 'z12'), (1276, 21.2, 'z12'), (1277, 24.9, 'z12'), (1278, 28.6, 'z12'), (1279, 32.3, 'z12'), (1280, 36.0, 'z12'), (1281, 39.7, 'z12'), (1282, 43.4, 'z12'), (1283, 47.1, 'z12'), (1284, 50.8, 'z12'), (1285, 54.5, 'z12'), (1286, 58.2, 'z12'), (1287, 61.9, 'z12'), (1288, 65.6, 'z12'), (1289, 69.3, 'z12'), (1290, 73.0, 'z12'), (1291, 76.7, 'z12'), (1292, 80.4, 'z12'), (1293, 84.1, 'z12'), (1294, 87.8, 'z12'), (1295, 91.5, 'z12'), (1296, 95.2, 'z12'), (1297, 98.9, 'z12'), (1298, 2.6, 'z12'), (1299, 6.3, 'z12'), (1300, 10.0, 'z13'), (1301, 13.7, 'z13'), (1302, 17.4, 'z13'), (1303, 21.1, 'z13'), (1304, 24.8, 'z13'), (1305, 28.5, 'z13'), (1306, 32.2, 'z13'), (1307, 35.9, 'z13'), (1308, 39.6, 'z13'), (1309, 43.3, 'z13'), (1310, 47.0, 'z13'), (1311, 50.7, 'z13'), (1312, 54.4, 'z13'), (1313, 58.1, 'z13'), (1314, 61.8, 'z13'), (1315, 65.5, 'z13'), (1316, 69.2, 'z13'), (1317, 72.9, 'z13'), (1318, 76.6, 'z13'), (1319, 80.3, 'z13'), (1320, 84.0, 'z13'), (1321, 87.7, 'z13'), (1322, 91.4, 'z13'), (1323, 95.1, 'z13'), (1324, 98.8, 'z13'), (1325, 2.5, 'z13'), (1326, 6.2, 'z13'), (1327, 9.9, 'z13'), (1328, 13.6, 'z13'), (1329, 17.3, 'z13'), (1330, 21.0, 'z13'), (1331, 24.7, 'z13'), (1332, 28.4, 'z13'), (1333, 32.1, 'z13'), (1334, 35.8, 'z13'), (1335, 39.5, 'z13'), (1336, 43.2, 'z13'), (1337, 46.9, 'z13'), (1338, 50.6, 'z13'), (1339, 54.3, 'z13'), (1340, 58.0, 'z13'), (1341, 61.7, 'z13'), (1342, 65.4, 'z13'), (1343, 69.1, 'z13'), (1344, 72.8, 'z13'), (1345, 76.5, 'z13'), (1346, 80.2, 'z13'), (1347, 83.9, 'z13'), (1348, 87.6, 'z13'), (1349, 91.3, 'z13'), (1350, 95.0, 'z13'), (1351, 98.7, 'z13'), (1352, 2.4, 'z13'), (1353, 6.1, 'z13'), (1354, 9.8, 'z13'), (1355, 13.5, 'z13'), (1356, 17.2, 'z13'), (1357, 20.9, 'z13'), (1358, 24.6, 'z13'), (1359, 28.3, 'z13'), (1360, 32.0, 'z13'), (1361, 35.7, 'z13'), (1362, 39.4, 'z13'), (1363, 43.1, 'z13'), (1364, 46.8, 'z13'), (1365, 50.5, 'z13'), (1366, 54.2, 'z13'), (1367, 57.9, 'z13'), (1368, 61.6, 'z13'), (1369, 65.3, 'z13'), (1370, 69.0, 'z13'), (1371, 72.7, 'z13'), (1372, 76.4, 'z13'), (1373, 80.1, 'z13'), (1374, 83.8, 'z13'), (1375, 87.5, 'z13'), (1376, 91.2, 'z13'), (1377, 94.9, 'z13'), (1378, 98.6, 'z13'), (1379, 2.3, 'z13'), (1380, 6.0, 'z13'), (1381, 9.7, 'z13'), (1382, 13.4, 'z13'), (1383, 17.1, 'z13'), (1384, 20.8, 'z13'), (1385, 24.5, 'z13'), (1386, 28.2, 'z13'), (1387, 31.9, 'z13'), (1388, 35.6, 'z13'), (1389, 39.3, 'z13'), (1390, 43.0, 'z13'), (1391, 46.7, 'z13'), (1392, 50.4, 'z13'), (1393, 54.1, 'z13'), (1394, 57.8, 'z13'), (1395, 61.5, 'z13'), (1396, 65.2, 'z13'), (1397, 68.9, 'z13'), (1398, 72.6, 'z13'), (1399, 76.3, 'z13'), (1400, 80.0, 'z14'), (1401, 83.7, 'z14'), (1402, 87.4, 'z14'), (1403, 91.1, 'z14'), (1404, 94.8, 'z14'), (1405, 98.5, 'z14'), (1406, 2.2, 'z14'), (1407, 5.9, 'z14'), (1408, 9.6, 'z14'), (1409, 13.3, 'z14'), (1410, 17.0, 'z14'), (1411, 20.7, 'z14'), (1412, 24.4, 'z14'), (1413, 28.1, 'z14'), (1414, 31.8, 'z14'), (1415, 35.5, 'z14'), (1416, 39.2, 'z14'), (1417, 42.9, 'z14'), (1418, 46.6, 'z14'), (1419, 50.3, 'z14'), (1420, 54.0, 'z14'), (1421, 57.7, 'z14'), (1422, 61.4, 'z14'), (1423, 65.1, 'z14'), (1424, 68.8, 'z14'), (1425, 72.5, 'z14'), (1426, 76.2, 'z14'), (1427, 79.9, 'z14'), (1428, 83.6, 'z14'), (1429, 87.3, 'z14'), (1430, 91.0, 'z14'), (1431, 94.7, 'z14'), (1432, 98.4, 'z14'), (1433, 2.1, 'z14'), (1434, 5.8, 'z14'), (1435, 9.5, 'z14'), (1436, 13.2, 'z14'), (1437, 16.9, 'z14'), (1438, 20.6, 'z14'), (1439, 24.3, 'z14'), (1440, 28.0, 'z14'), (1441, 31.7, 'z14'), (1442, 35.4, 'z14'), (1443, 39.1, 'z14'), (1444, 42.8, 'z14'), (1445, 46.5, 'z14'), (1446, 50.2, 'z14'), (1447, 53.9, 'z14'), (1448, 57.6, 'z14'), (1449, 61.3, 'z14'), (1450, 65.0, 'z14'), (1451, 68.7, 'z14'), (1452, 72.4, 'z14'), (1453, 76.1, 'z14'), (1454, 79.8, 'z14'), (1455, 83.5, 'z14'), (1456, 87.2, 'z14'), (1457, 90.9, 'z14'), (1458, 94.6, 'z14'), (1459, 98.3, 'z14'), (1460, 2.0, 'z14'), (1461, 5.7, 'z14'), (1462, 9.4, 'z14'), (1463, 13.1, 'z14'), (1464, 16.8, 'z14'), (1465, 20.5, 'z14'), (1466, 24.2, 'z14'), (1467, 27.9, 'z14'), (1468, 31.6, 'z14'), (1469, 35.3, 'z14'), (1470, 39.0, 'z14'), (1471, 42.7, 'z14'), (1472, 46.4, 'z14'), (1473, 50.1, 'z14'), (1474, 53.8, 'z14'), (1475, 57.5, 'z14'), (1476, 61.2, 'z14'), (1477, 64.9, 'z14'), (1478, 68.6, 'z14'), (1479, 72.3, 'z14'), (1480, 76.0, 'z14'), (1481, 79.7, 'z14'), (1482, 83.4, 'z14'), (1483, 87.1, 'z14'), (1484, 90.8, 'z14'), (1485, 94.5, 'z14'), (1486, 98.2, 'z14'), (1487, 1.9, 'z14'), (1488, 5.6, 'z14'), (1489, 9.3, 'z14'), (1490, 13.0, 'z14'), (1491, 16.7, 'z14'), (1492, 20.4, 'z14'), (1493, 24.1, 'z14'), (1494, 27.8, 'z14'), (1495, 31.5, 'z14'), (1496, 35.2, 'z14'), (1497, 38.9, 'z14'), (1498, 42.6, 'z14'), (1499, 46.3, 'z14'), (1500, 50.0, 'z15'), (1501, 53.7, 'z15'), (1502, 57.4, 'z15'), (1503, 61.1, 'z15'), (1504, 64.8, 'z15'), (1505, 68.5, 'z15'), (1506, 72.2, 'z15'), (1507, 75.9, 'z15'), (1508, 79.6, 'z15'), (1509, 83.3, 'z15'), (1510, 87.0, 'z15'), (1511, 90.7, 'z15'), (1512, 94.4, 'z15'), (1513, 98.1, 'z15'), (1514, 1.8, 'z15'), (1515, 5.5, 'z15'), (1516, 9.2, 'z15'), (1517, 12.9, 'z15'), (1518, 16.6, 'z15'), (1519, 20.3, 'z15'), (1520, 24.0, 'z15'), (1521, 27.7, 'z15'), (1522, 31.4, 'z15'), (1523, 35.1, 'z15'), (1524, 38.8, 'z15'), (1525, 42.5, 'z15'), (1526, 46.2, 'z15'), (1527, 49.9, 'z15'), (1528, 53.6, 'z15'), (1529, 57.3, 'z15'), (1530, 61.0, 'z15'), (1531, 64.7, 'z15'), (1532, 68.4, 'z15'), (1533, 72.1, 'z15'), (1534, 75.8, 'z15'), (1535, 79.5, 'z15'), (1536, 83.2, 'z15'), (1537, 86.9, 'z15'), (1538, 90.6, 'z15'), (1539, 94.3, 'z15'), (1540, 98.0, 'z15'), (1541, 1.7, 'z15'), (1542, 5.4, 'z15'), (1543, 9.1, 'z15'), (1544, 12.8, 'z15'), (1545, 16.5, 'z15'), (1546, 20.2, 'z15'), (1547, 23.9, 'z15'), (1548, 27.6, 'z15'), (1549, 31.3, 'z15'), (1550, 35.0, 'z15'), (1551, 38.7, 'z15'), (1552, 42.4, 'z15'), (1553, 46.1, 'z15'), (1554, 49.8, 'z15'), (1555, 53.5, 'z15'), (1556, 57.2, 'z15'), (1557, 60.9, 'z15'), (1558, 64.6, 'z15'), (1559, 68.3, 'z15'), (1560, 72.0, 'z15'), (1561, 75.7, 'z15'), (1562, 79.4, 'z15'), (1563, 83.1, 'z15'), (1564, 86.8, 'z15'), (1565, 90.5, 'z15'), (1566, 94.2, 'z15'), (1567, 97.9, 'z15'), (1568, 1.6, 'z15'), (1569, 5.3, 'z15'), (1570, 9.0, 'z15'), (1571, 12.7, 'z15'), (1572, 16.4, 'z15'), (1573, 20.1, 'z15'), (1574, 23.8, 'z15'), (1575, 27.5, 'z15'), (1576, 31.2, 'z15'), (1577, 34.9, 'z15'), (1578, 38.6, 'z15'), (1579, 42.3, 'z15'), (1580, 46.0, 'z15'), (1581, 49.7, 'z15'), (1582, 53.4, 'z15'), (1583, 57.1, 'z15'), (1584, 60.8, 'z15'), (1585, 64.5, 'z15'), (1586, 68.2, 'z15'), (1587, 71.9, 'z15'), (1588, 75.6, 'z15'), (1589, 79.3, 'z15'), (1590, 83.0, 'z15'), (1591, 86.7, 'z15'), (1592, 90.4, 'z15'), (1593, 94.1, 'z15'), (1594, 97.8, 'z15'), (1595, 1.5, 'z15'), (1596, 5.2, 'z15'), (1597, 8.9, 'z15'), (1598, 12.6, 'z15'), (1599, 16.3, 'z15'), (1600, 20.0, 'z16'), (1601, 23.7, 'z16'), (1602, 27.4, 'z16'), (1603, 31.1, 'z16'), (1604, 34.8, 'z16'), (1605, 38.5, 'z16'), (1606, 42.2, 'z16'), (1607, 45.9, 'z16'), (1608, 49.6, 'z16'), (1609, 53.3, 'z16'), (1610, 57.0, 'z16'), (1611, 60.7, 'z16'), (1612, 64.4, 'z16'), (1613, 68.1, 'z16'), (1614, 71.8, 'z16'), (1615, 75.5, 'z16'), (1616, 79.2, 'z16'), (1617, 82.9, 'z16'), (1618, 86.6, 'z16'), (1619, 90.3, 'z16'), (1620, 94.0, 'z16'), (1621, 97.7, 'z16'), (1622, 1.4, 'z16'), (1623, 5.1, 'z16'), (1624, 8.8, 'z16'), (1625, 12.5, 'z16'), (1626, 16.2, 'z16'), (1627, 19.9, 'z16'), (1628, 23.6, 'z16'), (1629, 27.3, 'z16'), (1630, 31.0, 'z16'), (1631, 34.7, 'z16'), (1632, 38.4, 'z16'), (1633, 42.1, 'z16'), (1634, 45.8, 'z16'), (1635, 49.5, 'z16'), (1636, 53.2, 'z16'), (1637, 56.9, 'z16'), (1638, 60.6, 'z16'), (1639, 64.3, 'z16'), (1640, 68.0, 'z16'), (1641, 71.7, 'z16'), (1642, 75.4, 'z16'), (1643, 79.1, 'z16'), (1644, 82.8, 'z16'), (1645, 86.5, 'z16'), (1646, 90.2, 'z16'), (1647, 93.9, 'z16'), (1648, 97.6, 'z16'), (1649, 1.3, 'z16'), (1650, 5.0, 'z16'), (1651, 8.7, 'z16'), (1652, 12.4, 'z16'), (1653, 16.1, 'z16'), (1654, 19.8, 'z16'), (1655, 23.5, 'z16'), (1656, 27.2, 'z16'), (1657, 30.9, 'z16'), (1658, 34.6, 'z16'), (1659, 38.3, 'z16'), (1660, 42.0, 'z16'), (1661, 45.7, 'z16'), (1662, 49.4, 'z16'), (1663, 53.1, 'z16'), (1664, 56.8, 'z16'), (1665, 60.5, 'z16'), (1666, 64.2, 'z16'), (1667, 67.9, 'z16'), (1668, 71.6, 'z16'), (1669, 75.3, 'z16'), (1670, 79.0, 'z16'), (1671, 82.7, 'z16'), (1672, 86.4, 'z16'), (1673, 90.1, 'z16'), (1674, 93.8, 'z16'), (1675, 97.5, 'z16'), (1676, 1.2, 'z16'), (1677, 4.9, 'z16'), (1678, 8.6, 'z16'), (1679, 12.3, 'z16'), (1680, 16.0, 'z16'), (1681, 19.7, 'z16'), (1682, 23.4, 'z16'), (1683, 27.1, 'z16'), (1684, 30.8, 'z16'), (1685, 34.5, 'z16'), (1686, 38.2, 'z16'), (1687, 41.9, 'z16'), (1688, 45.6, 'z16'), (1689, 49.3, 'z16'), (1690, 53.0, 'z16'), (1691, 56.7, 'z16'), (1692, 60.4, 'z16'), (1693, 64.1, 'z16'), (1694, 67.8, 'z16'), (1695, 71.5, 'z16'), (1696, 75.2, 'z16'), (1697, 78.9, 'z16'), (1698, 82.6, 'z16'), (1699, 86.3, 'z16'), (1700, 90.0, 'z17'), (1701, 93.7, 'z17'), (1702, 97.4, 'z17'), (1703, 1.1, 'z17'), (1704, 4.8, 'z17'), (1705, 8.5, 'z17'), (1706, 12.2, 'z17'), (1707, 15.9, 'z17'), (1708, 19.6, 'z17'), (1709, 23.3, 'z17'), (1710, 27.0, 'z17'), (1711, 30.7, 'z17'), (1712, 34.4, 'z17'), (1713, 38.1, 'z17'), (1714, 41.8, 'z17'), (1715, 45.5, 'z17'), (1716, 49.2, 'z17'), (1717, 52.9, 'z17'), (1718, 56.6, 'z17'), (1719, 60.3, 'z17'), (1720, 64.0, 'z17'), (1721, 67.7, 'z17'), (1722, 71.4, 'z17'), (1723, 75.1, 'z17'), (1724, 78.8, 'z17'), (1725, 82.5, 'z17'), (1726, 86.2, 'z17'), (1727, 89.9, 'z17'), (1728, 93.6, 'z17'), (1729, 97.3, 'z17'), (1730, 1.0, 'z17'), (1731, 4.7, 'z17'), (1732, 8.4, 'z17'), (1733, 12.1, 'z17'), (1734, 15.8, 'z17'), (1735, 19.5, 'z17'), (1736, 23.2, 'z17'), (1737, 26.9, 'z17'), (1738, 30.6, 'z17'), (1739, 34.3, 'z17'), (1740, 38.0, 'z17'), (1741, 41.7, 'z17'), (1742, 45.4, 'z17'), (1743, 49.1, 'z17'), (1744, 52.8, 'z17'), (1745, 56.5, 'z17'), (1746, 60.2, 'z17'), (1747, 63.9, 'z17'), (1748, 67.6, 'z17'), (1749, 71.3, 'z17'), (1750, 75.0, 'z17'), (1751, 78.7, 'z17'), (1752, 82.4, 'z17'), (1753, 86.1, 'z17'), (1754, 89.8, 'z17'), (1755, 93.5, 'z17'), (1756, 97.2, 'z17'), (1757, 0.9, 'z17'), (1758, 4.6, 'z17'), (1759, 8.3, 'z17'), (1760, 12.0, 'z17'), (1761, 15.7, 'z17'), (1762, 19.4, 'z17'), (1763, 23.1, 'z17'), (1764, 26.8, 'z17'), (1765, 30.5, 'z17'), (1766, 34.2, 'z17'), (1767, 37.9, 'z17'), (1768, 41.6, 'z17'), (1769, 45.3, 'z17'), (1770, 49.0, 'z17'), (1771, 52.7, 'z17'), (1772, 56.4, 'z17'), (1773, 60.1, 'z17'), (1774, 63.8, 'z17'), (1775, 67.5, 'z17'), (1776, 71.2, 'z17'), (1777, 74.9, 'z17'), (1778, 78.6, 'z17'), (1779, 82.3, 'z17'), (1780, 86.0, 'z17'), (1781, 89.7, 'z17'), (1782, 93.4, 'z17'), (1783, 97.1, 'z17'), (1784, 0.8, 'z17'), (1785, 4.5, 'z17'), (1786, 8.2, 'z17'), (1787, 11.9, 'z17'), (1788, 15.6, 'z17'), (1789, 19.3, 'z17'), (1790, 23.0, 'z17'), (1791, 26.7, 'z17'), (1792, 30.4, 'z17'), (1793, 34.1, 'z17'), (1794, 37.8, 'z17'), (1795, 41.5, 'z17'), (1796, 45.2, 'z17'), (1797, 48.9, 'z17'), (1798, 52.6, 'z17'), (1799, 56.3, 'z17'), (1800, 60.0, 'z18'), (1801, 63.7, 'z18'), (1802, 67.4, 'z18'), (1803, 71.1, 'z18'), (1804, 74.8, 'z18'), (1805, 78.5, 'z18'), (1806, 82.2, 'z18'), (1807, 85.9, 'z18'), (1808, 89.6, 'z18'), (1809, 93.3, 'z18'), (1810, 97.0, 'z18'), (1811, 0.7, 'z18'), (1812, 4.4, 'z18'), (1813, 8.1, 'z18'), (1814, 11.8, 'z18'), (1815, 15.5, 'z18'), (1816, 19.2, 'z18'), (1817, 22.9, 'z18'), (1818, 26.6, 'z18'), (1819, 30.3, 'z18'), (1820, 34.0, 'z18'), (1821, 37.7, 'z18'), (1822, 41.4, 'z18'), (1823, 45.1, 'z18'), (1824, 48.8, 'z18'), (1825, 52.5, 'z18'), (1826, 56.2, 'z18'), (1827, 59.9, 'z18'), (1828, 63.6, 'z18'), (1829, 67.3, 'z18'), (1830, 71.0, 'z18'), (1831, 74.7, 'z18'), (1832, 78.4, 'z18'), (1833, 82.1, 'z18'), (1834, 85.8, 'z18'), (1835, 89.5, 'z18'), (1836, 93.2, 'z18'), (1837, 96.9, 'z18'), (1838, 0.6, 'z18'), (1839, 4.3, 'z18'), (1840, 8.0, 'z18'), (1841, 11.7, 'z18'), (1842, 15.4, 'z18'), (1843, 19.1, 'z18'), (1844, 22.8, 'z18'), (1845, 26.5, 'z18'), (1846, 30.2, 'z18'), (1847, 33.9, 'z18'), (1848, 37.6, 'z18'), (1849, 41.3, 'z18'), (1850, 45.0, 'z18'), (1851, 48.7, 'z18'), (1852, 52.4, 'z18'), (1853, 56.1, 'z18'), (1854, 59.8, 'z18'), (1855, 63.5, 'z18'), (1856, 67.2, 'z18'), (1857, 70.9, 'z18'), (1858, 74.6, 'z18'), (1859, 78.3, 'z18'), (1860, 82.0, 'z18'), (1861, 85.7, 'z18'), (1862, 89.4, 'z18'), (1863, 93.1, 'z18'), (1864, 96.8, 'z18'), (1865, 0.5, 'z18'), (1866, 4.2, 'z18'), (1867, 7.9, 'z18'), (1868, 11.6, 'z18'), (1869, 15.3, 'z18'), (1870, 19.0, 'z18'), (1871, 22.7, 'z18'), (1872, 26.4, 'z18'), (1873, 30.1, 'z18'), (1874, 33.8, 'z18'), (1875, 37.5, 'z18'), (1876, 41.2, 'z18'), (1877, 44.9, 'z18'), (1878, 48.6, 'z18'), (1879, 52.3, 'z18'), (1880, 56.0, 'z18'), (1881, 59.7, 'z18'), (1882, 63.4, 'z18'), (1883, 67.1, 'z18'), (1884, 70.8, 'z18'), (1885, 74.5, 'z18'), (1886, 78.2, 'z18'), (1887, 81.9, 'z18'), (1888, 85.6, 'z18'), (1889, 89.3, 'z18'), (1890, 93.0, 'z18'), (1891, 96.7, 'z18'), (1892, 0.4, 'z18'), (1893, 4.1, 'z18'), (1894, 7.8, 'z18'), (1895, 11.5, 'z18'), (1896, 15.2, 'z18'), (1897, 18.9, 'z18'), (1898, 22.6, 'z18'), (1899, 26.3, 'z18'), (1900, 30.0, 'z19'), (1901, 33.7, 'z19'), (1902, 37.4, 'z19'), (1903, 41.1, 'z19'), (1904, 44.8, 'z19'), (1905, 48.5, 'z19'), (1906, 52.2, 'z19'), (1907, 55.9, 'z19'), (1908, 59.6, 'z19'), (1909, 63.3, 'z19'), (1910, 67.0, 'z19'), (1911, 70.7, 'z19'), (1912, 74.4, 'z19'), (1913, 78.1, 'z19'), (1914, 81.8, 'z19'), (1915, 85.5, 'z19'), (1916, 89.2, 'z19'), (1917, 92.9, 'z19'), (1918, 96.6, 'z19'), (1919, 0.3, 'z19'), (1920, 4.0, 'z19'), (1921, 7.7, 'z19'), (1922, 11.4, 'z19'), (1923, 15.1, 'z19'), (1924, 18.8, 'z19'), (1925, 22.5, 'z19'), (1926, 26.2, 'z19'), (1927, 29.9, 'z19'), (1928, 33.6, 'z19'), (1929, 37.3, 'z19'), (1930, 41.0, 'z19'), (1931, 44.7, 'z19'), (1932, 48.4, 'z19'), (1933, 52.1, 'z19'), (1934, 55.8, 'z19'), (1935, 59.5, 'z19'), (1936, 63.2, 'z19'), (1937, 66.9, 'z19'), (1938, 70.6, 'z19'), (1939, 74.3, 'z19'), (1940, 78.0, 'z19'), (1941, 81.7, 'z19'), (1942, 85.4, 'z19'), (1943, 89.1, 'z19'), (1944, 92.8, 'z19'), (1945, 96.5, 'z19'), (1946, 0.2, 'z19'), (1947, 3.9, 'z19'), (1948, 7.6, 'z19'), (1949, 11.3, 'z19'), (1950, 15.0, 'z19'), (1951, 18.7, 'z19'), (1952, 22.4, 'z19'), (1953, 26.1, 'z19'), (1954, 29.8, 'z19'), (1955, 33.5, 'z19'), (1956, 37.2, 'z19'), (1957, 40.9, 'z19'), (1958, 44.6, 'z19'), (1959, 48.3, 'z19'), (1960, 52.0, 'z19'), (1961, 55.7, 'z19'), (1962, 59.4, 'z19'), (1963, 63.1, 'z19'), (1964, 66.8, 'z19'), (1965, 70.5, 'z19'), (1966, 74.2, 'z19'), (1967, 77.9, 'z19'), (1968, 81.6, 'z19'), (1969, 85.3, 'z19'), (1970, 89.0, 'z19'), (1971, 92.7, 'z19'), (1972, 96.4, 'z19'), (1973, 0.1, 'z19'), (1974, 3.8, 'z19'), (1975, 7.5, 'z19'), (1976, 11.2, 'z19'), (1977, 14.9, 'z19'), (1978, 18.6, 'z19'), (1979, 22.3, 'z19'), (1980, 26.0, 'z19'), (1981, 29.7, 'z19'), (1982, 33.4, 'z19'), (1983, 37.1, 'z19'), (1984, 40.8, 'z19'), (1985, 44.5, 'z19'), (1986, 48.2, 'z19'), (1987, 51.9, 'z19'), (1988, 55.6, 'z19'), (1989, 59.3, 'z19'), (1990, 63.0, 'z19'), (1991, 66.7, 'z19'), (1992, 70.4, 'z19'), (1993, 74.1, 'z19'), (1994, 77.8, 'z19'), (1995, 81.5, 'z19'), (1996, 85.2, 'z19'), (1997, 88.9, 'z19'), (1998, 92.6, 'z19'), (1999, 96.3, 'z19');
+CREATE TABLE S(K INT, D INT) WITH (zone_map=off);
+INSERT INTO S VALUES (0, 0), (10, 1), (20, 2), (30, 3), (40, 4), (50, 5), (60, 6), (70, 0), (80, 1), (90, 2), (100, 3), (110, 4), (120, 5), (130, 6), (140, 0), (150, 1), (160, 2), (170, 3), (180, 4), (190, 5), (200, 6), (210, 0), (220, 1), (230, 2), (240, 3), (250, 4), (260, 5), (270, 6), (280, 0), (290, 1), (300, 2), (310, 3), (320, 4), (330, 5), (340, 6), (350, 0), (360, 1), (370, 2), (380, 3), (390, 4), (400, 5), (410, 6), (420, 0), (430, 1), (440, 2), (450, 3), (460, 4), (470, 5), (480, 6), (490, 0);
+SELECT A, B FROM R WHERE A < 20;
+SELECT A, C FROM R WHERE A >= 1990 AND B > 50.0;
+SELECT A FROM R WHERE A > 5000;
+SELECT A, B FROM R WHERE C = 'z07' AND B <= 10.0;
+SELECT COUNT(*), MIN(A), MAX(A) FROM R WHERE 300 <= A AND A < 700;
+SELECT R.A, S.D FROM R, S WHERE R.A = S.K AND R.A < 200;
+DELETE FROM R WHERE A < 1000;
+SELECT A, B FROM R WHERE A < 1010;
+INSERT INTO R VALUES (-5, 1.5, 'neg'), (20000, 2.5, 'big');
+SELECT A, C FROM R WHERE A < 0 OR A > 1998;
+SELECT A, C FROM R WHERE A > 10000;
@@ -0,0 +1,44 @@
+import pytest
+import subprocess
+
+from ddb.parser import parse_all
+from ddb.executor import ZoneMapScanPop
+from ddb.globals import ZONE_MAP_CHUNK_SIZE
+
+testcase_dir = "tests/zonemap/"
+T = 1
+
+@pytest.mark.parametrize("t_id", list(range(T)))
+def test_session(check_sql_case, t_id):
+    check_sql_case(testcase_dir + f"t_zonemap_{t_id}")
+
+@pytest.mark.parametrize("zone_map", ["on", "off"])
+def test_chunks_skipped(run, monkeypatch, zone_map):
+    # only a table created with a zone map has chunks of rows skipped by scans:
+    subprocess.run(['make', 'clean'], check=True)
+    scanned = list()
+    execute_batches = ZoneMapScanPop.execute_batches
+    def counting_execute_batches(self):
+        for batch in execute_batches(self):
+            scanned.extend(batch)
+            yield batch
+    monkeypatch.setattr(ZoneMapScanPop, 'execute_batches', counting_execute_batches)
+    responses = run(f'CREATE TABLE R(A INT, B INT) WITH (zone_map={zone_map});' +
+                    'INSERT INTO R VALUES ' + ', '.join(f'({i}, {i % 10})' for i in range(2000)) + ';' +
+                    'SHOW TABLES;' +
+                    'SELECT * FROM R WHERE A >= 1000 AND A < 1010;')
+    assert all(r.error is None for r in responses), [r.error_details for r in responses]
+    *_, show, r = responses
+    assert ('[zone map]' in show.response) == (zone_map == 'on')
+    assert r.response.startswith('SELECT 10')
+    if zone_map == 'on':
+        assert 10 <= len(scanned) <= 2 * ZONE_MAP_CHUNK_SIZE
+    else:
+        assert len(scanned) == 0
+
+def test_zone_map_with_primary_key(session):
+    subprocess.run(['make', 'clean'], check=True)
+    r, = parse_all('CREATE TABLE R(A INT, B INT, PRIMARY KEY(A)) WITH (zone_map=on);')
+    assert session.request(r).error is not None
+    r, = parse_all('CREATE TABLE R(A INT, B INT) WITH (zone_map=maybe);')
+    assert session.request(r).error is not None